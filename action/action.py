@@ -15,6 +15,11 @@ from custom_components.hacs.const import HACS_ACTION_GITHUB_API_HEADERS
 from custom_components.hacs.enums import HacsGitHubRepo
 from custom_components.hacs.exceptions import HacsException
 from custom_components.hacs.utils.decode import decode_content
+from custom_components.hacs.utils.http_cache import (
+    HttpCache,
+    HttpCacheSession,
+    http_cache_directory,
+)
 from custom_components.hacs.utils.logger import LOGGER
 from custom_components.hacs.validate.manager import ValidationManager
 
@@ -101,6 +106,9 @@ async def preflight():
     hacs.core.config_path = None
 
     async with aiohttp.ClientSession() as session:
+        if (cache_directory := http_cache_directory()) is not None:
+            hacs.http_cache = HttpCache(cache_directory)
+            session = HttpCacheSession(session, hacs.http_cache)
         hacs.session = session
         hacs.validation = ValidationManager(hacs=hacs, hass=hacs.hass)
         hacs.githubapi = GitHubAPI(
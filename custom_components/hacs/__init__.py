@@ -30,10 +30,17 @@ from .const import DOMAIN, MINIMUM_HA_VERSION, STARTUP
 from .data_client import HacsDataClient
 from .enums import ConfigurationType, HacsDisabledReason, HacsStage, LovelaceMode
 from .frontend import async_register_frontend
+from .services import SERVICE_VERIFY, async_register_services
+from .utils.backup import recover_staged_installs
+from .utils.blob_cache import BlobCache
+from .utils.compress import AssetCompressor
 from .utils.configuration_schema import hacs_config_combined
 from .utils.data import HacsData
+from .utils.http_cache import HttpCache, HttpCacheSession, http_cache_directory
 from .utils.logger import LOGGER
+from .utils.path import cache_directory
 from .utils.queue_manager import QueueManager
+from .utils.rate_limit import GitHubRateLimitSession
 from .utils.version import version_left_higher_or_equal_then_right
 from .websocket import async_register_websocket_commands
 
@@ -86,13 +93,18 @@ async def async_initialize_integration(
     hacs.configuration.dev = integration.version == "0.0.0"
     hacs.hass = hass
     hacs.queue = QueueManager(hass=hass)
-    hacs.data = HacsData(hacs=hacs)
+    hacs.data = HacsData(hacs=hacs, journal=hacs.configuration.storage_journal)
     hacs.data_client = HacsDataClient(
         session=clientsession,
         client_name=f"HACS/{integration.version}",
     )
     hacs.system.running = True
-    hacs.session = clientsession
+    hacs.http_cache = HttpCache(
+        http_cache_directory(cache_directory(hass.config.path(), "http_cache"))
+    )
+    hacs.session = HttpCacheSession(clientsession, hacs.http_cache)
+    hacs.blob_cache = BlobCache(cache_directory(hass.config.path(), "blob_cache"))
+    hacs.asset_compressor = AssetCompressor()
 
     hacs.core.lovelace_mode = LovelaceMode.YAML
     try:
@@ -107,10 +119,13 @@ async def async_initialize_integration(
     if hacs.core.ha_version is None:
         hacs.core.ha_version = AwesomeVersion(HAVERSION)
 
+    # Both GitHub clients feed the same rate limit budget
+    github_session = GitHubRateLimitSession(hacs.session, hacs.github_budget)
+
     ## Legacy GitHub client
     hacs.github = GitHub(
         hacs.configuration.token,
-        clientsession,
+        github_session,
         headers={
             "User-Agent": f"HACS/{hacs.version}",
             "Accept": ACCEPT_HEADERS["preview"],
@@ -120,7 +135,7 @@ async def async_initialize_integration(
     ## New GitHub client
     hacs.githubapi = GitHubAPI(
         token=hacs.configuration.token,
-        session=clientsession,
+        session=github_session,
         **{"client_name": f"HACS/{hacs.version}"},
     )
 
@@ -152,6 +167,8 @@ async def async_initialize_integration(
             hacs.disable_hacs(HacsDisabledReason.CONSTRAINS)
             return False
 
+        await hass.async_add_executor_job(recover_staged_installs, hacs.core.config_path)
+
         if not await hacs.data.restore():
             hacs.disable_hacs(HacsDisabledReason.RESTORE)
             return False
@@ -163,6 +180,7 @@ async def async_initialize_integration(
         hacs.set_active_categories()
 
         async_register_websocket_commands(hass)
+        async_register_services(hass)
         async_register_frontend(hass, hacs)
 
         if hacs.configuration.config_type == ConfigurationType.YAML:
@@ -262,7 +280,12 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         task()
 
     # Store data
-    await hacs.data.async_write(force=True)
+    await hacs.data.async_force_write()
+
+    if hacs.asset_compressor is not None:
+        hacs.asset_compressor.shutdown()
+
+    hass.services.async_remove(DOMAIN, SERVICE_VERIFY)
 
     try:
         if hass.data.get("frontend_panels", {}).get("hacs"):
@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
-import gzip
+from functools import partial
+import hashlib
 import logging
-import math
 import os
 import pathlib
-import shutil
-from typing import TYPE_CHECKING, Any, Awaitable, Callable
+import tempfile
+from typing import IO, TYPE_CHECKING, Any, Awaitable, Callable
+from uuid import uuid4
 
 from aiogithubapi import (
     AIOGitHubAPIException,
@@ -38,10 +40,11 @@ from homeassistant.util import dt
 
 from custom_components.hacs.repositories.base import (
     HACS_MANIFEST_KEYS_TO_EXPORT,
+    REPOSITORY_DATA_INDEXED_KEYS,
     REPOSITORY_KEYS_TO_EXPORT,
 )
 
-from .const import DOMAIN, TV, URL_BASE
+from .const import DOMAIN, DOWNLOAD_CHUNK_SIZE, DOWNLOAD_WRITE_BUFFER_SIZE, TV, URL_BASE
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
@@ -50,6 +53,7 @@ from .enums import (
     HacsDisabledReason,
     HacsDispatchEvent,
     HacsGitHubRepo,
+    HacsQueuePriority,
     HacsStage,
     LovelaceMode,
 )
@@ -64,15 +68,24 @@ from .exceptions import (
     HomeAssistantCoreRepositoryException,
 )
 from .repositories import REPOSITORY_CLASSES
+from .utils.concurrency import ConcurrencyController
 from .utils.decode import decode_content
+from .utils.graphql import async_fetch_repository_metadata
+from .utils.http_cache import HttpCacheSession
 from .utils.json import json_loads
 from .utils.logger import LOGGER
 from .utils.queue_manager import QueueManager
+from .utils.rate_limit import GitHubRateLimitBudget
+from .utils.repository_files import RepositoryFiles
 from .utils.store import async_load_from_store, async_save_to_store
+from .utils.tree import RepositoryTreeCache
 
 if TYPE_CHECKING:
     from .repositories.base import HacsRepository
+    from .utils.blob_cache import BlobCache
+    from .utils.compress import AssetCompressor
     from .utils.data import HacsData
+    from .utils.http_cache import HttpCache
     from .validate.manager import ValidationManager
 
 
@@ -133,6 +146,8 @@ class HacsConfiguration:
     release_limit: int = 5
     sidepanel_icon: str = "hacs:hacs"
     sidepanel_title: str = "HACS"
+    storage_codec: str = "json"
+    storage_journal: bool = False
     theme_path: str = "themes/"
     theme: bool = False
     token: str = None
@@ -206,12 +221,46 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    # Insertion ordered, so repositories are listed in the order they were registered
+    _repositories_by_category: dict[str, dict[HacsRepository, None]] = field(default_factory=dict)
+    _downloaded_repositories_by_category: dict[str, dict[HacsRepository, None]] = field(
+        default_factory=dict
+    )
+    _pending_update_repositories: set[HacsRepository] = field(default_factory=set)
+    _pending_update_unchecked: set[HacsRepository] = field(default_factory=set)
+    _serialized_repositories: dict[HacsRepository, str] = field(default_factory=dict)
+    _serialized_unhydrated: dict[str, tuple[Any, str | None]] = field(default_factory=dict)
+    _revision: int = 0
+    _repository_revisions: dict[HacsRepository, int] = field(default_factory=dict)
+    _removed_revisions: dict[str, int] = field(default_factory=dict)
+    _revision_listeners: list[Callable[[], None]] = field(default_factory=list)
+    _unhydrated: dict[str, dict[str, Any]] = field(default_factory=dict)
+    _unhydrated_by_full_name: dict[str, str] = field(default_factory=dict)
+    epoch: str = field(default_factory=lambda: uuid4().hex)
+    # Creates and registers the repository of stored data, see add_unhydrated
+    hydrator: Callable[[str, dict[str, Any]], HacsRepository | None] | None = None
 
     @property
     def list_all(self) -> list[HacsRepository]:
         """Return a list of repositories."""
+        self._hydrate_all()
         return list(self._repositories)
 
+    @property
+    def list_hydrated(self) -> list[HacsRepository]:
+        """Return a list of the repositories that are created, without creating the others."""
+        return list(self._repositories)
+
+    @property
+    def unhydrated(self) -> dict[str, dict[str, Any]]:
+        """Return the stored data of the repositories that are not created yet by ID."""
+        return self._unhydrated
+
+    @property
+    def count(self) -> int:
+        """Return the number of repositories."""
+        return len(self._repositories) + len(self._unhydrated)
+
     @property
     def list_removed(self) -> list[RemovedRepository]:
         """Return a list of removed repositories."""
@@ -220,14 +269,214 @@ class HacsRepositories:
     @property
     def list_downloaded(self) -> list[HacsRepository]:
         """Return a list of downloaded repositories."""
-        return [repo for repo in self._repositories if repo.data.installed]
+        return [
+            repository
+            for repositories in self._downloaded_repositories_by_category.values()
+            for repository in repositories
+        ]
+
+    @property
+    def list_pending_update(self) -> list[HacsRepository]:
+        """Return a list of downloaded repositories with a pending update."""
+        while self._pending_update_unchecked:
+            repository = self._pending_update_unchecked.pop()
+            if repository.data.installed and repository.pending_update:
+                self._pending_update_repositories.add(repository)
+            else:
+                self._pending_update_repositories.discard(repository)
+        return list(self._pending_update_repositories)
+
+    @property
+    def revision(self) -> int:
+        """Return the current catalog revision."""
+        return self._revision
+
+    def list_by_category(
+        self,
+        category: HacsCategory | str,
+        hydrate: bool = True,
+    ) -> list[HacsRepository]:
+        """Return a list of repositories in a category.
+
+        Without hydrate, the repositories that are not created yet are left out.
+        """
+        if hydrate:
+            self._hydrate_all(category)
+        return list(self._repositories_by_category.get(category, ()))
+
+    def list_unhydrated_by_category(self, category: HacsCategory | str) -> list[str]:
+        """Return the IDs of the repositories in a category that are not created yet."""
+        return [
+            repository_id
+            for repository_id, data in self._unhydrated.items()
+            if data.get("category") == category
+        ]
+
+    def add_unhydrated(self, repository_id: str, data: dict[str, Any]) -> None:
+        """Register a repository by its stored data.
+
+        The repository is created with the hydrator when it is first looked
+        up or listed, until then only the stored data is kept.
+        """
+        if repository_id == "0" or repository_id in self._repositories_by_id:
+            return
+        self._unhydrated[repository_id] = data
+        self._unhydrated_by_full_name[data["full_name"].lower()] = repository_id
+        self._serialized_unhydrated.pop(repository_id, None)
+
+    def get_unhydrated(self, repository_full_name: str) -> tuple[str, dict[str, Any]] | None:
+        """Return the ID and stored data of a repository that is not created yet."""
+        if (
+            repository_id := self._unhydrated_by_full_name.get(repository_full_name.lower())
+        ) is None:
+            return None
+        return repository_id, self._unhydrated[repository_id]
+
+    def mark_default_unhydrated(self, repository_id: str) -> None:
+        """Mark a repository that is not created yet as default."""
+        if repository_id in self._unhydrated:
+            self._default_repositories.add(repository_id)
+            self._serialized_unhydrated.pop(repository_id, None)
+
+    def remove_unhydrated(self, repository_id: str) -> None:
+        """Unregister a repository that is not created yet."""
+        if (data := self._unhydrated.pop(repository_id, None)) is None:
+            return
+        self._unhydrated_by_full_name.pop(data["full_name"].lower(), None)
+        self._serialized_unhydrated.pop(repository_id, None)
+        self._default_repositories.discard(repository_id)
+        self._bump_removed_revision(repository_id)
+
+    def _hydrate(self, repository_id: str) -> HacsRepository | None:
+        """Create the repository of stored data."""
+        if (data := self._unhydrated.pop(repository_id, None)) is None:
+            return None
+        self._unhydrated_by_full_name.pop(data["full_name"].lower(), None)
+        self._serialized_unhydrated.pop(repository_id, None)
+        if self.hydrator is None:
+            return None
+        return self.hydrator(repository_id, data)
+
+    def _hydrate_all(self, category: str | None = None) -> None:
+        """Create the repositories of stored data, or those in a category."""
+        for repository_id, data in list(self._unhydrated.items()):
+            if category is None or data.get("category") == category:
+                self._hydrate(repository_id)
 
     def category_downloaded(self, category: HacsCategory) -> bool:
         """Check if a given category has been downloaded."""
-        for repository in self.list_downloaded:
-            if repository.data.category == category:
-                return True
-        return False
+        return bool(self._downloaded_repositories_by_category.get(category))
+
+    def _index(self, repository: HacsRepository) -> None:
+        """Add a repository to the category, downloaded and pending update indexes.
+
+        A repository keeps its position in the indexes it already was in.
+        """
+        category = repository.data.category
+        for index, included in (
+            (self._repositories_by_category, True),
+            (self._downloaded_repositories_by_category, repository.data.installed),
+        ):
+            for indexed_category, repositories in index.items():
+                if not included or indexed_category != category:
+                    repositories.pop(repository, None)
+            if included:
+                index.setdefault(category, {})[repository] = None
+        self._pending_update_unchecked.add(repository)
+
+    def _unindex(self, repository: HacsRepository) -> None:
+        """Remove a repository from the category, downloaded and pending update indexes."""
+        for index in (self._repositories_by_category, self._downloaded_repositories_by_category):
+            for repositories in index.values():
+                repositories.pop(repository, None)
+        self._pending_update_repositories.discard(repository)
+        self._pending_update_unchecked.discard(repository)
+
+    def _bump_revision(self, repository: HacsRepository, removed: bool = False) -> None:
+        """Record a catalog change for a repository and notify the revision listeners."""
+        if removed:
+            self._repository_revisions.pop(repository, None)
+            self._bump_removed_revision(str(repository.data.id))
+            return
+        self._revision += 1
+        # Re-insert to keep both dicts ordered by revision
+        self._repository_revisions.pop(repository, None)
+        self._removed_revisions.pop(str(repository.data.id), None)
+        self._repository_revisions[repository] = self._revision
+        for listener in list(self._revision_listeners):
+            listener()
+
+    def _bump_removed_revision(self, repo_id: str) -> None:
+        """Record the removal of a repository and notify the revision listeners."""
+        self._revision += 1
+        self._removed_revisions.pop(repo_id, None)
+        self._removed_revisions[repo_id] = self._revision
+        for listener in list(self._revision_listeners):
+            listener()
+
+    def add_revision_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Add a listener that is called when the catalog revision changes."""
+        self._revision_listeners.append(listener)
+
+        def _remove_listener() -> None:
+            if listener in self._revision_listeners:
+                self._revision_listeners.remove(listener)
+
+        return _remove_listener
+
+    def changes_since(self, revision: int) -> tuple[list[HacsRepository], list[str]]:
+        """Return the repositories changed and the ids removed after a revision."""
+        changed = []
+        for repository, repository_revision in reversed(self._repository_revisions.items()):
+            if repository_revision <= revision:
+                break
+            changed.append(repository)
+
+        removed = []
+        for repo_id, removed_revision in reversed(self._removed_revisions.items()):
+            if removed_revision <= revision:
+                break
+            removed.append(repo_id)
+
+        return changed, removed
+
+    def _data_changed(self, repository: HacsRepository, key: str) -> None:
+        """Handle a change of a key for a registered repository."""
+        self._serialized_repositories.pop(repository, None)
+        self._bump_revision(repository)
+        if key in ("category", "installed"):
+            self._index(repository)
+        elif key in REPOSITORY_DATA_INDEXED_KEYS or key == "repository_manifest":
+            self._pending_update_unchecked.add(repository)
+
+    def get_serialized(
+        self,
+        repository: HacsRepository,
+        serializer: Callable[[HacsRepository], str],
+    ) -> str:
+        """Return the serialized payload of a repository, serializing it if needed."""
+        if (serialized := self._serialized_repositories.get(repository)) is None:
+            serialized = self._serialized_repositories[repository] = serializer(repository)
+        return serialized
+
+    def get_serialized_unhydrated(
+        self,
+        repository_id: str,
+        serializer: Callable[[str, dict[str, Any]], str | None],
+        context: Any = None,
+    ) -> str | None:
+        """Return the serialized payload of a repository that is not created yet.
+
+        The stored data does not change until the repository is created, so
+        the payload is kept while the context it was serialized in is the same.
+        """
+        cached = self._serialized_unhydrated.get(repository_id)
+        if cached is None or cached[0] != context:
+            cached = self._serialized_unhydrated[repository_id] = (
+                context,
+                serializer(repository_id, self._unhydrated[repository_id]),
+            )
+        return cached[1]
 
     def register(self, repository: HacsRepository, default: bool = False) -> None:
         """Register a repository."""
@@ -236,6 +485,11 @@ class HacsRepositories:
         if repo_id == "0":
             return
 
+        if (data := self._unhydrated.pop(repo_id, None)) is not None:
+            # Replaces the stored data
+            self._unhydrated_by_full_name.pop(data["full_name"].lower(), None)
+            self._serialized_unhydrated.pop(repo_id, None)
+
         if registered_repo := self._repositories_by_id.get(repo_id):
             if registered_repo.data.full_name == repository.data.full_name:
                 return
@@ -252,6 +506,10 @@ class HacsRepositories:
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
 
+        self._index(repository)
+        repository.data.set_listener(partial(self._data_changed, repository))
+        self._bump_revision(repository)
+
         if default:
             self.mark_default(repository)
 
@@ -274,6 +532,11 @@ class HacsRepositories:
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
 
+        self._unindex(repository)
+        self._serialized_repositories.pop(repository, None)
+        repository.data.set_listener(None)
+        self._bump_revision(repository, removed=True)
+
     def mark_default(self, repository: HacsRepository) -> None:
         """Mark a repository as default."""
         repo_id = str(repository.data.id)
@@ -284,7 +547,10 @@ class HacsRepositories:
         if not self.is_registered(repository_id=repo_id):
             return
 
-        self._default_repositories.add(repo_id)
+        if repo_id not in self._default_repositories:
+            self._default_repositories.add(repo_id)
+            self._serialized_repositories.pop(repository, None)
+            self._bump_revision(repository)
 
     def set_repository_id(self, repository: HacsRepository, repo_id: str):
         """Update a repository id."""
@@ -312,9 +578,12 @@ class HacsRepositories:
     ) -> bool:
         """Check if a repository is registered."""
         if repository_id is not None:
-            return repository_id in self._repositories_by_id
+            return repository_id in self._repositories_by_id or repository_id in self._unhydrated
         if repository_full_name is not None:
-            return repository_full_name in self._repositories_by_full_name
+            return (
+                repository_full_name in self._repositories_by_full_name
+                or repository_full_name in self._unhydrated_by_full_name
+            )
         return False
 
     def is_downloaded(
@@ -335,13 +604,21 @@ class HacsRepositories:
         """Get repository by id."""
         if not repository_id:
             return None
-        return self._repositories_by_id.get(str(repository_id))
+        if repository := self._repositories_by_id.get(str(repository_id)):
+            return repository
+        return self._hydrate(str(repository_id))
 
     def get_by_full_name(self, repository_full_name: str | None) -> HacsRepository | None:
         """Get repository by full name."""
         if not repository_full_name:
             return None
-        return self._repositories_by_full_name.get(repository_full_name.lower())
+        if repository := self._repositories_by_full_name.get(repository_full_name.lower()):
+            return repository
+        if (
+            repository_id := self._unhydrated_by_full_name.get(repository_full_name.lower())
+        ) is None:
+            return None
+        return self._hydrate(repository_id)
 
     def is_removed(self, repository_full_name: str) -> bool:
         """Check if a repository is removed."""
@@ -360,12 +637,15 @@ class HacsRepositories:
 class HacsBase:
     """Base HACS class."""
 
+    asset_compressor: AssetCompressor | None = None
+    blob_cache: BlobCache | None = None
     data: HacsData | None = None
     data_client: HacsDataClient | None = None
     frontend_version: str | None = None
     github: GitHub | None = None
     githubapi: GitHubAPI | None = None
     hass: HomeAssistant | None = None
+    http_cache: HttpCache | None = None
     integration: Integration | None = None
     queue: QueueManager | None = None
     repository: AIOGitHubAPIRepository | None = None
@@ -381,10 +661,21 @@ class HacsBase:
         self.coordinators: dict[HacsCategory, HacsUpdateCoordinator] = {}
         self.core = HacsCore()
         self.log = LOGGER
+        self.concurrency = ConcurrencyController()
+        self.github_budget = GitHubRateLimitBudget()
         self.recurring_tasks: list[Callable[[], None]] = []
         self.repositories = HacsRepositories()
+        self.repository_files = RepositoryFiles()
         self.status = HacsStatus()
         self.system = HacsSystem()
+        self.trees = RepositoryTreeCache()
+
+    @property
+    def stream_session(self) -> ClientSession | None:
+        """Return the session for streamed downloads, which bypasses the HTTP cache."""
+        if isinstance(self.session, HttpCacheSession):
+            return self.session.uncached
+        return self.session
 
     @property
     def integration_dir(self) -> pathlib.Path:
@@ -438,6 +729,17 @@ class HacsBase:
             self.common.categories.pop(category)
             self.coordinators.pop(category)
 
+    def _process_saved_file(self, file_path: str) -> None:
+        """Run the steps that follow writing a file, must run in the executor."""
+        # LEGACY! Remove with 2.0
+        if "themes" in file_path and file_path.endswith(".yaml"):
+            filename = file_path.split("/")[-1]
+            base = file_path.split("/themes/")[0]
+            combined = f"{base}/themes/{filename}"
+            if os.path.exists(combined):
+                self.log.info("Removing old theme file %s", combined)
+                os.remove(combined)
+
     async def async_save_file(self, file_path: str, content: Any) -> bool:
         """Save a file."""
 
@@ -450,21 +752,7 @@ class HacsBase:
             ) as file_handler:
                 file_handler.write(content)
 
-            # Create gz for .js files
-            if os.path.isfile(file_path):
-                if file_path.endswith(".js"):
-                    with open(file_path, "rb") as f_in:
-                        with gzip.open(file_path + ".gz", "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-
-            # LEGACY! Remove with 2.0
-            if "themes" in file_path and file_path.endswith(".yaml"):
-                filename = file_path.split("/")[-1]
-                base = file_path.split("/themes/")[0]
-                combined = f"{base}/themes/{filename}"
-                if os.path.exists(combined):
-                    self.log.info("Removing old theme file %s", combined)
-                    os.remove(combined)
+            self._process_saved_file(file_path)
 
         try:
             await self.hass.async_add_executor_job(_write_file)
@@ -478,23 +766,26 @@ class HacsBase:
 
     async def async_can_update(self) -> int:
         """Helper to calculate the number of repositories we can fetch data for."""
-        try:
-            response = await self.async_github_api_method(self.githubapi.rate_limit)
-            if ((limit := response.data.resources.core.remaining or 0) - 1000) >= 10:
-                return math.floor((limit - 1000) / 10)
-            reset = dt.as_local(dt.utc_from_timestamp(response.data.resources.core.reset))
+        if not self.github_budget.known:
+            # Nothing has been requested yet, the response headers will populate the budget
+            try:
+                await self.async_github_api_method(self.githubapi.rate_limit)
+            except (
+                BaseException  # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            ) as exception:
+                self.log.exception(exception)
+                return 0
+
+        if (can_update := self.github_budget.available_tasks()) == 0 and (
+            paused_until := self.github_budget.paused_until()
+        ) is not None:
+            resume = dt.as_local(dt.utc_from_timestamp(paused_until))
             self.log.info(
                 "GitHub API ratelimited - %s remaining (%s)",
-                response.data.resources.core.remaining,
-                f"{reset.hour}:{reset.minute}:{reset.second}",
+                self.github_budget.remaining,
+                f"{resume.hour}:{resume.minute}:{resume.second}",
             )
-            self.disable_hacs(HacsDisabledReason.RATE_LIMIT)
-        except (
-            BaseException  # lgtm [py/catch-base-exception] pylint: disable=broad-except
-        ) as exception:
-            self.log.exception(exception)
-
-        return 0
+        return can_update
 
     async def async_github_get_hacs_default_file(self, filename: str) -> list:
         """Get the content of a default file."""
@@ -524,7 +815,9 @@ class HacsBase:
             self.disable_hacs(HacsDisabledReason.INVALID_TOKEN)
             _exception = exception
         except GitHubRatelimitException as exception:
-            self.disable_hacs(HacsDisabledReason.RATE_LIMIT)
+            if self.github_budget.remaining != 0:
+                # Secondary limit, the primary limit pauses until the reset
+                self.github_budget.pause()
             _exception = exception
         except GitHubNotModifiedException as exception:
             raise exception
@@ -714,12 +1007,23 @@ class HacsBase:
         headers: dict | None = None,
         keep_url: bool = False,
         nolog: bool = False,
+        cache_key: str | None = None,
+        http_cache: bool = True,
         **_,
     ) -> bytes | None:
-        """Download files, and return the content."""
+        """Download files, and return the content.
+
+        Content with a cache_key is kept in the blob cache instead of the HTTP
+        cache, http_cache=False also skips it for content the caller caches.
+        """
         if url is None:
             return None
 
+        if cache_key is not None and self.blob_cache is not None:
+            if (content := await self.blob_cache.async_get(cache_key)) is not None:
+                self.log.debug("Using cached content of %s", url)
+                return content
+
         if not keep_url and "tags/" in url:
             url = url.replace("tags/", "")
 
@@ -728,19 +1032,28 @@ class HacsBase:
 
         while timeouts < 5:
             try:
-                request = await self.session.get(
+                session = (
+                    self.session
+                    if http_cache and (cache_key is None or self.blob_cache is None)
+                    else self.stream_session
+                )
+                request = await session.get(
                     url=url,
                     timeout=ClientTimeout(total=60),
                     headers=headers,
                 )
 
-                # Make sure that we got a valid result
-                if request.status == 200:
-                    return await request.read()
+                async with request:
+                    # Make sure that we got a valid result
+                    if request.status == 200:
+                        content = await request.read()
+                        if cache_key is not None and self.blob_cache is not None:
+                            await self.blob_cache.async_set(cache_key, content)
+                        return content
 
-                raise HacsException(
-                    f"Got status code {request.status} when trying to download {url}"
-                )
+                    raise HacsException(
+                        f"Got status code {request.status} when trying to download {url}"
+                    )
             except asyncio.TimeoutError:
                 self.log.warning(
                     "A timeout of 60! seconds was encountered while downloading %s, "
@@ -764,6 +1077,171 @@ class HacsBase:
 
             return None
 
+    async def async_download_file_to_fileobj(
+        self,
+        url: str,
+        fileobj: IO[bytes],
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+        **_,
+    ) -> str | None:
+        """Stream a file into a file object, and return the SHA-256 of the content."""
+        if url is None:
+            return None
+
+        if not keep_url and "tags/" in url:
+            url = url.replace("tags/", "")
+
+        self.log.debug("Trying to download %s", url)
+        timeouts = 0
+
+        while timeouts < 5:
+            try:
+                request = await self.stream_session.get(
+                    url=url,
+                    # Large files can take longer than a minute, only a stalled read is a timeout
+                    timeout=ClientTimeout(total=None, sock_connect=60, sock_read=60),
+                    headers=headers,
+                )
+
+                # Releases the connection when the content is not streamed to the end
+                async with request:
+                    if request.status != 200:
+                        raise HacsException(
+                            f"Got status code {request.status} when trying to download {url}"
+                        )
+
+                    await self.hass.async_add_executor_job(self._rewind_file, fileobj)
+                    sha256 = hashlib.sha256()
+                    buffer = bytearray()
+                    async for chunk in request.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        sha256.update(chunk)
+                        buffer.extend(chunk)
+                        if len(buffer) >= DOWNLOAD_WRITE_BUFFER_SIZE:
+                            await self.hass.async_add_executor_job(fileobj.write, bytes(buffer))
+                            buffer.clear()
+                    await self.hass.async_add_executor_job(fileobj.write, bytes(buffer))
+                    return sha256.hexdigest()
+
+            except asyncio.TimeoutError:
+                self.log.warning(
+                    "A timeout was encountered while downloading %s, tries left %s",
+                    url,
+                    (4 - timeouts),
+                )
+                timeouts += 1
+                await asyncio.sleep(1)
+                continue
+
+            except (
+                BaseException  # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            ) as exception:
+                if not nolog:
+                    self.log.exception("Download failed - %s", exception)
+
+            return None
+
+    async def async_download_file_to_path(
+        self,
+        url: str,
+        file_path: str,
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+        cache_key: str | None = None,
+        **_,
+    ) -> str | None:
+        """Stream a file to disk, and return the SHA-256 of the content.
+
+        The content is written to a temporary file next to the target which is
+        renamed into place once complete, so a failed download never leaves a
+        partial file behind.
+        """
+        if url is None:
+            return None
+
+        if cache_key is not None and self.blob_cache is not None:
+            if (cached := await self.blob_cache.async_get_path(cache_key)) is not None:
+                self.log.debug("Using cached content of %s", url)
+                try:
+                    return await self.hass.async_add_executor_job(
+                        self._copy_file_to_path, cached, file_path
+                    )
+                except OSError as exception:
+                    self.log.debug("Could not use cached content of %s - %s", url, exception)
+
+        temp_file = await self.hass.async_add_executor_job(
+            partial(
+                tempfile.NamedTemporaryFile,
+                dir=os.path.dirname(file_path),
+                prefix=f".{os.path.basename(file_path)}.",
+                suffix=".tmp",
+                delete=False,
+            )
+        )
+        try:
+            digest = await self.async_download_file_to_fileobj(
+                url,
+                temp_file,
+                headers=headers,
+                keep_url=keep_url,
+                nolog=nolog,
+            )
+            if digest is None:
+                return None
+
+            def _finalize() -> None:
+                temp_file.close()
+                os.replace(temp_file.name, file_path)
+                self._process_saved_file(file_path)
+
+            await self.hass.async_add_executor_job(_finalize)
+            temp_file = None
+        finally:
+            if temp_file is not None:
+                await self.hass.async_add_executor_job(self._remove_temp_file, temp_file)
+
+        if cache_key is not None and self.blob_cache is not None:
+            await self.blob_cache.async_set_from_file(cache_key, file_path)
+        return digest
+
+    @staticmethod
+    def _rewind_file(fileobj: IO[bytes]) -> None:
+        """Empty a file object so a download can be written from the start."""
+        fileobj.seek(0)
+        fileobj.truncate()
+
+    @staticmethod
+    def _remove_temp_file(temp_file: IO[bytes]) -> None:
+        """Close and remove a temporary file."""
+        temp_file.close()
+        with suppress(FileNotFoundError):
+            os.remove(temp_file.name)
+
+    def _copy_file_to_path(self, source: str, file_path: str) -> str:
+        """Copy a file into place and return the SHA-256 of the content."""
+        sha256 = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(file_path),
+            prefix=f".{os.path.basename(file_path)}.",
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            try:
+                with open(source, "rb") as source_file:
+                    while chunk := source_file.read(DOWNLOAD_CHUNK_SIZE):
+                        sha256.update(chunk)
+                        temp_file.write(chunk)
+            except BaseException:
+                os.remove(temp_file.name)
+                raise
+        os.replace(temp_file.name, file_path)
+        self._process_saved_file(file_path)
+        return sha256.hexdigest()
+
     async def async_recreate_entities(self) -> None:
         """Recreate entities."""
         if self.configuration == ConfigurationType.YAML or not self.configuration.experimental:
@@ -831,7 +1309,10 @@ class HacsBase:
                 repository = self.repositories.get_by_full_name(HacsGitHubRepo.INTEGRATION)
             elif self.configuration.experimental and not self.status.startup:
                 self.log.error("Scheduling update of hacs/integration")
-                self.queue.add(repository.common_update())
+                self.queue.add(
+                    repository.common_update,
+                    key=(repository.data.full_name_lower, "common_update"),
+                )
             if repository is None:
                 raise HacsException("Unknown error")
 
@@ -887,6 +1368,13 @@ class HacsBase:
                 continue
             if repo in self.common.archived_repositories:
                 continue
+            if (unhydrated := self.repositories.get_unhydrated(repo)) is not None and (
+                unhydrated[0] == repo_id
+                and (unhydrated[1].get("last_fetched") or 0) >= repo_data["last_fetched"]
+            ):
+                # The stored data is current, the repository is created when it is used
+                self.repositories.mark_default_unhydrated(repo_id)
+                continue
             if repository := self.repositories.get_by_full_name(repo):
                 self.repositories.set_repository_id(repository, repo_id)
                 self.repositories.mark_default(repository)
@@ -903,11 +1391,15 @@ class HacsBase:
             self.status.inital_fetch_done = True
 
         if self.stage == HacsStage.STARTUP:
-            for repository in self.repositories.list_all:
-                if (
-                    repository.data.category == category
-                    and not repository.data.installed
-                    and not self.repositories.is_default(repository.data.id)
+            for repository_id, data in list(self.repositories.unhydrated.items()):
+                if data.get("category") == category and not self.repositories.is_default(
+                    repository_id
+                ):
+                    self.log.debug("Unregister stale custom repository %s", data["full_name"])
+                    self.repositories.remove_unhydrated(repository_id)
+            for repository in self.repositories.list_by_category(category, hydrate=False):
+                if not repository.data.installed and not self.repositories.is_default(
+                    repository.data.id
                 ):
                     repository.logger.debug(
                         "%s Unregister stale custom repository", repository.string
@@ -933,20 +1425,30 @@ class HacsBase:
                 continue
             if repo in self.common.archived_repositories:
                 continue
+            if (unhydrated := self.repositories.get_unhydrated(repo)) is not None:
+                # The repository is created when it is used
+                self.repositories.mark_default_unhydrated(unhydrated[0])
+                continue
             repository = self.repositories.get_by_full_name(repo)
             if repository is not None:
                 self.repositories.mark_default(repository)
                 if self.status.new and self.configuration.dev:
                     # Force update for new installations
-                    self.queue.add(repository.common_update())
+                    self.queue.add(
+                        repository.common_update,
+                        key=(repository.data.full_name_lower, "common_update"),
+                    )
                 continue
 
             self.queue.add(
-                self.async_register_repository(
+                partial(
+                    self.async_register_repository,
                     repository_full_name=repo,
                     category=category,
                     default=True,
-                )
+                ),
+                key=(repo.lower(), "register"),
+                priority=HacsQueuePriority.REGISTRATION,
             )
 
     async def async_update_all_repositories(self, _=None) -> None:
@@ -955,23 +1457,103 @@ class HacsBase:
             return
         self.log.debug("Starting recurring background task for all repositories")
 
-        for repository in self.repositories.list_all:
-            if repository.data.category in self.common.categories:
-                self.queue.add(repository.common_update())
+        for category in self.common.categories:
+            for repository in await self.async_update_repositories_metadata(
+                self.repositories.list_by_category(category, hydrate=False),
+                self.repositories.list_unhydrated_by_category(category),
+            ):
+                self.queue.add(
+                    repository.common_update,
+                    key=(repository.data.full_name_lower, "common_update"),
+                )
 
         self.async_dispatch(HacsDispatchEvent.REPOSITORY, {"action": "reload"})
         self.log.debug("Recurring background task for all repositories done")
 
+    async def async_update_repositories_metadata(
+        self,
+        repositories: list[HacsRepository],
+        unhydrated: list[str] | None = None,
+        *,
+        refresh: bool = True,
+    ) -> list[HacsRepository]:
+        """Update repositories from batched metadata, return those that need a full update.
+
+        Repositories that are not created yet are only created when their
+        metadata changed. With refresh, the tree and info file of repositories
+        with a new commit or release are refreshed through the queue.
+        """
+        stored = {
+            repository_id: self.data.async_unregistered_repository(
+                repository_id, self.repositories.unhydrated[repository_id]
+            )
+            for repository_id in unhydrated or ()
+            if repository_id in self.repositories.unhydrated
+        }
+        if not repositories and not stored:
+            return []
+        metadata = await async_fetch_repository_metadata(
+            self.githubapi,
+            [
+                (repository.data.full_name, repository.metadata_manifest_path)
+                for repository in (*repositories, *stored.values())
+            ],
+            releases=max(self.configuration.release_limit * 2, 10),
+        )
+
+        repositories = list(repositories)
+        for repository_id, repository in stored.items():
+            result = metadata.get(repository.data.full_name_lower)
+            if (
+                result is not None
+                and result.full_name.lower() == repository.data.full_name_lower
+                and not result.attributes.get("archived")
+                and result.last_commit == repository.data.last_commit
+                and next(
+                    (release.tag_name for release in repository.releases_from_metadata(result)),
+                    None,
+                )
+                == repository.data.last_version
+            ):
+                # Unchanged, the stored data is kept until the repository is used
+                continue
+            if (repository := self.repositories.get_by_id(repository_id)) is not None:
+                repositories.append(repository)
+
+        missing = []
+        for repository in repositories:
+            result = metadata.get(repository.data.full_name_lower)
+            if result is None or result.full_name.lower() != repository.data.full_name_lower:
+                # Not found, renamed or failed, the REST update handles these
+                missing.append(repository)
+                continue
+            state = (repository.data.last_commit, repository.data.last_version)
+            if not repository.update_from_metadata(result):
+                # Archived and removed repositories and refs without files are also left to it
+                missing.append(repository)
+                continue
+            if refresh and state != (repository.data.last_commit, repository.data.last_version):
+                self.queue.add(
+                    repository.async_refresh_content,
+                    key=(repository.data.full_name_lower, "refresh_content"),
+                )
+        self.log.debug(
+            "Updated %s repositories from batched metadata, %s left for full update",
+            len(repositories) - len(missing),
+            len(missing),
+        )
+        return missing
+
     async def async_check_rate_limit(self, _=None) -> None:
-        """Check rate limit."""
-        if not self.system.disabled or self.system.disabled_reason != HacsDisabledReason.RATE_LIMIT:
+        """Resume the queue once the GitHub API budget allows it."""
+        if self.github_budget.paused_until() is not None:
             return
 
-        self.log.debug("Checking if ratelimit has lifted")
-        can_update = await self.async_can_update()
-        self.log.debug("Ratelimit indicate we can update %s", can_update)
-        if can_update > 0:
+        if self.system.disabled and self.system.disabled_reason == HacsDisabledReason.RATE_LIMIT:
             self.enable_hacs()
+
+        if self.queue.has_pending_tasks and not self.queue.running:
+            self.log.debug("GitHub API budget available, resuming the queue")
             await self.async_process_queue()
 
     async def async_process_queue(self, _=None) -> None:
@@ -988,7 +1570,7 @@ class HacsBase:
 
         async def _handle_queue():
             if not self.queue.has_pending_tasks:
-                await self.data.async_write()
+                self.data.async_schedule_write()
                 return
             can_update = await self.async_can_update()
             self.log.debug(
@@ -997,10 +1579,12 @@ class HacsBase:
                 self.queue.pending_tasks,
             )
             if can_update != 0:
+                calls = self.github_budget.calls
                 try:
-                    await self.queue.execute(can_update)
+                    tasks = await self.queue.execute(can_update)
                 except HacsExecutionStillInProgress:
                     return
+                self.github_budget.record_tasks(tasks, self.github_budget.calls - calls)
 
                 await _handle_queue()
 
@@ -1061,7 +1645,7 @@ class HacsBase:
                 repository.remove()
 
         if need_to_save:
-            await self.data.async_write()
+            self.data.async_schedule_write()
 
     async def async_update_downloaded_repositories(self, _=None) -> None:
         """Execute the task."""
@@ -1071,7 +1655,10 @@ class HacsBase:
 
         for repository in self.repositories.list_downloaded:
             if repository.data.category in self.common.categories:
-                self.queue.add(repository.update_repository(ignore_issues=True))
+                self.queue.add(
+                    partial(repository.update_repository, ignore_issues=True),
+                    key=(repository.data.full_name_lower, "update_repository"),
+                )
 
         self.log.debug("Recurring background task for downloaded repositories done")
 
@@ -1097,8 +1684,14 @@ class HacsBase:
                 repository.data.category in self.common.categories
                 and not self.repositories.is_default(repository.data.id)
             ):
-                repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+                if self.queue.add(
+                    partial(update_repository, repository),
+                    key=(repository.data.full_name_lower, "update_repository"),
+                ):
+                    repositories_to_update += 1
+
+        if not repositories_to_update:
+            repositories_updated.set()
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
@@ -1163,7 +1756,7 @@ class HacsBase:
                     was_installed = True
                     stored["acknowledged"] = False
                     # Remove from HACS
-                    critical_queue.add(repo.uninstall())
+                    critical_queue.add(repo.uninstall, priority=HacsQueuePriority.USER)
                     repo.remove()
 
             stored_critical.append(stored)
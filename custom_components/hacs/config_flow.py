@@ -33,6 +33,9 @@ from .utils.configuration_schema import (
     RELEASE_LIMIT,
     SIDEPANEL_ICON,
     SIDEPANEL_TITLE,
+    STORAGE_CODEC,
+    STORAGE_CODECS,
+    STORAGE_JOURNAL,
 )
 from .utils.logger import LOGGER
 
@@ -256,6 +259,10 @@ class HacsOptionsFlowHandler(OptionsFlow):
                 vol.Optional(NETDAEMON, default=hacs.configuration.netdaemon): bool,
                 vol.Optional(DEBUG, default=hacs.configuration.debug): bool,
                 vol.Optional(EXPERIMENTAL, default=hacs.configuration.experimental): bool,
+                vol.Optional(STORAGE_CODEC, default=hacs.configuration.storage_codec): vol.In(
+                    STORAGE_CODECS
+                ),
+                vol.Optional(STORAGE_JOURNAL, default=hacs.configuration.storage_journal): bool,
             }
 
         return self.async_show_form(step_id="user", data_schema=vol.Schema(schema))
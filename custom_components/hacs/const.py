@@ -15,7 +15,11 @@ TV = TypeVar("TV")
 PACKAGE_NAME = "custom_components.hacs"
 
 DEFAULT_CONCURRENT_TASKS = 15
-DEFAULT_CONCURRENT_BACKOFF_TIME = 1
+DEFAULT_CONCURRENT_MAX_TASKS = 50
+
+# Streamed downloads are read in chunks, and written to disk once the buffer is full
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_WRITE_BUFFER_SIZE = 1024 * 1024
 
 HACS_REPOSITORY_ID = "172733314"
 
@@ -25,6 +29,8 @@ HACS_ACTION_GITHUB_API_HEADERS = {
 }
 
 VERSION_STORAGE = "6"
+# Version of compressed store files, which older versions of HACS can not load
+VERSION_STORAGE_COMPRESSED = "7"
 STORENAME = "hacs"
 
 HACS_SYSTEM_ID = "0717a0cd-745c-48fd-9b16-c8534c9704f9-bc944b0f-fd42-4a58-a072-ade38d1444cd"
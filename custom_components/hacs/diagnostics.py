@@ -33,6 +33,7 @@ async def async_get_config_entry_diagnostics(
             "archived_repositories": hacs.common.archived_repositories,
             "ignored_repositories": hacs.common.ignored_repositories,
             "lovelace_mode": hacs.core.lovelace_mode,
+            "storage_writes": hacs.data.as_dict(),
             "configuration": {},
         },
         "custom_repositories": [
@@ -79,4 +80,7 @@ async def async_get_config_entry_diagnostics(
     except GitHubException as exception:
         data["rate_limit"] = str(exception)
 
+    data["rate_limit_budget"] = hacs.github_budget.as_dict()
+    data["concurrency"] = hacs.concurrency.as_dict()
+
     return async_redact_data(data, (TOKEN,))
@@ -1,5 +1,6 @@
 """Helper constants."""
 # pylint: disable=missing-class-docstring
+from enum import IntEnum
 import sys
 
 if sys.version_info.minor >= 11:
@@ -88,3 +89,11 @@ class HacsDisabledReason(StrEnum):
     CONSTRAINS = "constrains"
     LOAD_HACS = "load_hacs"
     RESTORE = "restore"
+
+
+class HacsQueuePriority(IntEnum):
+    """Priority of queued tasks, lower values are executed first."""
+
+    USER = 0
+    REGISTRATION = 1
+    BACKGROUND = 2
@@ -0,0 +1,6 @@
+"""HACS Frontend"""
+from .version import VERSION
+
+
+def locate_dir():
+    return __path__[0]
@@ -0,0 +1 @@
+import{c as e,u as t}from"./c.743a15a1.js";import{u as a,eO as r}from"./main-ad130be7.js";import{e as n,f as i,h as o}from"./c.d2e52e5a.js";import"./c.d262aab0.js";import"./c.f1291e50.js";import"./c.9b92f489.js";import"./c.82eccc94.js";import"./c.8e28b461.js";import"./c.3f859915.js";import"./c.0ca5587f.js";import"./c.42d6aebd.js";import"./c.2d5ed670.js";import"./c.2ee83bd0.js";import"./c.4266acdb.js";import"./c.0a1cf8d0.js";import"./c.21c042d4.js";import"./c.8d4c35ad.js";import"./c.f2bb3724.js";import"./c.4feb0cb8.js";import"./c.3da15c48.js";function u(e){return Intl.getCanonicalLocales(e)}function l(e){if("symbol"==typeof e)throw TypeError("Cannot convert a Symbol value to a string");return String(e)}function s(e){if(void 0===e)return NaN;if(null===e)return 0;if("boolean"==typeof e)return e?1:0;if("number"==typeof e)return e;if("symbol"==typeof e||"bigint"==typeof e)throw new TypeError("Cannot convert symbol/bigint to number");return Number(e)}function c(e){if(null==e)throw new TypeError("undefined/null cannot be converted to object");return Object(e)}function m(e,t){return Object.is?Object.is(e,t):e===t?0!==e||1/e==1/t:e!=e&&t!=t}function f(e){return new Array(e)}function d(e,t){return Object.prototype.hasOwnProperty.call(e,t)}function p(e,t){return e-Math.floor(e/t)*t}function g(e){return Math.floor(e/864e5)}function D(e){return Date.UTC(e,0)/864e5}function v(e){return new Date(e).getUTCFullYear()}function h(e){return e%4!=0?365:e%100!=0?366:e%400!=0?365:366}function y(e){return g(e)-D(v(e))}function F(e){return 365===h(v(e))?0:1}function T(e){var t=y(e),a=F(e);if(t>=0&&t<31)return 0;if(t<59+a)return 1;if(t<90+a)return 2;if(t<120+a)return 3;if(t<151+a)return 4;if(t<181+a)return 5;if(t<212+a)return 6;if(t<243+a)return 7;if(t<273+a)return 8;if(t<304+a)return 9;if(t<334+a)return 10;if(t<365+a)return 11;throw new Error("Invalid time")}function b(e){return void 0===e?Object.create(null):c(e)}function A(e,t,a,r){if(void 0!==e){if(e=Number(e),isNaN(e)||e<t||e>a)throw new RangeError("".concat(e," is outside of range [").concat(t,", ").concat(a,"]"));return Math.floor(e)}return r}function S(e,t,a,r,n){return A(e[t],a,r,n)}function P(e,t,a,r,n){if("object"!=typeof e)throw new TypeError("Options must be an object");var i=e[t];if(void 0!==i){if("boolean"!==a&&"string"!==a)throw new TypeError("invalid type");if("boolean"===a&&(i=Boolean(i)),"string"===a&&(i=l(i)),void 0!==r&&!r.filter((function(e){return e==i})).length)throw new RangeError("".concat(i," is not within ").concat(r.join(", ")));return i}return n}var E=["angle-degree","area-acre","area-hectare","concentr-percent","digital-bit","digital-byte","digital-gigabit","digital-gigabyte","digital-kilobit","digital-kilobyte","digital-megabit","digital-megabyte","digital-petabyte","digital-terabit","digital-terabyte","duration-day","duration-hour","duration-millisecond","duration-minute","duration-month","duration-second","duration-week","duration-year","length-centimeter","length-foot","length-inch","length-kilometer","length-meter","length-mile-scandinavian","length-mile","length-millimeter","length-yard","mass-gram","mass-kilogram","mass-ounce","mass-pound","mass-stone","temperature-celsius","temperature-fahrenheit","volume-fluid-ounce","volume-gallon","volume-liter","volume-milliliter"];function C(e){return e.slice(e.indexOf("-")+1)}var w=E.map(C);function M(e){return w.indexOf(e)>-1}var k=/[^A-Z]/;function O(e){return 3===(e=e.replace(/([a-z])/g,(function(e,t){return t.toUpperCase()}))).length&&!k.test(e)}function L(e){if(M(e=e.replace(/([A-Z])/g,(function(e,t){return t.toLowerCase()}))))return!0;var t=e.split("-per-");if(2!==t.length)return!1;var a=t[0],r=t[1];return!(!M(a)||!M(r))}function _(e){return Math.floor(Math.log(e)*Math.LOG10E)}function I(e,t){if("function"==typeof e.repeat)return e.repeat(t);for(var a=new Array(t),r=0;r<a.length;r++)a[r]=e;return a.join("")}function N(e,t,a,r){e.get(t)||e.set(t,Object.create(null)),e.get(t)[a]=r}function j(e,t){for(var a=[],r=2;r<arguments.length;r++)a[r-2]=arguments[r];var n=e.get(t);if(!n)throw new TypeError("".concat(t," InternalSlot has not been initialized"));return a.reduce((function(e,t){return e[t]=n[t],e}),Object.create(null))}function B(e,t,a){if(void 0===a&&(a=Error),!e)throw new a(t)}function R(e,t,a){var r=(0,a.getInternalSlots)(e),n=r.notation,i=r.dataLocaleData,o=r.numberingSystem;switch(n){case"standard":return 0;case"scientific":return t;case"engineering":return 3*Math.floor(t/3);default:var u=r.compactDisplay,l=r.style,s=r.currencyDisplay,c=void 0;if("currency"===l&&"name"!==s){c=(i.numbers.currency[o]||i.numbers.currency[i.numbers.nu[0]]).short}else{var m=i.numbers.decimal[o]||i.numbers.decimal[i.numbers.nu[0]];c="long"===u?m.long:m.short}if(!c)return 0;var f=String(Math.pow(10,t)),d=Object.keys(c);if(f<d[0])return 0;if(f>d[d.length-1])return d[d.length-1].length-1;var p=d.indexOf(f);if(-1===p)return 0;var g=d[p];return"0"===c[g].other?0:g.length-c[g].other.match(/0+/)[0].length}}function G(e,t,a){var r,n,i,o,u=a;if(0===e)r=I("0",u),n=0,i=0;else{var l=e.toString(),s=l.indexOf("e"),c=l.split("e"),m=c[0],f=c[1],d=m.replace(".","");if(s>=0&&d.length<=u)n=+f,r=d+I("0",u-d.length),i=e;else{var p=(n=_(e))-u+1,g=Math.round(v(e,p));v(g,u-1)>=10&&(n+=1,g=Math.floor(g/10)),r=g.toString(),i=v(g,u-1-n)}}if(n>=u-1?(r+=I("0",n-u+1),o=n+1):n>=0?(r="".concat(r.slice(0,n+1),".").concat(r.slice(n+1)),o=n+1):(r="0.".concat(I("0",-n-1)).concat(r),o=1),r.indexOf(".")>=0&&a>t){for(var D=a-t;D>0&&"0"===r[r.length-1];)r=r.slice(0,-1),D--;"."===r[r.length-1]&&(r=r.slice(0,-1))}return{formattedString:r,roundedNumber:i,integerDigitsCount:o};function v(e,t){return t<0?e*Math.pow(10,-t):e/Math.pow(10,t)}}function x(e,t,a){var r,n,i=a,o=Math.round(e*Math.pow(10,i)),u=o/Math.pow(10,i);if(o<1e21)r=o.toString();else{var l=(r=o.toString()).split("e"),s=l[0],c=l[1];r=s.replace(".",""),r+=I("0",Math.max(+c-r.length+1,0))}if(0!==i){var m=r.length;if(m<=i)r=I("0",i+1-m)+r,m=i+1;var f=r.slice(0,m-i),d=r.slice(m-i);r="".concat(f,".").concat(d),n=f.length}else n=r.length;for(var p=a-t;p>0&&"0"===r[r.length-1];)r=r.slice(0,-1),p--;return"."===r[r.length-1]&&(r=r.slice(0,-1)),{formattedString:r,roundedNumber:u,integerDigitsCount:n}}function z(e,t){var a,r=t<0||m(t,-0);switch(r&&(t=-t),e.roundingType){case"significantDigits":a=G(t,e.minimumSignificantDigits,e.maximumSignificantDigits);break;case"fractionDigits":a=x(t,e.minimumFractionDigits,e.maximumFractionDigits);break;default:(a=G(t,1,2)).integerDigitsCount>1&&(a=x(t,0,0))}t=a.roundedNumber;var n=a.formattedString,i=a.integerDigitsCount,o=e.minimumIntegerDigits;i<o&&(n=I("0",o-i)+n);return r&&(t=-t),{roundedNumber:t,formattedString:n}}function U(e,t,a){var r=a.getInternalSlots;if(0===t)return[0,0];t<0&&(t=-t);var n=_(t),i=R(e,n,{getInternalSlots:r});t=i<0?t*Math.pow(10,-i):t/Math.pow(10,i);var o=z(r(e),t);return 0===o.roundedNumber||_(o.roundedNumber)===n-i?[i,n]:[R(e,n+1,{getInternalSlots:r}),n+1]}function Z(e,t){var a=t.currencyDigitsData;return d(a,e)?a[e]:2}var H,K={adlm:["𞥐","𞥑","𞥒","𞥓","𞥔","𞥕","𞥖","𞥗","𞥘","𞥙"],ahom:["𑜰","𑜱","𑜲","𑜳","𑜴","𑜵","𑜶","𑜷","𑜸","𑜹"],arab:["٠","١","٢","٣","٤","٥","٦","٧","٨","٩"],arabext:["۰","۱","۲","۳","۴","۵","۶","۷","۸","۹"],bali:["᭐","᭑","᭒","᭓","᭔","᭕","᭖","᭗","᭘","᭙"],beng:["০","১","২","৩","৪","৫","৬","৭","৮","৯"],bhks:["𑱐","𑱑","𑱒","𑱓","𑱔","𑱕","𑱖","𑱗","𑱘","𑱙"],brah:["𑁦","𑁧","𑁨","𑁩","𑁪","𑁫","𑁬","𑁭","𑁮","𑁯"],cakm:["𑄶","𑄷","𑄸","𑄹","𑄺","𑄻","𑄼","𑄽","𑄾","𑄿"],cham:["꩐","꩑","꩒","꩓","꩔","꩕","꩖","꩗","꩘","꩙"],deva:["०","१","२","३","४","५","६","७","८","९"],diak:["𑥐","𑥑","𑥒","𑥓","𑥔","𑥕","𑥖","𑥗","𑥘","𑥙"],fullwide:["０","１","２","３","４","５","６","７","８","９"],gong:["𑶠","𑶡","𑶢","𑶣","𑶤","𑶥","𑶦","𑶧","𑶨","𑶩"],gonm:["𑵐","𑵑","𑵒","𑵓","𑵔","𑵕","𑵖","𑵗","𑵘","𑵙"],gujr:["૦","૧","૨","૩","૪","૫","૬","૭","૮","૯"],guru:["੦","੧","੨","੩","੪","੫","੬","੭","੮","੯"],hanidec:["〇","一","二","三","四","五","六","七","八","九"],hmng:["𖭐","𖭑","𖭒","𖭓","𖭔","𖭕","𖭖","𖭗","𖭘","𖭙"],hmnp:["𞅀","𞅁","𞅂","𞅃","𞅄","𞅅","𞅆","𞅇","𞅈","𞅉"],java:["꧐","꧑","꧒","꧓","꧔","꧕","꧖","꧗","꧘","꧙"],kali:["꤀","꤁","꤂","꤃","꤄","꤅","꤆","꤇","꤈","꤉"],khmr:["០","១","២","៣","៤","៥","៦","៧","៨","៩"],knda:["೦","೧","೨","೩","೪","೫","೬","೭","೮","೯"],lana:["᪀","᪁","᪂","᪃","᪄","᪅","᪆","᪇","᪈","᪉"],lanatham:["᪐","᪑","᪒","᪓","᪔","᪕","᪖","᪗","᪘","᪙"],laoo:["໐","໑","໒","໓","໔","໕","໖","໗","໘","໙"],lepc:["᪐","᪑","᪒","᪓","᪔","᪕","᪖","᪗","᪘","᪙"],limb:["᥆","᥇","᥈","᥉","᥊","᥋","᥌","᥍","᥎","᥏"],mathbold:["𝟎","𝟏","𝟐","𝟑","𝟒","𝟓","𝟔","𝟕","𝟖","𝟗"],mathdbl:["𝟘","𝟙","𝟚","𝟛","𝟜","𝟝","𝟞","𝟟","𝟠","𝟡"],mathmono:["𝟶","𝟷","𝟸","𝟹","𝟺","𝟻","𝟼","𝟽","𝟾","𝟿"],mathsanb:["𝟬","𝟭","𝟮","𝟯","𝟰","𝟱","𝟲","𝟳","𝟴","𝟵"],mathsans:["𝟢","𝟣","𝟤","𝟥","𝟦","𝟧","𝟨","𝟩","𝟪","𝟫"],mlym:["൦","൧","൨","൩","൪","൫","൬","൭","൮","൯"],modi:["𑙐","𑙑","𑙒","𑙓","𑙔","𑙕","𑙖","𑙗","𑙘","𑙙"],mong:["᠐","᠑","᠒","᠓","᠔","᠕","᠖","᠗","᠘","᠙"],mroo:["𖩠","𖩡","𖩢","𖩣","𖩤","𖩥","𖩦","𖩧","𖩨","𖩩"],mtei:["꯰","꯱","꯲","꯳","꯴","꯵","꯶","꯷","꯸","꯹"],mymr:["၀","၁","၂","၃","၄","၅","၆","၇","၈","၉"],mymrshan:["႐","႑","႒","႓","႔","႕","႖","႗","႘","႙"],mymrtlng:["꧰","꧱","꧲","꧳","꧴","꧵","꧶","꧷","꧸","꧹"],newa:["𑑐","𑑑","𑑒","𑑓","𑑔","𑑕","𑑖","𑑗","𑑘","𑑙"],nkoo:["߀","߁","߂","߃","߄","߅","߆","߇","߈","߉"],olck:["᱐","᱑","᱒","᱓","᱔","᱕","᱖","᱗","᱘","᱙"],orya:["୦","୧","୨","୩","୪","୫","୬","୭","୮","୯"],osma:["𐒠","𐒡","𐒢","𐒣","𐒤","𐒥","𐒦","𐒧","𐒨","𐒩"],rohg:["𐴰","𐴱","𐴲","𐴳","𐴴","𐴵","𐴶","𐴷","𐴸","𐴹"],saur:["꣐","꣑","꣒","꣓","꣔","꣕","꣖","꣗","꣘","꣙"],segment:["🯰","🯱","🯲","🯳","🯴","🯵","🯶","🯷","🯸","🯹"],shrd:["𑇐","𑇑","𑇒","𑇓","𑇔","𑇕","𑇖","𑇗","𑇘","𑇙"],sind:["𑋰","𑋱","𑋲","𑋳","𑋴","𑋵","𑋶","𑋷","𑋸","𑋹"],sinh:["෦","෧","෨","෩","෪","෫","෬","෭","෮","෯"],sora:["𑃰","𑃱","𑃲","𑃳","𑃴","𑃵","𑃶","𑃷","𑃸","𑃹"],sund:["᮰","᮱","᮲","᮳","᮴","᮵","᮶","᮷","᮸","᮹"],takr:["𑛀","𑛁","𑛂","𑛃","𑛄","𑛅","𑛆","𑛇","𑛈","𑛉"],talu:["᧐","᧑","᧒","᧓","᧔","᧕","᧖","᧗","᧘","᧙"],tamldec:["௦","௧","௨","௩","௪","௫","௬","௭","௮","௯"],telu:["౦","౧","౨","౩","౪","౫","౬","౭","౮","౯"],thai:["๐","๑","๒","๓","๔","๕","๖","๗","๘","๙"],tibt:["༠","༡","༢","༣","༤","༥","༦","༧","༨","༩"],tirh:["𑓐","𑓑","𑓒","𑓓","𑓔","𑓕","𑓖","𑓗","𑓘","𑓙"],vaii:["ᘠ","ᘡ","ᘢ","ᘣ","ᘤ","ᘥ","ᘦ","ᘧ","ᘨ","ᘩ"],wara:["𑣠","𑣡","𑣢","𑣣","𑣤","𑣥","𑣦","𑣧","𑣨","𑣩"],wcho:["𞋰","𞋱","𞋲","𞋳","𞋴","𞋵","𞋶","𞋷","𞋸","𞋹"]},Y=/[\$\+<->\^`\|~\xA2-\xA6\xA8\xA9\xAC\xAE-\xB1\xB4\xB8\xD7\xF7\u02C2-\u02C5\u02D2-\u02DF\u02E5-\u02EB\u02ED\u02EF-\u02FF\u0375\u0384\u0385\u03F6\u0482\u058D-\u058F\u0606-\u0608\u060B\u060E\u060F\u06DE\u06E9\u06FD\u06FE\u07F6\u07FE\u07FF\u09F2\u09F3\u09FA\u09FB\u0AF1\u0B70\u0BF3-\u0BFA\u0C7F\u0D4F\u0D79\u0E3F\u0F01-\u0F03\u0F13\u0F15-\u0F17\u0F1A-\u0F1F\u0F34\u0F36\u0F38\u0FBE-\u0FC5\u0FC7-\u0FCC\u0FCE\u0FCF\u0FD5-\u0FD8\u109E\u109F\u1390-\u1399\u166D\u17DB\u1940\u19DE-\u19FF\u1B61-\u1B6A\u1B74-\u1B7C\u1FBD\u1FBF-\u1FC1\u1FCD-\u1FCF\u1FDD-\u1FDF\u1FED-\u1FEF\u1FFD\u1FFE\u2044\u2052\u207A-\u207C\u208A-\u208C\u20A0-\u20BF\u2100\u2101\u2103-\u2106\u2108\u2109\u2114\u2116-\u2118\u211E-\u2123\u2125\u2127\u2129\u212E\u213A\u213B\u2140-\u2144\u214A-\u214D\u214F\u218A\u218B\u2190-\u2307\u230C-\u2328\u232B-\u2426\u2440-\u244A\u249C-\u24E9\u2500-\u2767\u2794-\u27C4\u27C7-\u27E5\u27F0-\u2982\u2999-\u29D7\u29DC-\u29FB\u29FE-\u2B73\u2B76-\u2B95\u2B97-\u2BFF\u2CE5-\u2CEA\u2E50\u2E51\u2E80-\u2E99\u2E9B-\u2EF3\u2F00-\u2FD5\u2FF0-\u2FFB\u3004\u3012\u3013\u3020\u3036\u3037\u303E\u303F\u309B\u309C\u3190\u3191\u3196-\u319F\u31C0-\u31E3\u3200-\u321E\u322A-\u3247\u3250\u3260-\u327F\u328A-\u32B0\u32C0-\u33FF\u4DC0-\u4DFF\uA490-\uA4C6\uA700-\uA716\uA720\uA721\uA789\uA78A\uA828-\uA82B\uA836-\uA839\uAA77-\uAA79\uAB5B\uAB6A\uAB6B\uFB29\uFBB2-\uFBC1\uFDFC\uFDFD\uFE62\uFE64-\uFE66\uFE69\uFF04\uFF0B\uFF1C-\uFF1E\uFF3E\uFF40\uFF5C\uFF5E\uFFE0-\uFFE6\uFFE8-\uFFEE\uFFFC\uFFFD]|\uD800[\uDD37-\uDD3F\uDD79-\uDD89\uDD8C-\uDD8E\uDD90-\uDD9C\uDDA0\uDDD0-\uDDFC]|\uD802[\uDC77\uDC78\uDEC8]|\uD805\uDF3F|\uD807[\uDFD5-\uDFF1]|\uD81A[\uDF3C-\uDF3F\uDF45]|\uD82F\uDC9C|\uD834[\uDC00-\uDCF5\uDD00-\uDD26\uDD29-\uDD64\uDD6A-\uDD6C\uDD83\uDD84\uDD8C-\uDDA9\uDDAE-\uDDE8\uDE00-\uDE41\uDE45\uDF00-\uDF56]|\uD835[\uDEC1\uDEDB\uDEFB\uDF15\uDF35\uDF4F\uDF6F\uDF89\uDFA9\uDFC3]|\uD836[\uDC00-\uDDFF\uDE37-\uDE3A\uDE6D-\uDE74\uDE76-\uDE83\uDE85\uDE86]|\uD838[\uDD4F\uDEFF]|\uD83B[\uDCAC\uDCB0\uDD2E\uDEF0\uDEF1]|\uD83C[\uDC00-\uDC2B\uDC30-\uDC93\uDCA0-\uDCAE\uDCB1-\uDCBF\uDCC1-\uDCCF\uDCD1-\uDCF5\uDD0D-\uDDAD\uDDE6-\uDE02\uDE10-\uDE3B\uDE40-\uDE48\uDE50\uDE51\uDE60-\uDE65\uDF00-\uDFFF]|\uD83D[\uDC00-\uDED7\uDEE0-\uDEEC\uDEF0-\uDEFC\uDF00-\uDF73\uDF80-\uDFD8\uDFE0-\uDFEB]|\uD83E[\uDC00-\uDC0B\uDC10-\uDC47\uDC50-\uDC59\uDC60-\uDC87\uDC90-\uDCAD\uDCB0\uDCB1\uDD00-\uDD78\uDD7A-\uDDCB\uDDCD-\uDE53\uDE60-\uDE6D\uDE70-\uDE74\uDE78-\uDE7A\uDE80-\uDE86\uDE90-\uDEA8\uDEB0-\uDEB6\uDEC0-\uDEC2\uDED0-\uDED6\uDF00-\uDF92\uDF94-\uDFCA]/,W=new RegExp("^".concat(Y.source)),V=new RegExp("".concat(Y.source,"$")),J=/[#0](?:[\.,][#0]+)*/g;function q(e,t,a,r){var n,i,o=e.sign,u=e.exponent,l=e.magnitude,s=r.notation,c=r.style,m=r.numberingSystem,f=t.numbers.nu[0],d=null;if("compact"===s&&l&&(d=function(e,t,a,r,n,i,o){var u,l,s=e.roundedNumber,c=e.sign,m=e.magnitude,f=String(Math.pow(10,m)),d=a.numbers.nu[0];if("currency"===r&&"name"!==i){var p=null===(u=((g=a.numbers.currency)[o]||g[d]).short)||void 0===u?void 0:u[f];if(!p)return null;l=X(t,s,p)}else{var g,D=((g=a.numbers.decimal)[o]||g[d])[n][f];if(!D)return null;l=X(t,s,D)}if("0"===l)return null;return l=Q(l,c).replace(/([^\s;\-\+\d¤]+)/g,"{c:$1}").replace(/0+/,"0")}(e,a,t,c,r.compactDisplay,r.currencyDisplay,m)),"currency"===c&&"name"!==r.currencyDisplay){var p=t.currencies[r.currency];if(p)switch(r.currencyDisplay){case"code":n=r.currency;break;case"symbol":n=p.symbol;break;default:n=p.narrow}else n=r.currency}if(d)i=d;else if("decimal"===c||"unit"===c||"currency"===c&&"name"===r.currencyDisplay)i=Q((t.numbers.decimal[m]||t.numbers.decimal[f]).standard,o);else if("currency"===c){i=Q((D=t.numbers.currency[m]||t.numbers.currency[f])[r.currencySign],o)}else{i=Q(t.numbers.percent[m]||t.numbers.percent[f],o)}var g=J.exec(i)[0];if(i=i.replace(J,"{0}").replace(/'(.)'/g,"$1"),"currency"===c&&"name"!==r.currencyDisplay){var D,v=(D=t.numbers.currency[m]||t.numbers.currency[f]).currencySpacing.afterInsertBetween;v&&!V.test(n)&&(i=i.replace("¤{0}","¤".concat(v,"{0}")));var h=D.currencySpacing.beforeInsertBetween;h&&!W.test(n)&&(i=i.replace("{0}¤","{0}".concat(h,"¤")))}for(var y=i.split(/({c:[^}]+}|\{0\}|[¤%\-\+])/g),F=[],T=t.numbers.symbols[m]||t.numbers.symbols[f],b=0,A=y;b<A.length;b++){if(U=A[b])switch(U){case"{0}":F.push.apply(F,$(T,e,s,u,m,!d&&r.useGrouping,g));break;case"-":F.push({type:"minusSign",value:T.minusSign});break;case"+":F.push({type:"plusSign",value:T.plusSign});break;case"%":F.push({type:"percentSign",value:T.percentSign});break;case"¤":F.push({type:"currency",value:n});break;default:/^\{c:/.test(U)?F.push({type:"compact",value:U.substring(3,U.length-1)}):F.push({type:"literal",value:U})}}switch(c){case"currency":if("name"===r.currencyDisplay){var S=(t.numbers.currency[m]||t.numbers.currency[f]).unitPattern,P=void 0,E=t.currencies[r.currency];P=E?X(a,e.roundedNumber*Math.pow(10,u),E.displayName):r.currency;for(var C=[],w=0,M=S.split(/(\{[01]\})/g);w<M.length;w++){switch(U=M[w]){case"{0}":C.push.apply(C,F);break;case"{1}":C.push({type:"currency",value:P});break;default:U&&C.push({type:"literal",value:U})}}return C}return F;case"unit":var k=r.unit,O=r.unitDisplay,L=t.units.simple[k];S=void 0;if(L)S=X(a,e.roundedNumber*Math.pow(10,u),t.units.simple[k][O]);else{var _=k.split("-per-"),I=_[0],N=_[1];L=t.units.simple[I];var j=X(a,e.roundedNumber*Math.pow(10,u),t.units.simple[I][O]),B=t.units.simple[N].perUnit[O];if(B)S=B.replace("{0}",j);else{var R=t.units.compound.per[O],G=X(a,1,t.units.simple[N][O]);S=S=R.replace("{0}",j).replace("{1}",G.replace("{0}",""))}}C=[];for(var x=0,z=S.split(/(\s*\{0\}\s*)/);x<z.length;x++){var U=z[x],Z=/^(\s*)\{0\}(\s*)$/.exec(U);Z?(Z[1]&&C.push({type:"literal",value:Z[1]}),C.push.apply(C,F),Z[2]&&C.push({type:"literal",value:Z[2]})):U&&C.push({type:"unit",value:U})}return C;default:return F}}function $(e,t,a,r,n,i,o){var u=[],l=t.formattedString,s=t.roundedNumber;if(isNaN(s))return[{type:"nan",value:l}];if(!isFinite(s))return[{type:"infinity",value:l}];var c=K[n];c&&(l=l.replace(/\d/g,(function(e){return c[+e]||e})));var m,f,d=l.indexOf(".");if(d>0?(m=l.slice(0,d),f=l.slice(d+1)):m=l,i&&("compact"!==a||s>=1e4)){var p=e.group,g=[],D=o.split(".")[0].split(","),v=3,h=3;D.length>1&&(v=D[D.length-1].length),D.length>2&&(h=D[D.length-2].length);var y=m.length-v;if(y>0){for(g.push(m.slice(y,y+v)),y-=h;y>0;y-=h)g.push(m.slice(y,y+h));g.push(m.slice(0,y+h))}else g.push(m);for(;g.length>0;){var F=g.pop();u.push({type:"integer",value:F}),g.length>0&&u.push({type:"group",value:p})}}else u.push({type:"integer",value:m});if(void 0!==f&&u.push({type:"decimal",value:e.decimal},{type:"fraction",value:f}),("scientific"===a||"engineering"===a)&&isFinite(s)){u.push({type:"exponentSeparator",value:e.exponential}),r<0&&(u.push({type:"exponentMinusSign",value:e.minusSign}),r=-r);var T=x(r,0,0);u.push({type:"exponentInteger",value:T.formattedString})}return u}function Q(e,t){e.indexOf(";")<0&&(e="".concat(e,";-").concat(e));var a=e.split(";"),r=a[0],n=a[1];switch(t){case 0:return r;case-1:return n;default:return n.indexOf("-")>=0?n.replace(/-/g,"+"):"+".concat(r)}}function X(e,t,a){return a[e.select(t)]||a.other}function ee(e,t,a){var r,n,i,o=a.getInternalSlots,u=o(e),l=u.pl,s=u.dataLocaleData,c=u.numberingSystem,f=s.numbers.symbols[c]||s.numbers.symbols[s.numbers.nu[0]],d=0,p=0;if(isNaN(t))n=f.nan;else if(isFinite(t)){"percent"===u.style&&(t*=100),p=(r=U(e,t,{getInternalSlots:o}))[0],d=r[1];var g=z(u,t=p<0?t*Math.pow(10,-p):t/Math.pow(10,p));n=g.formattedString,t=g.roundedNumber}else n=f.infinity;switch(u.signDisplay){case"never":i=0;break;case"auto":i=m(t,0)||t>0||isNaN(t)?0:-1;break;case"always":i=m(t,0)||t>0||isNaN(t)?1:-1;break;default:i=0===t||isNaN(t)?0:t>0?1:-1}return q({roundedNumber:t,formattedString:n,exponent:p,magnitude:d,sign:i},u.dataLocaleData,l,u)}function te(e,t,a){void 0===t&&(t=Object.create(null));var r=(0,a.getInternalSlots)(e),n=P(t,"style","string",["decimal","percent","currency","unit"],"decimal");r.style=n;var i=P(t,"currency","string",void 0,void 0);if(void 0!==i&&!O(i))throw RangeError("Malformed currency code");if("currency"===n&&void 0===i)throw TypeError("currency cannot be undefined");var o=P(t,"currencyDisplay","string",["code","symbol","narrowSymbol","name"],"symbol"),u=P(t,"currencySign","string",["standard","accounting"],"standard"),l=P(t,"unit","string",void 0,void 0);if(void 0!==l&&!L(l))throw RangeError("Invalid unit argument for Intl.NumberFormat()");if("unit"===n&&void 0===l)throw TypeError("unit cannot be undefined");var s=P(t,"unitDisplay","string",["short","narrow","long"],"short");"currency"===n&&(r.currency=i.toUpperCase(),r.currencyDisplay=o,r.currencySign=u),"unit"===n&&(r.unit=l,r.unitDisplay=s)}function ae(e,t,a,r,n){var i=S(t,"minimumIntegerDigits",1,21,1),o=t.minimumFractionDigits,u=t.maximumFractionDigits,l=t.minimumSignificantDigits,s=t.maximumSignificantDigits;if(e.minimumIntegerDigits=i,void 0!==l||void 0!==s)e.roundingType="significantDigits",l=A(l,1,21,1),s=A(s,l,21,21),e.minimumSignificantDigits=l,e.maximumSignificantDigits=s;else if(void 0!==o||void 0!==u){e.roundingType="fractionDigits",o=A(o,0,20,a),u=A(u,o,20,Math.max(o,r)),e.minimumFractionDigits=o,e.maximumFractionDigits=u}else"compact"===n?e.roundingType="compactRounding":(e.roundingType="fractionDigits",e.minimumFractionDigits=a,e.maximumFractionDigits=r)}!function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.type="MISSING_LOCALE_DATA",t}a(t,e)}(Error),function(e){e.startRange="startRange",e.shared="shared",e.endRange="endRange"}(H||(H={}));var re=Object.freeze({__proto__:null,_formatToParts:q,getInternalSlot:function(e,t,a){return j(e,t,a)[a]},getMultiInternalSlots:j,isLiteralPart:function(e){return"literal"===e.type},setInternalSlot:N,setMultiInternalSlots:function(e,t,a){for(var r=0,n=Object.keys(a);r<n.length;r++){var i=n[r];N(e,t,i,a[i])}},getMagnitude:_,defineProperty:function(e,t,a){var r=a.value;Object.defineProperty(e,t,{configurable:!0,enumerable:!1,writable:!0,value:r})},isMissingLocaleDataError:function(e){return"MISSING_LOCALE_DATA"===e.type},invariant:B,CanonicalizeLocaleList:u,CanonicalizeTimeZoneName:function(e,t){var a=t.tzData,r=t.uppercaseLinks,n=e.toUpperCase(),i=Object.keys(a).reduce((function(e,t){return e[t.toUpperCase()]=t,e}),{}),o=r[n]||i[n];return"Etc/UTC"===o||"Etc/GMT"===o?"UTC":o},CoerceOptionsToObject:b,GetNumberOption:S,GetOption:P,GetOptionsObject:function(e){if(void 0===e)return Object.create(null);if("object"==typeof e)return e;throw new TypeError("Options must be an object")},SANCTIONED_UNITS:E,removeUnitNamespace:C,SIMPLE_UNITS:w,IsSanctionedSimpleUnitIdentifier:M,IsValidTimeZoneName:function(e,t){var a=t.tzData,r=t.uppercaseLinks,n=e.toUpperCase(),i=new Set,o=new Set;return Object.keys(a).map((function(e){return e.toUpperCase()})).forEach((function(e){return i.add(e)})),Object.keys(r).forEach((function(e){o.add(e.toUpperCase()),i.add(r[e].toUpperCase())})),i.has(n)||o.has(n)},IsWellFormedCurrencyCode:O,IsWellFormedUnitIdentifier:L,ComputeExponent:U,ComputeExponentForMagnitude:R,CurrencyDigits:Z,FormatNumericToParts:function(e,t,a){for(var r=ee(e,t,a),n=f(0),i=0,o=r;i<o.length;i++){var u=o[i];n.push({type:u.type,value:u.value})}return n},FormatNumericToString:z,InitializeNumberFormat:function(e,t,a,r){var i=r.getInternalSlots,o=r.localeData,l=r.availableLocales,s=r.numberingSystemNames,c=r.getDefaultLocale,m=r.currencyDigitsData,f=u(t),d=b(a),p=Object.create(null),g=P(d,"localeMatcher","string",["lookup","best fit"],"best fit");p.localeMatcher=g;var D=P(d,"numberingSystem","string",void 0,void 0);if(void 0!==D&&s.indexOf(D)<0)throw RangeError("Invalid numberingSystems: ".concat(D));p.nu=D;var v=n(l,f,p,["nu"],o,c),h=o[v.dataLocale];B(!!h,"Missing locale data for ".concat(v.dataLocale));var y=i(e);y.locale=v.locale,y.dataLocale=v.dataLocale,y.numberingSystem=v.nu,y.dataLocaleData=h,te(e,d,{getInternalSlots:i});var F,T,A=y.style;if("currency"===A){var S=Z(y.currency,{currencyDigitsData:m});F=S,T=S}else F=0,T="percent"===A?0:3;var E=P(d,"notation","string",["standard","scientific","engineering","compact"],"standard");y.notation=E,ae(y,d,F,T,E);var C=P(d,"compactDisplay","string",["short","long"],"short");"compact"===E&&(y.compactDisplay=C);var w=P(d,"useGrouping","boolean",void 0,!0);y.useGrouping=w;var M=P(d,"signDisplay","string",["auto","never","always","exceptZero"],"auto");return y.signDisplay=M,e},PartitionNumberPattern:ee,SetNumberFormatDigitOptions:ae,SetNumberFormatUnitOptions:te,ToRawFixed:x,ToRawPrecision:G,PartitionPattern:function(e){for(var t=[],a=e.indexOf("{"),r=0,n=0,i=e.length;a<e.length&&a>-1;)B((r=e.indexOf("}",a))>a,"Invalid pattern ".concat(e)),a>n&&t.push({type:"literal",value:e.substring(n,a)}),t.push({type:e.substring(a+1,r),value:void 0}),n=r+1,a=e.indexOf("{",n);return n<i&&t.push({type:"literal",value:e.substring(n,i)}),t},SupportedLocales:function(e,t,a){return void 0!==a&&P(a=c(a),"localeMatcher","string",["lookup","best fit"],"best fit"),i(e,t)},get RangePatternType(){return H},ToString:l,ToNumber:s,TimeClip:function(e){return isFinite(e)?Math.abs(e)>8640000000000001?NaN:function(e){var t=s(e);if(isNaN(t)||m(t,-0))return 0;if(isFinite(t))return t;var a=Math.floor(Math.abs(t));return t<0&&(a=-a),m(a,-0)?0:a}(e):NaN},ToObject:c,SameValue:m,ArrayCreate:f,HasOwnProperty:d,Type:function(e){return null===e?"Null":void 0===e?"Undefined":"function"==typeof e||"object"==typeof e?"Object":"number"==typeof e?"Number":"boolean"==typeof e?"Boolean":"string"==typeof e?"String":"symbol"==typeof e?"Symbol":"bigint"==typeof e?"BigInt":void 0},Day:g,WeekDay:function(e){return p(g(e)+4,7)},DayFromYear:D,TimeFromYear:function(e){return Date.UTC(e,0)},YearFromTime:v,DaysInYear:h,DayWithinYear:y,InLeapYear:F,MonthFromTime:T,DateFromTime:function(e){var t=y(e),a=T(e),r=F(e);if(0===a)return t+1;if(1===a)return t-30;if(2===a)return t-58-r;if(3===a)return t-89-r;if(4===a)return t-119-r;if(5===a)return t-150-r;if(6===a)return t-180-r;if(7===a)return t-211-r;if(8===a)return t-242-r;if(9===a)return t-272-r;if(10===a)return t-303-r;if(11===a)return t-333-r;throw new Error("Invalid time")},HourFromTime:function(e){return p(Math.floor(e/36e5),24)},MinFromTime:function(e){return p(Math.floor(e/6e4),60)},SecFromTime:function(e){return p(Math.floor(e/1e3),60)},OrdinaryHasInstance:function(e,t,a){if("function"!=typeof e)return!1;if(null==a?void 0:a.boundTargetFunction)return t instanceof(null==a?void 0:a.boundTargetFunction);if("object"!=typeof t)return!1;var r=e.prototype;if("object"!=typeof r)throw new TypeError("OrdinaryHasInstance called on an object with an invalid prototype property.");return Object.prototype.isPrototypeOf.call(r,t)},msFromTime:function(e){return p(e,1e3)}}),ne=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0});var a=new WeakMap;t.default=function(e){var t=a.get(e);return t||(t=Object.create(null),a.set(e,t)),t}}));t(ne);var ie=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.default={"Africa/Asmera":"Africa/Nairobi","Africa/Timbuktu":"Africa/Abidjan","America/Argentina/ComodRivadavia":"America/Argentina/Catamarca","America/Atka":"America/Adak","America/Buenos_Aires":"America/Argentina/Buenos_Aires","America/Catamarca":"America/Argentina/Catamarca","America/Coral_Harbour":"America/Panama","America/Cordoba":"America/Argentina/Cordoba","America/Ensenada":"America/Tijuana","America/Fort_Wayne":"America/Indiana/Indianapolis","America/Godthab":"America/Nuuk","America/Indianapolis":"America/Indiana/Indianapolis","America/Jujuy":"America/Argentina/Jujuy","America/Knox_IN":"America/Indiana/Knox","America/Louisville":"America/Kentucky/Louisville","America/Mendoza":"America/Argentina/Mendoza","America/Montreal":"America/Toronto","America/Porto_Acre":"America/Rio_Branco","America/Rosario":"America/Argentina/Cordoba","America/Santa_Isabel":"America/Tijuana","America/Shiprock":"America/Denver","America/Virgin":"America/Puerto_Rico","Antarctica/South_Pole":"Pacific/Auckland","Asia/Ashkhabad":"Asia/Ashgabat","Asia/Calcutta":"Asia/Kolkata","Asia/Chongqing":"Asia/Shanghai","Asia/Chungking":"Asia/Shanghai","Asia/Dacca":"Asia/Dhaka","Asia/Harbin":"Asia/Shanghai","Asia/Kashgar":"Asia/Urumqi","Asia/Katmandu":"Asia/Kathmandu","Asia/Macao":"Asia/Macau","Asia/Rangoon":"Asia/Yangon","Asia/Saigon":"Asia/Ho_Chi_Minh","Asia/Tel_Aviv":"Asia/Jerusalem","Asia/Thimbu":"Asia/Thimphu","Asia/Ujung_Pandang":"Asia/Makassar","Asia/Ulan_Bator":"Asia/Ulaanbaatar","Atlantic/Faeroe":"Atlantic/Faroe","Atlantic/Jan_Mayen":"Europe/Oslo","Australia/ACT":"Australia/Sydney","Australia/Canberra":"Australia/Sydney","Australia/Currie":"Australia/Hobart","Australia/LHI":"Australia/Lord_Howe","Australia/NSW":"Australia/Sydney","Australia/North":"Australia/Darwin","Australia/Queensland":"Australia/Brisbane","Australia/South":"Australia/Adelaide","Australia/Tasmania":"Australia/Hobart","Australia/Victoria":"Australia/Melbourne","Australia/West":"Australia/Perth","Australia/Yancowinna":"Australia/Broken_Hill","Brazil/Acre":"America/Rio_Branco","Brazil/DeNoronha":"America/Noronha","Brazil/East":"America/Sao_Paulo","Brazil/West":"America/Manaus","Canada/Atlantic":"America/Halifax","Canada/Central":"America/Winnipeg","Canada/Eastern":"America/Toronto","Canada/Mountain":"America/Edmonton","Canada/Newfoundland":"America/St_Johns","Canada/Pacific":"America/Vancouver","Canada/Saskatchewan":"America/Regina","Canada/Yukon":"America/Whitehorse","Chile/Continental":"America/Santiago","Chile/EasterIsland":"Pacific/Easter",Cuba:"America/Havana",Egypt:"Africa/Cairo",Eire:"Europe/Dublin","Etc/UCT":"Etc/UTC","Europe/Belfast":"Europe/London","Europe/Tiraspol":"Europe/Chisinau",GB:"Europe/London","GB-Eire":"Europe/London","GMT+0":"Etc/GMT","GMT-0":"Etc/GMT",GMT0:"Etc/GMT",Greenwich:"Etc/GMT",Hongkong:"Asia/Hong_Kong",Iceland:"Atlantic/Reykjavik",Iran:"Asia/Tehran",Israel:"Asia/Jerusalem",Jamaica:"America/Jamaica",Japan:"Asia/Tokyo",Kwajalein:"Pacific/Kwajalein",Libya:"Africa/Tripoli","Mexico/BajaNorte":"America/Tijuana","Mexico/BajaSur":"America/Mazatlan","Mexico/General":"America/Mexico_City",NZ:"Pacific/Auckland","NZ-CHAT":"Pacific/Chatham",Navajo:"America/Denver",PRC:"Asia/Shanghai","Pacific/Enderbury":"Pacific/Kanton","Pacific/Johnston":"Pacific/Honolulu","Pacific/Ponape":"Pacific/Pohnpei","Pacific/Samoa":"Pacific/Pago_Pago","Pacific/Truk":"Pacific/Chuuk","Pacific/Yap":"Pacific/Chuuk",Poland:"Europe/Warsaw",Portugal:"Europe/Lisbon",ROC:"Asia/Taipei",ROK:"Asia/Seoul",Singapore:"Asia/Singapore",Turkey:"Europe/Istanbul",UCT:"Etc/UTC","US/Alaska":"America/Anchorage","US/Aleutian":"America/Adak","US/Arizona":"America/Phoenix","US/Central":"America/Chicago","US/East-Indiana":"America/Indiana/Indianapolis","US/Eastern":"America/New_York","US/Hawaii":"Pacific/Honolulu","US/Indiana-Starke":"America/Indiana/Knox","US/Michigan":"America/Detroit","US/Mountain":"America/Denver","US/Pacific":"America/Los_Angeles","US/Samoa":"Pacific/Pago_Pago",UTC:"Etc/UTC",Universal:"Etc/UTC","W-SU":"Europe/Moscow",Zulu:"Etc/UTC"}}));t(ie);var oe=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.unpack=t.pack=void 0,t.pack=function(e){var t=Object.keys(e.zones);return t.sort(),{zones:t.map((function(t){return(0,r.__spreadArray)([t],e.zones[t].map((function(e){var t=e[0],a=e.slice(1);return(0,r.__spreadArray)([""===t?"":t.toString(36)],a,!0).join(",")})),!0).join("|")})),abbrvs:e.abbrvs.join("|"),offsets:e.offsets.map((function(e){return e.toString(36)})).join("|")}},t.unpack=function(e){for(var t=e.abbrvs.split("|"),a=e.offsets.split("|").map((function(e){return parseInt(e,36)})),r={},n=0,i=e.zones;n<i.length;n++){var o=i[n].split("|"),u=o[0],l=o.slice(1);r[u]=l.map((function(e){return e.split(",")})).map((function(e){var r=e[0],n=e[1],i=e[2],o=e[3];return[""===r?-1/0:parseInt(r,36),t[+n],a[+i],"1"===o]}))}return r}}));t(oe),oe.unpack,oe.pack;var ue=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.shortMorePenalty=t.shortLessPenalty=t.longMorePenalty=t.longLessPenalty=t.differentNumericTypePenalty=t.additionPenalty=t.removalPenalty=t.DATE_TIME_PROPS=void 0,t.DATE_TIME_PROPS=["weekday","era","year","month","day","hour","minute","second","timeZoneName"],t.removalPenalty=120,t.additionPenalty=20,t.differentNumericTypePenalty=15,t.longLessPenalty=8,t.longMorePenalty=6,t.shortLessPenalty=6,t.shortMorePenalty=3}));t(ue),ue.shortMorePenalty,ue.shortLessPenalty,ue.longMorePenalty,ue.longLessPenalty,ue.differentNumericTypePenalty,ue.additionPenalty,ue.removalPenalty,ue.DATE_TIME_PROPS;var le=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.ToLocalTime=void 0,t.ToLocalTime=function(e,t,a,r){var n=r.tzData;(0,re.invariant)("Number"===(0,re.Type)(e),"invalid time"),(0,re.invariant)("gregory"===t,"We only support Gregory calendar right now");var i=function(e,t,a){var r,n=a[t];if(!n)return[0,!1];for(var i=0,o=0,u=!1;i<=n.length;i++)if(i===n.length||1e3*n[i][0]>e){o=(r=n[i-1])[2],u=r[3];break}return[1e3*o,u]}(e,a,n),o=i[0],u=i[1],l=e+o,s=(0,re.YearFromTime)(l);return{weekday:(0,re.WeekDay)(l),era:s<0?"BC":"AD",year:s,relatedYear:void 0,yearName:void 0,month:(0,re.MonthFromTime)(l),day:(0,re.DateFromTime)(l),hour:(0,re.HourFromTime)(l),minute:(0,re.MinFromTime)(l),second:(0,re.SecFromTime)(l),millisecond:(0,re.msFromTime)(l),inDST:u,timeZoneOffset:o}}}));t(le),le.ToLocalTime;var se=e((function(e,t){function a(e){return e<10?"0".concat(e):String(e)}function r(e,t,r,n){var i=Math.floor(r/6e4),o=Math.abs(i)%60,u=Math.floor(Math.abs(i)/60),l=t.split(";"),s=l[0],c=l[1],m="",f=r<0?c:s;return"long"===n?m=f.replace("HH",a(u)).replace("H",String(u)).replace("mm",a(o)).replace("m",String(o)):(o||u)&&(o||(f=f.replace(/:?m+/,"")),m=f.replace(/H+/,String(u)).replace(/m+/,String(o))),e.replace("{0}",m)}Object.defineProperty(t,"__esModule",{value:!0}),t.FormatDateTimePattern=void 0,t.FormatDateTimePattern=function(e,t,a,n){var i=n.getInternalSlots,o=n.localeData,u=n.getDefaultTimeZone,l=n.tzData;a=(0,re.TimeClip)(a);var s=i(e),c=o[s.dataLocale],m=s.locale,f=Object.create(null);f.useGrouping=!1;var d=new Intl.NumberFormat(m,f),p=Object.create(null);p.minimumIntegerDigits=2,p.useGrouping=!1;var g,D=new Intl.NumberFormat(m,p),v=s.fractionalSecondDigits;if(void 0!==v){var h=Object.create(null);h.minimumIntegerDigits=v,h.useGrouping=!1,g=new Intl.NumberFormat(m,h)}for(var y=(0,le.ToLocalTime)(a,s.calendar,s.timeZone,{tzData:l}),F=[],T=0,b=t;T<b.length;T++){var A=b[T],S=A.type;if("literal"===S)F.push({type:"literal",value:A.value});else if("fractionalSecondDigits"===S){var P=Math.floor(y.millisecond*Math.pow(10,(v||0)-3));F.push({type:"fractionalSecond",value:g.format(P)})}else if("dayPeriod"===S);else if(ue.DATE_TIME_PROPS.indexOf(S)>-1){var E="",C=s[S];P=y[S];"year"===S&&P<=0&&(P=1-P),"month"===S&&P++;var w=s.hourCycle;if("hour"!==S||"h11"!==w&&"h12"!==w||0===(P%=12)&&"h12"===w&&(P=12),"hour"===S&&"h24"===w&&0===P&&(P=24),"numeric"===C)E=d.format(P);else if("2-digit"===C)(E=D.format(P)).length>2&&(E=E.slice(E.length-2,E.length));else if("narrow"===C||"short"===C||"long"===C)if("era"===S)E=c[S][C][P];else if("timeZoneName"===S){var M=c.timeZoneName,k=c.gmtFormat,O=c.hourFormat,L=M[s.timeZone||u()];E=L&&L[C]?L[C][+y.inDST]:r(k,O,y.timeZoneOffset,C)}else E="month"===S?c.month[C][P-1]:c[S][C][P];F.push({type:S,value:E})}else if("ampm"===S){E=void 0;E=(P=y.hour)>11?c.pm:c.am,F.push({type:"dayPeriod",value:E})}else if("relatedYear"===S){P=y.relatedYear,E=d.format(P);F.push({type:"relatedYear",value:E})}else if("yearName"===S){P=y.yearName,E=d.format(P);F.push({type:"yearName",value:E})}}return F}}));t(se),se.FormatDateTimePattern;var ce=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.PartitionDateTimePattern=void 0,t.PartitionDateTimePattern=function(e,t,a){if(t=(0,re.TimeClip)(t),isNaN(t))throw new RangeError("invalid time");var r=(0,a.getInternalSlots)(e).pattern;return(0,se.FormatDateTimePattern)(e,(0,re.PartitionPattern)(r),t,a)}}));t(ce),ce.PartitionDateTimePattern;var me=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.FormatDateTime=void 0,t.FormatDateTime=function(e,t,a){for(var r="",n=0,i=(0,ce.PartitionDateTimePattern)(e,t,a);n<i.length;n++){r+=i[n].value}return r}}));t(me),me.FormatDateTime;var fe=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.BasicFormatMatcher=void 0,t.BasicFormatMatcher=function(e,t){var a=-1/0,n=t[0];(0,re.invariant)(Array.isArray(t),"formats should be a list of things");for(var i=0,o=t;i<o.length;i++){for(var u=o[i],l=0,s=0,c=ue.DATE_TIME_PROPS;s<c.length;s++){var m=c[s],f=e[m],d=u[m];if(void 0===f&&void 0!==d)l-=ue.additionPenalty;else if(void 0!==f&&void 0===d)l-=ue.removalPenalty;else if(f!==d){var p=void 0,g=(p="fractionalSecondDigits"===m?[1,2,3]:["2-digit","numeric","narrow","short","long"]).indexOf(f),D=p.indexOf(d),v=Math.max(-2,Math.min(D-g,2));2===v?l-=ue.longMorePenalty:1===v?l-=ue.shortMorePenalty:-1===v?l-=ue.shortLessPenalty:-2===v&&(l-=ue.longLessPenalty)}}l>a&&(a=l,n=u)}return(0,r.__assign)({},n)}}));t(fe),fe.BasicFormatMatcher;var de=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.splitRangePattern=t.splitFallbackRangePattern=t.parseDateTimeSkeleton=t.processDateTimePattern=void 0;var a=/(?:[Eec]{1,6}|G{1,5}|[Qq]{1,5}|(?:[yYur]+|U{1,5})|[ML]{1,5}|d{1,2}|D{1,3}|F{1}|[abB]{1,5}|[hkHK]{1,2}|w{1,2}|W{1}|m{1,2}|s{1,2}|[zZOvVxX]{1,4})(?=([^']*'[^']*')*[^']*$)/g,n=/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g;function i(e,t){var a=e.length;switch(e[0]){case"G":return t.era=4===a?"long":5===a?"narrow":"short","{era}";case"y":case"Y":case"u":case"U":case"r":return t.year=2===a?"2-digit":"numeric","{year}";case"q":case"Q":throw new RangeError("`w/Q` (quarter) patterns are not supported");case"M":case"L":return t.month=["numeric","2-digit","short","long","narrow"][a-1],"{month}";case"w":case"W":throw new RangeError("`w/W` (week of year) patterns are not supported");case"d":return t.day=["numeric","2-digit"][a-1],"{day}";case"D":case"F":case"g":return t.day="numeric","{day}";case"E":return t.weekday=4===a?"long":5===a?"narrow":"short","{weekday}";case"e":case"c":return t.weekday=[void 0,void 0,"short","long","narrow","short"][a-1],"{weekday}";case"a":case"b":case"B":return t.hour12=!0,"{ampm}";case"h":case"K":return t.hour=["numeric","2-digit"][a-1],t.hour12=!0,"{hour}";case"H":case"k":return t.hour=["numeric","2-digit"][a-1],"{hour}";case"j":case"J":case"C":throw new RangeError("`j/J/C` (hour) patterns are not supported, use `h/H/K/k` instead");case"m":return t.minute=["numeric","2-digit"][a-1],"{minute}";case"s":return t.second=["numeric","2-digit"][a-1],"{second}";case"S":case"A":return t.second="numeric","{second}";case"z":case"Z":case"O":case"v":case"V":case"X":case"x":return t.timeZoneName=a<4?"short":"long","{timeZoneName}"}return""}function o(e){switch(e){case"G":return"era";case"y":case"Y":case"u":case"U":case"r":return"year";case"M":case"L":return"month";case"d":case"D":case"F":case"g":return"day";case"a":case"b":case"B":return"ampm";case"h":case"H":case"K":case"k":return"hour";case"m":return"minute";case"s":case"S":case"A":return"second";default:throw new RangeError("Invalid range pattern token")}}function u(e,t){var r=[],o=e.replace(/'{2}/g,"{apostrophe}").replace(/'(.*?)'/g,(function(e,t){return r.push(t),"$$".concat(r.length-1,"$$")})).replace(a,(function(e){return i(e,t||{})}));return r.length&&(o=o.replace(/\$\$(\d+)\$\$/g,(function(e,t){return r[+t]})).replace(/\{apostrophe\}/g,"'")),[o.replace(/([\s\uFEFF\xA0])\{ampm\}([\s\uFEFF\xA0])/,"$1").replace("{ampm}","").replace(n,""),o]}function l(e){return e.split(/(\{[0|1]\})/g).filter(Boolean).map((function(e){switch(e){case"{0}":return{source:re.RangePatternType.startRange,pattern:e};case"{1}":return{source:re.RangePatternType.endRange,pattern:e};default:return{source:re.RangePatternType.shared,pattern:e}}}))}function s(e){for(var t,a=/\{(.*?)\}/g,r={},n=0;t=a.exec(e);){if(t[0]in r){n=t.index;break}r[t[0]]=t.index}return n?[{source:re.RangePatternType.startRange,pattern:e.slice(0,n)},{source:re.RangePatternType.endRange,pattern:e.slice(n)}]:[{source:re.RangePatternType.startRange,pattern:e}]}t.processDateTimePattern=u,t.parseDateTimeSkeleton=function(e,t,n,c){void 0===t&&(t=e);var m={pattern:"",pattern12:"",skeleton:e,rawPattern:t,rangePatterns:{},rangePatterns12:{}};if(n)for(var f in n){var d=o(f),p={patternParts:[]},g=u(n[f],p),D=g[0],v=g[1];m.rangePatterns[d]=(0,r.__assign)((0,r.__assign)({},p),{patternParts:s(D)}),m.rangePatterns12[d]=(0,r.__assign)((0,r.__assign)({},p),{patternParts:s(v)})}if(c){var h=l(c);m.rangePatterns.default={patternParts:h},m.rangePatterns12.default={patternParts:h}}e.replace(a,(function(e){return i(e,m)}));var y=u(t),F=y[0],T=y[1];return m.pattern=F,m.pattern12=T,m},t.splitFallbackRangePattern=l,t.splitRangePattern=s}));t(de),de.splitRangePattern,de.splitFallbackRangePattern,de.parseDateTimeSkeleton,de.processDateTimePattern;var pe=e((function(e,t){function a(e){return"numeric"===e||"2-digit"===e}function n(e,t){var r=0;e.hour12&&!t.hour12?r-=ue.removalPenalty:!e.hour12&&t.hour12&&(r-=ue.additionPenalty);for(var n=0,i=ue.DATE_TIME_PROPS;n<i.length;n++){var o=i[n],u=e[o],l=t[o];if(void 0===u&&void 0!==l)r-=ue.additionPenalty;else if(void 0!==u&&void 0===l)r-=ue.removalPenalty;else if(u!==l)if(a(u)!==a(l))r-=ue.differentNumericTypePenalty;else{var s=["2-digit","numeric","narrow","short","long"],c=s.indexOf(u),m=s.indexOf(l),f=Math.max(-2,Math.min(m-c,2));2===f?r-=ue.longMorePenalty:1===f?r-=ue.shortMorePenalty:-1===f?r-=ue.shortLessPenalty:-2===f&&(r-=ue.longLessPenalty)}}return r}Object.defineProperty(t,"__esModule",{value:!0}),t.BestFitFormatMatcher=t.bestFitFormatMatcherScore=void 0,t.bestFitFormatMatcherScore=n,t.BestFitFormatMatcher=function(e,t){var i=-1/0,o=t[0];(0,re.invariant)(Array.isArray(t),"formats should be a list of things");for(var u=0,l=t;u<l.length;u++){var s=l[u],c=n(e,s);c>i&&(i=c,o=s)}var m=(0,r.__assign)({},o),f={rawPattern:o.rawPattern};for(var d in(0,de.processDateTimePattern)(o.rawPattern,f),m){var p=m[d],g=f[d],D=e[d];"minute"!==d&&"second"!==d&&(D&&(a(g)&&!a(D)||p!==D&&(f[d]=D)))}return f.pattern=m.pattern,f.pattern12=m.pattern12,f.skeleton=m.skeleton,f.rangePatterns=m.rangePatterns,f.rangePatterns12=m.rangePatterns12,f}}));t(pe),pe.BestFitFormatMatcher,pe.bestFitFormatMatcherScore;var ge=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.DateTimeStyleFormat=void 0,t.DateTimeStyleFormat=function(e,t,a){var r,n;if(void 0!==t&&((0,re.invariant)("full"===t||"long"===t||"medium"===t||"short"===t,"invalid timeStyle"),n=a.timeFormat[t]),void 0!==e&&((0,re.invariant)("full"===e||"long"===e||"medium"===e||"short"===e,"invalid dateStyle"),r=a.dateFormat[e]),void 0!==e&&void 0!==t){var i={};for(var o in r)"pattern"!==o&&(i[o]=r[o]);for(var o in n)"pattern"!==o&&"pattern12"!==o&&(i[o]=n[o]);var u=a.dateTimeFormat[e],l=u.replace("{0}",n.pattern).replace("{1}",r.pattern);if(i.pattern=l,"pattern12"in n){var s=u.replace("{0}",n.pattern12).replace("{1}",r.pattern);i.pattern12=s}return i}return void 0!==t?n:((0,re.invariant)(void 0!==e,"dateStyle should not be undefined"),r)}}));t(ge),ge.DateTimeStyleFormat;var De=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.ToDateTimeOptions=void 0,t.ToDateTimeOptions=function(e,t,a){e=void 0===e?null:(0,re.ToObject)(e),e=Object.create(e);var r=!0;if("date"===t||"any"===t)for(var n=0,i=["weekday","year","month","day"];n<i.length;n++){void 0!==e[i[n]]&&(r=!1)}if("time"===t||"any"===t)for(var o=0,u=["dayPeriod","hour","minute","second","fractionalSecondDigits"];o<u.length;o++){void 0!==e[u[o]]&&(r=!1)}if(void 0===e.dateStyle&&void 0===e.timeStyle||(r=!1),"date"===t&&e.timeStyle)throw new TypeError("Intl.DateTimeFormat date was required but timeStyle was included");if("time"===t&&e.dateStyle)throw new TypeError("Intl.DateTimeFormat time was required but dateStyle was included");if(r&&("date"===a||"all"===a))for(var l=0,s=["year","month","day"];l<s.length;l++){e[s[l]]="numeric"}if(r&&("time"===a||"all"===a))for(var c=0,m=["hour","minute","second"];c<m.length;c++){e[m[c]]="numeric"}return e}}));t(De),De.ToDateTimeOptions;var ve=e((function(e,t){function a(e,t,a){return null==e&&(e=t),void 0!==a&&(a?e="h11"===t||"h23"===t?"h11":"h12":((0,re.invariant)(!a,"hour12 must not be set"),e="h11"===t||"h23"===t?"h23":"h24")),e}Object.defineProperty(t,"__esModule",{value:!0}),t.InitializeDateTimeFormat=void 0;var r=/^[a-z0-9]{3,8}$/i;t.InitializeDateTimeFormat=function(e,t,n,i){var u=i.getInternalSlots,l=i.availableLocales,s=i.localeData,c=i.getDefaultLocale,m=i.getDefaultTimeZone,f=i.relevantExtensionKeys,d=i.tzData,p=i.uppercaseLinks,g=(0,re.CanonicalizeLocaleList)(t),D=(0,De.ToDateTimeOptions)(n,"any","date"),v=Object.create(null),h=(0,re.GetOption)(D,"localeMatcher","string",["lookup","best fit"],"best fit");v.localeMatcher=h;var y=(0,re.GetOption)(D,"calendar","string",void 0,void 0);if(void 0!==y&&!r.test(y))throw new RangeError("Malformed calendar");var F=u(e);v.ca=y;var T=(0,re.GetOption)(D,"numberingSystem","string",void 0,void 0);if(void 0!==T&&!r.test(T))throw new RangeError("Malformed numbering system");v.nu=T;var b=(0,re.GetOption)(D,"hour12","boolean",void 0,void 0),A=(0,re.GetOption)(D,"hourCycle","string",["h11","h12","h23","h24"],void 0);void 0!==b&&(A=null),v.hc=A;var S=(0,o.ResolveLocale)(l,g,v,f,s,c);F.locale=S.locale,y=S.ca,F.calendar=y,F.hourCycle=S.hc,F.numberingSystem=S.nu;var P=S.dataLocale;F.dataLocale=P;var E=D.timeZone;if(void 0!==E){if(E=String(E),!(0,re.IsValidTimeZoneName)(E,{tzData:d,uppercaseLinks:p}))throw new RangeError("Invalid timeZoneName");E=(0,re.CanonicalizeTimeZoneName)(E,{tzData:d,uppercaseLinks:p})}else E=m();F.timeZone=E,(v=Object.create(null)).weekday=(0,re.GetOption)(D,"weekday","string",["narrow","short","long"],void 0),v.era=(0,re.GetOption)(D,"era","string",["narrow","short","long"],void 0),v.year=(0,re.GetOption)(D,"year","string",["2-digit","numeric"],void 0),v.month=(0,re.GetOption)(D,"month","string",["2-digit","numeric","narrow","short","long"],void 0),v.day=(0,re.GetOption)(D,"day","string",["2-digit","numeric"],void 0),v.hour=(0,re.GetOption)(D,"hour","string",["2-digit","numeric"],void 0),v.minute=(0,re.GetOption)(D,"minute","string",["2-digit","numeric"],void 0),v.second=(0,re.GetOption)(D,"second","string",["2-digit","numeric"],void 0),v.timeZoneName=(0,re.GetOption)(D,"timeZoneName","string",["short","long"],void 0),v.fractionalSecondDigits=(0,re.GetNumberOption)(D,"fractionalSecondDigits",1,3,void 0);var C=s[P];(0,re.invariant)(!!C,"Missing locale data for ".concat(P));var w=C.formats[y];if(!w)throw new RangeError('Calendar "'.concat(y,'" is not supported. Try setting "calendar" to 1 of the following: ').concat(Object.keys(C.formats).join(", ")));var M=(0,re.GetOption)(D,"formatMatcher","string",["basic","best fit"],"best fit"),k=(0,re.GetOption)(D,"dateStyle","string",["full","long","medium","short"],void 0);F.dateStyle=k;var O,L,_,I=(0,re.GetOption)(D,"timeStyle","string",["full","long","medium","short"],void 0);if(F.timeStyle=I,void 0===k&&void 0===I)if("basic"===M)O=(0,fe.BasicFormatMatcher)(v,w);else{if(function(e){for(var t=0,a=["hour","minute","second"];t<a.length;t++)if(void 0!==e[a[t]])return!0;return!1}(v)){var N=a(F.hourCycle,C.hourCycle,b);v.hour12="h11"===N||"h12"===N}O=(0,pe.BestFitFormatMatcher)(v,w)}else{for(var j=0,B=ue.DATE_TIME_PROPS;j<B.length;j++){if(void 0!==(G=v[R=B[j]]))throw new TypeError("Intl.DateTimeFormat can't set option ".concat(R," when ").concat(k?"dateStyle":"timeStyle"," is used"))}O=(0,ge.DateTimeStyleFormat)(k,I,C)}for(var R in F.format=O,v){var G;void 0!==(G=O[R])&&(F[R]=G)}if(void 0!==F.hour){N=a(F.hourCycle,C.hourCycle,b);F.hourCycle=N,"h11"===N||"h12"===N?(L=O.pattern12,_=O.rangePatterns12):(L=O.pattern,_=O.rangePatterns)}else F.hourCycle=void 0,L=O.pattern,_=O.rangePatterns;return F.pattern=L,F.rangePatterns=_,e}}));t(ve),ve.InitializeDateTimeFormat;var he=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.FormatDateTimeToParts=void 0,t.FormatDateTimeToParts=function(e,t,a){for(var r=(0,ce.PartitionDateTimePattern)(e,t,a),n=(0,re.ArrayCreate)(0),i=0,o=r;i<o.length;i++){var u=o[i];n.push({type:u.type,value:u.value})}return n}}));t(he),he.FormatDateTimeToParts;var ye=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.PartitionDateTimeRangePattern=void 0;var a=["era","year","month","day","dayPeriod","ampm","hour","minute","second","fractionalSecondDigits"];t.PartitionDateTimeRangePattern=function(e,t,r,n){if(t=(0,re.TimeClip)(t),isNaN(t))throw new RangeError("Invalid start time");if(r=(0,re.TimeClip)(r),isNaN(r))throw new RangeError("Invalid end time");for(var i,o=n.getInternalSlots,u=n.tzData,l=o(e),s=(0,le.ToLocalTime)(t,l.calendar,l.timeZone,{tzData:u}),c=(0,le.ToLocalTime)(r,l.calendar,l.timeZone,{tzData:u}),m=l.pattern,f=l.rangePatterns,d=!0,p=!1,g=0,D=a;g<D.length;g++){var v=D[g];if(d&&!p){var h=v in f?f[v]:void 0;if(void 0!==i&&void 0===h)p=!0;else if(i=h,"ampm"===v){var y=s.hour,F=c.hour;(y>11&&F<11||y<11&&F>11)&&(d=!1)}else if("dayPeriod"===v);else if("fractionalSecondDigits"===v){var T=l.fractionalSecondDigits;void 0===T&&(T=3);y=Math.floor(s.millisecond*Math.pow(10,T-3)),F=Math.floor(c.millisecond*Math.pow(10,T-3));(0,re.SameValue)(y,F)||(d=!1)}else{y=s[v],F=c[v];(0,re.SameValue)(y,F)||(d=!1)}}}if(d){for(var b=(0,se.FormatDateTimePattern)(e,(0,re.PartitionPattern)(m),t,n),A=0,S=b;A<S.length;A++){S[A].source=re.RangePatternType.shared}return b}var P=[];if(void 0===i)for(var E=0,C=(i=f.default).patternParts;E<C.length;E++){var w=C[E];"{0}"!==w.pattern&&"{1}"!==w.pattern||(w.pattern=m)}for(var M=0,k=i.patternParts;M<k.length;M++){var O=k[M],L=O.source,_=O.pattern,I=void 0;I=L===re.RangePatternType.startRange||L===re.RangePatternType.shared?t:r;for(var N=(0,re.PartitionPattern)(_),j=(0,se.FormatDateTimePattern)(e,N,I,n),B=0,R=j;B<R.length;B++){R[B].source=L}P=P.concat(j)}return P}}));t(ye),ye.PartitionDateTimeRangePattern;var Fe=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.FormatDateTimeRangeToParts=void 0,t.FormatDateTimeRangeToParts=function(e,t,a,r){for(var n=(0,ye.PartitionDateTimeRangePattern)(e,t,a,r),i=new Array(0),o=0,u=n;o<u.length;o++){var l=u[o];i.push({type:l.type,value:l.value,source:l.source})}return i}}));t(Fe),Fe.FormatDateTimeRangeToParts;var Te=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.FormatDateTimeRange=void 0,t.FormatDateTimeRange=function(e,t,a,r){for(var n="",i=0,o=(0,ye.PartitionDateTimeRangePattern)(e,t,a,r);i<o.length;i++){n+=o[i].value}return n}}));t(Te),Te.FormatDateTimeRange;var be=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.DateTimeFormat=void 0;var a=(0,r.__importDefault)(ne),n=(0,r.__importDefault)(ie),i=Object.keys(n.default).reduce((function(e,t){return e[t.toUpperCase()]=n.default[t],e}),{}),o=["locale","calendar","numberingSystem","dateStyle","timeStyle","timeZone","hourCycle","weekday","era","year","month","day","hour","minute","second","timeZoneName"],u={enumerable:!1,configurable:!0,get:function(){if("object"!=typeof this||!(0,re.OrdinaryHasInstance)(t.DateTimeFormat,this))throw TypeError("Intl.DateTimeFormat format property accessor called on incompatible receiver");var e=(0,a.default)(this),r=this,n=e.boundFormat;if(void 0===n){n=function(e){var n;return n=void 0===e?Date.now():Number(e),(0,me.FormatDateTime)(r,n,{getInternalSlots:a.default,localeData:t.DateTimeFormat.localeData,tzData:t.DateTimeFormat.tzData,getDefaultTimeZone:t.DateTimeFormat.getDefaultTimeZone})};try{Object.defineProperty(n,"name",{configurable:!0,enumerable:!1,writable:!1,value:""})}catch(e){}e.boundFormat=n}return n}};try{Object.defineProperty(u.get,"name",{configurable:!0,enumerable:!1,writable:!1,value:"get format"})}catch(e){}t.DateTimeFormat=function(e,r){if(!this||!(0,re.OrdinaryHasInstance)(t.DateTimeFormat,this))return new t.DateTimeFormat(e,r);(0,ve.InitializeDateTimeFormat)(this,e,r,{tzData:t.DateTimeFormat.tzData,uppercaseLinks:i,availableLocales:t.DateTimeFormat.availableLocales,relevantExtensionKeys:t.DateTimeFormat.relevantExtensionKeys,getDefaultLocale:t.DateTimeFormat.getDefaultLocale,getDefaultTimeZone:t.DateTimeFormat.getDefaultTimeZone,getInternalSlots:a.default,localeData:t.DateTimeFormat.localeData});var n=(0,a.default)(this).dataLocale,o=t.DateTimeFormat.localeData[n];(0,re.invariant)(void 0!==o,"Cannot load locale-dependent data for ".concat(n,"."))},(0,re.defineProperty)(t.DateTimeFormat,"supportedLocalesOf",{value:function(e,a){return(0,re.SupportedLocales)(t.DateTimeFormat.availableLocales,(0,re.CanonicalizeLocaleList)(e),a)}}),(0,re.defineProperty)(t.DateTimeFormat.prototype,"resolvedOptions",{value:function(){if("object"!=typeof this||!(0,re.OrdinaryHasInstance)(t.DateTimeFormat,this))throw TypeError("Method Intl.DateTimeFormat.prototype.resolvedOptions called on incompatible receiver");for(var e=(0,a.default)(this),r={},n=0,i=o;n<i.length;n++){var u=i[n],l=e[u];if("hourCycle"===u){var s="h11"===l||"h12"===l||"h23"!==l&&"h24"!==l&&void 0;void 0!==s&&(r.hour12=s)}ue.DATE_TIME_PROPS.indexOf(u)>-1&&(void 0===e.dateStyle&&void 0===e.timeStyle||(l=void 0)),void 0!==l&&(r[u]=l)}return r}}),(0,re.defineProperty)(t.DateTimeFormat.prototype,"formatToParts",{value:function(e){return e=void 0===e?Date.now():(0,re.ToNumber)(e),(0,he.FormatDateTimeToParts)(this,e,{getInternalSlots:a.default,localeData:t.DateTimeFormat.localeData,tzData:t.DateTimeFormat.tzData,getDefaultTimeZone:t.DateTimeFormat.getDefaultTimeZone})}}),(0,re.defineProperty)(t.DateTimeFormat.prototype,"formatRangeToParts",{value:function(e,r){if("object"!=typeof this)throw new TypeError;if(void 0===e||void 0===r)throw new TypeError("startDate/endDate cannot be undefined");var n=(0,re.ToNumber)(e),i=(0,re.ToNumber)(r);return(0,Fe.FormatDateTimeRangeToParts)(this,n,i,{getInternalSlots:a.default,localeData:t.DateTimeFormat.localeData,tzData:t.DateTimeFormat.tzData,getDefaultTimeZone:t.DateTimeFormat.getDefaultTimeZone})}}),(0,re.defineProperty)(t.DateTimeFormat.prototype,"formatRange",{value:function(e,r){if("object"!=typeof this)throw new TypeError;if(void 0===e||void 0===r)throw new TypeError("startDate/endDate cannot be undefined");var n=(0,re.ToNumber)(e),i=(0,re.ToNumber)(r);return(0,Te.FormatDateTimeRange)(this,n,i,{getInternalSlots:a.default,localeData:t.DateTimeFormat.localeData,tzData:t.DateTimeFormat.tzData,getDefaultTimeZone:t.DateTimeFormat.getDefaultTimeZone})}});t.DateTimeFormat.__setDefaultTimeZone=function(e){if(void 0!==e){if(e=String(e),!(0,re.IsValidTimeZoneName)(e,{tzData:t.DateTimeFormat.tzData,uppercaseLinks:i}))throw new RangeError("Invalid timeZoneName");e=(0,re.CanonicalizeTimeZoneName)(e,{tzData:t.DateTimeFormat.tzData,uppercaseLinks:i})}else e="UTC";t.DateTimeFormat.__defaultTimeZone=e},t.DateTimeFormat.relevantExtensionKeys=["nu","ca","hc"],t.DateTimeFormat.__defaultTimeZone="UTC",t.DateTimeFormat.getDefaultTimeZone=function(){return t.DateTimeFormat.__defaultTimeZone},t.DateTimeFormat.__addLocaleData=function(){for(var e=[],a=0;a<arguments.length;a++)e[a]=arguments[a];for(var n=function(e,a){var n=e.dateFormat,i=e.timeFormat,o=e.dateTimeFormat,u=e.formats,l=e.intervalFormats,s=(0,r.__rest)(e,["dateFormat","timeFormat","dateTimeFormat","formats","intervalFormats"]),c=(0,r.__assign)((0,r.__assign)({},s),{dateFormat:{full:(0,de.parseDateTimeSkeleton)(n.full),long:(0,de.parseDateTimeSkeleton)(n.long),medium:(0,de.parseDateTimeSkeleton)(n.medium),short:(0,de.parseDateTimeSkeleton)(n.short)},timeFormat:{full:(0,de.parseDateTimeSkeleton)(i.full),long:(0,de.parseDateTimeSkeleton)(i.long),medium:(0,de.parseDateTimeSkeleton)(i.medium),short:(0,de.parseDateTimeSkeleton)(i.short)},dateTimeFormat:{full:(0,de.parseDateTimeSkeleton)(o.full).pattern,long:(0,de.parseDateTimeSkeleton)(o.long).pattern,medium:(0,de.parseDateTimeSkeleton)(o.medium).pattern,short:(0,de.parseDateTimeSkeleton)(o.short).pattern},formats:{}}),m=function(e){c.formats[e]=Object.keys(u[e]).map((function(t){return(0,de.parseDateTimeSkeleton)(t,u[e][t],l[t],l.intervalFormatFallback)}))};for(var f in u)m(f);var d=new Intl.Locale(a).minimize().toString();t.DateTimeFormat.localeData[a]=t.DateTimeFormat.localeData[d]=c,t.DateTimeFormat.availableLocales.add(a),t.DateTimeFormat.availableLocales.add(d),t.DateTimeFormat.__defaultLocale||(t.DateTimeFormat.__defaultLocale=d)},i=0,o=e;i<o.length;i++){var u=o[i],l=u.data,s=u.locale;n(l,s)}},Object.defineProperty(t.DateTimeFormat.prototype,"format",u),t.DateTimeFormat.__defaultLocale="",t.DateTimeFormat.localeData={},t.DateTimeFormat.availableLocales=new Set,t.DateTimeFormat.getDefaultLocale=function(){return t.DateTimeFormat.__defaultLocale},t.DateTimeFormat.polyfilled=!0,t.DateTimeFormat.tzData={},t.DateTimeFormat.__addTZData=function(e){t.DateTimeFormat.tzData=(0,oe.unpack)(e)};try{"undefined"!=typeof Symbol&&Object.defineProperty(t.DateTimeFormat.prototype,Symbol.toStringTag,{value:"Intl.DateTimeFormat",writable:!1,enumerable:!1,configurable:!0}),Object.defineProperty(t.DateTimeFormat.prototype.constructor,"length",{value:1,writable:!1,enumerable:!1,configurable:!0})}catch(e){}}));t(be),be.DateTimeFormat;var Ae=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),(0,r.__exportStar)(be,t)}));t(Ae);var Se=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.supportedLocales=void 0,t.supportedLocales=["af-NA","af","agq","ak","am","ar-AE","ar-BH","ar-DJ","ar-DZ","ar-EG","ar-EH","ar-ER","ar-IL","ar-IQ","ar-JO","ar-KM","ar-KW","ar-LB","ar-LY","ar-MA","ar-MR","ar-OM","ar-PS","ar-QA","ar-SA","ar-SD","ar-SO","ar-SS","ar-SY","ar-TD","ar-TN","ar-YE","ar","as","asa","ast","az-Cyrl","az-Latn","az","bas","be-tarask","be","bem","bez","bg","bm","bn-IN","bn","bo-IN","bo","br","brx","bs-Cyrl","bs-Latn","bs","ca-AD","ca-ES-valencia","ca-FR","ca-IT","ca","ccp-IN","ccp","ce","ceb","cgg","chr","ckb-IR","ckb","cs","cy","da-GL","da","dav","de-AT","de-BE","de-CH","de-IT","de-LI","de-LU","de","dje","doi","dsb","dua","dyo","dz","ebu","ee-TG","ee","el-CY","el","en-001","en-150","en-AE","en-AG","en-AI","en-AS","en-AT","en-AU","en-BB","en-BE","en-BI","en-BM","en-BS","en-BW","en-BZ","en-CA","en-CC","en-CH","en-CK","en-CM","en-CX","en-CY","en-DE","en-DG","en-DK","en-DM","en-ER","en-FI","en-FJ","en-FK","en-FM","en-GB","en-GD","en-GG","en-GH","en-GI","en-GM","en-GU","en-GY","en-HK","en-IE","en-IL","en-IM","en-IN","en-IO","en-JE","en-JM","en-KE","en-KI","en-KN","en-KY","en-LC","en-LR","en-LS","en-MG","en-MH","en-MO","en-MP","en-MS","en-MT","en-MU","en-MW","en-MY","en-NA","en-NF","en-NG","en-NL","en-NR","en-NU","en-NZ","en-PG","en-PH","en-PK","en-PN","en-PR","en-PW","en-RW","en-SB","en-SC","en-SD","en-SE","en-SG","en-SH","en-SI","en-SL","en-SS","en-SX","en-SZ","en-TC","en-TK","en-TO","en-TT","en-TV","en-TZ","en-UG","en-UM","en-VC","en-VG","en-VI","en-VU","en-WS","en-ZA","en-ZM","en-ZW","en","eo","es-419","es-AR","es-BO","es-BR","es-BZ","es-CL","es-CO","es-CR","es-CU","es-DO","es-EA","es-EC","es-GQ","es-GT","es-HN","es-IC","es-MX","es-NI","es-PA","es-PE","es-PH","es-PR","es-PY","es-SV","es-US","es-UY","es-VE","es","et","eu","ewo","fa-AF","fa","ff-Adlm-BF","ff-Adlm-CM","ff-Adlm-GH","ff-Adlm-GM","ff-Adlm-GW","ff-Adlm-LR","ff-Adlm-MR","ff-Adlm-NE","ff-Adlm-NG","ff-Adlm-SL","ff-Adlm-SN","ff-Adlm","ff-Latn-BF","ff-Latn-CM","ff-Latn-GH","ff-Latn-GM","ff-Latn-GN","ff-Latn-GW","ff-Latn-LR","ff-Latn-MR","ff-Latn-NE","ff-Latn-NG","ff-Latn-SL","ff-Latn","ff","fi","fil","fo-DK","fo","fr-BE","fr-BF","fr-BI","fr-BJ","fr-BL","fr-CA","fr-CD","fr-CF","fr-CG","fr-CH","fr-CI","fr-CM","fr-DJ","fr-DZ","fr-GA","fr-GF","fr-GN","fr-GP","fr-GQ","fr-HT","fr-KM","fr-LU","fr-MA","fr-MC","fr-MF","fr-MG","fr-ML","fr-MQ","fr-MR","fr-MU","fr-NC","fr-NE","fr-PF","fr-PM","fr-RE","fr-RW","fr-SC","fr-SN","fr-SY","fr-TD","fr-TG","fr-TN","fr-VU","fr-WF","fr-YT","fr","fur","fy","ga-GB","ga","gd","gl","gsw-FR","gsw-LI","gsw","gu","guz","gv","ha-GH","ha-NE","ha","haw","he","hi","hr-BA","hr","hsb","hu","hy","ia","id","ig","ii","is","it-CH","it-SM","it-VA","it","ja","jgo","jmc","jv","ka","kab","kam","kde","kea","kgp","khq","ki","kk","kkj","kl","kln","km","kn","ko-KP","ko","kok","ks-Arab","ks","ksb","ksf","ksh","ku","kw","ky","lag","lb","lg","lkt","ln-AO","ln-CF","ln-CG","ln","lo","lrc-IQ","lrc","lt","lu","luo","luy","lv","mai","mas-TZ","mas","mer","mfe","mg","mgh","mgo","mi","mk","ml","mn","mni-Beng","mni","mr","ms-BN","ms-ID","ms-SG","ms","mt","mua","my","mzn","naq","nb-SJ","nb","nd","nds-NL","nds","ne-IN","ne","nl-AW","nl-BE","nl-BQ","nl-CW","nl-SR","nl-SX","nl","nmg","nn","nnh","no","nus","nyn","om-KE","om","or","os-RU","os","pa-Arab","pa-Guru","pa","pcm","pl","ps-PK","ps","pt-AO","pt-CH","pt-CV","pt-GQ","pt-GW","pt-LU","pt-MO","pt-MZ","pt-PT","pt-ST","pt-TL","pt","qu-BO","qu-EC","qu","rm","rn","ro-MD","ro","rof","ru-BY","ru-KG","ru-KZ","ru-MD","ru-UA","ru","rw","rwk","sa","sah","saq","sat-Olck","sat","sbp","sc","sd-Arab","sd-Deva","sd","se-FI","se-SE","se","seh","ses","sg","shi-Latn","shi-Tfng","shi","si","sk","sl","smn","sn","so-DJ","so-ET","so-KE","so","sq-MK","sq-XK","sq","sr-Cyrl-BA","sr-Cyrl-ME","sr-Cyrl-XK","sr-Cyrl","sr-Latn-BA","sr-Latn-ME","sr-Latn-XK","sr-Latn","sr","su-Latn","su","sv-AX","sv-FI","sv","sw-CD","sw-KE","sw-UG","sw","ta-LK","ta-MY","ta-SG","ta","te","teo-KE","teo","tg","th","ti-ER","ti","tk","to","tr-CY","tr","tt","twq","tzm","ug","uk","und","ur-IN","ur","uz-Arab","uz-Cyrl","uz-Latn","uz","vai-Latn","vai-Vaii","vai","vi","vun","wae","wo","xh","xog","yav","yi","yo-BJ","yo","yrl-CO","yrl-VE","yrl","yue-Hans","yue-Hant","yue","zgh","zh-Hans-HK","zh-Hans-MO","zh-Hans-SG","zh-Hans","zh-Hant-HK","zh-Hant-MO","zh-Hant","zh","zu"]}));t(Se),Se.supportedLocales;var Pe=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.shouldPolyfill=void 0,t.shouldPolyfill=function(e){if(void 0===e&&(e="en"),!("DateTimeFormat"in Intl)||!("formatToParts"in Intl.DateTimeFormat.prototype)||!("formatRange"in Intl.DateTimeFormat.prototype)||function(){try{return"dayPeriod"!==new Intl.DateTimeFormat("en",{hourCycle:"h11",hour:"numeric"}).formatToParts(0)[2].type}catch(e){return!1}}()||function(){try{return!!new Intl.DateTimeFormat("en",{dateStyle:"short",hour:"numeric"}).format(new Date(0))}catch(e){return!1}}()||!function(){try{return!!new Intl.DateTimeFormat(void 0,{dateStyle:"short"}).resolvedOptions().dateStyle}catch(e){return!1}}()||!function(e){if(!e)return!0;var t=Array.isArray(e)?e:[e];return Intl.DateTimeFormat.supportedLocalesOf(t).length===t.length}(e))return e?(0,o.match)([e],Se.supportedLocales,"en"):void 0}}));t(Pe),Pe.shouldPolyfill;var Ee=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),t.toLocaleTimeString=t.toLocaleDateString=t.toLocaleString=void 0,t.toLocaleString=function(e,t,a){return new be.DateTimeFormat(t,a).format(e)},t.toLocaleDateString=function(e,t,a){return new be.DateTimeFormat(t,(0,De.ToDateTimeOptions)(a,"date","date")).format(e)},t.toLocaleTimeString=function(e,t,a){return new be.DateTimeFormat(t,(0,De.ToDateTimeOptions)(a,"time","time")).format(e)}}));t(Ee),Ee.toLocaleTimeString,Ee.toLocaleDateString;var Ce=e((function(e,t){Object.defineProperty(t,"__esModule",{value:!0}),(0,Pe.shouldPolyfill)()&&((0,re.defineProperty)(Intl,"DateTimeFormat",{value:Ae.DateTimeFormat}),(0,re.defineProperty)(Date.prototype,"toLocaleString",{value:function(e,t){return(0,Ee.toLocaleString)(this,e,t)}}),(0,re.defineProperty)(Date.prototype,"toLocaleDateString",{value:function(e,t){return(0,Ee.toLocaleDateString)(this,e,t)}}),(0,re.defineProperty)(Date.prototype,"toLocaleTimeString",{value:function(e,t){return(0,Ee.toLocaleTimeString)(this,e,t)}}))})),we=t(Ce);export{Ce as __moduleExports,we as default};
@@ -0,0 +1 @@
+var a=[];export{a as default};
@@ -0,0 +1 @@
+VERSION = "20220906112053"
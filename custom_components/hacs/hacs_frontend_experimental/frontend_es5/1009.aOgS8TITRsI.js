@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1009],{81009:function(e,t,i){i.r(t),i.d(t,{HaDialogDatePicker:function(){return b}});var a,o,n,d=i(88962),l=i(99312),r=i(81043),c=i(33368),s=i(71650),p=i(68308),u=i(82390),h=i(69205),v=i(91808),m=(i(97393),i(14271),i(7341),i(93432)),g=i(5095),f=i(95260),k=i(18394),y=i(2537),_=i(29950),b=(i(9828),(0,v.Z)([(0,f.Mo)("ha-dialog-date-picker")],(function(e,t){var i,v=function(t){function i(){var t;(0,s.Z)(this,i);for(var a=arguments.length,o=new Array(a),n=0;n<a;n++)o[n]=arguments[n];return t=(0,p.Z)(this,i,[].concat(o)),e((0,u.Z)(t)),t}return(0,h.Z)(i,t),(0,c.Z)(i)}(t);return{F:v,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,f.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_params",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_value",value:void 0},{kind:"method",key:"showDialog",value:(i=(0,r.Z)((0,l.Z)().mark((function e(t){return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,(0,y.y)();case 2:this._params=t,this._value=t.value;case 4:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"method",key:"closeDialog",value:function(){this._params=void 0,(0,k.B)(this,"dialog-closed",{dialog:this.localName})}},{kind:"method",key:"render",value:function(){return this._params?(0,g.dy)(a||(a=(0,d.Z)(['<ha-dialog open @closed="','"> <app-datepicker .value="','" .min="','" .max="','" .locale="','" @datepicker-value-updated="','" .firstDayOfWeek="','"></app-datepicker> ',' <mwc-button slot="secondaryAction" @click="','"> ',' </mwc-button> <mwc-button slot="primaryAction" dialogaction="cancel" class="cancel-btn"> ',' </mwc-button> <mwc-button slot="primaryAction" @click="','"> '," </mwc-button> </ha-dialog>"])),this.closeDialog,this._value,this._params.min,this._params.max,this._params.locale,this._valueChanged,this._params.firstWeekday,this._params.canClear?(0,g.dy)(o||(o=(0,d.Z)(['<mwc-button slot="secondaryAction" @click="','" class="warning"> '," </mwc-button>"])),this._clear,this.hass.localize("ui.dialogs.date-picker.clear")):g.Ld,this._setToday,this.hass.localize("ui.dialogs.date-picker.today"),this.hass.localize("ui.common.cancel"),this._setValue,this.hass.localize("ui.common.ok")):g.Ld}},{kind:"method",key:"_valueChanged",value:function(e){this._value=e.detail.value}},{kind:"method",key:"_clear",value:function(){var e;null===(e=this._params)||void 0===e||e.onChange(void 0),this.closeDialog()}},{kind:"method",key:"_setToday",value:function(){var e=new Date;this._value=(0,m.Z)(e,"yyyy-MM-dd")}},{kind:"method",key:"_setValue",value:function(){var e;this._value||this._setToday(),null===(e=this._params)||void 0===e||e.onChange(this._value),this.closeDialog()}},{kind:"field",static:!0,key:"styles",value:function(){return[_.yu,(0,g.iv)(n||(n=(0,d.Z)(["ha-dialog{--dialog-content-padding:0;--justify-action-buttons:space-between}app-datepicker{--app-datepicker-accent-color:var(--primary-color);--app-datepicker-bg-color:transparent;--app-datepicker-color:var(--primary-text-color);--app-datepicker-disabled-day-color:var(--disabled-text-color);--app-datepicker-focused-day-color:var(--text-primary-color);--app-datepicker-focused-year-bg-color:var(--primary-color);--app-datepicker-selector-color:var(--secondary-text-color);--app-datepicker-separator-color:var(--divider-color);--app-datepicker-weekday-color:var(--secondary-text-color)}app-datepicker::part(calendar-day):focus{outline:0}app-datepicker::part(body){direction:ltr}@media all and (min-width:450px){ha-dialog{--mdc-dialog-min-width:300px}}@media all and (max-width:450px),all and (max-height:500px){app-datepicker{width:100%}}"])))]}}]}}),g.oi))},9828:function(e,t,i){i.d(t,{i:function(){return b}});var a,o,n,d=i(33368),l=i(71650),r=i(68308),c=i(82390),s=i(69205),p=i(91808),u=i(34541),h=i(47838),v=i(88962),m=(i(97393),i(91989),i(87762)),g=i(91632),f=i(5095),k=i(95260),y=i(60625),_=(i(54371),["button","ha-list-item"]),b=function(e,t){var i;return(0,f.dy)(a||(a=(0,v.Z)([' <div class="header_title"> <span>','</span> <ha-icon-button .label="','" .path="','" dialogAction="close" class="header_button"></ha-icon-button> </div> '])),t,null!==(i=null==e?void 0:e.localize("ui.dialogs.generic.close"))&&void 0!==i?i:"Close","M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z")};(0,p.Z)([(0,k.Mo)("ha-dialog")],(function(e,t){var i=function(t){function i(){var t;(0,l.Z)(this,i);for(var a=arguments.length,o=new Array(a),n=0;n<a;n++)o[n]=arguments[n];return t=(0,r.Z)(this,i,[].concat(o)),e((0,c.Z)(t)),t}return(0,s.Z)(i,t),(0,d.Z)(i)}(t);return{F:i,d:[{kind:"field",key:y.gA,value:void 0},{kind:"method",key:"scrollToPos",value:function(e,t){var i;null===(i=this.contentElement)||void 0===i||i.scrollTo(e,t)}},{kind:"method",key:"renderHeading",value:function(){return(0,f.dy)(o||(o=(0,v.Z)(['<slot name="heading"> '," </slot>"])),(0,u.Z)((0,h.Z)(i.prototype),"renderHeading",this).call(this))}},{kind:"method",key:"firstUpdated",value:function(){var e;(0,u.Z)((0,h.Z)(i.prototype),"firstUpdated",this).call(this),this.suppressDefaultPressSelector=[this.suppressDefaultPressSelector,_].join(", "),this._updateScrolledAttribute(),null===(e=this.contentElement)||void 0===e||e.addEventListener("scroll",this._onScroll,{passive:!0})}},{kind:"method",key:"disconnectedCallback",value:function(){(0,u.Z)((0,h.Z)(i.prototype),"disconnectedCallback",this).call(this),this.contentElement.removeEventListener("scroll",this._onScroll)}},{kind:"field",key:"_onScroll",value:function(){var e=this;return function(){e._updateScrolledAttribute()}}},{kind:"method",key:"_updateScrolledAttribute",value:function(){this.contentElement&&this.toggleAttribute("scrolled",0!==this.contentElement.scrollTop)}},{kind:"field",static:!0,key:"styles",value:function(){return[g.W,(0,f.iv)(n||(n=(0,v.Z)([":host([scrolled]) ::slotted(ha-dialog-header){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.mdc-dialog{--mdc-dialog-scroll-divider-color:var(\n          --dialog-scroll-divider-color,\n          var(--divider-color)\n        );z-index:var(--dialog-z-index,8);-webkit-backdrop-filter:var(--dialog-backdrop-filter,none);backdrop-filter:var(--dialog-backdrop-filter,none);--mdc-dialog-box-shadow:var(--dialog-box-shadow, none);--mdc-typography-headline6-font-weight:400;--mdc-typography-headline6-font-size:1.574rem}.mdc-dialog__actions{justify-content:var(--justify-action-buttons,flex-end);padding-bottom:max(env(safe-area-inset-bottom),24px)}.mdc-dialog__actions span:first-child{flex:var(--secondary-action-button-flex,unset)}.mdc-dialog__actions span:nth-child(2){flex:var(--primary-action-button-flex,unset)}.mdc-dialog__container{align-items:var(--vertical-align-dialog,center)}.mdc-dialog__title{padding:24px 24px 0 24px}.mdc-dialog__actions{padding:12px 24px 12px 24px}.mdc-dialog__title::before{content:unset}.mdc-dialog .mdc-dialog__content{position:var(--dialog-content-position,relative);padding:var(--dialog-content-padding,24px)}:host([hideactions]) .mdc-dialog .mdc-dialog__content{padding-bottom:max(var(--dialog-content-padding,24px),env(safe-area-inset-bottom))}.mdc-dialog .mdc-dialog__surface{position:var(--dialog-surface-position,relative);top:var(--dialog-surface-top);margin-top:var(--dialog-surface-margin-top);min-height:var(--mdc-dialog-min-height,auto);border-radius:var(--ha-dialog-border-radius,28px)}:host([flexContent]) .mdc-dialog .mdc-dialog__content{display:flex;flex-direction:column}.header_title{position:relative;padding-right:40px;padding-inline-end:40px;padding-inline-start:initial;direction:var(--direction)}.header_title span{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;display:block}.header_button{position:absolute;right:-8px;top:-8px;text-decoration:none;color:inherit;inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}.dialog-actions{inset-inline-start:initial!important;inset-inline-end:0px!important;direction:var(--direction)}"])))]}}]}}),m.M)}}]);
+//# sourceMappingURL=1009.aOgS8TITRsI.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1049],{92295:function(e,t,i){var n,a=i(88962),d=i(33368),o=i(71650),r=i(68308),l=i(82390),s=i(69205),u=i(91808),c=(i(97393),i(14271)),h=i(5095),f=i(95260),p=i(3712);(0,u.Z)([(0,f.Mo)("ha-button")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,a=new Array(n),d=0;d<n;d++)a[d]=arguments[d];return t=(0,r.Z)(this,i,[].concat(a)),e((0,l.Z)(t)),t}return(0,s.Z)(i,t),(0,d.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[p.W,(0,h.iv)(n||(n=(0,a.Z)(["::slotted([slot=icon]){margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction);display:block}.mdc-button{height:var(--button-height,36px)}.trailing-icon{display:flex}.slot-container{overflow:var(--button-slot-container-overflow,visible)}"])))]}}]}}),c.z)},1049:function(e,t,i){i.r(t),i.d(t,{HaTextSelector:function(){return L}});var n,a,d,o,r,l,s,u,c,h=i(88962),f=i(99312),p=i(81043),v=i(33368),x=i(71650),m=i(68308),g=i(82390),b=i(69205),k=i(91808),y=(i(97393),i(22859),i(5095)),Z=i(95260),_=i(4771),w=i(18394),C=(i(54371),i(46097)),A=(i(46349),i(70320),i(41353),i(29950)),L=(i(92295),i(51520),(0,k.Z)([(0,Z.Mo)("ha-multi-textfield")],(function(e,t){var i,o,r,l,s=function(t){function i(){var t;(0,x.Z)(this,i);for(var n=arguments.length,a=new Array(n),d=0;d<n;d++)a[d]=arguments[d];return t=(0,m.Z)(this,i,[].concat(a)),e((0,g.Z)(t)),t}return(0,b.Z)(i,t),(0,v.Z)(i)}(t);return{F:s,d:[{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"value",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,Z.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"inputType",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"inputSuffix",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"inputPrefix",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"addLabel",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"removeLabel",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:"item-index",type:Boolean})],key:"itemIndex",value:function(){return!1}},{kind:"method",key:"render",value:function(){var e,t,i,d=this;return(0,y.dy)(n||(n=(0,h.Z)([" ",' <div class="layout horizontal center-center"> <ha-button @click="','" .disabled="','"> ',' <ha-svg-icon slot="icon" .path="','"></ha-svg-icon> </ha-button> </div> '])),this._items.map((function(e,t){var i,n,o,r="".concat(d.itemIndex?" ".concat(t+1):"");return(0,y.dy)(a||(a=(0,h.Z)([' <div class="layout horizontal center-center row"> <ha-textfield .suffix="','" .prefix="','" .type="','" .autocomplete="','" .disabled="','" dialogInitialFocus="','" .index="','" class="flex-auto" .label="','" .value="','" ?data-last="','" @input="','" @keydown="','"></ha-textfield> <ha-icon-button .disabled="','" .index="','" slot="navigationIcon" .label="','" @click="','" .path="','"></ha-icon-button> </div> '])),d.inputSuffix,d.inputPrefix,d.inputType,d.autocomplete,d.disabled,t,t,"".concat(d.label?"".concat(d.label).concat(r):""),e,t===d._items.length-1,d._editItem,d._keyDown,d.disabled,t,null!==(i=null!==(n=d.removeLabel)&&void 0!==n?n:null===(o=d.hass)||void 0===o?void 0:o.localize("ui.common.remove"))&&void 0!==i?i:"Remove",d._removeItem,"M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19M8,9H16V19H8V9M15.5,4L14.5,3H9.5L8.5,4H5V6H19V4H15.5Z")})),this._addItem,this.disabled,null!==(e=null!==(t=this.addLabel)&&void 0!==t?t:null===(i=this.hass)||void 0===i?void 0:i.localize("ui.common.add"))&&void 0!==e?e:"Add","M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z")}},{kind:"get",key:"_items",value:function(){var e;return null!==(e=this.value)&&void 0!==e?e:[]}},{kind:"method",key:"_addItem",value:(l=(0,p.Z)((0,f.Z)().mark((function e(){var t,i,n;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return i=[].concat((0,C.Z)(this._items),[""]),this._fireChanged(i),e.next=4,this.updateComplete;case 4:null==(n=null===(t=this.shadowRoot)||void 0===t?void 0:t.querySelector("ha-textfield[data-last]"))||n.focus();case 6:case"end":return e.stop()}}),e,this)}))),function(){return l.apply(this,arguments)})},{kind:"method",key:"_editItem",value:(r=(0,p.Z)((0,f.Z)().mark((function e(t){var i,n;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:i=t.target.index,(n=(0,C.Z)(this._items))[i]=t.target.value,this._fireChanged(n);case 4:case"end":return e.stop()}}),e,this)}))),function(e){return r.apply(this,arguments)})},{kind:"method",key:"_keyDown",value:(o=(0,p.Z)((0,f.Z)().mark((function e(t){return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:"Enter"===t.key&&(t.stopPropagation(),this._addItem());case 1:case"end":return e.stop()}}),e,this)}))),function(e){return o.apply(this,arguments)})},{kind:"method",key:"_removeItem",value:(i=(0,p.Z)((0,f.Z)().mark((function e(t){var i,n;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:i=t.target.index,(n=(0,C.Z)(this._items)).splice(i,1),this._fireChanged(n);case 4:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"method",key:"_fireChanged",value:function(e){this.value=e,(0,w.B)(this,"value-changed",{value:e})}},{kind:"get",static:!0,key:"styles",value:function(){return[A.Qx,(0,y.iv)(d||(d=(0,h.Z)([".row{margin-bottom:8px}ha-textfield{display:block}ha-icon-button{display:block}ha-button{margin-left:8px}"])))]}}]}}),y.oi),i(99539),(0,k.Z)([(0,Z.Mo)("ha-selector-text")],(function(e,t){var i,n=function(t){function i(){var t;(0,x.Z)(this,i);for(var n=arguments.length,a=new Array(n),d=0;d<n;d++)a[d]=arguments[d];return t=(0,m.Z)(this,i,[].concat(a)),e((0,g.Z)(t)),t}return(0,b.Z)(i,t),(0,v.Z)(i)}(t);return{F:n,d:[{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"name",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"placeholder",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,Z.SB)()],key:"_unmaskedPassword",value:function(){return!1}},{kind:"method",key:"focus",value:(i=(0,p.Z)((0,f.Z)().mark((function e(){var t;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:null===(t=this.renderRoot.querySelector("ha-textarea, ha-textfield"))||void 0===t||t.focus();case 3:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"render",value:function(){var e,t,i,n,a,d,c,f,p,v,x,m,g,b,k;return null!==(e=this.selector.text)&&void 0!==e&&e.multiple?(0,y.dy)(o||(o=(0,h.Z)([' <ha-multi-textfield .hass="','" .value="','" .disabled="','" .label="','" .inputType="','" .inputSuffix="','" .inputPrefix="','" .autocomplete="','" @value-changed="','"> </ha-multi-textfield> '])),this.hass,(0,_.r)(null!==(v=this.value)&&void 0!==v?v:[]),this.disabled,this.label,null===(x=this.selector.text)||void 0===x?void 0:x.type,null===(m=this.selector.text)||void 0===m?void 0:m.suffix,null===(g=this.selector.text)||void 0===g?void 0:g.prefix,null===(b=this.selector.text)||void 0===b?void 0:b.autocomplete,this._handleChange):null!==(t=this.selector.text)&&void 0!==t&&t.multiline?(0,y.dy)(r||(r=(0,h.Z)(['<ha-textarea .name="','" .label="','" .placeholder="','" .value="','" .helper="','" helperPersistent .disabled="','" @input="','" autocapitalize="none" .autocomplete="','" spellcheck="false" .required="','" autogrow></ha-textarea>'])),this.name,this.label,this.placeholder,this.value||"",this.helper,this.disabled,this._handleChange,null===(k=this.selector.text)||void 0===k?void 0:k.autocomplete,this.required):(0,y.dy)(l||(l=(0,h.Z)(['<ha-textfield .name="','" .value="','" .placeholder="','" .helper="','" helperPersistent .disabled="','" .type="','" @input="','" .label="','" .prefix="','" .suffix="','" .required="','" .autocomplete="','"></ha-textfield> ',""])),this.name,this.value||"",this.placeholder||"",this.helper,this.disabled,this._unmaskedPassword?"text":null===(i=this.selector.text)||void 0===i?void 0:i.type,this._handleChange,this.label||"",null===(n=this.selector.text)||void 0===n?void 0:n.prefix,"password"===(null===(a=this.selector.text)||void 0===a?void 0:a.type)?(0,y.dy)(s||(s=(0,h.Z)(['<div style="width:24px"></div>']))):null===(d=this.selector.text)||void 0===d?void 0:d.suffix,this.required,null===(c=this.selector.text)||void 0===c?void 0:c.autocomplete,"password"===(null===(f=this.selector.text)||void 0===f?void 0:f.type)?(0,y.dy)(u||(u=(0,h.Z)(['<ha-icon-button toggles .label="','" @click="','" .path="','"></ha-icon-button>'])),(null===(p=this.hass)||void 0===p?void 0:p.localize(this._unmaskedPassword?"ui.components.selectors.text.hide_password":"ui.components.selectors.text.show_password"))||(this._unmaskedPassword?"Hide password":"Show password"),this._toggleUnmaskedPassword,this._unmaskedPassword?"M11.83,9L15,12.16C15,12.11 15,12.05 15,12A3,3 0 0,0 12,9C11.94,9 11.89,9 11.83,9M7.53,9.8L9.08,11.35C9.03,11.56 9,11.77 9,12A3,3 0 0,0 12,15C12.22,15 12.44,14.97 12.65,14.92L14.2,16.47C13.53,16.8 12.79,17 12,17A5,5 0 0,1 7,12C7,11.21 7.2,10.47 7.53,9.8M2,4.27L4.28,6.55L4.73,7C3.08,8.3 1.78,10 1,12C2.73,16.39 7,19.5 12,19.5C13.55,19.5 15.03,19.2 16.38,18.66L16.81,19.08L19.73,22L21,20.73L3.27,3M12,7A5,5 0 0,1 17,12C17,12.64 16.87,13.26 16.64,13.82L19.57,16.75C21.07,15.5 22.27,13.86 23,12C21.27,7.61 17,4.5 12,4.5C10.6,4.5 9.26,4.75 8,5.2L10.17,7.35C10.74,7.13 11.35,7 12,7Z":"M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17M12,4.5C7,4.5 2.73,7.61 1,12C2.73,16.39 7,19.5 12,19.5C17,19.5 21.27,16.39 23,12C21.27,7.61 17,4.5 12,4.5Z"):"")}},{kind:"method",key:"_toggleUnmaskedPassword",value:function(){this._unmaskedPassword=!this._unmaskedPassword}},{kind:"method",key:"_handleChange",value:function(e){var t,i,n=null!==(t=null===(i=e.detail)||void 0===i?void 0:i.value)&&void 0!==t?t:e.target.value;this.value!==n&&((""===n||Array.isArray(n)&&0===n.length)&&!this.required&&(n=void 0),(0,w.B)(this,"value-changed",{value:n}))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,y.iv)(c||(c=(0,h.Z)([":host{display:block;position:relative}ha-textarea,ha-textfield{width:100%}ha-icon-button{position:absolute;top:8px;right:8px;inset-inline-start:initial;inset-inline-end:8px;--mdc-icon-button-size:40px;--mdc-icon-size:20px;color:var(--secondary-text-color);direction:var(--direction)}"])))}}]}}),y.oi))},99539:function(e,t,i){var n,a=i(88962),d=i(33368),o=i(71650),r=i(68308),l=i(82390),s=i(69205),u=i(91808),c=i(34541),h=i(47838),f=(i(97393),i(89833)),p=i(31338),v=i(96791),x=i(5095),m=i(95260),g=i(67684);(0,u.Z)([(0,m.Mo)("ha-textarea")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,a=new Array(n),d=0;d<n;d++)a[d]=arguments[d];return t=(0,r.Z)(this,i,[].concat(a)),e((0,l.Z)(t)),t}return(0,s.Z)(i,t),(0,d.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,m.Cb)({type:Boolean,reflect:!0})],key:"autogrow",value:function(){return!1}},{kind:"method",key:"firstUpdated",value:function(){(0,c.Z)((0,h.Z)(i.prototype),"firstUpdated",this).call(this),this.setAttribute("dir",g.E.document.dir)}},{kind:"method",key:"updated",value:function(e){(0,c.Z)((0,h.Z)(i.prototype),"updated",this).call(this,e),this.autogrow&&e.has("value")&&(this.mdcRoot.dataset.value=this.value+'=​"')}},{kind:"field",static:!0,key:"styles",value:function(){return[p.W,v.W,(0,x.iv)(n||(n=(0,a.Z)([":host([autogrow]) .mdc-text-field{position:relative;min-height:74px;min-width:178px;max-height:200px}:host([autogrow]) .mdc-text-field:after{content:attr(data-value);margin-top:23px;margin-bottom:9px;line-height:1.5rem;min-height:42px;padding:0px 32px 0 16px;letter-spacing:var(\n          --mdc-typography-subtitle1-letter-spacing,\n          .009375em\n        );visibility:hidden;white-space:pre-wrap}:host([autogrow]) .mdc-text-field__input{position:absolute;height:calc(100% - 32px)}:host([autogrow]) .mdc-text-field.mdc-text-field--no-label:after{margin-top:16px;margin-bottom:16px}:host([dir=rtl]) .mdc-floating-label{right:16px;left:initial}"])))]}}]}}),f.O)},51520:function(e,t,i){var n,a,d,o,r=i(88962),l=i(33368),s=i(71650),u=i(68308),c=i(82390),h=i(69205),f=i(91808),p=i(34541),v=i(47838),x=(i(97393),i(42977)),m=i(31338),g=i(5095),b=i(95260),k=i(67684);(0,f.Z)([(0,b.Mo)("ha-textfield")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var n=arguments.length,a=new Array(n),d=0;d<n;d++)a[d]=arguments[d];return t=(0,u.Z)(this,i,[].concat(a)),e((0,c.Z)(t)),t}return(0,h.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,b.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,b.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,p.Z)((0,v.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=t?"trailing":"leading";return(0,g.dy)(n||(n=(0,r.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),i,t?1:-1,i)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,g.iv)(a||(a=(0,r.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===k.E.document.dir?(0,g.iv)(d||(d=(0,r.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,g.iv)(o||(o=(0,r.Z)([""])))]}}]}}),x.P)},89833:function(e,t,i){i.d(t,{O:function(){return m}});var n,a,d=i(88962),o=i(71650),r=i(33368),l=i(68308),s=i(69205),u=(i(22859),i(76843),i(43204)),c=i(42977),h=i(5095),f=i(95260),p=i(53180),v=i(10694),x=i(25815),m=function(e){function t(){var e;return(0,o.Z)(this,t),(e=(0,l.Z)(this,t,arguments)).rows=2,e.cols=20,e.charCounter=!1,e}return(0,s.Z)(t,e),(0,r.Z)(t,[{key:"render",value:function(){var e=this.charCounter&&-1!==this.maxLength,t=e&&"internal"===this.charCounter,i=e&&!t,a=!!this.helper||!!this.validationMessage||i,o={"mdc-text-field--disabled":this.disabled,"mdc-text-field--no-label":!this.label,"mdc-text-field--filled":!this.outlined,"mdc-text-field--outlined":this.outlined,"mdc-text-field--end-aligned":this.endAligned,"mdc-text-field--with-internal-counter":t};return(0,h.dy)(n||(n=(0,d.Z)([' <label class="mdc-text-field mdc-text-field--textarea ','"> '," "," "," "," "," </label> "," "])),(0,p.$)(o),this.renderRipple(),this.outlined?this.renderOutline():this.renderLabel(),this.renderInput(),this.renderCharCounter(t),this.renderLineRipple(),this.renderHelperText(a,i))}},{key:"renderInput",value:function(){var e=this.label?"label":void 0,t=-1===this.minLength?void 0:this.minLength,i=-1===this.maxLength?void 0:this.maxLength,n=this.autocapitalize?this.autocapitalize:void 0;return(0,h.dy)(a||(a=(0,d.Z)([' <textarea aria-labelledby="','" class="mdc-text-field__input" .value="','" rows="','" cols="','" ?disabled="','" placeholder="','" ?required="','" ?readonly="','" minlength="','" maxlength="','" name="','" inputmode="','" autocapitalize="','" @input="','" @blur="','">\n      </textarea>'])),(0,v.o)(e),(0,x.a)(this.value),this.rows,this.cols,this.disabled,this.placeholder,this.required,this.readOnly,(0,v.o)(t),(0,v.o)(i),(0,v.o)(""===this.name?void 0:this.name),(0,v.o)(this.inputMode),(0,v.o)(n),this.handleInputChange,this.onInputBlur)}}]),t}(c.P);(0,u.__decorate)([(0,f.IO)("textarea")],m.prototype,"formElement",void 0),(0,u.__decorate)([(0,f.Cb)({type:Number})],m.prototype,"rows",void 0),(0,u.__decorate)([(0,f.Cb)({type:Number})],m.prototype,"cols",void 0),(0,u.__decorate)([(0,f.Cb)({converter:{fromAttribute:function(e){return null!==e&&(""===e||e)},toAttribute:function(e){return"boolean"==typeof e?e?"":null:e}}})],m.prototype,"charCounter",void 0)},96791:function(e,t,i){i.d(t,{W:function(){return d}});var n,a=i(88962),d=(0,i(5095).iv)(n||(n=(0,a.Z)([".mdc-text-field{height:100%}.mdc-text-field__input{resize:none}"])))}}]);
+//# sourceMappingURL=1049.xMQc0QudPQE.js.map
\ No newline at end of file
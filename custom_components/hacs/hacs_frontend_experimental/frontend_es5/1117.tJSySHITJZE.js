@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1117],{1117:function(e,t,i){i.r(t),i.d(t,{HaAreaFilterSelector:function(){return b}});var n,a,r,d=i(88962),l=i(33368),o=i(71650),s=i(68308),c=i(82390),f=i(69205),u=i(91808),p=(i(97393),i(5095)),h=i(95260),v=i(99312),x=i(81043),m=(i(65974),i(18394)),g=(i(46798),i(47084),i(51358),i(5239),i(98490),i(85717),function(e,t){return new Promise((function(n){var a=t.cancel,r=t.submit;(0,m.B)(e,"show-dialog",{dialogTag:"dialog-area-filter",dialogImport:function(){return Promise.all([i.e(8597),i.e(7198)]).then(i.bind(i,77198))},dialogParams:Object.assign(Object.assign({},t),{},{cancel:function(){n(null),a&&a()},submit:function(e){n(e),r&&r(e)}})})}))}),b=(i(37662),i(51520),(0,u.Z)([(0,h.Mo)("ha-area-filter")],(function(e,t){var i,r=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,a=new Array(n),r=0;r<n;r++)a[r]=arguments[r];return t=(0,s.Z)(this,i,[].concat(a)),e((0,c.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:r,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"value",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"method",key:"render",value:function(){var e,t,i=Object.keys(this.hass.areas).length,a=null!==(e=null===(t=this.value)||void 0===t||null===(t=t.hidden)||void 0===t?void 0:t.length)&&void 0!==e?e:0,r=0===a?this.hass.localize("ui.components.area-filter.all_areas"):i===a?this.hass.localize("ui.components.area-filter.no_areas"):this.hass.localize("ui.components.area-filter.area_count",{count:i-a});return(0,p.dy)(n||(n=(0,d.Z)([' <ha-list-item tabindex="0" role="button" hasMeta twoline graphic="icon" @click="','" @keydown="','" .disabled="','"> <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> <span>','</span> <span slot="secondary">','</span> <ha-svg-icon slot="meta" .label="','" .path="','"></ha-svg-icon> </ha-list-item> '])),this._edit,this._edit,this.disabled,"M12.5 7C12.5 5.89 13.39 5 14.5 5H18C19.1 5 20 5.9 20 7V9.16C18.84 9.57 18 10.67 18 11.97V14H12.5V7M6 11.96V14H11.5V7C11.5 5.89 10.61 5 9.5 5H6C4.9 5 4 5.9 4 7V9.15C5.16 9.56 6 10.67 6 11.96M20.66 10.03C19.68 10.19 19 11.12 19 12.12V15H5V12C5 10.9 4.11 10 3 10S1 10.9 1 12V17C1 18.1 1.9 19 3 19V21H5V19H19V21H21V19C22.1 19 23 18.1 23 17V12C23 10.79 21.91 9.82 20.66 10.03Z",this.label,r,this.hass.localize("ui.common.edit"),"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z")}},{kind:"method",key:"_edit",value:(i=(0,x.Z)((0,v.Z)().mark((function e(t){var i;return(0,v.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!t.defaultPrevented){e.next=2;break}return e.abrupt("return");case 2:if("keydown"!==t.type||"Enter"===t.key||" "===t.key){e.next=4;break}return e.abrupt("return");case 4:return t.preventDefault(),t.stopPropagation(),e.next=8,g(this,{title:this.label,initialValue:this.value});case 8:if(i=e.sent){e.next=11;break}return e.abrupt("return");case 11:(0,m.B)(this,"value-changed",{value:i});case 12:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,p.iv)(a||(a=(0,d.Z)(["ha-list-item{--mdc-list-side-padding-left:8px;--mdc-list-side-padding-right:8px}"])))}}]}}),p.oi),(0,u.Z)([(0,h.Mo)("ha-selector-area_filter")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,a=new Array(n),r=0;r<n;r++)a[r]=arguments[r];return t=(0,s.Z)(this,i,[].concat(a)),e((0,c.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"method",key:"render",value:function(){return(0,p.dy)(r||(r=(0,d.Z)([' <ha-area-filter .hass="','" .value="','" .label="','" .helper="','" .disabled="','" .required="','"></ha-area-filter> '])),this.hass,this.value,this.label,this.helper,this.disabled,this.required)}}]}}),p.oi))},51520:function(e,t,i){var n,a,r,d,l=i(88962),o=i(33368),s=i(71650),c=i(68308),f=i(82390),u=i(69205),p=i(91808),h=i(34541),v=i(47838),x=(i(97393),i(42977)),m=i(31338),g=i(5095),b=i(95260),k=i(67684);(0,p.Z)([(0,b.Mo)("ha-textfield")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var n=arguments.length,a=new Array(n),r=0;r<n;r++)a[r]=arguments[r];return t=(0,c.Z)(this,i,[].concat(a)),e((0,f.Z)(t)),t}return(0,u.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,b.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,b.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,h.Z)((0,v.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=t?"trailing":"leading";return(0,g.dy)(n||(n=(0,l.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),i,t?1:-1,i)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,g.iv)(a||(a=(0,l.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===k.E.document.dir?(0,g.iv)(r||(r=(0,l.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,g.iv)(d||(d=(0,l.Z)([""])))]}}]}}),x.P)}}]);
+//# sourceMappingURL=1117.tJSySHITJZE.js.map
\ No newline at end of file
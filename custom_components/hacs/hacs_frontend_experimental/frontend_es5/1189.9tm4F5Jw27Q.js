@@ -0,0 +1,3 @@
+/*! For license information please see 1189.9tm4F5Jw27Q.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1189],{89833:function(e,t,n){n.d(t,{O:function(){return x}});var r,i,a=n(88962),c=n(71650),s=n(33368),o=n(68308),u=n(69205),f=(n(22859),n(76843),n(43204)),l=n(42977),v=n(5095),h=n(95260),d=n(53180),p=n(10694),b=n(25815),x=function(e){function t(){var e;return(0,c.Z)(this,t),(e=(0,o.Z)(this,t,arguments)).rows=2,e.cols=20,e.charCounter=!1,e}return(0,u.Z)(t,e),(0,s.Z)(t,[{key:"render",value:function(){var e=this.charCounter&&-1!==this.maxLength,t=e&&"internal"===this.charCounter,n=e&&!t,i=!!this.helper||!!this.validationMessage||n,c={"mdc-text-field--disabled":this.disabled,"mdc-text-field--no-label":!this.label,"mdc-text-field--filled":!this.outlined,"mdc-text-field--outlined":this.outlined,"mdc-text-field--end-aligned":this.endAligned,"mdc-text-field--with-internal-counter":t};return(0,v.dy)(r||(r=(0,a.Z)([' <label class="mdc-text-field mdc-text-field--textarea ','"> '," "," "," "," "," </label> "," "])),(0,d.$)(c),this.renderRipple(),this.outlined?this.renderOutline():this.renderLabel(),this.renderInput(),this.renderCharCounter(t),this.renderLineRipple(),this.renderHelperText(i,n))}},{key:"renderInput",value:function(){var e=this.label?"label":void 0,t=-1===this.minLength?void 0:this.minLength,n=-1===this.maxLength?void 0:this.maxLength,r=this.autocapitalize?this.autocapitalize:void 0;return(0,v.dy)(i||(i=(0,a.Z)([' <textarea aria-labelledby="','" class="mdc-text-field__input" .value="','" rows="','" cols="','" ?disabled="','" placeholder="','" ?required="','" ?readonly="','" minlength="','" maxlength="','" name="','" inputmode="','" autocapitalize="','" @input="','" @blur="','">\n      </textarea>'])),(0,p.o)(e),(0,b.a)(this.value),this.rows,this.cols,this.disabled,this.placeholder,this.required,this.readOnly,(0,p.o)(t),(0,p.o)(n),(0,p.o)(""===this.name?void 0:this.name),(0,p.o)(this.inputMode),(0,p.o)(r),this.handleInputChange,this.onInputBlur)}}]),t}(l.P);(0,f.__decorate)([(0,h.IO)("textarea")],x.prototype,"formElement",void 0),(0,f.__decorate)([(0,h.Cb)({type:Number})],x.prototype,"rows",void 0),(0,f.__decorate)([(0,h.Cb)({type:Number})],x.prototype,"cols",void 0),(0,f.__decorate)([(0,h.Cb)({converter:{fromAttribute:function(e){return null!==e&&(""===e||e)},toAttribute:function(e){return"boolean"==typeof e?e?"":null:e}}})],x.prototype,"charCounter",void 0)},96791:function(e,t,n){n.d(t,{W:function(){return a}});var r,i=n(88962),a=(0,n(5095).iv)(r||(r=(0,i.Z)([".mdc-text-field{height:100%}.mdc-text-field__input{resize:none}"])))},3239:function(e,t,n){n.d(t,{Z:function(){return i}});var r=n(76775);n(46798),n(94570),n(46349),n(70320),n(9849),n(50289),n(94167),n(65974);function i(e){if(!e||"object"!=(0,r.Z)(e))return e;if("[object Date]"==Object.prototype.toString.call(e))return new Date(e.getTime());if(Array.isArray(e))return e.map(i);var t={};return Object.keys(e).forEach((function(n){t[n]=i(e[n])})),t}},45882:function(e,t,n){var r=n(68077),i=n(19480),a=n(10228),c=n(97673),s=n(90476);r({target:"Array",proto:!0},{at:function(e){var t=i(this),n=a(t),r=c(e),s=r>=0?r:n+r;return s<0||s>=n?void 0:t[s]}}),s("at")},13227:function(e,t,n){n(68077)({target:"Number",stat:!0},{isInteger:n(3873)})},95818:function(e,t,n){n(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{MIN_SAFE_INTEGER:-9007199254740991})},23994:function(e,t,n){n(68077)({target:"Object",stat:!0},{is:n(93577)})},37724:function(e,t,n){var r=n(68077),i=n(55418),a=n(43313),c=n(97673),s=n(11336),o=n(18431),u=i("".charAt);r({target:"String",proto:!0,forced:o((function(){return"\ud842"!=="𠮷".at(-2)}))},{at:function(e){var t=s(a(this)),n=t.length,r=c(e),i=r>=0?r:n+r;return i<0||i>=n?void 0:u(t,i)}})},48769:function(e,t,n){n(88820)("WeakSet",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),n(6946))},48567:function(e,t,n){n(48769)},49089:function(e,t,n){var r=n(68077),i=n(72208),a=n(9160),c=n(22933),s=n(73177);r({target:"Iterator",proto:!0,real:!0},{every:function(e){c(this),a(e);var t=s(this),n=0;return!i(t,(function(t,r){if(!e(t,n++))return r()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})},98830:function(e,t,n){n.d(t,{HQ:function(){return b},F_:function(){return y},kr:function(){return u}});var r=n(33368),i=n(71650),a=n(68308),c=n(69205),s=n(56889),o=function(e){function t(e,n,r){var c;return(0,i.Z)(this,t),(c=(0,a.Z)(this,t,["context-request",{bubbles:!0,composed:!0}])).context=e,c.callback=n,c.subscribe=null!=r&&r,c}return(0,c.Z)(t,e),(0,r.Z)(t)}((0,s.Z)(Event));function u(e){return e}var f=function(){function e(t,n,r,a){var c,s=this;if((0,i.Z)(this,e),this.subscribe=!1,this.provided=!1,this.value=void 0,this.t=function(e,t){s.unsubscribe&&(s.unsubscribe!==t&&(s.provided=!1,s.unsubscribe()),s.subscribe||s.unsubscribe()),s.value=e,s.host.requestUpdate(),s.provided&&!s.subscribe||(s.provided=!0,s.callback&&s.callback(e,t)),s.unsubscribe=t},this.host=t,void 0!==n.context){var o=n;this.context=o.context,this.callback=o.callback,this.subscribe=null!==(c=o.subscribe)&&void 0!==c&&c}else this.context=n,this.callback=r,this.subscribe=null!=a&&a;this.host.addController(this)}return(0,r.Z)(e,[{key:"hostConnected",value:function(){this.dispatchRequest()}},{key:"hostDisconnected",value:function(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=void 0)}},{key:"dispatchRequest",value:function(){this.host.dispatchEvent(new o(this.context,this.t,this.subscribe))}}]),e}(),l=n(62746),v=n(40039),h=n(82390),d=(n(51358),n(46798),n(78399),n(5239),n(56086),n(47884),n(81912),n(64584),n(41483),n(12367),n(9454),n(98490),n(96043),n(23994),function(){function e(t){var n=this;(0,i.Z)(this,e),this.subscriptions=new Map,this.updateObservers=function(){var e,t=(0,v.Z)(n.subscriptions);try{for(t.s();!(e=t.n()).done;){var r=(0,l.Z)(e.value,2),i=r[0],a=r[1].disposer;i(n.o,a)}}catch(c){t.e(c)}finally{t.f()}},void 0!==t&&(this.value=t)}return(0,r.Z)(e,[{key:"value",get:function(){return this.o},set:function(e){this.setValue(e)}},{key:"setValue",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1]||!Object.is(e,this.o);this.o=e,t&&this.updateObservers()}},{key:"addCallback",value:function(e,t,n){var r=this;if(n){this.subscriptions.has(e)||this.subscriptions.set(e,{disposer:function(){r.subscriptions.delete(e)},consumerHost:t});var i=this.subscriptions.get(e).disposer;e(this.value,i)}else e(this.value)}},{key:"clearCallbacks",value:function(){this.subscriptions.clear()}}]),e}()),p=function(e){function t(e){var n;return(0,i.Z)(this,t),(n=(0,a.Z)(this,t,["context-provider",{bubbles:!0,composed:!0}])).context=e,n}return(0,c.Z)(t,e),(0,r.Z)(t)}((0,s.Z)(Event)),b=function(e){function t(e,n,r){var c;return(0,i.Z)(this,t),(c=(0,a.Z)(this,t,[void 0!==n.context?n.initialValue:r])).onContextRequest=function(e){var t=e.composedPath()[0];e.context===c.context&&t!==c.host&&(e.stopPropagation(),c.addCallback(e.callback,t,e.subscribe))},c.onProviderRequest=function(e){var t=e.composedPath()[0];if(e.context===c.context&&t!==c.host){var n,r=new Set,i=(0,v.Z)(c.subscriptions);try{for(i.s();!(n=i.n()).done;){var a=(0,l.Z)(n.value,2),s=a[0],u=a[1].consumerHost;r.has(s)||(r.add(s),u.dispatchEvent(new o(c.context,s,!0)))}}catch(f){i.e(f)}finally{i.f()}e.stopPropagation()}},c.host=e,void 0!==n.context?c.context=n.context:c.context=n,c.attachListeners(),c.host.addController((0,h.Z)(c)),c}return(0,c.Z)(t,e),(0,r.Z)(t,[{key:"attachListeners",value:function(){this.host.addEventListener("context-request",this.onContextRequest),this.host.addEventListener("context-provider",this.onProviderRequest)}},{key:"hostConnected",value:function(){this.host.dispatchEvent(new p(this.context))}}]),t}(d),x=(n(39685),n(48567),n(36513),n(40720),n(85717),n(39030));function y(e){var t=e.context,n=e.subscribe;return(0,x.eZ)({finisher:function(e,r){e.addInitializer((function(e){new f(e,{context:t,callback:function(t){e[r]=t},subscribe:n})}))}})}},99266:function(e,t,n){n.d(t,{r:function(){return d}});var r=n(62746),i=n(40039),a=n(71650),c=n(33368),s=n(95281),o=n(68308),u=n(69205),f=(n(51358),n(96043),n(46798),n(5239),n(98490),n(51467),n(32982)),l=n(16616),v=n(41005),h=function(e,t,n){for(var r=new Map,i=t;i<=n;i++)r.set(e[i],i);return r},d=(0,l.XM)(function(e){function t(e){var n;if((0,a.Z)(this,t),n=(0,o.Z)(this,t,[e]),e.type!==l.pX.CHILD)throw Error("repeat() can only be used in text expressions");return(0,s.Z)(n)}return(0,u.Z)(t,e),(0,c.Z)(t,[{key:"ct",value:function(e,t,n){var r;void 0===n?n=t:void 0!==t&&(r=t);var a,c=[],s=[],o=0,u=(0,i.Z)(e);try{for(u.s();!(a=u.n()).done;){var f=a.value;c[o]=r?r(f,o):o,s[o]=n(f,o),o++}}catch(l){u.e(l)}finally{u.f()}return{values:s,keys:c}}},{key:"render",value:function(e,t,n){return this.ct(e,t,n).values}},{key:"update",value:function(e,t){var n,i=(0,r.Z)(t,3),a=i[0],c=i[1],s=i[2],o=(0,v.i9)(e),u=this.ct(a,c,s),l=u.values,d=u.keys;if(!Array.isArray(o))return this.ut=d,l;for(var p,b,x=null!==(n=this.ut)&&void 0!==n?n:this.ut=[],y=[],k=0,Z=o.length-1,m=0,g=l.length-1;k<=Z&&m<=g;)if(null===o[k])k++;else if(null===o[Z])Z--;else if(x[k]===d[m])y[m]=(0,v.fk)(o[k],l[m]),k++,m++;else if(x[Z]===d[g])y[g]=(0,v.fk)(o[Z],l[g]),Z--,g--;else if(x[k]===d[g])y[g]=(0,v.fk)(o[k],l[g]),(0,v._Y)(e,y[g+1],o[k]),k++,g--;else if(x[Z]===d[m])y[m]=(0,v.fk)(o[Z],l[m]),(0,v._Y)(e,o[k],o[Z]),Z--,m++;else if(void 0===p&&(p=h(d,m,g),b=h(x,k,Z)),p.has(x[k]))if(p.has(x[Z])){var w=b.get(d[m]),_=void 0!==w?o[w]:null;if(null===_){var C=(0,v._Y)(e,o[k]);(0,v.fk)(C,l[m]),y[m]=C}else y[m]=(0,v.fk)(_,l[m]),(0,v._Y)(e,o[k],_),o[w]=null;m++}else(0,v.ws)(o[Z]),Z--;else(0,v.ws)(o[k]),k++;for(;m<=g;){var O=(0,v._Y)(e,y[g+1]);(0,v.fk)(O,l[m]),y[m++]=O}for(;k<=Z;){var j=o[k++];null!==j&&(0,v.ws)(j)}return this.ut=d,(0,v.hl)(e,y),f.Jb}}]),t}(l.Xe))},36142:function(e,t,n){n.d(t,{C:function(){return k}});var r=n(99312),i=n(81043),a=n(71650),c=n(33368),s=n(68308),o=n(82390),u=n(69205),f=(n(85472),n(46798),n(9849),n(90126),n(47084),n(56308),n(32982)),l=n(41005),v=n(36585);n(94738),n(98214),n(53918),n(20254),n(51358),n(5239),n(98490),n(51467);var h=function(){function e(t){(0,a.Z)(this,e),this.G=t}return(0,c.Z)(e,[{key:"disconnect",value:function(){this.G=void 0}},{key:"reconnect",value:function(e){this.G=e}},{key:"deref",value:function(){return this.G}}]),e}(),d=function(){function e(){(0,a.Z)(this,e),this.Y=void 0,this.Z=void 0}return(0,c.Z)(e,[{key:"get",value:function(){return this.Y}},{key:"pause",value:function(){var e,t=this;null!==(e=this.Y)&&void 0!==e||(this.Y=new Promise((function(e){return t.Z=e})))}},{key:"resume",value:function(){var e;null===(e=this.Z)||void 0===e||e.call(this),this.Y=this.Z=void 0}}]),e}(),p=n(16616),b=function(e){return!(0,l.pt)(e)&&"function"==typeof e.then},x=1073741823,y=function(e){function t(){var e;return(0,a.Z)(this,t),(e=(0,s.Z)(this,t,arguments))._$C_t=x,e._$Cwt=[],e._$Cq=new h((0,o.Z)(e)),e._$CK=new d,e}return(0,u.Z)(t,e),(0,c.Z)(t,[{key:"render",value:function(){for(var e,t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return null!==(e=n.find((function(e){return!b(e)})))&&void 0!==e?e:f.Jb}},{key:"update",value:function(e,t){var n=this,a=this._$Cwt,c=a.length;this._$Cwt=t;var s=this._$Cq,o=this._$CK;this.isConnected||this.disconnected();for(var u,l=function(){var e=t[v];if(!b(e))return{v:(n._$C_t=v,e)};v<c&&e===a[v]||(n._$C_t=x,c=0,Promise.resolve(e).then(function(){var t=(0,i.Z)((0,r.Z)().mark((function t(n){var i,a;return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!o.get()){t.next=5;break}return t.next=3,o.get();case 3:t.next=0;break;case 5:void 0!==(i=s.deref())&&(a=i._$Cwt.indexOf(e))>-1&&a<i._$C_t&&(i._$C_t=a,i.setValue(n));case 7:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}()))},v=0;v<t.length&&!(v>this._$C_t);v++)if(u=l())return u.v;return f.Jb}},{key:"disconnected",value:function(){this._$Cq.disconnect(),this._$CK.pause()}},{key:"reconnected",value:function(){this._$Cq.reconnect(this),this._$CK.resume()}}]),t}(v.sR),k=(0,p.XM)(y)},38768:function(e,t,n){n.d(t,{AG:function(){return L},DD:function(){return y},G0:function(){return M},IX:function(){return $},O7:function(){return R},Rx:function(){return S},Ry:function(){return N},Z_:function(){return Y},f0:function(){return E},hu:function(){return C},i0:function(){return q},is:function(){return O},jt:function(){return P}});var r=n(25283),i=n(62746),a=n(99312),c=n(40039),s=n(76775),o=n(46097),u=n(25518),f=n(33368),l=n(71650),v=n(68308),h=n(82390),d=n(69205),p=n(56889),b=(n(97393),n(91989),n(85717),n(22859),n(51467),n(20254),n(51358),n(46798),n(5239),n(98490),n(94738),n(98214),n(94570),n(30535),n(88770),n(96043),n(78399),n(56086),n(47884),n(81912),n(64584),n(41483),n(12367),n(9454),n(46349),n(70320),n(17692),n(40271),n(60163),n(13227),n(76843),n(65974),n(10999),n(52117),n(63789),n(82479),n(36513),n(11451),n(99397),["message","explanation"]),x=(0,a.Z)().mark(g),y=function(e){function t(e,n){var r,i;(0,l.Z)(this,t);var a=e.message,c=e.explanation,s=(0,u.Z)(e,b),f=e.path,d=0===f.length?a:"At path: ".concat(f.join(".")," -- ").concat(a);return r=(0,v.Z)(this,t,[null!=c?c:d]),null!=c&&(r.cause=d),Object.assign((0,h.Z)(r),s),r.name=r.constructor.name,r.failures=function(){var t;return null!==(t=i)&&void 0!==t?t:i=[e].concat((0,o.Z)(n()))},r}return(0,d.Z)(t,e),(0,f.Z)(t)}((0,p.Z)(TypeError));function k(e){return"object"===(0,s.Z)(e)&&null!=e}function Z(e){return"symbol"===(0,s.Z)(e)?e.toString():"string"==typeof e?JSON.stringify(e):"".concat(e)}function m(e,t,n,r){if(!0!==e){!1===e?e={}:"string"==typeof e&&(e={message:e});var i=t.path,a=t.branch,c=n.type,s=e,o=s.refinement,u=s.message,f=void 0===u?"Expected a value of type `".concat(c,"`").concat(o?" with refinement `".concat(o,"`"):"",", but received: `").concat(Z(r),"`"):u;return Object.assign(Object.assign({value:r,type:c,refinement:o,key:i[i.length-1],path:i,branch:a},e),{},{message:f})}}function g(e,t,n,r){var i,s,o,u;return(0,a.Z)().wrap((function(a){for(;;)switch(a.prev=a.next){case 0:k(f=e)&&"function"==typeof f[Symbol.iterator]||(e=[e]),i=(0,c.Z)(e),a.prev=2,i.s();case 4:if((s=i.n()).done){a.next=12;break}if(o=s.value,!(u=m(o,t,n,r))){a.next=10;break}return a.next=10,u;case 10:a.next=4;break;case 12:a.next=17;break;case 14:a.prev=14,a.t0=a.catch(2),i.e(a.t0);case 17:return a.prev=17,i.f(),a.finish(17);case 20:case"end":return a.stop()}var f}),x,null,[[2,14,17,20]])}function w(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return(0,a.Z)().mark((function r(){var s,u,f,l,v,h,d,p,b,x,y,Z,m,g,_,C,O,j,E,A,$,R,q,I,L,S,N;return(0,a.Z)().wrap((function(r){for(;;)switch(r.prev=r.next){case 0:if(s=n.path,u=void 0===s?[]:s,f=n.branch,l=void 0===f?[e]:f,v=n.coerce,h=void 0!==v&&v,d=n.mask,p=void 0!==d&&d,b={path:u,branch:l},h&&(e=t.coercer(e,b),p&&"type"!==t.type&&k(t.schema)&&k(e)&&!Array.isArray(e)))for(x in e)void 0===t.schema[x]&&delete e[x];y="valid",Z=(0,c.Z)(t.validator(e,b)),r.prev=5,Z.s();case 7:if((m=Z.n()).done){r.next=15;break}return(g=m.value).explanation=n.message,y="not_valid",r.next=13,[g,void 0];case 13:r.next=7;break;case 15:r.next=20;break;case 17:r.prev=17,r.t0=r.catch(5),Z.e(r.t0);case 20:return r.prev=20,Z.f(),r.finish(20);case 23:_=(0,c.Z)(t.entries(e,b)),r.prev=24,_.s();case 26:if((C=_.n()).done){r.next=53;break}O=(0,i.Z)(C.value,3),j=O[0],E=O[1],A=O[2],$=w(E,A,{path:void 0===j?u:[].concat((0,o.Z)(u),[j]),branch:void 0===j?l:[].concat((0,o.Z)(l),[E]),coerce:h,mask:p,message:n.message}),R=(0,c.Z)($),r.prev=30,R.s();case 32:if((q=R.n()).done){r.next=43;break}if(!(I=q.value)[0]){r.next=40;break}return y=null!=I[0].refinement?"not_refined":"not_valid",r.next=38,[I[0],void 0];case 38:r.next=41;break;case 40:h&&(E=I[1],void 0===j?e=E:e instanceof Map?e.set(j,E):e instanceof Set?e.add(E):k(e)&&(void 0!==E||j in e)&&(e[j]=E));case 41:r.next=32;break;case 43:r.next=48;break;case 45:r.prev=45,r.t1=r.catch(30),R.e(r.t1);case 48:return r.prev=48,R.f(),r.finish(48);case 51:r.next=26;break;case 53:r.next=58;break;case 55:r.prev=55,r.t2=r.catch(24),_.e(r.t2);case 58:return r.prev=58,_.f(),r.finish(58);case 61:if("not_valid"===y){r.next=81;break}L=(0,c.Z)(t.refiner(e,b)),r.prev=63,L.s();case 65:if((S=L.n()).done){r.next=73;break}return(N=S.value).explanation=n.message,y="not_refined",r.next=71,[N,void 0];case 71:r.next=65;break;case 73:r.next=78;break;case 75:r.prev=75,r.t3=r.catch(63),L.e(r.t3);case 78:return r.prev=78,L.f(),r.finish(78);case 81:if("valid"!==y){r.next=84;break}return r.next=84,[void 0,e];case 84:case"end":return r.stop()}}),r,null,[[5,17,20,23],[24,55,58,61],[30,45,48,51],[63,75,78,81]])}))()}var _=function(){function e(t){var n=this;(0,l.Z)(this,e);var r=t.type,i=t.schema,c=t.validator,s=t.refiner,o=t.coercer,u=void 0===o?function(e){return e}:o,f=t.entries,v=void 0===f?(0,a.Z)().mark((function e(){return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:case"end":return e.stop()}}),e)})):f;this.type=r,this.schema=i,this.entries=v,this.coercer=u,this.validator=c?function(e,t){return g(c(e,t),t,n,e)}:function(){return[]},this.refiner=s?function(e,t){return g(s(e,t),t,n,e)}:function(){return[]}}return(0,f.Z)(e,[{key:"assert",value:function(e,t){return C(e,this,t)}},{key:"create",value:function(e,t){return function(e,t,n){var r=j(e,t,{coerce:!0,message:n});if(r[0])throw r[0];return r[1]}(e,this,t)}},{key:"is",value:function(e){return O(e,this)}},{key:"mask",value:function(e,t){return function(e,t,n){var r=j(e,t,{coerce:!0,mask:!0,message:n});if(r[0])throw r[0];return r[1]}(e,this,t)}},{key:"validate",value:function(e){return j(e,this,arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}}]),e}();function C(e,t,n){var r=j(e,t,{message:n});if(r[0])throw r[0]}function O(e,t){return!j(e,t)[0]}function j(e,t){var n=w(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:{}),r=function(e){var t=e.next(),n=t.done,r=t.value;return n?void 0:r}(n);return r[0]?[new y(r[0],(0,a.Z)().mark((function e(){var t,r,i;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=(0,c.Z)(n),e.prev=1,t.s();case 3:if((r=t.n()).done){e.next=10;break}if(!(i=r.value)[0]){e.next=8;break}return e.next=8,i[0];case 8:e.next=3;break;case 10:e.next=15;break;case 12:e.prev=12,e.t0=e.catch(1),t.e(e.t0);case 15:return e.prev=15,t.f(),e.finish(15);case 18:case"end":return e.stop()}}),e,null,[[1,12,15,18]])}))),void 0]:[void 0,r[1]]}function E(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r="type"===t[0].type,i=t.map((function(e){return e.schema})),a=Object.assign.apply(Object,[{}].concat((0,o.Z)(i)));return r?D(a):N(a)}function A(e,t){return new _({type:e,schema:null,validator:t})}function $(e){return new _({type:"array",schema:e,entries:(0,a.Z)().mark((function t(n){var r,s,o,u,f;return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!e||!Array.isArray(n)){t.next=18;break}r=(0,c.Z)(n.entries()),t.prev=2,r.s();case 4:if((s=r.n()).done){t.next=10;break}return o=(0,i.Z)(s.value,2),u=o[0],f=o[1],t.next=8,[u,f,e];case 8:t.next=4;break;case 10:t.next=15;break;case 12:t.prev=12,t.t0=t.catch(2),r.e(t.t0);case 15:return t.prev=15,r.f(),t.finish(15);case 18:case"end":return t.stop()}}),t,null,[[2,12,15,18]])})),coercer:function(e){return Array.isArray(e)?e.slice():e},validator:function(e){return Array.isArray(e)||"Expected an array value, but received: ".concat(Z(e))}})}function R(){return A("boolean",(function(e){return"boolean"==typeof e}))}function q(e){var t=Z(e),n=(0,s.Z)(e);return new _({type:"literal",schema:"string"===n||"number"===n||"boolean"===n?e:null,validator:function(n){return n===e||"Expected the literal `".concat(t,"`, but received: ").concat(Z(n))}})}function I(){return A("never",(function(){return!1}))}function L(e){return new _(Object.assign(Object.assign({},e),{},{validator:function(t,n){return null===t||e.validator(t,n)},refiner:function(t,n){return null===t||e.refiner(t,n)}}))}function S(){return A("number",(function(e){return"number"==typeof e&&!isNaN(e)||"Expected a number, but received: ".concat(Z(e))}))}function N(e){var t=e?Object.keys(e):[],n=I();return new _({type:"object",schema:e||null,entries:(0,a.Z)().mark((function r(i){var s,o,u,f,l,v,h;return(0,a.Z)().wrap((function(r){for(;;)switch(r.prev=r.next){case 0:if(!e||!k(i)){r.next=37;break}s=new Set(Object.keys(i)),o=(0,c.Z)(t),r.prev=3,o.s();case 5:if((u=o.n()).done){r.next=12;break}return f=u.value,s.delete(f),r.next=10,[f,i[f],e[f]];case 10:r.next=5;break;case 12:r.next=17;break;case 14:r.prev=14,r.t0=r.catch(3),o.e(r.t0);case 17:return r.prev=17,o.f(),r.finish(17);case 20:l=(0,c.Z)(s),r.prev=21,l.s();case 23:if((v=l.n()).done){r.next=29;break}return h=v.value,r.next=27,[h,i[h],n];case 27:r.next=23;break;case 29:r.next=34;break;case 31:r.prev=31,r.t1=r.catch(21),l.e(r.t1);case 34:return r.prev=34,l.f(),r.finish(34);case 37:case"end":return r.stop()}}),r,null,[[3,14,17,20],[21,31,34,37]])})),validator:function(e){return k(e)||"Expected an object, but received: ".concat(Z(e))},coercer:function(e){return k(e)?Object.assign({},e):e}})}function P(e){return new _(Object.assign(Object.assign({},e),{},{validator:function(t,n){return void 0===t||e.validator(t,n)},refiner:function(t,n){return void 0===t||e.refiner(t,n)}}))}function Y(){return A("string",(function(e){return"string"==typeof e||"Expected a string, but received: ".concat(Z(e))}))}function D(e){var t=Object.keys(e);return new _({type:"type",schema:e,entries:(0,a.Z)().mark((function n(r){var i,c,s;return(0,a.Z)().wrap((function(n){for(;;)switch(n.prev=n.next){case 0:if(!k(r)){n.next=9;break}i=0,c=t;case 2:if(!(i<c.length)){n.next=9;break}return s=c[i],n.next=6,[s,r[s],e[s]];case 6:i++,n.next=2;break;case 9:case"end":return n.stop()}}),n)})),validator:function(e){return k(e)||"Expected an object, but received: ".concat(Z(e))},coercer:function(e){return k(e)?Object.assign({},e):e}})}function M(e){var t=e.map((function(e){return e.type})).join(" | ");return new _({type:"union",schema:null,coercer:function(t){var n,r=(0,c.Z)(e);try{for(r.s();!(n=r.n()).done;){var a=n.value.validate(t,{coerce:!0}),s=(0,i.Z)(a,2),o=s[0],u=s[1];if(!o)return u}}catch(f){r.e(f)}finally{r.f()}return t},validator:function(n,a){var s,o=[],u=(0,c.Z)(e);try{for(u.s();!(s=u.n()).done;){var f=w(n,s.value,a),l=(0,r.Z)(f).slice(0);if(!(0,i.Z)(l,1)[0][0])return[];var v,h=(0,c.Z)(l);try{for(h.s();!(v=h.n()).done;){var d=(0,i.Z)(v.value,1)[0];d&&o.push(d)}}catch(p){h.e(p)}finally{h.f()}}}catch(p){u.e(p)}finally{u.f()}return["Expected the value to satisfy a union of `".concat(t,"`, but received: ").concat(Z(n))].concat(o)}})}}}]);
+//# sourceMappingURL=1189.9tm4F5Jw27Q.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1303],{7341:function(e,t,a){a(51358),a(46798),a(78399),a(5239),a(56086),a(47884),a(81912),a(64584),a(41483),a(12367),a(9454),a(98490),a(97393);var n,r,i=Intl&&Intl.DateTimeFormat,o=[38,33,36],l=[40,34,35],s=new Set([37].concat(o)),d=new Set([39].concat(l)),u=new Set([39].concat(o)),c=new Set([37].concat(l)),h=new Set([37,39].concat(o,l)),f=a(99312),m=a(81043),v=a(88962),y=a(71650),p=a(33368),b=a(68308),g=a(34541),w=a(47838),_=a(69205),k=(a(76843),a(46349),a(70320),a(43204)),D=a(5095),T=a(95260),C=a(62746),x=(a(39685),a(32982)),S=a(16616),M=a(41005),U=function(e){return(0,M.dZ)(e)?e._$litType$.h:e.strings},Z=(0,S.XM)(function(e){function t(e){var a;return(0,y.Z)(this,t),(a=(0,b.Z)(this,t,[e])).tt=new WeakMap,a}return(0,_.Z)(t,e),(0,p.Z)(t,[{key:"render",value:function(e){return[e]}},{key:"update",value:function(e,t){var a=(0,C.Z)(t,1)[0],n=(0,M.hN)(this.et)?U(this.et):null,r=(0,M.hN)(a)?U(a):null;if(null!==n&&(null===r||n!==r)){var i=(0,M.i9)(e).pop(),o=this.tt.get(n);if(void 0===o){var l=document.createDocumentFragment();(o=(0,x.sY)(x.Ld,l)).setConnected(!1),this.tt.set(n,o)}(0,M.hl)(o,[i]),(0,M._Y)(o,void 0,i)}if(null!==r){if(null===n||n!==r){var s=this.tt.get(r);if(void 0!==s){var d=(0,M.i9)(s).pop();(0,M.E_)(e),(0,M._Y)(e,void 0,d),(0,M.hl)(e,[d])}}this.et=a}else this.et=void 0;return this.render(a)}}]),t}(S.Xe)),W=a(53180),F=a(99266);function N(e,t,a){return new Date(Date.UTC(e,t,a))}var Y,E,P,L,O,A=(0,D.dy)(n||(n=(0,v.Z)(['<svg height="24" viewBox="0 0 24 24" width="24"><path d="M15.41 7.41L14 6l-6 6 6 6 1.41-1.41L10.83 12z"></path></svg>']))),j=(0,D.dy)(r||(r=(0,v.Z)(['<svg height="24" viewBox="0 0 24 24" width="24"><path d="M10 6L8.59 7.41 13.17 12l-4.58 4.59L10 18l6-6z"></path></svg>']))),q=(0,D.iv)(Y||(Y=(0,v.Z)(["button{-webkit-appearance:none;-moz-appearance:none;appearance:none;position:relative;display:block;margin:0;padding:0;background:0 0;color:inherit;border:none;font:inherit;text-align:left;text-transform:inherit;-webkit-tap-highlight-color:transparent}"]))),z=((0,D.iv)(E||(E=(0,v.Z)(["a{-webkit-tap-highlight-color:transparent;position:relative;display:inline-block;background:initial;color:inherit;font:inherit;text-transform:inherit;text-decoration:none;outline:0}a:focus,a:focus.page-selected{text-decoration:underline}"]))),(0,D.iv)(P||(P=(0,v.Z)(["svg{display:block;min-width:var(--svg-icon-min-width,24px);min-height:var(--svg-icon-min-height,24px);fill:var(--svg-icon-fill,currentColor);pointer-events:none}"]))),(0,D.iv)(L||(L=(0,v.Z)(["[hidden]{display:none!important}"]))),(0,D.iv)(O||(O=(0,v.Z)([":host{display:block}*{box-sizing:border-box}"]))));a(47084),a(9849),a(50289),a(94167),a(65974);function H(e,t){return V.apply(this,arguments)}function V(){return(V=(0,m.Z)((0,f.Z)().mark((function e(t,a){var n,r,i,o,l,s,d;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(r=(n=a||{}).hasNativeWebAnimation,i=void 0!==r&&r,o=n.keyframes,l=void 0===o?[]:o,s=n.options,d=void 0===s?{duration:100}:s,Array.isArray(l)&&l.length){e.next=3;break}return e.abrupt("return");case 3:return e.abrupt("return",new Promise((function(e){if(i){t.animate(l,d).onfinish=function(){return e()}}else{var a=l||[],n=(0,C.Z)(a,2)[1];t.addEventListener("transitionend",(function a(){t.removeEventListener("transitionend",a),e()})),t.style.transitionDuration="".concat(d.duration,"ms"),d.easing&&(t.style.transitionTimingFunction=d.easing),Object.keys(n).forEach((function(e){e&&(t.style[e]=n[e])}))}})));case 4:case"end":return e.stop()}}),e)})))).apply(this,arguments)}function R(e,t){return+t-+e}function I(e){var t=e.hasAltKey,a=e.keyCode,n=e.focusedDate,r=e.selectedDate,i=e.disabledDaysSet,o=e.disabledDatesSet,l=e.minTime,h=e.maxTime,f=n.getUTCFullYear(),m=n.getUTCMonth(),v=n.getUTCDate(),y=+n,p=r.getUTCFullYear(),b=r.getUTCMonth(),g=f,w=m,_=v,k=!0;switch((b!==m||p!==f)&&(g=p,w=b,_=1,k=34===a||33===a||35===a),k){case y===l&&s.has(a):case y===h&&d.has(a):break;case 38===a:_-=7;break;case 40===a:_+=7;break;case 37===a:_-=1;break;case 39===a:_+=1;break;case 34===a:t?g+=1:w+=1;break;case 33===a:t?g-=1:w-=1;break;case 35===a:w+=1,_=0;break;default:_=1}if(34===a||33===a){var D=N(g,w+1,0).getUTCDate();_>D&&(_=D)}var T=function(e){var t=e.keyCode,a=e.disabledDaysSet,n=e.disabledDatesSet,r=e.focusedDate,i=e.maxTime,o=e.minTime,l=+r,s=l<o,d=l>i;if(R(o,i)<864e5)return r;var h=s||d||a.has(r.getUTCDay())||n.has(l);if(!h)return r;for(var f=0,m=s===d?r:new Date(s?o-864e5:864e5+i),v=m.getUTCFullYear(),y=m.getUTCMonth(),p=m.getUTCDate();h;)(s||!d&&u.has(t))&&(p+=1),(d||!s&&c.has(t))&&(p-=1),f=+(m=N(v,y,p)),s||(s=f<o)&&(f=+(m=new Date(o)),p=m.getUTCDate()),d||(d=f>i)&&(f=+(m=new Date(i)),p=m.getUTCDate()),h=a.has(m.getUTCDay())||n.has(f);return m}({keyCode:a,maxTime:h,minTime:l,disabledDaysSet:i,disabledDatesSet:o,focusedDate:N(g,w,_)});return T}function X(e,t,a){return e.dispatchEvent(new CustomEvent(t,{detail:a,bubbles:!0,composed:!0}))}a(85472),a(90126);function B(e,t){return e.composedPath().find((function(e){return e instanceof HTMLElement&&t(e)}))}a(63789),a(24074);function G(e){return function(t){return e.format(t).replace(/\u200e/gi,"")}}function J(e){var t=i(e,{timeZone:"UTC",weekday:"short",month:"short",day:"numeric"}),a=i(e,{timeZone:"UTC",day:"numeric"}),n=i(e,{timeZone:"UTC",year:"numeric",month:"short",day:"numeric"}),r=i(e,{timeZone:"UTC",year:"numeric",month:"long"}),o=i(e,{timeZone:"UTC",weekday:"long"}),l=i(e,{timeZone:"UTC",weekday:"narrow"}),s=i(e,{timeZone:"UTC",year:"numeric"});return{locale:e,dateFormat:G(t),dayFormat:G(a),fullDateFormat:G(n),longMonthYearFormat:G(r),longWeekdayFormat:G(o),narrowWeekdayFormat:G(l),yearFormat:G(s)}}var Q=a(25518),K=a(40039);a(95818),a(79894),a(91989),a(87438),a(22890),a(54299),a(85717),a(36513),a(34997),a(12148),a(32797);a(94738),a(98214),a(20254),a(51467),a(17692),a(94570),a(22859),a(99397);function $(e,t){(null==t||t>e.length)&&(t=e.length);for(var a=0,n=new Array(t);a<t;a++)n[a]=e[a];return n}function ee(e,t){var a="undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(!a){if(Array.isArray(e)||(a=function(e,t){if(e){if("string"==typeof e)return $(e,t);var a=Object.prototype.toString.call(e).slice(8,-1);return"Object"===a&&e.constructor&&(a=e.constructor.name),"Map"===a||"Set"===a?Array.from(e):"Arguments"===a||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(a)?$(e,t):void 0}}(e))||t&&e&&"number"==typeof e.length){a&&(e=a);var n=0,r=function(){};return{s:r,n:function(){return n>=e.length?{done:!0}:{done:!1,value:e[n++]}},e:function(e){throw e},f:r}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var i,o=!0,l=!1;return{s:function(){a=a.call(e)},n:function(){var e=a.next();return o=e.done,e},e:function(e){l=!0,i=e},f:function(){try{o||null==a.return||a.return()}finally{if(l)throw i}}}}function te(e,t){var a=function(e,t){var a=t.getUTCFullYear(),n=t.getUTCMonth(),r=t.getUTCDate(),i=t.getUTCDay(),o=i;return"first-4-day-week"===e&&(o=3),"first-day-of-year"===e&&(o=6),"first-full-week"===e&&(o=0),N(a,n,r-i+o)}(e,t),n=N(a.getUTCFullYear(),0,1),r=1+(+a-+n)/864e5;return Math.ceil(r/7)}function ae(e){return e>=0&&e<7?Math.abs(e):((e<0?7*Math.ceil(Math.abs(e)):0)+e)%7}function ne(e,t,a){var n=ae(e-t);return a?1+n:n}var re=["disabledDatesSet","disabledDaysSet"];function ie(e){var t,a=e.dayFormat,n=e.fullDateFormat,r=e.locale,i=e.longWeekdayFormat,o=e.narrowWeekdayFormat,l=e.selectedDate,s=e.disabledDates,d=e.disabledDays,u=e.firstDayOfWeek,c=e.max,h=e.min,f=e.showWeekNumber,m=e.weekLabel,v=e.weekNumberType,y=null==h?Number.MIN_SAFE_INTEGER:+h,p=null==c?Number.MAX_SAFE_INTEGER:+c,b=function(e){var t=e||{},a=t.firstDayOfWeek,n=void 0===a?0:a,r=t.showWeekNumber,i=void 0!==r&&r,o=t.weekLabel,l=t.longWeekdayFormat,s=t.narrowWeekdayFormat,d=1+(n+(n<0?7:0))%7,u=o||"Wk",c=i?[{label:"Wk"===u?"Week":u,value:u}]:[],h=Array.from(Array(7)).reduce((function(e,t,a){var n=N(2017,0,d+a);return e.push({label:l(n),value:s(n)}),e}),c);return h}({longWeekdayFormat:i,narrowWeekdayFormat:o,firstDayOfWeek:u,showWeekNumber:f,weekLabel:m}),g=function(e){return[r,e.toJSON(),null==s?void 0:s.join("_"),null==d?void 0:d.join("_"),u,null==c?void 0:c.toJSON(),null==h?void 0:h.toJSON(),f,m,v].filter(Boolean).join(":")},w=l.getUTCFullYear(),_=l.getUTCMonth(),k=[-1,0,1].map((function(e){var t=N(w,_+e,1),i=+N(w,_+e+1,0),o=g(t);if(i<y||+t>p)return{key:o,calendar:[],disabledDatesSet:new Set,disabledDaysSet:new Set};var l=function(e){for(var t=e||{},a=t.date,n=t.dayFormat,r=t.disabledDates,i=void 0===r?[]:r,o=t.disabledDays,l=void 0===o?[]:o,s=t.firstDayOfWeek,d=void 0===s?0:s,u=t.fullDateFormat,c=t.locale,h=void 0===c?"en-US":c,f=t.max,m=t.min,v=t.showWeekNumber,y=void 0!==v&&v,p=t.weekLabel,b=void 0===p?"Week":p,g=t.weekNumberType,w=void 0===g?"first-4-day-week":g,_=ae(d),k=a.getUTCFullYear(),D=a.getUTCMonth(),T=N(k,D,1),C=new Set(l.map((function(e){return ne(e,_,y)}))),x=new Set(i.map((function(e){return+e}))),S=[T.toJSON(),_,h,null==f?"":f.toJSON(),null==m?"":m.toJSON(),Array.from(C).join(","),Array.from(x).join(","),w].filter(Boolean).join(":"),M=ne(T.getUTCDay(),_,y),U=null==m?+new Date("2000-01-01"):+m,Z=null==f?+new Date("2100-12-31"):+f,W=y?8:7,F=N(k,1+D,0).getUTCDate(),Y=[],E=[],P=!1,L=1,O=0,A=[0,1,2,3,4,5];O<A.length;O++){var j,q=A[O],z=ee([0,1,2,3,4,5,6].concat(7===W?[]:[7]));try{for(z.s();!(j=z.n()).done;){var H=j.value,V=H+q*W;if(P||!y||0!==H)if(P||V<M)E.push({fullDate:null,label:"",value:"",key:"".concat(S,":").concat(V),disabled:!0});else{var R=N(k,D,L),I=+R,X=C.has(H)||x.has(I)||I<U||I>Z;X&&x.add(I),E.push({fullDate:R,label:u(R),value:n(R),key:"".concat(S,":").concat(R.toJSON()),disabled:X}),(L+=1)>F&&(P=!0)}else{var B=te(w,N(k,D,L-(q<1?_:0))),G="".concat(b," ").concat(B);E.push({fullDate:null,label:G,value:"".concat(B),key:"".concat(S,":").concat(G),disabled:!0})}}}catch(J){z.e(J)}finally{z.f()}Y.push(E),E=[]}return{disabledDatesSet:x,calendar:Y,disabledDaysSet:new Set(l.map((function(e){return ae(e)}))),key:S}}({dayFormat:a,fullDateFormat:n,locale:r,disabledDates:s,disabledDays:d,firstDayOfWeek:u,max:c,min:h,showWeekNumber:f,weekLabel:m,weekNumberType:v,date:t});return Object.assign(Object.assign({},l),{},{key:o})})),D=[],T=new Set,C=new Set,x=(0,K.Z)(k);try{for(x.s();!(t=x.n()).done;){var S=t.value,M=S.disabledDatesSet,U=S.disabledDaysSet,Z=(0,Q.Z)(S,re);if(Z.calendar.length>0){if(U.size>0){var W,F=(0,K.Z)(U);try{for(F.s();!(W=F.n()).done;){var Y=W.value;C.add(Y)}}catch(O){F.e(O)}finally{F.f()}}if(M.size>0){var E,P=(0,K.Z)(M);try{for(P.s();!(E=P.n()).done;){var L=E.value;T.add(L)}}catch(O){P.e(O)}finally{P.f()}}}D.push(Z)}}catch(O){x.e(O)}finally{x.f()}return{calendars:D,weekdays:b,disabledDatesSet:T,disabledDaysSet:C,key:g(l)}}function oe(e){var t=null==e?new Date:new Date(e),a="string"==typeof e&&(/^\d{4}-\d{2}-\d{2}$/i.test(e)||/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}(Z|\+00:00|-00:00)$/i.test(e)),n="number"==typeof e&&e>0&&isFinite(e),r=t.getFullYear(),i=t.getMonth(),o=t.getDate();return(a||n)&&(r=t.getUTCFullYear(),i=t.getUTCMonth(),o=t.getUTCDate()),N(r,i,o)}function le(e,t){return e.classList.contains(t)}function se(e,t){return!(null==e||!(t instanceof Date)||isNaN(+t))}a(5110);function de(e){return e-Math.floor(e)>0?+e.toFixed(3):e}function ue(e){return{passive:!0,handleEvent:e}}a(57778);function ce(e,t){var a="string"==typeof e&&e.length>0?e.split(/,\s*/i):[];return a.length?"function"==typeof t?a.map(t):a:[]}function he(e,t){if(null==e.scrollTo){var a=t||{},n=a.top,r=a.left;e.scrollTop=n||0,e.scrollLeft=r||0}else e.scrollTo(t)}function fe(e){if(e instanceof Date&&!isNaN(+e)){var t=e.toJSON();return null==t?"":t.replace(/^(.+)T.+/i,"$1")}return""}function me(e,t){if(R(e,t)<864e5)return[];var a=e.getUTCFullYear();return Array.from(Array(t.getUTCFullYear()-a+1),(function(e,t){return t+a}))}function ve(e,t,a){var n="number"==typeof e?e:+e,r=+t,i=+a;return n<r?r:n>i?i:e}var ye=a(82612);function pe(e){var t=e.clientX,a=e.clientY,n=e.pageX,r=e.pageY,i=Math.max(n,t),o=Math.max(r,a),l=e.identifier||e.pointerId;return{x:i,y:o,id:null==l?0:l}}function be(e,t){var a=t.changedTouches;if(null==a)return{newPointer:pe(t),oldPointer:e};var n=Array.from(a,(function(e){return pe(e)}));return{newPointer:null==e?n[0]:n.find((function(t){return t.id===e.id})),oldPointer:e}}function ge(e,t,a){e.addEventListener(t,a,!!ye.Vq&&{passive:!0})}var we,_e,ke,De,Te,Ce,xe,Se,Me,Ue,Ze,We,Fe,Ne,Ye,Ee,Pe,Le,Oe=function(){function e(t,a){(0,y.Z)(this,e),this._element=t,this._startPointer=null;var n=a.down,r=a.move,i=a.up;this._down=this._onDown(n),this._move=this._onMove(r),this._up=this._onUp(i),t&&t.addEventListener&&(t.addEventListener("mousedown",this._down),ge(t,"touchstart",this._down),ge(t,"touchmove",this._move),ge(t,"touchend",this._up))}return(0,p.Z)(e,[{key:"disconnect",value:function(){var e=this._element;e&&e.removeEventListener&&(e.removeEventListener("mousedown",this._down),e.removeEventListener("touchstart",this._down),e.removeEventListener("touchmove",this._move),e.removeEventListener("touchend",this._up))}},{key:"_onDown",value:function(e){var t=this;return function(a){a instanceof MouseEvent&&(t._element.addEventListener("mousemove",t._move),t._element.addEventListener("mouseup",t._up),t._element.addEventListener("mouseleave",t._up));var n=be(t._startPointer,a).newPointer;e(n,a),t._startPointer=n}}},{key:"_onMove",value:function(e){var t=this;return function(a){t._updatePointers(e,a)}}},{key:"_onUp",value:function(e){var t=this;return function(a){t._updatePointers(e,a,!0)}}},{key:"_updatePointers",value:function(e,t,a){a&&t instanceof MouseEvent&&(this._element.removeEventListener("mousemove",this._move),this._element.removeEventListener("mouseup",this._up),this._element.removeEventListener("mouseleave",this._up));var n=be(this._startPointer,t),r=n.newPointer;e(r,n.oldPointer,t),this._startPointer=a?null:r}}]),e}(),Ae=function(e){function t(){var e;(0,y.Z)(this,t),(e=(0,b.Z)(this,t)).firstDayOfWeek=0,e.showWeekNumber=!1,e.weekNumberType="first-4-day-week",e.landscape=!1,e.locale=i&&i().resolvedOptions&&i().resolvedOptions().locale||"en-US",e.disabledDays="",e.disabledDates="",e.weekLabel="Wk",e.inline=!1,e.dragRatio=.15,e._hasMin=!1,e._hasMax=!1,e._disabledDaysSet=new Set,e._disabledDatesSet=new Set,e._dx=-1/0,e._hasNativeWebAnimation="animate"in HTMLElement.prototype,e._updatingDateWithKey=!1;var a=oe(),n=J(e.locale),r=fe(a),o=oe("2100-12-31");return e.value=r,e.startView="calendar",e._min=new Date(a),e._max=new Date(o),e._todayDate=a,e._maxDate=o,e._yearList=me(a,o),e._selectedDate=new Date(a),e._focusedDate=new Date(a),e._formatters=n,e}var a;return(0,_.Z)(t,e),(0,p.Z)(t,[{key:"startView",get:function(){return this._startView},set:function(e){var t=e||"calendar";if("calendar"===t||"yearList"===t){var a=this._startView;this._startView=t,this.requestUpdate("startView",a)}}},{key:"min",get:function(){return this._hasMin?fe(this._min):""},set:function(e){var t=oe(e),a=se(e,t);this._min=a?t:this._todayDate,this._hasMin=a,this.requestUpdate("min")}},{key:"max",get:function(){return this._hasMax?fe(this._max):""},set:function(e){var t=oe(e),a=se(e,t);this._max=a?t:this._maxDate,this._hasMax=a,this.requestUpdate("max")}},{key:"value",get:function(){return fe(this._focusedDate)},set:function(e){var t=oe(e),a=se(e,t)?t:this._todayDate;this._focusedDate=new Date(a),this._selectedDate=this._lastSelectedDate=new Date(a)}},{key:"disconnectedCallback",value:function(){(0,g.Z)((0,w.Z)(t.prototype),"disconnectedCallback",this).call(this),this._tracker&&(this._tracker.disconnect(),this._tracker=void 0)}},{key:"render",value:function(){this._formatters.locale!==this.locale&&(this._formatters=J(this.locale));var e="yearList"===this._startView?this._renderDatepickerYearList():this._renderDatepickerCalendar(),t=this.inline?null:(0,D.dy)(we||(we=(0,v.Z)(['<div class="datepicker-header" part="header">',"</div>"])),this._renderHeaderSelectorButton());return(0,D.dy)(_e||(_e=(0,v.Z)([" ",' <div class="datepicker-body" part="body">',"</div> "])),t,Z(e))}},{key:"firstUpdated",value:function(){X(this,"datepicker-first-updated",{firstFocusableElement:"calendar"===this._startView?this.inline?this.shadowRoot.querySelector(".btn__month-selector"):this._buttonSelectorYear:this._yearViewListItem,value:this.value})}},{key:"updated",value:(a=(0,m.Z)((0,f.Z)().mark((function e(t){var a,n,r,i,o,l,s,d,u,c,h,v=this;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:a=this._startView,(t.has("min")||t.has("max"))&&(this._yearList=me(this._min,this._max),"yearList"===a&&this.requestUpdate(),n=+this._min,r=+this._max,R(n,r)>864e5&&(i=+this._focusedDate,o=i,i<n&&(o=n),i>r&&(o=r),this.value=fe(new Date(o)))),(t.has("_startView")||t.has("startView"))&&("yearList"===a&&(l=48*(this._selectedDate.getUTCFullYear()-this._min.getUTCFullYear()-2),he(this._yearViewFullList,{top:l,left:0})),"calendar"===a&&null==this._tracker&&(s=this.calendarsContainer,d=!1,u=!1,c=!1,s&&(h={down:function(){c||(d=!0,v._dx=0)},move:function(e,t){if(!c&&d){var a=v._dx,n=a<0&&le(s,"has-max-date")||a>0&&le(s,"has-min-date");!n&&Math.abs(a)>0&&d&&(u=!0,s.style.transform="translateX(".concat(de(a),"px)")),v._dx=n?0:a+(e.x-t.x)}},up:function(){var e=(0,m.Z)((0,f.Z)().mark((function e(t,a,n){var r,i,o,l;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!d||!u){e.next=17;break}return r=v._dx,i=s.getBoundingClientRect().width/3,o=Math.abs(r)>Number(v.dragRatio)*i,l=o?de(i*(r<0?-1:1)):0,c=!0,e.next=10,H(s,{hasNativeWebAnimation:v._hasNativeWebAnimation,keyframes:[{transform:"translateX(".concat(r,"px)")},{transform:"translateX(".concat(l,"px)")}],options:{duration:350,easing:"cubic-bezier(0, 0, .4, 1)"}});case 10:o&&v._updateMonth(r<0?"next":"previous").handleEvent(),d=u=c=!1,v._dx=-1/0,s.removeAttribute("style"),X(v,"datepicker-animation-finished"),e.next=18;break;case 17:d&&(v._updateFocusedDate(n),d=u=!1,v._dx=-1/0);case 18:case"end":return e.stop()}}),e)})));return function(t,a,n){return e.apply(this,arguments)}}()},this._tracker=new Oe(s,h))),t.get("_startView")&&"calendar"===a&&this._focusElement('[part="year-selector"]')),this._updatingDateWithKey&&(this._focusElement('[part="calendars"]:nth-of-type(2) .day--focused'),this._updatingDateWithKey=!1);case 4:case"end":return e.stop()}}),e,this)}))),function(e){return a.apply(this,arguments)})},{key:"_focusElement",value:function(e){var t=this.shadowRoot.querySelector(e);t&&t.focus()}},{key:"_renderHeaderSelectorButton",value:function(){var e=this._formatters,t=e.yearFormat,a=e.dateFormat,n="calendar"===this.startView,r=this._focusedDate,i=a(r),o=t(r);return(0,D.dy)(ke||(ke=(0,v.Z)([' <button class="','" type="button" part="year-selector" data-view="','" @click="','">','</button> <div class="datepicker-toolbar" part="toolbar"> <button class="','" type="button" part="calendar-selector" data-view="','" @click="','">',"</button> </div> "])),(0,W.$)({"btn__year-selector":!0,selected:!n}),"yearList",this._updateView("yearList"),o,(0,W.$)({"btn__calendar-selector":!0,selected:n}),"calendar",this._updateView("calendar"),i)}},{key:"_renderDatepickerYearList",value:function(){var e=this._formatters.yearFormat,t=this._focusedDate.getUTCFullYear();return(0,D.dy)(De||(De=(0,v.Z)([' <div class="datepicker-body__year-list-view" part="year-list-view"> <div class="year-list-view__full-list" part="year-list" @click="','"> ',"</div> </div> "])),this._updateYear,this._yearList.map((function(a){return(0,D.dy)(Te||(Te=(0,v.Z)(['<button class="','" type="button" part="year" .year="','">',"</button>"])),(0,W.$)({"year-list-view__list-item":!0,"year--selected":t===a}),a,e(N(a,0,1)))})))}},{key:"_renderDatepickerCalendar",value:function(){var e=this,t=this._formatters,a=t.longMonthYearFormat,n=t.dayFormat,r=t.fullDateFormat,i=t.longWeekdayFormat,o=t.narrowWeekdayFormat,l=ce(this.disabledDays,Number),s=ce(this.disabledDates,oe),d=this.showWeekNumber,u=this._focusedDate,c=this.firstDayOfWeek,h=oe(),f=this._selectedDate,m=this._max,y=this._min,p=ie({dayFormat:n,fullDateFormat:r,longWeekdayFormat:i,narrowWeekdayFormat:o,firstDayOfWeek:c,disabledDays:l,disabledDates:s,locale:this.locale,selectedDate:f,showWeekNumber:this.showWeekNumber,weekNumberType:this.weekNumberType,max:m,min:y,weekLabel:this.weekLabel}),b=p.calendars,g=p.disabledDaysSet,w=p.disabledDatesSet,_=p.weekdays,k=!b[0].calendar.length,T=!b[2].calendar.length,C=_.map((function(e){return(0,D.dy)(Ce||(Ce=(0,v.Z)(['<th class="calendar-weekday" part="calendar-weekday" role="columnheader" aria-label="','"> <div class="weekday" part="weekday">',"</div> </th>"])),e.label,e.value)})),x=(0,F.r)(b,(function(e){return e.key}),(function(t,n){var r=t.calendar;if(!r.length)return(0,D.dy)(xe||(xe=(0,v.Z)(['<div class="calendar-container" part="calendar"></div>'])));var i="calendarcaption".concat(n),o=r[1][1].fullDate,l=1===n,s=l&&!e._isInVisibleMonth(u,f)?I({disabledDaysSet:g,disabledDatesSet:w,hasAltKey:!1,keyCode:36,focusedDate:u,selectedDate:f,minTime:+y,maxTime:+m}):u;return(0,D.dy)(Se||(Se=(0,v.Z)([' <div class="calendar-container" part="calendar"> <table class="calendar-table" part="table" role="grid" aria-labelledby="','"> <caption id="','"> <div class="calendar-label" part="label">','</div> </caption> <thead role="rowgroup"> <tr class="calendar-weekdays" part="weekdays" role="row">','</tr> </thead> <tbody role="rowgroup">',"</tbody> </table> </div> "])),i,i,o?a(o):"",C,r.map((function(e){return(0,D.dy)(Me||(Me=(0,v.Z)(['<tr role="row">',"</tr>"])),e.map((function(e,t){var a=e.disabled,n=e.fullDate,r=e.label,i=e.value;if(!n&&i&&d&&t<1)return(0,D.dy)(Ue||(Ue=(0,v.Z)(['<th class="full-calendar__day weekday-label" part="calendar-day" scope="row" role="rowheader" abbr="','" aria-label="','">',"</th>"])),r,r,i);if(!i||!n)return(0,D.dy)(Ze||(Ze=(0,v.Z)(['<td class="full-calendar__day day--empty" part="calendar-day"></td>'])));var o=+new Date(n),c=+u===o,f=l&&s.getUTCDate()===Number(i);return(0,D.dy)(We||(We=(0,v.Z)([' <td tabindex="','" class="','" part="calendar-day','" role="gridcell" aria-disabled="','" aria-label="','" aria-selected="','" .fullDate="','" .day="','"> <div class="calendar-day" part="day','">',"</div> </td> "])),f?"0":"-1",(0,W.$)({"full-calendar__day":!0,"day--disabled":a,"day--today":+h===o,"day--focused":!a&&c}),+h===o?" calendar-today":"",a?"true":"false",r,c?"true":"false",n,i,+h===o?" today":"",i)})))})))}));return this._disabledDatesSet=w,this._disabledDaysSet=g,(0,D.dy)(Fe||(Fe=(0,v.Z)([' <div class="datepicker-body__calendar-view" part="calendar-view"> <div class="calendar-view__month-selector" part="month-selectors"> <div class="month-selector-container">','</div> <div class="month-selector-container">','</div> </div> <div class="','" part="calendars" @keyup="','">',"</div> </div> "])),k?null:(0,D.dy)(Ne||(Ne=(0,v.Z)([' <button class="btn__month-selector" type="button" part="month-selector" aria-label="Previous month" @click="','">',"</button> "])),this._updateMonth("previous"),A),T?null:(0,D.dy)(Ye||(Ye=(0,v.Z)([' <button class="btn__month-selector" type="button" part="month-selector" aria-label="Next month" @click="','">',"</button> "])),this._updateMonth("next"),j),(0,W.$)({"calendars-container":!0,"has-min-date":k,"has-max-date":T}),this._updateFocusedDateWithKeyboard,x)}},{key:"_updateView",value:function(e){var t=this;return ue((function(){"calendar"===e&&(t._selectedDate=t._lastSelectedDate=new Date(ve(t._focusedDate,t._min,t._max))),t._startView=e}))}},{key:"_updateMonth",value:function(e){var t=this;return ue((function(){if(null==t.calendarsContainer)return t.updateComplete;var a=t._lastSelectedDate||t._selectedDate,n=t._min,r=t._max,i="previous"===e,o=N(a.getUTCFullYear(),a.getUTCMonth()+(i?-1:1),1),l=o.getUTCFullYear(),s=o.getUTCMonth(),d=n.getUTCFullYear(),u=n.getUTCMonth(),c=r.getUTCFullYear(),h=r.getUTCMonth();return l<d||l<=d&&s<u||(l>c||l>=c&&s>h)||(t._lastSelectedDate=o,t._selectedDate=t._lastSelectedDate),t.updateComplete}))}},{key:"_updateYear",value:function(e){var t=B(e,(function(e){return le(e,"year-list-view__list-item")}));if(null!=t){var a=ve(new Date(this._focusedDate).setUTCFullYear(+t.year),this._min,this._max);this._selectedDate=this._lastSelectedDate=new Date(a),this._focusedDate=new Date(a),this._startView="calendar"}}},{key:"_updateFocusedDate",value:function(e){var t=B(e,(function(e){return le(e,"full-calendar__day")}));null==t||["day--empty","day--disabled","day--focused","weekday-label"].some((function(e){return le(t,e)}))||(this._focusedDate=new Date(t.fullDate),X(this,"datepicker-value-updated",{isKeypress:!1,value:this.value}))}},{key:"_updateFocusedDateWithKeyboard",value:function(e){var t=e.keyCode;if(13===t||32===t)return X(this,"datepicker-value-updated",{keyCode:t,isKeypress:!0,value:this.value}),void(this._focusedDate=new Date(this._selectedDate));if(9!==t&&h.has(t)){var a=this._selectedDate,n=I({keyCode:t,selectedDate:a,disabledDatesSet:this._disabledDatesSet,disabledDaysSet:this._disabledDaysSet,focusedDate:this._focusedDate,hasAltKey:e.altKey,maxTime:+this._max,minTime:+this._min});this._isInVisibleMonth(n,a)||(this._selectedDate=this._lastSelectedDate=n),this._focusedDate=n,this._updatingDateWithKey=!0,X(this,"datepicker-value-updated",{keyCode:t,isKeypress:!0,value:this.value})}}},{key:"_isInVisibleMonth",value:function(e,t){var a=e.getUTCFullYear(),n=e.getUTCMonth(),r=t.getUTCFullYear(),i=t.getUTCMonth();return a===r&&n===i}},{key:"calendarsContainer",get:function(){return this.shadowRoot.querySelector(".calendars-container")}}]),t}(D.oi);Ae.styles=[z,q,(0,D.iv)(Ee||(Ee=(0,v.Z)([":host{width:312px;background-color:var(--app-datepicker-bg-color,#fff);color:var(--app-datepicker-color,#000);border-radius:var(--app-datepicker-border-top-left-radius,0) var(--app-datepicker-border-top-right-radius,0) var(--app-datepicker-border-bottom-right-radius,0) var(--app-datepicker-border-bottom-left-radius,0);contain:content;overflow:hidden}:host([landscape]){display:flex;min-width:calc(568px - 16px * 2);width:calc(568px - 16px * 2)}.datepicker-header+.datepicker-body{border-top:1px solid var(--app-datepicker-separator-color,#ddd)}:host([landscape])>.datepicker-header+.datepicker-body{border-top:none;border-left:1px solid var(--app-datepicker-separator-color,#ddd)}.datepicker-header{display:flex;flex-direction:column;align-items:flex-start;position:relative;padding:16px 24px}:host([landscape])>.datepicker-header{min-width:calc(14ch + 24px * 2)}.btn__calendar-selector,.btn__year-selector{color:var(--app-datepicker-selector-color,rgba(0,0,0,.55));cursor:pointer}.btn__calendar-selector.selected,.btn__year-selector.selected{color:currentColor}.datepicker-toolbar{width:100%}.btn__year-selector{font-size:16px;font-weight:700}.btn__calendar-selector{font-size:36px;font-weight:700;line-height:1}.datepicker-body{position:relative;width:100%;overflow:hidden}.datepicker-body__calendar-view{min-height:56px}.calendar-view__month-selector{display:flex;align-items:center;position:absolute;top:0;left:0;width:100%;padding:0 8px;z-index:1}.month-selector-container{max-height:56px;height:100%}.month-selector-container+.month-selector-container{margin:0 0 0 auto}.btn__month-selector{padding:calc((56px - 24px)/ 2);line-height:0}.btn__month-selector>svg{fill:currentColor}.calendars-container{display:flex;justify-content:center;position:relative;top:0;left:calc(-100%);width:calc(100% * 3);transform:translateZ(0);will-change:transform;touch-action:pan-y}.year-list-view__full-list{max-height:calc(48px * 7);overflow-y:auto;scrollbar-color:var(--app-datepicker-scrollbar-thumb-bg-color,rgba(0,0,0,.35)) rgba(0,0,0,0);scrollbar-width:thin}.year-list-view__full-list::-webkit-scrollbar{width:8px;background-color:rgba(0,0,0,0)}.year-list-view__full-list::-webkit-scrollbar-thumb{background-color:var(--app-datepicker-scrollbar-thumb-bg-color,rgba(0,0,0,.35));border-radius:50px}.year-list-view__full-list::-webkit-scrollbar-thumb:hover{background-color:var(--app-datepicker-scrollbar-thumb-hover-bg-color,rgba(0,0,0,.5))}.calendar-weekdays>th,.weekday-label{color:var(--app-datepicker-weekday-color,rgba(0,0,0,.55));font-weight:400;transform:translateZ(0);will-change:transform}.calendar-container,.calendar-label,.calendar-table{width:100%}.calendar-container{position:relative;padding:0 16px 16px}.calendar-table{-moz-user-select:none;-webkit-user-select:none;user-select:none;border-collapse:collapse;border-spacing:0;text-align:center}.calendar-label{display:flex;align-items:center;justify-content:center;height:56px;font-weight:500;text-align:center}.calendar-weekday,.full-calendar__day{position:relative;width:calc(100% / 7);height:0;padding:calc(100% / 7 / 2) 0;outline:0;text-align:center}.full-calendar__day:not(.day--disabled):focus{outline:#000 dotted 1px;outline:-webkit-focus-ring-color auto 1px}:host([showweeknumber]) .calendar-weekday,:host([showweeknumber]) .full-calendar__day{width:calc(100% / 8);padding-top:calc(100% / 8);padding-bottom:0}:host([showweeknumber]) th.weekday-label{padding:0}.full-calendar__day:not(.day--empty):not(.day--disabled):not(.weekday-label){transform:translateZ(0);will-change:transform}.full-calendar__day:not(.day--empty):not(.day--disabled):not(.day--focused):not(.weekday-label):hover::after,.full-calendar__day:not(.day--empty):not(.day--disabled):not(.weekday-label).day--focused::after{content:'';display:block;position:absolute;top:0;left:0;width:100%;height:100%;background-color:var(--app-datepicker-accent-color,#1a73e8);border-radius:50%;opacity:0;pointer-events:none}.full-calendar__day:not(.day--empty):not(.day--disabled):not(.weekday-label){cursor:pointer;pointer-events:auto;-webkit-tap-highlight-color:transparent}.full-calendar__day.day--focused:not(.day--empty):not(.day--disabled):not(.weekday-label)::after,.full-calendar__day.day--today.day--focused:not(.day--empty):not(.day--disabled):not(.weekday-label)::after{opacity:1}.calendar-weekday>.weekday,.full-calendar__day>.calendar-day{display:flex;align-items:center;justify-content:center;position:absolute;top:5%;left:5%;width:90%;height:90%;color:currentColor;font-size:14px;pointer-events:none;z-index:1}.full-calendar__day.day--today{color:var(--app-datepicker-accent-color,#1a73e8)}.full-calendar__day.day--focused,.full-calendar__day.day--today.day--focused{color:var(--app-datepicker-focused-day-color,#fff)}.full-calendar__day.day--disabled>.calendar-day,.full-calendar__day.day--empty,.full-calendar__day.weekday-label{pointer-events:none}.full-calendar__day.day--disabled:not(.day--today){color:var(--app-datepicker-disabled-day-color,rgba(0,0,0,.55))}.year-list-view__list-item{position:relative;width:100%;padding:12px 16px;text-align:center}.year-list-view__list-item::after{content:'';position:absolute;top:0;left:0;width:100%;height:100%;background-color:var(--app-datepicker-focused-year-bg-color,#000);opacity:0;pointer-events:none}.year-list-view__list-item:focus::after{opacity:.05}.year-list-view__list-item.year--selected{color:var(--app-datepicker-accent-color,#1a73e8);font-size:24px;font-weight:500}@media (any-hover:hover){.btn__month-selector:hover,.year-list-view__list-item:hover{cursor:pointer}.full-calendar__day:not(.day--empty):not(.day--disabled):not(.day--focused):not(.weekday-label):hover::after{opacity:.15}.year-list-view__list-item:hover::after{opacity:.05}}@supports (background:-webkit-canvas(squares)){.calendar-container{padding:56px 16px 16px}table>caption{position:absolute;top:0;left:50%;transform:translate3d(-50%,0,0);will-change:transform}}"])))],(0,k.__decorate)([(0,T.Cb)({type:Number,reflect:!0})],Ae.prototype,"firstDayOfWeek",void 0),(0,k.__decorate)([(0,T.Cb)({type:Boolean,reflect:!0})],Ae.prototype,"showWeekNumber",void 0),(0,k.__decorate)([(0,T.Cb)({type:String,reflect:!0})],Ae.prototype,"weekNumberType",void 0),(0,k.__decorate)([(0,T.Cb)({type:Boolean,reflect:!0})],Ae.prototype,"landscape",void 0),(0,k.__decorate)([(0,T.Cb)({type:String,reflect:!0})],Ae.prototype,"startView",null),(0,k.__decorate)([(0,T.Cb)({type:String,reflect:!0})],Ae.prototype,"min",null),(0,k.__decorate)([(0,T.Cb)({type:String,reflect:!0})],Ae.prototype,"max",null),(0,k.__decorate)([(0,T.Cb)({type:String})],Ae.prototype,"value",null),(0,k.__decorate)([(0,T.Cb)({type:String})],Ae.prototype,"locale",void 0),(0,k.__decorate)([(0,T.Cb)({type:String})],Ae.prototype,"disabledDays",void 0),(0,k.__decorate)([(0,T.Cb)({type:String})],Ae.prototype,"disabledDates",void 0),(0,k.__decorate)([(0,T.Cb)({type:String})],Ae.prototype,"weekLabel",void 0),(0,k.__decorate)([(0,T.Cb)({type:Boolean})],Ae.prototype,"inline",void 0),(0,k.__decorate)([(0,T.Cb)({type:Number})],Ae.prototype,"dragRatio",void 0),(0,k.__decorate)([(0,T.Cb)({type:Date,attribute:!1})],Ae.prototype,"_selectedDate",void 0),(0,k.__decorate)([(0,T.Cb)({type:Date,attribute:!1})],Ae.prototype,"_focusedDate",void 0),(0,k.__decorate)([(0,T.Cb)({type:String,attribute:!1})],Ae.prototype,"_startView",void 0),(0,k.__decorate)([(0,T.IO)(".year-list-view__full-list")],Ae.prototype,"_yearViewFullList",void 0),(0,k.__decorate)([(0,T.IO)(".btn__year-selector")],Ae.prototype,"_buttonSelectorYear",void 0),(0,k.__decorate)([(0,T.IO)(".year-list-view__list-item")],Ae.prototype,"_yearViewListItem",void 0),(0,k.__decorate)([(0,T.hO)({passive:!0})],Ae.prototype,"_updateYear",null),(0,k.__decorate)([(0,T.hO)({passive:!0})],Ae.prototype,"_updateFocusedDateWithKeyboard",null),Pe="app-datepicker",Le=Ae,window.customElements&&!window.customElements.get(Pe)&&window.customElements.define(Pe,Le)},55020:function(e,t,a){a.d(t,{j:function(){return r}});var n={};function r(){return n}},5763:function(e,t,a){function n(e){var t=new Date(Date.UTC(e.getFullYear(),e.getMonth(),e.getDate(),e.getHours(),e.getMinutes(),e.getSeconds(),e.getMilliseconds()));return t.setUTCFullYear(e.getFullYear()),e.getTime()-t.getTime()}a.d(t,{Z:function(){return n}})},23682:function(e,t,a){a.d(t,{Z:function(){return n}});a(51467);function n(e,t){if(t.length<e)throw new TypeError(e+" argument"+(e>1?"s":"")+" required, but only "+t.length+" present")}},90394:function(e,t,a){a.d(t,{Z:function(){return n}});a(76843);function n(e){if(null===e||!0===e||!1===e)return NaN;var t=Number(e);return isNaN(t)?t:t<0?Math.ceil(t):Math.floor(t)}},93432:function(e,t,a){a.d(t,{Z:function(){return ee}});a(51467),a(91989),a(46349),a(70320),a(63789),a(18098),a(24074),a(76843),a(46798),a(94570);var n=a(56956),r=a(23682);var i=a(34327);function o(e){if((0,r.Z)(1,arguments),!function(e){return(0,r.Z)(1,arguments),e instanceof Date||"object"===(0,n.Z)(e)&&"[object Date]"===Object.prototype.toString.call(e)}(e)&&"number"!=typeof e)return!1;var t=(0,i.Z)(e);return!isNaN(Number(t))}var l=a(90394);function s(e,t){return(0,r.Z)(2,arguments),function(e,t){(0,r.Z)(2,arguments);var a=(0,i.Z)(e).getTime(),n=(0,l.Z)(t);return new Date(a+n)}(e,-(0,l.Z)(t))}function d(e){(0,r.Z)(1,arguments);var t=(0,i.Z)(e),a=t.getUTCDay(),n=(a<1?7:0)+a-1;return t.setUTCDate(t.getUTCDate()-n),t.setUTCHours(0,0,0,0),t}function u(e){(0,r.Z)(1,arguments);var t=(0,i.Z)(e),a=t.getUTCFullYear(),n=new Date(0);n.setUTCFullYear(a+1,0,4),n.setUTCHours(0,0,0,0);var o=d(n),l=new Date(0);l.setUTCFullYear(a,0,4),l.setUTCHours(0,0,0,0);var s=d(l);return t.getTime()>=o.getTime()?a+1:t.getTime()>=s.getTime()?a:a-1}function c(e){(0,r.Z)(1,arguments);var t=(0,i.Z)(e),a=d(t).getTime()-function(e){(0,r.Z)(1,arguments);var t=u(e),a=new Date(0);return a.setUTCFullYear(t,0,4),a.setUTCHours(0,0,0,0),d(a)}(t).getTime();return Math.round(a/6048e5)+1}var h=a(55020);function f(e,t){var a,n,o,s,d,u,c,f;(0,r.Z)(1,arguments);var m=(0,h.j)(),v=(0,l.Z)(null!==(a=null!==(n=null!==(o=null!==(s=null==t?void 0:t.weekStartsOn)&&void 0!==s?s:null==t||null===(d=t.locale)||void 0===d||null===(u=d.options)||void 0===u?void 0:u.weekStartsOn)&&void 0!==o?o:m.weekStartsOn)&&void 0!==n?n:null===(c=m.locale)||void 0===c||null===(f=c.options)||void 0===f?void 0:f.weekStartsOn)&&void 0!==a?a:0);if(!(v>=0&&v<=6))throw new RangeError("weekStartsOn must be between 0 and 6 inclusively");var y=(0,i.Z)(e),p=y.getUTCDay(),b=(p<v?7:0)+p-v;return y.setUTCDate(y.getUTCDate()-b),y.setUTCHours(0,0,0,0),y}function m(e,t){var a,n,o,s,d,u,c,m;(0,r.Z)(1,arguments);var v=(0,i.Z)(e),y=v.getUTCFullYear(),p=(0,h.j)(),b=(0,l.Z)(null!==(a=null!==(n=null!==(o=null!==(s=null==t?void 0:t.firstWeekContainsDate)&&void 0!==s?s:null==t||null===(d=t.locale)||void 0===d||null===(u=d.options)||void 0===u?void 0:u.firstWeekContainsDate)&&void 0!==o?o:p.firstWeekContainsDate)&&void 0!==n?n:null===(c=p.locale)||void 0===c||null===(m=c.options)||void 0===m?void 0:m.firstWeekContainsDate)&&void 0!==a?a:1);if(!(b>=1&&b<=7))throw new RangeError("firstWeekContainsDate must be between 1 and 7 inclusively");var g=new Date(0);g.setUTCFullYear(y+1,0,b),g.setUTCHours(0,0,0,0);var w=f(g,t),_=new Date(0);_.setUTCFullYear(y,0,b),_.setUTCHours(0,0,0,0);var k=f(_,t);return v.getTime()>=w.getTime()?y+1:v.getTime()>=k.getTime()?y:y-1}function v(e,t){(0,r.Z)(1,arguments);var a=(0,i.Z)(e),n=f(a,t).getTime()-function(e,t){var a,n,i,o,s,d,u,c;(0,r.Z)(1,arguments);var v=(0,h.j)(),y=(0,l.Z)(null!==(a=null!==(n=null!==(i=null!==(o=null==t?void 0:t.firstWeekContainsDate)&&void 0!==o?o:null==t||null===(s=t.locale)||void 0===s||null===(d=s.options)||void 0===d?void 0:d.firstWeekContainsDate)&&void 0!==i?i:v.firstWeekContainsDate)&&void 0!==n?n:null===(u=v.locale)||void 0===u||null===(c=u.options)||void 0===c?void 0:c.firstWeekContainsDate)&&void 0!==a?a:1),p=m(e,t),b=new Date(0);return b.setUTCFullYear(p,0,y),b.setUTCHours(0,0,0,0),f(b,t)}(a,t).getTime();return Math.round(n/6048e5)+1}function y(e,t){for(var a=e<0?"-":"",n=Math.abs(e).toString();n.length<t;)n="0"+n;return a+n}var p={y:function(e,t){var a=e.getUTCFullYear(),n=a>0?a:1-a;return y("yy"===t?n%100:n,t.length)},M:function(e,t){var a=e.getUTCMonth();return"M"===t?String(a+1):y(a+1,2)},d:function(e,t){return y(e.getUTCDate(),t.length)},a:function(e,t){var a=e.getUTCHours()/12>=1?"pm":"am";switch(t){case"a":case"aa":return a.toUpperCase();case"aaa":return a;case"aaaaa":return a[0];default:return"am"===a?"a.m.":"p.m."}},h:function(e,t){return y(e.getUTCHours()%12||12,t.length)},H:function(e,t){return y(e.getUTCHours(),t.length)},m:function(e,t){return y(e.getUTCMinutes(),t.length)},s:function(e,t){return y(e.getUTCSeconds(),t.length)},S:function(e,t){var a=t.length,n=e.getUTCMilliseconds();return y(Math.floor(n*Math.pow(10,a-3)),t.length)}},b="midnight",g="noon",w="morning",_="afternoon",k="evening",D="night",T={G:function(e,t,a){var n=e.getUTCFullYear()>0?1:0;switch(t){case"G":case"GG":case"GGG":return a.era(n,{width:"abbreviated"});case"GGGGG":return a.era(n,{width:"narrow"});default:return a.era(n,{width:"wide"})}},y:function(e,t,a){if("yo"===t){var n=e.getUTCFullYear(),r=n>0?n:1-n;return a.ordinalNumber(r,{unit:"year"})}return p.y(e,t)},Y:function(e,t,a,n){var r=m(e,n),i=r>0?r:1-r;return"YY"===t?y(i%100,2):"Yo"===t?a.ordinalNumber(i,{unit:"year"}):y(i,t.length)},R:function(e,t){return y(u(e),t.length)},u:function(e,t){return y(e.getUTCFullYear(),t.length)},Q:function(e,t,a){var n=Math.ceil((e.getUTCMonth()+1)/3);switch(t){case"Q":return String(n);case"QQ":return y(n,2);case"Qo":return a.ordinalNumber(n,{unit:"quarter"});case"QQQ":return a.quarter(n,{width:"abbreviated",context:"formatting"});case"QQQQQ":return a.quarter(n,{width:"narrow",context:"formatting"});default:return a.quarter(n,{width:"wide",context:"formatting"})}},q:function(e,t,a){var n=Math.ceil((e.getUTCMonth()+1)/3);switch(t){case"q":return String(n);case"qq":return y(n,2);case"qo":return a.ordinalNumber(n,{unit:"quarter"});case"qqq":return a.quarter(n,{width:"abbreviated",context:"standalone"});case"qqqqq":return a.quarter(n,{width:"narrow",context:"standalone"});default:return a.quarter(n,{width:"wide",context:"standalone"})}},M:function(e,t,a){var n=e.getUTCMonth();switch(t){case"M":case"MM":return p.M(e,t);case"Mo":return a.ordinalNumber(n+1,{unit:"month"});case"MMM":return a.month(n,{width:"abbreviated",context:"formatting"});case"MMMMM":return a.month(n,{width:"narrow",context:"formatting"});default:return a.month(n,{width:"wide",context:"formatting"})}},L:function(e,t,a){var n=e.getUTCMonth();switch(t){case"L":return String(n+1);case"LL":return y(n+1,2);case"Lo":return a.ordinalNumber(n+1,{unit:"month"});case"LLL":return a.month(n,{width:"abbreviated",context:"standalone"});case"LLLLL":return a.month(n,{width:"narrow",context:"standalone"});default:return a.month(n,{width:"wide",context:"standalone"})}},w:function(e,t,a,n){var r=v(e,n);return"wo"===t?a.ordinalNumber(r,{unit:"week"}):y(r,t.length)},I:function(e,t,a){var n=c(e);return"Io"===t?a.ordinalNumber(n,{unit:"week"}):y(n,t.length)},d:function(e,t,a){return"do"===t?a.ordinalNumber(e.getUTCDate(),{unit:"date"}):p.d(e,t)},D:function(e,t,a){var n=function(e){(0,r.Z)(1,arguments);var t=(0,i.Z)(e),a=t.getTime();t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0);var n=a-t.getTime();return Math.floor(n/864e5)+1}(e);return"Do"===t?a.ordinalNumber(n,{unit:"dayOfYear"}):y(n,t.length)},E:function(e,t,a){var n=e.getUTCDay();switch(t){case"E":case"EE":case"EEE":return a.day(n,{width:"abbreviated",context:"formatting"});case"EEEEE":return a.day(n,{width:"narrow",context:"formatting"});case"EEEEEE":return a.day(n,{width:"short",context:"formatting"});default:return a.day(n,{width:"wide",context:"formatting"})}},e:function(e,t,a,n){var r=e.getUTCDay(),i=(r-n.weekStartsOn+8)%7||7;switch(t){case"e":return String(i);case"ee":return y(i,2);case"eo":return a.ordinalNumber(i,{unit:"day"});case"eee":return a.day(r,{width:"abbreviated",context:"formatting"});case"eeeee":return a.day(r,{width:"narrow",context:"formatting"});case"eeeeee":return a.day(r,{width:"short",context:"formatting"});default:return a.day(r,{width:"wide",context:"formatting"})}},c:function(e,t,a,n){var r=e.getUTCDay(),i=(r-n.weekStartsOn+8)%7||7;switch(t){case"c":return String(i);case"cc":return y(i,t.length);case"co":return a.ordinalNumber(i,{unit:"day"});case"ccc":return a.day(r,{width:"abbreviated",context:"standalone"});case"ccccc":return a.day(r,{width:"narrow",context:"standalone"});case"cccccc":return a.day(r,{width:"short",context:"standalone"});default:return a.day(r,{width:"wide",context:"standalone"})}},i:function(e,t,a){var n=e.getUTCDay(),r=0===n?7:n;switch(t){case"i":return String(r);case"ii":return y(r,t.length);case"io":return a.ordinalNumber(r,{unit:"day"});case"iii":return a.day(n,{width:"abbreviated",context:"formatting"});case"iiiii":return a.day(n,{width:"narrow",context:"formatting"});case"iiiiii":return a.day(n,{width:"short",context:"formatting"});default:return a.day(n,{width:"wide",context:"formatting"})}},a:function(e,t,a){var n=e.getUTCHours()/12>=1?"pm":"am";switch(t){case"a":case"aa":return a.dayPeriod(n,{width:"abbreviated",context:"formatting"});case"aaa":return a.dayPeriod(n,{width:"abbreviated",context:"formatting"}).toLowerCase();case"aaaaa":return a.dayPeriod(n,{width:"narrow",context:"formatting"});default:return a.dayPeriod(n,{width:"wide",context:"formatting"})}},b:function(e,t,a){var n,r=e.getUTCHours();switch(n=12===r?g:0===r?b:r/12>=1?"pm":"am",t){case"b":case"bb":return a.dayPeriod(n,{width:"abbreviated",context:"formatting"});case"bbb":return a.dayPeriod(n,{width:"abbreviated",context:"formatting"}).toLowerCase();case"bbbbb":return a.dayPeriod(n,{width:"narrow",context:"formatting"});default:return a.dayPeriod(n,{width:"wide",context:"formatting"})}},B:function(e,t,a){var n,r=e.getUTCHours();switch(n=r>=17?k:r>=12?_:r>=4?w:D,t){case"B":case"BB":case"BBB":return a.dayPeriod(n,{width:"abbreviated",context:"formatting"});case"BBBBB":return a.dayPeriod(n,{width:"narrow",context:"formatting"});default:return a.dayPeriod(n,{width:"wide",context:"formatting"})}},h:function(e,t,a){if("ho"===t){var n=e.getUTCHours()%12;return 0===n&&(n=12),a.ordinalNumber(n,{unit:"hour"})}return p.h(e,t)},H:function(e,t,a){return"Ho"===t?a.ordinalNumber(e.getUTCHours(),{unit:"hour"}):p.H(e,t)},K:function(e,t,a){var n=e.getUTCHours()%12;return"Ko"===t?a.ordinalNumber(n,{unit:"hour"}):y(n,t.length)},k:function(e,t,a){var n=e.getUTCHours();return 0===n&&(n=24),"ko"===t?a.ordinalNumber(n,{unit:"hour"}):y(n,t.length)},m:function(e,t,a){return"mo"===t?a.ordinalNumber(e.getUTCMinutes(),{unit:"minute"}):p.m(e,t)},s:function(e,t,a){return"so"===t?a.ordinalNumber(e.getUTCSeconds(),{unit:"second"}):p.s(e,t)},S:function(e,t){return p.S(e,t)},X:function(e,t,a,n){var r=(n._originalDate||e).getTimezoneOffset();if(0===r)return"Z";switch(t){case"X":return x(r);case"XXXX":case"XX":return S(r);default:return S(r,":")}},x:function(e,t,a,n){var r=(n._originalDate||e).getTimezoneOffset();switch(t){case"x":return x(r);case"xxxx":case"xx":return S(r);default:return S(r,":")}},O:function(e,t,a,n){var r=(n._originalDate||e).getTimezoneOffset();switch(t){case"O":case"OO":case"OOO":return"GMT"+C(r,":");default:return"GMT"+S(r,":")}},z:function(e,t,a,n){var r=(n._originalDate||e).getTimezoneOffset();switch(t){case"z":case"zz":case"zzz":return"GMT"+C(r,":");default:return"GMT"+S(r,":")}},t:function(e,t,a,n){var r=n._originalDate||e;return y(Math.floor(r.getTime()/1e3),t.length)},T:function(e,t,a,n){return y((n._originalDate||e).getTime(),t.length)}};function C(e,t){var a=e>0?"-":"+",n=Math.abs(e),r=Math.floor(n/60),i=n%60;if(0===i)return a+String(r);var o=t||"";return a+String(r)+o+y(i,2)}function x(e,t){return e%60==0?(e>0?"-":"+")+y(Math.abs(e)/60,2):S(e,t)}function S(e,t){var a=t||"",n=e>0?"-":"+",r=Math.abs(e);return n+y(Math.floor(r/60),2)+a+y(r%60,2)}var M=T,U=function(e,t){switch(e){case"P":return t.date({width:"short"});case"PP":return t.date({width:"medium"});case"PPP":return t.date({width:"long"});default:return t.date({width:"full"})}},Z=function(e,t){switch(e){case"p":return t.time({width:"short"});case"pp":return t.time({width:"medium"});case"ppp":return t.time({width:"long"});default:return t.time({width:"full"})}},W={p:Z,P:function(e,t){var a,n=e.match(/(P+)(p+)?/)||[],r=n[1],i=n[2];if(!i)return U(e,t);switch(r){case"P":a=t.dateTime({width:"short"});break;case"PP":a=t.dateTime({width:"medium"});break;case"PPP":a=t.dateTime({width:"long"});break;default:a=t.dateTime({width:"full"})}return a.replace("{{date}}",U(r,t)).replace("{{time}}",Z(i,t))}},F=W,N=a(5763),Y=(a(56308),a(97393),["D","DD"]),E=["YY","YYYY"];function P(e,t,a){if("YYYY"===e)throw new RangeError("Use `yyyy` instead of `YYYY` (in `".concat(t,"`) for formatting years to the input `").concat(a,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"));if("YY"===e)throw new RangeError("Use `yy` instead of `YY` (in `".concat(t,"`) for formatting years to the input `").concat(a,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"));if("D"===e)throw new RangeError("Use `d` instead of `D` (in `".concat(t,"`) for formatting days of the month to the input `").concat(a,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"));if("DD"===e)throw new RangeError("Use `dd` instead of `DD` (in `".concat(t,"`) for formatting days of the month to the input `").concat(a,"`; see: https://github.com/date-fns/date-fns/blob/master/docs/unicodeTokens.md"))}var L={lessThanXSeconds:{one:"less than a second",other:"less than {{count}} seconds"},xSeconds:{one:"1 second",other:"{{count}} seconds"},halfAMinute:"half a minute",lessThanXMinutes:{one:"less than a minute",other:"less than {{count}} minutes"},xMinutes:{one:"1 minute",other:"{{count}} minutes"},aboutXHours:{one:"about 1 hour",other:"about {{count}} hours"},xHours:{one:"1 hour",other:"{{count}} hours"},xDays:{one:"1 day",other:"{{count}} days"},aboutXWeeks:{one:"about 1 week",other:"about {{count}} weeks"},xWeeks:{one:"1 week",other:"{{count}} weeks"},aboutXMonths:{one:"about 1 month",other:"about {{count}} months"},xMonths:{one:"1 month",other:"{{count}} months"},aboutXYears:{one:"about 1 year",other:"about {{count}} years"},xYears:{one:"1 year",other:"{{count}} years"},overXYears:{one:"over 1 year",other:"over {{count}} years"},almostXYears:{one:"almost 1 year",other:"almost {{count}} years"}},O=function(e,t,a){var n,r=L[e];return n="string"==typeof r?r:1===t?r.one:r.other.replace("{{count}}",t.toString()),null!=a&&a.addSuffix?a.comparison&&a.comparison>0?"in "+n:n+" ago":n};function A(e){return function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},a=t.width?String(t.width):e.defaultWidth;return e.formats[a]||e.formats[e.defaultWidth]}}var j={date:A({formats:{full:"EEEE, MMMM do, y",long:"MMMM do, y",medium:"MMM d, y",short:"MM/dd/yyyy"},defaultWidth:"full"}),time:A({formats:{full:"h:mm:ss a zzzz",long:"h:mm:ss a z",medium:"h:mm:ss a",short:"h:mm a"},defaultWidth:"full"}),dateTime:A({formats:{full:"{{date}} 'at' {{time}}",long:"{{date}} 'at' {{time}}",medium:"{{date}}, {{time}}",short:"{{date}}, {{time}}"},defaultWidth:"full"})},q={lastWeek:"'last' eeee 'at' p",yesterday:"'yesterday at' p",today:"'today at' p",tomorrow:"'tomorrow at' p",nextWeek:"eeee 'at' p",other:"P"},z=function(e,t,a,n){return q[e]};a(51358),a(98490);function H(e){return function(t,a){var n;if("formatting"===(null!=a&&a.context?String(a.context):"standalone")&&e.formattingValues){var r=e.defaultFormattingWidth||e.defaultWidth,i=null!=a&&a.width?String(a.width):r;n=e.formattingValues[i]||e.formattingValues[r]}else{var o=e.defaultWidth,l=null!=a&&a.width?String(a.width):e.defaultWidth;n=e.values[l]||e.values[o]}return n[e.argumentCallback?e.argumentCallback(t):t]}}var V={ordinalNumber:function(e,t){var a=Number(e),n=a%100;if(n>20||n<10)switch(n%10){case 1:return a+"st";case 2:return a+"nd";case 3:return a+"rd"}return a+"th"},era:H({values:{narrow:["B","A"],abbreviated:["BC","AD"],wide:["Before Christ","Anno Domini"]},defaultWidth:"wide"}),quarter:H({values:{narrow:["1","2","3","4"],abbreviated:["Q1","Q2","Q3","Q4"],wide:["1st quarter","2nd quarter","3rd quarter","4th quarter"]},defaultWidth:"wide",argumentCallback:function(e){return e-1}}),month:H({values:{narrow:["J","F","M","A","M","J","J","A","S","O","N","D"],abbreviated:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],wide:["January","February","March","April","May","June","July","August","September","October","November","December"]},defaultWidth:"wide"}),day:H({values:{narrow:["S","M","T","W","T","F","S"],short:["Su","Mo","Tu","We","Th","Fr","Sa"],abbreviated:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],wide:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]},defaultWidth:"wide"}),dayPeriod:H({values:{narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"morning",afternoon:"afternoon",evening:"evening",night:"night"}},defaultWidth:"wide",formattingValues:{narrow:{am:"a",pm:"p",midnight:"mi",noon:"n",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},abbreviated:{am:"AM",pm:"PM",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"},wide:{am:"a.m.",pm:"p.m.",midnight:"midnight",noon:"noon",morning:"in the morning",afternoon:"in the afternoon",evening:"in the evening",night:"at night"}},defaultFormattingWidth:"wide"})};a(27392),a(99397),a(17692);function R(e){return function(t){var a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=a.width,r=n&&e.matchPatterns[n]||e.matchPatterns[e.defaultMatchWidth],i=t.match(r);if(!i)return null;var o,l=i[0],s=n&&e.parsePatterns[n]||e.parsePatterns[e.defaultParseWidth],d=Array.isArray(s)?function(e,t){for(var a=0;a<e.length;a++)if(t(e[a]))return a;return}(s,(function(e){return e.test(l)})):function(e,t){for(var a in e)if(e.hasOwnProperty(a)&&t(e[a]))return a;return}(s,(function(e){return e.test(l)}));return o=e.valueCallback?e.valueCallback(d):d,{value:o=a.valueCallback?a.valueCallback(o):o,rest:t.slice(l.length)}}}var I,X={ordinalNumber:(I={matchPattern:/^(\d+)(th|st|nd|rd)?/i,parsePattern:/\d+/i,valueCallback:function(e){return parseInt(e,10)}},function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},a=e.match(I.matchPattern);if(!a)return null;var n=a[0],r=e.match(I.parsePattern);if(!r)return null;var i=I.valueCallback?I.valueCallback(r[0]):r[0];return{value:i=t.valueCallback?t.valueCallback(i):i,rest:e.slice(n.length)}}),era:R({matchPatterns:{narrow:/^(b|a)/i,abbreviated:/^(b\.?\s?c\.?|b\.?\s?c\.?\s?e\.?|a\.?\s?d\.?|c\.?\s?e\.?)/i,wide:/^(before christ|before common era|anno domini|common era)/i},defaultMatchWidth:"wide",parsePatterns:{any:[/^b/i,/^(a|c)/i]},defaultParseWidth:"any"}),quarter:R({matchPatterns:{narrow:/^[1234]/i,abbreviated:/^q[1234]/i,wide:/^[1234](th|st|nd|rd)? quarter/i},defaultMatchWidth:"wide",parsePatterns:{any:[/1/i,/2/i,/3/i,/4/i]},defaultParseWidth:"any",valueCallback:function(e){return e+1}}),month:R({matchPatterns:{narrow:/^[jfmasond]/i,abbreviated:/^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)/i,wide:/^(january|february|march|april|may|june|july|august|september|october|november|december)/i},defaultMatchWidth:"wide",parsePatterns:{narrow:[/^j/i,/^f/i,/^m/i,/^a/i,/^m/i,/^j/i,/^j/i,/^a/i,/^s/i,/^o/i,/^n/i,/^d/i],any:[/^ja/i,/^f/i,/^mar/i,/^ap/i,/^may/i,/^jun/i,/^jul/i,/^au/i,/^s/i,/^o/i,/^n/i,/^d/i]},defaultParseWidth:"any"}),day:R({matchPatterns:{narrow:/^[smtwf]/i,short:/^(su|mo|tu|we|th|fr|sa)/i,abbreviated:/^(sun|mon|tue|wed|thu|fri|sat)/i,wide:/^(sunday|monday|tuesday|wednesday|thursday|friday|saturday)/i},defaultMatchWidth:"wide",parsePatterns:{narrow:[/^s/i,/^m/i,/^t/i,/^w/i,/^t/i,/^f/i,/^s/i],any:[/^su/i,/^m/i,/^tu/i,/^w/i,/^th/i,/^f/i,/^sa/i]},defaultParseWidth:"any"}),dayPeriod:R({matchPatterns:{narrow:/^(a|p|mi|n|(in the|at) (morning|afternoon|evening|night))/i,any:/^([ap]\.?\s?m\.?|midnight|noon|(in the|at) (morning|afternoon|evening|night))/i},defaultMatchWidth:"any",parsePatterns:{any:{am:/^a/i,pm:/^p/i,midnight:/^mi/i,noon:/^no/i,morning:/morning/i,afternoon:/afternoon/i,evening:/evening/i,night:/night/i}},defaultParseWidth:"any"})},B={code:"en-US",formatDistance:O,formatLong:j,formatRelative:z,localize:V,match:X,options:{weekStartsOn:0,firstWeekContainsDate:1}},G=/[yYQqMLwIdDecihHKkms]o|(\w)\1*|''|'(''|[^'])+('|$)|./g,J=/P+p+|P+|p+|''|'(''|[^'])+('|$)|./g,Q=/^'([^]*?)'?$/,K=/''/g,$=/[a-zA-Z]/;function ee(e,t,a){var n,d,u,c,f,m,v,y,p,b,g,w,_,k,D,T,C,x;(0,r.Z)(2,arguments);var S=String(t),U=(0,h.j)(),Z=null!==(n=null!==(d=null==a?void 0:a.locale)&&void 0!==d?d:U.locale)&&void 0!==n?n:B,W=(0,l.Z)(null!==(u=null!==(c=null!==(f=null!==(m=null==a?void 0:a.firstWeekContainsDate)&&void 0!==m?m:null==a||null===(v=a.locale)||void 0===v||null===(y=v.options)||void 0===y?void 0:y.firstWeekContainsDate)&&void 0!==f?f:U.firstWeekContainsDate)&&void 0!==c?c:null===(p=U.locale)||void 0===p||null===(b=p.options)||void 0===b?void 0:b.firstWeekContainsDate)&&void 0!==u?u:1);if(!(W>=1&&W<=7))throw new RangeError("firstWeekContainsDate must be between 1 and 7 inclusively");var L=(0,l.Z)(null!==(g=null!==(w=null!==(_=null!==(k=null==a?void 0:a.weekStartsOn)&&void 0!==k?k:null==a||null===(D=a.locale)||void 0===D||null===(T=D.options)||void 0===T?void 0:T.weekStartsOn)&&void 0!==_?_:U.weekStartsOn)&&void 0!==w?w:null===(C=U.locale)||void 0===C||null===(x=C.options)||void 0===x?void 0:x.weekStartsOn)&&void 0!==g?g:0);if(!(L>=0&&L<=6))throw new RangeError("weekStartsOn must be between 0 and 6 inclusively");if(!Z.localize)throw new RangeError("locale must contain localize property");if(!Z.formatLong)throw new RangeError("locale must contain formatLong property");var O=(0,i.Z)(e);if(!o(O))throw new RangeError("Invalid time value");var A=s(O,(0,N.Z)(O)),j={firstWeekContainsDate:W,weekStartsOn:L,locale:Z,_originalDate:O};return S.match(J).map((function(e){var t=e[0];return"p"===t||"P"===t?(0,F[t])(e,Z.formatLong):e})).join("").match(G).map((function(n){if("''"===n)return"'";var r=n[0];if("'"===r)return function(e){var t=e.match(Q);if(!t)return e;return t[1].replace(K,"'")}(n);var i,o=M[r];if(o)return null!=a&&a.useAdditionalWeekYearTokens||(i=n,-1===E.indexOf(i))||P(n,t,String(e)),null!=a&&a.useAdditionalDayOfYearTokens||!function(e){return-1!==Y.indexOf(e)}(n)||P(n,t,String(e)),o(A,n,Z.localize,j);if(r.match($))throw new RangeError("Format string contains an unescaped latin alphabet character `"+r+"`");return n})).join("")}},34327:function(e,t,a){a.d(t,{Z:function(){return i}});a(46798),a(94570),a(51467);var n=a(56956),r=a(23682);function i(e){(0,r.Z)(1,arguments);var t=Object.prototype.toString.call(e);return e instanceof Date||"object"===(0,n.Z)(e)&&"[object Date]"===t?new Date(e.getTime()):"number"==typeof e||"[object Number]"===t?new Date(e):("string"!=typeof e&&"[object String]"!==t||"undefined"==typeof console||(console.warn("Starting with v2.0.0-beta.1 date-fns doesn't accept strings as date arguments. Please use `parseISO` to parse strings. See: https://github.com/date-fns/date-fns/blob/master/docs/upgradeGuide.md#string-arguments"),console.warn((new Error).stack)),new Date(NaN))}},93892:function(e,t,a){var n=a(97673),r=a(11336),i=a(43313),o=RangeError;e.exports=function(e){var t=r(i(this)),a="",l=n(e);if(l<0||l===1/0)throw new o("Wrong number of repetitions");for(;l>0;(l>>>=1)&&(t+=t))1&l&&(a+=t);return a}},95818:function(e,t,a){a(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{MIN_SAFE_INTEGER:-9007199254740991})},5110:function(e,t,a){var n=a(68077),r=a(55418),i=a(97673),o=a(29191),l=a(93892),s=a(18431),d=RangeError,u=String,c=Math.floor,h=r(l),f=r("".slice),m=r(1..toFixed),v=function(e,t,a){return 0===t?a:t%2==1?v(e,t-1,a*e):v(e*e,t/2,a)},y=function(e,t,a){for(var n=-1,r=a;++n<6;)r+=t*e[n],e[n]=r%1e7,r=c(r/1e7)},p=function(e,t){for(var a=6,n=0;--a>=0;)n+=e[a],e[a]=c(n/t),n=n%t*1e7},b=function(e){for(var t=6,a="";--t>=0;)if(""!==a||0===t||0!==e[t]){var n=u(e[t]);a=""===a?n:a+h("0",7-n.length)+n}return a};n({target:"Number",proto:!0,forced:s((function(){return"0.000"!==m(8e-5,3)||"1"!==m(.9,0)||"1.25"!==m(1.255,2)||"1000000000000000128"!==m(0xde0b6b3a7640080,0)}))||!s((function(){m({})}))},{toFixed:function(e){var t,a,n,r,l=o(this),s=i(e),c=[0,0,0,0,0,0],m="",g="0";if(s<0||s>20)throw new d("Incorrect fraction digits");if(l!=l)return"NaN";if(l<=-1e21||l>=1e21)return u(l);if(l<0&&(m="-",l=-l),l>1e-21)if(a=(t=function(e){for(var t=0,a=e;a>=4096;)t+=12,a/=4096;for(;a>=2;)t+=1,a/=2;return t}(l*v(2,69,1))-69)<0?l*v(2,-t,1):l/v(2,t,1),a*=4503599627370496,(t=52-t)>0){for(y(c,0,a),n=s;n>=7;)y(c,1e7,0),n-=7;for(y(c,v(10,n,1),0),n=t-1;n>=23;)p(c,1<<23),n-=23;p(c,1<<n),y(c,1,1),p(c,2),g=b(c)}else y(c,0,a),y(c,1<<-t,0),g=b(c)+h("0",s);return g=s>0?m+((r=g.length)<=s?"0."+h("0",s-r)+g:f(g,0,r-s)+"."+f(g,r-s)):m+g}})},54299:function(e,t,a){var n=a(68077),r=a(43173);n({target:"URL",proto:!0,enumerable:!0},{toJSON:function(){return r(URL.prototype.toString,this)}})},56956:function(e,t,a){a.d(t,{Z:function(){return n}});a(94738),a(98214),a(46798),a(20254),a(51358),a(5239),a(98490);function n(e){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},n(e)}},99266:function(e,t,a){a.d(t,{r:function(){return m}});var n=a(62746),r=a(40039),i=a(71650),o=a(33368),l=a(95281),s=a(68308),d=a(69205),u=(a(51358),a(96043),a(46798),a(5239),a(98490),a(51467),a(32982)),c=a(16616),h=a(41005),f=function(e,t,a){for(var n=new Map,r=t;r<=a;r++)n.set(e[r],r);return n},m=(0,c.XM)(function(e){function t(e){var a;if((0,i.Z)(this,t),a=(0,s.Z)(this,t,[e]),e.type!==c.pX.CHILD)throw Error("repeat() can only be used in text expressions");return(0,l.Z)(a)}return(0,d.Z)(t,e),(0,o.Z)(t,[{key:"ct",value:function(e,t,a){var n;void 0===a?a=t:void 0!==t&&(n=t);var i,o=[],l=[],s=0,d=(0,r.Z)(e);try{for(d.s();!(i=d.n()).done;){var u=i.value;o[s]=n?n(u,s):s,l[s]=a(u,s),s++}}catch(c){d.e(c)}finally{d.f()}return{values:l,keys:o}}},{key:"render",value:function(e,t,a){return this.ct(e,t,a).values}},{key:"update",value:function(e,t){var a,r=(0,n.Z)(t,3),i=r[0],o=r[1],l=r[2],s=(0,h.i9)(e),d=this.ct(i,o,l),c=d.values,m=d.keys;if(!Array.isArray(s))return this.ut=m,c;for(var v,y,p=null!==(a=this.ut)&&void 0!==a?a:this.ut=[],b=[],g=0,w=s.length-1,_=0,k=c.length-1;g<=w&&_<=k;)if(null===s[g])g++;else if(null===s[w])w--;else if(p[g]===m[_])b[_]=(0,h.fk)(s[g],c[_]),g++,_++;else if(p[w]===m[k])b[k]=(0,h.fk)(s[w],c[k]),w--,k--;else if(p[g]===m[k])b[k]=(0,h.fk)(s[g],c[k]),(0,h._Y)(e,b[k+1],s[g]),g++,k--;else if(p[w]===m[_])b[_]=(0,h.fk)(s[w],c[_]),(0,h._Y)(e,s[g],s[w]),w--,_++;else if(void 0===v&&(v=f(m,_,k),y=f(p,g,w)),v.has(p[g]))if(v.has(p[w])){var D=y.get(m[_]),T=void 0!==D?s[D]:null;if(null===T){var C=(0,h._Y)(e,s[g]);(0,h.fk)(C,c[_]),b[_]=C}else b[_]=(0,h.fk)(T,c[_]),(0,h._Y)(e,s[g],T),s[D]=null;_++}else(0,h.ws)(s[w]),w--;else(0,h.ws)(s[g]),g++;for(;_<=k;){var x=(0,h._Y)(e,b[k+1]);(0,h.fk)(x,c[_]),b[_++]=x}for(;g<=w;){var S=s[g++];null!==S&&(0,h.ws)(S)}return this.ut=m,(0,h.hl)(e,b),u.Jb}}]),t}(c.Xe))}}]);
+//# sourceMappingURL=1303.IExF4a4KLPU.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1318],{61318:function(o,t,n){n.r(t),n.d(t,{HaIconButtonToggle:function(){return f}});var r,e=n(88962),i=n(33368),c=n(71650),a=n(68308),s=n(82390),u=n(69205),l=n(91808),b=(n(97393),n(5095)),d=n(95260),p=n(54371),f=(0,l.Z)([(0,d.Mo)("ha-icon-button-toggle")],(function(o,t){var n=function(t){function n(){var t;(0,c.Z)(this,n);for(var r=arguments.length,e=new Array(r),i=0;i<r;i++)e[i]=arguments[i];return t=(0,a.Z)(this,n,[].concat(e)),o((0,s.Z)(t)),t}return(0,u.Z)(n,t),(0,i.Z)(n)}(t);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({type:Boolean,reflect:!0})],key:"selected",value:function(){return!1}},{kind:"get",static:!0,key:"styles",value:function(){return(0,b.iv)(r||(r=(0,e.Z)([':host{position:relative}mwc-icon-button{position:relative;transition:color 180ms ease-in-out}mwc-icon-button::before{opacity:0;transition:opacity 180ms ease-in-out;background-color:var(--primary-text-color);border-radius:20px;height:40px;width:40px;content:"";position:absolute;top:-10px;left:-10px;bottom:-10px;right:-10px;margin:auto;box-sizing:border-box}:host([border-only]) mwc-icon-button::before{background-color:transparent;border:2px solid var(--primary-text-color)}:host([selected]) mwc-icon-button{color:var(--primary-background-color)}:host([selected]:not([disabled])) mwc-icon-button::before{opacity:1}'])))}}]}}),p.HaIconButton)}}]);
+//# sourceMappingURL=1318.5_cxq66QzzY.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1336],{58135:function(n,e,t){t.d(e,{z:function(){return r}});t(40271),t(60163);var r=function(n){return function(e,t){return n.includes(e,t)}}},58664:function(n,e,t){t.d(e,{v:function(){return c}});t(40271);var r=t(21157),o=t(36655);function c(n,e){var t=(0,o.M)(n.entity_id),c=void 0!==e?e:null==n?void 0:n.state;if(["button","event","input_button","scene"].includes(t))return c!==r.nZ;if((0,r.rk)(c))return!1;if(c===r.PX&&"alert"!==t)return!1;switch(t){case"alarm_control_panel":return"disarmed"!==c;case"alert":return"idle"!==c;case"cover":case"valve":return"closed"!==c;case"device_tracker":case"person":return"not_home"!==c;case"lawn_mower":return["mowing","error"].includes(c);case"lock":return"locked"!==c;case"media_player":return"standby"!==c;case"vacuum":return!["idle","docked","paused"].includes(c);case"plant":return"problem"===c;case"group":return["on","home","open","locked","problem"].includes(c);case"timer":return"active"===c;case"camera":return"streaming"===c}return!0}},92599:function(n,e,t){t.d(e,{iI:function(){return o},oT:function(){return r}});t(99312),t(81043),t(83609),t(97393),t(46349),t(70320),t(22859),t(85717),t(46798),t(47084),t(88770),t(40271),t(60163),t(2094),"".concat(location.protocol,"//").concat(location.host);var r=function(n){return n.map((function(n){if("string"!==n.type)return n;switch(n.name){case"username":return Object.assign(Object.assign({},n),{},{autocomplete:"username"});case"password":return Object.assign(Object.assign({},n),{},{autocomplete:"current-password"});case"code":return Object.assign(Object.assign({},n),{},{autocomplete:"one-time-code"});default:return n}}))},o=function(n,e){return n.callWS({type:"auth/sign_path",path:e})}},21157:function(n,e,t){t.d(e,{PX:function(){return u},V_:function(){return a},nZ:function(){return o},rk:function(){return s}});var r=t(58135),o="unavailable",c="unknown",u="off",a=[o,c],i=[o,c,u],s=(0,r.z)(a);(0,r.z)(i)},75325:function(n,e,t){var r=t(68360);n.exports=/Version\/10(?:\.\d+){1,2}(?: [\w./]+)?(?: Mobile\/\w+)? Safari\//.test(r)},86558:function(n,e,t){var r=t(55418),o=t(97142),c=t(11336),u=t(93892),a=t(43313),i=r(u),s=r("".slice),l=Math.ceil,f=function(n){return function(e,t,r){var u,f,d=c(a(e)),p=o(t),v=d.length,m=void 0===r?" ":c(r);return p<=v||""===m?d:((f=i(m,l((u=p-v)/m.length))).length>u&&(f=s(f,0,u)),n?d+f:f+d)}};n.exports={start:f(!1),end:f(!0)}},93892:function(n,e,t){var r=t(97673),o=t(11336),c=t(43313),u=RangeError;n.exports=function(n){var e=o(c(this)),t="",a=r(n);if(a<0||a===1/0)throw new u("Wrong number of repetitions");for(;a>0;(a>>>=1)&&(e+=e))1&a&&(t+=e);return t}},73314:function(n,e,t){var r=t(68077),o=t(86558).start;r({target:"String",proto:!0,forced:t(75325)},{padStart:function(n){return o(this,n,arguments.length>1?arguments[1]:void 0)}})},7179:function(n,e,t){t(68077)({target:"String",proto:!0},{repeat:t(93892)})}}]);
+//# sourceMappingURL=1336.Fy4Hytu44Hc.js.map
\ No newline at end of file
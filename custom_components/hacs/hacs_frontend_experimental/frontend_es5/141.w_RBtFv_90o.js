@@ -0,0 +1,3 @@
+/*! For license information please see 141.w_RBtFv_90o.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[141],{86089:function(e,t,i){i.d(t,{U:function(){return n}});var n=function(e){return e.stopPropagation()}},25551:function(e,t,i){i.d(t,{u:function(){return a}});var n=i(14516),a=function(e,t){try{var i,n;return null!==(i=null===(n=o(t))||void 0===n?void 0:n.of(e))&&void 0!==i?i:e}catch(a){return e}},o=(0,n.Z)((function(e){return Intl&&"DisplayNames"in Intl?new Intl.DisplayNames(e.language,{type:"language",fallback:"code"}):void 0}))},32723:function(e,t,i){i.d(t,{b:function(){return o}});i(62746);var n=i(46097);i(34997),i(46798),i(9849),i(12148),i(85717),i(41353);function a(e,t,i){return t.reduce((function(e,t,n,a){if(void 0!==e){if(!e[t]&&i){var o=a[n+1];e[t]=void 0===o||"number"==typeof o?[]:{}}return e[t]}}),e)}function o(e,t,i,o,r){var s=Array.isArray(e)?(0,n.Z)(e):Object.assign({},e),l=o?a(s,o):s,c=r?a(s,r,!0):s;if(!Array.isArray(l)||!Array.isArray(c))return e;var d=l.splice(t,1)[0];return c.splice(i,0,d),s}},95352:function(e,t,i){var n,a,o,r,s=i(88962),l=i(33368),c=i(71650),d=i(68308),u=i(82390),h=i(69205),v=i(91808),f=i(34541),p=i(47838),b=(i(97393),i(85472),i(46798),i(9849),i(90126),i(22859),i(46349),i(70320),i(5095)),k=i(95260),g=i(18394),m=i(86089),y=i(25551),_=(i(46097),i(85717),i(90532),i(71133),"preferred"),Z="last_used";(0,v.Z)([(0,k.Mo)("ha-assist-pipeline-picker")],(function(e,t){var i=function(t){function i(){var t;(0,c.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,d.Z)(this,i,[].concat(a)),e((0,u.Z)(t)),t}return(0,h.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,k.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"includeLastUsed",value:function(){return!1}},{kind:"field",decorators:[(0,k.SB)()],key:"_pipelines",value:void 0},{kind:"field",decorators:[(0,k.SB)()],key:"_preferredPipeline",value:function(){return null}},{kind:"get",key:"_default",value:function(){return this.includeLastUsed?Z:_}},{kind:"method",key:"render",value:function(){var e,t,i=this;if(!this._pipelines)return b.Ld;var r=null!==(e=this.value)&&void 0!==e?e:this._default;return(0,b.dy)(n||(n=(0,s.Z)([' <ha-select .label="','" .value="','" .required="','" .disabled="','" @selected="','" @closed="','" fixedMenuPosition naturalMenuWidth> ',' <ha-list-item .value="','"> '," </ha-list-item> "," </ha-select> "])),this.label||this.hass.localize("ui.components.pipeline-picker.pipeline"),r,this.required,this.disabled,this._changed,m.U,this.includeLastUsed?(0,b.dy)(a||(a=(0,s.Z)([' <ha-list-item .value="','"> '," </ha-list-item> "])),Z,this.hass.localize("ui.components.pipeline-picker.last_used")):null,_,this.hass.localize("ui.components.pipeline-picker.preferred",{preferred:null===(t=this._pipelines.find((function(e){return e.id===i._preferredPipeline})))||void 0===t?void 0:t.name}),this._pipelines.map((function(e){return(0,b.dy)(o||(o=(0,s.Z)(['<ha-list-item .value="','"> '," (",") </ha-list-item>"])),e.id,e.name,(0,y.u)(e.language,i.hass.locale))})))}},{kind:"method",key:"firstUpdated",value:function(e){var t,n=this;(0,f.Z)((0,p.Z)(i.prototype),"firstUpdated",this).call(this,e),(t=this.hass,t.callWS({type:"assist_pipeline/pipeline/list"})).then((function(e){n._pipelines=e.pipelines,n._preferredPipeline=e.preferred_pipeline}))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,b.iv)(r||(r=(0,s.Z)(["ha-select{width:100%}"])))}},{kind:"method",key:"_changed",value:function(e){var t=e.target;!this.hass||""===t.value||t.value===this.value||void 0===this.value&&t.value===this._default||(this.value=t.value===this._default?void 0:t.value,(0,g.B)(this,"value-changed",{value:this.value}))}}]}}),b.oi)},47322:function(e,t,i){var n=i(40039),a=i(62746),o=i(99312),r=i(81043),s=i(33368),l=i(71650),c=i(68308),d=i(82390),u=i(69205),h=i(91808),v=i(88962),f=(i(97393),i(46349),i(70320),i(82073),i(85717),i(87438),i(46798),i(9849),i(22890),i(51358),i(47084),i(5239),i(98490),i(96043),i(36513),i(50289),i(94167),i(40271),i(60163),i(44577),i(5095)),p=i(95260),b=i(18394),k=(i(63789),i(24074),function(e){return e.replace(/^_*(.)|_+(.)/g,(function(e,t,i){return t?t.toUpperCase():" "+i.toUpperCase()}))});i(16591);var g,m,y,_=[],Z=function(e){return(0,f.dy)(g||(g=(0,v.Z)([' <mwc-list-item graphic="icon" .twoline="','"> <ha-icon .icon="','" slot="graphic"></ha-icon> <span>','</span> <span slot="secondary">',"</span> </mwc-list-item> "])),!!e.title,e.icon,e.title||e.path,e.path)},x=function(e,t,i){var n,a,o;return{path:"/".concat(e,"/").concat(null!==(n=t.path)&&void 0!==n?n:i),icon:null!==(a=t.icon)&&void 0!==a?a:"mdi:view-compact",title:null!==(o=t.title)&&void 0!==o?o:t.path?k(t.path):"".concat(i)}},C=function(e,t){var i;return{path:"/".concat(t.url_path),icon:null!==(i=t.icon)&&void 0!==i?i:"mdi:view-dashboard",title:t.url_path===e.defaultPanel?e.localize("panel.states"):e.localize("panel.".concat(t.title))||t.title||(t.url_path?k(t.url_path):"")}};(0,h.Z)([(0,p.Mo)("ha-navigation-picker")],(function(e,t){var i,h,k=function(t){function i(){var t;(0,l.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,c.Z)(this,i,[].concat(a)),e((0,d.Z)(t)),t}return(0,u.Z)(i,t),(0,s.Z)(i)}(t);return{F:k,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,p.SB)()],key:"_opened",value:function(){return!1}},{kind:"field",key:"navigationItemsLoaded",value:function(){return!1}},{kind:"field",key:"navigationItems",value:function(){return _}},{kind:"field",decorators:[(0,p.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"render",value:function(){return(0,f.dy)(m||(m=(0,v.Z)([' <ha-combo-box .hass="','" item-value-path="path" item-label-path="path" .value="','" allow-custom-value .filteredItems="','" .label="','" .helper="','" .disabled="','" .required="','" .renderer="','" @opened-changed="','" @value-changed="','" @filter-changed="','"> </ha-combo-box> '])),this.hass,this._value,this.navigationItems,this.label,this.helper,this.disabled,this.required,Z,this._openedChanged,this._valueChanged,this._filterChanged)}},{kind:"method",key:"_openedChanged",value:(h=(0,r.Z)((0,o.Z)().mark((function e(t){return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:this._opened=t.detail.value,this._opened&&!this.navigationItemsLoaded&&this._loadNavigationItems();case 2:case"end":return e.stop()}}),e,this)}))),function(e){return h.apply(this,arguments)})},{kind:"method",key:"_loadNavigationItems",value:(i=(0,r.Z)((0,o.Z)().mark((function e(){var t,i,r,s,l,c,d,u=this;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return this.navigationItemsLoaded=!0,t=Object.entries(this.hass.panels).map((function(e){var t=(0,a.Z)(e,2),i=t[0],n=t[1];return Object.assign({id:i},n)})),i=t.filter((function(e){return"lovelace"===e.component_name})),e.next=5,Promise.all(i.map((function(e){return(t=u.hass.connection,i="lovelace"===e.url_path?null:e.url_path,n=!0,t.sendMessagePromise({type:"lovelace/config",url_path:i,force:n})).then((function(t){return[e.id,t]})).catch((function(t){return[e.id,void 0]}));var t,i,n})));case 5:r=e.sent,s=new Map(r),this.navigationItems=[],l=(0,n.Z)(t),e.prev=9,d=(0,o.Z)().mark((function e(){var t,i;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t=c.value,u.navigationItems.push(C(u.hass,t)),(i=s.get(t.id))&&"views"in i){e.next=5;break}return e.abrupt("return",1);case 5:i.views.forEach((function(e,i){return u.navigationItems.push(x(t.url_path,e,i))}));case 6:case"end":return e.stop()}}),e)})),l.s();case 12:if((c=l.n()).done){e.next=18;break}return e.delegateYield(d(),"t0",14);case 14:if(!e.t0){e.next=16;break}return e.abrupt("continue",16);case 16:e.next=12;break;case 18:e.next=23;break;case 20:e.prev=20,e.t1=e.catch(9),l.e(e.t1);case 23:return e.prev=23,l.f(),e.finish(23);case 26:this.comboBox.filteredItems=this.navigationItems;case 27:case"end":return e.stop()}}),e,this,[[9,20,23,26]])}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"shouldUpdate",value:function(e){return!this._opened||e.has("_opened")}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation(),this._setValue(e.detail.value)}},{kind:"method",key:"_setValue",value:function(e){this.value=e,(0,b.B)(this,"value-changed",{value:this._value},{bubbles:!1,composed:!1})}},{kind:"method",key:"_filterChanged",value:function(e){var t=e.detail.value.toLowerCase();if(t.length>=2){var i=[];this.navigationItems.forEach((function(e){(e.path.toLowerCase().includes(t)||e.title.toLowerCase().includes(t))&&i.push(e)})),i.length>0?this.comboBox.filteredItems=i:this.comboBox.filteredItems=[]}else this.comboBox.filteredItems=this.navigationItems}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"get",static:!0,key:"styles",value:function(){return(0,f.iv)(y||(y=(0,v.Z)(["ha-icon,ha-svg-icon{color:var(--primary-text-color);position:relative;bottom:0px}[slot=prefix]{margin-right:8px}"])))}}]}}),f.oi)},71133:function(e,t,i){var n,a,o,r,s=i(99312),l=i(81043),c=i(88962),d=i(33368),u=i(71650),h=i(68308),v=i(82390),f=i(69205),p=i(91808),b=i(34541),k=i(47838),g=(i(97393),i(49412)),m=i(3762),y=i(5095),_=i(95260),Z=i(72218),x=i(2537);i(54371),(0,p.Z)([(0,_.Mo)("ha-select")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,h.Z)(this,i,[].concat(a)),e((0,v.Z)(t)),t}return(0,f.Z)(i,t),(0,d.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,y.dy)(n||(n=(0,c.Z)([" "," "," "])),(0,b.Z)((0,k.Z)(i.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,y.dy)(a||(a=(0,c.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):y.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,y.dy)(o||(o=(0,c.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):y.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,b.Z)((0,k.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,b.Z)((0,k.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,Z.D)((0,l.Z)((0,s.Z)().mark((function t(){return(0,s.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,x.y)();case 2:e.layoutOptions();case 3:case"end":return t.stop()}}),t)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,y.iv)(r||(r=(0,c.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),g.K)},41932:function(e,t,i){i.r(t),i.d(t,{HaSelectorUiAction:function(){return V}});var n,a,o,r,s,l,c,d,u,h,v,f=i(88962),p=i(33368),b=i(71650),k=i(68308),g=i(82390),m=i(69205),y=i(91808),_=(i(97393),i(5095)),Z=i(95260),x=i(18394),C=i(93359),w=i(34541),L=i(47838),A=(i(85717),i(46349),i(70320),i(22859),i(14516)),P=i(86089),M=(i(95352),i(33829),i(37662),(0,y.Z)([(0,Z.Mo)("ha-help-tooltip")],(function(e,t){var i=function(t){function i(){var t;(0,b.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,k.Z)(this,i,[].concat(a)),e((0,g.Z)(t)),t}return(0,m.Z)(i,t),(0,p.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,Z.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"position",value:function(){return"top"}},{kind:"method",key:"render",value:function(){return(0,_.dy)(n||(n=(0,f.Z)([' <ha-svg-icon .path="','"></ha-svg-icon> <simple-tooltip offset="4" .position="','" .fitToVisibleBounds="','">',"</simple-tooltip> "])),"M15.07,11.25L14.17,12.17C13.45,12.89 13,13.5 13,15H11V14.5C11,13.39 11.45,12.39 12.17,11.67L13.41,10.41C13.78,10.05 14,9.55 14,9C14,7.89 13.1,7 12,7A2,2 0 0,0 10,9H8A4,4 0 0,1 12,5A4,4 0 0,1 16,9C16,9.88 15.64,10.67 15.07,11.25M13,19H11V17H13M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12C22,6.47 17.5,2 12,2Z",this.position,!0,this.label)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,_.iv)(a||(a=(0,f.Z)(["ha-svg-icon{--mdc-icon-size:var(--ha-help-tooltip-size, 14px);color:var(--ha-help-tooltip-color,var(--disabled-text-color))}"])))}}]}}),_.oi),i(47322),i(84871),["more-info","toggle","navigate","url","call-service","assist","none"]),I=[{name:"navigation_path",selector:{navigation:{}}}],B=[{type:"grid",name:"",schema:[{name:"pipeline_id",selector:{assist_pipeline:{include_last_used:!0}}},{name:"start_listening",selector:{boolean:{}}}]}],V=((0,y.Z)([(0,Z.Mo)("hui-action-editor")],(function(e,t){var i=function(t){function i(){var t;(0,b.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,k.Z)(this,i,[].concat(a)),e((0,g.Z)(t)),t}return(0,m.Z)(i,t),(0,p.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,Z.Cb)()],key:"config",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"actions",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"defaultAction",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"tooltipText",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,Z.IO)("ha-select")],key:"_select",value:void 0},{kind:"get",key:"_navigation_path",value:function(){var e=this.config;return(null==e?void 0:e.navigation_path)||""}},{kind:"get",key:"_url_path",value:function(){var e=this.config;return(null==e?void 0:e.url_path)||""}},{kind:"get",key:"_service",value:function(){var e=this.config;return(null==e?void 0:e.service)||""}},{kind:"field",key:"_serviceAction",value:function(){var e=this;return(0,A.Z)((function(t){var i;return Object.assign(Object.assign({service:e._service},t.data||t.service_data?{data:null!==(i=t.data)&&void 0!==i?i:t.service_data}:null),{},{target:t.target})}))}},{kind:"method",key:"updated",value:function(e){(0,w.Z)((0,L.Z)(i.prototype),"updated",this).call(this,e),e.has("defaultAction")&&e.get("defaultAction")!==this.defaultAction&&this._select.layoutOptions()}},{kind:"method",key:"render",value:function(){var e,t,i,n,a,h,v,p,b=this;if(!this.hass)return _.Ld;var k=null!==(e=this.actions)&&void 0!==e?e:M;return(0,_.dy)(o||(o=(0,f.Z)([' <div class="dropdown"> <ha-select .label="','" .configValue="','" @selected="','" .value="','" @closed="','" fixedMenuPosition naturalMenuWidt> <mwc-list-item value="default"> '," "," </mwc-list-item> "," </ha-select> "," </div> "," "," "," "," "])),this.label,"action",this._actionPicked,null!==(t=null===(i=this.config)||void 0===i?void 0:i.action)&&void 0!==t?t:"default",P.U,this.hass.localize("ui.panel.lovelace.editor.action-editor.actions.default_action"),this.defaultAction?" (".concat(this.hass.localize("ui.panel.lovelace.editor.action-editor.actions.".concat(this.defaultAction)).toLowerCase(),")"):_.Ld,k.map((function(e){return(0,_.dy)(r||(r=(0,f.Z)([' <mwc-list-item .value="','"> '," </mwc-list-item> "])),e,b.hass.localize("ui.panel.lovelace.editor.action-editor.actions.".concat(e)))})),this.tooltipText?(0,_.dy)(s||(s=(0,f.Z)([' <ha-help-tooltip .label="','"></ha-help-tooltip> '])),this.tooltipText):_.Ld,"navigate"===(null===(n=this.config)||void 0===n?void 0:n.action)?(0,_.dy)(l||(l=(0,f.Z)([' <ha-form .hass="','" .schema="','" .data="','" .computeLabel="','" @value-changed="','"> </ha-form> '])),this.hass,I,this.config,this._computeFormLabel,this._formValueChanged):_.Ld,"url"===(null===(a=this.config)||void 0===a?void 0:a.action)?(0,_.dy)(c||(c=(0,f.Z)([' <ha-textfield .label="','" .value="','" .configValue="','" @input="','"></ha-textfield> '])),this.hass.localize("ui.panel.lovelace.editor.action-editor.url_path"),this._url_path,"url_path",this._valueChanged):_.Ld,"call-service"===(null===(h=this.config)||void 0===h?void 0:h.action)?(0,_.dy)(d||(d=(0,f.Z)([' <ha-service-control .hass="','" .value="','" .showAdvanced="','" narrow @value-changed="','"></ha-service-control> '])),this.hass,this._serviceAction(this.config),null===(v=this.hass.userData)||void 0===v?void 0:v.showAdvanced,this._serviceValueChanged):_.Ld,"assist"===(null===(p=this.config)||void 0===p?void 0:p.action)?(0,_.dy)(u||(u=(0,f.Z)([' <ha-form .hass="','" .schema="','" .data="','" .computeLabel="','" @value-changed="','"> </ha-form> '])),this.hass,B,this.config,this._computeFormLabel,this._formValueChanged):_.Ld)}},{kind:"method",key:"_actionPicked",value:function(e){var t;if(e.stopPropagation(),this.hass){var i=e.target.value;if((null===(t=this.config)||void 0===t?void 0:t.action)!==i)if("default"!==i){var n;switch(i){case"url":n={url_path:this._url_path};break;case"call-service":n={service:this._service};break;case"navigate":n={navigation_path:this._navigation_path}}(0,x.B)(this,"value-changed",{value:Object.assign({action:i},n)})}else(0,x.B)(this,"value-changed",{value:void 0})}}},{kind:"method",key:"_valueChanged",value:function(e){var t;if(e.stopPropagation(),this.hass){var i=e.target,n=null!==(t=e.target.value)&&void 0!==t?t:e.target.checked;this["_".concat(i.configValue)]!==n&&i.configValue&&(0,x.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.config),{},(0,C.Z)({},i.configValue,n))})}}},{kind:"method",key:"_formValueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,x.B)(this,"value-changed",{value:t})}},{kind:"method",key:"_computeFormLabel",value:function(e){var t;return null===(t=this.hass)||void 0===t?void 0:t.localize("ui.panel.lovelace.editor.action-editor.".concat(e.name))}},{kind:"method",key:"_serviceValueChanged",value:function(e){e.stopPropagation();var t=Object.assign(Object.assign({},this.config),{},{service:e.detail.value.service||"",data:e.detail.value.data,target:e.detail.value.target||{}});e.detail.value.data||delete t.data,"service_data"in t&&delete t.service_data,(0,x.B)(this,"value-changed",{value:t})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,_.iv)(h||(h=(0,f.Z)([".dropdown{position:relative}ha-help-tooltip{position:absolute;right:40px;top:16px;inset-inline-start:initial;inset-inline-end:40px;direction:var(--direction)}ha-select,ha-textfield{width:100%}ha-form,ha-navigation-picker,ha-service-control{display:block}ha-form,ha-navigation-picker,ha-service-control,ha-textfield{margin-top:8px}ha-service-control{--service-control-padding:0}ha-formfield{display:flex;height:56px;align-items:center;--mdc-typography-body2-font-size:1em}"])))}}]}}),_.oi),(0,y.Z)([(0,Z.Mo)("ha-selector-ui_action")],(function(e,t){var i=function(t){function i(){var t;(0,b.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,k.Z)(this,i,[].concat(a)),e((0,g.Z)(t)),t}return(0,m.Z)(i,t),(0,p.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"helper",value:void 0},{kind:"method",key:"render",value:function(){var e,t;return(0,_.dy)(v||(v=(0,f.Z)([' <hui-action-editor .label="','" .hass="','" .config="','" .actions="','" .defaultAction="','" .tooltipText="','" @value-changed="','"></hui-action-editor> '])),this.label,this.hass,this.value,null===(e=this.selector.ui_action)||void 0===e?void 0:e.actions,null===(t=this.selector.ui_action)||void 0===t?void 0:t.default_action,this.helper,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){(0,x.B)(this,"value-changed",{value:e.detail.value})}}]}}),_.oi))},77251:function(e,t,i){i.d(t,{T:function(){return c},j:function(){return d}});var n=i(71650),a=i(33368),o=i(68308),r=i(82390),s=i(69205),l=(i(97393),i(85717),i(98830)),c=(0,l.kr)("reorder-mode"),d=function(e){return function(e){function t(){var e;(0,n.Z)(this,t);for(var i=arguments.length,a=new Array(i),s=0;s<i;s++)a[s]=arguments[s];return(e=(0,o.Z)(this,t,[].concat(a)))._reorderModeProvider=new l.HQ((0,r.Z)(e),{context:c,initialValue:{active:!1,enter:function(){e._reorderModeProvider.setValue(Object.assign(Object.assign({},e._reorderModeProvider.value),{},{active:!0})),e.requestUpdate("_reorderMode")},exit:function(){e._reorderModeProvider.setValue(Object.assign(Object.assign({},e._reorderModeProvider.value),{},{active:!1})),e.requestUpdate("_reorderMode")}}}),e}return(0,s.Z)(t,e),(0,a.Z)(t,[{key:"_reorderMode",get:function(){return this._reorderModeProvider.value}}]),t}(e)}},23994:function(e,t,i){i(68077)({target:"Object",stat:!0},{is:i(93577)})},48769:function(e,t,i){i(88820)("WeakSet",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),i(6946))},48567:function(e,t,i){i(48769)},98830:function(e,t,i){i.d(t,{HQ:function(){return b},F_:function(){return g},kr:function(){return c}});var n=i(33368),a=i(71650),o=i(68308),r=i(69205),s=i(56889),l=function(e){function t(e,i,n){var r;return(0,a.Z)(this,t),(r=(0,o.Z)(this,t,["context-request",{bubbles:!0,composed:!0}])).context=e,r.callback=i,r.subscribe=null!=n&&n,r}return(0,r.Z)(t,e),(0,n.Z)(t)}((0,s.Z)(Event));function c(e){return e}var d=function(){function e(t,i,n,o){var r,s=this;if((0,a.Z)(this,e),this.subscribe=!1,this.provided=!1,this.value=void 0,this.t=function(e,t){s.unsubscribe&&(s.unsubscribe!==t&&(s.provided=!1,s.unsubscribe()),s.subscribe||s.unsubscribe()),s.value=e,s.host.requestUpdate(),s.provided&&!s.subscribe||(s.provided=!0,s.callback&&s.callback(e,t)),s.unsubscribe=t},this.host=t,void 0!==i.context){var l=i;this.context=l.context,this.callback=l.callback,this.subscribe=null!==(r=l.subscribe)&&void 0!==r&&r}else this.context=i,this.callback=n,this.subscribe=null!=o&&o;this.host.addController(this)}return(0,n.Z)(e,[{key:"hostConnected",value:function(){this.dispatchRequest()}},{key:"hostDisconnected",value:function(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=void 0)}},{key:"dispatchRequest",value:function(){this.host.dispatchEvent(new l(this.context,this.t,this.subscribe))}}]),e}(),u=i(62746),h=i(40039),v=i(82390),f=(i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(96043),i(23994),function(){function e(t){var i=this;(0,a.Z)(this,e),this.subscriptions=new Map,this.updateObservers=function(){var e,t=(0,h.Z)(i.subscriptions);try{for(t.s();!(e=t.n()).done;){var n=(0,u.Z)(e.value,2),a=n[0],o=n[1].disposer;a(i.o,o)}}catch(r){t.e(r)}finally{t.f()}},void 0!==t&&(this.value=t)}return(0,n.Z)(e,[{key:"value",get:function(){return this.o},set:function(e){this.setValue(e)}},{key:"setValue",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1]||!Object.is(e,this.o);this.o=e,t&&this.updateObservers()}},{key:"addCallback",value:function(e,t,i){var n=this;if(i){this.subscriptions.has(e)||this.subscriptions.set(e,{disposer:function(){n.subscriptions.delete(e)},consumerHost:t});var a=this.subscriptions.get(e).disposer;e(this.value,a)}else e(this.value)}},{key:"clearCallbacks",value:function(){this.subscriptions.clear()}}]),e}()),p=function(e){function t(e){var i;return(0,a.Z)(this,t),(i=(0,o.Z)(this,t,["context-provider",{bubbles:!0,composed:!0}])).context=e,i}return(0,r.Z)(t,e),(0,n.Z)(t)}((0,s.Z)(Event)),b=function(e){function t(e,i,n){var r;return(0,a.Z)(this,t),(r=(0,o.Z)(this,t,[void 0!==i.context?i.initialValue:n])).onContextRequest=function(e){var t=e.composedPath()[0];e.context===r.context&&t!==r.host&&(e.stopPropagation(),r.addCallback(e.callback,t,e.subscribe))},r.onProviderRequest=function(e){var t=e.composedPath()[0];if(e.context===r.context&&t!==r.host){var i,n=new Set,a=(0,h.Z)(r.subscriptions);try{for(a.s();!(i=a.n()).done;){var o=(0,u.Z)(i.value,2),s=o[0],c=o[1].consumerHost;n.has(s)||(n.add(s),c.dispatchEvent(new l(r.context,s,!0)))}}catch(d){a.e(d)}finally{a.f()}e.stopPropagation()}},r.host=e,void 0!==i.context?r.context=i.context:r.context=i,r.attachListeners(),r.host.addController((0,v.Z)(r)),r}return(0,r.Z)(t,e),(0,n.Z)(t,[{key:"attachListeners",value:function(){this.host.addEventListener("context-request",this.onContextRequest),this.host.addEventListener("context-provider",this.onProviderRequest)}},{key:"hostConnected",value:function(){this.host.dispatchEvent(new p(this.context))}}]),t}(f),k=(i(39685),i(48567),i(36513),i(40720),i(85717),i(39030));function g(e){var t=e.context,i=e.subscribe;return(0,k.eZ)({finisher:function(e,n){e.addInitializer((function(e){new d(e,{context:t,callback:function(t){e[n]=t},subscribe:i})}))}})}}}]);
+//# sourceMappingURL=141.w_RBtFv_90o.js.map
\ No newline at end of file
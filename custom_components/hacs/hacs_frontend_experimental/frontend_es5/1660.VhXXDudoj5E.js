@@ -0,0 +1,3 @@
+/*! For license information please see 1660.VhXXDudoj5E.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1660],{58135:function(t,e,n){n.d(e,{z:function(){return r}});n(40271),n(60163);var r=function(t){return function(e,n){return t.includes(e,n)}}},27959:function(t,e,n){n.d(e,{c:function(){return i}});var r=n(76775),i=(n(46798),n(94570),n(76843),function(t){if(void 0!==t){if("object"!==(0,r.Z)(t)){if("string"==typeof t||isNaN(t)){var e=(null==t?void 0:t.toString().split(":"))||[];if(1===e.length)return{seconds:Number(e[0])};if(e.length>3)return;var n=Number(e[2])||0,i=Math.floor(n);return{hours:Number(e[0])||0,minutes:Number(e[1])||0,seconds:i,milliseconds:Math.floor(1e3*(n-i))}}return{seconds:t}}if(!("days"in t))return t;var o=t.days,a=t.minutes,c=t.seconds,s=t.milliseconds,u=t.hours||0;return{hours:u=(u||0)+24*(o||0),minutes:a,seconds:c,milliseconds:s}}})},57128:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function d(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{d({},"")}catch(t){d=function(t,e,n){return t[e]=n}}function f(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new j(r||[]);return a(o,"_invoke",{value:O(t,n,c)}),o}function h(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=f;var v="suspendedStart",y="suspendedYield",p="executing",m="completed",g={};function b(){}function _(){}function k(){}var w={};d(w,s,(function(){return this}));var x=Object.getPrototypeOf,Z=x&&x(x(N([])));Z&&Z!==n&&o.call(Z,s)&&(w=Z);var C=k.prototype=b.prototype=Object.create(w);function S(t){["next","throw","return"].forEach((function(e){d(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=h(t[i],t,a);if("throw"!==u.type){var l=u.arg,d=l.value;return d&&"object"==r(d)&&o.call(d,"__await")?e.resolve(d.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(d).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function O(e,n,r){var i=v;return function(o,a){if(i===p)throw new Error("Generator is already running");if(i===m){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=z(c,r);if(s){if(s===g)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=p;var u=h(e,n,r);if("normal"===u.type){if(i=r.done?m:y,u.arg===g)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=m,r.method="throw",r.arg=u.arg)}}}function z(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,z(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var o=h(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,g;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function A(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function L(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function j(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(A,this),this.reset(!0)}function N(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=k,a(C,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:_,configurable:!0}),_.displayName=d(k,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,k):(t.__proto__=k,d(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},S(E.prototype),d(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(f(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},S(C),d(C,l,"Generator"),d(C,s,(function(){return this})),d(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=N,j.prototype={constructor:j,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(L),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),L(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;L(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:N(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,r=(t=i().mark((function t(r,o){var a,c,s,u;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{L:function(){return u}}),n(97393),a=n(23216),!(c=r([a])).then){t.next=13;break}return t.next=9,c;case 9:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=14;break;case 13:t.t0=c;case 14:a=t.t0[0],s=function(t){return t<10?"0".concat(t):t},u=function(t,e){var n=e.days||0,r=e.hours||0,i=e.minutes||0,o=e.seconds||0,a=e.milliseconds||0;return n>0?"".concat(Intl.NumberFormat(t.language,{style:"unit",unit:"day",unitDisplay:"long"}).format(n)," ").concat(r,":").concat(s(i),":").concat(s(o)):r>0?"".concat(r,":").concat(s(i),":").concat(s(o)):i>0?"".concat(i,":").concat(s(o)):o>0?Intl.NumberFormat(t.language,{style:"unit",unit:"second",unitDisplay:"long"}).format(o):a>0?Intl.NumberFormat(t.language,{style:"unit",unit:"millisecond",unitDisplay:"long"}).format(a):null},o(),t.next=23;break;case 20:t.prev=20,t.t2=t.catch(0),o(t.t2);case 23:case"end":return t.stop()}}),t,null,[[0,20]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},93312:function(t,e,n){n.d(e,{Z:function(){return i}});n(97393);var r=function(t){return t<10?"0".concat(t):t};function i(t){var e=Math.floor(t/3600),n=Math.floor(t%3600/60),i=Math.floor(t%3600%60);return e>0?"".concat(e,":").concat(r(n),":").concat(r(i)):n>0?"".concat(n,":").concat(r(i)):i>0?""+i:null}},3747:function(t,e,n){n.d(e,{t:function(){return c}});var r=n(71650),i=n(33368),o=(n(65974),n(10185),n(46798),n(9849),n(50289),n(94167),n(36513),n(56308),n(41353),n(88770),n(85717),function(){function t(){var e=this,n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.localStorage;(0,r.Z)(this,t),this.storage=void 0,this._storage={},this._listeners={},this.storage=n,n===window.localStorage&&window.addEventListener("storage",(function(t){t.key&&e.hasKey(t.key)&&(e._storage[t.key]=t.newValue?JSON.parse(t.newValue):t.newValue,e._listeners[t.key]&&e._listeners[t.key].forEach((function(n){return n(t.oldValue?JSON.parse(t.oldValue):t.oldValue,e._storage[t.key])})))}))}return(0,i.Z)(t,[{key:"addFromStorage",value:function(t){if(!this._storage[t]){var e=this.storage.getItem(t);e&&(this._storage[t]=JSON.parse(e))}}},{key:"subscribeChanges",value:function(t,e){var n=this;return this._listeners[t]?this._listeners[t].push(e):this._listeners[t]=[e],function(){n.unsubscribeChanges(t,e)}}},{key:"unsubscribeChanges",value:function(t,e){if(t in this._listeners){var n=this._listeners[t].indexOf(e);-1!==n&&this._listeners[t].splice(n,1)}}},{key:"hasKey",value:function(t){return t in this._storage}},{key:"getValue",value:function(t){return this._storage[t]}},{key:"setValue",value:function(t,e){var n=this._storage[t];this._storage[t]=e;try{void 0===e?this.storage.removeItem(t):this.storage.setItem(t,JSON.stringify(e))}catch(r){}finally{this._listeners[t]&&this._listeners[t].forEach((function(t){return t(n,e)}))}}}]),t}()),a={},c=function(t){return function(e){var n,r=t.storage||"localStorage";r&&r in a?n=a[r]:(n=new o(window[r]),a[r]=n);var i=String(e.key),c=t.key||String(e.key),s=e.initializer?e.initializer():void 0;n.addFromStorage(c);var u=!1!==t.subscribe?function(t){return n.subscribeChanges(c,(function(n,r){t.requestUpdate(e.key,n)}))}:void 0,l=function(){return n.hasKey(c)?n.getValue(c):s};return{kind:"method",placement:"prototype",key:e.key,descriptor:{set:function(r){!function(r,i){var o;t.state&&(o=l()),n.setValue(c,i),t.state&&r.requestUpdate(e.key,o)}(this,r)},get:function(){return l()},enumerable:!0,configurable:!0},finisher:function(n){if(t.state&&t.subscribe){var r=n.prototype.connectedCallback,o=n.prototype.disconnectedCallback;n.prototype.connectedCallback=function(){r.call(this),this["__unbsubLocalStorage".concat(i)]=null==u?void 0:u(this)},n.prototype.disconnectedCallback=function(){var t;o.call(this),null===(t=this["__unbsubLocalStorage".concat(i)])||void 0===t||t.call(this),this["__unbsubLocalStorage".concat(i)]=void 0}}t.state&&n.createProperty(e.key,Object.assign({noAccessor:!0},t.stateOptions))}}}}},91131:function(t,e,n){n.d(e,{t:function(){return r}});var r=function(t){return"latitude"in t.attributes&&"longitude"in t.attributes}},58664:function(t,e,n){n.d(e,{v:function(){return o}});n(40271);var r=n(21157),i=n(36655);function o(t,e){var n=(0,i.M)(t.entity_id),o=void 0!==e?e:null==t?void 0:t.state;if(["button","event","input_button","scene"].includes(n))return o!==r.nZ;if((0,r.rk)(o))return!1;if(o===r.PX&&"alert"!==n)return!1;switch(n){case"alarm_control_panel":return"disarmed"!==o;case"alert":return"idle"!==o;case"cover":case"valve":return"closed"!==o;case"device_tracker":case"person":return"not_home"!==o;case"lawn_mower":return["mowing","error"].includes(o);case"lock":return"locked"!==o;case"media_player":return"standby"!==o;case"vacuum":return!["idle","docked","paused"].includes(o);case"plant":return"problem"===o;case"group":return["on","home","open","locked","problem"].includes(o);case"timer":return"active"===o;case"camera":return"streaming"===o}return!0}},86603:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function d(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{d({},"")}catch(t){d=function(t,e,n){return t[e]=n}}function f(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new j(r||[]);return a(o,"_invoke",{value:O(t,n,c)}),o}function h(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=f;var v="suspendedStart",y="suspendedYield",p="executing",m="completed",g={};function b(){}function _(){}function k(){}var w={};d(w,s,(function(){return this}));var x=Object.getPrototypeOf,Z=x&&x(x(N([])));Z&&Z!==n&&o.call(Z,s)&&(w=Z);var C=k.prototype=b.prototype=Object.create(w);function S(t){["next","throw","return"].forEach((function(e){d(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=h(t[i],t,a);if("throw"!==u.type){var l=u.arg,d=l.value;return d&&"object"==r(d)&&o.call(d,"__await")?e.resolve(d.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(d).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function O(e,n,r){var i=v;return function(o,a){if(i===p)throw new Error("Generator is already running");if(i===m){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=z(c,r);if(s){if(s===g)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=p;var u=h(e,n,r);if("normal"===u.type){if(i=r.done?m:y,u.arg===g)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=m,r.method="throw",r.arg=u.arg)}}}function z(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,z(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var o=h(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,g;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function A(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function L(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function j(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(A,this),this.reset(!0)}function N(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=k,a(C,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:_,configurable:!0}),_.displayName=d(k,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,k):(t.__proto__=k,d(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},S(E.prototype),d(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(f(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},S(C),d(C,l,"Generator"),d(C,s,(function(){return this})),d(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=N,j.prototype={constructor:j,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(L),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),L(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;L(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:N(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,r=(t=i().mark((function t(r,o){var a,c,s,u,l,d,f;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{u:function(){return l},z:function(){return u}}),a=n(14516),c=n(23216),!(s=r([c])).then){t.next=12;break}return t.next=8,s;case 8:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=13;break;case 12:t.t0=s;case 13:c=t.t0[0],u=function(t,e){return d(t).format(e)},l=function(t,e){return f(t).format(e)},d=(0,a.Z)((function(t){return new Intl.ListFormat(t.language,{style:"long",type:"conjunction"})})),f=(0,a.Z)((function(t){return new Intl.ListFormat(t.language,{style:"long",type:"disjunction"})})),o(),t.next=24;break;case 21:t.prev=21,t.t2=t.catch(0),o(t.t2);case 24:case"end":return t.stop()}}),t,null,[[0,21]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},92482:function(t,e,n){n.d(e,{p:function(){return o}});var r=n(40039),i=(n(36513),n(91989),n(63789),n(24074),n(88770),n(38768)),o=function(t,e){if(!(e instanceof i.DD))return{warnings:[e.message],errors:void 0};var n,o=[],a=[],c=(0,r.Z)(e.failures());try{for(c.s();!(n=c.n()).done;){var s=n.value;if(void 0===s.value)o.push(t.localize("ui.errors.config.key_missing",{key:s.path.join(".")}));else if("never"===s.type)a.push(t.localize("ui.errors.config.key_not_expected",{key:s.path.join(".")}));else{if("union"===s.type)continue;"enums"===s.type?a.push(t.localize("ui.errors.config.key_wrong_type",{key:s.path.join("."),type_correct:s.message.replace("Expected ","").split(", ")[0],type_wrong:JSON.stringify(s.value)})):a.push(t.localize("ui.errors.config.key_wrong_type",{key:s.path.join("."),type_correct:s.refinement||s.type,type_wrong:JSON.stringify(s.value)}))}}}catch(e){c.e(e)}finally{c.f()}return{warnings:a,errors:o}}},32723:function(t,e,n){n.d(e,{b:function(){return o}});n(62746);var r=n(46097);n(34997),n(46798),n(9849),n(12148),n(85717),n(41353);function i(t,e,n){return e.reduce((function(t,e,r,i){if(void 0!==t){if(!t[e]&&n){var o=i[r+1];t[e]=void 0===o||"number"==typeof o?[]:{}}return t[e]}}),t)}function o(t,e,n,o,a){var c=Array.isArray(t)?(0,r.Z)(t):Object.assign({},t),s=o?i(c,o):c,u=a?i(c,a,!0):c;if(!Array.isArray(s)||!Array.isArray(u))return t;var l=s.splice(e,1)[0];return u.splice(n,0,l),c}},7748:function(t,e,n){n.d(e,{g:function(){return O}});var r,i,o,a,c,s=n(62746),u=n(99312),l=n(81043),d=n(88962),f=n(33368),h=n(71650),v=n(68308),y=n(82390),p=n(69205),m=n(91808),g=n(34541),b=n(47838),_=(n(86439),n(97393),n(46349),n(70320),n(37313),n(40271),n(85717),n(98830)),k=(n(44577),n(5095)),w=n(95260),x=n(18394),Z=n(38149),C=n(25917),S=(n(71133),"NO_AUTOMATION"),E="UNKNOWN_AUTOMATION",O=(0,m.Z)(null,(function(t,e){var n,m=function(e){function n(e,r,i){var o;return(0,h.Z)(this,n),o=(0,v.Z)(this,n),t((0,y.Z)(o)),o._localizeDeviceAutomation=e,o._fetchDeviceAutomations=r,o._createNoAutomation=i,o}return(0,p.Z)(n,e),(0,f.Z)(n)}(e);return{F:m,d:[{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"deviceId",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,w.SB)()],key:"_automations",value:function(){return[]}},{kind:"field",decorators:[(0,w.SB)()],key:"_renderEmpty",value:function(){return!1}},{kind:"field",decorators:[(0,w.SB)(),(0,_.F_)({context:Z.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"get",key:"NO_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.actions.no_actions")}},{kind:"get",key:"UNKNOWN_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.actions.unknown_action")}},{kind:"field",key:"_localizeDeviceAutomation",value:void 0},{kind:"field",key:"_fetchDeviceAutomations",value:void 0},{kind:"field",key:"_createNoAutomation",value:void 0},{kind:"get",key:"_value",value:function(){var t=this;if(!this.value)return"";if(!this._automations.length)return S;var e=this._automations.findIndex((function(e){return(0,C.hH)(t._entityReg,e,t.value)}));return-1===e?E:"".concat(this._automations[e].device_id,"_").concat(e)}},{kind:"method",key:"render",value:function(){var t=this;if(this._renderEmpty)return k.Ld;var e=this._value;return(0,k.dy)(r||(r=(0,d.Z)([' <ha-select .label="','" .value="','" @selected="','" .disabled="','"> '," "," "," </ha-select> "])),this.label,e,this._automationChanged,0===this._automations.length,e===S?(0,k.dy)(i||(i=(0,d.Z)(['<mwc-list-item .value="','"> '," </mwc-list-item>"])),S,this.NO_AUTOMATION_TEXT):"",e===E?(0,k.dy)(o||(o=(0,d.Z)(['<mwc-list-item .value="','"> '," </mwc-list-item>"])),E,this.UNKNOWN_AUTOMATION_TEXT):"",this._automations.map((function(e,n){return(0,k.dy)(a||(a=(0,d.Z)([' <mwc-list-item .value="','"> '," </mwc-list-item> "])),"".concat(e.device_id,"_").concat(n),t._localizeDeviceAutomation(t.hass,t._entityReg,e))})))}},{kind:"method",key:"updated",value:function(t){(0,g.Z)((0,b.Z)(m.prototype),"updated",this).call(this,t),t.has("deviceId")&&this._updateDeviceInfo()}},{kind:"method",key:"_updateDeviceInfo",value:(n=(0,l.Z)((0,u.Z)().mark((function t(){return(0,u.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!this.deviceId){t.next=6;break}return t.next=3,this._fetchDeviceAutomations(this.hass,this.deviceId);case 3:t.t0=t.sent.sort(C.h6),t.next=7;break;case 6:t.t0=[];case 7:return this._automations=t.t0,this.value&&this.value.device_id===this.deviceId||this._setValue(this._automations.length?this._automations[0]:this._createNoAutomation(this.deviceId)),this._renderEmpty=!0,t.next=12,this.updateComplete;case 12:this._renderEmpty=!1;case 13:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"_automationChanged",value:function(t){var e=t.target.value;if(e&&![E,S].includes(e)){var n=e.split("_"),r=(0,s.Z)(n,2),i=r[0],o=r[1],a=this._automations[o];a.device_id===i&&this._setValue(a)}}},{kind:"method",key:"_setValue",value:function(t){if(!this.value||!(0,C.hH)(this._entityReg,t,this.value)){var e=Object.assign({},t);delete e.metadata,(0,x.B)(this,"value-changed",{value:e})}}},{kind:"get",static:!0,key:"styles",value:function(){return(0,k.iv)(c||(c=(0,d.Z)(["ha-select{display:block}"])))}}]}}),k.oi)},27056:function(t,e,n){var r,i,o=n(99312),a=n(81043),c=n(33368),s=n(71650),u=n(68308),l=n(82390),d=n(69205),f=n(91808),h=n(88962),v=(n(22859),n(97393),n(87438),n(46798),n(9849),n(22890),n(13526),n(40271),n(60163),n(49089),n(46349),n(70320),n(37313),n(10733),n(5095)),y=n(95260),p=n(14516),m=n(18394),g=n(36655),b=n(28858),_=n(1913),k=n(16061),w=(n(16591),n(90532),function(t){return(0,v.dy)(r||(r=(0,h.Z)(['<ha-list-item .twoline="','"> <span>','</span> <span slot="secondary">',"</span> </ha-list-item>"])),!!t.area,t.name,t.area)});(0,f.Z)([(0,y.Mo)("ha-device-picker")],(function(t,e){var n,r,f=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,d.Z)(n,e),(0,c.Z)(n)}(e);return{F:f,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"exclude-devices"})],key:"excludeDevices",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"deviceFilter",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,y.SB)()],key:"_opened",value:void 0},{kind:"field",decorators:[(0,y.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"field",key:"_init",value:function(){return!1}},{kind:"field",key:"_getDevices",value:function(){var t=this;return(0,p.Z)((function(e,n,r,i,o,a,c,s,u){if(!e.length)return[{id:"no_devices",area:"",name:t.hass.localize("ui.components.device-picker.no_devices"),strings:[]}];var l={};(i||o||a||s)&&(l=(0,k.R6)(r));var d=e.filter((function(e){return e.id===t.value||!e.disabled_by}));i&&(d=d.filter((function(t){var e=l[t.id];return!(!e||!e.length)&&l[t.id].some((function(t){return i.includes((0,g.M)(t.entity_id))}))}))),o&&(d=d.filter((function(t){var e=l[t.id];return!e||!e.length||r.every((function(t){return!o.includes((0,g.M)(t.entity_id))}))}))),u&&(d=d.filter((function(t){return!u.includes(t.id)}))),a&&(d=d.filter((function(e){var n=l[e.id];return!(!n||!n.length)&&l[e.id].some((function(e){var n=t.hass.states[e.entity_id];return!!n&&(n.attributes.device_class&&a.includes(n.attributes.device_class))}))}))),s&&(d=d.filter((function(e){var n=l[e.id];return!(!n||!n.length)&&n.some((function(e){var n=t.hass.states[e.entity_id];return!!n&&s(n)}))}))),c&&(d=d.filter((function(e){return e.id===t.value||c(e)})));var f=d.map((function(e){var r=(0,k.jL)(e,t.hass,l[e.id]);return{id:e.id,name:r,area:e.area_id&&n[e.area_id]?n[e.area_id].name:t.hass.localize("ui.components.device-picker.no_area"),strings:[r||""]}}));return f.length?1===f.length?f:f.sort((function(e,n){return(0,b.$)(e.name||"",n.name||"",t.hass.locale.language)})):[{id:"no_devices",area:"",name:t.hass.localize("ui.components.device-picker.no_match"),strings:[]}]}))}},{kind:"method",key:"open",value:(r=(0,a.Z)((0,o.Z)().mark((function t(){var e;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,this.updateComplete;case 2:return t.next=4,null===(e=this.comboBox)||void 0===e?void 0:e.open();case 4:case"end":return t.stop()}}),t,this)}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"focus",value:(n=(0,a.Z)((0,o.Z)().mark((function t(){var e;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,this.updateComplete;case 2:return t.next=4,null===(e=this.comboBox)||void 0===e?void 0:e.focus();case 4:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"updated",value:function(t){if(!this._init&&this.hass||this._init&&t.has("_opened")&&this._opened){this._init=!0;var e=this._getDevices(Object.values(this.hass.devices),this.hass.areas,Object.values(this.hass.entities),this.includeDomains,this.excludeDomains,this.includeDeviceClasses,this.deviceFilter,this.entityFilter,this.excludeDevices);this.comboBox.items=e,this.comboBox.filteredItems=e}}},{kind:"method",key:"render",value:function(){return(0,v.dy)(i||(i=(0,h.Z)([' <ha-combo-box .hass="','" .label="','" .value="','" .helper="','" .renderer="','" .disabled="','" .required="','" item-id-path="id" item-value-path="id" item-label-path="name" @opened-changed="','" @value-changed="','" @filter-changed="','"></ha-combo-box> '])),this.hass,void 0===this.label&&this.hass?this.hass.localize("ui.components.device-picker.device"):this.label,this._value,this.helper,w,this.disabled,this.required,this._openedChanged,this._deviceChanged,this._filterChanged)}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_filterChanged",value:function(t){var e=t.target,n=t.detail.value.toLowerCase();e.filteredItems=n.length?(0,_.q)(n,e.items||[]):e.items}},{kind:"method",key:"_deviceChanged",value:function(t){t.stopPropagation();var e=t.detail.value;"no_devices"===e&&(e=""),e!==this._value&&this._setValue(e)}},{kind:"method",key:"_openedChanged",value:function(t){this._opened=t.detail.value}},{kind:"method",key:"_setValue",value:function(t){var e=this;this.value=t,setTimeout((function(){(0,m.B)(e,"value-changed",{value:t}),(0,m.B)(e,"change")}),0)}}]}}),v.oi)},91998:function(t,e,n){var r,i,o,a=n(88962),c=n(99312),s=n(81043),u=n(33368),l=n(71650),d=n(68308),f=n(82390),h=n(69205),v=n(91808),y=(n(97393),n(65974),n(87438),n(46798),n(9849),n(22890),n(40271),n(60163),n(37313),n(46349),n(70320),n(85717),n(90532),n(5095)),p=n(95260),m=n(14516),g=n(18394),b=n(36655),_=n(2733),k=n(1913),w=(n(16591),n(54371),n(37662),n(14303),n(28858));(0,v.Z)([(0,p.Mo)("ha-entity-picker")],(function(t,e){var n,v,x=function(e){function n(){var e;(0,l.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,d.Z)(this,n,[].concat(i)),t((0,f.Z)(e)),e}return(0,h.Z)(n,e),(0,u.Z)(n)}(e);return{F:x,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"autofocus",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,attribute:"allow-custom-entity"})],key:"allowCustomEntity",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Array,attribute:"include-unit-of-measurement"})],key:"includeUnitOfMeasurement",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Array,attribute:"include-entities"})],key:"includeEntities",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Array,attribute:"exclude-entities"})],key:"excludeEntities",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"hideClearIcon",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({attribute:"item-label-path"})],key:"itemLabelPath",value:function(){return"friendly_name"}},{kind:"field",decorators:[(0,p.SB)()],key:"_opened",value:function(){return!1}},{kind:"field",decorators:[(0,p.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"open",value:(v=(0,s.Z)((0,c.Z)().mark((function t(){var e;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,this.updateComplete;case 2:return t.next=4,null===(e=this.comboBox)||void 0===e?void 0:e.open();case 4:case"end":return t.stop()}}),t,this)}))),function(){return v.apply(this,arguments)})},{kind:"method",key:"focus",value:(n=(0,s.Z)((0,c.Z)().mark((function t(){var e;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,this.updateComplete;case 2:return t.next=4,null===(e=this.comboBox)||void 0===e?void 0:e.focus();case 4:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"field",key:"_initedStates",value:function(){return!1}},{kind:"field",key:"_states",value:function(){return[]}},{kind:"field",key:"_rowRenderer",value:function(){var t=this;return function(e){return(0,y.dy)(r||(r=(0,a.Z)(['<ha-list-item graphic="avatar" .twoline="','"> '," <span>",'</span> <span slot="secondary">',"</span> </ha-list-item>"])),!!e.entity_id,e.state?(0,y.dy)(i||(i=(0,a.Z)(['<state-badge slot="graphic" .stateObj="','" .hass="','"></state-badge>'])),e,t.hass):"",e.friendly_name,e.entity_id)}}},{kind:"field",key:"_getStates",value:function(){var t=this;return(0,m.Z)((function(e,n,r,i,o,a,c,s,u){var l=[];if(!n)return[];var d=Object.keys(n.states);return d.length?s?(d=d.filter((function(e){return t.includeEntities.includes(e)}))).map((function(t){var e=(0,_.C)(n.states[t])||t;return Object.assign(Object.assign({},n.states[t]),{},{friendly_name:e,strings:[t,e]})})).sort((function(e,n){return(0,w.f)(e.friendly_name,n.friendly_name,t.hass.locale.language)})):(u&&(d=d.filter((function(t){return!u.includes(t)}))),r&&(d=d.filter((function(t){return r.includes((0,b.M)(t))}))),i&&(d=d.filter((function(t){return!i.includes((0,b.M)(t))}))),l=d.map((function(t){var e=(0,_.C)(n.states[t])||t;return Object.assign(Object.assign({},n.states[t]),{},{friendly_name:e,strings:[t,e]})})).sort((function(e,n){return(0,w.f)(e.friendly_name,n.friendly_name,t.hass.locale.language)})),a&&(l=l.filter((function(e){return e.entity_id===t.value||e.attributes.device_class&&a.includes(e.attributes.device_class)}))),c&&(l=l.filter((function(e){return e.entity_id===t.value||e.attributes.unit_of_measurement&&c.includes(e.attributes.unit_of_measurement)}))),o&&(l=l.filter((function(e){return e.entity_id===t.value||o(e)}))),l.length?l:[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:t.hass.localize("ui.components.entity.entity-picker.no_match"),attributes:{friendly_name:t.hass.localize("ui.components.entity.entity-picker.no_match"),icon:"mdi:magnify"},strings:[]}]):[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:t.hass.localize("ui.components.entity.entity-picker.no_entities"),attributes:{friendly_name:t.hass.localize("ui.components.entity.entity-picker.no_entities"),icon:"mdi:magnify"},strings:[]}]}))}},{kind:"method",key:"shouldUpdate",value:function(t){return!!(t.has("value")||t.has("label")||t.has("disabled"))||!(!t.has("_opened")&&this._opened)}},{kind:"method",key:"willUpdate",value:function(t){(!this._initedStates||t.has("_opened")&&this._opened)&&(this._states=this._getStates(this._opened,this.hass,this.includeDomains,this.excludeDomains,this.entityFilter,this.includeDeviceClasses,this.includeUnitOfMeasurement,this.includeEntities,this.excludeEntities),this._initedStates&&(this.comboBox.filteredItems=this._states),this._initedStates=!0)}},{kind:"method",key:"render",value:function(){return(0,y.dy)(o||(o=(0,a.Z)([' <ha-combo-box item-value-path="entity_id" .itemLabelPath="','" .hass="','" .value="','" .label="','" .helper="','" .allowCustomValue="','" .filteredItems="','" .renderer="','" .required="','" .disabled="','" @opened-changed="','" @value-changed="','" @filter-changed="','"> </ha-combo-box> '])),this.itemLabelPath,this.hass,this._value,void 0===this.label?this.hass.localize("ui.components.entity.entity-picker.entity"):this.label,this.helper,this.allowCustomEntity,this._states,this._rowRenderer,this.required,this.disabled,this._openedChanged,this._valueChanged,this._filterChanged)}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(t){this._opened=t.detail.value}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e=t.detail.value;e!==this._value&&this._setValue(e)}},{kind:"method",key:"_filterChanged",value:function(t){var e=t.target,n=t.detail.value.toLowerCase();e.filteredItems=n.length?(0,k.q)(n,this._states):this._states}},{kind:"method",key:"_setValue",value:function(t){var e=this;this.value=t,setTimeout((function(){(0,g.B)(e,"value-changed",{value:t}),(0,g.B)(e,"change")}),0)}}]}}),y.oi)},92295:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),d=(n(97393),n(14271)),f=n(5095),h=n(95260),v=n(3712);(0,l.Z)([(0,h.Mo)("ha-button")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",static:!0,key:"styles",value:function(){return[v.W,(0,f.iv)(r||(r=(0,i.Z)(["::slotted([slot=icon]){margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction);display:block}.mdc-button{height:var(--button-height,36px)}.trailing-icon{display:flex}.slot-container{overflow:var(--button-slot-container-overflow,visible)}"])))]}}]}}),d.z)},68336:function(t,e,n){var r,i,o,a=n(88962),c=n(33368),s=n(71650),u=n(68308),l=n(82390),d=n(69205),f=n(91808),h=(n(97393),n(5095)),v=n(95260);(0,f.Z)([(0,v.Mo)("ha-card")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,d.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)()],key:"header",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean,reflect:!0})],key:"raised",value:function(){return!1}},{kind:"get",static:!0,key:"styles",value:function(){return(0,h.iv)(r||(r=(0,a.Z)([":host{background:var(--ha-card-background,var(--card-background-color,#fff));box-shadow:var(--ha-card-box-shadow,none);box-sizing:border-box;border-radius:var(--ha-card-border-radius,12px);border-width:var(--ha-card-border-width,1px);border-style:solid;border-color:var(--ha-card-border-color,var(--divider-color,#e0e0e0));color:var(--primary-text-color);display:block;transition:all .3s ease-out;position:relative}:host([raised]){border:none;box-shadow:var(--ha-card-box-shadow,0px 2px 1px -1px rgba(0,0,0,.2),0px 1px 1px 0px rgba(0,0,0,.14),0px 1px 3px 0px rgba(0,0,0,.12))}.card-header,:host ::slotted(.card-header){color:var(--ha-card-header-color,--primary-text-color);font-family:var(--ha-card-header-font-family, inherit);font-size:var(--ha-card-header-font-size, 24px);letter-spacing:-.012em;line-height:48px;padding:12px 16px 16px;display:block;margin-block-start:0px;margin-block-end:0px;font-weight:400}:host ::slotted(.card-content:not(:first-child)),slot:not(:first-child)::slotted(.card-content){padding-top:0px;margin-top:-8px}:host ::slotted(.card-content){padding:16px}:host ::slotted(.card-actions){border-top:1px solid var(--divider-color,#e8e8e8);padding:5px 16px}"])))}},{kind:"method",key:"render",value:function(){return(0,h.dy)(i||(i=(0,a.Z)([" "," <slot></slot> "])),this.header?(0,h.dy)(o||(o=(0,a.Z)(['<h1 class="card-header">',"</h1>"])),this.header):h.Ld)}}]}}),h.oi)},31360:function(t,e,n){var r,i,o,a,c,s=n(99312),u=n(81043),l=n(88962),d=n(33368),f=n(71650),h=n(68308),v=n(82390),y=n(69205),p=n(91808),m=n(34541),g=n(47838),b=(n(97393),n(5095)),_=n(95260),k=n(53180),w=n(18394),x=n(2537),Z=(n(37662),"M7.41,8.58L12,13.17L16.59,8.58L18,10L12,16L6,10L7.41,8.58Z");(0,p.Z)([(0,_.Mo)("ha-expansion-panel")],(function(t,e){var n,p=function(e){function n(){var e;(0,f.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,h.Z)(this,n,[].concat(i)),t((0,v.Z)(e)),e}return(0,y.Z)(n,e),(0,d.Z)(n)}(e);return{F:p,d:[{kind:"field",decorators:[(0,_.Cb)({type:Boolean,reflect:!0})],key:"expanded",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({type:Boolean,reflect:!0})],key:"outlined",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({type:Boolean,reflect:!0})],key:"leftChevron",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)()],key:"header",value:void 0},{kind:"field",decorators:[(0,_.Cb)()],key:"secondary",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_showContent",value:function(){return this.expanded}},{kind:"field",decorators:[(0,_.IO)(".container")],key:"_container",value:void 0},{kind:"method",key:"render",value:function(){return(0,b.dy)(r||(r=(0,l.Z)([' <div class="top ','"> <div id="summary" @click="','" @keydown="','" @focus="','" @blur="','" role="button" tabindex="0" aria-expanded="','" aria-controls="sect1"> ',' <slot name="header"> <div class="header"> ',' <slot class="secondary" name="secondary">',"</slot> </div> </slot> ",' </div> <slot name="icons"></slot> </div> <div class="container ','" @transitionend="','" role="region" aria-labelledby="summary" aria-hidden="','" tabindex="-1"> '," </div> "])),(0,k.$)({expanded:this.expanded}),this._toggleContainer,this._toggleContainer,this._focusChanged,this._focusChanged,this.expanded,this.leftChevron?(0,b.dy)(i||(i=(0,l.Z)([' <ha-svg-icon .path="','" class="summary-icon ','"></ha-svg-icon> '])),Z,(0,k.$)({expanded:this.expanded})):"",this.header,this.secondary,this.leftChevron?"":(0,b.dy)(o||(o=(0,l.Z)([' <ha-svg-icon .path="','" class="summary-icon ','"></ha-svg-icon> '])),Z,(0,k.$)({expanded:this.expanded})),(0,k.$)({expanded:this.expanded}),this._handleTransitionEnd,!this.expanded,this._showContent?(0,b.dy)(a||(a=(0,l.Z)(["<slot></slot>"]))):"")}},{kind:"method",key:"willUpdate",value:function(t){var e=this;(0,m.Z)((0,g.Z)(p.prototype),"willUpdate",this).call(this,t),t.has("expanded")&&this.expanded&&(this._showContent=this.expanded,setTimeout((function(){e.expanded&&(e._container.style.overflow="initial")}),300))}},{kind:"method",key:"_handleTransitionEnd",value:function(){this._container.style.removeProperty("height"),this._container.style.overflow=this.expanded?"initial":"hidden",this._showContent=this.expanded}},{kind:"method",key:"_toggleContainer",value:(n=(0,u.Z)((0,s.Z)().mark((function t(e){var n,r,i=this;return(0,s.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!e.defaultPrevented){t.next=2;break}return t.abrupt("return");case 2:if("keydown"!==e.type||"Enter"===e.key||" "===e.key){t.next=4;break}return t.abrupt("return");case 4:if(e.preventDefault(),n=!this.expanded,(0,w.B)(this,"expanded-will-change",{expanded:n}),this._container.style.overflow="hidden",!n){t.next=12;break}return this._showContent=!0,t.next=12,(0,x.y)();case 12:r=this._container.scrollHeight,this._container.style.height="".concat(r,"px"),n||setTimeout((function(){i._container.style.height="0px"}),0),this.expanded=n,(0,w.B)(this,"expanded-changed",{expanded:this.expanded});case 17:case"end":return t.stop()}}),t,this)}))),function(t){return n.apply(this,arguments)})},{kind:"method",key:"_focusChanged",value:function(t){this.shadowRoot.querySelector(".top").classList.toggle("focused","focus"===t.type)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,b.iv)(c||(c=(0,l.Z)([":host{display:block}.top{display:flex;align-items:center;border-radius:var(--ha-card-border-radius,12px)}.top.expanded{border-bottom-left-radius:0px;border-bottom-right-radius:0px}.top.focused{background:var(--input-fill-color)}:host([outlined]){box-shadow:none;border-width:1px;border-style:solid;border-color:var(--outline-color);border-radius:var(--ha-card-border-radius,12px)}.summary-icon{margin-left:8px}:host([leftchevron]) .summary-icon{margin-left:0;margin-right:8px}#summary{flex:1;display:flex;padding:var(--expansion-panel-summary-padding,0 8px);min-height:48px;align-items:center;cursor:pointer;overflow:hidden;font-weight:500;outline:0}.summary-icon{transition:transform 150ms cubic-bezier(.4, 0, .2, 1);direction:var(--direction)}.summary-icon.expanded{transform:rotate(180deg)}.header,::slotted([slot=header]){flex:1}.container{padding:var(--expansion-panel-content-padding,0 8px);overflow:hidden;transition:height .3s cubic-bezier(.4, 0, .2, 1);height:0px}.container.expanded{height:auto}.secondary{display:block;color:var(--secondary-text-color);font-size:12px}"])))}}]}}),b.oi)},42308:function(t,e,n){var r,i=n(99312),o=n(81043),a=n(88962),c=n(33368),s=n(71650),u=n(68308),l=n(82390),d=n(69205),f=n(91808),h=n(34541),v=n(47838),y=(n(97393),n(51358),n(46798),n(47084),n(5239),n(98490),n(22481),n(91989),n(5095)),p=n(95260),m=n(18394);(0,f.Z)([(0,p.Mo)("ha-sortable")],(function(t,e){var f,g=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,d.Z)(n,e),(0,c.Z)(n)}(e);return{F:g,d:[{kind:"field",key:"_sortable",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"path",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,attribute:"no-style"})],key:"noStyle",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:String,attribute:"draggable-selector"})],key:"draggableSelector",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:String,attribute:"handle-selector"})],key:"handleSelector",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:String,attribute:"group"})],key:"group",value:void 0},{kind:"method",key:"updated",value:function(t){t.has("disabled")&&(this.disabled?this._destroySortable():this._createSortable())}},{kind:"field",key:"_shouldBeDestroy",value:function(){return!1}},{kind:"method",key:"disconnectedCallback",value:function(){var t=this;(0,h.Z)((0,v.Z)(g.prototype),"disconnectedCallback",this).call(this),this._shouldBeDestroy=!0,setTimeout((function(){t._shouldBeDestroy&&(t._destroySortable(),t._shouldBeDestroy=!1)}),1)}},{kind:"method",key:"connectedCallback",value:function(){(0,h.Z)((0,v.Z)(g.prototype),"connectedCallback",this).call(this),this._shouldBeDestroy=!1}},{kind:"method",key:"createRenderRoot",value:function(){return this}},{kind:"method",key:"render",value:function(){return this.noStyle?y.Ld:(0,y.dy)(r||(r=(0,a.Z)([" <style>.sortable-fallback{display:none;opacity:0}.sortable-ghost{border:2px solid var(--primary-color);background:rgba(var(--rgb-primary-color),.25);border-radius:4px;opacity:.4}.sortable-drag{border-radius:4px;opacity:1;background:var(--card-background-color);box-shadow:0px 4px 8px 3px #00000026;cursor:grabbing}</style> "])))}},{kind:"method",key:"_createSortable",value:(f=(0,o.Z)((0,i.Z)().mark((function t(){var e,r,o;return(0,i.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!this._sortable){t.next=2;break}return t.abrupt("return");case 2:if(e=this.children[0]){t.next=5;break}return t.abrupt("return");case 5:return t.next=7,Promise.all([n.e(6087),n.e(8697)]).then(n.bind(n,48697));case 7:r=t.sent.default,o={animation:150,swapThreshold:.75,onChoose:this._handleChoose,onEnd:this._handleEnd},this.draggableSelector&&(o.draggable=this.draggableSelector),this.handleSelector&&(o.handle=this.handleSelector),this.draggableSelector&&(o.draggable=this.draggableSelector),this.group&&(o.group=this.group),this._sortable=new r(e,o);case 14:case"end":return t.stop()}}),t,this)}))),function(){return f.apply(this,arguments)})},{kind:"field",key:"_handleEnd",value:function(){var t=this;return function(){var e=(0,o.Z)((0,i.Z)().mark((function e(n){var r,o,a,c;return(0,i.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(n.item.placeholder&&(n.item.placeholder.replaceWith(n.item),delete n.item.placeholder),r=n.oldIndex,o=n.from.parentElement.path,a=n.newIndex,c=n.to.parentElement.path,void 0!==r&&void 0!==a&&(r!==a||(null==o?void 0:o.join("."))!==(null==c?void 0:c.join(".")))){e.next=7;break}return e.abrupt("return");case 7:(0,m.B)(t,"item-moved",{oldIndex:r,newIndex:a,oldPath:o,newPath:c});case 8:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}()}},{kind:"field",key:"_handleChoose",value:function(){return function(t){t.item.placeholder=document.createComment("sort-placeholder"),t.item.after(t.item.placeholder)}}},{kind:"method",key:"_destroySortable",value:function(){this._sortable&&(this._sortable.destroy(),this._sortable=void 0)}}]}}),y.oi)},99539:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),d=n(34541),f=n(47838),h=(n(97393),n(89833)),v=n(31338),y=n(96791),p=n(5095),m=n(95260),g=n(67684);(0,l.Z)([(0,m.Mo)("ha-textarea")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,m.Cb)({type:Boolean,reflect:!0})],key:"autogrow",value:function(){return!1}},{kind:"method",key:"firstUpdated",value:function(){(0,d.Z)((0,f.Z)(n.prototype),"firstUpdated",this).call(this),this.setAttribute("dir",g.E.document.dir)}},{kind:"method",key:"updated",value:function(t){(0,d.Z)((0,f.Z)(n.prototype),"updated",this).call(this,t),this.autogrow&&t.has("value")&&(this.mdcRoot.dataset.value=this.value+'=​"')}},{kind:"field",static:!0,key:"styles",value:function(){return[v.W,y.W,(0,p.iv)(r||(r=(0,i.Z)([":host([autogrow]) .mdc-text-field{position:relative;min-height:74px;min-width:178px;max-height:200px}:host([autogrow]) .mdc-text-field:after{content:attr(data-value);margin-top:23px;margin-bottom:9px;line-height:1.5rem;min-height:42px;padding:0px 32px 0 16px;letter-spacing:var(\n          --mdc-typography-subtitle1-letter-spacing,\n          .009375em\n        );visibility:hidden;white-space:pre-wrap}:host([autogrow]) .mdc-text-field__input{position:absolute;height:calc(100% - 32px)}:host([autogrow]) .mdc-text-field.mdc-text-field--no-label:after{margin-top:16px;margin-bottom:16px}:host([dir=rtl]) .mdc-floating-label{right:16px;left:initial}"])))]}}]}}),h.O)},92599:function(t,e,n){n.d(e,{iI:function(){return i},oT:function(){return r}});n(99312),n(81043),n(83609),n(97393),n(46349),n(70320),n(22859),n(85717),n(46798),n(47084),n(88770),n(40271),n(60163),n(2094),"".concat(location.protocol,"//").concat(location.host);var r=function(t){return t.map((function(t){if("string"!==t.type)return t;switch(t.name){case"username":return Object.assign(Object.assign({},t),{},{autocomplete:"username"});case"password":return Object.assign(Object.assign({},t),{},{autocomplete:"current-password"});case"code":return Object.assign(Object.assign({},t),{},{autocomplete:"one-time-code"});default:return t}}))},i=function(t,e){return t.callWS({type:"auth/sign_path",path:e})}},19418:function(t,e,n){n.d(e,{Gd:function(){return r},J8:function(){return o},Xm:function(){return i}});n(85717),n(38480);var r=function(t){if("condition"in t&&Array.isArray(t.condition))return{condition:"and",conditions:t.condition};for(var e=0,n=["and","or","not"];e<n.length;e++){var r=n[e];if(r in t)return{condition:r,conditions:t[r]}}return t},i=function(t,e,n,r){return t.connection.subscribeMessage(e,{type:"subscribe_trigger",trigger:n,variables:r})},o=function(t,e,n){return t.callWS({type:"test_condition",condition:e,variables:n})}},44553:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function d(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{d({},"")}catch(t){d=function(t,e,n){return t[e]=n}}function f(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new j(r||[]);return a(o,"_invoke",{value:O(t,n,c)}),o}function h(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=f;var v="suspendedStart",y="suspendedYield",p="executing",m="completed",g={};function b(){}function _(){}function k(){}var w={};d(w,s,(function(){return this}));var x=Object.getPrototypeOf,Z=x&&x(x(N([])));Z&&Z!==n&&o.call(Z,s)&&(w=Z);var C=k.prototype=b.prototype=Object.create(w);function S(t){["next","throw","return"].forEach((function(e){d(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=h(t[i],t,a);if("throw"!==u.type){var l=u.arg,d=l.value;return d&&"object"==r(d)&&o.call(d,"__await")?e.resolve(d.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(d).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function O(e,n,r){var i=v;return function(o,a){if(i===p)throw new Error("Generator is already running");if(i===m){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=z(c,r);if(s){if(s===g)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=p;var u=h(e,n,r);if("normal"===u.type){if(i=r.done?m:y,u.arg===g)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=m,r.method="throw",r.arg=u.arg)}}}function z(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,z(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var o=h(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,g;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function A(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function L(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function j(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(A,this),this.reset(!0)}function N(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=k,a(C,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:_,configurable:!0}),_.displayName=d(k,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,k):(t.__proto__=k,d(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},S(E.prototype),d(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(f(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},S(C),d(C,l,"Generator"),d(C,s,(function(){return this})),d(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=N,j.prototype={constructor:j,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(L),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),L(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;L(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:N(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function o(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,i,o,a,c=[],s=!0,u=!1;try{if(o=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=o.call(n)).done)&&(c.push(r.value),c.length!==e);s=!0);}catch(t){u=!0,i=t}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return c}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);"Object"===n&&t.constructor&&(n=t.constructor.name);if("Map"===n||"Set"===n)return Array.from(t);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function c(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,r=(t=i().mark((function t(r,a){var c,s,u,l,d,f,h,v,y,p,m,g,b,_,k,w,x,Z,C,S,E;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{R:function(){return Z},m:function(){return S}}),c=n(40039),n(76843),n(51358),n(46798),n(98490),n(36513),n(94570),n(88770),n(45882),n(37724),n(46349),n(70320),n(40271),n(60163),n(88640),n(27392),n(97393),n(63789),n(18098),s=n(4771),u=n(57128),l=n(91289),d=n(93312),f=n(73908),h=n(2733),v=n(23216),y=n(25917),p=n(86603),!(m=r([u,l,f,v,p])).then){t.next=56;break}return t.next=52,m;case 52:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=57;break;case 56:t.t0=m;case 57:g=t.t0,b=o(g,5),u=b[0],l=b[1],f=b[2],v=b[3],p=b[4],_="ui.panel.config.automation.editor.triggers.type",k="ui.panel.config.automation.editor.conditions.type",w=function(t,e){return"number"==typeof e?(0,d.Z)(e):"string"==typeof e?e:(0,u.L)(t,e)},x=function(t,e,n){var r=t.split(":");if(r.length<2||r.length>3)return t;try{var i=new Date("1970-01-01T"+t);return 2===r.length||0===Number(r[2])?(0,l.mr)(i,e,n):(0,l.Vu)(i,e,n)}catch(o){return t}},Z=function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]&&arguments[3];try{return C(t,e,n,r)}catch(o){console.error(o);var i="Error in describing trigger";return o.message&&(i+=": "+o.message),i}},C=function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(t.alias&&!r)return t.alias;if("event"===t.platform&&t.event_type){var i=[];if(Array.isArray(t.event_type)){var o,a=(0,c.Z)(t.event_type.values());try{for(a.s();!(o=a.n()).done;){var u=o.value;i.push(u)}}catch(At){a.e(At)}finally{a.f()}}else i.push(t.event_type);var l=(0,p.u)(e.locale,i);return e.localize("".concat(_,".event.description.full"),{eventTypes:l})}if("homeassistant"===t.platform&&t.event)return e.localize("start"===t.event?"".concat(_,".homeassistant.description.started"):"".concat(_,".homeassistant.description.shutdown"));if("numeric_state"===t.platform&&t.entity_id){var v=[],m=e.states,g=Array.isArray(t.entity_id)?e.states[t.entity_id[0]]:e.states[t.entity_id];if(Array.isArray(t.entity_id)){var b,k=(0,c.Z)(t.entity_id.values());try{for(k.s();!(b=k.n()).done;){var Z=b.value;m[Z]&&v.push((0,h.C)(m[Z])||Z)}}catch(At){k.e(At)}finally{k.f()}}else t.entity_id&&v.push(m[t.entity_id]?(0,h.C)(m[t.entity_id]):t.entity_id);var C=t.attribute?(0,f.S)(e.localize,g,e.entities,t.attribute):void 0,S=t.for?w(e.locale,t.for):void 0;if(void 0!==t.above&&void 0!==t.below)return e.localize("".concat(_,".numeric_state.description.above-below"),{attribute:C,entity:(0,p.u)(e.locale,v),numberOfEntities:v.length,above:t.above,below:t.below,duration:S});if(void 0!==t.above)return e.localize("".concat(_,".numeric_state.description.above"),{attribute:C,entity:(0,p.u)(e.locale,v),numberOfEntities:v.length,above:t.above,duration:S});if(void 0!==t.below)return e.localize("".concat(_,".numeric_state.description.below"),{attribute:C,entity:(0,p.u)(e.locale,v),numberOfEntities:v.length,below:t.below,duration:S})}if("state"===t.platform){var E="When",O=[],z=e.states;if(t.attribute){var A=Array.isArray(t.entity_id)?e.states[t.entity_id[0]]:e.states[t.entity_id];E+=" ".concat((0,f.S)(e.localize,A,e.entities,t.attribute)," of")}if(Array.isArray(t.entity_id)){var L,j=(0,c.Z)(t.entity_id.values());try{for(j.s();!(L=j.n()).done;){var N=L.value;z[N]&&O.push((0,h.C)(z[N])||N)}}catch(At){j.e(At)}finally{j.f()}}else t.entity_id&&O.push(z[t.entity_id]?(0,h.C)(z[t.entity_id]):t.entity_id);0===O.length&&O.push("something"),E+=" ".concat(O," changes");var I=e.states[Array.isArray(t.entity_id)?t.entity_id[0]:t.entity_id];if(void 0!==t.from)if(null===t.from)t.attribute||(E+=" from any state");else if(Array.isArray(t.from)){var T,P=[],B=(0,c.Z)(t.from.values());try{for(B.s();!(T=B.n()).done;){var D=T.value;P.push(t.attribute?e.formatEntityAttributeValue(I,t.attribute,D).toString():e.formatEntityState(I,D))}}catch(At){B.e(At)}finally{B.f()}if(0!==P.length){var M=(0,p.u)(e.locale,P);E+=" from ".concat(M)}}else E+=" from ".concat(t.attribute?e.formatEntityAttributeValue(I,t.attribute,t.from).toString():e.formatEntityState(I,t.from.toString()).toString());if(void 0!==t.to)if(null===t.to)t.attribute||(E+=" to any state");else if(Array.isArray(t.to)){var F,V=[],G=(0,c.Z)(t.to.values());try{for(G.s();!(F=G.n()).done;){var W=F.value;V.push(t.attribute?e.formatEntityAttributeValue(I,t.attribute,W).toString():e.formatEntityState(I,W).toString())}}catch(At){G.e(At)}finally{G.f()}if(0!==V.length){var U=(0,p.u)(e.locale,V);E+=" to ".concat(U)}}else E+=" to ".concat(t.attribute?e.formatEntityAttributeValue(I,t.attribute,t.to).toString():e.formatEntityState(I,t.to.toString()));if(t.attribute||void 0!==t.from||void 0!==t.to||(E+=" state or any attributes"),t.for){var R=w(e.locale,t.for);R&&(E+=" for ".concat(R))}return E}if("sun"===t.platform&&t.event){var q="";return t.offset&&(q="number"==typeof t.offset?(0,d.Z)(t.offset):"string"==typeof t.offset?t.offset:JSON.stringify(t.offset)),e.localize("sunset"===t.event?"".concat(_,".sun.description.sets"):"".concat(_,".sun.description.rises"),{hasDuration:""!==q?"true":"false",duration:q})}if("tag"===t.platform)return e.localize("".concat(_,".tag.description.full"));if("time"===t.platform&&t.at){var J=(0,s.r)(t.at).map((function(t){return"string"!=typeof t?t:t.includes(".")?"entity ".concat(e.states[t]?(0,h.C)(e.states[t]):t):x(t,e.locale,e.config)}));return e.localize("".concat(_,".time.description.full"),{time:(0,p.u)(e.locale,J)})}if("time_pattern"===t.platform){if(!t.seconds&&!t.minutes&&!t.hours)return e.localize("".concat(_,".time_pattern.description.initial"));var K=[],X="other",H="other",Y="other",$=0,Q=0,tt=0;if(void 0!==t.seconds){var et="*"===t.seconds,nt="string"==typeof t.seconds&&t.seconds.startsWith("/");$=et?0:"number"==typeof t.seconds?t.seconds:nt?parseInt(t.seconds.substring(1)):parseInt(t.seconds),(isNaN($)||$>59||$<0||nt&&0===$)&&K.push("seconds"),X=et||nt&&1===$?"every":nt?"every_interval":"on_the_xth"}if(void 0!==t.minutes){var rt="*"===t.minutes,it="string"==typeof t.minutes&&t.minutes.startsWith("/");Q=rt?0:"number"==typeof t.minutes?t.minutes:it?parseInt(t.minutes.substring(1)):parseInt(t.minutes),(isNaN(Q)||Q>59||Q<0||it&&0===Q)&&K.push("minutes"),H=rt||it&&1===Q?"every":it?"every_interval":void 0!==t.seconds?"has_seconds":"on_the_xth"}else void 0!==t.seconds&&(void 0!==t.hours?(Q=0,H="has_seconds"):H="every");if(void 0!==t.hours){var ot="*"===t.hours,at="string"==typeof t.hours&&t.hours.startsWith("/");tt=ot?0:"number"==typeof t.hours?t.hours:at?parseInt(t.hours.substring(1)):parseInt(t.hours),(isNaN(tt)||tt>23||tt<0||at&&0===tt)&&K.push("hours"),Y=ot||at&&1===tt?"every":at?"every_interval":void 0!==t.seconds||void 0!==t.minutes?"has_seconds_or_minutes":"on_the_xth"}else Y="every";return 0!==K.length?e.localize("".concat(_,".time_pattern.description.invalid"),{parts:(0,p.z)(e.locale,K.map((function(t){return e.localize("".concat(_,".time_pattern.").concat(t))})))}):e.localize("".concat(_,".time_pattern.description.full"),{secondsChoice:X,minutesChoice:H,hoursChoice:Y,seconds:$,minutes:Q,hours:tt,secondsWithOrdinal:e.localize("".concat(_,".time_pattern.description.ordinal"),{part:$}),minutesWithOrdinal:e.localize("".concat(_,".time_pattern.description.ordinal"),{part:Q}),hoursWithOrdinal:e.localize("".concat(_,".time_pattern.description.ordinal"),{part:tt})})}if("zone"===t.platform&&t.entity_id&&t.zone){var ct=[],st=[],ut=e.states;if(Array.isArray(t.entity_id)){var lt,dt=(0,c.Z)(t.entity_id.values());try{for(dt.s();!(lt=dt.n()).done;){var ft=lt.value;ut[ft]&&ct.push((0,h.C)(ut[ft])||ft)}}catch(At){dt.e(At)}finally{dt.f()}}else ct.push(ut[t.entity_id]?(0,h.C)(ut[t.entity_id]):t.entity_id);if(Array.isArray(t.zone)){var ht,vt=(0,c.Z)(t.zone.values());try{for(vt.s();!(ht=vt.n()).done;){var yt=ht.value;ut[yt]&&st.push((0,h.C)(ut[yt])||yt)}}catch(At){vt.e(At)}finally{vt.f()}}else st.push(ut[t.zone]?(0,h.C)(ut[t.zone]):t.zone);return e.localize("".concat(_,".zone.description.full"),{entity:(0,p.u)(e.locale,ct),event:t.event.toString(),zone:(0,p.u)(e.locale,st),numberOfZones:st.length})}if("geo_location"===t.platform&&t.source&&t.zone){var pt=[],mt=[],gt=e.states;if(Array.isArray(t.source)){var bt,_t=(0,c.Z)(t.source.values());try{for(_t.s();!(bt=_t.n()).done;){var kt=bt.value;pt.push(kt)}}catch(At){_t.e(At)}finally{_t.f()}}else pt.push(t.source);if(Array.isArray(t.zone)){var wt,xt=(0,c.Z)(t.zone.values());try{for(xt.s();!(wt=xt.n()).done;){var Zt=wt.value;gt[Zt]&&mt.push((0,h.C)(gt[Zt])||Zt)}}catch(At){xt.e(At)}finally{xt.f()}}else mt.push(gt[t.zone]?(0,h.C)(gt[t.zone]):t.zone);return e.localize("".concat(_,".geo_location.description.full"),{source:(0,p.u)(e.locale,pt),event:t.event.toString(),zone:(0,p.u)(e.locale,mt),numberOfZones:mt.length})}if("mqtt"===t.platform)return e.localize("".concat(_,".mqtt.description.full"));if("template"===t.platform){var Ct,St="";return t.for&&(St=null!==(Ct=w(e.locale,t.for))&&void 0!==Ct?Ct:""),e.localize("".concat(_,".template.description.full"),{hasDuration:""!==St?"true":"false",duration:St})}if("webhook"===t.platform)return e.localize("".concat(_,".webhook.description.full"));if("conversation"===t.platform)return t.command?e.localize("".concat(_,".conversation.description.full"),{sentence:(0,p.u)(e.locale,(0,s.r)(t.command).map((function(t){return"'".concat(t,"'")})))}):e.localize("".concat(_,".conversation.description.empty"));if("persistent_notification"===t.platform)return e.localize("".concat(_,".persistent_notification.description.full"));if("device"===t.platform&&t.device_id){var Et=t,Ot=(0,y.KL)(e,n,Et);if(Ot)return Ot;var zt=e.states[Et.entity_id];return"".concat(zt?(0,h.C)(zt):Et.entity_id," ").concat(Et.type)}return e.localize("ui.panel.config.automation.editor.triggers.type.".concat(t.platform,".label"))||e.localize("ui.panel.config.automation.editor.triggers.unknown_trigger")},S=function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]&&arguments[3];try{return E(t,e,n,r)}catch(o){console.error(o);var i="Error in describing condition";return o.message&&(i+=": "+o.message),i}},E=function(t,e,n){var r=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(t.alias&&!r)return t.alias;if(!t.condition)for(var i=0,o=["and","or","not"];i<o.length;i++){var a=o[i];a in t&&(0,s.r)(t[a])&&(t={condition:a,conditions:t[a]})}if("or"===t.condition){var u=(0,s.r)(t.conditions);if(!u||0===u.length)return e.localize("".concat(k,".or.description.no_conditions"));var l=u.length;return e.localize("".concat(k,".or.description.full"),{count:l})}if("and"===t.condition){var v=(0,s.r)(t.conditions);if(!v||0===v.length)return e.localize("".concat(k,".and.description.no_conditions"));var m=v.length;return e.localize("".concat(k,".and.description.full"),{count:m})}if("not"===t.condition){var g=(0,s.r)(t.conditions);return g&&0!==g.length?1===g.length?e.localize("".concat(k,".not.description.one_condition")):e.localize("".concat(k,".not.description.full"),{count:g.length}):e.localize("".concat(k,".not.description.no_conditions"))}if("state"===t.condition){if(!t.entity_id)return e.localize("".concat(k,".state.description.no_entity"));var b="";if(t.attribute){var _=Array.isArray(t.entity_id)?e.states[t.entity_id[0]]:e.states[t.entity_id];b=(0,f.S)(e.localize,_,e.entities,t.attribute)}var Z=[];if(Array.isArray(t.entity_id)){var C,S=(0,c.Z)(t.entity_id.values());try{for(S.s();!(C=S.n()).done;){var E=C.value;e.states[E]&&Z.push((0,h.C)(e.states[E])||E)}}catch(at){S.e(at)}finally{S.f()}}else t.entity_id&&Z.push(e.states[t.entity_id]?(0,h.C)(e.states[t.entity_id]):t.entity_id);var O=[],z=e.states[Array.isArray(t.entity_id)?t.entity_id[0]:t.entity_id];if(Array.isArray(t.state)){var A,L=(0,c.Z)(t.state.values());try{for(L.s();!(A=L.n()).done;){var j=A.value;O.push(t.attribute?e.formatEntityAttributeValue(z,t.attribute,j).toString():e.formatEntityState(z,j))}}catch(at){L.e(at)}finally{L.f()}}else""!==t.state&&O.push(t.attribute?e.formatEntityAttributeValue(z,t.attribute,t.state).toString():e.formatEntityState(z,t.state.toString()));var N="";return t.for&&(N=w(e.locale,t.for)||""),e.localize("".concat(k,".state.description.full"),{hasAttribute:""!==b?"true":"false",attribute:b,numberOfEntities:Z.length,entities:"any"===t.match?(0,p.u)(e.locale,Z):(0,p.z)(e.locale,Z),numberOfStates:O.length,states:(0,p.u)(e.locale,O),hasDuration:""!==N?"true":"false",duration:N})}if("numeric_state"===t.condition&&t.entity_id){var I=e.states[t.entity_id],T=I?(0,h.C)(I):t.entity_id,P=t.attribute?(0,f.S)(e.localize,I,e.entities,t.attribute):void 0;if(t.above&&t.below)return e.localize("".concat(k,".numeric_state.description.above-below"),{attribute:P,entity:T,above:t.above,below:t.below});if(t.above)return e.localize("".concat(k,".numeric_state.description.above"),{attribute:P,entity:T,above:t.above});if(t.below)return e.localize("".concat(k,".numeric_state.description.below"),{attribute:P,entity:T,below:t.below})}if("time"===t.condition){var B=(0,s.r)(t.weekday),D=B&&B.length>0&&B.length<7;if(t.before||t.after||D){var M="string"!=typeof t.before?t.before:t.before.includes(".")?"entity ".concat(e.states[t.before]?(0,h.C)(e.states[t.before]):t.before):x(t.before,e.locale,e.config),F="string"!=typeof t.after?t.after:t.after.includes(".")?"entity ".concat(e.states[t.after]?(0,h.C)(e.states[t.after]):t.after):x(t.after,e.locale,e.config),V=[];D&&(V=B.map((function(t){return e.localize("ui.panel.config.automation.editor.conditions.type.time.weekdays.".concat(t))})));var G="";return void 0!==F&&void 0!==M?G="after_before":void 0!==F?G="after":void 0!==M&&(G="before"),e.localize("".concat(k,".time.description.full"),{hasTime:G,hasTimeAndDay:(F||M)&&D?"true":"false",hasDay:D?"true":"false",time_before:M,time_after:F,day:(0,p.u)(e.locale,V)})}}if("sun"===t.condition&&("before"in t||"after"in t)){var W="Confirm";if(!t.after&&!t.before)return W+=" sun";if(W+=" sun",t.after){var U="";t.after_offset&&(U="number"==typeof t.after_offset?" offset by ".concat((0,d.Z)(t.after_offset)):"string"==typeof t.after_offset?" offset by ".concat(t.after_offset):" offset by ".concat(JSON.stringify(t.after_offset))),W+=" after ".concat(t.after).concat(U)}if(t.before){var R="";t.before_offset&&(R="number"==typeof t.before_offset?" offset by ".concat((0,d.Z)(t.before_offset)):"string"==typeof t.before_offset?" offset by ".concat(t.before_offset):" offset by ".concat(JSON.stringify(t.before_offset))),W+=" before ".concat(t.before).concat(R)}return W}if("zone"===t.condition&&t.entity_id&&t.zone){var q=[],J=[],K=e.states;if(Array.isArray(t.entity_id)){var X,H=(0,c.Z)(t.entity_id.values());try{for(H.s();!(X=H.n()).done;){var Y=X.value;K[Y]&&q.push((0,h.C)(K[Y])||Y)}}catch(at){H.e(at)}finally{H.f()}}else q.push(K[t.entity_id]?(0,h.C)(K[t.entity_id]):t.entity_id);if(Array.isArray(t.zone)){var $,Q=(0,c.Z)(t.zone.values());try{for(Q.s();!($=Q.n()).done;){var tt=$.value;K[tt]&&J.push((0,h.C)(K[tt])||tt)}}catch(at){Q.e(at)}finally{Q.f()}}else J.push(K[t.zone]?(0,h.C)(K[t.zone]):t.zone);var et=(0,p.u)(e.locale,q),nt=(0,p.u)(e.locale,J);return e.localize("".concat(k,".zone.description.full"),{entity:et,numberOfEntities:q.length,zone:nt,numberOfZones:J.length})}if("device"===t.condition&&t.device_id){var rt=t,it=(0,y.b2)(e,n,rt);if(it)return it;var ot=e.states[rt.entity_id];return"".concat(ot?(0,h.C)(ot):rt.entity_id," ").concat(rt.type)}return"template"===t.condition?e.localize("".concat(k,".template.description.full")):"trigger"===t.condition&&null!=t.id?e.localize("".concat(k,".trigger.description.full"),{id:(0,p.u)(e.locale,(0,s.r)(t.id).map((function(t){return t.toString()})))}):e.localize("ui.panel.config.automation.editor.conditions.type.".concat(t.condition,".label"))||e.localize("ui.panel.config.automation.editor.conditions.unknown_condition")},a(),t.next=78;break;case 75:t.prev=75,t.t2=t.catch(0),a(t.t2);case 78:case"end":return t.stop()}}),t,null,[[0,75]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var o=t.apply(e,n);function a(t){c(o,r,i,a,s,"next",t)}function s(t){c(o,r,i,a,s,"throw",t)}a(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},59449:function(t,e,n){n.d(e,{w:function(){return r}});n(85717);var r=function(t,e){return t.callWS(Object.assign({type:"validate_config"},e))}},38149:function(t,e,n){n.d(e,{we:function(){return i}});var r=n(98830),i=((0,r.kr)("connection"),(0,r.kr)("states"),(0,r.kr)("entities"),(0,r.kr)("devices"),(0,r.kr)("areas"),(0,r.kr)("localize"),(0,r.kr)("locale"),(0,r.kr)("config"),(0,r.kr)("themes"),(0,r.kr)("selectedTheme"),(0,r.kr)("user"),(0,r.kr)("userData"),(0,r.kr)("panels"),(0,r.kr)("extendedEntities"))},25917:function(t,e,n){n.d(e,{AG:function(){return a},Gg:function(){return c},KL:function(){return g},_2:function(){return p},_K:function(){return u},b2:function(){return m},dA:function(){return l},h6:function(){return b},hA:function(){return d},hH:function(){return h},r3:function(){return s}});var r=n(76775),i=(n(40271),n(60163),n(23994),n(97393),n(2733)),o=n(15306),a=function(t,e){return t.callWS({type:"device_automation/action/list",device_id:e})},c=function(t,e){return t.callWS({type:"device_automation/condition/list",device_id:e})},s=function(t,e){return t.callWS({type:"device_automation/trigger/list",device_id:e})},u=function(t,e){return t.callWS({type:"device_automation/action/capabilities",action:e})},l=function(t,e){return t.callWS({type:"device_automation/condition/capabilities",condition:e})},d=function(t,e){return t.callWS({type:"device_automation/trigger/capabilities",trigger:e})},f=["device_id","domain","entity_id","type","subtype","event","condition","platform"],h=function(t,e,n){if((0,r.Z)(e)!==(0,r.Z)(n))return!1;for(var i in e){var o,a;if(f.includes(i))if("entity_id"!==i||(null===(o=e[i])||void 0===o?void 0:o.includes("."))===(null===(a=n[i])||void 0===a?void 0:a.includes("."))){if(!Object.is(e[i],n[i]))return!1}else if(!v(t,e[i],n[i]))return!1}for(var c in n){var s,u;if(f.includes(c))if("entity_id"!==c||(null===(s=e[c])||void 0===s?void 0:s.includes("."))===(null===(u=n[c])||void 0===u?void 0:u.includes("."))){if(!Object.is(e[c],n[c]))return!1}else if(!v(t,e[c],n[c]))return!1}return!0},v=function(t,e,n){return!(!e||!n)&&(e.includes(".")&&(e=(0,o.w1)(t)[e].id),n.includes(".")&&(n=(0,o.w1)(t)[n].id),e===n)},y=function(t,e,n){if(!n)return"<unknown entity>";if(n.includes(".")){var r=t.states[n];return r?(0,i.C)(r):n}var a=(0,o.Mw)(e)[n];return a?(0,o.vA)(t,a)||n:"<unknown entity>"},p=function(t,e,n){return t.localize("component.".concat(n.domain,".device_automation.action_type.").concat(n.type),{entity_name:y(t,e,n.entity_id),subtype:n.subtype?t.localize("component.".concat(n.domain,".device_automation.action_subtype.").concat(n.subtype))||n.subtype:""})||(n.subtype?'"'.concat(n.subtype,'" ').concat(n.type):n.type)},m=function(t,e,n){return t.localize("component.".concat(n.domain,".device_automation.condition_type.").concat(n.type),{entity_name:y(t,e,n.entity_id),subtype:n.subtype?t.localize("component.".concat(n.domain,".device_automation.condition_subtype.").concat(n.subtype))||n.subtype:""})||(n.subtype?'"'.concat(n.subtype,'" ').concat(n.type):n.type)},g=function(t,e,n){return t.localize("component.".concat(n.domain,".device_automation.trigger_type.").concat(n.type),{entity_name:y(t,e,n.entity_id),subtype:n.subtype?t.localize("component.".concat(n.domain,".device_automation.trigger_subtype.").concat(n.subtype))||n.subtype:""})||(n.subtype?'"'.concat(n.subtype,'" ').concat(n.type):n.type)},b=function(t,e){var n,r,i,o;return null===(n=t.metadata)||void 0===n||!n.secondary||null!==(r=e.metadata)&&void 0!==r&&r.secondary?null!==(i=t.metadata)&&void 0!==i&&i.secondary||null===(o=e.metadata)||void 0===o||!o.secondary?0:-1:1}},21157:function(t,e,n){n.d(e,{PX:function(){return a},V_:function(){return c},nZ:function(){return i},rk:function(){return u}});var r=n(58135),i="unavailable",o="unknown",a="off",c=[i,o],s=[i,o,a],u=(0,r.z)(c);(0,r.z)(s)},15306:function(t,e,n){n.d(e,{vA:function(){return a},w1:function(){return c},Mw:function(){return s}});var r=n(40039),i=(n(37313),n(87438),n(46798),n(9849),n(22890),n(40271),n(56308),n(85472),n(90126),n(22859),n(85717),n(14516)),o=n(2733),a=(n(28858),n(36655),function(t,e){if(e.name)return e.name;var n=t.states[e.entity_id];return n?(0,o.C)(n):e.original_name?e.original_name:e.entity_id}),c=(0,i.Z)((function(t){var e,n={},i=(0,r.Z)(t);try{for(i.s();!(e=i.n()).done;){var o=e.value;n[o.entity_id]=o}}catch(a){i.e(a)}finally{i.f()}return n})),s=(0,i.Z)((function(t){var e,n={},i=(0,r.Z)(t);try{for(i.s();!(e=i.n()).done;){var o=e.value;n[o.id]=o}}catch(a){i.e(a)}finally{i.f()}return n}))},64082:function(t,e,n){n.d(e,{I:function(){return i},_:function(){return a}});n(51358),n(46798),n(47084),n(5239),n(98490);var r=n(18394),i="__paste__",o=function(){return Promise.all([n.e(6023),n.e(8597),n.e(2488),n.e(6581),n.e(3869)]).then(n.bind(n,13869))},a=function(t,e){(0,r.B)(t,"show-dialog",{dialogTag:"add-automation-element-dialog",dialogImport:o,dialogParams:e})}},21686:function(t,e,n){n.d(e,{G:function(){return i},H:function(){return o}});var r=n(38768),i=(0,r.Ry)({platform:(0,r.Z_)(),id:(0,r.jt)((0,r.Z_)()),enabled:(0,r.jt)((0,r.O7)())}),o=(0,r.Ry)({days:(0,r.jt)((0,r.Rx)()),hours:(0,r.jt)((0,r.Rx)()),minutes:(0,r.jt)((0,r.Rx)()),seconds:(0,r.jt)((0,r.Rx)())})},77251:function(t,e,n){n.d(e,{T:function(){return u},j:function(){return l}});var r=n(71650),i=n(33368),o=n(68308),a=n(82390),c=n(69205),s=(n(97393),n(85717),n(98830)),u=(0,s.kr)("reorder-mode"),l=function(t){return function(t){function e(){var t;(0,r.Z)(this,e);for(var n=arguments.length,i=new Array(n),c=0;c<n;c++)i[c]=arguments[c];return(t=(0,o.Z)(this,e,[].concat(i)))._reorderModeProvider=new s.HQ((0,a.Z)(t),{context:u,initialValue:{active:!1,enter:function(){t._reorderModeProvider.setValue(Object.assign(Object.assign({},t._reorderModeProvider.value),{},{active:!0})),t.requestUpdate("_reorderMode")},exit:function(){t._reorderModeProvider.setValue(Object.assign(Object.assign({},t._reorderModeProvider.value),{},{active:!1})),t.requestUpdate("_reorderMode")}}}),t}return(0,c.Z)(e,t),(0,i.Z)(e,[{key:"_reorderMode",get:function(){return this._reorderModeProvider.value}}]),e}(t)}}}]);
+//# sourceMappingURL=1660.VhXXDudoj5E.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 1706.J0oV_3HYRPc.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1706],{18601:function(t,e,n){n.d(e,{Wg:function(){return f},qN:function(){return p.q}});var o,r,i=n(71650),d=n(33368),a=n(68308),s=n(34541),l=n(47838),c=n(69205),u=(n(32797),n(5239),n(43204)),h=n(95260),p=n(78220),m=null!==(r=null===(o=window.ShadyDOM)||void 0===o?void 0:o.inUse)&&void 0!==r&&r,f=function(t){function e(){var t;return(0,i.Z)(this,e),(t=(0,a.Z)(this,e,arguments)).disabled=!1,t.containingForm=null,t.formDataListener=function(e){t.disabled||t.setFormData(e.formData)},t}return(0,c.Z)(e,t),(0,d.Z)(e,[{key:"findFormElement",value:function(){if(!this.shadowRoot||m)return null;for(var t=this.getRootNode().querySelectorAll("form"),e=0,n=Array.from(t);e<n.length;e++){var o=n[e];if(o.contains(this))return o}return null}},{key:"connectedCallback",value:function(){var t;(0,s.Z)((0,l.Z)(e.prototype),"connectedCallback",this).call(this),this.containingForm=this.findFormElement(),null===(t=this.containingForm)||void 0===t||t.addEventListener("formdata",this.formDataListener)}},{key:"disconnectedCallback",value:function(){var t;(0,s.Z)((0,l.Z)(e.prototype),"disconnectedCallback",this).call(this),null===(t=this.containingForm)||void 0===t||t.removeEventListener("formdata",this.formDataListener),this.containingForm=null}},{key:"click",value:function(){this.formElement&&!this.disabled&&(this.formElement.focus(),this.formElement.click())}},{key:"firstUpdated",value:function(){var t=this;(0,s.Z)((0,l.Z)(e.prototype),"firstUpdated",this).call(this),this.shadowRoot&&this.mdcRoot.addEventListener("change",(function(e){t.dispatchEvent(new Event("change",e))}))}}]),e}(p.H);f.shadowRootOptions={mode:"open",delegatesFocus:!0},(0,u.__decorate)([(0,h.Cb)({type:Boolean})],f.prototype,"disabled",void 0)},38341:function(t,e,n){n.d(e,{o:function(){return m}});var o=n(62746),r=n(71650),i=n(33368),d=n(68308),a=n(69205),s=(n(51467),n(43204)),l=n(72774),c={LABEL_FLOAT_ABOVE:"mdc-floating-label--float-above",LABEL_REQUIRED:"mdc-floating-label--required",LABEL_SHAKE:"mdc-floating-label--shake",ROOT:"mdc-floating-label"},u=function(t){function e(n){var o=t.call(this,(0,s.__assign)((0,s.__assign)({},e.defaultAdapter),n))||this;return o.shakeAnimationEndHandler=function(){o.handleShakeAnimationEnd()},o}return(0,s.__extends)(e,t),Object.defineProperty(e,"cssClasses",{get:function(){return c},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},getWidth:function(){return 0},registerInteractionHandler:function(){},deregisterInteractionHandler:function(){}}},enumerable:!1,configurable:!0}),e.prototype.init=function(){this.adapter.registerInteractionHandler("animationend",this.shakeAnimationEndHandler)},e.prototype.destroy=function(){this.adapter.deregisterInteractionHandler("animationend",this.shakeAnimationEndHandler)},e.prototype.getWidth=function(){return this.adapter.getWidth()},e.prototype.shake=function(t){var n=e.cssClasses.LABEL_SHAKE;t?this.adapter.addClass(n):this.adapter.removeClass(n)},e.prototype.float=function(t){var n=e.cssClasses,o=n.LABEL_FLOAT_ABOVE,r=n.LABEL_SHAKE;t?this.adapter.addClass(o):(this.adapter.removeClass(o),this.adapter.removeClass(r))},e.prototype.setRequired=function(t){var n=e.cssClasses.LABEL_REQUIRED;t?this.adapter.addClass(n):this.adapter.removeClass(n)},e.prototype.handleShakeAnimationEnd=function(){var t=e.cssClasses.LABEL_SHAKE;this.adapter.removeClass(t)},e}(l.K),h=n(57835),p=function(t){function e(t){var n;switch((0,r.Z)(this,e),(n=(0,d.Z)(this,e,[t])).foundation=null,n.previousPart=null,t.type){case h.pX.ATTRIBUTE:case h.pX.PROPERTY:break;default:throw new Error("FloatingLabel directive only support attribute and property parts")}return n}return(0,a.Z)(e,t),(0,i.Z)(e,[{key:"update",value:function(t,e){var n=(0,o.Z)(e,1)[0];if(t!==this.previousPart){this.foundation&&this.foundation.destroy(),this.previousPart=t;var r=t.element;r.classList.add("mdc-floating-label");var i=function(t){return{addClass:function(e){return t.classList.add(e)},removeClass:function(e){return t.classList.remove(e)},getWidth:function(){return t.scrollWidth},registerInteractionHandler:function(e,n){t.addEventListener(e,n)},deregisterInteractionHandler:function(e,n){t.removeEventListener(e,n)}}}(r);this.foundation=new u(i),this.foundation.init()}return this.render(n)}},{key:"render",value:function(t){return this.foundation}}]),e}(h.Xe),m=(0,h.XM)(p)},12335:function(t,e,n){n.d(e,{_:function(){return m}});var o=n(71650),r=n(33368),i=n(95281),d=n(68308),a=n(69205),s=(n(51467),n(43204)),l=n(72774),c={LINE_RIPPLE_ACTIVE:"mdc-line-ripple--active",LINE_RIPPLE_DEACTIVATING:"mdc-line-ripple--deactivating"},u=function(t){function e(n){var o=t.call(this,(0,s.__assign)((0,s.__assign)({},e.defaultAdapter),n))||this;return o.transitionEndHandler=function(t){o.handleTransitionEnd(t)},o}return(0,s.__extends)(e,t),Object.defineProperty(e,"cssClasses",{get:function(){return c},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},hasClass:function(){return!1},setStyle:function(){},registerEventHandler:function(){},deregisterEventHandler:function(){}}},enumerable:!1,configurable:!0}),e.prototype.init=function(){this.adapter.registerEventHandler("transitionend",this.transitionEndHandler)},e.prototype.destroy=function(){this.adapter.deregisterEventHandler("transitionend",this.transitionEndHandler)},e.prototype.activate=function(){this.adapter.removeClass(c.LINE_RIPPLE_DEACTIVATING),this.adapter.addClass(c.LINE_RIPPLE_ACTIVE)},e.prototype.setRippleCenter=function(t){this.adapter.setStyle("transform-origin",t+"px center")},e.prototype.deactivate=function(){this.adapter.addClass(c.LINE_RIPPLE_DEACTIVATING)},e.prototype.handleTransitionEnd=function(t){var e=this.adapter.hasClass(c.LINE_RIPPLE_DEACTIVATING);"opacity"===t.propertyName&&e&&(this.adapter.removeClass(c.LINE_RIPPLE_ACTIVE),this.adapter.removeClass(c.LINE_RIPPLE_DEACTIVATING))},e}(l.K),h=n(57835),p=function(t){function e(t){var n;switch((0,o.Z)(this,e),(n=(0,d.Z)(this,e,[t])).previousPart=null,n.foundation=null,t.type){case h.pX.ATTRIBUTE:case h.pX.PROPERTY:return(0,i.Z)(n);default:throw new Error("LineRipple only support attribute and property parts.")}return n}return(0,a.Z)(e,t),(0,r.Z)(e,[{key:"update",value:function(t,e){if(this.previousPart!==t){this.foundation&&this.foundation.destroy(),this.previousPart=t;var n=t.element;n.classList.add("mdc-line-ripple");var o=function(t){return{addClass:function(e){return t.classList.add(e)},removeClass:function(e){return t.classList.remove(e)},hasClass:function(e){return t.classList.contains(e)},setStyle:function(e,n){return t.style.setProperty(e,n)},registerEventHandler:function(e,n){t.addEventListener(e,n)},deregisterEventHandler:function(e,n){t.removeEventListener(e,n)}}}(n);this.foundation=new u(o),this.foundation.init()}return this.render()}},{key:"render",value:function(){return this.foundation}}]),e}(h.Xe),m=(0,h.XM)(p)},11027:function(t,e,n){var o,r,i=n(33368),d=n(71650),a=n(68308),s=n(69205),l=n(43204),c=n(95260),u=n(88962),h=(n(76843),n(78220)),p=n(72774),m={NOTCH_ELEMENT_SELECTOR:".mdc-notched-outline__notch"},f={NOTCH_ELEMENT_PADDING:8},_={NO_LABEL:"mdc-notched-outline--no-label",OUTLINE_NOTCHED:"mdc-notched-outline--notched",OUTLINE_UPGRADED:"mdc-notched-outline--upgraded"},v=function(t){function e(n){return t.call(this,(0,l.__assign)((0,l.__assign)({},e.defaultAdapter),n))||this}return(0,l.__extends)(e,t),Object.defineProperty(e,"strings",{get:function(){return m},enumerable:!1,configurable:!0}),Object.defineProperty(e,"cssClasses",{get:function(){return _},enumerable:!1,configurable:!0}),Object.defineProperty(e,"numbers",{get:function(){return f},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},setNotchWidthProperty:function(){},removeNotchWidthProperty:function(){}}},enumerable:!1,configurable:!0}),e.prototype.notch=function(t){var n=e.cssClasses.OUTLINE_NOTCHED;t>0&&(t+=f.NOTCH_ELEMENT_PADDING),this.adapter.setNotchWidthProperty(t),this.adapter.addClass(n)},e.prototype.closeNotch=function(){var t=e.cssClasses.OUTLINE_NOTCHED;this.adapter.removeClass(t),this.adapter.removeNotchWidthProperty()},e}(p.K),b=n(5095),g=n(53180),E=function(t){function e(){var t;return(0,d.Z)(this,e),(t=(0,a.Z)(this,e,arguments)).mdcFoundationClass=v,t.width=0,t.open=!1,t.lastOpen=t.open,t}return(0,s.Z)(e,t),(0,i.Z)(e,[{key:"createAdapter",value:function(){var t=this;return{addClass:function(e){return t.mdcRoot.classList.add(e)},removeClass:function(e){return t.mdcRoot.classList.remove(e)},setNotchWidthProperty:function(e){return t.notchElement.style.setProperty("width","".concat(e,"px"))},removeNotchWidthProperty:function(){return t.notchElement.style.removeProperty("width")}}}},{key:"openOrClose",value:function(t,e){this.mdcFoundation&&(t&&void 0!==e?this.mdcFoundation.notch(e):this.mdcFoundation.closeNotch())}},{key:"render",value:function(){this.openOrClose(this.open,this.width);var t=(0,g.$)({"mdc-notched-outline--notched":this.open});return(0,b.dy)(o||(o=(0,u.Z)([' <span class="mdc-notched-outline ','"> <span class="mdc-notched-outline__leading"></span> <span class="mdc-notched-outline__notch"> <slot></slot> </span> <span class="mdc-notched-outline__trailing"></span> </span>'])),t)}}]),e}(h.H);(0,l.__decorate)([(0,c.IO)(".mdc-notched-outline")],E.prototype,"mdcRoot",void 0),(0,l.__decorate)([(0,c.Cb)({type:Number})],E.prototype,"width",void 0),(0,l.__decorate)([(0,c.Cb)({type:Boolean,reflect:!0})],E.prototype,"open",void 0),(0,l.__decorate)([(0,c.IO)(".mdc-notched-outline__notch")],E.prototype,"notchElement",void 0);var y=(0,b.iv)(r||(r=(0,u.Z)([".mdc-notched-outline{display:flex;position:absolute;top:0;right:0;left:0;box-sizing:border-box;width:100%;max-width:100%;height:100%;text-align:left;pointer-events:none}.mdc-notched-outline[dir=rtl],[dir=rtl] .mdc-notched-outline{text-align:right}.mdc-notched-outline__leading,.mdc-notched-outline__notch,.mdc-notched-outline__trailing{box-sizing:border-box;height:100%;border-top:1px solid;border-bottom:1px solid;pointer-events:none}.mdc-notched-outline__leading{border-left:1px solid;border-right:none;width:12px}.mdc-notched-outline__leading[dir=rtl],[dir=rtl] .mdc-notched-outline__leading{border-left:none;border-right:1px solid}.mdc-notched-outline__trailing{border-left:none;border-right:1px solid;flex-grow:1}.mdc-notched-outline__trailing[dir=rtl],[dir=rtl] .mdc-notched-outline__trailing{border-left:1px solid;border-right:none}.mdc-notched-outline__notch{flex:0 0 auto;width:auto;max-width:calc(100% - 12px * 2)}.mdc-notched-outline .mdc-floating-label{display:inline-block;position:relative;max-width:100%}.mdc-notched-outline .mdc-floating-label--float-above{text-overflow:clip}.mdc-notched-outline--upgraded .mdc-floating-label--float-above{max-width:calc(100% / .75)}.mdc-notched-outline--notched .mdc-notched-outline__notch{padding-left:0;padding-right:8px;border-top:none}.mdc-notched-outline--notched .mdc-notched-outline__notch[dir=rtl],[dir=rtl] .mdc-notched-outline--notched .mdc-notched-outline__notch{padding-left:8px;padding-right:0}.mdc-notched-outline--no-label .mdc-notched-outline__notch{display:none}:host{display:block;position:absolute;right:0;left:0;box-sizing:border-box;width:100%;max-width:100%;height:100%;text-align:left;pointer-events:none}:host([dir=rtl]),[dir=rtl] :host{text-align:right}::slotted(.mdc-floating-label){display:inline-block;position:relative;top:17px;bottom:auto;max-width:100%}::slotted(.mdc-floating-label--float-above){text-overflow:clip}.mdc-notched-outline--upgraded ::slotted(.mdc-floating-label--float-above){max-width:calc(100% / .75)}.mdc-notched-outline .mdc-notched-outline__leading{border-top-left-radius:4px;border-top-left-radius:var(--mdc-shape-small,4px);border-top-right-radius:0;border-bottom-right-radius:0;border-bottom-left-radius:4px;border-bottom-left-radius:var(--mdc-shape-small,4px)}.mdc-notched-outline .mdc-notched-outline__leading[dir=rtl],[dir=rtl] .mdc-notched-outline .mdc-notched-outline__leading{border-top-left-radius:0;border-top-right-radius:4px;border-top-right-radius:var(--mdc-shape-small,4px);border-bottom-right-radius:4px;border-bottom-right-radius:var(--mdc-shape-small,4px);border-bottom-left-radius:0}@supports(top:max(0%)){.mdc-notched-outline .mdc-notched-outline__leading{width:max(12px,var(--mdc-shape-small,4px))}}@supports(top:max(0%)){.mdc-notched-outline .mdc-notched-outline__notch{max-width:calc(100% - max(12px,var(--mdc-shape-small,4px)) * 2)}}.mdc-notched-outline .mdc-notched-outline__trailing{border-top-left-radius:0;border-top-right-radius:4px;border-top-right-radius:var(--mdc-shape-small,4px);border-bottom-right-radius:4px;border-bottom-right-radius:var(--mdc-shape-small,4px);border-bottom-left-radius:0}.mdc-notched-outline .mdc-notched-outline__trailing[dir=rtl],[dir=rtl] .mdc-notched-outline .mdc-notched-outline__trailing{border-top-left-radius:4px;border-top-left-radius:var(--mdc-shape-small,4px);border-top-right-radius:0;border-bottom-right-radius:0;border-bottom-left-radius:4px;border-bottom-left-radius:var(--mdc-shape-small,4px)}.mdc-notched-outline__leading,.mdc-notched-outline__notch,.mdc-notched-outline__trailing{border-color:var(--mdc-notched-outline-border-color,var(--mdc-theme-primary,#6200ee));border-width:1px;border-width:var(--mdc-notched-outline-stroke-width,1px)}.mdc-notched-outline--notched .mdc-notched-outline__notch{padding-top:0;padding-top:var(--mdc-notched-outline-notch-offset,0)}"]))),C=function(t){function e(){return(0,d.Z)(this,e),(0,a.Z)(this,e,arguments)}return(0,s.Z)(e,t),(0,i.Z)(e)}(E);C.styles=[y],C=(0,l.__decorate)([(0,c.Mo)("mwc-notched-outline")],C)}}]);
+//# sourceMappingURL=1706.J0oV_3HYRPc.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 1848.nCTvwpagZy0.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1848],{13426:function(e,t,i){i.d(t,{J:function(){return a},_:function(){return o}});var r=i(76775),n=(i(63789),i(99397),i(10733),i(46798),i(9849),i(13526),/{%|{{/),a=function(e){return n.test(e)},o=function e(t){return!!t&&("string"==typeof t?a(t):"object"===(0,r.Z)(t)&&(Array.isArray(t)?t:Object.values(t)).some((function(t){return t&&e(t)})))}},41911:function(e,t,i){var r,n=i(88962),a=i(99312),o=i(81043),s=i(33368),u=i(71650),l=i(68308),c=i(82390),d=i(69205),h=i(91808),f=i(34541),g=i(47838),v=(i(97393),i(5095)),p=i(63335),m=i(21270),y=i(96762),b=i(95260),k=i(18394);(0,h.Z)([(0,b.Mo)("ha-check-list-item")],(function(e,t){var i,h=function(t){function i(){var t;(0,u.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,l.Z)(this,i,[].concat(n)),e((0,c.Z)(t)),t}return(0,d.Z)(i,t),(0,s.Z)(i)}(t);return{F:h,d:[{kind:"method",key:"onChange",value:(i=(0,o.Z)((0,a.Z)().mark((function e(t){return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:(0,f.Z)((0,g.Z)(h.prototype),"onChange",this).call(this,t),(0,k.B)(this,t.type);case 2:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"field",static:!0,key:"styles",value:function(){return[y.W,m.W,(0,v.iv)(r||(r=(0,n.Z)([":host{--mdc-theme-secondary:var(--primary-color)}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic,:host([graphic=control]) .mdc-deprecated-list-item__graphic,:host([graphic=large]) .mdc-deprecated-list-item__graphic,:host([graphic=medium]) .mdc-deprecated-list-item__graphic{margin-inline-end:var(--mdc-list-item-graphic-margin,16px);margin-inline-start:0px;direction:var(--direction)}.mdc-deprecated-list-item__meta{flex-shrink:0;direction:var(--direction);margin-inline-start:auto;margin-inline-end:0}.mdc-deprecated-list-item__graphic{margin-top:var(--check-list-item-graphic-margin-top)}"])))]}}]}}),p.F)},48950:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(8485)),h=i(92038),f=i(5095),g=i(95260),v=i(18394);(0,c.Z)([(0,g.Mo)("ha-formfield")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"_labelClick",value:function(){var e=this.input;if(e&&(e.focus(),!e.disabled))switch(e.tagName){case"HA-CHECKBOX":e.checked=!e.checked,(0,v.B)(e,"change");break;case"HA-RADIO":e.checked=!0,(0,v.B)(e,"change");break;default:e.click()}}},{kind:"field",static:!0,key:"styles",value:function(){return[h.W,(0,f.iv)(r||(r=(0,n.Z)([":host(:not([alignEnd])) ::slotted(ha-switch){margin-right:10px;margin-inline-end:10px;margin-inline-start:inline}.mdc-form-field>label{direction:var(--direction);margin-inline-start:0;margin-inline-end:auto;padding-inline-start:4px;padding-inline-end:0}"])))]}}]}}),d.a)},33202:function(e,t,i){var r,n,a,o,s,u,l,c,d,h,f=i(99312),g=i(81043),v=i(46097),p=i(88962),m=i(33368),y=i(71650),b=i(68308),k=i(82390),_=i(69205),w=i(91808),C=i(34541),Z=i(47838),x=(i(97393),i(46349),i(70320),i(87438),i(46798),i(9849),i(22890),i(40271),i(60163),i(85472),i(90126),i(41353),i(5095)),L=i(95260),A=i(92541),V=i(14516),M=i(18394),H=(i(85717),i(91989),i(17692),i(11451),i(36513),function(){var e=(0,g.Z)((0,f.Z)().mark((function e(t){return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.abrupt("return",t.callWS({type:"config/auth/list"}));case 1:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}()),E=(i(54371),i(37313),i(22859),i(44577),i(28858)),O=(i(71133),i(10733),i(53180)),j=i(86634),z=i(3850),S=((0,w.Z)([(0,L.Mo)("ha-user-badge")],(function(e,t){var i=function(t){function i(){var t;(0,y.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,b.Z)(this,i,[].concat(n)),e((0,k.Z)(t)),t}return(0,_.Z)(i,t),(0,m.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,L.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,L.Cb)({attribute:!1})],key:"user",value:void 0},{kind:"field",decorators:[(0,L.SB)()],key:"_personPicture",value:void 0},{kind:"field",key:"_personEntityId",value:void 0},{kind:"method",key:"willUpdate",value:function(e){if((0,C.Z)((0,Z.Z)(i.prototype),"willUpdate",this).call(this,e),e.has("user"))this._getPersonPicture();else{var t=e.get("hass");if(this._personEntityId&&t&&this.hass.states[this._personEntityId]!==t.states[this._personEntityId]){var r=this.hass.states[this._personEntityId];r?this._personPicture=r.attributes.entity_picture:this._getPersonPicture()}else!this._personEntityId&&t&&this._getPersonPicture()}}},{kind:"method",key:"render",value:function(){if(!this.hass||!this.user)return x.Ld;var e=this._personPicture;if(e)return(0,x.dy)(r||(r=(0,p.Z)(['<div style="','" class="picture"></div>'])),(0,j.V)({backgroundImage:"url(".concat(e,")")}));var t,i=(t=this.user.name)?t.trim().split(" ").slice(0,3).map((function(e){return e.substring(0,1)})).join(""):"?";return(0,x.dy)(n||(n=(0,p.Z)(['<div class="initials ','"> '," </div>"])),(0,O.$)({long:i.length>2}),i)}},{kind:"method",key:"_getPersonPicture",value:function(){if(this._personEntityId=void 0,this._personPicture=void 0,this.hass&&this.user)for(var e=0,t=Object.values(this.hass.states);e<t.length;e++){var i=t[e];if(i.attributes.user_id===this.user.id&&"person"===(0,z.N)(i)){this._personEntityId=i.entity_id,this._personPicture=i.attributes.entity_picture;break}}}},{kind:"get",static:!0,key:"styles",value:function(){return(0,x.iv)(a||(a=(0,p.Z)([":host{display:contents}.picture{width:40px;height:40px;background-size:cover;border-radius:50%}.initials{display:inline-block;box-sizing:border-box;width:40px;line-height:40px;border-radius:50%;text-align:center;background-color:var(--light-primary-color);text-decoration:none;color:var(--text-light-primary-color,var(--primary-text-color));overflow:hidden}.initials.long{font-size:80%}"])))}}]}}),x.oi),i(90532),(0,w.Z)(null,(function(e,t){var i=function(t){function i(){var t;(0,y.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,b.Z)(this,i,[].concat(n)),e((0,k.Z)(t)),t}return(0,_.Z)(i,t),(0,m.Z)(i)}(t);return{F:i,d:[{kind:"field",key:"hass",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"noUserLabel",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"value",value:function(){return""}},{kind:"field",decorators:[(0,L.Cb)()],key:"users",value:void 0},{kind:"field",decorators:[(0,L.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_sortedUsers",value:function(){var e=this;return(0,V.Z)((function(t){return t?t.filter((function(e){return!e.system_generated})).sort((function(t,i){return(0,E.$)(t.name,i.name,e.hass.locale.language)})):[]}))}},{kind:"method",key:"render",value:function(){var e,t,i=this;return(0,x.dy)(o||(o=(0,p.Z)([' <ha-select .label="','" .disabled="','" .value="','" @selected="','"> '," "," </ha-select> "])),this.label,this.disabled,this.value,this._userChanged,0===(null===(e=this.users)||void 0===e?void 0:e.length)?(0,x.dy)(s||(s=(0,p.Z)(['<mwc-list-item value=""> '," </mwc-list-item>"])),this.noUserLabel||(null===(t=this.hass)||void 0===t?void 0:t.localize("ui.components.user-picker.no_user"))):"",this._sortedUsers(this.users).map((function(e){return(0,x.dy)(u||(u=(0,p.Z)([' <ha-list-item graphic="avatar" .value="','"> <ha-user-badge .hass="','" .user="','" slot="graphic"></ha-user-badge> '," </ha-list-item> "])),e.id,i.hass,e,e.name)})))}},{kind:"method",key:"firstUpdated",value:function(e){var t=this;(0,C.Z)((0,Z.Z)(i.prototype),"firstUpdated",this).call(this,e),void 0===this.users&&H(this.hass).then((function(e){t.users=e}))}},{kind:"method",key:"_userChanged",value:function(e){var t=this,i=e.target.value;i!==this.value&&(this.value=i,setTimeout((function(){(0,M.B)(t,"value-changed",{value:i}),(0,M.B)(t,"change")}),0))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,x.iv)(l||(l=(0,p.Z)([":host{display:inline-block}mwc-list{display:block}"])))}}]}}),x.oi));customElements.define("ha-user-picker",S);(0,w.Z)([(0,L.Mo)("ha-users-picker")],(function(e,t){var i,r,n=function(t){function i(){var t;(0,y.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,b.Z)(this,i,[].concat(n)),e((0,k.Z)(t)),t}return(0,_.Z)(i,t),(0,m.Z)(i)}(t);return{F:n,d:[{kind:"field",decorators:[(0,L.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,L.Cb)({attribute:"picked-user-label"})],key:"pickedUserLabel",value:void 0},{kind:"field",decorators:[(0,L.Cb)({attribute:"pick-user-label"})],key:"pickUserLabel",value:void 0},{kind:"field",decorators:[(0,L.Cb)({attribute:!1})],key:"users",value:void 0},{kind:"method",key:"firstUpdated",value:function(e){var t=this;(0,C.Z)((0,Z.Z)(n.prototype),"firstUpdated",this).call(this,e),void 0===this.users&&H(this.hass).then((function(e){t.users=e}))}},{kind:"method",key:"render",value:function(){var e=this;if(!this.hass||!this.users)return x.Ld;var t=this._notSelectedUsers(this.users,this.value);return(0,x.dy)(c||(c=(0,p.Z)([" ",' <ha-user-picker .label="','" .hass="','" .users="','" .disabled="','" @value-changed="','"></ha-user-picker> '])),(0,A.l)([t],(function(){var i;return null===(i=e.value)||void 0===i?void 0:i.map((function(i,r){return(0,x.dy)(d||(d=(0,p.Z)([' <div> <ha-user-picker .label="','" .noUserLabel="','" .index="','" .hass="','" .value="','" .users="','" @value-changed="','"></ha-user-picker> <ha-icon-button .userId="','" .label="','" .path="','" @click="','"> ></ha-icon-button> </div> '])),e.pickedUserLabel,e.hass.localize("ui.components.user-picker.remove_user"),r,e.hass,i,e._notSelectedUsersAndSelected(i,e.users,t),e._userChanged,i,e.hass.localize("ui.components.user-picker.remove_user"),"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z",e._removeUser)}))})),this.pickUserLabel||this.hass.localize("ui.components.user-picker.add_user"),this.hass,t,!(null!=t&&t.length),this._addUser)}},{kind:"field",key:"_notSelectedUsers",value:function(){return(0,V.Z)((function(e,t){return t?null==e?void 0:e.filter((function(e){return!e.system_generated&&!t.includes(e.id)})):null==e?void 0:e.filter((function(e){return!e.system_generated}))}))}},{kind:"field",key:"_notSelectedUsersAndSelected",value:function(){return function(e,t,i){var r=null==t?void 0:t.find((function(t){return t.id===e}));return r?i?[].concat((0,v.Z)(i),[r]):[r]:i}}},{kind:"get",key:"_currentUsers",value:function(){return this.value||[]}},{kind:"method",key:"_updateUsers",value:(r=(0,g.Z)((0,f.Z)().mark((function e(t){return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:this.value=t,(0,M.B)(this,"value-changed",{value:t});case 2:case"end":return e.stop()}}),e,this)}))),function(e){return r.apply(this,arguments)})},{kind:"method",key:"_userChanged",value:function(e){e.stopPropagation();var t=e.currentTarget.index,i=e.detail.value,r=(0,v.Z)(this._currentUsers);""===i?r.splice(t,1):r.splice(t,1,i),this._updateUsers(r)}},{kind:"method",key:"_addUser",value:(i=(0,g.Z)((0,f.Z)().mark((function e(t){var i,r;return(0,f.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t.stopPropagation(),i=t.detail.value,t.currentTarget.value="",i){e.next=5;break}return e.abrupt("return");case 5:if(!(r=this._currentUsers).includes(i)){e.next=8;break}return e.abrupt("return");case 8:this._updateUsers([].concat((0,v.Z)(r),[i]));case 9:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"method",key:"_removeUser",value:function(e){var t=e.currentTarget.userId;this._updateUsers(this._currentUsers.filter((function(e){return e!==t})))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,x.iv)(h||(h=(0,p.Z)([":host{display:block}div{display:flex;align-items:center}"])))}}]}}),x.oi)},93034:function(e,t,i){i.d(t,{h:function(){return n},u:function(){return r}});var r={calendar:"M19,19H5V8H19M16,1V3H8V1H6V3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3H18V1M17,12H12V17H17V12Z",device:"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z",event:"M10,9A1,1 0 0,1 11,8A1,1 0 0,1 12,9V13.47L13.21,13.6L18.15,15.79C18.68,16.03 19,16.56 19,17.14V21.5C18.97,22.32 18.32,22.97 17.5,23H11C10.62,23 10.26,22.85 10,22.57L5.1,18.37L5.84,17.6C6.03,17.39 6.3,17.28 6.58,17.28H6.8L10,19V9M11,5A4,4 0 0,1 15,9C15,10.5 14.2,11.77 13,12.46V11.24C13.61,10.69 14,9.89 14,9A3,3 0 0,0 11,6A3,3 0 0,0 8,9C8,9.89 8.39,10.69 9,11.24V12.46C7.8,11.77 7,10.5 7,9A4,4 0 0,1 11,5M11,3A6,6 0 0,1 17,9C17,10.7 16.29,12.23 15.16,13.33L14.16,12.88C15.28,11.96 16,10.56 16,9A5,5 0 0,0 11,4A5,5 0 0,0 6,9C6,11.05 7.23,12.81 9,13.58V14.66C6.67,13.83 5,11.61 5,9A6,6 0 0,1 11,3Z",state:"M6.27 17.05C6.72 17.58 7 18.25 7 19C7 20.66 5.66 22 4 22S1 20.66 1 19 2.34 16 4 16C4.18 16 4.36 16 4.53 16.05L7.6 10.69L5.86 9.7L9.95 8.58L11.07 12.67L9.33 11.68L6.27 17.05M20 16C18.7 16 17.6 16.84 17.18 18H11V16L8 19L11 22V20H17.18C17.6 21.16 18.7 22 20 22C21.66 22 23 20.66 23 19S21.66 16 20 16M12 8C12.18 8 12.36 8 12.53 7.95L15.6 13.31L13.86 14.3L17.95 15.42L19.07 11.33L17.33 12.32L14.27 6.95C14.72 6.42 15 5.75 15 5C15 3.34 13.66 2 12 2S9 3.34 9 5 10.34 8 12 8Z",geo_location:"M12,11.5A2.5,2.5 0 0,1 9.5,9A2.5,2.5 0 0,1 12,6.5A2.5,2.5 0 0,1 14.5,9A2.5,2.5 0 0,1 12,11.5M12,2A7,7 0 0,0 5,9C5,14.25 12,22 12,22C12,22 19,14.25 19,9A7,7 0 0,0 12,2Z",homeassistant:i(19844).T,mqtt:"M21,9L17,5V8H10V10H17V13M7,11L3,15L7,19V16H14V14H7V11Z",numeric_state:"M4,17V9H2V7H6V17H4M22,15C22,16.11 21.1,17 20,17H16V15H20V13H18V11H20V9H16V7H20A2,2 0 0,1 22,9V10.5A1.5,1.5 0 0,1 20.5,12A1.5,1.5 0 0,1 22,13.5V15M14,15V17H8V13C8,11.89 8.9,11 10,11H12V9H8V7H12A2,2 0 0,1 14,9V11C14,12.11 13.1,13 12,13H10V15H14Z",sun:"M12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,2L14.39,5.42C13.65,5.15 12.84,5 12,5C11.16,5 10.35,5.15 9.61,5.42L12,2M3.34,7L7.5,6.65C6.9,7.16 6.36,7.78 5.94,8.5C5.5,9.24 5.25,10 5.11,10.79L3.34,7M3.36,17L5.12,13.23C5.26,14 5.53,14.78 5.95,15.5C6.37,16.24 6.91,16.86 7.5,17.37L3.36,17M20.65,7L18.88,10.79C18.74,10 18.47,9.23 18.05,8.5C17.63,7.78 17.1,7.15 16.5,6.64L20.65,7M20.64,17L16.5,17.36C17.09,16.85 17.62,16.22 18.04,15.5C18.46,14.77 18.73,14 18.87,13.21L20.64,17M12,22L9.59,18.56C10.33,18.83 11.14,19 12,19C12.82,19 13.63,18.83 14.37,18.56L12,22Z",conversation:"M8,7A2,2 0 0,1 10,9V14A2,2 0 0,1 8,16A2,2 0 0,1 6,14V9A2,2 0 0,1 8,7M14,14C14,16.97 11.84,19.44 9,19.92V22H7V19.92C4.16,19.44 2,16.97 2,14H4A4,4 0 0,0 8,18A4,4 0 0,0 12,14H14M21.41,9.41L17.17,13.66L18.18,10H14A2,2 0 0,1 12,8V4A2,2 0 0,1 14,2H20A2,2 0 0,1 22,4V8C22,8.55 21.78,9.05 21.41,9.41Z",tag:"M18,6H13A2,2 0 0,0 11,8V10.28C10.41,10.62 10,11.26 10,12A2,2 0 0,0 12,14C13.11,14 14,13.1 14,12C14,11.26 13.6,10.62 13,10.28V8H16V16H8V8H10V6H8L6,6V18H18M20,20H4V4H20M20,2H4A2,2 0 0,0 2,4V20A2,2 0 0,0 4,22H20C21.11,22 22,21.1 22,20V4C22,2.89 21.11,2 20,2Z",template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",time:"M12,20A8,8 0 0,0 20,12A8,8 0 0,0 12,4A8,8 0 0,0 4,12A8,8 0 0,0 12,20M12,2A10,10 0 0,1 22,12A10,10 0 0,1 12,22C6.47,22 2,17.5 2,12A10,10 0 0,1 12,2M12.5,7V12.25L17,14.92L16.25,16.15L11,13V7H12.5Z",time_pattern:"M11,17A1,1 0 0,0 12,18A1,1 0 0,0 13,17A1,1 0 0,0 12,16A1,1 0 0,0 11,17M11,3V7H13V5.08C16.39,5.57 19,8.47 19,12A7,7 0 0,1 12,19A7,7 0 0,1 5,12C5,10.32 5.59,8.78 6.58,7.58L12,13L13.41,11.59L6.61,4.79V4.81C4.42,6.45 3,9.05 3,12A9,9 0 0,0 12,21A9,9 0 0,0 21,12A9,9 0 0,0 12,3M18,12A1,1 0 0,0 17,11A1,1 0 0,0 16,12A1,1 0 0,0 17,13A1,1 0 0,0 18,12M6,12A1,1 0 0,0 7,13A1,1 0 0,0 8,12A1,1 0 0,0 7,11A1,1 0 0,0 6,12Z",webhook:"M10.46,19C9,21.07 6.15,21.59 4.09,20.15C2.04,18.71 1.56,15.84 3,13.75C3.87,12.5 5.21,11.83 6.58,11.77L6.63,13.2C5.72,13.27 4.84,13.74 4.27,14.56C3.27,16 3.58,17.94 4.95,18.91C6.33,19.87 8.26,19.5 9.26,18.07C9.57,17.62 9.75,17.13 9.82,16.63V15.62L15.4,15.58L15.47,15.47C16,14.55 17.15,14.23 18.05,14.75C18.95,15.27 19.26,16.43 18.73,17.35C18.2,18.26 17.04,18.58 16.14,18.06C15.73,17.83 15.44,17.46 15.31,17.04L11.24,17.06C11.13,17.73 10.87,18.38 10.46,19M17.74,11.86C20.27,12.17 22.07,14.44 21.76,16.93C21.45,19.43 19.15,21.2 16.62,20.89C15.13,20.71 13.9,19.86 13.19,18.68L14.43,17.96C14.92,18.73 15.75,19.28 16.75,19.41C18.5,19.62 20.05,18.43 20.26,16.76C20.47,15.09 19.23,13.56 17.5,13.35C16.96,13.29 16.44,13.36 15.97,13.53L15.12,13.97L12.54,9.2H12.32C11.26,9.16 10.44,8.29 10.47,7.25C10.5,6.21 11.4,5.4 12.45,5.44C13.5,5.5 14.33,6.35 14.3,7.39C14.28,7.83 14.11,8.23 13.84,8.54L15.74,12.05C16.36,11.85 17.04,11.78 17.74,11.86M8.25,9.14C7.25,6.79 8.31,4.1 10.62,3.12C12.94,2.14 15.62,3.25 16.62,5.6C17.21,6.97 17.09,8.47 16.42,9.67L15.18,8.95C15.6,8.14 15.67,7.15 15.27,6.22C14.59,4.62 12.78,3.85 11.23,4.5C9.67,5.16 8.97,7 9.65,8.6C9.93,9.26 10.4,9.77 10.97,10.11L11.36,10.32L8.29,15.31C8.32,15.36 8.36,15.42 8.39,15.5C8.88,16.41 8.54,17.56 7.62,18.05C6.71,18.54 5.56,18.18 5.06,17.24C4.57,16.31 4.91,15.16 5.83,14.67C6.22,14.46 6.65,14.41 7.06,14.5L9.37,10.73C8.9,10.3 8.5,9.76 8.25,9.14Z",persistent_notification:"M13 11H11V5H13M13 15H11V13H13M20 2H4C2.9 2 2 2.9 2 4V22L6 18H20C21.1 18 22 17.1 22 16V4C22 2.9 21.1 2 20 2Z",zone:"M12,2C15.31,2 18,4.66 18,7.95C18,12.41 12,19 12,19C12,19 6,12.41 6,7.95C6,4.66 8.69,2 12,2M12,6A2,2 0 0,0 10,8A2,2 0 0,0 12,10A2,2 0 0,0 14,8A2,2 0 0,0 12,6M20,19C20,21.21 16.42,23 12,23C7.58,23 4,21.21 4,19C4,17.71 5.22,16.56 7.11,15.83L7.75,16.74C6.67,17.19 6,17.81 6,18.5C6,19.88 8.69,21 12,21C15.31,21 18,19.88 18,18.5C18,17.81 17.33,17.19 16.25,16.74L16.89,15.83C18.78,16.56 20,17.71 20,19Z"},n={device:{},entity:{icon:"M11,13.5V21.5H3V13.5H11M12,2L17.5,11H6.5L12,2M17.5,13C20,13 22,15 22,17.5C22,20 20,22 17.5,22C15,22 13,20 13,17.5C13,15 15,13 17.5,13Z",members:{state:{},numeric_state:{}}},time_location:{icon:"M15,12H16.5V16.25L19.36,17.94L18.61,19.16L15,17V12M23,16A7,7 0 0,1 16,23C13,23 10.4,21.08 9.42,18.4L8,17.9L2.66,19.97L2.5,20A0.5,0.5 0 0,1 2,19.5V4.38C2,4.15 2.15,3.97 2.36,3.9L8,2L14,4.1L19.34,2H19.5A0.5,0.5 0 0,1 20,2.5V10.25C21.81,11.5 23,13.62 23,16M9,16C9,12.83 11.11,10.15 14,9.29V6.11L8,4V15.89L9,16.24C9,16.16 9,16.08 9,16M16,11A5,5 0 0,0 11,16A5,5 0 0,0 16,21A5,5 0 0,0 21,16A5,5 0 0,0 16,11Z",members:{calendar:{},sun:{},time:{},time_pattern:{},zone:{}}},other:{icon:"M16,12A2,2 0 0,1 18,10A2,2 0 0,1 20,12A2,2 0 0,1 18,14A2,2 0 0,1 16,12M10,12A2,2 0 0,1 12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12M4,12A2,2 0 0,1 6,10A2,2 0 0,1 8,12A2,2 0 0,1 6,14A2,2 0 0,1 4,12Z",members:{event:{},geo_location:{},homeassistant:{},mqtt:{},conversation:{},tag:{},template:{},webhook:{},persistent_notification:{}}}}},276:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,a=i.hasOwnProperty,o=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},u=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",c=s.toStringTag||"@@toStringTag";function d(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{d({},"")}catch(e){d=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,a=Object.create(n.prototype),s=new O(r||[]);return o(a,"_invoke",{value:V(e,i,s)}),a}function f(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var g="suspendedStart",v="suspendedYield",p="executing",m="completed",y={};function b(){}function k(){}function _(){}var w={};d(w,u,(function(){return this}));var C=Object.getPrototypeOf,Z=C&&C(C(j([])));Z&&Z!==i&&a.call(Z,u)&&(w=Z);var x=_.prototype=b.prototype=Object.create(w);function L(e){["next","throw","return"].forEach((function(t){d(e,t,(function(e){return this._invoke(t,e)}))}))}function A(e,t){function i(n,o,s,u){var l=f(e[n],e,o);if("throw"!==l.type){var c=l.arg,d=c.value;return d&&"object"==r(d)&&a.call(d,"__await")?t.resolve(d.__await).then((function(e){i("next",e,s,u)}),(function(e){i("throw",e,s,u)})):t.resolve(d).then((function(e){c.value=e,s(c)}),(function(e){return i("throw",e,s,u)}))}u(l.arg)}var n;o(this,"_invoke",{value:function(e,r){function a(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(a,a):a()}})}function V(t,i,r){var n=g;return function(a,o){if(n===p)throw new Error("Generator is already running");if(n===m){if("throw"===a)throw o;return{value:e,done:!0}}for(r.method=a,r.arg=o;;){var s=r.delegate;if(s){var u=M(s,r);if(u){if(u===y)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===g)throw n=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=p;var l=f(t,i,r);if("normal"===l.type){if(n=r.done?m:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=m,r.method="throw",r.arg=l.arg)}}}function M(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,M(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var a=f(n,t.iterator,i.arg);if("throw"===a.type)return i.method="throw",i.arg=a.arg,i.delegate=null,y;var o=a.arg;return o?o.done?(i[t.resultName]=o.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):o:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function H(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function E(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function O(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(H,this),this.reset(!0)}function j(t){if(t||""===t){var i=t[u];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,o=function i(){for(;++n<t.length;)if(a.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return o.next=o}}throw new TypeError(r(t)+" is not iterable")}return k.prototype=_,o(x,"constructor",{value:_,configurable:!0}),o(_,"constructor",{value:k,configurable:!0}),k.displayName=d(_,c,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===k||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,_):(e.__proto__=_,d(e,c,"GeneratorFunction")),e.prototype=Object.create(x),e},t.awrap=function(e){return{__await:e}},L(A.prototype),d(A.prototype,l,(function(){return this})),t.AsyncIterator=A,t.async=function(e,i,r,n,a){void 0===a&&(a=Promise);var o=new A(h(e,i,r,n),a);return t.isGeneratorFunction(i)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},L(x),d(x,c,"Generator"),d(x,u,(function(){return this})),d(x,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=j,O.prototype={constructor:O,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(E),!t)for(var i in this)"t"===i.charAt(0)&&a.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var o=this.tryEntries[n],s=o.completion;if("root"===o.tryLoc)return r("end");if(o.tryLoc<=this.prev){var u=a.call(o,"catchLoc"),l=a.call(o,"finallyLoc");if(u&&l){if(this.prev<o.catchLoc)return r(o.catchLoc,!0);if(this.prev<o.finallyLoc)return r(o.finallyLoc)}else if(u){if(this.prev<o.catchLoc)return r(o.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return r(o.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&a.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var o=n?n.completion:{};return o.type=e,o.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),E(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;E(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:j(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function a(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var i=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=i){var r,n,a,o,s=[],u=!0,l=!1;try{if(a=(i=i.call(e)).next,0===t){if(Object(i)!==i)return;u=!1}else for(;!(u=(r=a.call(i)).done)&&(s.push(r.value),s.length!==t);u=!0);}catch(e){l=!0,n=e}finally{try{if(!u&&null!=i.return&&(o=i.return(),Object(o)!==o))return}finally{if(l)throw n}}return s}}(e,t)||function(e,t){if(!e)return;if("string"==typeof e)return o(e,t);var i=Object.prototype.toString.call(e).slice(8,-1);"Object"===i&&e.constructor&&(i=e.constructor.name);if("Map"===i||"Set"===i)return Array.from(e);if("Arguments"===i||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i))return o(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function o(e,t){(null==t||t>e.length)&&(t=e.length);for(var i=0,r=new Array(t);i<t;i++)r[i]=e[i];return r}function s(e,t,i,r,n,a,o){try{var s=e[a](o),u=s.value}catch(l){return void i(l)}s.done?t(u):Promise.resolve(u).then(r,n)}i.a(e,function(){var e,r=(e=n().mark((function e(r,o){var s,u,l,c,d,h,f,g,v,p,m,y,b,k,_,w,C,Z,x,L,A,V,M,H,E,O,j,z,S,P,B,T,U,I,F,N,G,q,R,W,D,Y,K,X,$,J,Q,ee,te,ie,re,ne;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,i.d(t,{a:function(){return re}}),s=i(99312),u=i(81043),l=i(88962),c=i(33368),d=i(71650),h=i(68308),f=i(82390),g=i(69205),v=i(91808),p=i(34541),m=i(47838),y=i(93359),i(22859),i(85717),i(97393),i(46349),i(70320),b=i(98830),i(44577),k=i(5095),_=i(95260),w=i(53180),C=i(3747),Z=i(17267),x=i(18394),L=i(930),A=i(92482),V=i(72218),i(23860),i(85878),i(68336),i(31360),i(54371),i(51520),M=i(19418),H=i(44553),E=i(59449),O=i(38149),j=i(93034),z=i(11285),S=i(29950),i(98618),i(84119),P=i(10622),i(50155),i(14810),i(15527),i(21695),i(46891),i(37025),i(67626),i(92430),i(73240),i(75975),i(57068),i(79664),B=i(82749),i(13503),T=i(77251),!(U=r([H,P,B])).then){e.next=74;break}return e.next=70,U;case 70:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=75;break;case 74:e.t0=U;case 75:I=e.t0,F=a(I,3),H=F[0],P=F[1],B=F[2],ie="M21,7L9,19L3.5,13.5L4.91,12.09L9,16.17L19.59,5.59L21,7Z",re=function(e,t){var i,r;t.stopPropagation();var n=null===(i=t.currentTarget)||void 0===i?void 0:i.name;if(n){var a,o=null===(r=t.target)||void 0===r?void 0:r.value;(e.trigger[n]||"")!==o&&(void 0===o||""===o?delete(a=Object.assign({},e.trigger))[n]:a=Object.assign(Object.assign({},e.trigger),{},(0,y.Z)({},n,o)),(0,x.B)(e,"value-changed",{value:a}))}},ne=function(e){return e.preventDefault()},(0,v.Z)([(0,_.Mo)("ha-automation-trigger-row")],(function(e,t){var i,r,n=function(t){function i(){var t;(0,d.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,h.Z)(this,i,[].concat(n)),e((0,f.Z)(t)),t}return(0,g.Z)(i,t),(0,c.Z)(i)}(t);return{F:n,d:[{kind:"field",decorators:[(0,_.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,_.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"hideMenu",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_warnings",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_yamlMode",value:function(){return!1}},{kind:"field",decorators:[(0,_.SB)()],key:"_requestShowId",value:function(){return!1}},{kind:"field",decorators:[(0,_.SB)()],key:"_triggered",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_triggerColor",value:function(){return!1}},{kind:"field",decorators:[(0,_.IO)("ha-yaml-editor")],key:"_yamlEditor",value:void 0},{kind:"field",decorators:[(0,C.t)({key:"automationClipboard",state:!1,subscribe:!0,storage:"sessionStorage"})],key:"_clipboard",value:void 0},{kind:"field",decorators:[(0,_.SB)(),(0,b.F_)({context:O.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",decorators:[(0,_.SB)(),(0,b.F_)({context:T.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"field",key:"_triggerUnsub",value:void 0},{kind:"method",key:"render",value:function(){if(!this.trigger)return k.Ld;var e=void 0===this._reorderMode,t=void 0!==customElements.get("ha-automation-trigger-".concat(this.trigger.platform)),i=this._yamlMode||!t,r="id"in this.trigger||this._requestShowId;return(0,k.dy)(N||(N=(0,l.Z)([" <ha-card outlined> ",' <ha-expansion-panel leftChevron> <h3 slot="header"> <ha-svg-icon class="trigger-icon" .path="','"></ha-svg-icon> ',' </h3> <slot name="icons" slot="icons"></slot> ',' <div class="','"> '," ",' </div> </ha-expansion-panel> <div class="triggered ','" @click="','"> '," </div> </ha-card> "])),!1===this.trigger.enabled?(0,k.dy)(G||(G=(0,l.Z)([' <div class="disabled-bar"> '," </div> "])),this.hass.localize("ui.panel.config.automation.editor.actions.disabled")):"",j.u[this.trigger.platform],(0,H.R)(this.trigger,this.hass,this._entityReg),this.hideMenu?"":(0,k.dy)(q||(q=(0,l.Z)([' <ha-button-menu slot="icons" @action="','" @click="','" fixed> <ha-icon-button slot="trigger" .label="','" .path="','"></ha-icon-button> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','" class="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <li divider role="separator"></li> <mwc-list-item .disabled="','" graphic="icon"> '," ",' </mwc-list-item> <mwc-list-item .disabled="','" graphic="icon"> '," ",' </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item class="warning" graphic="icon" .disabled="','"> ',' <ha-svg-icon class="warning" slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> </ha-button-menu> '])),this._handleAction,ne,this.hass.localize("ui.common.menu"),"M12,16A2,2 0 0,1 14,18A2,2 0 0,1 12,20A2,2 0 0,1 10,18A2,2 0 0,1 12,16M12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12A2,2 0 0,1 12,10M12,4A2,2 0 0,1 14,6A2,2 0 0,1 12,8A2,2 0 0,1 10,6A2,2 0 0,1 12,4Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.rename"),"M18,17H10.5L12.5,15H18M6,17V14.5L13.88,6.65C14.07,6.45 14.39,6.45 14.59,6.65L16.35,8.41C16.55,8.61 16.55,8.92 16.35,9.12L8.47,17M19,3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3Z",this.disabled,(0,w.$)({hidden:e}),this.hass.localize("ui.panel.config.automation.editor.triggers.re_order"),"M18 21L14 17H17V7H14L18 3L22 7H19V17H22M2 19V17H12V19M2 13V11H9V13M2 7V5H6V7H2Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.edit_id"),"M10 7V9H9V15H10V17H6V15H7V9H6V7H10M16 7C17.11 7 18 7.9 18 9V15C18 16.11 17.11 17 16 17H12V7M16 9H14V15H16V9Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.duplicate"),"M11,17H4A2,2 0 0,1 2,15V3A2,2 0 0,1 4,1H16V3H4V15H11V13L15,16L11,19V17M19,21V7H8V13H6V7A2,2 0 0,1 8,5H19A2,2 0 0,1 21,7V21A2,2 0 0,1 19,23H8A2,2 0 0,1 6,21V19H8V21H19Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.copy"),"M19,21H8V7H19M19,5H8A2,2 0 0,0 6,7V21A2,2 0 0,0 8,23H19A2,2 0 0,0 21,21V7A2,2 0 0,0 19,5M16,1H4A2,2 0 0,0 2,3V17H4V3H16V1Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.cut"),"M19,3L13,9L15,11L22,4V3M12,12.5A0.5,0.5 0 0,1 11.5,12A0.5,0.5 0 0,1 12,11.5A0.5,0.5 0 0,1 12.5,12A0.5,0.5 0 0,1 12,12.5M6,20A2,2 0 0,1 4,18C4,16.89 4.9,16 6,16A2,2 0 0,1 8,18C8,19.11 7.1,20 6,20M6,8A2,2 0 0,1 4,6C4,4.89 4.9,4 6,4A2,2 0 0,1 8,6C8,7.11 7.1,8 6,8M9.64,7.64C9.87,7.14 10,6.59 10,6A4,4 0 0,0 6,2A4,4 0 0,0 2,6A4,4 0 0,0 6,10C6.59,10 7.14,9.87 7.64,9.64L10,12L7.64,14.36C7.14,14.13 6.59,14 6,14A4,4 0 0,0 2,18A4,4 0 0,0 6,22A4,4 0 0,0 10,18C10,17.41 9.87,16.86 9.64,16.36L12,14L19,21H22V20L9.64,7.64Z",!t,this.hass.localize("ui.panel.config.automation.editor.edit_ui"),i?"":(0,k.dy)(R||(R=(0,l.Z)(['<ha-svg-icon class="selected_menu_item" slot="graphic" .path="','"></ha-svg-icon>'])),ie),!t,this.hass.localize("ui.panel.config.automation.editor.edit_yaml"),i?(0,k.dy)(W||(W=(0,l.Z)(['<ha-svg-icon class="selected_menu_item" slot="graphic" .path="','"></ha-svg-icon>'])),ie):"",this.disabled,!1===this.trigger.enabled?this.hass.localize("ui.panel.config.automation.editor.actions.enable"):this.hass.localize("ui.panel.config.automation.editor.actions.disable"),!1===this.trigger.enabled?"M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M10,16.5L16,12L10,7.5V16.5Z":"M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4M9,9V15H15V9",this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.delete"),"M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z"),(0,w.$)({"card-content":!0,disabled:!1===this.trigger.enabled}),this._warnings?(0,k.dy)(D||(D=(0,l.Z)(['<ha-alert alert-type="warning" .title="','"> '," "," </ha-alert>"])),this.hass.localize("ui.errors.config.editor_not_supported"),this._warnings.length&&void 0!==this._warnings[0]?(0,k.dy)(Y||(Y=(0,l.Z)([" <ul> "," </ul>"])),this._warnings.map((function(e){return(0,k.dy)(K||(K=(0,l.Z)(["<li>","</li>"])),e)}))):"",this.hass.localize("ui.errors.config.edit_in_yaml_supported")):"",i?(0,k.dy)(X||(X=(0,l.Z)([" ",' <ha-yaml-editor .hass="','" .defaultValue="','" .readOnly="','" @value-changed="','"></ha-yaml-editor> '])),t?"":(0,k.dy)($||($=(0,l.Z)([" "," "])),this.hass.localize("ui.panel.config.automation.editor.triggers.unsupported_platform",{platform:this.trigger.platform})),this.hass,this.trigger,this.disabled,this._onYamlChange):(0,k.dy)(J||(J=(0,l.Z)([" ",' <div @ui-mode-not-available="','" @value-changed="','"> '," </div> "])),r?(0,k.dy)(Q||(Q=(0,l.Z)([' <ha-textfield .label="','" .value="','" .disabled="','" @change="','"> </ha-textfield> '])),this.hass.localize("ui.panel.config.automation.editor.triggers.id"),this.trigger.id||"",this.disabled,this._idChanged):"",this._handleUiModeNotAvailable,this._onUiChanged,(0,Z.h)("ha-automation-trigger-".concat(this.trigger.platform),{hass:this.hass,trigger:this.trigger,disabled:this.disabled,path:this.path})),(0,w.$)({active:void 0!==this._triggered,accent:this._triggerColor}),this._showTriggeredInfo,this.hass.localize("ui.panel.config.automation.editor.triggers.triggered"))}},{kind:"method",key:"updated",value:function(e){(0,p.Z)((0,m.Z)(n.prototype),"updated",this).call(this,e),e.has("trigger")&&this._subscribeTrigger()}},{kind:"method",key:"connectedCallback",value:function(){(0,p.Z)((0,m.Z)(n.prototype),"connectedCallback",this).call(this),this.hasUpdated&&this.trigger&&this._subscribeTrigger()}},{kind:"method",key:"disconnectedCallback",value:function(){(0,p.Z)((0,m.Z)(n.prototype),"disconnectedCallback",this).call(this),this._triggerUnsub&&(this._triggerUnsub.then((function(e){return e()})),this._triggerUnsub=void 0),this._doSubscribeTrigger.cancel()}},{kind:"method",key:"_subscribeTrigger",value:function(){this._triggerUnsub&&(this._triggerUnsub.then((function(e){return e()})),this._triggerUnsub=void 0),this._doSubscribeTrigger()}},{kind:"field",key:"_doSubscribeTrigger",value:function(){var e=this;return(0,V.D)((0,u.Z)((0,s.Z)().mark((function t(){var i,r,n,a;return(0,s.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return r=5e3,n=e.trigger,e._triggerUnsub&&(e._triggerUnsub.then((function(e){return e()})),e._triggerUnsub=void 0),t.next=5,(0,E.w)(e.hass,{trigger:n});case 5:if(t.sent.trigger.valid&&e.trigger===n){t.next=8;break}return t.abrupt("return");case 8:(a=(0,M.Xm)(e.hass,(function(t){void 0!==i?(clearTimeout(i),e._triggerColor=!e._triggerColor):e._triggerColor=!1,e._triggered=t,i=window.setTimeout((function(){e._triggered=void 0,i=void 0}),r)}),n)).catch((function(){e._triggerUnsub===a&&(e._triggerUnsub=void 0)})),e._triggerUnsub=a;case 11:case"end":return t.stop()}}),t)}))),5e3)}},{kind:"method",key:"_handleUiModeNotAvailable",value:function(e){this._warnings=(0,A.p)(this.hass,e.detail).warnings,this._yamlMode||(this._yamlMode=!0)}},{kind:"method",key:"_handleAction",value:(r=(0,u.Z)((0,s.Z)().mark((function e(t){var i;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:e.t0=t.detail.index,e.next=0===e.t0?3:1===e.t0?6:2===e.t0?8:3===e.t0?11:4===e.t0?13:5===e.t0?15:6===e.t0?18:7===e.t0?21:8===e.t0?24:9===e.t0?26:28;break;case 3:return e.next=5,this._renameTrigger();case 5:return e.abrupt("break",28);case 6:return null===(i=this._reorderMode)||void 0===i||i.enter(),e.abrupt("break",28);case 8:return this._requestShowId=!0,this.expand(),e.abrupt("break",28);case 11:return(0,x.B)(this,"duplicate"),e.abrupt("break",28);case 13:return this._setClipboard(),e.abrupt("break",28);case 15:return this._setClipboard(),(0,x.B)(this,"value-changed",{value:null}),e.abrupt("break",28);case 18:return this._switchUiMode(),this.expand(),e.abrupt("break",28);case 21:return this._switchYamlMode(),this.expand(),e.abrupt("break",28);case 24:return this._onDisable(),e.abrupt("break",28);case 26:return this._onDelete(),e.abrupt("break",28);case 28:case"end":return e.stop()}}),e,this)}))),function(e){return r.apply(this,arguments)})},{kind:"method",key:"_setClipboard",value:function(){this._clipboard=Object.assign(Object.assign({},this._clipboard),{},{trigger:this.trigger})}},{kind:"method",key:"_onDelete",value:function(){var e=this;(0,z.g7)(this,{title:this.hass.localize("ui.panel.config.automation.editor.triggers.delete_confirm_title"),text:this.hass.localize("ui.panel.config.automation.editor.triggers.delete_confirm_text"),dismissText:this.hass.localize("ui.common.cancel"),confirmText:this.hass.localize("ui.common.delete"),destructive:!0,confirm:function(){(0,x.B)(e,"value-changed",{value:null})}})}},{kind:"method",key:"_onDisable",value:function(){var e,t,i=!(null===(e=this.trigger.enabled)||void 0===e||e),r=Object.assign(Object.assign({},this.trigger),{},{enabled:i});(0,x.B)(this,"value-changed",{value:r}),this._yamlMode&&(null===(t=this._yamlEditor)||void 0===t||t.setValue(r))}},{kind:"method",key:"_idChanged",value:function(e){var t,i=e.target.value;if(i!==(null!==(t=this.trigger.id)&&void 0!==t?t:"")){this._requestShowId=!0;var r=Object.assign({},this.trigger);i?r.id=i:delete r.id,(0,x.B)(this,"value-changed",{value:r})}}},{kind:"method",key:"_onYamlChange",value:function(e){e.stopPropagation(),e.detail.isValid&&(this._warnings=void 0,(0,x.B)(this,"value-changed",{value:e.detail.value}))}},{kind:"method",key:"_onUiChanged",value:function(e){e.stopPropagation();var t=Object.assign(Object.assign({},this.trigger.alias?{alias:this.trigger.alias}:{}),e.detail.value);(0,x.B)(this,"value-changed",{value:t})}},{kind:"method",key:"_switchUiMode",value:function(){this._warnings=void 0,this._yamlMode=!1}},{kind:"method",key:"_switchYamlMode",value:function(){this._warnings=void 0,this._yamlMode=!0}},{kind:"method",key:"_showTriggeredInfo",value:function(){(0,z.Ys)(this,{text:(0,k.dy)(ee||(ee=(0,l.Z)([' <ha-yaml-editor readOnly="readOnly" .hass="','" .defaultValue="','"></ha-yaml-editor> '])),this.hass,this._triggered)})}},{kind:"method",key:"_renameTrigger",value:(i=(0,u.Z)((0,s.Z)().mark((function e(){var t,i,r;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,(0,z.D9)(this,{title:this.hass.localize("ui.panel.config.automation.editor.triggers.change_alias"),inputLabel:this.hass.localize("ui.panel.config.automation.editor.triggers.alias"),inputType:"string",placeholder:(0,L.f)((0,H.R)(this.trigger,this.hass,this._entityReg,!0)),defaultValue:this.trigger.alias,confirmText:this.hass.localize("ui.common.submit")});case 2:null!==(t=e.sent)&&(i=Object.assign({},this.trigger),""===t?delete i.alias:i.alias=t,(0,x.B)(this,"value-changed",{value:i}),this._yamlMode&&(null===(r=this._yamlEditor)||void 0===r||r.setValue(i)));case 4:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"expand",value:function(){var e=this;this.updateComplete.then((function(){e.shadowRoot.querySelector("ha-expansion-panel").expanded=!0}))}},{kind:"get",static:!0,key:"styles",value:function(){return[S.Qx,(0,k.iv)(te||(te=(0,l.Z)(["ha-button-menu{--mdc-theme-text-primary-on-background:var(--primary-text-color)}.disabled{opacity:.5;pointer-events:none}ha-expansion-panel{--expansion-panel-summary-padding:0 0 0 8px;--expansion-panel-content-padding:0}h3{margin:0;font-size:inherit;font-weight:inherit}.trigger-icon{display:none}@media (min-width:870px){.trigger-icon{display:inline-block;color:var(--secondary-text-color);opacity:.9;margin-right:8px}}.card-content{padding:16px}.disabled-bar{background:var(--divider-color,#e0e0e0);text-align:center;border-top-right-radius:var(--ha-card-border-radius);border-top-left-radius:var(--ha-card-border-radius)}.triggered{cursor:pointer;position:absolute;top:0px;right:0px;left:0px;text-transform:uppercase;font-weight:700;font-size:14px;background-color:var(--primary-color);color:var(--text-primary-color);max-height:0px;overflow:hidden;transition:max-height .3s;text-align:center;border-top-right-radius:var(--ha-card-border-radius,12px);border-top-left-radius:var(--ha-card-border-radius,12px)}.triggered.active{max-height:100px}.triggered:hover{opacity:.8}.triggered.accent{background-color:var(--accent-color);color:var(--text-accent-color,var(--text-primary-color))}mwc-list-item[disabled]{--mdc-theme-text-primary-on-background:var(--disabled-text-color)}mwc-list-item.hidden{display:none}ha-textfield{display:block;margin-bottom:24px}.selected_menu_item{color:var(--primary-color)}li[role=separator]{border-bottom-color:var(--divider-color)}"])))]}}]}}),k.oi),o(),e.next=100;break;case 97:e.prev=97,e.t2=e.catch(0),o(e.t2);case 100:case"end":return e.stop()}}),e,null,[[0,97]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var a=e.apply(t,i);function o(e){s(a,r,n,o,u,"next",e)}function u(e){s(a,r,n,o,u,"throw",e)}o(void 0)}))});return function(e,t){return r.apply(this,arguments)}}())},41848:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,a=i.hasOwnProperty,o=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},u=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",c=s.toStringTag||"@@toStringTag";function d(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{d({},"")}catch(e){d=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,a=Object.create(n.prototype),s=new O(r||[]);return o(a,"_invoke",{value:V(e,i,s)}),a}function f(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var g="suspendedStart",v="suspendedYield",p="executing",m="completed",y={};function b(){}function k(){}function _(){}var w={};d(w,u,(function(){return this}));var C=Object.getPrototypeOf,Z=C&&C(C(j([])));Z&&Z!==i&&a.call(Z,u)&&(w=Z);var x=_.prototype=b.prototype=Object.create(w);function L(e){["next","throw","return"].forEach((function(t){d(e,t,(function(e){return this._invoke(t,e)}))}))}function A(e,t){function i(n,o,s,u){var l=f(e[n],e,o);if("throw"!==l.type){var c=l.arg,d=c.value;return d&&"object"==r(d)&&a.call(d,"__await")?t.resolve(d.__await).then((function(e){i("next",e,s,u)}),(function(e){i("throw",e,s,u)})):t.resolve(d).then((function(e){c.value=e,s(c)}),(function(e){return i("throw",e,s,u)}))}u(l.arg)}var n;o(this,"_invoke",{value:function(e,r){function a(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(a,a):a()}})}function V(t,i,r){var n=g;return function(a,o){if(n===p)throw new Error("Generator is already running");if(n===m){if("throw"===a)throw o;return{value:e,done:!0}}for(r.method=a,r.arg=o;;){var s=r.delegate;if(s){var u=M(s,r);if(u){if(u===y)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===g)throw n=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=p;var l=f(t,i,r);if("normal"===l.type){if(n=r.done?m:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=m,r.method="throw",r.arg=l.arg)}}}function M(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,M(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var a=f(n,t.iterator,i.arg);if("throw"===a.type)return i.method="throw",i.arg=a.arg,i.delegate=null,y;var o=a.arg;return o?o.done?(i[t.resultName]=o.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):o:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function H(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function E(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function O(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(H,this),this.reset(!0)}function j(t){if(t||""===t){var i=t[u];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,o=function i(){for(;++n<t.length;)if(a.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return o.next=o}}throw new TypeError(r(t)+" is not iterable")}return k.prototype=_,o(x,"constructor",{value:_,configurable:!0}),o(_,"constructor",{value:k,configurable:!0}),k.displayName=d(_,c,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===k||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,_):(e.__proto__=_,d(e,c,"GeneratorFunction")),e.prototype=Object.create(x),e},t.awrap=function(e){return{__await:e}},L(A.prototype),d(A.prototype,l,(function(){return this})),t.AsyncIterator=A,t.async=function(e,i,r,n,a){void 0===a&&(a=Promise);var o=new A(h(e,i,r,n),a);return t.isGeneratorFunction(i)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},L(x),d(x,c,"Generator"),d(x,u,(function(){return this})),d(x,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=j,O.prototype={constructor:O,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(E),!t)for(var i in this)"t"===i.charAt(0)&&a.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var o=this.tryEntries[n],s=o.completion;if("root"===o.tryLoc)return r("end");if(o.tryLoc<=this.prev){var u=a.call(o,"catchLoc"),l=a.call(o,"finallyLoc");if(u&&l){if(this.prev<o.catchLoc)return r(o.catchLoc,!0);if(this.prev<o.finallyLoc)return r(o.finallyLoc)}else if(u){if(this.prev<o.catchLoc)return r(o.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return r(o.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&a.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var o=n?n.completion:{};return o.type=e,o.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),E(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;E(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:j(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function a(e,t,i,r,n,a,o){try{var s=e[a](o),u=s.value}catch(l){return void i(l)}s.done?t(u):Promise.resolve(u).then(r,n)}i.a(e,function(){var e,t=(e=n().mark((function e(t,r){var a,o,s,u,l,c,d,h,f,g,v,p,m,y,b,k,_,w,C,Z,x,L,A,V,M,H;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,a=i(46097),o=i(88962),s=i(33368),u=i(71650),l=i(68308),c=i(82390),d=i(69205),h=i(91808),f=i(34541),g=i(47838),i(97393),i(51358),i(46798),i(5239),i(39685),i(98490),i(85717),i(94570),i(41353),v=i(98830),p=i(3239),m=i(5095),y=i(95260),b=i(99266),k=i(3747),_=i(18394),w=i(32723),i(92295),i(85878),i(42308),i(37662),C=i(77251),Z=i(64082),x=i(276),!(L=t([x])).then){e.next=52;break}return e.next=48,L;case 48:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=53;break;case 52:e.t0=L;case 53:x=e.t0[0],(0,h.Z)([(0,y.Mo)("ha-automation-trigger")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,l.Z)(this,i,[].concat(n)),e((0,c.Z)(t)),t}return(0,d.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"triggers",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,y.SB)(),(0,v.F_)({context:C.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"field",decorators:[(0,k.t)({key:"automationClipboard",state:!0,subscribe:!0,storage:"sessionStorage"})],key:"_clipboard",value:void 0},{kind:"field",key:"_focusLastTriggerOnChange",value:function(){return!1}},{kind:"field",key:"_triggerKeys",value:function(){return new WeakMap}},{kind:"get",key:"nested",value:function(){return void 0!==this.path}},{kind:"method",key:"render",value:function(){var e,t=this;return(0,m.dy)(A||(A=(0,o.Z)([' <ha-sortable handle-selector=".handle" .disabled="','" @item-moved="','" group="triggers" .path="','"> <div class="triggers"> ',' </div> </ha-sortable> <ha-button outlined .label="','" .disabled="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </ha-button> '])),!(null!==(e=this._reorderMode)&&void 0!==e&&e.active),this._triggerMoved,this.path,(0,b.r)(this.triggers,(function(e){return t._getKey(e)}),(function(e,i){var r,n,s;return(0,m.dy)(V||(V=(0,o.Z)([' <ha-automation-trigger-row .path="','" .index="','" .trigger="','" .hideMenu="','" @duplicate="','" @value-changed="','" .hass="','" .disabled="','"> '," </ha-automation-trigger-row> "])),[].concat((0,a.Z)(null!==(r=t.path)&&void 0!==r?r:[]),[i]),i,e,Boolean(null===(n=t._reorderMode)||void 0===n?void 0:n.active),t._duplicateTrigger,t._triggerChanged,t.hass,t.disabled,null!==(s=t._reorderMode)&&void 0!==s&&s.active?(0,m.dy)(M||(M=(0,o.Z)([' <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <div class="handle" slot="icons"> <ha-svg-icon .path="','"></ha-svg-icon> </div> '])),i,t.hass.localize("ui.panel.config.automation.editor.move_up"),"M13,20H11V8L5.5,13.5L4.08,12.08L12,4.16L19.92,12.08L18.5,13.5L13,8V20Z",t._moveUp,0===i,i,t.hass.localize("ui.panel.config.automation.editor.move_down"),"M11,4H13V16L18.5,10.5L19.92,11.92L12,19.84L4.08,11.92L5.5,10.5L11,16V4Z",t._moveDown,i===t.triggers.length-1,"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"):"")})),this.hass.localize("ui.panel.config.automation.editor.triggers.add"),this.disabled,this._addTriggerDialog,"M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z")}},{kind:"method",key:"_addTriggerDialog",value:function(){var e;(0,Z._)(this,{type:"trigger",add:this._addTrigger,clipboardItem:null===(e=this._clipboard)||void 0===e||null===(e=e.trigger)||void 0===e?void 0:e.platform})}},{kind:"field",key:"_addTrigger",value:function(){var e=this;return function(t){var i;if(t===Z.I)i=e.triggers.concat((0,p.Z)(e._clipboard.trigger));else{var r=t,n=customElements.get("ha-automation-trigger-".concat(r));i=e.triggers.concat(Object.assign({platform:r},n.defaultConfig))}e._focusLastTriggerOnChange=!0,(0,_.B)(e,"value-changed",{value:i})}}},{kind:"method",key:"updated",value:function(e){if((0,f.Z)((0,g.Z)(i.prototype),"updated",this).call(this,e),e.has("triggers")&&this._focusLastTriggerOnChange){this._focusLastTriggerOnChange=!1;var t=this.shadowRoot.querySelector("ha-automation-trigger-row:last-of-type");t.updateComplete.then((function(){t.expand(),t.scrollIntoView(),t.focus()}))}}},{kind:"method",key:"_getKey",value:function(e){return this._triggerKeys.has(e)||this._triggerKeys.set(e,Math.random().toString()),this._triggerKeys.get(e)}},{kind:"method",key:"_moveUp",value:function(e){var t=e.target.index,i=t-1;this._move(t,i)}},{kind:"method",key:"_moveDown",value:function(e){var t=e.target.index,i=t+1;this._move(t,i)}},{kind:"method",key:"_move",value:function(e,t,i,r){var n=(0,w.b)(this.triggers,e,t,i,r);(0,_.B)(this,"value-changed",{value:n})}},{kind:"method",key:"_triggerMoved",value:function(e){if(!this.nested){e.stopPropagation();var t=e.detail,i=t.oldIndex,r=t.newIndex,n=t.oldPath,a=t.newPath;this._move(i,r,n,a)}}},{kind:"method",key:"_triggerChanged",value:function(e){e.stopPropagation();var t=(0,a.Z)(this.triggers),i=e.detail.value,r=e.target.index;if(null===i)t.splice(r,1);else{var n=this._getKey(t[r]);this._triggerKeys.set(i,n),t[r]=i}(0,_.B)(this,"value-changed",{value:t})}},{kind:"method",key:"_duplicateTrigger",value:function(e){e.stopPropagation();var t=e.target.index;(0,_.B)(this,"value-changed",{value:this.triggers.concat((0,p.Z)(this.triggers[t]))})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,m.iv)(H||(H=(0,o.Z)(["ha-automation-trigger-row{display:block;margin-bottom:16px;scroll-margin-top:48px}ha-svg-icon{height:20px}ha-alert{display:block;margin-bottom:16px;border-radius:var(--ha-card-border-radius,16px);overflow:hidden}.handle{padding:12px;cursor:move;cursor:grab}.handle ha-svg-icon{pointer-events:none;height:24px}"])))}}]}}),m.oi),r(),e.next=65;break;case 62:e.prev=62,e.t2=e.catch(0),r(e.t2);case 65:case"end":return e.stop()}}),e,null,[[0,62]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var o=e.apply(t,i);function s(e){a(o,r,n,s,u,"next",e)}function u(e){a(o,r,n,s,u,"throw",e)}s(void 0)}))});return function(e,i){return t.apply(this,arguments)}}())},98618:function(e,t,i){var r,n=i(88962),a=i(76775),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),h=(i(97393),i(88640),i(85717),i(22859),i(5095)),f=i(95260),g=i(14516),v=i(18394),p=(i(39663),i(27959));(0,d.Z)([(0,f.Mo)("ha-automation-trigger-calendar")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_schema",value:function(){return(0,g.Z)((function(e){return[{name:"entity_id",required:!0,selector:{entity:{domain:"calendar"}}},{name:"event",type:"select",required:!0,options:[["start",e("ui.panel.config.automation.editor.triggers.type.calendar.start")],["end",e("ui.panel.config.automation.editor.triggers.type.calendar.end")]]},{name:"offset",selector:{duration:{}}},{name:"offset_type",type:"select",required:!0,options:[["before",e("ui.panel.config.automation.editor.triggers.type.calendar.before")],["after",e("ui.panel.config.automation.editor.triggers.type.calendar.after")]]}]}))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{event:"start",offset:0}}},{kind:"method",key:"render",value:function(){var e=this._schema(this.hass.localize),t=this.trigger.offset,i=(0,p.c)(t),o="after";("object"===(0,a.Z)(t)&&i.hours<0||"string"==typeof t&&t.startsWith("-"))&&(i.hours=Math.abs(i.hours),o="before");var s=Object.assign(Object.assign({},this.trigger),{},{offset:i,offset_type:o});return(0,h.dy)(r||(r=(0,n.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),e,s,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){var t,i,r;e.stopPropagation();var n=e.detail.value.offset,a="before"===e.detail.value.offset_type?"-":"",o=Object.assign(Object.assign({},e.detail.value),{},{offset:"".concat(a).concat(null!==(t=n.hours)&&void 0!==t?t:0,":").concat(null!==(i=n.minutes)&&void 0!==i?i:0,":").concat(null!==(r=n.seconds)&&void 0!==r?r:0)});delete o.offset_type,(0,v.B)(this,"value-changed",{value:o})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){switch(t.name){case"entity_id":return e.hass.localize("ui.components.entity.entity-picker.entity");case"event":return e.hass.localize("ui.panel.config.automation.editor.triggers.type.calendar.event")}return""}}}]}}),h.oi)},37025:function(e,t,i){var r,n,a,o=i(99312),s=i(81043),u=i(46097),l=i(88962),c=i(33368),d=i(71650),h=i(68308),f=i(82390),g=i(69205),v=i(91808),p=(i(97393),i(46349),i(70320),i(85717),i(41353),i(5095)),m=i(95260),y=i(4771),b=i(18394),k=(i(51520),i(11285)),_="^[^.。,，?¿？؟!！;；:：]+$";(0,v.Z)([(0,m.Mo)("ha-automation-trigger-conversation")],(function(e,t){var i,v,w=function(t){function i(){var t;(0,d.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,h.Z)(this,i,[].concat(n)),e((0,f.Z)(t)),t}return(0,g.Z)(i,t),(0,c.Z)(i)}(t);return{F:w,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,m.IO)("#option_input",!0)],key:"_optionInput",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{command:""}}},{kind:"method",key:"render",value:function(){var e=this,t=this.trigger.command,i=t?(0,y.r)(t):[];return(0,p.dy)(r||(r=(0,l.Z)(["",' <ha-textfield class="flex-auto" id="option_input" .label="','" .validationMessage="','" autoValidate pattern="','" @keydown="','" @change="','"></ha-textfield>'])),i.length?i.map((function(t,i){return(0,p.dy)(n||(n=(0,l.Z)([' <ha-textfield class="option" iconTrailing .index="','" .value="','" .validationMessage="','" autoValidate validateOnInitialRender pattern="','" @change="','"> <ha-icon-button @click="','" slot="trailingIcon" .path="','"></ha-icon-button> </ha-textfield> '])),i,t,e.hass.localize("ui.panel.config.automation.editor.triggers.type.conversation.no_punctuation"),_,e._updateOption,e._removeOption,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z")})):p.Ld,this.hass.localize("ui.panel.config.automation.editor.triggers.type.conversation.add_sentence"),this.hass.localize("ui.panel.config.automation.editor.triggers.type.conversation.no_punctuation"),_,this._handleKeyAdd,this._addOption)}},{kind:"method",key:"_handleKeyAdd",value:function(e){e.stopPropagation(),"Enter"===e.key&&this._addOption()}},{kind:"method",key:"_addOption",value:function(){var e=this._optionInput;null!=e&&e.value&&((0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{command:this.trigger.command.length?[].concat((0,u.Z)(Array.isArray(this.trigger.command)?this.trigger.command:[this.trigger.command]),[e.value]):e.value})}),e.value="")}},{kind:"method",key:"_updateOption",value:(v=(0,s.Z)((0,o.Z)().mark((function e(t){var i,r;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:i=t.target.index,(r=(0,u.Z)(Array.isArray(this.trigger.command)?this.trigger.command:[this.trigger.command])).splice(i,1,t.target.value),(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{command:r})});case 4:case"end":return e.stop()}}),e,this)}))),function(e){return v.apply(this,arguments)})},{kind:"method",key:"_removeOption",value:(i=(0,s.Z)((0,o.Z)().mark((function e(t){var i,r;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return i=t.target.parentElement.index,e.next=3,(0,k.g7)(this,{title:this.hass.localize("ui.panel.config.automation.editor.triggers.type.conversation.delete"),text:this.hass.localize("ui.panel.config.automation.editor.triggers.type.conversation.confirm_delete"),destructive:!0});case 3:if(e.sent){e.next=5;break}return e.abrupt("return");case 5:Array.isArray(this.trigger.command)?(r=(0,u.Z)(this.trigger.command)).splice(i,1):r="",(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{command:r})});case 7:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,p.iv)(a||(a=(0,l.Z)([".layout{display:flex;flex-direction:row;flex-wrap:nowrap;align-items:center;justify-content:flex-start}.option{margin-top:4px}mwc-button{margin-left:8px}ha-textfield{display:block;margin-bottom:8px;--textfield-icon-trailing-padding:0}ha-textfield>ha-icon-button{position:relative;right:-8px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}#option_input{margin-top:8px}.header{margin-top:8px;margin-bottom:8px}"])))}}]}}),p.oi)},84119:function(e,t,i){var r,n,a,o=i(99312),s=i(81043),u=i(88962),l=i(33368),c=i(71650),d=i(68308),h=i(82390),f=i(69205),g=i(91808),v=(i(97393),i(46798),i(9849),i(50289),i(94167),i(22859),i(85717),i(98830)),p=i(5095),m=i(95260),y=i(14516),b=i(18394),k=(i(27056),i(25917)),_=i(7748),w=((0,g.Z)([(0,m.Mo)("ha-device-trigger-picker")],(function(e,t){return{F:function(t){function i(){var t;return(0,c.Z)(this,i),t=(0,d.Z)(this,i,[k.KL,k.r3,function(e){return{device_id:e||"",platform:"device",domain:"",entity_id:""}}]),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t),d:[{kind:"get",key:"NO_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.triggers.no_triggers")}},{kind:"get",key:"UNKNOWN_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.triggers.unknown_trigger")}}]}}),_.g),i(39663),i(38149));(0,g.Z)([(0,m.Mo)("ha-automation-trigger-device")],(function(e,t){var i,g=function(t){function i(){var t;(0,c.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,d.Z)(this,i,[].concat(n)),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:g,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Object})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,m.SB)()],key:"_deviceId",value:void 0},{kind:"field",decorators:[(0,m.SB)()],key:"_capabilities",value:void 0},{kind:"field",decorators:[(0,m.SB)(),(0,v.F_)({context:w.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",key:"_origTrigger",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{device_id:"",domain:"",entity_id:""}}},{kind:"field",key:"_extraFieldsData",value:function(){return(0,y.Z)((function(e,t){var i={};return t.extra_fields.forEach((function(t){void 0!==e[t.name]&&(i[t.name]=e[t.name])})),i}))}},{kind:"method",key:"render",value:function(){var e,t=this._deviceId||this.trigger.device_id;return(0,p.dy)(r||(r=(0,u.Z)([' <ha-device-picker .value="','" @value-changed="','" .hass="','" .disabled="','" .label="','"></ha-device-picker> <ha-device-trigger-picker .value="','" .deviceId="','" @value-changed="','" .hass="','" .disabled="','" .label="','"></ha-device-trigger-picker> '," "])),t,this._devicePicked,this.hass,this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.type.device.label"),this.trigger,t,this._deviceTriggerPicked,this.hass,this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.type.device.trigger"),null!==(e=this._capabilities)&&void 0!==e&&e.extra_fields?(0,p.dy)(n||(n=(0,u.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),this.hass,this._extraFieldsData(this.trigger,this._capabilities),this._capabilities.extra_fields,this.disabled,this._extraFieldsComputeLabelCallback(this.hass.localize),this._extraFieldsChanged):"")}},{kind:"method",key:"firstUpdated",value:function(){this._capabilities||this._getCapabilities(),this.trigger&&(this._origTrigger=this.trigger)}},{kind:"method",key:"updated",value:function(e){if(e.has("trigger")){var t=e.get("trigger");t&&!(0,k.hH)(this._entityReg,t,this.trigger)&&this._getCapabilities()}}},{kind:"method",key:"_getCapabilities",value:(i=(0,s.Z)((0,o.Z)().mark((function e(){var t;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!(t=this.trigger).domain){e.next=7;break}return e.next=4,(0,k.hA)(this.hass,t);case 4:e.t0=e.sent,e.next=8;break;case 7:e.t0=void 0;case 8:this._capabilities=e.t0;case 9:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"_devicePicked",value:function(e){e.stopPropagation(),this._deviceId=e.target.value,void 0===this._deviceId&&(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},g.defaultConfig),{},{platform:"device"})})}},{kind:"method",key:"_deviceTriggerPicked",value:function(e){e.stopPropagation();var t=e.detail.value;this._origTrigger&&(0,k.hH)(this._entityReg,this._origTrigger,t)&&(t=this._origTrigger),this.trigger.id&&(t.id=this.trigger.id),(0,b.B)(this,"value-changed",{value:t})}},{kind:"method",key:"_extraFieldsChanged",value:function(e){e.stopPropagation(),(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),e.detail.value)})}},{kind:"method",key:"_extraFieldsComputeLabelCallback",value:function(e){return function(t){return e("ui.panel.config.automation.editor.triggers.type.device.extra_fields.".concat(t.name))||t.name}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,p.iv)(a||(a=(0,u.Z)(["ha-device-picker{display:block;margin-bottom:24px}ha-form{display:block;margin-top:24px}"])))}}]}}),p.oi)},10622:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,a=i.hasOwnProperty,o=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},u=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",c=s.toStringTag||"@@toStringTag";function d(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{d({},"")}catch(e){d=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,a=Object.create(n.prototype),s=new O(r||[]);return o(a,"_invoke",{value:V(e,i,s)}),a}function f(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var g="suspendedStart",v="suspendedYield",p="executing",m="completed",y={};function b(){}function k(){}function _(){}var w={};d(w,u,(function(){return this}));var C=Object.getPrototypeOf,Z=C&&C(C(j([])));Z&&Z!==i&&a.call(Z,u)&&(w=Z);var x=_.prototype=b.prototype=Object.create(w);function L(e){["next","throw","return"].forEach((function(t){d(e,t,(function(e){return this._invoke(t,e)}))}))}function A(e,t){function i(n,o,s,u){var l=f(e[n],e,o);if("throw"!==l.type){var c=l.arg,d=c.value;return d&&"object"==r(d)&&a.call(d,"__await")?t.resolve(d.__await).then((function(e){i("next",e,s,u)}),(function(e){i("throw",e,s,u)})):t.resolve(d).then((function(e){c.value=e,s(c)}),(function(e){return i("throw",e,s,u)}))}u(l.arg)}var n;o(this,"_invoke",{value:function(e,r){function a(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(a,a):a()}})}function V(t,i,r){var n=g;return function(a,o){if(n===p)throw new Error("Generator is already running");if(n===m){if("throw"===a)throw o;return{value:e,done:!0}}for(r.method=a,r.arg=o;;){var s=r.delegate;if(s){var u=M(s,r);if(u){if(u===y)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===g)throw n=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=p;var l=f(t,i,r);if("normal"===l.type){if(n=r.done?m:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=m,r.method="throw",r.arg=l.arg)}}}function M(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,M(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var a=f(n,t.iterator,i.arg);if("throw"===a.type)return i.method="throw",i.arg=a.arg,i.delegate=null,y;var o=a.arg;return o?o.done?(i[t.resultName]=o.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):o:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function H(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function E(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function O(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(H,this),this.reset(!0)}function j(t){if(t||""===t){var i=t[u];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,o=function i(){for(;++n<t.length;)if(a.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return o.next=o}}throw new TypeError(r(t)+" is not iterable")}return k.prototype=_,o(x,"constructor",{value:_,configurable:!0}),o(_,"constructor",{value:k,configurable:!0}),k.displayName=d(_,c,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===k||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,_):(e.__proto__=_,d(e,c,"GeneratorFunction")),e.prototype=Object.create(x),e},t.awrap=function(e){return{__await:e}},L(A.prototype),d(A.prototype,l,(function(){return this})),t.AsyncIterator=A,t.async=function(e,i,r,n,a){void 0===a&&(a=Promise);var o=new A(h(e,i,r,n),a);return t.isGeneratorFunction(i)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},L(x),d(x,c,"Generator"),d(x,u,(function(){return this})),d(x,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=j,O.prototype={constructor:O,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(E),!t)for(var i in this)"t"===i.charAt(0)&&a.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var o=this.tryEntries[n],s=o.completion;if("root"===o.tryLoc)return r("end");if(o.tryLoc<=this.prev){var u=a.call(o,"catchLoc"),l=a.call(o,"finallyLoc");if(u&&l){if(this.prev<o.catchLoc)return r(o.catchLoc,!0);if(this.prev<o.finallyLoc)return r(o.finallyLoc)}else if(u){if(this.prev<o.catchLoc)return r(o.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return r(o.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&a.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var o=n?n.completion:{};return o.type=e,o.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),E(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;E(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:j(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function a(e,t,i,r,n,a,o){try{var s=e[a](o),u=s.value}catch(l){return void i(l)}s.done?t(u):Promise.resolve(u).then(r,n)}i.a(e,function(){var e,t=(e=n().mark((function e(t,r){var a,o,s,u,l,c,d,h,f,g,v,p,m,y;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,a=i(88962),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),i(97393),i(85717),h=i(5095),f=i(95260),g=i(18394),i(51520),i(80392),i(33202),v=i(276),!(p=t([v])).then){e.next=27;break}return e.next=23,p;case 23:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=28;break;case 27:e.t0=p;case 28:v=e.t0[0],(0,d.Z)([(0,f.Mo)("ha-automation-trigger-event")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)()],key:"trigger",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{event_type:""}}},{kind:"method",key:"render",value:function(){var e=this.trigger,t=e.event_type,i=e.event_data,r=e.context;return(0,h.dy)(m||(m=(0,a.Z)([' <ha-textfield .label="','" name="event_type" .value="','" .disabled="','" @change="','"></ha-textfield> <ha-yaml-editor .hass="','" .label="','" .name="','" .readOnly="','" .defaultValue="','" @value-changed="','"></ha-yaml-editor> <br> ',' <ha-users-picker .pickedUserLabel="','" .pickUserLabel="','" .hass="','" .disabled="','" .value="','" @value-changed="','"></ha-users-picker> '])),this.hass.localize("ui.panel.config.automation.editor.triggers.type.event.event_type"),t,this.disabled,this._valueChanged,this.hass,this.hass.localize("ui.panel.config.automation.editor.triggers.type.event.event_data"),"event_data",this.disabled,i,this._dataChanged,this.hass.localize("ui.panel.config.automation.editor.triggers.type.event.context_users"),this.hass.localize("ui.panel.config.automation.editor.triggers.type.event.context_user_picked"),this.hass.localize("ui.panel.config.automation.editor.triggers.type.event.context_user_pick"),this.hass,this.disabled,this._wrapUsersInArray(null==r?void 0:r.user_id),this._usersChanged)}},{kind:"method",key:"_wrapUsersInArray",value:function(e){return e?"string"==typeof e?[e]:e:[]}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation(),(0,v.a)(this,e)}},{kind:"method",key:"_dataChanged",value:function(e){e.stopPropagation(),e.detail.isValid&&(0,v.a)(this,e)}},{kind:"method",key:"_usersChanged",value:function(e){e.stopPropagation();var t=Object.assign({},this.trigger);!e.detail.value.length&&t.context?delete t.context.user_id:(t.context||(t.context={}),t.context.user_id=e.detail.value),(0,g.B)(this,"value-changed",{value:t})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,h.iv)(y||(y=(0,a.Z)(["ha-textfield{display:block}"])))}}]}}),h.oi),r(),e.next=36;break;case 33:e.prev=33,e.t2=e.catch(0),r(e.t2);case 36:case"end":return e.stop()}}),e,null,[[0,33]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var o=e.apply(t,i);function s(e){a(o,r,n,s,u,"next",e)}function u(e){a(o,r,n,s,u,"throw",e)}s(void 0)}))});return function(e,i){return t.apply(this,arguments)}}())},50155:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(22859),i(39663),i(5095)),h=i(95260),f=i(14516),g=i(18394);(0,c.Z)([(0,h.Mo)("ha-automation-trigger-geo_location")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_schema",value:function(){return(0,f.Z)((function(e){return[{name:"source",selector:{text:{}}},{name:"zone",selector:{entity:{domain:"zone"}}},{name:"event",type:"select",required:!0,options:[["enter",e("ui.panel.config.automation.editor.triggers.type.geo_location.enter")],["leave",e("ui.panel.config.automation.editor.triggers.type.geo_location.leave")]]}]}))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{source:"",zone:"",event:"enter"}}},{kind:"method",key:"render",value:function(){return(0,d.dy)(r||(r=(0,n.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),this._schema(this.hass.localize),this.trigger,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,g.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.geo_location.".concat(t.name))}}}]}}),d.oi)},14810:function(e,t,i){var r,n,a=i(88962),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),h=(i(97393),i(22859),i(39663),i(5095)),f=i(95260),g=i(14516),v=i(18394);(0,d.Z)([(0,f.Mo)("ha-automation-trigger-homeassistant")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_schema",value:function(){return(0,g.Z)((function(e){return[{name:"event",type:"select",required:!0,options:[["start",e("ui.panel.config.automation.editor.triggers.type.homeassistant.start")],["shutdown",e("ui.panel.config.automation.editor.triggers.type.homeassistant.shutdown")]]}]}))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{event:"start"}}},{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,a.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),this._schema(this.hass.localize),this.trigger,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,v.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.homeassistant.".concat(t.name))}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(n||(n=(0,a.Z)(["label{display:flex;align-items:center}"])))}}]}}),h.oi)},15527:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(22859),i(5095)),h=i(95260),f=i(18394),g=(i(39663),[{name:"topic",required:!0,selector:{text:{}}},{name:"payload",selector:{text:{}}}]);(0,c.Z)([(0,h.Mo)("ha-automation-trigger-mqtt")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{topic:""}}},{kind:"method",key:"render",value:function(){return(0,d.dy)(r||(r=(0,n.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),g,this.trigger,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,f.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.mqtt.".concat(t.name))}}}]}}),d.oi)},21695:function(e,t,i){var r,n=i(88962),a=i(46097),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),h=(i(97393),i(95818),i(76843),i(79894),i(51467),i(88640),i(85717),i(22859),i(5095)),f=i(95260),g=i(14516),v=i(27959),p=i(18394),m=i(13426),y=(i(39663),i(4771));(0,d.Z)([(0,f.Mo)("ha-automation-trigger-numeric_state")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,f.SB)()],key:"_inputAboveIsEntity",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_inputBelowIsEntity",value:void 0},{kind:"field",key:"_schema",value:function(){return(0,g.Z)((function(e,t,i,r){return[{name:"entity_id",required:!0,selector:{entity:{multiple:!0}}},{name:"attribute",selector:{attribute:{entity_id:t?t[0]:void 0,hide_attributes:["access_token","auto_update","available_modes","away_mode","changed_by","code_arm_required","code_format","color_mode","color_modes","current_activity","device_class","editable","effect_list","effect","entity_id","entity_picture","event_type","event_types","fan_mode","fan_modes","fan_speed_list","forecast","friendly_name","frontend_stream_type","has_date","has_time","hs_color","hvac_mode","hvac_modes","icon","id","latest_version","max_color_temp_kelvin","max_mireds","max_temp","media_album_name","media_artist","media_content_type","media_position_updated_at","media_title","min_color_temp_kelvin","min_mireds","min_temp","mode","next_dawn","next_dusk","next_midnight","next_noon","next_rising","next_setting","operation_list","operation_mode","options","percentage_step","precipitation_unit","preset_mode","preset_modes","pressure_unit","release_notes","release_summary","release_url","restored","rgb_color","rgbw_color","shuffle","skipped_version","sound_mode_list","sound_mode","source_list","source_type","source","state_class","step","supported_color_modes","supported_features","swing_mode","swing_modes","target_temp_step","temperature_unit","title","token","unit_of_measurement","user_id","uuid","visibility_unit","wind_speed_unit","xy_color"]}}},{name:"mode_above",type:"select",required:!0,options:[["value",e("ui.panel.config.automation.editor.triggers.type.numeric_state.type_value")],["input",e("ui.panel.config.automation.editor.triggers.type.numeric_state.type_input")]]}].concat((0,a.Z)(i?[{name:"above",selector:{entity:{domain:["input_number","number","sensor"]}}}]:[{name:"above",selector:{number:{mode:"box",min:Number.MIN_SAFE_INTEGER,max:Number.MAX_SAFE_INTEGER,step:.1}}}]),[{name:"mode_below",type:"select",required:!0,options:[["value",e("ui.panel.config.automation.editor.triggers.type.numeric_state.type_value")],["input",e("ui.panel.config.automation.editor.triggers.type.numeric_state.type_input")]]}],(0,a.Z)(r?[{name:"below",selector:{entity:{domain:["input_number","number","sensor"]}}}]:[{name:"below",selector:{number:{mode:"box",min:Number.MIN_SAFE_INTEGER,max:Number.MAX_SAFE_INTEGER,step:.1}}}]),[{name:"value_template",selector:{template:{}}},{name:"for",selector:{duration:{}}}])}))}},{kind:"method",key:"willUpdate",value:function(e){e.has("trigger")&&this.trigger&&(0,m._)(this.trigger.for)&&(0,p.B)(this,"ui-mode-not-available",Error(this.hass.localize("ui.errors.config.no_template_editor_support")))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{entity_id:[]}}},{kind:"method",key:"render",value:function(){var e,t,i=(0,v.c)(this.trigger.for),a=null!==(e=this._inputAboveIsEntity)&&void 0!==e?e:"string"==typeof this.trigger.above&&(this.trigger.above.startsWith("input_number.")||this.trigger.above.startsWith("number.")||this.trigger.above.startsWith("sensor.")),o=null!==(t=this._inputBelowIsEntity)&&void 0!==t?t:"string"==typeof this.trigger.below&&(this.trigger.below.startsWith("input_number.")||this.trigger.below.startsWith("number.")||this.trigger.below.startsWith("sensor.")),s=this._schema(this.hass.localize,this.trigger.entity_id,a,o),u=Object.assign(Object.assign({mode_above:a?"input":"value",mode_below:o?"input":"value"},this.trigger),{},{entity_id:(0,y.r)(this.trigger.entity_id),for:i});return(0,h.dy)(r||(r=(0,n.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" @value-changed="','" .computeLabel="','"></ha-form> '])),this.hass,u,s,this.disabled,this._valueChanged,this._computeLabelCallback)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;this._inputAboveIsEntity="input"===t.mode_above,this._inputBelowIsEntity="input"===t.mode_below,delete t.mode_above,delete t.mode_below,""===t.value_template&&delete t.value_template,(0,p.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){switch(t.name){case"entity_id":return e.hass.localize("ui.components.entity.entity-picker.entity");case"attribute":return e.hass.localize("ui.components.entity.entity-attribute-picker.attribute");case"for":return e.hass.localize("ui.panel.config.automation.editor.triggers.type.state.for");default:return e.hass.localize("ui.panel.config.automation.editor.triggers.type.numeric_state.".concat(t.name))}}}}]}}),h.oi)},46891:function(e,t,i){var r,n,a=i(88962),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),h=(i(97393),i(22859),i(14516)),f=i(5095),g=i(95260),v=i(18394),p=(i(85878),i(41911),i(54371),i(51520),["added","removed"]);(0,d.Z)([(0,g.Mo)("ha-automation-trigger-persistent_notification")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,g.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,g.Cb)()],key:"trigger",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_schema",value:function(){return(0,h.Z)((function(e){return[{name:"notification_id",required:!1,selector:{text:{}}},{name:"update_type",type:"multi_select",required:!1,options:[["added",e("ui.panel.config.automation.editor.triggers.type.persistent_notification.update_types.added")],["removed",e("ui.panel.config.automation.editor.triggers.type.persistent_notification.update_types.removed")],["current",e("ui.panel.config.automation.editor.triggers.type.persistent_notification.update_types.current")],["updated",e("ui.panel.config.automation.editor.triggers.type.persistent_notification.update_types.updated")]]}]}))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{update_type:[].concat(p),notification_id:""}}},{kind:"method",key:"render",value:function(){var e=this._schema(this.hass.localize);return(0,f.dy)(r||(r=(0,a.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),e,this.trigger,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,v.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.persistent_notification.".concat(t.name))}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,f.iv)(n||(n=(0,a.Z)(["ha-textfield{display:block}"])))}}]}}),f.oi)},67626:function(e,t,i){var r,n=i(88962),a=i(76775),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),h=(i(97393),i(51467),i(85717),i(46798),i(9849),i(50289),i(94167),i(65974),i(22859),i(5095)),f=i(95260),g=i(38768),v=i(14516),p=i(4771),m=i(18394),y=i(13426),b=i(21686),k=(i(39663),i(27959)),_=(0,g.f0)(b.G,(0,g.Ry)({alias:(0,g.jt)((0,g.Z_)()),platform:(0,g.i0)("state"),entity_id:(0,g.jt)((0,g.G0)([(0,g.Z_)(),(0,g.IX)((0,g.Z_)())])),attribute:(0,g.jt)((0,g.Z_)()),from:(0,g.jt)((0,g.AG)((0,g.Z_)())),to:(0,g.jt)((0,g.AG)((0,g.Z_)())),for:(0,g.jt)((0,g.G0)([(0,g.Rx)(),(0,g.Z_)(),b.H]))})),w="__ANY_STATE_IGNORE_ATTRIBUTES__";(0,d.Z)([(0,f.Mo)("ha-automation-trigger-state")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{entity_id:[]}}},{kind:"field",key:"_schema",value:function(){return(0,v.Z)((function(e,t,i){return[{name:"entity_id",required:!0,selector:{entity:{multiple:!0}}},{name:"attribute",selector:{attribute:{entity_id:t?t[0]:void 0,hide_attributes:["access_token","available_modes","code_arm_required","code_format","color_modes","device_class","editable","effect_list","entity_id","entity_picture","event_types","fan_modes","fan_speed_list","friendly_name","frontend_stream_type","has_date","has_time","hvac_modes","icon","id","max_color_temp_kelvin","max_mireds","max_temp","max","min_color_temp_kelvin","min_mireds","min_temp","min","mode","operation_list","options","percentage_step","precipitation_unit","preset_modes","pressure_unit","sound_mode_list","source_list","state_class","step","supported_color_modes","supported_features","swing_modes","target_temp_step","temperature_unit","token","unit_of_measurement","visibility_unit","wind_speed_unit"]}}},{name:"from",selector:{state:{extra_options:i?[]:[{label:e("ui.panel.config.automation.editor.triggers.type.state.any_state_ignore_attributes"),value:w}],entity_id:t?t[0]:void 0,attribute:i}}},{name:"to",selector:{state:{extra_options:i?[]:[{label:e("ui.panel.config.automation.editor.triggers.type.state.any_state_ignore_attributes"),value:w}],entity_id:t?t[0]:void 0,attribute:i}}},{name:"for",selector:{duration:{}}}]}))}},{kind:"method",key:"shouldUpdate",value:function(e){if(!e.has("trigger"))return!0;if(this.trigger.for&&"object"===(0,a.Z)(this.trigger.for)&&0===this.trigger.for.milliseconds&&delete this.trigger.for.milliseconds,this.trigger&&(0,y._)(this.trigger))return(0,m.B)(this,"ui-mode-not-available",Error(this.hass.localize("ui.errors.config.no_template_editor_support"))),!1;try{(0,g.hu)(this.trigger,_)}catch(t){return(0,m.B)(this,"ui-mode-not-available",t),!1}return!0}},{kind:"method",key:"render",value:function(){var e=(0,k.c)(this.trigger.for),t=Object.assign(Object.assign({},this.trigger),{},{entity_id:(0,p.r)(this.trigger.entity_id),for:e});t.attribute||null!==t.to||(t.to=w),t.attribute||null!==t.from||(t.from=w);var i=this._schema(this.hass.localize,this.trigger.entity_id,this.trigger.attribute);return(0,h.dy)(r||(r=(0,n.Z)([' <ha-form .hass="','" .data="','" .schema="','" @value-changed="','" .computeLabel="','" .disabled="','"></ha-form> '])),this.hass,t,i,this._valueChanged,this._computeLabelCallback,this.disabled)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;t.to===w&&(t.to=t.attribute?void 0:null),t.from===w&&(t.from=t.attribute?void 0:null),Object.keys(t).forEach((function(e){return void 0===t[e]||""===t[e]?delete t[e]:{}})),(0,m.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("entity_id"===t.name?"ui.components.entity.entity-picker.entity":"ui.panel.config.automation.editor.triggers.type.state.".concat(t.name))}}}]}}),h.oi)},92430:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(22859),i(5095)),h=i(95260),f=i(14516),g=i(18394);i(39663),(0,c.Z)([(0,h.Mo)("ha-automation-trigger-sun")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_schema",value:function(){return(0,f.Z)((function(e){return[{name:"event",type:"select",required:!0,options:[["sunrise",e("ui.panel.config.automation.editor.triggers.type.sun.sunrise")],["sunset",e("ui.panel.config.automation.editor.triggers.type.sun.sunset")]]},{name:"offset",selector:{text:{}}}]}))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{event:"sunrise",offset:0}}},{kind:"method",key:"render",value:function(){var e=this._schema(this.hass.localize);return(0,d.dy)(r||(r=(0,n.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),e,this.trigger,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,g.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.sun.".concat(t.name))}}}]}}),d.oi)},73240:function(e,t,i){var r,n,a,o=i(99312),s=i(81043),u=i(88962),l=i(33368),c=i(71650),d=i(68308),h=i(82390),f=i(69205),g=i(91808),v=i(34541),p=i(47838),m=(i(97393),i(46349),i(70320),i(22859),i(37313),i(85717),i(44577),i(5095)),y=i(95260),b=i(18394),k=i(28858),_=(i(71133),function(){var e=(0,s.Z)((0,o.Z)().mark((function e(t){return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.abrupt("return",t.callWS({type:"tag/list"}));case 1:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}());(0,g.Z)([(0,y.Mo)("ha-automation-trigger-tag")],(function(e,t){var i,g=function(t){function i(){var t;(0,c.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,d.Z)(this,i,[].concat(n)),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:g,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"trigger",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.SB)()],key:"_tags",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{tag_id:""}}},{kind:"method",key:"firstUpdated",value:function(e){(0,v.Z)((0,p.Z)(g.prototype),"firstUpdated",this).call(this,e),this._fetchTags()}},{kind:"method",key:"render",value:function(){return this._tags?(0,m.dy)(r||(r=(0,u.Z)([' <ha-select .label="','" .disabled="','" .value="','" @selected="','"> '," </ha-select> "])),this.hass.localize("ui.panel.config.automation.editor.triggers.type.tag.label"),this.disabled||0===this._tags.length,this.trigger.tag_id,this._tagChanged,this._tags.map((function(e){return(0,m.dy)(n||(n=(0,u.Z)([' <mwc-list-item .value="','"> '," </mwc-list-item> "])),e.id,e.name||e.id)}))):m.Ld}},{kind:"method",key:"_fetchTags",value:(i=(0,s.Z)((0,o.Z)().mark((function e(){var t=this;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,_(this.hass);case 2:this._tags=e.sent.sort((function(e,i){return(0,k.f)(e.name||e.id,i.name||i.id,t.hass.locale.language)}));case 3:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"_tagChanged",value:function(e){e.target.value&&this._tags&&this.trigger.tag_id!==e.target.value&&(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{tag_id:e.target.value})})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,m.iv)(a||(a=(0,u.Z)(["ha-select{display:block}"])))}}]}}),m.oi)},75975:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(51467),i(85717),i(46798),i(9849),i(49089),i(10733),i(22859),i(99539),i(5095)),h=i(95260),f=(i(39663),i(27959)),g=i(18394),v=i(13426),p=[{name:"value_template",required:!0,selector:{template:{}}},{name:"for",selector:{duration:{}}}];(0,c.Z)([(0,h.Mo)("ha-automation-trigger-template")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{value_template:""}}},{kind:"method",key:"willUpdate",value:function(e){e.has("trigger")&&this.trigger&&(0,v._)(this.trigger.for)&&(0,g.B)(this,"ui-mode-not-available",Error(this.hass.localize("ui.errors.config.no_template_editor_support")))}},{kind:"method",key:"render",value:function(){var e=(0,f.c)(this.trigger.for),t=Object.assign(Object.assign({},this.trigger),{},{for:e});return(0,d.dy)(r||(r=(0,n.Z)([' <ha-form .hass="','" .data="','" .schema="','" @value-changed="','" .computeLabel="','" .disabled="','"></ha-form> '])),this.hass,t,p,this._valueChanged,this._computeLabelCallback,this.disabled)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;t.for&&Object.values(t.for).every((function(e){return 0===e}))&&delete t.for,(0,g.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.template.".concat(t.name))}}}]}}),d.oi)},57068:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(45882),i(37724),i(51467),i(88640),i(85717),i(46798),i(9849),i(50289),i(94167),i(65974),i(22859),i(5095)),h=i(95260),f=i(14516),g=i(18394);i(39663),(0,c.Z)([(0,h.Mo)("ha-automation-trigger-time")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.SB)()],key:"_inputMode",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{at:""}}},{kind:"field",key:"_schema",value:function(){return(0,f.Z)((function(e,t){var i=t?{entity:{filter:[{domain:"input_datetime"},{domain:"sensor",device_class:"timestamp"}]}}:{time:{}};return[{name:"mode",type:"select",required:!0,options:[["value",e("ui.panel.config.automation.editor.triggers.type.time.type_value")],["input",e("ui.panel.config.automation.editor.triggers.type.time.type_input")]]},{name:"at",selector:i}]}))}},{kind:"method",key:"willUpdate",value:function(e){e.has("trigger")&&this.trigger&&Array.isArray(this.trigger.at)&&(0,g.B)(this,"ui-mode-not-available",Error(this.hass.localize("ui.errors.config.editor_not_supported")))}},{kind:"method",key:"render",value:function(){var e,t=this.trigger.at;if(Array.isArray(t))return d.Ld;var i=null!==(e=this._inputMode)&&void 0!==e?e:(null==t?void 0:t.startsWith("input_datetime."))||(null==t?void 0:t.startsWith("sensor.")),a=this._schema(this.hass.localize,i),o=Object.assign({mode:i?"input":"value"},this.trigger);return(0,d.dy)(r||(r=(0,n.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" @value-changed="','" .computeLabel="','"></ha-form> '])),this.hass,o,a,this.disabled,this._valueChanged,this._computeLabelCallback)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;this._inputMode="input"===t.mode,delete t.mode,Object.keys(t).forEach((function(e){return void 0===t[e]||""===t[e]?delete t[e]:{}})),(0,g.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.time.".concat(t.name))}}}]}}),d.oi)},79664:function(e,t,i){var r,n=i(88962),a=i(33368),o=i(71650),s=i(68308),u=i(82390),l=i(69205),c=i(91808),d=(i(97393),i(22859),i(5095)),h=i(95260),f=i(18394),g=(i(39663),[{name:"hours",selector:{text:{}}},{name:"minutes",selector:{text:{}}},{name:"seconds",selector:{text:{}}}]);(0,c.Z)([(0,h.Mo)("ha-automation-trigger-time_pattern")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,l.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"trigger",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{}}},{kind:"method",key:"render",value:function(){return(0,d.dy)(r||(r=(0,n.Z)([' <ha-form .hass="','" .schema="','" .data="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),this.hass,g,this.trigger,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;(0,f.B)(this,"value-changed",{value:t})}},{kind:"field",key:"_computeLabelCallback",value:function(){var e=this;return function(t){return e.hass.localize("ui.panel.config.automation.editor.triggers.type.time_pattern.".concat(t.name))}}}]}}),d.oi)},82749:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,a=i.hasOwnProperty,o=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},u=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",c=s.toStringTag||"@@toStringTag";function d(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{d({},"")}catch(e){d=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,a=Object.create(n.prototype),s=new O(r||[]);return o(a,"_invoke",{value:V(e,i,s)}),a}function f(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var g="suspendedStart",v="suspendedYield",p="executing",m="completed",y={};function b(){}function k(){}function _(){}var w={};d(w,u,(function(){return this}));var C=Object.getPrototypeOf,Z=C&&C(C(j([])));Z&&Z!==i&&a.call(Z,u)&&(w=Z);var x=_.prototype=b.prototype=Object.create(w);function L(e){["next","throw","return"].forEach((function(t){d(e,t,(function(e){return this._invoke(t,e)}))}))}function A(e,t){function i(n,o,s,u){var l=f(e[n],e,o);if("throw"!==l.type){var c=l.arg,d=c.value;return d&&"object"==r(d)&&a.call(d,"__await")?t.resolve(d.__await).then((function(e){i("next",e,s,u)}),(function(e){i("throw",e,s,u)})):t.resolve(d).then((function(e){c.value=e,s(c)}),(function(e){return i("throw",e,s,u)}))}u(l.arg)}var n;o(this,"_invoke",{value:function(e,r){function a(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(a,a):a()}})}function V(t,i,r){var n=g;return function(a,o){if(n===p)throw new Error("Generator is already running");if(n===m){if("throw"===a)throw o;return{value:e,done:!0}}for(r.method=a,r.arg=o;;){var s=r.delegate;if(s){var u=M(s,r);if(u){if(u===y)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===g)throw n=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=p;var l=f(t,i,r);if("normal"===l.type){if(n=r.done?m:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=m,r.method="throw",r.arg=l.arg)}}}function M(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,M(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var a=f(n,t.iterator,i.arg);if("throw"===a.type)return i.method="throw",i.arg=a.arg,i.delegate=null,y;var o=a.arg;return o?o.done?(i[t.resultName]=o.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):o:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function H(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function E(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function O(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(H,this),this.reset(!0)}function j(t){if(t||""===t){var i=t[u];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,o=function i(){for(;++n<t.length;)if(a.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return o.next=o}}throw new TypeError(r(t)+" is not iterable")}return k.prototype=_,o(x,"constructor",{value:_,configurable:!0}),o(_,"constructor",{value:k,configurable:!0}),k.displayName=d(_,c,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===k||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,_):(e.__proto__=_,d(e,c,"GeneratorFunction")),e.prototype=Object.create(x),e},t.awrap=function(e){return{__await:e}},L(A.prototype),d(A.prototype,l,(function(){return this})),t.AsyncIterator=A,t.async=function(e,i,r,n,a){void 0===a&&(a=Promise);var o=new A(h(e,i,r,n),a);return t.isGeneratorFunction(i)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},L(x),d(x,c,"Generator"),d(x,u,(function(){return this})),d(x,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=j,O.prototype={constructor:O,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(E),!t)for(var i in this)"t"===i.charAt(0)&&a.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var o=this.tryEntries[n],s=o.completion;if("root"===o.tryLoc)return r("end");if(o.tryLoc<=this.prev){var u=a.call(o,"catchLoc"),l=a.call(o,"finallyLoc");if(u&&l){if(this.prev<o.catchLoc)return r(o.catchLoc,!0);if(this.prev<o.finallyLoc)return r(o.finallyLoc)}else if(u){if(this.prev<o.catchLoc)return r(o.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return r(o.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&a.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var o=n?n.completion:{};return o.type=e,o.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),E(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;E(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:j(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function a(e,t,i,r,n,a,o){try{var s=e[a](o),u=s.value}catch(l){return void i(l)}s.done?t(u):Promise.resolve(u).then(r,n)}i.a(e,function(){var e,t=(e=n().mark((function e(t,r){var a,o,s,u,l,c,d,h,f,g,v,p,m,y,b,k,_,w,C,Z,x,L,A,V,M;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,a=i(99312),o=i(81043),s=i(88962),u=i(46097),l=i(33368),c=i(71650),d=i(68308),h=i(82390),f=i(69205),g=i(91808),v=i(34541),p=i(47838),i(97393),i(51358),i(24829),i(46798),i(45165),i(83868),i(75544),i(33435),i(66657),i(53608),i(42313),i(48112),i(87323),i(39588),i(31871),i(87753),i(91843),i(9979),i(34497),i(39912),i(76751),i(44988),i(32369),i(39832),i(83327),i(47475),i(94010),i(64085),i(56399),i(16149),i(39891),i(20459),i(89664),i(92478),i(60731),i(51964),i(93330),i(61792),i(40565),i(44580),i(48882),i(63789),i(24074),i(46349),i(40271),i(60163),i(85717),i(36513),i(41353),i(56308),m=i(5095),y=i(95260),b=i(18394),k=i(26654),_=i(26874),i(85878),i(41911),i(54371),i(51520),w=i(33849),C=i(276),!(Z=t([C])).then){e.next=132;break}return e.next=128,Z;case 128:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=133;break;case 132:e.t0=Z;case 133:C=e.t0[0],V=["GET","HEAD","POST","PUT"],M=["POST","PUT"],(0,g.Z)([(0,y.Mo)("ha-automation-trigger-webhook")],(function(e,t){var i,r=function(t){function i(){var t;(0,c.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,d.Z)(this,i,[].concat(n)),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:r,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"trigger",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.SB)()],key:"_config",value:void 0},{kind:"field",key:"_unsub",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{allowed_methods:[].concat(M),local_only:!0,webhook_id:""}}},{kind:"method",key:"connectedCallback",value:function(){var e=this;(0,v.Z)((0,p.Z)(r.prototype),"connectedCallback",this).call(this);var t={callback:function(t){e._config=t}};(0,b.B)(this,"subscribe-automation-config",t),this._unsub=t.unsub}},{kind:"method",key:"disconnectedCallback",value:function(){(0,v.Z)((0,p.Z)(r.prototype),"disconnectedCallback",this).call(this),this._unsub&&this._unsub()}},{kind:"method",key:"_generateWebhookId",value:function(){var e,t=crypto.getRandomValues(new Uint8Array(18)),i=btoa(String.fromCharCode.apply(String,(0,u.Z)(t))).replace(/\+/g,"-").replace(/\//g,"_"),r=(0,k.l)((null===(e=this._config)||void 0===e?void 0:e.alias)||"","-");return"".concat(r,"-").concat(i)}},{kind:"method",key:"willUpdate",value:function(e){(0,v.Z)((0,p.Z)(r.prototype),"willUpdate",this).call(this,e),e.has("trigger")&&(void 0===this.trigger.allowed_methods&&(this.trigger.allowed_methods=[].concat(M)),void 0===this.trigger.local_only&&(this.trigger.local_only=!0),""===this.trigger.webhook_id&&(this.trigger.webhook_id=this._generateWebhookId()))}},{kind:"method",key:"render",value:function(){var e=this,t=this.trigger,i=t.allowed_methods,r=t.local_only,n=t.webhook_id;return(0,m.dy)(x||(x=(0,s.Z)([' <div class="flex"> <ha-textfield name="webhook_id" .label="','" .helper="','" .disabled="','" iconTrailing .value="','" @input="','"> <ha-icon-button @click="','" slot="trailingIcon" .label="','" .path="','"></ha-icon-button> </ha-textfield> <ha-button-menu multi> <ha-icon-button slot="trigger" .label="','" .path="','"></ha-icon-button> ',' <li divider role="separator"></li> <ha-check-list-item left @request-selected="','" .selected="','"> '," </ha-check-list-item> </ha-button-menu> </div> "])),this.hass.localize("ui.panel.config.automation.editor.triggers.type.webhook.webhook_id"),this.hass.localize("ui.panel.config.automation.editor.triggers.type.webhook.webhook_id_helper"),this.disabled,n||"",this._valueChanged,this._copyUrl,this.hass.localize("ui.panel.config.automation.editor.triggers.type.webhook.copy_url"),"M19,21H8V7H19M19,5H8A2,2 0 0,0 6,7V21A2,2 0 0,0 8,23H19A2,2 0 0,0 21,21V7A2,2 0 0,0 19,5M16,1H4A2,2 0 0,0 2,3V17H4V3H16V1Z",this.hass.localize("ui.panel.config.automation.editor.triggers.type.webhook.webhook_settings"),"M12,15.5A3.5,3.5 0 0,1 8.5,12A3.5,3.5 0 0,1 12,8.5A3.5,3.5 0 0,1 15.5,12A3.5,3.5 0 0,1 12,15.5M19.43,12.97C19.47,12.65 19.5,12.33 19.5,12C19.5,11.67 19.47,11.34 19.43,11L21.54,9.37C21.73,9.22 21.78,8.95 21.66,8.73L19.66,5.27C19.54,5.05 19.27,4.96 19.05,5.05L16.56,6.05C16.04,5.66 15.5,5.32 14.87,5.07L14.5,2.42C14.46,2.18 14.25,2 14,2H10C9.75,2 9.54,2.18 9.5,2.42L9.13,5.07C8.5,5.32 7.96,5.66 7.44,6.05L4.95,5.05C4.73,4.96 4.46,5.05 4.34,5.27L2.34,8.73C2.21,8.95 2.27,9.22 2.46,9.37L4.57,11C4.53,11.34 4.5,11.67 4.5,12C4.5,12.33 4.53,12.65 4.57,12.97L2.46,14.63C2.27,14.78 2.21,15.05 2.34,15.27L4.34,18.73C4.46,18.95 4.73,19.03 4.95,18.95L7.44,17.94C7.96,18.34 8.5,18.68 9.13,18.93L9.5,21.58C9.54,21.82 9.75,22 10,22H14C14.25,22 14.46,21.82 14.5,21.58L14.87,18.93C15.5,18.67 16.04,18.34 16.56,17.94L19.05,18.95C19.27,19.03 19.54,18.95 19.66,18.73L21.66,15.27C21.78,15.05 21.73,14.78 21.54,14.63L19.43,12.97Z",V.map((function(t){return(0,m.dy)(L||(L=(0,s.Z)([' <ha-check-list-item left .value="','" @request-selected="','" .selected="','"> '," </ha-check-list-item> "])),t,e._allowedMethodsChanged,i.includes(t),t)})),this._localOnlyChanged,r,this.hass.localize("ui.panel.config.automation.editor.triggers.type.webhook.local_only"))}},{kind:"method",key:"_valueChanged",value:function(e){(0,C.a)(this,e)}},{kind:"method",key:"_localOnlyChanged",value:function(e){if(e.stopPropagation(),this.trigger.local_only!==e.detail.selected){var t=Object.assign(Object.assign({},this.trigger),{},{local_only:e.detail.selected});(0,b.B)(this,"value-changed",{value:t})}}},{kind:"method",key:"_allowedMethodsChanged",value:function(e){var t,i;e.stopPropagation();var r=e.target.value,n=e.detail.selected;if(n!==(null===(t=this.trigger.allowed_methods)||void 0===t?void 0:t.includes(r))){var a=null!==(i=this.trigger.allowed_methods)&&void 0!==i?i:[],o=(0,u.Z)(a);n?o.push(r):o.splice(o.indexOf(r),1);var s=Object.assign(Object.assign({},this.trigger),{},{allowed_methods:o});(0,b.B)(this,"value-changed",{value:s})}}},{kind:"method",key:"_copyUrl",value:(i=(0,o.Z)((0,a.Z)().mark((function e(t){var i,r;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return i=t.target.parentElement,r=this.hass.hassUrl("/api/webhook/".concat(i.value)),e.next=4,(0,_.v)(r);case 4:(0,w.C)(this,{message:this.hass.localize("ui.common.copied_clipboard")});case 5:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"field",static:!0,key:"styles",value:function(){return(0,m.iv)(A||(A=(0,s.Z)([".flex{display:flex}ha-textfield{flex:1}ha-textfield>ha-icon-button{--mdc-icon-button-size:24px;--mdc-icon-size:18px}ha-button-menu{padding-top:4px}"])))}}]}}),m.oi),r(),e.next=146;break;case 143:e.prev=143,e.t2=e.catch(0),r(e.t2);case 146:case"end":return e.stop()}}),e,null,[[0,143]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var o=e.apply(t,i);function s(e){a(o,r,n,s,u,"next",e)}function u(e){a(o,r,n,s,u,"throw",e)}s(void 0)}))});return function(e,i){return t.apply(this,arguments)}}())},13503:function(e,t,i){var r,n,a=i(88962),o=i(33368),s=i(71650),u=i(68308),l=i(82390),c=i(69205),d=i(91808),h=(i(97393),i(85717),i(91998),i(48950),i(5095)),f=i(95260),g=i(18394),v=i(3850),p=i(91131);function m(e){return(0,p.t)(e)&&"zone"!==(0,v.N)(e)}var y=["zone"];(0,d.Z)([(0,f.Mo)("ha-automation-trigger-zone")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),a=0;a<r;a++)n[a]=arguments[a];return t=(0,u.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)()],key:"trigger",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{entity_id:"",zone:"",event:"enter"}}},{kind:"method",key:"render",value:function(){var e=this.trigger,t=e.entity_id,i=e.zone,n=e.event;return(0,h.dy)(r||(r=(0,a.Z)([' <ha-entity-picker .label="','" .value="','" .disabled="','" @value-changed="','" .hass="','" allow-custom-entity .entityFilter="','"></ha-entity-picker> <ha-entity-picker .label="','" .value="','" .disabled="','" @value-changed="','" .hass="','" allow-custom-entity .includeDomains="','"></ha-entity-picker> <label> ',' <ha-formfield .disabled="','" .label="','"> <ha-radio name="event" value="enter" .disabled="','" .checked="','" @change="','"></ha-radio> </ha-formfield> <ha-formfield .disabled="','" .label="','"> <ha-radio name="event" value="leave" .disabled="','" .checked="','" @change="','"></ha-radio> </ha-formfield> </label> '])),this.hass.localize("ui.panel.config.automation.editor.triggers.type.zone.entity"),t,this.disabled,this._entityPicked,this.hass,m,this.hass.localize("ui.panel.config.automation.editor.triggers.type.zone.zone"),i,this.disabled,this._zonePicked,this.hass,y,this.hass.localize("ui.panel.config.automation.editor.triggers.type.zone.event"),this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.type.zone.enter"),this.disabled,"enter"===n,this._radioGroupPicked,this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.type.zone.leave"),this.disabled,"leave"===n,this._radioGroupPicked)}},{kind:"method",key:"_entityPicked",value:function(e){e.stopPropagation(),(0,g.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{entity_id:e.detail.value})})}},{kind:"method",key:"_zonePicked",value:function(e){e.stopPropagation(),(0,g.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{zone:e.detail.value})})}},{kind:"method",key:"_radioGroupPicked",value:function(e){e.stopPropagation(),(0,g.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.trigger),{},{event:e.target.value})})}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(n||(n=(0,a.Z)(["label{display:flex;align-items:center}ha-entity-picker{display:block;margin-bottom:24px}"])))}}]}}),h.oi)}}]);
+//# sourceMappingURL=1848.nCTvwpagZy0.js.map
\ No newline at end of file
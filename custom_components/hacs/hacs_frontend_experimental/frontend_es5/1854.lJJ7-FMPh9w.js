@@ -0,0 +1,2 @@
+(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1854],{58556:function(t,r,n){"use strict";var e;n(46798),n(94570),n(91584),(e="undefined"!=typeof process&&"[object process]"==={}.toString.call(process)||"undefined"!=typeof navigator&&"ReactNative"===navigator.product?global:self).Proxy||(e.Proxy=n(87082)(),e.Proxy.revocable=e.Proxy.revocable)},87082:function(t,r,n){var e=n(3355).default;n(51467),n(30535),n(17692),n(80628),n(30419),n(46798),n(9849),n(50289),n(94167),n(40720),n(37792),t.exports=function(){var t,r=null;function n(t){return!!t&&("object"===e(t)||"function"==typeof t)}function o(t){if(null!==t&&!n(t))throw new TypeError("Object prototype may only be an Object or null: "+t)}var i=Object,u=Boolean(i.create)||!({__proto__:null}instanceof i),c=i.create||(u?function(t){return o(t),{__proto__:t}}:function(t){if(o(t),null===t)throw new SyntaxError("Native Object.create is required to create objects with null prototype");var r=function(){};return r.prototype=t,new r}),s=function(){return null},a=i.getPrototypeOf||([].__proto__===Array.prototype?function(t){var r=t.__proto__;return n(r)?r:null}:s);return t=function(e,f){if(void 0===(this&&this instanceof t?this.constructor:void 0))throw new TypeError("Constructor Proxy requires 'new'");if(!n(e)||!n(f))throw new TypeError("Cannot create proxy with a non-object as target or handler");var l=function(){};r=function(){e=null,l=function(t){throw new TypeError("Cannot perform '".concat(t,"' on a proxy that has been revoked"))}},setTimeout((function(){r=null}),0);var p=f;for(var v in f={get:null,set:null,apply:null,construct:null},p){if(!(v in f))throw new TypeError("Proxy polyfill does not support trap '".concat(v,"'"));f[v]=p[v]}"function"==typeof p&&(f.apply=p.apply.bind(p));var h,y=a(e),d=!1,g=!1;"function"==typeof e?(h=function(){var t=this&&this.constructor===h,r=Array.prototype.slice.call(arguments);return l(t?"construct":"apply"),t&&f.construct?f.construct.call(this,e,r):!t&&f.apply?f.apply(e,this,r):t?(r.unshift(e),new(e.bind.apply(e,r))):e.apply(this,r)},d=!0):e instanceof Array?(h=[],g=!0):h=u||null!==y?c(y):{};var b=f.get?function(t){return l("get"),f.get(this,t,h)}:function(t){return l("get"),this[t]},m=f.set?function(t,r){l("set");f.set(this,t,r,h)}:function(t,r){l("set"),this[t]=r},x=i.getOwnPropertyNames(e),w={};x.forEach((function(t){if(!d&&!g||!(t in h)){var r=i.getOwnPropertyDescriptor(e,t),n={enumerable:Boolean(r.enumerable),get:b.bind(e,t),set:m.bind(e,t)};i.defineProperty(h,t,n),w[t]=!0}}));var S=!0;if(d||g){var E=i.setPrototypeOf||([].__proto__===Array.prototype?function(t,r){return o(r),t.__proto__=r,t}:s);y&&E(h,y)||(S=!1)}if(f.get||!S)for(var O in e)w[O]||i.defineProperty(h,O,{get:b.bind(e,O)});return i.seal(e),i.seal(h),h},t.revocable=function(n,e){return{proxy:new t(n,e),revoke:r}},t}},3355:function(t,r,n){function e(r){return t.exports=e="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},t.exports.__esModule=!0,t.exports.default=t.exports,e(r)}n(94738),n(98214),n(46798),n(20254),n(51358),n(5239),n(98490),t.exports=e,t.exports.__esModule=!0,t.exports.default=t.exports},9160:function(t,r,n){"use strict";var e=n(30553),o=n(71414),i=TypeError;t.exports=function(t){if(e(t))return t;throw new i(o(t)+" is not a function")}},50683:function(t,r,n){"use strict";var e=n(78142),o=n(71414),i=TypeError;t.exports=function(t){if(e(t))return t;throw new i(o(t)+" is not a constructor")}},95859:function(t,r,n){"use strict";var e=n(73758),o=String,i=TypeError;t.exports=function(t){if(e(t))return t;throw new i("Can't set "+o(t)+" as a prototype")}},90476:function(t,r,n){"use strict";var e=n(10282),o=n(9885),i=n(54991).f,u=e("unscopables"),c=Array.prototype;void 0===c[u]&&i(c,u,{configurable:!0,value:o(null)}),t.exports=function(t){c[u][t]=!0}},85539:function(t,r,n){"use strict";var e=n(95882),o=TypeError;t.exports=function(t,r){if(e(r,t))return t;throw new o("Incorrect invocation")}},22933:function(t,r,n){"use strict";var e=n(38475),o=String,i=TypeError;t.exports=function(t){if(e(t))return t;throw new i(o(t)+" is not an object")}},57939:function(t,r,n){"use strict";var e=n(18431);t.exports=e((function(){if("function"==typeof ArrayBuffer){var t=new ArrayBuffer(8);Object.isExtensible(t)&&Object.defineProperty(t,"a",{value:8})}}))},65332:function(t,r,n){"use strict";var e=n(19480),o=n(73834),i=n(10228);t.exports=function(t){for(var r=e(this),n=i(r),u=arguments.length,c=o(u>1?arguments[1]:void 0,n),s=u>2?arguments[2]:void 0,a=void 0===s?n:o(s,n);a>c;)r[c++]=t;return r}},30519:function(t,r,n){"use strict";var e=n(78856).forEach,o=n(54053)("forEach");t.exports=o?[].forEach:function(t){return e(this,t,arguments.length>1?arguments[1]:void 0)}},32413:function(t,r,n){"use strict";var e=n(76902),o=n(43173),i=n(19480),u=n(74856),c=n(21678),s=n(78142),a=n(10228),f=n(53396),l=n(46767),p=n(5218),v=Array;t.exports=function(t){var r=i(t),n=s(this),h=arguments.length,y=h>1?arguments[1]:void 0,d=void 0!==y;d&&(y=e(y,h>2?arguments[2]:void 0));var g,b,m,x,w,S,E=p(r),O=0;if(!E||this===v&&c(E))for(g=a(r),b=n?new this(g):v(g);g>O;O++)S=d?y(r[O],O):r[O],f(b,O,S);else for(w=(x=l(r,E)).next,b=n?new this:[];!(m=o(w,x)).done;O++)S=d?u(x,y,[m.value,O],!0):m.value,f(b,O,S);return b.length=O,b}},92460:function(t,r,n){"use strict";var e=n(17460),o=n(73834),i=n(10228),u=function(t){return function(r,n,u){var c,s=e(r),a=i(s),f=o(u,a);if(t&&n!=n){for(;a>f;)if((c=s[f++])!=c)return!0}else for(;a>f;f++)if((t||f in s)&&s[f]===n)return t||f||0;return!t&&-1}};t.exports={includes:u(!0),indexOf:u(!1)}},78856:function(t,r,n){"use strict";var e=n(76902),o=n(55418),i=n(70814),u=n(19480),c=n(10228),s=n(26183),a=o([].push),f=function(t){var r=1===t,n=2===t,o=3===t,f=4===t,l=6===t,p=7===t,v=5===t||l;return function(h,y,d,g){for(var b,m,x=u(h),w=i(x),S=c(w),E=e(y,d),O=0,j=g||s,T=r?j(h,S):n||p?j(h,0):void 0;S>O;O++)if((v||O in w)&&(m=E(b=w[O],O,x),t))if(r)T[O]=m;else if(m)switch(t){case 3:return!0;case 5:return b;case 6:return O;case 2:a(T,b)}else switch(t){case 4:return!1;case 7:a(T,b)}return l?-1:o||f?f:T}};t.exports={forEach:f(0),map:f(1),filter:f(2),some:f(3),every:f(4),find:f(5),findIndex:f(6),filterReject:f(7)}},817:function(t,r,n){"use strict";var e=n(18431),o=n(10282),i=n(91625),u=o("species");t.exports=function(t){return i>=51||!e((function(){var r=[];return(r.constructor={})[u]=function(){return{foo:1}},1!==r[t](Boolean).foo}))}},54053:function(t,r,n){"use strict";var e=n(18431);t.exports=function(t,r){var n=[][t];return!!n&&e((function(){n.call(null,r||function(){return 1},1)}))}},42439:function(t,r,n){"use strict";var e=n(9160),o=n(19480),i=n(70814),u=n(10228),c=TypeError,s=function(t){return function(r,n,s,a){var f=o(r),l=i(f),p=u(f);e(n);var v=t?p-1:0,h=t?-1:1;if(s<2)for(;;){if(v in l){a=l[v],v+=h;break}if(v+=h,t?v<0:p<=v)throw new c("Reduce of empty array with no initial value")}for(;t?v>=0:p>v;v+=h)v in l&&(a=n(a,l[v],v,f));return a}};t.exports={left:s(!1),right:s(!0)}},1991:function(t,r,n){"use strict";var e=n(58849),o=n(35968),i=TypeError,u=Object.getOwnPropertyDescriptor,c=e&&!function(){if(void 0!==this)return!0;try{Object.defineProperty([],"length",{writable:!1}).length=1}catch(t){return t instanceof TypeError}}();t.exports=c?function(t,r){if(o(t)&&!u(t,"length").writable)throw new i("Cannot set read only .length");return t.length=r}:function(t,r){return t.length=r}},88755:function(t,r,n){"use strict";var e=n(55418);t.exports=e([].slice)},60103:function(t,r,n){"use strict";var e=n(35968),o=n(78142),i=n(38475),u=n(10282)("species"),c=Array;t.exports=function(t){var r;return e(t)&&(r=t.constructor,(o(r)&&(r===c||e(r.prototype))||i(r)&&null===(r=r[u]))&&(r=void 0)),void 0===r?c:r}},26183:function(t,r,n){"use strict";var e=n(60103);t.exports=function(t,r){return new(e(t))(0===r?0:r)}},74856:function(t,r,n){"use strict";var e=n(22933),o=n(56208);t.exports=function(t,r,n,i){try{return i?r(e(n)[0],n[1]):r(n)}catch(u){o(t,"throw",u)}}},54294:function(t,r,n){"use strict";var e=n(10282)("iterator"),o=!1;try{var i=0,u={next:function(){return{done:!!i++}},return:function(){o=!0}};u[e]=function(){return this},Array.from(u,(function(){throw 2}))}catch(c){}t.exports=function(t,r){try{if(!r&&!o)return!1}catch(c){return!1}var n=!1;try{var i={};i[e]=function(){return{next:function(){return{done:n=!0}}}},t(i)}catch(c){}return n}},42458:function(t,r,n){"use strict";var e=n(55418),o=e({}.toString),i=e("".slice);t.exports=function(t){return i(o(t),8,-1)}},21973:function(t,r,n){"use strict";var e=n(9574),o=n(30553),i=n(42458),u=n(10282)("toStringTag"),c=Object,s="Arguments"===i(function(){return arguments}());t.exports=e?i:function(t){var r,n,e;return void 0===t?"Undefined":null===t?"Null":"string"==typeof(n=function(t,r){try{return t[r]}catch(n){}}(r=c(t),u))?n:s?i(r):"Object"===(e=i(r))&&o(r.callee)?"Arguments":e}},52961:function(t,r,n){"use strict";var e=n(9885),o=n(40030),i=n(40855),u=n(76902),c=n(85539),s=n(59317),a=n(72208),f=n(4638),l=n(85501),p=n(36929),v=n(58849),h=n(70276).fastKey,y=n(12648),d=y.set,g=y.getterFor;t.exports={getConstructor:function(t,r,n,f){var l=t((function(t,o){c(t,p),d(t,{type:r,index:e(null),first:void 0,last:void 0,size:0}),v||(t.size=0),s(o)||a(o,t[f],{that:t,AS_ENTRIES:n})})),p=l.prototype,y=g(r),b=function(t,r,n){var e,o,i=y(t),u=m(t,r);return u?u.value=n:(i.last=u={index:o=h(r,!0),key:r,value:n,previous:e=i.last,next:void 0,removed:!1},i.first||(i.first=u),e&&(e.next=u),v?i.size++:t.size++,"F"!==o&&(i.index[o]=u)),t},m=function(t,r){var n,e=y(t),o=h(r);if("F"!==o)return e.index[o];for(n=e.first;n;n=n.next)if(n.key===r)return n};return i(p,{clear:function(){for(var t=y(this),r=t.first;r;)r.removed=!0,r.previous&&(r.previous=r.previous.next=void 0),r=r.next;t.first=t.last=void 0,t.index=e(null),v?t.size=0:this.size=0},delete:function(t){var r=this,n=y(r),e=m(r,t);if(e){var o=e.next,i=e.previous;delete n.index[e.index],e.removed=!0,i&&(i.next=o),o&&(o.previous=i),n.first===e&&(n.first=o),n.last===e&&(n.last=i),v?n.size--:r.size--}return!!e},forEach:function(t){for(var r,n=y(this),e=u(t,arguments.length>1?arguments[1]:void 0);r=r?r.next:n.first;)for(e(r.value,r.key,this);r&&r.removed;)r=r.previous},has:function(t){return!!m(this,t)}}),i(p,n?{get:function(t){var r=m(this,t);return r&&r.value},set:function(t,r){return b(this,0===t?0:t,r)}}:{add:function(t){return b(this,t=0===t?0:t,t)}}),v&&o(p,"size",{configurable:!0,get:function(){return y(this).size}}),l},setStrong:function(t,r,n){var e=r+" Iterator",o=g(r),i=g(e);f(t,r,(function(t,r){d(this,{type:e,target:t,state:o(t),kind:r,last:void 0})}),(function(){for(var t=i(this),r=t.kind,n=t.last;n&&n.removed;)n=n.previous;return t.target&&(t.last=n=n?n.next:t.state.first)?l("keys"===r?n.key:"values"===r?n.value:[n.key,n.value],!1):(t.target=void 0,l(void 0,!0))}),n?"entries":"values",!n,!0),p(r)}}},6946:function(t,r,n){"use strict";var e=n(55418),o=n(40855),i=n(70276).getWeakData,u=n(85539),c=n(22933),s=n(59317),a=n(38475),f=n(72208),l=n(78856),p=n(55229),v=n(12648),h=v.set,y=v.getterFor,d=l.find,g=l.findIndex,b=e([].splice),m=0,x=function(t){return t.frozen||(t.frozen=new w)},w=function(){this.entries=[]},S=function(t,r){return d(t.entries,(function(t){return t[0]===r}))};w.prototype={get:function(t){var r=S(this,t);if(r)return r[1]},has:function(t){return!!S(this,t)},set:function(t,r){var n=S(this,t);n?n[1]=r:this.entries.push([t,r])},delete:function(t){var r=g(this.entries,(function(r){return r[0]===t}));return~r&&b(this.entries,r,1),!!~r}},t.exports={getConstructor:function(t,r,n,e){var l=t((function(t,o){u(t,v),h(t,{type:r,id:m++,frozen:void 0}),s(o)||f(o,t[e],{that:t,AS_ENTRIES:n})})),v=l.prototype,d=y(r),g=function(t,r,n){var e=d(t),o=i(c(r),!0);return!0===o?x(e).set(r,n):o[e.id]=n,t};return o(v,{delete:function(t){var r=d(this);if(!a(t))return!1;var n=i(t);return!0===n?x(r).delete(t):n&&p(n,r.id)&&delete n[r.id]},has:function(t){var r=d(this);if(!a(t))return!1;var n=i(t);return!0===n?x(r).has(t):n&&p(n,r.id)}}),o(v,n?{get:function(t){var r=d(this);if(a(t)){var n=i(t);return!0===n?x(r).get(t):n?n[r.id]:void 0}},set:function(t,r){return g(this,t,r)}}:{add:function(t){return g(this,t,!0)}}),l}}},88820:function(t,r,n){"use strict";var e=n(68077),o=n(5813),i=n(55418),u=n(27992),c=n(73936),s=n(70276),a=n(72208),f=n(85539),l=n(30553),p=n(59317),v=n(38475),h=n(18431),y=n(54294),d=n(48357),g=n(81760);t.exports=function(t,r,n){var b=-1!==t.indexOf("Map"),m=-1!==t.indexOf("Weak"),x=b?"set":"add",w=o[t],S=w&&w.prototype,E=w,O={},j=function(t){var r=i(S[t]);c(S,t,"add"===t?function(t){return r(this,0===t?0:t),this}:"delete"===t?function(t){return!(m&&!v(t))&&r(this,0===t?0:t)}:"get"===t?function(t){return m&&!v(t)?void 0:r(this,0===t?0:t)}:"has"===t?function(t){return!(m&&!v(t))&&r(this,0===t?0:t)}:function(t,n){return r(this,0===t?0:t,n),this})};if(u(t,!l(w)||!(m||S.forEach&&!h((function(){(new w).entries().next()})))))E=n.getConstructor(r,t,b,x),s.enable();else if(u(t,!0)){var T=new E,P=T[x](m?{}:-0,1)!==T,A=h((function(){T.has(1)})),I=y((function(t){new w(t)})),R=!m&&h((function(){for(var t=new w,r=5;r--;)t[x](r,r);return!t.has(-0)}));I||((E=r((function(t,r){f(t,S);var n=g(new w,t,E);return p(r)||a(r,n[x],{that:n,AS_ENTRIES:b}),n}))).prototype=S,S.constructor=E),(A||R)&&(j("delete"),j("has"),b&&j("get")),(R||P)&&j(x),m&&S.clear&&delete S.clear}return O[t]=E,e({global:!0,constructor:!0,forced:E!==w},O),d(E,t),m||n.setStrong(E,t,b),E}},93213:function(t,r,n){"use strict";var e=n(55229),o=n(20202),i=n(25245),u=n(54991);t.exports=function(t,r,n){for(var c=o(r),s=u.f,a=i.f,f=0;f<c.length;f++){var l=c[f];e(t,l)||n&&e(n,l)||s(t,l,a(r,l))}}},76870:function(t,r,n){"use strict";var e=n(10282)("match");t.exports=function(t){var r=/./;try{"/./"[t](r)}catch(n){try{return r[e]=!1,"/./"[t](r)}catch(o){}}return!1}},51577:function(t,r,n){"use strict";var e=n(18431);t.exports=!e((function(){function t(){}return t.prototype.constructor=null,Object.getPrototypeOf(new t)!==t.prototype}))},85501:function(t){"use strict";t.exports=function(t,r){return{value:t,done:r}}},52838:function(t,r,n){"use strict";var e=n(58849),o=n(54991),i=n(51012);t.exports=e?function(t,r,n){return o.f(t,r,i(1,n))}:function(t,r,n){return t[r]=n,t}},51012:function(t){"use strict";t.exports=function(t,r){return{enumerable:!(1&t),configurable:!(2&t),writable:!(4&t),value:r}}},53396:function(t,r,n){"use strict";var e=n(84297),o=n(54991),i=n(51012);t.exports=function(t,r,n){var u=e(r);u in t?o.f(t,u,i(0,n)):t[u]=n}},22653:function(t,r,n){"use strict";var e=n(22933),o=n(9265),i=TypeError;t.exports=function(t){if(e(this),"string"===t||"default"===t)t="string";else if("number"!==t)throw new i("Incorrect hint");return o(this,t)}},40030:function(t,r,n){"use strict";var e=n(23141),o=n(54991);t.exports=function(t,r,n){return n.get&&e(n.get,r,{getter:!0}),n.set&&e(n.set,r,{setter:!0}),o.f(t,r,n)}},73936:function(t,r,n){"use strict";var e=n(30553),o=n(54991),i=n(23141),u=n(64040);t.exports=function(t,r,n,c){c||(c={});var s=c.enumerable,a=void 0!==c.name?c.name:r;if(e(n)&&i(n,a,c),c.global)s?t[r]=n:u(r,n);else{try{c.unsafe?t[r]&&(s=!0):delete t[r]}catch(f){}s?t[r]=n:o.f(t,r,{value:n,enumerable:!1,configurable:!c.nonConfigurable,writable:!c.nonWritable})}return t}},40855:function(t,r,n){"use strict";var e=n(73936);t.exports=function(t,r,n){for(var o in r)e(t,o,r[o],n);return t}},64040:function(t,r,n){"use strict";var e=n(5813),o=Object.defineProperty;t.exports=function(t,r){try{o(e,t,{value:r,configurable:!0,writable:!0})}catch(n){e[t]=r}return r}},35102:function(t,r,n){"use strict";var e=n(71414),o=TypeError;t.exports=function(t,r){if(!delete t[r])throw new o("Cannot delete property "+e(r)+" of "+e(t))}},58849:function(t,r,n){"use strict";var e=n(18431);t.exports=!e((function(){return 7!==Object.defineProperty({},1,{get:function(){return 7}})[1]}))},55836:function(t,r,n){"use strict";var e=n(5813),o=n(38475),i=e.document,u=o(i)&&o(i.createElement);t.exports=function(t){return u?i.createElement(t):{}}},54108:function(t){"use strict";var r=TypeError;t.exports=function(t){if(t>9007199254740991)throw r("Maximum allowed index exceeded");return t}},70803:function(t){"use strict";t.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},1617:function(t,r,n){"use strict";var e=n(55836)("span").classList,o=e&&e.constructor&&e.constructor.prototype;t.exports=o===Object.prototype?void 0:o},89397:function(t,r,n){"use strict";var e=n(37575),o=n(13089);t.exports=!e&&!o&&"object"==typeof window&&"object"==typeof document},37575:function(t){"use strict";t.exports="object"==typeof Deno&&Deno&&"object"==typeof Deno.version},3089:function(t,r,n){"use strict";var e=n(68360);t.exports=/ipad|iphone|ipod/i.test(e)&&"undefined"!=typeof Pebble},78609:function(t,r,n){"use strict";var e=n(68360);t.exports=/(?:ipad|iphone|ipod).*applewebkit/i.test(e)},13089:function(t,r,n){"use strict";var e=n(5813),o=n(42458);t.exports="process"===o(e.process)},1642:function(t,r,n){"use strict";var e=n(68360);t.exports=/web0s(?!.*chrome)/i.test(e)},68360:function(t){"use strict";t.exports="undefined"!=typeof navigator&&String(navigator.userAgent)||""},91625:function(t,r,n){"use strict";var e,o,i=n(5813),u=n(68360),c=i.process,s=i.Deno,a=c&&c.versions||s&&s.version,f=a&&a.v8;f&&(o=(e=f.split("."))[0]>0&&e[0]<4?1:+(e[0]+e[1])),!o&&u&&(!(e=u.match(/Edge\/(\d+)/))||e[1]>=74)&&(e=u.match(/Chrome\/(\d+)/))&&(o=+e[1]),t.exports=o},97703:function(t){"use strict";t.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},21709:function(t,r,n){"use strict";var e=n(55418),o=Error,i=e("".replace),u=String(new o("zxcasd").stack),c=/\n\s*at [^:]*:[^\n]*/,s=c.test(u);t.exports=function(t,r){if(s&&"string"==typeof t&&!o.prepareStackTrace)for(;r--;)t=i(t,c,"");return t}},96337:function(t,r,n){"use strict";var e=n(52838),o=n(21709),i=n(40752),u=Error.captureStackTrace;t.exports=function(t,r,n,c){i&&(u?u(t,r):e(t,"stack",o(n,c)))}},40752:function(t,r,n){"use strict";var e=n(18431),o=n(51012);t.exports=!e((function(){var t=new Error("a");return!("stack"in t)||(Object.defineProperty(t,"stack",o(1,7)),7!==t.stack)}))},68077:function(t,r,n){"use strict";var e=n(5813),o=n(25245).f,i=n(52838),u=n(73936),c=n(64040),s=n(93213),a=n(27992);t.exports=function(t,r){var n,f,l,p,v,h=t.target,y=t.global,d=t.stat;if(n=y?e:d?e[h]||c(h,{}):(e[h]||{}).prototype)for(f in r){if(p=r[f],l=t.dontCallGetSet?(v=o(n,f))&&v.value:n[f],!a(y?f:h+(d?".":"#")+f,t.forced)&&void 0!==l){if(typeof p==typeof l)continue;s(p,l)}(t.sham||l&&l.sham)&&i(p,"sham",!0),u(n,f,p,t)}}},18431:function(t){"use strict";t.exports=function(t){try{return!!t()}catch(r){return!0}}},91452:function(t,r,n){"use strict";var e=n(18431);t.exports=!e((function(){return Object.isExtensible(Object.preventExtensions({}))}))},35449:function(t,r,n){"use strict";var e=n(39760),o=Function.prototype,i=o.apply,u=o.call;t.exports="object"==typeof Reflect&&Reflect.apply||(e?u.bind(i):function(){return u.apply(i,arguments)})},76902:function(t,r,n){"use strict";var e=n(74734),o=n(9160),i=n(39760),u=e(e.bind);t.exports=function(t,r){return o(t),void 0===r?t:i?u(t,r):function(){return t.apply(r,arguments)}}},39760:function(t,r,n){"use strict";var e=n(18431);t.exports=!e((function(){var t=function(){}.bind();return"function"!=typeof t||t.hasOwnProperty("prototype")}))},1319:function(t,r,n){"use strict";var e=n(55418),o=n(9160),i=n(38475),u=n(55229),c=n(88755),s=n(39760),a=Function,f=e([].concat),l=e([].join),p={};t.exports=s?a.bind:function(t){var r=o(this),n=r.prototype,e=c(arguments,1),s=function(){var n=f(e,c(arguments));return this instanceof s?function(t,r,n){if(!u(p,r)){for(var e=[],o=0;o<r;o++)e[o]="a["+o+"]";p[r]=a("C,a","return new C("+l(e,",")+")")}return p[r](t,n)}(r,n.length,n):r.apply(t,n)};return i(n)&&(s.prototype=n),s}},43173:function(t,r,n){"use strict";var e=n(39760),o=Function.prototype.call;t.exports=e?o.bind(o):function(){return o.apply(o,arguments)}},83875:function(t,r,n){"use strict";var e=n(58849),o=n(55229),i=Function.prototype,u=e&&Object.getOwnPropertyDescriptor,c=o(i,"name"),s=c&&"something"===function(){}.name,a=c&&(!e||e&&u(i,"name").configurable);t.exports={EXISTS:c,PROPER:s,CONFIGURABLE:a}},9881:function(t,r,n){"use strict";var e=n(55418),o=n(9160);t.exports=function(t,r,n){try{return e(o(Object.getOwnPropertyDescriptor(t,r)[n]))}catch(i){}}},74734:function(t,r,n){"use strict";var e=n(42458),o=n(55418);t.exports=function(t){if("Function"===e(t))return o(t)}},55418:function(t,r,n){"use strict";var e=n(39760),o=Function.prototype,i=o.call,u=e&&o.bind.bind(i,i);t.exports=e?u:function(t){return function(){return i.apply(t,arguments)}}},29694:function(t,r,n){"use strict";var e=n(5813),o=n(30553);t.exports=function(t,r){return arguments.length<2?(n=e[t],o(n)?n:void 0):e[t]&&e[t][r];var n}},73177:function(t){"use strict";t.exports=function(t){return{iterator:t,next:t.next,done:!1}}},5218:function(t,r,n){"use strict";var e=n(21973),o=n(54339),i=n(59317),u=n(70381),c=n(10282)("iterator");t.exports=function(t){if(!i(t))return o(t,c)||o(t,"@@iterator")||u[e(t)]}},46767:function(t,r,n){"use strict";var e=n(43173),o=n(9160),i=n(22933),u=n(71414),c=n(5218),s=TypeError;t.exports=function(t,r){var n=arguments.length<2?c(t):r;if(o(n))return i(e(n,t));throw new s(u(t)+" is not iterable")}},56454:function(t,r,n){"use strict";var e=n(55418),o=n(35968),i=n(30553),u=n(42458),c=n(11336),s=e([].push);t.exports=function(t){if(i(t))return t;if(o(t)){for(var r=t.length,n=[],e=0;e<r;e++){var a=t[e];"string"==typeof a?s(n,a):"number"!=typeof a&&"Number"!==u(a)&&"String"!==u(a)||s(n,c(a))}var f=n.length,l=!0;return function(t,r){if(l)return l=!1,r;if(o(this))return r;for(var e=0;e<f;e++)if(n[e]===t)return r}}}},54339:function(t,r,n){"use strict";var e=n(9160),o=n(59317);t.exports=function(t,r){var n=t[r];return o(n)?void 0:e(n)}},5813:function(t){"use strict";var r=function(t){return t&&t.Math===Math&&t};t.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof global&&global)||r("object"==typeof this&&this)||function(){return this}()||Function("return this")()},55229:function(t,r,n){"use strict";var e=n(55418),o=n(19480),i=e({}.hasOwnProperty);t.exports=Object.hasOwn||function(t,r){return i(o(t),r)}},46170:function(t){"use strict";t.exports={}},15089:function(t){"use strict";t.exports=function(t,r){try{1===arguments.length?console.error(t):console.error(t,r)}catch(n){}}},34483:function(t,r,n){"use strict";var e=n(29694);t.exports=e("document","documentElement")},33642:function(t,r,n){"use strict";var e=n(58849),o=n(18431),i=n(55836);t.exports=!e&&!o((function(){return 7!==Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},70814:function(t,r,n){"use strict";var e=n(55418),o=n(18431),i=n(42458),u=Object,c=e("".split);t.exports=o((function(){return!u("z").propertyIsEnumerable(0)}))?function(t){return"String"===i(t)?c(t,""):u(t)}:u},81760:function(t,r,n){"use strict";var e=n(30553),o=n(38475),i=n(27248);t.exports=function(t,r,n){var u,c;return i&&e(u=r.constructor)&&u!==n&&o(c=u.prototype)&&c!==n.prototype&&i(t,c),t}},47397:function(t,r,n){"use strict";var e=n(55418),o=n(30553),i=n(13036),u=e(Function.toString);o(i.inspectSource)||(i.inspectSource=function(t){return u(t)}),t.exports=i.inspectSource},91934:function(t,r,n){"use strict";var e=n(38475),o=n(52838);t.exports=function(t,r){e(r)&&"cause"in r&&o(t,"cause",r.cause)}},70276:function(t,r,n){"use strict";var e=n(68077),o=n(55418),i=n(46170),u=n(38475),c=n(55229),s=n(54991).f,a=n(45919),f=n(16102),l=n(69362),p=n(92311),v=n(91452),h=!1,y=p("meta"),d=0,g=function(t){s(t,y,{value:{objectID:"O"+d++,weakData:{}}})},b=t.exports={enable:function(){b.enable=function(){},h=!0;var t=a.f,r=o([].splice),n={};n[y]=1,t(n).length&&(a.f=function(n){for(var e=t(n),o=0,i=e.length;o<i;o++)if(e[o]===y){r(e,o,1);break}return e},e({target:"Object",stat:!0,forced:!0},{getOwnPropertyNames:f.f}))},fastKey:function(t,r){if(!u(t))return"symbol"==typeof t?t:("string"==typeof t?"S":"P")+t;if(!c(t,y)){if(!l(t))return"F";if(!r)return"E";g(t)}return t[y].objectID},getWeakData:function(t,r){if(!c(t,y)){if(!l(t))return!0;if(!r)return!1;g(t)}return t[y].weakData},onFreeze:function(t){return v&&h&&l(t)&&!c(t,y)&&g(t),t}};i[y]=!0},12648:function(t,r,n){"use strict";var e,o,i,u=n(83777),c=n(5813),s=n(38475),a=n(52838),f=n(55229),l=n(13036),p=n(95292),v=n(46170),h="Object already initialized",y=c.TypeError,d=c.WeakMap;if(u||l.state){var g=l.state||(l.state=new d);g.get=g.get,g.has=g.has,g.set=g.set,e=function(t,r){if(g.has(t))throw new y(h);return r.facade=t,g.set(t,r),r},o=function(t){return g.get(t)||{}},i=function(t){return g.has(t)}}else{var b=p("state");v[b]=!0,e=function(t,r){if(f(t,b))throw new y(h);return r.facade=t,a(t,b,r),r},o=function(t){return f(t,b)?t[b]:{}},i=function(t){return f(t,b)}}t.exports={set:e,get:o,has:i,enforce:function(t){return i(t)?o(t):e(t,{})},getterFor:function(t){return function(r){var n;if(!s(r)||(n=o(r)).type!==t)throw new y("Incompatible receiver, "+t+" required");return n}}}},21678:function(t,r,n){"use strict";var e=n(10282),o=n(70381),i=e("iterator"),u=Array.prototype;t.exports=function(t){return void 0!==t&&(o.Array===t||u[i]===t)}},35968:function(t,r,n){"use strict";var e=n(42458);t.exports=Array.isArray||function(t){return"Array"===e(t)}},30553:function(t){"use strict";var r="object"==typeof document&&document.all;t.exports=void 0===r&&void 0!==r?function(t){return"function"==typeof t||t===r}:function(t){return"function"==typeof t}},78142:function(t,r,n){"use strict";var e=n(55418),o=n(18431),i=n(30553),u=n(21973),c=n(29694),s=n(47397),a=function(){},f=[],l=c("Reflect","construct"),p=/^\s*(?:class|function)\b/,v=e(p.exec),h=!p.test(a),y=function(t){if(!i(t))return!1;try{return l(a,f,t),!0}catch(r){return!1}},d=function(t){if(!i(t))return!1;switch(u(t)){case"AsyncFunction":case"GeneratorFunction":case"AsyncGeneratorFunction":return!1}try{return h||!!v(p,s(t))}catch(r){return!0}};d.sham=!0,t.exports=!l||o((function(){var t;return y(y.call)||!y(Object)||!y((function(){t=!0}))||t}))?d:y},27992:function(t,r,n){"use strict";var e=n(18431),o=n(30553),i=/#|\.prototype\./,u=function(t,r){var n=s[c(t)];return n===f||n!==a&&(o(r)?e(r):!!r)},c=u.normalize=function(t){return String(t).replace(i,".").toLowerCase()},s=u.data={},a=u.NATIVE="N",f=u.POLYFILL="P";t.exports=u},59317:function(t){"use strict";t.exports=function(t){return null==t}},38475:function(t,r,n){"use strict";var e=n(30553);t.exports=function(t){return"object"==typeof t?null!==t:e(t)}},73758:function(t,r,n){"use strict";var e=n(38475);t.exports=function(t){return e(t)||null===t}},95448:function(t){"use strict";t.exports=!1},90744:function(t,r,n){"use strict";var e=n(38475),o=n(42458),i=n(10282)("match");t.exports=function(t){var r;return e(t)&&(void 0!==(r=t[i])?!!r:"RegExp"===o(t))}},12052:function(t,r,n){"use strict";var e=n(29694),o=n(30553),i=n(95882),u=n(58150),c=Object;t.exports=u?function(t){return"symbol"==typeof t}:function(t){var r=e("Symbol");return o(r)&&i(r.prototype,c(t))}},72208:function(t,r,n){"use strict";var e=n(76902),o=n(43173),i=n(22933),u=n(71414),c=n(21678),s=n(10228),a=n(95882),f=n(46767),l=n(5218),p=n(56208),v=TypeError,h=function(t,r){this.stopped=t,this.result=r},y=h.prototype;t.exports=function(t,r,n){var d,g,b,m,x,w,S,E=n&&n.that,O=!(!n||!n.AS_ENTRIES),j=!(!n||!n.IS_RECORD),T=!(!n||!n.IS_ITERATOR),P=!(!n||!n.INTERRUPTED),A=e(r,E),I=function(t){return d&&p(d,"normal",t),new h(!0,t)},R=function(t){return O?(i(t),P?A(t[0],t[1],I):A(t[0],t[1])):P?A(t,I):A(t)};if(j)d=t.iterator;else if(T)d=t;else{if(!(g=l(t)))throw new v(u(t)+" is not iterable");if(c(g)){for(b=0,m=s(t);m>b;b++)if((x=R(t[b]))&&a(y,x))return x;return new h(!1)}d=f(t,g)}for(w=j?t.next:d.next;!(S=o(w,d)).done;){try{x=R(S.value)}catch(k){p(d,"throw",k)}if("object"==typeof x&&x&&a(y,x))return x}return new h(!1)}},56208:function(t,r,n){"use strict";var e=n(43173),o=n(22933),i=n(54339);t.exports=function(t,r,n){var u,c;o(t);try{if(!(u=i(t,"return"))){if("throw"===r)throw n;return n}u=e(u,t)}catch(s){c=!0,u=s}if("throw"===r)throw n;if(c)throw u;return o(u),n}},54398:function(t,r,n){"use strict";var e=n(65017).IteratorPrototype,o=n(9885),i=n(51012),u=n(48357),c=n(70381),s=function(){return this};t.exports=function(t,r,n,a){var f=r+" Iterator";return t.prototype=o(e,{next:i(+!a,n)}),u(t,f,!1,!0),c[f]=s,t}},8900:function(t,r,n){"use strict";var e=n(43173),o=n(9885),i=n(52838),u=n(40855),c=n(10282),s=n(12648),a=n(54339),f=n(65017).IteratorPrototype,l=n(85501),p=n(56208),v=c("toStringTag"),h="IteratorHelper",y="WrapForValidIterator",d=s.set,g=function(t){var r=s.getterFor(t?y:h);return u(o(f),{next:function(){var n=r(this);if(t)return n.nextHandler();try{var e=n.done?void 0:n.nextHandler();return l(e,n.done)}catch(o){throw n.done=!0,o}},return:function(){var n=r(this),o=n.iterator;if(n.done=!0,t){var i=a(o,"return");return i?e(i,o):l(void 0,!0)}if(n.inner)try{p(n.inner.iterator,"normal")}catch(u){return p(o,"throw",u)}return p(o,"normal"),l(void 0,!0)}})},b=g(!0),m=g(!1);i(m,v,"Iterator Helper"),t.exports=function(t,r){var n=function(n,e){e?(e.iterator=n.iterator,e.next=n.next):e=n,e.type=r?y:h,e.nextHandler=t,e.counter=0,e.done=!1,d(this,e)};return n.prototype=r?b:m,n}},4638:function(t,r,n){"use strict";var e=n(68077),o=n(43173),i=n(95448),u=n(83875),c=n(30553),s=n(54398),a=n(2563),f=n(27248),l=n(48357),p=n(52838),v=n(73936),h=n(10282),y=n(70381),d=n(65017),g=u.PROPER,b=u.CONFIGURABLE,m=d.IteratorPrototype,x=d.BUGGY_SAFARI_ITERATORS,w=h("iterator"),S="keys",E="values",O="entries",j=function(){return this};t.exports=function(t,r,n,u,h,d,T){s(n,r,u);var P,A,I,R=function(t){if(t===h&&L)return L;if(!x&&t&&t in C)return C[t];switch(t){case S:case E:case O:return function(){return new n(this,t)}}return function(){return new n(this)}},k=r+" Iterator",_=!1,C=t.prototype,N=C[w]||C["@@iterator"]||h&&C[h],L=!x&&N||R(h),F="Array"===r&&C.entries||N;if(F&&(P=a(F.call(new t)))!==Object.prototype&&P.next&&(i||a(P)===m||(f?f(P,m):c(P[w])||v(P,w,j)),l(P,k,!0,!0),i&&(y[k]=j)),g&&h===E&&N&&N.name!==E&&(!i&&b?p(C,"name",E):(_=!0,L=function(){return o(N,this)})),h)if(A={values:R(E),keys:d?L:R(S),entries:R(O)},T)for(I in A)(x||_||!(I in C))&&v(C,I,A[I]);else e({target:r,proto:!0,forced:x||_},A);return i&&!T||C[w]===L||v(C,w,L,{name:h}),y[r]=L,A}},57902:function(t,r,n){"use strict";var e=n(43173),o=n(9160),i=n(22933),u=n(73177),c=n(8900),s=n(74856),a=c((function(){var t=this.iterator,r=i(e(this.next,t));if(!(this.done=!!r.done))return s(t,this.mapper,[r.value,this.counter++],!0)}));t.exports=function(t){return i(this),o(t),new a(u(this),{mapper:t})}},65017:function(t,r,n){"use strict";var e,o,i,u=n(18431),c=n(30553),s=n(38475),a=n(9885),f=n(2563),l=n(73936),p=n(10282),v=n(95448),h=p("iterator"),y=!1;[].keys&&("next"in(i=[].keys())?(o=f(f(i)))!==Object.prototype&&(e=o):y=!0),!s(e)||u((function(){var t={};return e[h].call(t)!==t}))?e={}:v&&(e=a(e)),c(e[h])||l(e,h,(function(){return this})),t.exports={IteratorPrototype:e,BUGGY_SAFARI_ITERATORS:y}},70381:function(t){"use strict";t.exports={}},10228:function(t,r,n){"use strict";var e=n(97142);t.exports=function(t){return e(t.length)}},23141:function(t,r,n){"use strict";var e=n(55418),o=n(18431),i=n(30553),u=n(55229),c=n(58849),s=n(83875).CONFIGURABLE,a=n(47397),f=n(12648),l=f.enforce,p=f.get,v=String,h=Object.defineProperty,y=e("".slice),d=e("".replace),g=e([].join),b=c&&!o((function(){return 8!==h((function(){}),"length",{value:8}).length})),m=String(String).split("String"),x=t.exports=function(t,r,n){"Symbol("===y(v(r),0,7)&&(r="["+d(v(r),/^Symbol\(([^)]*)\)/,"$1")+"]"),n&&n.getter&&(r="get "+r),n&&n.setter&&(r="set "+r),(!u(t,"name")||s&&t.name!==r)&&(c?h(t,"name",{value:r,configurable:!0}):t.name=r),b&&n&&u(n,"arity")&&t.length!==n.arity&&h(t,"length",{value:n.arity});try{n&&u(n,"constructor")&&n.constructor?c&&h(t,"prototype",{writable:!1}):t.prototype&&(t.prototype=void 0)}catch(o){}var e=l(t);return u(e,"source")||(e.source=g(m,"string"==typeof r?r:"")),t};Function.prototype.toString=x((function(){return i(this)&&p(this).source||a(this)}),"toString")},47329:function(t){"use strict";var r=Math.ceil,n=Math.floor;t.exports=Math.trunc||function(t){var e=+t;return(e>0?n:r)(e)}},33099:function(t,r,n){"use strict";var e,o,i,u,c,s=n(5813),a=n(95310),f=n(76902),l=n(20295).set,p=n(29639),v=n(78609),h=n(3089),y=n(1642),d=n(13089),g=s.MutationObserver||s.WebKitMutationObserver,b=s.document,m=s.process,x=s.Promise,w=a("queueMicrotask");if(!w){var S=new p,E=function(){var t,r;for(d&&(t=m.domain)&&t.exit();r=S.get();)try{r()}catch(n){throw S.head&&e(),n}t&&t.enter()};v||d||y||!g||!b?!h&&x&&x.resolve?((u=x.resolve(void 0)).constructor=x,c=f(u.then,u),e=function(){c(E)}):d?e=function(){m.nextTick(E)}:(l=f(l,s),e=function(){l(E)}):(o=!0,i=b.createTextNode(""),new g(E).observe(i,{characterData:!0}),e=function(){i.data=o=!o}),w=function(t){S.head||e(),S.add(t)}}t.exports=w},1731:function(t,r,n){"use strict";var e=n(9160),o=TypeError,i=function(t){var r,n;this.promise=new t((function(t,e){if(void 0!==r||void 0!==n)throw new o("Bad Promise constructor");r=t,n=e})),this.resolve=e(r),this.reject=e(n)};t.exports.f=function(t){return new i(t)}},30852:function(t,r,n){"use strict";var e=n(11336);t.exports=function(t,r){return void 0===t?arguments.length<2?"":r:e(t)}},52205:function(t,r,n){"use strict";var e=n(90744),o=TypeError;t.exports=function(t){if(e(t))throw new o("The method doesn't accept regular expressions");return t}},54914:function(t,r,n){"use strict";var e=n(58849),o=n(55418),i=n(43173),u=n(18431),c=n(93121),s=n(18503),a=n(60771),f=n(19480),l=n(70814),p=Object.assign,v=Object.defineProperty,h=o([].concat);t.exports=!p||u((function(){if(e&&1!==p({b:1},p(v({},"a",{enumerable:!0,get:function(){v(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var t={},r={},n=Symbol("assign detection"),o="abcdefghijklmnopqrst";return t[n]=7,o.split("").forEach((function(t){r[t]=t})),7!==p({},t)[n]||c(p({},r)).join("")!==o}))?function(t,r){for(var n=f(t),o=arguments.length,u=1,p=s.f,v=a.f;o>u;)for(var y,d=l(arguments[u++]),g=p?h(c(d),p(d)):c(d),b=g.length,m=0;b>m;)y=g[m++],e&&!i(v,d,y)||(n[y]=d[y]);return n}:p},9885:function(t,r,n){"use strict";var e,o=n(22933),i=n(44760),u=n(97703),c=n(46170),s=n(34483),a=n(55836),f=n(95292),l="prototype",p="script",v=f("IE_PROTO"),h=function(){},y=function(t){return"<"+p+">"+t+"</"+p+">"},d=function(t){t.write(y("")),t.close();var r=t.parentWindow.Object;return t=null,r},g=function(){try{e=new ActiveXObject("htmlfile")}catch(i){}var t,r,n;g="undefined"!=typeof document?document.domain&&e?d(e):(r=a("iframe"),n="java"+p+":",r.style.display="none",s.appendChild(r),r.src=String(n),(t=r.contentWindow.document).open(),t.write(y("document.F=Object")),t.close(),t.F):d(e);for(var o=u.length;o--;)delete g[l][u[o]];return g()};c[v]=!0,t.exports=Object.create||function(t,r){var n;return null!==t?(h[l]=o(t),n=new h,h[l]=null,n[v]=t):n=g(),void 0===r?n:i.f(n,r)}},44760:function(t,r,n){"use strict";var e=n(58849),o=n(52649),i=n(54991),u=n(22933),c=n(17460),s=n(93121);r.f=e&&!o?Object.defineProperties:function(t,r){u(t);for(var n,e=c(r),o=s(r),a=o.length,f=0;a>f;)i.f(t,n=o[f++],e[n]);return t}},54991:function(t,r,n){"use strict";var e=n(58849),o=n(33642),i=n(52649),u=n(22933),c=n(84297),s=TypeError,a=Object.defineProperty,f=Object.getOwnPropertyDescriptor,l="enumerable",p="configurable",v="writable";r.f=e?i?function(t,r,n){if(u(t),r=c(r),u(n),"function"==typeof t&&"prototype"===r&&"value"in n&&v in n&&!n[v]){var e=f(t,r);e&&e[v]&&(t[r]=n.value,n={configurable:p in n?n[p]:e[p],enumerable:l in n?n[l]:e[l],writable:!1})}return a(t,r,n)}:a:function(t,r,n){if(u(t),r=c(r),u(n),o)try{return a(t,r,n)}catch(e){}if("get"in n||"set"in n)throw new s("Accessors not supported");return"value"in n&&(t[r]=n.value),t}},25245:function(t,r,n){"use strict";var e=n(58849),o=n(43173),i=n(60771),u=n(51012),c=n(17460),s=n(84297),a=n(55229),f=n(33642),l=Object.getOwnPropertyDescriptor;r.f=e?l:function(t,r){if(t=c(t),r=s(r),f)try{return l(t,r)}catch(n){}if(a(t,r))return u(!o(i.f,t,r),t[r])}},16102:function(t,r,n){"use strict";var e=n(42458),o=n(17460),i=n(45919).f,u=n(88755),c="object"==typeof window&&window&&Object.getOwnPropertyNames?Object.getOwnPropertyNames(window):[];t.exports.f=function(t){return c&&"Window"===e(t)?function(t){try{return i(t)}catch(r){return u(c)}}(t):i(o(t))}},45919:function(t,r,n){"use strict";var e=n(30044),o=n(97703).concat("length","prototype");r.f=Object.getOwnPropertyNames||function(t){return e(t,o)}},18503:function(t,r){"use strict";r.f=Object.getOwnPropertySymbols},2563:function(t,r,n){"use strict";var e=n(55229),o=n(30553),i=n(19480),u=n(95292),c=n(51577),s=u("IE_PROTO"),a=Object,f=a.prototype;t.exports=c?a.getPrototypeOf:function(t){var r=i(t);if(e(r,s))return r[s];var n=r.constructor;return o(n)&&r instanceof n?n.prototype:r instanceof a?f:null}},69362:function(t,r,n){"use strict";var e=n(18431),o=n(38475),i=n(42458),u=n(57939),c=Object.isExtensible,s=e((function(){c(1)}));t.exports=s||u?function(t){return!!o(t)&&((!u||"ArrayBuffer"!==i(t))&&(!c||c(t)))}:c},95882:function(t,r,n){"use strict";var e=n(55418);t.exports=e({}.isPrototypeOf)},30044:function(t,r,n){"use strict";var e=n(55418),o=n(55229),i=n(17460),u=n(92460).indexOf,c=n(46170),s=e([].push);t.exports=function(t,r){var n,e=i(t),a=0,f=[];for(n in e)!o(c,n)&&o(e,n)&&s(f,n);for(;r.length>a;)o(e,n=r[a++])&&(~u(f,n)||s(f,n));return f}},93121:function(t,r,n){"use strict";var e=n(30044),o=n(97703);t.exports=Object.keys||function(t){return e(t,o)}},27248:function(t,r,n){"use strict";var e=n(9881),o=n(22933),i=n(95859);t.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var t,r=!1,n={};try{(t=e(Object.prototype,"__proto__","set"))(n,[]),r=n instanceof Array}catch(u){}return function(n,e){return o(n),i(e),r?t(n,e):n.__proto__=e,n}}():void 0)},81798:function(t,r,n){"use strict";var e=n(9574),o=n(21973);t.exports=e?{}.toString:function(){return"[object "+o(this)+"]"}},9265:function(t,r,n){"use strict";var e=n(43173),o=n(30553),i=n(38475),u=TypeError;t.exports=function(t,r){var n,c;if("string"===r&&o(n=t.toString)&&!i(c=e(n,t)))return c;if(o(n=t.valueOf)&&!i(c=e(n,t)))return c;if("string"!==r&&o(n=t.toString)&&!i(c=e(n,t)))return c;throw new u("Can't convert object to primitive value")}},20202:function(t,r,n){"use strict";var e=n(29694),o=n(55418),i=n(45919),u=n(18503),c=n(22933),s=o([].concat);t.exports=e("Reflect","ownKeys")||function(t){var r=i.f(c(t)),n=u.f;return n?s(r,n(t)):r}},50649:function(t,r,n){"use strict";var e=n(5813);t.exports=e},70754:function(t){"use strict";t.exports=function(t){try{return{error:!1,value:t()}}catch(r){return{error:!0,value:r}}}},15624:function(t,r,n){"use strict";var e=n(5813),o=n(44565),i=n(30553),u=n(27992),c=n(47397),s=n(10282),a=n(89397),f=n(37575),l=n(95448),p=n(91625),v=o&&o.prototype,h=s("species"),y=!1,d=i(e.PromiseRejectionEvent),g=u("Promise",(function(){var t=c(o),r=t!==String(o);if(!r&&66===p)return!0;if(l&&(!v.catch||!v.finally))return!0;if(!p||p<51||!/native code/.test(t)){var n=new o((function(t){t(1)})),e=function(t){t((function(){}),(function(){}))};if((n.constructor={})[h]=e,!(y=n.then((function(){}))instanceof e))return!0}return!r&&(a||f)&&!d}));t.exports={CONSTRUCTOR:g,REJECTION_EVENT:d,SUBCLASSING:y}},44565:function(t,r,n){"use strict";var e=n(5813);t.exports=e.Promise},13847:function(t,r,n){"use strict";var e=n(22933),o=n(38475),i=n(1731);t.exports=function(t,r){if(e(t),o(r)&&r.constructor===t)return r;var n=i.f(t);return(0,n.resolve)(r),n.promise}},30222:function(t,r,n){"use strict";var e=n(44565),o=n(54294),i=n(15624).CONSTRUCTOR;t.exports=i||!o((function(t){e.all(t).then(void 0,(function(){}))}))},4109:function(t,r,n){"use strict";var e=n(54991).f;t.exports=function(t,r,n){n in t||e(t,n,{configurable:!0,get:function(){return r[n]},set:function(t){r[n]=t}})}},29639:function(t){"use strict";var r=function(){this.head=null,this.tail=null};r.prototype={add:function(t){var r={item:t,next:null},n=this.tail;n?n.next=r:this.head=r,this.tail=r},get:function(){var t=this.head;if(t)return null===(this.head=t.next)&&(this.tail=null),t.item}},t.exports=r},45648:function(t,r,n){"use strict";var e,o,i=n(43173),u=n(55418),c=n(11336),s=n(85891),a=n(9773),f=n(82765),l=n(9885),p=n(12648).get,v=n(66509),h=n(70852),y=f("native-string-replace",String.prototype.replace),d=RegExp.prototype.exec,g=d,b=u("".charAt),m=u("".indexOf),x=u("".replace),w=u("".slice),S=(o=/b*/g,i(d,e=/a/,"a"),i(d,o,"a"),0!==e.lastIndex||0!==o.lastIndex),E=a.BROKEN_CARET,O=void 0!==/()??/.exec("")[1];(S||O||E||v||h)&&(g=function(t){var r,n,e,o,u,a,f,v=this,h=p(v),j=c(t),T=h.raw;if(T)return T.lastIndex=v.lastIndex,r=i(g,T,j),v.lastIndex=T.lastIndex,r;var P=h.groups,A=E&&v.sticky,I=i(s,v),R=v.source,k=0,_=j;if(A&&(I=x(I,"y",""),-1===m(I,"g")&&(I+="g"),_=w(j,v.lastIndex),v.lastIndex>0&&(!v.multiline||v.multiline&&"\n"!==b(j,v.lastIndex-1))&&(R="(?: "+R+")",_=" "+_,k++),n=new RegExp("^(?:"+R+")",I)),O&&(n=new RegExp("^"+R+"$(?!\\s)",I)),S&&(e=v.lastIndex),o=i(d,A?n:v,_),A?o?(o.input=w(o.input,k),o[0]=w(o[0],k),o.index=v.lastIndex,v.lastIndex+=o[0].length):v.lastIndex=0:S&&o&&(v.lastIndex=v.global?o.index+o[0].length:e),O&&o&&o.length>1&&i(y,o[0],n,(function(){for(u=1;u<arguments.length-2;u++)void 0===arguments[u]&&(o[u]=void 0)})),o&&P)for(o.groups=a=l(null),u=0;u<P.length;u++)a[(f=P[u])[0]]=o[f[1]];return o}),t.exports=g},85891:function(t,r,n){"use strict";var e=n(22933);t.exports=function(){var t=e(this),r="";return t.hasIndices&&(r+="d"),t.global&&(r+="g"),t.ignoreCase&&(r+="i"),t.multiline&&(r+="m"),t.dotAll&&(r+="s"),t.unicode&&(r+="u"),t.unicodeSets&&(r+="v"),t.sticky&&(r+="y"),r}},78287:function(t,r,n){"use strict";var e=n(43173),o=n(55229),i=n(95882),u=n(85891),c=RegExp.prototype;t.exports=function(t){var r=t.flags;return void 0!==r||"flags"in c||o(t,"flags")||!i(c,t)?r:e(u,t)}},9773:function(t,r,n){"use strict";var e=n(18431),o=n(5813).RegExp,i=e((function(){var t=o("a","y");return t.lastIndex=2,null!==t.exec("abcd")})),u=i||e((function(){return!o("a","y").sticky})),c=i||e((function(){var t=o("^r","gy");return t.lastIndex=2,null!==t.exec("str")}));t.exports={BROKEN_CARET:c,MISSED_STICKY:u,UNSUPPORTED_Y:i}},66509:function(t,r,n){"use strict";var e=n(18431),o=n(5813).RegExp;t.exports=e((function(){var t=o(".","s");return!(t.dotAll&&t.test("\n")&&"s"===t.flags)}))},70852:function(t,r,n){"use strict";var e=n(18431),o=n(5813).RegExp;t.exports=e((function(){var t=o("(?<a>b)","g");return"b"!==t.exec("b").groups.a||"bc"!=="b".replace(t,"$<a>c")}))},43313:function(t,r,n){"use strict";var e=n(59317),o=TypeError;t.exports=function(t){if(e(t))throw new o("Can't call method on "+t);return t}},95310:function(t,r,n){"use strict";var e=n(5813),o=n(58849),i=Object.getOwnPropertyDescriptor;t.exports=function(t){if(!o)return e[t];var r=i(e,t);return r&&r.value}},36929:function(t,r,n){"use strict";var e=n(29694),o=n(40030),i=n(10282),u=n(58849),c=i("species");t.exports=function(t){var r=e(t);u&&r&&!r[c]&&o(r,c,{configurable:!0,get:function(){return this}})}},48357:function(t,r,n){"use strict";var e=n(54991).f,o=n(55229),i=n(10282)("toStringTag");t.exports=function(t,r,n){t&&!n&&(t=t.prototype),t&&!o(t,i)&&e(t,i,{configurable:!0,value:r})}},95292:function(t,r,n){"use strict";var e=n(82765),o=n(92311),i=e("keys");t.exports=function(t){return i[t]||(i[t]=o(t))}},13036:function(t,r,n){"use strict";var e=n(5813),o=n(64040),i="__core-js_shared__",u=e[i]||o(i,{});t.exports=u},82765:function(t,r,n){"use strict";var e=n(95448),o=n(13036);(t.exports=function(t,r){return o[t]||(o[t]=void 0!==r?r:{})})("versions",[]).push({version:"3.35.0",mode:e?"pure":"global",copyright:"© 2014-2023 Denis Pushkarev (zloirock.ru)",license:"https://github.com/zloirock/core-js/blob/v3.35.0/LICENSE",source:"https://github.com/zloirock/core-js"})},51048:function(t,r,n){"use strict";var e=n(22933),o=n(50683),i=n(59317),u=n(10282)("species");t.exports=function(t,r){var n,c=e(t).constructor;return void 0===c||i(n=e(c)[u])?r:o(n)}},47512:function(t,r,n){"use strict";var e=n(55418),o=n(97673),i=n(11336),u=n(43313),c=e("".charAt),s=e("".charCodeAt),a=e("".slice),f=function(t){return function(r,n){var e,f,l=i(u(r)),p=o(n),v=l.length;return p<0||p>=v?t?"":void 0:(e=s(l,p))<55296||e>56319||p+1===v||(f=s(l,p+1))<56320||f>57343?t?c(l,p):e:t?a(l,p,p+2):f-56320+(e-55296<<10)+65536}};t.exports={codeAt:f(!1),charAt:f(!0)}},55370:function(t,r,n){"use strict";var e=n(55418),o=n(43313),i=n(11336),u=n(92743),c=e("".replace),s=RegExp("^["+u+"]+"),a=RegExp("(^|[^"+u+"])["+u+"]+$"),f=function(t){return function(r){var n=i(o(r));return 1&t&&(n=c(n,s,"")),2&t&&(n=c(n,a,"$1")),n}};t.exports={start:f(1),end:f(2),trim:f(3)}},63710:function(t,r,n){"use strict";var e=n(91625),o=n(18431),i=n(5813).String;t.exports=!!Object.getOwnPropertySymbols&&!o((function(){var t=Symbol("symbol detection");return!i(t)||!(Object(t)instanceof Symbol)||!Symbol.sham&&e&&e<41}))},17497:function(t,r,n){"use strict";var e=n(43173),o=n(29694),i=n(10282),u=n(73936);t.exports=function(){var t=o("Symbol"),r=t&&t.prototype,n=r&&r.valueOf,c=i("toPrimitive");r&&!r[c]&&u(r,c,(function(t){return e(n,this)}),{arity:1})}},94824:function(t,r,n){"use strict";var e=n(63710);t.exports=e&&!!Symbol.for&&!!Symbol.keyFor},20295:function(t,r,n){"use strict";var e,o,i,u,c=n(5813),s=n(35449),a=n(76902),f=n(30553),l=n(55229),p=n(18431),v=n(34483),h=n(88755),y=n(55836),d=n(33305),g=n(78609),b=n(13089),m=c.setImmediate,x=c.clearImmediate,w=c.process,S=c.Dispatch,E=c.Function,O=c.MessageChannel,j=c.String,T=0,P={},A="onreadystatechange";p((function(){e=c.location}));var I=function(t){if(l(P,t)){var r=P[t];delete P[t],r()}},R=function(t){return function(){I(t)}},k=function(t){I(t.data)},_=function(t){c.postMessage(j(t),e.protocol+"//"+e.host)};m&&x||(m=function(t){d(arguments.length,1);var r=f(t)?t:E(t),n=h(arguments,1);return P[++T]=function(){s(r,void 0,n)},o(T),T},x=function(t){delete P[t]},b?o=function(t){w.nextTick(R(t))}:S&&S.now?o=function(t){S.now(R(t))}:O&&!g?(u=(i=new O).port2,i.port1.onmessage=k,o=a(u.postMessage,u)):c.addEventListener&&f(c.postMessage)&&!c.importScripts&&e&&"file:"!==e.protocol&&!p(_)?(o=_,c.addEventListener("message",k,!1)):o=A in y("script")?function(t){v.appendChild(y("script"))[A]=function(){v.removeChild(this),I(t)}}:function(t){setTimeout(R(t),0)}),t.exports={set:m,clear:x}},29191:function(t,r,n){"use strict";var e=n(55418);t.exports=e(1..valueOf)},73834:function(t,r,n){"use strict";var e=n(97673),o=Math.max,i=Math.min;t.exports=function(t,r){var n=e(t);return n<0?o(n+r,0):i(n,r)}},17460:function(t,r,n){"use strict";var e=n(70814),o=n(43313);t.exports=function(t){return e(o(t))}},97673:function(t,r,n){"use strict";var e=n(47329);t.exports=function(t){var r=+t;return r!=r||0===r?0:e(r)}},97142:function(t,r,n){"use strict";var e=n(97673),o=Math.min;t.exports=function(t){return t>0?o(e(t),9007199254740991):0}},19480:function(t,r,n){"use strict";var e=n(43313),o=Object;t.exports=function(t){return o(e(t))}},80581:function(t,r,n){"use strict";var e=n(43173),o=n(38475),i=n(12052),u=n(54339),c=n(9265),s=n(10282),a=TypeError,f=s("toPrimitive");t.exports=function(t,r){if(!o(t)||i(t))return t;var n,s=u(t,f);if(s){if(void 0===r&&(r="default"),n=e(s,t,r),!o(n)||i(n))return n;throw new a("Can't convert object to primitive value")}return void 0===r&&(r="number"),c(t,r)}},84297:function(t,r,n){"use strict";var e=n(80581),o=n(12052);t.exports=function(t){var r=e(t,"string");return o(r)?r:r+""}},9574:function(t,r,n){"use strict";var e={};e[n(10282)("toStringTag")]="z",t.exports="[object z]"===String(e)},11336:function(t,r,n){"use strict";var e=n(21973),o=String;t.exports=function(t){if("Symbol"===e(t))throw new TypeError("Cannot convert a Symbol value to a string");return o(t)}},71414:function(t){"use strict";var r=String;t.exports=function(t){try{return r(t)}catch(n){return"Object"}}},92311:function(t,r,n){"use strict";var e=n(55418),o=0,i=Math.random(),u=e(1..toString);t.exports=function(t){return"Symbol("+(void 0===t?"":t)+")_"+u(++o+i,36)}},58150:function(t,r,n){"use strict";var e=n(63710);t.exports=e&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},52649:function(t,r,n){"use strict";var e=n(58849),o=n(18431);t.exports=e&&o((function(){return 42!==Object.defineProperty((function(){}),"prototype",{value:42,writable:!1}).prototype}))},33305:function(t){"use strict";var r=TypeError;t.exports=function(t,n){if(t<n)throw new r("Not enough arguments");return t}},83777:function(t,r,n){"use strict";var e=n(5813),o=n(30553),i=e.WeakMap;t.exports=o(i)&&/native code/.test(String(i))},80879:function(t,r,n){"use strict";var e=n(50649),o=n(55229),i=n(97665),u=n(54991).f;t.exports=function(t){var r=e.Symbol||(e.Symbol={});o(r,t)||u(r,t,{value:i.f(t)})}},97665:function(t,r,n){"use strict";var e=n(10282);r.f=e},10282:function(t,r,n){"use strict";var e=n(5813),o=n(82765),i=n(55229),u=n(92311),c=n(63710),s=n(58150),a=e.Symbol,f=o("wks"),l=s?a.for||a:a&&a.withoutSetter||u;t.exports=function(t){return i(f,t)||(f[t]=c&&i(a,t)?a[t]:l("Symbol."+t)),f[t]}},92743:function(t){"use strict";t.exports="\t\n\v\f\r                　\u2028\u2029\ufeff"},40612:function(t,r,n){"use strict";var e=n(29694),o=n(55229),i=n(52838),u=n(95882),c=n(27248),s=n(93213),a=n(4109),f=n(81760),l=n(30852),p=n(91934),v=n(96337),h=n(58849),y=n(95448);t.exports=function(t,r,n,d){var g="stackTraceLimit",b=d?2:1,m=t.split("."),x=m[m.length-1],w=e.apply(null,m);if(w){var S=w.prototype;if(!y&&o(S,"cause")&&delete S.cause,!n)return w;var E=e("Error"),O=r((function(t,r){var n=l(d?r:t,void 0),e=d?new w(t):new w;return void 0!==n&&i(e,"message",n),v(e,O,e.stack,2),this&&u(S,this)&&f(e,this,O),arguments.length>b&&p(e,arguments[b]),e}));if(O.prototype=S,"Error"!==x?c?c(O,E):s(O,E,{name:!0}):h&&g in w&&(a(O,w,g),a(O,w,"prepareStackTrace")),s(O,w),!y)try{S.name!==x&&i(S,"name",x),S.constructor=O}catch(j){}return O}}},97393:function(t,r,n){"use strict";var e=n(68077),o=n(18431),i=n(35968),u=n(38475),c=n(19480),s=n(10228),a=n(54108),f=n(53396),l=n(26183),p=n(817),v=n(10282),h=n(91625),y=v("isConcatSpreadable"),d=h>=51||!o((function(){var t=[];return t[y]=!1,t.concat()[0]!==t})),g=function(t){if(!u(t))return!1;var r=t[y];return void 0!==r?!!r:i(t)};e({target:"Array",proto:!0,arity:1,forced:!d||!p("concat")},{concat:function(t){var r,n,e,o,i,u=c(this),p=l(u,0),v=0;for(r=-1,e=arguments.length;r<e;r++)if(g(i=-1===r?u:arguments[r]))for(o=s(i),a(v+o),n=0;n<o;n++,v++)n in i&&f(p,v,i[n]);else a(v+1),f(p,v++,i);return p.length=v,p}})},86576:function(t,r,n){"use strict";var e=n(68077),o=n(65332),i=n(90476);e({target:"Array",proto:!0},{fill:o}),i("fill")},32797:function(t,r,n){"use strict";var e=n(68077),o=n(32413);e({target:"Array",stat:!0,forced:!n(54294)((function(t){Array.from(t)}))},{from:o})},40271:function(t,r,n){"use strict";var e=n(68077),o=n(92460).includes,i=n(18431),u=n(90476);e({target:"Array",proto:!0,forced:i((function(){return!Array(1).includes()}))},{includes:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),u("includes")},51358:function(t,r,n){"use strict";var e=n(17460),o=n(90476),i=n(70381),u=n(12648),c=n(54991).f,s=n(4638),a=n(85501),f=n(95448),l=n(58849),p="Array Iterator",v=u.set,h=u.getterFor(p);t.exports=s(Array,"Array",(function(t,r){v(this,{type:p,target:e(t),index:0,kind:r})}),(function(){var t=h(this),r=t.target,n=t.index++;if(!r||n>=r.length)return t.target=void 0,a(void 0,!0);switch(t.kind){case"keys":return a(n,!1);case"values":return a(r[n],!1)}return a([n,r[n]],!1)}),"values");var y=i.Arguments=i.Array;if(o("keys"),o("values"),o("entries"),!f&&l&&"values"!==y.name)try{c(y,"name",{value:"values"})}catch(d){}},34997:function(t,r,n){"use strict";var e=n(68077),o=n(42439).left,i=n(54053),u=n(91625);e({target:"Array",proto:!0,forced:!n(13089)&&u>79&&u<83||!i("reduce")},{reduce:function(t){var r=arguments.length;return o(this,t,r,r>1?arguments[1]:void 0)}})},17692:function(t,r,n){"use strict";var e=n(68077),o=n(35968),i=n(78142),u=n(38475),c=n(73834),s=n(10228),a=n(17460),f=n(53396),l=n(10282),p=n(817),v=n(88755),h=p("slice"),y=l("species"),d=Array,g=Math.max;e({target:"Array",proto:!0,forced:!h},{slice:function(t,r){var n,e,l,p=a(this),h=s(p),b=c(t,h),m=c(void 0===r?h:r,h);if(o(p)&&(n=p.constructor,(i(n)&&(n===d||o(n.prototype))||u(n)&&null===(n=n[y]))&&(n=void 0),n===d||void 0===n))return v(p,b,m);for(e=new(void 0===n?d:n)(g(m-b,0)),l=0;b<m;b++,l++)b in p&&f(e,l,p[b]);return e.length=l,e}})},95165:function(t,r,n){"use strict";var e=n(55229),o=n(73936),i=n(22653),u=n(10282)("toPrimitive"),c=Date.prototype;e(c,u)||o(c,u,i)},51467:function(t,r,n){"use strict";var e=n(68077),o=n(5813),i=n(35449),u=n(40612),c="WebAssembly",s=o[c],a=7!==new Error("e",{cause:7}).cause,f=function(t,r){var n={};n[t]=u(t,r,a),e({global:!0,constructor:!0,arity:1,forced:a},n)},l=function(t,r){if(s&&s[t]){var n={};n[t]=u(c+"."+t,r,a),e({target:c,stat:!0,constructor:!0,arity:1,forced:a},n)}};f("Error",(function(t){return function(r){return i(t,this,arguments)}})),f("EvalError",(function(t){return function(r){return i(t,this,arguments)}})),f("RangeError",(function(t){return function(r){return i(t,this,arguments)}})),f("ReferenceError",(function(t){return function(r){return i(t,this,arguments)}})),f("SyntaxError",(function(t){return function(r){return i(t,this,arguments)}})),f("TypeError",(function(t){return function(r){return i(t,this,arguments)}})),f("URIError",(function(t){return function(r){return i(t,this,arguments)}})),l("CompileError",(function(t){return function(r){return i(t,this,arguments)}})),l("LinkError",(function(t){return function(r){return i(t,this,arguments)}})),l("RuntimeError",(function(t){return function(r){return i(t,this,arguments)}}))},22859:function(t,r,n){"use strict";var e=n(58849),o=n(83875).EXISTS,i=n(55418),u=n(40030),c=Function.prototype,s=i(c.toString),a=/function\b(?:\s|\/\*[\S\s]*?\*\/|\/\/[^\n\r]*[\n\r]+)*([^\s(/]*)/,f=i(a.exec);e&&!o&&u(c,"name",{configurable:!0,get:function(){try{return f(a,s(this))[1]}catch(t){return""}}})},89802:function(t,r,n){"use strict";var e=n(68077),o=n(5813);e({global:!0,forced:o.globalThis!==o},{globalThis:o})},88770:function(t,r,n){"use strict";var e=n(68077),o=n(29694),i=n(35449),u=n(43173),c=n(55418),s=n(18431),a=n(30553),f=n(12052),l=n(88755),p=n(56454),v=n(63710),h=String,y=o("JSON","stringify"),d=c(/./.exec),g=c("".charAt),b=c("".charCodeAt),m=c("".replace),x=c(1..toString),w=/[\uD800-\uDFFF]/g,S=/^[\uD800-\uDBFF]$/,E=/^[\uDC00-\uDFFF]$/,O=!v||s((function(){var t=o("Symbol")("stringify detection");return"[null]"!==y([t])||"{}"!==y({a:t})||"{}"!==y(Object(t))})),j=s((function(){return'"\\udf06\\ud834"'!==y("\udf06\ud834")||'"\\udead"'!==y("\udead")})),T=function(t,r){var n=l(arguments),e=p(r);if(a(e)||void 0!==t&&!f(t))return n[1]=function(t,r){if(a(e)&&(r=u(e,this,h(t),r)),!f(r))return r},i(y,null,n)},P=function(t,r,n){var e=g(n,r-1),o=g(n,r+1);return d(S,t)&&!d(E,o)||d(E,t)&&!d(S,e)?"\\u"+x(b(t,0),16):t};y&&e({target:"JSON",stat:!0,arity:3,forced:O||j},{stringify:function(t,r,n){var e=l(arguments),o=i(O?T:y,null,e);return j&&"string"==typeof o?m(o,w,P):o}})},65101:function(t,r,n){"use strict";n(88820)("Map",(function(t){return function(){return t(this,arguments.length?arguments[0]:void 0)}}),n(52961))},96043:function(t,r,n){"use strict";n(65101)},76843:function(t,r,n){"use strict";var e=n(68077),o=n(95448),i=n(58849),u=n(5813),c=n(50649),s=n(55418),a=n(27992),f=n(55229),l=n(81760),p=n(95882),v=n(12052),h=n(80581),y=n(18431),d=n(45919).f,g=n(25245).f,b=n(54991).f,m=n(29191),x=n(55370).trim,w="Number",S=u[w],E=c[w],O=S.prototype,j=u.TypeError,T=s("".slice),P=s("".charCodeAt),A=function(t){var r,n,e,o,i,u,c,s,a=h(t,"number");if(v(a))throw new j("Cannot convert a Symbol value to a number");if("string"==typeof a&&a.length>2)if(a=x(a),43===(r=P(a,0))||45===r){if(88===(n=P(a,2))||120===n)return NaN}else if(48===r){switch(P(a,1)){case 66:case 98:e=2,o=49;break;case 79:case 111:e=8,o=55;break;default:return+a}for(u=(i=T(a,2)).length,c=0;c<u;c++)if((s=P(i,c))<48||s>o)return NaN;return parseInt(i,e)}return+a},I=a(w,!S(" 0o1")||!S("0b1")||S("+0x1")),R=function(t){var r,n=arguments.length<1?0:S(function(t){var r=h(t,"number");return"bigint"==typeof r?r:A(r)}(t));return p(O,r=this)&&y((function(){m(r)}))?l(Object(n),this,R):n};R.prototype=O,I&&!o&&(O.constructor=R),e({global:!0,constructor:!0,wrap:!0,forced:I},{Number:R});var k=function(t,r){for(var n,e=i?d(r):"MAX_VALUE,MIN_VALUE,NaN,NEGATIVE_INFINITY,POSITIVE_INFINITY,EPSILON,MAX_SAFE_INTEGER,MIN_SAFE_INTEGER,isFinite,isInteger,isNaN,isSafeInteger,parseFloat,parseInt,fromString,range".split(","),o=0;e.length>o;o++)f(r,n=e[o])&&!f(t,n)&&b(t,n,g(r,n))};o&&E&&k(c[w],E),(I||o)&&k(c[w],S)},79894:function(t,r,n){"use strict";n(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{MAX_SAFE_INTEGER:9007199254740991})},85717:function(t,r,n){"use strict";var e=n(68077),o=n(54914);e({target:"Object",stat:!0,arity:2,forced:Object.assign!==o},{assign:o})},40720:function(t,r,n){"use strict";var e=n(68077),o=n(18431),i=n(17460),u=n(25245).f,c=n(58849);e({target:"Object",stat:!0,forced:!c||o((function(){u(1)})),sham:!c},{getOwnPropertyDescriptor:function(t,r){return u(i(t),r)}})},30419:function(t,r,n){"use strict";var e=n(68077),o=n(18431),i=n(16102).f;e({target:"Object",stat:!0,forced:o((function(){return!Object.getOwnPropertyNames(1)}))},{getOwnPropertyNames:i})},28082:function(t,r,n){"use strict";var e=n(68077),o=n(63710),i=n(18431),u=n(18503),c=n(19480);e({target:"Object",stat:!0,forced:!o||i((function(){u.f(1)}))},{getOwnPropertySymbols:function(t){var r=u.f;return r?r(c(t)):[]}})},37792:function(t,r,n){"use strict";var e=n(68077),o=n(38475),i=n(70276).onFreeze,u=n(91452),c=n(18431),s=Object.seal;e({target:"Object",stat:!0,forced:c((function(){s(1)})),sham:!u},{seal:function(t){return s&&o(t)?s(i(t)):t}})},46798:function(t,r,n){"use strict";var e=n(9574),o=n(73936),i=n(81798);e||o(Object.prototype,"toString",i,{unsafe:!0})},75179:function(t,r,n){"use strict";var e=n(68077),o=n(43173),i=n(9160),u=n(1731),c=n(70754),s=n(72208);e({target:"Promise",stat:!0,forced:n(30222)},{all:function(t){var r=this,n=u.f(r),e=n.resolve,a=n.reject,f=c((function(){var n=i(r.resolve),u=[],c=0,f=1;s(t,(function(t){var i=c++,s=!1;f++,o(n,r,t).then((function(t){s||(s=!0,u[i]=t,--f||e(u))}),a)})),--f||e(u)}));return f.error&&a(f.value),n.promise}})},26900:function(t,r,n){"use strict";var e=n(68077),o=n(95448),i=n(15624).CONSTRUCTOR,u=n(44565),c=n(29694),s=n(30553),a=n(73936),f=u&&u.prototype;if(e({target:"Promise",proto:!0,forced:i,real:!0},{catch:function(t){return this.then(void 0,t)}}),!o&&s(u)){var l=c("Promise").prototype.catch;f.catch!==l&&a(f,"catch",l,{unsafe:!0})}},77280:function(t,r,n){"use strict";var e,o,i,u=n(68077),c=n(95448),s=n(13089),a=n(5813),f=n(43173),l=n(73936),p=n(27248),v=n(48357),h=n(36929),y=n(9160),d=n(30553),g=n(38475),b=n(85539),m=n(51048),x=n(20295).set,w=n(33099),S=n(15089),E=n(70754),O=n(29639),j=n(12648),T=n(44565),P=n(15624),A=n(1731),I="Promise",R=P.CONSTRUCTOR,k=P.REJECTION_EVENT,_=P.SUBCLASSING,C=j.getterFor(I),N=j.set,L=T&&T.prototype,F=T,M=L,z=a.TypeError,D=a.document,Z=a.process,U=A.f,G=U,B=!!(D&&D.createEvent&&a.dispatchEvent),W="unhandledrejection",H=function(t){var r;return!(!g(t)||!d(r=t.then))&&r},V=function(t,r){var n,e,o,i=r.value,u=1===r.state,c=u?t.ok:t.fail,s=t.resolve,a=t.reject,l=t.domain;try{c?(u||(2===r.rejection&&q(r),r.rejection=1),!0===c?n=i:(l&&l.enter(),n=c(i),l&&(l.exit(),o=!0)),n===t.promise?a(new z("Promise-chain cycle")):(e=H(n))?f(e,n,s,a):s(n)):a(i)}catch(p){l&&!o&&l.exit(),a(p)}},Y=function(t,r){t.notified||(t.notified=!0,w((function(){for(var n,e=t.reactions;n=e.get();)V(n,t);t.notified=!1,r&&!t.rejection&&X(t)})))},$=function(t,r,n){var e,o;B?((e=D.createEvent("Event")).promise=r,e.reason=n,e.initEvent(t,!1,!0),a.dispatchEvent(e)):e={promise:r,reason:n},!k&&(o=a["on"+t])?o(e):t===W&&S("Unhandled promise rejection",n)},X=function(t){f(x,a,(function(){var r,n=t.facade,e=t.value;if(K(t)&&(r=E((function(){s?Z.emit("unhandledRejection",e,n):$(W,n,e)})),t.rejection=s||K(t)?2:1,r.error))throw r.value}))},K=function(t){return 1!==t.rejection&&!t.parent},q=function(t){f(x,a,(function(){var r=t.facade;s?Z.emit("rejectionHandled",r):$("rejectionhandled",r,t.value)}))},J=function(t,r,n){return function(e){t(r,e,n)}},Q=function(t,r,n){t.done||(t.done=!0,n&&(t=n),t.value=r,t.state=2,Y(t,!0))},tt=function(t,r,n){if(!t.done){t.done=!0,n&&(t=n);try{if(t.facade===r)throw new z("Promise can't be resolved itself");var e=H(r);e?w((function(){var n={done:!1};try{f(e,r,J(tt,n,t),J(Q,n,t))}catch(o){Q(n,o,t)}})):(t.value=r,t.state=1,Y(t,!1))}catch(o){Q({done:!1},o,t)}}};if(R&&(M=(F=function(t){b(this,M),y(t),f(e,this);var r=C(this);try{t(J(tt,r),J(Q,r))}catch(n){Q(r,n)}}).prototype,(e=function(t){N(this,{type:I,done:!1,notified:!1,parent:!1,reactions:new O,rejection:!1,state:0,value:void 0})}).prototype=l(M,"then",(function(t,r){var n=C(this),e=U(m(this,F));return n.parent=!0,e.ok=!d(t)||t,e.fail=d(r)&&r,e.domain=s?Z.domain:void 0,0===n.state?n.reactions.add(e):w((function(){V(e,n)})),e.promise})),o=function(){var t=new e,r=C(t);this.promise=t,this.resolve=J(tt,r),this.reject=J(Q,r)},A.f=U=function(t){return t===F||undefined===t?new o(t):G(t)},!c&&d(T)&&L!==Object.prototype)){i=L.then,_||l(L,"then",(function(t,r){var n=this;return new F((function(t,r){f(i,n,t,r)})).then(t,r)}),{unsafe:!0});try{delete L.constructor}catch(rt){}p&&p(L,M)}u({global:!0,constructor:!0,wrap:!0,forced:R},{Promise:F}),v(F,I,!1,!0),h(I)},47084:function(t,r,n){"use strict";n(77280),n(75179),n(26900),n(34248),n(51941),n(80833)},34248:function(t,r,n){"use strict";var e=n(68077),o=n(43173),i=n(9160),u=n(1731),c=n(70754),s=n(72208);e({target:"Promise",stat:!0,forced:n(30222)},{race:function(t){var r=this,n=u.f(r),e=n.reject,a=c((function(){var u=i(r.resolve);s(t,(function(t){o(u,r,t).then(n.resolve,e)}))}));return a.error&&e(a.value),n.promise}})},51941:function(t,r,n){"use strict";var e=n(68077),o=n(1731);e({target:"Promise",stat:!0,forced:n(15624).CONSTRUCTOR},{reject:function(t){var r=o.f(this);return(0,r.reject)(t),r.promise}})},80833:function(t,r,n){"use strict";var e=n(68077),o=n(29694),i=n(95448),u=n(44565),c=n(15624).CONSTRUCTOR,s=n(13847),a=o("Promise"),f=i&&!c;e({target:"Promise",stat:!0,forced:i||c},{resolve:function(t){return s(f&&this===a?u:this,t)}})},36251:function(t,r,n){"use strict";var e=n(68077),o=n(29694),i=n(35449),u=n(1319),c=n(50683),s=n(22933),a=n(38475),f=n(9885),l=n(18431),p=o("Reflect","construct"),v=Object.prototype,h=[].push,y=l((function(){function t(){}return!(p((function(){}),[],t)instanceof t)})),d=!l((function(){p((function(){}))})),g=y||d;e({target:"Reflect",stat:!0,forced:g,sham:g},{construct:function(t,r){c(t),s(r);var n=arguments.length<3?t:c(arguments[2]);if(d&&!y)return p(t,r,n);if(t===n){switch(r.length){case 0:return new t;case 1:return new t(r[0]);case 2:return new t(r[0],r[1]);case 3:return new t(r[0],r[1],r[2]);case 4:return new t(r[0],r[1],r[2],r[3])}var e=[null];return i(h,e,r),new(i(u,t,e))}var o=n.prototype,l=f(a(o)?o:v),g=i(t,l,r);return a(g)?g:l}})},48226:function(t,r,n){"use strict";var e=n(68077),o=n(5813),i=n(48357);e({global:!0},{Reflect:{}}),i(o.Reflect,"Reflect",!0)},63789:function(t,r,n){"use strict";var e=n(68077),o=n(45648);e({target:"RegExp",proto:!0,forced:/./.exec!==o},{exec:o})},94570:function(t,r,n){"use strict";var e=n(83875).PROPER,o=n(73936),i=n(22933),u=n(11336),c=n(18431),s=n(78287),a="toString",f=RegExp.prototype,l=f[a],p=c((function(){return"/a/b"!==l.call({source:"a",flags:"b"})})),v=e&&l.name!==a;(p||v)&&o(f,a,(function(){var t=i(this);return"/"+u(t.source)+"/"+u(s(t))}),{unsafe:!0})},60163:function(t,r,n){"use strict";var e=n(68077),o=n(55418),i=n(52205),u=n(43313),c=n(11336),s=n(76870),a=o("".indexOf);e({target:"String",proto:!0,forced:!s("includes")},{includes:function(t){return!!~a(c(u(this)),c(i(t)),arguments.length>1?arguments[1]:void 0)}})},5239:function(t,r,n){"use strict";var e=n(47512).charAt,o=n(11336),i=n(12648),u=n(4638),c=n(85501),s="String Iterator",a=i.set,f=i.getterFor(s);u(String,"String",(function(t){a(this,{type:s,string:o(t),index:0})}),(function(){var t,r=f(this),n=r.string,o=r.index;return o>=n.length?c(void 0,!0):(t=e(n,o),r.index+=t.length,c(t,!1))}))},81770:function(t,r,n){"use strict";var e=n(68077),o=n(5813),i=n(43173),u=n(55418),c=n(95448),s=n(58849),a=n(63710),f=n(18431),l=n(55229),p=n(95882),v=n(22933),h=n(17460),y=n(84297),d=n(11336),g=n(51012),b=n(9885),m=n(93121),x=n(45919),w=n(16102),S=n(18503),E=n(25245),O=n(54991),j=n(44760),T=n(60771),P=n(73936),A=n(40030),I=n(82765),R=n(95292),k=n(46170),_=n(92311),C=n(10282),N=n(97665),L=n(80879),F=n(17497),M=n(48357),z=n(12648),D=n(78856).forEach,Z=R("hidden"),U="Symbol",G="prototype",B=z.set,W=z.getterFor(U),H=Object[G],V=o.Symbol,Y=V&&V[G],$=o.RangeError,X=o.TypeError,K=o.QObject,q=E.f,J=O.f,Q=w.f,tt=T.f,rt=u([].push),nt=I("symbols"),et=I("op-symbols"),ot=I("wks"),it=!K||!K[G]||!K[G].findChild,ut=function(t,r,n){var e=q(H,r);e&&delete H[r],J(t,r,n),e&&t!==H&&J(H,r,e)},ct=s&&f((function(){return 7!==b(J({},"a",{get:function(){return J(this,"a",{value:7}).a}})).a}))?ut:J,st=function(t,r){var n=nt[t]=b(Y);return B(n,{type:U,tag:t,description:r}),s||(n.description=r),n},at=function(t,r,n){t===H&&at(et,r,n),v(t);var e=y(r);return v(n),l(nt,e)?(n.enumerable?(l(t,Z)&&t[Z][e]&&(t[Z][e]=!1),n=b(n,{enumerable:g(0,!1)})):(l(t,Z)||J(t,Z,g(1,b(null))),t[Z][e]=!0),ct(t,e,n)):J(t,e,n)},ft=function(t,r){v(t);var n=h(r),e=m(n).concat(ht(n));return D(e,(function(r){s&&!i(lt,n,r)||at(t,r,n[r])})),t},lt=function(t){var r=y(t),n=i(tt,this,r);return!(this===H&&l(nt,r)&&!l(et,r))&&(!(n||!l(this,r)||!l(nt,r)||l(this,Z)&&this[Z][r])||n)},pt=function(t,r){var n=h(t),e=y(r);if(n!==H||!l(nt,e)||l(et,e)){var o=q(n,e);return!o||!l(nt,e)||l(n,Z)&&n[Z][e]||(o.enumerable=!0),o}},vt=function(t){var r=Q(h(t)),n=[];return D(r,(function(t){l(nt,t)||l(k,t)||rt(n,t)})),n},ht=function(t){var r=t===H,n=Q(r?et:h(t)),e=[];return D(n,(function(t){!l(nt,t)||r&&!l(H,t)||rt(e,nt[t])})),e};a||(V=function(){if(p(Y,this))throw new X("Symbol is not a constructor");var t=arguments.length&&void 0!==arguments[0]?d(arguments[0]):void 0,r=_(t),n=function(t){var e=void 0===this?o:this;e===H&&i(n,et,t),l(e,Z)&&l(e[Z],r)&&(e[Z][r]=!1);var u=g(1,t);try{ct(e,r,u)}catch(c){if(!(c instanceof $))throw c;ut(e,r,u)}};return s&&it&&ct(H,r,{configurable:!0,set:n}),st(r,t)},P(Y=V[G],"toString",(function(){return W(this).tag})),P(V,"withoutSetter",(function(t){return st(_(t),t)})),T.f=lt,O.f=at,j.f=ft,E.f=pt,x.f=w.f=vt,S.f=ht,N.f=function(t){return st(C(t),t)},s&&(A(Y,"description",{configurable:!0,get:function(){return W(this).description}}),c||P(H,"propertyIsEnumerable",lt,{unsafe:!0}))),e({global:!0,constructor:!0,wrap:!0,forced:!a,sham:!a},{Symbol:V}),D(m(ot),(function(t){L(t)})),e({target:U,stat:!0,forced:!a},{useSetter:function(){it=!0},useSimple:function(){it=!1}}),e({target:"Object",stat:!0,forced:!a,sham:!s},{create:function(t,r){return void 0===r?b(t):ft(b(t),r)},defineProperty:at,defineProperties:ft,getOwnPropertyDescriptor:pt}),e({target:"Object",stat:!0,forced:!a},{getOwnPropertyNames:vt}),F(),M(V,U),k[Z]=!0},98214:function(t,r,n){"use strict";var e=n(68077),o=n(58849),i=n(5813),u=n(55418),c=n(55229),s=n(30553),a=n(95882),f=n(11336),l=n(40030),p=n(93213),v=i.Symbol,h=v&&v.prototype;if(o&&s(v)&&(!("description"in h)||void 0!==v().description)){var y={},d=function(){var t=arguments.length<1||void 0===arguments[0]?void 0:f(arguments[0]),r=a(h,this)?new v(t):void 0===t?v():v(t);return""===t&&(y[r]=!0),r};p(d,v),d.prototype=h,h.constructor=d;var g="Symbol(description detection)"===String(v("description detection")),b=u(h.valueOf),m=u(h.toString),x=/^Symbol\((.*)\)[^)]+$/,w=u("".replace),S=u("".slice);l(h,"description",{configurable:!0,get:function(){var t=b(this);if(c(y,t))return"";var r=m(t),n=g?S(r,7,-1):w(r,x,"$1");return""===n?void 0:n}}),e({global:!0,constructor:!0,forced:!0},{Symbol:d})}},19273:function(t,r,n){"use strict";var e=n(68077),o=n(29694),i=n(55229),u=n(11336),c=n(82765),s=n(94824),a=c("string-to-symbol-registry"),f=c("symbol-to-string-registry");e({target:"Symbol",stat:!0,forced:!s},{for:function(t){var r=u(t);if(i(a,r))return a[r];var n=o("Symbol")(r);return a[r]=n,f[n]=r,n}})},20254:function(t,r,n){"use strict";n(80879)("iterator")},94738:function(t,r,n){"use strict";n(81770),n(19273),n(9696),n(88770),n(28082)},9696:function(t,r,n){"use strict";var e=n(68077),o=n(55229),i=n(12052),u=n(71414),c=n(82765),s=n(94824),a=c("symbol-to-string-registry");e({target:"Symbol",stat:!0,forced:!s},{keyFor:function(t){if(!i(t))throw new TypeError(u(t)+" is not a symbol");if(o(a,t))return a[t]}})},40262:function(t,r,n){"use strict";var e=n(80879),o=n(17497);e("toPrimitive"),o()},86673:function(t,r,n){"use strict";var e,o=n(91452),i=n(5813),u=n(55418),c=n(40855),s=n(70276),a=n(88820),f=n(6946),l=n(38475),p=n(12648).enforce,v=n(18431),h=n(83777),y=Object,d=Array.isArray,g=y.isExtensible,b=y.isFrozen,m=y.isSealed,x=y.freeze,w=y.seal,S=!i.ActiveXObject&&"ActiveXObject"in i,E=function(t){return function(){return t(this,arguments.length?arguments[0]:void 0)}},O=a("WeakMap",E,f),j=O.prototype,T=u(j.set);if(h)if(S){e=f.getConstructor(E,"WeakMap",!0),s.enable();var P=u(j.delete),A=u(j.has),I=u(j.get);c(j,{delete:function(t){if(l(t)&&!g(t)){var r=p(this);return r.frozen||(r.frozen=new e),P(this,t)||r.frozen.delete(t)}return P(this,t)},has:function(t){if(l(t)&&!g(t)){var r=p(this);return r.frozen||(r.frozen=new e),A(this,t)||r.frozen.has(t)}return A(this,t)},get:function(t){if(l(t)&&!g(t)){var r=p(this);return r.frozen||(r.frozen=new e),A(this,t)?I(this,t):r.frozen.get(t)}return I(this,t)},set:function(t,r){if(l(t)&&!g(t)){var n=p(this);n.frozen||(n.frozen=new e),A(this,t)?T(this,t,r):n.frozen.set(t,r)}else T(this,t,r);return this}})}else o&&v((function(){var t=x([]);return T(new O,t,1),!b(t)}))&&c(j,{set:function(t,r){var n;return d(t)&&(b(t)?n=x:m(t)&&(n=w)),T(this,t,r),n&&n(t),this}})},39685:function(t,r,n){"use strict";n(86673)},9849:function(t,r,n){"use strict";var e=n(68077),o=n(5813),i=n(85539),u=n(22933),c=n(30553),s=n(2563),a=n(40030),f=n(53396),l=n(18431),p=n(55229),v=n(10282),h=n(65017).IteratorPrototype,y=n(58849),d=n(95448),g="constructor",b="Iterator",m=v("toStringTag"),x=TypeError,w=o[b],S=d||!c(w)||w.prototype!==h||!l((function(){w({})})),E=function(){if(i(this,h),s(this)===h)throw new x("Abstract class Iterator not directly constructable")},O=function(t,r){y?a(h,t,{configurable:!0,get:function(){return r},set:function(r){if(u(this),this===h)throw new x("You can't redefine this property");p(this,t)?this[t]=r:f(this,t,r)}}):h[t]=r};p(h,m)||O(m,b),!S&&p(h,g)&&h[g]!==Object||O(g,E),E.prototype=h,e({global:!0,constructor:!0,forced:S},{Iterator:E})},12148:function(t,r,n){"use strict";var e=n(68077),o=n(72208),i=n(9160),u=n(22933),c=n(73177),s=TypeError;e({target:"Iterator",proto:!0,real:!0},{reduce:function(t){u(this),i(t);var r=c(this),n=arguments.length<2,e=n?void 0:arguments[1],a=0;if(o(r,(function(r){n?(n=!1,e=r):e=t(e,r,a),a++}),{IS_RECORD:!0}),n)throw new s("Reduce of empty iterator with no initial value");return e}})},13526:function(t,r,n){"use strict";var e=n(68077),o=n(72208),i=n(9160),u=n(22933),c=n(73177);e({target:"Iterator",proto:!0,real:!0},{some:function(t){u(this),i(t);var r=c(this),n=0;return o(r,(function(r,e){if(t(r,n++))return e()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})},98490:function(t,r,n){"use strict";var e=n(5813),o=n(70803),i=n(1617),u=n(51358),c=n(52838),s=n(48357),a=n(10282)("iterator"),f=u.values,l=function(t,r){if(t){if(t[a]!==f)try{c(t,a,f)}catch(e){t[a]=f}if(s(t,r,!0),o[r])for(var n in u)if(t[n]!==u[n])try{c(t,n,u[n])}catch(e){t[n]=u[n]}}};for(var p in o)l(e[p]&&e[p].prototype,p);l(i,"DOMTokenList")},91584:function(t,r,n){"use strict";var e=n(68077),o=n(5813),i=n(40030),u=n(58849),c=TypeError,s=Object.defineProperty,a=o.self!==o;try{if(u){var f=Object.getOwnPropertyDescriptor(o,"self");!a&&f&&f.get&&f.enumerable||i(o,"self",{get:function(){return o},set:function(t){if(this!==o)throw new c("Illegal invocation");s(o,"self",{value:t,writable:!0,configurable:!0,enumerable:!0})},configurable:!0,enumerable:!0})}else e({global:!0,simple:!0,forced:a},{self:o})}catch(l){}},9255:function(t,r,n){"use strict";function e(t,r){(null==r||r>t.length)&&(r=t.length);for(var n=0,e=new Array(r);n<r;n++)e[n]=t[n];return e}n.d(r,{Z:function(){return e}})},36772:function(t,r,n){"use strict";function e(t){if(Array.isArray(t))return t}n.d(r,{Z:function(){return e}})},59202:function(t,r,n){"use strict";n.d(r,{Z:function(){return i}});n(36251),n(46798),n(48226),n(36513);var e=n(44293),o=n(35508);function i(t,r,n){if((0,o.Z)())return Reflect.construct.apply(null,arguments);var i=[null];i.push.apply(i,r);var u=new(t.bind.apply(t,i));return n&&(0,e.Z)(u,n.prototype),u}},40039:function(t,r,n){"use strict";n.d(r,{Z:function(){return o}});n(94738),n(98214),n(46798),n(20254),n(51358),n(5239),n(98490),n(51467);var e=n(14827);function o(t,r){var n="undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(!n){if(Array.isArray(t)||(n=(0,e.Z)(t))||r&&t&&"number"==typeof t.length){n&&(t=n);var o=0,i=function(){};return{s:i,n:function(){return o>=t.length?{done:!0}:{done:!1,value:t[o++]}},e:function(t){throw t},f:i}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var u,c=!0,s=!1;return{s:function(){n=n.call(t)},n:function(){var t=n.next();return c=t.done,t},e:function(t){s=!0,u=t},f:function(){try{c||null==n.return||n.return()}finally{if(s)throw u}}}}},93359:function(t,r,n){"use strict";n.d(r,{Z:function(){return o}});var e=n(97292);function o(t,r,n){return(r=(0,e.Z)(r))in t?Object.defineProperty(t,r,{value:n,enumerable:!0,configurable:!0,writable:!0}):t[r]=n,t}},35508:function(t,r,n){"use strict";n.d(r,{Z:function(){return e}});n(36251),n(46798),n(48226);function e(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(e=function(){return!!t})()}},71005:function(t,r,n){"use strict";n.d(r,{Z:function(){return e}});n(94738),n(98214),n(46798),n(20254),n(51358),n(5239),n(98490),n(32797);function e(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}},1417:function(t,r,n){"use strict";n.d(r,{Z:function(){return e}});n(51467);function e(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}},44293:function(t,r,n){"use strict";function e(t,r){return e=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,r){return t.__proto__=r,t},e(t,r)}n.d(r,{Z:function(){return e}})},62746:function(t,r,n){"use strict";n.d(r,{Z:function(){return u}});var e=n(36772);n(94738),n(98214),n(46798),n(20254),n(51358),n(5239),n(98490),n(36513);var o=n(14827),i=n(1417);function u(t,r){return(0,e.Z)(t)||function(t,r){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var e,o,i,u,c=[],s=!0,a=!1;try{if(i=(n=n.call(t)).next,0===r){if(Object(n)!==n)return;s=!1}else for(;!(s=(e=i.call(n)).done)&&(c.push(e.value),c.length!==r);s=!0);}catch(t){a=!0,o=t}finally{try{if(!s&&null!=n.return&&(u=n.return(),Object(u)!==u))return}finally{if(a)throw o}}return c}}(t,r)||(0,o.Z)(t,r)||(0,i.Z)()}},46097:function(t,r,n){"use strict";n.d(r,{Z:function(){return u}});var e=n(9255);var o=n(71005),i=n(14827);n(51467);function u(t){return function(t){if(Array.isArray(t))return(0,e.Z)(t)}(t)||(0,o.Z)(t)||(0,i.Z)(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}},97292:function(t,r,n){"use strict";n.d(r,{Z:function(){return o}});var e=n(76775);n(40262),n(95165),n(94738),n(98214),n(46798),n(51467),n(76843);function o(t){var r=function(t,r){if("object"!=(0,e.Z)(t)||!t)return t;var n=t[Symbol.toPrimitive];if(void 0!==n){var o=n.call(t,r||"default");if("object"!=(0,e.Z)(o))return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===r?String:Number)(t)}(t,"string");return"symbol"==(0,e.Z)(r)?r:String(r)}},76775:function(t,r,n){"use strict";n.d(r,{Z:function(){return e}});n(94738),n(98214),n(46798),n(20254),n(51358),n(5239),n(98490);function e(t){return e="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},e(t)}},14827:function(t,r,n){"use strict";n.d(r,{Z:function(){return o}});n(17692),n(46798),n(94570),n(22859),n(32797),n(5239),n(63789),n(99397);var e=n(9255);function o(t,r){if(t){if("string"==typeof t)return(0,e.Z)(t,r);var n=Object.prototype.toString.call(t).slice(8,-1);return"Object"===n&&t.constructor&&(n=t.constructor.name),"Map"===n||"Set"===n?Array.from(t):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?(0,e.Z)(t,r):void 0}}},93217:function(t,r,n){"use strict";n.d(r,{Jj:function(){return d}});var e=n(62746),o=n(93359),i=n(59202),u=n(46097),c=n(40039),s=n(76775),a=(n(58556),n(94738),n(98214),n(46798),n(51467),n(22859),n(85717),n(51358),n(96043),n(5239),n(98490),n(10999),n(52117),n(63789),n(82479),n(94570),n(99397),n(89802),n(46349),n(70320),n(34997),n(9849),n(12148),n(17692),n(47084),n(39685),n(97393),n(91989),n(86576),n(79894),n(76843),Symbol("Comlink.proxy")),f=Symbol("Comlink.endpoint"),l=Symbol("Comlink.releaseProxy"),p=Symbol("Comlink.finalizer"),v=Symbol("Comlink.thrown"),h=function(t){return"object"===(0,s.Z)(t)&&null!==t||"function"==typeof t},y=new Map([["proxy",{canHandle:function(t){return h(t)&&t[a]},serialize:function(t){var r=new MessageChannel,n=r.port1,e=r.port2;return d(t,n),[e,[e]]},deserialize:function(t){return t.start(),S(t,[],r);var r}}],["throw",{canHandle:function(t){return h(t)&&v in t},serialize:function(t){var r=t.value;return[r instanceof Error?{isError:!0,value:{message:r.message,name:r.name,stack:r.stack}}:{isError:!1,value:r},[]]},deserialize:function(t){if(t.isError)throw Object.assign(new Error(t.value.message),t.value);throw t.value}}]]);function d(t){var r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:globalThis,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:["*"];r.addEventListener("message",(function s(f){if(f&&f.data)if(function(t,r){var n,e=(0,c.Z)(t);try{for(e.s();!(n=e.n()).done;){var o=n.value;if(r===o||"*"===o)return!0;if(o instanceof RegExp&&o.test(r))return!0}}catch(i){e.e(i)}finally{e.f()}return!1}(n,f.origin)){var l,h=Object.assign({path:[]},f.data),y=h.id,b=h.type,m=h.path,x=(f.data.argumentList||[]).map(T);try{var w=m.slice(0,-1).reduce((function(t,r){return t[r]}),t),S=m.reduce((function(t,r){return t[r]}),t);switch(b){case"GET":l=S;break;case"SET":w[m.slice(-1)[0]]=T(f.data.value),l=!0;break;case"APPLY":l=S.apply(w,x);break;case"CONSTRUCT":var E;l=function(t){return Object.assign(t,(0,o.Z)({},a,!0))}((0,i.Z)(S,(0,u.Z)(x)));break;case"ENDPOINT":var P=new MessageChannel,A=P.port1,I=P.port2;d(t,I),l=function(t,r){return O.set(t,r),t}(A,[A]);break;case"RELEASE":l=void 0;break;default:return}}catch(E){l=(0,o.Z)({value:E},v,0)}Promise.resolve(l).catch((function(t){return(0,o.Z)({value:t},v,0)})).then((function(n){var o=j(n),i=(0,e.Z)(o,2),u=i[0],c=i[1];r.postMessage(Object.assign(Object.assign({},u),{id:y}),c),"RELEASE"===b&&(r.removeEventListener("message",s),g(r),p in t&&"function"==typeof t[p]&&t[p]())})).catch((function(t){var n=j((0,o.Z)({value:new TypeError("Unserializable return value")},v,0)),i=(0,e.Z)(n,2),u=i[0],c=i[1];r.postMessage(Object.assign(Object.assign({},u),{id:y}),c)}))}else console.warn("Invalid origin '".concat(f.origin,"' for comlink proxy"))})),r.start&&r.start()}function g(t){(function(t){return"MessagePort"===t.constructor.name})(t)&&t.close()}function b(t){if(t)throw new Error("Proxy has been released and is not useable")}function m(t){return P(t,{type:"RELEASE"}).then((function(){g(t)}))}var x=new WeakMap,w="FinalizationRegistry"in globalThis&&new FinalizationRegistry((function(t){var r=(x.get(t)||0)-1;x.set(t,r),0===r&&m(t)}));function S(t){var r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=!1,o=new Proxy(arguments.length>2&&void 0!==arguments[2]?arguments[2]:function(){},{get:function(e,i){if(b(n),i===l)return function(){!function(t){w&&w.unregister(t)}(o),m(t),n=!0};if("then"===i){if(0===r.length)return{then:function(){return o}};var c=P(t,{type:"GET",path:r.map((function(t){return t.toString()}))}).then(T);return c.then.bind(c)}return S(t,[].concat((0,u.Z)(r),[i]))},set:function(o,i,c){b(n);var s=j(c),a=(0,e.Z)(s,2),f=a[0],l=a[1];return P(t,{type:"SET",path:[].concat((0,u.Z)(r),[i]).map((function(t){return t.toString()})),value:f},l).then(T)},apply:function(o,i,u){b(n);var c=r[r.length-1];if(c===f)return P(t,{type:"ENDPOINT"}).then(T);if("bind"===c)return S(t,r.slice(0,-1));var s=E(u),a=(0,e.Z)(s,2),l=a[0],p=a[1];return P(t,{type:"APPLY",path:r.map((function(t){return t.toString()})),argumentList:l},p).then(T)},construct:function(o,i){b(n);var u=E(i),c=(0,e.Z)(u,2),s=c[0],a=c[1];return P(t,{type:"CONSTRUCT",path:r.map((function(t){return t.toString()})),argumentList:s},a).then(T)}});return function(t,r){var n=(x.get(r)||0)+1;x.set(r,n),w&&w.register(t,r,t)}(o,t),o}function E(t){var r,n=t.map(j);return[n.map((function(t){return t[0]})),(r=n.map((function(t){return t[1]})),Array.prototype.concat.apply([],r))]}var O=new WeakMap;function j(t){var r,n=(0,c.Z)(y);try{for(n.s();!(r=n.n()).done;){var o=(0,e.Z)(r.value,2),i=o[0],u=o[1];if(u.canHandle(t)){var s=u.serialize(t),a=(0,e.Z)(s,2);return[{type:"HANDLER",name:i,value:a[0]},a[1]]}}}catch(f){n.e(f)}finally{n.f()}return[{type:"RAW",value:t},O.get(t)||[]]}function T(t){switch(t.type){case"HANDLER":return y.get(t.name).deserialize(t.value);case"RAW":return t.value}}function P(t,r,n){return new Promise((function(e){var o=new Array(4).fill(0).map((function(){return Math.floor(Math.random()*Number.MAX_SAFE_INTEGER).toString(16)})).join("-");t.addEventListener("message",(function r(n){n.data&&n.data.id&&n.data.id===o&&(t.removeEventListener("message",r),e(n.data))})),t.start&&t.start(),t.postMessage(Object.assign({id:o},r),n)}))}}}]);
+//# sourceMappingURL=1854.lJJ7-FMPh9w.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1880],{21880:function(e,t,r){r.r(t),r.d(t,{HaFormGrid:function(){return b}});var a,i,o,n=r(88962),d=r(99312),s=r(81043),u=r(33368),c=r(71650),l=r(68308),h=r(82390),m=r(69205),f=r(91808),p=r(34541),k=r(47838),v=(r(97393),r(46349),r(70320),r(39663),r(5095)),y=r(95260),b=(0,f.Z)([(0,y.Mo)("ha-form-grid")],(function(e,t){var r,f=function(t){function r(){var t;(0,c.Z)(this,r);for(var a=arguments.length,i=new Array(a),o=0;o<a;o++)i[o]=arguments[o];return t=(0,l.Z)(this,r,[].concat(i)),e((0,h.Z)(t)),t}return(0,m.Z)(r,t),(0,u.Z)(r)}(t);return{F:f,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"data",value:void 0},{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"schema",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)()],key:"computeLabel",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"computeHelper",value:void 0},{kind:"method",key:"focus",value:(r=(0,s.Z)((0,d.Z)().mark((function e(){var t;return(0,d.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:null===(t=this.renderRoot.querySelector("ha-form"))||void 0===t||t.focus();case 3:case"end":return e.stop()}}),e,this)}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"updated",value:function(e){(0,p.Z)((0,k.Z)(f.prototype),"updated",this).call(this,e),e.has("schema")&&(this.schema.column_min_width?this.style.setProperty("--form-grid-min-width",this.schema.column_min_width):this.style.setProperty("--form-grid-min-width",""))}},{kind:"method",key:"render",value:function(){var e=this;return(0,v.dy)(a||(a=(0,n.Z)([" "," "])),this.schema.schema.map((function(t){return(0,v.dy)(i||(i=(0,n.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" .computeLabel="','" .computeHelper="','"></ha-form> '])),e.hass,e.data,[t],e.disabled,e.computeLabel,e.computeHelper)})))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(o||(o=(0,n.Z)([":host{display:grid!important;grid-template-columns:repeat(var(--form-grid-column-count,auto-fit),minmax(var(--form-grid-min-width,200px),1fr));grid-column-gap:8px;grid-row-gap:24px}:host>ha-form{display:block}"])))}}]}}),v.oi)}}]);
+//# sourceMappingURL=1880.ZdGmRdt6je0.js.map
\ No newline at end of file
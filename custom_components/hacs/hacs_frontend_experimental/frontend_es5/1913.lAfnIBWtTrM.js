@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[1913],{1913:function(e,r,a){a.d(r,{q:function(){return p}});var n=a(40039),t=(a(76843),a(37313),a(87438),a(46798),a(9849),a(22890),a(46349),a(70320),a(36513),a(17692),a(4600),a(95818),a(79894),a(51467),a(91989),a(94570),function(e){return e[e.Null=0]="Null",e[e.Backspace=8]="Backspace",e[e.Tab=9]="Tab",e[e.LineFeed=10]="LineFeed",e[e.CarriageReturn=13]="CarriageReturn",e[e.Space=32]="Space",e[e.ExclamationMark=33]="ExclamationMark",e[e.DoubleQuote=34]="DoubleQuote",e[e.Hash=35]="Hash",e[e.DollarSign=36]="DollarSign",e[e.PercentSign=37]="PercentSign",e[e.Ampersand=38]="Ampersand",e[e.SingleQuote=39]="SingleQuote",e[e.OpenParen=40]="OpenParen",e[e.CloseParen=41]="CloseParen",e[e.Asterisk=42]="Asterisk",e[e.Plus=43]="Plus",e[e.Comma=44]="Comma",e[e.Dash=45]="Dash",e[e.Period=46]="Period",e[e.Slash=47]="Slash",e[e.Digit0=48]="Digit0",e[e.Digit1=49]="Digit1",e[e.Digit2=50]="Digit2",e[e.Digit3=51]="Digit3",e[e.Digit4=52]="Digit4",e[e.Digit5=53]="Digit5",e[e.Digit6=54]="Digit6",e[e.Digit7=55]="Digit7",e[e.Digit8=56]="Digit8",e[e.Digit9=57]="Digit9",e[e.Colon=58]="Colon",e[e.Semicolon=59]="Semicolon",e[e.LessThan=60]="LessThan",e[e.Equals=61]="Equals",e[e.GreaterThan=62]="GreaterThan",e[e.QuestionMark=63]="QuestionMark",e[e.AtSign=64]="AtSign",e[e.A=65]="A",e[e.B=66]="B",e[e.C=67]="C",e[e.D=68]="D",e[e.E=69]="E",e[e.F=70]="F",e[e.G=71]="G",e[e.H=72]="H",e[e.I=73]="I",e[e.J=74]="J",e[e.K=75]="K",e[e.L=76]="L",e[e.M=77]="M",e[e.N=78]="N",e[e.O=79]="O",e[e.P=80]="P",e[e.Q=81]="Q",e[e.R=82]="R",e[e.S=83]="S",e[e.T=84]="T",e[e.U=85]="U",e[e.V=86]="V",e[e.W=87]="W",e[e.X=88]="X",e[e.Y=89]="Y",e[e.Z=90]="Z",e[e.OpenSquareBracket=91]="OpenSquareBracket",e[e.Backslash=92]="Backslash",e[e.CloseSquareBracket=93]="CloseSquareBracket",e[e.Caret=94]="Caret",e[e.Underline=95]="Underline",e[e.BackTick=96]="BackTick",e[e.a=97]="a",e[e.b=98]="b",e[e.c=99]="c",e[e.d=100]="d",e[e.e=101]="e",e[e.f=102]="f",e[e.g=103]="g",e[e.h=104]="h",e[e.i=105]="i",e[e.j=106]="j",e[e.k=107]="k",e[e.l=108]="l",e[e.m=109]="m",e[e.n=110]="n",e[e.o=111]="o",e[e.p=112]="p",e[e.q=113]="q",e[e.r=114]="r",e[e.s=115]="s",e[e.t=116]="t",e[e.u=117]="u",e[e.v=118]="v",e[e.w=119]="w",e[e.x=120]="x",e[e.y=121]="y",e[e.z=122]="z",e[e.OpenCurlyBrace=123]="OpenCurlyBrace",e[e.Pipe=124]="Pipe",e[e.CloseCurlyBrace=125]="CloseCurlyBrace",e[e.Tilde=126]="Tilde",e}({})),i=128;function o(){for(var e=[],r=[],a=0;a<=i;a++)r[a]=0;for(var n=0;n<=i;n++)e.push(r.slice(0));return e}function s(e,r){if(r<0||r>=e.length)return!1;var a,n=e.codePointAt(r);switch(n){case t.Underline:case t.Dash:case t.Period:case t.Space:case t.Slash:case t.Backslash:case t.SingleQuote:case t.DoubleQuote:case t.Colon:case t.DollarSign:case t.LessThan:case t.OpenParen:case t.OpenSquareBracket:return!0;case void 0:return!1;default:return(a=n)>=127462&&a<=127487||8986===a||8987===a||9200===a||9203===a||a>=9728&&a<=10175||11088===a||11093===a||a>=127744&&a<=128591||a>=128640&&a<=128764||a>=128992&&a<=129003||a>=129280&&a<=129535||a>=129648&&a<=129750?!0:!1}}function u(e,r){if(r<0||r>=e.length)return!1;switch(e.charCodeAt(r)){case t.Space:case t.Tab:return!0;default:return!1}}function c(e,r,a){return r[e]!==a[e]}var l=function(e){return e[e.Diag=1]="Diag",e[e.Left=2]="Left",e[e.LeftLeft=3]="LeftLeft",e}(l||{});function f(e,r,a,n,t,o,s){var u=e.length>i?i:e.length,f=n.length>i?i:n.length;if(!(a>=u||o>=f||u-a>f-o)&&function(e,r,a,n,t,i){for(var o=arguments.length>6&&void 0!==arguments[6]&&arguments[6];r<a&&t<i;)e[r]===n[t]&&(o&&(h[r]=t),r+=1),t+=1;return r===a}(r,a,u,t,o,f,!0)){var k;!function(e,r,a,n,t,i){var o=e-1,s=r-1;for(;o>=a&&s>=n;)t[o]===i[s]&&(v[o]=s,o--),s--}(u,f,a,o,r,t);var p,C,L=1,T=[!1];for(k=1,p=a;p<u;k++,p++){var E=h[p],N=v[p],m=p+1<u?v[p+1]:f;for(L=E-o+1,C=E;C<m;L++,C++){var B=Number.MIN_SAFE_INTEGER,b=!1;C<=N&&(B=g(e,r,p,a,n,t,C,f,o,0===D[k-1][L-1],T));var P=0;B!==Number.MAX_SAFE_INTEGER&&(b=!0,P=B+S[k-1][L-1]);var A=C>E,I=A?S[k][L-1]+(D[k][L-1]>0?-5:0):0,w=C>E+1&&D[k][L-1]>0,q=w?S[k][L-2]+(D[k][L-2]>0?-5:0):0;if(w&&(!A||q>=I)&&(!b||q>=P))S[k][L]=q,d[k][L]=l.LeftLeft,D[k][L]=0;else if(A&&(!b||I>=P))S[k][L]=I,d[k][L]=l.Left,D[k][L]=0;else{if(!b)throw new Error("not possible");S[k][L]=P,d[k][L]=l.Diag,D[k][L]=D[k-1][L-1]+1}}}if(T[0]||s){k--,L--;for(var O=[S[k][L],o],Q=0,_=0;k>=1;){var F=L;do{var G=d[k][F];if(G===l.LeftLeft)F-=2;else{if(G!==l.Left)break;F-=1}}while(F>=1);Q>1&&r[a+k-1]===t[o+L-1]&&!c(F+o-1,n,t)&&Q+1>D[k][F]&&(F=L),F===L?Q++:Q=1,_||(_=F),k--,L=F-1,O.push(L)}f===u&&(O[0]+=2);var M=_-u;return O[0]-=M,O}}}function g(e,r,a,n,t,i,o,l,f,g,h){if(r[a]!==i[o])return Number.MIN_SAFE_INTEGER;var v=1,D=!1;return o===a-n?v=e[a]===t[o]?7:5:!c(o,t,i)||0!==o&&c(o-1,t,i)?!s(i,o)||0!==o&&s(i,o-1)?(s(i,o-1)||u(i,o-1))&&(v=5,D=!0):v=5:(v=e[a]===t[o]?7:5,D=!0),v>1&&a===n&&(h[0]=!0),D||(D=c(o,t,i)||s(i,o-1)||u(i,o-1)),a===n?o>f&&(v-=D?3:5):v+=g?D?2:0:D?0:1,o+1===l&&(v-=D?3:5),v}var h=k(256),v=k(256),D=o(),S=o(),d=o();function k(e){for(var r=[],a=0;a<=e;a++)r[a]=0;return r}var p=function(e,r){return r.map((function(r){return r.score=function(e,r){var a,t=Number.NEGATIVE_INFINITY,i=(0,n.Z)(r.strings);try{for(i.s();!(a=i.n()).done;){var o=a.value,s=f(e,e.toLowerCase(),0,o,o.toLowerCase(),0,!0);if(s){var u=0===s[0]?1:s[0];u>t&&(t=u)}}}catch(c){i.e(c)}finally{i.f()}if(t!==Number.NEGATIVE_INFINITY)return t}(e,r),r})).filter((function(e){return void 0!==e.score})).sort((function(e,r){var a=e.score,n=void 0===a?0:a,t=r.score,i=void 0===t?0:t;return n>i?-1:n<i?1:0}))}}}]);
+//# sourceMappingURL=1913.lAfnIBWtTrM.js.map
\ No newline at end of file
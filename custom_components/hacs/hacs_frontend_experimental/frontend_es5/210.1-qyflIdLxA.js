@@ -0,0 +1,3 @@
+/*! For license information please see 210.1-qyflIdLxA.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[210],{72774:function(e,t,r){r.d(t,{K:function(){return i}});var i=function(){function e(e){void 0===e&&(e={}),this.adapter=e}return Object.defineProperty(e,"cssClasses",{get:function(){return{}},enumerable:!1,configurable:!0}),Object.defineProperty(e,"strings",{get:function(){return{}},enumerable:!1,configurable:!0}),Object.defineProperty(e,"numbers",{get:function(){return{}},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{}},enumerable:!1,configurable:!0}),e.prototype.init=function(){},e.prototype.destroy=function(){},e}()},58014:function(e,t,r){function i(e,t){if(e.closest)return e.closest(t);for(var r=e;r;){if(a(r,t))return r;r=r.parentElement}return null}function a(e,t){return(e.matches||e.webkitMatchesSelector||e.msMatchesSelector).call(e,t)}r.d(t,{oq:function(){return i},wB:function(){return a}})},38103:function(e,t,r){r.d(t,{L:function(){return i}});r(51467);function i(e,t,r){if(void 0!==t)return function(e,t,r){var i=e.constructor;if(!r){var a="__".concat(t);if(!(r=i.getPropertyDescriptor(t,a)))throw new Error("@ariaProperty must be used after a @property decorator")}var n=r,o="";if(!n.set)throw new Error("@ariaProperty requires a setter for ".concat(t));if(e.dispatchWizEvent)return r;var c={configurable:!0,enumerable:!0,set:function(e){if(""===o){var r=i.getPropertyOptions(t);o="string"==typeof r.attribute?r.attribute:t}this.hasAttribute(o)&&this.removeAttribute(o),n.set.call(this,e)}};return n.get&&(c.get=function(){return n.get.call(this)}),c}(e,t,r);throw new Error("@ariaProperty only supports TypeScript Decorators")}},78220:function(e,t,r){r.d(t,{H:function(){return u},q:function(){return s.qN}});var i=r(71650),a=r(33368),n=r(68308),o=r(34541),c=r(47838),d=r(69205),p=r(5095),s=r(82612),u=function(e){function t(){return(0,i.Z)(this,t),(0,n.Z)(this,t,arguments)}return(0,d.Z)(t,e),(0,a.Z)(t,[{key:"click",value:function(){if(this.mdcRoot)return this.mdcRoot.focus(),void this.mdcRoot.click();(0,o.Z)((0,c.Z)(t.prototype),"click",this).call(this)}},{key:"createFoundation",value:function(){void 0!==this.mdcFoundation&&this.mdcFoundation.destroy(),this.mdcFoundationClass&&(this.mdcFoundation=new this.mdcFoundationClass(this.createAdapter()),this.mdcFoundation.init())}},{key:"firstUpdated",value:function(){this.createFoundation()}}]),t}(p.oi)},82612:function(e,t,r){r.d(t,{Mh:function(){return p},OE:function(){return i},Vq:function(){return d},WU:function(){return s},qN:function(){return a}});r(36513),r(56308);var i=function(e){return e.nodeType===Node.ELEMENT_NODE};function a(e){return{addClass:function(t){e.classList.add(t)},removeClass:function(t){e.classList.remove(t)},hasClass:function(t){return e.classList.contains(t)}}}var n=!1,o=function(){},c={get passive(){return n=!0,!1}};document.addEventListener("x",o,c),document.removeEventListener("x",o);var d=n,p=function(){var e=(arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.document).activeElement,t=[];if(!e)return t;for(;e&&(t.push(e),e.shadowRoot);)e=e.shadowRoot.activeElement;return t},s=function(e){var t=p();if(!t.length)return!1;var r=t[t.length-1],i=new Event("check-if-focused",{bubbles:!0,composed:!0}),a=[],n=function(e){a=e.composedPath()};return document.body.addEventListener("check-if-focused",n),r.dispatchEvent(i),document.body.removeEventListener("check-if-focused",n),-1!==a.indexOf(e)}},20210:function(e,t,r){var i,a,n,o,c=r(33368),d=r(71650),p=r(68308),s=r(69205),u=r(43204),l=r(95260),f=r(88962),m=(r(27763),r(38103)),v=r(98734),h=r(5095),y=r(10694),g=function(e){function t(){var e;return(0,d.Z)(this,t),(e=(0,p.Z)(this,t,arguments)).disabled=!1,e.icon="",e.shouldRenderRipple=!1,e.rippleHandlers=new v.A((function(){return e.shouldRenderRipple=!0,e.ripple})),e}return(0,s.Z)(t,e),(0,c.Z)(t,[{key:"renderRipple",value:function(){return this.shouldRenderRipple?(0,h.dy)(i||(i=(0,f.Z)([' <mwc-ripple .disabled="','" unbounded> </mwc-ripple>'])),this.disabled):""}},{key:"focus",value:function(){var e=this.buttonElement;e&&(this.rippleHandlers.startFocus(),e.focus())}},{key:"blur",value:function(){var e=this.buttonElement;e&&(this.rippleHandlers.endFocus(),e.blur())}},{key:"render",value:function(){return(0,h.dy)(a||(a=(0,f.Z)(['<button class="mdc-icon-button mdc-icon-button--display-flex" aria-label="','" aria-haspopup="','" ?disabled="','" @focus="','" @blur="','" @mousedown="','" @mouseenter="','" @mouseleave="','" @touchstart="','" @touchend="','" @touchcancel="','">'," "," <span><slot></slot></span> </button>"])),this.ariaLabel||this.icon,(0,y.o)(this.ariaHasPopup),this.disabled,this.handleRippleFocus,this.handleRippleBlur,this.handleRippleMouseDown,this.handleRippleMouseEnter,this.handleRippleMouseLeave,this.handleRippleTouchStart,this.handleRippleDeactivate,this.handleRippleDeactivate,this.renderRipple(),this.icon?(0,h.dy)(n||(n=(0,f.Z)(['<i class="material-icons">',"</i>"])),this.icon):"")}},{key:"handleRippleMouseDown",value:function(e){var t=this;window.addEventListener("mouseup",(function e(){window.removeEventListener("mouseup",e),t.handleRippleDeactivate()})),this.rippleHandlers.startPress(e)}},{key:"handleRippleTouchStart",value:function(e){this.rippleHandlers.startPress(e)}},{key:"handleRippleDeactivate",value:function(){this.rippleHandlers.endPress()}},{key:"handleRippleMouseEnter",value:function(){this.rippleHandlers.startHover()}},{key:"handleRippleMouseLeave",value:function(){this.rippleHandlers.endHover()}},{key:"handleRippleFocus",value:function(){this.rippleHandlers.startFocus()}},{key:"handleRippleBlur",value:function(){this.rippleHandlers.endFocus()}}]),t}(h.oi);(0,u.__decorate)([(0,l.Cb)({type:Boolean,reflect:!0})],g.prototype,"disabled",void 0),(0,u.__decorate)([(0,l.Cb)({type:String})],g.prototype,"icon",void 0),(0,u.__decorate)([m.L,(0,l.Cb)({type:String,attribute:"aria-label"})],g.prototype,"ariaLabel",void 0),(0,u.__decorate)([m.L,(0,l.Cb)({type:String,attribute:"aria-haspopup"})],g.prototype,"ariaHasPopup",void 0),(0,u.__decorate)([(0,l.IO)("button")],g.prototype,"buttonElement",void 0),(0,u.__decorate)([(0,l.GC)("mwc-ripple")],g.prototype,"ripple",void 0),(0,u.__decorate)([(0,l.SB)()],g.prototype,"shouldRenderRipple",void 0),(0,u.__decorate)([(0,l.hO)({passive:!0})],g.prototype,"handleRippleMouseDown",null),(0,u.__decorate)([(0,l.hO)({passive:!0})],g.prototype,"handleRippleTouchStart",null);var b=(0,h.iv)(o||(o=(0,f.Z)(['.material-icons{font-family:var(--mdc-icon-font, "Material Icons");font-weight:400;font-style:normal;font-size:var(--mdc-icon-size, 24px);line-height:1;letter-spacing:normal;text-transform:none;display:inline-block;white-space:nowrap;word-wrap:normal;direction:ltr;-webkit-font-smoothing:antialiased;text-rendering:optimizeLegibility;-moz-osx-font-smoothing:grayscale;font-feature-settings:"liga"}.mdc-icon-button{font-size:24px;width:48px;height:48px;padding:12px}.mdc-icon-button .mdc-icon-button__focus-ring{display:none}.mdc-icon-button.mdc-ripple-upgraded--background-focused .mdc-icon-button__focus-ring,.mdc-icon-button:not(.mdc-ripple-upgraded):focus .mdc-icon-button__focus-ring{display:block;max-height:48px;max-width:48px}@media screen and (forced-colors:active){.mdc-icon-button.mdc-ripple-upgraded--background-focused .mdc-icon-button__focus-ring,.mdc-icon-button:not(.mdc-ripple-upgraded):focus .mdc-icon-button__focus-ring{pointer-events:none;border:2px solid transparent;border-radius:6px;box-sizing:content-box;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:100%;width:100%}}@media screen and (forced-colors:active)and (forced-colors:active){.mdc-icon-button.mdc-ripple-upgraded--background-focused .mdc-icon-button__focus-ring,.mdc-icon-button:not(.mdc-ripple-upgraded):focus .mdc-icon-button__focus-ring{border-color:CanvasText}}@media screen and (forced-colors:active){.mdc-icon-button.mdc-ripple-upgraded--background-focused .mdc-icon-button__focus-ring::after,.mdc-icon-button:not(.mdc-ripple-upgraded):focus .mdc-icon-button__focus-ring::after{content:"";border:2px solid transparent;border-radius:8px;display:block;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}}@media screen and (forced-colors:active)and (forced-colors:active){.mdc-icon-button.mdc-ripple-upgraded--background-focused .mdc-icon-button__focus-ring::after,.mdc-icon-button:not(.mdc-ripple-upgraded):focus .mdc-icon-button__focus-ring::after{border-color:CanvasText}}.mdc-icon-button.mdc-icon-button--reduced-size .mdc-icon-button__ripple{width:40px;height:40px;margin-top:4px;margin-bottom:4px;margin-right:4px;margin-left:4px}.mdc-icon-button.mdc-icon-button--reduced-size.mdc-ripple-upgraded--background-focused .mdc-icon-button__focus-ring,.mdc-icon-button.mdc-icon-button--reduced-size:not(.mdc-ripple-upgraded):focus .mdc-icon-button__focus-ring{max-height:40px;max-width:40px}.mdc-icon-button .mdc-icon-button__touch{position:absolute;top:50%;height:48px;left:50%;width:48px;transform:translate(-50%,-50%)}.mdc-icon-button:disabled{color:rgba(0,0,0,.38);color:var(--mdc-theme-text-disabled-on-light,rgba(0,0,0,.38))}.mdc-icon-button img,.mdc-icon-button svg{width:24px;height:24px}.mdc-icon-button{display:inline-block;position:relative;box-sizing:border-box;border:none;outline:0;background-color:transparent;fill:currentColor;color:inherit;text-decoration:none;cursor:pointer;user-select:none;z-index:0;overflow:visible}.mdc-icon-button .mdc-icon-button__touch{position:absolute;top:50%;height:48px;left:50%;width:48px;transform:translate(-50%,-50%)}.mdc-icon-button:disabled{cursor:default;pointer-events:none}.mdc-icon-button--display-flex{align-items:center;display:inline-flex;justify-content:center}.mdc-icon-button__icon{display:inline-block}.mdc-icon-button__icon.mdc-icon-button__icon--on{display:none}.mdc-icon-button--on .mdc-icon-button__icon{display:none}.mdc-icon-button--on .mdc-icon-button__icon.mdc-icon-button__icon--on{display:inline-block}.mdc-icon-button__link{height:100%;left:0;outline:0;position:absolute;top:0;width:100%}.mdc-icon-button{display:inline-block;position:relative;box-sizing:border-box;border:none;outline:0;background-color:transparent;fill:currentColor;color:inherit;text-decoration:none;cursor:pointer;user-select:none;z-index:0;overflow:visible}.mdc-icon-button .mdc-icon-button__touch{position:absolute;top:50%;height:48px;left:50%;width:48px;transform:translate(-50%,-50%)}.mdc-icon-button:disabled{cursor:default;pointer-events:none}.mdc-icon-button--display-flex{align-items:center;display:inline-flex;justify-content:center}.mdc-icon-button__icon{display:inline-block}.mdc-icon-button__icon.mdc-icon-button__icon--on{display:none}.mdc-icon-button--on .mdc-icon-button__icon{display:none}.mdc-icon-button--on .mdc-icon-button__icon.mdc-icon-button__icon--on{display:inline-block}.mdc-icon-button__link{height:100%;left:0;outline:0;position:absolute;top:0;width:100%}:host{display:inline-block;outline:0}:host([disabled]){pointer-events:none}.mdc-icon-button ::slotted(*),.mdc-icon-button i,.mdc-icon-button img,.mdc-icon-button svg{display:block}:host{--mdc-ripple-color:currentcolor;-webkit-tap-highlight-color:transparent}.mdc-icon-button,:host{vertical-align:top}.mdc-icon-button{width:var(--mdc-icon-button-size,48px);height:var(--mdc-icon-button-size,48px);padding:calc((var(--mdc-icon-button-size,48px) - var(--mdc-icon-size,24px))/ 2)}.mdc-icon-button ::slotted(*),.mdc-icon-button i,.mdc-icon-button img,.mdc-icon-button svg{display:block;width:var(--mdc-icon-size,24px);height:var(--mdc-icon-size,24px)}']))),_=function(e){function t(){return(0,d.Z)(this,t),(0,p.Z)(this,t,arguments)}return(0,s.Z)(t,e),(0,c.Z)(t)}(g);_.styles=[b],_=(0,u.__decorate)([(0,l.Mo)("mwc-icon-button")],_)},27763:function(e,t,r){var i=r(33368),a=r(71650),n=r(68308),o=r(69205),c=r(43204),d=r(95260),p=r(88962),s=r(34541),u=r(47838),l=r(58014),f=r(78220),m=(r(65974),r(46798),r(9849),r(50289),r(94167),r(56308),r(13526),r(36513),r(72774)),v={BG_FOCUSED:"mdc-ripple-upgraded--background-focused",FG_ACTIVATION:"mdc-ripple-upgraded--foreground-activation",FG_DEACTIVATION:"mdc-ripple-upgraded--foreground-deactivation",ROOT:"mdc-ripple-upgraded",UNBOUNDED:"mdc-ripple-upgraded--unbounded"},h={VAR_FG_SCALE:"--mdc-ripple-fg-scale",VAR_FG_SIZE:"--mdc-ripple-fg-size",VAR_FG_TRANSLATE_END:"--mdc-ripple-fg-translate-end",VAR_FG_TRANSLATE_START:"--mdc-ripple-fg-translate-start",VAR_LEFT:"--mdc-ripple-left",VAR_TOP:"--mdc-ripple-top"},y={DEACTIVATION_TIMEOUT_MS:225,FG_DEACTIVATION_MS:150,INITIAL_ORIGIN_SCALE:.6,PADDING:10,TAP_DELAY_MS:300};var g,b,_=["touchstart","pointerdown","mousedown","keydown"],A=["touchend","pointerup","mouseup","contextmenu"],k=[],w=function(e){function t(r){var i=e.call(this,(0,c.__assign)((0,c.__assign)({},t.defaultAdapter),r))||this;return i.activationAnimationHasEnded=!1,i.activationTimer=0,i.fgDeactivationRemovalTimer=0,i.fgScale="0",i.frame={width:0,height:0},i.initialSize=0,i.layoutFrame=0,i.maxRadius=0,i.unboundedCoords={left:0,top:0},i.activationState=i.defaultActivationState(),i.activationTimerCallback=function(){i.activationAnimationHasEnded=!0,i.runDeactivationUXLogicIfReady()},i.activateHandler=function(e){i.activateImpl(e)},i.deactivateHandler=function(){i.deactivateImpl()},i.focusHandler=function(){i.handleFocus()},i.blurHandler=function(){i.handleBlur()},i.resizeHandler=function(){i.layout()},i}return(0,c.__extends)(t,e),Object.defineProperty(t,"cssClasses",{get:function(){return v},enumerable:!1,configurable:!0}),Object.defineProperty(t,"strings",{get:function(){return h},enumerable:!1,configurable:!0}),Object.defineProperty(t,"numbers",{get:function(){return y},enumerable:!1,configurable:!0}),Object.defineProperty(t,"defaultAdapter",{get:function(){return{addClass:function(){},browserSupportsCssVars:function(){return!0},computeBoundingRect:function(){return{top:0,right:0,bottom:0,left:0,width:0,height:0}},containsEventTarget:function(){return!0},deregisterDocumentInteractionHandler:function(){},deregisterInteractionHandler:function(){},deregisterResizeHandler:function(){},getWindowPageOffset:function(){return{x:0,y:0}},isSurfaceActive:function(){return!0},isSurfaceDisabled:function(){return!0},isUnbounded:function(){return!0},registerDocumentInteractionHandler:function(){},registerInteractionHandler:function(){},registerResizeHandler:function(){},removeClass:function(){},updateCssVariable:function(){}}},enumerable:!1,configurable:!0}),t.prototype.init=function(){var e=this,r=this.supportsPressRipple();if(this.registerRootHandlers(r),r){var i=t.cssClasses,a=i.ROOT,n=i.UNBOUNDED;requestAnimationFrame((function(){e.adapter.addClass(a),e.adapter.isUnbounded()&&(e.adapter.addClass(n),e.layoutInternal())}))}},t.prototype.destroy=function(){var e=this;if(this.supportsPressRipple()){this.activationTimer&&(clearTimeout(this.activationTimer),this.activationTimer=0,this.adapter.removeClass(t.cssClasses.FG_ACTIVATION)),this.fgDeactivationRemovalTimer&&(clearTimeout(this.fgDeactivationRemovalTimer),this.fgDeactivationRemovalTimer=0,this.adapter.removeClass(t.cssClasses.FG_DEACTIVATION));var r=t.cssClasses,i=r.ROOT,a=r.UNBOUNDED;requestAnimationFrame((function(){e.adapter.removeClass(i),e.adapter.removeClass(a),e.removeCssVars()}))}this.deregisterRootHandlers(),this.deregisterDeactivationHandlers()},t.prototype.activate=function(e){this.activateImpl(e)},t.prototype.deactivate=function(){this.deactivateImpl()},t.prototype.layout=function(){var e=this;this.layoutFrame&&cancelAnimationFrame(this.layoutFrame),this.layoutFrame=requestAnimationFrame((function(){e.layoutInternal(),e.layoutFrame=0}))},t.prototype.setUnbounded=function(e){var r=t.cssClasses.UNBOUNDED;e?this.adapter.addClass(r):this.adapter.removeClass(r)},t.prototype.handleFocus=function(){var e=this;requestAnimationFrame((function(){return e.adapter.addClass(t.cssClasses.BG_FOCUSED)}))},t.prototype.handleBlur=function(){var e=this;requestAnimationFrame((function(){return e.adapter.removeClass(t.cssClasses.BG_FOCUSED)}))},t.prototype.supportsPressRipple=function(){return this.adapter.browserSupportsCssVars()},t.prototype.defaultActivationState=function(){return{activationEvent:void 0,hasDeactivationUXRun:!1,isActivated:!1,isProgrammatic:!1,wasActivatedByPointer:!1,wasElementMadeActive:!1}},t.prototype.registerRootHandlers=function(e){var t,r;if(e){try{for(var i=(0,c.__values)(_),a=i.next();!a.done;a=i.next()){var n=a.value;this.adapter.registerInteractionHandler(n,this.activateHandler)}}catch(o){t={error:o}}finally{try{a&&!a.done&&(r=i.return)&&r.call(i)}finally{if(t)throw t.error}}this.adapter.isUnbounded()&&this.adapter.registerResizeHandler(this.resizeHandler)}this.adapter.registerInteractionHandler("focus",this.focusHandler),this.adapter.registerInteractionHandler("blur",this.blurHandler)},t.prototype.registerDeactivationHandlers=function(e){var t,r;if("keydown"===e.type)this.adapter.registerInteractionHandler("keyup",this.deactivateHandler);else try{for(var i=(0,c.__values)(A),a=i.next();!a.done;a=i.next()){var n=a.value;this.adapter.registerDocumentInteractionHandler(n,this.deactivateHandler)}}catch(o){t={error:o}}finally{try{a&&!a.done&&(r=i.return)&&r.call(i)}finally{if(t)throw t.error}}},t.prototype.deregisterRootHandlers=function(){var e,t;try{for(var r=(0,c.__values)(_),i=r.next();!i.done;i=r.next()){var a=i.value;this.adapter.deregisterInteractionHandler(a,this.activateHandler)}}catch(n){e={error:n}}finally{try{i&&!i.done&&(t=r.return)&&t.call(r)}finally{if(e)throw e.error}}this.adapter.deregisterInteractionHandler("focus",this.focusHandler),this.adapter.deregisterInteractionHandler("blur",this.blurHandler),this.adapter.isUnbounded()&&this.adapter.deregisterResizeHandler(this.resizeHandler)},t.prototype.deregisterDeactivationHandlers=function(){var e,t;this.adapter.deregisterInteractionHandler("keyup",this.deactivateHandler);try{for(var r=(0,c.__values)(A),i=r.next();!i.done;i=r.next()){var a=i.value;this.adapter.deregisterDocumentInteractionHandler(a,this.deactivateHandler)}}catch(n){e={error:n}}finally{try{i&&!i.done&&(t=r.return)&&t.call(r)}finally{if(e)throw e.error}}},t.prototype.removeCssVars=function(){var e=this,r=t.strings;Object.keys(r).forEach((function(t){0===t.indexOf("VAR_")&&e.adapter.updateCssVariable(r[t],null)}))},t.prototype.activateImpl=function(e){var t=this;if(!this.adapter.isSurfaceDisabled()){var r=this.activationState;if(!r.isActivated){var i=this.previousActivationEvent;if(!(i&&void 0!==e&&i.type!==e.type))r.isActivated=!0,r.isProgrammatic=void 0===e,r.activationEvent=e,r.wasActivatedByPointer=!r.isProgrammatic&&(void 0!==e&&("mousedown"===e.type||"touchstart"===e.type||"pointerdown"===e.type)),void 0!==e&&k.length>0&&k.some((function(e){return t.adapter.containsEventTarget(e)}))?this.resetActivationState():(void 0!==e&&(k.push(e.target),this.registerDeactivationHandlers(e)),r.wasElementMadeActive=this.checkElementMadeActive(e),r.wasElementMadeActive&&this.animateActivation(),requestAnimationFrame((function(){k=[],r.wasElementMadeActive||void 0===e||" "!==e.key&&32!==e.keyCode||(r.wasElementMadeActive=t.checkElementMadeActive(e),r.wasElementMadeActive&&t.animateActivation()),r.wasElementMadeActive||(t.activationState=t.defaultActivationState())})))}}},t.prototype.checkElementMadeActive=function(e){return void 0===e||"keydown"!==e.type||this.adapter.isSurfaceActive()},t.prototype.animateActivation=function(){var e=this,r=t.strings,i=r.VAR_FG_TRANSLATE_START,a=r.VAR_FG_TRANSLATE_END,n=t.cssClasses,o=n.FG_DEACTIVATION,c=n.FG_ACTIVATION,d=t.numbers.DEACTIVATION_TIMEOUT_MS;this.layoutInternal();var p="",s="";if(!this.adapter.isUnbounded()){var u=this.getFgTranslationCoordinates(),l=u.startPoint,f=u.endPoint;p=l.x+"px, "+l.y+"px",s=f.x+"px, "+f.y+"px"}this.adapter.updateCssVariable(i,p),this.adapter.updateCssVariable(a,s),clearTimeout(this.activationTimer),clearTimeout(this.fgDeactivationRemovalTimer),this.rmBoundedActivationClasses(),this.adapter.removeClass(o),this.adapter.computeBoundingRect(),this.adapter.addClass(c),this.activationTimer=setTimeout((function(){e.activationTimerCallback()}),d)},t.prototype.getFgTranslationCoordinates=function(){var e,t=this.activationState,r=t.activationEvent;return{startPoint:e={x:(e=t.wasActivatedByPointer?function(e,t,r){if(!e)return{x:0,y:0};var i,a,n=t.x,o=t.y,c=n+r.left,d=o+r.top;if("touchstart"===e.type){var p=e;i=p.changedTouches[0].pageX-c,a=p.changedTouches[0].pageY-d}else{var s=e;i=s.pageX-c,a=s.pageY-d}return{x:i,y:a}}(r,this.adapter.getWindowPageOffset(),this.adapter.computeBoundingRect()):{x:this.frame.width/2,y:this.frame.height/2}).x-this.initialSize/2,y:e.y-this.initialSize/2},endPoint:{x:this.frame.width/2-this.initialSize/2,y:this.frame.height/2-this.initialSize/2}}},t.prototype.runDeactivationUXLogicIfReady=function(){var e=this,r=t.cssClasses.FG_DEACTIVATION,i=this.activationState,a=i.hasDeactivationUXRun,n=i.isActivated;(a||!n)&&this.activationAnimationHasEnded&&(this.rmBoundedActivationClasses(),this.adapter.addClass(r),this.fgDeactivationRemovalTimer=setTimeout((function(){e.adapter.removeClass(r)}),y.FG_DEACTIVATION_MS))},t.prototype.rmBoundedActivationClasses=function(){var e=t.cssClasses.FG_ACTIVATION;this.adapter.removeClass(e),this.activationAnimationHasEnded=!1,this.adapter.computeBoundingRect()},t.prototype.resetActivationState=function(){var e=this;this.previousActivationEvent=this.activationState.activationEvent,this.activationState=this.defaultActivationState(),setTimeout((function(){return e.previousActivationEvent=void 0}),t.numbers.TAP_DELAY_MS)},t.prototype.deactivateImpl=function(){var e=this,t=this.activationState;if(t.isActivated){var r=(0,c.__assign)({},t);t.isProgrammatic?(requestAnimationFrame((function(){e.animateDeactivation(r)})),this.resetActivationState()):(this.deregisterDeactivationHandlers(),requestAnimationFrame((function(){e.activationState.hasDeactivationUXRun=!0,e.animateDeactivation(r),e.resetActivationState()})))}},t.prototype.animateDeactivation=function(e){var t=e.wasActivatedByPointer,r=e.wasElementMadeActive;(t||r)&&this.runDeactivationUXLogicIfReady()},t.prototype.layoutInternal=function(){var e=this;this.frame=this.adapter.computeBoundingRect();var r=Math.max(this.frame.height,this.frame.width);this.maxRadius=this.adapter.isUnbounded()?r:Math.sqrt(Math.pow(e.frame.width,2)+Math.pow(e.frame.height,2))+t.numbers.PADDING;var i=Math.floor(r*t.numbers.INITIAL_ORIGIN_SCALE);this.adapter.isUnbounded()&&i%2!=0?this.initialSize=i-1:this.initialSize=i,this.fgScale=""+this.maxRadius/this.initialSize,this.updateLayoutCssVars()},t.prototype.updateLayoutCssVars=function(){var e=t.strings,r=e.VAR_FG_SIZE,i=e.VAR_LEFT,a=e.VAR_TOP,n=e.VAR_FG_SCALE;this.adapter.updateCssVariable(r,this.initialSize+"px"),this.adapter.updateCssVariable(n,this.fgScale),this.adapter.isUnbounded()&&(this.unboundedCoords={left:Math.round(this.frame.width/2-this.initialSize/2),top:Math.round(this.frame.height/2-this.initialSize/2)},this.adapter.updateCssVariable(i,this.unboundedCoords.left+"px"),this.adapter.updateCssVariable(a,this.unboundedCoords.top+"px"))},t}(m.K),C=r(5095),E=r(53180),T=r(86634),x=function(e){function t(){var e;return(0,a.Z)(this,t),(e=(0,n.Z)(this,t,arguments)).primary=!1,e.accent=!1,e.unbounded=!1,e.disabled=!1,e.activated=!1,e.selected=!1,e.internalUseStateLayerCustomProperties=!1,e.hovering=!1,e.bgFocused=!1,e.fgActivation=!1,e.fgDeactivation=!1,e.fgScale="",e.fgSize="",e.translateStart="",e.translateEnd="",e.leftPos="",e.topPos="",e.mdcFoundationClass=w,e}return(0,o.Z)(t,e),(0,i.Z)(t,[{key:"isActive",get:function(){return(0,l.wB)(this.parentElement||this,":active")}},{key:"createAdapter",value:function(){var e=this;return{browserSupportsCssVars:function(){return!0},isUnbounded:function(){return e.unbounded},isSurfaceActive:function(){return e.isActive},isSurfaceDisabled:function(){return e.disabled},addClass:function(t){switch(t){case"mdc-ripple-upgraded--background-focused":e.bgFocused=!0;break;case"mdc-ripple-upgraded--foreground-activation":e.fgActivation=!0;break;case"mdc-ripple-upgraded--foreground-deactivation":e.fgDeactivation=!0}},removeClass:function(t){switch(t){case"mdc-ripple-upgraded--background-focused":e.bgFocused=!1;break;case"mdc-ripple-upgraded--foreground-activation":e.fgActivation=!1;break;case"mdc-ripple-upgraded--foreground-deactivation":e.fgDeactivation=!1}},containsEventTarget:function(){return!0},registerInteractionHandler:function(){},deregisterInteractionHandler:function(){},registerDocumentInteractionHandler:function(){},deregisterDocumentInteractionHandler:function(){},registerResizeHandler:function(){},deregisterResizeHandler:function(){},updateCssVariable:function(t,r){switch(t){case"--mdc-ripple-fg-scale":e.fgScale=r;break;case"--mdc-ripple-fg-size":e.fgSize=r;break;case"--mdc-ripple-fg-translate-end":e.translateEnd=r;break;case"--mdc-ripple-fg-translate-start":e.translateStart=r;break;case"--mdc-ripple-left":e.leftPos=r;break;case"--mdc-ripple-top":e.topPos=r}},computeBoundingRect:function(){return(e.parentElement||e).getBoundingClientRect()},getWindowPageOffset:function(){return{x:window.pageXOffset,y:window.pageYOffset}}}}},{key:"startPress",value:function(e){var t=this;this.waitForFoundation((function(){t.mdcFoundation.activate(e)}))}},{key:"endPress",value:function(){var e=this;this.waitForFoundation((function(){e.mdcFoundation.deactivate()}))}},{key:"startFocus",value:function(){var e=this;this.waitForFoundation((function(){e.mdcFoundation.handleFocus()}))}},{key:"endFocus",value:function(){var e=this;this.waitForFoundation((function(){e.mdcFoundation.handleBlur()}))}},{key:"startHover",value:function(){this.hovering=!0}},{key:"endHover",value:function(){this.hovering=!1}},{key:"waitForFoundation",value:function(e){this.mdcFoundation?e():this.updateComplete.then(e)}},{key:"update",value:function(e){e.has("disabled")&&this.disabled&&this.endHover(),(0,s.Z)((0,u.Z)(t.prototype),"update",this).call(this,e)}},{key:"render",value:function(){var e=this.activated&&(this.primary||!this.accent),t=this.selected&&(this.primary||!this.accent),r={"mdc-ripple-surface--accent":this.accent,"mdc-ripple-surface--primary--activated":e,"mdc-ripple-surface--accent--activated":this.accent&&this.activated,"mdc-ripple-surface--primary--selected":t,"mdc-ripple-surface--accent--selected":this.accent&&this.selected,"mdc-ripple-surface--disabled":this.disabled,"mdc-ripple-surface--hover":this.hovering,"mdc-ripple-surface--primary":this.primary,"mdc-ripple-surface--selected":this.selected,"mdc-ripple-upgraded--background-focused":this.bgFocused,"mdc-ripple-upgraded--foreground-activation":this.fgActivation,"mdc-ripple-upgraded--foreground-deactivation":this.fgDeactivation,"mdc-ripple-upgraded--unbounded":this.unbounded,"mdc-ripple-surface--internal-use-state-layer-custom-properties":this.internalUseStateLayerCustomProperties};return(0,C.dy)(g||(g=(0,p.Z)([' <div class="mdc-ripple-surface mdc-ripple-upgraded ','" style="','"></div>'])),(0,E.$)(r),(0,T.V)({"--mdc-ripple-fg-scale":this.fgScale,"--mdc-ripple-fg-size":this.fgSize,"--mdc-ripple-fg-translate-end":this.translateEnd,"--mdc-ripple-fg-translate-start":this.translateStart,"--mdc-ripple-left":this.leftPos,"--mdc-ripple-top":this.topPos}))}}]),t}(f.H);(0,c.__decorate)([(0,d.IO)(".mdc-ripple-surface")],x.prototype,"mdcRoot",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"primary",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"accent",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"unbounded",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"disabled",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"activated",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"selected",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean})],x.prototype,"internalUseStateLayerCustomProperties",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"hovering",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"bgFocused",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"fgActivation",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"fgDeactivation",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"fgScale",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"fgSize",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"translateStart",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"translateEnd",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"leftPos",void 0),(0,c.__decorate)([(0,d.SB)()],x.prototype,"topPos",void 0);var S=(0,C.iv)(b||(b=(0,p.Z)(['.mdc-ripple-surface{--mdc-ripple-fg-size:0;--mdc-ripple-left:0;--mdc-ripple-top:0;--mdc-ripple-fg-scale:1;--mdc-ripple-fg-translate-end:0;--mdc-ripple-fg-translate-start:0;-webkit-tap-highlight-color:transparent;will-change:transform,opacity;position:relative;outline:0;overflow:hidden}.mdc-ripple-surface::after,.mdc-ripple-surface::before{position:absolute;border-radius:50%;opacity:0;pointer-events:none;content:""}.mdc-ripple-surface::before{transition:opacity 15ms linear,background-color 15ms linear;z-index:1;z-index:var(--mdc-ripple-z-index,1)}.mdc-ripple-surface::after{z-index:0;z-index:var(--mdc-ripple-z-index,0)}.mdc-ripple-surface.mdc-ripple-upgraded::before{transform:scale(var(--mdc-ripple-fg-scale,1))}.mdc-ripple-surface.mdc-ripple-upgraded::after{top:0;left:0;transform:scale(0);transform-origin:center center}.mdc-ripple-surface.mdc-ripple-upgraded--unbounded::after{top:var(--mdc-ripple-top,0);left:var(--mdc-ripple-left,0)}.mdc-ripple-surface.mdc-ripple-upgraded--foreground-activation::after{animation:mdc-ripple-fg-radius-in 225ms forwards,mdc-ripple-fg-opacity-in 75ms forwards}.mdc-ripple-surface.mdc-ripple-upgraded--foreground-deactivation::after{animation:mdc-ripple-fg-opacity-out 150ms;transform:translate(var(--mdc-ripple-fg-translate-end,0)) scale(var(--mdc-ripple-fg-scale,1))}.mdc-ripple-surface::after,.mdc-ripple-surface::before{top:calc(50% - 100%);left:calc(50% - 100%);width:200%;height:200%}.mdc-ripple-surface.mdc-ripple-upgraded::after{width:var(--mdc-ripple-fg-size,100%);height:var(--mdc-ripple-fg-size,100%)}.mdc-ripple-surface[data-mdc-ripple-is-unbounded],.mdc-ripple-upgraded--unbounded{overflow:visible}.mdc-ripple-surface[data-mdc-ripple-is-unbounded]::after,.mdc-ripple-surface[data-mdc-ripple-is-unbounded]::before,.mdc-ripple-upgraded--unbounded::after,.mdc-ripple-upgraded--unbounded::before{top:calc(50% - 50%);left:calc(50% - 50%);width:100%;height:100%}.mdc-ripple-surface[data-mdc-ripple-is-unbounded].mdc-ripple-upgraded::after,.mdc-ripple-surface[data-mdc-ripple-is-unbounded].mdc-ripple-upgraded::before,.mdc-ripple-upgraded--unbounded.mdc-ripple-upgraded::after,.mdc-ripple-upgraded--unbounded.mdc-ripple-upgraded::before{top:var(--mdc-ripple-top,calc(50% - 50%));left:var(--mdc-ripple-left,calc(50% - 50%));width:var(--mdc-ripple-fg-size,100%);height:var(--mdc-ripple-fg-size,100%)}.mdc-ripple-surface[data-mdc-ripple-is-unbounded].mdc-ripple-upgraded::after,.mdc-ripple-upgraded--unbounded.mdc-ripple-upgraded::after{width:var(--mdc-ripple-fg-size,100%);height:var(--mdc-ripple-fg-size,100%)}.mdc-ripple-surface::after,.mdc-ripple-surface::before{background-color:#000;background-color:var(--mdc-ripple-color,#000)}.mdc-ripple-surface.mdc-ripple-surface--hover::before,.mdc-ripple-surface:hover::before{opacity:.04;opacity:var(--mdc-ripple-hover-opacity, .04)}.mdc-ripple-surface.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-opacity, .12)}.mdc-ripple-surface:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-press-opacity, .12)}.mdc-ripple-surface.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.12)}@keyframes mdc-ripple-fg-radius-in{from{animation-timing-function:cubic-bezier(0.4,0,0.2,1);transform:translate(var(--mdc-ripple-fg-translate-start,0)) scale(1)}to{transform:translate(var(--mdc-ripple-fg-translate-end,0)) scale(var(--mdc-ripple-fg-scale,1))}}@keyframes mdc-ripple-fg-opacity-in{from{animation-timing-function:linear;opacity:0}to{opacity:var(--mdc-ripple-fg-opacity, 0)}}@keyframes mdc-ripple-fg-opacity-out{from{animation-timing-function:linear;opacity:var(--mdc-ripple-fg-opacity, 0)}to{opacity:0}}:host{position:absolute;top:0;left:0;width:100%;height:100%;pointer-events:none;display:block}:host .mdc-ripple-surface{position:absolute;top:0;left:0;width:100%;height:100%;pointer-events:none;will-change:unset}.mdc-ripple-surface--primary::after,.mdc-ripple-surface--primary::before{background-color:#6200ee;background-color:var(--mdc-ripple-color,var(--mdc-theme-primary,#6200ee))}.mdc-ripple-surface--primary.mdc-ripple-surface--hover::before,.mdc-ripple-surface--primary:hover::before{opacity:.04;opacity:var(--mdc-ripple-hover-opacity, .04)}.mdc-ripple-surface--primary.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--primary:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-opacity, .12)}.mdc-ripple-surface--primary:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--primary:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-press-opacity, .12)}.mdc-ripple-surface--primary.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.12)}.mdc-ripple-surface--primary--activated::before{opacity:.12;opacity:var(--mdc-ripple-activated-opacity, .12)}.mdc-ripple-surface--primary--activated::after,.mdc-ripple-surface--primary--activated::before{background-color:#6200ee;background-color:var(--mdc-ripple-color,var(--mdc-theme-primary,#6200ee))}.mdc-ripple-surface--primary--activated.mdc-ripple-surface--hover::before,.mdc-ripple-surface--primary--activated:hover::before{opacity:.16;opacity:var(--mdc-ripple-hover-opacity, .16)}.mdc-ripple-surface--primary--activated.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--primary--activated:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.24;opacity:var(--mdc-ripple-focus-opacity, .24)}.mdc-ripple-surface--primary--activated:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--primary--activated:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.24;opacity:var(--mdc-ripple-press-opacity, .24)}.mdc-ripple-surface--primary--activated.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.24)}.mdc-ripple-surface--primary--selected::before{opacity:.08;opacity:var(--mdc-ripple-selected-opacity, .08)}.mdc-ripple-surface--primary--selected::after,.mdc-ripple-surface--primary--selected::before{background-color:#6200ee;background-color:var(--mdc-ripple-color,var(--mdc-theme-primary,#6200ee))}.mdc-ripple-surface--primary--selected.mdc-ripple-surface--hover::before,.mdc-ripple-surface--primary--selected:hover::before{opacity:.12;opacity:var(--mdc-ripple-hover-opacity, .12)}.mdc-ripple-surface--primary--selected.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--primary--selected:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.2;opacity:var(--mdc-ripple-focus-opacity, .2)}.mdc-ripple-surface--primary--selected:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--primary--selected:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.2;opacity:var(--mdc-ripple-press-opacity, .2)}.mdc-ripple-surface--primary--selected.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.2)}.mdc-ripple-surface--accent::after,.mdc-ripple-surface--accent::before{background-color:#018786;background-color:var(--mdc-ripple-color,var(--mdc-theme-secondary,#018786))}.mdc-ripple-surface--accent.mdc-ripple-surface--hover::before,.mdc-ripple-surface--accent:hover::before{opacity:.04;opacity:var(--mdc-ripple-hover-opacity, .04)}.mdc-ripple-surface--accent.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--accent:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-opacity, .12)}.mdc-ripple-surface--accent:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--accent:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-press-opacity, .12)}.mdc-ripple-surface--accent.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.12)}.mdc-ripple-surface--accent--activated::before{opacity:.12;opacity:var(--mdc-ripple-activated-opacity, .12)}.mdc-ripple-surface--accent--activated::after,.mdc-ripple-surface--accent--activated::before{background-color:#018786;background-color:var(--mdc-ripple-color,var(--mdc-theme-secondary,#018786))}.mdc-ripple-surface--accent--activated.mdc-ripple-surface--hover::before,.mdc-ripple-surface--accent--activated:hover::before{opacity:.16;opacity:var(--mdc-ripple-hover-opacity, .16)}.mdc-ripple-surface--accent--activated.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--accent--activated:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.24;opacity:var(--mdc-ripple-focus-opacity, .24)}.mdc-ripple-surface--accent--activated:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--accent--activated:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.24;opacity:var(--mdc-ripple-press-opacity, .24)}.mdc-ripple-surface--accent--activated.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.24)}.mdc-ripple-surface--accent--selected::before{opacity:.08;opacity:var(--mdc-ripple-selected-opacity, .08)}.mdc-ripple-surface--accent--selected::after,.mdc-ripple-surface--accent--selected::before{background-color:#018786;background-color:var(--mdc-ripple-color,var(--mdc-theme-secondary,#018786))}.mdc-ripple-surface--accent--selected.mdc-ripple-surface--hover::before,.mdc-ripple-surface--accent--selected:hover::before{opacity:.12;opacity:var(--mdc-ripple-hover-opacity, .12)}.mdc-ripple-surface--accent--selected.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--accent--selected:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.2;opacity:var(--mdc-ripple-focus-opacity, .2)}.mdc-ripple-surface--accent--selected:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--accent--selected:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.2;opacity:var(--mdc-ripple-press-opacity, .2)}.mdc-ripple-surface--accent--selected.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.2)}.mdc-ripple-surface--disabled{opacity:0}.mdc-ripple-surface--internal-use-state-layer-custom-properties::after,.mdc-ripple-surface--internal-use-state-layer-custom-properties::before{background-color:#000;background-color:var(--mdc-ripple-hover-state-layer-color,#000)}.mdc-ripple-surface--internal-use-state-layer-custom-properties.mdc-ripple-surface--hover::before,.mdc-ripple-surface--internal-use-state-layer-custom-properties:hover::before{opacity:.04;opacity:var(--mdc-ripple-hover-state-layer-opacity, .04)}.mdc-ripple-surface--internal-use-state-layer-custom-properties.mdc-ripple-upgraded--background-focused::before,.mdc-ripple-surface--internal-use-state-layer-custom-properties:not(.mdc-ripple-upgraded):focus::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-state-layer-opacity, .12)}.mdc-ripple-surface--internal-use-state-layer-custom-properties:not(.mdc-ripple-upgraded)::after{transition:opacity 150ms linear}.mdc-ripple-surface--internal-use-state-layer-custom-properties:not(.mdc-ripple-upgraded):active::after{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-pressed-state-layer-opacity, .12)}.mdc-ripple-surface--internal-use-state-layer-custom-properties.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-pressed-state-layer-opacity, 0.12)}']))),R=function(e){function t(){return(0,a.Z)(this,t),(0,n.Z)(this,t,arguments)}return(0,o.Z)(t,e),(0,i.Z)(t)}(x);R.styles=[S],R=(0,c.__decorate)([(0,d.Mo)("mwc-ripple")],R)},98734:function(e,t,r){r.d(t,{A:function(){return n}});var i=r(33368),a=r(71650),n=(0,i.Z)((function e(t){(0,a.Z)(this,e),this.startPress=function(e){t().then((function(t){t&&t.startPress(e)}))},this.endPress=function(){t().then((function(e){e&&e.endPress()}))},this.startFocus=function(){t().then((function(e){e&&e.startFocus()}))},this.endFocus=function(){t().then((function(e){e&&e.endFocus()}))},this.startHover=function(){t().then((function(e){e&&e.startHover()}))},this.endHover=function(){t().then((function(e){e&&e.endHover()}))}}))},53180:function(e,t,r){r.d(t,{$:function(){return u}});var i=r(62746),a=r(71650),n=r(33368),o=r(95281),c=r(68308),d=r(69205),p=(r(22859),r(51467),r(91989),r(87438),r(46798),r(9849),r(22890),r(65974),r(51358),r(78399),r(5239),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(98490),r(63789),r(57778),r(50289),r(94167),r(32982)),s=r(16616),u=(0,s.XM)(function(e){function t(e){var r,i;if((0,a.Z)(this,t),r=(0,c.Z)(this,t,[e]),e.type!==s.pX.ATTRIBUTE||"class"!==e.name||(null===(i=e.strings)||void 0===i?void 0:i.length)>2)throw Error("`classMap()` can only be used in the `class` attribute and must be the only part in the attribute.");return(0,o.Z)(r)}return(0,d.Z)(t,e),(0,n.Z)(t,[{key:"render",value:function(e){return" "+Object.keys(e).filter((function(t){return e[t]})).join(" ")+" "}},{key:"update",value:function(e,t){var r,a,n=this,o=(0,i.Z)(t,1)[0];if(void 0===this.it){for(var c in this.it=new Set,void 0!==e.strings&&(this.nt=new Set(e.strings.join(" ").split(/\s/).filter((function(e){return""!==e})))),o)o[c]&&!(null===(r=this.nt)||void 0===r?void 0:r.has(c))&&this.it.add(c);return this.render(o)}var d=e.element.classList;for(var s in this.it.forEach((function(e){e in o||(d.remove(e),n.it.delete(e))})),o){var u=!!o[s];u===this.it.has(s)||(null===(a=this.nt)||void 0===a?void 0:a.has(s))||(u?(d.add(s),this.it.add(s)):(d.remove(s),this.it.delete(s)))}return p.Jb}}]),t}(s.Xe))},10694:function(e,t,r){r.d(t,{o:function(){return a}});var i=r(32982),a=function(e){return null!=e?e:i.Ld}},86634:function(e,t,r){r.d(t,{V:function(){return f}});var i=r(62746),a=r(71650),n=r(33368),o=r(95281),c=r(68308),d=r(69205),p=(r(22859),r(51467),r(34997),r(46798),r(9849),r(12148),r(65974),r(97393),r(40271),r(60163),r(63789),r(24074),r(51358),r(78399),r(5239),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(98490),r(50289),r(94167),r(2094),r(17692),r(32982)),s=r(16616),u="important",l=" !"+u,f=(0,s.XM)(function(e){function t(e){var r,i;if((0,a.Z)(this,t),r=(0,c.Z)(this,t,[e]),e.type!==s.pX.ATTRIBUTE||"style"!==e.name||(null===(i=e.strings)||void 0===i?void 0:i.length)>2)throw Error("The `styleMap` directive must be used in the `style` attribute and must be the only part in the attribute.");return(0,o.Z)(r)}return(0,d.Z)(t,e),(0,n.Z)(t,[{key:"render",value:function(e){return Object.keys(e).reduce((function(t,r){var i=e[r];return null==i?t:t+"".concat(r=r.includes("-")?r:r.replace(/(?:^(webkit|moz|ms|o)|)(?=[A-Z])/g,"-$&").toLowerCase(),":").concat(i,";")}),"")}},{key:"update",value:function(e,t){var r=this,a=(0,i.Z)(t,1)[0],n=e.element.style;if(void 0===this.ht){for(var o in this.ht=new Set,a)this.ht.add(o);return this.render(a)}for(var c in this.ht.forEach((function(e){null==a[e]&&(r.ht.delete(e),e.includes("-")?n.removeProperty(e):n[e]="")})),a){var d=a[c];if(null!=d){this.ht.add(c);var s="string"==typeof d&&d.endsWith(l);c.includes("-")||s?n.setProperty(c,s?d.slice(0,-11):d,s?u:""):n[c]=d}}return p.Jb}}]),t}(s.Xe))},16616:function(e,t,r){r.d(t,{XM:function(){return c},Xe:function(){return d},pX:function(){return o}});var i=r(46097),a=r(71650),n=r(33368),o={ATTRIBUTE:1,CHILD:2,PROPERTY:3,BOOLEAN_ATTRIBUTE:4,EVENT:5,ELEMENT:6},c=function(e){return function(){for(var t=arguments.length,r=new Array(t),i=0;i<t;i++)r[i]=arguments[i];return{_$litDirective$:e,values:r}}},d=function(){function e(t){(0,a.Z)(this,e)}return(0,n.Z)(e,[{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"_$AT",value:function(e,t,r){this._$Ct=e,this._$AM=t,this._$Ci=r}},{key:"_$AS",value:function(e,t){return this.update(e,t)}},{key:"update",value:function(e,t){return this.render.apply(this,(0,i.Z)(t))}}]),e}()}}]);
+//# sourceMappingURL=210.1-qyflIdLxA.js.map
\ No newline at end of file
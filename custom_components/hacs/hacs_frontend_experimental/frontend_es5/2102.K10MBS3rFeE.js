@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2102],{42219:function(e,t,r){r.d(t,{y:function(){return n}});r(40271),r(60163);var a=r(14516),i=r(35137),n=(0,a.Z)((function(e){if(e.time_format===i.zt.language||e.time_format===i.zt.system){var t=e.time_format===i.zt.language?e.language:void 0;return new Date("January 1, 2023 22:00:00").toLocaleString(t).includes("10")}return e.time_format===i.zt.am_pm}))},91977:function(e,t,r){r.r(t),r.d(t,{HaTimeSelector:function(){return v}});var a,i=r(88962),n=r(33368),o=r(71650),d=r(68308),u=r(82390),l=r(69205),s=r(91808),c=(r(97393),r(5095)),h=r(95260),v=(r(51115),(0,s.Z)([(0,h.Mo)("ha-selector-time")],(function(e,t){var r=function(t){function r(){var t;(0,o.Z)(this,r);for(var a=arguments.length,i=new Array(a),n=0;n<a;n++)i[n]=arguments[n];return t=(0,d.Z)(this,r,[].concat(i)),e((0,u.Z)(t)),t}return(0,l.Z)(r,t),(0,n.Z)(r)}(t);return{F:r,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,c.dy)(a||(a=(0,i.Z)([' <ha-time-input .value="','" .locale="','" .disabled="','" .required="','" .helper="','" .label="','" enable-second></ha-time-input> '])),"string"==typeof this.value?this.value:void 0,this.hass.locale,this.disabled,this.required,this.helper,this.label)}}]}}),c.oi))},51115:function(e,t,r){var a,i=r(88962),n=r(33368),o=r(71650),d=r(68308),u=r(82390),l=r(69205),s=r(91808),c=(r(97393),r(76843),r(73314),r(46798),r(94570),r(5095)),h=r(95260),v=r(42219),f=r(18394);r(64106),(0,s.Z)([(0,h.Mo)("ha-time-input")],(function(e,t){var r=function(t){function r(){var t;(0,o.Z)(this,r);for(var a=arguments.length,i=new Array(a),n=0;n<a;n++)i[n]=arguments[n];return t=(0,d.Z)(this,r,[].concat(i)),e((0,u.Z)(t)),t}return(0,l.Z)(r,t),(0,n.Z)(r)}(t);return{F:r,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"locale",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)({type:Boolean,attribute:"enable-second"})],key:"enableSecond",value:function(){return!1}},{kind:"method",key:"render",value:function(){var e,t=(0,v.y)(this.locale),r=(null===(e=this.value)||void 0===e?void 0:e.split(":"))||[],n=r[0],o=Number(r[0]);return o&&t&&o>12&&o<24&&(n=String(o-12).padStart(2,"0")),t&&0===o&&(n="12"),(0,c.dy)(a||(a=(0,i.Z)([' <ha-base-time-input .label="','" .hours="','" .minutes="','" .seconds="','" .format="','" .amPm="','" .disabled="','" @value-changed="','" .enableSecond="','" .required="','" .helper="','"></ha-base-time-input> '])),this.label,Number(n),Number(r[1]),Number(r[2]),t?12:24,t&&o>=12?"PM":"AM",this.disabled,this._timeChanged,this.enableSecond,this.required,this.helper)}},{kind:"method",key:"_timeChanged",value:function(e){e.stopPropagation();var t,r=e.detail.value,a=(0,v.y)(this.locale);if(!isNaN(r.hours)||!isNaN(r.minutes)||!isNaN(r.seconds)){var i=r.hours||0;r&&a&&("PM"===r.amPm&&i<12&&(i+=12),"AM"===r.amPm&&12===i&&(i=0)),t="".concat(i.toString().padStart(2,"0"),":").concat(r.minutes?r.minutes.toString().padStart(2,"0"):"00",":").concat(r.seconds?r.seconds.toString().padStart(2,"0"):"00")}t!==this.value&&(this.value=t,(0,f.B)(this,"change"),(0,f.B)(this,"value-changed",{value:t}))}}]}}),c.oi)},93892:function(e,t,r){var a=r(97673),i=r(11336),n=r(43313),o=RangeError;e.exports=function(e){var t=i(n(this)),r="",d=a(e);if(d<0||d===1/0)throw new o("Wrong number of repetitions");for(;d>0;(d>>>=1)&&(t+=t))1&d&&(r+=t);return r}}}]);
+//# sourceMappingURL=2102.K10MBS3rFeE.js.map
\ No newline at end of file
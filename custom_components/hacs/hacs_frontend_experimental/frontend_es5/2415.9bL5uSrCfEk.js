@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2415],{55020:function(t,e,n){n.d(e,{j:function(){return o}});var r={};function o(){return r}},5763:function(t,e,n){function r(t){var e=new Date(Date.UTC(t.getFullYear(),t.getMonth(),t.getDate(),t.getHours(),t.getMinutes(),t.getSeconds(),t.getMilliseconds()));return e.setUTCFullYear(t.getFullYear()),t.getTime()-e.getTime()}n.d(e,{Z:function(){return r}})},23682:function(t,e,n){n.d(e,{Z:function(){return r}});n(51467);function r(t,e){if(e.length<t)throw new TypeError(t+" argument"+(t>1?"s":"")+" required, but only "+e.length+" present")}},90394:function(t,e,n){n.d(e,{Z:function(){return r}});n(76843);function r(t){if(null===t||!0===t||!1===t)return NaN;var e=Number(t);return isNaN(e)?e:e<0?Math.ceil(e):Math.floor(e)}},62308:function(t,e,n){n.d(e,{Z:function(){return s}});n(76843);var r=n(34327),o=n(5763),u=n(23682);function a(t){(0,u.Z)(1,arguments);var e=(0,r.Z)(t);return e.setHours(0,0,0,0),e}var i=864e5;function c(t,e){var n=t.getFullYear()-e.getFullYear()||t.getMonth()-e.getMonth()||t.getDate()-e.getDate()||t.getHours()-e.getHours()||t.getMinutes()-e.getMinutes()||t.getSeconds()-e.getSeconds()||t.getMilliseconds()-e.getMilliseconds();return n<0?-1:n>0?1:n}function s(t,e){(0,u.Z)(2,arguments);var n=(0,r.Z)(t),s=(0,r.Z)(e),l=c(n,s),f=Math.abs(function(t,e){(0,u.Z)(2,arguments);var n=a(t),r=a(e),c=n.getTime()-(0,o.Z)(n),s=r.getTime()-(0,o.Z)(r);return Math.round((c-s)/i)}(n,s));n.setDate(n.getDate()-l*f);var M=l*(f-Number(c(n,s)===-l));return 0===M?0:M}},27296:function(t,e,n){n.d(e,{Z:function(){return i}});var r=n(62308),o=n(23682),u={ceil:Math.ceil,round:Math.round,floor:Math.floor,trunc:function(t){return t<0?Math.ceil(t):Math.floor(t)}},a="trunc";function i(t,e,n){(0,o.Z)(2,arguments);var i,c=(0,r.Z)(t,e)/7;return((i=null==n?void 0:n.roundingMethod)?u[i]:u[a])(c)}},59401:function(t,e,n){n.d(e,{Z:function(){return i}});n(51467);var r=n(34327),o=n(90394),u=n(23682),a=n(55020);function i(t,e){var n,i,c,s,l,f,M,d;(0,u.Z)(1,arguments);var g=(0,a.j)(),N=(0,o.Z)(null!==(n=null!==(i=null!==(c=null!==(s=null==e?void 0:e.weekStartsOn)&&void 0!==s?s:null==e||null===(l=e.locale)||void 0===l||null===(f=l.options)||void 0===f?void 0:f.weekStartsOn)&&void 0!==c?c:g.weekStartsOn)&&void 0!==i?i:null===(M=g.locale)||void 0===M||null===(d=M.options)||void 0===d?void 0:d.weekStartsOn)&&void 0!==n?n:0);if(!(N>=0&&N<=6))throw new RangeError("weekStartsOn must be between 0 and 6 inclusively");var I=(0,r.Z)(t),m=I.getDay(),h=(m<N?7:0)+m-N;return I.setDate(I.getDate()-h),I.setHours(0,0,0,0),I}},34327:function(t,e,n){n.d(e,{Z:function(){return u}});n(46798),n(94570),n(51467);var r=n(56956),o=n(23682);function u(t){(0,o.Z)(1,arguments);var e=Object.prototype.toString.call(t);return t instanceof Date||"object"===(0,r.Z)(t)&&"[object Date]"===e?new Date(t.getTime()):"number"==typeof t||"[object Number]"===e?new Date(t):("string"!=typeof t&&"[object String]"!==e||"undefined"==typeof console||(console.warn("Starting with v2.0.0-beta.1 date-fns doesn't accept strings as date arguments. Please use `parseISO` to parse strings. See: https://github.com/date-fns/date-fns/blob/master/docs/upgradeGuide.md#string-arguments"),console.warn((new Error).stack)),new Date(NaN))}},22075:function(t,e,n){n.d(e,{L:function(){return u}});n(63789),n(57778),n(18098),n(76843);var r={en:"US",hi:"IN",deva:"IN",te:"IN",mr:"IN",ta:"IN",gu:"IN",kn:"IN",or:"IN",ml:"IN",pa:"IN",bho:"IN",awa:"IN",as:"IN",mwr:"IN",mai:"IN",mag:"IN",bgc:"IN",hne:"IN",dcc:"IN",bn:"BD",beng:"BD",rkt:"BD",dz:"BT",tibt:"BT",tn:"BW",am:"ET",ethi:"ET",om:"ET",quc:"GT",id:"ID",jv:"ID",su:"ID",mad:"ID",ms_arab:"ID",he:"IL",hebr:"IL",jam:"JM",ja:"JP",jpan:"JP",km:"KH",khmr:"KH",ko:"KR",kore:"KR",lo:"LA",laoo:"LA",mh:"MH",my:"MM",mymr:"MM",mt:"MT",ne:"NP",fil:"PH",ceb:"PH",ilo:"PH",ur:"PK",pa_arab:"PK",lah:"PK",ps:"PK",sd:"PK",skr:"PK",gn:"PY",th:"TH",thai:"TH",tts:"TH",zh_hant:"TW",hant:"TW",sm:"WS",zu:"ZA",sn:"ZW",arq:"DZ",ar:"EG",arab:"EG",arz:"EG",fa:"IR",az_arab:"IR",dv:"MV",thaa:"MV"},o={AG:0,ATG:0,28:0,AS:0,ASM:0,16:0,BD:0,BGD:0,50:0,BR:0,BRA:0,76:0,BS:0,BHS:0,44:0,BT:0,BTN:0,64:0,BW:0,BWA:0,72:0,BZ:0,BLZ:0,84:0,CA:0,CAN:0,124:0,CO:0,COL:0,170:0,DM:0,DMA:0,212:0,DO:0,DOM:0,214:0,ET:0,ETH:0,231:0,GT:0,GTM:0,320:0,GU:0,GUM:0,316:0,HK:0,HKG:0,344:0,HN:0,HND:0,340:0,ID:0,IDN:0,360:0,IL:0,ISR:0,376:0,IN:0,IND:0,356:0,JM:0,JAM:0,388:0,JP:0,JPN:0,392:0,KE:0,KEN:0,404:0,KH:0,KHM:0,116:0,KR:0,KOR:0,410:0,LA:0,LA0:0,418:0,MH:0,MHL:0,584:0,MM:0,MMR:0,104:0,MO:0,MAC:0,446:0,MT:0,MLT:0,470:0,MX:0,MEX:0,484:0,MZ:0,MOZ:0,508:0,NI:0,NIC:0,558:0,NP:0,NPL:0,524:0,PA:0,PAN:0,591:0,PE:0,PER:0,604:0,PH:0,PHL:0,608:0,PK:0,PAK:0,586:0,PR:0,PRI:0,630:0,PT:0,PRT:0,620:0,PY:0,PRY:0,600:0,SA:0,SAU:0,682:0,SG:0,SGP:0,702:0,SV:0,SLV:0,222:0,TH:0,THA:0,764:0,TT:0,TTO:0,780:0,TW:0,TWN:0,158:0,UM:0,UMI:0,581:0,US:0,USA:0,840:0,VE:0,VEN:0,862:0,VI:0,VIR:0,850:0,WS:0,WSM:0,882:0,YE:0,YEM:0,887:0,ZA:0,ZAF:0,710:0,ZW:0,ZWE:0,716:0,AE:6,ARE:6,784:6,AF:6,AFG:6,4:6,BH:6,BHR:6,48:6,DJ:6,DJI:6,262:6,DZ:6,DZA:6,12:6,EG:6,EGY:6,818:6,IQ:6,IRQ:6,368:6,IR:6,IRN:6,364:6,JO:6,JOR:6,400:6,KW:6,KWT:6,414:6,LY:6,LBY:6,434:6,OM:6,OMN:6,512:6,QA:6,QAT:6,634:6,SD:6,SDN:6,729:6,SY:6,SYR:6,760:6,MV:5,MDV:5,462:5};function u(t){return function(t,e,n){if(t){var r,o=t.toLowerCase().split(/[-_]/),u=o[0],a=u;if(o[1]&&4===o[1].length?(a+="_"+o[1],r=o[2]):r=o[1],r||(r=e[a]||e[u]),r)return function(t,e){var n=e["string"==typeof t?t.toUpperCase():t];return"number"==typeof n?n:1}(r.match(/^\d+$/)?Number(r):r,n)}return 1}(t,r,o)}},56956:function(t,e,n){n.d(e,{Z:function(){return r}});n(94738),n(98214),n(46798),n(20254),n(51358),n(5239),n(98490);function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}}}]);
+//# sourceMappingURL=2415.9bL5uSrCfEk.js.map
\ No newline at end of file
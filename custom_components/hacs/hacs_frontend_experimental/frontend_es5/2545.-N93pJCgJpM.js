@@ -0,0 +1,3 @@
+/*! For license information please see 2545.-N93pJCgJpM.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2545],{7006:function(r,t,o){var e,i=o(88962),a=o(46097),n=o(33368),c=o(71650),s=o(68308),d=o(82390),l=o(69205),u=o(91808),h=o(34541),v=o(47838),f=(o(97393),o(34131),o(22129)),p=o(5095),b=o(95260);(0,u.Z)([(0,b.Mo)("ha-circular-progress")],(function(r,t){var o=function(t){function o(){var t;(0,c.Z)(this,o);for(var e=arguments.length,i=new Array(e),a=0;a<e;a++)i[a]=arguments[a];return t=(0,s.Z)(this,o,[].concat(i)),r((0,d.Z)(t)),t}return(0,l.Z)(o,t),(0,n.Z)(o)}(t);return{F:o,d:[{kind:"field",decorators:[(0,b.Cb)({attribute:"aria-label",type:String})],key:"ariaLabel",value:function(){return"Loading"}},{kind:"field",decorators:[(0,b.Cb)()],key:"size",value:function(){return"medium"}},{kind:"method",key:"updated",value:function(r){if((0,h.Z)((0,v.Z)(o.prototype),"updated",this).call(this,r),r.has("size"))switch(this.size){case"tiny":this.style.setProperty("--md-circular-progress-size","16px");break;case"small":this.style.setProperty("--md-circular-progress-size","28px");break;case"medium":this.style.setProperty("--md-circular-progress-size","48px");break;case"large":this.style.setProperty("--md-circular-progress-size","68px")}}},{kind:"get",static:!0,key:"styles",value:function(){return[].concat((0,a.Z)((0,h.Z)((0,v.Z)(o),"styles",this)),[(0,p.iv)(e||(e=(0,i.Z)([":host{--md-sys-color-primary:var(--primary-color);--md-circular-progress-size:48px}"])))])}}]}}),f.B)},33358:function(r,t,o){o.r(t),o.d(t,{HaIconButtonArrowPrev:function(){return f}});var e,i=o(88962),a=o(33368),n=o(71650),c=o(68308),s=o(82390),d=o(69205),l=o(91808),u=(o(97393),o(5095)),h=o(95260),v=o(67684),f=(o(54371),(0,l.Z)([(0,h.Mo)("ha-icon-button-arrow-prev")],(function(r,t){var o=function(t){function o(){var t;(0,n.Z)(this,o);for(var e=arguments.length,i=new Array(e),a=0;a<e;a++)i[a]=arguments[a];return t=(0,c.Z)(this,o,[].concat(i)),r((0,s.Z)(t)),t}return(0,d.Z)(o,t),(0,a.Z)(o)}(t);return{F:o,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.SB)()],key:"_icon",value:function(){return"rtl"===v.E.document.dir?"M4,11V13H16L10.5,18.5L11.92,19.92L19.84,12L11.92,4.08L10.5,5.5L16,11H4Z":"M20,11V13H8L13.5,18.5L12.08,19.92L4.16,12L12.08,4.08L13.5,5.5L8,11H20Z"}},{kind:"method",key:"render",value:function(){var r;return(0,u.dy)(e||(e=(0,i.Z)([' <ha-icon-button .disabled="','" .label="','" .path="','"></ha-icon-button> '])),this.disabled,this.label||(null===(r=this.hass)||void 0===r?void 0:r.localize("ui.common.back"))||"Back",this._icon)}}]}}),u.oi))},54371:function(r,t,o){o.r(t),o.d(t,{HaIconButton:function(){return y}});var e,i,a,n,c=o(88962),s=o(33368),d=o(71650),l=o(68308),u=o(82390),h=o(69205),v=o(91808),f=(o(97393),o(20210),o(5095)),p=o(95260),b=o(10694),y=(o(37662),(0,v.Z)([(0,p.Mo)("ha-icon-button")],(function(r,t){var o=function(t){function o(){var t;(0,d.Z)(this,o);for(var e=arguments.length,i=new Array(e),a=0;a<e;a++)i[a]=arguments[a];return t=(0,l.Z)(this,o,[].concat(i)),r((0,u.Z)(t)),t}return(0,h.Z)(o,t),(0,s.Z)(o)}(t);return{F:o,d:[{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:String})],key:"path",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:String})],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:String,attribute:"aria-haspopup"})],key:"ariaHasPopup",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"hideTitle",value:function(){return!1}},{kind:"field",decorators:[(0,p.IO)("mwc-icon-button",!0)],key:"_button",value:void 0},{kind:"method",key:"focus",value:function(){var r;null===(r=this._button)||void 0===r||r.focus()}},{kind:"field",static:!0,key:"shadowRootOptions",value:function(){return{mode:"open",delegatesFocus:!0}}},{kind:"method",key:"render",value:function(){return(0,f.dy)(e||(e=(0,c.Z)([' <mwc-icon-button aria-label="','" title="','" aria-haspopup="','" .disabled="','"> '," </mwc-icon-button> "])),(0,b.o)(this.label),(0,b.o)(this.hideTitle?void 0:this.label),(0,b.o)(this.ariaHasPopup),this.disabled,this.path?(0,f.dy)(i||(i=(0,c.Z)(['<ha-svg-icon .path="','"></ha-svg-icon>'])),this.path):(0,f.dy)(a||(a=(0,c.Z)(["<slot></slot>"]))))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,f.iv)(n||(n=(0,c.Z)([":host{display:inline-block;outline:0}:host([disabled]){pointer-events:none}mwc-icon-button{--mdc-theme-on-primary:currentColor;--mdc-theme-text-disabled-on-light:var(--disabled-text-color)}"])))}}]}}),f.oi))},73957:function(r,t,o){var e,i,a,n=o(88962),c=o(33368),s=o(71650),d=o(68308),l=o(82390),u=o(69205),h=o(91808),v=o(34541),f=o(47838),p=(o(97393),o(76843),o(51467),o(5095)),b=o(95260),y=o(18394),k=(o(65974),o(85717),o(10733),function(){function r(){(0,s.Z)(this,r),this.notifications=void 0,this.notifications={}}return(0,c.Z)(r,[{key:"processMessage",value:function(r){if("removed"===r.type)for(var t=0,o=Object.keys(r.notifications);t<o.length;t++){var e=o[t];delete this.notifications[e]}else this.notifications=Object.assign(Object.assign({},this.notifications),r.notifications);return Object.values(this.notifications)}}]),r}());o(54371),(0,h.Z)([(0,b.Mo)("ha-menu-button")],(function(r,t){var o=function(t){function o(){var t;(0,s.Z)(this,o);for(var e=arguments.length,i=new Array(e),a=0;a<e;a++)i[a]=arguments[a];return t=(0,d.Z)(this,o,[].concat(i)),r((0,l.Z)(t)),t}return(0,u.Z)(o,t),(0,c.Z)(o)}(t);return{F:o,d:[{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"hassio",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,b.SB)()],key:"_hasNotifications",value:function(){return!1}},{kind:"field",decorators:[(0,b.SB)()],key:"_show",value:function(){return!1}},{kind:"field",key:"_alwaysVisible",value:function(){return!1}},{kind:"field",key:"_attachNotifOnConnect",value:function(){return!1}},{kind:"field",key:"_unsubNotifications",value:void 0},{kind:"method",key:"connectedCallback",value:function(){(0,v.Z)((0,f.Z)(o.prototype),"connectedCallback",this).call(this),this._attachNotifOnConnect&&(this._attachNotifOnConnect=!1,this._subscribeNotifications())}},{kind:"method",key:"disconnectedCallback",value:function(){(0,v.Z)((0,f.Z)(o.prototype),"disconnectedCallback",this).call(this),this._unsubNotifications&&(this._attachNotifOnConnect=!0,this._unsubNotifications(),this._unsubNotifications=void 0)}},{kind:"method",key:"render",value:function(){if(!this._show)return p.Ld;var r=this._hasNotifications&&(this.narrow||"always_hidden"===this.hass.dockedSidebar);return(0,p.dy)(e||(e=(0,n.Z)([' <ha-icon-button .label="','" .path="','" @click="','"></ha-icon-button> '," "])),this.hass.localize("ui.sidebar.sidebar_toggle"),"M3,6H21V8H3V6M3,11H21V13H3V11M3,16H21V18H3V16Z",this._toggleMenu,r?(0,p.dy)(i||(i=(0,n.Z)(['<div class="dot"></div>']))):"")}},{kind:"method",key:"firstUpdated",value:function(r){(0,v.Z)((0,f.Z)(o.prototype),"firstUpdated",this).call(this,r),this.hassio&&(this._alwaysVisible=(Number(window.parent.frontendVersion)||0)<20190710)}},{kind:"method",key:"willUpdate",value:function(r){if((0,v.Z)((0,f.Z)(o.prototype),"willUpdate",this).call(this,r),r.has("narrow")||r.has("hass")){var t=r.has("hass")?r.get("hass"):this.hass,e=(r.has("narrow")?r.get("narrow"):this.narrow)||"always_hidden"===(null==t?void 0:t.dockedSidebar),i=this.narrow||"always_hidden"===this.hass.dockedSidebar;this.hasUpdated&&e===i||(this._show=i||this._alwaysVisible,i?this._subscribeNotifications():this._unsubNotifications&&(this._unsubNotifications(),this._unsubNotifications=void 0))}}},{kind:"method",key:"_subscribeNotifications",value:function(){var r,t,o,e,i=this;if(this._unsubNotifications)throw new Error("Already subscribed");this._unsubNotifications=(r=this.hass.connection,t=function(r){i._hasNotifications=r.length>0},o=new k,e=r.subscribeMessage((function(r){return t(o.processMessage(r))}),{type:"persistent_notification/subscribe"}),function(){e.then((function(r){return null==r?void 0:r()}))})}},{kind:"method",key:"_toggleMenu",value:function(){(0,y.B)(this,"hass-toggle-menu")}},{kind:"get",static:!0,key:"styles",value:function(){return(0,p.iv)(a||(a=(0,n.Z)([":host{position:relative}.dot{pointer-events:none;position:absolute;background-color:var(--accent-color);width:12px;height:12px;top:9px;right:7px;border-radius:50%;border:2px solid var(--app-header-background-color)}"])))}}]}}),p.oi)},37662:function(r,t,o){o.r(t),o.d(t,{HaSvgIcon:function(){return b}});var e,i,a,n,c=o(88962),s=o(33368),d=o(71650),l=o(68308),u=o(82390),h=o(69205),v=o(91808),f=(o(97393),o(5095)),p=o(95260),b=(0,v.Z)([(0,p.Mo)("ha-svg-icon")],(function(r,t){var o=function(t){function o(){var t;(0,d.Z)(this,o);for(var e=arguments.length,i=new Array(e),a=0;a<e;a++)i[a]=arguments[a];return t=(0,l.Z)(this,o,[].concat(i)),r((0,u.Z)(t)),t}return(0,h.Z)(o,t),(0,s.Z)(o)}(t);return{F:o,d:[{kind:"field",decorators:[(0,p.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"secondaryPath",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"viewBox",value:void 0},{kind:"method",key:"render",value:function(){return(0,f.YP)(e||(e=(0,c.Z)([' <svg viewBox="','" preserveAspectRatio="xMidYMid meet" focusable="false" role="img" aria-hidden="true"> <g> '," "," </g> </svg>"])),this.viewBox||"0 0 24 24",this.path?(0,f.YP)(i||(i=(0,c.Z)(['<path class="primary-path" d="','"></path>'])),this.path):f.Ld,this.secondaryPath?(0,f.YP)(a||(a=(0,c.Z)(['<path class="secondary-path" d="','"></path>'])),this.secondaryPath):f.Ld)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,f.iv)(n||(n=(0,c.Z)([":host{display:var(--ha-icon-display,inline-flex);align-items:center;justify-content:center;position:relative;vertical-align:middle;fill:var(--icon-primary-color,currentcolor);width:var(--mdc-icon-size,24px);height:var(--mdc-icon-size,24px)}svg{width:100%;height:100%;pointer-events:none;display:block}path.primary-path{opacity:var(--icon-primary-opactity, 1)}path.secondary-path{fill:var(--icon-secondary-color,currentcolor);opacity:var(--icon-secondary-opactity, .5)}"])))}}]}}),f.oi)},84776:function(r,t,o){o.r(t);var e,i,a,n,c,s,d=o(88962),l=o(33368),u=o(71650),h=o(68308),v=o(82390),f=o(69205),p=o(91808),b=(o(97393),o(5095)),y=o(95260),k=(o(7006),o(33358),o(73957),o(29950));(0,p.Z)([(0,y.Mo)("hass-loading-screen")],(function(r,t){var o=function(t){function o(){var t;(0,u.Z)(this,o);for(var e=arguments.length,i=new Array(e),a=0;a<e;a++)i[a]=arguments[a];return t=(0,h.Z)(this,o,[].concat(i)),r((0,v.Z)(t)),t}return(0,f.Z)(o,t),(0,l.Z)(o)}(t);return{F:o,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean,attribute:"no-toolbar"})],key:"noToolbar",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"rootnav",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)()],key:"message",value:void 0},{kind:"method",key:"render",value:function(){var r;return(0,b.dy)(e||(e=(0,d.Z)([" ",' <div class="content"> <ha-circular-progress indeterminate></ha-circular-progress> '," </div> "])),this.noToolbar?"":(0,b.dy)(i||(i=(0,d.Z)(['<div class="toolbar"> '," </div>"])),this.rootnav||null!==(r=history.state)&&void 0!==r&&r.root?(0,b.dy)(a||(a=(0,d.Z)([' <ha-menu-button .hass="','" .narrow="','"></ha-menu-button> '])),this.hass,this.narrow):(0,b.dy)(n||(n=(0,d.Z)([' <ha-icon-button-arrow-prev .hass="','" @click="','"></ha-icon-button-arrow-prev> '])),this.hass,this._handleBack)),this.message?(0,b.dy)(c||(c=(0,d.Z)(['<div id="loading-text">',"</div>"])),this.message):b.Ld)}},{kind:"method",key:"_handleBack",value:function(){history.back()}},{kind:"get",static:!0,key:"styles",value:function(){return[k.Qx,(0,b.iv)(s||(s=(0,d.Z)([":host{display:block;height:100%;background-color:var(--primary-background-color)}.toolbar{display:flex;align-items:center;font-size:20px;height:var(--header-height);padding:8px 12px;pointer-events:none;background-color:var(--app-header-background-color);font-weight:400;color:var(--app-header-text-color,#fff);border-bottom:var(--app-header-border-bottom,none);box-sizing:border-box}@media (max-width:599px){.toolbar{padding:4px}}ha-icon-button-arrow-prev,ha-menu-button{pointer-events:auto}.content{height:calc(100% - var(--header-height));display:flex;flex-direction:column;align-items:center;justify-content:center}#loading-text{max-width:350px;margin-top:16px}"])))]}}]}}),b.oi)},39860:function(r,t,o){var e=o(68360).match(/firefox\/(\d+)/i);r.exports=!!e&&+e[1]},93712:function(r,t,o){var e=o(68360);r.exports=/MSIE|Trident/.test(e)},82803:function(r,t,o){var e=o(68360).match(/AppleWebKit\/(\d+)\./);r.exports=!!e&&+e[1]},24038:function(r,t,o){var e=o(13089);r.exports=function(r){try{if(e)return Function('return require("'+r+'")')()}catch(t){}}},37313:function(r,t,o){var e=o(68077),i=o(55418),a=o(9160),n=o(19480),c=o(10228),s=o(35102),d=o(11336),l=o(18431),u=o(8273),h=o(54053),v=o(39860),f=o(93712),p=o(91625),b=o(82803),y=[],k=i(y.sort),m=i(y.push),g=l((function(){y.sort(void 0)})),Z=l((function(){y.sort(null)})),_=h("sort"),w=!l((function(){if(p)return p<70;if(!(v&&v>3)){if(f)return!0;if(b)return b<603;var r,t,o,e,i="";for(r=65;r<76;r++){switch(t=String.fromCharCode(r),r){case 66:case 69:case 70:case 72:o=3;break;case 68:case 71:o=4;break;default:o=2}for(e=0;e<47;e++)y.push({k:t+e,v:o})}for(y.sort((function(r,t){return t.v-r.v})),e=0;e<y.length;e++)t=y[e].k.charAt(0),i.charAt(i.length-1)!==t&&(i+=t);return"DGBEFHACIJK"!==i}}));e({target:"Array",proto:!0,forced:g||!Z||!_||!w},{sort:function(r){void 0!==r&&a(r);var t=n(this);if(w)return void 0===r?k(t):k(t,r);var o,e,i=[],l=c(t);for(e=0;e<l;e++)e in t&&m(i,t[e]);for(u(i,function(r){return function(t,o){return void 0===o?-1:void 0===t?1:void 0!==r?+r(t,o)||0:d(t)>d(o)?1:-1}}(r)),o=c(i),e=0;e<o;)t[e]=i[e++];for(;e<l;)s(t,e++);return t}})},37792:function(r,t,o){var e=o(68077),i=o(38475),a=o(70276).onFreeze,n=o(91452),c=o(18431),s=Object.seal;e({target:"Object",stat:!0,forced:c((function(){s(1)})),sham:!n},{seal:function(r){return s&&i(r)?s(a(r)):r}})},22129:function(r,t,o){o.d(t,{B:function(){return g}});var e,i,a,n=o(33368),c=o(71650),s=o(68308),d=o(69205),l=o(43204),u=o(95260),h=o(88962),v=o(5095),f=(o(76843),o(53180)),p=o(6157),b=function(r){function t(){var r;return(0,c.Z)(this,t),(r=(0,s.Z)(this,t,arguments)).value=0,r.max=1,r.indeterminate=!1,r.fourColor=!1,r}return(0,d.Z)(t,r),(0,n.Z)(t,[{key:"render",value:function(){var r=this.ariaLabel;return(0,v.dy)(e||(e=(0,h.Z)([' <div class="progress ','" role="progressbar" aria-label="','" aria-valuemin="0" aria-valuemax="','" aria-valuenow="','">',"</div> "])),(0,f.$)(this.getRenderClasses()),r||v.Ld,this.max,this.indeterminate?v.Ld:this.value,this.renderIndicator())}},{key:"getRenderClasses",value:function(){return{indeterminate:this.indeterminate,"four-color":this.fourColor}}}]),t}(v.oi);(0,p.d)(b),(0,l.__decorate)([(0,u.Cb)({type:Number})],b.prototype,"value",void 0),(0,l.__decorate)([(0,u.Cb)({type:Number})],b.prototype,"max",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean})],b.prototype,"indeterminate",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean,attribute:"four-color"})],b.prototype,"fourColor",void 0);var y,k=function(r){function t(){return(0,c.Z)(this,t),(0,s.Z)(this,t,arguments)}return(0,d.Z)(t,r),(0,n.Z)(t,[{key:"renderIndicator",value:function(){return this.indeterminate?this.renderIndeterminateContainer():this.renderDeterminateContainer()}},{key:"renderDeterminateContainer",value:function(){var r=100*(1-this.value/this.max);return(0,v.dy)(i||(i=(0,h.Z)([' <svg viewBox="0 0 4800 4800"> <circle class="track" pathLength="100"></circle> <circle class="active-track" pathLength="100" stroke-dashoffset="','"></circle> </svg> '])),r)}},{key:"renderIndeterminateContainer",value:function(){return(0,v.dy)(a||(a=(0,h.Z)([' <div class="spinner"> <div class="left"> <div class="circle"></div> </div> <div class="right"> <div class="circle"></div> </div> </div>'])))}}]),t}(b),m=(0,v.iv)(y||(y=(0,h.Z)([":host{--_active-indicator-color:var(--md-circular-progress-active-indicator-color, var(--md-sys-color-primary, #6750a4));--_active-indicator-width:var(--md-circular-progress-active-indicator-width, 10);--_four-color-active-indicator-four-color:var(--md-circular-progress-four-color-active-indicator-four-color, var(--md-sys-color-tertiary-container, #ffd8e4));--_four-color-active-indicator-one-color:var(--md-circular-progress-four-color-active-indicator-one-color, var(--md-sys-color-primary, #6750a4));--_four-color-active-indicator-three-color:var(--md-circular-progress-four-color-active-indicator-three-color, var(--md-sys-color-tertiary, #7d5260));--_four-color-active-indicator-two-color:var(--md-circular-progress-four-color-active-indicator-two-color, var(--md-sys-color-primary-container, #eaddff));--_size:var(--md-circular-progress-size, 48px);display:inline-flex;vertical-align:middle;width:var(--_size);height:var(--_size);position:relative;align-items:center;justify-content:center;contain:strict;content-visibility:auto}.progress{flex:1;align-self:stretch;margin:4px}.active-track,.circle,.left,.progress,.right,.spinner,.track,svg{position:absolute;inset:0}svg{transform:rotate(-90deg)}circle{cx:50%;cy:50%;r:calc(50%*(1 - var(--_active-indicator-width)/ 100));stroke-width:calc(var(--_active-indicator-width)*1%);stroke-dasharray:100;fill:rgba(0,0,0,0)}.active-track{transition:stroke-dashoffset .5s cubic-bezier(0, 0, .2, 1);stroke:var(--_active-indicator-color)}.track{stroke:rgba(0,0,0,0)}.progress.indeterminate{animation:linear infinite linear-rotate;animation-duration:1.568s}.spinner{animation:infinite both rotate-arc;animation-duration:5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.left{overflow:hidden;inset:0 50% 0 0}.right{overflow:hidden;inset:0 0 0 50%}.circle{box-sizing:border-box;border-radius:50%;border:solid calc(var(--_active-indicator-width)/ 100*(var(--_size) - 8px));border-color:var(--_active-indicator-color) var(--_active-indicator-color) transparent transparent;animation:expand-arc;animation-iteration-count:infinite;animation-fill-mode:both;animation-duration:1333ms,5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.four-color .circle{animation-name:expand-arc,four-color}.left .circle{rotate:135deg;inset:0 -100% 0 0}.right .circle{rotate:100deg;inset:0 0 0 -100%;animation-delay:-.666s,0s}@media(forced-colors:active){.active-track{stroke:CanvasText}.circle{border-color:CanvasText CanvasText Canvas Canvas}}@keyframes expand-arc{0%{transform:rotate(265deg)}50%{transform:rotate(130deg)}100%{transform:rotate(265deg)}}@keyframes rotate-arc{12.5%{transform:rotate(135deg)}25%{transform:rotate(270deg)}37.5%{transform:rotate(405deg)}50%{transform:rotate(540deg)}62.5%{transform:rotate(675deg)}75%{transform:rotate(810deg)}87.5%{transform:rotate(945deg)}100%{transform:rotate(1080deg)}}@keyframes linear-rotate{to{transform:rotate(360deg)}}@keyframes four-color{0%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}15%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}25%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}40%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}50%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}65%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}75%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}90%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}100%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}}"]))),g=function(r){function t(){return(0,c.Z)(this,t),(0,s.Z)(this,t,arguments)}return(0,d.Z)(t,r),(0,n.Z)(t)}(k);g.styles=[m],g=(0,l.__decorate)([(0,u.Mo)("md-circular-progress")],g)}}]);
+//# sourceMappingURL=2545.-N93pJCgJpM.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 2552.6r_MrwUQ99U.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2552],{18007:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,r=(t=o().mark((function t(r,i){var a,c,u,s,l,h;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{Bt:function(){return h}}),n(40271),n(56308),a=n(22075),c=n(35137),u=n(23216),!(s=r([u])).then){t.next=17;break}return t.next=13,s;case 13:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=18;break;case 17:t.t0=s;case 18:u=t.t0[0],l=["sunday","monday","tuesday","wednesday","thursday","friday","saturday"],h=function(t){return t.first_weekday===c.FS.language?"weekInfo"in Intl.Locale.prototype?new Intl.Locale(t.language).weekInfo.firstDay%7:(0,a.L)(t.language)%7:l.includes(t.first_weekday)?l.indexOf(t.first_weekday):1},i(),t.next=28;break;case 25:t.prev=25,t.t2=t.catch(0),i(t.t2);case 28:case"end":return t.stop()}}),t,null,[[0,25]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},41090:function(t,e,n){n.d(e,{L:function(){return r},p:function(){return o}});var r={device:"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z",and:"M4.4,16.5C4.4,15.6 4.7,14.7 5.2,13.9C5.7,13.1 6.7,12.2 8.2,11.2C7.3,10.1 6.8,9.3 6.5,8.7C6.1,8 6,7.4 6,6.7C6,5.2 6.4,4.1 7.3,3.2C8.2,2.3 9.4,2 10.9,2C12.2,2 13.3,2.4 14.2,3.2C15.1,4 15.5,5 15.5,6.1C15.5,6.9 15.3,7.6 14.9,8.3C14.5,9 13.8,9.7 12.8,10.4L11.4,11.5L15.7,16.7C16.3,15.5 16.6,14.3 16.6,12.8H18.8C18.8,15.1 18.3,17 17.2,18.5L20,21.8H17L15.7,20.3C15,20.9 14.3,21.3 13.4,21.6C12.5,21.9 11.6,22.1 10.7,22.1C8.8,22.1 7.3,21.6 6.1,20.6C5,19.5 4.4,18.2 4.4,16.5M10.7,20C12,20 13.2,19.5 14.3,18.5L9.6,12.8L9.2,13.1C7.7,14.2 7,15.3 7,16.5C7,17.6 7.3,18.4 8,19C8.7,19.6 9.5,20 10.7,20M8.5,6.7C8.5,7.6 9,8.6 10.1,9.9L11.7,8.8C12.3,8.4 12.7,8 12.9,7.6C13.1,7.2 13.2,6.7 13.2,6.2C13.2,5.6 13,5.1 12.5,4.7C12.1,4.3 11.5,4.1 10.8,4.1C10.1,4.1 9.5,4.3 9.1,4.8C8.7,5.3 8.5,5.9 8.5,6.7Z",or:"M2,4C5,10 5,14 2,20H8C13,20 19,16 22,12C19,8 13,4 8,4H2M5,6H8C11.5,6 16.3,9 19.3,12C16.3,15 11.5,18 8,18H5C6.4,13.9 6.4,10.1 5,6Z",not:"M14.08,4.61L15.92,5.4L14.8,8H19V10H13.95L12.23,14H19V16H11.38L9.92,19.4L8.08,18.61L9.2,16H5V14H10.06L11.77,10H5V8H12.63L14.08,4.61Z",state:"M6.27 17.05C6.72 17.58 7 18.25 7 19C7 20.66 5.66 22 4 22S1 20.66 1 19 2.34 16 4 16C4.18 16 4.36 16 4.53 16.05L7.6 10.69L5.86 9.7L9.95 8.58L11.07 12.67L9.33 11.68L6.27 17.05M20 16C18.7 16 17.6 16.84 17.18 18H11V16L8 19L11 22V20H17.18C17.6 21.16 18.7 22 20 22C21.66 22 23 20.66 23 19S21.66 16 20 16M12 8C12.18 8 12.36 8 12.53 7.95L15.6 13.31L13.86 14.3L17.95 15.42L19.07 11.33L17.33 12.32L14.27 6.95C14.72 6.42 15 5.75 15 5C15 3.34 13.66 2 12 2S9 3.34 9 5 10.34 8 12 8Z",numeric_state:"M4,17V9H2V7H6V17H4M22,15C22,16.11 21.1,17 20,17H16V15H20V13H18V11H20V9H16V7H20A2,2 0 0,1 22,9V10.5A1.5,1.5 0 0,1 20.5,12A1.5,1.5 0 0,1 22,13.5V15M14,15V17H8V13C8,11.89 8.9,11 10,11H12V9H8V7H12A2,2 0 0,1 14,9V11C14,12.11 13.1,13 12,13H10V15H14Z",sun:"M12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,2L14.39,5.42C13.65,5.15 12.84,5 12,5C11.16,5 10.35,5.15 9.61,5.42L12,2M3.34,7L7.5,6.65C6.9,7.16 6.36,7.78 5.94,8.5C5.5,9.24 5.25,10 5.11,10.79L3.34,7M3.36,17L5.12,13.23C5.26,14 5.53,14.78 5.95,15.5C6.37,16.24 6.91,16.86 7.5,17.37L3.36,17M20.65,7L18.88,10.79C18.74,10 18.47,9.23 18.05,8.5C17.63,7.78 17.1,7.15 16.5,6.64L20.65,7M20.64,17L16.5,17.36C17.09,16.85 17.62,16.22 18.04,15.5C18.46,14.77 18.73,14 18.87,13.21L20.64,17M12,22L9.59,18.56C10.33,18.83 11.14,19 12,19C12.82,19 13.63,18.83 14.37,18.56L12,22Z",template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",time:"M12,20A8,8 0 0,0 20,12A8,8 0 0,0 12,4A8,8 0 0,0 4,12A8,8 0 0,0 12,20M12,2A10,10 0 0,1 22,12A10,10 0 0,1 12,22C6.47,22 2,17.5 2,12A10,10 0 0,1 12,2M12.5,7V12.25L17,14.92L16.25,16.15L11,13V7H12.5Z",trigger:"M10 7V9H9V15H10V17H6V15H7V9H6V7H10M16 7C17.11 7 18 7.9 18 9V15C18 16.11 17.11 17 16 17H12V7M16 9H14V15H16V9Z",zone:"M12,2C15.31,2 18,4.66 18,7.95C18,12.41 12,19 12,19C12,19 6,12.41 6,7.95C6,4.66 8.69,2 12,2M12,6A2,2 0 0,0 10,8A2,2 0 0,0 12,10A2,2 0 0,0 14,8A2,2 0 0,0 12,6M20,19C20,21.21 16.42,23 12,23C7.58,23 4,21.21 4,19C4,17.71 5.22,16.56 7.11,15.83L7.75,16.74C6.67,17.19 6,17.81 6,18.5C6,19.88 8.69,21 12,21C15.31,21 18,19.88 18,18.5C18,17.81 17.33,17.19 16.25,16.74L16.89,15.83C18.78,16.56 20,17.71 20,19Z"},o={device:{},entity:{icon:"M11,13.5V21.5H3V13.5H11M12,2L17.5,11H6.5L12,2M17.5,13C20,13 22,15 22,17.5C22,20 20,22 17.5,22C15,22 13,20 13,17.5C13,15 15,13 17.5,13Z",members:{state:{},numeric_state:{}}},time_location:{icon:"M15,12H16.5V16.25L19.36,17.94L18.61,19.16L15,17V12M23,16A7,7 0 0,1 16,23C13,23 10.4,21.08 9.42,18.4L8,17.9L2.66,19.97L2.5,20A0.5,0.5 0 0,1 2,19.5V4.38C2,4.15 2.15,3.97 2.36,3.9L8,2L14,4.1L19.34,2H19.5A0.5,0.5 0 0,1 20,2.5V10.25C21.81,11.5 23,13.62 23,16M9,16C9,12.83 11.11,10.15 14,9.29V6.11L8,4V15.89L9,16.24C9,16.16 9,16.08 9,16M16,11A5,5 0 0,0 11,16A5,5 0 0,0 16,21A5,5 0 0,0 21,16A5,5 0 0,0 16,11Z",members:{sun:{},time:{},zone:{}}},building_blocks:{icon:"M18.5 18.5C19.04 18.5 19.5 18.96 19.5 19.5S19.04 20.5 18.5 20.5H6.5C5.96 20.5 5.5 20.04 5.5 19.5S5.96 18.5 6.5 18.5H18.5M18.5 17H6.5C5.13 17 4 18.13 4 19.5S5.13 22 6.5 22H18.5C19.88 22 21 20.88 21 19.5S19.88 17 18.5 17M21 11H18V7H13L10 11V16H22L21 11M11.54 11L13.5 8.5H16V11H11.54M9.76 3.41L4.76 2L2 11.83C1.66 13.11 2.41 14.44 3.7 14.8L4.86 15.12L8.15 12.29L4.27 11.21L6.15 4.46L8.94 5.24C9.5 5.53 10.71 6.34 11.47 7.37L12.5 6H12.94C11.68 4.41 9.85 3.46 9.76 3.41Z",members:{and:{},or:{},not:{}}},other:{icon:"M16,12A2,2 0 0,1 18,10A2,2 0 0,1 20,12A2,2 0 0,1 18,14A2,2 0 0,1 16,12M10,12A2,2 0 0,1 12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12M4,12A2,2 0 0,1 6,10A2,2 0 0,1 8,12A2,2 0 0,1 6,14A2,2 0 0,1 4,12Z",members:{template:{},trigger:{}}}}},38514:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,o,i,a,c=[],u=!0,s=!1;try{if(i=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(c.push(r.value),c.length!==e);u=!0);}catch(t){s=!0,o=t}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(s)throw o}}return c}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);"Object"===n&&t.constructor&&(n=t.constructor.name);if("Map"===n||"Set"===n)return Array.from(t);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function c(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var a,c,u,s,l,h,d,f,p,v,y,m,g,b,w,_,k,L,x,E,C,A,Z,O,M,j;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,a=n(88962),c=n(33368),u=n(71650),s=n(68308),l=n(82390),h=n(69205),d=n(91808),n(97393),n(85717),f=n(5095),p=n(95260),v=n(14516),y=n(17267),m=n(18394),n(80392),g=n(19418),b=n(29950),w=n(57433),n(85027),_=n(32825),n(76898),k=n(97326),n(67905),n(50002),L=n(37127),x=n(8471),n(53685),n(6689),!(E=e([w,_,k,L,x])).then){t.next=39;break}return t.next=35,E;case 35:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=40;break;case 39:t.t0=E;case 40:C=t.t0,A=i(C,5),w=A[0],_=A[1],k=A[2],L=A[3],x=A[4],(0,d.Z)([(0,p.Mo)("ha-automation-condition-editor")],(function(t,e){var n=function(e){function n(){var e;(0,u.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,s.Z)(this,n,[].concat(o)),t((0,l.Z)(e)),e}return(0,h.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"yamlMode",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)()],key:"path",value:void 0},{kind:"field",key:"_processedCondition",value:function(){return(0,v.Z)((function(t){return(0,g.Gd)(t)}))}},{kind:"method",key:"render",value:function(){var t=this._processedCondition(this.condition),e=void 0!==customElements.get("ha-automation-condition-".concat(t.condition)),n=this.yamlMode||!e;return(0,f.dy)(Z||(Z=(0,a.Z)([" "," "])),n?(0,f.dy)(O||(O=(0,a.Z)([" ",' <ha-yaml-editor .hass="','" .defaultValue="','" @value-changed="','" .readOnly="','"></ha-yaml-editor> '])),e?"":(0,f.dy)(M||(M=(0,a.Z)([" "," "])),this.hass.localize("ui.panel.config.automation.editor.conditions.unsupported_condition",{condition:t.condition})),this.hass,this.condition,this._onYamlChange,this.disabled):(0,f.dy)(j||(j=(0,a.Z)([' <div @value-changed="','"> '," </div> "])),this._onUiChanged,(0,y.h)("ha-automation-condition-".concat(t.condition),{hass:this.hass,condition:t,disabled:this.disabled,path:this.path})))}},{kind:"method",key:"_onYamlChange",value:function(t){t.stopPropagation(),t.detail.isValid&&(0,m.B)(this,"value-changed",{value:t.detail.value,yaml:!0})}},{kind:"method",key:"_onUiChanged",value:function(t){t.stopPropagation();var e=Object.assign(Object.assign({},this.condition.alias?{alias:this.condition.alias}:{}),t.detail.value);(0,m.B)(this,"value-changed",{value:e})}},{kind:"field",static:!0,key:"styles",value:function(){return b.Qx}}]}}),f.oi),r(),t.next=54;break;case 51:t.prev=51,t.t2=t.catch(0),r(t.t2);case 54:case"end":return t.stop()}}),t,null,[[0,51]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var i=t.apply(e,n);function a(t){c(i,r,o,a,u,"next",t)}function u(t){c(i,r,o,a,u,"throw",t)}a(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},96925:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,o,i,a,c=[],u=!0,s=!1;try{if(i=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(c.push(r.value),c.length!==e);u=!0);}catch(t){s=!0,o=t}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(s)throw o}}return c}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);"Object"===n&&t.constructor&&(n=t.constructor.name);if("Map"===n||"Set"===n)return Array.from(t);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function c(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,r=(t=o().mark((function t(r,a){var c,u,s,l,h,d,f,p,v,y,m,g,b,w,_,k,L,x,E,C,A,Z,O,M,j,H,S,V,P,N,T,I,G,B,F,z,R,D,Y,K,W,U,q;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{a:function(){return q}}),c=n(99312),u=n(81043),s=n(88962),l=n(33368),h=n(71650),d=n(68308),f=n(82390),p=n(69205),v=n(91808),y=n(93359),n(22859),n(85717),n(97393),n(46349),n(70320),m=n(98830),n(44577),g=n(3239),b=n(5095),w=n(95260),_=n(53180),k=n(3747),L=n(18394),x=n(930),E=n(92482),n(85878),n(68336),n(31360),n(54371),C=n(19418),A=n(44553),Z=n(41090),O=n(59449),M=n(38149),j=n(11285),H=n(29950),S=n(38514),V=n(77251),!(P=r([A,S])).then){t.next=53;break}return t.next=49,P;case 49:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=54;break;case 53:t.t0=P;case 54:N=t.t0,T=i(N,2),A=T[0],S=T[1],W="M21,7L9,19L3.5,13.5L4.91,12.09L9,16.17L19.59,5.59L21,7Z",U=function(t){return t.preventDefault()},q=function(t,e){var n,r,o;e.stopPropagation();var i=null===(n=e.currentTarget)||void 0===n?void 0:n.name;if(i){var a,c=(null===(r=e.detail)||void 0===r?void 0:r.value)||(null===(o=e.currentTarget)||void 0===o?void 0:o.value);(t.condition[i]||"")!==c&&(c?a=Object.assign(Object.assign({},t.condition),{},(0,y.Z)({},i,c)):delete(a=Object.assign({},t.condition))[i],(0,L.B)(t,"value-changed",{value:a}))}},(0,v.Z)([(0,w.Mo)("ha-automation-condition-row")],(function(t,e){var n,r,o,i=function(e){function n(){var e;(0,h.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,d.Z)(this,n,[].concat(o)),t((0,f.Z)(e)),e}return(0,p.Z)(n,e),(0,l.Z)(n)}(e);return{F:i,d:[{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"condition",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"hideMenu",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,k.t)({key:"automationClipboard",state:!1,subscribe:!0,storage:"sessionStorage"})],key:"_clipboard",value:void 0},{kind:"field",decorators:[(0,w.SB)()],key:"_yamlMode",value:function(){return!1}},{kind:"field",decorators:[(0,w.SB)()],key:"_warnings",value:void 0},{kind:"field",decorators:[(0,w.SB)()],key:"_testing",value:function(){return!1}},{kind:"field",decorators:[(0,w.SB)()],key:"_testingResult",value:void 0},{kind:"field",decorators:[(0,w.SB)(),(0,m.F_)({context:M.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",decorators:[(0,w.SB)(),(0,m.F_)({context:V.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"method",key:"render",value:function(){if(!this.condition)return b.Ld;var t=void 0===this._reorderMode;return(0,b.dy)(I||(I=(0,s.Z)([" <ha-card outlined> ",' <ha-expansion-panel leftChevron> <h3 slot="header"> <ha-svg-icon class="condition-icon" .path="','"></ha-svg-icon> ',' </h3> <slot name="icons" slot="icons"></slot> ',' <div class="','"> ',' <ha-automation-condition-editor @ui-mode-not-available="','" @value-changed="','" .yamlMode="','" .disabled="','" .hass="','" .condition="','" .path="','"></ha-automation-condition-editor> </div> </ha-expansion-panel> <div class="testing ','"> '," </div> </ha-card> "])),!1===this.condition.enabled?(0,b.dy)(G||(G=(0,s.Z)(['<div class="disabled-bar"> '," </div>"])),this.hass.localize("ui.panel.config.automation.editor.actions.disabled")):"",Z.L[this.condition.condition],(0,x.f)((0,A.m)(this.condition,this.hass,this._entityReg)),this.hideMenu?"":(0,b.dy)(B||(B=(0,s.Z)([' <ha-button-menu slot="icons" @action="','" @click="','" fixed> <ha-icon-button slot="trigger" .label="','" .path="','"> </ha-icon-button> <mwc-list-item graphic="icon"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','" class="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon"> '," ",' </mwc-list-item> <mwc-list-item graphic="icon"> '," ",' </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item class="warning" graphic="icon" .disabled="','"> ',' <ha-svg-icon class="warning" slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> </ha-button-menu> '])),this._handleAction,U,this.hass.localize("ui.common.menu"),"M12,16A2,2 0 0,1 14,18A2,2 0 0,1 12,20A2,2 0 0,1 10,18A2,2 0 0,1 12,16M12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12A2,2 0 0,1 12,10M12,4A2,2 0 0,1 14,6A2,2 0 0,1 12,8A2,2 0 0,1 10,6A2,2 0 0,1 12,4Z",this.hass.localize("ui.panel.config.automation.editor.conditions.test"),"M6,22A3,3 0 0,1 3,19C3,18.4 3.18,17.84 3.5,17.37L9,7.81V6A1,1 0 0,1 8,5V4A2,2 0 0,1 10,2H14A2,2 0 0,1 16,4V5A1,1 0 0,1 15,6V7.81L20.5,17.37C20.82,17.84 21,18.4 21,19A3,3 0 0,1 18,22H6M5,19A1,1 0 0,0 6,20H18A1,1 0 0,0 19,19C19,18.79 18.93,18.59 18.82,18.43L16.53,14.47L14,17L8.93,11.93L5.18,18.43C5.07,18.59 5,18.79 5,19M13,10A1,1 0 0,0 12,11A1,1 0 0,0 13,12A1,1 0 0,0 14,11A1,1 0 0,0 13,10Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.conditions.rename"),"M18,17H10.5L12.5,15H18M6,17V14.5L13.88,6.65C14.07,6.45 14.39,6.45 14.59,6.65L16.35,8.41C16.55,8.61 16.55,8.92 16.35,9.12L8.47,17M19,3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3Z",this.disabled,(0,_.$)({hidden:t}),this.hass.localize("ui.panel.config.automation.editor.conditions.re_order"),"M18 21L14 17H17V7H14L18 3L22 7H19V17H22M2 19V17H12V19M2 13V11H9V13M2 7V5H6V7H2Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.duplicate"),"M11,17H4A2,2 0 0,1 2,15V3A2,2 0 0,1 4,1H16V3H4V15H11V13L15,16L11,19V17M19,21V7H8V13H6V7A2,2 0 0,1 8,5H19A2,2 0 0,1 21,7V21A2,2 0 0,1 19,23H8A2,2 0 0,1 6,21V19H8V21H19Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.copy"),"M19,21H8V7H19M19,5H8A2,2 0 0,0 6,7V21A2,2 0 0,0 8,23H19A2,2 0 0,0 21,21V7A2,2 0 0,0 19,5M16,1H4A2,2 0 0,0 2,3V17H4V3H16V1Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.cut"),"M19,3L13,9L15,11L22,4V3M12,12.5A0.5,0.5 0 0,1 11.5,12A0.5,0.5 0 0,1 12,11.5A0.5,0.5 0 0,1 12.5,12A0.5,0.5 0 0,1 12,12.5M6,20A2,2 0 0,1 4,18C4,16.89 4.9,16 6,16A2,2 0 0,1 8,18C8,19.11 7.1,20 6,20M6,8A2,2 0 0,1 4,6C4,4.89 4.9,4 6,4A2,2 0 0,1 8,6C8,7.11 7.1,8 6,8M9.64,7.64C9.87,7.14 10,6.59 10,6A4,4 0 0,0 6,2A4,4 0 0,0 2,6A4,4 0 0,0 6,10C6.59,10 7.14,9.87 7.64,9.64L10,12L7.64,14.36C7.14,14.13 6.59,14 6,14A4,4 0 0,0 2,18A4,4 0 0,0 6,22A4,4 0 0,0 10,18C10,17.41 9.87,16.86 9.64,16.36L12,14L19,21H22V20L9.64,7.64Z",this.hass.localize("ui.panel.config.automation.editor.edit_ui"),this._yamlMode?"":(0,b.dy)(F||(F=(0,s.Z)(['<ha-svg-icon class="selected_menu_item" slot="graphic" .path="','"></ha-svg-icon>'])),W),this.hass.localize("ui.panel.config.automation.editor.edit_yaml"),this._yamlMode?(0,b.dy)(z||(z=(0,s.Z)(['<ha-svg-icon class="selected_menu_item" slot="graphic" .path="','"></ha-svg-icon>'])),W):"",this.disabled,!1===this.condition.enabled?this.hass.localize("ui.panel.config.automation.editor.actions.enable"):this.hass.localize("ui.panel.config.automation.editor.actions.disable"),!1===this.condition.enabled?"M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M10,16.5L16,12L10,7.5V16.5Z":"M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4M9,9V15H15V9",this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.delete"),"M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z"),(0,_.$)({"card-content":!0,disabled:!1===this.condition.enabled}),this._warnings?(0,b.dy)(R||(R=(0,s.Z)(['<ha-alert alert-type="warning" .title="','"> '," "," </ha-alert>"])),this.hass.localize("ui.errors.config.editor_not_supported"),this._warnings.length>0&&void 0!==this._warnings[0]?(0,b.dy)(D||(D=(0,s.Z)([" <ul> "," </ul>"])),this._warnings.map((function(t){return(0,b.dy)(Y||(Y=(0,s.Z)(["<li>","</li>"])),t)}))):"",this.hass.localize("ui.errors.config.edit_in_yaml_supported")):"",this._handleUiModeNotAvailable,this._handleChangeEvent,this._yamlMode,this.disabled,this.hass,this.condition,this.path,(0,_.$)({active:this._testing,pass:!0===this._testingResult,error:!1===this._testingResult}),this._testingResult?this.hass.localize("ui.panel.config.automation.editor.conditions.testing_pass"):this.hass.localize("ui.panel.config.automation.editor.conditions.testing_error"))}},{kind:"method",key:"_handleUiModeNotAvailable",value:function(t){t.stopPropagation(),this._warnings=(0,E.p)(this.hass,t.detail).warnings,this._yamlMode||(this._yamlMode=!0)}},{kind:"method",key:"_handleChangeEvent",value:function(t){t.detail.yaml&&(this._warnings=void 0)}},{kind:"method",key:"_handleAction",value:(o=(0,u.Z)((0,c.Z)().mark((function t(e){var n;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:t.t0=e.detail.index,t.next=0===t.t0?3:1===t.t0?6:2===t.t0?9:3===t.t0?11:4===t.t0?13:5===t.t0?15:6===t.t0?18:7===t.t0?21:8===t.t0?24:9===t.t0?26:28;break;case 3:return t.next=5,this._testCondition();case 5:case 8:return t.abrupt("break",28);case 6:return t.next=8,this._renameCondition();case 9:return null===(n=this._reorderMode)||void 0===n||n.enter(),t.abrupt("break",28);case 11:return(0,L.B)(this,"duplicate"),t.abrupt("break",28);case 13:return this._setClipboard(),t.abrupt("break",28);case 15:return this._setClipboard(),(0,L.B)(this,"value-changed",{value:null}),t.abrupt("break",28);case 18:return this._switchUiMode(),this.expand(),t.abrupt("break",28);case 21:return this._switchYamlMode(),this.expand(),t.abrupt("break",28);case 24:return this._onDisable(),t.abrupt("break",28);case 26:return this._onDelete(),t.abrupt("break",28);case 28:case"end":return t.stop()}}),t,this)}))),function(t){return o.apply(this,arguments)})},{kind:"method",key:"_setClipboard",value:function(){this._clipboard=Object.assign(Object.assign({},this._clipboard),{},{condition:(0,g.Z)(this.condition)})}},{kind:"method",key:"_onDisable",value:function(){var t,e=!(null===(t=this.condition.enabled)||void 0===t||t),n=Object.assign(Object.assign({},this.condition),{},{enabled:e});(0,L.B)(this,"value-changed",{value:n})}},{kind:"method",key:"_onDelete",value:function(){var t=this;(0,j.g7)(this,{title:this.hass.localize("ui.panel.config.automation.editor.conditions.delete_confirm_title"),text:this.hass.localize("ui.panel.config.automation.editor.conditions.delete_confirm_text"),dismissText:this.hass.localize("ui.common.cancel"),confirmText:this.hass.localize("ui.common.delete"),destructive:!0,confirm:function(){(0,L.B)(t,"value-changed",{value:null})}})}},{kind:"method",key:"_switchUiMode",value:function(){this._warnings=void 0,this._yamlMode=!1}},{kind:"method",key:"_switchYamlMode",value:function(){this._warnings=void 0,this._yamlMode=!0}},{kind:"method",key:"_testCondition",value:(r=(0,u.Z)((0,c.Z)().mark((function t(){var e,n,r,o=this;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!this._testing){t.next=2;break}return t.abrupt("return");case 2:return this._testingResult=void 0,this._testing=!0,e=this.condition,t.prev=5,t.next=8,(0,O.w)(this.hass,{condition:e});case 8:if(n=t.sent,this.condition===e){t.next=12;break}return this._testing=!1,t.abrupt("return");case 12:if(n.condition.valid){t.next=16;break}return(0,j.Ys)(this,{title:this.hass.localize("ui.panel.config.automation.editor.conditions.invalid_condition"),text:n.condition.error}),this._testing=!1,t.abrupt("return");case 16:return t.prev=16,t.next=19,(0,C.J8)(this.hass,e);case 19:r=t.sent,t.next=30;break;case 22:if(t.prev=22,t.t0=t.catch(16),this.condition===e){t.next=27;break}return this._testing=!1,t.abrupt("return");case 27:return(0,j.Ys)(this,{title:this.hass.localize("ui.panel.config.automation.editor.conditions.test_failed"),text:t.t0.message}),this._testing=!1,t.abrupt("return");case 30:this._testingResult=r.result;case 31:return t.prev=31,setTimeout((function(){o._testing=!1}),2500),t.finish(31);case 34:case"end":return t.stop()}}),t,this,[[5,,31,34],[16,22]])}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"_renameCondition",value:(n=(0,u.Z)((0,c.Z)().mark((function t(){var e,n;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,j.D9)(this,{title:this.hass.localize("ui.panel.config.automation.editor.conditions.change_alias"),inputLabel:this.hass.localize("ui.panel.config.automation.editor.conditions.alias"),inputType:"string",placeholder:(0,x.f)((0,A.m)(this.condition,this.hass,this._entityReg,!0)),defaultValue:this.condition.alias,confirmText:this.hass.localize("ui.common.submit")});case 2:null!==(e=t.sent)&&(n=Object.assign({},this.condition),""===e?delete n.alias:n.alias=e,(0,L.B)(this,"value-changed",{value:n}));case 4:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"expand",value:function(){var t=this;this.updateComplete.then((function(){t.shadowRoot.querySelector("ha-expansion-panel").expanded=!0}))}},{kind:"get",static:!0,key:"styles",value:function(){return[H.Qx,(0,b.iv)(K||(K=(0,s.Z)(["ha-button-menu{--mdc-theme-text-primary-on-background:var(--primary-text-color)}.disabled{opacity:.5;pointer-events:none}ha-expansion-panel{--expansion-panel-summary-padding:0 0 0 8px;--expansion-panel-content-padding:0}h3{margin:0;font-size:inherit;font-weight:inherit}.condition-icon{display:none}@media (min-width:870px){.condition-icon{display:inline-block;color:var(--secondary-text-color);opacity:.9;margin-right:8px}}.card-content{padding:16px}.disabled-bar{background:var(--divider-color,#e0e0e0);text-align:center;border-top-right-radius:var(--ha-card-border-radius);border-top-left-radius:var(--ha-card-border-radius)}mwc-list-item[disabled]{--mdc-theme-text-primary-on-background:var(--disabled-text-color)}mwc-list-item.hidden{display:none}.testing{position:absolute;top:0px;right:0px;left:0px;text-transform:uppercase;font-weight:700;font-size:14px;background-color:var(--divider-color,#e0e0e0);color:var(--text-primary-color);max-height:0px;overflow:hidden;transition:max-height .3s;text-align:center;border-top-right-radius:var(--ha-card-border-radius,12px);border-top-left-radius:var(--ha-card-border-radius,12px)}.testing.active{max-height:100px}.testing.error{background-color:var(--accent-color)}.testing.pass{background-color:var(--success-color)}.selected_menu_item{color:var(--primary-color)}li[role=separator]{border-bottom-color:var(--divider-color)}"])))]}}]}}),b.oi),a(),t.next=78;break;case 75:t.prev=75,t.t2=t.catch(0),a(t.t2);case 78:case"end":return t.stop()}}),t,null,[[0,75]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var i=t.apply(e,n);function a(t){c(i,r,o,a,u,"next",t)}function u(t){c(i,r,o,a,u,"throw",t)}a(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},61563:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,s,l,h,d,f,p,v,y,m,g,b,w,_,k,L,x,E,C,A,Z,O,M;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(76775),a=n(88962),c=n(46097),u=n(33368),s=n(71650),l=n(68308),h=n(82390),d=n(69205),f=n(91808),n(97393),n(51358),n(46798),n(5239),n(39685),n(98490),n(9849),n(50289),n(94167),n(87438),n(22890),n(85717),n(94570),n(41353),p=n(98830),v=n(3239),y=n(5095),m=n(95260),g=n(99266),b=n(3747),w=n(18394),_=n(32723),n(92295),n(85878),n(42308),n(37662),k=n(77251),L=n(64082),x=n(96925),!(E=e([x])).then){t.next=61;break}return t.next=57,E;case 57:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=62;break;case 61:t.t0=E;case 62:x=t.t0[0],M="M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z",(0,f.Z)([(0,m.Mo)("ha-automation-condition")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,l.Z)(this,n,[].concat(o)),t((0,h.Z)(e)),e}return(0,d.Z)(n,e),(0,u.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"conditions",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,m.SB)(),(0,p.F_)({context:k.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"field",decorators:[(0,b.t)({key:"automationClipboard",state:!0,subscribe:!0,storage:"sessionStorage"})],key:"_clipboard",value:void 0},{kind:"field",key:"_focusLastConditionOnChange",value:function(){return!1}},{kind:"field",key:"_conditionKeys",value:function(){return new WeakMap}},{kind:"method",key:"updated",value:function(t){var e,n=this;if(t.has("conditions"))if(Array.isArray(this.conditions)||(e=[this.conditions]),(e||this.conditions).forEach((function(t,r){"string"==typeof t&&((e=e||(0,c.Z)(n.conditions))[r]={condition:"template",value_template:t})})),e)(0,w.B)(this,"value-changed",{value:e});else if(this._focusLastConditionOnChange){this._focusLastConditionOnChange=!1;var r=this.shadowRoot.querySelector("ha-automation-condition-row:last-of-type");r.updateComplete.then((function(){r.expand(),r.scrollIntoView(),r.focus()}))}}},{kind:"get",key:"nested",value:function(){return void 0!==this.path}},{kind:"method",key:"render",value:function(){var t,e=this;return Array.isArray(this.conditions)?(0,y.dy)(C||(C=(0,a.Z)([' <ha-sortable handle-selector=".handle" .disabled="','" @item-moved="','" group="conditions" .path="','"> <div class="conditions"> ',' </div> </ha-sortable> <div class="buttons"> <ha-button outlined .disabled="','" .label="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </ha-button> <ha-button .disabled="','" .label="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </ha-button> </div> '])),!(null!==(t=this._reorderMode)&&void 0!==t&&t.active),this._conditionMoved,this.path,(0,g.r)(this.conditions.filter((function(t){return"object"===(0,i.Z)(t)})),(function(t){return e._getKey(t)}),(function(t,n){var r,o,i;return(0,y.dy)(A||(A=(0,a.Z)([' <ha-automation-condition-row .path="','" .index="','" .totalConditions="','" .condition="','" .hideMenu="','" .disabled="','" @duplicate="','" @move-condition="','" @value-changed="','" .hass="','"> '," </ha-automation-condition-row> "])),[].concat((0,c.Z)(null!==(r=e.path)&&void 0!==r?r:[]),[n]),n,e.conditions.length,t,Boolean(null===(o=e._reorderMode)||void 0===o?void 0:o.active),e.disabled,e._duplicateCondition,e._move,e._conditionChanged,e.hass,null!==(i=e._reorderMode)&&void 0!==i&&i.active?(0,y.dy)(Z||(Z=(0,a.Z)([' <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <div class="handle" slot="icons"> <ha-svg-icon .path="','"></ha-svg-icon> </div> '])),n,e.hass.localize("ui.panel.config.automation.editor.move_up"),"M13,20H11V8L5.5,13.5L4.08,12.08L12,4.16L19.92,12.08L18.5,13.5L13,8V20Z",e._moveUp,0===n,n,e.hass.localize("ui.panel.config.automation.editor.move_down"),"M11,4H13V16L18.5,10.5L19.92,11.92L12,19.84L4.08,11.92L5.5,10.5L11,16V4Z",e._moveDown,n===e.conditions.length-1,"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"):"")})),this.disabled,this.hass.localize("ui.panel.config.automation.editor.conditions.add"),this._addConditionDialog,M,this.disabled,this.hass.localize("ui.panel.config.automation.editor.conditions.add_building_block"),this._addConditionBuildingBlockDialog,M):y.Ld}},{kind:"method",key:"_addConditionDialog",value:function(){var t;(0,L._)(this,{type:"condition",add:this._addCondition,clipboardItem:null===(t=this._clipboard)||void 0===t||null===(t=t.condition)||void 0===t?void 0:t.condition})}},{kind:"method",key:"_addConditionBuildingBlockDialog",value:function(){var t;(0,L._)(this,{type:"condition",add:this._addCondition,clipboardItem:null===(t=this._clipboard)||void 0===t||null===(t=t.condition)||void 0===t?void 0:t.condition,group:"building_blocks"})}},{kind:"field",key:"_addCondition",value:function(){var t=this;return function(e){var n;if(e===L.I)n=t.conditions.concat((0,v.Z)(t._clipboard.condition));else{var r=e,o=customElements.get("ha-automation-condition-".concat(r));n=t.conditions.concat(Object.assign({condition:r},o.defaultConfig))}t._focusLastConditionOnChange=!0,(0,w.B)(t,"value-changed",{value:n})}}},{kind:"method",key:"_getKey",value:function(t){return this._conditionKeys.has(t)||this._conditionKeys.set(t,Math.random().toString()),this._conditionKeys.get(t)}},{kind:"method",key:"_moveUp",value:function(t){var e=t.target.index,n=e-1;this._move(e,n)}},{kind:"method",key:"_moveDown",value:function(t){var e=t.target.index,n=e+1;this._move(e,n)}},{kind:"method",key:"_move",value:function(t,e,n,r){var o=(0,_.b)(this.conditions,t,e,n,r);(0,w.B)(this,"value-changed",{value:o})}},{kind:"method",key:"_conditionMoved",value:function(t){if(!this.nested){t.stopPropagation();var e=t.detail,n=e.oldIndex,r=e.newIndex,o=e.oldPath,i=e.newPath;this._move(n,r,o,i)}}},{kind:"method",key:"_conditionChanged",value:function(t){t.stopPropagation();var e=(0,c.Z)(this.conditions),n=t.detail.value,r=t.target.index;if(null===n)e.splice(r,1);else{var o=this._getKey(e[r]);this._conditionKeys.set(n,o),e[r]=n}this.conditions=e,(0,w.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_duplicateCondition",value:function(t){t.stopPropagation();var e=t.target.index;(0,w.B)(this,"value-changed",{value:this.conditions.concat((0,v.Z)(this.conditions[e]))})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,y.iv)(O||(O=(0,a.Z)(["ha-automation-condition-row{display:block;margin-bottom:16px;scroll-margin-top:48px}ha-svg-icon{height:20px}ha-alert{display:block;margin-bottom:16px;border-radius:var(--ha-card-border-radius,12px);overflow:hidden}.handle{padding:12px;cursor:move;cursor:grab}.handle ha-svg-icon{pointer-events:none;height:24px}.buttons{display:flex;flex-wrap:wrap;gap:8px}"])))}}]}}),y.oi),r(),t.next=74;break;case 71:t.prev=71,t.t2=t.catch(0),r(t.t2);case 74:case"end":return t.stop()}}),t,null,[[0,71]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},57433:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,s,l,h,d,f;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(33368),a=n(71650),c=n(68308),u=n(82390),s=n(69205),l=n(91808),n(97393),h=n(95260),d=n(42552),!(f=e([d])).then){t.next=19;break}return t.next=15,f;case 15:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=20;break;case 19:t.t0=f;case 20:d=t.t0[0],(0,l.Z)([(0,h.Mo)("ha-automation-condition-and")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,c.Z)(this,n,[].concat(o)),t((0,u.Z)(e)),e}return(0,s.Z)(n,e),(0,i.Z)(n)}(e);return{F:n,d:[]}}),d.w),r(),t.next=28;break;case 25:t.prev=25,t.t2=t.catch(0),r(t.t2);case 28:case"end":return t.stop()}}),t,null,[[0,25]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},85027:function(t,e,n){var r,o,i,a=n(99312),c=n(81043),u=n(88962),s=n(33368),l=n(71650),h=n(68308),d=n(82390),f=n(69205),p=n(91808),v=(n(97393),n(46798),n(9849),n(50289),n(94167),n(22859),n(85717),n(98830)),y=n(5095),m=n(95260),g=n(14516),b=n(18394),w=n(25917),_=n(7748),k=((0,p.Z)([(0,m.Mo)("ha-device-condition-picker")],(function(t,e){return{F:function(e){function n(){var e;return(0,l.Z)(this,n),e=(0,h.Z)(this,n,[w.b2,w.Gg,function(t){return{device_id:t||"",condition:"device",domain:"",entity_id:""}}]),t((0,d.Z)(e)),e}return(0,f.Z)(n,e),(0,s.Z)(n)}(e),d:[{kind:"get",key:"NO_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.conditions.no_conditions")}},{kind:"get",key:"UNKNOWN_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.conditions.unknown_condition")}}]}}),_.g),n(27056),n(39663),n(38149));(0,p.Z)([(0,m.Mo)("ha-automation-condition-device")],(function(t,e){var n,p=function(e){function n(){var e;(0,l.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,h.Z)(this,n,[].concat(o)),t((0,d.Z)(e)),e}return(0,f.Z)(n,e),(0,s.Z)(n)}(e);return{F:p,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Object})],key:"condition",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,m.SB)()],key:"_deviceId",value:void 0},{kind:"field",decorators:[(0,m.SB)()],key:"_capabilities",value:void 0},{kind:"field",decorators:[(0,m.SB)(),(0,v.F_)({context:k.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",key:"_origCondition",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{device_id:"",domain:"",entity_id:""}}},{kind:"field",key:"_extraFieldsData",value:function(){return(0,g.Z)((function(t,e){var n={};return e.extra_fields.forEach((function(e){void 0!==t[e.name]&&(n[e.name]=t[e.name])})),n}))}},{kind:"method",key:"render",value:function(){var t,e=this._deviceId||this.condition.device_id;return(0,y.dy)(r||(r=(0,u.Z)([' <ha-device-picker .value="','" @value-changed="','" .hass="','" .disabled="','" .label="','"></ha-device-picker> <ha-device-condition-picker .value="','" .deviceId="','" @value-changed="','" .hass="','" .disabled="','" .label="','"></ha-device-condition-picker> '," "])),e,this._devicePicked,this.hass,this.disabled,this.hass.localize("ui.panel.config.automation.editor.conditions.type.device.label"),this.condition,e,this._deviceConditionPicked,this.hass,this.disabled,this.hass.localize("ui.panel.config.automation.editor.conditions.type.device.condition"),null!==(t=this._capabilities)&&void 0!==t&&t.extra_fields?(0,y.dy)(o||(o=(0,u.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),this.hass,this._extraFieldsData(this.condition,this._capabilities),this._capabilities.extra_fields,this.disabled,this._extraFieldsComputeLabelCallback(this.hass.localize),this._extraFieldsChanged):"")}},{kind:"method",key:"firstUpdated",value:function(){this._capabilities||this._getCapabilities(),this.condition&&(this._origCondition=this.condition)}},{kind:"method",key:"updated",value:function(t){var e=t.get("condition");e&&!(0,w.hH)(this._entityReg,e,this.condition)&&this._getCapabilities()}},{kind:"method",key:"_getCapabilities",value:(n=(0,c.Z)((0,a.Z)().mark((function t(){var e;return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!(e=this.condition).domain){t.next=7;break}return t.next=4,(0,w.dA)(this.hass,e);case 4:t.t0=t.sent,t.next=8;break;case 7:t.t0=void 0;case 8:this._capabilities=t.t0;case 9:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"_devicePicked",value:function(t){t.stopPropagation(),this._deviceId=t.target.value,void 0===this._deviceId&&(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},p.defaultConfig),{},{condition:"device"})})}},{kind:"method",key:"_deviceConditionPicked",value:function(t){t.stopPropagation();var e=t.detail.value;this._origCondition&&(0,w.hH)(this._entityReg,this._origCondition,e)&&(e=this._origCondition),(0,b.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_extraFieldsChanged",value:function(t){t.stopPropagation(),(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.condition),t.detail.value)})}},{kind:"method",key:"_extraFieldsComputeLabelCallback",value:function(t){return function(e){return t("ui.panel.config.automation.editor.conditions.type.device.extra_fields.".concat(e.name))||e.name}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,y.iv)(i||(i=(0,u.Z)(["ha-device-picker{display:block;margin-bottom:24px}ha-form{display:block;margin-top:24px}"])))}}]}}),y.oi)},42552:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,r=(t=o().mark((function t(r,i){var a,c,u,s,l,h,d,f,p,v,y,m,g,b,w;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{w:function(){return w}}),a=n(46097),c=n(88962),u=n(33368),s=n(71650),l=n(68308),h=n(82390),d=n(69205),f=n(91808),n(97393),n(85717),p=n(5095),v=n(95260),y=n(18394),m=n(61563),!(g=r([m])).then){t.next=26;break}return t.next=22,g;case 22:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=27;break;case 26:t.t0=g;case 27:m=t.t0[0],w=(0,f.Z)([(0,v.Mo)("ha-automation-condition-logical")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,l.Z)(this,n,[].concat(o)),t((0,h.Z)(e)),e}return(0,d.Z)(n,e),(0,u.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"path",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{conditions:[]}}},{kind:"method",key:"render",value:function(){var t;return(0,p.dy)(b||(b=(0,c.Z)([' <ha-automation-condition .path="','" .conditions="','" @value-changed="','" .hass="','" .disabled="','"></ha-automation-condition> '])),[].concat((0,a.Z)(null!==(t=this.path)&&void 0!==t?t:[]),["conditions"]),this.condition.conditions||[],this._valueChanged,this.hass,this.disabled)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation(),(0,y.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.condition),{},{conditions:t.detail.value})})}}]}}),p.oi),i(),t.next=35;break;case 32:t.prev=32,t.t2=t.catch(0),i(t.t2);case 35:case"end":return t.stop()}}),t,null,[[0,32]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},32825:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,s,l,h,d,f;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(33368),a=n(71650),c=n(68308),u=n(82390),s=n(69205),l=n(91808),n(97393),h=n(95260),d=n(42552),!(f=e([d])).then){t.next=19;break}return t.next=15,f;case 15:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=20;break;case 19:t.t0=f;case 20:d=t.t0[0],(0,l.Z)([(0,h.Mo)("ha-automation-condition-not")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,c.Z)(this,n,[].concat(o)),t((0,u.Z)(e)),e}return(0,s.Z)(n,e),(0,i.Z)(n)}(e);return{F:n,d:[]}}),d.w),r(),t.next=28;break;case 25:t.prev=25,t.t2=t.catch(0),r(t.t2);case 28:case"end":return t.stop()}}),t,null,[[0,25]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},76898:function(t,e,n){var r,o=n(88962),i=n(46097),a=n(33368),c=n(71650),u=n(68308),s=n(82390),l=n(69205),h=n(91808),d=(n(97393),n(95818),n(76843),n(79894),n(88640),n(85717),n(22859),n(5095)),f=n(95260),p=n(14516),v=n(18394);n(39663),(0,h.Z)([(0,f.Mo)("ha-automation-condition-numeric_state")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,u.Z)(this,n,[].concat(o)),t((0,s.Z)(e)),e}return(0,l.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,f.SB)()],key:"_inputAboveIsEntity",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_inputBelowIsEntity",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{entity_id:""}}},{kind:"field",key:"_schema",value:function(){return(0,p.Z)((function(t,e,n){return[{name:"entity_id",required:!0,selector:{entity:{}}},{name:"attribute",selector:{attribute:{hide_attributes:["access_token","auto_update","available_modes","away_mode","changed_by","code_format","color_modes","current_activity","device_class","editable","effect_list","effect","entity_picture","event_type","event_types","fan_mode","fan_modes","fan_speed_list","forecast","friendly_name","frontend_stream_type","has_date","has_time","hs_color","hvac_mode","hvac_modes","icon","media_album_name","media_artist","media_content_type","media_position_updated_at","media_title","next_dawn","next_dusk","next_midnight","next_noon","next_rising","next_setting","operation_list","operation_mode","options","preset_mode","preset_modes","release_notes","release_summary","release_url","restored","rgb_color","rgbw_color","shuffle","sound_mode_list","sound_mode","source_list","source_type","source","state_class","supported_features","swing_mode","swing_mode","swing_modes","title","token","unit_of_measurement","xy_color"]}},context:{filter_entity:"entity_id"}},{name:"mode_above",type:"select",required:!0,options:[["value",t("ui.panel.config.automation.editor.conditions.type.numeric_state.type_value")],["input",t("ui.panel.config.automation.editor.conditions.type.numeric_state.type_input")]]}].concat((0,i.Z)(e?[{name:"above",selector:{entity:{domain:["input_number","number","sensor"]}}}]:[{name:"above",selector:{number:{mode:"box",min:Number.MIN_SAFE_INTEGER,max:Number.MAX_SAFE_INTEGER,step:.1}}}]),[{name:"mode_below",type:"select",required:!0,options:[["value",t("ui.panel.config.automation.editor.conditions.type.numeric_state.type_value")],["input",t("ui.panel.config.automation.editor.conditions.type.numeric_state.type_input")]]}],(0,i.Z)(n?[{name:"below",selector:{entity:{domain:["input_number","number","sensor"]}}}]:[{name:"below",selector:{number:{mode:"box",min:Number.MIN_SAFE_INTEGER,max:Number.MAX_SAFE_INTEGER,step:.1}}}]),[{name:"value_template",selector:{template:{}}}])}))}},{kind:"method",key:"render",value:function(){var t,e,n=null!==(t=this._inputAboveIsEntity)&&void 0!==t?t:"string"==typeof this.condition.above&&(this.condition.above.startsWith("input_number.")||this.condition.above.startsWith("number.")||this.condition.above.startsWith("sensor.")),i=null!==(e=this._inputBelowIsEntity)&&void 0!==e?e:"string"==typeof this.condition.below&&(this.condition.below.startsWith("input_number.")||this.condition.below.startsWith("number.")||this.condition.below.startsWith("sensor.")),a=this._schema(this.hass.localize,n,i),c=Object.assign({mode_above:n?"input":"value",mode_below:i?"input":"value"},this.condition);return(0,d.dy)(r||(r=(0,o.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" @value-changed="','" .computeLabel="','"></ha-form> '])),this.hass,c,a,this.disabled,this._valueChanged,this._computeLabelCallback)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e=t.detail.value;this._inputAboveIsEntity="input"===e.mode_above,this._inputBelowIsEntity="input"===e.mode_below,delete e.mode_above,delete e.mode_below,""===e.value_template&&delete e.value_template,(0,v.B)(this,"value-changed",{value:e})}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){switch(e.name){case"entity_id":return t.hass.localize("ui.components.entity.entity-picker.entity");case"attribute":return t.hass.localize("ui.components.entity.entity-attribute-picker.attribute");default:return t.hass.localize("ui.panel.config.automation.editor.triggers.type.numeric_state.".concat(e.name))}}}}]}}),d.oi)},97326:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,s,l,h,d,f;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(33368),a=n(71650),c=n(68308),u=n(82390),s=n(69205),l=n(91808),n(97393),h=n(95260),d=n(42552),!(f=e([d])).then){t.next=19;break}return t.next=15,f;case 15:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=20;break;case 19:t.t0=f;case 20:d=t.t0[0],(0,l.Z)([(0,h.Mo)("ha-automation-condition-or")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,c.Z)(this,n,[].concat(o)),t((0,u.Z)(e)),e}return(0,s.Z)(n,e),(0,i.Z)(n)}(e);return{F:n,d:[]}}),d.w),r(),t.next=28;break;case 25:t.prev=25,t.t2=t.catch(0),r(t.t2);case 28:case"end":return t.stop()}}),t,null,[[0,25]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},67905:function(t,e,n){var r,o=n(88962),i=n(33368),a=n(71650),c=n(68308),u=n(82390),s=n(69205),l=n(91808),h=(n(97393),n(85717),n(46798),n(9849),n(50289),n(94167),n(65974),n(22859),n(5095)),d=n(95260),f=n(38768),p=n(27959),v=n(18394),y=(n(39663),n(21686)),m=(0,f.Ry)({alias:(0,f.jt)((0,f.Z_)()),condition:(0,f.i0)("state"),entity_id:(0,f.jt)((0,f.Z_)()),attribute:(0,f.jt)((0,f.Z_)()),state:(0,f.jt)((0,f.Z_)()),for:(0,f.jt)((0,f.G0)([(0,f.Rx)(),(0,f.Z_)(),y.H])),enabled:(0,f.jt)((0,f.O7)())}),g=[{name:"entity_id",required:!0,selector:{entity:{}}},{name:"attribute",selector:{attribute:{hide_attributes:["access_token","available_modes","color_modes","editable","effect_list","entity_picture","event_types","fan_modes","fan_speed_list","forecast","friendly_name","hvac_modes","icon","operation_list","options","preset_modes","sound_mode_list","source_list","state_class","swing_modes","token"]}},context:{filter_entity:"entity_id"}},{name:"state",required:!0,selector:{state:{}},context:{filter_entity:"entity_id",filter_attribute:"attribute"}},{name:"for",selector:{duration:{}}}];(0,l.Z)([(0,d.Mo)("ha-automation-condition-state")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,c.Z)(this,n,[].concat(o)),t((0,u.Z)(e)),e}return(0,s.Z)(n,e),(0,i.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{entity_id:"",state:""}}},{kind:"method",key:"shouldUpdate",value:function(t){if(t.has("condition"))try{(0,f.hu)(this.condition,m)}catch(e){return(0,v.B)(this,"ui-mode-not-available",e),!1}return!0}},{kind:"method",key:"render",value:function(){var t=(0,p.c)(this.condition.for),e=Object.assign(Object.assign({},this.condition),{},{for:t});return(0,h.dy)(r||(r=(0,o.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" @value-changed="','" .computeLabel="','"></ha-form> '])),this.hass,e,g,this.disabled,this._valueChanged,this._computeLabelCallback)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e=t.detail.value;Object.keys(e).forEach((function(t){return void 0===e[t]||""===e[t]?delete e[t]:{}})),e.state||(e.state=""),(0,v.B)(this,"value-changed",{value:e})}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){switch(e.name){case"entity_id":return t.hass.localize("ui.components.entity.entity-picker.entity");case"attribute":return t.hass.localize("ui.components.entity.entity-attribute-picker.attribute");case"for":return t.hass.localize("ui.panel.config.automation.editor.triggers.type.state.for");default:return t.hass.localize("ui.panel.config.automation.editor.conditions.type.state.".concat(e.name))}}}}]}}),h.oi)},50002:function(t,e,n){var r,o=n(88962),i=n(33368),a=n(71650),c=n(68308),u=n(82390),s=n(69205),l=n(91808),h=(n(97393),n(22859),n(5095)),d=n(95260),f=n(14516),p=n(18394);n(39663),(0,l.Z)([(0,d.Mo)("ha-automation-condition-sun")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,c.Z)(this,n,[].concat(o)),t((0,u.Z)(e)),e}return(0,s.Z)(n,e),(0,i.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{}}},{kind:"field",key:"_schema",value:function(){return(0,f.Z)((function(t){return[{name:"before",type:"select",required:!0,options:[["sunrise",t("ui.panel.config.automation.editor.conditions.type.sun.sunrise")],["sunset",t("ui.panel.config.automation.editor.conditions.type.sun.sunset")]]},{name:"before_offset",selector:{text:{}}},{name:"after",type:"select",required:!0,options:[["sunrise",t("ui.panel.config.automation.editor.conditions.type.sun.sunrise")],["sunset",t("ui.panel.config.automation.editor.conditions.type.sun.sunset")]]},{name:"after_offset",selector:{text:{}}}]}))}},{kind:"method",key:"render",value:function(){var t=this._schema(this.hass.localize);return(0,h.dy)(r||(r=(0,o.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),t,this.condition,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e=t.detail.value;(0,p.B)(this,"value-changed",{value:e})}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){return t.hass.localize("ui.panel.config.automation.editor.conditions.type.sun.".concat(e.name))}}}]}}),h.oi)},37127:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,s,l,h,d,f,p,v,y,m;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(88962),a=n(33368),c=n(71650),u=n(68308),s=n(82390),l=n(69205),h=n(91808),n(97393),d=n(5095),f=n(95260),n(99539),p=n(96925),!(v=e([p])).then){t.next=22;break}return t.next=18,v;case 18:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=23;break;case 22:t.t0=v;case 23:p=t.t0[0],(0,h.Z)([(0,f.Mo)("ha-automation-condition-template")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,u.Z)(this,n,[].concat(o)),t((0,s.Z)(e)),e}return(0,l.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{value_template:""}}},{kind:"method",key:"render",value:function(){var t=this.condition.value_template;return(0,d.dy)(y||(y=(0,i.Z)([" <p> ",' * </p> <ha-code-editor .name="','" mode="jinja2" .hass="','" .value="','" .readOnly="','" autocomplete-entities @value-changed="','" dir="ltr"></ha-code-editor> '])),this.hass.localize("ui.panel.config.automation.editor.conditions.type.template.value_template"),"value_template",this.hass,t,this.disabled,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(t){(0,p.a)(this,t)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,d.iv)(m||(m=(0,i.Z)(["p{margin-top:0}"])))}}]}}),d.oi),r(),t.next=31;break;case 28:t.prev=28,t.t2=t.catch(0),r(t.t2);case 31:case"end":return t.stop()}}),t,null,[[0,28]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},8471:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",s=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new H(r||[]);return a(i,"_invoke",{value:Z(t,n,c)}),i}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var k={};h(k,u,(function(){return this}));var L=Object.getPrototypeOf,x=L&&L(L(S([])));x&&x!==n&&i.call(x,u)&&(k=x);var E=_.prototype=b.prototype=Object.create(k);function C(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function A(t,e){function n(o,a,c,u){var s=f(t[o],t,a);if("throw"!==s.type){var l=s.arg,h=l.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,u)}))}u(s.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function Z(e,n,r){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=O(c,r);if(u){if(u===g)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===p)throw o=m,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var s=f(e,n,r);if("normal"===s.type){if(o=r.done?m:v,s.arg===g)continue;return{value:s.arg,done:r.done}}"throw"===s.type&&(o=m,r.method="throw",r.arg=s.arg)}}}function O(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),g;var i=f(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,g;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,g):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,g)}function M(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function j(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(M,this),this.reset(!0)}function S(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=_,a(E,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=h(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,h(t,l,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},C(A.prototype),h(A.prototype,s,(function(){return this})),e.AsyncIterator=A,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new A(d(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},C(E),h(E,l,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=S,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(j),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),s=i.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),j(n),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;j(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:S(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(s){return void n(s)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,s,l,h,d,f,p,v,y,m,g,b;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(88962),a=n(33368),c=n(71650),u=n(68308),s=n(82390),l=n(69205),h=n(91808),n(97393),n(17692),n(46349),n(70320),n(88640),n(85717),n(46798),n(9849),n(50289),n(94167),n(65974),n(22859),d=n(5095),f=n(95260),p=n(14516),v=n(18007),y=n(18394),n(39663),!(m=e([v])).then){t.next=46;break}return t.next=42,m;case 42:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=47;break;case 46:t.t0=m;case 47:v=t.t0[0],b=["sun","mon","tue","wed","thu","fri","sat"],(0,h.Z)([(0,f.Mo)("ha-automation-condition-time")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,u.Z)(this,n,[].concat(o)),t((0,s.Z)(e)),e}return(0,l.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_inputModeBefore",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_inputModeAfter",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{}}},{kind:"field",key:"_schema",value:function(){return(0,p.Z)((function(t,e,n,r){var o=(0,v.Bt)(e),i=b.slice(o,b.length).concat(b.slice(0,o));return[{name:"mode_after",type:"select",required:!0,options:[["value",t("ui.panel.config.automation.editor.conditions.type.time.type_value")],["input",t("ui.panel.config.automation.editor.conditions.type.time.type_input")]]},{name:"after",selector:n?{entity:{filter:[{domain:"input_datetime"},{domain:"sensor",device_class:"timestamp"}]}}:{time:{}}},{name:"mode_before",type:"select",required:!0,options:[["value",t("ui.panel.config.automation.editor.conditions.type.time.type_value")],["input",t("ui.panel.config.automation.editor.conditions.type.time.type_input")]]},{name:"before",selector:r?{entity:{filter:[{domain:"input_datetime"},{domain:"sensor",device_class:"timestamp"}]}}:{time:{}}},{type:"multi_select",name:"weekday",options:i.map((function(e){return[e,t("ui.panel.config.automation.editor.conditions.type.time.weekdays.".concat(e))]}))}]}))}},{kind:"method",key:"render",value:function(){var t,e,n,r,o,a,c=null!==(t=this._inputModeBefore)&&void 0!==t?t:(null===(e=this.condition.before)||void 0===e?void 0:e.startsWith("input_datetime."))||(null===(n=this.condition.before)||void 0===n?void 0:n.startsWith("sensor.")),u=null!==(r=this._inputModeAfter)&&void 0!==r?r:(null===(o=this.condition.after)||void 0===o?void 0:o.startsWith("input_datetime."))||(null===(a=this.condition.after)||void 0===a?void 0:a.startsWith("sensor.")),s=this._schema(this.hass.localize,this.hass.locale,u,c),l=Object.assign({mode_before:c?"input":"value",mode_after:u?"input":"value"},this.condition);return(0,d.dy)(g||(g=(0,i.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" @value-changed="','" .computeLabel="','"></ha-form> '])),this.hass,l,s,this.disabled,this._valueChanged,this._computeLabelCallback)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e=t.detail.value;this._inputModeAfter="input"===e.mode_after,this._inputModeBefore="input"===e.mode_before,delete e.mode_after,delete e.mode_before,Object.keys(e).forEach((function(t){return void 0===e[t]||""===e[t]||Array.isArray(e[t])&&0===e[t].length?delete e[t]:{}})),(0,y.B)(this,"value-changed",{value:e})}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){return t.hass.localize("ui.panel.config.automation.editor.conditions.type.time.".concat(e.name))}}}]}}),d.oi),r(),t.next=56;break;case 53:t.prev=53,t.t2=t.catch(0),r(t.t2);case 56:case"end":return t.stop()}}),t,null,[[0,53]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},53685:function(t,e,n){var r,o=n(88962),i=n(33368),a=n(71650),c=n(68308),u=n(82390),s=n(69205),l=n(91808),h=n(34541),d=n(47838),f=(n(97393),n(46349),n(70320),n(22859),n(51358),n(46798),n(78399),n(5239),n(56086),n(47884),n(81912),n(64584),n(41483),n(12367),n(9454),n(98490),n(87438),n(9849),n(22890),n(13526),n(44577),n(5095)),p=n(95260),v=n(14516),y=n(4771),m=n(18394);n(39663),n(71133),(0,l.Z)([(0,p.Mo)("ha-automation-condition-trigger")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,c.Z)(this,n,[].concat(o)),t((0,u.Z)(e)),e}return(0,s.Z)(n,e),(0,i.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.SB)()],key:"_triggers",value:function(){return[]}},{kind:"field",key:"_unsub",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{id:""}}},{kind:"field",key:"_schema",value:function(){return(0,v.Z)((function(t){return[{name:"id",selector:{select:{multiple:!0,options:t.map((function(t){return t.id}))}},required:!0}]}))}},{kind:"method",key:"connectedCallback",value:function(){var t=this;(0,h.Z)((0,d.Z)(n.prototype),"connectedCallback",this).call(this);var e={callback:function(e){return t._automationUpdated(e)}};(0,m.B)(this,"subscribe-automation-config",e),this._unsub=e.unsub}},{kind:"method",key:"disconnectedCallback",value:function(){(0,h.Z)((0,d.Z)(n.prototype),"disconnectedCallback",this).call(this),this._unsub&&this._unsub()}},{kind:"method",key:"render",value:function(){if(!this._triggers.length)return this.hass.localize("ui.panel.config.automation.editor.conditions.type.trigger.no_triggers");var t=this._schema(this._triggers);return(0,f.dy)(r||(r=(0,o.Z)([' <ha-form .schema="','" .data="','" .hass="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),t,this.condition,this.hass,this.disabled,this._computeLabelCallback,this._valueChanged)}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){return t.hass.localize("ui.panel.config.automation.editor.conditions.type.trigger.".concat(e.name))}}},{kind:"method",key:"_automationUpdated",value:function(t){var e=new Set;this._triggers=null!=t&&t.trigger?(0,y.r)(t.trigger).filter((function(t){return t.id&&!e.has(t.id)&&e.add(t.id)})):[]}},{kind:"method",key:"_valueChanged",value:function(t){var e=this;t.stopPropagation();var n=t.detail.value;"string"==typeof n.id?this._triggers.some((function(t){return t.id===n.id}))||(n.id=""):Array.isArray(n.id)&&(n.id=n.id.filter((function(t){return e._triggers.some((function(e){return e.id===t}))})),n.id.length||(n.id="")),(0,m.B)(this,"value-changed",{value:n})}}]}}),f.oi)},6689:function(t,e,n){var r,o,i=n(88962),a=n(33368),c=n(71650),u=n(68308),s=n(82390),l=n(69205),h=n(91808),d=(n(97393),n(85717),n(5095)),f=n(95260),p=n(18394),v=n(3850),y=n(91131);n(91998);function m(t){return(0,y.t)(t)&&"zone"!==(0,v.N)(t)}var g=["zone"];(0,h.Z)([(0,f.Mo)("ha-automation-condition-zone")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,u.Z)(this,n,[].concat(o)),t((0,s.Z)(e)),e}return(0,l.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"condition",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{entity_id:"",zone:""}}},{kind:"method",key:"render",value:function(){var t=this.condition,e=t.entity_id,n=t.zone;return(0,d.dy)(r||(r=(0,i.Z)([' <ha-entity-picker .label="','" .value="','" @value-changed="','" .hass="','" .disabled="','" allow-custom-entity .entityFilter="','"></ha-entity-picker> <ha-entity-picker .label="','" .value="','" @value-changed="','" .hass="','" .disabled="','" allow-custom-entity .includeDomains="','"></ha-entity-picker> '])),this.hass.localize("ui.panel.config.automation.editor.conditions.type.zone.entity"),e,this._entityPicked,this.hass,this.disabled,m,this.hass.localize("ui.panel.config.automation.editor.conditions.type.zone.zone"),n,this._zonePicked,this.hass,this.disabled,g)}},{kind:"method",key:"_entityPicked",value:function(t){t.stopPropagation(),(0,p.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.condition),{},{entity_id:t.detail.value})})}},{kind:"method",key:"_zonePicked",value:function(t){t.stopPropagation(),(0,p.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.condition),{},{zone:t.detail.value})})}},{kind:"field",static:!0,key:"styles",value:function(){return(0,d.iv)(o||(o=(0,i.Z)(["ha-entity-picker:first-child{display:block;margin-bottom:24px}"])))}}]}}),d.oi)},22075:function(t,e,n){n.d(e,{L:function(){return i}});n(63789),n(57778),n(18098),n(76843);var r={en:"US",hi:"IN",deva:"IN",te:"IN",mr:"IN",ta:"IN",gu:"IN",kn:"IN",or:"IN",ml:"IN",pa:"IN",bho:"IN",awa:"IN",as:"IN",mwr:"IN",mai:"IN",mag:"IN",bgc:"IN",hne:"IN",dcc:"IN",bn:"BD",beng:"BD",rkt:"BD",dz:"BT",tibt:"BT",tn:"BW",am:"ET",ethi:"ET",om:"ET",quc:"GT",id:"ID",jv:"ID",su:"ID",mad:"ID",ms_arab:"ID",he:"IL",hebr:"IL",jam:"JM",ja:"JP",jpan:"JP",km:"KH",khmr:"KH",ko:"KR",kore:"KR",lo:"LA",laoo:"LA",mh:"MH",my:"MM",mymr:"MM",mt:"MT",ne:"NP",fil:"PH",ceb:"PH",ilo:"PH",ur:"PK",pa_arab:"PK",lah:"PK",ps:"PK",sd:"PK",skr:"PK",gn:"PY",th:"TH",thai:"TH",tts:"TH",zh_hant:"TW",hant:"TW",sm:"WS",zu:"ZA",sn:"ZW",arq:"DZ",ar:"EG",arab:"EG",arz:"EG",fa:"IR",az_arab:"IR",dv:"MV",thaa:"MV"},o={AG:0,ATG:0,28:0,AS:0,ASM:0,16:0,BD:0,BGD:0,50:0,BR:0,BRA:0,76:0,BS:0,BHS:0,44:0,BT:0,BTN:0,64:0,BW:0,BWA:0,72:0,BZ:0,BLZ:0,84:0,CA:0,CAN:0,124:0,CO:0,COL:0,170:0,DM:0,DMA:0,212:0,DO:0,DOM:0,214:0,ET:0,ETH:0,231:0,GT:0,GTM:0,320:0,GU:0,GUM:0,316:0,HK:0,HKG:0,344:0,HN:0,HND:0,340:0,ID:0,IDN:0,360:0,IL:0,ISR:0,376:0,IN:0,IND:0,356:0,JM:0,JAM:0,388:0,JP:0,JPN:0,392:0,KE:0,KEN:0,404:0,KH:0,KHM:0,116:0,KR:0,KOR:0,410:0,LA:0,LA0:0,418:0,MH:0,MHL:0,584:0,MM:0,MMR:0,104:0,MO:0,MAC:0,446:0,MT:0,MLT:0,470:0,MX:0,MEX:0,484:0,MZ:0,MOZ:0,508:0,NI:0,NIC:0,558:0,NP:0,NPL:0,524:0,PA:0,PAN:0,591:0,PE:0,PER:0,604:0,PH:0,PHL:0,608:0,PK:0,PAK:0,586:0,PR:0,PRI:0,630:0,PT:0,PRT:0,620:0,PY:0,PRY:0,600:0,SA:0,SAU:0,682:0,SG:0,SGP:0,702:0,SV:0,SLV:0,222:0,TH:0,THA:0,764:0,TT:0,TTO:0,780:0,TW:0,TWN:0,158:0,UM:0,UMI:0,581:0,US:0,USA:0,840:0,VE:0,VEN:0,862:0,VI:0,VIR:0,850:0,WS:0,WSM:0,882:0,YE:0,YEM:0,887:0,ZA:0,ZAF:0,710:0,ZW:0,ZWE:0,716:0,AE:6,ARE:6,784:6,AF:6,AFG:6,4:6,BH:6,BHR:6,48:6,DJ:6,DJI:6,262:6,DZ:6,DZA:6,12:6,EG:6,EGY:6,818:6,IQ:6,IRQ:6,368:6,IR:6,IRN:6,364:6,JO:6,JOR:6,400:6,KW:6,KWT:6,414:6,LY:6,LBY:6,434:6,OM:6,OMN:6,512:6,QA:6,QAT:6,634:6,SD:6,SDN:6,729:6,SY:6,SYR:6,760:6,MV:5,MDV:5,462:5};function i(t){return function(t,e,n){if(t){var r,o=t.toLowerCase().split(/[-_]/),i=o[0],a=i;if(o[1]&&4===o[1].length?(a+="_"+o[1],r=o[2]):r=o[1],r||(r=e[a]||e[i]),r)return function(t,e){var n=e["string"==typeof t?t.toUpperCase():t];return"number"==typeof n?n:1}(r.match(/^\d+$/)?Number(r):r,n)}return 1}(t,r,o)}}}]);
+//# sourceMappingURL=2552.6r_MrwUQ99U.js.map
\ No newline at end of file
@@ -0,0 +1 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2638],{2638:function(n,e,s){s.r(e)}}]);
\ No newline at end of file
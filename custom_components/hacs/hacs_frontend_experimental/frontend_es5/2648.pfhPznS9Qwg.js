@@ -0,0 +1,3 @@
+/*! For license information please see 2648.pfhPznS9Qwg.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2648],{24038:function(e,t,a){var r=a(13089);e.exports=function(e){try{if(r)return Function('return require("'+e+'")')()}catch(t){}}},92952:function(e,t,a){var r,i,n=a(33368),l=a(71650),s=a(68308),o=a(69205),d=a(43204),c=a(95260),v=a(88962),h=a(34541),u=a(47838),p=a(5095),m=function(e){function t(){return(0,l.Z)(this,t),(0,s.Z)(this,t,arguments)}return(0,o.Z)(t,e),(0,n.Z)(t,[{key:"connectedCallback",value:function(){(0,h.Z)((0,u.Z)(t.prototype),"connectedCallback",this).call(this),this.setAttribute("aria-hidden","true")}},{key:"render",value:function(){return(0,p.dy)(r||(r=(0,v.Z)(['<span class="shadow"></span>'])))}}]),t}(p.oi),b=(0,p.iv)(i||(i=(0,v.Z)([':host{--_level:var(--md-elevation-level, 0);--_shadow-color:var(--md-elevation-shadow-color, var(--md-sys-color-shadow, #000));display:flex;pointer-events:none}.shadow,.shadow::after,.shadow::before,:host{border-radius:inherit;inset:0;position:absolute;transition-duration:inherit;transition-property:inherit;transition-timing-function:inherit}.shadow::after,.shadow::before{content:"";transition-property:box-shadow,opacity}.shadow::before{box-shadow:0px calc(1px*(clamp(0,var(--_level),1) + clamp(0,var(--_level) - 3,1) + 2*clamp(0,var(--_level) - 4,1))) calc(1px*(2*clamp(0,var(--_level),1) + clamp(0,var(--_level) - 2,1) + clamp(0,var(--_level) - 4,1))) 0px var(--_shadow-color);opacity:.3}.shadow::after{box-shadow:0px calc(1px*(clamp(0,var(--_level),1) + clamp(0,var(--_level) - 1,1) + 2*clamp(0,var(--_level) - 2,3))) calc(1px*(3*clamp(0,var(--_level),2) + 2*clamp(0,var(--_level) - 2,3))) calc(1px*(clamp(0,var(--_level),4) + 2*clamp(0,var(--_level) - 4,1))) var(--_shadow-color);opacity:.15}']))),k=function(e){function t(){return(0,l.Z)(this,t),(0,s.Z)(this,t,arguments)}return(0,o.Z)(t,e),(0,n.Z)(t)}(m);k.styles=[b],k=(0,d.__decorate)([(0,c.Mo)("md-elevation")],k)},96985:function(e,t,a){a.d(t,{$:function(){return q}});var r,i=a(33368),n=a(71650),l=a(68308),s=a(69205),o=a(43204),d=a(95260),c=a(88962),v=a(5095),h=(0,v.iv)(r||(r=(0,c.Z)(["@media(forced-colors:active){:host{--md-slider-active-track-color:CanvasText;--md-slider-disabled-active-track-color:GrayText;--md-slider-disabled-active-track-opacity:1;--md-slider-disabled-handle-color:GrayText;--md-slider-disabled-inactive-track-color:GrayText;--md-slider-disabled-inactive-track-opacity:1;--md-slider-focus-handle-color:CanvasText;--md-slider-handle-color:CanvasText;--md-slider-handle-shadow-color:Canvas;--md-slider-hover-handle-color:CanvasText;--md-slider-hover-state-layer-color:Canvas;--md-slider-hover-state-layer-opacity:1;--md-slider-inactive-track-color:Canvas;--md-slider-label-container-color:Canvas;--md-slider-label-text-color:CanvasText;--md-slider-pressed-handle-color:CanvasText;--md-slider-pressed-state-layer-color:Canvas;--md-slider-pressed-state-layer-opacity:1;--md-slider-with-overlap-handle-outline-color:CanvasText}.label,.label::before{border:var(--_with-overlap-handle-outline-color) solid var(--_with-overlap-handle-outline-width)}:host(:not([disabled])) .track::before{border:1px solid var(--_active-track-color)}.tickmarks::before{background-image:url(\"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' fill='CanvasText'%3E%3Ccircle cx='2' cy='2'  r='1'/%3E%3C/svg%3E\")}.tickmarks::after{background-image:url(\"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' fill='Canvas'%3E%3Ccircle cx='2' cy='2' r='1'/%3E%3C/svg%3E\")}:host([disabled]) .tickmarks::before{background-image:url(\"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' fill='Canvas'%3E%3Ccircle cx='2' cy='2'  r='1'/%3E%3C/svg%3E\")}}"]))),u=a(62746),p=a(99312),m=a(81043),b=a(93359),k=(a(22859),a(51358),a(96043),a(46798),a(5239),a(98490),a(47084),a(73855),a(76843),a(85717),a(92952),a(86477),a(35981),a(53180)),_=a(86634);function f(e,t,a){return e?t():null==a?void 0:a()}var y=a(6157);a(36251),a(48226);function g(e,t){!t.bubbles||e.shadowRoot&&!t.composed||t.stopPropagation();var a=Reflect.construct(t.constructor,[t.type,t]),r=e.dispatchEvent(a);return r||t.preventDefault(),r}function w(e){return e.currentTarget===e.target&&(e.composedPath()[0]===e.target&&(!e.target.disabled&&!function(e){var t=x;t&&(e.preventDefault(),e.stopImmediatePropagation());return function(){z.apply(this,arguments)}(),t}(e)))}var x=!1;function z(){return(z=(0,m.Z)((0,p.Z)().mark((function e(){return(0,p.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return x=!0,e.next=3,null;case 3:x=!1;case 4:case"end":return e.stop()}}),e)})))).apply(this,arguments)}a(94738),a(98214);var S=Symbol("internals"),E=Symbol("privateInternals");var C,A,Z,N,T,L,V=a(34541),H=a(47838),O=(a(51467),Symbol("getFormValue")),P=Symbol("getFormState");var I,B,R,F=function(e){var t=function(e){function t(){return(0,n.Z)(this,t),(0,l.Z)(this,t,arguments)}return(0,s.Z)(t,e),(0,i.Z)(t,[{key:"form",get:function(){return this[S].form}},{key:"labels",get:function(){return this[S].labels}},{key:"name",get:function(){var e;return null!==(e=this.getAttribute("name"))&&void 0!==e?e:""},set:function(e){this.setAttribute("name",e)}},{key:"disabled",get:function(){return this.hasAttribute("disabled")},set:function(e){this.toggleAttribute("disabled",e)}},{key:"attributeChangedCallback",value:function(e,a,r){if("name"!==e&&"disabled"!==e)(0,V.Z)((0,H.Z)(t.prototype),"attributeChangedCallback",this).call(this,e,a,r);else{var i="disabled"===e?null!==a:a;this.requestUpdate(e,i)}}},{key:"requestUpdate",value:function(e,a,r){(0,V.Z)((0,H.Z)(t.prototype),"requestUpdate",this).call(this,e,a,r),this[S].setFormValue(this[O](),this[P]())}},{key:O,value:function(){throw new Error("Implement [getFormValue]")}},{key:P,value:function(){return this[O]()}},{key:"formDisabledCallback",value:function(e){this.disabled=e}}]),t}(e);return t.formAssociated=!0,(0,o.__decorate)([(0,d.Cb)({noAccessor:!0})],t.prototype,"name",null),(0,o.__decorate)([(0,d.Cb)({type:Boolean,noAccessor:!0})],t.prototype,"disabled",null),t}((I=v.oi,B=function(e){function t(){return(0,n.Z)(this,t),(0,l.Z)(this,t,arguments)}return(0,s.Z)(t,e),(0,i.Z)(t,[{key:S,get:function(){return this[E]||(this[E]=this.attachInternals()),this[E]}}]),t}(I),B)),M=function(e){function t(){var e;return(0,n.Z)(this,t),(e=(0,l.Z)(this,t)).min=0,e.max=100,e.valueLabel="",e.valueLabelStart="",e.valueLabelEnd="",e.ariaLabelStart="",e.ariaValueTextStart="",e.ariaLabelEnd="",e.ariaValueTextEnd="",e.step=1,e.ticks=!1,e.labeled=!1,e.range=!1,e.handleStartHover=!1,e.handleEndHover=!1,e.startOnTop=!1,e.handlesOverlapping=!1,e.ripplePointerId=1,e.isRedispatchingEvent=!1,v.sk||e.addEventListener("click",(function(t){w(t)&&e.inputEnd&&(e.focus(),function(e){var t=new MouseEvent("click",{bubbles:!0});e.dispatchEvent(t)}(e.inputEnd))})),e}var a,r;return(0,s.Z)(t,e),(0,i.Z)(t,[{key:"nameStart",get:function(){var e;return null!==(e=this.getAttribute("name-start"))&&void 0!==e?e:this.name},set:function(e){this.setAttribute("name-start",e)}},{key:"nameEnd",get:function(){var e;return null!==(e=this.getAttribute("name-end"))&&void 0!==e?e:this.nameStart},set:function(e){this.setAttribute("name-end",e)}},{key:"renderAriaLabelStart",get:function(){var e=this.ariaLabel;return this.ariaLabelStart||e&&"".concat(e," start")||this.valueLabelStart||String(this.valueStart)}},{key:"renderAriaValueTextStart",get:function(){return this.ariaValueTextStart||this.valueLabelStart||String(this.valueStart)}},{key:"renderAriaLabelEnd",get:function(){var e=this.ariaLabel;return this.range?this.ariaLabelEnd||e&&"".concat(e," end")||this.valueLabelEnd||String(this.valueEnd):e||this.valueLabel||String(this.value)}},{key:"renderAriaValueTextEnd",get:function(){return this.range?this.ariaValueTextEnd||this.valueLabelEnd||String(this.valueEnd):this.ariaValueText||this.valueLabel||String(this.value)}},{key:"focus",value:function(){var e;null===(e=this.inputEnd)||void 0===e||e.focus()}},{key:"willUpdate",value:function(e){var t,a;this.renderValueStart=e.has("valueStart")?this.valueStart:null===(t=this.inputStart)||void 0===t?void 0:t.valueAsNumber;var r=e.has("valueEnd")&&this.range||e.has("value");this.renderValueEnd=r?this.range?this.valueEnd:this.value:null===(a=this.inputEnd)||void 0===a?void 0:a.valueAsNumber,void 0!==e.get("handleStartHover")?this.toggleRippleHover(this.rippleStart,this.handleStartHover):void 0!==e.get("handleEndHover")&&this.toggleRippleHover(this.rippleEnd,this.handleEndHover)}},{key:"updated",value:function(e){if(this.range&&(this.renderValueStart=this.inputStart.valueAsNumber),this.renderValueEnd=this.inputEnd.valueAsNumber,this.range){var t=(this.max-this.min)/3;if(void 0===this.valueStart){this.inputStart.valueAsNumber=this.min+t;var a=this.inputStart.valueAsNumber;this.valueStart=this.renderValueStart=a}if(void 0===this.valueEnd){this.inputEnd.valueAsNumber=this.min+2*t;var r=this.inputEnd.valueAsNumber;this.valueEnd=this.renderValueEnd=r}}else{var i;null!==(i=this.value)&&void 0!==i||(this.value=this.renderValueEnd)}if(e.has("range")||e.has("renderValueStart")||e.has("renderValueEnd")||this.isUpdatePending){var n,l,s=null===(n=this.handleStart)||void 0===n?void 0:n.querySelector(".handleNub"),o=null===(l=this.handleEnd)||void 0===l?void 0:l.querySelector(".handleNub");this.handlesOverlapping=function(e,t){if(!e||!t)return!1;var a=e.getBoundingClientRect(),r=t.getBoundingClientRect();return!(a.top>r.bottom||a.right<r.left||a.bottom<r.top||a.left>r.right)}(s,o)}this.performUpdate()}},{key:"render",value:function(){var e,t,a,r,i=this,n=0===this.step?1:this.step,l=Math.max(this.max-this.min,n),s=this.range?((null!==(e=this.renderValueStart)&&void 0!==e?e:this.min)-this.min)/l:0,o=((null!==(t=this.renderValueEnd)&&void 0!==t?t:this.min)-this.min)/l,d={"--_start-fraction":String(s),"--_end-fraction":String(o),"--_tick-count":String(l/n)},h={ranged:this.range},u=this.valueLabelStart||String(this.renderValueStart),p=(this.range?this.valueLabelEnd:this.valueLabel)||String(this.renderValueEnd),m={start:!0,value:this.renderValueStart,ariaLabel:this.renderAriaLabelStart,ariaValueText:this.renderAriaValueTextStart,ariaMin:this.min,ariaMax:null!==(a=this.valueEnd)&&void 0!==a?a:this.max},b={start:!1,value:this.renderValueEnd,ariaLabel:this.renderAriaLabelEnd,ariaValueText:this.renderAriaValueTextEnd,ariaMin:this.range&&null!==(r=this.valueStart)&&void 0!==r?r:this.min,ariaMax:this.max},y={start:!0,hover:this.handleStartHover,label:u},g={start:!1,hover:this.handleEndHover,label:p},w={hover:this.handleStartHover||this.handleEndHover};return(0,v.dy)(C||(C=(0,c.Z)([' <div class="container ','" style="','"> '," "," ",' <div class="handleContainerPadded"> <div class="handleContainerBlock"> <div class="handleContainer ','"> '," "," </div> </div> </div> </div>"])),(0,k.$)(h),(0,_.V)(d),f(this.range,(function(){return i.renderInput(m)})),this.renderInput(b),this.renderTrack(),(0,k.$)(w),f(this.range,(function(){return i.renderHandle(y)})),this.renderHandle(g))}},{key:"renderTrack",value:function(){return(0,v.dy)(A||(A=(0,c.Z)([' <div class="track"></div> '," "])),this.ticks?(0,v.dy)(Z||(Z=(0,c.Z)(['<div class="tickmarks"></div>']))):v.Ld)}},{key:"renderLabel",value:function(e){return(0,v.dy)(N||(N=(0,c.Z)(['<div class="label" aria-hidden="true"> <span class="labelContent" part="label">',"</span> </div>"])),e)}},{key:"renderHandle",value:function(e){var t=this,a=e.start,r=e.hover,i=e.label,n=!this.disabled&&a===this.startOnTop,l=!this.disabled&&this.handlesOverlapping,s=a?"start":"end";return(0,v.dy)(T||(T=(0,c.Z)(['<div class="handle ','"> <div class="handleNub"><md-elevation></md-elevation></div> ',' <md-focus-ring part="focus-ring" for="','"></md-focus-ring> <md-ripple for="','" class="','" ?disabled="','"></md-ripple> </div>'])),(0,k.$)((0,b.Z)((0,b.Z)((0,b.Z)((0,b.Z)({},s,!0),"hover",r),"onTop",n),"isOverlapping",l)),f(this.labeled,(function(){return t.renderLabel(i)})),s,s,s,this.disabled)}},{key:"renderInput",value:function(e){var t=e.start,a=e.value,r=e.ariaLabel,i=e.ariaValueText,n=e.ariaMin,l=e.ariaMax,s=t?"start":"end";return(0,v.dy)(L||(L=(0,c.Z)(['<input type="range" class="','" @focus="','" @pointerdown="','" @pointerup="','" @pointerenter="','" @pointermove="','" @pointerleave="','" @keydown="','" @keyup="','" @input="','" @change="','" id="','" .disabled="','" .min="','" aria-valuemin="','" .max="','" aria-valuemax="','" .step="','" .value="','" .tabIndex="','" aria-label="','" aria-valuetext="','">'])),(0,k.$)({start:t,end:!t}),this.handleFocus,this.handleDown,this.handleUp,this.handleEnter,this.handleMove,this.handleLeave,this.handleKeydown,this.handleKeyup,this.handleInput,this.handleChange,s,this.disabled,String(this.min),n,String(this.max),l,String(this.step),String(a),t?1:0,r||v.Ld,i)}},{key:"toggleRippleHover",value:(r=(0,m.Z)((0,p.Z)().mark((function e(t,a){var r;return(0,p.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,t;case 2:if(r=e.sent){e.next=5;break}return e.abrupt("return");case 5:a?r.handlePointerenter(new PointerEvent("pointerenter",{isPrimary:!0,pointerId:this.ripplePointerId})):r.handlePointerleave(new PointerEvent("pointerleave",{isPrimary:!0,pointerId:this.ripplePointerId}));case 6:case"end":return e.stop()}}),e,this)}))),function(e,t){return r.apply(this,arguments)})},{key:"handleFocus",value:function(e){this.updateOnTop(e.target)}},{key:"startAction",value:function(e){var t=e.target,a=t===this.inputStart?this.inputEnd:this.inputStart;this.action={canFlip:"pointerdown"===e.type,flipped:!1,target:t,fixed:a,values:new Map([[t,t.valueAsNumber],[a,null==a?void 0:a.valueAsNumber]])}}},{key:"finishAction",value:function(e){this.action=void 0}},{key:"handleKeydown",value:function(e){this.startAction(e)}},{key:"handleKeyup",value:function(e){this.finishAction(e)}},{key:"handleDown",value:function(e){this.startAction(e),this.ripplePointerId=e.pointerId;var t=e.target===this.inputStart;this.handleStartHover=!this.disabled&&t&&Boolean(this.handleStart),this.handleEndHover=!this.disabled&&!t&&Boolean(this.handleEnd)}},{key:"handleUp",value:(a=(0,m.Z)((0,p.Z)().mark((function e(t){var a,r,i,n;return(0,p.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.action){e.next=2;break}return e.abrupt("return");case 2:return a=this.action,r=a.target,i=a.values,n=a.flipped,e.next=5,new Promise(requestAnimationFrame);case 5:void 0!==r&&(r.focus(),n&&r.valueAsNumber!==i.get(r)&&r.dispatchEvent(new Event("change",{bubbles:!0}))),this.finishAction(t);case 7:case"end":return e.stop()}}),e,this)}))),function(e){return a.apply(this,arguments)})},{key:"handleMove",value:function(e){this.handleStartHover=!this.disabled&&X(e,this.handleStart),this.handleEndHover=!this.disabled&&X(e,this.handleEnd)}},{key:"handleEnter",value:function(e){this.handleMove(e)}},{key:"handleLeave",value:function(){this.handleStartHover=!1,this.handleEndHover=!1}},{key:"updateOnTop",value:function(e){this.startOnTop=e.classList.contains("start")}},{key:"needsClamping",value:function(){if(!this.action)return!1;var e=this.action,t=e.target,a=e.fixed;return t===this.inputStart?t.valueAsNumber>a.valueAsNumber:t.valueAsNumber<a.valueAsNumber}},{key:"isActionFlipped",value:function(){var e=this.action;if(!e)return!1;var t=e.target,a=e.fixed,r=e.values;e.canFlip&&(r.get(t)===r.get(a)&&this.needsClamping()&&(e.canFlip=!1,e.flipped=!0,e.target=a,e.fixed=t));return e.flipped}},{key:"flipAction",value:function(){if(!this.action)return!1;var e=this.action,t=e.target,a=e.fixed,r=e.values,i=t.valueAsNumber!==a.valueAsNumber;return t.valueAsNumber=a.valueAsNumber,a.valueAsNumber=r.get(a),i}},{key:"clampAction",value:function(){if(!this.needsClamping()||!this.action)return!1;var e=this.action,t=e.target,a=e.fixed;return t.valueAsNumber=a.valueAsNumber,!0}},{key:"handleInput",value:function(e){if(!this.isRedispatchingEvent){var t=!1,a=!1;this.range&&(this.isActionFlipped()&&(t=!0,a=this.flipAction()),this.clampAction()&&(t=!0,a=!1));var r=e.target;this.updateOnTop(r),this.range?(this.valueStart=this.inputStart.valueAsNumber,this.valueEnd=this.inputEnd.valueAsNumber):this.value=this.inputEnd.valueAsNumber,t&&e.stopPropagation(),a&&(this.isRedispatchingEvent=!0,g(r,e),this.isRedispatchingEvent=!1)}}},{key:"handleChange",value:function(e){var t,a=e.target,r=null!==(t=this.action)&&void 0!==t?t:{},i=r.target,n=r.values;i&&i.valueAsNumber===n.get(a)||g(this,e),this.finishAction(e)}},{key:O,value:function(){if(this.range){var e=new FormData;return e.append(this.nameStart,String(this.valueStart)),e.append(this.nameEnd,String(this.valueEnd)),e}return String(this.value)}},{key:"formResetCallback",value:function(){if(this.range){var e=this.getAttribute("value-start");this.valueStart=null!==e?Number(e):void 0;var t=this.getAttribute("value-end");this.valueEnd=null!==t?Number(t):void 0}else{var a=this.getAttribute("value");this.value=null!==a?Number(a):void 0}}},{key:"formStateRestoreCallback",value:function(e){if(Array.isArray(e)){var t=(0,u.Z)(e,2),a=(0,u.Z)(t[0],2)[1],r=(0,u.Z)(t[1],2)[1];return this.valueStart=Number(a),this.valueEnd=Number(r),void(this.range=!0)}this.value=Number(e),this.range=!1}}]),t}(F);function X(e,t){var a=e.x,r=e.y;if(!t)return!1;var i=t.getBoundingClientRect(),n=i.top,l=i.left,s=i.bottom,o=i.right;return a>=l&&a<=o&&r>=n&&r<=s}(0,y.d)(M),M.shadowRootOptions=Object.assign(Object.assign({},v.oi.shadowRootOptions),{},{delegatesFocus:!0}),(0,o.__decorate)([(0,d.Cb)({type:Number})],M.prototype,"min",void 0),(0,o.__decorate)([(0,d.Cb)({type:Number})],M.prototype,"max",void 0),(0,o.__decorate)([(0,d.Cb)({type:Number})],M.prototype,"value",void 0),(0,o.__decorate)([(0,d.Cb)({type:Number,attribute:"value-start"})],M.prototype,"valueStart",void 0),(0,o.__decorate)([(0,d.Cb)({type:Number,attribute:"value-end"})],M.prototype,"valueEnd",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"value-label"})],M.prototype,"valueLabel",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"value-label-start"})],M.prototype,"valueLabelStart",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"value-label-end"})],M.prototype,"valueLabelEnd",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"aria-label-start"})],M.prototype,"ariaLabelStart",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"aria-valuetext-start"})],M.prototype,"ariaValueTextStart",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"aria-label-end"})],M.prototype,"ariaLabelEnd",void 0),(0,o.__decorate)([(0,d.Cb)({attribute:"aria-valuetext-end"})],M.prototype,"ariaValueTextEnd",void 0),(0,o.__decorate)([(0,d.Cb)({type:Number})],M.prototype,"step",void 0),(0,o.__decorate)([(0,d.Cb)({type:Boolean})],M.prototype,"ticks",void 0),(0,o.__decorate)([(0,d.Cb)({type:Boolean})],M.prototype,"labeled",void 0),(0,o.__decorate)([(0,d.Cb)({type:Boolean})],M.prototype,"range",void 0),(0,o.__decorate)([(0,d.IO)("input.start")],M.prototype,"inputStart",void 0),(0,o.__decorate)([(0,d.IO)(".handle.start")],M.prototype,"handleStart",void 0),(0,o.__decorate)([(0,d.GC)("md-ripple.start")],M.prototype,"rippleStart",void 0),(0,o.__decorate)([(0,d.IO)("input.end")],M.prototype,"inputEnd",void 0),(0,o.__decorate)([(0,d.IO)(".handle.end")],M.prototype,"handleEnd",void 0),(0,o.__decorate)([(0,d.GC)("md-ripple.end")],M.prototype,"rippleEnd",void 0),(0,o.__decorate)([(0,d.SB)()],M.prototype,"handleStartHover",void 0),(0,o.__decorate)([(0,d.SB)()],M.prototype,"handleEndHover",void 0),(0,o.__decorate)([(0,d.SB)()],M.prototype,"startOnTop",void 0),(0,o.__decorate)([(0,d.SB)()],M.prototype,"handlesOverlapping",void 0),(0,o.__decorate)([(0,d.SB)()],M.prototype,"renderValueStart",void 0),(0,o.__decorate)([(0,d.SB)()],M.prototype,"renderValueEnd",void 0);var U=(0,v.iv)(R||(R=(0,c.Z)([':host{--_active-track-color:var(--md-slider-active-track-color, var(--md-sys-color-primary, #6750a4));--_active-track-height:var(--md-slider-active-track-height, 4px);--_active-track-shape:var(--md-slider-active-track-shape, 9999px);--_disabled-active-track-color:var(--md-slider-disabled-active-track-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-active-track-opacity:var(--md-slider-disabled-active-track-opacity, 0.38);--_disabled-handle-color:var(--md-slider-disabled-handle-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-handle-elevation:var(--md-slider-disabled-handle-elevation, 0);--_disabled-inactive-track-color:var(--md-slider-disabled-inactive-track-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-inactive-track-opacity:var(--md-slider-disabled-inactive-track-opacity, 0.12);--_focus-handle-color:var(--md-slider-focus-handle-color, var(--md-sys-color-primary, #6750a4));--_handle-color:var(--md-slider-handle-color, var(--md-sys-color-primary, #6750a4));--_handle-elevation:var(--md-slider-handle-elevation, 1);--_handle-height:var(--md-slider-handle-height, 20px);--_handle-shadow-color:var(--md-slider-handle-shadow-color, var(--md-sys-color-shadow, #000));--_handle-shape:var(--md-slider-handle-shape, 9999px);--_handle-width:var(--md-slider-handle-width, 20px);--_hover-handle-color:var(--md-slider-hover-handle-color, var(--md-sys-color-primary, #6750a4));--_hover-state-layer-color:var(--md-slider-hover-state-layer-color, var(--md-sys-color-primary, #6750a4));--_hover-state-layer-opacity:var(--md-slider-hover-state-layer-opacity, 0.08);--_inactive-track-color:var(--md-slider-inactive-track-color, var(--md-sys-color-surface-container-highest, #e6e0e9));--_inactive-track-height:var(--md-slider-inactive-track-height, 4px);--_inactive-track-shape:var(--md-slider-inactive-track-shape, 9999px);--_label-container-color:var(--md-slider-label-container-color, var(--md-sys-color-primary, #6750a4));--_label-container-height:var(--md-slider-label-container-height, 28px);--_pressed-handle-color:var(--md-slider-pressed-handle-color, var(--md-sys-color-primary, #6750a4));--_pressed-state-layer-color:var(--md-slider-pressed-state-layer-color, var(--md-sys-color-primary, #6750a4));--_pressed-state-layer-opacity:var(--md-slider-pressed-state-layer-opacity, 0.12);--_state-layer-size:var(--md-slider-state-layer-size, 40px);--_with-overlap-handle-outline-color:var(--md-slider-with-overlap-handle-outline-color, var(--md-sys-color-on-primary, #fff));--_with-overlap-handle-outline-width:var(--md-slider-with-overlap-handle-outline-width, 1px);--_with-tick-marks-active-container-color:var(--md-slider-with-tick-marks-active-container-color, var(--md-sys-color-on-primary, #fff));--_with-tick-marks-container-size:var(--md-slider-with-tick-marks-container-size, 2px);--_with-tick-marks-disabled-container-color:var(--md-slider-with-tick-marks-disabled-container-color, var(--md-sys-color-on-surface, #1d1b20));--_with-tick-marks-inactive-container-color:var(--md-slider-with-tick-marks-inactive-container-color, var(--md-sys-color-on-surface-variant, #49454f));--_label-text-color:var(--md-slider-label-text-color, var(--md-sys-color-on-primary, #fff));--_label-text-font:var(--md-slider-label-text-font, var(--md-sys-typescale-label-medium-font, var(--md-ref-typeface-plain, Roboto)));--_label-text-line-height:var(--md-slider-label-text-line-height, var(--md-sys-typescale-label-medium-line-height, 1rem));--_label-text-size:var(--md-slider-label-text-size, var(--md-sys-typescale-label-medium-size, 0.75rem));--_label-text-weight:var(--md-slider-label-text-weight, var(--md-sys-typescale-label-medium-weight, var(--md-ref-typeface-weight-medium, 500)));--_start-fraction:0;--_end-fraction:0;--_tick-count:0;display:inline-flex;vertical-align:middle;min-inline-size:200px;--md-elevation-level:var(--_handle-elevation);--md-elevation-shadow-color:var(--_handle-shadow-color)}md-focus-ring{height:48px;inset:unset;width:48px}md-elevation{transition-duration:250ms}@media(prefers-reduced-motion){.label{transition-duration:0}}:host([disabled]){opacity:var(--_disabled-active-track-opacity);--md-elevation-level:var(--_disabled-handle-elevation)}.container{flex:1;display:flex;align-items:center;position:relative;block-size:var(--_state-layer-size);pointer-events:none;touch-action:none}.tickmarks,.track{position:absolute;inset:0;display:flex;align-items:center}.tickmarks::after,.tickmarks::before,.track::after,.track::before{position:absolute;content:"";inset-inline-start:calc(var(--_state-layer-size)/ 2 - var(--_with-tick-marks-container-size));inset-inline-end:calc(var(--_state-layer-size)/ 2 - var(--_with-tick-marks-container-size));background-size:calc((100% - var(--_with-tick-marks-container-size)*2)/ var(--_tick-count)) 100%}.tickmarks::before,.track::before{block-size:var(--_inactive-track-height);border-radius:var(--_inactive-track-shape)}.track::before{background-color:var(--_inactive-track-color)}.tickmarks::before{background-image:radial-gradient(circle at var(--_with-tick-marks-container-size) center,var(--_with-tick-marks-inactive-container-color) 0,var(--_with-tick-marks-inactive-container-color) calc(var(--_with-tick-marks-container-size)/ 2),transparent calc(var(--_with-tick-marks-container-size)/ 2))}:host([disabled]) .track::before{opacity:calc(1/var(--_disabled-active-track-opacity)*var(--_disabled-inactive-track-opacity));background-color:var(--_disabled-inactive-track-color)}.tickmarks::after,.track::after{block-size:var(--_active-track-height);border-radius:var(--_active-track-shape);clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))) 0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)))}.track::after{background-color:var(--_active-track-color)}.tickmarks::after{background-image:radial-gradient(circle at var(--_with-tick-marks-container-size) center,var(--_with-tick-marks-active-container-color) 0,var(--_with-tick-marks-active-container-color) calc(var(--_with-tick-marks-container-size)/ 2),transparent calc(var(--_with-tick-marks-container-size)/ 2))}:host-context([dir=rtl]) .track::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host([dir=rtl]) .track::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}.track:dir(rtl)::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host-context([dir=rtl]) .tickmarks::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host([dir=rtl]) .tickmarks::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}.tickmarks:dir(rtl)::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host([disabled]) .track::after{background-color:var(--_disabled-active-track-color)}:host([disabled]) .tickmarks::before{background-image:radial-gradient(circle at var(--_with-tick-marks-container-size) center,var(--_with-tick-marks-disabled-container-color) 0,var(--_with-tick-marks-disabled-container-color) calc(var(--_with-tick-marks-container-size)/ 2),transparent calc(var(--_with-tick-marks-container-size)/ 2))}.handleContainerPadded{position:relative;block-size:100%;inline-size:100%;padding-inline:calc(var(--_state-layer-size)/2)}.handleContainerBlock{position:relative;block-size:100%;inline-size:100%}.handleContainer{position:absolute;inset-block-start:0;inset-block-end:0;inset-inline-start:calc(100%*var(--_start-fraction));inline-size:calc(100%*(var(--_end-fraction) - var(--_start-fraction)))}.handle{position:absolute;block-size:var(--_state-layer-size);inline-size:var(--_state-layer-size);border-radius:var(--_handle-shape);display:flex;place-content:center;place-items:center}.handleNub{position:absolute;height:var(--_handle-height);width:var(--_handle-width);border-radius:var(--_handle-shape);background:var(--_handle-color)}:host([disabled]) .handleNub{background:var(--_disabled-handle-color)}input.end:focus~.handleContainerPadded .handle.end>.handleNub,input.start:focus~.handleContainerPadded .handle.start>.handleNub{background:var(--_focus-handle-color)}.container>.handleContainerPadded .handle.hover>.handleNub{background:var(--_hover-handle-color)}:host(:not([disabled])) input.end:active~.handleContainerPadded .handle.end>.handleNub,:host(:not([disabled])) input.start:active~.handleContainerPadded .handle.start>.handleNub{background:var(--_pressed-handle-color)}.onTop.isOverlapping .label,.onTop.isOverlapping .label::before{outline:var(--_with-overlap-handle-outline-color) solid var(--_with-overlap-handle-outline-width)}.onTop.isOverlapping .handleNub{border:var(--_with-overlap-handle-outline-color) solid var(--_with-overlap-handle-outline-width)}.handle.start{inset-inline-start:calc(0px - var(--_state-layer-size)/ 2)}.handle.end{inset-inline-end:calc(0px - var(--_state-layer-size)/ 2)}.label{position:absolute;box-sizing:border-box;display:flex;padding:4px;place-content:center;place-items:center;border-radius:9999px;color:var(--_label-text-color);font-family:var(--_label-text-font);font-size:var(--_label-text-size);line-height:var(--_label-text-line-height);font-weight:var(--_label-text-weight);inset-block-end:100%;min-inline-size:var(--_label-container-height);min-block-size:var(--_label-container-height);background:var(--_label-container-color);transition:transform .1s cubic-bezier(.2, 0, 0, 1);transform-origin:center bottom;transform:scale(0)}.handleContainer.hover .label,:host(:focus-within) .label,:where(:has(input:active)) .label{transform:scale(1)}.label::after,.label::before{position:absolute;display:block;content:"";background:inherit}.label::before{inline-size:calc(var(--_label-container-height)/2);block-size:calc(var(--_label-container-height)/2);bottom:calc(var(--_label-container-height)/-10);transform:rotate(45deg)}.label::after{inset:0px;border-radius:inherit}.labelContent{z-index:1}input[type=range]{opacity:0;-webkit-tap-highlight-color:transparent;position:absolute;box-sizing:border-box;height:100%;width:100%;margin:0;background:rgba(0,0,0,0);cursor:pointer;pointer-events:auto;appearance:none}input[type=range]:focus{outline:0}::-webkit-slider-runnable-track{-webkit-appearance:none}::-moz-range-track{appearance:none}::-webkit-slider-thumb{-webkit-appearance:none;appearance:none;block-size:var(--_handle-height);inline-size:var(--_handle-width);opacity:0;z-index:2}input.end::-webkit-slider-thumb{--_track-and-knob-padding:calc( (var(--_state-layer-size) - var(--_handle-width)) / 2 );--_x-translate:calc( var(--_track-and-knob-padding) - 2 * var(--_end-fraction) * var(--_track-and-knob-padding) );transform:translateX(var(--_x-translate))}:host-context([dir=rtl]) input.end::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}:host([dir=rtl]) input.end::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}input.end:dir(rtl)::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}input.start::-webkit-slider-thumb{--_track-and-knob-padding:calc( (var(--_state-layer-size) - var(--_handle-width)) / 2 );--_x-translate:calc( var(--_track-and-knob-padding) - 2 * var(--_start-fraction) * var(--_track-and-knob-padding) );transform:translateX(var(--_x-translate))}:host-context([dir=rtl]) input.start::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}:host([dir=rtl]) input.start::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}input.start:dir(rtl)::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}::-moz-range-thumb{appearance:none;block-size:var(--_state-layer-size);inline-size:var(--_state-layer-size);transform:scaleX(0);opacity:0;z-index:2}.ranged input.start{clip-path:inset(0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))) 0 0)}:host-context([dir=rtl]) .ranged input.start{clip-path:inset(0 0 0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))))}:host([dir=rtl]) .ranged input.start{clip-path:inset(0 0 0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))))}.ranged input.start:dir(rtl){clip-path:inset(0 0 0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))))}.ranged input.end{clip-path:inset(0 0 0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)))}:host-context([dir=rtl]) .ranged input.end{clip-path:inset(0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)) 0 0)}:host([dir=rtl]) .ranged input.end{clip-path:inset(0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)) 0 0)}.ranged input.end:dir(rtl){clip-path:inset(0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)) 0 0)}.onTop{z-index:1}.handle{--md-ripple-hover-color:var(--_hover-state-layer-color);--md-ripple-hover-opacity:var(--_hover-state-layer-opacity);--md-ripple-pressed-color:var(--_pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_pressed-state-layer-opacity)}md-ripple{border-radius:50%;height:var(--_state-layer-size);width:var(--_state-layer-size)}']))),q=function(e){function t(){return(0,n.Z)(this,t),(0,l.Z)(this,t,arguments)}return(0,s.Z)(t,e),(0,i.Z)(t)}(M);q.styles=[U,h],q=(0,o.__decorate)([(0,d.Mo)("md-slider")],q)}}]);
+//# sourceMappingURL=2648.pfhPznS9Qwg.js.map
\ No newline at end of file
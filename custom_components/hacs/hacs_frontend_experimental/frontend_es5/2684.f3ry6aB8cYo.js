@@ -0,0 +1,2 @@
+(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2684],{3021:function(e,a,t){"use strict";t(63789),t(99397),t(51467),t(97393),t(17692),Object.defineProperty(a,"__esModule",{value:!0}),a.CanonicalCodeForDisplayNames=void 0;var r=t(77021),o=t(81784),n=/^([a-z]{2}|[0-9]{3})$/i,i=/^[a-z]{4}$/i,l=/^[a-z0-9]{3,8}([-_][a-z0-9]{3,8})*$/i;a.CanonicalCodeForDisplayNames=function(e,a){if("language"===e)return(0,r.CanonicalizeLocaleList)([a])[0];if("region"===e){if(t=a,!n.test(t))throw RangeError("invalid region");return a.toUpperCase()}var t,s;if("script"===e){if(s=a,!i.test(s))throw RangeError("invalid script");return"".concat(a[0].toUpperCase()).concat(a.slice(1).toLowerCase())}if("calendar"===e){if(!function(e){return l.test(e)}(a))throw RangeError("invalid calendar");return a.toLowerCase()}if("dateTimeField"===e){if(!(0,o.IsValidDateTimeFieldCode)(a))throw RangeError("invalid dateTimeField");return a}if((0,r.invariant)("currency"===e,"invalid type"),!(0,r.IsWellFormedCurrencyCode)(a))throw RangeError("invalid currency");return a.toUpperCase()}},81784:function(e,a,t){"use strict";t(56308),Object.defineProperty(a,"__esModule",{value:!0}),a.IsValidDateTimeFieldCode=void 0;var r=["era","year","quarter","month","weekOfYear","weekday","day","dayPeriod","hour","minute","second","timeZoneName"];a.IsValidDateTimeFieldCode=function(e){return r.indexOf(e)>=0}},68033:function(e,a,t){"use strict";var r=t(3355).default;t(51467),t(32797),t(5239),t(46798),t(94570),t(51358),t(78399),t(56086),t(47884),t(81912),t(64584),t(41483),t(12367),t(9454),t(98490),t(63789),t(99397),t(94738),t(98214),t(94418),t(38644),t(53737),t(39685),t(24074),Object.defineProperty(a,"__esModule",{value:!0}),a.DisplayNames=void 0;var o=t(43204),n=t(77021),i=t(3021),l=t(81784),s=t(46042),c=function(){function e(a,t){if(void 0===this.constructor)throw TypeError("Constructor Intl.DisplayNames requires 'new'");var o=(0,n.CanonicalizeLocaleList)(a);t=(0,n.GetOptionsObject)(t);var i=Object.create(null),l=e.localeData,c=(0,n.GetOption)(t,"localeMatcher","string",["lookup","best fit"],"best fit");i.localeMatcher=c;var d=(0,s.ResolveLocale)(Array.from(e.availableLocales),o,i,[],e.localeData,e.getDefaultLocale),u=(0,n.GetOption)(t,"style","string",["narrow","short","long"],"long");p(this,"style",u);var f=(0,n.GetOption)(t,"type","string",["language","region","script","currency","calendar","dateTimeField"],void 0);if(void 0===f)throw TypeError('Intl.DisplayNames constructor requires "type" option');p(this,"type",f),p(this,"fallback",(0,n.GetOption)(t,"fallback","string",["code","none"],"code")),p(this,"locale",d.locale);var y=d.dataLocale,v=l[y];(0,n.invariant)(!!v,"Missing locale data for ".concat(y)),p(this,"localeData",v),(0,n.invariant)(void 0!==v,"locale data for ".concat(d.locale," does not exist."));var g=v.types;(0,n.invariant)("object"===r(g)&&null!=g,"invalid types data");var b=g[f];(0,n.invariant)("object"===r(b)&&null!=b,"invalid typeFields data");var m=(0,n.GetOption)(t,"languageDisplay","string",["dialect","standard"],"dialect");if("language"===f){p(this,"languageDisplay",m);var h=g[f][m];(0,n.invariant)("object"===r(h)&&null!=h,"invalid language typeFields data")}var D="language"===f?g[f][m][u]:g[f][u];(0,n.invariant)("object"===r(D)&&null!=D,"invalid styleFields data"),p(this,"fields",D)}return e.supportedLocalesOf=function(a,t){return(0,n.SupportedLocales)(e.availableLocales,(0,n.CanonicalizeLocaleList)(a),t)},e.__addLocaleData=function(){for(var a=[],t=0;t<arguments.length;t++)a[t]=arguments[t];for(var r=0,o=a;r<o.length;r++){var n=o[r],i=n.data,l=n.locale,s=new Intl.Locale(l).minimize().toString();e.localeData[l]=e.localeData[s]=i,e.availableLocales.add(s),e.availableLocales.add(l),e.__defaultLocale||(e.__defaultLocale=s)}},e.prototype.of=function(e){f(this,"of");var a=u(this,"type"),t=(0,n.ToString)(e);if(!function(e,a){switch(e){case"language":return/^[a-z]{2,3}(-[a-z]{4})?(-([a-z]{2}|\d{3}))?(-([a-z\d]{5,8}|\d[a-z\d]{3}))*$/i.test(a);case"region":return/^([a-z]{2}|\d{3})$/i.test(a);case"script":return/^[a-z]{4}$/i.test(a);case"currency":return(0,n.IsWellFormedCurrencyCode)(a);case"calendar":return/^[a-z0-9]{3,8}([-_][a-z0-9]{3,8})*$/i.test(a);case"dateTimeField":return(0,l.IsValidDateTimeFieldCode)(a)}}(a,t))throw RangeError("invalid code for Intl.DisplayNames.prototype.of");var r,o=(0,n.getMultiInternalSlots)(d,this,"localeData","style","fallback"),s=o.localeData,c=o.style,p=o.fallback,y=(0,i.CanonicalCodeForDisplayNames)(a,t);if("language"===a){r=function(e,a,t,r,o){var n=a.types.language[e],i=n[t][r]||n.long[r];if(void 0!==i)return i;var l=/-([a-z]{2}|\d{3})\b/i.exec(r);if(l){var s=r.substring(0,l.index)+r.substring(l.index+l[0].length),c=l[1],d=n[t][s]||n.long[s];if(void 0===d||!c)return d;var u=a.types.region,p=u[t][c]||u.long[c];if(p||"code"===o)return a.patterns.locale.replace("{0}",d).replace("{1}",p||c)}}(u(this,"languageDisplay"),s,c,y,p)}else{var v=s.types[a];r=v[c][y]||v.long[y]}return void 0!==r?r:"code"===p?t:void 0},e.prototype.resolvedOptions=function(){return f(this,"resolvedOptions"),o.__assign({},(0,n.getMultiInternalSlots)(d,this,"locale","style","type","fallback","languageDisplay"))},e.getDefaultLocale=function(){return e.__defaultLocale},e.localeData={},e.availableLocales=new Set,e.__defaultLocale="",e.polyfilled=!0,e}();a.DisplayNames=c;try{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(c.prototype,Symbol.toStringTag,{value:"Intl.DisplayNames",configurable:!0,enumerable:!1,writable:!1}),Object.defineProperty(c,"length",{value:2,writable:!1,enumerable:!1,configurable:!0})}catch(y){}var d=new WeakMap;function u(e,a){return(0,n.getInternalSlot)(d,e,a)}function p(e,a,t){(0,n.setInternalSlot)(d,e,a,t)}function f(e,a){if(!(e instanceof c))throw TypeError("Method Intl.DisplayNames.prototype.".concat(a," called on incompatible receiver"))}},72684:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0});var r=t(68033);Object.defineProperty(Intl,"DisplayNames",{value:r.DisplayNames,enumerable:!1,writable:!0,configurable:!0})},3355:function(e,a,t){function r(a){return e.exports=r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,r(a)}t(94738),t(98214),t(46798),t(20254),t(51358),t(5239),t(98490),e.exports=r,e.exports.__esModule=!0,e.exports.default=e.exports}}]);
+//# sourceMappingURL=2684.f3ry6aB8cYo.js.map
\ No newline at end of file
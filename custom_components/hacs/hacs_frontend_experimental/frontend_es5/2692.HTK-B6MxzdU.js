@@ -0,0 +1,3 @@
+/*! For license information please see 2692.HTK-B6MxzdU.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2692],{82692:function(r,e,a){var i,n,s=a(33368),t=a(71650),o=a(68308),l=a(69205),c=a(43204),d=a(95260),m=a(40039),p=a(99312),f=a(81043),g=a(88962),y=a(34541),u=a(47838),b=(a(64777),a(46798),a(47084),a(76843),a(38103)),h=a(5095),_=a(53180),v=a(10694),x=a(86634),w=function(r){function e(){var r;return(0,t.Z)(this,e),(r=(0,o.Z)(this,e,arguments)).indeterminate=!1,r.progress=0,r.buffer=1,r.reverse=!1,r.closed=!1,r.stylePrimaryHalf="",r.stylePrimaryFull="",r.styleSecondaryQuarter="",r.styleSecondaryHalf="",r.styleSecondaryFull="",r.animationReady=!0,r.closedAnimationOff=!1,r.resizeObserver=null,r}var a,n;return(0,l.Z)(e,r),(0,s.Z)(e,[{key:"connectedCallback",value:function(){(0,y.Z)((0,u.Z)(e.prototype),"connectedCallback",this).call(this),this.rootEl&&this.attachResizeObserver()}},{key:"render",value:function(){var r={"mdc-linear-progress--closed":this.closed,"mdc-linear-progress--closed-animation-off":this.closedAnimationOff,"mdc-linear-progress--indeterminate":this.indeterminate,"mdc-linear-progress--animation-ready":this.animationReady},e={"--mdc-linear-progress-primary-half":this.stylePrimaryHalf,"--mdc-linear-progress-primary-half-neg":""!==this.stylePrimaryHalf?"-".concat(this.stylePrimaryHalf):"","--mdc-linear-progress-primary-full":this.stylePrimaryFull,"--mdc-linear-progress-primary-full-neg":""!==this.stylePrimaryFull?"-".concat(this.stylePrimaryFull):"","--mdc-linear-progress-secondary-quarter":this.styleSecondaryQuarter,"--mdc-linear-progress-secondary-quarter-neg":""!==this.styleSecondaryQuarter?"-".concat(this.styleSecondaryQuarter):"","--mdc-linear-progress-secondary-half":this.styleSecondaryHalf,"--mdc-linear-progress-secondary-half-neg":""!==this.styleSecondaryHalf?"-".concat(this.styleSecondaryHalf):"","--mdc-linear-progress-secondary-full":this.styleSecondaryFull,"--mdc-linear-progress-secondary-full-neg":""!==this.styleSecondaryFull?"-".concat(this.styleSecondaryFull):""},a={"flex-basis":this.indeterminate?"100%":"".concat(100*this.buffer,"%")},n={transform:this.indeterminate?"scaleX(1)":"scaleX(".concat(this.progress,")")};return(0,h.dy)(i||(i=(0,g.Z)([' <div role="progressbar" class="mdc-linear-progress ','" style="','" dir="','" aria-label="','" aria-valuemin="0" aria-valuemax="1" aria-valuenow="','" @transitionend="','"> <div class="mdc-linear-progress__buffer"> <div class="mdc-linear-progress__buffer-bar" style="','"> </div> <div class="mdc-linear-progress__buffer-dots"></div> </div> <div class="mdc-linear-progress__bar mdc-linear-progress__primary-bar" style="','"> <span class="mdc-linear-progress__bar-inner"></span> </div> <div class="mdc-linear-progress__bar mdc-linear-progress__secondary-bar"> <span class="mdc-linear-progress__bar-inner"></span> </div> </div>'])),(0,_.$)(r),(0,x.V)(e),(0,v.o)(this.reverse?"rtl":void 0),(0,v.o)(this.ariaLabel),(0,v.o)(this.indeterminate?void 0:this.progress),this.syncClosedState,(0,x.V)(a),(0,x.V)(n))}},{key:"update",value:function(r){!r.has("closed")||this.closed&&void 0!==r.get("closed")||this.syncClosedState(),(0,y.Z)((0,u.Z)(e.prototype),"update",this).call(this,r)}},{key:"firstUpdated",value:(n=(0,f.Z)((0,p.Z)().mark((function r(a){return(0,p.Z)().wrap((function(r){for(;;)switch(r.prev=r.next){case 0:(0,y.Z)((0,u.Z)(e.prototype),"firstUpdated",this).call(this,a),this.attachResizeObserver();case 2:case"end":return r.stop()}}),r,this)}))),function(r){return n.apply(this,arguments)})},{key:"syncClosedState",value:function(){this.closedAnimationOff=this.closed}},{key:"updated",value:function(r){!r.has("indeterminate")&&r.has("reverse")&&this.indeterminate&&this.restartAnimation(),r.has("indeterminate")&&void 0!==r.get("indeterminate")&&this.indeterminate&&window.ResizeObserver&&this.calculateAndSetAnimationDimensions(this.rootEl.offsetWidth),(0,y.Z)((0,u.Z)(e.prototype),"updated",this).call(this,r)}},{key:"disconnectedCallback",value:function(){this.resizeObserver&&(this.resizeObserver.disconnect(),this.resizeObserver=null),(0,y.Z)((0,u.Z)(e.prototype),"disconnectedCallback",this).call(this)}},{key:"attachResizeObserver",value:function(){var r=this;if(window.ResizeObserver)return this.resizeObserver=new window.ResizeObserver((function(e){if(r.indeterminate){var a,i=(0,m.Z)(e);try{for(i.s();!(a=i.n()).done;){var n=a.value;if(n.contentRect){var s=n.contentRect.width;r.calculateAndSetAnimationDimensions(s)}}}catch(t){i.e(t)}finally{i.f()}}})),void this.resizeObserver.observe(this.rootEl);this.resizeObserver=null}},{key:"calculateAndSetAnimationDimensions",value:function(r){var e=.8367142*r,a=2.00611057*r,i=.37651913*r,n=.84386165*r,s=1.60277782*r;this.stylePrimaryHalf="".concat(e,"px"),this.stylePrimaryFull="".concat(a,"px"),this.styleSecondaryQuarter="".concat(i,"px"),this.styleSecondaryHalf="".concat(n,"px"),this.styleSecondaryFull="".concat(s,"px"),this.restartAnimation()}},{key:"restartAnimation",value:(a=(0,f.Z)((0,p.Z)().mark((function r(){return(0,p.Z)().wrap((function(r){for(;;)switch(r.prev=r.next){case 0:return this.animationReady=!1,r.next=3,this.updateComplete;case 3:return r.next=5,new Promise(requestAnimationFrame);case 5:return this.animationReady=!0,r.next=8,this.updateComplete;case 8:case"end":return r.stop()}}),r,this)}))),function(){return a.apply(this,arguments)})},{key:"open",value:function(){this.closed=!1}},{key:"close",value:function(){this.closed=!0}}]),e}(h.oi);(0,c.__decorate)([(0,d.IO)(".mdc-linear-progress")],w.prototype,"rootEl",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean,reflect:!0})],w.prototype,"indeterminate",void 0),(0,c.__decorate)([(0,d.Cb)({type:Number})],w.prototype,"progress",void 0),(0,c.__decorate)([(0,d.Cb)({type:Number})],w.prototype,"buffer",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean,reflect:!0})],w.prototype,"reverse",void 0),(0,c.__decorate)([(0,d.Cb)({type:Boolean,reflect:!0})],w.prototype,"closed",void 0),(0,c.__decorate)([b.L,(0,d.Cb)({attribute:"aria-label"})],w.prototype,"ariaLabel",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"stylePrimaryHalf",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"stylePrimaryFull",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"styleSecondaryQuarter",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"styleSecondaryHalf",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"styleSecondaryFull",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"animationReady",void 0),(0,c.__decorate)([(0,d.SB)()],w.prototype,"closedAnimationOff",void 0);var k=(0,h.iv)(n||(n=(0,g.Z)(["@keyframes mdc-linear-progress-primary-indeterminate-translate{0%{transform:translateX(0)}20%{animation-timing-function:cubic-bezier(0.5,0,0.701732,0.495819);transform:translateX(0)}59.15%{animation-timing-function:cubic-bezier(0.302435,0.381352,0.55,0.956352);transform:translateX(83.67142%);transform:translateX(var(--mdc-linear-progress-primary-half,83.67142%))}100%{transform:translateX(200.611057%);transform:translateX(var(--mdc-linear-progress-primary-full,200.611057%))}}@keyframes mdc-linear-progress-primary-indeterminate-scale{0%{transform:scaleX(.08)}36.65%{animation-timing-function:cubic-bezier(0.334731,0.12482,0.785844,1);transform:scaleX(.08)}69.15%{animation-timing-function:cubic-bezier(0.06,0.11,0.6,1);transform:scaleX(.661479)}100%{transform:scaleX(.08)}}@keyframes mdc-linear-progress-secondary-indeterminate-translate{0%{animation-timing-function:cubic-bezier(0.15,0,0.515058,0.409685);transform:translateX(0)}25%{animation-timing-function:cubic-bezier(0.31033,0.284058,0.8,0.733712);transform:translateX(37.651913%);transform:translateX(var(--mdc-linear-progress-secondary-quarter,37.651913%))}48.35%{animation-timing-function:cubic-bezier(0.4,0.627035,0.6,0.902026);transform:translateX(84.386165%);transform:translateX(var(--mdc-linear-progress-secondary-half,84.386165%))}100%{transform:translateX(160.277782%);transform:translateX(var(--mdc-linear-progress-secondary-full,160.277782%))}}@keyframes mdc-linear-progress-secondary-indeterminate-scale{0%{animation-timing-function:cubic-bezier(0.205028,0.057051,0.57661,0.453971);transform:scaleX(.08)}19.15%{animation-timing-function:cubic-bezier(0.152313,0.196432,0.648374,1.004315);transform:scaleX(.457104)}44.15%{animation-timing-function:cubic-bezier(0.257759,-0.003163,0.211762,1.38179);transform:scaleX(.72796)}100%{transform:scaleX(.08)}}@keyframes mdc-linear-progress-buffering{from{transform:rotate(180deg) translateX(-10px)}}@keyframes mdc-linear-progress-primary-indeterminate-translate-reverse{0%{transform:translateX(0)}20%{animation-timing-function:cubic-bezier(0.5,0,0.701732,0.495819);transform:translateX(0)}59.15%{animation-timing-function:cubic-bezier(0.302435,0.381352,0.55,0.956352);transform:translateX(-83.67142%);transform:translateX(var(--mdc-linear-progress-primary-half-neg,-83.67142%))}100%{transform:translateX(-200.611057%);transform:translateX(var(--mdc-linear-progress-primary-full-neg,-200.611057%))}}@keyframes mdc-linear-progress-secondary-indeterminate-translate-reverse{0%{animation-timing-function:cubic-bezier(0.15,0,0.515058,0.409685);transform:translateX(0)}25%{animation-timing-function:cubic-bezier(0.31033,0.284058,0.8,0.733712);transform:translateX(-37.651913%);transform:translateX(var(--mdc-linear-progress-secondary-quarter-neg,-37.651913%))}48.35%{animation-timing-function:cubic-bezier(0.4,0.627035,0.6,0.902026);transform:translateX(-84.386165%);transform:translateX(var(--mdc-linear-progress-secondary-half-neg,-84.386165%))}100%{transform:translateX(-160.277782%);transform:translateX(var(--mdc-linear-progress-secondary-full-neg,-160.277782%))}}@keyframes mdc-linear-progress-buffering-reverse{from{transform:translateX(-10px)}}.mdc-linear-progress{position:relative;width:100%;transform:translateZ(0);outline:1px solid transparent;overflow:hidden;transition:opacity 250ms 0s cubic-bezier(.4, 0, .6, 1)}@media screen and (forced-colors:active){.mdc-linear-progress{outline-color:CanvasText}}.mdc-linear-progress__bar{position:absolute;width:100%;height:100%;animation:none;transform-origin:top left;transition:transform 250ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-linear-progress__bar-inner{display:inline-block;position:absolute;width:100%;animation:none;border-top-style:solid}.mdc-linear-progress__buffer{display:flex;position:absolute;width:100%;height:100%}.mdc-linear-progress__buffer-dots{background-repeat:repeat-x;flex:auto;transform:rotate(180deg);animation:mdc-linear-progress-buffering 250ms infinite linear}.mdc-linear-progress__buffer-bar{flex:0 1 100%;transition:flex-basis 250ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-linear-progress__primary-bar{transform:scaleX(0)}.mdc-linear-progress__secondary-bar{display:none}.mdc-linear-progress--indeterminate .mdc-linear-progress__bar{transition:none}.mdc-linear-progress--indeterminate .mdc-linear-progress__primary-bar{left:-145.166611%}.mdc-linear-progress--indeterminate .mdc-linear-progress__secondary-bar{left:-54.888891%;display:block}.mdc-linear-progress--indeterminate.mdc-linear-progress--animation-ready .mdc-linear-progress__primary-bar{animation:mdc-linear-progress-primary-indeterminate-translate 2s infinite linear}.mdc-linear-progress--indeterminate.mdc-linear-progress--animation-ready .mdc-linear-progress__primary-bar>.mdc-linear-progress__bar-inner{animation:mdc-linear-progress-primary-indeterminate-scale 2s infinite linear}.mdc-linear-progress--indeterminate.mdc-linear-progress--animation-ready .mdc-linear-progress__secondary-bar{animation:mdc-linear-progress-secondary-indeterminate-translate 2s infinite linear}.mdc-linear-progress--indeterminate.mdc-linear-progress--animation-ready .mdc-linear-progress__secondary-bar>.mdc-linear-progress__bar-inner{animation:mdc-linear-progress-secondary-indeterminate-scale 2s infinite linear}.mdc-linear-progress[dir=rtl]:not([dir=ltr]) .mdc-linear-progress__bar,[dir=rtl] .mdc-linear-progress:not([dir=ltr]) .mdc-linear-progress__bar{right:0;-webkit-transform-origin:center right;transform-origin:center right}.mdc-linear-progress[dir=rtl]:not([dir=ltr]).mdc-linear-progress--animation-ready .mdc-linear-progress__primary-bar,[dir=rtl] .mdc-linear-progress:not([dir=ltr]).mdc-linear-progress--animation-ready .mdc-linear-progress__primary-bar{animation-name:mdc-linear-progress-primary-indeterminate-translate-reverse}.mdc-linear-progress[dir=rtl]:not([dir=ltr]).mdc-linear-progress--animation-ready .mdc-linear-progress__secondary-bar,[dir=rtl] .mdc-linear-progress:not([dir=ltr]).mdc-linear-progress--animation-ready .mdc-linear-progress__secondary-bar{animation-name:mdc-linear-progress-secondary-indeterminate-translate-reverse}.mdc-linear-progress[dir=rtl]:not([dir=ltr]) .mdc-linear-progress__buffer-dots,[dir=rtl] .mdc-linear-progress:not([dir=ltr]) .mdc-linear-progress__buffer-dots{animation:mdc-linear-progress-buffering-reverse 250ms infinite linear;transform:rotate(0)}.mdc-linear-progress[dir=rtl]:not([dir=ltr]).mdc-linear-progress--indeterminate .mdc-linear-progress__primary-bar,[dir=rtl] .mdc-linear-progress:not([dir=ltr]).mdc-linear-progress--indeterminate .mdc-linear-progress__primary-bar{right:-145.166611%;left:auto}.mdc-linear-progress[dir=rtl]:not([dir=ltr]).mdc-linear-progress--indeterminate .mdc-linear-progress__secondary-bar,[dir=rtl] .mdc-linear-progress:not([dir=ltr]).mdc-linear-progress--indeterminate .mdc-linear-progress__secondary-bar{right:-54.888891%;left:auto}.mdc-linear-progress--closed{opacity:0}.mdc-linear-progress--closed-animation-off .mdc-linear-progress__buffer-dots{animation:none}.mdc-linear-progress--closed-animation-off.mdc-linear-progress--indeterminate .mdc-linear-progress__bar,.mdc-linear-progress--closed-animation-off.mdc-linear-progress--indeterminate .mdc-linear-progress__bar .mdc-linear-progress__bar-inner{animation:none}.mdc-linear-progress__bar-inner{border-color:#6200ee;border-color:var(--mdc-theme-primary,#6200ee)}.mdc-linear-progress__buffer-dots{background-image:url(\"data:image/svg+xml,%3Csvg version='1.1' xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' x='0px' y='0px' enable-background='new 0 0 5 2' xml:space='preserve' viewBox='0 0 5 2' preserveAspectRatio='none slice'%3E%3Ccircle cx='1' cy='1' r='1' fill='%23e6e6e6'/%3E%3C/svg%3E\")}.mdc-linear-progress__buffer-bar{background-color:#e6e6e6}.mdc-linear-progress{height:4px}.mdc-linear-progress__bar-inner{border-top-width:4px}.mdc-linear-progress__buffer-dots{background-size:10px 4px}:host{display:block}.mdc-linear-progress__buffer-bar{background-color:#e6e6e6;background-color:var(--mdc-linear-progress-buffer-color,#e6e6e6)}.mdc-linear-progress__buffer-dots{background-image:url(\"data:image/svg+xml,%3Csvg version='1.1' xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' x='0px' y='0px' enable-background='new 0 0 5 2' xml:space='preserve' viewBox='0 0 5 2' preserveAspectRatio='none slice'%3E%3Ccircle cx='1' cy='1' r='1' fill='%23e6e6e6'/%3E%3C/svg%3E\");background-image:var(--mdc-linear-progress-buffering-dots-image, url(\"data:image/svg+xml,%3Csvg version='1.1' xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' x='0px' y='0px' enable-background='new 0 0 5 2' xml:space='preserve' viewBox='0 0 5 2' preserveAspectRatio='none slice'%3E%3Ccircle cx='1' cy='1' r='1' fill='%23e6e6e6'/%3E%3C/svg%3E\"))}"]))),X=function(r){function e(){return(0,t.Z)(this,e),(0,o.Z)(this,e,arguments)}return(0,l.Z)(e,r),(0,s.Z)(e)}(w);X.styles=[k],X=(0,c.__decorate)([(0,d.Mo)("mwc-linear-progress")],X)}}]);
+//# sourceMappingURL=2692.HTK-B6MxzdU.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2771],{43342:function(t){t.exports="undefined"!=typeof ArrayBuffer&&"undefined"!=typeof DataView},92515:function(t,r,n){var e=n(9881),o=n(42458),i=TypeError;t.exports=e(ArrayBuffer.prototype,"byteLength","get")||function(t){if("ArrayBuffer"!==o(t))throw new i("ArrayBuffer expected");return t.byteLength}},257:function(t,r,n){var e=n(55418),o=n(92515),i=e(ArrayBuffer.prototype.slice);t.exports=function(t){if(0!==o(t))return!1;try{return i(t,0,0),!1}catch(r){return!0}}},42438:function(t,r,n){var e=n(5813),o=n(55418),i=n(9881),a=n(21925),u=n(257),f=n(92515),c=n(28079),y=n(139),s=e.structuredClone,h=e.ArrayBuffer,p=e.DataView,d=e.TypeError,v=Math.min,g=h.prototype,A=p.prototype,l=o(g.slice),w=i(g,"resizable","get"),T=i(g,"maxByteLength","get"),x=o(A.getInt8),b=o(A.setInt8);t.exports=(y||c)&&function(t,r,n){var e,o=f(t),i=void 0===r?o:a(r),g=!w||!w(t);if(u(t))throw new d("ArrayBuffer is detached");if(y&&(t=s(t,{transfer:[t]}),o===i&&(n||g)))return t;if(o>=i&&(!n||g))e=l(t,0,i);else{var A=n&&!g&&T?{maxByteLength:T(t)}:void 0;e=new h(i,A);for(var M=new p(t),I=new p(e),E=v(i,o),L=0;L<E;L++)b(I,L,x(M,L))}return y||c(t),e}},62862:function(t,r,n){var e,o,i,a=n(43342),u=n(58849),f=n(5813),c=n(30553),y=n(38475),s=n(55229),h=n(21973),p=n(71414),d=n(52838),v=n(73936),g=n(40030),A=n(95882),l=n(2563),w=n(27248),T=n(10282),x=n(92311),b=n(12648),M=b.enforce,I=b.get,E=f.Int8Array,L=E&&E.prototype,B=f.Uint8ClampedArray,R=B&&B.prototype,m=E&&l(E),U=L&&l(L),_=Object.prototype,C=f.TypeError,O=T("toStringTag"),F=x("TYPED_ARRAY_TAG"),S="TypedArrayConstructor",V=a&&!!w&&"Opera"!==h(f.opera),W=!1,N={Int8Array:1,Uint8Array:1,Uint8ClampedArray:1,Int16Array:2,Uint16Array:2,Int32Array:4,Uint32Array:4,Float32Array:4,Float64Array:8},P={BigInt64Array:8,BigUint64Array:8},Y=function(t){var r=l(t);if(y(r)){var n=I(r);return n&&s(n,S)?n[S]:Y(r)}},k=function(t){if(!y(t))return!1;var r=h(t);return s(N,r)||s(P,r)};for(e in N)(i=(o=f[e])&&o.prototype)?M(i)[S]=o:V=!1;for(e in P)(i=(o=f[e])&&o.prototype)&&(M(i)[S]=o);if((!V||!c(m)||m===Function.prototype)&&(m=function(){throw new C("Incorrect invocation")},V))for(e in N)f[e]&&w(f[e],m);if((!V||!U||U===_)&&(U=m.prototype,V))for(e in N)f[e]&&w(f[e].prototype,U);if(V&&l(R)!==U&&w(R,U),u&&!s(U,O))for(e in W=!0,g(U,O,{configurable:!0,get:function(){return y(this)?this[F]:void 0}}),N)f[e]&&d(f[e],F,e);t.exports={NATIVE_ARRAY_BUFFER_VIEWS:V,TYPED_ARRAY_TAG:W&&F,aTypedArray:function(t){if(k(t))return t;throw new C("Target is not a typed array")},aTypedArrayConstructor:function(t){if(c(t)&&(!w||A(m,t)))return t;throw new C(p(t)+" is not a typed array constructor")},exportTypedArrayMethod:function(t,r,n,e){if(u){if(n)for(var o in N){var i=f[o];if(i&&s(i.prototype,t))try{delete i.prototype[t]}catch(a){try{i.prototype[t]=r}catch(c){}}}U[t]&&!n||v(U,t,n?r:V&&L[t]||r,e)}},exportTypedArrayStaticMethod:function(t,r,n){var e,o;if(u){if(w){if(n)for(e in N)if((o=f[e])&&s(o,t))try{delete o[t]}catch(i){}if(m[t]&&!n)return;try{return v(m,t,n?r:V&&m[t]||r)}catch(i){}}for(e in N)!(o=f[e])||o[t]&&!n||v(o,t,r)}},getTypedArrayConstructor:Y,isView:function(t){if(!y(t))return!1;var r=h(t);return"DataView"===r||s(N,r)||s(P,r)},isTypedArray:k,TypedArray:m,TypedArrayPrototype:U}},67933:function(t,r,n){var e=n(5813),o=n(55418),i=n(58849),a=n(43342),u=n(83875),f=n(52838),c=n(40030),y=n(40855),s=n(18431),h=n(85539),p=n(97673),d=n(97142),v=n(21925),g=n(84804),A=n(42767),l=n(2563),w=n(27248),T=n(65332),x=n(88755),b=n(81760),M=n(93213),I=n(48357),E=n(12648),L=u.PROPER,B=u.CONFIGURABLE,R="ArrayBuffer",m="DataView",U="prototype",_="Wrong index",C=E.getterFor(R),O=E.getterFor(m),F=E.set,S=e[R],V=S,W=V&&V[U],N=e[m],P=N&&N[U],Y=Object.prototype,k=e.Array,D=e.RangeError,j=o(T),G=o([].reverse),q=A.pack,z=A.unpack,H=function(t){return[255&t]},J=function(t){return[255&t,t>>8&255]},K=function(t){return[255&t,t>>8&255,t>>16&255,t>>24&255]},Q=function(t){return t[3]<<24|t[2]<<16|t[1]<<8|t[0]},X=function(t){return q(g(t),23,4)},Z=function(t){return q(t,52,8)},$=function(t,r,n){c(t[U],r,{configurable:!0,get:function(){return n(this)[r]}})},tt=function(t,r,n,e){var o=O(t),i=v(n),a=!!e;if(i+r>o.byteLength)throw new D(_);var u=o.bytes,f=i+o.byteOffset,c=x(u,f,f+r);return a?c:G(c)},rt=function(t,r,n,e,o,i){var a=O(t),u=v(n),f=e(+o),c=!!i;if(u+r>a.byteLength)throw new D(_);for(var y=a.bytes,s=u+a.byteOffset,h=0;h<r;h++)y[s+h]=f[c?h:r-h-1]};if(a){var nt=L&&S.name!==R;s((function(){S(1)}))&&s((function(){new S(-1)}))&&!s((function(){return new S,new S(1.5),new S(NaN),1!==S.length||nt&&!B}))?nt&&B&&f(S,"name",R):((V=function(t){return h(this,W),b(new S(v(t)),this,V)})[U]=W,W.constructor=V,M(V,S)),w&&l(P)!==Y&&w(P,Y);var et=new N(new V(2)),ot=o(P.setInt8);et.setInt8(0,2147483648),et.setInt8(1,2147483649),!et.getInt8(0)&&et.getInt8(1)||y(P,{setInt8:function(t,r){ot(this,t,r<<24>>24)},setUint8:function(t,r){ot(this,t,r<<24>>24)}},{unsafe:!0})}else W=(V=function(t){h(this,W);var r=v(t);F(this,{type:R,bytes:j(k(r),0),byteLength:r}),i||(this.byteLength=r,this.detached=!1)})[U],P=(N=function(t,r,n){h(this,P),h(t,W);var e=C(t),o=e.byteLength,a=p(r);if(a<0||a>o)throw new D("Wrong offset");if(a+(n=void 0===n?o-a:d(n))>o)throw new D("Wrong length");F(this,{type:m,buffer:t,byteLength:n,byteOffset:a,bytes:e.bytes}),i||(this.buffer=t,this.byteLength=n,this.byteOffset=a)})[U],i&&($(V,"byteLength",C),$(N,"buffer",O),$(N,"byteLength",O),$(N,"byteOffset",O)),y(P,{getInt8:function(t){return tt(this,1,t)[0]<<24>>24},getUint8:function(t){return tt(this,1,t)[0]},getInt16:function(t){var r=tt(this,2,t,arguments.length>1&&arguments[1]);return(r[1]<<8|r[0])<<16>>16},getUint16:function(t){var r=tt(this,2,t,arguments.length>1&&arguments[1]);return r[1]<<8|r[0]},getInt32:function(t){return Q(tt(this,4,t,arguments.length>1&&arguments[1]))},getUint32:function(t){return Q(tt(this,4,t,arguments.length>1&&arguments[1]))>>>0},getFloat32:function(t){return z(tt(this,4,t,arguments.length>1&&arguments[1]),23)},getFloat64:function(t){return z(tt(this,8,t,arguments.length>1&&arguments[1]),52)},setInt8:function(t,r){rt(this,1,t,H,r)},setUint8:function(t,r){rt(this,1,t,H,r)},setInt16:function(t,r){rt(this,2,t,J,r,arguments.length>2&&arguments[2])},setUint16:function(t,r){rt(this,2,t,J,r,arguments.length>2&&arguments[2])},setInt32:function(t,r){rt(this,4,t,K,r,arguments.length>2&&arguments[2])},setUint32:function(t,r){rt(this,4,t,K,r,arguments.length>2&&arguments[2])},setFloat32:function(t,r){rt(this,4,t,X,r,arguments.length>2&&arguments[2])},setFloat64:function(t,r){rt(this,8,t,Z,r,arguments.length>2&&arguments[2])}});I(V,R),I(N,m),t.exports={ArrayBuffer:V,DataView:N}},52792:function(t,r,n){var e=n(19480),o=n(73834),i=n(10228),a=n(35102),u=Math.min;t.exports=[].copyWithin||function(t,r){var n=e(this),f=i(n),c=o(t,f),y=o(r,f),s=arguments.length>2?arguments[2]:void 0,h=u((void 0===s?f:o(s,f))-y,f-c),p=1;for(y<c&&c<y+h&&(p=-1,y+=h-1,c+=h-1);h-- >0;)y in n?n[c]=n[y]:a(n,c),c+=p,y+=p;return n}},90696:function(t,r,n){var e=n(76902),o=n(70814),i=n(19480),a=n(10228),u=function(t){var r=1===t;return function(n,u,f){for(var c,y=i(n),s=o(y),h=a(s),p=e(u,f);h-- >0;)if(p(c=s[h],h,y))switch(t){case 0:return c;case 1:return h}return r?-1:void 0}};t.exports={findLast:u(0),findLastIndex:u(1)}},6641:function(t,r,n){var e=n(10228);t.exports=function(t,r){for(var n=e(t),o=new r(n),i=0;i<n;i++)o[i]=t[n-i-1];return o}},35165:function(t,r,n){var e=n(10228),o=n(97673),i=RangeError;t.exports=function(t,r,n,a){var u=e(t),f=o(n),c=f<0?u+f:f;if(c>=u||c<0)throw new i("Incorrect index");for(var y=new r(u),s=0;s<u;s++)y[s]=s===c?a:t[s];return y}},28079:function(t,r,n){var e,o,i,a,u=n(5813),f=n(24038),c=n(139),y=u.structuredClone,s=u.ArrayBuffer,h=u.MessageChannel,p=!1;if(c)p=function(t){y(t,{transfer:[t]})};else if(s)try{h||(e=f("worker_threads"))&&(h=e.MessageChannel),h&&(o=new h,i=new s(2),a=function(t){o.port1.postMessage(null,[t])},2===i.byteLength&&(a(i),0===i.byteLength&&(p=a)))}catch(d){}t.exports=p},42767:function(t){var r=Array,n=Math.abs,e=Math.pow,o=Math.floor,i=Math.log,a=Math.LN2;t.exports={pack:function(t,u,f){var c,y,s,h=r(f),p=8*f-u-1,d=(1<<p)-1,v=d>>1,g=23===u?e(2,-24)-e(2,-77):0,A=t<0||0===t&&1/t<0?1:0,l=0;for((t=n(t))!=t||t===1/0?(y=t!=t?1:0,c=d):(c=o(i(t)/a),t*(s=e(2,-c))<1&&(c--,s*=2),(t+=c+v>=1?g/s:g*e(2,1-v))*s>=2&&(c++,s/=2),c+v>=d?(y=0,c=d):c+v>=1?(y=(t*s-1)*e(2,u),c+=v):(y=t*e(2,v-1)*e(2,u),c=0));u>=8;)h[l++]=255&y,y/=256,u-=8;for(c=c<<u|y,p+=u;p>0;)h[l++]=255&c,c/=256,p-=8;return h[--l]|=128*A,h},unpack:function(t,r){var n,o=t.length,i=8*o-r-1,a=(1<<i)-1,u=a>>1,f=i-7,c=o-1,y=t[c--],s=127&y;for(y>>=7;f>0;)s=256*s+t[c--],f-=8;for(n=s&(1<<-f)-1,s>>=-f,f+=r;f>0;)n=256*n+t[c--],f-=8;if(0===s)s=1-u;else{if(s===a)return n?NaN:y?-1/0:1/0;n+=e(2,r),s-=u}return(y?-1:1)*n*e(2,s-r)}}},22407:function(t,r,n){var e=n(21973);t.exports=function(t){var r=e(t);return"BigInt64Array"===r||"BigUint64Array"===r}},37765:function(t,r,n){var e=n(24695),o=Math.abs,i=2220446049250313e-31,a=1/i;t.exports=function(t,r,n,u){var f=+t,c=o(f),y=e(f);if(c<u)return y*function(t){return t+a-a}(c/u/r)*u*r;var s=(1+r/i)*c,h=s-(s-c);return h>n||h!=h?y*(1/0):y*h}},84804:function(t,r,n){var e=n(37765);t.exports=Math.fround||function(t){return e(t,1.1920928955078125e-7,34028234663852886e22,11754943508222875e-54)}},24695:function(t){t.exports=Math.sign||function(t){var r=+t;return 0===r||r!=r?r:r<0?-1:1}},139:function(t,r,n){var e=n(5813),o=n(18431),i=n(91625),a=n(89397),u=n(37575),f=n(13089),c=e.structuredClone;t.exports=!!c&&!o((function(){if(u&&i>92||f&&i>94||a&&i>97)return!1;var t=new ArrayBuffer(8),r=c(t,{transfer:[t]});return 0!==t.byteLength||8!==r.byteLength}))},72402:function(t,r,n){var e=n(80581),o=TypeError;t.exports=function(t){var r=e(t,"number");if("number"==typeof r)throw new o("Can't convert number to bigint");return BigInt(r)}},21925:function(t,r,n){var e=n(97673),o=n(97142),i=RangeError;t.exports=function(t){if(void 0===t)return 0;var r=e(t),n=o(r);if(r!==n)throw new i("Wrong length or index");return n}},4282:function(t,r,n){var e=n(22719),o=RangeError;t.exports=function(t,r){var n=e(t);if(n%r)throw new o("Wrong offset");return n}},22719:function(t,r,n){var e=n(97673),o=RangeError;t.exports=function(t){var r=e(t);if(r<0)throw new o("The argument can't be less than 0");return r}},32902:function(t){var r=Math.round;t.exports=function(t){var n=r(t);return n<0?0:n>255?255:255&n}},24038:function(t,r,n){var e=n(13089);t.exports=function(t){try{if(e)return Function('return require("'+t+'")')()}catch(r){}}},78950:function(t,r,n){var e=n(68077),o=n(5813),i=n(43173),a=n(58849),u=n(82239),f=n(62862),c=n(67933),y=n(85539),s=n(51012),h=n(52838),p=n(3873),d=n(97142),v=n(21925),g=n(4282),A=n(32902),l=n(84297),w=n(55229),T=n(21973),x=n(38475),b=n(12052),M=n(9885),I=n(95882),E=n(27248),L=n(45919).f,B=n(26156),R=n(78856).forEach,m=n(36929),U=n(40030),_=n(54991),C=n(25245),O=n(78799),F=n(12648),S=n(81760),V=F.get,W=F.set,N=F.enforce,P=_.f,Y=C.f,k=o.RangeError,D=c.ArrayBuffer,j=D.prototype,G=c.DataView,q=f.NATIVE_ARRAY_BUFFER_VIEWS,z=f.TYPED_ARRAY_TAG,H=f.TypedArray,J=f.TypedArrayPrototype,K=f.isTypedArray,Q="BYTES_PER_ELEMENT",X="Wrong length",Z=function(t,r){U(t,r,{configurable:!0,get:function(){return V(this)[r]}})},$=function(t){var r;return I(j,t)||"ArrayBuffer"===(r=T(t))||"SharedArrayBuffer"===r},tt=function(t,r){return K(t)&&!b(r)&&r in t&&p(+r)&&r>=0},rt=function(t,r){return r=l(r),tt(t,r)?s(2,t[r]):Y(t,r)},nt=function(t,r,n){return r=l(r),!(tt(t,r)&&x(n)&&w(n,"value"))||w(n,"get")||w(n,"set")||n.configurable||w(n,"writable")&&!n.writable||w(n,"enumerable")&&!n.enumerable?P(t,r,n):(t[r]=n.value,t)};a?(q||(C.f=rt,_.f=nt,Z(J,"buffer"),Z(J,"byteOffset"),Z(J,"byteLength"),Z(J,"length")),e({target:"Object",stat:!0,forced:!q},{getOwnPropertyDescriptor:rt,defineProperty:nt}),t.exports=function(t,r,n){var a=t.match(/\d+/)[0]/8,f=t+(n?"Clamped":"")+"Array",c="get"+t,s="set"+t,p=o[f],l=p,w=l&&l.prototype,T={},b=function(t,r){P(t,r,{get:function(){return function(t,r){var n=V(t);return n.view[c](r*a+n.byteOffset,!0)}(this,r)},set:function(t){return function(t,r,e){var o=V(t);o.view[s](r*a+o.byteOffset,n?A(e):e,!0)}(this,r,t)},enumerable:!0})};q?u&&(l=r((function(t,r,n,e){return y(t,w),S(x(r)?$(r)?void 0!==e?new p(r,g(n,a),e):void 0!==n?new p(r,g(n,a)):new p(r):K(r)?O(l,r):i(B,l,r):new p(v(r)),t,l)})),E&&E(l,H),R(L(p),(function(t){t in l||h(l,t,p[t])})),l.prototype=w):(l=r((function(t,r,n,e){y(t,w);var o,u,f,c=0,s=0;if(x(r)){if(!$(r))return K(r)?O(l,r):i(B,l,r);o=r,s=g(n,a);var h=r.byteLength;if(void 0===e){if(h%a)throw new k(X);if((u=h-s)<0)throw new k(X)}else if((u=d(e)*a)+s>h)throw new k(X);f=u/a}else f=v(r),o=new D(u=f*a);for(W(t,{buffer:o,byteOffset:s,byteLength:u,length:f,view:new G(o)});c<f;)b(t,c++)})),E&&E(l,H),w=l.prototype=M(J)),w.constructor!==l&&h(w,"constructor",l),N(w).TypedArrayConstructor=l,z&&h(w,z,f);var I=l!==p;T[f]=l,e({global:!0,constructor:!0,forced:I,sham:!q},T),Q in l||h(l,Q,a),Q in w||h(w,Q,a),m(f)}):t.exports=function(){}},82239:function(t,r,n){var e=n(5813),o=n(18431),i=n(54294),a=n(62862).NATIVE_ARRAY_BUFFER_VIEWS,u=e.ArrayBuffer,f=e.Int8Array;t.exports=!a||!o((function(){f(1)}))||!o((function(){new f(-1)}))||!i((function(t){new f,new f(null),new f(1.5),new f(t)}),!0)||o((function(){return 1!==new f(new u(2),1,void 0).length}))},22970:function(t,r,n){var e=n(78799),o=n(68381);t.exports=function(t,r){return e(o(t),r)}},26156:function(t,r,n){var e=n(76902),o=n(43173),i=n(50683),a=n(19480),u=n(10228),f=n(46767),c=n(5218),y=n(21678),s=n(22407),h=n(62862).aTypedArrayConstructor,p=n(72402);t.exports=function(t){var r,n,d,v,g,A,l,w,T=i(this),x=a(t),b=arguments.length,M=b>1?arguments[1]:void 0,I=void 0!==M,E=c(x);if(E&&!y(E))for(w=(l=f(x,E)).next,x=[];!(A=o(w,l)).done;)x.push(A.value);for(I&&b>2&&(M=e(M,arguments[2])),n=u(x),d=new(h(T))(n),v=s(d),r=0;n>r;r++)g=I?M(x[r],r):x[r],d[r]=v?p(g):+g;return d}},68381:function(t,r,n){var e=n(62862),o=n(51048),i=e.aTypedArrayConstructor,a=e.getTypedArrayConstructor;t.exports=function(t){return i(o(t,a(t)))}},24829:function(t,r,n){var e=n(68077),o=n(74734),i=n(18431),a=n(67933),u=n(22933),f=n(73834),c=n(97142),y=n(51048),s=a.ArrayBuffer,h=a.DataView,p=h.prototype,d=o(s.prototype.slice),v=o(p.getUint8),g=o(p.setUint8);e({target:"ArrayBuffer",proto:!0,unsafe:!0,forced:i((function(){return!new s(2).slice(1,void 0).byteLength}))},{slice:function(t,r){if(d&&void 0===r)return d(u(this),t);for(var n=u(this).byteLength,e=f(t,n),o=f(void 0===r?n:r,n),i=new(y(this,s))(c(o-e)),a=new h(this),p=new h(i),A=0;e<o;)g(p,A++,v(a,e++));return i}})},83868:function(t,r,n){var e=n(62862),o=n(10228),i=n(97673),a=e.aTypedArray;(0,e.exportTypedArrayMethod)("at",(function(t){var r=a(this),n=o(r),e=i(t),u=e>=0?e:n+e;return u<0||u>=n?void 0:r[u]}))},75544:function(t,r,n){var e=n(55418),o=n(62862),i=e(n(52792)),a=o.aTypedArray;(0,o.exportTypedArrayMethod)("copyWithin",(function(t,r){return i(a(this),t,r,arguments.length>2?arguments[2]:void 0)}))},33435:function(t,r,n){var e=n(62862),o=n(78856).every,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("every",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},66657:function(t,r,n){var e=n(62862),o=n(65332),i=n(72402),a=n(21973),u=n(43173),f=n(55418),c=n(18431),y=e.aTypedArray,s=e.exportTypedArrayMethod,h=f("".slice);s("fill",(function(t){var r=arguments.length;y(this);var n="Big"===h(a(this),0,3)?i(t):+t;return u(o,this,n,r>1?arguments[1]:void 0,r>2?arguments[2]:void 0)}),c((function(){var t=0;return new Int8Array(2).fill({valueOf:function(){return t++}}),1!==t})))},53608:function(t,r,n){var e=n(62862),o=n(78856).filter,i=n(22970),a=e.aTypedArray;(0,e.exportTypedArrayMethod)("filter",(function(t){var r=o(a(this),t,arguments.length>1?arguments[1]:void 0);return i(this,r)}))},48112:function(t,r,n){var e=n(62862),o=n(78856).findIndex,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("findIndex",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},39588:function(t,r,n){var e=n(62862),o=n(90696).findLastIndex,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("findLastIndex",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},87323:function(t,r,n){var e=n(62862),o=n(90696).findLast,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("findLast",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},42313:function(t,r,n){var e=n(62862),o=n(78856).find,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("find",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},31871:function(t,r,n){var e=n(62862),o=n(78856).forEach,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("forEach",(function(t){o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},87753:function(t,r,n){var e=n(62862),o=n(92460).includes,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("includes",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},91843:function(t,r,n){var e=n(62862),o=n(92460).indexOf,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("indexOf",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},9979:function(t,r,n){var e=n(5813),o=n(18431),i=n(55418),a=n(62862),u=n(51358),f=n(10282)("iterator"),c=e.Uint8Array,y=i(u.values),s=i(u.keys),h=i(u.entries),p=a.aTypedArray,d=a.exportTypedArrayMethod,v=c&&c.prototype,g=!o((function(){v[f].call([1])})),A=!!v&&v.values&&v[f]===v.values&&"values"===v.values.name,l=function(){return y(p(this))};d("entries",(function(){return h(p(this))}),g),d("keys",(function(){return s(p(this))}),g),d("values",l,g||!A,{name:"values"}),d(f,l,g||!A,{name:"values"})},34497:function(t,r,n){var e=n(62862),o=n(55418),i=e.aTypedArray,a=e.exportTypedArrayMethod,u=o([].join);a("join",(function(t){return u(i(this),t)}))},39912:function(t,r,n){var e=n(62862),o=n(35449),i=n(6057),a=e.aTypedArray;(0,e.exportTypedArrayMethod)("lastIndexOf",(function(t){var r=arguments.length;return o(i,a(this),r>1?[t,arguments[1]]:[t])}))},76751:function(t,r,n){var e=n(62862),o=n(78856).map,i=n(68381),a=e.aTypedArray;(0,e.exportTypedArrayMethod)("map",(function(t){return o(a(this),t,arguments.length>1?arguments[1]:void 0,(function(t,r){return new(i(t))(r)}))}))},32369:function(t,r,n){var e=n(62862),o=n(42439).right,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("reduceRight",(function(t){var r=arguments.length;return o(i(this),t,r,r>1?arguments[1]:void 0)}))},44988:function(t,r,n){var e=n(62862),o=n(42439).left,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("reduce",(function(t){var r=arguments.length;return o(i(this),t,r,r>1?arguments[1]:void 0)}))},39832:function(t,r,n){var e=n(62862),o=e.aTypedArray,i=e.exportTypedArrayMethod,a=Math.floor;i("reverse",(function(){for(var t,r=this,n=o(r).length,e=a(n/2),i=0;i<e;)t=r[i],r[i++]=r[--n],r[n]=t;return r}))},83327:function(t,r,n){var e=n(5813),o=n(43173),i=n(62862),a=n(10228),u=n(4282),f=n(19480),c=n(18431),y=e.RangeError,s=e.Int8Array,h=s&&s.prototype,p=h&&h.set,d=i.aTypedArray,v=i.exportTypedArrayMethod,g=!c((function(){var t=new Uint8ClampedArray(2);return o(p,t,{length:1,0:3},1),3!==t[1]})),A=g&&i.NATIVE_ARRAY_BUFFER_VIEWS&&c((function(){var t=new s(2);return t.set(1),t.set("2",1),0!==t[0]||2!==t[1]}));v("set",(function(t){d(this);var r=u(arguments.length>1?arguments[1]:void 0,1),n=f(t);if(g)return o(p,this,n,r);var e=this.length,i=a(n),c=0;if(i+r>e)throw new y("Wrong length");for(;c<i;)this[r+c]=n[c++]}),!g||A)},47475:function(t,r,n){var e=n(62862),o=n(68381),i=n(18431),a=n(88755),u=e.aTypedArray;(0,e.exportTypedArrayMethod)("slice",(function(t,r){for(var n=a(u(this),t,r),e=o(this),i=0,f=n.length,c=new e(f);f>i;)c[i]=n[i++];return c}),i((function(){new Int8Array(1).slice()})))},94010:function(t,r,n){var e=n(62862),o=n(78856).some,i=e.aTypedArray;(0,e.exportTypedArrayMethod)("some",(function(t){return o(i(this),t,arguments.length>1?arguments[1]:void 0)}))},64085:function(t,r,n){var e=n(5813),o=n(74734),i=n(18431),a=n(9160),u=n(8273),f=n(62862),c=n(39860),y=n(93712),s=n(91625),h=n(82803),p=f.aTypedArray,d=f.exportTypedArrayMethod,v=e.Uint16Array,g=v&&o(v.prototype.sort),A=!(!g||i((function(){g(new v(2),null)}))&&i((function(){g(new v(2),{})}))),l=!!g&&!i((function(){if(s)return s<74;if(c)return c<67;if(y)return!0;if(h)return h<602;var t,r,n=new v(516),e=Array(516);for(t=0;t<516;t++)r=t%4,n[t]=515-t,e[t]=t-2*r+3;for(g(n,(function(t,r){return(t/4|0)-(r/4|0)})),t=0;t<516;t++)if(n[t]!==e[t])return!0}));d("sort",(function(t){return void 0!==t&&a(t),l?g(this,t):u(p(this),function(t){return function(r,n){return void 0!==t?+t(r,n)||0:n!=n?-1:r!=r?1:0===r&&0===n?1/r>0&&1/n<0?1:-1:r>n}}(t))}),!l||A)},56399:function(t,r,n){var e=n(62862),o=n(97142),i=n(73834),a=n(68381),u=e.aTypedArray;(0,e.exportTypedArrayMethod)("subarray",(function(t,r){var n=u(this),e=n.length,f=i(t,e);return new(a(n))(n.buffer,n.byteOffset+f*n.BYTES_PER_ELEMENT,o((void 0===r?e:i(r,e))-f))}))},16149:function(t,r,n){var e=n(5813),o=n(35449),i=n(62862),a=n(18431),u=n(88755),f=e.Int8Array,c=i.aTypedArray,y=i.exportTypedArrayMethod,s=[].toLocaleString,h=!!f&&a((function(){s.call(new f(1))}));y("toLocaleString",(function(){return o(s,h?u(c(this)):c(this),u(arguments))}),a((function(){return[1,2].toLocaleString()!==new f([1,2]).toLocaleString()}))||!a((function(){f.prototype.toLocaleString.call([1,2])})))},39891:function(t,r,n){var e=n(6641),o=n(62862),i=o.aTypedArray,a=o.exportTypedArrayMethod,u=o.getTypedArrayConstructor;a("toReversed",(function(){return e(i(this),u(this))}))},20459:function(t,r,n){var e=n(62862),o=n(55418),i=n(9160),a=n(78799),u=e.aTypedArray,f=e.getTypedArrayConstructor,c=e.exportTypedArrayMethod,y=o(e.TypedArrayPrototype.sort);c("toSorted",(function(t){void 0!==t&&i(t);var r=u(this),n=a(f(r),r);return y(n,t)}))},89664:function(t,r,n){var e=n(62862).exportTypedArrayMethod,o=n(18431),i=n(5813),a=n(55418),u=i.Uint8Array,f=u&&u.prototype||{},c=[].toString,y=a([].join);o((function(){c.call({})}))&&(c=function(){return y(this)});var s=f.toString!==c;e("toString",c,s)},92478:function(t,r,n){var e=n(35165),o=n(62862),i=n(22407),a=n(97673),u=n(72402),f=o.aTypedArray,c=o.getTypedArrayConstructor,y=o.exportTypedArrayMethod,s=!!function(){try{new Int8Array(1).with(2,{valueOf:function(){throw 8}})}catch(t){return 8===t}}();y("with",{with:function(t,r){var n=f(this),o=a(t),y=i(n)?u(r):+r;return e(n,c(n),o,y)}}.with,!s)},60731:function(t,r,n){var e=n(58849),o=n(40030),i=n(257),a=ArrayBuffer.prototype;e&&!("detached"in a)&&o(a,"detached",{configurable:!0,get:function(){return i(this)}})},93330:function(t,r,n){var e=n(68077),o=n(42438);o&&e({target:"ArrayBuffer",proto:!0},{transferToFixedLength:function(){return o(this,arguments.length?arguments[0]:void 0,!1)}})},51964:function(t,r,n){var e=n(68077),o=n(42438);o&&e({target:"ArrayBuffer",proto:!0},{transfer:function(){return o(this,arguments.length?arguments[0]:void 0,!0)}})}}]);
+//# sourceMappingURL=2771.fNg7fsMnGBE.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[2802],{86089:function(e,t,i){i.d(t,{U:function(){return n}});var n=function(e){return e.stopPropagation()}},50057:function(e,t,i){var n=i(33368),a=i(71650),l=i(68308),r=i(82390),o=i(69205),d=i(91808),s=(i(97393),i(34131),i(18846)),c=i(95260);(0,d.Z)([(0,c.Mo)("ha-chip-set")],(function(e,t){var i=function(t){function i(){var t;(0,a.Z)(this,i);for(var n=arguments.length,o=new Array(n),d=0;d<n;d++)o[d]=arguments[d];return t=(0,l.Z)(this,i,[].concat(o)),e((0,r.Z)(t)),t}return(0,o.Z)(i,t),(0,n.Z)(i)}(t);return{F:i,d:[]}}),s.l)},74376:function(e,t,i){var n,a=i(88962),l=i(33368),r=i(71650),o=i(68308),d=i(82390),s=i(69205),c=i(91808),u=(i(97393),i(58417)),h=i(39274),v=i(5095),f=i(95260);(0,c.Z)([(0,f.Mo)("ha-checkbox")],(function(e,t){var i=function(t){function i(){var t;(0,r.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,o.Z)(this,i,[].concat(a)),e((0,d.Z)(t)),t}return(0,s.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[h.W,(0,v.iv)(n||(n=(0,a.Z)([":host{--mdc-theme-secondary:var(--primary-color)}"])))]}}]}}),u.A)},48950:function(e,t,i){var n,a=i(88962),l=i(33368),r=i(71650),o=i(68308),d=i(82390),s=i(69205),c=i(91808),u=(i(97393),i(8485)),h=i(92038),v=i(5095),f=i(95260),p=i(18394);(0,c.Z)([(0,f.Mo)("ha-formfield")],(function(e,t){var i=function(t){function i(){var t;(0,r.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,o.Z)(this,i,[].concat(a)),e((0,d.Z)(t)),t}return(0,s.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"_labelClick",value:function(){var e=this.input;if(e&&(e.focus(),!e.disabled))switch(e.tagName){case"HA-CHECKBOX":e.checked=!e.checked,(0,p.B)(e,"change");break;case"HA-RADIO":e.checked=!0,(0,p.B)(e,"change");break;default:e.click()}}},{kind:"field",static:!0,key:"styles",value:function(){return[h.W,(0,v.iv)(n||(n=(0,a.Z)([":host(:not([alignEnd])) ::slotted(ha-switch){margin-right:10px;margin-inline-end:10px;margin-inline-start:inline}.mdc-form-field>label{direction:var(--direction);margin-inline-start:0;margin-inline-end:auto;padding-inline-start:4px;padding-inline-end:0}"])))]}}]}}),u.a)},7265:function(e,t,i){var n,a,l=i(88962),r=i(33368),o=i(71650),d=i(68308),s=i(82390),c=i(69205),u=i(91808),h=(i(97393),i(5095)),v=i(95260);(0,u.Z)([(0,v.Mo)("ha-input-helper-text")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,d.Z)(this,i,[].concat(a)),e((0,s.Z)(t)),t}return(0,c.Z)(i,t),(0,r.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"render",value:function(){return(0,h.dy)(n||(n=(0,l.Z)(["<slot></slot>"])))}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(a||(a=(0,l.Z)([":host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}"])))}}]}}),h.oi)},71133:function(e,t,i){var n,a,l,r,o=i(99312),d=i(81043),s=i(88962),c=i(33368),u=i(71650),h=i(68308),v=i(82390),f=i(69205),p=i(91808),b=i(34541),m=i(47838),y=(i(97393),i(49412)),k=i(3762),g=i(5095),Z=i(95260),x=i(72218),_=i(2537);i(54371),(0,p.Z)([(0,Z.Mo)("ha-select")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,h.Z)(this,i,[].concat(a)),e((0,v.Z)(t)),t}return(0,f.Z)(i,t),(0,c.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,g.dy)(n||(n=(0,s.Z)([" "," "," "])),(0,b.Z)((0,m.Z)(i.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,g.dy)(a||(a=(0,s.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):g.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,g.dy)(l||(l=(0,s.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):g.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,b.Z)((0,m.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,b.Z)((0,m.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,x.D)((0,d.Z)((0,o.Z)().mark((function t(){return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,_.y)();case 2:e.layoutOptions();case 3:case"end":return t.stop()}}),t)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[k.W,(0,g.iv)(r||(r=(0,s.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),y.K)},62802:function(e,t,i){i.r(t),i.d(t,{HaSelectSelector:function(){return U}});var n,a,l,r,o,d,s,c,u,h,v,f,p,b,m,y=i(99312),k=i(81043),g=i(46097),Z=i(88962),x=i(76775),_=i(33368),C=i(71650),w=i(68308),V=i(82390),H=i(69205),B=i(91808),M=(i(97393),i(41353),i(46349),i(70320),i(46798),i(9849),i(50289),i(94167),i(37313),i(40271),i(60163),i(87438),i(22890),i(85472),i(90126),i(80628),i(44577),i(5095)),L=i(95260),S=i(99266),A=i(4771),I=i(18394),E=i(86089),F=i(28858),P=(i(50057),i(34541)),q=i(47838),z=(i(34131),i(16587)),D=((0,B.Z)([(0,L.Mo)("ha-input-chip")],(function(e,t){var i=function(t){function i(){var t;(0,C.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,w.Z)(this,i,[].concat(a)),e((0,V.Z)(t)),t}return(0,H.Z)(i,t),(0,_.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[].concat((0,g.Z)((0,P.Z)((0,q.Z)(i),"styles",this)),[(0,M.iv)(n||(n=(0,Z.Z)([":host{--md-sys-color-primary:var(--primary-text-color);--md-sys-color-on-surface:var(--primary-text-color);--md-sys-color-on-surface-variant:var(--primary-text-color);--md-sys-color-on-secondary-container:var(--primary-text-color);--md-input-chip-container-shape:16px;--md-input-chip-outline-color:var(--outline-color);--md-input-chip-selected-container-color:rgba(\n          var(--rgb-primary-text-color),\n          0.15\n        )}::slotted([slot=icon]){display:flex;--mdc-icon-size:var(--md-input-chip-icon-size, 18px)}"])))])}}]}}),z.W),i(74376),i(16591),i(48950),i(7265),i(57463)),W=i(44973),U=((0,B.Z)([(0,L.Mo)("ha-radio")],(function(e,t){var i=function(t){function i(){var t;(0,C.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,w.Z)(this,i,[].concat(a)),e((0,V.Z)(t)),t}return(0,H.Z)(i,t),(0,_.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[W.W,(0,M.iv)(a||(a=(0,Z.Z)([":host{--mdc-theme-secondary:var(--primary-color)}"])))]}}]}}),D.J),i(71133),i(42308),(0,B.Z)([(0,L.Mo)("ha-selector-select")],(function(e,t){var i,n=function(t){function i(){var t;(0,C.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,w.Z)(this,i,[].concat(a)),e((0,V.Z)(t)),t}return(0,H.Z)(i,t),(0,_.Z)(i)}(t);return{F:n,d:[{kind:"field",decorators:[(0,L.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,L.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,L.Cb)()],key:"localizeValue",value:void 0},{kind:"field",decorators:[(0,L.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,L.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,L.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"_itemMoved",value:function(e){e.stopPropagation();var t=e.detail,i=t.oldIndex,n=t.newIndex;this._move(i,n)}},{kind:"method",key:"_move",value:function(e,t){var i=this.value.concat(),n=i.splice(e,1)[0];i.splice(t,0,n),this.value=i,(0,I.B)(this,"value-changed",{value:i})}},{kind:"field",key:"_filter",value:function(){return""}},{kind:"method",key:"render",value:function(){var e,t,i,n,a,b,m,y,k,g,_=this,C=(null===(e=this.selector.select)||void 0===e||null===(e=e.options)||void 0===e?void 0:e.map((function(e){return"object"===(0,x.Z)(e)?e:{value:e,label:e}})))||[],w=null===(t=this.selector.select)||void 0===t?void 0:t.translation_key;if(this.localizeValue&&w&&C.forEach((function(e){var t=_.localizeValue("".concat(w,".options.").concat(e.value));t&&(e.label=t)})),null!==(i=this.selector.select)&&void 0!==i&&i.sort&&C.sort((function(e,t){return(0,F.f)(e.label,t.label,_.hass.locale.language)})),!(null!==(n=this.selector.select)&&void 0!==n&&n.custom_value||null!==(a=this.selector.select)&&void 0!==a&&a.reorder||"list"!==this._mode)){var V;if(null===(V=this.selector.select)||void 0===V||!V.multiple)return(0,M.dy)(l||(l=(0,Z.Z)([" <div> "," "," </div> "," "])),this.label,C.map((function(e){return(0,M.dy)(r||(r=(0,Z.Z)([' <ha-formfield .label="','"> <ha-radio .checked="','" .value="','" .disabled="','" @change="','"></ha-radio> </ha-formfield> '])),e.label,e.value===_.value,e.value,e.disabled||_.disabled,_._valueChanged)})),this._renderHelper());var H=this.value&&""!==this.value?(0,A.r)(this.value):[];return(0,M.dy)(o||(o=(0,Z.Z)([" <div> "," "," </div> "," "])),this.label,C.map((function(e){return(0,M.dy)(d||(d=(0,Z.Z)([' <ha-formfield .label="','"> <ha-checkbox .checked="','" .value="','" .disabled="','" @change="','"></ha-checkbox> </ha-formfield> '])),e.label,H.includes(e.value),e.value,e.disabled||_.disabled,_._checkboxChanged)})),this._renderHelper())}if(null!==(b=this.selector.select)&&void 0!==b&&b.multiple){var B,L=this.value&&""!==this.value?(0,A.r)(this.value):[],I=C.filter((function(e){return!(e.disabled||null!=L&&L.includes(e.value))}));return(0,M.dy)(s||(s=(0,Z.Z)([" ",' <ha-combo-box item-value-path="value" item-label-path="label" .hass="','" .label="','" .helper="','" .disabled="','" .required="','" .value="','" .items="','" .allowCustomValue="','" @filter-changed="','" @value-changed="','" @opened-changed="','"></ha-combo-box> '])),null!=L&&L.length?(0,M.dy)(c||(c=(0,Z.Z)([' <ha-sortable no-style .disabled="','" @item-moved="','"> <ha-chip-set> '," </ha-chip-set> </ha-sortable> "])),!this.selector.select.reorder,this._itemMoved,(0,S.r)(L,(function(e){return e}),(function(e,t){var i,n,a,l=(null===(i=C.find((function(t){return t.value===e})))||void 0===i?void 0:i.label)||e;return(0,M.dy)(u||(u=(0,Z.Z)([' <ha-input-chip .idx="','" @remove="','" .label="','" selected="selected"> '," "," </ha-input-chip> "])),t,_._removeItem,l,null!==(n=_.selector.select)&&void 0!==n&&n.reorder?(0,M.dy)(h||(h=(0,Z.Z)([' <ha-svg-icon slot="icon" .path="','" data-handle></ha-svg-icon> '])),"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"):M.Ld,(null===(a=C.find((function(t){return t.value===e})))||void 0===a?void 0:a.label)||e)}))):M.Ld,this.hass,this.label,this.helper,this.disabled,this.required&&!L.length,"",I,null!==(B=this.selector.select.custom_value)&&void 0!==B&&B,this._filterChanged,this._comboBoxValueChanged,this._openedChanged)}if(null!==(m=this.selector.select)&&void 0!==m&&m.custom_value){void 0===this.value||Array.isArray(this.value)||C.find((function(e){return e.value===_.value}))||C.unshift({value:this.value,label:this.value});var P=C.filter((function(e){return!e.disabled}));return(0,M.dy)(v||(v=(0,Z.Z)([' <ha-combo-box item-value-path="value" item-label-path="label" .hass="','" .label="','" .helper="','" .disabled="','" .required="','" .items="','" .value="','" @filter-changed="','" @value-changed="','" @opened-changed="','"></ha-combo-box> '])),this.hass,this.label,this.helper,this.disabled,this.required,P,this.value,this._filterChanged,this._comboBoxValueChanged,this._openedChanged)}return(0,M.dy)(f||(f=(0,Z.Z)([' <ha-select fixedMenuPosition naturalMenuWidth .label="','" .value="','" .helper="','" .disabled="','" .required="','" clearable @closed="','" @selected="','"> '," </ha-select> "])),null!==(y=this.label)&&void 0!==y?y:"",null!==(k=this.value)&&void 0!==k?k:"",null!==(g=this.helper)&&void 0!==g?g:"",this.disabled,this.required,E.U,this._valueChanged,C.map((function(e){return(0,M.dy)(p||(p=(0,Z.Z)([' <mwc-list-item .value="','" .disabled="','">',"</mwc-list-item> "])),e.value,e.disabled,e.label)})))}},{kind:"method",key:"_renderHelper",value:function(){return this.helper?(0,M.dy)(b||(b=(0,Z.Z)(["<ha-input-helper-text>","</ha-input-helper-text>"])),this.helper):""}},{kind:"get",key:"_mode",value:function(){var e,t;return(null===(e=this.selector.select)||void 0===e?void 0:e.mode)||(((null===(t=this.selector.select)||void 0===t||null===(t=t.options)||void 0===t?void 0:t.length)||0)<6?"list":"dropdown")}},{kind:"method",key:"_valueChanged",value:function(e){var t,i;e.stopPropagation();var n=(null===(t=e.detail)||void 0===t?void 0:t.value)||e.target.value;this.disabled||void 0===n||n===(null!==(i=this.value)&&void 0!==i?i:"")||(0,I.B)(this,"value-changed",{value:n})}},{kind:"method",key:"_checkboxChanged",value:function(e){if(e.stopPropagation(),!this.disabled){var t,i=e.target.value,n=e.target.checked,a=this.value&&""!==this.value?(0,A.r)(this.value):[];if(n){if(a.includes(i))return;t=[].concat((0,g.Z)(a),[i])}else{if(null==a||!a.includes(i))return;t=a.filter((function(e){return e!==i}))}(0,I.B)(this,"value-changed",{value:t})}}},{kind:"method",key:"_removeItem",value:(i=(0,k.Z)((0,y.Z)().mark((function e(t){var i;return(0,y.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return t.stopPropagation(),(i=(0,g.Z)((0,A.r)(this.value))).splice(t.target.idx,1),(0,I.B)(this,"value-changed",{value:i}),e.next=6,this.updateComplete;case 6:this._filterChanged();case 7:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"method",key:"_comboBoxValueChanged",value:function(e){var t,i=this;e.stopPropagation();var n=e.detail.value;if(!this.disabled&&""!==n)if(null!==(t=this.selector.select)&&void 0!==t&&t.multiple){var a=this.value&&""!==this.value?(0,A.r)(this.value):[];void 0!==n&&a.includes(n)||(setTimeout((function(){i._filterChanged(),i.comboBox.setInputValue("")}),0),(0,I.B)(this,"value-changed",{value:[].concat((0,g.Z)(a),[n])}))}else(0,I.B)(this,"value-changed",{value:n})}},{kind:"method",key:"_openedChanged",value:function(e){null!=e&&e.detail.value&&this._filterChanged()}},{kind:"method",key:"_filterChanged",value:function(e){var t,i,n=this;this._filter=(null==e?void 0:e.detail.value)||"";var a=null===(t=this.comboBox.items)||void 0===t?void 0:t.filter((function(e){var t;return(e.label||e.value).toLowerCase().includes(null===(t=n._filter)||void 0===t?void 0:t.toLowerCase())}));this._filter&&null!==(i=this.selector.select)&&void 0!==i&&i.custom_value&&(null==a||a.unshift({label:this._filter,value:this._filter})),this.comboBox.filteredItems=a}},{kind:"field",static:!0,key:"styles",value:function(){return(0,M.iv)(m||(m=(0,Z.Z)([":host{position:relative}ha-formfield,ha-select,mwc-formfield{display:block}mwc-list-item[disabled]{--mdc-theme-text-primary-on-background:var(--disabled-text-color)}ha-chip-set{padding:8px 0}.sortable-fallback{display:none;opacity:0}.sortable-ghost{opacity:.4}.sortable-drag{cursor:grabbing}"])))}}]}}),M.oi))},42308:function(e,t,i){var n,a=i(99312),l=i(81043),r=i(88962),o=i(33368),d=i(71650),s=i(68308),c=i(82390),u=i(69205),h=i(91808),v=i(34541),f=i(47838),p=(i(97393),i(51358),i(46798),i(47084),i(5239),i(98490),i(22481),i(91989),i(5095)),b=i(95260),m=i(18394);(0,h.Z)([(0,b.Mo)("ha-sortable")],(function(e,t){var h,y=function(t){function i(){var t;(0,d.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,s.Z)(this,i,[].concat(a)),e((0,c.Z)(t)),t}return(0,u.Z)(i,t),(0,o.Z)(i)}(t);return{F:y,d:[{kind:"field",key:"_sortable",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"path",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean,attribute:"no-style"})],key:"noStyle",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:String,attribute:"draggable-selector"})],key:"draggableSelector",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:String,attribute:"handle-selector"})],key:"handleSelector",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:String,attribute:"group"})],key:"group",value:void 0},{kind:"method",key:"updated",value:function(e){e.has("disabled")&&(this.disabled?this._destroySortable():this._createSortable())}},{kind:"field",key:"_shouldBeDestroy",value:function(){return!1}},{kind:"method",key:"disconnectedCallback",value:function(){var e=this;(0,v.Z)((0,f.Z)(y.prototype),"disconnectedCallback",this).call(this),this._shouldBeDestroy=!0,setTimeout((function(){e._shouldBeDestroy&&(e._destroySortable(),e._shouldBeDestroy=!1)}),1)}},{kind:"method",key:"connectedCallback",value:function(){(0,v.Z)((0,f.Z)(y.prototype),"connectedCallback",this).call(this),this._shouldBeDestroy=!1}},{kind:"method",key:"createRenderRoot",value:function(){return this}},{kind:"method",key:"render",value:function(){return this.noStyle?p.Ld:(0,p.dy)(n||(n=(0,r.Z)([" <style>.sortable-fallback{display:none;opacity:0}.sortable-ghost{border:2px solid var(--primary-color);background:rgba(var(--rgb-primary-color),.25);border-radius:4px;opacity:.4}.sortable-drag{border-radius:4px;opacity:1;background:var(--card-background-color);box-shadow:0px 4px 8px 3px #00000026;cursor:grabbing}</style> "])))}},{kind:"method",key:"_createSortable",value:(h=(0,l.Z)((0,a.Z)().mark((function e(){var t,n,l;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!this._sortable){e.next=2;break}return e.abrupt("return");case 2:if(t=this.children[0]){e.next=5;break}return e.abrupt("return");case 5:return e.next=7,Promise.all([i.e(6087),i.e(8697)]).then(i.bind(i,48697));case 7:n=e.sent.default,l={animation:150,swapThreshold:.75,onChoose:this._handleChoose,onEnd:this._handleEnd},this.draggableSelector&&(l.draggable=this.draggableSelector),this.handleSelector&&(l.handle=this.handleSelector),this.draggableSelector&&(l.draggable=this.draggableSelector),this.group&&(l.group=this.group),this._sortable=new n(t,l);case 14:case"end":return e.stop()}}),e,this)}))),function(){return h.apply(this,arguments)})},{kind:"field",key:"_handleEnd",value:function(){var e=this;return function(){var t=(0,l.Z)((0,a.Z)().mark((function t(i){var n,l,r,o;return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(i.item.placeholder&&(i.item.placeholder.replaceWith(i.item),delete i.item.placeholder),n=i.oldIndex,l=i.from.parentElement.path,r=i.newIndex,o=i.to.parentElement.path,void 0!==n&&void 0!==r&&(n!==r||(null==l?void 0:l.join("."))!==(null==o?void 0:o.join(".")))){t.next=7;break}return t.abrupt("return");case 7:(0,m.B)(e,"item-moved",{oldIndex:n,newIndex:r,oldPath:l,newPath:o});case 8:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}()}},{kind:"field",key:"_handleChoose",value:function(){return function(e){e.item.placeholder=document.createComment("sort-placeholder"),e.item.after(e.item.placeholder)}}},{kind:"method",key:"_destroySortable",value:function(){this._sortable&&(this._sortable.destroy(),this._sortable=void 0)}}]}}),p.oi)}}]);
+//# sourceMappingURL=2802.ca29fxQAH4A.js.map
\ No newline at end of file
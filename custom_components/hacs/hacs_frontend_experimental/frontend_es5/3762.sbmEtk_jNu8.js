@@ -0,0 +1,3 @@
+/*! For license information please see 3762.sbmEtk_jNu8.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[3762],{3747:function(e,t,i){i.d(t,{t:function(){return s}});var r=i(71650),n=i(33368),o=(i(65974),i(10185),i(46798),i(9849),i(50289),i(94167),i(36513),i(56308),i(41353),i(88770),i(85717),function(){function e(){var t=this,i=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.localStorage;(0,r.Z)(this,e),this.storage=void 0,this._storage={},this._listeners={},this.storage=i,i===window.localStorage&&window.addEventListener("storage",(function(e){e.key&&t.hasKey(e.key)&&(t._storage[e.key]=e.newValue?JSON.parse(e.newValue):e.newValue,t._listeners[e.key]&&t._listeners[e.key].forEach((function(i){return i(e.oldValue?JSON.parse(e.oldValue):e.oldValue,t._storage[e.key])})))}))}return(0,n.Z)(e,[{key:"addFromStorage",value:function(e){if(!this._storage[e]){var t=this.storage.getItem(e);t&&(this._storage[e]=JSON.parse(t))}}},{key:"subscribeChanges",value:function(e,t){var i=this;return this._listeners[e]?this._listeners[e].push(t):this._listeners[e]=[t],function(){i.unsubscribeChanges(e,t)}}},{key:"unsubscribeChanges",value:function(e,t){if(e in this._listeners){var i=this._listeners[e].indexOf(t);-1!==i&&this._listeners[e].splice(i,1)}}},{key:"hasKey",value:function(e){return e in this._storage}},{key:"getValue",value:function(e){return this._storage[e]}},{key:"setValue",value:function(e,t){var i=this._storage[e];this._storage[e]=t;try{void 0===t?this.storage.removeItem(e):this.storage.setItem(e,JSON.stringify(t))}catch(r){}finally{this._listeners[e]&&this._listeners[e].forEach((function(e){return e(i,t)}))}}}]),e}()),a={},s=function(e){return function(t){var i,r=e.storage||"localStorage";r&&r in a?i=a[r]:(i=new o(window[r]),a[r]=i);var n=String(t.key),s=e.key||String(t.key),c=t.initializer?t.initializer():void 0;i.addFromStorage(s);var l=!1!==e.subscribe?function(e){return i.subscribeChanges(s,(function(i,r){e.requestUpdate(t.key,i)}))}:void 0,d=function(){return i.hasKey(s)?i.getValue(s):c};return{kind:"method",placement:"prototype",key:t.key,descriptor:{set:function(r){!function(r,n){var o;e.state&&(o=d()),i.setValue(s,n),e.state&&r.requestUpdate(t.key,o)}(this,r)},get:function(){return d()},enumerable:!0,configurable:!0},finisher:function(i){if(e.state&&e.subscribe){var r=i.prototype.connectedCallback,o=i.prototype.disconnectedCallback;i.prototype.connectedCallback=function(){r.call(this),this["__unbsubLocalStorage".concat(n)]=null==l?void 0:l(this)},i.prototype.disconnectedCallback=function(){var e;o.call(this),null===(e=this["__unbsubLocalStorage".concat(n)])||void 0===e||e.call(this),this["__unbsubLocalStorage".concat(n)]=void 0}}e.state&&i.createProperty(t.key,Object.assign({noAccessor:!0},e.stateOptions))}}}}},91998:function(e,t,i){var r,n,o,a=i(88962),s=i(99312),c=i(81043),l=i(33368),d=i(71650),u=i(68308),h=i(82390),p=i(69205),f=i(91808),v=(i(97393),i(65974),i(87438),i(46798),i(9849),i(22890),i(40271),i(60163),i(37313),i(46349),i(70320),i(85717),i(90532),i(5095)),m=i(95260),g=i(14516),y=i(18394),b=i(36655),_=i(2733),k=i(1913),w=(i(16591),i(54371),i(37662),i(14303),i(28858));(0,f.Z)([(0,m.Mo)("ha-entity-picker")],(function(e,t){var i,f,x=function(t){function i(){var t;(0,d.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,u.Z)(this,i,[].concat(n)),e((0,h.Z)(t)),t}return(0,p.Z)(i,t),(0,l.Z)(i)}(t);return{F:x,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"autofocus",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({type:Boolean,attribute:"allow-custom-entity"})],key:"allowCustomEntity",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Array,attribute:"include-unit-of-measurement"})],key:"includeUnitOfMeasurement",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Array,attribute:"include-entities"})],key:"includeEntities",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Array,attribute:"exclude-entities"})],key:"excludeEntities",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"hideClearIcon",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({attribute:"item-label-path"})],key:"itemLabelPath",value:function(){return"friendly_name"}},{kind:"field",decorators:[(0,m.SB)()],key:"_opened",value:function(){return!1}},{kind:"field",decorators:[(0,m.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"open",value:(f=(0,c.Z)((0,s.Z)().mark((function e(){var t;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:return e.next=4,null===(t=this.comboBox)||void 0===t?void 0:t.open();case 4:case"end":return e.stop()}}),e,this)}))),function(){return f.apply(this,arguments)})},{kind:"method",key:"focus",value:(i=(0,c.Z)((0,s.Z)().mark((function e(){var t;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:return e.next=4,null===(t=this.comboBox)||void 0===t?void 0:t.focus();case 4:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"field",key:"_initedStates",value:function(){return!1}},{kind:"field",key:"_states",value:function(){return[]}},{kind:"field",key:"_rowRenderer",value:function(){var e=this;return function(t){return(0,v.dy)(r||(r=(0,a.Z)(['<ha-list-item graphic="avatar" .twoline="','"> '," <span>",'</span> <span slot="secondary">',"</span> </ha-list-item>"])),!!t.entity_id,t.state?(0,v.dy)(n||(n=(0,a.Z)(['<state-badge slot="graphic" .stateObj="','" .hass="','"></state-badge>'])),t,e.hass):"",t.friendly_name,t.entity_id)}}},{kind:"field",key:"_getStates",value:function(){var e=this;return(0,g.Z)((function(t,i,r,n,o,a,s,c,l){var d=[];if(!i)return[];var u=Object.keys(i.states);return u.length?c?(u=u.filter((function(t){return e.includeEntities.includes(t)}))).map((function(e){var t=(0,_.C)(i.states[e])||e;return Object.assign(Object.assign({},i.states[e]),{},{friendly_name:t,strings:[e,t]})})).sort((function(t,i){return(0,w.f)(t.friendly_name,i.friendly_name,e.hass.locale.language)})):(l&&(u=u.filter((function(e){return!l.includes(e)}))),r&&(u=u.filter((function(e){return r.includes((0,b.M)(e))}))),n&&(u=u.filter((function(e){return!n.includes((0,b.M)(e))}))),d=u.map((function(e){var t=(0,_.C)(i.states[e])||e;return Object.assign(Object.assign({},i.states[e]),{},{friendly_name:t,strings:[e,t]})})).sort((function(t,i){return(0,w.f)(t.friendly_name,i.friendly_name,e.hass.locale.language)})),a&&(d=d.filter((function(t){return t.entity_id===e.value||t.attributes.device_class&&a.includes(t.attributes.device_class)}))),s&&(d=d.filter((function(t){return t.entity_id===e.value||t.attributes.unit_of_measurement&&s.includes(t.attributes.unit_of_measurement)}))),o&&(d=d.filter((function(t){return t.entity_id===e.value||o(t)}))),d.length?d:[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:e.hass.localize("ui.components.entity.entity-picker.no_match"),attributes:{friendly_name:e.hass.localize("ui.components.entity.entity-picker.no_match"),icon:"mdi:magnify"},strings:[]}]):[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:e.hass.localize("ui.components.entity.entity-picker.no_entities"),attributes:{friendly_name:e.hass.localize("ui.components.entity.entity-picker.no_entities"),icon:"mdi:magnify"},strings:[]}]}))}},{kind:"method",key:"shouldUpdate",value:function(e){return!!(e.has("value")||e.has("label")||e.has("disabled"))||!(!e.has("_opened")&&this._opened)}},{kind:"method",key:"willUpdate",value:function(e){(!this._initedStates||e.has("_opened")&&this._opened)&&(this._states=this._getStates(this._opened,this.hass,this.includeDomains,this.excludeDomains,this.entityFilter,this.includeDeviceClasses,this.includeUnitOfMeasurement,this.includeEntities,this.excludeEntities),this._initedStates&&(this.comboBox.filteredItems=this._states),this._initedStates=!0)}},{kind:"method",key:"render",value:function(){return(0,v.dy)(o||(o=(0,a.Z)([' <ha-combo-box item-value-path="entity_id" .itemLabelPath="','" .hass="','" .value="','" .label="','" .helper="','" .allowCustomValue="','" .filteredItems="','" .renderer="','" .required="','" .disabled="','" @opened-changed="','" @value-changed="','" @filter-changed="','"> </ha-combo-box> '])),this.itemLabelPath,this.hass,this._value,void 0===this.label?this.hass.localize("ui.components.entity.entity-picker.entity"):this.label,this.helper,this.allowCustomEntity,this._states,this._rowRenderer,this.required,this.disabled,this._openedChanged,this._valueChanged,this._filterChanged)}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;t!==this._value&&this._setValue(t)}},{kind:"method",key:"_filterChanged",value:function(e){var t=e.target,i=e.detail.value.toLowerCase();t.filteredItems=i.length?(0,k.q)(i,this._states):this._states}},{kind:"method",key:"_setValue",value:function(e){var t=this;this.value=e,setTimeout((function(){(0,y.B)(t,"value-changed",{value:e}),(0,y.B)(t,"change")}),0)}}]}}),v.oi)},68336:function(e,t,i){var r,n,o,a=i(88962),s=i(33368),c=i(71650),l=i(68308),d=i(82390),u=i(69205),h=i(91808),p=(i(97393),i(5095)),f=i(95260);(0,h.Z)([(0,f.Mo)("ha-card")],(function(e,t){var i=function(t){function i(){var t;(0,c.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,l.Z)(this,i,[].concat(n)),e((0,d.Z)(t)),t}return(0,u.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)()],key:"header",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean,reflect:!0})],key:"raised",value:function(){return!1}},{kind:"get",static:!0,key:"styles",value:function(){return(0,p.iv)(r||(r=(0,a.Z)([":host{background:var(--ha-card-background,var(--card-background-color,#fff));box-shadow:var(--ha-card-box-shadow,none);box-sizing:border-box;border-radius:var(--ha-card-border-radius,12px);border-width:var(--ha-card-border-width,1px);border-style:solid;border-color:var(--ha-card-border-color,var(--divider-color,#e0e0e0));color:var(--primary-text-color);display:block;transition:all .3s ease-out;position:relative}:host([raised]){border:none;box-shadow:var(--ha-card-box-shadow,0px 2px 1px -1px rgba(0,0,0,.2),0px 1px 1px 0px rgba(0,0,0,.14),0px 1px 3px 0px rgba(0,0,0,.12))}.card-header,:host ::slotted(.card-header){color:var(--ha-card-header-color,--primary-text-color);font-family:var(--ha-card-header-font-family, inherit);font-size:var(--ha-card-header-font-size, 24px);letter-spacing:-.012em;line-height:48px;padding:12px 16px 16px;display:block;margin-block-start:0px;margin-block-end:0px;font-weight:400}:host ::slotted(.card-content:not(:first-child)),slot:not(:first-child)::slotted(.card-content){padding-top:0px;margin-top:-8px}:host ::slotted(.card-content){padding:16px}:host ::slotted(.card-actions){border-top:1px solid var(--divider-color,#e8e8e8);padding:5px 16px}"])))}},{kind:"method",key:"render",value:function(){return(0,p.dy)(n||(n=(0,a.Z)([" "," <slot></slot> "])),this.header?(0,p.dy)(o||(o=(0,a.Z)(['<h1 class="card-header">',"</h1>"])),this.header):p.Ld)}}]}}),p.oi)},7006:function(e,t,i){var r,n=i(88962),o=i(46097),a=i(33368),s=i(71650),c=i(68308),l=i(82390),d=i(69205),u=i(91808),h=i(34541),p=i(47838),f=(i(97393),i(34131),i(22129)),v=i(5095),m=i(95260);(0,u.Z)([(0,m.Mo)("ha-circular-progress")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,c.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,d.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:"aria-label",type:String})],key:"ariaLabel",value:function(){return"Loading"}},{kind:"field",decorators:[(0,m.Cb)()],key:"size",value:function(){return"medium"}},{kind:"method",key:"updated",value:function(e){if((0,h.Z)((0,p.Z)(i.prototype),"updated",this).call(this,e),e.has("size"))switch(this.size){case"tiny":this.style.setProperty("--md-circular-progress-size","16px");break;case"small":this.style.setProperty("--md-circular-progress-size","28px");break;case"medium":this.style.setProperty("--md-circular-progress-size","48px");break;case"large":this.style.setProperty("--md-circular-progress-size","68px")}}},{kind:"get",static:!0,key:"styles",value:function(){return[].concat((0,o.Z)((0,h.Z)((0,p.Z)(i),"styles",this)),[(0,v.iv)(r||(r=(0,n.Z)([":host{--md-sys-color-primary:var(--primary-color);--md-circular-progress-size:48px}"])))])}}]}}),f.B)},78680:function(e,t,i){var r,n,o=i(88962),a=i(33368),s=i(71650),c=i(68308),l=i(82390),d=i(69205),u=i(91808),h=(i(97393),i(5095)),p=i(95260);(0,u.Z)([(0,p.Mo)("ha-dialog-header")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,c.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,d.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,o.Z)([' <header class="header"> <div class="header-bar"> <section class="header-navigation-icon"> <slot name="navigationIcon"></slot> </section> <section class="header-title"> <slot name="title"></slot> </section> <section class="header-action-items"> <slot name="actionItems"></slot> </section> </div> <slot></slot> </header> '])))}},{kind:"get",static:!0,key:"styles",value:function(){return[(0,h.iv)(n||(n=(0,o.Z)([":host{display:block}:host([show-border]){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.header-bar{display:flex;flex-direction:row;align-items:flex-start;padding:4px;box-sizing:border-box}.header-title{flex:1;font-size:22px;line-height:28px;font-weight:400;padding:10px 4px;min-width:0;overflow:hidden;text-overflow:ellipsis;white-space:nowrap}@media all and (min-width:450px) and (min-height:500px){.header-bar{padding:12px}}.header-navigation-icon{flex:none;min-width:8px;height:100%;display:flex;flex-direction:row}.header-action-items{flex:none;min-width:8px;height:100%;display:flex;flex-direction:row}"])))]}}]}}),h.oi)},9828:function(e,t,i){i.d(t,{i:function(){return k}});var r,n,o,a=i(33368),s=i(71650),c=i(68308),l=i(82390),d=i(69205),u=i(91808),h=i(34541),p=i(47838),f=i(88962),v=(i(97393),i(91989),i(87762)),m=i(91632),g=i(5095),y=i(95260),b=i(60625),_=(i(54371),["button","ha-list-item"]),k=function(e,t){var i;return(0,g.dy)(r||(r=(0,f.Z)([' <div class="header_title"> <span>','</span> <ha-icon-button .label="','" .path="','" dialogAction="close" class="header_button"></ha-icon-button> </div> '])),t,null!==(i=null==e?void 0:e.localize("ui.dialogs.generic.close"))&&void 0!==i?i:"Close","M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z")};(0,u.Z)([(0,y.Mo)("ha-dialog")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,c.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,d.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",key:b.gA,value:void 0},{kind:"method",key:"scrollToPos",value:function(e,t){var i;null===(i=this.contentElement)||void 0===i||i.scrollTo(e,t)}},{kind:"method",key:"renderHeading",value:function(){return(0,g.dy)(n||(n=(0,f.Z)(['<slot name="heading"> '," </slot>"])),(0,h.Z)((0,p.Z)(i.prototype),"renderHeading",this).call(this))}},{kind:"method",key:"firstUpdated",value:function(){var e;(0,h.Z)((0,p.Z)(i.prototype),"firstUpdated",this).call(this),this.suppressDefaultPressSelector=[this.suppressDefaultPressSelector,_].join(", "),this._updateScrolledAttribute(),null===(e=this.contentElement)||void 0===e||e.addEventListener("scroll",this._onScroll,{passive:!0})}},{kind:"method",key:"disconnectedCallback",value:function(){(0,h.Z)((0,p.Z)(i.prototype),"disconnectedCallback",this).call(this),this.contentElement.removeEventListener("scroll",this._onScroll)}},{kind:"field",key:"_onScroll",value:function(){var e=this;return function(){e._updateScrolledAttribute()}}},{kind:"method",key:"_updateScrolledAttribute",value:function(){this.contentElement&&this.toggleAttribute("scrolled",0!==this.contentElement.scrollTop)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,g.iv)(o||(o=(0,f.Z)([":host([scrolled]) ::slotted(ha-dialog-header){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.mdc-dialog{--mdc-dialog-scroll-divider-color:var(\n          --dialog-scroll-divider-color,\n          var(--divider-color)\n        );z-index:var(--dialog-z-index,8);-webkit-backdrop-filter:var(--dialog-backdrop-filter,none);backdrop-filter:var(--dialog-backdrop-filter,none);--mdc-dialog-box-shadow:var(--dialog-box-shadow, none);--mdc-typography-headline6-font-weight:400;--mdc-typography-headline6-font-size:1.574rem}.mdc-dialog__actions{justify-content:var(--justify-action-buttons,flex-end);padding-bottom:max(env(safe-area-inset-bottom),24px)}.mdc-dialog__actions span:first-child{flex:var(--secondary-action-button-flex,unset)}.mdc-dialog__actions span:nth-child(2){flex:var(--primary-action-button-flex,unset)}.mdc-dialog__container{align-items:var(--vertical-align-dialog,center)}.mdc-dialog__title{padding:24px 24px 0 24px}.mdc-dialog__actions{padding:12px 24px 12px 24px}.mdc-dialog__title::before{content:unset}.mdc-dialog .mdc-dialog__content{position:var(--dialog-content-position,relative);padding:var(--dialog-content-padding,24px)}:host([hideactions]) .mdc-dialog .mdc-dialog__content{padding-bottom:max(var(--dialog-content-padding,24px),env(safe-area-inset-bottom))}.mdc-dialog .mdc-dialog__surface{position:var(--dialog-surface-position,relative);top:var(--dialog-surface-top);margin-top:var(--dialog-surface-margin-top);min-height:var(--mdc-dialog-min-height,auto);border-radius:var(--ha-dialog-border-radius,28px)}:host([flexContent]) .mdc-dialog .mdc-dialog__content{display:flex;flex-direction:column}.header_title{position:relative;padding-right:40px;padding-inline-end:40px;padding-inline-start:initial;direction:var(--direction)}.header_title span{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;display:block}.header_button{position:absolute;right:-8px;top:-8px;text-decoration:none;color:inherit;inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}.dialog-actions{inset-inline-start:initial!important;inset-inline-end:0px!important;direction:var(--direction)}"])))]}}]}}),v.M)},99539:function(e,t,i){var r,n=i(88962),o=i(33368),a=i(71650),s=i(68308),c=i(82390),l=i(69205),d=i(91808),u=i(34541),h=i(47838),p=(i(97393),i(89833)),f=i(31338),v=i(96791),m=i(5095),g=i(95260),y=i(67684);(0,d.Z)([(0,g.Mo)("ha-textarea")],(function(e,t){var i=function(t){function i(){var t;(0,a.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,s.Z)(this,i,[].concat(n)),e((0,c.Z)(t)),t}return(0,l.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,g.Cb)({type:Boolean,reflect:!0})],key:"autogrow",value:function(){return!1}},{kind:"method",key:"firstUpdated",value:function(){(0,u.Z)((0,h.Z)(i.prototype),"firstUpdated",this).call(this),this.setAttribute("dir",y.E.document.dir)}},{kind:"method",key:"updated",value:function(e){(0,u.Z)((0,h.Z)(i.prototype),"updated",this).call(this,e),this.autogrow&&e.has("value")&&(this.mdcRoot.dataset.value=this.value+'=​"')}},{kind:"field",static:!0,key:"styles",value:function(){return[f.W,v.W,(0,m.iv)(r||(r=(0,n.Z)([":host([autogrow]) .mdc-text-field{position:relative;min-height:74px;min-width:178px;max-height:200px}:host([autogrow]) .mdc-text-field:after{content:attr(data-value);margin-top:23px;margin-bottom:9px;line-height:1.5rem;min-height:42px;padding:0px 32px 0 16px;letter-spacing:var(\n          --mdc-typography-subtitle1-letter-spacing,\n          .009375em\n        );visibility:hidden;white-space:pre-wrap}:host([autogrow]) .mdc-text-field__input{position:absolute;height:calc(100% - 32px)}:host([autogrow]) .mdc-text-field.mdc-text-field--no-label:after{margin-top:16px;margin-bottom:16px}:host([dir=rtl]) .mdc-floating-label{right:16px;left:initial}"])))]}}]}}),p.O)},60298:function(e,t,i){var r,n,o,a,s=i(99312),c=i(81043),l=i(88962),d=i(33368),u=i(71650),h=i(68308),p=i(82390),f=i(69205),v=i(91808),m=i(34541),g=i(47838),y=(i(97393),i(46349),i(70320),i(22859),i(85472),i(46798),i(9849),i(90126),i(5095)),b=i(95260),_=i(18394),k=i(86089),w=i(72218),x=i(56112),Z=(i(90532),i(71133),"__NONE_OPTION__");(0,v.Z)([(0,b.Mo)("ha-tts-voice-picker")],(function(e,t){var i,v=function(t){function i(){var t;(0,u.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,h.Z)(this,i,[].concat(n)),e((0,p.Z)(t)),t}return(0,f.Z)(i,t),(0,d.Z)(i)}(t);return{F:v,d:[{kind:"field",decorators:[(0,b.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"engineId",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"language",value:void 0},{kind:"field",decorators:[(0,b.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,b.SB)()],key:"_voices",value:void 0},{kind:"field",decorators:[(0,b.IO)("ha-select")],key:"_select",value:void 0},{kind:"method",key:"render",value:function(){var e,t;if(!this._voices)return y.Ld;var i=null!==(e=this.value)&&void 0!==e?e:this.required?null===(t=this._voices[0])||void 0===t?void 0:t.voice_id:Z;return(0,y.dy)(r||(r=(0,l.Z)([' <ha-select .label="','" .value="','" .required="','" .disabled="','" @selected="','" @closed="','" fixedMenuPosition naturalMenuWidth> '," "," </ha-select> "])),this.label||this.hass.localize("ui.components.tts-voice-picker.voice"),i,this.required,this.disabled,this._changed,k.U,this.required?y.Ld:(0,y.dy)(n||(n=(0,l.Z)(['<ha-list-item .value="','"> '," </ha-list-item>"])),Z,this.hass.localize("ui.components.tts-voice-picker.none")),this._voices.map((function(e){return(0,y.dy)(o||(o=(0,l.Z)(['<ha-list-item .value="','"> '," </ha-list-item>"])),e.voice_id,e.name)})))}},{kind:"method",key:"willUpdate",value:function(e){(0,m.Z)((0,g.Z)(v.prototype),"willUpdate",this).call(this,e),this.hasUpdated?(e.has("language")||e.has("engineId"))&&this._debouncedUpdateVoices():this._updateVoices()}},{kind:"field",key:"_debouncedUpdateVoices",value:function(){var e=this;return(0,w.D)((function(){return e._updateVoices()}),500)}},{kind:"method",key:"_updateVoices",value:(i=(0,c.Z)((0,s.Z)().mark((function e(){var t=this;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.engineId&&this.language){e.next=3;break}return this._voices=void 0,e.abrupt("return");case 3:return e.next=5,(0,x.MV)(this.hass,this.engineId,this.language);case 5:if(this._voices=e.sent.voices,this.value){e.next=8;break}return e.abrupt("return");case 8:this._voices&&this._voices.find((function(e){return e.voice_id===t.value}))||(this.value=void 0,(0,_.B)(this,"value-changed",{value:this.value}));case 9:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"updated",value:function(e){var t,i,r;((0,m.Z)((0,g.Z)(v.prototype),"updated",this).call(this,e),e.has("_voices")&&(null===(t=this._select)||void 0===t?void 0:t.value)!==this.value)&&(null===(i=this._select)||void 0===i||i.layoutOptions(),(0,_.B)(this,"value-changed",{value:null===(r=this._select)||void 0===r?void 0:r.value}))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,y.iv)(a||(a=(0,l.Z)(["ha-select{width:100%}"])))}},{kind:"method",key:"_changed",value:function(e){var t=e.target;!this.hass||""===t.value||t.value===this.value||void 0===this.value&&t.value===Z||(this.value=t.value===Z?void 0:t.value,(0,_.B)(this,"value-changed",{value:this.value}))}}]}}),y.oi)},93762:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,o=i.hasOwnProperty,a=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},c=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",d=s.toStringTag||"@@toStringTag";function u(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{u({},"")}catch(e){u=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,o=Object.create(n.prototype),s=new V(r||[]);return a(o,"_invoke",{value:I(e,i,s)}),o}function p(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var f="suspendedStart",v="suspendedYield",m="executing",g="completed",y={};function b(){}function _(){}function k(){}var w={};u(w,c,(function(){return this}));var x=Object.getPrototypeOf,Z=x&&x(x(H([])));Z&&Z!==i&&o.call(Z,c)&&(w=Z);var L=k.prototype=b.prototype=Object.create(w);function C(e){["next","throw","return"].forEach((function(t){u(e,t,(function(e){return this._invoke(t,e)}))}))}function z(e,t){function i(n,a,s,c){var l=p(e[n],e,a);if("throw"!==l.type){var d=l.arg,u=d.value;return u&&"object"==r(u)&&o.call(u,"__await")?t.resolve(u.__await).then((function(e){i("next",e,s,c)}),(function(e){i("throw",e,s,c)})):t.resolve(u).then((function(e){d.value=e,s(d)}),(function(e){return i("throw",e,s,c)}))}c(l.arg)}var n;a(this,"_invoke",{value:function(e,r){function o(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(o,o):o()}})}function I(t,i,r){var n=f;return function(o,a){if(n===m)throw new Error("Generator is already running");if(n===g){if("throw"===o)throw a;return{value:e,done:!0}}for(r.method=o,r.arg=a;;){var s=r.delegate;if(s){var c=E(s,r);if(c){if(c===y)continue;return c}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===f)throw n=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=m;var l=p(t,i,r);if("normal"===l.type){if(n=r.done?g:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=g,r.method="throw",r.arg=l.arg)}}}function E(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,E(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var o=p(n,t.iterator,i.arg);if("throw"===o.type)return i.method="throw",i.arg=o.arg,i.delegate=null,y;var a=o.arg;return a?a.done?(i[t.resultName]=a.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):a:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function O(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function S(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function V(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(O,this),this.reset(!0)}function H(t){if(t||""===t){var i=t[c];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,a=function i(){for(;++n<t.length;)if(o.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return a.next=a}}throw new TypeError(r(t)+" is not iterable")}return _.prototype=k,a(L,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:_,configurable:!0}),_.displayName=u(k,d,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===_||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,k):(e.__proto__=k,u(e,d,"GeneratorFunction")),e.prototype=Object.create(L),e},t.awrap=function(e){return{__await:e}},C(z.prototype),u(z.prototype,l,(function(){return this})),t.AsyncIterator=z,t.async=function(e,i,r,n,o){void 0===o&&(o=Promise);var a=new z(h(e,i,r,n),o);return t.isGeneratorFunction(i)?a:a.next().then((function(e){return e.done?e.value:a.next()}))},C(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=H,V.prototype={constructor:V,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(S),!t)for(var i in this)"t"===i.charAt(0)&&o.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var a=this.tryEntries[n],s=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),l=o.call(a,"finallyLoc");if(c&&l){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var a=n?n.completion:{};return a.type=e,a.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(a)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),S(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;S(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:H(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function o(e,t,i,r,n,o,a){try{var s=e[o](a),c=s.value}catch(l){return void i(l)}s.done?t(c):Promise.resolve(c).then(r,n)}i.a(e,function(){var e,r=(e=n().mark((function e(r,o){var a,s,c,l,d,u,h,p,f,v,m,g,y,b,_,k,w,x,Z;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,i.r(t),a=i(99312),s=i(81043),c=i(88962),l=i(33368),d=i(71650),u=i(68308),h=i(82390),p=i(69205),f=i(91808),i(97393),i(17692),v=i(5095),m=i(95260),g=i(18394),y=i(29950),i(9828),i(78680),i(64914),b=i(15758),_=i(86089),!(k=r([b])).then){e.next=32;break}return e.next=28,k;case 28:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=33;break;case 32:e.t0=k;case 33:b=e.t0[0],(0,f.Z)([(0,m.Mo)("dialog-media-player-browse")],(function(e,t){var i,r=function(t){function i(){var t;(0,d.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,u.Z)(this,i,[].concat(n)),e((0,h.Z)(t)),t}return(0,p.Z)(i,t),(0,l.Z)(i)}(t);return{F:r,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.SB)()],key:"_currentItem",value:void 0},{kind:"field",decorators:[(0,m.SB)()],key:"_navigateIds",value:void 0},{kind:"field",decorators:[(0,m.SB)()],key:"_params",value:void 0},{kind:"field",decorators:[(0,m.SB)()],key:"_preferredLayout",value:function(){return"auto"}},{kind:"field",decorators:[(0,m.IO)("ha-media-player-browse")],key:"_browser",value:void 0},{kind:"method",key:"showDialog",value:function(e){this._params=e,this._navigateIds=e.navigateIds||[{media_content_id:void 0,media_content_type:void 0}]}},{kind:"method",key:"closeDialog",value:function(){this._params=void 0,this._navigateIds=void 0,this._currentItem=void 0,this._preferredLayout="auto",this.classList.remove("opened"),(0,g.B)(this,"dialog-closed",{dialog:this.localName})}},{kind:"method",key:"render",value:function(){return this._params&&this._navigateIds?(0,v.dy)(w||(w=(0,c.Z)([' <ha-dialog open scrimClickAction escapeKeyAction hideActions flexContent .heading="','" @closed="','" @opened="','"> <ha-dialog-header show-border slot="heading"> ',' <span slot="title"> ',' </span> <ha-media-manage-button slot="actionItems" .hass="','" .currentItem="','" @media-refresh="','"></ha-media-manage-button> <ha-button-menu slot="actionItems" @action="','" @closed="','" fixed> <ha-icon-button slot="trigger" .label="','" .path="','"></ha-icon-button> <mwc-list-item graphic="icon"> ',' <ha-svg-icon class="','" slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon"> ',' <ha-svg-icon class="','" slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon"> ',' <ha-svg-icon slot="graphic" class="','" .path="','"></ha-svg-icon> </mwc-list-item> </ha-button-menu> <ha-icon-button .label="','" .path="','" dialogAction="close" slot="actionItems"></ha-icon-button> </ha-dialog-header> <ha-media-player-browse dialog .hass="','" .entityId="','" .navigateIds="','" .action="','" .preferredLayout="','" @close-dialog="','" @media-picked="','" @media-browsed="','"></ha-media-player-browse> </ha-dialog> '])),this._currentItem?this._currentItem.title:this.hass.localize("ui.components.media-browser.media-player-browser"),this.closeDialog,this._dialogOpened,this._navigateIds.length>1?(0,v.dy)(x||(x=(0,c.Z)([' <ha-icon-button slot="navigationIcon" .path="','" @click="','"></ha-icon-button> '])),"M20,11V13H8L13.5,18.5L12.08,19.92L4.16,12L12.08,4.08L13.5,5.5L8,11H20Z",this._goBack):v.Ld,this._currentItem?this._currentItem.title:this.hass.localize("ui.components.media-browser.media-player-browser"),this.hass,this._currentItem,this._refreshMedia,this._handleMenuAction,_.U,this.hass.localize("ui.common.menu"),"M12,16A2,2 0 0,1 14,18A2,2 0 0,1 12,20A2,2 0 0,1 10,18A2,2 0 0,1 12,16M12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12A2,2 0 0,1 12,10M12,4A2,2 0 0,1 14,6A2,2 0 0,1 12,8A2,2 0 0,1 10,6A2,2 0 0,1 12,4Z",this.hass.localize("ui.components.media-browser.auto"),"auto"===this._preferredLayout?"selected_menu_item":"","M3,5A2,2 0 0,1 5,3H19A2,2 0 0,1 21,5V19A2,2 0 0,1 19,21H5C3.89,21 3,20.1 3,19V5M5,5V19H19V5H5M11,7H13A2,2 0 0,1 15,9V17H13V13H11V17H9V9A2,2 0 0,1 11,7M11,9V11H13V9H11Z",this.hass.localize("ui.components.media-browser.grid"),"grid"===this._preferredLayout?"selected_menu_item":"","M10,4V8H14V4H10M16,4V8H20V4H16M16,10V14H20V10H16M16,16V20H20V16H16M14,20V16H10V20H14M8,20V16H4V20H8M8,14V10H4V14H8M8,8V4H4V8H8M10,14H14V10H10V14M4,2H20A2,2 0 0,1 22,4V20A2,2 0 0,1 20,22H4C2.92,22 2,21.1 2,20V4A2,2 0 0,1 4,2Z",this.hass.localize("ui.components.media-browser.list"),"list"===this._preferredLayout?"selected_menu_item":"","M11 15H17V17H11V15M9 7H7V9H9V7M11 13H17V11H11V13M11 9H17V7H11V9M9 11H7V13H9V11M21 5V19C21 20.1 20.1 21 19 21H5C3.9 21 3 20.1 3 19V5C3 3.9 3.9 3 5 3H19C20.1 3 21 3.9 21 5M19 5H5V19H19V5M9 15H7V17H9V15Z",this.hass.localize("ui.dialogs.generic.close"),"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z",this.hass,this._params.entityId,this._navigateIds,this._action,this._preferredLayout,this.closeDialog,this._mediaPicked,this._mediaBrowsed):v.Ld}},{kind:"method",key:"_dialogOpened",value:function(){this.classList.add("opened")}},{kind:"method",key:"_handleMenuAction",value:(i=(0,s.Z)((0,a.Z)().mark((function e(t){return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:e.t0=t.detail.index,e.next=0===e.t0?3:1===e.t0?5:2===e.t0?7:9;break;case 3:return this._preferredLayout="auto",e.abrupt("break",9);case 5:return this._preferredLayout="grid",e.abrupt("break",9);case 7:return this._preferredLayout="list",e.abrupt("break",9);case 9:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"method",key:"_goBack",value:function(){var e;this._navigateIds=null===(e=this._navigateIds)||void 0===e?void 0:e.slice(0,-1),this._currentItem=void 0}},{kind:"method",key:"_mediaBrowsed",value:function(e){this._navigateIds=e.detail.ids,this._currentItem=e.detail.current}},{kind:"method",key:"_mediaPicked",value:function(e){this._params.mediaPickedCallback(e.detail),"play"!==this._action&&this.closeDialog()}},{kind:"get",key:"_action",value:function(){return this._params.action||"play"}},{kind:"method",key:"_refreshMedia",value:function(){this._browser.refresh()}},{kind:"get",static:!0,key:"styles",value:function(){return[y.yu,(0,v.iv)(Z||(Z=(0,c.Z)(["ha-dialog{--dialog-z-index:9;--dialog-content-padding:0}ha-media-player-browse{--media-browser-max-height:calc(100vh - 65px);direction:ltr}:host(.opened) ha-media-player-browse{height:calc(100vh - 65px)}@media (min-width:800px){ha-dialog{--mdc-dialog-max-width:800px;--dialog-surface-position:fixed;--dialog-surface-top:40px;--mdc-dialog-max-height:calc(100vh - 72px)}ha-media-player-browse{position:initial;--media-browser-max-height:100vh - 137px;width:700px}}ha-dialog-header ha-media-manage-button{--mdc-theme-primary:var(--primary-text-color);margin:6px;display:block}"])))]}}]}}),v.oi),o(),e.next=47;break;case 44:e.prev=44,e.t2=e.catch(0),o(e.t2);case 47:case"end":return e.stop()}}),e,null,[[0,44]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var a=e.apply(t,i);function s(e){o(a,r,n,s,c,"next",e)}function c(e){o(a,r,n,s,c,"throw",e)}s(void 0)}))});return function(e,t){return r.apply(this,arguments)}}())},57435:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,o=i.hasOwnProperty,a=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},c=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",d=s.toStringTag||"@@toStringTag";function u(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{u({},"")}catch(e){u=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,o=Object.create(n.prototype),s=new V(r||[]);return a(o,"_invoke",{value:I(e,i,s)}),o}function p(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var f="suspendedStart",v="suspendedYield",m="executing",g="completed",y={};function b(){}function _(){}function k(){}var w={};u(w,c,(function(){return this}));var x=Object.getPrototypeOf,Z=x&&x(x(H([])));Z&&Z!==i&&o.call(Z,c)&&(w=Z);var L=k.prototype=b.prototype=Object.create(w);function C(e){["next","throw","return"].forEach((function(t){u(e,t,(function(e){return this._invoke(t,e)}))}))}function z(e,t){function i(n,a,s,c){var l=p(e[n],e,a);if("throw"!==l.type){var d=l.arg,u=d.value;return u&&"object"==r(u)&&o.call(u,"__await")?t.resolve(u.__await).then((function(e){i("next",e,s,c)}),(function(e){i("throw",e,s,c)})):t.resolve(u).then((function(e){d.value=e,s(d)}),(function(e){return i("throw",e,s,c)}))}c(l.arg)}var n;a(this,"_invoke",{value:function(e,r){function o(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(o,o):o()}})}function I(t,i,r){var n=f;return function(o,a){if(n===m)throw new Error("Generator is already running");if(n===g){if("throw"===o)throw a;return{value:e,done:!0}}for(r.method=o,r.arg=a;;){var s=r.delegate;if(s){var c=E(s,r);if(c){if(c===y)continue;return c}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===f)throw n=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=m;var l=p(t,i,r);if("normal"===l.type){if(n=r.done?g:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=g,r.method="throw",r.arg=l.arg)}}}function E(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,E(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var o=p(n,t.iterator,i.arg);if("throw"===o.type)return i.method="throw",i.arg=o.arg,i.delegate=null,y;var a=o.arg;return a?a.done?(i[t.resultName]=a.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):a:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function O(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function S(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function V(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(O,this),this.reset(!0)}function H(t){if(t||""===t){var i=t[c];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,a=function i(){for(;++n<t.length;)if(o.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return a.next=a}}throw new TypeError(r(t)+" is not iterable")}return _.prototype=k,a(L,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:_,configurable:!0}),_.displayName=u(k,d,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===_||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,k):(e.__proto__=k,u(e,d,"GeneratorFunction")),e.prototype=Object.create(L),e},t.awrap=function(e){return{__await:e}},C(z.prototype),u(z.prototype,l,(function(){return this})),t.AsyncIterator=z,t.async=function(e,i,r,n,o){void 0===o&&(o=Promise);var a=new z(h(e,i,r,n),o);return t.isGeneratorFunction(i)?a:a.next().then((function(e){return e.done?e.value:a.next()}))},C(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=H,V.prototype={constructor:V,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(S),!t)for(var i in this)"t"===i.charAt(0)&&o.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var a=this.tryEntries[n],s=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),l=o.call(a,"finallyLoc");if(c&&l){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var a=n?n.completion:{};return a.type=e,a.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(a)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),S(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;S(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:H(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function o(e,t,i,r,n,o,a){try{var s=e[o](a),c=s.value}catch(l){return void i(l)}s.done?t(c):Promise.resolve(c).then(r,n)}i.a(e,function(){var e,t=(e=n().mark((function e(t,r){var o,a,s,c,l,d,u,h,p,f,v,m,g,y,b,_,k,w,x,Z,L,C,z;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,o=i(99312),a=i(81043),s=i(88962),c=i(33368),l=i(71650),d=i(68308),u=i(82390),h=i(69205),p=i(91808),f=i(34541),v=i(47838),i(97393),i(22859),i(51358),i(46798),i(5239),i(98490),i(7695),i(44758),i(80354),i(68630),i(85472),i(9849),i(90126),i(85717),i(94570),i(44577),m=i(5095),g=i(95260),y=i(3747),b=i(18394),_=i(56112),k=i(29950),i(99539),w=i(7648),i(60298),x=i(26884),!(Z=t([w])).then){e.next=61;break}return e.next=57,Z;case 57:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=62;break;case 61:e.t0=Z;case 62:w=e.t0[0],(0,p.Z)([(0,g.Mo)("ha-browse-media-tts")],(function(e,t){var i,r=function(t){function i(){var t;(0,l.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,d.Z)(this,i,[].concat(n)),e((0,u.Z)(t)),t}return(0,h.Z)(i,t),(0,c.Z)(i)}(t);return{F:r,d:[{kind:"field",decorators:[(0,g.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,g.Cb)()],key:"item",value:void 0},{kind:"field",decorators:[(0,g.Cb)()],key:"action",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_language",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_voice",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_provider",value:void 0},{kind:"field",decorators:[(0,y.t)({key:"TtsMessage",state:!0,subscribe:!1})],key:"_message",value:void 0},{kind:"method",key:"render",value:function(){var e,t;return(0,m.dy)(L||(L=(0,s.Z)(['<ha-card> <div class="card-content"> <ha-textarea autogrow .label="','" .value="','"> </ha-textarea> ',' </div> <div class="card-actions"> <mwc-button @click="','"> '," </mwc-button> </div> </ha-card> "])),this.hass.localize("ui.components.media-browser.tts.message"),this._message||this.hass.localize("ui.components.media-browser.tts.example_message",{name:(null===(e=this.hass.user)||void 0===e?void 0:e.name)||"Alice"}),null!==(t=this._provider)&&void 0!==t&&null!==(t=t.supported_languages)&&void 0!==t&&t.length?(0,m.dy)(C||(C=(0,s.Z)([' <div class="options"> <ha-language-picker .hass="','" .languages="','" .value="','" required @value-changed="','"></ha-language-picker> <ha-tts-voice-picker .hass="','" .value="','" .engineId="','" .language="','" required @value-changed="','"></ha-tts-voice-picker> </div>'])),this.hass,this._provider.supported_languages,this._language,this._languageChanged,this.hass,this._voice,this._provider.engine_id,this._language,this._voiceChanged):m.Ld,this._ttsClicked,this.hass.localize("ui.components.media-browser.tts.action_".concat(this.action)))}},{kind:"method",key:"willUpdate",value:function(e){var t,i=this;if((0,f.Z)((0,v.Z)(r.prototype),"willUpdate",this).call(this,e),e.has("item")&&this.item.media_content_id){var n,o=new URLSearchParams(this.item.media_content_id.split("?")[1]),a=o.get("message"),s=o.get("language"),c=o.get("voice");a&&(this._message=a),s&&(this._language=s),c&&(this._voice=c);var l=(0,_.Xk)(this.item.media_content_id);l!==(null===(n=this._provider)||void 0===n?void 0:n.engine_id)&&(this._provider=void 0,(0,_.yP)(this.hass,l).then((function(e){var t;if(i._provider=e.provider,!i._language&&null!==(t=e.provider.supported_languages)&&void 0!==t&&t.length){var r,n="".concat(i.hass.config.language,"-").concat(i.hass.config.country).toLowerCase(),o=e.provider.supported_languages.find((function(e){return e.toLowerCase()===n}));if(o)return void(i._language=o);i._language=null===(r=e.provider.supported_languages)||void 0===r?void 0:r.find((function(e){return e.substring(0,2)===i.hass.config.language.substring(0,2)}))}})),"cloud"===l&&(0,x.LI)(this.hass).then((function(e){e.logged_in&&(i._language=e.prefs.tts_default_voice[0])})))}if(!e.has("_message")){var d=null===(t=this.shadowRoot.querySelector("ha-textarea"))||void 0===t?void 0:t.value;void 0!==d&&d!==this._message&&(this._message=d)}}},{kind:"method",key:"_languageChanged",value:function(e){this._language=e.detail.value}},{kind:"method",key:"_voiceChanged",value:function(e){this._voice=e.detail.value}},{kind:"method",key:"_ttsClicked",value:(i=(0,a.Z)((0,o.Z)().mark((function e(){var t,i,r;return(0,o.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=this.shadowRoot.querySelector("ha-textarea").value,this._message=t,i=Object.assign({},this.item),(r=new URLSearchParams).append("message",t),this._language&&r.append("language",this._language),this._voice&&r.append("voice",this._voice),i.media_content_id="".concat(i.media_content_id.split("?")[0],"?").concat(r.toString()),i.can_play=!0,i.title=t,(0,b.B)(this,"tts-picked",{item:i});case 11:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"field",static:!0,key:"styles",value:function(){return[k.k1,(0,m.iv)(z||(z=(0,s.Z)([":host{margin:16px auto;padding:0 8px;display:flex;flex-direction:column;max-width:448px}.options{margin-top:16px;display:flex;justify-content:space-between}ha-textarea{width:100%}button.link{color:var(--primary-color)}"])))]}}]}}),m.oi),r(),e.next=70;break;case 67:e.prev=67,e.t2=e.catch(0),r(e.t2);case 70:case"end":return e.stop()}}),e,null,[[0,67]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var a=e.apply(t,i);function s(e){o(a,r,n,s,c,"next",e)}function c(e){o(a,r,n,s,c,"throw",e)}s(void 0)}))});return function(e,i){return t.apply(this,arguments)}}())},64914:function(e,t,i){var r,n,o=i(88962),a=i(33368),s=i(71650),c=i(68308),l=i(82390),d=i(69205),u=i(91808),h=(i(97393),i(14271),i(5095)),p=i(95260),f=i(18394),v=i(23469);i(37662),i(51358),i(46798),i(47084),i(5239),i(98490),(0,u.Z)([(0,p.Mo)("ha-media-manage-button")],(function(e,t){var u=function(t){function i(){var t;(0,s.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,c.Z)(this,i,[].concat(n)),e((0,l.Z)(t)),t}return(0,d.Z)(i,t),(0,a.Z)(i)}(t);return{F:u,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"currentItem",value:void 0},{kind:"field",decorators:[(0,p.SB)()],key:"_uploading",value:function(){return 0}},{kind:"method",key:"render",value:function(){return this.currentItem&&(0,v.aV)(this.currentItem.media_content_id||"")?(0,h.dy)(r||(r=(0,o.Z)([' <mwc-button .label="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </mwc-button> '])),this.hass.localize("ui.components.media-browser.file_management.manage"),this._manage,"M19.39 10.74L11 19.13V20H4C2.9 20 2 19.11 2 18V6C2 4.89 2.89 4 4 4H10L12 6H20C21.1 6 22 6.89 22 8V10.15C21.74 10.06 21.46 10 21.17 10C20.5 10 19.87 10.26 19.39 10.74M13 19.96V22H15.04L21.17 15.88L19.13 13.83L13 19.96M22.85 13.47L21.53 12.15C21.33 11.95 21 11.95 20.81 12.15L19.83 13.13L21.87 15.17L22.85 14.19C23.05 14 23.05 13.67 22.85 13.47Z"):h.Ld}},{kind:"method",key:"_manage",value:function(){var e,t,r=this;e=this,t={currentItem:this.currentItem,onClose:function(){return(0,f.B)(r,"media-refresh")}},(0,f.B)(e,"show-dialog",{dialogTag:"dialog-media-manage",dialogImport:function(){return Promise.all([i.e(1985),i.e(8249),i.e(7765)]).then(i.bind(i,77765))},dialogParams:t})}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(n||(n=(0,o.Z)(["mwc-button{--mdc-button-disabled-ink-color:--mdc-theme-primary}ha-circular-progress[slot=icon],ha-svg-icon[slot=icon]{vertical-align:middle}ha-svg-icon[slot=icon]{margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction)}"])))}}]}}),h.oi)},15758:function(e,t,i){function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function n(){n=function(){return t};var e,t={},i=Object.prototype,o=i.hasOwnProperty,a=Object.defineProperty||function(e,t,i){e[t]=i.value},s="function"==typeof Symbol?Symbol:{},c=s.iterator||"@@iterator",l=s.asyncIterator||"@@asyncIterator",d=s.toStringTag||"@@toStringTag";function u(e,t,i){return Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{u({},"")}catch(e){u=function(e,t,i){return e[t]=i}}function h(e,t,i,r){var n=t&&t.prototype instanceof b?t:b,o=Object.create(n.prototype),s=new V(r||[]);return a(o,"_invoke",{value:I(e,i,s)}),o}function p(e,t,i){try{return{type:"normal",arg:e.call(t,i)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var f="suspendedStart",v="suspendedYield",m="executing",g="completed",y={};function b(){}function _(){}function k(){}var w={};u(w,c,(function(){return this}));var x=Object.getPrototypeOf,Z=x&&x(x(H([])));Z&&Z!==i&&o.call(Z,c)&&(w=Z);var L=k.prototype=b.prototype=Object.create(w);function C(e){["next","throw","return"].forEach((function(t){u(e,t,(function(e){return this._invoke(t,e)}))}))}function z(e,t){function i(n,a,s,c){var l=p(e[n],e,a);if("throw"!==l.type){var d=l.arg,u=d.value;return u&&"object"==r(u)&&o.call(u,"__await")?t.resolve(u.__await).then((function(e){i("next",e,s,c)}),(function(e){i("throw",e,s,c)})):t.resolve(u).then((function(e){d.value=e,s(d)}),(function(e){return i("throw",e,s,c)}))}c(l.arg)}var n;a(this,"_invoke",{value:function(e,r){function o(){return new t((function(t,n){i(e,r,t,n)}))}return n=n?n.then(o,o):o()}})}function I(t,i,r){var n=f;return function(o,a){if(n===m)throw new Error("Generator is already running");if(n===g){if("throw"===o)throw a;return{value:e,done:!0}}for(r.method=o,r.arg=a;;){var s=r.delegate;if(s){var c=E(s,r);if(c){if(c===y)continue;return c}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(n===f)throw n=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);n=m;var l=p(t,i,r);if("normal"===l.type){if(n=r.done?g:v,l.arg===y)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(n=g,r.method="throw",r.arg=l.arg)}}}function E(t,i){var r=i.method,n=t.iterator[r];if(n===e)return i.delegate=null,"throw"===r&&t.iterator.return&&(i.method="return",i.arg=e,E(t,i),"throw"===i.method)||"return"!==r&&(i.method="throw",i.arg=new TypeError("The iterator does not provide a '"+r+"' method")),y;var o=p(n,t.iterator,i.arg);if("throw"===o.type)return i.method="throw",i.arg=o.arg,i.delegate=null,y;var a=o.arg;return a?a.done?(i[t.resultName]=a.value,i.next=t.nextLoc,"return"!==i.method&&(i.method="next",i.arg=e),i.delegate=null,y):a:(i.method="throw",i.arg=new TypeError("iterator result is not an object"),i.delegate=null,y)}function O(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function S(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function V(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(O,this),this.reset(!0)}function H(t){if(t||""===t){var i=t[c];if(i)return i.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var n=-1,a=function i(){for(;++n<t.length;)if(o.call(t,n))return i.value=t[n],i.done=!1,i;return i.value=e,i.done=!0,i};return a.next=a}}throw new TypeError(r(t)+" is not iterable")}return _.prototype=k,a(L,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:_,configurable:!0}),_.displayName=u(k,d,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===_||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,k):(e.__proto__=k,u(e,d,"GeneratorFunction")),e.prototype=Object.create(L),e},t.awrap=function(e){return{__await:e}},C(z.prototype),u(z.prototype,l,(function(){return this})),t.AsyncIterator=z,t.async=function(e,i,r,n,o){void 0===o&&(o=Promise);var a=new z(h(e,i,r,n),o);return t.isGeneratorFunction(i)?a:a.next().then((function(e){return e.done?e.value:a.next()}))},C(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),i=[];for(var r in t)i.push(r);return i.reverse(),function e(){for(;i.length;){var r=i.pop();if(r in t)return e.value=r,e.done=!1,e}return e.done=!0,e}},t.values=H,V.prototype={constructor:V,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(S),!t)for(var i in this)"t"===i.charAt(0)&&o.call(this,i)&&!isNaN(+i.slice(1))&&(this[i]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var i=this;function r(r,n){return s.type="throw",s.arg=t,i.next=r,n&&(i.method="next",i.arg=e),!!n}for(var n=this.tryEntries.length-1;n>=0;--n){var a=this.tryEntries[n],s=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),l=o.call(a,"finallyLoc");if(c&&l){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(e,t){for(var i=this.tryEntries.length-1;i>=0;--i){var r=this.tryEntries[i];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var n=r;break}}n&&("break"===e||"continue"===e)&&n.tryLoc<=t&&t<=n.finallyLoc&&(n=null);var a=n?n.completion:{};return a.type=e,a.arg=t,n?(this.method="next",this.next=n.finallyLoc,y):this.complete(a)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),y},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.finallyLoc===e)return this.complete(i.completion,i.afterLoc),S(i),y}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var i=this.tryEntries[t];if(i.tryLoc===e){var r=i.completion;if("throw"===r.type){var n=r.arg;S(i)}return n}}throw new Error("illegal catch attempt")},delegateYield:function(t,i,r){return this.delegate={iterator:H(t),resultName:i,nextLoc:r},"next"===this.method&&(this.arg=e),y}},t}function o(e,t,i,r,n,o,a){try{var s=e[o](a),c=s.value}catch(l){return void i(l)}s.done?t(c):Promise.resolve(c).then(r,n)}i.a(e,function(){var e,t=(e=n().mark((function e(t,r){var o,a,s,c,l,d,u,h,p,f,v,m,g,y,b,_,k,w,x,Z,L,C,z,I,E,O,S,V,H,A,j,M,P,B,F,T,N,U,G,D,R,q,W,Y,$,J,K,Q,X,ee,te,ie,re,ne,oe,ae,se,ce,le,de,ue,he,pe;return n().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.prev=0,o=i(46097),a=i(88962),s=i(99312),c=i(81043),l=i(33368),d=i(71650),u=i(68308),h=i(82390),p=i(69205),f=i(91808),v=i(34541),m=i(47838),i(97393),i(46798),i(9849),i(49089),i(47084),i(40271),i(88640),i(17692),i(36513),i(85717),g=i(26535),i(14271),i(61641),i(44577),i(33829),y=i(5095),b=i(95260),_=i(53180),k=i(86634),w=i(36142),x=i(18394),Z=i(51750),L=i(72218),C=i(21157),z=i(78889),I=i(23469),E=i(56112),O=i(11285),S=i(23636),V=i(29950),H=i(72824),A=i(84728),i(91998),i(23860),i(85878),i(68336),i(7006),i(99040),i(54371),i(37662),j=i(57435),M=i(62782),!(P=t([j])).then){e.next=73;break}return e.next=69,P;case 69:e.t1=e.sent,e.t0=(0,e.t1)(),e.next=74;break;case 73:e.t0=P;case 74:j=e.t0[0],he="M8,5.14V19.14L19,12.14L8,5.14Z",pe="M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z",(0,f.Z)([(0,b.Mo)("ha-media-player-browse")],(function(e,t){var i,r,n,f,j,P=function(t){function i(){var t;(0,d.Z)(this,i);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return t=(0,u.Z)(this,i,[].concat(n)),e((0,h.Z)(t)),t}return(0,p.Z)(i,t),(0,l.Z)(i)}(t);return{F:P,d:[{kind:"field",decorators:[(0,b.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"entityId",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"action",value:function(){return"play"}},{kind:"field",decorators:[(0,b.Cb)()],key:"preferredLayout",value:function(){return"auto"}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"dialog",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({attribute:!1})],key:"navigateIds",value:function(){return[]}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean,reflect:!0})],key:"scrolled",value:function(){return!1}},{kind:"field",decorators:[(0,b.SB)()],key:"_error",value:void 0},{kind:"field",decorators:[(0,b.SB)()],key:"_parentItem",value:void 0},{kind:"field",decorators:[(0,b.SB)()],key:"_currentItem",value:void 0},{kind:"field",decorators:[(0,b.IO)(".header")],key:"_header",value:void 0},{kind:"field",decorators:[(0,b.IO)(".content")],key:"_content",value:void 0},{kind:"field",decorators:[(0,b.IO)("lit-virtualizer")],key:"_virtualizer",value:void 0},{kind:"field",key:"_observed",value:function(){return!1}},{kind:"field",key:"_headerOffsetHeight",value:function(){return 0}},{kind:"field",key:"_resizeObserver",value:void 0},{kind:"method",key:"connectedCallback",value:function(){var e=this;(0,v.Z)((0,m.Z)(P.prototype),"connectedCallback",this).call(this),this.updateComplete.then((function(){return e._attachResizeObserver()}))}},{kind:"method",key:"disconnectedCallback",value:function(){(0,v.Z)((0,m.Z)(P.prototype),"disconnectedCallback",this).call(this),this._resizeObserver&&this._resizeObserver.disconnect()}},{kind:"method",key:"refresh",value:(j=(0,c.Z)((0,s.Z)().mark((function e(){var t;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return t=this.navigateIds[this.navigateIds.length-1],e.prev=1,e.next=4,this._fetchData(this.entityId,t.media_content_id,t.media_content_type);case 4:this._currentItem=e.sent,(0,x.B)(this,"media-browsed",{ids:this.navigateIds,current:this._currentItem}),e.next=11;break;case 8:e.prev=8,e.t0=e.catch(1),this._setError(e.t0);case 11:case"end":return e.stop()}}),e,this,[[1,8]])}))),function(){return j.apply(this,arguments)})},{kind:"method",key:"play",value:function(){var e;null!==(e=this._currentItem)&&void 0!==e&&e.can_play&&this._runAction(this._currentItem)}},{kind:"method",key:"willUpdate",value:function(e){var t,i=this;if((0,v.Z)((0,m.Z)(P.prototype),"willUpdate",this).call(this,e),this.hasUpdated||(0,M.o)(),e.has("entityId"))this._setError(void 0);else if(!e.has("navigateIds"))return;this._setError(void 0);var r=e.get("navigateIds"),n=this.navigateIds;null===(t=this._content)||void 0===t||t.scrollTo(0,0),this.scrolled=!1;var o=this._currentItem,a=this._parentItem;this._currentItem=void 0,this._parentItem=void 0;var s,c,l=n[n.length-1],d=n.length>1?n[n.length-2]:void 0;e.has("entityId")||(r&&n.length===r.length+1&&r.every((function(e,t){var i=n[t];return i.media_content_id===e.media_content_id&&i.media_content_type===e.media_content_type}))?c=Promise.resolve(o):r&&n.length===r.length-1&&n.every((function(e,t){var i=r[t];return e.media_content_id===i.media_content_id&&e.media_content_type===i.media_content_type}))&&(s=Promise.resolve(a))),s||(s=this._fetchData(this.entityId,l.media_content_id,l.media_content_type)),s.then((function(e){i._currentItem=e,(0,x.B)(i,"media-browsed",{ids:n,current:e})}),(function(t){var o;r&&e.has("entityId")&&n.length===r.length&&r.every((function(e,t){return n[t].media_content_id===e.media_content_id&&n[t].media_content_type===e.media_content_type}))?(0,x.B)(i,"media-browsed",{ids:[{media_content_id:void 0,media_content_type:void 0}],replace:!0}):"entity_not_found"===t.code&&(0,C.rk)(null===(o=i.hass.states[i.entityId])||void 0===o?void 0:o.state)?i._setError({message:i.hass.localize("ui.components.media-browser.media_player_unavailable"),code:"entity_not_found"}):i._setError(t)})),c||void 0===d||(c=this._fetchData(this.entityId,d.media_content_id,d.media_content_type)),c&&c.then((function(e){i._parentItem=e}))}},{kind:"method",key:"shouldUpdate",value:function(e){if(e.size>1||!e.has("hass"))return!0;var t=e.get("hass");return void 0===t||t.localize!==this.hass.localize}},{kind:"method",key:"firstUpdated",value:function(){this._measureCard(),this._attachResizeObserver()}},{kind:"method",key:"updated",value:function(e){if((0,v.Z)((0,m.Z)(P.prototype),"updated",this).call(this,e),e.has("_scrolled"))this._animateHeaderHeight();else if(e.has("_currentItem")){var t;if(this._setHeaderHeight(),this._observed)return;var i=null===(t=this._virtualizer)||void 0===t?void 0:t._virtualizer;i&&(this._observed=!0,setTimeout((function(){return i._observeMutations()}),0))}}},{kind:"method",key:"render",value:function(){if(this._error)return(0,y.dy)(B||(B=(0,a.Z)([' <div class="container"> <ha-alert alert-type="error"> '," </ha-alert> </div> "])),this._renderError(this._error));if(!this._currentItem)return(0,y.dy)(F||(F=(0,a.Z)(["<ha-circular-progress indeterminate></ha-circular-progress>"])));var e=this._currentItem,t=this.hass.localize("ui.components.media-browser.class.".concat(e.media_class)),i=e.children||[],r=z.Fn[e.media_class],n=e.children_media_class?z.Fn[e.children_media_class]:z.Fn.directory,o=e.thumbnail?this._getThumbnailURLorBase64(e.thumbnail).then((function(e){return"url(".concat(e,")")})):"none";return(0,y.dy)(T||(T=(0,a.Z)([" ",' <div class="content" @scroll="','" @touchmove="','"> '," </div> "])),e.can_play?(0,y.dy)(N||(N=(0,a.Z)([' <div class="header ','" @transitionend="','"> <div class="header-content"> ',' <div class="header-info"> <div class="breadcrumb"> <h1 class="title">',"</h1> "," </div> "," </div> </div> </div> "])),(0,_.$)({"no-img":!e.thumbnail,"no-dialog":!this.dialog}),this._setHeaderHeight,e.thumbnail?(0,y.dy)(U||(U=(0,a.Z)([' <div class="img" style="background-image:','"> '," </div> "])),(0,w.C)(o,""),this.narrow&&null!=e&&e.can_play?(0,y.dy)(G||(G=(0,a.Z)([' <ha-fab mini .item="','" @click="','"> <ha-svg-icon slot="icon" .label="','" .path="','"></ha-svg-icon> '," </ha-fab> "])),e,this._actionClicked,this.hass.localize("ui.components.media-browser.".concat(this.action,"-media")),"play"===this.action?he:pe,this.hass.localize("ui.components.media-browser.".concat(this.action))):""):y.Ld,e.title,t?(0,y.dy)(D||(D=(0,a.Z)([' <h2 class="subtitle">',"</h2> "])),t):"",!e.can_play||e.thumbnail&&this.narrow?"":(0,y.dy)(R||(R=(0,a.Z)([' <mwc-button raised .item="','" @click="','"> <ha-svg-icon .label="','" .path="','"></ha-svg-icon> '," </mwc-button> "])),e,this._actionClicked,this.hass.localize("ui.components.media-browser.".concat(this.action,"-media")),"play"===this.action?he:pe,this.hass.localize("ui.components.media-browser.".concat(this.action)))):"",this._scroll,this._scroll,this._error?(0,y.dy)(q||(q=(0,a.Z)([' <div class="container"> <ha-alert alert-type="error"> '," </ha-alert> </div> "])),this._renderError(this._error)):(0,E.b_)(e.media_content_id)?(0,y.dy)(W||(W=(0,a.Z)([' <ha-browse-media-tts .item="','" .hass="','" .action="','" @tts-picked="','"></ha-browse-media-tts> '])),e,this.hass,this.action,this._ttsPicked):i.length||e.not_shown?"grid"===this.preferredLayout||"auto"===this.preferredLayout&&"grid"===n.layout?(0,y.dy)(J||(J=(0,a.Z)([' <lit-virtualizer scroller .layout="','" .items="','" .renderItem="','" class="children ','"></lit-virtualizer> '," "])),(0,g.e)({itemSize:{width:"175px",height:"portrait"===n.thumbnail_ratio?"312px":"225px"},gap:"16px",flex:{preserve:"aspect-ratio"},justify:"space-evenly",direction:"vertical"}),i,this._renderGridItem,(0,_.$)({portrait:"portrait"===n.thumbnail_ratio,not_shown:!!e.not_shown}),e.not_shown?(0,y.dy)(K||(K=(0,a.Z)([' <div class="grid not-shown"> <div class="title"> '," </div> </div> "])),this.hass.localize("ui.components.media-browser.not_shown",{count:e.not_shown})):""):(0,y.dy)(Q||(Q=(0,a.Z)([' <mwc-list> <lit-virtualizer scroller .items="','" style="','" .renderItem="','"></lit-virtualizer> '," </mwc-list> "])),i,(0,k.V)({height:"".concat(72*i.length+26,"px")}),this._renderListItem,e.not_shown?(0,y.dy)(X||(X=(0,a.Z)([' <mwc-list-item noninteractive class="not-shown" .graphic="','" dir="','"> <span class="title"> '," </span> </mwc-list-item> "])),r.show_list_images?"medium":"avatar",(0,Z.Zu)(this.hass),this.hass.localize("ui.components.media-browser.not_shown",{count:e.not_shown})):""):(0,y.dy)(Y||(Y=(0,a.Z)([' <div class="container no-items"> '," </div> "])),"media-source://media_source/local/."===e.media_content_id?(0,y.dy)($||($=(0,a.Z)([' <div class="highlight-add-button"> <span> <ha-svg-icon .path="','"></ha-svg-icon> </span> <span> '," </span> </div> "])),"M21.5 9.5L20.09 10.92L17 7.83V13.5C17 17.09 14.09 20 10.5 20H4V18H10.5C13 18 15 16 15 13.5V7.83L11.91 10.91L10.5 9.5L16 4L21.5 9.5Z",this.hass.localize("ui.components.media-browser.file_management.highlight_button")):this.hass.localize("ui.components.media-browser.no_items")))}},{kind:"field",key:"_renderGridItem",value:function(){var e=this;return function(t){var i=t.thumbnail?e._getThumbnailURLorBase64(t.thumbnail).then((function(e){return"url(".concat(e,")")})):"none";return(0,y.dy)(ee||(ee=(0,a.Z)([' <div class="child" .item="','" @click="','"> <ha-card outlined> <div class="thumbnail"> '," ",' </div> <div class="title"> ',' <simple-tooltip fitToVisibleBounds position="top" offset="4">',"</simple-tooltip> </div> </ha-card> </div> "])),t,e._childClicked,t.thumbnail?(0,y.dy)(te||(te=(0,a.Z)([' <div class="',' image" style="background-image:','"></div> '])),(0,_.$)({"centered-image":["app","directory"].includes(t.media_class),"brand-image":(0,H.zC)(t.thumbnail)}),(0,w.C)(i,"")):(0,y.dy)(ie||(ie=(0,a.Z)([' <div class="icon-holder image"> <ha-svg-icon class="folder" .path="','"></ha-svg-icon> </div> '])),z.Fn["directory"===t.media_class&&t.children_media_class||t.media_class].icon),t.can_play?(0,y.dy)(re||(re=(0,a.Z)([' <ha-icon-button class="play ','" .item="','" .label="','" .path="','" @click="','"></ha-icon-button> '])),(0,_.$)({can_expand:t.can_expand}),t,e.hass.localize("ui.components.media-browser.".concat(e.action,"-media")),"play"===e.action?he:pe,e._actionClicked):"",t.title,t.title)}}},{kind:"field",key:"_renderListItem",value:function(){var e=this;return function(t){var i=e._currentItem,r=z.Fn[i.media_class],n=r.show_list_images&&t.thumbnail?e._getThumbnailURLorBase64(t.thumbnail).then((function(e){return"url(".concat(e,")")})):"none";return(0,y.dy)(ne||(ne=(0,a.Z)([' <mwc-list-item @click="','" .item="','" .graphic="','" dir="','"> ',' <span class="title">',"</span> </mwc-list-item> "])),e._childClicked,t,r.show_list_images?"medium":"avatar",(0,Z.Zu)(e.hass),"none"!==n||t.can_play?(0,y.dy)(ae||(ae=(0,a.Z)(['<div class="','" style="background-image:','" slot="graphic"> '," </div>"])),(0,_.$)({graphic:!0,thumbnail:!0===r.show_list_images}),(0,w.C)(n,""),t.can_play?(0,y.dy)(se||(se=(0,a.Z)(['<ha-icon-button class="play ','" .item="','" .label="','" .path="','" @click="','"></ha-icon-button>'])),(0,_.$)({show:!r.show_list_images||!t.thumbnail}),t,e.hass.localize("ui.components.media-browser.".concat(e.action,"-media")),"play"===e.action?he:pe,e._actionClicked):y.Ld):(0,y.dy)(oe||(oe=(0,a.Z)(['<ha-svg-icon .path="','" slot="graphic"></ha-svg-icon>'])),z.Fn["directory"===t.media_class&&t.children_media_class||t.media_class].icon),t.title)}}},{kind:"method",key:"_getThumbnailURLorBase64",value:(f=(0,c.Z)((0,s.Z)().mark((function e(t){var i,r=this;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t){e.next=2;break}return e.abrupt("return","");case 2:if(!t.startsWith("/")){e.next=4;break}return e.abrupt("return",new Promise((function(e,i){r.hass.fetchWithAuth(t).then((function(e){return e.blob()})).then((function(t){var r=new FileReader;r.onload=function(){var t=r.result;e("string"==typeof t?t:"")},r.onerror=function(e){return i(e)},r.readAsDataURL(t)}))})));case 4:return(0,H.zC)(t)&&(t=(0,H.X1)({domain:(0,H.u4)(t),type:"icon",useFallback:!0,darkOptimized:null===(i=this.hass.themes)||void 0===i?void 0:i.darkMode})),e.abrupt("return",t);case 6:case"end":return e.stop()}}),e,this)}))),function(e){return f.apply(this,arguments)})},{kind:"field",key:"_actionClicked",value:function(){var e=this;return function(t){t.stopPropagation();var i=t.currentTarget.item;e._runAction(i)}}},{kind:"method",key:"_runAction",value:function(e){(0,x.B)(this,"media-picked",{item:e,navigateIds:this.navigateIds})}},{kind:"method",key:"_ttsPicked",value:function(e){e.stopPropagation();var t=this.navigateIds.slice(0,-1);t.push(e.detail.item),(0,x.B)(this,"media-picked",Object.assign(Object.assign({},e.detail),{},{navigateIds:t}))}},{kind:"field",key:"_childClicked",value:function(){var e=this;return function(){var t=(0,c.Z)((0,s.Z)().mark((function t(i){var r,n;return(0,s.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(r=i.currentTarget,n=r.item){t.next=4;break}return t.abrupt("return");case 4:if(n.can_expand){t.next=7;break}return e._runAction(n),t.abrupt("return");case 7:(0,x.B)(e,"media-browsed",{ids:[].concat((0,o.Z)(e.navigateIds),[n])});case 8:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}()}},{kind:"method",key:"_fetchData",value:(n=(0,c.Z)((0,s.Z)().mark((function e(t,i,r){return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.abrupt("return",t!==z.N8?(0,z.zz)(this.hass,t,i,r):(0,I.b)(this.hass,i));case 1:case"end":return e.stop()}}),e,this)}))),function(e,t,i){return n.apply(this,arguments)})},{kind:"method",key:"_measureCard",value:function(){this.narrow=(this.dialog?window.innerWidth:this.offsetWidth)<450}},{kind:"method",key:"_attachResizeObserver",value:(r=(0,c.Z)((0,s.Z)().mark((function e(){var t=this;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this._resizeObserver){e.next=4;break}return e.next=3,(0,S.j)();case 3:this._resizeObserver=new ResizeObserver((0,L.D)((function(){return t._measureCard()}),250,!1));case 4:this._resizeObserver.observe(this);case 5:case"end":return e.stop()}}),e,this)}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"_closeDialogAction",value:function(){(0,x.B)(this,"close-dialog")}},{kind:"method",key:"_setError",value:function(e){this.dialog?e&&(this._closeDialogAction(),(0,O.Ys)(this,{title:this.hass.localize("ui.components.media-browser.media_browsing_error"),text:this._renderError(e)})):this._error=e}},{kind:"method",key:"_renderError",value:function(e){return"Media directory does not exist."===e.message?(0,y.dy)(ce||(ce=(0,a.Z)([" <h2> "," </h2> <p> "," <br> "," <br> "," </p> "])),this.hass.localize("ui.components.media-browser.no_local_media_found"),this.hass.localize("ui.components.media-browser.no_media_folder"),this.hass.localize("ui.components.media-browser.setup_local_help",{documentation:(0,y.dy)(le||(le=(0,a.Z)(['<a href="','" target="_blank" rel="noreferrer">',"</a>"])),(0,A.R)(this.hass,"/more-info/local-media/setup-media"),this.hass.localize("ui.components.media-browser.documentation"))}),this.hass.localize("ui.components.media-browser.local_media_files")):(0,y.dy)(de||(de=(0,a.Z)(['<span class="error">',"</span>"])),e.message)}},{kind:"method",key:"_setHeaderHeight",value:(i=(0,c.Z)((0,s.Z)().mark((function e(){var t,i;return(0,s.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:if(t=this._header,i=this._content,t&&i){e.next=6;break}return e.abrupt("return");case 6:this._headerOffsetHeight=t.offsetHeight,i.style.marginTop="".concat(this._headerOffsetHeight,"px"),i.style.maxHeight="calc(var(--media-browser-max-height, 100%) - ".concat(this._headerOffsetHeight,"px)");case 9:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"_animateHeaderHeight",value:function(){var e,t=this;requestAnimationFrame((function i(r){void 0===e&&(e=r);var n=r-e;t._setHeaderHeight(),n<400&&requestAnimationFrame(i)}))}},{kind:"method",decorators:[(0,b.hO)({passive:!0})],key:"_scroll",value:function(e){var t=e.currentTarget;!this.scrolled&&t.scrollTop>this._headerOffsetHeight?this.scrolled=!0:this.scrolled&&t.scrollTop<this._headerOffsetHeight&&(this.scrolled=!1)}},{kind:"get",static:!0,key:"styles",value:function(){return[V.Qx,(0,y.iv)(ue||(ue=(0,a.Z)([":host{display:flex;flex-direction:column;position:relative}ha-circular-progress{--mdc-theme-primary:var(--primary-color);display:flex;justify-content:center;margin:40px}.container{padding:16px}.no-items{padding-left:32px}.highlight-add-button{display:flex;flex-direction:row-reverse;margin-right:48px}.highlight-add-button ha-svg-icon{position:relative;top:-.5em;margin-left:8px}.content{overflow-y:auto;box-sizing:border-box;height:100%}.header{display:flex;justify-content:space-between;border-bottom:1px solid var(--divider-color);background-color:var(--card-background-color);position:absolute;top:0;right:0;left:0;z-index:3;padding:16px}.header_button{position:relative;right:-8px}.header-content{display:flex;flex-wrap:wrap;flex-grow:1;align-items:flex-start}.header-content .img{height:175px;width:175px;margin-right:16px;background-size:cover;border-radius:2px;transition:width .4s,height .4s}.header-info{display:flex;flex-direction:column;justify-content:space-between;align-self:stretch;min-width:0;flex:1}.header-info mwc-button{display:block;--mdc-theme-primary:var(--primary-color);padding-bottom:16px}.breadcrumb{display:flex;flex-direction:column;overflow:hidden;flex-grow:1;padding-top:16px}.breadcrumb .title{font-size:32px;line-height:1.2;font-weight:700;margin:0;overflow:hidden;display:-webkit-box;-webkit-box-orient:vertical;-webkit-line-clamp:2;padding-right:8px}.breadcrumb .previous-title{font-size:14px;padding-bottom:8px;color:var(--secondary-text-color);overflow:hidden;text-overflow:ellipsis;cursor:pointer;--mdc-icon-size:14px}.breadcrumb .subtitle{font-size:16px;overflow:hidden;text-overflow:ellipsis;margin-bottom:0;transition:height .5s,margin .5s}.not-shown{font-style:italic;color:var(--secondary-text-color);padding:8px 16px 8px}.grid.not-shown{display:flex;align-items:center;text-align:center}mwc-list{--mdc-list-vertical-padding:0;--mdc-list-item-graphic-margin:0;--mdc-theme-text-icon-on-background:var(--secondary-text-color);margin-top:10px}mwc-list li:last-child{display:none}mwc-list li[divider]{border-bottom-color:var(--divider-color)}mwc-list-item{width:100%}div.children{display:grid;grid-template-columns:repeat(auto-fit,minmax(var(--media-browse-item-size,175px),0.1fr));grid-gap:16px;padding:16px}:host([dialog]) .children{grid-template-columns:repeat(auto-fit,minmax(var(--media-browse-item-size,175px),0.33fr))}.child{display:flex;flex-direction:column;cursor:pointer}ha-card{position:relative;width:100%;box-sizing:border-box}.children ha-card .thumbnail{width:100%;position:relative;box-sizing:border-box;transition:padding-bottom .1s ease-out;padding-bottom:100%}.portrait ha-card .thumbnail{padding-bottom:150%}ha-card .image{border-radius:3px 3px 0 0}.image{position:absolute;top:0;right:0;left:0;bottom:0;background-size:cover;background-repeat:no-repeat;background-position:center}.centered-image{margin:0 8px;background-size:contain}.brand-image{background-size:40%}.children ha-card .icon-holder{display:flex;justify-content:center;align-items:center}.child .folder{color:var(--secondary-text-color);--mdc-icon-size:calc(var(--media-browse-item-size, 175px) * 0.4)}.child .play{position:absolute;transition:color .5s;border-radius:50%;top:calc(50% - 50px);right:calc(50% - 35px);opacity:0;transition:opacity .1s ease-out}.child .play:not(.can_expand){--mdc-icon-button-size:70px;--mdc-icon-size:48px}ha-card:hover .play{opacity:1}ha-card:hover .play:not(.can_expand){color:var(--primary-color)}ha-card:hover .play.can_expand{bottom:8px}.child .play.can_expand{background-color:rgba(var(--rgb-card-background-color),.5);top:auto;bottom:0px;right:8px;transition:bottom .1s ease-out,opacity .1s ease-out}.child .play:hover{color:var(--primary-color)}.child .title{font-size:16px;padding-top:16px;padding-left:2px;overflow:hidden;display:-webkit-box;-webkit-box-orient:vertical;-webkit-line-clamp:1;text-overflow:ellipsis}.child ha-card .title{margin-bottom:16px;padding-left:16px}mwc-list-item .graphic{background-size:contain;background-repeat:no-repeat;background-position:center;border-radius:2px;display:flex;align-content:center;align-items:center;line-height:initial}mwc-list-item .graphic .play{opacity:0;transition:all .5s;background-color:rgba(var(--rgb-card-background-color),.5);border-radius:50%;--mdc-icon-button-size:40px}mwc-list-item:hover .graphic .play{opacity:1;color:var(--primary-text-color)}mwc-list-item .graphic .play.show{opacity:1;background-color:transparent}mwc-list-item .title{margin-left:16px}mwc-list-item[dir=rtl] .title{margin-right:16px;margin-left:0}:host([narrow]){padding:0}:host([narrow]) .media-source{padding:0 24px}:host([narrow]) div.children{grid-template-columns:minmax(0,1fr) minmax(0,1fr)!important}:host([narrow]) .breadcrumb .title{font-size:24px}:host([narrow]) .header{padding:0}:host([narrow]) .header.no-dialog{display:block}:host([narrow]) .header_button{position:absolute;top:14px;right:8px}:host([narrow]) .header-content{flex-direction:column;flex-wrap:nowrap}:host([narrow]) .header-content .img{height:auto;width:100%;margin-right:0;padding-bottom:50%;margin-bottom:8px;position:relative;background-position:center;border-radius:0;transition:width .4s,height .4s,padding-bottom .4s}ha-fab{position:absolute;--mdc-theme-secondary:var(--primary-color);bottom:-20px;right:20px}:host([narrow]) .header-info mwc-button{margin-top:16px;margin-bottom:8px}:host([narrow]) .header-info{padding:0 16px 8px}:host([scrolled]) .breadcrumb .subtitle{height:0;margin:0}:host([scrolled]) .breadcrumb .title{-webkit-line-clamp:1}:host(:not([narrow])[scrolled]) .header:not(.no-img) ha-icon-button{align-self:center}.no-img .header-info mwc-button,:host([scrolled]) .header-info mwc-button{padding-right:4px}:host([scrolled][narrow]) .no-img .header-info mwc-button{padding-right:16px}:host([scrolled]) .header-info{flex-direction:row}:host([scrolled]) .header-info mwc-button{align-self:center;margin-top:0;margin-bottom:0;padding-bottom:0}:host([scrolled][narrow]) .no-img .header-info{flex-direction:row-reverse}:host([scrolled][narrow]) .header-info{padding:20px 24px 10px 24px;align-items:center}:host([scrolled]) .header-content{align-items:flex-end;flex-direction:row}:host([scrolled]) .header-content .img{height:75px;width:75px}:host([scrolled]) .breadcrumb{padding-top:0;align-self:center}:host([scrolled][narrow]) .header-content .img{height:100px;width:100px;padding-bottom:initial;margin-bottom:0}:host([scrolled]) ha-fab{bottom:0px;right:-24px;--mdc-fab-box-shadow:none;--mdc-theme-secondary:rgba(var(--rgb-primary-color), 0.5)}lit-virtualizer{height:100%;overflow:overlay!important;contain:size layout!important}lit-virtualizer.not_shown{height:calc(100% - 36px)}"])))]}}]}}),y.oi),r(),e.next=85;break;case 82:e.prev=82,e.t2=e.catch(0),r(e.t2);case 85:case"end":return e.stop()}}),e,null,[[0,82]])})),function(){var t=this,i=arguments;return new Promise((function(r,n){var a=e.apply(t,i);function s(e){o(a,r,n,s,c,"next",e)}function c(e){o(a,r,n,s,c,"throw",e)}s(void 0)}))});return function(e,i){return t.apply(this,arguments)}}())},26884:function(e,t,i){i.d(t,{LI:function(){return r}});i(85717);var r=function(e){return e.callWS({type:"cloud/status"})}},23469:function(e,t,i){i.d(t,{Qr:function(){return c},aV:function(){return a},b:function(){return o},oE:function(){return s}});var r=i(99312),n=i(81043),o=(i(88640),i(51467),i(22859),function(e,t){return e.callWS({type:"media_source/browse_media",media_content_id:t})}),a=function(e){return e.startsWith("media-source://media_source")},s=function(){var e=(0,n.Z)((0,r.Z)().mark((function e(t,i,n){var o,a;return(0,r.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return(o=new FormData).append("media_content_id",i),o.append("file",n),e.next=5,t.fetchWithAuth("/api/media_source/local_source/upload",{method:"POST",body:o});case 5:if(413!==(a=e.sent).status){e.next=10;break}throw new Error("Uploaded file is too large (".concat(n.name,")"));case 10:if(200===a.status){e.next=12;break}throw new Error("Unknown error");case 12:return e.abrupt("return",a.json());case 13:case"end":return e.stop()}}),e)})));return function(t,i,r){return e.apply(this,arguments)}}(),c=function(){var e=(0,n.Z)((0,r.Z)().mark((function e(t,i){return(0,r.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.abrupt("return",t.callWS({type:"media_source/local_source/remove",media_content_id:i}));case 1:case"end":return e.stop()}}),e)})));return function(t,i){return e.apply(this,arguments)}}()},23636:function(e,t,i){i.d(t,{j:function(){return o}});var r=i(99312),n=i(81043),o=(i(51358),i(46798),i(47084),i(5239),i(98490),function(){var e=(0,n.Z)((0,r.Z)().mark((function e(){return(0,r.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:e.prev=0,new ResizeObserver((function(){})),e.next=9;break;case 4:return e.prev=4,e.t0=e.catch(0),e.next=8,Promise.resolve().then(i.bind(i,5442));case 8:window.ResizeObserver=e.sent.default;case 9:case"end":return e.stop()}}),e,null,[[0,4]])})));return function(){return e.apply(this,arguments)}}())},62782:function(e,t,i){i.d(t,{o:function(){return a}});var r=i(99312),n=i(81043),o=(i(51358),i(46798),i(47084),i(5239),i(98490),i(23636)),a=function(){var e=(0,n.Z)((0,r.Z)().mark((function e(){return(0,r.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,(0,o.j)();case 2:return e.next=4,i.e(8565).then(i.bind(i,98565));case 4:case"end":return e.stop()}}),e)})));return function(){return e.apply(this,arguments)}}()},84728:function(e,t,i){i.d(t,{R:function(){return r}});i(97393),i(40271),i(60163);var r=function(e,t){return"https://".concat(e.config.version.includes("b")?"rc":e.config.version.includes("dev")?"next":"www",".home-assistant.io").concat(t)}}}]);
+//# sourceMappingURL=3762.sbmEtk_jNu8.js.map
\ No newline at end of file
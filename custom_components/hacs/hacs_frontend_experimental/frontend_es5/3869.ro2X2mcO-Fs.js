@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[3869,9233,8245],{78680:function(t,e,i){var n,o,a=i(88962),r=i(33368),s=i(71650),c=i(68308),l=i(82390),d=i(69205),u=i(91808),h=(i(97393),i(5095)),p=i(95260);(0,u.Z)([(0,p.Mo)("ha-dialog-header")],(function(t,e){var i=function(e){function i(){var e;(0,s.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,c.Z)(this,i,[].concat(o)),t((0,l.Z)(e)),e}return(0,d.Z)(i,e),(0,r.Z)(i)}(e);return{F:i,d:[{kind:"method",key:"render",value:function(){return(0,h.dy)(n||(n=(0,a.Z)([' <header class="header"> <div class="header-bar"> <section class="header-navigation-icon"> <slot name="navigationIcon"></slot> </section> <section class="header-title"> <slot name="title"></slot> </section> <section class="header-action-items"> <slot name="actionItems"></slot> </section> </div> <slot></slot> </header> '])))}},{kind:"get",static:!0,key:"styles",value:function(){return[(0,h.iv)(o||(o=(0,a.Z)([":host{display:block}:host([show-border]){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.header-bar{display:flex;flex-direction:row;align-items:flex-start;padding:4px;box-sizing:border-box}.header-title{flex:1;font-size:22px;line-height:28px;font-weight:400;padding:10px 4px;min-width:0;overflow:hidden;text-overflow:ellipsis;white-space:nowrap}@media all and (min-width:450px) and (min-height:500px){.header-bar{padding:12px}}.header-navigation-icon{flex:none;min-width:8px;height:100%;display:flex;flex-direction:row}.header-action-items{flex:none;min-width:8px;height:100%;display:flex;flex-direction:row}"])))]}}]}}),h.oi)},9828:function(t,e,i){i.d(e,{i:function(){return V}});var n,o,a,r=i(33368),s=i(71650),c=i(68308),l=i(82390),d=i(69205),u=i(91808),h=i(34541),p=i(47838),f=i(88962),v=(i(97393),i(91989),i(87762)),C=i(91632),m=i(5095),g=i(95260),L=i(60625),A=(i(54371),["button","ha-list-item"]),V=function(t,e){var i;return(0,m.dy)(n||(n=(0,f.Z)([' <div class="header_title"> <span>','</span> <ha-icon-button .label="','" .path="','" dialogAction="close" class="header_button"></ha-icon-button> </div> '])),e,null!==(i=null==t?void 0:t.localize("ui.dialogs.generic.close"))&&void 0!==i?i:"Close","M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z")};(0,u.Z)([(0,g.Mo)("ha-dialog")],(function(t,e){var i=function(e){function i(){var e;(0,s.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,c.Z)(this,i,[].concat(o)),t((0,l.Z)(e)),e}return(0,d.Z)(i,e),(0,r.Z)(i)}(e);return{F:i,d:[{kind:"field",key:L.gA,value:void 0},{kind:"method",key:"scrollToPos",value:function(t,e){var i;null===(i=this.contentElement)||void 0===i||i.scrollTo(t,e)}},{kind:"method",key:"renderHeading",value:function(){return(0,m.dy)(o||(o=(0,f.Z)(['<slot name="heading"> '," </slot>"])),(0,h.Z)((0,p.Z)(i.prototype),"renderHeading",this).call(this))}},{kind:"method",key:"firstUpdated",value:function(){var t;(0,h.Z)((0,p.Z)(i.prototype),"firstUpdated",this).call(this),this.suppressDefaultPressSelector=[this.suppressDefaultPressSelector,A].join(", "),this._updateScrolledAttribute(),null===(t=this.contentElement)||void 0===t||t.addEventListener("scroll",this._onScroll,{passive:!0})}},{kind:"method",key:"disconnectedCallback",value:function(){(0,h.Z)((0,p.Z)(i.prototype),"disconnectedCallback",this).call(this),this.contentElement.removeEventListener("scroll",this._onScroll)}},{kind:"field",key:"_onScroll",value:function(){var t=this;return function(){t._updateScrolledAttribute()}}},{kind:"method",key:"_updateScrolledAttribute",value:function(){this.contentElement&&this.toggleAttribute("scrolled",0!==this.contentElement.scrollTop)}},{kind:"field",static:!0,key:"styles",value:function(){return[C.W,(0,m.iv)(a||(a=(0,f.Z)([":host([scrolled]) ::slotted(ha-dialog-header){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.mdc-dialog{--mdc-dialog-scroll-divider-color:var(\n          --dialog-scroll-divider-color,\n          var(--divider-color)\n        );z-index:var(--dialog-z-index,8);-webkit-backdrop-filter:var(--dialog-backdrop-filter,none);backdrop-filter:var(--dialog-backdrop-filter,none);--mdc-dialog-box-shadow:var(--dialog-box-shadow, none);--mdc-typography-headline6-font-weight:400;--mdc-typography-headline6-font-size:1.574rem}.mdc-dialog__actions{justify-content:var(--justify-action-buttons,flex-end);padding-bottom:max(env(safe-area-inset-bottom),24px)}.mdc-dialog__actions span:first-child{flex:var(--secondary-action-button-flex,unset)}.mdc-dialog__actions span:nth-child(2){flex:var(--primary-action-button-flex,unset)}.mdc-dialog__container{align-items:var(--vertical-align-dialog,center)}.mdc-dialog__title{padding:24px 24px 0 24px}.mdc-dialog__actions{padding:12px 24px 12px 24px}.mdc-dialog__title::before{content:unset}.mdc-dialog .mdc-dialog__content{position:var(--dialog-content-position,relative);padding:var(--dialog-content-padding,24px)}:host([hideactions]) .mdc-dialog .mdc-dialog__content{padding-bottom:max(var(--dialog-content-padding,24px),env(safe-area-inset-bottom))}.mdc-dialog .mdc-dialog__surface{position:var(--dialog-surface-position,relative);top:var(--dialog-surface-top);margin-top:var(--dialog-surface-margin-top);min-height:var(--mdc-dialog-min-height,auto);border-radius:var(--ha-dialog-border-radius,28px)}:host([flexContent]) .mdc-dialog .mdc-dialog__content{display:flex;flex-direction:column}.header_title{position:relative;padding-right:40px;padding-inline-end:40px;padding-inline-start:initial;direction:var(--direction)}.header_title span{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;display:block}.header_button{position:absolute;right:-8px;top:-8px;text-decoration:none;color:inherit;inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}.dialog-actions{inset-inline-start:initial!important;inset-inline-end:0px!important;direction:var(--direction)}"])))]}}]}}),v.M)},49233:function(t,e,i){i.r(e),i.d(e,{HaIconButtonPrev:function(){return f}});var n,o=i(88962),a=i(33368),r=i(71650),s=i(68308),c=i(82390),l=i(69205),d=i(91808),u=(i(97393),i(5095)),h=i(95260),p=i(67684),f=(i(54371),(0,d.Z)([(0,h.Mo)("ha-icon-button-prev")],(function(t,e){var i=function(e){function i(){var e;(0,r.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,s.Z)(this,i,[].concat(o)),t((0,c.Z)(e)),e}return(0,l.Z)(i,e),(0,a.Z)(i)}(e);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.SB)()],key:"_icon",value:function(){return"rtl"===p.E.document.dir?"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z":"M15.41,16.58L10.83,12L15.41,7.41L14,6L8,12L14,18L15.41,16.58Z"}},{kind:"method",key:"render",value:function(){var t;return(0,u.dy)(n||(n=(0,o.Z)([' <ha-icon-button .disabled="','" .label="','" .path="','"></ha-icon-button> '])),this.disabled,this.label||(null===(t=this.hass)||void 0===t?void 0:t.localize("ui.common.back"))||"Back",this._icon)}}]}}),u.oi))},68245:function(t,e,i){i.r(e),i.d(e,{HaIconNext:function(){return h}});var n=i(33368),o=i(71650),a=i(68308),r=i(82390),s=i(69205),c=i(91808),l=(i(97393),i(95260)),d=i(67684),u=i(37662),h=(0,c.Z)([(0,l.Mo)("ha-icon-next")],(function(t,e){var i=function(e){function i(){var e;(0,o.Z)(this,i);for(var n=arguments.length,s=new Array(n),c=0;c<n;c++)s[c]=arguments[c];return e=(0,a.Z)(this,i,[].concat(s)),t((0,r.Z)(e)),e}return(0,s.Z)(i,e),(0,n.Z)(i)}(e);return{F:i,d:[{kind:"field",decorators:[(0,l.Cb)()],key:"path",value:function(){return"rtl"===d.E.document.dir?"M15.41,16.58L10.83,12L15.41,7.41L14,6L8,12L14,18L15.41,16.58Z":"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z"}}]}}),u.HaSvgIcon)},43910:function(t,e,i){var n,o,a,r=i(99312),s=i(81043),c=i(88962),l=i(33368),d=i(71650),u=i(68308),h=i(82390),p=i(69205),f=i(91808),v=(i(97393),i(87438),i(46798),i(9849),i(22890),i(5095)),C=i(95260),m=(i(54371),i(37662),i(51520),i(18394));(0,f.Z)([(0,C.Mo)("search-input")],(function(t,e){var i,f,g,L=function(e){function i(){var e;(0,d.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,u.Z)(this,i,[].concat(o)),t((0,h.Z)(e)),e}return(0,p.Z)(i,e),(0,l.Z)(i)}(e);return{F:L,d:[{kind:"field",decorators:[(0,C.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,C.Cb)()],key:"filter",value:void 0},{kind:"field",decorators:[(0,C.Cb)({type:Boolean})],key:"suffix",value:function(){return!1}},{kind:"field",decorators:[(0,C.Cb)({type:Boolean})],key:"autofocus",value:function(){return!1}},{kind:"field",decorators:[(0,C.Cb)({type:String})],key:"label",value:void 0},{kind:"method",key:"focus",value:function(){var t;null===(t=this._input)||void 0===t||t.focus()}},{kind:"field",decorators:[(0,C.IO)("ha-textfield",!0)],key:"_input",value:void 0},{kind:"method",key:"render",value:function(){return(0,v.dy)(n||(n=(0,c.Z)([' <ha-textfield .autofocus="','" .label="','" .value="','" icon .iconTrailing="','" @input="','"> <slot name="prefix" slot="leadingIcon"> <ha-svg-icon tabindex="-1" class="prefix" .path="','"></ha-svg-icon> </slot> <div class="trailing" slot="trailingIcon"> ',' <slot name="suffix"></slot> </div> </ha-textfield> '])),this.autofocus,this.label||this.hass.localize("ui.common.search"),this.filter||"",this.filter||this.suffix,this._filterInputChanged,"M9.5,3A6.5,6.5 0 0,1 16,9.5C16,11.11 15.41,12.59 14.44,13.73L14.71,14H15.5L20.5,19L19,20.5L14,15.5V14.71L13.73,14.44C12.59,15.41 11.11,16 9.5,16A6.5,6.5 0 0,1 3,9.5A6.5,6.5 0 0,1 9.5,3M9.5,5C7,5 5,7 5,9.5C5,12 7,14 9.5,14C12,14 14,12 14,9.5C14,7 12,5 9.5,5Z",this.filter&&(0,v.dy)(o||(o=(0,c.Z)([' <ha-icon-button @click="','" .label="','" .path="','" class="clear-button"></ha-icon-button> '])),this._clearSearch,this.hass.localize("ui.common.clear"),"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"))}},{kind:"method",key:"_filterChanged",value:(g=(0,s.Z)((0,r.Z)().mark((function t(e){return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:(0,m.B)(this,"value-changed",{value:String(e)});case 1:case"end":return t.stop()}}),t,this)}))),function(t){return g.apply(this,arguments)})},{kind:"method",key:"_filterInputChanged",value:(f=(0,s.Z)((0,r.Z)().mark((function t(e){return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:this._filterChanged(e.target.value);case 1:case"end":return t.stop()}}),t,this)}))),function(t){return f.apply(this,arguments)})},{kind:"method",key:"_clearSearch",value:(i=(0,s.Z)((0,r.Z)().mark((function t(){return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:this._filterChanged("");case 1:case"end":return t.stop()}}),t,this)}))),function(){return i.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(a||(a=(0,c.Z)([":host{display:inline-flex}ha-icon-button,ha-svg-icon{color:var(--primary-text-color)}ha-svg-icon{outline:0}.clear-button{--mdc-icon-size:20px}ha-textfield{display:inherit}.trailing{display:flex;align-items:center}"])))}}]}}),v.oi)},22581:function(t,e,i){i.d(e,{Ko:function(){return r},cs:function(){return s},du:function(){return n},ko:function(){return c},lL:function(){return o},s3:function(){return a}});i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(88640);var n={condition:"M4 2A2 2 0 0 0 2 4V12H4V8H6V12H8V4A2 2 0 0 0 6 2H4M4 4H6V6H4M22 15.5V14A2 2 0 0 0 20 12H16V22H20A2 2 0 0 0 22 20V18.5A1.54 1.54 0 0 0 20.5 17A1.54 1.54 0 0 0 22 15.5M20 20H18V18H20V20M20 16H18V14H20M5.79 21.61L4.21 20.39L18.21 2.39L19.79 3.61Z",delay:"M12,20A7,7 0 0,1 5,13A7,7 0 0,1 12,6A7,7 0 0,1 19,13A7,7 0 0,1 12,20M19.03,7.39L20.45,5.97C20,5.46 19.55,5 19.04,4.56L17.62,6C16.07,4.74 14.12,4 12,4A9,9 0 0,0 3,13A9,9 0 0,0 12,22C17,22 21,17.97 21,13C21,10.88 20.26,8.93 19.03,7.39M11,14H13V8H11M15,1H9V3H15V1Z",event:"M10,9A1,1 0 0,1 11,8A1,1 0 0,1 12,9V13.47L13.21,13.6L18.15,15.79C18.68,16.03 19,16.56 19,17.14V21.5C18.97,22.32 18.32,22.97 17.5,23H11C10.62,23 10.26,22.85 10,22.57L5.1,18.37L5.84,17.6C6.03,17.39 6.3,17.28 6.58,17.28H6.8L10,19V9M11,5A4,4 0 0,1 15,9C15,10.5 14.2,11.77 13,12.46V11.24C13.61,10.69 14,9.89 14,9A3,3 0 0,0 11,6A3,3 0 0,0 8,9C8,9.89 8.39,10.69 9,11.24V12.46C7.8,11.77 7,10.5 7,9A4,4 0 0,1 11,5M11,3A6,6 0 0,1 17,9C17,10.7 16.29,12.23 15.16,13.33L14.16,12.88C15.28,11.96 16,10.56 16,9A5,5 0 0,0 11,4A5,5 0 0,0 6,9C6,11.05 7.23,12.81 9,13.58V14.66C6.67,13.83 5,11.61 5,9A6,6 0 0,1 11,3Z",play_media:"M8,5.14V19.14L19,12.14L8,5.14Z",activate_scene:"M17.5,12A1.5,1.5 0 0,1 16,10.5A1.5,1.5 0 0,1 17.5,9A1.5,1.5 0 0,1 19,10.5A1.5,1.5 0 0,1 17.5,12M14.5,8A1.5,1.5 0 0,1 13,6.5A1.5,1.5 0 0,1 14.5,5A1.5,1.5 0 0,1 16,6.5A1.5,1.5 0 0,1 14.5,8M9.5,8A1.5,1.5 0 0,1 8,6.5A1.5,1.5 0 0,1 9.5,5A1.5,1.5 0 0,1 11,6.5A1.5,1.5 0 0,1 9.5,8M6.5,12A1.5,1.5 0 0,1 5,10.5A1.5,1.5 0 0,1 6.5,9A1.5,1.5 0 0,1 8,10.5A1.5,1.5 0 0,1 6.5,12M12,3A9,9 0 0,0 3,12A9,9 0 0,0 12,21A1.5,1.5 0 0,0 13.5,19.5C13.5,19.11 13.35,18.76 13.11,18.5C12.88,18.23 12.73,17.88 12.73,17.5A1.5,1.5 0 0,1 14.23,16H16A5,5 0 0,0 21,11C21,6.58 16.97,3 12,3Z",service:"M12,5A2,2 0 0,1 14,7C14,7.24 13.96,7.47 13.88,7.69C17.95,8.5 21,11.91 21,16H3C3,11.91 6.05,8.5 10.12,7.69C10.04,7.47 10,7.24 10,7A2,2 0 0,1 12,5M22,19H2V17H22V19Z",wait_template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",wait_for_trigger:"M12,9A2,2 0 0,1 10,7C10,5.89 10.9,5 12,5C13.11,5 14,5.89 14,7A2,2 0 0,1 12,9M12,14A2,2 0 0,1 10,12C10,10.89 10.9,10 12,10C13.11,10 14,10.89 14,12A2,2 0 0,1 12,14M12,19A2,2 0 0,1 10,17C10,15.89 10.9,15 12,15C13.11,15 14,15.89 14,17A2,2 0 0,1 12,19M20,10H17V8.86C18.72,8.41 20,6.86 20,5H17V4A1,1 0 0,0 16,3H8A1,1 0 0,0 7,4V5H4C4,6.86 5.28,8.41 7,8.86V10H4C4,11.86 5.28,13.41 7,13.86V15H4C4,16.86 5.28,18.41 7,18.86V20A1,1 0 0,0 8,21H16A1,1 0 0,0 17,20V18.86C18.72,18.41 20,16.86 20,15H17V13.86C18.72,13.41 20,11.86 20,10Z",repeat:"M17.65,6.35C16.2,4.9 14.21,4 12,4A8,8 0 0,0 4,12A8,8 0 0,0 12,20C15.73,20 18.84,17.45 19.73,14H17.65C16.83,16.33 14.61,18 12,18A6,6 0 0,1 6,12A6,6 0 0,1 12,6C13.66,6 15.14,6.69 16.22,7.78L13,11H20V4L17.65,6.35Z",choose:"M11,5H8L12,1L16,5H13V9.43C12.25,9.89 11.58,10.46 11,11.12V5M22,11L18,7V10C14.39,9.85 11.31,12.57 11,16.17C9.44,16.72 8.62,18.44 9.17,20C9.72,21.56 11.44,22.38 13,21.83C14.56,21.27 15.38,19.56 14.83,18C14.53,17.14 13.85,16.47 13,16.17C13.47,12.17 17.47,11.97 17.95,11.97V14.97L22,11M10.63,11.59C9.3,10.57 7.67,10 6,10V7L2,11L6,15V12C7.34,12.03 8.63,12.5 9.64,13.4C9.89,12.76 10.22,12.15 10.63,11.59Z",if:"M14,4L16.29,6.29L13.41,9.17L14.83,10.59L17.71,7.71L20,10V4M10,4H4V10L6.29,7.71L11,12.41V20H13V11.59L7.71,6.29",device_id:"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z",stop:"M13 24C9.74 24 6.81 22 5.6 19L2.57 11.37C2.26 10.58 3 9.79 3.81 10.05L4.6 10.31C5.16 10.5 5.62 10.92 5.84 11.47L7.25 15H8V3.25C8 2.56 8.56 2 9.25 2S10.5 2.56 10.5 3.25V12H11.5V1.25C11.5 .56 12.06 0 12.75 0S14 .56 14 1.25V12H15V2.75C15 2.06 15.56 1.5 16.25 1.5C16.94 1.5 17.5 2.06 17.5 2.75V12H18.5V5.75C18.5 5.06 19.06 4.5 19.75 4.5S21 5.06 21 5.75V16C21 20.42 17.42 24 13 24Z",parallel:"M16,4.5V7H5V9H16V11.5L19.5,8M16,12.5V15H5V17H16V19.5L19.5,16",variables:"M21 2H3C1.9 2 1 2.9 1 4V20C1 21.1 1.9 22 3 22H21C22.1 22 23 21.1 23 20V4C23 2.9 22.1 2 21 2M21 20H3V6H21V20M16.6 8C18.1 9.3 19 11.1 19 13C19 14.9 18.1 16.7 16.6 18L15 17.4C16.3 16.4 17 14.7 17 13S16.3 9.6 15 8.6L16.6 8M7.4 8L9 8.6C7.7 9.6 7 11.3 7 13S7.7 16.4 9 17.4L7.4 18C5.9 16.7 5 14.9 5 13S5.9 9.3 7.4 8M12.1 12L13.5 10H15L12.8 13L14.1 16H12.8L12 14L10.6 16H9L11.3 12.9L10 10H11.3L12.1 12Z"},o=new Set(["variables"]),a={device_id:{},helpers:{icon:"M21.71 20.29L20.29 21.71A1 1 0 0 1 18.88 21.71L7 9.85A3.81 3.81 0 0 1 6 10A4 4 0 0 1 2.22 4.7L4.76 7.24L5.29 6.71L6.71 5.29L7.24 4.76L4.7 2.22A4 4 0 0 1 10 6A3.81 3.81 0 0 1 9.85 7L21.71 18.88A1 1 0 0 1 21.71 20.29M2.29 18.88A1 1 0 0 0 2.29 20.29L3.71 21.71A1 1 0 0 0 5.12 21.71L10.59 16.25L7.76 13.42M20 2L16 4V6L13.83 8.17L15.83 10.17L18 8H20L22 4Z",members:{}},building_blocks:{icon:"M18.5 18.5C19.04 18.5 19.5 18.96 19.5 19.5S19.04 20.5 18.5 20.5H6.5C5.96 20.5 5.5 20.04 5.5 19.5S5.96 18.5 6.5 18.5H18.5M18.5 17H6.5C5.13 17 4 18.13 4 19.5S5.13 22 6.5 22H18.5C19.88 22 21 20.88 21 19.5S19.88 17 18.5 17M21 11H18V7H13L10 11V16H22L21 11M11.54 11L13.5 8.5H16V11H11.54M9.76 3.41L4.76 2L2 11.83C1.66 13.11 2.41 14.44 3.7 14.8L4.86 15.12L8.15 12.29L4.27 11.21L6.15 4.46L8.94 5.24C9.5 5.53 10.71 6.34 11.47 7.37L12.5 6H12.94C11.68 4.41 9.85 3.46 9.76 3.41Z",members:{condition:{},delay:{},wait_template:{},wait_for_trigger:{},repeat:{},choose:{},if:{},stop:{},parallel:{},variables:{}}},other:{icon:"M16,12A2,2 0 0,1 18,10A2,2 0 0,1 20,12A2,2 0 0,1 18,14A2,2 0 0,1 16,12M10,12A2,2 0 0,1 12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12M4,12A2,2 0 0,1 6,10A2,2 0 0,1 8,12A2,2 0 0,1 6,14A2,2 0 0,1 4,12Z",members:{event:{},service:{}}}},r="__SERVICE__",s=function(t){return null==t?void 0:t.startsWith(r)},c=function(t){return t.substring(r.length)}},41090:function(t,e,i){i.d(e,{L:function(){return n},p:function(){return o}});var n={device:"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z",and:"M4.4,16.5C4.4,15.6 4.7,14.7 5.2,13.9C5.7,13.1 6.7,12.2 8.2,11.2C7.3,10.1 6.8,9.3 6.5,8.7C6.1,8 6,7.4 6,6.7C6,5.2 6.4,4.1 7.3,3.2C8.2,2.3 9.4,2 10.9,2C12.2,2 13.3,2.4 14.2,3.2C15.1,4 15.5,5 15.5,6.1C15.5,6.9 15.3,7.6 14.9,8.3C14.5,9 13.8,9.7 12.8,10.4L11.4,11.5L15.7,16.7C16.3,15.5 16.6,14.3 16.6,12.8H18.8C18.8,15.1 18.3,17 17.2,18.5L20,21.8H17L15.7,20.3C15,20.9 14.3,21.3 13.4,21.6C12.5,21.9 11.6,22.1 10.7,22.1C8.8,22.1 7.3,21.6 6.1,20.6C5,19.5 4.4,18.2 4.4,16.5M10.7,20C12,20 13.2,19.5 14.3,18.5L9.6,12.8L9.2,13.1C7.7,14.2 7,15.3 7,16.5C7,17.6 7.3,18.4 8,19C8.7,19.6 9.5,20 10.7,20M8.5,6.7C8.5,7.6 9,8.6 10.1,9.9L11.7,8.8C12.3,8.4 12.7,8 12.9,7.6C13.1,7.2 13.2,6.7 13.2,6.2C13.2,5.6 13,5.1 12.5,4.7C12.1,4.3 11.5,4.1 10.8,4.1C10.1,4.1 9.5,4.3 9.1,4.8C8.7,5.3 8.5,5.9 8.5,6.7Z",or:"M2,4C5,10 5,14 2,20H8C13,20 19,16 22,12C19,8 13,4 8,4H2M5,6H8C11.5,6 16.3,9 19.3,12C16.3,15 11.5,18 8,18H5C6.4,13.9 6.4,10.1 5,6Z",not:"M14.08,4.61L15.92,5.4L14.8,8H19V10H13.95L12.23,14H19V16H11.38L9.92,19.4L8.08,18.61L9.2,16H5V14H10.06L11.77,10H5V8H12.63L14.08,4.61Z",state:"M6.27 17.05C6.72 17.58 7 18.25 7 19C7 20.66 5.66 22 4 22S1 20.66 1 19 2.34 16 4 16C4.18 16 4.36 16 4.53 16.05L7.6 10.69L5.86 9.7L9.95 8.58L11.07 12.67L9.33 11.68L6.27 17.05M20 16C18.7 16 17.6 16.84 17.18 18H11V16L8 19L11 22V20H17.18C17.6 21.16 18.7 22 20 22C21.66 22 23 20.66 23 19S21.66 16 20 16M12 8C12.18 8 12.36 8 12.53 7.95L15.6 13.31L13.86 14.3L17.95 15.42L19.07 11.33L17.33 12.32L14.27 6.95C14.72 6.42 15 5.75 15 5C15 3.34 13.66 2 12 2S9 3.34 9 5 10.34 8 12 8Z",numeric_state:"M4,17V9H2V7H6V17H4M22,15C22,16.11 21.1,17 20,17H16V15H20V13H18V11H20V9H16V7H20A2,2 0 0,1 22,9V10.5A1.5,1.5 0 0,1 20.5,12A1.5,1.5 0 0,1 22,13.5V15M14,15V17H8V13C8,11.89 8.9,11 10,11H12V9H8V7H12A2,2 0 0,1 14,9V11C14,12.11 13.1,13 12,13H10V15H14Z",sun:"M12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,2L14.39,5.42C13.65,5.15 12.84,5 12,5C11.16,5 10.35,5.15 9.61,5.42L12,2M3.34,7L7.5,6.65C6.9,7.16 6.36,7.78 5.94,8.5C5.5,9.24 5.25,10 5.11,10.79L3.34,7M3.36,17L5.12,13.23C5.26,14 5.53,14.78 5.95,15.5C6.37,16.24 6.91,16.86 7.5,17.37L3.36,17M20.65,7L18.88,10.79C18.74,10 18.47,9.23 18.05,8.5C17.63,7.78 17.1,7.15 16.5,6.64L20.65,7M20.64,17L16.5,17.36C17.09,16.85 17.62,16.22 18.04,15.5C18.46,14.77 18.73,14 18.87,13.21L20.64,17M12,22L9.59,18.56C10.33,18.83 11.14,19 12,19C12.82,19 13.63,18.83 14.37,18.56L12,22Z",template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",time:"M12,20A8,8 0 0,0 20,12A8,8 0 0,0 12,4A8,8 0 0,0 4,12A8,8 0 0,0 12,20M12,2A10,10 0 0,1 22,12A10,10 0 0,1 12,22C6.47,22 2,17.5 2,12A10,10 0 0,1 12,2M12.5,7V12.25L17,14.92L16.25,16.15L11,13V7H12.5Z",trigger:"M10 7V9H9V15H10V17H6V15H7V9H6V7H10M16 7C17.11 7 18 7.9 18 9V15C18 16.11 17.11 17 16 17H12V7M16 9H14V15H16V9Z",zone:"M12,2C15.31,2 18,4.66 18,7.95C18,12.41 12,19 12,19C12,19 6,12.41 6,7.95C6,4.66 8.69,2 12,2M12,6A2,2 0 0,0 10,8A2,2 0 0,0 12,10A2,2 0 0,0 14,8A2,2 0 0,0 12,6M20,19C20,21.21 16.42,23 12,23C7.58,23 4,21.21 4,19C4,17.71 5.22,16.56 7.11,15.83L7.75,16.74C6.67,17.19 6,17.81 6,18.5C6,19.88 8.69,21 12,21C15.31,21 18,19.88 18,18.5C18,17.81 17.33,17.19 16.25,16.74L16.89,15.83C18.78,16.56 20,17.71 20,19Z"},o={device:{},entity:{icon:"M11,13.5V21.5H3V13.5H11M12,2L17.5,11H6.5L12,2M17.5,13C20,13 22,15 22,17.5C22,20 20,22 17.5,22C15,22 13,20 13,17.5C13,15 15,13 17.5,13Z",members:{state:{},numeric_state:{}}},time_location:{icon:"M15,12H16.5V16.25L19.36,17.94L18.61,19.16L15,17V12M23,16A7,7 0 0,1 16,23C13,23 10.4,21.08 9.42,18.4L8,17.9L2.66,19.97L2.5,20A0.5,0.5 0 0,1 2,19.5V4.38C2,4.15 2.15,3.97 2.36,3.9L8,2L14,4.1L19.34,2H19.5A0.5,0.5 0 0,1 20,2.5V10.25C21.81,11.5 23,13.62 23,16M9,16C9,12.83 11.11,10.15 14,9.29V6.11L8,4V15.89L9,16.24C9,16.16 9,16.08 9,16M16,11A5,5 0 0,0 11,16A5,5 0 0,0 16,21A5,5 0 0,0 21,16A5,5 0 0,0 16,11Z",members:{sun:{},time:{},zone:{}}},building_blocks:{icon:"M18.5 18.5C19.04 18.5 19.5 18.96 19.5 19.5S19.04 20.5 18.5 20.5H6.5C5.96 20.5 5.5 20.04 5.5 19.5S5.96 18.5 6.5 18.5H18.5M18.5 17H6.5C5.13 17 4 18.13 4 19.5S5.13 22 6.5 22H18.5C19.88 22 21 20.88 21 19.5S19.88 17 18.5 17M21 11H18V7H13L10 11V16H22L21 11M11.54 11L13.5 8.5H16V11H11.54M9.76 3.41L4.76 2L2 11.83C1.66 13.11 2.41 14.44 3.7 14.8L4.86 15.12L8.15 12.29L4.27 11.21L6.15 4.46L8.94 5.24C9.5 5.53 10.71 6.34 11.47 7.37L12.5 6H12.94C11.68 4.41 9.85 3.46 9.76 3.41Z",members:{and:{},or:{},not:{}}},other:{icon:"M16,12A2,2 0 0,1 18,10A2,2 0 0,1 20,12A2,2 0 0,1 18,14A2,2 0 0,1 16,12M10,12A2,2 0 0,1 12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12M4,12A2,2 0 0,1 6,10A2,2 0 0,1 8,12A2,2 0 0,1 6,14A2,2 0 0,1 4,12Z",members:{template:{},trigger:{}}}}},64346:function(t,e,i){i.d(e,{F3:function(){return o},Lh:function(){return n},t4:function(){return a}});i(22859);var n=function(t,e,i){return t("component.".concat(e,".title"))||(null==i?void 0:i.name)||e},o=function(t,e){var i={type:"manifest/list"};return e&&(i.integrations=e),t.callWS(i)},a=function(t,e){return t.callWS({type:"manifest/get",integration:e})}},93034:function(t,e,i){i.d(e,{h:function(){return o},u:function(){return n}});var n={calendar:"M19,19H5V8H19M16,1V3H8V1H6V3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3H18V1M17,12H12V17H17V12Z",device:"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z",event:"M10,9A1,1 0 0,1 11,8A1,1 0 0,1 12,9V13.47L13.21,13.6L18.15,15.79C18.68,16.03 19,16.56 19,17.14V21.5C18.97,22.32 18.32,22.97 17.5,23H11C10.62,23 10.26,22.85 10,22.57L5.1,18.37L5.84,17.6C6.03,17.39 6.3,17.28 6.58,17.28H6.8L10,19V9M11,5A4,4 0 0,1 15,9C15,10.5 14.2,11.77 13,12.46V11.24C13.61,10.69 14,9.89 14,9A3,3 0 0,0 11,6A3,3 0 0,0 8,9C8,9.89 8.39,10.69 9,11.24V12.46C7.8,11.77 7,10.5 7,9A4,4 0 0,1 11,5M11,3A6,6 0 0,1 17,9C17,10.7 16.29,12.23 15.16,13.33L14.16,12.88C15.28,11.96 16,10.56 16,9A5,5 0 0,0 11,4A5,5 0 0,0 6,9C6,11.05 7.23,12.81 9,13.58V14.66C6.67,13.83 5,11.61 5,9A6,6 0 0,1 11,3Z",state:"M6.27 17.05C6.72 17.58 7 18.25 7 19C7 20.66 5.66 22 4 22S1 20.66 1 19 2.34 16 4 16C4.18 16 4.36 16 4.53 16.05L7.6 10.69L5.86 9.7L9.95 8.58L11.07 12.67L9.33 11.68L6.27 17.05M20 16C18.7 16 17.6 16.84 17.18 18H11V16L8 19L11 22V20H17.18C17.6 21.16 18.7 22 20 22C21.66 22 23 20.66 23 19S21.66 16 20 16M12 8C12.18 8 12.36 8 12.53 7.95L15.6 13.31L13.86 14.3L17.95 15.42L19.07 11.33L17.33 12.32L14.27 6.95C14.72 6.42 15 5.75 15 5C15 3.34 13.66 2 12 2S9 3.34 9 5 10.34 8 12 8Z",geo_location:"M12,11.5A2.5,2.5 0 0,1 9.5,9A2.5,2.5 0 0,1 12,6.5A2.5,2.5 0 0,1 14.5,9A2.5,2.5 0 0,1 12,11.5M12,2A7,7 0 0,0 5,9C5,14.25 12,22 12,22C12,22 19,14.25 19,9A7,7 0 0,0 12,2Z",homeassistant:i(19844).T,mqtt:"M21,9L17,5V8H10V10H17V13M7,11L3,15L7,19V16H14V14H7V11Z",numeric_state:"M4,17V9H2V7H6V17H4M22,15C22,16.11 21.1,17 20,17H16V15H20V13H18V11H20V9H16V7H20A2,2 0 0,1 22,9V10.5A1.5,1.5 0 0,1 20.5,12A1.5,1.5 0 0,1 22,13.5V15M14,15V17H8V13C8,11.89 8.9,11 10,11H12V9H8V7H12A2,2 0 0,1 14,9V11C14,12.11 13.1,13 12,13H10V15H14Z",sun:"M12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,2L14.39,5.42C13.65,5.15 12.84,5 12,5C11.16,5 10.35,5.15 9.61,5.42L12,2M3.34,7L7.5,6.65C6.9,7.16 6.36,7.78 5.94,8.5C5.5,9.24 5.25,10 5.11,10.79L3.34,7M3.36,17L5.12,13.23C5.26,14 5.53,14.78 5.95,15.5C6.37,16.24 6.91,16.86 7.5,17.37L3.36,17M20.65,7L18.88,10.79C18.74,10 18.47,9.23 18.05,8.5C17.63,7.78 17.1,7.15 16.5,6.64L20.65,7M20.64,17L16.5,17.36C17.09,16.85 17.62,16.22 18.04,15.5C18.46,14.77 18.73,14 18.87,13.21L20.64,17M12,22L9.59,18.56C10.33,18.83 11.14,19 12,19C12.82,19 13.63,18.83 14.37,18.56L12,22Z",conversation:"M8,7A2,2 0 0,1 10,9V14A2,2 0 0,1 8,16A2,2 0 0,1 6,14V9A2,2 0 0,1 8,7M14,14C14,16.97 11.84,19.44 9,19.92V22H7V19.92C4.16,19.44 2,16.97 2,14H4A4,4 0 0,0 8,18A4,4 0 0,0 12,14H14M21.41,9.41L17.17,13.66L18.18,10H14A2,2 0 0,1 12,8V4A2,2 0 0,1 14,2H20A2,2 0 0,1 22,4V8C22,8.55 21.78,9.05 21.41,9.41Z",tag:"M18,6H13A2,2 0 0,0 11,8V10.28C10.41,10.62 10,11.26 10,12A2,2 0 0,0 12,14C13.11,14 14,13.1 14,12C14,11.26 13.6,10.62 13,10.28V8H16V16H8V8H10V6H8L6,6V18H18M20,20H4V4H20M20,2H4A2,2 0 0,0 2,4V20A2,2 0 0,0 4,22H20C21.11,22 22,21.1 22,20V4C22,2.89 21.11,2 20,2Z",template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",time:"M12,20A8,8 0 0,0 20,12A8,8 0 0,0 12,4A8,8 0 0,0 4,12A8,8 0 0,0 12,20M12,2A10,10 0 0,1 22,12A10,10 0 0,1 12,22C6.47,22 2,17.5 2,12A10,10 0 0,1 12,2M12.5,7V12.25L17,14.92L16.25,16.15L11,13V7H12.5Z",time_pattern:"M11,17A1,1 0 0,0 12,18A1,1 0 0,0 13,17A1,1 0 0,0 12,16A1,1 0 0,0 11,17M11,3V7H13V5.08C16.39,5.57 19,8.47 19,12A7,7 0 0,1 12,19A7,7 0 0,1 5,12C5,10.32 5.59,8.78 6.58,7.58L12,13L13.41,11.59L6.61,4.79V4.81C4.42,6.45 3,9.05 3,12A9,9 0 0,0 12,21A9,9 0 0,0 21,12A9,9 0 0,0 12,3M18,12A1,1 0 0,0 17,11A1,1 0 0,0 16,12A1,1 0 0,0 17,13A1,1 0 0,0 18,12M6,12A1,1 0 0,0 7,13A1,1 0 0,0 8,12A1,1 0 0,0 7,11A1,1 0 0,0 6,12Z",webhook:"M10.46,19C9,21.07 6.15,21.59 4.09,20.15C2.04,18.71 1.56,15.84 3,13.75C3.87,12.5 5.21,11.83 6.58,11.77L6.63,13.2C5.72,13.27 4.84,13.74 4.27,14.56C3.27,16 3.58,17.94 4.95,18.91C6.33,19.87 8.26,19.5 9.26,18.07C9.57,17.62 9.75,17.13 9.82,16.63V15.62L15.4,15.58L15.47,15.47C16,14.55 17.15,14.23 18.05,14.75C18.95,15.27 19.26,16.43 18.73,17.35C18.2,18.26 17.04,18.58 16.14,18.06C15.73,17.83 15.44,17.46 15.31,17.04L11.24,17.06C11.13,17.73 10.87,18.38 10.46,19M17.74,11.86C20.27,12.17 22.07,14.44 21.76,16.93C21.45,19.43 19.15,21.2 16.62,20.89C15.13,20.71 13.9,19.86 13.19,18.68L14.43,17.96C14.92,18.73 15.75,19.28 16.75,19.41C18.5,19.62 20.05,18.43 20.26,16.76C20.47,15.09 19.23,13.56 17.5,13.35C16.96,13.29 16.44,13.36 15.97,13.53L15.12,13.97L12.54,9.2H12.32C11.26,9.16 10.44,8.29 10.47,7.25C10.5,6.21 11.4,5.4 12.45,5.44C13.5,5.5 14.33,6.35 14.3,7.39C14.28,7.83 14.11,8.23 13.84,8.54L15.74,12.05C16.36,11.85 17.04,11.78 17.74,11.86M8.25,9.14C7.25,6.79 8.31,4.1 10.62,3.12C12.94,2.14 15.62,3.25 16.62,5.6C17.21,6.97 17.09,8.47 16.42,9.67L15.18,8.95C15.6,8.14 15.67,7.15 15.27,6.22C14.59,4.62 12.78,3.85 11.23,4.5C9.67,5.16 8.97,7 9.65,8.6C9.93,9.26 10.4,9.77 10.97,10.11L11.36,10.32L8.29,15.31C8.32,15.36 8.36,15.42 8.39,15.5C8.88,16.41 8.54,17.56 7.62,18.05C6.71,18.54 5.56,18.18 5.06,17.24C4.57,16.31 4.91,15.16 5.83,14.67C6.22,14.46 6.65,14.41 7.06,14.5L9.37,10.73C8.9,10.3 8.5,9.76 8.25,9.14Z",persistent_notification:"M13 11H11V5H13M13 15H11V13H13M20 2H4C2.9 2 2 2.9 2 4V22L6 18H20C21.1 18 22 17.1 22 16V4C22 2.9 21.1 2 20 2Z",zone:"M12,2C15.31,2 18,4.66 18,7.95C18,12.41 12,19 12,19C12,19 6,12.41 6,7.95C6,4.66 8.69,2 12,2M12,6A2,2 0 0,0 10,8A2,2 0 0,0 12,10A2,2 0 0,0 14,8A2,2 0 0,0 12,6M20,19C20,21.21 16.42,23 12,23C7.58,23 4,21.21 4,19C4,17.71 5.22,16.56 7.11,15.83L7.75,16.74C6.67,17.19 6,17.81 6,18.5C6,19.88 8.69,21 12,21C15.31,21 18,19.88 18,18.5C18,17.81 17.33,17.19 16.25,16.74L16.89,15.83C18.78,16.56 20,17.71 20,19Z"},o={device:{},entity:{icon:"M11,13.5V21.5H3V13.5H11M12,2L17.5,11H6.5L12,2M17.5,13C20,13 22,15 22,17.5C22,20 20,22 17.5,22C15,22 13,20 13,17.5C13,15 15,13 17.5,13Z",members:{state:{},numeric_state:{}}},time_location:{icon:"M15,12H16.5V16.25L19.36,17.94L18.61,19.16L15,17V12M23,16A7,7 0 0,1 16,23C13,23 10.4,21.08 9.42,18.4L8,17.9L2.66,19.97L2.5,20A0.5,0.5 0 0,1 2,19.5V4.38C2,4.15 2.15,3.97 2.36,3.9L8,2L14,4.1L19.34,2H19.5A0.5,0.5 0 0,1 20,2.5V10.25C21.81,11.5 23,13.62 23,16M9,16C9,12.83 11.11,10.15 14,9.29V6.11L8,4V15.89L9,16.24C9,16.16 9,16.08 9,16M16,11A5,5 0 0,0 11,16A5,5 0 0,0 16,21A5,5 0 0,0 21,16A5,5 0 0,0 16,11Z",members:{calendar:{},sun:{},time:{},time_pattern:{},zone:{}}},other:{icon:"M16,12A2,2 0 0,1 18,10A2,2 0 0,1 20,12A2,2 0 0,1 18,14A2,2 0 0,1 16,12M10,12A2,2 0 0,1 12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12M4,12A2,2 0 0,1 6,10A2,2 0 0,1 8,12A2,2 0 0,1 6,14A2,2 0 0,1 4,12Z",members:{event:{},geo_location:{},homeassistant:{},mqtt:{},conversation:{},tag:{},template:{},webhook:{},persistent_notification:{}}}}},13869:function(t,e,i){i.r(e);var n,o,a,r,s,c,l,d,u,h,p,f,v=i(88962),C=i(99312),m=i(40039),g=i(81043),L=i(46097),A=i(62746),V=i(33368),H=i(71650),y=i(68308),M=i(82390),_=i(69205),k=i(91808),Z=(i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(97393),i(22481),i(46349),i(70320),i(82073),i(71791),i(50617),i(36513),i(63789),i(35221),i(80628),i(37313),i(22859),i(9849),i(50289),i(94167),i(65974),i(40271),i(94738),i(98214),i(85472),i(90126),i(61641),i(11994)),b=i(5095),x=i(95260),w=i(10694),S=i(99266),z=i(86634),I=i(14516),B=i(18394),O=i(81454),j=i(28858),F=(i(9828),i(78680),i(54371),i(49233),i(68245),i(34131),i(40298)),E=((0,k.Z)([(0,x.Mo)("ha-list-new")],(function(t,e){var i=function(e){function i(){var e;(0,H.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,y.Z)(this,i,[].concat(o)),t((0,M.Z)(e)),e}return(0,_.Z)(i,e),(0,V.Z)(i)}(e);return{F:i,d:[{kind:"get",static:!0,key:"styles",value:function(){return[].concat((0,L.Z)(F.j.styles),[(0,b.iv)(n||(n=(0,v.Z)([":host{--md-sys-color-surface:var(--card-background-color)}"])))])}}]}}),F.j),i(76507)),T=((0,k.Z)([(0,x.Mo)("ha-list-item-new")],(function(t,e){var i=function(e){function i(){var e;(0,H.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,y.Z)(this,i,[].concat(o)),t((0,M.Z)(e)),e}return(0,_.Z)(i,e),(0,V.Z)(i)}(e);return{F:i,d:[{kind:"get",static:!0,key:"styles",value:function(){return[].concat((0,L.Z)(E.g.styles),[(0,b.iv)(o||(o=(0,v.Z)([":host{--ha-icon-display:block;--md-sys-color-primary:var(--primary-text-color);--md-sys-color-secondary:var(--secondary-text-color);--md-sys-color-surface:var(--card-background-color);--md-sys-color-on-surface:var(--primary-text-color);--md-sys-color-on-surface-variant:var(--secondary-text-color)}"])))])}}]}}),E.g),i(22581)),G=i(41090),D=i(64346),P=i(93034),U=i(29950),W=i(72824),K=i(64082),R=i(36655),q=i(76775),X=(i(96043),i(88811),i(24829),i(10999),i(52117),i(82479),i(94570),i(71779),function t(e,i){if(e===i)return!0;if(e&&i&&"object"===(0,q.Z)(e)&&"object"===(0,q.Z)(i)){if(e.constructor!==i.constructor)return!1;var n,o;if(Array.isArray(e)){if((o=e.length)!==i.length)return!1;for(n=o;0!=n--;)if(!t(e[n],i[n]))return!1;return!0}if(e instanceof Map&&i instanceof Map){if(e.size!==i.size)return!1;var a,r=(0,m.Z)(e.entries());try{for(r.s();!(a=r.n()).done;)if(n=a.value,!i.has(n[0]))return!1}catch(p){r.e(p)}finally{r.f()}var s,c=(0,m.Z)(e.entries());try{for(c.s();!(s=c.n()).done;)if(!t((n=s.value)[1],i.get(n[0])))return!1}catch(p){c.e(p)}finally{c.f()}return!0}if(e instanceof Set&&i instanceof Set){if(e.size!==i.size)return!1;var l,d=(0,m.Z)(e.entries());try{for(d.s();!(l=d.n()).done;)if(n=l.value,!i.has(n[0]))return!1}catch(p){d.e(p)}finally{d.f()}return!0}if(ArrayBuffer.isView(e)&&ArrayBuffer.isView(i)){if((o=e.length)!==i.length)return!1;for(n=o;0!=n--;)if(e[n]!==i[n])return!1;return!0}if(e.constructor===RegExp)return e.source===i.source&&e.flags===i.flags;if(e.valueOf!==Object.prototype.valueOf)return e.valueOf()===i.valueOf();if(e.toString!==Object.prototype.toString)return e.toString()===i.toString();var u=Object.keys(e);if((o=u.length)!==Object.keys(i).length)return!1;for(n=o;0!=n--;)if(!Object.prototype.hasOwnProperty.call(i,u[n]))return!1;for(n=o;0!=n--;){var h=u[n];if(!t(e[h],i[h]))return!1}return!0}return e!=e&&i!=i}),$=(i(43910),i(69222),"M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z"),N={trigger:{groups:P.h,icons:P.u},condition:{groups:G.p,icons:G.L},action:{groups:T.s3,icons:T.du}},Q=new Set(["date","datetime","device_tracker","text","time","tts","update","weather","image_processing"]),J=new Set(["notify"]);(0,k.Z)([(0,x.Mo)("add-automation-element-dialog")],(function(t,e){var i,n=function(e){function i(){var e;(0,H.Z)(this,i);for(var n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return e=(0,y.Z)(this,i,[].concat(o)),t((0,M.Z)(e)),e}return(0,_.Z)(i,e),(0,V.Z)(i)}(e);return{F:n,d:[{kind:"field",decorators:[(0,x.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_params",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_group",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_prev",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_filter",value:function(){return""}},{kind:"field",decorators:[(0,x.SB)()],key:"_manifests",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_domains",value:void 0},{kind:"field",decorators:[(0,x.IO)("ha-dialog")],key:"_dialog",value:void 0},{kind:"field",key:"_fullScreen",value:function(){return!1}},{kind:"field",decorators:[(0,x.SB)()],key:"_width",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_height",value:void 0},{kind:"method",key:"showDialog",value:function(t){var e;this._params=t,this._group=t.group,"action"===(null===(e=this._params)||void 0===e?void 0:e.type)&&(this.hass.loadBackendTranslation("services"),this._fetchManifests(),this._calculateUsedDomains()),this._fullScreen=matchMedia("all and (max-width: 450px), all and (max-height: 500px)").matches}},{kind:"method",key:"closeDialog",value:function(){this._params&&(0,B.B)(this,"dialog-closed",{dialog:this.localName}),this._height=void 0,this._width=void 0,this._params=void 0,this._group=void 0,this._prev=void 0,this._filter="",this._manifests=void 0,this._domains=void 0}},{kind:"field",key:"_getGroups",value:function(){return function(t,e){return e?(0,T.cs)(e)?{}:N[t].groups[e].members:N[t].groups}}},{kind:"field",key:"_convertToItem",value:function(){return function(t,e,i,n){return{group:Boolean(e.members),key:t,name:n("ui.panel.config.automation.editor.".concat(i,"s.").concat(e.members?"groups":"type",".").concat(t,".label")),description:n("ui.panel.config.automation.editor.".concat(i,"s.").concat(e.members?"groups":"type",".").concat(t,".description").concat(e.members?"":".picker")),icon:e.icon||N[i].icons[t]}}}},{kind:"field",key:"_getFilteredItems",value:function(){var t=this;return(0,I.Z)((function(e,i,n,o,a,r){var s=function i(n){return Object.entries(n).map((function(n){var a=(0,A.Z)(n,2),r=a[0],s=a[1];return s.members?i(s.members):t._convertToItem(r,s,e,o)}))}(t._getGroups(e,i)).flat();"action"===e&&s.push.apply(s,(0,L.Z)(t._services(o,a,r,i)));var c={keys:["key","name","description"],isCaseSensitive:!1,minMatchCharLength:Math.min(n.length,2),threshold:.2};return new Z.Z(s,c).search(n).map((function(t){return t.item}))}))}},{kind:"field",key:"_getGroupItems",value:function(){var t=this;return(0,I.Z)((function(e,i,n,o,a,r){if("action"===e&&(0,T.cs)(i)){var s=t._services(o,a,r,i);return i==="".concat(T.Ko,"media_player")&&(s=[t._convertToItem("play_media",{},e,o)].concat((0,L.Z)(s))),s}var c=t._getGroups(e,i),l=Object.entries(c).map((function(i){var n=(0,A.Z)(i,2),a=n[0],r=n[1];return t._convertToItem(a,r,e,o)}));return"action"===e&&(t._group?"helpers"===t._group?l.unshift.apply(l,(0,L.Z)(t._serviceGroups(o,a,r,n,"helper"))):"other"===t._group&&l.unshift.apply(l,(0,L.Z)(t._serviceGroups(o,a,r,n,"other"))):l.unshift.apply(l,(0,L.Z)(t._serviceGroups(o,a,r,n,void 0)))),l.sort((function(e,i){return e.group&&i.group?0:e.group&&!i.group?1:!e.group&&i.group?-1:(0,j.$)(e.name,i.name,t.hass.locale.language)}))}))}},{kind:"field",key:"_serviceGroups",value:function(){var t=this;return function(e,i,n,o,a){if(!i||!n)return[];var r=[];return Object.keys(i).forEach((function(i){var s=n[i],c=!o||o.has(i);if(void 0===a&&(J.has(i)||"entity"===(null==s?void 0:s.integration_type)&&c&&!Q.has(i))||"helper"===a&&"helper"===(null==s?void 0:s.integration_type)||"other"===a&&!J.has(i)&&(Q.has(i)||!c&&"entity"===(null==s?void 0:s.integration_type)||!["helper","entity"].includes((null==s?void 0:s.integration_type)||""))){var l,d=(0,O.G)(i);r.push({group:!0,icon:d,image:d?void 0:(0,W.X1)({domain:i,type:"icon",darkOptimized:null===(l=t.hass.themes)||void 0===l?void 0:l.darkMode}),key:"".concat(T.Ko).concat(i),name:(0,D.Lh)(e,i,s),description:""})}})),r.sort((function(e,i){return(0,j.$)(e.name,i.name,t.hass.locale.language)}))}}},{kind:"field",key:"_services",value:function(){var t=this;return(0,I.Z)((function(e,i,n,o){if(!i)return[];var a,r=[];(0,T.cs)(o)&&(a=(0,T.ko)(o));var s=function(n){for(var o=0,s=Object.keys(i[n]);o<s.length;o++){var c,l,d,u=s[o],h=(0,O.G)(n);r.push({group:!1,icon:h,image:h?void 0:(0,W.X1)({domain:n,type:"icon",darkOptimized:null===(c=t.hass.themes)||void 0===c?void 0:c.darkMode}),key:"".concat(T.Ko).concat(n,".").concat(u),name:"".concat(a?"":"".concat((0,D.Lh)(e,n),": ")).concat(t.hass.localize("component.".concat(n,".services.").concat(u,".name"))||(null===(l=i[n][u])||void 0===l?void 0:l.name)||u),description:t.hass.localize("component.".concat(a,".services.").concat(u,".description"))||(null===(d=i[n][u])||void 0===d?void 0:d.description)})}};return a?(s(a),r.sort((function(e,i){return(0,j.$)(e.name,i.name,t.hass.locale.language)}))):o&&!["helpers","other"].includes(o)?[]:(Object.keys(i).sort().forEach((function(t){var e=null==n?void 0:n[t];"helpers"===o&&"helper"!==(null==e?void 0:e.integration_type)||"other"===o&&(Q.has(t)||["helper","entity"].includes((null==e?void 0:e.integration_type)||""))||s(t)})),r)}))}},{kind:"method",key:"_fetchManifests",value:(i=(0,g.Z)((0,C.Z)().mark((function t(){var e,i,n,o,a;return(0,C.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return e={},t.next=3,(0,D.F3)(this.hass);case 3:i=t.sent,n=(0,m.Z)(i);try{for(n.s();!(o=n.n()).done;)a=o.value,e[a.domain]=a}catch(r){n.e(r)}finally{n.f()}this._manifests=e;case 7:case"end":return t.stop()}}),t,this)}))),function(){return i.apply(this,arguments)})},{kind:"method",key:"_calculateUsedDomains",value:function(){var t=new Set(Object.keys(this.hass.states).map(R.M));X(t,this._domains)||(this._domains=t)}},{kind:"method",key:"_opened",value:function(){var t,e=null===(t=this.shadowRoot.querySelector("ha-list-new"))||void 0===t?void 0:t.getBoundingClientRect();this._width=null==e?void 0:e.width,this._height=null==e?void 0:e.height}},{kind:"method",key:"willUpdate",value:function(t){var e,i;"action"===(null===(e=this._params)||void 0===e?void 0:e.type)&&t.has("hass")&&(null===(i=t.get("hass"))||void 0===i?void 0:i.states)!==this.hass.states&&this._calculateUsedDomains()}},{kind:"method",key:"render",value:function(){var t,e=this;if(!this._params)return b.Ld;var i=this._filter?this._getFilteredItems(this._params.type,this._group,this._filter,this.hass.localize,this.hass.services,this._manifests):this._getGroupItems(this._params.type,this._group,this._domains,this.hass.localize,this.hass.services,this._manifests),n=(0,T.cs)(this._group)?(0,D.Lh)(this.hass.localize,(0,T.ko)(this._group),null===(t=this._manifests)||void 0===t?void 0:t[(0,T.ko)(this._group)]):this.hass.localize("ui.panel.config.automation.editor.".concat(this._params.type,"s.groups.").concat(this._group,".label"));return(0,b.dy)(a||(a=(0,v.Z)([' <ha-dialog open hideActions @opened="','" @closed="','" .heading="','"> <div slot="heading"> <ha-dialog-header> <span slot="title">',"</span> ",' </ha-dialog-header> <search-input dialogInitialFocus="','" .hass="','" .filter="','" @value-changed="','" .label="','"></search-input> </div> <ha-list-new dialogInitialFocus="','" style="','"> '," "," </ha-list-new> </ha-dialog> "])),this._opened,this.closeDialog,!0,this._group?n:this.hass.localize("ui.panel.config.automation.editor.".concat(this._params.type,"s.add")),this._group&&this._group!==this._params.group?(0,b.dy)(r||(r=(0,v.Z)(['<ha-icon-button-prev slot="navigationIcon" @click="','"></ha-icon-button-prev>'])),this._back):(0,b.dy)(s||(s=(0,v.Z)(['<ha-icon-button .path="','" slot="navigationIcon" dialogAction="cancel"></ha-icon-button>'])),"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"),(0,w.o)(this._fullScreen?void 0:""),this.hass,this._filter,this._filterChanged,n?this.hass.localize("ui.panel.config.automation.editor.search_in",{group:n}):this.hass.localize("ui.panel.config.automation.editor.".concat(this._params.type,"s.search")),(0,w.o)(this._fullScreen?"":void 0),(0,z.V)({width:this._width?"".concat(this._width,"px"):"auto",height:this._height?"".concat(Math.min(468,this._height),"px"):"auto"}),!this._params.clipboardItem||this._filter||this._group&&!i.find((function(t){return t.key===e._params.clipboardItem}))?"":(0,b.dy)(c||(c=(0,v.Z)(['<ha-list-item-new class="paste" .value="','" @click="','"> ',' <span slot="secondary">','</span> <ha-svg-icon slot="start" .path="','"></ha-svg-icon><ha-svg-icon slot="end" .path="','"></ha-svg-icon> </ha-list-item-new> <md-divider></md-divider>'])),K.I,this._selected,this.hass.localize("ui.panel.config.automation.editor.".concat(this._params.type,"s.paste")),this.hass.localize("ui.panel.config.automation.editor.".concat(this._params.type,"s.type.").concat(this._params.clipboardItem,".label")),"M19,20H5V4H7V7H17V4H19M12,2A1,1 0 0,1 13,3A1,1 0 0,1 12,4A1,1 0 0,1 11,3A1,1 0 0,1 12,2M19,2H14.82C14.4,0.84 13.3,0 12,0C10.7,0 9.6,0.84 9.18,2H5A2,2 0 0,0 3,4V20A2,2 0 0,0 5,22H19A2,2 0 0,0 21,20V4A2,2 0 0,0 19,2Z",$),(0,S.r)(i,(function(t){return t.key}),(function(t){return(0,b.dy)(l||(l=(0,v.Z)([' <ha-list-item-new interactive type="button" .value="','" .group="','" @click="','"> <div slot="headline">','</div> <div slot="supporting-text">',"</div> "," "," </ha-list-item-new> "])),t.key,t.group,e._selected,t.name,t.description,t.icon?(0,b.dy)(d||(d=(0,v.Z)(['<ha-svg-icon slot="start" .path="','"></ha-svg-icon>'])),t.icon):(0,b.dy)(u||(u=(0,v.Z)(['<img alt="" slot="start" src="','" crossorigin="anonymous" referrerpolicy="no-referrer">'])),t.image),t.group?(0,b.dy)(h||(h=(0,v.Z)(['<ha-icon-next slot="end"></ha-icon-next>']))):(0,b.dy)(p||(p=(0,v.Z)(['<ha-svg-icon slot="end" .path="','"></ha-svg-icon>'])),$))})))}},{kind:"method",key:"_back",value:function(){if(this._dialog.scrollToPos(0,0),!this._filter)return this._prev?(this._group=this._prev,void(this._prev=void 0)):void(this._group=void 0);this._filter=""}},{kind:"method",key:"_selected",value:function(t){this._dialog.scrollToPos(0,0);var e=t.currentTarget;if(e.group)return this._prev=this._group,void(this._group=e.value);this._params.add(e.value),this.closeDialog()}},{kind:"method",key:"_filterChanged",value:function(t){this._filter=t.detail.value}},{kind:"get",static:!0,key:"styles",value:function(){return[U.Qx,U.yu,(0,b.iv)(f||(f=(0,v.Z)(["ha-dialog{--dialog-content-padding:0;--mdc-dialog-max-height:60vh}@media all and (min-width:550px){ha-dialog{--mdc-dialog-min-width:500px}}ha-icon-next{width:24px}ha-list-new{max-height:468px;max-width:100vw;--md-list-item-leading-space:24px;--md-list-item-trailing-space:24px}ha-list-item-new img{width:24px}search-input{display:block;margin:0 16px}"])))]}}]}}),b.oi)},72824:function(t,e,i){i.d(e,{X1:function(){return n},u4:function(){return o},zC:function(){return a}});i(97393),i(88640);var n=function(t){return"https://brands.home-assistant.io/".concat(t.brand?"brands/":"").concat(t.useFallback?"_/":"").concat(t.domain,"/").concat(t.darkOptimized?"dark_":"").concat(t.type,".png")},o=function(t){return t.split("/")[4]},a=function(t){return t.startsWith("https://brands.home-assistant.io/")}}}]);
+//# sourceMappingURL=3869.ro2X2mcO-Fs.js.map
\ No newline at end of file
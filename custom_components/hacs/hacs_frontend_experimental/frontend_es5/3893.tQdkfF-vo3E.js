@@ -0,0 +1 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[3893],{63893:function(e){e.exports=[]}}]);
\ No newline at end of file
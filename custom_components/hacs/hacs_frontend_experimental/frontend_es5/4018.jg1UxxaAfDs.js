@@ -0,0 +1,3 @@
+/*! For license information please see 4018.jg1UxxaAfDs.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4018],{24038:function(e,r,a){var t=a(13089);e.exports=function(e){try{if(t)return Function('return require("'+e+'")')()}catch(r){}}},10996:function(e,r,a){a.d(r,{X:function(){return w}});var t,o,i,n,s=a(33368),l=a(71650),c=a(68308),d=a(69205),v=a(43204),h=a(95260),p=a(88962),u=a(34541),f=a(47838),b=(a(85717),a(92952),a(5095)),m=function(e){function r(){var e;return(0,l.Z)(this,r),(e=(0,c.Z)(this,r,arguments)).elevated=!1,e.href="",e.target="",e}return(0,d.Z)(r,e),(0,s.Z)(r,[{key:"primaryId",get:function(){return this.href?"link":"button"}},{key:"rippleDisabled",get:function(){return!this.href&&this.disabled}},{key:"getContainerClasses",value:function(){return Object.assign(Object.assign({},(0,u.Z)((0,f.Z)(r.prototype),"getContainerClasses",this).call(this)),{},{disabled:!this.href&&this.disabled,elevated:this.elevated,link:!!this.href})}},{key:"renderPrimaryAction",value:function(e){var r=this.ariaLabel;return this.href?(0,b.dy)(t||(t=(0,p.Z)([' <a class="primary action" id="link" aria-label="','" href="','" target="','">',"</a> "])),r||b.Ld,this.href,this.target||b.Ld,e):(0,b.dy)(o||(o=(0,p.Z)([' <button class="primary action" id="button" aria-label="','" ?disabled="','" type="button">',"</button> "])),r||b.Ld,this.disabled&&!this.alwaysFocusable,e)}},{key:"renderOutline",value:function(){return this.elevated?(0,b.dy)(i||(i=(0,p.Z)(["<md-elevation></md-elevation>"]))):(0,u.Z)((0,f.Z)(r.prototype),"renderOutline",this).call(this)}}]),r}(a(8674).A);(0,v.__decorate)([(0,h.Cb)({type:Boolean})],m.prototype,"elevated",void 0),(0,v.__decorate)([(0,h.Cb)()],m.prototype,"href",void 0),(0,v.__decorate)([(0,h.Cb)()],m.prototype,"target",void 0);var y,g=(0,b.iv)(n||(n=(0,p.Z)([":host{--_container-height:var(--md-assist-chip-container-height, 32px);--_container-shape:var(--md-assist-chip-container-shape, 8px);--_disabled-label-text-color:var(--md-assist-chip-disabled-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-label-text-opacity:var(--md-assist-chip-disabled-label-text-opacity, 0.38);--_elevated-container-color:var(--md-assist-chip-elevated-container-color, var(--md-sys-color-surface-container-low, #f7f2fa));--_elevated-container-elevation:var(--md-assist-chip-elevated-container-elevation, 1);--_elevated-container-shadow-color:var(--md-assist-chip-elevated-container-shadow-color, var(--md-sys-color-shadow, #000));--_elevated-disabled-container-color:var(--md-assist-chip-elevated-disabled-container-color, var(--md-sys-color-on-surface, #1d1b20));--_elevated-disabled-container-elevation:var(--md-assist-chip-elevated-disabled-container-elevation, 0);--_elevated-disabled-container-opacity:var(--md-assist-chip-elevated-disabled-container-opacity, 0.12);--_elevated-focus-container-elevation:var(--md-assist-chip-elevated-focus-container-elevation, 1);--_elevated-hover-container-elevation:var(--md-assist-chip-elevated-hover-container-elevation, 2);--_elevated-pressed-container-elevation:var(--md-assist-chip-elevated-pressed-container-elevation, 1);--_focus-label-text-color:var(--md-assist-chip-focus-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_hover-label-text-color:var(--md-assist-chip-hover-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_hover-state-layer-color:var(--md-assist-chip-hover-state-layer-color, var(--md-sys-color-on-surface, #1d1b20));--_hover-state-layer-opacity:var(--md-assist-chip-hover-state-layer-opacity, 0.08);--_label-text-color:var(--md-assist-chip-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_label-text-font:var(--md-assist-chip-label-text-font, var(--md-sys-typescale-label-large-font, var(--md-ref-typeface-plain, Roboto)));--_label-text-line-height:var(--md-assist-chip-label-text-line-height, var(--md-sys-typescale-label-large-line-height, 1.25rem));--_label-text-size:var(--md-assist-chip-label-text-size, var(--md-sys-typescale-label-large-size, 0.875rem));--_label-text-weight:var(--md-assist-chip-label-text-weight, var(--md-sys-typescale-label-large-weight, var(--md-ref-typeface-weight-medium, 500)));--_pressed-label-text-color:var(--md-assist-chip-pressed-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_pressed-state-layer-color:var(--md-assist-chip-pressed-state-layer-color, var(--md-sys-color-on-surface, #1d1b20));--_pressed-state-layer-opacity:var(--md-assist-chip-pressed-state-layer-opacity, 0.12);--_disabled-outline-color:var(--md-assist-chip-disabled-outline-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-outline-opacity:var(--md-assist-chip-disabled-outline-opacity, 0.12);--_focus-outline-color:var(--md-assist-chip-focus-outline-color, var(--md-sys-color-on-surface, #1d1b20));--_outline-color:var(--md-assist-chip-outline-color, var(--md-sys-color-outline, #79747e));--_outline-width:var(--md-assist-chip-outline-width, 1px);--_disabled-leading-icon-color:var(--md-assist-chip-disabled-leading-icon-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-leading-icon-opacity:var(--md-assist-chip-disabled-leading-icon-opacity, 0.38);--_focus-leading-icon-color:var(--md-assist-chip-focus-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_hover-leading-icon-color:var(--md-assist-chip-hover-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_leading-icon-color:var(--md-assist-chip-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_icon-size:var(--md-assist-chip-icon-size, 18px);--_pressed-leading-icon-color:var(--md-assist-chip-pressed-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_leading-space:var(--md-assist-chip-leading-space, 16px);--_trailing-space:var(--md-assist-chip-trailing-space, 16px);--_icon-label-space:var(--md-assist-chip-icon-label-space, 8px);--_with-leading-icon-leading-space:var(--md-assist-chip-with-leading-icon-leading-space, 8px);--_container-shape-start-start:var( --md-assist-chip-container-shape-start-start, var(--_container-shape) );--_container-shape-start-end:var( --md-assist-chip-container-shape-start-end, var(--_container-shape) );--_container-shape-end-end:var( --md-assist-chip-container-shape-end-end, var(--_container-shape) );--_container-shape-end-start:var( --md-assist-chip-container-shape-end-start, var(--_container-shape) )}@media(forced-colors:active){.link .outline{border-color:ActiveText}}"]))),_=(0,b.iv)(y||(y=(0,p.Z)([".elevated{--md-elevation-level:var(--_elevated-container-elevation);--md-elevation-shadow-color:var(--_elevated-container-shadow-color)}.elevated::before{background:var(--_elevated-container-color)}.elevated:hover{--md-elevation-level:var(--_elevated-hover-container-elevation)}.elevated:focus-within{--md-elevation-level:var(--_elevated-focus-container-elevation)}.elevated:active{--md-elevation-level:var(--_elevated-pressed-container-elevation)}.elevated.disabled{--md-elevation-level:var(--_elevated-disabled-container-elevation)}.elevated.disabled::before{background:var(--_elevated-disabled-container-color);opacity:var(--_elevated-disabled-container-opacity)}@media(forced-colors:active){.elevated md-elevation{border:1px solid CanvasText}.elevated.disabled md-elevation{border-color:GrayText}}"]))),x=a(90704),w=function(e){function r(){return(0,l.Z)(this,r),(0,c.Z)(this,r,arguments)}return(0,d.Z)(r,e),(0,s.Z)(r)}(m);w.styles=[x.W,_,g],w=(0,v.__decorate)([(0,h.Mo)("md-assist-chip")],w)},18846:function(e,r,a){a.d(r,{l:function(){return y}});var t,o,i=a(33368),n=a(71650),s=a(68308),l=a(69205),c=a(43204),d=a(95260),v=a(40039),h=a(88962),p=a(82390),u=(a(87438),a(46798),a(9849),a(22890),a(85472),a(90126),a(56308),a(5095)),f=a(8674),b=function(e){function r(){var e;return(0,n.Z)(this,r),(e=(0,s.Z)(this,r)).internals=e.attachInternals(),u.sk||(e.addEventListener("focusin",e.updateTabIndices.bind((0,p.Z)(e))),e.addEventListener("update-focus",e.updateTabIndices.bind((0,p.Z)(e))),e.addEventListener("keydown",e.handleKeyDown.bind((0,p.Z)(e))),e.internals.role="toolbar"),e}return(0,l.Z)(r,e),(0,i.Z)(r,[{key:"chips",get:function(){return this.childElements.filter((function(e){return e instanceof f.A}))}},{key:"render",value:function(){return(0,u.dy)(t||(t=(0,h.Z)(['<slot @slotchange="','"></slot>'])),this.updateTabIndices)}},{key:"handleKeyDown",value:function(e){var r="ArrowLeft"===e.key,a="ArrowRight"===e.key,t="Home"===e.key,o="End"===e.key;if(r||a||t||o){var i=this.chips;if(!(i.length<2)){if(e.preventDefault(),t||o)return i[t?0:i.length-1].focus({trailing:o}),void this.updateTabIndices();var n="rtl"===getComputedStyle(this).direction?r:a,s=i.find((function(e){return e.matches(":focus-within")}));if(!s)return(n?i[0]:i[i.length-1]).focus({trailing:!n}),void this.updateTabIndices();for(var l=i.indexOf(s),c=n?l+1:l-1;c!==l;){c>=i.length?c=0:c<0&&(c=i.length-1);var d=i[c];if(!d.disabled||d.alwaysFocusable){d.focus({trailing:!n}),this.updateTabIndices();break}n?c++:c--}}}}},{key:"updateTabIndices",value:function(){var e,r,a=this.chips,t=(0,v.Z)(a);try{for(t.s();!(r=t.n()).done;){var o=r.value,i=o.alwaysFocusable||!o.disabled;o.matches(":focus-within")&&i?e=o:(i&&!e&&(e=o),o.tabIndex=-1)}}catch(n){t.e(n)}finally{t.f()}e&&(e.tabIndex=0)}}]),r}(u.oi);(0,c.__decorate)([(0,d.NH)()],b.prototype,"childElements",void 0);var m=(0,u.iv)(o||(o=(0,h.Z)([":host{display:flex;flex-wrap:wrap;gap:8px}"]))),y=function(e){function r(){return(0,n.Z)(this,r),(0,s.Z)(this,r,arguments)}return(0,l.Z)(r,e),(0,i.Z)(r)}(b);y.styles=[m],y=(0,c.__decorate)([(0,d.Mo)("md-chip-set")],y)},8674:function(e,r,a){a.d(r,{A:function(){return _}});var t,o,i,n,s,l=a(88962),c=a(71650),d=a(33368),v=a(68308),h=a(34541),p=a(47838),u=a(69205),f=(a(85717),a(43204)),b=(a(86477),a(35981),a(5095)),m=a(95260),y=a(53180),g=a(6157),_=function(e){function r(){var e;return(0,c.Z)(this,r),(e=(0,v.Z)(this,r,arguments)).disabled=!1,e.alwaysFocusable=!1,e.label="",e.hasIcon=!1,e}return(0,u.Z)(r,e),(0,d.Z)(r,[{key:"rippleDisabled",get:function(){return this.disabled}},{key:"focus",value:function(e){this.disabled&&!this.alwaysFocusable||(0,h.Z)((0,p.Z)(r.prototype),"focus",this).call(this,e)}},{key:"render",value:function(){return(0,b.dy)(t||(t=(0,l.Z)([' <div class="container ','"> '," </div> "])),(0,y.$)(this.getContainerClasses()),this.renderContainerContent())}},{key:"updated",value:function(e){e.has("disabled")&&void 0!==e.get("disabled")&&this.dispatchEvent(new Event("update-focus",{bubbles:!0}))}},{key:"getContainerClasses",value:function(){return{disabled:this.disabled,"has-icon":this.hasIcon}}},{key:"renderContainerContent",value:function(){return(0,b.dy)(o||(o=(0,l.Z)([" ",' <md-focus-ring part="focus-ring" for="','"></md-focus-ring> <md-ripple for="','" ?disabled="','"></md-ripple> '," "])),this.renderOutline(),this.primaryId,this.primaryId,this.rippleDisabled,this.renderPrimaryAction(this.renderPrimaryContent()))}},{key:"renderOutline",value:function(){return(0,b.dy)(i||(i=(0,l.Z)(['<span class="outline"></span>'])))}},{key:"renderLeadingIcon",value:function(){return(0,b.dy)(n||(n=(0,l.Z)(['<slot name="icon" @slotchange="','"></slot>'])),this.handleIconChange)}},{key:"renderPrimaryContent",value:function(){return(0,b.dy)(s||(s=(0,l.Z)([' <span class="leading icon" aria-hidden="true"> ',' </span> <span class="label">','</span> <span class="touch"></span> '])),this.renderLeadingIcon(),this.label)}},{key:"handleIconChange",value:function(e){var r=e.target;this.hasIcon=r.assignedElements({flatten:!0}).length>0}}]),r}(b.oi);(0,g.d)(_),_.shadowRootOptions=Object.assign(Object.assign({},b.oi.shadowRootOptions),{},{delegatesFocus:!0}),(0,f.__decorate)([(0,m.Cb)({type:Boolean,reflect:!0})],_.prototype,"disabled",void 0),(0,f.__decorate)([(0,m.Cb)({type:Boolean,attribute:"always-focusable"})],_.prototype,"alwaysFocusable",void 0),(0,f.__decorate)([(0,m.Cb)()],_.prototype,"label",void 0),(0,f.__decorate)([(0,m.Cb)({type:Boolean,reflect:!0,attribute:"has-icon"})],_.prototype,"hasIcon",void 0)},90704:function(e,r,a){a.d(r,{W:function(){return i}});var t,o=a(88962),i=(0,a(5095).iv)(t||(t=(0,o.Z)([':host{border-start-start-radius:var(--_container-shape-start-start);border-start-end-radius:var(--_container-shape-start-end);border-end-start-radius:var(--_container-shape-end-start);border-end-end-radius:var(--_container-shape-end-end);display:inline-flex;height:var(--_container-height);cursor:pointer;-webkit-tap-highlight-color:transparent;--md-ripple-hover-color:var(--_hover-state-layer-color);--md-ripple-hover-opacity:var(--_hover-state-layer-opacity);--md-ripple-pressed-color:var(--_pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_pressed-state-layer-opacity)}:host([disabled]){pointer-events:none}:host([touch-target=wrapper]){margin:max(0px,(48px - var(--_container-height))/2) 0}md-focus-ring{--md-focus-ring-shape-start-start:var(--_container-shape-start-start);--md-focus-ring-shape-start-end:var(--_container-shape-start-end);--md-focus-ring-shape-end-end:var(--_container-shape-end-end);--md-focus-ring-shape-end-start:var(--_container-shape-end-start)}.container{border-radius:inherit;box-sizing:border-box;display:flex;height:100%;position:relative;width:100%}.container::before{border-radius:inherit;content:"";inset:0;pointer-events:none;position:absolute}.container:not(.disabled){cursor:pointer}.container.disabled{pointer-events:none}.cell{display:flex}.action{align-items:baseline;appearance:none;background:0 0;border:none;border-radius:inherit;display:flex;outline:0;padding:0;position:relative;text-decoration:none}.primary.action{padding-inline-start:var(--_leading-space);padding-inline-end:var(--_trailing-space)}.has-icon .primary.action{padding-inline-start:var(--_with-leading-icon-leading-space)}.touch{height:48px;inset:50% 0 0;position:absolute;transform:translateY(-50%);width:100%}:host([touch-target=none]) .touch{display:none}.outline{border:var(--_outline-width) solid var(--_outline-color);border-radius:inherit;inset:0;pointer-events:none;position:absolute}:where(:focus) .outline{border-color:var(--_focus-outline-color)}:where(.disabled) .outline{border-color:var(--_disabled-outline-color);opacity:var(--_disabled-outline-opacity)}md-ripple{border-radius:inherit}.icon,.label,.touch{z-index:1}.label{align-items:center;color:var(--_label-text-color);display:flex;font-family:var(--_label-text-font);font-size:var(--_label-text-size);line-height:var(--_label-text-line-height);font-weight:var(--_label-text-weight);height:100%;text-overflow:ellipsis;user-select:none;white-space:nowrap}:where(:hover) .label{color:var(--_hover-label-text-color)}:where(:focus) .label{color:var(--_focus-label-text-color)}:where(:active) .label{color:var(--_pressed-label-text-color)}:where(.disabled) .label{color:var(--_disabled-label-text-color);opacity:var(--_disabled-label-text-opacity)}.icon{align-self:center;display:flex;fill:currentColor;position:relative}.icon ::slotted(:first-child){font-size:var(--_icon-size);height:var(--_icon-size);width:var(--_icon-size)}.leading.icon{color:var(--_leading-icon-color)}.leading.icon ::slotted(*),.leading.icon svg{margin-inline-end:var(--_icon-label-space)}:where(:hover) .leading.icon{color:var(--_hover-leading-icon-color)}:where(:focus) .leading.icon{color:var(--_focus-leading-icon-color)}:where(:active) .leading.icon{color:var(--_pressed-leading-icon-color)}:where(.disabled) .leading.icon{color:var(--_disabled-leading-icon-color);opacity:var(--_disabled-leading-icon-opacity)}@media(forced-colors:active){:where(.disabled) :is(.label,.outline,.leading.icon){color:GrayText;opacity:1}}a,button:not(:disabled){cursor:inherit}'])))},92952:function(e,r,a){var t,o,i=a(33368),n=a(71650),s=a(68308),l=a(69205),c=a(43204),d=a(95260),v=a(88962),h=a(34541),p=a(47838),u=a(5095),f=function(e){function r(){return(0,n.Z)(this,r),(0,s.Z)(this,r,arguments)}return(0,l.Z)(r,e),(0,i.Z)(r,[{key:"connectedCallback",value:function(){(0,h.Z)((0,p.Z)(r.prototype),"connectedCallback",this).call(this),this.setAttribute("aria-hidden","true")}},{key:"render",value:function(){return(0,u.dy)(t||(t=(0,v.Z)(['<span class="shadow"></span>'])))}}]),r}(u.oi),b=(0,u.iv)(o||(o=(0,v.Z)([':host{--_level:var(--md-elevation-level, 0);--_shadow-color:var(--md-elevation-shadow-color, var(--md-sys-color-shadow, #000));display:flex;pointer-events:none}.shadow,.shadow::after,.shadow::before,:host{border-radius:inherit;inset:0;position:absolute;transition-duration:inherit;transition-property:inherit;transition-timing-function:inherit}.shadow::after,.shadow::before{content:"";transition-property:box-shadow,opacity}.shadow::before{box-shadow:0px calc(1px*(clamp(0,var(--_level),1) + clamp(0,var(--_level) - 3,1) + 2*clamp(0,var(--_level) - 4,1))) calc(1px*(2*clamp(0,var(--_level),1) + clamp(0,var(--_level) - 2,1) + clamp(0,var(--_level) - 4,1))) 0px var(--_shadow-color);opacity:.3}.shadow::after{box-shadow:0px calc(1px*(clamp(0,var(--_level),1) + clamp(0,var(--_level) - 1,1) + 2*clamp(0,var(--_level) - 2,3))) calc(1px*(3*clamp(0,var(--_level),2) + 2*clamp(0,var(--_level) - 2,3))) calc(1px*(clamp(0,var(--_level),4) + 2*clamp(0,var(--_level) - 4,1))) var(--_shadow-color);opacity:.15}']))),m=function(e){function r(){return(0,n.Z)(this,r),(0,s.Z)(this,r,arguments)}return(0,l.Z)(r,e),(0,i.Z)(r)}(f);m.styles=[b],m=(0,c.__decorate)([(0,d.Mo)("md-elevation")],m)},22129:function(e,r,a){a.d(r,{B:function(){return _}});var t,o,i,n=a(33368),s=a(71650),l=a(68308),c=a(69205),d=a(43204),v=a(95260),h=a(88962),p=a(5095),u=(a(76843),a(53180)),f=a(6157),b=function(e){function r(){var e;return(0,s.Z)(this,r),(e=(0,l.Z)(this,r,arguments)).value=0,e.max=1,e.indeterminate=!1,e.fourColor=!1,e}return(0,c.Z)(r,e),(0,n.Z)(r,[{key:"render",value:function(){var e=this.ariaLabel;return(0,p.dy)(t||(t=(0,h.Z)([' <div class="progress ','" role="progressbar" aria-label="','" aria-valuemin="0" aria-valuemax="','" aria-valuenow="','">',"</div> "])),(0,u.$)(this.getRenderClasses()),e||p.Ld,this.max,this.indeterminate?p.Ld:this.value,this.renderIndicator())}},{key:"getRenderClasses",value:function(){return{indeterminate:this.indeterminate,"four-color":this.fourColor}}}]),r}(p.oi);(0,f.d)(b),(0,d.__decorate)([(0,v.Cb)({type:Number})],b.prototype,"value",void 0),(0,d.__decorate)([(0,v.Cb)({type:Number})],b.prototype,"max",void 0),(0,d.__decorate)([(0,v.Cb)({type:Boolean})],b.prototype,"indeterminate",void 0),(0,d.__decorate)([(0,v.Cb)({type:Boolean,attribute:"four-color"})],b.prototype,"fourColor",void 0);var m,y=function(e){function r(){return(0,s.Z)(this,r),(0,l.Z)(this,r,arguments)}return(0,c.Z)(r,e),(0,n.Z)(r,[{key:"renderIndicator",value:function(){return this.indeterminate?this.renderIndeterminateContainer():this.renderDeterminateContainer()}},{key:"renderDeterminateContainer",value:function(){var e=100*(1-this.value/this.max);return(0,p.dy)(o||(o=(0,h.Z)([' <svg viewBox="0 0 4800 4800"> <circle class="track" pathLength="100"></circle> <circle class="active-track" pathLength="100" stroke-dashoffset="','"></circle> </svg> '])),e)}},{key:"renderIndeterminateContainer",value:function(){return(0,p.dy)(i||(i=(0,h.Z)([' <div class="spinner"> <div class="left"> <div class="circle"></div> </div> <div class="right"> <div class="circle"></div> </div> </div>'])))}}]),r}(b),g=(0,p.iv)(m||(m=(0,h.Z)([":host{--_active-indicator-color:var(--md-circular-progress-active-indicator-color, var(--md-sys-color-primary, #6750a4));--_active-indicator-width:var(--md-circular-progress-active-indicator-width, 10);--_four-color-active-indicator-four-color:var(--md-circular-progress-four-color-active-indicator-four-color, var(--md-sys-color-tertiary-container, #ffd8e4));--_four-color-active-indicator-one-color:var(--md-circular-progress-four-color-active-indicator-one-color, var(--md-sys-color-primary, #6750a4));--_four-color-active-indicator-three-color:var(--md-circular-progress-four-color-active-indicator-three-color, var(--md-sys-color-tertiary, #7d5260));--_four-color-active-indicator-two-color:var(--md-circular-progress-four-color-active-indicator-two-color, var(--md-sys-color-primary-container, #eaddff));--_size:var(--md-circular-progress-size, 48px);display:inline-flex;vertical-align:middle;width:var(--_size);height:var(--_size);position:relative;align-items:center;justify-content:center;contain:strict;content-visibility:auto}.progress{flex:1;align-self:stretch;margin:4px}.active-track,.circle,.left,.progress,.right,.spinner,.track,svg{position:absolute;inset:0}svg{transform:rotate(-90deg)}circle{cx:50%;cy:50%;r:calc(50%*(1 - var(--_active-indicator-width)/ 100));stroke-width:calc(var(--_active-indicator-width)*1%);stroke-dasharray:100;fill:rgba(0,0,0,0)}.active-track{transition:stroke-dashoffset .5s cubic-bezier(0, 0, .2, 1);stroke:var(--_active-indicator-color)}.track{stroke:rgba(0,0,0,0)}.progress.indeterminate{animation:linear infinite linear-rotate;animation-duration:1.568s}.spinner{animation:infinite both rotate-arc;animation-duration:5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.left{overflow:hidden;inset:0 50% 0 0}.right{overflow:hidden;inset:0 0 0 50%}.circle{box-sizing:border-box;border-radius:50%;border:solid calc(var(--_active-indicator-width)/ 100*(var(--_size) - 8px));border-color:var(--_active-indicator-color) var(--_active-indicator-color) transparent transparent;animation:expand-arc;animation-iteration-count:infinite;animation-fill-mode:both;animation-duration:1333ms,5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.four-color .circle{animation-name:expand-arc,four-color}.left .circle{rotate:135deg;inset:0 -100% 0 0}.right .circle{rotate:100deg;inset:0 0 0 -100%;animation-delay:-.666s,0s}@media(forced-colors:active){.active-track{stroke:CanvasText}.circle{border-color:CanvasText CanvasText Canvas Canvas}}@keyframes expand-arc{0%{transform:rotate(265deg)}50%{transform:rotate(130deg)}100%{transform:rotate(265deg)}}@keyframes rotate-arc{12.5%{transform:rotate(135deg)}25%{transform:rotate(270deg)}37.5%{transform:rotate(405deg)}50%{transform:rotate(540deg)}62.5%{transform:rotate(675deg)}75%{transform:rotate(810deg)}87.5%{transform:rotate(945deg)}100%{transform:rotate(1080deg)}}@keyframes linear-rotate{to{transform:rotate(360deg)}}@keyframes four-color{0%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}15%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}25%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}40%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}50%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}65%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}75%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}90%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}100%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}}"]))),_=function(e){function r(){return(0,s.Z)(this,r),(0,l.Z)(this,r,arguments)}return(0,c.Z)(r,e),(0,n.Z)(r)}(y);_.styles=[g],_=(0,d.__decorate)([(0,v.Mo)("md-circular-progress")],_)}}]);
+//# sourceMappingURL=4018.jg1UxxaAfDs.js.map
\ No newline at end of file
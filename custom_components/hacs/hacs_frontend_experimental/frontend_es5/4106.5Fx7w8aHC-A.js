@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4106],{86089:function(e,t,i){i.d(t,{U:function(){return n}});var n=function(e){return e.stopPropagation()}},64106:function(e,t,i){var n,a,r,o,d,l,s,c,u=i(88962),h=i(33368),f=i(71650),m=i(68308),p=i(82390),v=i(69205),b=i(91808),y=(i(97393),i(76843),i(5110),i(22859),i(73314),i(46798),i(94570),i(44577),i(5095)),x=i(95260),k=i(10694),g=i(18394),Z=i(86089);i(71133),i(7265),(0,b.Z)([(0,x.Mo)("ha-base-time-input")],(function(e,t){var i=function(t){function i(){var t;(0,f.Z)(this,i);for(var n=arguments.length,a=new Array(n),r=0;r<n;r++)a[r]=arguments[r];return t=(0,m.Z)(this,i,[].concat(a)),e((0,p.Z)(t)),t}return(0,v.Z)(i,t),(0,h.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,x.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,x.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"autoValidate",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Number})],key:"format",value:function(){return 12}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Number})],key:"days",value:function(){return 0}},{kind:"field",decorators:[(0,x.Cb)({type:Number})],key:"hours",value:function(){return 0}},{kind:"field",decorators:[(0,x.Cb)({type:Number})],key:"minutes",value:function(){return 0}},{kind:"field",decorators:[(0,x.Cb)({type:Number})],key:"seconds",value:function(){return 0}},{kind:"field",decorators:[(0,x.Cb)({type:Number})],key:"milliseconds",value:function(){return 0}},{kind:"field",decorators:[(0,x.Cb)()],key:"dayLabel",value:function(){return""}},{kind:"field",decorators:[(0,x.Cb)()],key:"hourLabel",value:function(){return""}},{kind:"field",decorators:[(0,x.Cb)()],key:"minLabel",value:function(){return""}},{kind:"field",decorators:[(0,x.Cb)()],key:"secLabel",value:function(){return""}},{kind:"field",decorators:[(0,x.Cb)()],key:"millisecLabel",value:function(){return""}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"enableSecond",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"enableMillisecond",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"enableDay",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"noHoursLimit",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)()],key:"amPm",value:function(){return"AM"}},{kind:"method",key:"render",value:function(){return(0,y.dy)(n||(n=(0,u.Z)([" ",' <div class="time-input-wrap"> ',' <ha-textfield id="hour" type="number" inputmode="numeric" .value="','" .label="','" name="hours" @change="','" @focusin="','" no-spinner .required="','" .autoValidate="','" maxlength="2" max="','" min="0" .disabled="','" suffix=":" class="hasSuffix"> </ha-textfield> <ha-textfield id="min" type="number" inputmode="numeric" .value="','" .label="','" @change="','" @focusin="','" name="minutes" no-spinner .required="','" .autoValidate="','" maxlength="2" max="59" min="0" .disabled="','" .suffix="','" class="','"> </ha-textfield> '," "," "," </div> "," "])),this.label?(0,y.dy)(a||(a=(0,u.Z)(["<label>","","</label>"])),this.label,this.required?" *":""):"",this.enableDay?(0,y.dy)(r||(r=(0,u.Z)([' <ha-textfield id="day" type="number" inputmode="numeric" .value="','" .label="','" name="days" @change="','" @focusin="','" no-spinner .required="','" .autoValidate="','" min="0" .disabled="','" suffix=":" class="hasSuffix"> </ha-textfield> '])),this.days.toFixed(),this.dayLabel,this._valueChanged,this._onFocus,this.required,this.autoValidate,this.disabled):"",this.hours.toFixed(),this.hourLabel,this._valueChanged,this._onFocus,this.required,this.autoValidate,(0,k.o)(this._hourMax),this.disabled,this._formatValue(this.minutes),this.minLabel,this._valueChanged,this._onFocus,this.required,this.autoValidate,this.disabled,this.enableSecond?":":"",this.enableSecond?"has-suffix":"",this.enableSecond?(0,y.dy)(o||(o=(0,u.Z)(['<ha-textfield id="sec" type="number" inputmode="numeric" .value="','" .label="','" @change="','" @focusin="','" name="seconds" no-spinner .required="','" .autoValidate="','" maxlength="2" max="59" min="0" .disabled="','" .suffix="','" class="','"> </ha-textfield>'])),this._formatValue(this.seconds),this.secLabel,this._valueChanged,this._onFocus,this.required,this.autoValidate,this.disabled,this.enableMillisecond?":":"",this.enableMillisecond?"has-suffix":""):"",this.enableMillisecond?(0,y.dy)(d||(d=(0,u.Z)(['<ha-textfield id="millisec" type="number" .value="','" .label="','" @change="','" @focusin="','" name="milliseconds" no-spinner .required="','" .autoValidate="','" maxlength="3" max="999" min="0" .disabled="','"> </ha-textfield>'])),this._formatValue(this.milliseconds,3),this.millisecLabel,this._valueChanged,this._onFocus,this.required,this.autoValidate,this.disabled):"",24===this.format?"":(0,y.dy)(l||(l=(0,u.Z)(['<ha-select .required="','" .value="','" .disabled="','" name="amPm" naturalMenuWidth fixedMenuPosition @selected="','" @closed="','"> <mwc-list-item value="AM">AM</mwc-list-item> <mwc-list-item value="PM">PM</mwc-list-item> </ha-select>'])),this.required,this.amPm,this.disabled,this._valueChanged,Z.U),this.helper?(0,y.dy)(s||(s=(0,u.Z)(["<ha-input-helper-text>","</ha-input-helper-text>"])),this.helper):"")}},{kind:"method",key:"_valueChanged",value:function(e){var t=e.currentTarget;this[t.name]="amPm"===t.name?t.value:Number(t.value);var i={hours:this.hours,minutes:this.minutes,seconds:this.seconds,milliseconds:this.milliseconds};this.enableDay&&(i.days=this.days),12===this.format&&(i.amPm=this.amPm),(0,g.B)(this,"value-changed",{value:i})}},{kind:"method",key:"_onFocus",value:function(e){e.currentTarget.select()}},{kind:"method",key:"_formatValue",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:2;return e.toString().padStart(t,"0")}},{kind:"get",key:"_hourMax",value:function(){if(!this.noHoursLimit)return 12===this.format?12:23}},{kind:"field",static:!0,key:"styles",value:function(){return(0,y.iv)(c||(c=(0,u.Z)([":host{display:block}.time-input-wrap{display:flex;border-radius:var(--mdc-shape-small,4px) var(--mdc-shape-small,4px) 0 0;overflow:hidden;position:relative;direction:ltr}ha-textfield{width:40px;text-align:center;--mdc-shape-small:0;--text-field-appearance:none;--text-field-padding:0 4px;--text-field-suffix-padding-left:2px;--text-field-suffix-padding-right:0;--text-field-text-align:center}ha-textfield.hasSuffix{--text-field-padding:0 0 0 4px}ha-textfield:first-child{--text-field-border-top-left-radius:var(--mdc-shape-medium)}ha-textfield:last-child{--text-field-border-top-right-radius:var(--mdc-shape-medium)}ha-select{--mdc-shape-small:0;width:85px}label{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:var(\n        --mdc-typography-body2-font-family,\n        var(--mdc-typography-font-family, Roboto, sans-serif)\n      );font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:var(\n        --mdc-typography-body2-letter-spacing,\n        .0178571429em\n      );text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:var(--mdc-typography-body2-text-transform,inherit);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87));padding-left:4px}"])))}}]}}),y.oi)},7265:function(e,t,i){var n,a,r=i(88962),o=i(33368),d=i(71650),l=i(68308),s=i(82390),c=i(69205),u=i(91808),h=(i(97393),i(5095)),f=i(95260);(0,u.Z)([(0,f.Mo)("ha-input-helper-text")],(function(e,t){var i=function(t){function i(){var t;(0,d.Z)(this,i);for(var n=arguments.length,a=new Array(n),r=0;r<n;r++)a[r]=arguments[r];return t=(0,l.Z)(this,i,[].concat(a)),e((0,s.Z)(t)),t}return(0,c.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"render",value:function(){return(0,h.dy)(n||(n=(0,r.Z)(["<slot></slot>"])))}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(a||(a=(0,r.Z)([":host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}"])))}}]}}),h.oi)},71133:function(e,t,i){var n,a,r,o,d=i(99312),l=i(81043),s=i(88962),c=i(33368),u=i(71650),h=i(68308),f=i(82390),m=i(69205),p=i(91808),v=i(34541),b=i(47838),y=(i(97393),i(49412)),x=i(3762),k=i(5095),g=i(95260),Z=i(72218),_=i(2537);i(54371),(0,p.Z)([(0,g.Mo)("ha-select")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),r=0;r<n;r++)a[r]=arguments[r];return t=(0,h.Z)(this,i,[].concat(a)),e((0,f.Z)(t)),t}return(0,m.Z)(i,t),(0,c.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,k.dy)(n||(n=(0,s.Z)([" "," "," "])),(0,v.Z)((0,b.Z)(i.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,k.dy)(a||(a=(0,s.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):k.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,k.dy)(r||(r=(0,s.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):k.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,v.Z)((0,b.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,v.Z)((0,b.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,Z.D)((0,l.Z)((0,d.Z)().mark((function t(){return(0,d.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,_.y)();case 2:e.layoutOptions();case 3:case"end":return t.stop()}}),t)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[x.W,(0,k.iv)(o||(o=(0,s.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),y.K)},75325:function(e,t,i){var n=i(68360);e.exports=/Version\/10(?:\.\d+){1,2}(?: [\w./]+)?(?: Mobile\/\w+)? Safari\//.test(n)},86558:function(e,t,i){var n=i(55418),a=i(97142),r=i(11336),o=i(93892),d=i(43313),l=n(o),s=n("".slice),c=Math.ceil,u=function(e){return function(t,i,n){var o,u,h=r(d(t)),f=a(i),m=h.length,p=void 0===n?" ":r(n);return f<=m||""===p?h:((u=l(p,c((o=f-m)/p.length))).length>o&&(u=s(u,0,o)),e?h+u:u+h)}};e.exports={start:u(!1),end:u(!0)}},5110:function(e,t,i){var n=i(68077),a=i(55418),r=i(97673),o=i(29191),d=i(93892),l=i(18431),s=RangeError,c=String,u=Math.floor,h=a(d),f=a("".slice),m=a(1..toFixed),p=function(e,t,i){return 0===t?i:t%2==1?p(e,t-1,i*e):p(e*e,t/2,i)},v=function(e,t,i){for(var n=-1,a=i;++n<6;)a+=t*e[n],e[n]=a%1e7,a=u(a/1e7)},b=function(e,t){for(var i=6,n=0;--i>=0;)n+=e[i],e[i]=u(n/t),n=n%t*1e7},y=function(e){for(var t=6,i="";--t>=0;)if(""!==i||0===t||0!==e[t]){var n=c(e[t]);i=""===i?n:i+h("0",7-n.length)+n}return i};n({target:"Number",proto:!0,forced:l((function(){return"0.000"!==m(8e-5,3)||"1"!==m(.9,0)||"1.25"!==m(1.255,2)||"1000000000000000128"!==m(0xde0b6b3a7640080,0)}))||!l((function(){m({})}))},{toFixed:function(e){var t,i,n,a,d=o(this),l=r(e),u=[0,0,0,0,0,0],m="",x="0";if(l<0||l>20)throw new s("Incorrect fraction digits");if(d!=d)return"NaN";if(d<=-1e21||d>=1e21)return c(d);if(d<0&&(m="-",d=-d),d>1e-21)if(i=(t=function(e){for(var t=0,i=e;i>=4096;)t+=12,i/=4096;for(;i>=2;)t+=1,i/=2;return t}(d*p(2,69,1))-69)<0?d*p(2,-t,1):d/p(2,t,1),i*=4503599627370496,(t=52-t)>0){for(v(u,0,i),n=l;n>=7;)v(u,1e7,0),n-=7;for(v(u,p(10,n,1),0),n=t-1;n>=23;)b(u,1<<23),n-=23;b(u,1<<n),v(u,1,1),b(u,2),x=y(u)}else v(u,0,i),v(u,1<<-t,0),x=y(u)+h("0",l);return x=l>0?m+((a=x.length)<=l?"0."+h("0",l-a)+x:f(x,0,a-l)+"."+f(x,a-l)):m+x}})},73314:function(e,t,i){var n=i(68077),a=i(86558).start;n({target:"String",proto:!0,forced:i(75325)},{padStart:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}})}}]);
+//# sourceMappingURL=4106.5Fx7w8aHC-A.js.map
\ No newline at end of file
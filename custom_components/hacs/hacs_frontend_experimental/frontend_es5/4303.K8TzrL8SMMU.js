@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4303],{42732:function(t,e,i){i.d(e,{I2:function(){return h},Hh:function(){return l}});i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(36513),i(97393);var a=i(21157),o=i(97315);i(40039),i(34997),i(9849),i(12148),i(64777),i(2094),i(11451);var r=i(26654),n=(i(76843),i(36655)),s=i(58664),c=new Set(["alarm_control_panel","alert","automation","binary_sensor","calendar","camera","climate","cover","device_tracker","fan","group","humidifier","input_boolean","lawn_mower","light","lock","media_player","person","plant","remote","schedule","script","siren","sun","switch","timer","update","vacuum","valve","water_heater"]),l=function(t,e){if((void 0!==e?e:null==t?void 0:t.state)===a.nZ)return"var(--state-unavailable-color)";var i,o=d(t,e);return o?(i=o,Array.isArray(i)?i.reverse().reduce((function(t,e){return"var(".concat(e).concat(t?", ".concat(t):"",")")}),void 0):"var(".concat(i,")")):void 0},u=function(t,e,i){var a=void 0!==i?i:e.state,o=(0,s.v)(e,i),n=[],c=(0,r.l)(a,"_"),l=o?"active":"inactive",u=e.attributes.device_class;return u&&n.push("--state-".concat(t,"-").concat(u,"-").concat(c,"-color")),n.push("--state-".concat(t,"-").concat(c,"-color"),"--state-".concat(t,"-").concat(l,"-color"),"--state-".concat(l,"-color")),n},d=function(t,e){var i=void 0!==e?e:null==t?void 0:t.state,a=(0,n.M)(t.entity_id),r=t.attributes.device_class;if("sensor"===a&&"battery"===r){var s=function(t){var e=Number(t);if(!isNaN(e))return e>=70?"--state-sensor-battery-high-color":e>=30?"--state-sensor-battery-medium-color":"--state-sensor-battery-low-color"}(i);if(s)return[s]}if("group"===a){var l=(0,o.W)(t);if(l&&c.has(l))return u(l,t,e)}if(c.has(a))return u(a,t,e)},h=function(t){if(t.attributes.brightness&&"plant"!==(0,n.M)(t.entity_id)){var e=t.attributes.brightness;return"brightness(".concat((e+245)/5,"%)")}return""}},26654:function(t,e,i){i.d(e,{l:function(){return a}});i(10999),i(52117),i(63789),i(82479),i(94570),i(91989),i(24074),i(46798);var a=function(t){var e,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"_",a="àáâäæãåāăąçćčđďèéêëēėęěğǵḧîïíīįìıİłḿñńǹňôöòóœøōõőṕŕřßśšşșťțûüùúūǘůűųẃẍÿýžźż·",o="aaaaaaaaaacccddeeeeeeeegghiiiiiiiilmnnnnoooooooooprrsssssttuuuuuuuuuwxyyzzz".concat(i),r=new RegExp(a.split("").join("|"),"g");return""===t?e="":""===(e=t.toString().toLowerCase().replace(r,(function(t){return o.charAt(a.indexOf(t))})).replace(/(\d),(?=\d)/g,"$1").replace(/[^a-z0-9]+/g,i).replace(new RegExp("(".concat(i,")\\1+"),"g"),"$1").replace(new RegExp("^".concat(i,"+")),"").replace(new RegExp("".concat(i,"+$")),""))&&(e="unknown"),e}},14303:function(t,e,i){var a,o,r,n,s,c,l,u,d=i(76775),h=i(88962),v=i(33368),f=i(71650),b=i(68308),y=i(82390),p=i(69205),g=i(91808),k=i(34541),_=i(47838),m=(i(97393),i(91989),i(46798),i(5095)),Z=i(95260),w=i(10694),C=i(86634),j=i(36655),O=i(3850),I=i(42732),x=(0,m.iv)(a||(a=(0,h.Z)(["ha-state-icon[data-domain=alarm_control_panel][data-state=arming],ha-state-icon[data-domain=alarm_control_panel][data-state=pending],ha-state-icon[data-domain=alarm_control_panel][data-state=triggered],ha-state-icon[data-domain=lock][data-state=jammed]{animation:pulse 1s infinite}@keyframes pulse{0%{opacity:1}50%{opacity:0}100%{opacity:1}}ha-state-icon[data-state=unavailable]{color:var(--state-unavailable-color)}"]))),M=(i(99312),i(81043),i(85717),i(88640),i(92599),function(t,e,i){return"".concat(t,"&width=").concat(e,"&height=").concat(i)}),H=(i(34997),["auto","heat_cool","heat","cool","dry","fan_only","off"].reduce((function(t,e,i){return t[e]=i,t}),{}),{cooling:"cool",drying:"dry",fan:"fan_only",preheating:"heat",heating:"heat",idle:"off",off:"off"}),R=i(36142),S=i(4138),z=i(81454),U=i(30045),A=(i(37662),(0,g.Z)([(0,Z.Mo)("ha-state-icon")],(function(t,e){var i=function(e){function i(){var e;(0,f.Z)(this,i);for(var a=arguments.length,o=new Array(a),r=0;r<a;r++)o[r]=arguments[r];return e=(0,b.Z)(this,i,[].concat(o)),t((0,y.Z)(e)),e}return(0,p.Z)(i,e),(0,v.Z)(i)}(e);return{F:i,d:[{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"stateObj",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"icon",value:void 0},{kind:"method",key:"render",value:function(){var t,e,i=this,a=this.icon||this.stateObj&&(null===(t=this.hass)||void 0===t||null===(t=t.entities[this.stateObj.entity_id])||void 0===t?void 0:t.icon)||(null===(e=this.stateObj)||void 0===e?void 0:e.attributes.icon);if(a)return(0,m.dy)(o||(o=(0,h.Z)(['<ha-icon .icon="','"></ha-icon>'])),a);if(!this.stateObj)return m.Ld;if(!this.hass)return this._renderFallback();var s=(0,U.gD)(this.hass,this.stateObj).then((function(t){return t?(0,m.dy)(r||(r=(0,h.Z)(['<ha-icon .icon="','"></ha-icon>'])),t):i._renderFallback()}));return(0,m.dy)(n||(n=(0,h.Z)(["",""])),(0,R.C)(s))}},{kind:"method",key:"_renderFallback",value:function(){return(0,m.dy)(s||(s=(0,h.Z)(['<ha-svg-icon .path="','"></ha-svg-icon>'])),(t=this.stateObj)?(0,z.K)((0,j.M)(t.entity_id),t):S.Rb);var t}}]}}),m.oi),(0,g.Z)(null,(function(t,e){var i=function(e){function i(){var e;(0,f.Z)(this,i);for(var a=arguments.length,o=new Array(a),r=0;r<a;r++)o[r]=arguments[r];return e=(0,b.Z)(this,i,[].concat(o)),t((0,y.Z)(e)),e}return(0,p.Z)(i,e),(0,v.Z)(i)}(e);return{F:i,d:[{kind:"field",key:"hass",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({attribute:!1})],key:"stateObj",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"overrideIcon",value:void 0},{kind:"field",decorators:[(0,Z.Cb)()],key:"overrideImage",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"stateColor",value:function(){return!1}},{kind:"field",decorators:[(0,Z.Cb)()],key:"color",value:void 0},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean,reflect:!0})],key:"icon",value:function(){return!0}},{kind:"field",decorators:[(0,Z.SB)()],key:"_iconStyle",value:function(){return{}}},{kind:"method",key:"connectedCallback",value:function(){var t,e;(0,k.Z)((0,_.Z)(i.prototype),"connectedCallback",this).call(this),this.hasUpdated&&void 0===this.overrideImage&&(null!==(t=this.stateObj)&&void 0!==t&&t.attributes.entity_picture||null!==(e=this.stateObj)&&void 0!==e&&e.attributes.entity_picture_local)&&this.requestUpdate("stateObj")}},{kind:"method",key:"disconnectedCallback",value:function(){var t,e;(0,k.Z)((0,_.Z)(i.prototype),"disconnectedCallback",this).call(this),void 0===this.overrideImage&&(null!==(t=this.stateObj)&&void 0!==t&&t.attributes.entity_picture||null!==(e=this.stateObj)&&void 0!==e&&e.attributes.entity_picture_local)&&(this.style.backgroundImage="")}},{kind:"get",key:"_stateColor",value:function(){var t=this.stateObj?(0,O.N)(this.stateObj):void 0;return this.stateColor||"light"===t&&!1!==this.stateColor}},{kind:"method",key:"render",value:function(){var t=this.stateObj;if(!t&&!this.overrideIcon&&!this.overrideImage)return(0,m.dy)(c||(c=(0,h.Z)(['<div class="missing"> <ha-svg-icon .path="','"></ha-svg-icon> </div>'])),"M13 14H11V9H13M13 18H11V16H13M1 21H23L12 2L1 21Z");if(!this.icon)return m.Ld;var e=t?(0,O.N)(t):void 0;return(0,m.dy)(l||(l=(0,h.Z)(['<ha-state-icon .hass="','" style="','" data-domain="','" data-state="','" .icon="','" .stateObj="','"></ha-state-icon>'])),this.hass,(0,C.V)(this._iconStyle),(0,w.o)(e),(0,w.o)(null==t?void 0:t.state),this.overrideIcon,t)}},{kind:"method",key:"willUpdate",value:function(t){if((0,k.Z)((0,_.Z)(i.prototype),"willUpdate",this).call(this,t),t.has("stateObj")||t.has("overrideImage")||t.has("overrideIcon")||t.has("stateColor")||t.has("color")){var e=this.stateObj,a={},o="";if(this.icon=!0,e&&void 0===this.overrideImage)if(!e.attributes.entity_picture_local&&!e.attributes.entity_picture||this.overrideIcon){if(this.color)a.color=this.color;else if(this._stateColor){var r=(0,I.Hh)(e);if(r&&(a.color=r),e.attributes.rgb_color&&(a.color="rgb(".concat(e.attributes.rgb_color.join(","),")")),e.attributes.brightness){var n=e.attributes.brightness;if("number"!=typeof n){var s="Type error: state-badge expected number, but type of ".concat(e.entity_id,".attributes.brightness is ").concat((0,d.Z)(n)," (").concat(n,")");console.warn(s)}a.filter=(0,I.I2)(e)}if(e.attributes.hvac_action){var c=e.attributes.hvac_action;c in H?a.color=(0,I.Hh)(e,H[c]):delete a.color}}}else{var l=e.attributes.entity_picture_local||e.attributes.entity_picture;this.hass&&(l=this.hass.hassUrl(l));var u=(0,j.M)(e.entity_id);"camera"===u&&(l=M(l,80,80)),o="url(".concat(l,")"),this.icon=!1,"update"===u?this.style.borderRadius="0":"media_player"===u&&(this.style.borderRadius="8%")}else if(this.overrideImage){var h=this.overrideImage;this.hass&&(h=this.hass.hassUrl(h)),o="url(".concat(h,")"),this.icon=!1}this._iconStyle=a,this.style.backgroundImage=o}}},{kind:"get",static:!0,key:"styles",value:function(){return[x,(0,m.iv)(u||(u=(0,h.Z)([":host{position:relative;display:inline-block;width:40px;color:var(--paper-item-icon-color,#44739e);border-radius:50%;height:40px;text-align:center;background-size:cover;line-height:40px;vertical-align:middle;box-sizing:border-box;--state-inactive-color:initial}:host(:focus){outline:0}:host(:not([icon]):focus){border:2px solid var(--divider-color)}:host([icon]:focus){background:var(--divider-color)}ha-state-icon{transition:color .3s ease-in-out,filter .3s ease-in-out}.missing{color:#fce588}"])))]}}]}}),m.oi));customElements.define("state-badge",A)},97315:function(t,e,i){i.d(e,{W:function(){return r},Z:function(){return n}});var a=i(46097),o=(i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(46349),i(70320),i(36655)),r=function(t){var e=t.attributes.entity_id||[],i=(0,a.Z)(new Set(e.map((function(t){return(0,o.M)(t)}))));return 1===i.length?i[0]:void 0},n=function(t,e,i,a,o){return t.connection.subscribeMessage(o,{type:"group/start_preview",flow_id:e,flow_type:i,user_input:a})}}}]);
+//# sourceMappingURL=4303.K8TzrL8SMMU.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4338],{9828:function(i,t,a){a.d(t,{i:function(){return k}});var e,o,n,r=a(33368),d=a(71650),l=a(68308),s=a(82390),c=a(69205),p=a(91808),h=a(34541),m=a(47838),u=a(88962),v=(a(97393),a(91989),a(87762)),g=a(91632),f=a(5095),_=a(95260),y=a(60625),x=(a(54371),["button","ha-list-item"]),k=function(i,t){var a;return(0,f.dy)(e||(e=(0,u.Z)([' <div class="header_title"> <span>','</span> <ha-icon-button .label="','" .path="','" dialogAction="close" class="header_button"></ha-icon-button> </div> '])),t,null!==(a=null==i?void 0:i.localize("ui.dialogs.generic.close"))&&void 0!==a?a:"Close","M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z")};(0,p.Z)([(0,_.Mo)("ha-dialog")],(function(i,t){var a=function(t){function a(){var t;(0,d.Z)(this,a);for(var e=arguments.length,o=new Array(e),n=0;n<e;n++)o[n]=arguments[n];return t=(0,l.Z)(this,a,[].concat(o)),i((0,s.Z)(t)),t}return(0,c.Z)(a,t),(0,r.Z)(a)}(t);return{F:a,d:[{kind:"field",key:y.gA,value:void 0},{kind:"method",key:"scrollToPos",value:function(i,t){var a;null===(a=this.contentElement)||void 0===a||a.scrollTo(i,t)}},{kind:"method",key:"renderHeading",value:function(){return(0,f.dy)(o||(o=(0,u.Z)(['<slot name="heading"> '," </slot>"])),(0,h.Z)((0,m.Z)(a.prototype),"renderHeading",this).call(this))}},{kind:"method",key:"firstUpdated",value:function(){var i;(0,h.Z)((0,m.Z)(a.prototype),"firstUpdated",this).call(this),this.suppressDefaultPressSelector=[this.suppressDefaultPressSelector,x].join(", "),this._updateScrolledAttribute(),null===(i=this.contentElement)||void 0===i||i.addEventListener("scroll",this._onScroll,{passive:!0})}},{kind:"method",key:"disconnectedCallback",value:function(){(0,h.Z)((0,m.Z)(a.prototype),"disconnectedCallback",this).call(this),this.contentElement.removeEventListener("scroll",this._onScroll)}},{kind:"field",key:"_onScroll",value:function(){var i=this;return function(){i._updateScrolledAttribute()}}},{kind:"method",key:"_updateScrolledAttribute",value:function(){this.contentElement&&this.toggleAttribute("scrolled",0!==this.contentElement.scrollTop)}},{kind:"field",static:!0,key:"styles",value:function(){return[g.W,(0,f.iv)(n||(n=(0,u.Z)([":host([scrolled]) ::slotted(ha-dialog-header){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.mdc-dialog{--mdc-dialog-scroll-divider-color:var(\n          --dialog-scroll-divider-color,\n          var(--divider-color)\n        );z-index:var(--dialog-z-index,8);-webkit-backdrop-filter:var(--dialog-backdrop-filter,none);backdrop-filter:var(--dialog-backdrop-filter,none);--mdc-dialog-box-shadow:var(--dialog-box-shadow, none);--mdc-typography-headline6-font-weight:400;--mdc-typography-headline6-font-size:1.574rem}.mdc-dialog__actions{justify-content:var(--justify-action-buttons,flex-end);padding-bottom:max(env(safe-area-inset-bottom),24px)}.mdc-dialog__actions span:first-child{flex:var(--secondary-action-button-flex,unset)}.mdc-dialog__actions span:nth-child(2){flex:var(--primary-action-button-flex,unset)}.mdc-dialog__container{align-items:var(--vertical-align-dialog,center)}.mdc-dialog__title{padding:24px 24px 0 24px}.mdc-dialog__actions{padding:12px 24px 12px 24px}.mdc-dialog__title::before{content:unset}.mdc-dialog .mdc-dialog__content{position:var(--dialog-content-position,relative);padding:var(--dialog-content-padding,24px)}:host([hideactions]) .mdc-dialog .mdc-dialog__content{padding-bottom:max(var(--dialog-content-padding,24px),env(safe-area-inset-bottom))}.mdc-dialog .mdc-dialog__surface{position:var(--dialog-surface-position,relative);top:var(--dialog-surface-top);margin-top:var(--dialog-surface-margin-top);min-height:var(--mdc-dialog-min-height,auto);border-radius:var(--ha-dialog-border-radius,28px)}:host([flexContent]) .mdc-dialog .mdc-dialog__content{display:flex;flex-direction:column}.header_title{position:relative;padding-right:40px;padding-inline-end:40px;padding-inline-start:initial;direction:var(--direction)}.header_title span{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;display:block}.header_button{position:absolute;right:-8px;top:-8px;text-decoration:none;color:inherit;inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}.dialog-actions{inset-inline-start:initial!important;inset-inline-end:0px!important;direction:var(--direction)}"])))]}}]}}),v.M)},44338:function(i,t,a){a.r(t);var e,o,n,r,d,l,s,c=a(88962),p=a(99312),h=a(81043),m=a(33368),u=a(71650),v=a(68308),g=a(82390),f=a(69205),_=a(91808),y=(a(97393),a(14271),a(5095)),x=a(95260),k=a(53180),b=a(10694),Z=a(18394);a(9828),a(37662),a(8942),(0,_.Z)([(0,x.Mo)("dialog-box")],(function(i,t){var a,_=function(t){function a(){var t;(0,u.Z)(this,a);for(var e=arguments.length,o=new Array(e),n=0;n<e;n++)o[n]=arguments[n];return t=(0,v.Z)(this,a,[].concat(o)),i((0,g.Z)(t)),t}return(0,f.Z)(a,t),(0,m.Z)(a)}(t);return{F:_,d:[{kind:"field",decorators:[(0,x.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,x.SB)()],key:"_params",value:void 0},{kind:"field",decorators:[(0,x.IO)("ha-textfield")],key:"_textField",value:void 0},{kind:"method",key:"showDialog",value:(a=(0,h.Z)((0,p.Z)().mark((function i(t){return(0,p.Z)().wrap((function(i){for(;;)switch(i.prev=i.next){case 0:this._params=t;case 1:case"end":return i.stop()}}),i,this)}))),function(i){return a.apply(this,arguments)})},{kind:"method",key:"closeDialog",value:function(){var i,t;return!(null!==(i=this._params)&&void 0!==i&&i.confirmation||null!==(t=this._params)&&void 0!==t&&t.prompt)&&(!this._params||(this._dismiss(),!0))}},{kind:"method",key:"render",value:function(){if(!this._params)return y.Ld;var i=this._params.confirmation||this._params.prompt;return(0,y.dy)(e||(e=(0,c.Z)([' <ha-dialog open ?scrimClickAction="','" ?escapeKeyAction="','" @closed="','" defaultAction="ignore" .heading="','"> <div> '," "," </div> ",' <mwc-button @click="','" ?dialogInitialFocus="','" slot="primaryAction" class="','"> '," </mwc-button> </ha-dialog> "])),i,i,this._dialogClosed,(0,y.dy)(o||(o=(0,c.Z)(["","",""])),this._params.warning?(0,y.dy)(n||(n=(0,c.Z)(['<ha-svg-icon .path="','" style="color:var(--warning-color)"></ha-svg-icon> '])),"M12,2L1,21H23M12,6L19.53,19H4.47M11,10V14H13V10M11,16V18H13V16"):"",this._params.title?this._params.title:this._params.confirmation&&this.hass.localize("ui.dialogs.generic.default_confirmation_title")),this._params.text?(0,y.dy)(r||(r=(0,c.Z)([' <p class="','"> '," </p> "])),this._params.prompt?"no-bottom-padding":"",this._params.text):"",this._params.prompt?(0,y.dy)(d||(d=(0,c.Z)([' <ha-textfield dialogInitialFocus value="','" .placeholder="','" .label="','" .type="','" .min="','" .max="','"></ha-textfield> '])),(0,b.o)(this._params.defaultValue),this._params.placeholder,this._params.inputLabel?this._params.inputLabel:"",this._params.inputType?this._params.inputType:"text",this._params.inputMin,this._params.inputMax):"",i&&(0,y.dy)(l||(l=(0,c.Z)([' <mwc-button @click="','" slot="secondaryAction"> '," </mwc-button> "])),this._dismiss,this._params.dismissText?this._params.dismissText:this.hass.localize("ui.dialogs.generic.cancel")),this._confirm,!this._params.prompt,(0,k.$)({destructive:this._params.destructive||!1}),this._params.confirmText?this._params.confirmText:this.hass.localize("ui.dialogs.generic.ok"))}},{kind:"method",key:"_dismiss",value:function(){var i;null!==(i=this._params)&&void 0!==i&&i.cancel&&this._params.cancel(),this._close()}},{kind:"method",key:"_confirm",value:function(){var i;this._params.confirm&&this._params.confirm(null===(i=this._textField)||void 0===i?void 0:i.value);this._close()}},{kind:"method",key:"_dialogClosed",value:function(i){"ignore"!==i.detail.action&&this._dismiss()}},{kind:"method",key:"_close",value:function(){this._params&&(this._params=void 0,(0,Z.B)(this,"dialog-closed",{dialog:this.localName}))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,y.iv)(s||(s=(0,c.Z)([":host([inert]){pointer-events:initial!important;cursor:initial!important}a{color:var(--primary-color)}p{margin:0;color:var(--primary-text-color)}.no-bottom-padding{padding-bottom:0}.secondary{color:var(--secondary-text-color)}.destructive{--mdc-theme-primary:var(--error-color)}ha-dialog{--dialog-z-index:104}@media all and (min-width:600px){ha-dialog{--mdc-dialog-min-width:400px}}ha-textfield{width:100%}"])))}}]}}),y.oi)}}]);
+//# sourceMappingURL=4338.Gdg6eHmvZuQ.js.map
\ No newline at end of file
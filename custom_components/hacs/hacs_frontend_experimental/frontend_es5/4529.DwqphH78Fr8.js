@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4529],{14529:function(e,t,i){i.r(t),i.d(t,{HaColorRGBSelector:function(){return h}});var n,d,l=i(88962),a=i(33368),r=i(71650),o=i(68308),f=i(82390),c=i(69205),s=i(91808),u=(i(97393),i(5095)),p=i(95260),x=i(4096),v=i(18394),h=(i(51520),(0,s.Z)([(0,p.Mo)("ha-selector-color_rgb")],(function(e,t){var i=function(t){function i(){var t;(0,r.Z)(this,i);for(var n=arguments.length,d=new Array(n),l=0;l<n;l++)d[l]=arguments[l];return t=(0,o.Z)(this,i,[].concat(d)),e((0,f.Z)(t)),t}return(0,c.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"method",key:"render",value:function(){return(0,u.dy)(n||(n=(0,l.Z)([' <ha-textfield type="color" helperPersistent .value="','" .label="','" .required="','" .helper="','" .disalbled="','" @change="','"></ha-textfield> '])),this.value?(0,x.CO)(this.value):"",this.label||"",this.required,this.helper,this.disabled,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){var t=e.target.value;(0,v.B)(this,"value-changed",{value:(0,x.wK)(t)})}},{kind:"field",static:!0,key:"styles",value:function(){return(0,u.iv)(d||(d=(0,l.Z)([":host{display:flex;justify-content:flex-end;align-items:center}ha-textfield{--text-field-padding:8px;min-width:75px;flex-grow:1;margin:0 4px}"])))}}]}}),u.oi))},51520:function(e,t,i){var n,d,l,a,r=i(88962),o=i(33368),f=i(71650),c=i(68308),s=i(82390),u=i(69205),p=i(91808),x=i(34541),v=i(47838),h=(i(97393),i(42977)),g=i(31338),m=i(5095),k=i(95260),b=i(67684);(0,p.Z)([(0,k.Mo)("ha-textfield")],(function(e,t){var i=function(t){function i(){var t;(0,f.Z)(this,i);for(var n=arguments.length,d=new Array(n),l=0;l<n;l++)d[l]=arguments[l];return t=(0,c.Z)(this,i,[].concat(d)),e((0,s.Z)(t)),t}return(0,u.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,k.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,x.Z)((0,v.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=t?"trailing":"leading";return(0,m.dy)(n||(n=(0,r.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),i,t?1:-1,i)}},{kind:"field",static:!0,key:"styles",value:function(){return[g.W,(0,m.iv)(d||(d=(0,r.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===b.E.document.dir?(0,m.iv)(l||(l=(0,r.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,m.iv)(a||(a=(0,r.Z)([""])))]}}]}}),h.P)}}]);
+//# sourceMappingURL=4529.DwqphH78Fr8.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 4779.e5-Ed0yczRo.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4779],{52996:function(t,e,r){r.d(e,{p:function(){return n}});r(40271),r(60163);var n=function(t,e){return t&&t.config.components.includes(e)}},18007:function(t,e,r){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}function i(){i=function(){return e};var t,e={},r=Object.prototype,o=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},l="function"==typeof Symbol?Symbol:{},c=l.iterator||"@@iterator",s=l.asyncIterator||"@@asyncIterator",d=l.toStringTag||"@@toStringTag";function u(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function h(t,e,r,n){var i=e&&e.prototype instanceof g?e:g,o=Object.create(i.prototype),l=new V(n||[]);return a(o,"_invoke",{value:H(t,r,l)}),o}function f(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=h;var v="suspendedStart",p="suspendedYield",m="executing",b="completed",y={};function g(){}function _(){}function w(){}var k={};u(k,c,(function(){return this}));var x=Object.getPrototypeOf,C=x&&x(x(j([])));C&&C!==r&&o.call(C,c)&&(k=C);var L=w.prototype=g.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function S(t,e){function r(i,a,l,c){var s=f(t[i],t,a);if("throw"!==s.type){var d=s.arg,u=d.value;return u&&"object"==n(u)&&o.call(u,"__await")?e.resolve(u.__await).then((function(t){r("next",t,l,c)}),(function(t){r("throw",t,l,c)})):e.resolve(u).then((function(t){d.value=t,l(d)}),(function(t){return r("throw",t,l,c)}))}c(s.arg)}var i;a(this,"_invoke",{value:function(t,n){function o(){return new e((function(e,i){r(t,n,e,i)}))}return i=i?i.then(o,o):o()}})}function H(e,r,n){var i=v;return function(o,a){if(i===m)throw new Error("Generator is already running");if(i===b){if("throw"===o)throw a;return{value:t,done:!0}}for(n.method=o,n.arg=a;;){var l=n.delegate;if(l){var c=A(l,n);if(c){if(c===y)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(i===v)throw i=b,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);i=m;var s=f(e,r,n);if("normal"===s.type){if(i=n.done?b:p,s.arg===y)continue;return{value:s.arg,done:n.done}}"throw"===s.type&&(i=b,n.method="throw",n.arg=s.arg)}}}function A(e,r){var n=r.method,i=e.iterator[n];if(i===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,A(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),y;var o=f(i,e.iterator,r.arg);if("throw"===o.type)return r.method="throw",r.arg=o.arg,r.delegate=null,y;var a=o.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,y):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,y)}function E(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function O(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function V(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(E,this),this.reset(!0)}function j(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function r(){for(;++i<e.length;)if(o.call(e,i))return r.value=e[i],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(n(e)+" is not iterable")}return _.prototype=w,a(L,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=u(w,d,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,u(t,d,"GeneratorFunction")),t.prototype=Object.create(L),t},e.awrap=function(t){return{__await:t}},Z(S.prototype),u(S.prototype,s,(function(){return this})),e.AsyncIterator=S,e.async=function(t,r,n,i,o){void 0===o&&(o=Promise);var a=new S(h(t,r,n,i),o);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=j,V.prototype={constructor:V,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(O),!e)for(var r in this)"t"===r.charAt(0)&&o.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,i){return l.type="throw",l.arg=e,r.next=n,i&&(r.method="next",r.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],l=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),s=o.call(a,"finallyLoc");if(c&&s){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&o.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var i=n;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,y):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),y},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),O(r),y}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var i=n.arg;O(r)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:j(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),y}},e}function o(t,e,r,n,i,o,a){try{var l=t[o](a),c=l.value}catch(s){return void r(s)}l.done?e(c):Promise.resolve(c).then(n,i)}r.a(t,function(){var t,n=(t=i().mark((function t(n,o){var a,l,c,s,d,u;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,r.d(e,{Bt:function(){return u}}),r(40271),r(56308),a=r(22075),l=r(35137),c=r(23216),!(s=n([c])).then){t.next=17;break}return t.next=13,s;case 13:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=18;break;case 17:t.t0=s;case 18:c=t.t0[0],d=["sunday","monday","tuesday","wednesday","thursday","friday","saturday"],u=function(t){return t.first_weekday===l.FS.language?"weekInfo"in Intl.Locale.prototype?new Intl.Locale(t.language).weekInfo.firstDay%7:(0,a.L)(t.language)%7:d.includes(t.first_weekday)?d.indexOf(t.first_weekday):1},o(),t.next=28;break;case 25:t.prev=25,t.t2=t.catch(0),o(t.t2);case 28:case"end":return t.stop()}}),t,null,[[0,25]])})),function(){var e=this,r=arguments;return new Promise((function(n,i){var a=t.apply(e,r);function l(t){o(a,n,i,l,c,"next",t)}function c(t){o(a,n,i,l,c,"throw",t)}l(void 0)}))});return function(t,e){return n.apply(this,arguments)}}())},76950:function(t,e,r){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}function i(){i=function(){return e};var t,e={},r=Object.prototype,o=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},l="function"==typeof Symbol?Symbol:{},c=l.iterator||"@@iterator",s=l.asyncIterator||"@@asyncIterator",d=l.toStringTag||"@@toStringTag";function u(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function h(t,e,r,n){var i=e&&e.prototype instanceof g?e:g,o=Object.create(i.prototype),l=new V(n||[]);return a(o,"_invoke",{value:H(t,r,l)}),o}function f(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=h;var v="suspendedStart",p="suspendedYield",m="executing",b="completed",y={};function g(){}function _(){}function w(){}var k={};u(k,c,(function(){return this}));var x=Object.getPrototypeOf,C=x&&x(x(j([])));C&&C!==r&&o.call(C,c)&&(k=C);var L=w.prototype=g.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function S(t,e){function r(i,a,l,c){var s=f(t[i],t,a);if("throw"!==s.type){var d=s.arg,u=d.value;return u&&"object"==n(u)&&o.call(u,"__await")?e.resolve(u.__await).then((function(t){r("next",t,l,c)}),(function(t){r("throw",t,l,c)})):e.resolve(u).then((function(t){d.value=t,l(d)}),(function(t){return r("throw",t,l,c)}))}c(s.arg)}var i;a(this,"_invoke",{value:function(t,n){function o(){return new e((function(e,i){r(t,n,e,i)}))}return i=i?i.then(o,o):o()}})}function H(e,r,n){var i=v;return function(o,a){if(i===m)throw new Error("Generator is already running");if(i===b){if("throw"===o)throw a;return{value:t,done:!0}}for(n.method=o,n.arg=a;;){var l=n.delegate;if(l){var c=A(l,n);if(c){if(c===y)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(i===v)throw i=b,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);i=m;var s=f(e,r,n);if("normal"===s.type){if(i=n.done?b:p,s.arg===y)continue;return{value:s.arg,done:n.done}}"throw"===s.type&&(i=b,n.method="throw",n.arg=s.arg)}}}function A(e,r){var n=r.method,i=e.iterator[n];if(i===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,A(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),y;var o=f(i,e.iterator,r.arg);if("throw"===o.type)return r.method="throw",r.arg=o.arg,r.delegate=null,y;var a=o.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,y):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,y)}function E(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function O(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function V(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(E,this),this.reset(!0)}function j(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function r(){for(;++i<e.length;)if(o.call(e,i))return r.value=e[i],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(n(e)+" is not iterable")}return _.prototype=w,a(L,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=u(w,d,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,u(t,d,"GeneratorFunction")),t.prototype=Object.create(L),t},e.awrap=function(t){return{__await:t}},Z(S.prototype),u(S.prototype,s,(function(){return this})),e.AsyncIterator=S,e.async=function(t,r,n,i,o){void 0===o&&(o=Promise);var a=new S(h(t,r,n,i),o);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=j,V.prototype={constructor:V,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(O),!e)for(var r in this)"t"===r.charAt(0)&&o.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,i){return l.type="throw",l.arg=e,r.next=n,i&&(r.method="next",r.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],l=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),s=o.call(a,"finallyLoc");if(c&&s){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&o.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var i=n;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,y):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),y},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),O(r),y}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var i=n.arg;O(r)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:j(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),y}},e}function o(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,i,o,a,l=[],c=!0,s=!1;try{if(o=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;c=!1}else for(;!(c=(n=o.call(r)).done)&&(l.push(n.value),l.length!==e);c=!0);}catch(t){s=!0,i=t}finally{try{if(!c&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(s)throw i}}return l}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);"Object"===r&&t.constructor&&(r=t.constructor.name);if("Map"===r||"Set"===r)return Array.from(t);if("Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}function l(t,e,r,n,i,o,a){try{var l=t[o](a),c=l.value}catch(s){return void r(s)}l.done?e(c):Promise.resolve(c).then(n,i)}r.a(t,function(){var t,n=(t=i().mark((function t(n,a){var l,c,s,d,u,h,f,v;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,r.d(e,{G:function(){return v}}),l=r(14516),c=r(23216),s=r(94844),!(d=n([c,s])).then){t.next=13;break}return t.next=9,d;case 9:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=14;break;case 13:t.t0=d;case 14:u=t.t0,h=o(u,2),c=h[0],s=h[1],f=(0,l.Z)((function(t){return new Intl.RelativeTimeFormat(t.language,{numeric:"auto"})})),v=function(t,e,r){var n=!(arguments.length>3&&void 0!==arguments[3])||arguments[3],i=(0,s.W)(t,r,e);return n?f(e).format(i.value,i.unit):Intl.NumberFormat(e.language,{style:"unit",unit:i.unit,unitDisplay:"long"}).format(Math.abs(i.value))},a(),t.next=26;break;case 23:t.prev=23,t.t2=t.catch(0),a(t.t2);case 26:case"end":return t.stop()}}),t,null,[[0,23]])})),function(){var e=this,r=arguments;return new Promise((function(n,i){var o=t.apply(e,r);function a(t){l(o,n,i,a,c,"next",t)}function c(t){l(o,n,i,a,c,"throw",t)}a(void 0)}))});return function(t,e){return n.apply(this,arguments)}}())},3747:function(t,e,r){r.d(e,{t:function(){return l}});var n=r(71650),i=r(33368),o=(r(65974),r(10185),r(46798),r(9849),r(50289),r(94167),r(36513),r(56308),r(41353),r(88770),r(85717),function(){function t(){var e=this,r=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window.localStorage;(0,n.Z)(this,t),this.storage=void 0,this._storage={},this._listeners={},this.storage=r,r===window.localStorage&&window.addEventListener("storage",(function(t){t.key&&e.hasKey(t.key)&&(e._storage[t.key]=t.newValue?JSON.parse(t.newValue):t.newValue,e._listeners[t.key]&&e._listeners[t.key].forEach((function(r){return r(t.oldValue?JSON.parse(t.oldValue):t.oldValue,e._storage[t.key])})))}))}return(0,i.Z)(t,[{key:"addFromStorage",value:function(t){if(!this._storage[t]){var e=this.storage.getItem(t);e&&(this._storage[t]=JSON.parse(e))}}},{key:"subscribeChanges",value:function(t,e){var r=this;return this._listeners[t]?this._listeners[t].push(e):this._listeners[t]=[e],function(){r.unsubscribeChanges(t,e)}}},{key:"unsubscribeChanges",value:function(t,e){if(t in this._listeners){var r=this._listeners[t].indexOf(e);-1!==r&&this._listeners[t].splice(r,1)}}},{key:"hasKey",value:function(t){return t in this._storage}},{key:"getValue",value:function(t){return this._storage[t]}},{key:"setValue",value:function(t,e){var r=this._storage[t];this._storage[t]=e;try{void 0===e?this.storage.removeItem(t):this.storage.setItem(t,JSON.stringify(e))}catch(n){}finally{this._listeners[t]&&this._listeners[t].forEach((function(t){return t(r,e)}))}}}]),t}()),a={},l=function(t){return function(e){var r,n=t.storage||"localStorage";n&&n in a?r=a[n]:(r=new o(window[n]),a[n]=r);var i=String(e.key),l=t.key||String(e.key),c=e.initializer?e.initializer():void 0;r.addFromStorage(l);var s=!1!==t.subscribe?function(t){return r.subscribeChanges(l,(function(r,n){t.requestUpdate(e.key,r)}))}:void 0,d=function(){return r.hasKey(l)?r.getValue(l):c};return{kind:"method",placement:"prototype",key:e.key,descriptor:{set:function(n){!function(n,i){var o;t.state&&(o=d()),r.setValue(l,i),t.state&&n.requestUpdate(e.key,o)}(this,n)},get:function(){return d()},enumerable:!0,configurable:!0},finisher:function(r){if(t.state&&t.subscribe){var n=r.prototype.connectedCallback,o=r.prototype.disconnectedCallback;r.prototype.connectedCallback=function(){n.call(this),this["__unbsubLocalStorage".concat(i)]=null==s?void 0:s(this)},r.prototype.disconnectedCallback=function(){var t;o.call(this),null===(t=this["__unbsubLocalStorage".concat(i)])||void 0===t||t.call(this),this["__unbsubLocalStorage".concat(i)]=void 0}}t.state&&r.createProperty(e.key,Object.assign({noAccessor:!0},t.stateOptions))}}}}},94844:function(t,e,r){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}function i(){i=function(){return e};var t,e={},r=Object.prototype,o=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},l="function"==typeof Symbol?Symbol:{},c=l.iterator||"@@iterator",s=l.asyncIterator||"@@asyncIterator",d=l.toStringTag||"@@toStringTag";function u(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function h(t,e,r,n){var i=e&&e.prototype instanceof g?e:g,o=Object.create(i.prototype),l=new V(n||[]);return a(o,"_invoke",{value:H(t,r,l)}),o}function f(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=h;var v="suspendedStart",p="suspendedYield",m="executing",b="completed",y={};function g(){}function _(){}function w(){}var k={};u(k,c,(function(){return this}));var x=Object.getPrototypeOf,C=x&&x(x(j([])));C&&C!==r&&o.call(C,c)&&(k=C);var L=w.prototype=g.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function S(t,e){function r(i,a,l,c){var s=f(t[i],t,a);if("throw"!==s.type){var d=s.arg,u=d.value;return u&&"object"==n(u)&&o.call(u,"__await")?e.resolve(u.__await).then((function(t){r("next",t,l,c)}),(function(t){r("throw",t,l,c)})):e.resolve(u).then((function(t){d.value=t,l(d)}),(function(t){return r("throw",t,l,c)}))}c(s.arg)}var i;a(this,"_invoke",{value:function(t,n){function o(){return new e((function(e,i){r(t,n,e,i)}))}return i=i?i.then(o,o):o()}})}function H(e,r,n){var i=v;return function(o,a){if(i===m)throw new Error("Generator is already running");if(i===b){if("throw"===o)throw a;return{value:t,done:!0}}for(n.method=o,n.arg=a;;){var l=n.delegate;if(l){var c=A(l,n);if(c){if(c===y)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(i===v)throw i=b,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);i=m;var s=f(e,r,n);if("normal"===s.type){if(i=n.done?b:p,s.arg===y)continue;return{value:s.arg,done:n.done}}"throw"===s.type&&(i=b,n.method="throw",n.arg=s.arg)}}}function A(e,r){var n=r.method,i=e.iterator[n];if(i===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,A(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),y;var o=f(i,e.iterator,r.arg);if("throw"===o.type)return r.method="throw",r.arg=o.arg,r.delegate=null,y;var a=o.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,y):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,y)}function E(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function O(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function V(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(E,this),this.reset(!0)}function j(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function r(){for(;++i<e.length;)if(o.call(e,i))return r.value=e[i],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(n(e)+" is not iterable")}return _.prototype=w,a(L,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=u(w,d,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,u(t,d,"GeneratorFunction")),t.prototype=Object.create(L),t},e.awrap=function(t){return{__await:t}},Z(S.prototype),u(S.prototype,s,(function(){return this})),e.AsyncIterator=S,e.async=function(t,r,n,i,o){void 0===o&&(o=Promise);var a=new S(h(t,r,n,i),o);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=j,V.prototype={constructor:V,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(O),!e)for(var r in this)"t"===r.charAt(0)&&o.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,i){return l.type="throw",l.arg=e,r.next=n,i&&(r.method="next",r.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],l=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),s=o.call(a,"finallyLoc");if(c&&s){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&o.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var i=n;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,y):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),y},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),O(r),y}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var i=n.arg;O(r)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:j(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),y}},e}function o(t,e,r,n,i,o,a){try{var l=t[o](a),c=l.value}catch(s){return void r(s)}l.done?e(c):Promise.resolve(c).then(n,i)}r.a(t,function(){var t,n=(t=i().mark((function t(n,o){var a,l,c,s,d,u,h,f,v,p;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,v=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Date.now(),r=arguments.length>2?arguments[2]:void 0,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},i=Object.assign(Object.assign({},p),n||{}),o=(+t-+e)/u;if(Math.abs(o)<i.second)return{value:Math.round(o),unit:"second"};var d=o/h;if(Math.abs(d)<i.minute)return{value:Math.round(d),unit:"minute"};var v=o/f;if(Math.abs(v)<i.hour)return{value:Math.round(v),unit:"hour"};var m=new Date(t),b=new Date(e);m.setHours(0,0,0,0),b.setHours(0,0,0,0);var y=(0,a.Z)(m,b);if(0===y)return{value:Math.round(v),unit:"hour"};if(Math.abs(y)<i.day)return{value:y,unit:"day"};var g=(0,s.Bt)(r),_=(0,l.Z)(m,{weekStartsOn:g}),w=(0,l.Z)(b,{weekStartsOn:g}),k=(0,c.Z)(_,w);if(0===k)return{value:y,unit:"day"};if(Math.abs(k)<i.week)return{value:k,unit:"week"};var x=m.getFullYear()-b.getFullYear(),C=12*x+m.getMonth()-b.getMonth();return 0===C?{value:k,unit:"week"}:Math.abs(C)<i.month||0===x?{value:C,unit:"month"}:{value:Math.round(x),unit:"year"}},r.d(e,{W:function(){return v}}),r(85717),a=r(62308),l=r(59401),c=r(27296),s=r(18007),!(d=n([s])).then){t.next=17;break}return t.next=13,d;case 13:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=18;break;case 17:t.t0=d;case 18:s=t.t0[0],u=1e3,f=60*(h=60),p={second:45,minute:45,hour:22,day:5,week:4,month:11},o(),t.next=29;break;case 26:t.prev=26,t.t2=t.catch(0),o(t.t2);case 29:case"end":return t.stop()}}),t,null,[[0,26]])})),function(){var e=this,r=arguments;return new Promise((function(n,i){var a=t.apply(e,r);function l(t){o(a,n,i,l,c,"next",t)}function c(t){o(a,n,i,l,c,"throw",t)}l(void 0)}))});return function(t,e){return n.apply(this,arguments)}}())},74376:function(t,e,r){var n,i=r(88962),o=r(33368),a=r(71650),l=r(68308),c=r(82390),s=r(69205),d=r(91808),u=(r(97393),r(58417)),h=r(39274),f=r(5095),v=r(95260);(0,d.Z)([(0,v.Mo)("ha-checkbox")],(function(t,e){var r=function(e){function r(){var e;(0,a.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,l.Z)(this,r,[].concat(i)),t((0,c.Z)(e)),e}return(0,s.Z)(r,e),(0,o.Z)(r)}(e);return{F:r,d:[{kind:"field",static:!0,key:"styles",value:function(){return[h.W,(0,f.iv)(n||(n=(0,i.Z)([":host{--mdc-theme-secondary:var(--primary-color)}"])))]}}]}}),u.A)},51520:function(t,e,r){var n,i,o,a,l=r(88962),c=r(33368),s=r(71650),d=r(68308),u=r(82390),h=r(69205),f=r(91808),v=r(34541),p=r(47838),m=(r(97393),r(42977)),b=r(31338),y=r(5095),g=r(95260),_=r(67684);(0,f.Z)([(0,g.Mo)("ha-textfield")],(function(t,e){var r=function(e){function r(){var e;(0,s.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,d.Z)(this,r,[].concat(i)),t((0,u.Z)(e)),e}return(0,h.Z)(r,e),(0,c.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,g.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,g.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,g.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(t){(0,v.Z)((0,p.Z)(r.prototype),"updated",this).call(this,t),(t.has("invalid")&&(this.invalid||void 0!==t.get("invalid"))||t.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),t.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),t.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),t.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]&&arguments[1],r=e?"trailing":"leading";return(0,y.dy)(n||(n=(0,l.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),r,e?1:-1,r)}},{kind:"field",static:!0,key:"styles",value:function(){return[b.W,(0,y.iv)(i||(i=(0,l.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===_.E.document.dir?(0,y.iv)(o||(o=(0,l.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,y.iv)(a||(a=(0,l.Z)([""])))]}}]}}),m.P)},43910:function(t,e,r){var n,i,o,a=r(99312),l=r(81043),c=r(88962),s=r(33368),d=r(71650),u=r(68308),h=r(82390),f=r(69205),v=r(91808),p=(r(97393),r(87438),r(46798),r(9849),r(22890),r(5095)),m=r(95260),b=(r(54371),r(37662),r(51520),r(18394));(0,v.Z)([(0,m.Mo)("search-input")],(function(t,e){var r,v,y,g=function(e){function r(){var e;(0,d.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,u.Z)(this,r,[].concat(i)),t((0,h.Z)(e)),e}return(0,f.Z)(r,e),(0,s.Z)(r)}(e);return{F:g,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"filter",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"suffix",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"autofocus",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({type:String})],key:"label",value:void 0},{kind:"method",key:"focus",value:function(){var t;null===(t=this._input)||void 0===t||t.focus()}},{kind:"field",decorators:[(0,m.IO)("ha-textfield",!0)],key:"_input",value:void 0},{kind:"method",key:"render",value:function(){return(0,p.dy)(n||(n=(0,c.Z)([' <ha-textfield .autofocus="','" .label="','" .value="','" icon .iconTrailing="','" @input="','"> <slot name="prefix" slot="leadingIcon"> <ha-svg-icon tabindex="-1" class="prefix" .path="','"></ha-svg-icon> </slot> <div class="trailing" slot="trailingIcon"> ',' <slot name="suffix"></slot> </div> </ha-textfield> '])),this.autofocus,this.label||this.hass.localize("ui.common.search"),this.filter||"",this.filter||this.suffix,this._filterInputChanged,"M9.5,3A6.5,6.5 0 0,1 16,9.5C16,11.11 15.41,12.59 14.44,13.73L14.71,14H15.5L20.5,19L19,20.5L14,15.5V14.71L13.73,14.44C12.59,15.41 11.11,16 9.5,16A6.5,6.5 0 0,1 3,9.5A6.5,6.5 0 0,1 9.5,3M9.5,5C7,5 5,7 5,9.5C5,12 7,14 9.5,14C12,14 14,12 14,9.5C14,7 12,5 9.5,5Z",this.filter&&(0,p.dy)(i||(i=(0,c.Z)([' <ha-icon-button @click="','" .label="','" .path="','" class="clear-button"></ha-icon-button> '])),this._clearSearch,this.hass.localize("ui.common.clear"),"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"))}},{kind:"method",key:"_filterChanged",value:(y=(0,l.Z)((0,a.Z)().mark((function t(e){return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:(0,b.B)(this,"value-changed",{value:String(e)});case 1:case"end":return t.stop()}}),t,this)}))),function(t){return y.apply(this,arguments)})},{kind:"method",key:"_filterInputChanged",value:(v=(0,l.Z)((0,a.Z)().mark((function t(e){return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:this._filterChanged(e.target.value);case 1:case"end":return t.stop()}}),t,this)}))),function(t){return v.apply(this,arguments)})},{kind:"method",key:"_clearSearch",value:(r=(0,l.Z)((0,a.Z)().mark((function t(){return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:this._filterChanged("");case 1:case"end":return t.stop()}}),t,this)}))),function(){return r.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,p.iv)(o||(o=(0,c.Z)([":host{display:inline-flex}ha-icon-button,ha-svg-icon{color:var(--primary-text-color)}ha-svg-icon{outline:0}.clear-button{--mdc-icon-size:20px}ha-textfield{display:inherit}.trailing{display:flex;align-items:center}"])))}}]}}),p.oi)},96710:function(t,e,r){var n,i,o,a,l,c,s,d,u,h,f,v,p,m,b,y,g,_,w,k,x,C,L,Z,S,H,A,E,O,V,j,F,M,R,P,T,z,B,D,N,I,G=r(88962),W=r(33368),Y=r(71650),U=r(68308),q=r(82390),K=r(69205),$=r(91808),J=(r(97393),r(76843),r(91989),r(87438),r(46798),r(9849),r(22890),r(14271),r(33829),r(5095)),X=r(95260),Q=r(18394),tt=r(51750),et=r(99312),rt=r(81043),nt=r(93359),it=r(62746),ot=r(46097),at=r(34541),lt=r(47838),ct=(r(13526),r(10733),r(50289),r(94167),r(46349),r(70320),r(82073),r(40271),r(60163),r(51358),r(47084),r(5239),r(98490),r(36513),r(3239)),st=r(53180),dt=r(10694),ut=r(86634),ht=r(14516),ft=r(47715),vt=r(72218),pt=r(2537),mt=r(29950),bt=r(62782),yt=(r(74376),r(37662),r(43910),r(31528),r(7695),r(44758),r(80354),r(68630),r(93217)),gt=function(){return n||(n=(0,yt.Ud)(new Worker(new URL(r.p+r.u(8456),r.b)))),n},_t=function(t,e,r,n,i){return gt().sortData(t,e,r,n,i)},wt=((0,$.Z)([(0,X.Mo)("ha-data-table")],(function(t,e){var r,n,b=function(e){function r(){var e;(0,Y.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,U.Z)(this,r,[].concat(i)),t((0,q.Z)(e)),e}return(0,K.Z)(r,e),(0,W.Z)(r)}(e);return{F:b,d:[{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Object})],key:"columns",value:function(){return{}}},{kind:"field",decorators:[(0,X.Cb)({type:Array})],key:"data",value:function(){return[]}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"selectable",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"clickable",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"hasFab",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"appendRow",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,attribute:"auto-height"})],key:"autoHeight",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"id",value:function(){return"id"}},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"noDataText",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"searchLabel",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,attribute:"no-label-float"})],key:"noLabelFloat",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"filter",value:function(){return""}},{kind:"field",decorators:[(0,X.SB)()],key:"_filterable",value:function(){return!1}},{kind:"field",decorators:[(0,X.SB)()],key:"_filter",value:function(){return""}},{kind:"field",decorators:[(0,X.SB)()],key:"_sortColumn",value:void 0},{kind:"field",decorators:[(0,X.SB)()],key:"_sortDirection",value:function(){return null}},{kind:"field",decorators:[(0,X.SB)()],key:"_filteredData",value:function(){return[]}},{kind:"field",decorators:[(0,X.SB)()],key:"_headerHeight",value:function(){return 0}},{kind:"field",decorators:[(0,X.IO)("slot[name='header']")],key:"_header",value:void 0},{kind:"field",decorators:[(0,X.SB)()],key:"_items",value:function(){return[]}},{kind:"field",key:"_checkableRowsCount",value:void 0},{kind:"field",key:"_checkedRows",value:function(){return[]}},{kind:"field",key:"_sortColumns",value:function(){return{}}},{kind:"field",key:"curRequest",value:function(){return 0}},{kind:"field",decorators:[(0,ft.i)(".scroller")],key:"_savedScrollPos",value:void 0},{kind:"field",key:"_debounceSearch",value:function(){var t=this;return(0,vt.D)((function(e){t._filter=e}),100,!1)}},{kind:"method",key:"clearSelection",value:function(){this._checkedRows=[],this._checkedRowsChanged()}},{kind:"method",key:"connectedCallback",value:function(){(0,at.Z)((0,lt.Z)(b.prototype),"connectedCallback",this).call(this),this._items.length&&(this._items=(0,ot.Z)(this._items))}},{kind:"method",key:"firstUpdated",value:function(){var t=this;this.updateComplete.then((function(){return t._calcTableHeight()}))}},{kind:"method",key:"willUpdate",value:function(t){if((0,at.Z)((0,lt.Z)(b.prototype),"willUpdate",this).call(this,t),this.hasUpdated||(0,bt.o)(),t.has("columns")){for(var e in this._filterable=Object.values(this.columns).some((function(t){return t.filterable})),this.columns)if(this.columns[e].direction){this._sortDirection=this.columns[e].direction,this._sortColumn=e;break}var r=(0,ct.Z)(this.columns);Object.values(r).forEach((function(t){delete t.title,delete t.template})),this._sortColumns=r}t.has("filter")&&this._debounceSearch(this.filter),t.has("data")&&(this._checkableRowsCount=this.data.filter((function(t){return!1!==t.selectable})).length),(t.has("data")||t.has("columns")||t.has("_filter")||t.has("_sortColumn")||t.has("_sortDirection"))&&this._sortFilterData()}},{kind:"method",key:"render",value:function(){var t=this;return(0,J.dy)(i||(i=(0,G.Z)([' <div class="mdc-data-table"> <slot name="header" @slotchange="','"> ',' </slot> <div class="mdc-data-table__table ','" role="table" aria-rowcount="','" style="','"> <div class="mdc-data-table__header-row" role="row" aria-rowindex="1"> '," "," </div> "," </div> </div> "])),this._calcTableHeight,this._filterable?(0,J.dy)(o||(o=(0,G.Z)([' <div class="table-header"> <search-input .hass="','" @value-changed="','" .label="','" .noLabelFloat="','"></search-input> </div> '])),this.hass,this._handleSearchChange,this.searchLabel,this.noLabelFloat):"",(0,st.$)({"auto-height":this.autoHeight}),this._filteredData.length+1,(0,ut.V)({height:this.autoHeight?"".concat(53*(this._filteredData.length||1)+53,"px"):"calc(100% - ".concat(this._headerHeight,"px)")}),this.selectable?(0,J.dy)(a||(a=(0,G.Z)([' <div class="mdc-data-table__header-cell mdc-data-table__header-cell--checkbox" role="columnheader"> <ha-checkbox class="mdc-data-table__row-checkbox" @change="','" .indeterminate="','" .checked="','"> </ha-checkbox> </div> '])),this._handleHeaderRowCheckboxClick,this._checkedRows.length&&this._checkedRows.length!==this._checkableRowsCount,this._checkedRows.length&&this._checkedRows.length===this._checkableRowsCount):"",Object.entries(this.columns).map((function(e){var r=(0,it.Z)(e,2),n=r[0],i=r[1];if(i.hidden)return"";var o=n===t._sortColumn,a={"mdc-data-table__header-cell--numeric":"numeric"===i.type,"mdc-data-table__header-cell--icon":"icon"===i.type,"mdc-data-table__header-cell--icon-button":"icon-button"===i.type,"mdc-data-table__header-cell--overflow-menu":"overflow-menu"===i.type,sortable:Boolean(i.sortable),"not-sorted":Boolean(i.sortable&&!o),grows:Boolean(i.grows)};return(0,J.dy)(l||(l=(0,G.Z)([' <div aria-label="','" class="mdc-data-table__header-cell ','" style="','" role="columnheader" aria-sort="','" @click="','" .columnId="','"> '," <span>","</span> </div> "])),(0,dt.o)(i.label),(0,st.$)(a),i.width?(0,ut.V)((0,nt.Z)((0,nt.Z)({},i.grows?"minWidth":"width",i.width),"maxWidth",i.maxWidth||"")):"",(0,dt.o)(o?"desc"===t._sortDirection?"descending":"ascending":void 0),t._handleHeaderClick,n,i.sortable?(0,J.dy)(c||(c=(0,G.Z)([' <ha-svg-icon .path="','"></ha-svg-icon> '])),o&&"desc"===t._sortDirection?"M11,4H13V16L18.5,10.5L19.92,11.92L12,19.84L4.08,11.92L5.5,10.5L11,16V4Z":"M13,20H11V8L5.5,13.5L4.08,12.08L12,4.16L19.92,12.08L18.5,13.5L13,8V20Z"):"",i.title)})),this._filteredData.length?(0,J.dy)(d||(d=(0,G.Z)([' <lit-virtualizer scroller class="mdc-data-table__content scroller ha-scrollbar" @scroll="','" .items="','" .keyFunction="','" .renderItem="','"></lit-virtualizer> '])),this._saveScrollPos,this._items,this._keyFunction,this._renderRow):(0,J.dy)(s||(s=(0,G.Z)([' <div class="mdc-data-table__content"> <div class="mdc-data-table__row" role="row"> <div class="mdc-data-table__cell grows center" role="cell"> '," </div> </div> </div> "])),this.noDataText||this.hass.localize("ui.components.data-table.no-data")))}},{kind:"field",key:"_keyFunction",value:function(){var t=this;return function(e){return e[t.id]||e}}},{kind:"field",key:"_renderRow",value:function(){var t=this;return function(e,r){return e?e.append?(0,J.dy)(u||(u=(0,G.Z)(['<div class="mdc-data-table__row">',"</div>"])),e.content):e.empty?(0,J.dy)(h||(h=(0,G.Z)(['<div class="mdc-data-table__row"></div>']))):(0,J.dy)(f||(f=(0,G.Z)([' <div aria-rowindex="','" role="row" .rowId="','" @click="','" class="mdc-data-table__row ','" aria-selected="','" .selectable="','"> '," "," </div> "])),r+2,e[t.id],t._handleRowClick,(0,st.$)({"mdc-data-table__row--selected":t._checkedRows.includes(String(e[t.id])),clickable:t.clickable}),(0,dt.o)(!!t._checkedRows.includes(String(e[t.id]))||void 0),!1!==e.selectable,t.selectable?(0,J.dy)(v||(v=(0,G.Z)([' <div class="mdc-data-table__cell mdc-data-table__cell--checkbox" role="cell"> <ha-checkbox class="mdc-data-table__row-checkbox" @change="','" .rowId="','" .disabled="','" .checked="','"> </ha-checkbox> </div> '])),t._handleRowCheckboxClick,e[t.id],!1===e.selectable,t._checkedRows.includes(String(e[t.id]))):"",Object.entries(t.columns).map((function(t){var r=(0,it.Z)(t,2),n=r[0],i=r[1];return i.hidden?"":(0,J.dy)(p||(p=(0,G.Z)([' <div role="','" class="mdc-data-table__cell ','" style="','"> '," </div> "])),i.main?"rowheader":"cell",(0,st.$)({"mdc-data-table__cell--flex":"flex"===i.type,"mdc-data-table__cell--numeric":"numeric"===i.type,"mdc-data-table__cell--icon":"icon"===i.type,"mdc-data-table__cell--icon-button":"icon-button"===i.type,"mdc-data-table__cell--overflow-menu":"overflow-menu"===i.type,grows:Boolean(i.grows),forceLTR:Boolean(i.forceLTR)}),i.width?(0,ut.V)((0,nt.Z)((0,nt.Z)({},i.grows?"minWidth":"width",i.width),"maxWidth",i.maxWidth?i.maxWidth:"")):"",i.template?i.template(e):e[n])}))):J.Ld}}},{kind:"method",key:"_sortFilterData",value:(n=(0,rt.Z)((0,et.Z)().mark((function t(){var e,r,n,i,o,a,l,c,s,d;return(0,et.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(e=(new Date).getTime(),this.curRequest++,r=this.curRequest,n=this.data,!this._filter){t.next=8;break}return t.next=7,this._memFilterData(this.data,this._sortColumns,this._filter);case 7:n=t.sent;case 8:return i=this._sortColumn?_t(n,this._sortColumns[this._sortColumn],this._sortDirection,this._sortColumn,this.hass.locale.language):n,t.next=11,Promise.all([i,pt.y]);case 11:if(o=t.sent,a=(0,it.Z)(o,1),l=a[0],c=(new Date).getTime(),!((s=c-e)<100)){t.next=19;break}return t.next=19,new Promise((function(t){setTimeout(t,100-s)}));case 19:if(this.curRequest===r){t.next=21;break}return t.abrupt("return");case 21:this.appendRow||this.hasFab?(d=(0,ot.Z)(l),this.appendRow&&d.push({append:!0,content:this.appendRow}),this.hasFab&&d.push({empty:!0}),this._items=d):this._items=l,this._filteredData=l;case 23:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"field",key:"_memFilterData",value:function(){return(0,ht.Z)((function(t,e,r){return function(t,e,r){return gt().filterData(t,e,r)}(t,e,r)}))}},{kind:"method",key:"_handleHeaderClick",value:function(t){var e=t.currentTarget.columnId;this.columns[e].sortable&&(this._sortDirection&&this._sortColumn===e?"asc"===this._sortDirection?this._sortDirection="desc":this._sortDirection=null:this._sortDirection="asc",this._sortColumn=null===this._sortDirection?void 0:e,(0,Q.B)(this,"sorting-changed",{column:e,direction:this._sortDirection}))}},{kind:"method",key:"_handleHeaderRowCheckboxClick",value:function(t){var e=this;t.target.checked?(this._checkedRows=this._filteredData.filter((function(t){return!1!==t.selectable})).map((function(t){return t[e.id]})),this._checkedRowsChanged()):(this._checkedRows=[],this._checkedRowsChanged())}},{kind:"field",key:"_handleRowCheckboxClick",value:function(){var t=this;return function(e){var r=e.currentTarget,n=r.rowId;if(r.checked){if(t._checkedRows.includes(n))return;t._checkedRows=[].concat((0,ot.Z)(t._checkedRows),[n])}else t._checkedRows=t._checkedRows.filter((function(t){return t!==n}));t._checkedRowsChanged()}}},{kind:"field",key:"_handleRowClick",value:function(){var t=this;return function(e){var r=e.target;if(!["HA-CHECKBOX","MWC-BUTTON"].includes(r.tagName)){var n=e.currentTarget.rowId;(0,Q.B)(t,"row-click",{id:n},{bubbles:!1})}}}},{kind:"method",key:"_checkedRowsChanged",value:function(){this._items.length&&(this._items=(0,ot.Z)(this._items)),(0,Q.B)(this,"selection-changed",{value:this._checkedRows})}},{kind:"method",key:"_handleSearchChange",value:function(t){this.filter||this._debounceSearch(t.detail.value)}},{kind:"method",key:"_calcTableHeight",value:(r=(0,rt.Z)((0,et.Z)().mark((function t(){return(0,et.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!this.autoHeight){t.next=2;break}return t.abrupt("return");case 2:return t.next=4,this.updateComplete;case 4:this._headerHeight=this._header.clientHeight;case 5:case"end":return t.stop()}}),t,this)}))),function(){return r.apply(this,arguments)})},{kind:"method",decorators:[(0,X.hO)({passive:!0})],key:"_saveScrollPos",value:function(t){this._savedScrollPos=t.target.scrollTop}},{kind:"get",static:!0,key:"styles",value:function(){return[mt.$c,(0,J.iv)(m||(m=(0,G.Z)([":host{height:100%}.mdc-data-table__content{font-family:Roboto,sans-serif;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-size:.875rem;line-height:1.25rem;font-weight:400;letter-spacing:.0178571429em;text-decoration:inherit;text-transform:inherit}.mdc-data-table{background-color:var(--data-table-background-color);border-radius:4px;border-width:1px;border-style:solid;border-color:var(--divider-color);display:inline-flex;flex-direction:column;box-sizing:border-box;overflow:hidden}.mdc-data-table__row--selected{background-color:rgba(var(--rgb-primary-color),.04)}.mdc-data-table__row{display:flex;width:100%;height:52px}.mdc-data-table__row~.mdc-data-table__row{border-top:1px solid var(--divider-color)}.mdc-data-table__row.clickable:not(\n.mdc-data-table__row--selected\n):hover{background-color:rgba(var(--rgb-primary-text-color),.04)}.mdc-data-table__header-cell{color:var(--primary-text-color)}.mdc-data-table__cell{color:var(--primary-text-color)}.mdc-data-table__header-row{height:56px;display:flex;width:100%;border-bottom:1px solid var(--divider-color);overflow-x:auto}.mdc-data-table__header-row::-webkit-scrollbar{display:none}.mdc-data-table__cell,.mdc-data-table__header-cell{padding-right:16px;padding-left:16px;align-self:center;overflow:hidden;text-overflow:ellipsis;flex-shrink:0;box-sizing:border-box}.mdc-data-table__cell.mdc-data-table__cell--flex{display:flex;overflow:initial}.mdc-data-table__cell.mdc-data-table__cell--icon{overflow:initial}.mdc-data-table__cell--checkbox,.mdc-data-table__header-cell--checkbox{padding-left:16px;padding-right:0;width:60px}:host([dir=rtl]) .mdc-data-table__cell--checkbox,:host([dir=rtl]) .mdc-data-table__header-cell--checkbox{padding-left:0;padding-right:16px}.mdc-data-table__table{height:100%;width:100%;border:0;white-space:nowrap}.mdc-data-table__cell{font-family:Roboto,sans-serif;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-size:.875rem;line-height:1.25rem;font-weight:400;letter-spacing:.0178571429em;text-decoration:inherit;text-transform:inherit}.mdc-data-table__cell a{color:inherit;text-decoration:none}.mdc-data-table__cell--numeric{text-align:right}:host([dir=rtl]) .mdc-data-table__cell--numeric{text-align:left}.mdc-data-table__cell--icon{color:var(--secondary-text-color);text-align:center}.mdc-data-table__cell--icon,.mdc-data-table__header-cell--icon{width:54px}.mdc-data-table__cell--icon img{width:24px;height:24px}.mdc-data-table__header-cell.mdc-data-table__header-cell--icon{text-align:center}.mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:hover,.mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:not(\n.not-sorted\n){text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:hover,:host([dir=rtl]) .mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:not(\n.not-sorted\n){text-align:right}.mdc-data-table__cell--icon:first-child ha-icon,.mdc-data-table__cell--icon:first-child ha-state-icon,.mdc-data-table__cell--icon:first-child ha-svg-icon,.mdc-data-table__cell--icon:first-child img{margin-left:8px}:host([dir=rtl]) .mdc-data-table__cell--icon:first-child ha-icon,:host([dir=rtl]) .mdc-data-table__cell--icon:first-child ha-state-icon,:host([dir=rtl]) .mdc-data-table__cell--icon:first-child ha-svg-icon :host([dir=rtl]) .mdc-data-table__cell--icon:first-child img{margin-left:auto;margin-right:8px}.mdc-data-table__cell--icon:first-child state-badge{margin-right:-8px}:host([dir=rtl]) .mdc-data-table__cell--icon:first-child state-badge{margin-right:auto;margin-left:-8px}.mdc-data-table__cell--icon-button,.mdc-data-table__cell--overflow-menu,.mdc-data-table__header-cell--icon-button,.mdc-data-table__header-cell--overflow-menu{padding:8px}.mdc-data-table__cell--icon-button,.mdc-data-table__header-cell--icon-button{width:56px}.mdc-data-table__cell--icon-button,.mdc-data-table__cell--overflow-menu{color:var(--secondary-text-color);text-overflow:clip}.mdc-data-table__cell--icon-button:first-child,.mdc-data-table__cell--icon-button:last-child,.mdc-data-table__header-cell--icon-button:first-child,.mdc-data-table__header-cell--icon-button:last-child{width:64px}.mdc-data-table__cell--icon-button:first-child,.mdc-data-table__cell--overflow-menu:first-child,.mdc-data-table__header-cell--icon-button:first-child,.mdc-data-table__header-cell--overflow-menu:first-child{padding-left:16px}:host([dir=rtl]) .mdc-data-table__cell--overflow-menu:first-child,:host([dir=rtl]) .mdc-data-table__header-cell--overflow-menu:first-child{padding-left:8px;padding-right:16px}.mdc-data-table__cell--icon-button:last-child,.mdc-data-table__cell--overflow-menu:last-child,.mdc-data-table__header-cell--icon-button:last-child,.mdc-data-table__header-cell--overflow-menu:last-child{padding-right:16px}:host([dir=rtl]) .mdc-data-table__cell--icon-button:last-child,:host([dir=rtl]) .mdc-data-table__cell--overflow-menu:last-child,:host([dir=rtl]) .mdc-data-table__header-cell--icon-button:last-child,:host([dir=rtl]) .mdc-data-table__header-cell--overflow-menu:last-child{padding-right:8px;padding-left:16px}.mdc-data-table__cell--overflow-menu,.mdc-data-table__header-cell--overflow-menu{overflow:initial}.mdc-data-table__cell--icon-button a{color:var(--secondary-text-color)}.mdc-data-table__header-cell{font-family:Roboto,sans-serif;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-size:.875rem;line-height:1.375rem;font-weight:500;letter-spacing:.0071428571em;text-decoration:inherit;text-transform:inherit;text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell{text-align:right}.mdc-data-table__header-cell--numeric{text-align:right}.mdc-data-table__header-cell--numeric.sortable:hover,.mdc-data-table__header-cell--numeric.sortable:not(.not-sorted){text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell--numeric{text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell--numeric.sortable:hover,:host([dir=rtl]) .mdc-data-table__header-cell--numeric.sortable:not(.not-sorted){text-align:right}:host{display:block}.mdc-data-table{display:block;border-width:var(--data-table-border-width,1px);height:100%}.mdc-data-table__header-cell{overflow:hidden;position:relative}.mdc-data-table__header-cell span{position:relative;left:0px}:host([dir=rtl]) .mdc-data-table__header-cell span{left:auto;right:0px}.mdc-data-table__header-cell.sortable{cursor:pointer}.mdc-data-table__header-cell>*{transition:left .2s ease}:host([dir=rtl]) .mdc-data-table__header-cell>*{transition:right .2s ease}.mdc-data-table__header-cell ha-svg-icon{top:-3px;position:absolute}.mdc-data-table__header-cell.not-sorted ha-svg-icon{left:-20px}:host([dir=rtl]) .mdc-data-table__header-cell.not-sorted ha-svg-icon{right:-20px}.mdc-data-table__header-cell.sortable.not-sorted:hover span,.mdc-data-table__header-cell.sortable:not(.not-sorted) span{left:24px}:host([dir=rtl]) .mdc-data-table__header-cell.sortable.not-sorted:hover span,:host([dir=rtl]) .mdc-data-table__header-cell.sortable:not(.not-sorted) span{left:auto;right:24px}.mdc-data-table__header-cell.sortable:hover.not-sorted ha-svg-icon,.mdc-data-table__header-cell.sortable:not(.not-sorted) ha-svg-icon{left:12px}:host([dir=rtl]) .mdc-data-table__header-cell.sortable:hover.not-sorted ha-svg-icon,:host([dir=rtl]) .mdc-data-table__header-cell.sortable:not(.not-sorted) ha-svg-icon{left:auto;right:12px}.table-header{border-bottom:1px solid var(--divider-color)}search-input{display:block;flex:1}slot[name=header]{display:block}.center{text-align:center}.secondary{color:var(--secondary-text-color)}.scroller{height:calc(100% - 57px);overflow:overlay!important}.mdc-data-table__table.auto-height .scroller{overflow-y:hidden!important}.grows{flex-grow:1;flex-shrink:1}.forceLTR{direction:ltr}.clickable{cursor:pointer}lit-virtualizer{contain:size layout!important;overscroll-behavior:contain}"])))]}}]}}),J.oi),r(22859),r(85472),r(90126),r(27763),r(52996)),kt=(r(33358),r(73957),r(98734));(0,$.Z)([(0,X.Mo)("ha-tab")],(function(t,e){var r=function(e){function r(){var e;(0,Y.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,U.Z)(this,r,[].concat(i)),t((0,q.Z)(e)),e}return(0,K.Z)(r,e),(0,W.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,X.Cb)({type:Boolean,reflect:!0})],key:"active",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)()],key:"name",value:void 0},{kind:"field",decorators:[(0,X.GC)("mwc-ripple")],key:"_ripple",value:void 0},{kind:"field",decorators:[(0,X.SB)()],key:"_shouldRenderRipple",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,J.dy)(b||(b=(0,G.Z)([' <div tabindex="0" role="tab" aria-selected="','" aria-label="','" @focus="','" @blur="','" @mousedown="','" @mouseup="','" @mouseenter="','" @mouseleave="','" @touchstart="','" @touchend="','" @touchcancel="','" @keydown="','"> ',' <span class="name">',"</span> "," </div> "])),this.active,(0,dt.o)(this.name),this.handleRippleFocus,this.handleRippleBlur,this.handleRippleActivate,this.handleRippleDeactivate,this.handleRippleMouseEnter,this.handleRippleMouseLeave,this.handleRippleActivate,this.handleRippleDeactivate,this.handleRippleDeactivate,this._handleKeyDown,this.narrow?(0,J.dy)(y||(y=(0,G.Z)(['<slot name="icon"></slot>']))):"",this.name,this._shouldRenderRipple?(0,J.dy)(g||(g=(0,G.Z)(["<mwc-ripple></mwc-ripple>"]))):"")}},{kind:"field",key:"_rippleHandlers",value:function(){var t=this;return new kt.A((function(){return t._shouldRenderRipple=!0,t._ripple}))}},{kind:"method",key:"_handleKeyDown",value:function(t){"Enter"===t.key&&t.target.click()}},{kind:"method",decorators:[(0,X.hO)({passive:!0})],key:"handleRippleActivate",value:function(t){this._rippleHandlers.startPress(t)}},{kind:"method",key:"handleRippleDeactivate",value:function(){this._rippleHandlers.endPress()}},{kind:"method",key:"handleRippleMouseEnter",value:function(){this._rippleHandlers.startHover()}},{kind:"method",key:"handleRippleMouseLeave",value:function(){this._rippleHandlers.endHover()}},{kind:"method",key:"handleRippleFocus",value:function(){this._rippleHandlers.startFocus()}},{kind:"method",key:"handleRippleBlur",value:function(){this._rippleHandlers.endFocus()}},{kind:"get",static:!0,key:"styles",value:function(){return(0,J.iv)(_||(_=(0,G.Z)(["div{padding:0 32px;display:flex;flex-direction:column;text-align:center;box-sizing:border-box;align-items:center;justify-content:center;width:100%;height:var(--header-height);cursor:pointer;position:relative;outline:0}.name{white-space:nowrap;overflow:hidden;text-overflow:ellipsis;max-width:100%}:host([active]){color:var(--primary-color)}:host(:not([narrow])[active]) div{border-bottom:2px solid var(--primary-color)}:host([narrow]){min-width:0;display:flex;justify-content:center;overflow:hidden}:host([narrow]) div{padding:0 4px}"])))}}]}}),J.oi),(0,$.Z)([(0,X.Mo)("hass-tabs-subpage")],(function(t,e){var r=function(e){function r(){var e;(0,Y.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,U.Z)(this,r,[].concat(i)),t((0,q.Z)(e)),e}return(0,K.Z)(r,e),(0,W.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"supervisor",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"localizeFunc",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:String,attribute:"back-path"})],key:"backPath",value:void 0},{kind:"field",decorators:[(0,X.Cb)()],key:"backCallback",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,attribute:"main-page"})],key:"mainPage",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"tabs",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,reflect:!0,attribute:"is-wide"})],key:"isWide",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,reflect:!0})],key:"rtl",value:function(){return!1}},{kind:"field",decorators:[(0,X.SB)()],key:"_activeTab",value:void 0},{kind:"field",decorators:[(0,ft.i)(".content")],key:"_savedScrollPos",value:void 0},{kind:"field",key:"_getTabs",value:function(){var t=this;return(0,ht.Z)((function(e,r,n,i,o,a,l){var c=e.filter((function(e){return(!e.component||e.core||(0,wt.p)(t.hass,e.component))&&(!e.advancedOnly||n)}));if(c.length<2){if(1===c.length){var s=c[0];return[s.translationKey?l(s.translationKey):s.name]}return[""]}return c.map((function(e){return(0,J.dy)(w||(w=(0,G.Z)([' <a href="','"> <ha-tab .hass="','" .active="','" .narrow="','" .name="','"> '," </ha-tab> </a> "])),e.path,t.hass,e.path===(null==r?void 0:r.path),t.narrow,e.translationKey?l(e.translationKey):e.name,e.iconPath?(0,J.dy)(k||(k=(0,G.Z)(['<ha-svg-icon slot="icon" .path="','"></ha-svg-icon>'])),e.iconPath):"")}))}))}},{kind:"method",key:"willUpdate",value:function(t){var e=this;if(t.has("route")&&(this._activeTab=this.tabs.find((function(t){return"".concat(e.route.prefix).concat(e.route.path).includes(t.path)}))),t.has("hass")){var n=t.get("hass");n&&n.language===this.hass.language||(this.rtl=(0,tt.HE)(this.hass))}(0,at.Z)((0,lt.Z)(r.prototype),"willUpdate",this).call(this,t)}},{kind:"method",key:"render",value:function(){var t,e,r=this._getTabs(this.tabs,this._activeTab,null===(t=this.hass.userData)||void 0===t?void 0:t.showAdvanced,this.hass.config.components,this.hass.language,this.narrow,this.localizeFunc||this.hass.localize),n=r.length>1;return(0,J.dy)(x||(x=(0,G.Z)([' <div class="toolbar"> '," "," ",' <div id="toolbar-icon"> <slot name="toolbar-icon"></slot> </div> </div> <div class="content ha-scrollbar ','" @scroll="','"> <slot></slot> </div> <div id="fab" class="','"> <slot name="fab"></slot> </div> '])),this.mainPage||!this.backPath&&null!==(e=history.state)&&void 0!==e&&e.root?(0,J.dy)(C||(C=(0,G.Z)([' <ha-menu-button .hassio="','" .hass="','" .narrow="','"></ha-menu-button> '])),this.supervisor,this.hass,this.narrow):this.backPath?(0,J.dy)(L||(L=(0,G.Z)([' <a href="','"> <ha-icon-button-arrow-prev .hass="','"></ha-icon-button-arrow-prev> </a> '])),this.backPath,this.hass):(0,J.dy)(Z||(Z=(0,G.Z)([' <ha-icon-button-arrow-prev .hass="','" @click="','"></ha-icon-button-arrow-prev> '])),this.hass,this._backTapped),this.narrow||!n?(0,J.dy)(S||(S=(0,G.Z)(['<div class="main-title"> <slot name="header">',"</slot> </div>"])),n?"":r[0]):"",n?(0,J.dy)(H||(H=(0,G.Z)([' <div id="tabbar" class="','"> '," </div> "])),(0,st.$)({"bottom-bar":this.narrow}),r):"",(0,st.$)({tabs:n}),this._saveScrollPos,(0,st.$)({tabs:n}))}},{kind:"method",decorators:[(0,X.hO)({passive:!0})],key:"_saveScrollPos",value:function(t){this._savedScrollPos=t.target.scrollTop}},{kind:"method",key:"_backTapped",value:function(){this.backCallback?this.backCallback():history.back()}},{kind:"get",static:!0,key:"styles",value:function(){return[mt.$c,(0,J.iv)(A||(A=(0,G.Z)([":host{display:block;height:100%;background-color:var(--primary-background-color)}:host([narrow]){width:100%;position:fixed}ha-menu-button{margin-right:24px}.toolbar{display:flex;align-items:center;font-size:20px;height:var(--header-height);background-color:var(--sidebar-background-color);font-weight:400;border-bottom:1px solid var(--divider-color);padding:8px 12px;box-sizing:border-box}@media (max-width:599px){.toolbar{padding:4px}}.toolbar a{color:var(--sidebar-text-color);text-decoration:none}.bottom-bar a{width:25%}#tabbar{display:flex;font-size:14px;overflow:hidden}#tabbar>a{overflow:hidden;max-width:45%}#tabbar.bottom-bar{position:absolute;bottom:0;left:0;padding:0 16px;box-sizing:border-box;background-color:var(--sidebar-background-color);border-top:1px solid var(--divider-color);justify-content:space-around;z-index:2;font-size:12px;width:100%;padding-bottom:env(safe-area-inset-bottom)}#tabbar:not(.bottom-bar){flex:1;justify-content:center}:host(:not([narrow])) #toolbar-icon{min-width:40px}::slotted([slot=toolbar-icon]),ha-icon-button-arrow-prev,ha-menu-button{display:flex;flex-shrink:0;pointer-events:auto;color:var(--sidebar-icon-color)}.main-title{flex:1;max-height:var(--header-height);line-height:20px;color:var(--sidebar-text-color);margin:var(--main-title-margin,0 0 0 24px)}.content{position:relative;width:calc(100% - env(safe-area-inset-left) - env(safe-area-inset-right));margin-left:env(safe-area-inset-left);margin-right:env(safe-area-inset-right);height:calc(100% - 1px - var(--header-height));height:calc(100% - 1px - var(--header-height) - env(safe-area-inset-bottom));overflow:auto;-webkit-overflow-scrolling:touch}:host([narrow]) .content.tabs{height:calc(100% - 2 * var(--header-height));height:calc(100% - 2 * var(--header-height) - env(safe-area-inset-bottom))}#fab{position:fixed;right:calc(16px + env(safe-area-inset-right));bottom:calc(16px + env(safe-area-inset-bottom));z-index:1}:host([narrow]) #fab.tabs{bottom:calc(84px + env(safe-area-inset-bottom))}#fab[is-wide]{bottom:24px;right:24px}:host([rtl]) #fab{right:auto;left:calc(16px + env(safe-area-inset-left))}:host([rtl][is-wide]) #fab{bottom:24px;left:24px;right:auto}"])))]}}]}}),J.oi),(0,$.Z)([(0,X.Mo)("hass-tabs-subpage-data-table")],(function(t,e){var r=function(e){function r(){var e;(0,Y.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,U.Z)(this,r,[].concat(i)),t((0,q.Z)(e)),e}return(0,K.Z)(r,e),(0,W.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"localizeFunc",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"isWide",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"supervisor",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean,attribute:"main-page"})],key:"mainPage",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Object})],key:"columns",value:function(){return{}}},{kind:"field",decorators:[(0,X.Cb)({type:Array})],key:"data",value:function(){return[]}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"selectable",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"clickable",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"hasFab",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"appendRow",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"id",value:function(){return"id"}},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"filter",value:function(){return""}},{kind:"field",decorators:[(0,X.Cb)()],key:"searchLabel",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Array})],key:"activeFilters",value:void 0},{kind:"field",decorators:[(0,X.Cb)()],key:"hiddenLabel",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Number})],key:"numHidden",value:function(){return 0}},{kind:"field",decorators:[(0,X.Cb)({type:String,attribute:"back-path"})],key:"backPath",value:void 0},{kind:"field",decorators:[(0,X.Cb)()],key:"backCallback",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:String})],key:"noDataText",value:void 0},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"empty",value:function(){return!1}},{kind:"field",decorators:[(0,X.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,X.Cb)()],key:"tabs",value:function(){return[]}},{kind:"field",decorators:[(0,X.Cb)({type:Boolean})],key:"hideFilterMenu",value:function(){return!1}},{kind:"field",decorators:[(0,X.IO)("ha-data-table",!0)],key:"_dataTable",value:void 0},{kind:"method",key:"clearSelection",value:function(){this._dataTable.clearSelection()}},{kind:"method",key:"render",value:function(){var t=this.numHidden?this.hiddenLabel||this.hass.localize("ui.components.data-table.hidden",{number:this.numHidden})||this.numHidden:void 0,e=this.activeFilters?(0,J.dy)(E||(E=(0,G.Z)([""," "," ",""])),this.hass.localize("ui.components.data-table.filtering_by"),this.activeFilters.join(", "),t?"(".concat(t,")"):""):t,r=(0,J.dy)(O||(O=(0,G.Z)(['<search-input .hass="','" .filter="','" .suffix="','" @value-changed="','" .label="','"> '," </search-input>"])),this.hass,this.filter,!this.narrow,this._handleSearchChange,this.searchLabel,this.narrow?"":(0,J.dy)(V||(V=(0,G.Z)(['<div class="filters" slot="suffix" @click="','"> ',' <slot name="filter-menu"></slot> </div>'])),this._preventDefault,e?(0,J.dy)(j||(j=(0,G.Z)(['<div class="active-filters"> ',' <mwc-button @click="','"> '," </mwc-button> </div>"])),e,this._clearFilter,this.hass.localize("ui.components.data-table.clear")):""));return(0,J.dy)(F||(F=(0,G.Z)([' <hass-tabs-subpage .hass="','" .localizeFunc="','" .narrow="','" .isWide="','" .backPath="','" .backCallback="','" .route="','" .tabs="','" .mainPage="','" .supervisor="','"> ',' <div slot="fab"><slot name="fab"></slot></div> </hass-tabs-subpage> '])),this.hass,this.localizeFunc,this.narrow,this.isWide,this.backPath,this.backCallback,this.route,this.tabs,this.mainPage,this.supervisor,this.empty?(0,J.dy)(M||(M=(0,G.Z)(['<div class="center"> <slot name="empty">',"</slot> </div>"])),this.noDataText):(0,J.dy)(R||(R=(0,G.Z)([""," ",' <ha-data-table .hass="','" .columns="','" .data="','" .noDataText="','" .filter="','" .selectable="','" .hasFab="','" .id="','" .dir="','" .clickable="','" .appendRow="','"> '," </ha-data-table>"])),this.hideFilterMenu?"":(0,J.dy)(P||(P=(0,G.Z)([' <div slot="toolbar-icon"> ','<slot name="toolbar-icon"></slot> </div> '])),this.narrow?(0,J.dy)(T||(T=(0,G.Z)([' <div class="filter-menu"> ',' <slot name="filter-menu"></slot> </div> '])),this.numHidden||this.activeFilters?(0,J.dy)(z||(z=(0,G.Z)(['<span class="badge">',"</span>"])),this.numHidden||"!"):""):""),this.narrow?(0,J.dy)(B||(B=(0,G.Z)([' <div slot="header"> <slot name="header"> <div class="search-toolbar">',"</div> </slot> </div> "])),r):"",this.hass,this.columns,this.data,this.noDataText,this.filter,this.selectable,this.hasFab,this.id,(0,tt.Zu)(this.hass),this.clickable,this.appendRow,this.narrow?(0,J.dy)(N||(N=(0,G.Z)([' <div slot="header"></div> ']))):(0,J.dy)(D||(D=(0,G.Z)([' <div slot="header"> <slot name="header"> <div class="table-header">',"</div> </slot> </div> "])),r)))}},{kind:"method",key:"_preventDefault",value:function(t){t.preventDefault()}},{kind:"method",key:"_handleSearchChange",value:function(t){this.filter!==t.detail.value&&(this.filter=t.detail.value,(0,Q.B)(this,"search-changed",{value:this.filter}))}},{kind:"method",key:"_clearFilter",value:function(){(0,Q.B)(this,"clear-filter")}},{kind:"get",static:!0,key:"styles",value:function(){return(0,J.iv)(I||(I=(0,G.Z)(['ha-data-table{width:100%;height:100%;--data-table-border-width:0}:host(:not([narrow])) ha-data-table{height:calc(100vh - 1px - var(--header-height));display:block}:host([narrow]) hass-tabs-subpage{--main-title-margin:0}.table-header{display:flex;align-items:center;--mdc-shape-small:0;height:56px}.search-toolbar{display:flex;align-items:center;color:var(--secondary-text-color)}search-input{--mdc-text-field-fill-color:var(--sidebar-background-color);--mdc-text-field-idle-line-color:var(--divider-color);--text-field-overflow:visible;z-index:5}.table-header search-input{display:block;position:absolute;top:0;right:0;left:0}.search-toolbar search-input{display:block;width:100%;color:var(--secondary-text-color);--mdc-ripple-color:transparant}.filters{--mdc-text-field-fill-color:var(--input-fill-color);--mdc-text-field-idle-line-color:var(--input-idle-line-color);--mdc-shape-small:4px;--text-field-overflow:initial;display:flex;justify-content:flex-end;color:var(--primary-text-color)}.active-filters{color:var(--primary-text-color);position:relative;display:flex;align-items:center;padding:2px 2px 2px 8px;margin-left:4px;margin-inline-start:4px;margin-inline-end:initial;font-size:14px;width:max-content;cursor:initial;direction:var(--direction)}.active-filters ha-svg-icon{color:var(--primary-color)}.active-filters mwc-button{margin-left:8px;margin-inline-start:8px;margin-inline-end:initial;direction:var(--direction)}.active-filters::before{background-color:var(--primary-color);opacity:.12;border-radius:4px;position:absolute;top:0;right:0;bottom:0;left:0;content:""}.badge{min-width:20px;box-sizing:border-box;border-radius:50%;font-weight:400;background-color:var(--primary-color);line-height:20px;text-align:center;padding:0px 4px;color:var(--text-primary-color);position:absolute;right:0;top:4px;font-size:.65em}.filter-menu{position:relative}.center{display:flex;align-items:center;justify-content:center;text-align:center;box-sizing:border-box;height:100%;width:100%;padding:16px}'])))}}]}}),J.oi)},23216:function(t,e,r){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}function i(){i=function(){return e};var t,e={},r=Object.prototype,o=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},l="function"==typeof Symbol?Symbol:{},c=l.iterator||"@@iterator",s=l.asyncIterator||"@@asyncIterator",d=l.toStringTag||"@@toStringTag";function u(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function h(t,e,r,n){var i=e&&e.prototype instanceof g?e:g,o=Object.create(i.prototype),l=new V(n||[]);return a(o,"_invoke",{value:H(t,r,l)}),o}function f(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=h;var v="suspendedStart",p="suspendedYield",m="executing",b="completed",y={};function g(){}function _(){}function w(){}var k={};u(k,c,(function(){return this}));var x=Object.getPrototypeOf,C=x&&x(x(j([])));C&&C!==r&&o.call(C,c)&&(k=C);var L=w.prototype=g.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function S(t,e){function r(i,a,l,c){var s=f(t[i],t,a);if("throw"!==s.type){var d=s.arg,u=d.value;return u&&"object"==n(u)&&o.call(u,"__await")?e.resolve(u.__await).then((function(t){r("next",t,l,c)}),(function(t){r("throw",t,l,c)})):e.resolve(u).then((function(t){d.value=t,l(d)}),(function(t){return r("throw",t,l,c)}))}c(s.arg)}var i;a(this,"_invoke",{value:function(t,n){function o(){return new e((function(e,i){r(t,n,e,i)}))}return i=i?i.then(o,o):o()}})}function H(e,r,n){var i=v;return function(o,a){if(i===m)throw new Error("Generator is already running");if(i===b){if("throw"===o)throw a;return{value:t,done:!0}}for(n.method=o,n.arg=a;;){var l=n.delegate;if(l){var c=A(l,n);if(c){if(c===y)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(i===v)throw i=b,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);i=m;var s=f(e,r,n);if("normal"===s.type){if(i=n.done?b:p,s.arg===y)continue;return{value:s.arg,done:n.done}}"throw"===s.type&&(i=b,n.method="throw",n.arg=s.arg)}}}function A(e,r){var n=r.method,i=e.iterator[n];if(i===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,A(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),y;var o=f(i,e.iterator,r.arg);if("throw"===o.type)return r.method="throw",r.arg=o.arg,r.delegate=null,y;var a=o.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,y):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,y)}function E(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function O(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function V(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(E,this),this.reset(!0)}function j(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function r(){for(;++i<e.length;)if(o.call(e,i))return r.value=e[i],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(n(e)+" is not iterable")}return _.prototype=w,a(L,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=u(w,d,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,u(t,d,"GeneratorFunction")),t.prototype=Object.create(L),t},e.awrap=function(t){return{__await:t}},Z(S.prototype),u(S.prototype,s,(function(){return this})),e.AsyncIterator=S,e.async=function(t,r,n,i,o){void 0===o&&(o=Promise);var a=new S(h(t,r,n,i),o);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=j,V.prototype={constructor:V,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(O),!e)for(var r in this)"t"===r.charAt(0)&&o.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,i){return l.type="throw",l.arg=e,r.next=n,i&&(r.method="next",r.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],l=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),s=o.call(a,"finallyLoc");if(c&&s){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&o.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var i=n;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,y):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),y},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),O(r),y}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var i=n.arg;O(r)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:j(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),y}},e}function o(t,e,r,n,i,o,a){try{var l=t[o](a),c=l.value}catch(s){return void r(s)}l.done?e(c):Promise.resolve(c).then(n,i)}r.a(t,function(){var t,n=(t=i().mark((function t(n,o){var a,l,c,s,d,u,h,f,v,p,m,b,y;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.prev=0,r.r(e),a=r(99312),l=r(81043),r(51358),r(46798),r(47084),r(5239),r(98490),r(36513),c=r(43170),s=r(27499),d=r(16723),u=r(82874),h=r(32812),f=r(99331),v=r(27815),p=r(64532),m=r(11674),b=r(53285),y=function(){var t=(0,l.Z)((0,a.Z)().mark((function t(){var e,n;return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(e=(0,m.sS)(),n=[],!(0,d.Y)()){t.next=5;break}return t.next=5,Promise.all([r.e(9460),r.e(254)]).then(r.bind(r,45577));case 5:if(!(0,h.Y)()){t.next=8;break}return t.next=8,Promise.all([r.e(7021),r.e(9460),r.e(8196)]).then(r.bind(r,48196));case 8:if((0,c.Y)(e)&&n.push(Promise.all([r.e(7021),r.e(6554)]).then(r.bind(r,76554)).then((function(){return(0,b.H)()}))),(0,s.Yq)(e)&&n.push(Promise.all([r.e(7021),r.e(2684)]).then(r.bind(r,72684))),(0,u.Y)(e)&&n.push(Promise.all([r.e(7021),r.e(9029)]).then(r.bind(r,69029))),(0,f.Y)(e)&&n.push(Promise.all([r.e(7021),r.e(7048)]).then(r.bind(r,87048))),(0,v.Y)(e)&&n.push(Promise.all([r.e(7021),r.e(655)]).then(r.bind(r,20655)).then((function(){return r.e(4827).then(r.t.bind(r,64827,23))}))),(0,p.Y)(e)&&n.push(Promise.all([r.e(7021),r.e(759)]).then(r.bind(r,20759))),0!==n.length){t.next=16;break}return t.abrupt("return");case 16:return t.next=18,Promise.all(n).then((function(){return(0,b.n)(e)}));case 18:case"end":return t.stop()}}),t)})));return function(){return t.apply(this,arguments)}}(),t.next=29,y();case 29:o(),t.next=35;break;case 32:t.prev=32,t.t0=t.catch(0),o(t.t0);case 35:case"end":return t.stop()}}),t,null,[[0,32]])})),function(){var e=this,r=arguments;return new Promise((function(n,i){var a=t.apply(e,r);function l(t){o(a,n,i,l,c,"next",t)}function c(t){o(a,n,i,l,c,"throw",t)}l(void 0)}))});return function(t,e){return n.apply(this,arguments)}}(),1)},23636:function(t,e,r){r.d(e,{j:function(){return o}});var n=r(99312),i=r(81043),o=(r(51358),r(46798),r(47084),r(5239),r(98490),function(){var t=(0,i.Z)((0,n.Z)().mark((function t(){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:t.prev=0,new ResizeObserver((function(){})),t.next=9;break;case 4:return t.prev=4,t.t0=t.catch(0),t.next=8,Promise.resolve().then(r.bind(r,5442));case 8:window.ResizeObserver=t.sent.default;case 9:case"end":return t.stop()}}),t,null,[[0,4]])})));return function(){return t.apply(this,arguments)}}())},62782:function(t,e,r){r.d(e,{o:function(){return a}});var n=r(99312),i=r(81043),o=(r(51358),r(46798),r(47084),r(5239),r(98490),r(23636)),a=function(){var t=(0,i.Z)((0,n.Z)().mark((function t(){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,o.j)();case 2:return t.next=4,r.e(8565).then(r.bind(r,98565));case 4:case"end":return t.stop()}}),t)})));return function(){return t.apply(this,arguments)}}()},72824:function(t,e,r){r.d(e,{X1:function(){return n},u4:function(){return i},zC:function(){return o}});r(97393),r(88640);var n=function(t){return"https://brands.home-assistant.io/".concat(t.brand?"brands/":"").concat(t.useFallback?"_/":"").concat(t.domain,"/").concat(t.darkOptimized?"dark_":"").concat(t.type,".png")},i=function(t){return t.split("/")[4]},o=function(t){return t.startsWith("https://brands.home-assistant.io/")}},3239:function(t,e,r){r.d(e,{Z:function(){return i}});var n=r(76775);r(46798),r(94570),r(46349),r(70320),r(9849),r(50289),r(94167),r(65974);function i(t){if(!t||"object"!=(0,n.Z)(t))return t;if("[object Date]"==Object.prototype.toString.call(t))return new Date(t.getTime());if(Array.isArray(t))return t.map(i);var e={};return Object.keys(t).forEach((function(r){e[r]=i(t[r])})),e}},54779:function(t,e,r){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}function i(){i=function(){return e};var t,e={},r=Object.prototype,o=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},l="function"==typeof Symbol?Symbol:{},c=l.iterator||"@@iterator",s=l.asyncIterator||"@@asyncIterator",d=l.toStringTag||"@@toStringTag";function u(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{u({},"")}catch(t){u=function(t,e,r){return t[e]=r}}function h(t,e,r,n){var i=e&&e.prototype instanceof g?e:g,o=Object.create(i.prototype),l=new V(n||[]);return a(o,"_invoke",{value:H(t,r,l)}),o}function f(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=h;var v="suspendedStart",p="suspendedYield",m="executing",b="completed",y={};function g(){}function _(){}function w(){}var k={};u(k,c,(function(){return this}));var x=Object.getPrototypeOf,C=x&&x(x(j([])));C&&C!==r&&o.call(C,c)&&(k=C);var L=w.prototype=g.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){u(t,e,(function(t){return this._invoke(e,t)}))}))}function S(t,e){function r(i,a,l,c){var s=f(t[i],t,a);if("throw"!==s.type){var d=s.arg,u=d.value;return u&&"object"==n(u)&&o.call(u,"__await")?e.resolve(u.__await).then((function(t){r("next",t,l,c)}),(function(t){r("throw",t,l,c)})):e.resolve(u).then((function(t){d.value=t,l(d)}),(function(t){return r("throw",t,l,c)}))}c(s.arg)}var i;a(this,"_invoke",{value:function(t,n){function o(){return new e((function(e,i){r(t,n,e,i)}))}return i=i?i.then(o,o):o()}})}function H(e,r,n){var i=v;return function(o,a){if(i===m)throw new Error("Generator is already running");if(i===b){if("throw"===o)throw a;return{value:t,done:!0}}for(n.method=o,n.arg=a;;){var l=n.delegate;if(l){var c=A(l,n);if(c){if(c===y)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(i===v)throw i=b,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);i=m;var s=f(e,r,n);if("normal"===s.type){if(i=n.done?b:p,s.arg===y)continue;return{value:s.arg,done:n.done}}"throw"===s.type&&(i=b,n.method="throw",n.arg=s.arg)}}}function A(e,r){var n=r.method,i=e.iterator[n];if(i===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,A(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),y;var o=f(i,e.iterator,r.arg);if("throw"===o.type)return r.method="throw",r.arg=o.arg,r.delegate=null,y;var a=o.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,y):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,y)}function E(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function O(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function V(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(E,this),this.reset(!0)}function j(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function r(){for(;++i<e.length;)if(o.call(e,i))return r.value=e[i],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(n(e)+" is not iterable")}return _.prototype=w,a(L,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=u(w,d,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,u(t,d,"GeneratorFunction")),t.prototype=Object.create(L),t},e.awrap=function(t){return{__await:t}},Z(S.prototype),u(S.prototype,s,(function(){return this})),e.AsyncIterator=S,e.async=function(t,r,n,i,o){void 0===o&&(o=Promise);var a=new S(h(t,r,n,i),o);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(L),u(L,d,"Generator"),u(L,c,(function(){return this})),u(L,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=j,V.prototype={constructor:V,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(O),!e)for(var r in this)"t"===r.charAt(0)&&o.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,i){return l.type="throw",l.arg=e,r.next=n,i&&(r.method="next",r.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],l=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=o.call(a,"catchLoc"),s=o.call(a,"finallyLoc");if(c&&s){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&o.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var i=n;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,y):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),y},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),O(r),y}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var i=n.arg;O(r)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:j(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),y}},e}function o(t,e,r,n,i,o,a){try{var l=t[o](a),c=l.value}catch(s){return void r(s)}l.done?e(c):Promise.resolve(c).then(n,i)}r.a(t,function(){var t,n=(t=i().mark((function t(n,o){var a,l,c,s,d,u,h,f,v,p,m,b,y,g,_,w,k,x,C,L,Z,S,H,A,E,O,V,j,F,M,R,P,T,z,B,D,N,I,G,W,Y,U,q,K,$,J,X,Q,tt,et,rt,nt,it,ot,at;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,r.r(e),r.d(e,{HacsDashboard:function(){return at}}),a=r(93359),l=r(62746),c=r(99312),s=r(81043),d=r(88962),u=r(33368),h=r(71650),f=r(68308),v=r(82390),p=r(69205),m=r(91808),b=r(34541),y=r(47838),g=r(46097),r(97393),r(46349),r(70320),r(65974),r(87438),r(46798),r(9849),r(22890),r(88640),r(63789),r(24074),r(40271),r(60163),r(37313),r(22859),r(85717),r(94738),r(98214),r(85472),r(90126),r(47084),r(82073),r(34997),r(12148),r(14271),r(61641),r(44577),_=r(5095),w=r(95260),k=r(14516),x=r(76950),C=r(3747),L=r(67684),Z=r(38480),r(96710),r(85878),r(99040),r(39663),r(21162),r(62082),r(37662),S=r(11285),H=r(29950),A=r(72824),E=r(33367),O=r(90012),V=r(98355),j=r(78822),F=r(46797),M=r(61422),R=r(92178),P=r(25287),!(T=n([x])).then){t.next=101;break}return t.next=97,T;case 97:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=102;break;case 101:t.t0=T;case 102:x=t.t0[0],$="M11,15H13V17H11V15M11,7H13V13H11V7M12,2C6.47,2 2,6.5 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4A8,8 0 0,1 20,12A8,8 0 0,1 12,20Z",J="M13,9H18.5L13,3.5V9M6,2H14L20,8V20A2,2 0 0,1 18,22H6C4.89,22 4,21.1 4,20V4C4,2.89 4.89,2 6,2M15,18V16H6V18H15M18,14V12H6V14H18Z",X="M2.6,10.59L8.38,4.8L10.07,6.5C9.83,7.35 10.22,8.28 11,8.73V14.27C10.4,14.61 10,15.26 10,16A2,2 0 0,0 12,18A2,2 0 0,0 14,16C14,15.26 13.6,14.61 13,14.27V9.41L15.07,11.5C15,11.65 15,11.82 15,12A2,2 0 0,0 17,14A2,2 0 0,0 19,12A2,2 0 0,0 17,10C16.82,10 16.65,10 16.5,10.07L13.93,7.5C14.19,6.57 13.71,5.55 12.78,5.16C12.35,5 11.9,4.96 11.5,5.07L9.8,3.38L10.59,2.6C11.37,1.81 12.63,1.81 13.41,2.6L21.4,10.59C22.19,11.37 22.19,12.63 21.4,13.41L13.41,21.4C12.63,22.19 11.37,22.19 10.59,21.4L2.6,13.41C1.81,12.63 1.81,11.37 2.6,10.59Z",Q="M12,2A10,10 0 0,0 2,12C2,16.42 4.87,20.17 8.84,21.5C9.34,21.58 9.5,21.27 9.5,21C9.5,20.77 9.5,20.14 9.5,19.31C6.73,19.91 6.14,17.97 6.14,17.97C5.68,16.81 5.03,16.5 5.03,16.5C4.12,15.88 5.1,15.9 5.1,15.9C6.1,15.97 6.63,16.93 6.63,16.93C7.5,18.45 8.97,18 9.54,17.76C9.63,17.11 9.89,16.67 10.17,16.42C7.95,16.17 5.62,15.31 5.62,11.5C5.62,10.39 6,9.5 6.65,8.79C6.55,8.54 6.2,7.5 6.75,6.15C6.75,6.15 7.59,5.88 9.5,7.17C10.29,6.95 11.15,6.84 12,6.84C12.85,6.84 13.71,6.95 14.5,7.17C16.41,5.88 17.25,6.15 17.25,6.15C17.8,7.5 17.45,8.54 17.35,8.79C18,9.5 18.38,10.39 18.38,11.5C18.38,15.32 16.04,16.16 13.81,16.41C14.17,16.72 14.5,17.33 14.5,18.26C14.5,19.6 14.5,20.68 14.5,21C14.5,21.27 14.66,21.59 15.17,21.5C19.14,20.16 22,16.42 22,12A10,10 0 0,0 12,2Z",tt="M13,9H11V7H13M13,17H11V11H13M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z",et="M20,4C21.11,4 22,4.89 22,6V18C22,19.11 21.11,20 20,20H4C2.89,20 2,19.11 2,18V6C2,4.89 2.89,4 4,4H20M8.5,15V9H7.25V12.5L4.75,9H3.5V15H4.75V11.5L7.3,15H8.5M13.5,10.26V9H9.5V15H13.5V13.75H11V12.64H13.5V11.38H11V10.26H13.5M20.5,14V9H19.25V13.5H18.13V10H16.88V13.5H15.75V9H14.5V14A1,1 0 0,0 15.5,15H19.5A1,1 0 0,0 20.5,14Z",rt={name:!0,downloads:!0,stars:!0,last_updated:!0,installed_version:!1,available_version:!1,status:!1,category:!0},nt={title:"",hidden:!0,filterable:!0},it=["downloaded","new"],ot=(0,k.Z)((function(t,e,r){return[{name:"filters",type:"constant",value:""},{name:"base",selector:{select:{options:it.map((function(e){return{value:e,label:t("common.".concat(e))}})),mode:"dropdown",sort:!0}}},{name:"category",selector:{select:{options:e.map((function(e){return{label:t("common.".concat(e)),value:"category_".concat(e)}})),mode:"dropdown",sort:!0}}}].concat((0,g.Z)(r?[]:[{name:"behaviour",type:"constant",value:""},{name:"columns",selector:{select:{options:Object.keys(rt).map((function(e){return{label:t("column.".concat(e)),value:e}})),multiple:!0,mode:"dropdown",sort:!0}}}]))})),at=(0,m.Z)([(0,w.Mo)("hacs-dashboard")],(function(t,e){var r,n=function(e){function r(){var e;(0,h.Z)(this,r);for(var n=arguments.length,i=new Array(n),o=0;o<n;o++)i[o]=arguments[o];return e=(0,f.Z)(this,r,[].concat(i)),t((0,v.Z)(e)),e}return(0,p.Z)(r,e),(0,u.Z)(r)}(e);return{F:n,d:[{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hacs",value:void 0},{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"isWide",value:void 0},{kind:"field",decorators:[(0,C.t)({key:"hacs-table-filter",state:!0,subscribe:!1})],key:"activeFilters",value:function(){return[]}},{kind:"field",decorators:[(0,C.t)({key:"hacs-table-sort",state:!0,subscribe:!1})],key:"activeSort",value:void 0},{kind:"field",decorators:[(0,C.t)({key:"hacs-active-search",state:!0,subscribe:!1})],key:"_activeSearch",value:void 0},{kind:"field",decorators:[(0,C.t)({key:"hacs-table-scroll",state:!0,subscribe:!1})],key:"_tableScroll",value:void 0},{kind:"field",decorators:[(0,C.t)({key:"hacs-hide-browse-fab",state:!0,subscribe:!1})],key:"_hide_browse_fab",value:void 0},{kind:"field",decorators:[(0,C.t)({key:"hacs-table-active-columns",state:!0,subscribe:!1})],key:"_tableColumns",value:function(){return rt}},{kind:"method",key:"connectedCallback",value:function(){var t,e=this;(0,b.Z)((0,y.Z)(n.prototype),"connectedCallback",this).call(this);var r=this.activeFilters&&0===this.activeFilters.length?["downloaded"]:this.activeFilters,i=null!==(t=this._activeSearch)&&void 0!==t&&t.length?null==r?void 0:r.filter((function(t){return"downloaded"!==t})):r;this.activeFilters=null!=i&&i.length?i:void 0,this.updateComplete.then((function(){e.restoreScroller().catch((function(){}))}))}},{kind:"method",key:"updated",value:function(t){var e;if((0,b.Z)((0,y.Z)(n.prototype),"updated",this).call(this,t),t.has("_activeSearch")&&null!==(e=this._activeSearch)&&void 0!==e&&e.length){var r,i=(null===(r=this.activeFilters)||void 0===r?void 0:r.filter((function(t){return"downloaded"!==t})))||[];this.activeFilters=i.length?i:void 0}}},{kind:"field",key:"render",value:function(){var t=this;return function(){var e,r,n,i=!(t._hide_browse_fab||null!==(e=t._activeSearch)&&void 0!==e&&e.length||void 0===t.activeFilters||1!==t.activeFilters.length||"downloaded"!==t.activeFilters[0]),o=t._filterRepositories(t.hacs.repositories,t.activeFilters),a=0!==o.filter((function(t){return t.new})).length;return(0,_.dy)(z||(z=(0,d.Z)(['<hass-tabs-subpage-data-table .tabs="','" .columns="','" .data="','" .hass="','" ?iswide="','" .localizeFunc="','" .mainPage="','" .narrow="','" .route="','" clickable .filter="','" .activeFilters="','" .noDataText="','" @row-click="','" @clear-filter="','" @value-changed="','" @sorting-changed="','" .hasFab="','"> <ha-icon-overflow-menu narrow slot="toolbar-icon" .hass="','" .items="','"> </ha-icon-overflow-menu> <ha-button-menu slot="filter-menu" @click="','"> <ha-icon-button slot="trigger" .label="','" .path="','"> </ha-icon-button> </ha-button-menu> '," </hass-tabs-subpage-data-table>"])),[{name:j.Z}],t._columns(t.narrow,t._tableColumns,t.hacs.localize),o,t.hass,t.isWide,t.hass.localize,!0,t.narrow,t.route,t._activeSearch||"",null===(r=t.activeFilters)||void 0===r?void 0:r.map((function(e){return t.hacs.localize("common.".concat(e.startsWith("category_")?e.replace("category_",""):e))||e})),null!==(n=t.activeFilters)&&void 0!==n&&n.includes("downloaded")?"No downloaded repositories":"No repositories matching search and filters",t._handleRowClicked,t._handleClearFilter,t._handleSearchFilterChanged,t._handleSortingChanged,i,t.hass,[{path:J,label:t.hacs.localize("menu.documentation"),action:function(){var e;return L.E.open((0,P.R)({experimental:null===(e=t.hacs.info)||void 0===e?void 0:e.experimental}),"_blank","noreferrer=true")}},{path:Q,label:"GitHub",action:function(){return L.E.open("https://github.com/hacs","_blank","noreferrer=true")}},{path:$,label:t.hacs.localize("menu.open_issue"),action:function(){var e;return L.E.open((0,P.R)({experimental:null===(e=t.hacs.info)||void 0===e?void 0:e.experimental,path:"/docs/issues"}),"_blank","noreferrer=true")}},{path:X,disabled:Boolean(t.hacs.info.disabled_reason),label:t.hacs.localize("menu.custom_repositories"),action:function(){(0,E.U8)(t,{hacs:t.hacs})}},a?{path:et,label:t.hacs.localize("menu.dismiss"),action:function(){(0,F.VP)(t.hass,t.hacs)}}:void 0,{path:tt,label:t.hacs.localize("menu.about"),action:function(){(0,E.lU)(t,{hacs:t.hacs,title:j.Z,description:(0,_.dy)(B||(B=(0,d.Z)(['<ha-markdown .content="','"></ha-markdown>'])),(0,V.e)(t.hacs))})}}].filter((function(t){return void 0!==t})),t._handleIconOverflowMenuOpened,t.hass.localize("ui.panel.config.entities.picker.filter.filter"),"M6,13H18V11H6M3,6V8H21V6M10,18H14V16H10V18Z",i?(0,_.dy)(D||(D=(0,d.Z)([' <ha-fab slot="fab" @click="','" .label="','" extended> <ha-svg-icon slot="icon" .path="','"></ha-svg-icon> </ha-fab> '])),t._show_browse_dialog,t.hacs.localize("dialog_browse.btn"),"M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z"):_.Ld)}}},{kind:"field",key:"_show_browse_dialog",value:function(){var t=this;return(0,s.Z)((0,c.Z)().mark((function e(){return(0,c.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:(0,S.g7)(t,{title:t.hacs.localize("dialog_browse.title"),text:t.hacs.localize("dialog_browse.content"),confirmText:t.hacs.localize("common.close"),confirm:function(){t._hide_browse_fab=!0},dismissText:t.hacs.localize("menu.documentation"),cancel:function(){var e;L.E.open((0,P.R)({experimental:null===(e=t.hacs.info)||void 0===e?void 0:e.experimental,path:"/docs/basic/dashboard"}),"_blank","noreferrer=true"),t._show_browse_dialog()}});case 1:case"end":return e.stop()}}),e)})))}},{kind:"field",key:"_filterRepositories",value:function(){var t=this;return(0,k.Z)((function(e,r){return e.filter((function(e){var n,i;return!(null!==(n=t.activeFilters)&&void 0!==n&&n.includes("downloaded")&&!e.installed||null!==(i=t.activeFilters)&&void 0!==i&&i.includes("new")&&!e.new||null!=r&&r.filter((function(t){return t.startsWith("category_")})).length&&!r.includes("category_".concat(e.category)))})).sort((function(t,e){return e.name.localeCompare(t.name)})).sort((function(t,e){return t.stars<e.stars?1:-1})).sort((function(t,e){return t.installed&&!e.installed?1:-1})).sort((function(t,e){return!t.new&&e.new?1:-1}))}))}},{kind:"field",key:"_columns",value:function(){var t=this;return(0,k.Z)((function(e,r,n){var i,o,a,l,c,s,u,h;return{icon:{title:"",label:t.hass.localize("ui.panel.config.lovelace.dashboards.picker.headers.icon"),hidden:t.narrow,type:"icon",template:function(e){var r;return"integration"===e.category?(0,_.dy)(N||(N=(0,d.Z)([' <img style="height:32px;width:32px" slot="item-icon" src="','" referrerpolicy="no-referrer"> '])),(0,A.X1)({domain:e.domain||"invalid",type:"icon",useFallback:!0,darkOptimized:null===(r=t.hass.themes)||void 0===r?void 0:r.darkMode})):(0,_.dy)(I||(I=(0,d.Z)([' <ha-svg-icon style="height:32px;width:32px;fill:var(--secondary-text-color)" slot="item-icon" .path="','"></ha-svg-icon> '])),(0,R.C)(e.category))}},name:Object.assign(Object.assign({},nt),{},{title:n("column.name"),main:!0,sortable:!0,direction:"name"===(null===(i=t.activeSort)||void 0===i?void 0:i.column)?t.activeSort.direction:null,hidden:!r.name,grows:!0,template:function(r){var i;return(0,_.dy)(G||(G=(0,d.Z)([" "," "," ",' <div class="secondary"> '," </div> "])),r.new?(0,_.dy)(W||(W=(0,d.Z)(['<ha-svg-icon label="New" style="color:var(--primary-color);margin-right:4px" .path="','"></ha-svg-icon>'])),et):"",null!==(i=t.activeFilters)&&void 0!==i&&i.includes("downloaded")||!r.installed?"":(0,_.dy)(Y||(Y=(0,d.Z)(['<ha-svg-icon label="Downloaded" style="color:var(--primary-color);margin-right:4px" .path="','"></ha-svg-icon>'])),"M5,20H19V18H5M19,9H15V3H9V9H5L12,16L19,9Z"),r.name,e?n("common.".concat(r.category)):r.description)}}),downloads:Object.assign(Object.assign({},nt),{},{title:n("column.downloads"),hidden:e||!r.downloads,sortable:!0,direction:"downloads"===(null===(o=t.activeSort)||void 0===o?void 0:o.column)?t.activeSort.direction:null,width:"10%",template:function(t){return(0,_.dy)(U||(U=(0,d.Z)(["",""])),t.downloads||"-")}}),stars:Object.assign(Object.assign({},nt),{},{title:n("column.stars"),hidden:e||!r.stars,sortable:!0,direction:"stars"===(null===(a=t.activeSort)||void 0===a?void 0:a.column)?t.activeSort.direction:null,width:"10%"}),last_updated:Object.assign(Object.assign({},nt),{},{title:n("column.last_updated"),hidden:e||!r.last_updated,sortable:!0,direction:"last_updated"===(null===(l=t.activeSort)||void 0===l?void 0:l.column)?t.activeSort.direction:null,width:"15%",template:function(e){if(!e.last_updated)return"-";try{return(0,x.G)(new Date(e.last_updated),t.hass.locale)}catch(r){return"-"}}}),installed_version:Object.assign(Object.assign({},nt),{},{title:n("column.installed_version"),hidden:e||!r.installed_version,sortable:!0,direction:"installed_version"===(null===(c=t.activeSort)||void 0===c?void 0:c.column)?t.activeSort.direction:null,width:"10%",template:function(t){return t.installed?t.installed_version:"-"}}),available_version:Object.assign(Object.assign({},nt),{},{title:n("column.available_version"),hidden:e||!r.available_version,sortable:!0,direction:"available_version"===(null===(s=t.activeSort)||void 0===s?void 0:s.column)?t.activeSort.direction:null,width:"10%",template:function(t){return t.installed?t.available_version:"-"}}),status:Object.assign(Object.assign({},nt),{},{title:n("column.status"),hidden:e||!r.status,sortable:!0,direction:"status"===(null===(u=t.activeSort)||void 0===u?void 0:u.column)?t.activeSort.direction:null,width:"10%",template:function(t){return["pending-restart","pending-upgrade"].includes(t.status)?n("repository_status.".concat(t.status)):"-"}}),category:Object.assign(Object.assign({},nt),{},{title:n("column.category"),hidden:e||!r.category,sortable:!0,direction:"category"===(null===(h=t.activeSort)||void 0===h?void 0:h.column)?t.activeSort.direction:null,width:"10%",template:function(t){return n("common.".concat(t.category))}}),authors:nt,description:nt,domain:nt,full_name:nt,id:nt,topics:nt,actions:{title:"",width:t.narrow?void 0:"10%",type:"overflow-menu",template:function(e){return e.installed?(0,_.dy)(q||(q=(0,d.Z)([' <ha-icon-overflow-menu .hass="','" .items="','" narrow> </ha-icon-overflow-menu> '])),t.hass,(0,O.G)(t,e)):""}}}}))}},{kind:"get",key:"_scrollerTarget",value:function(){var t;return null===(t=this.shadowRoot)||void 0===t||null===(t=t.querySelector("hass-tabs-subpage-data-table"))||void 0===t||null===(t=t.shadowRoot)||void 0===t||null===(t=t.querySelector("hass-tabs-subpage"))||void 0===t||null===(t=t.shadowRoot)||void 0===t||null===(t=t.querySelector(".content"))||void 0===t||null===(t=t.querySelectorAll("SLOT")[0])||void 0===t||null===(t=t.assignedNodes())||void 0===t||null===(t=t.find((function(t){return"HA-DATA-TABLE"===t.nodeName})))||void 0===t||null===(t=t.shadowRoot)||void 0===t?void 0:t.querySelector(".scroller")}},{kind:"method",key:"restoreScroller",value:(r=(0,s.Z)((0,c.Z)().mark((function t(){var e,r=this;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(0!==(null!==(e=this._tableScroll)&&void 0!==e?e:0)){t.next=2;break}return t.abrupt("return");case 2:return t.next=4,new Promise((function(t,e){var n=setTimeout(e,1e3),i=setInterval((function(){r._scrollerTarget&&(r._scrollerTarget.scrollTop=r._tableScroll,clearTimeout(n),clearInterval(i),t())}),50)}));case 4:case"end":return t.stop()}}),t,this)}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"_handleRowClicked",value:function(t){var e;this._tableScroll=(null===(e=this._scrollerTarget)||void 0===e?void 0:e.scrollTop)||0,(0,Z.c)("/hacs/repository/".concat(t.detail.id))}},{kind:"method",key:"_handleIconOverflowMenuOpened",value:function(t){var e,r,n,i=this;t.stopPropagation(),(0,E.lU)(this,{hacs:this.hacs,title:this.hacs.localize("dialog_overview.title"),description:(0,_.dy)(K||(K=(0,d.Z)(["<p>","</p>"])),this.hacs.localize("dialog_overview.description")),data:{base:(null===(e=this.activeFilters)||void 0===e?void 0:e.find((function(t){return it.includes(t)})))||"",category:(null===(r=this.activeFilters)||void 0===r?void 0:r.find((function(t){return t.startsWith("category_")})))||"",columns:Object.entries(rt).filter((function(t){var e,r=(0,l.Z)(t,2),n=r[0],o=r[1];return null!==(e=i._tableColumns[n])&&void 0!==e?e:o})).map((function(t){var e=(0,l.Z)(t,2),r=e[0];return e[1],r}))},schema:ot(this.hacs.localize,this.hacs.info.categories,this.narrow),computeLabelCallback:function(t,e){return i.hacs.localize("dialog_overview.".concat(t.name))||i.hacs.localize("dialog_overview.sections.".concat(t.name))||t.name},saveAction:(n=(0,s.Z)((0,c.Z)().mark((function t(e){var r;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:r=Object.entries(e).filter((function(t){var e=(0,l.Z)(t,2),r=e[0],n=e[1];return["base","category"].includes(r)&&![void 0,null,""].includes(n)})).map((function(t){var e=(0,l.Z)(t,2);return e[0],e[1]})),i.activeFilters=r.length?r:void 0,i._tableColumns=Object.keys(rt).reduce((function(t,r){var n;return Object.assign(Object.assign({},t),{},(0,a.Z)({},r,null!==(n=e.columns.includes(r))&&void 0!==n?n:rt[r]))}),{});case 3:case"end":return t.stop()}}),t)}))),function(t){return n.apply(this,arguments)})})}},{kind:"method",key:"_handleSearchFilterChanged",value:function(t){this._activeSearch=t.detail.value}},{kind:"method",key:"_handleSortingChanged",value:function(t){this.activeSort=t.detail}},{kind:"method",key:"_handleClearFilter",value:function(){this.activeFilters=void 0}},{kind:"get",static:!0,key:"styles",value:function(){return[H.Qx,M.w]}}]}}),_.oi),o(),t.next=123;break;case 120:t.prev=120,t.t2=t.catch(0),o(t.t2);case 123:case"end":return t.stop()}}),t,null,[[0,120]])})),function(){var e=this,r=arguments;return new Promise((function(n,i){var a=t.apply(e,r);function l(t){o(a,n,i,l,c,"next",t)}function c(t){o(a,n,i,l,c,"throw",t)}l(void 0)}))});return function(t,e){return n.apply(this,arguments)}}())},98355:function(t,e,r){r.d(e,{e:function(){return i}});r(97393),r(87438),r(46798),r(9849),r(22890);var n=r(25287),i=function(t){var e,r,i;return"\n**".concat(t.localize("dialog_about.integration_version"),":** | ").concat(t.info.version,"\n:--|--\n**").concat(t.localize("dialog_about.frontend_version"),":** | ").concat("20240119163101","\n**").concat(t.localize("common.repositories"),":** | ").concat(t.repositories.length,"\n**").concat(t.localize("dialog_about.downloaded_repositories"),":** | ").concat(t.repositories.filter((function(t){return t.installed})).length,"\n\n**").concat(t.localize("dialog_about.useful_links"),":**\n\n- [General documentation](").concat((0,n.R)({experimental:null===(e=t.info)||void 0===e?void 0:e.experimental}),")\n- [Configuration](").concat((0,n.R)({experimental:null===(r=t.info)||void 0===r?void 0:r.experimental,path:"/docs/configuration/start"}),")\n- [FAQ](").concat((0,n.R)({experimental:null===(i=t.info)||void 0===i?void 0:i.experimental,path:"/docs/faq/what"}),")\n- [GitHub](https://github.com/hacs)\n- [Discord](https://discord.gg/apgchf8)\n- [Become a GitHub sponsor? ❤️](https://github.com/sponsors/ludeeus)\n- [BuyMe~~Coffee~~Beer? 🍺🙈](https://buymeacoffee.com/ludeeus)\n\n***\n\n_Everything you find in HACS is **not** tested by Home Assistant, that includes HACS itself.\nThe HACS and Home Assistant teams do not support **anything** you find here._")}},78822:function(t,e,r){r.d(e,{Z:function(){return n}});var n="Home Assistant Community Store"},92178:function(t,e,r){r.d(e,{C:function(){return o}});var n=r(14516),i={appdaemon:"M12,2A2,2 0 0,1 14,4C14,4.74 13.6,5.39 13,5.73V7H14A7,7 0 0,1 21,14H22A1,1 0 0,1 23,15V18A1,1 0 0,1 22,19H21V20A2,2 0 0,1 19,22H5A2,2 0 0,1 3,20V19H2A1,1 0 0,1 1,18V15A1,1 0 0,1 2,14H3A7,7 0 0,1 10,7H11V5.73C10.4,5.39 10,4.74 10,4A2,2 0 0,1 12,2M7.5,13A2.5,2.5 0 0,0 5,15.5A2.5,2.5 0 0,0 7.5,18A2.5,2.5 0 0,0 10,15.5A2.5,2.5 0 0,0 7.5,13M16.5,13A2.5,2.5 0 0,0 14,15.5A2.5,2.5 0 0,0 16.5,18A2.5,2.5 0 0,0 19,15.5A2.5,2.5 0 0,0 16.5,13Z",integration:"M2,10.96C1.5,10.68 1.35,10.07 1.63,9.59L3.13,7C3.24,6.8 3.41,6.66 3.6,6.58L11.43,2.18C11.59,2.06 11.79,2 12,2C12.21,2 12.41,2.06 12.57,2.18L20.47,6.62C20.66,6.72 20.82,6.88 20.91,7.08L22.36,9.6C22.64,10.08 22.47,10.69 22,10.96L21,11.54V16.5C21,16.88 20.79,17.21 20.47,17.38L12.57,21.82C12.41,21.94 12.21,22 12,22C11.79,22 11.59,21.94 11.43,21.82L3.53,17.38C3.21,17.21 3,16.88 3,16.5V10.96C2.7,11.13 2.32,11.14 2,10.96M12,4.15V4.15L12,10.85V10.85L17.96,7.5L12,4.15M5,15.91L11,19.29V12.58L5,9.21V15.91M19,15.91V12.69L14,15.59C13.67,15.77 13.3,15.76 13,15.6V19.29L19,15.91M13.85,13.36L20.13,9.73L19.55,8.72L13.27,12.35L13.85,13.36Z",netdaemon:"M2,15A1,1 0 0,1 3,16A1,1 0 0,1 2,17A1,1 0 0,1 1,16A1,1 0 0,1 2,15M21,17H19V9H17V7H23V9H21V17M16,7V9H14V11H16V13H14V15H16V17H12V7H16M11,7V17H9L6,11V17H4V7H6L9,13V7H11Z",plugin:"M13,3V9H21V3M13,21H21V11H13M3,21H11V15H3M3,13H11V3H3V13Z",python_script:"M19.14,7.5A2.86,2.86 0 0,1 22,10.36V14.14A2.86,2.86 0 0,1 19.14,17H12C12,17.39 12.32,17.96 12.71,17.96H17V19.64A2.86,2.86 0 0,1 14.14,22.5H9.86A2.86,2.86 0 0,1 7,19.64V15.89C7,14.31 8.28,13.04 9.86,13.04H15.11C16.69,13.04 17.96,11.76 17.96,10.18V7.5H19.14M14.86,19.29C14.46,19.29 14.14,19.59 14.14,20.18C14.14,20.77 14.46,20.89 14.86,20.89A0.71,0.71 0 0,0 15.57,20.18C15.57,19.59 15.25,19.29 14.86,19.29M4.86,17.5C3.28,17.5 2,16.22 2,14.64V10.86C2,9.28 3.28,8 4.86,8H12C12,7.61 11.68,7.04 11.29,7.04H7V5.36C7,3.78 8.28,2.5 9.86,2.5H14.14C15.72,2.5 17,3.78 17,5.36V9.11C17,10.69 15.72,11.96 14.14,11.96H8.89C7.31,11.96 6.04,13.24 6.04,14.82V17.5H4.86M9.14,5.71C9.54,5.71 9.86,5.41 9.86,4.82C9.86,4.23 9.54,4.11 9.14,4.11C8.75,4.11 8.43,4.23 8.43,4.82C8.43,5.41 8.75,5.71 9.14,5.71Z",template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",theme:"M17.5,12A1.5,1.5 0 0,1 16,10.5A1.5,1.5 0 0,1 17.5,9A1.5,1.5 0 0,1 19,10.5A1.5,1.5 0 0,1 17.5,12M14.5,8A1.5,1.5 0 0,1 13,6.5A1.5,1.5 0 0,1 14.5,5A1.5,1.5 0 0,1 16,6.5A1.5,1.5 0 0,1 14.5,8M9.5,8A1.5,1.5 0 0,1 8,6.5A1.5,1.5 0 0,1 9.5,5A1.5,1.5 0 0,1 11,6.5A1.5,1.5 0 0,1 9.5,8M6.5,12A1.5,1.5 0 0,1 5,10.5A1.5,1.5 0 0,1 6.5,9A1.5,1.5 0 0,1 8,10.5A1.5,1.5 0 0,1 6.5,12M12,3A9,9 0 0,0 3,12A9,9 0 0,0 12,21A1.5,1.5 0 0,0 13.5,19.5C13.5,19.11 13.35,18.76 13.11,18.5C12.88,18.23 12.73,17.88 12.73,17.5A1.5,1.5 0 0,1 14.23,16H16A5,5 0 0,0 21,11C21,6.58 16.97,3 12,3Z"},o=(0,n.Z)((function(t){return i[t]}))},25287:function(t,e,r){r.d(e,{R:function(){return n}});r(97393);var n=function(t){var e=null!=t&&t.experimental?"experimental.hacs.xyz":"www.hacs.xyz";return"https://".concat(e).concat((null==t?void 0:t.path)||"")}}}]);
+//# sourceMappingURL=4779.e5-Ed0yczRo.js.map
\ No newline at end of file
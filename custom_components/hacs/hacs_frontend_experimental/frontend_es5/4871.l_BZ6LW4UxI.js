@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4871],{74376:function(e,t,i){var a,n=i(88962),s=i(33368),l=i(71650),o=i(68308),r=i(82390),d=i(69205),c=i(91808),v=(i(97393),i(58417)),u=i(39274),h=i(5095),f=i(95260);(0,c.Z)([(0,f.Mo)("ha-checkbox")],(function(e,t){var i=function(t){function i(){var t;(0,l.Z)(this,i);for(var a=arguments.length,n=new Array(a),s=0;s<a;s++)n[s]=arguments[s];return t=(0,o.Z)(this,i,[].concat(n)),e((0,r.Z)(t)),t}return(0,d.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[u.W,(0,h.iv)(a||(a=(0,n.Z)([":host{--mdc-theme-secondary:var(--primary-color)}"])))]}}]}}),v.A)},84871:function(e,t,i){var a,n,s,l,o,r,d,c,v,u,h,f,p,y=i(99312),g=i(81043),_=i(93359),k=i(88962),b=i(46097),m=i(62746),x=i(33368),w=i(71650),Z=i(68308),j=i(82390),O=i(69205),C=i(91808),B=i(76775),M=(i(46798),i(9849),i(13526),i(40271),i(60163),i(97393),i(51358),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(85717),i(50289),i(94167),i(46349),i(70320),i(82073),i(87438),i(22890),i(17692),i(36513),i(65974),i(85472),i(90126),i(94738),i(98214),i(22859),i(10733),i(5095)),z=i(95260),S=i(14516),A=i(4771),P=i(18394),L=i(36655),I=i(44672),F=i(56311),V=i(64346),K=i(29934),R=i(84728),E=(i(74376),i(54371),i(86336),i(52910),i(3017),i(80392),i(32723)),T=i(77251),U=function(e){return e.selector&&!e.required&&!("boolean"in e.selector&&e.default)};(0,C.Z)([(0,z.Mo)("ha-service-control")],(function(e,t){var i,C,T=function(t){function i(){var t;(0,w.Z)(this,i);for(var a=arguments.length,n=new Array(a),s=0;s<a;s++)n[s]=arguments[s];return t=(0,Z.Z)(this,i,[].concat(n)),e((0,j.Z)(t)),t}return(0,O.Z)(i,t),(0,x.Z)(i)}(t);return{F:T,d:[{kind:"field",decorators:[(0,z.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,z.Cb)({attribute:!1})],key:"value",value:void 0},{kind:"field",decorators:[(0,z.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,z.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,z.Cb)({type:Boolean})],key:"showAdvanced",value:function(){return!1}},{kind:"field",decorators:[(0,z.Cb)({type:Boolean,reflect:!0})],key:"hidePicker",value:function(){return!1}},{kind:"field",decorators:[(0,z.SB)()],key:"_value",value:void 0},{kind:"field",decorators:[(0,z.SB)()],key:"_checkedKeys",value:function(){return new Set}},{kind:"field",decorators:[(0,z.SB)()],key:"_manifest",value:void 0},{kind:"field",decorators:[(0,z.IO)("ha-yaml-editor")],key:"_yamlEditor",value:void 0},{kind:"method",key:"willUpdate",value:function(e){var t,i,a,n,s,l,o,r,d=this;if(this.hasUpdated||(this.hass.loadBackendTranslation("services"),this.hass.loadBackendTranslation("selector")),e.has("value")){var c=e.get("value");(null==c?void 0:c.service)!==(null===(t=this.value)||void 0===t?void 0:t.service)&&(this._checkedKeys=new Set);var v,u=this._getServiceInfo(null===(i=this.value)||void 0===i?void 0:i.service,this.hass.services);if(null!==(a=this.value)&&void 0!==a&&a.service){if(null==c||!c.service||(0,L.M)(this.value.service)!==(0,L.M)(c.service))this._fetchManifest((0,L.M)(null===(v=this.value)||void 0===v?void 0:v.service))}else this._manifest=void 0;if(u&&"target"in u&&(null!==(n=this.value)&&void 0!==n&&null!==(n=n.data)&&void 0!==n&&n.entity_id||null!==(s=this.value)&&void 0!==s&&null!==(s=s.data)&&void 0!==s&&s.area_id||null!==(l=this.value)&&void 0!==l&&null!==(l=l.data)&&void 0!==l&&l.device_id)){var h,f,p,y=Object.assign({},this.value.target);!this.value.data.entity_id||null!==(h=this.value.target)&&void 0!==h&&h.entity_id||(y.entity_id=this.value.data.entity_id),!this.value.data.area_id||null!==(f=this.value.target)&&void 0!==f&&f.area_id||(y.area_id=this.value.data.area_id),!this.value.data.device_id||null!==(p=this.value.target)&&void 0!==p&&p.device_id||(y.device_id=this.value.data.device_id),this._value=Object.assign(Object.assign({},this.value),{},{target:y,data:Object.assign({},this.value.data)}),delete this._value.data.entity_id,delete this._value.data.device_id,delete this._value.data.area_id}else this._value=this.value;if((null==c?void 0:c.service)!==(null===(o=this.value)||void 0===o?void 0:o.service)){var g=!1;if(this._value&&u){var _=this.value&&!("data"in this.value);this._value.data||(this._value.data={}),u.fields.forEach((function(e){e.selector&&e.required&&void 0===e.default&&"boolean"in e.selector&&void 0===d._value.data[e.key]&&(g=!0,d._value.data[e.key]=!1),_&&e.selector&&void 0!==e.default&&void 0===d._value.data[e.key]&&(g=!0,d._value.data[e.key]=e.default)}))}g&&(0,P.B)(this,"value-changed",{value:Object.assign({},this._value)})}if(null!==(r=this._value)&&void 0!==r&&r.data){var k=this._yamlEditor;k&&k.value!==this._value.data&&k.setValue(this._value.data)}}}},{kind:"field",key:"_getServiceInfo",value:function(){return(0,S.Z)((function(e,t){if(e&&t){var i=(0,L.M)(e),a=(0,I.p)(e);if(i in t&&a in t[i]){var n=Object.entries(t[i][a].fields).map((function(e){var t=(0,m.Z)(e,2),i=t[0],a=t[1];return Object.assign(Object.assign({key:i},a),{},{selector:a.selector})}));return Object.assign(Object.assign({},t[i][a]),{},{fields:n,hasSelector:n.length?n.filter((function(e){return e.selector})).map((function(e){return e.key})):[]})}}}))}},{kind:"field",key:"_filterFields",value:function(){var e=this;return(0,S.Z)((function(t,i){var a;return null==t||null===(a=t.fields)||void 0===a?void 0:a.filter((function(a){return!a.filter||e._filterField(t.target,a.filter,i)}))}))}},{kind:"method",key:"_filterField",value:function(e,t,i){var a,n,s,l,o,r,d,c,v,u=this,h=e?{target:e}:{target:{}},f=(null===(a=(0,A.r)((null==i||null===(n=i.target)||void 0===n?void 0:n.entity_id)||(null==i||null===(s=i.data)||void 0===s?void 0:s.entity_id)))||void 0===a?void 0:a.slice())||[],p=(null===(l=(0,A.r)((null==i||null===(o=i.target)||void 0===o?void 0:o.device_id)||(null==i||null===(r=i.data)||void 0===r?void 0:r.device_id)))||void 0===l?void 0:l.slice())||[],y=null===(d=(0,A.r)((null==i||null===(c=i.target)||void 0===c?void 0:c.area_id)||(null==i||null===(v=i.data)||void 0===v?void 0:v.area_id)))||void 0===d?void 0:d.slice();return y&&y.forEach((function(e){var t=(0,K.xO)(u.hass,e,u.hass.devices,u.hass.entities,h);f.push.apply(f,(0,b.Z)(t.entities)),p.push.apply(p,(0,b.Z)(t.devices))})),p.length&&p.forEach((function(e){f.push.apply(f,(0,b.Z)((0,K.aV)(u.hass,e,u.hass.entities,h).entities))})),!!f.length&&!!f.some((function(e){var i,a=u.hass.states[e];return!!a&&(!(null===(i=t.supported_features)||void 0===i||!i.some((function(e){return(0,F.e)(a,e)})))||!(!t.attribute||!Object.entries(t.attribute).some((function(e){var t=(0,m.Z)(e,2),i=t[0],n=t[1];return i in a.attributes&&function(e,t){return"object"===(0,B.Z)(t)?!!Array.isArray(t)&&t.some((function(t){return e.includes(t)})):e.includes(t)}(n,a.attributes[i])}))))}))}},{kind:"method",key:"render",value:function(){var e,t,i,f,p,y,g,b,m=this,x=this._getServiceInfo(null===(e=this._value)||void 0===e?void 0:e.service,this.hass.services),w=(null==x?void 0:x.fields.length)&&!x.hasSelector.length||x&&Object.keys((null===(t=this._value)||void 0===t?void 0:t.data)||{}).some((function(e){return!x.hasSelector.includes(e)})),Z=w&&(null==x?void 0:x.fields.find((function(e){return"entity_id"===e.key}))),j=Boolean(!w&&(null==x?void 0:x.fields.some((function(e){return U(e)})))),O=this._filterFields(x,this._value),C=null!==(i=this._value)&&void 0!==i&&i.service?(0,L.M)(this._value.service):void 0,B=null!==(f=this._value)&&void 0!==f&&f.service?(0,I.p)(this._value.service):void 0,z=B&&this.hass.localize("component.".concat(C,".services.").concat(B,".description"))||(null==x?void 0:x.description);return(0,M.dy)(a||(a=(0,k.Z)(["",' <div class="description"> '," "," </div> "," "," ",""])),this.hidePicker?M.Ld:(0,M.dy)(n||(n=(0,k.Z)(['<ha-service-picker .hass="','" .value="','" .disabled="','" @value-changed="','"></ha-service-picker>'])),this.hass,null===(p=this._value)||void 0===p?void 0:p.service,this.disabled,this._serviceChanged),z?(0,M.dy)(s||(s=(0,k.Z)(["<p>","</p>"])),z):"",this._manifest?(0,M.dy)(l||(l=(0,k.Z)([' <a href="','" title="','" target="_blank" rel="noreferrer"> <ha-icon-button .path="','" class="help-icon"></ha-icon-button> </a>'])),this._manifest.is_built_in?(0,R.R)(this.hass,"/integrations/".concat(this._manifest.domain)):this._manifest.documentation,this.hass.localize("ui.components.service-control.integration_doc"),"M15.07,11.25L14.17,12.17C13.45,12.89 13,13.5 13,15H11V14.5C11,13.39 11.45,12.39 12.17,11.67L13.41,10.41C13.78,10.05 14,9.55 14,9C14,7.89 13.1,7 12,7A2,2 0 0,0 10,9H8A4,4 0 0,1 12,5A4,4 0 0,1 16,9C16,9.88 15.64,10.67 15.07,11.25M13,19H11V17H13M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12C22,6.47 17.5,2 12,2Z"):"",x&&"target"in x?(0,M.dy)(o||(o=(0,k.Z)(['<ha-settings-row .narrow="','"> ',' <span slot="heading">','</span> <span slot="description">','</span><ha-selector .hass="','" .selector="','" .disabled="','" @value-changed="','" .value="','"></ha-selector></ha-settings-row>'])),this.narrow,j?(0,M.dy)(r||(r=(0,k.Z)(['<div slot="prefix" class="checkbox-spacer"></div>']))):"",this.hass.localize("ui.components.service-control.target"),this.hass.localize("ui.components.service-control.target_description"),this.hass,x.target?{target:x.target}:{target:{}},this.disabled,this._targetChanged,null===(y=this._value)||void 0===y?void 0:y.target):Z?(0,M.dy)(d||(d=(0,k.Z)(['<ha-entity-picker .hass="','" .disabled="','" .value="','" .label="','" @value-changed="','" allow-custom-entity></ha-entity-picker>'])),this.hass,this.disabled,null===(g=this._value)||void 0===g||null===(g=g.data)||void 0===g?void 0:g.entity_id,this.hass.localize("component.".concat(C,".services.").concat(B,".fields.entity_id.description"))||Z.description,this._entityPicked):"",this._renderReorderModeAlert(),w?(0,M.dy)(c||(c=(0,k.Z)(['<ha-yaml-editor .hass="','" .label="','" .name="','" .readOnly="','" .defaultValue="','" @value-changed="','"></ha-yaml-editor>'])),this.hass,this.hass.localize("ui.components.service-control.data"),"data",this.disabled,null===(b=this._value)||void 0===b?void 0:b.data,this._dataChanged):null==O?void 0:O.map((function(e){var t,i,a,n,s,l=null!==(t=null==e?void 0:e.selector)&&void 0!==t?t:{text:void 0},o=Object.keys(l)[0],r=["action","condition","trigger"].includes(o)?(0,_.Z)({},o,Object.assign(Object.assign({},l[o]),{},{path:[e.key]})):l,d=U(e);return e.selector&&(!e.advanced||m.showAdvanced||null!==(i=m._value)&&void 0!==i&&i.data&&void 0!==m._value.data[e.key])?(0,M.dy)(v||(v=(0,k.Z)(['<ha-settings-row .narrow="','"> ',' <span slot="heading">','</span> <span slot="description">','</span> <ha-selector .disabled="','" .hass="','" .selector="','" .key="','" @value-changed="','" .value="','" .placeholder="','" .localizeValue="','" @item-moved="','"></ha-selector> </ha-settings-row>'])),m.narrow,d?(0,M.dy)(h||(h=(0,k.Z)(['<ha-checkbox .key="','" .checked="','" .disabled="','" @change="','" slot="prefix"></ha-checkbox>'])),e.key,m._checkedKeys.has(e.key)||(null===(a=m._value)||void 0===a?void 0:a.data)&&void 0!==m._value.data[e.key],m.disabled,m._checkboxChanged):j?(0,M.dy)(u||(u=(0,k.Z)(['<div slot="prefix" class="checkbox-spacer"></div>']))):"",m.hass.localize("component.".concat(C,".services.").concat(B,".fields.").concat(e.key,".name"))||e.name||e.key,m.hass.localize("component.".concat(C,".services.").concat(B,".fields.").concat(e.key,".description"))||(null==e?void 0:e.description),m.disabled||d&&!m._checkedKeys.has(e.key)&&(!(null!==(n=m._value)&&void 0!==n&&n.data)||void 0===m._value.data[e.key]),m.hass,r,e.key,m._serviceDataChanged,null!==(s=m._value)&&void 0!==s&&s.data?m._value.data[e.key]:void 0,e.default,m._localizeValueCallback,m._itemMoved):""})))}},{kind:"method",key:"_renderReorderModeAlert",value:function(){return this._reorderMode.active?(0,M.dy)(f||(f=(0,k.Z)([' <ha-alert class="re-order" alert-type="info" .title="','"> ',' <ha-button slot="action" @click="','"> '," </ha-button> </ha-alert> "])),this.hass.localize("ui.panel.config.automation.editor.re_order_mode.title"),this.hass.localize("ui.panel.config.automation.editor.re_order_mode.description_all"),this._exitReOrderMode,this.hass.localize("ui.panel.config.automation.editor.re_order_mode.exit")):M.Ld}},{kind:"method",key:"_exitReOrderMode",value:(C=(0,g.Z)((0,y.Z)().mark((function e(){return(0,y.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:this._reorderMode.exit();case 1:case"end":return e.stop()}}),e,this)}))),function(){return C.apply(this,arguments)})},{kind:"field",key:"_localizeValueCallback",value:function(){var e=this;return function(t){var i;return null!==(i=e._value)&&void 0!==i&&i.service?e.hass.localize("component.".concat((0,L.M)(e._value.service),".selector.").concat(t)):""}}},{kind:"method",key:"_checkboxChanged",value:function(e){var t,i=e.currentTarget.checked,a=e.currentTarget.key;if(i){var n,s;this._checkedKeys.add(a);var l,o,r=null===(n=this._getServiceInfo(null===(s=this._value)||void 0===s?void 0:s.service,this.hass.services))||void 0===n?void 0:n.fields.find((function(e){return e.key===a})),d=null==r?void 0:r.default;if(null==d&&null!=r&&r.selector&&"constant"in r.selector)d=null===(l=r.selector.constant)||void 0===l?void 0:l.value;if(null==d&&null!=r&&r.selector&&"boolean"in r.selector&&(d=!1),null!=d)t=Object.assign(Object.assign({},null===(o=this._value)||void 0===o?void 0:o.data),{},(0,_.Z)({},a,d))}else{var c;this._checkedKeys.delete(a),delete(t=Object.assign({},null===(c=this._value)||void 0===c?void 0:c.data))[a]}t&&(0,P.B)(this,"value-changed",{value:Object.assign(Object.assign({},this._value),{},{data:t})}),this.requestUpdate("_checkedKeys")}},{kind:"method",key:"_serviceChanged",value:function(e){var t,i=this;if(e.stopPropagation(),e.detail.value!==(null===(t=this._value)||void 0===t?void 0:t.service)){var a,n=e.detail.value||"";if(n){var s,l=this._getServiceInfo(n,this.hass.services),o=null===(s=this._value)||void 0===s?void 0:s.target;if(o&&null!=l&&l.target){var r,d,c,v,u,h,f={target:Object.assign({},l.target)},p=(null===(r=(0,A.r)(o.entity_id||(null===(d=this._value.data)||void 0===d?void 0:d.entity_id)))||void 0===r?void 0:r.slice())||[],y=(null===(c=(0,A.r)(o.device_id||(null===(v=this._value.data)||void 0===v?void 0:v.device_id)))||void 0===c?void 0:c.slice())||[],g=(null===(u=(0,A.r)(o.area_id||(null===(h=this._value.data)||void 0===h?void 0:h.area_id)))||void 0===u?void 0:u.slice())||[];g.length&&(g=g.filter((function(e){return(0,K.vI)(i.hass,i.hass.entities,i.hass.devices,e,f)}))),y.length&&(y=y.filter((function(e){return(0,K.qJ)(i.hass,Object.values(i.hass.entities),i.hass.devices[e],f)}))),p.length&&(p=p.filter((function(e){return(0,K.QQ)(i.hass.states[e],f)}))),a=Object.assign(Object.assign(Object.assign({},p.length?{entity_id:p}:{}),y.length?{device_id:y}:{}),g.length?{area_id:g}:{})}}var _={service:n,target:a};(0,P.B)(this,"value-changed",{value:_})}}},{kind:"method",key:"_entityPicked",value:function(e){var t,i;e.stopPropagation();var a=e.detail.value;if((null===(t=this._value)||void 0===t||null===(t=t.data)||void 0===t?void 0:t.entity_id)!==a){var n,s;if(!a&&null!==(i=this._value)&&void 0!==i&&i.data)delete(n=Object.assign({},this._value)).data.entity_id;else n=Object.assign(Object.assign({},this._value),{},{data:Object.assign(Object.assign({},null===(s=this._value)||void 0===s?void 0:s.data),{},{entity_id:e.detail.value})});(0,P.B)(this,"value-changed",{value:n})}}},{kind:"method",key:"_targetChanged",value:function(e){var t;e.stopPropagation();var i,a=e.detail.value;(null===(t=this._value)||void 0===t?void 0:t.target)!==a&&(a?i=Object.assign(Object.assign({},this._value),{},{target:e.detail.value}):delete(i=Object.assign({},this._value)).target,(0,P.B)(this,"value-changed",{value:i}))}},{kind:"method",key:"_serviceDataChanged",value:function(e){var t,i,a;e.stopPropagation();var n=e.currentTarget.key,s=e.detail.value;if((null===(t=this._value)||void 0===t||null===(t=t.data)||void 0===t?void 0:t[n])!==s&&(null!==(i=this._value)&&void 0!==i&&null!==(i=i.data)&&void 0!==i&&i[n]||""!==s&&void 0!==s)){var l=Object.assign(Object.assign({},null===(a=this._value)||void 0===a?void 0:a.data),{},(0,_.Z)({},n,s));""!==s&&void 0!==s||delete l[n],(0,P.B)(this,"value-changed",{value:Object.assign(Object.assign({},this._value),{},{data:l})})}}},{kind:"method",key:"_itemMoved",value:function(e){var t,i;e.stopPropagation();var a=e.detail,n=a.oldIndex,s=a.newIndex,l=a.oldPath,o=a.newPath,r=null!==(t=null===(i=this.value)||void 0===i?void 0:i.data)&&void 0!==t?t:{},d=(0,E.b)(r,n,s,l,o);(0,P.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.value),{},{data:d})})}},{kind:"method",key:"_dataChanged",value:function(e){e.stopPropagation(),e.detail.isValid&&(0,P.B)(this,"value-changed",{value:Object.assign(Object.assign({},this._value),{},{data:e.detail.value})})}},{kind:"method",key:"_fetchManifest",value:(i=(0,g.Z)((0,y.Z)().mark((function e(t){return(0,y.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return this._manifest=void 0,e.prev=1,e.next=4,(0,V.t4)(this.hass,t);case 4:this._manifest=e.sent,e.next=9;break;case 7:e.prev=7,e.t0=e.catch(1);case 9:case"end":return e.stop()}}),e,this,[[1,7]])}))),function(e){return i.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,M.iv)(p||(p=(0,k.Z)(["ha-settings-row{padding:var(--service-control-padding,0 16px)}ha-settings-row{--paper-time-input-justify-content:flex-end;--settings-row-content-width:100%;--settings-row-prefix-display:contents;border-top:var(--service-control-items-border-top,1px solid var(--divider-color))}ha-entity-picker,ha-service-picker,ha-yaml-editor{display:block;margin:var(--service-control-padding,0 16px)}ha-yaml-editor{padding:16px 0}p{margin:var(--service-control-padding,0 16px);padding:16px 0}:host([hidePicker]) p{padding-top:0}.checkbox-spacer{width:32px}ha-checkbox{margin-left:-16px}.help-icon{color:var(--secondary-text-color)}.description{justify-content:space-between;display:flex;align-items:center;padding-right:2px}"])))}}]}}),(0,T.j)(M.oi))},52910:function(e,t,i){var a,n,s=i(40039),l=i(33368),o=i(71650),r=i(68308),d=i(82390),c=i(69205),v=i(91808),u=i(88962),h=(i(22859),i(97393),i(46798),i(9849),i(50289),i(94167),i(37313),i(65974),i(36513),i(87438),i(22890),i(40271),i(60163),i(44577),i(5095)),f=i(95260),p=i(14516),y=i(18394),g=i(64346),_=(i(16591),function(e){return(0,h.dy)(a||(a=(0,u.Z)(["<mwc-list-item twoline> <span>",'</span> <span slot="secondary">',"</span> </mwc-list-item>"])),e.name,e.name===e.service?"":e.service)});(0,v.Z)([(0,f.Mo)("ha-service-picker")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var a=arguments.length,n=new Array(a),s=0;s<a;s++)n[s]=arguments[s];return t=(0,r.Z)(this,i,[].concat(n)),e((0,d.Z)(t)),t}return(0,c.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,f.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,f.SB)()],key:"_filter",value:void 0},{kind:"method",key:"willUpdate",value:function(){this.hasUpdated||this.hass.loadBackendTranslation("services")}},{kind:"method",key:"render",value:function(){return(0,h.dy)(n||(n=(0,u.Z)([' <ha-combo-box .hass="','" .label="','" .filteredItems="','" .value="','" .disabled="','" .renderer="','" item-value-path="service" item-label-path="name" allow-custom-value @filter-changed="','" @value-changed="','"></ha-combo-box> '])),this.hass,this.hass.localize("ui.components.service-picker.service"),this._filteredServices(this.hass.localize,this.hass.services,this._filter),this.value,this.disabled,_,this._filterChanged,this._valueChanged)}},{kind:"field",key:"_services",value:function(){var e=this;return(0,p.Z)((function(t,i){if(!i)return[];var a=[];return Object.keys(i).sort().forEach((function(n){var l,o=Object.keys(i[n]).sort(),r=(0,s.Z)(o);try{for(r.s();!(l=r.n()).done;){var d=l.value;a.push({service:"".concat(n,".").concat(d),name:"".concat((0,g.Lh)(t,n),": ").concat(e.hass.localize("component.".concat(n,".services.").concat(d,".name"))||i[n][d].name||d)})}}catch(c){r.e(c)}finally{r.f()}})),a}))}},{kind:"field",key:"_filteredServices",value:function(){var e=this;return(0,p.Z)((function(t,i,a){if(!i)return[];var n=e._services(t,i);return a?n.filter((function(e){var t;return e.service.toLowerCase().includes(a)||(null===(t=e.name)||void 0===t?void 0:t.toLowerCase().includes(a))})):n}))}},{kind:"method",key:"_filterChanged",value:function(e){this._filter=e.detail.value.toLowerCase()}},{kind:"method",key:"_valueChanged",value:function(e){this.value=e.detail.value,(0,y.B)(this,"change"),(0,y.B)(this,"value-changed",{value:this.value})}}]}}),h.oi)},3017:function(e,t,i){var a,n,s=i(88962),l=i(33368),o=i(71650),r=i(68308),d=i(82390),c=i(69205),v=i(91808),u=(i(97393),i(5095)),h=i(95260);(0,v.Z)([(0,h.Mo)("ha-settings-row")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var a=arguments.length,n=new Array(a),s=0;s<a;s++)n[s]=arguments[s];return t=(0,r.Z)(this,i,[].concat(n)),e((0,d.Z)(t)),t}return(0,c.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)({type:Boolean,attribute:"three-line"})],key:"threeLine",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,u.dy)(a||(a=(0,s.Z)([' <div class="prefix-wrap"> <slot name="prefix"></slot> <div class="body" ?two-line="','" ?three-line="','"> <slot name="heading"></slot> <div class="secondary"><slot name="description"></slot></div> </div> </div> <div class="content"><slot></slot></div> '])),!this.threeLine,this.threeLine)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,u.iv)(n||(n=(0,s.Z)([":host{display:flex;padding:0 16px;align-content:normal;align-self:auto;align-items:center}.body{padding-top:8px;padding-bottom:8px;padding-left:0;padding-inline-start:0;padding-right:16x;padding-inline-end:16px;overflow:hidden;display:var(--layout-vertical_-_display);flex-direction:var(--layout-vertical_-_flex-direction);justify-content:var(--layout-center-justified_-_justify-content);flex:var(--layout-flex_-_flex);flex-basis:var(--layout-flex_-_flex-basis)}.body[three-line]{min-height:var(--paper-item-body-three-line-min-height,88px)}.body>*{overflow:hidden;text-overflow:ellipsis;white-space:nowrap}.body>.secondary{display:block;padding-top:4px;font-family:var(\n          --mdc-typography-body2-font-family,\n          var(--mdc-typography-font-family, Roboto, sans-serif)\n        );-webkit-font-smoothing:antialiased;font-size:var(--mdc-typography-body2-font-size, .875rem);font-weight:var(--mdc-typography-body2-font-weight,400);line-height:normal;color:var(--secondary-text-color)}.body[two-line]{min-height:calc(var(--paper-item-body-two-line-min-height,72px) - 16px);flex:1}.content{display:contents}:host(:not([narrow])) .content{display:var(--settings-row-content-display,flex);justify-content:flex-end;flex:1;padding:16px 0}.content ::slotted(*){width:var(--settings-row-content-width)}:host([narrow]){align-items:normal;flex-direction:column;border-top:1px solid var(--divider-color);padding-bottom:8px}::slotted(ha-switch){padding:16px 0}.secondary{white-space:normal}.prefix-wrap{display:var(--settings-row-prefix-display)}:host([narrow]) .prefix-wrap{display:flex;align-items:center}"])))}}]}}),u.oi)},64346:function(e,t,i){i.d(t,{F3:function(){return n},Lh:function(){return a},t4:function(){return s}});i(22859);var a=function(e,t,i){return e("component.".concat(t,".title"))||(null==i?void 0:i.name)||t},n=function(e,t){var i={type:"manifest/list"};return t&&(i.integrations=t),e.callWS(i)},s=function(e,t){return e.callWS({type:"manifest/get",integration:t})}},84728:function(e,t,i){i.d(t,{R:function(){return a}});i(97393),i(40271),i(60163);var a=function(e,t){return"https://".concat(e.config.version.includes("b")?"rc":e.config.version.includes("dev")?"next":"www",".home-assistant.io").concat(t)}}}]);
+//# sourceMappingURL=4871.l_BZ6LW4UxI.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 4993.2Bj2KZPrX1E.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[4993],{92353:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),h=(n(97393),n(76843),n(85717),n(5095)),d=n(95260),f=n(18394);n(64106),(0,l.Z)([(0,d.Mo)("ha-duration-input")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"data",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"enableMillisecond",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"enableDay",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,d.IO)("paper-time-input",!0)],key:"_input",value:void 0},{kind:"method",key:"focus",value:function(){this._input&&this._input.focus()}},{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,i.Z)([' <ha-base-time-input .label="','" .helper="','" .required="','" .autoValidate="','" .disabled="','" errorMessage="Required" enableSecond .enableMillisecond="','" .enableDay="','" format="24" .days="','" .hours="','" .minutes="','" .seconds="','" .milliseconds="','" @value-changed="','" noHoursLimit dayLabel="dd" hourLabel="hh" minLabel="mm" secLabel="ss" millisecLabel="ms"></ha-base-time-input> '])),this.label,this.helper,this.required,this.required,this.disabled,this.enableMillisecond,this.enableDay,this._days,this._hours,this._minutes,this._seconds,this._milliseconds,this._durationChanged)}},{kind:"get",key:"_days",value:function(){var t;return null!==(t=this.data)&&void 0!==t&&t.days?Number(this.data.days):0}},{kind:"get",key:"_hours",value:function(){var t;return null!==(t=this.data)&&void 0!==t&&t.hours?Number(this.data.hours):0}},{kind:"get",key:"_minutes",value:function(){var t;return null!==(t=this.data)&&void 0!==t&&t.minutes?Number(this.data.minutes):0}},{kind:"get",key:"_seconds",value:function(){var t;return null!==(t=this.data)&&void 0!==t&&t.seconds?Number(this.data.seconds):0}},{kind:"get",key:"_milliseconds",value:function(){var t;return null!==(t=this.data)&&void 0!==t&&t.milliseconds?Number(this.data.milliseconds):0}},{kind:"method",key:"_durationChanged",value:function(t){t.stopPropagation();var e,n=Object.assign({},t.detail.value);(this.enableMillisecond||n.milliseconds?n.milliseconds>999&&(n.seconds+=Math.floor(n.milliseconds/1e3),n.milliseconds%=1e3):delete n.milliseconds,n.seconds>59&&(n.minutes+=Math.floor(n.seconds/60),n.seconds%=60),n.minutes>59&&(n.hours+=Math.floor(n.minutes/60),n.minutes%=60),this.enableDay&&n.hours>24)&&(n.days=(null!==(e=n.days)&&void 0!==e?e:0)+Math.floor(n.hours/24),n.hours%=24);(0,f.B)(this,"value-changed",{value:n})}}]}}),h.oi)},4993:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,r=(t=i().mark((function t(r,o){var a,c,s,u,l,h,d,f,v,p,y,g,m,b,_;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.r(e),n.d(e,{HaActionSelector:function(){return _}}),a=n(88962),c=n(33368),s=n(71650),u=n(68308),l=n(82390),h=n(69205),d=n(91808),n(97393),f=n(5095),v=n(95260),p=n(48866),!(y=r([p])).then){t.next=23;break}return t.next=19,y;case 19:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=24;break;case 23:t.t0=y;case 24:p=t.t0[0],_=(0,d.Z)([(0,v.Mo)("ha-selector-action")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,h.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"method",key:"render",value:function(){var t;return(0,f.dy)(g||(g=(0,a.Z)([" ",' <ha-automation-action .disabled="','" .actions="','" .hass="','" .path="','"></ha-automation-action> '])),this.label?(0,f.dy)(m||(m=(0,a.Z)(["<label>","</label>"])),this.label):f.Ld,this.disabled,this.value||[],this.hass,null===(t=this.selector.action)||void 0===t?void 0:t.path)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,f.iv)(b||(b=(0,a.Z)(["ha-automation-action{display:block;margin-bottom:16px}:host([disabled]) ha-automation-action{opacity:var(--light-disabled-opacity);pointer-events:none}label{display:block;margin-bottom:4px;font-weight:500}"])))}}]}}),f.oi),o(),t.next=32;break;case 29:t.prev=29,t.t2=t.catch(0),o(t.t2);case 32:case"end":return t.stop()}}),t,null,[[0,29]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},22581:function(t,e,n){n.d(e,{Ko:function(){return a},cs:function(){return c},du:function(){return r},ko:function(){return s},lL:function(){return i},s3:function(){return o}});n(51358),n(46798),n(78399),n(5239),n(56086),n(47884),n(81912),n(64584),n(41483),n(12367),n(9454),n(98490),n(88640);var r={condition:"M4 2A2 2 0 0 0 2 4V12H4V8H6V12H8V4A2 2 0 0 0 6 2H4M4 4H6V6H4M22 15.5V14A2 2 0 0 0 20 12H16V22H20A2 2 0 0 0 22 20V18.5A1.54 1.54 0 0 0 20.5 17A1.54 1.54 0 0 0 22 15.5M20 20H18V18H20V20M20 16H18V14H20M5.79 21.61L4.21 20.39L18.21 2.39L19.79 3.61Z",delay:"M12,20A7,7 0 0,1 5,13A7,7 0 0,1 12,6A7,7 0 0,1 19,13A7,7 0 0,1 12,20M19.03,7.39L20.45,5.97C20,5.46 19.55,5 19.04,4.56L17.62,6C16.07,4.74 14.12,4 12,4A9,9 0 0,0 3,13A9,9 0 0,0 12,22C17,22 21,17.97 21,13C21,10.88 20.26,8.93 19.03,7.39M11,14H13V8H11M15,1H9V3H15V1Z",event:"M10,9A1,1 0 0,1 11,8A1,1 0 0,1 12,9V13.47L13.21,13.6L18.15,15.79C18.68,16.03 19,16.56 19,17.14V21.5C18.97,22.32 18.32,22.97 17.5,23H11C10.62,23 10.26,22.85 10,22.57L5.1,18.37L5.84,17.6C6.03,17.39 6.3,17.28 6.58,17.28H6.8L10,19V9M11,5A4,4 0 0,1 15,9C15,10.5 14.2,11.77 13,12.46V11.24C13.61,10.69 14,9.89 14,9A3,3 0 0,0 11,6A3,3 0 0,0 8,9C8,9.89 8.39,10.69 9,11.24V12.46C7.8,11.77 7,10.5 7,9A4,4 0 0,1 11,5M11,3A6,6 0 0,1 17,9C17,10.7 16.29,12.23 15.16,13.33L14.16,12.88C15.28,11.96 16,10.56 16,9A5,5 0 0,0 11,4A5,5 0 0,0 6,9C6,11.05 7.23,12.81 9,13.58V14.66C6.67,13.83 5,11.61 5,9A6,6 0 0,1 11,3Z",play_media:"M8,5.14V19.14L19,12.14L8,5.14Z",activate_scene:"M17.5,12A1.5,1.5 0 0,1 16,10.5A1.5,1.5 0 0,1 17.5,9A1.5,1.5 0 0,1 19,10.5A1.5,1.5 0 0,1 17.5,12M14.5,8A1.5,1.5 0 0,1 13,6.5A1.5,1.5 0 0,1 14.5,5A1.5,1.5 0 0,1 16,6.5A1.5,1.5 0 0,1 14.5,8M9.5,8A1.5,1.5 0 0,1 8,6.5A1.5,1.5 0 0,1 9.5,5A1.5,1.5 0 0,1 11,6.5A1.5,1.5 0 0,1 9.5,8M6.5,12A1.5,1.5 0 0,1 5,10.5A1.5,1.5 0 0,1 6.5,9A1.5,1.5 0 0,1 8,10.5A1.5,1.5 0 0,1 6.5,12M12,3A9,9 0 0,0 3,12A9,9 0 0,0 12,21A1.5,1.5 0 0,0 13.5,19.5C13.5,19.11 13.35,18.76 13.11,18.5C12.88,18.23 12.73,17.88 12.73,17.5A1.5,1.5 0 0,1 14.23,16H16A5,5 0 0,0 21,11C21,6.58 16.97,3 12,3Z",service:"M12,5A2,2 0 0,1 14,7C14,7.24 13.96,7.47 13.88,7.69C17.95,8.5 21,11.91 21,16H3C3,11.91 6.05,8.5 10.12,7.69C10.04,7.47 10,7.24 10,7A2,2 0 0,1 12,5M22,19H2V17H22V19Z",wait_template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",wait_for_trigger:"M12,9A2,2 0 0,1 10,7C10,5.89 10.9,5 12,5C13.11,5 14,5.89 14,7A2,2 0 0,1 12,9M12,14A2,2 0 0,1 10,12C10,10.89 10.9,10 12,10C13.11,10 14,10.89 14,12A2,2 0 0,1 12,14M12,19A2,2 0 0,1 10,17C10,15.89 10.9,15 12,15C13.11,15 14,15.89 14,17A2,2 0 0,1 12,19M20,10H17V8.86C18.72,8.41 20,6.86 20,5H17V4A1,1 0 0,0 16,3H8A1,1 0 0,0 7,4V5H4C4,6.86 5.28,8.41 7,8.86V10H4C4,11.86 5.28,13.41 7,13.86V15H4C4,16.86 5.28,18.41 7,18.86V20A1,1 0 0,0 8,21H16A1,1 0 0,0 17,20V18.86C18.72,18.41 20,16.86 20,15H17V13.86C18.72,13.41 20,11.86 20,10Z",repeat:"M17.65,6.35C16.2,4.9 14.21,4 12,4A8,8 0 0,0 4,12A8,8 0 0,0 12,20C15.73,20 18.84,17.45 19.73,14H17.65C16.83,16.33 14.61,18 12,18A6,6 0 0,1 6,12A6,6 0 0,1 12,6C13.66,6 15.14,6.69 16.22,7.78L13,11H20V4L17.65,6.35Z",choose:"M11,5H8L12,1L16,5H13V9.43C12.25,9.89 11.58,10.46 11,11.12V5M22,11L18,7V10C14.39,9.85 11.31,12.57 11,16.17C9.44,16.72 8.62,18.44 9.17,20C9.72,21.56 11.44,22.38 13,21.83C14.56,21.27 15.38,19.56 14.83,18C14.53,17.14 13.85,16.47 13,16.17C13.47,12.17 17.47,11.97 17.95,11.97V14.97L22,11M10.63,11.59C9.3,10.57 7.67,10 6,10V7L2,11L6,15V12C7.34,12.03 8.63,12.5 9.64,13.4C9.89,12.76 10.22,12.15 10.63,11.59Z",if:"M14,4L16.29,6.29L13.41,9.17L14.83,10.59L17.71,7.71L20,10V4M10,4H4V10L6.29,7.71L11,12.41V20H13V11.59L7.71,6.29",device_id:"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z",stop:"M13 24C9.74 24 6.81 22 5.6 19L2.57 11.37C2.26 10.58 3 9.79 3.81 10.05L4.6 10.31C5.16 10.5 5.62 10.92 5.84 11.47L7.25 15H8V3.25C8 2.56 8.56 2 9.25 2S10.5 2.56 10.5 3.25V12H11.5V1.25C11.5 .56 12.06 0 12.75 0S14 .56 14 1.25V12H15V2.75C15 2.06 15.56 1.5 16.25 1.5C16.94 1.5 17.5 2.06 17.5 2.75V12H18.5V5.75C18.5 5.06 19.06 4.5 19.75 4.5S21 5.06 21 5.75V16C21 20.42 17.42 24 13 24Z",parallel:"M16,4.5V7H5V9H16V11.5L19.5,8M16,12.5V15H5V17H16V19.5L19.5,16",variables:"M21 2H3C1.9 2 1 2.9 1 4V20C1 21.1 1.9 22 3 22H21C22.1 22 23 21.1 23 20V4C23 2.9 22.1 2 21 2M21 20H3V6H21V20M16.6 8C18.1 9.3 19 11.1 19 13C19 14.9 18.1 16.7 16.6 18L15 17.4C16.3 16.4 17 14.7 17 13S16.3 9.6 15 8.6L16.6 8M7.4 8L9 8.6C7.7 9.6 7 11.3 7 13S7.7 16.4 9 17.4L7.4 18C5.9 16.7 5 14.9 5 13S5.9 9.3 7.4 8M12.1 12L13.5 10H15L12.8 13L14.1 16H12.8L12 14L10.6 16H9L11.3 12.9L10 10H11.3L12.1 12Z"},i=new Set(["variables"]),o={device_id:{},helpers:{icon:"M21.71 20.29L20.29 21.71A1 1 0 0 1 18.88 21.71L7 9.85A3.81 3.81 0 0 1 6 10A4 4 0 0 1 2.22 4.7L4.76 7.24L5.29 6.71L6.71 5.29L7.24 4.76L4.7 2.22A4 4 0 0 1 10 6A3.81 3.81 0 0 1 9.85 7L21.71 18.88A1 1 0 0 1 21.71 20.29M2.29 18.88A1 1 0 0 0 2.29 20.29L3.71 21.71A1 1 0 0 0 5.12 21.71L10.59 16.25L7.76 13.42M20 2L16 4V6L13.83 8.17L15.83 10.17L18 8H20L22 4Z",members:{}},building_blocks:{icon:"M18.5 18.5C19.04 18.5 19.5 18.96 19.5 19.5S19.04 20.5 18.5 20.5H6.5C5.96 20.5 5.5 20.04 5.5 19.5S5.96 18.5 6.5 18.5H18.5M18.5 17H6.5C5.13 17 4 18.13 4 19.5S5.13 22 6.5 22H18.5C19.88 22 21 20.88 21 19.5S19.88 17 18.5 17M21 11H18V7H13L10 11V16H22L21 11M11.54 11L13.5 8.5H16V11H11.54M9.76 3.41L4.76 2L2 11.83C1.66 13.11 2.41 14.44 3.7 14.8L4.86 15.12L8.15 12.29L4.27 11.21L6.15 4.46L8.94 5.24C9.5 5.53 10.71 6.34 11.47 7.37L12.5 6H12.94C11.68 4.41 9.85 3.46 9.76 3.41Z",members:{condition:{},delay:{},wait_template:{},wait_for_trigger:{},repeat:{},choose:{},if:{},stop:{},parallel:{},variables:{}}},other:{icon:"M16,12A2,2 0 0,1 18,10A2,2 0 0,1 20,12A2,2 0 0,1 18,14A2,2 0 0,1 16,12M10,12A2,2 0 0,1 12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12M4,12A2,2 0 0,1 6,10A2,2 0 0,1 8,12A2,2 0 0,1 6,14A2,2 0 0,1 4,12Z",members:{event:{},service:{}}}},a="__SERVICE__",c=function(t){return null==t?void 0:t.startsWith(a)},s=function(t){return t.substring(a.length)}},11420:function(t,e,n){n.d(e,{Pw:function(){return l},TL:function(){return c}});n(46798),n(7179);var r=n(38768),i=n(58135),o=(n(38480),(0,i.z)(["queued","parallel"]),(0,r.Ry)({alias:(0,r.jt)((0,r.Z_)()),continue_on_error:(0,r.jt)((0,r.O7)()),enabled:(0,r.jt)((0,r.O7)())})),a=(0,r.Ry)({entity_id:(0,r.jt)((0,r.G0)([(0,r.Z_)(),(0,r.IX)((0,r.Z_)())])),device_id:(0,r.jt)((0,r.G0)([(0,r.Z_)(),(0,r.IX)((0,r.Z_)())])),area_id:(0,r.jt)((0,r.G0)([(0,r.Z_)(),(0,r.IX)((0,r.Z_)())]))}),c=(0,r.f0)(o,(0,r.Ry)({service:(0,r.jt)((0,r.Z_)()),service_template:(0,r.jt)((0,r.Z_)()),entity_id:(0,r.jt)((0,r.Z_)()),target:(0,r.jt)(a),data:(0,r.jt)((0,r.Ry)()),response_variable:(0,r.jt)((0,r.Z_)()),metadata:(0,r.jt)((0,r.Ry)())})),s=(0,r.f0)(o,(0,r.Ry)({service:(0,r.i0)("media_player.play_media"),target:(0,r.jt)((0,r.Ry)({entity_id:(0,r.jt)((0,r.Z_)())})),entity_id:(0,r.jt)((0,r.Z_)()),data:(0,r.Ry)({media_content_id:(0,r.Z_)(),media_content_type:(0,r.Z_)()}),metadata:(0,r.Ry)()})),u=(0,r.f0)(o,(0,r.Ry)({service:(0,r.i0)("scene.turn_on"),target:(0,r.jt)((0,r.Ry)({entity_id:(0,r.jt)((0,r.Z_)())})),entity_id:(0,r.jt)((0,r.Z_)()),metadata:(0,r.Ry)()})),l=function(t){if("delay"in t)return"delay";if("wait_template"in t)return"wait_template";if(["condition","and","or","not"].some((function(e){return e in t})))return"check_condition";if("event"in t)return"fire_event";if("device_id"in t)return"device_action";if("scene"in t)return"activate_scene";if("repeat"in t)return"repeat";if("choose"in t)return"choose";if("if"in t)return"if";if("wait_for_trigger"in t)return"wait_for_trigger";if("variables"in t)return"variables";if("stop"in t)return"stop";if("parallel"in t)return"parallel";if("service"in t){if("metadata"in t){if((0,r.is)(t,u))return"activate_scene";if((0,r.is)(t,s))return"play_media"}return"service"}return"unknown"}},35422:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,i,o,a,c=[],s=!0,u=!1;try{if(o=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=o.call(n)).done)&&(c.push(r.value),c.length!==e);s=!0);}catch(t){u=!0,i=t}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return c}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);"Object"===n&&t.constructor&&(n=t.constructor.name);if("Map"===n||"Set"===n)return Array.from(t);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function c(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,r=(t=i().mark((function t(r,a){var c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x,L,C,Z;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{Q:function(){return C}}),c=n(40039),s=n(62746),n(82073),n(36513),n(40271),n(60163),n(22859),n(97393),n(65974),n(7179),n(46349),n(70320),n(88770),u=n(4771),l=n(57128),h=n(93312),d=n(2733),f=n(86603),v=n(13426),p=n(44553),y=n(25917),g=n(16061),m=n(15306),b=n(64346),_=n(11420),!(w=r([l,f,p])).then){t.next=46;break}return t.next=42,w;case 42:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=47;break;case 46:t.t0=w;case 47:k=t.t0,x=o(k,3),l=x[0],f=x[1],p=x[2],L="ui.panel.config.automation.editor.actions.type",C=function(t,e,n,r){var i=arguments.length>4&&void 0!==arguments[4]&&arguments[4];try{return Z(t,e,n,r,i)}catch(a){console.error(a);var o="Error in describing action";return a.message&&(o+=": "+a.message),o}},Z=function(t,e,n,r){var i=arguments.length>4&&void 0!==arguments[4]&&arguments[4];if(n.alias&&!i)return n.alias;if(r||(r=(0,_.Pw)(n)),"service"===r){var o=n,a=[];if(o.target)for(var w=0,k=Object.entries({area_id:"areas",device_id:"devices",entity_id:"entities"});w<k.length;w++){var x=(0,s.Z)(k[w],2),C=x[0],Z=x[1];if(C in o.target){var E,A=Array.isArray(o.target[C])?o.target[C]:[o.target[C]],O=(0,c.Z)(A);try{for(O.s();!(E=O.n()).done;){var j=E.value;if((0,v.J)(j)){a.push(t.localize("".concat(L,".service.description.target_template"),{name:Z}));break}if("entity_id"===C)if(j.includes(".")){var V=t.states[j];V?a.push((0,d.C)(V)):a.push(j)}else{var H=(0,m.Mw)(e)[j];H?a.push((0,m.vA)(t,H)||j):a.push(t.localize("".concat(L,".service.description.target_unknown_entity")))}else if("device_id"===C){var M=t.devices[j];M?a.push((0,g.jL)(M,t)):a.push(t.localize("".concat(L,".service.description.target_unknown_device")))}else if("area_id"===C){var S=t.areas[j];null!=S&&S.name?a.push(S.name):a.push(t.localize("".concat(L,".service.description.target_unknown_area")))}else a.push(j)}}catch(pt){O.e(pt)}finally{O.f()}}}if(o.service_template||o.service&&(0,v.J)(o.service))return t.localize("".concat(L,".service.description.service_based_on_template"),{targets:(0,f.z)(t.locale,a)});if(o.service){var P,z=o.service.split(".",2),N=(0,s.Z)(z,2),B=N[0],G=N[1],T=t.localize("component.".concat(B,".services.").concat(G,".name"))||(null===(P=t.services[B][G])||void 0===P?void 0:P.name);return o.metadata?t.localize("".concat(L,".service.description.service_name"),{domain:(0,b.Lh)(t.localize,B),name:T||o.service,targets:(0,f.z)(t.locale,a)}):t.localize("".concat(L,".service.description.service_based_on_name"),{name:T?"".concat((0,b.Lh)(t.localize,B),": ").concat(T):o.service,targets:(0,f.z)(t.locale,a)})}return t.localize("".concat(L,".service.description.service"))}if("delay"===r){var F,I=n;return F="number"==typeof I.delay?t.localize("".concat(L,".delay.description.duration_string"),{string:(0,h.Z)(I.delay)}):"string"==typeof I.delay?(0,v.J)(I.delay)?t.localize("".concat(L,".delay.description.duration_template")):t.localize("".concat(L,".delay.description.duration_string"),{string:I.delay||t.localize("".concat(L,".delay.description.duration_unknown"))}):I.delay?t.localize("".concat(L,".delay.description.duration_string"),{string:(0,l.L)(t.locale,I.delay)}):t.localize("".concat(L,".delay.description.duration_string"),{string:t.localize("".concat(L,".delay.description.duration_unknown"))}),t.localize("".concat(L,".delay.description.full"),{duration:F})}if("activate_scene"===r){var D,Y,R=n;if(!(D="scene"in R?R.scene:(null===(Y=R.target)||void 0===Y?void 0:Y.entity_id)||R.entity_id))return t.localize("".concat(L,".activate_scene.description.activate_scene"));var q=D?t.states[D]:void 0;return t.localize("".concat(L,".activate_scene.description.activate_scene_with_name"),{name:q?(0,d.C)(q):D})}if("play_media"===r){var U,K=n,Q=(null===(U=K.target)||void 0===U?void 0:U.entity_id)||K.entity_id,$=Q?t.states[Q]:void 0;return t.localize("".concat(L,".play_media.description.full"),{hasMedia:K.metadata.title||K.data.media_content_id?"true":"false",media:K.metadata.title||K.data.media_content_id,hasMediaPlayer:$||void 0!==Q?"true":"false",mediaPlayer:$?(0,d.C)($):Q})}if("wait_for_trigger"===r){var J=n,W=(0,u.r)(J.wait_for_trigger);return W&&0!==W.length?t.localize("".concat(L,".wait_for_trigger.description.wait_for_triggers"),{count:W.length}):t.localize("".concat(L,".wait_for_trigger.description.wait_for_a_trigger"))}if("variables"===r){var X=n;return t.localize("".concat(L,".variables.description.full"),{names:(0,f.z)(t.locale,Object.keys(X.variables))})}if("fire_event"===r){var tt=n;return(0,v.J)(tt.event)?t.localize("".concat(L,".event.description.full"),{name:t.localize("".concat(L,".event.description.template"))}):t.localize("".concat(L,".event.description.full"),{name:tt.event})}if("wait_template"===r)return t.localize("".concat(L,".wait_template.description.full"));if("stop"===r){var et=n;return t.localize("".concat(L,".stop.description.full"),{hasReason:void 0!==et.stop?"true":"false",reason:et.stop})}if("if"===r)return void 0!==n.else?t.localize("".concat(L,".if.description.if_else")):t.localize("".concat(L,".if.description.if"));if("choose"===r){var nt=n;if(nt.choose){var rt=(0,u.r)(nt.choose).length+(nt.default?1:0);return t.localize("".concat(L,".choose.description.full"),{number:rt})}return t.localize("".concat(L,".choose.description.no_action"))}if("repeat"===r){var it=n,ot="";if("count"in it.repeat){var at=it.repeat.count;ot=t.localize("".concat(L,".repeat.description.count"),{count:at})}else if("while"in it.repeat){var ct=(0,u.r)(it.repeat.while);ot=t.localize("".concat(L,".repeat.description.while_count"),{count:ct.length})}else if("until"in it.repeat){var st=(0,u.r)(it.repeat.until);ot=t.localize("".concat(L,".repeat.description.until_count"),{count:st.length})}else if("for_each"in it.repeat){var ut=(0,u.r)(it.repeat.for_each).map((function(t){return JSON.stringify(t)}));ot=t.localize("".concat(L,".repeat.description.for_each"),{items:(0,f.z)(t.locale,ut)})}return t.localize("".concat(L,".repeat.description.full"),{chosenAction:ot})}if("check_condition"===r)return t.localize("".concat(L,".check_condition.description.full"),{condition:(0,p.m)(n,t,e)});if("device_action"===r){var lt=n;if(!lt.device_id)return t.localize("".concat(L,".device_id.description.no_device"));var ht=(0,y._2)(t,e,lt);if(ht)return ht;var dt=t.states[lt.entity_id];return"".concat(lt.type||"Perform action with"," ").concat(dt?(0,d.C)(dt):lt.entity_id)}if("parallel"===r){var ft=n,vt=(0,u.r)(ft.parallel).length;return t.localize("".concat(L,".parallel.description.full"),{number:vt})}return r},a(),t.next=61;break;case 58:t.prev=58,t.t2=t.catch(0),a(t.t2);case 61:case"end":return t.stop()}}),t,null,[[0,58]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var o=t.apply(e,n);function a(t){c(o,r,i,a,s,"next",t)}function s(t){c(o,r,i,a,s,"throw",t)}a(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},48238:function(t,e,n){n.d(e,{n:function(){return r}});n(40271);var r=function(t,e){return t.callWS({type:"execute_script",sequence:e})}},63602:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,i,o,a,c=[],s=!0,u=!1;try{if(o=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=o.call(n)).done)&&(c.push(r.value),c.length!==e);s=!0);}catch(t){u=!0,i=t}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return c}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);"Object"===n&&t.constructor&&(n=t.constructor.name);if("Map"===n||"Set"===n)return Array.from(t);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function c(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,r=(t=i().mark((function t(r,a){var c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x,L,C,Z,E,A,O,j,V,H,M,S,P,z,N,B,G,T,F,I,D,Y,R,q,U,K,Q,$,J,W,X,tt,et,nt,rt,it,ot,at,ct,st,ut,lt,ht;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,n.d(e,{a0:function(){return lt},oL:function(){return ut}}),c=n(99312),s=n(81043),u=n(88962),l=n(33368),h=n(71650),d=n(68308),f=n(82390),v=n(69205),p=n(91808),y=n(93359),n(46798),n(85472),n(9849),n(90126),n(65974),n(22859),n(85717),n(97393),n(46349),n(70320),g=n(98830),n(44577),m=n(3239),b=n(5095),_=n(95260),w=n(53180),k=n(3747),x=n(17267),L=n(18394),C=n(36655),Z=n(81454),E=n(930),A=n(92482),n(23860),n(85878),n(68336),n(31360),n(54371),O=n(22581),j=n(59449),V=n(38149),H=n(11420),M=n(35422),S=n(48238),P=n(11285),z=n(29950),N=n(77251),B=n(33849),n(55683),G=n(84702),T=n(41992),n(32501),n(69645),F=n(52668),I=n(62286),D=n(15787),n(49368),Y=n(66873),n(1794),n(98723),R=n(29800),n(93972),!(q=r([M,G,T,F,I,D,Y,R])).then){t.next=82;break}return t.next=78,q;case 78:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=83;break;case 82:t.t0=q;case 83:U=t.t0,K=o(U,8),M=K[0],G=K[1],T=K[2],F=K[3],I=K[4],D=K[5],Y=K[6],R=K[7],st="M21,7L9,19L3.5,13.5L4.91,12.09L9,16.17L19.59,5.59L21,7Z",ut=function(t){if(t)return"service"in t||"scene"in t?(0,H.Pw)(t):["and","or","not"].some((function(e){return e in t}))?"condition":Object.keys(O.du).find((function(e){return e in t}))},lt=function(t,e){var n,r;e.stopPropagation();var i=null===(n=e.target)||void 0===n?void 0:n.name;if(i){var o,a=(null===(r=e.detail)||void 0===r?void 0:r.value)||e.target.value;(t.action[i]||"")!==a&&(a?o=Object.assign(Object.assign({},t.action),{},(0,y.Z)({},i,a)):delete(o=Object.assign({},t.action))[i],(0,L.B)(t,"value-changed",{value:o}))}},ht=function(t){return t.preventDefault()},(0,p.Z)([(0,_.Mo)("ha-automation-action-row")],(function(t,e){var n,r,i,o=function(e){function n(){var e;(0,h.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,d.Z)(this,n,[].concat(i)),t((0,f.Z)(e)),e}return(0,v.Z)(n,e),(0,l.Z)(n)}(e);return{F:o,d:[{kind:"field",decorators:[(0,_.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,_.Cb)()],key:"action",value:void 0},{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"hideMenu",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,k.t)({key:"automationClipboard",state:!1,subscribe:!0,storage:"sessionStorage"})],key:"_clipboard",value:void 0},{kind:"field",decorators:[(0,_.SB)(),(0,g.F_)({context:V.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",decorators:[(0,_.SB)(),(0,g.F_)({context:N.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_warnings",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_uiModeAvailable",value:function(){return!0}},{kind:"field",decorators:[(0,_.SB)()],key:"_yamlMode",value:function(){return!1}},{kind:"field",decorators:[(0,_.IO)("ha-yaml-editor")],key:"_yamlEditor",value:void 0},{kind:"method",key:"willUpdate",value:function(t){if(t.has("action")){var e=ut(this.action);this._uiModeAvailable=void 0!==e&&!O.lL.has(e),this._uiModeAvailable||this._yamlMode||(this._yamlMode=!0)}}},{kind:"method",key:"updated",value:function(t){if(t.has("action")&&this._yamlMode){var e=this._yamlEditor;e&&e.value!==this.action&&e.setValue(this.action)}}},{kind:"method",key:"render",value:function(){if(!this.action)return b.Ld;var t=ut(this.action),e=this._yamlMode,n=void 0===this._reorderMode;return(0,b.dy)(Q||(Q=(0,u.Z)([" <ha-card outlined> ",' <ha-expansion-panel leftChevron> <h3 slot="header"> <ha-svg-icon class="action-icon" .path="','"></ha-svg-icon> ',' </h3> <slot name="icons" slot="icons"></slot> '," ",' <div class="','"> '," "," </div> </ha-expansion-panel> </ha-card> "])),!1===this.action.enabled?(0,b.dy)($||($=(0,u.Z)(['<div class="disabled-bar"> '," </div>"])),this.hass.localize("ui.panel.config.automation.editor.actions.disabled")):"","service"===t&&"service"in this.action&&this.action.service&&(0,Z.G)((0,C.M)(this.action.service))||O.du[t],(0,E.f)((0,M.Q)(this.hass,this._entityReg,this.action)),"condition"!==t&&!0===this.action.continue_on_error?(0,b.dy)(J||(J=(0,u.Z)(['<div slot="icons"> <ha-svg-icon .path="','"></ha-svg-icon> <simple-tooltip animation-delay="0"> '," </simple-tooltip> </div> "])),"M18.75 22.16L16 19.16L17.16 18L18.75 19.59L22.34 16L23.5 17.41L18.75 22.16M13 13V7H11V13H13M13 17V15H11V17H13M12 2C17.5 2 22 6.5 22 12L21.91 13.31C21.31 13.11 20.67 13 20 13C16.69 13 14 15.69 14 19C14 19.95 14.22 20.85 14.62 21.65C13.78 21.88 12.91 22 12 22C6.5 22 2 17.5 2 12C2 6.5 6.5 2 12 2Z",this.hass.localize("ui.panel.config.automation.editor.actions.continue_on_error")):b.Ld,this.hideMenu?"":(0,b.dy)(W||(W=(0,u.Z)([' <ha-button-menu slot="icons" @action="','" @click="','" fixed> <ha-icon-button slot="trigger" .label="','" .path="','"></ha-icon-button> <mwc-list-item graphic="icon"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','" class="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <li divider role="separator"></li> <mwc-list-item .disabled="','" graphic="icon"> '," ",' </mwc-list-item> <mwc-list-item .disabled="','" graphic="icon"> '," ",' </mwc-list-item> <li divider role="separator"></li> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item class="warning" graphic="icon" .disabled="','"> ',' <ha-svg-icon class="warning" slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> </ha-button-menu> '])),this._handleAction,ht,this.hass.localize("ui.common.menu"),"M12,16A2,2 0 0,1 14,18A2,2 0 0,1 12,20A2,2 0 0,1 10,18A2,2 0 0,1 12,16M12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12A2,2 0 0,1 12,10M12,4A2,2 0 0,1 14,6A2,2 0 0,1 12,8A2,2 0 0,1 10,6A2,2 0 0,1 12,4Z",this.hass.localize("ui.panel.config.automation.editor.actions.run"),"M8,5.14V19.14L19,12.14L8,5.14Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.rename"),"M18,17H10.5L12.5,15H18M6,17V14.5L13.88,6.65C14.07,6.45 14.39,6.45 14.59,6.65L16.35,8.41C16.55,8.61 16.55,8.92 16.35,9.12L8.47,17M19,3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3Z",this.disabled,(0,w.$)({hidden:n}),this.hass.localize("ui.panel.config.automation.editor.actions.re_order"),"M18 21L14 17H17V7H14L18 3L22 7H19V17H22M2 19V17H12V19M2 13V11H9V13M2 7V5H6V7H2Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.duplicate"),"M11,17H4A2,2 0 0,1 2,15V3A2,2 0 0,1 4,1H16V3H4V15H11V13L15,16L11,19V17M19,21V7H8V13H6V7A2,2 0 0,1 8,5H19A2,2 0 0,1 21,7V21A2,2 0 0,1 19,23H8A2,2 0 0,1 6,21V19H8V21H19Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.copy"),"M19,21H8V7H19M19,5H8A2,2 0 0,0 6,7V21A2,2 0 0,0 8,23H19A2,2 0 0,0 21,21V7A2,2 0 0,0 19,5M16,1H4A2,2 0 0,0 2,3V17H4V3H16V1Z",this.disabled,this.hass.localize("ui.panel.config.automation.editor.triggers.cut"),"M19,3L13,9L15,11L22,4V3M12,12.5A0.5,0.5 0 0,1 11.5,12A0.5,0.5 0 0,1 12,11.5A0.5,0.5 0 0,1 12.5,12A0.5,0.5 0 0,1 12,12.5M6,20A2,2 0 0,1 4,18C4,16.89 4.9,16 6,16A2,2 0 0,1 8,18C8,19.11 7.1,20 6,20M6,8A2,2 0 0,1 4,6C4,4.89 4.9,4 6,4A2,2 0 0,1 8,6C8,7.11 7.1,8 6,8M9.64,7.64C9.87,7.14 10,6.59 10,6A4,4 0 0,0 6,2A4,4 0 0,0 2,6A4,4 0 0,0 6,10C6.59,10 7.14,9.87 7.64,9.64L10,12L7.64,14.36C7.14,14.13 6.59,14 6,14A4,4 0 0,0 2,18A4,4 0 0,0 6,22A4,4 0 0,0 10,18C10,17.41 9.87,16.86 9.64,16.36L12,14L19,21H22V20L9.64,7.64Z",!this._uiModeAvailable,this.hass.localize("ui.panel.config.automation.editor.edit_ui"),e?"":(0,b.dy)(X||(X=(0,u.Z)(['<ha-svg-icon class="selected_menu_item" slot="graphic" .path="','"></ha-svg-icon>'])),st),!this._uiModeAvailable,this.hass.localize("ui.panel.config.automation.editor.edit_yaml"),e?(0,b.dy)(tt||(tt=(0,u.Z)(['<ha-svg-icon class="selected_menu_item" slot="graphic" .path="','"></ha-svg-icon>'])),st):"",this.disabled,!1===this.action.enabled?this.hass.localize("ui.panel.config.automation.editor.actions.enable"):this.hass.localize("ui.panel.config.automation.editor.actions.disable"),!1===this.action.enabled?"M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M10,16.5L16,12L10,7.5V16.5Z":"M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4M9,9V15H15V9",this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.delete"),"M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z"),(0,w.$)({"card-content":!0,disabled:!1===this.action.enabled}),this._warnings?(0,b.dy)(et||(et=(0,u.Z)(['<ha-alert alert-type="warning" .title="','"> '," "," </ha-alert>"])),this.hass.localize("ui.errors.config.editor_not_supported"),this._warnings.length>0&&void 0!==this._warnings[0]?(0,b.dy)(nt||(nt=(0,u.Z)([" <ul> "," </ul>"])),this._warnings.map((function(t){return(0,b.dy)(rt||(rt=(0,u.Z)(["<li>","</li>"])),t)}))):"",this.hass.localize("ui.errors.config.edit_in_yaml_supported")):"",e?(0,b.dy)(it||(it=(0,u.Z)([" ",' <ha-yaml-editor .hass="','" .defaultValue="','" .readOnly="','" @value-changed="','"></ha-yaml-editor> '])),void 0===t?(0,b.dy)(ot||(ot=(0,u.Z)([" "," "])),this.hass.localize("ui.panel.config.automation.editor.actions.unsupported_action")):"",this.hass,this.action,this.disabled,this._onYamlChange):(0,b.dy)(at||(at=(0,u.Z)([' <div @ui-mode-not-available="','" @value-changed="','"> '," </div> "])),this._handleUiModeNotAvailable,this._onUiChanged,(0,x.h)("ha-automation-action-".concat(t),{hass:this.hass,action:this.action,narrow:this.narrow,disabled:this.disabled,path:this.path})))}},{kind:"method",key:"_handleUiModeNotAvailable",value:function(t){t.stopPropagation(),this._warnings=(0,A.p)(this.hass,t.detail).warnings,this._yamlMode||(this._yamlMode=!0)}},{kind:"method",key:"_handleAction",value:(i=(0,s.Z)((0,c.Z)().mark((function t(e){var n;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:t.t0=e.detail.index,t.next=0===t.t0?3:1===t.t0?5:2===t.t0?8:3===t.t0?10:4===t.t0?12:5===t.t0?14:6===t.t0?17:7===t.t0?20:8===t.t0?23:9===t.t0?25:27;break;case 3:return this._runAction(),t.abrupt("break",27);case 5:return t.next=7,this._renameAction();case 7:return t.abrupt("break",27);case 8:return null===(n=this._reorderMode)||void 0===n||n.enter(),t.abrupt("break",27);case 10:return(0,L.B)(this,"duplicate"),t.abrupt("break",27);case 12:return this._setClipboard(),t.abrupt("break",27);case 14:return this._setClipboard(),(0,L.B)(this,"value-changed",{value:null}),t.abrupt("break",27);case 17:return this._switchUiMode(),this.expand(),t.abrupt("break",27);case 20:return this._switchYamlMode(),this.expand(),t.abrupt("break",27);case 23:return this._onDisable(),t.abrupt("break",27);case 25:return this._onDelete(),t.abrupt("break",27);case 27:case"end":return t.stop()}}),t,this)}))),function(t){return i.apply(this,arguments)})},{kind:"method",key:"_setClipboard",value:function(){this._clipboard=Object.assign(Object.assign({},this._clipboard),{},{action:(0,m.Z)(this.action)})}},{kind:"method",key:"_onDisable",value:function(){var t,e,n=!(null===(t=this.action.enabled)||void 0===t||t),r=Object.assign(Object.assign({},this.action),{},{enabled:n});(0,L.B)(this,"value-changed",{value:r}),this._yamlMode&&(null===(e=this._yamlEditor)||void 0===e||e.setValue(r))}},{kind:"method",key:"_runAction",value:(r=(0,s.Z)((0,c.Z)().mark((function t(){var e;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,j.w)(this.hass,{action:this.action});case 2:if((e=t.sent).action.valid){t.next=6;break}return(0,P.Ys)(this,{title:this.hass.localize("ui.panel.config.automation.editor.actions.invalid_action"),text:e.action.error}),t.abrupt("return");case 6:return t.prev=6,t.next=9,(0,S.n)(this.hass,this.action);case 9:t.next=15;break;case 11:return t.prev=11,t.t0=t.catch(6),(0,P.Ys)(this,{title:this.hass.localize("ui.panel.config.automation.editor.actions.run_action_error"),text:t.t0.message||t.t0}),t.abrupt("return");case 15:(0,B.C)(this,{message:this.hass.localize("ui.panel.config.automation.editor.actions.run_action_success")});case 16:case"end":return t.stop()}}),t,this,[[6,11]])}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"_onDelete",value:function(){var t=this;(0,P.g7)(this,{title:this.hass.localize("ui.panel.config.automation.editor.actions.delete_confirm_title"),text:this.hass.localize("ui.panel.config.automation.editor.actions.delete_confirm_text"),dismissText:this.hass.localize("ui.common.cancel"),confirmText:this.hass.localize("ui.common.delete"),destructive:!0,confirm:function(){(0,L.B)(t,"value-changed",{value:null})}})}},{kind:"method",key:"_onYamlChange",value:function(t){t.stopPropagation(),t.detail.isValid&&(0,L.B)(this,"value-changed",{value:t.detail.value})}},{kind:"method",key:"_onUiChanged",value:function(t){t.stopPropagation();var e=Object.assign(Object.assign({},this.action.alias?{alias:this.action.alias}:{}),t.detail.value);(0,L.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_switchUiMode",value:function(){this._warnings=void 0,this._yamlMode=!1}},{kind:"method",key:"_switchYamlMode",value:function(){this._warnings=void 0,this._yamlMode=!0}},{kind:"method",key:"_renameAction",value:(n=(0,s.Z)((0,c.Z)().mark((function t(){var e,n,r;return(0,c.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,P.D9)(this,{title:this.hass.localize("ui.panel.config.automation.editor.actions.change_alias"),inputLabel:this.hass.localize("ui.panel.config.automation.editor.actions.alias"),inputType:"string",placeholder:(0,E.f)((0,M.Q)(this.hass,this._entityReg,this.action,void 0,!0)),defaultValue:this.action.alias,confirmText:this.hass.localize("ui.common.submit")});case 2:null!==(e=t.sent)&&(n=Object.assign({},this.action),""===e?delete n.alias:n.alias=e,(0,L.B)(this,"value-changed",{value:n}),this._yamlMode&&(null===(r=this._yamlEditor)||void 0===r||r.setValue(n)));case 4:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"expand",value:function(){var t=this;this.updateComplete.then((function(){t.shadowRoot.querySelector("ha-expansion-panel").expanded=!0}))}},{kind:"get",static:!0,key:"styles",value:function(){return[z.Qx,(0,b.iv)(ct||(ct=(0,u.Z)(["ha-button-menu,ha-icon-button{--mdc-theme-text-primary-on-background:var(--primary-text-color)}.disabled{opacity:.5;pointer-events:none}ha-expansion-panel{--expansion-panel-summary-padding:0 0 0 8px;--expansion-panel-content-padding:0}h3{margin:0;font-size:inherit;font-weight:inherit}.action-icon{display:none}@media (min-width:870px){.action-icon{display:inline-block;color:var(--secondary-text-color);opacity:.9;margin-right:8px}}.card-content{padding:16px}.disabled-bar{background:var(--divider-color,#e0e0e0);text-align:center;border-top-right-radius:var(--ha-card-border-radius);border-top-left-radius:var(--ha-card-border-radius)}mwc-list-item[disabled]{--mdc-theme-text-primary-on-background:var(--disabled-text-color)}mwc-list-item.hidden{display:none}.warning ul{margin:4px 0}.selected_menu_item{color:var(--primary-color)}li[role=separator]{border-bottom-color:var(--divider-color)}"])))]}}]}}),b.oi),a(),t.next=115;break;case 112:t.prev=112,t.t2=t.catch(0),a(t.t2);case 115:case"end":return t.stop()}}),t,null,[[0,112]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var o=t.apply(e,n);function a(t){c(o,r,i,a,s,"next",t)}function s(t){c(o,r,i,a,s,"throw",t)}a(void 0)}))});return function(t,e){return r.apply(this,arguments)}}())},48866:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x,L,C,Z,E,A,O,j,V,H,M;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(93359),a=n(46097),c=n(88962),s=n(33368),u=n(71650),l=n(68308),h=n(82390),d=n(69205),f=n(91808),v=n(34541),p=n(47838),n(97393),n(51358),n(46798),n(5239),n(39685),n(98490),n(85717),n(94570),n(41353),y=n(98830),g=n(3239),m=n(5095),b=n(95260),_=n(99266),w=n(3747),k=n(18394),x=n(32723),n(92295),n(42308),n(37662),L=n(22581),C=n(77251),Z=n(64082),E=n(63602),!(A=e([E])).then){t.next=53;break}return t.next=49,A;case 49:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=54;break;case 53:t.t0=A;case 54:E=t.t0[0],M="M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z",(0,f.Z)([(0,b.Mo)("ha-automation-action")],(function(t,e){var n=function(e){function n(){var e;(0,u.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,l.Z)(this,n,[].concat(i)),t((0,h.Z)(e)),e}return(0,d.Z)(n,e),(0,s.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,b.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"actions",value:void 0},{kind:"field",decorators:[(0,b.SB)(),(0,y.F_)({context:C.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"field",decorators:[(0,w.t)({key:"automationClipboard",state:!0,subscribe:!0,storage:"sessionStorage"})],key:"_clipboard",value:void 0},{kind:"field",key:"_focusLastActionOnChange",value:function(){return!1}},{kind:"field",key:"_actionKeys",value:function(){return new WeakMap}},{kind:"get",key:"nested",value:function(){return void 0!==this.path}},{kind:"method",key:"render",value:function(){var t,e=this;return(0,m.dy)(O||(O=(0,c.Z)([' <ha-sortable handle-selector=".handle" .disabled="','" @item-moved="','" group="actions" .path="','"> <div class="actions"> ',' </div> </ha-sortable> <div class="buttons"> <ha-button outlined .disabled="','" .label="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </ha-button> <ha-button .disabled="','" .label="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </ha-button> </div> '])),!(null!==(t=this._reorderMode)&&void 0!==t&&t.active),this._actionMoved,this.path,(0,_.r)(this.actions,(function(t){return e._getKey(t)}),(function(t,n){var r,i,o;return(0,m.dy)(j||(j=(0,c.Z)([' <ha-automation-action-row .path="','" .index="','" .action="','" .narrow="','" .disabled="','" .hideMenu="','" @duplicate="','" @value-changed="','" .hass="','"> '," </ha-automation-action-row> "])),[].concat((0,a.Z)(null!==(r=e.path)&&void 0!==r?r:[]),[n]),n,t,e.narrow,e.disabled,Boolean(null===(i=e._reorderMode)||void 0===i?void 0:i.active),e._duplicateAction,e._actionChanged,e.hass,null!==(o=e._reorderMode)&&void 0!==o&&o.active?(0,m.dy)(V||(V=(0,c.Z)([' <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <div class="handle" slot="icons"> <ha-svg-icon .path="','"></ha-svg-icon> </div> '])),n,e.hass.localize("ui.panel.config.automation.editor.move_up"),"M13,20H11V8L5.5,13.5L4.08,12.08L12,4.16L19.92,12.08L18.5,13.5L13,8V20Z",e._moveUp,0===n,n,e.hass.localize("ui.panel.config.automation.editor.move_down"),"M11,4H13V16L18.5,10.5L19.92,11.92L12,19.84L4.08,11.92L5.5,10.5L11,16V4Z",e._moveDown,n===e.actions.length-1,"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"):"")})),this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.add"),this._addActionDialog,M,this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.add_building_block"),this._addActionBuildingBlockDialog,M)}},{kind:"method",key:"updated",value:function(t){if((0,v.Z)((0,p.Z)(n.prototype),"updated",this).call(this,t),t.has("actions")&&this._focusLastActionOnChange){this._focusLastActionOnChange=!1;var e=this.shadowRoot.querySelector("ha-automation-action-row:last-of-type");e.updateComplete.then((function(){e.expand(),e.scrollIntoView(),e.focus()}))}}},{kind:"method",key:"_addActionDialog",value:function(){var t;(0,Z._)(this,{type:"action",add:this._addAction,clipboardItem:(0,E.oL)(null===(t=this._clipboard)||void 0===t?void 0:t.action)})}},{kind:"method",key:"_addActionBuildingBlockDialog",value:function(){var t;(0,Z._)(this,{type:"action",add:this._addAction,clipboardItem:(0,E.oL)(null===(t=this._clipboard)||void 0===t?void 0:t.action),group:"building_blocks"})}},{kind:"field",key:"_addAction",value:function(){var t=this;return function(e){var n;if(e===Z.I)n=t.actions.concat((0,g.Z)(t._clipboard.action));else if((0,L.cs)(e))n=t.actions.concat({service:(0,L.ko)(e),metadata:{}});else{var r=customElements.get("ha-automation-action-".concat(e));n=t.actions.concat(r?Object.assign({},r.defaultConfig):(0,o.Z)({},e,{}))}t._focusLastActionOnChange=!0,(0,k.B)(t,"value-changed",{value:n})}}},{kind:"method",key:"_getKey",value:function(t){return this._actionKeys.has(t)||this._actionKeys.set(t,Math.random().toString()),this._actionKeys.get(t)}},{kind:"method",key:"_moveUp",value:function(t){var e=t.target.index,n=e-1;this._move(e,n)}},{kind:"method",key:"_moveDown",value:function(t){var e=t.target.index,n=e+1;this._move(e,n)}},{kind:"method",key:"_move",value:function(t,e,n,r){var i=(0,x.b)(this.actions,t,e,n,r);(0,k.B)(this,"value-changed",{value:i})}},{kind:"method",key:"_actionMoved",value:function(t){if(!this.nested){t.stopPropagation();var e=t.detail,n=e.oldIndex,r=e.newIndex,i=e.oldPath,o=e.newPath;this._move(n,r,i,o)}}},{kind:"method",key:"_actionChanged",value:function(t){t.stopPropagation();var e=(0,a.Z)(this.actions),n=t.detail.value,r=t.target.index;if(null===n)e.splice(r,1);else{var i=this._getKey(e[r]);this._actionKeys.set(n,i),e[r]=n}(0,k.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_duplicateAction",value:function(t){t.stopPropagation();var e=t.target.index;(0,k.B)(this,"value-changed",{value:this.actions.concat((0,g.Z)(this.actions[e]))})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,m.iv)(H||(H=(0,c.Z)(["ha-automation-action-row{display:block;margin-bottom:16px;scroll-margin-top:48px}ha-svg-icon{height:20px}ha-alert{display:block;margin-bottom:16px;border-radius:var(--ha-card-border-radius,12px);overflow:hidden}.handle{padding:12px;cursor:move;cursor:grab}.handle ha-svg-icon{pointer-events:none;height:24px}.buttons{display:flex;flex-wrap:wrap;gap:8px}"])))}}]}}),m.oi),r(),t.next=66;break;case 63:t.prev=63,t.t2=t.catch(0),r(t.t2);case 66:case"end":return t.stop()}}),t,null,[[0,63]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},55683:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),h=(n(97393),n(85717),n(5095)),d=n(95260),f=n(18394),v=(n(91998),["scene"]);(0,l.Z)([(0,d.Mo)("ha-automation-action-activate_scene")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)()],key:"action",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{service:"scene.turn_on",target:{entity_id:""},metadata:{}}}},{kind:"method",key:"render",value:function(){var t,e;"scene"in this.action?t=this.action.scene:t=null===(e=this.action.target)||void 0===e?void 0:e.entity_id;return(0,h.dy)(r||(r=(0,i.Z)([' <ha-entity-picker .hass="','" .label="','" .value="','" .disabled="','" @value-changed="','" .includeDomains="','" allow-custom-entity></ha-entity-picker> '])),this.hass,this.hass.localize("ui.panel.config.automation.editor.actions.type.activate_scene.scene"),t,this.disabled,this._entityPicked,v)}},{kind:"method",key:"_entityPicked",value:function(t){t.stopPropagation(),(0,f.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{service:"scene.turn_on",target:{entity_id:t.detail.value},metadata:{}})})}}]}}),h.oi)},84702:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x,L,C,Z,E,A,O,j,V,H,M,S,P,z,N,B,G;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(99312),a=n(81043),c=n(46097),s=n(88962),u=n(33368),l=n(71650),h=n(68308),d=n(82390),f=n(69205),v=n(91808),p=n(34541),y=n(47838),n(97393),n(85717),n(46798),n(9849),n(50289),n(94167),n(36513),n(41353),g=n(98830),m=n(3239),b=n(5095),_=n(95260),w=n(53180),k=n(99266),x=n(4771),L=n(18394),C=n(930),n(92295),n(85878),n(54371),n(42308),Z=n(44553),E=n(38149),A=n(11285),O=n(29950),j=n(77251),!(V=e([Z])).then){t.next=55;break}return t.next=51,V;case 51:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=56;break;case 55:t.t0=V;case 56:Z=t.t0[0],G=function(t){return t.preventDefault()},(0,v.Z)([(0,_.Mo)("ha-automation-action-choose")],(function(t,e){var n,r,i=function(e){function n(){var e;(0,l.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,h.Z)(this,n,[].concat(i)),t((0,d.Z)(e)),e}return(0,f.Z)(n,e),(0,u.Z)(n)}(e);return{F:i,d:[{kind:"field",decorators:[(0,_.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,_.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,_.Cb)({attribute:!1})],key:"path",value:void 0},{kind:"field",decorators:[(0,_.Cb)()],key:"action",value:void 0},{kind:"field",decorators:[(0,_.SB)()],key:"_showDefault",value:function(){return!1}},{kind:"field",decorators:[(0,_.SB)()],key:"_expandedStates",value:function(){return[]}},{kind:"field",decorators:[(0,_.SB)(),(0,g.F_)({context:E.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",decorators:[(0,_.SB)(),(0,g.F_)({context:j.T,subscribe:!0})],key:"_reorderMode",value:void 0},{kind:"field",key:"_expandLast",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{choose:[{conditions:[],sequence:[]}]}}},{kind:"method",key:"_expandedChanged",value:function(t){this._expandedStates=this._expandedStates.concat(),this._expandedStates[t.target.index]=t.detail.expanded}},{kind:"method",key:"_getDescription",value:function(t){var e=(0,x.r)(t.conditions);if(!e||0===e.length)return this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.no_conditions");var n="";return"string"==typeof e[0]?n+=e[0]:n+=(0,Z.m)(e[0],this.hass,this._entityReg),e.length>1&&(n+=this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.option_description_additional",{numberOfAdditionalConditions:e.length-1})),n}},{kind:"method",key:"render",value:function(){var t,e,n,r=this,i=this.action,o=void 0===this._reorderMode;return(0,b.dy)(H||(H=(0,s.Z)([' <ha-sortable handle-selector=".handle" .disabled="','" group="choose-options" .path="','"> <div class="options"> ',' </div> </ha-sortable> <ha-button outlined .label="','" .disabled="','" @click="','"> <ha-svg-icon .path="','" slot="icon"></ha-svg-icon> </ha-button> '," "])),!(null!==(t=this._reorderMode)&&void 0!==t&&t.active),[].concat((0,c.Z)(null!==(e=this.path)&&void 0!==e?e:[]),["choose"]),(0,k.r)(i.choose?(0,x.r)(i.choose):[],(function(t){return t}),(function(t,e){var n,i,a;return(0,b.dy)(M||(M=(0,s.Z)([' <div class="option"> <ha-card> <ha-expansion-panel .index="','" leftChevron @expanded-changed="','"> <h3 slot="header"> ',": "," </h3> ",' <div class="card-content"> <h4> ',': </h4> <ha-automation-condition .path="','" .conditions="','" .disabled="','" .hass="','" .idx="','" @value-changed="','"></ha-automation-condition> <h4> ',': </h4> <ha-automation-action .path="','" .actions="','" .disabled="','" .hass="','" .idx="','" @value-changed="','"></ha-automation-action> </div> </ha-expansion-panel> </ha-card> </div> '])),e,r._expandedChanged,r.hass.localize("ui.panel.config.automation.editor.actions.type.choose.option",{number:e+1}),t.alias||(r._expandedStates[e]?"":r._getDescription(t)),null!==(n=r._reorderMode)&&void 0!==n&&n.active?(0,b.dy)(S||(S=(0,s.Z)([' <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <ha-icon-button .index="','" slot="icons" .label="','" .path="','" @click="','" .disabled="','"></ha-icon-button> <div class="handle" slot="icons"> <ha-svg-icon .path="','"></ha-svg-icon> </div> '])),e,r.hass.localize("ui.panel.config.automation.editor.move_up"),"M13,20H11V8L5.5,13.5L4.08,12.08L12,4.16L19.92,12.08L18.5,13.5L13,8V20Z",r._moveUp,0===e,e,r.hass.localize("ui.panel.config.automation.editor.move_down"),"M11,4H13V16L18.5,10.5L19.92,11.92L12,19.84L4.08,11.92L5.5,10.5L11,16V4Z",r._moveDown,e===(0,x.r)(r.action.choose).length-1,"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"):(0,b.dy)(P||(P=(0,s.Z)([' <ha-button-menu slot="icons" .idx="','" @action="','" @click="','" fixed> <ha-icon-button slot="trigger" .label="','" .path="','"></ha-icon-button> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','" class="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item graphic="icon" .disabled="','"> ',' <ha-svg-icon slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> <mwc-list-item class="warning" graphic="icon" .disabled="','"> ',' <ha-svg-icon class="warning" slot="graphic" .path="','"></ha-svg-icon> </mwc-list-item> </ha-button-menu> '])),e,r._handleAction,G,r.hass.localize("ui.common.menu"),"M12,16A2,2 0 0,1 14,18A2,2 0 0,1 12,20A2,2 0 0,1 10,18A2,2 0 0,1 12,16M12,10A2,2 0 0,1 14,12A2,2 0 0,1 12,14A2,2 0 0,1 10,12A2,2 0 0,1 12,10M12,4A2,2 0 0,1 14,6A2,2 0 0,1 12,8A2,2 0 0,1 10,6A2,2 0 0,1 12,4Z",r.disabled,r.hass.localize("ui.panel.config.automation.editor.actions.rename"),"M18,17H10.5L12.5,15H18M6,17V14.5L13.88,6.65C14.07,6.45 14.39,6.45 14.59,6.65L16.35,8.41C16.55,8.61 16.55,8.92 16.35,9.12L8.47,17M19,3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3Z",r.disabled,(0,w.$)({hidden:o}),r.hass.localize("ui.panel.config.automation.editor.actions.re_order"),"M18 21L14 17H17V7H14L18 3L22 7H19V17H22M2 19V17H12V19M2 13V11H9V13M2 7V5H6V7H2Z",r.disabled,r.hass.localize("ui.panel.config.automation.editor.actions.duplicate"),"M11,17H4A2,2 0 0,1 2,15V3A2,2 0 0,1 4,1H16V3H4V15H11V13L15,16L11,19V17M19,21V7H8V13H6V7A2,2 0 0,1 8,5H19A2,2 0 0,1 21,7V21A2,2 0 0,1 19,23H8A2,2 0 0,1 6,21V19H8V21H19Z",r.disabled,r.hass.localize("ui.panel.config.automation.editor.actions.type.choose.remove_option"),"M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z"),r.hass.localize("ui.panel.config.automation.editor.actions.type.choose.conditions"),[].concat((0,c.Z)(null!==(i=r.path)&&void 0!==i?i:[]),["choose",e,"conditions"]),(0,x.r)(t.conditions),r.disabled,r.hass,e,r._conditionChanged,r.hass.localize("ui.panel.config.automation.editor.actions.type.choose.sequence"),[].concat((0,c.Z)(null!==(a=r.path)&&void 0!==a?a:[]),["choose",e,"sequence"]),(0,x.r)(t.sequence)||[],r.disabled,r.hass,e,r._actionChanged)})),this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.add_option"),this.disabled,this._addOption,"M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z",this._showDefault||i.default?(0,b.dy)(z||(z=(0,s.Z)([" <h2> ",': </h2> <ha-automation-action .path="','" .actions="','" .disabled="','" @value-changed="','" .hass="','"></ha-automation-action> '])),this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.default"),[].concat((0,c.Z)(null!==(n=this.path)&&void 0!==n?n:[]),["choose","default"]),(0,x.r)(i.default)||[],this.disabled,this._defaultChanged,this.hass):(0,b.dy)(N||(N=(0,s.Z)(['<div class="link-button-row"> <button class="link" @click="','" .disabled="','"> '," </button> </div>"])),this._addDefault,this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.add_default")))}},{kind:"method",key:"_handleAction",value:(r=(0,a.Z)((0,o.Z)().mark((function t(e){var n;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:t.t0=e.detail.index,t.next=0===t.t0?3:1===t.t0?6:2===t.t0?8:3===t.t0?10:12;break;case 3:return t.next=5,this._renameAction(e);case 5:return t.abrupt("break",12);case 6:return null===(n=this._reorderMode)||void 0===n||n.enter(),t.abrupt("break",12);case 8:return this._duplicateOption(e),t.abrupt("break",12);case 10:return this._removeOption(e),t.abrupt("break",12);case 12:case"end":return t.stop()}}),t,this)}))),function(t){return r.apply(this,arguments)})},{kind:"method",key:"_renameAction",value:(n=(0,a.Z)((0,o.Z)().mark((function t(e){var n,r,i,a;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return n=e.target.idx,r=this.action.choose?(0,c.Z)((0,x.r)(this.action.choose)):[],i=r[n],t.next=5,(0,A.D9)(this,{title:this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.change_alias"),inputLabel:this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.alias"),inputType:"string",placeholder:(0,C.f)(this._getDescription(i)),defaultValue:i.alias,confirmText:this.hass.localize("ui.common.submit")});case 5:null!==(a=t.sent)&&(""===a?delete r[n].alias:r[n].alias=a,(0,L.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{choose:r})}));case 7:case"end":return t.stop()}}),t,this)}))),function(t){return n.apply(this,arguments)})},{kind:"method",key:"_duplicateOption",value:function(t){var e=t.target.idx;this._createOption((0,m.Z)((0,x.r)(this.action.choose)[e]))}},{kind:"method",key:"firstUpdated",value:function(){var t=this;(0,x.r)(this.action.choose).forEach((function(){return t._expandedStates.push(!1)}))}},{kind:"method",key:"updated",value:function(t){if((0,p.Z)((0,y.Z)(i.prototype),"updated",this).call(this,t),this._expandLast){var e=this.shadowRoot.querySelectorAll("ha-expansion-panel");e[e.length-1].expanded=!0,this._expandLast=!1}}},{kind:"method",key:"_addDefault",value:function(){this._showDefault=!0}},{kind:"method",key:"_conditionChanged",value:function(t){t.stopPropagation();var e=t.detail.value,n=t.target.idx,r=this.action.choose?(0,c.Z)((0,x.r)(this.action.choose)):[];r[n].conditions=e,(0,L.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{choose:r})})}},{kind:"method",key:"_actionChanged",value:function(t){t.stopPropagation();var e=t.detail.value,n=t.target.idx,r=this.action.choose?(0,c.Z)((0,x.r)(this.action.choose)):[];r[n].sequence=e,(0,L.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{choose:r})})}},{kind:"method",key:"_addOption",value:function(){this._createOption({conditions:[],sequence:[]})}},{kind:"method",key:"_createOption",value:function(t){var e=this.action.choose?(0,c.Z)((0,x.r)(this.action.choose)):[];e.push(t),(0,L.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{choose:e})}),this._expandLast=!0,this._expandedStates[e.length-1]=!0}},{kind:"method",key:"_moveUp",value:function(t){var e=t.target.index,n=e-1;this._move(e,n)}},{kind:"method",key:"_moveDown",value:function(t){var e=t.target.index,n=e+1;this._move(e,n)}},{kind:"method",key:"_move",value:function(t,e){var n=(0,x.r)(this.action.choose).concat(),r=n.splice(t,1)[0];n.splice(e,0,r);var i=this._expandedStates.splice(t,1)[0];this._expandedStates.splice(e,0,i),(0,L.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{choose:n})})}},{kind:"method",key:"_removeOption",value:function(t){var e=this,n=t.target.idx;(0,A.g7)(this,{title:this.hass.localize("ui.panel.config.automation.editor.actions.type.choose.delete_confirm_title"),text:this.hass.localize("ui.panel.config.automation.editor.actions.delete_confirm_text"),dismissText:this.hass.localize("ui.common.cancel"),confirmText:this.hass.localize("ui.common.delete"),destructive:!0,confirm:function(){var t=e.action.choose?(0,c.Z)((0,x.r)(e.action.choose)):[];t.splice(n,1),e._expandedStates.splice(n,1),(0,L.B)(e,"value-changed",{value:Object.assign(Object.assign({},e.action),{},{choose:t})})}})}},{kind:"method",key:"_defaultChanged",value:function(t){t.stopPropagation(),this._showDefault=!0;var e=t.detail.value,n=Object.assign(Object.assign({},this.action),{},{default:e});0===e.length&&delete n.default,(0,L.B)(this,"value-changed",{value:n})}},{kind:"get",static:!0,key:"styles",value:function(){return[O.Qx,(0,b.iv)(B||(B=(0,s.Z)([".option{margin:0 0 16px 0}.add-card mwc-button{display:block;text-align:center}ha-expansion-panel{--expansion-panel-summary-padding:0 0 0 8px;--expansion-panel-content-padding:0}mwc-list-item[disabled]{--mdc-theme-text-primary-on-background:var(--disabled-text-color)}mwc-list-item.hidden{display:none}h3{margin:0;font-size:inherit;font-weight:inherit}ha-icon-button{inset-inline-start:initial;inset-inline-end:0;direction:var(--direction)}ha-svg-icon{height:20px}.link-button-row{padding:14px 14px 0 14px}.card-content{padding:0 16px 16px 16px}.handle{padding:12px;cursor:move;cursor:grab}.handle ha-svg-icon{pointer-events:none;height:24px}"])))]}}]}}),b.oi),r(),t.next=74;break;case 71:t.prev=71,t.t2=t.catch(0),r(t.t2);case 74:case"end":return t.stop()}}),t,null,[[0,71]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},41992:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(62746),a=n(88962),c=n(33368),s=n(71650),u=n(68308),l=n(82390),h=n(69205),d=n(91808),n(97393),n(46349),n(70320),n(37313),n(82073),n(85717),f=n(5095),v=n(95260),p=n(14516),y=n(18394),g=n(28858),n(71133),m=n(41090),b=n(38514),!(_=e([b])).then){t.next=37;break}return t.next=33,_;case 33:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=38;break;case 37:t.t0=_;case 38:b=t.t0[0],(0,d.Z)([(0,v.Mo)("ha-automation-action-condition")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,h.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)()],key:"action",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{condition:"state"}}},{kind:"method",key:"render",value:function(){return(0,f.dy)(w||(w=(0,a.Z)([' <ha-select fixedMenuPosition .label="','" .disabled="','" .value="','" naturalMenuWidth @selected="','"> ',' </ha-select> <ha-automation-condition-editor .condition="','" .disabled="','" .hass="','" @value-changed="','"></ha-automation-condition-editor> '])),this.hass.localize("ui.panel.config.automation.editor.conditions.type_select"),this.disabled,this.action.condition,this._typeChanged,this._processedTypes(this.hass.localize).map((function(t){var e=(0,o.Z)(t,3),n=e[0],r=e[1],i=e[2];return(0,f.dy)(k||(k=(0,a.Z)([' <mwc-list-item .value="','" graphic="icon"> ','<ha-svg-icon slot="graphic" .path="','"></ha-svg-icon></mwc-list-item> '])),n,r,i)})),this.action,this.disabled,this.hass,this._conditionChanged)}},{kind:"field",key:"_processedTypes",value:function(){var t=this;return(0,p.Z)((function(e){return Object.entries(m.L).map((function(t){var n=(0,o.Z)(t,2),r=n[0],i=n[1];return[r,e("ui.panel.config.automation.editor.conditions.type.".concat(r,".label")),i]})).sort((function(e,n){return(0,g.$)(e[1],n[1],t.hass.locale.language)}))}))}},{kind:"method",key:"_conditionChanged",value:function(t){t.stopPropagation(),(0,y.B)(this,"value-changed",{value:t.detail.value})}},{kind:"method",key:"_typeChanged",value:function(t){var e=t.target.value;if(e){var n=customElements.get("ha-automation-condition-".concat(e));e!==this.action.condition&&(0,y.B)(this,"value-changed",{value:Object.assign({condition:e},n.defaultConfig)})}}},{kind:"get",static:!0,key:"styles",value:function(){return(0,f.iv)(x||(x=(0,a.Z)(["ha-select{margin-bottom:24px}"])))}}]}}),f.oi),r(),t.next=46;break;case 43:t.prev=43,t.t2=t.catch(0),r(t.t2);case 46:case"end":return t.stop()}}),t,null,[[0,43]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},32501:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),h=(n(97393),n(51467),n(85717),n(5095)),d=n(95260),f=n(18394),v=n(13426),p=(n(92353),n(27959));(0,l.Z)([(0,d.Mo)("ha-automation-action-delay")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,d.SB)()],key:"_timeData",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{delay:""}}},{kind:"method",key:"willUpdate",value:function(t){t.has("action")&&(this.action&&(0,v._)(this.action)?(0,f.B)(this,"ui-mode-not-available",Error(this.hass.localize("ui.errors.config.no_template_editor_support"))):this._timeData=(0,p.c)(this.action.delay))}},{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,i.Z)(['<ha-duration-input .label="','" .disabled="','" .data="','" enableMillisecond @value-changed="','"></ha-duration-input>'])),this.hass.localize("ui.panel.config.automation.editor.actions.type.delay.delay"),this.disabled,this._timeData,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e=t.detail.value;e&&(0,f.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{delay:e})})}}]}}),h.oi)},69645:function(t,e,n){var r,i,o,a=n(99312),c=n(81043),s=n(88962),u=n(33368),l=n(71650),h=n(68308),d=n(82390),f=n(69205),v=n(91808),p=(n(97393),n(46798),n(9849),n(50289),n(94167),n(22859),n(85717),n(98830)),y=n(5095),g=n(95260),m=n(14516),b=n(18394),_=n(25917),w=n(7748),k=((0,v.Z)([(0,g.Mo)("ha-device-action-picker")],(function(t,e){return{F:function(e){function n(){var e;return(0,l.Z)(this,n),e=(0,h.Z)(this,n,[_._2,_.AG,function(t){return{device_id:t||"",domain:"",entity_id:""}}]),t((0,d.Z)(e)),e}return(0,f.Z)(n,e),(0,u.Z)(n)}(e),d:[{kind:"get",key:"NO_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.actions.no_actions")}},{kind:"get",key:"UNKNOWN_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.actions.unknown_action")}}]}}),w.g),n(27056),n(39663),n(38149));(0,v.Z)([(0,g.Mo)("ha-automation-action-device_id")],(function(t,e){var n,v=function(e){function n(){var e;(0,l.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,h.Z)(this,n,[].concat(i)),t((0,d.Z)(e)),e}return(0,f.Z)(n,e),(0,u.Z)(n)}(e);return{F:v,d:[{kind:"field",decorators:[(0,g.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:Object})],key:"action",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_deviceId",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_capabilities",value:void 0},{kind:"field",decorators:[(0,g.SB)(),(0,p.F_)({context:k.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"field",key:"_origAction",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{device_id:"",domain:"",entity_id:""}}},{kind:"field",key:"_extraFieldsData",value:function(){return(0,m.Z)((function(t,e){var n={};return e.extra_fields.forEach((function(e){void 0!==t[e.name]&&(n[e.name]=t[e.name])})),n}))}},{kind:"method",key:"render",value:function(){var t,e=this._deviceId||this.action.device_id;return(0,y.dy)(r||(r=(0,s.Z)([' <ha-device-picker .value="','" .disabled="','" @value-changed="','" .hass="','" label="','"></ha-device-picker> <ha-device-action-picker .value="','" .deviceId="','" .disabled="','" @value-changed="','" .hass="','" label="','"></ha-device-action-picker> '," "])),e,this.disabled,this._devicePicked,this.hass,this.hass.localize("ui.panel.config.automation.editor.actions.type.device_id.label"),this.action,e,this.disabled,this._deviceActionPicked,this.hass,this.hass.localize("ui.panel.config.automation.editor.actions.type.device_id.action"),null!==(t=this._capabilities)&&void 0!==t&&null!==(t=t.extra_fields)&&void 0!==t&&t.length?(0,y.dy)(i||(i=(0,s.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" .computeLabel="','" @value-changed="','"></ha-form> '])),this.hass,this._extraFieldsData(this.action,this._capabilities),this._capabilities.extra_fields,this.disabled,this._extraFieldsComputeLabelCallback(this.hass.localize),this._extraFieldsChanged):"")}},{kind:"method",key:"firstUpdated",value:function(){this._capabilities||this._getCapabilities(),this.action&&(this._origAction=this.action)}},{kind:"method",key:"updated",value:function(t){var e=t.get("action");e&&!(0,_.hH)(this._entityReg,e,this.action)&&(this._deviceId=void 0,this._getCapabilities())}},{kind:"method",key:"_getCapabilities",value:(n=(0,c.Z)((0,a.Z)().mark((function t(){return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!this.action.domain){t.next=6;break}return t.next=3,(0,_._K)(this.hass,this.action);case 3:t.t0=t.sent,t.next=7;break;case 6:t.t0=void 0;case 7:this._capabilities=t.t0;case 8:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"_devicePicked",value:function(t){t.stopPropagation(),this._deviceId=t.target.value,void 0===this._deviceId&&(0,b.B)(this,"value-changed",{value:v.defaultConfig})}},{kind:"method",key:"_deviceActionPicked",value:function(t){t.stopPropagation();var e=t.detail.value;this._origAction&&(0,_.hH)(this._entityReg,this._origAction,e)&&(e=this._origAction),(0,b.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_extraFieldsChanged",value:function(t){t.stopPropagation(),(0,b.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),t.detail.value)})}},{kind:"method",key:"_extraFieldsComputeLabelCallback",value:function(t){return function(e){return t("ui.panel.config.automation.editor.actions.type.device_id.extra_fields.".concat(e.name))||e.name}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,y.iv)(o||(o=(0,s.Z)(["ha-device-picker{display:block;margin-bottom:24px}ha-device-action-picker{display:block}ha-form{display:block;margin-top:24px}"])))}}]}}),y.oi)},52668:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(88962),a=n(33368),c=n(71650),s=n(68308),u=n(82390),l=n(69205),h=n(91808),n(97393),n(85717),d=n(5095),f=n(95260),v=n(18394),n(91998),n(52910),n(51520),n(80392),p=n(63602),!(y=e([p])).then){t.next=28;break}return t.next=24,y;case 24:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=29;break;case 28:t.t0=y;case 29:p=t.t0[0],(0,h.Z)([(0,f.Mo)("ha-automation-action-event")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,s.Z)(this,n,[].concat(i)),t((0,u.Z)(e)),e}return(0,l.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,f.Cb)()],key:"action",value:void 0},{kind:"field",decorators:[(0,f.IO)("ha-yaml-editor",!0)],key:"_yamlEditor",value:void 0},{kind:"field",key:"_actionData",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{event:"",event_data:{}}}},{kind:"method",key:"updated",value:function(t){t.has("action")&&(this._actionData&&this._actionData!==this.action.event_data&&this._yamlEditor&&this._yamlEditor.setValue(this.action.event_data),this._actionData=this.action.event_data)}},{kind:"method",key:"render",value:function(){var t=this.action,e=t.event,n=t.event_data;return(0,d.dy)(g||(g=(0,o.Z)([' <ha-textfield .label="','" .value="','" .disabled="','" @change="','"></ha-textfield> <ha-yaml-editor .hass="','" .label="','" .name="','" .readOnly="','" .defaultValue="','" @value-changed="','"></ha-yaml-editor> '])),this.hass.localize("ui.panel.config.automation.editor.actions.type.event.event"),e,this.disabled,this._eventChanged,this.hass,this.hass.localize("ui.panel.config.automation.editor.actions.type.event.event_data"),"event_data",this.disabled,n,this._dataChanged)}},{kind:"method",key:"_dataChanged",value:function(t){t.stopPropagation(),t.detail.isValid&&(this._actionData=t.detail.value,(0,p.a0)(this,t))}},{kind:"method",key:"_eventChanged",value:function(t){t.stopPropagation(),(0,v.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{event:t.target.value})})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,d.iv)(m||(m=(0,o.Z)(["ha-textfield{display:block}"])))}}]}}),d.oi),r(),t.next=37;break;case 34:t.prev=34,t.t2=t.catch(0),r(t.t2);case 37:case"end":return t.stop()}}),t,null,[[0,34]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},62286:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(46097),a=n(88962),c=n(33368),s=n(71650),u=n(68308),l=n(82390),h=n(69205),d=n(91808),n(97393),n(85717),f=n(5095),v=n(95260),p=n(18394),n(51520),y=n(29950),g=n(48866),!(m=e([g])).then){t.next=27;break}return t.next=23,m;case 23:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=28;break;case 27:t.t0=m;case 28:g=t.t0[0],(0,d.Z)([(0,v.Mo)("ha-automation-action-if")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,h.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"path",value:void 0},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,v.SB)()],key:"_showElse",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{if:[],then:[]}}},{kind:"method",key:"render",value:function(){var t,e,n,r=this.action;return(0,f.dy)(b||(b=(0,a.Z)([" <h3> ",'*: </h3> <ha-automation-condition .path="','" .conditions="','" .disabled="','" @value-changed="','" .hass="','"></ha-automation-condition> <h3> ','*: </h3> <ha-automation-action .path="','" .actions="','" .disabled="','" @value-changed="','" .hass="','"></ha-automation-action> '," "])),this.hass.localize("ui.panel.config.automation.editor.actions.type.if.if"),[].concat((0,o.Z)(null!==(t=this.path)&&void 0!==t?t:[]),["if"]),r.if,this.disabled,this._ifChanged,this.hass,this.hass.localize("ui.panel.config.automation.editor.actions.type.if.then"),[].concat((0,o.Z)(null!==(e=this.path)&&void 0!==e?e:[]),["then"]),r.then,this.disabled,this._thenChanged,this.hass,this._showElse||r.else?(0,f.dy)(_||(_=(0,a.Z)([" <h3> ",': </h3> <ha-automation-action .path="','" .actions="','" .disabled="','" @value-changed="','" .hass="','"></ha-automation-action> '])),this.hass.localize("ui.panel.config.automation.editor.actions.type.if.else"),[].concat((0,o.Z)(null!==(n=this.path)&&void 0!==n?n:[]),["else"]),r.else||[],this.disabled,this._elseChanged,this.hass):(0,f.dy)(w||(w=(0,a.Z)([' <div class="link-button-row"> <button class="link" @click="','" .disabled="','"> '," </button> </div>"])),this._addElse,this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.type.if.add_else")))}},{kind:"method",key:"_addElse",value:function(){this._showElse=!0}},{kind:"method",key:"_ifChanged",value:function(t){t.stopPropagation();var e=t.detail.value;(0,p.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{if:e})})}},{kind:"method",key:"_thenChanged",value:function(t){t.stopPropagation();var e=t.detail.value;(0,p.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{then:e})})}},{kind:"method",key:"_elseChanged",value:function(t){t.stopPropagation(),this._showElse=!0;var e=t.detail.value,n=Object.assign(Object.assign({},this.action),{},{else:e});0===e.length&&delete n.else,(0,p.B)(this,"value-changed",{value:n})}},{kind:"get",static:!0,key:"styles",value:function(){return[y.Qx,(0,f.iv)(k||(k=(0,a.Z)([".link-button-row{padding:14px}"])))]}}]}}),f.oi),r(),t.next=36;break;case 33:t.prev=33,t.t2=t.catch(0),r(t.t2);case 36:case"end":return t.stop()}}),t,null,[[0,33]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},15787:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m,b;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(46097),a=n(88962),c=n(33368),s=n(71650),u=n(68308),l=n(82390),h=n(69205),d=n(91808),n(97393),n(85717),f=n(5095),v=n(95260),p=n(18394),n(51520),y=n(29950),g=n(48866),!(m=e([g])).then){t.next=27;break}return t.next=23,m;case 23:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=28;break;case 27:t.t0=m;case 28:g=t.t0[0],(0,d.Z)([(0,v.Mo)("ha-automation-action-parallel")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,h.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"path",value:void 0},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{parallel:[]}}},{kind:"method",key:"render",value:function(){var t,e=this.action;return(0,f.dy)(b||(b=(0,a.Z)([' <ha-automation-action .path="','" .actions="','" .disabled="','" @value-changed="','" .hass="','"></ha-automation-action> '])),[].concat((0,o.Z)(null!==(t=this.path)&&void 0!==t?t:[]),["parallel"]),e.parallel,this.disabled,this._actionsChanged,this.hass)}},{kind:"method",key:"_actionsChanged",value:function(t){t.stopPropagation();var e=t.detail.value;(0,p.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{parallel:e})})}},{kind:"get",static:!0,key:"styles",value:function(){return y.Qx}}]}}),f.oi),r(),t.next=36;break;case 33:t.prev=33,t.t2=t.catch(0),r(t.t2);case 36:case"end":return t.stop()}}),t,null,[[0,33]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},49368:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),h=(n(97393),n(85717),n(5095)),d=n(95260),f=n(14516),v=n(18394);n(39624),(0,l.Z)([(0,d.Mo)("ha-automation-action-play_media")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"narrow",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{service:"media_player.play_media",target:{entity_id:""},data:{media_content_id:"",media_content_type:""},metadata:{}}}},{kind:"field",key:"_getSelectorValue",value:function(){return(0,f.Z)((function(t){var e,n,r;return{entity_id:(null===(e=t.target)||void 0===e?void 0:e.entity_id)||t.entity_id,media_content_id:null===(n=t.data)||void 0===n?void 0:n.media_content_id,media_content_type:null===(r=t.data)||void 0===r?void 0:r.media_content_type,metadata:t.metadata}}))}},{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,i.Z)([' <ha-selector-media .hass="','" .disabled="','" .value="','" @value-changed="','"></ha-selector-media> '])),this.hass,this.disabled,this._getSelectorValue(this.action),this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation(),(0,v.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{service:"media_player.play_media",target:{entity_id:t.detail.value.entity_id},data:{media_content_id:t.detail.value.media_content_id,media_content_type:t.detail.value.media_content_type},metadata:t.detail.value.metadata||{}})})}}]}}),h.oi)},66873:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var o,a,c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x,L;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,o=n(88962),a=n(46097),c=n(33368),s=n(71650),u=n(68308),l=n(82390),h=n(69205),d=n(91808),n(85472),n(46798),n(97393),n(46349),n(7179),n(85717),n(22859),f=n(5095),v=n(95260),p=n(14516),y=n(18394),n(51520),g=n(29950),m=n(48866),b=n(13426),n(39663),!(_=e([m])).then){t.next=40;break}return t.next=36,_;case 36:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=41;break;case 40:t.t0=_;case 41:m=t.t0[0],x=["count","while","until","for_each"],L=function(t){return x.find((function(e){return e in t}))},(0,d.Z)([(0,v.Mo)("ha-automation-action-repeat")],(function(t,e){var n=function(e){function n(){var e;(0,s.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,u.Z)(this,n,[].concat(i)),t((0,l.Z)(e)),e}return(0,h.Z)(n,e),(0,c.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"path",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{repeat:{count:2,sequence:[]}}}},{kind:"field",key:"_schema",value:function(){return(0,p.Z)((function(t,e,n,r){return[{name:"type",selector:{select:{mode:"dropdown",options:x.map((function(e){return{value:e,label:t("ui.panel.config.automation.editor.actions.type.repeat.type.".concat(e,".label"))}}))}}}].concat((0,a.Z)("count"===e?[{name:"count",required:!0,selector:n?{template:{}}:{number:{mode:"box",min:1}}}]:[]),(0,a.Z)("until"===e||"while"===e?[{name:e,selector:{condition:{path:[].concat((0,a.Z)(null!=r?r:[]),["repeat",e])}}}]:[]),(0,a.Z)("for_each"===e?[{name:"for_each",required:!0,selector:{object:{}}}]:[]),[{name:"sequence",selector:{action:{path:[].concat((0,a.Z)(null!=r?r:[]),["repeat","sequence"])}}}])}))}},{kind:"method",key:"render",value:function(){var t=this.action.repeat,e=L(t),n=this._schema(this.hass.localize,null!=e?e:"count","count"in t&&"string"==typeof t.count&&(0,b.J)(t.count),this.path),r=Object.assign(Object.assign({},t),{},{type:e});return(0,f.dy)(w||(w=(0,o.Z)(['<ha-form .hass="','" .data="','" .schema="','" .disabled="','" @value-changed="','" .computeLabel="','"></ha-form>'])),this.hass,r,n,this.disabled,this._valueChanged,this._computeLabelCallback)}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation();var e,n,r=t.detail.value,i=r.type;(delete r.type,i!==L(this.action.repeat))&&("count"===i&&(r.count=2,delete r.while,delete r.until,delete r.for_each),"while"===i&&(r.while=null!==(e=r.until)&&void 0!==e?e:[],delete r.count,delete r.until,delete r.for_each),"until"===i&&(r.until=null!==(n=r.while)&&void 0!==n?n:[],delete r.count,delete r.while,delete r.for_each),"for_each"===i&&(r.for_each={},delete r.count,delete r.while,delete r.until));(0,y.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{repeat:Object.assign({},r)})})}},{kind:"get",static:!0,key:"styles",value:function(){return[g.Qx,(0,f.iv)(k||(k=(0,o.Z)(["ha-textfield{margin-top:16px}"])))]}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){switch(e.name){case"type":return t.hass.localize("ui.panel.config.automation.editor.actions.type.repeat.type_select");case"count":return t.hass.localize("ui.panel.config.automation.editor.actions.type.repeat.type.count.label");case"while":return t.hass.localize("ui.panel.config.automation.editor.actions.type.repeat.type.while.conditions")+":";case"until":return t.hass.localize("ui.panel.config.automation.editor.actions.type.repeat.type.until.conditions")+":";case"for_each":return t.hass.localize("ui.panel.config.automation.editor.actions.type.repeat.type.for_each.items")+":";case"sequence":return t.hass.localize("ui.panel.config.automation.editor.actions.type.repeat.sequence")+":"}return""}}}]}}),f.oi),r(),t.next=51;break;case 48:t.prev=48,t.t2=t.catch(0),r(t.t2);case 51:case"end":return t.stop()}}),t,null,[[0,48]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var a=t.apply(e,n);function c(t){o(a,r,i,c,s,"next",t)}function s(t){o(a,r,i,c,s,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},1794:function(t,e,n){var r,i,o,a,c,s=n(88962),u=n(62746),l=n(33368),h=n(71650),d=n(68308),f=n(82390),v=n(69205),p=n(91808),y=(n(97393),n(46798),n(9849),n(13526),n(82073),n(51467),n(85717),n(5095)),g=n(95260),m=n(14516),b=n(38768),_=n(18394),w=n(36655),k=n(44672),x=n(13426),L=(n(84871),n(11420));(0,p.Z)([(0,g.Mo)("ha-automation-action-service")],(function(t,e){var n=function(e){function n(){var e;(0,h.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,d.Z)(this,n,[].concat(i)),t((0,f.Z)(e)),e}return(0,v.Z)(n,e),(0,l.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,g.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,g.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"narrow",value:function(){return!1}},{kind:"field",decorators:[(0,g.SB)()],key:"_action",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_responseChecked",value:function(){return!1}},{kind:"field",key:"_fields",value:function(){return(0,m.Z)((function(t,e){if(!e)return{fields:{}};var n=(0,w.M)(e),r=(0,k.p)(e);return n in t&&r in t[n]?{fields:t[n][r].fields}:{fields:{}}}))}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{service:"",data:{}}}},{kind:"method",key:"willUpdate",value:function(t){var e;if(t.has("action")){try{(0,b.hu)(this.action,L.TL)}catch(r){return void(0,_.B)(this,"ui-mode-not-available",r)}var n=this._fields(this.hass.services,null===(e=this.action)||void 0===e?void 0:e.service).fields;this.action&&(Object.entries(this.action).some((function(t){var e=(0,u.Z)(t,2),n=e[0],r=e[1];return"data"!==n&&(0,x._)(r)}))||this.action.data&&Object.entries(this.action.data).some((function(t){var e=(0,u.Z)(t,2),r=e[0],i=e[1],o=n[r];return(null==o||!o.selector||!("template"in o.selector)&&!("object"in o.selector))&&(0,x._)(i)})))?(0,_.B)(this,"ui-mode-not-available",Error(this.hass.localize("ui.errors.config.no_template_editor_support"))):this.action.entity_id?(this._action=Object.assign(Object.assign({},this.action),{},{data:Object.assign(Object.assign({},this.action.data),{},{entity_id:this.action.entity_id})}),delete this._action.entity_id):this._action=this.action}}},{kind:"method",key:"render",value:function(){var t,e;if(!this._action)return y.Ld;var n=this._action.service?this._action.service.split(".",2):[void 0,void 0],c=(0,u.Z)(n,2),l=c[0],h=c[1];return(0,y.dy)(r||(r=(0,s.Z)([' <ha-service-control .narrow="','" .hass="','" .value="','" .disabled="','" .showAdvanced="','" @value-changed="','"></ha-service-control> '," "])),this.narrow,this.hass,this._action,this.disabled,null===(t=this.hass.userData)||void 0===t?void 0:t.showAdvanced,this._actionChanged,l&&h&&null!==(e=this.hass.services[l])&&void 0!==e&&null!==(e=e[h])&&void 0!==e&&e.response?(0,y.dy)(i||(i=(0,s.Z)(['<ha-settings-row .narrow="','"> ',' <span slot="heading">','</span> <span slot="description"> ',' </span> <ha-textfield .value="','" .required="','" .disabled="','" @change="','"></ha-textfield> </ha-settings-row>'])),this.narrow,this.hass.services[l][h].response.optional?(0,y.dy)(o||(o=(0,s.Z)(['<ha-checkbox .checked="','" .disabled="','" @change="','" slot="prefix"></ha-checkbox>'])),this._action.response_variable||this._responseChecked,this.disabled,this._responseCheckboxChanged):(0,y.dy)(a||(a=(0,s.Z)(['<div slot="prefix" class="checkbox-spacer"></div>']))),this.hass.localize("ui.panel.config.automation.editor.actions.type.service.response_variable"),this.hass.services[l][h].response.optional?this.hass.localize("ui.panel.config.automation.editor.actions.type.service.has_optional_response"):this.hass.localize("ui.panel.config.automation.editor.actions.type.service.has_response"),this._action.response_variable||"",!this.hass.services[l][h].response.optional,this.disabled||this.hass.services[l][h].response.optional&&!this._action.response_variable&&!this._responseChecked,this._responseVariableChanged):y.Ld)}},{kind:"method",key:"_actionChanged",value:function(t){t.detail.value===this._action&&t.stopPropagation();var e=Object.assign(Object.assign({},this.action),t.detail.value);if("response_variable"in this.action){var n,r=this._action.service?this._action.service.split(".",2):[void 0,void 0],i=(0,u.Z)(r,2),o=i[0],a=i[1];o&&a&&null!==(n=this.hass.services[o])&&void 0!==n&&n[a]&&!("response"in this.hass.services[o][a])&&(delete e.response_variable,this._responseChecked=!1)}(0,_.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_responseVariableChanged",value:function(t){var e=Object.assign(Object.assign({},this.action),{},{response_variable:t.target.value});t.target.value||delete e.response_variable,(0,_.B)(this,"value-changed",{value:e})}},{kind:"method",key:"_responseCheckboxChanged",value:function(t){if(this._responseChecked=t.target.checked,!this._responseChecked){var e=Object.assign({},this.action);delete e.response_variable,(0,_.B)(this,"value-changed",{value:e})}}},{kind:"get",static:!0,key:"styles",value:function(){return(0,y.iv)(c||(c=(0,s.Z)(["ha-service-control{display:block;margin:0 -16px}ha-settings-row{margin:0 -16px;padding:var(--service-control-padding,0 16px)}ha-settings-row{--paper-time-input-justify-content:flex-end;--settings-row-content-width:100%;--settings-row-prefix-display:contents;border-top:var(--service-control-items-border-top,1px solid var(--divider-color))}ha-checkbox{margin-left:-16px}.checkbox-spacer{width:32px}"])))}}]}}),y.oi)},98723:function(t,e,n){var r,i,o=n(88962),a=n(33368),c=n(71650),s=n(68308),u=n(82390),l=n(69205),h=n(91808),d=(n(97393),n(85717),n(5095)),f=n(95260),v=n(18394);n(51520),(0,h.Z)([(0,f.Mo)("ha-automation-action-stop")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,s.Z)(this,n,[].concat(i)),t((0,u.Z)(e)),e}return(0,l.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)()],key:"action",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{stop:""}}},{kind:"method",key:"render",value:function(){var t=this.action,e=t.error,n=t.stop,i=t.response_variable;return(0,d.dy)(r||(r=(0,o.Z)([' <ha-textfield .label="','" .value="','" .disabled="','" @change="','"></ha-textfield> <ha-textfield .label="','" .value="','" .disabled="','" @change="','"></ha-textfield> <ha-formfield .disabled="','" .label="','"> <ha-switch .disabled="','" .checked="','" @change="','"></ha-switch> </ha-formfield> '])),this.hass.localize("ui.panel.config.automation.editor.actions.type.stop.stop"),n,this.disabled,this._stopChanged,this.hass.localize("ui.panel.config.automation.editor.actions.type.stop.response_variable"),i||"",this.disabled,this._responseChanged,this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.type.stop.error"),this.disabled,null!=e&&e,this._errorChanged)}},{kind:"method",key:"_stopChanged",value:function(t){t.stopPropagation(),(0,v.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{stop:t.target.value})})}},{kind:"method",key:"_responseChanged",value:function(t){t.stopPropagation(),(0,v.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{response_variable:t.target.value})})}},{kind:"method",key:"_errorChanged",value:function(t){t.stopPropagation(),(0,v.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{error:t.target.checked})})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,d.iv)(i||(i=(0,o.Z)(["ha-textfield{display:block;margin-bottom:24px}"])))}}]}}),d.oi)},29800:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function i(){i=function(){return e};var t,e={},n=Object.prototype,o=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},s=c.iterator||"@@iterator",u=c.asyncIterator||"@@asyncIterator",l=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function d(t,e,n,r){var i=e&&e.prototype instanceof b?e:b,o=Object.create(i.prototype),c=new H(r||[]);return a(o,"_invoke",{value:A(t,n,c)}),o}function f(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function _(){}function w(){}var k={};h(k,s,(function(){return this}));var x=Object.getPrototypeOf,L=x&&x(x(M([])));L&&L!==n&&o.call(L,s)&&(k=L);var C=w.prototype=b.prototype=Object.create(k);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function E(t,e){function n(i,a,c,s){var u=f(t[i],t,a);if("throw"!==u.type){var l=u.arg,h=l.value;return h&&"object"==r(h)&&o.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,s)}),(function(t){n("throw",t,c,s)})):e.resolve(h).then((function(t){l.value=t,c(l)}),(function(t){return n("throw",t,c,s)}))}s(u.arg)}var i;a(this,"_invoke",{value:function(t,r){function o(){return new e((function(e,i){n(t,r,e,i)}))}return i=i?i.then(o,o):o()}})}function A(e,n,r){var i=v;return function(o,a){if(i===y)throw new Error("Generator is already running");if(i===g){if("throw"===o)throw a;return{value:t,done:!0}}for(r.method=o,r.arg=a;;){var c=r.delegate;if(c){var s=O(c,r);if(s){if(s===m)continue;return s}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(i===v)throw i=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);i=y;var u=f(e,n,r);if("normal"===u.type){if(i=r.done?g:p,u.arg===m)continue;return{value:u.arg,done:r.done}}"throw"===u.type&&(i=g,r.method="throw",r.arg=u.arg)}}}function O(e,n){var r=n.method,i=e.iterator[r];if(i===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,O(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var o=f(i,e.iterator,n.arg);if("throw"===o.type)return n.method="throw",n.arg=o.arg,n.delegate=null,m;var a=o.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function j(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function V(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(j,this),this.reset(!0)}function M(e){if(e||""===e){var n=e[s];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var i=-1,a=function n(){for(;++i<e.length;)if(o.call(e,i))return n.value=e[i],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return _.prototype=w,a(C,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:_,configurable:!0}),_.displayName=h(w,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===_||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,l,"GeneratorFunction")),t.prototype=Object.create(C),t},e.awrap=function(t){return{__await:t}},Z(E.prototype),h(E.prototype,u,(function(){return this})),e.AsyncIterator=E,e.async=function(t,n,r,i,o){void 0===o&&(o=Promise);var a=new E(d(t,n,r,i),o);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(C),h(C,l,"Generator"),h(C,s,(function(){return this})),h(C,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=M,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(V),!e)for(var n in this)"t"===n.charAt(0)&&o.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,i){return c.type="throw",c.arg=e,n.next=r,i&&(n.method="next",n.arg=t),!!i}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var s=o.call(a,"catchLoc"),u=o.call(a,"finallyLoc");if(s&&u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&o.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var i=r;break}}i&&("break"===t||"continue"===t)&&i.tryLoc<=e&&e<=i.finallyLoc&&(i=null);var a=i?i.completion:{};return a.type=t,a.arg=e,i?(this.method="next",this.next=i.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),V(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var i=r.arg;V(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:M(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function o(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var n=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=n){var r,i,o,a,c=[],s=!0,u=!1;try{if(o=(n=n.call(t)).next,0===e){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=o.call(n)).done)&&(c.push(r.value),c.length!==e);s=!0);}catch(t){u=!0,i=t}finally{try{if(!s&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(u)throw i}}return c}}(t,e)||function(t,e){if(!t)return;if("string"==typeof t)return a(t,e);var n=Object.prototype.toString.call(t).slice(8,-1);"Object"===n&&t.constructor&&(n=t.constructor.name);if("Map"===n||"Set"===n)return Array.from(t);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return a(t,e)}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function a(t,e){(null==e||e>t.length)&&(e=t.length);for(var n=0,r=new Array(e);n<e;n++)r[n]=t[n];return r}function c(t,e,n,r,i,o,a){try{var c=t[o](a),s=c.value}catch(u){return void n(u)}c.done?e(s):Promise.resolve(s).then(r,i)}n.a(t,function(){var t,e=(t=i().mark((function t(e,r){var a,c,s,u,l,h,d,f,v,p,y,g,m,b,_,w,k,x,L,C;return i().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,a=n(46097),c=n(88962),s=n(33368),u=n(71650),l=n(68308),h=n(82390),d=n(69205),f=n(91808),n(97393),n(85717),v=n(5095),p=n(95260),y=n(4771),g=n(27959),m=n(18394),n(92353),n(48950),n(51520),b=n(41848),_=n(63602),!(w=e([b,_])).then){t.next=31;break}return t.next=27,w;case 27:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=32;break;case 31:t.t0=w;case 32:k=t.t0,x=o(k,2),b=x[0],_=x[1],(0,f.Z)([(0,p.Mo)("ha-automation-action-wait_for_trigger")],(function(t,e){var n=function(e){function n(){var e;(0,u.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,l.Z)(this,n,[].concat(i)),t((0,h.Z)(e)),e}return(0,d.Z)(n,e),(0,s.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"path",value:void 0},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{wait_for_trigger:[]}}},{kind:"method",key:"render",value:function(){var t,e,n=(0,g.c)(this.action.timeout);return(0,v.dy)(L||(L=(0,c.Z)([' <ha-duration-input .label="','" .data="','" .disabled="','" enableMillisecond @value-changed="','"></ha-duration-input> <ha-formfield .disabled="','" .label="','"> <ha-switch .checked="','" .disabled="','" @change="','"></ha-switch> </ha-formfield> <ha-automation-trigger .path="','" .triggers="','" .hass="','" .disabled="','" .name="','" @value-changed="','"></ha-automation-trigger> '])),this.hass.localize("ui.panel.config.automation.editor.actions.type.wait_for_trigger.timeout"),n,this.disabled,this._timeoutChanged,this.disabled,this.hass.localize("ui.panel.config.automation.editor.actions.type.wait_for_trigger.continue_timeout"),null===(t=this.action.continue_on_timeout)||void 0===t||t,this.disabled,this._continueChanged,[].concat((0,a.Z)(null!==(e=this.path)&&void 0!==e?e:[]),["wait_for_trigger"]),(0,y.r)(this.action.wait_for_trigger),this.hass,this.disabled,"wait_for_trigger",this._valueChanged)}},{kind:"method",key:"_timeoutChanged",value:function(t){t.stopPropagation();var e=t.detail.value;e&&(0,m.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{timeout:e})})}},{kind:"method",key:"_continueChanged",value:function(t){(0,m.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.action),{},{continue_on_timeout:t.target.checked})})}},{kind:"method",key:"_valueChanged",value:function(t){(0,_.a0)(this,t)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(C||(C=(0,c.Z)(["ha-duration-input{display:block;margin-bottom:24px}ha-automation-trigger{display:block;margin-top:24px}"])))}}]}}),v.oi),r(),t.next=43;break;case 40:t.prev=40,t.t2=t.catch(0),r(t.t2);case 43:case"end":return t.stop()}}),t,null,[[0,40]])})),function(){var e=this,n=arguments;return new Promise((function(r,i){var o=t.apply(e,n);function a(t){c(o,r,i,a,s,"next",t)}function s(t){c(o,r,i,a,s,"throw",t)}a(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},93972:function(t,e,n){var r,i=n(88962),o=n(33368),a=n(71650),c=n(68308),s=n(82390),u=n(69205),l=n(91808),h=(n(97393),n(22859),n(5095)),d=n(95260),f=(n(39663),[{name:"wait_template",selector:{template:{}}},{name:"timeout",required:!1,selector:{text:{}}},{name:"continue_on_timeout",selector:{boolean:{}}}]);(0,l.Z)([(0,d.Mo)("ha-automation-action-wait_template")],(function(t,e){var n=function(e){function n(){var e;(0,a.Z)(this,n);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return e=(0,c.Z)(this,n,[].concat(i)),t((0,s.Z)(e)),e}return(0,u.Z)(n,e),(0,o.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"action",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"get",static:!0,key:"defaultConfig",value:function(){return{wait_template:"",continue_on_timeout:!0}}},{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,i.Z)([' <ha-form .hass="','" .data="','" .schema="','" .disabled="','" .computeLabel="','"></ha-form> '])),this.hass,this.action,f,this.disabled,this._computeLabelCallback)}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(e){return t.hass.localize("ui.panel.config.automation.editor.actions.type.wait_template.".concat("continue_on_timeout"===e.name?"continue_timeout":e.name))}}}]}}),h.oi)}}]);
+//# sourceMappingURL=4993.2Bj2KZPrX1E.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[5059],{86089:function(e,i,t){t.d(i,{U:function(){return n}});var n=function(e){return e.stopPropagation()}},25551:function(e,i,t){t.d(i,{u:function(){return a}});var n=t(14516),a=function(e,i){try{var t,n;return null!==(t=null===(n=l(i))||void 0===n?void 0:n.of(e))&&void 0!==t?t:e}catch(a){return e}},l=(0,n.Z)((function(e){return Intl&&"DisplayNames"in Intl?new Intl.DisplayNames(e.language,{type:"language",fallback:"code"}):void 0}))},95352:function(e,i,t){var n,a,l,r,d=t(88962),s=t(33368),o=t(71650),c=t(68308),u=t(82390),h=t(69205),p=t(91808),v=t(34541),f=t(47838),k=(t(97393),t(85472),t(46798),t(9849),t(90126),t(22859),t(46349),t(70320),t(5095)),y=t(95260),b=t(18394),m=t(86089),_=t(25551),Z=(t(46097),t(85717),t(90532),t(71133),"preferred"),g="last_used";(0,p.Z)([(0,y.Mo)("ha-assist-pipeline-picker")],(function(e,i){var t=function(i){function t(){var i;(0,o.Z)(this,t);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return i=(0,c.Z)(this,t,[].concat(a)),e((0,u.Z)(i)),i}return(0,h.Z)(t,i),(0,s.Z)(t)}(i);return{F:t,d:[{kind:"field",decorators:[(0,y.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"includeLastUsed",value:function(){return!1}},{kind:"field",decorators:[(0,y.SB)()],key:"_pipelines",value:void 0},{kind:"field",decorators:[(0,y.SB)()],key:"_preferredPipeline",value:function(){return null}},{kind:"get",key:"_default",value:function(){return this.includeLastUsed?g:Z}},{kind:"method",key:"render",value:function(){var e,i,t=this;if(!this._pipelines)return k.Ld;var r=null!==(e=this.value)&&void 0!==e?e:this._default;return(0,k.dy)(n||(n=(0,d.Z)([' <ha-select .label="','" .value="','" .required="','" .disabled="','" @selected="','" @closed="','" fixedMenuPosition naturalMenuWidth> ',' <ha-list-item .value="','"> '," </ha-list-item> "," </ha-select> "])),this.label||this.hass.localize("ui.components.pipeline-picker.pipeline"),r,this.required,this.disabled,this._changed,m.U,this.includeLastUsed?(0,k.dy)(a||(a=(0,d.Z)([' <ha-list-item .value="','"> '," </ha-list-item> "])),g,this.hass.localize("ui.components.pipeline-picker.last_used")):null,Z,this.hass.localize("ui.components.pipeline-picker.preferred",{preferred:null===(i=this._pipelines.find((function(e){return e.id===t._preferredPipeline})))||void 0===i?void 0:i.name}),this._pipelines.map((function(e){return(0,k.dy)(l||(l=(0,d.Z)(['<ha-list-item .value="','"> '," (",") </ha-list-item>"])),e.id,e.name,(0,_.u)(e.language,t.hass.locale))})))}},{kind:"method",key:"firstUpdated",value:function(e){var i,n=this;(0,v.Z)((0,f.Z)(t.prototype),"firstUpdated",this).call(this,e),(i=this.hass,i.callWS({type:"assist_pipeline/pipeline/list"})).then((function(e){n._pipelines=e.pipelines,n._preferredPipeline=e.preferred_pipeline}))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,k.iv)(r||(r=(0,d.Z)(["ha-select{width:100%}"])))}},{kind:"method",key:"_changed",value:function(e){var i=e.target;!this.hass||""===i.value||i.value===this.value||void 0===this.value&&i.value===this._default||(this.value=i.value===this._default?void 0:i.value,(0,b.B)(this,"value-changed",{value:this.value}))}}]}}),k.oi)},71133:function(e,i,t){var n,a,l,r,d=t(99312),s=t(81043),o=t(88962),c=t(33368),u=t(71650),h=t(68308),p=t(82390),v=t(69205),f=t(91808),k=t(34541),y=t(47838),b=(t(97393),t(49412)),m=t(3762),_=t(5095),Z=t(95260),g=t(72218),x=t(2537);t(54371),(0,f.Z)([(0,Z.Mo)("ha-select")],(function(e,i){var t=function(i){function t(){var i;(0,u.Z)(this,t);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return i=(0,h.Z)(this,t,[].concat(a)),e((0,p.Z)(i)),i}return(0,v.Z)(t,i),(0,c.Z)(t)}(i);return{F:t,d:[{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,_.dy)(n||(n=(0,o.Z)([" "," "," "])),(0,k.Z)((0,y.Z)(t.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,_.dy)(a||(a=(0,o.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):_.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,_.dy)(l||(l=(0,o.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):_.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,k.Z)((0,y.Z)(t.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,k.Z)((0,y.Z)(t.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,g.D)((0,s.Z)((0,d.Z)().mark((function i(){return(0,d.Z)().wrap((function(i){for(;;)switch(i.prev=i.next){case 0:return i.next=2,(0,x.y)();case 2:e.layoutOptions();case 3:case"end":return i.stop()}}),i)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,_.iv)(r||(r=(0,o.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),b.K)},75059:function(e,i,t){t.r(i),t.d(i,{HaAssistPipelineSelector:function(){return v}});var n,a,l=t(88962),r=t(33368),d=t(71650),s=t(68308),o=t(82390),c=t(69205),u=t(91808),h=(t(97393),t(5095)),p=t(95260),v=(t(95352),(0,u.Z)([(0,p.Mo)("ha-selector-assist_pipeline")],(function(e,i){var t=function(i){function t(){var i;(0,d.Z)(this,t);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return i=(0,s.Z)(this,t,[].concat(a)),e((0,o.Z)(i)),i}return(0,c.Z)(t,i),(0,r.Z)(t)}(i);return{F:t,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"method",key:"render",value:function(){var e;return(0,h.dy)(n||(n=(0,l.Z)([' <ha-assist-pipeline-picker .hass="','" .value="','" .label="','" .helper="','" .disabled="','" .required="','" .includeLastUsed="','"></ha-assist-pipeline-picker> '])),this.hass,this.value,this.label,this.helper,this.disabled,this.required,Boolean(null===(e=this.selector.assist_pipeline)||void 0===e?void 0:e.include_last_used))}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(a||(a=(0,l.Z)(["ha-conversation-agent-picker{width:100%}"])))}}]}}),h.oi))}}]);
+//# sourceMappingURL=5059.ezVDS_-SpfE.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[5803],{86089:function(e,n,t){t.d(n,{U:function(){return o}});var o=function(e){return e.stopPropagation()}},71133:function(e,n,t){var o,i,a,r,c=t(99312),s=t(81043),l=t(88962),d=t(33368),u=t(71650),p=t(68308),h=t(82390),f=t(69205),v=t(91808),g=t(34541),m=t(47838),k=(t(97393),t(49412)),_=t(3762),y=t(5095),b=t(95260),w=t(72218),Z=t(2537);t(54371),(0,v.Z)([(0,b.Mo)("ha-select")],(function(e,n){var t=function(n){function t(){var n;(0,u.Z)(this,t);for(var o=arguments.length,i=new Array(o),a=0;a<o;a++)i[a]=arguments[a];return n=(0,p.Z)(this,t,[].concat(i)),e((0,h.Z)(n)),n}return(0,f.Z)(t,n),(0,d.Z)(t)}(n);return{F:t,d:[{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,y.dy)(o||(o=(0,l.Z)([" "," "," "])),(0,g.Z)((0,m.Z)(t.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,y.dy)(i||(i=(0,l.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):y.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,y.dy)(a||(a=(0,l.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):y.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,g.Z)((0,m.Z)(t.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,g.Z)((0,m.Z)(t.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,w.D)((0,s.Z)((0,c.Z)().mark((function n(){return(0,c.Z)().wrap((function(n){for(;;)switch(n.prev=n.next){case 0:return n.next=2,(0,Z.y)();case 2:e.layoutOptions();case 3:case"end":return n.stop()}}),n)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[_.W,(0,y.iv)(r||(r=(0,l.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),k.K)},65803:function(e,n,t){t.r(n),t.d(n,{HaConversationAgentSelector:function(){return j}});var o,i,a,r,c,s,l,d,u,p,h,f,v,g=t(88962),m=t(33368),k=t(71650),_=t(68308),y=t(82390),b=t(69205),w=t(91808),Z=(t(97393),t(5095)),C=t(95260),x=t(99312),L=t(81043),F=t(34541),S=t(47838),z=(t(85472),t(46798),t(9849),t(90126),t(40271),t(60163),t(46349),t(70320),t(22859),t(18394)),E=t(86089),A=t(72218),B=t(60470),D=t(64346),T=t(62746),O=(t(85717),t(51358),t(47084),t(5239),t(98490),function(e,n){var t;return e.callApi("POST","config/config_entries/options/flow",{handler:n,show_advanced_options:Boolean(null===(t=e.userData)||void 0===t?void 0:t.showAdvanced)})}),P=function(e,n){return e.callApi("GET","config/config_entries/options/flow/".concat(n))},M=function(e,n,t){return e.callApi("POST","config/config_entries/options/flow/".concat(n),t)},U=function(e,n){return e.callApi("DELETE","config/config_entries/options/flow/".concat(n))},q=t(46739),H=function(e,n,t){return(0,q.w)(e,Object.assign({startFlowHandler:n.entry_id,domain:n.domain},t),{flowType:"options_flow",loadDevicesAndAreas:!1,createFlow:(d=(0,L.Z)((0,x.Z)().mark((function e(t,o){var i,a,r;return(0,x.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,Promise.all([O(t,o),t.loadFragmentTranslation("config"),t.loadBackendTranslation("options",n.domain),t.loadBackendTranslation("selector",n.domain)]);case 2:return i=e.sent,a=(0,T.Z)(i,1),r=a[0],e.abrupt("return",r);case 6:case"end":return e.stop()}}),e)}))),function(e,n){return d.apply(this,arguments)}),fetchFlow:(l=(0,L.Z)((0,x.Z)().mark((function e(t,o){var i,a,r;return(0,x.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,Promise.all([P(t,o),t.loadFragmentTranslation("config"),t.loadBackendTranslation("options",n.domain),t.loadBackendTranslation("selector",n.domain)]);case 2:return i=e.sent,a=(0,T.Z)(i,1),r=a[0],e.abrupt("return",r);case 6:case"end":return e.stop()}}),e)}))),function(e,n){return l.apply(this,arguments)}),handleFlowStep:M,deleteFlow:U,renderAbortDescription:function(e,t){var i=e.localize("component.".concat(n.domain,".options.abort.").concat(t.reason),t.description_placeholders);return i?(0,Z.dy)(o||(o=(0,g.Z)([' <ha-markdown breaks allowsvg .content="','"></ha-markdown> '])),i):""},renderShowFormStepHeader:function(e,t){return e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".title"),t.description_placeholders)||e.localize("ui.dialogs.options_flow.form.header")},renderShowFormStepDescription:function(e,t){var o=e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".description"),t.description_placeholders);return o?(0,Z.dy)(i||(i=(0,g.Z)([' <ha-markdown allowsvg breaks .content="','"></ha-markdown> '])),o):""},renderShowFormStepFieldLabel:function(e,t,o){return e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".data.").concat(o.name))},renderShowFormStepFieldHelper:function(e,t,o){var i=e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".data_description.").concat(o.name),t.description_placeholders);return i?(0,Z.dy)(a||(a=(0,g.Z)(['<ha-markdown breaks .content="','"></ha-markdown>'])),i):""},renderShowFormStepFieldError:function(e,t,o){return e.localize("component.".concat(n.domain,".options.error.").concat(o),t.description_placeholders)||o},renderShowFormStepFieldLocalizeValue:function(e,t,o){return e.localize("component.".concat(n.domain,".selector.").concat(o))},renderShowFormStepSubmitButton:function(e,t){return e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".submit"))||e.localize("ui.panel.config.integrations.config_flow.".concat(!1===t.last_step?"next":"submit"))},renderExternalStepHeader:function(e,n){return""},renderExternalStepDescription:function(e,n){return""},renderCreateEntryDescription:function(e,n){return(0,Z.dy)(r||(r=(0,g.Z)([" <p>","</p> "])),e.localize("ui.dialogs.options_flow.success.description"))},renderShowFormProgressHeader:function(e,t){return e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".title"))||e.localize("component.".concat(n.domain,".title"))},renderShowFormProgressDescription:function(e,t){var o=e.localize("component.".concat(n.domain,".options.progress.").concat(t.progress_action),t.description_placeholders);return o?(0,Z.dy)(c||(c=(0,g.Z)([' <ha-markdown allowsvg breaks .content="','"></ha-markdown> '])),o):""},renderMenuHeader:function(e,t){return e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".title"))||e.localize("component.".concat(n.domain,".title"))},renderMenuDescription:function(e,t){var o=e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".description"),t.description_placeholders);return o?(0,Z.dy)(s||(s=(0,g.Z)([' <ha-markdown allowsvg breaks .content="','"></ha-markdown> '])),o):""},renderMenuOption:function(e,t,o){return e.localize("component.".concat(n.domain,".options.step.").concat(t.step_id,".menu_options.").concat(o),t.description_placeholders)},renderLoadingDescription:function(e,t){return e.localize("component.".concat(n.domain,".options.loading"))||("loading_flow"===t||"loading_step"===t?e.localize("ui.dialogs.options_flow.loading.".concat(t),{integration:(0,D.Lh)(e.localize,n.domain)}):"")}});var l,d},W=(t(90532),t(71133),"__NONE_OPTION__"),j=((0,w.Z)([(0,C.Mo)("ha-conversation-agent-picker")],(function(e,n){var t,o,i,a=function(n){function t(){var n;(0,k.Z)(this,t);for(var o=arguments.length,i=new Array(o),a=0;a<o;a++)i[a]=arguments[a];return n=(0,_.Z)(this,t,[].concat(i)),e((0,y.Z)(n)),n}return(0,b.Z)(t,n),(0,m.Z)(t)}(n);return{F:a,d:[{kind:"field",decorators:[(0,C.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,C.Cb)()],key:"language",value:void 0},{kind:"field",decorators:[(0,C.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,C.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,C.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,C.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,C.SB)()],key:"_agents",value:void 0},{kind:"field",decorators:[(0,C.SB)()],key:"_configEntry",value:void 0},{kind:"method",key:"render",value:function(){var e,n,t;if(!this._agents)return Z.Ld;var o=null!==(e=this.value)&&void 0!==e?e:this.required&&(!this.language||null!==(n=this._agents.find((function(e){return"homeassistant"===e.id})))&&void 0!==n&&n.supported_languages.includes(this.language))?"homeassistant":W;return(0,Z.dy)(l||(l=(0,g.Z)([' <ha-select .label="','" .value="','" .required="','" .disabled="','" @selected="','" @closed="','" fixedMenuPosition naturalMenuWidth> '," ","</ha-select>"," "])),this.label||this.hass.localize("ui.components.coversation-agent-picker.conversation_agent"),o,this.required,this.disabled,this._changed,E.U,this.required?Z.Ld:(0,Z.dy)(d||(d=(0,g.Z)(['<ha-list-item .value="','"> '," </ha-list-item>"])),W,this.hass.localize("ui.components.coversation-agent-picker.none")),this._agents.map((function(e){return(0,Z.dy)(u||(u=(0,g.Z)(['<ha-list-item .value="','" .disabled="','"> '," </ha-list-item>"])),e.id,"*"!==e.supported_languages&&0===e.supported_languages.length,e.name)})),null!==(t=this._configEntry)&&void 0!==t&&t.supports_options?(0,Z.dy)(p||(p=(0,g.Z)(['<ha-icon-button .path="','" @click="','"></ha-icon-button>'])),"M12,15.5A3.5,3.5 0 0,1 8.5,12A3.5,3.5 0 0,1 12,8.5A3.5,3.5 0 0,1 15.5,12A3.5,3.5 0 0,1 12,15.5M19.43,12.97C19.47,12.65 19.5,12.33 19.5,12C19.5,11.67 19.47,11.34 19.43,11L21.54,9.37C21.73,9.22 21.78,8.95 21.66,8.73L19.66,5.27C19.54,5.05 19.27,4.96 19.05,5.05L16.56,6.05C16.04,5.66 15.5,5.32 14.87,5.07L14.5,2.42C14.46,2.18 14.25,2 14,2H10C9.75,2 9.54,2.18 9.5,2.42L9.13,5.07C8.5,5.32 7.96,5.66 7.44,6.05L4.95,5.05C4.73,4.96 4.46,5.05 4.34,5.27L2.34,8.73C2.21,8.95 2.27,9.22 2.46,9.37L4.57,11C4.53,11.34 4.5,11.67 4.5,12C4.5,12.33 4.53,12.65 4.57,12.97L2.46,14.63C2.27,14.78 2.21,15.05 2.34,15.27L4.34,18.73C4.46,18.95 4.73,19.03 4.95,18.95L7.44,17.94C7.96,18.34 8.5,18.68 9.13,18.93L9.5,21.58C9.54,21.82 9.75,22 10,22H14C14.25,22 14.46,21.82 14.5,21.58L14.87,18.93C15.5,18.67 16.04,18.34 16.56,17.94L19.05,18.95C19.27,19.03 19.54,18.95 19.66,18.73L21.66,15.27C21.78,15.05 21.73,14.78 21.54,14.63L19.43,12.97Z",this._openOptionsFlow):"")}},{kind:"method",key:"willUpdate",value:function(e){(0,F.Z)((0,S.Z)(a.prototype),"willUpdate",this).call(this,e),this.hasUpdated?e.has("language")&&this._debouncedUpdateAgents():this._updateAgents(),e.has("value")&&this._maybeFetchConfigEntry()}},{kind:"method",key:"_maybeFetchConfigEntry",value:(i=(0,L.Z)((0,x.Z)().mark((function e(){return(0,x.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.value&&"homeassistant"!==this.value){e.next=3;break}return this._configEntry=void 0,e.abrupt("return");case 3:return e.prev=3,e.next=6,(0,B.RQ)(this.hass,this.value);case 6:this._configEntry=e.sent.config_entry,e.next=12;break;case 9:e.prev=9,e.t0=e.catch(3),this._configEntry=void 0;case 12:case"end":return e.stop()}}),e,this,[[3,9]])}))),function(){return i.apply(this,arguments)})},{kind:"field",key:"_debouncedUpdateAgents",value:function(){var e=this;return(0,A.D)((function(){return e._updateAgents()}),500)}},{kind:"method",key:"_updateAgents",value:(o=(0,L.Z)((0,x.Z)().mark((function e(){var n,t,o,i=this;return(0,x.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,a=this.hass,r=this.language,c=this.hass.config.country||void 0,a.callWS({type:"conversation/agent/list",language:r,country:c});case 2:if(n=e.sent,t=n.agents,this._agents=t,this.value){e.next=7;break}return e.abrupt("return");case 7:o=t.find((function(e){return e.id===i.value})),(0,z.B)(this,"supported-languages-changed",{value:null==o?void 0:o.supported_languages}),(!o||"*"!==o.supported_languages&&0===o.supported_languages.length)&&(this.value=void 0,(0,z.B)(this,"value-changed",{value:this.value}));case 10:case"end":return e.stop()}var a,r,c}),e,this)}))),function(){return o.apply(this,arguments)})},{kind:"method",key:"_openOptionsFlow",value:(t=(0,L.Z)((0,x.Z)().mark((function e(){return(0,x.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this._configEntry){e.next=2;break}return e.abrupt("return");case 2:return e.t0=H,e.t1=this,e.t2=this._configEntry,e.next=7,(0,D.t4)(this.hass,this._configEntry.domain);case 7:e.t3=e.sent,e.t4={manifest:e.t3},(0,e.t0)(e.t1,e.t2,e.t4);case 10:case"end":return e.stop()}}),e,this)}))),function(){return t.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,Z.iv)(h||(h=(0,g.Z)([":host{display:flex;align-items:center}ha-select{width:100%}ha-icon-button{color:var(--secondary-text-color)}"])))}},{kind:"method",key:"_changed",value:function(e){var n,t=this,o=e.target;!this.hass||""===o.value||o.value===this.value||void 0===this.value&&o.value===W||(this.value=o.value===W?void 0:o.value,(0,z.B)(this,"value-changed",{value:this.value}),(0,z.B)(this,"supported-languages-changed",{value:null===(n=this._agents.find((function(e){return e.id===t.value})))||void 0===n?void 0:n.supported_languages}))}}]}}),Z.oi),(0,w.Z)([(0,C.Mo)("ha-selector-conversation_agent")],(function(e,n){var t=function(n){function t(){var n;(0,k.Z)(this,t);for(var o=arguments.length,i=new Array(o),a=0;a<o;a++)i[a]=arguments[a];return n=(0,_.Z)(this,t,[].concat(i)),e((0,y.Z)(n)),n}return(0,b.Z)(t,n),(0,m.Z)(t)}(n);return{F:t,d:[{kind:"field",decorators:[(0,C.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,C.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,C.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,C.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,C.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,C.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,C.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,C.Cb)({attribute:!1})],key:"context",value:void 0},{kind:"method",key:"render",value:function(){var e,n;return(0,Z.dy)(f||(f=(0,g.Z)(['<ha-conversation-agent-picker .hass="','" .value="','" .language="','" .label="','" .helper="','" .disabled="','" .required="','"></ha-conversation-agent-picker>'])),this.hass,this.value,(null===(e=this.selector.conversation_agent)||void 0===e?void 0:e.language)||(null===(n=this.context)||void 0===n?void 0:n.language),this.label,this.helper,this.disabled,this.required)}},{kind:"field",static:!0,key:"styles",value:function(){return(0,Z.iv)(v||(v=(0,g.Z)(["ha-conversation-agent-picker{width:100%}"])))}}]}}),Z.oi))},64346:function(e,n,t){t.d(n,{F3:function(){return i},Lh:function(){return o},t4:function(){return a}});t(22859);var o=function(e,n,t){return e("component.".concat(n,".title"))||(null==t?void 0:t.name)||n},i=function(e,n){var t={type:"manifest/list"};return n&&(t.integrations=n),e.callWS(t)},a=function(e,n){return e.callWS({type:"manifest/get",integration:n})}},46739:function(e,n,t){t.d(n,{w:function(){return a}});t(51358),t(46798),t(47084),t(5239),t(98490),t(85717);var o=t(18394),i=function(){return Promise.all([t.e(2850),t.e(5887),t.e(6023),t.e(8597),t.e(6591),t.e(1913),t.e(5718),t.e(3252)]).then(t.bind(t,61675))},a=function(e,n,t){(0,o.B)(e,"show-dialog",{dialogTag:"dialog-data-entry-flow",dialogImport:i,dialogParams:Object.assign(Object.assign({},n),{},{flowConfig:t,dialogParentElement:e})})}}}]);
+//# sourceMappingURL=5803.urO6zvSSRp4.js.map
\ No newline at end of file
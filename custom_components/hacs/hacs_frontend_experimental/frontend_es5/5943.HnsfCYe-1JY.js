@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[5943],{49412:function(e,t,c){c.d(t,{K:function(){return P}});var i=c(40039),l=c(99312),d=c(81043),n=c(88962),o=c(71650),a=c(33368),r=c(68308),s=c(34541),m=c(47838),p=c(69205),u=(c(85717),c(22859),c(51358),c(96043),c(46798),c(5239),c(98490),c(46349),c(70320),c(47084),c(43204)),h=(c(11027),c(65666),c(75642),c(98691)),f=(c(11451),c(36513),c(9849),c(50289),c(94167),c(37313),c(26349),c(74015)),_=(c(56308),["input","button","textarea","select"]),g=function(e){var t=e.target;if(t){var c=(""+t.tagName).toLowerCase();-1===_.indexOf(c)&&e.preventDefault()}};function b(e,t){for(var c=new Map,i=0;i<e;i++){var l=t(i).trim();if(l){var d=l[0].toLowerCase();c.has(d)||c.set(d,[]),c.get(d).push({text:l.toLowerCase(),index:i})}}return c.forEach((function(e){e.sort((function(e,t){return e.index-t.index}))})),c}function v(e,t){var c,i=e.nextChar,l=e.focusItemAtIndex,d=e.sortedIndexByFirstChar,n=e.focusedItemIndex,o=e.skipFocus,a=e.isItemAtIndexDisabled;return clearTimeout(t.bufferClearTimeout),t.bufferClearTimeout=setTimeout((function(){!function(e){e.typeaheadBuffer=""}(t)}),f.KT.TYPEAHEAD_BUFFER_CLEAR_TIMEOUT_MS),t.typeaheadBuffer=t.typeaheadBuffer+i,c=1===t.typeaheadBuffer.length?function(e,t,c,i){var l=i.typeaheadBuffer[0],d=e.get(l);if(!d)return-1;if(l===i.currentFirstChar&&d[i.sortedIndexCursor].index===t){i.sortedIndexCursor=(i.sortedIndexCursor+1)%d.length;var n=d[i.sortedIndexCursor].index;if(!c(n))return n}i.currentFirstChar=l;var o,a=-1;for(o=0;o<d.length;o++)if(!c(d[o].index)){a=o;break}for(;o<d.length;o++)if(d[o].index>t&&!c(d[o].index)){a=o;break}if(-1!==a)return i.sortedIndexCursor=a,d[i.sortedIndexCursor].index;return-1}(d,n,a,t):function(e,t,c){var i=c.typeaheadBuffer[0],l=e.get(i);if(!l)return-1;var d=l[c.sortedIndexCursor];if(0===d.text.lastIndexOf(c.typeaheadBuffer,0)&&!t(d.index))return d.index;var n=(c.sortedIndexCursor+1)%l.length,o=-1;for(;n!==c.sortedIndexCursor;){var a=l[n],r=0===a.text.lastIndexOf(c.typeaheadBuffer,0),s=!t(a.index);if(r&&s){o=n;break}n=(n+1)%l.length}if(-1!==o)return c.sortedIndexCursor=o,l[c.sortedIndexCursor].index;return-1}(d,a,t),-1===c||o||l(c),c}function x(e){return e.typeaheadBuffer.length>0}var y,w,I,E,k,C,A,O,T,S=c(18601),M=c(14114),L=c(82612),R=c(38341),D=c(12335),F=(c(94570),c(72774)),B=c(45253),V={ACTIVATED:"mdc-select--activated",DISABLED:"mdc-select--disabled",FOCUSED:"mdc-select--focused",INVALID:"mdc-select--invalid",MENU_INVALID:"mdc-select__menu--invalid",OUTLINED:"mdc-select--outlined",REQUIRED:"mdc-select--required",ROOT:"mdc-select",WITH_LEADING_ICON:"mdc-select--with-leading-icon"},z={ARIA_CONTROLS:"aria-controls",ARIA_DESCRIBEDBY:"aria-describedby",ARIA_SELECTED_ATTR:"aria-selected",CHANGE_EVENT:"MDCSelect:change",HIDDEN_INPUT_SELECTOR:'input[type="hidden"]',LABEL_SELECTOR:".mdc-floating-label",LEADING_ICON_SELECTOR:".mdc-select__icon",LINE_RIPPLE_SELECTOR:".mdc-line-ripple",MENU_SELECTOR:".mdc-select__menu",OUTLINE_SELECTOR:".mdc-notched-outline",SELECTED_TEXT_SELECTOR:".mdc-select__selected-text",SELECT_ANCHOR_SELECTOR:".mdc-select__anchor",VALUE_ATTR:"data-value"},U={LABEL_SCALE:.75,UNSET_INDEX:-1,CLICK_DEBOUNCE_TIMEOUT_MS:330},N=function(e){function t(c,i){void 0===i&&(i={});var l=e.call(this,(0,u.__assign)((0,u.__assign)({},t.defaultAdapter),c))||this;return l.disabled=!1,l.isMenuOpen=!1,l.useDefaultValidation=!0,l.customValidity=!0,l.lastSelectedIndex=U.UNSET_INDEX,l.clickDebounceTimeout=0,l.recentlyClicked=!1,l.leadingIcon=i.leadingIcon,l.helperText=i.helperText,l}return(0,u.__extends)(t,e),Object.defineProperty(t,"cssClasses",{get:function(){return V},enumerable:!1,configurable:!0}),Object.defineProperty(t,"numbers",{get:function(){return U},enumerable:!1,configurable:!0}),Object.defineProperty(t,"strings",{get:function(){return z},enumerable:!1,configurable:!0}),Object.defineProperty(t,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},hasClass:function(){return!1},activateBottomLine:function(){},deactivateBottomLine:function(){},getSelectedIndex:function(){return-1},setSelectedIndex:function(){},hasLabel:function(){return!1},floatLabel:function(){},getLabelWidth:function(){return 0},setLabelRequired:function(){},hasOutline:function(){return!1},notchOutline:function(){},closeOutline:function(){},setRippleCenter:function(){},notifyChange:function(){},setSelectedText:function(){},isSelectAnchorFocused:function(){return!1},getSelectAnchorAttr:function(){return""},setSelectAnchorAttr:function(){},removeSelectAnchorAttr:function(){},addMenuClass:function(){},removeMenuClass:function(){},openMenu:function(){},closeMenu:function(){},getAnchorElement:function(){return null},setMenuAnchorElement:function(){},setMenuAnchorCorner:function(){},setMenuWrapFocus:function(){},focusMenuItemAtIndex:function(){},getMenuItemCount:function(){return 0},getMenuItemValues:function(){return[]},getMenuItemTextAtIndex:function(){return""},isTypeaheadInProgress:function(){return!1},typeaheadMatchItem:function(){return-1}}},enumerable:!1,configurable:!0}),t.prototype.getSelectedIndex=function(){return this.adapter.getSelectedIndex()},t.prototype.setSelectedIndex=function(e,t,c){void 0===t&&(t=!1),void 0===c&&(c=!1),e>=this.adapter.getMenuItemCount()||(e===U.UNSET_INDEX?this.adapter.setSelectedText(""):this.adapter.setSelectedText(this.adapter.getMenuItemTextAtIndex(e).trim()),this.adapter.setSelectedIndex(e),t&&this.adapter.closeMenu(),c||this.lastSelectedIndex===e||this.handleChange(),this.lastSelectedIndex=e)},t.prototype.setValue=function(e,t){void 0===t&&(t=!1);var c=this.adapter.getMenuItemValues().indexOf(e);this.setSelectedIndex(c,!1,t)},t.prototype.getValue=function(){var e=this.adapter.getSelectedIndex(),t=this.adapter.getMenuItemValues();return e!==U.UNSET_INDEX?t[e]:""},t.prototype.getDisabled=function(){return this.disabled},t.prototype.setDisabled=function(e){this.disabled=e,this.disabled?(this.adapter.addClass(V.DISABLED),this.adapter.closeMenu()):this.adapter.removeClass(V.DISABLED),this.leadingIcon&&this.leadingIcon.setDisabled(this.disabled),this.disabled?this.adapter.removeSelectAnchorAttr("tabindex"):this.adapter.setSelectAnchorAttr("tabindex","0"),this.adapter.setSelectAnchorAttr("aria-disabled",this.disabled.toString())},t.prototype.openMenu=function(){this.adapter.addClass(V.ACTIVATED),this.adapter.openMenu(),this.isMenuOpen=!0,this.adapter.setSelectAnchorAttr("aria-expanded","true")},t.prototype.setHelperTextContent=function(e){this.helperText&&this.helperText.setContent(e)},t.prototype.layout=function(){if(this.adapter.hasLabel()){var e=this.getValue().length>0,t=this.adapter.hasClass(V.FOCUSED),c=e||t,i=this.adapter.hasClass(V.REQUIRED);this.notchOutline(c),this.adapter.floatLabel(c),this.adapter.setLabelRequired(i)}},t.prototype.layoutOptions=function(){var e=this.adapter.getMenuItemValues().indexOf(this.getValue());this.setSelectedIndex(e,!1,!0)},t.prototype.handleMenuOpened=function(){if(0!==this.adapter.getMenuItemValues().length){var e=this.getSelectedIndex(),t=e>=0?e:0;this.adapter.focusMenuItemAtIndex(t)}},t.prototype.handleMenuClosing=function(){this.adapter.setSelectAnchorAttr("aria-expanded","false")},t.prototype.handleMenuClosed=function(){this.adapter.removeClass(V.ACTIVATED),this.isMenuOpen=!1,this.adapter.isSelectAnchorFocused()||this.blur()},t.prototype.handleChange=function(){this.layout(),this.adapter.notifyChange(this.getValue()),this.adapter.hasClass(V.REQUIRED)&&this.useDefaultValidation&&this.setValid(this.isValid())},t.prototype.handleMenuItemAction=function(e){this.setSelectedIndex(e,!0)},t.prototype.handleFocus=function(){this.adapter.addClass(V.FOCUSED),this.layout(),this.adapter.activateBottomLine()},t.prototype.handleBlur=function(){this.isMenuOpen||this.blur()},t.prototype.handleClick=function(e){this.disabled||this.recentlyClicked||(this.setClickDebounceTimeout(),this.isMenuOpen?this.adapter.closeMenu():(this.adapter.setRippleCenter(e),this.openMenu()))},t.prototype.handleKeydown=function(e){if(!this.isMenuOpen&&this.adapter.hasClass(V.FOCUSED)){var t=(0,h.ku)(e)===h.Fn.ENTER,c=(0,h.ku)(e)===h.Fn.SPACEBAR,i=(0,h.ku)(e)===h.Fn.ARROW_UP,l=(0,h.ku)(e)===h.Fn.ARROW_DOWN;if(!(e.ctrlKey||e.metaKey)&&(!c&&e.key&&1===e.key.length||c&&this.adapter.isTypeaheadInProgress())){var d=c?" ":e.key,n=this.adapter.typeaheadMatchItem(d,this.getSelectedIndex());return n>=0&&this.setSelectedIndex(n),void e.preventDefault()}(t||c||i||l)&&(this.openMenu(),e.preventDefault())}},t.prototype.notchOutline=function(e){if(this.adapter.hasOutline()){var t=this.adapter.hasClass(V.FOCUSED);if(e){var c=U.LABEL_SCALE,i=this.adapter.getLabelWidth()*c;this.adapter.notchOutline(i)}else t||this.adapter.closeOutline()}},t.prototype.setLeadingIconAriaLabel=function(e){this.leadingIcon&&this.leadingIcon.setAriaLabel(e)},t.prototype.setLeadingIconContent=function(e){this.leadingIcon&&this.leadingIcon.setContent(e)},t.prototype.getUseDefaultValidation=function(){return this.useDefaultValidation},t.prototype.setUseDefaultValidation=function(e){this.useDefaultValidation=e},t.prototype.setValid=function(e){this.useDefaultValidation||(this.customValidity=e),this.adapter.setSelectAnchorAttr("aria-invalid",(!e).toString()),e?(this.adapter.removeClass(V.INVALID),this.adapter.removeMenuClass(V.MENU_INVALID)):(this.adapter.addClass(V.INVALID),this.adapter.addMenuClass(V.MENU_INVALID)),this.syncHelperTextValidity(e)},t.prototype.isValid=function(){return this.useDefaultValidation&&this.adapter.hasClass(V.REQUIRED)&&!this.adapter.hasClass(V.DISABLED)?this.getSelectedIndex()!==U.UNSET_INDEX&&(0!==this.getSelectedIndex()||Boolean(this.getValue())):this.customValidity},t.prototype.setRequired=function(e){e?this.adapter.addClass(V.REQUIRED):this.adapter.removeClass(V.REQUIRED),this.adapter.setSelectAnchorAttr("aria-required",e.toString()),this.adapter.setLabelRequired(e)},t.prototype.getRequired=function(){return"true"===this.adapter.getSelectAnchorAttr("aria-required")},t.prototype.init=function(){var e=this.adapter.getAnchorElement();e&&(this.adapter.setMenuAnchorElement(e),this.adapter.setMenuAnchorCorner(B.Ns.BOTTOM_START)),this.adapter.setMenuWrapFocus(!1),this.setDisabled(this.adapter.hasClass(V.DISABLED)),this.syncHelperTextValidity(!this.adapter.hasClass(V.INVALID)),this.layout(),this.layoutOptions()},t.prototype.blur=function(){this.adapter.removeClass(V.FOCUSED),this.layout(),this.adapter.deactivateBottomLine(),this.adapter.hasClass(V.REQUIRED)&&this.useDefaultValidation&&this.setValid(this.isValid())},t.prototype.syncHelperTextValidity=function(e){if(this.helperText){this.helperText.setValidity(e);var t=this.helperText.isVisible(),c=this.helperText.getId();t&&c?this.adapter.setSelectAnchorAttr(z.ARIA_DESCRIBEDBY,c):this.adapter.removeSelectAnchorAttr(z.ARIA_DESCRIBEDBY)}},t.prototype.setClickDebounceTimeout=function(){var e=this;clearTimeout(this.clickDebounceTimeout),this.clickDebounceTimeout=setTimeout((function(){e.recentlyClicked=!1}),U.CLICK_DEBOUNCE_TIMEOUT_MS),this.recentlyClicked=!0},t}(F.K),Z=c(5095),Y=c(95260),X=c(53180),W=c(10694),q=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t={};for(var c in e)t[c]=e[c];return Object.assign({badInput:!1,customError:!1,patternMismatch:!1,rangeOverflow:!1,rangeUnderflow:!1,stepMismatch:!1,tooLong:!1,tooShort:!1,typeMismatch:!1,valid:!0,valueMissing:!1},t)},P=function(e){function t(){var e;return(0,o.Z)(this,t),(e=(0,r.Z)(this,t,arguments)).mdcFoundationClass=N,e.disabled=!1,e.outlined=!1,e.label="",e.outlineOpen=!1,e.outlineWidth=0,e.value="",e.name="",e.selectedText="",e.icon="",e.menuOpen=!1,e.helper="",e.validateOnInitialRender=!1,e.validationMessage="",e.required=!1,e.naturalMenuWidth=!1,e.isUiValid=!0,e.fixedMenuPosition=!1,e.typeaheadState={bufferClearTimeout:0,currentFirstChar:"",sortedIndexCursor:0,typeaheadBuffer:""},e.sortedIndexByFirstChar=new Map,e.menuElement_=null,e.listeners=[],e.onBodyClickBound=function(){},e._menuUpdateComplete=null,e.valueSetDirectly=!1,e.validityTransform=null,e._validity=q(),e}var c,u,f,_,M;return(0,p.Z)(t,e),(0,a.Z)(t,[{key:"items",get:function(){return this.menuElement_||(this.menuElement_=this.menuElement),this.menuElement_?this.menuElement_.items:[]}},{key:"selected",get:function(){var e=this.menuElement;return e?e.selected:null}},{key:"index",get:function(){var e=this.menuElement;return e?e.index:-1}},{key:"shouldRenderHelperText",get:function(){return!!this.helper||!!this.validationMessage}},{key:"validity",get:function(){return this._checkValidity(this.value),this._validity}},{key:"render",value:function(){var e={"mdc-select--disabled":this.disabled,"mdc-select--no-label":!this.label,"mdc-select--filled":!this.outlined,"mdc-select--outlined":this.outlined,"mdc-select--with-leading-icon":!!this.icon,"mdc-select--required":this.required,"mdc-select--invalid":!this.isUiValid},t=this.label?"label":void 0,c=this.shouldRenderHelperText?"helper-text":void 0;return(0,Z.dy)(y||(y=(0,n.Z)([' <div class="mdc-select ','"> <input class="formElement" name="','" .value="','" hidden ?disabled="','" ?required="','"> <div class="mdc-select__anchor" aria-autocomplete="none" role="combobox" aria-expanded="','" aria-invalid="','" aria-haspopup="listbox" aria-labelledby="','" aria-required="','" aria-describedby="','" @click="','" @focus="','" @blur="','" @keydown="','"> '," "," ",' <span class="mdc-select__selected-text-container"> <span class="mdc-select__selected-text">','</span> </span> <span class="mdc-select__dropdown-icon"> <svg class="mdc-select__dropdown-icon-graphic" viewBox="7 10 10 5" focusable="false"> <polygon class="mdc-select__dropdown-icon-inactive" stroke="none" fill-rule="evenodd" points="7 10 12 15 17 10"> </polygon> <polygon class="mdc-select__dropdown-icon-active" stroke="none" fill-rule="evenodd" points="7 15 12 10 17 15"> </polygon> </svg> </span> '," </div> "," </div> ",""])),(0,X.$)(e),this.name,this.value,this.disabled,this.required,this.menuOpen,!this.isUiValid,(0,W.o)(t),this.required,(0,W.o)(c),this.onClick,this.onFocus,this.onBlur,this.onKeydown,this.renderRipple(),this.outlined?this.renderOutline():this.renderLabel(),this.renderLeadingIcon(),this.selectedText,this.renderLineRipple(),this.renderMenu(),this.renderHelperText())}},{key:"renderMenu",value:function(){var e=this.getMenuClasses();return(0,Z.dy)(w||(w=(0,n.Z)([' <mwc-menu innerRole="listbox" wrapFocus class="','" activatable .fullwidth="','" .open="','" .anchor="','" .fixed="','" @selected="','" @opened="','" @closed="','" @items-updated="','" @keydown="','"> '," </mwc-menu>"])),(0,X.$)(e),!this.fixedMenuPosition&&!this.naturalMenuWidth,this.menuOpen,this.anchorElement,this.fixedMenuPosition,this.onSelected,this.onOpened,this.onClosed,this.onItemsUpdated,this.handleTypeahead,this.renderMenuContent())}},{key:"getMenuClasses",value:function(){return{"mdc-select__menu":!0,"mdc-menu":!0,"mdc-menu-surface":!0,"mdc-select__menu--invalid":!this.isUiValid}}},{key:"renderMenuContent",value:function(){return(0,Z.dy)(I||(I=(0,n.Z)(["<slot></slot>"])))}},{key:"renderRipple",value:function(){return this.outlined?Z.Ld:(0,Z.dy)(E||(E=(0,n.Z)([' <span class="mdc-select__ripple"></span> '])))}},{key:"renderOutline",value:function(){return this.outlined?(0,Z.dy)(k||(k=(0,n.Z)([' <mwc-notched-outline .width="','" .open="','" class="mdc-notched-outline"> '," </mwc-notched-outline>"])),this.outlineWidth,this.outlineOpen,this.renderLabel()):Z.Ld}},{key:"renderLabel",value:function(){return this.label?(0,Z.dy)(C||(C=(0,n.Z)([' <span .floatingLabelFoundation="','" id="label">',"</span> "])),(0,R.o)(this.label),this.label):Z.Ld}},{key:"renderLeadingIcon",value:function(){return this.icon?(0,Z.dy)(A||(A=(0,n.Z)(['<mwc-icon class="mdc-select__icon"><div>',"</div></mwc-icon>"])),this.icon):Z.Ld}},{key:"renderLineRipple",value:function(){return this.outlined?Z.Ld:(0,Z.dy)(O||(O=(0,n.Z)([' <span .lineRippleFoundation="','"></span> '])),(0,D._)())}},{key:"renderHelperText",value:function(){if(!this.shouldRenderHelperText)return Z.Ld;var e=this.validationMessage&&!this.isUiValid,t={"mdc-select-helper-text--validation-msg":e};return(0,Z.dy)(T||(T=(0,n.Z)([' <p class="mdc-select-helper-text ','" id="helper-text">',"</p>"])),(0,X.$)(t),e?this.validationMessage:this.helper)}},{key:"createAdapter",value:function(){var e,t=this;return Object.assign(Object.assign({},(0,S.qN)(this.mdcRoot)),{activateBottomLine:function(){t.lineRippleElement&&t.lineRippleElement.lineRippleFoundation.activate()},deactivateBottomLine:function(){t.lineRippleElement&&t.lineRippleElement.lineRippleFoundation.deactivate()},hasLabel:function(){return!!t.label},floatLabel:function(e){t.labelElement&&t.labelElement.floatingLabelFoundation.float(e)},getLabelWidth:function(){return t.labelElement?t.labelElement.floatingLabelFoundation.getWidth():0},setLabelRequired:function(e){t.labelElement&&t.labelElement.floatingLabelFoundation.setRequired(e)},hasOutline:function(){return t.outlined},notchOutline:function(e){t.outlineElement&&!t.outlineOpen&&(t.outlineWidth=e,t.outlineOpen=!0)},closeOutline:function(){t.outlineElement&&(t.outlineOpen=!1)},setRippleCenter:function(e){t.lineRippleElement&&t.lineRippleElement.lineRippleFoundation.setRippleCenter(e)},notifyChange:(e=(0,d.Z)((0,l.Z)().mark((function e(c){var i;return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t.valueSetDirectly||c!==t.value){e.next=2;break}return e.abrupt("return");case 2:return t.valueSetDirectly=!1,t.value=c,e.next=6,t.updateComplete;case 6:i=new Event("change",{bubbles:!0}),t.dispatchEvent(i);case 8:case"end":return e.stop()}}),e)}))),function(t){return e.apply(this,arguments)}),setSelectedText:function(e){return t.selectedText=e},isSelectAnchorFocused:function(){var e=t.anchorElement;return!!e&&e.getRootNode().activeElement===e},getSelectAnchorAttr:function(e){var c=t.anchorElement;return c?c.getAttribute(e):null},setSelectAnchorAttr:function(e,c){var i=t.anchorElement;i&&i.setAttribute(e,c)},removeSelectAnchorAttr:function(e){var c=t.anchorElement;c&&c.removeAttribute(e)},openMenu:function(){t.menuOpen=!0},closeMenu:function(){t.menuOpen=!1},addMenuClass:function(){},removeMenuClass:function(){},getAnchorElement:function(){return t.anchorElement},setMenuAnchorElement:function(){},setMenuAnchorCorner:function(){var e=t.menuElement;e&&(e.corner="BOTTOM_START")},setMenuWrapFocus:function(e){var c=t.menuElement;c&&(c.wrapFocus=e)},focusMenuItemAtIndex:function(e){var c=t.menuElement;if(c){var i=c.items[e];i&&i.focus()}},getMenuItemCount:function(){var e=t.menuElement;return e?e.items.length:0},getMenuItemValues:function(){var e=t.menuElement;return e?e.items.map((function(e){return e.value})):[]},getMenuItemTextAtIndex:function(e){var c=t.menuElement;if(!c)return"";var i=c.items[e];return i?i.text:""},getSelectedIndex:function(){return t.index},setSelectedIndex:function(){},isTypeaheadInProgress:function(){return x(t.typeaheadState)},typeaheadMatchItem:function(e,c){if(!t.menuElement)return-1;var i={focusItemAtIndex:function(e){t.menuElement.focusItemAtIndex(e)},focusedItemIndex:c||t.menuElement.getFocusedItemIndex(),nextChar:e,sortedIndexByFirstChar:t.sortedIndexByFirstChar,skipFocus:!1,isItemAtIndexDisabled:function(e){return t.items[e].disabled}},l=v(i,t.typeaheadState);return-1!==l&&t.select(l),l}})}},{key:"checkValidity",value:function(){var e=this._checkValidity(this.value);if(!e){var t=new Event("invalid",{bubbles:!1,cancelable:!0});this.dispatchEvent(t)}return e}},{key:"reportValidity",value:function(){var e=this.checkValidity();return this.isUiValid=e,e}},{key:"_checkValidity",value:function(e){var t=this.formElement.validity,c=q(t);if(this.validityTransform){var i=this.validityTransform(e,c);c=Object.assign(Object.assign({},c),i)}return this._validity=c,this._validity.valid}},{key:"setCustomValidity",value:function(e){this.validationMessage=e,this.formElement.setCustomValidity(e)}},{key:"getUpdateComplete",value:(M=(0,d.Z)((0,l.Z)().mark((function e(){var c;return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this._menuUpdateComplete;case 2:return e.next=4,(0,s.Z)((0,m.Z)(t.prototype),"getUpdateComplete",this).call(this);case 4:return c=e.sent,e.abrupt("return",c);case 6:case"end":return e.stop()}}),e,this)}))),function(){return M.apply(this,arguments)})},{key:"firstUpdated",value:(_=(0,d.Z)((0,l.Z)().mark((function e(){var c,i,d=this;return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!(c=this.menuElement)){e.next=5;break}return this._menuUpdateComplete=c.updateComplete,e.next=5,this._menuUpdateComplete;case 5:if((0,s.Z)((0,m.Z)(t.prototype),"firstUpdated",this).call(this),this.mdcFoundation.isValid=function(){return!0},this.mdcFoundation.setValid=function(){},this.mdcFoundation.setDisabled(this.disabled),this.validateOnInitialRender&&this.reportValidity(),this.selected){e.next=21;break}if(this.items.length||!this.slotElement||!this.slotElement.assignedNodes({flatten:!0}).length){e.next=16;break}return e.next=14,new Promise((function(e){return requestAnimationFrame(e)}));case 14:return e.next=16,this.layout();case 16:if(i=this.items.length&&""===this.items[0].value,this.value||!i){e.next=20;break}return this.select(0),e.abrupt("return");case 20:this.selectByValue(this.value);case 21:this.sortedIndexByFirstChar=b(this.items.length,(function(e){return d.items[e].text}));case 22:case"end":return e.stop()}}),e,this)}))),function(){return _.apply(this,arguments)})},{key:"onItemsUpdated",value:function(){var e=this;this.sortedIndexByFirstChar=b(this.items.length,(function(t){return e.items[t].text}))}},{key:"select",value:function(e){var t=this.menuElement;t&&t.select(e)}},{key:"selectByValue",value:function(e){for(var t=-1,c=0;c<this.items.length;c++){if(this.items[c].value===e){t=c;break}}this.valueSetDirectly=!0,this.select(t),this.mdcFoundation.handleChange()}},{key:"disconnectedCallback",value:function(){(0,s.Z)((0,m.Z)(t.prototype),"disconnectedCallback",this).call(this);var e,c=(0,i.Z)(this.listeners);try{for(c.s();!(e=c.n()).done;){var l=e.value;l.target.removeEventListener(l.name,l.cb)}}catch(d){c.e(d)}finally{c.f()}}},{key:"focus",value:function(){var e=new CustomEvent("focus"),t=this.anchorElement;t&&(t.dispatchEvent(e),t.focus())}},{key:"blur",value:function(){var e=new CustomEvent("blur"),t=this.anchorElement;t&&(t.dispatchEvent(e),t.blur())}},{key:"onFocus",value:function(){this.mdcFoundation&&this.mdcFoundation.handleFocus()}},{key:"onBlur",value:function(){this.mdcFoundation&&this.mdcFoundation.handleBlur();var e=this.menuElement;e&&!e.open&&this.reportValidity()}},{key:"onClick",value:function(e){if(this.mdcFoundation){this.focus();var t=e.target.getBoundingClientRect(),c=("touches"in e?e.touches[0].clientX:e.clientX)-t.left;this.mdcFoundation.handleClick(c)}}},{key:"onKeydown",value:function(e){var t=(0,h.ku)(e)===h.Fn.ARROW_UP,c=(0,h.ku)(e)===h.Fn.ARROW_DOWN;if(c||t){var i=t&&this.index>0,l=c&&this.index<this.items.length-1;return i?this.select(this.index-1):l&&this.select(this.index+1),e.preventDefault(),void this.mdcFoundation.openMenu()}this.mdcFoundation.handleKeydown(e)}},{key:"handleTypeahead",value:function(e){var t=this;if(this.menuElement){var c=this.menuElement.getFocusedItemIndex(),i=(0,L.OE)(e.target)?e.target:null;!function(e,t){var c=e.event,i=e.isTargetListItem,l=e.focusedItemIndex,d=e.focusItemAtIndex,n=e.sortedIndexByFirstChar,o=e.isItemAtIndexDisabled,a="ArrowLeft"===(0,h.ku)(c),r="ArrowUp"===(0,h.ku)(c),s="ArrowRight"===(0,h.ku)(c),m="ArrowDown"===(0,h.ku)(c),p="Home"===(0,h.ku)(c),u="End"===(0,h.ku)(c),f="Enter"===(0,h.ku)(c),_="Spacebar"===(0,h.ku)(c);c.altKey||c.ctrlKey||c.metaKey||a||r||s||m||p||u||f||(_||1!==c.key.length?_&&(i&&g(c),i&&x(t)&&v({focusItemAtIndex:d,focusedItemIndex:l,nextChar:" ",sortedIndexByFirstChar:n,skipFocus:!1,isItemAtIndexDisabled:o},t)):(g(c),v({focusItemAtIndex:d,focusedItemIndex:l,nextChar:c.key.toLowerCase(),sortedIndexByFirstChar:n,skipFocus:!1,isItemAtIndexDisabled:o},t)))}({event:e,focusItemAtIndex:function(e){t.menuElement.focusItemAtIndex(e)},focusedItemIndex:c,isTargetListItem:!!i&&i.hasAttribute("mwc-list-item"),sortedIndexByFirstChar:this.sortedIndexByFirstChar,isItemAtIndexDisabled:function(e){return t.items[e].disabled}},this.typeaheadState)}}},{key:"onSelected",value:(f=(0,d.Z)((0,l.Z)().mark((function e(t){var c;return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.mdcFoundation){e.next=3;break}return e.next=3,this.updateComplete;case 3:this.mdcFoundation.handleMenuItemAction(t.detail.index),(c=this.items[t.detail.index])&&(this.value=c.value);case 6:case"end":return e.stop()}}),e,this)}))),function(e){return f.apply(this,arguments)})},{key:"onOpened",value:function(){this.mdcFoundation&&(this.menuOpen=!0,this.mdcFoundation.handleMenuOpened())}},{key:"onClosed",value:function(){this.mdcFoundation&&(this.menuOpen=!1,this.mdcFoundation.handleMenuClosed())}},{key:"setFormData",value:function(e){this.name&&null!==this.selected&&e.append(this.name,this.value)}},{key:"layout",value:(u=(0,d.Z)((0,l.Z)().mark((function e(){var t,c,i,d,n,o=arguments;return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return t=!(o.length>0&&void 0!==o[0])||o[0],this.mdcFoundation&&this.mdcFoundation.layout(),e.next=4,this.updateComplete;case 4:if((c=this.menuElement)&&c.layout(t),i=this.labelElement){e.next=10;break}return this.outlineOpen=!1,e.abrupt("return");case 10:if(d=!!this.label&&!!this.value,i.floatingLabelFoundation.float(d),this.outlined){e.next=14;break}return e.abrupt("return");case 14:return this.outlineOpen=d,e.next=17,this.updateComplete;case 17:n=i.floatingLabelFoundation.getWidth(),this.outlineOpen&&(this.outlineWidth=n);case 19:case"end":return e.stop()}}),e,this)}))),function(){return u.apply(this,arguments)})},{key:"layoutOptions",value:(c=(0,d.Z)((0,l.Z)().mark((function e(){return(0,l.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.mdcFoundation){e.next=2;break}return e.abrupt("return");case 2:this.mdcFoundation.layoutOptions();case 3:case"end":return e.stop()}}),e,this)}))),function(){return c.apply(this,arguments)})}]),t}(S.Wg);(0,u.__decorate)([(0,Y.IO)(".mdc-select")],P.prototype,"mdcRoot",void 0),(0,u.__decorate)([(0,Y.IO)(".formElement")],P.prototype,"formElement",void 0),(0,u.__decorate)([(0,Y.IO)("slot")],P.prototype,"slotElement",void 0),(0,u.__decorate)([(0,Y.IO)("select")],P.prototype,"nativeSelectElement",void 0),(0,u.__decorate)([(0,Y.IO)("input")],P.prototype,"nativeInputElement",void 0),(0,u.__decorate)([(0,Y.IO)(".mdc-line-ripple")],P.prototype,"lineRippleElement",void 0),(0,u.__decorate)([(0,Y.IO)(".mdc-floating-label")],P.prototype,"labelElement",void 0),(0,u.__decorate)([(0,Y.IO)("mwc-notched-outline")],P.prototype,"outlineElement",void 0),(0,u.__decorate)([(0,Y.IO)(".mdc-menu")],P.prototype,"menuElement",void 0),(0,u.__decorate)([(0,Y.IO)(".mdc-select__anchor")],P.prototype,"anchorElement",void 0),(0,u.__decorate)([(0,Y.Cb)({type:Boolean,attribute:"disabled",reflect:!0}),(0,M.P)((function(e){this.mdcFoundation&&this.mdcFoundation.setDisabled(e)}))],P.prototype,"disabled",void 0),(0,u.__decorate)([(0,Y.Cb)({type:Boolean}),(0,M.P)((function(e,t){void 0!==t&&this.outlined!==t&&this.layout(!1)}))],P.prototype,"outlined",void 0),(0,u.__decorate)([(0,Y.Cb)({type:String}),(0,M.P)((function(e,t){void 0!==t&&this.label!==t&&this.layout(!1)}))],P.prototype,"label",void 0),(0,u.__decorate)([(0,Y.SB)()],P.prototype,"outlineOpen",void 0),(0,u.__decorate)([(0,Y.SB)()],P.prototype,"outlineWidth",void 0),(0,u.__decorate)([(0,Y.Cb)({type:String}),(0,M.P)((function(e){if(this.mdcFoundation){var t=null===this.selected&&!!e,c=this.selected&&this.selected.value!==e;(t||c)&&this.selectByValue(e),this.reportValidity()}}))],P.prototype,"value",void 0),(0,u.__decorate)([(0,Y.Cb)()],P.prototype,"name",void 0),(0,u.__decorate)([(0,Y.SB)()],P.prototype,"selectedText",void 0),(0,u.__decorate)([(0,Y.Cb)({type:String})],P.prototype,"icon",void 0),(0,u.__decorate)([(0,Y.SB)()],P.prototype,"menuOpen",void 0),(0,u.__decorate)([(0,Y.Cb)({type:String})],P.prototype,"helper",void 0),(0,u.__decorate)([(0,Y.Cb)({type:Boolean})],P.prototype,"validateOnInitialRender",void 0),(0,u.__decorate)([(0,Y.Cb)({type:String})],P.prototype,"validationMessage",void 0),(0,u.__decorate)([(0,Y.Cb)({type:Boolean})],P.prototype,"required",void 0),(0,u.__decorate)([(0,Y.Cb)({type:Boolean})],P.prototype,"naturalMenuWidth",void 0),(0,u.__decorate)([(0,Y.SB)()],P.prototype,"isUiValid",void 0),(0,u.__decorate)([(0,Y.Cb)({type:Boolean})],P.prototype,"fixedMenuPosition",void 0),(0,u.__decorate)([(0,Y.hO)({capture:!0})],P.prototype,"handleTypeahead",null)},3762:function(e,t,c){c.d(t,{W:function(){return d}});var i,l=c(88962),d=(0,c(5095).iv)(i||(i=(0,l.Z)(['.mdc-floating-label{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-subtitle1-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:1rem;font-size:var(--mdc-typography-subtitle1-font-size, 1rem);font-weight:400;font-weight:var(--mdc-typography-subtitle1-font-weight,400);letter-spacing:.009375em;letter-spacing:var(--mdc-typography-subtitle1-letter-spacing, .009375em);text-decoration:inherit;text-decoration:var(--mdc-typography-subtitle1-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-subtitle1-text-transform,inherit);position:absolute;left:0;-webkit-transform-origin:left top;transform-origin:left top;line-height:1.15rem;text-align:left;text-overflow:ellipsis;white-space:nowrap;cursor:text;overflow:hidden;will-change:transform;transition:transform 150ms cubic-bezier(.4, 0, .2, 1),color 150ms cubic-bezier(.4, 0, .2, 1)}.mdc-floating-label[dir=rtl],[dir=rtl] .mdc-floating-label{right:0;left:auto;-webkit-transform-origin:right top;transform-origin:right top;text-align:right}.mdc-floating-label--float-above{cursor:auto}.mdc-floating-label--required::after{margin-left:1px;margin-right:0px;content:"*"}.mdc-floating-label--required[dir=rtl]::after,[dir=rtl] .mdc-floating-label--required::after{margin-left:0;margin-right:1px}.mdc-floating-label--float-above{transform:translateY(-106%) scale(.75)}.mdc-floating-label--shake{animation:mdc-floating-label-shake-float-above-standard 250ms 1}@keyframes mdc-floating-label-shake-float-above-standard{0%{transform:translateX(calc(0 - 0%)) translateY(-106%) scale(.75)}33%{animation-timing-function:cubic-bezier(0.5,0,0.701732,0.495819);transform:translateX(calc(4% - 0%)) translateY(-106%) scale(.75)}66%{animation-timing-function:cubic-bezier(0.302435,0.381352,0.55,0.956352);transform:translateX(calc(-4% - 0%)) translateY(-106%) scale(.75)}100%{transform:translateX(calc(0 - 0%)) translateY(-106%) scale(.75)}}@keyframes mdc-ripple-fg-radius-in{from{animation-timing-function:cubic-bezier(0.4,0,0.2,1);transform:translate(var(--mdc-ripple-fg-translate-start,0)) scale(1)}to{transform:translate(var(--mdc-ripple-fg-translate-end,0)) scale(var(--mdc-ripple-fg-scale,1))}}@keyframes mdc-ripple-fg-opacity-in{from{animation-timing-function:linear;opacity:0}to{opacity:var(--mdc-ripple-fg-opacity, 0)}}@keyframes mdc-ripple-fg-opacity-out{from{animation-timing-function:linear;opacity:var(--mdc-ripple-fg-opacity, 0)}to{opacity:0}}.mdc-line-ripple::after,.mdc-line-ripple::before{position:absolute;bottom:0;left:0;width:100%;border-bottom-style:solid;content:""}.mdc-line-ripple::before{border-bottom-width:1px}.mdc-line-ripple::before{z-index:1}.mdc-line-ripple::after{transform:scaleX(0);border-bottom-width:2px;opacity:0;z-index:2}.mdc-line-ripple::after{transition:transform 180ms cubic-bezier(.4, 0, .2, 1),opacity 180ms cubic-bezier(.4, 0, .2, 1)}.mdc-line-ripple--active::after{transform:scaleX(1);opacity:1}.mdc-line-ripple--deactivating::after{opacity:0}.mdc-notched-outline{display:flex;position:absolute;top:0;right:0;left:0;box-sizing:border-box;width:100%;max-width:100%;height:100%;text-align:left;pointer-events:none}.mdc-notched-outline[dir=rtl],[dir=rtl] .mdc-notched-outline{text-align:right}.mdc-notched-outline__leading,.mdc-notched-outline__notch,.mdc-notched-outline__trailing{box-sizing:border-box;height:100%;border-top:1px solid;border-bottom:1px solid;pointer-events:none}.mdc-notched-outline__leading{border-left:1px solid;border-right:none;width:12px}.mdc-notched-outline__leading[dir=rtl],[dir=rtl] .mdc-notched-outline__leading{border-left:none;border-right:1px solid}.mdc-notched-outline__trailing{border-left:none;border-right:1px solid;flex-grow:1}.mdc-notched-outline__trailing[dir=rtl],[dir=rtl] .mdc-notched-outline__trailing{border-left:1px solid;border-right:none}.mdc-notched-outline__notch{flex:0 0 auto;width:auto;max-width:calc(100% - 12px * 2)}.mdc-notched-outline .mdc-floating-label{display:inline-block;position:relative;max-width:100%}.mdc-notched-outline .mdc-floating-label--float-above{text-overflow:clip}.mdc-notched-outline--upgraded .mdc-floating-label--float-above{max-width:calc(100% / .75)}.mdc-notched-outline--notched .mdc-notched-outline__notch{padding-left:0;padding-right:8px;border-top:none}.mdc-notched-outline--notched .mdc-notched-outline__notch[dir=rtl],[dir=rtl] .mdc-notched-outline--notched .mdc-notched-outline__notch{padding-left:8px;padding-right:0}.mdc-notched-outline--no-label .mdc-notched-outline__notch{display:none}.mdc-select{display:inline-flex;position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__selected-text{color:rgba(0,0,0,.87)}.mdc-select.mdc-select--disabled .mdc-select__selected-text{color:rgba(0,0,0,.38)}.mdc-select:not(.mdc-select--disabled) .mdc-floating-label{color:rgba(0,0,0,.6)}.mdc-select:not(.mdc-select--disabled).mdc-select--focused .mdc-floating-label{color:rgba(98,0,238,.87)}.mdc-select.mdc-select--disabled .mdc-floating-label{color:rgba(0,0,0,.38)}.mdc-select:not(.mdc-select--disabled) .mdc-select__dropdown-icon{fill:rgba(0,0,0,0.54)}.mdc-select:not(.mdc-select--disabled).mdc-select--focused .mdc-select__dropdown-icon{fill:#6200ee;fill:var(--mdc-theme-primary,#6200ee)}.mdc-select.mdc-select--disabled .mdc-select__dropdown-icon{fill:rgba(0,0,0,0.38)}.mdc-select:not(.mdc-select--disabled)+.mdc-select-helper-text{color:rgba(0,0,0,.6)}.mdc-select.mdc-select--disabled+.mdc-select-helper-text{color:rgba(0,0,0,.38)}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:rgba(0,0,0,.54)}.mdc-select.mdc-select--disabled .mdc-select__icon{color:rgba(0,0,0,.38)}@media screen and (forced-colors:active),(-ms-high-contrast:active){.mdc-select.mdc-select--disabled .mdc-select__selected-text{color:GrayText}.mdc-select.mdc-select--disabled .mdc-select__dropdown-icon{fill:red}.mdc-select.mdc-select--disabled .mdc-floating-label{color:GrayText}.mdc-select.mdc-select--disabled .mdc-line-ripple::before{border-bottom-color:GrayText}.mdc-select.mdc-select--disabled .mdc-notched-outline__leading,.mdc-select.mdc-select--disabled .mdc-notched-outline__notch,.mdc-select.mdc-select--disabled .mdc-notched-outline__trailing{border-color:GrayText}.mdc-select.mdc-select--disabled .mdc-select__icon{color:GrayText}.mdc-select.mdc-select--disabled+.mdc-select-helper-text{color:GrayText}}.mdc-select .mdc-floating-label{top:50%;transform:translateY(-50%);pointer-events:none}.mdc-select .mdc-select__anchor{padding-left:16px;padding-right:0}.mdc-select .mdc-select__anchor[dir=rtl],[dir=rtl] .mdc-select .mdc-select__anchor{padding-left:0;padding-right:16px}.mdc-select.mdc-select--with-leading-icon .mdc-select__anchor{padding-left:0;padding-right:0}.mdc-select.mdc-select--with-leading-icon .mdc-select__anchor[dir=rtl],[dir=rtl] .mdc-select.mdc-select--with-leading-icon .mdc-select__anchor{padding-left:0;padding-right:0}.mdc-select .mdc-select__icon{width:24px;height:24px;font-size:24px}.mdc-select .mdc-select__dropdown-icon{width:24px;height:24px}.mdc-select .mdc-select__menu .mdc-deprecated-list-item{padding-left:16px;padding-right:16px}.mdc-select .mdc-select__menu .mdc-deprecated-list-item[dir=rtl],[dir=rtl] .mdc-select .mdc-select__menu .mdc-deprecated-list-item{padding-left:16px;padding-right:16px}.mdc-select .mdc-select__menu .mdc-deprecated-list-item__graphic{margin-left:0;margin-right:12px}.mdc-select .mdc-select__menu .mdc-deprecated-list-item__graphic[dir=rtl],[dir=rtl] .mdc-select .mdc-select__menu .mdc-deprecated-list-item__graphic{margin-left:12px;margin-right:0}.mdc-select__dropdown-icon{margin-left:12px;margin-right:12px;display:inline-flex;position:relative;align-self:center;align-items:center;justify-content:center;flex-shrink:0;pointer-events:none}.mdc-select__dropdown-icon .mdc-select__dropdown-icon-active,.mdc-select__dropdown-icon .mdc-select__dropdown-icon-inactive{position:absolute;top:0;left:0}.mdc-select__dropdown-icon .mdc-select__dropdown-icon-graphic{width:41.6666666667%;height:20.8333333333%}.mdc-select__dropdown-icon .mdc-select__dropdown-icon-inactive{opacity:1;transition:opacity 75ms linear 75ms}.mdc-select__dropdown-icon .mdc-select__dropdown-icon-active{opacity:0;transition:opacity 75ms linear}.mdc-select__dropdown-icon[dir=rtl],[dir=rtl] .mdc-select__dropdown-icon{margin-left:12px;margin-right:12px}.mdc-select--activated .mdc-select__dropdown-icon .mdc-select__dropdown-icon-inactive{opacity:0;transition:opacity 49.5ms linear}.mdc-select--activated .mdc-select__dropdown-icon .mdc-select__dropdown-icon-active{opacity:1;transition:opacity .1s linear 49.5ms}.mdc-select__anchor{width:200px;min-width:0;flex:1 1 auto;position:relative;box-sizing:border-box;overflow:hidden;outline:0;cursor:pointer}.mdc-select__anchor .mdc-floating-label--float-above{transform:translateY(-106%) scale(.75)}.mdc-select__selected-text-container{display:flex;appearance:none;pointer-events:none;box-sizing:border-box;width:auto;min-width:0;flex-grow:1;height:28px;border:none;outline:0;padding:0;background-color:transparent;color:inherit}.mdc-select__selected-text{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-subtitle1-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:1rem;font-size:var(--mdc-typography-subtitle1-font-size, 1rem);line-height:1.75rem;line-height:var(--mdc-typography-subtitle1-line-height, 1.75rem);font-weight:400;font-weight:var(--mdc-typography-subtitle1-font-weight,400);letter-spacing:.009375em;letter-spacing:var(--mdc-typography-subtitle1-letter-spacing, .009375em);text-decoration:inherit;text-decoration:var(--mdc-typography-subtitle1-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-subtitle1-text-transform,inherit);text-overflow:ellipsis;white-space:nowrap;overflow:hidden;display:block;width:100%;text-align:left}.mdc-select__selected-text[dir=rtl],[dir=rtl] .mdc-select__selected-text{text-align:right}.mdc-select--invalid:not(.mdc-select--disabled) .mdc-floating-label{color:#b00020;color:var(--mdc-theme-error,#b00020)}.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-floating-label{color:#b00020;color:var(--mdc-theme-error,#b00020)}.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--invalid+.mdc-select-helper-text--validation-msg{color:#b00020;color:var(--mdc-theme-error,#b00020)}.mdc-select--invalid:not(.mdc-select--disabled) .mdc-select__dropdown-icon{fill:#b00020;fill:var(--mdc-theme-error,#b00020)}.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-select__dropdown-icon{fill:#b00020;fill:var(--mdc-theme-error,#b00020)}.mdc-select--disabled{cursor:default;pointer-events:none}.mdc-select--with-leading-icon .mdc-select__menu .mdc-deprecated-list-item{padding-left:12px;padding-right:12px}.mdc-select--with-leading-icon .mdc-select__menu .mdc-deprecated-list-item[dir=rtl],[dir=rtl] .mdc-select--with-leading-icon .mdc-select__menu .mdc-deprecated-list-item{padding-left:12px;padding-right:12px}@media screen and (forced-colors:active),(-ms-high-contrast:active){.mdc-select__menu::before{position:absolute;box-sizing:border-box;width:100%;height:100%;top:0;left:0;border:1px solid transparent;border-radius:inherit;content:"";pointer-events:none}}@media screen and (forced-colors:active)and (forced-colors:active),screen and (-ms-high-contrast:active)and (forced-colors:active){.mdc-select__menu::before{border-color:CanvasText}}.mdc-select__menu .mdc-deprecated-list .mdc-select__icon,.mdc-select__menu .mdc-list .mdc-select__icon{margin-left:0;margin-right:0}.mdc-select__menu .mdc-deprecated-list .mdc-select__icon[dir=rtl],.mdc-select__menu .mdc-list .mdc-select__icon[dir=rtl],[dir=rtl] .mdc-select__menu .mdc-deprecated-list .mdc-select__icon,[dir=rtl] .mdc-select__menu .mdc-list .mdc-select__icon{margin-left:0;margin-right:0}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--activated,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected,.mdc-select__menu .mdc-list .mdc-deprecated-list-item--activated,.mdc-select__menu .mdc-list .mdc-deprecated-list-item--selected{color:#000;color:var(--mdc-theme-on-surface,#000)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--activated .mdc-deprecated-list-item__graphic,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected .mdc-deprecated-list-item__graphic,.mdc-select__menu .mdc-list .mdc-deprecated-list-item--activated .mdc-deprecated-list-item__graphic,.mdc-select__menu .mdc-list .mdc-deprecated-list-item--selected .mdc-deprecated-list-item__graphic{color:#000;color:var(--mdc-theme-on-surface,#000)}.mdc-select__menu .mdc-list-item__start{display:inline-flex;align-items:center}.mdc-select__option{padding-left:16px;padding-right:16px}.mdc-select__option[dir=rtl],[dir=rtl] .mdc-select__option{padding-left:16px;padding-right:16px}.mdc-select__one-line-option.mdc-list-item--with-one-line{height:48px}.mdc-select__two-line-option.mdc-list-item--with-two-lines{height:64px}.mdc-select__two-line-option.mdc-list-item--with-two-lines .mdc-list-item__start{margin-top:20px}.mdc-select__two-line-option.mdc-list-item--with-two-lines .mdc-list-item__primary-text{display:block;margin-top:0;line-height:normal;margin-bottom:-20px}.mdc-select__two-line-option.mdc-list-item--with-two-lines .mdc-list-item__primary-text::before{display:inline-block;width:0;height:28px;content:"";vertical-align:0}.mdc-select__two-line-option.mdc-list-item--with-two-lines .mdc-list-item__primary-text::after{display:inline-block;width:0;height:20px;content:"";vertical-align:-20px}.mdc-select__two-line-option.mdc-list-item--with-two-lines.mdc-list-item--with-trailing-meta .mdc-list-item__end{display:block;margin-top:0;line-height:normal}.mdc-select__two-line-option.mdc-list-item--with-two-lines.mdc-list-item--with-trailing-meta .mdc-list-item__end::before{display:inline-block;width:0;height:36px;content:"";vertical-align:0}.mdc-select__option-with-leading-content{padding-left:0;padding-right:12px}.mdc-select__option-with-leading-content.mdc-list-item{padding-left:0;padding-right:auto}.mdc-select__option-with-leading-content.mdc-list-item[dir=rtl],[dir=rtl] .mdc-select__option-with-leading-content.mdc-list-item{padding-left:auto;padding-right:0}.mdc-select__option-with-leading-content .mdc-list-item__start{margin-left:12px;margin-right:0}.mdc-select__option-with-leading-content .mdc-list-item__start[dir=rtl],[dir=rtl] .mdc-select__option-with-leading-content .mdc-list-item__start{margin-left:0;margin-right:12px}.mdc-select__option-with-leading-content .mdc-list-item__start{width:36px;height:24px}.mdc-select__option-with-leading-content[dir=rtl],[dir=rtl] .mdc-select__option-with-leading-content{padding-left:12px;padding-right:0}.mdc-select__option-with-meta.mdc-list-item{padding-left:auto;padding-right:0}.mdc-select__option-with-meta.mdc-list-item[dir=rtl],[dir=rtl] .mdc-select__option-with-meta.mdc-list-item{padding-left:0;padding-right:auto}.mdc-select__option-with-meta .mdc-list-item__end{margin-left:12px;margin-right:12px}.mdc-select__option-with-meta .mdc-list-item__end[dir=rtl],[dir=rtl] .mdc-select__option-with-meta .mdc-list-item__end{margin-left:12px;margin-right:12px}.mdc-select--filled .mdc-select__anchor{height:56px;display:flex;align-items:baseline}.mdc-select--filled .mdc-select__anchor::before{display:inline-block;width:0;height:40px;content:"";vertical-align:0}.mdc-select--filled.mdc-select--no-label .mdc-select__anchor .mdc-select__selected-text::before{content:"​"}.mdc-select--filled.mdc-select--no-label .mdc-select__anchor .mdc-select__selected-text-container{height:100%;display:inline-flex;align-items:center}.mdc-select--filled.mdc-select--no-label .mdc-select__anchor::before{display:none}.mdc-select--filled .mdc-select__anchor{border-top-left-radius:4px;border-top-left-radius:var(--mdc-shape-small,4px);border-top-right-radius:4px;border-top-right-radius:var(--mdc-shape-small,4px);border-bottom-right-radius:0;border-bottom-left-radius:0}.mdc-select--filled:not(.mdc-select--disabled) .mdc-select__anchor{background-color:#f5f5f5}.mdc-select--filled.mdc-select--disabled .mdc-select__anchor{background-color:#fafafa}.mdc-select--filled:not(.mdc-select--disabled) .mdc-line-ripple::before{border-bottom-color:rgba(0,0,0,.42)}.mdc-select--filled:not(.mdc-select--disabled):hover .mdc-line-ripple::before{border-bottom-color:rgba(0,0,0,.87)}.mdc-select--filled:not(.mdc-select--disabled) .mdc-line-ripple::after{border-bottom-color:#6200ee;border-bottom-color:var(--mdc-theme-primary,#6200ee)}.mdc-select--filled.mdc-select--disabled .mdc-line-ripple::before{border-bottom-color:rgba(0,0,0,.06)}.mdc-select--filled .mdc-floating-label{max-width:calc(100% - 64px)}.mdc-select--filled .mdc-floating-label--float-above{max-width:calc(100% / .75 - 64px / .75)}.mdc-select--filled .mdc-menu-surface--is-open-below{border-top-left-radius:0px;border-top-right-radius:0px}.mdc-select--filled.mdc-select--focused.mdc-line-ripple::after{transform:scale(1,2);opacity:1}.mdc-select--filled .mdc-floating-label{left:16px;right:initial}.mdc-select--filled .mdc-floating-label[dir=rtl],[dir=rtl] .mdc-select--filled .mdc-floating-label{left:initial;right:16px}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{left:48px;right:initial}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label[dir=rtl],[dir=rtl] .mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{left:initial;right:48px}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{max-width:calc(100% - 96px)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label--float-above{max-width:calc(100% / .75 - 96px / .75)}.mdc-select--invalid:not(.mdc-select--disabled) .mdc-line-ripple::before{border-bottom-color:#b00020;border-bottom-color:var(--mdc-theme-error,#b00020)}.mdc-select--invalid:not(.mdc-select--disabled):hover .mdc-line-ripple::before{border-bottom-color:#b00020;border-bottom-color:var(--mdc-theme-error,#b00020)}.mdc-select--invalid:not(.mdc-select--disabled) .mdc-line-ripple::after{border-bottom-color:#b00020;border-bottom-color:var(--mdc-theme-error,#b00020)}.mdc-select--outlined{border:none}.mdc-select--outlined .mdc-select__anchor{height:56px}.mdc-select--outlined .mdc-select__anchor .mdc-floating-label--float-above{transform:translateY(-37.25px) scale(1)}.mdc-select--outlined .mdc-select__anchor .mdc-floating-label--float-above{font-size:.75rem}.mdc-select--outlined .mdc-select__anchor .mdc-notched-outline--upgraded .mdc-floating-label--float-above,.mdc-select--outlined .mdc-select__anchor.mdc-notched-outline--upgraded .mdc-floating-label--float-above{transform:translateY(-34.75px) scale(.75)}.mdc-select--outlined .mdc-select__anchor .mdc-notched-outline--upgraded .mdc-floating-label--float-above,.mdc-select--outlined .mdc-select__anchor.mdc-notched-outline--upgraded .mdc-floating-label--float-above{font-size:1rem}.mdc-select--outlined .mdc-select__anchor .mdc-floating-label--shake{animation:mdc-floating-label-shake-float-above-select-outlined-56px 250ms 1}@keyframes mdc-floating-label-shake-float-above-select-outlined-56px{0%{transform:translateX(calc(0 - 0%)) translateY(-34.75px) scale(.75)}33%{animation-timing-function:cubic-bezier(0.5,0,0.701732,0.495819);transform:translateX(calc(4% - 0%)) translateY(-34.75px) scale(.75)}66%{animation-timing-function:cubic-bezier(0.302435,0.381352,0.55,0.956352);transform:translateX(calc(-4% - 0%)) translateY(-34.75px) scale(.75)}100%{transform:translateX(calc(0 - 0%)) translateY(-34.75px) scale(.75)}}.mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__leading{border-top-left-radius:4px;border-top-left-radius:var(--mdc-shape-small,4px);border-top-right-radius:0;border-bottom-right-radius:0;border-bottom-left-radius:4px;border-bottom-left-radius:var(--mdc-shape-small,4px)}.mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__leading[dir=rtl],[dir=rtl] .mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__leading{border-top-left-radius:0;border-top-right-radius:4px;border-top-right-radius:var(--mdc-shape-small,4px);border-bottom-right-radius:4px;border-bottom-right-radius:var(--mdc-shape-small,4px);border-bottom-left-radius:0}@supports(top:max(0%)){.mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__leading{width:max(12px,var(--mdc-shape-small,4px))}}@supports(top:max(0%)){.mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__notch{max-width:calc(100% - max(12px,var(--mdc-shape-small,4px)) * 2)}}.mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__trailing{border-top-left-radius:0;border-top-right-radius:4px;border-top-right-radius:var(--mdc-shape-small,4px);border-bottom-right-radius:4px;border-bottom-right-radius:var(--mdc-shape-small,4px);border-bottom-left-radius:0}.mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__trailing[dir=rtl],[dir=rtl] .mdc-select--outlined .mdc-notched-outline .mdc-notched-outline__trailing{border-top-left-radius:4px;border-top-left-radius:var(--mdc-shape-small,4px);border-top-right-radius:0;border-bottom-right-radius:0;border-bottom-left-radius:4px;border-bottom-left-radius:var(--mdc-shape-small,4px)}@supports(top:max(0%)){.mdc-select--outlined .mdc-select__anchor{padding-left:max(16px,calc(var(--mdc-shape-small,4px) + 4px))}}.mdc-select--outlined .mdc-select__anchor[dir=rtl],[dir=rtl] .mdc-select--outlined .mdc-select__anchor{padding-left:0}@supports(top:max(0%)){.mdc-select--outlined .mdc-select__anchor[dir=rtl],[dir=rtl] .mdc-select--outlined .mdc-select__anchor{padding-right:max(16px,calc(var(--mdc-shape-small,4px) + 4px))}}@supports(top:max(0%)){.mdc-select--outlined+.mdc-select-helper-text{margin-left:max(16px,calc(var(--mdc-shape-small,4px) + 4px))}}.mdc-select--outlined+.mdc-select-helper-text[dir=rtl],[dir=rtl] .mdc-select--outlined+.mdc-select-helper-text{margin-left:0}@supports(top:max(0%)){.mdc-select--outlined+.mdc-select-helper-text[dir=rtl],[dir=rtl] .mdc-select--outlined+.mdc-select-helper-text{margin-right:max(16px,calc(var(--mdc-shape-small,4px) + 4px))}}.mdc-select--outlined:not(.mdc-select--disabled) .mdc-select__anchor{background-color:transparent}.mdc-select--outlined.mdc-select--disabled .mdc-select__anchor{background-color:transparent}.mdc-select--outlined:not(.mdc-select--disabled) .mdc-notched-outline__leading,.mdc-select--outlined:not(.mdc-select--disabled) .mdc-notched-outline__notch,.mdc-select--outlined:not(.mdc-select--disabled) .mdc-notched-outline__trailing{border-color:rgba(0,0,0,.38)}.mdc-select--outlined:not(.mdc-select--disabled):not(.mdc-select--focused) .mdc-select__anchor:hover .mdc-notched-outline .mdc-notched-outline__leading,.mdc-select--outlined:not(.mdc-select--disabled):not(.mdc-select--focused) .mdc-select__anchor:hover .mdc-notched-outline .mdc-notched-outline__notch,.mdc-select--outlined:not(.mdc-select--disabled):not(.mdc-select--focused) .mdc-select__anchor:hover .mdc-notched-outline .mdc-notched-outline__trailing{border-color:rgba(0,0,0,.87)}.mdc-select--outlined:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__leading,.mdc-select--outlined:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__notch,.mdc-select--outlined:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__trailing{border-width:2px}.mdc-select--outlined:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__leading,.mdc-select--outlined:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__notch,.mdc-select--outlined:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__trailing{border-color:#6200ee;border-color:var(--mdc-theme-primary,#6200ee)}.mdc-select--outlined.mdc-select--disabled .mdc-notched-outline__leading,.mdc-select--outlined.mdc-select--disabled .mdc-notched-outline__notch,.mdc-select--outlined.mdc-select--disabled .mdc-notched-outline__trailing{border-color:rgba(0,0,0,.06)}.mdc-select--outlined .mdc-select__anchor :not(.mdc-notched-outline--notched) .mdc-notched-outline__notch{max-width:calc(100% - 60px)}.mdc-select--outlined .mdc-select__anchor{display:flex;align-items:baseline;overflow:visible}.mdc-select--outlined .mdc-select__anchor .mdc-floating-label--shake{animation:mdc-floating-label-shake-float-above-select-outlined 250ms 1}.mdc-select--outlined .mdc-select__anchor .mdc-floating-label--float-above{transform:translateY(-37.25px) scale(1)}.mdc-select--outlined .mdc-select__anchor .mdc-floating-label--float-above{font-size:.75rem}.mdc-select--outlined .mdc-select__anchor .mdc-notched-outline--upgraded .mdc-floating-label--float-above,.mdc-select--outlined .mdc-select__anchor.mdc-notched-outline--upgraded .mdc-floating-label--float-above{transform:translateY(-34.75px) scale(.75)}.mdc-select--outlined .mdc-select__anchor .mdc-notched-outline--upgraded .mdc-floating-label--float-above,.mdc-select--outlined .mdc-select__anchor.mdc-notched-outline--upgraded .mdc-floating-label--float-above{font-size:1rem}.mdc-select--outlined .mdc-select__anchor .mdc-notched-outline--notched .mdc-notched-outline__notch{padding-top:1px}.mdc-select--outlined .mdc-select__anchor .mdc-select__selected-text::before{content:"​"}.mdc-select--outlined .mdc-select__anchor .mdc-select__selected-text-container{height:100%;display:inline-flex;align-items:center}.mdc-select--outlined .mdc-select__anchor::before{display:none}.mdc-select--outlined .mdc-select__selected-text-container{display:flex;border:none;z-index:1;background-color:transparent}.mdc-select--outlined .mdc-select__icon{z-index:2}.mdc-select--outlined .mdc-floating-label{line-height:1.15rem;left:4px;right:initial}.mdc-select--outlined .mdc-floating-label[dir=rtl],[dir=rtl] .mdc-select--outlined .mdc-floating-label{left:initial;right:4px}.mdc-select--outlined.mdc-select--focused .mdc-notched-outline--notched .mdc-notched-outline__notch{padding-top:2px}.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled) .mdc-notched-outline__leading,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled) .mdc-notched-outline__notch,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled) .mdc-notched-outline__trailing{border-color:#b00020;border-color:var(--mdc-theme-error,#b00020)}.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled):not(.mdc-select--focused) .mdc-select__anchor:hover .mdc-notched-outline .mdc-notched-outline__leading,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled):not(.mdc-select--focused) .mdc-select__anchor:hover .mdc-notched-outline .mdc-notched-outline__notch,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled):not(.mdc-select--focused) .mdc-select__anchor:hover .mdc-notched-outline .mdc-notched-outline__trailing{border-color:#b00020;border-color:var(--mdc-theme-error,#b00020)}.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__leading,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__notch,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__trailing{border-width:2px}.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__leading,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__notch,.mdc-select--outlined.mdc-select--invalid:not(.mdc-select--disabled).mdc-select--focused .mdc-notched-outline .mdc-notched-outline__trailing{border-color:#b00020;border-color:var(--mdc-theme-error,#b00020)}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label{left:36px;right:initial}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label[dir=rtl],[dir=rtl] .mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label{left:initial;right:36px}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label--float-above{transform:translateY(-37.25px) translateX(-32px) scale(1)}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label--float-above[dir=rtl],[dir=rtl] .mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label--float-above{transform:translateY(-37.25px) translateX(32px) scale(1)}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label--float-above{font-size:.75rem}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-notched-outline--upgraded .mdc-floating-label--float-above,.mdc-select--outlined.mdc-select--with-leading-icon.mdc-notched-outline--upgraded .mdc-floating-label--float-above{transform:translateY(-34.75px) translateX(-32px) scale(.75)}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-notched-outline--upgraded .mdc-floating-label--float-above[dir=rtl],.mdc-select--outlined.mdc-select--with-leading-icon.mdc-notched-outline--upgraded .mdc-floating-label--float-above[dir=rtl],[dir=rtl] .mdc-select--outlined.mdc-select--with-leading-icon .mdc-notched-outline--upgraded .mdc-floating-label--float-above,[dir=rtl] .mdc-select--outlined.mdc-select--with-leading-icon.mdc-notched-outline--upgraded .mdc-floating-label--float-above{transform:translateY(-34.75px) translateX(32px) scale(.75)}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-notched-outline--upgraded .mdc-floating-label--float-above,.mdc-select--outlined.mdc-select--with-leading-icon.mdc-notched-outline--upgraded .mdc-floating-label--float-above{font-size:1rem}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label--shake{animation:mdc-floating-label-shake-float-above-select-outlined-leading-icon-56px 250ms 1}@keyframes mdc-floating-label-shake-float-above-select-outlined-leading-icon-56px{0%{transform:translateX(calc(0 - 32px)) translateY(-34.75px) scale(.75)}33%{animation-timing-function:cubic-bezier(0.5,0,0.701732,0.495819);transform:translateX(calc(4% - 32px)) translateY(-34.75px) scale(.75)}66%{animation-timing-function:cubic-bezier(0.302435,0.381352,0.55,0.956352);transform:translateX(calc(-4% - 32px)) translateY(-34.75px) scale(.75)}100%{transform:translateX(calc(0 - 32px)) translateY(-34.75px) scale(.75)}}.mdc-select--outlined.mdc-select--with-leading-icon[dir=rtl] .mdc-floating-label--shake,[dir=rtl] .mdc-select--outlined.mdc-select--with-leading-icon .mdc-floating-label--shake{animation:mdc-floating-label-shake-float-above-select-outlined-leading-icon-56px 250ms 1}@keyframes mdc-floating-label-shake-float-above-select-outlined-leading-icon-56px-rtl{0%{transform:translateX(calc(0 - -32px)) translateY(-34.75px) scale(.75)}33%{animation-timing-function:cubic-bezier(0.5,0,0.701732,0.495819);transform:translateX(calc(4% - -32px)) translateY(-34.75px) scale(.75)}66%{animation-timing-function:cubic-bezier(0.302435,0.381352,0.55,0.956352);transform:translateX(calc(-4% - -32px)) translateY(-34.75px) scale(.75)}100%{transform:translateX(calc(0 - -32px)) translateY(-34.75px) scale(.75)}}.mdc-select--outlined.mdc-select--with-leading-icon .mdc-select__anchor :not(.mdc-notched-outline--notched) .mdc-notched-outline__notch{max-width:calc(100% - 96px)}.mdc-select--outlined .mdc-menu-surface{margin-bottom:8px}.mdc-select--outlined .mdc-menu-surface--is-open-below,.mdc-select--outlined.mdc-select--no-label .mdc-menu-surface{margin-bottom:0}.mdc-select__anchor{--mdc-ripple-fg-size:0;--mdc-ripple-left:0;--mdc-ripple-top:0;--mdc-ripple-fg-scale:1;--mdc-ripple-fg-translate-end:0;--mdc-ripple-fg-translate-start:0;-webkit-tap-highlight-color:transparent;will-change:transform,opacity}.mdc-select__anchor .mdc-select__ripple::after,.mdc-select__anchor .mdc-select__ripple::before{position:absolute;border-radius:50%;opacity:0;pointer-events:none;content:""}.mdc-select__anchor .mdc-select__ripple::before{transition:opacity 15ms linear,background-color 15ms linear;z-index:1;z-index:var(--mdc-ripple-z-index,1)}.mdc-select__anchor .mdc-select__ripple::after{z-index:0;z-index:var(--mdc-ripple-z-index,0)}.mdc-select__anchor.mdc-ripple-upgraded .mdc-select__ripple::before{transform:scale(var(--mdc-ripple-fg-scale,1))}.mdc-select__anchor.mdc-ripple-upgraded .mdc-select__ripple::after{top:0;left:0;transform:scale(0);transform-origin:center center}.mdc-select__anchor.mdc-ripple-upgraded--unbounded .mdc-select__ripple::after{top:var(--mdc-ripple-top,0);left:var(--mdc-ripple-left,0)}.mdc-select__anchor.mdc-ripple-upgraded--foreground-activation .mdc-select__ripple::after{animation:mdc-ripple-fg-radius-in 225ms forwards,mdc-ripple-fg-opacity-in 75ms forwards}.mdc-select__anchor.mdc-ripple-upgraded--foreground-deactivation .mdc-select__ripple::after{animation:mdc-ripple-fg-opacity-out 150ms;transform:translate(var(--mdc-ripple-fg-translate-end,0)) scale(var(--mdc-ripple-fg-scale,1))}.mdc-select__anchor .mdc-select__ripple::after,.mdc-select__anchor .mdc-select__ripple::before{top:calc(50% - 100%);left:calc(50% - 100%);width:200%;height:200%}.mdc-select__anchor.mdc-ripple-upgraded .mdc-select__ripple::after{width:var(--mdc-ripple-fg-size,100%);height:var(--mdc-ripple-fg-size,100%)}.mdc-select__anchor .mdc-select__ripple::after,.mdc-select__anchor .mdc-select__ripple::before{background-color:rgba(0,0,0,.87);background-color:var(--mdc-ripple-color,rgba(0,0,0,.87))}.mdc-select__anchor.mdc-ripple-surface--hover .mdc-select__ripple::before,.mdc-select__anchor:hover .mdc-select__ripple::before{opacity:.04;opacity:var(--mdc-ripple-hover-opacity, .04)}.mdc-select__anchor.mdc-ripple-upgraded--background-focused .mdc-select__ripple::before,.mdc-select__anchor:not(.mdc-ripple-upgraded):focus .mdc-select__ripple::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-opacity, .12)}.mdc-select__anchor .mdc-select__ripple{position:absolute;top:0;left:0;width:100%;height:100%;pointer-events:none}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected .mdc-deprecated-list-item__ripple::after,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected .mdc-deprecated-list-item__ripple::before{background-color:#000;background-color:var(--mdc-ripple-color,var(--mdc-theme-on-surface,#000))}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected.mdc-ripple-surface--hover .mdc-deprecated-list-item__ripple::before,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:hover .mdc-deprecated-list-item__ripple::before{opacity:.04;opacity:var(--mdc-ripple-hover-opacity, .04)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected.mdc-ripple-upgraded--background-focused .mdc-deprecated-list-item__ripple::before,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:not(.mdc-ripple-upgraded):focus .mdc-deprecated-list-item__ripple::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-opacity, .12)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:not(.mdc-ripple-upgraded) .mdc-deprecated-list-item__ripple::after{transition:opacity 150ms linear}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:not(.mdc-ripple-upgraded):active .mdc-deprecated-list-item__ripple::after{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-press-opacity, .12)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.12)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected .mdc-list-item__ripple::after,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected .mdc-list-item__ripple::before{background-color:#000;background-color:var(--mdc-ripple-color,var(--mdc-theme-on-surface,#000))}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected.mdc-ripple-surface--hover .mdc-list-item__ripple::before,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:hover .mdc-list-item__ripple::before{opacity:.04;opacity:var(--mdc-ripple-hover-opacity, .04)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected.mdc-ripple-upgraded--background-focused .mdc-list-item__ripple::before,.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:not(.mdc-ripple-upgraded):focus .mdc-list-item__ripple::before{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-focus-opacity, .12)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:not(.mdc-ripple-upgraded) .mdc-list-item__ripple::after{transition:opacity 150ms linear}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected:not(.mdc-ripple-upgraded):active .mdc-list-item__ripple::after{transition-duration:75ms;opacity:.12;opacity:var(--mdc-ripple-press-opacity, .12)}.mdc-select__menu .mdc-deprecated-list .mdc-deprecated-list-item--selected.mdc-ripple-upgraded{--mdc-ripple-fg-opacity:var(--mdc-ripple-press-opacity, 0.12)}.mdc-select-helper-text{margin:0;margin-left:16px;margin-right:16px;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-caption-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.75rem;font-size:var(--mdc-typography-caption-font-size, .75rem);line-height:1.25rem;line-height:var(--mdc-typography-caption-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-caption-font-weight,400);letter-spacing:.0333333333em;letter-spacing:var(--mdc-typography-caption-letter-spacing, .0333333333em);text-decoration:inherit;text-decoration:var(--mdc-typography-caption-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-caption-text-transform,inherit);display:block;margin-top:0;line-height:normal}.mdc-select-helper-text[dir=rtl],[dir=rtl] .mdc-select-helper-text{margin-left:16px;margin-right:16px}.mdc-select-helper-text::before{display:inline-block;width:0;height:16px;content:"";vertical-align:0}.mdc-select-helper-text--validation-msg{opacity:0;transition:opacity 180ms cubic-bezier(.4, 0, .2, 1)}.mdc-select--invalid+.mdc-select-helper-text--validation-msg,.mdc-select-helper-text--validation-msg-persistent{opacity:1}.mdc-select--with-leading-icon .mdc-select__icon{display:inline-block;box-sizing:border-box;border:none;text-decoration:none;cursor:pointer;user-select:none;flex-shrink:0;align-self:center;background-color:transparent;fill:currentColor}.mdc-select--with-leading-icon .mdc-select__icon{margin-left:12px;margin-right:12px}.mdc-select--with-leading-icon .mdc-select__icon[dir=rtl],[dir=rtl] .mdc-select--with-leading-icon .mdc-select__icon{margin-left:12px;margin-right:12px}.mdc-select__icon:not([tabindex]),.mdc-select__icon[tabindex="-1"]{cursor:default;pointer-events:none}.material-icons{font-family:var(--mdc-icon-font, "Material Icons");font-weight:400;font-style:normal;font-size:var(--mdc-icon-size, 24px);line-height:1;letter-spacing:normal;text-transform:none;display:inline-block;white-space:nowrap;word-wrap:normal;direction:ltr;-webkit-font-smoothing:antialiased;text-rendering:optimizeLegibility;-moz-osx-font-smoothing:grayscale;font-feature-settings:"liga"}:host{display:inline-block;vertical-align:top;outline:0}.mdc-select{width:100%}[hidden]{display:none}.mdc-select__icon{z-index:2}.mdc-select--with-leading-icon{--mdc-list-item-graphic-margin:calc( 48px - var(--mdc-list-item-graphic-size, 24px) - var(--mdc-list-side-padding, 16px) )}.mdc-select .mdc-select__anchor .mdc-select__selected-text{overflow:hidden}.mdc-select .mdc-select__anchor *{display:inline-flex}.mdc-select .mdc-select__anchor .mdc-floating-label{display:inline-block}mwc-notched-outline{--mdc-notched-outline-border-color:var( --mdc-select-outlined-idle-border-color, rgba(0, 0, 0, 0.38) );--mdc-notched-outline-notch-offset:1px}:host(:not([disabled]):hover) .mdc-select:not(.mdc-select--invalid):not(.mdc-select--focused) mwc-notched-outline{--mdc-notched-outline-border-color:var( --mdc-select-outlined-hover-border-color, rgba(0, 0, 0, 0.87) )}:host(:not([disabled])) .mdc-select:not(.mdc-select--disabled) .mdc-select__selected-text{color:rgba(0,0,0,.87);color:var(--mdc-select-ink-color,rgba(0,0,0,.87))}:host(:not([disabled])) .mdc-select:not(.mdc-select--disabled) .mdc-line-ripple::before{border-bottom-color:rgba(0,0,0,.42);border-bottom-color:var(--mdc-select-idle-line-color,rgba(0,0,0,.42))}:host(:not([disabled])) .mdc-select:not(.mdc-select--disabled):hover .mdc-line-ripple::before{border-bottom-color:rgba(0,0,0,.87);border-bottom-color:var(--mdc-select-hover-line-color,rgba(0,0,0,.87))}:host(:not([disabled])) .mdc-select:not(.mdc-select--outlined):not(.mdc-select--disabled) .mdc-select__anchor{background-color:#f5f5f5;background-color:var(--mdc-select-fill-color,#f5f5f5)}:host(:not([disabled])) .mdc-select.mdc-select--invalid .mdc-select__dropdown-icon{fill:var(--mdc-select-error-dropdown-icon-color,var(--mdc-select-error-color,var(--mdc-theme-error,#b00020)))}:host(:not([disabled])) .mdc-select.mdc-select--invalid .mdc-floating-label,:host(:not([disabled])) .mdc-select.mdc-select--invalid .mdc-floating-label::after{color:var(--mdc-select-error-color,var(--mdc-theme-error,#b00020))}:host(:not([disabled])) .mdc-select.mdc-select--invalid mwc-notched-outline{--mdc-notched-outline-border-color:var(--mdc-select-error-color, var(--mdc-theme-error, #b00020))}.mdc-select__menu--invalid{--mdc-theme-primary:var(--mdc-select-error-color, var(--mdc-theme-error, #b00020))}:host(:not([disabled])) .mdc-select:not(.mdc-select--invalid):not(.mdc-select--focused) .mdc-floating-label,:host(:not([disabled])) .mdc-select:not(.mdc-select--invalid):not(.mdc-select--focused) .mdc-floating-label::after{color:rgba(0,0,0,.6);color:var(--mdc-select-label-ink-color,rgba(0,0,0,.6))}:host(:not([disabled])) .mdc-select:not(.mdc-select--invalid):not(.mdc-select--focused) .mdc-select__dropdown-icon{fill:rgba(0,0,0,0.54);fill:var(--mdc-select-dropdown-icon-color,rgba(0,0,0,0.54))}:host(:not([disabled])) .mdc-select.mdc-select--focused mwc-notched-outline{--mdc-notched-outline-stroke-width:2px;--mdc-notched-outline-notch-offset:2px}:host(:not([disabled])) .mdc-select.mdc-select--focused:not(.mdc-select--invalid) mwc-notched-outline{--mdc-notched-outline-border-color:var( --mdc-select-focused-label-color, var(--mdc-theme-primary, rgba(98, 0, 238, 0.87)) )}:host(:not([disabled])) .mdc-select.mdc-select--focused:not(.mdc-select--invalid) .mdc-select__dropdown-icon{fill:rgba(98,0,238,.87);fill:var(--mdc-select-focused-dropdown-icon-color,var(--mdc-theme-primary,rgba(98,0,238,0.87)))}:host(:not([disabled])) .mdc-select.mdc-select--focused:not(.mdc-select--invalid) .mdc-floating-label{color:#6200ee;color:var(--mdc-theme-primary,#6200ee)}:host(:not([disabled])) .mdc-select.mdc-select--focused:not(.mdc-select--invalid) .mdc-floating-label::after{color:#6200ee;color:var(--mdc-theme-primary,#6200ee)}:host(:not([disabled])) .mdc-select-helper-text:not(.mdc-select-helper-text--validation-msg){color:var(--mdc-select-label-ink-color,rgba(0,0,0,.6))}:host([disabled]){pointer-events:none}:host([disabled]) .mdc-select:not(.mdc-select--outlined).mdc-select--disabled .mdc-select__anchor{background-color:#fafafa;background-color:var(--mdc-select-disabled-fill-color,#fafafa)}:host([disabled]) .mdc-select.mdc-select--outlined mwc-notched-outline{--mdc-notched-outline-border-color:var( --mdc-select-outlined-disabled-border-color, rgba(0, 0, 0, 0.06) )}:host([disabled]) .mdc-select .mdc-select__dropdown-icon{fill:rgba(0,0,0,0.38);fill:var(--mdc-select-disabled-dropdown-icon-color,rgba(0,0,0,0.38))}:host([disabled]) .mdc-select:not(.mdc-select--invalid):not(.mdc-select--focused) .mdc-floating-label,:host([disabled]) .mdc-select:not(.mdc-select--invalid):not(.mdc-select--focused) .mdc-floating-label::after{color:rgba(0,0,0,.38);color:var(--mdc-select-disabled-ink-color,rgba(0,0,0,.38))}:host([disabled]) .mdc-select-helper-text{color:rgba(0,0,0,.38);color:var(--mdc-select-disabled-ink-color,rgba(0,0,0,.38))}:host([disabled]) .mdc-select__selected-text{color:rgba(0,0,0,.38);color:var(--mdc-select-disabled-ink-color,rgba(0,0,0,.38))}'])))}}]);
+//# sourceMappingURL=5943.HnsfCYe-1JY.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 6023.1tzROGjBv74.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6023],{35749:function(e){e.exports={IndexSizeError:{s:"INDEX_SIZE_ERR",c:1,m:1},DOMStringSizeError:{s:"DOMSTRING_SIZE_ERR",c:2,m:0},HierarchyRequestError:{s:"HIERARCHY_REQUEST_ERR",c:3,m:1},WrongDocumentError:{s:"WRONG_DOCUMENT_ERR",c:4,m:1},InvalidCharacterError:{s:"INVALID_CHARACTER_ERR",c:5,m:1},NoDataAllowedError:{s:"NO_DATA_ALLOWED_ERR",c:6,m:0},NoModificationAllowedError:{s:"NO_MODIFICATION_ALLOWED_ERR",c:7,m:1},NotFoundError:{s:"NOT_FOUND_ERR",c:8,m:1},NotSupportedError:{s:"NOT_SUPPORTED_ERR",c:9,m:1},InUseAttributeError:{s:"INUSE_ATTRIBUTE_ERR",c:10,m:1},InvalidStateError:{s:"INVALID_STATE_ERR",c:11,m:1},SyntaxError:{s:"SYNTAX_ERR",c:12,m:1},InvalidModificationError:{s:"INVALID_MODIFICATION_ERR",c:13,m:1},NamespaceError:{s:"NAMESPACE_ERR",c:14,m:1},InvalidAccessError:{s:"INVALID_ACCESS_ERR",c:15,m:1},ValidationError:{s:"VALIDATION_ERR",c:16,m:0},TypeMismatchError:{s:"TYPE_MISMATCH_ERR",c:17,m:1},SecurityError:{s:"SECURITY_ERR",c:18,m:1},NetworkError:{s:"NETWORK_ERR",c:19,m:1},AbortError:{s:"ABORT_ERR",c:20,m:1},URLMismatchError:{s:"URL_MISMATCH_ERR",c:21,m:1},QuotaExceededError:{s:"QUOTA_EXCEEDED_ERR",c:22,m:1},TimeoutError:{s:"TIMEOUT_ERR",c:23,m:1},InvalidNodeTypeError:{s:"INVALID_NODE_TYPE_ERR",c:24,m:1},DataCloneError:{s:"DATA_CLONE_ERR",c:25,m:1}}},99167:function(e,t,a){var r=a(58849),n=a(18431),i=a(22933),o=a(30852),s=Error.prototype.toString,l=n((function(){if(r){var e=Object.create(Object.defineProperty({},"name",{get:function(){return this===e}}));if("true"!==s.call(e))return!0}return"2: 1"!==s.call({message:1,name:2})||"Error"!==s.call({})}));e.exports=l?function(){var e=i(this),t=o(e.name,"Error"),a=o(e.message);return t?a?t+": "+a:t:a}:s},40565:function(e,t,a){var r=a(68077),n=a(24038),i=a(29694),o=a(18431),s=a(9885),l=a(51012),c=a(54991).f,u=a(73936),d=a(40030),f=a(55229),m=a(85539),h=a(22933),p=a(99167),v=a(30852),E=a(35749),y=a(21709),g=a(12648),w=a(58849),b=a(95448),A="DOMException",M="DATA_CLONE_ERR",R=i("Error"),T=i(A)||function(){try{(new(i("MessageChannel")||n("worker_threads").MessageChannel)).port1.postMessage(new WeakMap)}catch(e){if(e.name===M&&25===e.code)return e.constructor}}(),I=T&&T.prototype,k=R.prototype,O=g.set,S=g.getterFor(A),C="stack"in new R(A),N=function(e){return f(E,e)&&E[e].m?E[e].c:0},_=function(){m(this,x);var e=arguments.length,t=v(e<1?void 0:arguments[0]),a=v(e<2?void 0:arguments[1],"Error"),r=N(a);if(O(this,{type:A,name:a,message:t,code:r}),w||(this.name=a,this.message=t,this.code=r),C){var n=new R(t);n.name=A,c(this,"stack",l(1,y(n.stack,1)))}},x=_.prototype=s(k),D=function(e){return{enumerable:!0,configurable:!0,get:e}},L=function(e){return D((function(){return S(this)[e]}))};w&&(d(x,"code",L("code")),d(x,"message",L("message")),d(x,"name",L("name"))),c(x,"constructor",l(1,_));var F=o((function(){return!(new T instanceof R)})),V=F||o((function(){return k.toString!==p||"2: 1"!==String(new T(1,2))})),P=F||o((function(){return 25!==new T(1,"DataCloneError").code})),Z=F||25!==T[M]||25!==I[M],W=b?V||P||Z:F;r({global:!0,constructor:!0,forced:W},{DOMException:W?_:T});var H=i(A),j=H.prototype;for(var U in V&&(b||T===H)&&u(j,"toString",p),P&&w&&T===H&&d(j,"code",D((function(){return N(h(this).name)}))),E)if(f(E,U)){var z=E[U],q=z.s,K=l(6,z.c);f(H,q)||c(H,q,K),f(j,q)||c(j,q,K)}},44580:function(e,t,a){var r=a(68077),n=a(5813),i=a(29694),o=a(51012),s=a(54991).f,l=a(55229),c=a(85539),u=a(81760),d=a(30852),f=a(35749),m=a(21709),h=a(58849),p=a(95448),v="DOMException",E=i("Error"),y=i(v),g=function(){c(this,w);var e=arguments.length,t=d(e<1?void 0:arguments[0]),a=d(e<2?void 0:arguments[1],"Error"),r=new y(t,a),n=new E(t);return n.name=v,s(r,"stack",o(1,m(n.stack,1))),u(r,this,g),r},w=g.prototype=y.prototype,b="stack"in new E(v),A="stack"in new y(1,2),M=y&&h&&Object.getOwnPropertyDescriptor(n,v),R=!(!M||M.writable&&M.configurable),T=b&&!R&&!A;r({global:!0,constructor:!0,forced:p||T},{DOMException:T?g:y});var I=i(v),k=I.prototype;if(k.constructor!==I)for(var O in p||s(k,"constructor",o(1,I)),f)if(l(f,O)){var S=f[O],C=S.s;l(I,C)||s(I,C,o(6,S.c))}},48882:function(e,t,a){var r=a(29694),n="DOMException";a(48357)(r(n),n)},6157:function(e,t,a){a.d(t,{d:function(){return o}});var r=a(40039),n=(a(46349),a(88640),a(63789),a(24074),["ariaAtomic","ariaAutoComplete","ariaBusy","ariaChecked","ariaColCount","ariaColIndex","ariaColSpan","ariaCurrent","ariaDisabled","ariaExpanded","ariaHasPopup","ariaHidden","ariaInvalid","ariaKeyShortcuts","ariaLabel","ariaLevel","ariaLive","ariaModal","ariaMultiLine","ariaMultiSelectable","ariaOrientation","ariaPlaceholder","ariaPosInSet","ariaPressed","ariaReadOnly","ariaRequired","ariaRoleDescription","ariaRowCount","ariaRowIndex","ariaRowSpan","ariaSelected","ariaSetSize","ariaSort","ariaValueMax","ariaValueMin","ariaValueNow","ariaValueText"]);n.map(i);function i(e){return e.replace("aria","aria-").replace(/Elements?/g,"").toLowerCase()}function o(e){var t,a=(0,r.Z)(n);try{for(a.s();!(t=a.n()).done;){var o=t.value;e.createProperty(o,{attribute:i(o),reflect:!0})}}catch(s){a.e(s)}finally{a.f()}e.addInitializer((function(e){var t={hostConnected:function(){e.setAttribute("role","presentation")}};e.addController(t)}))}},34131:function(e,t,a){var r=a(62746),n=a(68308),i=a(82390),o=a(34541),s=a(47838),l=a(69205),c=a(56889),u=a(33368),d=a(71650),f=a(46097),m=a(40039);a(51358),a(46798),a(5239),a(39685),a(98490),a(9849),a(50289),a(94167),a(32797),a(65974),a(87438),a(22890),a(94570),a(22859),a(36513),a(46349),a(70320),a(40271),a(60163),a(97393),a(91989),a(64777),a(78399),a(56086),a(47884),a(81912),a(64584),a(41483),a(12367),a(9454),a(40565),a(44580),a(48882),a(37792),a(56308),a(51467),a(63789),a(99397),a(10599),a(20254),a(94738),a(98214),a(40720),a(37313),a(85717),a(24074);!function(e){var t=new WeakMap,a=new WeakMap,h=new WeakMap,p=new WeakMap,v=new WeakMap,E=new WeakMap,y=new WeakMap,g=new WeakMap,w=new WeakMap,b=new WeakMap,A=new WeakMap,M=new WeakMap,R=new WeakMap,T=new WeakMap,I=new WeakMap,k={ariaAtomic:"aria-atomic",ariaAutoComplete:"aria-autocomplete",ariaBusy:"aria-busy",ariaChecked:"aria-checked",ariaColCount:"aria-colcount",ariaColIndex:"aria-colindex",ariaColIndexText:"aria-colindextext",ariaColSpan:"aria-colspan",ariaCurrent:"aria-current",ariaDisabled:"aria-disabled",ariaExpanded:"aria-expanded",ariaHasPopup:"aria-haspopup",ariaHidden:"aria-hidden",ariaInvalid:"aria-invalid",ariaKeyShortcuts:"aria-keyshortcuts",ariaLabel:"aria-label",ariaLevel:"aria-level",ariaLive:"aria-live",ariaModal:"aria-modal",ariaMultiLine:"aria-multiline",ariaMultiSelectable:"aria-multiselectable",ariaOrientation:"aria-orientation",ariaPlaceholder:"aria-placeholder",ariaPosInSet:"aria-posinset",ariaPressed:"aria-pressed",ariaReadOnly:"aria-readonly",ariaRelevant:"aria-relevant",ariaRequired:"aria-required",ariaRoleDescription:"aria-roledescription",ariaRowCount:"aria-rowcount",ariaRowIndex:"aria-rowindex",ariaRowIndexText:"aria-rowindextext",ariaRowSpan:"aria-rowspan",ariaSelected:"aria-selected",ariaSetSize:"aria-setsize",ariaSort:"aria-sort",ariaValueMax:"aria-valuemax",ariaValueMin:"aria-valuemin",ariaValueNow:"aria-valuenow",ariaValueText:"aria-valuetext",role:"role"};function O(e){var t=p.get(e),a=t.form;U(e,a,t),P(e,t.labels)}var S=function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],a=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:function(e){return p.has(e)?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}}),r=a.nextNode(),n=!t||e.disabled;r;)r.formDisabledCallback&&n&&L(r,e.disabled),r=a.nextNode()},C={attributes:!0,attributeFilter:["disabled","name"]},N=B()?new MutationObserver((function(e){var t,a=(0,m.Z)(e);try{for(a.s();!(t=a.n()).done;){var r=t.value,n=r.target;if("disabled"===r.attributeName&&(n.constructor.formAssociated?L(n,n.hasAttribute("disabled")):"fieldset"===n.localName&&S(n)),"name"===r.attributeName&&n.constructor.formAssociated){var i=p.get(n),o=w.get(n);i.setFormValue(o)}}}catch(s){a.e(s)}finally{a.f()}})):{};function _(e){e.forEach((function(e){var t=e.addedNodes,a=e.removedNodes,r=Array.from(t),n=Array.from(a);r.forEach((function(e){if(p.has(e)&&e.constructor.formAssociated&&O(e),b.has(e)){var t=b.get(e);Object.keys(k).filter((function(e){return null!==t[e]})).forEach((function(a){e.setAttribute(k[a],t[a])})),b.delete(e)}if(I.has(e)){var a=I.get(e);e.setAttribute("internals-valid",a.validity.valid.toString()),e.setAttribute("internals-invalid",(!a.validity.valid).toString()),e.setAttribute("aria-invalid",(!a.validity.valid).toString()),I.delete(e)}if("form"===e.localName)for(var r=g.get(e),n=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:function(e){return!p.has(e)||!e.constructor.formAssociated||r&&r.has(e)?NodeFilter.FILTER_SKIP:NodeFilter.FILTER_ACCEPT}}),i=n.nextNode();i;)O(i),i=n.nextNode();var o;"fieldset"===e.localName&&(null===(o=N.observe)||void 0===o||o.call(N,e,C),S(e,!0))})),n.forEach((function(e){var t=p.get(e);(t&&h.get(t)&&F(t),y.has(e))&&y.get(e).disconnect()}))}))}function x(e){e.forEach((function(e){e.removedNodes.forEach((function(t){var a=R.get(e.target);p.has(t)&&Y(t),a.disconnect()}))}))}!B()||new MutationObserver(_);var D={childList:!0,subtree:!0},L=function(e,t){e.toggleAttribute("internals-disabled",t),t?e.setAttribute("aria-disabled","true"):e.removeAttribute("aria-disabled"),e.formDisabledCallback&&e.formDisabledCallback.apply(e,[t])},F=function(e){h.get(e).forEach((function(e){e.remove()})),h.set(e,[])},V=function(e,t){var a=document.createElement("input");return a.type="hidden",a.name=e.getAttribute("name"),e.after(a),h.get(t).push(a),a},P=function(e,t){if(t.length){Array.from(t).forEach((function(t){return t.addEventListener("click",e.click.bind(e))}));var a=t[0].id;t[0].id||(a="".concat(t[0].htmlFor,"_Label"),t[0].id=a),e.setAttribute("aria-labelledby",a)}},Z=function(e){var t=Array.from(e.elements).filter((function(e){return!e.tagName.includes("-")&&e.validity})).map((function(e){return e.validity.valid})),a=g.get(e)||[],r=Array.from(a).filter((function(e){return e.isConnected})).map((function(e){return p.get(e).validity.valid})),n=[].concat((0,f.Z)(t),(0,f.Z)(r)).includes(!1);e.toggleAttribute("internals-invalid",n),e.toggleAttribute("internals-valid",!n)},W=function(e){Z(z(e.target))},H=function(e){Z(z(e.target))},j=function(e){var t=g.get(e.target);t&&t.size&&t.forEach((function(e){e.constructor.formAssociated&&e.formResetCallback&&e.formResetCallback.apply(e)}))},U=function(e,t,a){if(t){var r=g.get(t);if(r)r.add(e);else{var n=new Set;n.add(e),g.set(t,n),function(e){var t=["button[type=submit]","input[type=submit]","button:not([type])"].map((function(e){return"".concat(e,":not([disabled])")})).map((function(t){return"".concat(t,":not([form])").concat(e.id?",".concat(t,"[form='").concat(e.id,"']"):"")})).join(",");e.addEventListener("click",(function(a){if(a.target.closest(t)){var r=g.get(e);if(e.noValidate)return;r.size&&Array.from(r).reverse().map((function(e){return p.get(e).reportValidity()})).includes(!1)&&a.preventDefault()}}))}(t),t.addEventListener("reset",j),t.addEventListener("input",W),t.addEventListener("change",H)}E.set(t,{ref:e,internals:a}),e.constructor.formAssociated&&e.formAssociatedCallback&&setTimeout((function(){e.formAssociatedCallback.apply(e,[t])}),0),Z(t)}},z=function e(t){var a=t.parentNode;return a&&"FORM"!==a.tagName&&(a=e(a)),a},q=function(e,t){var a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:DOMException;if(!e.constructor.formAssociated)throw new a(t)},K=function(e,t,a){var r=g.get(e);return r&&r.size&&r.forEach((function(e){p.get(e)[a]()||(t=!1)})),t},Y=function(e){if(e.constructor.formAssociated){var t=p.get(e),a=t.labels,r=t.form;P(e,a),U(e,r,t)}};function B(){return"undefined"!=typeof MutationObserver}var Q=(0,u.Z)((function e(){(0,d.Z)(this,e),this.badInput=!1,this.customError=!1,this.patternMismatch=!1,this.rangeOverflow=!1,this.rangeUnderflow=!1,this.stepMismatch=!1,this.tooLong=!1,this.tooShort=!1,this.typeMismatch=!1,this.valid=!0,this.valueMissing=!1,Object.seal(this)})),X=function(e){var t=!0;for(var a in e)"valid"!==a&&!1!==e[a]&&(t=!1);return t},G=new WeakMap;function J(e,t){e.toggleAttribute(t,!0),e.part&&e.part.add(t)}var $,ee=function(e){function t(e){var a;if((0,d.Z)(this,t),a=(0,n.Z)(this,t),!e||!e.tagName||-1===e.tagName.indexOf("-"))throw new TypeError("Illegal constructor");return G.set((0,i.Z)(a),e),a}return(0,l.Z)(t,e),(0,u.Z)(t,[{key:"add",value:function(e){if(!/^--/.test(e)||"string"!=typeof e)throw new DOMException("Failed to execute 'add' on 'CustomStateSet': The specified value ".concat(e," must start with '--'."));var a=(0,o.Z)((0,s.Z)(t.prototype),"add",this).call(this,e),r=G.get(this),n="state".concat(e);return r.isConnected?J(r,n):setTimeout((function(){J(r,n)})),a}},{key:"clear",value:function(){var e,a=(0,m.Z)(this.entries());try{for(a.s();!(e=a.n()).done;){var n=(0,r.Z)(e.value,1)[0];this.delete(n)}}catch(i){a.e(i)}finally{a.f()}(0,o.Z)((0,s.Z)(t.prototype),"clear",this).call(this)}},{key:"delete",value:function(e){var a=(0,o.Z)((0,s.Z)(t.prototype),"delete",this).call(this,e),r=G.get(this);return r.isConnected?(r.toggleAttribute("state".concat(e),!1),r.part&&r.part.remove("state".concat(e))):setTimeout((function(){r.toggleAttribute("state".concat(e),!1),r.part&&r.part.remove("state".concat(e))})),a}}],[{key:"isPolyfilled",get:function(){return!0}}]),t}((0,c.Z)(Set));function te(e,t,a,r){if("a"===a&&!r)throw new TypeError("Private accessor was defined without a getter");if("function"==typeof t?e!==t||!r:!t.has(e))throw new TypeError("Cannot read private member from an object whose class did not declare it");return"m"===a?r:"a"===a?r.call(e):r?r.value:t.get(e)}var ae=function(e){function t(e){(0,d.Z)(this,t),$.set(this,void 0),function(e,t,a,r,n){if("m"===r)throw new TypeError("Private method is not writable");if("a"===r&&!n)throw new TypeError("Private accessor was defined without a setter");if("function"==typeof t?e!==t||!n:!t.has(e))throw new TypeError("Cannot write private member to an object whose class did not declare it");"a"===r?n.call(e,a):n?n.value=a:t.set(e,a)}(this,$,e,"f");for(var a=0;a<e.length;a++){var r=e[a];this[a]=r,r.hasAttribute("name")&&(this[r.getAttribute("name")]=r)}Object.freeze(this)}return(0,u.Z)(t,[{key:"length",get:function(){return te(this,$,"f").length}},{key:e,value:function(){return te(this,$,"f")[Symbol.iterator]()}},{key:"item",value:function(e){return null==this[e]?null:this[e]}},{key:"namedItem",value:function(e){return null==this[e]?null:this[e]}}]),t}(($=new WeakMap,Symbol.iterator));var re=function(){function e(r){if((0,d.Z)(this,e),!r||!r.tagName||-1===r.tagName.indexOf("-"))throw new TypeError("Illegal constructor");var n,i,o,s,l=r.getRootNode(),c=new Q;this.states=new ee(r),t.set(this,r),a.set(this,c),p.set(r,this),function(e,t){var a=function(){t[r]=null;var a=null,n=k[r];Object.defineProperty(t,r,{get:function(){return a},set:function(r){a=r,e.isConnected?e.setAttribute(n,r):b.set(e,t)}})};for(var r in k)a()}(r,this),function(e,t){var a;h.set(t,[]),null===(a=N.observe)||void 0===a||a.call(N,e,C)}(r,this),Object.seal(this),l instanceof DocumentFragment&&(n=l,s=new MutationObserver(x),null!==(i=window)&&void 0!==i&&null!==(i=i.ShadyDOM)&&void 0!==i&&i.inUse&&n.mode&&n.host&&(n=n.host),null===(o=s.observe)||void 0===o||o.call(s,n,{childList:!0}),R.set(n,s))}return(0,u.Z)(e,[{key:"checkValidity",value:function(){var e=t.get(this);if(q(e,"Failed to execute 'checkValidity' on 'ElementInternals': The target element is not a form-associated custom element."),!this.willValidate)return!0;var r=a.get(this);if(!r.valid){var n=new Event("invalid",{bubbles:!1,cancelable:!0,composed:!1});e.dispatchEvent(n)}return r.valid}},{key:"form",get:function(){var e,a=t.get(this);return q(a,"Failed to read the 'form' property from 'ElementInternals': The target element is not a form-associated custom element."),!0===a.constructor.formAssociated&&(e=z(a)),e}},{key:"labels",get:function(){var e=t.get(this);q(e,"Failed to read the 'labels' property from 'ElementInternals': The target element is not a form-associated custom element.");var a=e.getAttribute("id"),r=e.getRootNode();return r&&a?r.querySelectorAll('[for="'.concat(a,'"]')):[]}},{key:"reportValidity",value:function(){var e=t.get(this);if(q(e,"Failed to execute 'reportValidity' on 'ElementInternals': The target element is not a form-associated custom element."),!this.willValidate)return!0;var a=this.checkValidity(),r=M.get(this);if(r&&!e.constructor.formAssociated)throw new DOMException("Failed to execute 'reportValidity' on 'ElementInternals': The target element is not a form-associated custom element.");return!a&&r&&(e.focus(),r.focus()),a}},{key:"setFormValue",value:function(e){var a=this,n=t.get(this);(q(n,"Failed to execute 'setFormValue' on 'ElementInternals': The target element is not a form-associated custom element."),F(this),null==e||e instanceof FormData)?null!=e&&e instanceof FormData&&Array.from(e).reverse().forEach((function(e){var t=(0,r.Z)(e,2),i=t[0],o=t[1];if("string"==typeof o){var s=V(n,a);s.name=i,s.value=o}})):n.getAttribute("name")&&(V(n,this).value=e);w.set(n,e)}},{key:"setValidity",value:function(e,r,n){var i=t.get(this);if(q(i,"Failed to execute 'setValidity' on 'ElementInternals': The target element is not a form-associated custom element."),!e)throw new TypeError("Failed to execute 'setValidity' on 'ElementInternals': 1 argument required, but only 0 present.");M.set(this,n);var o,s=a.get(this),l={};for(var c in e)l[c]=e[c];0===Object.keys(l).length&&((o=s).badInput=!1,o.customError=!1,o.patternMismatch=!1,o.rangeOverflow=!1,o.rangeUnderflow=!1,o.stepMismatch=!1,o.tooLong=!1,o.tooShort=!1,o.typeMismatch=!1,o.valid=!0,o.valueMissing=!1);var u=Object.assign(Object.assign({},s),l);delete u.valid;var d=function(e,t,a){return e.valid=X(t),Object.keys(t).forEach((function(a){return e[a]=t[a]})),a&&Z(a),e}(s,u,this.form),f=d.valid;if(!f&&!r)throw new DOMException("Failed to execute 'setValidity' on 'ElementInternals': The second argument should not be empty if one or more flags in the first argument are true.");v.set(this,f?"":r),i.isConnected?(i.toggleAttribute("internals-invalid",!f),i.toggleAttribute("internals-valid",f),i.setAttribute("aria-invalid","".concat(!f))):I.set(i,this)}},{key:"shadowRoot",get:function(){var e=t.get(this),a=A.get(e);return a||null}},{key:"validationMessage",get:function(){var e=t.get(this);return q(e,"Failed to read the 'validationMessage' property from 'ElementInternals': The target element is not a form-associated custom element."),v.get(this)}},{key:"validity",get:function(){var e=t.get(this);return q(e,"Failed to read the 'validity' property from 'ElementInternals': The target element is not a form-associated custom element."),a.get(this)}},{key:"willValidate",get:function(){var e=t.get(this);return q(e,"Failed to read the 'willValidate' property from 'ElementInternals': The target element is not a form-associated custom element."),!(e.disabled||e.hasAttribute("disabled")||e.hasAttribute("readonly"))}}],[{key:"isPolyfilled",get:function(){return!0}}]),e}();var ne=!1,ie=!1;function oe(e){ie||(ie=!0,window.CustomStateSet=ee,e&&(HTMLElement.prototype.attachInternals=function(){for(var t=arguments.length,a=new Array(t),r=0;r<t;r++)a[r]=arguments[r];var n=e.call(this,a);return n.states=new ee(this),n}))}function se(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];if(!ne){if(ne=!0,"undefined"!=typeof window&&(window.ElementInternals=re),"undefined"!=typeof CustomElementRegistry){var t=CustomElementRegistry.prototype.define;CustomElementRegistry.prototype.define=function(e,a,r){if(a.formAssociated){var n=a.prototype.connectedCallback;a.prototype.connectedCallback=function(){T.has(this)||(T.set(this,!0),this.hasAttribute("disabled")&&L(this,!0)),null!=n&&n.apply(this),Y(this)}}t.call(this,e,a,r)}}if("undefined"!=typeof HTMLElement&&(HTMLElement.prototype.attachInternals=function(){if(!this.tagName)return{};if(-1===this.tagName.indexOf("-"))throw new Error("Failed to execute 'attachInternals' on 'HTMLElement': Unable to attach ElementInternals to non-custom elements.");if(p.has(this))throw new DOMException("DOMException: Failed to execute 'attachInternals' on 'HTMLElement': ElementInternals for the specified element was already attached.");return new re(this)}),"undefined"!=typeof Element){function r(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var n=a.apply(this,t);if(A.set(this,n),B()){var i=new MutationObserver(_);window.ShadyDOM?i.observe(this,D):i.observe(n,D),y.set(this,i)}return n}var a=Element.prototype.attachShadow;Element.prototype.attachShadow=r}if(B()&&"undefined"!=typeof document)new MutationObserver(_).observe(document.documentElement,D);"undefined"!=typeof HTMLFormElement&&function(){var e=HTMLFormElement.prototype.checkValidity;HTMLFormElement.prototype.checkValidity=function(){for(var t=arguments.length,a=new Array(t),r=0;r<t;r++)a[r]=arguments[r];var n=e.apply(this,a);return K(this,n,"checkValidity")};var t=HTMLFormElement.prototype.reportValidity;HTMLFormElement.prototype.reportValidity=function(){for(var e=arguments.length,a=new Array(e),r=0;r<e;r++)a[r]=arguments[r];var n=t.apply(this,a);return K(this,n,"reportValidity")};var a=Object.getOwnPropertyDescriptor(HTMLFormElement.prototype,"elements").get;Object.defineProperty(HTMLFormElement.prototype,"elements",{get:function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var n=a.call.apply(a,[this].concat(t)),i=Array.from(g.get(this)||[]);if(0===i.length)return n;var o=Array.from(n).concat(i).sort((function(e,t){return e.compareDocumentPosition?2&e.compareDocumentPosition(t)?1:-1:0}));return new ae(o)}})}(),(e||"undefined"!=typeof window&&!window.CustomStateSet)&&oe()}}!!customElements.polyfillWrapFlushCallback||(!function(){if("undefined"==typeof window||!window.ElementInternals||!HTMLElement.prototype.attachInternals)return!1;var e=function(e){function t(){var e;return(0,d.Z)(this,t),(e=(0,n.Z)(this,t)).internals=e.attachInternals(),e}return(0,l.Z)(t,e),(0,u.Z)(t)}((0,c.Z)(HTMLElement)),t="element-internals-feature-detection-".concat(Math.random().toString(36).replace(/[^a-z]+/g,""));customElements.define(t,e);var a=new e;return["shadowRoot","form","willValidate","validity","validationMessage","labels","setFormValue","setValidity","checkValidity","reportValidity"].every((function(e){return e in a.internals}))}()?se(!1):"undefined"==typeof window||window.CustomStateSet||oe(HTMLElement.prototype.attachInternals)),e.forceCustomStateSetPolyfill=oe,e.forceElementInternalsPolyfill=se,Object.defineProperty(e,"__esModule",{value:!0})}({})}}]);
+//# sourceMappingURL=6023.1tzROGjBv74.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 6087.tf6VR6CerHc.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6087],{56087:function(t,e,n){n.d(e,{V8:function(){return se},lK:function(){return ee}});n(65974),n(94738),n(87438),n(46798),n(9849),n(22890),n(40720),n(36513),n(50289),n(94167),n(31750),n(98214),n(20254),n(51358),n(5239),n(98490),n(85717),n(56308),n(32797),n(17692),n(94570),n(22859),n(63789),n(99397),n(51467),n(18098),n(24074),n(27392),n(76843),n(41353),n(22481),n(91989),n(75802),n(37313),n(13526),n(11451),n(97393),n(47084),n(87463);function o(t,e){var n=Object.keys(t);if(Object.getOwnPropertySymbols){var o=Object.getOwnPropertySymbols(t);e&&(o=o.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),n.push.apply(n,o)}return n}function r(t){for(var e=1;e<arguments.length;e++){var n=null!=arguments[e]?arguments[e]:{};e%2?o(Object(n),!0).forEach((function(e){a(t,e,n[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(n)):o(Object(n)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(n,e))}))}return t}function i(t){return i="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},i(t)}function a(t,e,n){return e in t?Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}):t[e]=n,t}function l(){return l=Object.assign||function(t){for(var e=1;e<arguments.length;e++){var n=arguments[e];for(var o in n)Object.prototype.hasOwnProperty.call(n,o)&&(t[o]=n[o])}return t},l.apply(this,arguments)}function s(t,e){if(null==t)return{};var n,o,r=function(t,e){if(null==t)return{};var n,o,r={},i=Object.keys(t);for(o=0;o<i.length;o++)n=i[o],e.indexOf(n)>=0||(r[n]=t[n]);return r}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(o=0;o<i.length;o++)n=i[o],e.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(t,n)&&(r[n]=t[n])}return r}function c(t){if("undefined"!=typeof window&&window.navigator)return!!navigator.userAgent.match(t)}var u=c(/(?:Trident.*rv[ :]?11\.|msie|iemobile|Windows Phone)/i),d=c(/Edge/i),h=c(/firefox/i),f=c(/safari/i)&&!c(/chrome/i)&&!c(/android/i),p=c(/iP(ad|od|hone)/i),g=c(/chrome/i)&&c(/android/i),v={capture:!1,passive:!1};function m(t,e,n){t.addEventListener(e,n,!u&&v)}function b(t,e,n){t.removeEventListener(e,n,!u&&v)}function y(t,e){if(e){if(">"===e[0]&&(e=e.substring(1)),t)try{if(t.matches)return t.matches(e);if(t.msMatchesSelector)return t.msMatchesSelector(e);if(t.webkitMatchesSelector)return t.webkitMatchesSelector(e)}catch(n){return!1}return!1}}function w(t){return t.host&&t!==document&&t.host.nodeType?t.host:t.parentNode}function E(t,e,n,o){if(t){n=n||document;do{if(null!=e&&(">"===e[0]?t.parentNode===n&&y(t,e):y(t,e))||o&&t===n)return t;if(t===n)break}while(t=w(t))}return null}var D,S=/\s+/g;function _(t,e,n){if(t&&e)if(t.classList)t.classList[n?"add":"remove"](e);else{var o=(" "+t.className+" ").replace(S," ").replace(" "+e+" "," ");t.className=(o+(n?" "+e:"")).replace(S," ")}}function T(t,e,n){var o=t&&t.style;if(o){if(void 0===n)return document.defaultView&&document.defaultView.getComputedStyle?n=document.defaultView.getComputedStyle(t,""):t.currentStyle&&(n=t.currentStyle),void 0===e?n:n[e];e in o||-1!==e.indexOf("webkit")||(e="-webkit-"+e),o[e]=n+("string"==typeof n?"":"px")}}function C(t,e){var n="";if("string"==typeof t)n=t;else do{var o=T(t,"transform");o&&"none"!==o&&(n=o+" "+n)}while(!e&&(t=t.parentNode));var r=window.DOMMatrix||window.WebKitCSSMatrix||window.CSSMatrix||window.MSCSSMatrix;return r&&new r(n)}function O(t,e,n){if(t){var o=t.getElementsByTagName(e),r=0,i=o.length;if(n)for(;r<i;r++)n(o[r],r);return o}return[]}function x(){var t=document.scrollingElement;return t||document.documentElement}function M(t,e,n,o,r){if(t.getBoundingClientRect||t===window){var i,a,l,s,c,d,h;if(t!==window&&t.parentNode&&t!==x()?(a=(i=t.getBoundingClientRect()).top,l=i.left,s=i.bottom,c=i.right,d=i.height,h=i.width):(a=0,l=0,s=window.innerHeight,c=window.innerWidth,d=window.innerHeight,h=window.innerWidth),(e||n)&&t!==window&&(r=r||t.parentNode,!u))do{if(r&&r.getBoundingClientRect&&("none"!==T(r,"transform")||n&&"static"!==T(r,"position"))){var f=r.getBoundingClientRect();a-=f.top+parseInt(T(r,"border-top-width")),l-=f.left+parseInt(T(r,"border-left-width")),s=a+i.height,c=l+i.width;break}}while(r=r.parentNode);if(o&&t!==window){var p=C(r||t),g=p&&p.a,v=p&&p.d;p&&(s=(a/=v)+(d/=v),c=(l/=g)+(h/=g))}return{top:a,left:l,bottom:s,right:c,width:h,height:d}}}function N(t,e,n){for(var o=X(t,!0),r=M(t)[e];o;){var i=M(o)[n];if(!("top"===n||"left"===n?r>=i:r<=i))return o;if(o===x())break;o=X(o,!1)}return!1}function I(t,e,n,o){for(var r=0,i=0,a=t.children;i<a.length;){if("none"!==a[i].style.display&&a[i]!==jt.ghost&&(o||a[i]!==jt.dragged)&&E(a[i],n.draggable,t,!1)){if(r===e)return a[i];r++}i++}return null}function A(t,e){for(var n=t.lastElementChild;n&&(n===jt.ghost||"none"===T(n,"display")||e&&!y(n,e));)n=n.previousElementSibling;return n||null}function P(t,e){var n=0;if(!t||!t.parentNode)return-1;for(;t=t.previousElementSibling;)"TEMPLATE"===t.nodeName.toUpperCase()||t===jt.clone||e&&!y(t,e)||n++;return n}function k(t){var e=0,n=0,o=x();if(t)do{var r=C(t),i=r.a,a=r.d;e+=t.scrollLeft*i,n+=t.scrollTop*a}while(t!==o&&(t=t.parentNode));return[e,n]}function X(t,e){if(!t||!t.getBoundingClientRect)return x();var n=t,o=!1;do{if(n.clientWidth<n.scrollWidth||n.clientHeight<n.scrollHeight){var r=T(n);if(n.clientWidth<n.scrollWidth&&("auto"==r.overflowX||"scroll"==r.overflowX)||n.clientHeight<n.scrollHeight&&("auto"==r.overflowY||"scroll"==r.overflowY)){if(!n.getBoundingClientRect||n===document.body)return x();if(o||e)return n;o=!0}}}while(n=n.parentNode);return x()}function Y(t,e){return Math.round(t.top)===Math.round(e.top)&&Math.round(t.left)===Math.round(e.left)&&Math.round(t.height)===Math.round(e.height)&&Math.round(t.width)===Math.round(e.width)}function R(t,e){return function(){if(!D){var n=arguments;1===n.length?t.call(this,n[0]):t.apply(this,n),D=setTimeout((function(){D=void 0}),e)}}}function B(t,e,n){t.scrollLeft+=e,t.scrollTop+=n}function F(t){var e=window.Polymer,n=window.jQuery||window.Zepto;return e&&e.dom?e.dom(t).cloneNode(!0):n?n(t).clone(!0)[0]:t.cloneNode(!0)}function j(t,e,n){var o={};return Array.from(t.children).forEach((function(r){var i,a,l,s;if(E(r,e.draggable,t,!1)&&!r.animated&&r!==n){var c=M(r);o.left=Math.min(null!==(i=o.left)&&void 0!==i?i:1/0,c.left),o.top=Math.min(null!==(a=o.top)&&void 0!==a?a:1/0,c.top),o.right=Math.max(null!==(l=o.right)&&void 0!==l?l:-1/0,c.right),o.bottom=Math.max(null!==(s=o.bottom)&&void 0!==s?s:-1/0,c.bottom)}})),o.width=o.right-o.left,o.height=o.bottom-o.top,o.x=o.left,o.y=o.top,o}var H="Sortable"+(new Date).getTime();function L(){var t,e=[];return{captureAnimationState:function(){(e=[],this.options.animation)&&[].slice.call(this.el.children).forEach((function(t){if("none"!==T(t,"display")&&t!==jt.ghost){e.push({target:t,rect:M(t)});var n=r({},e[e.length-1].rect);if(t.thisAnimationDuration){var o=C(t,!0);o&&(n.top-=o.f,n.left-=o.e)}t.fromRect=n}}))},addAnimationState:function(t){e.push(t)},removeAnimationState:function(t){e.splice(function(t,e){for(var n in t)if(t.hasOwnProperty(n))for(var o in e)if(e.hasOwnProperty(o)&&e[o]===t[n][o])return Number(n);return-1}(e,{target:t}),1)},animateAll:function(n){var o=this;if(!this.options.animation)return clearTimeout(t),void("function"==typeof n&&n());var r=!1,i=0;e.forEach((function(t){var e=0,n=t.target,a=n.fromRect,l=M(n),s=n.prevFromRect,c=n.prevToRect,u=t.rect,d=C(n,!0);d&&(l.top-=d.f,l.left-=d.e),n.toRect=l,n.thisAnimationDuration&&Y(s,l)&&!Y(a,l)&&(u.top-l.top)/(u.left-l.left)==(a.top-l.top)/(a.left-l.left)&&(e=function(t,e,n,o){return Math.sqrt(Math.pow(e.top-t.top,2)+Math.pow(e.left-t.left,2))/Math.sqrt(Math.pow(e.top-n.top,2)+Math.pow(e.left-n.left,2))*o.animation}(u,s,c,o.options)),Y(l,a)||(n.prevFromRect=a,n.prevToRect=l,e||(e=o.options.animation),o.animate(n,u,l,e)),e&&(r=!0,i=Math.max(i,e),clearTimeout(n.animationResetTimer),n.animationResetTimer=setTimeout((function(){n.animationTime=0,n.prevFromRect=null,n.fromRect=null,n.prevToRect=null,n.thisAnimationDuration=null}),e),n.thisAnimationDuration=e)})),clearTimeout(t),r?t=setTimeout((function(){"function"==typeof n&&n()}),i):"function"==typeof n&&n(),e=[]},animate:function(t,e,n,o){if(o){T(t,"transition",""),T(t,"transform","");var r=C(this.el),i=r&&r.a,a=r&&r.d,l=(e.left-n.left)/(i||1),s=(e.top-n.top)/(a||1);t.animatingX=!!l,t.animatingY=!!s,T(t,"transform","translate3d("+l+"px,"+s+"px,0)"),this.forRepaintDummy=function(t){return t.offsetWidth}(t),T(t,"transition","transform "+o+"ms"+(this.options.easing?" "+this.options.easing:"")),T(t,"transform","translate3d(0,0,0)"),"number"==typeof t.animated&&clearTimeout(t.animated),t.animated=setTimeout((function(){T(t,"transition",""),T(t,"transform",""),t.animated=!1,t.animatingX=!1,t.animatingY=!1}),o)}}}}var W=[],z={initializeByDefault:!0},G={mount:function(t){for(var e in z)z.hasOwnProperty(e)&&!(e in t)&&(t[e]=z[e]);W.forEach((function(e){if(e.pluginName===t.pluginName)throw"Sortable: Cannot mount plugin ".concat(t.pluginName," more than once")})),W.push(t)},pluginEvent:function(t,e,n){var o=this;this.eventCanceled=!1,n.cancel=function(){o.eventCanceled=!0};var i=t+"Global";W.forEach((function(o){e[o.pluginName]&&(e[o.pluginName][i]&&e[o.pluginName][i](r({sortable:e},n)),e.options[o.pluginName]&&e[o.pluginName][t]&&e[o.pluginName][t](r({sortable:e},n)))}))},initializePlugins:function(t,e,n,o){for(var r in W.forEach((function(o){var r=o.pluginName;if(t.options[r]||o.initializeByDefault){var i=new o(t,e,t.options);i.sortable=t,i.options=t.options,t[r]=i,l(n,i.defaults)}})),t.options)if(t.options.hasOwnProperty(r)){var i=this.modifyOption(t,r,t.options[r]);void 0!==i&&(t.options[r]=i)}},getEventProperties:function(t,e){var n={};return W.forEach((function(o){"function"==typeof o.eventProperties&&l(n,o.eventProperties.call(e[o.pluginName],t))})),n},modifyOption:function(t,e,n){var o;return W.forEach((function(r){t[r.pluginName]&&r.optionListeners&&"function"==typeof r.optionListeners[e]&&(o=r.optionListeners[e].call(t[r.pluginName],n))})),o}};function U(t){var e=t.sortable,n=t.rootEl,o=t.name,i=t.targetEl,a=t.cloneEl,l=t.toEl,s=t.fromEl,c=t.oldIndex,h=t.newIndex,f=t.oldDraggableIndex,p=t.newDraggableIndex,g=t.originalEvent,v=t.putSortable,m=t.extraEventProperties;if(e=e||n&&n[H]){var b,y=e.options,w="on"+o.charAt(0).toUpperCase()+o.substr(1);!window.CustomEvent||u||d?(b=document.createEvent("Event")).initEvent(o,!0,!0):b=new CustomEvent(o,{bubbles:!0,cancelable:!0}),b.to=l||n,b.from=s||n,b.item=i||n,b.clone=a,b.oldIndex=c,b.newIndex=h,b.oldDraggableIndex=f,b.newDraggableIndex=p,b.originalEvent=g,b.pullMode=v?v.lastPutMode:void 0;var E=r(r({},m),G.getEventProperties(o,e));for(var D in E)b[D]=E[D];n&&n.dispatchEvent(b),y[w]&&y[w].call(e,b)}}var V=["evt"],q=function(t,e){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},o=n.evt,i=s(n,V);G.pluginEvent.bind(jt)(t,e,r({dragEl:K,parentEl:Q,ghostEl:$,rootEl:J,nextEl:tt,lastDownEl:et,cloneEl:nt,cloneHidden:ot,dragStarted:vt,putSortable:ct,activeSortable:jt.active,originalEvent:o,oldIndex:rt,oldDraggableIndex:at,newIndex:it,newDraggableIndex:lt,hideGhostForTarget:Yt,unhideGhostForTarget:Rt,cloneNowHidden:function(){ot=!0},cloneNowShown:function(){ot=!1},dispatchSortableEvent:function(t){Z({sortable:e,name:t,originalEvent:o})}},i))};function Z(t){U(r({putSortable:ct,cloneEl:nt,targetEl:K,rootEl:J,oldIndex:rt,oldDraggableIndex:at,newIndex:it,newDraggableIndex:lt},t))}var K,Q,$,J,tt,et,nt,ot,rt,it,at,lt,st,ct,ut,dt,ht,ft,pt,gt,vt,mt,bt,yt,wt,Et=!1,Dt=!1,St=[],_t=!1,Tt=!1,Ct=[],Ot=!1,xt=[],Mt="undefined"!=typeof document,Nt=p,It=d||u?"cssFloat":"float",At=Mt&&!g&&!p&&"draggable"in document.createElement("div"),Pt=function(){if(Mt){if(u)return!1;var t=document.createElement("x");return t.style.cssText="pointer-events:auto","auto"===t.style.pointerEvents}}(),kt=function(t,e){var n=T(t),o=parseInt(n.width)-parseInt(n.paddingLeft)-parseInt(n.paddingRight)-parseInt(n.borderLeftWidth)-parseInt(n.borderRightWidth),r=I(t,0,e),i=I(t,1,e),a=r&&T(r),l=i&&T(i),s=a&&parseInt(a.marginLeft)+parseInt(a.marginRight)+M(r).width,c=l&&parseInt(l.marginLeft)+parseInt(l.marginRight)+M(i).width;if("flex"===n.display)return"column"===n.flexDirection||"column-reverse"===n.flexDirection?"vertical":"horizontal";if("grid"===n.display)return n.gridTemplateColumns.split(" ").length<=1?"vertical":"horizontal";if(r&&a.float&&"none"!==a.float){var u="left"===a.float?"left":"right";return!i||"both"!==l.clear&&l.clear!==u?"horizontal":"vertical"}return r&&("block"===a.display||"flex"===a.display||"table"===a.display||"grid"===a.display||s>=o&&"none"===n[It]||i&&"none"===n[It]&&s+c>o)?"vertical":"horizontal"},Xt=function(t){function e(t,n){return function(o,r,i,a){var l=o.options.group.name&&r.options.group.name&&o.options.group.name===r.options.group.name;if(null==t&&(n||l))return!0;if(null==t||!1===t)return!1;if(n&&"clone"===t)return t;if("function"==typeof t)return e(t(o,r,i,a),n)(o,r,i,a);var s=(n?o:r).options.group.name;return!0===t||"string"==typeof t&&t===s||t.join&&t.indexOf(s)>-1}}var n={},o=t.group;o&&"object"==i(o)||(o={name:o}),n.name=o.name,n.checkPull=e(o.pull,!0),n.checkPut=e(o.put),n.revertClone=o.revertClone,t.group=n},Yt=function(){!Pt&&$&&T($,"display","none")},Rt=function(){!Pt&&$&&T($,"display","")};Mt&&!g&&document.addEventListener("click",(function(t){if(Dt)return t.preventDefault(),t.stopPropagation&&t.stopPropagation(),t.stopImmediatePropagation&&t.stopImmediatePropagation(),Dt=!1,!1}),!0);var Bt=function(t){if(K){t=t.touches?t.touches[0]:t;var e=(r=t.clientX,i=t.clientY,St.some((function(t){var e=t[H].options.emptyInsertThreshold;if(e&&!A(t)){var n=M(t),o=r>=n.left-e&&r<=n.right+e,l=i>=n.top-e&&i<=n.bottom+e;return o&&l?a=t:void 0}})),a);if(e){var n={};for(var o in t)t.hasOwnProperty(o)&&(n[o]=t[o]);n.target=n.rootEl=e,n.preventDefault=void 0,n.stopPropagation=void 0,e[H]._onDragOver(n)}}var r,i,a},Ft=function(t){K&&K.parentNode[H]._isOutsideThisEl(t.target)};function jt(t,e){if(!t||!t.nodeType||1!==t.nodeType)throw"Sortable: `el` must be an HTMLElement, not ".concat({}.toString.call(t));this.el=t,this.options=e=l({},e),t[H]=this;var n={group:null,sort:!0,disabled:!1,store:null,handle:null,draggable:/^[uo]l$/i.test(t.nodeName)?">li":">*",swapThreshold:1,invertSwap:!1,invertedSwapThreshold:null,removeCloneOnHide:!0,direction:function(){return kt(t,this.options)},ghostClass:"sortable-ghost",chosenClass:"sortable-chosen",dragClass:"sortable-drag",ignore:"a, img",filter:null,preventOnFilter:!0,animation:0,easing:null,setData:function(t,e){t.setData("Text",e.textContent)},dropBubble:!1,dragoverBubble:!1,dataIdAttr:"data-id",delay:0,delayOnTouchOnly:!1,touchStartThreshold:(Number.parseInt?Number:window).parseInt(window.devicePixelRatio,10)||1,forceFallback:!1,fallbackClass:"sortable-fallback",fallbackOnBody:!1,fallbackTolerance:0,fallbackOffset:{x:0,y:0},supportPointer:!1!==jt.supportPointer&&"PointerEvent"in window&&!f,emptyInsertThreshold:5};for(var o in G.initializePlugins(this,t,n),n)!(o in e)&&(e[o]=n[o]);for(var r in Xt(e),this)"_"===r.charAt(0)&&"function"==typeof this[r]&&(this[r]=this[r].bind(this));this.nativeDraggable=!e.forceFallback&&At,this.nativeDraggable&&(this.options.touchStartThreshold=1),e.supportPointer?m(t,"pointerdown",this._onTapStart):(m(t,"mousedown",this._onTapStart),m(t,"touchstart",this._onTapStart)),this.nativeDraggable&&(m(t,"dragover",this),m(t,"dragenter",this)),St.push(this.el),e.store&&e.store.get&&this.sort(e.store.get(this)||[]),l(this,L())}function Ht(t,e,n,o,r,i,a,l){var s,c,h=t[H],f=h.options.onMove;return!window.CustomEvent||u||d?(s=document.createEvent("Event")).initEvent("move",!0,!0):s=new CustomEvent("move",{bubbles:!0,cancelable:!0}),s.to=e,s.from=t,s.dragged=n,s.draggedRect=o,s.related=r||e,s.relatedRect=i||M(e),s.willInsertAfter=l,s.originalEvent=a,t.dispatchEvent(s),f&&(c=f.call(h,s,a)),c}function Lt(t){t.draggable=!1}function Wt(){Ot=!1}function zt(t){for(var e=t.tagName+t.className+t.src+t.href+t.textContent,n=e.length,o=0;n--;)o+=e.charCodeAt(n);return o.toString(36)}function Gt(t){return setTimeout(t,0)}function Ut(t){return clearTimeout(t)}jt.prototype={constructor:jt,_isOutsideThisEl:function(t){this.el.contains(t)||t===this.el||(mt=null)},_getDirection:function(t,e){return"function"==typeof this.options.direction?this.options.direction.call(this,t,e,K):this.options.direction},_onTapStart:function(t){if(t.cancelable){var e=this,n=this.el,o=this.options,r=o.preventOnFilter,i=t.type,a=t.touches&&t.touches[0]||t.pointerType&&"touch"===t.pointerType&&t,l=(a||t).target,s=t.target.shadowRoot&&(t.path&&t.path[0]||t.composedPath&&t.composedPath()[0])||l,c=o.filter;if(function(t){xt.length=0;var e=t.getElementsByTagName("input"),n=e.length;for(;n--;){var o=e[n];o.checked&&xt.push(o)}}(n),!K&&!(/mousedown|pointerdown/.test(i)&&0!==t.button||o.disabled)&&!s.isContentEditable&&(this.nativeDraggable||!f||!l||"SELECT"!==l.tagName.toUpperCase())&&!((l=E(l,o.draggable,n,!1))&&l.animated||et===l)){if(rt=P(l),at=P(l,o.draggable),"function"==typeof c){if(c.call(this,t,l,this))return Z({sortable:e,rootEl:s,name:"filter",targetEl:l,toEl:n,fromEl:n}),q("filter",e,{evt:t}),void(r&&t.cancelable&&t.preventDefault())}else if(c&&(c=c.split(",").some((function(o){if(o=E(s,o.trim(),n,!1))return Z({sortable:e,rootEl:o,name:"filter",targetEl:l,fromEl:n,toEl:n}),q("filter",e,{evt:t}),!0}))))return void(r&&t.cancelable&&t.preventDefault());o.handle&&!E(s,o.handle,n,!1)||this._prepareDragStart(t,a,l)}}},_prepareDragStart:function(t,e,n){var o,r=this,i=r.el,a=r.options,l=i.ownerDocument;if(n&&!K&&n.parentNode===i){var s=M(n);if(J=i,Q=(K=n).parentNode,tt=K.nextSibling,et=n,st=a.group,jt.dragged=K,ut={target:K,clientX:(e||t).clientX,clientY:(e||t).clientY},pt=ut.clientX-s.left,gt=ut.clientY-s.top,this._lastX=(e||t).clientX,this._lastY=(e||t).clientY,K.style["will-change"]="all",o=function(){q("delayEnded",r,{evt:t}),jt.eventCanceled?r._onDrop():(r._disableDelayedDragEvents(),!h&&r.nativeDraggable&&(K.draggable=!0),r._triggerDragStart(t,e),Z({sortable:r,name:"choose",originalEvent:t}),_(K,a.chosenClass,!0))},a.ignore.split(",").forEach((function(t){O(K,t.trim(),Lt)})),m(l,"dragover",Bt),m(l,"mousemove",Bt),m(l,"touchmove",Bt),m(l,"mouseup",r._onDrop),m(l,"touchend",r._onDrop),m(l,"touchcancel",r._onDrop),h&&this.nativeDraggable&&(this.options.touchStartThreshold=4,K.draggable=!0),q("delayStart",this,{evt:t}),!a.delay||a.delayOnTouchOnly&&!e||this.nativeDraggable&&(d||u))o();else{if(jt.eventCanceled)return void this._onDrop();m(l,"mouseup",r._disableDelayedDrag),m(l,"touchend",r._disableDelayedDrag),m(l,"touchcancel",r._disableDelayedDrag),m(l,"mousemove",r._delayedDragTouchMoveHandler),m(l,"touchmove",r._delayedDragTouchMoveHandler),a.supportPointer&&m(l,"pointermove",r._delayedDragTouchMoveHandler),r._dragStartTimer=setTimeout(o,a.delay)}}},_delayedDragTouchMoveHandler:function(t){var e=t.touches?t.touches[0]:t;Math.max(Math.abs(e.clientX-this._lastX),Math.abs(e.clientY-this._lastY))>=Math.floor(this.options.touchStartThreshold/(this.nativeDraggable&&window.devicePixelRatio||1))&&this._disableDelayedDrag()},_disableDelayedDrag:function(){K&&Lt(K),clearTimeout(this._dragStartTimer),this._disableDelayedDragEvents()},_disableDelayedDragEvents:function(){var t=this.el.ownerDocument;b(t,"mouseup",this._disableDelayedDrag),b(t,"touchend",this._disableDelayedDrag),b(t,"touchcancel",this._disableDelayedDrag),b(t,"mousemove",this._delayedDragTouchMoveHandler),b(t,"touchmove",this._delayedDragTouchMoveHandler),b(t,"pointermove",this._delayedDragTouchMoveHandler)},_triggerDragStart:function(t,e){e=e||"touch"==t.pointerType&&t,!this.nativeDraggable||e?this.options.supportPointer?m(document,"pointermove",this._onTouchMove):m(document,e?"touchmove":"mousemove",this._onTouchMove):(m(K,"dragend",this),m(J,"dragstart",this._onDragStart));try{document.selection?Gt((function(){document.selection.empty()})):window.getSelection().removeAllRanges()}catch(n){}},_dragStarted:function(t,e){if(Et=!1,J&&K){q("dragStarted",this,{evt:e}),this.nativeDraggable&&m(document,"dragover",Ft);var n=this.options;!t&&_(K,n.dragClass,!1),_(K,n.ghostClass,!0),jt.active=this,t&&this._appendGhost(),Z({sortable:this,name:"start",originalEvent:e})}else this._nulling()},_emulateDragOver:function(){if(dt){this._lastX=dt.clientX,this._lastY=dt.clientY,Yt();for(var t=document.elementFromPoint(dt.clientX,dt.clientY),e=t;t&&t.shadowRoot&&(t=t.shadowRoot.elementFromPoint(dt.clientX,dt.clientY))!==e;)e=t;if(K.parentNode[H]._isOutsideThisEl(t),e)do{if(e[H]){if(e[H]._onDragOver({clientX:dt.clientX,clientY:dt.clientY,target:t,rootEl:e})&&!this.options.dragoverBubble)break}t=e}while(e=e.parentNode);Rt()}},_onTouchMove:function(t){if(ut){var e=this.options,n=e.fallbackTolerance,o=e.fallbackOffset,r=t.touches?t.touches[0]:t,i=$&&C($,!0),a=$&&i&&i.a,l=$&&i&&i.d,s=Nt&&wt&&k(wt),c=(r.clientX-ut.clientX+o.x)/(a||1)+(s?s[0]-Ct[0]:0)/(a||1),u=(r.clientY-ut.clientY+o.y)/(l||1)+(s?s[1]-Ct[1]:0)/(l||1);if(!jt.active&&!Et){if(n&&Math.max(Math.abs(r.clientX-this._lastX),Math.abs(r.clientY-this._lastY))<n)return;this._onDragStart(t,!0)}if($){i?(i.e+=c-(ht||0),i.f+=u-(ft||0)):i={a:1,b:0,c:0,d:1,e:c,f:u};var d="matrix(".concat(i.a,",").concat(i.b,",").concat(i.c,",").concat(i.d,",").concat(i.e,",").concat(i.f,")");T($,"webkitTransform",d),T($,"mozTransform",d),T($,"msTransform",d),T($,"transform",d),ht=c,ft=u,dt=r}t.cancelable&&t.preventDefault()}},_appendGhost:function(){if(!$){var t=this.options.fallbackOnBody?document.body:J,e=M(K,!0,Nt,!0,t),n=this.options;if(Nt){for(wt=t;"static"===T(wt,"position")&&"none"===T(wt,"transform")&&wt!==document;)wt=wt.parentNode;wt!==document.body&&wt!==document.documentElement?(wt===document&&(wt=x()),e.top+=wt.scrollTop,e.left+=wt.scrollLeft):wt=x(),Ct=k(wt)}_($=K.cloneNode(!0),n.ghostClass,!1),_($,n.fallbackClass,!0),_($,n.dragClass,!0),T($,"transition",""),T($,"transform",""),T($,"box-sizing","border-box"),T($,"margin",0),T($,"top",e.top),T($,"left",e.left),T($,"width",e.width),T($,"height",e.height),T($,"opacity","0.8"),T($,"position",Nt?"absolute":"fixed"),T($,"zIndex","100000"),T($,"pointerEvents","none"),jt.ghost=$,t.appendChild($),T($,"transform-origin",pt/parseInt($.style.width)*100+"% "+gt/parseInt($.style.height)*100+"%")}},_onDragStart:function(t,e){var n=this,o=t.dataTransfer,r=n.options;q("dragStart",this,{evt:t}),jt.eventCanceled?this._onDrop():(q("setupClone",this),jt.eventCanceled||((nt=F(K)).removeAttribute("id"),nt.draggable=!1,nt.style["will-change"]="",this._hideClone(),_(nt,this.options.chosenClass,!1),jt.clone=nt),n.cloneId=Gt((function(){q("clone",n),jt.eventCanceled||(n.options.removeCloneOnHide||J.insertBefore(nt,K),n._hideClone(),Z({sortable:n,name:"clone"}))})),!e&&_(K,r.dragClass,!0),e?(Dt=!0,n._loopId=setInterval(n._emulateDragOver,50)):(b(document,"mouseup",n._onDrop),b(document,"touchend",n._onDrop),b(document,"touchcancel",n._onDrop),o&&(o.effectAllowed="move",r.setData&&r.setData.call(n,o,K)),m(document,"drop",n),T(K,"transform","translateZ(0)")),Et=!0,n._dragStartId=Gt(n._dragStarted.bind(n,e,t)),m(document,"selectstart",n),vt=!0,f&&T(document.body,"user-select","none"))},_onDragOver:function(t){var e,n,o,i,a=this.el,l=t.target,s=this.options,c=s.group,u=jt.active,d=st===c,h=s.sort,f=ct||u,p=this,g=!1;if(!Ot){if(void 0!==t.preventDefault&&t.cancelable&&t.preventDefault(),l=E(l,s.draggable,a,!0),F("dragOver"),jt.eventCanceled)return g;if(K.contains(t.target)||l.animated&&l.animatingX&&l.animatingY||p._ignoreWhileAnimating===l)return W(!1);if(Dt=!1,u&&!s.disabled&&(d?h||(o=Q!==J):ct===this||(this.lastPutMode=st.checkPull(this,u,K,t))&&c.checkPut(this,u,K,t))){if(i="vertical"===this._getDirection(t,l),e=M(K),F("dragOverValid"),jt.eventCanceled)return g;if(o)return Q=J,L(),this._hideClone(),F("revert"),jt.eventCanceled||(tt?J.insertBefore(K,tt):J.appendChild(K)),W(!0);var v=A(a,s.draggable);if(!v||function(t,e,n){var o=M(A(n.el,n.options.draggable)),r=j(n.el,n.options,$),i=10;return e?t.clientX>r.right+i||t.clientY>o.bottom&&t.clientX>o.left:t.clientY>r.bottom+i||t.clientX>o.right&&t.clientY>o.top}(t,i,this)&&!v.animated){if(v===K)return W(!1);if(v&&a===t.target&&(l=v),l&&(n=M(l)),!1!==Ht(J,a,K,e,l,n,t,!!l))return L(),v&&v.nextSibling?a.insertBefore(K,v.nextSibling):a.appendChild(K),Q=a,z(),W(!0)}else if(v&&function(t,e,n){var o=M(I(n.el,0,n.options,!0)),r=j(n.el,n.options,$),i=10;return e?t.clientX<r.left-i||t.clientY<o.top&&t.clientX<o.right:t.clientY<r.top-i||t.clientY<o.bottom&&t.clientX<o.left}(t,i,this)){var m=I(a,0,s,!0);if(m===K)return W(!1);if(n=M(l=m),!1!==Ht(J,a,K,e,l,n,t,!1))return L(),a.insertBefore(K,m),Q=a,z(),W(!0)}else if(l.parentNode===a){n=M(l);var b,y,w,D=K.parentNode!==a,S=!function(t,e,n){var o=n?t.left:t.top,r=n?t.right:t.bottom,i=n?t.width:t.height,a=n?e.left:e.top,l=n?e.right:e.bottom,s=n?e.width:e.height;return o===a||r===l||o+i/2===a+s/2}(K.animated&&K.toRect||e,l.animated&&l.toRect||n,i),C=i?"top":"left",O=N(l,"top","top")||N(K,"top","top"),x=O?O.scrollTop:void 0;if(mt!==l&&(y=n[C],_t=!1,Tt=!S&&s.invertSwap||D),b=function(t,e,n,o,r,i,a,l){var s=o?t.clientY:t.clientX,c=o?n.height:n.width,u=o?n.top:n.left,d=o?n.bottom:n.right,h=!1;if(!a)if(l&&yt<c*r){if(!_t&&(1===bt?s>u+c*i/2:s<d-c*i/2)&&(_t=!0),_t)h=!0;else if(1===bt?s<u+yt:s>d-yt)return-bt}else if(s>u+c*(1-r)/2&&s<d-c*(1-r)/2)return function(t){return P(K)<P(t)?1:-1}(e);if((h=h||a)&&(s<u+c*i/2||s>d-c*i/2))return s>u+c/2?1:-1;return 0}(t,l,n,i,S?1:s.swapThreshold,null==s.invertedSwapThreshold?s.swapThreshold:s.invertedSwapThreshold,Tt,mt===l),0!==b){var k=P(K);do{k-=b,w=Q.children[k]}while(w&&("none"===T(w,"display")||w===$))}if(0===b||w===l)return W(!1);mt=l,bt=b;var X=l.nextElementSibling,Y=!1,R=Ht(J,a,K,e,l,n,t,Y=1===b);if(!1!==R)return 1!==R&&-1!==R||(Y=1===R),Ot=!0,setTimeout(Wt,30),L(),Y&&!X?a.appendChild(K):l.parentNode.insertBefore(K,Y?X:l),O&&B(O,0,x-O.scrollTop),Q=K.parentNode,void 0===y||Tt||(yt=Math.abs(y-M(l)[C])),z(),W(!0)}if(a.contains(K))return W(!1)}return!1}function F(s,c){q(s,p,r({evt:t,isOwner:d,axis:i?"vertical":"horizontal",revert:o,dragRect:e,targetRect:n,canSort:h,fromSortable:f,target:l,completed:W,onMove:function(n,o){return Ht(J,a,K,e,n,M(n),t,o)},changed:z},c))}function L(){F("dragOverAnimationCapture"),p.captureAnimationState(),p!==f&&f.captureAnimationState()}function W(e){return F("dragOverCompleted",{insertion:e}),e&&(d?u._hideClone():u._showClone(p),p!==f&&(_(K,ct?ct.options.ghostClass:u.options.ghostClass,!1),_(K,s.ghostClass,!0)),ct!==p&&p!==jt.active?ct=p:p===jt.active&&ct&&(ct=null),f===p&&(p._ignoreWhileAnimating=l),p.animateAll((function(){F("dragOverAnimationComplete"),p._ignoreWhileAnimating=null})),p!==f&&(f.animateAll(),f._ignoreWhileAnimating=null)),(l===K&&!K.animated||l===a&&!l.animated)&&(mt=null),s.dragoverBubble||t.rootEl||l===document||(K.parentNode[H]._isOutsideThisEl(t.target),!e&&Bt(t)),!s.dragoverBubble&&t.stopPropagation&&t.stopPropagation(),g=!0}function z(){it=P(K),lt=P(K,s.draggable),Z({sortable:p,name:"change",toEl:a,newIndex:it,newDraggableIndex:lt,originalEvent:t})}},_ignoreWhileAnimating:null,_offMoveEvents:function(){b(document,"mousemove",this._onTouchMove),b(document,"touchmove",this._onTouchMove),b(document,"pointermove",this._onTouchMove),b(document,"dragover",Bt),b(document,"mousemove",Bt),b(document,"touchmove",Bt)},_offUpEvents:function(){var t=this.el.ownerDocument;b(t,"mouseup",this._onDrop),b(t,"touchend",this._onDrop),b(t,"pointerup",this._onDrop),b(t,"touchcancel",this._onDrop),b(document,"selectstart",this)},_onDrop:function(t){var e=this.el,n=this.options;it=P(K),lt=P(K,n.draggable),q("drop",this,{evt:t}),Q=K&&K.parentNode,it=P(K),lt=P(K,n.draggable),jt.eventCanceled||(Et=!1,Tt=!1,_t=!1,clearInterval(this._loopId),clearTimeout(this._dragStartTimer),Ut(this.cloneId),Ut(this._dragStartId),this.nativeDraggable&&(b(document,"drop",this),b(e,"dragstart",this._onDragStart)),this._offMoveEvents(),this._offUpEvents(),f&&T(document.body,"user-select",""),T(K,"transform",""),t&&(vt&&(t.cancelable&&t.preventDefault(),!n.dropBubble&&t.stopPropagation()),$&&$.parentNode&&$.parentNode.removeChild($),(J===Q||ct&&"clone"!==ct.lastPutMode)&&nt&&nt.parentNode&&nt.parentNode.removeChild(nt),K&&(this.nativeDraggable&&b(K,"dragend",this),Lt(K),K.style["will-change"]="",vt&&!Et&&_(K,ct?ct.options.ghostClass:this.options.ghostClass,!1),_(K,this.options.chosenClass,!1),Z({sortable:this,name:"unchoose",toEl:Q,newIndex:null,newDraggableIndex:null,originalEvent:t}),J!==Q?(it>=0&&(Z({rootEl:Q,name:"add",toEl:Q,fromEl:J,originalEvent:t}),Z({sortable:this,name:"remove",toEl:Q,originalEvent:t}),Z({rootEl:Q,name:"sort",toEl:Q,fromEl:J,originalEvent:t}),Z({sortable:this,name:"sort",toEl:Q,originalEvent:t})),ct&&ct.save()):it!==rt&&it>=0&&(Z({sortable:this,name:"update",toEl:Q,originalEvent:t}),Z({sortable:this,name:"sort",toEl:Q,originalEvent:t})),jt.active&&(null!=it&&-1!==it||(it=rt,lt=at),Z({sortable:this,name:"end",toEl:Q,originalEvent:t}),this.save())))),this._nulling()},_nulling:function(){q("nulling",this),J=K=Q=$=tt=nt=et=ot=ut=dt=vt=it=lt=rt=at=mt=bt=ct=st=jt.dragged=jt.ghost=jt.clone=jt.active=null,xt.forEach((function(t){t.checked=!0})),xt.length=ht=ft=0},handleEvent:function(t){switch(t.type){case"drop":case"dragend":this._onDrop(t);break;case"dragenter":case"dragover":K&&(this._onDragOver(t),function(t){t.dataTransfer&&(t.dataTransfer.dropEffect="move");t.cancelable&&t.preventDefault()}(t));break;case"selectstart":t.preventDefault()}},toArray:function(){for(var t,e=[],n=this.el.children,o=0,r=n.length,i=this.options;o<r;o++)E(t=n[o],i.draggable,this.el,!1)&&e.push(t.getAttribute(i.dataIdAttr)||zt(t));return e},sort:function(t,e){var n={},o=this.el;this.toArray().forEach((function(t,e){var r=o.children[e];E(r,this.options.draggable,o,!1)&&(n[t]=r)}),this),e&&this.captureAnimationState(),t.forEach((function(t){n[t]&&(o.removeChild(n[t]),o.appendChild(n[t]))})),e&&this.animateAll()},save:function(){var t=this.options.store;t&&t.set&&t.set(this)},closest:function(t,e){return E(t,e||this.options.draggable,this.el,!1)},option:function(t,e){var n=this.options;if(void 0===e)return n[t];var o=G.modifyOption(this,t,e);n[t]=void 0!==o?o:e,"group"===t&&Xt(n)},destroy:function(){q("destroy",this);var t=this.el;t[H]=null,b(t,"mousedown",this._onTapStart),b(t,"touchstart",this._onTapStart),b(t,"pointerdown",this._onTapStart),this.nativeDraggable&&(b(t,"dragover",this),b(t,"dragenter",this)),Array.prototype.forEach.call(t.querySelectorAll("[draggable]"),(function(t){t.removeAttribute("draggable")})),this._onDrop(),this._disableDelayedDragEvents(),St.splice(St.indexOf(this.el),1),this.el=t=null},_hideClone:function(){if(!ot){if(q("hideClone",this),jt.eventCanceled)return;T(nt,"display","none"),this.options.removeCloneOnHide&&nt.parentNode&&nt.parentNode.removeChild(nt),ot=!0}},_showClone:function(t){if("clone"===t.lastPutMode){if(ot){if(q("showClone",this),jt.eventCanceled)return;K.parentNode!=J||this.options.group.revertClone?tt?J.insertBefore(nt,tt):J.appendChild(nt):J.insertBefore(nt,K),this.options.group.revertClone&&this.animate(K,nt),T(nt,"display",""),ot=!1}}else this._hideClone()}},Mt&&m(document,"touchmove",(function(t){(jt.active||Et)&&t.cancelable&&t.preventDefault()})),jt.utils={on:m,off:b,css:T,find:O,is:function(t,e){return!!E(t,e,t,!1)},extend:function(t,e){if(t&&e)for(var n in e)e.hasOwnProperty(n)&&(t[n]=e[n]);return t},throttle:R,closest:E,toggleClass:_,clone:F,index:P,nextTick:Gt,cancelNextTick:Ut,detectDirection:kt,getChild:I},jt.get=function(t){return t[H]},jt.mount=function(){for(var t=arguments.length,e=new Array(t),n=0;n<t;n++)e[n]=arguments[n];e[0].constructor===Array&&(e=e[0]),e.forEach((function(t){if(!t.prototype||!t.prototype.constructor)throw"Sortable: Mounted plugin must be a constructor function, not ".concat({}.toString.call(t));t.utils&&(jt.utils=r(r({},jt.utils),t.utils)),G.mount(t)}))},jt.create=function(t,e){return new jt(t,e)},jt.version="1.15.2";var Vt,qt,Zt,Kt,Qt,$t,Jt=[],te=!1;function ee(){function t(){for(var t in this.defaults={scroll:!0,forceAutoScrollFallback:!1,scrollSensitivity:30,scrollSpeed:10,bubbleScroll:!0},this)"_"===t.charAt(0)&&"function"==typeof this[t]&&(this[t]=this[t].bind(this))}return t.prototype={dragStarted:function(t){var e=t.originalEvent;this.sortable.nativeDraggable?m(document,"dragover",this._handleAutoScroll):this.options.supportPointer?m(document,"pointermove",this._handleFallbackAutoScroll):e.touches?m(document,"touchmove",this._handleFallbackAutoScroll):m(document,"mousemove",this._handleFallbackAutoScroll)},dragOverCompleted:function(t){var e=t.originalEvent;this.options.dragOverBubble||e.rootEl||this._handleAutoScroll(e)},drop:function(){this.sortable.nativeDraggable?b(document,"dragover",this._handleAutoScroll):(b(document,"pointermove",this._handleFallbackAutoScroll),b(document,"touchmove",this._handleFallbackAutoScroll),b(document,"mousemove",this._handleFallbackAutoScroll)),oe(),ne(),clearTimeout(D),D=void 0},nulling:function(){Qt=qt=Vt=te=$t=Zt=Kt=null,Jt.length=0},_handleFallbackAutoScroll:function(t){this._handleAutoScroll(t,!0)},_handleAutoScroll:function(t,e){var n=this,o=(t.touches?t.touches[0]:t).clientX,r=(t.touches?t.touches[0]:t).clientY,i=document.elementFromPoint(o,r);if(Qt=t,e||this.options.forceAutoScrollFallback||d||u||f){re(t,this.options,i,e);var a=X(i,!0);!te||$t&&o===Zt&&r===Kt||($t&&oe(),$t=setInterval((function(){var i=X(document.elementFromPoint(o,r),!0);i!==a&&(a=i,ne()),re(t,n.options,i,e)}),10),Zt=o,Kt=r)}else{if(!this.options.bubbleScroll||X(i,!0)===x())return void ne();re(t,this.options,X(i,!1),!1)}}},l(t,{pluginName:"scroll",initializeByDefault:!0})}function ne(){Jt.forEach((function(t){clearInterval(t.pid)})),Jt=[]}function oe(){clearInterval($t)}var re=R((function(t,e,n,o){if(e.scroll){var r,i=(t.touches?t.touches[0]:t).clientX,a=(t.touches?t.touches[0]:t).clientY,l=e.scrollSensitivity,s=e.scrollSpeed,c=x(),u=!1;qt!==n&&(qt=n,ne(),Vt=e.scroll,r=e.scrollFn,!0===Vt&&(Vt=X(n,!0)));var d=0,h=Vt;do{var f=h,p=M(f),g=p.top,v=p.bottom,m=p.left,b=p.right,y=p.width,w=p.height,E=void 0,D=void 0,S=f.scrollWidth,_=f.scrollHeight,C=T(f),O=f.scrollLeft,N=f.scrollTop;f===c?(E=y<S&&("auto"===C.overflowX||"scroll"===C.overflowX||"visible"===C.overflowX),D=w<_&&("auto"===C.overflowY||"scroll"===C.overflowY||"visible"===C.overflowY)):(E=y<S&&("auto"===C.overflowX||"scroll"===C.overflowX),D=w<_&&("auto"===C.overflowY||"scroll"===C.overflowY));var I=E&&(Math.abs(b-i)<=l&&O+y<S)-(Math.abs(m-i)<=l&&!!O),A=D&&(Math.abs(v-a)<=l&&N+w<_)-(Math.abs(g-a)<=l&&!!N);if(!Jt[d])for(var P=0;P<=d;P++)Jt[P]||(Jt[P]={});Jt[d].vx==I&&Jt[d].vy==A&&Jt[d].el===f||(Jt[d].el=f,Jt[d].vx=I,Jt[d].vy=A,clearInterval(Jt[d].pid),0==I&&0==A||(u=!0,Jt[d].pid=setInterval(function(){o&&0===this.layer&&jt.active._onTouchMove(Qt);var e=Jt[this.layer].vy?Jt[this.layer].vy*s:0,n=Jt[this.layer].vx?Jt[this.layer].vx*s:0;"function"==typeof r&&"continue"!==r.call(jt.dragged.parentNode[H],n,e,t,Qt,Jt[this.layer].el)||B(Jt[this.layer].el,n,e)}.bind({layer:d}),24))),d++}while(e.bubbleScroll&&h!==c&&(h=X(h,!1)));te=u}}),30),ie=function(t){var e=t.originalEvent,n=t.putSortable,o=t.dragEl,r=t.activeSortable,i=t.dispatchSortableEvent,a=t.hideGhostForTarget,l=t.unhideGhostForTarget;if(e){var s=n||r;a();var c=e.changedTouches&&e.changedTouches.length?e.changedTouches[0]:e,u=document.elementFromPoint(c.clientX,c.clientY);l(),s&&!s.el.contains(u)&&(i("spill"),this.onSpill({dragEl:o,putSortable:n}))}};function ae(){}function le(){}ae.prototype={startIndex:null,dragStart:function(t){var e=t.oldDraggableIndex;this.startIndex=e},onSpill:function(t){var e=t.dragEl,n=t.putSortable;this.sortable.captureAnimationState(),n&&n.captureAnimationState();var o=I(this.sortable.el,this.startIndex,this.options);o?this.sortable.el.insertBefore(e,o):this.sortable.el.appendChild(e),this.sortable.animateAll(),n&&n.animateAll()},drop:ie},l(ae,{pluginName:"revertOnSpill"}),le.prototype={onSpill:function(t){var e=t.dragEl,n=t.putSortable||this.sortable;n.captureAnimationState(),e.parentNode&&e.parentNode.removeChild(e),n.animateAll()},drop:ie},l(le,{pluginName:"removeOnSpill"});var se=[le,ae];e.ZP=jt},75802:function(t,e,n){var o=n(68077),r=n(79058);o({target:"Number",stat:!0,forced:Number.parseInt!==r},{parseInt:r})},31750:function(t,e,n){var o=n(68077),r=n(58849),i=n(20202),a=n(17460),l=n(25245),s=n(53396);o({target:"Object",stat:!0,sham:!r},{getOwnPropertyDescriptors:function(t){for(var e,n,o=a(t),r=l.f,c=i(o),u={},d=0;c.length>d;)void 0!==(n=r(o,e=c[d++]))&&s(u,e,n);return u}})},87463:function(t,e,n){var o=n(68077),r=n(22933),i=n(72208),a=n(73177),l=[].push;o({target:"Iterator",proto:!0,real:!0},{toArray:function(){var t=[];return i(a(r(this)),l,{that:t,IS_RECORD:!0}),t}})}}]);
+//# sourceMappingURL=6087.tf6VR6CerHc.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6196],{58135:function(e,t,i){i.d(t,{z:function(){return a}});i(40271),i(60163);var a=function(e){return function(t,i){return e.includes(t,i)}}},56196:function(e,t,i){i.r(t),i.d(t,{HaSelectorState:function(){return g}});var a,o,n=i(88962),r=i(33368),s=i(71650),u=i(68308),d=i(82390),l=i(69205),c=i(91808),h=(i(97393),i(5095)),p=i(95260),v=i(49389),f=i(46097),b=(i(46349),i(70320),i(18394)),_=(i(36513),i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(3850)),y=i(21157),m={alarm_control_panel:["armed_away","armed_custom_bypass","armed_home","armed_night","armed_vacation","arming","disarmed","disarming","pending","triggered"],automation:["on","off"],binary_sensor:["on","off"],button:[],calendar:["on","off"],camera:["idle","recording","streaming"],cover:["closed","closing","open","opening"],device_tracker:["home","not_home"],fan:["on","off"],humidifier:["on","off"],input_boolean:["on","off"],input_button:[],lawn_mower:["error","paused","mowing","docked"],light:["on","off"],lock:["jammed","locked","locking","unlocked","unlocking"],media_player:["off","on","idle","playing","paused","standby","buffering"],person:["home","not_home"],plant:["ok","problem"],remote:["on","off"],scene:[],schedule:["on","off"],script:["on","off"],siren:["on","off"],sun:["above_horizon","below_horizon"],switch:["on","off"],timer:["active","idle","paused"],update:["on","off"],vacuum:["cleaning","docked","error","idle","paused","returning"],valve:["closed","closing","open","opening"],weather:["clear-night","cloudy","exceptional","fog","hail","lightning-rainy","lightning","partlycloudy","pouring","rainy","snowy-rainy","snowy","sunny","windy-variant","windy"]},k={alarm_control_panel:{code_format:["number","text"]},binary_sensor:{device_class:["battery","battery_charging","co","cold","connectivity","door","garage_door","gas","heat","light","lock","moisture","motion","moving","occupancy","opening","plug","power","presence","problem","running","safety","smoke","sound","tamper","update","vibration","window"]},button:{device_class:["restart","update"]},camera:{frontend_stream_type:["hls","web_rtc"]},climate:{hvac_action:["off","idle","preheating","heating","cooling","drying","fan"]},cover:{device_class:["awning","blind","curtain","damper","door","garage","gate","shade","shutter","window"]},device_tracker:{source_type:["bluetooth","bluetooth_le","gps","router"]},fan:{direction:["forward","reverse"]},humidifier:{device_class:["humidifier","dehumidifier"],action:["off","idle","humidifying","drying"]},media_player:{device_class:["tv","speaker","receiver"],media_content_type:["album","app","artist","channel","channels","composer","contibuting_artist","episode","game","genre","image","movie","music","playlist","podcast","season","track","tvshow","url","video"],repeat:["off","one","all"]},number:{device_class:["temperature"]},sensor:{device_class:["apparent_power","aqi","battery","carbon_dioxide","carbon_monoxide","current","date","duration","energy","frequency","gas","humidity","illuminance","monetary","nitrogen_dioxide","nitrogen_monoxide","nitrous_oxide","ozone","ph","pm1","pm10","pm25","power_factor","power","pressure","reactive_power","signal_strength","sulphur_dioxide","temperature","timestamp","volatile_organic_compounds","volatile_organic_compounds_parts","voltage"],state_class:["measurement","total","total_increasing"]},switch:{device_class:["outlet","switch"]},update:{device_class:["firmware"]},water_heater:{away_mode:["on","off"]}},g=(i(16591),(0,c.Z)([(0,p.Mo)("ha-entity-state-picker")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var a=arguments.length,o=new Array(a),n=0;n<a;n++)o[n]=arguments[n];return t=(0,u.Z)(this,i,[].concat(o)),e((0,d.Z)(t)),t}return(0,l.Z)(i,t),(0,r.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"entityId",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"attribute",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"extraOptions",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"autofocus",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,attribute:"allow-custom-value"})],key:"allowCustomValue",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.SB)()],key:"_opened",value:function(){return!1}},{kind:"field",decorators:[(0,p.IO)("ha-combo-box",!0)],key:"_comboBox",value:void 0},{kind:"method",key:"shouldUpdate",value:function(e){return!(!e.has("_opened")&&this._opened)}},{kind:"method",key:"updated",value:function(e){var t=this;if(e.has("_opened")&&this._opened||e.has("entityId")||e.has("attribute")||e.has("extraOptions")){var i,a=this.entityId?this.hass.states[this.entityId]:void 0;this._comboBox.items=[].concat((0,f.Z)(null!==(i=this.extraOptions)&&void 0!==i?i:[]),(0,f.Z)(this.entityId&&a?function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:void 0,i=(0,_.N)(e),a=[];switch(!t&&i in m?a.push.apply(a,(0,f.Z)(m[i])):t&&i in k&&t in k[i]&&a.push.apply(a,(0,f.Z)(k[i][t])),i){case"climate":t?"fan_mode"===t?a.push.apply(a,(0,f.Z)(e.attributes.fan_modes)):"preset_mode"===t?a.push.apply(a,(0,f.Z)(e.attributes.preset_modes)):"swing_mode"===t&&a.push.apply(a,(0,f.Z)(e.attributes.swing_modes)):a.push.apply(a,(0,f.Z)(e.attributes.hvac_modes));break;case"device_tracker":case"person":t||a.push("home","not_home");break;case"event":"event_type"===t&&a.push.apply(a,(0,f.Z)(e.attributes.event_types));break;case"fan":"preset_mode"===t&&a.push.apply(a,(0,f.Z)(e.attributes.preset_modes));break;case"humidifier":"mode"===t&&a.push.apply(a,(0,f.Z)(e.attributes.available_modes));break;case"input_select":case"select":t||a.push.apply(a,(0,f.Z)(e.attributes.options));break;case"light":"effect"===t&&e.attributes.effect_list?a.push.apply(a,(0,f.Z)(e.attributes.effect_list)):"color_mode"===t&&e.attributes.supported_color_modes&&a.push.apply(a,(0,f.Z)(e.attributes.supported_color_modes));break;case"media_player":"sound_mode"===t?a.push.apply(a,(0,f.Z)(e.attributes.sound_mode_list)):"source"===t&&a.push.apply(a,(0,f.Z)(e.attributes.source_list));break;case"remote":"current_activity"===t&&a.push.apply(a,(0,f.Z)(e.attributes.activity_list));break;case"sensor":t||"enum"!==e.attributes.device_class||a.push.apply(a,(0,f.Z)(e.attributes.options));break;case"vacuum":"fan_speed"===t&&a.push.apply(a,(0,f.Z)(e.attributes.fan_speed_list));break;case"water_heater":t&&"operation_mode"!==t||a.push.apply(a,(0,f.Z)(e.attributes.operation_list))}return t||a.push.apply(a,(0,f.Z)(y.V_)),(0,f.Z)(new Set(a))}(a,this.attribute).map((function(e){return{value:e,label:t.attribute?t.hass.formatEntityAttributeValue(a,t.attribute,e):t.hass.formatEntityState(a,e)}})):[]))}}},{kind:"method",key:"render",value:function(){var e;return this.hass?(0,h.dy)(a||(a=(0,n.Z)([' <ha-combo-box .hass="','" .value="','" .autofocus="','" .label="','" .disabled="','" .required="','" .helper="','" .allowCustomValue="','" item-value-path="value" item-label-path="label" @opened-changed="','" @value-changed="','"> </ha-combo-box> '])),this.hass,this._value,this.autofocus,null!==(e=this.label)&&void 0!==e?e:this.hass.localize("ui.components.entity.entity-state-picker.state"),this.disabled||!this.entityId,this.required,this.helper,this.allowCustomValue,this._openedChanged,this._valueChanged):h.Ld}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();var t=e.detail.value;t!==this._value&&this._setValue(t)}},{kind:"method",key:"_setValue",value:function(e){var t=this;this.value=e,setTimeout((function(){(0,b.B)(t,"value-changed",{value:e}),(0,b.B)(t,"change")}),0)}}]}}),h.oi),(0,c.Z)([(0,p.Mo)("ha-selector-state")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var a=arguments.length,o=new Array(a),n=0;n<a;n++)o[n]=arguments[n];return t=(0,u.Z)(this,i,[].concat(o)),e((0,d.Z)(t)),t}return(0,l.Z)(i,t),(0,r.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,p.Cb)()],key:"context",value:void 0},{kind:"method",key:"render",value:function(){var e,t,i,a,r;return(0,h.dy)(o||(o=(0,n.Z)([' <ha-entity-state-picker .hass="','" .entityId="','" .attribute="','" .extraOptions="','" .value="','" .label="','" .helper="','" .disabled="','" .required="','" allow-custom-value></ha-entity-state-picker> '])),this.hass,(null===(e=this.selector.state)||void 0===e?void 0:e.entity_id)||(null===(t=this.context)||void 0===t?void 0:t.filter_entity),(null===(i=this.selector.state)||void 0===i?void 0:i.attribute)||(null===(a=this.context)||void 0===a?void 0:a.filter_attribute),null===(r=this.selector.state)||void 0===r?void 0:r.extra_options,this.value,this.label,this.helper,this.disabled,this.required)}}]}}),(0,v.f)(h.oi)))},21157:function(e,t,i){i.d(t,{PX:function(){return r},V_:function(){return s},nZ:function(){return o},rk:function(){return d}});var a=i(58135),o="unavailable",n="unknown",r="off",s=[o,n],u=[o,n,r],d=(0,a.z)(s);(0,a.z)(u)},49389:function(e,t,i){i.d(t,{f:function(){return p}});var a=i(40039),o=i(33368),n=i(71650),r=i(68308),s=i(82390),u=i(69205),d=i(91808),l=i(34541),c=i(47838),h=(i(97393),i(46798),i(47084),i(51358),i(98490),i(40271),i(60163),i(9849),i(13526),i(95260)),p=function(e){var t=(0,d.Z)(null,(function(e,t){var i=function(t){function i(){var t;(0,n.Z)(this,i);for(var a=arguments.length,o=new Array(a),u=0;u<a;u++)o[u]=arguments[u];return t=(0,r.Z)(this,i,[].concat(o)),e((0,s.Z)(t)),t}return(0,u.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",key:"hassSubscribeRequiredHostProps",value:void 0},{kind:"field",key:"__unsubs",value:void 0},{kind:"method",key:"connectedCallback",value:function(){(0,l.Z)((0,c.Z)(i.prototype),"connectedCallback",this).call(this),this.__checkSubscribed()}},{kind:"method",key:"disconnectedCallback",value:function(){if((0,l.Z)((0,c.Z)(i.prototype),"disconnectedCallback",this).call(this),this.__unsubs){for(;this.__unsubs.length;){var e=this.__unsubs.pop();e instanceof Promise?e.then((function(e){return e()})):e()}this.__unsubs=void 0}}},{kind:"method",key:"updated",value:function(e){if((0,l.Z)((0,c.Z)(i.prototype),"updated",this).call(this,e),e.has("hass"))this.__checkSubscribed();else if(this.hassSubscribeRequiredHostProps){var t,o=(0,a.Z)(e.keys());try{for(o.s();!(t=o.n()).done;){var n=t.value;if(this.hassSubscribeRequiredHostProps.includes(n))return void this.__checkSubscribed()}}catch(r){o.e(r)}finally{o.f()}}}},{kind:"method",key:"hassSubscribe",value:function(){return[]}},{kind:"method",key:"__checkSubscribed",value:function(){var e,t=this;void 0!==this.__unsubs||!this.isConnected||void 0===this.hass||null!==(e=this.hassSubscribeRequiredHostProps)&&void 0!==e&&e.some((function(e){return void 0===t[e]}))||(this.__unsubs=this.hassSubscribe())}}]}}),e);return t}}}]);
+//# sourceMappingURL=6196.JDlJRN5_Aq0.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6251],{62871:function(e,t,i){i.d(t,{K:function(){return r}});var r=function(e){switch(e.language){case"cz":case"de":case"fi":case"fr":case"sk":case"sv":return" ";default:return""}}},92295:function(e,t,i){var r,a=i(88962),n=i(33368),o=i(71650),l=i(68308),s=i(82390),d=i(69205),c=i(91808),u=(i(97393),i(14271)),h=i(5095),v=i(95260),f=i(3712);(0,c.Z)([(0,v.Mo)("ha-button")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var r=arguments.length,a=new Array(r),n=0;n<r;n++)a[n]=arguments[n];return t=(0,l.Z)(this,i,[].concat(a)),e((0,s.Z)(t)),t}return(0,d.Z)(i,t),(0,n.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[f.W,(0,h.iv)(r||(r=(0,a.Z)(["::slotted([slot=icon]){margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction);display:block}.mdc-button{height:var(--button-height,36px)}.trailing-icon{display:flex}.slot-container{overflow:var(--button-slot-container-overflow,visible)}"])))]}}]}}),u.z)},90272:function(e,t,i){i.r(t),i.d(t,{HaFileSelector:function(){return P}});var r,a,n,o,l,s,d,c,u,h=i(99312),v=i(81043),f=i(88962),p=i(33368),g=i(71650),k=i(68308),b=i(82390),y=i(69205),m=i(91808),_=i(34541),x=i(47838),Z=(i(97393),i(22859),i(5095)),w=i(95260),B=i(18394),F=(i(51467),function(){var e=(0,v.Z)((0,h.Z)().mark((function e(t,i){var r,a,n;return(0,h.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return(r=new FormData).append("file",i),e.next=4,t.fetchWithAuth("/api/file_upload",{method:"POST",body:r});case 4:if(413!==(a=e.sent).status){e.next=9;break}throw new Error("Uploaded file is too large (".concat(i.name,")"));case 9:if(200===a.status){e.next=11;break}throw new Error("Unknown error");case 11:return e.next=13,a.json();case 13:return n=e.sent,e.abrupt("return",n.file_id);case 15:case"end":return e.stop()}}),e)})));return function(t,i){return e.apply(this,arguments)}}()),C=function(){var e=(0,v.Z)((0,h.Z)().mark((function e(t,i){return(0,h.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.abrupt("return",t.callApi("DELETE","file_upload",{file_id:i}));case 1:case"end":return e.stop()}}),e)})));return function(t,i){return e.apply(this,arguments)}}(),D=i(11285),z=(i(76843),i(46798),i(94570),i(46349),i(70320),i(32797),i(5239),i(82692),i(53180)),M=(i(92295),i(54371),i(62871)),H=i(4771),A=(i(67712),i(5110),"M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z"),V="M14,2H6A2,2 0 0,0 4,4V20A2,2 0 0,0 6,22H18A2,2 0 0,0 20,20V8L14,2M13.5,16V19H10.5V16H8L12,12L16,16H13.5M13,9V3.5L18.5,9H13Z",P=((0,m.Z)([(0,w.Mo)("ha-file-upload")],(function(e,t){var i=function(t){function i(){var t;(0,g.Z)(this,i);for(var r=arguments.length,a=new Array(r),n=0;n<r;n++)a[n]=arguments[n];return t=(0,k.Z)(this,i,[].concat(a)),e((0,b.Z)(t)),t}return(0,y.Z)(i,t),(0,p.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"accept",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"icon",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"secondary",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"supports",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"multiple",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"uploading",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)({type:Number})],key:"progress",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean,attribute:"auto-open-file-dialog"})],key:"autoOpenFileDialog",value:function(){return!1}},{kind:"field",decorators:[(0,w.SB)()],key:"_drag",value:function(){return!1}},{kind:"field",decorators:[(0,w.IO)("#input")],key:"_input",value:void 0},{kind:"method",key:"firstUpdated",value:function(e){(0,_.Z)((0,x.Z)(i.prototype),"firstUpdated",this).call(this,e),this.autoOpenFileDialog&&this._openFilePicker()}},{kind:"method",key:"render",value:function(){var e,t,i,c,u,h=this;return(0,Z.dy)(r||(r=(0,f.Z)([" "," "])),this.uploading?(0,Z.dy)(a||(a=(0,f.Z)(['<div class="container"> <div class="row"> <span class="header">',"</span> ",' </div> <mwc-linear-progress .indeterminate="','" .progress="','"></mwc-linear-progress> </div>'])),this.value?null===(e=this.hass)||void 0===e?void 0:e.localize("ui.components.file-upload.uploading_name",{name:this.value.toString()}):null===(t=this.hass)||void 0===t?void 0:t.localize("ui.components.file-upload.uploading"),this.progress?(0,Z.dy)(n||(n=(0,f.Z)(['<span class="progress">',"","%</span>"])),this.progress,(0,M.K)(this.hass.locale)):"",!this.progress,this.progress?this.progress/100:void 0):(0,Z.dy)(o||(o=(0,f.Z)(['<label for="','" class="container ','" @drop="','" @dragenter="','" @dragover="','" @dragleave="','" @dragend="','">',' <input id="input" type="file" class="file" .accept="','" .multiple="','" @change="','"></label>'])),this.value?"":"input",(0,z.$)({dragged:this._drag,multiple:this.multiple,value:Boolean(this.value)}),this._handleDrop,this._handleDragStart,this._handleDragStart,this._handleDragEnd,this._handleDragEnd,this.value?"string"==typeof this.value?(0,Z.dy)(s||(s=(0,f.Z)(['<div class="row"> <div class="value" @click="','"> <ha-svg-icon .path="','"></ha-svg-icon> ',' </div> <ha-icon-button @click="','" .label="','" .path="','"></ha-icon-button> </div>'])),this._openFilePicker,this.icon||V,this.value,this._clearValue,(null===(u=this.hass)||void 0===u?void 0:u.localize("ui.common.delete"))||"Delete",A):(this.value instanceof FileList?Array.from(this.value):(0,H.r)(this.value)).map((function(e){var t;return(0,Z.dy)(d||(d=(0,f.Z)(['<div class="row"> <div class="value" @click="','"> <ha-svg-icon .path="','"></ha-svg-icon> '," - ",' </div> <ha-icon-button @click="','" .label="','" .path="','"></ha-icon-button> </div>'])),h._openFilePicker,h.icon||V,e.name,function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:2;if(0===e)return"0 Bytes";t=t<0?0:t;var i=Math.floor(Math.log(e)/Math.log(1024));return"".concat(parseFloat((e/Math.pow(1024,i)).toFixed(t))," ").concat(["Bytes","KB","MB","GB","TB","PB","EB","ZB","YB"][i])}(e.size),h._clearValue,(null===(t=h.hass)||void 0===t?void 0:t.localize("ui.common.delete"))||"Delete",A)})):(0,Z.dy)(l||(l=(0,f.Z)(['<ha-svg-icon class="big-icon" .path="','"></ha-svg-icon> <ha-button unelevated @click="','"> ',' </ha-button> <span class="secondary">','</span> <span class="supports">',"</span>"])),this.icon||V,this._openFilePicker,this.label||(null===(i=this.hass)||void 0===i?void 0:i.localize("ui.components.file-upload.label")),this.secondary||(null===(c=this.hass)||void 0===c?void 0:c.localize("ui.components.file-upload.secondary")),this.supports),this.accept,this.multiple,this._handleFilePicked))}},{kind:"method",key:"_openFilePicker",value:function(){var e;null===(e=this._input)||void 0===e||e.click()}},{kind:"method",key:"_handleDrop",value:function(e){var t;e.preventDefault(),e.stopPropagation(),null!==(t=e.dataTransfer)&&void 0!==t&&t.files&&(0,B.B)(this,"file-picked",{files:this.multiple||1===e.dataTransfer.files.length?Array.from(e.dataTransfer.files):[e.dataTransfer.files[0]]}),this._drag=!1}},{kind:"method",key:"_handleDragStart",value:function(e){e.preventDefault(),e.stopPropagation(),this._drag=!0}},{kind:"method",key:"_handleDragEnd",value:function(e){e.preventDefault(),e.stopPropagation(),this._drag=!1}},{kind:"method",key:"_handleFilePicked",value:function(e){0!==e.target.files.length&&(this.value=e.target.files,(0,B.B)(this,"file-picked",{files:e.target.files}))}},{kind:"method",key:"_clearValue",value:function(e){e.preventDefault(),this._input.value="",this.value=void 0,(0,B.B)(this,"change")}},{kind:"get",static:!0,key:"styles",value:function(){return(0,Z.iv)(c||(c=(0,f.Z)([':host{display:block;height:240px}:host([disabled]){pointer-events:none;color:var(--disabled-text-color)}.container{position:relative;display:flex;flex-direction:column;justify-content:center;align-items:center;border:solid 1px var(--mdc-text-field-idle-line-color,rgba(0,0,0,.42));border-radius:var(--mdc-shape-small,4px);height:100%}label.container{border:dashed 1px var(--mdc-text-field-idle-line-color,rgba(0,0,0,.42));cursor:pointer}:host([disabled]) .container{border-color:var(--disabled-color)}label.dragged{border-color:var(--primary-color)}.dragged:before{position:absolute;top:0;right:0;bottom:0;left:0;background-color:var(--primary-color);content:"";opacity:var(--dark-divider-opacity);pointer-events:none;border-radius:var(--mdc-shape-small,4px)}label.value{cursor:default}label.value.multiple{justify-content:unset;overflow:auto}.highlight{color:var(--primary-color)}.row{display:flex;width:100%;align-items:center;justify-content:space-between;padding:0 16px;box-sizing:border-box}ha-button{margin-bottom:4px}.supports{color:var(--secondary-text-color);font-size:12px}:host([disabled]) .secondary{color:var(--disabled-text-color)}input.file{display:none}.value{cursor:pointer}.value ha-svg-icon{margin-right:8px}.big-icon{--mdc-icon-size:48px;margin-bottom:8px}ha-button{--mdc-button-outline-color:var(--primary-color);--mdc-icon-button-size:24px}mwc-linear-progress{width:100%;padding:16px;box-sizing:border-box}.header{font-weight:500}.progress{color:var(--secondary-text-color)}'])))}}]}}),Z.oi),(0,m.Z)([(0,w.Mo)("ha-selector-file")],(function(e,t){var i,r=function(t){function i(){var t;(0,g.Z)(this,i);for(var r=arguments.length,a=new Array(r),n=0;n<r;n++)a[n]=arguments[n];return t=(0,k.Z)(this,i,[].concat(a)),e((0,b.Z)(t)),t}return(0,y.Z)(i,t),(0,p.Z)(i)}(t);return{F:r,d:[{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,w.SB)()],key:"_filename",value:void 0},{kind:"field",decorators:[(0,w.SB)()],key:"_busy",value:function(){return!1}},{kind:"method",key:"render",value:function(){var e,t;return(0,Z.dy)(u||(u=(0,f.Z)([' <ha-file-upload .hass="','" .accept="','" .icon="','" .label="','" .required="','" .disabled="','" .supports="','" .uploading="','" .value="','" @file-picked="','" @change="','"></ha-file-upload> '])),this.hass,null===(e=this.selector.file)||void 0===e?void 0:e.accept,"M13,9V3.5L18.5,9M6,2C4.89,2 4,2.89 4,4V20A2,2 0 0,0 6,22H18A2,2 0 0,0 20,20V8L14,2H6Z",this.label,this.required,this.disabled,this.helper,this._busy,this.value?(null===(t=this._filename)||void 0===t?void 0:t.name)||this.hass.localize("ui.components.selectors.file.unknown_file"):void 0,this._uploadFile,this._removeFile)}},{kind:"method",key:"willUpdate",value:function(e){(0,_.Z)((0,x.Z)(r.prototype),"willUpdate",this).call(this,e),e.has("value")&&this._filename&&this.value!==this._filename.fileId&&(this._filename=void 0)}},{kind:"method",key:"_uploadFile",value:(i=(0,v.Z)((0,h.Z)().mark((function e(t){var i,r;return(0,h.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return this._busy=!0,i=t.detail.files[0],e.prev=2,e.next=5,F(this.hass,i);case 5:r=e.sent,this._filename={fileId:r,name:i.name},(0,B.B)(this,"value-changed",{value:r}),e.next=13;break;case 10:e.prev=10,e.t0=e.catch(2),(0,D.Ys)(this,{text:this.hass.localize("ui.components.selectors.file.upload_failed",{reason:e.t0.message||e.t0})});case 13:return e.prev=13,this._busy=!1,e.finish(13);case 16:case"end":return e.stop()}}),e,this,[[2,10,13,16]])}))),function(e){return i.apply(this,arguments)})},{kind:"field",key:"_removeFile",value:function(){var e=this;return(0,v.Z)((0,h.Z)().mark((function t(){return(0,h.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return e._busy=!0,t.prev=1,t.next=4,C(e.hass,e.value);case 4:t.next=8;break;case 6:t.prev=6,t.t0=t.catch(1);case 8:return t.prev=8,e._busy=!1,t.finish(8);case 11:e._filename=void 0,(0,B.B)(e,"value-changed",{value:""});case 13:case"end":return t.stop()}}),t,null,[[1,6,8,11]])})))}}]}}),Z.oi))},93892:function(e,t,i){var r=i(97673),a=i(11336),n=i(43313),o=RangeError;e.exports=function(e){var t=a(n(this)),i="",l=r(e);if(l<0||l===1/0)throw new o("Wrong number of repetitions");for(;l>0;(l>>>=1)&&(t+=t))1&l&&(i+=t);return i}},5110:function(e,t,i){var r=i(68077),a=i(55418),n=i(97673),o=i(29191),l=i(93892),s=i(18431),d=RangeError,c=String,u=Math.floor,h=a(l),v=a("".slice),f=a(1..toFixed),p=function(e,t,i){return 0===t?i:t%2==1?p(e,t-1,i*e):p(e*e,t/2,i)},g=function(e,t,i){for(var r=-1,a=i;++r<6;)a+=t*e[r],e[r]=a%1e7,a=u(a/1e7)},k=function(e,t){for(var i=6,r=0;--i>=0;)r+=e[i],e[i]=u(r/t),r=r%t*1e7},b=function(e){for(var t=6,i="";--t>=0;)if(""!==i||0===t||0!==e[t]){var r=c(e[t]);i=""===i?r:i+h("0",7-r.length)+r}return i};r({target:"Number",proto:!0,forced:s((function(){return"0.000"!==f(8e-5,3)||"1"!==f(.9,0)||"1.25"!==f(1.255,2)||"1000000000000000128"!==f(0xde0b6b3a7640080,0)}))||!s((function(){f({})}))},{toFixed:function(e){var t,i,r,a,l=o(this),s=n(e),u=[0,0,0,0,0,0],f="",y="0";if(s<0||s>20)throw new d("Incorrect fraction digits");if(l!=l)return"NaN";if(l<=-1e21||l>=1e21)return c(l);if(l<0&&(f="-",l=-l),l>1e-21)if(i=(t=function(e){for(var t=0,i=e;i>=4096;)t+=12,i/=4096;for(;i>=2;)t+=1,i/=2;return t}(l*p(2,69,1))-69)<0?l*p(2,-t,1):l/p(2,t,1),i*=4503599627370496,(t=52-t)>0){for(g(u,0,i),r=s;r>=7;)g(u,1e7,0),r-=7;for(g(u,p(10,r,1),0),r=t-1;r>=23;)k(u,1<<23),r-=23;k(u,1<<r),g(u,1,1),k(u,2),y=b(u)}else g(u,0,i),g(u,1<<-t,0),y=b(u)+h("0",s);return y=s>0?f+((a=y.length)<=s?"0."+h("0",s-a)+y:v(y,0,a-s)+"."+v(y,a-s)):f+y}})}}]);
+//# sourceMappingURL=6251.tYTB2MC5QTo.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[655],{51621:function(e,t,a){a(56308),a(17692),a(63789),a(24074),Object.defineProperty(t,"__esModule",{value:!0}),t.GetOperands=void 0;var l=a(77021);t.GetOperands=function(e){(0,l.invariant)("string"==typeof e,"GetOperands should have been called with a string");var t=(0,l.ToNumber)(e);(0,l.invariant)(isFinite(t),"n should be finite");var a,r,n,i=e.indexOf("."),o="";-1===i?(a=t,r=0,n=0):(a=e.slice(0,i),o=e.slice(i,e.length),r=(0,l.ToNumber)(o),n=o.length);var u,c,s=Math.abs((0,l.ToNumber)(a));if(0!==r){var f=o.replace(/0+$/,"");u=f.length,c=(0,l.ToNumber)(f)}else u=0,c=0;return{Number:t,IntegerDigits:s,NumberOfFractionDigits:n,NumberOfFractionDigitsWithoutTrailing:u,FractionDigits:r,FractionDigitsWithoutTrailing:c}}},75533:function(e,t,a){Object.defineProperty(t,"__esModule",{value:!0}),t.InitializePluralRules=void 0;var l=a(77021),r=a(46042);t.InitializePluralRules=function(e,t,a,n){var i=n.availableLocales,o=n.relevantExtensionKeys,u=n.localeData,c=n.getDefaultLocale,s=n.getInternalSlots,f=(0,l.CanonicalizeLocaleList)(t),d=Object.create(null),b=(0,l.CoerceOptionsToObject)(a),p=s(e);p.initializedPluralRules=!0;var v=(0,l.GetOption)(b,"localeMatcher","string",["best fit","lookup"],"best fit");d.localeMatcher=v,p.type=(0,l.GetOption)(b,"type","string",["cardinal","ordinal"],"cardinal"),(0,l.SetNumberFormatDigitOptions)(p,b,0,3,"standard");var g=(0,r.ResolveLocale)(i,f,d,o,u,c);return p.locale=g.locale,e}},79695:function(e,t,a){Object.defineProperty(t,"__esModule",{value:!0}),t.ResolvePlural=void 0;var l=a(77021),r=a(51621);t.ResolvePlural=function(e,t,a){var n=a.getInternalSlots,i=a.PluralRuleSelect,o=n(e);if((0,l.invariant)("Object"===(0,l.Type)(o),"pl has to be an object"),(0,l.invariant)("initializedPluralRules"in o,"pluralrules must be initialized"),(0,l.invariant)("Number"===(0,l.Type)(t),"n must be a number"),!isFinite(t))return"other";var u=o.locale,c=o.type,s=(0,l.FormatNumericToString)(o,t).formattedString;return i(u,c,t,(0,r.GetOperands)(s))}},68441:function(e,t,a){a(51358),a(46798),a(5239),a(39685),a(98490),Object.defineProperty(t,"__esModule",{value:!0});var l=new WeakMap;t.default=function(e){var t=l.get(e);return t||(t=Object.create(null),l.set(e,t)),t}},78643:function(e,t,a){a(51467),a(97393),a(46798),a(94570),a(51358),a(78399),a(5239),a(56086),a(47884),a(81912),a(64584),a(41483),a(12367),a(9454),a(98490),a(94738),a(98214),a(94418),a(38644),a(53737),Object.defineProperty(t,"__esModule",{value:!0}),t.PluralRules=void 0;var l=a(43204),r=a(77021),n=a(75533),i=a(79695),o=l.__importDefault(a(68441));function u(e,t){if(!(e instanceof s))throw new TypeError("Method Intl.PluralRules.prototype.".concat(t," called on incompatible receiver ").concat(String(e)))}function c(e,t,a,l){var r=l.IntegerDigits,n=l.NumberOfFractionDigits,i=l.FractionDigits;return s.localeData[e].fn(n?"".concat(r,".").concat(i):r,"ordinal"===t)}var s=function(){function e(t,a){if(!(this&&this instanceof e?this.constructor:void 0))throw new TypeError("Intl.PluralRules must be called with 'new'");return(0,n.InitializePluralRules)(this,t,a,{availableLocales:e.availableLocales,relevantExtensionKeys:e.relevantExtensionKeys,localeData:e.localeData,getDefaultLocale:e.getDefaultLocale,getInternalSlots:o.default})}return e.prototype.resolvedOptions=function(){u(this,"resolvedOptions");var t=Object.create(null),a=(0,o.default)(this);return t.locale=a.locale,t.type=a.type,["minimumIntegerDigits","minimumFractionDigits","maximumFractionDigits","minimumSignificantDigits","maximumSignificantDigits"].forEach((function(e){var l=a[e];void 0!==l&&(t[e]=l)})),t.pluralCategories=l.__spreadArray([],e.localeData[t.locale].categories[t.type],!0),t},e.prototype.select=function(e){u(this,"select");var t=(0,r.ToNumber)(e);return(0,i.ResolvePlural)(this,t,{getInternalSlots:o.default,PluralRuleSelect:c})},e.prototype.toString=function(){return"[object Intl.PluralRules]"},e.supportedLocalesOf=function(t,a){return(0,r.SupportedLocales)(e.availableLocales,(0,r.CanonicalizeLocaleList)(t),a)},e.__addLocaleData=function(){for(var t=[],a=0;a<arguments.length;a++)t[a]=arguments[a];for(var l=0,r=t;l<r.length;l++){var n=r[l],i=n.data,o=n.locale;e.localeData[o]=i,e.availableLocales.add(o),e.__defaultLocale||(e.__defaultLocale=o)}},e.getDefaultLocale=function(){return e.__defaultLocale},e.localeData={},e.availableLocales=new Set,e.__defaultLocale="",e.relevantExtensionKeys=[],e.polyfilled=!0,e}();t.PluralRules=s;try{"undefined"!=typeof Symbol&&Object.defineProperty(s.prototype,Symbol.toStringTag,{value:"Intl.PluralRules",writable:!1,enumerable:!1,configurable:!0});try{Object.defineProperty(s,"length",{value:0,writable:!1,enumerable:!1,configurable:!0})}catch(f){}Object.defineProperty(s.prototype.constructor,"length",{value:0,writable:!1,enumerable:!1,configurable:!0}),Object.defineProperty(s.supportedLocalesOf,"length",{value:1,writable:!1,enumerable:!1,configurable:!0})}catch(d){}},20655:function(e,t,a){Object.defineProperty(t,"__esModule",{value:!0});var l=a(78643);Object.defineProperty(Intl,"PluralRules",{value:l.PluralRules,writable:!0,enumerable:!1,configurable:!0})}}]);
+//# sourceMappingURL=655.lM1Lzp1cqBQ.js.map
\ No newline at end of file
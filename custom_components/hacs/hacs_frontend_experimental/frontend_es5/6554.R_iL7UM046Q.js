@@ -0,0 +1,2 @@
+(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6554],{94136:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),t(43204).__exportStar(t(15875),a)},76554:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0});var r=t(94136),i=t(77021),o=t(17106);(0,i.defineProperty)(Intl,"DateTimeFormat",{value:r.DateTimeFormat}),(0,i.defineProperty)(Date.prototype,"toLocaleString",{value:function(e,a){return(0,o.toLocaleString)(this,e,a)}}),(0,i.defineProperty)(Date.prototype,"toLocaleDateString",{value:function(e,a){return(0,o.toLocaleDateString)(this,e,a)}}),(0,i.defineProperty)(Date.prototype,"toLocaleTimeString",{value:function(e,a){return(0,o.toLocaleTimeString)(this,e,a)}})},7802:function(e,a,t){"use strict";t(56308),Object.defineProperty(a,"__esModule",{value:!0}),a.BasicFormatMatcher=void 0;var r=t(43204),i=t(77021),o=t(35328);a.BasicFormatMatcher=function(e,a){var t=-1/0,n=a[0];(0,i.invariant)(Array.isArray(a),"formats should be a list of things");for(var c=0,s=a;c<s.length;c++){for(var l=s[c],u=0,m=0,f=o.DATE_TIME_PROPS;m<f.length;m++){var d=f[m],p=e[d],A=l[d];if(void 0===p&&void 0!==A)u-=o.additionPenalty;else if(void 0!==p&&void 0===A)u-=o.removalPenalty;else if("timeZoneName"===d)"short"===p||"shortGeneric"===p?"shortOffset"===A?u-=o.offsetPenalty:"longOffset"===A?u-=o.offsetPenalty+o.shortMorePenalty:"short"===p&&"long"===A||"shortGeneric"===p&&"longGeneric"===A?u-=o.shortMorePenalty:p!==A&&(u-=o.removalPenalty):"shortOffset"===p&&"longOffset"===A?u-=o.shortMorePenalty:"long"===p||"longGeneric"===p?"longOffset"===A?u-=o.offsetPenalty:"shortOffset"===A?u-=o.offsetPenalty+o.longLessPenalty:"long"===p&&"short"===A||"longGeneric"===p&&"shortGeneric"===A?u-=o.longLessPenalty:p!==A&&(u-=o.removalPenalty):"longOffset"===p&&"shortOffset"===A?u-=o.longLessPenalty:p!==A&&(u-=o.removalPenalty);else if(p!==A){var g=void 0,v=(g="fractionalSecondDigits"===d?[1,2,3]:["2-digit","numeric","narrow","short","long"]).indexOf(p),h=g.indexOf(A),y=Math.max(-2,Math.min(h-v,2));2===y?u-=o.longMorePenalty:1===y?u-=o.shortMorePenalty:-1===y?u-=o.shortLessPenalty:-2===y&&(u-=o.longLessPenalty)}}u>t&&(t=u,n=l)}return r.__assign({},n)}},72833:function(e,a,t){"use strict";t(56308),Object.defineProperty(a,"__esModule",{value:!0}),a.BestFitFormatMatcher=a.bestFitFormatMatcherScore=void 0;var r=t(43204),i=t(77021),o=t(35328),n=t(20059);function c(e){return"numeric"===e||"2-digit"===e}function s(e,a){var t=0;e.hour12&&!a.hour12?t-=o.removalPenalty:!e.hour12&&a.hour12&&(t-=o.additionPenalty);for(var r=0,i=o.DATE_TIME_PROPS;r<i.length;r++){var n=i[r],s=e[n],l=a[n];if(void 0===s&&void 0!==l)t-=o.additionPenalty;else if(void 0!==s&&void 0===l)t-=o.removalPenalty;else if(s!==l)if(c(s)!==c(l))t-=o.differentNumericTypePenalty;else{var u=["2-digit","numeric","narrow","short","long"],m=u.indexOf(s),f=u.indexOf(l),d=Math.max(-2,Math.min(f-m,2));2===d?t-=o.longMorePenalty:1===d?t-=o.shortMorePenalty:-1===d?t-=o.shortLessPenalty:-2===d&&(t-=o.longLessPenalty)}}return t}a.bestFitFormatMatcherScore=s,a.BestFitFormatMatcher=function(e,a){var t=-1/0,o=a[0];(0,i.invariant)(Array.isArray(a),"formats should be a list of things");for(var l=0,u=a;l<u.length;l++){var m=u[l],f=s(e,m);f>t&&(t=f,o=m)}var d=r.__assign({},o),p={rawPattern:o.rawPattern};for(var A in(0,n.processDateTimePattern)(o.rawPattern,p),d){var g=d[A],v=p[A],h=e[A];"minute"!==A&&"second"!==A&&(h&&(c(v)&&!c(h)||g!==h&&(p[A]=h)))}return p.pattern=d.pattern,p.pattern12=d.pattern12,p.skeleton=d.skeleton,p.rangePatterns=d.rangePatterns,p.rangePatterns12=d.rangePatterns12,p}},11464:function(e,a,t){"use strict";t(63789),t(24074),Object.defineProperty(a,"__esModule",{value:!0}),a.DateTimeStyleFormat=void 0;var r=t(77021);a.DateTimeStyleFormat=function(e,a,t){var i,o;if(void 0!==a&&((0,r.invariant)("full"===a||"long"===a||"medium"===a||"short"===a,"invalid timeStyle"),o=t.timeFormat[a]),void 0!==e&&((0,r.invariant)("full"===e||"long"===e||"medium"===e||"short"===e,"invalid dateStyle"),i=t.dateFormat[e]),void 0!==e&&void 0!==a){var n={};for(var c in i)"pattern"!==c&&(n[c]=i[c]);for(var c in o)"pattern"!==c&&"pattern12"!==c&&(n[c]=o[c]);var s=t.dateTimeFormat[e],l=s.replace("{0}",o.pattern).replace("{1}",i.pattern);if(n.pattern=l,"pattern12"in o){var u=s.replace("{0}",o.pattern12).replace("{1}",i.pattern);n.pattern12=u}return n}return void 0!==a?o:((0,r.invariant)(void 0!==e,"dateStyle should not be undefined"),i)}},81800:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),a.FormatDateTime=void 0;var r=t(61334);a.FormatDateTime=function(e,a,t){for(var i="",o=0,n=(0,r.PartitionDateTimePattern)(e,a,t);o<n.length;o++){i+=n[o].value}return i}},48084:function(e,a,t){"use strict";t(63789),t(24074),t(36513),t(56308),t(17692),Object.defineProperty(a,"__esModule",{value:!0}),a.FormatDateTimePattern=void 0;var r=t(77021),i=t(35328),o=t(51593);function n(e){return e<10?"0".concat(e):String(e)}function c(e,a,t,r){var i=Math.floor(t/6e4),o=Math.abs(i)%60,c=Math.floor(Math.abs(i)/60),s=a.split(";"),l=s[0],u=s[1],m="",f=t<0?u:l;return"long"===r?m=f.replace("HH",n(c)).replace("H",String(c)).replace("mm",n(o)).replace("m",String(o)):(o||c)&&(o||(f=f.replace(/:?m+/,"")),m=f.replace(/H+/,String(c)).replace(/m+/,String(o))),e.replace("{0}",m)}a.FormatDateTimePattern=function(e,a,t,n){var s=n.getInternalSlots,l=n.localeData,u=n.getDefaultTimeZone,m=n.tzData;t=(0,r.TimeClip)(t);var f=s(e),d=l[f.dataLocale],p=f.locale,A=Object.create(null);A.useGrouping=!1;var g=new Intl.NumberFormat(p,A),v=Object.create(null);v.minimumIntegerDigits=2,v.useGrouping=!1;var h,y=new Intl.NumberFormat(p,v),T=f.fractionalSecondDigits;if(void 0!==T){var P=Object.create(null);P.minimumIntegerDigits=T,P.useGrouping=!1,h=new Intl.NumberFormat(p,P)}for(var D=(0,o.ToLocalTime)(t,f.calendar,f.timeZone,{tzData:m}),b=[],_=0,S=a;_<S.length;_++){var F=S[_],E=F.type;if("literal"===E)b.push({type:"literal",value:F.value});else if("fractionalSecondDigits"===E){var M=Math.floor(D.millisecond*Math.pow(10,(T||0)-3));b.push({type:"fractionalSecond",value:h.format(M)})}else if("dayPeriod"===E){var w=D[k=f.dayPeriod];b.push({type:E,value:w})}else if("timeZoneName"===E){var k=f.timeZoneName,O=(w=void 0,d.timeZoneName),L=d.gmtFormat,C=d.hourFormat,R=O[f.timeZone||u()];w=R&&R[k]?R[k][+D.inDST]:c(L,C,D.timeZoneOffset,k),b.push({type:E,value:w})}else if(i.DATE_TIME_PROPS.indexOf(E)>-1){w="",k=f[E],M=D[E];"year"===E&&M<=0&&(M=1-M),"month"===E&&M++;var j=f.hourCycle;"hour"!==E||"h11"!==j&&"h12"!==j||0===(M%=12)&&"h12"===j&&(M=12),"hour"===E&&"h24"===j&&0===M&&(M=24),"numeric"===k?w=g.format(M):"2-digit"===k?(w=y.format(M)).length>2&&(w=w.slice(w.length-2,w.length)):"narrow"!==k&&"short"!==k&&"long"!==k||(w="era"===E?d[E][k][M]:"month"===E?d.month[k][M-1]:d[E][k][M]),b.push({type:E,value:w})}else if("ampm"===E){w=void 0;w=(M=D.hour)>11?d.pm:d.am,b.push({type:"dayPeriod",value:w})}else if("relatedYear"===E){M=D.relatedYear,w=g.format(M);b.push({type:"relatedYear",value:w})}else if("yearName"===E){M=D.yearName,w=g.format(M);b.push({type:"yearName",value:w})}}return b}},91920:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),a.FormatDateTimeRange=void 0;var r=t(46186);a.FormatDateTimeRange=function(e,a,t,i){for(var o="",n=0,c=(0,r.PartitionDateTimeRangePattern)(e,a,t,i);n<c.length;n++){o+=c[n].value}return o}},99607:function(e,a,t){"use strict";t(36513),Object.defineProperty(a,"__esModule",{value:!0}),a.FormatDateTimeRangeToParts=void 0;var r=t(46186);a.FormatDateTimeRangeToParts=function(e,a,t,i){for(var o=(0,r.PartitionDateTimeRangePattern)(e,a,t,i),n=new Array(0),c=0,s=o;c<s.length;c++){var l=s[c];n.push({type:l.type,value:l.value,source:l.source})}return n}},85923:function(e,a,t){"use strict";t(36513),Object.defineProperty(a,"__esModule",{value:!0}),a.FormatDateTimeToParts=void 0;var r=t(61334),i=t(77021);a.FormatDateTimeToParts=function(e,a,t){for(var o=(0,r.PartitionDateTimePattern)(e,a,t),n=(0,i.ArrayCreate)(0),c=0,s=o;c<s.length;c++){var l=s[c];n.push({type:l.type,value:l.value})}return n}},79916:function(e,a,t){"use strict";t(63789),t(99397),t(51467),t(65974),t(97393),t(91989),Object.defineProperty(a,"__esModule",{value:!0}),a.InitializeDateTimeFormat=void 0;var r=t(77021),i=t(46042),o=t(7802),n=t(72833),c=t(11464),s=t(59811),l=t(35328);function u(e,a,t){return null==e&&(e=a),void 0!==t&&(t?e="h11"===a||"h23"===a?"h11":"h12":((0,r.invariant)(!t,"hour12 must not be set"),e="h11"===a||"h23"===a?"h23":"h24")),e}var m=/^[a-z0-9]{3,8}$/i;a.InitializeDateTimeFormat=function(e,a,t,f){var d=f.getInternalSlots,p=f.availableLocales,A=f.localeData,g=f.getDefaultLocale,v=f.getDefaultTimeZone,h=f.relevantExtensionKeys,y=f.tzData,T=f.uppercaseLinks,P=(0,r.CanonicalizeLocaleList)(a),D=(0,s.ToDateTimeOptions)(t,"any","date"),b=Object.create(null),_=(0,r.GetOption)(D,"localeMatcher","string",["lookup","best fit"],"best fit");b.localeMatcher=_;var S=(0,r.GetOption)(D,"calendar","string",void 0,void 0);if(void 0!==S&&!m.test(S))throw new RangeError("Malformed calendar");var F=d(e);b.ca=S;var E=(0,r.GetOption)(D,"numberingSystem","string",void 0,void 0);if(void 0!==E&&!m.test(E))throw new RangeError("Malformed numbering system");b.nu=E;var M=(0,r.GetOption)(D,"hour12","boolean",void 0,void 0),w=(0,r.GetOption)(D,"hourCycle","string",["h11","h12","h23","h24"],void 0);void 0!==M&&(w=null),b.hc=w;var k=(0,i.ResolveLocale)(p,P,b,h,A,g);F.locale=k.locale,S=k.ca,F.calendar=S,F.hourCycle=k.hc,F.numberingSystem=k.nu;var O=k.dataLocale;F.dataLocale=O;var L=D.timeZone;if(void 0!==L){if(L=String(L),!(0,r.IsValidTimeZoneName)(L,{zoneNamesFromData:Object.keys(y),uppercaseLinks:T}))throw new RangeError("Invalid timeZoneName");L=(0,r.CanonicalizeTimeZoneName)(L,{zoneNames:Object.keys(y),uppercaseLinks:T})}else L=v();F.timeZone=L,(b=Object.create(null)).weekday=(0,r.GetOption)(D,"weekday","string",["narrow","short","long"],void 0),b.era=(0,r.GetOption)(D,"era","string",["narrow","short","long"],void 0),b.year=(0,r.GetOption)(D,"year","string",["2-digit","numeric"],void 0),b.month=(0,r.GetOption)(D,"month","string",["2-digit","numeric","narrow","short","long"],void 0),b.day=(0,r.GetOption)(D,"day","string",["2-digit","numeric"],void 0),b.hour=(0,r.GetOption)(D,"hour","string",["2-digit","numeric"],void 0),b.minute=(0,r.GetOption)(D,"minute","string",["2-digit","numeric"],void 0),b.second=(0,r.GetOption)(D,"second","string",["2-digit","numeric"],void 0),b.timeZoneName=(0,r.GetOption)(D,"timeZoneName","string",["long","short","longOffset","shortOffset","longGeneric","shortGeneric"],void 0),b.fractionalSecondDigits=(0,r.GetNumberOption)(D,"fractionalSecondDigits",1,3,void 0);var C=A[O];(0,r.invariant)(!!C,"Missing locale data for ".concat(O));var R=C.formats[S];if(!R)throw new RangeError('Calendar "'.concat(S,'" is not supported. Try setting "calendar" to 1 of the following: ').concat(Object.keys(C.formats).join(", ")));var j=(0,r.GetOption)(D,"formatMatcher","string",["basic","best fit"],"best fit"),I=(0,r.GetOption)(D,"dateStyle","string",["full","long","medium","short"],void 0);F.dateStyle=I;var N,G,B,z=(0,r.GetOption)(D,"timeStyle","string",["full","long","medium","short"],void 0);if(F.timeStyle=z,void 0===I&&void 0===z)if("basic"===j)N=(0,o.BasicFormatMatcher)(b,R);else{if(function(e){for(var a=0,t=["hour","minute","second"];a<t.length;a++)if(void 0!==e[t[a]])return!0;return!1}(b)){var Z=u(F.hourCycle,C.hourCycle,M);b.hour12="h11"===Z||"h12"===Z}N=(0,n.BestFitFormatMatcher)(b,R)}else{for(var x=0,U=l.DATE_TIME_PROPS;x<U.length;x++){if(void 0!==(H=b[K=U[x]]))throw new TypeError("Intl.DateTimeFormat can't set option ".concat(K," when ").concat(I?"dateStyle":"timeStyle"," is used"))}N=(0,c.DateTimeStyleFormat)(I,z,C)}for(var K in F.format=N,b){var H;void 0!==(H=N[K])&&(F[K]=H)}if(void 0!==F.hour){Z=u(F.hourCycle,C.hourCycle,M);F.hourCycle=Z,"h11"===Z||"h12"===Z?(G=N.pattern12,B=N.rangePatterns12):(G=N.pattern,B=N.rangePatterns)}else F.hourCycle=void 0,G=N.pattern,B=N.rangePatterns;return F.pattern=G,F.rangePatterns=B,e}},61334:function(e,a,t){"use strict";t(51467),Object.defineProperty(a,"__esModule",{value:!0}),a.PartitionDateTimePattern=void 0;var r=t(77021),i=t(48084);a.PartitionDateTimePattern=function(e,a,t){if(a=(0,r.TimeClip)(a),isNaN(a))throw new RangeError("invalid time");var o=(0,t.getInternalSlots)(e).pattern;return(0,i.FormatDateTimePattern)(e,(0,r.PartitionPattern)(o),a,t)}},46186:function(e,a,t){"use strict";t(51467),t(97393),Object.defineProperty(a,"__esModule",{value:!0}),a.PartitionDateTimeRangePattern=void 0;var r=t(77021),i=t(51593),o=t(48084),n=["era","year","month","day","dayPeriod","ampm","hour","minute","second","fractionalSecondDigits"];a.PartitionDateTimeRangePattern=function(e,a,t,c){if(a=(0,r.TimeClip)(a),isNaN(a))throw new RangeError("Invalid start time");if(t=(0,r.TimeClip)(t),isNaN(t))throw new RangeError("Invalid end time");for(var s,l=c.getInternalSlots,u=c.tzData,m=l(e),f=(0,i.ToLocalTime)(a,m.calendar,m.timeZone,{tzData:u}),d=(0,i.ToLocalTime)(t,m.calendar,m.timeZone,{tzData:u}),p=m.pattern,A=m.rangePatterns,g=!0,v=!1,h=0,y=n;h<y.length;h++){var T=y[h];if(g&&!v){var P=T in A?A[T]:void 0;if(void 0!==s&&void 0===P)v=!0;else if(s=P,"ampm"===T){var D=f.hour,b=d.hour;(D>11&&b<11||D<11&&b>11)&&(g=!1)}else if("dayPeriod"===T);else if("fractionalSecondDigits"===T){var _=m.fractionalSecondDigits;void 0===_&&(_=3);D=Math.floor(f.millisecond*Math.pow(10,_-3)),b=Math.floor(d.millisecond*Math.pow(10,_-3));(0,r.SameValue)(D,b)||(g=!1)}else{D=f[T],b=d[T];(0,r.SameValue)(D,b)||(g=!1)}}}if(g){for(var S=(0,o.FormatDateTimePattern)(e,(0,r.PartitionPattern)(p),a,c),F=0,E=S;F<E.length;F++){E[F].source=r.RangePatternType.shared}return S}var M=[];if(void 0===s)for(var w=0,k=(s=A.default).patternParts;w<k.length;w++){var O=k[w];"{0}"!==O.pattern&&"{1}"!==O.pattern||(O.pattern=p)}for(var L=0,C=s.patternParts;L<C.length;L++){var R=C[L],j=R.source,I=R.pattern,N=void 0;N=j===r.RangePatternType.startRange||j===r.RangePatternType.shared?a:t;for(var G=(0,r.PartitionPattern)(I),B=(0,o.FormatDateTimePattern)(e,G,N,c),z=0,Z=B;z<Z.length;z++){Z[z].source=j}M=M.concat(B)}return M}},59811:function(e,a,t){"use strict";t(51467),Object.defineProperty(a,"__esModule",{value:!0}),a.ToDateTimeOptions=void 0;var r=t(77021);a.ToDateTimeOptions=function(e,a,t){e=void 0===e?null:(0,r.ToObject)(e),e=Object.create(e);var i=!0;if("date"===a||"any"===a)for(var o=0,n=["weekday","year","month","day"];o<n.length;o++){void 0!==e[n[o]]&&(i=!1)}if("time"===a||"any"===a)for(var c=0,s=["dayPeriod","hour","minute","second","fractionalSecondDigits"];c<s.length;c++){void 0!==e[s[c]]&&(i=!1)}if(void 0===e.dateStyle&&void 0===e.timeStyle||(i=!1),"date"===a&&e.timeStyle)throw new TypeError("Intl.DateTimeFormat date was required but timeStyle was included");if("time"===a&&e.dateStyle)throw new TypeError("Intl.DateTimeFormat time was required but dateStyle was included");if(i&&("date"===t||"all"===t))for(var l=0,u=["year","month","day"];l<u.length;l++){e[u[l]]="numeric"}if(i&&("time"===t||"all"===t))for(var m=0,f=["hour","minute","second"];m<f.length;m++){e[f[m]]="numeric"}return e}},51593:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),a.ToLocalTime=void 0;var r=t(77021);a.ToLocalTime=function(e,a,t,i){var o=i.tzData;(0,r.invariant)("Number"===(0,r.Type)(e),"invalid time"),(0,r.invariant)("gregory"===a,"We only support Gregory calendar right now");var n=function(e,a,t){var r,i=t[a];if(!i)return[0,!1];for(var o=0,n=0,c=!1;o<=i.length;o++)if(o===i.length||1e3*i[o][0]>e){n=(r=i[o-1])[2],c=r[3];break}return[1e3*n,c]}(e,t,o),c=n[0],s=n[1],l=e+c,u=(0,r.YearFromTime)(l);return{weekday:(0,r.WeekDay)(l),era:u<0?"BC":"AD",year:u,relatedYear:void 0,yearName:void 0,month:(0,r.MonthFromTime)(l),day:(0,r.DateFromTime)(l),hour:(0,r.HourFromTime)(l),minute:(0,r.MinFromTime)(l),second:(0,r.SecFromTime)(l),millisecond:(0,r.msFromTime)(l),inDST:s,timeZoneOffset:c}}},20059:function(e,a,t){"use strict";t(51467),t(63789),t(24074),t(36513),t(87438),t(46798),t(9849),t(22890),t(57778),t(46349),t(70320),t(17692),Object.defineProperty(a,"__esModule",{value:!0}),a.splitRangePattern=a.splitFallbackRangePattern=a.parseDateTimeSkeleton=a.processDateTimePattern=void 0;var r=t(43204),i=t(77021),o=/(?:[Eec]{1,6}|G{1,5}|[Qq]{1,5}|(?:[yYur]+|U{1,5})|[ML]{1,5}|d{1,2}|D{1,3}|F{1}|[abB]{1,5}|[hkHK]{1,2}|w{1,2}|W{1}|m{1,2}|s{1,2}|[zZOvVxX]{1,4})(?=([^']*'[^']*')*[^']*$)/g,n=/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g;function c(e,a){var t=e.length;switch(e[0]){case"G":return a.era=4===t?"long":5===t?"narrow":"short","{era}";case"y":case"Y":case"u":case"U":case"r":return a.year=2===t?"2-digit":"numeric","{year}";case"q":case"Q":throw new RangeError("`w/Q` (quarter) patterns are not supported");case"M":case"L":return a.month=["numeric","2-digit","short","long","narrow"][t-1],"{month}";case"w":case"W":throw new RangeError("`w/W` (week of year) patterns are not supported");case"d":return a.day=["numeric","2-digit"][t-1],"{day}";case"D":case"F":case"g":return a.day="numeric","{day}";case"E":return a.weekday=4===t?"long":5===t?"narrow":"short","{weekday}";case"e":case"c":return a.weekday=[void 0,void 0,"short","long","narrow","short"][t-1],"{weekday}";case"a":case"b":case"B":return a.hour12=!0,"{ampm}";case"h":case"K":return a.hour=["numeric","2-digit"][t-1],a.hour12=!0,"{hour}";case"H":case"k":return a.hour=["numeric","2-digit"][t-1],"{hour}";case"j":case"J":case"C":throw new RangeError("`j/J/C` (hour) patterns are not supported, use `h/H/K/k` instead");case"m":return a.minute=["numeric","2-digit"][t-1],"{minute}";case"s":return a.second=["numeric","2-digit"][t-1],"{second}";case"S":case"A":return a.second="numeric","{second}";case"z":case"Z":case"O":case"v":case"V":case"X":case"x":return a.timeZoneName=t<4?"short":"long","{timeZoneName}"}return""}function s(e){switch(e){case"G":return"era";case"y":case"Y":case"u":case"U":case"r":return"year";case"M":case"L":return"month";case"d":case"D":case"F":case"g":return"day";case"a":case"b":case"B":return"ampm";case"h":case"H":case"K":case"k":return"hour";case"m":return"minute";case"s":case"S":case"A":return"second";default:throw new RangeError("Invalid range pattern token")}}function l(e,a){var t=[],r=e.replace(/'{2}/g,"{apostrophe}").replace(/'(.*?)'/g,(function(e,a){return t.push(a),"$$".concat(t.length-1,"$$")})).replace(o,(function(e){return c(e,a||{})}));return t.length&&(r=r.replace(/\$\$(\d+)\$\$/g,(function(e,a){return t[+a]})).replace(/\{apostrophe\}/g,"'")),[r.replace(/([\s\uFEFF\xA0])\{ampm\}([\s\uFEFF\xA0])/,"$1").replace("{ampm}","").replace(n,""),r]}function u(e){return e.split(/(\{[0|1]\})/g).filter(Boolean).map((function(e){switch(e){case"{0}":return{source:i.RangePatternType.startRange,pattern:e};case"{1}":return{source:i.RangePatternType.endRange,pattern:e};default:return{source:i.RangePatternType.shared,pattern:e}}}))}function m(e){for(var a,t=/\{(.*?)\}/g,r={},o=0;a=t.exec(e);){if(a[0]in r){o=a.index;break}r[a[0]]=a.index}return o?[{source:i.RangePatternType.startRange,pattern:e.slice(0,o)},{source:i.RangePatternType.endRange,pattern:e.slice(o)}]:[{source:i.RangePatternType.startRange,pattern:e}]}a.processDateTimePattern=l,a.parseDateTimeSkeleton=function(e,a,t,i){void 0===a&&(a=e);var n={pattern:"",pattern12:"",skeleton:e,rawPattern:a,rangePatterns:{},rangePatterns12:{}};if(t)for(var f in t){var d=s(f),p={patternParts:[]},A=l(t[f],p),g=A[0],v=A[1];n.rangePatterns[d]=r.__assign(r.__assign({},p),{patternParts:m(g)}),n.rangePatterns12[d]=r.__assign(r.__assign({},p),{patternParts:m(v)})}if(i){var h=u(i);n.rangePatterns.default={patternParts:h},n.rangePatterns12.default={patternParts:h}}e.replace(o,(function(e){return c(e,n)}));var y=l(a),T=y[0],P=y[1];return n.pattern=T,n.pattern12=P,n},a.splitFallbackRangePattern=u,a.splitRangePattern=m},35328:function(e,a){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),a.offsetPenalty=a.shortMorePenalty=a.shortLessPenalty=a.longMorePenalty=a.longLessPenalty=a.differentNumericTypePenalty=a.additionPenalty=a.removalPenalty=a.DATE_TIME_PROPS=void 0,a.DATE_TIME_PROPS=["weekday","era","year","month","day","dayPeriod","hour","minute","second","fractionalSecondDigits","timeZoneName"],a.removalPenalty=120,a.additionPenalty=20,a.differentNumericTypePenalty=15,a.longLessPenalty=8,a.longMorePenalty=6,a.shortLessPenalty=6,a.shortMorePenalty=3,a.offsetPenalty=1},15875:function(e,a,t){"use strict";var r=t(3355).default;t(34997),t(46798),t(9849),t(12148),t(65974),t(51467),t(76843),t(56308),t(46349),t(70320),t(94570),t(51358),t(78399),t(5239),t(56086),t(47884),t(81912),t(64584),t(41483),t(12367),t(9454),t(98490),t(94738),t(98214),t(94418),t(38644),t(53737),Object.defineProperty(a,"__esModule",{value:!0}),a.DateTimeFormat=void 0;var i=t(43204),o=t(77021),n=t(81800),c=t(91920),s=t(99607),l=t(85923),u=t(79916),m=t(20059),f=t(35328),d=i.__importDefault(t(99431)),p=i.__importDefault(t(8951)),A=t(10465),g=Object.keys(d.default).reduce((function(e,a){return e[a.toUpperCase()]=d.default[a],e}),{}),v=["locale","calendar","numberingSystem","dateStyle","timeStyle","timeZone","hourCycle","weekday","era","year","month","day","hour","minute","second","timeZoneName"],h={enumerable:!1,configurable:!0,get:function(){if("object"!==r(this)||!(0,o.OrdinaryHasInstance)(a.DateTimeFormat,this))throw TypeError("Intl.DateTimeFormat format property accessor called on incompatible receiver");var e=(0,p.default)(this),t=this,i=e.boundFormat;if(void 0===i){i=function(e){var r;return r=void 0===e?Date.now():Number(e),(0,n.FormatDateTime)(t,r,{getInternalSlots:p.default,localeData:a.DateTimeFormat.localeData,tzData:a.DateTimeFormat.tzData,getDefaultTimeZone:a.DateTimeFormat.getDefaultTimeZone})};try{Object.defineProperty(i,"name",{configurable:!0,enumerable:!1,writable:!1,value:""})}catch(c){}e.boundFormat=i}return i}};try{Object.defineProperty(h.get,"name",{configurable:!0,enumerable:!1,writable:!1,value:"get format"})}catch(y){}a.DateTimeFormat=function(e,t){if(!this||!(0,o.OrdinaryHasInstance)(a.DateTimeFormat,this))return new a.DateTimeFormat(e,t);(0,u.InitializeDateTimeFormat)(this,e,t,{tzData:a.DateTimeFormat.tzData,uppercaseLinks:g,availableLocales:a.DateTimeFormat.availableLocales,relevantExtensionKeys:a.DateTimeFormat.relevantExtensionKeys,getDefaultLocale:a.DateTimeFormat.getDefaultLocale,getDefaultTimeZone:a.DateTimeFormat.getDefaultTimeZone,getInternalSlots:p.default,localeData:a.DateTimeFormat.localeData});var r=(0,p.default)(this).dataLocale,i=a.DateTimeFormat.localeData[r];(0,o.invariant)(void 0!==i,"Cannot load locale-dependent data for ".concat(r,"."))},(0,o.defineProperty)(a.DateTimeFormat,"supportedLocalesOf",{value:function(e,t){return(0,o.SupportedLocales)(a.DateTimeFormat.availableLocales,(0,o.CanonicalizeLocaleList)(e),t)}}),(0,o.defineProperty)(a.DateTimeFormat.prototype,"resolvedOptions",{value:function(){if("object"!==r(this)||!(0,o.OrdinaryHasInstance)(a.DateTimeFormat,this))throw TypeError("Method Intl.DateTimeFormat.prototype.resolvedOptions called on incompatible receiver");for(var e=(0,p.default)(this),t={},i=0,n=v;i<n.length;i++){var c=n[i],s=e[c];if("hourCycle"===c){var l="h11"===s||"h12"===s||"h23"!==s&&"h24"!==s&&void 0;void 0!==l&&(t.hour12=l)}f.DATE_TIME_PROPS.indexOf(c)>-1&&(void 0===e.dateStyle&&void 0===e.timeStyle||(s=void 0)),void 0!==s&&(t[c]=s)}return t}}),(0,o.defineProperty)(a.DateTimeFormat.prototype,"formatToParts",{value:function(e){return e=void 0===e?Date.now():(0,o.ToNumber)(e),(0,l.FormatDateTimeToParts)(this,e,{getInternalSlots:p.default,localeData:a.DateTimeFormat.localeData,tzData:a.DateTimeFormat.tzData,getDefaultTimeZone:a.DateTimeFormat.getDefaultTimeZone})}}),(0,o.defineProperty)(a.DateTimeFormat.prototype,"formatRangeToParts",{value:function(e,t){if("object"!==r(this))throw new TypeError;if(void 0===e||void 0===t)throw new TypeError("startDate/endDate cannot be undefined");var i=(0,o.ToNumber)(e),n=(0,o.ToNumber)(t);return(0,s.FormatDateTimeRangeToParts)(this,i,n,{getInternalSlots:p.default,localeData:a.DateTimeFormat.localeData,tzData:a.DateTimeFormat.tzData,getDefaultTimeZone:a.DateTimeFormat.getDefaultTimeZone})}}),(0,o.defineProperty)(a.DateTimeFormat.prototype,"formatRange",{value:function(e,t){if("object"!==r(this))throw new TypeError;if(void 0===e||void 0===t)throw new TypeError("startDate/endDate cannot be undefined");var i=(0,o.ToNumber)(e),n=(0,o.ToNumber)(t);return(0,c.FormatDateTimeRange)(this,i,n,{getInternalSlots:p.default,localeData:a.DateTimeFormat.localeData,tzData:a.DateTimeFormat.tzData,getDefaultTimeZone:a.DateTimeFormat.getDefaultTimeZone})}});a.DateTimeFormat.__setDefaultTimeZone=function(e){if(void 0!==e){if(e=String(e),!(0,o.IsValidTimeZoneName)(e,{zoneNamesFromData:Object.keys(a.DateTimeFormat.tzData),uppercaseLinks:g}))throw new RangeError("Invalid timeZoneName");e=(0,o.CanonicalizeTimeZoneName)(e,{zoneNames:Object.keys(a.DateTimeFormat.tzData),uppercaseLinks:g})}else e="UTC";a.DateTimeFormat.__defaultTimeZone=e},a.DateTimeFormat.relevantExtensionKeys=["nu","ca","hc"],a.DateTimeFormat.__defaultTimeZone="UTC",a.DateTimeFormat.getDefaultTimeZone=function(){return a.DateTimeFormat.__defaultTimeZone},a.DateTimeFormat.__addLocaleData=function(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];for(var r=function(e,t){var r=e.dateFormat,o=e.timeFormat,n=e.dateTimeFormat,c=e.formats,s=e.intervalFormats,l=i.__rest(e,["dateFormat","timeFormat","dateTimeFormat","formats","intervalFormats"]),u=i.__assign(i.__assign({},l),{dateFormat:{full:(0,m.parseDateTimeSkeleton)(r.full),long:(0,m.parseDateTimeSkeleton)(r.long),medium:(0,m.parseDateTimeSkeleton)(r.medium),short:(0,m.parseDateTimeSkeleton)(r.short)},timeFormat:{full:(0,m.parseDateTimeSkeleton)(o.full),long:(0,m.parseDateTimeSkeleton)(o.long),medium:(0,m.parseDateTimeSkeleton)(o.medium),short:(0,m.parseDateTimeSkeleton)(o.short)},dateTimeFormat:{full:(0,m.parseDateTimeSkeleton)(n.full).pattern,long:(0,m.parseDateTimeSkeleton)(n.long).pattern,medium:(0,m.parseDateTimeSkeleton)(n.medium).pattern,short:(0,m.parseDateTimeSkeleton)(n.short).pattern},formats:{}}),f=function(e){u.formats[e]=Object.keys(c[e]).map((function(a){return(0,m.parseDateTimeSkeleton)(a,c[e][a],s[a],s.intervalFormatFallback)}))};for(var d in c)f(d);var p=new Intl.Locale(t).minimize().toString();a.DateTimeFormat.localeData[t]=a.DateTimeFormat.localeData[p]=u,a.DateTimeFormat.availableLocales.add(t),a.DateTimeFormat.availableLocales.add(p),a.DateTimeFormat.__defaultLocale||(a.DateTimeFormat.__defaultLocale=p)},o=0,n=e;o<n.length;o++){var c=n[o];r(c.data,c.locale)}},Object.defineProperty(a.DateTimeFormat.prototype,"format",h),a.DateTimeFormat.__defaultLocale="",a.DateTimeFormat.localeData={},a.DateTimeFormat.availableLocales=new Set,a.DateTimeFormat.getDefaultLocale=function(){return a.DateTimeFormat.__defaultLocale},a.DateTimeFormat.polyfilled=!0,a.DateTimeFormat.tzData={},a.DateTimeFormat.__addTZData=function(e){a.DateTimeFormat.tzData=(0,A.unpack)(e)};try{"undefined"!=typeof Symbol&&Object.defineProperty(a.DateTimeFormat.prototype,Symbol.toStringTag,{value:"Intl.DateTimeFormat",writable:!1,enumerable:!1,configurable:!0}),Object.defineProperty(a.DateTimeFormat.prototype.constructor,"length",{value:1,writable:!1,enumerable:!1,configurable:!0})}catch(y){}},99431:function(e,a){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),a.default={"Africa/Accra":"Africa/Abidjan","Africa/Addis_Ababa":"Africa/Nairobi","Africa/Asmara":"Africa/Nairobi","Africa/Asmera":"Africa/Nairobi","Africa/Bamako":"Africa/Abidjan","Africa/Bangui":"Africa/Lagos","Africa/Banjul":"Africa/Abidjan","Africa/Blantyre":"Africa/Maputo","Africa/Brazzaville":"Africa/Lagos","Africa/Bujumbura":"Africa/Maputo","Africa/Conakry":"Africa/Abidjan","Africa/Dakar":"Africa/Abidjan","Africa/Dar_es_Salaam":"Africa/Nairobi","Africa/Djibouti":"Africa/Nairobi","Africa/Douala":"Africa/Lagos","Africa/Freetown":"Africa/Abidjan","Africa/Gaborone":"Africa/Maputo","Africa/Harare":"Africa/Maputo","Africa/Kampala":"Africa/Nairobi","Africa/Kigali":"Africa/Maputo","Africa/Kinshasa":"Africa/Lagos","Africa/Libreville":"Africa/Lagos","Africa/Lome":"Africa/Abidjan","Africa/Luanda":"Africa/Lagos","Africa/Lubumbashi":"Africa/Maputo","Africa/Lusaka":"Africa/Maputo","Africa/Malabo":"Africa/Lagos","Africa/Maseru":"Africa/Johannesburg","Africa/Mbabane":"Africa/Johannesburg","Africa/Mogadishu":"Africa/Nairobi","Africa/Niamey":"Africa/Lagos","Africa/Nouakchott":"Africa/Abidjan","Africa/Ouagadougou":"Africa/Abidjan","Africa/Porto-Novo":"Africa/Lagos","Africa/Timbuktu":"Africa/Abidjan","America/Anguilla":"America/Puerto_Rico","America/Antigua":"America/Puerto_Rico","America/Argentina/ComodRivadavia":"America/Argentina/Catamarca","America/Aruba":"America/Puerto_Rico","America/Atikokan":"America/Panama","America/Atka":"America/Adak","America/Blanc-Sablon":"America/Puerto_Rico","America/Buenos_Aires":"America/Argentina/Buenos_Aires","America/Catamarca":"America/Argentina/Catamarca","America/Cayman":"America/Panama","America/Coral_Harbour":"America/Panama","America/Cordoba":"America/Argentina/Cordoba","America/Creston":"America/Phoenix","America/Curacao":"America/Puerto_Rico","America/Dominica":"America/Puerto_Rico","America/Ensenada":"America/Tijuana","America/Fort_Wayne":"America/Indiana/Indianapolis","America/Godthab":"America/Nuuk","America/Grenada":"America/Puerto_Rico","America/Guadeloupe":"America/Puerto_Rico","America/Indianapolis":"America/Indiana/Indianapolis","America/Jujuy":"America/Argentina/Jujuy","America/Knox_IN":"America/Indiana/Knox","America/Kralendijk":"America/Puerto_Rico","America/Louisville":"America/Kentucky/Louisville","America/Lower_Princes":"America/Puerto_Rico","America/Marigot":"America/Puerto_Rico","America/Mendoza":"America/Argentina/Mendoza","America/Montreal":"America/Toronto","America/Montserrat":"America/Puerto_Rico","America/Nassau":"America/Toronto","America/Nipigon":"America/Toronto","America/Pangnirtung":"America/Iqaluit","America/Port_of_Spain":"America/Puerto_Rico","America/Porto_Acre":"America/Rio_Branco","America/Rainy_River":"America/Winnipeg","America/Rosario":"America/Argentina/Cordoba","America/Santa_Isabel":"America/Tijuana","America/Shiprock":"America/Denver","America/St_Barthelemy":"America/Puerto_Rico","America/St_Kitts":"America/Puerto_Rico","America/St_Lucia":"America/Puerto_Rico","America/St_Thomas":"America/Puerto_Rico","America/St_Vincent":"America/Puerto_Rico","America/Thunder_Bay":"America/Toronto","America/Tortola":"America/Puerto_Rico","America/Virgin":"America/Puerto_Rico","America/Yellowknife":"America/Edmonton","Antarctica/DumontDUrville":"Pacific/Port_Moresby","Antarctica/McMurdo":"Pacific/Auckland","Antarctica/South_Pole":"Pacific/Auckland","Antarctica/Syowa":"Asia/Riyadh","Antarctica/Vostok":"Asia/Urumqi","Arctic/Longyearbyen":"Europe/Berlin","Asia/Aden":"Asia/Riyadh","Asia/Ashkhabad":"Asia/Ashgabat","Asia/Bahrain":"Asia/Qatar","Asia/Brunei":"Asia/Kuching","Asia/Calcutta":"Asia/Kolkata","Asia/Chongqing":"Asia/Shanghai","Asia/Chungking":"Asia/Shanghai","Asia/Dacca":"Asia/Dhaka","Asia/Harbin":"Asia/Shanghai","Asia/Istanbul":"Europe/Istanbul","Asia/Kashgar":"Asia/Urumqi","Asia/Katmandu":"Asia/Kathmandu","Asia/Kuala_Lumpur":"Asia/Singapore","Asia/Kuwait":"Asia/Riyadh","Asia/Macao":"Asia/Macau","Asia/Muscat":"Asia/Dubai","Asia/Phnom_Penh":"Asia/Bangkok","Asia/Rangoon":"Asia/Yangon","Asia/Saigon":"Asia/Ho_Chi_Minh","Asia/Tel_Aviv":"Asia/Jerusalem","Asia/Thimbu":"Asia/Thimphu","Asia/Ujung_Pandang":"Asia/Makassar","Asia/Ulan_Bator":"Asia/Ulaanbaatar","Asia/Vientiane":"Asia/Bangkok","Atlantic/Faeroe":"Atlantic/Faroe","Atlantic/Jan_Mayen":"Europe/Berlin","Atlantic/Reykjavik":"Africa/Abidjan","Atlantic/St_Helena":"Africa/Abidjan","Australia/ACT":"Australia/Sydney","Australia/Canberra":"Australia/Sydney","Australia/Currie":"Australia/Hobart","Australia/LHI":"Australia/Lord_Howe","Australia/NSW":"Australia/Sydney","Australia/North":"Australia/Darwin","Australia/Queensland":"Australia/Brisbane","Australia/South":"Australia/Adelaide","Australia/Tasmania":"Australia/Hobart","Australia/Victoria":"Australia/Melbourne","Australia/West":"Australia/Perth","Australia/Yancowinna":"Australia/Broken_Hill","Brazil/Acre":"America/Rio_Branco","Brazil/DeNoronha":"America/Noronha","Brazil/East":"America/Sao_Paulo","Brazil/West":"America/Manaus","Canada/Atlantic":"America/Halifax","Canada/Central":"America/Winnipeg","Canada/Eastern":"America/Toronto","Canada/Mountain":"America/Edmonton","Canada/Newfoundland":"America/St_Johns","Canada/Pacific":"America/Vancouver","Canada/Saskatchewan":"America/Regina","Canada/Yukon":"America/Whitehorse","Chile/Continental":"America/Santiago","Chile/EasterIsland":"Pacific/Easter",Cuba:"America/Havana",Egypt:"Africa/Cairo",Eire:"Europe/Dublin","Etc/GMT+0":"Etc/GMT","Etc/GMT-0":"Etc/GMT","Etc/GMT0":"Etc/GMT","Etc/Greenwich":"Etc/GMT","Etc/UCT":"Etc/UTC","Etc/Universal":"Etc/UTC","Etc/Zulu":"Etc/UTC","Europe/Amsterdam":"Europe/Brussels","Europe/Belfast":"Europe/London","Europe/Bratislava":"Europe/Prague","Europe/Busingen":"Europe/Zurich","Europe/Copenhagen":"Europe/Berlin","Europe/Guernsey":"Europe/London","Europe/Isle_of_Man":"Europe/London","Europe/Jersey":"Europe/London","Europe/Kiev":"Europe/Kyiv","Europe/Ljubljana":"Europe/Belgrade","Europe/Luxembourg":"Europe/Brussels","Europe/Mariehamn":"Europe/Helsinki","Europe/Monaco":"Europe/Paris","Europe/Nicosia":"Asia/Nicosia","Europe/Oslo":"Europe/Berlin","Europe/Podgorica":"Europe/Belgrade","Europe/San_Marino":"Europe/Rome","Europe/Sarajevo":"Europe/Belgrade","Europe/Skopje":"Europe/Belgrade","Europe/Stockholm":"Europe/Berlin","Europe/Tiraspol":"Europe/Chisinau","Europe/Uzhgorod":"Europe/Kyiv","Europe/Vaduz":"Europe/Zurich","Europe/Vatican":"Europe/Rome","Europe/Zagreb":"Europe/Belgrade","Europe/Zaporozhye":"Europe/Kyiv",GB:"Europe/London","GB-Eire":"Europe/London","GMT+0":"Etc/GMT","GMT-0":"Etc/GMT",GMT0:"Etc/GMT",Greenwich:"Etc/GMT",Hongkong:"Asia/Hong_Kong",Iceland:"Africa/Abidjan","Indian/Antananarivo":"Africa/Nairobi","Indian/Christmas":"Asia/Bangkok","Indian/Cocos":"Asia/Yangon","Indian/Comoro":"Africa/Nairobi","Indian/Kerguelen":"Indian/Maldives","Indian/Mahe":"Asia/Dubai","Indian/Mayotte":"Africa/Nairobi","Indian/Reunion":"Asia/Dubai",Iran:"Asia/Tehran",Israel:"Asia/Jerusalem",Jamaica:"America/Jamaica",Japan:"Asia/Tokyo",Kwajalein:"Pacific/Kwajalein",Libya:"Africa/Tripoli","Mexico/BajaNorte":"America/Tijuana","Mexico/BajaSur":"America/Mazatlan","Mexico/General":"America/Mexico_City",NZ:"Pacific/Auckland","NZ-CHAT":"Pacific/Chatham",Navajo:"America/Denver",PRC:"Asia/Shanghai","Pacific/Chuuk":"Pacific/Port_Moresby","Pacific/Enderbury":"Pacific/Kanton","Pacific/Funafuti":"Pacific/Tarawa","Pacific/Johnston":"Pacific/Honolulu","Pacific/Majuro":"Pacific/Tarawa","Pacific/Midway":"Pacific/Pago_Pago","Pacific/Pohnpei":"Pacific/Guadalcanal","Pacific/Ponape":"Pacific/Guadalcanal","Pacific/Saipan":"Pacific/Guam","Pacific/Samoa":"Pacific/Pago_Pago","Pacific/Truk":"Pacific/Port_Moresby","Pacific/Wake":"Pacific/Tarawa","Pacific/Wallis":"Pacific/Tarawa","Pacific/Yap":"Pacific/Port_Moresby",Poland:"Europe/Warsaw",Portugal:"Europe/Lisbon",ROC:"Asia/Taipei",ROK:"Asia/Seoul",Singapore:"Asia/Singapore",Turkey:"Europe/Istanbul",UCT:"Etc/UTC","US/Alaska":"America/Anchorage","US/Aleutian":"America/Adak","US/Arizona":"America/Phoenix","US/Central":"America/Chicago","US/East-Indiana":"America/Indiana/Indianapolis","US/Eastern":"America/New_York","US/Hawaii":"Pacific/Honolulu","US/Indiana-Starke":"America/Indiana/Knox","US/Michigan":"America/Detroit","US/Mountain":"America/Denver","US/Pacific":"America/Los_Angeles","US/Samoa":"Pacific/Pago_Pago",UTC:"Etc/UTC",Universal:"Etc/UTC","W-SU":"Europe/Moscow",Zulu:"Etc/UTC"}},8951:function(e,a,t){"use strict";t(51358),t(46798),t(5239),t(39685),t(98490),Object.defineProperty(a,"__esModule",{value:!0});var r=new WeakMap;a.default=function(e){var a=r.get(e);return a||(a=Object.create(null),r.set(e,a)),a}},10465:function(e,a,t){"use strict";t(65974),t(37313),t(46349),t(70320),t(91989),t(17692),t(46798),t(94570),t(27392),Object.defineProperty(a,"__esModule",{value:!0}),a.unpack=a.pack=void 0;var r=t(43204);a.pack=function(e){var a=Object.keys(e.zones);return a.sort(),{zones:a.map((function(a){return r.__spreadArray([a],e.zones[a].map((function(e){var a=e[0],t=e.slice(1);return r.__spreadArray([""===a?"":a.toString(36)],t,!0).join(",")})),!0).join("|")})),abbrvs:e.abbrvs.join("|"),offsets:e.offsets.map((function(e){return e.toString(36)})).join("|")}},a.unpack=function(e){for(var a=e.abbrvs.split("|"),t=e.offsets.split("|").map((function(e){return parseInt(e,36)})),r={},i=0,o=e.zones;i<o.length;i++){var n=o[i].split("|"),c=n[0],s=n.slice(1);r[c]=s.map((function(e){return e.split(",")})).map((function(e){var r=e[0],i=e[1],o=e[2],n=e[3];return[""===r?-1/0:parseInt(r,36),a[+i],t[+o],"1"===n]}))}return r}},17106:function(e,a,t){"use strict";Object.defineProperty(a,"__esModule",{value:!0}),a.toLocaleTimeString=a.toLocaleDateString=a.toLocaleString=void 0;var r=t(15875),i=t(59811);a.toLocaleString=function(e,a,t){return new r.DateTimeFormat(a,t).format(e)},a.toLocaleDateString=function(e,a,t){return new r.DateTimeFormat(a,(0,i.ToDateTimeOptions)(t,"date","date")).format(e)},a.toLocaleTimeString=function(e,a,t){return new r.DateTimeFormat(a,(0,i.ToDateTimeOptions)(t,"time","time")).format(e)}},3355:function(e,a,t){function r(a){return e.exports=r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,r(a)}t(94738),t(98214),t(46798),t(20254),t(51358),t(5239),t(98490),e.exports=r,e.exports.__esModule=!0,e.exports.default=e.exports},39860:function(e,a,t){"use strict";var r=t(68360).match(/firefox\/(\d+)/i);e.exports=!!r&&+r[1]},93712:function(e,a,t){"use strict";var r=t(68360);e.exports=/MSIE|Trident/.test(r)},82803:function(e,a,t){"use strict";var r=t(68360).match(/AppleWebKit\/(\d+)\./);e.exports=!!r&&+r[1]},37313:function(e,a,t){"use strict";var r=t(68077),i=t(55418),o=t(9160),n=t(19480),c=t(10228),s=t(35102),l=t(11336),u=t(18431),m=t(8273),f=t(54053),d=t(39860),p=t(93712),A=t(91625),g=t(82803),v=[],h=i(v.sort),y=i(v.push),T=u((function(){v.sort(void 0)})),P=u((function(){v.sort(null)})),D=f("sort"),b=!u((function(){if(A)return A<70;if(!(d&&d>3)){if(p)return!0;if(g)return g<603;var e,a,t,r,i="";for(e=65;e<76;e++){switch(a=String.fromCharCode(e),e){case 66:case 69:case 70:case 72:t=3;break;case 68:case 71:t=4;break;default:t=2}for(r=0;r<47;r++)v.push({k:a+r,v:t})}for(v.sort((function(e,a){return a.v-e.v})),r=0;r<v.length;r++)a=v[r].k.charAt(0),i.charAt(i.length-1)!==a&&(i+=a);return"DGBEFHACIJK"!==i}}));r({target:"Array",proto:!0,forced:T||!P||!D||!b},{sort:function(e){void 0!==e&&o(e);var a=n(this);if(b)return void 0===e?h(a):h(a,e);var t,r,i=[],u=c(a);for(r=0;r<u;r++)r in a&&y(i,a[r]);for(m(i,function(e){return function(a,t){return void 0===t?-1:void 0===a?1:void 0!==e?+e(a,t)||0:l(a)>l(t)?1:-1}}(e)),t=c(i),r=0;r<t;)a[r]=i[r++];for(;r<u;)s(a,r++);return a}})}}]);
+//# sourceMappingURL=6554.R_iL7UM046Q.js.map
\ No newline at end of file
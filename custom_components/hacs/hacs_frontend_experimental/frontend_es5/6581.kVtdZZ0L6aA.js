@@ -0,0 +1,3 @@
+/*! For license information please see 6581.kVtdZZ0L6aA.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6581],{88811:function(t,e,i){var n=i(68077),r=i(5813),o=i(67933),a=i(36929),s="ArrayBuffer",c=o[s];n({global:!0,constructor:!0,forced:r[s]!==c},{ArrayBuffer:c}),a(s)},71779:function(t,e,i){var n=i(5813),r=i(58849),o=i(40030),a=i(85891),s=i(18431),c=n.RegExp,l=c.prototype;r&&s((function(){var t=!0;try{c(".","d")}catch(s){t=!1}var e={},i="",n=t?"dgimsy":"gimsy",r=function(t,n){Object.defineProperty(e,t,{get:function(){return i+=n,!0}})},o={dotAll:"s",global:"g",ignoreCase:"i",multiline:"m",sticky:"y"};for(var a in t&&(o.hasIndices="d"),o)r(a,o[a]);return Object.getOwnPropertyDescriptor(l,"flags").get.call(e)!==n||i!==n}))&&o(l,"flags",{configurable:!0,get:a})},69222:function(t,e,i){var n=i(33368),r=i(71650),o=i(68308),a=i(69205),s=i(43204),c=i(95260),l=i(5095),u=function(t){function e(){var t;return(0,r.Z)(this,e),(t=(0,o.Z)(this,e,arguments)).inset=!1,t.insetStart=!1,t.insetEnd=!1,t}return(0,a.Z)(e,t),(0,n.Z)(e)}(l.oi);(0,s.__decorate)([(0,c.Cb)({type:Boolean,reflect:!0})],u.prototype,"inset",void 0),(0,s.__decorate)([(0,c.Cb)({type:Boolean,reflect:!0,attribute:"inset-start"})],u.prototype,"insetStart",void 0),(0,s.__decorate)([(0,c.Cb)({type:Boolean,reflect:!0,attribute:"inset-end"})],u.prototype,"insetEnd",void 0);var h,d=i(88962),f=(0,l.iv)(h||(h=(0,d.Z)([':host{--_color:var(--md-divider-color, var(--md-sys-color-outline-variant, #cac4d0));--_thickness:var(--md-divider-thickness, 1px);box-sizing:border-box;color:var(--_color);display:flex;height:var(--_thickness);width:100%}:host([inset-start]),:host([inset]){padding-inline-start:16px}:host([inset-end]),:host([inset]){padding-inline-end:16px}:host::before{background:currentColor;content:"";height:100%;width:100%}@media(forced-colors:active){:host::before{background:CanvasText}}']))),v=function(t){function e(){return(0,r.Z)(this,e),(0,o.Z)(this,e,arguments)}return(0,a.Z)(e,t),(0,n.Z)(e)}(u);v.styles=[f],v=(0,s.__decorate)([(0,c.Mo)("md-divider")],v)},74496:function(t,e,i){i.d(e,{B3:function(){return s},CL:function(){return a},PQ:function(){return r},Rn:function(){return l},dl:function(){return o},oh:function(){return u},xZ:function(){return c}});var n=i(40039);function r(t){var e=s(t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:h);return e&&(e.tabIndex=0,e.focus()),e}function o(t){var e=function(t){for(var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:h,i=t.length-1;i>=0;i--){var n=t[i];if(e(n))return n}return null}(t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:h);return e&&(e.tabIndex=0,e.focus()),e}function a(t){for(var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:h,i=0;i<t.length;i++){var n=t[i];if(0===n.tabIndex&&e(n))return{item:n,index:i}}return null}function s(t){var e,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:h,r=(0,n.Z)(t);try{for(r.s();!(e=r.n()).done;){var o=e.value;if(i(o))return o}}catch(a){r.e(a)}finally{r.f()}return null}function c(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:h;if(e){var n=function(t,e){for(var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:h,n=1;n<t.length;n++){var r=t[(n+e)%t.length];if(i(r))return r}return t[e]?t[e]:null}(t,e.index,i);return n&&(n.tabIndex=0,n.focus()),n}return r(t,i)}function l(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:h;if(e){var n=function(t,e){for(var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:h,n=1;n<t.length;n++){var r=t[(e-n+t.length)%t.length];if(i(r))return r}return t[e]?t[e]:null}(t,e.index,i);return n&&(n.tabIndex=0,n.focus()),n}return o(t,i)}function u(){return new Event("request-activation",{bubbles:!0,composed:!0})}function h(t){return!t.disabled}},76507:function(t,e,i){i.d(e,{g:function(){return B}});var n,r,o=i(33368),a=i(71650),s=i(68308),c=i(69205),l=i(43204),u=i(95260),h=i(88962),d=i(34541),f=i(47838),v=(i(85717),i(86477),i(40039)),g=(i(63789),i(18098),i(5095)),m=function(t){function e(){var t;return(0,a.Z)(this,e),(t=(0,s.Z)(this,e,arguments)).multiline=!1,t}return(0,c.Z)(e,t),(0,o.Z)(e,[{key:"render",value:function(){return(0,g.dy)(n||(n=(0,h.Z)([' <slot name="container"></slot> <slot class="non-text" name="start"></slot> <div class="text"> <slot name="overline" @slotchange="','"></slot> <slot class="default-slot" @slotchange="','"></slot> <slot name="headline" @slotchange="','"></slot> <slot name="supporting-text" @slotchange="','"></slot> </div> <slot class="non-text" name="trailing-supporting-text"></slot> <slot class="non-text" name="end"></slot> '])),this.handleTextSlotChange,this.handleTextSlotChange,this.handleTextSlotChange,this.handleTextSlotChange)}},{key:"handleTextSlotChange",value:function(){var t,e=!1,i=0,n=(0,v.Z)(this.textSlots);try{for(n.s();!(t=n.n()).done;){if(p(t.value)&&(i+=1),i>1){e=!0;break}}}catch(r){n.e(r)}finally{n.f()}this.multiline=e}}]),e}(g.oi);function p(t){var e,i=(0,v.Z)(t.assignedNodes({flatten:!0}));try{for(i.s();!(e=i.n()).done;){var n,r=e.value,o=r.nodeType===Node.ELEMENT_NODE,a=r.nodeType===Node.TEXT_NODE&&(null===(n=r.textContent)||void 0===n?void 0:n.match(/\S/));if(o||a)return!0}}catch(s){i.e(s)}finally{i.f()}return!1}(0,l.__decorate)([(0,u.Cb)({type:Boolean,reflect:!0})],m.prototype,"multiline",void 0),(0,l.__decorate)([(0,u.Kt)(".text slot")],m.prototype,"textSlots",void 0);var y=(0,g.iv)(r||(r=(0,h.Z)([":host{color:var(--md-sys-color-on-surface,#1d1b20);font-family:var(--md-sys-typescale-body-large-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-body-large-size, 1rem);font-weight:var(--md-sys-typescale-body-large-weight,var(--md-ref-typeface-weight-regular,400));line-height:var(--md-sys-typescale-body-large-line-height, 1.5rem);align-items:center;box-sizing:border-box;display:flex;gap:16px;min-height:56px;overflow:hidden;padding:12px 16px;position:relative;text-overflow:ellipsis}:host([multiline]){min-height:72px}[name=overline]{color:var(--md-sys-color-on-surface-variant,#49454f);font-family:var(--md-sys-typescale-label-small-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-label-small-size, .6875rem);font-weight:var(--md-sys-typescale-label-small-weight,var(--md-ref-typeface-weight-medium,500));line-height:var(--md-sys-typescale-label-small-line-height, 1rem)}[name=supporting-text]{color:var(--md-sys-color-on-surface-variant,#49454f);font-family:var(--md-sys-typescale-body-medium-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-body-medium-size, .875rem);font-weight:var(--md-sys-typescale-body-medium-weight,var(--md-ref-typeface-weight-regular,400));line-height:var(--md-sys-typescale-body-medium-line-height, 1.25rem)}[name=trailing-supporting-text]{color:var(--md-sys-color-on-surface-variant,#49454f);font-family:var(--md-sys-typescale-label-small-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-label-small-size, .6875rem);font-weight:var(--md-sys-typescale-label-small-weight,var(--md-ref-typeface-weight-medium,500));line-height:var(--md-sys-typescale-label-small-line-height, 1rem)}[name=container]::slotted(*){inset:0;position:absolute}.default-slot{display:inline}.default-slot,.text ::slotted(*){overflow:hidden;text-overflow:ellipsis}.text{display:flex;flex:1;flex-direction:column;overflow:hidden}"]))),b=function(t){function e(){return(0,a.Z)(this,e),(0,s.Z)(this,e,arguments)}return(0,c.Z)(e,t),(0,o.Z)(e)}(m);b.styles=[y],b=(0,l.__decorate)([(0,u.Mo)("md-item")],b);i(35981);var x,k,Z,w,M,_,I,L,C,A=i(53180),S=i(46097),R=(i(94738),i(98214),i(46798),i(34997),i(9849),i(12148),i(51467),i(51358),i(96043),i(5239),i(98490),i(36513),i(91989),i(97393),i(32982)),E=Symbol.for(""),$=function(t){if((null==t?void 0:t.r)===E)return null==t?void 0:t._$litStatic$},N=function(t){for(var e=arguments.length,i=new Array(e>1?e-1:0),n=1;n<e;n++)i[n-1]=arguments[n];return{_$litStatic$:i.reduce((function(e,i,n){return e+function(t){if(void 0!==t._$litStatic$)return t._$litStatic$;throw Error("Value passed to 'literal' function must be a 'literal' result: ".concat(t,". Use 'unsafeStatic' to pass non-literal values, but\n            take care to ensure page security."))}(i)+t[n+1]}),t[0]),r:E}},F=new Map,O=function(t){return function(e){for(var i=arguments.length,n=new Array(i>1?i-1:0),r=1;r<i;r++)n[r-1]=arguments[r];for(var o,a,s,c=n.length,l=[],u=[],h=0,d=!1;h<c;){for(s=e[h];h<c&&void 0!==(a=n[h],o=$(a));)s+=o+e[++h],d=!0;h!==c&&u.push(a),l.push(s),h++}if(h===c&&l.push(e[c]),d){var f=l.join("$$lit$$");void 0===(e=F.get(f))&&(l.raw=l,F.set(f,e=l)),n=u}return t.apply(void 0,[e].concat((0,S.Z)(n)))}},j=O(R.dy),z=(O(R.YP),i(6157)),P=i(74496),D=function(t){function e(){var t;return(0,a.Z)(this,e),(t=(0,s.Z)(this,e,arguments)).disabled=!1,t.type="text",t.isListItem=!0,t.href="",t.target="",t}return(0,c.Z)(e,t),(0,o.Z)(e,[{key:"isDisabled",get:function(){return this.disabled&&"link"!==this.type}},{key:"willUpdate",value:function(t){this.href&&(this.type="link"),(0,d.Z)((0,f.Z)(e.prototype),"willUpdate",this).call(this,t)}},{key:"render",value:function(){return this.renderListItem((0,g.dy)(x||(x=(0,h.Z)([' <md-item> <div slot="container"> '," ",' </div> <slot name="start" slot="start"></slot> <slot name="end" slot="end"></slot> '," </md-item> "])),this.renderRipple(),this.renderFocusRing(),this.renderBody()))}},{key:"renderListItem",value:function(t){var e,i="link"===this.type;switch(this.type){case"link":e=N(k||(k=(0,h.Z)(["a"])));break;case"button":e=N(Z||(Z=(0,h.Z)(["button"])));break;default:e=N(w||(w=(0,h.Z)(["li"])))}var n="text"!==this.type,r=i&&this.target?this.target:g.Ld;return j(M||(M=(0,h.Z)(["\n      <",'\n        id="item"\n        tabindex="','"\n        ?disabled=','\n        role="listitem"\n        aria-selected=',"\n        aria-checked=","\n        aria-expanded=","\n        aria-haspopup=",'\n        class="list-item ','"\n        href=',"\n        target=","\n        @focus=","\n      >","</",">\n    "])),e,this.isDisabled||!n?-1:0,this.isDisabled,this.ariaSelected||g.Ld,this.ariaChecked||g.Ld,this.ariaExpanded||g.Ld,this.ariaHasPopup||g.Ld,(0,A.$)(this.getRenderClasses()),this.href||g.Ld,r,this.onFocus,t,e)}},{key:"renderRipple",value:function(){return"text"===this.type?g.Ld:(0,g.dy)(_||(_=(0,h.Z)([' <md-ripple part="ripple" for="item" ?disabled="','"></md-ripple>'])),this.isDisabled)}},{key:"renderFocusRing",value:function(){return"text"===this.type?g.Ld:(0,g.dy)(I||(I=(0,h.Z)([' <md-focus-ring @visibility-changed="','" part="focus-ring" for="item" inward></md-focus-ring>'])),this.onFocusRingVisibilityChanged)}},{key:"onFocusRingVisibilityChanged",value:function(t){}},{key:"getRenderClasses",value:function(){return{disabled:this.isDisabled}}},{key:"renderBody",value:function(){return(0,g.dy)(L||(L=(0,h.Z)([' <slot></slot> <slot name="overline" slot="overline"></slot> <slot name="headline" slot="headline"></slot> <slot name="supporting-text" slot="supporting-text"></slot> <slot name="trailing-supporting-text" slot="trailing-supporting-text"></slot> '])))}},{key:"onFocus",value:function(){-1===this.tabIndex&&this.dispatchEvent((0,P.oh)())}},{key:"focus",value:function(){var t;null===(t=this.listItemRoot)||void 0===t||t.focus()}}]),e}(g.oi);(0,z.d)(D),D.shadowRootOptions=Object.assign(Object.assign({},g.oi.shadowRootOptions),{},{delegatesFocus:!0}),(0,l.__decorate)([(0,u.Cb)({type:Boolean,reflect:!0})],D.prototype,"disabled",void 0),(0,l.__decorate)([(0,u.Cb)({reflect:!0})],D.prototype,"type",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean,attribute:"md-list-item",reflect:!0})],D.prototype,"isListItem",void 0),(0,l.__decorate)([(0,u.Cb)()],D.prototype,"href",void 0),(0,l.__decorate)([(0,u.Cb)()],D.prototype,"target",void 0),(0,l.__decorate)([(0,u.IO)(".list-item")],D.prototype,"listItemRoot",void 0);var W=(0,g.iv)(C||(C=(0,h.Z)([":host{display:flex;-webkit-tap-highlight-color:transparent;--md-ripple-hover-color:var(--md-list-item-hover-state-layer-color, var(--md-sys-color-on-surface, #1d1b20));--md-ripple-hover-opacity:var(--md-list-item-hover-state-layer-opacity, 0.08);--md-ripple-pressed-color:var(--md-list-item-pressed-state-layer-color, var(--md-sys-color-on-surface, #1d1b20));--md-ripple-pressed-opacity:var(--md-list-item-pressed-state-layer-opacity, 0.12)}:host(:is([type=button]:not([disabled]),[type=link])){cursor:pointer}md-focus-ring{z-index:1;--md-focus-ring-shape:8px}a,button,li{background:0 0;border:none;cursor:inherit;padding:0;margin:0;text-align:unset;text-decoration:none}.list-item{border-radius:inherit;display:flex;flex:1;max-width:inherit;min-width:inherit;outline:0;-webkit-tap-highlight-color:transparent;width:100%}.list-item.interactive{cursor:pointer}.list-item.disabled{opacity:var(--md-list-item-disabled-opacity, .3);pointer-events:none}[slot=container]{pointer-events:none}md-ripple{border-radius:inherit}md-item{border-radius:inherit;flex:1;height:100%;color:var(--md-list-item-label-text-color,var(--md-sys-color-on-surface,#1d1b20));font-family:var(--md-list-item-label-text-font, var(--md-sys-typescale-body-large-font, var(--md-ref-typeface-plain, Roboto)));font-size:var(--md-list-item-label-text-size, var(--md-sys-typescale-body-large-size, 1rem));line-height:var(--md-list-item-label-text-line-height, var(--md-sys-typescale-body-large-line-height, 1.5rem));font-weight:var(--md-list-item-label-text-weight,var(--md-sys-typescale-body-large-weight,var(--md-ref-typeface-weight-regular,400)));min-height:var(--md-list-item-one-line-container-height,56px);padding-top:var(--md-list-item-top-space,12px);padding-bottom:var(--md-list-item-bottom-space,12px);padding-inline-start:var(--md-list-item-leading-space,16px);padding-inline-end:var(--md-list-item-trailing-space,16px)}md-item[multiline]{min-height:var(--md-list-item-two-line-container-height,72px)}[slot=supporting-text]{color:var(--md-list-item-supporting-text-color,var(--md-sys-color-on-surface-variant,#49454f));font-family:var(--md-list-item-supporting-text-font, var(--md-sys-typescale-body-medium-font, var(--md-ref-typeface-plain, Roboto)));font-size:var(--md-list-item-supporting-text-size, var(--md-sys-typescale-body-medium-size, .875rem));line-height:var(--md-list-item-supporting-text-line-height, var(--md-sys-typescale-body-medium-line-height, 1.25rem));font-weight:var(--md-list-item-supporting-text-weight,var(--md-sys-typescale-body-medium-weight,var(--md-ref-typeface-weight-regular,400)))}[slot=trailing-supporting-text]{color:var(--md-list-item-trailing-supporting-text-color,var(--md-sys-color-on-surface-variant,#49454f));font-family:var(--md-list-item-trailing-supporting-text-font, var(--md-sys-typescale-label-small-font, var(--md-ref-typeface-plain, Roboto)));font-size:var(--md-list-item-trailing-supporting-text-size, var(--md-sys-typescale-label-small-size, .6875rem));line-height:var(--md-list-item-trailing-supporting-text-line-height, var(--md-sys-typescale-label-small-line-height, 1rem));font-weight:var(--md-list-item-trailing-supporting-text-weight,var(--md-sys-typescale-label-small-weight,var(--md-ref-typeface-weight-medium,500)))}:is([slot=start],[slot=end])::slotted(*){fill:currentColor}[slot=start]{color:var(--md-list-item-leading-icon-color,var(--md-sys-color-on-surface-variant,#49454f))}[slot=end]{color:var(--md-list-item-trailing-icon-color,var(--md-sys-color-on-surface-variant,#49454f))}@media(forced-colors:active){.disabled slot{color:GrayText}.list-item.disabled{color:GrayText;opacity:1}}"]))),B=function(t){function e(){return(0,a.Z)(this,e),(0,s.Z)(this,e,arguments)}return(0,c.Z)(e,t),(0,o.Z)(e)}(D);B.styles=[W],B=(0,l.__decorate)([(0,u.Mo)("md-list-item")],B)},40298:function(t,e,i){i.d(e,{j:function(){return k}});var n,r,o=i(33368),a=i(71650),s=i(68308),c=i(69205),l=i(43204),u=i(95260),h=i(88962),d=i(82390),f=(i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(10733),i(5095)),v=i(40039),g=(i(36513),i(74496)),m={ArrowDown:"ArrowDown",ArrowLeft:"ArrowLeft",ArrowUp:"ArrowUp",ArrowRight:"ArrowRight",Home:"Home",End:"End"},p=function(){function t(e){var i=this;(0,a.Z)(this,t),this.handleKeydown=function(t){var e=t.key;if(!t.defaultPrevented&&i.isNavigableKey(e)){var n=i.items;if(n.length){var r=(0,g.CL)(n,i.isActivatable);r&&(r.item.tabIndex=-1),t.preventDefault();var o=i.isRtl();switch(e){case m.ArrowDown:case o?m.ArrowLeft:m.ArrowRight:(0,g.xZ)(n,r,i.isActivatable);break;case m.ArrowUp:case o?m.ArrowRight:m.ArrowLeft:(0,g.Rn)(n,r,i.isActivatable);break;case m.Home:(0,g.PQ)(n,i.isActivatable);break;case m.End:(0,g.dl)(n,i.isActivatable)}}}},this.onDeactivateItems=function(){var t,e=i.items,n=(0,v.Z)(e);try{for(n.s();!(t=n.n()).done;){var r=t.value;i.deactivateItem(r)}}catch(o){n.e(o)}finally{n.f()}},this.onRequestActivation=function(t){i.onDeactivateItems();var e=t.target;i.activateItem(e),e.focus()},this.onSlotchange=function(){var t,e=i.items,n=!1,r=(0,v.Z)(e);try{for(r.s();!(t=r.n()).done;){var o=t.value;!(!o.disabled&&o.tabIndex>-1)||n?o.tabIndex=-1:(n=!0,o.tabIndex=0)}}catch(s){r.e(s)}finally{r.f()}if(!n){var a=(0,g.B3)(e,i.isActivatable);a&&(a.tabIndex=0)}};var n=e.isItem,r=e.getPossibleItems,o=e.isRtl,s=e.deactivateItem,c=e.activateItem,l=e.isNavigableKey,u=e.isActivatable;this.isItem=n,this.getPossibleItems=r,this.isRtl=o,this.deactivateItem=s,this.activateItem=c,this.isNavigableKey=l,this.isActivatable=u}return(0,o.Z)(t,[{key:"items",get:function(){var t,e=this.getPossibleItems(),i=[],n=(0,v.Z)(e);try{for(n.s();!(t=n.n()).done;){var r=t.value;if(this.isItem(r))i.push(r);else{var o=r.item;o&&this.isItem(o)&&i.push(o)}}}catch(a){n.e(a)}finally{n.f()}return i}},{key:"activateNextItem",value:function(){var t=this.items,e=(0,g.CL)(t,this.isActivatable);return e&&(e.item.tabIndex=-1),(0,g.xZ)(t,e,this.isActivatable)}},{key:"activatePreviousItem",value:function(){var t=this.items,e=(0,g.CL)(t,this.isActivatable);return e&&(e.item.tabIndex=-1),(0,g.Rn)(t,e,this.isActivatable)}}]),t}(),y=new Set(Object.values(m)),b=function(t){function e(){var t;return(0,a.Z)(this,e),(t=(0,s.Z)(this,e)).listController=new p({isItem:function(t){return t.hasAttribute("md-list-item")},getPossibleItems:function(){return t.slotItems},isRtl:function(){return"rtl"===getComputedStyle((0,d.Z)(t)).direction},deactivateItem:function(t){t.tabIndex=-1},activateItem:function(t){t.tabIndex=0},isNavigableKey:function(t){return y.has(t)},isActivatable:function(t){return!t.disabled&&"text"!==t.type}}),t.internals=t.attachInternals(),f.sk||(t.internals.role="list",t.addEventListener("keydown",t.listController.handleKeydown)),t}return(0,c.Z)(e,t),(0,o.Z)(e,[{key:"items",get:function(){return this.listController.items}},{key:"render",value:function(){return(0,f.dy)(n||(n=(0,h.Z)([' <slot @deactivate-items="','" @request-activation="','" @slotchange="','"> </slot> '])),this.listController.onDeactivateItems,this.listController.onRequestActivation,this.listController.onSlotchange)}},{key:"activateNextItem",value:function(){return this.listController.activateNextItem()}},{key:"activatePreviousItem",value:function(){return this.listController.activatePreviousItem()}}]),e}(f.oi);(0,l.__decorate)([(0,u.NH)({flatten:!0})],b.prototype,"slotItems",void 0);var x=(0,f.iv)(r||(r=(0,h.Z)([":host{background:var(--md-list-container-color,var(--md-sys-color-surface,#fef7ff));color:unset;display:flex;flex-direction:column;outline:0;padding:8px 0;position:relative}"]))),k=function(t){function e(){return(0,a.Z)(this,e),(0,s.Z)(this,e,arguments)}return(0,c.Z)(e,t),(0,o.Z)(e)}(b);k.styles=[x],k=(0,l.__decorate)([(0,u.Mo)("md-list")],k)},11994:function(t,e,i){i.d(e,{Z:function(){return lt}});var n=i(93359),r=i(68308),o=i(69205),a=i(46097),s=i(71650),c=i(33368),l=i(76775);i(11451),i(46798),i(94570),i(9849),i(50289),i(94167),i(36513),i(88770),i(51467),i(22859),i(91989),i(85717),i(51358),i(96043),i(5239),i(98490),i(63789),i(18098),i(67712),i(41353),i(46349),i(70320),i(56308),i(97393),i(88640),i(2094),i(57778),i(87438),i(22890),i(78399),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(35221),i(65974),i(34281),i(76843),i(37313),i(17692);function u(t){return Array.isArray?Array.isArray(t):"[object Array]"===b(t)}var h=1/0;function d(t){return null==t?"":function(t){if("string"==typeof t)return t;var e=t+"";return"0"==e&&1/t==-h?"-0":e}(t)}function f(t){return"string"==typeof t}function v(t){return"number"==typeof t}function g(t){return!0===t||!1===t||function(t){return m(t)&&null!==t}(t)&&"[object Boolean]"==b(t)}function m(t){return"object"===(0,l.Z)(t)}function p(t){return null!=t}function y(t){return!t.trim().length}function b(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":Object.prototype.toString.call(t)}var x=function(t){return"Missing ".concat(t," property in key")},k=function(t){return"Property 'weight' in key '".concat(t,"' must be a positive integer")},Z=Object.prototype.hasOwnProperty,w=function(){function t(e){var i=this;(0,s.Z)(this,t),this._keys=[],this._keyMap={};var n=0;e.forEach((function(t){var e=M(t);i._keys.push(e),i._keyMap[e.id]=e,n+=e.weight})),this._keys.forEach((function(t){t.weight/=n}))}return(0,c.Z)(t,[{key:"get",value:function(t){return this._keyMap[t]}},{key:"keys",value:function(){return this._keys}},{key:"toJSON",value:function(){return JSON.stringify(this._keys)}}]),t}();function M(t){var e=null,i=null,n=null,r=1,o=null;if(f(t)||u(t))n=t,e=_(t),i=I(t);else{if(!Z.call(t,"name"))throw new Error(x("name"));var a=t.name;if(n=a,Z.call(t,"weight")&&(r=t.weight)<=0)throw new Error(k(a));e=_(a),i=I(a),o=t.getFn}return{path:e,id:i,weight:r,src:n,getFn:o}}function _(t){return u(t)?t:t.split(".")}function I(t){return u(t)?t.join("."):t}var L={useExtendedSearch:!1,getFn:function(t,e){var i=[],n=!1;return function t(e,r,o){if(p(e))if(r[o]){var a=e[r[o]];if(!p(a))return;if(o===r.length-1&&(f(a)||v(a)||g(a)))i.push(d(a));else if(u(a)){n=!0;for(var s=0,c=a.length;s<c;s+=1)t(a[s],r,o+1)}else r.length&&t(a,r,o+1)}else i.push(e)}(t,f(e)?e.split("."):e,0),n?i:i[0]},ignoreLocation:!1,ignoreFieldNorm:!1,fieldNormWeight:1},C=Object.assign(Object.assign(Object.assign(Object.assign({},{isCaseSensitive:!1,includeScore:!1,keys:[],shouldSort:!0,sortFn:function(t,e){return t.score===e.score?t.idx<e.idx?-1:1:t.score<e.score?-1:1}}),{includeMatches:!1,findAllMatches:!1,minMatchCharLength:1}),{location:0,threshold:.6,distance:100}),L),A=/[^ ]+/g;var S=function(){function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},i=e.getFn,n=void 0===i?C.getFn:i,r=e.fieldNormWeight,o=void 0===r?C.fieldNormWeight:r;(0,s.Z)(this,t),this.norm=function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1,e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:3,i=new Map,n=Math.pow(10,e);return{get:function(e){var r=e.match(A).length;if(i.has(r))return i.get(r);var o=1/Math.pow(r,.5*t),a=parseFloat(Math.round(o*n)/n);return i.set(r,a),a},clear:function(){i.clear()}}}(o,3),this.getFn=n,this.isCreated=!1,this.setIndexRecords()}return(0,c.Z)(t,[{key:"setSources",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[];this.docs=t}},{key:"setIndexRecords",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[];this.records=t}},{key:"setKeys",value:function(){var t=this,e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[];this.keys=e,this._keysMap={},e.forEach((function(e,i){t._keysMap[e.id]=i}))}},{key:"create",value:function(){var t=this;!this.isCreated&&this.docs.length&&(this.isCreated=!0,f(this.docs[0])?this.docs.forEach((function(e,i){t._addString(e,i)})):this.docs.forEach((function(e,i){t._addObject(e,i)})),this.norm.clear())}},{key:"add",value:function(t){var e=this.size();f(t)?this._addString(t,e):this._addObject(t,e)}},{key:"removeAt",value:function(t){this.records.splice(t,1);for(var e=t,i=this.size();e<i;e+=1)this.records[e].i-=1}},{key:"getValueForItemAtKeyId",value:function(t,e){return t[this._keysMap[e]]}},{key:"size",value:function(){return this.records.length}},{key:"_addString",value:function(t,e){if(p(t)&&!y(t)){var i={v:t,i:e,n:this.norm.get(t)};this.records.push(i)}}},{key:"_addObject",value:function(t,e){var i=this,n={i:e,$:{}};this.keys.forEach((function(e,r){var o=e.getFn?e.getFn(t):i.getFn(t,e.path);if(p(o))if(u(o)){for(var a=[],s=[{nestedArrIndex:-1,value:o}];s.length;){var c=s.pop(),l=c.nestedArrIndex,h=c.value;if(p(h))if(f(h)&&!y(h)){var d={v:h,i:l,n:i.norm.get(h)};a.push(d)}else u(h)&&h.forEach((function(t,e){s.push({nestedArrIndex:e,value:t})}))}n.$[r]=a}else if(f(o)&&!y(o)){var v={v:o,n:i.norm.get(o)};n.$[r]=v}})),this.records.push(n)}},{key:"toJSON",value:function(){return{keys:this.keys,records:this.records}}}]),t}();function R(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},n=i.getFn,r=void 0===n?C.getFn:n,o=i.fieldNormWeight,a=void 0===o?C.fieldNormWeight:o,s=new S({getFn:r,fieldNormWeight:a});return s.setKeys(t.map(M)),s.setSources(e),s.create(),s}function E(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},i=e.errors,n=void 0===i?0:i,r=e.currentLocation,o=void 0===r?0:r,a=e.expectedLocation,s=void 0===a?0:a,c=e.distance,l=void 0===c?C.distance:c,u=e.ignoreLocation,h=void 0===u?C.ignoreLocation:u,d=n/t.length;if(h)return d;var f=Math.abs(s-o);return l?d+f/l:f?1:d}var $=32;function N(t,e,i){var n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},r=n.location,o=void 0===r?C.location:r,a=n.distance,s=void 0===a?C.distance:a,c=n.threshold,l=void 0===c?C.threshold:c,u=n.findAllMatches,h=void 0===u?C.findAllMatches:u,d=n.minMatchCharLength,f=void 0===d?C.minMatchCharLength:d,v=n.includeMatches,g=void 0===v?C.includeMatches:v,m=n.ignoreLocation,p=void 0===m?C.ignoreLocation:m;if(e.length>$)throw new Error("Pattern length exceeds max of ".concat($,"."));for(var y,b=e.length,x=t.length,k=Math.max(0,Math.min(o,x)),Z=l,w=k,M=f>1||g,_=M?Array(x):[];(y=t.indexOf(e,w))>-1;){var I=E(e,{currentLocation:y,expectedLocation:k,distance:s,ignoreLocation:p});if(Z=Math.min(I,Z),w=y+b,M)for(var L=0;L<b;)_[y+L]=1,L+=1}w=-1;for(var A=[],S=1,R=b+x,N=1<<b-1,F=0;F<b;F+=1){for(var O=0,j=R;O<j;){E(e,{errors:F,currentLocation:k+j,expectedLocation:k,distance:s,ignoreLocation:p})<=Z?O=j:R=j,j=Math.floor((R-O)/2+O)}R=j;var z=Math.max(1,k-j+1),P=h?x:Math.min(k+j,x)+b,D=Array(P+2);D[P+1]=(1<<F)-1;for(var W=P;W>=z;W-=1){var B=W-1,T=i[t.charAt(B)];if(M&&(_[B]=+!!T),D[W]=(D[W+1]<<1|1)&T,F&&(D[W]|=(A[W+1]|A[W])<<1|1|A[W+1]),D[W]&N&&(S=E(e,{errors:F,currentLocation:B,expectedLocation:k,distance:s,ignoreLocation:p}))<=Z){if(Z=S,(w=B)<=k)break;z=Math.max(1,2*k-w)}}if(E(e,{errors:F+1,currentLocation:k,expectedLocation:k,distance:s,ignoreLocation:p})>Z)break;A=D}var K={isMatch:w>=0,score:Math.max(.001,S)};if(M){var q=function(){for(var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:C.minMatchCharLength,i=[],n=-1,r=-1,o=0,a=t.length;o<a;o+=1){var s=t[o];s&&-1===n?n=o:s||-1===n||((r=o-1)-n+1>=e&&i.push([n,r]),n=-1)}return t[o-1]&&o-n>=e&&i.push([n,o-1]),i}(_,f);q.length?g&&(K.indices=q):K.isMatch=!1}return K}function F(t){for(var e={},i=0,n=t.length;i<n;i+=1){var r=t.charAt(i);e[r]=(e[r]||0)|1<<n-i-1}return e}var O=function(){function t(e){var i=this,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=n.location,o=void 0===r?C.location:r,a=n.threshold,c=void 0===a?C.threshold:a,l=n.distance,u=void 0===l?C.distance:l,h=n.includeMatches,d=void 0===h?C.includeMatches:h,f=n.findAllMatches,v=void 0===f?C.findAllMatches:f,g=n.minMatchCharLength,m=void 0===g?C.minMatchCharLength:g,p=n.isCaseSensitive,y=void 0===p?C.isCaseSensitive:p,b=n.ignoreLocation,x=void 0===b?C.ignoreLocation:b;if((0,s.Z)(this,t),this.options={location:o,threshold:c,distance:u,includeMatches:d,findAllMatches:v,minMatchCharLength:m,isCaseSensitive:y,ignoreLocation:x},this.pattern=y?e:e.toLowerCase(),this.chunks=[],this.pattern.length){var k=function(t,e){i.chunks.push({pattern:t,alphabet:F(t),startIndex:e})},Z=this.pattern.length;if(Z>$){for(var w=0,M=Z%$,_=Z-M;w<_;)k(this.pattern.substr(w,$),w),w+=$;if(M){var I=Z-$;k(this.pattern.substr(I),I)}}else k(this.pattern,0)}}return(0,c.Z)(t,[{key:"searchIn",value:function(t){var e=this.options,i=e.isCaseSensitive,n=e.includeMatches;if(i||(t=t.toLowerCase()),this.pattern===t){var r={isMatch:!0,score:0};return n&&(r.indices=[[0,t.length-1]]),r}var o=this.options,s=o.location,c=o.distance,l=o.threshold,u=o.findAllMatches,h=o.minMatchCharLength,d=o.ignoreLocation,f=[],v=0,g=!1;this.chunks.forEach((function(e){var i=e.pattern,r=e.alphabet,o=e.startIndex,m=N(t,i,r,{location:s+o,distance:c,threshold:l,findAllMatches:u,minMatchCharLength:h,includeMatches:n,ignoreLocation:d}),p=m.isMatch,y=m.score,b=m.indices;p&&(g=!0),v+=y,p&&b&&(f=[].concat((0,a.Z)(f),(0,a.Z)(b)))}));var m={isMatch:g,score:g?v/this.chunks.length:1};return g&&n&&(m.indices=f),m}}]),t}(),j=function(){function t(e){(0,s.Z)(this,t),this.pattern=e}return(0,c.Z)(t,[{key:"search",value:function(){}}],[{key:"isMultiMatch",value:function(t){return z(t,this.multiRegex)}},{key:"isSingleMatch",value:function(t){return z(t,this.singleRegex)}}]),t}();function z(t,e){var i=t.match(e);return i?i[1]:null}var P=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){var e=t===this.pattern;return{isMatch:e,score:e?0:1,indices:[0,this.pattern.length-1]}}}],[{key:"type",get:function(){return"exact"}},{key:"multiRegex",get:function(){return/^="(.*)"$/}},{key:"singleRegex",get:function(){return/^=(.*)$/}}]),e}(j),D=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){var e=-1===t.indexOf(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,t.length-1]}}}],[{key:"type",get:function(){return"inverse-exact"}},{key:"multiRegex",get:function(){return/^!"(.*)"$/}},{key:"singleRegex",get:function(){return/^!(.*)$/}}]),e}(j),W=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){var e=t.startsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,this.pattern.length-1]}}}],[{key:"type",get:function(){return"prefix-exact"}},{key:"multiRegex",get:function(){return/^\^"(.*)"$/}},{key:"singleRegex",get:function(){return/^\^(.*)$/}}]),e}(j),B=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){var e=!t.startsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,t.length-1]}}}],[{key:"type",get:function(){return"inverse-prefix-exact"}},{key:"multiRegex",get:function(){return/^!\^"(.*)"$/}},{key:"singleRegex",get:function(){return/^!\^(.*)$/}}]),e}(j),T=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){var e=t.endsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[t.length-this.pattern.length,t.length-1]}}}],[{key:"type",get:function(){return"suffix-exact"}},{key:"multiRegex",get:function(){return/^"(.*)"\$$/}},{key:"singleRegex",get:function(){return/^(.*)\$$/}}]),e}(j),K=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){var e=!t.endsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,t.length-1]}}}],[{key:"type",get:function(){return"inverse-suffix-exact"}},{key:"multiRegex",get:function(){return/^!"(.*)"\$$/}},{key:"singleRegex",get:function(){return/^!(.*)\$$/}}]),e}(j),q=function(t){function e(t){var i,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},o=n.location,a=void 0===o?C.location:o,c=n.threshold,l=void 0===c?C.threshold:c,u=n.distance,h=void 0===u?C.distance:u,d=n.includeMatches,f=void 0===d?C.includeMatches:d,v=n.findAllMatches,g=void 0===v?C.findAllMatches:v,m=n.minMatchCharLength,p=void 0===m?C.minMatchCharLength:m,y=n.isCaseSensitive,b=void 0===y?C.isCaseSensitive:y,x=n.ignoreLocation,k=void 0===x?C.ignoreLocation:x;return(0,s.Z)(this,e),(i=(0,r.Z)(this,e,[t]))._bitapSearch=new O(t,{location:a,threshold:l,distance:h,includeMatches:f,findAllMatches:g,minMatchCharLength:p,isCaseSensitive:b,ignoreLocation:k}),i}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){return this._bitapSearch.searchIn(t)}}],[{key:"type",get:function(){return"fuzzy"}},{key:"multiRegex",get:function(){return/^"(.*)"$/}},{key:"singleRegex",get:function(){return/^(.*)$/}}]),e}(j),U=function(t){function e(t){return(0,s.Z)(this,e),(0,r.Z)(this,e,[t])}return(0,o.Z)(e,t),(0,c.Z)(e,[{key:"search",value:function(t){for(var e,i=0,n=[],r=this.pattern.length;(e=t.indexOf(this.pattern,i))>-1;)i=e+r,n.push([e,i-1]);var o=!!n.length;return{isMatch:o,score:o?0:1,indices:n}}}],[{key:"type",get:function(){return"include"}},{key:"multiRegex",get:function(){return/^'"(.*)"$/}},{key:"singleRegex",get:function(){return/^'(.*)$/}}]),e}(j),H=[P,U,W,B,K,T,D,q],V=H.length,J=/ +(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)/;var Q=new Set([q.type,U.type]),G=function(){function t(e){var i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=i.isCaseSensitive,r=void 0===n?C.isCaseSensitive:n,o=i.includeMatches,a=void 0===o?C.includeMatches:o,c=i.minMatchCharLength,l=void 0===c?C.minMatchCharLength:c,u=i.ignoreLocation,h=void 0===u?C.ignoreLocation:u,d=i.findAllMatches,f=void 0===d?C.findAllMatches:d,v=i.location,g=void 0===v?C.location:v,m=i.threshold,p=void 0===m?C.threshold:m,y=i.distance,b=void 0===y?C.distance:y;(0,s.Z)(this,t),this.query=null,this.options={isCaseSensitive:r,includeMatches:a,minMatchCharLength:l,findAllMatches:f,ignoreLocation:h,location:g,threshold:p,distance:b},this.pattern=r?e:e.toLowerCase(),this.query=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return t.split("|").map((function(t){for(var i=t.trim().split(J).filter((function(t){return t&&!!t.trim()})),n=[],r=0,o=i.length;r<o;r+=1){for(var a=i[r],s=!1,c=-1;!s&&++c<V;){var l=H[c],u=l.isMultiMatch(a);u&&(n.push(new l(u,e)),s=!0)}if(!s)for(c=-1;++c<V;){var h=H[c],d=h.isSingleMatch(a);if(d){n.push(new h(d,e));break}}}return n}))}(this.pattern,this.options)}return(0,c.Z)(t,[{key:"searchIn",value:function(t){var e=this.query;if(!e)return{isMatch:!1,score:1};var i=this.options,n=i.includeMatches;t=i.isCaseSensitive?t:t.toLowerCase();for(var r=0,o=[],s=0,c=0,l=e.length;c<l;c+=1){var u=e[c];o.length=0,r=0;for(var h=0,d=u.length;h<d;h+=1){var f=u[h],v=f.search(t),g=v.isMatch,m=v.indices,p=v.score;if(!g){s=0,r=0,o.length=0;break}if(r+=1,s+=p,n){var y=f.constructor.type;Q.has(y)?o=[].concat((0,a.Z)(o),(0,a.Z)(m)):o.push(m)}}if(r){var b={isMatch:!0,score:s/r};return n&&(b.indices=o),b}}return{isMatch:!1,score:1}}}],[{key:"condition",value:function(t,e){return e.useExtendedSearch}}]),t}(),X=[];function Y(t,e){for(var i=0,n=X.length;i<n;i+=1){var r=X[i];if(r.condition(t,e))return new r(t,e)}return new O(t,e)}var tt="$and",et="$or",it="$path",nt="$val",rt=function(t){return!(!t[tt]&&!t[et])},ot=function(t){return(0,n.Z)({},tt,Object.keys(t).map((function(e){return(0,n.Z)({},e,t[e])})))};function at(t,e){var i=(arguments.length>2&&void 0!==arguments[2]?arguments[2]:{}).auto,n=void 0===i||i;return rt(t)||(t=ot(t)),function t(i){var r=Object.keys(i),o=function(t){return!!t[it]}(i);if(!o&&r.length>1&&!rt(i))return t(ot(i));if(function(t){return!u(t)&&m(t)&&!rt(t)}(i)){var a=o?i[it]:r[0],s=o?i[nt]:i[a];if(!f(s))throw new Error(function(t){return"Invalid value for key ".concat(t)}(a));var c={keyId:I(a),pattern:s};return n&&(c.searcher=Y(s,e)),c}var l={children:[],operator:r[0]};return r.forEach((function(e){var n=i[e];u(n)&&n.forEach((function(e){l.children.push(t(e))}))})),l}(t)}function st(t,e){var i=t.matches;e.matches=[],p(i)&&i.forEach((function(t){if(p(t.indices)&&t.indices.length){var i={indices:t.indices,value:t.value};t.key&&(i.key=t.key.src),t.idx>-1&&(i.refIndex=t.idx),e.matches.push(i)}}))}function ct(t,e){e.score=t.score}var lt=function(){function t(e){var i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2?arguments[2]:void 0;(0,s.Z)(this,t),this.options=Object.assign(Object.assign({},C),i),this.options.useExtendedSearch,this._keyStore=new w(this.options.keys),this.setCollection(e,n)}return(0,c.Z)(t,[{key:"setCollection",value:function(t,e){if(this._docs=t,e&&!(e instanceof S))throw new Error("Incorrect 'index' type");this._myIndex=e||R(this.options.keys,this._docs,{getFn:this.options.getFn,fieldNormWeight:this.options.fieldNormWeight})}},{key:"add",value:function(t){p(t)&&(this._docs.push(t),this._myIndex.add(t))}},{key:"remove",value:function(){for(var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:function(){return!1},e=[],i=0,n=this._docs.length;i<n;i+=1){var r=this._docs[i];t(r,i)&&(this.removeAt(i),i-=1,n-=1,e.push(r))}return e}},{key:"removeAt",value:function(t){this._docs.splice(t,1),this._myIndex.removeAt(t)}},{key:"getIndex",value:function(){return this._myIndex}},{key:"search",value:function(t){var e=(arguments.length>1&&void 0!==arguments[1]?arguments[1]:{}).limit,i=void 0===e?-1:e,n=this.options,r=n.includeMatches,o=n.includeScore,a=n.shouldSort,s=n.sortFn,c=n.ignoreFieldNorm,l=f(t)?f(this._docs[0])?this._searchStringList(t):this._searchObjectList(t):this._searchLogical(t);return function(t,e){var i=e.ignoreFieldNorm,n=void 0===i?C.ignoreFieldNorm:i;t.forEach((function(t){var e=1;t.matches.forEach((function(t){var i=t.key,r=t.norm,o=t.score,a=i?i.weight:null;e*=Math.pow(0===o&&a?Number.EPSILON:o,(a||1)*(n?1:r))})),t.score=e}))}(l,{ignoreFieldNorm:c}),a&&l.sort(s),v(i)&&i>-1&&(l=l.slice(0,i)),function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},n=i.includeMatches,r=void 0===n?C.includeMatches:n,o=i.includeScore,a=void 0===o?C.includeScore:o,s=[];return r&&s.push(st),a&&s.push(ct),t.map((function(t){var i=t.idx,n={item:e[i],refIndex:i};return s.length&&s.forEach((function(e){e(t,n)})),n}))}(l,this._docs,{includeMatches:r,includeScore:o})}},{key:"_searchStringList",value:function(t){var e=Y(t,this.options),i=this._myIndex.records,n=[];return i.forEach((function(t){var i=t.v,r=t.i,o=t.n;if(p(i)){var a=e.searchIn(i),s=a.isMatch,c=a.score,l=a.indices;s&&n.push({item:i,idx:r,matches:[{score:c,value:i,norm:o,indices:l}]})}})),n}},{key:"_searchLogical",value:function(t){var e=this,i=at(t,this.options),n=function t(i,n,r){if(!i.children){var o=i.keyId,s=i.searcher,c=e._findMatches({key:e._keyStore.get(o),value:e._myIndex.getValueForItemAtKeyId(n,o),searcher:s});return c&&c.length?[{idx:r,item:n,matches:c}]:[]}for(var l=[],u=0,h=i.children.length;u<h;u+=1){var d=t(i.children[u],n,r);if(d.length)l.push.apply(l,(0,a.Z)(d));else if(i.operator===tt)return[]}return l},r=this._myIndex.records,o={},s=[];return r.forEach((function(t){var e=t.$,r=t.i;if(p(e)){var c=n(i,e,r);c.length&&(o[r]||(o[r]={idx:r,item:e,matches:[]},s.push(o[r])),c.forEach((function(t){var e,i=t.matches;(e=o[r].matches).push.apply(e,(0,a.Z)(i))})))}})),s}},{key:"_searchObjectList",value:function(t){var e=this,i=Y(t,this.options),n=this._myIndex,r=n.keys,o=n.records,s=[];return o.forEach((function(t){var n=t.$,o=t.i;if(p(n)){var c=[];r.forEach((function(t,r){c.push.apply(c,(0,a.Z)(e._findMatches({key:t,value:n[r],searcher:i})))})),c.length&&s.push({idx:o,item:n,matches:c})}})),s}},{key:"_findMatches",value:function(t){var e=t.key,i=t.value,n=t.searcher;if(!p(i))return[];var r=[];if(u(i))i.forEach((function(t){var i=t.v,o=t.i,a=t.n;if(p(i)){var s=n.searchIn(i),c=s.isMatch,l=s.score,u=s.indices;c&&r.push({score:l,key:e,value:i,idx:o,norm:a,indices:u})}}));else{var o=i.v,a=i.n,s=n.searchIn(o),c=s.isMatch,l=s.score,h=s.indices;c&&r.push({score:l,key:e,value:o,norm:a,indices:h})}return r}}]),t}();lt.version="7.0.0",lt.createIndex=R,lt.parseIndex=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},i=e.getFn,n=void 0===i?C.getFn:i,r=e.fieldNormWeight,o=void 0===r?C.fieldNormWeight:r,a=t.keys,s=t.records,c=new S({getFn:n,fieldNormWeight:o});return c.setKeys(a),c.setIndexRecords(s),c},lt.config=C,lt.parseQuery=at,function(){X.push.apply(X,arguments)}(G)}}]);
+//# sourceMappingURL=6581.kVtdZZ0L6aA.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6765],{6765:function(n,e,t){t.r(e),t.d(e,{HaIconButtonNext:function(){return b}});var o,i=t(88962),r=t(33368),a=t(71650),d=t(68308),u=t(82390),c=t(69205),l=t(91808),s=(t(97393),t(5095)),h=t(95260),f=t(67684),b=(t(54371),(0,l.Z)([(0,h.Mo)("ha-icon-button-next")],(function(n,e){var t=function(e){function t(){var e;(0,a.Z)(this,t);for(var o=arguments.length,i=new Array(o),r=0;r<o;r++)i[r]=arguments[r];return e=(0,d.Z)(this,t,[].concat(i)),n((0,u.Z)(e)),e}return(0,c.Z)(t,e),(0,r.Z)(t)}(e);return{F:t,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.SB)()],key:"_icon",value:function(){return"rtl"===f.E.document.dir?"M15.41,16.58L10.83,12L15.41,7.41L14,6L8,12L14,18L15.41,16.58Z":"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z"}},{kind:"method",key:"render",value:function(){var n;return(0,s.dy)(o||(o=(0,i.Z)([' <ha-icon-button .disabled="','" .label="','" .path="','"></ha-icon-button> '])),this.disabled,this.label||(null===(n=this.hass)||void 0===n?void 0:n.localize("ui.common.next"))||"Next",this._icon)}}]}}),s.oi))}}]);
+//# sourceMappingURL=6765.KUu3HrD-tZY.js.map
\ No newline at end of file
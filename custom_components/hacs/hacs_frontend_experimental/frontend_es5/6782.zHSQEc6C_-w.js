@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6782],{7265:function(e,t,i){var a,r,n=i(88962),o=i(33368),s=i(71650),d=i(68308),l=i(82390),u=i(69205),c=i(91808),h=(i(97393),i(5095)),f=i(95260);(0,c.Z)([(0,f.Mo)("ha-input-helper-text")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var a=arguments.length,r=new Array(a),n=0;n<a;n++)r[n]=arguments[n];return t=(0,d.Z)(this,i,[].concat(r)),e((0,l.Z)(t)),t}return(0,u.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"render",value:function(){return(0,h.dy)(a||(a=(0,n.Z)(["<slot></slot>"])))}},{kind:"field",static:!0,key:"styles",value:function(){return(0,h.iv)(r||(r=(0,n.Z)([":host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}"])))}}]}}),h.oi)},46782:function(e,t,i){i.r(t),i.d(t,{HaLocationSelector:function(){return T}});var a,r,n,o,s=i(62746),d=i(88962),l=i(33368),u=i(71650),c=i(68308),h=i(82390),f=i(69205),p=i(91808),v=(i(97393),i(85717),i(5095)),k=i(95260),m=i(14516),y=i(18394),b=i(99312),g=i(81043),_=i(34541),Z=i(47838),M=(i(51358),i(46798),i(47084),i(5239),i(98490),i(76843),i(46349),i(70320),i(36513),i(10733),i(9849),i(50289),i(94167),i(22859),i(7265),i(40039)),L=(i(91989),i(51467),function(){var e=(0,g.Z)((0,b.Z)().mark((function e(t){var a,r,n,o;return(0,b.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t.parentNode){e.next=2;break}throw new Error("Cannot setup Leaflet map on disconnected element");case 2:return e.next=4,Promise.all([i.e(2771),i.e(208)]).then(i.t.bind(i,70208,23));case 4:return(a=e.sent.default).Icon.Default.imagePath="/static/images/leaflet/images/",r=a.map(t),(n=document.createElement("link")).setAttribute("href","/static/images/leaflet/leaflet.css"),n.setAttribute("rel","stylesheet"),t.parentNode.appendChild(n),r.setView([52.3731339,4.8903147],13),o=x(a).addTo(r),e.abrupt("return",[r,a,o]);case 14:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}()),x=function(e){return e.tileLayer("https://basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}".concat(e.Browser.retina?"@2x.png":".png"),{attribution:'&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a>, &copy; <a href="https://carto.com/attributions">CARTO</a>',subdomains:"abcd",minZoom:0,maxZoom:20})},C=i(3850),w=i(2733),z=i(23636),B=(i(54371),i(86634)),E=(0,p.Z)(null,(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var a=arguments.length,r=new Array(a),n=0;n<a;n++)r[n]=arguments[n];return t=(0,c.Z)(this,i,[].concat(r)),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,k.Cb)({attribute:"entity-id"})],key:"entityId",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:"entity-name"})],key:"entityName",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:"entity-picture"})],key:"entityPicture",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:"entity-color"})],key:"entityColor",value:void 0},{kind:"method",key:"render",value:function(){return(0,v.dy)(a||(a=(0,d.Z)([' <div class="marker ','" style="','" @click="','"> '," </div> "])),this.entityPicture?"picture":"",(0,B.V)({"border-color":this.entityColor}),this._badgeTap,this.entityPicture?(0,v.dy)(r||(r=(0,d.Z)(['<div class="entity-picture" style="','"></div>'])),(0,B.V)({"background-image":"url(".concat(this.entityPicture,")")})):this.entityName)}},{kind:"method",key:"_badgeTap",value:function(e){e.stopPropagation(),this.entityId&&(0,y.B)(this,"hass-more-info",{entityId:this.entityId})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(n||(n=(0,d.Z)([".marker{display:flex;justify-content:center;align-items:center;box-sizing:border-box;width:48px;height:48px;font-size:var(--ha-marker-font-size, 1.5em);border-radius:50%;border:1px solid var(--ha-marker-color,var(--primary-color));color:var(--primary-text-color);background-color:var(--card-background-color)}.marker.picture{overflow:hidden}.entity-picture{background-size:cover;height:100%;width:100%}"])))}}]}}),v.oi);customElements.define("ha-entity-marker",E);var P,O,I,F,S,A=function(e){return"string"==typeof e?e:e.entity_id},T=((0,p.Z)([(0,k.Mo)("ha-map")],(function(e,t){var i,a,r=function(t){function i(){var t;(0,u.Z)(this,i);for(var a=arguments.length,r=new Array(a),n=0;n<a;n++)r[n]=arguments[n];return t=(0,c.Z)(this,i,[].concat(r)),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:r,d:[{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"entities",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"paths",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"layers",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"autoFit",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"renderPassive",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"interactiveZones",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"fitZones",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"darkMode",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Number})],key:"zoom",value:function(){return 14}},{kind:"field",decorators:[(0,k.SB)()],key:"_loaded",value:function(){return!1}},{kind:"field",key:"leafletMap",value:void 0},{kind:"field",key:"Leaflet",value:void 0},{kind:"field",key:"_resizeObserver",value:void 0},{kind:"field",key:"_mapItems",value:function(){return[]}},{kind:"field",key:"_mapFocusItems",value:function(){return[]}},{kind:"field",key:"_mapZones",value:function(){return[]}},{kind:"field",key:"_mapPaths",value:function(){return[]}},{kind:"method",key:"connectedCallback",value:function(){(0,_.Z)((0,Z.Z)(r.prototype),"connectedCallback",this).call(this),this._loadMap(),this._attachObserver()}},{kind:"method",key:"disconnectedCallback",value:function(){(0,_.Z)((0,Z.Z)(r.prototype),"disconnectedCallback",this).call(this),this.leafletMap&&(this.leafletMap.remove(),this.leafletMap=void 0,this.Leaflet=void 0),this._loaded=!1,this._resizeObserver&&this._resizeObserver.unobserve(this)}},{kind:"method",key:"update",value:function(e){var t,i;if((0,_.Z)((0,Z.Z)(r.prototype),"update",this).call(this,e),this._loaded){var a=!1,n=e.get("hass");if(e.has("_loaded")||e.has("entities"))this._drawEntities(),a=!0;else if(this._loaded&&n&&this.entities){var o,s=(0,M.Z)(this.entities);try{for(s.s();!(o=s.n()).done;){var d=o.value;if(n.states[A(d)]!==this.hass.states[A(d)]){this._drawEntities(),a=!0;break}}}catch(l){s.e(l)}finally{s.f()}}(e.has("_loaded")||e.has("paths"))&&this._drawPaths(),(e.has("_loaded")||e.has("layers"))&&(this._drawLayers(e.get("layers")),a=!0),(e.has("_loaded")||this.autoFit&&a)&&this.fitMap(),e.has("zoom")&&this.leafletMap.setZoom(this.zoom),(e.has("darkMode")||e.has("hass")&&(!n||(null===(t=n.themes)||void 0===t?void 0:t.darkMode)!==(null===(i=this.hass.themes)||void 0===i?void 0:i.darkMode)))&&this._updateMapStyle()}}},{kind:"method",key:"_updateMapStyle",value:function(){var e,t,i,a=null!==(e=null!==(t=this.darkMode)&&void 0!==t?t:this.hass.themes.darkMode)&&void 0!==e&&e,r=null!==(i=this.darkMode)&&void 0!==i&&i,n=this.shadowRoot.getElementById("map");n.classList.toggle("dark",a),n.classList.toggle("forced-dark",r)}},{kind:"method",key:"_loadMap",value:(a=(0,g.Z)((0,b.Z)().mark((function e(){var t,i,a;return(0,b.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return(t=this.shadowRoot.getElementById("map"))||((t=document.createElement("div")).id="map",this.shadowRoot.append(t)),e.next=4,L(t);case 4:i=e.sent,a=(0,s.Z)(i,2),this.leafletMap=a[0],this.Leaflet=a[1],this._updateMapStyle(),this._loaded=!0;case 10:case"end":return e.stop()}}),e,this)}))),function(){return a.apply(this,arguments)})},{kind:"method",key:"fitMap",value:function(e){var t,i,a;if(this.leafletMap&&this.Leaflet&&this.hass)if(this._mapFocusItems.length||null!==(t=this.layers)&&void 0!==t&&t.length){var r,n=this.Leaflet.latLngBounds(this._mapFocusItems?this._mapFocusItems.map((function(e){return e.getLatLng()})):[]);if(this.fitZones)null===(r=this._mapZones)||void 0===r||r.forEach((function(e){n.extend("getBounds"in e?e.getBounds():e.getLatLng())}));null===(i=this.layers)||void 0===i||i.forEach((function(e){n.extend("getBounds"in e?e.getBounds():e.getLatLng())})),n=n.pad(null!==(a=null==e?void 0:e.pad)&&void 0!==a?a:.5),this.leafletMap.fitBounds(n,{maxZoom:(null==e?void 0:e.zoom)||this.zoom})}else this.leafletMap.setView(new this.Leaflet.LatLng(this.hass.config.latitude,this.hass.config.longitude),(null==e?void 0:e.zoom)||this.zoom)}},{kind:"method",key:"fitBounds",value:function(e,t){var i;if(this.leafletMap&&this.Leaflet&&this.hass){var a=this.Leaflet.latLngBounds(e).pad(null!==(i=null==t?void 0:t.pad)&&void 0!==i?i:.5);this.leafletMap.fitBounds(a,{maxZoom:(null==t?void 0:t.zoom)||this.zoom})}}},{kind:"method",key:"_drawLayers",value:function(e){if(e&&e.forEach((function(e){return e.remove()})),this.layers){var t=this.leafletMap;this.layers.forEach((function(e){t.addLayer(e)}))}}},{kind:"method",key:"_drawPaths",value:function(){var e=this,t=this.hass,i=this.leafletMap,a=this.Leaflet;if(t&&i&&a&&(this._mapPaths.length&&(this._mapPaths.forEach((function(e){return e.remove()})),this._mapPaths=[]),this.paths)){var r=getComputedStyle(this).getPropertyValue("--dark-primary-color");this.paths.forEach((function(t){var n,o;t.gradualOpacity&&(n=t.gradualOpacity/(t.points.length-2),o=1-t.gradualOpacity);for(var s=0;s<t.points.length-1;s++){var d=t.gradualOpacity?o+s*n:void 0;e._mapPaths.push(a.circleMarker(t.points[s].point,{radius:3,color:t.color||r,opacity:d,fillOpacity:d,interactive:!0}).bindTooltip(t.points[s].tooltip,{direction:"top"})),e._mapPaths.push(a.polyline([t.points[s].point,t.points[s+1].point],{color:t.color||r,opacity:d,interactive:!1}))}var l=t.points.length-1;if(l>=0){var u=t.gradualOpacity?o+l*n:void 0;e._mapPaths.push(a.circleMarker(t.points[l].point,{radius:3,color:t.color||r,opacity:u,fillOpacity:u,interactive:!0}).bindTooltip(t.points[l].tooltip,{direction:"top"}))}e._mapPaths.forEach((function(e){return i.addLayer(e)}))}))}}},{kind:"method",key:"_drawEntities",value:function(){var e,t=this.hass,i=this.leafletMap,a=this.Leaflet;if(t&&i&&a&&(this._mapItems.length&&(this._mapItems.forEach((function(e){return e.remove()})),this._mapItems=[],this._mapFocusItems=[]),this._mapZones.length&&(this._mapZones.forEach((function(e){return e.remove()})),this._mapZones=[]),this.entities)){var r,n=getComputedStyle(this),o=n.getPropertyValue("--accent-color"),s=n.getPropertyValue("--secondary-text-color"),d=n.getPropertyValue("--dark-primary-color"),l=(null!==(e=this.darkMode)&&void 0!==e?e:this.hass.themes.darkMode)?"dark":"light",u=(0,M.Z)(this.entities);try{for(u.s();!(r=u.n()).done;){var c=r.value,h=t.states[A(c)];if(h){var f="string"!=typeof c?c.name:void 0,p=null!=f?f:(0,w.C)(h),v=h.attributes,k=v.latitude,m=v.longitude,y=v.passive,b=v.icon,g=v.radius,_=v.entity_picture,Z=v.gps_accuracy;if(k&&m)if("zone"!==(0,C.N)(h)){var L="string"!=typeof c&&"state"===c.label_mode?this.hass.formatEntityState(h):null!=f?f:p.split(" ").map((function(e){return e[0]})).join("").substr(0,3),x=a.marker([k,m],{icon:a.divIcon({html:'\n              <ha-entity-marker\n                entity-id="'.concat(A(c),'"\n                entity-name="').concat(L,'"\n                entity-picture="').concat(_?this.hass.hassUrl(_):"",'"\n                ').concat("string"!=typeof c?'entity-color="'.concat(c.color,'"'):"","\n              ></ha-entity-marker>\n            "),iconSize:[48,48],className:""}),title:p});this._mapItems.push(x),"string"!=typeof c&&!1===c.focus||this._mapFocusItems.push(x),Z&&this._mapItems.push(a.circle([k,m],{interactive:!1,color:d,radius:Z}))}else{if(y&&!this.renderPassive)continue;var z="";if(b){var B=document.createElement("ha-icon");B.setAttribute("icon",b),z=B.outerHTML}else{var E=document.createElement("span");E.innerHTML=p,z=E.outerHTML}this._mapZones.push(a.marker([k,m],{icon:a.divIcon({html:z,iconSize:[24,24],className:l}),interactive:this.interactiveZones,title:p})),this._mapZones.push(a.circle([k,m],{interactive:!1,color:y?s:o,radius:g}))}}}}catch(P){u.e(P)}finally{u.f()}this._mapItems.forEach((function(e){return i.addLayer(e)})),this._mapZones.forEach((function(e){return i.addLayer(e)}))}}},{kind:"method",key:"_attachObserver",value:(i=(0,g.Z)((0,b.Z)().mark((function e(){var t=this;return(0,b.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this._resizeObserver){e.next=4;break}return e.next=3,(0,z.j)();case 3:this._resizeObserver=new ResizeObserver((function(){var e;null===(e=t.leafletMap)||void 0===e||e.invalidateSize({debounceMoveend:!0})}));case 4:this._resizeObserver.observe(this);case 5:case"end":return e.stop()}}),e,this)}))),function(){return i.apply(this,arguments)})},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(o||(o=(0,d.Z)([":host{display:block;height:300px}#map{height:100%}#map.dark{background:#090909}#map.forced-dark{--map-filter:invert(0.9) hue-rotate(170deg) brightness(1.5) contrast(1.2) saturate(0.3)}#map:active{cursor:grabbing;cursor:-moz-grabbing;cursor:-webkit-grabbing}.light{color:#000}.dark{color:#fff}.leaflet-tile-pane{filter:var(--map-filter)}.dark .leaflet-bar a{background-color:var(--card-background-color,#1c1c1c);color:#fff}.leaflet-marker-draggable{cursor:move!important}.leaflet-edit-resize{border-radius:50%;cursor:nesw-resize!important}.named-icon{display:flex;align-items:center;justify-content:center;flex-direction:column;text-align:center;color:var(--primary-text-color)}.leaflet-pane{z-index:0!important}.leaflet-bottom,.leaflet-control,.leaflet-top{z-index:1!important}.leaflet-tooltip{padding:8px;font-size:90%;background:rgba(80,80,80,.9)!important;color:#fff!important;border-radius:4px;box-shadow:none!important}"])))}}]}}),v.fl),(0,p.Z)([(0,k.Mo)("ha-locations-editor")],(function(e,t){var a,r=function(t){function a(){var t;return(0,u.Z)(this,a),t=(0,c.Z)(this,a),e((0,h.Z)(t)),t._loadPromise=Promise.all([i.e(2771),i.e(208)]).then(i.t.bind(i,70208,23)).then((function(e){return i.e(7716).then(i.t.bind(i,27716,23)).then((function(){return t.Leaflet=e.default,t._updateMarkers(),t.updateComplete.then((function(){return t.fitMap()}))}))})),t}return(0,f.Z)(a,t),(0,l.Z)(a)}(t);return{F:r,d:[{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"locations",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"autoFit",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Number})],key:"zoom",value:function(){return 16}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"darkMode",value:function(){return!1}},{kind:"field",decorators:[(0,k.SB)()],key:"_locationMarkers",value:void 0},{kind:"field",decorators:[(0,k.SB)()],key:"_circles",value:function(){return{}}},{kind:"field",decorators:[(0,k.IO)("ha-map",!0)],key:"map",value:void 0},{kind:"field",key:"Leaflet",value:void 0},{kind:"field",key:"_loadPromise",value:void 0},{kind:"method",key:"fitMap",value:function(e){this.map.fitMap(e)}},{kind:"method",key:"fitBounds",value:function(e,t){this.map.fitBounds(e,t)}},{kind:"method",key:"fitMarker",value:(a=(0,g.Z)((0,b.Z)().mark((function e(t,i){var a,r;return(0,b.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.Leaflet){e.next=3;break}return e.next=3,this._loadPromise;case 3:if(this.map.leafletMap&&this._locationMarkers){e.next=5;break}return e.abrupt("return");case 5:if(a=this._locationMarkers[t]){e.next=8;break}return e.abrupt("return");case 8:"getBounds"in a?(this.map.leafletMap.fitBounds(a.getBounds()),a.bringToFront()):(r=this._circles[t])?this.map.leafletMap.fitBounds(r.getBounds()):this.map.leafletMap.setView(a.getLatLng(),(null==i?void 0:i.zoom)||this.zoom);case 9:case"end":return e.stop()}}),e,this)}))),function(e,t){return a.apply(this,arguments)})},{kind:"method",key:"render",value:function(){return(0,v.dy)(P||(P=(0,d.Z)([' <ha-map .hass="','" .layers="','" .zoom="','" .autoFit="','" .darkMode="','"></ha-map> '," "])),this.hass,this._getLayers(this._circles,this._locationMarkers),this.zoom,this.autoFit,this.darkMode,this.helper?(0,v.dy)(O||(O=(0,d.Z)(["<ha-input-helper-text>","</ha-input-helper-text>"])),this.helper):"")}},{kind:"field",key:"_getLayers",value:function(){return(0,m.Z)((function(e,t){var i=[];return Array.prototype.push.apply(i,Object.values(e)),t&&Array.prototype.push.apply(i,Object.values(t)),i}))}},{kind:"method",key:"willUpdate",value:function(e){(0,_.Z)((0,Z.Z)(r.prototype),"willUpdate",this).call(this,e),this.Leaflet&&e.has("locations")&&this._updateMarkers()}},{kind:"method",key:"_updateLocation",value:function(e){var t=e.target,i=t.getLatLng(),a=i.lng;Math.abs(a)>180&&(a=(a%360+540)%360-180);var r=[i.lat,a];(0,y.B)(this,"location-updated",{id:t.id,location:r},{bubbles:!1})}},{kind:"method",key:"_updateRadius",value:function(e){var t=e.target,i=this._locationMarkers[t.id];(0,y.B)(this,"radius-updated",{id:t.id,radius:i.getRadius()},{bubbles:!1})}},{kind:"method",key:"_markerClicked",value:function(e){var t=e.target;(0,y.B)(this,"marker-clicked",{id:t.id},{bubbles:!1})}},{kind:"method",key:"_updateMarkers",value:function(){var e=this;if(!this.locations||!this.locations.length)return this._circles={},void(this._locationMarkers=void 0);var t={},i={},a=getComputedStyle(this).getPropertyValue("--accent-color");this.locations.forEach((function(r){var n;if(r.icon||r.iconPath){var o,s=document.createElement("div");s.className="named-icon",void 0!==r.name&&(s.innerText=r.name),r.icon?(o=document.createElement("ha-icon")).setAttribute("icon",r.icon):(o=document.createElement("ha-svg-icon")).setAttribute("path",r.iconPath),s.prepend(o),n=e.Leaflet.divIcon({html:s.outerHTML,iconSize:[24,24],className:"light"})}if(r.radius){var d=e.Leaflet.circle([r.latitude,r.longitude],{color:r.radius_color||a,radius:r.radius});r.radius_editable||r.location_editable?(d.editing.enable(),d.addEventListener("add",(function(){var t=d.editing._moveMarker,i=d.editing._resizeMarkers[0];n&&t.setIcon(n),i.id=t.id=r.id,t.addEventListener("dragend",(function(t){return e._updateLocation(t)})).addEventListener("click",(function(t){return e._markerClicked(t)})),r.radius_editable?i.addEventListener("dragend",(function(t){return e._updateRadius(t)})):i.remove()})),t[r.id]=d):i[r.id]=d}if(!r.radius||!r.radius_editable&&!r.location_editable){var l={title:r.name,draggable:r.location_editable};n&&(l.icon=n);var u=e.Leaflet.marker([r.latitude,r.longitude],l).addEventListener("dragend",(function(t){return e._updateLocation(t)})).addEventListener("click",(function(t){return e._markerClicked(t)}));u.id=r.id,t[r.id]=u}})),this._circles=i,this._locationMarkers=t,(0,y.B)(this,"markers-updated")}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(I||(I=(0,d.Z)(["ha-map{display:block;height:100%}"])))}}]}}),v.oi),(0,p.Z)([(0,k.Mo)("ha-selector-location")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var a=arguments.length,r=new Array(a),n=0;n<a;n++)r[n]=arguments[n];return t=(0,c.Z)(this,i,[].concat(r)),e((0,h.Z)(t)),t}return(0,f.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,v.dy)(F||(F=(0,d.Z)([" <p>",'</p> <ha-locations-editor class="flex" .hass="','" .helper="','" .locations="','" @location-updated="','" @radius-updated="','"></ha-locations-editor> '])),this.label?this.label:"",this.hass,this.helper,this._location(this.selector,this.value),this._locationChanged,this._radiusChanged)}},{kind:"field",key:"_location",value:function(){var e=this;return(0,m.Z)((function(t,i){var a,r,n,o,s=getComputedStyle(e),d=null!==(a=t.location)&&void 0!==a&&a.radius?s.getPropertyValue("--zone-radius-color")||s.getPropertyValue("--accent-color"):void 0;return[{id:"location",latitude:(null==i?void 0:i.latitude)||e.hass.config.latitude,longitude:(null==i?void 0:i.longitude)||e.hass.config.longitude,radius:null!==(r=t.location)&&void 0!==r&&r.radius?(null==i?void 0:i.radius)||1e3:void 0,radius_color:d,icon:null!==(n=t.location)&&void 0!==n&&n.icon||null!==(o=t.location)&&void 0!==o&&o.radius?"mdi:map-marker-radius":"mdi:map-marker",location_editable:!0,radius_editable:!0}]}))}},{kind:"method",key:"_locationChanged",value:function(e){var t=(0,s.Z)(e.detail.location,2),i=t[0],a=t[1];(0,y.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.value),{},{latitude:i,longitude:a})})}},{kind:"method",key:"_radiusChanged",value:function(e){var t=e.detail.radius;(0,y.B)(this,"value-changed",{value:Object.assign(Object.assign({},this.value),{},{radius:t})})}},{kind:"field",static:!0,key:"styles",value:function(){return(0,v.iv)(S||(S=(0,d.Z)(["ha-locations-editor{display:block;height:400px}p{margin-top:0}"])))}}]}}),v.oi))},23636:function(e,t,i){i.d(t,{j:function(){return n}});var a=i(99312),r=i(81043),n=(i(51358),i(46798),i(47084),i(5239),i(98490),function(){var e=(0,r.Z)((0,a.Z)().mark((function e(){return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:e.prev=0,new ResizeObserver((function(){})),e.next=9;break;case 4:return e.prev=4,e.t0=e.catch(0),e.next=8,Promise.resolve().then(i.bind(i,5442));case 8:window.ResizeObserver=e.sent.default;case 9:case"end":return e.stop()}}),e,null,[[0,4]])})));return function(){return e.apply(this,arguments)}}())}}]);
+//# sourceMappingURL=6782.zHSQEc6C_-w.js.map
\ No newline at end of file
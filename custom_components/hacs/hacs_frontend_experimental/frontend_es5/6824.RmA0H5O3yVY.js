@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6824],{8485:function(t,e,r){r.d(e,{a:function(){return R}});var n,i=r(88962),o=r(99312),a=r(81043),c=r(71650),s=r(33368),l=r(68308),d=r(69205),f=r(43204),p=r(72774),u={ROOT:"mdc-form-field"},m={LABEL_SELECTOR:".mdc-form-field > label"},h=function(t){function e(r){var n=t.call(this,(0,f.__assign)((0,f.__assign)({},e.defaultAdapter),r))||this;return n.click=function(){n.handleClick()},n}return(0,f.__extends)(e,t),Object.defineProperty(e,"cssClasses",{get:function(){return u},enumerable:!1,configurable:!0}),Object.defineProperty(e,"strings",{get:function(){return m},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{activateInputRipple:function(){},deactivateInputRipple:function(){},deregisterInteractionHandler:function(){},registerInteractionHandler:function(){}}},enumerable:!1,configurable:!0}),e.prototype.init=function(){this.adapter.registerInteractionHandler("click",this.click)},e.prototype.destroy=function(){this.adapter.deregisterInteractionHandler("click",this.click)},e.prototype.handleClick=function(){var t=this;this.adapter.activateInputRipple(),requestAnimationFrame((function(){t.adapter.deactivateInputRipple()}))},e}(p.K),g=r(78220),y=r(18601),v=r(14114),b=r(5095),E=r(95260),_=r(53180),R=function(t){function e(){var t;return(0,c.Z)(this,e),(t=(0,l.Z)(this,e,arguments)).alignEnd=!1,t.spaceBetween=!1,t.nowrap=!1,t.label="",t.mdcFoundationClass=h,t}return(0,d.Z)(e,t),(0,s.Z)(e,[{key:"createAdapter",value:function(){var t,e,r=this;return{registerInteractionHandler:function(t,e){r.labelEl.addEventListener(t,e)},deregisterInteractionHandler:function(t,e){r.labelEl.removeEventListener(t,e)},activateInputRipple:(e=(0,a.Z)((0,o.Z)().mark((function t(){var e,n;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!((e=r.input)instanceof y.Wg)){t.next=6;break}return t.next=4,e.ripple;case 4:(n=t.sent)&&n.startPress();case 6:case"end":return t.stop()}}),t)}))),function(){return e.apply(this,arguments)}),deactivateInputRipple:(t=(0,a.Z)((0,o.Z)().mark((function t(){var e,n;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!((e=r.input)instanceof y.Wg)){t.next=6;break}return t.next=4,e.ripple;case 4:(n=t.sent)&&n.endPress();case 6:case"end":return t.stop()}}),t)}))),function(){return t.apply(this,arguments)})}}},{key:"input",get:function(){var t,e;return null!==(e=null===(t=this.slottedInputs)||void 0===t?void 0:t[0])&&void 0!==e?e:null}},{key:"render",value:function(){var t={"mdc-form-field--align-end":this.alignEnd,"mdc-form-field--space-between":this.spaceBetween,"mdc-form-field--nowrap":this.nowrap};return(0,b.dy)(n||(n=(0,i.Z)([' <div class="mdc-form-field ','"> <slot></slot> <label class="mdc-label" @click="','">',"</label> </div>"])),(0,_.$)(t),this._labelClick,this.label)}},{key:"click",value:function(){this._labelClick()}},{key:"_labelClick",value:function(){var t=this.input;t&&(t.focus(),t.click())}}]),e}(g.H);(0,f.__decorate)([(0,E.Cb)({type:Boolean})],R.prototype,"alignEnd",void 0),(0,f.__decorate)([(0,E.Cb)({type:Boolean})],R.prototype,"spaceBetween",void 0),(0,f.__decorate)([(0,E.Cb)({type:Boolean})],R.prototype,"nowrap",void 0),(0,f.__decorate)([(0,E.Cb)({type:String}),(0,v.P)(function(){var t=(0,a.Z)((0,o.Z)().mark((function t(e){var r;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:null===(r=this.input)||void 0===r||r.setAttribute("aria-label",e);case 1:case"end":return t.stop()}}),t,this)})));return function(e){return t.apply(this,arguments)}}())],R.prototype,"label",void 0),(0,f.__decorate)([(0,E.IO)(".mdc-form-field")],R.prototype,"mdcRoot",void 0),(0,f.__decorate)([(0,E.vZ)("",!0,"*")],R.prototype,"slottedInputs",void 0),(0,f.__decorate)([(0,E.IO)("label")],R.prototype,"labelEl",void 0)},92038:function(t,e,r){r.d(e,{W:function(){return o}});var n,i=r(88962),o=(0,r(5095).iv)(n||(n=(0,i.Z)([".mdc-form-field{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87));display:inline-flex;align-items:center;vertical-align:middle}.mdc-form-field>label{margin-left:0;margin-right:auto;padding-left:4px;padding-right:0;order:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{margin-left:auto;margin-right:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{padding-left:0;padding-right:4px}.mdc-form-field--nowrap>label{text-overflow:ellipsis;overflow:hidden;white-space:nowrap}.mdc-form-field--align-end>label{margin-left:auto;margin-right:0;padding-left:0;padding-right:4px;order:-1}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{margin-left:0;margin-right:auto}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{padding-left:4px;padding-right:0}.mdc-form-field--space-between{justify-content:space-between}.mdc-form-field--space-between>label{margin:0}.mdc-form-field--space-between>label[dir=rtl],[dir=rtl] .mdc-form-field--space-between>label{margin:0}:host{display:inline-flex}.mdc-form-field{width:100%}::slotted(*){-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87))}::slotted(mwc-switch){margin-right:10px}::slotted(mwc-switch[dir=rtl]),[dir=rtl] ::slotted(mwc-switch){margin-left:10px}"])))},63335:function(t,e,r){r.d(e,{F:function(){return E}});var n=r(99312),i=r(81043),o=r(88962),a=r(71650),c=r(33368),s=r(68308),l=r(69205),d=r(43204),f=r(95260),p=r(58417),u=r(39274),m=function(t){function e(){return(0,a.Z)(this,e),(0,s.Z)(this,e,arguments)}return(0,l.Z)(e,t),(0,c.Z)(e)}(p.A);m.styles=[u.W],m=(0,d.__decorate)([(0,f.Mo)("mwc-checkbox")],m);var h,g,y,v=r(5095),b=r(53180),E=function(t){function e(){var t;return(0,a.Z)(this,e),(t=(0,s.Z)(this,e,arguments)).left=!1,t.graphic="control",t}var r;return(0,l.Z)(e,t),(0,c.Z)(e,[{key:"render",value:function(){var t={"mdc-deprecated-list-item__graphic":this.left,"mdc-deprecated-list-item__meta":!this.left},e=this.renderText(),r=this.graphic&&"control"!==this.graphic&&!this.left?this.renderGraphic():(0,v.dy)(h||(h=(0,o.Z)([""]))),n=this.hasMeta&&this.left?this.renderMeta():(0,v.dy)(g||(g=(0,o.Z)([""]))),i=this.renderRipple();return(0,v.dy)(y||(y=(0,o.Z)([" "," "," ",' <span class="','"> <mwc-checkbox reducedTouchTarget tabindex="','" .checked="','" ?disabled="','" @change="','"> </mwc-checkbox> </span> '," ",""])),i,r,this.left?"":e,(0,b.$)(t),this.tabindex,this.selected,this.disabled,this.onChange,this.left?e:"",n)}},{key:"onChange",value:(r=(0,i.Z)((0,n.Z)().mark((function t(e){var r;return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(r=e.target,this.selected===r.checked){t.next=8;break}return this._skipPropRequest=!0,this.selected=r.checked,t.next=7,this.updateComplete;case 7:this._skipPropRequest=!1;case 8:case"end":return t.stop()}}),t,this)}))),function(t){return r.apply(this,arguments)})}]),e}(r(61092).K);(0,d.__decorate)([(0,f.IO)("slot")],E.prototype,"slotElement",void 0),(0,d.__decorate)([(0,f.IO)("mwc-checkbox")],E.prototype,"checkboxElement",void 0),(0,d.__decorate)([(0,f.Cb)({type:Boolean})],E.prototype,"left",void 0),(0,d.__decorate)([(0,f.Cb)({type:String,reflect:!0})],E.prototype,"graphic",void 0)},21270:function(t,e,r){r.d(e,{W:function(){return o}});var n,i=r(88962),o=(0,r(5095).iv)(n||(n=(0,i.Z)([":host(:not([twoline])){height:56px}:host(:not([left])) .mdc-deprecated-list-item__meta{height:40px;width:40px}"])))},97383:function(t){var e="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",r=e+"+/",n=e+"-_",i=function(t){for(var e={},r=0;r<64;r++)e[t.charAt(r)]=r;return e};t.exports={i2c:r,c2i:i(r),i2cUrl:n,c2iUrl:i(n)}},35749:function(t){t.exports={IndexSizeError:{s:"INDEX_SIZE_ERR",c:1,m:1},DOMStringSizeError:{s:"DOMSTRING_SIZE_ERR",c:2,m:0},HierarchyRequestError:{s:"HIERARCHY_REQUEST_ERR",c:3,m:1},WrongDocumentError:{s:"WRONG_DOCUMENT_ERR",c:4,m:1},InvalidCharacterError:{s:"INVALID_CHARACTER_ERR",c:5,m:1},NoDataAllowedError:{s:"NO_DATA_ALLOWED_ERR",c:6,m:0},NoModificationAllowedError:{s:"NO_MODIFICATION_ALLOWED_ERR",c:7,m:1},NotFoundError:{s:"NOT_FOUND_ERR",c:8,m:1},NotSupportedError:{s:"NOT_SUPPORTED_ERR",c:9,m:1},InUseAttributeError:{s:"INUSE_ATTRIBUTE_ERR",c:10,m:1},InvalidStateError:{s:"INVALID_STATE_ERR",c:11,m:1},SyntaxError:{s:"SYNTAX_ERR",c:12,m:1},InvalidModificationError:{s:"INVALID_MODIFICATION_ERR",c:13,m:1},NamespaceError:{s:"NAMESPACE_ERR",c:14,m:1},InvalidAccessError:{s:"INVALID_ACCESS_ERR",c:15,m:1},ValidationError:{s:"VALIDATION_ERR",c:16,m:0},TypeMismatchError:{s:"TYPE_MISMATCH_ERR",c:17,m:1},SecurityError:{s:"SECURITY_ERR",c:18,m:1},NetworkError:{s:"NETWORK_ERR",c:19,m:1},AbortError:{s:"ABORT_ERR",c:20,m:1},URLMismatchError:{s:"URL_MISMATCH_ERR",c:21,m:1},QuotaExceededError:{s:"QUOTA_EXCEEDED_ERR",c:22,m:1},TimeoutError:{s:"TIMEOUT_ERR",c:23,m:1},InvalidNodeTypeError:{s:"INVALID_NODE_TYPE_ERR",c:24,m:1},DataCloneError:{s:"DATA_CLONE_ERR",c:25,m:1}}},99167:function(t,e,r){var n=r(58849),i=r(18431),o=r(22933),a=r(30852),c=Error.prototype.toString,s=i((function(){if(n){var t=Object.create(Object.defineProperty({},"name",{get:function(){return this===t}}));if("true"!==c.call(t))return!0}return"2: 1"!==c.call({message:1,name:2})||"Error"!==c.call({})}));t.exports=s?function(){var t=o(this),e=a(t.name,"Error"),r=a(t.message);return e?r?e+": "+r:e:r}:c},61792:function(t,e,r){var n=r(68077),i=r(5813),o=r(29694),a=r(55418),c=r(43173),s=r(18431),l=r(11336),d=r(33305),f=r(97383).i2c,p=o("btoa"),u=a("".charAt),m=a("".charCodeAt),h=!!p&&!s((function(){return"aGk="!==p("hi")})),g=h&&!s((function(){p()})),y=h&&s((function(){return"bnVsbA=="!==p(null)})),v=h&&1!==p.length;n({global:!0,bind:!0,enumerable:!0,forced:!h||g||y||v},{btoa:function(t){if(d(arguments.length,1),h)return c(p,i,l(t));for(var e,r,n=l(t),a="",s=0,g=f;u(n,s)||(g="=",s%1);){if((r=m(n,s+=3/4))>255)throw new(o("DOMException"))("The string contains characters outside of the Latin1 range","InvalidCharacterError");a+=u(g,63&(e=e<<8|r)>>8-s%1*8)}return a}})},40565:function(t,e,r){var n=r(68077),i=r(24038),o=r(29694),a=r(18431),c=r(9885),s=r(51012),l=r(54991).f,d=r(73936),f=r(40030),p=r(55229),u=r(85539),m=r(22933),h=r(99167),g=r(30852),y=r(35749),v=r(21709),b=r(12648),E=r(58849),_=r(95448),R="DOMException",w="DATA_CLONE_ERR",x=o("Error"),k=o(R)||function(){try{(new(o("MessageChannel")||i("worker_threads").MessageChannel)).port1.postMessage(new WeakMap)}catch(t){if(t.name===w&&25===t.code)return t.constructor}}(),I=k&&k.prototype,A=x.prototype,O=b.set,C=b.getterFor(R),T="stack"in new x(R),Z=function(t){return p(y,t)&&y[t].m?y[t].c:0},D=function(){u(this,N);var t=arguments.length,e=g(t<1?void 0:arguments[0]),r=g(t<2?void 0:arguments[1],"Error"),n=Z(r);if(O(this,{type:R,name:r,message:e,code:n}),E||(this.name=r,this.message=e,this.code=n),T){var i=new x(e);i.name=R,l(this,"stack",s(1,v(i.stack,1)))}},N=D.prototype=c(A),M=function(t){return{enumerable:!0,configurable:!0,get:t}},S=function(t){return M((function(){return C(this)[t]}))};E&&(f(N,"code",S("code")),f(N,"message",S("message")),f(N,"name",S("name"))),l(N,"constructor",s(1,D));var L=a((function(){return!(new k instanceof x)})),P=L||a((function(){return A.toString!==h||"2: 1"!==String(new k(1,2))})),U=L||a((function(){return 25!==new k(1,"DataCloneError").code})),H=L||25!==k[w]||25!==I[w],W=_?P||U||H:L;n({global:!0,constructor:!0,forced:W},{DOMException:W?D:k});var z=o(R),B=z.prototype;for(var F in P&&(_||k===z)&&d(B,"toString",h),U&&E&&k===z&&f(B,"code",M((function(){return Z(m(this).name)}))),y)if(p(y,F)){var V=y[F],j=V.s,X=s(6,V.c);p(z,j)||l(z,j,X),p(B,j)||l(B,j,X)}},44580:function(t,e,r){var n=r(68077),i=r(5813),o=r(29694),a=r(51012),c=r(54991).f,s=r(55229),l=r(85539),d=r(81760),f=r(30852),p=r(35749),u=r(21709),m=r(58849),h=r(95448),g="DOMException",y=o("Error"),v=o(g),b=function(){l(this,E);var t=arguments.length,e=f(t<1?void 0:arguments[0]),r=f(t<2?void 0:arguments[1],"Error"),n=new v(e,r),i=new y(e);return i.name=g,c(n,"stack",a(1,u(i.stack,1))),d(n,this,b),n},E=b.prototype=v.prototype,_="stack"in new y(g),R="stack"in new v(1,2),w=v&&m&&Object.getOwnPropertyDescriptor(i,g),x=!(!w||w.writable&&w.configurable),k=_&&!x&&!R;n({global:!0,constructor:!0,forced:h||k},{DOMException:k?b:v});var I=o(g),A=I.prototype;if(A.constructor!==I)for(var O in h||c(A,"constructor",a(1,I)),p)if(s(p,O)){var C=p[O],T=C.s;s(I,T)||c(I,T,a(6,C.c))}},48882:function(t,e,r){var n=r(29694),i="DOMException";r(48357)(n(i),i)},92541:function(t,e,r){r.d(e,{l:function(){return f}});var n=r(62746),i=r(71650),o=r(33368),a=r(68308),c=r(69205),s=(r(46798),r(9849),r(49089),r(32797),r(5239),r(32982)),l=r(16616),d={},f=(0,l.XM)(function(t){function e(){var t;return(0,i.Z)(this,e),(t=(0,a.Z)(this,e,arguments)).st=d,t}return(0,c.Z)(e,t),(0,o.Z)(e,[{key:"render",value:function(t,e){return e()}},{key:"update",value:function(t,e){var r=this,i=(0,n.Z)(e,2),o=i[0],a=i[1];if(Array.isArray(o)){if(Array.isArray(this.st)&&this.st.length===o.length&&o.every((function(t,e){return t===r.st[e]})))return s.Jb}else if(this.st===o)return s.Jb;return this.st=Array.isArray(o)?Array.from(o):o,this.render(o,a)}}]),e}(l.Xe))}}]);
+//# sourceMappingURL=6824.RmA0H5O3yVY.js.map
\ No newline at end of file
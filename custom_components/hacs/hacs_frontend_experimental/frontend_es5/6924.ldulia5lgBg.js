@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[6924],{77716:function(n,e,t){t.r(e),t.d(e,{HaIconButtonArrowNext:function(){return b}});var o,r=t(88962),i=t(33368),a=t(71650),d=t(68308),u=t(82390),c=t(69205),l=t(91808),s=(t(97393),t(5095)),h=t(95260),f=t(67684),b=(t(54371),(0,l.Z)([(0,h.Mo)("ha-icon-button-arrow-next")],(function(n,e){var t=function(e){function t(){var e;(0,a.Z)(this,t);for(var o=arguments.length,r=new Array(o),i=0;i<o;i++)r[i]=arguments[i];return e=(0,d.Z)(this,t,[].concat(r)),n((0,u.Z)(e)),e}return(0,c.Z)(t,e),(0,i.Z)(t)}(e);return{F:t,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,h.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,h.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,h.SB)()],key:"_icon",value:function(){return"rtl"===f.E.document.dir?"M20,11V13H8L13.5,18.5L12.08,19.92L4.16,12L12.08,4.08L13.5,5.5L8,11H20Z":"M4,11V13H16L10.5,18.5L11.92,19.92L19.84,12L11.92,4.08L10.5,5.5L16,11H4Z"}},{kind:"method",key:"render",value:function(){var n;return(0,s.dy)(o||(o=(0,r.Z)([' <ha-icon-button .disabled="','" .label="','" .path="','"></ha-icon-button> '])),this.disabled,this.label||(null===(n=this.hass)||void 0===n?void 0:n.localize("ui.common.next"))||"Next",this._icon)}}]}}),s.oi))}}]);
+//# sourceMappingURL=6924.ldulia5lgBg.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7021],{77021:function(n,e,r){function t(n){return Intl.getCanonicalLocales(n)}r.r(e),r.d(e,{ApplyUnsignedRoundingMode:function(){return K},ArrayCreate:function(){return f},CanonicalizeLocaleList:function(){return t},CanonicalizeTimeZoneName:function(){return u},CoerceOptionsToObject:function(){return R},CollapseNumberRange:function(){return Q},ComputeExponent:function(){return gn},ComputeExponentForMagnitude:function(){return ln},CurrencyDigits:function(){return Dn},DateFromTime:function(){return S},Day:function(){return d},DayFromYear:function(){return y},DayWithinYear:function(){return E},DaysInYear:function(){return b},FormatApproximately:function(){return pn},FormatNumericRange:function(){return In},FormatNumericRangeToParts:function(){return Nn},FormatNumericToParts:function(){return xn},FormatNumericToString:function(){return mn},GetNumberOption:function(){return U},GetOption:function(){return z},GetOptionsObject:function(){return Z},GetStringOrBooleanOption:function(){return G},GetUnsignedRoundingMode:function(){return Mn},HasOwnProperty:function(){return m},HourFromTime:function(){return M},InLeapYear:function(){return C},InitializeNumberFormat:function(){return Rn},IsSanctionedSimpleUnitIdentifier:function(){return V},IsValidTimeZoneName:function(){return $},IsWellFormedCurrencyCode:function(){return q},IsWellFormedUnitIdentifier:function(){return J},MinFromTime:function(){return O},MonthFromTime:function(){return w},OrdinaryHasInstance:function(){return j},PartitionNumberPattern:function(){return Sn},PartitionNumberRangePattern:function(){return An},PartitionPattern:function(){return Pn},RangePatternType:function(){return zn},SANCTIONED_UNITS:function(){return _},SIMPLE_UNITS:function(){return W},SameValue:function(){return s},SecFromTime:function(){return k},SetNumberFormatDigitOptions:function(){return kn},SetNumberFormatUnitOptions:function(){return jn},SupportedLocales:function(){return Un},TimeClip:function(){return c},TimeFromYear:function(){return F},ToNumber:function(){return o},ToObject:function(){return l},ToRawFixed:function(){return fn},ToRawPrecision:function(){return sn},ToString:function(){return a},Type:function(){return g},WeekDay:function(){return h},YearFromTime:function(){return v},_formatToParts:function(){return bn},defineProperty:function(){return on},getInternalSlot:function(){return tn},getMagnitude:function(){return X},getMultiInternalSlots:function(){return un},invariant:function(){return cn},isLiteralPart:function(){return an},isMissingLocaleDataError:function(){return Gn},msFromTime:function(){return L},removeUnitNamespace:function(){return Y},setInternalSlot:function(){return en},setMultiInternalSlots:function(){return rn}});r(34997),r(46798),r(9849),r(12148);function u(n,e){var r=e.zoneNames,t=e.uppercaseLinks,u=n.toUpperCase(),i=r.reduce((function(n,e){return n[e.toUpperCase()]=e,n}),{}),a=t[u]||i[u];return"Etc/UTC"===a||"Etc/GMT"===a?"UTC":a}var i=r(76775);r(51467),r(76843),r(23994);function a(n){if("symbol"===(0,i.Z)(n))throw TypeError("Cannot convert a Symbol value to a string");return String(n)}function o(n){if(void 0===n)return NaN;if(null===n)return 0;if("boolean"==typeof n)return n?1:0;if("number"==typeof n)return n;if("symbol"===(0,i.Z)(n)||"bigint"==typeof n)throw new TypeError("Cannot convert symbol/bigint to number");return Number(n)}function c(n){return isFinite(n)?Math.abs(n)>8640000000000001?NaN:function(n){var e=o(n);if(isNaN(e)||s(e,-0))return 0;if(isFinite(e))return e;var r=Math.floor(Math.abs(e));return e<0&&(r=-r),s(r,-0)?0:r}(n):NaN}function l(n){if(null==n)throw new TypeError("undefined/null cannot be converted to object");return Object(n)}function s(n,e){return Object.is?Object.is(n,e):n===e?0!==n||1/n==1/e:n!=n&&e!=e}function f(n){return new Array(n)}function m(n,e){return Object.prototype.hasOwnProperty.call(n,e)}function g(n){return null===n?"Null":void 0===n?"Undefined":"function"==typeof n||"object"===(0,i.Z)(n)?"Object":"number"==typeof n?"Number":"boolean"==typeof n?"Boolean":"string"==typeof n?"String":"symbol"===(0,i.Z)(n)?"Symbol":"bigint"==typeof n?"BigInt":void 0}var D=864e5;function p(n,e){return n-Math.floor(n/e)*e}function d(n){return Math.floor(n/D)}function h(n){return p(d(n)+4,7)}function y(n){return Date.UTC(n,0)/D}function F(n){return Date.UTC(n,0)}function v(n){return new Date(n).getUTCFullYear()}function b(n){return n%4!=0?365:n%100!=0?366:n%400!=0?365:366}function E(n){return d(n)-y(v(n))}function C(n){return 365===b(v(n))?0:1}function w(n){var e=E(n),r=C(n);if(e>=0&&e<31)return 0;if(e<59+r)return 1;if(e<90+r)return 2;if(e<120+r)return 3;if(e<151+r)return 4;if(e<181+r)return 5;if(e<212+r)return 6;if(e<243+r)return 7;if(e<273+r)return 8;if(e<304+r)return 9;if(e<334+r)return 10;if(e<365+r)return 11;throw new Error("Invalid time")}function S(n){var e=E(n),r=w(n),t=C(n);if(0===r)return e+1;if(1===r)return e-30;if(2===r)return e-58-t;if(3===r)return e-89-t;if(4===r)return e-119-t;if(5===r)return e-150-t;if(6===r)return e-180-t;if(7===r)return e-211-t;if(8===r)return e-242-t;if(9===r)return e-272-t;if(10===r)return e-303-t;if(11===r)return e-333-t;throw new Error("Invalid time")}var A=24,I=60,N=60,x=1e3,B=x*N,T=B*I;function M(n){return p(Math.floor(n/T),A)}function O(n){return p(Math.floor(n/B),I)}function k(n){return p(Math.floor(n/x),N)}function j(n,e,r){if("function"!=typeof n)return!1;if(null==r?void 0:r.boundTargetFunction)return e instanceof(null==r?void 0:r.boundTargetFunction);if("object"!==(0,i.Z)(e))return!1;var t=n.prototype;if("object"!==(0,i.Z)(t))throw new TypeError("OrdinaryHasInstance called on an object with an invalid prototype property.");return Object.prototype.isPrototypeOf.call(t,e)}function L(n){return p(n,x)}function R(n){return void 0===n?Object.create(null):l(n)}r(97393);function P(n,e,r,t){if(void 0===n)return t;var u=Number(n);if(isNaN(u)||u<e||u>r)throw new RangeError("".concat(u," is outside of range [").concat(e,", ").concat(r,"]"));return Math.floor(u)}function U(n,e,r,t,u){return P(n[e],r,t,u)}r(87438),r(22890),r(91989);function z(n,e,r,t,u){if("object"!==(0,i.Z)(n))throw new TypeError("Options must be an object");var o=n[e];if(void 0!==o){if("boolean"!==r&&"string"!==r)throw new TypeError("invalid type");if("boolean"===r&&(o=Boolean(o)),"string"===r&&(o=a(o)),void 0!==t&&!t.filter((function(n){return n==o})).length)throw new RangeError("".concat(o," is not within ").concat(t.join(", ")));return o}return u}function Z(n){if(void 0===n)return Object.create(null);if("object"===(0,i.Z)(n))return n;throw new TypeError("Options must be an object")}r(56308);function G(n,e,r,t,u,i){var o=n[e];if(void 0===o)return i;if(!0===o)return t;if(!1===Boolean(o))return u;if("true"===(o=a(o))||"false"===o)return i;if(-1===(r||[]).indexOf(o))throw new RangeError("Invalid value ".concat(o));return o}r(17692),r(46349);var _=["angle-degree","area-acre","area-hectare","concentr-percent","digital-bit","digital-byte","digital-gigabit","digital-gigabyte","digital-kilobit","digital-kilobyte","digital-megabit","digital-megabyte","digital-petabyte","digital-terabit","digital-terabyte","duration-day","duration-hour","duration-millisecond","duration-minute","duration-month","duration-second","duration-week","duration-year","length-centimeter","length-foot","length-inch","length-kilometer","length-meter","length-mile-scandinavian","length-mile","length-millimeter","length-yard","mass-gram","mass-kilogram","mass-ounce","mass-pound","mass-stone","temperature-celsius","temperature-fahrenheit","volume-fluid-ounce","volume-gallon","volume-liter","volume-milliliter"];function Y(n){return n.slice(n.indexOf("-")+1)}var W=_.map(Y);function V(n){return W.indexOf(n)>-1}r(51358),r(78399),r(5239),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(98490),r(50289),r(94167),r(70320),r(65974);function $(n,e){var r=e.zoneNamesFromData,t=e.uppercaseLinks,u=n.toUpperCase(),i=new Set,a=new Set;return r.map((function(n){return n.toUpperCase()})).forEach((function(n){return i.add(n)})),Object.keys(t).forEach((function(n){a.add(n.toUpperCase()),i.add(t[n].toUpperCase())})),i.has(u)||a.has(u)}r(63789),r(24074),r(99397);var H=/[^A-Z]/;function q(n){return 3===(n=n.replace(/([a-z])/g,(function(n,e){return e.toUpperCase()}))).length&&!H.test(n)}function J(n){if(V(n=n.replace(/([A-Z])/g,(function(n,e){return e.toLowerCase()}))))return!0;var e=n.split("-per-");if(2!==e.length)return!1;var r=e[0],t=e[1];return!(!V(r)||!V(t))}function K(n,e,r,t){if(n===e)return e;if(void 0===t)throw new Error("unsignedRoundingMode is mandatory");if("zero"===t)return e;if("infinity"===t)return r;var u=n-e,i=r-n;if(u<i)return e;if(i<u)return r;if(u!==i)throw new Error("Unexpected error");if("half-zero"===t)return e;if("half-infinity"===t)return r;if("half-even"!==t)throw new Error("Unexpected value for unsignedRoundingMode: ".concat(t));return 0===e/(r-e)%2?e:r}function Q(n){return n}r(7179);function X(n){return Math.floor(Math.log(n)*Math.LOG10E)}function nn(n,e){if("function"==typeof n.repeat)return n.repeat(e);for(var r=new Array(e),t=0;t<r.length;t++)r[t]=n;return r.join("")}function en(n,e,r,t){n.get(e)||n.set(e,Object.create(null)),n.get(e)[r]=t}function rn(n,e,r){for(var t=0,u=Object.keys(r);t<u.length;t++){var i=u[t];en(n,e,i,r[i])}}function tn(n,e,r){return un(n,e,r)[r]}function un(n,e){for(var r=[],t=2;t<arguments.length;t++)r[t-2]=arguments[t];var u=n.get(e);if(!u)throw new TypeError("".concat(e," InternalSlot has not been initialized"));return r.reduce((function(n,e){return n[e]=u[e],n}),Object.create(null))}function an(n){return"literal"===n.type}function on(n,e,r){var t=r.value;Object.defineProperty(n,e,{configurable:!0,enumerable:!1,writable:!0,value:t})}function cn(n,e,r){if(void 0===r&&(r=Error),!n)throw new r(e)}r(18098);function ln(n,e,r){var t=(0,r.getInternalSlots)(n),u=t.notation,i=t.dataLocaleData,a=t.numberingSystem;switch(u){case"standard":return 0;case"scientific":return e;case"engineering":return 3*Math.floor(e/3);default:var o=t.compactDisplay,c=t.style,l=t.currencyDisplay,s=void 0;if("currency"===c&&"name"!==l){s=(i.numbers.currency[a]||i.numbers.currency[i.numbers.nu[0]]).short}else{var f=i.numbers.decimal[a]||i.numbers.decimal[i.numbers.nu[0]];s="long"===o?f.long:f.short}if(!s)return 0;var m=String(Math.pow(10,e)),g=Object.keys(s);if(m<g[0])return 0;if(m>g[g.length-1])return g[g.length-1].length-1;var D=g.indexOf(m);if(-1===D)return 0;var p=g[D];return"0"===s[p].other?0:p.length-s[p].other.match(/0+/)[0].length}}r(94570);function sn(n,e,r){var t,u,i,a,o=r;if(0===n)t=nn("0",o),u=0,i=0;else{var c=n.toString(),l=c.indexOf("e"),s=c.split("e"),f=s[0],m=s[1],g=f.replace(".","");if(l>=0&&g.length<=o)u=+m,t=g+nn("0",o-g.length),i=n;else{var D=(u=X(n))-o+1,p=Math.round(h(n,D));h(p,o-1)>=10&&(u+=1,p=Math.floor(p/10)),t=p.toString(),i=h(p,o-1-u)}}if(u>=o-1?(t+=nn("0",u-o+1),a=u+1):u>=0?(t="".concat(t.slice(0,u+1),".").concat(t.slice(u+1)),a=u+1):(t="0.".concat(nn("0",-u-1)).concat(t),a=1),t.indexOf(".")>=0&&r>e){for(var d=r-e;d>0&&"0"===t[t.length-1];)t=t.slice(0,-1),d--;"."===t[t.length-1]&&(t=t.slice(0,-1))}return{formattedString:t,roundedNumber:i,integerDigitsCount:a};function h(n,e){return e<0?n*Math.pow(10,-e):n/Math.pow(10,e)}}function fn(n,e,r){var t,u,i=r,a=Math.round(n*Math.pow(10,i)),o=a/Math.pow(10,i);if(a<1e21)t=a.toString();else{var c=(t=a.toString()).split("e"),l=c[0],s=c[1];t=l.replace(".",""),t+=nn("0",Math.max(+s-t.length+1,0))}if(0!==i){var f=t.length;if(f<=i)t=nn("0",i+1-f)+t,f=i+1;var m=t.slice(0,f-i),g=t.slice(f-i);t="".concat(m,".").concat(g),u=m.length}else u=t.length;for(var D=r-e;D>0&&"0"===t[t.length-1];)t=t.slice(0,-1),D--;return"."===t[t.length-1]&&(t=t.slice(0,-1)),{formattedString:t,roundedNumber:o,integerDigitsCount:u}}function mn(n,e){var r,t=e<0||s(e,-0);switch(t&&(e=-e),n.roundingType){case"significantDigits":r=sn(e,n.minimumSignificantDigits,n.maximumSignificantDigits);break;case"fractionDigits":r=fn(e,n.minimumFractionDigits,n.maximumFractionDigits);break;default:(r=sn(e,1,2)).integerDigitsCount>1&&(r=fn(e,0,0))}e=r.roundedNumber;var u=r.formattedString,i=r.integerDigitsCount,a=n.minimumIntegerDigits;i<a&&(u=nn("0",a-i)+u);return t&&(e=-e),{roundedNumber:e,formattedString:u}}function gn(n,e,r){var t=r.getInternalSlots;if(0===e)return[0,0];e<0&&(e=-e);var u=X(e),i=ln(n,u,{getInternalSlots:t});e=i<0?e*Math.pow(10,-i):e/Math.pow(10,i);var a=mn(t(n),e);return 0===a.roundedNumber||X(a.roundedNumber)===u-i?[i,u]:[ln(n,u+1,{getInternalSlots:t}),u+1]}function Dn(n,e){var r=e.currencyDigitsData;return m(r,n)?r[n]:2}r(36513);function pn(n,e,r){var t=(0,r.getInternalSlots)(n),u=t.dataLocaleData.numbers.symbols[t.numberingSystem].approximatelySign;return e.push({type:"approximatelySign",value:u}),e}r(10999),r(52117),r(82479),r(57778),r(22481);var dn={adlm:["𞥐","𞥑","𞥒","𞥓","𞥔","𞥕","𞥖","𞥗","𞥘","𞥙"],ahom:["𑜰","𑜱","𑜲","𑜳","𑜴","𑜵","𑜶","𑜷","𑜸","𑜹"],arab:["٠","١","٢","٣","٤","٥","٦","٧","٨","٩"],arabext:["۰","۱","۲","۳","۴","۵","۶","۷","۸","۹"],bali:["᭐","᭑","᭒","᭓","᭔","᭕","᭖","᭗","᭘","᭙"],beng:["০","১","২","৩","৪","৫","৬","৭","৮","৯"],bhks:["𑱐","𑱑","𑱒","𑱓","𑱔","𑱕","𑱖","𑱗","𑱘","𑱙"],brah:["𑁦","𑁧","𑁨","𑁩","𑁪","𑁫","𑁬","𑁭","𑁮","𑁯"],cakm:["𑄶","𑄷","𑄸","𑄹","𑄺","𑄻","𑄼","𑄽","𑄾","𑄿"],cham:["꩐","꩑","꩒","꩓","꩔","꩕","꩖","꩗","꩘","꩙"],deva:["०","१","२","३","४","५","६","७","८","९"],diak:["𑥐","𑥑","𑥒","𑥓","𑥔","𑥕","𑥖","𑥗","𑥘","𑥙"],fullwide:["０","１","２","３","４","５","６","７","８","９"],gong:["𑶠","𑶡","𑶢","𑶣","𑶤","𑶥","𑶦","𑶧","𑶨","𑶩"],gonm:["𑵐","𑵑","𑵒","𑵓","𑵔","𑵕","𑵖","𑵗","𑵘","𑵙"],gujr:["૦","૧","૨","૩","૪","૫","૬","૭","૮","૯"],guru:["੦","੧","੨","੩","੪","੫","੬","੭","੮","੯"],hanidec:["〇","一","二","三","四","五","六","七","八","九"],hmng:["𖭐","𖭑","𖭒","𖭓","𖭔","𖭕","𖭖","𖭗","𖭘","𖭙"],hmnp:["𞅀","𞅁","𞅂","𞅃","𞅄","𞅅","𞅆","𞅇","𞅈","𞅉"],java:["꧐","꧑","꧒","꧓","꧔","꧕","꧖","꧗","꧘","꧙"],kali:["꤀","꤁","꤂","꤃","꤄","꤅","꤆","꤇","꤈","꤉"],khmr:["០","១","២","៣","៤","៥","៦","៧","៨","៩"],knda:["೦","೧","೨","೩","೪","೫","೬","೭","೮","೯"],lana:["᪀","᪁","᪂","᪃","᪄","᪅","᪆","᪇","᪈","᪉"],lanatham:["᪐","᪑","᪒","᪓","᪔","᪕","᪖","᪗","᪘","᪙"],laoo:["໐","໑","໒","໓","໔","໕","໖","໗","໘","໙"],lepc:["᪐","᪑","᪒","᪓","᪔","᪕","᪖","᪗","᪘","᪙"],limb:["᥆","᥇","᥈","᥉","᥊","᥋","᥌","᥍","᥎","᥏"],mathbold:["𝟎","𝟏","𝟐","𝟑","𝟒","𝟓","𝟔","𝟕","𝟖","𝟗"],mathdbl:["𝟘","𝟙","𝟚","𝟛","𝟜","𝟝","𝟞","𝟟","𝟠","𝟡"],mathmono:["𝟶","𝟷","𝟸","𝟹","𝟺","𝟻","𝟼","𝟽","𝟾","𝟿"],mathsanb:["𝟬","𝟭","𝟮","𝟯","𝟰","𝟱","𝟲","𝟳","𝟴","𝟵"],mathsans:["𝟢","𝟣","𝟤","𝟥","𝟦","𝟧","𝟨","𝟩","𝟪","𝟫"],mlym:["൦","൧","൨","൩","൪","൫","൬","൭","൮","൯"],modi:["𑙐","𑙑","𑙒","𑙓","𑙔","𑙕","𑙖","𑙗","𑙘","𑙙"],mong:["᠐","᠑","᠒","᠓","᠔","᠕","᠖","᠗","᠘","᠙"],mroo:["𖩠","𖩡","𖩢","𖩣","𖩤","𖩥","𖩦","𖩧","𖩨","𖩩"],mtei:["꯰","꯱","꯲","꯳","꯴","꯵","꯶","꯷","꯸","꯹"],mymr:["၀","၁","၂","၃","၄","၅","၆","၇","၈","၉"],mymrshan:["႐","႑","႒","႓","႔","႕","႖","႗","႘","႙"],mymrtlng:["꧰","꧱","꧲","꧳","꧴","꧵","꧶","꧷","꧸","꧹"],newa:["𑑐","𑑑","𑑒","𑑓","𑑔","𑑕","𑑖","𑑗","𑑘","𑑙"],nkoo:["߀","߁","߂","߃","߄","߅","߆","߇","߈","߉"],olck:["᱐","᱑","᱒","᱓","᱔","᱕","᱖","᱗","᱘","᱙"],orya:["୦","୧","୨","୩","୪","୫","୬","୭","୮","୯"],osma:["𐒠","𐒡","𐒢","𐒣","𐒤","𐒥","𐒦","𐒧","𐒨","𐒩"],rohg:["𐴰","𐴱","𐴲","𐴳","𐴴","𐴵","𐴶","𐴷","𐴸","𐴹"],saur:["꣐","꣑","꣒","꣓","꣔","꣕","꣖","꣗","꣘","꣙"],segment:["🯰","🯱","🯲","🯳","🯴","🯵","🯶","🯷","🯸","🯹"],shrd:["𑇐","𑇑","𑇒","𑇓","𑇔","𑇕","𑇖","𑇗","𑇘","𑇙"],sind:["𑋰","𑋱","𑋲","𑋳","𑋴","𑋵","𑋶","𑋷","𑋸","𑋹"],sinh:["෦","෧","෨","෩","෪","෫","෬","෭","෮","෯"],sora:["𑃰","𑃱","𑃲","𑃳","𑃴","𑃵","𑃶","𑃷","𑃸","𑃹"],sund:["᮰","᮱","᮲","᮳","᮴","᮵","᮶","᮷","᮸","᮹"],takr:["𑛀","𑛁","𑛂","𑛃","𑛄","𑛅","𑛆","𑛇","𑛈","𑛉"],talu:["᧐","᧑","᧒","᧓","᧔","᧕","᧖","᧗","᧘","᧙"],tamldec:["௦","௧","௨","௩","௪","௫","௬","௭","௮","௯"],telu:["౦","౧","౨","౩","౪","౫","౬","౭","౮","౯"],thai:["๐","๑","๒","๓","๔","๕","๖","๗","๘","๙"],tibt:["༠","༡","༢","༣","༤","༥","༦","༧","༨","༩"],tirh:["𑓐","𑓑","𑓒","𑓓","𑓔","𑓕","𑓖","𑓗","𑓘","𑓙"],vaii:["ᘠ","ᘡ","ᘢ","ᘣ","ᘤ","ᘥ","ᘦ","ᘧ","ᘨ","ᘩ"],wara:["𑣠","𑣡","𑣢","𑣣","𑣤","𑣥","𑣦","𑣧","𑣨","𑣩"],wcho:["𞋰","𞋱","𞋲","𞋳","𞋴","𞋵","𞋶","𞋷","𞋸","𞋹"]},hn=/[\$\+<->\^`\|~\xA2-\xA6\xA8\xA9\xAC\xAE-\xB1\xB4\xB8\xD7\xF7\u02C2-\u02C5\u02D2-\u02DF\u02E5-\u02EB\u02ED\u02EF-\u02FF\u0375\u0384\u0385\u03F6\u0482\u058D-\u058F\u0606-\u0608\u060B\u060E\u060F\u06DE\u06E9\u06FD\u06FE\u07F6\u07FE\u07FF\u09F2\u09F3\u09FA\u09FB\u0AF1\u0B70\u0BF3-\u0BFA\u0C7F\u0D4F\u0D79\u0E3F\u0F01-\u0F03\u0F13\u0F15-\u0F17\u0F1A-\u0F1F\u0F34\u0F36\u0F38\u0FBE-\u0FC5\u0FC7-\u0FCC\u0FCE\u0FCF\u0FD5-\u0FD8\u109E\u109F\u1390-\u1399\u166D\u17DB\u1940\u19DE-\u19FF\u1B61-\u1B6A\u1B74-\u1B7C\u1FBD\u1FBF-\u1FC1\u1FCD-\u1FCF\u1FDD-\u1FDF\u1FED-\u1FEF\u1FFD\u1FFE\u2044\u2052\u207A-\u207C\u208A-\u208C\u20A0-\u20BF\u2100\u2101\u2103-\u2106\u2108\u2109\u2114\u2116-\u2118\u211E-\u2123\u2125\u2127\u2129\u212E\u213A\u213B\u2140-\u2144\u214A-\u214D\u214F\u218A\u218B\u2190-\u2307\u230C-\u2328\u232B-\u2426\u2440-\u244A\u249C-\u24E9\u2500-\u2767\u2794-\u27C4\u27C7-\u27E5\u27F0-\u2982\u2999-\u29D7\u29DC-\u29FB\u29FE-\u2B73\u2B76-\u2B95\u2B97-\u2BFF\u2CE5-\u2CEA\u2E50\u2E51\u2E80-\u2E99\u2E9B-\u2EF3\u2F00-\u2FD5\u2FF0-\u2FFB\u3004\u3012\u3013\u3020\u3036\u3037\u303E\u303F\u309B\u309C\u3190\u3191\u3196-\u319F\u31C0-\u31E3\u3200-\u321E\u322A-\u3247\u3250\u3260-\u327F\u328A-\u32B0\u32C0-\u33FF\u4DC0-\u4DFF\uA490-\uA4C6\uA700-\uA716\uA720\uA721\uA789\uA78A\uA828-\uA82B\uA836-\uA839\uAA77-\uAA79\uAB5B\uAB6A\uAB6B\uFB29\uFBB2-\uFBC1\uFDFC\uFDFD\uFE62\uFE64-\uFE66\uFE69\uFF04\uFF0B\uFF1C-\uFF1E\uFF3E\uFF40\uFF5C\uFF5E\uFFE0-\uFFE6\uFFE8-\uFFEE\uFFFC\uFFFD]|\uD800[\uDD37-\uDD3F\uDD79-\uDD89\uDD8C-\uDD8E\uDD90-\uDD9C\uDDA0\uDDD0-\uDDFC]|\uD802[\uDC77\uDC78\uDEC8]|\uD805\uDF3F|\uD807[\uDFD5-\uDFF1]|\uD81A[\uDF3C-\uDF3F\uDF45]|\uD82F\uDC9C|\uD834[\uDC00-\uDCF5\uDD00-\uDD26\uDD29-\uDD64\uDD6A-\uDD6C\uDD83\uDD84\uDD8C-\uDDA9\uDDAE-\uDDE8\uDE00-\uDE41\uDE45\uDF00-\uDF56]|\uD835[\uDEC1\uDEDB\uDEFB\uDF15\uDF35\uDF4F\uDF6F\uDF89\uDFA9\uDFC3]|\uD836[\uDC00-\uDDFF\uDE37-\uDE3A\uDE6D-\uDE74\uDE76-\uDE83\uDE85\uDE86]|\uD838[\uDD4F\uDEFF]|\uD83B[\uDCAC\uDCB0\uDD2E\uDEF0\uDEF1]|\uD83C[\uDC00-\uDC2B\uDC30-\uDC93\uDCA0-\uDCAE\uDCB1-\uDCBF\uDCC1-\uDCCF\uDCD1-\uDCF5\uDD0D-\uDDAD\uDDE6-\uDE02\uDE10-\uDE3B\uDE40-\uDE48\uDE50\uDE51\uDE60-\uDE65\uDF00-\uDFFF]|\uD83D[\uDC00-\uDED7\uDEE0-\uDEEC\uDEF0-\uDEFC\uDF00-\uDF73\uDF80-\uDFD8\uDFE0-\uDFEB]|\uD83E[\uDC00-\uDC0B\uDC10-\uDC47\uDC50-\uDC59\uDC60-\uDC87\uDC90-\uDCAD\uDCB0\uDCB1\uDD00-\uDD78\uDD7A-\uDDCB\uDDCD-\uDE53\uDE60-\uDE6D\uDE70-\uDE74\uDE78-\uDE7A\uDE80-\uDE86\uDE90-\uDEA8\uDEB0-\uDEB6\uDEC0-\uDEC2\uDED0-\uDED6\uDF00-\uDF92\uDF94-\uDFCA]/,yn=new RegExp("^".concat(hn.source)),Fn=new RegExp("".concat(hn.source,"$")),vn=/[#0](?:[\.,][#0]+)*/g;function bn(n,e,r,t){var u,i,a=n.sign,o=n.exponent,c=n.magnitude,l=t.notation,s=t.style,f=t.numberingSystem,m=e.numbers.nu[0],g=null;if("compact"===l&&c&&(g=function(n,e,r,t,u,i,a){var o,c,l=n.roundedNumber,s=n.sign,f=n.magnitude,m=String(Math.pow(10,f)),g=r.numbers.nu[0];if("currency"===t&&"name"!==i){var D=null===(o=((p=r.numbers.currency)[a]||p[g]).short)||void 0===o?void 0:o[m];if(!D)return null;c=wn(e,l,D)}else{var p,d=((p=r.numbers.decimal)[a]||p[g])[u][m];if(!d)return null;c=wn(e,l,d)}if("0"===c)return null;return c=Cn(c,s).replace(/([^\s;\-\+\d¤]+)/g,"{c:$1}").replace(/0+/,"0"),c}(n,r,e,s,t.compactDisplay,t.currencyDisplay,f)),"currency"===s&&"name"!==t.currencyDisplay){var D=e.currencies[t.currency];if(D)switch(t.currencyDisplay){case"code":u=t.currency;break;case"symbol":u=D.symbol;break;default:u=D.narrow}else u=t.currency}if(g)i=g;else if("decimal"===s||"unit"===s||"currency"===s&&"name"===t.currencyDisplay)i=Cn((e.numbers.decimal[f]||e.numbers.decimal[m]).standard,a);else if("currency"===s){i=Cn((d=e.numbers.currency[f]||e.numbers.currency[m])[t.currencySign],a)}else{i=Cn(e.numbers.percent[f]||e.numbers.percent[m],a)}var p=vn.exec(i)[0];if(i=i.replace(vn,"{0}").replace(/'(.)'/g,"$1"),"currency"===s&&"name"!==t.currencyDisplay){var d,h=(d=e.numbers.currency[f]||e.numbers.currency[m]).currencySpacing.afterInsertBetween;h&&!Fn.test(u)&&(i=i.replace("¤{0}","¤".concat(h,"{0}")));var y=d.currencySpacing.beforeInsertBetween;y&&!yn.test(u)&&(i=i.replace("{0}¤","{0}".concat(y,"¤")))}for(var F=i.split(/({c:[^}]+}|\{0\}|[¤%\-\+])/g),v=[],b=e.numbers.symbols[f]||e.numbers.symbols[m],E=0,C=F;E<C.length;E++){if(G=C[E])switch(G){case"{0}":v.push.apply(v,En(b,n,l,o,f,!g&&Boolean(t.useGrouping),p));break;case"-":v.push({type:"minusSign",value:b.minusSign});break;case"+":v.push({type:"plusSign",value:b.plusSign});break;case"%":v.push({type:"percentSign",value:b.percentSign});break;case"¤":v.push({type:"currency",value:u});break;default:/^\{c:/.test(G)?v.push({type:"compact",value:G.substring(3,G.length-1)}):v.push({type:"literal",value:G})}}switch(s){case"currency":if("name"===t.currencyDisplay){var w=(e.numbers.currency[f]||e.numbers.currency[m]).unitPattern,S=void 0,A=e.currencies[t.currency];S=A?wn(r,n.roundedNumber*Math.pow(10,o),A.displayName):t.currency;for(var I=[],N=0,x=w.split(/(\{[01]\})/g);N<x.length;N++){switch(G=x[N]){case"{0}":I.push.apply(I,v);break;case"{1}":I.push({type:"currency",value:S});break;default:G&&I.push({type:"literal",value:G})}}return I}return v;case"unit":var B=t.unit,T=t.unitDisplay,M=e.units.simple[B];w=void 0;if(M)w=wn(r,n.roundedNumber*Math.pow(10,o),e.units.simple[B][T]);else{var O=B.split("-per-"),k=O[0],j=O[1];M=e.units.simple[k];var L=wn(r,n.roundedNumber*Math.pow(10,o),e.units.simple[k][T]),R=e.units.simple[j].perUnit[T];if(R)w=R.replace("{0}",L);else{var P=e.units.compound.per[T],U=wn(r,1,e.units.simple[j][T]);w=w=P.replace("{0}",L).replace("{1}",U.replace("{0}",""))}}I=[];for(var z=0,Z=w.split(/(\s*\{0\}\s*)/);z<Z.length;z++){var G=Z[z],_=/^(\s*)\{0\}(\s*)$/.exec(G);_?(_[1]&&I.push({type:"literal",value:_[1]}),I.push.apply(I,v),_[2]&&I.push({type:"literal",value:_[2]})):G&&I.push({type:"unit",value:G})}return I;default:return v}}function En(n,e,r,t,u,i,a){var o=[],c=e.formattedString,l=e.roundedNumber;if(isNaN(l))return[{type:"nan",value:c}];if(!isFinite(l))return[{type:"infinity",value:c}];var s=dn[u];s&&(c=c.replace(/\d/g,(function(n){return s[+n]||n})));var f,m,g=c.indexOf(".");if(g>0?(f=c.slice(0,g),m=c.slice(g+1)):f=c,i&&("compact"!==r||l>=1e4)){var D=n.group,p=[],d=a.split(".")[0].split(","),h=3,y=3;d.length>1&&(h=d[d.length-1].length),d.length>2&&(y=d[d.length-2].length);var F=f.length-h;if(F>0){for(p.push(f.slice(F,F+h)),F-=y;F>0;F-=y)p.push(f.slice(F,F+y));p.push(f.slice(0,F+y))}else p.push(f);for(;p.length>0;){var v=p.pop();o.push({type:"integer",value:v}),p.length>0&&o.push({type:"group",value:D})}}else o.push({type:"integer",value:f});if(void 0!==m&&o.push({type:"decimal",value:n.decimal},{type:"fraction",value:m}),("scientific"===r||"engineering"===r)&&isFinite(l)){o.push({type:"exponentSeparator",value:n.exponential}),t<0&&(o.push({type:"exponentMinusSign",value:n.minusSign}),t=-t);var b=fn(t,0,0);o.push({type:"exponentInteger",value:b.formattedString})}return o}function Cn(n,e){n.indexOf(";")<0&&(n="".concat(n,";-").concat(n));var r=n.split(";"),t=r[0],u=r[1];switch(e){case 0:return t;case-1:return u;default:return u.indexOf("-")>=0?u.replace(/-/g,"+"):"+".concat(t)}}function wn(n,e,r){return r[n.select(e)]||r.other}function Sn(n,e,r){var t,u,i,a=r.getInternalSlots,o=a(n),c=o.pl,l=o.dataLocaleData,f=o.numberingSystem,m=l.numbers.symbols[f]||l.numbers.symbols[l.numbers.nu[0]],g=0,D=0;if(isNaN(e))u=m.nan;else if(e==Number.POSITIVE_INFINITY||e==Number.NEGATIVE_INFINITY)u=m.infinity;else{if(!s(e,-0)){if(!isFinite(e))throw new Error("Input must be a mathematical value");"percent"==o.style&&(e*=100),D=(t=gn(n,e,{getInternalSlots:a}))[0],g=t[1],e=D<0?e*Math.pow(10,-D):e/Math.pow(10,D)}var p=mn(o,e);u=p.formattedString,e=p.roundedNumber}switch(o.signDisplay){case"never":i=0;break;case"auto":i=s(e,0)||e>0||isNaN(e)?0:-1;break;case"always":i=s(e,0)||e>0||isNaN(e)?1:-1;break;default:i=0===e||isNaN(e)?0:e>0?1:-1}return bn({roundedNumber:e,formattedString:u,exponent:D,magnitude:g,sign:i},o.dataLocaleData,c,o)}function An(n,e,r,t){var u=t.getInternalSlots;if(isNaN(e)||isNaN(r))throw new RangeError("Input must be a number");var i=[],a=Sn(n,e,{getInternalSlots:u}),o=Sn(n,r,{getInternalSlots:u});if(a===o)return pn(n,a,{getInternalSlots:u});for(var c=0,l=a;c<l.length;c++){l[c].source="startRange"}i=i.concat(a);var s=u(n),f=s.dataLocaleData.numbers.symbols[s.numberingSystem];i.push({type:"literal",value:f.rangeSign,source:"shared"});for(var m=0,g=o;m<g.length;m++){g[m].source="endRange"}return i=i.concat(o)}function In(n,e,r,t){return An(n,e,r,{getInternalSlots:t.getInternalSlots}).map((function(n){return n.value})).join("")}function Nn(n,e,r,t){return An(n,e,r,{getInternalSlots:t.getInternalSlots}).map((function(n,e){return{type:n.type,value:n.value,source:n.source,result:e.toString()}}))}function xn(n,e,r){for(var t=Sn(n,e,r),u=f(0),i=0,a=t;i<a.length;i++){var o=a[i];u.push({type:o.type,value:o.value})}return u}var Bn={ceil:"zero",floor:"infinity",expand:"infinity",trunc:"zero",halfCeil:"half-zero",halfFloor:"half-infinity",halfExpand:"half-infinity",halfTrunc:"half-zero",halfEven:"half-even"},Tn={ceil:"infinity",floor:"zero",expand:"infinity",trunc:"zero",halfCeil:"half-infinity",halfFloor:"half-zero",halfExpand:"half-infinity",halfTrunc:"half-zero",halfEven:"half-even"};function Mn(n,e){return e?Bn[n]:Tn[n]}r(32797);var On=r(46042);function kn(n,e,r,t,u){var i=U(e,"minimumIntegerDigits",1,21,1),a=e.minimumFractionDigits,o=e.maximumFractionDigits,c=e.minimumSignificantDigits,l=e.maximumSignificantDigits;n.minimumIntegerDigits=i;var s=z(e,"roundingPriority","string",["auto","morePrecision","lessPrecision"],"auto"),f=void 0!==c||void 0!==l,m=void 0!==a||void 0!==o,g=!0,D=!0;if("auto"===s&&(g=f,(f||!m&&"compact"===u)&&(D=!1)),g&&(f?(c=P(c,1,21,1),l=P(l,c,21,21),n.minimumSignificantDigits=c,n.maximumSignificantDigits=l):(n.minimumSignificantDigits=1,n.maximumSignificantDigits=21)),D)if(m){if(a=P(a,0,20,void 0),o=P(o,0,20,void 0),void 0===a)a=Math.min(r,o);else if(void 0===o)o=Math.max(t,a);else if(a>o)throw new RangeError("Invalid range, ".concat(a," > ").concat(o));n.minimumFractionDigits=a,n.maximumFractionDigits=o}else n.minimumFractionDigits=r,n.maximumFractionDigits=t;g||D?n.roundingType="morePrecision"===s?"morePrecision":"lessPrecision"===s?"lessPrecision":f?"significantDigits":"fractionDigits":(n.roundingType="morePrecision",n.minimumFractionDigits=0,n.maximumFractionDigits=0,n.minimumSignificantDigits=1,n.maximumSignificantDigits=2)}function jn(n,e,r){void 0===e&&(e=Object.create(null));var t=(0,r.getInternalSlots)(n),u=z(e,"style","string",["decimal","percent","currency","unit"],"decimal");t.style=u;var i=z(e,"currency","string",void 0,void 0);if(void 0!==i&&!q(i))throw RangeError("Malformed currency code");if("currency"===u&&void 0===i)throw TypeError("currency cannot be undefined");var a=z(e,"currencyDisplay","string",["code","symbol","narrowSymbol","name"],"symbol"),o=z(e,"currencySign","string",["standard","accounting"],"standard"),c=z(e,"unit","string",void 0,void 0);if(void 0!==c&&!J(c))throw RangeError("Invalid unit argument for Intl.NumberFormat()");if("unit"===u&&void 0===c)throw TypeError("unit cannot be undefined");var l=z(e,"unitDisplay","string",["short","narrow","long"],"short");"currency"===u&&(t.currency=i.toUpperCase(),t.currencyDisplay=a,t.currencySign=o),"unit"===u&&(t.unit=c,t.unitDisplay=l)}var Ln=[1,2,5,10,20,25,50,100,200,250,500,1e3,2e3];function Rn(n,e,r,u){var i=u.getInternalSlots,a=u.localeData,o=u.availableLocales,c=u.numberingSystemNames,l=u.getDefaultLocale,s=u.currencyDigitsData,f=t(e),m=R(r),g=Object.create(null),D=z(m,"localeMatcher","string",["lookup","best fit"],"best fit");g.localeMatcher=D;var p=z(m,"numberingSystem","string",void 0,void 0);if(void 0!==p&&c.indexOf(p)<0)throw RangeError("Invalid numberingSystems: ".concat(p));g.nu=p;var d=(0,On.ResolveLocale)(Array.from(o),f,g,["nu"],a,l),h=a[d.dataLocale];cn(!!h,"Missing locale data for ".concat(d.dataLocale));var y=i(n);y.locale=d.locale,y.dataLocale=d.dataLocale,y.numberingSystem=d.nu,y.dataLocaleData=h,jn(n,m,{getInternalSlots:i});var F,v,b=y.style;if("currency"===b){var E=Dn(y.currency,{currencyDigitsData:s});F=E,v=E}else F=0,v="percent"===b?0:3;var C=z(m,"notation","string",["standard","scientific","engineering","compact"],"standard");y.notation=C,kn(y,m,F,v,C);var w=U(m,"roundingIncrement",1,5e3,1);if(-1===Ln.indexOf(w))throw new RangeError("Invalid rounding increment value: ".concat(w,".\nValid values are ").concat(Ln,"."));if(1!==w&&"fractionDigits"!==y.roundingType)throw new TypeError("For roundingIncrement > 1 only fractionDigits is a valid roundingType");if(1!==w&&y.maximumFractionDigits!==y.minimumFractionDigits)throw new RangeError("With roundingIncrement > 1, maximumFractionDigits and minimumFractionDigits must be equal.");y.roundingIncrement=w;var S=z(m,"trailingZeroDisplay","string",["auto","stripIfInteger"],"auto");y.trailingZeroDisplay=S;var A=z(m,"compactDisplay","string",["short","long"],"short"),I="auto";return"compact"===C&&(y.compactDisplay=A,I="min2"),y.useGrouping=G(m,"useGrouping",["min2","auto","always"],"always",!1,I),y.signDisplay=z(m,"signDisplay","string",["auto","never","always","exceptZero","negative"],"auto"),y.roundingMode=z(m,"roundingMode","string",["ceil","floor","expand","trunc","halfCeil","halfFloor","halfExpand","halfTrunc","halfEven"],"halfExpand"),n}function Pn(n){for(var e=[],r=n.indexOf("{"),t=0,u=0,i=n.length;r<n.length&&r>-1;)cn((t=n.indexOf("}",r))>r,"Invalid pattern ".concat(n)),r>u&&e.push({type:"literal",value:n.substring(u,r)}),e.push({type:n.substring(r+1,t),value:void 0}),u=t+1,r=n.indexOf("{",u);return u<i&&e.push({type:"literal",value:n.substring(u,i)}),e}function Un(n,e,r){return void 0!==r&&z(r=l(r),"localeMatcher","string",["lookup","best fit"],"best fit"),(0,On.LookupSupportedLocales)(Array.from(n),e)}var zn,Zn=r(43204);!function(n){function e(){var e=null!==n&&n.apply(this,arguments)||this;return e.type="MISSING_LOCALE_DATA",e}(0,Zn.__extends)(e,n)}(Error);function Gn(n){return"MISSING_LOCALE_DATA"===n.type}!function(n){n.startRange="startRange",n.shared="shared",n.endRange="endRange"}(zn||(zn={}))},78799:function(n,e,r){var t=r(10228);n.exports=function(n,e,r){for(var u=0,i=arguments.length>2?r:t(e),a=new n(i);i>u;)a[u]=e[u++];return a}},9941:function(n,e,r){var t=r(76902),u=r(55418),i=r(70814),a=r(19480),o=r(84297),c=r(10228),l=r(9885),s=r(78799),f=Array,m=u([].push);n.exports=function(n,e,r,u){for(var g,D,p,d=a(n),h=i(d),y=t(e,r),F=l(null),v=c(h),b=0;v>b;b++)p=h[b],(D=o(y(p,b,d)))in F?m(F[D],p):F[D]=[p];if(u&&(g=u(d))!==f)for(D in F)F[D]=s(g,F[D]);return F}},93892:function(n,e,r){var t=r(97673),u=r(11336),i=r(43313),a=RangeError;n.exports=function(n){var e=u(i(this)),r="",o=t(n);if(o<0||o===1/0)throw new a("Wrong number of repetitions");for(;o>0;(o>>>=1)&&(e+=e))1&o&&(r+=e);return r}},23994:function(n,e,r){r(68077)({target:"Object",stat:!0},{is:r(93577)})},7179:function(n,e,r){r(68077)({target:"String",proto:!0},{repeat:r(93892)})},22481:function(n,e,r){var t=r(68077),u=r(9941),i=r(90476);t({target:"Array",proto:!0},{group:function(n){return u(this,n,arguments.length>1?arguments[1]:void 0)}}),i("group")}}]);
+//# sourceMappingURL=7021.FlYVe8e0Xkc.js.map
\ No newline at end of file
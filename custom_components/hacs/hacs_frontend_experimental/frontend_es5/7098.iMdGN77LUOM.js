@@ -0,0 +1,3 @@
+/*! For license information please see 7098.iMdGN77LUOM.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7098],{8485:function(e,r,t){t.d(r,{a:function(){return x}});var i,o=t(88962),a=t(99312),n=t(81043),c=t(71650),d=t(33368),l=t(68308),s=t(69205),u=t(43204),p=t(72774),h={ROOT:"mdc-form-field"},v={LABEL_SELECTOR:".mdc-form-field > label"},m=function(e){function r(t){var i=e.call(this,(0,u.__assign)((0,u.__assign)({},r.defaultAdapter),t))||this;return i.click=function(){i.handleClick()},i}return(0,u.__extends)(r,e),Object.defineProperty(r,"cssClasses",{get:function(){return h},enumerable:!1,configurable:!0}),Object.defineProperty(r,"strings",{get:function(){return v},enumerable:!1,configurable:!0}),Object.defineProperty(r,"defaultAdapter",{get:function(){return{activateInputRipple:function(){},deactivateInputRipple:function(){},deregisterInteractionHandler:function(){},registerInteractionHandler:function(){}}},enumerable:!1,configurable:!0}),r.prototype.init=function(){this.adapter.registerInteractionHandler("click",this.click)},r.prototype.destroy=function(){this.adapter.deregisterInteractionHandler("click",this.click)},r.prototype.handleClick=function(){var e=this;this.adapter.activateInputRipple(),requestAnimationFrame((function(){e.adapter.deactivateInputRipple()}))},r}(p.K),b=t(78220),f=t(18601),g=t(14114),_=t(5095),y=t(95260),k=t(53180),x=function(e){function r(){var e;return(0,c.Z)(this,r),(e=(0,l.Z)(this,r,arguments)).alignEnd=!1,e.spaceBetween=!1,e.nowrap=!1,e.label="",e.mdcFoundationClass=m,e}return(0,s.Z)(r,e),(0,d.Z)(r,[{key:"createAdapter",value:function(){var e,r,t=this;return{registerInteractionHandler:function(e,r){t.labelEl.addEventListener(e,r)},deregisterInteractionHandler:function(e,r){t.labelEl.removeEventListener(e,r)},activateInputRipple:(r=(0,n.Z)((0,a.Z)().mark((function e(){var r,i;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!((r=t.input)instanceof f.Wg)){e.next=6;break}return e.next=4,r.ripple;case 4:(i=e.sent)&&i.startPress();case 6:case"end":return e.stop()}}),e)}))),function(){return r.apply(this,arguments)}),deactivateInputRipple:(e=(0,n.Z)((0,a.Z)().mark((function e(){var r,i;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!((r=t.input)instanceof f.Wg)){e.next=6;break}return e.next=4,r.ripple;case 4:(i=e.sent)&&i.endPress();case 6:case"end":return e.stop()}}),e)}))),function(){return e.apply(this,arguments)})}}},{key:"input",get:function(){var e,r;return null!==(r=null===(e=this.slottedInputs)||void 0===e?void 0:e[0])&&void 0!==r?r:null}},{key:"render",value:function(){var e={"mdc-form-field--align-end":this.alignEnd,"mdc-form-field--space-between":this.spaceBetween,"mdc-form-field--nowrap":this.nowrap};return(0,_.dy)(i||(i=(0,o.Z)([' <div class="mdc-form-field ','"> <slot></slot> <label class="mdc-label" @click="','">',"</label> </div>"])),(0,k.$)(e),this._labelClick,this.label)}},{key:"click",value:function(){this._labelClick()}},{key:"_labelClick",value:function(){var e=this.input;e&&(e.focus(),e.click())}}]),r}(b.H);(0,u.__decorate)([(0,y.Cb)({type:Boolean})],x.prototype,"alignEnd",void 0),(0,u.__decorate)([(0,y.Cb)({type:Boolean})],x.prototype,"spaceBetween",void 0),(0,u.__decorate)([(0,y.Cb)({type:Boolean})],x.prototype,"nowrap",void 0),(0,u.__decorate)([(0,y.Cb)({type:String}),(0,g.P)(function(){var e=(0,n.Z)((0,a.Z)().mark((function e(r){var t;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:null===(t=this.input)||void 0===t||t.setAttribute("aria-label",r);case 1:case"end":return e.stop()}}),e,this)})));return function(r){return e.apply(this,arguments)}}())],x.prototype,"label",void 0),(0,u.__decorate)([(0,y.IO)(".mdc-form-field")],x.prototype,"mdcRoot",void 0),(0,u.__decorate)([(0,y.vZ)("",!0,"*")],x.prototype,"slottedInputs",void 0),(0,u.__decorate)([(0,y.IO)("label")],x.prototype,"labelEl",void 0)},92038:function(e,r,t){t.d(r,{W:function(){return a}});var i,o=t(88962),a=(0,t(5095).iv)(i||(i=(0,o.Z)([".mdc-form-field{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87));display:inline-flex;align-items:center;vertical-align:middle}.mdc-form-field>label{margin-left:0;margin-right:auto;padding-left:4px;padding-right:0;order:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{margin-left:auto;margin-right:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{padding-left:0;padding-right:4px}.mdc-form-field--nowrap>label{text-overflow:ellipsis;overflow:hidden;white-space:nowrap}.mdc-form-field--align-end>label{margin-left:auto;margin-right:0;padding-left:0;padding-right:4px;order:-1}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{margin-left:0;margin-right:auto}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{padding-left:4px;padding-right:0}.mdc-form-field--space-between{justify-content:space-between}.mdc-form-field--space-between>label{margin:0}.mdc-form-field--space-between>label[dir=rtl],[dir=rtl] .mdc-form-field--space-between>label{margin:0}:host{display:inline-flex}.mdc-form-field{width:100%}::slotted(*){-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87))}::slotted(mwc-switch){margin-right:10px}::slotted(mwc-switch[dir=rtl]),[dir=rtl] ::slotted(mwc-switch){margin-left:10px}"])))},57463:function(e,r,t){t.d(r,{J:function(){return R}});var i,o,a=t(88962),n=t(71650),c=t(33368),d=t(68308),l=t(34541),s=t(47838),u=t(69205),p=(t(22859),t(85717),t(76843),t(43204)),h=(t(27763),t(38103)),v=t(18601),m=t(14114),b=t(40039),f=(t(94738),t(98214),t(46798),t(51358),t(78399),t(5239),t(56086),t(47884),t(81912),t(64584),t(41483),t(12367),t(9454),t(98490),t(56308),t(32797),t(37313),Symbol("selection controller")),g=(0,c.Z)((function e(){(0,n.Z)(this,e),this.selected=null,this.ordered=null,this.set=new Set})),_=function(){function e(r){var t=this;(0,n.Z)(this,e),this.sets={},this.focusedSet=null,this.mouseIsDown=!1,this.updating=!1,r.addEventListener("keydown",(function(e){t.keyDownHandler(e)})),r.addEventListener("mousedown",(function(){t.mousedownHandler()})),r.addEventListener("mouseup",(function(){t.mouseupHandler()}))}return(0,c.Z)(e,[{key:"keyDownHandler",value:function(e){var r=e.target;"checked"in r&&this.has(r)&&("ArrowRight"==e.key||"ArrowDown"==e.key?this.selectNext(r):"ArrowLeft"!=e.key&&"ArrowUp"!=e.key||this.selectPrevious(r))}},{key:"mousedownHandler",value:function(){this.mouseIsDown=!0}},{key:"mouseupHandler",value:function(){this.mouseIsDown=!1}},{key:"has",value:function(e){return this.getSet(e.name).set.has(e)}},{key:"selectPrevious",value:function(e){var r=this.getOrdered(e),t=r.indexOf(e),i=r[t-1]||r[r.length-1];return this.select(i),i}},{key:"selectNext",value:function(e){var r=this.getOrdered(e),t=r.indexOf(e),i=r[t+1]||r[0];return this.select(i),i}},{key:"select",value:function(e){e.click()}},{key:"focus",value:function(e){if(!this.mouseIsDown){var r=this.getSet(e.name),t=this.focusedSet;this.focusedSet=r,t!=r&&r.selected&&r.selected!=e&&r.selected.focus()}}},{key:"isAnySelected",value:function(e){var r,t=this.getSet(e.name),i=(0,b.Z)(t.set);try{for(i.s();!(r=i.n()).done;){if(r.value.checked)return!0}}catch(o){i.e(o)}finally{i.f()}return!1}},{key:"getOrdered",value:function(e){var r=this.getSet(e.name);return r.ordered||(r.ordered=Array.from(r.set),r.ordered.sort((function(e,r){return e.compareDocumentPosition(r)==Node.DOCUMENT_POSITION_PRECEDING?1:0}))),r.ordered}},{key:"getSet",value:function(e){return this.sets[e]||(this.sets[e]=new g),this.sets[e]}},{key:"register",value:function(e){var r=e.name||e.getAttribute("name")||"",t=this.getSet(r);t.set.add(e),t.ordered=null}},{key:"unregister",value:function(e){var r=this.getSet(e.name);r.set.delete(e),r.ordered=null,r.selected==e&&(r.selected=null)}},{key:"update",value:function(e){if(!this.updating){this.updating=!0;var r=this.getSet(e.name);if(e.checked){var t,i=(0,b.Z)(r.set);try{for(i.s();!(t=i.n()).done;){var o=t.value;o!=e&&(o.checked=!1)}}catch(d){i.e(d)}finally{i.f()}r.selected=e}if(this.isAnySelected(e)){var a,n=(0,b.Z)(r.set);try{for(n.s();!(a=n.n()).done;){var c=a.value;if(void 0===c.formElementTabIndex)break;c.formElementTabIndex=c.checked?0:-1}}catch(d){n.e(d)}finally{n.f()}}this.updating=!1}}}],[{key:"getController",value:function(r){var t=!("global"in r)||"global"in r&&r.global?document:r.getRootNode(),i=t[f];return void 0===i&&(i=new e(t),t[f]=i),i}}]),e}(),y=t(98734),k=t(72774),x={NATIVE_CONTROL_SELECTOR:".mdc-radio__native-control"},w={DISABLED:"mdc-radio--disabled",ROOT:"mdc-radio"},Z=function(e){function r(t){return e.call(this,(0,p.__assign)((0,p.__assign)({},r.defaultAdapter),t))||this}return(0,p.__extends)(r,e),Object.defineProperty(r,"cssClasses",{get:function(){return w},enumerable:!1,configurable:!0}),Object.defineProperty(r,"strings",{get:function(){return x},enumerable:!1,configurable:!0}),Object.defineProperty(r,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},setNativeControlDisabled:function(){}}},enumerable:!1,configurable:!0}),r.prototype.setDisabled=function(e){var t=r.cssClasses.DISABLED;this.adapter.setNativeControlDisabled(e),e?this.adapter.addClass(t):this.adapter.removeClass(t)},r}(k.K),C=t(5095),E=t(95260),I=t(53180),A=t(10694),R=function(e){function r(){var e;return(0,n.Z)(this,r),(e=(0,d.Z)(this,r,arguments))._checked=!1,e.useStateLayerCustomProperties=!1,e.global=!1,e.disabled=!1,e.value="on",e.name="",e.reducedTouchTarget=!1,e.mdcFoundationClass=Z,e.formElementTabIndex=0,e.focused=!1,e.shouldRenderRipple=!1,e.rippleElement=null,e.rippleHandlers=new y.A((function(){return e.shouldRenderRipple=!0,e.ripple.then((function(r){e.rippleElement=r})),e.ripple})),e}return(0,u.Z)(r,e),(0,c.Z)(r,[{key:"checked",get:function(){return this._checked},set:function(e){var r,t,i=this._checked;e!==i&&(this._checked=e,this.formElement&&(this.formElement.checked=e),null===(r=this._selectionController)||void 0===r||r.update(this),!1===e&&(null===(t=this.formElement)||void 0===t||t.blur()),this.requestUpdate("checked",i),this.dispatchEvent(new Event("checked",{bubbles:!0,composed:!0})))}},{key:"_handleUpdatedValue",value:function(e){this.formElement.value=e}},{key:"renderRipple",value:function(){return this.shouldRenderRipple?(0,C.dy)(i||(i=(0,a.Z)(['<mwc-ripple unbounded accent .internalUseStateLayerCustomProperties="','" .disabled="','"></mwc-ripple>'])),this.useStateLayerCustomProperties,this.disabled):""}},{key:"isRippleActive",get:function(){var e;return(null===(e=this.rippleElement)||void 0===e?void 0:e.isActive)||!1}},{key:"connectedCallback",value:function(){(0,l.Z)((0,s.Z)(r.prototype),"connectedCallback",this).call(this),this._selectionController=_.getController(this),this._selectionController.register(this),this._selectionController.update(this)}},{key:"disconnectedCallback",value:function(){this._selectionController.unregister(this),this._selectionController=void 0}},{key:"focus",value:function(){this.formElement.focus()}},{key:"createAdapter",value:function(){var e=this;return Object.assign(Object.assign({},(0,v.qN)(this.mdcRoot)),{setNativeControlDisabled:function(r){e.formElement.disabled=r}})}},{key:"handleFocus",value:function(){this.focused=!0,this.handleRippleFocus()}},{key:"handleClick",value:function(){this.formElement.focus()}},{key:"handleBlur",value:function(){this.focused=!1,this.formElement.blur(),this.rippleHandlers.endFocus()}},{key:"setFormData",value:function(e){this.name&&this.checked&&e.append(this.name,this.value)}},{key:"render",value:function(){var e={"mdc-radio--touch":!this.reducedTouchTarget,"mdc-ripple-upgraded--background-focused":this.focused,"mdc-radio--disabled":this.disabled};return(0,C.dy)(o||(o=(0,a.Z)([' <div class="mdc-radio ','"> <input tabindex="','" class="mdc-radio__native-control" type="radio" name="','" aria-label="','" aria-labelledby="','" .checked="','" .value="','" ?disabled="','" @change="','" @focus="','" @click="','" @blur="','" @mousedown="','" @mouseenter="','" @mouseleave="','" @touchstart="','" @touchend="','" @touchcancel="','"> <div class="mdc-radio__background"> <div class="mdc-radio__outer-circle"></div> <div class="mdc-radio__inner-circle"></div> </div> '," </div>"])),(0,I.$)(e),this.formElementTabIndex,this.name,(0,A.o)(this.ariaLabel),(0,A.o)(this.ariaLabelledBy),this.checked,this.value,this.disabled,this.changeHandler,this.handleFocus,this.handleClick,this.handleBlur,this.handleRippleMouseDown,this.handleRippleMouseEnter,this.handleRippleMouseLeave,this.handleRippleTouchStart,this.handleRippleDeactivate,this.handleRippleDeactivate,this.renderRipple())}},{key:"handleRippleMouseDown",value:function(e){var r=this;window.addEventListener("mouseup",(function e(){window.removeEventListener("mouseup",e),r.handleRippleDeactivate()})),this.rippleHandlers.startPress(e)}},{key:"handleRippleTouchStart",value:function(e){this.rippleHandlers.startPress(e)}},{key:"handleRippleDeactivate",value:function(){this.rippleHandlers.endPress()}},{key:"handleRippleMouseEnter",value:function(){this.rippleHandlers.startHover()}},{key:"handleRippleMouseLeave",value:function(){this.rippleHandlers.endHover()}},{key:"handleRippleFocus",value:function(){this.rippleHandlers.startFocus()}},{key:"changeHandler",value:function(){this.checked=this.formElement.checked}}]),r}(v.Wg);(0,p.__decorate)([(0,E.IO)(".mdc-radio")],R.prototype,"mdcRoot",void 0),(0,p.__decorate)([(0,E.IO)("input")],R.prototype,"formElement",void 0),(0,p.__decorate)([(0,E.SB)()],R.prototype,"useStateLayerCustomProperties",void 0),(0,p.__decorate)([(0,E.Cb)({type:Boolean})],R.prototype,"global",void 0),(0,p.__decorate)([(0,E.Cb)({type:Boolean,reflect:!0})],R.prototype,"checked",null),(0,p.__decorate)([(0,E.Cb)({type:Boolean}),(0,m.P)((function(e){this.mdcFoundation.setDisabled(e)}))],R.prototype,"disabled",void 0),(0,p.__decorate)([(0,E.Cb)({type:String}),(0,m.P)((function(e){this._handleUpdatedValue(e)}))],R.prototype,"value",void 0),(0,p.__decorate)([(0,E.Cb)({type:String})],R.prototype,"name",void 0),(0,p.__decorate)([(0,E.Cb)({type:Boolean})],R.prototype,"reducedTouchTarget",void 0),(0,p.__decorate)([(0,E.Cb)({type:Number})],R.prototype,"formElementTabIndex",void 0),(0,p.__decorate)([(0,E.SB)()],R.prototype,"focused",void 0),(0,p.__decorate)([(0,E.SB)()],R.prototype,"shouldRenderRipple",void 0),(0,p.__decorate)([(0,E.GC)("mwc-ripple")],R.prototype,"ripple",void 0),(0,p.__decorate)([h.L,(0,E.Cb)({attribute:"aria-label"})],R.prototype,"ariaLabel",void 0),(0,p.__decorate)([h.L,(0,E.Cb)({attribute:"aria-labelledby"})],R.prototype,"ariaLabelledBy",void 0),(0,p.__decorate)([(0,E.hO)({passive:!0})],R.prototype,"handleRippleTouchStart",null)},44973:function(e,r,t){t.d(r,{W:function(){return a}});var i,o=t(88962),a=(0,t(5095).iv)(i||(i=(0,o.Z)(['.mdc-touch-target-wrapper{display:inline}.mdc-radio{padding:calc((40px - 20px)/ 2)}.mdc-radio .mdc-radio__native-control:enabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:rgba(0,0,0,.54)}.mdc-radio .mdc-radio__native-control:enabled:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:#018786;border-color:var(--mdc-theme-secondary,#018786)}.mdc-radio .mdc-radio__native-control:enabled+.mdc-radio__background .mdc-radio__inner-circle{border-color:#018786;border-color:var(--mdc-theme-secondary,#018786)}.mdc-radio .mdc-radio__native-control:disabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:rgba(0,0,0,.38)}.mdc-radio .mdc-radio__native-control:disabled:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:rgba(0,0,0,.38)}.mdc-radio .mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background .mdc-radio__inner-circle{border-color:rgba(0,0,0,.38)}.mdc-radio .mdc-radio__background::before{background-color:#018786;background-color:var(--mdc-theme-secondary,#018786)}.mdc-radio .mdc-radio__background::before{top:calc(-1 * (40px - 20px)/ 2);left:calc(-1 * (40px - 20px)/ 2);width:40px;height:40px}.mdc-radio .mdc-radio__native-control{top:calc((40px - 40px)/ 2);right:calc((40px - 40px)/ 2);left:calc((40px - 40px)/ 2);width:40px;height:40px}@media screen and (forced-colors:active),(-ms-high-contrast:active){.mdc-radio.mdc-radio--disabled .mdc-radio__native-control:disabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio.mdc-radio--disabled [aria-disabled=true] .mdc-radio__native-control:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:GrayText}.mdc-radio.mdc-radio--disabled .mdc-radio__native-control:disabled:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio.mdc-radio--disabled [aria-disabled=true] .mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:GrayText}.mdc-radio.mdc-radio--disabled .mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio.mdc-radio--disabled [aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background .mdc-radio__inner-circle{border-color:GrayText}}.mdc-radio{display:inline-block;position:relative;flex:0 0 auto;box-sizing:content-box;width:20px;height:20px;cursor:pointer;will-change:opacity,transform,border-color,color}.mdc-radio__background{display:inline-block;position:relative;box-sizing:border-box;width:20px;height:20px}.mdc-radio__background::before{position:absolute;transform:scale(0,0);border-radius:50%;opacity:0;pointer-events:none;content:"";transition:opacity 120ms 0s cubic-bezier(.4, 0, .6, 1),transform 120ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-radio__outer-circle{position:absolute;top:0;left:0;box-sizing:border-box;width:100%;height:100%;border-width:2px;border-style:solid;border-radius:50%;transition:border-color 120ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-radio__inner-circle{position:absolute;top:0;left:0;box-sizing:border-box;width:100%;height:100%;transform:scale(0,0);border-width:10px;border-style:solid;border-radius:50%;transition:transform 120ms 0s cubic-bezier(.4, 0, .6, 1),border-color 120ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-radio__native-control{position:absolute;margin:0;padding:0;opacity:0;cursor:inherit;z-index:1}.mdc-radio--touch{margin-top:4px;margin-bottom:4px;margin-right:4px;margin-left:4px}.mdc-radio--touch .mdc-radio__native-control{top:calc((40px - 48px)/ 2);right:calc((40px - 48px)/ 2);left:calc((40px - 48px)/ 2);width:48px;height:48px}.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring{pointer-events:none;border:2px solid transparent;border-radius:6px;box-sizing:content-box;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:100%;width:100%}@media screen and (forced-colors:active){.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring{border-color:CanvasText}}.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring::after,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring::after{content:"";border:2px solid transparent;border-radius:8px;display:block;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}@media screen and (forced-colors:active){.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring::after,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring::after{border-color:CanvasText}}.mdc-radio__native-control:checked+.mdc-radio__background,.mdc-radio__native-control:disabled+.mdc-radio__background{transition:opacity 120ms 0s cubic-bezier(0, 0, .2, 1),transform 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__outer-circle{transition:border-color 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle{transition:transform 120ms 0s cubic-bezier(0, 0, .2, 1),border-color 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio--disabled{cursor:default;pointer-events:none}.mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__inner-circle{transform:scale(.5);transition:transform 120ms 0s cubic-bezier(0, 0, .2, 1),border-color 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio__native-control:disabled+.mdc-radio__background,[aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background{cursor:default}.mdc-radio__native-control:focus+.mdc-radio__background::before{transform:scale(1);opacity:.12;transition:opacity 120ms 0s cubic-bezier(0, 0, .2, 1),transform 120ms 0s cubic-bezier(0, 0, .2, 1)}:host{display:inline-block;outline:0}.mdc-radio{vertical-align:bottom}.mdc-radio .mdc-radio__native-control:enabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:var(--mdc-radio-unchecked-color,rgba(0,0,0,.54))}.mdc-radio .mdc-radio__native-control:disabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:var(--mdc-radio-disabled-color,rgba(0,0,0,.38))}.mdc-radio .mdc-radio__native-control:disabled:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:var(--mdc-radio-disabled-color,rgba(0,0,0,.38))}.mdc-radio .mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background .mdc-radio__inner-circle{border-color:var(--mdc-radio-disabled-color,rgba(0,0,0,.38))}'])))},24038:function(e,r,t){var i=t(13089);e.exports=function(e){try{if(i)return Function('return require("'+e+'")')()}catch(r){}}},18846:function(e,r,t){t.d(r,{l:function(){return g}});var i,o,a=t(33368),n=t(71650),c=t(68308),d=t(69205),l=t(43204),s=t(95260),u=t(40039),p=t(88962),h=t(82390),v=(t(87438),t(46798),t(9849),t(22890),t(85472),t(90126),t(56308),t(5095)),m=t(8674),b=function(e){function r(){var e;return(0,n.Z)(this,r),(e=(0,c.Z)(this,r)).internals=e.attachInternals(),v.sk||(e.addEventListener("focusin",e.updateTabIndices.bind((0,h.Z)(e))),e.addEventListener("update-focus",e.updateTabIndices.bind((0,h.Z)(e))),e.addEventListener("keydown",e.handleKeyDown.bind((0,h.Z)(e))),e.internals.role="toolbar"),e}return(0,d.Z)(r,e),(0,a.Z)(r,[{key:"chips",get:function(){return this.childElements.filter((function(e){return e instanceof m.A}))}},{key:"render",value:function(){return(0,v.dy)(i||(i=(0,p.Z)(['<slot @slotchange="','"></slot>'])),this.updateTabIndices)}},{key:"handleKeyDown",value:function(e){var r="ArrowLeft"===e.key,t="ArrowRight"===e.key,i="Home"===e.key,o="End"===e.key;if(r||t||i||o){var a=this.chips;if(!(a.length<2)){if(e.preventDefault(),i||o)return a[i?0:a.length-1].focus({trailing:o}),void this.updateTabIndices();var n="rtl"===getComputedStyle(this).direction?r:t,c=a.find((function(e){return e.matches(":focus-within")}));if(!c)return(n?a[0]:a[a.length-1]).focus({trailing:!n}),void this.updateTabIndices();for(var d=a.indexOf(c),l=n?d+1:d-1;l!==d;){l>=a.length?l=0:l<0&&(l=a.length-1);var s=a[l];if(!s.disabled||s.alwaysFocusable){s.focus({trailing:!n}),this.updateTabIndices();break}n?l++:l--}}}}},{key:"updateTabIndices",value:function(){var e,r,t=this.chips,i=(0,u.Z)(t);try{for(i.s();!(r=i.n()).done;){var o=r.value,a=o.alwaysFocusable||!o.disabled;o.matches(":focus-within")&&a?e=o:(a&&!e&&(e=o),o.tabIndex=-1)}}catch(n){i.e(n)}finally{i.f()}e&&(e.tabIndex=0)}}]),r}(v.oi);(0,l.__decorate)([(0,s.NH)()],b.prototype,"childElements",void 0);var f=(0,v.iv)(o||(o=(0,p.Z)([":host{display:flex;flex-wrap:wrap;gap:8px}"]))),g=function(e){function r(){return(0,n.Z)(this,r),(0,c.Z)(this,r,arguments)}return(0,d.Z)(r,e),(0,a.Z)(r)}(b);g.styles=[f],g=(0,l.__decorate)([(0,s.Mo)("md-chip-set")],g)},16587:function(e,r,t){t.d(r,{W:function(){return z}});var i,o,a,n,c,d=t(33368),l=t(71650),s=t(68308),u=t(69205),p=t(43204),h=t(95260),v=t(88962),m=t(34541),b=t(47838),f=(t(85717),t(5095)),g=t(82390),_=t(8674),y="aria-label-remove",k=function(e){function r(){var e;return(0,l.Z)(this,r),(e=(0,s.Z)(this,r)).handleTrailingActionFocus=e.handleTrailingActionFocus.bind((0,g.Z)(e)),f.sk||e.addEventListener("keydown",e.handleKeyDown.bind((0,g.Z)(e))),e}return(0,u.Z)(r,e),(0,d.Z)(r,[{key:"ariaLabelRemove",get:function(){if(this.hasAttribute(y))return this.getAttribute(y);var e=this.ariaLabel;return"Remove ".concat(e||this.label)},set:function(e){e!==this.ariaLabelRemove&&(null===e?this.removeAttribute(y):this.setAttribute(y,e),this.requestUpdate())}},{key:"focus",value:function(e){(this.alwaysFocusable||!this.disabled)&&null!=e&&e.trailing&&this.trailingAction?this.trailingAction.focus(e):(0,m.Z)((0,b.Z)(r.prototype),"focus",this).call(this,e)}},{key:"renderContainerContent",value:function(){return(0,f.dy)(i||(i=(0,v.Z)([" "," "," "])),(0,m.Z)((0,b.Z)(r.prototype),"renderContainerContent",this).call(this),this.renderTrailingAction(this.handleTrailingActionFocus))}},{key:"handleKeyDown",value:function(e){var r,t,i="ArrowLeft"===e.key,o="ArrowRight"===e.key;if((i||o)&&this.primaryAction&&this.trailingAction){var a="rtl"===getComputedStyle(this).direction?i:o,n=null===(r=this.primaryAction)||void 0===r?void 0:r.matches(":focus-within"),c=null===(t=this.trailingAction)||void 0===t?void 0:t.matches(":focus-within");if(!(a&&c||!a&&n))e.preventDefault(),e.stopPropagation(),(a?this.trailingAction:this.primaryAction).focus()}}},{key:"handleTrailingActionFocus",value:function(){var e=this.primaryAction,r=this.trailingAction;e&&r&&(e.tabIndex=-1,r.addEventListener("focusout",(function(){e.tabIndex=0}),{once:!0}))}}]),r}(_.A);t(86477),t(35981);function x(e){this.disabled||(e.stopPropagation(),!this.dispatchEvent(new Event("remove",{cancelable:!0}))||this.remove())}var w,Z=function(e){function r(){var e;return(0,l.Z)(this,r),(e=(0,s.Z)(this,r,arguments)).avatar=!1,e.href="",e.target="",e.removeOnly=!1,e.selected=!1,e}return(0,u.Z)(r,e),(0,d.Z)(r,[{key:"primaryId",get:function(){return this.href?"link":this.removeOnly?"":"button"}},{key:"rippleDisabled",get:function(){return!this.href&&this.disabled}},{key:"primaryAction",get:function(){return this.removeOnly?null:this.renderRoot.querySelector(".primary.action")}},{key:"getContainerClasses",value:function(){return Object.assign(Object.assign({},(0,m.Z)((0,b.Z)(r.prototype),"getContainerClasses",this).call(this)),{},{avatar:this.avatar,disabled:!this.href&&this.disabled,link:!!this.href,selected:this.selected,"has-trailing":!0})}},{key:"renderPrimaryAction",value:function(e){var r=this.ariaLabel;return this.href?(0,f.dy)(a||(a=(0,v.Z)([' <a class="primary action" id="link" aria-label="','" href="','" target="','">',"</a> "])),r||f.Ld,this.href,this.target||f.Ld,e):this.removeOnly?(0,f.dy)(n||(n=(0,v.Z)([' <span class="primary action" aria-label="','"> '," </span> "])),r||f.Ld,e):(0,f.dy)(c||(c=(0,v.Z)([' <button class="primary action" id="button" aria-label="','" ?disabled="','" type="button">',"</button> "])),r||f.Ld,this.disabled&&!this.alwaysFocusable,e)}},{key:"renderTrailingAction",value:function(e){return function(e){var r=e.ariaLabel,t=e.disabled,i=e.focusListener,a=e.tabbable,n=void 0!==a&&a;return(0,f.dy)(o||(o=(0,v.Z)([' <button class="trailing action" aria-label="','" tabindex="','" @click="','" @focus="','"> <md-focus-ring part="trailing-focus-ring"></md-focus-ring> <md-ripple ?disabled="','"></md-ripple> <span class="trailing icon" aria-hidden="true"> <slot name="remove-trailing-icon"> <svg viewBox="0 96 960 960"> <path d="m249 849-42-42 231-231-231-231 42-42 231 231 231-231 42 42-231 231 231 231-42 42-231-231-231 231Z"/> </svg> </slot> </span> <span class="touch"></span> </button> '])),r,n?f.Ld:-1,x,i,t)}({focusListener:e,ariaLabel:this.ariaLabelRemove,disabled:!this.href&&this.disabled,tabbable:this.removeOnly})}}]),r}(k);(0,p.__decorate)([(0,h.Cb)({type:Boolean})],Z.prototype,"avatar",void 0),(0,p.__decorate)([(0,h.Cb)()],Z.prototype,"href",void 0),(0,p.__decorate)([(0,h.Cb)()],Z.prototype,"target",void 0),(0,p.__decorate)([(0,h.Cb)({type:Boolean,attribute:"remove-only"})],Z.prototype,"removeOnly",void 0),(0,p.__decorate)([(0,h.Cb)({type:Boolean,reflect:!0})],Z.prototype,"selected",void 0),(0,p.__decorate)([(0,h.IO)(".trailing.action")],Z.prototype,"trailingAction",void 0);var C,E,I=(0,f.iv)(w||(w=(0,v.Z)([":host{--_container-height:var(--md-input-chip-container-height, 32px);--_container-shape:var(--md-input-chip-container-shape, 8px);--_disabled-label-text-color:var(--md-input-chip-disabled-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-label-text-opacity:var(--md-input-chip-disabled-label-text-opacity, 0.38);--_disabled-selected-container-color:var(--md-input-chip-disabled-selected-container-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-selected-container-opacity:var(--md-input-chip-disabled-selected-container-opacity, 0.12);--_label-text-font:var(--md-input-chip-label-text-font, var(--md-sys-typescale-label-large-font, var(--md-ref-typeface-plain, Roboto)));--_label-text-line-height:var(--md-input-chip-label-text-line-height, var(--md-sys-typescale-label-large-line-height, 1.25rem));--_label-text-size:var(--md-input-chip-label-text-size, var(--md-sys-typescale-label-large-size, 0.875rem));--_label-text-weight:var(--md-input-chip-label-text-weight, var(--md-sys-typescale-label-large-weight, var(--md-ref-typeface-weight-medium, 500)));--_selected-container-color:var(--md-input-chip-selected-container-color, var(--md-sys-color-secondary-container, #e8def8));--_selected-focus-label-text-color:var(--md-input-chip-selected-focus-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-label-text-color:var(--md-input-chip-selected-hover-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-state-layer-color:var(--md-input-chip-selected-hover-state-layer-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-state-layer-opacity:var(--md-input-chip-selected-hover-state-layer-opacity, 0.08);--_selected-label-text-color:var(--md-input-chip-selected-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-outline-width:var(--md-input-chip-selected-outline-width, 0px);--_selected-pressed-label-text-color:var(--md-input-chip-selected-pressed-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-pressed-state-layer-color:var(--md-input-chip-selected-pressed-state-layer-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-pressed-state-layer-opacity:var(--md-input-chip-selected-pressed-state-layer-opacity, 0.12);--_disabled-outline-color:var(--md-input-chip-disabled-outline-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-outline-opacity:var(--md-input-chip-disabled-outline-opacity, 0.12);--_focus-label-text-color:var(--md-input-chip-focus-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_focus-outline-color:var(--md-input-chip-focus-outline-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-label-text-color:var(--md-input-chip-hover-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-state-layer-color:var(--md-input-chip-hover-state-layer-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-state-layer-opacity:var(--md-input-chip-hover-state-layer-opacity, 0.08);--_label-text-color:var(--md-input-chip-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_outline-color:var(--md-input-chip-outline-color, var(--md-sys-color-outline, #79747e));--_outline-width:var(--md-input-chip-outline-width, 1px);--_pressed-label-text-color:var(--md-input-chip-pressed-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_pressed-state-layer-color:var(--md-input-chip-pressed-state-layer-color, var(--md-sys-color-on-surface-variant, #49454f));--_pressed-state-layer-opacity:var(--md-input-chip-pressed-state-layer-opacity, 0.12);--_avatar-shape:var(--md-input-chip-avatar-shape, 9999px);--_avatar-size:var(--md-input-chip-avatar-size, 24px);--_disabled-avatar-opacity:var(--md-input-chip-disabled-avatar-opacity, 0.38);--_disabled-leading-icon-color:var(--md-input-chip-disabled-leading-icon-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-leading-icon-opacity:var(--md-input-chip-disabled-leading-icon-opacity, 0.38);--_icon-size:var(--md-input-chip-icon-size, 18px);--_selected-focus-leading-icon-color:var(--md-input-chip-selected-focus-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_selected-hover-leading-icon-color:var(--md-input-chip-selected-hover-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_selected-leading-icon-color:var(--md-input-chip-selected-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_selected-pressed-leading-icon-color:var(--md-input-chip-selected-pressed-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_focus-leading-icon-color:var(--md-input-chip-focus-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_hover-leading-icon-color:var(--md-input-chip-hover-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_leading-icon-color:var(--md-input-chip-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_pressed-leading-icon-color:var(--md-input-chip-pressed-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_disabled-trailing-icon-color:var(--md-input-chip-disabled-trailing-icon-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-trailing-icon-opacity:var(--md-input-chip-disabled-trailing-icon-opacity, 0.38);--_selected-focus-trailing-icon-color:var(--md-input-chip-selected-focus-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-trailing-icon-color:var(--md-input-chip-selected-hover-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-pressed-trailing-icon-color:var(--md-input-chip-selected-pressed-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-trailing-icon-color:var(--md-input-chip-selected-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_focus-trailing-icon-color:var(--md-input-chip-focus-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-trailing-icon-color:var(--md-input-chip-hover-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_pressed-trailing-icon-color:var(--md-input-chip-pressed-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_trailing-icon-color:var(--md-input-chip-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_leading-space:var(--md-input-chip-leading-space, 16px);--_trailing-space:var(--md-input-chip-trailing-space, 16px);--_icon-label-space:var(--md-input-chip-icon-label-space, 8px);--_with-leading-icon-leading-space:var(--md-input-chip-with-leading-icon-leading-space, 8px);--_with-trailing-icon-trailing-space:var(--md-input-chip-with-trailing-icon-trailing-space, 8px);--_container-shape-start-start:var( --md-input-chip-container-shape-start-start, var(--_container-shape) );--_container-shape-start-end:var( --md-input-chip-container-shape-start-end, var(--_container-shape) );--_container-shape-end-end:var( --md-input-chip-container-shape-end-end, var(--_container-shape) );--_container-shape-end-start:var( --md-input-chip-container-shape-end-start, var(--_container-shape) )}:host([avatar]){--_container-shape-start-start:var( --md-input-chip-container-shape-start-start, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) );--_container-shape-start-end:var( --md-input-chip-container-shape-start-end, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) );--_container-shape-end-end:var( --md-input-chip-container-shape-end-end, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) );--_container-shape-end-start:var( --md-input-chip-container-shape-end-start, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) )}.avatar .primary.action{padding-inline-start:4px}.avatar .leading.icon ::slotted(:first-child){border-radius:var(--_avatar-shape);height:var(--_avatar-size);width:var(--_avatar-size)}.disabled.avatar .leading.icon{opacity:var(--_disabled-avatar-opacity)}@media(forced-colors:active){.link .outline{border-color:ActiveText}.disabled.avatar .leading.icon{opacity:1}}"]))),A=(0,f.iv)(C||(C=(0,v.Z)([".selected{--md-ripple-hover-color:var(--_selected-hover-state-layer-color);--md-ripple-hover-opacity:var(--_selected-hover-state-layer-opacity);--md-ripple-pressed-color:var(--_selected-pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_selected-pressed-state-layer-opacity)}:where(.selected)::before{background:var(--_selected-container-color)}:where(.selected) .outline{border-width:var(--_selected-outline-width)}:where(.selected.disabled)::before{background:var(--_disabled-selected-container-color);opacity:var(--_disabled-selected-container-opacity)}:where(.selected) .label{color:var(--_selected-label-text-color)}:where(.selected:hover) .label{color:var(--_selected-hover-label-text-color)}:where(.selected:focus) .label{color:var(--_selected-focus-label-text-color)}:where(.selected:active) .label{color:var(--_selected-pressed-label-text-color)}:where(.selected) .leading.icon{color:var(--_selected-leading-icon-color)}:where(.selected:hover) .leading.icon{color:var(--_selected-hover-leading-icon-color)}:where(.selected:focus) .leading.icon{color:var(--_selected-focus-leading-icon-color)}:where(.selected:active) .leading.icon{color:var(--_selected-pressed-leading-icon-color)}@media(forced-colors:active){:where(.selected:not(.elevated))::before{border:1px solid CanvasText}:where(.selected) .outline{border-width:1px}}"]))),R=t(90704),L=(0,f.iv)(E||(E=(0,v.Z)([".trailing.action{align-items:center;justify-content:center;padding-inline-start:var(--_icon-label-space);padding-inline-end:var(--_with-trailing-icon-trailing-space)}.trailing.action :is(md-ripple,md-focus-ring){border-radius:50%;height:calc(1.3333333333*var(--_icon-size));width:calc(1.3333333333*var(--_icon-size))}.trailing.action md-focus-ring{inset:unset}.has-trailing .primary.action{padding-inline-end:0}.trailing.icon{color:var(--_trailing-icon-color);height:var(--_icon-size);width:var(--_icon-size)}:where(:hover) .trailing.icon{color:var(--_hover-trailing-icon-color)}:where(:focus) .trailing.icon{color:var(--_focus-trailing-icon-color)}:where(:active) .trailing.icon{color:var(--_pressed-trailing-icon-color)}:where(.disabled) .trailing.icon{color:var(--_disabled-trailing-icon-color);opacity:var(--_disabled-trailing-icon-opacity)}:where(.selected) .trailing.icon{color:var(--_selected-trailing-icon-color)}:where(.selected:hover) .trailing.icon{color:var(--_selected-hover-trailing-icon-color)}:where(.selected:focus) .trailing.icon{color:var(--_selected-focus-trailing-icon-color)}:where(.selected:active) .trailing.icon{color:var(--_selected-pressed-trailing-icon-color)}@media(forced-colors:active){.trailing.icon{color:ButtonText}:where(.disabled) .trailing.icon{color:GrayText;opacity:1}}"]))),z=function(e){function r(){return(0,l.Z)(this,r),(0,s.Z)(this,r,arguments)}return(0,u.Z)(r,e),(0,d.Z)(r)}(Z);z.styles=[R.W,L,A,I],z=(0,p.__decorate)([(0,h.Mo)("md-input-chip")],z)},8674:function(e,r,t){t.d(r,{A:function(){return y}});var i,o,a,n,c,d=t(88962),l=t(71650),s=t(33368),u=t(68308),p=t(34541),h=t(47838),v=t(69205),m=(t(85717),t(43204)),b=(t(86477),t(35981),t(5095)),f=t(95260),g=t(53180),_=t(6157),y=function(e){function r(){var e;return(0,l.Z)(this,r),(e=(0,u.Z)(this,r,arguments)).disabled=!1,e.alwaysFocusable=!1,e.label="",e.hasIcon=!1,e}return(0,v.Z)(r,e),(0,s.Z)(r,[{key:"rippleDisabled",get:function(){return this.disabled}},{key:"focus",value:function(e){this.disabled&&!this.alwaysFocusable||(0,p.Z)((0,h.Z)(r.prototype),"focus",this).call(this,e)}},{key:"render",value:function(){return(0,b.dy)(i||(i=(0,d.Z)([' <div class="container ','"> '," </div> "])),(0,g.$)(this.getContainerClasses()),this.renderContainerContent())}},{key:"updated",value:function(e){e.has("disabled")&&void 0!==e.get("disabled")&&this.dispatchEvent(new Event("update-focus",{bubbles:!0}))}},{key:"getContainerClasses",value:function(){return{disabled:this.disabled,"has-icon":this.hasIcon}}},{key:"renderContainerContent",value:function(){return(0,b.dy)(o||(o=(0,d.Z)([" ",' <md-focus-ring part="focus-ring" for="','"></md-focus-ring> <md-ripple for="','" ?disabled="','"></md-ripple> '," "])),this.renderOutline(),this.primaryId,this.primaryId,this.rippleDisabled,this.renderPrimaryAction(this.renderPrimaryContent()))}},{key:"renderOutline",value:function(){return(0,b.dy)(a||(a=(0,d.Z)(['<span class="outline"></span>'])))}},{key:"renderLeadingIcon",value:function(){return(0,b.dy)(n||(n=(0,d.Z)(['<slot name="icon" @slotchange="','"></slot>'])),this.handleIconChange)}},{key:"renderPrimaryContent",value:function(){return(0,b.dy)(c||(c=(0,d.Z)([' <span class="leading icon" aria-hidden="true"> ',' </span> <span class="label">','</span> <span class="touch"></span> '])),this.renderLeadingIcon(),this.label)}},{key:"handleIconChange",value:function(e){var r=e.target;this.hasIcon=r.assignedElements({flatten:!0}).length>0}}]),r}(b.oi);(0,_.d)(y),y.shadowRootOptions=Object.assign(Object.assign({},b.oi.shadowRootOptions),{},{delegatesFocus:!0}),(0,m.__decorate)([(0,f.Cb)({type:Boolean,reflect:!0})],y.prototype,"disabled",void 0),(0,m.__decorate)([(0,f.Cb)({type:Boolean,attribute:"always-focusable"})],y.prototype,"alwaysFocusable",void 0),(0,m.__decorate)([(0,f.Cb)()],y.prototype,"label",void 0),(0,m.__decorate)([(0,f.Cb)({type:Boolean,reflect:!0,attribute:"has-icon"})],y.prototype,"hasIcon",void 0)},90704:function(e,r,t){t.d(r,{W:function(){return a}});var i,o=t(88962),a=(0,t(5095).iv)(i||(i=(0,o.Z)([':host{border-start-start-radius:var(--_container-shape-start-start);border-start-end-radius:var(--_container-shape-start-end);border-end-start-radius:var(--_container-shape-end-start);border-end-end-radius:var(--_container-shape-end-end);display:inline-flex;height:var(--_container-height);cursor:pointer;-webkit-tap-highlight-color:transparent;--md-ripple-hover-color:var(--_hover-state-layer-color);--md-ripple-hover-opacity:var(--_hover-state-layer-opacity);--md-ripple-pressed-color:var(--_pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_pressed-state-layer-opacity)}:host([disabled]){pointer-events:none}:host([touch-target=wrapper]){margin:max(0px,(48px - var(--_container-height))/2) 0}md-focus-ring{--md-focus-ring-shape-start-start:var(--_container-shape-start-start);--md-focus-ring-shape-start-end:var(--_container-shape-start-end);--md-focus-ring-shape-end-end:var(--_container-shape-end-end);--md-focus-ring-shape-end-start:var(--_container-shape-end-start)}.container{border-radius:inherit;box-sizing:border-box;display:flex;height:100%;position:relative;width:100%}.container::before{border-radius:inherit;content:"";inset:0;pointer-events:none;position:absolute}.container:not(.disabled){cursor:pointer}.container.disabled{pointer-events:none}.cell{display:flex}.action{align-items:baseline;appearance:none;background:0 0;border:none;border-radius:inherit;display:flex;outline:0;padding:0;position:relative;text-decoration:none}.primary.action{padding-inline-start:var(--_leading-space);padding-inline-end:var(--_trailing-space)}.has-icon .primary.action{padding-inline-start:var(--_with-leading-icon-leading-space)}.touch{height:48px;inset:50% 0 0;position:absolute;transform:translateY(-50%);width:100%}:host([touch-target=none]) .touch{display:none}.outline{border:var(--_outline-width) solid var(--_outline-color);border-radius:inherit;inset:0;pointer-events:none;position:absolute}:where(:focus) .outline{border-color:var(--_focus-outline-color)}:where(.disabled) .outline{border-color:var(--_disabled-outline-color);opacity:var(--_disabled-outline-opacity)}md-ripple{border-radius:inherit}.icon,.label,.touch{z-index:1}.label{align-items:center;color:var(--_label-text-color);display:flex;font-family:var(--_label-text-font);font-size:var(--_label-text-size);line-height:var(--_label-text-line-height);font-weight:var(--_label-text-weight);height:100%;text-overflow:ellipsis;user-select:none;white-space:nowrap}:where(:hover) .label{color:var(--_hover-label-text-color)}:where(:focus) .label{color:var(--_focus-label-text-color)}:where(:active) .label{color:var(--_pressed-label-text-color)}:where(.disabled) .label{color:var(--_disabled-label-text-color);opacity:var(--_disabled-label-text-opacity)}.icon{align-self:center;display:flex;fill:currentColor;position:relative}.icon ::slotted(:first-child){font-size:var(--_icon-size);height:var(--_icon-size);width:var(--_icon-size)}.leading.icon{color:var(--_leading-icon-color)}.leading.icon ::slotted(*),.leading.icon svg{margin-inline-end:var(--_icon-label-space)}:where(:hover) .leading.icon{color:var(--_hover-leading-icon-color)}:where(:focus) .leading.icon{color:var(--_focus-leading-icon-color)}:where(:active) .leading.icon{color:var(--_pressed-leading-icon-color)}:where(.disabled) .leading.icon{color:var(--_disabled-leading-icon-color);opacity:var(--_disabled-leading-icon-opacity)}@media(forced-colors:active){:where(.disabled) :is(.label,.outline,.leading.icon){color:GrayText;opacity:1}}a,button:not(:disabled){cursor:inherit}'])))},99266:function(e,r,t){t.d(r,{r:function(){return v}});var i=t(62746),o=t(40039),a=t(71650),n=t(33368),c=t(95281),d=t(68308),l=t(69205),s=(t(51358),t(96043),t(46798),t(5239),t(98490),t(51467),t(32982)),u=t(16616),p=t(41005),h=function(e,r,t){for(var i=new Map,o=r;o<=t;o++)i.set(e[o],o);return i},v=(0,u.XM)(function(e){function r(e){var t;if((0,a.Z)(this,r),t=(0,d.Z)(this,r,[e]),e.type!==u.pX.CHILD)throw Error("repeat() can only be used in text expressions");return(0,c.Z)(t)}return(0,l.Z)(r,e),(0,n.Z)(r,[{key:"ct",value:function(e,r,t){var i;void 0===t?t=r:void 0!==r&&(i=r);var a,n=[],c=[],d=0,l=(0,o.Z)(e);try{for(l.s();!(a=l.n()).done;){var s=a.value;n[d]=i?i(s,d):d,c[d]=t(s,d),d++}}catch(u){l.e(u)}finally{l.f()}return{values:c,keys:n}}},{key:"render",value:function(e,r,t){return this.ct(e,r,t).values}},{key:"update",value:function(e,r){var t,o=(0,i.Z)(r,3),a=o[0],n=o[1],c=o[2],d=(0,p.i9)(e),l=this.ct(a,n,c),u=l.values,v=l.keys;if(!Array.isArray(d))return this.ut=v,u;for(var m,b,f=null!==(t=this.ut)&&void 0!==t?t:this.ut=[],g=[],_=0,y=d.length-1,k=0,x=u.length-1;_<=y&&k<=x;)if(null===d[_])_++;else if(null===d[y])y--;else if(f[_]===v[k])g[k]=(0,p.fk)(d[_],u[k]),_++,k++;else if(f[y]===v[x])g[x]=(0,p.fk)(d[y],u[x]),y--,x--;else if(f[_]===v[x])g[x]=(0,p.fk)(d[_],u[x]),(0,p._Y)(e,g[x+1],d[_]),_++,x--;else if(f[y]===v[k])g[k]=(0,p.fk)(d[y],u[k]),(0,p._Y)(e,d[_],d[y]),y--,k++;else if(void 0===m&&(m=h(v,k,x),b=h(f,_,y)),m.has(f[_]))if(m.has(f[y])){var w=b.get(v[k]),Z=void 0!==w?d[w]:null;if(null===Z){var C=(0,p._Y)(e,d[_]);(0,p.fk)(C,u[k]),g[k]=C}else g[k]=(0,p.fk)(Z,u[k]),(0,p._Y)(e,d[_],Z),d[w]=null;k++}else(0,p.ws)(d[y]),y--;else(0,p.ws)(d[_]),_++;for(;k<=x;){var E=(0,p._Y)(e,g[x+1]);(0,p.fk)(E,u[k]),g[k++]=E}for(;_<=y;){var I=d[_++];null!==I&&(0,p.ws)(I)}return this.ut=v,(0,p.hl)(e,g),s.Jb}}]),r}(u.Xe))}}]);
+//# sourceMappingURL=7098.iMdGN77LUOM.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7198],{92295:function(e,t,i){var n,a=i(88962),o=i(33368),r=i(71650),l=i(68308),d=i(82390),s=i(69205),c=i(91808),u=(i(97393),i(14271)),h=i(5095),v=i(95260),f=i(3712);(0,c.Z)([(0,v.Mo)("ha-button")],(function(e,t){var i=function(t){function i(){var t;(0,r.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,l.Z)(this,i,[].concat(a)),e((0,d.Z)(t)),t}return(0,s.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[f.W,(0,h.iv)(n||(n=(0,a.Z)(["::slotted([slot=icon]){margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction);display:block}.mdc-button{height:var(--button-height,36px)}.trailing-icon{display:flex}.slot-container{overflow:var(--button-slot-container-overflow,visible)}"])))]}}]}}),u.z)},9828:function(e,t,i){i.d(t,{i:function(){return _}});var n,a,o,r=i(33368),l=i(71650),d=i(68308),s=i(82390),c=i(69205),u=i(91808),h=i(34541),v=i(47838),f=i(88962),p=(i(97393),i(91989),i(87762)),g=i(91632),b=i(5095),m=i(95260),y=i(60625),k=(i(54371),["button","ha-list-item"]),_=function(e,t){var i;return(0,b.dy)(n||(n=(0,f.Z)([' <div class="header_title"> <span>','</span> <ha-icon-button .label="','" .path="','" dialogAction="close" class="header_button"></ha-icon-button> </div> '])),t,null!==(i=null==e?void 0:e.localize("ui.dialogs.generic.close"))&&void 0!==i?i:"Close","M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z")};(0,u.Z)([(0,m.Mo)("ha-dialog")],(function(e,t){var i=function(t){function i(){var t;(0,l.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,d.Z)(this,i,[].concat(a)),e((0,s.Z)(t)),t}return(0,c.Z)(i,t),(0,r.Z)(i)}(t);return{F:i,d:[{kind:"field",key:y.gA,value:void 0},{kind:"method",key:"scrollToPos",value:function(e,t){var i;null===(i=this.contentElement)||void 0===i||i.scrollTo(e,t)}},{kind:"method",key:"renderHeading",value:function(){return(0,b.dy)(a||(a=(0,f.Z)(['<slot name="heading"> '," </slot>"])),(0,h.Z)((0,v.Z)(i.prototype),"renderHeading",this).call(this))}},{kind:"method",key:"firstUpdated",value:function(){var e;(0,h.Z)((0,v.Z)(i.prototype),"firstUpdated",this).call(this),this.suppressDefaultPressSelector=[this.suppressDefaultPressSelector,k].join(", "),this._updateScrolledAttribute(),null===(e=this.contentElement)||void 0===e||e.addEventListener("scroll",this._onScroll,{passive:!0})}},{kind:"method",key:"disconnectedCallback",value:function(){(0,h.Z)((0,v.Z)(i.prototype),"disconnectedCallback",this).call(this),this.contentElement.removeEventListener("scroll",this._onScroll)}},{kind:"field",key:"_onScroll",value:function(){var e=this;return function(){e._updateScrolledAttribute()}}},{kind:"method",key:"_updateScrolledAttribute",value:function(){this.contentElement&&this.toggleAttribute("scrolled",0!==this.contentElement.scrollTop)}},{kind:"field",static:!0,key:"styles",value:function(){return[g.W,(0,b.iv)(o||(o=(0,f.Z)([":host([scrolled]) ::slotted(ha-dialog-header){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.mdc-dialog{--mdc-dialog-scroll-divider-color:var(\n          --dialog-scroll-divider-color,\n          var(--divider-color)\n        );z-index:var(--dialog-z-index,8);-webkit-backdrop-filter:var(--dialog-backdrop-filter,none);backdrop-filter:var(--dialog-backdrop-filter,none);--mdc-dialog-box-shadow:var(--dialog-box-shadow, none);--mdc-typography-headline6-font-weight:400;--mdc-typography-headline6-font-size:1.574rem}.mdc-dialog__actions{justify-content:var(--justify-action-buttons,flex-end);padding-bottom:max(env(safe-area-inset-bottom),24px)}.mdc-dialog__actions span:first-child{flex:var(--secondary-action-button-flex,unset)}.mdc-dialog__actions span:nth-child(2){flex:var(--primary-action-button-flex,unset)}.mdc-dialog__container{align-items:var(--vertical-align-dialog,center)}.mdc-dialog__title{padding:24px 24px 0 24px}.mdc-dialog__actions{padding:12px 24px 12px 24px}.mdc-dialog__title::before{content:unset}.mdc-dialog .mdc-dialog__content{position:var(--dialog-content-position,relative);padding:var(--dialog-content-padding,24px)}:host([hideactions]) .mdc-dialog .mdc-dialog__content{padding-bottom:max(var(--dialog-content-padding,24px),env(safe-area-inset-bottom))}.mdc-dialog .mdc-dialog__surface{position:var(--dialog-surface-position,relative);top:var(--dialog-surface-top);margin-top:var(--dialog-surface-margin-top);min-height:var(--mdc-dialog-min-height,auto);border-radius:var(--ha-dialog-border-radius,28px)}:host([flexContent]) .mdc-dialog .mdc-dialog__content{display:flex;flex-direction:column}.header_title{position:relative;padding-right:40px;padding-inline-end:40px;padding-inline-start:initial;direction:var(--direction)}.header_title span{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;display:block}.header_button{position:absolute;right:-8px;top:-8px;text-decoration:none;color:inherit;inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}.dialog-actions{inset-inline-start:initial!important;inset-inline-end:0px!important;direction:var(--direction)}"])))]}}]}}),p.M)},42308:function(e,t,i){var n,a=i(99312),o=i(81043),r=i(88962),l=i(33368),d=i(71650),s=i(68308),c=i(82390),u=i(69205),h=i(91808),v=i(34541),f=i(47838),p=(i(97393),i(51358),i(46798),i(47084),i(5239),i(98490),i(22481),i(91989),i(5095)),g=i(95260),b=i(18394);(0,h.Z)([(0,g.Mo)("ha-sortable")],(function(e,t){var h,m=function(t){function i(){var t;(0,d.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,s.Z)(this,i,[].concat(a)),e((0,c.Z)(t)),t}return(0,u.Z)(i,t),(0,l.Z)(i)}(t);return{F:m,d:[{kind:"field",key:"_sortable",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"path",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:Boolean,attribute:"no-style"})],key:"noStyle",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:String,attribute:"draggable-selector"})],key:"draggableSelector",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:String,attribute:"handle-selector"})],key:"handleSelector",value:void 0},{kind:"field",decorators:[(0,g.Cb)({type:String,attribute:"group"})],key:"group",value:void 0},{kind:"method",key:"updated",value:function(e){e.has("disabled")&&(this.disabled?this._destroySortable():this._createSortable())}},{kind:"field",key:"_shouldBeDestroy",value:function(){return!1}},{kind:"method",key:"disconnectedCallback",value:function(){var e=this;(0,v.Z)((0,f.Z)(m.prototype),"disconnectedCallback",this).call(this),this._shouldBeDestroy=!0,setTimeout((function(){e._shouldBeDestroy&&(e._destroySortable(),e._shouldBeDestroy=!1)}),1)}},{kind:"method",key:"connectedCallback",value:function(){(0,v.Z)((0,f.Z)(m.prototype),"connectedCallback",this).call(this),this._shouldBeDestroy=!1}},{kind:"method",key:"createRenderRoot",value:function(){return this}},{kind:"method",key:"render",value:function(){return this.noStyle?p.Ld:(0,p.dy)(n||(n=(0,r.Z)([" <style>.sortable-fallback{display:none;opacity:0}.sortable-ghost{border:2px solid var(--primary-color);background:rgba(var(--rgb-primary-color),.25);border-radius:4px;opacity:.4}.sortable-drag{border-radius:4px;opacity:1;background:var(--card-background-color);box-shadow:0px 4px 8px 3px #00000026;cursor:grabbing}</style> "])))}},{kind:"method",key:"_createSortable",value:(h=(0,o.Z)((0,a.Z)().mark((function e(){var t,n,o;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!this._sortable){e.next=2;break}return e.abrupt("return");case 2:if(t=this.children[0]){e.next=5;break}return e.abrupt("return");case 5:return e.next=7,Promise.all([i.e(6087),i.e(8697)]).then(i.bind(i,48697));case 7:n=e.sent.default,o={animation:150,swapThreshold:.75,onChoose:this._handleChoose,onEnd:this._handleEnd},this.draggableSelector&&(o.draggable=this.draggableSelector),this.handleSelector&&(o.handle=this.handleSelector),this.draggableSelector&&(o.draggable=this.draggableSelector),this.group&&(o.group=this.group),this._sortable=new n(t,o);case 14:case"end":return e.stop()}}),e,this)}))),function(){return h.apply(this,arguments)})},{kind:"field",key:"_handleEnd",value:function(){var e=this;return function(){var t=(0,o.Z)((0,a.Z)().mark((function t(i){var n,o,r,l;return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(i.item.placeholder&&(i.item.placeholder.replaceWith(i.item),delete i.item.placeholder),n=i.oldIndex,o=i.from.parentElement.path,r=i.newIndex,l=i.to.parentElement.path,void 0!==n&&void 0!==r&&(n!==r||(null==o?void 0:o.join("."))!==(null==l?void 0:l.join(".")))){t.next=7;break}return t.abrupt("return");case 7:(0,b.B)(e,"item-moved",{oldIndex:n,newIndex:r,oldPath:o,newPath:l});case 8:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}()}},{kind:"field",key:"_handleChoose",value:function(){return function(e){e.item.placeholder=document.createComment("sort-placeholder"),e.item.after(e.item.placeholder)}}},{kind:"method",key:"_destroySortable",value:function(){this._sortable&&(this._sortable.destroy(),this._sortable=void 0)}}]}}),p.oi)},97477:function(e,t,i){i.d(t,{a:function(){return c},Lo:function(){return s},sG:function(){return d}});i(40039),i(85717),i(36513),i(56308),i(22859);var n=i(28858),a=(i(37313),i(72881)),o=i(72218),r=function(e){return e.sendMessagePromise({type:"config/area_registry/list"}).then((function(e){return e.sort((function(e,t){return(0,n.$)(e.name,t.name)}))}))},l=function(e,t){return e.subscribeEvents((0,o.D)((function(){return r(e).then((function(e){return t.setState(e,!0)}))}),500,!0),"area_registry_updated")},d=function(e,t){return(0,a.B)("_areaRegistry",r,l,e,t)},s=function(e,t){return e.callWS(Object.assign({type:"config/area_registry/create"},t))},c=function(e,t){return function(i,a){var o=t?t.indexOf(i):-1,r=t?t.indexOf(a):-1;if(-1===o&&-1===r){var l,d,s,c,u=null!==(l=null==e||null===(d=e[i])||void 0===d?void 0:d.name)&&void 0!==l?l:i,h=null!==(s=null==e||null===(c=e[a])||void 0===c?void 0:c.name)&&void 0!==s?s:a;return(0,n.$)(u,h)}return-1===o?1:-1===r?-1:o-r}}},77198:function(e,t,i){i.r(t),i.d(t,{DialogAreaFilter:function(){return x}});var n,a,o,r,l=i(46097),d=i(88962),s=i(33368),c=i(71650),u=i(68308),h=i(82390),v=i(69205),f=i(91808),p=(i(97393),i(65974),i(37313),i(87438),i(46798),i(9849),i(22890),i(40271),i(60163),i(41353),i(22859),i(56308),i(36513),i(61641),i(5095)),g=i(95260),b=i(53180),m=i(99266),y=i(18394),k=(i(92295),i(9828),i(54371),i(90532),i(42308),i(97477)),_=i(29950),x=(0,f.Z)([(0,g.Mo)("dialog-area-filter")],(function(e,t){var i=function(t){function i(){var t;(0,c.Z)(this,i);for(var n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return t=(0,u.Z)(this,i,[].concat(a)),e((0,h.Z)(t)),t}return(0,v.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,g.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_dialogParams",value:void 0},{kind:"field",decorators:[(0,g.SB)()],key:"_hidden",value:function(){return[]}},{kind:"field",decorators:[(0,g.SB)()],key:"_areas",value:function(){return[]}},{kind:"method",key:"showDialog",value:function(e){var t,i,n,a;this._dialogParams=e,this._hidden=null!==(t=null===(i=e.initialValue)||void 0===i?void 0:i.hidden)&&void 0!==t?t:[];var o=null!==(n=null===(a=e.initialValue)||void 0===a?void 0:a.order)&&void 0!==n?n:[],r=Object.keys(this.hass.areas);this._areas=r.concat().sort((0,k.a)(this.hass.areas,o))}},{kind:"method",key:"closeDialog",value:function(){this._dialogParams=void 0,this._hidden=[],this._areas=[],(0,y.B)(this,"dialog-closed",{dialog:this.localName})}},{kind:"method",key:"_submit",value:function(){var e,t,i=this,n=this._areas.filter((function(e){return!i._hidden.includes(e)})),a={hidden:this._hidden,order:n};null===(e=this._dialogParams)||void 0===e||null===(t=e.submit)||void 0===t||t.call(e,a),this.closeDialog()}},{kind:"method",key:"_cancel",value:function(){var e,t;null===(e=this._dialogParams)||void 0===e||null===(t=e.cancel)||void 0===t||t.call(e),this.closeDialog()}},{kind:"method",key:"_areaMoved",value:function(e){e.stopPropagation();var t=e.detail,i=t.oldIndex,n=t.newIndex,a=this._areas.concat(),o=a.splice(i,1)[0];a.splice(n,0,o),this._areas=a}},{kind:"method",key:"render",value:function(){var e,t=this;if(!this._dialogParams||!this.hass)return p.Ld;var i=this._areas;return(0,p.dy)(n||(n=(0,d.Z)([' <ha-dialog open @closed="','" .heading="','"> <ha-sortable draggable-selector=".draggable" handle-selector=".handle" @item-moved="','"> <mwc-list class="areas"> ',' </mwc-list> </ha-sortable> <ha-button slot="secondaryAction" dialogAction="cancel"> ',' </ha-button> <ha-button @click="','" slot="primaryAction"> '," </ha-button> </ha-dialog> "])),this._cancel,null!==(e=this._dialogParams.title)&&void 0!==e?e:this.hass.localize("ui.components.area-filter.title"),this._areaMoved,(0,m.r)(i,(function(e){return e}),(function(e,i){var n,r=!t._hidden.includes(e),l=(null===(n=t.hass.areas[e])||void 0===n?void 0:n.name)||e;return(0,p.dy)(a||(a=(0,d.Z)([' <ha-list-item class="','" hasMeta graphic="icon" noninteractive> '," ",' <ha-icon-button tabindex="0" class="action" .path="','" slot="meta" .label="','" .area="','" @click="','"></ha-icon-button> </ha-list-item> '])),(0,b.$)({hidden:!r,draggable:r}),r?(0,p.dy)(o||(o=(0,d.Z)(['<ha-svg-icon class="handle" .path="','" slot="graphic"></ha-svg-icon>'])),"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"):p.Ld,l,r?"M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17M12,4.5C7,4.5 2.73,7.61 1,12C2.73,16.39 7,19.5 12,19.5C17,19.5 21.27,16.39 23,12C21.27,7.61 17,4.5 12,4.5Z":"M11.83,9L15,12.16C15,12.11 15,12.05 15,12A3,3 0 0,0 12,9C11.94,9 11.89,9 11.83,9M7.53,9.8L9.08,11.35C9.03,11.56 9,11.77 9,12A3,3 0 0,0 12,15C12.22,15 12.44,14.97 12.65,14.92L14.2,16.47C13.53,16.8 12.79,17 12,17A5,5 0 0,1 7,12C7,11.21 7.2,10.47 7.53,9.8M2,4.27L4.28,6.55L4.73,7C3.08,8.3 1.78,10 1,12C2.73,16.39 7,19.5 12,19.5C13.55,19.5 15.03,19.2 16.38,18.66L16.81,19.08L19.73,22L21,20.73L3.27,3M12,7A5,5 0 0,1 17,12C17,12.64 16.87,13.26 16.64,13.82L19.57,16.75C21.07,15.5 22.27,13.86 23,12C21.27,7.61 17,4.5 12,4.5C10.6,4.5 9.26,4.75 8,5.2L10.17,7.35C10.74,7.13 11.35,7 12,7Z",t.hass.localize("ui.components.area-filter.".concat(r?"hide":"show"),{area:l}),e,t._toggle)})),this.hass.localize("ui.common.cancel"),this._submit,this.hass.localize("ui.common.submit"))}},{kind:"method",key:"_toggle",value:function(e){var t,i=this,n=e.target.area,a=(0,l.Z)(null!==(t=this._hidden)&&void 0!==t?t:[]);a.includes(n)?a.splice(a.indexOf(n),1):a.push(n),this._hidden=a;var o=this._areas.filter((function(e){return!i._hidden.includes(e)})),r=this._areas.filter((function(e){return i._hidden.includes(e)}));this._areas=[].concat((0,l.Z)(o),(0,l.Z)(r))}},{kind:"get",static:!0,key:"styles",value:function(){return[_.yu,(0,p.iv)(r||(r=(0,d.Z)(["ha-dialog{--dialog-z-index:104;--dialog-content-padding:0}ha-list-item{overflow:visible}.hidden{color:var(--disabled-text-color)}.handle{cursor:move;cursor:grab}.actions{display:flex;flex-direction:row}ha-icon-button{display:block;margin:-12px}"])))]}}]}}),p.oi)},99266:function(e,t,i){i.d(t,{r:function(){return f}});var n=i(62746),a=i(40039),o=i(71650),r=i(33368),l=i(95281),d=i(68308),s=i(69205),c=(i(51358),i(96043),i(46798),i(5239),i(98490),i(51467),i(32982)),u=i(16616),h=i(41005),v=function(e,t,i){for(var n=new Map,a=t;a<=i;a++)n.set(e[a],a);return n},f=(0,u.XM)(function(e){function t(e){var i;if((0,o.Z)(this,t),i=(0,d.Z)(this,t,[e]),e.type!==u.pX.CHILD)throw Error("repeat() can only be used in text expressions");return(0,l.Z)(i)}return(0,s.Z)(t,e),(0,r.Z)(t,[{key:"ct",value:function(e,t,i){var n;void 0===i?i=t:void 0!==t&&(n=t);var o,r=[],l=[],d=0,s=(0,a.Z)(e);try{for(s.s();!(o=s.n()).done;){var c=o.value;r[d]=n?n(c,d):d,l[d]=i(c,d),d++}}catch(u){s.e(u)}finally{s.f()}return{values:l,keys:r}}},{key:"render",value:function(e,t,i){return this.ct(e,t,i).values}},{key:"update",value:function(e,t){var i,a=(0,n.Z)(t,3),o=a[0],r=a[1],l=a[2],d=(0,h.i9)(e),s=this.ct(o,r,l),u=s.values,f=s.keys;if(!Array.isArray(d))return this.ut=f,u;for(var p,g,b=null!==(i=this.ut)&&void 0!==i?i:this.ut=[],m=[],y=0,k=d.length-1,_=0,x=u.length-1;y<=k&&_<=x;)if(null===d[y])y++;else if(null===d[k])k--;else if(b[y]===f[_])m[_]=(0,h.fk)(d[y],u[_]),y++,_++;else if(b[k]===f[x])m[x]=(0,h.fk)(d[k],u[x]),k--,x--;else if(b[y]===f[x])m[x]=(0,h.fk)(d[y],u[x]),(0,h._Y)(e,m[x+1],d[y]),y++,x--;else if(b[k]===f[_])m[_]=(0,h.fk)(d[k],u[_]),(0,h._Y)(e,d[y],d[k]),k--,_++;else if(void 0===p&&(p=v(f,_,x),g=v(b,y,k)),p.has(b[y]))if(p.has(b[k])){var Z=g.get(f[_]),C=void 0!==Z?d[Z]:null;if(null===C){var w=(0,h._Y)(e,d[y]);(0,h.fk)(w,u[_]),m[_]=w}else m[_]=(0,h.fk)(C,u[_]),(0,h._Y)(e,d[y],C),d[Z]=null;_++}else(0,h.ws)(d[k]),k--;else(0,h.ws)(d[y]),y++;for(;_<=x;){var M=(0,h._Y)(e,m[x+1]);(0,h.fk)(M,u[_]),m[_++]=M}for(;y<=k;){var S=d[y++];null!==S&&(0,h.ws)(S)}return this.ut=f,(0,h.hl)(e,m),c.Jb}}]),t}(u.Xe))}}]);
+//# sourceMappingURL=7198.qomrKdkE6bE.js.map
\ No newline at end of file
@@ -0,0 +1 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7386],{87386:function(n,e,s){s.r(e)}}]);
\ No newline at end of file
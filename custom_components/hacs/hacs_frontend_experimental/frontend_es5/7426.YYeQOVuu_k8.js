@@ -0,0 +1,3 @@
+/*! For license information please see 7426.YYeQOVuu_k8.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7426],{93892:function(e,t,n){var i=n(97673),r=n(11336),o=n(43313),a=RangeError;e.exports=function(e){var t=r(o(this)),n="",l=i(e);if(l<0||l===1/0)throw new a("Wrong number of repetitions");for(;l>0;(l>>>=1)&&(t+=t))1&l&&(n+=t);return n}},7179:function(e,t,n){n(68077)({target:"String",proto:!0},{repeat:n(93892)})},45165:function(e,t,n){n(78950)("Uint8",(function(e){return function(t,n,i){return e(this,t,n,i)}}))},77426:function(e,t,n){n.d(t,{$w:function(){return Wt},oW:function(){return Yt},zD:function(){return Rt}});var i=n(76775);n(65974),n(76843),n(22859),n(51467),n(46798),n(94570),n(63789),n(24074),n(17692),n(7179),n(36513),n(9849),n(50289),n(94167),n(56308),n(97393),n(27392),n(10999),n(52117),n(82479),n(99397),n(67712),n(51358),n(24829),n(45165),n(83868),n(75544),n(33435),n(66657),n(53608),n(42313),n(48112),n(87323),n(39588),n(31871),n(87753),n(91843),n(9979),n(34497),n(39912),n(76751),n(44988),n(32369),n(39832),n(83327),n(47475),n(94010),n(64085),n(56399),n(16149),n(39891),n(20459),n(89664),n(92478),n(60731),n(51964),n(93330),n(80641),n(37313);function r(e){return null==e}var o={isNothing:r,isObject:function(e){return"object"===(0,i.Z)(e)&&null!==e},toArray:function(e){return Array.isArray(e)?e:r(e)?[]:[e]},repeat:function(e,t){var n,i="";for(n=0;n<t;n+=1)i+=e;return i},isNegativeZero:function(e){return 0===e&&Number.NEGATIVE_INFINITY===1/e},extend:function(e,t){var n,i,r,o;if(t)for(n=0,i=(o=Object.keys(t)).length;n<i;n+=1)e[r=o[n]]=t[r];return e}};function a(e,t){var n="",i=e.reason||"(unknown reason)";return e.mark?(e.mark.name&&(n+='in "'+e.mark.name+'" '),n+="("+(e.mark.line+1)+":"+(e.mark.column+1)+")",!t&&e.mark.snippet&&(n+="\n\n"+e.mark.snippet),i+" "+n):i}function l(e,t){Error.call(this),this.name="YAMLException",this.reason=e,this.mark=t,this.message=a(this,!1),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack||""}l.prototype=Object.create(Error.prototype),l.prototype.constructor=l,l.prototype.toString=function(e){return this.name+": "+a(this,e)};var c=l;function u(e,t,n,i,r){var o="",a="",l=Math.floor(r/2)-1;return i-t>l&&(t=i-l+(o=" ... ").length),n-i>l&&(n=i+l-(a=" ...").length),{str:o+e.slice(t,n).replace(/\t/g,"→")+a,pos:i-t+o.length}}function s(e,t){return o.repeat(" ",t-e.length)+e}var p=function(e,t){if(t=Object.create(t||null),!e.buffer)return null;t.maxLength||(t.maxLength=79),"number"!=typeof t.indent&&(t.indent=1),"number"!=typeof t.linesBefore&&(t.linesBefore=3),"number"!=typeof t.linesAfter&&(t.linesAfter=2);for(var n,i=/\r?\n|\r|\0/g,r=[0],a=[],l=-1;n=i.exec(e.buffer);)a.push(n.index),r.push(n.index+n[0].length),e.position<=n.index&&l<0&&(l=r.length-2);l<0&&(l=r.length-1);var c,p,f="",d=Math.min(e.line+t.linesAfter,a.length).toString().length,h=t.maxLength-(t.indent+d+3);for(c=1;c<=t.linesBefore&&!(l-c<0);c++)p=u(e.buffer,r[l-c],a[l-c],e.position-(r[l]-r[l-c]),h),f=o.repeat(" ",t.indent)+s((e.line-c+1).toString(),d)+" | "+p.str+"\n"+f;for(p=u(e.buffer,r[l],a[l],e.position,h),f+=o.repeat(" ",t.indent)+s((e.line+1).toString(),d)+" | "+p.str+"\n",f+=o.repeat("-",t.indent+d+3+p.pos)+"^\n",c=1;c<=t.linesAfter&&!(l+c>=a.length);c++)p=u(e.buffer,r[l+c],a[l+c],e.position-(r[l]-r[l+c]),h),f+=o.repeat(" ",t.indent)+s((e.line+c+1).toString(),d)+" | "+p.str+"\n";return f.replace(/\n$/,"")},f=["kind","multi","resolve","construct","instanceOf","predicate","represent","representName","defaultStyle","styleAliases"],d=["scalar","sequence","mapping"];var h=function(e,t){if(t=t||{},Object.keys(t).forEach((function(t){if(-1===f.indexOf(t))throw new c('Unknown option "'+t+'" is met in definition of "'+e+'" YAML type.')})),this.options=t,this.tag=e,this.kind=t.kind||null,this.resolve=t.resolve||function(){return!0},this.construct=t.construct||function(e){return e},this.instanceOf=t.instanceOf||null,this.predicate=t.predicate||null,this.represent=t.represent||null,this.representName=t.representName||null,this.defaultStyle=t.defaultStyle||null,this.multi=t.multi||!1,this.styleAliases=function(e){var t={};return null!==e&&Object.keys(e).forEach((function(n){e[n].forEach((function(e){t[String(e)]=n}))})),t}(t.styleAliases||null),-1===d.indexOf(this.kind))throw new c('Unknown kind "'+this.kind+'" is specified for "'+e+'" YAML type.')};function g(e,t){var n=[];return e[t].forEach((function(e){var t=n.length;n.forEach((function(n,i){n.tag===e.tag&&n.kind===e.kind&&n.multi===e.multi&&(t=i)})),n[t]=e})),n}function m(e){return this.extend(e)}m.prototype.extend=function(e){var t=[],n=[];if(e instanceof h)n.push(e);else if(Array.isArray(e))n=n.concat(e);else{if(!e||!Array.isArray(e.implicit)&&!Array.isArray(e.explicit))throw new c("Schema.extend argument should be a Type, [ Type ], or a schema definition ({ implicit: [...], explicit: [...] })");e.implicit&&(t=t.concat(e.implicit)),e.explicit&&(n=n.concat(e.explicit))}t.forEach((function(e){if(!(e instanceof h))throw new c("Specified list of YAML types (or a single Type object) contains a non-Type object.");if(e.loadKind&&"scalar"!==e.loadKind)throw new c("There is a non-scalar type in the implicit list of a schema. Implicit resolving of such types is not supported.");if(e.multi)throw new c("There is a multi type in the implicit list of a schema. Multi tags can only be listed as explicit.")})),n.forEach((function(e){if(!(e instanceof h))throw new c("Specified list of YAML types (or a single Type object) contains a non-Type object.")}));var i=Object.create(m.prototype);return i.implicit=(this.implicit||[]).concat(t),i.explicit=(this.explicit||[]).concat(n),i.compiledImplicit=g(i,"implicit"),i.compiledExplicit=g(i,"explicit"),i.compiledTypeMap=function(){var e,t,n={scalar:{},sequence:{},mapping:{},fallback:{},multi:{scalar:[],sequence:[],mapping:[],fallback:[]}};function i(e){e.multi?(n.multi[e.kind].push(e),n.multi.fallback.push(e)):n[e.kind][e.tag]=n.fallback[e.tag]=e}for(e=0,t=arguments.length;e<t;e+=1)arguments[e].forEach(i);return n}(i.compiledImplicit,i.compiledExplicit),i};var y=m,b=new h("tag:yaml.org,2002:str",{kind:"scalar",construct:function(e){return null!==e?e:""}}),v=new h("tag:yaml.org,2002:seq",{kind:"sequence",construct:function(e){return null!==e?e:[]}}),A=new h("tag:yaml.org,2002:map",{kind:"mapping",construct:function(e){return null!==e?e:{}}}),w=new y({explicit:[b,v,A]});var k=new h("tag:yaml.org,2002:null",{kind:"scalar",resolve:function(e){if(null===e)return!0;var t=e.length;return 1===t&&"~"===e||4===t&&("null"===e||"Null"===e||"NULL"===e)},construct:function(){return null},predicate:function(e){return null===e},represent:{canonical:function(){return"~"},lowercase:function(){return"null"},uppercase:function(){return"NULL"},camelcase:function(){return"Null"},empty:function(){return""}},defaultStyle:"lowercase"});var C=new h("tag:yaml.org,2002:bool",{kind:"scalar",resolve:function(e){if(null===e)return!1;var t=e.length;return 4===t&&("true"===e||"True"===e||"TRUE"===e)||5===t&&("false"===e||"False"===e||"FALSE"===e)},construct:function(e){return"true"===e||"True"===e||"TRUE"===e},predicate:function(e){return"[object Boolean]"===Object.prototype.toString.call(e)},represent:{lowercase:function(e){return e?"true":"false"},uppercase:function(e){return e?"TRUE":"FALSE"},camelcase:function(e){return e?"True":"False"}},defaultStyle:"lowercase"});function x(e){return 48<=e&&e<=55}function I(e){return 48<=e&&e<=57}var O=new h("tag:yaml.org,2002:int",{kind:"scalar",resolve:function(e){if(null===e)return!1;var t,n,i=e.length,r=0,o=!1;if(!i)return!1;if("-"!==(t=e[r])&&"+"!==t||(t=e[++r]),"0"===t){if(r+1===i)return!0;if("b"===(t=e[++r])){for(r++;r<i;r++)if("_"!==(t=e[r])){if("0"!==t&&"1"!==t)return!1;o=!0}return o&&"_"!==t}if("x"===t){for(r++;r<i;r++)if("_"!==(t=e[r])){if(!(48<=(n=e.charCodeAt(r))&&n<=57||65<=n&&n<=70||97<=n&&n<=102))return!1;o=!0}return o&&"_"!==t}if("o"===t){for(r++;r<i;r++)if("_"!==(t=e[r])){if(!x(e.charCodeAt(r)))return!1;o=!0}return o&&"_"!==t}}if("_"===t)return!1;for(;r<i;r++)if("_"!==(t=e[r])){if(!I(e.charCodeAt(r)))return!1;o=!0}return!(!o||"_"===t)},construct:function(e){var t,n=e,i=1;if(-1!==n.indexOf("_")&&(n=n.replace(/_/g,"")),"-"!==(t=n[0])&&"+"!==t||("-"===t&&(i=-1),t=(n=n.slice(1))[0]),"0"===n)return 0;if("0"===t){if("b"===n[1])return i*parseInt(n.slice(2),2);if("x"===n[1])return i*parseInt(n.slice(2),16);if("o"===n[1])return i*parseInt(n.slice(2),8)}return i*parseInt(n,10)},predicate:function(e){return"[object Number]"===Object.prototype.toString.call(e)&&e%1==0&&!o.isNegativeZero(e)},represent:{binary:function(e){return e>=0?"0b"+e.toString(2):"-0b"+e.toString(2).slice(1)},octal:function(e){return e>=0?"0o"+e.toString(8):"-0o"+e.toString(8).slice(1)},decimal:function(e){return e.toString(10)},hexadecimal:function(e){return e>=0?"0x"+e.toString(16).toUpperCase():"-0x"+e.toString(16).toUpperCase().slice(1)}},defaultStyle:"decimal",styleAliases:{binary:[2,"bin"],octal:[8,"oct"],decimal:[10,"dec"],hexadecimal:[16,"hex"]}}),j=new RegExp("^(?:[-+]?(?:[0-9][0-9_]*)(?:\\.[0-9_]*)?(?:[eE][-+]?[0-9]+)?|\\.[0-9_]+(?:[eE][-+]?[0-9]+)?|[-+]?\\.(?:inf|Inf|INF)|\\.(?:nan|NaN|NAN))$");var S=/^[-+]?[0-9]+e/;var T=new h("tag:yaml.org,2002:float",{kind:"scalar",resolve:function(e){return null!==e&&!(!j.test(e)||"_"===e[e.length-1])},construct:function(e){var t,n;return n="-"===(t=e.replace(/_/g,"").toLowerCase())[0]?-1:1,"+-".indexOf(t[0])>=0&&(t=t.slice(1)),".inf"===t?1===n?Number.POSITIVE_INFINITY:Number.NEGATIVE_INFINITY:".nan"===t?NaN:n*parseFloat(t,10)},predicate:function(e){return"[object Number]"===Object.prototype.toString.call(e)&&(e%1!=0||o.isNegativeZero(e))},represent:function(e,t){var n;if(isNaN(e))switch(t){case"lowercase":return".nan";case"uppercase":return".NAN";case"camelcase":return".NaN"}else if(Number.POSITIVE_INFINITY===e)switch(t){case"lowercase":return".inf";case"uppercase":return".INF";case"camelcase":return".Inf"}else if(Number.NEGATIVE_INFINITY===e)switch(t){case"lowercase":return"-.inf";case"uppercase":return"-.INF";case"camelcase":return"-.Inf"}else if(o.isNegativeZero(e))return"-0.0";return n=e.toString(10),S.test(n)?n.replace("e",".e"):n},defaultStyle:"lowercase"}),N=w.extend({implicit:[k,C,O,T]}),F=N,M=new RegExp("^([0-9][0-9][0-9][0-9])-([0-9][0-9])-([0-9][0-9])$"),L=new RegExp("^([0-9][0-9][0-9][0-9])-([0-9][0-9]?)-([0-9][0-9]?)(?:[Tt]|[ \\t]+)([0-9][0-9]?):([0-9][0-9]):([0-9][0-9])(?:\\.([0-9]*))?(?:[ \\t]*(Z|([-+])([0-9][0-9]?)(?::([0-9][0-9]))?))?$");var E=new h("tag:yaml.org,2002:timestamp",{kind:"scalar",resolve:function(e){return null!==e&&(null!==M.exec(e)||null!==L.exec(e))},construct:function(e){var t,n,i,r,o,a,l,c,u=0,s=null;if(null===(t=M.exec(e))&&(t=L.exec(e)),null===t)throw new Error("Date resolve error");if(n=+t[1],i=+t[2]-1,r=+t[3],!t[4])return new Date(Date.UTC(n,i,r));if(o=+t[4],a=+t[5],l=+t[6],t[7]){for(u=t[7].slice(0,3);u.length<3;)u+="0";u=+u}return t[9]&&(s=6e4*(60*+t[10]+ +(t[11]||0)),"-"===t[9]&&(s=-s)),c=new Date(Date.UTC(n,i,r,o,a,l,u)),s&&c.setTime(c.getTime()-s),c},instanceOf:Date,represent:function(e){return e.toISOString()}});var _=new h("tag:yaml.org,2002:merge",{kind:"scalar",resolve:function(e){return"<<"===e||null===e}}),D="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=\n\r";var U=new h("tag:yaml.org,2002:binary",{kind:"scalar",resolve:function(e){if(null===e)return!1;var t,n,i=0,r=e.length,o=D;for(n=0;n<r;n++)if(!((t=o.indexOf(e.charAt(n)))>64)){if(t<0)return!1;i+=6}return i%8==0},construct:function(e){var t,n,i=e.replace(/[\r\n=]/g,""),r=i.length,o=D,a=0,l=[];for(t=0;t<r;t++)t%4==0&&t&&(l.push(a>>16&255),l.push(a>>8&255),l.push(255&a)),a=a<<6|o.indexOf(i.charAt(t));return 0===(n=r%4*6)?(l.push(a>>16&255),l.push(a>>8&255),l.push(255&a)):18===n?(l.push(a>>10&255),l.push(a>>2&255)):12===n&&l.push(a>>4&255),new Uint8Array(l)},predicate:function(e){return"[object Uint8Array]"===Object.prototype.toString.call(e)},represent:function(e){var t,n,i="",r=0,o=e.length,a=D;for(t=0;t<o;t++)t%3==0&&t&&(i+=a[r>>18&63],i+=a[r>>12&63],i+=a[r>>6&63],i+=a[63&r]),r=(r<<8)+e[t];return 0===(n=o%3)?(i+=a[r>>18&63],i+=a[r>>12&63],i+=a[r>>6&63],i+=a[63&r]):2===n?(i+=a[r>>10&63],i+=a[r>>4&63],i+=a[r<<2&63],i+=a[64]):1===n&&(i+=a[r>>2&63],i+=a[r<<4&63],i+=a[64],i+=a[64]),i}}),q=Object.prototype.hasOwnProperty,Y=Object.prototype.toString;var R=new h("tag:yaml.org,2002:omap",{kind:"sequence",resolve:function(e){if(null===e)return!0;var t,n,i,r,o,a=[],l=e;for(t=0,n=l.length;t<n;t+=1){if(i=l[t],o=!1,"[object Object]"!==Y.call(i))return!1;for(r in i)if(q.call(i,r)){if(o)return!1;o=!0}if(!o)return!1;if(-1!==a.indexOf(r))return!1;a.push(r)}return!0},construct:function(e){return null!==e?e:[]}}),W=Object.prototype.toString;var Z=new h("tag:yaml.org,2002:pairs",{kind:"sequence",resolve:function(e){if(null===e)return!0;var t,n,i,r,o,a=e;for(o=new Array(a.length),t=0,n=a.length;t<n;t+=1){if(i=a[t],"[object Object]"!==W.call(i))return!1;if(1!==(r=Object.keys(i)).length)return!1;o[t]=[r[0],i[r[0]]]}return!0},construct:function(e){if(null===e)return[];var t,n,i,r,o,a=e;for(o=new Array(a.length),t=0,n=a.length;t<n;t+=1)i=a[t],r=Object.keys(i),o[t]=[r[0],i[r[0]]];return o}}),B=Object.prototype.hasOwnProperty;var K=new h("tag:yaml.org,2002:set",{kind:"mapping",resolve:function(e){if(null===e)return!0;var t,n=e;for(t in n)if(B.call(n,t)&&null!==n[t])return!1;return!0},construct:function(e){return null!==e?e:{}}}),$=F.extend({implicit:[E,_],explicit:[U,R,Z,K]}),P=Object.prototype.hasOwnProperty,G=1,V=2,z=3,Q=4,J=1,H=2,X=3,ee=/[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x84\x86-\x9F\uFFFE\uFFFF]|[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?:[^\uD800-\uDBFF]|^)[\uDC00-\uDFFF]/,te=/[\x85\u2028\u2029]/,ne=/[,\[\]\{\}]/,ie=/^(?:!|!!|![a-z\-]+!)$/i,re=/^(?:!|[^,\[\]\{\}])(?:%[0-9a-f]{2}|[0-9a-z\-#;\/\?:@&=\+\$,_\.!~\*'\(\)\[\]])*$/i;function oe(e){return Object.prototype.toString.call(e)}function ae(e){return 10===e||13===e}function le(e){return 9===e||32===e}function ce(e){return 9===e||32===e||10===e||13===e}function ue(e){return 44===e||91===e||93===e||123===e||125===e}function se(e){var t;return 48<=e&&e<=57?e-48:97<=(t=32|e)&&t<=102?t-97+10:-1}function pe(e){return 48===e?"\0":97===e?"":98===e?"\b":116===e||9===e?"\t":110===e?"\n":118===e?"\v":102===e?"\f":114===e?"\r":101===e?"":32===e?" ":34===e?'"':47===e?"/":92===e?"\\":78===e?"":95===e?" ":76===e?"\u2028":80===e?"\u2029":""}function fe(e){return e<=65535?String.fromCharCode(e):String.fromCharCode(55296+(e-65536>>10),56320+(e-65536&1023))}for(var de=new Array(256),he=new Array(256),ge=0;ge<256;ge++)de[ge]=pe(ge)?1:0,he[ge]=pe(ge);function me(e,t){this.input=e,this.filename=t.filename||null,this.schema=t.schema||$,this.onWarning=t.onWarning||null,this.legacy=t.legacy||!1,this.json=t.json||!1,this.listener=t.listener||null,this.implicitTypes=this.schema.compiledImplicit,this.typeMap=this.schema.compiledTypeMap,this.length=e.length,this.position=0,this.line=0,this.lineStart=0,this.lineIndent=0,this.firstTabInLine=-1,this.documents=[]}function ye(e,t){var n={name:e.filename,buffer:e.input.slice(0,-1),position:e.position,line:e.line,column:e.position-e.lineStart};return n.snippet=p(n),new c(t,n)}function be(e,t){throw ye(e,t)}function ve(e,t){e.onWarning&&e.onWarning.call(null,ye(e,t))}var Ae={YAML:function(e,t,n){var i,r,o;null!==e.version&&be(e,"duplication of %YAML directive"),1!==n.length&&be(e,"YAML directive accepts exactly one argument"),null===(i=/^([0-9]+)\.([0-9]+)$/.exec(n[0]))&&be(e,"ill-formed argument of the YAML directive"),r=parseInt(i[1],10),o=parseInt(i[2],10),1!==r&&be(e,"unacceptable YAML version of the document"),e.version=n[0],e.checkLineBreaks=o<2,1!==o&&2!==o&&ve(e,"unsupported YAML version of the document")},TAG:function(e,t,n){var i,r;2!==n.length&&be(e,"TAG directive accepts exactly two arguments"),i=n[0],r=n[1],ie.test(i)||be(e,"ill-formed tag handle (first argument) of the TAG directive"),P.call(e.tagMap,i)&&be(e,'there is a previously declared suffix for "'+i+'" tag handle'),re.test(r)||be(e,"ill-formed tag prefix (second argument) of the TAG directive");try{r=decodeURIComponent(r)}catch(o){be(e,"tag prefix is malformed: "+r)}e.tagMap[i]=r}};function we(e,t,n,i){var r,o,a,l;if(t<n){if(l=e.input.slice(t,n),i)for(r=0,o=l.length;r<o;r+=1)9===(a=l.charCodeAt(r))||32<=a&&a<=1114111||be(e,"expected valid JSON character");else ee.test(l)&&be(e,"the stream contains non-printable characters");e.result+=l}}function ke(e,t,n,i){var r,a,l,c;for(o.isObject(n)||be(e,"cannot merge mappings; the provided source object is unacceptable"),l=0,c=(r=Object.keys(n)).length;l<c;l+=1)a=r[l],P.call(t,a)||(t[a]=n[a],i[a]=!0)}function Ce(e,t,n,r,o,a,l,c,u){var s,p;if(Array.isArray(o))for(s=0,p=(o=Array.prototype.slice.call(o)).length;s<p;s+=1)Array.isArray(o[s])&&be(e,"nested arrays are not supported inside keys"),"object"===(0,i.Z)(o)&&"[object Object]"===oe(o[s])&&(o[s]="[object Object]");if("object"===(0,i.Z)(o)&&"[object Object]"===oe(o)&&(o="[object Object]"),o=String(o),null===t&&(t={}),"tag:yaml.org,2002:merge"===r)if(Array.isArray(a))for(s=0,p=a.length;s<p;s+=1)ke(e,t,a[s],n);else ke(e,t,a,n);else e.json||P.call(n,o)||!P.call(t,o)||(e.line=l||e.line,e.lineStart=c||e.lineStart,e.position=u||e.position,be(e,"duplicated mapping key")),"__proto__"===o?Object.defineProperty(t,o,{configurable:!0,enumerable:!0,writable:!0,value:a}):t[o]=a,delete n[o];return t}function xe(e){var t;10===(t=e.input.charCodeAt(e.position))?e.position++:13===t?(e.position++,10===e.input.charCodeAt(e.position)&&e.position++):be(e,"a line break is expected"),e.line+=1,e.lineStart=e.position,e.firstTabInLine=-1}function Ie(e,t,n){for(var i=0,r=e.input.charCodeAt(e.position);0!==r;){for(;le(r);)9===r&&-1===e.firstTabInLine&&(e.firstTabInLine=e.position),r=e.input.charCodeAt(++e.position);if(t&&35===r)do{r=e.input.charCodeAt(++e.position)}while(10!==r&&13!==r&&0!==r);if(!ae(r))break;for(xe(e),r=e.input.charCodeAt(e.position),i++,e.lineIndent=0;32===r;)e.lineIndent++,r=e.input.charCodeAt(++e.position)}return-1!==n&&0!==i&&e.lineIndent<n&&ve(e,"deficient indentation"),i}function Oe(e){var t,n=e.position;return!(45!==(t=e.input.charCodeAt(n))&&46!==t||t!==e.input.charCodeAt(n+1)||t!==e.input.charCodeAt(n+2)||(n+=3,0!==(t=e.input.charCodeAt(n))&&!ce(t)))}function je(e,t){1===t?e.result+=" ":t>1&&(e.result+=o.repeat("\n",t-1))}function Se(e,t){var n,i,r=e.tag,o=e.anchor,a=[],l=!1;if(-1!==e.firstTabInLine)return!1;for(null!==e.anchor&&(e.anchorMap[e.anchor]=a),i=e.input.charCodeAt(e.position);0!==i&&(-1!==e.firstTabInLine&&(e.position=e.firstTabInLine,be(e,"tab characters must not be used in indentation")),45===i)&&ce(e.input.charCodeAt(e.position+1));)if(l=!0,e.position++,Ie(e,!0,-1)&&e.lineIndent<=t)a.push(null),i=e.input.charCodeAt(e.position);else if(n=e.line,Fe(e,t,z,!1,!0),a.push(e.result),Ie(e,!0,-1),i=e.input.charCodeAt(e.position),(e.line===n||e.lineIndent>t)&&0!==i)be(e,"bad indentation of a sequence entry");else if(e.lineIndent<t)break;return!!l&&(e.tag=r,e.anchor=o,e.kind="sequence",e.result=a,!0)}function Te(e){var t,n,i,r,o=!1,a=!1;if(33!==(r=e.input.charCodeAt(e.position)))return!1;if(null!==e.tag&&be(e,"duplication of a tag property"),60===(r=e.input.charCodeAt(++e.position))?(o=!0,r=e.input.charCodeAt(++e.position)):33===r?(a=!0,n="!!",r=e.input.charCodeAt(++e.position)):n="!",t=e.position,o){do{r=e.input.charCodeAt(++e.position)}while(0!==r&&62!==r);e.position<e.length?(i=e.input.slice(t,e.position),r=e.input.charCodeAt(++e.position)):be(e,"unexpected end of the stream within a verbatim tag")}else{for(;0!==r&&!ce(r);)33===r&&(a?be(e,"tag suffix cannot contain exclamation marks"):(n=e.input.slice(t-1,e.position+1),ie.test(n)||be(e,"named tag handle cannot contain such characters"),a=!0,t=e.position+1)),r=e.input.charCodeAt(++e.position);i=e.input.slice(t,e.position),ne.test(i)&&be(e,"tag suffix cannot contain flow indicator characters")}i&&!re.test(i)&&be(e,"tag name cannot contain such characters: "+i);try{i=decodeURIComponent(i)}catch(l){be(e,"tag name is malformed: "+i)}return o?e.tag=i:P.call(e.tagMap,n)?e.tag=e.tagMap[n]+i:"!"===n?e.tag="!"+i:"!!"===n?e.tag="tag:yaml.org,2002:"+i:be(e,'undeclared tag handle "'+n+'"'),!0}function Ne(e){var t,n;if(38!==(n=e.input.charCodeAt(e.position)))return!1;for(null!==e.anchor&&be(e,"duplication of an anchor property"),n=e.input.charCodeAt(++e.position),t=e.position;0!==n&&!ce(n)&&!ue(n);)n=e.input.charCodeAt(++e.position);return e.position===t&&be(e,"name of an anchor node must contain at least one character"),e.anchor=e.input.slice(t,e.position),!0}function Fe(e,t,n,i,r){var a,l,c,u,s,p,f,d,h,g=1,m=!1,y=!1;if(null!==e.listener&&e.listener("open",e),e.tag=null,e.anchor=null,e.kind=null,e.result=null,a=l=c=Q===n||z===n,i&&Ie(e,!0,-1)&&(m=!0,e.lineIndent>t?g=1:e.lineIndent===t?g=0:e.lineIndent<t&&(g=-1)),1===g)for(;Te(e)||Ne(e);)Ie(e,!0,-1)?(m=!0,c=a,e.lineIndent>t?g=1:e.lineIndent===t?g=0:e.lineIndent<t&&(g=-1)):c=!1;if(c&&(c=m||r),1!==g&&Q!==n||(d=G===n||V===n?t:t+1,h=e.position-e.lineStart,1===g?c&&(Se(e,h)||function(e,t,n){var i,r,o,a,l,c,u,s=e.tag,p=e.anchor,f={},d=Object.create(null),h=null,g=null,m=null,y=!1,b=!1;if(-1!==e.firstTabInLine)return!1;for(null!==e.anchor&&(e.anchorMap[e.anchor]=f),u=e.input.charCodeAt(e.position);0!==u;){if(y||-1===e.firstTabInLine||(e.position=e.firstTabInLine,be(e,"tab characters must not be used in indentation")),i=e.input.charCodeAt(e.position+1),o=e.line,63!==u&&58!==u||!ce(i)){if(a=e.line,l=e.lineStart,c=e.position,!Fe(e,n,V,!1,!0))break;if(e.line===o){for(u=e.input.charCodeAt(e.position);le(u);)u=e.input.charCodeAt(++e.position);if(58===u)ce(u=e.input.charCodeAt(++e.position))||be(e,"a whitespace character is expected after the key-value separator within a block mapping"),y&&(Ce(e,f,d,h,g,null,a,l,c),h=g=m=null),b=!0,y=!1,r=!1,h=e.tag,g=e.result;else{if(!b)return e.tag=s,e.anchor=p,!0;be(e,"can not read an implicit mapping pair; a colon is missed")}}else{if(!b)return e.tag=s,e.anchor=p,!0;be(e,"can not read a block mapping entry; a multiline key may not be an implicit key")}}else 63===u?(y&&(Ce(e,f,d,h,g,null,a,l,c),h=g=m=null),b=!0,y=!0,r=!0):y?(y=!1,r=!0):be(e,"incomplete explicit mapping pair; a key node is missed; or followed by a non-tabulated empty line"),e.position+=1,u=i;if((e.line===o||e.lineIndent>t)&&(y&&(a=e.line,l=e.lineStart,c=e.position),Fe(e,t,Q,!0,r)&&(y?g=e.result:m=e.result),y||(Ce(e,f,d,h,g,m,a,l,c),h=g=m=null),Ie(e,!0,-1),u=e.input.charCodeAt(e.position)),(e.line===o||e.lineIndent>t)&&0!==u)be(e,"bad indentation of a mapping entry");else if(e.lineIndent<t)break}return y&&Ce(e,f,d,h,g,null,a,l,c),b&&(e.tag=s,e.anchor=p,e.kind="mapping",e.result=f),b}(e,h,d))||function(e,t){var n,i,r,o,a,l,c,u,s,p,f,d,h=!0,g=e.tag,m=e.anchor,y=Object.create(null);if(91===(d=e.input.charCodeAt(e.position)))a=93,u=!1,o=[];else{if(123!==d)return!1;a=125,u=!0,o={}}for(null!==e.anchor&&(e.anchorMap[e.anchor]=o),d=e.input.charCodeAt(++e.position);0!==d;){if(Ie(e,!0,t),(d=e.input.charCodeAt(e.position))===a)return e.position++,e.tag=g,e.anchor=m,e.kind=u?"mapping":"sequence",e.result=o,!0;h?44===d&&be(e,"expected the node content, but found ','"):be(e,"missed comma between flow collection entries"),f=null,l=c=!1,63===d&&ce(e.input.charCodeAt(e.position+1))&&(l=c=!0,e.position++,Ie(e,!0,t)),n=e.line,i=e.lineStart,r=e.position,Fe(e,t,G,!1,!0),p=e.tag,s=e.result,Ie(e,!0,t),d=e.input.charCodeAt(e.position),!c&&e.line!==n||58!==d||(l=!0,d=e.input.charCodeAt(++e.position),Ie(e,!0,t),Fe(e,t,G,!1,!0),f=e.result),u?Ce(e,o,y,p,s,f,n,i,r):l?o.push(Ce(e,null,y,p,s,f,n,i,r)):o.push(s),Ie(e,!0,t),44===(d=e.input.charCodeAt(e.position))?(h=!0,d=e.input.charCodeAt(++e.position)):h=!1}be(e,"unexpected end of the stream within a flow collection")}(e,d)?y=!0:(l&&function(e,t){var n,i,r,a,l,c=J,u=!1,s=!1,p=t,f=0,d=!1;if(124===(a=e.input.charCodeAt(e.position)))i=!1;else{if(62!==a)return!1;i=!0}for(e.kind="scalar",e.result="";0!==a;)if(43===(a=e.input.charCodeAt(++e.position))||45===a)J===c?c=43===a?X:H:be(e,"repeat of a chomping mode identifier");else{if(!((r=48<=(l=a)&&l<=57?l-48:-1)>=0))break;0===r?be(e,"bad explicit indentation width of a block scalar; it cannot be less than one"):s?be(e,"repeat of an indentation width identifier"):(p=t+r-1,s=!0)}if(le(a)){do{a=e.input.charCodeAt(++e.position)}while(le(a));if(35===a)do{a=e.input.charCodeAt(++e.position)}while(!ae(a)&&0!==a)}for(;0!==a;){for(xe(e),e.lineIndent=0,a=e.input.charCodeAt(e.position);(!s||e.lineIndent<p)&&32===a;)e.lineIndent++,a=e.input.charCodeAt(++e.position);if(!s&&e.lineIndent>p&&(p=e.lineIndent),ae(a))f++;else{if(e.lineIndent<p){c===X?e.result+=o.repeat("\n",u?1+f:f):c===J&&u&&(e.result+="\n");break}for(i?le(a)?(d=!0,e.result+=o.repeat("\n",u?1+f:f)):d?(d=!1,e.result+=o.repeat("\n",f+1)):0===f?u&&(e.result+=" "):e.result+=o.repeat("\n",f):e.result+=o.repeat("\n",u?1+f:f),u=!0,s=!0,f=0,n=e.position;!ae(a)&&0!==a;)a=e.input.charCodeAt(++e.position);we(e,n,e.position,!1)}}return!0}(e,d)||function(e,t){var n,i,r;if(39!==(n=e.input.charCodeAt(e.position)))return!1;for(e.kind="scalar",e.result="",e.position++,i=r=e.position;0!==(n=e.input.charCodeAt(e.position));)if(39===n){if(we(e,i,e.position,!0),39!==(n=e.input.charCodeAt(++e.position)))return!0;i=e.position,e.position++,r=e.position}else ae(n)?(we(e,i,r,!0),je(e,Ie(e,!1,t)),i=r=e.position):e.position===e.lineStart&&Oe(e)?be(e,"unexpected end of the document within a single quoted scalar"):(e.position++,r=e.position);be(e,"unexpected end of the stream within a single quoted scalar")}(e,d)||function(e,t){var n,i,r,o,a,l,c;if(34!==(l=e.input.charCodeAt(e.position)))return!1;for(e.kind="scalar",e.result="",e.position++,n=i=e.position;0!==(l=e.input.charCodeAt(e.position));){if(34===l)return we(e,n,e.position,!0),e.position++,!0;if(92===l){if(we(e,n,e.position,!0),ae(l=e.input.charCodeAt(++e.position)))Ie(e,!1,t);else if(l<256&&de[l])e.result+=he[l],e.position++;else if((a=120===(c=l)?2:117===c?4:85===c?8:0)>0){for(r=a,o=0;r>0;r--)(a=se(l=e.input.charCodeAt(++e.position)))>=0?o=(o<<4)+a:be(e,"expected hexadecimal character");e.result+=fe(o),e.position++}else be(e,"unknown escape sequence");n=i=e.position}else ae(l)?(we(e,n,i,!0),je(e,Ie(e,!1,t)),n=i=e.position):e.position===e.lineStart&&Oe(e)?be(e,"unexpected end of the document within a double quoted scalar"):(e.position++,i=e.position)}be(e,"unexpected end of the stream within a double quoted scalar")}(e,d)?y=!0:!function(e){var t,n,i;if(42!==(i=e.input.charCodeAt(e.position)))return!1;for(i=e.input.charCodeAt(++e.position),t=e.position;0!==i&&!ce(i)&&!ue(i);)i=e.input.charCodeAt(++e.position);return e.position===t&&be(e,"name of an alias node must contain at least one character"),n=e.input.slice(t,e.position),P.call(e.anchorMap,n)||be(e,'unidentified alias "'+n+'"'),e.result=e.anchorMap[n],Ie(e,!0,-1),!0}(e)?function(e,t,n){var i,r,o,a,l,c,u,s,p=e.kind,f=e.result;if(ce(s=e.input.charCodeAt(e.position))||ue(s)||35===s||38===s||42===s||33===s||124===s||62===s||39===s||34===s||37===s||64===s||96===s)return!1;if((63===s||45===s)&&(ce(i=e.input.charCodeAt(e.position+1))||n&&ue(i)))return!1;for(e.kind="scalar",e.result="",r=o=e.position,a=!1;0!==s;){if(58===s){if(ce(i=e.input.charCodeAt(e.position+1))||n&&ue(i))break}else if(35===s){if(ce(e.input.charCodeAt(e.position-1)))break}else{if(e.position===e.lineStart&&Oe(e)||n&&ue(s))break;if(ae(s)){if(l=e.line,c=e.lineStart,u=e.lineIndent,Ie(e,!1,-1),e.lineIndent>=t){a=!0,s=e.input.charCodeAt(e.position);continue}e.position=o,e.line=l,e.lineStart=c,e.lineIndent=u;break}}a&&(we(e,r,o,!1),je(e,e.line-l),r=o=e.position,a=!1),le(s)||(o=e.position+1),s=e.input.charCodeAt(++e.position)}return we(e,r,o,!1),!!e.result||(e.kind=p,e.result=f,!1)}(e,d,G===n)&&(y=!0,null===e.tag&&(e.tag="?")):(y=!0,null===e.tag&&null===e.anchor||be(e,"alias node should not have any properties")),null!==e.anchor&&(e.anchorMap[e.anchor]=e.result)):0===g&&(y=c&&Se(e,h))),null===e.tag)null!==e.anchor&&(e.anchorMap[e.anchor]=e.result);else if("?"===e.tag){for(null!==e.result&&"scalar"!==e.kind&&be(e,'unacceptable node kind for !<?> tag; it should be "scalar", not "'+e.kind+'"'),u=0,s=e.implicitTypes.length;u<s;u+=1)if((f=e.implicitTypes[u]).resolve(e.result)){e.result=f.construct(e.result),e.tag=f.tag,null!==e.anchor&&(e.anchorMap[e.anchor]=e.result);break}}else if("!"!==e.tag){if(P.call(e.typeMap[e.kind||"fallback"],e.tag))f=e.typeMap[e.kind||"fallback"][e.tag];else for(f=null,u=0,s=(p=e.typeMap.multi[e.kind||"fallback"]).length;u<s;u+=1)if(e.tag.slice(0,p[u].tag.length)===p[u].tag){f=p[u];break}f||be(e,"unknown tag !<"+e.tag+">"),null!==e.result&&f.kind!==e.kind&&be(e,"unacceptable node kind for !<"+e.tag+'> tag; it should be "'+f.kind+'", not "'+e.kind+'"'),f.resolve(e.result,e.tag)?(e.result=f.construct(e.result,e.tag),null!==e.anchor&&(e.anchorMap[e.anchor]=e.result)):be(e,"cannot resolve a node with !<"+e.tag+"> explicit tag")}return null!==e.listener&&e.listener("close",e),null!==e.tag||null!==e.anchor||y}function Me(e){var t,n,i,r,o=e.position,a=!1;for(e.version=null,e.checkLineBreaks=e.legacy,e.tagMap=Object.create(null),e.anchorMap=Object.create(null);0!==(r=e.input.charCodeAt(e.position))&&(Ie(e,!0,-1),r=e.input.charCodeAt(e.position),!(e.lineIndent>0||37!==r));){for(a=!0,r=e.input.charCodeAt(++e.position),t=e.position;0!==r&&!ce(r);)r=e.input.charCodeAt(++e.position);for(i=[],(n=e.input.slice(t,e.position)).length<1&&be(e,"directive name must not be less than one character in length");0!==r;){for(;le(r);)r=e.input.charCodeAt(++e.position);if(35===r){do{r=e.input.charCodeAt(++e.position)}while(0!==r&&!ae(r));break}if(ae(r))break;for(t=e.position;0!==r&&!ce(r);)r=e.input.charCodeAt(++e.position);i.push(e.input.slice(t,e.position))}0!==r&&xe(e),P.call(Ae,n)?Ae[n](e,n,i):ve(e,'unknown document directive "'+n+'"')}Ie(e,!0,-1),0===e.lineIndent&&45===e.input.charCodeAt(e.position)&&45===e.input.charCodeAt(e.position+1)&&45===e.input.charCodeAt(e.position+2)?(e.position+=3,Ie(e,!0,-1)):a&&be(e,"directives end mark is expected"),Fe(e,e.lineIndent-1,Q,!1,!0),Ie(e,!0,-1),e.checkLineBreaks&&te.test(e.input.slice(o,e.position))&&ve(e,"non-ASCII line breaks are interpreted as content"),e.documents.push(e.result),e.position===e.lineStart&&Oe(e)?46===e.input.charCodeAt(e.position)&&(e.position+=3,Ie(e,!0,-1)):e.position<e.length-1&&be(e,"end of the stream or a document separator is expected")}function Le(e,t){t=t||{},0!==(e=String(e)).length&&(10!==e.charCodeAt(e.length-1)&&13!==e.charCodeAt(e.length-1)&&(e+="\n"),65279===e.charCodeAt(0)&&(e=e.slice(1)));var n=new me(e,t),i=e.indexOf("\0");for(-1!==i&&(n.position=i,be(n,"null byte is not allowed in input")),n.input+="\0";32===n.input.charCodeAt(n.position);)n.lineIndent+=1,n.position+=1;for(;n.position<n.length-1;)Me(n);return n.documents}var Ee={loadAll:function(e,t,n){null!==t&&"object"===(0,i.Z)(t)&&void 0===n&&(n=t,t=null);var r=Le(e,n);if("function"!=typeof t)return r;for(var o=0,a=r.length;o<a;o+=1)t(r[o])},load:function(e,t){var n=Le(e,t);if(0!==n.length){if(1===n.length)return n[0];throw new c("expected a single document in the stream, but found more")}}},_e=Object.prototype.toString,De=Object.prototype.hasOwnProperty,Ue=65279,qe=9,Ye=10,Re=13,We=32,Ze=33,Be=34,Ke=35,$e=37,Pe=38,Ge=39,Ve=42,ze=44,Qe=45,Je=58,He=61,Xe=62,et=63,tt=64,nt=91,it=93,rt=96,ot=123,at=124,lt=125,ct={0:"\\0",7:"\\a",8:"\\b",9:"\\t",10:"\\n",11:"\\v",12:"\\f",13:"\\r",27:"\\e",34:'\\"',92:"\\\\",133:"\\N",160:"\\_",8232:"\\L",8233:"\\P"},ut=["y","Y","yes","Yes","YES","on","On","ON","n","N","no","No","NO","off","Off","OFF"],st=/^[-+]?[0-9_]+(?::[0-9_]+)+(?:\.[0-9_]*)?$/;function pt(e){var t,n,i;if(t=e.toString(16).toUpperCase(),e<=255)n="x",i=2;else if(e<=65535)n="u",i=4;else{if(!(e<=4294967295))throw new c("code point within a string may not be greater than 0xFFFFFFFF");n="U",i=8}return"\\"+n+o.repeat("0",i-t.length)+t}var ft=1,dt=2;function ht(e){this.schema=e.schema||$,this.indent=Math.max(1,e.indent||2),this.noArrayIndent=e.noArrayIndent||!1,this.skipInvalid=e.skipInvalid||!1,this.flowLevel=o.isNothing(e.flowLevel)?-1:e.flowLevel,this.styleMap=function(e,t){var n,i,r,o,a,l,c;if(null===t)return{};for(n={},r=0,o=(i=Object.keys(t)).length;r<o;r+=1)a=i[r],l=String(t[a]),"!!"===a.slice(0,2)&&(a="tag:yaml.org,2002:"+a.slice(2)),(c=e.compiledTypeMap.fallback[a])&&De.call(c.styleAliases,l)&&(l=c.styleAliases[l]),n[a]=l;return n}(this.schema,e.styles||null),this.sortKeys=e.sortKeys||!1,this.lineWidth=e.lineWidth||80,this.noRefs=e.noRefs||!1,this.noCompatMode=e.noCompatMode||!1,this.condenseFlow=e.condenseFlow||!1,this.quotingType='"'===e.quotingType?dt:ft,this.forceQuotes=e.forceQuotes||!1,this.replacer="function"==typeof e.replacer?e.replacer:null,this.implicitTypes=this.schema.compiledImplicit,this.explicitTypes=this.schema.compiledExplicit,this.tag=null,this.result="",this.duplicates=[],this.usedDuplicates=null}function gt(e,t){for(var n,i=o.repeat(" ",t),r=0,a=-1,l="",c=e.length;r<c;)-1===(a=e.indexOf("\n",r))?(n=e.slice(r),r=c):(n=e.slice(r,a+1),r=a+1),n.length&&"\n"!==n&&(l+=i),l+=n;return l}function mt(e,t){return"\n"+o.repeat(" ",e.indent*t)}function yt(e){return e===We||e===qe}function bt(e){return 32<=e&&e<=126||161<=e&&e<=55295&&8232!==e&&8233!==e||57344<=e&&e<=65533&&e!==Ue||65536<=e&&e<=1114111}function vt(e){return bt(e)&&e!==Ue&&e!==Re&&e!==Ye}function At(e,t,n){var i=vt(e),r=i&&!yt(e);return(n?i:i&&e!==ze&&e!==nt&&e!==it&&e!==ot&&e!==lt)&&e!==Ke&&!(t===Je&&!r)||vt(t)&&!yt(t)&&e===Ke||t===Je&&r}function wt(e,t){var n,i=e.charCodeAt(t);return i>=55296&&i<=56319&&t+1<e.length&&(n=e.charCodeAt(t+1))>=56320&&n<=57343?1024*(i-55296)+n-56320+65536:i}function kt(e){return/^\n* /.test(e)}var Ct=1,xt=2,It=3,Ot=4,jt=5;function St(e,t,n,i,r,o,a,l){var c,u,s=0,p=null,f=!1,d=!1,h=-1!==i,g=-1,m=bt(u=wt(e,0))&&u!==Ue&&!yt(u)&&u!==Qe&&u!==et&&u!==Je&&u!==ze&&u!==nt&&u!==it&&u!==ot&&u!==lt&&u!==Ke&&u!==Pe&&u!==Ve&&u!==Ze&&u!==at&&u!==He&&u!==Xe&&u!==Ge&&u!==Be&&u!==$e&&u!==tt&&u!==rt&&function(e){return!yt(e)&&e!==Je}(wt(e,e.length-1));if(t||a)for(c=0;c<e.length;s>=65536?c+=2:c++){if(!bt(s=wt(e,c)))return jt;m=m&&At(s,p,l),p=s}else{for(c=0;c<e.length;s>=65536?c+=2:c++){if((s=wt(e,c))===Ye)f=!0,h&&(d=d||c-g-1>i&&" "!==e[g+1],g=c);else if(!bt(s))return jt;m=m&&At(s,p,l),p=s}d=d||h&&c-g-1>i&&" "!==e[g+1]}return f||d?n>9&&kt(e)?jt:a?o===dt?jt:xt:d?Ot:It:!m||a||r(e)?o===dt?jt:xt:Ct}function Tt(e,t,n,i,r){e.dump=function(){if(0===t.length)return e.quotingType===dt?'""':"''";if(!e.noCompatMode&&(-1!==ut.indexOf(t)||st.test(t)))return e.quotingType===dt?'"'+t+'"':"'"+t+"'";var o=e.indent*Math.max(1,n),a=-1===e.lineWidth?-1:Math.max(Math.min(e.lineWidth,40),e.lineWidth-o),l=i||e.flowLevel>-1&&n>=e.flowLevel;switch(St(t,l,e.indent,a,(function(t){return function(e,t){var n,i;for(n=0,i=e.implicitTypes.length;n<i;n+=1)if(e.implicitTypes[n].resolve(t))return!0;return!1}(e,t)}),e.quotingType,e.forceQuotes&&!i,r)){case Ct:return t;case xt:return"'"+t.replace(/'/g,"''")+"'";case It:return"|"+Nt(t,e.indent)+Ft(gt(t,o));case Ot:return">"+Nt(t,e.indent)+Ft(gt(function(e,t){var n,i,r=/(\n+)([^\n]*)/g,o=(l=e.indexOf("\n"),l=-1!==l?l:e.length,r.lastIndex=l,Mt(e.slice(0,l),t)),a="\n"===e[0]||" "===e[0];var l;for(;i=r.exec(e);){var c=i[1],u=i[2];n=" "===u[0],o+=c+(a||n||""===u?"":"\n")+Mt(u,t),a=n}return o}(t,a),o));case jt:return'"'+function(e){for(var t,n="",i=0,r=0;r<e.length;i>=65536?r+=2:r++)i=wt(e,r),!(t=ct[i])&&bt(i)?(n+=e[r],i>=65536&&(n+=e[r+1])):n+=t||pt(i);return n}(t)+'"';default:throw new c("impossible error: invalid scalar style")}}()}function Nt(e,t){var n=kt(e)?String(t):"",i="\n"===e[e.length-1];return n+(i&&("\n"===e[e.length-2]||"\n"===e)?"+":i?"":"-")+"\n"}function Ft(e){return"\n"===e[e.length-1]?e.slice(0,-1):e}function Mt(e,t){if(""===e||" "===e[0])return e;for(var n,i,r=/ [^ ]/g,o=0,a=0,l=0,c="";n=r.exec(e);)(l=n.index)-o>t&&(i=a>o?a:l,c+="\n"+e.slice(o,i),o=i+1),a=l;return c+="\n",e.length-o>t&&a>o?c+=e.slice(o,a)+"\n"+e.slice(a+1):c+=e.slice(o),c.slice(1)}function Lt(e,t,n,i){var r,o,a,l="",c=e.tag;for(r=0,o=n.length;r<o;r+=1)a=n[r],e.replacer&&(a=e.replacer.call(n,String(r),a)),(_t(e,t+1,a,!0,!0,!1,!0)||void 0===a&&_t(e,t+1,null,!0,!0,!1,!0))&&(i&&""===l||(l+=mt(e,t)),e.dump&&Ye===e.dump.charCodeAt(0)?l+="-":l+="- ",l+=e.dump);e.tag=c,e.dump=l||"[]"}function Et(e,t,n){var r,o,a,l,u,s;for(a=0,l=(o=n?e.explicitTypes:e.implicitTypes).length;a<l;a+=1)if(((u=o[a]).instanceOf||u.predicate)&&(!u.instanceOf||"object"===(0,i.Z)(t)&&t instanceof u.instanceOf)&&(!u.predicate||u.predicate(t))){if(n?u.multi&&u.representName?e.tag=u.representName(t):e.tag=u.tag:e.tag="?",u.represent){if(s=e.styleMap[u.tag]||u.defaultStyle,"[object Function]"===_e.call(u.represent))r=u.represent(t,s);else{if(!De.call(u.represent,s))throw new c("!<"+u.tag+'> tag resolver accepts not "'+s+'" style');r=u.represent[s](t,s)}e.dump=r}return!0}return!1}function _t(e,t,n,i,r,o,a){e.tag=null,e.dump=n,Et(e,n,!1)||Et(e,n,!0);var l,u=_e.call(e.dump),s=i;i&&(i=e.flowLevel<0||e.flowLevel>t);var p,f,d="[object Object]"===u||"[object Array]"===u;if(d&&(f=-1!==(p=e.duplicates.indexOf(n))),(null!==e.tag&&"?"!==e.tag||f||2!==e.indent&&t>0)&&(r=!1),f&&e.usedDuplicates[p])e.dump="*ref_"+p;else{if(d&&f&&!e.usedDuplicates[p]&&(e.usedDuplicates[p]=!0),"[object Object]"===u)i&&0!==Object.keys(e.dump).length?(!function(e,t,n,i){var r,o,a,l,u,s,p="",f=e.tag,d=Object.keys(n);if(!0===e.sortKeys)d.sort();else if("function"==typeof e.sortKeys)d.sort(e.sortKeys);else if(e.sortKeys)throw new c("sortKeys must be a boolean or a function");for(r=0,o=d.length;r<o;r+=1)s="",i&&""===p||(s+=mt(e,t)),l=n[a=d[r]],e.replacer&&(l=e.replacer.call(n,a,l)),_t(e,t+1,a,!0,!0,!0)&&((u=null!==e.tag&&"?"!==e.tag||e.dump&&e.dump.length>1024)&&(e.dump&&Ye===e.dump.charCodeAt(0)?s+="?":s+="? "),s+=e.dump,u&&(s+=mt(e,t)),_t(e,t+1,l,!0,u)&&(e.dump&&Ye===e.dump.charCodeAt(0)?s+=":":s+=": ",p+=s+=e.dump));e.tag=f,e.dump=p||"{}"}(e,t,e.dump,r),f&&(e.dump="&ref_"+p+e.dump)):(!function(e,t,n){var i,r,o,a,l,c="",u=e.tag,s=Object.keys(n);for(i=0,r=s.length;i<r;i+=1)l="",""!==c&&(l+=", "),e.condenseFlow&&(l+='"'),a=n[o=s[i]],e.replacer&&(a=e.replacer.call(n,o,a)),_t(e,t,o,!1,!1)&&(e.dump.length>1024&&(l+="? "),l+=e.dump+(e.condenseFlow?'"':"")+":"+(e.condenseFlow?"":" "),_t(e,t,a,!1,!1)&&(c+=l+=e.dump));e.tag=u,e.dump="{"+c+"}"}(e,t,e.dump),f&&(e.dump="&ref_"+p+" "+e.dump));else if("[object Array]"===u)i&&0!==e.dump.length?(e.noArrayIndent&&!a&&t>0?Lt(e,t-1,e.dump,r):Lt(e,t,e.dump,r),f&&(e.dump="&ref_"+p+e.dump)):(!function(e,t,n){var i,r,o,a="",l=e.tag;for(i=0,r=n.length;i<r;i+=1)o=n[i],e.replacer&&(o=e.replacer.call(n,String(i),o)),(_t(e,t,o,!1,!1)||void 0===o&&_t(e,t,null,!1,!1))&&(""!==a&&(a+=","+(e.condenseFlow?"":" ")),a+=e.dump);e.tag=l,e.dump="["+a+"]"}(e,t,e.dump),f&&(e.dump="&ref_"+p+" "+e.dump));else{if("[object String]"!==u){if("[object Undefined]"===u)return!1;if(e.skipInvalid)return!1;throw new c("unacceptable kind of an object to dump "+u)}"?"!==e.tag&&Tt(e,e.dump,t,o,s)}null!==e.tag&&"?"!==e.tag&&(l=encodeURI("!"===e.tag[0]?e.tag.slice(1):e.tag).replace(/!/g,"%21"),l="!"===e.tag[0]?"!"+l:"tag:yaml.org,2002:"===l.slice(0,18)?"!!"+l.slice(18):"!<"+l+">",e.dump=l+" "+e.dump)}return!0}function Dt(e,t){var n,i,r=[],o=[];for(Ut(e,r,o),n=0,i=o.length;n<i;n+=1)t.duplicates.push(r[o[n]]);t.usedDuplicates=new Array(i)}function Ut(e,t,n){var r,o,a;if(null!==e&&"object"===(0,i.Z)(e))if(-1!==(o=t.indexOf(e)))-1===n.indexOf(o)&&n.push(o);else if(t.push(e),Array.isArray(e))for(o=0,a=e.length;o<a;o+=1)Ut(e[o],t,n);else for(o=0,a=(r=Object.keys(e)).length;o<a;o+=1)Ut(e[r[o]],t,n)}function qt(e,t){return function(){throw new Error("Function yaml."+e+" is removed in js-yaml 4. Use yaml."+t+" instead, which is now safe by default.")}}var Yt=$,Rt=Ee.load,Wt={dump:function(e,t){var n=new ht(t=t||{});n.noRefs||Dt(e,n);var i=e;return n.replacer&&(i=n.replacer.call({"":i},"",i)),_t(n,0,i,!0,!0)?n.dump+"\n":""}}.dump;qt("safeLoad","load"),qt("safeLoadAll","loadAll"),qt("safeDump","dump")}}]);
+//# sourceMappingURL=7426.YYeQOVuu_k8.js.map
\ No newline at end of file
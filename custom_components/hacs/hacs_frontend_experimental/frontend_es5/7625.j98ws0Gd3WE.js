@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7625],{7625:function(r,t,n){n.r(t),n.d(t,{HaIconButtonGroup:function(){return f}});var o,e,i=n(88962),a=n(33368),u=n(71650),c=n(68308),s=n(82390),d=n(69205),h=n(91808),l=(n(97393),n(5095)),p=n(95260),f=(0,h.Z)([(0,p.Mo)("ha-icon-button-group")],(function(r,t){var n=function(t){function n(){var t;(0,u.Z)(this,n);for(var o=arguments.length,e=new Array(o),i=0;i<o;i++)e[i]=arguments[i];return t=(0,c.Z)(this,n,[].concat(e)),r((0,s.Z)(t)),t}return(0,d.Z)(n,t),(0,a.Z)(n)}(t);return{F:n,d:[{kind:"method",key:"render",value:function(){return(0,l.dy)(o||(o=(0,i.Z)(["<slot></slot>"])))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,l.iv)(e||(e=(0,i.Z)([":host{position:relative;display:flex;flex-direction:row;align-items:center;height:48px;border-radius:28px;background-color:rgba(139,145,151,.1);box-sizing:border-box;width:auto;padding:0}::slotted(.separator){background-color:rgba(var(--rgb-primary-text-color),.15);width:1px;margin:0 1px;height:40px}"])))}}]}}),l.oi)}}]);
+//# sourceMappingURL=7625.j98ws0Gd3WE.js.map
\ No newline at end of file
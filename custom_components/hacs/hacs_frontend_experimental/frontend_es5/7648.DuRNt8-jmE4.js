@@ -0,0 +1,3 @@
+/*! For license information please see 7648.DuRNt8-jmE4.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7648],{86089:function(t,e,n){n.d(e,{U:function(){return r}});var r=function(t){return t.stopPropagation()}},25551:function(t,e,n){n.d(e,{u:function(){return o}});var r=n(14516),o=function(t,e){try{var n,r;return null!==(n=null===(r=i(e))||void 0===r?void 0:r.of(t))&&void 0!==n?n:t}catch(o){return t}},i=(0,r.Z)((function(t){return Intl&&"DisplayNames"in Intl?new Intl.DisplayNames(t.language,{type:"language",fallback:"code"}):void 0}))},7648:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",l=c.asyncIterator||"@@asyncIterator",s=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function f(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new C(r||[]);return a(i,"_invoke",{value:P(t,n,c)}),i}function d(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=f;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function w(){}function k(){}var x={};h(x,u,(function(){return this}));var L=Object.getPrototypeOf,_=L&&L(L(G([])));_&&_!==n&&i.call(_,u)&&(x=_);var E=k.prototype=b.prototype=Object.create(x);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function O(t,e){function n(o,a,c,u){var l=d(t[o],t,a);if("throw"!==l.type){var s=l.arg,h=s.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){s.value=t,c(s)}),(function(t){return n("throw",t,c,u)}))}u(l.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function P(e,n,r){var o=v;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===g){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=j(c,r);if(u){if(u===m)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===v)throw o=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var l=d(e,n,r);if("normal"===l.type){if(o=r.done?g:p,l.arg===m)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(o=g,r.method="throw",r.arg=l.arg)}}}function j(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,j(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var i=d(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,m;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function S(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function N(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function C(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(S,this),this.reset(!0)}function G(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=k,a(E,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:w,configurable:!0}),w.displayName=h(k,s,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,k):(t.__proto__=k,h(t,s,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},Z(O.prototype),h(O.prototype,l,(function(){return this})),e.AsyncIterator=O,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new O(f(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(E),h(E,s,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=G,C.prototype={constructor:C,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(N),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),l=i.call(a,"finallyLoc");if(u&&l){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),N(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;N(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:G(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(l){return void n(l)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,e=(t=o().mark((function t(e,r){var i,a,c,u,l,s,h,f,d,v,p,y,g,m,b,w,k,x,L,_,E,Z,O;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,i=n(88962),a=n(33368),c=n(71650),u=n(68308),l=n(82390),s=n(69205),h=n(91808),f=n(34541),d=n(47838),n(97393),n(86439),n(46349),n(70320),n(37313),n(65974),v=n(5095),p=n(95260),y=n(14516),g=n(18394),m=n(86089),b=n(25551),w=n(28858),k=n(23216),x=n(80411),n(90532),n(71133),!(L=e([k])).then){t.next=41;break}return t.next=37,L;case 37:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=42;break;case 41:t.t0=L;case 42:k=t.t0[0],(0,h.Z)([(0,p.Mo)("ha-language-picker")],(function(t,e){var n=function(e){function n(){var e;(0,c.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,u.Z)(this,n,[].concat(o)),t((0,l.Z)(e)),e}return(0,s.Z)(n,e),(0,a.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"languages",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"nativeName",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"noSort",value:function(){return!1}},{kind:"field",decorators:[(0,p.SB)()],key:"_defaultLanguages",value:function(){return[]}},{kind:"field",decorators:[(0,p.IO)("ha-select")],key:"_select",value:void 0},{kind:"method",key:"firstUpdated",value:function(t){(0,f.Z)((0,d.Z)(n.prototype),"firstUpdated",this).call(this,t),this._computeDefaultLanguageOptions()}},{kind:"method",key:"updated",value:function(t){var e=this;(0,f.Z)((0,d.Z)(n.prototype),"updated",this).call(this,t);var r=t.has("hass")&&this.hass&&t.get("hass")&&t.get("hass").locale.language!==this.hass.locale.language;if(t.has("languages")||t.has("value")||r){var o,i;if(this._select.layoutOptions(),this._select.value!==this.value&&(0,g.B)(this,"value-changed",{value:this._select.value}),!this.value)return;var a=this._getLanguagesOptions(null!==(o=this.languages)&&void 0!==o?o:this._defaultLanguages,this.nativeName,null===(i=this.hass)||void 0===i?void 0:i.locale).findIndex((function(t){return t.value===e.value}));-1===a&&(this.value=void 0),r&&this._select.select(a)}}},{kind:"field",key:"_getLanguagesOptions",value:function(){var t=this;return(0,y.Z)((function(e,n,r){var o=[];if(n){var i=x.o.translations;o=e.map((function(t){var e,n=null===(e=i[t])||void 0===e?void 0:e.nativeName;if(!n)try{n=new Intl.DisplayNames(t,{type:"language",fallback:"code"}).of(t)}catch(r){n=t}return{value:t,label:n}}))}else r&&(o=e.map((function(t){return{value:t,label:(0,b.u)(t,r)}})));return!t.noSort&&r&&o.sort((function(t,e){return(0,w.f)(t.label,e.label,r.language)})),o}))}},{kind:"method",key:"_computeDefaultLanguageOptions",value:function(){this._defaultLanguages=Object.keys(x.o.translations)}},{kind:"method",key:"render",value:function(){var t,e,n,r,o,a,c,u=this._getLanguagesOptions(null!==(t=this.languages)&&void 0!==t?t:this._defaultLanguages,this.nativeName,null===(e=this.hass)||void 0===e?void 0:e.locale),l=null!==(n=this.value)&&void 0!==n?n:this.required?null===(r=u[0])||void 0===r?void 0:r.value:this.value;return(0,v.dy)(_||(_=(0,i.Z)([' <ha-select .label="','" .value="','" .required="','" .disabled="','" @selected="','" @closed="','" fixedMenuPosition naturalMenuWidth> '," </ha-select> "])),null!==(o=this.label)&&void 0!==o?o:(null===(a=this.hass)||void 0===a?void 0:a.localize("ui.components.language-picker.language"))||"Language",l||"",this.required,this.disabled,this._changed,m.U,0===u.length?(0,v.dy)(E||(E=(0,i.Z)(['<ha-list-item value="">',"</ha-list-item>"])),(null===(c=this.hass)||void 0===c?void 0:c.localize("ui.components.language-picker.no_languages"))||"No languages"):u.map((function(t){return(0,v.dy)(Z||(Z=(0,i.Z)([' <ha-list-item .value="','">',"</ha-list-item> "])),t.value,t.label)})))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(O||(O=(0,i.Z)(["ha-select{width:100%}"])))}},{kind:"method",key:"_changed",value:function(t){var e=t.target;""!==e.value&&e.value!==this.value&&(this.value=e.value,(0,g.B)(this,"value-changed",{value:this.value}))}}]}}),v.oi),r(),t.next=50;break;case 47:t.prev=47,t.t2=t.catch(0),r(t.t2);case 50:case"end":return t.stop()}}),t,null,[[0,47]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,n){return e.apply(this,arguments)}}())},71133:function(t,e,n){var r,o,i,a,c=n(99312),u=n(81043),l=n(88962),s=n(33368),h=n(71650),f=n(68308),d=n(82390),v=n(69205),p=n(91808),y=n(34541),g=n(47838),m=(n(97393),n(49412)),b=n(3762),w=n(5095),k=n(95260),x=n(72218),L=n(2537);n(54371),(0,p.Z)([(0,k.Mo)("ha-select")],(function(t,e){var n=function(e){function n(){var e;(0,h.Z)(this,n);for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return e=(0,f.Z)(this,n,[].concat(o)),t((0,d.Z)(e)),e}return(0,v.Z)(n,e),(0,s.Z)(n)}(e);return{F:n,d:[{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,w.dy)(r||(r=(0,l.Z)([" "," "," "])),(0,y.Z)((0,g.Z)(n.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,w.dy)(o||(o=(0,l.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):w.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,w.dy)(i||(i=(0,l.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):w.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,y.Z)((0,g.Z)(n.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,y.Z)((0,g.Z)(n.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var t=this;return(0,x.D)((0,u.Z)((0,c.Z)().mark((function e(){return(0,c.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,(0,L.y)();case 2:t.layoutOptions();case 3:case"end":return e.stop()}}),e)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[b.W,(0,w.iv)(a||(a=(0,l.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),m.K)},23216:function(t,e,n){function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}function o(){o=function(){return e};var t,e={},n=Object.prototype,i=n.hasOwnProperty,a=Object.defineProperty||function(t,e,n){t[e]=n.value},c="function"==typeof Symbol?Symbol:{},u=c.iterator||"@@iterator",l=c.asyncIterator||"@@asyncIterator",s=c.toStringTag||"@@toStringTag";function h(t,e,n){return Object.defineProperty(t,e,{value:n,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,n){return t[e]=n}}function f(t,e,n,r){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),c=new C(r||[]);return a(i,"_invoke",{value:P(t,n,c)}),i}function d(t,e,n){try{return{type:"normal",arg:t.call(e,n)}}catch(t){return{type:"throw",arg:t}}}e.wrap=f;var v="suspendedStart",p="suspendedYield",y="executing",g="completed",m={};function b(){}function w(){}function k(){}var x={};h(x,u,(function(){return this}));var L=Object.getPrototypeOf,_=L&&L(L(G([])));_&&_!==n&&i.call(_,u)&&(x=_);var E=k.prototype=b.prototype=Object.create(x);function Z(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function O(t,e){function n(o,a,c,u){var l=d(t[o],t,a);if("throw"!==l.type){var s=l.arg,h=s.value;return h&&"object"==r(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){n("next",t,c,u)}),(function(t){n("throw",t,c,u)})):e.resolve(h).then((function(t){s.value=t,c(s)}),(function(t){return n("throw",t,c,u)}))}u(l.arg)}var o;a(this,"_invoke",{value:function(t,r){function i(){return new e((function(e,o){n(t,r,e,o)}))}return o=o?o.then(i,i):i()}})}function P(e,n,r){var o=v;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===g){if("throw"===i)throw a;return{value:t,done:!0}}for(r.method=i,r.arg=a;;){var c=r.delegate;if(c){var u=j(c,r);if(u){if(u===m)continue;return u}}if("next"===r.method)r.sent=r._sent=r.arg;else if("throw"===r.method){if(o===v)throw o=g,r.arg;r.dispatchException(r.arg)}else"return"===r.method&&r.abrupt("return",r.arg);o=y;var l=d(e,n,r);if("normal"===l.type){if(o=r.done?g:p,l.arg===m)continue;return{value:l.arg,done:r.done}}"throw"===l.type&&(o=g,r.method="throw",r.arg=l.arg)}}}function j(e,n){var r=n.method,o=e.iterator[r];if(o===t)return n.delegate=null,"throw"===r&&e.iterator.return&&(n.method="return",n.arg=t,j(e,n),"throw"===n.method)||"return"!==r&&(n.method="throw",n.arg=new TypeError("The iterator does not provide a '"+r+"' method")),m;var i=d(o,e.iterator,n.arg);if("throw"===i.type)return n.method="throw",n.arg=i.arg,n.delegate=null,m;var a=i.arg;return a?a.done?(n[e.resultName]=a.value,n.next=e.nextLoc,"return"!==n.method&&(n.method="next",n.arg=t),n.delegate=null,m):a:(n.method="throw",n.arg=new TypeError("iterator result is not an object"),n.delegate=null,m)}function S(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function N(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function C(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(S,this),this.reset(!0)}function G(e){if(e||""===e){var n=e[u];if(n)return n.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function n(){for(;++o<e.length;)if(i.call(e,o))return n.value=e[o],n.done=!1,n;return n.value=t,n.done=!0,n};return a.next=a}}throw new TypeError(r(e)+" is not iterable")}return w.prototype=k,a(E,"constructor",{value:k,configurable:!0}),a(k,"constructor",{value:w,configurable:!0}),w.displayName=h(k,s,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,k):(t.__proto__=k,h(t,s,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},Z(O.prototype),h(O.prototype,l,(function(){return this})),e.AsyncIterator=O,e.async=function(t,n,r,o,i){void 0===i&&(i=Promise);var a=new O(f(t,n,r,o),i);return e.isGeneratorFunction(n)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},Z(E),h(E,s,"Generator"),h(E,u,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),n=[];for(var r in e)n.push(r);return n.reverse(),function t(){for(;n.length;){var r=n.pop();if(r in e)return t.value=r,t.done=!1,t}return t.done=!0,t}},e.values=G,C.prototype={constructor:C,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(N),!e)for(var n in this)"t"===n.charAt(0)&&i.call(this,n)&&!isNaN(+n.slice(1))&&(this[n]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var n=this;function r(r,o){return c.type="throw",c.arg=e,n.next=r,o&&(n.method="next",n.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],c=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=i.call(a,"catchLoc"),l=i.call(a,"finallyLoc");if(u&&l){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(t,e){for(var n=this.tryEntries.length-1;n>=0;--n){var r=this.tryEntries[n];if(r.tryLoc<=this.prev&&i.call(r,"finallyLoc")&&this.prev<r.finallyLoc){var o=r;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,m):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),m},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.finallyLoc===t)return this.complete(n.completion,n.afterLoc),N(n),m}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var n=this.tryEntries[e];if(n.tryLoc===t){var r=n.completion;if("throw"===r.type){var o=r.arg;N(n)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,n,r){return this.delegate={iterator:G(e),resultName:n,nextLoc:r},"next"===this.method&&(this.arg=t),m}},e}function i(t,e,n,r,o,i,a){try{var c=t[i](a),u=c.value}catch(l){return void n(l)}c.done?e(u):Promise.resolve(u).then(r,o)}n.a(t,function(){var t,r=(t=o().mark((function t(r,i){var a,c,u,l,s,h,f,d,v,p,y,g,m;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.prev=0,n.r(e),a=n(99312),c=n(81043),n(51358),n(46798),n(47084),n(5239),n(98490),n(36513),u=n(43170),l=n(27499),s=n(16723),h=n(82874),f=n(32812),d=n(99331),v=n(27815),p=n(64532),y=n(11674),g=n(53285),m=function(){var t=(0,c.Z)((0,a.Z)().mark((function t(){var e,r;return(0,a.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(e=(0,y.sS)(),r=[],!(0,s.Y)()){t.next=5;break}return t.next=5,Promise.all([n.e(9460),n.e(254)]).then(n.bind(n,45577));case 5:if(!(0,f.Y)()){t.next=8;break}return t.next=8,Promise.all([n.e(7021),n.e(9460),n.e(8196)]).then(n.bind(n,48196));case 8:if((0,u.Y)(e)&&r.push(Promise.all([n.e(7021),n.e(6554)]).then(n.bind(n,76554)).then((function(){return(0,g.H)()}))),(0,l.Yq)(e)&&r.push(Promise.all([n.e(7021),n.e(2684)]).then(n.bind(n,72684))),(0,h.Y)(e)&&r.push(Promise.all([n.e(7021),n.e(9029)]).then(n.bind(n,69029))),(0,d.Y)(e)&&r.push(Promise.all([n.e(7021),n.e(7048)]).then(n.bind(n,87048))),(0,v.Y)(e)&&r.push(Promise.all([n.e(7021),n.e(655)]).then(n.bind(n,20655)).then((function(){return n.e(4827).then(n.t.bind(n,64827,23))}))),(0,p.Y)(e)&&r.push(Promise.all([n.e(7021),n.e(759)]).then(n.bind(n,20759))),0!==r.length){t.next=16;break}return t.abrupt("return");case 16:return t.next=18,Promise.all(r).then((function(){return(0,g.n)(e)}));case 18:case"end":return t.stop()}}),t)})));return function(){return t.apply(this,arguments)}}(),t.next=29,m();case 29:i(),t.next=35;break;case 32:t.prev=32,t.t0=t.catch(0),i(t.t0);case 35:case"end":return t.stop()}}),t,null,[[0,32]])})),function(){var e=this,n=arguments;return new Promise((function(r,o){var a=t.apply(e,n);function c(t){i(a,r,o,c,u,"next",t)}function u(t){i(a,r,o,c,u,"throw",t)}c(void 0)}))});return function(t,e){return r.apply(this,arguments)}}(),1)}}]);
+//# sourceMappingURL=7648.DuRNt8-jmE4.js.map
\ No newline at end of file
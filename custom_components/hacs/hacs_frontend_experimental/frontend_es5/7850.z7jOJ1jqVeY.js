@@ -0,0 +1,3 @@
+/*! For license information please see 7850.z7jOJ1jqVeY.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[7850],{89833:function(t,i,e){e.d(i,{O:function(){return g}});var r,o,n=e(88962),s=e(71650),a=e(33368),l=e(68308),c=e(69205),h=(e(22859),e(76843),e(43204)),u=e(42977),d=e(5095),f=e(95260),_=e(53180),v=e(10694),p=e(25815),g=function(t){function i(){var t;return(0,s.Z)(this,i),(t=(0,l.Z)(this,i,arguments)).rows=2,t.cols=20,t.charCounter=!1,t}return(0,c.Z)(i,t),(0,a.Z)(i,[{key:"render",value:function(){var t=this.charCounter&&-1!==this.maxLength,i=t&&"internal"===this.charCounter,e=t&&!i,o=!!this.helper||!!this.validationMessage||e,s={"mdc-text-field--disabled":this.disabled,"mdc-text-field--no-label":!this.label,"mdc-text-field--filled":!this.outlined,"mdc-text-field--outlined":this.outlined,"mdc-text-field--end-aligned":this.endAligned,"mdc-text-field--with-internal-counter":i};return(0,d.dy)(r||(r=(0,n.Z)([' <label class="mdc-text-field mdc-text-field--textarea ','"> '," "," "," "," "," </label> "," "])),(0,_.$)(s),this.renderRipple(),this.outlined?this.renderOutline():this.renderLabel(),this.renderInput(),this.renderCharCounter(i),this.renderLineRipple(),this.renderHelperText(o,e))}},{key:"renderInput",value:function(){var t=this.label?"label":void 0,i=-1===this.minLength?void 0:this.minLength,e=-1===this.maxLength?void 0:this.maxLength,r=this.autocapitalize?this.autocapitalize:void 0;return(0,d.dy)(o||(o=(0,n.Z)([' <textarea aria-labelledby="','" class="mdc-text-field__input" .value="','" rows="','" cols="','" ?disabled="','" placeholder="','" ?required="','" ?readonly="','" minlength="','" maxlength="','" name="','" inputmode="','" autocapitalize="','" @input="','" @blur="','">\n      </textarea>'])),(0,v.o)(t),(0,p.a)(this.value),this.rows,this.cols,this.disabled,this.placeholder,this.required,this.readOnly,(0,v.o)(i),(0,v.o)(e),(0,v.o)(""===this.name?void 0:this.name),(0,v.o)(this.inputMode),(0,v.o)(r),this.handleInputChange,this.onInputBlur)}}]),i}(u.P);(0,h.__decorate)([(0,f.IO)("textarea")],g.prototype,"formElement",void 0),(0,h.__decorate)([(0,f.Cb)({type:Number})],g.prototype,"rows",void 0),(0,h.__decorate)([(0,f.Cb)({type:Number})],g.prototype,"cols",void 0),(0,h.__decorate)([(0,f.Cb)({converter:{fromAttribute:function(t){return null!==t&&(""===t||t)},toAttribute:function(t){return"boolean"==typeof t?t?"":null:t}}})],g.prototype,"charCounter",void 0)},96791:function(t,i,e){e.d(i,{W:function(){return n}});var r,o=e(88962),n=(0,e(5095).iv)(r||(r=(0,o.Z)([".mdc-text-field{height:100%}.mdc-text-field__input{resize:none}"])))},24038:function(t,i,e){var r=e(13089);t.exports=function(t){try{if(r)return Function('return require("'+t+'")')()}catch(i){}}},95818:function(t,i,e){e(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{MIN_SAFE_INTEGER:-9007199254740991})},49089:function(t,i,e){var r=e(68077),o=e(72208),n=e(9160),s=e(22933),a=e(73177);r({target:"Iterator",proto:!0,real:!0},{every:function(t){s(this),n(t);var i=a(this),e=0;return!o(i,(function(i,r){if(!t(i,e++))return r()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})},26535:function(t,i,e){e.d(i,{e:function(){return v}});var r=e(93359),o=e(71650),n=e(33368),s=e(68308),a=e(69205),l=(e(85717),e(15723)),c=e(62746),h=e(34541),u=e(47838);e(46798),e(40271),e(51467),e(97393),e(36513),e(27392),e(46349),e(70320);function d(t){return"horizontal"===t?"row":"column"}var f=function(t){function i(){var t;return(0,o.Z)(this,i),(t=(0,s.Z)(this,i,arguments))._itemSize={},t._gaps={},t._padding={},t}return(0,a.Z)(i,t),(0,n.Z)(i,[{key:"_getDefaultConfig",value:function(){return Object.assign({},(0,h.Z)((0,u.Z)(i.prototype),"_getDefaultConfig",this).call(this),{itemSize:{width:"300px",height:"300px"},gap:"8px",padding:"match-gap"})}},{key:"_gap",get:function(){return this._gaps.row}},{key:"_idealSize",get:function(){return this._itemSize[(0,l.qF)(this.direction)]}},{key:"_idealSize1",get:function(){return this._itemSize[(0,l.qF)(this.direction)]}},{key:"_idealSize2",get:function(){return this._itemSize[(0,l.gu)(this.direction)]}},{key:"_gap1",get:function(){return this._gaps[(t=this.direction,"horizontal"===t?"column":"row")];var t}},{key:"_gap2",get:function(){return this._gaps[d(this.direction)]}},{key:"_padding1",get:function(){var t=this._padding,i="horizontal"===this.direction?["left","right"]:["top","bottom"],e=(0,c.Z)(i,2),r=e[0],o=e[1];return[t[r],t[o]]}},{key:"_padding2",get:function(){var t=this._padding,i="horizontal"===this.direction?["top","bottom"]:["left","right"],e=(0,c.Z)(i,2),r=e[0],o=e[1];return[t[r],t[o]]}},{key:"itemSize",set:function(t){var i=this._itemSize;"string"==typeof t&&(t={width:t,height:t});var e=parseInt(t.width),r=parseInt(t.height);e!==i.width&&(i.width=e,this._triggerReflow()),r!==i.height&&(i.height=r,this._triggerReflow())}},{key:"gap",set:function(t){this._setGap(t)}},{key:"_setGap",value:function(t){var i=t.split(" ").map((function(t){return function(t){return"auto"===t?1/0:parseInt(t)}(t)})),e=this._gaps;i[0]!==e.row&&(e.row=i[0],this._triggerReflow()),void 0===i[1]?i[0]!==e.column&&(e.column=i[0],this._triggerReflow()):i[1]!==e.column&&(e.column=i[1],this._triggerReflow())}},{key:"padding",set:function(t){var i=this._padding,e=t.split(" ").map((function(t){return function(t){return"match-gap"===t?1/0:parseInt(t)}(t)}));1===e.length?(i.top=i.right=i.bottom=i.left=e[0],this._triggerReflow()):2===e.length?(i.top=i.bottom=e[0],i.right=i.left=e[1],this._triggerReflow()):3===e.length?(i.top=e[0],i.right=i.left=e[1],i.bottom=e[2],this._triggerReflow()):4===e.length&&(["top","right","bottom","left"].forEach((function(t,r){return i[t]=e[r]})),this._triggerReflow())}}]),i}(l.IE),_=function(t){function i(){var t;return(0,o.Z)(this,i),(t=(0,s.Z)(this,i,arguments))._metrics=null,t.flex=null,t.justify=null,t}return(0,a.Z)(i,t),(0,n.Z)(i,[{key:"_getDefaultConfig",value:function(){return Object.assign({},(0,h.Z)((0,u.Z)(i.prototype),"_getDefaultConfig",this).call(this),{flex:!1,justify:"start"})}},{key:"gap",set:function(t){(0,h.Z)((0,u.Z)(i.prototype),"_setGap",this).call(this,t)}},{key:"_updateLayout",value:function(){var t=this,i=this.justify,e=(0,c.Z)(this._padding1,2),r=e[0],o=e[1],n=(0,c.Z)(this._padding2,2),s=n[0],a=n[1];["_gap1","_gap2"].forEach((function(e){var r=t[e];if(r===1/0&&!["space-between","space-around","space-evenly"].includes(i))throw new Error("grid layout: gap can only be set to 'auto' when justify is set to 'space-between', 'space-around' or 'space-evenly'");if(r===1/0&&"_gap2"===e)throw new Error("grid layout: ".concat(d(t.direction),"-gap cannot be set to 'auto' when direction is set to ").concat(t.direction))}));var h=this.flex||["start","center","end"].includes(i),u={rolumns:-1,itemSize1:-1,itemSize2:-1,gap1:this._gap1===1/0?-1:this._gap1,gap2:h?this._gap2:0,padding1:{start:r===1/0?this._gap1:r,end:o===1/0?this._gap1:o},padding2:h?{start:s===1/0?this._gap2:s,end:a===1/0?this._gap2:a}:{start:0,end:0},positions:[]},f=this._viewDim2-u.padding2.start-u.padding2.end;if(f<=0)u.rolumns=0;else{var _,v=h?u.gap2:0,p=0,g=0;if(f>=this._idealSize2&&(g=(p=Math.floor((f-this._idealSize2)/(this._idealSize2+v))+1)*this._idealSize2+(p-1)*v),this.flex)switch((f-g)/(this._idealSize2+v)>=.5&&(p+=1),u.rolumns=p,u.itemSize2=Math.round((f-v*(p-1))/p),!0===this.flex?"area":this.flex.preserve){case"aspect-ratio":u.itemSize1=Math.round(this._idealSize1/this._idealSize2*u.itemSize2);break;case(0,l.qF)(this.direction):u.itemSize1=Math.round(this._idealSize1);break;default:u.itemSize1=Math.round(this._idealSize1*this._idealSize2/u.itemSize2)}else u.itemSize1=this._idealSize1,u.itemSize2=this._idealSize2,u.rolumns=p;if(h){var m=u.rolumns*u.itemSize2+(u.rolumns-1)*u.gap2;_=this.flex||"start"===i?u.padding2.start:"end"===i?this._viewDim2-u.padding2.end-m:Math.round(this._viewDim2/2-m/2)}else{var y=f-u.rolumns*u.itemSize2;"space-between"===i?(u.gap2=Math.round(y/(u.rolumns-1)),_=0):"space-around"===i?(u.gap2=Math.round(y/u.rolumns),_=Math.round(u.gap2/2)):(u.gap2=Math.round(y/(u.rolumns+1)),_=u.gap2),this._gap1===1/0&&(u.gap1=u.gap2,r===1/0&&(u.padding1.start=_),o===1/0&&(u.padding1.end=_))}for(var b=0;b<u.rolumns;b++)u.positions.push(_),_+=u.itemSize2+u.gap2}this._metrics=u}}]),i}(f),v=function(t){return Object.assign({type:p},t)},p=function(t){function i(){return(0,o.Z)(this,i),(0,s.Z)(this,i,arguments)}return(0,a.Z)(i,t),(0,n.Z)(i,[{key:"_delta",get:function(){return this._metrics.itemSize1+this._metrics.gap1}},{key:"_getItemSize",value:function(t){return(0,r.Z)((0,r.Z)({},this._sizeDim,this._metrics.itemSize1),this._secondarySizeDim,this._metrics.itemSize2)}},{key:"_getActiveItems",value:function(){var t=this._metrics,i=t.rolumns;if(0===i)this._first=-1,this._last=-1,this._physicalMin=0,this._physicalMax=0;else{var e=t.padding1,r=Math.max(0,this._scrollPosition-this._overhang),o=Math.min(this._scrollSize,this._scrollPosition+this._viewDim1+this._overhang),n=Math.max(0,Math.floor((r-e.start)/this._delta)),s=Math.max(0,Math.ceil((o-e.start)/this._delta));this._first=n*i,this._last=Math.min(s*i-1,this.items.length-1),this._physicalMin=e.start+this._delta*n,this._physicalMax=e.start+this._delta*s}}},{key:"_getItemPosition",value:function(t){var i=this._metrics,e=i.rolumns,o=i.padding1,n=i.positions,s=i.itemSize1,a=i.itemSize2;return(0,r.Z)((0,r.Z)((0,r.Z)((0,r.Z)({},this._positionDim,o.start+Math.floor(t/e)*this._delta),this._secondaryPositionDim,n[t%e]),(0,l.qF)(this.direction),s),(0,l.gu)(this.direction),a)}},{key:"_updateScrollSize",value:function(){var t=this._metrics,i=t.rolumns,e=t.gap1,r=t.padding1,o=t.itemSize1,n=1;if(i>0){var s=Math.ceil(this.items.length/i);n=r.start+s*o+(s-1)*e+r.end}this._scrollSize=n}}]),i}(_)},15723:function(t,i,e){e.d(i,{IE:function(){return l},gu:function(){return a},qF:function(){return s}});var r=e(93359),o=e(71650),n=e(33368);e(46798),e(47084),e(85717),e(51358),e(96043),e(5239),e(98490);function s(t){return"horizontal"===t?"width":"height"}function a(t){return"horizontal"===t?"height":"width"}var l=function(){function t(i,e){var r=this;(0,o.Z)(this,t),this._latestCoords={left:0,top:0},this._direction=null,this._viewportSize={width:0,height:0},this.totalScrollSize={width:0,height:0},this.offsetWithinScroller={left:0,top:0},this._pendingReflow=!1,this._pendingLayoutUpdate=!1,this._pin=null,this._firstVisible=0,this._lastVisible=0,this._physicalMin=0,this._physicalMax=0,this._first=-1,this._last=-1,this._sizeDim="height",this._secondarySizeDim="width",this._positionDim="top",this._secondaryPositionDim="left",this._scrollPosition=0,this._scrollError=0,this._items=[],this._scrollSize=1,this._overhang=1e3,this._hostSink=i,Promise.resolve().then((function(){return r.config=e||r._getDefaultConfig()}))}return(0,n.Z)(t,[{key:"_getDefaultConfig",value:function(){return{direction:"vertical"}}},{key:"config",get:function(){return{direction:this.direction}},set:function(t){Object.assign(this,Object.assign({},this._getDefaultConfig(),t))}},{key:"items",get:function(){return this._items},set:function(t){this._setItems(t)}},{key:"_setItems",value:function(t){t!==this._items&&(this._items=t,this._scheduleReflow())}},{key:"direction",get:function(){return this._direction},set:function(t){(t="horizontal"===t?t:"vertical")!==this._direction&&(this._direction=t,this._sizeDim="horizontal"===t?"width":"height",this._secondarySizeDim="horizontal"===t?"height":"width",this._positionDim="horizontal"===t?"left":"top",this._secondaryPositionDim="horizontal"===t?"top":"left",this._triggerReflow())}},{key:"viewportSize",get:function(){return this._viewportSize},set:function(t){var i=this._viewDim1,e=this._viewDim2;Object.assign(this._viewportSize,t),e!==this._viewDim2?this._scheduleLayoutUpdate():i!==this._viewDim1&&this._checkThresholds()}},{key:"viewportScroll",get:function(){return this._latestCoords},set:function(t){Object.assign(this._latestCoords,t);var i=this._scrollPosition;this._scrollPosition=this._latestCoords[this._positionDim],Math.abs(i-this._scrollPosition)>=1&&this._checkThresholds()}},{key:"reflowIfNeeded",value:function(){(arguments.length>0&&void 0!==arguments[0]&&arguments[0]||this._pendingReflow)&&(this._pendingReflow=!1,this._reflow())}},{key:"pin",get:function(){if(null!==this._pin){var t=this._pin,i=t.index,e=t.block;return{index:Math.max(0,Math.min(i,this.items.length-1)),block:e}}return null},set:function(t){this._pin=t,this._triggerReflow()}},{key:"_clampScrollPosition",value:function(t){return Math.max(-this.offsetWithinScroller[this._positionDim],Math.min(t,this.totalScrollSize[s(this.direction)]-this._viewDim1))}},{key:"unpin",value:function(){null!==this._pin&&(this._sendUnpinnedMessage(),this._pin=null)}},{key:"_updateLayout",value:function(){}},{key:"_viewDim1",get:function(){return this._viewportSize[this._sizeDim]}},{key:"_viewDim2",get:function(){return this._viewportSize[this._secondarySizeDim]}},{key:"_scheduleReflow",value:function(){this._pendingReflow=!0}},{key:"_scheduleLayoutUpdate",value:function(){this._pendingLayoutUpdate=!0,this._scheduleReflow()}},{key:"_triggerReflow",value:function(){var t=this;this._scheduleLayoutUpdate(),Promise.resolve().then((function(){return t.reflowIfNeeded()}))}},{key:"_reflow",value:function(){this._pendingLayoutUpdate&&(this._updateLayout(),this._pendingLayoutUpdate=!1),this._updateScrollSize(),this._setPositionFromPin(),this._getActiveItems(),this._updateVisibleIndices(),this._sendStateChangedMessage()}},{key:"_setPositionFromPin",value:function(){if(null!==this.pin){var t=this._scrollPosition,i=this.pin,e=i.index,r=i.block;this._scrollPosition=this._calculateScrollIntoViewPosition({index:e,block:r||"start"})-this.offsetWithinScroller[this._positionDim],this._scrollError=t-this._scrollPosition}}},{key:"_calculateScrollIntoViewPosition",value:function(t){var i=t.block,e=Math.min(this.items.length,Math.max(0,t.index)),r=this._getItemPosition(e)[this._positionDim],o=r;if("start"!==i){var n=this._getItemSize(e)[this._sizeDim];if("center"===i)o=r-.5*this._viewDim1+.5*n;else{var s=r-this._viewDim1+n;if("end"===i)o=s;else{var a=this._scrollPosition;o=Math.abs(a-r)<Math.abs(a-s)?r:s}}}return o+=this.offsetWithinScroller[this._positionDim],this._clampScrollPosition(o)}},{key:"getScrollIntoViewCoordinates",value:function(t){return(0,r.Z)({},this._positionDim,this._calculateScrollIntoViewPosition(t))}},{key:"_sendUnpinnedMessage",value:function(){this._hostSink({type:"unpinned"})}},{key:"_sendVisibilityChangedMessage",value:function(){this._hostSink({type:"visibilityChanged",firstVisible:this._firstVisible,lastVisible:this._lastVisible})}},{key:"_sendStateChangedMessage",value:function(){var t=new Map;if(-1!==this._first&&-1!==this._last)for(var i=this._first;i<=this._last;i++)t.set(i,this._getItemPosition(i));var e={type:"stateChanged",scrollSize:(0,r.Z)((0,r.Z)({},this._sizeDim,this._scrollSize),this._secondarySizeDim,null),range:{first:this._first,last:this._last,firstVisible:this._firstVisible,lastVisible:this._lastVisible},childPositions:t};this._scrollError&&(e.scrollError=(0,r.Z)((0,r.Z)({},this._positionDim,this._scrollError),this._secondaryPositionDim,0),this._scrollError=0),this._hostSink(e)}},{key:"_num",get:function(){return-1===this._first||-1===this._last?0:this._last-this._first+1}},{key:"_checkThresholds",value:function(){if(0===this._viewDim1&&this._num>0||null!==this._pin)this._scheduleReflow();else{var t=Math.max(0,this._scrollPosition-this._overhang),i=Math.min(this._scrollSize,this._scrollPosition+this._viewDim1+this._overhang);this._physicalMin>t||this._physicalMax<i?this._scheduleReflow():this._updateVisibleIndices({emit:!0})}}},{key:"_updateVisibleIndices",value:function(t){if(-1!==this._first&&-1!==this._last){for(var i=this._first;i<this._last&&Math.round(this._getItemPosition(i)[this._positionDim]+this._getItemSize(i)[this._sizeDim])<=Math.round(this._scrollPosition);)i++;for(var e=this._last;e>this._first&&Math.round(this._getItemPosition(e)[this._positionDim])>=Math.round(this._scrollPosition+this._viewDim1);)e--;i===this._firstVisible&&e===this._lastVisible||(this._firstVisible=i,this._lastVisible=e,t&&t.emit&&this._sendVisibilityChangedMessage())}}}]),t}()},22129:function(t,i,e){e.d(i,{B:function(){return b}});var r,o,n,s=e(33368),a=e(71650),l=e(68308),c=e(69205),h=e(43204),u=e(95260),d=e(88962),f=e(5095),_=(e(76843),e(53180)),v=e(6157),p=function(t){function i(){var t;return(0,a.Z)(this,i),(t=(0,l.Z)(this,i,arguments)).value=0,t.max=1,t.indeterminate=!1,t.fourColor=!1,t}return(0,c.Z)(i,t),(0,s.Z)(i,[{key:"render",value:function(){var t=this.ariaLabel;return(0,f.dy)(r||(r=(0,d.Z)([' <div class="progress ','" role="progressbar" aria-label="','" aria-valuemin="0" aria-valuemax="','" aria-valuenow="','">',"</div> "])),(0,_.$)(this.getRenderClasses()),t||f.Ld,this.max,this.indeterminate?f.Ld:this.value,this.renderIndicator())}},{key:"getRenderClasses",value:function(){return{indeterminate:this.indeterminate,"four-color":this.fourColor}}}]),i}(f.oi);(0,v.d)(p),(0,h.__decorate)([(0,u.Cb)({type:Number})],p.prototype,"value",void 0),(0,h.__decorate)([(0,u.Cb)({type:Number})],p.prototype,"max",void 0),(0,h.__decorate)([(0,u.Cb)({type:Boolean})],p.prototype,"indeterminate",void 0),(0,h.__decorate)([(0,u.Cb)({type:Boolean,attribute:"four-color"})],p.prototype,"fourColor",void 0);var g,m=function(t){function i(){return(0,a.Z)(this,i),(0,l.Z)(this,i,arguments)}return(0,c.Z)(i,t),(0,s.Z)(i,[{key:"renderIndicator",value:function(){return this.indeterminate?this.renderIndeterminateContainer():this.renderDeterminateContainer()}},{key:"renderDeterminateContainer",value:function(){var t=100*(1-this.value/this.max);return(0,f.dy)(o||(o=(0,d.Z)([' <svg viewBox="0 0 4800 4800"> <circle class="track" pathLength="100"></circle> <circle class="active-track" pathLength="100" stroke-dashoffset="','"></circle> </svg> '])),t)}},{key:"renderIndeterminateContainer",value:function(){return(0,f.dy)(n||(n=(0,d.Z)([' <div class="spinner"> <div class="left"> <div class="circle"></div> </div> <div class="right"> <div class="circle"></div> </div> </div>'])))}}]),i}(p),y=(0,f.iv)(g||(g=(0,d.Z)([":host{--_active-indicator-color:var(--md-circular-progress-active-indicator-color, var(--md-sys-color-primary, #6750a4));--_active-indicator-width:var(--md-circular-progress-active-indicator-width, 10);--_four-color-active-indicator-four-color:var(--md-circular-progress-four-color-active-indicator-four-color, var(--md-sys-color-tertiary-container, #ffd8e4));--_four-color-active-indicator-one-color:var(--md-circular-progress-four-color-active-indicator-one-color, var(--md-sys-color-primary, #6750a4));--_four-color-active-indicator-three-color:var(--md-circular-progress-four-color-active-indicator-three-color, var(--md-sys-color-tertiary, #7d5260));--_four-color-active-indicator-two-color:var(--md-circular-progress-four-color-active-indicator-two-color, var(--md-sys-color-primary-container, #eaddff));--_size:var(--md-circular-progress-size, 48px);display:inline-flex;vertical-align:middle;width:var(--_size);height:var(--_size);position:relative;align-items:center;justify-content:center;contain:strict;content-visibility:auto}.progress{flex:1;align-self:stretch;margin:4px}.active-track,.circle,.left,.progress,.right,.spinner,.track,svg{position:absolute;inset:0}svg{transform:rotate(-90deg)}circle{cx:50%;cy:50%;r:calc(50%*(1 - var(--_active-indicator-width)/ 100));stroke-width:calc(var(--_active-indicator-width)*1%);stroke-dasharray:100;fill:rgba(0,0,0,0)}.active-track{transition:stroke-dashoffset .5s cubic-bezier(0, 0, .2, 1);stroke:var(--_active-indicator-color)}.track{stroke:rgba(0,0,0,0)}.progress.indeterminate{animation:linear infinite linear-rotate;animation-duration:1.568s}.spinner{animation:infinite both rotate-arc;animation-duration:5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.left{overflow:hidden;inset:0 50% 0 0}.right{overflow:hidden;inset:0 0 0 50%}.circle{box-sizing:border-box;border-radius:50%;border:solid calc(var(--_active-indicator-width)/ 100*(var(--_size) - 8px));border-color:var(--_active-indicator-color) var(--_active-indicator-color) transparent transparent;animation:expand-arc;animation-iteration-count:infinite;animation-fill-mode:both;animation-duration:1333ms,5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.four-color .circle{animation-name:expand-arc,four-color}.left .circle{rotate:135deg;inset:0 -100% 0 0}.right .circle{rotate:100deg;inset:0 0 0 -100%;animation-delay:-.666s,0s}@media(forced-colors:active){.active-track{stroke:CanvasText}.circle{border-color:CanvasText CanvasText Canvas Canvas}}@keyframes expand-arc{0%{transform:rotate(265deg)}50%{transform:rotate(130deg)}100%{transform:rotate(265deg)}}@keyframes rotate-arc{12.5%{transform:rotate(135deg)}25%{transform:rotate(270deg)}37.5%{transform:rotate(405deg)}50%{transform:rotate(540deg)}62.5%{transform:rotate(675deg)}75%{transform:rotate(810deg)}87.5%{transform:rotate(945deg)}100%{transform:rotate(1080deg)}}@keyframes linear-rotate{to{transform:rotate(360deg)}}@keyframes four-color{0%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}15%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}25%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}40%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}50%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}65%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}75%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}90%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}100%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}}"]))),b=function(t){function i(){return(0,a.Z)(this,i),(0,l.Z)(this,i,arguments)}return(0,c.Z)(i,t),(0,s.Z)(i)}(m);b.styles=[y],b=(0,h.__decorate)([(0,u.Mo)("md-circular-progress")],b)},36142:function(t,i,e){e.d(i,{C:function(){return y}});var r=e(99312),o=e(81043),n=e(71650),s=e(33368),a=e(68308),l=e(82390),c=e(69205),h=(e(85472),e(46798),e(9849),e(90126),e(47084),e(56308),e(32982)),u=e(41005),d=e(36585);e(94738),e(98214),e(53918),e(20254),e(51358),e(5239),e(98490),e(51467);var f=function(){function t(i){(0,n.Z)(this,t),this.G=i}return(0,s.Z)(t,[{key:"disconnect",value:function(){this.G=void 0}},{key:"reconnect",value:function(t){this.G=t}},{key:"deref",value:function(){return this.G}}]),t}(),_=function(){function t(){(0,n.Z)(this,t),this.Y=void 0,this.Z=void 0}return(0,s.Z)(t,[{key:"get",value:function(){return this.Y}},{key:"pause",value:function(){var t,i=this;null!==(t=this.Y)&&void 0!==t||(this.Y=new Promise((function(t){return i.Z=t})))}},{key:"resume",value:function(){var t;null===(t=this.Z)||void 0===t||t.call(this),this.Y=this.Z=void 0}}]),t}(),v=e(16616),p=function(t){return!(0,u.pt)(t)&&"function"==typeof t.then},g=1073741823,m=function(t){function i(){var t;return(0,n.Z)(this,i),(t=(0,a.Z)(this,i,arguments))._$C_t=g,t._$Cwt=[],t._$Cq=new f((0,l.Z)(t)),t._$CK=new _,t}return(0,c.Z)(i,t),(0,s.Z)(i,[{key:"render",value:function(){for(var t,i=arguments.length,e=new Array(i),r=0;r<i;r++)e[r]=arguments[r];return null!==(t=e.find((function(t){return!p(t)})))&&void 0!==t?t:h.Jb}},{key:"update",value:function(t,i){var e=this,n=this._$Cwt,s=n.length;this._$Cwt=i;var a=this._$Cq,l=this._$CK;this.isConnected||this.disconnected();for(var c,u=function(){var t=i[d];if(!p(t))return{v:(e._$C_t=d,t)};d<s&&t===n[d]||(e._$C_t=g,s=0,Promise.resolve(t).then(function(){var i=(0,o.Z)((0,r.Z)().mark((function i(e){var o,n;return(0,r.Z)().wrap((function(i){for(;;)switch(i.prev=i.next){case 0:if(!l.get()){i.next=5;break}return i.next=3,l.get();case 3:i.next=0;break;case 5:void 0!==(o=a.deref())&&(n=o._$Cwt.indexOf(t))>-1&&n<o._$C_t&&(o._$C_t=n,o.setValue(e));case 7:case"end":return i.stop()}}),i)})));return function(t){return i.apply(this,arguments)}}()))},d=0;d<i.length&&!(d>this._$C_t);d++)if(c=u())return c.v;return h.Jb}},{key:"disconnected",value:function(){this._$Cq.disconnect(),this._$CK.pause()}},{key:"reconnected",value:function(){this._$Cq.reconnect(this),this._$CK.resume()}}]),i}(d.sR),y=(0,v.XM)(m)}}]);
+//# sourceMappingURL=7850.z7jOJ1jqVeY.js.map
\ No newline at end of file
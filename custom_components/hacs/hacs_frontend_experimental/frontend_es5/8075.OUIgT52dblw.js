@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8075],{7265:function(e,t,i){var n,d,l=i(88962),r=i(33368),a=i(71650),o=i(68308),s=i(82390),u=i(69205),c=i(91808),f=(i(97393),i(5095)),h=i(95260);(0,c.Z)([(0,h.Mo)("ha-input-helper-text")],(function(e,t){var i=function(t){function i(){var t;(0,a.Z)(this,i);for(var n=arguments.length,d=new Array(n),l=0;l<n;l++)d[l]=arguments[l];return t=(0,o.Z)(this,i,[].concat(d)),e((0,s.Z)(t)),t}return(0,u.Z)(i,t),(0,r.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"render",value:function(){return(0,f.dy)(n||(n=(0,l.Z)(["<slot></slot>"])))}},{kind:"field",static:!0,key:"styles",value:function(){return(0,f.iv)(d||(d=(0,l.Z)([":host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}"])))}}]}}),f.oi)},68075:function(e,t,i){i.r(t),i.d(t,{HaNumberSelector:function(){return b}});var n,d,l,r,a,o=i(88962),s=i(33368),u=i(71650),c=i(68308),f=i(82390),h=i(69205),p=i(91808),v=(i(97393),i(76843),i(46798),i(94570),i(5095)),m=i(95260),x=i(53180),g=i(18394),b=(i(7265),i(8956),i(51520),(0,p.Z)([(0,m.Mo)("ha-selector-number")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,d=new Array(n),l=0;l<n;l++)d[l]=arguments[l];return t=(0,c.Z)(this,i,[].concat(d)),e((0,f.Z)(t)),t}return(0,h.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Number})],key:"value",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Number})],key:"placeholder",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",key:"_valueStr",value:function(){return""}},{kind:"method",key:"willUpdate",value:function(e){e.has("value")&&(""!==this._valueStr&&this.value===Number(this._valueStr)||(this._valueStr=null==this.value||isNaN(this.value)?"":this.value.toString()))}},{kind:"method",key:"render",value:function(){var e,t,i,a,s,u,c,f,h,p,m,g,b,k,y,_="box"===(null===(e=this.selector.number)||void 0===e?void 0:e.mode)||void 0===(null===(t=this.selector.number)||void 0===t?void 0:t.min)||void 0===(null===(i=this.selector.number)||void 0===i?void 0:i.max);if(!_&&"any"===(k=null!==(y=this.selector.number.step)&&void 0!==y?y:1)){k=1;for(var Z=(this.selector.number.max-this.selector.number.min)/100;k>Z;)k/=10}return(0,v.dy)(n||(n=(0,o.Z)([' <div class="input"> ',' <ha-textfield .inputMode="','" .label="','" .placeholder="','" class="','" .min="','" .max="','" .value="','" .step="','" helperPersistent .helper="','" .disabled="','" .required="','" .suffix="','" type="number" autoValidate ?no-spinner="','" @input="','"> </ha-textfield> </div> '," "])),_?"":(0,v.dy)(d||(d=(0,o.Z)([" ",' <ha-slider labeled .min="','" .max="','" .value="','" .step="','" .disabled="','" .required="','" @change="','"> </ha-slider> '])),this.label?(0,v.dy)(l||(l=(0,o.Z)(["","",""])),this.label,this.required?"*":""):"",this.selector.number.min,this.selector.number.max,null!==(a=this.value)&&void 0!==a?a:"",k,this.disabled,this.required,this._handleSliderChange),"any"===(null===(s=this.selector.number)||void 0===s?void 0:s.step)||(null!==(u=null===(c=this.selector.number)||void 0===c?void 0:c.step)&&void 0!==u?u:1)%1!=0?"decimal":"numeric",_?this.label:void 0,this.placeholder,(0,x.$)({single:_}),null===(f=this.selector.number)||void 0===f?void 0:f.min,null===(h=this.selector.number)||void 0===h?void 0:h.max,null!==(p=this._valueStr)&&void 0!==p?p:"",null!==(m=null===(g=this.selector.number)||void 0===g?void 0:g.step)&&void 0!==m?m:1,_?this.helper:void 0,this.disabled,this.required,null===(b=this.selector.number)||void 0===b?void 0:b.unit_of_measurement,!_,this._handleInputChange,!_&&this.helper?(0,v.dy)(r||(r=(0,o.Z)(["<ha-input-helper-text>","</ha-input-helper-text>"])),this.helper):"")}},{kind:"method",key:"_handleInputChange",value:function(e){e.stopPropagation(),this._valueStr=e.target.value;var t=""===e.target.value||isNaN(e.target.value)?void 0:Number(e.target.value);this.value!==t&&(0,g.B)(this,"value-changed",{value:t})}},{kind:"method",key:"_handleSliderChange",value:function(e){e.stopPropagation();var t=Number(e.target.value);this.value!==t&&(0,g.B)(this,"value-changed",{value:t})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(a||(a=(0,o.Z)([".input{display:flex;justify-content:space-between;align-items:center;direction:ltr}ha-slider{flex:1}ha-textfield{--ha-textfield-input-width:40px}.single{--ha-textfield-input-width:unset;flex:1}"])))}}]}}),v.oi))},8956:function(e,t,i){var n,d=i(88962),l=i(46097),r=i(33368),a=i(71650),o=i(68308),s=i(82390),u=i(69205),c=i(91808),f=(i(97393),i(95260)),h=(i(34131),i(96985)),p=i(5095);(0,c.Z)([(0,f.Mo)("ha-slider")],(function(e,t){var i=function(t){function i(){var t;(0,a.Z)(this,i);for(var n=arguments.length,d=new Array(n),l=0;l<n;l++)d[l]=arguments[l];return t=(0,o.Z)(this,i,[].concat(d)),e((0,s.Z)(t)),t}return(0,u.Z)(i,t),(0,r.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[].concat((0,l.Z)(h.$.styles),[(0,p.iv)(n||(n=(0,d.Z)([":host{--md-sys-color-primary:var(--primary-color);--md-sys-color-outline:var(--outline-color);--md-sys-color-on-surface:var(--primary-text-color);--md-slider-handle-width:14px;--md-slider-handle-height:14px;min-width:100px;min-inline-size:100px;width:200px}"])))])}}]}}),h.$)},51520:function(e,t,i){var n,d,l,r,a=i(88962),o=i(33368),s=i(71650),u=i(68308),c=i(82390),f=i(69205),h=i(91808),p=i(34541),v=i(47838),m=(i(97393),i(42977)),x=i(31338),g=i(5095),b=i(95260),k=i(67684);(0,h.Z)([(0,b.Mo)("ha-textfield")],(function(e,t){var i=function(t){function i(){var t;(0,s.Z)(this,i);for(var n=arguments.length,d=new Array(n),l=0;l<n;l++)d[l]=arguments[l];return t=(0,u.Z)(this,i,[].concat(d)),e((0,c.Z)(t)),t}return(0,f.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,b.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,b.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,b.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,b.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,p.Z)((0,v.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=t?"trailing":"leading";return(0,g.dy)(n||(n=(0,a.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),i,t?1:-1,i)}},{kind:"field",static:!0,key:"styles",value:function(){return[x.W,(0,g.iv)(d||(d=(0,a.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===k.E.document.dir?(0,g.iv)(l||(l=(0,a.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,g.iv)(r||(r=(0,a.Z)([""])))]}}]}}),m.P)}}]);
+//# sourceMappingURL=8075.OUIgT52dblw.js.map
\ No newline at end of file
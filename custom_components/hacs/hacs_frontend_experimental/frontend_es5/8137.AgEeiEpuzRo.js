@@ -0,0 +1,3 @@
+/*! For license information please see 8137.AgEeiEpuzRo.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8137],{42219:function(t,e,r){r.d(e,{y:function(){return i}});r(40271),r(60163);var n=r(14516),o=r(35137),i=(0,n.Z)((function(t){if(t.time_format===o.zt.language||t.time_format===o.zt.system){var e=t.time_format===o.zt.language?t.language:void 0;return new Date("January 1, 2023 22:00:00").toLocaleString(e).includes("10")}return t.time_format===o.zt.am_pm}))},58902:function(t,e,r){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}function o(){o=function(){return e};var t,e={},r=Object.prototype,i=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},u="function"==typeof Symbol?Symbol:{},c=u.iterator||"@@iterator",l=u.asyncIterator||"@@asyncIterator",s=u.toStringTag||"@@toStringTag";function h(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{h({},"")}catch(t){h=function(t,e,r){return t[e]=r}}function d(t,e,r,n){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),u=new j(n||[]);return a(i,"_invoke",{value:N(t,r,u)}),i}function f(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=d;var v="suspendedStart",p="suspendedYield",y="executing",m="completed",g={};function b(){}function k(){}function w(){}var x={};h(x,c,(function(){return this}));var _=Object.getPrototypeOf,L=_&&_(_(I([])));L&&L!==r&&i.call(L,c)&&(x=L);var E=w.prototype=b.prototype=Object.create(x);function S(t){["next","throw","return"].forEach((function(e){h(t,e,(function(t){return this._invoke(e,t)}))}))}function C(t,e){function r(o,a,u,c){var l=f(t[o],t,a);if("throw"!==l.type){var s=l.arg,h=s.value;return h&&"object"==n(h)&&i.call(h,"__await")?e.resolve(h.__await).then((function(t){r("next",t,u,c)}),(function(t){r("throw",t,u,c)})):e.resolve(h).then((function(t){s.value=t,u(s)}),(function(t){return r("throw",t,u,c)}))}c(l.arg)}var o;a(this,"_invoke",{value:function(t,n){function i(){return new e((function(e,o){r(t,n,e,o)}))}return o=o?o.then(i,i):i()}})}function N(e,r,n){var o=v;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(n.method=i,n.arg=a;;){var u=n.delegate;if(u){var c=Z(u,n);if(c){if(c===g)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(o===v)throw o=m,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);o=y;var l=f(e,r,n);if("normal"===l.type){if(o=n.done?m:p,l.arg===g)continue;return{value:l.arg,done:n.done}}"throw"===l.type&&(o=m,n.method="throw",n.arg=l.arg)}}}function Z(e,r){var n=r.method,o=e.iterator[n];if(o===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,Z(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),g;var i=f(o,e.iterator,r.arg);if("throw"===i.type)return r.method="throw",r.arg=i.arg,r.delegate=null,g;var a=i.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,g):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,g)}function O(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function P(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function j(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(O,this),this.reset(!0)}function I(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function r(){for(;++o<e.length;)if(i.call(e,o))return r.value=e[o],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError(n(e)+" is not iterable")}return k.prototype=w,a(E,"constructor",{value:w,configurable:!0}),a(w,"constructor",{value:k,configurable:!0}),k.displayName=h(w,s,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===k||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,w):(t.__proto__=w,h(t,s,"GeneratorFunction")),t.prototype=Object.create(E),t},e.awrap=function(t){return{__await:t}},S(C.prototype),h(C.prototype,l,(function(){return this})),e.AsyncIterator=C,e.async=function(t,r,n,o,i){void 0===i&&(i=Promise);var a=new C(d(t,r,n,o),i);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},S(E),h(E,s,"Generator"),h(E,c,(function(){return this})),h(E,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=I,j.prototype={constructor:j,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(P),!e)for(var r in this)"t"===r.charAt(0)&&i.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,o){return u.type="throw",u.arg=e,r.next=n,o&&(r.method="next",r.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],u=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=i.call(a,"catchLoc"),l=i.call(a,"finallyLoc");if(c&&l){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&i.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var o=n;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),P(r),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var o=n.arg;P(r)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:I(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),g}},e}function i(t,e,r,n,o,i,a){try{var u=t[i](a),c=u.value}catch(l){return void r(l)}u.done?e(c):Promise.resolve(c).then(n,o)}r.a(t,function(){var t,n=(t=o().mark((function t(n,i){var a,u,c,l,s,h,d,f,v,p,y,m,g,b,k,w;return o().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.prev=0,r.r(e),r.d(e,{HaDateTimeSelector:function(){return w}}),a=r(88962),u=r(33368),c=r(71650),l=r(68308),s=r(82390),h=r(69205),d=r(91808),r(97393),f=r(5095),v=r(95260),p=r(18394),y=r(99683),r(51115),r(7265),!(m=n([y])).then){t.next=26;break}return t.next=22,m;case 22:t.t1=t.sent,t.t0=(0,t.t1)(),t.next=27;break;case 26:t.t0=m;case 27:y=t.t0[0],w=(0,d.Z)([(0,v.Mo)("ha-selector-datetime")],(function(t,e){var r=function(e){function r(){var e;(0,c.Z)(this,r);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e=(0,l.Z)(this,r,[].concat(o)),t((0,s.Z)(e)),e}return(0,h.Z)(r,e),(0,u.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,v.IO)("ha-date-input")],key:"_dateInput",value:void 0},{kind:"field",decorators:[(0,v.IO)("ha-time-input")],key:"_timeInput",value:void 0},{kind:"method",key:"render",value:function(){var t="string"==typeof this.value?this.value.split(" "):void 0;return(0,f.dy)(g||(g=(0,a.Z)([' <div class="input"> <ha-date-input .label="','" .locale="','" .disabled="','" .required="','" .value="','" @value-changed="','"> </ha-date-input> <ha-time-input enable-second .value="','" .locale="','" .disabled="','" .required="','" @value-changed="','"></ha-time-input> </div> '," "])),this.label,this.hass.locale,this.disabled,this.required,null==t?void 0:t[0],this._valueChanged,(null==t?void 0:t[1])||"00:00:00",this.hass.locale,this.disabled,this.required,this._valueChanged,this.helper?(0,f.dy)(b||(b=(0,a.Z)(["<ha-input-helper-text>","</ha-input-helper-text>"])),this.helper):"")}},{kind:"method",key:"_valueChanged",value:function(t){t.stopPropagation(),this._dateInput.value&&this._timeInput.value&&(0,p.B)(this,"value-changed",{value:"".concat(this._dateInput.value," ").concat(this._timeInput.value)})}},{kind:"field",static:!0,key:"styles",value:function(){return(0,f.iv)(k||(k=(0,a.Z)([".input{display:flex;align-items:center;flex-direction:row}ha-date-input{min-width:150px;margin-right:4px}"])))}}]}}),f.oi),i(),t.next=35;break;case 32:t.prev=32,t.t2=t.catch(0),i(t.t2);case 35:case"end":return t.stop()}}),t,null,[[0,32]])})),function(){var e=this,r=arguments;return new Promise((function(n,o){var a=t.apply(e,r);function u(t){i(a,n,o,u,c,"next",t)}function c(t){i(a,n,o,u,c,"throw",t)}u(void 0)}))});return function(t,e){return n.apply(this,arguments)}}())},51115:function(t,e,r){var n,o=r(88962),i=r(33368),a=r(71650),u=r(68308),c=r(82390),l=r(69205),s=r(91808),h=(r(97393),r(76843),r(73314),r(46798),r(94570),r(5095)),d=r(95260),f=r(42219),v=r(18394);r(64106),(0,s.Z)([(0,d.Mo)("ha-time-input")],(function(t,e){var r=function(e){function r(){var e;(0,a.Z)(this,r);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e=(0,u.Z)(this,r,[].concat(o)),t((0,c.Z)(e)),e}return(0,l.Z)(r,e),(0,i.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"locale",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"field",decorators:[(0,d.Cb)({type:Boolean,attribute:"enable-second"})],key:"enableSecond",value:function(){return!1}},{kind:"method",key:"render",value:function(){var t,e=(0,f.y)(this.locale),r=(null===(t=this.value)||void 0===t?void 0:t.split(":"))||[],i=r[0],a=Number(r[0]);return a&&e&&a>12&&a<24&&(i=String(a-12).padStart(2,"0")),e&&0===a&&(i="12"),(0,h.dy)(n||(n=(0,o.Z)([' <ha-base-time-input .label="','" .hours="','" .minutes="','" .seconds="','" .format="','" .amPm="','" .disabled="','" @value-changed="','" .enableSecond="','" .required="','" .helper="','"></ha-base-time-input> '])),this.label,Number(i),Number(r[1]),Number(r[2]),e?12:24,e&&a>=12?"PM":"AM",this.disabled,this._timeChanged,this.enableSecond,this.required,this.helper)}},{kind:"method",key:"_timeChanged",value:function(t){t.stopPropagation();var e,r=t.detail.value,n=(0,f.y)(this.locale);if(!isNaN(r.hours)||!isNaN(r.minutes)||!isNaN(r.seconds)){var o=r.hours||0;r&&n&&("PM"===r.amPm&&o<12&&(o+=12),"AM"===r.amPm&&12===o&&(o=0)),e="".concat(o.toString().padStart(2,"0"),":").concat(r.minutes?r.minutes.toString().padStart(2,"0"):"00",":").concat(r.seconds?r.seconds.toString().padStart(2,"0"):"00")}e!==this.value&&(this.value=e,(0,v.B)(this,"change"),(0,v.B)(this,"value-changed",{value:e}))}}]}}),h.oi)},93892:function(t,e,r){var n=r(97673),o=r(11336),i=r(43313),a=RangeError;t.exports=function(t){var e=o(i(this)),r="",u=n(t);if(u<0||u===1/0)throw new a("Wrong number of repetitions");for(;u>0;(u>>>=1)&&(e+=e))1&u&&(r+=e);return r}}}]);
+//# sourceMappingURL=8137.AgEeiEpuzRo.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8224],{78224:function(e,i,t){t.r(i),t.d(i,{HaFormFloat:function(){return v}});var d,n,a=t(88962),l=t(33368),r=t(71650),o=t(68308),c=t(82390),f=t(69205),s=t(91808),u=(t(97393),t(94738),t(98214),t(63789),t(24074),t(2094),t(67712),t(5095)),p=t(95260),h=t(18394),v=(t(51520),(0,s.Z)([(0,p.Mo)("ha-form-float")],(function(e,i){var t=function(i){function t(){var i;(0,r.Z)(this,t);for(var d=arguments.length,n=new Array(d),a=0;a<d;a++)n[a]=arguments[a];return i=(0,o.Z)(this,t,[].concat(n)),e((0,c.Z)(i)),i}return(0,f.Z)(t,i),(0,l.Z)(t)}(i);return{F:t,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"localize",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"schema",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"data",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.IO)("ha-textfield")],key:"_input",value:void 0},{kind:"method",key:"focus",value:function(){this._input&&this._input.focus()}},{kind:"method",key:"render",value:function(){var e,i;return(0,u.dy)(d||(d=(0,a.Z)([' <ha-textfield type="numeric" inputMode="decimal" .label="','" .helper="','" helperPersistent .value="','" .disabled="','" .required="','" .autoValidate="','" .suffix="','" .validationMessage="','" @input="','"></ha-textfield> '])),this.label,this.helper,void 0!==this.data?this.data:"",this.disabled,this.schema.required,this.schema.required,null===(e=this.schema.description)||void 0===e?void 0:e.suffix,this.schema.required?null===(i=this.localize)||void 0===i?void 0:i.call(this,"ui.common.error_required"):void 0,this._valueChanged)}},{kind:"method",key:"updated",value:function(e){e.has("schema")&&this.toggleAttribute("own-margin",!!this.schema.required)}},{kind:"method",key:"_valueChanged",value:function(e){var i,t=e.target,d=t.value.replace(",",".");if(!d.endsWith(".")&&"-"!==d)if(""!==d&&(i=parseFloat(d),isNaN(i)&&(i=void 0)),this.data!==i)(0,h.B)(this,"value-changed",{value:i});else{var n=void 0===i?"":String(i);t.value!==n&&(t.value=n)}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,u.iv)(n||(n=(0,a.Z)([":host([own-margin]){margin-bottom:5px}ha-textfield{display:block}"])))}}]}}),u.oi))},51520:function(e,i,t){var d,n,a,l,r=t(88962),o=t(33368),c=t(71650),f=t(68308),s=t(82390),u=t(69205),p=t(91808),h=t(34541),v=t(47838),x=(t(97393),t(42977)),m=t(31338),g=t(5095),k=t(95260),b=t(67684);(0,p.Z)([(0,k.Mo)("ha-textfield")],(function(e,i){var t=function(i){function t(){var i;(0,c.Z)(this,t);for(var d=arguments.length,n=new Array(d),a=0;a<d;a++)n[a]=arguments[a];return i=(0,f.Z)(this,t,[].concat(n)),e((0,s.Z)(i)),i}return(0,u.Z)(t,i),(0,o.Z)(t)}(i);return{F:t,d:[{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,k.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,k.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,h.Z)((0,v.Z)(t.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e){var i=arguments.length>1&&void 0!==arguments[1]&&arguments[1],t=i?"trailing":"leading";return(0,g.dy)(d||(d=(0,r.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),t,i?1:-1,t)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,g.iv)(n||(n=(0,r.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===b.E.document.dir?(0,g.iv)(a||(a=(0,r.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,g.iv)(l||(l=(0,r.Z)([""])))]}}]}}),x.P)}}]);
+//# sourceMappingURL=8224.F4rz7eg3UG0.js.map
\ No newline at end of file
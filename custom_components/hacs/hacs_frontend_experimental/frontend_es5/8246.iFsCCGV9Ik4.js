@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8246],{15734:function(e,t,i){i.r(t),i.d(t,{HaAreaSelector:function(){return F}});var r,a,n,s,u,d=i(88962),o=i(33368),l=i(71650),c=i(68308),h=i(82390),v=i(69205),f=i(91808),k=(i(97393),i(46798),i(9849),i(13526),i(10733),i(5095)),y=i(95260),b=i(14516),p=i(4771),_=i(16061),m=i(18394),C=i(92794),Z=i(29934),A=(i(25718),i(46097)),g=i(99312),S=i(81043),D=(i(46349),i(70320),i(40271),i(60163),i(87438),i(22890),i(49389)),F=((0,f.Z)([(0,y.Mo)("ha-areas-picker")],(function(e,t){var i,s=function(t){function i(){var t;(0,l.Z)(this,i);for(var r=arguments.length,a=new Array(r),n=0;n<r;n++)a[n]=arguments[n];return t=(0,c.Z)(this,i,[].concat(a)),e((0,h.Z)(t)),t}return(0,v.Z)(i,t),(0,o.Z)(i)}(t);return{F:s,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"placeholder",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean,attribute:"no-add"})],key:"noAdd",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"deviceFilter",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,y.Cb)({attribute:"picked-area-label"})],key:"pickedAreaLabel",value:void 0},{kind:"field",decorators:[(0,y.Cb)({attribute:"pick-area-label"})],key:"pickAreaLabel",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"method",key:"render",value:function(){var e=this;if(!this.hass)return k.Ld;var t=this._currentAreas;return(0,k.dy)(r||(r=(0,d.Z)([" ",' <div> <ha-area-picker .noAdd="','" .hass="','" .label="','" .helper="','" .includeDomains="','" .excludeDomains="','" .includeDeviceClasses="','" .deviceFilter="','" .entityFilter="','" .disabled="','" .placeholder="','" .required="','" @value-changed="','" .excludeAreas="','"></ha-area-picker> </div> '])),t.map((function(t){return(0,k.dy)(a||(a=(0,d.Z)([' <div> <ha-area-picker .curValue="','" .noAdd="','" .hass="','" .value="','" .label="','" .includeDomains="','" .excludeDomains="','" .includeDeviceClasses="','" .deviceFilter="','" .entityFilter="','" .disabled="','" @value-changed="','"></ha-area-picker> </div> '])),t,e.noAdd,e.hass,t,e.pickedAreaLabel,e.includeDomains,e.excludeDomains,e.includeDeviceClasses,e.deviceFilter,e.entityFilter,e.disabled,e._areaChanged)})),this.noAdd,this.hass,this.pickAreaLabel,this.helper,this.includeDomains,this.excludeDomains,this.includeDeviceClasses,this.deviceFilter,this.entityFilter,this.disabled,this.placeholder,this.required&&!t.length,this._addArea,t)}},{kind:"get",key:"_currentAreas",value:function(){return this.value||[]}},{kind:"method",key:"_updateAreas",value:(i=(0,S.Z)((0,g.Z)().mark((function e(t){return(0,g.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:this.value=t,(0,m.B)(this,"value-changed",{value:t});case 2:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"method",key:"_areaChanged",value:function(e){e.stopPropagation();var t=e.currentTarget.curValue,i=e.detail.value;if(i!==t){var r=this._currentAreas;i&&!r.includes(i)?this._updateAreas(r.map((function(e){return e===t?i:e}))):this._updateAreas(r.filter((function(e){return e!==t})))}}},{kind:"method",key:"_addArea",value:function(e){e.stopPropagation();var t=e.detail.value;if(t){e.currentTarget.value="";var i=this._currentAreas;i.includes(t)||this._updateAreas([].concat((0,A.Z)(i),[t]))}}},{kind:"field",static:!0,key:"styles",value:function(){return(0,k.iv)(n||(n=(0,d.Z)(["div{margin-top:8px}"])))}}]}}),(0,D.f)(k.oi)),(0,f.Z)([(0,y.Mo)("ha-selector-area")],(function(e,t){var i=function(t){function i(){var t;(0,l.Z)(this,i);for(var r=arguments.length,a=new Array(r),n=0;n<r;n++)a[n]=arguments[n];return t=(0,c.Z)(this,i,[].concat(a)),e((0,h.Z)(t)),t}return(0,v.Z)(i,t),(0,o.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,y.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,y.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,y.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,y.SB)()],key:"_entitySources",value:void 0},{kind:"field",key:"_deviceIntegrationLookup",value:function(){return(0,b.Z)(_.HP)}},{kind:"method",key:"_hasIntegration",value:function(e){var t,i;return(null===(t=e.area)||void 0===t?void 0:t.entity)&&(0,p.r)(e.area.entity).some((function(e){return e.integration}))||(null===(i=e.area)||void 0===i?void 0:i.device)&&(0,p.r)(e.area.device).some((function(e){return e.integration}))}},{kind:"method",key:"willUpdate",value:function(e){var t,i;e.has("selector")&&void 0!==this.value&&(null!==(t=this.selector.area)&&void 0!==t&&t.multiple&&!Array.isArray(this.value)?(this.value=[this.value],(0,m.B)(this,"value-changed",{value:this.value})):null!==(i=this.selector.area)&&void 0!==i&&i.multiple||!Array.isArray(this.value)||(this.value=this.value[0],(0,m.B)(this,"value-changed",{value:this.value})))}},{kind:"method",key:"updated",value:function(e){var t=this;e.has("selector")&&this._hasIntegration(this.selector)&&!this._entitySources&&(0,C.m)(this.hass).then((function(e){t._entitySources=e}))}},{kind:"method",key:"render",value:function(){var e;return this._hasIntegration(this.selector)&&!this._entitySources?k.Ld:null!==(e=this.selector.area)&&void 0!==e&&e.multiple?(0,k.dy)(u||(u=(0,d.Z)([' <ha-areas-picker .hass="','" .value="','" .helper="','" .pickAreaLabel="','" no-add .deviceFilter="','" .entityFilter="','" .disabled="','" .required="','"></ha-areas-picker> '])),this.hass,this.value,this.helper,this.label,this._filterDevices,this._filterEntities,this.disabled,this.required):(0,k.dy)(s||(s=(0,d.Z)([' <ha-area-picker .hass="','" .value="','" .label="','" .helper="','" no-add .deviceFilter="','" .entityFilter="','" .disabled="','" .required="','"></ha-area-picker> '])),this.hass,this.value,this.label,this.helper,this._filterDevices,this._filterEntities,this.disabled,this.required)}},{kind:"field",key:"_filterEntities",value:function(){var e=this;return function(t){var i;return null===(i=e.selector.area)||void 0===i||!i.entity||(0,p.r)(e.selector.area.entity).some((function(i){return(0,Z.lV)(i,t,e._entitySources)}))}}},{kind:"field",key:"_filterDevices",value:function(){var e=this;return function(t){var i;if(null===(i=e.selector.area)||void 0===i||!i.device)return!0;var r=e._entitySources?e._deviceIntegrationLookup(e._entitySources,Object.values(e.hass.entities)):void 0;return(0,p.r)(e.selector.area.device).some((function(e){return(0,Z.lE)(e,t,r)}))}}}]}}),k.oi))},92794:function(e,t,i){i.d(t,{m:function(){return u}});i(65974);var r=i(99312),a=i(81043),n=(i(97393),i(46798),i(47084),function(){var e=(0,a.Z)((0,r.Z)().mark((function e(t,i,a,s,u){var d,o,l,c,h,v,f,k=arguments;return(0,r.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:for(d=k.length,o=new Array(d>5?d-5:0),l=5;l<d;l++)o[l-5]=k[l];if(h=(c=u)[t],v=function(e){return s&&s(u,e.result)!==e.cacheKey?(c[t]=void 0,n.apply(void 0,[t,i,a,s,u].concat(o))):e.result},!h){e.next=6;break}return e.abrupt("return",h instanceof Promise?h.then(v):v(h));case 6:return f=a.apply(void 0,[u].concat(o)),c[t]=f,f.then((function(e){c[t]={result:e,cacheKey:null==s?void 0:s(u,e)},setTimeout((function(){c[t]=void 0}),i)}),(function(){c[t]=void 0})),e.abrupt("return",f);case 10:case"end":return e.stop()}}),e)})));return function(t,i,r,a,n){return e.apply(this,arguments)}}()),s=function(e){return e.callWS({type:"entity/source"})},u=function(e){return n("_entitySources",3e4,s,(function(e){return Object.keys(e.states).length}),e)}},49389:function(e,t,i){i.d(t,{f:function(){return v}});var r=i(40039),a=i(33368),n=i(71650),s=i(68308),u=i(82390),d=i(69205),o=i(91808),l=i(34541),c=i(47838),h=(i(97393),i(46798),i(47084),i(51358),i(98490),i(40271),i(60163),i(9849),i(13526),i(95260)),v=function(e){var t=(0,o.Z)(null,(function(e,t){var i=function(t){function i(){var t;(0,n.Z)(this,i);for(var r=arguments.length,a=new Array(r),d=0;d<r;d++)a[d]=arguments[d];return t=(0,s.Z)(this,i,[].concat(a)),e((0,u.Z)(t)),t}return(0,d.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,h.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",key:"hassSubscribeRequiredHostProps",value:void 0},{kind:"field",key:"__unsubs",value:void 0},{kind:"method",key:"connectedCallback",value:function(){(0,l.Z)((0,c.Z)(i.prototype),"connectedCallback",this).call(this),this.__checkSubscribed()}},{kind:"method",key:"disconnectedCallback",value:function(){if((0,l.Z)((0,c.Z)(i.prototype),"disconnectedCallback",this).call(this),this.__unsubs){for(;this.__unsubs.length;){var e=this.__unsubs.pop();e instanceof Promise?e.then((function(e){return e()})):e()}this.__unsubs=void 0}}},{kind:"method",key:"updated",value:function(e){if((0,l.Z)((0,c.Z)(i.prototype),"updated",this).call(this,e),e.has("hass"))this.__checkSubscribed();else if(this.hassSubscribeRequiredHostProps){var t,a=(0,r.Z)(e.keys());try{for(a.s();!(t=a.n()).done;){var n=t.value;if(this.hassSubscribeRequiredHostProps.includes(n))return void this.__checkSubscribed()}}catch(s){a.e(s)}finally{a.f()}}}},{kind:"method",key:"hassSubscribe",value:function(){return[]}},{kind:"method",key:"__checkSubscribed",value:function(){var e,t=this;void 0!==this.__unsubs||!this.isConnected||void 0===this.hass||null!==(e=this.hassSubscribeRequiredHostProps)&&void 0!==e&&e.some((function(e){return void 0===t[e]}))||(this.__unsubs=this.hassSubscribe())}}]}}),e);return t}},95818:function(e,t,i){i(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{MIN_SAFE_INTEGER:-9007199254740991})},49089:function(e,t,i){var r=i(68077),a=i(72208),n=i(9160),s=i(22933),u=i(73177);r({target:"Iterator",proto:!0,real:!0},{every:function(e){s(this),n(e);var t=u(this),i=0;return!a(t,(function(t,r){if(!e(t,i++))return r()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})}}]);
+//# sourceMappingURL=8246.iFsCCGV9Ik4.js.map
\ No newline at end of file
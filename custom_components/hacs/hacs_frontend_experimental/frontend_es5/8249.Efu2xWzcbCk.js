@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8249],{63335:function(t,e,i){i.d(e,{F:function(){return b}});var n=i(99312),s=i(81043),r=i(88962),o=i(71650),a=i(33368),u=i(68308),h=i(69205),l=i(43204),c=i(95260),d=i(58417),f=i(39274),v=function(t){function e(){return(0,o.Z)(this,e),(0,u.Z)(this,e,arguments)}return(0,h.Z)(e,t),(0,a.Z)(e)}(d.A);v.styles=[f.W],v=(0,l.__decorate)([(0,c.Mo)("mwc-checkbox")],v);var p,m,y,g=i(5095),k=i(53180),b=function(t){function e(){var t;return(0,o.Z)(this,e),(t=(0,u.Z)(this,e,arguments)).left=!1,t.graphic="control",t}var i;return(0,h.Z)(e,t),(0,a.Z)(e,[{key:"render",value:function(){var t={"mdc-deprecated-list-item__graphic":this.left,"mdc-deprecated-list-item__meta":!this.left},e=this.renderText(),i=this.graphic&&"control"!==this.graphic&&!this.left?this.renderGraphic():(0,g.dy)(p||(p=(0,r.Z)([""]))),n=this.hasMeta&&this.left?this.renderMeta():(0,g.dy)(m||(m=(0,r.Z)([""]))),s=this.renderRipple();return(0,g.dy)(y||(y=(0,r.Z)([" "," "," ",' <span class="','"> <mwc-checkbox reducedTouchTarget tabindex="','" .checked="','" ?disabled="','" @change="','"> </mwc-checkbox> </span> '," ",""])),s,i,this.left?"":e,(0,k.$)(t),this.tabindex,this.selected,this.disabled,this.onChange,this.left?e:"",n)}},{key:"onChange",value:(i=(0,s.Z)((0,n.Z)().mark((function t(e){var i;return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(i=e.target,this.selected===i.checked){t.next=8;break}return this._skipPropRequest=!0,this.selected=i.checked,t.next=7,this.updateComplete;case 7:this._skipPropRequest=!1;case 8:case"end":return t.stop()}}),t,this)}))),function(t){return i.apply(this,arguments)})}]),e}(i(61092).K);(0,l.__decorate)([(0,c.IO)("slot")],b.prototype,"slotElement",void 0),(0,l.__decorate)([(0,c.IO)("mwc-checkbox")],b.prototype,"checkboxElement",void 0),(0,l.__decorate)([(0,c.Cb)({type:Boolean})],b.prototype,"left",void 0),(0,l.__decorate)([(0,c.Cb)({type:String,reflect:!0})],b.prototype,"graphic",void 0)},21270:function(t,e,i){i.d(e,{W:function(){return r}});var n,s=i(88962),r=(0,i(5095).iv)(n||(n=(0,s.Z)([":host(:not([twoline])){height:56px}:host(:not([left])) .mdc-deprecated-list-item__meta{height:40px;width:40px}"])))},48769:function(t,e,i){i(88820)("WeakSet",(function(t){return function(){return t(this,arguments.length?arguments[0]:void 0)}}),i(6946))},48567:function(t,e,i){i(48769)},62434:function(t,e,i){i.d(e,{jt:function(){return A}});var n=i(46097),s=i(62746),r=i(99312),o=i(81043),a=i(71650),u=i(33368),h=i(95281),l=i(68308),c=i(69205),d=(i(51358),i(96043),i(46798),i(5239),i(98490),i(48567),i(47084),i(39685),i(51467),i(85717),i(9849),i(50289),i(94167),i(76843),i(49089),i(32797),i(97393),i(17692),i(36513),i(87438),i(22890),i(46349),i(70320),i(32982)),f=i(57835),v=i(76187),p=(i(78399),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(13526),new WeakMap),m=0,y=new Map,g=new WeakSet,k=function(){return new Promise((function(t){return requestAnimationFrame(t)}))},b=function(t,e){var i=t-e;return 0===i?void 0:i},Z=function(t,e){var i=t/e;return 1===i?void 0:i},w={left:function(t,e){var i=b(t,e);return{value:i,transform:null==i||isNaN(i)?void 0:"translateX(".concat(i,"px)")}},top:function(t,e){var i=b(t,e);return{value:i,transform:null==i||isNaN(i)?void 0:"translateY(".concat(i,"px)")}},width:function(t,e){var i;0===e&&(e=1,i={width:"1px"});var n=Z(t,e);return{value:n,overrideFrom:i,transform:null==n||isNaN(n)?void 0:"scaleX(".concat(n,")")}},height:function(t,e){var i;0===e&&(e=1,i={height:"1px"});var n=Z(t,e);return{value:n,overrideFrom:i,transform:null==n||isNaN(n)?void 0:"scaleY(".concat(n,")")}}},x={duration:333,easing:"ease-in-out"},O=["left","top","width","height","opacity","color","background"],C=new WeakMap,_=function(t){function e(t){var i;if((0,a.Z)(this,e),(i=(0,l.Z)(this,e,[t])).t=null,i.i=null,i.o=!0,i.shouldLog=!1,t.type===f.pX.CHILD)throw Error("The `animate` directive must be used in attribute position.");return i.createFinished(),(0,h.Z)(i)}var i,v,b,Z;return(0,c.Z)(e,t),(0,u.Z)(e,[{key:"createFinished",value:function(){var t,e=this;null!==(t=this.resolveFinished)&&void 0!==t&&t.call(this),this.finished=new Promise((function(t){e.h=t}))}},{key:"resolveFinished",value:(Z=(0,o.Z)((0,r.Z)().mark((function t(){var e;return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:null!==(e=this.h)&&void 0!==e&&e.call(this),this.h=void 0;case 1:case"end":return t.stop()}}),t,this)}))),function(){return Z.apply(this,arguments)})},{key:"render",value:function(t){return d.Ld}},{key:"getController",value:function(){return p.get(this.l)}},{key:"isDisabled",value:function(){var t;return this.options.disabled||(null===(t=this.getController())||void 0===t?void 0:t.disabled)}},{key:"update",value:function(t,e){var i,n=(0,s.Z)(e,1)[0],r=void 0===this.l;return r&&(this.l=null===(i=t.options)||void 0===i?void 0:i.host,this.l.addController(this),this.element=t.element,C.set(this.element,this)),this.optionsOrCallback=n,(r||"function"!=typeof n)&&this.u(n),this.render(n)}},{key:"u",value:function(t){var e,i,n;t=null!==(e=t)&&void 0!==e?e:{};var s=this.getController();void 0!==s&&((t=Object.assign(Object.assign({},s.defaultOptions),t)).keyframeOptions=Object.assign(Object.assign({},s.defaultOptions.keyframeOptions),t.keyframeOptions)),null!==(n=(i=t).properties)&&void 0!==n||(i.properties=O),this.options=t}},{key:"p",value:function(){var t={},e=this.element.getBoundingClientRect(),i=getComputedStyle(this.element);return this.options.properties.forEach((function(n){var s,r=null!==(s=e[n])&&void 0!==s?s:w[n]?void 0:i[n],o=Number(r);t[n]=isNaN(o)?r+"":o})),t}},{key:"m",value:function(){var t,e=!0;return this.options.guard&&(e=function(t,e){if(Array.isArray(t)){if(Array.isArray(e)&&e.length===t.length&&t.every((function(t,i){return t===e[i]})))return!1}else if(e===t)return!1;return!0}(t=this.options.guard(),this.v)),this.o=this.l.hasUpdated&&!this.isDisabled()&&!this.isAnimating()&&e&&this.element.isConnected,this.o&&(this.v=Array.isArray(t)?Array.from(t):t),this.o}},{key:"hostUpdate",value:function(){var t;"function"==typeof this.optionsOrCallback&&this.u(this.optionsOrCallback()),this.m()&&(this.g=this.p(),this.t=null!==(t=this.t)&&void 0!==t?t:this.element.parentNode,this.i=this.element.nextSibling)}},{key:"hostUpdated",value:(b=(0,o.Z)((0,r.Z)().mark((function t(){var e,i,s,o,a,u,h,l,c,d,f;return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(this.o&&this.element.isConnected&&(!this.options.skipInitial||this.isHostRendered)){t.next=2;break}return t.abrupt("return");case 2:return this.prepare(),t.next=5,k;case 5:i=this._(),s=this.A(this.options.keyframeOptions,i),o=this.p(),void 0!==this.g?(a=this.O(this.g,o,i),u=a.from,h=a.to,this.log("measured",[this.g,o,u,h]),e=this.calculateKeyframes(u,h)):(l=y.get(this.options.inId))?(y.delete(this.options.inId),c=this.O(l,o,i),d=c.from,f=c.to,e=this.calculateKeyframes(d,f),e=this.options.in?[Object.assign(Object.assign({},this.options.in[0]),e[0])].concat((0,n.Z)(this.options.in.slice(1)),[e[1]]):e,m++,e.forEach((function(t){return t.zIndex=m}))):this.options.in&&(e=[].concat((0,n.Z)(this.options.in),[{}])),this.animate(e,s);case 8:case"end":return t.stop()}}),t,this)}))),function(){return b.apply(this,arguments)})},{key:"resetStyles",value:function(){var t;void 0!==this.j&&(this.element.setAttribute("style",null!==(t=this.j)&&void 0!==t?t:""),this.j=void 0)}},{key:"commitStyles",value:function(){var t,e;this.j=this.element.getAttribute("style"),null!==(t=this.webAnimation)&&void 0!==t&&t.commitStyles(),null===(e=this.webAnimation)||void 0===e||e.cancel()}},{key:"reconnected",value:function(){}},{key:"disconnected",value:(v=(0,o.Z)((0,r.Z)().mark((function t(){var e,i,n,s,o,a;return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(this.o){t.next=2;break}return t.abrupt("return");case 2:if(void 0!==this.options.id&&y.set(this.options.id,this.g),void 0!==this.options.out){t.next=4;break}return t.abrupt("return");case 4:return this.prepare(),t.next=7,k();case 7:if(null===(e=this.t)||void 0===e||!e.isConnected){t.next=10;break}i=this.i&&this.i.parentNode===this.t?this.i:null,this.t.insertBefore(this.element,i),this.options.stabilizeOut&&(n=this.p(),this.log("stabilizing out"),s=this.g.left-n.left,o=this.g.top-n.top,!("static"===getComputedStyle(this.element).position)||0===s&&0===o||(this.element.style.position="relative"),0!==s&&(this.element.style.left=s+"px"),0!==o&&(this.element.style.top=o+"px"));case 10:return a=this.A(this.options.keyframeOptions),t.next=13,this.animate(this.options.out,a);case 13:this.element.remove();case 14:case"end":return t.stop()}}),t,this)}))),function(){return v.apply(this,arguments)})},{key:"prepare",value:function(){this.createFinished()}},{key:"start",value:function(){var t,e;null===(t=(e=this.options).onStart)||void 0===t||t.call(e,this)}},{key:"didFinish",value:function(t){var e,i;t&&null!==(e=(i=this.options).onComplete)&&void 0!==e&&e.call(i,this),this.g=void 0,this.animatingProperties=void 0,this.frames=void 0,this.resolveFinished()}},{key:"_",value:function(){for(var t=[],e=this.element.parentNode;e;e=null===(i=e)||void 0===i?void 0:i.parentNode){var i,n=C.get(e);n&&!n.isDisabled()&&n&&t.push(n)}return t}},{key:"isHostRendered",get:function(){var t=this,e=g.has(this.l);return e||this.l.updateComplete.then((function(){g.add(t.l)})),e}},{key:"A",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._(),i=Object.assign({},x);return e.forEach((function(t){return Object.assign(i,t.options.keyframeOptions)})),Object.assign(i,t),i}},{key:"O",value:function(t,e,i){t=Object.assign({},t),e=Object.assign({},e);var n=i.map((function(t){return t.animatingProperties})).filter((function(t){return void 0!==t})),s=1,r=1;return void 0!==n&&(n.forEach((function(t){t.width&&(s/=t.width),t.height&&(r/=t.height)})),void 0!==t.left&&void 0!==e.left&&(t.left=s*t.left,e.left=s*e.left),void 0!==t.top&&void 0!==e.top&&(t.top=r*t.top,e.top=r*e.top)),{from:t,to:e}}},{key:"calculateKeyframes",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],n={},s={},r=!1,o={};for(var a in e){var u=t[a],h=e[a];if(a in w){var l,c=w[a];if(void 0===u||void 0===h)continue;var d=c(u,h);void 0!==d.transform&&(o[a]=d.value,r=!0,n.transform="".concat(null!==(l=n.transform)&&void 0!==l?l:""," ").concat(d.transform),void 0!==d.overrideFrom&&Object.assign(n,d.overrideFrom))}else u!==h&&void 0!==u&&void 0!==h&&(r=!0,n[a]=u,s[a]=h)}return n.transformOrigin=s.transformOrigin=i?"center center":"top left",this.animatingProperties=o,r?[n,s]:void 0}},{key:"animate",value:(i=(0,o.Z)((0,r.Z)().mark((function t(e){var i,n,s,o=arguments;return(0,r.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(i=o.length>1&&void 0!==o[1]?o[1]:this.options.keyframeOptions,this.start(),this.frames=e,n=!1,this.isAnimating()||this.isDisabled()||(this.options.onFrames&&(this.frames=e=this.options.onFrames(this),this.log("modified frames",e)),void 0===e)){t.next=15;break}return this.log("animate",[e,i]),n=!0,this.webAnimation=this.element.animate(e,i),null==(s=this.getController())||s.add(this),t.prev=7,t.next=10,this.webAnimation.finished;case 10:t.next=14;break;case 12:t.prev=12,t.t0=t.catch(7);case 14:null==s||s.remove(this);case 15:return t.abrupt("return",(this.didFinish(n),n));case 16:case"end":return t.stop()}}),t,this,[[7,12]])}))),function(t){return i.apply(this,arguments)})},{key:"isAnimating",value:function(){var t,e;return"running"===(null===(t=this.webAnimation)||void 0===t?void 0:t.playState)||(null===(e=this.webAnimation)||void 0===e?void 0:e.pending)}},{key:"log",value:function(t,e){this.shouldLog&&!this.isDisabled()&&console.log(t,this.options.id,e)}}]),e}(v.sR),A=(0,f.XM)(_),N=(i(40271),["top","right","bottom","left"]),j=function(t){function e(t){var i;if((0,a.Z)(this,e),i=(0,l.Z)(this,e,[t]),t.type!==f.pX.ELEMENT)throw Error("The `position` directive must be used in attribute position.");return(0,h.Z)(i)}return(0,c.Z)(e,t),(0,u.Z)(e,[{key:"render",value:function(t,e){return d.Ld}},{key:"update",value:function(t,e){var i,n=(0,s.Z)(e,2),r=n[0],o=n[1];return void 0===this.l&&(this.l=null===(i=t.options)||void 0===i?void 0:i.host,this.l.addController(this)),this.N=t.element,this.P=r,this.S=null!=o?o:["left","top","width","height"],this.render(r,o)}},{key:"hostUpdated",value:function(){this.C()}},{key:"C",value:function(){var t,e,i=this,n="function"==typeof this.P?this.P():null===(t=this.P)||void 0===t?void 0:t.value,s=n.offsetParent;if(void 0!==n&&s){var r=n.getBoundingClientRect(),o=s.getBoundingClientRect();null===(e=this.S)||void 0===e||e.forEach((function(t){var e=N.includes(t)?r[t]-o[t]:r[t];i.N.style[t]=e+"px"}))}}}]),e}(v.sR);(0,f.XM)(j)},99266:function(t,e,i){i.d(e,{r:function(){return v}});var n=i(62746),s=i(40039),r=i(71650),o=i(33368),a=i(95281),u=i(68308),h=i(69205),l=(i(51358),i(96043),i(46798),i(5239),i(98490),i(51467),i(32982)),c=i(16616),d=i(41005),f=function(t,e,i){for(var n=new Map,s=e;s<=i;s++)n.set(t[s],s);return n},v=(0,c.XM)(function(t){function e(t){var i;if((0,r.Z)(this,e),i=(0,u.Z)(this,e,[t]),t.type!==c.pX.CHILD)throw Error("repeat() can only be used in text expressions");return(0,a.Z)(i)}return(0,h.Z)(e,t),(0,o.Z)(e,[{key:"ct",value:function(t,e,i){var n;void 0===i?i=e:void 0!==e&&(n=e);var r,o=[],a=[],u=0,h=(0,s.Z)(t);try{for(h.s();!(r=h.n()).done;){var l=r.value;o[u]=n?n(l,u):u,a[u]=i(l,u),u++}}catch(c){h.e(c)}finally{h.f()}return{values:a,keys:o}}},{key:"render",value:function(t,e,i){return this.ct(t,e,i).values}},{key:"update",value:function(t,e){var i,s=(0,n.Z)(e,3),r=s[0],o=s[1],a=s[2],u=(0,d.i9)(t),h=this.ct(r,o,a),c=h.values,v=h.keys;if(!Array.isArray(u))return this.ut=v,c;for(var p,m,y=null!==(i=this.ut)&&void 0!==i?i:this.ut=[],g=[],k=0,b=u.length-1,Z=0,w=c.length-1;k<=b&&Z<=w;)if(null===u[k])k++;else if(null===u[b])b--;else if(y[k]===v[Z])g[Z]=(0,d.fk)(u[k],c[Z]),k++,Z++;else if(y[b]===v[w])g[w]=(0,d.fk)(u[b],c[w]),b--,w--;else if(y[k]===v[w])g[w]=(0,d.fk)(u[k],c[w]),(0,d._Y)(t,g[w+1],u[k]),k++,w--;else if(y[b]===v[Z])g[Z]=(0,d.fk)(u[b],c[Z]),(0,d._Y)(t,u[k],u[b]),b--,Z++;else if(void 0===p&&(p=f(v,Z,w),m=f(y,k,b)),p.has(y[k]))if(p.has(y[b])){var x=m.get(v[Z]),O=void 0!==x?u[x]:null;if(null===O){var C=(0,d._Y)(t,u[k]);(0,d.fk)(C,c[Z]),g[Z]=C}else g[Z]=(0,d.fk)(O,c[Z]),(0,d._Y)(t,u[k],O),u[x]=null;Z++}else(0,d.ws)(u[b]),b--;else(0,d.ws)(u[k]),k++;for(;Z<=w;){var _=(0,d._Y)(t,g[w+1]);(0,d.fk)(_,c[Z]),g[Z++]=_}for(;k<=b;){var A=u[k++];null!==A&&(0,d.ws)(A)}return this.ut=v,(0,d.hl)(t,g),l.Jb}}]),e}(c.Xe))}}]);
+//# sourceMappingURL=8249.Efu2xWzcbCk.js.map
\ No newline at end of file
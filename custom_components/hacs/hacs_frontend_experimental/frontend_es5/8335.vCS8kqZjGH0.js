@@ -0,0 +1,3 @@
+/*! For license information please see 8335.vCS8kqZjGH0.js.LICENSE.txt */
+(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8335],{91100:function(e,t,r){r(46798),r(94570),r(10999),r(52117),r(63789),r(82479),r(99397);var n=r(79668),u=r(48544);r(27301);function i(e){return null==e}function o(e){(e=function(e){var t={};for(var r in e)t[r]=e[r];return t}(e||{})).whiteList=e.whiteList||n.whiteList,e.onAttr=e.onAttr||n.onAttr,e.onIgnoreAttr=e.onIgnoreAttr||n.onIgnoreAttr,e.safeAttrValue=e.safeAttrValue||n.safeAttrValue,this.options=e}o.prototype.process=function(e){if(!(e=(e=e||"").toString()))return"";var t=this.options,r=t.whiteList,n=t.onAttr,o=t.onIgnoreAttr,a=t.safeAttrValue;return u(e,(function(e,t,u,s,l){var c=r[u],f=!1;if(!0===c?f=c:"function"==typeof c?f=c(s):c instanceof RegExp&&(f=c.test(s)),!0!==f&&(f=!1),s=a(u,s)){var h,p={position:t,sourcePosition:e,source:l,isWhite:f};return f?i(h=n(u,s,p))?u+":"+s:h:i(h=o(u,s,p))?void 0:h}}))},e.exports=o},79668:function(e,t,r){function n(){var e={"align-content":!1,"align-items":!1,"align-self":!1,"alignment-adjust":!1,"alignment-baseline":!1,all:!1,"anchor-point":!1,animation:!1,"animation-delay":!1,"animation-direction":!1,"animation-duration":!1,"animation-fill-mode":!1,"animation-iteration-count":!1,"animation-name":!1,"animation-play-state":!1,"animation-timing-function":!1,azimuth:!1,"backface-visibility":!1,background:!0,"background-attachment":!0,"background-clip":!0,"background-color":!0,"background-image":!0,"background-origin":!0,"background-position":!0,"background-repeat":!0,"background-size":!0,"baseline-shift":!1,binding:!1,bleed:!1,"bookmark-label":!1,"bookmark-level":!1,"bookmark-state":!1,border:!0,"border-bottom":!0,"border-bottom-color":!0,"border-bottom-left-radius":!0,"border-bottom-right-radius":!0,"border-bottom-style":!0,"border-bottom-width":!0,"border-collapse":!0,"border-color":!0,"border-image":!0,"border-image-outset":!0,"border-image-repeat":!0,"border-image-slice":!0,"border-image-source":!0,"border-image-width":!0,"border-left":!0,"border-left-color":!0,"border-left-style":!0,"border-left-width":!0,"border-radius":!0,"border-right":!0,"border-right-color":!0,"border-right-style":!0,"border-right-width":!0,"border-spacing":!0,"border-style":!0,"border-top":!0,"border-top-color":!0,"border-top-left-radius":!0,"border-top-right-radius":!0,"border-top-style":!0,"border-top-width":!0,"border-width":!0,bottom:!1,"box-decoration-break":!0,"box-shadow":!0,"box-sizing":!0,"box-snap":!0,"box-suppress":!0,"break-after":!0,"break-before":!0,"break-inside":!0,"caption-side":!1,chains:!1,clear:!0,clip:!1,"clip-path":!1,"clip-rule":!1,color:!0,"color-interpolation-filters":!0,"column-count":!1,"column-fill":!1,"column-gap":!1,"column-rule":!1,"column-rule-color":!1,"column-rule-style":!1,"column-rule-width":!1,"column-span":!1,"column-width":!1,columns:!1,contain:!1,content:!1,"counter-increment":!1,"counter-reset":!1,"counter-set":!1,crop:!1,cue:!1,"cue-after":!1,"cue-before":!1,cursor:!1,direction:!1,display:!0,"display-inside":!0,"display-list":!0,"display-outside":!0,"dominant-baseline":!1,elevation:!1,"empty-cells":!1,filter:!1,flex:!1,"flex-basis":!1,"flex-direction":!1,"flex-flow":!1,"flex-grow":!1,"flex-shrink":!1,"flex-wrap":!1,float:!1,"float-offset":!1,"flood-color":!1,"flood-opacity":!1,"flow-from":!1,"flow-into":!1,font:!0,"font-family":!0,"font-feature-settings":!0,"font-kerning":!0,"font-language-override":!0,"font-size":!0,"font-size-adjust":!0,"font-stretch":!0,"font-style":!0,"font-synthesis":!0,"font-variant":!0,"font-variant-alternates":!0,"font-variant-caps":!0,"font-variant-east-asian":!0,"font-variant-ligatures":!0,"font-variant-numeric":!0,"font-variant-position":!0,"font-weight":!0,grid:!1,"grid-area":!1,"grid-auto-columns":!1,"grid-auto-flow":!1,"grid-auto-rows":!1,"grid-column":!1,"grid-column-end":!1,"grid-column-start":!1,"grid-row":!1,"grid-row-end":!1,"grid-row-start":!1,"grid-template":!1,"grid-template-areas":!1,"grid-template-columns":!1,"grid-template-rows":!1,"hanging-punctuation":!1,height:!0,hyphens:!1,icon:!1,"image-orientation":!1,"image-resolution":!1,"ime-mode":!1,"initial-letters":!1,"inline-box-align":!1,"justify-content":!1,"justify-items":!1,"justify-self":!1,left:!1,"letter-spacing":!0,"lighting-color":!0,"line-box-contain":!1,"line-break":!1,"line-grid":!1,"line-height":!1,"line-snap":!1,"line-stacking":!1,"line-stacking-ruby":!1,"line-stacking-shift":!1,"line-stacking-strategy":!1,"list-style":!0,"list-style-image":!0,"list-style-position":!0,"list-style-type":!0,margin:!0,"margin-bottom":!0,"margin-left":!0,"margin-right":!0,"margin-top":!0,"marker-offset":!1,"marker-side":!1,marks:!1,mask:!1,"mask-box":!1,"mask-box-outset":!1,"mask-box-repeat":!1,"mask-box-slice":!1,"mask-box-source":!1,"mask-box-width":!1,"mask-clip":!1,"mask-image":!1,"mask-origin":!1,"mask-position":!1,"mask-repeat":!1,"mask-size":!1,"mask-source-type":!1,"mask-type":!1,"max-height":!0,"max-lines":!1,"max-width":!0,"min-height":!0,"min-width":!0,"move-to":!1,"nav-down":!1,"nav-index":!1,"nav-left":!1,"nav-right":!1,"nav-up":!1,"object-fit":!1,"object-position":!1,opacity:!1,order:!1,orphans:!1,outline:!1,"outline-color":!1,"outline-offset":!1,"outline-style":!1,"outline-width":!1,overflow:!1,"overflow-wrap":!1,"overflow-x":!1,"overflow-y":!1,padding:!0,"padding-bottom":!0,"padding-left":!0,"padding-right":!0,"padding-top":!0,page:!1,"page-break-after":!1,"page-break-before":!1,"page-break-inside":!1,"page-policy":!1,pause:!1,"pause-after":!1,"pause-before":!1,perspective:!1,"perspective-origin":!1,pitch:!1,"pitch-range":!1,"play-during":!1,position:!1,"presentation-level":!1,quotes:!1,"region-fragment":!1,resize:!1,rest:!1,"rest-after":!1,"rest-before":!1,richness:!1,right:!1,rotation:!1,"rotation-point":!1,"ruby-align":!1,"ruby-merge":!1,"ruby-position":!1,"shape-image-threshold":!1,"shape-outside":!1,"shape-margin":!1,size:!1,speak:!1,"speak-as":!1,"speak-header":!1,"speak-numeral":!1,"speak-punctuation":!1,"speech-rate":!1,stress:!1,"string-set":!1,"tab-size":!1,"table-layout":!1,"text-align":!0,"text-align-last":!0,"text-combine-upright":!0,"text-decoration":!0,"text-decoration-color":!0,"text-decoration-line":!0,"text-decoration-skip":!0,"text-decoration-style":!0,"text-emphasis":!0,"text-emphasis-color":!0,"text-emphasis-position":!0,"text-emphasis-style":!0,"text-height":!0,"text-indent":!0,"text-justify":!0,"text-orientation":!0,"text-overflow":!0,"text-shadow":!0,"text-space-collapse":!0,"text-transform":!0,"text-underline-position":!0,"text-wrap":!0,top:!1,transform:!1,"transform-origin":!1,"transform-style":!1,transition:!1,"transition-delay":!1,"transition-duration":!1,"transition-property":!1,"transition-timing-function":!1,"unicode-bidi":!1,"vertical-align":!1,visibility:!1,"voice-balance":!1,"voice-duration":!1,"voice-family":!1,"voice-pitch":!1,"voice-range":!1,"voice-rate":!1,"voice-stress":!1,"voice-volume":!1,volume:!1,"white-space":!1,widows:!1,width:!0,"will-change":!1,"word-break":!0,"word-spacing":!0,"word-wrap":!0,"wrap-flow":!1,"wrap-through":!1,"writing-mode":!1,"z-index":!1};return e}r(46798),r(63789),r(99397);var u=/javascript\s*\:/gim;t.whiteList=n(),t.getDefaultWhiteList=n,t.onAttr=function(e,t,r){},t.onIgnoreAttr=function(e,t,r){},t.safeAttrValue=function(e,t){return u.test(t)?"":t}},8300:function(e,t,r){var n=r(79668),u=r(91100);for(var i in(t=e.exports=function(e,t){return new u(t).process(e)}).FilterCSS=u,n)t[i]=n[i];"undefined"!=typeof window&&(window.filterCSS=e.exports)},48544:function(e,t,r){r(62544),r(11451),r(17692),r(56308);var n=r(27301);e.exports=function(e,t){";"!==(e=n.trimRight(e))[e.length-1]&&(e+=";");var r=e.length,u=!1,i=0,o=0,a="";function s(){if(!u){var r=n.trim(e.slice(i,o)),s=r.indexOf(":");if(-1!==s){var l=n.trim(r.slice(0,s)),c=n.trim(r.slice(s+1));if(l){var f=t(i,a.length,l,c,r);f&&(a+=f+"; ")}}}i=o+1}for(;o<r;o++){var l=e[o];if("/"===l&&"*"===e[o+1]){var c=e.indexOf("*/",o+2);if(-1===c)break;i=(o=c+1)+1,u=!1}else"("===l?u=!0:")"===l?u=!1:";"===l?u||s():"\n"===l&&s()}return n.trim(a)}},27301:function(e,t,r){r(56308),r(46798),r(9849),r(50289),r(94167),r(11451),r(63789),r(24074),r(62544),e.exports={indexOf:function(e,t){var r,n;if(Array.prototype.indexOf)return e.indexOf(t);for(r=0,n=e.length;r<n;r++)if(e[r]===t)return r;return-1},forEach:function(e,t,r){var n,u;if(Array.prototype.forEach)return e.forEach(t,r);for(n=0,u=e.length;n<u;n++)t.call(r,e[n],n,e)},trim:function(e){return String.prototype.trim?e.trim():e.replace(/(^\s*)|(\s*$)/g,"")},trimRight:function(e){return String.prototype.trimRight?e.trimRight():e.replace(/(\s*$)/g,"")}}},60841:function(e,t,r){r(63789),r(24074),r(11451),r(99397),r(27392),r(56308),r(36513),r(46798),r(9849),r(50289),r(94167),r(17692),r(87438),r(22890),r(91989);var n=r(8300).FilterCSS,u=r(8300).getDefaultWhiteList,i=r(58511);function o(){return{a:["target","href","title"],abbr:["title"],address:[],area:["shape","coords","href","alt"],article:[],aside:[],audio:["autoplay","controls","crossorigin","loop","muted","preload","src"],b:[],bdi:["dir"],bdo:["dir"],big:[],blockquote:["cite"],br:[],caption:[],center:[],cite:[],code:[],col:["align","valign","span","width"],colgroup:["align","valign","span","width"],dd:[],del:["datetime"],details:["open"],div:[],dl:[],dt:[],em:[],figcaption:[],figure:[],font:["color","size","face"],footer:[],h1:[],h2:[],h3:[],h4:[],h5:[],h6:[],header:[],hr:[],i:[],img:["src","alt","title","width","height"],ins:["datetime"],li:[],mark:[],nav:[],ol:[],p:[],pre:[],s:[],section:[],small:[],span:[],sub:[],summary:[],sup:[],strong:[],strike:[],table:["width","border","align","valign"],tbody:["align","valign"],td:["width","rowspan","colspan","align","valign"],tfoot:["align","valign"],th:["width","rowspan","colspan","align","valign"],thead:["align","valign"],tr:["rowspan","align","valign"],tt:[],u:[],ul:[],video:["autoplay","controls","crossorigin","loop","muted","playsinline","poster","preload","src","height","width"]}}var a=new n;function s(e){return e.replace(l,"&lt;").replace(c,"&gt;")}var l=/</g,c=/>/g,f=/"/g,h=/&quot;/g,p=/&#([a-zA-Z0-9]*);?/gim,D=/&colon;?/gim,g=/&newline;?/gim,d=/((j\s*a\s*v\s*a|v\s*b|l\s*i\s*v\s*e)\s*s\s*c\s*r\s*i\s*p\s*t\s*|m\s*o\s*c\s*h\s*a):/gi,v=/e\s*x\s*p\s*r\s*e\s*s\s*s\s*i\s*o\s*n\s*\(.*/gi,k=/u\s*r\s*l\s*\(.*/gi;function x(e){return e.replace(f,"&quot;")}function m(e){return e.replace(h,'"')}function F(e){return e.replace(p,(function(e,t){return"x"===t[0]||"X"===t[0]?String.fromCharCode(parseInt(t.substr(1),16)):String.fromCharCode(parseInt(t,10))}))}function A(e){return e.replace(D,":").replace(g," ")}function y(e){for(var t="",r=0,n=e.length;r<n;r++)t+=e.charCodeAt(r)<32?" ":e.charAt(r);return i.trim(t)}function b(e){return e=y(e=A(e=F(e=m(e))))}function E(e){return e=s(e=x(e))}t.whiteList={a:["target","href","title"],abbr:["title"],address:[],area:["shape","coords","href","alt"],article:[],aside:[],audio:["autoplay","controls","crossorigin","loop","muted","preload","src"],b:[],bdi:["dir"],bdo:["dir"],big:[],blockquote:["cite"],br:[],caption:[],center:[],cite:[],code:[],col:["align","valign","span","width"],colgroup:["align","valign","span","width"],dd:[],del:["datetime"],details:["open"],div:[],dl:[],dt:[],em:[],figcaption:[],figure:[],font:["color","size","face"],footer:[],h1:[],h2:[],h3:[],h4:[],h5:[],h6:[],header:[],hr:[],i:[],img:["src","alt","title","width","height"],ins:["datetime"],li:[],mark:[],nav:[],ol:[],p:[],pre:[],s:[],section:[],small:[],span:[],sub:[],summary:[],sup:[],strong:[],strike:[],table:["width","border","align","valign"],tbody:["align","valign"],td:["width","rowspan","colspan","align","valign"],tfoot:["align","valign"],th:["width","rowspan","colspan","align","valign"],thead:["align","valign"],tr:["rowspan","align","valign"],tt:[],u:[],ul:[],video:["autoplay","controls","crossorigin","loop","muted","playsinline","poster","preload","src","height","width"]},t.getDefaultWhiteList=o,t.onTag=function(e,t,r){},t.onIgnoreTag=function(e,t,r){},t.onTagAttr=function(e,t,r){},t.onIgnoreTagAttr=function(e,t,r){},t.safeAttrValue=function(e,t,r,n){if(r=b(r),"href"===t||"src"===t){if("#"===(r=i.trim(r)))return"#";if("http://"!==r.substr(0,7)&&"https://"!==r.substr(0,8)&&"mailto:"!==r.substr(0,7)&&"tel:"!==r.substr(0,4)&&"data:image/"!==r.substr(0,11)&&"ftp://"!==r.substr(0,6)&&"./"!==r.substr(0,2)&&"../"!==r.substr(0,3)&&"#"!==r[0]&&"/"!==r[0])return""}else if("background"===t){if(d.lastIndex=0,d.test(r))return""}else if("style"===t){if(v.lastIndex=0,v.test(r))return"";if(k.lastIndex=0,k.test(r)&&(d.lastIndex=0,d.test(r)))return"";!1!==n&&(r=(n=n||a).process(r))}return r=E(r)},t.escapeHtml=s,t.escapeQuote=x,t.unescapeQuote=m,t.escapeHtmlEntities=F,t.escapeDangerHtml5Entities=A,t.clearNonPrintableCharacter=y,t.friendlyAttrValue=b,t.escapeAttrValue=E,t.onIgnoreTagStripAll=function(){return""},t.StripTagBody=function(e,t){"function"!=typeof t&&(t=function(){});var r=!Array.isArray(e),n=[],u=!1;return{onIgnoreTag:function(o,a,s){if(function(t){return!!r||-1!==i.indexOf(e,t)}(o)){if(s.isClosing){var l="[/removed]",c=s.position+10;return n.push([!1!==u?u:s.position,c]),u=!1,l}return u||(u=s.position),"[removed]"}return t(o,a,s)},remove:function(e){var t="",r=0;return i.forEach(n,(function(n){t+=e.slice(r,n[0]),r=n[1]})),t+=e.slice(r)}}},t.stripCommentTag=function(e){for(var t="",r=0;r<e.length;){var n=e.indexOf("\x3c!--",r);if(-1===n){t+=e.slice(r);break}t+=e.slice(r,n);var u=e.indexOf("--\x3e",n);if(-1===u)break;r=u+3}return t},t.stripBlankChar=function(e){var t=e.split("");return(t=t.filter((function(e){var t=e.charCodeAt(0);return 127!==t&&(!(t<=31)||(10===t||13===t))}))).join("")},t.cssFilter=a,t.getDefaultCSSWhiteList=u},62173:function(e,t,r){r(91584);var n=r(60841),u=r(79542),i=r(61585);function o(e,t){return new i(t).process(e)}(t=e.exports=o).filterXSS=o,t.FilterXSS=i,function(){for(var e in n)t[e]=n[e];for(var r in u)t[r]=u[r]}(),"undefined"!=typeof window&&(window.filterXSS=e.exports),"undefined"!=typeof self&&"undefined"!=typeof DedicatedWorkerGlobalScope&&self instanceof DedicatedWorkerGlobalScope&&(self.filterXSS=e.exports)},79542:function(e,t,r){r(17692),r(11451),r(63789),r(24074),r(36513),r(56308),r(99397),r(91989);var n=r(58511);function u(e){var t,r=n.spaceIndex(e);return t=-1===r?e.slice(1,-1):e.slice(1,r+1),"/"===(t=n.trim(t).toLowerCase()).slice(0,1)&&(t=t.slice(1)),"/"===t.slice(-1)&&(t=t.slice(0,-1)),t}function i(e){return"</"===e.slice(0,2)}var o=/[^a-zA-Z0-9\\_:.-]/gim;function a(e,t){for(;t<e.length;t++){var r=e[t];if(" "!==r)return"="===r?t:-1}}function s(e,t){for(;t<e.length;t++){var r=e[t];if(" "!==r)return"'"===r||'"'===r?t:-1}}function l(e,t){for(;t>0;t--){var r=e[t];if(" "!==r)return"="===r?t:-1}}function c(e){return function(e){return'"'===e[0]&&'"'===e[e.length-1]||"'"===e[0]&&"'"===e[e.length-1]}(e)?e.substr(1,e.length-2):e}t.parseTag=function(e,t,r){"use strict";var n="",o=0,a=!1,s=!1,l=0,c=e.length,f="",h="";e:for(l=0;l<c;l++){var p=e.charAt(l);if(!1===a){if("<"===p){a=l;continue}}else if(!1===s){if("<"===p){n+=r(e.slice(o,l)),a=l,o=l;continue}if(">"===p||l===c-1){n+=r(e.slice(o,a)),f=u(h=e.slice(a,l+1)),n+=t(a,n.length,f,h,i(h)),o=l+1,a=!1;continue}if('"'===p||"'"===p)for(var D=1,g=e.charAt(l-D);""===g.trim()||"="===g;){if("="===g){s=p;continue e}g=e.charAt(l-++D)}}else if(p===s){s=!1;continue}}return o<c&&(n+=r(e.substr(o))),n},t.parseAttr=function(e,t){"use strict";var r=0,u=0,i=[],f=!1,h=e.length;function p(e,r){if(!((e=(e=n.trim(e)).replace(o,"").toLowerCase()).length<1)){var u=t(e,r||"");u&&i.push(u)}}for(var D=0;D<h;D++){var g,d=e.charAt(D);if(!1!==f||"="!==d)if(!1===f||D!==u)if(/\s|\n|\t/.test(d)){if(e=e.replace(/\s|\n|\t/g," "),!1===f){if(-1===(g=a(e,D))){p(n.trim(e.slice(r,D))),f=!1,r=D+1;continue}D=g-1;continue}if(-1===(g=l(e,D-1))){p(f,c(n.trim(e.slice(r,D)))),f=!1,r=D+1;continue}}else;else{if(-1===(g=e.indexOf(d,D+1)))break;p(f,n.trim(e.slice(u+1,g))),f=!1,r=(D=g)+1}else f=e.slice(r,D),r=D+1,u='"'===e.charAt(r)||"'"===e.charAt(r)?r:s(e,D+1)}return r<e.length&&(!1===f?p(e.slice(r)):p(f,c(n.trim(e.slice(r))))),n.trim(i.join(" "))}},58511:function(e,t,r){r(56308),r(46798),r(9849),r(50289),r(94167),r(11451),r(63789),r(24074),e.exports={indexOf:function(e,t){var r,n;if(Array.prototype.indexOf)return e.indexOf(t);for(r=0,n=e.length;r<n;r++)if(e[r]===t)return r;return-1},forEach:function(e,t,r){var n,u;if(Array.prototype.forEach)return e.forEach(t,r);for(n=0,u=e.length;n<u;n++)t.call(r,e[n],n,e)},trim:function(e){return String.prototype.trim?e.trim():e.replace(/(^\s*)|(\s*$)/g,"")},spaceIndex:function(e){var t=/\s|\n|\t/.exec(e);return t?t.index:-1}}},61585:function(e,t,r){r(11451),r(17692),r(46349),r(70320),r(46798),r(94570),r(56308);var n=r(8300).FilterCSS,u=r(60841),i=r(79542),o=i.parseTag,a=i.parseAttr,s=r(58511);function l(e){return null==e}function c(e){(e=function(e){var t={};for(var r in e)t[r]=e[r];return t}(e||{})).stripIgnoreTag&&(e.onIgnoreTag&&console.error('Notes: cannot use these two options "stripIgnoreTag" and "onIgnoreTag" at the same time'),e.onIgnoreTag=u.onIgnoreTagStripAll),e.whiteList||e.allowList?e.whiteList=function(e){var t={};for(var r in e)Array.isArray(e[r])?t[r.toLowerCase()]=e[r].map((function(e){return e.toLowerCase()})):t[r.toLowerCase()]=e[r];return t}(e.whiteList||e.allowList):e.whiteList=u.whiteList,e.onTag=e.onTag||u.onTag,e.onTagAttr=e.onTagAttr||u.onTagAttr,e.onIgnoreTag=e.onIgnoreTag||u.onIgnoreTag,e.onIgnoreTagAttr=e.onIgnoreTagAttr||u.onIgnoreTagAttr,e.safeAttrValue=e.safeAttrValue||u.safeAttrValue,e.escapeHtml=e.escapeHtml||u.escapeHtml,this.options=e,!1===e.css?this.cssFilter=!1:(e.css=e.css||{},this.cssFilter=new n(e.css))}c.prototype.process=function(e){if(!(e=(e=e||"").toString()))return"";var t=this.options,r=t.whiteList,n=t.onTag,i=t.onIgnoreTag,c=t.onTagAttr,f=t.onIgnoreTagAttr,h=t.safeAttrValue,p=t.escapeHtml,D=this.cssFilter;t.stripBlankChar&&(e=u.stripBlankChar(e)),t.allowCommentTag||(e=u.stripCommentTag(e));var g=!1;t.stripIgnoreTagBody&&(g=u.StripTagBody(t.stripIgnoreTagBody,i),i=g.onIgnoreTag);var d=o(e,(function(e,t,u,o,g){var d={sourcePosition:e,position:t,isClosing:g,isWhite:Object.prototype.hasOwnProperty.call(r,u)},v=n(u,o,d);if(!l(v))return v;if(d.isWhite){if(d.isClosing)return"</"+u+">";var k=function(e){var t=s.spaceIndex(e);if(-1===t)return{html:"",closing:"/"===e[e.length-2]};var r="/"===(e=s.trim(e.slice(t+1,-1)))[e.length-1];return r&&(e=s.trim(e.slice(0,-1))),{html:e,closing:r}}(o),x=r[u],m=a(k.html,(function(e,t){var r=-1!==s.indexOf(x,e),n=c(u,e,t,r);return l(n)?r?(t=h(u,e,t,D))?e+'="'+t+'"':e:l(n=f(u,e,t,r))?void 0:n:n}));return o="<"+u,m&&(o+=" "+m),k.closing&&(o+=" /"),o+=">"}return l(v=i(u,o,d))?p(o):v}),p);return g&&(d=g.remove(d)),d},e.exports=c},75147:function(e,t,r){"use strict";var n=r(3569).has;e.exports=function(e){return n(e),e}},18513:function(e,t,r){"use strict";var n=r(47512).charAt;e.exports=function(e,t,r){return t+(r?n(e,t).length:1)}},6057:function(e,t,r){"use strict";var n=r(35449),u=r(17460),i=r(97673),o=r(10228),a=r(54053),s=Math.min,l=[].lastIndexOf,c=!!l&&1/[1].lastIndexOf(1,-0)<0,f=a("lastIndexOf"),h=c||!f;e.exports=h?function(e){if(c)return n(l,this,arguments)||0;var t=u(this),r=o(t),a=r-1;for(arguments.length>1&&(a=s(a,i(arguments[1]))),a<0&&(a=r+a);a>=0;a--)if(a in t&&t[a]===e)return a||0;return-1}:l},14265:function(e,t,r){"use strict";var n=r(55418),u=r(43313),i=r(11336),o=/"/g,a=n("".replace);e.exports=function(e,t,r,n){var s=i(u(e)),l="<"+t;return""!==r&&(l+=" "+r+'="'+a(i(n),o,"&quot;")+'"'),l+">"+s+"</"+t+">"}},37374:function(e,t,r){"use strict";r(63789);var n=r(74734),u=r(73936),i=r(45648),o=r(18431),a=r(10282),s=r(52838),l=a("species"),c=RegExp.prototype;e.exports=function(e,t,r,f){var h=a(e),p=!o((function(){var t={};return t[h]=function(){return 7},7!==""[e](t)})),D=p&&!o((function(){var t=!1,r=/a/;return"split"===e&&((r={}).constructor={},r.constructor[l]=function(){return r},r.flags="",r[h]=/./[h]),r.exec=function(){return t=!0,null},r[h](""),!t}));if(!p||!D||r){var g=n(/./[h]),d=t(h,""[e],(function(e,t,r,u,o){var a=n(e),s=t.exec;return s===i||s===c.exec?p&&!o?{done:!0,value:g(t,r,u)}:{done:!0,value:a(r,t,u)}:{done:!1}}));u(String.prototype,e,d[0]),u(c,h,d[1])}f&&s(c[h],"sham",!0)}},70684:function(e,t,r){"use strict";var n=r(9160),u=r(22933),i=r(43173),o=r(97673),a=r(73177),s="Invalid size",l=RangeError,c=TypeError,f=Math.max,h=function(e,t){this.set=e,this.size=f(t,0),this.has=n(e.has),this.keys=n(e.keys)};h.prototype={getIterator:function(){return a(u(i(this.keys,this.set)))},includes:function(e){return i(this.has,this.set,e)}},e.exports=function(e){u(e);var t=+e.size;if(t!=t)throw new c(s);var r=o(t);if(r<0)throw new l(s);return new h(e,r)}},17107:function(e,t,r){"use strict";var n=r(55418),u=r(19480),i=Math.floor,o=n("".charAt),a=n("".replace),s=n("".slice),l=/\$([$&'`]|\d{1,2}|<[^>]*>)/g,c=/\$([$&'`]|\d{1,2})/g;e.exports=function(e,t,r,n,f,h){var p=r+e.length,D=n.length,g=c;return void 0!==f&&(f=u(f),g=l),a(h,g,(function(u,a){var l;switch(o(a,0)){case"$":return"$";case"&":return e;case"`":return s(t,0,r);case"'":return s(t,p);case"<":l=f[s(a,1,-1)];break;default:var c=+a;if(0===c)return u;if(c>D){var h=i(c/10);return 0===h?u:h<=D?void 0===n[h-1]?o(a,1):n[h-1]+o(a,1):u}l=n[c-1]}return void 0===l?"":l}))}},61651:function(e,t,r){"use strict";var n=r(43173);e.exports=function(e,t,r){for(var u,i,o=r?e:e.iterator,a=e.next;!(u=n(a,o)).done;)if(void 0!==(i=t(u.value)))return i}},79058:function(e,t,r){"use strict";var n=r(5813),u=r(18431),i=r(55418),o=r(11336),a=r(55370).trim,s=r(92743),l=n.parseInt,c=n.Symbol,f=c&&c.iterator,h=/^[+-]?0x/i,p=i(h.exec),D=8!==l(s+"08")||22!==l(s+"0x16")||f&&!u((function(){l(Object(f))}));e.exports=D?function(e,t){var r=a(o(e));return l(r,t>>>0||(p(h,r)?16:10))}:l},60771:function(e,t){"use strict";var r={}.propertyIsEnumerable,n=Object.getOwnPropertyDescriptor,u=n&&!r.call({1:2},1);t.f=u?function(e){var t=n(this,e);return!!t&&t.enumerable}:r},94448:function(e,t,r){"use strict";var n=r(43173),u=r(22933),i=r(30553),o=r(42458),a=r(45648),s=TypeError;e.exports=function(e,t){var r=e.exec;if(i(r)){var l=n(r,e,t);return null!==l&&u(l),l}if("RegExp"===o(e))return n(a,e,t);throw new s("RegExp#exec called on incompatible receiver")}},93577:function(e){"use strict";e.exports=Object.is||function(e,t){return e===t?0!==e||1/e==1/t:e!=e&&t!=t}},44640:function(e,t,r){"use strict";var n=r(3569),u=r(15690),i=n.Set,o=n.add;e.exports=function(e){var t=new i;return u(e,(function(e){o(t,e)})),t}},74331:function(e,t,r){"use strict";var n=r(75147),u=r(3569),i=r(44640),o=r(85725),a=r(70684),s=r(15690),l=r(61651),c=u.has,f=u.remove;e.exports=function(e){var t=n(this),r=a(e),u=i(t);return o(t)<=r.size?s(t,(function(e){r.includes(e)&&f(u,e)})):l(r.getIterator(),(function(e){c(t,e)&&f(u,e)})),u}},3569:function(e,t,r){"use strict";var n=r(55418),u=Set.prototype;e.exports={Set:Set,add:n(u.add),has:n(u.has),remove:n(u.delete),proto:u}},52863:function(e,t,r){"use strict";var n=r(75147),u=r(3569),i=r(85725),o=r(70684),a=r(15690),s=r(61651),l=u.Set,c=u.add,f=u.has;e.exports=function(e){var t=n(this),r=o(e),u=new l;return i(t)>r.size?s(r.getIterator(),(function(e){f(t,e)&&c(u,e)})):a(t,(function(e){r.includes(e)&&c(u,e)})),u}},74635:function(e,t,r){"use strict";var n=r(75147),u=r(3569).has,i=r(85725),o=r(70684),a=r(15690),s=r(61651),l=r(56208);e.exports=function(e){var t=n(this),r=o(e);if(i(t)<=r.size)return!1!==a(t,(function(e){if(r.includes(e))return!1}),!0);var c=r.getIterator();return!1!==s(c,(function(e){if(u(t,e))return l(c,"normal",!1)}))}},67511:function(e,t,r){"use strict";var n=r(75147),u=r(85725),i=r(15690),o=r(70684);e.exports=function(e){var t=n(this),r=o(e);return!(u(t)>r.size)&&!1!==i(t,(function(e){if(!r.includes(e))return!1}),!0)}},61757:function(e,t,r){"use strict";var n=r(75147),u=r(3569).has,i=r(85725),o=r(70684),a=r(61651),s=r(56208);e.exports=function(e){var t=n(this),r=o(e);if(i(t)<r.size)return!1;var l=r.getIterator();return!1!==a(l,(function(e){if(!u(t,e))return s(l,"normal",!1)}))}},15690:function(e,t,r){"use strict";var n=r(55418),u=r(61651),i=r(3569),o=i.Set,a=i.proto,s=n(a.forEach),l=n(a.keys),c=l(new o).next;e.exports=function(e,t,r){return r?u({iterator:l(e),next:c},t):s(e,t)}},19268:function(e,t,r){"use strict";var n=r(29694),u=function(e){return{size:e,has:function(){return!1},keys:function(){return{next:function(){return{done:!0}}}}}};e.exports=function(e){var t=n("Set");try{(new t)[e](u(0));try{return(new t)[e](u(-1)),!1}catch(r){return!0}}catch(i){return!1}}},85725:function(e,t,r){"use strict";var n=r(9881),u=r(3569);e.exports=n(u.proto,"size","get")||function(e){return e.size}},26832:function(e,t,r){"use strict";var n=r(75147),u=r(3569),i=r(44640),o=r(70684),a=r(61651),s=u.add,l=u.has,c=u.remove;e.exports=function(e){var t=n(this),r=o(e).getIterator(),u=i(t);return a(r,(function(e){l(t,e)?c(u,e):s(u,e)})),u}},65053:function(e,t,r){"use strict";var n=r(75147),u=r(3569).add,i=r(44640),o=r(70684),a=r(61651);e.exports=function(e){var t=n(this),r=o(e).getIterator(),s=i(t);return a(r,(function(e){u(s,e)})),s}},24089:function(e,t,r){"use strict";var n=r(18431);e.exports=function(e){return n((function(){var t=""[e]('"');return t!==t.toLowerCase()||t.split('"').length>3}))}},93892:function(e,t,r){"use strict";var n=r(97673),u=r(11336),i=r(43313),o=RangeError;e.exports=function(e){var t=u(i(this)),r="",a=n(e);if(a<0||a===1/0)throw new o("Wrong number of repetitions");for(;a>0;(a>>>=1)&&(t+=t))1&a&&(r+=t);return r}},30556:function(e,t,r){"use strict";var n=r(55370).end,u=r(82650);e.exports=u("trimEnd")?function(){return n(this)}:"".trimEnd},82650:function(e,t,r){"use strict";var n=r(83875).PROPER,u=r(18431),i=r(92743);e.exports=function(e){return u((function(){return!!i[e]()||"​᠎"!=="​᠎"[e]()||n&&i[e].name!==e}))}},96868:function(e,t,r){"use strict";var n=r(55370).start,u=r(82650);e.exports=u("trimStart")?function(){return n(this)}:"".trimStart},87438:function(e,t,r){"use strict";var n=r(68077),u=r(78856).filter;n({target:"Array",proto:!0,forced:!r(817)("filter")},{filter:function(e){return u(this,e,arguments.length>1?arguments[1]:void 0)}})},56308:function(e,t,r){"use strict";var n=r(68077),u=r(74734),i=r(92460).indexOf,o=r(54053),a=u([].indexOf),s=!!a&&1/a([1],1,-0)<0;n({target:"Array",proto:!0,forced:s||!o("indexOf")},{indexOf:function(e){var t=arguments.length>1?arguments[1]:void 0;return s?a(this,e,t)||0:i(this,e,t)}})},91989:function(e,t,r){"use strict";var n=r(68077),u=r(55418),i=r(70814),o=r(17460),a=r(54053),s=u([].join);n({target:"Array",proto:!0,forced:i!==Object||!a("join",",")},{join:function(e){return s(o(this),void 0===e?",":e)}})},26349:function(e,t,r){"use strict";var n=r(68077),u=r(6057);n({target:"Array",proto:!0,forced:u!==[].lastIndexOf},{lastIndexOf:u})},46349:function(e,t,r){"use strict";var n=r(68077),u=r(78856).map;n({target:"Array",proto:!0,forced:!r(817)("map")},{map:function(e){return u(this,e,arguments.length>1?arguments[1]:void 0)}})},36513:function(e,t,r){"use strict";var n=r(68077),u=r(19480),i=r(10228),o=r(1991),a=r(54108);n({target:"Array",proto:!0,arity:1,forced:r(18431)((function(){return 4294967297!==[].push.call({length:4294967296},1)}))||!function(){try{Object.defineProperty([],"length",{writable:!1}).push()}catch(e){return e instanceof TypeError}}()},{push:function(e){var t=u(this),r=i(t),n=arguments.length;a(r+n);for(var s=0;s<n;s++)t[r]=arguments[s],r++;return o(t,r),r}})},64777:function(e,t,r){"use strict";var n=r(68077),u=r(55418),i=r(35968),o=u([].reverse),a=[1,2];n({target:"Array",proto:!0,forced:String(a)===String(a.reverse())},{reverse:function(){return i(this)&&(this.length=this.length),o(this)}})},41353:function(e,t,r){"use strict";var n=r(68077),u=r(19480),i=r(73834),o=r(97673),a=r(10228),s=r(1991),l=r(54108),c=r(26183),f=r(53396),h=r(35102),p=r(817)("splice"),D=Math.max,g=Math.min;n({target:"Array",proto:!0,forced:!p},{splice:function(e,t){var r,n,p,d,v,k,x=u(this),m=a(x),F=i(e,m),A=arguments.length;for(0===A?r=n=0:1===A?(r=0,n=m-F):(r=A-2,n=g(D(o(t),0),m-F)),l(m+r-n),p=c(x,n),d=0;d<n;d++)(v=F+d)in x&&f(p,d,x[v]);if(p.length=n,r<n){for(d=F;d<m-n;d++)k=d+r,(v=d+n)in x?x[k]=x[v]:h(x,k);for(d=m;d>m-n+r;d--)h(x,d-1)}else if(r>n)for(d=m-n;d>F;d--)k=d+r-1,(v=d+n-1)in x?x[k]=x[v]:h(x,k);for(d=0;d<r;d++)x[d+F]=arguments[d+2];return s(x,m-n+r),p}})},80628:function(e,t,r){"use strict";var n=r(68077),u=r(19480),i=r(10228),o=r(1991),a=r(35102),s=r(54108);n({target:"Array",proto:!0,arity:1,forced:1!==[].unshift(0)||!function(){try{Object.defineProperty([],"length",{writable:!1}).unshift()}catch(e){return e instanceof TypeError}}()},{unshift:function(e){var t=u(this),r=i(t),n=arguments.length;if(n){s(r+n);for(var l=r;l--;){var c=l+n;l in t?t[c]=t[l]:a(t,c)}for(var f=0;f<n;f++)t[f]=arguments[f]}return o(t,r+n)}})},38644:function(e,t,r){"use strict";var n=r(5813);r(48357)(n.JSON,"JSON",!0)},53737:function(e,t,r){"use strict";r(48357)(Math,"Math",!0)},30535:function(e,t,r){"use strict";var n=r(68077),u=r(18431),i=r(19480),o=r(2563),a=r(51577);n({target:"Object",stat:!0,forced:u((function(){o(1)})),sham:!a},{getPrototypeOf:function(e){return o(i(e))}})},65974:function(e,t,r){"use strict";var n=r(68077),u=r(19480),i=r(93121);n({target:"Object",stat:!0,forced:r(18431)((function(){i(1)}))},{keys:function(e){return i(u(e))}})},27392:function(e,t,r){"use strict";var n=r(68077),u=r(79058);n({global:!0,forced:parseInt!==u},{parseInt:u})},10999:function(e,t,r){"use strict";var n=r(58849),u=r(5813),i=r(55418),o=r(27992),a=r(81760),s=r(52838),l=r(9885),c=r(45919).f,f=r(95882),h=r(90744),p=r(11336),D=r(78287),g=r(9773),d=r(4109),v=r(73936),k=r(18431),x=r(55229),m=r(12648).enforce,F=r(36929),A=r(10282),y=r(66509),b=r(70852),E=A("match"),C=u.RegExp,w=C.prototype,B=u.SyntaxError,S=i(w.exec),I=i("".charAt),T=i("".replace),z=i("".indexOf),O=i("".slice),$=/^\?<[^\s\d!#%&*+<=>@^][^\s!#%&*+<=>@^]*>/,R=/a/g,_=/a/g,L=new C(R)!==R,j=g.MISSED_STICKY,P=g.UNSUPPORTED_Y,Z=n&&(!L||j||y||b||k((function(){return _[E]=!1,C(R)!==R||C(_)===_||"/a/i"!==String(C(R,"i"))})));if(o("RegExp",Z)){for(var q=function(e,t){var r,n,u,i,o,c,g=f(w,this),d=h(e),v=void 0===t,k=[],F=e;if(!g&&d&&v&&e.constructor===q)return e;if((d||f(w,e))&&(e=e.source,v&&(t=D(F))),e=void 0===e?"":p(e),t=void 0===t?"":p(t),F=e,y&&"dotAll"in R&&(n=!!t&&z(t,"s")>-1)&&(t=T(t,/s/g,"")),r=t,j&&"sticky"in R&&(u=!!t&&z(t,"y")>-1)&&P&&(t=T(t,/y/g,"")),b&&(i=function(e){for(var t,r=e.length,n=0,u="",i=[],o=l(null),a=!1,s=!1,c=0,f="";n<=r;n++){if("\\"===(t=I(e,n)))t+=I(e,++n);else if("]"===t)a=!1;else if(!a)switch(!0){case"["===t:a=!0;break;case"("===t:S($,O(e,n+1))&&(n+=2,s=!0),u+=t,c++;continue;case">"===t&&s:if(""===f||x(o,f))throw new B("Invalid capture group name");o[f]=!0,i[i.length]=[f,c],s=!1,f="";continue}s?f+=t:u+=t}return[u,i]}(e),e=i[0],k=i[1]),o=a(C(e,t),g?this:w,q),(n||u||k.length)&&(c=m(o),n&&(c.dotAll=!0,c.raw=q(function(e){for(var t,r=e.length,n=0,u="",i=!1;n<=r;n++)"\\"!==(t=I(e,n))?i||"."!==t?("["===t?i=!0:"]"===t&&(i=!1),u+=t):u+="[\\s\\S]":u+=t+I(e,++n);return u}(e),r)),u&&(c.sticky=!0),k.length&&(c.groups=k)),e!==F)try{s(o,"source",""===F?"(?:)":F)}catch(A){}return o},M=c(C),Q=0;M.length>Q;)d(q,C,M[Q++]);w.constructor=q,q.prototype=w,v(u,"RegExp",q,{constructor:!0})}F("RegExp")},52117:function(e,t,r){"use strict";var n=r(58849),u=r(66509),i=r(42458),o=r(40030),a=r(12648).get,s=RegExp.prototype,l=TypeError;n&&u&&o(s,"dotAll",{configurable:!0,get:function(){if(this!==s){if("RegExp"===i(this))return!!a(this).dotAll;throw new l("Incompatible receiver, RegExp required")}}})},82479:function(e,t,r){"use strict";var n=r(58849),u=r(9773).MISSED_STICKY,i=r(42458),o=r(40030),a=r(12648).get,s=RegExp.prototype,l=TypeError;n&&u&&o(s,"sticky",{configurable:!0,get:function(){if(this!==s){if("RegExp"===i(this))return!!a(this).sticky;throw new l("Incompatible receiver, RegExp required")}}})},99397:function(e,t,r){"use strict";r(63789);var n,u,i=r(68077),o=r(43173),a=r(30553),s=r(22933),l=r(11336),c=(n=!1,(u=/[ac]/).exec=function(){return n=!0,/./.exec.apply(this,arguments)},!0===u.test("abc")&&n),f=/./.test;i({target:"RegExp",proto:!0,forced:!c},{test:function(e){var t=s(this),r=l(e),n=t.exec;if(!a(n))return o(f,t,r);var u=o(n,t,r);return null!==u&&(s(u),!0)}})},36442:function(e,t,r){"use strict";r(88820)("Set",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),r(52961))},78399:function(e,t,r){"use strict";r(36442)},7507:function(e,t,r){"use strict";var n=r(68077),u=r(14265);n({target:"String",proto:!0,forced:r(24089)("link")},{link:function(e){return u(this,"a","href",e)}})},18098:function(e,t,r){"use strict";var n=r(43173),u=r(37374),i=r(22933),o=r(59317),a=r(97142),s=r(11336),l=r(43313),c=r(54339),f=r(18513),h=r(94448);u("match",(function(e,t,r){return[function(t){var r=l(this),u=o(t)?void 0:c(t,e);return u?n(u,t,r):new RegExp(t)[e](s(r))},function(e){var n=i(this),u=s(e),o=r(t,n,u);if(o.done)return o.value;if(!n.global)return h(n,u);var l=n.unicode;n.lastIndex=0;for(var c,p=[],D=0;null!==(c=h(n,u));){var g=s(c[0]);p[D]=g,""===g&&(n.lastIndex=f(u,a(n.lastIndex),l)),D++}return 0===D?null:p}]}))},7179:function(e,t,r){"use strict";r(68077)({target:"String",proto:!0},{repeat:r(93892)})},24074:function(e,t,r){"use strict";var n=r(35449),u=r(43173),i=r(55418),o=r(37374),a=r(18431),s=r(22933),l=r(30553),c=r(59317),f=r(97673),h=r(97142),p=r(11336),D=r(43313),g=r(18513),d=r(54339),v=r(17107),k=r(94448),x=r(10282)("replace"),m=Math.max,F=Math.min,A=i([].concat),y=i([].push),b=i("".indexOf),E=i("".slice),C="$0"==="a".replace(/./,"$0"),w=!!/./[x]&&""===/./[x]("a","$0");o("replace",(function(e,t,r){var i=w?"$":"$0";return[function(e,r){var n=D(this),i=c(e)?void 0:d(e,x);return i?u(i,e,n,r):u(t,p(n),e,r)},function(e,u){var o=s(this),a=p(e);if("string"==typeof u&&-1===b(u,i)&&-1===b(u,"$<")){var c=r(t,o,a,u);if(c.done)return c.value}var D=l(u);D||(u=p(u));var d,x=o.global;x&&(d=o.unicode,o.lastIndex=0);for(var C,w=[];null!==(C=k(o,a))&&(y(w,C),x);){""===p(C[0])&&(o.lastIndex=g(a,h(o.lastIndex),d))}for(var B,S="",I=0,T=0;T<w.length;T++){for(var z,O=p((C=w[T])[0]),$=m(F(f(C.index),a.length),0),R=[],_=1;_<C.length;_++)y(R,void 0===(B=C[_])?B:String(B));var L=C.groups;if(D){var j=A([O],R,$,a);void 0!==L&&y(j,L),z=p(n(u,void 0,j))}else z=v(O,a,$,R,L,u);$>=I&&(S+=E(a,I,$)+z,I=$+O.length)}return S+E(a,I)}]}),!!a((function(){var e=/./;return e.exec=function(){var e=[];return e.groups={a:"7"},e},"7"!=="".replace(e,"$<a>")}))||!C||w)},35221:function(e,t,r){"use strict";var n=r(43173),u=r(37374),i=r(22933),o=r(59317),a=r(43313),s=r(93577),l=r(11336),c=r(54339),f=r(94448);u("search",(function(e,t,r){return[function(t){var r=a(this),u=o(t)?void 0:c(t,e);return u?n(u,t,r):new RegExp(t)[e](l(r))},function(e){var n=i(this),u=l(e),o=r(t,n,u);if(o.done)return o.value;var a=n.lastIndex;s(a,0)||(n.lastIndex=0);var c=f(n,u);return s(n.lastIndex,a)||(n.lastIndex=a),null===c?-1:c.index}]}))},57778:function(e,t,r){"use strict";var n=r(35449),u=r(43173),i=r(55418),o=r(37374),a=r(22933),s=r(59317),l=r(90744),c=r(43313),f=r(51048),h=r(18513),p=r(97142),D=r(11336),g=r(54339),d=r(88755),v=r(94448),k=r(45648),x=r(9773),m=r(18431),F=x.UNSUPPORTED_Y,A=4294967295,y=Math.min,b=[].push,E=i(/./.exec),C=i(b),w=i("".slice),B=!m((function(){var e=/(?:)/,t=e.exec;e.exec=function(){return t.apply(this,arguments)};var r="ab".split(e);return 2!==r.length||"a"!==r[0]||"b"!==r[1]}));o("split",(function(e,t,r){var i;return i="c"==="abbc".split(/(b)*/)[1]||4!=="test".split(/(?:)/,-1).length||2!=="ab".split(/(?:ab)*/).length||4!==".".split(/(.?)(.?)/).length||".".split(/()()/).length>1||"".split(/.?/).length?function(e,r){var i=D(c(this)),o=void 0===r?A:r>>>0;if(0===o)return[];if(void 0===e)return[i];if(!l(e))return u(t,i,e,o);for(var a,s,f,h=[],p=(e.ignoreCase?"i":"")+(e.multiline?"m":"")+(e.unicode?"u":"")+(e.sticky?"y":""),g=0,v=new RegExp(e.source,p+"g");(a=u(k,v,i))&&!((s=v.lastIndex)>g&&(C(h,w(i,g,a.index)),a.length>1&&a.index<i.length&&n(b,h,d(a,1)),f=a[0].length,g=s,h.length>=o));)v.lastIndex===a.index&&v.lastIndex++;return g===i.length?!f&&E(v,"")||C(h,""):C(h,w(i,g)),h.length>o?d(h,0,o):h}:"0".split(void 0,0).length?function(e,r){return void 0===e&&0===r?[]:u(t,this,e,r)}:t,[function(t,r){var n=c(this),o=s(t)?void 0:g(t,e);return o?u(o,t,n,r):u(i,D(n),t,r)},function(e,n){var u=a(this),o=D(e),s=r(i,u,o,n,i!==t);if(s.done)return s.value;var l=f(u,RegExp),c=u.unicode,g=(u.ignoreCase?"i":"")+(u.multiline?"m":"")+(u.unicode?"u":"")+(F?"g":"y"),d=new l(F?"^(?:"+u.source+")":u,g),k=void 0===n?A:n>>>0;if(0===k)return[];if(0===o.length)return null===v(d,o)?[o]:[];for(var x=0,m=0,b=[];m<o.length;){d.lastIndex=F?0:m;var E,B=v(d,F?w(o,m):o);if(null===B||(E=y(p(d.lastIndex+(F?m:0)),o.length))===x)m=h(o,m,c);else{if(C(b,w(o,x,m)),b.length===k)return b;for(var S=1;S<=B.length-1;S++)if(C(b,B[S]),b.length===k)return b;m=x=E}}return C(b,w(o,x)),b}]}),!B,F)},62544:function(e,t,r){"use strict";r(61953);var n=r(68077),u=r(30556);n({target:"String",proto:!0,name:"trimEnd",forced:"".trimEnd!==u},{trimEnd:u})},6087:function(e,t,r){"use strict";var n=r(68077),u=r(96868);n({target:"String",proto:!0,name:"trimStart",forced:"".trimLeft!==u},{trimLeft:u})},61953:function(e,t,r){"use strict";var n=r(68077),u=r(30556);n({target:"String",proto:!0,name:"trimEnd",forced:"".trimRight!==u},{trimRight:u})},10187:function(e,t,r){"use strict";r(6087);var n=r(68077),u=r(96868);n({target:"String",proto:!0,name:"trimStart",forced:"".trimStart!==u},{trimStart:u})},11451:function(e,t,r){"use strict";var n=r(68077),u=r(55370).trim;n({target:"String",proto:!0,forced:r(82650)("trim")},{trim:function(){return u(this)}})},53918:function(e,t,r){"use strict";r(80879)("asyncIterator")},94418:function(e,t,r){"use strict";var n=r(29694),u=r(80879),i=r(48357);u("toStringTag"),i(n("Symbol"),"Symbol")},22890:function(e,t,r){"use strict";var n=r(68077),u=r(43173),i=r(9160),o=r(22933),a=r(73177),s=r(8900),l=r(74856),c=r(95448),f=s((function(){for(var e,t,r=this.iterator,n=this.predicate,i=this.next;;){if(e=o(u(i,r)),this.done=!!e.done)return;if(t=e.value,l(r,n,[t,this.counter++],!0))return t}}));n({target:"Iterator",proto:!0,real:!0,forced:c},{filter:function(e){return o(this),i(e),new f(a(this),{predicate:e})}})},50289:function(e,t,r){"use strict";var n=r(68077),u=r(72208),i=r(9160),o=r(22933),a=r(73177);n({target:"Iterator",proto:!0,real:!0},{forEach:function(e){o(this),i(e);var t=a(this),r=0;u(t,(function(t){e(t,r++)}),{IS_RECORD:!0})}})},70320:function(e,t,r){"use strict";var n=r(68077),u=r(57902);n({target:"Iterator",proto:!0,real:!0,forced:r(95448)},{map:u})},56086:function(e,t,r){"use strict";var n=r(68077),u=r(74331);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("difference")},{difference:u})},47884:function(e,t,r){"use strict";var n=r(68077),u=r(18431),i=r(52863);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("intersection")||u((function(){return"3,2"!==Array.from(new Set([1,2,3]).intersection(new Set([3,2])))}))},{intersection:i})},81912:function(e,t,r){"use strict";var n=r(68077),u=r(74635);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("isDisjointFrom")},{isDisjointFrom:u})},64584:function(e,t,r){"use strict";var n=r(68077),u=r(67511);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("isSubsetOf")},{isSubsetOf:u})},41483:function(e,t,r){"use strict";var n=r(68077),u=r(61757);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("isSupersetOf")},{isSupersetOf:u})},12367:function(e,t,r){"use strict";var n=r(68077),u=r(26832);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("symmetricDifference")},{symmetricDifference:u})},9454:function(e,t,r){"use strict";var n=r(68077),u=r(65053);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("union")},{union:u})},94167:function(e,t,r){"use strict";var n=r(5813),u=r(70803),i=r(1617),o=r(30519),a=r(52838),s=function(e){if(e&&e.forEach!==o)try{a(e,"forEach",o)}catch(t){e.forEach=o}};for(var l in u)u[l]&&s(n[l]&&n[l].prototype);s(i)},81043:function(e,t,r){"use strict";r.d(t,{Z:function(){return u}});r(46798),r(47084);function n(e,t,r,n,u,i,o){try{var a=e[i](o),s=a.value}catch(l){return void r(l)}a.done?t(s):Promise.resolve(s).then(n,u)}function u(e){return function(){var t=this,r=arguments;return new Promise((function(u,i){var o=e.apply(t,r);function a(e){n(o,u,i,a,s,"next",e)}function s(e){n(o,u,i,a,s,"throw",e)}a(void 0)}))}}},99312:function(e,t,r){"use strict";r.d(t,{Z:function(){return u}});r(94738),r(98214),r(46798),r(20254),r(51358),r(5239),r(98490),r(53918),r(94418),r(38644),r(53737),r(30535),r(51467),r(36513),r(9849),r(50289),r(94167),r(22859),r(47084),r(64777),r(17692);var n=r(76775);function u(){u=function(){return t};var e,t={},r=Object.prototype,i=r.hasOwnProperty,o=Object.defineProperty||function(e,t,r){e[t]=r.value},a="function"==typeof Symbol?Symbol:{},s=a.iterator||"@@iterator",l=a.asyncIterator||"@@asyncIterator",c=a.toStringTag||"@@toStringTag";function f(e,t,r){return Object.defineProperty(e,t,{value:r,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{f({},"")}catch(e){f=function(e,t,r){return e[t]=r}}function h(e,t,r,n){var u=t&&t.prototype instanceof x?t:x,i=Object.create(u.prototype),a=new z(n||[]);return o(i,"_invoke",{value:B(e,r,a)}),i}function p(e,t,r){try{return{type:"normal",arg:e.call(t,r)}}catch(e){return{type:"throw",arg:e}}}t.wrap=h;var D="suspendedStart",g="suspendedYield",d="executing",v="completed",k={};function x(){}function m(){}function F(){}var A={};f(A,s,(function(){return this}));var y=Object.getPrototypeOf,b=y&&y(y(O([])));b&&b!==r&&i.call(b,s)&&(A=b);var E=F.prototype=x.prototype=Object.create(A);function C(e){["next","throw","return"].forEach((function(t){f(e,t,(function(e){return this._invoke(t,e)}))}))}function w(e,t){function r(u,o,a,s){var l=p(e[u],e,o);if("throw"!==l.type){var c=l.arg,f=c.value;return f&&"object"==(0,n.Z)(f)&&i.call(f,"__await")?t.resolve(f.__await).then((function(e){r("next",e,a,s)}),(function(e){r("throw",e,a,s)})):t.resolve(f).then((function(e){c.value=e,a(c)}),(function(e){return r("throw",e,a,s)}))}s(l.arg)}var u;o(this,"_invoke",{value:function(e,n){function i(){return new t((function(t,u){r(e,n,t,u)}))}return u=u?u.then(i,i):i()}})}function B(t,r,n){var u=D;return function(i,o){if(u===d)throw new Error("Generator is already running");if(u===v){if("throw"===i)throw o;return{value:e,done:!0}}for(n.method=i,n.arg=o;;){var a=n.delegate;if(a){var s=S(a,n);if(s){if(s===k)continue;return s}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(u===D)throw u=v,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);u=d;var l=p(t,r,n);if("normal"===l.type){if(u=n.done?v:g,l.arg===k)continue;return{value:l.arg,done:n.done}}"throw"===l.type&&(u=v,n.method="throw",n.arg=l.arg)}}}function S(t,r){var n=r.method,u=t.iterator[n];if(u===e)return r.delegate=null,"throw"===n&&t.iterator.return&&(r.method="return",r.arg=e,S(t,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),k;var i=p(u,t.iterator,r.arg);if("throw"===i.type)return r.method="throw",r.arg=i.arg,r.delegate=null,k;var o=i.arg;return o?o.done?(r[t.resultName]=o.value,r.next=t.nextLoc,"return"!==r.method&&(r.method="next",r.arg=e),r.delegate=null,k):o:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,k)}function I(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function T(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function z(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(I,this),this.reset(!0)}function O(t){if(t||""===t){var r=t[s];if(r)return r.call(t);if("function"==typeof t.next)return t;if(!isNaN(t.length)){var u=-1,o=function r(){for(;++u<t.length;)if(i.call(t,u))return r.value=t[u],r.done=!1,r;return r.value=e,r.done=!0,r};return o.next=o}}throw new TypeError((0,n.Z)(t)+" is not iterable")}return m.prototype=F,o(E,"constructor",{value:F,configurable:!0}),o(F,"constructor",{value:m,configurable:!0}),m.displayName=f(F,c,"GeneratorFunction"),t.isGeneratorFunction=function(e){var t="function"==typeof e&&e.constructor;return!!t&&(t===m||"GeneratorFunction"===(t.displayName||t.name))},t.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,F):(e.__proto__=F,f(e,c,"GeneratorFunction")),e.prototype=Object.create(E),e},t.awrap=function(e){return{__await:e}},C(w.prototype),f(w.prototype,l,(function(){return this})),t.AsyncIterator=w,t.async=function(e,r,n,u,i){void 0===i&&(i=Promise);var o=new w(h(e,r,n,u),i);return t.isGeneratorFunction(r)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},C(E),f(E,c,"Generator"),f(E,s,(function(){return this})),f(E,"toString",(function(){return"[object Generator]"})),t.keys=function(e){var t=Object(e),r=[];for(var n in t)r.push(n);return r.reverse(),function e(){for(;r.length;){var n=r.pop();if(n in t)return e.value=n,e.done=!1,e}return e.done=!0,e}},t.values=O,z.prototype={constructor:z,reset:function(t){if(this.prev=0,this.next=0,this.sent=this._sent=e,this.done=!1,this.delegate=null,this.method="next",this.arg=e,this.tryEntries.forEach(T),!t)for(var r in this)"t"===r.charAt(0)&&i.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=e)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(t){if(this.done)throw t;var r=this;function n(n,u){return a.type="throw",a.arg=t,r.next=n,u&&(r.method="next",r.arg=e),!!u}for(var u=this.tryEntries.length-1;u>=0;--u){var o=this.tryEntries[u],a=o.completion;if("root"===o.tryLoc)return n("end");if(o.tryLoc<=this.prev){var s=i.call(o,"catchLoc"),l=i.call(o,"finallyLoc");if(s&&l){if(this.prev<o.catchLoc)return n(o.catchLoc,!0);if(this.prev<o.finallyLoc)return n(o.finallyLoc)}else if(s){if(this.prev<o.catchLoc)return n(o.catchLoc,!0)}else{if(!l)throw new Error("try statement without catch or finally");if(this.prev<o.finallyLoc)return n(o.finallyLoc)}}}},abrupt:function(e,t){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&i.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var u=n;break}}u&&("break"===e||"continue"===e)&&u.tryLoc<=t&&t<=u.finallyLoc&&(u=null);var o=u?u.completion:{};return o.type=e,o.arg=t,u?(this.method="next",this.next=u.finallyLoc,k):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),k},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var r=this.tryEntries[t];if(r.finallyLoc===e)return this.complete(r.completion,r.afterLoc),T(r),k}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var r=this.tryEntries[t];if(r.tryLoc===e){var n=r.completion;if("throw"===n.type){var u=n.arg;T(r)}return u}}throw new Error("illegal catch attempt")},delegateYield:function(t,r,n){return this.delegate={iterator:O(t),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=e),k}},t}},92838:function(e,t,r){"use strict";r.d(t,{TU:function(){return Ce}});r(51467);function n(e,t){if(!Object.prototype.hasOwnProperty.call(e,t))throw new TypeError("attempted to use private field on non-instance");return e}var u=0;function i(e){return"__private_"+u+++"_"+e}var o=r(46097),a=r(40039);function s(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}var l=r(97292);function c(e,t){for(var r=0;r<t.length;r++){var n=t[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(e,(0,l.Z)(n.key),n)}}function f(e,t,r){return t&&c(e.prototype,t),r&&c(e,r),Object.defineProperty(e,"prototype",{writable:!1}),e}var h=r(62746);r(10999),r(52117),r(63789),r(82479),r(94570),r(99397),r(24074),r(27392),r(57778),r(11451),r(41353),r(36513),r(17692),r(56308),r(18098),r(91989),r(46349),r(70320),r(7179),r(10187),r(35221),r(62544),r(87438),r(46798),r(9849),r(22890),r(13526),r(7507),r(85717),r(50289),r(94167),r(65974),r(40271),r(60163),r(26349),r(97393),r(80628),r(22859),r(47084),r(51358),r(78399),r(5239),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(98490);function p(){return{async:!1,breaks:!1,extensions:null,gfm:!0,hooks:null,pedantic:!1,renderer:null,silent:!1,tokenizer:null,walkTokens:null}}var D={async:!1,breaks:!1,extensions:null,gfm:!0,hooks:null,pedantic:!1,renderer:null,silent:!1,tokenizer:null,walkTokens:null};function g(e){D=e}var d=/[&<>"']/,v=new RegExp(d.source,"g"),k=/[<>"']|&(?!(#\d{1,7}|#[Xx][a-fA-F0-9]{1,6}|\w+);)/,x=new RegExp(k.source,"g"),m={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"},F=function(e){return m[e]};function A(e,t){if(t){if(d.test(e))return e.replace(v,F)}else if(k.test(e))return e.replace(x,F);return e}var y=/&(#(?:\d+)|(?:#x[0-9A-Fa-f]+)|(?:\w+));?/gi;function b(e){return e.replace(y,(function(e,t){return"colon"===(t=t.toLowerCase())?":":"#"===t.charAt(0)?"x"===t.charAt(1)?String.fromCharCode(parseInt(t.substring(2),16)):String.fromCharCode(+t.substring(1)):""}))}var E=/(^|[^\[])\^/g;function C(e,t){var r="string"==typeof e?e:e.source;t=t||"";var n={replace:function(e,t){var u="string"==typeof t?t:t.source;return u=u.replace(E,"$1"),r=r.replace(e,u),n},getRegex:function(){return new RegExp(r,t)}};return n}function w(e){try{e=encodeURI(e).replace(/%25/g,"%")}catch(t){return null}return e}var B={exec:function(){return null}};function S(e,t){var r=e.replace(/\|/g,(function(e,t,r){for(var n=!1,u=t;--u>=0&&"\\"===r[u];)n=!n;return n?"|":" |"})).split(/ \|/),n=0;if(r[0].trim()||r.shift(),r.length>0&&!r[r.length-1].trim()&&r.pop(),t)if(r.length>t)r.splice(t);else for(;r.length<t;)r.push("");for(;n<r.length;n++)r[n]=r[n].trim().replace(/\\\|/g,"|");return r}function I(e,t,r){var n=e.length;if(0===n)return"";for(var u=0;u<n;){var i=e.charAt(n-u-1);if(i!==t||r){if(i===t||!r)break;u++}else u++}return e.slice(0,n-u)}function T(e,t,r,n){var u=t.href,i=t.title?A(t.title):null,o=e[1].replace(/\\([\[\]])/g,"$1");if("!"!==e[0].charAt(0)){n.state.inLink=!0;var a={type:"link",raw:r,href:u,title:i,text:o,tokens:n.inlineTokens(o)};return n.state.inLink=!1,a}return{type:"image",raw:r,href:u,title:i,text:A(o)}}var z=function(){function e(t){s(this,e),this.options=void 0,this.rules=void 0,this.lexer=void 0,this.options=t||D}return f(e,[{key:"space",value:function(e){var t=this.rules.block.newline.exec(e);if(t&&t[0].length>0)return{type:"space",raw:t[0]}}},{key:"code",value:function(e){var t=this.rules.block.code.exec(e);if(t){var r=t[0].replace(/^ {1,4}/gm,"");return{type:"code",raw:t[0],codeBlockStyle:"indented",text:this.options.pedantic?r:I(r,"\n")}}}},{key:"fences",value:function(e){var t=this.rules.block.fences.exec(e);if(t){var r=t[0],n=function(e,t){var r=e.match(/^(\s+)(?:```)/);if(null===r)return t;var n=r[1];return t.split("\n").map((function(e){var t=e.match(/^\s+/);return null===t?e:(0,h.Z)(t,1)[0].length>=n.length?e.slice(n.length):e})).join("\n")}(r,t[3]||"");return{type:"code",raw:r,lang:t[2]?t[2].trim().replace(this.rules.inline.anyPunctuation,"$1"):t[2],text:n}}}},{key:"heading",value:function(e){var t=this.rules.block.heading.exec(e);if(t){var r=t[2].trim();if(/#$/.test(r)){var n=I(r,"#");this.options.pedantic?r=n.trim():n&&!/ $/.test(n)||(r=n.trim())}return{type:"heading",raw:t[0],depth:t[1].length,text:r,tokens:this.lexer.inline(r)}}}},{key:"hr",value:function(e){var t=this.rules.block.hr.exec(e);if(t)return{type:"hr",raw:t[0]}}},{key:"blockquote",value:function(e){var t=this.rules.block.blockquote.exec(e);if(t){var r=I(t[0].replace(/^ *>[ \t]?/gm,""),"\n"),n=this.lexer.state.top;this.lexer.state.top=!0;var u=this.lexer.blockTokens(r);return this.lexer.state.top=n,{type:"blockquote",raw:t[0],tokens:u,text:r}}}},{key:"list",value:function(e){var t=this.rules.block.list.exec(e);if(t){var r=t[1].trim(),n=r.length>1,u={type:"list",raw:"",ordered:n,start:n?+r.slice(0,-1):"",loose:!1,items:[]};r=n?"\\d{1,9}\\".concat(r.slice(-1)):"\\".concat(r),this.options.pedantic&&(r=n?r:"[*+-]");for(var i=new RegExp("^( {0,3}".concat(r,")((?:[\t ][^\\n]*)?(?:\\n|$))")),o="",a="",s=!1;e;){var l=!1;if(!(t=i.exec(e)))break;if(this.rules.block.hr.test(e))break;o=t[0],e=e.substring(o.length);var c=t[2].split("\n",1)[0].replace(/^\t+/,(function(e){return" ".repeat(3*e.length)})),f=e.split("\n",1)[0],h=0;this.options.pedantic?(h=2,a=c.trimStart()):(h=(h=t[2].search(/[^ ]/))>4?1:h,a=c.slice(h),h+=t[1].length);var p=!1;if(!c&&/^ *$/.test(f)&&(o+=f+"\n",e=e.substring(f.length+1),l=!0),!l)for(var D=new RegExp("^ {0,".concat(Math.min(3,h-1),"}(?:[*+-]|\\d{1,9}[.)])((?:[ \t][^\\n]*)?(?:\\n|$))")),g=new RegExp("^ {0,".concat(Math.min(3,h-1),"}((?:- *){3,}|(?:_ *){3,}|(?:\\* *){3,})(?:\\n+|$)")),d=new RegExp("^ {0,".concat(Math.min(3,h-1),"}(?:```|~~~)")),v=new RegExp("^ {0,".concat(Math.min(3,h-1),"}#"));e;){var k=e.split("\n",1)[0];if(f=k,this.options.pedantic&&(f=f.replace(/^ {1,4}(?=( {4})*[^ ])/g,"  ")),d.test(f))break;if(v.test(f))break;if(D.test(f))break;if(g.test(e))break;if(f.search(/[^ ]/)>=h||!f.trim())a+="\n"+f.slice(h);else{if(p)break;if(c.search(/[^ ]/)>=4)break;if(d.test(c))break;if(v.test(c))break;if(g.test(c))break;a+="\n"+f}p||f.trim()||(p=!0),o+=k+"\n",e=e.substring(k.length+1),c=f.slice(h)}u.loose||(s?u.loose=!0:/\n *\n *$/.test(o)&&(s=!0));var x=null,m=void 0;this.options.gfm&&(x=/^\[[ xX]\] /.exec(a))&&(m="[ ] "!==x[0],a=a.replace(/^\[[ xX]\] +/,"")),u.items.push({type:"list_item",raw:o,task:!!x,checked:m,loose:!1,text:a,tokens:[]}),u.raw+=o}u.items[u.items.length-1].raw=o.trimEnd(),u.items[u.items.length-1].text=a.trimEnd(),u.raw=u.raw.trimEnd();for(var F=0;F<u.items.length;F++)if(this.lexer.state.top=!1,u.items[F].tokens=this.lexer.blockTokens(u.items[F].text,[]),!u.loose){var A=u.items[F].tokens.filter((function(e){return"space"===e.type})),y=A.length>0&&A.some((function(e){return/\n.*\n/.test(e.raw)}));u.loose=y}if(u.loose)for(var b=0;b<u.items.length;b++)u.items[b].loose=!0;return u}}},{key:"html",value:function(e){var t=this.rules.block.html.exec(e);if(t)return{type:"html",block:!0,raw:t[0],pre:"pre"===t[1]||"script"===t[1]||"style"===t[1],text:t[0]}}},{key:"def",value:function(e){var t=this.rules.block.def.exec(e);if(t){var r=t[1].toLowerCase().replace(/\s+/g," "),n=t[2]?t[2].replace(/^<(.*)>$/,"$1").replace(this.rules.inline.anyPunctuation,"$1"):"",u=t[3]?t[3].substring(1,t[3].length-1).replace(this.rules.inline.anyPunctuation,"$1"):t[3];return{type:"def",tag:r,raw:t[0],href:n,title:u}}}},{key:"table",value:function(e){var t=this,r=this.rules.block.table.exec(e);if(r&&/[:|]/.test(r[2])){var n=S(r[1]),u=r[2].replace(/^\||\| *$/g,"").split("|"),i=r[3]&&r[3].trim()?r[3].replace(/\n[ \t]*$/,"").split("\n"):[],o={type:"table",raw:r[0],header:[],align:[],rows:[]};if(n.length===u.length){var s,l=(0,a.Z)(u);try{for(l.s();!(s=l.n()).done;){var c=s.value;/^ *-+: *$/.test(c)?o.align.push("right"):/^ *:-+: *$/.test(c)?o.align.push("center"):/^ *:-+ *$/.test(c)?o.align.push("left"):o.align.push(null)}}catch(v){l.e(v)}finally{l.f()}var f,h=(0,a.Z)(n);try{for(h.s();!(f=h.n()).done;){var p=f.value;o.header.push({text:p,tokens:this.lexer.inline(p)})}}catch(v){h.e(v)}finally{h.f()}var D,g=(0,a.Z)(i);try{for(g.s();!(D=g.n()).done;){var d=D.value;o.rows.push(S(d,o.header.length).map((function(e){return{text:e,tokens:t.lexer.inline(e)}})))}}catch(v){g.e(v)}finally{g.f()}return o}}}},{key:"lheading",value:function(e){var t=this.rules.block.lheading.exec(e);if(t)return{type:"heading",raw:t[0],depth:"="===t[2].charAt(0)?1:2,text:t[1],tokens:this.lexer.inline(t[1])}}},{key:"paragraph",value:function(e){var t=this.rules.block.paragraph.exec(e);if(t){var r="\n"===t[1].charAt(t[1].length-1)?t[1].slice(0,-1):t[1];return{type:"paragraph",raw:t[0],text:r,tokens:this.lexer.inline(r)}}}},{key:"text",value:function(e){var t=this.rules.block.text.exec(e);if(t)return{type:"text",raw:t[0],text:t[0],tokens:this.lexer.inline(t[0])}}},{key:"escape",value:function(e){var t=this.rules.inline.escape.exec(e);if(t)return{type:"escape",raw:t[0],text:A(t[1])}}},{key:"tag",value:function(e){var t=this.rules.inline.tag.exec(e);if(t)return!this.lexer.state.inLink&&/^<a /i.test(t[0])?this.lexer.state.inLink=!0:this.lexer.state.inLink&&/^<\/a>/i.test(t[0])&&(this.lexer.state.inLink=!1),!this.lexer.state.inRawBlock&&/^<(pre|code|kbd|script)(\s|>)/i.test(t[0])?this.lexer.state.inRawBlock=!0:this.lexer.state.inRawBlock&&/^<\/(pre|code|kbd|script)(\s|>)/i.test(t[0])&&(this.lexer.state.inRawBlock=!1),{type:"html",raw:t[0],inLink:this.lexer.state.inLink,inRawBlock:this.lexer.state.inRawBlock,block:!1,text:t[0]}}},{key:"link",value:function(e){var t=this.rules.inline.link.exec(e);if(t){var r=t[2].trim();if(!this.options.pedantic&&/^</.test(r)){if(!/>$/.test(r))return;var n=I(r.slice(0,-1),"\\");if((r.length-n.length)%2==0)return}else{var u=function(e,t){if(-1===e.indexOf(t[1]))return-1;for(var r=0,n=0;n<e.length;n++)if("\\"===e[n])n++;else if(e[n]===t[0])r++;else if(e[n]===t[1]&&--r<0)return n;return-1}(t[2],"()");if(u>-1){var i=(0===t[0].indexOf("!")?5:4)+t[1].length+u;t[2]=t[2].substring(0,u),t[0]=t[0].substring(0,i).trim(),t[3]=""}}var o=t[2],a="";if(this.options.pedantic){var s=/^([^'"]*[^\s])\s+(['"])(.*)\2/.exec(o);s&&(o=s[1],a=s[3])}else a=t[3]?t[3].slice(1,-1):"";return o=o.trim(),/^</.test(o)&&(o=this.options.pedantic&&!/>$/.test(r)?o.slice(1):o.slice(1,-1)),T(t,{href:o?o.replace(this.rules.inline.anyPunctuation,"$1"):o,title:a?a.replace(this.rules.inline.anyPunctuation,"$1"):a},t[0],this.lexer)}}},{key:"reflink",value:function(e,t){var r;if((r=this.rules.inline.reflink.exec(e))||(r=this.rules.inline.nolink.exec(e))){var n=t[(r[2]||r[1]).replace(/\s+/g," ").toLowerCase()];if(!n){var u=r[0].charAt(0);return{type:"text",raw:u,text:u}}return T(r,n,r[0],this.lexer)}}},{key:"emStrong",value:function(e,t){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"",n=this.rules.inline.emStrongLDelim.exec(e);if(n&&((!n[3]||!r.match(/(?:[0-9A-Za-z\xAA\xB2\xB3\xB5\xB9\xBA\xBC-\xBE\xC0-\xD6\xD8-\xF6\xF8-\u02C1\u02C6-\u02D1\u02E0-\u02E4\u02EC\u02EE\u0370-\u0374\u0376\u0377\u037A-\u037D\u037F\u0386\u0388-\u038A\u038C\u038E-\u03A1\u03A3-\u03F5\u03F7-\u0481\u048A-\u052F\u0531-\u0556\u0559\u0560-\u0588\u05D0-\u05EA\u05EF-\u05F2\u0620-\u064A\u0660-\u0669\u066E\u066F\u0671-\u06D3\u06D5\u06E5\u06E6\u06EE-\u06FC\u06FF\u0710\u0712-\u072F\u074D-\u07A5\u07B1\u07C0-\u07EA\u07F4\u07F5\u07FA\u0800-\u0815\u081A\u0824\u0828\u0840-\u0858\u0860-\u086A\u0870-\u0887\u0889-\u088E\u08A0-\u08C9\u0904-\u0939\u093D\u0950\u0958-\u0961\u0966-\u096F\u0971-\u0980\u0985-\u098C\u098F\u0990\u0993-\u09A8\u09AA-\u09B0\u09B2\u09B6-\u09B9\u09BD\u09CE\u09DC\u09DD\u09DF-\u09E1\u09E6-\u09F1\u09F4-\u09F9\u09FC\u0A05-\u0A0A\u0A0F\u0A10\u0A13-\u0A28\u0A2A-\u0A30\u0A32\u0A33\u0A35\u0A36\u0A38\u0A39\u0A59-\u0A5C\u0A5E\u0A66-\u0A6F\u0A72-\u0A74\u0A85-\u0A8D\u0A8F-\u0A91\u0A93-\u0AA8\u0AAA-\u0AB0\u0AB2\u0AB3\u0AB5-\u0AB9\u0ABD\u0AD0\u0AE0\u0AE1\u0AE6-\u0AEF\u0AF9\u0B05-\u0B0C\u0B0F\u0B10\u0B13-\u0B28\u0B2A-\u0B30\u0B32\u0B33\u0B35-\u0B39\u0B3D\u0B5C\u0B5D\u0B5F-\u0B61\u0B66-\u0B6F\u0B71-\u0B77\u0B83\u0B85-\u0B8A\u0B8E-\u0B90\u0B92-\u0B95\u0B99\u0B9A\u0B9C\u0B9E\u0B9F\u0BA3\u0BA4\u0BA8-\u0BAA\u0BAE-\u0BB9\u0BD0\u0BE6-\u0BF2\u0C05-\u0C0C\u0C0E-\u0C10\u0C12-\u0C28\u0C2A-\u0C39\u0C3D\u0C58-\u0C5A\u0C5D\u0C60\u0C61\u0C66-\u0C6F\u0C78-\u0C7E\u0C80\u0C85-\u0C8C\u0C8E-\u0C90\u0C92-\u0CA8\u0CAA-\u0CB3\u0CB5-\u0CB9\u0CBD\u0CDD\u0CDE\u0CE0\u0CE1\u0CE6-\u0CEF\u0CF1\u0CF2\u0D04-\u0D0C\u0D0E-\u0D10\u0D12-\u0D3A\u0D3D\u0D4E\u0D54-\u0D56\u0D58-\u0D61\u0D66-\u0D78\u0D7A-\u0D7F\u0D85-\u0D96\u0D9A-\u0DB1\u0DB3-\u0DBB\u0DBD\u0DC0-\u0DC6\u0DE6-\u0DEF\u0E01-\u0E30\u0E32\u0E33\u0E40-\u0E46\u0E50-\u0E59\u0E81\u0E82\u0E84\u0E86-\u0E8A\u0E8C-\u0EA3\u0EA5\u0EA7-\u0EB0\u0EB2\u0EB3\u0EBD\u0EC0-\u0EC4\u0EC6\u0ED0-\u0ED9\u0EDC-\u0EDF\u0F00\u0F20-\u0F33\u0F40-\u0F47\u0F49-\u0F6C\u0F88-\u0F8C\u1000-\u102A\u103F-\u1049\u1050-\u1055\u105A-\u105D\u1061\u1065\u1066\u106E-\u1070\u1075-\u1081\u108E\u1090-\u1099\u10A0-\u10C5\u10C7\u10CD\u10D0-\u10FA\u10FC-\u1248\u124A-\u124D\u1250-\u1256\u1258\u125A-\u125D\u1260-\u1288\u128A-\u128D\u1290-\u12B0\u12B2-\u12B5\u12B8-\u12BE\u12C0\u12C2-\u12C5\u12C8-\u12D6\u12D8-\u1310\u1312-\u1315\u1318-\u135A\u1369-\u137C\u1380-\u138F\u13A0-\u13F5\u13F8-\u13FD\u1401-\u166C\u166F-\u167F\u1681-\u169A\u16A0-\u16EA\u16EE-\u16F8\u1700-\u1711\u171F-\u1731\u1740-\u1751\u1760-\u176C\u176E-\u1770\u1780-\u17B3\u17D7\u17DC\u17E0-\u17E9\u17F0-\u17F9\u1810-\u1819\u1820-\u1878\u1880-\u1884\u1887-\u18A8\u18AA\u18B0-\u18F5\u1900-\u191E\u1946-\u196D\u1970-\u1974\u1980-\u19AB\u19B0-\u19C9\u19D0-\u19DA\u1A00-\u1A16\u1A20-\u1A54\u1A80-\u1A89\u1A90-\u1A99\u1AA7\u1B05-\u1B33\u1B45-\u1B4C\u1B50-\u1B59\u1B83-\u1BA0\u1BAE-\u1BE5\u1C00-\u1C23\u1C40-\u1C49\u1C4D-\u1C7D\u1C80-\u1C88\u1C90-\u1CBA\u1CBD-\u1CBF\u1CE9-\u1CEC\u1CEE-\u1CF3\u1CF5\u1CF6\u1CFA\u1D00-\u1DBF\u1E00-\u1F15\u1F18-\u1F1D\u1F20-\u1F45\u1F48-\u1F4D\u1F50-\u1F57\u1F59\u1F5B\u1F5D\u1F5F-\u1F7D\u1F80-\u1FB4\u1FB6-\u1FBC\u1FBE\u1FC2-\u1FC4\u1FC6-\u1FCC\u1FD0-\u1FD3\u1FD6-\u1FDB\u1FE0-\u1FEC\u1FF2-\u1FF4\u1FF6-\u1FFC\u2070\u2071\u2074-\u2079\u207F-\u2089\u2090-\u209C\u2102\u2107\u210A-\u2113\u2115\u2119-\u211D\u2124\u2126\u2128\u212A-\u212D\u212F-\u2139\u213C-\u213F\u2145-\u2149\u214E\u2150-\u2189\u2460-\u249B\u24EA-\u24FF\u2776-\u2793\u2C00-\u2CE4\u2CEB-\u2CEE\u2CF2\u2CF3\u2CFD\u2D00-\u2D25\u2D27\u2D2D\u2D30-\u2D67\u2D6F\u2D80-\u2D96\u2DA0-\u2DA6\u2DA8-\u2DAE\u2DB0-\u2DB6\u2DB8-\u2DBE\u2DC0-\u2DC6\u2DC8-\u2DCE\u2DD0-\u2DD6\u2DD8-\u2DDE\u2E2F\u3005-\u3007\u3021-\u3029\u3031-\u3035\u3038-\u303C\u3041-\u3096\u309D-\u309F\u30A1-\u30FA\u30FC-\u30FF\u3105-\u312F\u3131-\u318E\u3192-\u3195\u31A0-\u31BF\u31F0-\u31FF\u3220-\u3229\u3248-\u324F\u3251-\u325F\u3280-\u3289\u32B1-\u32BF\u3400-\u4DBF\u4E00-\uA48C\uA4D0-\uA4FD\uA500-\uA60C\uA610-\uA62B\uA640-\uA66E\uA67F-\uA69D\uA6A0-\uA6EF\uA717-\uA71F\uA722-\uA788\uA78B-\uA7CA\uA7D0\uA7D1\uA7D3\uA7D5-\uA7D9\uA7F2-\uA801\uA803-\uA805\uA807-\uA80A\uA80C-\uA822\uA830-\uA835\uA840-\uA873\uA882-\uA8B3\uA8D0-\uA8D9\uA8F2-\uA8F7\uA8FB\uA8FD\uA8FE\uA900-\uA925\uA930-\uA946\uA960-\uA97C\uA984-\uA9B2\uA9CF-\uA9D9\uA9E0-\uA9E4\uA9E6-\uA9FE\uAA00-\uAA28\uAA40-\uAA42\uAA44-\uAA4B\uAA50-\uAA59\uAA60-\uAA76\uAA7A\uAA7E-\uAAAF\uAAB1\uAAB5\uAAB6\uAAB9-\uAABD\uAAC0\uAAC2\uAADB-\uAADD\uAAE0-\uAAEA\uAAF2-\uAAF4\uAB01-\uAB06\uAB09-\uAB0E\uAB11-\uAB16\uAB20-\uAB26\uAB28-\uAB2E\uAB30-\uAB5A\uAB5C-\uAB69\uAB70-\uABE2\uABF0-\uABF9\uAC00-\uD7A3\uD7B0-\uD7C6\uD7CB-\uD7FB\uF900-\uFA6D\uFA70-\uFAD9\uFB00-\uFB06\uFB13-\uFB17\uFB1D\uFB1F-\uFB28\uFB2A-\uFB36\uFB38-\uFB3C\uFB3E\uFB40\uFB41\uFB43\uFB44\uFB46-\uFBB1\uFBD3-\uFD3D\uFD50-\uFD8F\uFD92-\uFDC7\uFDF0-\uFDFB\uFE70-\uFE74\uFE76-\uFEFC\uFF10-\uFF19\uFF21-\uFF3A\uFF41-\uFF5A\uFF66-\uFFBE\uFFC2-\uFFC7\uFFCA-\uFFCF\uFFD2-\uFFD7\uFFDA-\uFFDC]|\uD800[\uDC00-\uDC0B\uDC0D-\uDC26\uDC28-\uDC3A\uDC3C\uDC3D\uDC3F-\uDC4D\uDC50-\uDC5D\uDC80-\uDCFA\uDD07-\uDD33\uDD40-\uDD78\uDD8A\uDD8B\uDE80-\uDE9C\uDEA0-\uDED0\uDEE1-\uDEFB\uDF00-\uDF23\uDF2D-\uDF4A\uDF50-\uDF75\uDF80-\uDF9D\uDFA0-\uDFC3\uDFC8-\uDFCF\uDFD1-\uDFD5]|\uD801[\uDC00-\uDC9D\uDCA0-\uDCA9\uDCB0-\uDCD3\uDCD8-\uDCFB\uDD00-\uDD27\uDD30-\uDD63\uDD70-\uDD7A\uDD7C-\uDD8A\uDD8C-\uDD92\uDD94\uDD95\uDD97-\uDDA1\uDDA3-\uDDB1\uDDB3-\uDDB9\uDDBB\uDDBC\uDE00-\uDF36\uDF40-\uDF55\uDF60-\uDF67\uDF80-\uDF85\uDF87-\uDFB0\uDFB2-\uDFBA]|\uD802[\uDC00-\uDC05\uDC08\uDC0A-\uDC35\uDC37\uDC38\uDC3C\uDC3F-\uDC55\uDC58-\uDC76\uDC79-\uDC9E\uDCA7-\uDCAF\uDCE0-\uDCF2\uDCF4\uDCF5\uDCFB-\uDD1B\uDD20-\uDD39\uDD80-\uDDB7\uDDBC-\uDDCF\uDDD2-\uDE00\uDE10-\uDE13\uDE15-\uDE17\uDE19-\uDE35\uDE40-\uDE48\uDE60-\uDE7E\uDE80-\uDE9F\uDEC0-\uDEC7\uDEC9-\uDEE4\uDEEB-\uDEEF\uDF00-\uDF35\uDF40-\uDF55\uDF58-\uDF72\uDF78-\uDF91\uDFA9-\uDFAF]|\uD803[\uDC00-\uDC48\uDC80-\uDCB2\uDCC0-\uDCF2\uDCFA-\uDD23\uDD30-\uDD39\uDE60-\uDE7E\uDE80-\uDEA9\uDEB0\uDEB1\uDF00-\uDF27\uDF30-\uDF45\uDF51-\uDF54\uDF70-\uDF81\uDFB0-\uDFCB\uDFE0-\uDFF6]|\uD804[\uDC03-\uDC37\uDC52-\uDC6F\uDC71\uDC72\uDC75\uDC83-\uDCAF\uDCD0-\uDCE8\uDCF0-\uDCF9\uDD03-\uDD26\uDD36-\uDD3F\uDD44\uDD47\uDD50-\uDD72\uDD76\uDD83-\uDDB2\uDDC1-\uDDC4\uDDD0-\uDDDA\uDDDC\uDDE1-\uDDF4\uDE00-\uDE11\uDE13-\uDE2B\uDE3F\uDE40\uDE80-\uDE86\uDE88\uDE8A-\uDE8D\uDE8F-\uDE9D\uDE9F-\uDEA8\uDEB0-\uDEDE\uDEF0-\uDEF9\uDF05-\uDF0C\uDF0F\uDF10\uDF13-\uDF28\uDF2A-\uDF30\uDF32\uDF33\uDF35-\uDF39\uDF3D\uDF50\uDF5D-\uDF61]|\uD805[\uDC00-\uDC34\uDC47-\uDC4A\uDC50-\uDC59\uDC5F-\uDC61\uDC80-\uDCAF\uDCC4\uDCC5\uDCC7\uDCD0-\uDCD9\uDD80-\uDDAE\uDDD8-\uDDDB\uDE00-\uDE2F\uDE44\uDE50-\uDE59\uDE80-\uDEAA\uDEB8\uDEC0-\uDEC9\uDF00-\uDF1A\uDF30-\uDF3B\uDF40-\uDF46]|\uD806[\uDC00-\uDC2B\uDCA0-\uDCF2\uDCFF-\uDD06\uDD09\uDD0C-\uDD13\uDD15\uDD16\uDD18-\uDD2F\uDD3F\uDD41\uDD50-\uDD59\uDDA0-\uDDA7\uDDAA-\uDDD0\uDDE1\uDDE3\uDE00\uDE0B-\uDE32\uDE3A\uDE50\uDE5C-\uDE89\uDE9D\uDEB0-\uDEF8]|\uD807[\uDC00-\uDC08\uDC0A-\uDC2E\uDC40\uDC50-\uDC6C\uDC72-\uDC8F\uDD00-\uDD06\uDD08\uDD09\uDD0B-\uDD30\uDD46\uDD50-\uDD59\uDD60-\uDD65\uDD67\uDD68\uDD6A-\uDD89\uDD98\uDDA0-\uDDA9\uDEE0-\uDEF2\uDF02\uDF04-\uDF10\uDF12-\uDF33\uDF50-\uDF59\uDFB0\uDFC0-\uDFD4]|\uD808[\uDC00-\uDF99]|\uD809[\uDC00-\uDC6E\uDC80-\uDD43]|\uD80B[\uDF90-\uDFF0]|[\uD80C\uD81C-\uD820\uD822\uD840-\uD868\uD86A-\uD86C\uD86F-\uD872\uD874-\uD879\uD880-\uD883\uD885-\uD887][\uDC00-\uDFFF]|\uD80D[\uDC00-\uDC2F\uDC41-\uDC46]|\uD811[\uDC00-\uDE46]|\uD81A[\uDC00-\uDE38\uDE40-\uDE5E\uDE60-\uDE69\uDE70-\uDEBE\uDEC0-\uDEC9\uDED0-\uDEED\uDF00-\uDF2F\uDF40-\uDF43\uDF50-\uDF59\uDF5B-\uDF61\uDF63-\uDF77\uDF7D-\uDF8F]|\uD81B[\uDE40-\uDE96\uDF00-\uDF4A\uDF50\uDF93-\uDF9F\uDFE0\uDFE1\uDFE3]|\uD821[\uDC00-\uDFF7]|\uD823[\uDC00-\uDCD5\uDD00-\uDD08]|\uD82B[\uDFF0-\uDFF3\uDFF5-\uDFFB\uDFFD\uDFFE]|\uD82C[\uDC00-\uDD22\uDD32\uDD50-\uDD52\uDD55\uDD64-\uDD67\uDD70-\uDEFB]|\uD82F[\uDC00-\uDC6A\uDC70-\uDC7C\uDC80-\uDC88\uDC90-\uDC99]|\uD834[\uDEC0-\uDED3\uDEE0-\uDEF3\uDF60-\uDF78]|\uD835[\uDC00-\uDC54\uDC56-\uDC9C\uDC9E\uDC9F\uDCA2\uDCA5\uDCA6\uDCA9-\uDCAC\uDCAE-\uDCB9\uDCBB\uDCBD-\uDCC3\uDCC5-\uDD05\uDD07-\uDD0A\uDD0D-\uDD14\uDD16-\uDD1C\uDD1E-\uDD39\uDD3B-\uDD3E\uDD40-\uDD44\uDD46\uDD4A-\uDD50\uDD52-\uDEA5\uDEA8-\uDEC0\uDEC2-\uDEDA\uDEDC-\uDEFA\uDEFC-\uDF14\uDF16-\uDF34\uDF36-\uDF4E\uDF50-\uDF6E\uDF70-\uDF88\uDF8A-\uDFA8\uDFAA-\uDFC2\uDFC4-\uDFCB\uDFCE-\uDFFF]|\uD837[\uDF00-\uDF1E\uDF25-\uDF2A]|\uD838[\uDC30-\uDC6D\uDD00-\uDD2C\uDD37-\uDD3D\uDD40-\uDD49\uDD4E\uDE90-\uDEAD\uDEC0-\uDEEB\uDEF0-\uDEF9]|\uD839[\uDCD0-\uDCEB\uDCF0-\uDCF9\uDFE0-\uDFE6\uDFE8-\uDFEB\uDFED\uDFEE\uDFF0-\uDFFE]|\uD83A[\uDC00-\uDCC4\uDCC7-\uDCCF\uDD00-\uDD43\uDD4B\uDD50-\uDD59]|\uD83B[\uDC71-\uDCAB\uDCAD-\uDCAF\uDCB1-\uDCB4\uDD01-\uDD2D\uDD2F-\uDD3D\uDE00-\uDE03\uDE05-\uDE1F\uDE21\uDE22\uDE24\uDE27\uDE29-\uDE32\uDE34-\uDE37\uDE39\uDE3B\uDE42\uDE47\uDE49\uDE4B\uDE4D-\uDE4F\uDE51\uDE52\uDE54\uDE57\uDE59\uDE5B\uDE5D\uDE5F\uDE61\uDE62\uDE64\uDE67-\uDE6A\uDE6C-\uDE72\uDE74-\uDE77\uDE79-\uDE7C\uDE7E\uDE80-\uDE89\uDE8B-\uDE9B\uDEA1-\uDEA3\uDEA5-\uDEA9\uDEAB-\uDEBB]|\uD83C[\uDD00-\uDD0C]|\uD83E[\uDFF0-\uDFF9]|\uD869[\uDC00-\uDEDF\uDF00-\uDFFF]|\uD86D[\uDC00-\uDF39\uDF40-\uDFFF]|\uD86E[\uDC00-\uDC1D\uDC20-\uDFFF]|\uD873[\uDC00-\uDEA1\uDEB0-\uDFFF]|\uD87A[\uDC00-\uDFE0]|\uD87E[\uDC00-\uDE1D]|\uD884[\uDC00-\uDF4A\uDF50-\uDFFF]|\uD888[\uDC00-\uDFAF])/))&&(!(n[1]||n[2]||"")||!r||this.rules.inline.punctuation.exec(r)))){var u,i,a=(0,o.Z)(n[0]).length-1,s=a,l=0,c="*"===n[0][0]?this.rules.inline.emStrongRDelimAst:this.rules.inline.emStrongRDelimUnd;for(c.lastIndex=0,t=t.slice(-1*e.length+a);null!=(n=c.exec(t));)if(u=n[1]||n[2]||n[3]||n[4]||n[5]||n[6])if(i=(0,o.Z)(u).length,n[3]||n[4])s+=i;else if(!((n[5]||n[6])&&a%3)||(a+i)%3){if(!((s-=i)>0)){i=Math.min(i,i+s+l);var f=(0,o.Z)(n[0])[0].length,h=e.slice(0,a+n.index+f+i);if(Math.min(a,i)%2){var p=h.slice(1,-1);return{type:"em",raw:h,text:p,tokens:this.lexer.inlineTokens(p)}}var D=h.slice(2,-2);return{type:"strong",raw:h,text:D,tokens:this.lexer.inlineTokens(D)}}}else l+=i}}},{key:"codespan",value:function(e){var t=this.rules.inline.code.exec(e);if(t){var r=t[2].replace(/\n/g," "),n=/[^ ]/.test(r),u=/^ /.test(r)&&/ $/.test(r);return n&&u&&(r=r.substring(1,r.length-1)),r=A(r,!0),{type:"codespan",raw:t[0],text:r}}}},{key:"br",value:function(e){var t=this.rules.inline.br.exec(e);if(t)return{type:"br",raw:t[0]}}},{key:"del",value:function(e){var t=this.rules.inline.del.exec(e);if(t)return{type:"del",raw:t[0],text:t[2],tokens:this.lexer.inlineTokens(t[2])}}},{key:"autolink",value:function(e){var t,r,n=this.rules.inline.autolink.exec(e);if(n)return r="@"===n[2]?"mailto:"+(t=A(n[1])):t=A(n[1]),{type:"link",raw:n[0],text:t,href:r,tokens:[{type:"text",raw:t,text:t}]}}},{key:"url",value:function(e){var t;if(t=this.rules.inline.url.exec(e)){var r,n;if("@"===t[2])n="mailto:"+(r=A(t[0]));else{var u;do{var i,o;u=t[0],t[0]=null!==(i=null===(o=this.rules.inline._backpedal.exec(t[0]))||void 0===o?void 0:o[0])&&void 0!==i?i:""}while(u!==t[0]);r=A(t[0]),n="www."===t[1]?"http://"+t[0]:t[0]}return{type:"link",raw:t[0],text:r,href:n,tokens:[{type:"text",raw:r,text:r}]}}}},{key:"inlineText",value:function(e){var t,r=this.rules.inline.text.exec(e);if(r)return t=this.lexer.state.inRawBlock?r[0]:A(r[0]),{type:"text",raw:r[0],text:t}}}]),e}(),O=/^ {0,3}((?:-[\t ]*){3,}|(?:_[ \t]*){3,}|(?:\*[ \t]*){3,})(?:\n+|$)/,$=/(?:[*+-]|\d{1,9}[.)])/,R=C(/^(?!bull )((?:.|\n(?!\s*?\n|bull ))+?)\n {0,3}(=+|-+) *(?:\n+|$)/).replace(/bull/g,$).getRegex(),_=/^([^\n]+(?:\n(?!hr|heading|lheading|blockquote|fences|list|html|table| +\n)[^\n]+)*)/,L=/(?!\s*\])(?:\\.|[^\[\]\\])+/,j=C(/^ {0,3}\[(label)\]: *(?:\n *)?([^<\s][^\s]*|<.*?>)(?:(?: +(?:\n *)?| *\n *)(title))? *(?:\n+|$)/).replace("label",L).replace("title",/(?:"(?:\\"?|[^"\\])*"|'[^'\n]*(?:\n[^'\n]+)*\n?'|\([^()]*\))/).getRegex(),P=C(/^( {0,3}bull)([ \t][^\n]+?)?(?:\n|$)/).replace(/bull/g,$).getRegex(),Z="address|article|aside|base|basefont|blockquote|body|caption|center|col|colgroup|dd|details|dialog|dir|div|dl|dt|fieldset|figcaption|figure|footer|form|frame|frameset|h[1-6]|head|header|hr|html|iframe|legend|li|link|main|menu|menuitem|meta|nav|noframes|ol|optgroup|option|p|param|section|source|summary|table|tbody|td|tfoot|th|thead|title|tr|track|ul",q=/<!--(?!-?>)[\s\S]*?(?:-->|$)/,M=C("^ {0,3}(?:<(script|pre|style|textarea)[\\s>][\\s\\S]*?(?:</\\1>[^\\n]*\\n+|$)|comment[^\\n]*(\\n+|$)|<\\?[\\s\\S]*?(?:\\?>\\n*|$)|<![A-Z][\\s\\S]*?(?:>\\n*|$)|<!\\[CDATA\\[[\\s\\S]*?(?:\\]\\]>\\n*|$)|</?(tag)(?: +|\\n|/?>)[\\s\\S]*?(?:(?:\\n *)+\\n|$)|<(?!script|pre|style|textarea)([a-z][\\w-]*)(?:attribute)*? */?>(?=[ \\t]*(?:\\n|$))[\\s\\S]*?(?:(?:\\n *)+\\n|$)|</(?!script|pre|style|textarea)[a-z][\\w-]*\\s*>(?=[ \\t]*(?:\\n|$))[\\s\\S]*?(?:(?:\\n *)+\\n|$))","i").replace("comment",q).replace("tag",Z).replace("attribute",/ +[a-zA-Z:_][\w.:-]*(?: *= *"[^"\n]*"| *= *'[^'\n]*'| *= *[^\s"'=<>`]+)?/).getRegex(),Q=C(_).replace("hr",O).replace("heading"," {0,3}#{1,6}(?:\\s|$)").replace("|lheading","").replace("|table","").replace("blockquote"," {0,3}>").replace("fences"," {0,3}(?:`{3,}(?=[^`\\n]*\\n)|~{3,})[^\\n]*\\n").replace("list"," {0,3}(?:[*+-]|1[.)]) ").replace("html","</?(?:tag)(?: +|\\n|/?>)|<(?:script|pre|style|textarea|!--)").replace("tag",Z).getRegex(),N={blockquote:C(/^( {0,3}> ?(paragraph|[^\n]*)(?:\n|$))+/).replace("paragraph",Q).getRegex(),code:/^( {4}[^\n]+(?:\n(?: *(?:\n|$))*)?)+/,def:j,fences:/^ {0,3}(`{3,}(?=[^`\n]*(?:\n|$))|~{3,})([^\n]*)(?:\n|$)(?:|([\s\S]*?)(?:\n|$))(?: {0,3}\1[~`]* *(?=\n|$)|$)/,heading:/^ {0,3}(#{1,6})(?=\s|$)(.*)(?:\n+|$)/,hr:O,html:M,lheading:R,list:P,newline:/^(?: *(?:\n|$))+/,paragraph:Q,table:B,text:/^[^\n]+/},V=C("^ *([^\\n ].*)\\n {0,3}((?:\\| *)?:?-+:? *(?:\\| *:?-+:? *)*(?:\\| *)?)(?:\\n((?:(?! *\\n|hr|heading|blockquote|code|fences|list|html).*(?:\\n|$))*)\\n*|$)").replace("hr",O).replace("heading"," {0,3}#{1,6}(?:\\s|$)").replace("blockquote"," {0,3}>").replace("code"," {4}[^\\n]").replace("fences"," {0,3}(?:`{3,}(?=[^`\\n]*\\n)|~{3,})[^\\n]*\\n").replace("list"," {0,3}(?:[*+-]|1[.)]) ").replace("html","</?(?:tag)(?: +|\\n|/?>)|<(?:script|pre|style|textarea|!--)").replace("tag",Z).getRegex(),H=Object.assign(Object.assign({},N),{},{table:V,paragraph:C(_).replace("hr",O).replace("heading"," {0,3}#{1,6}(?:\\s|$)").replace("|lheading","").replace("table",V).replace("blockquote"," {0,3}>").replace("fences"," {0,3}(?:`{3,}(?=[^`\\n]*\\n)|~{3,})[^\\n]*\\n").replace("list"," {0,3}(?:[*+-]|1[.)]) ").replace("html","</?(?:tag)(?: +|\\n|/?>)|<(?:script|pre|style|textarea|!--)").replace("tag",Z).getRegex()}),G=Object.assign(Object.assign({},N),{},{html:C("^ *(?:comment *(?:\\n|\\s*$)|<(tag)[\\s\\S]+?</\\1> *(?:\\n{2,}|\\s*$)|<tag(?:\"[^\"]*\"|'[^']*'|\\s[^'\"/>\\s]*)*?/?> *(?:\\n{2,}|\\s*$))").replace("comment",q).replace(/tag/g,"(?!(?:a|em|strong|small|s|cite|q|dfn|abbr|data|time|code|var|samp|kbd|sub|sup|i|b|u|mark|ruby|rt|rp|bdi|bdo|span|br|wbr|ins|del|img)\\b)\\w+(?!:|[^\\w\\s@]*@)\\b").getRegex(),def:/^ *\[([^\]]+)\]: *<?([^\s>]+)>?(?: +(["(][^\n]+[")]))? *(?:\n+|$)/,heading:/^(#{1,6})(.*)(?:\n+|$)/,fences:B,lheading:/^(.+?)\n {0,3}(=+|-+) *(?:\n+|$)/,paragraph:C(_).replace("hr",O).replace("heading"," *#{1,6} *[^\n]").replace("lheading",R).replace("|table","").replace("blockquote"," {0,3}>").replace("|fences","").replace("|list","").replace("|html","").replace("|tag","").getRegex()}),W=/^\\([!"#$%&'()*+,\-./:;<=>?@\[\]\\^_`{|}~])/,U=/^( {2,}|\\)\n(?!\s*$)/,X="\\p{P}$+<=>`^|~",Y=C(/^((?![*_])[\spunctuation])/,"u").replace(/punctuation/g,X).getRegex(),J=C(/^(?:\*+(?:((?!\*)[punct])|[^\s*]))|^_+(?:((?!_)[punct])|([^\s_]))/,"u").replace(/punct/g,X).getRegex(),K=C("^[^_*]*?__[^_*]*?\\*[^_*]*?(?=__)|[^*]+(?=[^*])|(?!\\*)[punct](\\*+)(?=[\\s]|$)|[^punct\\s](\\*+)(?!\\*)(?=[punct\\s]|$)|(?!\\*)[punct\\s](\\*+)(?=[^punct\\s])|[\\s](\\*+)(?!\\*)(?=[punct])|(?!\\*)[punct](\\*+)(?!\\*)(?=[punct])|[^punct\\s](\\*+)(?=[^punct\\s])","gu").replace(/punct/g,X).getRegex(),ee=C("^[^_*]*?\\*\\*[^_*]*?_[^_*]*?(?=\\*\\*)|[^_]+(?=[^_])|(?!_)[punct](_+)(?=[\\s]|$)|[^punct\\s](_+)(?!_)(?=[punct\\s]|$)|(?!_)[punct\\s](_+)(?=[^punct\\s])|[\\s](_+)(?!_)(?=[punct])|(?!_)[punct](_+)(?!_)(?=[punct])","gu").replace(/punct/g,X).getRegex(),te=C(/\\([punct])/,"gu").replace(/punct/g,X).getRegex(),re=C(/^<(scheme:[^\s\x00-\x1f<>]*|email)>/).replace("scheme",/[a-zA-Z][a-zA-Z0-9+.-]{1,31}/).replace("email",/[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+(@)[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?![-_])/).getRegex(),ne=C(q).replace("(?:--\x3e|$)","--\x3e").getRegex(),ue=C("^comment|^</[a-zA-Z][\\w:-]*\\s*>|^<[a-zA-Z][\\w-]*(?:attribute)*?\\s*/?>|^<\\?[\\s\\S]*?\\?>|^<![a-zA-Z]+\\s[\\s\\S]*?>|^<!\\[CDATA\\[[\\s\\S]*?\\]\\]>").replace("comment",ne).replace("attribute",/\s+[a-zA-Z:_][\w.:-]*(?:\s*=\s*"[^"]*"|\s*=\s*'[^']*'|\s*=\s*[^\s"'=<>`]+)?/).getRegex(),ie=/(?:\[(?:\\.|[^\[\]\\])*\]|\\.|`[^`]*`|[^\[\]\\`])*?/,oe=C(/^!?\[(label)\]\(\s*(href)(?:\s+(title))?\s*\)/).replace("label",ie).replace("href",/<(?:\\.|[^\n<>\\])+>|[^\s\x00-\x1f]*/).replace("title",/"(?:\\"?|[^"\\])*"|'(?:\\'?|[^'\\])*'|\((?:\\\)?|[^)\\])*\)/).getRegex(),ae=C(/^!?\[(label)\]\[(ref)\]/).replace("label",ie).replace("ref",L).getRegex(),se=C(/^!?\[(ref)\](?:\[\])?/).replace("ref",L).getRegex(),le={_backpedal:B,anyPunctuation:te,autolink:re,blockSkip:/\[[^[\]]*?\]\([^\(\)]*?\)|`[^`]*?`|<[^<>]*?>/g,br:U,code:/^(`+)([^`]|[^`][\s\S]*?[^`])\1(?!`)/,del:B,emStrongLDelim:J,emStrongRDelimAst:K,emStrongRDelimUnd:ee,escape:W,link:oe,nolink:se,punctuation:Y,reflink:ae,reflinkSearch:C("reflink|nolink(?!\\()","g").replace("reflink",ae).replace("nolink",se).getRegex(),tag:ue,text:/^(`+|[^`])(?:(?= {2,}\n)|[\s\S]*?(?:(?=[\\<!\[`*_]|\b_|$)|[^ ](?= {2,}\n)))/,url:B},ce=Object.assign(Object.assign({},le),{},{link:C(/^!?\[(label)\]\((.*?)\)/).replace("label",ie).getRegex(),reflink:C(/^!?\[(label)\]\s*\[([^\]]*)\]/).replace("label",ie).getRegex()}),fe=Object.assign(Object.assign({},le),{},{escape:C(W).replace("])","~|])").getRegex(),url:C(/^((?:ftp|https?):\/\/|www\.)(?:[a-zA-Z0-9\-]+\.?)+[^\s<]*|^email/,"i").replace("email",/[A-Za-z0-9._+-]+(@)[a-zA-Z0-9-_]+(?:\.[a-zA-Z0-9-_]*[a-zA-Z0-9])+(?![-_])/).getRegex(),_backpedal:/(?:[^?!.,:;*_'"~()&]+|\([^)]*\)|&(?![a-zA-Z0-9]+;$)|[?!.,:;*_'"~)]+(?!$))+/,del:/^(~~?)(?=[^\s~])([\s\S]*?[^\s~])\1(?=[^~]|$)/,text:/^([`~]+|[^`~])(?:(?= {2,}\n)|(?=[a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-]+@)|[\s\S]*?(?:(?=[\\<!\[`*~_]|\b_|https?:\/\/|ftp:\/\/|www\.|$)|[^ ](?= {2,}\n)|[^a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-](?=[a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-]+@)))/}),he=Object.assign(Object.assign({},fe),{},{br:C(U).replace("{2,}","*").getRegex(),text:C(fe.text).replace("\\b_","\\b_| {2,}\\n").replace(/\{2,\}/g,"*").getRegex()}),pe={normal:N,gfm:H,pedantic:G},De={normal:le,gfm:fe,breaks:he,pedantic:ce},ge=function(){function e(t){s(this,e),this.tokens=void 0,this.options=void 0,this.state=void 0,this.tokenizer=void 0,this.inlineQueue=void 0,this.tokens=[],this.tokens.links=Object.create(null),this.options=t||D,this.options.tokenizer=this.options.tokenizer||new z,this.tokenizer=this.options.tokenizer,this.tokenizer.options=this.options,this.tokenizer.lexer=this,this.inlineQueue=[],this.state={inLink:!1,inRawBlock:!1,top:!0};var r={block:pe.normal,inline:De.normal};this.options.pedantic?(r.block=pe.pedantic,r.inline=De.pedantic):this.options.gfm&&(r.block=pe.gfm,this.options.breaks?r.inline=De.breaks:r.inline=De.gfm),this.tokenizer.rules=r}return f(e,[{key:"lex",value:function(e){e=e.replace(/\r\n|\r/g,"\n"),this.blockTokens(e,this.tokens);for(var t=0;t<this.inlineQueue.length;t++){var r=this.inlineQueue[t];this.inlineTokens(r.src,r.tokens)}return this.inlineQueue=[],this.tokens}},{key:"blockTokens",value:function(e){var t,r,n,u,i=this,o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];e=this.options.pedantic?e.replace(/\t/g,"    ").replace(/^ +$/gm,""):e.replace(/^( *)(\t+)/gm,(function(e,t,r){return t+"    ".repeat(r.length)}));for(var a,s=function(){if(i.options.extensions&&i.options.extensions.block&&i.options.extensions.block.some((function(r){return!!(t=r.call({lexer:i},e,o))&&(e=e.substring(t.raw.length),o.push(t),!0)})))return 0;if(t=i.tokenizer.space(e))return e=e.substring(t.raw.length),1===t.raw.length&&o.length>0?o[o.length-1].raw+="\n":o.push(t),0;if(t=i.tokenizer.code(e))return e=e.substring(t.raw.length),!(r=o[o.length-1])||"paragraph"!==r.type&&"text"!==r.type?o.push(t):(r.raw+="\n"+t.raw,r.text+="\n"+t.text,i.inlineQueue[i.inlineQueue.length-1].src=r.text),0;if(t=i.tokenizer.fences(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.heading(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.hr(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.blockquote(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.list(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.html(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.def(e))return e=e.substring(t.raw.length),!(r=o[o.length-1])||"paragraph"!==r.type&&"text"!==r.type?i.tokens.links[t.tag]||(i.tokens.links[t.tag]={href:t.href,title:t.title}):(r.raw+="\n"+t.raw,r.text+="\n"+t.raw,i.inlineQueue[i.inlineQueue.length-1].src=r.text),0;if(t=i.tokenizer.table(e))return e=e.substring(t.raw.length),o.push(t),0;if(t=i.tokenizer.lheading(e))return e=e.substring(t.raw.length),o.push(t),0;if(n=e,i.options.extensions&&i.options.extensions.startBlock){var a,s=1/0,l=e.slice(1);i.options.extensions.startBlock.forEach((function(e){"number"==typeof(a=e.call({lexer:i},l))&&a>=0&&(s=Math.min(s,a))})),s<1/0&&s>=0&&(n=e.substring(0,s+1))}if(i.state.top&&(t=i.tokenizer.paragraph(n)))return r=o[o.length-1],u&&"paragraph"===r.type?(r.raw+="\n"+t.raw,r.text+="\n"+t.text,i.inlineQueue.pop(),i.inlineQueue[i.inlineQueue.length-1].src=r.text):o.push(t),u=n.length!==e.length,e=e.substring(t.raw.length),0;if(t=i.tokenizer.text(e))return e=e.substring(t.raw.length),(r=o[o.length-1])&&"text"===r.type?(r.raw+="\n"+t.raw,r.text+="\n"+t.text,i.inlineQueue.pop(),i.inlineQueue[i.inlineQueue.length-1].src=r.text):o.push(t),0;if(e){var c="Infinite loop on byte: "+e.charCodeAt(0);if(i.options.silent)return console.error(c),1;throw new Error(c)}};e&&(0===(a=s())||1!==a););return this.state.top=!0,o}},{key:"inline",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];return this.inlineQueue.push({src:e,tokens:t}),t}},{key:"inlineTokens",value:function(e){var t,r,n,u,i,o,a=this,s=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],l=e;if(this.tokens.links){var c=Object.keys(this.tokens.links);if(c.length>0)for(;null!=(u=this.tokenizer.rules.inline.reflinkSearch.exec(l));)c.includes(u[0].slice(u[0].lastIndexOf("[")+1,-1))&&(l=l.slice(0,u.index)+"["+"a".repeat(u[0].length-2)+"]"+l.slice(this.tokenizer.rules.inline.reflinkSearch.lastIndex))}for(;null!=(u=this.tokenizer.rules.inline.blockSkip.exec(l));)l=l.slice(0,u.index)+"["+"a".repeat(u[0].length-2)+"]"+l.slice(this.tokenizer.rules.inline.blockSkip.lastIndex);for(;null!=(u=this.tokenizer.rules.inline.anyPunctuation.exec(l));)l=l.slice(0,u.index)+"++"+l.slice(this.tokenizer.rules.inline.anyPunctuation.lastIndex);for(var f,h=function(){if(i||(o=""),i=!1,a.options.extensions&&a.options.extensions.inline&&a.options.extensions.inline.some((function(r){return!!(t=r.call({lexer:a},e,s))&&(e=e.substring(t.raw.length),s.push(t),!0)})))return 0;if(t=a.tokenizer.escape(e))return e=e.substring(t.raw.length),s.push(t),0;if(t=a.tokenizer.tag(e))return e=e.substring(t.raw.length),(r=s[s.length-1])&&"text"===t.type&&"text"===r.type?(r.raw+=t.raw,r.text+=t.text):s.push(t),0;if(t=a.tokenizer.link(e))return e=e.substring(t.raw.length),s.push(t),0;if(t=a.tokenizer.reflink(e,a.tokens.links))return e=e.substring(t.raw.length),(r=s[s.length-1])&&"text"===t.type&&"text"===r.type?(r.raw+=t.raw,r.text+=t.text):s.push(t),0;if(t=a.tokenizer.emStrong(e,l,o))return e=e.substring(t.raw.length),s.push(t),0;if(t=a.tokenizer.codespan(e))return e=e.substring(t.raw.length),s.push(t),0;if(t=a.tokenizer.br(e))return e=e.substring(t.raw.length),s.push(t),0;if(t=a.tokenizer.del(e))return e=e.substring(t.raw.length),s.push(t),0;if(t=a.tokenizer.autolink(e))return e=e.substring(t.raw.length),s.push(t),0;if(!a.state.inLink&&(t=a.tokenizer.url(e)))return e=e.substring(t.raw.length),s.push(t),0;if(n=e,a.options.extensions&&a.options.extensions.startInline){var u,c=1/0,f=e.slice(1);a.options.extensions.startInline.forEach((function(e){"number"==typeof(u=e.call({lexer:a},f))&&u>=0&&(c=Math.min(c,u))})),c<1/0&&c>=0&&(n=e.substring(0,c+1))}if(t=a.tokenizer.inlineText(n))return e=e.substring(t.raw.length),"_"!==t.raw.slice(-1)&&(o=t.raw.slice(-1)),i=!0,(r=s[s.length-1])&&"text"===r.type?(r.raw+=t.raw,r.text+=t.text):s.push(t),0;if(e){var h="Infinite loop on byte: "+e.charCodeAt(0);if(a.options.silent)return console.error(h),1;throw new Error(h)}};e&&(0===(f=h())||1!==f););return s}}],[{key:"rules",get:function(){return{block:pe,inline:De}}},{key:"lex",value:function(t,r){return new e(r).lex(t)}},{key:"lexInline",value:function(t,r){return new e(r).inlineTokens(t)}}]),e}(),de=function(){function e(t){s(this,e),this.options=void 0,this.options=t||D}return f(e,[{key:"code",value:function(e,t,r){var n,u=null===(n=(t||"").match(/^\S*/))||void 0===n?void 0:n[0];return e=e.replace(/\n$/,"")+"\n",u?'<pre><code class="language-'+A(u)+'">'+(r?e:A(e,!0))+"</code></pre>\n":"<pre><code>"+(r?e:A(e,!0))+"</code></pre>\n"}},{key:"blockquote",value:function(e){return"<blockquote>\n".concat(e,"</blockquote>\n")}},{key:"html",value:function(e,t){return e}},{key:"heading",value:function(e,t,r){return"<h".concat(t,">").concat(e,"</h").concat(t,">\n")}},{key:"hr",value:function(){return"<hr>\n"}},{key:"list",value:function(e,t,r){var n=t?"ol":"ul";return"<"+n+(t&&1!==r?' start="'+r+'"':"")+">\n"+e+"</"+n+">\n"}},{key:"listitem",value:function(e,t,r){return"<li>".concat(e,"</li>\n")}},{key:"checkbox",value:function(e){return"<input "+(e?'checked="" ':"")+'disabled="" type="checkbox">'}},{key:"paragraph",value:function(e){return"<p>".concat(e,"</p>\n")}},{key:"table",value:function(e,t){return t&&(t="<tbody>".concat(t,"</tbody>")),"<table>\n<thead>\n"+e+"</thead>\n"+t+"</table>\n"}},{key:"tablerow",value:function(e){return"<tr>\n".concat(e,"</tr>\n")}},{key:"tablecell",value:function(e,t){var r=t.header?"th":"td";return(t.align?"<".concat(r,' align="').concat(t.align,'">'):"<".concat(r,">"))+e+"</".concat(r,">\n")}},{key:"strong",value:function(e){return"<strong>".concat(e,"</strong>")}},{key:"em",value:function(e){return"<em>".concat(e,"</em>")}},{key:"codespan",value:function(e){return"<code>".concat(e,"</code>")}},{key:"br",value:function(){return"<br>"}},{key:"del",value:function(e){return"<del>".concat(e,"</del>")}},{key:"link",value:function(e,t,r){var n=w(e);if(null===n)return r;var u='<a href="'+(e=n)+'"';return t&&(u+=' title="'+t+'"'),u+=">"+r+"</a>"}},{key:"image",value:function(e,t,r){var n=w(e);if(null===n)return r;var u='<img src="'.concat(e=n,'" alt="').concat(r,'"');return t&&(u+=' title="'.concat(t,'"')),u+=">"}},{key:"text",value:function(e){return e}}]),e}(),ve=function(){function e(){s(this,e)}return f(e,[{key:"strong",value:function(e){return e}},{key:"em",value:function(e){return e}},{key:"codespan",value:function(e){return e}},{key:"del",value:function(e){return e}},{key:"html",value:function(e){return e}},{key:"text",value:function(e){return e}},{key:"link",value:function(e,t,r){return""+r}},{key:"image",value:function(e,t,r){return""+r}},{key:"br",value:function(){return""}}]),e}(),ke=function(){function e(t){s(this,e),this.options=void 0,this.renderer=void 0,this.textRenderer=void 0,this.options=t||D,this.options.renderer=this.options.renderer||new de,this.renderer=this.options.renderer,this.renderer.options=this.options,this.textRenderer=new ve}return f(e,[{key:"parse",value:function(e){for(var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],r="",n=0;n<e.length;n++){var u=e[n];if(this.options.extensions&&this.options.extensions.renderers&&this.options.extensions.renderers[u.type]){var i=u,o=this.options.extensions.renderers[i.type].call({parser:this},i);if(!1!==o||!["space","hr","heading","code","table","blockquote","list","html","paragraph","text"].includes(i.type)){r+=o||"";continue}}switch(u.type){case"space":continue;case"hr":r+=this.renderer.hr();continue;case"heading":var a=u;r+=this.renderer.heading(this.parseInline(a.tokens),a.depth,b(this.parseInline(a.tokens,this.textRenderer)));continue;case"code":var s=u;r+=this.renderer.code(s.text,s.lang,!!s.escaped);continue;case"table":for(var l=u,c="",f="",h=0;h<l.header.length;h++)f+=this.renderer.tablecell(this.parseInline(l.header[h].tokens),{header:!0,align:l.align[h]});c+=this.renderer.tablerow(f);for(var p="",D=0;D<l.rows.length;D++){var g=l.rows[D];f="";for(var d=0;d<g.length;d++)f+=this.renderer.tablecell(this.parseInline(g[d].tokens),{header:!1,align:l.align[d]});p+=this.renderer.tablerow(f)}r+=this.renderer.table(c,p);continue;case"blockquote":var v=u,k=this.parse(v.tokens);r+=this.renderer.blockquote(k);continue;case"list":for(var x=u,m=x.ordered,F=x.start,A=x.loose,y="",E=0;E<x.items.length;E++){var C=x.items[E],w=C.checked,B=C.task,S="";if(C.task){var I=this.renderer.checkbox(!!w);A?C.tokens.length>0&&"paragraph"===C.tokens[0].type?(C.tokens[0].text=I+" "+C.tokens[0].text,C.tokens[0].tokens&&C.tokens[0].tokens.length>0&&"text"===C.tokens[0].tokens[0].type&&(C.tokens[0].tokens[0].text=I+" "+C.tokens[0].tokens[0].text)):C.tokens.unshift({type:"text",text:I+" "}):S+=I+" "}S+=this.parse(C.tokens,A),y+=this.renderer.listitem(S,B,!!w)}r+=this.renderer.list(y,m,F);continue;case"html":var T=u;r+=this.renderer.html(T.text,T.block);continue;case"paragraph":var z=u;r+=this.renderer.paragraph(this.parseInline(z.tokens));continue;case"text":for(var O=u,$=O.tokens?this.parseInline(O.tokens):O.text;n+1<e.length&&"text"===e[n+1].type;)$+="\n"+((O=e[++n]).tokens?this.parseInline(O.tokens):O.text);r+=t?this.renderer.paragraph($):$;continue;default:var R='Token with "'+u.type+'" type was not found.';if(this.options.silent)return console.error(R),"";throw new Error(R)}}return r}},{key:"parseInline",value:function(e,t){t=t||this.renderer;for(var r="",n=0;n<e.length;n++){var u=e[n];if(this.options.extensions&&this.options.extensions.renderers&&this.options.extensions.renderers[u.type]){var i=this.options.extensions.renderers[u.type].call({parser:this},u);if(!1!==i||!["escape","html","link","image","strong","em","codespan","br","del","text"].includes(u.type)){r+=i||"";continue}}switch(u.type){case"escape":var o=u;r+=t.text(o.text);break;case"html":var a=u;r+=t.html(a.text);break;case"link":var s=u;r+=t.link(s.href,s.title,this.parseInline(s.tokens,t));break;case"image":var l=u;r+=t.image(l.href,l.title,l.text);break;case"strong":var c=u;r+=t.strong(this.parseInline(c.tokens,t));break;case"em":var f=u;r+=t.em(this.parseInline(f.tokens,t));break;case"codespan":var h=u;r+=t.codespan(h.text);break;case"br":r+=t.br();break;case"del":var p=u;r+=t.del(this.parseInline(p.tokens,t));break;case"text":var D=u;r+=t.text(D.text);break;default:var g='Token with "'+u.type+'" type was not found.';if(this.options.silent)return console.error(g),"";throw new Error(g)}}return r}}],[{key:"parse",value:function(t,r){return new e(r).parse(t)}},{key:"parseInline",value:function(t,r){return new e(r).parseInline(t)}}]),e}(),xe=function(){function e(t){s(this,e),this.options=void 0,this.options=t||D}return f(e,[{key:"preprocess",value:function(e){return e}},{key:"postprocess",value:function(e){return e}},{key:"processAllTokens",value:function(e){return e}}]),e}();xe.passThroughHooks=new Set(["preprocess","postprocess","processAllTokens"]);var me=i("parseMarkdown"),Fe=i("onError"),Ae=function(){function e(){s(this,e),Object.defineProperty(this,Fe,{value:be}),Object.defineProperty(this,me,{value:ye}),this.defaults={async:!1,breaks:!1,extensions:null,gfm:!0,hooks:null,pedantic:!1,renderer:null,silent:!1,tokenizer:null,walkTokens:null},this.options=this.setOptions,this.parse=n(this,me)[me](ge.lex,ke.parse),this.parseInline=n(this,me)[me](ge.lexInline,ke.parseInline),this.Parser=ke,this.Renderer=de,this.TextRenderer=ve,this.Lexer=ge,this.Tokenizer=z,this.Hooks=xe,this.use.apply(this,arguments)}return f(e,[{key:"walkTokens",value:function(e,t){var r,n=this,u=[],i=(0,a.Z)(e);try{var o=function(){var e=r.value;switch(u=u.concat(t.call(n,e)),e.type){case"table":var i,o=e,s=(0,a.Z)(o.header);try{for(s.s();!(i=s.n()).done;){var l=i.value;u=u.concat(n.walkTokens(l.tokens,t))}}catch(x){s.e(x)}finally{s.f()}var c,f=(0,a.Z)(o.rows);try{for(f.s();!(c=f.n()).done;){var h,p=c.value,D=(0,a.Z)(p);try{for(D.s();!(h=D.n()).done;){var g=h.value;u=u.concat(n.walkTokens(g.tokens,t))}}catch(x){D.e(x)}finally{D.f()}}}catch(x){f.e(x)}finally{f.f()}break;case"list":var d=e;u=u.concat(n.walkTokens(d.items,t));break;default:var v,k=e;null!==(v=n.defaults.extensions)&&void 0!==v&&null!==(v=v.childTokens)&&void 0!==v&&v[k.type]?n.defaults.extensions.childTokens[k.type].forEach((function(e){u=u.concat(n.walkTokens(k[e],t))})):k.tokens&&(u=u.concat(n.walkTokens(k.tokens,t)))}};for(i.s();!(r=i.n()).done;)o()}catch(s){i.e(s)}finally{i.f()}return u}},{key:"use",value:function(){for(var e=this,t=this.defaults.extensions||{renderers:{},childTokens:{}},r=arguments.length,n=new Array(r),u=0;u<r;u++)n[u]=arguments[u];return n.forEach((function(r){var n=Object.assign({},r);if(n.async=e.defaults.async||n.async||!1,r.extensions&&(r.extensions.forEach((function(e){if(!e.name)throw new Error("extension name required");if("renderer"in e){var r=t.renderers[e.name];t.renderers[e.name]=r?function(){for(var t=arguments.length,n=new Array(t),u=0;u<t;u++)n[u]=arguments[u];var i=e.renderer.apply(this,n);return!1===i&&(i=r.apply(this,n)),i}:e.renderer}if("tokenizer"in e){if(!e.level||"block"!==e.level&&"inline"!==e.level)throw new Error("extension level must be 'block' or 'inline'");var n=t[e.level];n?n.unshift(e.tokenizer):t[e.level]=[e.tokenizer],e.start&&("block"===e.level?t.startBlock?t.startBlock.push(e.start):t.startBlock=[e.start]:"inline"===e.level&&(t.startInline?t.startInline.push(e.start):t.startInline=[e.start]))}"childTokens"in e&&e.childTokens&&(t.childTokens[e.name]=e.childTokens)})),n.extensions=t),r.renderer){var u=e.defaults.renderer||new de(e.defaults),i=function(){if(!(o in u))throw new Error("renderer '".concat(o,"' does not exist"));if("options"===o)return 1;var e=o,t=r.renderer[e],n=u[e];u[e]=function(){for(var e=arguments.length,r=new Array(e),i=0;i<e;i++)r[i]=arguments[i];var o=t.apply(u,r);return!1===o&&(o=n.apply(u,r)),o||""}};for(var o in r.renderer)i();n.renderer=u}if(r.tokenizer){var a=e.defaults.tokenizer||new z(e.defaults),s=function(){if(!(l in a))throw new Error("tokenizer '".concat(l,"' does not exist"));if(["options","rules","lexer"].includes(l))return 1;var e=l,t=r.tokenizer[e],n=a[e];a[e]=function(){for(var e=arguments.length,r=new Array(e),u=0;u<e;u++)r[u]=arguments[u];var i=t.apply(a,r);return!1===i&&(i=n.apply(a,r)),i}};for(var l in r.tokenizer)s();n.tokenizer=a}if(r.hooks){var c=e.defaults.hooks||new xe,f=function(){if(!(h in c))throw new Error("hook '".concat(h,"' does not exist"));if("options"===h)return 1;var t=h,n=r.hooks[t],u=c[t];xe.passThroughHooks.has(h)?c[t]=function(t){if(e.defaults.async)return Promise.resolve(n.call(c,t)).then((function(e){return u.call(c,e)}));var r=n.call(c,t);return u.call(c,r)}:c[t]=function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var i=n.apply(c,t);return!1===i&&(i=u.apply(c,t)),i}};for(var h in r.hooks)f();n.hooks=c}if(r.walkTokens){var p=e.defaults.walkTokens,D=r.walkTokens;n.walkTokens=function(e){var t=[];return t.push(D.call(this,e)),p&&(t=t.concat(p.call(this,e))),t}}e.defaults=Object.assign(Object.assign({},e.defaults),n)})),this}},{key:"setOptions",value:function(e){return this.defaults=Object.assign(Object.assign({},this.defaults),e),this}},{key:"lexer",value:function(e,t){return ge.lex(e,null!=t?t:this.defaults)}},{key:"parser",value:function(e,t){return ke.parse(e,null!=t?t:this.defaults)}}]),e}();function ye(e,t){var r=this;return function(u,i){var o=Object.assign({},i),a=Object.assign(Object.assign({},r.defaults),o);!0===r.defaults.async&&!1===o.async&&(a.silent||console.warn("marked(): The async option was set to true by an extension. The async: false option sent to parse will be ignored."),a.async=!0);var s=n(r,Fe)[Fe](!!a.silent,!!a.async);if(null==u)return s(new Error("marked(): input parameter is undefined or null"));if("string"!=typeof u)return s(new Error("marked(): input parameter is of type "+Object.prototype.toString.call(u)+", string expected"));if(a.hooks&&(a.hooks.options=a),a.async)return Promise.resolve(a.hooks?a.hooks.preprocess(u):u).then((function(t){return e(t,a)})).then((function(e){return a.hooks?a.hooks.processAllTokens(e):e})).then((function(e){return a.walkTokens?Promise.all(r.walkTokens(e,a.walkTokens)).then((function(){return e})):e})).then((function(e){return t(e,a)})).then((function(e){return a.hooks?a.hooks.postprocess(e):e})).catch(s);try{a.hooks&&(u=a.hooks.preprocess(u));var l=e(u,a);a.hooks&&(l=a.hooks.processAllTokens(l)),a.walkTokens&&r.walkTokens(l,a.walkTokens);var c=t(l,a);return a.hooks&&(c=a.hooks.postprocess(c)),c}catch(f){return s(f)}}}function be(e,t){return function(r){if(r.message+="\nPlease report this to https://github.com/markedjs/marked.",e){var n="<p>An error occurred:</p><pre>"+A(r.message+"",!0)+"</pre>";return t?Promise.resolve(n):n}if(t)return Promise.reject(r);throw r}}var Ee=new Ae;function Ce(e,t){return Ee.parse(e,t)}Ce.options=Ce.setOptions=function(e){return Ee.setOptions(e),Ce.defaults=Ee.defaults,g(Ce.defaults),Ce},Ce.getDefaults=p,Ce.defaults=D,Ce.use=function(){return Ee.use.apply(Ee,arguments),Ce.defaults=Ee.defaults,g(Ce.defaults),Ce},Ce.walkTokens=function(e,t){return Ee.walkTokens(e,t)},Ce.parseInline=Ee.parseInline,Ce.Parser=ke,Ce.parser=ke.parse,Ce.Renderer=de,Ce.TextRenderer=ve,Ce.Lexer=ge,Ce.lexer=ge.lex,Ce.Tokenizer=z,Ce.Hooks=xe,Ce.parse=Ce;Ce.options,Ce.setOptions,Ce.use,Ce.walkTokens,Ce.parseInline,ke.parse,ge.lex}}]);
+//# sourceMappingURL=8335.vCS8kqZjGH0.js.map
\ No newline at end of file
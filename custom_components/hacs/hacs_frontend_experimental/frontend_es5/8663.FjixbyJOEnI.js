@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8663],{41911:function(e,t,i){var n,r=i(88962),a=i(99312),o=i(81043),d=i(33368),l=i(71650),c=i(68308),s=i(82390),f=i(69205),p=i(91808),h=i(34541),u=i(47838),m=(i(97393),i(5095)),g=i(63335),v=i(21270),y=i(96762),x=i(95260),b=i(18394);(0,p.Z)([(0,x.Mo)("ha-check-list-item")],(function(e,t){var i,p=function(t){function i(){var t;(0,l.Z)(this,i);for(var n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return t=(0,c.Z)(this,i,[].concat(r)),e((0,s.Z)(t)),t}return(0,f.Z)(i,t),(0,d.Z)(i)}(t);return{F:p,d:[{kind:"method",key:"onChange",value:(i=(0,o.Z)((0,a.Z)().mark((function e(t){return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:(0,h.Z)((0,u.Z)(p.prototype),"onChange",this).call(this,t),(0,b.B)(this,t.type);case 2:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})},{kind:"field",static:!0,key:"styles",value:function(){return[y.W,v.W,(0,m.iv)(n||(n=(0,r.Z)([":host{--mdc-theme-secondary:var(--primary-color)}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic,:host([graphic=control]) .mdc-deprecated-list-item__graphic,:host([graphic=large]) .mdc-deprecated-list-item__graphic,:host([graphic=medium]) .mdc-deprecated-list-item__graphic{margin-inline-end:var(--mdc-list-item-graphic-margin,16px);margin-inline-start:0px;direction:var(--direction)}.mdc-deprecated-list-item__meta{flex-shrink:0;direction:var(--direction);margin-inline-start:auto;margin-inline-end:0}.mdc-deprecated-list-item__graphic{margin-top:var(--check-list-item-graphic-margin-top)}"])))]}}]}}),g.F)},74376:function(e,t,i){var n,r=i(88962),a=i(33368),o=i(71650),d=i(68308),l=i(82390),c=i(69205),s=i(91808),f=(i(97393),i(58417)),p=i(39274),h=i(5095),u=i(95260);(0,s.Z)([(0,u.Mo)("ha-checkbox")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return t=(0,d.Z)(this,i,[].concat(r)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",static:!0,key:"styles",value:function(){return[p.W,(0,h.iv)(n||(n=(0,r.Z)([":host{--mdc-theme-secondary:var(--primary-color)}"])))]}}]}}),f.A)},58663:function(e,t,i){i.r(t),i.d(t,{HaFormMultiSelect:function(){return k}});var n,r,a,o,d,l=i(46097),c=i(88962),s=i(33368),f=i(71650),p=i(68308),h=i(82390),u=i(69205),m=i(91808),g=(i(97393),i(82073),i(46349),i(70320),i(40271),i(60163),i(91989),i(85472),i(46798),i(9849),i(90126),i(65974),i(87438),i(22890),i(5095)),v=i(95260),y=i(18394);i(85878),i(41911),i(74376),i(48950),i(37662),i(51520);function x(e){return Array.isArray(e)?e[0]:e}function b(e){return Array.isArray(e)?e[1]||e[0]:e}var k=(0,m.Z)([(0,v.Mo)("ha-form-multi_select")],(function(e,t){var i=function(t){function i(){var t;(0,f.Z)(this,i);for(var n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return t=(0,p.Z)(this,i,[].concat(r)),e((0,h.Z)(t)),t}return(0,u.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,v.Cb)()],key:"schema",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"data",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.SB)()],key:"_opened",value:function(){return!1}},{kind:"field",decorators:[(0,v.IO)("ha-button-menu")],key:"_input",value:void 0},{kind:"method",key:"focus",value:function(){this._input&&this._input.focus()}},{kind:"method",key:"render",value:function(){var e=this,t=Array.isArray(this.schema.options)?this.schema.options:Object.entries(this.schema.options),i=this.data||[];return t.length<6?(0,g.dy)(n||(n=(0,c.Z)(["<div> ",""," </div> "])),this.label,t.map((function(t){var n=x(t);return(0,g.dy)(r||(r=(0,c.Z)([' <ha-formfield .label="','"> <ha-checkbox .checked="','" .value="','" .disabled="','" @change="','"></ha-checkbox> </ha-formfield> '])),b(t),i.includes(n),n,e.disabled,e._valueChanged)}))):(0,g.dy)(a||(a=(0,c.Z)([' <ha-button-menu .disabled="','" fixed @opened="','" @closed="','" multi activatable> <ha-textfield slot="trigger" .label="','" .value="','" .disabled="','" tabindex="-1"></ha-textfield> <ha-svg-icon slot="trigger" .path="','"></ha-svg-icon> '," </ha-button-menu> "])),this.disabled,this._handleOpen,this._handleClose,this.label,i.map((function(e){return b(t.find((function(t){return x(t)===e})))||e})).join(", "),this.disabled,this._opened?"M7,15L12,10L17,15H7Z":"M7,10L12,15L17,10H7Z",t.map((function(t){var n=x(t),r=i.includes(n);return(0,g.dy)(o||(o=(0,c.Z)(['<ha-check-list-item left .selected="','" .activated="','" @request-selected="','" .value="','" .disabled="','"> '," </ha-check-list-item>"])),r,r,e._selectedChanged,n,e.disabled,b(t))})))}},{kind:"method",key:"firstUpdated",value:function(){var e=this;this.updateComplete.then((function(){var t,i=(null===(t=e.shadowRoot)||void 0===t?void 0:t.querySelector("ha-textfield"))||{},n=i.formElement,r=i.mdcRoot;n&&(n.style.textOverflow="ellipsis"),r&&(r.style.cursor="pointer")}))}},{kind:"method",key:"updated",value:function(e){e.has("schema")&&this.toggleAttribute("own-margin",Object.keys(this.schema.options).length>=6&&!!this.schema.required)}},{kind:"method",key:"_selectedChanged",value:function(e){e.stopPropagation(),"property"!==e.detail.source&&this._handleValueChanged(e.target.value,e.detail.selected)}},{kind:"method",key:"_valueChanged",value:function(e){var t=e.target,i=t.value,n=t.checked;this._handleValueChanged(i,n)}},{kind:"method",key:"_handleValueChanged",value:function(e,t){var i;if(t)if(this.data){if(this.data.includes(e))return;i=[].concat((0,l.Z)(this.data),[e])}else i=[e];else{if(!this.data.includes(e))return;i=this.data.filter((function(t){return t!==e}))}(0,y.B)(this,"value-changed",{value:i})}},{kind:"method",key:"_handleOpen",value:function(e){e.stopPropagation(),this._opened=!0,this.toggleAttribute("opened",!0)}},{kind:"method",key:"_handleClose",value:function(e){e.stopPropagation(),this._opened=!1,this.toggleAttribute("opened",!1)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,g.iv)(d||(d=(0,c.Z)([":host([own-margin]){margin-bottom:5px}ha-button-menu{display:block;cursor:pointer}ha-formfield{display:block;padding-right:16px;padding-inline-end:16px;padding-inline-start:initial;direction:var(--direction)}ha-textfield{display:block;pointer-events:none}ha-svg-icon{color:var(--input-dropdown-icon-color);position:absolute;right:1em;top:1em;cursor:pointer;inset-inline-end:1em;inset-inline-start:initial;direction:var(--direction)}:host([opened]) ha-svg-icon{color:var(--primary-color)}:host([opened]) ha-button-menu{--mdc-text-field-idle-line-color:var(--input-hover-line-color);--mdc-text-field-label-ink-color:var(--primary-color)}"])))}}]}}),g.oi)},48950:function(e,t,i){var n,r=i(88962),a=i(33368),o=i(71650),d=i(68308),l=i(82390),c=i(69205),s=i(91808),f=(i(97393),i(8485)),p=i(92038),h=i(5095),u=i(95260),m=i(18394);(0,s.Z)([(0,u.Mo)("ha-formfield")],(function(e,t){var i=function(t){function i(){var t;(0,o.Z)(this,i);for(var n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return t=(0,d.Z)(this,i,[].concat(r)),e((0,l.Z)(t)),t}return(0,c.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"method",key:"_labelClick",value:function(){var e=this.input;if(e&&(e.focus(),!e.disabled))switch(e.tagName){case"HA-CHECKBOX":e.checked=!e.checked,(0,m.B)(e,"change");break;case"HA-RADIO":e.checked=!0,(0,m.B)(e,"change");break;default:e.click()}}},{kind:"field",static:!0,key:"styles",value:function(){return[p.W,(0,h.iv)(n||(n=(0,r.Z)([":host(:not([alignEnd])) ::slotted(ha-switch){margin-right:10px;margin-inline-end:10px;margin-inline-start:inline}.mdc-form-field>label{direction:var(--direction);margin-inline-start:0;margin-inline-end:auto;padding-inline-start:4px;padding-inline-end:0}"])))]}}]}}),f.a)},51520:function(e,t,i){var n,r,a,o,d=i(88962),l=i(33368),c=i(71650),s=i(68308),f=i(82390),p=i(69205),h=i(91808),u=i(34541),m=i(47838),g=(i(97393),i(42977)),v=i(31338),y=i(5095),x=i(95260),b=i(67684);(0,h.Z)([(0,x.Mo)("ha-textfield")],(function(e,t){var i=function(t){function i(){var t;(0,c.Z)(this,i);for(var n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return t=(0,s.Z)(this,i,[].concat(r)),e((0,f.Z)(t)),t}return(0,p.Z)(i,t),(0,l.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"invalid",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)({type:Boolean})],key:"iconTrailing",value:function(){return!1}},{kind:"field",decorators:[(0,x.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,x.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,x.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,x.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,u.Z)((0,m.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=t?"trailing":"leading";return(0,y.dy)(n||(n=(0,d.Z)([' <span class="mdc-text-field__icon mdc-text-field__icon--','" tabindex="','"> <slot name="','Icon"></slot> </span> '])),i,t?1:-1,i)}},{kind:"field",static:!0,key:"styles",value:function(){return[v.W,(0,y.iv)(r||(r=(0,d.Z)([".mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}"]))),"rtl"===b.E.document.dir?(0,y.iv)(a||(a=(0,d.Z)([".mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}"]))):(0,y.iv)(o||(o=(0,d.Z)([""])))]}}]}}),g.P)},8485:function(e,t,i){i.d(t,{a:function(){return _}});var n,r=i(88962),a=i(99312),o=i(81043),d=i(71650),l=i(33368),c=i(68308),s=i(69205),f=i(43204),p=i(72774),h={ROOT:"mdc-form-field"},u={LABEL_SELECTOR:".mdc-form-field > label"},m=function(e){function t(i){var n=e.call(this,(0,f.__assign)((0,f.__assign)({},t.defaultAdapter),i))||this;return n.click=function(){n.handleClick()},n}return(0,f.__extends)(t,e),Object.defineProperty(t,"cssClasses",{get:function(){return h},enumerable:!1,configurable:!0}),Object.defineProperty(t,"strings",{get:function(){return u},enumerable:!1,configurable:!0}),Object.defineProperty(t,"defaultAdapter",{get:function(){return{activateInputRipple:function(){},deactivateInputRipple:function(){},deregisterInteractionHandler:function(){},registerInteractionHandler:function(){}}},enumerable:!1,configurable:!0}),t.prototype.init=function(){this.adapter.registerInteractionHandler("click",this.click)},t.prototype.destroy=function(){this.adapter.deregisterInteractionHandler("click",this.click)},t.prototype.handleClick=function(){var e=this;this.adapter.activateInputRipple(),requestAnimationFrame((function(){e.adapter.deactivateInputRipple()}))},t}(p.K),g=i(78220),v=i(18601),y=i(14114),x=i(5095),b=i(95260),k=i(53180),_=function(e){function t(){var e;return(0,d.Z)(this,t),(e=(0,c.Z)(this,t,arguments)).alignEnd=!1,e.spaceBetween=!1,e.nowrap=!1,e.label="",e.mdcFoundationClass=m,e}return(0,s.Z)(t,e),(0,l.Z)(t,[{key:"createAdapter",value:function(){var e,t,i=this;return{registerInteractionHandler:function(e,t){i.labelEl.addEventListener(e,t)},deregisterInteractionHandler:function(e,t){i.labelEl.removeEventListener(e,t)},activateInputRipple:(t=(0,o.Z)((0,a.Z)().mark((function e(){var t,n;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!((t=i.input)instanceof v.Wg)){e.next=6;break}return e.next=4,t.ripple;case 4:(n=e.sent)&&n.startPress();case 6:case"end":return e.stop()}}),e)}))),function(){return t.apply(this,arguments)}),deactivateInputRipple:(e=(0,o.Z)((0,a.Z)().mark((function e(){var t,n;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!((t=i.input)instanceof v.Wg)){e.next=6;break}return e.next=4,t.ripple;case 4:(n=e.sent)&&n.endPress();case 6:case"end":return e.stop()}}),e)}))),function(){return e.apply(this,arguments)})}}},{key:"input",get:function(){var e,t;return null!==(t=null===(e=this.slottedInputs)||void 0===e?void 0:e[0])&&void 0!==t?t:null}},{key:"render",value:function(){var e={"mdc-form-field--align-end":this.alignEnd,"mdc-form-field--space-between":this.spaceBetween,"mdc-form-field--nowrap":this.nowrap};return(0,x.dy)(n||(n=(0,r.Z)([' <div class="mdc-form-field ','"> <slot></slot> <label class="mdc-label" @click="','">',"</label> </div>"])),(0,k.$)(e),this._labelClick,this.label)}},{key:"click",value:function(){this._labelClick()}},{key:"_labelClick",value:function(){var e=this.input;e&&(e.focus(),e.click())}}]),t}(g.H);(0,f.__decorate)([(0,b.Cb)({type:Boolean})],_.prototype,"alignEnd",void 0),(0,f.__decorate)([(0,b.Cb)({type:Boolean})],_.prototype,"spaceBetween",void 0),(0,f.__decorate)([(0,b.Cb)({type:Boolean})],_.prototype,"nowrap",void 0),(0,f.__decorate)([(0,b.Cb)({type:String}),(0,y.P)(function(){var e=(0,o.Z)((0,a.Z)().mark((function e(t){var i;return(0,a.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:null===(i=this.input)||void 0===i||i.setAttribute("aria-label",t);case 1:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}())],_.prototype,"label",void 0),(0,f.__decorate)([(0,b.IO)(".mdc-form-field")],_.prototype,"mdcRoot",void 0),(0,f.__decorate)([(0,b.vZ)("",!0,"*")],_.prototype,"slottedInputs",void 0),(0,f.__decorate)([(0,b.IO)("label")],_.prototype,"labelEl",void 0)},92038:function(e,t,i){i.d(t,{W:function(){return a}});var n,r=i(88962),a=(0,i(5095).iv)(n||(n=(0,r.Z)([".mdc-form-field{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87));display:inline-flex;align-items:center;vertical-align:middle}.mdc-form-field>label{margin-left:0;margin-right:auto;padding-left:4px;padding-right:0;order:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{margin-left:auto;margin-right:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{padding-left:0;padding-right:4px}.mdc-form-field--nowrap>label{text-overflow:ellipsis;overflow:hidden;white-space:nowrap}.mdc-form-field--align-end>label{margin-left:auto;margin-right:0;padding-left:0;padding-right:4px;order:-1}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{margin-left:0;margin-right:auto}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{padding-left:4px;padding-right:0}.mdc-form-field--space-between{justify-content:space-between}.mdc-form-field--space-between>label{margin:0}.mdc-form-field--space-between>label[dir=rtl],[dir=rtl] .mdc-form-field--space-between>label{margin:0}:host{display:inline-flex}.mdc-form-field{width:100%}::slotted(*){-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87))}::slotted(mwc-switch){margin-right:10px}::slotted(mwc-switch[dir=rtl]),[dir=rtl] ::slotted(mwc-switch){margin-left:10px}"])))},63335:function(e,t,i){i.d(t,{F:function(){return b}});var n=i(99312),r=i(81043),a=i(88962),o=i(71650),d=i(33368),l=i(68308),c=i(69205),s=i(43204),f=i(95260),p=i(58417),h=i(39274),u=function(e){function t(){return(0,o.Z)(this,t),(0,l.Z)(this,t,arguments)}return(0,c.Z)(t,e),(0,d.Z)(t)}(p.A);u.styles=[h.W],u=(0,s.__decorate)([(0,f.Mo)("mwc-checkbox")],u);var m,g,v,y=i(5095),x=i(53180),b=function(e){function t(){var e;return(0,o.Z)(this,t),(e=(0,l.Z)(this,t,arguments)).left=!1,e.graphic="control",e}var i;return(0,c.Z)(t,e),(0,d.Z)(t,[{key:"render",value:function(){var e={"mdc-deprecated-list-item__graphic":this.left,"mdc-deprecated-list-item__meta":!this.left},t=this.renderText(),i=this.graphic&&"control"!==this.graphic&&!this.left?this.renderGraphic():(0,y.dy)(m||(m=(0,a.Z)([""]))),n=this.hasMeta&&this.left?this.renderMeta():(0,y.dy)(g||(g=(0,a.Z)([""]))),r=this.renderRipple();return(0,y.dy)(v||(v=(0,a.Z)([" "," "," ",' <span class="','"> <mwc-checkbox reducedTouchTarget tabindex="','" .checked="','" ?disabled="','" @change="','"> </mwc-checkbox> </span> '," ",""])),r,i,this.left?"":t,(0,x.$)(e),this.tabindex,this.selected,this.disabled,this.onChange,this.left?t:"",n)}},{key:"onChange",value:(i=(0,r.Z)((0,n.Z)().mark((function e(t){var i;return(0,n.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(i=t.target,this.selected===i.checked){e.next=8;break}return this._skipPropRequest=!0,this.selected=i.checked,e.next=7,this.updateComplete;case 7:this._skipPropRequest=!1;case 8:case"end":return e.stop()}}),e,this)}))),function(e){return i.apply(this,arguments)})}]),t}(i(61092).K);(0,s.__decorate)([(0,f.IO)("slot")],b.prototype,"slotElement",void 0),(0,s.__decorate)([(0,f.IO)("mwc-checkbox")],b.prototype,"checkboxElement",void 0),(0,s.__decorate)([(0,f.Cb)({type:Boolean})],b.prototype,"left",void 0),(0,s.__decorate)([(0,f.Cb)({type:String,reflect:!0})],b.prototype,"graphic",void 0)},21270:function(e,t,i){i.d(t,{W:function(){return a}});var n,r=i(88962),a=(0,i(5095).iv)(n||(n=(0,r.Z)([":host(:not([twoline])){height:56px}:host(:not([left])) .mdc-deprecated-list-item__meta{height:40px;width:40px}"])))}}]);
+//# sourceMappingURL=8663.FjixbyJOEnI.js.map
\ No newline at end of file
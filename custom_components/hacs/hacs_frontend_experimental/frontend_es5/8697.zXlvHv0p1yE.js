@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8697],{48697:function(n,e,s){s.r(e);var t=s(56087);t.ZP.mount(t.V8,new t.lK),e.default=t.ZP}}]);
+//# sourceMappingURL=8697.zXlvHv0p1yE.js.map
\ No newline at end of file
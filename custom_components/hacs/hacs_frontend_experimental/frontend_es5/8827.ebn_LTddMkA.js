@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8827],{28827:function(n,r,t){t.r(r),t.d(r,{HaIconPrev:function(){return s}});var e=t(33368),c=t(71650),o=t(68308),u=t(82390),a=t(69205),i=t(91808),f=(t(97393),t(95260)),L=t(67684),h=t(37662),s=(0,i.Z)([(0,f.Mo)("ha-icon-prev")],(function(n,r){var t=function(r){function t(){var r;(0,c.Z)(this,t);for(var e=arguments.length,a=new Array(e),i=0;i<e;i++)a[i]=arguments[i];return r=(0,o.Z)(this,t,[].concat(a)),n((0,u.Z)(r)),r}return(0,a.Z)(t,r),(0,e.Z)(t)}(r);return{F:t,d:[{kind:"field",decorators:[(0,f.Cb)()],key:"path",value:function(){return"rtl"===L.E.document.dir?"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z":"M15.41,16.58L10.83,12L15.41,7.41L14,6L8,12L14,18L15.41,16.58Z"}}]}}),h.HaSvgIcon)}}]);
+//# sourceMappingURL=8827.ebn_LTddMkA.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[8874],{48874:function(e,a,i){i.r(a),i.d(a,{HaFormExpendable:function(){return m}});var n,t,o,d,s=i(88962),r=i(33368),c=i(71650),h=i(68308),l=i(82390),u=i(69205),p=i(91808),v=(i(97393),i(46798),i(94570),i(5095)),f=i(95260),m=(i(39663),(0,p.Z)([(0,f.Mo)("ha-form-expandable")],(function(e,a){var i=function(a){function i(){var a;(0,c.Z)(this,i);for(var n=arguments.length,t=new Array(n),o=0;o<n;o++)t[o]=arguments[o];return a=(0,h.Z)(this,i,[].concat(t)),e((0,l.Z)(a)),a}return(0,u.Z)(i,a),(0,r.Z)(i)}(a);return{F:i,d:[{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"data",value:void 0},{kind:"field",decorators:[(0,f.Cb)({attribute:!1})],key:"schema",value:void 0},{kind:"field",decorators:[(0,f.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,f.Cb)()],key:"computeLabel",value:void 0},{kind:"field",decorators:[(0,f.Cb)()],key:"computeHelper",value:void 0},{kind:"method",key:"render",value:function(){var e,a;return(0,v.dy)(n||(n=(0,s.Z)([' <ha-expansion-panel outlined .expanded="','"> <div slot="header" role="heading" aria-level="','"> '," ",' </div> <div class="content"> <ha-form .hass="','" .data="','" .schema="','" .disabled="','" .computeLabel="','" .computeHelper="','"></ha-form> </div> </ha-expansion-panel> '])),Boolean(this.schema.expanded),null!==(e=null===(a=this.schema.headingLevel)||void 0===a?void 0:a.toString())&&void 0!==e?e:"3",this.schema.icon?(0,v.dy)(t||(t=(0,s.Z)([' <ha-icon .icon="','"></ha-icon> '])),this.schema.icon):this.schema.iconPath?(0,v.dy)(o||(o=(0,s.Z)([' <ha-svg-icon .path="','"></ha-svg-icon> '])),this.schema.iconPath):v.Ld,this.schema.title,this.hass,this.data,this.schema.schema,this.disabled,this.computeLabel,this.computeHelper)}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(d||(d=(0,s.Z)([":host{display:flex!important;flex-direction:column}:host ha-form{display:block}.content{padding:12px}ha-expansion-panel{display:block;--expansion-panel-content-padding:0;border-radius:6px;--ha-card-border-radius:6px}ha-icon,ha-svg-icon{color:var(--secondary-text-color)}"])))}}]}}),v.oi))}}]);
+//# sourceMappingURL=8874.v9_ZhWB8pTA.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9146],{59146:function(r,o,e){e.r(o),e.d(o,{EditorState:function(){return i.yy},EditorView:function(){return l.tk},autocompletion:function(){return d.ys},crosshairCursor:function(){return l.S2},defaultKeymap:function(){return t.wQ},drawSelection:function(){return l.Uw},haSyntaxHighlighting:function(){return f},haTheme:function(){return v},highlightActiveLine:function(){return l.ZO},highlightSelectionMatches:function(){return m.sW},highlightingFor:function(){return a.QN},history:function(){return t.m8},historyKeymap:function(){return t.f$},keymap:function(){return l.$f},langCompartment:function(){return u},langs:function(){return g},lineNumbers:function(){return l.Eu},readonlyCompartment:function(){return s},rectangularSelection:function(){return l.Zs},searchKeymap:function(){return m.Lp},tabKeyBindings:function(){return b},tags:function(){return p.pJ}});e(22859),e(7507);var t=e(65300),a=e(67289),c=e(17429),n=e(76697),i=e(74075),l=e(58626),p=e(35905),d=e(90561),m=e(52456),g={jinja2:a.il.define(c.b),yaml:a.il.define(n.r)},u=new i.F6,s=new i.F6,b=[{key:"Tab",run:t.at},{key:"Shift-Tab",run:t.xi}],v=l.tk.theme({"&":{color:"var(--primary-text-color)",backgroundColor:"var(--code-editor-background-color, var(--mdc-text-field-fill-color, whitesmoke))",borderRadius:"var(--mdc-shape-small, 4px) var(--mdc-shape-small, 4px) 0px 0px",caretColor:"var(--secondary-text-color)",height:"var(--code-mirror-height, auto)",maxHeight:"var(--code-mirror-max-height, unset)"},"&.cm-editor.cm-focused":{outline:"none"},"&.cm-focused .cm-cursor":{borderLeftColor:"var(--secondary-text-color)"},".cm-selectionBackground, ::selection":{backgroundColor:"rgba(var(--rgb-primary-color), 0.1)"},"&.cm-focused > .cm-scroller > .cm-selectionLayer .cm-selectionBackground":{backgroundColor:"rgba(var(--rgb-primary-color), 0.2)"},".cm-activeLine":{backgroundColor:"rgba(var(--rgb-secondary-text-color), 0.1)"},".cm-scroller":{outline:"none"},".cm-content":{caretColor:"var(--secondary-text-color)",paddingTop:"16px",paddingBottom:"16px"},".cm-panels":{backgroundColor:"var(--primary-background-color)",color:"var(--primary-text-color)"},".cm-panels.top":{borderBottom:"1px solid var(--divider-color)"},".cm-panels.bottom":{borderTop:"1px solid var(--divider-color)"},".cm-button":{border:"1px solid var(--primary-color)",padding:"0px 16px",textTransform:"uppercase",margin:"4px",background:"none",color:"var(--primary-color)",fontFamily:"var(--mdc-typography-button-font-family, var(--mdc-typography-font-family, Roboto, sans-serif))",fontSize:"var(--mdc-typography-button-font-size, 0.875rem)",height:"36px",fontWeight:"var(--mdc-typography-button-font-weight, 500)",borderRadius:"4px",letterSpacing:"var(--mdc-typography-button-letter-spacing, 0.0892857em)"},".cm-textfield":{padding:"4px 0px 5px",borderRadius:"0",fontSize:"16px",color:"var(--primary-text-color)",border:"0",background:"none",fontFamily:"Roboto",borderBottom:"1px solid var(--secondary-text-color)",margin:"4px 4px 0","& ::placeholder":{color:"var(--secondary-text-color)"},"&:focus":{outline:"none",borderBottom:"2px solid var(--primary-color)",paddingBottom:"4px"}},".cm-tooltip":{color:"var(--primary-text-color)",backgroundColor:"var(--code-editor-background-color, var(--card-background-color))",border:"1px solid var(--divider-color)",borderRadius:"var(--mdc-shape-medium, 4px)",boxShadow:"0px 5px 5px -3px rgb(0 0 0 / 20%), 0px 8px 10px 1px rgb(0 0 0 / 14%), 0px 3px 14px 2px rgb(0 0 0 / 12%)"},"& .cm-tooltip.cm-tooltip-autocomplete > ul > li":{padding:"4px 8px"},"& .cm-tooltip-autocomplete ul li[aria-selected]":{background:"var(--primary-color)",color:"var(--text-primary-color)"},".cm-completionIcon":{display:"none"},".cm-completionDetail":{fontFamily:"Roboto",color:"var(--secondary-text-color)"},"li[aria-selected] .cm-completionDetail":{color:"var(--text-primary-color)"},"& .cm-completionInfo.cm-completionInfo-right":{left:"calc(100% + 4px)"},"& .cm-tooltip.cm-completionInfo":{padding:"4px 8px",marginTop:"-5px"},".cm-selectionMatch":{backgroundColor:"rgba(var(--rgb-primary-color), 0.1)"},".cm-searchMatch":{backgroundColor:"rgba(var(--rgb-accent-color), .2)",outline:"1px solid rgba(var(--rgb-accent-color), .4)"},".cm-searchMatch.selected":{backgroundColor:"rgba(var(--rgb-accent-color), .4)",outline:"1px solid var(--accent-color)"},".cm-gutters":{backgroundColor:"var(--code-editor-gutter-color, var(--secondary-background-color, whitesmoke))",color:"var(--paper-dialog-color, var(--secondary-text-color))",border:"none",borderRight:"1px solid var(--secondary-text-color)",paddingRight:"1px"},"&.cm-focused .cm-gutters":{borderRight:"2px solid var(--primary-color)",paddingRight:"0"},".cm-gutterElement.lineNumber":{color:"inherit"}}),x=a.Qf.define([{tag:p.pJ.keyword,color:"var(--codemirror-keyword, #6262FF)"},{tag:[p.pJ.name,p.pJ.deleted,p.pJ.character,p.pJ.propertyName,p.pJ.macroName],color:"var(--codemirror-property, #905)"},{tag:[p.pJ.function(p.pJ.variableName),p.pJ.labelName],color:"var(--codemirror-variable, #07a)"},{tag:[p.pJ.color,p.pJ.constant(p.pJ.name),p.pJ.standard(p.pJ.name)],color:"var(--codemirror-qualifier, #690)"},{tag:[p.pJ.definition(p.pJ.name),p.pJ.separator],color:"var(--codemirror-def, #8DA6CE)"},{tag:[p.pJ.typeName,p.pJ.className,p.pJ.number,p.pJ.changed,p.pJ.annotation,p.pJ.modifier,p.pJ.self,p.pJ.namespace],color:"var(--codemirror-number, #ca7841)"},{tag:[p.pJ.operator,p.pJ.operatorKeyword,p.pJ.url,p.pJ.escape,p.pJ.regexp,p.pJ.link,p.pJ.special(p.pJ.string)],color:"var(--codemirror-operator, #cda869)"},{tag:p.pJ.comment,color:"var(--codemirror-comment, #777)"},{tag:p.pJ.meta,color:"var(--codemirror-meta, var(--primary-text-color))"},{tag:p.pJ.strong,fontWeight:"bold"},{tag:p.pJ.emphasis,fontStyle:"italic"},{tag:p.pJ.link,color:"var(--primary-color)",textDecoration:"underline"},{tag:p.pJ.heading,fontWeight:"bold"},{tag:p.pJ.atom,color:"var(--codemirror-atom, #F90)"},{tag:p.pJ.bool,color:"var(--codemirror-atom, #F90)"},{tag:p.pJ.special(p.pJ.variableName),color:"var(--codemirror-variable-2, #690)"},{tag:p.pJ.processingInstruction,color:"var(--secondary-text-color)"},{tag:p.pJ.string,color:"var(--codemirror-string, #07a)"},{tag:p.pJ.inserted,color:"var(--codemirror-string2, #07a)"},{tag:p.pJ.invalid,color:"var(--error-color)"}]),f=(0,a.nF)(x)}}]);
+//# sourceMappingURL=9146.ab8uSmRRLIE.js.map
\ No newline at end of file
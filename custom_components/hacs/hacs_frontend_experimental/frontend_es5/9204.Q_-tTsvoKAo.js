@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9204],{86089:function(e,t,a){a.d(t,{U:function(){return r}});var r=function(e){return e.stopPropagation()}},7265:function(e,t,a){var r,i,n=a(88962),d=a(33368),l=a(71650),o=a(68308),u=a(82390),h=a(69205),s=a(91808),c=(a(97393),a(5095)),v=a(95260);(0,s.Z)([(0,v.Mo)("ha-input-helper-text")],(function(e,t){var a=function(t){function a(){var t;(0,l.Z)(this,a);for(var r=arguments.length,i=new Array(r),n=0;n<r;n++)i[n]=arguments[n];return t=(0,o.Z)(this,a,[].concat(i)),e((0,u.Z)(t)),t}return(0,h.Z)(a,t),(0,d.Z)(a)}(t);return{F:a,d:[{kind:"method",key:"render",value:function(){return(0,c.dy)(r||(r=(0,n.Z)(["<slot></slot>"])))}},{kind:"field",static:!0,key:"styles",value:function(){return(0,c.iv)(i||(i=(0,n.Z)([":host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}"])))}}]}}),c.oi)},50527:function(e,t,a){a.r(t),a.d(t,{HaObjectSelector:function(){return p}});var r,i,n=a(88962),d=a(33368),l=a(71650),o=a(68308),u=a(82390),h=a(69205),s=a(91808),c=a(34541),v=a(47838),f=(a(97393),a(5095)),k=a(95260),y=a(18394),p=(a(80392),a(7265),(0,s.Z)([(0,k.Mo)("ha-selector-object")],(function(e,t){var a=function(t){function a(){var t;(0,l.Z)(this,a);for(var r=arguments.length,i=new Array(r),n=0;n<r;n++)i[n]=arguments[n];return t=(0,o.Z)(this,a,[].concat(i)),e((0,u.Z)(t)),t}return(0,h.Z)(a,t),(0,d.Z)(a)}(t);return{F:a,d:[{kind:"field",decorators:[(0,k.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,k.Cb)()],key:"placeholder",value:void 0},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,k.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,k.IO)("ha-yaml-editor",!0)],key:"_yamlEditor",value:void 0},{kind:"field",key:"_valueChangedFromChild",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,f.dy)(r||(r=(0,n.Z)(['<ha-yaml-editor .hass="','" .readonly="','" .label="','" .required="','" .placeholder="','" .defaultValue="','" @value-changed="','"></ha-yaml-editor> '," "])),this.hass,this.disabled,this.label,this.required,this.placeholder,this.value,this._handleChange,this.helper?(0,f.dy)(i||(i=(0,n.Z)(["<ha-input-helper-text>","</ha-input-helper-text>"])),this.helper):"")}},{kind:"method",key:"updated",value:function(e){(0,c.Z)((0,v.Z)(a.prototype),"updated",this).call(this,e),e.has("value")&&!this._valueChangedFromChild&&this._yamlEditor.setValue(this.value),this._valueChangedFromChild=!1}},{kind:"method",key:"_handleChange",value:function(e){this._valueChangedFromChild=!0;var t=e.target.value;e.target.isValid&&this.value!==t&&(0,y.B)(this,"value-changed",{value:t})}}]}}),f.oi))}}]);
+//# sourceMappingURL=9204.Q_-tTsvoKAo.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 9255.g3e6_es7qE4.js.LICENSE.txt */
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9255],{89255:function(n,e,t){t.r(e),t.d(e,{HaIconSelector:function(){return k}});var i,r=t(88962),o=t(33368),u=t(71650),l=t(68308),a=t(82390),c=t(69205),s=t(91808),d=(t(97393),t(5095)),v=t(95260),f=t(36142),h=t(18394),_=t(36655),$=t(81454),A=t(30045),k=(0,s.Z)([(0,v.Mo)("ha-selector-icon")],(function(n,e){var t=function(e){function t(){var e;(0,u.Z)(this,t);for(var i=arguments.length,r=new Array(i),o=0;o<i;o++)r[o]=arguments[o];return e=(0,l.Z)(this,t,[].concat(r)),n((0,a.Z)(e)),e}return(0,c.Z)(t,e),(0,o.Z)(t)}(e);return{F:t,d:[{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,v.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,v.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,v.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,v.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,v.Cb)()],key:"context",value:void 0},{kind:"method",key:"render",value:function(){var n,e,t,o,u,l,a=null===(n=this.context)||void 0===n?void 0:n.icon_entity,c=a?this.hass.states[a]:void 0,s=(null===(e=this.selector.icon)||void 0===e?void 0:e.placeholder)||(null==c?void 0:c.attributes.icon)||c&&(0,f.C)((0,A.gD)(this.hass,c)),v=!s&&c?(0,$.K)((0,_.M)(a),c):void 0;return(0,d.dy)(i||(i=(0,r.Z)([' <ha-icon-picker .hass="','" .label="','" .value="','" .required="','" .disabled="','" .helper="','" .fallbackPath="','" .placeholder="','" @value-changed="','"></ha-icon-picker> '])),this.hass,this.label,this.value,this.required,this.disabled,this.helper,null!==(t=null===(o=this.selector.icon)||void 0===o?void 0:o.fallbackPath)&&void 0!==t?t:v,null!==(u=null===(l=this.selector.icon)||void 0===l?void 0:l.placeholder)&&void 0!==u?u:s,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(n){(0,h.B)(this,"value-changed",{value:n.detail.value})}}]}}),d.oi)},36142:function(n,e,t){t.d(e,{C:function(){return y}});var i=t(99312),r=t(81043),o=t(71650),u=t(33368),l=t(68308),a=t(82390),c=t(69205),s=(t(85472),t(46798),t(9849),t(90126),t(47084),t(56308),t(32982)),d=t(41005),v=t(36585);t(94738),t(98214),t(53918),t(20254),t(51358),t(5239),t(98490),t(51467);var f=function(){function n(e){(0,o.Z)(this,n),this.G=e}return(0,u.Z)(n,[{key:"disconnect",value:function(){this.G=void 0}},{key:"reconnect",value:function(n){this.G=n}},{key:"deref",value:function(){return this.G}}]),n}(),h=function(){function n(){(0,o.Z)(this,n),this.Y=void 0,this.Z=void 0}return(0,u.Z)(n,[{key:"get",value:function(){return this.Y}},{key:"pause",value:function(){var n,e=this;null!==(n=this.Y)&&void 0!==n||(this.Y=new Promise((function(n){return e.Z=n})))}},{key:"resume",value:function(){var n;null===(n=this.Z)||void 0===n||n.call(this),this.Y=this.Z=void 0}}]),n}(),_=t(16616),$=function(n){return!(0,d.pt)(n)&&"function"==typeof n.then},A=1073741823,k=function(n){function e(){var n;return(0,o.Z)(this,e),(n=(0,l.Z)(this,e,arguments))._$C_t=A,n._$Cwt=[],n._$Cq=new f((0,a.Z)(n)),n._$CK=new h,n}return(0,c.Z)(e,n),(0,u.Z)(e,[{key:"render",value:function(){for(var n,e=arguments.length,t=new Array(e),i=0;i<e;i++)t[i]=arguments[i];return null!==(n=t.find((function(n){return!$(n)})))&&void 0!==n?n:s.Jb}},{key:"update",value:function(n,e){var t=this,o=this._$Cwt,u=o.length;this._$Cwt=e;var l=this._$Cq,a=this._$CK;this.isConnected||this.disconnected();for(var c,d=function(){var n=e[v];if(!$(n))return{v:(t._$C_t=v,n)};v<u&&n===o[v]||(t._$C_t=A,u=0,Promise.resolve(n).then(function(){var e=(0,r.Z)((0,i.Z)().mark((function e(t){var r,o;return(0,i.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!a.get()){e.next=5;break}return e.next=3,a.get();case 3:e.next=0;break;case 5:void 0!==(r=l.deref())&&(o=r._$Cwt.indexOf(n))>-1&&o<r._$C_t&&(r._$C_t=o,r.setValue(t));case 7:case"end":return e.stop()}}),e)})));return function(n){return e.apply(this,arguments)}}()))},v=0;v<e.length&&!(v>this._$C_t);v++)if(c=d())return c.v;return s.Jb}},{key:"disconnected",value:function(){this._$Cq.disconnect(),this._$CK.pause()}},{key:"reconnected",value:function(){this._$Cq.reconnect(this),this._$CK.resume()}}]),e}(v.sR),y=(0,_.XM)(k)},36585:function(n,e,t){t.d(e,{sR:function(){return y}});var i=t(46097),r=t(71650),o=t(33368),u=t(68308),l=t(34541),a=t(47838),c=t(69205),s=t(40039),d=(t(51358),t(46798),t(78399),t(5239),t(56086),t(47884),t(81912),t(64584),t(41483),t(12367),t(9454),t(98490),t(41005)),v=t(16616),f=function n(e,t){var i,r,o=e._$AN;if(void 0===o)return!1;var u,l=(0,s.Z)(o);try{for(l.s();!(u=l.n()).done;){var a=u.value;null===(r=(i=a)._$AO)||void 0===r||r.call(i,t,!1),n(a,t)}}catch(c){l.e(c)}finally{l.f()}return!0},h=function(n){var e,t;do{if(void 0===(e=n._$AM))break;(t=e._$AN).delete(n),n=e}while(0===(null==t?void 0:t.size))},_=function(n){for(var e;e=n._$AM;n=e){var t=e._$AN;if(void 0===t)e._$AN=t=new Set;else if(t.has(n))break;t.add(n),k(e)}};function $(n){void 0!==this._$AN?(h(this),this._$AM=n,_(this)):this._$AM=n}function A(n){var e=arguments.length>1&&void 0!==arguments[1]&&arguments[1],t=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=this._$AH,r=this._$AN;if(void 0!==r&&0!==r.size)if(e)if(Array.isArray(i))for(var o=t;o<i.length;o++)f(i[o],!1),h(i[o]);else null!=i&&(f(i,!1),h(i));else f(this,n)}var k=function(n){var e,t,i,r;n.type==v.pX.CHILD&&(null!==(e=(i=n)._$AP)&&void 0!==e||(i._$AP=A),null!==(t=(r=n)._$AQ)&&void 0!==t||(r._$AQ=$))},y=function(n){function e(){var n;return(0,r.Z)(this,e),(n=(0,u.Z)(this,e,arguments))._$AN=void 0,n}return(0,c.Z)(e,n),(0,o.Z)(e,[{key:"_$AT",value:function(n,t,i){(0,l.Z)((0,a.Z)(e.prototype),"_$AT",this).call(this,n,t,i),_(this),this.isConnected=n._$AU}},{key:"_$AO",value:function(n){var e,t,i=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];n!==this.isConnected&&(this.isConnected=n,n?null===(e=this.reconnected)||void 0===e||e.call(this):null===(t=this.disconnected)||void 0===t||t.call(this)),i&&(f(this,n),h(this))}},{key:"setValue",value:function(n){if((0,d.OR)(this._$Ct))this._$Ct._$AI(n,this);else{var e=(0,i.Z)(this._$Ct._$AH);e[this._$Ci]=n,this._$Ct._$AI(e,this,0)}}},{key:"disconnected",value:function(){}},{key:"reconnected",value:function(){}}]),e}(v.Xe)},41005:function(n,e,t){t.d(e,{E_:function(){return $},OR:function(){return a},_Y:function(){return s},dZ:function(){return l},fk:function(){return d},hN:function(){return u},hl:function(){return f},i9:function(){return h},pt:function(){return o},ws:function(){return _}});var i=t(76775),r=t(32982).Al.I,o=function(n){return null===n||"object"!=(0,i.Z)(n)&&"function"!=typeof n},u=function(n,e){return void 0===e?void 0!==(null==n?void 0:n._$litType$):(null==n?void 0:n._$litType$)===e},l=function(n){var e;return null!=(null===(e=null==n?void 0:n._$litType$)||void 0===e?void 0:e.h)},a=function(n){return void 0===n.strings},c=function(){return document.createComment("")},s=function(n,e,t){var i,o=n._$AA.parentNode,u=void 0===e?n._$AB:e._$AA;if(void 0===t){var l=o.insertBefore(c(),u),a=o.insertBefore(c(),u);t=new r(l,a,n,n.options)}else{var s,d=t._$AB.nextSibling,v=t._$AM,f=v!==n;if(f)null===(i=t._$AQ)||void 0===i||i.call(t,n),t._$AM=n,void 0!==t._$AP&&(s=n._$AU)!==v._$AU&&t._$AP(s);if(d!==u||f)for(var h=t._$AA;h!==d;){var _=h.nextSibling;o.insertBefore(h,u),h=_}}return t},d=function(n,e){var t=arguments.length>2&&void 0!==arguments[2]?arguments[2]:n;return n._$AI(e,t),n},v={},f=function(n){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:v;return n._$AH=e},h=function(n){return n._$AH},_=function(n){var e;null===(e=n._$AP)||void 0===e||e.call(n,!1,!0);for(var t=n._$AA,i=n._$AB.nextSibling;t!==i;){var r=t.nextSibling;t.remove(),t=r}},$=function(n){n._$AR()}}}]);
+//# sourceMappingURL=9255.g3e6_es7qE4.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 9342.csXElsWxAwo.js.LICENSE.txt */
+(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9342],{98691:function(t,e,i){"use strict";i.d(e,{Fn:function(){return n},ku:function(){return _}});i(51358),i(46798),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(96043);var n={UNKNOWN:"Unknown",BACKSPACE:"Backspace",ENTER:"Enter",SPACEBAR:"Spacebar",PAGE_UP:"PageUp",PAGE_DOWN:"PageDown",END:"End",HOME:"Home",ARROW_LEFT:"ArrowLeft",ARROW_UP:"ArrowUp",ARROW_RIGHT:"ArrowRight",ARROW_DOWN:"ArrowDown",DELETE:"Delete",ESCAPE:"Escape",TAB:"Tab"},o=new Set;o.add(n.BACKSPACE),o.add(n.ENTER),o.add(n.SPACEBAR),o.add(n.PAGE_UP),o.add(n.PAGE_DOWN),o.add(n.END),o.add(n.HOME),o.add(n.ARROW_LEFT),o.add(n.ARROW_UP),o.add(n.ARROW_RIGHT),o.add(n.ARROW_DOWN),o.add(n.DELETE),o.add(n.ESCAPE),o.add(n.TAB);var r=8,a=13,s=32,d=33,c=34,l=35,u=36,p=37,m=38,h=39,f=40,g=46,b=27,v=9,y=new Map;y.set(r,n.BACKSPACE),y.set(a,n.ENTER),y.set(s,n.SPACEBAR),y.set(d,n.PAGE_UP),y.set(c,n.PAGE_DOWN),y.set(l,n.END),y.set(u,n.HOME),y.set(p,n.ARROW_LEFT),y.set(m,n.ARROW_UP),y.set(h,n.ARROW_RIGHT),y.set(f,n.ARROW_DOWN),y.set(g,n.DELETE),y.set(b,n.ESCAPE),y.set(v,n.TAB);var x=new Set;function _(t){var e=t.key;if(o.has(e))return e;var i=y.get(t.keyCode);return i||n.UNKNOWN}x.add(n.PAGE_UP),x.add(n.PAGE_DOWN),x.add(n.END),x.add(n.HOME),x.add(n.ARROW_LEFT),x.add(n.ARROW_UP),x.add(n.ARROW_RIGHT),x.add(n.ARROW_DOWN)},74015:function(t,e,i){"use strict";var n,o;i.d(e,{KT:function(){return d},UX:function(){return r},j2:function(){return s}});var r={LIST_ITEM_ACTIVATED_CLASS:"mdc-list-item--activated",LIST_ITEM_CLASS:"mdc-list-item",LIST_ITEM_DISABLED_CLASS:"mdc-list-item--disabled",LIST_ITEM_SELECTED_CLASS:"mdc-list-item--selected",LIST_ITEM_TEXT_CLASS:"mdc-list-item__text",LIST_ITEM_PRIMARY_TEXT_CLASS:"mdc-list-item__primary-text",ROOT:"mdc-list"},a=((n={})[""+r.LIST_ITEM_ACTIVATED_CLASS]="mdc-list-item--activated",n[""+r.LIST_ITEM_CLASS]="mdc-list-item",n[""+r.LIST_ITEM_DISABLED_CLASS]="mdc-list-item--disabled",n[""+r.LIST_ITEM_SELECTED_CLASS]="mdc-list-item--selected",n[""+r.LIST_ITEM_PRIMARY_TEXT_CLASS]="mdc-list-item__primary-text",n[""+r.ROOT]="mdc-list",(o={})[""+r.LIST_ITEM_ACTIVATED_CLASS]="mdc-deprecated-list-item--activated",o[""+r.LIST_ITEM_CLASS]="mdc-deprecated-list-item",o[""+r.LIST_ITEM_DISABLED_CLASS]="mdc-deprecated-list-item--disabled",o[""+r.LIST_ITEM_SELECTED_CLASS]="mdc-deprecated-list-item--selected",o[""+r.LIST_ITEM_TEXT_CLASS]="mdc-deprecated-list-item__text",o[""+r.LIST_ITEM_PRIMARY_TEXT_CLASS]="mdc-deprecated-list-item__primary-text",o[""+r.ROOT]="mdc-deprecated-list",o),s={ACTION_EVENT:"MDCList:action",SELECTION_CHANGE_EVENT:"MDCList:selectionChange",ARIA_CHECKED:"aria-checked",ARIA_CHECKED_CHECKBOX_SELECTOR:'[role="checkbox"][aria-checked="true"]',ARIA_CHECKED_RADIO_SELECTOR:'[role="radio"][aria-checked="true"]',ARIA_CURRENT:"aria-current",ARIA_DISABLED:"aria-disabled",ARIA_ORIENTATION:"aria-orientation",ARIA_ORIENTATION_HORIZONTAL:"horizontal",ARIA_ROLE_CHECKBOX_SELECTOR:'[role="checkbox"]',ARIA_SELECTED:"aria-selected",ARIA_INTERACTIVE_ROLES_SELECTOR:'[role="listbox"], [role="menu"]',ARIA_MULTI_SELECTABLE_SELECTOR:'[aria-multiselectable="true"]',CHECKBOX_RADIO_SELECTOR:'input[type="checkbox"], input[type="radio"]',CHECKBOX_SELECTOR:'input[type="checkbox"]',CHILD_ELEMENTS_TO_TOGGLE_TABINDEX:"\n    ."+r.LIST_ITEM_CLASS+" button:not(:disabled),\n    ."+r.LIST_ITEM_CLASS+" a,\n    ."+a[r.LIST_ITEM_CLASS]+" button:not(:disabled),\n    ."+a[r.LIST_ITEM_CLASS]+" a\n  ",DEPRECATED_SELECTOR:".mdc-deprecated-list",FOCUSABLE_CHILD_ELEMENTS:"\n    ."+r.LIST_ITEM_CLASS+" button:not(:disabled),\n    ."+r.LIST_ITEM_CLASS+" a,\n    ."+r.LIST_ITEM_CLASS+' input[type="radio"]:not(:disabled),\n    .'+r.LIST_ITEM_CLASS+' input[type="checkbox"]:not(:disabled),\n    .'+a[r.LIST_ITEM_CLASS]+" button:not(:disabled),\n    ."+a[r.LIST_ITEM_CLASS]+" a,\n    ."+a[r.LIST_ITEM_CLASS]+' input[type="radio"]:not(:disabled),\n    .'+a[r.LIST_ITEM_CLASS]+' input[type="checkbox"]:not(:disabled)\n  ',RADIO_SELECTOR:'input[type="radio"]',SELECTED_ITEM_SELECTOR:'[aria-selected="true"], [aria-current="true"]'},d={UNSET_INDEX:-1,TYPEAHEAD_BUFFER_CLEAR_TIMEOUT_MS:300}},45253:function(t,e,i){"use strict";i.d(e,{HX:function(){return n},KT:function(){return s},Ns:function(){return o},UX:function(){return r},j2:function(){return a}});i(91989);var n,o,r={ANCHOR:"mdc-menu-surface--anchor",ANIMATING_CLOSED:"mdc-menu-surface--animating-closed",ANIMATING_OPEN:"mdc-menu-surface--animating-open",FIXED:"mdc-menu-surface--fixed",IS_OPEN_BELOW:"mdc-menu-surface--is-open-below",OPEN:"mdc-menu-surface--open",ROOT:"mdc-menu-surface"},a={CLOSED_EVENT:"MDCMenuSurface:closed",CLOSING_EVENT:"MDCMenuSurface:closing",OPENED_EVENT:"MDCMenuSurface:opened",OPENING_EVENT:"MDCMenuSurface:opening",FOCUSABLE_ELEMENTS:["button:not(:disabled)",'[href]:not([aria-disabled="true"])',"input:not(:disabled)","select:not(:disabled)","textarea:not(:disabled)",'[tabindex]:not([tabindex="-1"]):not([aria-disabled="true"])'].join(", ")},s={TRANSITION_OPEN_DURATION:120,TRANSITION_CLOSE_DURATION:75,MARGIN_TO_EDGE:32,ANCHOR_TO_MENU_SURFACE_WIDTH_RATIO:.67,TOUCH_EVENT_WAIT_MS:30};!function(t){t[t.BOTTOM=1]="BOTTOM",t[t.CENTER=2]="CENTER",t[t.RIGHT=4]="RIGHT",t[t.FLIP_RTL=8]="FLIP_RTL"}(n||(n={})),function(t){t[t.TOP_LEFT=0]="TOP_LEFT",t[t.TOP_RIGHT=4]="TOP_RIGHT",t[t.BOTTOM_LEFT=1]="BOTTOM_LEFT",t[t.BOTTOM_RIGHT=5]="BOTTOM_RIGHT",t[t.TOP_START=8]="TOP_START",t[t.TOP_END=12]="TOP_END",t[t.BOTTOM_START=9]="BOTTOM_START",t[t.BOTTOM_END=13]="BOTTOM_END"}(o||(o={}))},6945:function(t,e,i){"use strict";i.d(e,{k:function(){return a}});i(51467),i(65974);var n=i(43204),o=i(72774),r=i(45253),a=function(t){function e(i){var o=t.call(this,(0,n.__assign)((0,n.__assign)({},e.defaultAdapter),i))||this;return o.isSurfaceOpen=!1,o.isQuickOpen=!1,o.isHoistedElement=!1,o.isFixedPosition=!1,o.isHorizontallyCenteredOnViewport=!1,o.maxHeight=0,o.openBottomBias=0,o.openAnimationEndTimerId=0,o.closeAnimationEndTimerId=0,o.animationRequestId=0,o.anchorCorner=r.Ns.TOP_START,o.originCorner=r.Ns.TOP_START,o.anchorMargin={top:0,right:0,bottom:0,left:0},o.position={x:0,y:0},o}return(0,n.__extends)(e,t),Object.defineProperty(e,"cssClasses",{get:function(){return r.UX},enumerable:!1,configurable:!0}),Object.defineProperty(e,"strings",{get:function(){return r.j2},enumerable:!1,configurable:!0}),Object.defineProperty(e,"numbers",{get:function(){return r.KT},enumerable:!1,configurable:!0}),Object.defineProperty(e,"Corner",{get:function(){return r.Ns},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},hasClass:function(){return!1},hasAnchor:function(){return!1},isElementInContainer:function(){return!1},isFocused:function(){return!1},isRtl:function(){return!1},getInnerDimensions:function(){return{height:0,width:0}},getAnchorDimensions:function(){return null},getWindowDimensions:function(){return{height:0,width:0}},getBodyDimensions:function(){return{height:0,width:0}},getWindowScroll:function(){return{x:0,y:0}},setPosition:function(){},setMaxHeight:function(){},setTransformOrigin:function(){},saveFocus:function(){},restoreFocus:function(){},notifyClose:function(){},notifyClosing:function(){},notifyOpen:function(){},notifyOpening:function(){}}},enumerable:!1,configurable:!0}),e.prototype.init=function(){var t=e.cssClasses,i=t.ROOT,n=t.OPEN;if(!this.adapter.hasClass(i))throw new Error(i+" class required in root element.");this.adapter.hasClass(n)&&(this.isSurfaceOpen=!0)},e.prototype.destroy=function(){clearTimeout(this.openAnimationEndTimerId),clearTimeout(this.closeAnimationEndTimerId),cancelAnimationFrame(this.animationRequestId)},e.prototype.setAnchorCorner=function(t){this.anchorCorner=t},e.prototype.flipCornerHorizontally=function(){this.originCorner=this.originCorner^r.HX.RIGHT},e.prototype.setAnchorMargin=function(t){this.anchorMargin.top=t.top||0,this.anchorMargin.right=t.right||0,this.anchorMargin.bottom=t.bottom||0,this.anchorMargin.left=t.left||0},e.prototype.setIsHoisted=function(t){this.isHoistedElement=t},e.prototype.setFixedPosition=function(t){this.isFixedPosition=t},e.prototype.isFixed=function(){return this.isFixedPosition},e.prototype.setAbsolutePosition=function(t,e){this.position.x=this.isFinite(t)?t:0,this.position.y=this.isFinite(e)?e:0},e.prototype.setIsHorizontallyCenteredOnViewport=function(t){this.isHorizontallyCenteredOnViewport=t},e.prototype.setQuickOpen=function(t){this.isQuickOpen=t},e.prototype.setMaxHeight=function(t){this.maxHeight=t},e.prototype.setOpenBottomBias=function(t){this.openBottomBias=t},e.prototype.isOpen=function(){return this.isSurfaceOpen},e.prototype.open=function(){var t=this;this.isSurfaceOpen||(this.adapter.notifyOpening(),this.adapter.saveFocus(),this.isQuickOpen?(this.isSurfaceOpen=!0,this.adapter.addClass(e.cssClasses.OPEN),this.dimensions=this.adapter.getInnerDimensions(),this.autoposition(),this.adapter.notifyOpen()):(this.adapter.addClass(e.cssClasses.ANIMATING_OPEN),this.animationRequestId=requestAnimationFrame((function(){t.dimensions=t.adapter.getInnerDimensions(),t.autoposition(),t.adapter.addClass(e.cssClasses.OPEN),t.openAnimationEndTimerId=setTimeout((function(){t.openAnimationEndTimerId=0,t.adapter.removeClass(e.cssClasses.ANIMATING_OPEN),t.adapter.notifyOpen()}),r.KT.TRANSITION_OPEN_DURATION)})),this.isSurfaceOpen=!0))},e.prototype.close=function(t){var i=this;if(void 0===t&&(t=!1),this.isSurfaceOpen){if(this.adapter.notifyClosing(),this.isQuickOpen)return this.isSurfaceOpen=!1,t||this.maybeRestoreFocus(),this.adapter.removeClass(e.cssClasses.OPEN),this.adapter.removeClass(e.cssClasses.IS_OPEN_BELOW),void this.adapter.notifyClose();this.adapter.addClass(e.cssClasses.ANIMATING_CLOSED),requestAnimationFrame((function(){i.adapter.removeClass(e.cssClasses.OPEN),i.adapter.removeClass(e.cssClasses.IS_OPEN_BELOW),i.closeAnimationEndTimerId=setTimeout((function(){i.closeAnimationEndTimerId=0,i.adapter.removeClass(e.cssClasses.ANIMATING_CLOSED),i.adapter.notifyClose()}),r.KT.TRANSITION_CLOSE_DURATION)})),this.isSurfaceOpen=!1,t||this.maybeRestoreFocus()}},e.prototype.handleBodyClick=function(t){var e=t.target;this.adapter.isElementInContainer(e)||this.close()},e.prototype.handleKeydown=function(t){var e=t.keyCode;("Escape"===t.key||27===e)&&this.close()},e.prototype.autoposition=function(){var t;this.measurements=this.getAutoLayoutmeasurements();var i=this.getoriginCorner(),n=this.getMenuSurfaceMaxHeight(i),o=this.hasBit(i,r.HX.BOTTOM)?"bottom":"top",a=this.hasBit(i,r.HX.RIGHT)?"right":"left",s=this.getHorizontalOriginOffset(i),d=this.getVerticalOriginOffset(i),c=this.measurements,l=c.anchorSize,u=c.surfaceSize,p=((t={})[a]=s,t[o]=d,t);l.width/u.width>r.KT.ANCHOR_TO_MENU_SURFACE_WIDTH_RATIO&&(a="center"),(this.isHoistedElement||this.isFixedPosition)&&this.adjustPositionForHoistedElement(p),this.adapter.setTransformOrigin(a+" "+o),this.adapter.setPosition(p),this.adapter.setMaxHeight(n?n+"px":""),this.hasBit(i,r.HX.BOTTOM)||this.adapter.addClass(e.cssClasses.IS_OPEN_BELOW)},e.prototype.getAutoLayoutmeasurements=function(){var t=this.adapter.getAnchorDimensions(),e=this.adapter.getBodyDimensions(),i=this.adapter.getWindowDimensions(),n=this.adapter.getWindowScroll();return t||(t={top:this.position.y,right:this.position.x,bottom:this.position.y,left:this.position.x,width:0,height:0}),{anchorSize:t,bodySize:e,surfaceSize:this.dimensions,viewportDistance:{top:t.top,right:i.width-t.right,bottom:i.height-t.bottom,left:t.left},viewportSize:i,windowScroll:n}},e.prototype.getoriginCorner=function(){var t,i,n=this.originCorner,o=this.measurements,a=o.viewportDistance,s=o.anchorSize,d=o.surfaceSize,c=e.numbers.MARGIN_TO_EDGE;this.hasBit(this.anchorCorner,r.HX.BOTTOM)?(t=a.top-c+this.anchorMargin.bottom,i=a.bottom-c-this.anchorMargin.bottom):(t=a.top-c+this.anchorMargin.top,i=a.bottom-c+s.height-this.anchorMargin.top),!(i-d.height>0)&&t>i+this.openBottomBias&&(n=this.setBit(n,r.HX.BOTTOM));var l,u,p=this.adapter.isRtl(),m=this.hasBit(this.anchorCorner,r.HX.FLIP_RTL),h=this.hasBit(this.anchorCorner,r.HX.RIGHT)||this.hasBit(n,r.HX.RIGHT),f=!1;(f=p&&m?!h:h)?(l=a.left+s.width+this.anchorMargin.right,u=a.right-this.anchorMargin.right):(l=a.left+this.anchorMargin.left,u=a.right+s.width-this.anchorMargin.left);var g=l-d.width>0,b=u-d.width>0,v=this.hasBit(n,r.HX.FLIP_RTL)&&this.hasBit(n,r.HX.RIGHT);return b&&v&&p||!g&&v?n=this.unsetBit(n,r.HX.RIGHT):(g&&f&&p||g&&!f&&h||!b&&l>=u)&&(n=this.setBit(n,r.HX.RIGHT)),n},e.prototype.getMenuSurfaceMaxHeight=function(t){if(this.maxHeight>0)return this.maxHeight;var i=this.measurements.viewportDistance,n=0,o=this.hasBit(t,r.HX.BOTTOM),a=this.hasBit(this.anchorCorner,r.HX.BOTTOM),s=e.numbers.MARGIN_TO_EDGE;return o?(n=i.top+this.anchorMargin.top-s,a||(n+=this.measurements.anchorSize.height)):(n=i.bottom-this.anchorMargin.bottom+this.measurements.anchorSize.height-s,a&&(n-=this.measurements.anchorSize.height)),n},e.prototype.getHorizontalOriginOffset=function(t){var e=this.measurements.anchorSize,i=this.hasBit(t,r.HX.RIGHT),n=this.hasBit(this.anchorCorner,r.HX.RIGHT);if(i){var o=n?e.width-this.anchorMargin.left:this.anchorMargin.right;return this.isHoistedElement||this.isFixedPosition?o-(this.measurements.viewportSize.width-this.measurements.bodySize.width):o}return n?e.width-this.anchorMargin.right:this.anchorMargin.left},e.prototype.getVerticalOriginOffset=function(t){var e=this.measurements.anchorSize,i=this.hasBit(t,r.HX.BOTTOM),n=this.hasBit(this.anchorCorner,r.HX.BOTTOM);return i?n?e.height-this.anchorMargin.top:-this.anchorMargin.bottom:n?e.height+this.anchorMargin.bottom:this.anchorMargin.top},e.prototype.adjustPositionForHoistedElement=function(t){var e,i,o=this.measurements,r=o.windowScroll,a=o.viewportDistance,s=o.surfaceSize,d=o.viewportSize,c=Object.keys(t);try{for(var l=(0,n.__values)(c),u=l.next();!u.done;u=l.next()){var p=u.value,m=t[p]||0;!this.isHorizontallyCenteredOnViewport||"left"!==p&&"right"!==p?(m+=a[p],this.isFixedPosition||("top"===p?m+=r.y:"bottom"===p?m-=r.y:"left"===p?m+=r.x:m-=r.x),t[p]=m):t[p]=(d.width-s.width)/2}}catch(h){e={error:h}}finally{try{u&&!u.done&&(i=l.return)&&i.call(l)}finally{if(e)throw e.error}}},e.prototype.maybeRestoreFocus=function(){var t=this,e=this.adapter.isFocused(),i=this.adapter.getOwnerDocument?this.adapter.getOwnerDocument():document,n=i.activeElement&&this.adapter.isElementInContainer(i.activeElement);(e||n)&&setTimeout((function(){t.adapter.restoreFocus()}),r.KT.TOUCH_EVENT_WAIT_MS)},e.prototype.hasBit=function(t,e){return Boolean(t&e)},e.prototype.setBit=function(t,e){return t|e},e.prototype.unsetBit=function(t,e){return t^e},e.prototype.isFinite=function(t){return"number"==typeof t&&isFinite(t)},e}(o.K);e.Z=a},14114:function(t,e,i){"use strict";i.d(e,{P:function(){return n}});i(51358),i(96043),i(46798),i(5239),i(98490),i(9849),i(50289),i(94167);var n=function(t){return function(e,i){if(e.constructor._observers){if(!e.constructor.hasOwnProperty("_observers")){var n=e.constructor._observers;e.constructor._observers=new Map,n.forEach((function(t,i){return e.constructor._observers.set(i,t)}))}}else{e.constructor._observers=new Map;var o=e.updated;e.updated=function(t){var e=this;o.call(this,t),t.forEach((function(t,i){var n=e.constructor._observers.get(i);void 0!==n&&n.call(e,e[i],t)}))}}e.constructor._observers.set(i,t)}}},48095:function(t,e,i){"use strict";i.d(e,{_:function(){return _}});var n,o,r,a,s,d,c,l,u=i(88962),p=i(71650),m=i(33368),h=i(68308),f=i(69205),g=i(43204),b=(i(27763),i(98734)),v=i(5095),y=i(95260),x=i(53180),_=function(t){function e(){var t;return(0,p.Z)(this,e),(t=(0,h.Z)(this,e,arguments)).mini=!1,t.exited=!1,t.disabled=!1,t.extended=!1,t.showIconAtEnd=!1,t.reducedTouchTarget=!1,t.icon="",t.label="",t.shouldRenderRipple=!1,t.useStateLayerCustomProperties=!1,t.rippleHandlers=new b.A((function(){return t.shouldRenderRipple=!0,t.ripple})),t}return(0,f.Z)(e,t),(0,m.Z)(e,[{key:"render",value:function(){var t=this.mini&&!this.reducedTouchTarget,e={"mdc-fab--mini":this.mini,"mdc-fab--touch":t,"mdc-fab--exited":this.exited,"mdc-fab--extended":this.extended,"icon-end":this.showIconAtEnd},i=this.label?this.label:this.icon;return(0,v.dy)(n||(n=(0,u.Z)(['<button class="mdc-fab ','" ?disabled="','" aria-label="','" @mouseenter="','" @mouseleave="','" @focus="','" @blur="','" @mousedown="','" @touchstart="','" @touchend="','" @touchcancel="','">',"","",'<span class="material-icons mdc-fab__icon"><slot name="icon">',"</slot></span>","","</button>"])),(0,x.$)(e),this.disabled,i,this.handleRippleMouseEnter,this.handleRippleMouseLeave,this.handleRippleFocus,this.handleRippleBlur,this.handleRippleActivate,this.handleRippleStartPress,this.handleRippleDeactivate,this.handleRippleDeactivate,this.renderBeforeRipple(),this.renderRipple(),this.showIconAtEnd?this.renderLabel():"",this.icon,this.showIconAtEnd?"":this.renderLabel(),this.renderTouchTarget())}},{key:"renderIcon",value:function(){return(0,v.dy)(o||(o=(0,u.Z)([""])))}},{key:"renderTouchTarget",value:function(){var t=this.mini&&!this.reducedTouchTarget;return(0,v.dy)(r||(r=(0,u.Z)(["",""])),t?(0,v.dy)(a||(a=(0,u.Z)(['<div class="mdc-fab__touch"></div>']))):"")}},{key:"renderLabel",value:function(){var t=""!==this.label&&this.extended;return(0,v.dy)(s||(s=(0,u.Z)(["",""])),t?(0,v.dy)(d||(d=(0,u.Z)(['<span class="mdc-fab__label">',"</span>"])),this.label):"")}},{key:"renderBeforeRipple",value:function(){return(0,v.dy)(c||(c=(0,u.Z)([""])))}},{key:"renderRipple",value:function(){return this.shouldRenderRipple?(0,v.dy)(l||(l=(0,u.Z)(['<mwc-ripple class="ripple" .internalUseStateLayerCustomProperties="','"></mwc-ripple>'])),this.useStateLayerCustomProperties):""}},{key:"handleRippleActivate",value:function(t){var e=this;window.addEventListener("mouseup",(function t(){window.removeEventListener("mouseup",t),e.handleRippleDeactivate()})),this.handleRippleStartPress(t)}},{key:"handleRippleStartPress",value:function(t){this.rippleHandlers.startPress(t)}},{key:"handleRippleDeactivate",value:function(){this.rippleHandlers.endPress()}},{key:"handleRippleMouseEnter",value:function(){this.rippleHandlers.startHover()}},{key:"handleRippleMouseLeave",value:function(){this.rippleHandlers.endHover()}},{key:"handleRippleFocus",value:function(){this.rippleHandlers.startFocus()}},{key:"handleRippleBlur",value:function(){this.rippleHandlers.endFocus()}}]),e}(v.oi);_.shadowRootOptions={mode:"open",delegatesFocus:!0},(0,g.__decorate)([(0,y.GC)("mwc-ripple")],_.prototype,"ripple",void 0),(0,g.__decorate)([(0,y.Cb)({type:Boolean})],_.prototype,"mini",void 0),(0,g.__decorate)([(0,y.Cb)({type:Boolean})],_.prototype,"exited",void 0),(0,g.__decorate)([(0,y.Cb)({type:Boolean})],_.prototype,"disabled",void 0),(0,g.__decorate)([(0,y.Cb)({type:Boolean})],_.prototype,"extended",void 0),(0,g.__decorate)([(0,y.Cb)({type:Boolean})],_.prototype,"showIconAtEnd",void 0),(0,g.__decorate)([(0,y.Cb)({type:Boolean})],_.prototype,"reducedTouchTarget",void 0),(0,g.__decorate)([(0,y.Cb)()],_.prototype,"icon",void 0),(0,g.__decorate)([(0,y.Cb)()],_.prototype,"label",void 0),(0,g.__decorate)([(0,y.SB)()],_.prototype,"shouldRenderRipple",void 0),(0,g.__decorate)([(0,y.SB)()],_.prototype,"useStateLayerCustomProperties",void 0),(0,g.__decorate)([(0,y.hO)({passive:!0})],_.prototype,"handleRippleStartPress",null)},72477:function(t,e,i){"use strict";i.d(e,{W:function(){return r}});var n,o=i(88962),r=(0,i(5095).iv)(n||(n=(0,o.Z)([':host .mdc-fab .material-icons{font-family:var(--mdc-icon-font, "Material Icons");font-weight:400;font-style:normal;font-size:var(--mdc-icon-size, 24px);line-height:1;letter-spacing:normal;text-transform:none;display:inline-block;white-space:nowrap;word-wrap:normal;direction:ltr;-webkit-font-smoothing:antialiased;text-rendering:optimizeLegibility;-moz-osx-font-smoothing:grayscale;font-feature-settings:"liga"}:host{outline:0;--mdc-ripple-color:currentcolor;user-select:none;-webkit-tap-highlight-color:transparent;display:inline-flex;-webkit-tap-highlight-color:transparent;display:inline-flex;outline:0;user-select:none}:host .mdc-touch-target-wrapper{display:inline}:host .mdc-elevation-overlay{position:absolute;border-radius:inherit;pointer-events:none;opacity:0;opacity:var(--mdc-elevation-overlay-opacity, 0);transition:opacity 280ms cubic-bezier(.4, 0, .2, 1);background-color:#fff;background-color:var(--mdc-elevation-overlay-color,#fff)}:host .mdc-fab{position:relative;display:inline-flex;position:relative;align-items:center;justify-content:center;box-sizing:border-box;width:56px;height:56px;padding:0;border:none;fill:currentColor;text-decoration:none;cursor:pointer;user-select:none;-moz-appearance:none;-webkit-appearance:none;overflow:visible;transition:box-shadow 280ms cubic-bezier(.4, 0, .2, 1),opacity 15ms linear 30ms,transform 270ms 0s cubic-bezier(0, 0, .2, 1)}:host .mdc-fab .mdc-elevation-overlay{width:100%;height:100%;top:0;left:0}:host .mdc-fab::-moz-focus-inner{padding:0;border:0}:host .mdc-fab:hover{box-shadow:0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12)}:host .mdc-fab.mdc-ripple-upgraded--background-focused,:host .mdc-fab:not(.mdc-ripple-upgraded):focus{box-shadow:0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12)}:host .mdc-fab .mdc-fab__focus-ring{position:absolute}:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring{pointer-events:none;border:2px solid transparent;border-radius:6px;box-sizing:content-box;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}@media screen and (forced-colors:active){:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring{border-color:CanvasText}}:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring::after,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring::after{content:"";border:2px solid transparent;border-radius:8px;display:block;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}@media screen and (forced-colors:active){:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring::after,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring::after{border-color:CanvasText}}:host .mdc-fab:active,:host .mdc-fab:focus:active{box-shadow:0px 7px 8px -4px rgba(0,0,0,.2),0px 12px 17px 2px rgba(0,0,0,.14),0px 5px 22px 4px rgba(0,0,0,.12)}:host .mdc-fab:active,:host .mdc-fab:focus{outline:0}:host .mdc-fab:hover{cursor:pointer}:host .mdc-fab>svg{width:100%}:host .mdc-fab--mini{width:40px;height:40px}:host .mdc-fab--extended{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-button-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-button-font-size, .875rem);line-height:2.25rem;line-height:var(--mdc-typography-button-line-height, 2.25rem);font-weight:500;font-weight:var(--mdc-typography-button-font-weight,500);letter-spacing:.0892857143em;letter-spacing:var(--mdc-typography-button-letter-spacing, .0892857143em);text-decoration:none;text-decoration:var(--mdc-typography-button-text-decoration,none);text-transform:uppercase;text-transform:var(--mdc-typography-button-text-transform,uppercase);border-radius:24px;padding-left:20px;padding-right:20px;width:auto;max-width:100%;height:48px;line-height:normal}:host .mdc-fab--extended .mdc-fab__ripple{border-radius:24px}:host .mdc-fab--extended .mdc-fab__icon{margin-left:calc(12px - 20px);margin-right:12px}:host .mdc-fab--extended .mdc-fab__icon[dir=rtl],[dir=rtl] :host .mdc-fab--extended .mdc-fab__icon{margin-left:12px;margin-right:calc(12px - 20px)}:host .mdc-fab--extended .mdc-fab__label+.mdc-fab__icon{margin-left:12px;margin-right:calc(12px - 20px)}:host .mdc-fab--extended .mdc-fab__label+.mdc-fab__icon[dir=rtl],[dir=rtl] :host .mdc-fab--extended .mdc-fab__label+.mdc-fab__icon{margin-left:calc(12px - 20px);margin-right:12px}:host .mdc-fab--touch{margin-top:4px;margin-bottom:4px;margin-right:4px;margin-left:4px}:host .mdc-fab--touch .mdc-fab__touch{position:absolute;top:50%;height:48px;left:50%;width:48px;transform:translate(-50%,-50%)}:host .mdc-fab::before{position:absolute;box-sizing:border-box;width:100%;height:100%;top:0;left:0;border:1px solid transparent;border-radius:inherit;content:"";pointer-events:none}@media screen and (forced-colors:active){:host .mdc-fab::before{border-color:CanvasText}}:host .mdc-fab__label{justify-content:flex-start;text-overflow:ellipsis;white-space:nowrap;overflow-x:hidden;overflow-y:visible}:host .mdc-fab__icon{transition:transform 180ms 90ms cubic-bezier(0, 0, .2, 1);fill:currentColor;will-change:transform}:host .mdc-fab .mdc-fab__icon{display:inline-flex;align-items:center;justify-content:center}:host .mdc-fab--exited{transform:scale(0);opacity:0;transition:opacity 15ms linear 150ms,transform 180ms 0s cubic-bezier(.4, 0, 1, 1)}:host .mdc-fab--exited .mdc-fab__icon{transform:scale(0);transition:transform 135ms 0s cubic-bezier(.4, 0, 1, 1)}:host .mdc-fab{background-color:#018786;background-color:var(--mdc-theme-secondary,#018786);box-shadow:0px 3px 5px -1px rgba(0,0,0,.2),0px 6px 10px 0px rgba(0,0,0,.14),0px 1px 18px 0px rgba(0,0,0,.12)}:host .mdc-fab .mdc-fab__icon{width:24px;height:24px;font-size:24px}:host .mdc-fab,:host .mdc-fab:disabled .mdc-fab__icon,:host .mdc-fab:disabled .mdc-fab__label,:host .mdc-fab:not(:disabled) .mdc-fab__icon,:host .mdc-fab:not(:disabled) .mdc-fab__label{color:#fff;color:var(--mdc-theme-on-secondary,#fff)}:host .mdc-fab:not(.mdc-fab--extended){border-radius:50%}:host .mdc-fab:not(.mdc-fab--extended) .mdc-fab__ripple{border-radius:50%}:host .mdc-fab{position:relative;display:inline-flex;position:relative;align-items:center;justify-content:center;box-sizing:border-box;width:56px;height:56px;padding:0;border:none;fill:currentColor;text-decoration:none;cursor:pointer;user-select:none;-moz-appearance:none;-webkit-appearance:none;overflow:visible;transition:box-shadow 280ms cubic-bezier(.4, 0, .2, 1),opacity 15ms linear 30ms,transform 270ms 0s cubic-bezier(0, 0, .2, 1)}:host .mdc-fab .mdc-elevation-overlay{width:100%;height:100%;top:0;left:0}:host .mdc-fab::-moz-focus-inner{padding:0;border:0}:host .mdc-fab:hover{box-shadow:0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12)}:host .mdc-fab.mdc-ripple-upgraded--background-focused,:host .mdc-fab:not(.mdc-ripple-upgraded):focus{box-shadow:0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12)}:host .mdc-fab .mdc-fab__focus-ring{position:absolute}:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring{pointer-events:none;border:2px solid transparent;border-radius:6px;box-sizing:content-box;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}@media screen and (forced-colors:active){:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring{border-color:CanvasText}}:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring::after,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring::after{content:"";border:2px solid transparent;border-radius:8px;display:block;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}@media screen and (forced-colors:active){:host .mdc-fab.mdc-ripple-upgraded--background-focused .mdc-fab__focus-ring::after,:host .mdc-fab:not(.mdc-ripple-upgraded):focus .mdc-fab__focus-ring::after{border-color:CanvasText}}:host .mdc-fab:active,:host .mdc-fab:focus:active{box-shadow:0px 7px 8px -4px rgba(0,0,0,.2),0px 12px 17px 2px rgba(0,0,0,.14),0px 5px 22px 4px rgba(0,0,0,.12)}:host .mdc-fab:active,:host .mdc-fab:focus{outline:0}:host .mdc-fab:hover{cursor:pointer}:host .mdc-fab>svg{width:100%}:host .mdc-fab--mini{width:40px;height:40px}:host .mdc-fab--extended{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-button-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-button-font-size, .875rem);line-height:2.25rem;line-height:var(--mdc-typography-button-line-height, 2.25rem);font-weight:500;font-weight:var(--mdc-typography-button-font-weight,500);letter-spacing:.0892857143em;letter-spacing:var(--mdc-typography-button-letter-spacing, .0892857143em);text-decoration:none;text-decoration:var(--mdc-typography-button-text-decoration,none);text-transform:uppercase;text-transform:var(--mdc-typography-button-text-transform,uppercase);border-radius:24px;padding-left:20px;padding-right:20px;width:auto;max-width:100%;height:48px;line-height:normal}:host .mdc-fab--extended .mdc-fab__ripple{border-radius:24px}:host .mdc-fab--extended .mdc-fab__icon{margin-left:calc(12px - 20px);margin-right:12px}:host .mdc-fab--extended .mdc-fab__icon[dir=rtl],[dir=rtl] :host .mdc-fab--extended .mdc-fab__icon{margin-left:12px;margin-right:calc(12px - 20px)}:host .mdc-fab--extended .mdc-fab__label+.mdc-fab__icon{margin-left:12px;margin-right:calc(12px - 20px)}:host .mdc-fab--extended .mdc-fab__label+.mdc-fab__icon[dir=rtl],[dir=rtl] :host .mdc-fab--extended .mdc-fab__label+.mdc-fab__icon{margin-left:calc(12px - 20px);margin-right:12px}:host .mdc-fab--touch{margin-top:4px;margin-bottom:4px;margin-right:4px;margin-left:4px}:host .mdc-fab--touch .mdc-fab__touch{position:absolute;top:50%;height:48px;left:50%;width:48px;transform:translate(-50%,-50%)}:host .mdc-fab::before{position:absolute;box-sizing:border-box;width:100%;height:100%;top:0;left:0;border:1px solid transparent;border-radius:inherit;content:"";pointer-events:none}@media screen and (forced-colors:active){:host .mdc-fab::before{border-color:CanvasText}}:host .mdc-fab__label{justify-content:flex-start;text-overflow:ellipsis;white-space:nowrap;overflow-x:hidden;overflow-y:visible}:host .mdc-fab__icon{transition:transform 180ms 90ms cubic-bezier(0, 0, .2, 1);fill:currentColor;will-change:transform}:host .mdc-fab .mdc-fab__icon{display:inline-flex;align-items:center;justify-content:center}:host .mdc-fab--exited{transform:scale(0);opacity:0;transition:opacity 15ms linear 150ms,transform 180ms 0s cubic-bezier(.4, 0, 1, 1)}:host .mdc-fab--exited .mdc-fab__icon{transform:scale(0);transition:transform 135ms 0s cubic-bezier(.4, 0, 1, 1)}:host .mdc-fab .ripple{overflow:hidden}:host .mdc-fab:not(.mdc-fab--extended) .ripple{border-radius:50%}:host .mdc-fab.mdc-fab--extended .ripple{border-radius:24px}:host .mdc-fab .mdc-fab__label{z-index:0}:host .mdc-fab .mdc-fab__icon ::slotted(*){width:inherit;height:inherit;font-size:inherit}:host .mdc-fab--extended.mdc-fab--exited .mdc-fab__icon ::slotted(*){transform:scale(0);transition:transform 135ms 0s cubic-bezier(.4, 0, 1, 1)}:host .mdc-fab{padding-top:0px;padding-top:max(0px,var(--mdc-fab-focus-outline-width,0px));padding-right:0px;padding-right:max(0px,var(--mdc-fab-focus-outline-width,0px));padding-bottom:0px;padding-bottom:max(0px,var(--mdc-fab-focus-outline-width,0px));padding-left:0px;padding-left:max(0px,var(--mdc-fab-focus-outline-width,0px));box-shadow:0px 3px 5px -1px rgba(0,0,0,.2),0px 6px 10px 0px rgba(0,0,0,.14),0px 1px 18px 0px rgba(0,0,0,.12);box-shadow:var(--mdc-fab-box-shadow,0px 3px 5px -1px rgba(0,0,0,.2),0px 6px 10px 0px rgba(0,0,0,.14),0px 1px 18px 0px rgba(0,0,0,.12))}:host .mdc-fab:not(:disabled).mdc-ripple-upgraded--background-focused,:host .mdc-fab:not(:disabled):not(.mdc-ripple-upgraded):focus{border-color:initial;border-color:var(--mdc-fab-focus-outline-color,initial)}:host .mdc-fab:not(:disabled).mdc-ripple-upgraded--background-focused,:host .mdc-fab:not(:disabled):not(.mdc-ripple-upgraded):focus{border-style:solid;border-width:var(--mdc-fab-focus-outline-width,0px);padding-top:0px;padding-top:max(calc(0px - var(--mdc-fab-focus-outline-width,0px)),calc(calc(0px - var(--mdc-fab-focus-outline-width,0px)) * -1));padding-right:0px;padding-right:max(calc(0px - var(--mdc-fab-focus-outline-width,0px)),calc(calc(0px - var(--mdc-fab-focus-outline-width,0px)) * -1));padding-bottom:0px;padding-bottom:max(calc(0px - var(--mdc-fab-focus-outline-width,0px)),calc(calc(0px - var(--mdc-fab-focus-outline-width,0px)) * -1));padding-left:0px;padding-left:max(calc(0px - var(--mdc-fab-focus-outline-width,0px)),calc(calc(0px - var(--mdc-fab-focus-outline-width,0px)) * -1))}:host .mdc-fab:focus,:host .mdc-fab:hover{box-shadow:0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12);box-shadow:var(--mdc-fab-box-shadow,0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12))}:host .mdc-fab:active{box-shadow:0px 7px 8px -4px rgba(0,0,0,.2),0px 12px 17px 2px rgba(0,0,0,.14),0px 5px 22px 4px rgba(0,0,0,.12);box-shadow:var(--mdc-fab-box-shadow,0px 7px 8px -4px rgba(0,0,0,.2),0px 12px 17px 2px rgba(0,0,0,.14),0px 5px 22px 4px rgba(0,0,0,.12))}:host .mdc-fab .ripple{overflow:hidden}:host .mdc-fab .mdc-fab__label{z-index:0}:host .mdc-fab:not(.mdc-fab--extended) .ripple{border-radius:50%}:host .mdc-fab.mdc-fab--extended .ripple{border-radius:24px}:host .mdc-fab .mdc-fab__icon{width:24px;width:var(--mdc-icon-size,24px);height:24px;height:var(--mdc-icon-size,24px);font-size:24px;font-size:var(--mdc-icon-size, 24px);transition:transform 180ms 90ms cubic-bezier(0, 0, .2, 1);fill:currentColor;will-change:transform;display:inline-flex;align-items:center;justify-content:center}:host .mdc-fab.mdc-fab--extended{padding-top:0px;padding-top:max(0px,var(--mdc-fab-focus-outline-width,0px));padding-right:20px;padding-right:max(var(--mdc-fab-extended-label-padding,20px),var(--mdc-fab-focus-outline-width,0px));padding-bottom:0px;padding-bottom:max(0px,var(--mdc-fab-focus-outline-width,0px));padding-left:20px;padding-left:max(var(--mdc-fab-extended-label-padding,20px),var(--mdc-fab-focus-outline-width,0px))}:host .mdc-fab.mdc-fab--extended:not(:disabled).mdc-ripple-upgraded--background-focused,:host .mdc-fab.mdc-fab--extended:not(:disabled):not(.mdc-ripple-upgraded):focus{border-style:solid;border-width:var(--mdc-fab-focus-outline-width,0px);padding-top:0px;padding-top:max(calc(0px - var(--mdc-fab-focus-outline-width,0px)),calc(calc(0px - var(--mdc-fab-focus-outline-width,0px)) * -1));padding-right:20px;padding-right:max(calc(var(--mdc-fab-extended-label-padding,20px) - var(--mdc-fab-focus-outline-width,0px)),calc(calc(var(--mdc-fab-extended-label-padding,20px) - var(--mdc-fab-focus-outline-width,0px)) * -1));padding-bottom:0px;padding-bottom:max(calc(0px - var(--mdc-fab-focus-outline-width,0px)),calc(calc(0px - var(--mdc-fab-focus-outline-width,0px)) * -1));padding-left:20px;padding-left:max(calc(var(--mdc-fab-extended-label-padding,20px) - var(--mdc-fab-focus-outline-width,0px)),calc(calc(var(--mdc-fab-extended-label-padding,20px) - var(--mdc-fab-focus-outline-width,0px)) * -1))}:host .mdc-fab.mdc-fab--extended.icon-end .mdc-fab__icon{margin-left:12px;margin-left:var(--mdc-fab-extended-icon-padding,12px);margin-right:calc(12px - 20px);margin-right:calc(var(--mdc-fab-extended-icon-padding,12px) - var(--mdc-fab-extended-label-padding,20px))}:host .mdc-fab.mdc-fab--extended.icon-end .mdc-fab__icon[dir=rtl],[dir=rtl] :host .mdc-fab.mdc-fab--extended.icon-end .mdc-fab__icon{margin-left:calc(12px - 20px);margin-left:calc(var(--mdc-fab-extended-icon-padding,12px) - var(--mdc-fab-extended-label-padding,20px));margin-right:12px;margin-right:var(--mdc-fab-extended-icon-padding,12px)}'])))},23104:function(t,e,i){"use strict";i.d(e,{PV:function(){return h}});var n=i(46097),o=i(40039),r=i(71650),a=i(33368),s=i(68308),d=i(69205),c=(i(32797),i(5239),i(37313),i(36513),i(51358),i(46798),i(78399),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(85717),i(56308),i(51467),i(72774)),l=i(98691),u=i(74015),p=function(t,e){return t-e},m=["input","button","textarea","select"];function h(t){return t instanceof Set}var f=function(t){var e=t===u.KT.UNSET_INDEX?new Set:t;return h(e)?new Set(e):new Set([e])},g=function(t){function e(t){var i;return(0,r.Z)(this,e),(i=(0,s.Z)(this,e,[Object.assign(Object.assign({},e.defaultAdapter),t)])).isMulti_=!1,i.wrapFocus_=!1,i.isVertical_=!0,i.selectedIndex_=u.KT.UNSET_INDEX,i.focusedItemIndex_=u.KT.UNSET_INDEX,i.useActivatedClass_=!1,i.ariaCurrentAttrValue_=null,i}return(0,d.Z)(e,t),(0,a.Z)(e,[{key:"setWrapFocus",value:function(t){this.wrapFocus_=t}},{key:"setMulti",value:function(t){this.isMulti_=t;var e=this.selectedIndex_;if(t){if(!h(e)){var i=e===u.KT.UNSET_INDEX;this.selectedIndex_=i?new Set:new Set([e])}}else if(h(e))if(e.size){var n=Array.from(e).sort(p);this.selectedIndex_=n[0]}else this.selectedIndex_=u.KT.UNSET_INDEX}},{key:"setVerticalOrientation",value:function(t){this.isVertical_=t}},{key:"setUseActivatedClass",value:function(t){this.useActivatedClass_=t}},{key:"getSelectedIndex",value:function(){return this.selectedIndex_}},{key:"setSelectedIndex",value:function(t){this.isIndexValid_(t)&&(this.isMulti_?this.setMultiSelectionAtIndex_(f(t)):this.setSingleSelectionAtIndex_(t))}},{key:"handleFocusIn",value:function(t,e){e>=0&&this.adapter.setTabIndexForElementIndex(e,0)}},{key:"handleFocusOut",value:function(t,e){var i=this;e>=0&&this.adapter.setTabIndexForElementIndex(e,-1),setTimeout((function(){i.adapter.isFocusInsideList()||i.setTabindexToFirstSelectedItem_()}),0)}},{key:"handleKeydown",value:function(t,e,i){var n="ArrowLeft"===(0,l.ku)(t),o="ArrowUp"===(0,l.ku)(t),r="ArrowRight"===(0,l.ku)(t),a="ArrowDown"===(0,l.ku)(t),s="Home"===(0,l.ku)(t),d="End"===(0,l.ku)(t),c="Enter"===(0,l.ku)(t),u="Spacebar"===(0,l.ku)(t);if(this.adapter.isRootFocused())o||d?(t.preventDefault(),this.focusLastElement()):(a||s)&&(t.preventDefault(),this.focusFirstElement());else{var p=this.adapter.getFocusedElementIndex();if(!(-1===p&&(p=i)<0)){var m;if(this.isVertical_&&a||!this.isVertical_&&r)this.preventDefaultEvent(t),m=this.focusNextElement(p);else if(this.isVertical_&&o||!this.isVertical_&&n)this.preventDefaultEvent(t),m=this.focusPrevElement(p);else if(s)this.preventDefaultEvent(t),m=this.focusFirstElement();else if(d)this.preventDefaultEvent(t),m=this.focusLastElement();else if((c||u)&&e){var h=t.target;if(h&&"A"===h.tagName&&c)return;this.preventDefaultEvent(t),this.setSelectedIndexOnAction_(p,!0)}this.focusedItemIndex_=p,void 0!==m&&(this.setTabindexAtIndex_(m),this.focusedItemIndex_=m)}}}},{key:"handleSingleSelection",value:function(t,e,i){t!==u.KT.UNSET_INDEX&&(this.setSelectedIndexOnAction_(t,e,i),this.setTabindexAtIndex_(t),this.focusedItemIndex_=t)}},{key:"focusNextElement",value:function(t){var e=t+1;if(e>=this.adapter.getListItemCount()){if(!this.wrapFocus_)return t;e=0}return this.adapter.focusItemAtIndex(e),e}},{key:"focusPrevElement",value:function(t){var e=t-1;if(e<0){if(!this.wrapFocus_)return t;e=this.adapter.getListItemCount()-1}return this.adapter.focusItemAtIndex(e),e}},{key:"focusFirstElement",value:function(){return this.adapter.focusItemAtIndex(0),0}},{key:"focusLastElement",value:function(){var t=this.adapter.getListItemCount()-1;return this.adapter.focusItemAtIndex(t),t}},{key:"setEnabled",value:function(t,e){this.isIndexValid_(t)&&this.adapter.setDisabledStateForElementIndex(t,!e)}},{key:"preventDefaultEvent",value:function(t){var e=t.target,i="".concat(e.tagName).toLowerCase();-1===m.indexOf(i)&&t.preventDefault()}},{key:"setSingleSelectionAtIndex_",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];this.selectedIndex_!==t&&(this.selectedIndex_!==u.KT.UNSET_INDEX&&(this.adapter.setSelectedStateForElementIndex(this.selectedIndex_,!1),this.useActivatedClass_&&this.adapter.setActivatedStateForElementIndex(this.selectedIndex_,!1)),e&&this.adapter.setSelectedStateForElementIndex(t,!0),this.useActivatedClass_&&this.adapter.setActivatedStateForElementIndex(t,!0),this.setAriaForSingleSelectionAtIndex_(t),this.selectedIndex_=t,this.adapter.notifySelected(t))}},{key:"setMultiSelectionAtIndex_",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=function(t,e){for(var i=Array.from(t),n=Array.from(e),o={added:[],removed:[]},r=i.sort(p),a=n.sort(p),s=0,d=0;s<r.length||d<a.length;){var c=r[s],l=a[d];c!==l?void 0!==c&&(void 0===l||c<l)?(o.removed.push(c),s++):void 0!==l&&(void 0===c||l<c)&&(o.added.push(l),d++):(s++,d++)}return o}(f(this.selectedIndex_),t);if(i.removed.length||i.added.length){var n,r=(0,o.Z)(i.removed);try{for(r.s();!(n=r.n()).done;){var a=n.value;e&&this.adapter.setSelectedStateForElementIndex(a,!1),this.useActivatedClass_&&this.adapter.setActivatedStateForElementIndex(a,!1)}}catch(l){r.e(l)}finally{r.f()}var s,d=(0,o.Z)(i.added);try{for(d.s();!(s=d.n()).done;){var c=s.value;e&&this.adapter.setSelectedStateForElementIndex(c,!0),this.useActivatedClass_&&this.adapter.setActivatedStateForElementIndex(c,!0)}}catch(l){d.e(l)}finally{d.f()}this.selectedIndex_=t,this.adapter.notifySelected(t,i)}}},{key:"setAriaForSingleSelectionAtIndex_",value:function(t){this.selectedIndex_===u.KT.UNSET_INDEX&&(this.ariaCurrentAttrValue_=this.adapter.getAttributeForElementIndex(t,u.j2.ARIA_CURRENT));var e=null!==this.ariaCurrentAttrValue_,i=e?u.j2.ARIA_CURRENT:u.j2.ARIA_SELECTED;this.selectedIndex_!==u.KT.UNSET_INDEX&&this.adapter.setAttributeForElementIndex(this.selectedIndex_,i,"false");var n=e?this.ariaCurrentAttrValue_:"true";this.adapter.setAttributeForElementIndex(t,i,n)}},{key:"setTabindexAtIndex_",value:function(t){this.focusedItemIndex_===u.KT.UNSET_INDEX&&0!==t?this.adapter.setTabIndexForElementIndex(0,-1):this.focusedItemIndex_>=0&&this.focusedItemIndex_!==t&&this.adapter.setTabIndexForElementIndex(this.focusedItemIndex_,-1),this.adapter.setTabIndexForElementIndex(t,0)}},{key:"setTabindexToFirstSelectedItem_",value:function(){var t=0;"number"==typeof this.selectedIndex_&&this.selectedIndex_!==u.KT.UNSET_INDEX?t=this.selectedIndex_:h(this.selectedIndex_)&&this.selectedIndex_.size>0&&(t=Math.min.apply(Math,(0,n.Z)(this.selectedIndex_))),this.setTabindexAtIndex_(t)}},{key:"isIndexValid_",value:function(t){if(t instanceof Set){if(!this.isMulti_)throw new Error("MDCListFoundation: Array of index is only supported for checkbox based list");if(0===t.size)return!0;var e,i=!1,n=(0,o.Z)(t);try{for(n.s();!(e=n.n()).done;){var r=e.value;if(i=this.isIndexInRange_(r))break}}catch(a){n.e(a)}finally{n.f()}return i}if("number"==typeof t){if(this.isMulti_)throw new Error("MDCListFoundation: Expected array of index for checkbox based list but got number: "+t);return t===u.KT.UNSET_INDEX||this.isIndexInRange_(t)}return!1}},{key:"isIndexInRange_",value:function(t){var e=this.adapter.getListItemCount();return t>=0&&t<e}},{key:"setSelectedIndexOnAction_",value:function(t,e,i){if(!this.adapter.getDisabledStateForElementIndex(t)){var n=t;if(this.isMulti_&&(n=new Set([t])),this.isIndexValid_(n)){if(this.isMulti_)this.toggleMultiAtIndex(t,i,e);else if(e||i)this.setSingleSelectionAtIndex_(t,e);else this.selectedIndex_===t&&this.setSingleSelectionAtIndex_(u.KT.UNSET_INDEX);e&&this.adapter.notifyAction(t)}}}},{key:"toggleMultiAtIndex",value:function(t,e){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=!1;n=void 0===e?!this.adapter.getSelectedStateForElementIndex(t):e;var o=f(this.selectedIndex_);n?o.add(t):o.delete(t),this.setMultiSelectionAtIndex_(o,i)}}],[{key:"strings",get:function(){return u.j2}},{key:"numbers",get:function(){return u.KT}},{key:"defaultAdapter",get:function(){return{focusItemAtIndex:function(){},getFocusedElementIndex:function(){return 0},getListItemCount:function(){return 0},isFocusInsideList:function(){return!1},isRootFocused:function(){return!1},notifyAction:function(){},notifySelected:function(){},getSelectedStateForElementIndex:function(){return!1},setDisabledStateForElementIndex:function(){},getDisabledStateForElementIndex:function(){return!1},setSelectedStateForElementIndex:function(){},setActivatedStateForElementIndex:function(){},setTabIndexForElementIndex:function(){},setAttributeForElementIndex:function(){},getAttributeForElementIndex:function(){return null}}}}]),e}(c.K);e.ZP=g},61092:function(t,e,i){"use strict";i.d(e,{K:function(){return C}});var n,o,r,a,s,d,c,l,u,p,m=i(40039),h=i(88962),f=i(71650),g=i(33368),b=i(68308),v=i(82390),y=i(34541),x=i(47838),_=i(69205),E=(i(22481),i(11451),i(76843),i(43204)),T=(i(27763),i(14114)),I=i(98734),w=i(5095),S=i(95260),A=i(53180),C=function(t){function e(){var t;return(0,f.Z)(this,e),(t=(0,b.Z)(this,e,arguments)).value="",t.group=null,t.tabindex=-1,t.disabled=!1,t.twoline=!1,t.activated=!1,t.graphic=null,t.multipleGraphics=!1,t.hasMeta=!1,t.noninteractive=!1,t.selected=!1,t.shouldRenderRipple=!1,t._managingList=null,t.boundOnClick=t.onClick.bind((0,v.Z)(t)),t._firstChanged=!0,t._skipPropRequest=!1,t.rippleHandlers=new I.A((function(){return t.shouldRenderRipple=!0,t.ripple})),t.listeners=[{target:(0,v.Z)(t),eventNames:["click"],cb:function(){t.onClick()}},{target:(0,v.Z)(t),eventNames:["mouseenter"],cb:t.rippleHandlers.startHover},{target:(0,v.Z)(t),eventNames:["mouseleave"],cb:t.rippleHandlers.endHover},{target:(0,v.Z)(t),eventNames:["focus"],cb:t.rippleHandlers.startFocus},{target:(0,v.Z)(t),eventNames:["blur"],cb:t.rippleHandlers.endFocus},{target:(0,v.Z)(t),eventNames:["mousedown","touchstart"],cb:function(e){var i=e.type;t.onDown("mousedown"===i?"mouseup":"touchend",e)}}],t}return(0,_.Z)(e,t),(0,g.Z)(e,[{key:"text",get:function(){var t=this.textContent;return t?t.trim():""}},{key:"render",value:function(){var t=this.renderText(),e=this.graphic?this.renderGraphic():(0,w.dy)(n||(n=(0,h.Z)([""]))),i=this.hasMeta?this.renderMeta():(0,w.dy)(o||(o=(0,h.Z)([""])));return(0,w.dy)(r||(r=(0,h.Z)([" "," "," "," ",""])),this.renderRipple(),e,t,i)}},{key:"renderRipple",value:function(){return this.shouldRenderRipple?(0,w.dy)(a||(a=(0,h.Z)([' <mwc-ripple .activated="','"> </mwc-ripple>'])),this.activated):this.activated?(0,w.dy)(s||(s=(0,h.Z)(['<div class="fake-activated-ripple"></div>']))):""}},{key:"renderGraphic",value:function(){var t={multi:this.multipleGraphics};return(0,w.dy)(d||(d=(0,h.Z)([' <span class="mdc-deprecated-list-item__graphic material-icons ','"> <slot name="graphic"></slot> </span>'])),(0,A.$)(t))}},{key:"renderMeta",value:function(){return(0,w.dy)(c||(c=(0,h.Z)([' <span class="mdc-deprecated-list-item__meta material-icons"> <slot name="meta"></slot> </span>'])))}},{key:"renderText",value:function(){var t=this.twoline?this.renderTwoline():this.renderSingleLine();return(0,w.dy)(l||(l=(0,h.Z)([' <span class="mdc-deprecated-list-item__text"> '," </span>"])),t)}},{key:"renderSingleLine",value:function(){return(0,w.dy)(u||(u=(0,h.Z)(["<slot></slot>"])))}},{key:"renderTwoline",value:function(){return(0,w.dy)(p||(p=(0,h.Z)([' <span class="mdc-deprecated-list-item__primary-text"> <slot></slot> </span> <span class="mdc-deprecated-list-item__secondary-text"> <slot name="secondary"></slot> </span> '])))}},{key:"onClick",value:function(){this.fireRequestSelected(!this.selected,"interaction")}},{key:"onDown",value:function(t,e){var i=this;window.addEventListener(t,(function e(){window.removeEventListener(t,e),i.rippleHandlers.endPress()})),this.rippleHandlers.startPress(e)}},{key:"fireRequestSelected",value:function(t,e){if(!this.noninteractive){var i=new CustomEvent("request-selected",{bubbles:!0,composed:!0,detail:{source:e,selected:t}});this.dispatchEvent(i)}}},{key:"connectedCallback",value:function(){(0,y.Z)((0,x.Z)(e.prototype),"connectedCallback",this).call(this),this.noninteractive||this.setAttribute("mwc-list-item","");var t,i=(0,m.Z)(this.listeners);try{for(i.s();!(t=i.n()).done;){var n,o=t.value,r=(0,m.Z)(o.eventNames);try{for(r.s();!(n=r.n()).done;){var a=n.value;o.target.addEventListener(a,o.cb,{passive:!0})}}catch(s){r.e(s)}finally{r.f()}}}catch(s){i.e(s)}finally{i.f()}}},{key:"disconnectedCallback",value:function(){(0,y.Z)((0,x.Z)(e.prototype),"disconnectedCallback",this).call(this);var t,i=(0,m.Z)(this.listeners);try{for(i.s();!(t=i.n()).done;){var n,o=t.value,r=(0,m.Z)(o.eventNames);try{for(r.s();!(n=r.n()).done;){var a=n.value;o.target.removeEventListener(a,o.cb)}}catch(s){r.e(s)}finally{r.f()}}}catch(s){i.e(s)}finally{i.f()}this._managingList&&(this._managingList.debouncedLayout?this._managingList.debouncedLayout(!0):this._managingList.layout(!0))}},{key:"firstUpdated",value:function(){var t=new Event("list-item-rendered",{bubbles:!0,composed:!0});this.dispatchEvent(t)}}]),e}(w.oi);(0,E.__decorate)([(0,S.IO)("slot")],C.prototype,"slotElement",void 0),(0,E.__decorate)([(0,S.GC)("mwc-ripple")],C.prototype,"ripple",void 0),(0,E.__decorate)([(0,S.Cb)({type:String})],C.prototype,"value",void 0),(0,E.__decorate)([(0,S.Cb)({type:String,reflect:!0})],C.prototype,"group",void 0),(0,E.__decorate)([(0,S.Cb)({type:Number,reflect:!0})],C.prototype,"tabindex",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean,reflect:!0}),(0,T.P)((function(t){t?this.setAttribute("aria-disabled","true"):this.setAttribute("aria-disabled","false")}))],C.prototype,"disabled",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean,reflect:!0})],C.prototype,"twoline",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean,reflect:!0})],C.prototype,"activated",void 0),(0,E.__decorate)([(0,S.Cb)({type:String,reflect:!0})],C.prototype,"graphic",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean})],C.prototype,"multipleGraphics",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean})],C.prototype,"hasMeta",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean,reflect:!0}),(0,T.P)((function(t){t?(this.removeAttribute("aria-checked"),this.removeAttribute("mwc-list-item"),this.selected=!1,this.activated=!1,this.tabIndex=-1):this.setAttribute("mwc-list-item","")}))],C.prototype,"noninteractive",void 0),(0,E.__decorate)([(0,S.Cb)({type:Boolean,reflect:!0}),(0,T.P)((function(t){var e=this.getAttribute("role"),i="gridcell"===e||"option"===e||"row"===e||"tab"===e;i&&t?this.setAttribute("aria-selected","true"):i&&this.setAttribute("aria-selected","false"),this._firstChanged?this._firstChanged=!1:this._skipPropRequest||this.fireRequestSelected(t,"property")}))],C.prototype,"selected",void 0),(0,E.__decorate)([(0,S.SB)()],C.prototype,"shouldRenderRipple",void 0),(0,E.__decorate)([(0,S.SB)()],C.prototype,"_managingList",void 0)},96762:function(t,e,i){"use strict";i.d(e,{W:function(){return r}});var n,o=i(88962),r=(0,i(5095).iv)(n||(n=(0,o.Z)([':host{cursor:pointer;user-select:none;-webkit-tap-highlight-color:transparent;height:48px;display:flex;position:relative;align-items:center;justify-content:flex-start;overflow:hidden;padding:0;padding-left:var(--mdc-list-side-padding,16px);padding-right:var(--mdc-list-side-padding,16px);outline:0;height:48px;color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87))}:host:focus{outline:0}:host([activated]){color:#6200ee;color:var(--mdc-theme-primary,#6200ee);--mdc-ripple-color:var( --mdc-theme-primary, #6200ee )}:host([activated]) .mdc-deprecated-list-item__graphic{color:#6200ee;color:var(--mdc-theme-primary,#6200ee)}:host([activated]) .fake-activated-ripple::before{position:absolute;display:block;top:0;bottom:0;left:0;right:0;width:100%;height:100%;pointer-events:none;z-index:1;content:"";opacity:.12;opacity:var(--mdc-ripple-activated-opacity, .12);background-color:#6200ee;background-color:var(--mdc-ripple-color,var(--mdc-theme-primary,#6200ee))}.mdc-deprecated-list-item__graphic{flex-shrink:0;align-items:center;justify-content:center;fill:currentColor;display:inline-flex}.mdc-deprecated-list-item__graphic ::slotted(*){flex-shrink:0;align-items:center;justify-content:center;fill:currentColor;width:100%;height:100%;text-align:center}.mdc-deprecated-list-item__meta{width:var(--mdc-list-item-meta-size,24px);height:var(--mdc-list-item-meta-size,24px);margin-left:auto;margin-right:0;color:rgba(0,0,0,.38);color:var(--mdc-theme-text-hint-on-background,rgba(0,0,0,.38))}.mdc-deprecated-list-item__meta.multi{width:auto}.mdc-deprecated-list-item__meta ::slotted(*){width:var(--mdc-list-item-meta-size,24px);line-height:var(--mdc-list-item-meta-size, 24px)}.mdc-deprecated-list-item__meta ::slotted(.material-icons),.mdc-deprecated-list-item__meta ::slotted(mwc-icon){line-height:var(--mdc-list-item-meta-size, 24px)!important}.mdc-deprecated-list-item__meta ::slotted(:not(.material-icons):not(mwc-icon)){-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-caption-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.75rem;font-size:var(--mdc-typography-caption-font-size, .75rem);line-height:1.25rem;line-height:var(--mdc-typography-caption-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-caption-font-weight,400);letter-spacing:.0333333333em;letter-spacing:var(--mdc-typography-caption-letter-spacing, .0333333333em);text-decoration:inherit;text-decoration:var(--mdc-typography-caption-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-caption-text-transform,inherit)}.mdc-deprecated-list-item__meta[dir=rtl],[dir=rtl] .mdc-deprecated-list-item__meta{margin-left:0;margin-right:auto}.mdc-deprecated-list-item__meta ::slotted(*){width:100%;height:100%}.mdc-deprecated-list-item__text{text-overflow:ellipsis;white-space:nowrap;overflow:hidden}.mdc-deprecated-list-item__text ::slotted([for]),.mdc-deprecated-list-item__text[for]{pointer-events:none}.mdc-deprecated-list-item__primary-text{text-overflow:ellipsis;white-space:nowrap;overflow:hidden;display:block;margin-top:0;line-height:normal;margin-bottom:-20px;display:block}.mdc-deprecated-list-item__primary-text::before{display:inline-block;width:0;height:32px;content:"";vertical-align:0}.mdc-deprecated-list-item__primary-text::after{display:inline-block;width:0;height:20px;content:"";vertical-align:-20px}.mdc-deprecated-list-item__secondary-text{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);text-overflow:ellipsis;white-space:nowrap;overflow:hidden;display:block;margin-top:0;line-height:normal;display:block}.mdc-deprecated-list-item__secondary-text::before{display:inline-block;width:0;height:20px;content:"";vertical-align:0}.mdc-deprecated-list--dense .mdc-deprecated-list-item__secondary-text{font-size:inherit}* ::slotted(a),a{color:inherit;text-decoration:none}:host([twoline]){height:72px}:host([twoline]) .mdc-deprecated-list-item__text{align-self:flex-start}:host([disabled]),:host([noninteractive]){cursor:default;pointer-events:none}:host([disabled]) .mdc-deprecated-list-item__text ::slotted(*){opacity:.38}:host([disabled]) .mdc-deprecated-list-item__primary-text ::slotted(*),:host([disabled]) .mdc-deprecated-list-item__secondary-text ::slotted(*),:host([disabled]) .mdc-deprecated-list-item__text ::slotted(*){color:#000;color:var(--mdc-theme-on-surface,#000)}.mdc-deprecated-list-item__secondary-text ::slotted(*){color:rgba(0,0,0,.54);color:var(--mdc-theme-text-secondary-on-background,rgba(0,0,0,.54))}.mdc-deprecated-list-item__graphic ::slotted(*){background-color:transparent;color:rgba(0,0,0,.38);color:var(--mdc-theme-text-icon-on-background,rgba(0,0,0,.38))}.mdc-deprecated-list-group__subheader ::slotted(*){color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87))}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic{width:var(--mdc-list-item-graphic-size,40px);height:var(--mdc-list-item-graphic-size,40px)}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic.multi{width:auto}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic ::slotted(*){width:var(--mdc-list-item-graphic-size,40px);line-height:var(--mdc-list-item-graphic-size, 40px)}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic ::slotted(.material-icons),:host([graphic=avatar]) .mdc-deprecated-list-item__graphic ::slotted(mwc-icon){line-height:var(--mdc-list-item-graphic-size, 40px)!important}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic ::slotted(*){border-radius:50%}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic,:host([graphic=control]) .mdc-deprecated-list-item__graphic,:host([graphic=large]) .mdc-deprecated-list-item__graphic,:host([graphic=medium]) .mdc-deprecated-list-item__graphic{margin-left:0;margin-right:var(--mdc-list-item-graphic-margin,16px)}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic[dir=rtl],:host([graphic=control]) .mdc-deprecated-list-item__graphic[dir=rtl],:host([graphic=large]) .mdc-deprecated-list-item__graphic[dir=rtl],:host([graphic=medium]) .mdc-deprecated-list-item__graphic[dir=rtl],[dir=rtl] :host([graphic=avatar]) .mdc-deprecated-list-item__graphic,[dir=rtl] :host([graphic=control]) .mdc-deprecated-list-item__graphic,[dir=rtl] :host([graphic=large]) .mdc-deprecated-list-item__graphic,[dir=rtl] :host([graphic=medium]) .mdc-deprecated-list-item__graphic{margin-left:var(--mdc-list-item-graphic-margin,16px);margin-right:0}:host([graphic=icon]) .mdc-deprecated-list-item__graphic{width:var(--mdc-list-item-graphic-size,24px);height:var(--mdc-list-item-graphic-size,24px);margin-left:0;margin-right:var(--mdc-list-item-graphic-margin,32px)}:host([graphic=icon]) .mdc-deprecated-list-item__graphic.multi{width:auto}:host([graphic=icon]) .mdc-deprecated-list-item__graphic ::slotted(*){width:var(--mdc-list-item-graphic-size,24px);line-height:var(--mdc-list-item-graphic-size, 24px)}:host([graphic=icon]) .mdc-deprecated-list-item__graphic ::slotted(.material-icons),:host([graphic=icon]) .mdc-deprecated-list-item__graphic ::slotted(mwc-icon){line-height:var(--mdc-list-item-graphic-size, 24px)!important}:host([graphic=icon]) .mdc-deprecated-list-item__graphic[dir=rtl],[dir=rtl] :host([graphic=icon]) .mdc-deprecated-list-item__graphic{margin-left:var(--mdc-list-item-graphic-margin,32px);margin-right:0}:host([graphic=avatar]:not([twoLine])),:host([graphic=icon]:not([twoLine])){height:56px}:host([graphic=large]:not([twoLine])),:host([graphic=medium]:not([twoLine])){height:72px}:host([graphic=large]) .mdc-deprecated-list-item__graphic,:host([graphic=medium]) .mdc-deprecated-list-item__graphic{width:var(--mdc-list-item-graphic-size,56px);height:var(--mdc-list-item-graphic-size,56px)}:host([graphic=large]) .mdc-deprecated-list-item__graphic.multi,:host([graphic=medium]) .mdc-deprecated-list-item__graphic.multi{width:auto}:host([graphic=large]) .mdc-deprecated-list-item__graphic ::slotted(*),:host([graphic=medium]) .mdc-deprecated-list-item__graphic ::slotted(*){width:var(--mdc-list-item-graphic-size,56px);line-height:var(--mdc-list-item-graphic-size, 56px)}:host([graphic=large]) .mdc-deprecated-list-item__graphic ::slotted(.material-icons),:host([graphic=large]) .mdc-deprecated-list-item__graphic ::slotted(mwc-icon),:host([graphic=medium]) .mdc-deprecated-list-item__graphic ::slotted(.material-icons),:host([graphic=medium]) .mdc-deprecated-list-item__graphic ::slotted(mwc-icon){line-height:var(--mdc-list-item-graphic-size, 56px)!important}:host([graphic=large]){padding-left:0px}'])))},44577:function(t,e,i){"use strict";var n=i(33368),o=i(71650),r=i(68308),a=i(69205),s=i(43204),d=i(95260),c=i(61092),l=i(96762),u=function(t){function e(){return(0,o.Z)(this,e),(0,r.Z)(this,e,arguments)}return(0,a.Z)(e,t),(0,n.Z)(e)}(c.K);u.styles=[l.W],u=(0,s.__decorate)([(0,d.Mo)("mwc-list-item")],u)},61641:function(t,e,i){"use strict";var n,o,r=i(33368),a=i(71650),s=i(68308),d=i(69205),c=i(43204),l=i(95260),u=i(88962),p=i(40039),m=i(99312),h=i(81043),f=i(82390),g=i(34541),b=i(47838),v=(i(46798),i(47084),i(51358),i(78399),i(5239),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),i(9849),i(50289),i(94167),i(36513),i(56308),i(44577),i(78220)),y=i(14114),x=i(82612),_=i(5095),E=i(10694),T=i(23104);var I=function(t){return t.hasAttribute("mwc-list-item")};function w(){var t=this,e=this.itemsReadyResolver;this.itemsReady=new Promise((function(e){return t.itemsReadyResolver=e})),e()}var S,A=function(t){function e(){var t;(0,a.Z)(this,e),(t=(0,s.Z)(this,e)).mdcAdapter=null,t.mdcFoundationClass=T.ZP,t.activatable=!1,t.multi=!1,t.wrapFocus=!1,t.itemRoles=null,t.innerRole=null,t.innerAriaLabel=null,t.rootTabbable=!1,t.previousTabindex=null,t.noninteractive=!1,t.itemsReadyResolver=function(){},t.itemsReady=Promise.resolve([]),t.items_=[];var i=function(t){var e,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:50;return function(){var n=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];clearTimeout(e),e=setTimeout((function(){t(n)}),i)}}(t.layout.bind((0,f.Z)(t)));return t.debouncedLayout=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];w.call((0,f.Z)(t)),i(e)},t}var i;return(0,d.Z)(e,t),(0,r.Z)(e,[{key:"getUpdateComplete",value:(i=(0,h.Z)((0,m.Z)().mark((function t(){var i;return(0,m.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,g.Z)((0,b.Z)(e.prototype),"getUpdateComplete",this).call(this);case 2:return i=t.sent,t.next=5,this.itemsReady;case 5:return t.abrupt("return",i);case 6:case"end":return t.stop()}}),t,this)}))),function(){return i.apply(this,arguments)})},{key:"items",get:function(){return this.items_}},{key:"updateItems",value:function(){var t,e,i=this,n=null!==(t=this.assignedElements)&&void 0!==t?t:[],o=[],r=(0,p.Z)(n);try{for(r.s();!(e=r.n()).done;){var a=e.value;I(a)&&(o.push(a),a._managingList=this),a.hasAttribute("divider")&&!a.hasAttribute("role")&&a.setAttribute("role","separator")}}catch(l){r.e(l)}finally{r.f()}this.items_=o;var s=new Set;if(this.items_.forEach((function(t,e){i.itemRoles?t.setAttribute("role",i.itemRoles):t.removeAttribute("role"),t.selected&&s.add(e)})),this.multi)this.select(s);else{var d=s.size?s.entries().next().value[1]:-1;this.select(d)}var c=new Event("items-updated",{bubbles:!0,composed:!0});this.dispatchEvent(c)}},{key:"selected",get:function(){var t=this.index;if(!(0,T.PV)(t))return-1===t?null:this.items[t];var e,i=[],n=(0,p.Z)(t);try{for(n.s();!(e=n.n()).done;){var o=e.value;i.push(this.items[o])}}catch(r){n.e(r)}finally{n.f()}return i}},{key:"index",get:function(){return this.mdcFoundation?this.mdcFoundation.getSelectedIndex():-1}},{key:"render",value:function(){var t=null===this.innerRole?void 0:this.innerRole,e=null===this.innerAriaLabel?void 0:this.innerAriaLabel,i=this.rootTabbable?"0":"-1";return(0,_.dy)(n||(n=(0,u.Z)([' <ul tabindex="','" role="','" aria-label="','" class="mdc-deprecated-list" @keydown="','" @focusin="','" @focusout="','" @request-selected="','" @list-item-rendered="','"> <slot></slot> '," </ul> "])),i,(0,E.o)(t),(0,E.o)(e),this.onKeydown,this.onFocusIn,this.onFocusOut,this.onRequestSelected,this.onListItemConnected,this.renderPlaceholder())}},{key:"renderPlaceholder",value:function(){var t,e=null!==(t=this.assignedElements)&&void 0!==t?t:[];return void 0!==this.emptyMessage&&0===e.length?(0,_.dy)(o||(o=(0,u.Z)([" <mwc-list-item noninteractive>","</mwc-list-item> "])),this.emptyMessage):null}},{key:"firstUpdated",value:function(){(0,g.Z)((0,b.Z)(e.prototype),"firstUpdated",this).call(this),this.items.length||(this.mdcFoundation.setMulti(this.multi),this.layout())}},{key:"onFocusIn",value:function(t){if(this.mdcFoundation&&this.mdcRoot){var e=this.getIndexOfTarget(t);this.mdcFoundation.handleFocusIn(t,e)}}},{key:"onFocusOut",value:function(t){if(this.mdcFoundation&&this.mdcRoot){var e=this.getIndexOfTarget(t);this.mdcFoundation.handleFocusOut(t,e)}}},{key:"onKeydown",value:function(t){if(this.mdcFoundation&&this.mdcRoot){var e=this.getIndexOfTarget(t),i=t.target,n=I(i);this.mdcFoundation.handleKeydown(t,n,e)}}},{key:"onRequestSelected",value:function(t){if(this.mdcFoundation){var e=this.getIndexOfTarget(t);if(-1===e&&(this.layout(),-1===(e=this.getIndexOfTarget(t))))return;if(this.items[e].disabled)return;var i=t.detail.selected,n=t.detail.source;this.mdcFoundation.handleSingleSelection(e,"interaction"===n,i),t.stopPropagation()}}},{key:"getIndexOfTarget",value:function(t){var e,i=this.items,n=t.composedPath(),o=(0,p.Z)(n);try{for(o.s();!(e=o.n()).done;){var r=e.value,a=-1;if((0,x.OE)(r)&&I(r)&&(a=i.indexOf(r)),-1!==a)return a}}catch(s){o.e(s)}finally{o.f()}return-1}},{key:"createAdapter",value:function(){var t=this;return this.mdcAdapter={getListItemCount:function(){return t.mdcRoot?t.items.length:0},getFocusedElementIndex:this.getFocusedItemIndex,getAttributeForElementIndex:function(e,i){if(!t.mdcRoot)return"";var n=t.items[e];return n?n.getAttribute(i):""},setAttributeForElementIndex:function(e,i,n){if(t.mdcRoot){var o=t.items[e];o&&o.setAttribute(i,n)}},focusItemAtIndex:function(e){var i=t.items[e];i&&i.focus()},setTabIndexForElementIndex:function(e,i){var n=t.items[e];n&&(n.tabindex=i)},notifyAction:function(e){var i={bubbles:!0,composed:!0};i.detail={index:e};var n=new CustomEvent("action",i);t.dispatchEvent(n)},notifySelected:function(e,i){var n={bubbles:!0,composed:!0};n.detail={index:e,diff:i};var o=new CustomEvent("selected",n);t.dispatchEvent(o)},isFocusInsideList:function(){return(0,x.WU)(t)},isRootFocused:function(){var e=t.mdcRoot;return e.getRootNode().activeElement===e},setDisabledStateForElementIndex:function(e,i){var n=t.items[e];n&&(n.disabled=i)},getDisabledStateForElementIndex:function(e){var i=t.items[e];return!!i&&i.disabled},setSelectedStateForElementIndex:function(e,i){var n=t.items[e];n&&(n.selected=i)},getSelectedStateForElementIndex:function(e){var i=t.items[e];return!!i&&i.selected},setActivatedStateForElementIndex:function(e,i){var n=t.items[e];n&&(n.activated=i)}},this.mdcAdapter}},{key:"selectUi",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.items[t];i&&(i.selected=!0,i.activated=e)}},{key:"deselectUi",value:function(t){var e=this.items[t];e&&(e.selected=!1,e.activated=!1)}},{key:"select",value:function(t){this.mdcFoundation&&this.mdcFoundation.setSelectedIndex(t)}},{key:"toggle",value:function(t,e){this.multi&&this.mdcFoundation.toggleMultiAtIndex(t,e)}},{key:"onListItemConnected",value:function(t){var e=t.target;this.layout(-1===this.items.indexOf(e))}},{key:"layout",value:function(){(!(arguments.length>0&&void 0!==arguments[0])||arguments[0])&&this.updateItems();var t,e=this.items[0],i=(0,p.Z)(this.items);try{for(i.s();!(t=i.n()).done;){t.value.tabindex=-1}}catch(n){i.e(n)}finally{i.f()}e&&(this.noninteractive?this.previousTabindex||(this.previousTabindex=e):e.tabindex=0),this.itemsReadyResolver()}},{key:"getFocusedItemIndex",value:function(){if(!this.mdcRoot)return-1;if(!this.items.length)return-1;var t=(0,x.Mh)();if(!t.length)return-1;for(var e=t.length-1;e>=0;e--){var i=t[e];if(I(i))return this.items.indexOf(i)}return-1}},{key:"focusItemAtIndex",value:function(t){var e,i=(0,p.Z)(this.items);try{for(i.s();!(e=i.n()).done;){var n=e.value;if(0===n.tabindex){n.tabindex=-1;break}}}catch(o){i.e(o)}finally{i.f()}this.items[t].tabindex=0,this.items[t].focus()}},{key:"focus",value:function(){var t=this.mdcRoot;t&&t.focus()}},{key:"blur",value:function(){var t=this.mdcRoot;t&&t.blur()}}]),e}(v.H);(0,c.__decorate)([(0,l.Cb)({type:String})],A.prototype,"emptyMessage",void 0),(0,c.__decorate)([(0,l.IO)(".mdc-deprecated-list")],A.prototype,"mdcRoot",void 0),(0,c.__decorate)([(0,l.vZ)("",!0,"*")],A.prototype,"assignedElements",void 0),(0,c.__decorate)([(0,l.vZ)("",!0,'[tabindex="0"]')],A.prototype,"tabbableElements",void 0),(0,c.__decorate)([(0,l.Cb)({type:Boolean}),(0,y.P)((function(t){this.mdcFoundation&&this.mdcFoundation.setUseActivatedClass(t)}))],A.prototype,"activatable",void 0),(0,c.__decorate)([(0,l.Cb)({type:Boolean}),(0,y.P)((function(t,e){this.mdcFoundation&&this.mdcFoundation.setMulti(t),void 0!==e&&this.layout()}))],A.prototype,"multi",void 0),(0,c.__decorate)([(0,l.Cb)({type:Boolean}),(0,y.P)((function(t){this.mdcFoundation&&this.mdcFoundation.setWrapFocus(t)}))],A.prototype,"wrapFocus",void 0),(0,c.__decorate)([(0,l.Cb)({type:String}),(0,y.P)((function(t,e){void 0!==e&&this.updateItems()}))],A.prototype,"itemRoles",void 0),(0,c.__decorate)([(0,l.Cb)({type:String})],A.prototype,"innerRole",void 0),(0,c.__decorate)([(0,l.Cb)({type:String})],A.prototype,"innerAriaLabel",void 0),(0,c.__decorate)([(0,l.Cb)({type:Boolean})],A.prototype,"rootTabbable",void 0),(0,c.__decorate)([(0,l.Cb)({type:Boolean,reflect:!0}),(0,y.P)((function(t){var e,i;if(t){var n=null!==(i=null===(e=this.tabbableElements)||void 0===e?void 0:e[0])&&void 0!==i?i:null;this.previousTabindex=n,n&&n.setAttribute("tabindex","-1")}else!t&&this.previousTabindex&&(this.previousTabindex.setAttribute("tabindex","0"),this.previousTabindex=null)}))],A.prototype,"noninteractive",void 0);var C=(0,_.iv)(S||(S=(0,u.Z)(['@keyframes mdc-ripple-fg-radius-in{from{animation-timing-function:cubic-bezier(0.4,0,0.2,1);transform:translate(var(--mdc-ripple-fg-translate-start,0)) scale(1)}to{transform:translate(var(--mdc-ripple-fg-translate-end,0)) scale(var(--mdc-ripple-fg-scale,1))}}@keyframes mdc-ripple-fg-opacity-in{from{animation-timing-function:linear;opacity:0}to{opacity:var(--mdc-ripple-fg-opacity, 0)}}@keyframes mdc-ripple-fg-opacity-out{from{animation-timing-function:linear;opacity:var(--mdc-ripple-fg-opacity, 0)}to{opacity:0}}:host{display:block}.mdc-deprecated-list{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-subtitle1-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:1rem;font-size:var(--mdc-typography-subtitle1-font-size, 1rem);line-height:1.75rem;line-height:var(--mdc-typography-subtitle1-line-height, 1.75rem);font-weight:400;font-weight:var(--mdc-typography-subtitle1-font-weight,400);letter-spacing:.009375em;letter-spacing:var(--mdc-typography-subtitle1-letter-spacing, .009375em);text-decoration:inherit;text-decoration:var(--mdc-typography-subtitle1-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-subtitle1-text-transform,inherit);line-height:1.5rem;margin:0;padding:8px 0;list-style-type:none;color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87));padding:var(--mdc-list-vertical-padding,8px) 0}.mdc-deprecated-list:focus{outline:0}.mdc-deprecated-list-item{height:48px}.mdc-deprecated-list--dense{padding-top:4px;padding-bottom:4px;font-size:.812rem}.mdc-deprecated-list ::slotted([divider]){height:0;margin:0;border:none;border-bottom-width:1px;border-bottom-style:solid;border-bottom-color:rgba(0,0,0,.12)}.mdc-deprecated-list ::slotted([divider][padded]){margin:0 var(--mdc-list-side-padding,16px)}.mdc-deprecated-list ::slotted([divider][inset]){margin-left:var(--mdc-list-inset-margin,72px);margin-right:0;width:calc(100% - var(--mdc-list-inset-margin,72px))}.mdc-deprecated-list ::slotted([divider][inset][dir=rtl]),[dir=rtl] .mdc-deprecated-list ::slotted([divider][inset]){margin-left:0;margin-right:var(--mdc-list-inset-margin,72px)}.mdc-deprecated-list ::slotted([divider][inset][padded]){width:calc(100% - var(--mdc-list-inset-margin,72px) - var(--mdc-list-side-padding,16px))}.mdc-deprecated-list--dense ::slotted([mwc-list-item]){height:40px}.mdc-deprecated-list--dense ::slotted([mwc-list]){--mdc-list-item-graphic-size:20px}.mdc-deprecated-list--avatar-list.mdc-deprecated-list--dense ::slotted([mwc-list-item]),.mdc-deprecated-list--two-line.mdc-deprecated-list--dense ::slotted([mwc-list-item]){height:60px}.mdc-deprecated-list--avatar-list.mdc-deprecated-list--dense ::slotted([mwc-list]){--mdc-list-item-graphic-size:36px}:host([noninteractive]){pointer-events:none;cursor:default}.mdc-deprecated-list--dense ::slotted(.mdc-deprecated-list-item__primary-text){display:block;margin-top:0;line-height:normal;margin-bottom:-20px}.mdc-deprecated-list--dense ::slotted(.mdc-deprecated-list-item__primary-text)::before{display:inline-block;width:0;height:24px;content:"";vertical-align:0}.mdc-deprecated-list--dense ::slotted(.mdc-deprecated-list-item__primary-text)::after{display:inline-block;width:0;height:20px;content:"";vertical-align:-20px}']))),O=function(t){function e(){return(0,a.Z)(this,e),(0,s.Z)(this,e,arguments)}return(0,d.Z)(e,t),(0,r.Z)(e)}(A);O.styles=[C],O=(0,c.__decorate)([(0,l.Mo)("mwc-list")],O)},99608:function(t,e,i){"use strict";var n,o,r,a=i(33368),s=i(71650),d=i(68308),c=i(69205),l=i(43204),u=i(95260),p=i(99312),m=i(81043),h=i(88962),f=(i(73855),i(80641),i(85717),i(56308),i(76843),i(45253)),g=i(6945),b=i(78220),v=i(14114),y=i(82612),x=i(5095),_=i(53180),E=i(86634),T={TOP_LEFT:f.Ns.TOP_LEFT,TOP_RIGHT:f.Ns.TOP_RIGHT,BOTTOM_LEFT:f.Ns.BOTTOM_LEFT,BOTTOM_RIGHT:f.Ns.BOTTOM_RIGHT,TOP_START:f.Ns.TOP_START,TOP_END:f.Ns.TOP_END,BOTTOM_START:f.Ns.BOTTOM_START,BOTTOM_END:f.Ns.BOTTOM_END},I=function(t){function e(){var t;return(0,s.Z)(this,e),(t=(0,d.Z)(this,e,arguments)).mdcFoundationClass=g.Z,t.absolute=!1,t.fullwidth=!1,t.fixed=!1,t.x=null,t.y=null,t.quick=!1,t.open=!1,t.stayOpenOnBodyClick=!1,t.bitwiseCorner=f.Ns.TOP_START,t.previousMenuCorner=null,t.menuCorner="START",t.corner="TOP_START",t.styleTop="",t.styleLeft="",t.styleRight="",t.styleBottom="",t.styleMaxHeight="",t.styleTransformOrigin="",t.anchor=null,t.previouslyFocused=null,t.previousAnchor=null,t.onBodyClickBound=function(){},t}return(0,c.Z)(e,t),(0,a.Z)(e,[{key:"render",value:function(){return this.renderSurface()}},{key:"renderSurface",value:function(){var t=this.getRootClasses(),e=this.getRootStyles();return(0,x.dy)(n||(n=(0,h.Z)([' <div class="','" style="','" @keydown="','" @opened="','" @closed="','"> '," </div>"])),(0,_.$)(t),(0,E.V)(e),this.onKeydown,this.registerBodyClick,this.deregisterBodyClick,this.renderContent())}},{key:"getRootClasses",value:function(){return{"mdc-menu-surface":!0,"mdc-menu-surface--fixed":this.fixed,"mdc-menu-surface--fullwidth":this.fullwidth}}},{key:"getRootStyles",value:function(){return{top:this.styleTop,left:this.styleLeft,right:this.styleRight,bottom:this.styleBottom,"max-height":this.styleMaxHeight,"transform-origin":this.styleTransformOrigin}}},{key:"renderContent",value:function(){return(0,x.dy)(o||(o=(0,h.Z)(["<slot></slot>"])))}},{key:"createAdapter",value:function(){var t,e=this;return Object.assign(Object.assign({},(0,b.q)(this.mdcRoot)),{hasAnchor:function(){return!!e.anchor},notifyClose:function(){var t=new CustomEvent("closed",{bubbles:!0,composed:!0});e.open=!1,e.mdcRoot.dispatchEvent(t)},notifyClosing:function(){var t=new CustomEvent("closing",{bubbles:!0,composed:!0});e.mdcRoot.dispatchEvent(t)},notifyOpen:function(){var t=new CustomEvent("opened",{bubbles:!0,composed:!0});e.open=!0,e.mdcRoot.dispatchEvent(t)},notifyOpening:function(){var t=new CustomEvent("opening",{bubbles:!0,composed:!0});e.mdcRoot.dispatchEvent(t)},isElementInContainer:function(){return!1},isRtl:function(){return!!e.mdcRoot&&"rtl"===getComputedStyle(e.mdcRoot).direction},setTransformOrigin:function(t){e.mdcRoot&&(e.styleTransformOrigin=t)},isFocused:function(){return(0,y.WU)(e)},saveFocus:function(){var t=(0,y.Mh)(),i=t.length;i||(e.previouslyFocused=null),e.previouslyFocused=t[i-1]},restoreFocus:function(){e.previouslyFocused&&"focus"in e.previouslyFocused&&e.previouslyFocused.focus()},getInnerDimensions:function(){var t=e.mdcRoot;return t?{width:t.offsetWidth,height:t.offsetHeight}:{width:0,height:0}},getAnchorDimensions:function(){var t=e.anchor;return t?t.getBoundingClientRect():null},getBodyDimensions:function(){return{width:document.body.clientWidth,height:document.body.clientHeight}},getWindowDimensions:function(){return{width:window.innerWidth,height:window.innerHeight}},getWindowScroll:function(){return{x:window.pageXOffset,y:window.pageYOffset}},setPosition:function(t){e.mdcRoot&&(e.styleLeft="left"in t?"".concat(t.left,"px"):"",e.styleRight="right"in t?"".concat(t.right,"px"):"",e.styleTop="top"in t?"".concat(t.top,"px"):"",e.styleBottom="bottom"in t?"".concat(t.bottom,"px"):"")},setMaxHeight:(t=(0,m.Z)((0,p.Z)().mark((function t(i){return(0,p.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(e.mdcRoot){t.next=3;break}return t.abrupt("return");case 3:return e.styleMaxHeight=i,t.next=6,e.updateComplete;case 6:e.styleMaxHeight="var(--mdc-menu-max-height, ".concat(i,")");case 7:case"end":return t.stop()}}),t)}))),function(e){return t.apply(this,arguments)})})}},{key:"onKeydown",value:function(t){this.mdcFoundation&&this.mdcFoundation.handleKeydown(t)}},{key:"onBodyClick",value:function(t){this.stayOpenOnBodyClick||-1===t.composedPath().indexOf(this)&&this.close()}},{key:"registerBodyClick",value:function(){this.onBodyClickBound=this.onBodyClick.bind(this),document.body.addEventListener("click",this.onBodyClickBound,{passive:!0,capture:!0})}},{key:"deregisterBodyClick",value:function(){document.body.removeEventListener("click",this.onBodyClickBound,{capture:!0})}},{key:"onOpenChanged",value:function(t,e){this.mdcFoundation&&(t?this.mdcFoundation.open():void 0!==e&&this.mdcFoundation.close())}},{key:"close",value:function(){this.open=!1}},{key:"show",value:function(){this.open=!0}}]),e}(b.H);(0,l.__decorate)([(0,u.IO)(".mdc-menu-surface")],I.prototype,"mdcRoot",void 0),(0,l.__decorate)([(0,u.IO)("slot")],I.prototype,"slotElement",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean}),(0,v.P)((function(t){this.mdcFoundation&&!this.fixed&&this.mdcFoundation.setIsHoisted(t)}))],I.prototype,"absolute",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean})],I.prototype,"fullwidth",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean}),(0,v.P)((function(t){this.mdcFoundation&&!this.absolute&&this.mdcFoundation.setFixedPosition(t)}))],I.prototype,"fixed",void 0),(0,l.__decorate)([(0,u.Cb)({type:Number}),(0,v.P)((function(t){this.mdcFoundation&&null!==this.y&&null!==t&&(this.mdcFoundation.setAbsolutePosition(t,this.y),this.mdcFoundation.setAnchorMargin({left:t,top:this.y,right:-t,bottom:this.y}))}))],I.prototype,"x",void 0),(0,l.__decorate)([(0,u.Cb)({type:Number}),(0,v.P)((function(t){this.mdcFoundation&&null!==this.x&&null!==t&&(this.mdcFoundation.setAbsolutePosition(this.x,t),this.mdcFoundation.setAnchorMargin({left:this.x,top:t,right:-this.x,bottom:t}))}))],I.prototype,"y",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean}),(0,v.P)((function(t){this.mdcFoundation&&this.mdcFoundation.setQuickOpen(t)}))],I.prototype,"quick",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean,reflect:!0}),(0,v.P)((function(t,e){this.onOpenChanged(t,e)}))],I.prototype,"open",void 0),(0,l.__decorate)([(0,u.Cb)({type:Boolean})],I.prototype,"stayOpenOnBodyClick",void 0),(0,l.__decorate)([(0,u.SB)(),(0,v.P)((function(t){this.mdcFoundation&&this.mdcFoundation.setAnchorCorner(t)}))],I.prototype,"bitwiseCorner",void 0),(0,l.__decorate)([(0,u.Cb)({type:String}),(0,v.P)((function(t){if(this.mdcFoundation){var e="START"===t||"END"===t,i=null===this.previousMenuCorner,n=!i&&t!==this.previousMenuCorner;e&&(n||i&&"END"===t)&&(this.bitwiseCorner=this.bitwiseCorner^f.HX.RIGHT,this.mdcFoundation.flipCornerHorizontally(),this.previousMenuCorner=t)}}))],I.prototype,"menuCorner",void 0),(0,l.__decorate)([(0,u.Cb)({type:String}),(0,v.P)((function(t){if(this.mdcFoundation&&t){var e=T[t];"END"===this.menuCorner&&(e^=f.HX.RIGHT),this.bitwiseCorner=e}}))],I.prototype,"corner",void 0),(0,l.__decorate)([(0,u.SB)()],I.prototype,"styleTop",void 0),(0,l.__decorate)([(0,u.SB)()],I.prototype,"styleLeft",void 0),(0,l.__decorate)([(0,u.SB)()],I.prototype,"styleRight",void 0),(0,l.__decorate)([(0,u.SB)()],I.prototype,"styleBottom",void 0),(0,l.__decorate)([(0,u.SB)()],I.prototype,"styleMaxHeight",void 0),(0,l.__decorate)([(0,u.SB)()],I.prototype,"styleTransformOrigin",void 0);var w=(0,x.iv)(r||(r=(0,h.Z)([".mdc-menu-surface{display:none;position:absolute;box-sizing:border-box;max-width:calc(100vw - 32px);max-width:var(--mdc-menu-max-width,calc(100vw - 32px));max-height:calc(100vh - 32px);max-height:var(--mdc-menu-max-height,calc(100vh - 32px));margin:0;padding:0;transform:scale(1);transform-origin:top left;opacity:0;overflow:auto;will-change:transform,opacity;z-index:8;transition:opacity .03s linear,transform .12s cubic-bezier(0, 0, .2, 1),height 250ms cubic-bezier(0, 0, .2, 1);box-shadow:0px 5px 5px -3px rgba(0,0,0,.2),0px 8px 10px 1px rgba(0,0,0,.14),0px 3px 14px 2px rgba(0,0,0,.12);background-color:#fff;background-color:var(--mdc-theme-surface,#fff);color:#000;color:var(--mdc-theme-on-surface,#000);border-radius:4px;border-radius:var(--mdc-shape-medium,4px);transform-origin-left:top left;transform-origin-right:top right}.mdc-menu-surface:focus{outline:0}.mdc-menu-surface--animating-open{display:inline-block;transform:scale(.8);opacity:0}.mdc-menu-surface--open{display:inline-block;transform:scale(1);opacity:1}.mdc-menu-surface--animating-closed{display:inline-block;opacity:0;transition:opacity 75ms linear}.mdc-menu-surface[dir=rtl],[dir=rtl] .mdc-menu-surface{transform-origin-left:top right;transform-origin-right:top left}.mdc-menu-surface--anchor{position:relative;overflow:visible}.mdc-menu-surface--fixed{position:fixed}.mdc-menu-surface--fullwidth{width:100%}:host(:not([open])){display:none}.mdc-menu-surface{z-index:8;z-index:var(--mdc-menu-z-index,8);min-width:112px;min-width:var(--mdc-menu-min-width,112px)}"]))),S=function(t){function e(){return(0,s.Z)(this,e),(0,d.Z)(this,e,arguments)}return(0,c.Z)(e,t),(0,a.Z)(e)}(I);S.styles=[w],S=(0,l.__decorate)([(0,u.Mo)("mwc-menu-surface")],S)},65666:function(t,e,i){"use strict";var n,o=i(33368),r=i(71650),a=i(68308),s=i(69205),d=i(43204),c=i(95260),l=i(99312),u=i(81043),p=i(88962),m=i(34541),h=i(47838),f=(i(80641),i(73855),i(56308),i(22481),i(76843),i(61641),i(99608),{MENU_SELECTED_LIST_ITEM:"mdc-menu-item--selected",MENU_SELECTION_GROUP:"mdc-menu__selection-group",ROOT:"mdc-menu"}),g={ARIA_CHECKED_ATTR:"aria-checked",ARIA_DISABLED_ATTR:"aria-disabled",CHECKBOX_SELECTOR:'input[type="checkbox"]',LIST_SELECTOR:".mdc-list,.mdc-deprecated-list",SELECTED_EVENT:"MDCMenu:selected",SKIP_RESTORE_FOCUS:"data-menu-item-skip-restore-focus"},b={FOCUS_ROOT_INDEX:-1};!function(t){t[t.NONE=0]="NONE",t[t.LIST_ROOT=1]="LIST_ROOT",t[t.FIRST_ITEM=2]="FIRST_ITEM",t[t.LAST_ITEM=3]="LAST_ITEM"}(n||(n={}));i(51467);var v,y,x,_=i(72774),E=i(74015),T=i(6945),I=function(t){function e(i){var o=t.call(this,(0,d.__assign)((0,d.__assign)({},e.defaultAdapter),i))||this;return o.closeAnimationEndTimerId=0,o.defaultFocusState=n.LIST_ROOT,o.selectedIndex=-1,o}return(0,d.__extends)(e,t),Object.defineProperty(e,"cssClasses",{get:function(){return f},enumerable:!1,configurable:!0}),Object.defineProperty(e,"strings",{get:function(){return g},enumerable:!1,configurable:!0}),Object.defineProperty(e,"numbers",{get:function(){return b},enumerable:!1,configurable:!0}),Object.defineProperty(e,"defaultAdapter",{get:function(){return{addClassToElementAtIndex:function(){},removeClassFromElementAtIndex:function(){},addAttributeToElementAtIndex:function(){},removeAttributeFromElementAtIndex:function(){},getAttributeFromElementAtIndex:function(){return null},elementContainsClass:function(){return!1},closeSurface:function(){},getElementIndex:function(){return-1},notifySelected:function(){},getMenuItemCount:function(){return 0},focusItemAtIndex:function(){},focusListRoot:function(){},getSelectedSiblingOfItemAtIndex:function(){return-1},isSelectableItemAtIndex:function(){return!1}}},enumerable:!1,configurable:!0}),e.prototype.destroy=function(){this.closeAnimationEndTimerId&&clearTimeout(this.closeAnimationEndTimerId),this.adapter.closeSurface()},e.prototype.handleKeydown=function(t){var e=t.key,i=t.keyCode;("Tab"===e||9===i)&&this.adapter.closeSurface(!0)},e.prototype.handleItemAction=function(t){var e=this,i=this.adapter.getElementIndex(t);if(!(i<0)){this.adapter.notifySelected({index:i});var n="true"===this.adapter.getAttributeFromElementAtIndex(i,g.SKIP_RESTORE_FOCUS);this.adapter.closeSurface(n),this.closeAnimationEndTimerId=setTimeout((function(){var i=e.adapter.getElementIndex(t);i>=0&&e.adapter.isSelectableItemAtIndex(i)&&e.setSelectedIndex(i)}),T.k.numbers.TRANSITION_CLOSE_DURATION)}},e.prototype.handleMenuSurfaceOpened=function(){switch(this.defaultFocusState){case n.FIRST_ITEM:this.adapter.focusItemAtIndex(0);break;case n.LAST_ITEM:this.adapter.focusItemAtIndex(this.adapter.getMenuItemCount()-1);break;case n.NONE:break;default:this.adapter.focusListRoot()}},e.prototype.setDefaultFocusState=function(t){this.defaultFocusState=t},e.prototype.getSelectedIndex=function(){return this.selectedIndex},e.prototype.setSelectedIndex=function(t){if(this.validatedIndex(t),!this.adapter.isSelectableItemAtIndex(t))throw new Error("MDCMenuFoundation: No selection group at specified index.");var e=this.adapter.getSelectedSiblingOfItemAtIndex(t);e>=0&&(this.adapter.removeAttributeFromElementAtIndex(e,g.ARIA_CHECKED_ATTR),this.adapter.removeClassFromElementAtIndex(e,f.MENU_SELECTED_LIST_ITEM)),this.adapter.addClassToElementAtIndex(t,f.MENU_SELECTED_LIST_ITEM),this.adapter.addAttributeToElementAtIndex(t,g.ARIA_CHECKED_ATTR,"true"),this.selectedIndex=t},e.prototype.setEnabled=function(t,e){this.validatedIndex(t),e?(this.adapter.removeClassFromElementAtIndex(t,E.UX.LIST_ITEM_DISABLED_CLASS),this.adapter.addAttributeToElementAtIndex(t,g.ARIA_DISABLED_ATTR,"false")):(this.adapter.addClassToElementAtIndex(t,E.UX.LIST_ITEM_DISABLED_CLASS),this.adapter.addAttributeToElementAtIndex(t,g.ARIA_DISABLED_ATTR,"true"))},e.prototype.validatedIndex=function(t){var e=this.adapter.getMenuItemCount();if(!(t>=0&&t<e))throw new Error("MDCMenuFoundation: No list item at specified index.")},e}(_.K),w=i(78220),S=i(14114),A=i(5095),C=i(53180),O=(i(23104),function(t){function e(){var t;return(0,r.Z)(this,e),(t=(0,a.Z)(this,e,arguments)).mdcFoundationClass=I,t.listElement_=null,t.anchor=null,t.open=!1,t.quick=!1,t.wrapFocus=!1,t.innerRole="menu",t.innerAriaLabel=null,t.corner="TOP_START",t.x=null,t.y=null,t.absolute=!1,t.multi=!1,t.activatable=!1,t.fixed=!1,t.forceGroupSelection=!1,t.fullwidth=!1,t.menuCorner="START",t.stayOpenOnBodyClick=!1,t.defaultFocus="LIST_ROOT",t._listUpdateComplete=null,t}var i,n;return(0,s.Z)(e,t),(0,o.Z)(e,[{key:"listElement",get:function(){return this.listElement_||(this.listElement_=this.renderRoot.querySelector("mwc-list")),this.listElement_}},{key:"items",get:function(){var t=this.listElement;return t?t.items:[]}},{key:"index",get:function(){var t=this.listElement;return t?t.index:-1}},{key:"selected",get:function(){var t=this.listElement;return t?t.selected:null}},{key:"render",value:function(){return this.renderSurface()}},{key:"renderSurface",value:function(){var t=this.getSurfaceClasses();return(0,A.dy)(v||(v=(0,p.Z)([' <mwc-menu-surface ?hidden="','" .anchor="','" .open="','" .quick="','" .corner="','" .x="','" .y="','" .absolute="','" .fixed="','" .fullwidth="','" .menuCorner="','" ?stayOpenOnBodyClick="','" class="','" @closed="','" @opened="','" @keydown="','"> '," </mwc-menu-surface>"])),!this.open,this.anchor,this.open,this.quick,this.corner,this.x,this.y,this.absolute,this.fixed,this.fullwidth,this.menuCorner,this.stayOpenOnBodyClick,(0,C.$)(t),this.onClosed,this.onOpened,this.onKeydown,this.renderList())}},{key:"getSurfaceClasses",value:function(){return{"mdc-menu":!0,"mdc-menu-surface":!0}}},{key:"renderList",value:function(){var t="menu"===this.innerRole?"menuitem":"option",e=this.renderListClasses();return(0,A.dy)(y||(y=(0,p.Z)([' <mwc-list rootTabbable .innerAriaLabel="','" .innerRole="','" .multi="','" class="','" .itemRoles="','" .wrapFocus="','" .activatable="','" @action="','"> <slot></slot> </mwc-list>'])),this.innerAriaLabel,this.innerRole,this.multi,(0,C.$)(e),t,this.wrapFocus,this.activatable,this.onAction)}},{key:"renderListClasses",value:function(){return{"mdc-deprecated-list":!0}}},{key:"createAdapter",value:function(){var t=this;return{addClassToElementAtIndex:function(e,i){var n=t.listElement;if(n){var o=n.items[e];o&&("mdc-menu-item--selected"===i?t.forceGroupSelection&&!o.selected&&n.toggle(e,!0):o.classList.add(i))}},removeClassFromElementAtIndex:function(e,i){var n=t.listElement;if(n){var o=n.items[e];o&&("mdc-menu-item--selected"===i?o.selected&&n.toggle(e,!1):o.classList.remove(i))}},addAttributeToElementAtIndex:function(e,i,n){var o=t.listElement;if(o){var r=o.items[e];r&&r.setAttribute(i,n)}},removeAttributeFromElementAtIndex:function(e,i){var n=t.listElement;if(n){var o=n.items[e];o&&o.removeAttribute(i)}},getAttributeFromElementAtIndex:function(e,i){var n=t.listElement;if(!n)return null;var o=n.items[e];return o?o.getAttribute(i):null},elementContainsClass:function(t,e){return t.classList.contains(e)},closeSurface:function(){t.open=!1},getElementIndex:function(e){var i=t.listElement;return i?i.items.indexOf(e):-1},notifySelected:function(){},getMenuItemCount:function(){var e=t.listElement;return e?e.items.length:0},focusItemAtIndex:function(e){var i=t.listElement;if(i){var n=i.items[e];n&&n.focus()}},focusListRoot:function(){t.listElement&&t.listElement.focus()},getSelectedSiblingOfItemAtIndex:function(e){var i=t.listElement;if(!i)return-1;var n=i.items[e];if(!n||!n.group)return-1;for(var o=0;o<i.items.length;o++)if(o!==e){var r=i.items[o];if(r.selected&&r.group===n.group)return o}return-1},isSelectableItemAtIndex:function(e){var i=t.listElement;if(!i)return!1;var n=i.items[e];return!!n&&n.hasAttribute("group")}}}},{key:"onKeydown",value:function(t){this.mdcFoundation&&this.mdcFoundation.handleKeydown(t)}},{key:"onAction",value:function(t){var e=this.listElement;if(this.mdcFoundation&&e){var i=t.detail.index,n=e.items[i];n&&this.mdcFoundation.handleItemAction(n)}}},{key:"onOpened",value:function(){this.open=!0,this.mdcFoundation&&this.mdcFoundation.handleMenuSurfaceOpened()}},{key:"onClosed",value:function(){this.open=!1}},{key:"getUpdateComplete",value:(n=(0,u.Z)((0,l.Z)().mark((function t(){var i;return(0,l.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,this._listUpdateComplete;case 2:return t.next=4,(0,m.Z)((0,h.Z)(e.prototype),"getUpdateComplete",this).call(this);case 4:return i=t.sent,t.abrupt("return",i);case 6:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{key:"firstUpdated",value:(i=(0,u.Z)((0,l.Z)().mark((function t(){var i;return(0,l.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if((0,m.Z)((0,h.Z)(e.prototype),"firstUpdated",this).call(this),!(i=this.listElement)){t.next=6;break}return this._listUpdateComplete=i.updateComplete,t.next=6,this._listUpdateComplete;case 6:case"end":return t.stop()}}),t,this)}))),function(){return i.apply(this,arguments)})},{key:"select",value:function(t){var e=this.listElement;e&&e.select(t)}},{key:"close",value:function(){this.open=!1}},{key:"show",value:function(){this.open=!0}},{key:"getFocusedItemIndex",value:function(){var t=this.listElement;return t?t.getFocusedItemIndex():-1}},{key:"focusItemAtIndex",value:function(t){var e=this.listElement;e&&e.focusItemAtIndex(t)}},{key:"layout",value:function(){var t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],e=this.listElement;e&&e.layout(t)}}]),e}(w.H));(0,d.__decorate)([(0,c.IO)(".mdc-menu")],O.prototype,"mdcRoot",void 0),(0,d.__decorate)([(0,c.IO)("slot")],O.prototype,"slotElement",void 0),(0,d.__decorate)([(0,c.Cb)({type:Object})],O.prototype,"anchor",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean,reflect:!0})],O.prototype,"open",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"quick",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"wrapFocus",void 0),(0,d.__decorate)([(0,c.Cb)({type:String})],O.prototype,"innerRole",void 0),(0,d.__decorate)([(0,c.Cb)({type:String})],O.prototype,"innerAriaLabel",void 0),(0,d.__decorate)([(0,c.Cb)({type:String})],O.prototype,"corner",void 0),(0,d.__decorate)([(0,c.Cb)({type:Number})],O.prototype,"x",void 0),(0,d.__decorate)([(0,c.Cb)({type:Number})],O.prototype,"y",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"absolute",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"multi",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"activatable",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"fixed",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"forceGroupSelection",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"fullwidth",void 0),(0,d.__decorate)([(0,c.Cb)({type:String})],O.prototype,"menuCorner",void 0),(0,d.__decorate)([(0,c.Cb)({type:Boolean})],O.prototype,"stayOpenOnBodyClick",void 0),(0,d.__decorate)([(0,c.Cb)({type:String}),(0,S.P)((function(t){this.mdcFoundation&&this.mdcFoundation.setDefaultFocusState(n[t])}))],O.prototype,"defaultFocus",void 0);var R=(0,A.iv)(x||(x=(0,p.Z)(["mwc-list ::slotted([mwc-list-item]:not([twoline])),mwc-list ::slotted([noninteractive]:not([twoline])){height:var(--mdc-menu-item-height,48px)}"]))),k=function(t){function e(){return(0,r.Z)(this,e),(0,a.Z)(this,e,arguments)}return(0,s.Z)(e,t),(0,o.Z)(e)}(O);k.styles=[R],k=(0,d.__decorate)([(0,c.Mo)("mwc-menu")],k)},58556:function(t,e,i){"use strict";var n;i(46798),i(94570),i(91584),(n="undefined"!=typeof process&&"[object process]"==={}.toString.call(process)||"undefined"!=typeof navigator&&"ReactNative"===navigator.product?global:self).Proxy||(n.Proxy=i(87082)(),n.Proxy.revocable=n.Proxy.revocable)},87082:function(t,e,i){var n=i(3355).default;i(51467),i(30535),i(17692),i(80628),i(30419),i(46798),i(9849),i(50289),i(94167),i(40720),i(37792),t.exports=function(){var t,e=null;function i(t){return!!t&&("object"===n(t)||"function"==typeof t)}function o(t){if(null!==t&&!i(t))throw new TypeError("Object prototype may only be an Object or null: "+t)}var r=Object,a=Boolean(r.create)||!({__proto__:null}instanceof r),s=r.create||(a?function(t){return o(t),{__proto__:t}}:function(t){if(o(t),null===t)throw new SyntaxError("Native Object.create is required to create objects with null prototype");var e=function(){};return e.prototype=t,new e}),d=function(){return null},c=r.getPrototypeOf||([].__proto__===Array.prototype?function(t){var e=t.__proto__;return i(e)?e:null}:d);return t=function(n,l){if(void 0===(this&&this instanceof t?this.constructor:void 0))throw new TypeError("Constructor Proxy requires 'new'");if(!i(n)||!i(l))throw new TypeError("Cannot create proxy with a non-object as target or handler");var u=function(){};e=function(){n=null,u=function(t){throw new TypeError("Cannot perform '".concat(t,"' on a proxy that has been revoked"))}},setTimeout((function(){e=null}),0);var p=l;for(var m in l={get:null,set:null,apply:null,construct:null},p){if(!(m in l))throw new TypeError("Proxy polyfill does not support trap '".concat(m,"'"));l[m]=p[m]}"function"==typeof p&&(l.apply=p.apply.bind(p));var h,f=c(n),g=!1,b=!1;"function"==typeof n?(h=function(){var t=this&&this.constructor===h,e=Array.prototype.slice.call(arguments);return u(t?"construct":"apply"),t&&l.construct?l.construct.call(this,n,e):!t&&l.apply?l.apply(n,this,e):t?(e.unshift(n),new(n.bind.apply(n,e))):n.apply(this,e)},g=!0):n instanceof Array?(h=[],b=!0):h=a||null!==f?s(f):{};var v=l.get?function(t){return u("get"),l.get(this,t,h)}:function(t){return u("get"),this[t]},y=l.set?function(t,e){u("set");l.set(this,t,e,h)}:function(t,e){u("set"),this[t]=e},x=r.getOwnPropertyNames(n),_={};x.forEach((function(t){if(!g&&!b||!(t in h)){var e=r.getOwnPropertyDescriptor(n,t),i={enumerable:Boolean(e.enumerable),get:v.bind(n,t),set:y.bind(n,t)};r.defineProperty(h,t,i),_[t]=!0}}));var E=!0;if(g||b){var T=r.setPrototypeOf||([].__proto__===Array.prototype?function(t,e){return o(e),t.__proto__=e,t}:d);f&&T(h,f)||(E=!1)}if(l.get||!E)for(var I in n)_[I]||r.defineProperty(h,I,{get:v.bind(n,I)});return r.seal(n),r.seal(h),h},t.revocable=function(i,n){return{proxy:new t(i,n),revoke:e}},t}},3355:function(t,e,i){function n(e){return t.exports=n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},t.exports.__esModule=!0,t.exports.default=t.exports,n(e)}i(94738),i(98214),i(46798),i(20254),i(51358),i(5239),i(98490),t.exports=n,t.exports.__esModule=!0,t.exports.default=t.exports},78799:function(t,e,i){"use strict";var n=i(10228);t.exports=function(t,e,i){for(var o=0,r=arguments.length>2?i:n(e),a=new t(r);r>o;)a[o]=e[o++];return a}},9941:function(t,e,i){"use strict";var n=i(76902),o=i(55418),r=i(70814),a=i(19480),s=i(84297),d=i(10228),c=i(9885),l=i(78799),u=Array,p=o([].push);t.exports=function(t,e,i,o){for(var m,h,f,g=a(t),b=r(g),v=n(e,i),y=c(null),x=d(b),_=0;x>_;_++)f=b[_],(h=s(v(f,_,g)))in y?p(y[h],f):y[h]=[f];if(o&&(m=o(g))!==u)for(h in y)y[h]=l(m,y[h]);return y}},39860:function(t,e,i){"use strict";var n=i(68360).match(/firefox\/(\d+)/i);t.exports=!!n&&+n[1]},93712:function(t,e,i){"use strict";var n=i(68360);t.exports=/MSIE|Trident/.test(n)},82803:function(t,e,i){"use strict";var n=i(68360).match(/AppleWebKit\/(\d+)\./);t.exports=!!n&&+n[1]},86439:function(t,e,i){"use strict";var n=i(68077),o=i(78856).findIndex,r=i(90476),a="findIndex",s=!0;a in[]&&Array(1)[a]((function(){s=!1})),n({target:"Array",proto:!0,forced:s},{findIndex:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),r(a)},37313:function(t,e,i){"use strict";var n=i(68077),o=i(55418),r=i(9160),a=i(19480),s=i(10228),d=i(35102),c=i(11336),l=i(18431),u=i(8273),p=i(54053),m=i(39860),h=i(93712),f=i(91625),g=i(82803),b=[],v=o(b.sort),y=o(b.push),x=l((function(){b.sort(void 0)})),_=l((function(){b.sort(null)})),E=p("sort"),T=!l((function(){if(f)return f<70;if(!(m&&m>3)){if(h)return!0;if(g)return g<603;var t,e,i,n,o="";for(t=65;t<76;t++){switch(e=String.fromCharCode(t),t){case 66:case 69:case 70:case 72:i=3;break;case 68:case 71:i=4;break;default:i=2}for(n=0;n<47;n++)b.push({k:e+n,v:i})}for(b.sort((function(t,e){return e.v-t.v})),n=0;n<b.length;n++)e=b[n].k.charAt(0),o.charAt(o.length-1)!==e&&(o+=e);return"DGBEFHACIJK"!==o}}));n({target:"Array",proto:!0,forced:x||!_||!E||!T},{sort:function(t){void 0!==t&&r(t);var e=a(this);if(T)return void 0===t?v(e):v(e,t);var i,n,o=[],l=s(e);for(n=0;n<l;n++)n in e&&y(o,e[n]);for(u(o,function(t){return function(e,i){return void 0===i?-1:void 0===e?1:void 0!==t?+t(e,i)||0:c(e)>c(i)?1:-1}}(t)),i=s(o),n=0;n<i;)e[n]=o[n++];for(;n<l;)d(e,n++);return e}})},79894:function(t,e,i){"use strict";i(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{MAX_SAFE_INTEGER:9007199254740991})},37792:function(t,e,i){"use strict";var n=i(68077),o=i(38475),r=i(70276).onFreeze,a=i(91452),s=i(18431),d=Object.seal;n({target:"Object",stat:!0,forced:s((function(){d(1)})),sham:!a},{seal:function(t){return d&&o(t)?d(r(t)):t}})},73855:function(t,e,i){"use strict";var n=i(68077),o=i(14265);n({target:"String",proto:!0,forced:i(24089)("fixed")},{fixed:function(){return o(this,"tt","","")}})},18098:function(t,e,i){"use strict";var n=i(43173),o=i(37374),r=i(22933),a=i(59317),s=i(97142),d=i(11336),c=i(43313),l=i(54339),u=i(18513),p=i(94448);o("match",(function(t,e,i){return[function(e){var i=c(this),o=a(e)?void 0:l(e,t);return o?n(o,e,i):new RegExp(e)[t](d(i))},function(t){var n=r(this),o=d(t),a=i(e,n,o);if(a.done)return a.value;if(!n.global)return p(n,o);var c=n.unicode;n.lastIndex=0;for(var l,m=[],h=0;null!==(l=p(n,o));){var f=d(l[0]);m[h]=f,""===f&&(n.lastIndex=u(o,s(n.lastIndex),c)),h++}return 0===h?null:m}]}))},11451:function(t,e,i){"use strict";var n=i(68077),o=i(55370).trim;n({target:"String",proto:!0,forced:i(82650)("trim")},{trim:function(){return o(this)}})},22481:function(t,e,i){"use strict";var n=i(68077),o=i(9941),r=i(90476);n({target:"Array",proto:!0},{group:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),r("group")},33829:function(t,e,i){"use strict";var n,o,r=i(88962),a=i(71650),s=i(33368),d=i(68308),c=i(82390),l=i(69205),u=i(34541),p=i(47838),m=(i(11451),i(22859),i(46798),i(9849),i(50289),i(94167),i(85717),i(76843),i(5095)),h=function(t){function e(){var t;return(0,a.Z)(this,e),(t=(0,d.Z)(this,e)).manualMode=!1,t.position="bottom",t.fitToVisibleBounds=!1,t.offset=14,t.marginTop=14,t.animationEntry="",t.animationExit="",t.animationConfig={entry:[{name:"fade-in-animation",node:(0,c.Z)(t),timing:{delay:0}}],exit:[{name:"fade-out-animation",node:(0,c.Z)(t)}]},setTimeout((function(){t.addEventListener("webkitAnimationEnd",t._onAnimationEnd.bind((0,c.Z)(t))),t.addEventListener("mouseenter",t.hide.bind((0,c.Z)(t)))}),0),t}return(0,l.Z)(e,t),(0,s.Z)(e,[{key:"render",value:function(){return(0,m.dy)(n||(n=(0,r.Z)([' <div id="tooltip" class="hidden" @animationend="','"> <slot></slot> </div>'])),this._onAnimationEnd)}},{key:"target",get:function(){var t=this.parentNode,e=this.getRootNode();return this.for?e.querySelector("#"+this.for):t.nodeType==Node.DOCUMENT_FRAGMENT_NODE?e.host:t}},{key:"disconnectedCallback",value:function(){this.manualMode||this._removeListeners(),(0,u.Z)((0,p.Z)(e.prototype),"disconnectedCallback",this).call(this)}},{key:"playAnimation",value:function(t){"entry"===t?this.show():"exit"===t&&this.hide()}},{key:"cancelAnimation",value:function(){this.shadowRoot.querySelector("#tooltip").classList.add("cancel-animation")}},{key:"show",value:function(){if(!this._showing){if(""===this.textContent.trim()){for(var t=!0,e=this.children,i=0;i<e.length;i++)if(""!==e[i].textContent.trim()){t=!1;break}if(t)return}this._showing=!0,this.shadowRoot.querySelector("#tooltip").classList.remove("hidden"),this.shadowRoot.querySelector("#tooltip").classList.remove("cancel-animation"),this.shadowRoot.querySelector("#tooltip").classList.remove(this._getAnimationType("exit")),this.updatePosition(),this._animationPlaying=!0,this.shadowRoot.querySelector("#tooltip").classList.add(this._getAnimationType("entry"))}}},{key:"hide",value:function(){var t=this;if(this._showing){if(this._animationPlaying)return this._showing=!1,void this._cancelAnimation();this._onAnimationFinish(),this._showing=!1,this._animationPlaying=!0,clearTimeout(this.__debounceCancel),this.__debounceCancel=setTimeout((function(){t._cancelAnimation()}),5e3)}}},{key:"updatePosition",value:function(){if(this._target&&this.offsetParent){var t=this.offset;14!=this.marginTop&&14==this.offset&&(t=this.marginTop);var e,i,n=this.offsetParent.getBoundingClientRect(),o=this._target.getBoundingClientRect(),r=this.getBoundingClientRect(),a=(o.width-r.width)/2,s=(o.height-r.height)/2,d=o.left-n.left,c=o.top-n.top;switch(this.position){case"top":e=d+a,i=c-r.height-t;break;case"bottom":e=d+a,i=c+o.height+t;break;case"left":e=d-r.width-t,i=c+s;break;case"right":e=d+o.width+t,i=c+s}this.fitToVisibleBounds?(n.left+e+r.width>window.innerWidth?(this.style.right="0px",this.style.left="auto"):(this.style.left=Math.max(0,e)+"px",this.style.right="auto"),n.top+i+r.height>window.innerHeight?(this.style.bottom=n.height-c+t+"px",this.style.top="auto"):(this.style.top=Math.max(-n.top,i)+"px",this.style.bottom="auto")):(this.style.left=e+"px",this.style.top=i+"px")}}},{key:"_addListeners",value:function(){this._target&&(this._target.addEventListener("mouseenter",this.show.bind(this)),this._target.addEventListener("focus",this.show.bind(this)),this._target.addEventListener("mouseleave",this.hide.bind(this)),this._target.addEventListener("blur",this.hide.bind(this)),this._target.addEventListener("tap",this.hide.bind(this)))}},{key:"_findTarget",value:function(){this.manualMode||this._removeListeners(),this._target=this.target,this.manualMode||this._addListeners()}},{key:"_manualModeChanged",value:function(){this.manualMode?this._removeListeners():this._addListeners()}},{key:"_cancelAnimation",value:function(){this.shadowRoot.querySelector("#tooltip").classList.remove(this._getAnimationType("entry")),this.shadowRoot.querySelector("#tooltip").classList.remove(this._getAnimationType("exit")),this.shadowRoot.querySelector("#tooltip").classList.remove("cancel-animation"),this.shadowRoot.querySelector("#tooltip").classList.add("hidden")}},{key:"_onAnimationFinish",value:function(){this._showing&&(this.shadowRoot.querySelector("#tooltip").classList.remove(this._getAnimationType("entry")),this.shadowRoot.querySelector("#tooltip").classList.remove("cancel-animation"),this.shadowRoot.querySelector("#tooltip").classList.add(this._getAnimationType("exit")))}},{key:"_onAnimationEnd",value:function(){this._animationPlaying=!1,this._showing||(this.shadowRoot.querySelector("#tooltip").classList.remove(this._getAnimationType("exit")),this.shadowRoot.querySelector("#tooltip").classList.add("hidden"))}},{key:"_getAnimationType",value:function(t){if("entry"===t&&""!==this.animationEntry)return this.animationEntry;if("exit"===t&&""!==this.animationExit)return this.animationExit;if(this.animationConfig[t]&&"string"==typeof this.animationConfig[t][0].name){if(this.animationConfig[t][0].timing&&this.animationConfig[t][0].timing.delay&&0!==this.animationConfig[t][0].timing.delay){var e=this.animationConfig[t][0].timing.delay;"entry"===t?document.documentElement.style.setProperty("--simple-tooltip-delay-in",e+"ms"):"exit"===t&&document.documentElement.style.setProperty("--simple-tooltip-delay-out",e+"ms")}return this.animationConfig[t][0].name}}},{key:"_removeListeners",value:function(){this._target&&(this._target.removeEventListener("mouseover",this.show.bind(this)),this._target.removeEventListener("focusin",this.show.bind(this)),this._target.removeEventListener("mouseout",this.hide.bind(this)),this._target.removeEventListener("focusout",this.hide.bind(this)),this._target.removeEventListener("click",this.hide.bind(this)))}},{key:"firstUpdated",value:function(t){this.setAttribute("role","tooltip"),this.setAttribute("tabindex",-1),this._findTarget()}},{key:"updated",value:function(t){var e=this;t.forEach((function(t,i){"for"==i&&e._findTarget(e[i],t),"manualMode"==i&&e._manualModeChanged(e[i],t),"animationDelay"==i&&e._delayChange(e[i],t)}))}},{key:"_delayChange",value:function(t){500!==t&&document.documentElement.style.setProperty("--simple-tooltip-delay-in",t+"ms")}}],[{key:"styles",get:function(){return[(0,m.iv)(o||(o=(0,r.Z)([":host{display:block;position:absolute;outline:0;z-index:1002;-moz-user-select:none;-ms-user-select:none;-webkit-user-select:none;user-select:none;cursor:default;pointer-events:none}#tooltip{display:block;outline:0;font-size:var(--simple-tooltip-font-size, 10px);line-height:1;background-color:var(--simple-tooltip-background,#616161);color:var(--simple-tooltip-text-color,#fff);padding:8px;border-radius:var(--simple-tooltip-border-radius,2px);width:var(--simple-tooltip-width)}@keyframes keyFrameScaleUp{0%{transform:scale(0)}100%{transform:scale(1)}}@keyframes keyFrameScaleDown{0%{transform:scale(1)}100%{transform:scale(0)}}@keyframes keyFrameFadeInOpacity{0%{opacity:0}100%{opacity:var(--simple-tooltip-opacity, .9)}}@keyframes keyFrameFadeOutOpacity{0%{opacity:var(--simple-tooltip-opacity, .9)}100%{opacity:0}}@keyframes keyFrameSlideDownIn{0%{transform:translateY(-2000px);opacity:0}10%{opacity:.2}100%{transform:translateY(0);opacity:var(--simple-tooltip-opacity, .9)}}@keyframes keyFrameSlideDownOut{0%{transform:translateY(0);opacity:var(--simple-tooltip-opacity, .9)}10%{opacity:.2}100%{transform:translateY(-2000px);opacity:0}}.fade-in-animation{opacity:0;animation-delay:var(--simple-tooltip-delay-in, 500ms);animation-name:keyFrameFadeInOpacity;animation-iteration-count:1;animation-timing-function:ease-in;animation-duration:var(--simple-tooltip-duration-in, 500ms);animation-fill-mode:forwards}.fade-out-animation{opacity:var(--simple-tooltip-opacity, .9);animation-delay:var(--simple-tooltip-delay-out, 0ms);animation-name:keyFrameFadeOutOpacity;animation-iteration-count:1;animation-timing-function:ease-in;animation-duration:var(--simple-tooltip-duration-out, 500ms);animation-fill-mode:forwards}.scale-up-animation{transform:scale(0);opacity:var(--simple-tooltip-opacity, .9);animation-delay:var(--simple-tooltip-delay-in, 500ms);animation-name:keyFrameScaleUp;animation-iteration-count:1;animation-timing-function:ease-in;animation-duration:var(--simple-tooltip-duration-in, 500ms);animation-fill-mode:forwards}.scale-down-animation{transform:scale(1);opacity:var(--simple-tooltip-opacity, .9);animation-delay:var(--simple-tooltip-delay-out, 500ms);animation-name:keyFrameScaleDown;animation-iteration-count:1;animation-timing-function:ease-in;animation-duration:var(--simple-tooltip-duration-out, 500ms);animation-fill-mode:forwards}.slide-down-animation{transform:translateY(-2000px);opacity:0;animation-delay:var(--simple-tooltip-delay-out, 500ms);animation-name:keyFrameSlideDownIn;animation-iteration-count:1;animation-timing-function:cubic-bezier(0,0,0.2,1);animation-duration:var(--simple-tooltip-duration-out, 500ms);animation-fill-mode:forwards}.slide-down-animation-out{transform:translateY(0);opacity:var(--simple-tooltip-opacity, .9);animation-delay:var(--simple-tooltip-delay-out, 500ms);animation-name:keyFrameSlideDownOut;animation-iteration-count:1;animation-timing-function:cubic-bezier(0.4,0,1,1);animation-duration:var(--simple-tooltip-duration-out, 500ms);animation-fill-mode:forwards}.cancel-animation{animation-delay:-30s!important}.hidden{position:absolute;left:-10000px;top:auto;width:1px;height:1px;overflow:hidden}"])))]}},{key:"properties",get:function(){return Object.assign(Object.assign({},(0,u.Z)((0,p.Z)(e),"properties",this)),{},{for:{type:String},manualMode:{type:Boolean,attribute:"manual-mode"},position:{type:String},fitToVisibleBounds:{type:Boolean,attribute:"fit-to-visible-bounds"},offset:{type:Number},marginTop:{type:Number,attribute:"margin-top"},animationDelay:{type:Number,attribute:"animation-delay"},animationEntry:{type:String,attribute:"animation-entry"},animationExit:{type:String,attribute:"animation-exit"},_showing:{type:Boolean}})}},{key:"tag",get:function(){return"simple-tooltip"}}]),e}(m.oi);customElements.define(h.tag,h)},93217:function(t,e,i){"use strict";i.d(e,{Ud:function(){return v}});var n=i(62746),o=i(93359),r=i(59202),a=i(46097),s=i(40039),d=i(76775),c=(i(58556),i(94738),i(98214),i(46798),i(51467),i(22859),i(85717),i(51358),i(96043),i(5239),i(98490),i(10999),i(52117),i(63789),i(82479),i(94570),i(99397),i(89802),i(46349),i(70320),i(34997),i(9849),i(12148),i(17692),i(47084),i(39685),i(97393),i(91989),i(86576),i(79894),i(76843),Symbol("Comlink.proxy")),l=Symbol("Comlink.endpoint"),u=Symbol("Comlink.releaseProxy"),p=Symbol("Comlink.finalizer"),m=Symbol("Comlink.thrown"),h=function(t){return"object"===(0,d.Z)(t)&&null!==t||"function"==typeof t},f=new Map([["proxy",{canHandle:function(t){return h(t)&&t[c]},serialize:function(t){var e=new MessageChannel,i=e.port1,n=e.port2;return g(t,i),[n,[n]]},deserialize:function(t){return t.start(),v(t)}}],["throw",{canHandle:function(t){return h(t)&&m in t},serialize:function(t){var e=t.value;return[e instanceof Error?{isError:!0,value:{message:e.message,name:e.name,stack:e.stack}}:{isError:!1,value:e},[]]},deserialize:function(t){if(t.isError)throw Object.assign(new Error(t.value.message),t.value);throw t.value}}]]);function g(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:globalThis,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:["*"];e.addEventListener("message",(function d(l){if(l&&l.data)if(function(t,e){var i,n=(0,s.Z)(t);try{for(n.s();!(i=n.n()).done;){var o=i.value;if(e===o||"*"===o)return!0;if(o instanceof RegExp&&o.test(e))return!0}}catch(r){n.e(r)}finally{n.f()}return!1}(i,l.origin)){var u,h=Object.assign({path:[]},l.data),f=h.id,v=h.type,y=h.path,x=(l.data.argumentList||[]).map(A);try{var _=y.slice(0,-1).reduce((function(t,e){return t[e]}),t),E=y.reduce((function(t,e){return t[e]}),t);switch(v){case"GET":u=E;break;case"SET":_[y.slice(-1)[0]]=A(l.data.value),u=!0;break;case"APPLY":u=E.apply(_,x);break;case"CONSTRUCT":var T;u=function(t){return Object.assign(t,(0,o.Z)({},c,!0))}((0,r.Z)(E,(0,a.Z)(x)));break;case"ENDPOINT":var I=new MessageChannel,C=I.port1,O=I.port2;g(t,O),u=function(t,e){return w.set(t,e),t}(C,[C]);break;case"RELEASE":u=void 0;break;default:return}}catch(T){u=(0,o.Z)({value:T},m,0)}Promise.resolve(u).catch((function(t){return(0,o.Z)({value:t},m,0)})).then((function(i){var o=S(i),r=(0,n.Z)(o,2),a=r[0],s=r[1];e.postMessage(Object.assign(Object.assign({},a),{id:f}),s),"RELEASE"===v&&(e.removeEventListener("message",d),b(e),p in t&&"function"==typeof t[p]&&t[p]())})).catch((function(t){var i=S((0,o.Z)({value:new TypeError("Unserializable return value")},m,0)),r=(0,n.Z)(i,2),a=r[0],s=r[1];e.postMessage(Object.assign(Object.assign({},a),{id:f}),s)}))}else console.warn("Invalid origin '".concat(l.origin,"' for comlink proxy"))})),e.start&&e.start()}function b(t){(function(t){return"MessagePort"===t.constructor.name})(t)&&t.close()}function v(t,e){return T(t,[],e)}function y(t){if(t)throw new Error("Proxy has been released and is not useable")}function x(t){return C(t,{type:"RELEASE"}).then((function(){b(t)}))}var _=new WeakMap,E="FinalizationRegistry"in globalThis&&new FinalizationRegistry((function(t){var e=(_.get(t)||0)-1;_.set(t,e),0===e&&x(t)}));function T(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],i=!1,o=new Proxy(arguments.length>2&&void 0!==arguments[2]?arguments[2]:function(){},{get:function(n,r){if(y(i),r===u)return function(){!function(t){E&&E.unregister(t)}(o),x(t),i=!0};if("then"===r){if(0===e.length)return{then:function(){return o}};var s=C(t,{type:"GET",path:e.map((function(t){return t.toString()}))}).then(A);return s.then.bind(s)}return T(t,[].concat((0,a.Z)(e),[r]))},set:function(o,r,s){y(i);var d=S(s),c=(0,n.Z)(d,2),l=c[0],u=c[1];return C(t,{type:"SET",path:[].concat((0,a.Z)(e),[r]).map((function(t){return t.toString()})),value:l},u).then(A)},apply:function(o,r,a){y(i);var s=e[e.length-1];if(s===l)return C(t,{type:"ENDPOINT"}).then(A);if("bind"===s)return T(t,e.slice(0,-1));var d=I(a),c=(0,n.Z)(d,2),u=c[0],p=c[1];return C(t,{type:"APPLY",path:e.map((function(t){return t.toString()})),argumentList:u},p).then(A)},construct:function(o,r){y(i);var a=I(r),s=(0,n.Z)(a,2),d=s[0],c=s[1];return C(t,{type:"CONSTRUCT",path:e.map((function(t){return t.toString()})),argumentList:d},c).then(A)}});return function(t,e){var i=(_.get(e)||0)+1;_.set(e,i),E&&E.register(t,e,t)}(o,t),o}function I(t){var e,i=t.map(S);return[i.map((function(t){return t[0]})),(e=i.map((function(t){return t[1]})),Array.prototype.concat.apply([],e))]}var w=new WeakMap;function S(t){var e,i=(0,s.Z)(f);try{for(i.s();!(e=i.n()).done;){var o=(0,n.Z)(e.value,2),r=o[0],a=o[1];if(a.canHandle(t)){var d=a.serialize(t),c=(0,n.Z)(d,2);return[{type:"HANDLER",name:r,value:c[0]},c[1]]}}}catch(l){i.e(l)}finally{i.f()}return[{type:"RAW",value:t},w.get(t)||[]]}function A(t){switch(t.type){case"HANDLER":return f.get(t.name).deserialize(t.value);case"RAW":return t.value}}function C(t,e,i){return new Promise((function(n){var o=new Array(4).fill(0).map((function(){return Math.floor(Math.random()*Number.MAX_SAFE_INTEGER).toString(16)})).join("-");t.addEventListener("message",(function e(i){i.data&&i.data.id&&i.data.id===o&&(t.removeEventListener("message",e),n(i.data))})),t.start&&t.start(),t.postMessage(Object.assign({id:o},e),i)}))}}}]);
+//# sourceMappingURL=9342.csXElsWxAwo.js.map
\ No newline at end of file
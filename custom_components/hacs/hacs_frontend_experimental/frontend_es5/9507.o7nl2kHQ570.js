@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9507],{86089:function(e,t,i){i.d(t,{U:function(){return n}});var n=function(e){return e.stopPropagation()}},71133:function(e,t,i){var n,a,l,r,o=i(99312),c=i(81043),d=i(88962),s=i(33368),u=i(71650),h=i(68308),v=i(82390),p=i(69205),f=i(91808),k=i(34541),y=i(47838),b=(i(97393),i(49412)),m=i(3762),g=i(5095),Z=i(95260),_=i(72218),C=i(2537);i(54371),(0,f.Z)([(0,Z.Mo)("ha-select")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,h.Z)(this,i,[].concat(a)),e((0,v.Z)(t)),t}return(0,p.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,Z.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,Z.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,g.dy)(n||(n=(0,d.Z)([" "," "," "])),(0,k.Z)((0,y.Z)(i.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,g.dy)(a||(a=(0,d.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):g.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,g.dy)(l||(l=(0,d.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):g.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,k.Z)((0,y.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,k.Z)((0,y.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,_.D)((0,c.Z)((0,o.Z)().mark((function t(){return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,C.y)();case 2:e.layoutOptions();case 3:case"end":return t.stop()}}),t)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[m.W,(0,g.iv)(r||(r=(0,d.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),b.K)},79507:function(e,t,i){i.r(t),i.d(t,{HaSelectorUiColor:function(){return C}});var n=i(88962),a=i(33368),l=i(71650),r=i(68308),o=i(82390),c=i(69205),d=i(91808),s=(i(97393),i(5095)),u=i(95260),h=i(18394),v=(i(46349),i(70320),i(32797),i(5239),i(44577),i(86634)),p=(i(51358),i(46798),i(78399),i(56086),i(47884),i(81912),i(64584),i(41483),i(12367),i(9454),i(98490),new Set(["primary","accent","disabled","red","pink","purple","deep-purple","indigo","blue","light-blue","cyan","teal","green","light-green","lime","yellow","amber","orange","deep-orange","brown","light-grey","grey","dark-grey","blue-grey","black","white"]));function f(e){return p.has(e)?"var(--".concat(e,"-color)"):e}var k,y,b,m,g,Z,_=i(86089),C=(i(71133),(0,d.Z)([(0,u.Mo)("hui-color-picker")],(function(e,t){var i=function(t){function i(){var t;(0,l.Z)(this,i);for(var n=arguments.length,a=new Array(n),c=0;c<n;c++)a[c]=arguments[c];return t=(0,r.Z)(this,i,[].concat(a)),e((0,o.Z)(t)),t}return(0,c.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,u.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,u.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,u.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,u.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,u.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"method",key:"_valueSelected",value:function(e){var t=e.target.value;t&&(0,h.B)(this,"value-changed",{value:"default"!==t?t:void 0})}},{kind:"method",key:"render",value:function(){var e=this;return(0,s.dy)(k||(k=(0,n.Z)([' <ha-select .icon="','" .label="','" .value="','" .helper="','" .disabled="','" @closed="','" @selected="','" fixedMenuPosition naturalMenuWidth> ',' <mwc-list-item value="default"> '," </mwc-list-item> "," </ha-select> "])),Boolean(this.value),this.label,this.value||"default",this.helper,this.disabled,_.U,this._valueSelected,this.value?(0,s.dy)(y||(y=(0,n.Z)([' <span slot="icon"> '," </span> "])),this.renderColorCircle(this.value||"grey")):s.Ld,this.hass.localize("ui.panel.lovelace.editor.color-picker.default_color"),Array.from(p).map((function(t){return(0,s.dy)(b||(b=(0,n.Z)([' <mwc-list-item .value="','" graphic="icon"> ',' <span slot="graphic">',"</span> </mwc-list-item> "])),t,e.hass.localize("ui.panel.lovelace.editor.color-picker.colors.".concat(t))||t,e.renderColorCircle(t))})))}},{kind:"method",key:"renderColorCircle",value:function(e){return(0,s.dy)(m||(m=(0,n.Z)([' <span class="circle-color" style="','"></span> '])),(0,v.V)({"--circle-color":f(e)}))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,s.iv)(g||(g=(0,n.Z)([".circle-color{display:block;background-color:var(--circle-color);border-radius:10px;width:20px;height:20px}ha-select{width:100%}"])))}}]}}),s.oi),(0,d.Z)([(0,u.Mo)("ha-selector-ui_color")],(function(e,t){var i=function(t){function i(){var t;(0,l.Z)(this,i);for(var n=arguments.length,a=new Array(n),c=0;c<n;c++)a[c]=arguments[c];return t=(0,r.Z)(this,i,[].concat(a)),e((0,o.Z)(t)),t}return(0,c.Z)(i,t),(0,a.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,u.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,u.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,u.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,u.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,u.Cb)()],key:"helper",value:void 0},{kind:"method",key:"render",value:function(){return(0,s.dy)(Z||(Z=(0,n.Z)([' <hui-color-picker .label="','" .hass="','" .value="','" .helper="','" @value-changed="','"></hui-color-picker> '])),this.label,this.hass,this.value,this.helper,this._valueChanged)}},{kind:"method",key:"_valueChanged",value:function(e){(0,h.B)(this,"value-changed",{value:e.detail.value})}}]}}),s.oi))}}]);
+//# sourceMappingURL=9507.o7nl2kHQ570.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9516],{39516:function(e,n,t){t.r(n),t.d(n,{HaSelectorConstant:function(){return s}});var o=t(33368),l=t(71650),i=t(68308),r=t(82390),a=t(69205),u=t(91808),d=(t(97393),t(5095)),c=t(95260),s=(0,u.Z)([(0,c.Mo)("ha-selector-constant")],(function(e,n){var t=function(n){function t(){var n;(0,l.Z)(this,t);for(var o=arguments.length,a=new Array(o),u=0;u<o;u++)a[u]=arguments[u];return n=(0,i.Z)(this,t,[].concat(a)),e((0,r.Z)(n)),n}return(0,a.Z)(t,n),(0,o.Z)(t)}(n);return{F:t,d:[{kind:"field",decorators:[(0,c.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,c.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,c.Cb)()],key:"localizeValue",value:void 0},{kind:"method",key:"render",value:function(){var e,n,t,o,l;if(this.disabled)return d.Ld;var i=null===(e=this.selector.constant)||void 0===e?void 0:e.translation_key,r=i&&this.localizeValue?this.localizeValue("".concat(i,".value")):void 0;return null!==(n=null!==(t=null!=r?r:null===(o=this.selector.constant)||void 0===o?void 0:o.label)&&void 0!==t?t:null===(l=this.selector.constant)||void 0===l?void 0:l.value)&&void 0!==n?n:d.Ld}}]}}),d.oi)}}]);
+//# sourceMappingURL=9516.i7RVaZCgJ8k.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9624],{39624:function(t,i,e){e.r(i),e.d(i,{HaMediaSelector:function(){return V}});var a,n,o,l,d,s,r=e(88962),c=e(33368),u=e(71650),h=e(68308),m=e(82390),_=e(69205),C=e(91808),v=(e(97393),e(88640),e(40271),e(22859),e(85717),e(46349),e(70320),e(5095)),p=e(95260),A=e(53180),g=e(18394),b=e(56311),y=e(92599),M=e(78889),H=e(72824),f=(e(23860),e(39663),e(51358),e(46798),e(47084),e(5239),e(98490),[{name:"media_content_id",required:!1,selector:{text:{}}},{name:"media_content_type",required:!1,selector:{text:{}}}]),V=(0,C.Z)([(0,p.Mo)("ha-selector-media")],(function(t,i){var C=function(i){function e(){var i;(0,u.Z)(this,e);for(var a=arguments.length,n=new Array(a),o=0;o<a;o++)n[o]=arguments[o];return i=(0,h.Z)(this,e,[].concat(n)),t((0,m.Z)(i)),i}return(0,_.Z)(e,i),(0,c.Z)(e)}(i);return{F:C,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,p.SB)()],key:"_thumbnailUrl",value:void 0},{kind:"method",key:"willUpdate",value:function(t){var i=this;if(t.has("value")){var e,a,n=null===(e=this.value)||void 0===e||null===(e=e.metadata)||void 0===e?void 0:e.thumbnail;if(n===(null===(a=t.get("value"))||void 0===a||null===(a=a.metadata)||void 0===a?void 0:a.thumbnail))return;if(n&&n.startsWith("/"))this._thumbnailUrl=void 0,(0,y.iI)(this.hass,n).then((function(t){i._thumbnailUrl=t.path}));else if(n&&n.startsWith("https://brands.home-assistant.io")){var o;this._thumbnailUrl=(0,H.X1)({domain:(0,H.u4)(n),type:"icon",useFallback:!0,darkOptimized:null===(o=this.hass.themes)||void 0===o?void 0:o.darkMode})}else this._thumbnailUrl=n}}},{kind:"method",key:"render",value:function(){var t,i,e,s,c,u,h,m,_,C,p=null!==(t=this.value)&&void 0!==t&&t.entity_id?this.hass.states[this.value.entity_id]:void 0,g=!(null!==(i=this.value)&&void 0!==i&&i.entity_id)||p&&(0,b.e)(p,M.yZ.BROWSE_MEDIA);return(0,v.dy)(a||(a=(0,r.Z)(['<ha-entity-picker .hass="','" .value="','" .label="','" .disabled="','" .helper="','" .required="','" include-domains=\'["media_player"]\' allow-custom-entity @value-changed="','"></ha-entity-picker> ',""])),this.hass,null===(e=this.value)||void 0===e?void 0:e.entity_id,this.label||this.hass.localize("ui.components.selectors.media.pick_media_player"),this.disabled,this.helper,this.required,this._entityChanged,g?(0,v.dy)(o||(o=(0,r.Z)(['<ha-card outlined @click="','" class="','"> <div class="thumbnail ','"> ',' </div> <div class="title"> '," </div> </ha-card>"])),this._pickMedia,this.disabled||null===(s=this.value)||void 0===s||!s.entity_id?"disabled":"",(0,A.$)({portrait:!(null===(c=this.value)||void 0===c||null===(c=c.metadata)||void 0===c||!c.media_class)&&"portrait"===M.Fn[this.value.metadata.children_media_class||this.value.metadata.media_class].thumbnail_ratio}),null!==(u=this.value)&&void 0!==u&&null!==(u=u.metadata)&&void 0!==u&&u.thumbnail?(0,v.dy)(l||(l=(0,r.Z)([' <div class="',' image" style="','"></div> '])),(0,A.$)({"centered-image":!!this.value.metadata.media_class&&["app","directory"].includes(this.value.metadata.media_class)}),this._thumbnailUrl?"background-image: url(".concat(this._thumbnailUrl,");"):""):(0,v.dy)(d||(d=(0,r.Z)([' <div class="icon-holder image"> <ha-svg-icon class="folder" .path="','"></ha-svg-icon> </div> '])),null!==(h=this.value)&&void 0!==h&&h.media_content_id?null!==(m=this.value)&&void 0!==m&&null!==(m=m.metadata)&&void 0!==m&&m.media_class?M.Fn["directory"===this.value.metadata.media_class&&this.value.metadata.children_media_class||this.value.metadata.media_class].icon:"M19 3H5C3.89 3 3 3.89 3 5V19C3 20.1 3.9 21 5 21H19C20.1 21 21 20.1 21 19V5C21 3.89 20.1 3 19 3M10 16V8L15 12":"M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z"),null!==(_=this.value)&&void 0!==_&&_.media_content_id?(null===(C=this.value.metadata)||void 0===C?void 0:C.title)||this.value.media_content_id:this.hass.localize("ui.components.selectors.media.pick_media")):(0,v.dy)(n||(n=(0,r.Z)(["<ha-alert> ",' </ha-alert> <ha-form .hass="','" .data="','" .schema="','" .computeLabel="','"></ha-form>'])),this.hass.localize("ui.components.selectors.media.browse_not_supported"),this.hass,this.value,f,this._computeLabelCallback))}},{kind:"field",key:"_computeLabelCallback",value:function(){var t=this;return function(i){return t.hass.localize("ui.components.selectors.media.".concat(i.name))}}},{kind:"method",key:"_entityChanged",value:function(t){t.stopPropagation(),(0,g.B)(this,"value-changed",{value:{entity_id:t.detail.value,media_content_id:"",media_content_type:""}})}},{kind:"method",key:"_pickMedia",value:function(){var t,i,a,n=this;i=this,a={action:"pick",entityId:this.value.entity_id,navigateIds:null===(t=this.value.metadata)||void 0===t?void 0:t.navigateIds,mediaPickedCallback:function(t){var i;(0,g.B)(n,"value-changed",{value:Object.assign(Object.assign({},n.value),{},{media_content_id:t.item.media_content_id,media_content_type:t.item.media_content_type,metadata:{title:t.item.title,thumbnail:t.item.thumbnail,media_class:t.item.media_class,children_media_class:t.item.children_media_class,navigateIds:null===(i=t.navigateIds)||void 0===i?void 0:i.map((function(t){return{media_content_type:t.media_content_type,media_content_id:t.media_content_id}}))}})})}},(0,g.B)(i,"show-dialog",{dialogTag:"dialog-media-player-browse",dialogImport:function(){return Promise.all([e.e(1706),e.e(2850),e.e(5943),e.e(5887),e.e(1866),e.e(6023),e.e(8597),e.e(7850),e.e(6591),e.e(3687),e.e(9503),e.e(1913),e.e(4303),e.e(7648),e.e(3762)]).then(e.bind(e,93762))},dialogParams:a})}},{kind:"get",static:!0,key:"styles",value:function(){return(0,v.iv)(s||(s=(0,r.Z)(["ha-entity-picker{display:block;margin-bottom:16px}mwc-button{margin-top:8px}ha-alert{display:block;margin-bottom:16px}ha-card{position:relative;width:200px;box-sizing:border-box;cursor:pointer}ha-card.disabled{pointer-events:none;color:var(--disabled-text-color)}ha-card .thumbnail{width:100%;position:relative;box-sizing:border-box;transition:padding-bottom .1s ease-out;padding-bottom:100%}ha-card .thumbnail.portrait{padding-bottom:150%}ha-card .image{border-radius:3px 3px 0 0}.folder{--mdc-icon-size:calc(var(--media-browse-item-size, 175px) * 0.4)}.title{font-size:16px;padding-top:16px;overflow:hidden;text-overflow:ellipsis;margin-bottom:16px;padding-left:16px;padding-right:4px;white-space:nowrap}.image{position:absolute;top:0;right:0;left:0;bottom:0;background-size:cover;background-repeat:no-repeat;background-position:center}.centered-image{margin:0 8px;background-size:contain}.icon-holder{display:flex;justify-content:center;align-items:center}"])))}}]}}),v.oi)},78889:function(t,i,e){e.d(i,{Fn:function(){return d},N8:function(){return l},yZ:function(){return o},zz:function(){return s}});e(36513),e(7179),e(73314),e(63789),e(24074),e(56308),e(17692),e(88640),e(85717),e(58664),e(21157),e(56112);var a="M11,14C12,14 13.05,14.16 14.2,14.44C13.39,15.31 13,16.33 13,17.5C13,18.39 13.25,19.23 13.78,20H3V18C3,16.81 3.91,15.85 5.74,15.12C7.57,14.38 9.33,14 11,14M11,12C9.92,12 9,11.61 8.18,10.83C7.38,10.05 7,9.11 7,8C7,6.92 7.38,6 8.18,5.18C9,4.38 9.92,4 11,4C12.11,4 13.05,4.38 13.83,5.18C14.61,6 15,6.92 15,8C15,9.11 14.61,10.05 13.83,10.83C13.05,11.61 12.11,12 11,12M18.5,10H20L22,10V12H20V17.5A2.5,2.5 0 0,1 17.5,20A2.5,2.5 0 0,1 15,17.5A2.5,2.5 0 0,1 17.5,15C17.86,15 18.19,15.07 18.5,15.21V10Z",n="M8.16,3L6.75,4.41L9.34,7H4C2.89,7 2,7.89 2,9V19C2,20.11 2.89,21 4,21H20C21.11,21 22,20.11 22,19V9C22,7.89 21.11,7 20,7H14.66L17.25,4.41L15.84,3L12,6.84L8.16,3M4,9H17V19H4V9M19.5,9A1,1 0 0,1 20.5,10A1,1 0 0,1 19.5,11A1,1 0 0,1 18.5,10A1,1 0 0,1 19.5,9M19.5,12A1,1 0 0,1 20.5,13A1,1 0 0,1 19.5,14A1,1 0 0,1 18.5,13A1,1 0 0,1 19.5,12Z",o=function(t){return t[t.PAUSE=1]="PAUSE",t[t.SEEK=2]="SEEK",t[t.VOLUME_SET=4]="VOLUME_SET",t[t.VOLUME_MUTE=8]="VOLUME_MUTE",t[t.PREVIOUS_TRACK=16]="PREVIOUS_TRACK",t[t.NEXT_TRACK=32]="NEXT_TRACK",t[t.TURN_ON=128]="TURN_ON",t[t.TURN_OFF=256]="TURN_OFF",t[t.PLAY_MEDIA=512]="PLAY_MEDIA",t[t.VOLUME_STEP=1024]="VOLUME_STEP",t[t.SELECT_SOURCE=2048]="SELECT_SOURCE",t[t.STOP=4096]="STOP",t[t.CLEAR_PLAYLIST=8192]="CLEAR_PLAYLIST",t[t.PLAY=16384]="PLAY",t[t.SHUFFLE_SET=32768]="SHUFFLE_SET",t[t.SELECT_SOUND_MODE=65536]="SELECT_SOUND_MODE",t[t.BROWSE_MEDIA=131072]="BROWSE_MEDIA",t[t.REPEAT_SET=262144]="REPEAT_SET",t[t.GROUPING=524288]="GROUPING",t}({}),l="browser",d={album:{icon:"M12,11A1,1 0 0,0 11,12A1,1 0 0,0 12,13A1,1 0 0,0 13,12A1,1 0 0,0 12,11M12,16.5C9.5,16.5 7.5,14.5 7.5,12C7.5,9.5 9.5,7.5 12,7.5C14.5,7.5 16.5,9.5 16.5,12C16.5,14.5 14.5,16.5 12,16.5M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z",layout:"grid"},app:{icon:"M21 2H3C1.9 2 1 2.9 1 4V20C1 21.1 1.9 22 3 22H21C22.1 22 23 21.1 23 20V4C23 2.9 22.1 2 21 2M21 7H3V4H21V7Z",layout:"grid",show_list_images:!0},artist:{icon:a,layout:"grid",show_list_images:!0},channel:{icon:n,thumbnail_ratio:"portrait",layout:"grid",show_list_images:!0},composer:{icon:"M11,4A4,4 0 0,1 15,8A4,4 0 0,1 11,12A4,4 0 0,1 7,8A4,4 0 0,1 11,4M11,6A2,2 0 0,0 9,8A2,2 0 0,0 11,10A2,2 0 0,0 13,8A2,2 0 0,0 11,6M11,13C12.1,13 13.66,13.23 15.11,13.69C14.5,14.07 14,14.6 13.61,15.23C12.79,15.03 11.89,14.9 11,14.9C8.03,14.9 4.9,16.36 4.9,17V18.1H13.04C13.13,18.8 13.38,19.44 13.76,20H3V17C3,14.34 8.33,13 11,13M18.5,10H20L22,10V12H20V17.5A2.5,2.5 0 0,1 17.5,20A2.5,2.5 0 0,1 15,17.5A2.5,2.5 0 0,1 17.5,15C17.86,15 18.19,15.07 18.5,15.21V10Z",layout:"grid",show_list_images:!0},contributing_artist:{icon:a,layout:"grid",show_list_images:!0},directory:{icon:"M10,4H4C2.89,4 2,4.89 2,6V18A2,2 0 0,0 4,20H20A2,2 0 0,0 22,18V8C22,6.89 21.1,6 20,6H12L10,4Z",layout:"grid",show_list_images:!0},episode:{icon:n,layout:"grid",thumbnail_ratio:"portrait",show_list_images:!0},game:{icon:"M7,6H17A6,6 0 0,1 23,12A6,6 0 0,1 17,18C15.22,18 13.63,17.23 12.53,16H11.47C10.37,17.23 8.78,18 7,18A6,6 0 0,1 1,12A6,6 0 0,1 7,6M6,9V11H4V13H6V15H8V13H10V11H8V9H6M15.5,12A1.5,1.5 0 0,0 14,13.5A1.5,1.5 0 0,0 15.5,15A1.5,1.5 0 0,0 17,13.5A1.5,1.5 0 0,0 15.5,12M18.5,9A1.5,1.5 0 0,0 17,10.5A1.5,1.5 0 0,0 18.5,12A1.5,1.5 0 0,0 20,10.5A1.5,1.5 0 0,0 18.5,9Z",layout:"grid",thumbnail_ratio:"portrait"},genre:{icon:"M8.11,19.45C5.94,18.65 4.22,16.78 3.71,14.35L2.05,6.54C1.81,5.46 2.5,4.4 3.58,4.17L13.35,2.1L13.38,2.09C14.45,1.88 15.5,2.57 15.72,3.63L16.07,5.3L20.42,6.23H20.45C21.5,6.47 22.18,7.53 21.96,8.59L20.3,16.41C19.5,20.18 15.78,22.6 12,21.79C10.42,21.46 9.08,20.61 8.11,19.45V19.45M20,8.18L10.23,6.1L8.57,13.92V13.95C8,16.63 9.73,19.27 12.42,19.84C15.11,20.41 17.77,18.69 18.34,16L20,8.18M16,16.5C15.37,17.57 14.11,18.16 12.83,17.89C11.56,17.62 10.65,16.57 10.5,15.34L16,16.5M8.47,5.17L4,6.13L5.66,13.94L5.67,13.97C5.82,14.68 6.12,15.32 6.53,15.87C6.43,15.1 6.45,14.3 6.62,13.5L7.05,11.5C6.6,11.42 6.21,11.17 6,10.81C6.06,10.2 6.56,9.66 7.25,9.5C7.33,9.5 7.4,9.5 7.5,9.5L8.28,5.69C8.32,5.5 8.38,5.33 8.47,5.17M15.03,12.23C15.35,11.7 16.03,11.42 16.72,11.57C17.41,11.71 17.91,12.24 18,12.86C17.67,13.38 17,13.66 16.3,13.5C15.61,13.37 15.11,12.84 15.03,12.23M10.15,11.19C10.47,10.66 11.14,10.38 11.83,10.53C12.5,10.67 13.03,11.21 13.11,11.82C12.78,12.34 12.11,12.63 11.42,12.5C10.73,12.33 10.23,11.8 10.15,11.19M11.97,4.43L13.93,4.85L13.77,4.05L11.97,4.43Z",layout:"grid",show_list_images:!0},image:{icon:"M8.5,13.5L11,16.5L14.5,12L19,18H5M21,19V5C21,3.89 20.1,3 19,3H5A2,2 0 0,0 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19Z",layout:"grid",show_list_images:!0},movie:{icon:"M18,4L20,8H17L15,4H13L15,8H12L10,4H8L10,8H7L5,4H4A2,2 0 0,0 2,6V18A2,2 0 0,0 4,20H20A2,2 0 0,0 22,18V4H18Z",thumbnail_ratio:"portrait",layout:"grid",show_list_images:!0},music:{icon:"M21,3V15.5A3.5,3.5 0 0,1 17.5,19A3.5,3.5 0 0,1 14,15.5A3.5,3.5 0 0,1 17.5,12C18.04,12 18.55,12.12 19,12.34V6.47L9,8.6V17.5A3.5,3.5 0 0,1 5.5,21A3.5,3.5 0 0,1 2,17.5A3.5,3.5 0 0,1 5.5,14C6.04,14 6.55,14.12 7,14.34V6L21,3Z",show_list_images:!0},playlist:{icon:"M15,6H3V8H15V6M15,10H3V12H15V10M3,16H11V14H3V16M17,6V14.18C16.69,14.07 16.35,14 16,14A3,3 0 0,0 13,17A3,3 0 0,0 16,20A3,3 0 0,0 19,17V8H22V6H17Z",layout:"grid",show_list_images:!0},podcast:{icon:"M17,18.25V21.5H7V18.25C7,16.87 9.24,15.75 12,15.75C14.76,15.75 17,16.87 17,18.25M12,5.5A6.5,6.5 0 0,1 18.5,12C18.5,13.25 18.15,14.42 17.54,15.41L16,14.04C16.32,13.43 16.5,12.73 16.5,12C16.5,9.5 14.5,7.5 12,7.5C9.5,7.5 7.5,9.5 7.5,12C7.5,12.73 7.68,13.43 8,14.04L6.46,15.41C5.85,14.42 5.5,13.25 5.5,12A6.5,6.5 0 0,1 12,5.5M12,1.5A10.5,10.5 0 0,1 22.5,12C22.5,14.28 21.77,16.39 20.54,18.11L19.04,16.76C19.96,15.4 20.5,13.76 20.5,12A8.5,8.5 0 0,0 12,3.5A8.5,8.5 0 0,0 3.5,12C3.5,13.76 4.04,15.4 4.96,16.76L3.46,18.11C2.23,16.39 1.5,14.28 1.5,12A10.5,10.5 0 0,1 12,1.5M12,9.5A2.5,2.5 0 0,1 14.5,12A2.5,2.5 0 0,1 12,14.5A2.5,2.5 0 0,1 9.5,12A2.5,2.5 0 0,1 12,9.5Z",layout:"grid"},season:{icon:n,layout:"grid",thumbnail_ratio:"portrait",show_list_images:!0},track:{icon:"M14,2H6A2,2 0 0,0 4,4V20A2,2 0 0,0 6,22H18A2,2 0 0,0 20,20V8L14,2M13,13H11V18A2,2 0 0,1 9,20A2,2 0 0,1 7,18A2,2 0 0,1 9,16C9.4,16 9.7,16.1 10,16.3V11H13V13M13,9V3.5L18.5,9H13Z"},tv_show:{icon:n,layout:"grid",thumbnail_ratio:"portrait"},url:{icon:"M16.36,14C16.44,13.34 16.5,12.68 16.5,12C16.5,11.32 16.44,10.66 16.36,10H19.74C19.9,10.64 20,11.31 20,12C20,12.69 19.9,13.36 19.74,14M14.59,19.56C15.19,18.45 15.65,17.25 15.97,16H18.92C17.96,17.65 16.43,18.93 14.59,19.56M14.34,14H9.66C9.56,13.34 9.5,12.68 9.5,12C9.5,11.32 9.56,10.65 9.66,10H14.34C14.43,10.65 14.5,11.32 14.5,12C14.5,12.68 14.43,13.34 14.34,14M12,19.96C11.17,18.76 10.5,17.43 10.09,16H13.91C13.5,17.43 12.83,18.76 12,19.96M8,8H5.08C6.03,6.34 7.57,5.06 9.4,4.44C8.8,5.55 8.35,6.75 8,8M5.08,16H8C8.35,17.25 8.8,18.45 9.4,19.56C7.57,18.93 6.03,17.65 5.08,16M4.26,14C4.1,13.36 4,12.69 4,12C4,11.31 4.1,10.64 4.26,10H7.64C7.56,10.66 7.5,11.32 7.5,12C7.5,12.68 7.56,13.34 7.64,14M12,4.03C12.83,5.23 13.5,6.57 13.91,8H10.09C10.5,6.57 11.17,5.23 12,4.03M18.92,8H15.97C15.65,6.75 15.19,5.55 14.59,4.44C16.43,5.07 17.96,6.34 18.92,8M12,2C6.47,2 2,6.5 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z"},video:{icon:"M17,10.5V7A1,1 0 0,0 16,6H4A1,1 0 0,0 3,7V17A1,1 0 0,0 4,18H16A1,1 0 0,0 17,17V13.5L21,17.5V6.5L17,10.5Z",layout:"grid",show_list_images:!0}},s=function(t,i,e,a){return t.callWS({type:"media_player/browse_media",entity_id:i,media_content_id:e,media_content_type:a})}},56112:function(t,i,e){e.d(i,{MV:function(){return s},Wg:function(){return l},Xk:function(){return o},b_:function(){return n},yP:function(){return d}});e(88640);var a="media-source://tts/",n=function(t){return t.startsWith(a)},o=function(t){return t.substring(19)},l=function(t,i,e){return t.callWS({type:"tts/engine/list",language:i,country:e})},d=function(t,i){return t.callWS({type:"tts/engine/get",engine_id:i})},s=function(t,i,e){return t.callWS({type:"tts/engine/voices",engine_id:i,language:e})}},72824:function(t,i,e){e.d(i,{X1:function(){return a},u4:function(){return n},zC:function(){return o}});e(97393),e(88640);var a=function(t){return"https://brands.home-assistant.io/".concat(t.brand?"brands/":"").concat(t.useFallback?"_/":"").concat(t.domain,"/").concat(t.darkOptimized?"dark_":"").concat(t.type,".png")},n=function(t){return t.split("/")[4]},o=function(t){return t.startsWith("https://brands.home-assistant.io/")}}}]);
+//# sourceMappingURL=9624.xNrOvxvIjIQ.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9663],{4771:function(e,n,t){function r(e){return void 0===e||Array.isArray(e)?e:[e]}t.d(n,{r:function(){return r}})},17267:function(e,n,t){t.d(n,{h:function(){return d}});var r=t(62746),i=t(71650),o=t(33368),u=t(68308),a=t(69205),c=(t(51467),t(46798),t(9849),t(50289),t(94167),t(82073),t(5095)),l=t(57835),d=(0,l.XM)(function(e){function n(e){var t;if((0,i.Z)(this,n),(t=(0,u.Z)(this,n,[e]))._element=void 0,e.type!==l.pX.CHILD)throw new Error("dynamicElementDirective can only be used in content bindings");return t}return(0,a.Z)(n,e),(0,o.Z)(n,[{key:"update",value:function(e,n){var t=this,i=(0,r.Z)(n,2),o=i[0],u=i[1];return this._element&&this._element.localName===o?(u&&Object.entries(u).forEach((function(e){var n=(0,r.Z)(e,2),i=n[0],o=n[1];t._element[i]=o})),c.Jb):this.render(o,u)}},{key:"render",value:function(e,n){var t=this;return this._element=document.createElement(e),n&&Object.entries(n).forEach((function(e){var n=(0,r.Z)(e,2),i=n[0],o=n[1];t._element[i]=o})),this._element}}]),n}(l.Xe))},36655:function(e,n,t){t.d(n,{M:function(){return r}});t(56308);var r=function(e){return e.substr(0,e.indexOf("."))}},44672:function(e,n,t){t.d(n,{p:function(){return r}});t(56308);var r=function(e){return e.substr(e.indexOf(".")+1)}},3850:function(e,n,t){t.d(n,{N:function(){return i}});var r=t(36655),i=function(e){return(0,r.M)(e.entity_id)}},2733:function(e,n,t){t.d(n,{C:function(){return i}});t(63789),t(24074),t(46798),t(94570);var r=t(44672),i=function(e){return n=e.entity_id,void 0===(t=e.attributes).friendly_name?(0,r.p)(n).replace(/_/g," "):(null!==(i=t.friendly_name)&&void 0!==i?i:"").toString();var n,t,i}},56311:function(e,n,t){t.d(n,{e:function(){return r}});var r=function(e,n){return i(e.attributes,n)},i=function(e,n){return 0!=(e.supported_features&n)}},28858:function(e,n,t){t.d(n,{$:function(){return a},f:function(){return c}});var r=t(14516),i=(0,r.Z)((function(e){return new Intl.Collator(e)})),o=(0,r.Z)((function(e){return new Intl.Collator(e,{sensitivity:"accent"})})),u=function(e,n){return e<n?-1:e>n?1:0},a=function(e,n){var t,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;return null!==(t=Intl)&&void 0!==t&&t.Collator?i(r).compare(e,n):u(e,n)},c=function(e,n){var t,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;return null!==(t=Intl)&&void 0!==t&&t.Collator?o(r).compare(e,n):u(e.toLowerCase(),n.toLowerCase())}},72218:function(e,n,t){t.d(n,{D:function(){return r}});var r=function(e,n){var t,r=arguments.length>2&&void 0!==arguments[2]&&arguments[2],i=function(){for(var i=arguments.length,o=new Array(i),u=0;u<i;u++)o[u]=arguments[u];var a=r&&!t;clearTimeout(t),t=window.setTimeout((function(){t=void 0,r||e.apply(void 0,o)}),n),a&&e.apply(void 0,o)};return i.cancel=function(){clearTimeout(t)},i}},39663:function(e,n,t){var r,i,o,u,a,c,l,d=t(93359),s=t(62746),f=t(88962),v=t(99312),h=t(40039),m=t(81043),b=t(33368),p=t(71650),y=t(68308),k=t(82390),g=t(69205),_=t(91808),P=t(34541),Z=t(47838),C=(t(51358),t(46798),t(47084),t(5239),t(98490),t(22859),t(97393),t(9849),t(50289),t(94167),t(46349),t(70320),t(85717),t(82073),t(5095)),w=t(95260),x=t(17267),E=t(18394),O=(t(23860),t(86336),{boolean:function(){return Promise.all([t.e(1985),t.e(5107)]).then(t.bind(t,45107))},constant:function(){return t.e(9948).then(t.bind(t,9948))},float:function(){return Promise.all([t.e(1706),t.e(2850),t.e(8224)]).then(t.bind(t,78224))},grid:function(){return t.e(1880).then(t.bind(t,21880))},expandable:function(){return t.e(8874).then(t.bind(t,48874))},integer:function(){return Promise.all([t.e(6023),t.e(2488),t.e(2648),t.e(9030)]).then(t.bind(t,79030))},multi_select:function(){return Promise.all([t.e(1706),t.e(2850),t.e(1985),t.e(8663)]).then(t.bind(t,58663))},positive_time_period_dict:function(){return Promise.all([t.e(1706),t.e(5943),t.e(4106),t.e(6118)]).then(t.bind(t,76255))},select:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(5887),t.e(6023),t.e(1985),t.e(2488),t.e(7098),t.e(6591),t.e(5778)]).then(t.bind(t,75778))},string:function(){return Promise.all([t.e(1706),t.e(2850),t.e(947)]).then(t.bind(t,20947))}}),j=function(e,n){return e?n.name?e[n.name]:e:null};(0,_.Z)([(0,w.Mo)("ha-form")],(function(e,n){var t,_=function(n){function t(){var n;(0,p.Z)(this,t);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return n=(0,y.Z)(this,t,[].concat(i)),e((0,k.Z)(n)),n}return(0,g.Z)(t,n),(0,b.Z)(t)}(n);return{F:_,d:[{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"data",value:void 0},{kind:"field",decorators:[(0,w.Cb)({attribute:!1})],key:"schema",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"error",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"warning",value:void 0},{kind:"field",decorators:[(0,w.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,w.Cb)()],key:"computeError",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"computeWarning",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"computeLabel",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"computeHelper",value:void 0},{kind:"field",decorators:[(0,w.Cb)()],key:"localizeValue",value:void 0},{kind:"method",key:"getFormProperties",value:function(){return{}}},{kind:"method",key:"focus",value:(t=(0,m.Z)((0,v.Z)().mark((function e(){var n,t,r,i;return(0,v.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:if(n=this.renderRoot.querySelector(".root")){e.next=5;break}return e.abrupt("return");case 5:t=(0,h.Z)(n.children),e.prev=6,t.s();case 8:if((r=t.n()).done){e.next=18;break}if("HA-ALERT"===(i=r.value).tagName){e.next=16;break}if(!(i instanceof C.fl)){e.next=14;break}return e.next=14,i.updateComplete;case 14:return i.focus(),e.abrupt("break",18);case 16:e.next=8;break;case 18:e.next=23;break;case 20:e.prev=20,e.t0=e.catch(6),t.e(e.t0);case 23:return e.prev=23,t.f(),e.finish(23);case 26:case"end":return e.stop()}}),e,this,[[6,20,23,26]])}))),function(){return t.apply(this,arguments)})},{kind:"method",key:"willUpdate",value:function(e){e.has("schema")&&this.schema&&this.schema.forEach((function(e){var n;"selector"in e||null===(n=O[e.type])||void 0===n||n.call(O)}))}},{kind:"method",key:"render",value:function(){var e=this;return(0,C.dy)(r||(r=(0,f.Z)([' <div class="root" part="root"> '," "," </div> "])),this.error&&this.error.base?(0,C.dy)(i||(i=(0,f.Z)([' <ha-alert alert-type="error"> '," </ha-alert> "])),this._computeError(this.error.base,this.schema)):"",this.schema.map((function(n){var t,r=function(e,n){return e&&n.name?e[n.name]:null}(e.error,n),i=function(e,n){return e&&n.name?e[n.name]:null}(e.warning,n);return(0,C.dy)(o||(o=(0,f.Z)([" "," "," "])),r?(0,C.dy)(u||(u=(0,f.Z)([' <ha-alert own-margin alert-type="error"> '," </ha-alert> "])),e._computeError(r,n)):i?(0,C.dy)(a||(a=(0,f.Z)([' <ha-alert own-margin alert-type="warning"> '," </ha-alert> "])),e._computeWarning(i,n)):"","selector"in n?(0,C.dy)(c||(c=(0,f.Z)(['<ha-selector .schema="','" .hass="','" .name="','" .selector="','" .value="','" .label="','" .disabled="','" .placeholder="','" .helper="','" .localizeValue="','" .required="','" .context="','"></ha-selector>'])),n,e.hass,n.name,n.selector,j(e.data,n),e._computeLabel(n,e.data),n.disabled||e.disabled||!1,n.required?"":n.default,e._computeHelper(n),e.localizeValue,n.required||!1,e._generateContext(n)):(0,x.h)(e.fieldElementName(n.type),Object.assign({schema:n,data:j(e.data,n),label:e._computeLabel(n,e.data),helper:e._computeHelper(n),disabled:e.disabled||n.disabled||!1,hass:e.hass,localize:null===(t=e.hass)||void 0===t?void 0:t.localize,computeLabel:e.computeLabel,computeHelper:e.computeHelper,context:e._generateContext(n)},e.getFormProperties())))})))}},{kind:"method",key:"fieldElementName",value:function(e){return"ha-form-".concat(e)}},{kind:"method",key:"_generateContext",value:function(e){if(e.context){for(var n={},t=0,r=Object.entries(e.context);t<r.length;t++){var i=(0,s.Z)(r[t],2),o=i[0],u=i[1];n[o]=this.data[u]}return n}}},{kind:"method",key:"createRenderRoot",value:function(){var e=(0,P.Z)((0,Z.Z)(_.prototype),"createRenderRoot",this).call(this);return this.addValueChangedListener(e),e}},{kind:"method",key:"addValueChangedListener",value:function(e){var n=this;e.addEventListener("value-changed",(function(e){e.stopPropagation();var t=e.target.schema;if(e.target!==n){var r=t.name?(0,d.Z)({},t.name,e.detail.value):e.detail.value;n.data=Object.assign(Object.assign({},n.data),r),(0,E.B)(n,"value-changed",{value:n.data})}}))}},{kind:"method",key:"_computeLabel",value:function(e,n){return this.computeLabel?this.computeLabel(e,n):e?e.name:""}},{kind:"method",key:"_computeHelper",value:function(e){return this.computeHelper?this.computeHelper(e):""}},{kind:"method",key:"_computeError",value:function(e,n){return this.computeError?this.computeError(e,n):e}},{kind:"method",key:"_computeWarning",value:function(e,n){return this.computeWarning?this.computeWarning(e,n):e}},{kind:"get",static:!0,key:"styles",value:function(){return(0,C.iv)(l||(l=(0,f.Z)([".root>*{display:block}.root>:not([own-margin]):not(:last-child){margin-bottom:24px}ha-alert[own-margin]{margin-bottom:4px}"])))}}]}}),C.oi)},86336:function(e,n,t){var r,i=t(88962),o=t(93359),u=t(99312),a=t(81043),c=t(33368),l=t(71650),d=t(68308),s=t(82390),f=t(69205),v=t(91808),h=(t(51358),t(46798),t(47084),t(5239),t(98490),t(78399),t(56086),t(47884),t(81912),t(64584),t(41483),t(12367),t(9454),t(97393),t(65974),t(63789),t(24074),t(22859),t(5095)),m=t(95260),b=t(14516),p=t(17267),y=t(29934),k={action:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(5887),t.e(1866),t.e(1985),t.e(2771),t.e(7426),t.e(1189),t.e(6824),t.e(6591),t.e(3687),t.e(9503),t.e(1913),t.e(4303),t.e(4106),t.e(392),t.e(3908),t.e(1660),t.e(1848),t.e(2552),t.e(4871),t.e(9624),t.e(4993)]).then(t.bind(t,4993))},addon:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(657)]).then(t.bind(t,20657))},area:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(1913),t.e(5718),t.e(8246)]).then(t.bind(t,15734))},area_filter:function(){return Promise.all([t.e(1706),t.e(2850),t.e(1117)]).then(t.bind(t,1117))},attribute:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(1866),t.e(6591),t.e(3687),t.e(3908),t.e(6138)]).then(t.bind(t,72552))},assist_pipeline:function(){return Promise.all([t.e(1706),t.e(5943),t.e(5059)]).then(t.bind(t,75059))},boolean:function(){return Promise.all([t.e(8942),t.e(339)]).then(t.bind(t,10339))},color_rgb:function(){return Promise.all([t.e(1706),t.e(2850),t.e(4529)]).then(t.bind(t,14529))},condition:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(5887),t.e(1866),t.e(2771),t.e(7426),t.e(1189),t.e(6591),t.e(3687),t.e(9503),t.e(1913),t.e(4303),t.e(392),t.e(3908),t.e(1660),t.e(2552),t.e(672)]).then(t.bind(t,93526))},config_entry:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(3395)]).then(t.bind(t,93395))},conversation_agent:function(){return Promise.all([t.e(1706),t.e(5943),t.e(5803)]).then(t.bind(t,65803))},constant:function(){return t.e(9516).then(t.bind(t,39516))},country:function(){return Promise.all([t.e(1706),t.e(5943),t.e(1866),t.e(2166)]).then(t.bind(t,2166))},date:function(){return Promise.all([t.e(1706),t.e(2850),t.e(1866),t.e(9683),t.e(4340)]).then(t.bind(t,24340))},datetime:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(1866),t.e(4106),t.e(9683),t.e(8137)]).then(t.bind(t,58902))},device:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(1913),t.e(7145)]).then(t.bind(t,72722))},duration:function(){return Promise.all([t.e(1706),t.e(5943),t.e(4106),t.e(1794)]).then(t.bind(t,86086))},entity:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(3687),t.e(9503),t.e(1913),t.e(4303),t.e(5775),t.e(6716)]).then(t.bind(t,6371))},statistic:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(3687),t.e(9503),t.e(1913),t.e(4303),t.e(9693)]).then(t.bind(t,28112))},file:function(){return Promise.all([t.e(2692),t.e(6251)]).then(t.bind(t,90272))},language:function(){return Promise.all([t.e(1706),t.e(5943),t.e(1866),t.e(7648),t.e(1457)]).then(t.bind(t,71457))},navigation:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(8689)]).then(t.bind(t,78689))},number:function(){return Promise.all([t.e(1706),t.e(2850),t.e(6023),t.e(2488),t.e(2648),t.e(8075)]).then(t.bind(t,68075))},object:function(){return Promise.all([t.e(2771),t.e(7426),t.e(392),t.e(9204)]).then(t.bind(t,50527))},select:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(5887),t.e(6023),t.e(1985),t.e(2488),t.e(7098),t.e(6591),t.e(2802)]).then(t.bind(t,62802))},selector:function(){return t.e(4755).then(t.bind(t,34755))},state:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(6591),t.e(6196)]).then(t.bind(t,56196))},backup_location:function(){return Promise.all([t.e(1706),t.e(5943),t.e(1244)]).then(t.bind(t,21244))},stt:function(){return Promise.all([t.e(1706),t.e(5943),t.e(6315)]).then(t.bind(t,86315))},target:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5887),t.e(5396),t.e(6591),t.e(3687),t.e(9503),t.e(1913),t.e(4303),t.e(5718),t.e(5775),t.e(1948)]).then(t.bind(t,51948))},template:function(){return t.e(9766).then(t.bind(t,9766))},text:function(){return Promise.all([t.e(1706),t.e(2850),t.e(1049)]).then(t.bind(t,1049))},time:function(){return Promise.all([t.e(1706),t.e(5943),t.e(4106),t.e(2102)]).then(t.bind(t,91977))},icon:function(){return Promise.all([t.e(3687),t.e(9503),t.e(9255)]).then(t.bind(t,89255))},media:function(){return Promise.all([t.e(9624),t.e(1336)]).then(t.bind(t,39624))},theme:function(){return Promise.all([t.e(1706),t.e(5943),t.e(9877)]).then(t.bind(t,49877))},trigger:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(5887),t.e(1866),t.e(1985),t.e(2771),t.e(7426),t.e(1189),t.e(6824),t.e(6591),t.e(3687),t.e(9503),t.e(1913),t.e(4303),t.e(392),t.e(3908),t.e(1660),t.e(1848),t.e(2210)]).then(t.bind(t,81501))},tts:function(){return Promise.all([t.e(1706),t.e(5943),t.e(3983)]).then(t.bind(t,23983))},tts_voice:function(){return Promise.all([t.e(1706),t.e(5943),t.e(1666)]).then(t.bind(t,71666))},location:function(){return t.e(6782).then(t.bind(t,46782))},color_temp:function(){return Promise.all([t.e(6023),t.e(2488),t.e(2648),t.e(8115),t.e(5891)]).then(t.bind(t,65891))},ui_action:function(){return Promise.all([t.e(1706),t.e(2850),t.e(5943),t.e(5887),t.e(1985),t.e(2771),t.e(7426),t.e(6591),t.e(392),t.e(4871),t.e(141)]).then(t.bind(t,41932))},ui_color:function(){return Promise.all([t.e(1706),t.e(5943),t.e(9507)]).then(t.bind(t,79507))}},g=new Set(["ui-action","ui-color"]);(0,v.Z)([(0,m.Mo)("ha-selector")],(function(e,n){var t,v=function(n){function t(){var n;(0,l.Z)(this,t);for(var r=arguments.length,i=new Array(r),o=0;o<r;o++)i[o]=arguments[o];return n=(0,d.Z)(this,t,[].concat(i)),e((0,s.Z)(n)),n}return(0,f.Z)(t,n),(0,c.Z)(t)}(n);return{F:v,d:[{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"name",value:void 0},{kind:"field",decorators:[(0,m.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"localizeValue",value:void 0},{kind:"field",decorators:[(0,m.Cb)()],key:"placeholder",value:void 0},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,m.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"field",decorators:[(0,m.Cb)()],key:"context",value:void 0},{kind:"method",key:"focus",value:(t=(0,a.Z)((0,u.Z)().mark((function e(){var n;return(0,u.Z)().wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.updateComplete;case 2:null===(n=this.renderRoot.querySelector("#selector"))||void 0===n||n.focus();case 3:case"end":return e.stop()}}),e,this)}))),function(){return t.apply(this,arguments)})},{kind:"get",key:"_type",value:function(){var e=Object.keys(this.selector)[0];return g.has(e)?e.replace("-","_"):e}},{kind:"method",key:"willUpdate",value:function(e){var n;e.has("selector")&&this.selector&&(null===(n=k[this._type])||void 0===n||n.call(k))}},{kind:"field",key:"_handleLegacySelector",value:function(){var e=this;return(0,b.Z)((function(n){if("entity"in n)return(0,y.CM)(n);if("device"in n)return(0,y.c9)(n);var t=Object.keys(e.selector)[0];return g.has(t)?(0,o.Z)({},t.replace("-","_"),n[t]):n}))}},{kind:"method",key:"render",value:function(){return(0,h.dy)(r||(r=(0,i.Z)([" "," "])),(0,p.h)("ha-selector-".concat(this._type),{hass:this.hass,name:this.name,selector:this._handleLegacySelector(this.selector),value:this.value,label:this.label,placeholder:this.placeholder,disabled:this.disabled,required:this.required,helper:this.helper,context:this.context,localizeValue:this.localizeValue,id:"selector"}))}}]}}),h.oi)},16061:function(e,n,t){t.d(n,{jL:function(){return d},R6:function(){return f},HP:function(){return v},q4:function(){return l},t1:function(){return s}});var r=t(40039),i=(t(22859),t(87438),t(46798),t(9849),t(22890),t(85717),t(37313),t(36513),t(2733)),o=(t(28858),t(72881)),u=t(72218),a=function(e){return e.sendMessagePromise({type:"config/device_registry/list"})},c=function(e,n){return e.subscribeEvents((0,u.D)((function(){return a(e).then((function(e){return n.setState(e,!0)}))}),500,!0),"device_registry_updated")},l=function(e,n){return(0,o.B)("_dr",a,c,e,n)},d=function(e,n,t){return e.name_by_user||e.name||t&&function(e,n){var t,o=(0,r.Z)(n||[]);try{for(o.s();!(t=o.n()).done;){var u=t.value,a="string"==typeof u?u:u.entity_id,c=e.states[a];if(c)return(0,i.C)(c)}}catch(l){o.e(l)}finally{o.f()}}(n,t)||n.localize("ui.panel.config.devices.unnamed_device",{type:n.localize("ui.panel.config.devices.type.".concat(e.entry_type||"device"))})},s=function(e,n,t){return e.callWS(Object.assign({type:"config/device_registry/update",device_id:n},t))},f=function(e){var n,t={},i=(0,r.Z)(e);try{for(i.s();!(n=i.n()).done;){var o=n.value;o.device_id&&(o.device_id in t||(t[o.device_id]=[]),t[o.device_id].push(o))}}catch(u){i.e(u)}finally{i.f()}return t},v=function(e,n){var t,i={},o=(0,r.Z)(n);try{for(o.s();!(t=o.n()).done;){var u=t.value,a=e[u.entity_id];null!=a&&a.domain&&null!==u.device_id&&(i[u.device_id]||(i[u.device_id]=[]),i[u.device_id].push(a.domain))}}catch(c){o.e(c)}finally{o.f()}return i}},29934:function(e,n,t){t.d(n,{CM:function(){return p},QQ:function(){return h},aV:function(){return s},c9:function(){return y},lE:function(){return m},lV:function(){return b},qJ:function(){return v},vI:function(){return f},xO:function(){return d}});var r=t(25518),i=(t(46798),t(9849),t(50289),t(94167),t(10733),t(36513),t(13526),t(87438),t(22890),t(40271),t(60163),t(85717),t(4771)),o=t(3850),u=t(56311),a=t(16061),c=["domain","integration","device_class"],l=["integration","manufacturer","model"],d=function(e,n,t,r,i,o){var u=[],a=[];return Object.values(t).forEach((function(t){t.area_id===n&&v(e,Object.values(r),t,i,o)&&a.push(t.id)})),Object.values(r).forEach((function(t){t.area_id===n&&h(e.states[t.entity_id],i,o)&&u.push(t.entity_id)})),{devices:a,entities:u}},s=function(e,n,t,r,i){var o=[];return Object.values(t).forEach((function(t){t.device_id===n&&h(e.states[t.entity_id],r,i)&&o.push(t.entity_id)})),{entities:o}},f=function(e,n,t,r,i,o){return!!Object.values(t).some((function(t){return!(t.area_id!==r||!v(e,Object.values(n),t,i,o))}))||Object.values(n).some((function(n){return!(n.area_id!==r||!h(e.states[n.entity_id],i,o))}))},v=function(e,n,t,r,o){var u,c,l=o?(0,a.HP)(o,n):void 0;return!(null!==(u=r.target)&&void 0!==u&&u.device&&!(0,i.r)(r.target.device).some((function(e){return m(e,t,l)})))&&(null===(c=r.target)||void 0===c||!c.entity||n.filter((function(e){return e.device_id===t.id})).some((function(n){var t=e.states[n.entity_id];return h(t,r,o)})))},h=function(e,n,t){var r;return null===(r=n.target)||void 0===r||!r.entity||(0,i.r)(n.target.entity).some((function(n){return b(n,e,t)}))},m=function(e,n,t){var r,i=e.manufacturer,o=e.model,u=e.integration;if(i&&n.manufacturer!==i)return!1;if(o&&n.model!==o)return!1;if(u&&t&&(null==t||null===(r=t[n.id])||void 0===r||!r.includes(u)))return!1;return!0},b=function(e,n,t){var r,a=e.domain,c=e.device_class,l=e.supported_features,d=e.integration;if(a){var s=(0,o.N)(n);if(Array.isArray(a)?!a.includes(s):s!==a)return!1}if(c){var f=n.attributes.device_class;if(f&&Array.isArray(c)?!c.includes(f):f!==c)return!1}return!(l&&!(0,i.r)(l).some((function(e){return(0,u.e)(n,e)})))&&(!d||(null==t||null===(r=t[n.entity_id])||void 0===r?void 0:r.domain)===d)},p=function(e){if(!e.entity)return{entity:null};if("filter"in e.entity)return e;var n=e.entity,t=n.domain,i=n.integration,o=n.device_class,u=(0,r.Z)(n,c);return t||i||o?{entity:Object.assign(Object.assign({},u),{},{filter:{domain:t,integration:i,device_class:o}})}:{entity:u}},y=function(e){if(!e.device)return{device:null};if("filter"in e.device)return e;var n=e.device,t=n.integration,i=n.manufacturer,o=n.model,u=(0,r.Z)(n,l);return t||i||o?{device:Object.assign(Object.assign({},u),{},{filter:{integration:t,manufacturer:i,model:o}})}:{device:u}}},72881:function(e,n,t){t.d(n,{B:function(){return o}});t(51467),t(97393),t(36513),t(85717),t(46798),t(47084);var r=function(e){var n=[];function t(t,r){e=r?t:Object.assign(Object.assign({},e),t);for(var i=n,o=0;o<i.length;o++)i[o](e)}return{get state(){return e},action:function(n){function r(e){t(e,!1)}return function(){for(var t=[e],i=0;i<arguments.length;i++)t.push(arguments[i]);var o=n.apply(this,t);if(null!=o)return o instanceof Promise?o.then(r):r(o)}},setState:t,clearState:function(){e=void 0},subscribe:function(e){return n.push(e),function(){!function(e){for(var t=[],r=0;r<n.length;r++)n[r]===e?e=null:t.push(n[r]);n=t}(e)}}}},i=function(e,n,t,i){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:{unsubGrace:!0};if(e[n])return e[n];var u,a,c=0,l=r(),d=function(){if(!t)throw new Error("Collection does not support refresh");return t(e).then((function(e){return l.setState(e,!0)}))},s=function(){return d().catch((function(n){if(e.connected)throw n}))},f=function(){a=void 0,u&&u.then((function(e){e()})),l.clearState(),e.removeEventListener("ready",d),e.removeEventListener("disconnected",v)},v=function(){a&&(clearTimeout(a),f())};return e[n]={get state(){return l.state},refresh:d,subscribe:function(n){1===++c&&function(){if(void 0!==a)return clearTimeout(a),void(a=void 0);i&&(u=i(e,l)),t&&(e.addEventListener("ready",s),s()),e.addEventListener("disconnected",v)}();var r=l.subscribe(n);return void 0!==l.state&&setTimeout((function(){return n(l.state)}),0),function(){r(),--c||(o.unsubGrace?a=setTimeout(f,5e3):f())}}},e[n]},o=function(e,n,t,r,o){return i(r,e,n,t).subscribe(o)}},57835:function(e,n,t){t.d(n,{XM:function(){return r.XM},Xe:function(){return r.Xe},pX:function(){return r.pX}});var r=t(16616)}}]);
+//# sourceMappingURL=9663.9sCTw_yhuBE.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+"use strict";(self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[]).push([[9877],{86089:function(e,t,i){i.d(t,{U:function(){return n}});var n=function(e){return e.stopPropagation()}},71133:function(e,t,i){var n,a,l,r,d=i(99312),o=i(81043),c=i(88962),s=i(33368),u=i(71650),h=i(68308),v=i(82390),f=i(69205),k=i(91808),m=i(34541),p=i(47838),y=(i(97393),i(49412)),b=i(3762),Z=i(5095),g=i(95260),_=i(72218),x=i(2537);i(54371),(0,k.Z)([(0,g.Mo)("ha-select")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,h.Z)(this,i,[].concat(a)),e((0,v.Z)(t)),t}return(0,f.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,g.Cb)({type:Boolean})],key:"icon",value:function(){return!1}},{kind:"field",decorators:[(0,g.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,Z.dy)(n||(n=(0,c.Z)([" "," "," "])),(0,m.Z)((0,p.Z)(i.prototype),"render",this).call(this),this.clearable&&!this.required&&!this.disabled&&this.value?(0,Z.dy)(a||(a=(0,c.Z)(['<ha-icon-button label="clear" @click="','" .path="','"></ha-icon-button>'])),this._clearValue,"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"):Z.Ld)}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?(0,Z.dy)(l||(l=(0,c.Z)(['<span class="mdc-select__icon"><slot name="icon"></slot></span>']))):Z.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,m.Z)((0,p.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,m.Z)((0,p.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value:function(){var e=this;return(0,_.D)((0,o.Z)((0,d.Z)().mark((function t(){return(0,d.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,x.y)();case 2:e.layoutOptions();case 3:case"end":return t.stop()}}),t)}))),500)}},{kind:"field",static:!0,key:"styles",value:function(){return[b.W,(0,Z.iv)(r||(r=(0,c.Z)([":host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}"])))]}}]}}),y.K)},49877:function(e,t,i){i.r(t),i.d(t,{HaThemeSelector:function(){return Z}});var n,a,l,r,d,o,c=i(88962),s=i(33368),u=i(71650),h=i(68308),v=i(82390),f=i(69205),k=i(91808),m=(i(97393),i(5095)),p=i(95260),y=(i(46349),i(70320),i(37313),i(65974),i(44577),i(18394)),b=i(86089),Z=(i(71133),(0,k.Z)([(0,p.Mo)("ha-theme-picker")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,h.Z)(this,i,[].concat(a)),e((0,v.Z)(t)),t}return(0,f.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"includeDefault",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!1}},{kind:"method",key:"render",value:function(){return(0,m.dy)(n||(n=(0,c.Z)([' <ha-select .label="','" .value="','" .required="','" .disabled="','" @selected="','" @closed="','" fixedMenuPosition naturalMenuWidth> '," "," "," </ha-select> "])),this.label||this.hass.localize("ui.components.theme-picker.theme"),this.value,this.required,this.disabled,this._changed,b.U,this.required?m.Ld:(0,m.dy)(a||(a=(0,c.Z)([' <mwc-list-item value="remove"> '," </mwc-list-item> "])),this.hass.localize("ui.components.theme-picker.no_theme")),this.includeDefault?(0,m.dy)(l||(l=(0,c.Z)([' <mwc-list-item .value="','"> Home Assistant </mwc-list-item> '])),"default"):m.Ld,Object.keys(this.hass.themes.themes).sort().map((function(e){return(0,m.dy)(r||(r=(0,c.Z)(['<mwc-list-item .value="','">',"</mwc-list-item>"])),e,e)})))}},{kind:"get",static:!0,key:"styles",value:function(){return(0,m.iv)(d||(d=(0,c.Z)(["ha-select{width:100%}"])))}},{kind:"method",key:"_changed",value:function(e){this.hass&&""!==e.target.value&&(this.value="remove"===e.target.value?void 0:e.target.value,(0,y.B)(this,"value-changed",{value:this.value}))}}]}}),m.oi),(0,k.Z)([(0,p.Mo)("ha-selector-theme")],(function(e,t){var i=function(t){function i(){var t;(0,u.Z)(this,i);for(var n=arguments.length,a=new Array(n),l=0;l<n;l++)a[l]=arguments[l];return t=(0,h.Z)(this,i,[].concat(a)),e((0,v.Z)(t)),t}return(0,f.Z)(i,t),(0,s.Z)(i)}(t);return{F:i,d:[{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,p.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,p.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,p.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:function(){return!1}},{kind:"field",decorators:[(0,p.Cb)({type:Boolean})],key:"required",value:function(){return!0}},{kind:"method",key:"render",value:function(){var e;return(0,m.dy)(o||(o=(0,c.Z)([' <ha-theme-picker .hass="','" .value="','" .label="','" .includeDefault="','" .disabled="','" .required="','"></ha-theme-picker> '])),this.hass,this.value,this.label,null===(e=this.selector.theme)||void 0===e?void 0:e.include_default,this.disabled,this.required)}}]}}),m.oi))}}]);
+//# sourceMappingURL=9877.EFgfYaNDgTw.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see entrypoint.yqQWLcDGcBc.js.LICENSE.txt */
+!function(){var t,e,r,n,o,i,a,s,c={4096:function(t,e,r){"use strict";r.d(e,{CO:function(){return s},Rw:function(){return y},p3:function(){return m},uO:function(){return g},wK:function(){return a}});var n=r(62746),o=(r(46798),r(94570),r(27392),r(97393),r(17692),r(58579)),i=function(t){var e=Math.round(Math.min(Math.max(t,0),255)).toString(16);return 1===e.length?"0".concat(e):e},a=function(t){return t=(0,o.R)(t),[parseInt(t.substring(0,2),16),parseInt(t.substring(2,4),16),parseInt(t.substring(4,6),16)]},s=function(t){return"#".concat(i(t[0])).concat(i(t[1])).concat(i(t[2]))},c=.95047,u=1.08883,l=.137931034,f=.12841855,h=function(t){return(t/=255)<=.04045?t/12.92:Math.pow((t+.055)/1.055,2.4)},d=function(t){return t>.008856452?Math.pow(t,1/3):t/f+l},p=function(t){return 255*(t<=.00304?12.92*t:1.055*Math.pow(t,1/2.4)-.055)},v=function(t){return t>.206896552?t*t*t:f*(t-l)},y=function(t){var e=function(t){var e=(0,n.Z)(t,3),r=e[0],o=e[1],i=e[2];return r=h(r),o=h(o),i=h(i),[d((.4124564*r+.3575761*o+.1804375*i)/c),d((.2126729*r+.7151522*o+.072175*i)/1),d((.0193339*r+.119192*o+.9503041*i)/u)]}(t),r=(0,n.Z)(e,3),o=r[0],i=r[1],a=116*i-16;return[a<0?0:a,500*(o-i),200*(i-r[2])]},m=function(t){var e=(0,n.Z)(t,3),r=e[0],o=e[1],i=e[2],a=(r+16)/116,s=isNaN(o)?a:a+o/500,l=isNaN(i)?a:a-i/200;return a=1*v(a),s=c*v(s),l=u*v(l),[p(3.2404542*s-1.5371385*a-.4985314*l),p(-.969266*s+1.8760108*a+.041556*l),p(.0556434*s-.2040259*a+1.0572252*l)]},g=function(t){var e=m(t);return s(e)}},58579:function(t,e,r){"use strict";r.d(e,{R:function(){return o},o:function(){return i}});var n=r(40039),o=(r(63789),r(24074),r(27392),r(46798),r(94570),function(t){if(6===(t=t.replace("#","")).length)return t;var e,r="",o=(0,n.Z)(t);try{for(o.s();!(e=o.n()).done;){var i=e.value;r+=i+i}}catch(a){o.e(a)}finally{o.f()}return r}),i=function(t,e){var r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:50,n="";t=o(t),e=o(e);for(var i=0;i<=5;i+=2){for(var a=parseInt(t.substr(i,2),16),s=parseInt(e.substr(i,2),16),c=Math.floor(s+r/100*(a-s)).toString(16);c.length<2;)c="0"+c;n+=c}return"#".concat(n)}},18394:function(t,e,r){"use strict";r.d(e,{B:function(){return n}});var n=function(t,e,r,n){n=n||{},r=null==r?{}:r;var o=new Event(e,{bubbles:void 0===n.bubbles||n.bubbles,cancelable:Boolean(n.cancelable),composed:void 0===n.composed||n.composed});return o.detail=r,t.dispatchEvent(o),o}},67684:function(t,e,r){"use strict";r.d(e,{E:function(){return o}});r(22859);var n=r(14703),o=window.name===n.y?window:parent.name===n.y?parent:top},6429:function(t,e,r){"use strict";r.d(e,{J:function(){return n}});r(85472),r(46798),r(9849),r(90126),r(56308);var n=function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(!(t.defaultPrevented||0!==t.button||t.metaKey||t.ctrlKey||t.shiftKey)){var r=t.composedPath().find((function(t){return"A"===t.tagName}));if(r&&!r.target&&!r.hasAttribute("download")&&"external"!==r.getAttribute("rel")){var n=r.href;if(n&&-1===n.indexOf("mailto:")){var o=window.location,i=o.origin||o.protocol+"//"+o.host;if(0===n.indexOf(i)&&"#"!==(n=n.substr(i.length)))return e&&t.preventDefault(),n}}}}},38480:function(t,e,r){"use strict";r.d(e,{c:function(){return a}});r(63789),r(24074),r(97393),r(99312),r(81043),r(71650),r(33368),r(68308),r(34541),r(47838),r(69205),r(46798),r(47084),r(85717);var n,o=r(67684),i=(r(60625),r(18394)),a=function t(e,r){var a,s=(null==r?void 0:r.replace)||!1;n?n.then((function(){return t(e,r)})):(s?o.E.history.replaceState(null!==(a=o.E.history.state)&&void 0!==a&&a.root?{root:!0}:null,"",e):o.E.history.pushState(null,"",e),(0,i.B)(o.E,"location-changed",{replace:s}))}},2537:function(t,e,r){"use strict";r.d(e,{y:function(){return n}});r(46798),r(47084);var n=function(){return new Promise((function(t){var e;e=t,requestAnimationFrame((function(){return setTimeout(e,0)}))}))}},14703:function(t,e,r){"use strict";r.d(e,{y:function(){return n}});var n="ha-main-window"},35137:function(t,e,r){"use strict";r.d(e,{t6:function(){return a},FS:function(){return s},y4:function(){return n},zt:function(){return o},c_:function(){return i}});r(99312),r(81043),r(85717);var n=function(t){return t.language="language",t.system="system",t.comma_decimal="comma_decimal",t.decimal_comma="decimal_comma",t.space_comma="space_comma",t.none="none",t}({}),o=function(t){return t.language="language",t.system="system",t.am_pm="12",t.twenty_four="24",t}({}),i=function(t){return t.local="local",t.server="server",t}({}),a=function(t){return t.language="language",t.system="system",t.DMY="DMY",t.MDY="MDY",t.YMD="YMD",t}({}),s=function(t){return t.language="language",t.monday="monday",t.tuesday="tuesday",t.wednesday="wednesday",t.thursday="thursday",t.friday="friday",t.saturday="saturday",t.sunday="sunday",t}({})},60625:function(t,e,r){"use strict";r.d(e,{gA:function(){return h},lD:function(){return p}});var n=r(40039),o=r(99312),i=r(81043),a=(r(94738),r(98214),r(46798),r(85717),r(67684)),s=(r(51358),r(78399),r(5239),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(98490),function t(e,r){var n,o=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||e===document.body)return null;if((e=null!==(n=e.assignedSlot)&&void 0!==n?n:e).parentElement)e=e.parentElement;else{var i=e.getRootNode();e=i instanceof ShadowRoot?i.host:null}return(o?Object.prototype.hasOwnProperty.call(e,r):e&&r in e)?e:t(e,r,o)}),c=function(t,e){for(var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=new Set;t;)n.add(t),t=s(t,e,r);return n},u=function t(){var e,r=arguments.length>0&&void 0!==arguments[0]?arguments[0]:document;return null!==(e=r.activeElement)&&void 0!==e&&null!==(e=e.shadowRoot)&&void 0!==e&&e.activeElement?t(r.activeElement.shadowRoot):r.activeElement},l=r(2537),f={},h=Symbol.for("HA focus target"),d=function(){var t=(0,i.Z)((0,o.Z)().mark((function t(e,r,n,i,s){var l,d,p,y,m,g=arguments;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(d=!(g.length>5&&void 0!==g[5])||g[5],n in f){t.next=6;break}if(s){t.next=5;break}return t.abrupt("return",!1);case 5:f[n]={element:s().then((function(){var t=document.createElement(n);return e.provideHass(t),t}))};case 6:if(null!==(l=a.E.history.state)&&void 0!==l&&l.replaced?(f[n].closedFocusTargets=f[a.E.history.state.dialog].closedFocusTargets,delete f[a.E.history.state.dialog].closedFocusTargets):f[n].closedFocusTargets=c(u(),h),d){a.E.history.replaceState({dialog:n,open:!1,oldState:null!==(p=a.E.history.state)&&void 0!==p&&p.open&&(null===(y=a.E.history.state)||void 0===y?void 0:y.dialog)!==n?a.E.history.state:null},"");try{a.E.history.pushState({dialog:n,dialogParams:i,open:!0},"")}catch(o){a.E.history.pushState({dialog:n,dialogParams:null,open:!0},"")}}return t.next=10,f[n].element;case 10:return(m=t.sent).addEventListener("dialog-closed",v),r.appendChild(m),m.showDialog(i),t.abrupt("return",!0);case 15:case"end":return t.stop()}}),t)})));return function(e,r,n,o,i){return t.apply(this,arguments)}}(),p=function(t,e){t.addEventListener("show-dialog",(function(r){var n=r.detail,o=n.dialogTag,i=n.dialogImport,a=n.dialogParams,s=n.addHistory;d(t,e,o,a,i,s)}))},v=function(){var t=(0,i.Z)((0,o.Z)().mark((function t(e){var r,i,a,s,c;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(r=f[e.detail.dialog].closedFocusTargets,delete f[e.detail.dialog].closedFocusTargets,r){t.next=4;break}return t.abrupt("return");case 4:return(i=u())instanceof HTMLElement&&i.blur(),t.next=8,(0,l.y)();case 8:a=(0,n.Z)(r),t.prev=9,a.s();case 11:if((s=a.n()).done){t.next=20;break}if(!((c=s.value)instanceof HTMLElement)){t.next=18;break}if(c.focus(),!(i=u())||i===document.body){t.next=18;break}return t.abrupt("return");case 18:t.next=11;break;case 20:t.next=25;break;case 22:t.prev=22,t.t0=t.catch(9),a.e(t.t0);case 25:return t.prev=25,a.f(),t.finish(25);case 28:0;case 29:case"end":return t.stop()}}),t,null,[[9,22,25,28]])})));return function(e){return t.apply(this,arguments)}}()},53285:function(t,e,r){"use strict";r.d(e,{H:function(){return u},n:function(){return c}});var n=r(99312),o=r(81043),i=(r(83609),r(51358),r(46798),r(78399),r(5239),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(98490),r(47084),r(97393),r(46349),["DateTimeFormat","DisplayNames","ListFormat","NumberFormat","RelativeTimeFormat"]),a=new Set,s=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r){var o,i,a,s=arguments;return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(i=s.length>2&&void 0!==s[2]?s[2]:"__addLocaleData","function"!=typeof(null===(o=Intl[e])||void 0===o?void 0:o[i])){t.next=12;break}return t.next=4,fetch("".concat("/hacsfiles/frontend/static/","locale-data/intl-").concat(e.toLowerCase(),"/").concat(r,".json"));case 4:if(!(a=t.sent).ok){t.next=12;break}return t.t0=Intl[e],t.t1=i,t.next=10,a.json();case 10:t.t2=t.sent,t.t0[t.t1].call(t.t0,t.t2);case 12:case"end":return t.stop()}}),t)})));return function(e,r){return t.apply(this,arguments)}}(),c=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!a.has(e)){t.next=2;break}return t.abrupt("return");case 2:return a.add(e),t.next=5,Promise.all(i.map((function(t){return s(t,e)})));case 5:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}(),u=function(){return s("DateTimeFormat","add-all-tz","__addTZData")}},29950:function(t,e,r){"use strict";r.d(e,{$c:function(){return d},Qx:function(){return f},k1:function(){return l},yu:function(){return h}});var n,o,i,a,s,c=r(88962),u=r(5095),l=(0,u.iv)(n||(n=(0,c.Z)(["button.link{background:0 0;color:inherit;border:none;padding:0;font:inherit;text-align:left;text-decoration:underline;cursor:pointer;outline:0}"]))),f=(0,u.iv)(o||(o=(0,c.Z)([":host{font-family:var(--paper-font-body1_-_font-family);-webkit-font-smoothing:var(--paper-font-body1_-_-webkit-font-smoothing);font-size:var(--paper-font-body1_-_font-size);font-weight:var(--paper-font-body1_-_font-weight);line-height:var(--paper-font-body1_-_line-height)}app-header div[sticky]{height:48px}app-toolbar [main-title]{margin-left:20px}h1{font-family:var(--paper-font-headline_-_font-family);-webkit-font-smoothing:var(--paper-font-headline_-_-webkit-font-smoothing);white-space:var(--paper-font-headline_-_white-space);overflow:var(--paper-font-headline_-_overflow);text-overflow:var(--paper-font-headline_-_text-overflow);font-size:var(--paper-font-headline_-_font-size);font-weight:var(--paper-font-headline_-_font-weight);line-height:var(--paper-font-headline_-_line-height)}h2{font-family:var(--paper-font-title_-_font-family);-webkit-font-smoothing:var(--paper-font-title_-_-webkit-font-smoothing);white-space:var(--paper-font-title_-_white-space);overflow:var(--paper-font-title_-_overflow);text-overflow:var(--paper-font-title_-_text-overflow);font-size:var(--paper-font-title_-_font-size);font-weight:var(--paper-font-title_-_font-weight);line-height:var(--paper-font-title_-_line-height)}h3{font-family:var(--paper-font-subhead_-_font-family);-webkit-font-smoothing:var(--paper-font-subhead_-_-webkit-font-smoothing);white-space:var(--paper-font-subhead_-_white-space);overflow:var(--paper-font-subhead_-_overflow);text-overflow:var(--paper-font-subhead_-_text-overflow);font-size:var(--paper-font-subhead_-_font-size);font-weight:var(--paper-font-subhead_-_font-weight);line-height:var(--paper-font-subhead_-_line-height)}a{color:var(--primary-color)}.secondary{color:var(--secondary-text-color)}.error{color:var(--error-color)}.warning{color:var(--error-color)}mwc-button.warning{--mdc-theme-primary:var(--error-color)}"," .card-actions a{text-decoration:none}.card-actions .warning{--mdc-theme-primary:var(--error-color)}.layout.horizontal,.layout.vertical{display:flex}.layout.inline{display:inline-flex}.layout.horizontal{flex-direction:row}.layout.vertical{flex-direction:column}.layout.wrap{flex-wrap:wrap}.layout.no-wrap{flex-wrap:nowrap}.layout.center,.layout.center-center{align-items:center}.layout.bottom{align-items:flex-end}.layout.center-center,.layout.center-justified{justify-content:center}.flex{flex:1;flex-basis:0.000000001px}.flex-auto{flex:1 1 auto}.flex-none{flex:none}.layout.justified{justify-content:space-between}"])),l),h=(0,u.iv)(i||(i=(0,c.Z)(["ha-dialog{--mdc-dialog-min-width:400px;--mdc-dialog-max-width:600px;--mdc-dialog-max-width:min(600px, 95vw);--justify-action-buttons:space-between}ha-dialog .form{color:var(--primary-text-color)}a{color:var(--primary-color)}@media all and (max-width:450px),all and (max-height:500px){ha-dialog{--mdc-dialog-min-width:calc(\n        100vw - env(safe-area-inset-right) - env(safe-area-inset-left)\n      );--mdc-dialog-max-width:calc(\n        100vw - env(safe-area-inset-right) - env(safe-area-inset-left)\n      );--mdc-dialog-min-height:100%;--mdc-dialog-max-height:100%;--vertical-align-dialog:flex-end;--ha-dialog-border-radius:0}}ha-button.warning,mwc-button.warning{--mdc-theme-primary:var(--error-color)}.error{color:var(--error-color)}"]))),d=(0,u.iv)(a||(a=(0,c.Z)([".ha-scrollbar::-webkit-scrollbar{width:.4rem;height:.4rem}.ha-scrollbar::-webkit-scrollbar-thumb{-webkit-border-radius:4px;border-radius:4px;background:var(--scrollbar-thumb-color)}.ha-scrollbar{overflow-y:auto;scrollbar-color:var(--scrollbar-thumb-color) transparent;scrollbar-width:thin}"])));(0,u.iv)(s||(s=(0,c.Z)(["body{background-color:var(--primary-background-color);color:var(--primary-text-color);height:calc(100vh - 32px);width:100vw}"])))},80411:function(t,e,r){"use strict";r.d(e,{o:function(){return n}});var n=JSON.parse('{"translations":{"bg_BG":{"hash":"1e82b34ab9f0c55312a66ff37f4f18c0"},"cs":{"nativeName":"Čeština","hash":"31e4be3dd5593aa2b434e709e1924229"},"da":{"nativeName":"Dansk","hash":"16776c3d28b67bf99a0c73fdbc0cfae4"},"de":{"nativeName":"Deutsch","hash":"dac679b6d76656504db5a91ad9e996d8"},"el":{"nativeName":"Ελληνικά","hash":"636cdf49331449eea2267d12d169616a"},"en":{"nativeName":"English","hash":"d6bde56fa1fdd9560a9bac962dc3543c"},"es":{"nativeName":"Español","hash":"bcd255337b52b53ea7afcc2a78fae584"},"et":{"nativeName":"Eesti","hash":"ea2bb7b310ab97c3cec49056310af86c"},"fi":{"nativeName":"Suomi","hash":"d1d844622077edfc387e659e32a9e83d"},"fr":{"nativeName":"Français","hash":"dcb5044a8e6eebfe652f69faad4e44b0"},"he":{"nativeName":"עברית","isRTL":true,"hash":"0962bb286801f841fac425f5c7bad29c"},"hu":{"nativeName":"Magyar","hash":"a40c39ce75fa085bf90129f555351c22"},"id":{"nativeName":"Indonesia","hash":"759d98753602215aa6897061b5875a97"},"it":{"nativeName":"Italiano","hash":"a1659f16073143e8964ba0fc6fbc62bc"},"nb":{"nativeName":"Norsk Bokmål","hash":"803518a17950a96001d7e15c6a04fa17"},"nl":{"nativeName":"Nederlands","hash":"f2c983349dd1ca417e28b352c7aa3bb2"},"nn":{"nativeName":"Norsk Nynorsk","hash":"90030a3996f62d6bb24ed106f01fa99e"},"pl":{"nativeName":"Polski","hash":"26f9070d4cb5611ac866e78bbc1dbd9c"},"pt":{"nativeName":"Português","hash":"fe330cc04846a0b58c036d0b957ae2a6"},"pt_BR":{"hash":"c3b7972f9e2dc120fd3ce1eb4cd2b061"},"ro":{"nativeName":"Română","hash":"7af39cc2c487146a76ced383bf60f0e8"},"ru":{"nativeName":"Русский","hash":"7c2555c3e35f5b6595873486f1a0d3ce"},"sk":{"nativeName":"Slovenčina","hash":"b048ba5e09091bd590be3b6800cea189"},"sl":{"nativeName":"Slovenščina","hash":"03e1f0b3843d8e0e39acb0b5272d90e1"},"sv":{"nativeName":"Svenska","hash":"ade387c9b691dc186b0513eaa3bfff63"},"translationMetadata":{"hash":"95f1b3a12ca6cb0a0c0d83fe10bebb95"},"vi":{"nativeName":"Tiếng Việt","hash":"ceabf4069169cd826b9370133afbb433"},"zh_Hans":{"hash":"626d19b777e6c4133e2df9db2716c07e"}}}')},11674:function(t,e,r){"use strict";r.d(e,{i0:function(){return v},sS:function(){return p}});var n=r(99312),o=r(40039),i=r(81043),a=(r(83609),r(85472),r(46798),r(9849),r(90126),r(65974),r(40271),r(60163),r(10185),r(47084),r(97393),r(51467),r(35137),r(80411)),s="".concat("/hacsfiles/frontend/static/","translations"),c=window.localStorage||{},u={};function l(t){return f.apply(this,arguments)}function f(){return(f=(0,i.Z)((0,n.Z)().mark((function t(e){var r;return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,fetch("".concat(s,"/").concat(e),{credentials:"same-origin"});case 2:if((r=t.sent).ok){t.next=5;break}throw new Error("Fail to fetch translation ".concat(e,": HTTP response status is ").concat(r.status));case 5:return t.abrupt("return",r.json());case 6:case"end":return t.stop()}}),t)})))).apply(this,arguments)}var h={"zh-cn":"zh-Hans","zh-sg":"zh-Hans","zh-my":"zh-Hans","zh-tw":"zh-Hant","zh-hk":"zh-Hant","zh-mo":"zh-Hant",zh:"zh-Hant"};function d(t){if(t in a.o.translations)return t;var e=t.toLowerCase();if(e in h)return h[e];var r=Object.keys(a.o.translations).find((function(t){return t.toLowerCase()===e}));return r||(t.includes("-")?d(t.split("-")[0]):void 0)}function p(){var t=null;if(c.selectedLanguage)try{var e=JSON.parse(c.selectedLanguage);if(e&&(t=d(e)))return t}catch(i){}if(navigator.languages){var r,n=(0,o.Z)(navigator.languages);try{for(n.s();!(r=n.n()).done;){if(t=d(r.value))return t}}catch(i){n.e(i)}finally{n.f()}}return(t=d(navigator.language))||"en"}function v(t,e){return y.apply(this,arguments)}function y(){return(y=(0,i.Z)((0,n.Z)().mark((function t(e,r){var o,i;return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(null!=(o=a.o.translations[r])&&o.hash){t.next=5;break}if("en"===r){t.next=4;break}return t.abrupt("return",v(e,"en"));case 4:throw new Error("Language en is not found in metadata");case 5:return i="".concat(e?e+"/":"").concat(r,"-").concat(o.hash,".json"),u[i]||(u[i]=l(i).then((function(t){return{language:r,data:t}})).catch((function(t){return delete u[i],"en"!==r?v(e,"en"):Promise.reject(t)}))),t.abrupt("return",u[i]);case 8:case"end":return t.stop()}}),t)})))).apply(this,arguments)}},56646:function(){"use strict";window.JSCompiler_renameProperty=function(t,e){return t}},42687:function(t,e,r){"use strict";r.d(e,{Kk:function(){return s},Rq:function(){return c},iY:function(){return u}});r(63789),r(99397),r(51358),r(46798),r(5239),r(98490),r(31528),r(7695),r(44758),r(80354),r(68630),r(80641),r(24074),r(26349),r(56646);var n,o,i=/(url\()([^)]*)(\))/g,a=/(^\/[^\/])|(^#)|(^[\w-\d]*:)/;function s(t,e){if(t&&a.test(t))return t;if("//"===t)return t;if(void 0===n){n=!1;try{var r=new URL("b","http://a");r.pathname="c%20d",n="http://a/c%20d"===r.href}catch(i){}}if(e||(e=document.baseURI||window.location.href),n)try{return new URL(t,e).href}catch(i){return t}return o||((o=document.implementation.createHTMLDocument("temp")).base=o.createElement("base"),o.head.appendChild(o.base),o.anchor=o.createElement("a"),o.body.appendChild(o.anchor)),o.base.href=e,o.anchor.href=t,o.anchor.href||t}function c(t,e){return t.replace(i,(function(t,r,n,o){return r+"'"+s(n.replace(/["']/g,""),e)+"'"+o}))}function u(t){return t.substring(0,t.lastIndexOf("/")+1)}},74460:function(t,e,r){"use strict";r.d(e,{FV:function(){return i},HY:function(){return d},Hr:function(){return h},XN:function(){return c},ZN:function(){return u},a2:function(){return f},ew:function(){return m},gx:function(){return y},ls:function(){return p},md:function(){return g},nL:function(){return l},sM:function(){return a},v1:function(){return s},xj:function(){return v}});r(56646);var n=r(42687),o=!window.ShadyDOM||!window.ShadyDOM.inUse,i=(Boolean(!window.ShadyCSS||window.ShadyCSS.nativeCss),window.customElements.polyfillWrapFlushCallback,o&&"adoptedStyleSheets"in Document.prototype&&"replaceSync"in CSSStyleSheet.prototype&&function(){try{var t=new CSSStyleSheet;t.replaceSync("");var e=document.createElement("div");return e.attachShadow({mode:"open"}),e.shadowRoot.adoptedStyleSheets=[t],e.shadowRoot.adoptedStyleSheets[0]===t}catch(r){return!1}}()),a=window.Polymer&&window.Polymer.rootPath||(0,n.iY)(document.baseURI||window.location.href),s=window.Polymer&&window.Polymer.sanitizeDOMValue||void 0,c=(window.Polymer&&window.Polymer.setPassiveTouchGestures,window.Polymer&&window.Polymer.strictTemplatePolicy||!1),u=window.Polymer&&window.Polymer.allowTemplateFromDomModule||!1,l=window.Polymer&&window.Polymer.legacyOptimizations||!1,f=window.Polymer&&window.Polymer.legacyWarnings||!1,h=window.Polymer&&window.Polymer.syncInitialRender||!1,d=window.Polymer&&window.Polymer.legacyUndefined||!1,p=window.Polymer&&window.Polymer.orderedComputed||!1,v=function(t){t},y=window.Polymer&&window.Polymer.removeNestedTemplates||!1,m=window.Polymer&&window.Polymer.fastDomIf||!1,g=(window.Polymer&&window.Polymer.suppressTemplateNotifications,window.Polymer&&window.Polymer.legacyNoObservedAttributes,window.Polymer&&window.Polymer.useAdoptedStyleSheetsWithBuiltCSS||!1)},14516:function(t,e,r){"use strict";r.d(e,{Z:function(){return i}});r(32550),r(76843);var n=Number.isNaN||function(t){return"number"==typeof t&&t!=t};function o(t,e){if(t.length!==e.length)return!1;for(var r=0;r<t.length;r++)if(o=t[r],i=e[r],!(o===i||n(o)&&n(i)))return!1;var o,i;return!0}function i(t,e){void 0===e&&(e=o);var r=null;function n(){for(var n=[],o=0;o<arguments.length;o++)n[o]=arguments[o];if(r&&r.lastThis===this&&e(n,r.lastArgs))return r.lastResult;var i=t.apply(this,n);return r={lastResult:i,lastArgs:n,lastThis:this},i}return n.clear=function(){r=null},n}},83609:function(t,e,r){r(46798),r(47084),r(91584),r(65974),r(10185),r(46349),r(63789),r(24074),r(36513),r(83609),self.fetch||(self.fetch=function(t,e){return e=e||{},new Promise((function(r,n){var o=new XMLHttpRequest,i=[],a={},s=function t(){return{ok:2==(o.status/100|0),statusText:o.statusText,status:o.status,url:o.responseURL,text:function(){return Promise.resolve(o.responseText)},json:function(){return Promise.resolve(o.responseText).then(JSON.parse)},blob:function(){return Promise.resolve(new Blob([o.response]))},clone:t,headers:{keys:function(){return i},entries:function(){return i.map((function(t){return[t,o.getResponseHeader(t)]}))},get:function(t){return o.getResponseHeader(t)},has:function(t){return null!=o.getResponseHeader(t)}}}};for(var c in o.open(e.method||"get",t,!0),o.onload=function(){o.getAllResponseHeaders().toLowerCase().replace(/^(.+?):/gm,(function(t,e){a[e]||i.push(a[e]=e)})),r(s())},o.onerror=n,o.withCredentials="include"==e.credentials,e.headers)o.setRequestHeader(c,e.headers[c]);o.send(e.body||null)}))})},84643:function(t,e,r){"use strict";r.d(e,{p:function(){return n}});var n=function(t){return t.CONFIG="hacs_dispatch_config",t.ERROR="hacs_dispatch_error",t.RELOAD="hacs_dispatch_reload",t.REPOSITORY="hacs_dispatch_repository",t.STAGE="hacs_dispatch_stage",t.STARTUP="hacs_dispatch_startup",t.STATUS="hacs_dispatch_status",t}({})},46797:function(t,e,r){"use strict";r.d(e,{CE:function(){return d},EK:function(){return u},ER:function(){return a},NA:function(){return c},VP:function(){return h},W:function(){return i},jN:function(){return f},jW:function(){return s},yx:function(){return l}});var n=r(99312),o=r(81043),i=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/info"}));case 1:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}(),a=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repositories/list"}));case 1:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}(),s=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repository/remove",repository:r}));case 1:case"end":return t.stop()}}),t)})));return function(e,r){return t.apply(this,arguments)}}(),c=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r,o){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repositories/add",repository:r,category:o}));case 1:case"end":return t.stop()}}),t)})));return function(e,r,n){return t.apply(this,arguments)}}(),u=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r,o){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repository/beta",repository:r,show_beta:o}));case 1:case"end":return t.stop()}}),t)})));return function(e,r,n){return t.apply(this,arguments)}}(),l=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repository/refresh",repository:r}));case 1:case"end":return t.stop()}}),t)})));return function(e,r){return t.apply(this,arguments)}}(),f=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repositories/remove",repository:r}));case 1:case"end":return t.stop()}}),t)})));return function(e,r){return t.apply(this,arguments)}}(),h=function(){var t=(0,o.Z)((0,n.Z)().mark((function t(e,r){return(0,n.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e.connection.sendMessagePromise({type:"hacs/repositories/clear_new",categories:r.info.categories}));case 1:case"end":return t.stop()}}),t)})));return function(e,r){return t.apply(this,arguments)}}(),d=function(t,e,r){return t.connection.subscribeMessage(e,{type:"hacs/subscribe",signal:r})}},61422:function(t,e,r){"use strict";r.d(e,{w:function(){return v}});var n,o,i,a,s,c=r(88962),u=r(5095),l=(0,u.iv)(n||(n=(0,c.Z)(["a{text-decoration:var(--hcv-text-decoration-link);color:var(--hcv-text-color-link)}"]))),f=(0,u.iv)(o||(o=(0,c.Z)(["ha-svg-icon{color:var(--hcv-color-icon)}"]))),h=(0,u.iv)(i||(i=(0,c.Z)(["mwc-button[raised]{border-radius:4px}mwc-button[raised]>ha-circular-progress{--mdc-theme-primary:var(--hcv-text-color-primary)}"]))),d=((0,u.iv)(a||(a=(0,c.Z)(["::-webkit-scrollbar{width:.4rem;height:.4rem}::-webkit-scrollbar-track{-webkit-border-radius:4px;border-radius:4px;background:var(--scrollbar-thumb-color)}::-webkit-scrollbar-thumb{background-color:var(--accent-color);border-radius:.3em}.scroll{overflow-y:auto;scrollbar-color:var(--scrollbar-thumb-color) transparent;scrollbar-width:thin}"]))),r(29950)),p=(0,u.iv)(s||(s=(0,c.Z)([".warning{color:var(--hcv-color-warning)}.pending_update{color:var(--hcv-color-update)}.error,.pending_restart,.uninstall{color:var(--hcv-color-error);--mdc-theme-primary:var(--hcv-color-error)}.header{opacity:var(--dark-primary-opacity);padding:8px 0 4px 16px}code,pre{background-color:var(--markdown-code-background-color,none);border-radius:3px}"]))),v=[d.Qx,f,p,l,h]},23792:function(t,e,r){"use strict";r.d(e,{J:function(){return i}});var n=r(71650),o=r(33368),i=function(){function t(e){(0,n.Z)(this,t),this.prefix=void 0,this.prefix=e?"[HACS.".concat(e,"]"):"[HACS]"}return(0,o.Z)(t,[{key:"info",value:function(t){this.log(t)}},{key:"log",value:function(t){console.log(this.prefix,t)}},{key:"debug",value:function(t){console.debug(this.prefix,t)}},{key:"warn",value:function(t){console.warn(this.prefix,t)}},{key:"error",value:function(t){console.error(this.prefix,t)}}]),t}()},9160:function(t,e,r){"use strict";var n=r(30553),o=r(71414),i=TypeError;t.exports=function(t){if(n(t))return t;throw new i(o(t)+" is not a function")}},50683:function(t,e,r){"use strict";var n=r(78142),o=r(71414),i=TypeError;t.exports=function(t){if(n(t))return t;throw new i(o(t)+" is not a constructor")}},95859:function(t,e,r){"use strict";var n=r(73758),o=String,i=TypeError;t.exports=function(t){if(n(t))return t;throw new i("Can't set "+o(t)+" as a prototype")}},75147:function(t,e,r){"use strict";var n=r(3569).has;t.exports=function(t){return n(t),t}},90476:function(t,e,r){"use strict";var n=r(10282),o=r(9885),i=r(54991).f,a=n("unscopables"),s=Array.prototype;void 0===s[a]&&i(s,a,{configurable:!0,value:o(null)}),t.exports=function(t){s[a][t]=!0}},18513:function(t,e,r){"use strict";var n=r(47512).charAt;t.exports=function(t,e,r){return e+(r?n(t,e).length:1)}},85539:function(t,e,r){"use strict";var n=r(95882),o=TypeError;t.exports=function(t,e){if(n(e,t))return t;throw new o("Incorrect invocation")}},22933:function(t,e,r){"use strict";var n=r(38475),o=String,i=TypeError;t.exports=function(t){if(n(t))return t;throw new i(o(t)+" is not an object")}},57939:function(t,e,r){"use strict";var n=r(18431);t.exports=n((function(){if("function"==typeof ArrayBuffer){var t=new ArrayBuffer(8);Object.isExtensible(t)&&Object.defineProperty(t,"a",{value:8})}}))},65332:function(t,e,r){"use strict";var n=r(19480),o=r(73834),i=r(10228);t.exports=function(t){for(var e=n(this),r=i(e),a=arguments.length,s=o(a>1?arguments[1]:void 0,r),c=a>2?arguments[2]:void 0,u=void 0===c?r:o(c,r);u>s;)e[s++]=t;return e}},30519:function(t,e,r){"use strict";var n=r(78856).forEach,o=r(54053)("forEach");t.exports=o?[].forEach:function(t){return n(this,t,arguments.length>1?arguments[1]:void 0)}},32413:function(t,e,r){"use strict";var n=r(76902),o=r(43173),i=r(19480),a=r(74856),s=r(21678),c=r(78142),u=r(10228),l=r(53396),f=r(46767),h=r(5218),d=Array;t.exports=function(t){var e=i(t),r=c(this),p=arguments.length,v=p>1?arguments[1]:void 0,y=void 0!==v;y&&(v=n(v,p>2?arguments[2]:void 0));var m,g,b,w,_,E,x=h(e),S=0;if(!x||this===d&&s(x))for(m=u(e),g=r?new this(m):d(m);m>S;S++)E=y?v(e[S],S):e[S],l(g,S,E);else for(_=(w=f(e,x)).next,g=r?new this:[];!(b=o(_,w)).done;S++)E=y?a(w,v,[b.value,S],!0):b.value,l(g,S,E);return g.length=S,g}},92460:function(t,e,r){"use strict";var n=r(17460),o=r(73834),i=r(10228),a=function(t){return function(e,r,a){var s,c=n(e),u=i(c),l=o(a,u);if(t&&r!=r){for(;u>l;)if((s=c[l++])!=s)return!0}else for(;u>l;l++)if((t||l in c)&&c[l]===r)return t||l||0;return!t&&-1}};t.exports={includes:a(!0),indexOf:a(!1)}},78856:function(t,e,r){"use strict";var n=r(76902),o=r(55418),i=r(70814),a=r(19480),s=r(10228),c=r(26183),u=o([].push),l=function(t){var e=1===t,r=2===t,o=3===t,l=4===t,f=6===t,h=7===t,d=5===t||f;return function(p,v,y,m){for(var g,b,w=a(p),_=i(w),E=s(_),x=n(v,y),S=0,k=m||c,A=e?k(p,E):r||h?k(p,0):void 0;E>S;S++)if((d||S in _)&&(b=x(g=_[S],S,w),t))if(e)A[S]=b;else if(b)switch(t){case 3:return!0;case 5:return g;case 6:return S;case 2:u(A,g)}else switch(t){case 4:return!1;case 7:u(A,g)}return f?-1:o||l?l:A}};t.exports={forEach:l(0),map:l(1),filter:l(2),some:l(3),every:l(4),find:l(5),findIndex:l(6),filterReject:l(7)}},6057:function(t,e,r){"use strict";var n=r(35449),o=r(17460),i=r(97673),a=r(10228),s=r(54053),c=Math.min,u=[].lastIndexOf,l=!!u&&1/[1].lastIndexOf(1,-0)<0,f=s("lastIndexOf"),h=l||!f;t.exports=h?function(t){if(l)return n(u,this,arguments)||0;var e=o(this),r=a(e),s=r-1;for(arguments.length>1&&(s=c(s,i(arguments[1]))),s<0&&(s=r+s);s>=0;s--)if(s in e&&e[s]===t)return s||0;return-1}:u},817:function(t,e,r){"use strict";var n=r(18431),o=r(10282),i=r(91625),a=o("species");t.exports=function(t){return i>=51||!n((function(){var e=[];return(e.constructor={})[a]=function(){return{foo:1}},1!==e[t](Boolean).foo}))}},54053:function(t,e,r){"use strict";var n=r(18431);t.exports=function(t,e){var r=[][t];return!!r&&n((function(){r.call(null,e||function(){return 1},1)}))}},42439:function(t,e,r){"use strict";var n=r(9160),o=r(19480),i=r(70814),a=r(10228),s=TypeError,c=function(t){return function(e,r,c,u){var l=o(e),f=i(l),h=a(l);n(r);var d=t?h-1:0,p=t?-1:1;if(c<2)for(;;){if(d in f){u=f[d],d+=p;break}if(d+=p,t?d<0:h<=d)throw new s("Reduce of empty array with no initial value")}for(;t?d>=0:h>d;d+=p)d in f&&(u=r(u,f[d],d,l));return u}};t.exports={left:c(!1),right:c(!0)}},1991:function(t,e,r){"use strict";var n=r(58849),o=r(35968),i=TypeError,a=Object.getOwnPropertyDescriptor,s=n&&!function(){if(void 0!==this)return!0;try{Object.defineProperty([],"length",{writable:!1}).length=1}catch(t){return t instanceof TypeError}}();t.exports=s?function(t,e){if(o(t)&&!a(t,"length").writable)throw new i("Cannot set read only .length");return t.length=e}:function(t,e){return t.length=e}},88755:function(t,e,r){"use strict";var n=r(55418);t.exports=n([].slice)},8273:function(t,e,r){"use strict";var n=r(88755),o=Math.floor,i=function(t,e){var r=t.length;if(r<8)for(var a,s,c=1;c<r;){for(s=c,a=t[c];s&&e(t[s-1],a)>0;)t[s]=t[--s];s!==c++&&(t[s]=a)}else for(var u=o(r/2),l=i(n(t,0,u),e),f=i(n(t,u),e),h=l.length,d=f.length,p=0,v=0;p<h||v<d;)t[p+v]=p<h&&v<d?e(l[p],f[v])<=0?l[p++]:f[v++]:p<h?l[p++]:f[v++];return t};t.exports=i},60103:function(t,e,r){"use strict";var n=r(35968),o=r(78142),i=r(38475),a=r(10282)("species"),s=Array;t.exports=function(t){var e;return n(t)&&(e=t.constructor,(o(e)&&(e===s||n(e.prototype))||i(e)&&null===(e=e[a]))&&(e=void 0)),void 0===e?s:e}},26183:function(t,e,r){"use strict";var n=r(60103);t.exports=function(t,e){return new(n(t))(0===e?0:e)}},74856:function(t,e,r){"use strict";var n=r(22933),o=r(56208);t.exports=function(t,e,r,i){try{return i?e(n(r)[0],r[1]):e(r)}catch(a){o(t,"throw",a)}}},54294:function(t,e,r){"use strict";var n=r(10282)("iterator"),o=!1;try{var i=0,a={next:function(){return{done:!!i++}},return:function(){o=!0}};a[n]=function(){return this},Array.from(a,(function(){throw 2}))}catch(s){}t.exports=function(t,e){try{if(!e&&!o)return!1}catch(s){return!1}var r=!1;try{var i={};i[n]=function(){return{next:function(){return{done:r=!0}}}},t(i)}catch(s){}return r}},42458:function(t,e,r){"use strict";var n=r(55418),o=n({}.toString),i=n("".slice);t.exports=function(t){return i(o(t),8,-1)}},21973:function(t,e,r){"use strict";var n=r(9574),o=r(30553),i=r(42458),a=r(10282)("toStringTag"),s=Object,c="Arguments"===i(function(){return arguments}());t.exports=n?i:function(t){var e,r,n;return void 0===t?"Undefined":null===t?"Null":"string"==typeof(r=function(t,e){try{return t[e]}catch(r){}}(e=s(t),a))?r:c?i(e):"Object"===(n=i(e))&&o(e.callee)?"Arguments":n}},52961:function(t,e,r){"use strict";var n=r(9885),o=r(40030),i=r(40855),a=r(76902),s=r(85539),c=r(59317),u=r(72208),l=r(4638),f=r(85501),h=r(36929),d=r(58849),p=r(70276).fastKey,v=r(12648),y=v.set,m=v.getterFor;t.exports={getConstructor:function(t,e,r,l){var f=t((function(t,o){s(t,h),y(t,{type:e,index:n(null),first:void 0,last:void 0,size:0}),d||(t.size=0),c(o)||u(o,t[l],{that:t,AS_ENTRIES:r})})),h=f.prototype,v=m(e),g=function(t,e,r){var n,o,i=v(t),a=b(t,e);return a?a.value=r:(i.last=a={index:o=p(e,!0),key:e,value:r,previous:n=i.last,next:void 0,removed:!1},i.first||(i.first=a),n&&(n.next=a),d?i.size++:t.size++,"F"!==o&&(i.index[o]=a)),t},b=function(t,e){var r,n=v(t),o=p(e);if("F"!==o)return n.index[o];for(r=n.first;r;r=r.next)if(r.key===e)return r};return i(h,{clear:function(){for(var t=v(this),e=t.first;e;)e.removed=!0,e.previous&&(e.previous=e.previous.next=void 0),e=e.next;t.first=t.last=void 0,t.index=n(null),d?t.size=0:this.size=0},delete:function(t){var e=this,r=v(e),n=b(e,t);if(n){var o=n.next,i=n.previous;delete r.index[n.index],n.removed=!0,i&&(i.next=o),o&&(o.previous=i),r.first===n&&(r.first=o),r.last===n&&(r.last=i),d?r.size--:e.size--}return!!n},forEach:function(t){for(var e,r=v(this),n=a(t,arguments.length>1?arguments[1]:void 0);e=e?e.next:r.first;)for(n(e.value,e.key,this);e&&e.removed;)e=e.previous},has:function(t){return!!b(this,t)}}),i(h,r?{get:function(t){var e=b(this,t);return e&&e.value},set:function(t,e){return g(this,0===t?0:t,e)}}:{add:function(t){return g(this,t=0===t?0:t,t)}}),d&&o(h,"size",{configurable:!0,get:function(){return v(this).size}}),f},setStrong:function(t,e,r){var n=e+" Iterator",o=m(e),i=m(n);l(t,e,(function(t,e){y(this,{type:n,target:t,state:o(t),kind:e,last:void 0})}),(function(){for(var t=i(this),e=t.kind,r=t.last;r&&r.removed;)r=r.previous;return t.target&&(t.last=r=r?r.next:t.state.first)?f("keys"===e?r.key:"values"===e?r.value:[r.key,r.value],!1):(t.target=void 0,f(void 0,!0))}),r?"entries":"values",!r,!0),h(e)}}},6946:function(t,e,r){"use strict";var n=r(55418),o=r(40855),i=r(70276).getWeakData,a=r(85539),s=r(22933),c=r(59317),u=r(38475),l=r(72208),f=r(78856),h=r(55229),d=r(12648),p=d.set,v=d.getterFor,y=f.find,m=f.findIndex,g=n([].splice),b=0,w=function(t){return t.frozen||(t.frozen=new _)},_=function(){this.entries=[]},E=function(t,e){return y(t.entries,(function(t){return t[0]===e}))};_.prototype={get:function(t){var e=E(this,t);if(e)return e[1]},has:function(t){return!!E(this,t)},set:function(t,e){var r=E(this,t);r?r[1]=e:this.entries.push([t,e])},delete:function(t){var e=m(this.entries,(function(e){return e[0]===t}));return~e&&g(this.entries,e,1),!!~e}},t.exports={getConstructor:function(t,e,r,n){var f=t((function(t,o){a(t,d),p(t,{type:e,id:b++,frozen:void 0}),c(o)||l(o,t[n],{that:t,AS_ENTRIES:r})})),d=f.prototype,y=v(e),m=function(t,e,r){var n=y(t),o=i(s(e),!0);return!0===o?w(n).set(e,r):o[n.id]=r,t};return o(d,{delete:function(t){var e=y(this);if(!u(t))return!1;var r=i(t);return!0===r?w(e).delete(t):r&&h(r,e.id)&&delete r[e.id]},has:function(t){var e=y(this);if(!u(t))return!1;var r=i(t);return!0===r?w(e).has(t):r&&h(r,e.id)}}),o(d,r?{get:function(t){var e=y(this);if(u(t)){var r=i(t);return!0===r?w(e).get(t):r?r[e.id]:void 0}},set:function(t,e){return m(this,t,e)}}:{add:function(t){return m(this,t,!0)}}),f}}},88820:function(t,e,r){"use strict";var n=r(68077),o=r(5813),i=r(55418),a=r(27992),s=r(73936),c=r(70276),u=r(72208),l=r(85539),f=r(30553),h=r(59317),d=r(38475),p=r(18431),v=r(54294),y=r(48357),m=r(81760);t.exports=function(t,e,r){var g=-1!==t.indexOf("Map"),b=-1!==t.indexOf("Weak"),w=g?"set":"add",_=o[t],E=_&&_.prototype,x=_,S={},k=function(t){var e=i(E[t]);s(E,t,"add"===t?function(t){return e(this,0===t?0:t),this}:"delete"===t?function(t){return!(b&&!d(t))&&e(this,0===t?0:t)}:"get"===t?function(t){return b&&!d(t)?void 0:e(this,0===t?0:t)}:"has"===t?function(t){return!(b&&!d(t))&&e(this,0===t?0:t)}:function(t,r){return e(this,0===t?0:t,r),this})};if(a(t,!f(_)||!(b||E.forEach&&!p((function(){(new _).entries().next()})))))x=r.getConstructor(e,t,g,w),c.enable();else if(a(t,!0)){var A=new x,P=A[w](b?{}:-0,1)!==A,O=p((function(){A.has(1)})),T=v((function(t){new _(t)})),R=!b&&p((function(){for(var t=new _,e=5;e--;)t[w](e,e);return!t.has(-0)}));T||((x=e((function(t,e){l(t,E);var r=m(new _,t,x);return h(e)||u(e,r[w],{that:r,AS_ENTRIES:g}),r}))).prototype=E,E.constructor=x),(O||R)&&(k("delete"),k("has"),g&&k("get")),(R||P)&&k(w),b&&E.clear&&delete E.clear}return S[t]=x,n({global:!0,constructor:!0,forced:x!==_},S),y(x,t),b||r.setStrong(x,t,g),x}},93213:function(t,e,r){"use strict";var n=r(55229),o=r(20202),i=r(25245),a=r(54991);t.exports=function(t,e,r){for(var s=o(e),c=a.f,u=i.f,l=0;l<s.length;l++){var f=s[l];n(t,f)||r&&n(r,f)||c(t,f,u(e,f))}}},76870:function(t,e,r){"use strict";var n=r(10282)("match");t.exports=function(t){var e=/./;try{"/./"[t](e)}catch(r){try{return e[n]=!1,"/./"[t](e)}catch(o){}}return!1}},51577:function(t,e,r){"use strict";var n=r(18431);t.exports=!n((function(){function t(){}return t.prototype.constructor=null,Object.getPrototypeOf(new t)!==t.prototype}))},14265:function(t,e,r){"use strict";var n=r(55418),o=r(43313),i=r(11336),a=/"/g,s=n("".replace);t.exports=function(t,e,r,n){var c=i(o(t)),u="<"+e;return""!==r&&(u+=" "+r+'="'+s(i(n),a,"&quot;")+'"'),u+">"+c+"</"+e+">"}},85501:function(t){"use strict";t.exports=function(t,e){return{value:t,done:e}}},52838:function(t,e,r){"use strict";var n=r(58849),o=r(54991),i=r(51012);t.exports=n?function(t,e,r){return o.f(t,e,i(1,r))}:function(t,e,r){return t[e]=r,t}},51012:function(t){"use strict";t.exports=function(t,e){return{enumerable:!(1&t),configurable:!(2&t),writable:!(4&t),value:e}}},53396:function(t,e,r){"use strict";var n=r(84297),o=r(54991),i=r(51012);t.exports=function(t,e,r){var a=n(e);a in t?o.f(t,a,i(0,r)):t[a]=r}},22653:function(t,e,r){"use strict";var n=r(22933),o=r(9265),i=TypeError;t.exports=function(t){if(n(this),"string"===t||"default"===t)t="string";else if("number"!==t)throw new i("Incorrect hint");return o(this,t)}},40030:function(t,e,r){"use strict";var n=r(23141),o=r(54991);t.exports=function(t,e,r){return r.get&&n(r.get,e,{getter:!0}),r.set&&n(r.set,e,{setter:!0}),o.f(t,e,r)}},73936:function(t,e,r){"use strict";var n=r(30553),o=r(54991),i=r(23141),a=r(64040);t.exports=function(t,e,r,s){s||(s={});var c=s.enumerable,u=void 0!==s.name?s.name:e;if(n(r)&&i(r,u,s),s.global)c?t[e]=r:a(e,r);else{try{s.unsafe?t[e]&&(c=!0):delete t[e]}catch(l){}c?t[e]=r:o.f(t,e,{value:r,enumerable:!1,configurable:!s.nonConfigurable,writable:!s.nonWritable})}return t}},40855:function(t,e,r){"use strict";var n=r(73936);t.exports=function(t,e,r){for(var o in e)n(t,o,e[o],r);return t}},64040:function(t,e,r){"use strict";var n=r(5813),o=Object.defineProperty;t.exports=function(t,e){try{o(n,t,{value:e,configurable:!0,writable:!0})}catch(r){n[t]=e}return e}},35102:function(t,e,r){"use strict";var n=r(71414),o=TypeError;t.exports=function(t,e){if(!delete t[e])throw new o("Cannot delete property "+n(e)+" of "+n(t))}},58849:function(t,e,r){"use strict";var n=r(18431);t.exports=!n((function(){return 7!==Object.defineProperty({},1,{get:function(){return 7}})[1]}))},55836:function(t,e,r){"use strict";var n=r(5813),o=r(38475),i=n.document,a=o(i)&&o(i.createElement);t.exports=function(t){return a?i.createElement(t):{}}},54108:function(t){"use strict";var e=TypeError;t.exports=function(t){if(t>9007199254740991)throw e("Maximum allowed index exceeded");return t}},70803:function(t){"use strict";t.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},1617:function(t,e,r){"use strict";var n=r(55836)("span").classList,o=n&&n.constructor&&n.constructor.prototype;t.exports=o===Object.prototype?void 0:o},89397:function(t,e,r){"use strict";var n=r(37575),o=r(13089);t.exports=!n&&!o&&"object"==typeof window&&"object"==typeof document},37575:function(t){"use strict";t.exports="object"==typeof Deno&&Deno&&"object"==typeof Deno.version},3089:function(t,e,r){"use strict";var n=r(68360);t.exports=/ipad|iphone|ipod/i.test(n)&&"undefined"!=typeof Pebble},78609:function(t,e,r){"use strict";var n=r(68360);t.exports=/(?:ipad|iphone|ipod).*applewebkit/i.test(n)},13089:function(t,e,r){"use strict";var n=r(5813),o=r(42458);t.exports="process"===o(n.process)},1642:function(t,e,r){"use strict";var n=r(68360);t.exports=/web0s(?!.*chrome)/i.test(n)},68360:function(t){"use strict";t.exports="undefined"!=typeof navigator&&String(navigator.userAgent)||""},91625:function(t,e,r){"use strict";var n,o,i=r(5813),a=r(68360),s=i.process,c=i.Deno,u=s&&s.versions||c&&c.version,l=u&&u.v8;l&&(o=(n=l.split("."))[0]>0&&n[0]<4?1:+(n[0]+n[1])),!o&&a&&(!(n=a.match(/Edge\/(\d+)/))||n[1]>=74)&&(n=a.match(/Chrome\/(\d+)/))&&(o=+n[1]),t.exports=o},97703:function(t){"use strict";t.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},21709:function(t,e,r){"use strict";var n=r(55418),o=Error,i=n("".replace),a=String(new o("zxcasd").stack),s=/\n\s*at [^:]*:[^\n]*/,c=s.test(a);t.exports=function(t,e){if(c&&"string"==typeof t&&!o.prepareStackTrace)for(;e--;)t=i(t,s,"");return t}},96337:function(t,e,r){"use strict";var n=r(52838),o=r(21709),i=r(40752),a=Error.captureStackTrace;t.exports=function(t,e,r,s){i&&(a?a(t,e):n(t,"stack",o(r,s)))}},40752:function(t,e,r){"use strict";var n=r(18431),o=r(51012);t.exports=!n((function(){var t=new Error("a");return!("stack"in t)||(Object.defineProperty(t,"stack",o(1,7)),7!==t.stack)}))},68077:function(t,e,r){"use strict";var n=r(5813),o=r(25245).f,i=r(52838),a=r(73936),s=r(64040),c=r(93213),u=r(27992);t.exports=function(t,e){var r,l,f,h,d,p=t.target,v=t.global,y=t.stat;if(r=v?n:y?n[p]||s(p,{}):(n[p]||{}).prototype)for(l in e){if(h=e[l],f=t.dontCallGetSet?(d=o(r,l))&&d.value:r[l],!u(v?l:p+(y?".":"#")+l,t.forced)&&void 0!==f){if(typeof h==typeof f)continue;c(h,f)}(t.sham||f&&f.sham)&&i(h,"sham",!0),a(r,l,h,t)}}},18431:function(t){"use strict";t.exports=function(t){try{return!!t()}catch(e){return!0}}},37374:function(t,e,r){"use strict";r(63789);var n=r(74734),o=r(73936),i=r(45648),a=r(18431),s=r(10282),c=r(52838),u=s("species"),l=RegExp.prototype;t.exports=function(t,e,r,f){var h=s(t),d=!a((function(){var e={};return e[h]=function(){return 7},7!==""[t](e)})),p=d&&!a((function(){var e=!1,r=/a/;return"split"===t&&((r={}).constructor={},r.constructor[u]=function(){return r},r.flags="",r[h]=/./[h]),r.exec=function(){return e=!0,null},r[h](""),!e}));if(!d||!p||r){var v=n(/./[h]),y=e(h,""[t],(function(t,e,r,o,a){var s=n(t),c=e.exec;return c===i||c===l.exec?d&&!a?{done:!0,value:v(e,r,o)}:{done:!0,value:s(r,e,o)}:{done:!1}}));o(String.prototype,t,y[0]),o(l,h,y[1])}f&&c(l[h],"sham",!0)}},63505:function(t,e,r){"use strict";var n=r(35968),o=r(10228),i=r(54108),a=r(76902),s=function(t,e,r,c,u,l,f,h){for(var d,p,v=u,y=0,m=!!f&&a(f,h);y<c;)y in r&&(d=m?m(r[y],y,e):r[y],l>0&&n(d)?(p=o(d),v=s(t,e,d,p,v,l-1)-1):(i(v+1),t[v]=d),v++),y++;return v};t.exports=s},91452:function(t,e,r){"use strict";var n=r(18431);t.exports=!n((function(){return Object.isExtensible(Object.preventExtensions({}))}))},35449:function(t,e,r){"use strict";var n=r(39760),o=Function.prototype,i=o.apply,a=o.call;t.exports="object"==typeof Reflect&&Reflect.apply||(n?a.bind(i):function(){return a.apply(i,arguments)})},76902:function(t,e,r){"use strict";var n=r(74734),o=r(9160),i=r(39760),a=n(n.bind);t.exports=function(t,e){return o(t),void 0===e?t:i?a(t,e):function(){return t.apply(e,arguments)}}},39760:function(t,e,r){"use strict";var n=r(18431);t.exports=!n((function(){var t=function(){}.bind();return"function"!=typeof t||t.hasOwnProperty("prototype")}))},1319:function(t,e,r){"use strict";var n=r(55418),o=r(9160),i=r(38475),a=r(55229),s=r(88755),c=r(39760),u=Function,l=n([].concat),f=n([].join),h={};t.exports=c?u.bind:function(t){var e=o(this),r=e.prototype,n=s(arguments,1),c=function(){var r=l(n,s(arguments));return this instanceof c?function(t,e,r){if(!a(h,e)){for(var n=[],o=0;o<e;o++)n[o]="a["+o+"]";h[e]=u("C,a","return new C("+f(n,",")+")")}return h[e](t,r)}(e,r.length,r):e.apply(t,r)};return i(r)&&(c.prototype=r),c}},43173:function(t,e,r){"use strict";var n=r(39760),o=Function.prototype.call;t.exports=n?o.bind(o):function(){return o.apply(o,arguments)}},83875:function(t,e,r){"use strict";var n=r(58849),o=r(55229),i=Function.prototype,a=n&&Object.getOwnPropertyDescriptor,s=o(i,"name"),c=s&&"something"===function(){}.name,u=s&&(!n||n&&a(i,"name").configurable);t.exports={EXISTS:s,PROPER:c,CONFIGURABLE:u}},9881:function(t,e,r){"use strict";var n=r(55418),o=r(9160);t.exports=function(t,e,r){try{return n(o(Object.getOwnPropertyDescriptor(t,e)[r]))}catch(i){}}},74734:function(t,e,r){"use strict";var n=r(42458),o=r(55418);t.exports=function(t){if("Function"===n(t))return o(t)}},55418:function(t,e,r){"use strict";var n=r(39760),o=Function.prototype,i=o.call,a=n&&o.bind.bind(i,i);t.exports=n?a:function(t){return function(){return i.apply(t,arguments)}}},29694:function(t,e,r){"use strict";var n=r(5813),o=r(30553);t.exports=function(t,e){return arguments.length<2?(r=n[t],o(r)?r:void 0):n[t]&&n[t][e];var r}},73177:function(t){"use strict";t.exports=function(t){return{iterator:t,next:t.next,done:!1}}},5218:function(t,e,r){"use strict";var n=r(21973),o=r(54339),i=r(59317),a=r(70381),s=r(10282)("iterator");t.exports=function(t){if(!i(t))return o(t,s)||o(t,"@@iterator")||a[n(t)]}},46767:function(t,e,r){"use strict";var n=r(43173),o=r(9160),i=r(22933),a=r(71414),s=r(5218),c=TypeError;t.exports=function(t,e){var r=arguments.length<2?s(t):e;if(o(r))return i(n(r,t));throw new c(a(t)+" is not iterable")}},56454:function(t,e,r){"use strict";var n=r(55418),o=r(35968),i=r(30553),a=r(42458),s=r(11336),c=n([].push);t.exports=function(t){if(i(t))return t;if(o(t)){for(var e=t.length,r=[],n=0;n<e;n++){var u=t[n];"string"==typeof u?c(r,u):"number"!=typeof u&&"Number"!==a(u)&&"String"!==a(u)||c(r,s(u))}var l=r.length,f=!0;return function(t,e){if(f)return f=!1,e;if(o(this))return e;for(var n=0;n<l;n++)if(r[n]===t)return e}}}},54339:function(t,e,r){"use strict";var n=r(9160),o=r(59317);t.exports=function(t,e){var r=t[e];return o(r)?void 0:n(r)}},70684:function(t,e,r){"use strict";var n=r(9160),o=r(22933),i=r(43173),a=r(97673),s=r(73177),c="Invalid size",u=RangeError,l=TypeError,f=Math.max,h=function(t,e){this.set=t,this.size=f(e,0),this.has=n(t.has),this.keys=n(t.keys)};h.prototype={getIterator:function(){return s(o(i(this.keys,this.set)))},includes:function(t){return i(this.has,this.set,t)}},t.exports=function(t){o(t);var e=+t.size;if(e!=e)throw new l(c);var r=a(e);if(r<0)throw new u(c);return new h(t,r)}},17107:function(t,e,r){"use strict";var n=r(55418),o=r(19480),i=Math.floor,a=n("".charAt),s=n("".replace),c=n("".slice),u=/\$([$&'`]|\d{1,2}|<[^>]*>)/g,l=/\$([$&'`]|\d{1,2})/g;t.exports=function(t,e,r,n,f,h){var d=r+t.length,p=n.length,v=l;return void 0!==f&&(f=o(f),v=u),s(h,v,(function(o,s){var u;switch(a(s,0)){case"$":return"$";case"&":return t;case"`":return c(e,0,r);case"'":return c(e,d);case"<":u=f[c(s,1,-1)];break;default:var l=+s;if(0===l)return o;if(l>p){var h=i(l/10);return 0===h?o:h<=p?void 0===n[h-1]?a(s,1):n[h-1]+a(s,1):o}u=n[l-1]}return void 0===u?"":u}))}},5813:function(t){"use strict";var e=function(t){return t&&t.Math===Math&&t};t.exports=e("object"==typeof globalThis&&globalThis)||e("object"==typeof window&&window)||e("object"==typeof self&&self)||e("object"==typeof global&&global)||e("object"==typeof this&&this)||function(){return this}()||Function("return this")()},55229:function(t,e,r){"use strict";var n=r(55418),o=r(19480),i=n({}.hasOwnProperty);t.exports=Object.hasOwn||function(t,e){return i(o(t),e)}},46170:function(t){"use strict";t.exports={}},15089:function(t){"use strict";t.exports=function(t,e){try{1===arguments.length?console.error(t):console.error(t,e)}catch(r){}}},34483:function(t,e,r){"use strict";var n=r(29694);t.exports=n("document","documentElement")},33642:function(t,e,r){"use strict";var n=r(58849),o=r(18431),i=r(55836);t.exports=!n&&!o((function(){return 7!==Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},70814:function(t,e,r){"use strict";var n=r(55418),o=r(18431),i=r(42458),a=Object,s=n("".split);t.exports=o((function(){return!a("z").propertyIsEnumerable(0)}))?function(t){return"String"===i(t)?s(t,""):a(t)}:a},81760:function(t,e,r){"use strict";var n=r(30553),o=r(38475),i=r(27248);t.exports=function(t,e,r){var a,s;return i&&n(a=e.constructor)&&a!==r&&o(s=a.prototype)&&s!==r.prototype&&i(t,s),t}},47397:function(t,e,r){"use strict";var n=r(55418),o=r(30553),i=r(13036),a=n(Function.toString);o(i.inspectSource)||(i.inspectSource=function(t){return a(t)}),t.exports=i.inspectSource},91934:function(t,e,r){"use strict";var n=r(38475),o=r(52838);t.exports=function(t,e){n(e)&&"cause"in e&&o(t,"cause",e.cause)}},70276:function(t,e,r){"use strict";var n=r(68077),o=r(55418),i=r(46170),a=r(38475),s=r(55229),c=r(54991).f,u=r(45919),l=r(16102),f=r(69362),h=r(92311),d=r(91452),p=!1,v=h("meta"),y=0,m=function(t){c(t,v,{value:{objectID:"O"+y++,weakData:{}}})},g=t.exports={enable:function(){g.enable=function(){},p=!0;var t=u.f,e=o([].splice),r={};r[v]=1,t(r).length&&(u.f=function(r){for(var n=t(r),o=0,i=n.length;o<i;o++)if(n[o]===v){e(n,o,1);break}return n},n({target:"Object",stat:!0,forced:!0},{getOwnPropertyNames:l.f}))},fastKey:function(t,e){if(!a(t))return"symbol"==typeof t?t:("string"==typeof t?"S":"P")+t;if(!s(t,v)){if(!f(t))return"F";if(!e)return"E";m(t)}return t[v].objectID},getWeakData:function(t,e){if(!s(t,v)){if(!f(t))return!0;if(!e)return!1;m(t)}return t[v].weakData},onFreeze:function(t){return d&&p&&f(t)&&!s(t,v)&&m(t),t}};i[v]=!0},12648:function(t,e,r){"use strict";var n,o,i,a=r(83777),s=r(5813),c=r(38475),u=r(52838),l=r(55229),f=r(13036),h=r(95292),d=r(46170),p="Object already initialized",v=s.TypeError,y=s.WeakMap;if(a||f.state){var m=f.state||(f.state=new y);m.get=m.get,m.has=m.has,m.set=m.set,n=function(t,e){if(m.has(t))throw new v(p);return e.facade=t,m.set(t,e),e},o=function(t){return m.get(t)||{}},i=function(t){return m.has(t)}}else{var g=h("state");d[g]=!0,n=function(t,e){if(l(t,g))throw new v(p);return e.facade=t,u(t,g,e),e},o=function(t){return l(t,g)?t[g]:{}},i=function(t){return l(t,g)}}t.exports={set:n,get:o,has:i,enforce:function(t){return i(t)?o(t):n(t,{})},getterFor:function(t){return function(e){var r;if(!c(e)||(r=o(e)).type!==t)throw new v("Incompatible receiver, "+t+" required");return r}}}},21678:function(t,e,r){"use strict";var n=r(10282),o=r(70381),i=n("iterator"),a=Array.prototype;t.exports=function(t){return void 0!==t&&(o.Array===t||a[i]===t)}},35968:function(t,e,r){"use strict";var n=r(42458);t.exports=Array.isArray||function(t){return"Array"===n(t)}},30553:function(t){"use strict";var e="object"==typeof document&&document.all;t.exports=void 0===e&&void 0!==e?function(t){return"function"==typeof t||t===e}:function(t){return"function"==typeof t}},78142:function(t,e,r){"use strict";var n=r(55418),o=r(18431),i=r(30553),a=r(21973),s=r(29694),c=r(47397),u=function(){},l=[],f=s("Reflect","construct"),h=/^\s*(?:class|function)\b/,d=n(h.exec),p=!h.test(u),v=function(t){if(!i(t))return!1;try{return f(u,l,t),!0}catch(e){return!1}},y=function(t){if(!i(t))return!1;switch(a(t)){case"AsyncFunction":case"GeneratorFunction":case"AsyncGeneratorFunction":return!1}try{return p||!!d(h,c(t))}catch(e){return!0}};y.sham=!0,t.exports=!f||o((function(){var t;return v(v.call)||!v(Object)||!v((function(){t=!0}))||t}))?y:v},89688:function(t,e,r){"use strict";var n=r(55229);t.exports=function(t){return void 0!==t&&(n(t,"value")||n(t,"writable"))}},27992:function(t,e,r){"use strict";var n=r(18431),o=r(30553),i=/#|\.prototype\./,a=function(t,e){var r=c[s(t)];return r===l||r!==u&&(o(e)?n(e):!!e)},s=a.normalize=function(t){return String(t).replace(i,".").toLowerCase()},c=a.data={},u=a.NATIVE="N",l=a.POLYFILL="P";t.exports=a},3873:function(t,e,r){"use strict";var n=r(38475),o=Math.floor;t.exports=Number.isInteger||function(t){return!n(t)&&isFinite(t)&&o(t)===t}},59317:function(t){"use strict";t.exports=function(t){return null==t}},38475:function(t,e,r){"use strict";var n=r(30553);t.exports=function(t){return"object"==typeof t?null!==t:n(t)}},73758:function(t,e,r){"use strict";var n=r(38475);t.exports=function(t){return n(t)||null===t}},95448:function(t){"use strict";t.exports=!1},90744:function(t,e,r){"use strict";var n=r(38475),o=r(42458),i=r(10282)("match");t.exports=function(t){var e;return n(t)&&(void 0!==(e=t[i])?!!e:"RegExp"===o(t))}},12052:function(t,e,r){"use strict";var n=r(29694),o=r(30553),i=r(95882),a=r(58150),s=Object;t.exports=a?function(t){return"symbol"==typeof t}:function(t){var e=n("Symbol");return o(e)&&i(e.prototype,s(t))}},61651:function(t,e,r){"use strict";var n=r(43173);t.exports=function(t,e,r){for(var o,i,a=r?t:t.iterator,s=t.next;!(o=n(s,a)).done;)if(void 0!==(i=e(o.value)))return i}},72208:function(t,e,r){"use strict";var n=r(76902),o=r(43173),i=r(22933),a=r(71414),s=r(21678),c=r(10228),u=r(95882),l=r(46767),f=r(5218),h=r(56208),d=TypeError,p=function(t,e){this.stopped=t,this.result=e},v=p.prototype;t.exports=function(t,e,r){var y,m,g,b,w,_,E,x=r&&r.that,S=!(!r||!r.AS_ENTRIES),k=!(!r||!r.IS_RECORD),A=!(!r||!r.IS_ITERATOR),P=!(!r||!r.INTERRUPTED),O=n(e,x),T=function(t){return y&&h(y,"normal",t),new p(!0,t)},R=function(t){return S?(i(t),P?O(t[0],t[1],T):O(t[0],t[1])):P?O(t,T):O(t)};if(k)y=t.iterator;else if(A)y=t;else{if(!(m=f(t)))throw new d(a(t)+" is not iterable");if(s(m)){for(g=0,b=c(t);b>g;g++)if((w=R(t[g]))&&u(v,w))return w;return new p(!1)}y=l(t,m)}for(_=k?t.next:y.next;!(E=o(_,y)).done;){try{w=R(E.value)}catch(C){h(y,"throw",C)}if("object"==typeof w&&w&&u(v,w))return w}return new p(!1)}},56208:function(t,e,r){"use strict";var n=r(43173),o=r(22933),i=r(54339);t.exports=function(t,e,r){var a,s;o(t);try{if(!(a=i(t,"return"))){if("throw"===e)throw r;return r}a=n(a,t)}catch(c){s=!0,a=c}if("throw"===e)throw r;if(s)throw a;return o(a),r}},54398:function(t,e,r){"use strict";var n=r(65017).IteratorPrototype,o=r(9885),i=r(51012),a=r(48357),s=r(70381),c=function(){return this};t.exports=function(t,e,r,u){var l=e+" Iterator";return t.prototype=o(n,{next:i(+!u,r)}),a(t,l,!1,!0),s[l]=c,t}},8900:function(t,e,r){"use strict";var n=r(43173),o=r(9885),i=r(52838),a=r(40855),s=r(10282),c=r(12648),u=r(54339),l=r(65017).IteratorPrototype,f=r(85501),h=r(56208),d=s("toStringTag"),p="IteratorHelper",v="WrapForValidIterator",y=c.set,m=function(t){var e=c.getterFor(t?v:p);return a(o(l),{next:function(){var r=e(this);if(t)return r.nextHandler();try{var n=r.done?void 0:r.nextHandler();return f(n,r.done)}catch(o){throw r.done=!0,o}},return:function(){var r=e(this),o=r.iterator;if(r.done=!0,t){var i=u(o,"return");return i?n(i,o):f(void 0,!0)}if(r.inner)try{h(r.inner.iterator,"normal")}catch(a){return h(o,"throw",a)}return h(o,"normal"),f(void 0,!0)}})},g=m(!0),b=m(!1);i(b,d,"Iterator Helper"),t.exports=function(t,e){var r=function(r,n){n?(n.iterator=r.iterator,n.next=r.next):n=r,n.type=e?v:p,n.nextHandler=t,n.counter=0,n.done=!1,y(this,n)};return r.prototype=e?g:b,r}},4638:function(t,e,r){"use strict";var n=r(68077),o=r(43173),i=r(95448),a=r(83875),s=r(30553),c=r(54398),u=r(2563),l=r(27248),f=r(48357),h=r(52838),d=r(73936),p=r(10282),v=r(70381),y=r(65017),m=a.PROPER,g=a.CONFIGURABLE,b=y.IteratorPrototype,w=y.BUGGY_SAFARI_ITERATORS,_=p("iterator"),E="keys",x="values",S="entries",k=function(){return this};t.exports=function(t,e,r,a,p,y,A){c(r,e,a);var P,O,T,R=function(t){if(t===p&&N)return N;if(!w&&t&&t in I)return I[t];switch(t){case E:case x:case S:return function(){return new r(this,t)}}return function(){return new r(this)}},C=e+" Iterator",H=!1,I=t.prototype,L=I[_]||I["@@iterator"]||p&&I[p],N=!w&&L||R(p),B="Array"===e&&I.entries||L;if(B&&(P=u(B.call(new t)))!==Object.prototype&&P.next&&(i||u(P)===b||(l?l(P,b):s(P[_])||d(P,_,k)),f(P,C,!0,!0),i&&(v[C]=k)),m&&p===x&&L&&L.name!==x&&(!i&&g?h(I,"name",x):(H=!0,N=function(){return o(L,this)})),p)if(O={values:R(x),keys:y?N:R(E),entries:R(S)},A)for(T in O)(w||H||!(T in I))&&d(I,T,O[T]);else n({target:e,proto:!0,forced:w||H},O);return i&&!A||I[_]===N||d(I,_,N,{name:p}),v[e]=N,O}},57902:function(t,e,r){"use strict";var n=r(43173),o=r(9160),i=r(22933),a=r(73177),s=r(8900),c=r(74856),u=s((function(){var t=this.iterator,e=i(n(this.next,t));if(!(this.done=!!e.done))return c(t,this.mapper,[e.value,this.counter++],!0)}));t.exports=function(t){return i(this),o(t),new u(a(this),{mapper:t})}},65017:function(t,e,r){"use strict";var n,o,i,a=r(18431),s=r(30553),c=r(38475),u=r(9885),l=r(2563),f=r(73936),h=r(10282),d=r(95448),p=h("iterator"),v=!1;[].keys&&("next"in(i=[].keys())?(o=l(l(i)))!==Object.prototype&&(n=o):v=!0),!c(n)||a((function(){var t={};return n[p].call(t)!==t}))?n={}:d&&(n=u(n)),s(n[p])||f(n,p,(function(){return this})),t.exports={IteratorPrototype:n,BUGGY_SAFARI_ITERATORS:v}},70381:function(t){"use strict";t.exports={}},10228:function(t,e,r){"use strict";var n=r(97142);t.exports=function(t){return n(t.length)}},23141:function(t,e,r){"use strict";var n=r(55418),o=r(18431),i=r(30553),a=r(55229),s=r(58849),c=r(83875).CONFIGURABLE,u=r(47397),l=r(12648),f=l.enforce,h=l.get,d=String,p=Object.defineProperty,v=n("".slice),y=n("".replace),m=n([].join),g=s&&!o((function(){return 8!==p((function(){}),"length",{value:8}).length})),b=String(String).split("String"),w=t.exports=function(t,e,r){"Symbol("===v(d(e),0,7)&&(e="["+y(d(e),/^Symbol\(([^)]*)\)/,"$1")+"]"),r&&r.getter&&(e="get "+e),r&&r.setter&&(e="set "+e),(!a(t,"name")||c&&t.name!==e)&&(s?p(t,"name",{value:e,configurable:!0}):t.name=e),g&&r&&a(r,"arity")&&t.length!==r.arity&&p(t,"length",{value:r.arity});try{r&&a(r,"constructor")&&r.constructor?s&&p(t,"prototype",{writable:!1}):t.prototype&&(t.prototype=void 0)}catch(o){}var n=f(t);return a(n,"source")||(n.source=m(b,"string"==typeof e?e:"")),t};Function.prototype.toString=w((function(){return i(this)&&h(this).source||u(this)}),"toString")},47329:function(t){"use strict";var e=Math.ceil,r=Math.floor;t.exports=Math.trunc||function(t){var n=+t;return(n>0?r:e)(n)}},33099:function(t,e,r){"use strict";var n,o,i,a,s,c=r(5813),u=r(95310),l=r(76902),f=r(20295).set,h=r(29639),d=r(78609),p=r(3089),v=r(1642),y=r(13089),m=c.MutationObserver||c.WebKitMutationObserver,g=c.document,b=c.process,w=c.Promise,_=u("queueMicrotask");if(!_){var E=new h,x=function(){var t,e;for(y&&(t=b.domain)&&t.exit();e=E.get();)try{e()}catch(r){throw E.head&&n(),r}t&&t.enter()};d||y||v||!m||!g?!p&&w&&w.resolve?((a=w.resolve(void 0)).constructor=w,s=l(a.then,a),n=function(){s(x)}):y?n=function(){b.nextTick(x)}:(f=l(f,c),n=function(){f(x)}):(o=!0,i=g.createTextNode(""),new m(x).observe(i,{characterData:!0}),n=function(){i.data=o=!o}),_=function(t){E.head||n(),E.add(t)}}t.exports=_},1731:function(t,e,r){"use strict";var n=r(9160),o=TypeError,i=function(t){var e,r;this.promise=new t((function(t,n){if(void 0!==e||void 0!==r)throw new o("Bad Promise constructor");e=t,r=n})),this.resolve=n(e),this.reject=n(r)};t.exports.f=function(t){return new i(t)}},30852:function(t,e,r){"use strict";var n=r(11336);t.exports=function(t,e){return void 0===t?arguments.length<2?"":e:n(t)}},52205:function(t,e,r){"use strict";var n=r(90744),o=TypeError;t.exports=function(t){if(n(t))throw new o("The method doesn't accept regular expressions");return t}},60957:function(t,e,r){"use strict";var n=r(5813),o=r(18431),i=r(55418),a=r(11336),s=r(55370).trim,c=r(92743),u=i("".charAt),l=n.parseFloat,f=n.Symbol,h=f&&f.iterator,d=1/l(c+"-0")!=-1/0||h&&!o((function(){l(Object(h))}));t.exports=d?function(t){var e=s(a(t)),r=l(e);return 0===r&&"-"===u(e,0)?-0:r}:l},79058:function(t,e,r){"use strict";var n=r(5813),o=r(18431),i=r(55418),a=r(11336),s=r(55370).trim,c=r(92743),u=n.parseInt,l=n.Symbol,f=l&&l.iterator,h=/^[+-]?0x/i,d=i(h.exec),p=8!==u(c+"08")||22!==u(c+"0x16")||f&&!o((function(){u(Object(f))}));t.exports=p?function(t,e){var r=s(a(t));return u(r,e>>>0||(d(h,r)?16:10))}:u},54914:function(t,e,r){"use strict";var n=r(58849),o=r(55418),i=r(43173),a=r(18431),s=r(93121),c=r(18503),u=r(60771),l=r(19480),f=r(70814),h=Object.assign,d=Object.defineProperty,p=o([].concat);t.exports=!h||a((function(){if(n&&1!==h({b:1},h(d({},"a",{enumerable:!0,get:function(){d(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var t={},e={},r=Symbol("assign detection"),o="abcdefghijklmnopqrst";return t[r]=7,o.split("").forEach((function(t){e[t]=t})),7!==h({},t)[r]||s(h({},e)).join("")!==o}))?function(t,e){for(var r=l(t),o=arguments.length,a=1,h=c.f,d=u.f;o>a;)for(var v,y=f(arguments[a++]),m=h?p(s(y),h(y)):s(y),g=m.length,b=0;g>b;)v=m[b++],n&&!i(d,y,v)||(r[v]=y[v]);return r}:h},9885:function(t,e,r){"use strict";var n,o=r(22933),i=r(44760),a=r(97703),s=r(46170),c=r(34483),u=r(55836),l=r(95292),f="prototype",h="script",d=l("IE_PROTO"),p=function(){},v=function(t){return"<"+h+">"+t+"</"+h+">"},y=function(t){t.write(v("")),t.close();var e=t.parentWindow.Object;return t=null,e},m=function(){try{n=new ActiveXObject("htmlfile")}catch(i){}var t,e,r;m="undefined"!=typeof document?document.domain&&n?y(n):(e=u("iframe"),r="java"+h+":",e.style.display="none",c.appendChild(e),e.src=String(r),(t=e.contentWindow.document).open(),t.write(v("document.F=Object")),t.close(),t.F):y(n);for(var o=a.length;o--;)delete m[f][a[o]];return m()};s[d]=!0,t.exports=Object.create||function(t,e){var r;return null!==t?(p[f]=o(t),r=new p,p[f]=null,r[d]=t):r=m(),void 0===e?r:i.f(r,e)}},44760:function(t,e,r){"use strict";var n=r(58849),o=r(52649),i=r(54991),a=r(22933),s=r(17460),c=r(93121);e.f=n&&!o?Object.defineProperties:function(t,e){a(t);for(var r,n=s(e),o=c(e),u=o.length,l=0;u>l;)i.f(t,r=o[l++],n[r]);return t}},54991:function(t,e,r){"use strict";var n=r(58849),o=r(33642),i=r(52649),a=r(22933),s=r(84297),c=TypeError,u=Object.defineProperty,l=Object.getOwnPropertyDescriptor,f="enumerable",h="configurable",d="writable";e.f=n?i?function(t,e,r){if(a(t),e=s(e),a(r),"function"==typeof t&&"prototype"===e&&"value"in r&&d in r&&!r[d]){var n=l(t,e);n&&n[d]&&(t[e]=r.value,r={configurable:h in r?r[h]:n[h],enumerable:f in r?r[f]:n[f],writable:!1})}return u(t,e,r)}:u:function(t,e,r){if(a(t),e=s(e),a(r),o)try{return u(t,e,r)}catch(n){}if("get"in r||"set"in r)throw new c("Accessors not supported");return"value"in r&&(t[e]=r.value),t}},25245:function(t,e,r){"use strict";var n=r(58849),o=r(43173),i=r(60771),a=r(51012),s=r(17460),c=r(84297),u=r(55229),l=r(33642),f=Object.getOwnPropertyDescriptor;e.f=n?f:function(t,e){if(t=s(t),e=c(e),l)try{return f(t,e)}catch(r){}if(u(t,e))return a(!o(i.f,t,e),t[e])}},16102:function(t,e,r){"use strict";var n=r(42458),o=r(17460),i=r(45919).f,a=r(88755),s="object"==typeof window&&window&&Object.getOwnPropertyNames?Object.getOwnPropertyNames(window):[];t.exports.f=function(t){return s&&"Window"===n(t)?function(t){try{return i(t)}catch(e){return a(s)}}(t):i(o(t))}},45919:function(t,e,r){"use strict";var n=r(30044),o=r(97703).concat("length","prototype");e.f=Object.getOwnPropertyNames||function(t){return n(t,o)}},18503:function(t,e){"use strict";e.f=Object.getOwnPropertySymbols},2563:function(t,e,r){"use strict";var n=r(55229),o=r(30553),i=r(19480),a=r(95292),s=r(51577),c=a("IE_PROTO"),u=Object,l=u.prototype;t.exports=s?u.getPrototypeOf:function(t){var e=i(t);if(n(e,c))return e[c];var r=e.constructor;return o(r)&&e instanceof r?r.prototype:e instanceof u?l:null}},69362:function(t,e,r){"use strict";var n=r(18431),o=r(38475),i=r(42458),a=r(57939),s=Object.isExtensible,c=n((function(){s(1)}));t.exports=c||a?function(t){return!!o(t)&&((!a||"ArrayBuffer"!==i(t))&&(!s||s(t)))}:s},95882:function(t,e,r){"use strict";var n=r(55418);t.exports=n({}.isPrototypeOf)},30044:function(t,e,r){"use strict";var n=r(55418),o=r(55229),i=r(17460),a=r(92460).indexOf,s=r(46170),c=n([].push);t.exports=function(t,e){var r,n=i(t),u=0,l=[];for(r in n)!o(s,r)&&o(n,r)&&c(l,r);for(;e.length>u;)o(n,r=e[u++])&&(~a(l,r)||c(l,r));return l}},93121:function(t,e,r){"use strict";var n=r(30044),o=r(97703);t.exports=Object.keys||function(t){return n(t,o)}},60771:function(t,e){"use strict";var r={}.propertyIsEnumerable,n=Object.getOwnPropertyDescriptor,o=n&&!r.call({1:2},1);e.f=o?function(t){var e=n(this,t);return!!e&&e.enumerable}:r},27248:function(t,e,r){"use strict";var n=r(9881),o=r(22933),i=r(95859);t.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var t,e=!1,r={};try{(t=n(Object.prototype,"__proto__","set"))(r,[]),e=r instanceof Array}catch(a){}return function(r,n){return o(r),i(n),e?t(r,n):r.__proto__=n,r}}():void 0)},94969:function(t,e,r){"use strict";var n=r(58849),o=r(18431),i=r(55418),a=r(2563),s=r(93121),c=r(17460),u=i(r(60771).f),l=i([].push),f=n&&o((function(){var t=Object.create(null);return t[2]=2,!u(t,2)})),h=function(t){return function(e){for(var r,o=c(e),i=s(o),h=f&&null===a(o),d=i.length,p=0,v=[];d>p;)r=i[p++],n&&!(h?r in o:u(o,r))||l(v,t?[r,o[r]]:o[r]);return v}};t.exports={entries:h(!0),values:h(!1)}},81798:function(t,e,r){"use strict";var n=r(9574),o=r(21973);t.exports=n?{}.toString:function(){return"[object "+o(this)+"]"}},9265:function(t,e,r){"use strict";var n=r(43173),o=r(30553),i=r(38475),a=TypeError;t.exports=function(t,e){var r,s;if("string"===e&&o(r=t.toString)&&!i(s=n(r,t)))return s;if(o(r=t.valueOf)&&!i(s=n(r,t)))return s;if("string"!==e&&o(r=t.toString)&&!i(s=n(r,t)))return s;throw new a("Can't convert object to primitive value")}},20202:function(t,e,r){"use strict";var n=r(29694),o=r(55418),i=r(45919),a=r(18503),s=r(22933),c=o([].concat);t.exports=n("Reflect","ownKeys")||function(t){var e=i.f(s(t)),r=a.f;return r?c(e,r(t)):e}},25403:function(t,e,r){"use strict";var n=r(55418),o=r(55229),i=SyntaxError,a=parseInt,s=String.fromCharCode,c=n("".charAt),u=n("".slice),l=n(/./.exec),f={'\\"':'"',"\\\\":"\\","\\/":"/","\\b":"\b","\\f":"\f","\\n":"\n","\\r":"\r","\\t":"\t"},h=/^[\da-f]{4}$/i,d=/^[\u0000-\u001F]$/;t.exports=function(t,e){for(var r=!0,n="";e<t.length;){var p=c(t,e);if("\\"===p){var v=u(t,e,e+2);if(o(f,v))n+=f[v],e+=2;else{if("\\u"!==v)throw new i('Unknown escape sequence: "'+v+'"');var y=u(t,e+=2,e+4);if(!l(h,y))throw new i("Bad Unicode escape at: "+e);n+=s(a(y,16)),e+=4}}else{if('"'===p){r=!1,e++;break}if(l(d,p))throw new i("Bad control character in string literal at: "+e);n+=p,e++}}if(r)throw new i("Unterminated string at: "+e);return{value:n,end:e}}},50649:function(t,e,r){"use strict";var n=r(5813);t.exports=n},70754:function(t){"use strict";t.exports=function(t){try{return{error:!1,value:t()}}catch(e){return{error:!0,value:e}}}},15624:function(t,e,r){"use strict";var n=r(5813),o=r(44565),i=r(30553),a=r(27992),s=r(47397),c=r(10282),u=r(89397),l=r(37575),f=r(95448),h=r(91625),d=o&&o.prototype,p=c("species"),v=!1,y=i(n.PromiseRejectionEvent),m=a("Promise",(function(){var t=s(o),e=t!==String(o);if(!e&&66===h)return!0;if(f&&(!d.catch||!d.finally))return!0;if(!h||h<51||!/native code/.test(t)){var r=new o((function(t){t(1)})),n=function(t){t((function(){}),(function(){}))};if((r.constructor={})[p]=n,!(v=r.then((function(){}))instanceof n))return!0}return!e&&(u||l)&&!y}));t.exports={CONSTRUCTOR:m,REJECTION_EVENT:y,SUBCLASSING:v}},44565:function(t,e,r){"use strict";var n=r(5813);t.exports=n.Promise},13847:function(t,e,r){"use strict";var n=r(22933),o=r(38475),i=r(1731);t.exports=function(t,e){if(n(t),o(e)&&e.constructor===t)return e;var r=i.f(t);return(0,r.resolve)(e),r.promise}},30222:function(t,e,r){"use strict";var n=r(44565),o=r(54294),i=r(15624).CONSTRUCTOR;t.exports=i||!o((function(t){n.all(t).then(void 0,(function(){}))}))},4109:function(t,e,r){"use strict";var n=r(54991).f;t.exports=function(t,e,r){r in t||n(t,r,{configurable:!0,get:function(){return e[r]},set:function(t){e[r]=t}})}},29639:function(t){"use strict";var e=function(){this.head=null,this.tail=null};e.prototype={add:function(t){var e={item:t,next:null},r=this.tail;r?r.next=e:this.head=e,this.tail=e},get:function(){var t=this.head;if(t)return null===(this.head=t.next)&&(this.tail=null),t.item}},t.exports=e},94448:function(t,e,r){"use strict";var n=r(43173),o=r(22933),i=r(30553),a=r(42458),s=r(45648),c=TypeError;t.exports=function(t,e){var r=t.exec;if(i(r)){var u=n(r,t,e);return null!==u&&o(u),u}if("RegExp"===a(t))return n(s,t,e);throw new c("RegExp#exec called on incompatible receiver")}},45648:function(t,e,r){"use strict";var n,o,i=r(43173),a=r(55418),s=r(11336),c=r(85891),u=r(9773),l=r(82765),f=r(9885),h=r(12648).get,d=r(66509),p=r(70852),v=l("native-string-replace",String.prototype.replace),y=RegExp.prototype.exec,m=y,g=a("".charAt),b=a("".indexOf),w=a("".replace),_=a("".slice),E=(o=/b*/g,i(y,n=/a/,"a"),i(y,o,"a"),0!==n.lastIndex||0!==o.lastIndex),x=u.BROKEN_CARET,S=void 0!==/()??/.exec("")[1];(E||S||x||d||p)&&(m=function(t){var e,r,n,o,a,u,l,d=this,p=h(d),k=s(t),A=p.raw;if(A)return A.lastIndex=d.lastIndex,e=i(m,A,k),d.lastIndex=A.lastIndex,e;var P=p.groups,O=x&&d.sticky,T=i(c,d),R=d.source,C=0,H=k;if(O&&(T=w(T,"y",""),-1===b(T,"g")&&(T+="g"),H=_(k,d.lastIndex),d.lastIndex>0&&(!d.multiline||d.multiline&&"\n"!==g(k,d.lastIndex-1))&&(R="(?: "+R+")",H=" "+H,C++),r=new RegExp("^(?:"+R+")",T)),S&&(r=new RegExp("^"+R+"$(?!\\s)",T)),E&&(n=d.lastIndex),o=i(y,O?r:d,H),O?o?(o.input=_(o.input,C),o[0]=_(o[0],C),o.index=d.lastIndex,d.lastIndex+=o[0].length):d.lastIndex=0:E&&o&&(d.lastIndex=d.global?o.index+o[0].length:n),S&&o&&o.length>1&&i(v,o[0],r,(function(){for(a=1;a<arguments.length-2;a++)void 0===arguments[a]&&(o[a]=void 0)})),o&&P)for(o.groups=u=f(null),a=0;a<P.length;a++)u[(l=P[a])[0]]=o[l[1]];return o}),t.exports=m},85891:function(t,e,r){"use strict";var n=r(22933);t.exports=function(){var t=n(this),e="";return t.hasIndices&&(e+="d"),t.global&&(e+="g"),t.ignoreCase&&(e+="i"),t.multiline&&(e+="m"),t.dotAll&&(e+="s"),t.unicode&&(e+="u"),t.unicodeSets&&(e+="v"),t.sticky&&(e+="y"),e}},78287:function(t,e,r){"use strict";var n=r(43173),o=r(55229),i=r(95882),a=r(85891),s=RegExp.prototype;t.exports=function(t){var e=t.flags;return void 0!==e||"flags"in s||o(t,"flags")||!i(s,t)?e:n(a,t)}},9773:function(t,e,r){"use strict";var n=r(18431),o=r(5813).RegExp,i=n((function(){var t=o("a","y");return t.lastIndex=2,null!==t.exec("abcd")})),a=i||n((function(){return!o("a","y").sticky})),s=i||n((function(){var t=o("^r","gy");return t.lastIndex=2,null!==t.exec("str")}));t.exports={BROKEN_CARET:s,MISSED_STICKY:a,UNSUPPORTED_Y:i}},66509:function(t,e,r){"use strict";var n=r(18431),o=r(5813).RegExp;t.exports=n((function(){var t=o(".","s");return!(t.dotAll&&t.test("\n")&&"s"===t.flags)}))},70852:function(t,e,r){"use strict";var n=r(18431),o=r(5813).RegExp;t.exports=n((function(){var t=o("(?<a>b)","g");return"b"!==t.exec("b").groups.a||"bc"!=="b".replace(t,"$<a>c")}))},43313:function(t,e,r){"use strict";var n=r(59317),o=TypeError;t.exports=function(t){if(n(t))throw new o("Can't call method on "+t);return t}},95310:function(t,e,r){"use strict";var n=r(5813),o=r(58849),i=Object.getOwnPropertyDescriptor;t.exports=function(t){if(!o)return n[t];var e=i(n,t);return e&&e.value}},93577:function(t){"use strict";t.exports=Object.is||function(t,e){return t===e?0!==t||1/t==1/e:t!=t&&e!=e}},44640:function(t,e,r){"use strict";var n=r(3569),o=r(15690),i=n.Set,a=n.add;t.exports=function(t){var e=new i;return o(t,(function(t){a(e,t)})),e}},74331:function(t,e,r){"use strict";var n=r(75147),o=r(3569),i=r(44640),a=r(85725),s=r(70684),c=r(15690),u=r(61651),l=o.has,f=o.remove;t.exports=function(t){var e=n(this),r=s(t),o=i(e);return a(e)<=r.size?c(e,(function(t){r.includes(t)&&f(o,t)})):u(r.getIterator(),(function(t){l(e,t)&&f(o,t)})),o}},3569:function(t,e,r){"use strict";var n=r(55418),o=Set.prototype;t.exports={Set:Set,add:n(o.add),has:n(o.has),remove:n(o.delete),proto:o}},52863:function(t,e,r){"use strict";var n=r(75147),o=r(3569),i=r(85725),a=r(70684),s=r(15690),c=r(61651),u=o.Set,l=o.add,f=o.has;t.exports=function(t){var e=n(this),r=a(t),o=new u;return i(e)>r.size?c(r.getIterator(),(function(t){f(e,t)&&l(o,t)})):s(e,(function(t){r.includes(t)&&l(o,t)})),o}},74635:function(t,e,r){"use strict";var n=r(75147),o=r(3569).has,i=r(85725),a=r(70684),s=r(15690),c=r(61651),u=r(56208);t.exports=function(t){var e=n(this),r=a(t);if(i(e)<=r.size)return!1!==s(e,(function(t){if(r.includes(t))return!1}),!0);var l=r.getIterator();return!1!==c(l,(function(t){if(o(e,t))return u(l,"normal",!1)}))}},67511:function(t,e,r){"use strict";var n=r(75147),o=r(85725),i=r(15690),a=r(70684);t.exports=function(t){var e=n(this),r=a(t);return!(o(e)>r.size)&&!1!==i(e,(function(t){if(!r.includes(t))return!1}),!0)}},61757:function(t,e,r){"use strict";var n=r(75147),o=r(3569).has,i=r(85725),a=r(70684),s=r(61651),c=r(56208);t.exports=function(t){var e=n(this),r=a(t);if(i(e)<r.size)return!1;var u=r.getIterator();return!1!==s(u,(function(t){if(!o(e,t))return c(u,"normal",!1)}))}},15690:function(t,e,r){"use strict";var n=r(55418),o=r(61651),i=r(3569),a=i.Set,s=i.proto,c=n(s.forEach),u=n(s.keys),l=u(new a).next;t.exports=function(t,e,r){return r?o({iterator:u(t),next:l},e):c(t,e)}},19268:function(t,e,r){"use strict";var n=r(29694),o=function(t){return{size:t,has:function(){return!1},keys:function(){return{next:function(){return{done:!0}}}}}};t.exports=function(t){var e=n("Set");try{(new e)[t](o(0));try{return(new e)[t](o(-1)),!1}catch(r){return!0}}catch(i){return!1}}},85725:function(t,e,r){"use strict";var n=r(9881),o=r(3569);t.exports=n(o.proto,"size","get")||function(t){return t.size}},36929:function(t,e,r){"use strict";var n=r(29694),o=r(40030),i=r(10282),a=r(58849),s=i("species");t.exports=function(t){var e=n(t);a&&e&&!e[s]&&o(e,s,{configurable:!0,get:function(){return this}})}},26832:function(t,e,r){"use strict";var n=r(75147),o=r(3569),i=r(44640),a=r(70684),s=r(61651),c=o.add,u=o.has,l=o.remove;t.exports=function(t){var e=n(this),r=a(t).getIterator(),o=i(e);return s(r,(function(t){u(e,t)?l(o,t):c(o,t)})),o}},48357:function(t,e,r){"use strict";var n=r(54991).f,o=r(55229),i=r(10282)("toStringTag");t.exports=function(t,e,r){t&&!r&&(t=t.prototype),t&&!o(t,i)&&n(t,i,{configurable:!0,value:e})}},65053:function(t,e,r){"use strict";var n=r(75147),o=r(3569).add,i=r(44640),a=r(70684),s=r(61651);t.exports=function(t){var e=n(this),r=a(t).getIterator(),c=i(e);return s(r,(function(t){o(c,t)})),c}},95292:function(t,e,r){"use strict";var n=r(82765),o=r(92311),i=n("keys");t.exports=function(t){return i[t]||(i[t]=o(t))}},13036:function(t,e,r){"use strict";var n=r(5813),o=r(64040),i="__core-js_shared__",a=n[i]||o(i,{});t.exports=a},82765:function(t,e,r){"use strict";var n=r(95448),o=r(13036);(t.exports=function(t,e){return o[t]||(o[t]=void 0!==e?e:{})})("versions",[]).push({version:"3.35.0",mode:n?"pure":"global",copyright:"© 2014-2023 Denis Pushkarev (zloirock.ru)",license:"https://github.com/zloirock/core-js/blob/v3.35.0/LICENSE",source:"https://github.com/zloirock/core-js"})},51048:function(t,e,r){"use strict";var n=r(22933),o=r(50683),i=r(59317),a=r(10282)("species");t.exports=function(t,e){var r,s=n(t).constructor;return void 0===s||i(r=n(s)[a])?e:o(r)}},24089:function(t,e,r){"use strict";var n=r(18431);t.exports=function(t){return n((function(){var e=""[t]('"');return e!==e.toLowerCase()||e.split('"').length>3}))}},47512:function(t,e,r){"use strict";var n=r(55418),o=r(97673),i=r(11336),a=r(43313),s=n("".charAt),c=n("".charCodeAt),u=n("".slice),l=function(t){return function(e,r){var n,l,f=i(a(e)),h=o(r),d=f.length;return h<0||h>=d?t?"":void 0:(n=c(f,h))<55296||n>56319||h+1===d||(l=c(f,h+1))<56320||l>57343?t?s(f,h):n:t?u(f,h,h+2):l-56320+(n-55296<<10)+65536}};t.exports={codeAt:l(!1),charAt:l(!0)}},86713:function(t,e,r){"use strict";var n=r(55418),o=2147483647,i=/[^\0-\u007E]/,a=/[.\u3002\uFF0E\uFF61]/g,s="Overflow: input needs wider integers to process",c=RangeError,u=n(a.exec),l=Math.floor,f=String.fromCharCode,h=n("".charCodeAt),d=n([].join),p=n([].push),v=n("".replace),y=n("".split),m=n("".toLowerCase),g=function(t){return t+22+75*(t<26)},b=function(t,e,r){var n=0;for(t=r?l(t/700):t>>1,t+=l(t/e);t>455;)t=l(t/35),n+=36;return l(n+36*t/(t+38))},w=function(t){var e=[];t=function(t){for(var e=[],r=0,n=t.length;r<n;){var o=h(t,r++);if(o>=55296&&o<=56319&&r<n){var i=h(t,r++);56320==(64512&i)?p(e,((1023&o)<<10)+(1023&i)+65536):(p(e,o),r--)}else p(e,o)}return e}(t);var r,n,i=t.length,a=128,u=0,v=72;for(r=0;r<t.length;r++)(n=t[r])<128&&p(e,f(n));var y=e.length,m=y;for(y&&p(e,"-");m<i;){var w=o;for(r=0;r<t.length;r++)(n=t[r])>=a&&n<w&&(w=n);var _=m+1;if(w-a>l((o-u)/_))throw new c(s);for(u+=(w-a)*_,a=w,r=0;r<t.length;r++){if((n=t[r])<a&&++u>o)throw new c(s);if(n===a){for(var E=u,x=36;;){var S=x<=v?1:x>=v+26?26:x-v;if(E<S)break;var k=E-S,A=36-S;p(e,f(g(S+k%A))),E=l(k/A),x+=36}p(e,f(g(E))),v=b(u,_,m===y),u=0,m++}}u++,a++}return d(e,"")};t.exports=function(t){var e,r,n=[],o=y(v(m(t),a,"."),".");for(e=0;e<o.length;e++)r=o[e],p(n,u(i,r)?"xn--"+w(r):r);return d(n,".")}},30556:function(t,e,r){"use strict";var n=r(55370).end,o=r(82650);t.exports=o("trimEnd")?function(){return n(this)}:"".trimEnd},82650:function(t,e,r){"use strict";var n=r(83875).PROPER,o=r(18431),i=r(92743);t.exports=function(t){return o((function(){return!!i[t]()||"​᠎"!=="​᠎"[t]()||n&&i[t].name!==t}))}},96868:function(t,e,r){"use strict";var n=r(55370).start,o=r(82650);t.exports=o("trimStart")?function(){return n(this)}:"".trimStart},55370:function(t,e,r){"use strict";var n=r(55418),o=r(43313),i=r(11336),a=r(92743),s=n("".replace),c=RegExp("^["+a+"]+"),u=RegExp("(^|[^"+a+"])["+a+"]+$"),l=function(t){return function(e){var r=i(o(e));return 1&t&&(r=s(r,c,"")),2&t&&(r=s(r,u,"$1")),r}};t.exports={start:l(1),end:l(2),trim:l(3)}},63710:function(t,e,r){"use strict";var n=r(91625),o=r(18431),i=r(5813).String;t.exports=!!Object.getOwnPropertySymbols&&!o((function(){var t=Symbol("symbol detection");return!i(t)||!(Object(t)instanceof Symbol)||!Symbol.sham&&n&&n<41}))},17497:function(t,e,r){"use strict";var n=r(43173),o=r(29694),i=r(10282),a=r(73936);t.exports=function(){var t=o("Symbol"),e=t&&t.prototype,r=e&&e.valueOf,s=i("toPrimitive");e&&!e[s]&&a(e,s,(function(t){return n(r,this)}),{arity:1})}},94824:function(t,e,r){"use strict";var n=r(63710);t.exports=n&&!!Symbol.for&&!!Symbol.keyFor},20295:function(t,e,r){"use strict";var n,o,i,a,s=r(5813),c=r(35449),u=r(76902),l=r(30553),f=r(55229),h=r(18431),d=r(34483),p=r(88755),v=r(55836),y=r(33305),m=r(78609),g=r(13089),b=s.setImmediate,w=s.clearImmediate,_=s.process,E=s.Dispatch,x=s.Function,S=s.MessageChannel,k=s.String,A=0,P={},O="onreadystatechange";h((function(){n=s.location}));var T=function(t){if(f(P,t)){var e=P[t];delete P[t],e()}},R=function(t){return function(){T(t)}},C=function(t){T(t.data)},H=function(t){s.postMessage(k(t),n.protocol+"//"+n.host)};b&&w||(b=function(t){y(arguments.length,1);var e=l(t)?t:x(t),r=p(arguments,1);return P[++A]=function(){c(e,void 0,r)},o(A),A},w=function(t){delete P[t]},g?o=function(t){_.nextTick(R(t))}:E&&E.now?o=function(t){E.now(R(t))}:S&&!m?(a=(i=new S).port2,i.port1.onmessage=C,o=u(a.postMessage,a)):s.addEventListener&&l(s.postMessage)&&!s.importScripts&&n&&"file:"!==n.protocol&&!h(H)?(o=H,s.addEventListener("message",C,!1)):o=O in v("script")?function(t){d.appendChild(v("script"))[O]=function(){d.removeChild(this),T(t)}}:function(t){setTimeout(R(t),0)}),t.exports={set:b,clear:w}},29191:function(t,e,r){"use strict";var n=r(55418);t.exports=n(1..valueOf)},73834:function(t,e,r){"use strict";var n=r(97673),o=Math.max,i=Math.min;t.exports=function(t,e){var r=n(t);return r<0?o(r+e,0):i(r,e)}},17460:function(t,e,r){"use strict";var n=r(70814),o=r(43313);t.exports=function(t){return n(o(t))}},97673:function(t,e,r){"use strict";var n=r(47329);t.exports=function(t){var e=+t;return e!=e||0===e?0:n(e)}},97142:function(t,e,r){"use strict";var n=r(97673),o=Math.min;t.exports=function(t){return t>0?o(n(t),9007199254740991):0}},19480:function(t,e,r){"use strict";var n=r(43313),o=Object;t.exports=function(t){return o(n(t))}},80581:function(t,e,r){"use strict";var n=r(43173),o=r(38475),i=r(12052),a=r(54339),s=r(9265),c=r(10282),u=TypeError,l=c("toPrimitive");t.exports=function(t,e){if(!o(t)||i(t))return t;var r,c=a(t,l);if(c){if(void 0===e&&(e="default"),r=n(c,t,e),!o(r)||i(r))return r;throw new u("Can't convert object to primitive value")}return void 0===e&&(e="number"),s(t,e)}},84297:function(t,e,r){"use strict";var n=r(80581),o=r(12052);t.exports=function(t){var e=n(t,"string");return o(e)?e:e+""}},9574:function(t,e,r){"use strict";var n={};n[r(10282)("toStringTag")]="z",t.exports="[object z]"===String(n)},11336:function(t,e,r){"use strict";var n=r(21973),o=String;t.exports=function(t){if("Symbol"===n(t))throw new TypeError("Cannot convert a Symbol value to a string");return o(t)}},71414:function(t){"use strict";var e=String;t.exports=function(t){try{return e(t)}catch(r){return"Object"}}},92311:function(t,e,r){"use strict";var n=r(55418),o=0,i=Math.random(),a=n(1..toString);t.exports=function(t){return"Symbol("+(void 0===t?"":t)+")_"+a(++o+i,36)}},75548:function(t,e,r){"use strict";var n=r(18431),o=r(10282),i=r(58849),a=r(95448),s=o("iterator");t.exports=!n((function(){var t=new URL("b?a=1&b=2&c=3","http://a"),e=t.searchParams,r=new URLSearchParams("a=1&a=2&b=3"),n="";return t.pathname="c%20d",e.forEach((function(t,r){e.delete("b"),n+=r+t})),r.delete("a",2),r.delete("b",void 0),a&&(!t.toJSON||!r.has("a",1)||r.has("a",2)||!r.has("a",void 0)||r.has("b"))||!e.size&&(a||!i)||!e.sort||"http://a/c%20d?a=1&c=3"!==t.href||"3"!==e.get("c")||"a=1"!==String(new URLSearchParams("?a=1"))||!e[s]||"a"!==new URL("https://a@b").username||"b"!==new URLSearchParams(new URLSearchParams("a=b")).get("a")||"xn--e1aybc"!==new URL("http://тест").host||"#%D0%B1"!==new URL("http://a#б").hash||"a1c3"!==n||"x"!==new URL("http://x",void 0).host}))},58150:function(t,e,r){"use strict";var n=r(63710);t.exports=n&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},52649:function(t,e,r){"use strict";var n=r(58849),o=r(18431);t.exports=n&&o((function(){return 42!==Object.defineProperty((function(){}),"prototype",{value:42,writable:!1}).prototype}))},33305:function(t){"use strict";var e=TypeError;t.exports=function(t,r){if(t<r)throw new e("Not enough arguments");return t}},83777:function(t,e,r){"use strict";var n=r(5813),o=r(30553),i=n.WeakMap;t.exports=o(i)&&/native code/.test(String(i))},80879:function(t,e,r){"use strict";var n=r(50649),o=r(55229),i=r(97665),a=r(54991).f;t.exports=function(t){var e=n.Symbol||(n.Symbol={});o(e,t)||a(e,t,{value:i.f(t)})}},97665:function(t,e,r){"use strict";var n=r(10282);e.f=n},10282:function(t,e,r){"use strict";var n=r(5813),o=r(82765),i=r(55229),a=r(92311),s=r(63710),c=r(58150),u=n.Symbol,l=o("wks"),f=c?u.for||u:u&&u.withoutSetter||a;t.exports=function(t){return i(l,t)||(l[t]=s&&i(u,t)?u[t]:f("Symbol."+t)),l[t]}},92743:function(t){"use strict";t.exports="\t\n\v\f\r                　\u2028\u2029\ufeff"},40612:function(t,e,r){"use strict";var n=r(29694),o=r(55229),i=r(52838),a=r(95882),s=r(27248),c=r(93213),u=r(4109),l=r(81760),f=r(30852),h=r(91934),d=r(96337),p=r(58849),v=r(95448);t.exports=function(t,e,r,y){var m="stackTraceLimit",g=y?2:1,b=t.split("."),w=b[b.length-1],_=n.apply(null,b);if(_){var E=_.prototype;if(!v&&o(E,"cause")&&delete E.cause,!r)return _;var x=n("Error"),S=e((function(t,e){var r=f(y?e:t,void 0),n=y?new _(t):new _;return void 0!==r&&i(n,"message",r),d(n,S,n.stack,2),this&&a(E,this)&&l(n,this,S),arguments.length>g&&h(n,arguments[g]),n}));if(S.prototype=E,"Error"!==w?s?s(S,x):c(S,x,{name:!0}):p&&m in _&&(u(S,_,m),u(S,_,"prepareStackTrace")),c(S,_),!v)try{E.name!==w&&i(E,"name",w),E.constructor=S}catch(k){}return S}}},97393:function(t,e,r){"use strict";var n=r(68077),o=r(18431),i=r(35968),a=r(38475),s=r(19480),c=r(10228),u=r(54108),l=r(53396),f=r(26183),h=r(817),d=r(10282),p=r(91625),v=d("isConcatSpreadable"),y=p>=51||!o((function(){var t=[];return t[v]=!1,t.concat()[0]!==t})),m=function(t){if(!a(t))return!1;var e=t[v];return void 0!==e?!!e:i(t)};n({target:"Array",proto:!0,arity:1,forced:!y||!h("concat")},{concat:function(t){var e,r,n,o,i,a=s(this),h=f(a,0),d=0;for(e=-1,n=arguments.length;e<n;e++)if(m(i=-1===e?a:arguments[e]))for(o=c(i),u(d+o),r=0;r<o;r++,d++)r in i&&l(h,d,i[r]);else u(d+1),l(h,d++,i);return h.length=d,h}})},86576:function(t,e,r){"use strict";var n=r(68077),o=r(65332),i=r(90476);n({target:"Array",proto:!0},{fill:o}),i("fill")},87438:function(t,e,r){"use strict";var n=r(68077),o=r(78856).filter;n({target:"Array",proto:!0,forced:!r(817)("filter")},{filter:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}})},85472:function(t,e,r){"use strict";var n=r(68077),o=r(78856).find,i=r(90476),a="find",s=!0;a in[]&&Array(1)[a]((function(){s=!1})),n({target:"Array",proto:!0,forced:s},{find:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),i(a)},71791:function(t,e,r){"use strict";var n=r(68077),o=r(63505),i=r(19480),a=r(10228),s=r(97673),c=r(26183);n({target:"Array",proto:!0},{flat:function(){var t=arguments.length?arguments[0]:void 0,e=i(this),r=a(e),n=c(e,0);return n.length=o(n,e,e,r,0,void 0===t?1:s(t)),n}})},32797:function(t,e,r){"use strict";var n=r(68077),o=r(32413);n({target:"Array",stat:!0,forced:!r(54294)((function(t){Array.from(t)}))},{from:o})},40271:function(t,e,r){"use strict";var n=r(68077),o=r(92460).includes,i=r(18431),a=r(90476);n({target:"Array",proto:!0,forced:i((function(){return!Array(1).includes()}))},{includes:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),a("includes")},56308:function(t,e,r){"use strict";var n=r(68077),o=r(74734),i=r(92460).indexOf,a=r(54053),s=o([].indexOf),c=!!s&&1/s([1],1,-0)<0;n({target:"Array",proto:!0,forced:c||!a("indexOf")},{indexOf:function(t){var e=arguments.length>1?arguments[1]:void 0;return c?s(this,t,e)||0:i(this,t,e)}})},51358:function(t,e,r){"use strict";var n=r(17460),o=r(90476),i=r(70381),a=r(12648),s=r(54991).f,c=r(4638),u=r(85501),l=r(95448),f=r(58849),h="Array Iterator",d=a.set,p=a.getterFor(h);t.exports=c(Array,"Array",(function(t,e){d(this,{type:h,target:n(t),index:0,kind:e})}),(function(){var t=p(this),e=t.target,r=t.index++;if(!e||r>=e.length)return t.target=void 0,u(void 0,!0);switch(t.kind){case"keys":return u(r,!1);case"values":return u(e[r],!1)}return u([r,e[r]],!1)}),"values");var v=i.Arguments=i.Array;if(o("keys"),o("values"),o("entries"),!l&&f&&"values"!==v.name)try{s(v,"name",{value:"values"})}catch(y){}},91989:function(t,e,r){"use strict";var n=r(68077),o=r(55418),i=r(70814),a=r(17460),s=r(54053),c=o([].join);n({target:"Array",proto:!0,forced:i!==Object||!s("join",",")},{join:function(t){return c(a(this),void 0===t?",":t)}})},26349:function(t,e,r){"use strict";var n=r(68077),o=r(6057);n({target:"Array",proto:!0,forced:o!==[].lastIndexOf},{lastIndexOf:o})},46349:function(t,e,r){"use strict";var n=r(68077),o=r(78856).map;n({target:"Array",proto:!0,forced:!r(817)("map")},{map:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}})},36513:function(t,e,r){"use strict";var n=r(68077),o=r(19480),i=r(10228),a=r(1991),s=r(54108);n({target:"Array",proto:!0,arity:1,forced:r(18431)((function(){return 4294967297!==[].push.call({length:4294967296},1)}))||!function(){try{Object.defineProperty([],"length",{writable:!1}).push()}catch(t){return t instanceof TypeError}}()},{push:function(t){var e=o(this),r=i(e),n=arguments.length;s(r+n);for(var c=0;c<n;c++)e[r]=arguments[c],r++;return a(e,r),r}})},34997:function(t,e,r){"use strict";var n=r(68077),o=r(42439).left,i=r(54053),a=r(91625);n({target:"Array",proto:!0,forced:!r(13089)&&a>79&&a<83||!i("reduce")},{reduce:function(t){var e=arguments.length;return o(this,t,e,e>1?arguments[1]:void 0)}})},64777:function(t,e,r){"use strict";var n=r(68077),o=r(55418),i=r(35968),a=o([].reverse),s=[1,2];n({target:"Array",proto:!0,forced:String(s)===String(s.reverse())},{reverse:function(){return i(this)&&(this.length=this.length),a(this)}})},17692:function(t,e,r){"use strict";var n=r(68077),o=r(35968),i=r(78142),a=r(38475),s=r(73834),c=r(10228),u=r(17460),l=r(53396),f=r(10282),h=r(817),d=r(88755),p=h("slice"),v=f("species"),y=Array,m=Math.max;n({target:"Array",proto:!0,forced:!p},{slice:function(t,e){var r,n,f,h=u(this),p=c(h),g=s(t,p),b=s(void 0===e?p:e,p);if(o(h)&&(r=h.constructor,(i(r)&&(r===y||o(r.prototype))||a(r)&&null===(r=r[v]))&&(r=void 0),r===y||void 0===r))return d(h,g,b);for(n=new(void 0===r?y:r)(m(b-g,0)),f=0;g<b;g++,f++)g in h&&l(n,f,h[g]);return n.length=f,n}})},41353:function(t,e,r){"use strict";var n=r(68077),o=r(19480),i=r(73834),a=r(97673),s=r(10228),c=r(1991),u=r(54108),l=r(26183),f=r(53396),h=r(35102),d=r(817)("splice"),p=Math.max,v=Math.min;n({target:"Array",proto:!0,forced:!d},{splice:function(t,e){var r,n,d,y,m,g,b=o(this),w=s(b),_=i(t,w),E=arguments.length;for(0===E?r=n=0:1===E?(r=0,n=w-_):(r=E-2,n=v(p(a(e),0),w-_)),u(w+r-n),d=l(b,n),y=0;y<n;y++)(m=_+y)in b&&f(d,y,b[m]);if(d.length=n,r<n){for(y=_;y<w-n;y++)g=y+r,(m=y+n)in b?b[g]=b[m]:h(b,g);for(y=w;y>w-n+r;y--)h(b,y-1)}else if(r>n)for(y=w-n;y>_;y--)g=y+r-1,(m=y+n-1)in b?b[g]=b[m]:h(b,g);for(y=0;y<r;y++)b[y+_]=arguments[y+2];return c(b,w-n+r),d}})},50617:function(t,e,r){"use strict";r(90476)("flat")},80628:function(t,e,r){"use strict";var n=r(68077),o=r(19480),i=r(10228),a=r(1991),s=r(35102),c=r(54108);n({target:"Array",proto:!0,arity:1,forced:1!==[].unshift(0)||!function(){try{Object.defineProperty([],"length",{writable:!1}).unshift()}catch(t){return t instanceof TypeError}}()},{unshift:function(t){var e=o(this),r=i(e),n=arguments.length;if(n){c(r+n);for(var u=r;u--;){var l=u+n;u in e?e[l]=e[u]:s(e,l)}for(var f=0;f<n;f++)e[f]=arguments[f]}return a(e,r+n)}})},95165:function(t,e,r){"use strict";var n=r(55229),o=r(73936),i=r(22653),a=r(10282)("toPrimitive"),s=Date.prototype;n(s,a)||o(s,a,i)},51467:function(t,e,r){"use strict";var n=r(68077),o=r(5813),i=r(35449),a=r(40612),s="WebAssembly",c=o[s],u=7!==new Error("e",{cause:7}).cause,l=function(t,e){var r={};r[t]=a(t,e,u),n({global:!0,constructor:!0,arity:1,forced:u},r)},f=function(t,e){if(c&&c[t]){var r={};r[t]=a(s+"."+t,e,u),n({target:s,stat:!0,constructor:!0,arity:1,forced:u},r)}};l("Error",(function(t){return function(e){return i(t,this,arguments)}})),l("EvalError",(function(t){return function(e){return i(t,this,arguments)}})),l("RangeError",(function(t){return function(e){return i(t,this,arguments)}})),l("ReferenceError",(function(t){return function(e){return i(t,this,arguments)}})),l("SyntaxError",(function(t){return function(e){return i(t,this,arguments)}})),l("TypeError",(function(t){return function(e){return i(t,this,arguments)}})),l("URIError",(function(t){return function(e){return i(t,this,arguments)}})),f("CompileError",(function(t){return function(e){return i(t,this,arguments)}})),f("LinkError",(function(t){return function(e){return i(t,this,arguments)}})),f("RuntimeError",(function(t){return function(e){return i(t,this,arguments)}}))},22859:function(t,e,r){"use strict";var n=r(58849),o=r(83875).EXISTS,i=r(55418),a=r(40030),s=Function.prototype,c=i(s.toString),u=/function\b(?:\s|\/\*[\S\s]*?\*\/|\/\/[^\n\r]*[\n\r]+)*([^\s(/]*)/,l=i(u.exec);n&&!o&&a(s,"name",{configurable:!0,get:function(){try{return l(u,c(this))[1]}catch(t){return""}}})},89802:function(t,e,r){"use strict";var n=r(68077),o=r(5813);n({global:!0,forced:o.globalThis!==o},{globalThis:o})},88770:function(t,e,r){"use strict";var n=r(68077),o=r(29694),i=r(35449),a=r(43173),s=r(55418),c=r(18431),u=r(30553),l=r(12052),f=r(88755),h=r(56454),d=r(63710),p=String,v=o("JSON","stringify"),y=s(/./.exec),m=s("".charAt),g=s("".charCodeAt),b=s("".replace),w=s(1..toString),_=/[\uD800-\uDFFF]/g,E=/^[\uD800-\uDBFF]$/,x=/^[\uDC00-\uDFFF]$/,S=!d||c((function(){var t=o("Symbol")("stringify detection");return"[null]"!==v([t])||"{}"!==v({a:t})||"{}"!==v(Object(t))})),k=c((function(){return'"\\udf06\\ud834"'!==v("\udf06\ud834")||'"\\udead"'!==v("\udead")})),A=function(t,e){var r=f(arguments),n=h(e);if(u(n)||void 0!==t&&!l(t))return r[1]=function(t,e){if(u(n)&&(e=a(n,this,p(t),e)),!l(e))return e},i(v,null,r)},P=function(t,e,r){var n=m(r,e-1),o=m(r,e+1);return y(E,t)&&!y(x,o)||y(x,t)&&!y(E,n)?"\\u"+w(g(t,0),16):t};v&&n({target:"JSON",stat:!0,arity:3,forced:S||k},{stringify:function(t,e,r){var n=f(arguments),o=i(S?A:v,null,n);return k&&"string"==typeof o?b(o,_,P):o}})},38644:function(t,e,r){"use strict";var n=r(5813);r(48357)(n.JSON,"JSON",!0)},65101:function(t,e,r){"use strict";r(88820)("Map",(function(t){return function(){return t(this,arguments.length?arguments[0]:void 0)}}),r(52961))},96043:function(t,e,r){"use strict";r(65101)},53737:function(t,e,r){"use strict";r(48357)(Math,"Math",!0)},76843:function(t,e,r){"use strict";var n=r(68077),o=r(95448),i=r(58849),a=r(5813),s=r(50649),c=r(55418),u=r(27992),l=r(55229),f=r(81760),h=r(95882),d=r(12052),p=r(80581),v=r(18431),y=r(45919).f,m=r(25245).f,g=r(54991).f,b=r(29191),w=r(55370).trim,_="Number",E=a[_],x=s[_],S=E.prototype,k=a.TypeError,A=c("".slice),P=c("".charCodeAt),O=function(t){var e,r,n,o,i,a,s,c,u=p(t,"number");if(d(u))throw new k("Cannot convert a Symbol value to a number");if("string"==typeof u&&u.length>2)if(u=w(u),43===(e=P(u,0))||45===e){if(88===(r=P(u,2))||120===r)return NaN}else if(48===e){switch(P(u,1)){case 66:case 98:n=2,o=49;break;case 79:case 111:n=8,o=55;break;default:return+u}for(a=(i=A(u,2)).length,s=0;s<a;s++)if((c=P(i,s))<48||c>o)return NaN;return parseInt(i,n)}return+u},T=u(_,!E(" 0o1")||!E("0b1")||E("+0x1")),R=function(t){var e,r=arguments.length<1?0:E(function(t){var e=p(t,"number");return"bigint"==typeof e?e:O(e)}(t));return h(S,e=this)&&v((function(){b(e)}))?f(Object(r),this,R):r};R.prototype=S,T&&!o&&(S.constructor=R),n({global:!0,constructor:!0,wrap:!0,forced:T},{Number:R});var C=function(t,e){for(var r,n=i?y(e):"MAX_VALUE,MIN_VALUE,NaN,NEGATIVE_INFINITY,POSITIVE_INFINITY,EPSILON,MAX_SAFE_INTEGER,MIN_SAFE_INTEGER,isFinite,isInteger,isNaN,isSafeInteger,parseFloat,parseInt,fromString,range".split(","),o=0;n.length>o;o++)l(e,r=n[o])&&!l(t,r)&&g(t,r,m(e,r))};o&&x&&C(s[_],x),(T||o)&&C(s[_],E)},34281:function(t,e,r){"use strict";r(68077)({target:"Number",stat:!0,nonConfigurable:!0,nonWritable:!0},{EPSILON:Math.pow(2,-52)})},32550:function(t,e,r){"use strict";r(68077)({target:"Number",stat:!0},{isNaN:function(t){return t!=t}})},60309:function(t,e,r){"use strict";var n=r(68077),o=r(3873),i=Math.abs;n({target:"Number",stat:!0},{isSafeInteger:function(t){return o(t)&&i(t)<=9007199254740991}})},85717:function(t,e,r){"use strict";var n=r(68077),o=r(54914);n({target:"Object",stat:!0,arity:2,forced:Object.assign!==o},{assign:o})},82073:function(t,e,r){"use strict";var n=r(68077),o=r(94969).entries;n({target:"Object",stat:!0},{entries:function(t){return o(t)}})},10599:function(t,e,r){"use strict";var n=r(68077),o=r(91452),i=r(18431),a=r(38475),s=r(70276).onFreeze,c=Object.freeze;n({target:"Object",stat:!0,forced:i((function(){c(1)})),sham:!o},{freeze:function(t){return c&&a(t)?c(s(t)):t}})},90465:function(t,e,r){"use strict";var n=r(68077),o=r(72208),i=r(53396);n({target:"Object",stat:!0},{fromEntries:function(t){var e={};return o(t,(function(t,r){i(e,t,r)}),{AS_ENTRIES:!0}),e}})},40720:function(t,e,r){"use strict";var n=r(68077),o=r(18431),i=r(17460),a=r(25245).f,s=r(58849);n({target:"Object",stat:!0,forced:!s||o((function(){a(1)})),sham:!s},{getOwnPropertyDescriptor:function(t,e){return a(i(t),e)}})},30419:function(t,e,r){"use strict";var n=r(68077),o=r(18431),i=r(16102).f;n({target:"Object",stat:!0,forced:o((function(){return!Object.getOwnPropertyNames(1)}))},{getOwnPropertyNames:i})},28082:function(t,e,r){"use strict";var n=r(68077),o=r(63710),i=r(18431),a=r(18503),s=r(19480);n({target:"Object",stat:!0,forced:!o||i((function(){a.f(1)}))},{getOwnPropertySymbols:function(t){var e=a.f;return e?e(s(t)):[]}})},30535:function(t,e,r){"use strict";var n=r(68077),o=r(18431),i=r(19480),a=r(2563),s=r(51577);n({target:"Object",stat:!0,forced:o((function(){a(1)})),sham:!s},{getPrototypeOf:function(t){return a(i(t))}})},65974:function(t,e,r){"use strict";var n=r(68077),o=r(19480),i=r(93121);n({target:"Object",stat:!0,forced:r(18431)((function(){i(1)}))},{keys:function(t){return i(o(t))}})},46798:function(t,e,r){"use strict";var n=r(9574),o=r(73936),i=r(81798);n||o(Object.prototype,"toString",i,{unsafe:!0})},10733:function(t,e,r){"use strict";var n=r(68077),o=r(94969).values;n({target:"Object",stat:!0},{values:function(t){return o(t)}})},67712:function(t,e,r){"use strict";var n=r(68077),o=r(60957);n({global:!0,forced:parseFloat!==o},{parseFloat:o})},27392:function(t,e,r){"use strict";var n=r(68077),o=r(79058);n({global:!0,forced:parseInt!==o},{parseInt:o})},75179:function(t,e,r){"use strict";var n=r(68077),o=r(43173),i=r(9160),a=r(1731),s=r(70754),c=r(72208);n({target:"Promise",stat:!0,forced:r(30222)},{all:function(t){var e=this,r=a.f(e),n=r.resolve,u=r.reject,l=s((function(){var r=i(e.resolve),a=[],s=0,l=1;c(t,(function(t){var i=s++,c=!1;l++,o(r,e,t).then((function(t){c||(c=!0,a[i]=t,--l||n(a))}),u)})),--l||n(a)}));return l.error&&u(l.value),r.promise}})},26900:function(t,e,r){"use strict";var n=r(68077),o=r(95448),i=r(15624).CONSTRUCTOR,a=r(44565),s=r(29694),c=r(30553),u=r(73936),l=a&&a.prototype;if(n({target:"Promise",proto:!0,forced:i,real:!0},{catch:function(t){return this.then(void 0,t)}}),!o&&c(a)){var f=s("Promise").prototype.catch;l.catch!==f&&u(l,"catch",f,{unsafe:!0})}},77280:function(t,e,r){"use strict";var n,o,i,a=r(68077),s=r(95448),c=r(13089),u=r(5813),l=r(43173),f=r(73936),h=r(27248),d=r(48357),p=r(36929),v=r(9160),y=r(30553),m=r(38475),g=r(85539),b=r(51048),w=r(20295).set,_=r(33099),E=r(15089),x=r(70754),S=r(29639),k=r(12648),A=r(44565),P=r(15624),O=r(1731),T="Promise",R=P.CONSTRUCTOR,C=P.REJECTION_EVENT,H=P.SUBCLASSING,I=k.getterFor(T),L=k.set,N=A&&A.prototype,B=A,M=N,j=u.TypeError,$=u.document,Z=u.process,U=O.f,D=U,F=!!($&&$.createEvent&&u.dispatchEvent),z="unhandledrejection",G=function(t){var e;return!(!m(t)||!y(e=t.then))&&e},V=function(t,e){var r,n,o,i=e.value,a=1===e.state,s=a?t.ok:t.fail,c=t.resolve,u=t.reject,f=t.domain;try{s?(a||(2===e.rejection&&X(e),e.rejection=1),!0===s?r=i:(f&&f.enter(),r=s(i),f&&(f.exit(),o=!0)),r===t.promise?u(new j("Promise-chain cycle")):(n=G(r))?l(n,r,c,u):c(r)):u(i)}catch(h){f&&!o&&f.exit(),u(h)}},W=function(t,e){t.notified||(t.notified=!0,_((function(){for(var r,n=t.reactions;r=n.get();)V(r,t);t.notified=!1,e&&!t.rejection&&K(t)})))},q=function(t,e,r){var n,o;F?((n=$.createEvent("Event")).promise=e,n.reason=r,n.initEvent(t,!1,!0),u.dispatchEvent(n)):n={promise:e,reason:r},!C&&(o=u["on"+t])?o(n):t===z&&E("Unhandled promise rejection",r)},K=function(t){l(w,u,(function(){var e,r=t.facade,n=t.value;if(Y(t)&&(e=x((function(){c?Z.emit("unhandledRejection",n,r):q(z,r,n)})),t.rejection=c||Y(t)?2:1,e.error))throw e.value}))},Y=function(t){return 1!==t.rejection&&!t.parent},X=function(t){l(w,u,(function(){var e=t.facade;c?Z.emit("rejectionHandled",e):q("rejectionhandled",e,t.value)}))},J=function(t,e,r){return function(n){t(e,n,r)}},Q=function(t,e,r){t.done||(t.done=!0,r&&(t=r),t.value=e,t.state=2,W(t,!0))},tt=function(t,e,r){if(!t.done){t.done=!0,r&&(t=r);try{if(t.facade===e)throw new j("Promise can't be resolved itself");var n=G(e);n?_((function(){var r={done:!1};try{l(n,e,J(tt,r,t),J(Q,r,t))}catch(o){Q(r,o,t)}})):(t.value=e,t.state=1,W(t,!1))}catch(o){Q({done:!1},o,t)}}};if(R&&(M=(B=function(t){g(this,M),v(t),l(n,this);var e=I(this);try{t(J(tt,e),J(Q,e))}catch(r){Q(e,r)}}).prototype,(n=function(t){L(this,{type:T,done:!1,notified:!1,parent:!1,reactions:new S,rejection:!1,state:0,value:void 0})}).prototype=f(M,"then",(function(t,e){var r=I(this),n=U(b(this,B));return r.parent=!0,n.ok=!y(t)||t,n.fail=y(e)&&e,n.domain=c?Z.domain:void 0,0===r.state?r.reactions.add(n):_((function(){V(n,r)})),n.promise})),o=function(){var t=new n,e=I(t);this.promise=t,this.resolve=J(tt,e),this.reject=J(Q,e)},O.f=U=function(t){return t===B||undefined===t?new o(t):D(t)},!s&&y(A)&&N!==Object.prototype)){i=N.then,H||f(N,"then",(function(t,e){var r=this;return new B((function(t,e){l(i,r,t,e)})).then(t,e)}),{unsafe:!0});try{delete N.constructor}catch(et){}h&&h(N,M)}a({global:!0,constructor:!0,wrap:!0,forced:R},{Promise:B}),d(B,T,!1,!0),p(T)},47084:function(t,e,r){"use strict";r(77280),r(75179),r(26900),r(34248),r(51941),r(80833)},34248:function(t,e,r){"use strict";var n=r(68077),o=r(43173),i=r(9160),a=r(1731),s=r(70754),c=r(72208);n({target:"Promise",stat:!0,forced:r(30222)},{race:function(t){var e=this,r=a.f(e),n=r.reject,u=s((function(){var a=i(e.resolve);c(t,(function(t){o(a,e,t).then(r.resolve,n)}))}));return u.error&&n(u.value),r.promise}})},51941:function(t,e,r){"use strict";var n=r(68077),o=r(1731);n({target:"Promise",stat:!0,forced:r(15624).CONSTRUCTOR},{reject:function(t){var e=o.f(this);return(0,e.reject)(t),e.promise}})},80833:function(t,e,r){"use strict";var n=r(68077),o=r(29694),i=r(95448),a=r(44565),s=r(15624).CONSTRUCTOR,c=r(13847),u=o("Promise"),l=i&&!s;n({target:"Promise",stat:!0,forced:i||s},{resolve:function(t){return c(l&&this===u?a:this,t)}})},36251:function(t,e,r){"use strict";var n=r(68077),o=r(29694),i=r(35449),a=r(1319),s=r(50683),c=r(22933),u=r(38475),l=r(9885),f=r(18431),h=o("Reflect","construct"),d=Object.prototype,p=[].push,v=f((function(){function t(){}return!(h((function(){}),[],t)instanceof t)})),y=!f((function(){h((function(){}))})),m=v||y;n({target:"Reflect",stat:!0,forced:m,sham:m},{construct:function(t,e){s(t),c(e);var r=arguments.length<3?t:s(arguments[2]);if(y&&!v)return h(t,e,r);if(t===r){switch(e.length){case 0:return new t;case 1:return new t(e[0]);case 2:return new t(e[0],e[1]);case 3:return new t(e[0],e[1],e[2]);case 4:return new t(e[0],e[1],e[2],e[3])}var n=[null];return i(p,n,e),new(i(a,t,n))}var o=r.prototype,f=l(u(o)?o:d),m=i(t,f,e);return u(m)?m:f}})},10713:function(t,e,r){"use strict";var n=r(68077),o=r(43173),i=r(38475),a=r(22933),s=r(89688),c=r(25245),u=r(2563);n({target:"Reflect",stat:!0},{get:function t(e,r){var n,l,f=arguments.length<3?e:arguments[2];return a(e)===f?e[r]:(n=c.f(e,r))?s(n)?n.value:void 0===n.get?void 0:o(n.get,f):i(l=u(e))?t(l,r,f):void 0}})},48226:function(t,e,r){"use strict";var n=r(68077),o=r(5813),i=r(48357);n({global:!0},{Reflect:{}}),i(o.Reflect,"Reflect",!0)},10999:function(t,e,r){"use strict";var n=r(58849),o=r(5813),i=r(55418),a=r(27992),s=r(81760),c=r(52838),u=r(9885),l=r(45919).f,f=r(95882),h=r(90744),d=r(11336),p=r(78287),v=r(9773),y=r(4109),m=r(73936),g=r(18431),b=r(55229),w=r(12648).enforce,_=r(36929),E=r(10282),x=r(66509),S=r(70852),k=E("match"),A=o.RegExp,P=A.prototype,O=o.SyntaxError,T=i(P.exec),R=i("".charAt),C=i("".replace),H=i("".indexOf),I=i("".slice),L=/^\?<[^\s\d!#%&*+<=>@^][^\s!#%&*+<=>@^]*>/,N=/a/g,B=/a/g,M=new A(N)!==N,j=v.MISSED_STICKY,$=v.UNSUPPORTED_Y,Z=n&&(!M||j||x||S||g((function(){return B[k]=!1,A(N)!==N||A(B)===B||"/a/i"!==String(A(N,"i"))})));if(a("RegExp",Z)){for(var U=function(t,e){var r,n,o,i,a,l,v=f(P,this),y=h(t),m=void 0===e,g=[],_=t;if(!v&&y&&m&&t.constructor===U)return t;if((y||f(P,t))&&(t=t.source,m&&(e=p(_))),t=void 0===t?"":d(t),e=void 0===e?"":d(e),_=t,x&&"dotAll"in N&&(n=!!e&&H(e,"s")>-1)&&(e=C(e,/s/g,"")),r=e,j&&"sticky"in N&&(o=!!e&&H(e,"y")>-1)&&$&&(e=C(e,/y/g,"")),S&&(i=function(t){for(var e,r=t.length,n=0,o="",i=[],a=u(null),s=!1,c=!1,l=0,f="";n<=r;n++){if("\\"===(e=R(t,n)))e+=R(t,++n);else if("]"===e)s=!1;else if(!s)switch(!0){case"["===e:s=!0;break;case"("===e:T(L,I(t,n+1))&&(n+=2,c=!0),o+=e,l++;continue;case">"===e&&c:if(""===f||b(a,f))throw new O("Invalid capture group name");a[f]=!0,i[i.length]=[f,l],c=!1,f="";continue}c?f+=e:o+=e}return[o,i]}(t),t=i[0],g=i[1]),a=s(A(t,e),v?this:P,U),(n||o||g.length)&&(l=w(a),n&&(l.dotAll=!0,l.raw=U(function(t){for(var e,r=t.length,n=0,o="",i=!1;n<=r;n++)"\\"!==(e=R(t,n))?i||"."!==e?("["===e?i=!0:"]"===e&&(i=!1),o+=e):o+="[\\s\\S]":o+=e+R(t,++n);return o}(t),r)),o&&(l.sticky=!0),g.length&&(l.groups=g)),t!==_)try{c(a,"source",""===_?"(?:)":_)}catch(E){}return a},D=l(A),F=0;D.length>F;)y(U,A,D[F++]);P.constructor=U,U.prototype=P,m(o,"RegExp",U,{constructor:!0})}_("RegExp")},52117:function(t,e,r){"use strict";var n=r(58849),o=r(66509),i=r(42458),a=r(40030),s=r(12648).get,c=RegExp.prototype,u=TypeError;n&&o&&a(c,"dotAll",{configurable:!0,get:function(){if(this!==c){if("RegExp"===i(this))return!!s(this).dotAll;throw new u("Incompatible receiver, RegExp required")}}})},63789:function(t,e,r){"use strict";var n=r(68077),o=r(45648);n({target:"RegExp",proto:!0,forced:/./.exec!==o},{exec:o})},82479:function(t,e,r){"use strict";var n=r(58849),o=r(9773).MISSED_STICKY,i=r(42458),a=r(40030),s=r(12648).get,c=RegExp.prototype,u=TypeError;n&&o&&a(c,"sticky",{configurable:!0,get:function(){if(this!==c){if("RegExp"===i(this))return!!s(this).sticky;throw new u("Incompatible receiver, RegExp required")}}})},99397:function(t,e,r){"use strict";r(63789);var n,o,i=r(68077),a=r(43173),s=r(30553),c=r(22933),u=r(11336),l=(n=!1,(o=/[ac]/).exec=function(){return n=!0,/./.exec.apply(this,arguments)},!0===o.test("abc")&&n),f=/./.test;i({target:"RegExp",proto:!0,forced:!l},{test:function(t){var e=c(this),r=u(t),n=e.exec;if(!s(n))return a(f,e,r);var o=a(n,e,r);return null!==o&&(c(o),!0)}})},94570:function(t,e,r){"use strict";var n=r(83875).PROPER,o=r(73936),i=r(22933),a=r(11336),s=r(18431),c=r(78287),u="toString",l=RegExp.prototype,f=l[u],h=s((function(){return"/a/b"!==f.call({source:"a",flags:"b"})})),d=n&&f.name!==u;(h||d)&&o(l,u,(function(){var t=i(this);return"/"+a(t.source)+"/"+a(c(t))}),{unsafe:!0})},36442:function(t,e,r){"use strict";r(88820)("Set",(function(t){return function(){return t(this,arguments.length?arguments[0]:void 0)}}),r(52961))},78399:function(t,e,r){"use strict";r(36442)},80641:function(t,e,r){"use strict";var n=r(68077),o=r(14265);n({target:"String",proto:!0,forced:r(24089)("anchor")},{anchor:function(t){return o(this,"a","name",t)}})},4600:function(t,e,r){"use strict";var n=r(68077),o=r(47512).codeAt;n({target:"String",proto:!0},{codePointAt:function(t){return o(this,t)}})},2094:function(t,e,r){"use strict";var n,o=r(68077),i=r(74734),a=r(25245).f,s=r(97142),c=r(11336),u=r(52205),l=r(43313),f=r(76870),h=r(95448),d=i("".slice),p=Math.min,v=f("endsWith");o({target:"String",proto:!0,forced:!!(h||v||(n=a(String.prototype,"endsWith"),!n||n.writable))&&!v},{endsWith:function(t){var e=c(l(this));u(t);var r=arguments.length>1?arguments[1]:void 0,n=e.length,o=void 0===r?n:p(s(r),n),i=c(t);return d(e,o-i.length,o)===i}})},40924:function(t,e,r){"use strict";var n=r(68077),o=r(55418),i=r(73834),a=RangeError,s=String.fromCharCode,c=String.fromCodePoint,u=o([].join);n({target:"String",stat:!0,arity:1,forced:!!c&&1!==c.length},{fromCodePoint:function(t){for(var e,r=[],n=arguments.length,o=0;n>o;){if(e=+arguments[o++],i(e,1114111)!==e)throw new a(e+" is not a valid code point");r[o]=e<65536?s(e):s(55296+((e-=65536)>>10),e%1024+56320)}return u(r,"")}})},60163:function(t,e,r){"use strict";var n=r(68077),o=r(55418),i=r(52205),a=r(43313),s=r(11336),c=r(76870),u=o("".indexOf);n({target:"String",proto:!0,forced:!c("includes")},{includes:function(t){return!!~u(s(a(this)),s(i(t)),arguments.length>1?arguments[1]:void 0)}})},5239:function(t,e,r){"use strict";var n=r(47512).charAt,o=r(11336),i=r(12648),a=r(4638),s=r(85501),c="String Iterator",u=i.set,l=i.getterFor(c);a(String,"String",(function(t){u(this,{type:c,string:o(t),index:0})}),(function(){var t,e=l(this),r=e.string,o=e.index;return o>=r.length?s(void 0,!0):(t=n(r,o),e.index+=t.length,s(t,!1))}))},24074:function(t,e,r){"use strict";var n=r(35449),o=r(43173),i=r(55418),a=r(37374),s=r(18431),c=r(22933),u=r(30553),l=r(59317),f=r(97673),h=r(97142),d=r(11336),p=r(43313),v=r(18513),y=r(54339),m=r(17107),g=r(94448),b=r(10282)("replace"),w=Math.max,_=Math.min,E=i([].concat),x=i([].push),S=i("".indexOf),k=i("".slice),A="$0"==="a".replace(/./,"$0"),P=!!/./[b]&&""===/./[b]("a","$0");a("replace",(function(t,e,r){var i=P?"$":"$0";return[function(t,r){var n=p(this),i=l(t)?void 0:y(t,b);return i?o(i,t,n,r):o(e,d(n),t,r)},function(t,o){var a=c(this),s=d(t);if("string"==typeof o&&-1===S(o,i)&&-1===S(o,"$<")){var l=r(e,a,s,o);if(l.done)return l.value}var p=u(o);p||(o=d(o));var y,b=a.global;b&&(y=a.unicode,a.lastIndex=0);for(var A,P=[];null!==(A=g(a,s))&&(x(P,A),b);){""===d(A[0])&&(a.lastIndex=v(s,h(a.lastIndex),y))}for(var O,T="",R=0,C=0;C<P.length;C++){for(var H,I=d((A=P[C])[0]),L=w(_(f(A.index),s.length),0),N=[],B=1;B<A.length;B++)x(N,void 0===(O=A[B])?O:String(O));var M=A.groups;if(p){var j=E([I],N,L,s);void 0!==M&&x(j,M),H=d(n(o,void 0,j))}else H=m(I,s,L,N,M,o);L>=R&&(T+=k(s,R,L)+H,R=L+I.length)}return T+k(s,R)}]}),!!s((function(){var t=/./;return t.exec=function(){var t=[];return t.groups={a:"7"},t},"7"!=="".replace(t,"$<a>")}))||!A||P)},35221:function(t,e,r){"use strict";var n=r(43173),o=r(37374),i=r(22933),a=r(59317),s=r(43313),c=r(93577),u=r(11336),l=r(54339),f=r(94448);o("search",(function(t,e,r){return[function(e){var r=s(this),o=a(e)?void 0:l(e,t);return o?n(o,e,r):new RegExp(e)[t](u(r))},function(t){var n=i(this),o=u(t),a=r(e,n,o);if(a.done)return a.value;var s=n.lastIndex;c(s,0)||(n.lastIndex=0);var l=f(n,o);return c(n.lastIndex,s)||(n.lastIndex=s),null===l?-1:l.index}]}))},57778:function(t,e,r){"use strict";var n=r(35449),o=r(43173),i=r(55418),a=r(37374),s=r(22933),c=r(59317),u=r(90744),l=r(43313),f=r(51048),h=r(18513),d=r(97142),p=r(11336),v=r(54339),y=r(88755),m=r(94448),g=r(45648),b=r(9773),w=r(18431),_=b.UNSUPPORTED_Y,E=4294967295,x=Math.min,S=[].push,k=i(/./.exec),A=i(S),P=i("".slice),O=!w((function(){var t=/(?:)/,e=t.exec;t.exec=function(){return e.apply(this,arguments)};var r="ab".split(t);return 2!==r.length||"a"!==r[0]||"b"!==r[1]}));a("split",(function(t,e,r){var i;return i="c"==="abbc".split(/(b)*/)[1]||4!=="test".split(/(?:)/,-1).length||2!=="ab".split(/(?:ab)*/).length||4!==".".split(/(.?)(.?)/).length||".".split(/()()/).length>1||"".split(/.?/).length?function(t,r){var i=p(l(this)),a=void 0===r?E:r>>>0;if(0===a)return[];if(void 0===t)return[i];if(!u(t))return o(e,i,t,a);for(var s,c,f,h=[],d=(t.ignoreCase?"i":"")+(t.multiline?"m":"")+(t.unicode?"u":"")+(t.sticky?"y":""),v=0,m=new RegExp(t.source,d+"g");(s=o(g,m,i))&&!((c=m.lastIndex)>v&&(A(h,P(i,v,s.index)),s.length>1&&s.index<i.length&&n(S,h,y(s,1)),f=s[0].length,v=c,h.length>=a));)m.lastIndex===s.index&&m.lastIndex++;return v===i.length?!f&&k(m,"")||A(h,""):A(h,P(i,v)),h.length>a?y(h,0,a):h}:"0".split(void 0,0).length?function(t,r){return void 0===t&&0===r?[]:o(e,this,t,r)}:e,[function(e,r){var n=l(this),a=c(e)?void 0:v(e,t);return a?o(a,e,n,r):o(i,p(n),e,r)},function(t,n){var o=s(this),a=p(t),c=r(i,o,a,n,i!==e);if(c.done)return c.value;var u=f(o,RegExp),l=o.unicode,v=(o.ignoreCase?"i":"")+(o.multiline?"m":"")+(o.unicode?"u":"")+(_?"g":"y"),y=new u(_?"^(?:"+o.source+")":o,v),g=void 0===n?E:n>>>0;if(0===g)return[];if(0===a.length)return null===m(y,a)?[a]:[];for(var b=0,w=0,S=[];w<a.length;){y.lastIndex=_?0:w;var k,O=m(y,_?P(a,w):a);if(null===O||(k=x(d(y.lastIndex+(_?w:0)),a.length))===b)w=h(a,w,l);else{if(A(S,P(a,b,w)),S.length===g)return S;for(var T=1;T<=O.length-1;T++)if(A(S,O[T]),S.length===g)return S;w=b=k}}return A(S,P(a,b)),S}]}),!O,_)},88640:function(t,e,r){"use strict";var n,o=r(68077),i=r(74734),a=r(25245).f,s=r(97142),c=r(11336),u=r(52205),l=r(43313),f=r(76870),h=r(95448),d=i("".slice),p=Math.min,v=f("startsWith");o({target:"String",proto:!0,forced:!!(h||v||(n=a(String.prototype,"startsWith"),!n||n.writable))&&!v},{startsWith:function(t){var e=c(l(this));u(t);var r=s(p(arguments.length>1?arguments[1]:void 0,e.length)),n=c(t);return d(e,r,r+n.length)===n}})},62544:function(t,e,r){"use strict";r(61953);var n=r(68077),o=r(30556);n({target:"String",proto:!0,name:"trimEnd",forced:"".trimEnd!==o},{trimEnd:o})},6087:function(t,e,r){"use strict";var n=r(68077),o=r(96868);n({target:"String",proto:!0,name:"trimStart",forced:"".trimLeft!==o},{trimLeft:o})},61953:function(t,e,r){"use strict";var n=r(68077),o=r(30556);n({target:"String",proto:!0,name:"trimEnd",forced:"".trimRight!==o},{trimRight:o})},10187:function(t,e,r){"use strict";r(6087);var n=r(68077),o=r(96868);n({target:"String",proto:!0,name:"trimStart",forced:"".trimStart!==o},{trimStart:o})},53918:function(t,e,r){"use strict";r(80879)("asyncIterator")},81770:function(t,e,r){"use strict";var n=r(68077),o=r(5813),i=r(43173),a=r(55418),s=r(95448),c=r(58849),u=r(63710),l=r(18431),f=r(55229),h=r(95882),d=r(22933),p=r(17460),v=r(84297),y=r(11336),m=r(51012),g=r(9885),b=r(93121),w=r(45919),_=r(16102),E=r(18503),x=r(25245),S=r(54991),k=r(44760),A=r(60771),P=r(73936),O=r(40030),T=r(82765),R=r(95292),C=r(46170),H=r(92311),I=r(10282),L=r(97665),N=r(80879),B=r(17497),M=r(48357),j=r(12648),$=r(78856).forEach,Z=R("hidden"),U="Symbol",D="prototype",F=j.set,z=j.getterFor(U),G=Object[D],V=o.Symbol,W=V&&V[D],q=o.RangeError,K=o.TypeError,Y=o.QObject,X=x.f,J=S.f,Q=_.f,tt=A.f,et=a([].push),rt=T("symbols"),nt=T("op-symbols"),ot=T("wks"),it=!Y||!Y[D]||!Y[D].findChild,at=function(t,e,r){var n=X(G,e);n&&delete G[e],J(t,e,r),n&&t!==G&&J(G,e,n)},st=c&&l((function(){return 7!==g(J({},"a",{get:function(){return J(this,"a",{value:7}).a}})).a}))?at:J,ct=function(t,e){var r=rt[t]=g(W);return F(r,{type:U,tag:t,description:e}),c||(r.description=e),r},ut=function(t,e,r){t===G&&ut(nt,e,r),d(t);var n=v(e);return d(r),f(rt,n)?(r.enumerable?(f(t,Z)&&t[Z][n]&&(t[Z][n]=!1),r=g(r,{enumerable:m(0,!1)})):(f(t,Z)||J(t,Z,m(1,g(null))),t[Z][n]=!0),st(t,n,r)):J(t,n,r)},lt=function(t,e){d(t);var r=p(e),n=b(r).concat(pt(r));return $(n,(function(e){c&&!i(ft,r,e)||ut(t,e,r[e])})),t},ft=function(t){var e=v(t),r=i(tt,this,e);return!(this===G&&f(rt,e)&&!f(nt,e))&&(!(r||!f(this,e)||!f(rt,e)||f(this,Z)&&this[Z][e])||r)},ht=function(t,e){var r=p(t),n=v(e);if(r!==G||!f(rt,n)||f(nt,n)){var o=X(r,n);return!o||!f(rt,n)||f(r,Z)&&r[Z][n]||(o.enumerable=!0),o}},dt=function(t){var e=Q(p(t)),r=[];return $(e,(function(t){f(rt,t)||f(C,t)||et(r,t)})),r},pt=function(t){var e=t===G,r=Q(e?nt:p(t)),n=[];return $(r,(function(t){!f(rt,t)||e&&!f(G,t)||et(n,rt[t])})),n};u||(V=function(){if(h(W,this))throw new K("Symbol is not a constructor");var t=arguments.length&&void 0!==arguments[0]?y(arguments[0]):void 0,e=H(t),r=function(t){var n=void 0===this?o:this;n===G&&i(r,nt,t),f(n,Z)&&f(n[Z],e)&&(n[Z][e]=!1);var a=m(1,t);try{st(n,e,a)}catch(s){if(!(s instanceof q))throw s;at(n,e,a)}};return c&&it&&st(G,e,{configurable:!0,set:r}),ct(e,t)},P(W=V[D],"toString",(function(){return z(this).tag})),P(V,"withoutSetter",(function(t){return ct(H(t),t)})),A.f=ft,S.f=ut,k.f=lt,x.f=ht,w.f=_.f=dt,E.f=pt,L.f=function(t){return ct(I(t),t)},c&&(O(W,"description",{configurable:!0,get:function(){return z(this).description}}),s||P(G,"propertyIsEnumerable",ft,{unsafe:!0}))),n({global:!0,constructor:!0,wrap:!0,forced:!u,sham:!u},{Symbol:V}),$(b(ot),(function(t){N(t)})),n({target:U,stat:!0,forced:!u},{useSetter:function(){it=!0},useSimple:function(){it=!1}}),n({target:"Object",stat:!0,forced:!u,sham:!c},{create:function(t,e){return void 0===e?g(t):lt(g(t),e)},defineProperty:ut,defineProperties:lt,getOwnPropertyDescriptor:ht}),n({target:"Object",stat:!0,forced:!u},{getOwnPropertyNames:dt}),B(),M(V,U),C[Z]=!0},98214:function(t,e,r){"use strict";var n=r(68077),o=r(58849),i=r(5813),a=r(55418),s=r(55229),c=r(30553),u=r(95882),l=r(11336),f=r(40030),h=r(93213),d=i.Symbol,p=d&&d.prototype;if(o&&c(d)&&(!("description"in p)||void 0!==d().description)){var v={},y=function(){var t=arguments.length<1||void 0===arguments[0]?void 0:l(arguments[0]),e=u(p,this)?new d(t):void 0===t?d():d(t);return""===t&&(v[e]=!0),e};h(y,d),y.prototype=p,p.constructor=y;var m="Symbol(description detection)"===String(d("description detection")),g=a(p.valueOf),b=a(p.toString),w=/^Symbol\((.*)\)[^)]+$/,_=a("".replace),E=a("".slice);f(p,"description",{configurable:!0,get:function(){var t=g(this);if(s(v,t))return"";var e=b(t),r=m?E(e,7,-1):_(e,w,"$1");return""===r?void 0:r}}),n({global:!0,constructor:!0,forced:!0},{Symbol:y})}},19273:function(t,e,r){"use strict";var n=r(68077),o=r(29694),i=r(55229),a=r(11336),s=r(82765),c=r(94824),u=s("string-to-symbol-registry"),l=s("symbol-to-string-registry");n({target:"Symbol",stat:!0,forced:!c},{for:function(t){var e=a(t);if(i(u,e))return u[e];var r=o("Symbol")(e);return u[e]=r,l[r]=e,r}})},20254:function(t,e,r){"use strict";r(80879)("iterator")},94738:function(t,e,r){"use strict";r(81770),r(19273),r(9696),r(88770),r(28082)},9696:function(t,e,r){"use strict";var n=r(68077),o=r(55229),i=r(12052),a=r(71414),s=r(82765),c=r(94824),u=s("symbol-to-string-registry");n({target:"Symbol",stat:!0,forced:!c},{keyFor:function(t){if(!i(t))throw new TypeError(a(t)+" is not a symbol");if(o(u,t))return u[t]}})},40262:function(t,e,r){"use strict";var n=r(80879),o=r(17497);n("toPrimitive"),o()},94418:function(t,e,r){"use strict";var n=r(29694),o=r(80879),i=r(48357);o("toStringTag"),i(n("Symbol"),"Symbol")},86673:function(t,e,r){"use strict";var n,o=r(91452),i=r(5813),a=r(55418),s=r(40855),c=r(70276),u=r(88820),l=r(6946),f=r(38475),h=r(12648).enforce,d=r(18431),p=r(83777),v=Object,y=Array.isArray,m=v.isExtensible,g=v.isFrozen,b=v.isSealed,w=v.freeze,_=v.seal,E=!i.ActiveXObject&&"ActiveXObject"in i,x=function(t){return function(){return t(this,arguments.length?arguments[0]:void 0)}},S=u("WeakMap",x,l),k=S.prototype,A=a(k.set);if(p)if(E){n=l.getConstructor(x,"WeakMap",!0),c.enable();var P=a(k.delete),O=a(k.has),T=a(k.get);s(k,{delete:function(t){if(f(t)&&!m(t)){var e=h(this);return e.frozen||(e.frozen=new n),P(this,t)||e.frozen.delete(t)}return P(this,t)},has:function(t){if(f(t)&&!m(t)){var e=h(this);return e.frozen||(e.frozen=new n),O(this,t)||e.frozen.has(t)}return O(this,t)},get:function(t){if(f(t)&&!m(t)){var e=h(this);return e.frozen||(e.frozen=new n),O(this,t)?T(this,t):e.frozen.get(t)}return T(this,t)},set:function(t,e){if(f(t)&&!m(t)){var r=h(this);r.frozen||(r.frozen=new n),O(this,t)?A(this,t,e):r.frozen.set(t,e)}else A(this,t,e);return this}})}else o&&d((function(){var t=w([]);return A(new S,t,1),!g(t)}))&&s(k,{set:function(t,e){var r;return y(t)&&(g(t)?r=w:b(t)&&(r=_)),A(this,t,e),r&&r(t),this}})},39685:function(t,e,r){"use strict";r(86673)},9849:function(t,e,r){"use strict";var n=r(68077),o=r(5813),i=r(85539),a=r(22933),s=r(30553),c=r(2563),u=r(40030),l=r(53396),f=r(18431),h=r(55229),d=r(10282),p=r(65017).IteratorPrototype,v=r(58849),y=r(95448),m="constructor",g="Iterator",b=d("toStringTag"),w=TypeError,_=o[g],E=y||!s(_)||_.prototype!==p||!f((function(){_({})})),x=function(){if(i(this,p),c(this)===p)throw new w("Abstract class Iterator not directly constructable")},S=function(t,e){v?u(p,t,{configurable:!0,get:function(){return e},set:function(e){if(a(this),this===p)throw new w("You can't redefine this property");h(this,t)?this[t]=e:l(this,t,e)}}):p[t]=e};h(p,b)||S(b,g),!E&&h(p,m)&&p[m]!==Object||S(m,x),x.prototype=p,n({global:!0,constructor:!0,forced:E},{Iterator:x})},22890:function(t,e,r){"use strict";var n=r(68077),o=r(43173),i=r(9160),a=r(22933),s=r(73177),c=r(8900),u=r(74856),l=r(95448),f=c((function(){for(var t,e,r=this.iterator,n=this.predicate,i=this.next;;){if(t=a(o(i,r)),this.done=!!t.done)return;if(e=t.value,u(r,n,[e,this.counter++],!0))return e}}));n({target:"Iterator",proto:!0,real:!0,forced:l},{filter:function(t){return a(this),i(t),new f(s(this),{predicate:t})}})},90126:function(t,e,r){"use strict";var n=r(68077),o=r(72208),i=r(9160),a=r(22933),s=r(73177);n({target:"Iterator",proto:!0,real:!0},{find:function(t){a(this),i(t);var e=s(this),r=0;return o(e,(function(e,n){if(t(e,r++))return n(e)}),{IS_RECORD:!0,INTERRUPTED:!0}).result}})},50289:function(t,e,r){"use strict";var n=r(68077),o=r(72208),i=r(9160),a=r(22933),s=r(73177);n({target:"Iterator",proto:!0,real:!0},{forEach:function(t){a(this),i(t);var e=s(this),r=0;o(e,(function(e){t(e,r++)}),{IS_RECORD:!0})}})},70320:function(t,e,r){"use strict";var n=r(68077),o=r(57902);n({target:"Iterator",proto:!0,real:!0,forced:r(95448)},{map:o})},12148:function(t,e,r){"use strict";var n=r(68077),o=r(72208),i=r(9160),a=r(22933),s=r(73177),c=TypeError;n({target:"Iterator",proto:!0,real:!0},{reduce:function(t){a(this),i(t);var e=s(this),r=arguments.length<2,n=r?void 0:arguments[1],u=0;if(o(e,(function(e){r?(r=!1,n=e):n=t(n,e,u),u++}),{IS_RECORD:!0}),r)throw new c("Reduce of empty iterator with no initial value");return n}})},13526:function(t,e,r){"use strict";var n=r(68077),o=r(72208),i=r(9160),a=r(22933),s=r(73177);n({target:"Iterator",proto:!0,real:!0},{some:function(t){a(this),i(t);var e=s(this),r=0;return o(e,(function(e,n){if(t(e,r++))return n()}),{IS_RECORD:!0,INTERRUPTED:!0}).stopped}})},10185:function(t,e,r){"use strict";var n=r(68077),o=r(58849),i=r(5813),a=r(29694),s=r(55418),c=r(43173),u=r(30553),l=r(38475),f=r(35968),h=r(55229),d=r(11336),p=r(10228),v=r(53396),y=r(18431),m=r(25403),g=r(63710),b=i.JSON,w=i.Number,_=i.SyntaxError,E=b&&b.parse,x=a("Object","keys"),S=Object.getOwnPropertyDescriptor,k=s("".charAt),A=s("".slice),P=s(/./.exec),O=s([].push),T=/^\d$/,R=/^[1-9]$/,C=/^(?:-|\d)$/,H=/^[\t\n\r ]$/,I=function(t,e,r,n){var o,i,a,s,u,d=t[e],v=n&&d===n.value,y=v&&"string"==typeof n.source?{source:n.source}:{};if(l(d)){var m=f(d),g=v?n.nodes:m?[]:{};if(m)for(o=g.length,a=p(d),s=0;s<a;s++)L(d,s,I(d,""+s,r,s<o?g[s]:void 0));else for(i=x(d),a=p(i),s=0;s<a;s++)u=i[s],L(d,u,I(d,u,r,h(g,u)?g[u]:void 0))}return c(r,t,e,d,y)},L=function(t,e,r){if(o){var n=S(t,e);if(n&&!n.configurable)return}void 0===r?delete t[e]:v(t,e,r)},N=function(t,e,r,n){this.value=t,this.end=e,this.source=r,this.nodes=n},B=function(t,e){this.source=t,this.index=e};B.prototype={fork:function(t){return new B(this.source,t)},parse:function(){var t=this.source,e=this.skip(H,this.index),r=this.fork(e),n=k(t,e);if(P(C,n))return r.number();switch(n){case"{":return r.object();case"[":return r.array();case'"':return r.string();case"t":return r.keyword(!0);case"f":return r.keyword(!1);case"n":return r.keyword(null)}throw new _('Unexpected character: "'+n+'" at: '+e)},node:function(t,e,r,n,o){return new N(e,n,t?null:A(this.source,r,n),o)},object:function(){for(var t=this.source,e=this.index+1,r=!1,n={},o={};e<t.length;){if(e=this.until(['"',"}"],e),"}"===k(t,e)&&!r){e++;break}var i=this.fork(e).string(),a=i.value;e=i.end,e=this.until([":"],e)+1,e=this.skip(H,e),i=this.fork(e).parse(),v(o,a,i),v(n,a,i.value),e=this.until([",","}"],i.end);var s=k(t,e);if(","===s)r=!0,e++;else if("}"===s){e++;break}}return this.node(1,n,this.index,e,o)},array:function(){for(var t=this.source,e=this.index+1,r=!1,n=[],o=[];e<t.length;){if(e=this.skip(H,e),"]"===k(t,e)&&!r){e++;break}var i=this.fork(e).parse();if(O(o,i),O(n,i.value),e=this.until([",","]"],i.end),","===k(t,e))r=!0,e++;else if("]"===k(t,e)){e++;break}}return this.node(1,n,this.index,e,o)},string:function(){var t=this.index,e=m(this.source,this.index+1);return this.node(0,e.value,t,e.end)},number:function(){var t=this.source,e=this.index,r=e;if("-"===k(t,r)&&r++,"0"===k(t,r))r++;else{if(!P(R,k(t,r)))throw new _("Failed to parse number at: "+r);r=this.skip(T,++r)}if(("."===k(t,r)&&(r=this.skip(T,++r)),"e"===k(t,r)||"E"===k(t,r))&&(r++,"+"!==k(t,r)&&"-"!==k(t,r)||r++,r===(r=this.skip(T,r))))throw new _("Failed to parse number's exponent value at: "+r);return this.node(0,w(A(t,e,r)),e,r)},keyword:function(t){var e=""+t,r=this.index,n=r+e.length;if(A(this.source,r,n)!==e)throw new _("Failed to parse value at: "+r);return this.node(0,t,r,n)},skip:function(t,e){for(var r=this.source;e<r.length&&P(t,k(r,e));e++);return e},until:function(t,e){e=this.skip(H,e);for(var r=k(this.source,e),n=0;n<t.length;n++)if(t[n]===r)return e;throw new _('Unexpected character: "'+r+'" at: '+e)}};var M=y((function(){var t,e="9007199254740993";return E(e,(function(e,r,n){t=n.source})),t!==e})),j=g&&!y((function(){return 1/E("-0 \t")!=-1/0}));n({target:"JSON",stat:!0,forced:M},{parse:function(t,e){return j&&!u(e)?E(t):function(t,e){t=d(t);var r=new B(t,0,""),n=r.parse(),o=n.value,i=r.skip(H,n.end);if(i<t.length)throw new _('Unexpected extra character: "'+k(t,i)+'" after the parsed data at: '+i);return u(e)?I({"":o},"",e,n):o}(t,e)}})},56086:function(t,e,r){"use strict";var n=r(68077),o=r(74331);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("difference")},{difference:o})},47884:function(t,e,r){"use strict";var n=r(68077),o=r(18431),i=r(52863);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("intersection")||o((function(){return"3,2"!==Array.from(new Set([1,2,3]).intersection(new Set([3,2])))}))},{intersection:i})},81912:function(t,e,r){"use strict";var n=r(68077),o=r(74635);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("isDisjointFrom")},{isDisjointFrom:o})},64584:function(t,e,r){"use strict";var n=r(68077),o=r(67511);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("isSubsetOf")},{isSubsetOf:o})},41483:function(t,e,r){"use strict";var n=r(68077),o=r(61757);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("isSupersetOf")},{isSupersetOf:o})},12367:function(t,e,r){"use strict";var n=r(68077),o=r(26832);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("symmetricDifference")},{symmetricDifference:o})},9454:function(t,e,r){"use strict";var n=r(68077),o=r(65053);n({target:"Set",proto:!0,real:!0,forced:!r(19268)("union")},{union:o})},94167:function(t,e,r){"use strict";var n=r(5813),o=r(70803),i=r(1617),a=r(30519),s=r(52838),c=function(t){if(t&&t.forEach!==a)try{s(t,"forEach",a)}catch(e){t.forEach=a}};for(var u in o)o[u]&&c(n[u]&&n[u].prototype);c(i)},98490:function(t,e,r){"use strict";var n=r(5813),o=r(70803),i=r(1617),a=r(51358),s=r(52838),c=r(48357),u=r(10282)("iterator"),l=a.values,f=function(t,e){if(t){if(t[u]!==l)try{s(t,u,l)}catch(n){t[u]=l}if(c(t,e,!0),o[e])for(var r in a)if(t[r]!==a[r])try{s(t,r,a[r])}catch(n){t[r]=a[r]}}};for(var h in o)f(n[h]&&n[h].prototype,h);f(i,"DOMTokenList")},91584:function(t,e,r){"use strict";var n=r(68077),o=r(5813),i=r(40030),a=r(58849),s=TypeError,c=Object.defineProperty,u=o.self!==o;try{if(a){var l=Object.getOwnPropertyDescriptor(o,"self");!u&&l&&l.get&&l.enumerable||i(o,"self",{get:function(){return o},set:function(t){if(this!==o)throw new s("Illegal invocation");c(o,"self",{value:t,writable:!0,configurable:!0,enumerable:!0})},configurable:!0,enumerable:!0})}else n({global:!0,simple:!0,forced:u},{self:o})}catch(f){}},40110:function(t,e,r){"use strict";r(51358);var n=r(68077),o=r(5813),i=r(95310),a=r(43173),s=r(55418),c=r(58849),u=r(75548),l=r(73936),f=r(40030),h=r(40855),d=r(48357),p=r(54398),v=r(12648),y=r(85539),m=r(30553),g=r(55229),b=r(76902),w=r(21973),_=r(22933),E=r(38475),x=r(11336),S=r(9885),k=r(51012),A=r(46767),P=r(5218),O=r(85501),T=r(33305),R=r(10282),C=r(8273),H=R("iterator"),I="URLSearchParams",L=I+"Iterator",N=v.set,B=v.getterFor(I),M=v.getterFor(L),j=i("fetch"),$=i("Request"),Z=i("Headers"),U=$&&$.prototype,D=Z&&Z.prototype,F=o.RegExp,z=o.TypeError,G=o.decodeURIComponent,V=o.encodeURIComponent,W=s("".charAt),q=s([].join),K=s([].push),Y=s("".replace),X=s([].shift),J=s([].splice),Q=s("".split),tt=s("".slice),et=/\+/g,rt=Array(4),nt=function(t){return rt[t-1]||(rt[t-1]=F("((?:%[\\da-f]{2}){"+t+"})","gi"))},ot=function(t){try{return G(t)}catch(e){return t}},it=function(t){var e=Y(t,et," "),r=4;try{return G(e)}catch(n){for(;r;)e=Y(e,nt(r--),ot);return e}},at=/[!'()~]|%20/g,st={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+"},ct=function(t){return st[t]},ut=function(t){return Y(V(t),at,ct)},lt=p((function(t,e){N(this,{type:L,target:B(t).entries,index:0,kind:e})}),I,(function(){var t=M(this),e=t.target,r=t.index++;if(!e||r>=e.length)return t.target=void 0,O(void 0,!0);var n=e[r];switch(t.kind){case"keys":return O(n.key,!1);case"values":return O(n.value,!1)}return O([n.key,n.value],!1)}),!0),ft=function(t){this.entries=[],this.url=null,void 0!==t&&(E(t)?this.parseObject(t):this.parseQuery("string"==typeof t?"?"===W(t,0)?tt(t,1):t:x(t)))};ft.prototype={type:I,bindURL:function(t){this.url=t,this.update()},parseObject:function(t){var e,r,n,o,i,s,c,u=this.entries,l=P(t);if(l)for(r=(e=A(t,l)).next;!(n=a(r,e)).done;){if(i=(o=A(_(n.value))).next,(s=a(i,o)).done||(c=a(i,o)).done||!a(i,o).done)throw new z("Expected sequence with length 2");K(u,{key:x(s.value),value:x(c.value)})}else for(var f in t)g(t,f)&&K(u,{key:f,value:x(t[f])})},parseQuery:function(t){if(t)for(var e,r,n=this.entries,o=Q(t,"&"),i=0;i<o.length;)(e=o[i++]).length&&(r=Q(e,"="),K(n,{key:it(X(r)),value:it(q(r,"="))}))},serialize:function(){for(var t,e=this.entries,r=[],n=0;n<e.length;)t=e[n++],K(r,ut(t.key)+"="+ut(t.value));return q(r,"&")},update:function(){this.entries.length=0,this.parseQuery(this.url.query)},updateURL:function(){this.url&&this.url.update()}};var ht=function(){y(this,dt);var t=N(this,new ft(arguments.length>0?arguments[0]:void 0));c||(this.size=t.entries.length)},dt=ht.prototype;if(h(dt,{append:function(t,e){var r=B(this);T(arguments.length,2),K(r.entries,{key:x(t),value:x(e)}),c||this.length++,r.updateURL()},delete:function(t){for(var e=B(this),r=T(arguments.length,1),n=e.entries,o=x(t),i=r<2?void 0:arguments[1],a=void 0===i?i:x(i),s=0;s<n.length;){var u=n[s];if(u.key!==o||void 0!==a&&u.value!==a)s++;else if(J(n,s,1),void 0!==a)break}c||(this.size=n.length),e.updateURL()},get:function(t){var e=B(this).entries;T(arguments.length,1);for(var r=x(t),n=0;n<e.length;n++)if(e[n].key===r)return e[n].value;return null},getAll:function(t){var e=B(this).entries;T(arguments.length,1);for(var r=x(t),n=[],o=0;o<e.length;o++)e[o].key===r&&K(n,e[o].value);return n},has:function(t){for(var e=B(this).entries,r=T(arguments.length,1),n=x(t),o=r<2?void 0:arguments[1],i=void 0===o?o:x(o),a=0;a<e.length;){var s=e[a++];if(s.key===n&&(void 0===i||s.value===i))return!0}return!1},set:function(t,e){var r=B(this);T(arguments.length,1);for(var n,o=r.entries,i=!1,a=x(t),s=x(e),u=0;u<o.length;u++)(n=o[u]).key===a&&(i?J(o,u--,1):(i=!0,n.value=s));i||K(o,{key:a,value:s}),c||(this.size=o.length),r.updateURL()},sort:function(){var t=B(this);C(t.entries,(function(t,e){return t.key>e.key?1:-1})),t.updateURL()},forEach:function(t){for(var e,r=B(this).entries,n=b(t,arguments.length>1?arguments[1]:void 0),o=0;o<r.length;)n((e=r[o++]).value,e.key,this)},keys:function(){return new lt(this,"keys")},values:function(){return new lt(this,"values")},entries:function(){return new lt(this,"entries")}},{enumerable:!0}),l(dt,H,dt.entries,{name:"entries"}),l(dt,"toString",(function(){return B(this).serialize()}),{enumerable:!0}),c&&f(dt,"size",{get:function(){return B(this).entries.length},configurable:!0,enumerable:!0}),d(ht,I),n({global:!0,constructor:!0,forced:!u},{URLSearchParams:ht}),!u&&m(Z)){var pt=s(D.has),vt=s(D.set),yt=function(t){if(E(t)){var e,r=t.body;if(w(r)===I)return e=t.headers?new Z(t.headers):new Z,pt(e,"content-type")||vt(e,"content-type","application/x-www-form-urlencoded;charset=UTF-8"),S(t,{body:k(0,x(r)),headers:k(0,e)})}return t};if(m(j)&&n({global:!0,enumerable:!0,dontCallGetSet:!0,forced:!0},{fetch:function(t){return j(t,arguments.length>1?yt(arguments[1]):{})}}),m($)){var mt=function(t){return y(this,U),new $(t,arguments.length>1?yt(arguments[1]):{})};U.constructor=mt,mt.prototype=U,n({global:!0,constructor:!0,dontCallGetSet:!0,forced:!0},{Request:mt})}}t.exports={URLSearchParams:ht,getState:B}},44758:function(t,e,r){"use strict";var n=r(73936),o=r(55418),i=r(11336),a=r(33305),s=URLSearchParams,c=s.prototype,u=o(c.append),l=o(c.delete),f=o(c.forEach),h=o([].push),d=new s("a=1&a=2&b=3");d.delete("a",1),d.delete("b",void 0),d+""!="a=2"&&n(c,"delete",(function(t){var e=arguments.length,r=e<2?void 0:arguments[1];if(e&&void 0===r)return l(this,t);var n=[];f(this,(function(t,e){h(n,{key:e,value:t})})),a(e,1);for(var o,s=i(t),c=i(r),d=0,p=0,v=!1,y=n.length;d<y;)o=n[d++],v||o.key===s?(v=!0,l(this,o.key)):p++;for(;p<y;)(o=n[p++]).key===s&&o.value===c||u(this,o.key,o.value)}),{enumerable:!0,unsafe:!0})},80354:function(t,e,r){"use strict";var n=r(73936),o=r(55418),i=r(11336),a=r(33305),s=URLSearchParams,c=s.prototype,u=o(c.getAll),l=o(c.has),f=new s("a=1");!f.has("a",2)&&f.has("a",void 0)||n(c,"has",(function(t){var e=arguments.length,r=e<2?void 0:arguments[1];if(e&&void 0===r)return l(this,t);var n=u(this,t);a(e,1);for(var o=i(r),s=0;s<n.length;)if(n[s++]===o)return!0;return!1}),{enumerable:!0,unsafe:!0})},7695:function(t,e,r){"use strict";r(40110)},68630:function(t,e,r){"use strict";var n=r(58849),o=r(55418),i=r(40030),a=URLSearchParams.prototype,s=o(a.forEach);n&&!("size"in a)&&i(a,"size",{get:function(){var t=0;return s(this,(function(){t++})),t},configurable:!0,enumerable:!0})},15407:function(t,e,r){"use strict";r(5239);var n,o=r(68077),i=r(58849),a=r(75548),s=r(5813),c=r(76902),u=r(55418),l=r(73936),f=r(40030),h=r(85539),d=r(55229),p=r(54914),v=r(32413),y=r(88755),m=r(47512).codeAt,g=r(86713),b=r(11336),w=r(48357),_=r(33305),E=r(40110),x=r(12648),S=x.set,k=x.getterFor("URL"),A=E.URLSearchParams,P=E.getState,O=s.URL,T=s.TypeError,R=s.parseInt,C=Math.floor,H=Math.pow,I=u("".charAt),L=u(/./.exec),N=u([].join),B=u(1..toString),M=u([].pop),j=u([].push),$=u("".replace),Z=u([].shift),U=u("".split),D=u("".slice),F=u("".toLowerCase),z=u([].unshift),G="Invalid scheme",V="Invalid host",W="Invalid port",q=/[a-z]/i,K=/[\d+-.a-z]/i,Y=/\d/,X=/^0x/i,J=/^[0-7]+$/,Q=/^\d+$/,tt=/^[\da-f]+$/i,et=/[\0\t\n\r #%/:<>?@[\\\]^|]/,rt=/[\0\t\n\r #/:<>?@[\\\]^|]/,nt=/^[\u0000-\u0020]+/,ot=/(^|[^\u0000-\u0020])[\u0000-\u0020]+$/,it=/[\t\n\r]/g,at=function(t){var e,r,n,o;if("number"==typeof t){for(e=[],r=0;r<4;r++)z(e,t%256),t=C(t/256);return N(e,".")}if("object"==typeof t){for(e="",n=function(t){for(var e=null,r=1,n=null,o=0,i=0;i<8;i++)0!==t[i]?(o>r&&(e=n,r=o),n=null,o=0):(null===n&&(n=i),++o);return o>r&&(e=n,r=o),e}(t),r=0;r<8;r++)o&&0===t[r]||(o&&(o=!1),n===r?(e+=r?":":"::",o=!0):(e+=B(t[r],16),r<7&&(e+=":")));return"["+e+"]"}return t},st={},ct=p({},st,{" ":1,'"':1,"<":1,">":1,"`":1}),ut=p({},ct,{"#":1,"?":1,"{":1,"}":1}),lt=p({},ut,{"/":1,":":1,";":1,"=":1,"@":1,"[":1,"\\":1,"]":1,"^":1,"|":1}),ft=function(t,e){var r=m(t,0);return r>32&&r<127&&!d(e,t)?t:encodeURIComponent(t)},ht={ftp:21,file:null,http:80,https:443,ws:80,wss:443},dt=function(t,e){var r;return 2===t.length&&L(q,I(t,0))&&(":"===(r=I(t,1))||!e&&"|"===r)},pt=function(t){var e;return t.length>1&&dt(D(t,0,2))&&(2===t.length||"/"===(e=I(t,2))||"\\"===e||"?"===e||"#"===e)},vt=function(t){return"."===t||"%2e"===F(t)},yt={},mt={},gt={},bt={},wt={},_t={},Et={},xt={},St={},kt={},At={},Pt={},Ot={},Tt={},Rt={},Ct={},Ht={},It={},Lt={},Nt={},Bt={},Mt=function(t,e,r){var n,o,i,a=b(t);if(e){if(o=this.parse(a))throw new T(o);this.searchParams=null}else{if(void 0!==r&&(n=new Mt(r,!0)),o=this.parse(a,null,n))throw new T(o);(i=P(new A)).bindURL(this),this.searchParams=i}};Mt.prototype={type:"URL",parse:function(t,e,r){var o,i,a,s,c,u=this,l=e||yt,f=0,h="",p=!1,m=!1,g=!1;for(t=b(t),e||(u.scheme="",u.username="",u.password="",u.host=null,u.port=null,u.path=[],u.query=null,u.fragment=null,u.cannotBeABaseURL=!1,t=$(t,nt,""),t=$(t,ot,"$1")),t=$(t,it,""),o=v(t);f<=o.length;){switch(i=o[f],l){case yt:if(!i||!L(q,i)){if(e)return G;l=gt;continue}h+=F(i),l=mt;break;case mt:if(i&&(L(K,i)||"+"===i||"-"===i||"."===i))h+=F(i);else{if(":"!==i){if(e)return G;h="",l=gt,f=0;continue}if(e&&(u.isSpecial()!==d(ht,h)||"file"===h&&(u.includesCredentials()||null!==u.port)||"file"===u.scheme&&!u.host))return;if(u.scheme=h,e)return void(u.isSpecial()&&ht[u.scheme]===u.port&&(u.port=null));h="","file"===u.scheme?l=Tt:u.isSpecial()&&r&&r.scheme===u.scheme?l=bt:u.isSpecial()?l=xt:"/"===o[f+1]?(l=wt,f++):(u.cannotBeABaseURL=!0,j(u.path,""),l=Lt)}break;case gt:if(!r||r.cannotBeABaseURL&&"#"!==i)return G;if(r.cannotBeABaseURL&&"#"===i){u.scheme=r.scheme,u.path=y(r.path),u.query=r.query,u.fragment="",u.cannotBeABaseURL=!0,l=Bt;break}l="file"===r.scheme?Tt:_t;continue;case bt:if("/"!==i||"/"!==o[f+1]){l=_t;continue}l=St,f++;break;case wt:if("/"===i){l=kt;break}l=It;continue;case _t:if(u.scheme=r.scheme,i===n)u.username=r.username,u.password=r.password,u.host=r.host,u.port=r.port,u.path=y(r.path),u.query=r.query;else if("/"===i||"\\"===i&&u.isSpecial())l=Et;else if("?"===i)u.username=r.username,u.password=r.password,u.host=r.host,u.port=r.port,u.path=y(r.path),u.query="",l=Nt;else{if("#"!==i){u.username=r.username,u.password=r.password,u.host=r.host,u.port=r.port,u.path=y(r.path),u.path.length--,l=It;continue}u.username=r.username,u.password=r.password,u.host=r.host,u.port=r.port,u.path=y(r.path),u.query=r.query,u.fragment="",l=Bt}break;case Et:if(!u.isSpecial()||"/"!==i&&"\\"!==i){if("/"!==i){u.username=r.username,u.password=r.password,u.host=r.host,u.port=r.port,l=It;continue}l=kt}else l=St;break;case xt:if(l=St,"/"!==i||"/"!==I(h,f+1))continue;f++;break;case St:if("/"!==i&&"\\"!==i){l=kt;continue}break;case kt:if("@"===i){p&&(h="%40"+h),p=!0,a=v(h);for(var w=0;w<a.length;w++){var _=a[w];if(":"!==_||g){var E=ft(_,lt);g?u.password+=E:u.username+=E}else g=!0}h=""}else if(i===n||"/"===i||"?"===i||"#"===i||"\\"===i&&u.isSpecial()){if(p&&""===h)return"Invalid authority";f-=v(h).length+1,h="",l=At}else h+=i;break;case At:case Pt:if(e&&"file"===u.scheme){l=Ct;continue}if(":"!==i||m){if(i===n||"/"===i||"?"===i||"#"===i||"\\"===i&&u.isSpecial()){if(u.isSpecial()&&""===h)return V;if(e&&""===h&&(u.includesCredentials()||null!==u.port))return;if(s=u.parseHost(h))return s;if(h="",l=Ht,e)return;continue}"["===i?m=!0:"]"===i&&(m=!1),h+=i}else{if(""===h)return V;if(s=u.parseHost(h))return s;if(h="",l=Ot,e===Pt)return}break;case Ot:if(!L(Y,i)){if(i===n||"/"===i||"?"===i||"#"===i||"\\"===i&&u.isSpecial()||e){if(""!==h){var x=R(h,10);if(x>65535)return W;u.port=u.isSpecial()&&x===ht[u.scheme]?null:x,h=""}if(e)return;l=Ht;continue}return W}h+=i;break;case Tt:if(u.scheme="file","/"===i||"\\"===i)l=Rt;else{if(!r||"file"!==r.scheme){l=It;continue}switch(i){case n:u.host=r.host,u.path=y(r.path),u.query=r.query;break;case"?":u.host=r.host,u.path=y(r.path),u.query="",l=Nt;break;case"#":u.host=r.host,u.path=y(r.path),u.query=r.query,u.fragment="",l=Bt;break;default:pt(N(y(o,f),""))||(u.host=r.host,u.path=y(r.path),u.shortenPath()),l=It;continue}}break;case Rt:if("/"===i||"\\"===i){l=Ct;break}r&&"file"===r.scheme&&!pt(N(y(o,f),""))&&(dt(r.path[0],!0)?j(u.path,r.path[0]):u.host=r.host),l=It;continue;case Ct:if(i===n||"/"===i||"\\"===i||"?"===i||"#"===i){if(!e&&dt(h))l=It;else if(""===h){if(u.host="",e)return;l=Ht}else{if(s=u.parseHost(h))return s;if("localhost"===u.host&&(u.host=""),e)return;h="",l=Ht}continue}h+=i;break;case Ht:if(u.isSpecial()){if(l=It,"/"!==i&&"\\"!==i)continue}else if(e||"?"!==i)if(e||"#"!==i){if(i!==n&&(l=It,"/"!==i))continue}else u.fragment="",l=Bt;else u.query="",l=Nt;break;case It:if(i===n||"/"===i||"\\"===i&&u.isSpecial()||!e&&("?"===i||"#"===i)){if(".."===(c=F(c=h))||"%2e."===c||".%2e"===c||"%2e%2e"===c?(u.shortenPath(),"/"===i||"\\"===i&&u.isSpecial()||j(u.path,"")):vt(h)?"/"===i||"\\"===i&&u.isSpecial()||j(u.path,""):("file"===u.scheme&&!u.path.length&&dt(h)&&(u.host&&(u.host=""),h=I(h,0)+":"),j(u.path,h)),h="","file"===u.scheme&&(i===n||"?"===i||"#"===i))for(;u.path.length>1&&""===u.path[0];)Z(u.path);"?"===i?(u.query="",l=Nt):"#"===i&&(u.fragment="",l=Bt)}else h+=ft(i,ut);break;case Lt:"?"===i?(u.query="",l=Nt):"#"===i?(u.fragment="",l=Bt):i!==n&&(u.path[0]+=ft(i,st));break;case Nt:e||"#"!==i?i!==n&&("'"===i&&u.isSpecial()?u.query+="%27":u.query+="#"===i?"%23":ft(i,st)):(u.fragment="",l=Bt);break;case Bt:i!==n&&(u.fragment+=ft(i,ct))}f++}},parseHost:function(t){var e,r,n;if("["===I(t,0)){if("]"!==I(t,t.length-1))return V;if(e=function(t){var e,r,n,o,i,a,s,c=[0,0,0,0,0,0,0,0],u=0,l=null,f=0,h=function(){return I(t,f)};if(":"===h()){if(":"!==I(t,1))return;f+=2,l=++u}for(;h();){if(8===u)return;if(":"!==h()){for(e=r=0;r<4&&L(tt,h());)e=16*e+R(h(),16),f++,r++;if("."===h()){if(0===r)return;if(f-=r,u>6)return;for(n=0;h();){if(o=null,n>0){if(!("."===h()&&n<4))return;f++}if(!L(Y,h()))return;for(;L(Y,h());){if(i=R(h(),10),null===o)o=i;else{if(0===o)return;o=10*o+i}if(o>255)return;f++}c[u]=256*c[u]+o,2!=++n&&4!==n||u++}if(4!==n)return;break}if(":"===h()){if(f++,!h())return}else if(h())return;c[u++]=e}else{if(null!==l)return;f++,l=++u}}if(null!==l)for(a=u-l,u=7;0!==u&&a>0;)s=c[u],c[u--]=c[l+a-1],c[l+--a]=s;else if(8!==u)return;return c}(D(t,1,-1)),!e)return V;this.host=e}else if(this.isSpecial()){if(t=g(t),L(et,t))return V;if(e=function(t){var e,r,n,o,i,a,s,c=U(t,".");if(c.length&&""===c[c.length-1]&&c.length--,(e=c.length)>4)return t;for(r=[],n=0;n<e;n++){if(""===(o=c[n]))return t;if(i=10,o.length>1&&"0"===I(o,0)&&(i=L(X,o)?16:8,o=D(o,8===i?1:2)),""===o)a=0;else{if(!L(10===i?Q:8===i?J:tt,o))return t;a=R(o,i)}j(r,a)}for(n=0;n<e;n++)if(a=r[n],n===e-1){if(a>=H(256,5-e))return null}else if(a>255)return null;for(s=M(r),n=0;n<r.length;n++)s+=r[n]*H(256,3-n);return s}(t),null===e)return V;this.host=e}else{if(L(rt,t))return V;for(e="",r=v(t),n=0;n<r.length;n++)e+=ft(r[n],st);this.host=e}},cannotHaveUsernamePasswordPort:function(){return!this.host||this.cannotBeABaseURL||"file"===this.scheme},includesCredentials:function(){return""!==this.username||""!==this.password},isSpecial:function(){return d(ht,this.scheme)},shortenPath:function(){var t=this.path,e=t.length;!e||"file"===this.scheme&&1===e&&dt(t[0],!0)||t.length--},serialize:function(){var t=this,e=t.scheme,r=t.username,n=t.password,o=t.host,i=t.port,a=t.path,s=t.query,c=t.fragment,u=e+":";return null!==o?(u+="//",t.includesCredentials()&&(u+=r+(n?":"+n:"")+"@"),u+=at(o),null!==i&&(u+=":"+i)):"file"===e&&(u+="//"),u+=t.cannotBeABaseURL?a[0]:a.length?"/"+N(a,"/"):"",null!==s&&(u+="?"+s),null!==c&&(u+="#"+c),u},setHref:function(t){var e=this.parse(t);if(e)throw new T(e);this.searchParams.update()},getOrigin:function(){var t=this.scheme,e=this.port;if("blob"===t)try{return new jt(t.path[0]).origin}catch(r){return"null"}return"file"!==t&&this.isSpecial()?t+"://"+at(this.host)+(null!==e?":"+e:""):"null"},getProtocol:function(){return this.scheme+":"},setProtocol:function(t){this.parse(b(t)+":",yt)},getUsername:function(){return this.username},setUsername:function(t){var e=v(b(t));if(!this.cannotHaveUsernamePasswordPort()){this.username="";for(var r=0;r<e.length;r++)this.username+=ft(e[r],lt)}},getPassword:function(){return this.password},setPassword:function(t){var e=v(b(t));if(!this.cannotHaveUsernamePasswordPort()){this.password="";for(var r=0;r<e.length;r++)this.password+=ft(e[r],lt)}},getHost:function(){var t=this.host,e=this.port;return null===t?"":null===e?at(t):at(t)+":"+e},setHost:function(t){this.cannotBeABaseURL||this.parse(t,At)},getHostname:function(){var t=this.host;return null===t?"":at(t)},setHostname:function(t){this.cannotBeABaseURL||this.parse(t,Pt)},getPort:function(){var t=this.port;return null===t?"":b(t)},setPort:function(t){this.cannotHaveUsernamePasswordPort()||(""===(t=b(t))?this.port=null:this.parse(t,Ot))},getPathname:function(){var t=this.path;return this.cannotBeABaseURL?t[0]:t.length?"/"+N(t,"/"):""},setPathname:function(t){this.cannotBeABaseURL||(this.path=[],this.parse(t,Ht))},getSearch:function(){var t=this.query;return t?"?"+t:""},setSearch:function(t){""===(t=b(t))?this.query=null:("?"===I(t,0)&&(t=D(t,1)),this.query="",this.parse(t,Nt)),this.searchParams.update()},getSearchParams:function(){return this.searchParams.facade},getHash:function(){var t=this.fragment;return t?"#"+t:""},setHash:function(t){""!==(t=b(t))?("#"===I(t,0)&&(t=D(t,1)),this.fragment="",this.parse(t,Bt)):this.fragment=null},update:function(){this.query=this.searchParams.serialize()||null}};var jt=function(t){var e=h(this,$t),r=_(arguments.length,1)>1?arguments[1]:void 0,n=S(e,new Mt(t,!1,r));i||(e.href=n.serialize(),e.origin=n.getOrigin(),e.protocol=n.getProtocol(),e.username=n.getUsername(),e.password=n.getPassword(),e.host=n.getHost(),e.hostname=n.getHostname(),e.port=n.getPort(),e.pathname=n.getPathname(),e.search=n.getSearch(),e.searchParams=n.getSearchParams(),e.hash=n.getHash())},$t=jt.prototype,Zt=function(t,e){return{get:function(){return k(this)[t]()},set:e&&function(t){return k(this)[e](t)},configurable:!0,enumerable:!0}};if(i&&(f($t,"href",Zt("serialize","setHref")),f($t,"origin",Zt("getOrigin")),f($t,"protocol",Zt("getProtocol","setProtocol")),f($t,"username",Zt("getUsername","setUsername")),f($t,"password",Zt("getPassword","setPassword")),f($t,"host",Zt("getHost","setHost")),f($t,"hostname",Zt("getHostname","setHostname")),f($t,"port",Zt("getPort","setPort")),f($t,"pathname",Zt("getPathname","setPathname")),f($t,"search",Zt("getSearch","setSearch")),f($t,"searchParams",Zt("getSearchParams")),f($t,"hash",Zt("getHash","setHash"))),l($t,"toJSON",(function(){return k(this).serialize()}),{enumerable:!0}),l($t,"toString",(function(){return k(this).serialize()}),{enumerable:!0}),O){var Ut=O.createObjectURL,Dt=O.revokeObjectURL;Ut&&l(jt,"createObjectURL",c(Ut,O)),Dt&&l(jt,"revokeObjectURL",c(Dt,O))}w(jt,"URL"),o({global:!0,constructor:!0,forced:!a,sham:!i},{URL:jt})},31528:function(t,e,r){"use strict";r(15407)},9255:function(t,e,r){"use strict";function n(t,e){(null==e||e>t.length)&&(e=t.length);for(var r=0,n=new Array(e);r<e;r++)n[r]=t[r];return n}r.d(e,{Z:function(){return n}})},36772:function(t,e,r){"use strict";function n(t){if(Array.isArray(t))return t}r.d(e,{Z:function(){return n}})},82390:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(51467);function n(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}},81043:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});r(46798),r(47084);function n(t,e,r,n,o,i,a){try{var s=t[i](a),c=s.value}catch(u){return void r(u)}s.done?e(c):Promise.resolve(c).then(n,o)}function o(t){return function(){var e=this,r=arguments;return new Promise((function(o,i){var a=t.apply(e,r);function s(t){n(a,o,i,s,c,"next",t)}function c(t){n(a,o,i,s,c,"throw",t)}s(void 0)}))}}},68308:function(t,e,r){"use strict";r.d(e,{Z:function(){return a}});r(36251),r(46798),r(48226);var n=r(47838),o=r(35508),i=r(95281);function a(t,e,r){return e=(0,n.Z)(e),(0,i.Z)(t,(0,o.Z)()?Reflect.construct(e,r||[],(0,n.Z)(t).constructor):e.apply(t,r))}},71650:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(51467);function n(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}},59202:function(t,e,r){"use strict";r.d(e,{Z:function(){return i}});r(36251),r(46798),r(48226),r(36513);var n=r(44293),o=r(35508);function i(t,e,r){if((0,o.Z)())return Reflect.construct.apply(null,arguments);var i=[null];i.push.apply(i,e);var a=new(t.bind.apply(t,i));return r&&(0,n.Z)(a,r.prototype),a}},33368:function(t,e,r){"use strict";r.d(e,{Z:function(){return i}});var n=r(97292);function o(t,e){for(var r=0;r<e.length;r++){var o=e[r];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(t,(0,n.Z)(o.key),o)}}function i(t,e,r){return e&&o(t.prototype,e),r&&o(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t}},40039:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});r(94738),r(98214),r(46798),r(20254),r(51358),r(5239),r(98490),r(51467);var n=r(14827);function o(t,e){var r="undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(!r){if(Array.isArray(t)||(r=(0,n.Z)(t))||e&&t&&"number"==typeof t.length){r&&(t=r);var o=0,i=function(){};return{s:i,n:function(){return o>=t.length?{done:!0}:{done:!1,value:t[o++]}},e:function(t){throw t},f:i}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var a,s=!0,c=!1;return{s:function(){r=r.call(t)},n:function(){var t=r.next();return s=t.done,t},e:function(t){c=!0,a=t},f:function(){try{s||null==r.return||r.return()}finally{if(c)throw a}}}}},91808:function(t,e,r){"use strict";r.d(e,{Z:function(){return i}});r(46349),r(70320),r(46798),r(9849),r(50289),r(94167),r(36513),r(56308),r(51467),r(41353),r(94418),r(38644),r(53737),r(94738),r(98214),r(85717),r(85472);var n=r(25283),o=r(97292);function i(t,e,r,n){var o=a();if(n)for(var i=0;i<n.length;i++)o=n[i](o);var f=e((function(t){o.initializeInstanceElements(t,h.elements)}),r),h=o.decorateClass(function(t){for(var e=[],r=function(t){return"method"===t.kind&&t.key===i.key&&t.placement===i.placement},n=0;n<t.length;n++){var o,i=t[n];if("method"===i.kind&&(o=e.find(r)))if(l(i.descriptor)||l(o.descriptor)){if(u(i)||u(o))throw new ReferenceError("Duplicated methods ("+i.key+") can't be decorated.");o.descriptor=i.descriptor}else{if(u(i)){if(u(o))throw new ReferenceError("Decorators can't be placed on different accessors with for the same property ("+i.key+").");o.decorators=i.decorators}c(i,o)}else e.push(i)}return e}(f.d.map(s)),t);return o.initializeClassElements(f.F,h.elements),o.runClassFinishers(f.F,h.finishers)}function a(){a=function(){return t};var t={elementsDefinitionOrder:[["method"],["field"]],initializeInstanceElements:function(t,e){["method","field"].forEach((function(r){e.forEach((function(e){e.kind===r&&"own"===e.placement&&this.defineClassElement(t,e)}),this)}),this)},initializeClassElements:function(t,e){var r=t.prototype;["method","field"].forEach((function(n){e.forEach((function(e){var o=e.placement;if(e.kind===n&&("static"===o||"prototype"===o)){var i="static"===o?t:r;this.defineClassElement(i,e)}}),this)}),this)},defineClassElement:function(t,e){var r=e.descriptor;if("field"===e.kind){var n=e.initializer;r={enumerable:r.enumerable,writable:r.writable,configurable:r.configurable,value:void 0===n?void 0:n.call(t)}}Object.defineProperty(t,e.key,r)},decorateClass:function(t,e){var r=[],n=[],o={static:[],prototype:[],own:[]};if(t.forEach((function(t){this.addElementPlacement(t,o)}),this),t.forEach((function(t){if(!u(t))return r.push(t);var e=this.decorateElement(t,o);r.push(e.element),r.push.apply(r,e.extras),n.push.apply(n,e.finishers)}),this),!e)return{elements:r,finishers:n};var i=this.decorateConstructor(r,e);return n.push.apply(n,i.finishers),i.finishers=n,i},addElementPlacement:function(t,e,r){var n=e[t.placement];if(!r&&-1!==n.indexOf(t.key))throw new TypeError("Duplicated element ("+t.key+")");n.push(t.key)},decorateElement:function(t,e){for(var r=[],n=[],o=t.decorators,i=o.length-1;i>=0;i--){var a=e[t.placement];a.splice(a.indexOf(t.key),1);var s=this.fromElementDescriptor(t),c=this.toElementFinisherExtras((0,o[i])(s)||s);t=c.element,this.addElementPlacement(t,e),c.finisher&&n.push(c.finisher);var u=c.extras;if(u){for(var l=0;l<u.length;l++)this.addElementPlacement(u[l],e);r.push.apply(r,u)}}return{element:t,finishers:n,extras:r}},decorateConstructor:function(t,e){for(var r=[],n=e.length-1;n>=0;n--){var o=this.fromClassDescriptor(t),i=this.toClassDescriptor((0,e[n])(o)||o);if(void 0!==i.finisher&&r.push(i.finisher),void 0!==i.elements){t=i.elements;for(var a=0;a<t.length-1;a++)for(var s=a+1;s<t.length;s++)if(t[a].key===t[s].key&&t[a].placement===t[s].placement)throw new TypeError("Duplicated element ("+t[a].key+")")}}return{elements:t,finishers:r}},fromElementDescriptor:function(t){var e={kind:t.kind,key:t.key,placement:t.placement,descriptor:t.descriptor};return Object.defineProperty(e,Symbol.toStringTag,{value:"Descriptor",configurable:!0}),"field"===t.kind&&(e.initializer=t.initializer),e},toElementDescriptors:function(t){if(void 0!==t)return(0,n.Z)(t).map((function(t){var e=this.toElementDescriptor(t);return this.disallowProperty(t,"finisher","An element descriptor"),this.disallowProperty(t,"extras","An element descriptor"),e}),this)},toElementDescriptor:function(t){var e=String(t.kind);if("method"!==e&&"field"!==e)throw new TypeError('An element descriptor\'s .kind property must be either "method" or "field", but a decorator created an element descriptor with .kind "'+e+'"');var r=(0,o.Z)(t.key),n=String(t.placement);if("static"!==n&&"prototype"!==n&&"own"!==n)throw new TypeError('An element descriptor\'s .placement property must be one of "static", "prototype" or "own", but a decorator created an element descriptor with .placement "'+n+'"');var i=t.descriptor;this.disallowProperty(t,"elements","An element descriptor");var a={kind:e,key:r,placement:n,descriptor:Object.assign({},i)};return"field"!==e?this.disallowProperty(t,"initializer","A method descriptor"):(this.disallowProperty(i,"get","The property descriptor of a field descriptor"),this.disallowProperty(i,"set","The property descriptor of a field descriptor"),this.disallowProperty(i,"value","The property descriptor of a field descriptor"),a.initializer=t.initializer),a},toElementFinisherExtras:function(t){return{element:this.toElementDescriptor(t),finisher:f(t,"finisher"),extras:this.toElementDescriptors(t.extras)}},fromClassDescriptor:function(t){var e={kind:"class",elements:t.map(this.fromElementDescriptor,this)};return Object.defineProperty(e,Symbol.toStringTag,{value:"Descriptor",configurable:!0}),e},toClassDescriptor:function(t){var e=String(t.kind);if("class"!==e)throw new TypeError('A class descriptor\'s .kind property must be "class", but a decorator created a class descriptor with .kind "'+e+'"');this.disallowProperty(t,"key","A class descriptor"),this.disallowProperty(t,"placement","A class descriptor"),this.disallowProperty(t,"descriptor","A class descriptor"),this.disallowProperty(t,"initializer","A class descriptor"),this.disallowProperty(t,"extras","A class descriptor");var r=f(t,"finisher");return{elements:this.toElementDescriptors(t.elements),finisher:r}},runClassFinishers:function(t,e){for(var r=0;r<e.length;r++){var n=(0,e[r])(t);if(void 0!==n){if("function"!=typeof n)throw new TypeError("Finishers must return a constructor.");t=n}}return t},disallowProperty:function(t,e,r){if(void 0!==t[e])throw new TypeError(r+" can't have a ."+e+" property.")}};return t}function s(t){var e,r=(0,o.Z)(t.key);"method"===t.kind?e={value:t.value,writable:!0,configurable:!0,enumerable:!1}:"get"===t.kind?e={get:t.value,configurable:!0,enumerable:!1}:"set"===t.kind?e={set:t.value,configurable:!0,enumerable:!1}:"field"===t.kind&&(e={configurable:!0,writable:!0,enumerable:!0});var n={kind:"field"===t.kind?"field":"method",key:r,placement:t.static?"static":"field"===t.kind?"own":"prototype",descriptor:e};return t.decorators&&(n.decorators=t.decorators),"field"===t.kind&&(n.initializer=t.value),n}function c(t,e){void 0!==t.descriptor.get?e.descriptor.get=t.descriptor.get:e.descriptor.set=t.descriptor.set}function u(t){return t.decorators&&t.decorators.length}function l(t){return void 0!==t&&!(void 0===t.value&&void 0===t.writable)}function f(t,e){var r=t[e];if(void 0!==r&&"function"!=typeof r)throw new TypeError("Expected '"+e+"' to be a function");return r}},93359:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});var n=r(97292);function o(t,e,r){return(e=(0,n.Z)(e))in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}},34541:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});r(46798),r(48226),r(10713),r(40720);var n=r(47838);function o(){return o="undefined"!=typeof Reflect&&Reflect.get?Reflect.get.bind():function(t,e,r){var o=function(t,e){for(;!Object.prototype.hasOwnProperty.call(t,e)&&null!==(t=(0,n.Z)(t)););return t}(t,e);if(o){var i=Object.getOwnPropertyDescriptor(o,e);return i.get?i.get.call(arguments.length<3?t:r):i.value}},o.apply(this,arguments)}},47838:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(30535);function n(t){return n=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){return t.__proto__||Object.getPrototypeOf(t)},n(t)}},69205:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});r(51467);var n=r(44293);function o(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),Object.defineProperty(t,"prototype",{writable:!1}),e&&(0,n.Z)(t,e)}},35508:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(36251),r(46798),r(48226);function n(){try{var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){})))}catch(t){}return(n=function(){return!!t})()}},71005:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(94738),r(98214),r(46798),r(20254),r(51358),r(5239),r(98490),r(32797);function n(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}},1417:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(51467);function n(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}},25518:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(94738),r(56308),r(65974);function n(t,e){if(null==t)return{};var r,n,o=function(t,e){if(null==t)return{};var r,n,o={},i=Object.keys(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||(o[r]=t[r]);return o}(t,e);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(t);for(n=0;n<i.length;n++)r=i[n],e.indexOf(r)>=0||Object.prototype.propertyIsEnumerable.call(t,r)&&(o[r]=t[r])}return o}},95281:function(t,e,r){"use strict";r.d(e,{Z:function(){return i}});r(51467);var n=r(76775),o=r(82390);function i(t,e){if(e&&("object"===(0,n.Z)(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return(0,o.Z)(t)}},99312:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});r(94738),r(98214),r(46798),r(20254),r(51358),r(5239),r(98490),r(53918),r(94418),r(38644),r(53737),r(30535),r(51467),r(36513),r(9849),r(50289),r(94167),r(22859),r(47084),r(64777),r(17692);var n=r(76775);function o(){o=function(){return e};var t,e={},r=Object.prototype,i=r.hasOwnProperty,a=Object.defineProperty||function(t,e,r){t[e]=r.value},s="function"==typeof Symbol?Symbol:{},c=s.iterator||"@@iterator",u=s.asyncIterator||"@@asyncIterator",l=s.toStringTag||"@@toStringTag";function f(t,e,r){return Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}),t[e]}try{f({},"")}catch(t){f=function(t,e,r){return t[e]=r}}function h(t,e,r,n){var o=e&&e.prototype instanceof b?e:b,i=Object.create(o.prototype),s=new H(n||[]);return a(i,"_invoke",{value:O(t,r,s)}),i}function d(t,e,r){try{return{type:"normal",arg:t.call(e,r)}}catch(t){return{type:"throw",arg:t}}}e.wrap=h;var p="suspendedStart",v="suspendedYield",y="executing",m="completed",g={};function b(){}function w(){}function _(){}var E={};f(E,c,(function(){return this}));var x=Object.getPrototypeOf,S=x&&x(x(I([])));S&&S!==r&&i.call(S,c)&&(E=S);var k=_.prototype=b.prototype=Object.create(E);function A(t){["next","throw","return"].forEach((function(e){f(t,e,(function(t){return this._invoke(e,t)}))}))}function P(t,e){function r(o,a,s,c){var u=d(t[o],t,a);if("throw"!==u.type){var l=u.arg,f=l.value;return f&&"object"==(0,n.Z)(f)&&i.call(f,"__await")?e.resolve(f.__await).then((function(t){r("next",t,s,c)}),(function(t){r("throw",t,s,c)})):e.resolve(f).then((function(t){l.value=t,s(l)}),(function(t){return r("throw",t,s,c)}))}c(u.arg)}var o;a(this,"_invoke",{value:function(t,n){function i(){return new e((function(e,o){r(t,n,e,o)}))}return o=o?o.then(i,i):i()}})}function O(e,r,n){var o=p;return function(i,a){if(o===y)throw new Error("Generator is already running");if(o===m){if("throw"===i)throw a;return{value:t,done:!0}}for(n.method=i,n.arg=a;;){var s=n.delegate;if(s){var c=T(s,n);if(c){if(c===g)continue;return c}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if(o===p)throw o=m,n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);o=y;var u=d(e,r,n);if("normal"===u.type){if(o=n.done?m:v,u.arg===g)continue;return{value:u.arg,done:n.done}}"throw"===u.type&&(o=m,n.method="throw",n.arg=u.arg)}}}function T(e,r){var n=r.method,o=e.iterator[n];if(o===t)return r.delegate=null,"throw"===n&&e.iterator.return&&(r.method="return",r.arg=t,T(e,r),"throw"===r.method)||"return"!==n&&(r.method="throw",r.arg=new TypeError("The iterator does not provide a '"+n+"' method")),g;var i=d(o,e.iterator,r.arg);if("throw"===i.type)return r.method="throw",r.arg=i.arg,r.delegate=null,g;var a=i.arg;return a?a.done?(r[e.resultName]=a.value,r.next=e.nextLoc,"return"!==r.method&&(r.method="next",r.arg=t),r.delegate=null,g):a:(r.method="throw",r.arg=new TypeError("iterator result is not an object"),r.delegate=null,g)}function R(t){var e={tryLoc:t[0]};1 in t&&(e.catchLoc=t[1]),2 in t&&(e.finallyLoc=t[2],e.afterLoc=t[3]),this.tryEntries.push(e)}function C(t){var e=t.completion||{};e.type="normal",delete e.arg,t.completion=e}function H(t){this.tryEntries=[{tryLoc:"root"}],t.forEach(R,this),this.reset(!0)}function I(e){if(e||""===e){var r=e[c];if(r)return r.call(e);if("function"==typeof e.next)return e;if(!isNaN(e.length)){var o=-1,a=function r(){for(;++o<e.length;)if(i.call(e,o))return r.value=e[o],r.done=!1,r;return r.value=t,r.done=!0,r};return a.next=a}}throw new TypeError((0,n.Z)(e)+" is not iterable")}return w.prototype=_,a(k,"constructor",{value:_,configurable:!0}),a(_,"constructor",{value:w,configurable:!0}),w.displayName=f(_,l,"GeneratorFunction"),e.isGeneratorFunction=function(t){var e="function"==typeof t&&t.constructor;return!!e&&(e===w||"GeneratorFunction"===(e.displayName||e.name))},e.mark=function(t){return Object.setPrototypeOf?Object.setPrototypeOf(t,_):(t.__proto__=_,f(t,l,"GeneratorFunction")),t.prototype=Object.create(k),t},e.awrap=function(t){return{__await:t}},A(P.prototype),f(P.prototype,u,(function(){return this})),e.AsyncIterator=P,e.async=function(t,r,n,o,i){void 0===i&&(i=Promise);var a=new P(h(t,r,n,o),i);return e.isGeneratorFunction(r)?a:a.next().then((function(t){return t.done?t.value:a.next()}))},A(k),f(k,l,"Generator"),f(k,c,(function(){return this})),f(k,"toString",(function(){return"[object Generator]"})),e.keys=function(t){var e=Object(t),r=[];for(var n in e)r.push(n);return r.reverse(),function t(){for(;r.length;){var n=r.pop();if(n in e)return t.value=n,t.done=!1,t}return t.done=!0,t}},e.values=I,H.prototype={constructor:H,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=t,this.done=!1,this.delegate=null,this.method="next",this.arg=t,this.tryEntries.forEach(C),!e)for(var r in this)"t"===r.charAt(0)&&i.call(this,r)&&!isNaN(+r.slice(1))&&(this[r]=t)},stop:function(){this.done=!0;var t=this.tryEntries[0].completion;if("throw"===t.type)throw t.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var r=this;function n(n,o){return s.type="throw",s.arg=e,r.next=n,o&&(r.method="next",r.arg=t),!!o}for(var o=this.tryEntries.length-1;o>=0;--o){var a=this.tryEntries[o],s=a.completion;if("root"===a.tryLoc)return n("end");if(a.tryLoc<=this.prev){var c=i.call(a,"catchLoc"),u=i.call(a,"finallyLoc");if(c&&u){if(this.prev<a.catchLoc)return n(a.catchLoc,!0);if(this.prev<a.finallyLoc)return n(a.finallyLoc)}else if(c){if(this.prev<a.catchLoc)return n(a.catchLoc,!0)}else{if(!u)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return n(a.finallyLoc)}}}},abrupt:function(t,e){for(var r=this.tryEntries.length-1;r>=0;--r){var n=this.tryEntries[r];if(n.tryLoc<=this.prev&&i.call(n,"finallyLoc")&&this.prev<n.finallyLoc){var o=n;break}}o&&("break"===t||"continue"===t)&&o.tryLoc<=e&&e<=o.finallyLoc&&(o=null);var a=o?o.completion:{};return a.type=t,a.arg=e,o?(this.method="next",this.next=o.finallyLoc,g):this.complete(a)},complete:function(t,e){if("throw"===t.type)throw t.arg;return"break"===t.type||"continue"===t.type?this.next=t.arg:"return"===t.type?(this.rval=this.arg=t.arg,this.method="return",this.next="end"):"normal"===t.type&&e&&(this.next=e),g},finish:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.finallyLoc===t)return this.complete(r.completion,r.afterLoc),C(r),g}},catch:function(t){for(var e=this.tryEntries.length-1;e>=0;--e){var r=this.tryEntries[e];if(r.tryLoc===t){var n=r.completion;if("throw"===n.type){var o=n.arg;C(r)}return o}}throw new Error("illegal catch attempt")},delegateYield:function(e,r,n){return this.delegate={iterator:I(e),resultName:r,nextLoc:n},"next"===this.method&&(this.arg=t),g}},e}},44293:function(t,e,r){"use strict";function n(t,e){return n=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){return t.__proto__=e,t},n(t,e)}r.d(e,{Z:function(){return n}})},62746:function(t,e,r){"use strict";r.d(e,{Z:function(){return a}});var n=r(36772);r(94738),r(98214),r(46798),r(20254),r(51358),r(5239),r(98490),r(36513);var o=r(14827),i=r(1417);function a(t,e){return(0,n.Z)(t)||function(t,e){var r=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=r){var n,o,i,a,s=[],c=!0,u=!1;try{if(i=(r=r.call(t)).next,0===e){if(Object(r)!==r)return;c=!1}else for(;!(c=(n=i.call(r)).done)&&(s.push(n.value),s.length!==e);c=!0);}catch(t){u=!0,o=t}finally{try{if(!c&&null!=r.return&&(a=r.return(),Object(a)!==a))return}finally{if(u)throw o}}return s}}(t,e)||(0,o.Z)(t,e)||(0,i.Z)()}},88962:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(17692),r(10599);function n(t,e){return e||(e=t.slice(0)),Object.freeze(Object.defineProperties(t,{raw:{value:Object.freeze(e)}}))}},25283:function(t,e,r){"use strict";r.d(e,{Z:function(){return s}});var n=r(36772),o=r(71005),i=r(14827),a=r(1417);function s(t){return(0,n.Z)(t)||(0,o.Z)(t)||(0,i.Z)(t)||(0,a.Z)()}},46097:function(t,e,r){"use strict";r.d(e,{Z:function(){return a}});var n=r(9255);var o=r(71005),i=r(14827);r(51467);function a(t){return function(t){if(Array.isArray(t))return(0,n.Z)(t)}(t)||(0,o.Z)(t)||(0,i.Z)(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}},97292:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});var n=r(76775);r(40262),r(95165),r(94738),r(98214),r(46798),r(51467),r(76843);function o(t){var e=function(t,e){if("object"!=(0,n.Z)(t)||!t)return t;var r=t[Symbol.toPrimitive];if(void 0!==r){var o=r.call(t,e||"default");if("object"!=(0,n.Z)(o))return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===e?String:Number)(t)}(t,"string");return"symbol"==(0,n.Z)(e)?e:String(e)}},76775:function(t,e,r){"use strict";r.d(e,{Z:function(){return n}});r(94738),r(98214),r(46798),r(20254),r(51358),r(5239),r(98490);function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}},14827:function(t,e,r){"use strict";r.d(e,{Z:function(){return o}});r(17692),r(46798),r(94570),r(22859),r(32797),r(5239),r(63789),r(99397);var n=r(9255);function o(t,e){if(t){if("string"==typeof t)return(0,n.Z)(t,e);var r=Object.prototype.toString.call(t).slice(8,-1);return"Object"===r&&t.constructor&&(r=t.constructor.name),"Map"===r||"Set"===r?Array.from(t):"Arguments"===r||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(r)?(0,n.Z)(t,e):void 0}}},56889:function(t,e,r){"use strict";r.d(e,{Z:function(){return a}});r(51358),r(96043),r(46798),r(5239),r(98490),r(51467);var n=r(47838),o=r(44293);r(56308),r(94570);var i=r(59202);function a(t){var e="function"==typeof Map?new Map:void 0;return a=function(t){if(null===t||!function(t){try{return-1!==Function.toString.call(t).indexOf("[native code]")}catch(e){return"function"==typeof t}}(t))return t;if("function"!=typeof t)throw new TypeError("Super expression must either be null or a function");if(void 0!==e){if(e.has(t))return e.get(t);e.set(t,r)}function r(){return(0,i.Z)(t,arguments,(0,n.Z)(this).constructor)}return r.prototype=Object.create(t.prototype,{constructor:{value:r,enumerable:!1,writable:!0,configurable:!0}}),(0,o.Z)(r,t)},a(t)}},5442:function(t,e,r){"use strict";r.r(e);r(91584),r(56308),r(46798),r(94570),r(36513),r(41353),r(87438),r(9849),r(22890),r(50289),r(94167),r(94738),r(98214),r(20254),r(51358),r(5239),r(98490),r(65974),r(67712),r(34997),r(96043),r(13526),r(51467),r(46349),r(70320);var n="undefined"!=typeof window&&"undefined"!=typeof document&&window.document===document,o="undefined"!=typeof global&&global.Math===Math?global:"undefined"!=typeof self&&self.Math===Math?self:"undefined"!=typeof window&&window.Math===Math?window:Function("return this")(),i=function(){if("function"==typeof requestAnimationFrame)return requestAnimationFrame.bind(o);return function(t){return setTimeout((function(){t(+Date.now())}),1e3/60)}}();var a=["top","right","bottom","left","width","height","size","weight"],s="undefined"!=typeof MutationObserver,c=n&&HTMLElement.prototype.attachShadow&&-1!==HTMLElement.prototype.attachShadow.toString().indexOf("[native code]")?HTMLElement.prototype.attachShadow:null,u=function(){function t(){this.connected_=!1,this.mutationEventsAdded_=!1,this.mutationsObserver_=null,this.observers_=[],this.onTransitionEnd_=this.onTransitionEnd_.bind(this),this.refresh=function(t,e){var r=!1,n=!1,o=0;function a(){r&&(r=!1,t()),n&&c()}function s(){i(a)}function c(){var t=Date.now();if(r){if(t-o<2)return;n=!0}else r=!0,n=!1,setTimeout(s,e);o=t}return c}(this.refresh.bind(this),20)}return t.prototype.addObserver=function(t){~this.observers_.indexOf(t)||this.observers_.push(t),this.connected_||this.connect_()},t.prototype.removeObserver=function(t){var e=this.observers_,r=e.indexOf(t);~r&&e.splice(r,1),!e.length&&this.connected_&&this.disconnect_()},t.prototype.refresh=function(){this.updateObservers_()&&this.refresh()},t.prototype.updateObservers_=function(){var t=this.observers_.filter((function(t){return t.gatherActive(),t.hasActive()}));return t.forEach((function(t){return t.broadcastActive()})),t.length>0},t.prototype.connect_=function(){if(n&&!this.connected_){if(document.addEventListener("transitionend",this.onTransitionEnd_),window.addEventListener("resize",this.refresh),s){this.mutationsObserver_=new MutationObserver(this.refresh);var t={attributes:!0,childList:!0,characterData:!0,subtree:!0};if(this.mutationsObserver_.observe(document,t),c){var e=this;!function r(n){var o=n.shadowRoot;o&&(e.mutationsObserver_.observe(o,t),r(o));for(var i=n.firstElementChild;i;)r(i),i=i.nextElementSibling}(document),HTMLElement.prototype.attachShadow=function(){for(var r=[],n=0;n<arguments.length;n++)r[n]=arguments[n];var o=c.apply(this,r);return e.mutationsObserver_.observe(o,t),o}}}else document.addEventListener("DOMSubtreeModified",this.refresh),this.mutationEventsAdded_=!0;this.connected_=!0}},t.prototype.disconnect_=function(){n&&this.connected_&&(document.removeEventListener("transitionend",this.onTransitionEnd_),window.removeEventListener("resize",this.refresh),this.mutationsObserver_&&(this.mutationsObserver_.disconnect(),c&&(HTMLElement.prototype.attachShadow=c)),this.mutationEventsAdded_&&document.removeEventListener("DOMSubtreeModified",this.refresh),this.mutationsObserver_=null,this.mutationEventsAdded_=!1,this.connected_=!1)},t.prototype.onTransitionEnd_=function(t){var e=t.propertyName,r=void 0===e?"":e;a.some((function(t){return!!~r.indexOf(t)}))&&this.refresh()},t.getInstance=function(){return t.instance_||(t.instance_=new t),t.instance_},t.instance_=null,t}();function l(t){var e="function"==typeof Symbol&&t[Symbol.iterator],r=0;return e?e.call(t):{next:function(){return t&&r>=t.length&&(t=void 0),{value:t&&t[r++],done:!t}}}}var f=function(t,e){var r,n;try{for(var o=l(Object.keys(e)),i=o.next();!i.done;i=o.next()){var a=i.value;Object.defineProperty(t,a,{value:e[a],enumerable:!1,writable:!1,configurable:!0})}}catch(s){r={error:s}}finally{try{i&&!i.done&&(n=o.return)&&n.call(o)}finally{if(r)throw r.error}}return t},h=function(t){var e;return(null===(e=null==t?void 0:t.ownerDocument)||void 0===e?void 0:e.defaultView)||o},d=b(0,0,0,0);function p(t){return"number"==typeof t?t:parseFloat(t)||0}function v(t){for(var e=[],r=1;r<arguments.length;r++)e[r-1]=arguments[r];return e.reduce((function(e,r){return e+p(t["border-"+r+"-width"])}),0)}function y(t){var e=t.clientWidth,r=t.clientHeight;if(!e&&!r)return d;var n=h(t).getComputedStyle(t),o=function(t){var e=t;return{top:p(e["padding-top"]),right:p(e["padding-right"]),bottom:p(e["padding-bottom"]),left:p(e["padding-left"])}}(n),i=o.left+o.right,a=o.top+o.bottom,s=p(n.width),c=p(n.height);if("border-box"===n.boxSizing&&(Math.round(s+i)!==e&&(s-=v(n,"left","right")+i),Math.round(c+a)!==r&&(c-=v(n,"top","bottom")+a)),!function(t){return t===h(t).document.documentElement}(t)){var u=Math.round(s+i)-e,l=Math.round(c+a)-r;1!==Math.abs(u)&&(s-=u),1!==Math.abs(l)&&(c-=l)}return b(o.left,o.top,s,c)}var m="undefined"!=typeof SVGGraphicsElement?function(t){return t instanceof h(t).SVGGraphicsElement}:function(t){return t instanceof h(t).SVGElement&&"function"==typeof t.getBBox};function g(t){return n?m(t)?function(t){var e=t.getBBox();return b(0,0,e.width,e.height)}(t):y(t):d}function b(t,e,r,n){return{x:t,y:e,width:r,height:n}}var w=function(){function t(t){this.broadcastWidth=0,this.broadcastHeight=0,this.contentRect_=b(0,0,0,0),this.target=t}return t.prototype.isActive=function(){var t=g(this.target);return this.contentRect_=t,t.width!==this.broadcastWidth||t.height!==this.broadcastHeight},t.prototype.broadcastRect=function(){var t=this.contentRect_;return this.broadcastWidth=t.width,this.broadcastHeight=t.height,t},t}(),_=function(t,e){var r,n,o,i,a,s,c,u=(n=(r=e).x,o=r.y,i=r.width,a=r.height,s="undefined"!=typeof DOMRectReadOnly?DOMRectReadOnly:Object,c=Object.create(s.prototype),f(c,{x:n,y:o,width:i,height:a,top:o,right:n+i,bottom:a+o,left:n}),c);f(this,{target:t,contentRect:u})},E=function(){if("undefined"!=typeof Map)return Map;function t(t,e){var r=-1;return t.some((function(t,n){return t[0]===e&&(r=n,!0)})),r}return function(){function e(){this.__entries__=[]}return Object.defineProperty(e.prototype,"size",{get:function(){return this.__entries__.length},enumerable:!0,configurable:!0}),e.prototype.get=function(e){var r,n=t(this.__entries__,e);return null===(r=this.__entries__[n])||void 0===r?void 0:r[1]},e.prototype.set=function(e,r){var n=t(this.__entries__,e);~n?this.__entries__[n][1]=r:this.__entries__.push([e,r])},e.prototype.delete=function(e){var r=this.__entries__,n=t(r,e);~n&&r.splice(n,1)},e.prototype.has=function(e){return!!~t(this.__entries__,e)},e.prototype.clear=function(){this.__entries__.splice(0)},e.prototype.forEach=function(t,e){var r,n;void 0===e&&(e=null);try{for(var o=l(this.__entries__),i=o.next();!i.done;i=o.next()){var a=i.value;t.call(e,a[1],a[0])}}catch(s){r={error:s}}finally{try{i&&!i.done&&(n=o.return)&&n.call(o)}finally{if(r)throw r.error}}},e}()}(),x=function(){function t(t,e,r){if(this.activeObservations_=[],this.observations_=new E,"function"!=typeof t)throw new TypeError("The callback provided as parameter 1 is not a function.");this.callback_=t,this.controller_=e,this.callbackCtx_=r}return t.prototype.observe=function(t){if(void 0===t)throw new TypeError("1 argument required, but only 0 present.");if("undefined"!=typeof Element&&Element instanceof Object){if(!(t instanceof h(t).Element))throw new TypeError('parameter 1 is not of type "Element".');var e=this.observations_;e.has(t)||(e.set(t,new w(t)),this.controller_.addObserver(this),this.controller_.refresh())}},t.prototype.unobserve=function(t){if(void 0===t)throw new TypeError("1 argument required, but only 0 present.");if("undefined"!=typeof Element&&Element instanceof Object){if(!(t instanceof h(t).Element))throw new TypeError('parameter 1 is not of type "Element".');var e=this.observations_;e.has(t)&&(e.delete(t),e.size||this.controller_.removeObserver(this))}},t.prototype.disconnect=function(){this.clearActive(),this.observations_.clear(),this.controller_.removeObserver(this)},t.prototype.gatherActive=function(){var t=this;this.clearActive(),this.observations_.forEach((function(e){e.isActive()&&t.activeObservations_.push(e)}))},t.prototype.broadcastActive=function(){if(this.hasActive()){var t=this.callbackCtx_,e=this.activeObservations_.map((function(t){return new _(t.target,t.broadcastRect())}));this.callback_.call(t,e,t),this.clearActive()}},t.prototype.clearActive=function(){this.activeObservations_.splice(0)},t.prototype.hasActive=function(){return this.activeObservations_.length>0},t}(),S=function(){function t(e){if(!(this instanceof t))throw new TypeError("Cannot call a class as a function.");if(!arguments.length)throw new TypeError("1 argument required, but only 0 present.");var r=u.getInstance();this.observer_=new x(e,r,this)}return t.prototype.observe=function(t){this.observer_.observe(t)},t.prototype.unobserve=function(t){this.observer_.unobserve(t)},t.prototype.disconnect=function(){this.observer_.disconnect()},t}(),k=void 0!==o.ResizeObserver?o.ResizeObserver:S;e.default=k},39030:function(t,e,r){"use strict";r.d(e,{eZ:function(){return n}});r(85717);var n=function(t){var e=t.finisher,r=t.descriptor;return function(t,n){var o;if(void 0===n){var i=null!==(o=t.originalKey)&&void 0!==o?o:t.key,a=null!=r?{kind:"method",placement:"prototype",key:i,descriptor:r(t.key)}:Object.assign(Object.assign({},t),{},{key:i});return null!=e&&(a.finisher=function(t){e(t,i)}),a}var s=t.constructor;void 0!==r&&Object.defineProperty(t,n,r(n)),null==e||e(s,n)}}},5701:function(t,e,r){"use strict";r.d(e,{C:function(){return i}});r(85717),r(94738),r(98214),r(46798);var n=function(t,e){return"method"===e.kind&&e.descriptor&&!("value"in e.descriptor)?Object.assign(Object.assign({},e),{},{finisher:function(r){r.createProperty(e.key,t)}}):{kind:"field",key:Symbol(),placement:"own",descriptor:{},originalKey:e.key,initializer:function(){"function"==typeof e.initializer&&(this[e.key]=e.initializer.call(this))},finisher:function(r){r.createProperty(e.key,t)}}},o=function(t,e,r){e.constructor.createProperty(r,t)};function i(t){return function(e,r){return void 0!==r?o(t,e,r):n(t,e)}}},95260:function(t,e,r){"use strict";r.d(e,{Mo:function(){return n},hO:function(){return s},Cb:function(){return o.C},IO:function(){return u},Kt:function(){return l},NH:function(){return y},vZ:function(){return m},GC:function(){return d},SB:function(){return i}});var n=function(t){return function(e){return"function"==typeof e?function(t,e){return customElements.define(t,e),e}(t,e):function(t,e){return{kind:e.kind,elements:e.elements,finisher:function(e){customElements.define(t,e)}}}(t,e)}},o=r(5701);r(85717);function i(t){return(0,o.C)(Object.assign(Object.assign({},t),{},{state:!0}))}var a=r(39030);function s(t){return(0,a.eZ)({finisher:function(e,r){Object.assign(e.prototype[r],t)}})}var c=r(76775);r(94738),r(98214),r(46798);function u(t,e){return(0,a.eZ)({descriptor:function(r){var n={get:function(){var e,r;return null!==(r=null===(e=this.renderRoot)||void 0===e?void 0:e.querySelector(t))&&void 0!==r?r:null},enumerable:!0,configurable:!0};if(e){var o="symbol"==(0,c.Z)(r)?Symbol():"__"+r;n.get=function(){var e,r;return void 0===this[o]&&(this[o]=null!==(r=null===(e=this.renderRoot)||void 0===e?void 0:e.querySelector(t))&&void 0!==r?r:null),this[o]}}return n}})}function l(t){return(0,a.eZ)({descriptor:function(e){return{get:function(){var e,r;return null!==(r=null===(e=this.renderRoot)||void 0===e?void 0:e.querySelectorAll(t))&&void 0!==r?r:[]},enumerable:!0,configurable:!0}}})}var f=r(99312),h=r(81043);function d(t){return(0,a.eZ)({descriptor:function(e){return{get:function(){var e=this;return(0,h.Z)((0,f.Z)().mark((function r(){var n;return(0,f.Z)().wrap((function(r){for(;;)switch(r.prev=r.next){case 0:return r.next=2,e.updateComplete;case 2:return r.abrupt("return",null===(n=e.renderRoot)||void 0===n?void 0:n.querySelector(t));case 3:case"end":return r.stop()}}),r)})))()},enumerable:!0,configurable:!0}}})}r(87438),r(9849),r(22890);var p,v=null!=(null===(p=window.HTMLSlotElement)||void 0===p?void 0:p.prototype.assignedElements)?function(t,e){return t.assignedElements(e)}:function(t,e){return t.assignedNodes(e).filter((function(t){return t.nodeType===Node.ELEMENT_NODE}))};function y(t){var e=null!=t?t:{},r=e.slot,n=e.selector;return(0,a.eZ)({descriptor:function(e){return{get:function(){var e,o="slot"+(r?"[name=".concat(r,"]"):":not([name])"),i=null===(e=this.renderRoot)||void 0===e?void 0:e.querySelector(o),a=null!=i?v(i,t):[];return n?a.filter((function(t){return t.matches(n)})):a},enumerable:!0,configurable:!0}}})}function m(t,e,r){var n,o=t;return"object"==(0,c.Z)(t)?(o=t.slot,n=t):n={flatten:e},r?y({slot:o,flatten:e,selector:r}):(0,a.eZ)({descriptor:function(t){return{get:function(){var t,e,r="slot"+(o?"[name=".concat(o,"]"):":not([name])"),i=null===(t=this.renderRoot)||void 0===t?void 0:t.querySelector(r);return null!==(e=null==i?void 0:i.assignedNodes(n))&&void 0!==e?e:[]},enumerable:!0,configurable:!0}}})}},5095:function(t,e,r){"use strict";r.d(e,{c3:function(){return g},oi:function(){return St},fl:function(){return R},iv:function(){return w},dy:function(){return nt},sk:function(){return At},Jb:function(){return it},Ld:function(){return at},sY:function(){return xt},YP:function(){return ot},$m:function(){return b}});var n,o=r(40039),i=r(46097),a=r(76775),s=r(99312),c=r(81043),u=r(71650),l=r(33368),f=r(68308),h=r(69205),d=r(56889),p=(r(88770),r(76843),r(65974),r(10185),r(51358),r(96043),r(46798),r(5239),r(98490),r(47084),r(9849),r(50289),r(94167),r(36513),r(41353),r(56308),r(94738),r(98214),r(30535),r(97393),r(30419),r(78399),r(56086),r(47884),r(81912),r(64584),r(41483),r(12367),r(9454),r(64777),r(71791),r(50617),r(80628),r(63789),r(39685),r(51467),r(34997),r(12148),r(46349),r(70320),window),v=p.ShadowRoot&&(void 0===p.ShadyCSS||p.ShadyCSS.nativeShadow)&&"adoptedStyleSheets"in Document.prototype&&"replace"in CSSStyleSheet.prototype,y=Symbol(),m=new WeakMap,g=function(){function t(e,r,n){if((0,u.Z)(this,t),this._$cssResult$=!0,n!==y)throw Error("CSSResult is not constructable. Use `unsafeCSS` or `css` instead.");this.cssText=e,this.t=r}return(0,l.Z)(t,[{key:"styleSheet",get:function(){var t=this.o,e=this.t;if(v&&void 0===t){var r=void 0!==e&&1===e.length;r&&(t=m.get(e)),void 0===t&&((this.o=t=new CSSStyleSheet).replaceSync(this.cssText),r&&m.set(e,t))}return t}},{key:"toString",value:function(){return this.cssText}}]),t}(),b=function(t){return new g("string"==typeof t?t:t+"",void 0,y)},w=function(t){for(var e=arguments.length,r=new Array(e>1?e-1:0),n=1;n<e;n++)r[n-1]=arguments[n];var o=1===t.length?t[0]:r.reduce((function(e,r,n){return e+function(t){if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")}(r)+t[n+1]}),t[0]);return new g(o,t,y)},_=v?function(t){return t}:function(t){return t instanceof CSSStyleSheet?function(t){var e,r="",n=(0,o.Z)(t.cssRules);try{for(n.s();!(e=n.n()).done;){r+=e.value.cssText}}catch(i){n.e(i)}finally{n.f()}return b(r)}(t):t},E=window,x=E.trustedTypes,S=x?x.emptyScript:"",k=E.reactiveElementPolyfillSupport,A={toAttribute:function(t,e){switch(e){case Boolean:t=t?S:null;break;case Object:case Array:t=null==t?t:JSON.stringify(t)}return t},fromAttribute:function(t,e){var r=t;switch(e){case Boolean:r=null!==t;break;case Number:r=null===t?null:Number(t);break;case Object:case Array:try{r=JSON.parse(t)}catch(t){r=null}}return r}},P=function(t,e){return e!==t&&(e==e||t==t)},O={attribute:!0,type:String,converter:A,reflect:!1,hasChanged:P},T="finalized",R=function(t){function e(){var t;return(0,u.Z)(this,e),(t=(0,f.Z)(this,e))._$Ei=new Map,t.isUpdatePending=!1,t.hasUpdated=!1,t._$El=null,t._$Eu(),t}var r;return(0,h.Z)(e,t),(0,l.Z)(e,[{key:"_$Eu",value:function(){var t,e=this;this._$E_=new Promise((function(t){return e.enableUpdating=t})),this._$AL=new Map,this._$Eg(),this.requestUpdate(),null===(t=this.constructor.h)||void 0===t||t.forEach((function(t){return t(e)}))}},{key:"addController",value:function(t){var e,r;(null!==(e=this._$ES)&&void 0!==e?e:this._$ES=[]).push(t),void 0!==this.renderRoot&&this.isConnected&&(null===(r=t.hostConnected)||void 0===r||r.call(t))}},{key:"removeController",value:function(t){var e;null===(e=this._$ES)||void 0===e||e.splice(this._$ES.indexOf(t)>>>0,1)}},{key:"_$Eg",value:function(){var t=this;this.constructor.elementProperties.forEach((function(e,r){t.hasOwnProperty(r)&&(t._$Ei.set(r,t[r]),delete t[r])}))}},{key:"createRenderRoot",value:function(){var t,e=null!==(t=this.shadowRoot)&&void 0!==t?t:this.attachShadow(this.constructor.shadowRootOptions);return function(t,e){v?t.adoptedStyleSheets=e.map((function(t){return t instanceof CSSStyleSheet?t:t.styleSheet})):e.forEach((function(e){var r=document.createElement("style"),n=p.litNonce;void 0!==n&&r.setAttribute("nonce",n),r.textContent=e.cssText,t.appendChild(r)}))}(e,this.constructor.elementStyles),e}},{key:"connectedCallback",value:function(){var t;void 0===this.renderRoot&&(this.renderRoot=this.createRenderRoot()),this.enableUpdating(!0),null===(t=this._$ES)||void 0===t||t.forEach((function(t){var e;return null===(e=t.hostConnected)||void 0===e?void 0:e.call(t)}))}},{key:"enableUpdating",value:function(t){}},{key:"disconnectedCallback",value:function(){var t;null===(t=this._$ES)||void 0===t||t.forEach((function(t){var e;return null===(e=t.hostDisconnected)||void 0===e?void 0:e.call(t)}))}},{key:"attributeChangedCallback",value:function(t,e,r){this._$AK(t,r)}},{key:"_$EO",value:function(t,e){var r,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:O,o=this.constructor._$Ep(t,n);if(void 0!==o&&!0===n.reflect){var i=(void 0!==(null===(r=n.converter)||void 0===r?void 0:r.toAttribute)?n.converter:A).toAttribute(e,n.type);this._$El=t,null==i?this.removeAttribute(o):this.setAttribute(o,i),this._$El=null}}},{key:"_$AK",value:function(t,e){var r,n=this.constructor,o=n._$Ev.get(t);if(void 0!==o&&this._$El!==o){var i=n.getPropertyOptions(o),a="function"==typeof i.converter?{fromAttribute:i.converter}:void 0!==(null===(r=i.converter)||void 0===r?void 0:r.fromAttribute)?i.converter:A;this._$El=o,this[o]=a.fromAttribute(e,i.type),this._$El=null}}},{key:"requestUpdate",value:function(t,e,r){var n=!0;void 0!==t&&(((r=r||this.constructor.getPropertyOptions(t)).hasChanged||P)(this[t],e)?(this._$AL.has(t)||this._$AL.set(t,e),!0===r.reflect&&this._$El!==t&&(void 0===this._$EC&&(this._$EC=new Map),this._$EC.set(t,r))):n=!1),!this.isUpdatePending&&n&&(this._$E_=this._$Ej())}},{key:"_$Ej",value:(r=(0,c.Z)((0,s.Z)().mark((function t(){var e;return(0,s.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return this.isUpdatePending=!0,t.prev=1,t.next=4,this._$E_;case 4:t.next=9;break;case 6:t.prev=6,t.t0=t.catch(1),Promise.reject(t.t0);case 9:if(e=this.scheduleUpdate(),t.t1=null!=e,!t.t1){t.next=14;break}return t.next=14,e;case 14:return t.abrupt("return",!this.isUpdatePending);case 15:case"end":return t.stop()}}),t,this,[[1,6]])}))),function(){return r.apply(this,arguments)})},{key:"scheduleUpdate",value:function(){return this.performUpdate()}},{key:"performUpdate",value:function(){var t,e=this;if(this.isUpdatePending){this.hasUpdated,this._$Ei&&(this._$Ei.forEach((function(t,r){return e[r]=t})),this._$Ei=void 0);var r=!1,n=this._$AL;try{(r=this.shouldUpdate(n))?(this.willUpdate(n),null===(t=this._$ES)||void 0===t||t.forEach((function(t){var e;return null===(e=t.hostUpdate)||void 0===e?void 0:e.call(t)})),this.update(n)):this._$Ek()}catch(t){throw r=!1,this._$Ek(),t}r&&this._$AE(n)}}},{key:"willUpdate",value:function(t){}},{key:"_$AE",value:function(t){var e;null===(e=this._$ES)||void 0===e||e.forEach((function(t){var e;return null===(e=t.hostUpdated)||void 0===e?void 0:e.call(t)})),this.hasUpdated||(this.hasUpdated=!0,this.firstUpdated(t)),this.updated(t)}},{key:"_$Ek",value:function(){this._$AL=new Map,this.isUpdatePending=!1}},{key:"updateComplete",get:function(){return this.getUpdateComplete()}},{key:"getUpdateComplete",value:function(){return this._$E_}},{key:"shouldUpdate",value:function(t){return!0}},{key:"update",value:function(t){var e=this;void 0!==this._$EC&&(this._$EC.forEach((function(t,r){return e._$EO(r,e[r],t)})),this._$EC=void 0),this._$Ek()}},{key:"updated",value:function(t){}},{key:"firstUpdated",value:function(t){}}],[{key:"addInitializer",value:function(t){var e;this.finalize(),(null!==(e=this.h)&&void 0!==e?e:this.h=[]).push(t)}},{key:"observedAttributes",get:function(){var t=this;this.finalize();var e=[];return this.elementProperties.forEach((function(r,n){var o=t._$Ep(n,r);void 0!==o&&(t._$Ev.set(o,n),e.push(o))})),e}},{key:"createProperty",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:O;if(e.state&&(e.attribute=!1),this.finalize(),this.elementProperties.set(t,e),!e.noAccessor&&!this.prototype.hasOwnProperty(t)){var r="symbol"==(0,a.Z)(t)?Symbol():"__"+t,n=this.getPropertyDescriptor(t,r,e);void 0!==n&&Object.defineProperty(this.prototype,t,n)}}},{key:"getPropertyDescriptor",value:function(t,e,r){return{get:function(){return this[e]},set:function(n){var o=this[t];this[e]=n,this.requestUpdate(t,o,r)},configurable:!0,enumerable:!0}}},{key:"getPropertyOptions",value:function(t){return this.elementProperties.get(t)||O}},{key:"finalize",value:function(){if(this.hasOwnProperty(T))return!1;this[T]=!0;var t=Object.getPrototypeOf(this);if(t.finalize(),void 0!==t.h&&(this.h=(0,i.Z)(t.h)),this.elementProperties=new Map(t.elementProperties),this._$Ev=new Map,this.hasOwnProperty("properties")){var e,r=this.properties,n=[].concat((0,i.Z)(Object.getOwnPropertyNames(r)),(0,i.Z)(Object.getOwnPropertySymbols(r))),a=(0,o.Z)(n);try{for(a.s();!(e=a.n()).done;){var s=e.value;this.createProperty(s,r[s])}}catch(c){a.e(c)}finally{a.f()}}return this.elementStyles=this.finalizeStyles(this.styles),!0}},{key:"finalizeStyles",value:function(t){var e=[];if(Array.isArray(t)){var r,n=new Set(t.flat(1/0).reverse()),i=(0,o.Z)(n);try{for(i.s();!(r=i.n()).done;){var a=r.value;e.unshift(_(a))}}catch(s){i.e(s)}finally{i.f()}}else void 0!==t&&e.push(_(t));return e}},{key:"_$Ep",value:function(t,e){var r=e.attribute;return!1===r?void 0:"string"==typeof r?r:"string"==typeof t?t.toLowerCase():void 0}}]),e}((0,d.Z)(HTMLElement));R[T]=!0,R.elementProperties=new Map,R.elementStyles=[],R.shadowRootOptions={mode:"open"},null==k||k({ReactiveElement:R}),(null!==(n=E.reactiveElementVersions)&&void 0!==n?n:E.reactiveElementVersions=[]).push("1.6.3");r(32982);var C,H=r(82390),I=r(34541),L=r(47838),N=(r(89802),r(62746)),B=(r(17692),r(20254),r(10999),r(52117),r(82479),r(94570),r(99397),r(88640),r(2094),r(57778),r(22859),r(86576),window),M=B.trustedTypes,j=M?M.createPolicy("lit-html",{createHTML:function(t){return t}}):void 0,$="$lit$",Z="lit$".concat((Math.random()+"").slice(9),"$"),U="?"+Z,D="<".concat(U,">"),F=document,z=function(){return F.createComment("")},G=function(t){return null===t||"object"!=(0,a.Z)(t)&&"function"!=typeof t},V=Array.isArray,W=function(t){return V(t)||"function"==typeof(null==t?void 0:t[Symbol.iterator])},q="[ \t\n\f\r]",K=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,Y=/-->/g,X=/>/g,J=RegExp(">|".concat(q,"(?:([^\\s\"'>=/]+)(").concat(q,"*=").concat(q,"*(?:[^ \t\n\f\r\"'`<>=]|(\"|')|))|$)"),"g"),Q=/'/g,tt=/"/g,et=/^(?:script|style|textarea|title)$/i,rt=function(t){return function(e){for(var r=arguments.length,n=new Array(r>1?r-1:0),o=1;o<r;o++)n[o-1]=arguments[o];return{_$litType$:t,strings:e,values:n}}},nt=rt(1),ot=rt(2),it=Symbol.for("lit-noChange"),at=Symbol.for("lit-nothing"),st=new WeakMap,ct=F.createTreeWalker(F,129,null,!1),ut=function(t,e){for(var r,n=t.length-1,o=[],i=2===e?"<svg>":"",a=K,s=0;s<n;s++){for(var c=t[s],u=void 0,l=void 0,f=-1,h=0;h<c.length&&(a.lastIndex=h,null!==(l=a.exec(c)));)h=a.lastIndex,a===K?"!--"===l[1]?a=Y:void 0!==l[1]?a=X:void 0!==l[2]?(et.test(l[2])&&(r=RegExp("</"+l[2],"g")),a=J):void 0!==l[3]&&(a=J):a===J?">"===l[0]?(a=null!=r?r:K,f=-1):void 0===l[1]?f=-2:(f=a.lastIndex-l[2].length,u=l[1],a=void 0===l[3]?J:'"'===l[3]?tt:Q):a===tt||a===Q?a=J:a===Y||a===X?a=K:(a=J,r=void 0);var d=a===J&&t[s+1].startsWith("/>")?" ":"";i+=a===K?c+D:f>=0?(o.push(u),c.slice(0,f)+$+c.slice(f)+Z+d):c+Z+(-2===f?(o.push(void 0),s):d)}var p=i+(t[n]||"<?>")+(2===e?"</svg>":"");if(!Array.isArray(t)||!t.hasOwnProperty("raw"))throw Error("invalid template strings array");return[void 0!==j?j.createHTML(p):p,o]},lt=function(){function t(e,r){var n,a=e.strings,s=e._$litType$;(0,u.Z)(this,t),this.parts=[];var c=0,l=0,f=a.length-1,h=this.parts,d=ut(a,s),p=(0,N.Z)(d,2),v=p[0],y=p[1];if(this.el=t.createElement(v,r),ct.currentNode=this.el.content,2===s){var m=this.el.content,g=m.firstChild;g.remove(),m.append.apply(m,(0,i.Z)(g.childNodes))}for(;null!==(n=ct.nextNode())&&h.length<f;){if(1===n.nodeType){if(n.hasAttributes()){var b,w=[],_=(0,o.Z)(n.getAttributeNames());try{for(_.s();!(b=_.n()).done;){var E=b.value;if(E.endsWith($)||E.startsWith(Z)){var x=y[l++];if(w.push(E),void 0!==x){var S=n.getAttribute(x.toLowerCase()+$).split(Z),k=/([.?@])?(.*)/.exec(x);h.push({type:1,index:c,name:k[2],strings:S,ctor:"."===k[1]?vt:"?"===k[1]?mt:"@"===k[1]?gt:pt})}else h.push({type:6,index:c})}}}catch(I){_.e(I)}finally{_.f()}for(var A=0,P=w;A<P.length;A++){var O=P[A];n.removeAttribute(O)}}if(et.test(n.tagName)){var T=n.textContent.split(Z),R=T.length-1;if(R>0){n.textContent=M?M.emptyScript:"";for(var C=0;C<R;C++)n.append(T[C],z()),ct.nextNode(),h.push({type:2,index:++c});n.append(T[R],z())}}}else if(8===n.nodeType)if(n.data===U)h.push({type:2,index:c});else for(var H=-1;-1!==(H=n.data.indexOf(Z,H+1));)h.push({type:7,index:c}),H+=Z.length-1;c++}}return(0,l.Z)(t,null,[{key:"createElement",value:function(t,e){var r=F.createElement("template");return r.innerHTML=t,r}}]),t}();function ft(t,e){var r,n,o,i,a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t,s=arguments.length>3?arguments[3]:void 0;if(e===it)return e;var c=void 0!==s?null===(r=a._$Co)||void 0===r?void 0:r[s]:a._$Cl,u=G(e)?void 0:e._$litDirective$;return(null==c?void 0:c.constructor)!==u&&(null===(n=null==c?void 0:c._$AO)||void 0===n||n.call(c,!1),void 0===u?c=void 0:(c=new u(t))._$AT(t,a,s),void 0!==s?(null!==(o=(i=a)._$Co)&&void 0!==o?o:i._$Co=[])[s]=c:a._$Cl=c),void 0!==c&&(e=ft(t,c._$AS(t,e.values),c,s)),e}var ht=function(){function t(e,r){(0,u.Z)(this,t),this._$AV=[],this._$AN=void 0,this._$AD=e,this._$AM=r}return(0,l.Z)(t,[{key:"parentNode",get:function(){return this._$AM.parentNode}},{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"u",value:function(t){var e,r=this._$AD,n=r.el.content,o=r.parts,i=(null!==(e=null==t?void 0:t.creationScope)&&void 0!==e?e:F).importNode(n,!0);ct.currentNode=i;for(var a=ct.nextNode(),s=0,c=0,u=o[0];void 0!==u;){if(s===u.index){var l=void 0;2===u.type?l=new dt(a,a.nextSibling,this,t):1===u.type?l=new u.ctor(a,u.name,u.strings,this,t):6===u.type&&(l=new bt(a,this,t)),this._$AV.push(l),u=o[++c]}s!==(null==u?void 0:u.index)&&(a=ct.nextNode(),s++)}return ct.currentNode=F,i}},{key:"v",value:function(t){var e,r=0,n=(0,o.Z)(this._$AV);try{for(n.s();!(e=n.n()).done;){var i=e.value;void 0!==i&&(void 0!==i.strings?(i._$AI(t,i,r),r+=i.strings.length-2):i._$AI(t[r])),r++}}catch(a){n.e(a)}finally{n.f()}}}]),t}(),dt=function(){function t(e,r,n,o){var i;(0,u.Z)(this,t),this.type=2,this._$AH=at,this._$AN=void 0,this._$AA=e,this._$AB=r,this._$AM=n,this.options=o,this._$Cp=null===(i=null==o?void 0:o.isConnected)||void 0===i||i}return(0,l.Z)(t,[{key:"_$AU",get:function(){var t,e;return null!==(e=null===(t=this._$AM)||void 0===t?void 0:t._$AU)&&void 0!==e?e:this._$Cp}},{key:"parentNode",get:function(){var t=this._$AA.parentNode,e=this._$AM;return void 0!==e&&11===(null==t?void 0:t.nodeType)&&(t=e.parentNode),t}},{key:"startNode",get:function(){return this._$AA}},{key:"endNode",get:function(){return this._$AB}},{key:"_$AI",value:function(t){t=ft(this,t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:this),G(t)?t===at||null==t||""===t?(this._$AH!==at&&this._$AR(),this._$AH=at):t!==this._$AH&&t!==it&&this._(t):void 0!==t._$litType$?this.g(t):void 0!==t.nodeType?this.$(t):W(t)?this.T(t):this._(t)}},{key:"k",value:function(t){return this._$AA.parentNode.insertBefore(t,this._$AB)}},{key:"$",value:function(t){this._$AH!==t&&(this._$AR(),this._$AH=this.k(t))}},{key:"_",value:function(t){this._$AH!==at&&G(this._$AH)?this._$AA.nextSibling.data=t:this.$(F.createTextNode(t)),this._$AH=t}},{key:"g",value:function(t){var e,r=t.values,n=t._$litType$,o="number"==typeof n?this._$AC(t):(void 0===n.el&&(n.el=lt.createElement(n.h,this.options)),n);if((null===(e=this._$AH)||void 0===e?void 0:e._$AD)===o)this._$AH.v(r);else{var i=new ht(o,this),a=i.u(this.options);i.v(r),this.$(a),this._$AH=i}}},{key:"_$AC",value:function(t){var e=st.get(t.strings);return void 0===e&&st.set(t.strings,e=new lt(t)),e}},{key:"T",value:function(e){V(this._$AH)||(this._$AH=[],this._$AR());var r,n,i=this._$AH,a=0,s=(0,o.Z)(e);try{for(s.s();!(n=s.n()).done;){var c=n.value;a===i.length?i.push(r=new t(this.k(z()),this.k(z()),this,this.options)):r=i[a],r._$AI(c),a++}}catch(u){s.e(u)}finally{s.f()}a<i.length&&(this._$AR(r&&r._$AB.nextSibling,a),i.length=a)}},{key:"_$AR",value:function(){var t,e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._$AA.nextSibling,r=arguments.length>1?arguments[1]:void 0;for(null===(t=this._$AP)||void 0===t||t.call(this,!1,!0,r);e&&e!==this._$AB;){var n=e.nextSibling;e.remove(),e=n}}},{key:"setConnected",value:function(t){var e;void 0===this._$AM&&(this._$Cp=t,null===(e=this._$AP)||void 0===e||e.call(this,t))}}]),t}(),pt=function(){function t(e,r,n,o,i){(0,u.Z)(this,t),this.type=1,this._$AH=at,this._$AN=void 0,this.element=e,this.name=r,this._$AM=o,this.options=i,n.length>2||""!==n[0]||""!==n[1]?(this._$AH=Array(n.length-1).fill(new String),this.strings=n):this._$AH=at}return(0,l.Z)(t,[{key:"tagName",get:function(){return this.element.tagName}},{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"_$AI",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this,r=arguments.length>2?arguments[2]:void 0,n=arguments.length>3?arguments[3]:void 0,o=this.strings,i=!1;if(void 0===o)t=ft(this,t,e,0),(i=!G(t)||t!==this._$AH&&t!==it)&&(this._$AH=t);else{var a,s,c=t;for(t=o[0],a=0;a<o.length-1;a++)(s=ft(this,c[r+a],e,a))===it&&(s=this._$AH[a]),i||(i=!G(s)||s!==this._$AH[a]),s===at?t=at:t!==at&&(t+=(null!=s?s:"")+o[a+1]),this._$AH[a]=s}i&&!n&&this.j(t)}},{key:"j",value:function(t){t===at?this.element.removeAttribute(this.name):this.element.setAttribute(this.name,null!=t?t:"")}}]),t}(),vt=function(t){function e(){var t;return(0,u.Z)(this,e),(t=(0,f.Z)(this,e,arguments)).type=3,t}return(0,h.Z)(e,t),(0,l.Z)(e,[{key:"j",value:function(t){this.element[this.name]=t===at?void 0:t}}]),e}(pt),yt=M?M.emptyScript:"",mt=function(t){function e(){var t;return(0,u.Z)(this,e),(t=(0,f.Z)(this,e,arguments)).type=4,t}return(0,h.Z)(e,t),(0,l.Z)(e,[{key:"j",value:function(t){t&&t!==at?this.element.setAttribute(this.name,yt):this.element.removeAttribute(this.name)}}]),e}(pt),gt=function(t){function e(t,r,n,o,i){var a;return(0,u.Z)(this,e),(a=(0,f.Z)(this,e,[t,r,n,o,i])).type=5,a}return(0,h.Z)(e,t),(0,l.Z)(e,[{key:"_$AI",value:function(t){var e;if((t=null!==(e=ft(this,t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:this,0))&&void 0!==e?e:at)!==it){var r=this._$AH,n=t===at&&r!==at||t.capture!==r.capture||t.once!==r.once||t.passive!==r.passive,o=t!==at&&(r===at||n);n&&this.element.removeEventListener(this.name,this,r),o&&this.element.addEventListener(this.name,this,t),this._$AH=t}}},{key:"handleEvent",value:function(t){var e,r;"function"==typeof this._$AH?this._$AH.call(null!==(r=null===(e=this.options)||void 0===e?void 0:e.host)&&void 0!==r?r:this.element,t):this._$AH.handleEvent(t)}}]),e}(pt),bt=function(){function t(e,r,n){(0,u.Z)(this,t),this.element=e,this.type=6,this._$AN=void 0,this._$AM=r,this.options=n}return(0,l.Z)(t,[{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"_$AI",value:function(t){ft(this,t)}}]),t}(),wt=B.litHtmlPolyfillSupport;null==wt||wt(lt,dt),(null!==(C=B.litHtmlVersions)&&void 0!==C?C:B.litHtmlVersions=[]).push("2.7.4");var _t,Et,xt=function(t,e,r){var n,o,i=null!==(n=null==r?void 0:r.renderBefore)&&void 0!==n?n:e,a=i._$litPart$;if(void 0===a){var s=null!==(o=null==r?void 0:r.renderBefore)&&void 0!==o?o:null;i._$litPart$=a=new dt(e.insertBefore(z(),s),s,void 0,null!=r?r:{})}return a._$AI(t),a},St=function(t){function e(){var t;return(0,u.Z)(this,e),(t=(0,f.Z)(this,e,arguments)).renderOptions={host:(0,H.Z)(t)},t._$Do=void 0,t}return(0,h.Z)(e,t),(0,l.Z)(e,[{key:"createRenderRoot",value:function(){var t,r,n=(0,I.Z)((0,L.Z)(e.prototype),"createRenderRoot",this).call(this);return null!==(t=(r=this.renderOptions).renderBefore)&&void 0!==t||(r.renderBefore=n.firstChild),n}},{key:"update",value:function(t){var r=this.render();this.hasUpdated||(this.renderOptions.isConnected=this.isConnected),(0,I.Z)((0,L.Z)(e.prototype),"update",this).call(this,t),this._$Do=xt(r,this.renderRoot,this.renderOptions)}},{key:"connectedCallback",value:function(){var t;(0,I.Z)((0,L.Z)(e.prototype),"connectedCallback",this).call(this),null===(t=this._$Do)||void 0===t||t.setConnected(!0)}},{key:"disconnectedCallback",value:function(){var t;(0,I.Z)((0,L.Z)(e.prototype),"disconnectedCallback",this).call(this),null===(t=this._$Do)||void 0===t||t.setConnected(!1)}},{key:"render",value:function(){return it}}]),e}(R);St.finalized=!0,St._$litElement$=!0,null===(_t=globalThis.litElementHydrateSupport)||void 0===_t||_t.call(globalThis,{LitElement:St});var kt=globalThis.litElementPolyfillSupport;null==kt||kt({LitElement:St});(null!==(Et=globalThis.litElementVersions)&&void 0!==Et?Et:globalThis.litElementVersions=[]).push("3.3.2");var At=!1},32982:function(t,e,r){"use strict";r.d(e,{Al:function(){return X},Jb:function(){return N},Ld:function(){return B},YP:function(){return L},dy:function(){return I},sY:function(){return Q}});var n,o=r(68308),i=r(69205),a=r(40039),s=r(46097),c=r(62746),u=r(71650),l=r(33368),f=r(76775),h=(r(17692),r(20254),r(51358),r(46798),r(5239),r(98490),r(94738),r(98214),r(10999),r(52117),r(63789),r(82479),r(94570),r(97393),r(39685),r(51467),r(99397),r(88640),r(36513),r(2094),r(57778),r(56308),r(22859),r(86576),window),d=h.trustedTypes,p=d?d.createPolicy("lit-html",{createHTML:function(t){return t}}):void 0,v="$lit$",y="lit$".concat((Math.random()+"").slice(9),"$"),m="?"+y,g="<".concat(m,">"),b=document,w=function(){return b.createComment("")},_=function(t){return null===t||"object"!=(0,f.Z)(t)&&"function"!=typeof t},E=Array.isArray,x=function(t){return E(t)||"function"==typeof(null==t?void 0:t[Symbol.iterator])},S="[ \t\n\f\r]",k=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,A=/-->/g,P=/>/g,O=RegExp(">|".concat(S,"(?:([^\\s\"'>=/]+)(").concat(S,"*=").concat(S,"*(?:[^ \t\n\f\r\"'`<>=]|(\"|')|))|$)"),"g"),T=/'/g,R=/"/g,C=/^(?:script|style|textarea|title)$/i,H=function(t){return function(e){for(var r=arguments.length,n=new Array(r>1?r-1:0),o=1;o<r;o++)n[o-1]=arguments[o];return{_$litType$:t,strings:e,values:n}}},I=H(1),L=H(2),N=Symbol.for("lit-noChange"),B=Symbol.for("lit-nothing"),M=new WeakMap,j=b.createTreeWalker(b,129,null,!1);function $(t,e){if(!Array.isArray(t)||!t.hasOwnProperty("raw"))throw Error("invalid template strings array");return void 0!==p?p.createHTML(e):e}var Z=function(t,e){for(var r,n=t.length-1,o=[],i=2===e?"<svg>":"",a=k,s=0;s<n;s++){for(var c=t[s],u=void 0,l=void 0,f=-1,h=0;h<c.length&&(a.lastIndex=h,null!==(l=a.exec(c)));)h=a.lastIndex,a===k?"!--"===l[1]?a=A:void 0!==l[1]?a=P:void 0!==l[2]?(C.test(l[2])&&(r=RegExp("</"+l[2],"g")),a=O):void 0!==l[3]&&(a=O):a===O?">"===l[0]?(a=null!=r?r:k,f=-1):void 0===l[1]?f=-2:(f=a.lastIndex-l[2].length,u=l[1],a=void 0===l[3]?O:'"'===l[3]?R:T):a===R||a===T?a=O:a===A||a===P?a=k:(a=O,r=void 0);var d=a===O&&t[s+1].startsWith("/>")?" ":"";i+=a===k?c+g:f>=0?(o.push(u),c.slice(0,f)+v+c.slice(f)+y+d):c+y+(-2===f?(o.push(void 0),s):d)}return[$(t,i+(t[n]||"<?>")+(2===e?"</svg>":"")),o]},U=function(){function t(e,r){var n,o=e.strings,i=e._$litType$;(0,u.Z)(this,t),this.parts=[];var l=0,f=0,h=o.length-1,p=this.parts,g=Z(o,i),b=(0,c.Z)(g,2),_=b[0],E=b[1];if(this.el=t.createElement(_,r),j.currentNode=this.el.content,2===i){var x=this.el.content,S=x.firstChild;S.remove(),x.append.apply(x,(0,s.Z)(S.childNodes))}for(;null!==(n=j.nextNode())&&p.length<h;){if(1===n.nodeType){if(n.hasAttributes()){var k,A=[],P=(0,a.Z)(n.getAttributeNames());try{for(P.s();!(k=P.n()).done;){var O=k.value;if(O.endsWith(v)||O.startsWith(y)){var T=E[f++];if(A.push(O),void 0!==T){var R=n.getAttribute(T.toLowerCase()+v).split(y),H=/([.?@])?(.*)/.exec(T);p.push({type:1,index:l,name:H[2],strings:R,ctor:"."===H[1]?V:"?"===H[1]?q:"@"===H[1]?K:G})}else p.push({type:6,index:l})}}}catch(D){P.e(D)}finally{P.f()}for(var I=0,L=A;I<L.length;I++){var N=L[I];n.removeAttribute(N)}}if(C.test(n.tagName)){var B=n.textContent.split(y),M=B.length-1;if(M>0){n.textContent=d?d.emptyScript:"";for(var $=0;$<M;$++)n.append(B[$],w()),j.nextNode(),p.push({type:2,index:++l});n.append(B[M],w())}}}else if(8===n.nodeType)if(n.data===m)p.push({type:2,index:l});else for(var U=-1;-1!==(U=n.data.indexOf(y,U+1));)p.push({type:7,index:l}),U+=y.length-1;l++}}return(0,l.Z)(t,null,[{key:"createElement",value:function(t,e){var r=b.createElement("template");return r.innerHTML=t,r}}]),t}();function D(t,e){var r,n,o,i,a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t,s=arguments.length>3?arguments[3]:void 0;if(e===N)return e;var c=void 0!==s?null===(r=a._$Co)||void 0===r?void 0:r[s]:a._$Cl,u=_(e)?void 0:e._$litDirective$;return(null==c?void 0:c.constructor)!==u&&(null===(n=null==c?void 0:c._$AO)||void 0===n||n.call(c,!1),void 0===u?c=void 0:(c=new u(t))._$AT(t,a,s),void 0!==s?(null!==(o=(i=a)._$Co)&&void 0!==o?o:i._$Co=[])[s]=c:a._$Cl=c),void 0!==c&&(e=D(t,c._$AS(t,e.values),c,s)),e}var F=function(){function t(e,r){(0,u.Z)(this,t),this._$AV=[],this._$AN=void 0,this._$AD=e,this._$AM=r}return(0,l.Z)(t,[{key:"parentNode",get:function(){return this._$AM.parentNode}},{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"u",value:function(t){var e,r=this._$AD,n=r.el.content,o=r.parts,i=(null!==(e=null==t?void 0:t.creationScope)&&void 0!==e?e:b).importNode(n,!0);j.currentNode=i;for(var a=j.nextNode(),s=0,c=0,u=o[0];void 0!==u;){if(s===u.index){var l=void 0;2===u.type?l=new z(a,a.nextSibling,this,t):1===u.type?l=new u.ctor(a,u.name,u.strings,this,t):6===u.type&&(l=new Y(a,this,t)),this._$AV.push(l),u=o[++c]}s!==(null==u?void 0:u.index)&&(a=j.nextNode(),s++)}return j.currentNode=b,i}},{key:"v",value:function(t){var e,r=0,n=(0,a.Z)(this._$AV);try{for(n.s();!(e=n.n()).done;){var o=e.value;void 0!==o&&(void 0!==o.strings?(o._$AI(t,o,r),r+=o.strings.length-2):o._$AI(t[r])),r++}}catch(i){n.e(i)}finally{n.f()}}}]),t}(),z=function(){function t(e,r,n,o){var i;(0,u.Z)(this,t),this.type=2,this._$AH=B,this._$AN=void 0,this._$AA=e,this._$AB=r,this._$AM=n,this.options=o,this._$Cp=null===(i=null==o?void 0:o.isConnected)||void 0===i||i}return(0,l.Z)(t,[{key:"_$AU",get:function(){var t,e;return null!==(e=null===(t=this._$AM)||void 0===t?void 0:t._$AU)&&void 0!==e?e:this._$Cp}},{key:"parentNode",get:function(){var t=this._$AA.parentNode,e=this._$AM;return void 0!==e&&11===(null==t?void 0:t.nodeType)&&(t=e.parentNode),t}},{key:"startNode",get:function(){return this._$AA}},{key:"endNode",get:function(){return this._$AB}},{key:"_$AI",value:function(t){t=D(this,t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:this),_(t)?t===B||null==t||""===t?(this._$AH!==B&&this._$AR(),this._$AH=B):t!==this._$AH&&t!==N&&this._(t):void 0!==t._$litType$?this.g(t):void 0!==t.nodeType?this.$(t):x(t)?this.T(t):this._(t)}},{key:"k",value:function(t){return this._$AA.parentNode.insertBefore(t,this._$AB)}},{key:"$",value:function(t){this._$AH!==t&&(this._$AR(),this._$AH=this.k(t))}},{key:"_",value:function(t){this._$AH!==B&&_(this._$AH)?this._$AA.nextSibling.data=t:this.$(b.createTextNode(t)),this._$AH=t}},{key:"g",value:function(t){var e,r=t.values,n=t._$litType$,o="number"==typeof n?this._$AC(t):(void 0===n.el&&(n.el=U.createElement($(n.h,n.h[0]),this.options)),n);if((null===(e=this._$AH)||void 0===e?void 0:e._$AD)===o)this._$AH.v(r);else{var i=new F(o,this),a=i.u(this.options);i.v(r),this.$(a),this._$AH=i}}},{key:"_$AC",value:function(t){var e=M.get(t.strings);return void 0===e&&M.set(t.strings,e=new U(t)),e}},{key:"T",value:function(e){E(this._$AH)||(this._$AH=[],this._$AR());var r,n,o=this._$AH,i=0,s=(0,a.Z)(e);try{for(s.s();!(n=s.n()).done;){var c=n.value;i===o.length?o.push(r=new t(this.k(w()),this.k(w()),this,this.options)):r=o[i],r._$AI(c),i++}}catch(u){s.e(u)}finally{s.f()}i<o.length&&(this._$AR(r&&r._$AB.nextSibling,i),o.length=i)}},{key:"_$AR",value:function(){var t,e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._$AA.nextSibling,r=arguments.length>1?arguments[1]:void 0;for(null===(t=this._$AP)||void 0===t||t.call(this,!1,!0,r);e&&e!==this._$AB;){var n=e.nextSibling;e.remove(),e=n}}},{key:"setConnected",value:function(t){var e;void 0===this._$AM&&(this._$Cp=t,null===(e=this._$AP)||void 0===e||e.call(this,t))}}]),t}(),G=function(){function t(e,r,n,o,i){(0,u.Z)(this,t),this.type=1,this._$AH=B,this._$AN=void 0,this.element=e,this.name=r,this._$AM=o,this.options=i,n.length>2||""!==n[0]||""!==n[1]?(this._$AH=Array(n.length-1).fill(new String),this.strings=n):this._$AH=B}return(0,l.Z)(t,[{key:"tagName",get:function(){return this.element.tagName}},{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"_$AI",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this,r=arguments.length>2?arguments[2]:void 0,n=arguments.length>3?arguments[3]:void 0,o=this.strings,i=!1;if(void 0===o)t=D(this,t,e,0),(i=!_(t)||t!==this._$AH&&t!==N)&&(this._$AH=t);else{var a,s,c=t;for(t=o[0],a=0;a<o.length-1;a++)(s=D(this,c[r+a],e,a))===N&&(s=this._$AH[a]),i||(i=!_(s)||s!==this._$AH[a]),s===B?t=B:t!==B&&(t+=(null!=s?s:"")+o[a+1]),this._$AH[a]=s}i&&!n&&this.j(t)}},{key:"j",value:function(t){t===B?this.element.removeAttribute(this.name):this.element.setAttribute(this.name,null!=t?t:"")}}]),t}(),V=function(t){function e(){var t;return(0,u.Z)(this,e),(t=(0,o.Z)(this,e,arguments)).type=3,t}return(0,i.Z)(e,t),(0,l.Z)(e,[{key:"j",value:function(t){this.element[this.name]=t===B?void 0:t}}]),e}(G),W=d?d.emptyScript:"",q=function(t){function e(){var t;return(0,u.Z)(this,e),(t=(0,o.Z)(this,e,arguments)).type=4,t}return(0,i.Z)(e,t),(0,l.Z)(e,[{key:"j",value:function(t){t&&t!==B?this.element.setAttribute(this.name,W):this.element.removeAttribute(this.name)}}]),e}(G),K=function(t){function e(t,r,n,i,a){var s;return(0,u.Z)(this,e),(s=(0,o.Z)(this,e,[t,r,n,i,a])).type=5,s}return(0,i.Z)(e,t),(0,l.Z)(e,[{key:"_$AI",value:function(t){var e;if((t=null!==(e=D(this,t,arguments.length>1&&void 0!==arguments[1]?arguments[1]:this,0))&&void 0!==e?e:B)!==N){var r=this._$AH,n=t===B&&r!==B||t.capture!==r.capture||t.once!==r.once||t.passive!==r.passive,o=t!==B&&(r===B||n);n&&this.element.removeEventListener(this.name,this,r),o&&this.element.addEventListener(this.name,this,t),this._$AH=t}}},{key:"handleEvent",value:function(t){var e,r;"function"==typeof this._$AH?this._$AH.call(null!==(r=null===(e=this.options)||void 0===e?void 0:e.host)&&void 0!==r?r:this.element,t):this._$AH.handleEvent(t)}}]),e}(G),Y=function(){function t(e,r,n){(0,u.Z)(this,t),this.element=e,this.type=6,this._$AN=void 0,this._$AM=r,this.options=n}return(0,l.Z)(t,[{key:"_$AU",get:function(){return this._$AM._$AU}},{key:"_$AI",value:function(t){D(this,t)}}]),t}(),X={O:v,P:y,A:m,C:1,M:Z,L:F,R:x,D:D,I:z,V:G,H:q,N:K,U:V,F:Y},J=h.litHtmlPolyfillSupport;null==J||J(U,z),(null!==(n=h.litHtmlVersions)&&void 0!==n?n:h.litHtmlVersions=[]).push("2.8.0");var Q=function(t,e,r){var n,o,i=null!==(n=null==r?void 0:r.renderBefore)&&void 0!==n?n:e,a=i._$litPart$;if(void 0===a){var s=null!==(o=null==r?void 0:r.renderBefore)&&void 0!==o?o:null;i._$litPart$=a=new z(e.insertBefore(w(),s),s,void 0,null!=r?r:{})}return a._$AI(t),a}},43204:function(t,e,r){"use strict";r.r(e),r.d(e,{__assign:function(){return a},__asyncDelegator:function(){return A},__asyncGenerator:function(){return k},__asyncValues:function(){return P},__await:function(){return S},__awaiter:function(){return v},__classPrivateFieldGet:function(){return H},__classPrivateFieldIn:function(){return L},__classPrivateFieldSet:function(){return I},__createBinding:function(){return m},__decorate:function(){return c},__esDecorate:function(){return l},__exportStar:function(){return g},__extends:function(){return i},__generator:function(){return y},__importDefault:function(){return C},__importStar:function(){return R},__makeTemplateObject:function(){return O},__metadata:function(){return p},__param:function(){return u},__propKey:function(){return h},__read:function(){return w},__rest:function(){return s},__runInitializers:function(){return f},__setFunctionName:function(){return d},__spread:function(){return _},__spreadArray:function(){return x},__spreadArrays:function(){return E},__values:function(){return b}});var n=r(76775),o=(r(51467),r(85717),r(56308),r(94738),r(40720),r(46798),r(48226),r(22859),r(36513),r(80628),r(98214),r(47084),r(20254),r(51358),r(5239),r(98490),r(97393),r(17692),r(53918),function(t,e){return o=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(t,e){t.__proto__=e}||function(t,e){for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&(t[r]=e[r])},o(t,e)});function i(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Class extends value "+String(e)+" is not a constructor or null");function r(){this.constructor=t}o(t,e),t.prototype=null===e?Object.create(e):(r.prototype=e.prototype,new r)}var a=function(){return a=Object.assign||function(t){for(var e,r=1,n=arguments.length;r<n;r++)for(var o in e=arguments[r])Object.prototype.hasOwnProperty.call(e,o)&&(t[o]=e[o]);return t},a.apply(this,arguments)};function s(t,e){var r={};for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&e.indexOf(n)<0&&(r[n]=t[n]);if(null!=t&&"function"==typeof Object.getOwnPropertySymbols){var o=0;for(n=Object.getOwnPropertySymbols(t);o<n.length;o++)e.indexOf(n[o])<0&&Object.prototype.propertyIsEnumerable.call(t,n[o])&&(r[n[o]]=t[n[o]])}return r}function c(t,e,r,o){var i,a=arguments.length,s=a<3?e:null===o?o=Object.getOwnPropertyDescriptor(e,r):o;if("object"===("undefined"==typeof Reflect?"undefined":(0,n.Z)(Reflect))&&"function"==typeof Reflect.decorate)s=Reflect.decorate(t,e,r,o);else for(var c=t.length-1;c>=0;c--)(i=t[c])&&(s=(a<3?i(s):a>3?i(e,r,s):i(e,r))||s);return a>3&&s&&Object.defineProperty(e,r,s),s}function u(t,e){return function(r,n){e(r,n,t)}}function l(t,e,r,o,i,a){function s(t){if(void 0!==t&&"function"!=typeof t)throw new TypeError("Function expected");return t}for(var c,u=o.kind,l="getter"===u?"get":"setter"===u?"set":"value",f=!e&&t?o.static?t:t.prototype:null,h=e||(f?Object.getOwnPropertyDescriptor(f,o.name):{}),d=!1,p=r.length-1;p>=0;p--){var v={};for(var y in o)v[y]="access"===y?{}:o[y];for(var y in o.access)v.access[y]=o.access[y];v.addInitializer=function(t){if(d)throw new TypeError("Cannot add initializers after decoration has completed");a.push(s(t||null))};var m=(0,r[p])("accessor"===u?{get:h.get,set:h.set}:h[l],v);if("accessor"===u){if(void 0===m)continue;if(null===m||"object"!==(0,n.Z)(m))throw new TypeError("Object expected");(c=s(m.get))&&(h.get=c),(c=s(m.set))&&(h.set=c),(c=s(m.init))&&i.unshift(c)}else(c=s(m))&&("field"===u?i.unshift(c):h[l]=c)}f&&Object.defineProperty(f,o.name,h),d=!0}function f(t,e,r){for(var n=arguments.length>2,o=0;o<e.length;o++)r=n?e[o].call(t,r):e[o].call(t);return n?r:void 0}function h(t){return"symbol"===(0,n.Z)(t)?t:"".concat(t)}function d(t,e,r){return"symbol"===(0,n.Z)(e)&&(e=e.description?"[".concat(e.description,"]"):""),Object.defineProperty(t,"name",{configurable:!0,value:r?"".concat(r," ",e):e})}function p(t,e){if("object"===("undefined"==typeof Reflect?"undefined":(0,n.Z)(Reflect))&&"function"==typeof Reflect.metadata)return Reflect.metadata(t,e)}function v(t,e,r,n){return new(r||(r=Promise))((function(o,i){function a(t){try{c(n.next(t))}catch(e){i(e)}}function s(t){try{c(n.throw(t))}catch(e){i(e)}}function c(t){var e;t.done?o(t.value):(e=t.value,e instanceof r?e:new r((function(t){t(e)}))).then(a,s)}c((n=n.apply(t,e||[])).next())}))}function y(t,e){var r,n,o,i,a={label:0,sent:function(){if(1&o[0])throw o[1];return o[1]},trys:[],ops:[]};return i={next:s(0),throw:s(1),return:s(2)},"function"==typeof Symbol&&(i[Symbol.iterator]=function(){return this}),i;function s(s){return function(c){return function(s){if(r)throw new TypeError("Generator is already executing.");for(;i&&(i=0,s[0]&&(a=0)),a;)try{if(r=1,n&&(o=2&s[0]?n.return:s[0]?n.throw||((o=n.return)&&o.call(n),0):n.next)&&!(o=o.call(n,s[1])).done)return o;switch(n=0,o&&(s=[2&s[0],o.value]),s[0]){case 0:case 1:o=s;break;case 4:return a.label++,{value:s[1],done:!1};case 5:a.label++,n=s[1],s=[0];continue;case 7:s=a.ops.pop(),a.trys.pop();continue;default:if(!(o=a.trys,(o=o.length>0&&o[o.length-1])||6!==s[0]&&2!==s[0])){a=0;continue}if(3===s[0]&&(!o||s[1]>o[0]&&s[1]<o[3])){a.label=s[1];break}if(6===s[0]&&a.label<o[1]){a.label=o[1],o=s;break}if(o&&a.label<o[2]){a.label=o[2],a.ops.push(s);break}o[2]&&a.ops.pop(),a.trys.pop();continue}s=e.call(t,a)}catch(c){s=[6,c],n=0}finally{r=o=0}if(5&s[0])throw s[1];return{value:s[0]?s[1]:void 0,done:!0}}([s,c])}}}var m=Object.create?function(t,e,r,n){void 0===n&&(n=r);var o=Object.getOwnPropertyDescriptor(e,r);o&&!("get"in o?!e.__esModule:o.writable||o.configurable)||(o={enumerable:!0,get:function(){return e[r]}}),Object.defineProperty(t,n,o)}:function(t,e,r,n){void 0===n&&(n=r),t[n]=e[r]};function g(t,e){for(var r in t)"default"===r||Object.prototype.hasOwnProperty.call(e,r)||m(e,t,r)}function b(t){var e="function"==typeof Symbol&&Symbol.iterator,r=e&&t[e],n=0;if(r)return r.call(t);if(t&&"number"==typeof t.length)return{next:function(){return t&&n>=t.length&&(t=void 0),{value:t&&t[n++],done:!t}}};throw new TypeError(e?"Object is not iterable.":"Symbol.iterator is not defined.")}function w(t,e){var r="function"==typeof Symbol&&t[Symbol.iterator];if(!r)return t;var n,o,i=r.call(t),a=[];try{for(;(void 0===e||e-- >0)&&!(n=i.next()).done;)a.push(n.value)}catch(s){o={error:s}}finally{try{n&&!n.done&&(r=i.return)&&r.call(i)}finally{if(o)throw o.error}}return a}function _(){for(var t=[],e=0;e<arguments.length;e++)t=t.concat(w(arguments[e]));return t}function E(){for(var t=0,e=0,r=arguments.length;e<r;e++)t+=arguments[e].length;var n=Array(t),o=0;for(e=0;e<r;e++)for(var i=arguments[e],a=0,s=i.length;a<s;a++,o++)n[o]=i[a];return n}function x(t,e,r){if(r||2===arguments.length)for(var n,o=0,i=e.length;o<i;o++)!n&&o in e||(n||(n=Array.prototype.slice.call(e,0,o)),n[o]=e[o]);return t.concat(n||Array.prototype.slice.call(e))}function S(t){return this instanceof S?(this.v=t,this):new S(t)}function k(t,e,r){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var n,o=r.apply(t,e||[]),i=[];return n={},a("next"),a("throw"),a("return"),n[Symbol.asyncIterator]=function(){return this},n;function a(t){o[t]&&(n[t]=function(e){return new Promise((function(r,n){i.push([t,e,r,n])>1||s(t,e)}))})}function s(t,e){try{(r=o[t](e)).value instanceof S?Promise.resolve(r.value.v).then(c,u):l(i[0][2],r)}catch(n){l(i[0][3],n)}var r}function c(t){s("next",t)}function u(t){s("throw",t)}function l(t,e){t(e),i.shift(),i.length&&s(i[0][0],i[0][1])}}function A(t){var e,r;return e={},n("next"),n("throw",(function(t){throw t})),n("return"),e[Symbol.iterator]=function(){return this},e;function n(n,o){e[n]=t[n]?function(e){return(r=!r)?{value:S(t[n](e)),done:!1}:o?o(e):e}:o}}function P(t){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var e,r=t[Symbol.asyncIterator];return r?r.call(t):(t=b(t),e={},n("next"),n("throw"),n("return"),e[Symbol.asyncIterator]=function(){return this},e);function n(r){e[r]=t[r]&&function(e){return new Promise((function(n,o){(function(t,e,r,n){Promise.resolve(n).then((function(e){t({value:e,done:r})}),e)})(n,o,(e=t[r](e)).done,e.value)}))}}}function O(t,e){return Object.defineProperty?Object.defineProperty(t,"raw",{value:e}):t.raw=e,t}var T=Object.create?function(t,e){Object.defineProperty(t,"default",{enumerable:!0,value:e})}:function(t,e){t.default=e};function R(t){if(t&&t.__esModule)return t;var e={};if(null!=t)for(var r in t)"default"!==r&&Object.prototype.hasOwnProperty.call(t,r)&&m(e,t,r);return T(e,t),e}function C(t){return t&&t.__esModule?t:{default:t}}function H(t,e,r,n){if("a"===r&&!n)throw new TypeError("Private accessor was defined without a getter");if("function"==typeof e?t!==e||!n:!e.has(t))throw new TypeError("Cannot read private member from an object whose class did not declare it");return"m"===r?n:"a"===r?n.call(t):n?n.value:e.get(t)}function I(t,e,r,n,o){if("m"===n)throw new TypeError("Private method is not writable");if("a"===n&&!o)throw new TypeError("Private accessor was defined without a setter");if("function"==typeof e?t!==e||!o:!e.has(t))throw new TypeError("Cannot write private member to an object whose class did not declare it");return"a"===n?o.call(t,r):o?o.value=r:e.set(t,r),r}function L(t,e){if(null===e||"object"!==(0,n.Z)(e)&&"function"!=typeof e)throw new TypeError("Cannot use 'in' operator on non-object");return"function"==typeof t?e===t:t.has(e)}e.default={__extends:i,__assign:a,__rest:s,__decorate:c,__param:u,__metadata:p,__awaiter:v,__generator:y,__createBinding:m,__exportStar:g,__values:b,__read:w,__spread:_,__spreadArrays:E,__spreadArray:x,__await:S,__asyncGenerator:k,__asyncDelegator:A,__asyncValues:P,__makeTemplateObject:O,__importStar:R,__importDefault:C,__classPrivateFieldGet:H,__classPrivateFieldSet:I,__classPrivateFieldIn:L}}},u={};function l(t){var e=u[t];if(void 0!==e)return e.exports;var r=u[t]={exports:{}};return c[t].call(r.exports,r,r.exports,l),r.exports}l.m=c,t="function"==typeof Symbol?Symbol("webpack queues"):"__webpack_queues__",e="function"==typeof Symbol?Symbol("webpack exports"):"__webpack_exports__",r="function"==typeof Symbol?Symbol("webpack error"):"__webpack_error__",n=function(t){t&&t.d<1&&(t.d=1,t.forEach((function(t){t.r--})),t.forEach((function(t){t.r--?t.r++:t()})))},l.a=function(o,i,a){var s;a&&((s=[]).d=-1);var c,u,l,f=new Set,h=o.exports,d=new Promise((function(t,e){l=e,u=t}));d[e]=h,d[t]=function(t){s&&t(s),f.forEach(t),d.catch((function(){}))},o.exports=d,i((function(o){var i;c=function(o){return o.map((function(o){if(null!==o&&"object"==typeof o){if(o[t])return o;if(o.then){var i=[];i.d=0,o.then((function(t){a[e]=t,n(i)}),(function(t){a[r]=t,n(i)}));var a={};return a[t]=function(t){t(i)},a}}var s={};return s[t]=function(){},s[e]=o,s}))}(o);var a=function(){return c.map((function(t){if(t[r])throw t[r];return t[e]}))},u=new Promise((function(e){(i=function(){e(a)}).r=0;var r=function(t){t!==s&&!f.has(t)&&(f.add(t),t&&!t.d&&(i.r++,t.push(i)))};c.map((function(e){e[t](r)}))}));return i.r?u:a()}),(function(t){t?l(d[r]=t):u(h),n(s)})),s&&s.d<0&&(s.d=0)},l.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return l.d(e,{a:e}),e},i=Object.getPrototypeOf?function(t){return Object.getPrototypeOf(t)}:function(t){return t.__proto__},l.t=function(t,e){if(1&e&&(t=this(t)),8&e)return t;if("object"==typeof t&&t){if(4&e&&t.__esModule)return t;if(16&e&&"function"==typeof t.then)return t}var r=Object.create(null);l.r(r);var n={};o=o||[null,i({}),i([]),i(i)];for(var a=2&e&&t;"object"==typeof a&&!~o.indexOf(a);a=i(a))Object.getOwnPropertyNames(a).forEach((function(e){n[e]=function(){return t[e]}}));return n.default=function(){return t},l.d(r,n),r},l.d=function(t,e){for(var r in e)l.o(e,r)&&!l.o(t,r)&&Object.defineProperty(t,r,{enumerable:!0,get:e[r]})},l.f={},l.e=function(t){return Promise.all(Object.keys(l.f).reduce((function(e,r){return l.f[r](t,e),e}),[]))},l.u=function(t){return({1402:"markdown-worker",8456:"sort-filter-worker"}[t]||t)+"."+{141:"w_RBtFv_90o",208:"HsHU6-aOlFE",210:"1-qyflIdLxA",254:"YN5-uIa1JAw",339:"VdvS95PtRgE",392:"-NQDQjjOY1M",655:"lM1Lzp1cqBQ",657:"fPiB7jeibm8",672:"uTOFaaeUX8k",759:"DgApziNyyVI",947:"vXxufIv6HzY",1009:"aOgS8TITRsI",1049:"xMQc0QudPQE",1064:"_Oj9KHqBMEk",1117:"tJSySHITJZE",1189:"9tm4F5Jw27Q",1195:"E-6gA55jDx8",1244:"zJBQ8QvnNhs",1303:"IExF4a4KLPU",1318:"5_cxq66QzzY",1336:"Fy4Hytu44Hc",1402:"aWYo49uYdxE",1457:"P08NbxN5Y1c",1660:"VhXXDudoj5E",1666:"DwU_QWcSm10",1706:"J0oV_3HYRPc",1794:"95eQFrlvJ2Y",1848:"nCTvwpagZy0",1866:"QlDGXbFyIlM",1880:"ZdGmRdt6je0",1904:"sywepMvb6cQ",1908:"y8mh-Mlw64U",1913:"lAfnIBWtTrM",1948:"BOD6dJ8gWEw",1970:"cfHHb3OquLA",1985:"mTji3MQXkI8",2102:"K10MBS3rFeE",2166:"0s2Uv3CfQq8",2210:"QixDFWhQWT0",2415:"9bL5uSrCfEk",2488:"BSKRLImaphU",2519:"ykGi5kXz9uA",2545:"-N93pJCgJpM",2552:"6r_MrwUQ99U",2562:"Ciqv7fC2yh4",2583:"buK0TG2ANss",2638:"NY_2vZJ9udw",2648:"pfhPznS9Qwg",2684:"f3ry6aB8cYo",2692:"HTK-B6MxzdU",2771:"fNg7fsMnGBE",2802:"ca29fxQAH4A",2850:"TFNu9TvACIY",3252:"96FXAq2UeSY",3395:"C4oPfY7RYU4",3687:"Qan5l4-t5Oo",3762:"sbmEtk_jNu8",3869:"ro2X2mcO-Fs",3893:"tQdkfF-vo3E",3908:"q1LNtwLgL0s",3983:"2Ma_yUi7iC8",4018:"jg1UxxaAfDs",4093:"6h50EXyvG0E",4106:"5Fx7w8aHC-A",4271:"RMAmnR_-dfE",4303:"K8TzrL8SMMU",4338:"Gdg6eHmvZuQ",4340:"9ti27LkwSj8",4529:"DwqphH78Fr8",4755:"1nook-Cclgc",4779:"e5-Ed0yczRo",4827:"r7cvBNI6HTc",4833:"X2k4s7_XUo4",4837:"9ZWtI2BMQtc",4871:"l_BZ6LW4UxI",4993:"2Bj2KZPrX1E",5059:"ezVDS_-SpfE",5107:"KzgGAZW2sYI",5396:"XNLg001cWjs",5563:"O3izg8C0DX8",5718:"MeJIqSGQJCQ",5775:"exb2O9gJQvY",5778:"94a0XDP09sg",5803:"urO6zvSSRp4",5887:"vuEQsaOrMxA",5891:"VpcaaKsmWqM",5943:"HnsfCYe-1JY",6023:"1tzROGjBv74",6087:"tf6VR6CerHc",6118:"GOz64smAqvc",6138:"HxgnmYBe7Sc",6196:"JDlJRN5_Aq0",6251:"tYTB2MC5QTo",6315:"tiGucb3nvP0",6509:"X5lCMzMg3I8",6554:"R_iL7UM046Q",6581:"kVtdZZ0L6aA",6591:"Jaxsdc--oMw",6637:"kfyEn3Ts_cg",6716:"ipA_5DF60V4",6765:"KUu3HrD-tZY",6782:"zHSQEc6C_-w",6824:"RmA0H5O3yVY",6924:"ldulia5lgBg",7021:"FlYVe8e0Xkc",7048:"C8vGDJbJoa8",7098:"iMdGN77LUOM",7145:"tZMTrdTXn8Q",7198:"qomrKdkE6bE",7386:"dmKKSr80bi4",7426:"YYeQOVuu_k8",7625:"j98ws0Gd3WE",7648:"DuRNt8-jmE4",7716:"z8X_0aIr8rQ",7765:"Pjs8utIBMys",7850:"z7jOJ1jqVeY",8075:"OUIgT52dblw",8115:"AQii0_2kiGs",8137:"AgEeiEpuzRo",8196:"6_-CjHp71J0",8224:"F4rz7eg3UG0",8245:"6Ic3bSGTpcE",8246:"iFsCCGV9Ik4",8249:"Efu2xWzcbCk",8370:"z6Z9kOJJPww",8456:"vImq4zL8Gjk",8565:"wJ9COULmd4M",8597:"yAPkPPAqOcY",8663:"FjixbyJOEnI",8689:"LZtFXvwEzsE",8697:"zXlvHv0p1yE",8827:"ebn_LTddMkA",8874:"v9_ZhWB8pTA",8942:"WDtldE--Do8",9015:"Ani2ZeM7Hdk",9029:"z1KD_peqrd8",9030:"VD_2kkT3HVo",9146:"ab8uSmRRLIE",9204:"Q_-tTsvoKAo",9233:"cyVjlz1B1wI",9255:"g3e6_es7qE4",9342:"csXElsWxAwo",9460:"wqYx3_a2Hlc",9503:"Ud3RTiLMoPU",9507:"o7nl2kHQ570",9516:"i7RVaZCgJ8k",9624:"xNrOvxvIjIQ",9663:"9sCTw_yhuBE",9683:"ch0LgHzEwa0",9693:"kqhOTaEt_9A",9766:"OmCEn859YPI",9821:"gMIWl_3CLkw",9877:"EFgfYaNDgTw",9948:"nvrExStc-58"}[t]+".js"},l.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},a={},s="hacs-frontend:",l.l=function(t,e,r,n){if(a[t])a[t].push(e);else{var o,i;if(void 0!==r)for(var c=document.getElementsByTagName("script"),u=0;u<c.length;u++){var f=c[u];if(f.getAttribute("src")==t||f.getAttribute("data-webpack")==s+r){o=f;break}}o||(i=!0,(o=document.createElement("script")).charset="utf-8",o.timeout=120,l.nc&&o.setAttribute("nonce",l.nc),o.setAttribute("data-webpack",s+r),o.src=t,o.crossOrigin="use-credentials"),a[t]=[e];var h=function(e,r){o.onerror=o.onload=null,clearTimeout(d);var n=a[t];if(delete a[t],o.parentNode&&o.parentNode.removeChild(o),n&&n.forEach((function(t){return t(r)})),e)return e(r)},d=setTimeout(h.bind(null,void 0,{type:"timeout",target:o}),12e4);o.onerror=h.bind(null,o.onerror),o.onload=h.bind(null,o.onload),i&&document.head.appendChild(o)}},l.r=function(t){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},l.p="/hacsfiles/frontend/frontend_es5/",function(){l.b=document.baseURI||self.location.href;var t={9976:0};l.f.j=function(e,r){var n=l.o(t,e)?t[e]:void 0;if(0!==n)if(n)r.push(n[2]);else{var o=new Promise((function(r,o){n=t[e]=[r,o]}));r.push(n[2]=o);var i=l.p+l.u(e),a=new Error;l.l(i,(function(r){if(l.o(t,e)&&(0!==(n=t[e])&&(t[e]=void 0),n)){var o=r&&("load"===r.type?"missing":r.type),i=r&&r.target&&r.target.src;a.message="Loading chunk "+e+" failed.\n("+o+": "+i+")",a.name="ChunkLoadError",a.type=o,a.request=i,n[1](a)}}),"chunk-"+e,e)}};var e=function(e,r){var n,o,i=r[0],a=r[1],s=r[2],c=0;if(i.some((function(e){return 0!==t[e]}))){for(n in a)l.o(a,n)&&(l.m[n]=a[n]);if(s)s(l)}for(e&&e(r);c<i.length;c++)o=i[c],l.o(t,o)&&t[o]&&t[o][0](),t[o]=0},r=self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[];r.forEach(e.bind(null,0)),r.push=e.bind(null,r.push.bind(r))}(),function(){"use strict";var t;l(46798),l(9849),l(50289),l(94167),l(22859),l(89802),l(46349),l(70320),l(34997),l(12148),l(32797),l(5239),l(51358),l(78399),l(56086),l(47884),l(81912),l(64584),l(41483),l(12367),l(9454),l(98490),l(96043),l(36513),l(91989);t=function(){var t,e,r="__scoped";null!==(t=globalThis.reactiveElementPolyfillSupport)&&void 0!==t||(globalThis.reactiveElementPolyfillSupport=function(t){var e=t.ReactiveElement;if(void 0!==window.ShadyCSS&&(!window.ShadyCSS.nativeShadow||window.ShadyCSS.ApplyShim)){var n=e.prototype;window.ShadyDOM&&window.ShadyDOM.inUse&&!0===window.ShadyDOM.noPatch&&window.ShadyDOM.patchElementProto(n);var o=n.createRenderRoot;n.createRenderRoot=function(){var t,e,n,i=this.localName;if(window.ShadyCSS.nativeShadow)return o.call(this);if(!this.constructor.hasOwnProperty(r)){this.constructor[r]=!0;var a=this.constructor.elementStyles.map((function(t){return t instanceof CSSStyleSheet?Array.from(t.cssRules).reduce((function(t,e){return t+e.cssText}),""):t.cssText}));null===(e=null===(t=window.ShadyCSS)||void 0===t?void 0:t.ScopingShim)||void 0===e||e.prepareAdoptedCssText(a,i),void 0===this.constructor._$AJ&&window.ShadyCSS.prepareTemplateStyles(document.createElement("template"),i)}return null!==(n=this.shadowRoot)&&void 0!==n?n:this.attachShadow(this.constructor.shadowRootOptions)};var i=n.connectedCallback;n.connectedCallback=function(){i.call(this),this.hasUpdated&&window.ShadyCSS.styleElement(this)};var a=n._$AE;n._$AE=function(t){this.hasUpdated||window.ShadyCSS.styleElement(this),a.call(this,t)}}});var n,o=new Set,i=new Map;null!==(e=globalThis.litHtmlPolyfillSupport)&&void 0!==e||(globalThis.litHtmlPolyfillSupport=function(t,e){if(void 0!==window.ShadyCSS&&(!window.ShadyCSS.nativeShadow||window.ShadyCSS.ApplyShim)){var r=function(t){return void 0!==t&&!o.has(t)},n=function(t){var e=i.get(t);return void 0===e&&i.set(t,e=[]),e},a=new Map,s=t.createElement;t.createElement=function(e,o){var i=s.call(t,e,o),a=null==o?void 0:o.scope;if(void 0!==a&&(window.ShadyCSS.nativeShadow||window.ShadyCSS.prepareTemplateDom(i,a),r(a))){var c=n(a),u=i.content.querySelectorAll("style");c.push.apply(c,Array.from(u).map((function(t){var e;return null===(e=t.parentNode)||void 0===e||e.removeChild(t),t.textContent})))}return i};var c=document.createDocumentFragment(),u=document.createComment(""),l=e.prototype,f=l._$AI;l._$AI=function(t,e){var a,s;void 0===e&&(e=this);var l=this._$AA.parentNode,h=null===(a=this.options)||void 0===a?void 0:a.scope;if(l instanceof ShadowRoot&&r(h)){var d=this._$AA,p=this._$AB;c.appendChild(u),this._$AA=u,this._$AB=null,f.call(this,t,e);var v=(null==t?void 0:t._$litType$)?this._$AH._$AD.el:document.createElement("template");if(function(t,e){var r,a=n(t),s=0!==a.length;s&&((r=document.createElement("style")).textContent=a.join("\n"),e.content.appendChild(r)),o.add(t),i.delete(t),window.ShadyCSS.prepareTemplateStyles(e,t),s&&window.ShadyCSS.nativeShadow&&null!==(r=e.content.querySelector("style"))&&e.content.appendChild(r)}(h,v),c.removeChild(u),null===(s=window.ShadyCSS)||void 0===s?void 0:s.nativeShadow){var y=v.content.querySelector("style");null!==y&&c.appendChild(y.cloneNode(!0))}l.insertBefore(c,p),this._$AA=d,this._$AB=p}else f.call(this,t,e)},l._$AC=function(e){var r,n=null===(r=this.options)||void 0===r?void 0:r.scope,o=a.get(n);void 0===o&&a.set(n,o=new Map);var i=o.get(e.strings);return void 0===i&&o.set(e.strings,i=new t(e,this.options)),i}}}),null!==(n=globalThis.litElementPolyfillSupport)&&void 0!==n||(globalThis.litElementPolyfillSupport=function(t){var e=t.LitElement;if(void 0!==window.ShadyCSS&&(!window.ShadyCSS.nativeShadow||window.ShadyCSS.ApplyShim)){e._$AJ=!0;var r=e.prototype,n=r.createRenderRoot;r.createRenderRoot=function(){return this.renderOptions.scope=this.localName,n.call(this)}}})},"function"==typeof define&&define.amd?define(t):t();var e=l(5442);window.ResizeObserver=e.default,[Element.prototype,Document.prototype,DocumentFragment.prototype].forEach((function(t){Object.prototype.hasOwnProperty.call(t,"append")||Object.defineProperty(t,"append",{configurable:!0,enumerable:!0,writable:!0,value:function(){for(var t=document.createDocumentFragment(),e=arguments.length,r=new Array(e),n=0;n<e;n++)r[n]=arguments[n];r.forEach((function(e){var r=e instanceof Node;t.appendChild(r?e:document.createTextNode(String(e)))})),this.appendChild(t)}})})),void 0===Element.prototype.getAttributeNames&&(Element.prototype.getAttributeNames=function(){for(var t=this.attributes,e=t.length,r=new Array(e),n=0;n<e;n++)r[n]=t[n].name;return r}),Element.prototype.toggleAttribute||(Element.prototype.toggleAttribute=function(t,e){return void 0!==e&&(e=!!e),this.hasAttribute(t)?!!e||(this.removeAttribute(t),!1):!1!==e&&(this.setAttribute(t,""),!0)});var r,n,o=l(74460),i=l(88962),a=(l(94570),l(5095)),s=(0,a.iv)(r||(r=(0,i.Z)(['@font-face{font-family:Roboto;src:local("Roboto Thin"),local("Roboto-Thin"),url(','fonts/roboto/Roboto-Thin.woff2) format("woff2");font-weight:100;font-style:normal}@font-face{font-family:Roboto;src:local("Roboto Thin Italic"),local("Roboto-ThinItalic"),url(','fonts/roboto/Roboto-ThinItalic.woff2) format("woff2");font-weight:100;font-style:italic}@font-face{font-family:Roboto;src:local("Roboto Light"),local("Roboto-Light"),url(','fonts/roboto/Roboto-Light.woff2) format("woff2");font-weight:300;font-style:normal}@font-face{font-family:Roboto;src:local("Roboto Light Italic"),local("Roboto-LightItalic"),url(','fonts/roboto/Roboto-LightItalic.woff2) format("woff2");font-weight:300;font-style:italic}@font-face{font-family:Roboto;src:local("Roboto Regular"),local("Roboto-Regular"),url(','fonts/roboto/Roboto-Regular.woff2) format("woff2");font-weight:400;font-style:normal}@font-face{font-family:Roboto;src:local("Roboto Italic"),local("Roboto-Italic"),url(','fonts/roboto/Roboto-RegularItalic.woff2) format("woff2");font-weight:400;font-style:italic}@font-face{font-family:Roboto;src:local("Roboto Medium"),local("Roboto-Medium"),url(','fonts/roboto/Roboto-Medium.woff2) format("woff2");font-weight:500;font-style:normal}@font-face{font-family:Roboto;src:local("Roboto Medium Italic"),local("Roboto-MediumItalic"),url(','fonts/roboto/Roboto-MediumItalic.woff2) format("woff2");font-weight:500;font-style:italic}@font-face{font-family:Roboto;src:local("Roboto Bold"),local("Roboto-Bold"),url(','fonts/roboto/Roboto-Bold.woff2) format("woff2");font-weight:700;font-style:normal}@font-face{font-family:Roboto;src:local("Roboto Bold Italic"),local("Roboto-BoldItalic"),url(','fonts/roboto/Roboto-BoldItalic.woff2) format("woff2");font-weight:700;font-style:italic}@font-face{font-family:Roboto;src:local("Roboto Black"),local("Roboto-Black"),url(','fonts/roboto/Roboto-Black.woff2) format("woff2");font-weight:900;font-style:normal}@font-face{font-family:Roboto;src:local("Roboto Black Italic"),local("Roboto-BlackItalic"),url(','fonts/roboto/Roboto-BlackItalic.woff2) format("woff2");font-weight:900;font-style:italic}'])),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/"),(0,a.$m)("/hacsfiles/frontend/static/")).toString(),c=l(62746),u=(l(82073),l(97393),{"primary-background-color":"#111111","card-background-color":"#1c1c1c","secondary-background-color":"#282828","clear-background-color":"#111111","primary-text-color":"#e1e1e1","secondary-text-color":"#9b9b9b","disabled-text-color":"#6f6f6f","app-header-text-color":"#e1e1e1","app-header-background-color":"#101e24","switch-unchecked-button-color":"#999999","switch-unchecked-track-color":"#9b9b9b","divider-color":"rgba(225, 225, 225, .12)","outline-color":"rgba(225, 225, 225, .12)","mdc-ripple-color":"#AAAAAA","mdc-linear-progress-buffer-color":"rgba(255, 255, 255, 0.1)","input-idle-line-color":"rgba(255, 255, 255, 0.42)","input-hover-line-color":"rgba(255, 255, 255, 0.87)","input-disabled-line-color":"rgba(255, 255, 255, 0.06)","input-outlined-idle-border-color":"rgba(255, 255, 255, 0.38)","input-outlined-hover-border-color":"rgba(255, 255, 255, 0.87)","input-outlined-disabled-border-color":"rgba(255, 255, 255, 0.06)","input-fill-color":"rgba(255, 255, 255, 0.05)","input-disabled-fill-color":"rgba(255, 255, 255, 0.02)","input-ink-color":"rgba(255, 255, 255, 0.87)","input-label-ink-color":"rgba(255, 255, 255, 0.6)","input-disabled-ink-color":"rgba(255, 255, 255, 0.37)","input-dropdown-icon-color":"rgba(255, 255, 255, 0.54)","codemirror-keyword":"#C792EA","codemirror-operator":"#89DDFF","codemirror-variable":"#f07178","codemirror-variable-2":"#EEFFFF","codemirror-variable-3":"#DECB6B","codemirror-builtin":"#FFCB6B","codemirror-atom":"#F78C6C","codemirror-number":"#FF5370","codemirror-def":"#82AAFF","codemirror-string":"#C3E88D","codemirror-string-2":"#f07178","codemirror-comment":"#545454","codemirror-tag":"#FF5370","codemirror-meta":"#FFCB6B","codemirror-attribute":"#C792EA","codemirror-property":"#C792EA","codemirror-qualifier":"#DECB6B","codemirror-type":"#DECB6B","energy-grid-return-color":"#a280db","map-filter":"invert(.9) hue-rotate(170deg) brightness(1.5) contrast(1.2) saturate(.3)","disabled-color":"#464646"}),f={"state-icon-error-color":"var(--error-state-color, var(--error-color))","state-unavailable-color":"var(--state-icon-unavailable-color, var(--disabled-text-color))","sidebar-text-color":"var(--primary-text-color)","sidebar-background-color":"var(--card-background-color)","sidebar-selected-text-color":"var(--primary-color)","sidebar-selected-icon-color":"var(--primary-color)","sidebar-icon-color":"rgba(var(--rgb-primary-text-color), 0.6)","switch-checked-color":"var(--primary-color)","switch-checked-button-color":"var(--switch-checked-color, var(--primary-background-color))","switch-checked-track-color":"var(--switch-checked-color, #000000)","switch-unchecked-button-color":"var(--switch-unchecked-color, var(--primary-background-color))","switch-unchecked-track-color":"var(--switch-unchecked-color, #000000)","slider-color":"var(--primary-color)","slider-secondary-color":"var(--light-primary-color)","slider-track-color":"var(--scrollbar-thumb-color)","label-badge-background-color":"var(--card-background-color)","label-badge-text-color":"rgba(var(--rgb-primary-text-color), 0.8)","paper-listbox-background-color":"var(--card-background-color)","paper-item-icon-color":"var(--state-icon-color)","paper-item-icon-active-color":"var(--state-icon-active-color)","table-header-background-color":"var(--input-fill-color)","table-row-background-color":"var(--primary-background-color)","table-row-alternative-background-color":"var(--secondary-background-color)","data-table-background-color":"var(--card-background-color)","markdown-code-background-color":"var(--primary-background-color)","mdc-theme-primary":"var(--primary-color)","mdc-theme-secondary":"var(--accent-color)","mdc-theme-background":"var(--primary-background-color)","mdc-theme-surface":"var(--card-background-color)","mdc-theme-on-primary":"var(--text-primary-color)","mdc-theme-on-secondary":"var(--text-primary-color)","mdc-theme-on-surface":"var(--primary-text-color)","mdc-theme-text-disabled-on-light":"var(--disabled-text-color)","mdc-theme-text-primary-on-background":"var(--primary-text-color)","mdc-theme-text-secondary-on-background":"var(--secondary-text-color)","mdc-theme-text-hint-on-background":"var(--secondary-text-color)","mdc-theme-text-icon-on-background":"var(--secondary-text-color)","mdc-theme-error":"var(--error-color)","app-header-text-color":"var(--text-primary-color)","app-header-background-color":"var(--primary-color)","mdc-checkbox-unchecked-color":"rgba(var(--rgb-primary-text-color), 0.54)","mdc-checkbox-disabled-color":"var(--disabled-text-color)","mdc-radio-unchecked-color":"rgba(var(--rgb-primary-text-color), 0.54)","mdc-radio-disabled-color":"var(--disabled-text-color)","mdc-tab-text-label-color-default":"var(--primary-text-color)","mdc-button-disabled-ink-color":"var(--disabled-text-color)","mdc-button-outline-color":"var(--outline-color)","mdc-dialog-scroll-divider-color":"var(--divider-color)","mdc-dialog-heading-ink-color":"var(--primary-text-color)","mdc-dialog-content-ink-color":"var(--primary-text-color)","mdc-text-field-idle-line-color":"var(--input-idle-line-color)","mdc-text-field-hover-line-color":"var(--input-hover-line-color)","mdc-text-field-disabled-line-color":"var(--input-disabled-line-color)","mdc-text-field-outlined-idle-border-color":"var(--input-outlined-idle-border-color)","mdc-text-field-outlined-hover-border-color":"var(--input-outlined-hover-border-color)","mdc-text-field-outlined-disabled-border-color":"var(--input-outlined-disabled-border-color)","mdc-text-field-fill-color":"var(--input-fill-color)","mdc-text-field-disabled-fill-color":"var(--input-disabled-fill-color)","mdc-text-field-ink-color":"var(--input-ink-color)","mdc-text-field-label-ink-color":"var(--input-label-ink-color)","mdc-text-field-disabled-ink-color":"var(--input-disabled-ink-color)","mdc-select-idle-line-color":"var(--input-idle-line-color)","mdc-select-hover-line-color":"var(--input-hover-line-color)","mdc-select-outlined-idle-border-color":"var(--input-outlined-idle-border-color)","mdc-select-outlined-hover-border-color":"var(--input-outlined-hover-border-color)","mdc-select-outlined-disabled-border-color":"var(--input-outlined-disabled-border-color)","mdc-select-fill-color":"var(--input-fill-color)","mdc-select-disabled-fill-color":"var(--input-disabled-fill-color)","mdc-select-ink-color":"var(--input-ink-color)","mdc-select-label-ink-color":"var(--input-label-ink-color)","mdc-select-disabled-ink-color":"var(--input-disabled-ink-color)","mdc-select-dropdown-icon-color":"var(--input-dropdown-icon-color)","mdc-select-disabled-dropdown-icon-color":"var(--input-disabled-ink-color)","chip-background-color":"rgba(var(--rgb-primary-text-color), 0.15)","material-body-text-color":"var(--primary-text-color)","material-background-color":"var(--card-background-color)","material-secondary-background-color":"var(--secondary-background-color)","material-secondary-text-color":"var(--secondary-text-color)"},h=(0,a.iv)(n||(n=(0,i.Z)(["html{font-size:14px;height:100vh;--primary-text-color:#212121;--secondary-text-color:#727272;--text-primary-color:#ffffff;--text-light-primary-color:#212121;--disabled-text-color:#bdbdbd;--primary-color:",";--dark-primary-color:#0288d1;--light-primary-color:#b3e5fc;--accent-color:",';--divider-color:rgba(0, 0, 0, 0.12);--outline-color:rgba(0, 0, 0, 0.12);--scrollbar-thumb-color:rgb(194, 194, 194);--error-color:#db4437;--warning-color:#ffa600;--success-color:#43a047;--info-color:#039be5;--card-background-color:#ffffff;--primary-background-color:#fafafa;--secondary-background-color:#e5e5e5;--clear-background-color:#ffffff;--header-height:56px;--label-badge-red:var(--error-color);--label-badge-blue:var(--info-color);--label-badge-green:var(--success-color);--label-badge-yellow:var(--warning-color);--label-badge-grey:#9e9e9e;--state-icon-color:#44739e;--energy-grid-consumption-color:#488fc2;--energy-grid-return-color:#8353d1;--energy-solar-color:#ff9800;--energy-non-fossil-color:#0f9d58;--energy-battery-out-color:#4db6ac;--energy-battery-in-color:#f06292;--energy-gas-color:#8e021b;--energy-water-color:#00bcd4;--dark-divider-opacity:0.12;--dark-disabled-opacity:0.38;--dark-secondary-opacity:0.54;--dark-primary-opacity:0.87;--light-divider-opacity:0.12;--light-disabled-opacity:0.3;--light-secondary-opacity:0.7;--light-primary-opacity:1;--rgb-primary-color:3,169,244;--rgb-accent-color:255,152,0;--rgb-primary-text-color:33,33,33;--rgb-secondary-text-color:114,114,114;--rgb-text-primary-color:255,255,255;--rgb-card-background-color:255,255,255;--disabled-color:#bdbdbd;--red-color:#f44336;--pink-color:#e91e63;--purple-color:#926bc7;--deep-purple-color:#6e41ab;--indigo-color:#3f51b5;--blue-color:#2196f3;--light-blue-color:#03a9f4;--cyan-color:#00bcd4;--teal-color:#009688;--green-color:#4caf50;--light-green-color:#8bc34a;--lime-color:#cddc39;--yellow-color:#ffeb3b;--amber-color:#ffc107;--orange-color:#ff9800;--deep-orange-color:#ff6f22;--brown-color:#795548;--light-grey-color:#bdbdbd;--grey-color:#9e9e9e;--dark-grey-color:#606060;--blue-grey-color:#607d8b;--black-color:#000000;--white-color:#ffffff;--state-active-color:var(--amber-color);--state-inactive-color:var(--grey-color);--state-unavailable-color:var(--disabled-color);--state-alarm_control_panel-armed_away-color:var(--green-color);--state-alarm_control_panel-armed_custom_bypass-color:var(--green-color);--state-alarm_control_panel-armed_home-color:var(--green-color);--state-alarm_control_panel-armed_night-color:var(--green-color);--state-alarm_control_panel-armed_vacation-color:var(--green-color);--state-alarm_control_panel-arming-color:var(--orange-color);--state-alarm_control_panel-disarming-color:var(--orange-color);--state-alarm_control_panel-pending-color:var(--orange-color);--state-alarm_control_panel-triggered-color:var(--red-color);--state-alert-off-color:var(--orange-color);--state-alert-on-color:var(--red-color);--state-binary_sensor-active-color:var(--amber-color);--state-binary_sensor-battery-on-color:var(--red-color);--state-binary_sensor-carbon_monoxide-on-color:var(--red-color);--state-binary_sensor-gas-on-color:var(--red-color);--state-binary_sensor-heat-on-color:var(--red-color);--state-binary_sensor-lock-on-color:var(--red-color);--state-binary_sensor-moisture-on-color:var(--red-color);--state-binary_sensor-problem-on-color:var(--red-color);--state-binary_sensor-safety-on-color:var(--red-color);--state-binary_sensor-smoke-on-color:var(--red-color);--state-binary_sensor-sound-on-color:var(--red-color);--state-binary_sensor-tamper-on-color:var(--red-color);--state-climate-auto-color:var(--green-color);--state-climate-cool-color:var(--blue-color);--state-climate-dry-color:var(--orange-color);--state-climate-fan_only-color:var(--cyan-color);--state-climate-heat-color:var(--deep-orange-color);--state-climate-heat-cool-color:var(--amber-color);--state-cover-active-color:var(--purple-color);--state-device_tracker-active-color:var(--blue-color);--state-device_tracker-home-color:var(--green-color);--state-fan-active-color:var(--cyan-color);--state-humidifier-on-color:var(--blue-color);--state-lawn_mower-error-color:var(--red-color);--state-lawn_mower-mowing-color:var(--teal-color);--state-light-active-color:var(--amber-color);--state-lock-jammed-color:var(--red-color);--state-lock-locked-color:var(--green-color);--state-lock-pending-color:var(--orange-color);--state-lock-unlocked-color:var(--red-color);--state-media_player-active-color:var(--light-blue-color);--state-person-active-color:var(--blue-color);--state-person-home-color:var(--green-color);--state-plant-active-color:var(--red-color);--state-siren-active-color:var(--red-color);--state-sun-above_horizon-color:var(--amber-color);--state-sun-below_horizon-color:var(--indigo-color);--state-switch-active-color:var(--amber-color);--state-update-active-color:var(--orange-color);--state-vacuum-active-color:var(--teal-color);--state-valve-active-color:var(--blue-color);--state-sensor-battery-high-color:var(--green-color);--state-sensor-battery-low-color:var(--red-color);--state-sensor-battery-medium-color:var(--orange-color);--state-water_heater-eco-color:var(--green-color);--state-water_heater-electric-color:var(--orange-color);--state-water_heater-gas-color:var(--orange-color);--state-water_heater-heat_pump-color:var(--orange-color);--state-water_heater-high_demand-color:var(--deep-orange-color);--state-water_heater-performance-color:var(--deep-orange-color);--history-unavailable-color:transparent;--history-unknown-color:var(--dark-grey-color);--input-idle-line-color:rgba(0, 0, 0, 0.42);--input-hover-line-color:rgba(0, 0, 0, 0.87);--input-disabled-line-color:rgba(0, 0, 0, 0.06);--input-outlined-idle-border-color:rgba(0, 0, 0, 0.38);--input-outlined-hover-border-color:rgba(0, 0, 0, 0.87);--input-outlined-disabled-border-color:rgba(0, 0, 0, 0.06);--input-fill-color:rgb(245, 245, 245);--input-disabled-fill-color:rgb(250, 250, 250);--input-ink-color:rgba(0, 0, 0, 0.87);--input-label-ink-color:rgba(0, 0, 0, 0.6);--input-disabled-ink-color:rgba(0, 0, 0, 0.37);--input-dropdown-icon-color:rgba(0, 0, 0, 0.54);--material-h6-font-size:1.25rem;--material-small-font-size:0.875rem;--material-caption-font-size:0.75rem;--material-button-font-size:0.875rem;--shadow-transition:{transition:box-shadow .28s cubic-bezier(.4, 0, .2, 1)};--shadow-none:{box-shadow:none};--shadow-elevation-2dp:{box-shadow:0 2px 2px 0 rgba(0,0,0,.14),0 1px 5px 0 rgba(0,0,0,.12),0 3px 1px -2px rgba(0,0,0,.2)};--shadow-elevation-3dp:{box-shadow:0 3px 4px 0 rgba(0,0,0,.14),0 1px 8px 0 rgba(0,0,0,.12),0 3px 3px -2px rgba(0,0,0,.4)};--shadow-elevation-4dp:{box-shadow:0 4px 5px 0 rgba(0,0,0,.14),0 1px 10px 0 rgba(0,0,0,.12),0 2px 4px -1px rgba(0,0,0,.4)};--shadow-elevation-6dp:{box-shadow:0 6px 10px 0 rgba(0,0,0,.14),0 1px 18px 0 rgba(0,0,0,.12),0 3px 5px -1px rgba(0,0,0,.4)};--shadow-elevation-8dp:{box-shadow:0 8px 10px 1px rgba(0,0,0,.14),0 3px 14px 2px rgba(0,0,0,.12),0 5px 5px -3px rgba(0,0,0,.4)};--shadow-elevation-12dp:{box-shadow:0 12px 16px 1px rgba(0,0,0,.14),0 4px 22px 3px rgba(0,0,0,.12),0 6px 7px -4px rgba(0,0,0,.4)};--shadow-elevation-16dp:{box-shadow:0 16px 24px 2px rgba(0,0,0,.14),0 6px 30px 5px rgba(0,0,0,.12),0 8px 10px -5px rgba(0,0,0,.4)};--shadow-elevation-24dp:{box-shadow:0 24px 38px 3px rgba(0,0,0,.14),0 9px 46px 8px rgba(0,0,0,.12),0 11px 15px -7px rgba(0,0,0,.4)};--paper-font-common-base:{font-family:Roboto,Noto,sans-serif;-webkit-font-smoothing:antialiased};--paper-font-common-code:{font-family:"Roboto Mono",Consolas,Menlo,monospace;-webkit-font-smoothing:antialiased};--paper-font-common-expensive-kerning:{text-rendering:optimizeLegibility};--paper-font-common-nowrap:{white-space:nowrap;overflow:hidden;text-overflow:ellipsis};--paper-font-display4:{@apply --paper-font-common-base;@apply --paper-font-common-nowrap;font-size:112px;font-weight:300;letter-spacing:-.044em;line-height:120px};--paper-font-display3:{@apply --paper-font-common-base;@apply --paper-font-common-nowrap;font-size:56px;font-weight:400;letter-spacing:-.026em;line-height:60px};--paper-font-display2:{@apply --paper-font-common-base;font-size:45px;font-weight:400;letter-spacing:-.018em;line-height:48px};--paper-font-display1:{@apply --paper-font-common-base;font-size:34px;font-weight:400;letter-spacing:-.01em;line-height:40px};--paper-font-headline:{@apply --paper-font-common-base;font-size:24px;font-weight:400;letter-spacing:-.012em;line-height:32px};--paper-font-title:{@apply --paper-font-common-base;@apply --paper-font-common-nowrap;font-size:20px;font-weight:500;line-height:28px};--paper-font-subhead:{@apply --paper-font-common-base;font-size:16px;font-weight:400;line-height:24px};--paper-font-body2:{@apply --paper-font-common-base;font-size:14px;font-weight:500;line-height:24px};--paper-font-body1:{@apply --paper-font-common-base;font-size:14px;font-weight:400;line-height:20px};--paper-font-caption:{@apply --paper-font-common-base;@apply --paper-font-common-nowrap;font-size:12px;font-weight:400;letter-spacing:.011em;line-height:20px};--paper-font-menu:{@apply --paper-font-common-base;@apply --paper-font-common-nowrap;font-size:13px;font-weight:500;line-height:24px};--paper-font-button:{@apply --paper-font-common-base;@apply --paper-font-common-nowrap;font-size:14px;font-weight:500;letter-spacing:.018em;line-height:24px;text-transform:uppercase};--paper-font-code2:{@apply --paper-font-common-code;font-size:14px;font-weight:700;line-height:20px};--paper-font-code1:{@apply --paper-font-common-code;font-size:14px;font-weight:500;line-height:20px};direction:ltr;--direction:ltr;--float-start:left;--float-end:right;',"}"])),(0,a.$m)("#03a9f4"),(0,a.$m)("#ff9800"),(0,a.$m)(Object.entries(f).map((function(t){var e=(0,c.Z)(t,2),r=e[0],n=e[1];return"--".concat(r,": ").concat(n,";")})).join(""))).toString(),d=document.createElement("style");d.textContent=[h,s].join(""),document.head.append(d);l(63789),l(99397);if(/^((?!chrome|android).)*version\/14\.0\s.*safari/i.test(navigator.userAgent)){var p=window.Element.prototype.attachShadow;window.Element.prototype.attachShadow=function(t){return t&&t.delegatesFocus&&delete t.delegatesFocus,p.apply(this,[t])}}var v,y=l(33368),m=l(71650),g=l(68308),b=l(82390),w=l(69205),_=l(91808),E=l(34541),x=l(47838),S=(l(40271),l(85717),l(95260)),k=l(25518),A=(l(65974),l(88640),l(4096)),P=l(58579),O=function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1;return[t[0]-18*e,t[1],t[2]]},T=(l(34281),l(76843),function(t){for(var e=[0,0,0],r=0;r<t.length;r++){var n=t[r]/255;e[r]=n<=.03928?n/12.92:Math.pow((n+.055)/1.055,2.4)}return.2126*e[0]+.7152*e[1]+.0722*e[2]}),R=function(t,e){var r=T(t),n=T(e);return r>n?(r+.05)/(n+.05):(n+.05)/(r+.05)},C=["modes"],H={},I=function(t,e,r,n,o){var i,a,s=r||(o?e.theme:void 0),c=void 0!==(null==n?void 0:n.dark)?n.dark:e.darkMode,l=s,f={};if(s&&c&&(l="".concat(l,"__dark"),f=Object.assign({},u)),"default"===s){var h,d=null==n?void 0:n.primaryColor,p=null==n?void 0:n.accentColor;if(c&&d&&(f["app-header-background-color"]=(0,P.o)(d,"#121212",8)),d){l="".concat(l,"__primary_").concat(d);var v=(0,A.wK)(d),y=(0,A.Rw)(v);f["primary-color"]=d;var m=(0,A.p3)(function(t){return O(t,-(arguments.length>1&&void 0!==arguments[1]?arguments[1]:1))}(y));f["light-primary-color"]=(0,A.CO)(m),f["dark-primary-color"]=(0,A.uO)(O(y)),f["text-primary-color"]=R(v,[33,33,33])<6?"#fff":"#212121",f["text-light-primary-color"]=R(m,[33,33,33])<6?"#fff":"#212121",f["state-icon-color"]=f["dark-primary-color"]}if(p){l="".concat(l,"__accent_").concat(p),f["accent-color"]=p;var g=(0,A.wK)(p);f["text-accent-color"]=R(g,[33,33,33])<6?"#fff":"#212121"}if((null===(h=t.__themes)||void 0===h?void 0:h.cacheKey)===l)return}if(s&&"default"!==s&&e.themes[s]){var b=e.themes[s],w=b.modes,_=(0,k.Z)(b,C);f=Object.assign(Object.assign({},f),_),w&&(f=c?Object.assign(Object.assign({},f),w.dark):Object.assign(Object.assign({},f),w.light))}if(null!==(i=t.__themes)&&void 0!==i&&i.keys||Object.keys(f).length){var E=Object.keys(f).length&&l?H[l]||L(l,f):void 0,x=Object.assign(Object.assign({},null===(a=t.__themes)||void 0===a?void 0:a.keys),null==E?void 0:E.styles);if(t.__themes={cacheKey:l,keys:null==E?void 0:E.keys},t.updateStyles)t.updateStyles(x);else if(window.ShadyCSS)window.ShadyCSS.styleSubtree(t,x);else for(var S in x)null===S?t.style.removeProperty(S):t.style.setProperty(S,x[S])}},L=function(t,e){if(e&&Object.keys(e).length){for(var r=Object.assign(Object.assign({},f),e),n={},o={},i=0,a=Object.keys(r);i<a.length;i++){var s=a[i],c="--".concat(s),u=String(r[s]);if(n[c]=u,o[c]="",u.startsWith("#")){var l="rgb-".concat(s);if(void 0===r[l])try{var h=(0,A.wK)(u).join(","),d="--".concat(l);n[d]=h,o[d]=""}catch(p){continue}}}return H[t]={styles:n,keys:o},{styles:n,keys:o}}},N=l(18394),B=l(67684),M=l(6429),j=l(38480),$=l(60625),Z=l(93359),U=l(99312),D=l(81043),F=(l(47084),l(23792)),z=l(76775),G=(l(51467),l(43204));!function(t){t[t.EXPECT_ARGUMENT_CLOSING_BRACE=1]="EXPECT_ARGUMENT_CLOSING_BRACE",t[t.EMPTY_ARGUMENT=2]="EMPTY_ARGUMENT",t[t.MALFORMED_ARGUMENT=3]="MALFORMED_ARGUMENT",t[t.EXPECT_ARGUMENT_TYPE=4]="EXPECT_ARGUMENT_TYPE",t[t.INVALID_ARGUMENT_TYPE=5]="INVALID_ARGUMENT_TYPE",t[t.EXPECT_ARGUMENT_STYLE=6]="EXPECT_ARGUMENT_STYLE",t[t.INVALID_NUMBER_SKELETON=7]="INVALID_NUMBER_SKELETON",t[t.INVALID_DATE_TIME_SKELETON=8]="INVALID_DATE_TIME_SKELETON",t[t.EXPECT_NUMBER_SKELETON=9]="EXPECT_NUMBER_SKELETON",t[t.EXPECT_DATE_TIME_SKELETON=10]="EXPECT_DATE_TIME_SKELETON",t[t.UNCLOSED_QUOTE_IN_ARGUMENT_STYLE=11]="UNCLOSED_QUOTE_IN_ARGUMENT_STYLE",t[t.EXPECT_SELECT_ARGUMENT_OPTIONS=12]="EXPECT_SELECT_ARGUMENT_OPTIONS",t[t.EXPECT_PLURAL_ARGUMENT_OFFSET_VALUE=13]="EXPECT_PLURAL_ARGUMENT_OFFSET_VALUE",t[t.INVALID_PLURAL_ARGUMENT_OFFSET_VALUE=14]="INVALID_PLURAL_ARGUMENT_OFFSET_VALUE",t[t.EXPECT_SELECT_ARGUMENT_SELECTOR=15]="EXPECT_SELECT_ARGUMENT_SELECTOR",t[t.EXPECT_PLURAL_ARGUMENT_SELECTOR=16]="EXPECT_PLURAL_ARGUMENT_SELECTOR",t[t.EXPECT_SELECT_ARGUMENT_SELECTOR_FRAGMENT=17]="EXPECT_SELECT_ARGUMENT_SELECTOR_FRAGMENT",t[t.EXPECT_PLURAL_ARGUMENT_SELECTOR_FRAGMENT=18]="EXPECT_PLURAL_ARGUMENT_SELECTOR_FRAGMENT",t[t.INVALID_PLURAL_ARGUMENT_SELECTOR=19]="INVALID_PLURAL_ARGUMENT_SELECTOR",t[t.DUPLICATE_PLURAL_ARGUMENT_SELECTOR=20]="DUPLICATE_PLURAL_ARGUMENT_SELECTOR",t[t.DUPLICATE_SELECT_ARGUMENT_SELECTOR=21]="DUPLICATE_SELECT_ARGUMENT_SELECTOR",t[t.MISSING_OTHER_CLAUSE=22]="MISSING_OTHER_CLAUSE",t[t.INVALID_TAG=23]="INVALID_TAG",t[t.INVALID_TAG_NAME=25]="INVALID_TAG_NAME",t[t.UNMATCHED_CLOSING_TAG=26]="UNMATCHED_CLOSING_TAG",t[t.UNCLOSED_TAG=27]="UNCLOSED_TAG"}(v||(v={}));var V,W;l(10999),l(52117),l(82479),l(40924),l(90465),l(4600),l(10187),l(62544),l(60309),l(17692),l(24074),l(56308);function q(t){return t.type===V.literal}function K(t){return t.type===V.argument}function Y(t){return t.type===V.number}function X(t){return t.type===V.date}function J(t){return t.type===V.time}function Q(t){return t.type===V.select}function tt(t){return t.type===V.plural}function et(t){return t.type===V.pound}function rt(t){return t.type===V.tag}function nt(t){return!(!t||"object"!==(0,z.Z)(t)||t.type!==W.number)}function ot(t){return!(!t||"object"!==(0,z.Z)(t)||t.type!==W.dateTime)}!function(t){t[t.literal=0]="literal",t[t.argument=1]="argument",t[t.number=2]="number",t[t.date=3]="date",t[t.time=4]="time",t[t.select=5]="select",t[t.plural=6]="plural",t[t.pound=7]="pound",t[t.tag=8]="tag"}(V||(V={})),function(t){t[t.number=0]="number",t[t.dateTime=1]="dateTime"}(W||(W={}));var it=/[ \xA0\u1680\u2000-\u200A\u202F\u205F\u3000]/,at=/(?:[Eec]{1,6}|G{1,5}|[Qq]{1,5}|(?:[yYur]+|U{1,5})|[ML]{1,5}|d{1,2}|D{1,3}|F{1}|[abB]{1,5}|[hkHK]{1,2}|w{1,2}|W{1}|m{1,2}|s{1,2}|[zZOvVxX]{1,4})(?=([^']*'[^']*')*[^']*$)/g;function st(t){var e={};return t.replace(at,(function(t){var r=t.length;switch(t[0]){case"G":e.era=4===r?"long":5===r?"narrow":"short";break;case"y":e.year=2===r?"2-digit":"numeric";break;case"Y":case"u":case"U":case"r":throw new RangeError("`Y/u/U/r` (year) patterns are not supported, use `y` instead");case"q":case"Q":throw new RangeError("`q/Q` (quarter) patterns are not supported");case"M":case"L":e.month=["numeric","2-digit","short","long","narrow"][r-1];break;case"w":case"W":throw new RangeError("`w/W` (week) patterns are not supported");case"d":e.day=["numeric","2-digit"][r-1];break;case"D":case"F":case"g":throw new RangeError("`D/F/g` (day) patterns are not supported, use `d` instead");case"E":e.weekday=4===r?"long":5===r?"narrow":"short";break;case"e":if(r<4)throw new RangeError("`e..eee` (weekday) patterns are not supported");e.weekday=["short","long","narrow","short"][r-4];break;case"c":if(r<4)throw new RangeError("`c..ccc` (weekday) patterns are not supported");e.weekday=["short","long","narrow","short"][r-4];break;case"a":e.hour12=!0;break;case"b":case"B":throw new RangeError("`b/B` (period) patterns are not supported, use `a` instead");case"h":e.hourCycle="h12",e.hour=["numeric","2-digit"][r-1];break;case"H":e.hourCycle="h23",e.hour=["numeric","2-digit"][r-1];break;case"K":e.hourCycle="h11",e.hour=["numeric","2-digit"][r-1];break;case"k":e.hourCycle="h24",e.hour=["numeric","2-digit"][r-1];break;case"j":case"J":case"C":throw new RangeError("`j/J/C` (hour) patterns are not supported, use `h/H/K/k` instead");case"m":e.minute=["numeric","2-digit"][r-1];break;case"s":e.second=["numeric","2-digit"][r-1];break;case"S":case"A":throw new RangeError("`S/A` (second) patterns are not supported, use `s` instead");case"z":e.timeZoneName=r<4?"short":"long";break;case"Z":case"O":case"v":case"V":case"X":case"x":throw new RangeError("`Z/O/v/V/X/x` (timeZone) patterns are not supported, use `z` instead")}return""})),e}l(87438),l(22890),l(57778),l(67712);var ct=/[\t-\r \x85\u200E\u200F\u2028\u2029]/i;var ut=/^\.(?:(0+)(\*)?|(#+)|(0+)(#+))$/g,lt=/^(@+)?(\+|#+)?[rs]?$/g,ft=/(\*)(0+)|(#+)(0+)|(0+)/g,ht=/^(0+)$/;function dt(t){var e={};return"r"===t[t.length-1]?e.roundingPriority="morePrecision":"s"===t[t.length-1]&&(e.roundingPriority="lessPrecision"),t.replace(lt,(function(t,r,n){return"string"!=typeof n?(e.minimumSignificantDigits=r.length,e.maximumSignificantDigits=r.length):"+"===n?e.minimumSignificantDigits=r.length:"#"===r[0]?e.maximumSignificantDigits=r.length:(e.minimumSignificantDigits=r.length,e.maximumSignificantDigits=r.length+("string"==typeof n?n.length:0)),""})),e}function pt(t){switch(t){case"sign-auto":return{signDisplay:"auto"};case"sign-accounting":case"()":return{currencySign:"accounting"};case"sign-always":case"+!":return{signDisplay:"always"};case"sign-accounting-always":case"()!":return{signDisplay:"always",currencySign:"accounting"};case"sign-except-zero":case"+?":return{signDisplay:"exceptZero"};case"sign-accounting-except-zero":case"()?":return{signDisplay:"exceptZero",currencySign:"accounting"};case"sign-never":case"+_":return{signDisplay:"never"}}}function vt(t){var e;if("E"===t[0]&&"E"===t[1]?(e={notation:"engineering"},t=t.slice(2)):"E"===t[0]&&(e={notation:"scientific"},t=t.slice(1)),e){var r=t.slice(0,2);if("+!"===r?(e.signDisplay="always",t=t.slice(2)):"+?"===r&&(e.signDisplay="exceptZero",t=t.slice(2)),!ht.test(t))throw new Error("Malformed concise eng/scientific notation");e.minimumIntegerDigits=t.length}return e}function yt(t){var e=pt(t);return e||{}}function mt(t){for(var e={},r=0,n=t;r<n.length;r++){var o=n[r];switch(o.stem){case"percent":case"%":e.style="percent";continue;case"%x100":e.style="percent",e.scale=100;continue;case"currency":e.style="currency",e.currency=o.options[0];continue;case"group-off":case",_":e.useGrouping=!1;continue;case"precision-integer":case".":e.maximumFractionDigits=0;continue;case"measure-unit":case"unit":e.style="unit",e.unit=o.options[0].replace(/^(.*?)-/,"");continue;case"compact-short":case"K":e.notation="compact",e.compactDisplay="short";continue;case"compact-long":case"KK":e.notation="compact",e.compactDisplay="long";continue;case"scientific":e=(0,G.__assign)((0,G.__assign)((0,G.__assign)({},e),{notation:"scientific"}),o.options.reduce((function(t,e){return(0,G.__assign)((0,G.__assign)({},t),yt(e))}),{}));continue;case"engineering":e=(0,G.__assign)((0,G.__assign)((0,G.__assign)({},e),{notation:"engineering"}),o.options.reduce((function(t,e){return(0,G.__assign)((0,G.__assign)({},t),yt(e))}),{}));continue;case"notation-simple":e.notation="standard";continue;case"unit-width-narrow":e.currencyDisplay="narrowSymbol",e.unitDisplay="narrow";continue;case"unit-width-short":e.currencyDisplay="code",e.unitDisplay="short";continue;case"unit-width-full-name":e.currencyDisplay="name",e.unitDisplay="long";continue;case"unit-width-iso-code":e.currencyDisplay="symbol";continue;case"scale":e.scale=parseFloat(o.options[0]);continue;case"integer-width":if(o.options.length>1)throw new RangeError("integer-width stems only accept a single optional option");o.options[0].replace(ft,(function(t,r,n,o,i,a){if(r)e.minimumIntegerDigits=n.length;else{if(o&&i)throw new Error("We currently do not support maximum integer digits");if(a)throw new Error("We currently do not support exact integer digits")}return""}));continue}if(ht.test(o.stem))e.minimumIntegerDigits=o.stem.length;else if(ut.test(o.stem)){if(o.options.length>1)throw new RangeError("Fraction-precision stems only accept a single optional option");o.stem.replace(ut,(function(t,r,n,o,i,a){return"*"===n?e.minimumFractionDigits=r.length:o&&"#"===o[0]?e.maximumFractionDigits=o.length:i&&a?(e.minimumFractionDigits=i.length,e.maximumFractionDigits=i.length+a.length):(e.minimumFractionDigits=r.length,e.maximumFractionDigits=r.length),""}));var i=o.options[0];"w"===i?e=(0,G.__assign)((0,G.__assign)({},e),{trailingZeroDisplay:"stripIfInteger"}):i&&(e=(0,G.__assign)((0,G.__assign)({},e),dt(i)))}else if(lt.test(o.stem))e=(0,G.__assign)((0,G.__assign)({},e),dt(o.stem));else{var a=pt(o.stem);a&&(e=(0,G.__assign)((0,G.__assign)({},e),a));var s=vt(o.stem);s&&(e=(0,G.__assign)((0,G.__assign)({},e),s))}}return e}var gt,bt={"001":["H","h"],AC:["H","h","hb","hB"],AD:["H","hB"],AE:["h","hB","hb","H"],AF:["H","hb","hB","h"],AG:["h","hb","H","hB"],AI:["H","h","hb","hB"],AL:["h","H","hB"],AM:["H","hB"],AO:["H","hB"],AR:["H","h","hB","hb"],AS:["h","H"],AT:["H","hB"],AU:["h","hb","H","hB"],AW:["H","hB"],AX:["H"],AZ:["H","hB","h"],BA:["H","hB","h"],BB:["h","hb","H","hB"],BD:["h","hB","H"],BE:["H","hB"],BF:["H","hB"],BG:["H","hB","h"],BH:["h","hB","hb","H"],BI:["H","h"],BJ:["H","hB"],BL:["H","hB"],BM:["h","hb","H","hB"],BN:["hb","hB","h","H"],BO:["H","hB","h","hb"],BQ:["H"],BR:["H","hB"],BS:["h","hb","H","hB"],BT:["h","H"],BW:["H","h","hb","hB"],BY:["H","h"],BZ:["H","h","hb","hB"],CA:["h","hb","H","hB"],CC:["H","h","hb","hB"],CD:["hB","H"],CF:["H","h","hB"],CG:["H","hB"],CH:["H","hB","h"],CI:["H","hB"],CK:["H","h","hb","hB"],CL:["H","h","hB","hb"],CM:["H","h","hB"],CN:["H","hB","hb","h"],CO:["h","H","hB","hb"],CP:["H"],CR:["H","h","hB","hb"],CU:["H","h","hB","hb"],CV:["H","hB"],CW:["H","hB"],CX:["H","h","hb","hB"],CY:["h","H","hb","hB"],CZ:["H"],DE:["H","hB"],DG:["H","h","hb","hB"],DJ:["h","H"],DK:["H"],DM:["h","hb","H","hB"],DO:["h","H","hB","hb"],DZ:["h","hB","hb","H"],EA:["H","h","hB","hb"],EC:["H","hB","h","hb"],EE:["H","hB"],EG:["h","hB","hb","H"],EH:["h","hB","hb","H"],ER:["h","H"],ES:["H","hB","h","hb"],ET:["hB","hb","h","H"],FI:["H"],FJ:["h","hb","H","hB"],FK:["H","h","hb","hB"],FM:["h","hb","H","hB"],FO:["H","h"],FR:["H","hB"],GA:["H","hB"],GB:["H","h","hb","hB"],GD:["h","hb","H","hB"],GE:["H","hB","h"],GF:["H","hB"],GG:["H","h","hb","hB"],GH:["h","H"],GI:["H","h","hb","hB"],GL:["H","h"],GM:["h","hb","H","hB"],GN:["H","hB"],GP:["H","hB"],GQ:["H","hB","h","hb"],GR:["h","H","hb","hB"],GT:["H","h","hB","hb"],GU:["h","hb","H","hB"],GW:["H","hB"],GY:["h","hb","H","hB"],HK:["h","hB","hb","H"],HN:["H","h","hB","hb"],HR:["H","hB"],HU:["H","h"],IC:["H","h","hB","hb"],ID:["H"],IE:["H","h","hb","hB"],IL:["H","hB"],IM:["H","h","hb","hB"],IN:["h","H"],IO:["H","h","hb","hB"],IQ:["h","hB","hb","H"],IR:["hB","H"],IS:["H"],IT:["H","hB"],JE:["H","h","hb","hB"],JM:["h","hb","H","hB"],JO:["h","hB","hb","H"],JP:["H","K","h"],KE:["hB","hb","H","h"],KG:["H","h","hB","hb"],KH:["hB","h","H","hb"],KI:["h","hb","H","hB"],KM:["H","h","hB","hb"],KN:["h","hb","H","hB"],KP:["h","H","hB","hb"],KR:["h","H","hB","hb"],KW:["h","hB","hb","H"],KY:["h","hb","H","hB"],KZ:["H","hB"],LA:["H","hb","hB","h"],LB:["h","hB","hb","H"],LC:["h","hb","H","hB"],LI:["H","hB","h"],LK:["H","h","hB","hb"],LR:["h","hb","H","hB"],LS:["h","H"],LT:["H","h","hb","hB"],LU:["H","h","hB"],LV:["H","hB","hb","h"],LY:["h","hB","hb","H"],MA:["H","h","hB","hb"],MC:["H","hB"],MD:["H","hB"],ME:["H","hB","h"],MF:["H","hB"],MG:["H","h"],MH:["h","hb","H","hB"],MK:["H","h","hb","hB"],ML:["H"],MM:["hB","hb","H","h"],MN:["H","h","hb","hB"],MO:["h","hB","hb","H"],MP:["h","hb","H","hB"],MQ:["H","hB"],MR:["h","hB","hb","H"],MS:["H","h","hb","hB"],MT:["H","h"],MU:["H","h"],MV:["H","h"],MW:["h","hb","H","hB"],MX:["H","h","hB","hb"],MY:["hb","hB","h","H"],MZ:["H","hB"],NA:["h","H","hB","hb"],NC:["H","hB"],NE:["H"],NF:["H","h","hb","hB"],NG:["H","h","hb","hB"],NI:["H","h","hB","hb"],NL:["H","hB"],NO:["H","h"],NP:["H","h","hB"],NR:["H","h","hb","hB"],NU:["H","h","hb","hB"],NZ:["h","hb","H","hB"],OM:["h","hB","hb","H"],PA:["h","H","hB","hb"],PE:["H","hB","h","hb"],PF:["H","h","hB"],PG:["h","H"],PH:["h","hB","hb","H"],PK:["h","hB","H"],PL:["H","h"],PM:["H","hB"],PN:["H","h","hb","hB"],PR:["h","H","hB","hb"],PS:["h","hB","hb","H"],PT:["H","hB"],PW:["h","H"],PY:["H","h","hB","hb"],QA:["h","hB","hb","H"],RE:["H","hB"],RO:["H","hB"],RS:["H","hB","h"],RU:["H"],RW:["H","h"],SA:["h","hB","hb","H"],SB:["h","hb","H","hB"],SC:["H","h","hB"],SD:["h","hB","hb","H"],SE:["H"],SG:["h","hb","H","hB"],SH:["H","h","hb","hB"],SI:["H","hB"],SJ:["H"],SK:["H"],SL:["h","hb","H","hB"],SM:["H","h","hB"],SN:["H","h","hB"],SO:["h","H"],SR:["H","hB"],SS:["h","hb","H","hB"],ST:["H","hB"],SV:["H","h","hB","hb"],SX:["H","h","hb","hB"],SY:["h","hB","hb","H"],SZ:["h","hb","H","hB"],TA:["H","h","hb","hB"],TC:["h","hb","H","hB"],TD:["h","H","hB"],TF:["H","h","hB"],TG:["H","hB"],TH:["H","h"],TJ:["H","h"],TL:["H","hB","hb","h"],TM:["H","h"],TN:["h","hB","hb","H"],TO:["h","H"],TR:["H","hB"],TT:["h","hb","H","hB"],TW:["hB","hb","h","H"],TZ:["hB","hb","H","h"],UA:["H","hB","h"],UG:["hB","hb","H","h"],UM:["h","hb","H","hB"],US:["h","hb","H","hB"],UY:["H","h","hB","hb"],UZ:["H","hB","h"],VA:["H","h","hB"],VC:["h","hb","H","hB"],VE:["h","H","hB","hb"],VG:["h","hb","H","hB"],VI:["h","hb","H","hB"],VN:["H","h"],VU:["h","H"],WF:["H","hB"],WS:["h","H"],XK:["H","hB","h"],YE:["h","hB","hb","H"],YT:["H","hB"],ZA:["H","h","hb","hB"],ZM:["h","hb","H","hB"],ZW:["H","h"],"af-ZA":["H","h","hB","hb"],"ar-001":["h","hB","hb","H"],"ca-ES":["H","h","hB"],"en-001":["h","hb","H","hB"],"es-BO":["H","h","hB","hb"],"es-BR":["H","h","hB","hb"],"es-EC":["H","h","hB","hb"],"es-ES":["H","h","hB","hb"],"es-GQ":["H","h","hB","hb"],"es-PE":["H","h","hB","hb"],"fr-CA":["H","h","hB"],"gl-ES":["H","h","hB"],"gu-IN":["hB","hb","h","H"],"hi-IN":["hB","h","H"],"it-CH":["H","h","hB"],"it-IT":["H","h","hB"],"kn-IN":["hB","h","H"],"ml-IN":["hB","h","H"],"mr-IN":["hB","hb","h","H"],"pa-IN":["hB","hb","h","H"],"ta-IN":["hB","h","hb","H"],"te-IN":["hB","h","H"],"zu-ZA":["H","hB","hb","h"]};function wt(t){var e=t.hourCycle;if(void 0===e&&t.hourCycles&&t.hourCycles.length&&(e=t.hourCycles[0]),e)switch(e){case"h24":return"k";case"h23":return"H";case"h12":return"h";case"h11":return"K";default:throw new Error("Invalid hourCycle")}var r,n=t.language;return"root"!==n&&(r=t.maximize().region),(bt[r||""]||bt[n||""]||bt["".concat(n,"-001")]||bt["001"])[0]}var _t=new RegExp("^".concat(it.source,"*")),Et=new RegExp("".concat(it.source,"*$"));function xt(t,e){return{start:t,end:e}}var St=!!String.prototype.startsWith&&"_a".startsWith("a",1),kt=!!String.fromCodePoint,At=!!Object.fromEntries,Pt=!!String.prototype.codePointAt,Ot=!!String.prototype.trimStart,Tt=!!String.prototype.trimEnd,Rt=!!Number.isSafeInteger?Number.isSafeInteger:function(t){return"number"==typeof t&&isFinite(t)&&Math.floor(t)===t&&Math.abs(t)<=9007199254740991},Ct=!0;try{Ct="a"===(null===(gt=$t("([^\\p{White_Space}\\p{Pattern_Syntax}]*)","yu").exec("a"))||void 0===gt?void 0:gt[0])}catch(Te){Ct=!1}var Ht,It=St?function(t,e,r){return t.startsWith(e,r)}:function(t,e,r){return t.slice(r,r+e.length)===e},Lt=kt?String.fromCodePoint:function(){for(var t=[],e=0;e<arguments.length;e++)t[e]=arguments[e];for(var r,n="",o=t.length,i=0;o>i;){if((r=t[i++])>1114111)throw RangeError(r+" is not a valid code point");n+=r<65536?String.fromCharCode(r):String.fromCharCode(55296+((r-=65536)>>10),r%1024+56320)}return n},Nt=At?Object.fromEntries:function(t){for(var e={},r=0,n=t;r<n.length;r++){var o=n[r],i=o[0],a=o[1];e[i]=a}return e},Bt=Pt?function(t,e){return t.codePointAt(e)}:function(t,e){var r=t.length;if(!(e<0||e>=r)){var n,o=t.charCodeAt(e);return o<55296||o>56319||e+1===r||(n=t.charCodeAt(e+1))<56320||n>57343?o:n-56320+(o-55296<<10)+65536}},Mt=Ot?function(t){return t.trimStart()}:function(t){return t.replace(_t,"")},jt=Tt?function(t){return t.trimEnd()}:function(t){return t.replace(Et,"")};function $t(t,e){return new RegExp(t,e)}if(Ct){var Zt=$t("([^\\p{White_Space}\\p{Pattern_Syntax}]*)","yu");Ht=function(t,e){var r;return Zt.lastIndex=e,null!==(r=Zt.exec(t)[1])&&void 0!==r?r:""}}else Ht=function(t,e){for(var r=[];;){var n=Bt(t,e);if(void 0===n||Ft(n)||zt(n))break;r.push(n),e+=n>=65536?2:1}return Lt.apply(void 0,r)};var Ut=function(){function t(t,e){void 0===e&&(e={}),this.message=t,this.position={offset:0,line:1,column:1},this.ignoreTag=!!e.ignoreTag,this.locale=e.locale,this.requiresOtherClause=!!e.requiresOtherClause,this.shouldParseSkeletons=!!e.shouldParseSkeletons}return t.prototype.parse=function(){if(0!==this.offset())throw Error("parser can only be used once");return this.parseMessage(0,"",!1)},t.prototype.parseMessage=function(t,e,r){for(var n=[];!this.isEOF();){var o=this.char();if(123===o){if((i=this.parseArgument(t,r)).err)return i;n.push(i.val)}else{if(125===o&&t>0)break;if(35!==o||"plural"!==e&&"selectordinal"!==e){if(60===o&&!this.ignoreTag&&47===this.peek()){if(r)break;return this.error(v.UNMATCHED_CLOSING_TAG,xt(this.clonePosition(),this.clonePosition()))}if(60===o&&!this.ignoreTag&&Dt(this.peek()||0)){if((i=this.parseTag(t,e)).err)return i;n.push(i.val)}else{var i;if((i=this.parseLiteral(t,e)).err)return i;n.push(i.val)}}else{var a=this.clonePosition();this.bump(),n.push({type:V.pound,location:xt(a,this.clonePosition())})}}}return{val:n,err:null}},t.prototype.parseTag=function(t,e){var r=this.clonePosition();this.bump();var n=this.parseTagName();if(this.bumpSpace(),this.bumpIf("/>"))return{val:{type:V.literal,value:"<".concat(n,"/>"),location:xt(r,this.clonePosition())},err:null};if(this.bumpIf(">")){var o=this.parseMessage(t+1,e,!0);if(o.err)return o;var i=o.val,a=this.clonePosition();if(this.bumpIf("</")){if(this.isEOF()||!Dt(this.char()))return this.error(v.INVALID_TAG,xt(a,this.clonePosition()));var s=this.clonePosition();return n!==this.parseTagName()?this.error(v.UNMATCHED_CLOSING_TAG,xt(s,this.clonePosition())):(this.bumpSpace(),this.bumpIf(">")?{val:{type:V.tag,value:n,children:i,location:xt(r,this.clonePosition())},err:null}:this.error(v.INVALID_TAG,xt(a,this.clonePosition())))}return this.error(v.UNCLOSED_TAG,xt(r,this.clonePosition()))}return this.error(v.INVALID_TAG,xt(r,this.clonePosition()))},t.prototype.parseTagName=function(){var t,e=this.offset();for(this.bump();!this.isEOF()&&(45===(t=this.char())||46===t||t>=48&&t<=57||95===t||t>=97&&t<=122||t>=65&&t<=90||183==t||t>=192&&t<=214||t>=216&&t<=246||t>=248&&t<=893||t>=895&&t<=8191||t>=8204&&t<=8205||t>=8255&&t<=8256||t>=8304&&t<=8591||t>=11264&&t<=12271||t>=12289&&t<=55295||t>=63744&&t<=64975||t>=65008&&t<=65533||t>=65536&&t<=983039);)this.bump();return this.message.slice(e,this.offset())},t.prototype.parseLiteral=function(t,e){for(var r=this.clonePosition(),n="";;){var o=this.tryParseQuote(e);if(o)n+=o;else{var i=this.tryParseUnquoted(t,e);if(i)n+=i;else{var a=this.tryParseLeftAngleBracket();if(!a)break;n+=a}}}var s=xt(r,this.clonePosition());return{val:{type:V.literal,value:n,location:s},err:null}},t.prototype.tryParseLeftAngleBracket=function(){return this.isEOF()||60!==this.char()||!this.ignoreTag&&(Dt(t=this.peek()||0)||47===t)?null:(this.bump(),"<");var t},t.prototype.tryParseQuote=function(t){if(this.isEOF()||39!==this.char())return null;switch(this.peek()){case 39:return this.bump(),this.bump(),"'";case 123:case 60:case 62:case 125:break;case 35:if("plural"===t||"selectordinal"===t)break;return null;default:return null}this.bump();var e=[this.char()];for(this.bump();!this.isEOF();){var r=this.char();if(39===r){if(39!==this.peek()){this.bump();break}e.push(39),this.bump()}else e.push(r);this.bump()}return Lt.apply(void 0,e)},t.prototype.tryParseUnquoted=function(t,e){if(this.isEOF())return null;var r=this.char();return 60===r||123===r||35===r&&("plural"===e||"selectordinal"===e)||125===r&&t>0?null:(this.bump(),Lt(r))},t.prototype.parseArgument=function(t,e){var r=this.clonePosition();if(this.bump(),this.bumpSpace(),this.isEOF())return this.error(v.EXPECT_ARGUMENT_CLOSING_BRACE,xt(r,this.clonePosition()));if(125===this.char())return this.bump(),this.error(v.EMPTY_ARGUMENT,xt(r,this.clonePosition()));var n=this.parseIdentifierIfPossible().value;if(!n)return this.error(v.MALFORMED_ARGUMENT,xt(r,this.clonePosition()));if(this.bumpSpace(),this.isEOF())return this.error(v.EXPECT_ARGUMENT_CLOSING_BRACE,xt(r,this.clonePosition()));switch(this.char()){case 125:return this.bump(),{val:{type:V.argument,value:n,location:xt(r,this.clonePosition())},err:null};case 44:return this.bump(),this.bumpSpace(),this.isEOF()?this.error(v.EXPECT_ARGUMENT_CLOSING_BRACE,xt(r,this.clonePosition())):this.parseArgumentOptions(t,e,n,r);default:return this.error(v.MALFORMED_ARGUMENT,xt(r,this.clonePosition()))}},t.prototype.parseIdentifierIfPossible=function(){var t=this.clonePosition(),e=this.offset(),r=Ht(this.message,e),n=e+r.length;return this.bumpTo(n),{value:r,location:xt(t,this.clonePosition())}},t.prototype.parseArgumentOptions=function(t,e,r,n){var o,i=this.clonePosition(),a=this.parseIdentifierIfPossible().value,s=this.clonePosition();switch(a){case"":return this.error(v.EXPECT_ARGUMENT_TYPE,xt(i,s));case"number":case"date":case"time":this.bumpSpace();var c=null;if(this.bumpIf(",")){this.bumpSpace();var u=this.clonePosition();if((g=this.parseSimpleArgStyleIfPossible()).err)return g;if(0===(d=jt(g.val)).length)return this.error(v.EXPECT_ARGUMENT_STYLE,xt(this.clonePosition(),this.clonePosition()));c={style:d,styleLocation:xt(u,this.clonePosition())}}if((b=this.tryParseArgumentClose(n)).err)return b;var l=xt(n,this.clonePosition());if(c&&It(null==c?void 0:c.style,"::",0)){var f=Mt(c.style.slice(2));if("number"===a)return(g=this.parseNumberSkeletonFromString(f,c.styleLocation)).err?g:{val:{type:V.number,value:r,location:l,style:g.val},err:null};if(0===f.length)return this.error(v.EXPECT_DATE_TIME_SKELETON,l);var h=f;this.locale&&(h=function(t,e){for(var r="",n=0;n<t.length;n++){var o=t.charAt(n);if("j"===o){for(var i=0;n+1<t.length&&t.charAt(n+1)===o;)i++,n++;var a=1+(1&i),s=i<2?1:3+(i>>1),c=wt(e);for("H"!=c&&"k"!=c||(s=0);s-- >0;)r+="a";for(;a-- >0;)r=c+r}else r+="J"===o?"H":o}return r}(f,this.locale));var d={type:W.dateTime,pattern:h,location:c.styleLocation,parsedOptions:this.shouldParseSkeletons?st(h):{}};return{val:{type:"date"===a?V.date:V.time,value:r,location:l,style:d},err:null}}return{val:{type:"number"===a?V.number:"date"===a?V.date:V.time,value:r,location:l,style:null!==(o=null==c?void 0:c.style)&&void 0!==o?o:null},err:null};case"plural":case"selectordinal":case"select":var p=this.clonePosition();if(this.bumpSpace(),!this.bumpIf(","))return this.error(v.EXPECT_SELECT_ARGUMENT_OPTIONS,xt(p,(0,G.__assign)({},p)));this.bumpSpace();var y=this.parseIdentifierIfPossible(),m=0;if("select"!==a&&"offset"===y.value){if(!this.bumpIf(":"))return this.error(v.EXPECT_PLURAL_ARGUMENT_OFFSET_VALUE,xt(this.clonePosition(),this.clonePosition()));var g;if(this.bumpSpace(),(g=this.tryParseDecimalInteger(v.EXPECT_PLURAL_ARGUMENT_OFFSET_VALUE,v.INVALID_PLURAL_ARGUMENT_OFFSET_VALUE)).err)return g;this.bumpSpace(),y=this.parseIdentifierIfPossible(),m=g.val}var b,w=this.tryParsePluralOrSelectOptions(t,a,e,y);if(w.err)return w;if((b=this.tryParseArgumentClose(n)).err)return b;var _=xt(n,this.clonePosition());return"select"===a?{val:{type:V.select,value:r,options:Nt(w.val),location:_},err:null}:{val:{type:V.plural,value:r,options:Nt(w.val),offset:m,pluralType:"plural"===a?"cardinal":"ordinal",location:_},err:null};default:return this.error(v.INVALID_ARGUMENT_TYPE,xt(i,s))}},t.prototype.tryParseArgumentClose=function(t){return this.isEOF()||125!==this.char()?this.error(v.EXPECT_ARGUMENT_CLOSING_BRACE,xt(t,this.clonePosition())):(this.bump(),{val:!0,err:null})},t.prototype.parseSimpleArgStyleIfPossible=function(){for(var t=0,e=this.clonePosition();!this.isEOF();){switch(this.char()){case 39:this.bump();var r=this.clonePosition();if(!this.bumpUntil("'"))return this.error(v.UNCLOSED_QUOTE_IN_ARGUMENT_STYLE,xt(r,this.clonePosition()));this.bump();break;case 123:t+=1,this.bump();break;case 125:if(!(t>0))return{val:this.message.slice(e.offset,this.offset()),err:null};t-=1;break;default:this.bump()}}return{val:this.message.slice(e.offset,this.offset()),err:null}},t.prototype.parseNumberSkeletonFromString=function(t,e){var r=[];try{r=function(t){if(0===t.length)throw new Error("Number skeleton cannot be empty");for(var e=[],r=0,n=t.split(ct).filter((function(t){return t.length>0}));r<n.length;r++){var o=n[r].split("/");if(0===o.length)throw new Error("Invalid number skeleton");for(var i=o[0],a=o.slice(1),s=0,c=a;s<c.length;s++)if(0===c[s].length)throw new Error("Invalid number skeleton");e.push({stem:i,options:a})}return e}(t)}catch(n){return this.error(v.INVALID_NUMBER_SKELETON,e)}return{val:{type:W.number,tokens:r,location:e,parsedOptions:this.shouldParseSkeletons?mt(r):{}},err:null}},t.prototype.tryParsePluralOrSelectOptions=function(t,e,r,n){for(var o,i=!1,a=[],s=new Set,c=n.value,u=n.location;;){if(0===c.length){var l=this.clonePosition();if("select"===e||!this.bumpIf("="))break;var f=this.tryParseDecimalInteger(v.EXPECT_PLURAL_ARGUMENT_SELECTOR,v.INVALID_PLURAL_ARGUMENT_SELECTOR);if(f.err)return f;u=xt(l,this.clonePosition()),c=this.message.slice(l.offset,this.offset())}if(s.has(c))return this.error("select"===e?v.DUPLICATE_SELECT_ARGUMENT_SELECTOR:v.DUPLICATE_PLURAL_ARGUMENT_SELECTOR,u);"other"===c&&(i=!0),this.bumpSpace();var h=this.clonePosition();if(!this.bumpIf("{"))return this.error("select"===e?v.EXPECT_SELECT_ARGUMENT_SELECTOR_FRAGMENT:v.EXPECT_PLURAL_ARGUMENT_SELECTOR_FRAGMENT,xt(this.clonePosition(),this.clonePosition()));var d=this.parseMessage(t+1,e,r);if(d.err)return d;var p=this.tryParseArgumentClose(h);if(p.err)return p;a.push([c,{value:d.val,location:xt(h,this.clonePosition())}]),s.add(c),this.bumpSpace(),c=(o=this.parseIdentifierIfPossible()).value,u=o.location}return 0===a.length?this.error("select"===e?v.EXPECT_SELECT_ARGUMENT_SELECTOR:v.EXPECT_PLURAL_ARGUMENT_SELECTOR,xt(this.clonePosition(),this.clonePosition())):this.requiresOtherClause&&!i?this.error(v.MISSING_OTHER_CLAUSE,xt(this.clonePosition(),this.clonePosition())):{val:a,err:null}},t.prototype.tryParseDecimalInteger=function(t,e){var r=1,n=this.clonePosition();this.bumpIf("+")||this.bumpIf("-")&&(r=-1);for(var o=!1,i=0;!this.isEOF();){var a=this.char();if(!(a>=48&&a<=57))break;o=!0,i=10*i+(a-48),this.bump()}var s=xt(n,this.clonePosition());return o?Rt(i*=r)?{val:i,err:null}:this.error(e,s):this.error(t,s)},t.prototype.offset=function(){return this.position.offset},t.prototype.isEOF=function(){return this.offset()===this.message.length},t.prototype.clonePosition=function(){return{offset:this.position.offset,line:this.position.line,column:this.position.column}},t.prototype.char=function(){var t=this.position.offset;if(t>=this.message.length)throw Error("out of bound");var e=Bt(this.message,t);if(void 0===e)throw Error("Offset ".concat(t," is at invalid UTF-16 code unit boundary"));return e},t.prototype.error=function(t,e){return{val:null,err:{kind:t,message:this.message,location:e}}},t.prototype.bump=function(){if(!this.isEOF()){var t=this.char();10===t?(this.position.line+=1,this.position.column=1,this.position.offset+=1):(this.position.column+=1,this.position.offset+=t<65536?1:2)}},t.prototype.bumpIf=function(t){if(It(this.message,t,this.offset())){for(var e=0;e<t.length;e++)this.bump();return!0}return!1},t.prototype.bumpUntil=function(t){var e=this.offset(),r=this.message.indexOf(t,e);return r>=0?(this.bumpTo(r),!0):(this.bumpTo(this.message.length),!1)},t.prototype.bumpTo=function(t){if(this.offset()>t)throw Error("targetOffset ".concat(t," must be greater than or equal to the current offset ").concat(this.offset()));for(t=Math.min(t,this.message.length);;){var e=this.offset();if(e===t)break;if(e>t)throw Error("targetOffset ".concat(t," is at invalid UTF-16 code unit boundary"));if(this.bump(),this.isEOF())break}},t.prototype.bumpSpace=function(){for(;!this.isEOF()&&Ft(this.char());)this.bump()},t.prototype.peek=function(){if(this.isEOF())return null;var t=this.char(),e=this.offset(),r=this.message.charCodeAt(e+(t>=65536?2:1));return null!=r?r:null},t}();function Dt(t){return t>=97&&t<=122||t>=65&&t<=90}function Ft(t){return t>=9&&t<=13||32===t||133===t||t>=8206&&t<=8207||8232===t||8233===t}function zt(t){return t>=33&&t<=35||36===t||t>=37&&t<=39||40===t||41===t||42===t||43===t||44===t||45===t||t>=46&&t<=47||t>=58&&t<=59||t>=60&&t<=62||t>=63&&t<=64||91===t||92===t||93===t||94===t||96===t||123===t||124===t||125===t||126===t||161===t||t>=162&&t<=165||166===t||167===t||169===t||171===t||172===t||174===t||176===t||177===t||182===t||187===t||191===t||215===t||247===t||t>=8208&&t<=8213||t>=8214&&t<=8215||8216===t||8217===t||8218===t||t>=8219&&t<=8220||8221===t||8222===t||8223===t||t>=8224&&t<=8231||t>=8240&&t<=8248||8249===t||8250===t||t>=8251&&t<=8254||t>=8257&&t<=8259||8260===t||8261===t||8262===t||t>=8263&&t<=8273||8274===t||8275===t||t>=8277&&t<=8286||t>=8592&&t<=8596||t>=8597&&t<=8601||t>=8602&&t<=8603||t>=8604&&t<=8607||8608===t||t>=8609&&t<=8610||8611===t||t>=8612&&t<=8613||8614===t||t>=8615&&t<=8621||8622===t||t>=8623&&t<=8653||t>=8654&&t<=8655||t>=8656&&t<=8657||8658===t||8659===t||8660===t||t>=8661&&t<=8691||t>=8692&&t<=8959||t>=8960&&t<=8967||8968===t||8969===t||8970===t||8971===t||t>=8972&&t<=8991||t>=8992&&t<=8993||t>=8994&&t<=9e3||9001===t||9002===t||t>=9003&&t<=9083||9084===t||t>=9085&&t<=9114||t>=9115&&t<=9139||t>=9140&&t<=9179||t>=9180&&t<=9185||t>=9186&&t<=9254||t>=9255&&t<=9279||t>=9280&&t<=9290||t>=9291&&t<=9311||t>=9472&&t<=9654||9655===t||t>=9656&&t<=9664||9665===t||t>=9666&&t<=9719||t>=9720&&t<=9727||t>=9728&&t<=9838||9839===t||t>=9840&&t<=10087||10088===t||10089===t||10090===t||10091===t||10092===t||10093===t||10094===t||10095===t||10096===t||10097===t||10098===t||10099===t||10100===t||10101===t||t>=10132&&t<=10175||t>=10176&&t<=10180||10181===t||10182===t||t>=10183&&t<=10213||10214===t||10215===t||10216===t||10217===t||10218===t||10219===t||10220===t||10221===t||10222===t||10223===t||t>=10224&&t<=10239||t>=10240&&t<=10495||t>=10496&&t<=10626||10627===t||10628===t||10629===t||10630===t||10631===t||10632===t||10633===t||10634===t||10635===t||10636===t||10637===t||10638===t||10639===t||10640===t||10641===t||10642===t||10643===t||10644===t||10645===t||10646===t||10647===t||10648===t||t>=10649&&t<=10711||10712===t||10713===t||10714===t||10715===t||t>=10716&&t<=10747||10748===t||10749===t||t>=10750&&t<=11007||t>=11008&&t<=11055||t>=11056&&t<=11076||t>=11077&&t<=11078||t>=11079&&t<=11084||t>=11085&&t<=11123||t>=11124&&t<=11125||t>=11126&&t<=11157||11158===t||t>=11159&&t<=11263||t>=11776&&t<=11777||11778===t||11779===t||11780===t||11781===t||t>=11782&&t<=11784||11785===t||11786===t||11787===t||11788===t||11789===t||t>=11790&&t<=11798||11799===t||t>=11800&&t<=11801||11802===t||11803===t||11804===t||11805===t||t>=11806&&t<=11807||11808===t||11809===t||11810===t||11811===t||11812===t||11813===t||11814===t||11815===t||11816===t||11817===t||t>=11818&&t<=11822||11823===t||t>=11824&&t<=11833||t>=11834&&t<=11835||t>=11836&&t<=11839||11840===t||11841===t||11842===t||t>=11843&&t<=11855||t>=11856&&t<=11857||11858===t||t>=11859&&t<=11903||t>=12289&&t<=12291||12296===t||12297===t||12298===t||12299===t||12300===t||12301===t||12302===t||12303===t||12304===t||12305===t||t>=12306&&t<=12307||12308===t||12309===t||12310===t||12311===t||12312===t||12313===t||12314===t||12315===t||12316===t||12317===t||t>=12318&&t<=12319||12320===t||12336===t||64830===t||64831===t||t>=65093&&t<=65094}function Gt(t){t.forEach((function(t){if(delete t.location,Q(t)||tt(t))for(var e in t.options)delete t.options[e].location,Gt(t.options[e].value);else Y(t)&&nt(t.style)||(X(t)||J(t))&&ot(t.style)?delete t.style.location:rt(t)&&Gt(t.children)}))}function Vt(t,e){void 0===e&&(e={}),e=(0,G.__assign)({shouldParseSkeletons:!0,requiresOtherClause:!0},e);var r=new Ut(t,e).parse();if(r.err){var n=SyntaxError(v[r.err.kind]);throw n.location=r.err.location,n.originalMessage=r.err.message,n}return(null==e?void 0:e.captureLocation)||Gt(r.val),r.val}l(88770);function Wt(t,e){var r=e&&e.cache?e.cache:ee,n=e&&e.serializer?e.serializer:Jt;return(e&&e.strategy?e.strategy:Xt)(t,{cache:r,serializer:n})}function qt(t,e,r,n){var o,i=null==(o=n)||"number"==typeof o||"boolean"==typeof o?n:r(n),a=e.get(i);return void 0===a&&(a=t.call(this,n),e.set(i,a)),a}function Kt(t,e,r){var n=Array.prototype.slice.call(arguments,3),o=r(n),i=e.get(o);return void 0===i&&(i=t.apply(this,n),e.set(o,i)),i}function Yt(t,e,r,n,o){return r.bind(e,t,n,o)}function Xt(t,e){return Yt(t,this,1===t.length?qt:Kt,e.cache.create(),e.serializer)}var Jt=function(){return JSON.stringify(arguments)};function Qt(){this.cache=Object.create(null)}Qt.prototype.get=function(t){return this.cache[t]},Qt.prototype.set=function(t,e){this.cache[t]=e};var te,ee={create:function(){return new Qt}},re={variadic:function(t,e){return Yt(t,this,Kt,e.cache.create(),e.serializer)},monadic:function(t,e){return Yt(t,this,qt,e.cache.create(),e.serializer)}};!function(t){t.MISSING_VALUE="MISSING_VALUE",t.INVALID_VALUE="INVALID_VALUE",t.MISSING_INTL_API="MISSING_INTL_API"}(te||(te={}));var ne,oe=function(t){function e(e,r,n){var o=t.call(this,e)||this;return o.code=r,o.originalMessage=n,o}return(0,G.__extends)(e,t),e.prototype.toString=function(){return"[formatjs Error: ".concat(this.code,"] ").concat(this.message)},e}(Error),ie=function(t){function e(e,r,n,o){return t.call(this,'Invalid values for "'.concat(e,'": "').concat(r,'". Options are "').concat(Object.keys(n).join('", "'),'"'),te.INVALID_VALUE,o)||this}return(0,G.__extends)(e,t),e}(oe),ae=function(t){function e(e,r,n){return t.call(this,'Value for "'.concat(e,'" must be of type ').concat(r),te.INVALID_VALUE,n)||this}return(0,G.__extends)(e,t),e}(oe),se=function(t){function e(e,r){return t.call(this,'The intl string context variable "'.concat(e,'" was not provided to the string "').concat(r,'"'),te.MISSING_VALUE,r)||this}return(0,G.__extends)(e,t),e}(oe);function ce(t){return"function"==typeof t}function ue(t,e,r,n,o,i,a){if(1===t.length&&q(t[0]))return[{type:ne.literal,value:t[0].value}];for(var s=[],c=0,u=t;c<u.length;c++){var l=u[c];if(q(l))s.push({type:ne.literal,value:l.value});else if(et(l))"number"==typeof i&&s.push({type:ne.literal,value:r.getNumberFormat(e).format(i)});else{var f=l.value;if(!o||!(f in o))throw new se(f,a);var h=o[f];if(K(l))h&&"string"!=typeof h&&"number"!=typeof h||(h="string"==typeof h||"number"==typeof h?String(h):""),s.push({type:"string"==typeof h?ne.literal:ne.object,value:h});else if(X(l)){var d="string"==typeof l.style?n.date[l.style]:ot(l.style)?l.style.parsedOptions:void 0;s.push({type:ne.literal,value:r.getDateTimeFormat(e,d).format(h)})}else if(J(l)){d="string"==typeof l.style?n.time[l.style]:ot(l.style)?l.style.parsedOptions:n.time.medium;s.push({type:ne.literal,value:r.getDateTimeFormat(e,d).format(h)})}else if(Y(l)){(d="string"==typeof l.style?n.number[l.style]:nt(l.style)?l.style.parsedOptions:void 0)&&d.scale&&(h*=d.scale||1),s.push({type:ne.literal,value:r.getNumberFormat(e,d).format(h)})}else{if(rt(l)){var p=l.children,v=l.value,y=o[v];if(!ce(y))throw new ae(v,"function",a);var m=y(ue(p,e,r,n,o,i).map((function(t){return t.value})));Array.isArray(m)||(m=[m]),s.push.apply(s,m.map((function(t){return{type:"string"==typeof t?ne.literal:ne.object,value:t}})))}if(Q(l)){if(!(g=l.options[h]||l.options.other))throw new ie(l.value,h,Object.keys(l.options),a);s.push.apply(s,ue(g.value,e,r,n,o))}else if(tt(l)){var g;if(!(g=l.options["=".concat(h)])){if(!Intl.PluralRules)throw new oe('Intl.PluralRules is not available in this environment.\nTry polyfilling it using "@formatjs/intl-pluralrules"\n',te.MISSING_INTL_API,a);var b=r.getPluralRules(e,{type:l.pluralType}).select(h-(l.offset||0));g=l.options[b]||l.options.other}if(!g)throw new ie(l.value,h,Object.keys(l.options),a);s.push.apply(s,ue(g.value,e,r,n,o,h-(l.offset||0)))}else;}}}return function(t){return t.length<2?t:t.reduce((function(t,e){var r=t[t.length-1];return r&&r.type===ne.literal&&e.type===ne.literal?r.value+=e.value:t.push(e),t}),[])}(s)}function le(t,e){return e?Object.keys(t).reduce((function(r,n){var o,i;return r[n]=(o=t[n],(i=e[n])?(0,G.__assign)((0,G.__assign)((0,G.__assign)({},o||{}),i||{}),Object.keys(o).reduce((function(t,e){return t[e]=(0,G.__assign)((0,G.__assign)({},o[e]),i[e]||{}),t}),{})):o),r}),(0,G.__assign)({},t)):t}function fe(t){return{create:function(){return{get:function(e){return t[e]},set:function(e,r){t[e]=r}}}}}!function(t){t[t.literal=0]="literal",t[t.object=1]="object"}(ne||(ne={}));var he,de,pe,ve=function(){function t(e,r,n,o){var i,a=this;if(void 0===r&&(r=t.defaultLocale),this.formatterCache={number:{},dateTime:{},pluralRules:{}},this.format=function(t){var e=a.formatToParts(t);if(1===e.length)return e[0].value;var r=e.reduce((function(t,e){return t.length&&e.type===ne.literal&&"string"==typeof t[t.length-1]?t[t.length-1]+=e.value:t.push(e.value),t}),[]);return r.length<=1?r[0]||"":r},this.formatToParts=function(t){return ue(a.ast,a.locales,a.formatters,a.formats,t,void 0,a.message)},this.resolvedOptions=function(){var t;return{locale:(null===(t=a.resolvedLocale)||void 0===t?void 0:t.toString())||Intl.NumberFormat.supportedLocalesOf(a.locales)[0]}},this.getAst=function(){return a.ast},this.locales=r,this.resolvedLocale=t.resolveLocale(r),"string"==typeof e){if(this.message=e,!t.__parse)throw new TypeError("IntlMessageFormat.__parse must be set to process `message` of type `string`");var s=o||{},c=(s.formatters,(0,G.__rest)(s,["formatters"]));this.ast=t.__parse(e,(0,G.__assign)((0,G.__assign)({},c),{locale:this.resolvedLocale}))}else this.ast=e;if(!Array.isArray(this.ast))throw new TypeError("A message must be provided as a String or AST.");this.formats=le(t.formats,n),this.formatters=o&&o.formatters||(void 0===(i=this.formatterCache)&&(i={number:{},dateTime:{},pluralRules:{}}),{getNumberFormat:Wt((function(){for(var t,e=[],r=0;r<arguments.length;r++)e[r]=arguments[r];return new((t=Intl.NumberFormat).bind.apply(t,(0,G.__spreadArray)([void 0],e,!1)))}),{cache:fe(i.number),strategy:re.variadic}),getDateTimeFormat:Wt((function(){for(var t,e=[],r=0;r<arguments.length;r++)e[r]=arguments[r];return new((t=Intl.DateTimeFormat).bind.apply(t,(0,G.__spreadArray)([void 0],e,!1)))}),{cache:fe(i.dateTime),strategy:re.variadic}),getPluralRules:Wt((function(){for(var t,e=[],r=0;r<arguments.length;r++)e[r]=arguments[r];return new((t=Intl.PluralRules).bind.apply(t,(0,G.__spreadArray)([void 0],e,!1)))}),{cache:fe(i.pluralRules),strategy:re.variadic})})}return Object.defineProperty(t,"defaultLocale",{get:function(){return t.memoizedDefaultLocale||(t.memoizedDefaultLocale=(new Intl.NumberFormat).resolvedOptions().locale),t.memoizedDefaultLocale},enumerable:!1,configurable:!0}),t.memoizedDefaultLocale=null,t.resolveLocale=function(t){if(void 0!==Intl.Locale){var e=Intl.NumberFormat.supportedLocalesOf(t);return e.length>0?new Intl.Locale(e[0]):new Intl.Locale("string"==typeof t?t:t[0])}},t.__parse=Vt,t.formats={number:{integer:{maximumFractionDigits:0},currency:{style:"currency"},percent:{style:"percent"}},date:{short:{month:"numeric",day:"numeric",year:"2-digit"},medium:{month:"short",day:"numeric",year:"numeric"},long:{month:"long",day:"numeric",year:"numeric"},full:{weekday:"long",month:"long",day:"numeric",year:"numeric"}},time:{short:{hour:"numeric",minute:"numeric"},medium:{hour:"numeric",minute:"numeric",second:"numeric"},long:{hour:"numeric",minute:"numeric",second:"numeric",timeZoneName:"short"},full:{hour:"numeric",minute:"numeric",second:"numeric",timeZoneName:"short"}}},t}(),ye=ve,me=l(53285),ge=function(){var t=(0,D.Z)((0,U.Z)().mark((function t(e,r,n,o){return(0,U.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,Promise.all([l.e(1866),l.e(6637)]).then(l.bind(l,23216)).then((function(){return(0,me.n)(r)}));case 2:return e._localizationCache={},t.abrupt("return",(function(t){if(!(t&&n&&r&&n[r]))return"";var i=n[r][t];if(!i)return"";var a=t+i,s=e._localizationCache[a];if(!s){try{s=new ye(i,r,o)}catch(d){return"Translation error: "+d.message}e._localizationCache[a]=s}for(var c={},u=arguments.length,l=new Array(u>1?u-1:0),f=1;f<u;f++)l[f-1]=arguments[f];if(1===l.length&&"object"===(0,z.Z)(l[0]))c=l[0];else for(var h=0;h<l.length;h+=2)c[l[h]]=l[h+1];try{return s.format(c)}catch(d){return"Translation "+d}}));case 4:case"end":return t.stop()}}),t)})));return function(e,r,n,o){return t.apply(this,arguments)}}(),be=l(11674),we=l(46797),_e=l(84643),Ee=(0,_.Z)(null,(function(t,e){var r,n,o,i=function(e){function r(){var e;(0,m.Z)(this,r);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e=(0,g.Z)(this,r,[].concat(o)),t((0,b.Z)(e)),e}return(0,w.Z)(r,e),(0,y.Z)(r)}(e);return{F:i,d:[{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"hacs",value:function(){return{localize:function(){return""}}}},{kind:"field",decorators:[(0,S.SB)()],key:"_language",value:function(){return"en"}},{kind:"method",key:"connectedCallback",value:function(){(0,E.Z)((0,x.Z)(i.prototype),"connectedCallback",this).call(this),this.hasUpdated&&this._initHacs()}},{kind:"method",key:"willUpdate",value:function(t){if(this.hasUpdated||this._initHacs(),t.has("hass")){var e=t.get("hass");(null==e?void 0:e.language)!==this.hass.language&&(this._language=this.hass.language)}!t.has("_language")&&this.hasUpdated||this._initializeLocalize()}},{kind:"method",key:"_initHacs",value:(o=(0,D.Z)((0,U.Z)().mark((function t(){var e=this;return(0,U.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:(0,we.CE)(this.hass,(function(){return e._updateProperties("configuration")}),_e.p.CONFIG),(0,we.CE)(this.hass,(function(){return e._updateProperties("status")}),_e.p.STATUS),(0,we.CE)(this.hass,(function(){return e._updateProperties("status")}),_e.p.STAGE),(0,we.CE)(this.hass,(function(){return e._updateProperties("repositories")}),_e.p.REPOSITORY),this.hass.connection.subscribeEvents((0,D.Z)((0,U.Z)().mark((function t(){return(0,U.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.abrupt("return",e._updateProperties("lovelace"));case 1:case"end":return t.stop()}}),t)}))),"lovelace_updated"),this._updateHacs({log:new F.J}),this._updateProperties(),this.addEventListener("update-hacs",(function(t){return e._updateHacs(t.detail)}));case 8:case"end":return t.stop()}}),t,this)}))),function(){return o.apply(this,arguments)})},{kind:"method",key:"_initializeLocalize",value:(n=(0,D.Z)((0,U.Z)().mark((function t(){var e,r,n;return(0,U.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,(0,be.i0)(null,this._language);case 2:return e=t.sent,r=e.language,n=e.data,t.t0=this,t.next=8,ge(this.constructor.prototype,r,(0,Z.Z)({},r,n));case 8:t.t1=t.sent,t.t2={localize:t.t1},t.t0._updateHacs.call(t.t0,t.t2);case 11:case"end":return t.stop()}}),t,this)}))),function(){return n.apply(this,arguments)})},{kind:"method",key:"_updateProperties",value:(r=(0,D.Z)((0,U.Z)().mark((function t(){var e,r,n,o,i,a=arguments;return(0,U.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(r={},n={},"all"!==(e=a.length>0&&void 0!==a[0]?a[0]:"all")){t.next=12;break}return t.next=6,Promise.all([(0,we.ER)(this.hass),(0,we.W)(this.hass)]);case 6:o=t.sent,i=(0,c.Z)(o,2),n.repositories=i[0],n.info=i[1],t.next=22;break;case 12:if("info"!==e){t.next=18;break}return t.next=15,(0,we.W)(this.hass);case 15:n.info=t.sent,t.next=22;break;case 18:if("repositories"!==e){t.next=22;break}return t.next=21,(0,we.ER)(this.hass);case 21:n.repositories=t.sent;case 22:Object.keys(n).forEach((function(t){void 0!==n[t]&&(r[t]=n[t])})),r&&(this._updateHacs(r),this.requestUpdate());case 24:case"end":return t.stop()}}),t,this)}))),function(){return r.apply(this,arguments)})},{kind:"method",key:"_updateHacs",value:function(t){this.hacs=Object.assign(Object.assign({},this.hacs),t)}}]}}),function(t){function e(){var t;(0,m.Z)(this,e);for(var r=arguments.length,n=new Array(r),o=0;o<r;o++)n[o]=arguments[o];return(t=(0,g.Z)(this,e,[].concat(n))).hass=void 0,t.__provideHass=[],t}return(0,w.Z)(e,t),(0,y.Z)(e,[{key:"provideHass",value:function(t){this.__provideHass.push(t),t.hass=this.hass}},{key:"updated",value:function(t){var r=this;(0,E.Z)((0,x.Z)(e.prototype),"updated",this).call(this,t),t.has("hass")&&this.__provideHass.forEach((function(t){t.hass=r.hass}))}}]),e}(a.oi)),xe=function(t,e){var r=matchMedia(t),n=function(t){return e(t.matches)};return r.addListener(n),e(r.matches),function(){return r.removeListener(n)}},Se=(l(35221),l(10733),l(14516)),ke=(0,_.Z)(null,(function(t,e){var r,n=function(e){function r(){var e;(0,m.Z)(this,r);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e=(0,g.Z)(this,r,[].concat(o)),t((0,b.Z)(e)),e}return(0,w.Z)(r,e),(0,y.Z)(r)}(e);return{F:n,d:[{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",key:"routerOptions",value:void 0},{kind:"field",key:"_currentPage",value:function(){return""}},{kind:"field",key:"_currentLoadProm",value:void 0},{kind:"field",key:"_cache",value:function(){return{}}},{kind:"field",key:"_initialLoadDone",value:function(){return!1}},{kind:"field",key:"_computeTail",value:function(){return(0,Se.Z)((function(t){var e=t.path.indexOf("/",1);return-1===e?{prefix:t.prefix+t.path,path:""}:{prefix:t.prefix+t.path.substr(0,e),path:t.path.substr(e)}}))}},{kind:"method",key:"createRenderRoot",value:function(){return this}},{kind:"method",key:"update",value:function(t){var e=this;(0,E.Z)((0,x.Z)(n.prototype),"update",this).call(this,t);var r=this.routerOptions||{routes:{}};if(!r||!r.initialLoad||this._initialLoadDone)if(t.has("route")){var o=this.route,i=r.defaultPage;o&&""===o.path&&void 0!==i&&(0,j.c)("".concat(o.prefix,"/").concat(i),{replace:!0});for(var a=o?function(t,e){if(""===t)return e;var r=t.indexOf("/",1);return-1===r?t.substr(1):t.substr(1,r-1)}(o.path,i||""):"not_found",s=r.routes[a];"string"==typeof s;)a=s,s=r.routes[a];if(r.beforeRender){var c=r.beforeRender(a);if(void 0!==c){for(a=c,s=r.routes[a];"string"==typeof s;)a=s,s=r.routes[a];o&&(0,j.c)("".concat(o.prefix,"/").concat(c).concat(location.search),{replace:!0})}}if(this._currentPage!==a){if(!s)return this._currentPage="",void(this.lastChild&&this.removeChild(this.lastChild));this._currentPage=a;var u,l=s.load?s.load():Promise.resolve();if(l.catch((function(t){console.error("Error loading page",a,t),e._currentPage===a&&(e.lastChild&&e.removeChild(e.lastChild),u&&clearTimeout(u),e.appendChild(e.createErrorScreen("Error while loading page ".concat(a,"."))))})),r.showLoading){var f=!1;u=window.setTimeout((function(){f||e._currentPage!==a||(e.lastChild&&e.removeChild(e.lastChild),e.appendChild(e.createLoadingScreen()))}),400),this._currentLoadProm=l.then((function(){e._currentLoadProm=void 0,e._currentPage===a&&(f=!0,e._createPanel(r,a,s))}),(function(){e._currentLoadProm=void 0}))}else this._createPanel(r,a,s)}else this.lastChild&&this.updatePageEl(this.lastChild,t)}else this.lastChild&&!this._currentLoadProm&&this.updatePageEl(this.lastChild,t)}},{kind:"method",key:"firstUpdated",value:function(t){var e=this;(0,E.Z)((0,x.Z)(n.prototype),"firstUpdated",this).call(this,t);var r=this.routerOptions;r&&(r.preloadAll&&Object.values(r.routes).forEach((function(t){return"object"===(0,z.Z)(t)&&t.load&&t.load()})),r.initialLoad&&(setTimeout((function(){e._initialLoadDone||e.appendChild(e.createLoadingScreen())}),400),r.initialLoad().then((function(){e._initialLoadDone=!0,e.requestUpdate("route")}))))}},{kind:"method",key:"createLoadingScreen",value:function(){return Promise.all([l.e(6023),l.e(210),l.e(2545)]).then(l.bind(l,84776)),document.createElement("hass-loading-screen")}},{kind:"method",key:"createErrorScreen",value:function(t){Promise.all([l.e(210),l.e(4271),l.e(8370),l.e(1908)]).then(l.bind(l,11908));var e=document.createElement("hass-error-screen");return e.error=t,e}},{kind:"method",key:"rebuild",value:(r=(0,D.Z)((0,U.Z)().mark((function t(){var e;return(0,U.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(void 0!==(e=this.route)){t.next=3;break}return t.abrupt("return");case 3:return this.route=void 0,t.next=6,this.updateComplete;case 6:void 0===this.route&&(this.route=e);case 7:case"end":return t.stop()}}),t,this)}))),function(){return r.apply(this,arguments)})},{kind:"get",key:"pageRendered",value:function(){var t=this;return this.updateComplete.then((function(){return t._currentLoadProm}))}},{kind:"method",key:"createElement",value:function(t){return document.createElement(t)}},{kind:"method",key:"updatePageEl",value:function(t,e){}},{kind:"get",key:"routeTail",value:function(){return this._computeTail(this.route)}},{kind:"method",key:"_createPanel",value:function(t,e,r){this.lastChild&&this.removeChild(this.lastChild);var n=this._cache[e]||this.createElement(r.tag);this.updatePageEl(n),this.appendChild(n),(t.cacheAll||r.cache)&&(this._cache[e]=n)}}]}}),a.fl),Ae=((0,_.Z)([(0,S.Mo)("hacs-router")],(function(t,e){var r=function(e){function r(){var e;(0,m.Z)(this,r);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e=(0,g.Z)(this,r,[].concat(o)),t((0,b.Z)(e)),e}return(0,w.Z)(r,e),(0,y.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"hacs",value:void 0},{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,S.Cb)({type:Boolean})],key:"narrow",value:void 0},{kind:"field",decorators:[(0,S.SB)()],key:"_wideSidebar",value:function(){return!1}},{kind:"field",decorators:[(0,S.SB)()],key:"_wide",value:function(){return!1}},{kind:"field",key:"_listeners",value:function(){return[]}},{kind:"method",key:"connectedCallback",value:function(){var t=this;(0,E.Z)((0,x.Z)(r.prototype),"connectedCallback",this).call(this),this._listeners.push(xe("(min-width: 1040px)",(function(e){t._wide=e}))),this._listeners.push(xe("(min-width: 1296px)",(function(e){t._wideSidebar=e}))),this.style.setProperty("--app-header-background-color","var(--sidebar-background-color)"),this.style.setProperty("--app-header-text-color","var(--sidebar-text-color)"),this.style.setProperty("--app-header-border-bottom","1px solid var(--divider-color)"),this.style.setProperty("--ha-card-border-radius","var(--ha-config-card-border-radius, 12px)")}},{kind:"method",key:"disconnectedCallback",value:function(){for((0,E.Z)((0,x.Z)(r.prototype),"disconnectedCallback",this).call(this);this._listeners.length;)this._listeners.pop()()}},{kind:"method",key:"updatePageEl",value:function(t){var e="docked"===this.hass.dockedSidebar?this._wideSidebar:this._wide;t.hass=this.hass,t.hacs=this.hacs,t.route=this.route,t.narrow=this.narrow,t.isWide=e}},{kind:"field",key:"routerOptions",value:function(){return{defaultPage:"dashboard",showLoading:!0,beforeRender:function(t){return["_my_redirect","repository"].includes(t)?void 0:"dashboard"},routes:{_my_redirect:{tag:"hacs-my-redirect",load:function(){return Promise.all([l.e(210),l.e(4271),l.e(8370),l.e(4837)]).then(l.bind(l,44837))}},dashboard:{tag:"hacs-dashboard",load:function(){return Promise.all([l.e(1706),l.e(2850),l.e(1866),l.e(1985),l.e(210),l.e(4271),l.e(2415),l.e(9342),l.e(9663),l.e(8370),l.e(2519),l.e(4779)]).then(l.bind(l,54779))}},repository:{tag:"hacs-repository-dashboard",load:function(){return Promise.all([l.e(6023),l.e(2488),l.e(210),l.e(4271),l.e(9342),l.e(4018),l.e(8370),l.e(2519),l.e(9015)]).then(l.bind(l,49015))}}}}}}]}}),ke),l(61422)),Pe=(0,a.iv)(he||(he=(0,i.Z)([":host{--hcv-color-error:var(--hacs-error-color, var(--error-color));--hcv-color-warning:var(--hacs-warning-color, var(--warning-color));--hcv-color-update:var(--hacs-update-color, var(--info-color));--hcv-color-new:var(--hacs-new-color, var(--success-color));--hcv-color-icon:var(--hacs-default-icon-color, var(--primary-text-color));--hcv-text-color-primary:var(--primary-text-color);--hcv-text-color-on-background:var(--text-primary-color);--hcv-text-color-secondary:var(--secondary-text-color);--hcv-text-color-link:var(--link-text-color, var(--accent-color));--mdc-dialog-heading-ink-color:var(--hcv-text-color-primary);--mdc-dialog-content-ink-color:var(--hcv-text-color-primary)}"])));(0,_.Z)([(0,S.Mo)("hacs-frontend")],(function(t,e){var r=function(e){function r(){var e;(0,m.Z)(this,r);for(var n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return e=(0,g.Z)(this,r,[].concat(o)),t((0,b.Z)(e)),e}return(0,w.Z)(r,e),(0,y.Z)(r)}(e);return{F:r,d:[{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"hacs",value:void 0},{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"narrow",value:void 0},{kind:"field",decorators:[(0,S.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"method",key:"firstUpdated",value:function(t){var e=this;(0,E.Z)((0,x.Z)(r.prototype),"firstUpdated",this).call(this,t),this._applyTheme(),this.addEventListener("hacs-location-changed",(function(t){return e._setRoute(t)})),""===this.route.path&&(0,j.c)("/hacs/entry",{replace:!0}),window.addEventListener("haptic",(function(t){(0,N.B)(window.parent,t.type,t.detail,{bubbles:!1})})),document.body.addEventListener("click",(function(t){var e=(0,M.J)(t);e&&(0,j.c)(e)})),B.E.addEventListener("location-changed",(function(t){return(0,N.B)(e,t.type,t.detail,{bubbles:!1})})),document.body.addEventListener("keydown",(function(t){t.ctrlKey||t.shiftKey||t.metaKey||t.altKey||["c","e"].includes(t.key)&&(0,N.B)(B.E,"hass-quick-bar-trigger",t,{bubbles:!1})})),B.E.matchMedia("(prefers-color-scheme: dark)").addEventListener("change",(function(t){return e._applyTheme()})),(0,$.lD)(this,this.shadowRoot)}},{kind:"method",key:"updated",value:function(t){(0,E.Z)((0,x.Z)(r.prototype),"updated",this).call(this,t);var e=t.get("hass");e&&e.themes!==this.hass.themes&&this._applyTheme()}},{kind:"method",key:"render",value:function(){var t,e;return this.hass&&null!==(t=this.hacs)&&void 0!==t&&null!==(t=t.info)&&void 0!==t&&null!==(t=t.categories)&&void 0!==t&&t.length&&void 0!==(null===(e=this.hacs)||void 0===e?void 0:e.localize)?(0,a.dy)(de||(de=(0,i.Z)([' <hacs-router .hass="','" .hacs="','" .route="','" .narrow="','"></hacs-router> '])),this.hass,this.hacs,this.route,this.narrow):a.Ld}},{kind:"get",static:!0,key:"styles",value:function(){return[Ae.w,Pe,(0,a.iv)(pe||(pe=(0,i.Z)(["hass-loading-screen{height:100vh}"])))]}},{kind:"method",key:"_setRoute",value:function(t){var e;null!==(e=t.detail)&&void 0!==e&&e.route&&(this.route=t.detail.route,(0,j.c)(this.route.path,{replace:!0}),this.requestUpdate())}},{kind:"method",key:"_applyTheme",value:function(){var t;I(this.parentElement,this.hass.themes,(null===(t=this.hass.selectedTheme)||void 0===t?void 0:t.theme)||(this.hass.themes.darkMode&&this.hass.themes.default_dark_theme?this.hass.themes.default_dark_theme:this.hass.themes.default_theme),Object.assign(Object.assign({},this.hass.selectedTheme),{},{dark:this.hass.themes.darkMode})),this.parentElement.style.backgroundColor="var(--primary-background-color)",this.parentElement.style.color="var(--primary-text-color)"}}]}}),Ee);(0,o.xj)(!1);var Oe=document.createElement("style");Oe.innerHTML="\nbody {\n  font-family: Roboto, sans-serif;\n  -moz-osx-font-smoothing: grayscale;\n  -webkit-font-smoothing: antialiased;\n  font-weight: 400;\n  margin: 0;\n  padding: 0;\n  height: 100vh;\n}\n@media (prefers-color-scheme: dark) {\n  body {\n    background-color: #111111;\n    color: #e1e1e1;\n  }\n}\n",document.head.appendChild(Oe)}()}();
+//# sourceMappingURL=entrypoint.yqQWLcDGcBc.js.map
\ No newline at end of file
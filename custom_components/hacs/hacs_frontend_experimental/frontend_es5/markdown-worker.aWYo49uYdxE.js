@@ -0,0 +1,2 @@
+!function(){"use strict";var t,e,n={43040:function(t,e,n){var r,i,o=n(99312),c=n(81043),a=(n(85717),n(93217)),u=n(92838),s=n(62173),f=function(t,e,n){if("input"===t){if("type"===e&&"checkbox"===n||"checked"===e||"disabled"===e)return;return""}},l=function(){var t=(0,c.Z)((0,o.Z)().mark((function t(e,n){var c,a,l=arguments;return(0,o.Z)().wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return c=l.length>2&&void 0!==l[2]?l[2]:{},r||(r=Object.assign(Object.assign({},(0,s.getDefaultWhiteList)()),{},{input:["type","disabled","checked"],"ha-icon":["icon"],"ha-svg-icon":["path"],"ha-alert":["alert-type","title"],"ha-qr-code":["data","scale","width","margin","error-correction-level","center-image"]})),c.allowSvg?(i||(i=Object.assign(Object.assign({},r),{},{svg:["xmlns","height","width"],path:["transform","stroke","d"],img:["src"]})),a=i):a=r,t.t0=s.filterXSS,t.next=6,(0,u.TU)(e,n);case 6:return t.t1=t.sent,t.t2={whiteList:a,onTagAttr:f},t.abrupt("return",(0,t.t0)(t.t1,t.t2));case 9:case"end":return t.stop()}}),t)})));return function(e,n){return t.apply(this,arguments)}}(),p={renderMarkdown:l};(0,a.Jj)(p)}},r={};function i(t){var e=r[t];if(void 0!==e)return e.exports;var o=r[t]={exports:{}};return n[t].call(o.exports,o,o.exports,i),o.exports}i.m=n,i.x=function(){var t=i.O(void 0,[1854,8335],(function(){return i(43040)}));return t=i.O(t)},t=[],i.O=function(e,n,r,o){if(!n){var c=1/0;for(f=0;f<t.length;f++){n=t[f][0],r=t[f][1],o=t[f][2];for(var a=!0,u=0;u<n.length;u++)(!1&o||c>=o)&&Object.keys(i.O).every((function(t){return i.O[t](n[u])}))?n.splice(u--,1):(a=!1,o<c&&(c=o));if(a){t.splice(f--,1);var s=r();void 0!==s&&(e=s)}}return e}o=o||0;for(var f=t.length;f>0&&t[f-1][2]>o;f--)t[f]=t[f-1];t[f]=[n,r,o]},i.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return i.d(e,{a:e}),e},i.d=function(t,e){for(var n in e)i.o(e,n)&&!i.o(t,n)&&Object.defineProperty(t,n,{enumerable:!0,get:e[n]})},i.f={},i.e=function(t){return Promise.all(Object.keys(i.f).reduce((function(e,n){return i.f[n](t,e),e}),[]))},i.u=function(t){return t+"."+{1854:"lJJ7-FMPh9w",8335:"vCS8kqZjGH0"}[t]+".js"},i.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},i.p="/hacsfiles/frontend/frontend_es5/",function(){var t={1402:1};i.f.i=function(e,n){t[e]||importScripts(i.p+i.u(e))};var e=self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[],n=e.push.bind(e);e.push=function(e){var r=e[0],o=e[1],c=e[2];for(var a in o)i.o(o,a)&&(i.m[a]=o[a]);for(c&&c(i);r.length;)t[r.pop()]=1;n(e)}}(),e=i.x,i.x=function(){return Promise.all([i.e(1854),i.e(8335)]).then(e)};i.x()}();
+//# sourceMappingURL=markdown-worker.aWYo49uYdxE.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+!function(){"use strict";var r,t,n={38661:function(r,t,n){var e=n(62746),o=(n(87438),n(46798),n(9849),n(22890),n(13526),n(82073),n(40271),n(60163),n(37313),n(76843),n(93217)),i=(n(32550),Number.isNaN||function(r){return"number"==typeof r&&r!=r});function u(r,t){if(r.length!==t.length)return!1;for(var n=0;n<r.length;n++)if(e=r[n],o=t[n],!(e===o||i(e)&&i(o)))return!1;var e,o;return!0}function f(r,t){void 0===t&&(t=u);var n=null;function e(){for(var e=[],o=0;o<arguments.length;o++)e[o]=arguments[o];if(n&&n.lastThis===this&&t(e,n.lastArgs))return n.lastResult;var i=r.apply(this,e);return n={lastResult:i,lastArgs:e,lastThis:this},i}return e.clear=function(){n=null},e}var a=f((function(r){return new Intl.Collator(r)})),c=(f((function(r){return new Intl.Collator(r,{sensitivity:"accent"})})),function(r,t){return r<t?-1:r>t?1:0}),s={filterData:function(r,t,n){return n=n.toUpperCase(),r.filter((function(r){return Object.entries(t).some((function(t){var o=(0,e.Z)(t,2),i=o[0],u=o[1];return!(!u.filterable||!String(u.filterKey?r[u.valueColumn||i][u.filterKey]:r[u.valueColumn||i]).toUpperCase().includes(n))}))}))},sortData:function(r,t,n,e,o){return r.sort((function(r,i){var u=1;"desc"===n&&(u=-1);var f=t.filterKey?r[t.valueColumn||e][t.filterKey]:r[t.valueColumn||e],s=t.filterKey?i[t.valueColumn||e][t.filterKey]:i[t.valueColumn||e];if("numeric"===t.type)f=isNaN(f)?void 0:Number(f),s=isNaN(s)?void 0:Number(s);else if("string"==typeof f&&"string"==typeof s)return u*function(r,t){var n,e=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;return null!==(n=Intl)&&void 0!==n&&n.Collator?a(e).compare(r,t):c(r,t)}(f,s,o);return null==f&&null!=s?1:null==s&&null!=f?-1:f<s?-1*u:f>s?1*u:0}))}};(0,o.Jj)(s)},8273:function(r,t,n){var e=n(88755),o=Math.floor,i=function(r,t){var n=r.length;if(n<8)for(var u,f,a=1;a<n;){for(f=a,u=r[a];f&&t(r[f-1],u)>0;)r[f]=r[--f];f!==a++&&(r[f]=u)}else for(var c=o(n/2),s=i(e(r,0,c),t),l=i(e(r,c),t),v=s.length,p=l.length,h=0,g=0;h<v||g<p;)r[h+g]=h<v&&g<p?t(s[h],l[g])<=0?s[h++]:l[g++]:h<v?s[h++]:l[g++];return r};r.exports=i},39860:function(r,t,n){var e=n(68360).match(/firefox\/(\d+)/i);r.exports=!!e&&+e[1]},93712:function(r,t,n){var e=n(68360);r.exports=/MSIE|Trident/.test(e)},82803:function(r,t,n){var e=n(68360).match(/AppleWebKit\/(\d+)\./);r.exports=!!e&&+e[1]},60771:function(r,t){var n={}.propertyIsEnumerable,e=Object.getOwnPropertyDescriptor,o=e&&!n.call({1:2},1);t.f=o?function(r){var t=e(this,r);return!!t&&t.enumerable}:n},94969:function(r,t,n){var e=n(58849),o=n(18431),i=n(55418),u=n(2563),f=n(93121),a=n(17460),c=i(n(60771).f),s=i([].push),l=e&&o((function(){var r=Object.create(null);return r[2]=2,!c(r,2)})),v=function(r){return function(t){for(var n,o=a(t),i=f(o),v=l&&null===u(o),p=i.length,h=0,g=[];p>h;)n=i[h++],e&&!(v?n in o:c(o,n))||s(g,r?[n,o[n]]:o[n]);return g}};r.exports={entries:v(!0),values:v(!1)}},87438:function(r,t,n){var e=n(68077),o=n(78856).filter;e({target:"Array",proto:!0,forced:!n(817)("filter")},{filter:function(r){return o(this,r,arguments.length>1?arguments[1]:void 0)}})},91989:function(r,t,n){var e=n(68077),o=n(55418),i=n(70814),u=n(17460),f=n(54053),a=o([].join);e({target:"Array",proto:!0,forced:i!==Object||!f("join",",")},{join:function(r){return a(u(this),void 0===r?",":r)}})},46349:function(r,t,n){var e=n(68077),o=n(78856).map;e({target:"Array",proto:!0,forced:!n(817)("map")},{map:function(r){return o(this,r,arguments.length>1?arguments[1]:void 0)}})},36513:function(r,t,n){var e=n(68077),o=n(19480),i=n(10228),u=n(1991),f=n(54108);e({target:"Array",proto:!0,arity:1,forced:n(18431)((function(){return 4294967297!==[].push.call({length:4294967296},1)}))||!function(){try{Object.defineProperty([],"length",{writable:!1}).push()}catch(r){return r instanceof TypeError}}()},{push:function(r){var t=o(this),n=i(t),e=arguments.length;f(n+e);for(var a=0;a<e;a++)t[n]=arguments[a],n++;return u(t,n),n}})},37313:function(r,t,n){var e=n(68077),o=n(55418),i=n(9160),u=n(19480),f=n(10228),a=n(35102),c=n(11336),s=n(18431),l=n(8273),v=n(54053),p=n(39860),h=n(93712),g=n(91625),d=n(82803),y=[],b=o(y.sort),m=o(y.push),x=s((function(){y.sort(void 0)})),E=s((function(){y.sort(null)})),O=v("sort"),w=!s((function(){if(g)return g<70;if(!(p&&p>3)){if(h)return!0;if(d)return d<603;var r,t,n,e,o="";for(r=65;r<76;r++){switch(t=String.fromCharCode(r),r){case 66:case 69:case 70:case 72:n=3;break;case 68:case 71:n=4;break;default:n=2}for(e=0;e<47;e++)y.push({k:t+e,v:n})}for(y.sort((function(r,t){return t.v-r.v})),e=0;e<y.length;e++)t=y[e].k.charAt(0),o.charAt(o.length-1)!==t&&(o+=t);return"DGBEFHACIJK"!==o}}));e({target:"Array",proto:!0,forced:x||!E||!O||!w},{sort:function(r){void 0!==r&&i(r);var t=u(this);if(w)return void 0===r?b(t):b(t,r);var n,e,o=[],s=f(t);for(e=0;e<s;e++)e in t&&m(o,t[e]);for(l(o,function(r){return function(t,n){return void 0===n?-1:void 0===t?1:void 0!==r?+r(t,n)||0:c(t)>c(n)?1:-1}}(r)),n=f(o),e=0;e<n;)t[e]=o[e++];for(;e<s;)a(t,e++);return t}})},80628:function(r,t,n){var e=n(68077),o=n(19480),i=n(10228),u=n(1991),f=n(35102),a=n(54108);e({target:"Array",proto:!0,arity:1,forced:1!==[].unshift(0)||!function(){try{Object.defineProperty([],"length",{writable:!1}).unshift()}catch(r){return r instanceof TypeError}}()},{unshift:function(r){var t=o(this),n=i(t),e=arguments.length;if(e){a(n+e);for(var c=n;c--;){var s=c+e;c in t?t[s]=t[c]:f(t,s)}for(var l=0;l<e;l++)t[l]=arguments[l]}return u(t,n+e)}})},32550:function(r,t,n){n(68077)({target:"Number",stat:!0},{isNaN:function(r){return r!=r}})},82073:function(r,t,n){var e=n(68077),o=n(94969).entries;e({target:"Object",stat:!0},{entries:function(r){return o(r)}})},30535:function(r,t,n){var e=n(68077),o=n(18431),i=n(19480),u=n(2563),f=n(51577);e({target:"Object",stat:!0,forced:o((function(){u(1)})),sham:!f},{getPrototypeOf:function(r){return u(i(r))}})},10999:function(r,t,n){var e=n(58849),o=n(5813),i=n(55418),u=n(27992),f=n(81760),a=n(52838),c=n(9885),s=n(45919).f,l=n(95882),v=n(90744),p=n(11336),h=n(78287),g=n(9773),d=n(4109),y=n(73936),b=n(18431),m=n(55229),x=n(12648).enforce,E=n(36929),O=n(10282),w=n(66509),C=n(70852),j=O("match"),A=o.RegExp,I=A.prototype,R=o.SyntaxError,k=i(I.exec),S=i("".charAt),N=i("".replace),T=i("".indexOf),K=i("".slice),P=/^\?<[^\s\d!#%&*+<=>@^][^\s!#%&*+<=>@^]*>/,D=/a/g,_=/a/g,M=new A(D)!==D,U=g.MISSED_STICKY,Y=g.UNSUPPORTED_Y,q=e&&(!M||U||w||C||b((function(){return _[j]=!1,A(D)!==D||A(_)===_||"/a/i"!==String(A(D,"i"))})));if(u("RegExp",q)){for(var J=function(r,t){var n,e,o,i,u,s,g=l(I,this),d=v(r),y=void 0===t,b=[],E=r;if(!g&&d&&y&&r.constructor===J)return r;if((d||l(I,r))&&(r=r.source,y&&(t=h(E))),r=void 0===r?"":p(r),t=void 0===t?"":p(t),E=r,w&&"dotAll"in D&&(e=!!t&&T(t,"s")>-1)&&(t=N(t,/s/g,"")),n=t,U&&"sticky"in D&&(o=!!t&&T(t,"y")>-1)&&Y&&(t=N(t,/y/g,"")),C&&(i=function(r){for(var t,n=r.length,e=0,o="",i=[],u=c(null),f=!1,a=!1,s=0,l="";e<=n;e++){if("\\"===(t=S(r,e)))t+=S(r,++e);else if("]"===t)f=!1;else if(!f)switch(!0){case"["===t:f=!0;break;case"("===t:k(P,K(r,e+1))&&(e+=2,a=!0),o+=t,s++;continue;case">"===t&&a:if(""===l||m(u,l))throw new R("Invalid capture group name");u[l]=!0,i[i.length]=[l,s],a=!1,l="";continue}a?l+=t:o+=t}return[o,i]}(r),r=i[0],b=i[1]),u=f(A(r,t),g?this:I,J),(e||o||b.length)&&(s=x(u),e&&(s.dotAll=!0,s.raw=J(function(r){for(var t,n=r.length,e=0,o="",i=!1;e<=n;e++)"\\"!==(t=S(r,e))?i||"."!==t?("["===t?i=!0:"]"===t&&(i=!1),o+=t):o+="[\\s\\S]":o+=t+S(r,++e);return o}(r),n)),o&&(s.sticky=!0),b.length&&(s.groups=b)),r!==E)try{a(u,"source",""===E?"(?:)":E)}catch(O){}return u},B=s(A),F=0;B.length>F;)d(J,A,B[F++]);I.constructor=J,J.prototype=I,y(o,"RegExp",J,{constructor:!0})}E("RegExp")},52117:function(r,t,n){var e=n(58849),o=n(66509),i=n(42458),u=n(40030),f=n(12648).get,a=RegExp.prototype,c=TypeError;e&&o&&u(a,"dotAll",{configurable:!0,get:function(){if(this!==a){if("RegExp"===i(this))return!!f(this).dotAll;throw new c("Incompatible receiver, RegExp required")}}})},82479:function(r,t,n){var e=n(58849),o=n(9773).MISSED_STICKY,i=n(42458),u=n(40030),f=n(12648).get,a=RegExp.prototype,c=TypeError;e&&o&&u(a,"sticky",{configurable:!0,get:function(){if(this!==a){if("RegExp"===i(this))return!!f(this).sticky;throw new c("Incompatible receiver, RegExp required")}}})},99397:function(r,t,n){n(63789);var e,o,i=n(68077),u=n(43173),f=n(30553),a=n(22933),c=n(11336),s=(e=!1,(o=/[ac]/).exec=function(){return e=!0,/./.exec.apply(this,arguments)},!0===o.test("abc")&&e),l=/./.test;i({target:"RegExp",proto:!0,forced:!s},{test:function(r){var t=a(this),n=c(r),e=t.exec;if(!f(e))return u(l,t,n);var o=u(e,t,n);return null!==o&&(a(o),!0)}})},22890:function(r,t,n){var e=n(68077),o=n(43173),i=n(9160),u=n(22933),f=n(73177),a=n(8900),c=n(74856),s=n(95448),l=a((function(){for(var r,t,n=this.iterator,e=this.predicate,i=this.next;;){if(r=u(o(i,n)),this.done=!!r.done)return;if(t=r.value,c(n,e,[t,this.counter++],!0))return t}}));e({target:"Iterator",proto:!0,real:!0,forced:s},{filter:function(r){return u(this),i(r),new l(f(this),{predicate:r})}})},50289:function(r,t,n){var e=n(68077),o=n(72208),i=n(9160),u=n(22933),f=n(73177);e({target:"Iterator",proto:!0,real:!0},{forEach:function(r){u(this),i(r);var t=f(this),n=0;o(t,(function(t){r(t,n++)}),{IS_RECORD:!0})}})},70320:function(r,t,n){var e=n(68077),o=n(57902);e({target:"Iterator",proto:!0,real:!0,forced:n(95448)},{map:o})},94167:function(r,t,n){var e=n(5813),o=n(70803),i=n(1617),u=n(30519),f=n(52838),a=function(r){if(r&&r.forEach!==u)try{f(r,"forEach",u)}catch(t){r.forEach=u}};for(var c in o)o[c]&&a(e[c]&&e[c].prototype);a(i)}},e={};function o(r){var t=e[r];if(void 0!==t)return t.exports;var i=e[r]={exports:{}};return n[r].call(i.exports,i,i.exports,o),i.exports}o.m=n,o.x=function(){var r=o.O(void 0,[1854],(function(){return o(38661)}));return r=o.O(r)},r=[],o.O=function(t,n,e,i){if(!n){var u=1/0;for(s=0;s<r.length;s++){n=r[s][0],e=r[s][1],i=r[s][2];for(var f=!0,a=0;a<n.length;a++)(!1&i||u>=i)&&Object.keys(o.O).every((function(r){return o.O[r](n[a])}))?n.splice(a--,1):(f=!1,i<u&&(u=i));if(f){r.splice(s--,1);var c=e();void 0!==c&&(t=c)}}return t}i=i||0;for(var s=r.length;s>0&&r[s-1][2]>i;s--)r[s]=r[s-1];r[s]=[n,e,i]},o.d=function(r,t){for(var n in t)o.o(t,n)&&!o.o(r,n)&&Object.defineProperty(r,n,{enumerable:!0,get:t[n]})},o.f={},o.e=function(r){return Promise.all(Object.keys(o.f).reduce((function(t,n){return o.f[n](r,t),t}),[]))},o.u=function(r){return r+".lJJ7-FMPh9w.js"},o.o=function(r,t){return Object.prototype.hasOwnProperty.call(r,t)},o.p="/hacsfiles/frontend/frontend_es5/",function(){var r={8456:1};o.f.i=function(t,n){r[t]||importScripts(o.p+o.u(t))};var t=self.webpackChunkhacs_frontend=self.webpackChunkhacs_frontend||[],n=t.push.bind(t);t.push=function(t){var e=t[0],i=t[1],u=t[2];for(var f in i)o.o(i,f)&&(o.m[f]=i[f]);for(u&&u(o);e.length;)r[e.pop()]=1;n(t)}}(),t=o.x,o.x=function(){return o.e(1854).then(t)};o.x()}();
+//# sourceMappingURL=sort-filter-worker.vImq4zL8Gjk.js.map
\ No newline at end of file
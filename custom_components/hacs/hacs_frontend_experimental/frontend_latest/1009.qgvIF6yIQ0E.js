@@ -0,0 +1,5 @@
+export const id=1009;export const ids=[1009];export const modules={81009:(e,a,i)=>{i.r(a),i.d(a,{HaDialogDatePicker:()=>s});var t=i(309),o=(i(14271),i(85217),i(93432)),d=i(5095),l=i(95260),n=i(18394),r=i(2537),c=i(29950);i(9828);let s=(0,t.Z)([(0,l.Mo)("ha-dialog-date-picker")],(function(e,a){return{F:class extends a{constructor(...a){super(...a),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_params",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_value",value:void 0},{kind:"method",key:"showDialog",value:async function(e){await(0,r.y)(),this._params=e,this._value=e.value}},{kind:"method",key:"closeDialog",value:function(){this._params=void 0,(0,n.B)(this,"dialog-closed",{dialog:this.localName})}},{kind:"method",key:"render",value:function(){return this._params?d.dy`<ha-dialog open @closed="${this.closeDialog}"> <app-datepicker .value="${this._value}" .min="${this._params.min}" .max="${this._params.max}" .locale="${this._params.locale}" @datepicker-value-updated="${this._valueChanged}" .firstDayOfWeek="${this._params.firstWeekday}"></app-datepicker> ${this._params.canClear?d.dy`<mwc-button slot="secondaryAction" @click="${this._clear}" class="warning"> ${this.hass.localize("ui.dialogs.date-picker.clear")} </mwc-button>`:d.Ld} <mwc-button slot="secondaryAction" @click="${this._setToday}"> ${this.hass.localize("ui.dialogs.date-picker.today")} </mwc-button> <mwc-button slot="primaryAction" dialogaction="cancel" class="cancel-btn"> ${this.hass.localize("ui.common.cancel")} </mwc-button> <mwc-button slot="primaryAction" @click="${this._setValue}"> ${this.hass.localize("ui.common.ok")} </mwc-button> </ha-dialog>`:d.Ld}},{kind:"method",key:"_valueChanged",value:function(e){this._value=e.detail.value}},{kind:"method",key:"_clear",value:function(){var e;null===(e=this._params)||void 0===e||e.onChange(void 0),this.closeDialog()}},{kind:"method",key:"_setToday",value:function(){const e=new Date;this._value=(0,o.Z)(e,"yyyy-MM-dd")}},{kind:"method",key:"_setValue",value:function(){var e;this._value||this._setToday(),null===(e=this._params)||void 0===e||e.onChange(this._value),this.closeDialog()}},{kind:"field",static:!0,key:"styles",value:()=>[c.yu,d.iv`ha-dialog{--dialog-content-padding:0;--justify-action-buttons:space-between}app-datepicker{--app-datepicker-accent-color:var(--primary-color);--app-datepicker-bg-color:transparent;--app-datepicker-color:var(--primary-text-color);--app-datepicker-disabled-day-color:var(--disabled-text-color);--app-datepicker-focused-day-color:var(--text-primary-color);--app-datepicker-focused-year-bg-color:var(--primary-color);--app-datepicker-selector-color:var(--secondary-text-color);--app-datepicker-separator-color:var(--divider-color);--app-datepicker-weekday-color:var(--secondary-text-color)}app-datepicker::part(calendar-day):focus{outline:0}app-datepicker::part(body){direction:ltr}@media all and (min-width:450px){ha-dialog{--mdc-dialog-min-width:300px}}@media all and (max-width:450px),all and (max-height:500px){app-datepicker{width:100%}}`]}]}}),d.oi)},9828:(e,a,i)=>{i.d(a,{i:()=>u});var t=i(309),o=i(34541),d=i(47838),l=i(87762),n=i(91632),r=i(5095),c=i(95260),s=i(60625);i(54371);const p=["button","ha-list-item"],u=(e,a)=>{var i;return r.dy` <div class="header_title"> <span>${a}</span> <ha-icon-button .label="${null!==(i=null==e?void 0:e.localize("ui.dialogs.generic.close"))&&void 0!==i?i:"Close"}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}" dialogAction="close" class="header_button"></ha-icon-button> </div> `};(0,t.Z)([(0,c.Mo)("ha-dialog")],(function(e,a){class i extends a{constructor(...a){super(...a),e(this)}}return{F:i,d:[{kind:"field",key:s.gA,value:void 0},{kind:"method",key:"scrollToPos",value:function(e,a){var i;null===(i=this.contentElement)||void 0===i||i.scrollTo(e,a)}},{kind:"method",key:"renderHeading",value:function(){return r.dy`<slot name="heading"> ${(0,o.Z)((0,d.Z)(i.prototype),"renderHeading",this).call(this)} </slot>`}},{kind:"method",key:"firstUpdated",value:function(){var e;(0,o.Z)((0,d.Z)(i.prototype),"firstUpdated",this).call(this),this.suppressDefaultPressSelector=[this.suppressDefaultPressSelector,p].join(", "),this._updateScrolledAttribute(),null===(e=this.contentElement)||void 0===e||e.addEventListener("scroll",this._onScroll,{passive:!0})}},{kind:"method",key:"disconnectedCallback",value:function(){(0,o.Z)((0,d.Z)(i.prototype),"disconnectedCallback",this).call(this),this.contentElement.removeEventListener("scroll",this._onScroll)}},{kind:"field",key:"_onScroll",value(){return()=>{this._updateScrolledAttribute()}}},{kind:"method",key:"_updateScrolledAttribute",value:function(){this.contentElement&&this.toggleAttribute("scrolled",0!==this.contentElement.scrollTop)}},{kind:"field",static:!0,key:"styles",value:()=>[n.W,r.iv`:host([scrolled]) ::slotted(ha-dialog-header){border-bottom:1px solid var(--mdc-dialog-scroll-divider-color,rgba(0,0,0,.12))}.mdc-dialog{--mdc-dialog-scroll-divider-color:var(
+          --dialog-scroll-divider-color,
+          var(--divider-color)
+        );z-index:var(--dialog-z-index,8);-webkit-backdrop-filter:var(--dialog-backdrop-filter,none);backdrop-filter:var(--dialog-backdrop-filter,none);--mdc-dialog-box-shadow:var(--dialog-box-shadow, none);--mdc-typography-headline6-font-weight:400;--mdc-typography-headline6-font-size:1.574rem}.mdc-dialog__actions{justify-content:var(--justify-action-buttons,flex-end);padding-bottom:max(env(safe-area-inset-bottom),24px)}.mdc-dialog__actions span:first-child{flex:var(--secondary-action-button-flex,unset)}.mdc-dialog__actions span:nth-child(2){flex:var(--primary-action-button-flex,unset)}.mdc-dialog__container{align-items:var(--vertical-align-dialog,center)}.mdc-dialog__title{padding:24px 24px 0 24px}.mdc-dialog__actions{padding:12px 24px 12px 24px}.mdc-dialog__title::before{content:unset}.mdc-dialog .mdc-dialog__content{position:var(--dialog-content-position,relative);padding:var(--dialog-content-padding,24px)}:host([hideactions]) .mdc-dialog .mdc-dialog__content{padding-bottom:max(var(--dialog-content-padding,24px),env(safe-area-inset-bottom))}.mdc-dialog .mdc-dialog__surface{position:var(--dialog-surface-position,relative);top:var(--dialog-surface-top);margin-top:var(--dialog-surface-margin-top);min-height:var(--mdc-dialog-min-height,auto);border-radius:var(--ha-dialog-border-radius,28px)}:host([flexContent]) .mdc-dialog .mdc-dialog__content{display:flex;flex-direction:column}.header_title{position:relative;padding-right:40px;padding-inline-end:40px;padding-inline-start:initial;direction:var(--direction)}.header_title span{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;display:block}.header_button{position:absolute;right:-8px;top:-8px;text-decoration:none;color:inherit;inset-inline-start:initial;inset-inline-end:-8px;direction:var(--direction)}.dialog-actions{inset-inline-start:initial!important;inset-inline-end:0px!important;direction:var(--direction)}`]}]}}),l.M)}};
+//# sourceMappingURL=1009.qgvIF6yIQ0E.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=1318;export const ids=[1318];export const modules={61318:(o,t,e)=>{e.r(t),e.d(t,{HaIconButtonToggle:()=>s});var r=e(309),n=e(5095),i=e(95260),c=e(54371);let s=(0,r.Z)([(0,i.Mo)("ha-icon-button-toggle")],(function(o,t){return{F:class extends t{constructor(...t){super(...t),o(this)}},d:[{kind:"field",decorators:[(0,i.Cb)({type:Boolean,reflect:!0})],key:"selected",value:()=>!1},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`:host{position:relative}mwc-icon-button{position:relative;transition:color 180ms ease-in-out}mwc-icon-button::before{opacity:0;transition:opacity 180ms ease-in-out;background-color:var(--primary-text-color);border-radius:20px;height:40px;width:40px;content:"";position:absolute;top:-10px;left:-10px;bottom:-10px;right:-10px;margin:auto;box-sizing:border-box}:host([border-only]) mwc-icon-button::before{background-color:transparent;border:2px solid var(--primary-text-color)}:host([selected]) mwc-icon-button{color:var(--primary-background-color)}:host([selected]:not([disabled])) mwc-icon-button::before{opacity:1}`}}]}}),c.HaIconButton)}};
+//# sourceMappingURL=1318.e9GsbUI8yzc.js.map
\ No newline at end of file
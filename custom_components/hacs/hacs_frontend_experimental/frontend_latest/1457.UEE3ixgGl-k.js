@@ -0,0 +1,2 @@
+export const id=1457;export const ids=[1457,3216];export const modules={86089:(e,t,a)=>{a.d(t,{U:()=>i});const i=e=>e.stopPropagation()},25551:(e,t,a)=>{a.d(t,{u:()=>l});var i=a(14516);const l=(e,t)=>{try{var a,i;return null!==(a=null===(i=n(t))||void 0===i?void 0:i.of(e))&&void 0!==a?a:e}catch(t){return e}},n=(0,i.Z)((e=>Intl&&"DisplayNames"in Intl?new Intl.DisplayNames(e.language,{type:"language",fallback:"code"}):void 0))},7648:(e,t,a)=>{a.a(e,(async(e,t)=>{try{var i=a(309),l=a(34541),n=a(47838),s=a(5095),d=a(95260),o=a(14516),r=a(18394),c=a(86089),u=a(25551),h=a(28858),v=a(23216),g=a(80411),p=(a(90532),a(71133),e([v]));v=(p.then?(await p)():p)[0];(0,i.Z)([(0,d.Mo)("ha-language-picker")],(function(e,t){class a extends t{constructor(...t){super(...t),e(this)}}return{F:a,d:[{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"languages",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"nativeName",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"noSort",value:()=>!1},{kind:"field",decorators:[(0,d.SB)()],key:"_defaultLanguages",value:()=>[]},{kind:"field",decorators:[(0,d.IO)("ha-select")],key:"_select",value:void 0},{kind:"method",key:"firstUpdated",value:function(e){(0,l.Z)((0,n.Z)(a.prototype),"firstUpdated",this).call(this,e),this._computeDefaultLanguageOptions()}},{kind:"method",key:"updated",value:function(e){(0,l.Z)((0,n.Z)(a.prototype),"updated",this).call(this,e);const t=e.has("hass")&&this.hass&&e.get("hass")&&e.get("hass").locale.language!==this.hass.locale.language;if(e.has("languages")||e.has("value")||t){var i,s;if(this._select.layoutOptions(),this._select.value!==this.value&&(0,r.B)(this,"value-changed",{value:this._select.value}),!this.value)return;const e=this._getLanguagesOptions(null!==(i=this.languages)&&void 0!==i?i:this._defaultLanguages,this.nativeName,null===(s=this.hass)||void 0===s?void 0:s.locale).findIndex((e=>e.value===this.value));-1===e&&(this.value=void 0),t&&this._select.select(e)}}},{kind:"field",key:"_getLanguagesOptions",value(){return(0,o.Z)(((e,t,a)=>{let i=[];if(t){const t=g.o.translations;i=e.map((e=>{var a;let i=null===(a=t[e])||void 0===a?void 0:a.nativeName;if(!i)try{i=new Intl.DisplayNames(e,{type:"language",fallback:"code"}).of(e)}catch(t){i=e}return{value:e,label:i}}))}else a&&(i=e.map((e=>({value:e,label:(0,u.u)(e,a)}))));return!this.noSort&&a&&i.sort(((e,t)=>(0,h.f)(e.label,t.label,a.language))),i}))}},{kind:"method",key:"_computeDefaultLanguageOptions",value:function(){this._defaultLanguages=Object.keys(g.o.translations)}},{kind:"method",key:"render",value:function(){var e,t,a,i,l,n,d;const o=this._getLanguagesOptions(null!==(e=this.languages)&&void 0!==e?e:this._defaultLanguages,this.nativeName,null===(t=this.hass)||void 0===t?void 0:t.locale),r=null!==(a=this.value)&&void 0!==a?a:this.required?null===(i=o[0])||void 0===i?void 0:i.value:this.value;return s.dy` <ha-select .label="${null!==(l=this.label)&&void 0!==l?l:(null===(n=this.hass)||void 0===n?void 0:n.localize("ui.components.language-picker.language"))||"Language"}" .value="${r||""}" .required="${this.required}" .disabled="${this.disabled}" @selected="${this._changed}" @closed="${c.U}" fixedMenuPosition naturalMenuWidth> ${0===o.length?s.dy`<ha-list-item value="">${(null===(d=this.hass)||void 0===d?void 0:d.localize("ui.components.language-picker.no_languages"))||"No languages"}</ha-list-item>`:o.map((e=>s.dy` <ha-list-item .value="${e.value}">${e.label}</ha-list-item> `))} </ha-select> `}},{kind:"get",static:!0,key:"styles",value:function(){return s.iv`ha-select{width:100%}`}},{kind:"method",key:"_changed",value:function(e){const t=e.target;""!==t.value&&t.value!==this.value&&(this.value=t.value,(0,r.B)(this,"value-changed",{value:this.value}))}}]}}),s.oi);t()}catch(e){t(e)}}))},71133:(e,t,a)=>{var i=a(309),l=a(34541),n=a(47838),s=a(49412),d=a(3762),o=a(5095),r=a(95260),c=a(72218),u=a(2537);a(54371);(0,i.Z)([(0,r.Mo)("ha-select")],(function(e,t){class a extends t{constructor(...t){super(...t),e(this)}}return{F:a,d:[{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:()=>!1},{kind:"method",key:"render",value:function(){return o.dy` ${(0,l.Z)((0,n.Z)(a.prototype),"render",this).call(this)} ${this.clearable&&!this.required&&!this.disabled&&this.value?o.dy`<ha-icon-button label="clear" @click="${this._clearValue}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}"></ha-icon-button>`:o.Ld} `}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?o.dy`<span class="mdc-select__icon"><slot name="icon"></slot></span>`:o.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,l.Z)((0,n.Z)(a.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,l.Z)((0,n.Z)(a.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value(){return(0,c.D)((async()=>{await(0,u.y)(),this.layoutOptions()}),500)}},{kind:"field",static:!0,key:"styles",value:()=>[d.W,o.iv`:host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}`]}]}}),s.K)},71457:(e,t,a)=>{a.a(e,(async(e,i)=>{try{a.r(t),a.d(t,{HaLanguageSelector:()=>r});var l=a(309),n=a(5095),s=a(95260),d=a(7648),o=e([d]);d=(o.then?(await o)():o)[0];let r=(0,l.Z)([(0,s.Mo)("ha-selector-language")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"method",key:"render",value:function(){var e,t,a;return n.dy` <ha-language-picker .hass="${this.hass}" .value="${this.value}" .label="${this.label}" .helper="${this.helper}" .languages="${null===(e=this.selector.language)||void 0===e?void 0:e.languages}" .nativeName="${Boolean(null===(t=this.selector)||void 0===t||null===(t=t.language)||void 0===t?void 0:t.native_name)}" .noSort="${Boolean(null===(a=this.selector)||void 0===a||null===(a=a.language)||void 0===a?void 0:a.no_sort)}" .disabled="${this.disabled}" .required="${this.required}"></ha-language-picker> `}},{kind:"field",static:!0,key:"styles",value:()=>n.iv`ha-language-picker{width:100%}`}]}}),n.oi);i()}catch(e){i(e)}}))},23216:(e,t,a)=>{a.a(e,(async(e,i)=>{try{a.r(t);var l=a(43170),n=a(27499),s=a(16723),d=a(82874),o=a(32812),r=a(99331),c=a(27815),u=a(64532),h=a(11674),v=a(53285);const e=async()=>{const e=(0,h.sS)(),t=[];(0,s.Y)()&&await Promise.all([a.e(9460),a.e(254)]).then(a.bind(a,20254)),(0,o.Y)()&&await Promise.all([a.e(7021),a.e(9460),a.e(8196)]).then(a.bind(a,48196)),(0,l.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(6554)]).then(a.bind(a,76554)).then((()=>(0,v.H)()))),(0,n.Yq)(e)&&t.push(Promise.all([a.e(7021),a.e(2684)]).then(a.bind(a,72684))),(0,d.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(9029)]).then(a.bind(a,69029))),(0,r.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(7048)]).then(a.bind(a,87048))),(0,c.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(655)]).then(a.bind(a,20655)).then((()=>a.e(4827).then(a.t.bind(a,64827,23))))),(0,u.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(759)]).then(a.bind(a,20759))),0!==t.length&&await Promise.all(t).then((()=>(0,v.n)(e)))};await e(),i()}catch(e){i(e)}}),1)}};
+//# sourceMappingURL=1457.UEE3ixgGl-k.js.map
\ No newline at end of file
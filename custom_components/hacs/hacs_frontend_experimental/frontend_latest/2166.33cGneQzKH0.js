@@ -0,0 +1,2 @@
+export const id=2166;export const ids=[2166,3216];export const modules={86089:(e,t,i)=>{i.d(t,{U:()=>a});const a=e=>e.stopPropagation()},75668:(e,t,i)=>{i.a(e,(async(e,t)=>{try{var a=i(309),n=i(5095),l=i(95260),d=i(14516),o=i(18394),s=i(86089),r=i(28858),c=i(23216),u=(i(90532),i(71133),e([c]));c=(u.then?(await u)():u)[0];const h=["AD","AE","AF","AG","AI","AL","AM","AO","AQ","AR","AS","AT","AU","AW","AX","AZ","BA","BB","BD","BE","BF","BG","BH","BI","BJ","BL","BM","BN","BO","BQ","BR","BS","BT","BV","BW","BY","BZ","CA","CC","CD","CF","CG","CH","CI","CK","CL","CM","CN","CO","CR","CU","CV","CW","CX","CY","CZ","DE","DJ","DK","DM","DO","DZ","EC","EE","EG","EH","ER","ES","ET","FI","FJ","FK","FM","FO","FR","GA","GB","GD","GE","GF","GG","GH","GI","GL","GM","GN","GP","GQ","GR","GS","GT","GU","GW","GY","HK","HM","HN","HR","HT","HU","ID","IE","IL","IM","IN","IO","IQ","IR","IS","IT","JE","JM","JO","JP","KE","KG","KH","KI","KM","KN","KP","KR","KW","KY","KZ","LA","LB","LC","LI","LK","LR","LS","LT","LU","LV","LY","MA","MC","MD","ME","MF","MG","MH","MK","ML","MM","MN","MO","MP","MQ","MR","MS","MT","MU","MV","MW","MX","MY","MZ","NA","NC","NE","NF","NG","NI","NL","NO","NP","NR","NU","NZ","OM","PA","PE","PF","PG","PH","PK","PL","PM","PN","PR","PS","PT","PW","PY","QA","RE","RO","RS","RU","RW","SA","SB","SC","SD","SE","SG","SH","SI","SJ","SK","SL","SM","SN","SO","SR","SS","ST","SV","SX","SY","SZ","TC","TD","TF","TG","TH","TJ","TK","TL","TM","TN","TO","TR","TT","TV","TW","TZ","UA","UG","UM","US","UY","UZ","VA","VC","VE","VG","VI","VN","VU","WF","WS","YE","YT","ZA","ZM","ZW"];(0,a.Z)([(0,l.Mo)("ha-country-picker")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)()],key:"language",value:()=>"en"},{kind:"field",decorators:[(0,l.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"countries",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"noSort",value:()=>!1},{kind:"field",key:"_getOptions",value(){return(0,d.Z)(((e,t)=>{let i=[];const a=Intl&&"DisplayNames"in Intl?new Intl.DisplayNames(e,{type:"region",fallback:"code"}):void 0;return i=t?t.map((e=>({value:e,label:a?a.of(e):e}))):h.map((e=>({value:e,label:a?a.of(e):e}))),this.noSort||i.sort(((t,i)=>(0,r.f)(t.label,i.label,e))),i}))}},{kind:"method",key:"render",value:function(){const e=this._getOptions(this.language,this.countries);return n.dy` <ha-select .label="${this.label}" .value="${this.value}" .required="${this.required}" .helper="${this.helper}" .disabled="${this.disabled}" @selected="${this._changed}" @closed="${s.U}" fixedMenuPosition naturalMenuWidth> ${e.map((e=>n.dy` <ha-list-item .value="${e.value}">${e.label}</ha-list-item> `))} </ha-select> `}},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`ha-select{width:100%}`}},{kind:"method",key:"_changed",value:function(e){const t=e.target;""!==t.value&&t.value!==this.value&&(this.value=t.value,(0,o.B)(this,"value-changed",{value:this.value}))}}]}}),n.oi);t()}catch(e){t(e)}}))},71133:(e,t,i)=>{var a=i(309),n=i(34541),l=i(47838),d=i(49412),o=i(3762),s=i(5095),r=i(95260),c=i(72218),u=i(2537);i(54371);(0,a.Z)([(0,r.Mo)("ha-select")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:()=>!1},{kind:"method",key:"render",value:function(){return s.dy` ${(0,n.Z)((0,l.Z)(i.prototype),"render",this).call(this)} ${this.clearable&&!this.required&&!this.disabled&&this.value?s.dy`<ha-icon-button label="clear" @click="${this._clearValue}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}"></ha-icon-button>`:s.Ld} `}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?s.dy`<span class="mdc-select__icon"><slot name="icon"></slot></span>`:s.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,n.Z)((0,l.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,n.Z)((0,l.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value(){return(0,c.D)((async()=>{await(0,u.y)(),this.layoutOptions()}),500)}},{kind:"field",static:!0,key:"styles",value:()=>[o.W,s.iv`:host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}`]}]}}),d.K)},2166:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.r(t),i.d(t,{HaCountrySelector:()=>r});var n=i(309),l=i(5095),d=i(95260),o=i(75668),s=e([o]);o=(s.then?(await s)():s)[0];let r=(0,n.Z)([(0,d.Mo)("ha-selector-country")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"method",key:"render",value:function(){var e,t;return l.dy` <ha-country-picker .hass="${this.hass}" .value="${this.value}" .label="${this.label}" .helper="${this.helper}" .countries="${null===(e=this.selector.country)||void 0===e?void 0:e.countries}" .noSort="${null===(t=this.selector.country)||void 0===t?void 0:t.no_sort}" .disabled="${this.disabled}" .required="${this.required}"></ha-country-picker> `}},{kind:"field",static:!0,key:"styles",value:()=>l.iv`ha-country-picker{width:100%}`}]}}),l.oi);a()}catch(e){a(e)}}))},23216:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.r(t);var n=i(43170),l=i(27499),d=i(16723),o=i(82874),s=i(32812),r=i(99331),c=i(27815),u=i(64532),h=i(11674),v=i(53285);const e=async()=>{const e=(0,h.sS)(),t=[];(0,d.Y)()&&await Promise.all([i.e(9460),i.e(254)]).then(i.bind(i,20254)),(0,s.Y)()&&await Promise.all([i.e(7021),i.e(9460),i.e(8196)]).then(i.bind(i,48196)),(0,n.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(6554)]).then(i.bind(i,76554)).then((()=>(0,v.H)()))),(0,l.Yq)(e)&&t.push(Promise.all([i.e(7021),i.e(2684)]).then(i.bind(i,72684))),(0,o.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(9029)]).then(i.bind(i,69029))),(0,r.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(7048)]).then(i.bind(i,87048))),(0,c.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(655)]).then(i.bind(i,20655)).then((()=>i.e(4827).then(i.t.bind(i,64827,23))))),(0,u.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(759)]).then(i.bind(i,20759))),0!==t.length&&await Promise.all(t).then((()=>(0,v.n)(e)))};await e(),a()}catch(e){a(e)}}),1)}};
+//# sourceMappingURL=2166.33cGneQzKH0.js.map
\ No newline at end of file
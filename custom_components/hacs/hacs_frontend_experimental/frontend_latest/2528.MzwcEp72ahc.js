@@ -0,0 +1,2 @@
+export const id=2528;export const ids=[2528,3216,8664];export const modules={58135:(e,t,a)=>{a.d(t,{z:()=>n});const n=e=>(t,a)=>e.includes(t,a)},18007:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.d(t,{Bt:()=>u});var i=a(22075),o=a(50345),r=a(23216),l=e([r]);r=(l.then?(await l)():l)[0];const s=["sunday","monday","tuesday","wednesday","thursday","friday","saturday"],u=e=>e.first_weekday===o.FS.language?"weekInfo"in Intl.Locale.prototype?new Intl.Locale(e.language).weekInfo.firstDay%7:(0,i.L)(e.language)%7:s.includes(e.first_weekday)?s.indexOf(e.first_weekday):1;n()}catch(e){n(e)}}))},83111:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.d(t,{WB:()=>m,p6:()=>u});var i=a(14516),o=a(50345),r=a(23216),l=a(45502),s=e([r]);r=(s.then?(await s)():s)[0];(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",month:"long",day:"numeric",timeZone:(0,l.f)(e.time_zone,t)})));const u=(e,t,a)=>d(t,a.time_zone).format(e),d=(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",timeZone:(0,l.f)(e.time_zone,t)}))),m=((0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"short",day:"numeric",timeZone:(0,l.f)(e.time_zone,t)}))),(e,t,a)=>{var n,i,r,l;const s=c(t,a.time_zone);if(t.date_format===o.t6.language||t.date_format===o.t6.system)return s.format(e);const u=s.formatToParts(e),d=null===(n=u.find((e=>"literal"===e.type)))||void 0===n?void 0:n.value,m=null===(i=u.find((e=>"day"===e.type)))||void 0===i?void 0:i.value,h=null===(r=u.find((e=>"month"===e.type)))||void 0===r?void 0:r.value,y=null===(l=u.find((e=>"year"===e.type)))||void 0===l?void 0:l.value,v=u.at(u.length-1);let f="literal"===(null==v?void 0:v.type)?null==v?void 0:v.value:"";"bg"===t.language&&t.date_format===o.t6.YMD&&(f="");return{[o.t6.DMY]:`${m}${d}${h}${d}${y}${f}`,[o.t6.MDY]:`${h}${d}${m}${d}${y}${f}`,[o.t6.YMD]:`${y}${d}${h}${d}${m}${f}`}[t.date_format]}),c=(0,i.Z)(((e,t)=>{const a=e.date_format===o.t6.system?void 0:e.language;return e.date_format===o.t6.language||(e.date_format,o.t6.system),new Intl.DateTimeFormat(a,{year:"numeric",month:"numeric",day:"numeric",timeZone:(0,l.f)(e.time_zone,t)})}));(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{day:"numeric",month:"short",timeZone:(0,l.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"long",year:"numeric",timeZone:(0,l.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"long",timeZone:(0,l.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",timeZone:(0,l.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",timeZone:(0,l.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"short",timeZone:(0,l.f)(e.time_zone,t)})));n()}catch(e){n(e)}}))},7501:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.d(t,{o0:()=>m});var i=a(14516),o=a(23216),r=a(83111),l=a(91289),s=a(45502),u=a(42219),d=e([o,r,l]);[o,r,l]=d.then?(await d)():d;const m=(e,t,a)=>c(t,a.time_zone).format(e),c=(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",hour:(0,u.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,u.y)(e)?"h12":"h23",timeZone:(0,s.f)(e.time_zone,t)})));(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"short",day:"numeric",hour:(0,u.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,u.y)(e)?"h12":"h23",timeZone:(0,s.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"short",day:"numeric",hour:(0,u.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,u.y)(e)?"h12":"h23",timeZone:(0,s.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",hour:(0,u.y)(e)?"numeric":"2-digit",minute:"2-digit",second:"2-digit",hourCycle:(0,u.y)(e)?"h12":"h23",timeZone:(0,s.f)(e.time_zone,t)})));n()}catch(e){n(e)}}))},91289:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.d(t,{Vu:()=>m,mr:()=>u});var i=a(14516),o=a(23216),r=a(45502),l=a(42219),s=e([o]);o=(s.then?(await s)():s)[0];const u=(e,t,a)=>d(t,a.time_zone).format(e),d=(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{hour:"numeric",minute:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,r.f)(e.time_zone,t)}))),m=(e,t,a)=>c(t,a.time_zone).format(e),c=(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{hour:(0,l.y)(e)?"numeric":"2-digit",minute:"2-digit",second:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,r.f)(e.time_zone,t)})));(0,i.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",hour:(0,l.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,r.f)(e.time_zone,t)}))),(0,i.Z)(((e,t)=>new Intl.DateTimeFormat("en-GB",{hour:"numeric",minute:"2-digit",hour12:!1,timeZone:(0,r.f)(e.time_zone,t)})));n()}catch(e){n(e)}}))},76950:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.d(t,{G:()=>u});var i=a(14516),o=a(23216),r=a(94844),l=e([o,r]);[o,r]=l.then?(await l)():l;const s=(0,i.Z)((e=>new Intl.RelativeTimeFormat(e.language,{numeric:"auto"}))),u=(e,t,a,n=!0)=>{const i=(0,r.W)(e,a,t);return n?s(t).format(i.value,i.unit):Intl.NumberFormat(t.language,{style:"unit",unit:i.unit,unitDisplay:"long"}).format(Math.abs(i.value))};n()}catch(e){n(e)}}))},45502:(e,t,a)=>{a.d(t,{f:()=>d});var n,i,o,r,l,s=a(50345);const u=null!==(n=null===(i=(o=Intl).DateTimeFormat)||void 0===i||null===(r=(l=i.call(o)).resolvedOptions)||void 0===r?void 0:r.call(l).timeZone)&&void 0!==n?n:"UTC",d=(e,t)=>e===s.c_.local&&"UTC"!==u?u:t},42219:(e,t,a)=>{a.d(t,{y:()=>o});var n=a(14516),i=a(50345);const o=(0,n.Z)((e=>{if(e.time_format===i.zt.language||e.time_format===i.zt.system){const t=e.time_format===i.zt.language?e.language:void 0;return new Date("January 1, 2023 22:00:00").toLocaleString(t).includes("10")}return e.time_format===i.zt.am_pm}))},58664:(e,t,a)=>{a.d(t,{v:()=>o});var n=a(21157),i=a(36655);function o(e,t){const a=(0,i.M)(e.entity_id),o=void 0!==t?t:null==e?void 0:e.state;if(["button","event","input_button","scene"].includes(a))return o!==n.nZ;if((0,n.rk)(o))return!1;if(o===n.PX&&"alert"!==a)return!1;switch(a){case"alarm_control_panel":return"disarmed"!==o;case"alert":return"idle"!==o;case"cover":case"valve":return"closed"!==o;case"device_tracker":case"person":return"not_home"!==o;case"lawn_mower":return["mowing","error"].includes(o);case"lock":return"locked"!==o;case"media_player":return"standby"!==o;case"vacuum":return!["idle","docked","paused"].includes(o);case"plant":return"problem"===o;case"group":return["on","home","open","locked","problem"].includes(o);case"timer":return"active"===o;case"camera":return"streaming"===o}return!0}},930:(e,t,a)=>{a.d(t,{f:()=>n});const n=e=>e.charAt(0).toUpperCase()+e.slice(1)},94844:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.d(t,{W:()=>c});var i=a(62308),o=a(59401),r=a(27296),l=a(18007),s=e([l]);l=(s.then?(await s)():s)[0];const u=1e3,d=60,m=60*d;function c(e,t=Date.now(),a,n={}){const s={...h,...n||{}},c=(+e-+t)/u;if(Math.abs(c)<s.second)return{value:Math.round(c),unit:"second"};const y=c/d;if(Math.abs(y)<s.minute)return{value:Math.round(y),unit:"minute"};const v=c/m;if(Math.abs(v)<s.hour)return{value:Math.round(v),unit:"hour"};const f=new Date(e),g=new Date(t);f.setHours(0,0,0,0),g.setHours(0,0,0,0);const _=(0,i.Z)(f,g);if(0===_)return{value:Math.round(v),unit:"hour"};if(Math.abs(_)<s.day)return{value:_,unit:"day"};const p=(0,l.Bt)(a),k=(0,o.Z)(f,{weekStartsOn:p}),w=(0,o.Z)(g,{weekStartsOn:p}),Z=(0,r.Z)(k,w);if(0===Z)return{value:_,unit:"day"};if(Math.abs(Z)<s.week)return{value:Z,unit:"week"};const b=f.getFullYear()-g.getFullYear(),z=12*b+f.getMonth()-g.getMonth();return 0===z?{value:Z,unit:"week"}:Math.abs(z)<s.month||0===b?{value:z,unit:"month"}:{value:Math.round(b),unit:"year"}}const h={second:45,minute:45,hour:22,day:5,week:4,month:11};n()}catch(y){n(y)}}))},21157:(e,t,a)=>{a.d(t,{PX:()=>r,V_:()=>l,nZ:()=>i,rk:()=>u});var n=a(58135);const i="unavailable",o="unknown",r="off",l=[i,o],s=[i,o,r],u=(0,n.z)(l);(0,n.z)(s)},93843:(e,t,a)=>{a.a(e,(async(e,t)=>{try{var n=a(309),i=a(5095),o=a(95260),r=a(2733),l=(a(75868),a(21157)),s=a(64147),u=a(97916),d=e([u]);u=(d.then?(await d)():d)[0];(0,n.Z)([(0,o.Mo)("entity-preview-row")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,o.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,o.SB)()],key:"stateObj",value:void 0},{kind:"method",key:"render",value:function(){if(!this.stateObj)return i.Ld;const e=this.stateObj;return i.dy`<state-badge .hass="${this.hass}" .stateObj="${e}" stateColor></state-badge> <div class="name" .title="${(0,r.C)(e)}"> ${(0,r.C)(e)} </div> <div class="value"> ${e.attributes.device_class!==s.Ft||(0,l.rk)(e.state)?this.hass.formatEntityState(e):i.dy` <hui-timestamp-display .hass="${this.hass}" .ts="${new Date(e.state)}" capitalize></hui-timestamp-display> `} </div>`}},{kind:"get",static:!0,key:"styles",value:function(){return i.iv`:host{display:flex;align-items:center;flex-direction:row}.name{margin-left:16px;margin-right:8px;flex:1 1 30%}.value{direction:ltr}`}}]}}),i.oi);t()}catch(e){t(e)}}))},97916:(e,t,a)=>{a.a(e,(async(e,t)=>{try{var n=a(309),i=a(34541),o=a(47838),r=a(5095),l=a(95260),s=a(83111),u=a(7501),d=a(91289),m=a(76950),c=a(930),h=e([s,u,d,m]);[s,u,d,m]=h.then?(await h)():h;const y={date:s.p6,datetime:u.o0,time:d.mr},v=["relative","total"];(0,n.Z)([(0,l.Mo)("hui-timestamp-display")],(function(e,t){class a extends t{constructor(...t){super(...t),e(this)}}return{F:a,d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"ts",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"format",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"capitalize",value:()=>!1},{kind:"field",decorators:[(0,l.SB)()],key:"_relative",value:void 0},{kind:"field",key:"_connected",value:void 0},{kind:"field",key:"_interval",value:void 0},{kind:"method",key:"connectedCallback",value:function(){(0,i.Z)((0,o.Z)(a.prototype),"connectedCallback",this).call(this),this._connected=!0,this._startInterval()}},{kind:"method",key:"disconnectedCallback",value:function(){(0,i.Z)((0,o.Z)(a.prototype),"disconnectedCallback",this).call(this),this._connected=!1,this._clearInterval()}},{kind:"method",key:"render",value:function(){if(!this.ts||!this.hass)return r.Ld;if(isNaN(this.ts.getTime()))return r.dy`${this.hass.localize("ui.panel.lovelace.components.timestamp-display.invalid")}`;const e=this._format;return v.includes(e)?r.dy` ${this._relative} `:e in y?r.dy` ${y[e](this.ts,this.hass.locale,this.hass.config)} `:r.dy`${this.hass.localize("ui.panel.lovelace.components.timestamp-display.invalid_format")}`}},{kind:"method",key:"updated",value:function(e){(0,i.Z)((0,o.Z)(a.prototype),"updated",this).call(this,e),e.has("format")&&this._connected&&(v.includes("relative")?this._startInterval():this._clearInterval())}},{kind:"get",key:"_format",value:function(){return this.format||"relative"}},{kind:"method",key:"_startInterval",value:function(){this._clearInterval(),this._connected&&v.includes(this._format)&&(this._updateRelative(),this._interval=window.setInterval((()=>this._updateRelative()),1e3))}},{kind:"method",key:"_clearInterval",value:function(){this._interval&&(clearInterval(this._interval),this._interval=void 0)}},{kind:"method",key:"_updateRelative",value:function(){var e;this.ts&&null!==(e=this.hass)&&void 0!==e&&e.localize&&(this._relative="relative"===this._format?(0,m.G)(this.ts,this.hass.locale):(0,m.G)(new Date,this.hass.locale,this.ts,!1),this._relative=this.capitalize?(0,c.f)(this._relative):this._relative)}}]}}),r.oi);t()}catch(e){t(e)}}))},23216:(e,t,a)=>{a.a(e,(async(e,n)=>{try{a.r(t);var i=a(43170),o=a(27499),r=a(16723),l=a(82874),s=a(32812),u=a(99331),d=a(27815),m=a(64532),c=a(11674),h=a(53285);const e=async()=>{const e=(0,c.sS)(),t=[];(0,r.Y)()&&await Promise.all([a.e(9460),a.e(254)]).then(a.bind(a,20254)),(0,s.Y)()&&await Promise.all([a.e(7021),a.e(9460),a.e(8196)]).then(a.bind(a,48196)),(0,i.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(6554)]).then(a.bind(a,76554)).then((()=>(0,h.H)()))),(0,o.Yq)(e)&&t.push(Promise.all([a.e(7021),a.e(2684)]).then(a.bind(a,72684))),(0,l.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(9029)]).then(a.bind(a,69029))),(0,u.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(7048)]).then(a.bind(a,87048))),(0,d.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(655)]).then(a.bind(a,20655)).then((()=>a.e(4827).then(a.t.bind(a,64827,23))))),(0,m.Y)(e)&&t.push(Promise.all([a.e(7021),a.e(759)]).then(a.bind(a,20759))),0!==t.length&&await Promise.all(t).then((()=>(0,h.n)(e)))};await e(),n()}catch(e){n(e)}}),1)}};
+//# sourceMappingURL=2528.MzwcEp72ahc.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=254;export const ids=[254];export const modules={20254:(e,n,o)=>{Object.defineProperty(n,"__esModule",{value:!0});var t=o(39460);"undefined"==typeof Intl&&("undefined"!=typeof window?Object.defineProperty(window,"Intl",{value:{}}):"undefined"!=typeof global&&Object.defineProperty(global,"Intl",{value:{}})),Object.defineProperty(Intl,"getCanonicalLocales",{value:t.getCanonicalLocales,writable:!0,enumerable:!1,configurable:!0})}};
+//# sourceMappingURL=254.sgXbTzp50vY.js.map
\ No newline at end of file
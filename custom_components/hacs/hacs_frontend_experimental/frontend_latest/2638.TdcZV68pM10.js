@@ -0,0 +1 @@
+export const id=2638;export const ids=[2638];export const modules={2638:(o,t,s)=>{s.r(t)}};
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=3216;export const ids=[3216];export const modules={23216:(e,n,t)=>{t.a(e,(async(e,s)=>{try{t.r(n);var i=t(43170),a=t(27499),h=t(16723),l=t(82874),o=t(32812),r=t(99331),d=t(27815),m=t(64532),b=t(11674),c=t(53285);const e=async()=>{const e=(0,b.sS)(),n=[];(0,h.Y)()&&await Promise.all([t.e(9460),t.e(254)]).then(t.bind(t,20254)),(0,o.Y)()&&await Promise.all([t.e(7021),t.e(9460),t.e(8196)]).then(t.bind(t,48196)),(0,i.Y)(e)&&n.push(Promise.all([t.e(7021),t.e(6554)]).then(t.bind(t,76554)).then((()=>(0,c.H)()))),(0,a.Yq)(e)&&n.push(Promise.all([t.e(7021),t.e(2684)]).then(t.bind(t,72684))),(0,l.Y)(e)&&n.push(Promise.all([t.e(7021),t.e(9029)]).then(t.bind(t,69029))),(0,r.Y)(e)&&n.push(Promise.all([t.e(7021),t.e(7048)]).then(t.bind(t,87048))),(0,d.Y)(e)&&n.push(Promise.all([t.e(7021),t.e(655)]).then(t.bind(t,20655)).then((()=>t.e(4827).then(t.t.bind(t,64827,23))))),(0,m.Y)(e)&&n.push(Promise.all([t.e(7021),t.e(759)]).then(t.bind(t,20759))),0!==n.length&&await Promise.all(n).then((()=>(0,c.n)(e)))};await e(),s()}catch(e){s(e)}}),1)}};
+//# sourceMappingURL=3216.VH9U6OUbxiI.js.map
\ No newline at end of file
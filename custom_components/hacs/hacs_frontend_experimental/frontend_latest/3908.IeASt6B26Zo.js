@@ -0,0 +1,2 @@
+export const id=3908;export const ids=[3908,3216];export const modules={83111:(e,t,n)=>{n.a(e,(async(e,i)=>{try{n.d(t,{WB:()=>d,p6:()=>l});var a=n(14516),m=n(50345),r=n(23216),o=n(45502),u=e([r]);r=(u.then?(await u)():u)[0];(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",month:"long",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)})));const l=(e,t,n)=>c(t,n.time_zone).format(e),c=(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),d=((0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"short",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),(e,t,n)=>{var i,a,r,o;const u=s(t,n.time_zone);if(t.date_format===m.t6.language||t.date_format===m.t6.system)return u.format(e);const l=u.formatToParts(e),c=null===(i=l.find((e=>"literal"===e.type)))||void 0===i?void 0:i.value,d=null===(a=l.find((e=>"day"===e.type)))||void 0===a?void 0:a.value,g=null===(r=l.find((e=>"month"===e.type)))||void 0===r?void 0:r.value,h=null===(o=l.find((e=>"year"===e.type)))||void 0===o?void 0:o.value,y=l.at(l.length-1);let _="literal"===(null==y?void 0:y.type)?null==y?void 0:y.value:"";"bg"===t.language&&t.date_format===m.t6.YMD&&(_="");return{[m.t6.DMY]:`${d}${c}${g}${c}${h}${_}`,[m.t6.MDY]:`${g}${c}${d}${c}${h}${_}`,[m.t6.YMD]:`${h}${c}${g}${c}${d}${_}`}[t.date_format]}),s=(0,a.Z)(((e,t)=>{const n=e.date_format===m.t6.system?void 0:e.language;return e.date_format===m.t6.language||(e.date_format,m.t6.system),new Intl.DateTimeFormat(n,{year:"numeric",month:"numeric",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)})}));(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{day:"numeric",month:"short",timeZone:(0,o.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"long",year:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"long",timeZone:(0,o.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",timeZone:(0,o.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"short",timeZone:(0,o.f)(e.time_zone,t)})));i()}catch(e){i(e)}}))},7501:(e,t,n)=>{n.a(e,(async(e,i)=>{try{n.d(t,{o0:()=>d});var a=n(14516),m=n(23216),r=n(83111),o=n(91289),u=n(45502),l=n(42219),c=e([m,r,o]);[m,r,o]=c.then?(await c)():c;const d=(e,t,n)=>s(t,n.time_zone).format(e),s=(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",hour:(0,l.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,u.f)(e.time_zone,t)})));(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"short",day:"numeric",hour:(0,l.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,u.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"short",day:"numeric",hour:(0,l.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,u.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",hour:(0,l.y)(e)?"numeric":"2-digit",minute:"2-digit",second:"2-digit",hourCycle:(0,l.y)(e)?"h12":"h23",timeZone:(0,u.f)(e.time_zone,t)})));i()}catch(e){i(e)}}))},91289:(e,t,n)=>{n.a(e,(async(e,i)=>{try{n.d(t,{Vu:()=>d,mr:()=>l});var a=n(14516),m=n(23216),r=n(45502),o=n(42219),u=e([m]);m=(u.then?(await u)():u)[0];const l=(e,t,n)=>c(t,n.time_zone).format(e),c=(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{hour:"numeric",minute:"2-digit",hourCycle:(0,o.y)(e)?"h12":"h23",timeZone:(0,r.f)(e.time_zone,t)}))),d=(e,t,n)=>s(t,n.time_zone).format(e),s=(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{hour:(0,o.y)(e)?"numeric":"2-digit",minute:"2-digit",second:"2-digit",hourCycle:(0,o.y)(e)?"h12":"h23",timeZone:(0,r.f)(e.time_zone,t)})));(0,a.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",hour:(0,o.y)(e)?"numeric":"2-digit",minute:"2-digit",hourCycle:(0,o.y)(e)?"h12":"h23",timeZone:(0,r.f)(e.time_zone,t)}))),(0,a.Z)(((e,t)=>new Intl.DateTimeFormat("en-GB",{hour:"numeric",minute:"2-digit",hour12:!1,timeZone:(0,r.f)(e.time_zone,t)})));i()}catch(e){i(e)}}))},45502:(e,t,n)=>{n.d(t,{f:()=>c});var i,a,m,r,o,u=n(50345);const l=null!==(i=null===(a=(m=Intl).DateTimeFormat)||void 0===a||null===(r=(o=a.call(m)).resolvedOptions)||void 0===r?void 0:r.call(o).timeZone)&&void 0!==i?i:"UTC",c=(e,t)=>e===u.c_.local&&"UTC"!==l?l:t},42219:(e,t,n)=>{n.d(t,{y:()=>m});var i=n(14516),a=n(50345);const m=(0,i.Z)((e=>{if(e.time_format===a.zt.language||e.time_format===a.zt.system){const t=e.time_format===a.zt.language?e.language:void 0;return new Date("January 1, 2023 22:00:00").toLocaleString(t).includes("10")}return e.time_format===a.zt.am_pm}))},73908:(e,t,n)=>{n.a(e,(async(e,i)=>{try{n.d(t,{S:()=>l});n(27087),n(53687);var a=n(83111),m=n(7501),r=(n(41010),n(930)),o=(n(80263),n(36655)),u=e([a,m]);[a,m]=u.then?(await u)():u;const l=(e,t,n,i)=>{const a=t.entity_id,m=t.attributes.device_class,u=(0,o.M)(a),l=n[a],c=null==l?void 0:l.translation_key;return c&&e(`component.${l.platform}.entity.${u}.${c}.state_attributes.${i}.name`)||m&&e(`component.${u}.entity_component.${m}.state_attributes.${i}.name`)||e(`component.${u}.entity_component._.state_attributes.${i}.name`)||(0,r.f)(i.replace(/_/g," ").replace(/\bid\b/g,"ID").replace(/\bip\b/g,"IP").replace(/\bmac\b/g,"MAC").replace(/\bgps\b/g,"GPS"))};i()}catch(e){i(e)}}))},41010:(e,t,n)=>{n.d(t,{uf:()=>a});var i=n(50345);const a=(e,t,n)=>{const a=t?(e=>{switch(e.number_format){case i.y4.comma_decimal:return["en-US","en"];case i.y4.decimal_comma:return["de","es","it"];case i.y4.space_comma:return["fr","sv","cs"];case i.y4.system:return;default:return e.language}})(t):void 0;if(Number.isNaN=Number.isNaN||function e(t){return"number"==typeof t&&e(t)},(null==t?void 0:t.number_format)!==i.y4.none&&!Number.isNaN(Number(e))&&Intl)try{return new Intl.NumberFormat(a,m(e,n)).format(Number(e))}catch(t){return console.error(t),new Intl.NumberFormat(void 0,m(e,n)).format(Number(e))}return!Number.isNaN(Number(e))&&""!==e&&(null==t?void 0:t.number_format)===i.y4.none&&Intl?new Intl.NumberFormat("en-US",m(e,{...n,useGrouping:!1})).format(Number(e)):"string"==typeof e?e:`${((e,t=2)=>Math.round(e*10**t)/10**t)(e,null==n?void 0:n.maximumFractionDigits).toString()}${"currency"===(null==n?void 0:n.style)?` ${n.currency}`:""}`},m=(e,t)=>{const n={maximumFractionDigits:2,...t};if("string"!=typeof e)return n;if(!t||void 0===t.minimumFractionDigits&&void 0===t.maximumFractionDigits){const t=e.indexOf(".")>-1?e.split(".")[1].length:0;n.minimumFractionDigits=t,n.maximumFractionDigits=t}return n}},930:(e,t,n)=>{n.d(t,{f:()=>i});const i=e=>e.charAt(0).toUpperCase()+e.slice(1)},80263:(e,t,n)=>{const i="^\\d{4}-(0[1-9]|1[0-2])-([12]\\d|0[1-9]|3[01])";new RegExp(i+"$"),new RegExp(i)},27087:(e,t,n)=>{n.d(t,{F_:()=>i});new Set(["temperature","current_temperature","target_temperature","target_temp_temp","target_temp_high","target_temp_low","target_temp_step","min_temp","max_temp"]);const i={climate:{humidity:"%",current_humidity:"%",target_humidity_low:"%",target_humidity_high:"%",target_humidity_step:"%",min_humidity:"%",max_humidity:"%"},cover:{current_position:"%",current_tilt_position:"%"},fan:{percentage:"%"},humidifier:{humidity:"%",current_humidity:"%",min_humidity:"%",max_humidity:"%"},light:{color_temp:"mired",max_mireds:"mired",min_mireds:"mired",color_temp_kelvin:"K",min_color_temp_kelvin:"K",max_color_temp_kelvin:"K",brightness:"%"},sun:{elevation:"°"},vacuum:{battery_level:"%"},valve:{current_position:"%"},sensor:{battery_level:"%"},media_player:{volume_level:"%"}}},23216:(e,t,n)=>{n.a(e,(async(e,i)=>{try{n.r(t);var a=n(43170),m=n(27499),r=n(16723),o=n(82874),u=n(32812),l=n(99331),c=n(27815),d=n(64532),s=n(11674),g=n(53285);const e=async()=>{const e=(0,s.sS)(),t=[];(0,r.Y)()&&await Promise.all([n.e(9460),n.e(254)]).then(n.bind(n,20254)),(0,u.Y)()&&await Promise.all([n.e(7021),n.e(9460),n.e(8196)]).then(n.bind(n,48196)),(0,a.Y)(e)&&t.push(Promise.all([n.e(7021),n.e(6554)]).then(n.bind(n,76554)).then((()=>(0,g.H)()))),(0,m.Yq)(e)&&t.push(Promise.all([n.e(7021),n.e(2684)]).then(n.bind(n,72684))),(0,o.Y)(e)&&t.push(Promise.all([n.e(7021),n.e(9029)]).then(n.bind(n,69029))),(0,l.Y)(e)&&t.push(Promise.all([n.e(7021),n.e(7048)]).then(n.bind(n,87048))),(0,c.Y)(e)&&t.push(Promise.all([n.e(7021),n.e(655)]).then(n.bind(n,20655)).then((()=>n.e(4827).then(n.t.bind(n,64827,23))))),(0,d.Y)(e)&&t.push(Promise.all([n.e(7021),n.e(759)]).then(n.bind(n,20759))),0!==t.length&&await Promise.all(t).then((()=>(0,g.n)(e)))};await e(),i()}catch(e){i(e)}}),1)}};
+//# sourceMappingURL=3908.IeASt6B26Zo.js.map
\ No newline at end of file
@@ -0,0 +1,18 @@
+/*! For license information please see 4370.J9MDWy8fJNw.js.LICENSE.txt */
+export const id=4370;export const ids=[4370];export const modules={69222:(t,e,i)=>{var s=i(43204),r=i(95260),n=i(5095);class o extends n.oi{constructor(){super(...arguments),this.inset=!1,this.insetStart=!1,this.insetEnd=!1}}(0,s.__decorate)([(0,r.Cb)({type:Boolean,reflect:!0})],o.prototype,"inset",void 0),(0,s.__decorate)([(0,r.Cb)({type:Boolean,reflect:!0,attribute:"inset-start"})],o.prototype,"insetStart",void 0),(0,s.__decorate)([(0,r.Cb)({type:Boolean,reflect:!0,attribute:"inset-end"})],o.prototype,"insetEnd",void 0);const a=n.iv`:host{--_color:var(--md-divider-color, var(--md-sys-color-outline-variant, #cac4d0));--_thickness:var(--md-divider-thickness, 1px);box-sizing:border-box;color:var(--_color);display:flex;height:var(--_thickness);width:100%}:host([inset-start]),:host([inset]){padding-inline-start:16px}:host([inset-end]),:host([inset]){padding-inline-end:16px}:host::before{background:currentColor;content:"";height:100%;width:100%}@media(forced-colors:active){:host::before{background:CanvasText}}`;let l=class extends o{};l.styles=[a],l=(0,s.__decorate)([(0,r.Mo)("md-divider")],l)},74496:(t,e,i)=>{function s(t,e=h){const i=o(t,e);return i&&(i.tabIndex=0,i.focus()),i}function r(t,e=h){const i=function(t,e=h){for(let i=t.length-1;i>=0;i--){const s=t[i];if(e(s))return s}return null}(t,e);return i&&(i.tabIndex=0,i.focus()),i}function n(t,e=h){for(let i=0;i<t.length;i++){const s=t[i];if(0===s.tabIndex&&e(s))return{item:s,index:i}}return null}function o(t,e=h){for(const i of t)if(e(i))return i;return null}function a(t,e,i=h){if(e){const s=function(t,e,i=h){for(let s=1;s<t.length;s++){const r=t[(s+e)%t.length];if(i(r))return r}return t[e]?t[e]:null}(t,e.index,i);return s&&(s.tabIndex=0,s.focus()),s}return s(t,i)}function l(t,e,i=h){if(e){const s=function(t,e,i=h){for(let s=1;s<t.length;s++){const r=t[(e-s+t.length)%t.length];if(i(r))return r}return t[e]?t[e]:null}(t,e.index,i);return s&&(s.tabIndex=0,s.focus()),s}return r(t,i)}function c(){return new Event("request-activation",{bubbles:!0,composed:!0})}function h(t){return!t.disabled}i.d(e,{B3:()=>o,CL:()=>n,PQ:()=>s,Rn:()=>l,dl:()=>r,oh:()=>c,xZ:()=>a})},76507:(t,e,i)=>{i.d(e,{g:()=>M});var s=i(43204),r=i(95260),n=(i(86477),i(5095));class o extends n.oi{constructor(){super(...arguments),this.multiline=!1}render(){return n.dy` <slot name="container"></slot> <slot class="non-text" name="start"></slot> <div class="text"> <slot name="overline" @slotchange="${this.handleTextSlotChange}"></slot> <slot class="default-slot" @slotchange="${this.handleTextSlotChange}"></slot> <slot name="headline" @slotchange="${this.handleTextSlotChange}"></slot> <slot name="supporting-text" @slotchange="${this.handleTextSlotChange}"></slot> </div> <slot class="non-text" name="trailing-supporting-text"></slot> <slot class="non-text" name="end"></slot> `}handleTextSlotChange(){let t=!1,e=0;for(const i of this.textSlots)if(a(i)&&(e+=1),e>1){t=!0;break}this.multiline=t}}function a(t){for(const i of t.assignedNodes({flatten:!0})){var e;const t=i.nodeType===Node.ELEMENT_NODE,s=i.nodeType===Node.TEXT_NODE&&(null===(e=i.textContent)||void 0===e?void 0:e.match(/\S/));if(t||s)return!0}return!1}(0,s.__decorate)([(0,r.Cb)({type:Boolean,reflect:!0})],o.prototype,"multiline",void 0),(0,s.__decorate)([(0,r.Kt)(".text slot")],o.prototype,"textSlots",void 0);const l=n.iv`:host{color:var(--md-sys-color-on-surface,#1d1b20);font-family:var(--md-sys-typescale-body-large-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-body-large-size, 1rem);font-weight:var(--md-sys-typescale-body-large-weight,var(--md-ref-typeface-weight-regular,400));line-height:var(--md-sys-typescale-body-large-line-height, 1.5rem);align-items:center;box-sizing:border-box;display:flex;gap:16px;min-height:56px;overflow:hidden;padding:12px 16px;position:relative;text-overflow:ellipsis}:host([multiline]){min-height:72px}[name=overline]{color:var(--md-sys-color-on-surface-variant,#49454f);font-family:var(--md-sys-typescale-label-small-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-label-small-size, .6875rem);font-weight:var(--md-sys-typescale-label-small-weight,var(--md-ref-typeface-weight-medium,500));line-height:var(--md-sys-typescale-label-small-line-height, 1rem)}[name=supporting-text]{color:var(--md-sys-color-on-surface-variant,#49454f);font-family:var(--md-sys-typescale-body-medium-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-body-medium-size, .875rem);font-weight:var(--md-sys-typescale-body-medium-weight,var(--md-ref-typeface-weight-regular,400));line-height:var(--md-sys-typescale-body-medium-line-height, 1.25rem)}[name=trailing-supporting-text]{color:var(--md-sys-color-on-surface-variant,#49454f);font-family:var(--md-sys-typescale-label-small-font, var(--md-ref-typeface-plain, Roboto));font-size:var(--md-sys-typescale-label-small-size, .6875rem);font-weight:var(--md-sys-typescale-label-small-weight,var(--md-ref-typeface-weight-medium,500));line-height:var(--md-sys-typescale-label-small-line-height, 1rem)}[name=container]::slotted(*){inset:0;position:absolute}.default-slot{display:inline}.default-slot,.text ::slotted(*){overflow:hidden;text-overflow:ellipsis}.text{display:flex;flex:1;flex-direction:column;overflow:hidden}`;let c=class extends o{};c.styles=[l],c=(0,s.__decorate)([(0,r.Mo)("md-item")],c);i(35981);var h=i(53180),d=i(32982);const u=Symbol.for(""),m=t=>{if((null==t?void 0:t.r)===u)return null==t?void 0:t._$litStatic$},p=(t,...e)=>({_$litStatic$:e.reduce(((e,i,s)=>e+(t=>{if(void 0!==t._$litStatic$)return t._$litStatic$;throw Error(`Value passed to 'literal' function must be a 'literal' result: ${t}. Use 'unsafeStatic' to pass non-literal values, but\n            take care to ensure page security.`)})(i)+t[s+1]),t[0]),r:u}),g=new Map,f=t=>(e,...i)=>{const s=i.length;let r,n;const o=[],a=[];let l,c=0,h=!1;for(;c<s;){for(l=e[c];c<s&&void 0!==(n=i[c],r=m(n));)l+=r+e[++c],h=!0;c!==s&&a.push(n),o.push(l),c++}if(c===s&&o.push(e[s]),h){const t=o.join("$$lit$$");void 0===(e=g.get(t))&&(o.raw=o,g.set(t,e=o)),i=a}return t(e,...i)},y=f(d.dy);f(d.YP);var v=i(6157),x=i(74496);class b extends n.oi{constructor(){super(...arguments),this.disabled=!1,this.type="text",this.isListItem=!0,this.href="",this.target=""}get isDisabled(){return this.disabled&&"link"!==this.type}willUpdate(t){this.href&&(this.type="link"),super.willUpdate(t)}render(){return this.renderListItem(n.dy` <md-item> <div slot="container"> ${this.renderRipple()} ${this.renderFocusRing()} </div> <slot name="start" slot="start"></slot> <slot name="end" slot="end"></slot> ${this.renderBody()} </md-item> `)}renderListItem(t){const e="link"===this.type;let i;switch(this.type){case"link":i=p`a`;break;case"button":i=p`button`;break;default:i=p`li`}const s="text"!==this.type,r=e&&this.target?this.target:n.Ld;return y`
+      <${i}
+        id="item"
+        tabindex="${this.isDisabled||!s?-1:0}"
+        ?disabled=${this.isDisabled}
+        role="listitem"
+        aria-selected=${this.ariaSelected||n.Ld}
+        aria-checked=${this.ariaChecked||n.Ld}
+        aria-expanded=${this.ariaExpanded||n.Ld}
+        aria-haspopup=${this.ariaHasPopup||n.Ld}
+        class="list-item ${(0,h.$)(this.getRenderClasses())}"
+        href=${this.href||n.Ld}
+        target=${r}
+        @focus=${this.onFocus}
+      >${t}</${i}>
+    `}renderRipple(){return"text"===this.type?n.Ld:n.dy` <md-ripple part="ripple" for="item" ?disabled="${this.isDisabled}"></md-ripple>`}renderFocusRing(){return"text"===this.type?n.Ld:n.dy` <md-focus-ring @visibility-changed="${this.onFocusRingVisibilityChanged}" part="focus-ring" for="item" inward></md-focus-ring>`}onFocusRingVisibilityChanged(t){}getRenderClasses(){return{disabled:this.isDisabled}}renderBody(){return n.dy` <slot></slot> <slot name="overline" slot="overline"></slot> <slot name="headline" slot="headline"></slot> <slot name="supporting-text" slot="supporting-text"></slot> <slot name="trailing-supporting-text" slot="trailing-supporting-text"></slot> `}onFocus(){-1===this.tabIndex&&this.dispatchEvent((0,x.oh)())}focus(){var t;null===(t=this.listItemRoot)||void 0===t||t.focus()}}(0,v.d)(b),b.shadowRootOptions={...n.oi.shadowRootOptions,delegatesFocus:!0},(0,s.__decorate)([(0,r.Cb)({type:Boolean,reflect:!0})],b.prototype,"disabled",void 0),(0,s.__decorate)([(0,r.Cb)({reflect:!0})],b.prototype,"type",void 0),(0,s.__decorate)([(0,r.Cb)({type:Boolean,attribute:"md-list-item",reflect:!0})],b.prototype,"isListItem",void 0),(0,s.__decorate)([(0,r.Cb)()],b.prototype,"href",void 0),(0,s.__decorate)([(0,r.Cb)()],b.prototype,"target",void 0),(0,s.__decorate)([(0,r.IO)(".list-item")],b.prototype,"listItemRoot",void 0);const w=n.iv`:host{display:flex;-webkit-tap-highlight-color:transparent;--md-ripple-hover-color:var(--md-list-item-hover-state-layer-color, var(--md-sys-color-on-surface, #1d1b20));--md-ripple-hover-opacity:var(--md-list-item-hover-state-layer-opacity, 0.08);--md-ripple-pressed-color:var(--md-list-item-pressed-state-layer-color, var(--md-sys-color-on-surface, #1d1b20));--md-ripple-pressed-opacity:var(--md-list-item-pressed-state-layer-opacity, 0.12)}:host(:is([type=button]:not([disabled]),[type=link])){cursor:pointer}md-focus-ring{z-index:1;--md-focus-ring-shape:8px}a,button,li{background:0 0;border:none;cursor:inherit;padding:0;margin:0;text-align:unset;text-decoration:none}.list-item{border-radius:inherit;display:flex;flex:1;max-width:inherit;min-width:inherit;outline:0;-webkit-tap-highlight-color:transparent;width:100%}.list-item.interactive{cursor:pointer}.list-item.disabled{opacity:var(--md-list-item-disabled-opacity, .3);pointer-events:none}[slot=container]{pointer-events:none}md-ripple{border-radius:inherit}md-item{border-radius:inherit;flex:1;height:100%;color:var(--md-list-item-label-text-color,var(--md-sys-color-on-surface,#1d1b20));font-family:var(--md-list-item-label-text-font, var(--md-sys-typescale-body-large-font, var(--md-ref-typeface-plain, Roboto)));font-size:var(--md-list-item-label-text-size, var(--md-sys-typescale-body-large-size, 1rem));line-height:var(--md-list-item-label-text-line-height, var(--md-sys-typescale-body-large-line-height, 1.5rem));font-weight:var(--md-list-item-label-text-weight,var(--md-sys-typescale-body-large-weight,var(--md-ref-typeface-weight-regular,400)));min-height:var(--md-list-item-one-line-container-height,56px);padding-top:var(--md-list-item-top-space,12px);padding-bottom:var(--md-list-item-bottom-space,12px);padding-inline-start:var(--md-list-item-leading-space,16px);padding-inline-end:var(--md-list-item-trailing-space,16px)}md-item[multiline]{min-height:var(--md-list-item-two-line-container-height,72px)}[slot=supporting-text]{color:var(--md-list-item-supporting-text-color,var(--md-sys-color-on-surface-variant,#49454f));font-family:var(--md-list-item-supporting-text-font, var(--md-sys-typescale-body-medium-font, var(--md-ref-typeface-plain, Roboto)));font-size:var(--md-list-item-supporting-text-size, var(--md-sys-typescale-body-medium-size, .875rem));line-height:var(--md-list-item-supporting-text-line-height, var(--md-sys-typescale-body-medium-line-height, 1.25rem));font-weight:var(--md-list-item-supporting-text-weight,var(--md-sys-typescale-body-medium-weight,var(--md-ref-typeface-weight-regular,400)))}[slot=trailing-supporting-text]{color:var(--md-list-item-trailing-supporting-text-color,var(--md-sys-color-on-surface-variant,#49454f));font-family:var(--md-list-item-trailing-supporting-text-font, var(--md-sys-typescale-label-small-font, var(--md-ref-typeface-plain, Roboto)));font-size:var(--md-list-item-trailing-supporting-text-size, var(--md-sys-typescale-label-small-size, .6875rem));line-height:var(--md-list-item-trailing-supporting-text-line-height, var(--md-sys-typescale-label-small-line-height, 1rem));font-weight:var(--md-list-item-trailing-supporting-text-weight,var(--md-sys-typescale-label-small-weight,var(--md-ref-typeface-weight-medium,500)))}:is([slot=start],[slot=end])::slotted(*){fill:currentColor}[slot=start]{color:var(--md-list-item-leading-icon-color,var(--md-sys-color-on-surface-variant,#49454f))}[slot=end]{color:var(--md-list-item-trailing-icon-color,var(--md-sys-color-on-surface-variant,#49454f))}@media(forced-colors:active){.disabled slot{color:GrayText}.list-item.disabled{color:GrayText;opacity:1}}`;let M=class extends b{};M.styles=[w],M=(0,s.__decorate)([(0,r.Mo)("md-list-item")],M)},40298:(t,e,i)=>{i.d(e,{j:()=>u});var s=i(43204),r=i(95260),n=i(5095),o=i(74496);const a={ArrowDown:"ArrowDown",ArrowLeft:"ArrowLeft",ArrowUp:"ArrowUp",ArrowRight:"ArrowRight",Home:"Home",End:"End"};class l{constructor(t){this.handleKeydown=t=>{const e=t.key;if(t.defaultPrevented||!this.isNavigableKey(e))return;const i=this.items;if(!i.length)return;const s=(0,o.CL)(i,this.isActivatable);s&&(s.item.tabIndex=-1),t.preventDefault();const r=this.isRtl();switch(e){case a.ArrowDown:case r?a.ArrowLeft:a.ArrowRight:(0,o.xZ)(i,s,this.isActivatable);break;case a.ArrowUp:case r?a.ArrowRight:a.ArrowLeft:(0,o.Rn)(i,s,this.isActivatable);break;case a.Home:(0,o.PQ)(i,this.isActivatable);break;case a.End:(0,o.dl)(i,this.isActivatable)}},this.onDeactivateItems=()=>{const t=this.items;for(const e of t)this.deactivateItem(e)},this.onRequestActivation=t=>{this.onDeactivateItems();const e=t.target;this.activateItem(e),e.focus()},this.onSlotchange=()=>{const t=this.items;let e=!1;for(const i of t){!(!i.disabled&&i.tabIndex>-1)||e?i.tabIndex=-1:(e=!0,i.tabIndex=0)}if(e)return;const i=(0,o.B3)(t,this.isActivatable);i&&(i.tabIndex=0)};const{isItem:e,getPossibleItems:i,isRtl:s,deactivateItem:r,activateItem:n,isNavigableKey:l,isActivatable:c}=t;this.isItem=e,this.getPossibleItems=i,this.isRtl=s,this.deactivateItem=r,this.activateItem=n,this.isNavigableKey=l,this.isActivatable=c}get items(){const t=this.getPossibleItems(),e=[];for(const i of t){if(this.isItem(i)){e.push(i);continue}const t=i.item;t&&this.isItem(t)&&e.push(t)}return e}activateNextItem(){const t=this.items,e=(0,o.CL)(t,this.isActivatable);return e&&(e.item.tabIndex=-1),(0,o.xZ)(t,e,this.isActivatable)}activatePreviousItem(){const t=this.items,e=(0,o.CL)(t,this.isActivatable);return e&&(e.item.tabIndex=-1),(0,o.Rn)(t,e,this.isActivatable)}}const c=new Set(Object.values(a));class h extends n.oi{get items(){return this.listController.items}constructor(){super(),this.listController=new l({isItem:t=>t.hasAttribute("md-list-item"),getPossibleItems:()=>this.slotItems,isRtl:()=>"rtl"===getComputedStyle(this).direction,deactivateItem:t=>{t.tabIndex=-1},activateItem:t=>{t.tabIndex=0},isNavigableKey:t=>c.has(t),isActivatable:t=>!t.disabled&&"text"!==t.type}),this.internals=this.attachInternals(),n.sk||(this.internals.role="list",this.addEventListener("keydown",this.listController.handleKeydown))}render(){return n.dy` <slot @deactivate-items="${this.listController.onDeactivateItems}" @request-activation="${this.listController.onRequestActivation}" @slotchange="${this.listController.onSlotchange}"> </slot> `}activateNextItem(){return this.listController.activateNextItem()}activatePreviousItem(){return this.listController.activatePreviousItem()}}(0,s.__decorate)([(0,r.NH)({flatten:!0})],h.prototype,"slotItems",void 0);const d=n.iv`:host{background:var(--md-list-container-color,var(--md-sys-color-surface,#fef7ff));color:unset;display:flex;flex-direction:column;outline:0;padding:8px 0;position:relative}`;let u=class extends h{};u.styles=[d],u=(0,s.__decorate)([(0,r.Mo)("md-list")],u)},11994:(t,e,i)=>{function s(t){return Array.isArray?Array.isArray(t):"[object Array]"===u(t)}i.d(e,{Z:()=>J});const r=1/0;function n(t){return null==t?"":function(t){if("string"==typeof t)return t;let e=t+"";return"0"==e&&1/t==-r?"-0":e}(t)}function o(t){return"string"==typeof t}function a(t){return"number"==typeof t}function l(t){return!0===t||!1===t||function(t){return c(t)&&null!==t}(t)&&"[object Boolean]"==u(t)}function c(t){return"object"==typeof t}function h(t){return null!=t}function d(t){return!t.trim().length}function u(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":Object.prototype.toString.call(t)}const m=t=>`Missing ${t} property in key`,p=t=>`Property 'weight' in key '${t}' must be a positive integer`,g=Object.prototype.hasOwnProperty;class f{constructor(t){this._keys=[],this._keyMap={};let e=0;t.forEach((t=>{let i=y(t);this._keys.push(i),this._keyMap[i.id]=i,e+=i.weight})),this._keys.forEach((t=>{t.weight/=e}))}get(t){return this._keyMap[t]}keys(){return this._keys}toJSON(){return JSON.stringify(this._keys)}}function y(t){let e=null,i=null,r=null,n=1,a=null;if(o(t)||s(t))r=t,e=v(t),i=x(t);else{if(!g.call(t,"name"))throw new Error(m("name"));const s=t.name;if(r=s,g.call(t,"weight")&&(n=t.weight,n<=0))throw new Error(p(s));e=v(s),i=x(s),a=t.getFn}return{path:e,id:i,weight:n,src:r,getFn:a}}function v(t){return s(t)?t:t.split(".")}function x(t){return s(t)?t.join("."):t}var b={isCaseSensitive:!1,includeScore:!1,keys:[],shouldSort:!0,sortFn:(t,e)=>t.score===e.score?t.idx<e.idx?-1:1:t.score<e.score?-1:1,includeMatches:!1,findAllMatches:!1,minMatchCharLength:1,location:0,threshold:.6,distance:100,...{useExtendedSearch:!1,getFn:function(t,e){let i=[],r=!1;const c=(t,e,d)=>{if(h(t))if(e[d]){const u=t[e[d]];if(!h(u))return;if(d===e.length-1&&(o(u)||a(u)||l(u)))i.push(n(u));else if(s(u)){r=!0;for(let t=0,i=u.length;t<i;t+=1)c(u[t],e,d+1)}else e.length&&c(u,e,d+1)}else i.push(t)};return c(t,o(e)?e.split("."):e,0),r?i:i[0]},ignoreLocation:!1,ignoreFieldNorm:!1,fieldNormWeight:1}};const w=/[^ ]+/g;class M{constructor({getFn:t=b.getFn,fieldNormWeight:e=b.fieldNormWeight}={}){this.norm=function(t=1,e=3){const i=new Map,s=Math.pow(10,e);return{get(e){const r=e.match(w).length;if(i.has(r))return i.get(r);const n=1/Math.pow(r,.5*t),o=parseFloat(Math.round(n*s)/s);return i.set(r,o),o},clear(){i.clear()}}}(e,3),this.getFn=t,this.isCreated=!1,this.setIndexRecords()}setSources(t=[]){this.docs=t}setIndexRecords(t=[]){this.records=t}setKeys(t=[]){this.keys=t,this._keysMap={},t.forEach(((t,e)=>{this._keysMap[t.id]=e}))}create(){!this.isCreated&&this.docs.length&&(this.isCreated=!0,o(this.docs[0])?this.docs.forEach(((t,e)=>{this._addString(t,e)})):this.docs.forEach(((t,e)=>{this._addObject(t,e)})),this.norm.clear())}add(t){const e=this.size();o(t)?this._addString(t,e):this._addObject(t,e)}removeAt(t){this.records.splice(t,1);for(let e=t,i=this.size();e<i;e+=1)this.records[e].i-=1}getValueForItemAtKeyId(t,e){return t[this._keysMap[e]]}size(){return this.records.length}_addString(t,e){if(!h(t)||d(t))return;let i={v:t,i:e,n:this.norm.get(t)};this.records.push(i)}_addObject(t,e){let i={i:e,$:{}};this.keys.forEach(((e,r)=>{let n=e.getFn?e.getFn(t):this.getFn(t,e.path);if(h(n))if(s(n)){let t=[];const e=[{nestedArrIndex:-1,value:n}];for(;e.length;){const{nestedArrIndex:i,value:r}=e.pop();if(h(r))if(o(r)&&!d(r)){let e={v:r,i,n:this.norm.get(r)};t.push(e)}else s(r)&&r.forEach(((t,i)=>{e.push({nestedArrIndex:i,value:t})}))}i.$[r]=t}else if(o(n)&&!d(n)){let t={v:n,n:this.norm.get(n)};i.$[r]=t}})),this.records.push(i)}toJSON(){return{keys:this.keys,records:this.records}}}function _(t,e,{getFn:i=b.getFn,fieldNormWeight:s=b.fieldNormWeight}={}){const r=new M({getFn:i,fieldNormWeight:s});return r.setKeys(t.map(y)),r.setSources(e),r.create(),r}function I(t,{errors:e=0,currentLocation:i=0,expectedLocation:s=0,distance:r=b.distance,ignoreLocation:n=b.ignoreLocation}={}){const o=e/t.length;if(n)return o;const a=Math.abs(s-i);return r?o+a/r:a?1:o}const L=32;function k(t,e,i,{location:s=b.location,distance:r=b.distance,threshold:n=b.threshold,findAllMatches:o=b.findAllMatches,minMatchCharLength:a=b.minMatchCharLength,includeMatches:l=b.includeMatches,ignoreLocation:c=b.ignoreLocation}={}){if(e.length>L)throw new Error(`Pattern length exceeds max of ${L}.`);const h=e.length,d=t.length,u=Math.max(0,Math.min(s,d));let m=n,p=u;const g=a>1||l,f=g?Array(d):[];let y;for(;(y=t.indexOf(e,p))>-1;){let t=I(e,{currentLocation:y,expectedLocation:u,distance:r,ignoreLocation:c});if(m=Math.min(t,m),p=y+h,g){let t=0;for(;t<h;)f[y+t]=1,t+=1}}p=-1;let v=[],x=1,w=h+d;const M=1<<h-1;for(let s=0;s<h;s+=1){let n=0,a=w;for(;n<a;){I(e,{errors:s,currentLocation:u+a,expectedLocation:u,distance:r,ignoreLocation:c})<=m?n=a:w=a,a=Math.floor((w-n)/2+n)}w=a;let l=Math.max(1,u-a+1),y=o?d:Math.min(u+a,d)+h,b=Array(y+2);b[y+1]=(1<<s)-1;for(let n=y;n>=l;n-=1){let o=n-1,a=i[t.charAt(o)];if(g&&(f[o]=+!!a),b[n]=(b[n+1]<<1|1)&a,s&&(b[n]|=(v[n+1]|v[n])<<1|1|v[n+1]),b[n]&M&&(x=I(e,{errors:s,currentLocation:o,expectedLocation:u,distance:r,ignoreLocation:c}),x<=m)){if(m=x,p=o,p<=u)break;l=Math.max(1,2*u-p)}}if(I(e,{errors:s+1,currentLocation:u,expectedLocation:u,distance:r,ignoreLocation:c})>m)break;v=b}const _={isMatch:p>=0,score:Math.max(.001,x)};if(g){const t=function(t=[],e=b.minMatchCharLength){let i=[],s=-1,r=-1,n=0;for(let o=t.length;n<o;n+=1){let o=t[n];o&&-1===s?s=n:o||-1===s||(r=n-1,r-s+1>=e&&i.push([s,r]),s=-1)}return t[n-1]&&n-s>=e&&i.push([s,n-1]),i}(f,a);t.length?l&&(_.indices=t):_.isMatch=!1}return _}function $(t){let e={};for(let i=0,s=t.length;i<s;i+=1){const r=t.charAt(i);e[r]=(e[r]||0)|1<<s-i-1}return e}class C{constructor(t,{location:e=b.location,threshold:i=b.threshold,distance:s=b.distance,includeMatches:r=b.includeMatches,findAllMatches:n=b.findAllMatches,minMatchCharLength:o=b.minMatchCharLength,isCaseSensitive:a=b.isCaseSensitive,ignoreLocation:l=b.ignoreLocation}={}){if(this.options={location:e,threshold:i,distance:s,includeMatches:r,findAllMatches:n,minMatchCharLength:o,isCaseSensitive:a,ignoreLocation:l},this.pattern=a?t:t.toLowerCase(),this.chunks=[],!this.pattern.length)return;const c=(t,e)=>{this.chunks.push({pattern:t,alphabet:$(t),startIndex:e})},h=this.pattern.length;if(h>L){let t=0;const e=h%L,i=h-e;for(;t<i;)c(this.pattern.substr(t,L),t),t+=L;if(e){const t=h-L;c(this.pattern.substr(t),t)}}else c(this.pattern,0)}searchIn(t){const{isCaseSensitive:e,includeMatches:i}=this.options;if(e||(t=t.toLowerCase()),this.pattern===t){let e={isMatch:!0,score:0};return i&&(e.indices=[[0,t.length-1]]),e}const{location:s,distance:r,threshold:n,findAllMatches:o,minMatchCharLength:a,ignoreLocation:l}=this.options;let c=[],h=0,d=!1;this.chunks.forEach((({pattern:e,alphabet:u,startIndex:m})=>{const{isMatch:p,score:g,indices:f}=k(t,e,u,{location:s+m,distance:r,threshold:n,findAllMatches:o,minMatchCharLength:a,includeMatches:i,ignoreLocation:l});p&&(d=!0),h+=g,p&&f&&(c=[...c,...f])}));let u={isMatch:d,score:d?h/this.chunks.length:1};return d&&i&&(u.indices=c),u}}class A{constructor(t){this.pattern=t}static isMultiMatch(t){return S(t,this.multiRegex)}static isSingleMatch(t){return S(t,this.singleRegex)}search(){}}function S(t,e){const i=t.match(e);return i?i[1]:null}class R extends A{constructor(t,{location:e=b.location,threshold:i=b.threshold,distance:s=b.distance,includeMatches:r=b.includeMatches,findAllMatches:n=b.findAllMatches,minMatchCharLength:o=b.minMatchCharLength,isCaseSensitive:a=b.isCaseSensitive,ignoreLocation:l=b.ignoreLocation}={}){super(t),this._bitapSearch=new C(t,{location:e,threshold:i,distance:s,includeMatches:r,findAllMatches:n,minMatchCharLength:o,isCaseSensitive:a,ignoreLocation:l})}static get type(){return"fuzzy"}static get multiRegex(){return/^"(.*)"$/}static get singleRegex(){return/^(.*)$/}search(t){return this._bitapSearch.searchIn(t)}}class E extends A{constructor(t){super(t)}static get type(){return"include"}static get multiRegex(){return/^'"(.*)"$/}static get singleRegex(){return/^'(.*)$/}search(t){let e,i=0;const s=[],r=this.pattern.length;for(;(e=t.indexOf(this.pattern,i))>-1;)i=e+r,s.push([e,i-1]);const n=!!s.length;return{isMatch:n,score:n?0:1,indices:s}}}const N=[class extends A{constructor(t){super(t)}static get type(){return"exact"}static get multiRegex(){return/^="(.*)"$/}static get singleRegex(){return/^=(.*)$/}search(t){const e=t===this.pattern;return{isMatch:e,score:e?0:1,indices:[0,this.pattern.length-1]}}},E,class extends A{constructor(t){super(t)}static get type(){return"prefix-exact"}static get multiRegex(){return/^\^"(.*)"$/}static get singleRegex(){return/^\^(.*)$/}search(t){const e=t.startsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,this.pattern.length-1]}}},class extends A{constructor(t){super(t)}static get type(){return"inverse-prefix-exact"}static get multiRegex(){return/^!\^"(.*)"$/}static get singleRegex(){return/^!\^(.*)$/}search(t){const e=!t.startsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,t.length-1]}}},class extends A{constructor(t){super(t)}static get type(){return"inverse-suffix-exact"}static get multiRegex(){return/^!"(.*)"\$$/}static get singleRegex(){return/^!(.*)\$$/}search(t){const e=!t.endsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,t.length-1]}}},class extends A{constructor(t){super(t)}static get type(){return"suffix-exact"}static get multiRegex(){return/^"(.*)"\$$/}static get singleRegex(){return/^(.*)\$$/}search(t){const e=t.endsWith(this.pattern);return{isMatch:e,score:e?0:1,indices:[t.length-this.pattern.length,t.length-1]}}},class extends A{constructor(t){super(t)}static get type(){return"inverse-exact"}static get multiRegex(){return/^!"(.*)"$/}static get singleRegex(){return/^!(.*)$/}search(t){const e=-1===t.indexOf(this.pattern);return{isMatch:e,score:e?0:1,indices:[0,t.length-1]}}},R],F=N.length,z=/ +(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)/;const O=new Set([R.type,E.type]);class j{constructor(t,{isCaseSensitive:e=b.isCaseSensitive,includeMatches:i=b.includeMatches,minMatchCharLength:s=b.minMatchCharLength,ignoreLocation:r=b.ignoreLocation,findAllMatches:n=b.findAllMatches,location:o=b.location,threshold:a=b.threshold,distance:l=b.distance}={}){this.query=null,this.options={isCaseSensitive:e,includeMatches:i,minMatchCharLength:s,findAllMatches:n,ignoreLocation:r,location:o,threshold:a,distance:l},this.pattern=e?t:t.toLowerCase(),this.query=function(t,e={}){return t.split("|").map((t=>{let i=t.trim().split(z).filter((t=>t&&!!t.trim())),s=[];for(let t=0,r=i.length;t<r;t+=1){const r=i[t];let n=!1,o=-1;for(;!n&&++o<F;){const t=N[o];let i=t.isMultiMatch(r);i&&(s.push(new t(i,e)),n=!0)}if(!n)for(o=-1;++o<F;){const t=N[o];let i=t.isSingleMatch(r);if(i){s.push(new t(i,e));break}}}return s}))}(this.pattern,this.options)}static condition(t,e){return e.useExtendedSearch}searchIn(t){const e=this.query;if(!e)return{isMatch:!1,score:1};const{includeMatches:i,isCaseSensitive:s}=this.options;t=s?t:t.toLowerCase();let r=0,n=[],o=0;for(let s=0,a=e.length;s<a;s+=1){const a=e[s];n.length=0,r=0;for(let e=0,s=a.length;e<s;e+=1){const s=a[e],{isMatch:l,indices:c,score:h}=s.search(t);if(!l){o=0,r=0,n.length=0;break}if(r+=1,o+=h,i){const t=s.constructor.type;O.has(t)?n=[...n,...c]:n.push(c)}}if(r){let t={isMatch:!0,score:o/r};return i&&(t.indices=n),t}}return{isMatch:!1,score:1}}}const P=[];function W(t,e){for(let i=0,s=P.length;i<s;i+=1){let s=P[i];if(s.condition(t,e))return new s(t,e)}return new C(t,e)}const D="$and",T="$or",K="$path",B="$val",q=t=>!(!t[D]&&!t[T]),U=t=>({[D]:Object.keys(t).map((e=>({[e]:t[e]})))});function H(t,e,{auto:i=!0}={}){const r=t=>{let n=Object.keys(t);const a=(t=>!!t[K])(t);if(!a&&n.length>1&&!q(t))return r(U(t));if((t=>!s(t)&&c(t)&&!q(t))(t)){const s=a?t[K]:n[0],r=a?t[B]:t[s];if(!o(r))throw new Error((t=>`Invalid value for key ${t}`)(s));const l={keyId:x(s),pattern:r};return i&&(l.searcher=W(r,e)),l}let l={children:[],operator:n[0]};return n.forEach((e=>{const i=t[e];s(i)&&i.forEach((t=>{l.children.push(r(t))}))})),l};return q(t)||(t=U(t)),r(t)}function V(t,e){const i=t.matches;e.matches=[],h(i)&&i.forEach((t=>{if(!h(t.indices)||!t.indices.length)return;const{indices:i,value:s}=t;let r={indices:i,value:s};t.key&&(r.key=t.key.src),t.idx>-1&&(r.refIndex=t.idx),e.matches.push(r)}))}function Z(t,e){e.score=t.score}class J{constructor(t,e={},i){this.options={...b,...e},this.options.useExtendedSearch,this._keyStore=new f(this.options.keys),this.setCollection(t,i)}setCollection(t,e){if(this._docs=t,e&&!(e instanceof M))throw new Error("Incorrect 'index' type");this._myIndex=e||_(this.options.keys,this._docs,{getFn:this.options.getFn,fieldNormWeight:this.options.fieldNormWeight})}add(t){h(t)&&(this._docs.push(t),this._myIndex.add(t))}remove(t=(()=>!1)){const e=[];for(let i=0,s=this._docs.length;i<s;i+=1){const r=this._docs[i];t(r,i)&&(this.removeAt(i),i-=1,s-=1,e.push(r))}return e}removeAt(t){this._docs.splice(t,1),this._myIndex.removeAt(t)}getIndex(){return this._myIndex}search(t,{limit:e=-1}={}){const{includeMatches:i,includeScore:s,shouldSort:r,sortFn:n,ignoreFieldNorm:l}=this.options;let c=o(t)?o(this._docs[0])?this._searchStringList(t):this._searchObjectList(t):this._searchLogical(t);return function(t,{ignoreFieldNorm:e=b.ignoreFieldNorm}){t.forEach((t=>{let i=1;t.matches.forEach((({key:t,norm:s,score:r})=>{const n=t?t.weight:null;i*=Math.pow(0===r&&n?Number.EPSILON:r,(n||1)*(e?1:s))})),t.score=i}))}(c,{ignoreFieldNorm:l}),r&&c.sort(n),a(e)&&e>-1&&(c=c.slice(0,e)),function(t,e,{includeMatches:i=b.includeMatches,includeScore:s=b.includeScore}={}){const r=[];return i&&r.push(V),s&&r.push(Z),t.map((t=>{const{idx:i}=t,s={item:e[i],refIndex:i};return r.length&&r.forEach((e=>{e(t,s)})),s}))}(c,this._docs,{includeMatches:i,includeScore:s})}_searchStringList(t){const e=W(t,this.options),{records:i}=this._myIndex,s=[];return i.forEach((({v:t,i,n:r})=>{if(!h(t))return;const{isMatch:n,score:o,indices:a}=e.searchIn(t);n&&s.push({item:t,idx:i,matches:[{score:o,value:t,norm:r,indices:a}]})})),s}_searchLogical(t){const e=H(t,this.options),i=(t,e,s)=>{if(!t.children){const{keyId:i,searcher:r}=t,n=this._findMatches({key:this._keyStore.get(i),value:this._myIndex.getValueForItemAtKeyId(e,i),searcher:r});return n&&n.length?[{idx:s,item:e,matches:n}]:[]}const r=[];for(let n=0,o=t.children.length;n<o;n+=1){const o=t.children[n],a=i(o,e,s);if(a.length)r.push(...a);else if(t.operator===D)return[]}return r},s=this._myIndex.records,r={},n=[];return s.forEach((({$:t,i:s})=>{if(h(t)){let o=i(e,t,s);o.length&&(r[s]||(r[s]={idx:s,item:t,matches:[]},n.push(r[s])),o.forEach((({matches:t})=>{r[s].matches.push(...t)})))}})),n}_searchObjectList(t){const e=W(t,this.options),{keys:i,records:s}=this._myIndex,r=[];return s.forEach((({$:t,i:s})=>{if(!h(t))return;let n=[];i.forEach(((i,s)=>{n.push(...this._findMatches({key:i,value:t[s],searcher:e}))})),n.length&&r.push({idx:s,item:t,matches:n})})),r}_findMatches({key:t,value:e,searcher:i}){if(!h(e))return[];let r=[];if(s(e))e.forEach((({v:e,i:s,n})=>{if(!h(e))return;const{isMatch:o,score:a,indices:l}=i.searchIn(e);o&&r.push({score:a,key:t,value:e,idx:s,norm:n,indices:l})}));else{const{v:s,n}=e,{isMatch:o,score:a,indices:l}=i.searchIn(s);o&&r.push({score:a,key:t,value:s,norm:n,indices:l})}return r}}J.version="7.0.0",J.createIndex=_,J.parseIndex=function(t,{getFn:e=b.getFn,fieldNormWeight:i=b.fieldNormWeight}={}){const{keys:s,records:r}=t,n=new M({getFn:e,fieldNormWeight:i});return n.setKeys(s),n.setIndexRecords(r),n},J.config=b,J.parseQuery=H,function(...t){P.push(...t)}(j)}};
+//# sourceMappingURL=4370.J9MDWy8fJNw.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=4448;export const ids=[4448];export const modules={55020:(t,e,n)=>{n.d(e,{j:()=>o});var r={};function o(){return r}},5763:(t,e,n)=>{function r(t){var e=new Date(Date.UTC(t.getFullYear(),t.getMonth(),t.getDate(),t.getHours(),t.getMinutes(),t.getSeconds(),t.getMilliseconds()));return e.setUTCFullYear(t.getFullYear()),t.getTime()-e.getTime()}n.d(e,{Z:()=>r})},23682:(t,e,n)=>{function r(t,e){if(e.length<t)throw new TypeError(t+" argument"+(t>1?"s":"")+" required, but only "+e.length+" present")}n.d(e,{Z:()=>r})},90394:(t,e,n)=>{function r(t){if(null===t||!0===t||!1===t)return NaN;var e=Number(t);return isNaN(e)?e:e<0?Math.ceil(e):Math.floor(e)}n.d(e,{Z:()=>r})},62308:(t,e,n)=>{n.d(e,{Z:()=>l});var r=n(34327),o=n(5763),a=n(23682);function u(t){(0,a.Z)(1,arguments);var e=(0,r.Z)(t);return e.setHours(0,0,0,0),e}var i=864e5;function s(t,e){var n=t.getFullYear()-e.getFullYear()||t.getMonth()-e.getMonth()||t.getDate()-e.getDate()||t.getHours()-e.getHours()||t.getMinutes()-e.getMinutes()||t.getSeconds()-e.getSeconds()||t.getMilliseconds()-e.getMilliseconds();return n<0?-1:n>0?1:n}function l(t,e){(0,a.Z)(2,arguments);var n=(0,r.Z)(t),l=(0,r.Z)(e),c=s(n,l),d=Math.abs(function(t,e){(0,a.Z)(2,arguments);var n=u(t),r=u(e),s=n.getTime()-(0,o.Z)(n),l=r.getTime()-(0,o.Z)(r);return Math.round((s-l)/i)}(n,l));n.setDate(n.getDate()-c*d);var f=c*(d-Number(s(n,l)===-c));return 0===f?0:f}},27296:(t,e,n)=>{n.d(e,{Z:()=>i});var r=n(62308),o=n(23682),a={ceil:Math.ceil,round:Math.round,floor:Math.floor,trunc:function(t){return t<0?Math.ceil(t):Math.floor(t)}},u="trunc";function i(t,e,n){(0,o.Z)(2,arguments);var i,s=(0,r.Z)(t,e)/7;return((i=null==n?void 0:n.roundingMethod)?a[i]:a[u])(s)}},59401:(t,e,n)=>{n.d(e,{Z:()=>i});var r=n(34327),o=n(90394),a=n(23682),u=n(55020);function i(t,e){var n,i,s,l,c,d,f,g;(0,a.Z)(1,arguments);var M=(0,u.j)(),m=(0,o.Z)(null!==(n=null!==(i=null!==(s=null!==(l=null==e?void 0:e.weekStartsOn)&&void 0!==l?l:null==e||null===(c=e.locale)||void 0===c||null===(d=c.options)||void 0===d?void 0:d.weekStartsOn)&&void 0!==s?s:M.weekStartsOn)&&void 0!==i?i:null===(f=M.locale)||void 0===f||null===(g=f.options)||void 0===g?void 0:g.weekStartsOn)&&void 0!==n?n:0);if(!(m>=0&&m<=6))throw new RangeError("weekStartsOn must be between 0 and 6 inclusively");var b=(0,r.Z)(t),h=b.getDay(),v=(h<m?7:0)+h-m;return b.setDate(b.getDate()-v),b.setHours(0,0,0,0),b}},34327:(t,e,n)=>{n.d(e,{Z:()=>a});var r=n(56956),o=n(23682);function a(t){(0,o.Z)(1,arguments);var e=Object.prototype.toString.call(t);return t instanceof Date||"object"===(0,r.Z)(t)&&"[object Date]"===e?new Date(t.getTime()):"number"==typeof t||"[object Number]"===e?new Date(t):("string"!=typeof t&&"[object String]"!==e||"undefined"==typeof console||(console.warn("Starting with v2.0.0-beta.1 date-fns doesn't accept strings as date arguments. Please use `parseISO` to parse strings. See: https://github.com/date-fns/date-fns/blob/master/docs/upgradeGuide.md#string-arguments"),console.warn((new Error).stack)),new Date(NaN))}},3239:(t,e,n)=>{function r(t){if(!t||"object"!=typeof t)return t;if("[object Date]"==Object.prototype.toString.call(t))return new Date(t.getTime());if(Array.isArray(t))return t.map(r);var e={};return Object.keys(t).forEach((function(n){e[n]=r(t[n])})),e}n.d(e,{Z:()=>r})},22075:(t,e,n)=>{n.d(e,{L:()=>a});const r={en:"US",hi:"IN",deva:"IN",te:"IN",mr:"IN",ta:"IN",gu:"IN",kn:"IN",or:"IN",ml:"IN",pa:"IN",bho:"IN",awa:"IN",as:"IN",mwr:"IN",mai:"IN",mag:"IN",bgc:"IN",hne:"IN",dcc:"IN",bn:"BD",beng:"BD",rkt:"BD",dz:"BT",tibt:"BT",tn:"BW",am:"ET",ethi:"ET",om:"ET",quc:"GT",id:"ID",jv:"ID",su:"ID",mad:"ID",ms_arab:"ID",he:"IL",hebr:"IL",jam:"JM",ja:"JP",jpan:"JP",km:"KH",khmr:"KH",ko:"KR",kore:"KR",lo:"LA",laoo:"LA",mh:"MH",my:"MM",mymr:"MM",mt:"MT",ne:"NP",fil:"PH",ceb:"PH",ilo:"PH",ur:"PK",pa_arab:"PK",lah:"PK",ps:"PK",sd:"PK",skr:"PK",gn:"PY",th:"TH",thai:"TH",tts:"TH",zh_hant:"TW",hant:"TW",sm:"WS",zu:"ZA",sn:"ZW",arq:"DZ",ar:"EG",arab:"EG",arz:"EG",fa:"IR",az_arab:"IR",dv:"MV",thaa:"MV"};const o={AG:0,ATG:0,28:0,AS:0,ASM:0,16:0,BD:0,BGD:0,50:0,BR:0,BRA:0,76:0,BS:0,BHS:0,44:0,BT:0,BTN:0,64:0,BW:0,BWA:0,72:0,BZ:0,BLZ:0,84:0,CA:0,CAN:0,124:0,CO:0,COL:0,170:0,DM:0,DMA:0,212:0,DO:0,DOM:0,214:0,ET:0,ETH:0,231:0,GT:0,GTM:0,320:0,GU:0,GUM:0,316:0,HK:0,HKG:0,344:0,HN:0,HND:0,340:0,ID:0,IDN:0,360:0,IL:0,ISR:0,376:0,IN:0,IND:0,356:0,JM:0,JAM:0,388:0,JP:0,JPN:0,392:0,KE:0,KEN:0,404:0,KH:0,KHM:0,116:0,KR:0,KOR:0,410:0,LA:0,LA0:0,418:0,MH:0,MHL:0,584:0,MM:0,MMR:0,104:0,MO:0,MAC:0,446:0,MT:0,MLT:0,470:0,MX:0,MEX:0,484:0,MZ:0,MOZ:0,508:0,NI:0,NIC:0,558:0,NP:0,NPL:0,524:0,PA:0,PAN:0,591:0,PE:0,PER:0,604:0,PH:0,PHL:0,608:0,PK:0,PAK:0,586:0,PR:0,PRI:0,630:0,PT:0,PRT:0,620:0,PY:0,PRY:0,600:0,SA:0,SAU:0,682:0,SG:0,SGP:0,702:0,SV:0,SLV:0,222:0,TH:0,THA:0,764:0,TT:0,TTO:0,780:0,TW:0,TWN:0,158:0,UM:0,UMI:0,581:0,US:0,USA:0,840:0,VE:0,VEN:0,862:0,VI:0,VIR:0,850:0,WS:0,WSM:0,882:0,YE:0,YEM:0,887:0,ZA:0,ZAF:0,710:0,ZW:0,ZWE:0,716:0,AE:6,ARE:6,784:6,AF:6,AFG:6,4:6,BH:6,BHR:6,48:6,DJ:6,DJI:6,262:6,DZ:6,DZA:6,12:6,EG:6,EGY:6,818:6,IQ:6,IRQ:6,368:6,IR:6,IRN:6,364:6,JO:6,JOR:6,400:6,KW:6,KWT:6,414:6,LY:6,LBY:6,434:6,OM:6,OMN:6,512:6,QA:6,QAT:6,634:6,SD:6,SDN:6,729:6,SY:6,SYR:6,760:6,MV:5,MDV:5,462:5};function a(t){return function(t,e,n){if(t){var r,o=t.toLowerCase().split(/[-_]/),a=o[0],u=a;if(o[1]&&4===o[1].length?(u+="_"+o[1],r=o[2]):r=o[1],r||(r=e[u]||e[a]),r)return function(t,e){var n=e["string"==typeof t?t.toUpperCase():t];return"number"==typeof n?n:1}(r.match(/^\d+$/)?Number(r):r,n)}return 1}(t,r,o)}},56956:(t,e,n)=>{function r(t){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},r(t)}n.d(e,{Z:()=>r})},72881:(t,e,n)=>{n.d(e,{B:()=>a});const r=t=>{let e=[];function n(n,r){t=r?n:Object.assign(Object.assign({},t),n);let o=e;for(let e=0;e<o.length;e++)o[e](t)}return{get state(){return t},action(e){function r(t){n(t,!1)}return function(){let n=[t];for(let t=0;t<arguments.length;t++)n.push(arguments[t]);let o=e.apply(this,n);if(null!=o)return o instanceof Promise?o.then(r):r(o)}},setState:n,clearState(){t=void 0},subscribe:t=>(e.push(t),()=>{!function(t){let n=[];for(let r=0;r<e.length;r++)e[r]===t?t=null:n.push(e[r]);e=n}(t)})}},o=(t,e,n,o,a={unsubGrace:!0})=>{if(t[e])return t[e];let u,i,s=0,l=r();const c=()=>{if(!n)throw new Error("Collection does not support refresh");return n(t).then((t=>l.setState(t,!0)))},d=()=>c().catch((e=>{if(t.connected)throw e})),f=()=>{i=void 0,u&&u.then((t=>{t()})),l.clearState(),t.removeEventListener("ready",c),t.removeEventListener("disconnected",g)},g=()=>{i&&(clearTimeout(i),f())};return t[e]={get state(){return l.state},refresh:c,subscribe(e){s++,1===s&&(()=>{if(void 0!==i)return clearTimeout(i),void(i=void 0);o&&(u=o(t,l)),n&&(t.addEventListener("ready",d),d()),t.addEventListener("disconnected",g)})();const r=l.subscribe(e);return void 0!==l.state&&setTimeout((()=>e(l.state)),0),()=>{r(),s--,s||(a.unsubGrace?i=setTimeout(f,5e3):f())}}},t[e]},a=(t,e,n,r,a)=>o(r,t,e,n).subscribe(a)},57835:(t,e,n)=>{n.d(e,{XM:()=>r.XM,Xe:()=>r.Xe,pX:()=>r.pX});var r=n(16616)}};
+//# sourceMappingURL=4448.nQc05ARyXt0.js.map
\ No newline at end of file
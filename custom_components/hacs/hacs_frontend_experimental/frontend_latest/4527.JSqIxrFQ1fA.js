@@ -0,0 +1,4 @@
+/*! For license information please see 4527.JSqIxrFQ1fA.js.LICENSE.txt */
+export const id=4527;export const ids=[4527];export const modules={89833:(t,i,e)=>{e.d(i,{O:()=>d});var r=e(43204),s=e(42977),o=e(5095),a=e(95260),n=e(53180),l=e(10694),h=e(25815);const c={fromAttribute:t=>null!==t&&(""===t||t),toAttribute:t=>"boolean"==typeof t?t?"":null:t};class d extends s.P{constructor(){super(...arguments),this.rows=2,this.cols=20,this.charCounter=!1}render(){const t=this.charCounter&&-1!==this.maxLength,i=t&&"internal"===this.charCounter,e=t&&!i,r=!!this.helper||!!this.validationMessage||e,s={"mdc-text-field--disabled":this.disabled,"mdc-text-field--no-label":!this.label,"mdc-text-field--filled":!this.outlined,"mdc-text-field--outlined":this.outlined,"mdc-text-field--end-aligned":this.endAligned,"mdc-text-field--with-internal-counter":i};return o.dy` <label class="mdc-text-field mdc-text-field--textarea ${(0,n.$)(s)}"> ${this.renderRipple()} ${this.outlined?this.renderOutline():this.renderLabel()} ${this.renderInput()} ${this.renderCharCounter(i)} ${this.renderLineRipple()} </label> ${this.renderHelperText(r,e)} `}renderInput(){const t=this.label?"label":void 0,i=-1===this.minLength?void 0:this.minLength,e=-1===this.maxLength?void 0:this.maxLength,r=this.autocapitalize?this.autocapitalize:void 0;return o.dy` <textarea aria-labelledby="${(0,l.o)(t)}" class="mdc-text-field__input" .value="${(0,h.a)(this.value)}" rows="${this.rows}" cols="${this.cols}" ?disabled="${this.disabled}" placeholder="${this.placeholder}" ?required="${this.required}" ?readonly="${this.readOnly}" minlength="${(0,l.o)(i)}" maxlength="${(0,l.o)(e)}" name="${(0,l.o)(""===this.name?void 0:this.name)}" inputmode="${(0,l.o)(this.inputMode)}" autocapitalize="${(0,l.o)(r)}" @input="${this.handleInputChange}" @blur="${this.onInputBlur}">
+      </textarea>`}}(0,r.__decorate)([(0,a.IO)("textarea")],d.prototype,"formElement",void 0),(0,r.__decorate)([(0,a.Cb)({type:Number})],d.prototype,"rows",void 0),(0,r.__decorate)([(0,a.Cb)({type:Number})],d.prototype,"cols",void 0),(0,r.__decorate)([(0,a.Cb)({converter:c})],d.prototype,"charCounter",void 0)},96791:(t,i,e)=>{e.d(i,{W:()=>r});const r=e(5095).iv`.mdc-text-field{height:100%}.mdc-text-field__input{resize:none}`},26535:(t,i,e)=>{e.d(i,{e:()=>n});var r=e(15723);function s(t){return"horizontal"===t?"row":"column"}class o extends r.IE{constructor(){super(...arguments),this._itemSize={},this._gaps={},this._padding={}}_getDefaultConfig(){return Object.assign({},super._getDefaultConfig(),{itemSize:{width:"300px",height:"300px"},gap:"8px",padding:"match-gap"})}get _gap(){return this._gaps.row}get _idealSize(){return this._itemSize[(0,r.qF)(this.direction)]}get _idealSize1(){return this._itemSize[(0,r.qF)(this.direction)]}get _idealSize2(){return this._itemSize[(0,r.gu)(this.direction)]}get _gap1(){return this._gaps[(t=this.direction,"horizontal"===t?"column":"row")];var t}get _gap2(){return this._gaps[s(this.direction)]}get _padding1(){const t=this._padding,[i,e]="horizontal"===this.direction?["left","right"]:["top","bottom"];return[t[i],t[e]]}get _padding2(){const t=this._padding,[i,e]="horizontal"===this.direction?["top","bottom"]:["left","right"];return[t[i],t[e]]}set itemSize(t){const i=this._itemSize;"string"==typeof t&&(t={width:t,height:t});const e=parseInt(t.width),r=parseInt(t.height);e!==i.width&&(i.width=e,this._triggerReflow()),r!==i.height&&(i.height=r,this._triggerReflow())}set gap(t){this._setGap(t)}_setGap(t){const i=t.split(" ").map((t=>function(t){return"auto"===t?1/0:parseInt(t)}(t))),e=this._gaps;i[0]!==e.row&&(e.row=i[0],this._triggerReflow()),void 0===i[1]?i[0]!==e.column&&(e.column=i[0],this._triggerReflow()):i[1]!==e.column&&(e.column=i[1],this._triggerReflow())}set padding(t){const i=this._padding,e=t.split(" ").map((t=>function(t){return"match-gap"===t?1/0:parseInt(t)}(t)));1===e.length?(i.top=i.right=i.bottom=i.left=e[0],this._triggerReflow()):2===e.length?(i.top=i.bottom=e[0],i.right=i.left=e[1],this._triggerReflow()):3===e.length?(i.top=e[0],i.right=i.left=e[1],i.bottom=e[2],this._triggerReflow()):4===e.length&&(["top","right","bottom","left"].forEach(((t,r)=>i[t]=e[r])),this._triggerReflow())}}class a extends o{constructor(){super(...arguments),this._metrics=null,this.flex=null,this.justify=null}_getDefaultConfig(){return Object.assign({},super._getDefaultConfig(),{flex:!1,justify:"start"})}set gap(t){super._setGap(t)}_updateLayout(){const t=this.justify,[i,e]=this._padding1,[o,a]=this._padding2;["_gap1","_gap2"].forEach((i=>{const e=this[i];if(e===1/0&&!["space-between","space-around","space-evenly"].includes(t))throw new Error("grid layout: gap can only be set to 'auto' when justify is set to 'space-between', 'space-around' or 'space-evenly'");if(e===1/0&&"_gap2"===i)throw new Error(`grid layout: ${s(this.direction)}-gap cannot be set to 'auto' when direction is set to ${this.direction}`)}));const n=this.flex||["start","center","end"].includes(t),l={rolumns:-1,itemSize1:-1,itemSize2:-1,gap1:this._gap1===1/0?-1:this._gap1,gap2:n?this._gap2:0,padding1:{start:i===1/0?this._gap1:i,end:e===1/0?this._gap1:e},padding2:n?{start:o===1/0?this._gap2:o,end:a===1/0?this._gap2:a}:{start:0,end:0},positions:[]},h=this._viewDim2-l.padding2.start-l.padding2.end;if(h<=0)l.rolumns=0;else{const s=n?l.gap2:0;let o,a=0,c=0;if(h>=this._idealSize2&&(a=Math.floor((h-this._idealSize2)/(this._idealSize2+s))+1,c=a*this._idealSize2+(a-1)*s),this.flex){(h-c)/(this._idealSize2+s)>=.5&&(a+=1),l.rolumns=a,l.itemSize2=Math.round((h-s*(a-1))/a);switch(!0===this.flex?"area":this.flex.preserve){case"aspect-ratio":l.itemSize1=Math.round(this._idealSize1/this._idealSize2*l.itemSize2);break;case(0,r.qF)(this.direction):l.itemSize1=Math.round(this._idealSize1);break;default:l.itemSize1=Math.round(this._idealSize1*this._idealSize2/l.itemSize2)}}else l.itemSize1=this._idealSize1,l.itemSize2=this._idealSize2,l.rolumns=a;if(n){const i=l.rolumns*l.itemSize2+(l.rolumns-1)*l.gap2;o=this.flex||"start"===t?l.padding2.start:"end"===t?this._viewDim2-l.padding2.end-i:Math.round(this._viewDim2/2-i/2)}else{const r=h-l.rolumns*l.itemSize2;"space-between"===t?(l.gap2=Math.round(r/(l.rolumns-1)),o=0):"space-around"===t?(l.gap2=Math.round(r/l.rolumns),o=Math.round(l.gap2/2)):(l.gap2=Math.round(r/(l.rolumns+1)),o=l.gap2),this._gap1===1/0&&(l.gap1=l.gap2,i===1/0&&(l.padding1.start=o),e===1/0&&(l.padding1.end=o))}for(let t=0;t<l.rolumns;t++)l.positions.push(o),o+=l.itemSize2+l.gap2}this._metrics=l}}const n=t=>Object.assign({type:l},t);class l extends a{get _delta(){return this._metrics.itemSize1+this._metrics.gap1}_getItemSize(t){return{[this._sizeDim]:this._metrics.itemSize1,[this._secondarySizeDim]:this._metrics.itemSize2}}_getActiveItems(){const t=this._metrics,{rolumns:i}=t;if(0===i)this._first=-1,this._last=-1,this._physicalMin=0,this._physicalMax=0;else{const{padding1:e}=t,r=Math.max(0,this._scrollPosition-this._overhang),s=Math.min(this._scrollSize,this._scrollPosition+this._viewDim1+this._overhang),o=Math.max(0,Math.floor((r-e.start)/this._delta)),a=Math.max(0,Math.ceil((s-e.start)/this._delta));this._first=o*i,this._last=Math.min(a*i-1,this.items.length-1),this._physicalMin=e.start+this._delta*o,this._physicalMax=e.start+this._delta*a}}_getItemPosition(t){const{rolumns:i,padding1:e,positions:s,itemSize1:o,itemSize2:a}=this._metrics;return{[this._positionDim]:e.start+Math.floor(t/i)*this._delta,[this._secondaryPositionDim]:s[t%i],[(0,r.qF)(this.direction)]:o,[(0,r.gu)(this.direction)]:a}}_updateScrollSize(){const{rolumns:t,gap1:i,padding1:e,itemSize1:r}=this._metrics;let s=1;if(t>0){const o=Math.ceil(this.items.length/t);s=e.start+o*r+(o-1)*i+e.end}this._scrollSize=s}}},15723:(t,i,e)=>{function r(t){return"horizontal"===t?"width":"height"}function s(t){return"horizontal"===t?"height":"width"}e.d(i,{IE:()=>o,gu:()=>s,qF:()=>r});class o{_getDefaultConfig(){return{direction:"vertical"}}constructor(t,i){this._latestCoords={left:0,top:0},this._direction=null,this._viewportSize={width:0,height:0},this.totalScrollSize={width:0,height:0},this.offsetWithinScroller={left:0,top:0},this._pendingReflow=!1,this._pendingLayoutUpdate=!1,this._pin=null,this._firstVisible=0,this._lastVisible=0,this._physicalMin=0,this._physicalMax=0,this._first=-1,this._last=-1,this._sizeDim="height",this._secondarySizeDim="width",this._positionDim="top",this._secondaryPositionDim="left",this._scrollPosition=0,this._scrollError=0,this._items=[],this._scrollSize=1,this._overhang=1e3,this._hostSink=t,Promise.resolve().then((()=>this.config=i||this._getDefaultConfig()))}set config(t){Object.assign(this,Object.assign({},this._getDefaultConfig(),t))}get config(){return{direction:this.direction}}get items(){return this._items}set items(t){this._setItems(t)}_setItems(t){t!==this._items&&(this._items=t,this._scheduleReflow())}get direction(){return this._direction}set direction(t){(t="horizontal"===t?t:"vertical")!==this._direction&&(this._direction=t,this._sizeDim="horizontal"===t?"width":"height",this._secondarySizeDim="horizontal"===t?"height":"width",this._positionDim="horizontal"===t?"left":"top",this._secondaryPositionDim="horizontal"===t?"top":"left",this._triggerReflow())}get viewportSize(){return this._viewportSize}set viewportSize(t){const{_viewDim1:i,_viewDim2:e}=this;Object.assign(this._viewportSize,t),e!==this._viewDim2?this._scheduleLayoutUpdate():i!==this._viewDim1&&this._checkThresholds()}get viewportScroll(){return this._latestCoords}set viewportScroll(t){Object.assign(this._latestCoords,t);const i=this._scrollPosition;this._scrollPosition=this._latestCoords[this._positionDim];Math.abs(i-this._scrollPosition)>=1&&this._checkThresholds()}reflowIfNeeded(t=!1){(t||this._pendingReflow)&&(this._pendingReflow=!1,this._reflow())}set pin(t){this._pin=t,this._triggerReflow()}get pin(){if(null!==this._pin){const{index:t,block:i}=this._pin;return{index:Math.max(0,Math.min(t,this.items.length-1)),block:i}}return null}_clampScrollPosition(t){return Math.max(-this.offsetWithinScroller[this._positionDim],Math.min(t,this.totalScrollSize[r(this.direction)]-this._viewDim1))}unpin(){null!==this._pin&&(this._sendUnpinnedMessage(),this._pin=null)}_updateLayout(){}get _viewDim1(){return this._viewportSize[this._sizeDim]}get _viewDim2(){return this._viewportSize[this._secondarySizeDim]}_scheduleReflow(){this._pendingReflow=!0}_scheduleLayoutUpdate(){this._pendingLayoutUpdate=!0,this._scheduleReflow()}_triggerReflow(){this._scheduleLayoutUpdate(),Promise.resolve().then((()=>this.reflowIfNeeded()))}_reflow(){this._pendingLayoutUpdate&&(this._updateLayout(),this._pendingLayoutUpdate=!1),this._updateScrollSize(),this._setPositionFromPin(),this._getActiveItems(),this._updateVisibleIndices(),this._sendStateChangedMessage()}_setPositionFromPin(){if(null!==this.pin){const t=this._scrollPosition,{index:i,block:e}=this.pin;this._scrollPosition=this._calculateScrollIntoViewPosition({index:i,block:e||"start"})-this.offsetWithinScroller[this._positionDim],this._scrollError=t-this._scrollPosition}}_calculateScrollIntoViewPosition(t){const{block:i}=t,e=Math.min(this.items.length,Math.max(0,t.index)),r=this._getItemPosition(e)[this._positionDim];let s=r;if("start"!==i){const t=this._getItemSize(e)[this._sizeDim];if("center"===i)s=r-.5*this._viewDim1+.5*t;else{const e=r-this._viewDim1+t;if("end"===i)s=e;else{const t=this._scrollPosition;s=Math.abs(t-r)<Math.abs(t-e)?r:e}}}return s+=this.offsetWithinScroller[this._positionDim],this._clampScrollPosition(s)}getScrollIntoViewCoordinates(t){return{[this._positionDim]:this._calculateScrollIntoViewPosition(t)}}_sendUnpinnedMessage(){this._hostSink({type:"unpinned"})}_sendVisibilityChangedMessage(){this._hostSink({type:"visibilityChanged",firstVisible:this._firstVisible,lastVisible:this._lastVisible})}_sendStateChangedMessage(){const t=new Map;if(-1!==this._first&&-1!==this._last)for(let i=this._first;i<=this._last;i++)t.set(i,this._getItemPosition(i));const i={type:"stateChanged",scrollSize:{[this._sizeDim]:this._scrollSize,[this._secondarySizeDim]:null},range:{first:this._first,last:this._last,firstVisible:this._firstVisible,lastVisible:this._lastVisible},childPositions:t};this._scrollError&&(i.scrollError={[this._positionDim]:this._scrollError,[this._secondaryPositionDim]:0},this._scrollError=0),this._hostSink(i)}get _num(){return-1===this._first||-1===this._last?0:this._last-this._first+1}_checkThresholds(){if(0===this._viewDim1&&this._num>0||null!==this._pin)this._scheduleReflow();else{const t=Math.max(0,this._scrollPosition-this._overhang),i=Math.min(this._scrollSize,this._scrollPosition+this._viewDim1+this._overhang);this._physicalMin>t||this._physicalMax<i?this._scheduleReflow():this._updateVisibleIndices({emit:!0})}}_updateVisibleIndices(t){if(-1===this._first||-1===this._last)return;let i=this._first;for(;i<this._last&&Math.round(this._getItemPosition(i)[this._positionDim]+this._getItemSize(i)[this._sizeDim])<=Math.round(this._scrollPosition);)i++;let e=this._last;for(;e>this._first&&Math.round(this._getItemPosition(e)[this._positionDim])>=Math.round(this._scrollPosition+this._viewDim1);)e--;i===this._firstVisible&&e===this._lastVisible||(this._firstVisible=i,this._lastVisible=e,t&&t.emit&&this._sendVisibilityChangedMessage())}}},22129:(t,i,e)=>{e.d(i,{B:()=>d});var r=e(43204),s=e(95260),o=e(5095),a=e(53180),n=e(6157);class l extends o.oi{constructor(){super(...arguments),this.value=0,this.max=1,this.indeterminate=!1,this.fourColor=!1}render(){const{ariaLabel:t}=this;return o.dy` <div class="progress ${(0,a.$)(this.getRenderClasses())}" role="progressbar" aria-label="${t||o.Ld}" aria-valuemin="0" aria-valuemax="${this.max}" aria-valuenow="${this.indeterminate?o.Ld:this.value}">${this.renderIndicator()}</div> `}getRenderClasses(){return{indeterminate:this.indeterminate,"four-color":this.fourColor}}}(0,n.d)(l),(0,r.__decorate)([(0,s.Cb)({type:Number})],l.prototype,"value",void 0),(0,r.__decorate)([(0,s.Cb)({type:Number})],l.prototype,"max",void 0),(0,r.__decorate)([(0,s.Cb)({type:Boolean})],l.prototype,"indeterminate",void 0),(0,r.__decorate)([(0,s.Cb)({type:Boolean,attribute:"four-color"})],l.prototype,"fourColor",void 0);class h extends l{renderIndicator(){return this.indeterminate?this.renderIndeterminateContainer():this.renderDeterminateContainer()}renderDeterminateContainer(){const t=100*(1-this.value/this.max);return o.dy` <svg viewBox="0 0 4800 4800"> <circle class="track" pathLength="100"></circle> <circle class="active-track" pathLength="100" stroke-dashoffset="${t}"></circle> </svg> `}renderIndeterminateContainer(){return o.dy` <div class="spinner"> <div class="left"> <div class="circle"></div> </div> <div class="right"> <div class="circle"></div> </div> </div>`}}const c=o.iv`:host{--_active-indicator-color:var(--md-circular-progress-active-indicator-color, var(--md-sys-color-primary, #6750a4));--_active-indicator-width:var(--md-circular-progress-active-indicator-width, 10);--_four-color-active-indicator-four-color:var(--md-circular-progress-four-color-active-indicator-four-color, var(--md-sys-color-tertiary-container, #ffd8e4));--_four-color-active-indicator-one-color:var(--md-circular-progress-four-color-active-indicator-one-color, var(--md-sys-color-primary, #6750a4));--_four-color-active-indicator-three-color:var(--md-circular-progress-four-color-active-indicator-three-color, var(--md-sys-color-tertiary, #7d5260));--_four-color-active-indicator-two-color:var(--md-circular-progress-four-color-active-indicator-two-color, var(--md-sys-color-primary-container, #eaddff));--_size:var(--md-circular-progress-size, 48px);display:inline-flex;vertical-align:middle;width:var(--_size);height:var(--_size);position:relative;align-items:center;justify-content:center;contain:strict;content-visibility:auto}.progress{flex:1;align-self:stretch;margin:4px}.active-track,.circle,.left,.progress,.right,.spinner,.track,svg{position:absolute;inset:0}svg{transform:rotate(-90deg)}circle{cx:50%;cy:50%;r:calc(50%*(1 - var(--_active-indicator-width)/ 100));stroke-width:calc(var(--_active-indicator-width)*1%);stroke-dasharray:100;fill:rgba(0,0,0,0)}.active-track{transition:stroke-dashoffset .5s cubic-bezier(0, 0, .2, 1);stroke:var(--_active-indicator-color)}.track{stroke:rgba(0,0,0,0)}.progress.indeterminate{animation:linear infinite linear-rotate;animation-duration:1.568s}.spinner{animation:infinite both rotate-arc;animation-duration:5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.left{overflow:hidden;inset:0 50% 0 0}.right{overflow:hidden;inset:0 0 0 50%}.circle{box-sizing:border-box;border-radius:50%;border:solid calc(var(--_active-indicator-width)/ 100*(var(--_size) - 8px));border-color:var(--_active-indicator-color) var(--_active-indicator-color) transparent transparent;animation:expand-arc;animation-iteration-count:infinite;animation-fill-mode:both;animation-duration:1333ms,5332ms;animation-timing-function:cubic-bezier(0.4,0,0.2,1)}.four-color .circle{animation-name:expand-arc,four-color}.left .circle{rotate:135deg;inset:0 -100% 0 0}.right .circle{rotate:100deg;inset:0 0 0 -100%;animation-delay:-.666s,0s}@media(forced-colors:active){.active-track{stroke:CanvasText}.circle{border-color:CanvasText CanvasText Canvas Canvas}}@keyframes expand-arc{0%{transform:rotate(265deg)}50%{transform:rotate(130deg)}100%{transform:rotate(265deg)}}@keyframes rotate-arc{12.5%{transform:rotate(135deg)}25%{transform:rotate(270deg)}37.5%{transform:rotate(405deg)}50%{transform:rotate(540deg)}62.5%{transform:rotate(675deg)}75%{transform:rotate(810deg)}87.5%{transform:rotate(945deg)}100%{transform:rotate(1080deg)}}@keyframes linear-rotate{to{transform:rotate(360deg)}}@keyframes four-color{0%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}15%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}25%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}40%{border-top-color:var(--_four-color-active-indicator-two-color);border-right-color:var(--_four-color-active-indicator-two-color)}50%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}65%{border-top-color:var(--_four-color-active-indicator-three-color);border-right-color:var(--_four-color-active-indicator-three-color)}75%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}90%{border-top-color:var(--_four-color-active-indicator-four-color);border-right-color:var(--_four-color-active-indicator-four-color)}100%{border-top-color:var(--_four-color-active-indicator-one-color);border-right-color:var(--_four-color-active-indicator-one-color)}}`;let d=class extends h{};d.styles=[c],d=(0,r.__decorate)([(0,s.Mo)("md-circular-progress")],d)},60307:(t,i,e)=>{e.d(i,{C:()=>_});var r=e(32982),s=e(41005),o=e(36585);class a{constructor(t){this.G=t}disconnect(){this.G=void 0}reconnect(t){this.G=t}deref(){return this.G}}class n{constructor(){this.Y=void 0,this.Z=void 0}get(){return this.Y}pause(){var t;null!==(t=this.Y)&&void 0!==t||(this.Y=new Promise((t=>this.Z=t)))}resume(){var t;null===(t=this.Z)||void 0===t||t.call(this),this.Y=this.Z=void 0}}var l=e(16616);const h=t=>!(0,s.pt)(t)&&"function"==typeof t.then,c=1073741823;class d extends o.sR{constructor(){super(...arguments),this._$C_t=c,this._$Cwt=[],this._$Cq=new a(this),this._$CK=new n}render(...t){var i;return null!==(i=t.find((t=>!h(t))))&&void 0!==i?i:r.Jb}update(t,i){const e=this._$Cwt;let s=e.length;this._$Cwt=i;const o=this._$Cq,a=this._$CK;this.isConnected||this.disconnected();for(let t=0;t<i.length&&!(t>this._$C_t);t++){const r=i[t];if(!h(r))return this._$C_t=t,r;t<s&&r===e[t]||(this._$C_t=c,s=0,Promise.resolve(r).then((async t=>{for(;a.get();)await a.get();const i=o.deref();if(void 0!==i){const e=i._$Cwt.indexOf(r);e>-1&&e<i._$C_t&&(i._$C_t=e,i.setValue(t))}})))}return r.Jb}disconnected(){this._$Cq.disconnect(),this._$CK.pause()}reconnected(){this._$Cq.reconnect(this),this._$CK.resume()}}const _=(0,l.XM)(d)}};
+//# sourceMappingURL=4527.JSqIxrFQ1fA.js.map
\ No newline at end of file
@@ -0,0 +1,5 @@
+export const id=4871;export const ids=[4871];export const modules={74376:(e,t,i)=>{var a=i(309),s=i(58417),l=i(39274),d=i(5095),o=i(95260);(0,a.Z)([(0,o.Mo)("ha-checkbox")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[l.W,d.iv`:host{--mdc-theme-secondary:var(--primary-color)}`]}]}}),s.A)},84871:(e,t,i)=>{var a=i(309),s=i(5095),l=i(95260),d=i(14516),o=i(4771),n=i(18394),r=i(36655),v=i(44672),c=i(56311),h=i(64346),u=i(29934),p=i(84728),y=(i(74376),i(54371),i(86336),i(52910),i(3017),i(80392),i(32723)),f=i(77251);const _=e=>e.selector&&!e.required&&!("boolean"in e.selector&&e.default);(0,a.Z)([(0,l.Mo)("ha-service-control")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"value",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"showAdvanced",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"hidePicker",value:()=>!1},{kind:"field",decorators:[(0,l.SB)()],key:"_value",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_checkedKeys",value:()=>new Set},{kind:"field",decorators:[(0,l.SB)()],key:"_manifest",value:void 0},{kind:"field",decorators:[(0,l.IO)("ha-yaml-editor")],key:"_yamlEditor",value:void 0},{kind:"method",key:"willUpdate",value:function(e){var t,i,a,s,l,d,o,v;if(this.hasUpdated||(this.hass.loadBackendTranslation("services"),this.hass.loadBackendTranslation("selector")),!e.has("value"))return;const c=e.get("value");(null==c?void 0:c.service)!==(null===(t=this.value)||void 0===t?void 0:t.service)&&(this._checkedKeys=new Set);const h=this._getServiceInfo(null===(i=this.value)||void 0===i?void 0:i.service,this.hass.services);var u;null!==(a=this.value)&&void 0!==a&&a.service?null!=c&&c.service&&(0,r.M)(this.value.service)===(0,r.M)(c.service)||this._fetchManifest((0,r.M)(null===(u=this.value)||void 0===u?void 0:u.service)):this._manifest=void 0;if(h&&"target"in h&&(null!==(s=this.value)&&void 0!==s&&null!==(s=s.data)&&void 0!==s&&s.entity_id||null!==(l=this.value)&&void 0!==l&&null!==(l=l.data)&&void 0!==l&&l.area_id||null!==(d=this.value)&&void 0!==d&&null!==(d=d.data)&&void 0!==d&&d.device_id)){var p,y,f;const e={...this.value.target};!this.value.data.entity_id||null!==(p=this.value.target)&&void 0!==p&&p.entity_id||(e.entity_id=this.value.data.entity_id),!this.value.data.area_id||null!==(y=this.value.target)&&void 0!==y&&y.area_id||(e.area_id=this.value.data.area_id),!this.value.data.device_id||null!==(f=this.value.target)&&void 0!==f&&f.device_id||(e.device_id=this.value.data.device_id),this._value={...this.value,target:e,data:{...this.value.data}},delete this._value.data.entity_id,delete this._value.data.device_id,delete this._value.data.area_id}else this._value=this.value;if((null==c?void 0:c.service)!==(null===(o=this.value)||void 0===o?void 0:o.service)){let e=!1;if(this._value&&h){const t=this.value&&!("data"in this.value);this._value.data||(this._value.data={}),h.fields.forEach((i=>{i.selector&&i.required&&void 0===i.default&&"boolean"in i.selector&&void 0===this._value.data[i.key]&&(e=!0,this._value.data[i.key]=!1),t&&i.selector&&void 0!==i.default&&void 0===this._value.data[i.key]&&(e=!0,this._value.data[i.key]=i.default)}))}e&&(0,n.B)(this,"value-changed",{value:{...this._value}})}if(null!==(v=this._value)&&void 0!==v&&v.data){const e=this._yamlEditor;e&&e.value!==this._value.data&&e.setValue(this._value.data)}}},{kind:"field",key:"_getServiceInfo",value:()=>(0,d.Z)(((e,t)=>{if(!e||!t)return;const i=(0,r.M)(e),a=(0,v.p)(e);if(!(i in t))return;if(!(a in t[i]))return;const s=Object.entries(t[i][a].fields).map((([e,t])=>({key:e,...t,selector:t.selector})));return{...t[i][a],fields:s,hasSelector:s.length?s.filter((e=>e.selector)).map((e=>e.key)):[]}}))},{kind:"field",key:"_filterFields",value(){return(0,d.Z)(((e,t)=>{var i;return null==e||null===(i=e.fields)||void 0===i?void 0:i.filter((i=>!i.filter||this._filterField(e.target,i.filter,t)))}))}},{kind:"method",key:"_filterField",value:function(e,t,i){var a,s,l,d,n,r,v,h,p;const y=e?{target:e}:{target:{}},f=(null===(a=(0,o.r)((null==i||null===(s=i.target)||void 0===s?void 0:s.entity_id)||(null==i||null===(l=i.data)||void 0===l?void 0:l.entity_id)))||void 0===a?void 0:a.slice())||[],_=(null===(d=(0,o.r)((null==i||null===(n=i.target)||void 0===n?void 0:n.device_id)||(null==i||null===(r=i.data)||void 0===r?void 0:r.device_id)))||void 0===d?void 0:d.slice())||[],g=null===(v=(0,o.r)((null==i||null===(h=i.target)||void 0===h?void 0:h.area_id)||(null==i||null===(p=i.data)||void 0===p?void 0:p.area_id)))||void 0===v?void 0:v.slice();return g&&g.forEach((e=>{const t=(0,u.xO)(this.hass,e,this.hass.devices,this.hass.entities,y);f.push(...t.entities),_.push(...t.devices)})),_.length&&_.forEach((e=>{f.push(...(0,u.aV)(this.hass,e,this.hass.entities,y).entities)})),!!f.length&&!!f.some((e=>{var i;const a=this.hass.states[e];return!!a&&(!(null===(i=t.supported_features)||void 0===i||!i.some((e=>(0,c.e)(a,e))))||!(!t.attribute||!Object.entries(t.attribute).some((([e,t])=>e in a.attributes&&((e,t)=>"object"==typeof t?!!Array.isArray(t)&&t.some((t=>e.includes(t))):e.includes(t))(t,a.attributes[e])))))}))}},{kind:"method",key:"render",value:function(){var e,t,i,a,l,d,o,n;const c=this._getServiceInfo(null===(e=this._value)||void 0===e?void 0:e.service,this.hass.services),h=(null==c?void 0:c.fields.length)&&!c.hasSelector.length||c&&Object.keys((null===(t=this._value)||void 0===t?void 0:t.data)||{}).some((e=>!c.hasSelector.includes(e))),u=h&&(null==c?void 0:c.fields.find((e=>"entity_id"===e.key))),y=Boolean(!h&&(null==c?void 0:c.fields.some((e=>_(e))))),f=this._filterFields(c,this._value),g=null!==(i=this._value)&&void 0!==i&&i.service?(0,r.M)(this._value.service):void 0,k=null!==(a=this._value)&&void 0!==a&&a.service?(0,v.p)(this._value.service):void 0,m=k&&this.hass.localize(`component.${g}.services.${k}.description`)||(null==c?void 0:c.description);return s.dy`${this.hidePicker?s.Ld:s.dy`<ha-service-picker .hass="${this.hass}" .value="${null===(l=this._value)||void 0===l?void 0:l.service}" .disabled="${this.disabled}" @value-changed="${this._serviceChanged}"></ha-service-picker>`} <div class="description"> ${m?s.dy`<p>${m}</p>`:""} ${this._manifest?s.dy` <a href="${this._manifest.is_built_in?(0,p.R)(this.hass,`/integrations/${this._manifest.domain}`):this._manifest.documentation}" title="${this.hass.localize("ui.components.service-control.integration_doc")}" target="_blank" rel="noreferrer"> <ha-icon-button .path="${"M15.07,11.25L14.17,12.17C13.45,12.89 13,13.5 13,15H11V14.5C11,13.39 11.45,12.39 12.17,11.67L13.41,10.41C13.78,10.05 14,9.55 14,9C14,7.89 13.1,7 12,7A2,2 0 0,0 10,9H8A4,4 0 0,1 12,5A4,4 0 0,1 16,9C16,9.88 15.64,10.67 15.07,11.25M13,19H11V17H13M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12C22,6.47 17.5,2 12,2Z"}" class="help-icon"></ha-icon-button> </a>`:""} </div> ${c&&"target"in c?s.dy`<ha-settings-row .narrow="${this.narrow}"> ${y?s.dy`<div slot="prefix" class="checkbox-spacer"></div>`:""} <span slot="heading">${this.hass.localize("ui.components.service-control.target")}</span> <span slot="description">${this.hass.localize("ui.components.service-control.target_description")}</span><ha-selector .hass="${this.hass}" .selector="${c.target?{target:c.target}:{target:{}}}" .disabled="${this.disabled}" @value-changed="${this._targetChanged}" .value="${null===(d=this._value)||void 0===d?void 0:d.target}"></ha-selector></ha-settings-row>`:u?s.dy`<ha-entity-picker .hass="${this.hass}" .disabled="${this.disabled}" .value="${null===(o=this._value)||void 0===o||null===(o=o.data)||void 0===o?void 0:o.entity_id}" .label="${this.hass.localize(`component.${g}.services.${k}.fields.entity_id.description`)||u.description}" @value-changed="${this._entityPicked}" allow-custom-entity></ha-entity-picker>`:""} ${this._renderReorderModeAlert()} ${h?s.dy`<ha-yaml-editor .hass="${this.hass}" .label="${this.hass.localize("ui.components.service-control.data")}" .name="${"data"}" .readOnly="${this.disabled}" .defaultValue="${null===(n=this._value)||void 0===n?void 0:n.data}" @value-changed="${this._dataChanged}"></ha-yaml-editor>`:null==f?void 0:f.map((e=>{var t,i,a,l,d;const o=null!==(t=null==e?void 0:e.selector)&&void 0!==t?t:{text:void 0},n=Object.keys(o)[0],r=["action","condition","trigger"].includes(n)?{[n]:{...o[n],path:[e.key]}}:o,v=_(e);return e.selector&&(!e.advanced||this.showAdvanced||null!==(i=this._value)&&void 0!==i&&i.data&&void 0!==this._value.data[e.key])?s.dy`<ha-settings-row .narrow="${this.narrow}"> ${v?s.dy`<ha-checkbox .key="${e.key}" .checked="${this._checkedKeys.has(e.key)||(null===(a=this._value)||void 0===a?void 0:a.data)&&void 0!==this._value.data[e.key]}" .disabled="${this.disabled}" @change="${this._checkboxChanged}" slot="prefix"></ha-checkbox>`:y?s.dy`<div slot="prefix" class="checkbox-spacer"></div>`:""} <span slot="heading">${this.hass.localize(`component.${g}.services.${k}.fields.${e.key}.name`)||e.name||e.key}</span> <span slot="description">${this.hass.localize(`component.${g}.services.${k}.fields.${e.key}.description`)||(null==e?void 0:e.description)}</span> <ha-selector .disabled="${this.disabled||v&&!this._checkedKeys.has(e.key)&&(!(null!==(l=this._value)&&void 0!==l&&l.data)||void 0===this._value.data[e.key])}" .hass="${this.hass}" .selector="${r}" .key="${e.key}" @value-changed="${this._serviceDataChanged}" .value="${null!==(d=this._value)&&void 0!==d&&d.data?this._value.data[e.key]:void 0}" .placeholder="${e.default}" .localizeValue="${this._localizeValueCallback}" @item-moved="${this._itemMoved}"></ha-selector> </ha-settings-row>`:""}))}`}},{kind:"method",key:"_renderReorderModeAlert",value:function(){return this._reorderMode.active?s.dy` <ha-alert class="re-order" alert-type="info" .title="${this.hass.localize("ui.panel.config.automation.editor.re_order_mode.title")}"> ${this.hass.localize("ui.panel.config.automation.editor.re_order_mode.description_all")} <ha-button slot="action" @click="${this._exitReOrderMode}"> ${this.hass.localize("ui.panel.config.automation.editor.re_order_mode.exit")} </ha-button> </ha-alert> `:s.Ld}},{kind:"method",key:"_exitReOrderMode",value:async function(){this._reorderMode.exit()}},{kind:"field",key:"_localizeValueCallback",value(){return e=>{var t;return null!==(t=this._value)&&void 0!==t&&t.service?this.hass.localize(`component.${(0,r.M)(this._value.service)}.selector.${e}`):""}}},{kind:"method",key:"_checkboxChanged",value:function(e){const t=e.currentTarget.checked,i=e.currentTarget.key;let a;if(t){var s,l;this._checkedKeys.add(i);const e=null===(s=this._getServiceInfo(null===(l=this._value)||void 0===l?void 0:l.service,this.hass.services))||void 0===s?void 0:s.fields.find((e=>e.key===i));let t=null==e?void 0:e.default;var d,o;if(null==t&&null!=e&&e.selector&&"constant"in e.selector)t=null===(d=e.selector.constant)||void 0===d?void 0:d.value;if(null==t&&null!=e&&e.selector&&"boolean"in e.selector&&(t=!1),null!=t)a={...null===(o=this._value)||void 0===o?void 0:o.data,[i]:t}}else{var r;this._checkedKeys.delete(i),a={...null===(r=this._value)||void 0===r?void 0:r.data},delete a[i]}a&&(0,n.B)(this,"value-changed",{value:{...this._value,data:a}}),this.requestUpdate("_checkedKeys")}},{kind:"method",key:"_serviceChanged",value:function(e){var t;if(e.stopPropagation(),e.detail.value===(null===(t=this._value)||void 0===t?void 0:t.service))return;const i=e.detail.value||"";let a;if(i){var s;const e=this._getServiceInfo(i,this.hass.services),t=null===(s=this._value)||void 0===s?void 0:s.target;if(t&&null!=e&&e.target){var l,d,r,v,c,h;const i={target:{...e.target}};let s=(null===(l=(0,o.r)(t.entity_id||(null===(d=this._value.data)||void 0===d?void 0:d.entity_id)))||void 0===l?void 0:l.slice())||[],n=(null===(r=(0,o.r)(t.device_id||(null===(v=this._value.data)||void 0===v?void 0:v.device_id)))||void 0===r?void 0:r.slice())||[],p=(null===(c=(0,o.r)(t.area_id||(null===(h=this._value.data)||void 0===h?void 0:h.area_id)))||void 0===c?void 0:c.slice())||[];p.length&&(p=p.filter((e=>(0,u.vI)(this.hass,this.hass.entities,this.hass.devices,e,i)))),n.length&&(n=n.filter((e=>(0,u.qJ)(this.hass,Object.values(this.hass.entities),this.hass.devices[e],i)))),s.length&&(s=s.filter((e=>(0,u.QQ)(this.hass.states[e],i)))),a={...s.length?{entity_id:s}:{},...n.length?{device_id:n}:{},...p.length?{area_id:p}:{}}}}const p={service:i,target:a};(0,n.B)(this,"value-changed",{value:p})}},{kind:"method",key:"_entityPicked",value:function(e){var t,i;e.stopPropagation();const a=e.detail.value;if((null===(t=this._value)||void 0===t||null===(t=t.data)||void 0===t?void 0:t.entity_id)===a)return;let s;var l;!a&&null!==(i=this._value)&&void 0!==i&&i.data?(s={...this._value},delete s.data.entity_id):s={...this._value,data:{...null===(l=this._value)||void 0===l?void 0:l.data,entity_id:e.detail.value}};(0,n.B)(this,"value-changed",{value:s})}},{kind:"method",key:"_targetChanged",value:function(e){var t;e.stopPropagation();const i=e.detail.value;if((null===(t=this._value)||void 0===t?void 0:t.target)===i)return;let a;i?a={...this._value,target:e.detail.value}:(a={...this._value},delete a.target),(0,n.B)(this,"value-changed",{value:a})}},{kind:"method",key:"_serviceDataChanged",value:function(e){var t,i,a;e.stopPropagation();const s=e.currentTarget.key,l=e.detail.value;if((null===(t=this._value)||void 0===t||null===(t=t.data)||void 0===t?void 0:t[s])===l||(null===(i=this._value)||void 0===i||null===(i=i.data)||void 0===i||!i[s])&&(""===l||void 0===l))return;const d={...null===(a=this._value)||void 0===a?void 0:a.data,[s]:l};""!==l&&void 0!==l||delete d[s],(0,n.B)(this,"value-changed",{value:{...this._value,data:d}})}},{kind:"method",key:"_itemMoved",value:function(e){var t,i;e.stopPropagation();const{oldIndex:a,newIndex:s,oldPath:l,newPath:d}=e.detail,o=null!==(t=null===(i=this.value)||void 0===i?void 0:i.data)&&void 0!==t?t:{},r=(0,y.b)(o,a,s,l,d);(0,n.B)(this,"value-changed",{value:{...this.value,data:r}})}},{kind:"method",key:"_dataChanged",value:function(e){e.stopPropagation(),e.detail.isValid&&(0,n.B)(this,"value-changed",{value:{...this._value,data:e.detail.value}})}},{kind:"method",key:"_fetchManifest",value:async function(e){this._manifest=void 0;try{this._manifest=await(0,h.t4)(this.hass,e)}catch(e){}}},{kind:"get",static:!0,key:"styles",value:function(){return s.iv`ha-settings-row{padding:var(--service-control-padding,0 16px)}ha-settings-row{--paper-time-input-justify-content:flex-end;--settings-row-content-width:100%;--settings-row-prefix-display:contents;border-top:var(--service-control-items-border-top,1px solid var(--divider-color))}ha-entity-picker,ha-service-picker,ha-yaml-editor{display:block;margin:var(--service-control-padding,0 16px)}ha-yaml-editor{padding:16px 0}p{margin:var(--service-control-padding,0 16px);padding:16px 0}:host([hidePicker]) p{padding-top:0}.checkbox-spacer{width:32px}ha-checkbox{margin-left:-16px}.help-icon{color:var(--secondary-text-color)}.description{justify-content:space-between;display:flex;align-items:center;padding-right:2px}`}}]}}),(0,f.j)(s.oi))},52910:(e,t,i)=>{var a=i(309),s=(i(44577),i(5095)),l=i(95260),d=i(14516),o=i(18394),n=i(64346);i(16591);const r=e=>s.dy`<mwc-list-item twoline> <span>${e.name}</span> <span slot="secondary">${e.name===e.service?"":e.service}</span> </mwc-list-item>`;(0,a.Z)([(0,l.Mo)("ha-service-picker")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_filter",value:void 0},{kind:"method",key:"willUpdate",value:function(){this.hasUpdated||this.hass.loadBackendTranslation("services")}},{kind:"method",key:"render",value:function(){return s.dy` <ha-combo-box .hass="${this.hass}" .label="${this.hass.localize("ui.components.service-picker.service")}" .filteredItems="${this._filteredServices(this.hass.localize,this.hass.services,this._filter)}" .value="${this.value}" .disabled="${this.disabled}" .renderer="${r}" item-value-path="service" item-label-path="name" allow-custom-value @filter-changed="${this._filterChanged}" @value-changed="${this._valueChanged}"></ha-combo-box> `}},{kind:"field",key:"_services",value(){return(0,d.Z)(((e,t)=>{if(!t)return[];const i=[];return Object.keys(t).sort().forEach((a=>{const s=Object.keys(t[a]).sort();for(const l of s)i.push({service:`${a}.${l}`,name:`${(0,n.Lh)(e,a)}: ${this.hass.localize(`component.${a}.services.${l}.name`)||t[a][l].name||l}`})})),i}))}},{kind:"field",key:"_filteredServices",value(){return(0,d.Z)(((e,t,i)=>{if(!t)return[];const a=this._services(e,t);return i?a.filter((e=>{var t;return e.service.toLowerCase().includes(i)||(null===(t=e.name)||void 0===t?void 0:t.toLowerCase().includes(i))})):a}))}},{kind:"method",key:"_filterChanged",value:function(e){this._filter=e.detail.value.toLowerCase()}},{kind:"method",key:"_valueChanged",value:function(e){this.value=e.detail.value,(0,o.B)(this,"change"),(0,o.B)(this,"value-changed",{value:this.value})}}]}}),s.oi)},3017:(e,t,i)=>{var a=i(309),s=i(5095),l=i(95260);(0,a.Z)([(0,l.Mo)("ha-settings-row")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,attribute:"three-line"})],key:"threeLine",value:()=>!1},{kind:"method",key:"render",value:function(){return s.dy` <div class="prefix-wrap"> <slot name="prefix"></slot> <div class="body" ?two-line="${!this.threeLine}" ?three-line="${this.threeLine}"> <slot name="heading"></slot> <div class="secondary"><slot name="description"></slot></div> </div> </div> <div class="content"><slot></slot></div> `}},{kind:"get",static:!0,key:"styles",value:function(){return s.iv`:host{display:flex;padding:0 16px;align-content:normal;align-self:auto;align-items:center}.body{padding-top:8px;padding-bottom:8px;padding-left:0;padding-inline-start:0;padding-right:16x;padding-inline-end:16px;overflow:hidden;display:var(--layout-vertical_-_display);flex-direction:var(--layout-vertical_-_flex-direction);justify-content:var(--layout-center-justified_-_justify-content);flex:var(--layout-flex_-_flex);flex-basis:var(--layout-flex_-_flex-basis)}.body[three-line]{min-height:var(--paper-item-body-three-line-min-height,88px)}.body>*{overflow:hidden;text-overflow:ellipsis;white-space:nowrap}.body>.secondary{display:block;padding-top:4px;font-family:var(
+          --mdc-typography-body2-font-family,
+          var(--mdc-typography-font-family, Roboto, sans-serif)
+        );-webkit-font-smoothing:antialiased;font-size:var(--mdc-typography-body2-font-size, .875rem);font-weight:var(--mdc-typography-body2-font-weight,400);line-height:normal;color:var(--secondary-text-color)}.body[two-line]{min-height:calc(var(--paper-item-body-two-line-min-height,72px) - 16px);flex:1}.content{display:contents}:host(:not([narrow])) .content{display:var(--settings-row-content-display,flex);justify-content:flex-end;flex:1;padding:16px 0}.content ::slotted(*){width:var(--settings-row-content-width)}:host([narrow]){align-items:normal;flex-direction:column;border-top:1px solid var(--divider-color);padding-bottom:8px}::slotted(ha-switch){padding:16px 0}.secondary{white-space:normal}.prefix-wrap{display:var(--settings-row-prefix-display)}:host([narrow]) .prefix-wrap{display:flex;align-items:center}`}}]}}),s.oi)},64346:(e,t,i)=>{i.d(t,{F3:()=>s,Lh:()=>a,t4:()=>l});const a=(e,t,i)=>e(`component.${t}.title`)||(null==i?void 0:i.name)||t,s=(e,t)=>{const i={type:"manifest/list"};return t&&(i.integrations=t),e.callWS(i)},l=(e,t)=>e.callWS({type:"manifest/get",integration:t})},84728:(e,t,i)=>{i.d(t,{R:()=>a});const a=(e,t)=>`https://${e.config.version.includes("b")?"rc":e.config.version.includes("dev")?"next":"www"}.home-assistant.io${t}`}};
+//# sourceMappingURL=4871.cf3WhCdvOYs.js.map
\ No newline at end of file
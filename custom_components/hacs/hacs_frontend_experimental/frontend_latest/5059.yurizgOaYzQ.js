@@ -0,0 +1,2 @@
+export const id=5059;export const ids=[5059];export const modules={86089:(e,i,t)=>{t.d(i,{U:()=>l});const l=e=>e.stopPropagation()},25551:(e,i,t)=>{t.d(i,{u:()=>a});var l=t(14516);const a=(e,i)=>{try{var t,l;return null!==(t=null===(l=n(i))||void 0===l?void 0:l.of(e))&&void 0!==t?t:e}catch(i){return e}},n=(0,l.Z)((e=>Intl&&"DisplayNames"in Intl?new Intl.DisplayNames(e.language,{type:"language",fallback:"code"}):void 0))},95352:(e,i,t)=>{var l=t(309),a=t(34541),n=t(47838),s=t(5095),d=t(95260),o=t(18394),r=t(86089),c=t(25551);t(90532),t(71133);const u="preferred",h="last_used";(0,l.Z)([(0,d.Mo)("ha-assist-pipeline-picker")],(function(e,i){class t extends i{constructor(...i){super(...i),e(this)}}return{F:t,d:[{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"includeLastUsed",value:()=>!1},{kind:"field",decorators:[(0,d.SB)()],key:"_pipelines",value:void 0},{kind:"field",decorators:[(0,d.SB)()],key:"_preferredPipeline",value:()=>null},{kind:"get",key:"_default",value:function(){return this.includeLastUsed?h:u}},{kind:"method",key:"render",value:function(){var e,i;if(!this._pipelines)return s.Ld;const t=null!==(e=this.value)&&void 0!==e?e:this._default;return s.dy` <ha-select .label="${this.label||this.hass.localize("ui.components.pipeline-picker.pipeline")}" .value="${t}" .required="${this.required}" .disabled="${this.disabled}" @selected="${this._changed}" @closed="${r.U}" fixedMenuPosition naturalMenuWidth> ${this.includeLastUsed?s.dy` <ha-list-item .value="${h}"> ${this.hass.localize("ui.components.pipeline-picker.last_used")} </ha-list-item> `:null} <ha-list-item .value="${u}"> ${this.hass.localize("ui.components.pipeline-picker.preferred",{preferred:null===(i=this._pipelines.find((e=>e.id===this._preferredPipeline)))||void 0===i?void 0:i.name})} </ha-list-item> ${this._pipelines.map((e=>s.dy`<ha-list-item .value="${e.id}"> ${e.name} (${(0,c.u)(e.language,this.hass.locale)}) </ha-list-item>`))} </ha-select> `}},{kind:"method",key:"firstUpdated",value:function(e){var i;(0,a.Z)((0,n.Z)(t.prototype),"firstUpdated",this).call(this,e),(i=this.hass,i.callWS({type:"assist_pipeline/pipeline/list"})).then((e=>{this._pipelines=e.pipelines,this._preferredPipeline=e.preferred_pipeline}))}},{kind:"get",static:!0,key:"styles",value:function(){return s.iv`ha-select{width:100%}`}},{kind:"method",key:"_changed",value:function(e){const i=e.target;!this.hass||""===i.value||i.value===this.value||void 0===this.value&&i.value===this._default||(this.value=i.value===this._default?void 0:i.value,(0,o.B)(this,"value-changed",{value:this.value}))}}]}}),s.oi)},71133:(e,i,t)=>{var l=t(309),a=t(34541),n=t(47838),s=t(49412),d=t(3762),o=t(5095),r=t(95260),c=t(72218),u=t(2537);t(54371);(0,l.Z)([(0,r.Mo)("ha-select")],(function(e,i){class t extends i{constructor(...i){super(...i),e(this)}}return{F:t,d:[{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:()=>!1},{kind:"method",key:"render",value:function(){return o.dy` ${(0,a.Z)((0,n.Z)(t.prototype),"render",this).call(this)} ${this.clearable&&!this.required&&!this.disabled&&this.value?o.dy`<ha-icon-button label="clear" @click="${this._clearValue}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}"></ha-icon-button>`:o.Ld} `}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?o.dy`<span class="mdc-select__icon"><slot name="icon"></slot></span>`:o.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,a.Z)((0,n.Z)(t.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,a.Z)((0,n.Z)(t.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value(){return(0,c.D)((async()=>{await(0,u.y)(),this.layoutOptions()}),500)}},{kind:"field",static:!0,key:"styles",value:()=>[d.W,o.iv`:host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}`]}]}}),s.K)},75059:(e,i,t)=>{t.r(i),t.d(i,{HaAssistPipelineSelector:()=>s});var l=t(309),a=t(5095),n=t(95260);t(95352);let s=(0,l.Z)([(0,n.Mo)("ha-selector-assist_pipeline")],(function(e,i){return{F:class extends i{constructor(...i){super(...i),e(this)}},d:[{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,n.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,n.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"method",key:"render",value:function(){var e;return a.dy` <ha-assist-pipeline-picker .hass="${this.hass}" .value="${this.value}" .label="${this.label}" .helper="${this.helper}" .disabled="${this.disabled}" .required="${this.required}" .includeLastUsed="${Boolean(null===(e=this.selector.assist_pipeline)||void 0===e?void 0:e.include_last_used)}"></ha-assist-pipeline-picker> `}},{kind:"field",static:!0,key:"styles",value:()=>a.iv`ha-conversation-agent-picker{width:100%}`}]}}),a.oi)}};
+//# sourceMappingURL=5059.yurizgOaYzQ.js.map
\ No newline at end of file
@@ -0,0 +1,5 @@
+export const id=512;export const ids=[512,8664];export const modules={58135:(e,t,i)=>{i.d(t,{z:()=>o});const o=e=>(t,i)=>e.includes(t,i)},27959:(e,t,i)=>{i.d(t,{c:()=>o});const o=e=>{if(void 0===e)return;if("object"!=typeof e){if("string"==typeof e||isNaN(e)){const t=(null==e?void 0:e.toString().split(":"))||[];if(1===t.length)return{seconds:Number(t[0])};if(t.length>3)return;const i=Number(t[2])||0,o=Math.floor(i);return{hours:Number(t[0])||0,minutes:Number(t[1])||0,seconds:o,milliseconds:Math.floor(1e3*(i-o))}}return{seconds:e}}if(!("days"in e))return e;const{days:t,minutes:i,seconds:o,milliseconds:n}=e;let a=e.hours||0;return a=(a||0)+24*(t||0),{hours:a,minutes:i,seconds:o,milliseconds:n}}},57128:(e,t,i)=>{i.a(e,(async(e,o)=>{try{i.d(t,{L:()=>r});var n=i(23216),a=e([n]);n=(a.then?(await a)():a)[0];const s=e=>e<10?`0${e}`:e,r=(e,t)=>{const i=t.days||0,o=t.hours||0,n=t.minutes||0,a=t.seconds||0,r=t.milliseconds||0;return i>0?`${Intl.NumberFormat(e.language,{style:"unit",unit:"day",unitDisplay:"long"}).format(i)} ${o}:${s(n)}:${s(a)}`:o>0?`${o}:${s(n)}:${s(a)}`:n>0?`${n}:${s(a)}`:a>0?Intl.NumberFormat(e.language,{style:"unit",unit:"second",unitDisplay:"long"}).format(a):r>0?Intl.NumberFormat(e.language,{style:"unit",unit:"millisecond",unitDisplay:"long"}).format(r):null};o()}catch(e){o(e)}}))},93312:(e,t,i)=>{i.d(t,{Z:()=>n});const o=e=>e<10?`0${e}`:e;function n(e){const t=Math.floor(e/3600),i=Math.floor(e%3600/60),n=Math.floor(e%3600%60);return t>0?`${t}:${o(i)}:${o(n)}`:i>0?`${i}:${o(n)}`:n>0?""+n:null}},3747:(e,t,i)=>{i.d(t,{t:()=>a});class o{constructor(e=window.localStorage){this.storage=void 0,this._storage={},this._listeners={},this.storage=e,e===window.localStorage&&window.addEventListener("storage",(e=>{e.key&&this.hasKey(e.key)&&(this._storage[e.key]=e.newValue?JSON.parse(e.newValue):e.newValue,this._listeners[e.key]&&this._listeners[e.key].forEach((t=>t(e.oldValue?JSON.parse(e.oldValue):e.oldValue,this._storage[e.key]))))}))}addFromStorage(e){if(!this._storage[e]){const t=this.storage.getItem(e);t&&(this._storage[e]=JSON.parse(t))}}subscribeChanges(e,t){return this._listeners[e]?this._listeners[e].push(t):this._listeners[e]=[t],()=>{this.unsubscribeChanges(e,t)}}unsubscribeChanges(e,t){if(!(e in this._listeners))return;const i=this._listeners[e].indexOf(t);-1!==i&&this._listeners[e].splice(i,1)}hasKey(e){return e in this._storage}getValue(e){return this._storage[e]}setValue(e,t){const i=this._storage[e];this._storage[e]=t;try{void 0===t?this.storage.removeItem(e):this.storage.setItem(e,JSON.stringify(t))}catch(e){}finally{this._listeners[e]&&this._listeners[e].forEach((e=>e(i,t)))}}}const n={},a=e=>t=>{const i=e.storage||"localStorage";let a;i&&i in n?a=n[i]:(a=new o(window[i]),n[i]=a);const s=String(t.key),r=e.key||String(t.key),l=t.initializer?t.initializer():void 0;a.addFromStorage(r);const d=!1!==e.subscribe?e=>a.subscribeChanges(r,((i,o)=>{e.requestUpdate(t.key,i)})):void 0,c=()=>a.hasKey(r)?a.getValue(r):l;return{kind:"method",placement:"prototype",key:t.key,descriptor:{set(i){((i,o)=>{let n;e.state&&(n=c()),a.setValue(r,o),e.state&&i.requestUpdate(t.key,n)})(this,i)},get:()=>c(),enumerable:!0,configurable:!0},finisher(i){if(e.state&&e.subscribe){const e=i.prototype.connectedCallback,t=i.prototype.disconnectedCallback;i.prototype.connectedCallback=function(){e.call(this),this[`__unbsubLocalStorage${s}`]=null==d?void 0:d(this)},i.prototype.disconnectedCallback=function(){var e;t.call(this),null===(e=this[`__unbsubLocalStorage${s}`])||void 0===e||e.call(this),this[`__unbsubLocalStorage${s}`]=void 0}}e.state&&i.createProperty(t.key,{noAccessor:!0,...e.stateOptions})}}}},91131:(e,t,i)=>{i.d(t,{t:()=>o});const o=e=>"latitude"in e.attributes&&"longitude"in e.attributes},58664:(e,t,i)=>{i.d(t,{v:()=>a});var o=i(21157),n=i(36655);function a(e,t){const i=(0,n.M)(e.entity_id),a=void 0!==t?t:null==e?void 0:e.state;if(["button","event","input_button","scene"].includes(i))return a!==o.nZ;if((0,o.rk)(a))return!1;if(a===o.PX&&"alert"!==i)return!1;switch(i){case"alarm_control_panel":return"disarmed"!==a;case"alert":return"idle"!==a;case"cover":case"valve":return"closed"!==a;case"device_tracker":case"person":return"not_home"!==a;case"lawn_mower":return["mowing","error"].includes(a);case"lock":return"locked"!==a;case"media_player":return"standby"!==a;case"vacuum":return!["idle","docked","paused"].includes(a);case"plant":return"problem"===a;case"group":return["on","home","open","locked","problem"].includes(a);case"timer":return"active"===a;case"camera":return"streaming"===a}return!0}},86603:(e,t,i)=>{i.a(e,(async(e,o)=>{try{i.d(t,{u:()=>l,z:()=>r});var n=i(14516),a=i(23216),s=e([a]);a=(s.then?(await s)():s)[0];const r=(e,t)=>d(e).format(t),l=(e,t)=>c(e).format(t),d=(0,n.Z)((e=>new Intl.ListFormat(e.language,{style:"long",type:"conjunction"}))),c=(0,n.Z)((e=>new Intl.ListFormat(e.language,{style:"long",type:"disjunction"})));o()}catch(e){o(e)}}))},92482:(e,t,i)=>{i.d(t,{p:()=>n});var o=i(38768);const n=(e,t)=>{if(!(t instanceof o.DD))return{warnings:[t.message],errors:void 0};const i=[],n=[];for(const o of t.failures())if(void 0===o.value)i.push(e.localize("ui.errors.config.key_missing",{key:o.path.join(".")}));else if("never"===o.type)n.push(e.localize("ui.errors.config.key_not_expected",{key:o.path.join(".")}));else{if("union"===o.type)continue;"enums"===o.type?n.push(e.localize("ui.errors.config.key_wrong_type",{key:o.path.join("."),type_correct:o.message.replace("Expected ","").split(", ")[0],type_wrong:JSON.stringify(o.value)})):n.push(e.localize("ui.errors.config.key_wrong_type",{key:o.path.join("."),type_correct:o.refinement||o.type,type_wrong:JSON.stringify(o.value)}))}return{warnings:n,errors:i}}},7748:(e,t,i)=>{i.d(t,{g:()=>y});var o=i(309),n=i(34541),a=i(47838),s=i(22264),r=(i(44577),i(5095)),l=i(95260),d=i(18394),c=i(38149),u=i(25917);i(71133);const h="NO_AUTOMATION",f="UNKNOWN_AUTOMATION";let y=(0,o.Z)(null,(function(e,t){class i extends t{constructor(t,i,o){super(),e(this),this._localizeDeviceAutomation=t,this._fetchDeviceAutomations=i,this._createNoAutomation=o}}return{F:i,d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"deviceId",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_automations",value:()=>[]},{kind:"field",decorators:[(0,l.SB)()],key:"_renderEmpty",value:()=>!1},{kind:"field",decorators:[(0,l.SB)(),(0,s.F)({context:c.we,subscribe:!0})],key:"_entityReg",value:void 0},{kind:"get",key:"NO_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.actions.no_actions")}},{kind:"get",key:"UNKNOWN_AUTOMATION_TEXT",value:function(){return this.hass.localize("ui.panel.config.devices.automation.actions.unknown_action")}},{kind:"field",key:"_localizeDeviceAutomation",value:void 0},{kind:"field",key:"_fetchDeviceAutomations",value:void 0},{kind:"field",key:"_createNoAutomation",value:void 0},{kind:"get",key:"_value",value:function(){if(!this.value)return"";if(!this._automations.length)return h;const e=this._automations.findIndex((e=>(0,u.hH)(this._entityReg,e,this.value)));return-1===e?f:`${this._automations[e].device_id}_${e}`}},{kind:"method",key:"render",value:function(){if(this._renderEmpty)return r.Ld;const e=this._value;return r.dy` <ha-select .label="${this.label}" .value="${e}" @selected="${this._automationChanged}" .disabled="${0===this._automations.length}"> ${e===h?r.dy`<mwc-list-item .value="${h}"> ${this.NO_AUTOMATION_TEXT} </mwc-list-item>`:""} ${e===f?r.dy`<mwc-list-item .value="${f}"> ${this.UNKNOWN_AUTOMATION_TEXT} </mwc-list-item>`:""} ${this._automations.map(((e,t)=>r.dy` <mwc-list-item .value="${`${e.device_id}_${t}`}"> ${this._localizeDeviceAutomation(this.hass,this._entityReg,e)} </mwc-list-item> `))} </ha-select> `}},{kind:"method",key:"updated",value:function(e){(0,n.Z)((0,a.Z)(i.prototype),"updated",this).call(this,e),e.has("deviceId")&&this._updateDeviceInfo()}},{kind:"method",key:"_updateDeviceInfo",value:async function(){this._automations=this.deviceId?(await this._fetchDeviceAutomations(this.hass,this.deviceId)).sort(u.h6):[],this.value&&this.value.device_id===this.deviceId||this._setValue(this._automations.length?this._automations[0]:this._createNoAutomation(this.deviceId)),this._renderEmpty=!0,await this.updateComplete,this._renderEmpty=!1}},{kind:"method",key:"_automationChanged",value:function(e){const t=e.target.value;if(!t||[f,h].includes(t))return;const[i,o]=t.split("_"),n=this._automations[o];n.device_id===i&&this._setValue(n)}},{kind:"method",key:"_setValue",value:function(e){if(this.value&&(0,u.hH)(this._entityReg,e,this.value))return;const t={...e};delete t.metadata,(0,d.B)(this,"value-changed",{value:t})}},{kind:"get",static:!0,key:"styles",value:function(){return r.iv`ha-select{display:block}`}}]}}),r.oi)},27056:(e,t,i)=>{var o=i(309),n=i(5095),a=i(95260),s=i(14516),r=i(18394),l=i(36655),d=i(28858),c=i(1913),u=i(16061);i(16591),i(90532);const h=e=>n.dy`<ha-list-item .twoline="${!!e.area}"> <span>${e.name}</span> <span slot="secondary">${e.area}</span> </ha-list-item>`;(0,o.Z)([(0,a.Mo)("ha-device-picker")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"exclude-devices"})],key:"excludeDevices",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"deviceFilter",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,a.SB)()],key:"_opened",value:void 0},{kind:"field",decorators:[(0,a.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"field",key:"_init",value:()=>!1},{kind:"field",key:"_getDevices",value(){return(0,s.Z)(((e,t,i,o,n,a,s,r,c)=>{if(!e.length)return[{id:"no_devices",area:"",name:this.hass.localize("ui.components.device-picker.no_devices"),strings:[]}];let h={};(o||n||a||r)&&(h=(0,u.R6)(i));let f=e.filter((e=>e.id===this.value||!e.disabled_by));o&&(f=f.filter((e=>{const t=h[e.id];return!(!t||!t.length)&&h[e.id].some((e=>o.includes((0,l.M)(e.entity_id))))}))),n&&(f=f.filter((e=>{const t=h[e.id];return!t||!t.length||i.every((e=>!n.includes((0,l.M)(e.entity_id))))}))),c&&(f=f.filter((e=>!c.includes(e.id)))),a&&(f=f.filter((e=>{const t=h[e.id];return!(!t||!t.length)&&h[e.id].some((e=>{const t=this.hass.states[e.entity_id];return!!t&&(t.attributes.device_class&&a.includes(t.attributes.device_class))}))}))),r&&(f=f.filter((e=>{const t=h[e.id];return!(!t||!t.length)&&t.some((e=>{const t=this.hass.states[e.entity_id];return!!t&&r(t)}))}))),s&&(f=f.filter((e=>e.id===this.value||s(e))));const y=f.map((e=>{const i=(0,u.jL)(e,this.hass,h[e.id]);return{id:e.id,name:i,area:e.area_id&&t[e.area_id]?t[e.area_id].name:this.hass.localize("ui.components.device-picker.no_area"),strings:[i||""]}}));return y.length?1===y.length?y:y.sort(((e,t)=>(0,d.$)(e.name||"",t.name||"",this.hass.locale.language))):[{id:"no_devices",area:"",name:this.hass.localize("ui.components.device-picker.no_match"),strings:[]}]}))}},{kind:"method",key:"open",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.open())}},{kind:"method",key:"focus",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.focus())}},{kind:"method",key:"updated",value:function(e){if(!this._init&&this.hass||this._init&&e.has("_opened")&&this._opened){this._init=!0;const e=this._getDevices(Object.values(this.hass.devices),this.hass.areas,Object.values(this.hass.entities),this.includeDomains,this.excludeDomains,this.includeDeviceClasses,this.deviceFilter,this.entityFilter,this.excludeDevices);this.comboBox.items=e,this.comboBox.filteredItems=e}}},{kind:"method",key:"render",value:function(){return n.dy` <ha-combo-box .hass="${this.hass}" .label="${void 0===this.label&&this.hass?this.hass.localize("ui.components.device-picker.device"):this.label}" .value="${this._value}" .helper="${this.helper}" .renderer="${h}" .disabled="${this.disabled}" .required="${this.required}" item-id-path="id" item-value-path="id" item-label-path="name" @opened-changed="${this._openedChanged}" @value-changed="${this._deviceChanged}" @filter-changed="${this._filterChanged}"></ha-combo-box> `}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_filterChanged",value:function(e){const t=e.target,i=e.detail.value.toLowerCase();t.filteredItems=i.length?(0,c.q)(i,t.items||[]):t.items}},{kind:"method",key:"_deviceChanged",value:function(e){e.stopPropagation();let t=e.detail.value;"no_devices"===t&&(t=""),t!==this._value&&this._setValue(t)}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_setValue",value:function(e){this.value=e,setTimeout((()=>{(0,r.B)(this,"value-changed",{value:e}),(0,r.B)(this,"change")}),0)}}]}}),n.oi)},91998:(e,t,i)=>{var o=i(309),n=(i(90532),i(5095)),a=i(95260),s=i(14516),r=i(18394),l=i(36655),d=i(2733),c=i(1913),u=(i(16591),i(54371),i(37662),i(75868),i(28858));(0,o.Z)([(0,a.Mo)("ha-entity-picker")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"autofocus",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,attribute:"allow-custom-entity"})],key:"allowCustomEntity",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"include-unit-of-measurement"})],key:"includeUnitOfMeasurement",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"include-entities"})],key:"includeEntities",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Array,attribute:"exclude-entities"})],key:"excludeEntities",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"hideClearIcon",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({attribute:"item-label-path"})],key:"itemLabelPath",value:()=>"friendly_name"},{kind:"field",decorators:[(0,a.SB)()],key:"_opened",value:()=>!1},{kind:"field",decorators:[(0,a.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"open",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.open())}},{kind:"method",key:"focus",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.focus())}},{kind:"field",key:"_initedStates",value:()=>!1},{kind:"field",key:"_states",value:()=>[]},{kind:"field",key:"_rowRenderer",value(){return e=>n.dy`<ha-list-item graphic="avatar" .twoline="${!!e.entity_id}"> ${e.state?n.dy`<state-badge slot="graphic" .stateObj="${e}" .hass="${this.hass}"></state-badge>`:""} <span>${e.friendly_name}</span> <span slot="secondary">${e.entity_id}</span> </ha-list-item>`}},{kind:"field",key:"_getStates",value(){return(0,s.Z)(((e,t,i,o,n,a,s,r,c)=>{let h=[];if(!t)return[];let f=Object.keys(t.states);return f.length?r?(f=f.filter((e=>this.includeEntities.includes(e))),f.map((e=>{const i=(0,d.C)(t.states[e])||e;return{...t.states[e],friendly_name:i,strings:[e,i]}})).sort(((e,t)=>(0,u.f)(e.friendly_name,t.friendly_name,this.hass.locale.language)))):(c&&(f=f.filter((e=>!c.includes(e)))),i&&(f=f.filter((e=>i.includes((0,l.M)(e))))),o&&(f=f.filter((e=>!o.includes((0,l.M)(e))))),h=f.map((e=>{const i=(0,d.C)(t.states[e])||e;return{...t.states[e],friendly_name:i,strings:[e,i]}})).sort(((e,t)=>(0,u.f)(e.friendly_name,t.friendly_name,this.hass.locale.language))),a&&(h=h.filter((e=>e.entity_id===this.value||e.attributes.device_class&&a.includes(e.attributes.device_class)))),s&&(h=h.filter((e=>e.entity_id===this.value||e.attributes.unit_of_measurement&&s.includes(e.attributes.unit_of_measurement)))),n&&(h=h.filter((e=>e.entity_id===this.value||n(e)))),h.length?h:[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_match"),attributes:{friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_match"),icon:"mdi:magnify"},strings:[]}]):[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_entities"),attributes:{friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_entities"),icon:"mdi:magnify"},strings:[]}]}))}},{kind:"method",key:"shouldUpdate",value:function(e){return!!(e.has("value")||e.has("label")||e.has("disabled"))||!(!e.has("_opened")&&this._opened)}},{kind:"method",key:"willUpdate",value:function(e){(!this._initedStates||e.has("_opened")&&this._opened)&&(this._states=this._getStates(this._opened,this.hass,this.includeDomains,this.excludeDomains,this.entityFilter,this.includeDeviceClasses,this.includeUnitOfMeasurement,this.includeEntities,this.excludeEntities),this._initedStates&&(this.comboBox.filteredItems=this._states),this._initedStates=!0)}},{kind:"method",key:"render",value:function(){return n.dy` <ha-combo-box item-value-path="entity_id" .itemLabelPath="${this.itemLabelPath}" .hass="${this.hass}" .value="${this._value}" .label="${void 0===this.label?this.hass.localize("ui.components.entity.entity-picker.entity"):this.label}" .helper="${this.helper}" .allowCustomValue="${this.allowCustomEntity}" .filteredItems="${this._states}" .renderer="${this._rowRenderer}" .required="${this.required}" .disabled="${this.disabled}" @opened-changed="${this._openedChanged}" @value-changed="${this._valueChanged}" @filter-changed="${this._filterChanged}"> </ha-combo-box> `}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();const t=e.detail.value;t!==this._value&&this._setValue(t)}},{kind:"method",key:"_filterChanged",value:function(e){const t=e.target,i=e.detail.value.toLowerCase();t.filteredItems=i.length?(0,c.q)(i,this._states):this._states}},{kind:"method",key:"_setValue",value:function(e){this.value=e,setTimeout((()=>{(0,r.B)(this,"value-changed",{value:e}),(0,r.B)(this,"change")}),0)}}]}}),n.oi)},92295:(e,t,i)=>{var o=i(309),n=i(14271),a=i(5095),s=i(95260),r=i(3712);(0,o.Z)([(0,s.Mo)("ha-button")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[r.W,a.iv`::slotted([slot=icon]){margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction);display:block}.mdc-button{height:var(--button-height,36px)}.trailing-icon{display:flex}.slot-container{overflow:var(--button-slot-container-overflow,visible)}`]}]}}),n.z)},68336:(e,t,i)=>{var o=i(309),n=i(5095),a=i(95260);(0,o.Z)([(0,a.Mo)("ha-card")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,a.Cb)()],key:"header",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,reflect:!0})],key:"raised",value:()=>!1},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`:host{background:var(--ha-card-background,var(--card-background-color,#fff));box-shadow:var(--ha-card-box-shadow,none);box-sizing:border-box;border-radius:var(--ha-card-border-radius,12px);border-width:var(--ha-card-border-width,1px);border-style:solid;border-color:var(--ha-card-border-color,var(--divider-color,#e0e0e0));color:var(--primary-text-color);display:block;transition:all .3s ease-out;position:relative}:host([raised]){border:none;box-shadow:var(--ha-card-box-shadow,0px 2px 1px -1px rgba(0,0,0,.2),0px 1px 1px 0px rgba(0,0,0,.14),0px 1px 3px 0px rgba(0,0,0,.12))}.card-header,:host ::slotted(.card-header){color:var(--ha-card-header-color,--primary-text-color);font-family:var(--ha-card-header-font-family, inherit);font-size:var(--ha-card-header-font-size, 24px);letter-spacing:-.012em;line-height:48px;padding:12px 16px 16px;display:block;margin-block-start:0px;margin-block-end:0px;font-weight:400}:host ::slotted(.card-content:not(:first-child)),slot:not(:first-child)::slotted(.card-content){padding-top:0px;margin-top:-8px}:host ::slotted(.card-content){padding:16px}:host ::slotted(.card-actions){border-top:1px solid var(--divider-color,#e8e8e8);padding:5px 16px}`}},{kind:"method",key:"render",value:function(){return n.dy` ${this.header?n.dy`<h1 class="card-header">${this.header}</h1>`:n.Ld} <slot></slot> `}}]}}),n.oi)},31360:(e,t,i)=>{var o=i(309),n=i(34541),a=i(47838),s=i(5095),r=i(95260),l=i(53180),d=i(18394),c=i(2537);i(37662);const u="M7.41,8.58L12,13.17L16.59,8.58L18,10L12,16L6,10L7.41,8.58Z";(0,o.Z)([(0,r.Mo)("ha-expansion-panel")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"expanded",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"outlined",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"leftChevron",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)()],key:"header",value:void 0},{kind:"field",decorators:[(0,r.Cb)()],key:"secondary",value:void 0},{kind:"field",decorators:[(0,r.SB)()],key:"_showContent",value(){return this.expanded}},{kind:"field",decorators:[(0,r.IO)(".container")],key:"_container",value:void 0},{kind:"method",key:"render",value:function(){return s.dy` <div class="top ${(0,l.$)({expanded:this.expanded})}"> <div id="summary" @click="${this._toggleContainer}" @keydown="${this._toggleContainer}" @focus="${this._focusChanged}" @blur="${this._focusChanged}" role="button" tabindex="0" aria-expanded="${this.expanded}" aria-controls="sect1"> ${this.leftChevron?s.dy` <ha-svg-icon .path="${u}" class="summary-icon ${(0,l.$)({expanded:this.expanded})}"></ha-svg-icon> `:""} <slot name="header"> <div class="header"> ${this.header} <slot class="secondary" name="secondary">${this.secondary}</slot> </div> </slot> ${this.leftChevron?"":s.dy` <ha-svg-icon .path="${u}" class="summary-icon ${(0,l.$)({expanded:this.expanded})}"></ha-svg-icon> `} </div> <slot name="icons"></slot> </div> <div class="container ${(0,l.$)({expanded:this.expanded})}" @transitionend="${this._handleTransitionEnd}" role="region" aria-labelledby="summary" aria-hidden="${!this.expanded}" tabindex="-1"> ${this._showContent?s.dy`<slot></slot>`:""} </div> `}},{kind:"method",key:"willUpdate",value:function(e){(0,n.Z)((0,a.Z)(i.prototype),"willUpdate",this).call(this,e),e.has("expanded")&&this.expanded&&(this._showContent=this.expanded,setTimeout((()=>{this.expanded&&(this._container.style.overflow="initial")}),300))}},{kind:"method",key:"_handleTransitionEnd",value:function(){this._container.style.removeProperty("height"),this._container.style.overflow=this.expanded?"initial":"hidden",this._showContent=this.expanded}},{kind:"method",key:"_toggleContainer",value:async function(e){if(e.defaultPrevented)return;if("keydown"===e.type&&"Enter"!==e.key&&" "!==e.key)return;e.preventDefault();const t=!this.expanded;(0,d.B)(this,"expanded-will-change",{expanded:t}),this._container.style.overflow="hidden",t&&(this._showContent=!0,await(0,c.y)());const i=this._container.scrollHeight;this._container.style.height=`${i}px`,t||setTimeout((()=>{this._container.style.height="0px"}),0),this.expanded=t,(0,d.B)(this,"expanded-changed",{expanded:this.expanded})}},{kind:"method",key:"_focusChanged",value:function(e){this.shadowRoot.querySelector(".top").classList.toggle("focused","focus"===e.type)}},{kind:"get",static:!0,key:"styles",value:function(){return s.iv`:host{display:block}.top{display:flex;align-items:center;border-radius:var(--ha-card-border-radius,12px)}.top.expanded{border-bottom-left-radius:0px;border-bottom-right-radius:0px}.top.focused{background:var(--input-fill-color)}:host([outlined]){box-shadow:none;border-width:1px;border-style:solid;border-color:var(--outline-color);border-radius:var(--ha-card-border-radius,12px)}.summary-icon{margin-left:8px}:host([leftchevron]) .summary-icon{margin-left:0;margin-right:8px}#summary{flex:1;display:flex;padding:var(--expansion-panel-summary-padding,0 8px);min-height:48px;align-items:center;cursor:pointer;overflow:hidden;font-weight:500;outline:0}.summary-icon{transition:transform 150ms cubic-bezier(.4, 0, .2, 1);direction:var(--direction)}.summary-icon.expanded{transform:rotate(180deg)}.header,::slotted([slot=header]){flex:1}.container{padding:var(--expansion-panel-content-padding,0 8px);overflow:hidden;transition:height .3s cubic-bezier(.4, 0, .2, 1);height:0px}.container.expanded{height:auto}.secondary{display:block;color:var(--secondary-text-color);font-size:12px}`}}]}}),s.oi)},42308:(e,t,i)=>{var o=i(309),n=i(34541),a=i(47838),s=i(5095),r=i(95260),l=i(18394);(0,o.Z)([(0,r.Mo)("ha-sortable")],(function(e,t){class o extends t{constructor(...t){super(...t),e(this)}}return{F:o,d:[{kind:"field",key:"_sortable",value:void 0},{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"path",value:void 0},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,attribute:"no-style"})],key:"noStyle",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:String,attribute:"draggable-selector"})],key:"draggableSelector",value:void 0},{kind:"field",decorators:[(0,r.Cb)({type:String,attribute:"handle-selector"})],key:"handleSelector",value:void 0},{kind:"field",decorators:[(0,r.Cb)({type:String,attribute:"group"})],key:"group",value:void 0},{kind:"method",key:"updated",value:function(e){e.has("disabled")&&(this.disabled?this._destroySortable():this._createSortable())}},{kind:"field",key:"_shouldBeDestroy",value:()=>!1},{kind:"method",key:"disconnectedCallback",value:function(){(0,n.Z)((0,a.Z)(o.prototype),"disconnectedCallback",this).call(this),this._shouldBeDestroy=!0,setTimeout((()=>{this._shouldBeDestroy&&(this._destroySortable(),this._shouldBeDestroy=!1)}),1)}},{kind:"method",key:"connectedCallback",value:function(){(0,n.Z)((0,a.Z)(o.prototype),"connectedCallback",this).call(this),this._shouldBeDestroy=!1}},{kind:"method",key:"createRenderRoot",value:function(){return this}},{kind:"method",key:"render",value:function(){return this.noStyle?s.Ld:s.dy` <style>.sortable-fallback{display:none;opacity:0}.sortable-ghost{border:2px solid var(--primary-color);background:rgba(var(--rgb-primary-color),.25);border-radius:4px;opacity:.4}.sortable-drag{border-radius:4px;opacity:1;background:var(--card-background-color);box-shadow:0px 4px 8px 3px #00000026;cursor:grabbing}</style> `}},{kind:"method",key:"_createSortable",value:async function(){if(this._sortable)return;const e=this.children[0];if(!e)return;const t=(await Promise.all([i.e(6087),i.e(8697)]).then(i.bind(i,48697))).default,o={animation:150,swapThreshold:.75,onChoose:this._handleChoose,onEnd:this._handleEnd};this.draggableSelector&&(o.draggable=this.draggableSelector),this.handleSelector&&(o.handle=this.handleSelector),this.draggableSelector&&(o.draggable=this.draggableSelector),this.group&&(o.group=this.group),this._sortable=new t(e,o)}},{kind:"field",key:"_handleEnd",value(){return async e=>{e.item.placeholder&&(e.item.placeholder.replaceWith(e.item),delete e.item.placeholder);const t=e.oldIndex,i=e.from.parentElement.path,o=e.newIndex,n=e.to.parentElement.path;void 0===t||void 0===o||t===o&&(null==i?void 0:i.join("."))===(null==n?void 0:n.join("."))||(0,l.B)(this,"item-moved",{oldIndex:t,newIndex:o,oldPath:i,newPath:n})}}},{kind:"field",key:"_handleChoose",value:()=>e=>{e.item.placeholder=document.createComment("sort-placeholder"),e.item.after(e.item.placeholder)}},{kind:"method",key:"_destroySortable",value:function(){this._sortable&&(this._sortable.destroy(),this._sortable=void 0)}}]}}),s.oi)},99539:(e,t,i)=>{var o=i(309),n=i(34541),a=i(47838),s=i(89833),r=i(31338),l=i(96791),d=i(5095),c=i(95260),u=i(67684);(0,o.Z)([(0,c.Mo)("ha-textarea")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,c.Cb)({type:Boolean,reflect:!0})],key:"autogrow",value:()=>!1},{kind:"method",key:"firstUpdated",value:function(){(0,n.Z)((0,a.Z)(i.prototype),"firstUpdated",this).call(this),this.setAttribute("dir",u.E.document.dir)}},{kind:"method",key:"updated",value:function(e){(0,n.Z)((0,a.Z)(i.prototype),"updated",this).call(this,e),this.autogrow&&e.has("value")&&(this.mdcRoot.dataset.value=this.value+'=​"')}},{kind:"field",static:!0,key:"styles",value:()=>[r.W,l.W,d.iv`:host([autogrow]) .mdc-text-field{position:relative;min-height:74px;min-width:178px;max-height:200px}:host([autogrow]) .mdc-text-field:after{content:attr(data-value);margin-top:23px;margin-bottom:9px;line-height:1.5rem;min-height:42px;padding:0px 32px 0 16px;letter-spacing:var(
+          --mdc-typography-subtitle1-letter-spacing,
+          .009375em
+        );visibility:hidden;white-space:pre-wrap}:host([autogrow]) .mdc-text-field__input{position:absolute;height:calc(100% - 32px)}:host([autogrow]) .mdc-text-field.mdc-text-field--no-label:after{margin-top:16px;margin-bottom:16px}:host([dir=rtl]) .mdc-floating-label{right:16px;left:initial}`]}]}}),s.O)},19418:(e,t,i)=>{i.d(t,{Gd:()=>o,J8:()=>a,Xm:()=>n});i(38480);const o=e=>{if("condition"in e&&Array.isArray(e.condition))return{condition:"and",conditions:e.condition};for(const t of["and","or","not"])if(t in e)return{condition:t,conditions:e[t]};return e};const n=(e,t,i,o)=>e.connection.subscribeMessage(t,{type:"subscribe_trigger",trigger:i,variables:o}),a=(e,t,i)=>e.callWS({type:"test_condition",condition:t,variables:i})},44553:(e,t,i)=>{i.a(e,(async(e,o)=>{try{i.d(t,{R:()=>b,m:()=>g});var n=i(4771),a=i(57128),s=i(91289),r=i(93312),l=i(73908),d=i(2733),c=i(23216),u=i(25917),h=i(86603),f=e([a,s,l,c,h]);[a,s,l,c,h]=f.then?(await f)():f;const y="ui.panel.config.automation.editor.triggers.type",p="ui.panel.config.automation.editor.conditions.type",v=(e,t)=>{let i;return i="number"==typeof t?(0,r.Z)(t):"string"==typeof t?t:(0,a.L)(e,t),i},m=(e,t,i)=>{const o=e.split(":");if(o.length<2||o.length>3)return e;try{const n=new Date("1970-01-01T"+e);return 2===o.length||0===Number(o[2])?(0,s.mr)(n,t,i):(0,s.Vu)(n,t,i)}catch(t){return e}},b=(e,t,i,o=!1)=>{try{return _(e,t,i,o)}catch(e){console.error(e);let t="Error in describing trigger";return e.message&&(t+=": "+e.message),t}},_=(e,t,i,o=!1)=>{if(e.alias&&!o)return e.alias;if("event"===e.platform&&e.event_type){const i=[];if(Array.isArray(e.event_type))for(const t of e.event_type.values())i.push(t);else i.push(e.event_type);const o=(0,h.u)(t.locale,i);return t.localize(`${y}.event.description.full`,{eventTypes:o})}if("homeassistant"===e.platform&&e.event)return t.localize("start"===e.event?`${y}.homeassistant.description.started`:`${y}.homeassistant.description.shutdown`);if("numeric_state"===e.platform&&e.entity_id){const i=[],o=t.states,n=Array.isArray(e.entity_id)?t.states[e.entity_id[0]]:t.states[e.entity_id];if(Array.isArray(e.entity_id))for(const t of e.entity_id.values())o[t]&&i.push((0,d.C)(o[t])||t);else e.entity_id&&i.push(o[e.entity_id]?(0,d.C)(o[e.entity_id]):e.entity_id);const a=e.attribute?(0,l.S)(t.localize,n,t.entities,e.attribute):void 0,s=e.for?v(t.locale,e.for):void 0;if(void 0!==e.above&&void 0!==e.below)return t.localize(`${y}.numeric_state.description.above-below`,{attribute:a,entity:(0,h.u)(t.locale,i),numberOfEntities:i.length,above:e.above,below:e.below,duration:s});if(void 0!==e.above)return t.localize(`${y}.numeric_state.description.above`,{attribute:a,entity:(0,h.u)(t.locale,i),numberOfEntities:i.length,above:e.above,duration:s});if(void 0!==e.below)return t.localize(`${y}.numeric_state.description.below`,{attribute:a,entity:(0,h.u)(t.locale,i),numberOfEntities:i.length,below:e.below,duration:s})}if("state"===e.platform){let i="When";const o=[],n=t.states;if(e.attribute){const o=Array.isArray(e.entity_id)?t.states[e.entity_id[0]]:t.states[e.entity_id];i+=` ${(0,l.S)(t.localize,o,t.entities,e.attribute)} of`}if(Array.isArray(e.entity_id))for(const t of e.entity_id.values())n[t]&&o.push((0,d.C)(n[t])||t);else e.entity_id&&o.push(n[e.entity_id]?(0,d.C)(n[e.entity_id]):e.entity_id);0===o.length&&o.push("something"),i+=` ${o} changes`;const a=t.states[Array.isArray(e.entity_id)?e.entity_id[0]:e.entity_id];if(void 0!==e.from)if(null===e.from)e.attribute||(i+=" from any state");else if(Array.isArray(e.from)){const o=[];for(const i of e.from.values())o.push(e.attribute?t.formatEntityAttributeValue(a,e.attribute,i).toString():t.formatEntityState(a,i));if(0!==o.length){i+=` from ${(0,h.u)(t.locale,o)}`}}else i+=` from ${e.attribute?t.formatEntityAttributeValue(a,e.attribute,e.from).toString():t.formatEntityState(a,e.from.toString()).toString()}`;if(void 0!==e.to)if(null===e.to)e.attribute||(i+=" to any state");else if(Array.isArray(e.to)){const o=[];for(const i of e.to.values())o.push(e.attribute?t.formatEntityAttributeValue(a,e.attribute,i).toString():t.formatEntityState(a,i).toString());if(0!==o.length){i+=` to ${(0,h.u)(t.locale,o)}`}}else i+=` to ${e.attribute?t.formatEntityAttributeValue(a,e.attribute,e.to).toString():t.formatEntityState(a,e.to.toString())}`;if(e.attribute||void 0!==e.from||void 0!==e.to||(i+=" state or any attributes"),e.for){const o=v(t.locale,e.for);o&&(i+=` for ${o}`)}return i}if("sun"===e.platform&&e.event){let i="";return e.offset&&(i="number"==typeof e.offset?(0,r.Z)(e.offset):"string"==typeof e.offset?e.offset:JSON.stringify(e.offset)),t.localize("sunset"===e.event?`${y}.sun.description.sets`:`${y}.sun.description.rises`,{hasDuration:""!==i?"true":"false",duration:i})}if("tag"===e.platform)return t.localize(`${y}.tag.description.full`);if("time"===e.platform&&e.at){const i=(0,n.r)(e.at).map((e=>"string"!=typeof e?e:e.includes(".")?`entity ${t.states[e]?(0,d.C)(t.states[e]):e}`:m(e,t.locale,t.config)));return t.localize(`${y}.time.description.full`,{time:(0,h.u)(t.locale,i)})}if("time_pattern"===e.platform){if(!e.seconds&&!e.minutes&&!e.hours)return t.localize(`${y}.time_pattern.description.initial`);const i=[];let o="other",n="other",a="other",s=0,r=0,l=0;if(void 0!==e.seconds){const t="*"===e.seconds,n="string"==typeof e.seconds&&e.seconds.startsWith("/");s=t?0:"number"==typeof e.seconds?e.seconds:n?parseInt(e.seconds.substring(1)):parseInt(e.seconds),(isNaN(s)||s>59||s<0||n&&0===s)&&i.push("seconds"),o=t||n&&1===s?"every":n?"every_interval":"on_the_xth"}if(void 0!==e.minutes){const t="*"===e.minutes,o="string"==typeof e.minutes&&e.minutes.startsWith("/");r=t?0:"number"==typeof e.minutes?e.minutes:o?parseInt(e.minutes.substring(1)):parseInt(e.minutes),(isNaN(r)||r>59||r<0||o&&0===r)&&i.push("minutes"),n=t||o&&1===r?"every":o?"every_interval":void 0!==e.seconds?"has_seconds":"on_the_xth"}else void 0!==e.seconds&&(void 0!==e.hours?(r=0,n="has_seconds"):n="every");if(void 0!==e.hours){const t="*"===e.hours,o="string"==typeof e.hours&&e.hours.startsWith("/");l=t?0:"number"==typeof e.hours?e.hours:o?parseInt(e.hours.substring(1)):parseInt(e.hours),(isNaN(l)||l>23||l<0||o&&0===l)&&i.push("hours"),a=t||o&&1===l?"every":o?"every_interval":void 0!==e.seconds||void 0!==e.minutes?"has_seconds_or_minutes":"on_the_xth"}else a="every";return 0!==i.length?t.localize(`${y}.time_pattern.description.invalid`,{parts:(0,h.z)(t.locale,i.map((e=>t.localize(`${y}.time_pattern.${e}`))))}):t.localize(`${y}.time_pattern.description.full`,{secondsChoice:o,minutesChoice:n,hoursChoice:a,seconds:s,minutes:r,hours:l,secondsWithOrdinal:t.localize(`${y}.time_pattern.description.ordinal`,{part:s}),minutesWithOrdinal:t.localize(`${y}.time_pattern.description.ordinal`,{part:r}),hoursWithOrdinal:t.localize(`${y}.time_pattern.description.ordinal`,{part:l})})}if("zone"===e.platform&&e.entity_id&&e.zone){const i=[],o=[],n=t.states;if(Array.isArray(e.entity_id))for(const t of e.entity_id.values())n[t]&&i.push((0,d.C)(n[t])||t);else i.push(n[e.entity_id]?(0,d.C)(n[e.entity_id]):e.entity_id);if(Array.isArray(e.zone))for(const t of e.zone.values())n[t]&&o.push((0,d.C)(n[t])||t);else o.push(n[e.zone]?(0,d.C)(n[e.zone]):e.zone);return t.localize(`${y}.zone.description.full`,{entity:(0,h.u)(t.locale,i),event:e.event.toString(),zone:(0,h.u)(t.locale,o),numberOfZones:o.length})}if("geo_location"===e.platform&&e.source&&e.zone){const i=[],o=[],n=t.states;if(Array.isArray(e.source))for(const t of e.source.values())i.push(t);else i.push(e.source);if(Array.isArray(e.zone))for(const t of e.zone.values())n[t]&&o.push((0,d.C)(n[t])||t);else o.push(n[e.zone]?(0,d.C)(n[e.zone]):e.zone);return t.localize(`${y}.geo_location.description.full`,{source:(0,h.u)(t.locale,i),event:e.event.toString(),zone:(0,h.u)(t.locale,o),numberOfZones:o.length})}if("mqtt"===e.platform)return t.localize(`${y}.mqtt.description.full`);if("template"===e.platform){let i="";var a;if(e.for)i=null!==(a=v(t.locale,e.for))&&void 0!==a?a:"";return t.localize(`${y}.template.description.full`,{hasDuration:""!==i?"true":"false",duration:i})}if("webhook"===e.platform)return t.localize(`${y}.webhook.description.full`);if("conversation"===e.platform)return e.command?t.localize(`${y}.conversation.description.full`,{sentence:(0,h.u)(t.locale,(0,n.r)(e.command).map((e=>`'${e}'`)))}):t.localize(`${y}.conversation.description.empty`);if("persistent_notification"===e.platform)return t.localize(`${y}.persistent_notification.description.full`);if("device"===e.platform&&e.device_id){const o=e,n=(0,u.KL)(t,i,o);if(n)return n;const a=t.states[o.entity_id];return`${a?(0,d.C)(a):o.entity_id} ${o.type}`}return t.localize(`ui.panel.config.automation.editor.triggers.type.${e.platform}.label`)||t.localize("ui.panel.config.automation.editor.triggers.unknown_trigger")},g=(e,t,i,o=!1)=>{try{return k(e,t,i,o)}catch(e){console.error(e);let t="Error in describing condition";return e.message&&(t+=": "+e.message),t}},k=(e,t,i,o=!1)=>{if(e.alias&&!o)return e.alias;if(!e.condition){const t=["and","or","not"];for(const i of t)i in e&&(0,n.r)(e[i])&&(e={condition:i,conditions:e[i]})}if("or"===e.condition){const i=(0,n.r)(e.conditions);if(!i||0===i.length)return t.localize(`${p}.or.description.no_conditions`);const o=i.length;return t.localize(`${p}.or.description.full`,{count:o})}if("and"===e.condition){const i=(0,n.r)(e.conditions);if(!i||0===i.length)return t.localize(`${p}.and.description.no_conditions`);const o=i.length;return t.localize(`${p}.and.description.full`,{count:o})}if("not"===e.condition){const i=(0,n.r)(e.conditions);return i&&0!==i.length?1===i.length?t.localize(`${p}.not.description.one_condition`):t.localize(`${p}.not.description.full`,{count:i.length}):t.localize(`${p}.not.description.no_conditions`)}if("state"===e.condition){if(!e.entity_id)return t.localize(`${p}.state.description.no_entity`);let i="";if(e.attribute){const o=Array.isArray(e.entity_id)?t.states[e.entity_id[0]]:t.states[e.entity_id];i=(0,l.S)(t.localize,o,t.entities,e.attribute)}const o=[];if(Array.isArray(e.entity_id))for(const i of e.entity_id.values())t.states[i]&&o.push((0,d.C)(t.states[i])||i);else e.entity_id&&o.push(t.states[e.entity_id]?(0,d.C)(t.states[e.entity_id]):e.entity_id);const n=[],a=t.states[Array.isArray(e.entity_id)?e.entity_id[0]:e.entity_id];if(Array.isArray(e.state))for(const i of e.state.values())n.push(e.attribute?t.formatEntityAttributeValue(a,e.attribute,i).toString():t.formatEntityState(a,i));else""!==e.state&&n.push(e.attribute?t.formatEntityAttributeValue(a,e.attribute,e.state).toString():t.formatEntityState(a,e.state.toString()));let s="";return e.for&&(s=v(t.locale,e.for)||""),t.localize(`${p}.state.description.full`,{hasAttribute:""!==i?"true":"false",attribute:i,numberOfEntities:o.length,entities:"any"===e.match?(0,h.u)(t.locale,o):(0,h.z)(t.locale,o),numberOfStates:n.length,states:(0,h.u)(t.locale,n),hasDuration:""!==s?"true":"false",duration:s})}if("numeric_state"===e.condition&&e.entity_id){const i=t.states[e.entity_id],o=i?(0,d.C)(i):e.entity_id,n=e.attribute?(0,l.S)(t.localize,i,t.entities,e.attribute):void 0;if(e.above&&e.below)return t.localize(`${p}.numeric_state.description.above-below`,{attribute:n,entity:o,above:e.above,below:e.below});if(e.above)return t.localize(`${p}.numeric_state.description.above`,{attribute:n,entity:o,above:e.above});if(e.below)return t.localize(`${p}.numeric_state.description.below`,{attribute:n,entity:o,below:e.below})}if("time"===e.condition){const i=(0,n.r)(e.weekday),o=i&&i.length>0&&i.length<7;if(e.before||e.after||o){const n="string"!=typeof e.before?e.before:e.before.includes(".")?`entity ${t.states[e.before]?(0,d.C)(t.states[e.before]):e.before}`:m(e.before,t.locale,t.config),a="string"!=typeof e.after?e.after:e.after.includes(".")?`entity ${t.states[e.after]?(0,d.C)(t.states[e.after]):e.after}`:m(e.after,t.locale,t.config);let s=[];o&&(s=i.map((e=>t.localize(`ui.panel.config.automation.editor.conditions.type.time.weekdays.${e}`))));let r="";return void 0!==a&&void 0!==n?r="after_before":void 0!==a?r="after":void 0!==n&&(r="before"),t.localize(`${p}.time.description.full`,{hasTime:r,hasTimeAndDay:(a||n)&&o?"true":"false",hasDay:o?"true":"false",time_before:n,time_after:a,day:(0,h.u)(t.locale,s)})}}if("sun"===e.condition&&("before"in e||"after"in e)){let t="Confirm";if(!e.after&&!e.before)return t+=" sun",t;if(t+=" sun",e.after){let i="";e.after_offset&&(i="number"==typeof e.after_offset?` offset by ${(0,r.Z)(e.after_offset)}`:"string"==typeof e.after_offset?` offset by ${e.after_offset}`:` offset by ${JSON.stringify(e.after_offset)}`),t+=` after ${e.after}${i}`}if(e.before){let i="";e.before_offset&&(i="number"==typeof e.before_offset?` offset by ${(0,r.Z)(e.before_offset)}`:"string"==typeof e.before_offset?` offset by ${e.before_offset}`:` offset by ${JSON.stringify(e.before_offset)}`),t+=` before ${e.before}${i}`}return t}if("zone"===e.condition&&e.entity_id&&e.zone){const i=[],o=[],n=t.states;if(Array.isArray(e.entity_id))for(const t of e.entity_id.values())n[t]&&i.push((0,d.C)(n[t])||t);else i.push(n[e.entity_id]?(0,d.C)(n[e.entity_id]):e.entity_id);if(Array.isArray(e.zone))for(const t of e.zone.values())n[t]&&o.push((0,d.C)(n[t])||t);else o.push(n[e.zone]?(0,d.C)(n[e.zone]):e.zone);const a=(0,h.u)(t.locale,i),s=(0,h.u)(t.locale,o);return t.localize(`${p}.zone.description.full`,{entity:a,numberOfEntities:i.length,zone:s,numberOfZones:o.length})}if("device"===e.condition&&e.device_id){const o=e,n=(0,u.b2)(t,i,o);if(n)return n;const a=t.states[o.entity_id];return`${a?(0,d.C)(a):o.entity_id} ${o.type}`}return"template"===e.condition?t.localize(`${p}.template.description.full`):"trigger"===e.condition&&null!=e.id?t.localize(`${p}.trigger.description.full`,{id:(0,h.u)(t.locale,(0,n.r)(e.id).map((e=>e.toString())))}):t.localize(`ui.panel.config.automation.editor.conditions.type.${e.condition}.label`)||t.localize("ui.panel.config.automation.editor.conditions.unknown_condition")};o()}catch(e){o(e)}}))},59449:(e,t,i)=>{i.d(t,{w:()=>o});const o=(e,t)=>e.callWS({type:"validate_config",...t})},38149:(e,t,i)=>{i.d(t,{we:()=>n});var o=i(45245);(0,o.k)("connection"),(0,o.k)("states"),(0,o.k)("entities"),(0,o.k)("devices"),(0,o.k)("areas"),(0,o.k)("localize"),(0,o.k)("locale"),(0,o.k)("config"),(0,o.k)("themes"),(0,o.k)("selectedTheme"),(0,o.k)("user"),(0,o.k)("userData"),(0,o.k)("panels");const n=(0,o.k)("extendedEntities")},25917:(e,t,i)=>{i.d(t,{AG:()=>a,Gg:()=>s,KL:()=>m,_2:()=>p,_K:()=>l,b2:()=>v,dA:()=>d,h6:()=>b,hA:()=>c,hH:()=>h,r3:()=>r});var o=i(2733),n=i(15306);const a=(e,t)=>e.callWS({type:"device_automation/action/list",device_id:t}),s=(e,t)=>e.callWS({type:"device_automation/condition/list",device_id:t}),r=(e,t)=>e.callWS({type:"device_automation/trigger/list",device_id:t}),l=(e,t)=>e.callWS({type:"device_automation/action/capabilities",action:t}),d=(e,t)=>e.callWS({type:"device_automation/condition/capabilities",condition:t}),c=(e,t)=>e.callWS({type:"device_automation/trigger/capabilities",trigger:t}),u=["device_id","domain","entity_id","type","subtype","event","condition","platform"],h=(e,t,i)=>{if(typeof t!=typeof i)return!1;for(const a in t){var o,n;if(u.includes(a))if("entity_id"!==a||(null===(o=t[a])||void 0===o?void 0:o.includes("."))===(null===(n=i[a])||void 0===n?void 0:n.includes("."))){if(!Object.is(t[a],i[a]))return!1}else if(!f(e,t[a],i[a]))return!1}for(const o in i){var a,s;if(u.includes(o))if("entity_id"!==o||(null===(a=t[o])||void 0===a?void 0:a.includes("."))===(null===(s=i[o])||void 0===s?void 0:s.includes("."))){if(!Object.is(t[o],i[o]))return!1}else if(!f(e,t[o],i[o]))return!1}return!0},f=(e,t,i)=>!(!t||!i)&&(t.includes(".")&&(t=(0,n.w1)(e)[t].id),i.includes(".")&&(i=(0,n.w1)(e)[i].id),t===i),y=(e,t,i)=>{if(!i)return"<unknown entity>";if(i.includes(".")){const t=e.states[i];return t?(0,o.C)(t):i}const a=(0,n.Mw)(t)[i];return a?(0,n.vA)(e,a)||i:"<unknown entity>"},p=(e,t,i)=>e.localize(`component.${i.domain}.device_automation.action_type.${i.type}`,{entity_name:y(e,t,i.entity_id),subtype:i.subtype?e.localize(`component.${i.domain}.device_automation.action_subtype.${i.subtype}`)||i.subtype:""})||(i.subtype?`"${i.subtype}" ${i.type}`:i.type),v=(e,t,i)=>e.localize(`component.${i.domain}.device_automation.condition_type.${i.type}`,{entity_name:y(e,t,i.entity_id),subtype:i.subtype?e.localize(`component.${i.domain}.device_automation.condition_subtype.${i.subtype}`)||i.subtype:""})||(i.subtype?`"${i.subtype}" ${i.type}`:i.type),m=(e,t,i)=>e.localize(`component.${i.domain}.device_automation.trigger_type.${i.type}`,{entity_name:y(e,t,i.entity_id),subtype:i.subtype?e.localize(`component.${i.domain}.device_automation.trigger_subtype.${i.subtype}`)||i.subtype:""})||(i.subtype?`"${i.subtype}" ${i.type}`:i.type),b=(e,t)=>{var i,o,n,a;return null===(i=e.metadata)||void 0===i||!i.secondary||null!==(o=t.metadata)&&void 0!==o&&o.secondary?null!==(n=e.metadata)&&void 0!==n&&n.secondary||null===(a=t.metadata)||void 0===a||!a.secondary?0:-1:1}},21157:(e,t,i)=>{i.d(t,{PX:()=>s,V_:()=>r,nZ:()=>n,rk:()=>d});var o=i(58135);const n="unavailable",a="unknown",s="off",r=[n,a],l=[n,a,s],d=(0,o.z)(r);(0,o.z)(l)},15306:(e,t,i)=>{i.d(t,{vA:()=>a,w1:()=>s,Mw:()=>r});var o=i(14516),n=i(2733);i(28858);const a=(e,t)=>{if(t.name)return t.name;const i=e.states[t.entity_id];return i?(0,n.C)(i):t.original_name?t.original_name:t.entity_id},s=(0,o.Z)((e=>{const t={};for(const i of e)t[i.entity_id]=i;return t})),r=(0,o.Z)((e=>{const t={};for(const i of e)t[i.id]=i;return t}))},64082:(e,t,i)=>{i.d(t,{I:()=>n,_:()=>s});var o=i(18394);const n="__paste__",a=()=>Promise.all([i.e(6023),i.e(8597),i.e(2488),i.e(4370),i.e(3869)]).then(i.bind(i,13869)),s=(e,t)=>{(0,o.B)(e,"show-dialog",{dialogTag:"add-automation-element-dialog",dialogImport:a,dialogParams:t})}},21686:(e,t,i)=>{i.d(t,{G:()=>n,H:()=>a});var o=i(38768);const n=(0,o.Ry)({platform:(0,o.Z_)(),id:(0,o.jt)((0,o.Z_)()),enabled:(0,o.jt)((0,o.O7)())}),a=(0,o.Ry)({days:(0,o.jt)((0,o.Rx)()),hours:(0,o.jt)((0,o.Rx)()),minutes:(0,o.jt)((0,o.Rx)()),seconds:(0,o.jt)((0,o.Rx)())})}};
+//# sourceMappingURL=512.e_Yqry3MvEc.js.map
\ No newline at end of file
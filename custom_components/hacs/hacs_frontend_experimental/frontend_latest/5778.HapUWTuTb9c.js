@@ -0,0 +1,5 @@
+export const id=5778;export const ids=[5778,2802];export const modules={86089:(e,t,l)=>{l.d(t,{U:()=>i});const i=e=>e.stopPropagation()},50057:(e,t,l)=>{var i=l(309),a=(l(34131),l(18846)),o=l(95260);(0,i.Z)([(0,o.Mo)("ha-chip-set")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[]}}),a.l)},74376:(e,t,l)=>{var i=l(309),a=l(58417),o=l(39274),d=l(5095),s=l(95260);(0,i.Z)([(0,s.Mo)("ha-checkbox")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[o.W,d.iv`:host{--mdc-theme-secondary:var(--primary-color)}`]}]}}),a.A)},75778:(e,t,l)=>{l.r(t),l.d(t,{HaFormSelect:()=>n});var i=l(309),a=l(14516),o=l(5095),d=l(95260),s=l(18394);l(62802);let n=(0,i.Z)([(0,d.Mo)("ha-form-select")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"schema",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"data",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",key:"_selectSchema",value:()=>(0,a.Z)((e=>({select:{options:e.map((e=>({value:e[0],label:e[1]})))}})))},{kind:"method",key:"render",value:function(){return o.dy` <ha-selector-select .hass="${this.hass}" .schema="${this.schema}" .value="${this.data}" .label="${this.label}" .helper="${this.helper}" .disabled="${this.disabled}" .required="${this.schema.required}" .selector="${this._selectSchema(this.schema.options)}" @value-changed="${this._valueChanged}"></ha-selector-select> `}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();let t=e.detail.value;t!==this.data&&(""===t&&(t=void 0),(0,s.B)(this,"value-changed",{value:t}))}}]}}),o.oi)},48950:(e,t,l)=>{var i=l(309),a=l(8485),o=l(92038),d=l(5095),s=l(95260),n=l(18394);(0,i.Z)([(0,s.Mo)("ha-formfield")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"method",key:"_labelClick",value:function(){const e=this.input;if(e&&(e.focus(),!e.disabled))switch(e.tagName){case"HA-CHECKBOX":e.checked=!e.checked,(0,n.B)(e,"change");break;case"HA-RADIO":e.checked=!0,(0,n.B)(e,"change");break;default:e.click()}}},{kind:"field",static:!0,key:"styles",value:()=>[o.W,d.iv`:host(:not([alignEnd])) ::slotted(ha-switch){margin-right:10px;margin-inline-end:10px;margin-inline-start:inline}.mdc-form-field>label{direction:var(--direction);margin-inline-start:0;margin-inline-end:auto;padding-inline-start:4px;padding-inline-end:0}`]}]}}),a.a)},7265:(e,t,l)=>{var i=l(309),a=l(5095),o=l(95260);(0,i.Z)([(0,o.Mo)("ha-input-helper-text")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"method",key:"render",value:function(){return a.dy`<slot></slot>`}},{kind:"field",static:!0,key:"styles",value:()=>a.iv`:host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}`}]}}),a.oi)},71133:(e,t,l)=>{var i=l(309),a=l(34541),o=l(47838),d=l(49412),s=l(3762),n=l(5095),r=l(95260),c=l(72218),h=l(2537);l(54371);(0,i.Z)([(0,r.Mo)("ha-select")],(function(e,t){class l extends t{constructor(...t){super(...t),e(this)}}return{F:l,d:[{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:()=>!1},{kind:"method",key:"render",value:function(){return n.dy` ${(0,a.Z)((0,o.Z)(l.prototype),"render",this).call(this)} ${this.clearable&&!this.required&&!this.disabled&&this.value?n.dy`<ha-icon-button label="clear" @click="${this._clearValue}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}"></ha-icon-button>`:n.Ld} `}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?n.dy`<span class="mdc-select__icon"><slot name="icon"></slot></span>`:n.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,a.Z)((0,o.Z)(l.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,a.Z)((0,o.Z)(l.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value(){return(0,c.D)((async()=>{await(0,h.y)(),this.layoutOptions()}),500)}},{kind:"field",static:!0,key:"styles",value:()=>[s.W,n.iv`:host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}`]}]}}),d.K)},62802:(e,t,l)=>{l.r(t),l.d(t,{HaSelectSelector:()=>m});var i=l(309),a=(l(44577),l(5095)),o=l(95260),d=l(99266),s=l(4771),n=l(18394),r=l(86089),c=l(28858),h=(l(50057),l(34541)),u=l(47838),v=(l(34131),l(16587));(0,i.Z)([(0,o.Mo)("ha-input-chip")],(function(e,t){class l extends t{constructor(...t){super(...t),e(this)}}return{F:l,d:[{kind:"field",static:!0,key:"styles",value(){return[...(0,h.Z)((0,u.Z)(l),"styles",this),a.iv`:host{--md-sys-color-primary:var(--primary-text-color);--md-sys-color-on-surface:var(--primary-text-color);--md-sys-color-on-surface-variant:var(--primary-text-color);--md-sys-color-on-secondary-container:var(--primary-text-color);--md-input-chip-container-shape:16px;--md-input-chip-outline-color:var(--outline-color);--md-input-chip-selected-container-color:rgba(
+          var(--rgb-primary-text-color),
+          0.15
+        )}::slotted([slot=icon]){display:flex;--mdc-icon-size:var(--md-input-chip-icon-size, 18px)}`]}}]}}),v.W);l(74376),l(16591),l(48950),l(7265);var p=l(57463),b=l(44973);(0,i.Z)([(0,o.Mo)("ha-radio")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[b.W,a.iv`:host{--mdc-theme-secondary:var(--primary-color)}`]}]}}),p.J);l(71133),l(42308);let m=(0,i.Z)([(0,o.Mo)("ha-selector-select")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,o.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,o.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,o.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,o.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,o.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,o.Cb)()],key:"localizeValue",value:void 0},{kind:"field",decorators:[(0,o.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,o.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"field",decorators:[(0,o.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"_itemMoved",value:function(e){e.stopPropagation();const{oldIndex:t,newIndex:l}=e.detail;this._move(t,l)}},{kind:"method",key:"_move",value:function(e,t){const l=this.value.concat(),i=l.splice(e,1)[0];l.splice(t,0,i),this.value=l,(0,n.B)(this,"value-changed",{value:l})}},{kind:"field",key:"_filter",value:()=>""},{kind:"method",key:"render",value:function(){var e,t,l,i,o,n,h,u,v,p;const b=(null===(e=this.selector.select)||void 0===e||null===(e=e.options)||void 0===e?void 0:e.map((e=>"object"==typeof e?e:{value:e,label:e})))||[],m=null===(t=this.selector.select)||void 0===t?void 0:t.translation_key;if(this.localizeValue&&m&&b.forEach((e=>{const t=this.localizeValue(`${m}.options.${e.value}`);t&&(e.label=t)})),null!==(l=this.selector.select)&&void 0!==l&&l.sort&&b.sort(((e,t)=>(0,c.f)(e.label,t.label,this.hass.locale.language))),!(null!==(i=this.selector.select)&&void 0!==i&&i.custom_value||null!==(o=this.selector.select)&&void 0!==o&&o.reorder||"list"!==this._mode)){var k;if(null===(k=this.selector.select)||void 0===k||!k.multiple)return a.dy` <div> ${this.label} ${b.map((e=>a.dy` <ha-formfield .label="${e.label}"> <ha-radio .checked="${e.value===this.value}" .value="${e.value}" .disabled="${e.disabled||this.disabled}" @change="${this._valueChanged}"></ha-radio> </ha-formfield> `))} </div> ${this._renderHelper()} `;const e=this.value&&""!==this.value?(0,s.r)(this.value):[];return a.dy` <div> ${this.label} ${b.map((t=>a.dy` <ha-formfield .label="${t.label}"> <ha-checkbox .checked="${e.includes(t.value)}" .value="${t.value}" .disabled="${t.disabled||this.disabled}" @change="${this._checkboxChanged}"></ha-checkbox> </ha-formfield> `))} </div> ${this._renderHelper()} `}if(null!==(n=this.selector.select)&&void 0!==n&&n.multiple){var y;const e=this.value&&""!==this.value?(0,s.r)(this.value):[],t=b.filter((t=>!(t.disabled||null!=e&&e.includes(t.value))));return a.dy` ${null!=e&&e.length?a.dy` <ha-sortable no-style .disabled="${!this.selector.select.reorder}" @item-moved="${this._itemMoved}"> <ha-chip-set> ${(0,d.r)(e,(e=>e),((e,t)=>{var l,i,o;const d=(null===(l=b.find((t=>t.value===e)))||void 0===l?void 0:l.label)||e;return a.dy` <ha-input-chip .idx="${t}" @remove="${this._removeItem}" .label="${d}" selected="selected"> ${null!==(i=this.selector.select)&&void 0!==i&&i.reorder?a.dy` <ha-svg-icon slot="icon" .path="${"M7,19V17H9V19H7M11,19V17H13V19H11M15,19V17H17V19H15M7,15V13H9V15H7M11,15V13H13V15H11M15,15V13H17V15H15M7,11V9H9V11H7M11,11V9H13V11H11M15,11V9H17V11H15M7,7V5H9V7H7M11,7V5H13V7H11M15,7V5H17V7H15Z"}" data-handle></ha-svg-icon> `:a.Ld} ${(null===(o=b.find((t=>t.value===e)))||void 0===o?void 0:o.label)||e} </ha-input-chip> `}))} </ha-chip-set> </ha-sortable> `:a.Ld} <ha-combo-box item-value-path="value" item-label-path="label" .hass="${this.hass}" .label="${this.label}" .helper="${this.helper}" .disabled="${this.disabled}" .required="${this.required&&!e.length}" .value="${""}" .items="${t}" .allowCustomValue="${null!==(y=this.selector.select.custom_value)&&void 0!==y&&y}" @filter-changed="${this._filterChanged}" @value-changed="${this._comboBoxValueChanged}" @opened-changed="${this._openedChanged}"></ha-combo-box> `}if(null!==(h=this.selector.select)&&void 0!==h&&h.custom_value){void 0===this.value||Array.isArray(this.value)||b.find((e=>e.value===this.value))||b.unshift({value:this.value,label:this.value});const e=b.filter((e=>!e.disabled));return a.dy` <ha-combo-box item-value-path="value" item-label-path="label" .hass="${this.hass}" .label="${this.label}" .helper="${this.helper}" .disabled="${this.disabled}" .required="${this.required}" .items="${e}" .value="${this.value}" @filter-changed="${this._filterChanged}" @value-changed="${this._comboBoxValueChanged}" @opened-changed="${this._openedChanged}"></ha-combo-box> `}return a.dy` <ha-select fixedMenuPosition naturalMenuWidth .label="${null!==(u=this.label)&&void 0!==u?u:""}" .value="${null!==(v=this.value)&&void 0!==v?v:""}" .helper="${null!==(p=this.helper)&&void 0!==p?p:""}" .disabled="${this.disabled}" .required="${this.required}" clearable @closed="${r.U}" @selected="${this._valueChanged}"> ${b.map((e=>a.dy` <mwc-list-item .value="${e.value}" .disabled="${e.disabled}">${e.label}</mwc-list-item> `))} </ha-select> `}},{kind:"method",key:"_renderHelper",value:function(){return this.helper?a.dy`<ha-input-helper-text>${this.helper}</ha-input-helper-text>`:""}},{kind:"get",key:"_mode",value:function(){var e,t;return(null===(e=this.selector.select)||void 0===e?void 0:e.mode)||(((null===(t=this.selector.select)||void 0===t||null===(t=t.options)||void 0===t?void 0:t.length)||0)<6?"list":"dropdown")}},{kind:"method",key:"_valueChanged",value:function(e){var t,l;e.stopPropagation();const i=(null===(t=e.detail)||void 0===t?void 0:t.value)||e.target.value;this.disabled||void 0===i||i===(null!==(l=this.value)&&void 0!==l?l:"")||(0,n.B)(this,"value-changed",{value:i})}},{kind:"method",key:"_checkboxChanged",value:function(e){if(e.stopPropagation(),this.disabled)return;let t;const l=e.target.value,i=e.target.checked,a=this.value&&""!==this.value?(0,s.r)(this.value):[];if(i){if(a.includes(l))return;t=[...a,l]}else{if(null==a||!a.includes(l))return;t=a.filter((e=>e!==l))}(0,n.B)(this,"value-changed",{value:t})}},{kind:"method",key:"_removeItem",value:async function(e){e.stopPropagation();const t=[...(0,s.r)(this.value)];t.splice(e.target.idx,1),(0,n.B)(this,"value-changed",{value:t}),await this.updateComplete,this._filterChanged()}},{kind:"method",key:"_comboBoxValueChanged",value:function(e){var t;e.stopPropagation();const l=e.detail.value;if(this.disabled||""===l)return;if(null===(t=this.selector.select)||void 0===t||!t.multiple)return void(0,n.B)(this,"value-changed",{value:l});const i=this.value&&""!==this.value?(0,s.r)(this.value):[];void 0!==l&&i.includes(l)||(setTimeout((()=>{this._filterChanged(),this.comboBox.setInputValue("")}),0),(0,n.B)(this,"value-changed",{value:[...i,l]}))}},{kind:"method",key:"_openedChanged",value:function(e){null!=e&&e.detail.value&&this._filterChanged()}},{kind:"method",key:"_filterChanged",value:function(e){var t,l;this._filter=(null==e?void 0:e.detail.value)||"";const i=null===(t=this.comboBox.items)||void 0===t?void 0:t.filter((e=>{var t;return(e.label||e.value).toLowerCase().includes(null===(t=this._filter)||void 0===t?void 0:t.toLowerCase())}));this._filter&&null!==(l=this.selector.select)&&void 0!==l&&l.custom_value&&(null==i||i.unshift({label:this._filter,value:this._filter})),this.comboBox.filteredItems=i}},{kind:"field",static:!0,key:"styles",value:()=>a.iv`:host{position:relative}ha-formfield,ha-select,mwc-formfield{display:block}mwc-list-item[disabled]{--mdc-theme-text-primary-on-background:var(--disabled-text-color)}ha-chip-set{padding:8px 0}.sortable-fallback{display:none;opacity:0}.sortable-ghost{opacity:.4}.sortable-drag{cursor:grabbing}`}]}}),a.oi)},42308:(e,t,l)=>{var i=l(309),a=l(34541),o=l(47838),d=l(5095),s=l(95260),n=l(18394);(0,i.Z)([(0,s.Mo)("ha-sortable")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",key:"_sortable",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"path",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean,attribute:"no-style"})],key:"noStyle",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:String,attribute:"draggable-selector"})],key:"draggableSelector",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:String,attribute:"handle-selector"})],key:"handleSelector",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:String,attribute:"group"})],key:"group",value:void 0},{kind:"method",key:"updated",value:function(e){e.has("disabled")&&(this.disabled?this._destroySortable():this._createSortable())}},{kind:"field",key:"_shouldBeDestroy",value:()=>!1},{kind:"method",key:"disconnectedCallback",value:function(){(0,a.Z)((0,o.Z)(i.prototype),"disconnectedCallback",this).call(this),this._shouldBeDestroy=!0,setTimeout((()=>{this._shouldBeDestroy&&(this._destroySortable(),this._shouldBeDestroy=!1)}),1)}},{kind:"method",key:"connectedCallback",value:function(){(0,a.Z)((0,o.Z)(i.prototype),"connectedCallback",this).call(this),this._shouldBeDestroy=!1}},{kind:"method",key:"createRenderRoot",value:function(){return this}},{kind:"method",key:"render",value:function(){return this.noStyle?d.Ld:d.dy` <style>.sortable-fallback{display:none;opacity:0}.sortable-ghost{border:2px solid var(--primary-color);background:rgba(var(--rgb-primary-color),.25);border-radius:4px;opacity:.4}.sortable-drag{border-radius:4px;opacity:1;background:var(--card-background-color);box-shadow:0px 4px 8px 3px #00000026;cursor:grabbing}</style> `}},{kind:"method",key:"_createSortable",value:async function(){if(this._sortable)return;const e=this.children[0];if(!e)return;const t=(await Promise.all([l.e(6087),l.e(8697)]).then(l.bind(l,48697))).default,i={animation:150,swapThreshold:.75,onChoose:this._handleChoose,onEnd:this._handleEnd};this.draggableSelector&&(i.draggable=this.draggableSelector),this.handleSelector&&(i.handle=this.handleSelector),this.draggableSelector&&(i.draggable=this.draggableSelector),this.group&&(i.group=this.group),this._sortable=new t(e,i)}},{kind:"field",key:"_handleEnd",value(){return async e=>{e.item.placeholder&&(e.item.placeholder.replaceWith(e.item),delete e.item.placeholder);const t=e.oldIndex,l=e.from.parentElement.path,i=e.newIndex,a=e.to.parentElement.path;void 0===t||void 0===i||t===i&&(null==l?void 0:l.join("."))===(null==a?void 0:a.join("."))||(0,n.B)(this,"item-moved",{oldIndex:t,newIndex:i,oldPath:l,newPath:a})}}},{kind:"field",key:"_handleChoose",value:()=>e=>{e.item.placeholder=document.createComment("sort-placeholder"),e.item.after(e.item.placeholder)}},{kind:"method",key:"_destroySortable",value:function(){this._sortable&&(this._sortable.destroy(),this._sortable=void 0)}}]}}),d.oi)}};
+//# sourceMappingURL=5778.HapUWTuTb9c.js.map
\ No newline at end of file
@@ -0,0 +1,16 @@
+export const id=5891;export const ids=[5891,8664];export const modules={58135:(e,t,i)=>{i.d(t,{z:()=>r});const r=e=>(t,i)=>e.includes(t,i)},58664:(e,t,i)=>{i.d(t,{v:()=>a});var r=i(21157),o=i(36655);function a(e,t){const i=(0,o.M)(e.entity_id),a=void 0!==t?t:null==e?void 0:e.state;if(["button","event","input_button","scene"].includes(i))return a!==r.nZ;if((0,r.rk)(a))return!1;if(a===r.PX&&"alert"!==i)return!1;switch(i){case"alarm_control_panel":return"disarmed"!==a;case"alert":return"idle"!==a;case"cover":case"valve":return"closed"!==a;case"device_tracker":case"person":return"not_home"!==a;case"lawn_mower":return["mowing","error"].includes(a);case"lock":return"locked"!==a;case"media_player":return"standby"!==a;case"vacuum":return!["idle","docked","paused"].includes(a);case"plant":return"problem"===a;case"group":return["on","home","open","locked","problem"].includes(a);case"timer":return"active"===a;case"camera":return"streaming"===a}return!0}},42732:(e,t,i)=>{i.d(t,{I2:()=>h,Hh:()=>d});var r=i(21157),o=i(97315);var a=i(26654);var s=i(36655),l=i(58664);const n=new Set(["alarm_control_panel","alert","automation","binary_sensor","calendar","camera","climate","cover","device_tracker","fan","group","humidifier","input_boolean","lawn_mower","light","lock","media_player","person","plant","remote","schedule","script","siren","sun","switch","timer","update","vacuum","valve","water_heater"]),d=(e,t)=>{if((void 0!==t?t:null==e?void 0:e.state)===r.nZ)return"var(--state-unavailable-color)";const i=u(e,t);return i?(o=i,Array.isArray(o)?o.reverse().reduce(((e,t)=>`var(${t}${e?`, ${e}`:""})`),void 0):`var(${o})`):void 0;var o},c=(e,t,i)=>{const r=void 0!==i?i:t.state,o=(0,l.v)(t,i),s=[],n=(0,a.l)(r,"_"),d=o?"active":"inactive",c=t.attributes.device_class;return c&&s.push(`--state-${e}-${c}-${n}-color`),s.push(`--state-${e}-${n}-color`,`--state-${e}-${d}-color`,`--state-${d}-color`),s},u=(e,t)=>{const i=void 0!==t?t:null==e?void 0:e.state,r=(0,s.M)(e.entity_id),a=e.attributes.device_class;if("sensor"===r&&"battery"===a){const e=(e=>{const t=Number(e);if(!isNaN(t))return t>=70?"--state-sensor-battery-high-color":t>=30?"--state-sensor-battery-medium-color":"--state-sensor-battery-low-color"})(i);if(e)return[e]}if("group"===r){const i=(0,o.W)(e);if(i&&n.has(i))return c(i,e,t)}if(n.has(r))return c(r,e,t)},h=e=>{if(e.attributes.brightness&&"plant"!==(0,s.M)(e.entity_id)){return`brightness(${(e.attributes.brightness+245)/5}%)`}return""}},41010:(e,t,i)=>{i.d(t,{uf:()=>o});var r=i(50345);const o=(e,t,i)=>{const o=t?(e=>{switch(e.number_format){case r.y4.comma_decimal:return["en-US","en"];case r.y4.decimal_comma:return["de","es","it"];case r.y4.space_comma:return["fr","sv","cs"];case r.y4.system:return;default:return e.language}})(t):void 0;if(Number.isNaN=Number.isNaN||function e(t){return"number"==typeof t&&e(t)},(null==t?void 0:t.number_format)!==r.y4.none&&!Number.isNaN(Number(e))&&Intl)try{return new Intl.NumberFormat(o,a(e,i)).format(Number(e))}catch(t){return console.error(t),new Intl.NumberFormat(void 0,a(e,i)).format(Number(e))}return!Number.isNaN(Number(e))&&""!==e&&(null==t?void 0:t.number_format)===r.y4.none&&Intl?new Intl.NumberFormat("en-US",a(e,{...i,useGrouping:!1})).format(Number(e)):"string"==typeof e?e:`${((e,t=2)=>Math.round(e*10**t)/10**t)(e,null==i?void 0:i.maximumFractionDigits).toString()}${"currency"===(null==i?void 0:i.style)?` ${i.currency}`:""}`},a=(e,t)=>{const i={maximumFractionDigits:2,...t};if("string"!=typeof e)return i;if(!t||void 0===t.minimumFractionDigits&&void 0===t.maximumFractionDigits){const t=e.indexOf(".")>-1?e.split(".")[1].length:0;i.minimumFractionDigits=t,i.maximumFractionDigits=t}return i}},26654:(e,t,i)=>{i.d(t,{l:()=>r});const r=(e,t="_")=>{const i="àáâäæãåāăąçćčđďèéêëēėęěğǵḧîïíīįìıİłḿñńǹňôöòóœøōõőṕŕřßśšşșťțûüùúūǘůűųẃẍÿýžźż·",r=`aaaaaaaaaacccddeeeeeeeegghiiiiiiiilmnnnnoooooooooprrsssssttuuuuuuuuuwxyyzzz${t}`,o=new RegExp(i.split("").join("|"),"g");let a;return""===e?a="":(a=e.toString().toLowerCase().replace(o,(e=>r.charAt(i.indexOf(e)))).replace(/(\d),(?=\d)/g,"$1").replace(/[^a-z0-9]+/g,t).replace(new RegExp(`(${t})\\1+`,"g"),"$1").replace(new RegExp(`^${t}+`),"").replace(new RegExp(`${t}+$`),""),""===a&&(a="unknown")),a}},62871:(e,t,i)=>{i.d(t,{K:()=>r});const r=e=>{switch(e.language){case"cz":case"de":case"fi":case"fr":case"sk":case"sv":return" ";default:return""}}},7265:(e,t,i)=>{var r=i(309),o=i(5095),a=i(95260);(0,r.Z)([(0,a.Mo)("ha-input-helper-text")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"method",key:"render",value:function(){return o.dy`<slot></slot>`}},{kind:"field",static:!0,key:"styles",value:()=>o.iv`:host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}`}]}}),o.oi)},65891:(e,t,i)=>{i.r(t),i.d(t,{HaColorTempSelector:()=>P});var r=i(309),o=i(5095),a=i(95260),s=i(86634),l=i(14516),n=i(18394);i(7265),i(8956);(0,r.Z)([(0,a.Mo)("ha-labeled-slider")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"labeled",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)()],key:"caption",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"min",value:()=>0},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"max",value:()=>100},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"step",value:()=>1},{kind:"field",decorators:[(0,a.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"extra",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)()],key:"icon",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"value",value:void 0},{kind:"method",key:"render",value:function(){return o.dy` <div class="title">${this._getTitle()}</div> <div class="extra-container"><slot name="extra"></slot></div> <div class="slider-container"> ${this.icon?o.dy`<ha-icon icon="${this.icon}"></ha-icon>`:o.Ld} <ha-slider .min="${this.min}" .max="${this.max}" .step="${this.step}" .labeled="${this.labeled}" .disabled="${this.disabled}" .value="${this.value}" @change="${this._inputChanged}"></ha-slider> </div> ${this.helper?o.dy`<ha-input-helper-text> ${this.helper} </ha-input-helper-text>`:o.Ld} `}},{kind:"method",key:"_getTitle",value:function(){return`${this.caption}${this.caption&&this.required?" *":""}`}},{kind:"method",key:"_inputChanged",value:function(e){(0,n.B)(this,"value-changed",{value:Number(e.target.value)})}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`:host{display:block}.title{margin:5px 0 8px;color:var(--primary-text-color)}.slider-container{display:flex}ha-icon{margin-top:8px;color:var(--secondary-text-color)}ha-slider{flex-grow:1;background-image:var(--ha-slider-background);border-radius:4px}`}}]}}),o.oi);var d=i(34541),c=i(47838),u=i(4096);const h=(e,t,i)=>Math.min(Math.max(e,t),i),v=2700,p=6500,m=e=>{const t=e/100;return[b(t),k(t),f(t)]},b=e=>{if(e<=66)return 255;return h(329.698727446*(e-60)**-.1332047592,0,255)},k=e=>{let t;return t=e<=66?99.4708025861*Math.log(e)-161.1195681661:288.1221695283*(e-60)**-.0755148492,h(t,0,255)},f=e=>{if(e>=66)return 255;if(e<=19)return 0;const t=138.5177312231*Math.log(e-10)-305.0447927307;return h(t,0,255)},y=e=>Math.floor(1e6/e);var g=i(42732),_=i(89878),w=i(96549),x=i(53180),$=i(41010),C=i(62871);const N=new Set(["ArrowRight","ArrowUp","ArrowLeft","ArrowDown","PageUp","PageDown","Home","End"]);(0,r.Z)([(0,a.Mo)("ha-control-slider")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"locale",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)()],key:"mode",value:()=>"start"},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,reflect:!0})],key:"vertical",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,attribute:"show-handle"})],key:"showHandle",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,attribute:"inverted"})],key:"inverted",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({attribute:"tooltip-position"})],key:"tooltipPosition",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"unit",value:void 0},{kind:"field",decorators:[(0,a.Cb)({attribute:"tooltip-mode"})],key:"tooltipMode",value:()=>"interaction"},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"value",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"step",value:()=>1},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"min",value:()=>0},{kind:"field",decorators:[(0,a.Cb)({type:Number})],key:"max",value:()=>100},{kind:"field",decorators:[(0,a.SB)()],key:"pressed",value:()=>!1},{kind:"field",decorators:[(0,a.SB)()],key:"tooltipVisible",value:()=>!1},{kind:"field",key:"_mc",value:void 0},{kind:"method",key:"valueToPercentage",value:function(e){const t=(this.boundedValue(e)-this.min)/(this.max-this.min);return this.inverted?1-t:t}},{kind:"method",key:"percentageToValue",value:function(e){return(this.max-this.min)*(this.inverted?1-e:e)+this.min}},{kind:"method",key:"steppedValue",value:function(e){return Math.round(e/this.step)*this.step}},{kind:"method",key:"boundedValue",value:function(e){return Math.min(Math.max(e,this.min),this.max)}},{kind:"method",key:"firstUpdated",value:function(e){(0,d.Z)((0,c.Z)(i.prototype),"firstUpdated",this).call(this,e),this.setupListeners(),this.setAttribute("role","slider"),this.hasAttribute("tabindex")||this.setAttribute("tabindex","0")}},{kind:"method",key:"updated",value:function(e){if((0,d.Z)((0,c.Z)(i.prototype),"updated",this).call(this,e),e.has("value")){var t;const e=this.steppedValue(null!==(t=this.value)&&void 0!==t?t:0);this.setAttribute("aria-valuenow",e.toString()),this.setAttribute("aria-valuetext",this._formatValue(e))}if(e.has("min")&&this.setAttribute("aria-valuemin",this.min.toString()),e.has("max")&&this.setAttribute("aria-valuemax",this.max.toString()),e.has("vertical")){const e=this.vertical?"vertical":"horizontal";this.setAttribute("aria-orientation",e)}}},{kind:"method",key:"connectedCallback",value:function(){(0,d.Z)((0,c.Z)(i.prototype),"connectedCallback",this).call(this),this.setupListeners()}},{kind:"method",key:"disconnectedCallback",value:function(){(0,d.Z)((0,c.Z)(i.prototype),"disconnectedCallback",this).call(this),this.destroyListeners()}},{kind:"field",decorators:[(0,a.IO)("#slider")],key:"slider",value:void 0},{kind:"method",key:"setupListeners",value:function(){if(this.slider&&!this._mc){let e;this._mc=new w.dK(this.slider,{touchAction:this.vertical?"pan-x":"pan-y"}),this._mc.add(new w.Ce({threshold:10,direction:w.oM,enable:!0})),this._mc.add(new w.Uw({event:"singletap"})),this._mc.on("panstart",(()=>{this.disabled||(this.pressed=!0,this._showTooltip(),e=this.value)})),this._mc.on("pancancel",(()=>{this.disabled||(this.pressed=!1,this._hideTooltip(),this.value=e)})),this._mc.on("panmove",(e=>{if(this.disabled)return;const t=this._getPercentageFromEvent(e);this.value=this.percentageToValue(t);const i=this.steppedValue(this.value);(0,n.B)(this,"slider-moved",{value:i})})),this._mc.on("panend",(e=>{if(this.disabled)return;this.pressed=!1,this._hideTooltip();const t=this._getPercentageFromEvent(e);this.value=this.steppedValue(this.percentageToValue(t)),(0,n.B)(this,"slider-moved",{value:void 0}),(0,n.B)(this,"value-changed",{value:this.value})})),this._mc.on("singletap",(e=>{if(this.disabled)return;const t=this._getPercentageFromEvent(e);this.value=this.steppedValue(this.percentageToValue(t)),(0,n.B)(this,"value-changed",{value:this.value})})),this.addEventListener("keydown",this._handleKeyDown),this.addEventListener("keyup",this._handleKeyUp)}}},{kind:"method",key:"destroyListeners",value:function(){this._mc&&(this._mc.destroy(),this._mc=void 0),this.removeEventListener("keydown",this._handleKeyDown),this.removeEventListener("keyup",this._handleKeyUp)}},{kind:"get",key:"_tenPercentStep",value:function(){return Math.max(this.step,(this.max-this.min)/10)}},{kind:"method",key:"_showTooltip",value:function(){null!=this._tooltipTimeout&&window.clearTimeout(this._tooltipTimeout),this.tooltipVisible=!0}},{kind:"method",key:"_hideTooltip",value:function(e){e?this._tooltipTimeout=window.setTimeout((()=>{this.tooltipVisible=!1}),e):this.tooltipVisible=!1}},{kind:"method",key:"_handleKeyDown",value:function(e){var t,i,r,o;if(N.has(e.code)){switch(e.preventDefault(),e.code){case"ArrowRight":case"ArrowUp":this.value=this.boundedValue((null!==(t=this.value)&&void 0!==t?t:0)+this.step);break;case"ArrowLeft":case"ArrowDown":this.value=this.boundedValue((null!==(i=this.value)&&void 0!==i?i:0)-this.step);break;case"PageUp":this.value=this.steppedValue(this.boundedValue((null!==(r=this.value)&&void 0!==r?r:0)+this._tenPercentStep));break;case"PageDown":this.value=this.steppedValue(this.boundedValue((null!==(o=this.value)&&void 0!==o?o:0)-this._tenPercentStep));break;case"Home":this.value=this.min;break;case"End":this.value=this.max}this._showTooltip(),(0,n.B)(this,"slider-moved",{value:this.value})}}},{kind:"field",key:"_tooltipTimeout",value:void 0},{kind:"method",key:"_handleKeyUp",value:function(e){N.has(e.code)&&(e.preventDefault(),this._hideTooltip(500),(0,n.B)(this,"value-changed",{value:this.value}))}},{kind:"field",key:"_getPercentageFromEvent",value(){return e=>{if(this.vertical){const t=e.center.y,i=e.target.getBoundingClientRect().top,r=e.target.clientHeight;return Math.max(Math.min(1,1-(t-i)/r),0)}const t=e.center.x,i=e.target.getBoundingClientRect().left,r=e.target.clientWidth;return Math.max(Math.min(1,(t-i)/r),0)}}},{kind:"method",key:"_formatValue",value:function(e){var t,i;return`${(0,$.uf)(e,this.locale)}${this.unit?`${t=this.unit,i=this.locale,"°"===t?"":i&&"%"===t?(0,C.K)(i):" "}${this.unit}`:""}`}},{kind:"method",key:"_renderTooltip",value:function(){var e,t,i;if("never"===this.tooltipMode)return o.Ld;const r=null!==(e=this.tooltipPosition)&&void 0!==e?e:this.vertical?"left":"top",a="always"===this.tooltipMode||this.tooltipVisible&&"interaction"===this.tooltipMode,s=this.steppedValue(null!==(t=this.value)&&void 0!==t?t:0);return o.dy` <span aria-hidden="true" class="tooltip ${(0,x.$)({visible:a,[r]:!0,[null!==(i=this.mode)&&void 0!==i?i:"start"]:!0,"show-handle":this.showHandle})}"> ${this._formatValue(s)} </span> `}},{kind:"method",key:"render",value:function(){var e,t;return o.dy` <div class="container${(0,x.$)({pressed:this.pressed})}" style="${(0,s.V)({"--value":`${this.valueToPercentage(null!==(e=this.value)&&void 0!==e?e:0)}`})}"> <div id="slider" class="slider"> <div class="slider-track-background"></div> <slot name="background"></slot> ${"cursor"===this.mode?null!=this.value?o.dy` <div class="${(0,x.$)({"slider-track-cursor":!0})}"></div> `:null:o.dy` <div class="${(0,x.$)({"slider-track-bar":!0,[null!==(t=this.mode)&&void 0!==t?t:"start"]:!0,"show-handle":this.showHandle})}"></div> `} </div> ${this._renderTooltip()} </div> `}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`:host{display:block;--control-slider-color:var(--primary-color);--control-slider-background:var(--disabled-color);--control-slider-background-opacity:0.2;--control-slider-thickness:40px;--control-slider-border-radius:10px;--control-slider-tooltip-font-size:14px;height:var(--control-slider-thickness);width:100%;border-radius:var(--control-slider-border-radius);outline:0;transition:box-shadow 180ms ease-in-out}:host(:focus-visible){box-shadow:0 0 0 2px var(--control-slider-color)}:host([vertical]){width:var(--control-slider-thickness);height:100%}.container{position:relative;height:100%;width:100%;--handle-size:4px;--handle-margin:calc(var(--control-slider-thickness) / 8)}.tooltip{pointer-events:none;user-select:none;position:absolute;background-color:var(--clear-background-color);color:var(--primary-text-color);font-size:var(--control-slider-tooltip-font-size);border-radius:.8em;padding:.2em .4em;opacity:0;white-space:nowrap;box-shadow:0 2px 5px rgba(0,0,0,.2);transition:opacity 180ms ease-in-out,left 180ms ease-in-out,bottom 180ms ease-in-out;--handle-spacing:calc(2 * var(--handle-margin) + var(--handle-size));--slider-tooltip-margin:-4px;--slider-tooltip-range:100%;--slider-tooltip-offset:0px;--slider-tooltip-position:calc(
+          min(
+            max(
+              var(--value) * var(--slider-tooltip-range) +
+                var(--slider-tooltip-offset),
+              0%
+            ),
+            100%
+          )
+        )}.tooltip.start{--slider-tooltip-offset:calc(-0.5 * (var(--handle-spacing)))}.tooltip.end{--slider-tooltip-offset:calc(0.5 * (var(--handle-spacing)))}.tooltip.cursor{--slider-tooltip-range:calc(100% - var(--handle-spacing));--slider-tooltip-offset:calc(0.5 * (var(--handle-spacing)))}.tooltip.show-handle{--slider-tooltip-range:calc(100% - var(--handle-spacing));--slider-tooltip-offset:calc(0.5 * (var(--handle-spacing)))}.tooltip.visible{opacity:1}.tooltip.top{transform:translate3d(-50%,-100%,0);top:var(--slider-tooltip-margin);left:50%}.tooltip.bottom{transform:translate3d(-50%,100%,0);bottom:var(--slider-tooltip-margin);left:50%}.tooltip.left{transform:translate3d(-100%,50%,0);bottom:50%;left:var(--slider-tooltip-margin)}.tooltip.right{transform:translate3d(100%,50%,0);bottom:50%;right:var(--slider-tooltip-margin)}:host(:not([vertical])) .tooltip.bottom,:host(:not([vertical])) .tooltip.top{left:var(--slider-tooltip-position)}:host([vertical]) .tooltip.left,:host([vertical]) .tooltip.right{bottom:var(--slider-tooltip-position)}.slider{position:relative;height:100%;width:100%;border-radius:var(--control-slider-border-radius);transform:translateZ(0);overflow:hidden;cursor:pointer}.slider *{pointer-events:none}.slider .slider-track-background{position:absolute;top:0;left:0;height:100%;width:100%;background:var(--control-slider-background);opacity:var(--control-slider-background-opacity)}::slotted([slot=background]){position:absolute;top:0;left:0;height:100%;width:100%}.slider .slider-track-bar{--border-radius:var(--control-slider-border-radius);--slider-size:100%;position:absolute;height:100%;width:100%;background-color:var(--control-slider-color);transition:transform 180ms ease-in-out,background-color 180ms ease-in-out}.slider .slider-track-bar.show-handle{--slider-size:calc(
+          100% - 2 * var(--handle-margin) - var(--handle-size)
+        )}.slider .slider-track-bar::after{display:block;content:"";position:absolute;margin:auto;border-radius:var(--handle-size);background-color:#fff}.slider .slider-track-bar{top:0;left:0;transform:translate3d(calc((var(--value,0) - 1) * var(--slider-size)),0,0);border-radius:0 var(--border-radius) var(--border-radius) 0}.slider .slider-track-bar:after{top:0;bottom:0;right:var(--handle-margin);height:50%;width:var(--handle-size)}.slider .slider-track-bar.end{right:0;left:initial;transform:translate3d(calc(var(--value,0) * var(--slider-size)),0,0);border-radius:var(--border-radius) 0 0 var(--border-radius)}.slider .slider-track-bar.end::after{right:initial;left:var(--handle-margin)}:host([vertical]) .slider .slider-track-bar{bottom:0;left:0;transform:translate3d(0,calc((1 - var(--value,0)) * var(--slider-size)),0);border-radius:var(--border-radius) var(--border-radius) 0 0}:host([vertical]) .slider .slider-track-bar:after{top:var(--handle-margin);right:0;left:0;bottom:initial;width:50%;height:var(--handle-size)}:host([vertical]) .slider .slider-track-bar.end{top:0;bottom:initial;transform:translate3d(0,calc((0 - var(--value,0)) * var(--slider-size)),0);border-radius:0 0 var(--border-radius) var(--border-radius)}:host([vertical]) .slider .slider-track-bar.end::after{top:initial;bottom:var(--handle-margin)}.slider .slider-track-cursor:after{display:block;content:"";background-color:var(--secondary-text-color);position:absolute;top:0;left:0;bottom:0;right:0;margin:auto;border-radius:var(--handle-size)}.slider .slider-track-cursor{--cursor-size:calc(var(--control-slider-thickness) / 4);position:absolute;background-color:#fff;border-radius:var(--handle-size);transition:left 180ms ease-in-out,bottom 180ms ease-in-out;top:0;bottom:0;left:calc(var(--value,0) * (100% - var(--cursor-size)));width:var(--cursor-size);box-shadow:0 2px 5px rgba(0,0,0,.2)}.slider .slider-track-cursor:after{height:50%;width:var(--handle-size)}:host([vertical]) .slider .slider-track-cursor{top:initial;right:0;left:0;bottom:calc(var(--value,0) * (100% - var(--cursor-size)));height:var(--cursor-size);width:100%}:host([vertical]) .slider .slider-track-cursor:after{height:var(--handle-size);width:50%}.pressed .tooltip{transition:opacity 180ms ease-in-out}.pressed .slider-track-bar,.pressed .slider-track-cursor{transition:none}:host(:disabled) .slider{cursor:not-allowed}`}}]}}),o.oi);var V=i(21157);let T=function(e){return e.UNKNOWN="unknown",e.ONOFF="onoff",e.BRIGHTNESS="brightness",e.COLOR_TEMP="color_temp",e.HS="hs",e.XY="xy",e.RGB="rgb",e.RGBW="rgbw",e.RGBWW="rgbww",e.WHITE="white",e}({});const z=[T.HS,T.XY,T.RGB,T.RGBW,T.RGBWW];T.COLOR_TEMP,T.BRIGHTNESS,T.WHITE;var M=i(27087);const B=(e,t)=>{const i=[],r=(t-e)/10;for(let t=0;t<11;t++){const o=e+r*t,a=(0,u.CO)(m(o));i.push([.1*t,a])}return i.map((([e,t])=>`${t} ${100*e}%`)).join(", ")};(0,r.Z)([(0,a.Mo)("light-color-temp-picker")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"stateObj",value:void 0},{kind:"field",decorators:[(0,a.SB)()],key:"_ctPickerValue",value:void 0},{kind:"method",key:"render",value:function(){var e,t;if(!this.stateObj)return o.Ld;const i=null!==(e=this.stateObj.attributes.min_color_temp_kelvin)&&void 0!==e?e:v,r=null!==(t=this.stateObj.attributes.max_color_temp_kelvin)&&void 0!==t?t:p,a=this._generateTemperatureGradient(i,r),l=(0,g.Hh)(this.stateObj);return o.dy` <ha-control-slider inverted vertical .value="${this._ctPickerValue}" .min="${i}" .max="${r}" mode="cursor" @value-changed="${this._ctColorChanged}" @slider-moved="${this._ctColorCursorMoved}" .ariaLabel="${this.hass.localize("ui.dialogs.more_info_control.light.color_temp")}" style="${(0,s.V)({"--control-slider-color":l,"--gradient":a})}" .disabled="${this.stateObj.state===V.nZ}" .unit="${M.F_.light.color_temp_kelvin}" .locale="${this.hass.locale}"> </ha-control-slider> `}},{kind:"field",key:"_generateTemperatureGradient",value:()=>(0,l.Z)(((e,t)=>B(e,t)))},{kind:"method",key:"_updateSliderValues",value:function(){const e=this.stateObj;"on"===e.state?this._ctPickerValue=e.attributes.color_mode===T.COLOR_TEMP?e.attributes.color_temp_kelvin:void 0:this._ctPickerValue=void 0}},{kind:"method",key:"willUpdate",value:function(e){(0,d.Z)((0,c.Z)(i.prototype),"willUpdate",this).call(this,e),e.has("stateObj")&&this._updateSliderValues()}},{kind:"method",key:"_ctColorCursorMoved",value:function(e){const t=e.detail.value;isNaN(t)||this._ctPickerValue===t||(this._ctPickerValue=t,(0,n.B)(this,"color-hovered",{color_temp_kelvin:t}),this._throttleUpdateColorTemp())}},{kind:"field",key:"_throttleUpdateColorTemp",value(){return(0,_.P)((()=>{this._updateColorTemp()}),500)}},{kind:"method",key:"_ctColorChanged",value:function(e){const t=e.detail.value;(0,n.B)(this,"color-hovered",void 0),isNaN(t)||this._ctPickerValue===t||(this._ctPickerValue=t,this._updateColorTemp())}},{kind:"method",key:"_updateColorTemp",value:function(){const e=this._ctPickerValue;this._applyColor({color_temp_kelvin:e})}},{kind:"method",key:"_applyColor",value:function(e,t){(0,n.B)(this,"color-changed",e),this.hass.callService("light","turn_on",{entity_id:this.stateObj.entity_id,...e,...t})}},{kind:"get",static:!0,key:"styles",value:function(){return[o.iv`:host{display:flex;flex-direction:column}ha-control-slider{height:45vh;max-height:320px;min-height:200px;--control-slider-thickness:100px;--control-slider-border-radius:24px;--control-slider-color:var(--primary-color);--control-slider-background:-webkit-linear-gradient(
+            top,
+            var(--gradient)
+          );--control-slider-tooltip-font-size:20px;--control-slider-background-opacity:1}`]}}]}}),o.oi);let P=(0,r.Z)([(0,a.Mo)("ha-selector-color_temp")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,a.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,a.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,a.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,a.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"method",key:"render",value:function(){var e,t,i,r,a,l,n,d,c,u,h,m,b,k,f;let y,g;if("kelvin"===(null===(e=this.selector.color_temp)||void 0===e?void 0:e.unit))y=null!==(t=null===(i=this.selector.color_temp)||void 0===i?void 0:i.min)&&void 0!==t?t:v,g=null!==(r=null===(a=this.selector.color_temp)||void 0===a?void 0:a.max)&&void 0!==r?r:p;else y=null!==(l=null!==(n=null===(d=this.selector.color_temp)||void 0===d?void 0:d.min)&&void 0!==n?n:null===(c=this.selector.color_temp)||void 0===c?void 0:c.min_mireds)&&void 0!==l?l:153,g=null!==(u=null!==(h=null===(m=this.selector.color_temp)||void 0===m?void 0:m.max)&&void 0!==h?h:null===(b=this.selector.color_temp)||void 0===b?void 0:b.max_mireds)&&void 0!==u?u:500;const _=this._generateTemperatureGradient(null!==(k=null===(f=this.selector.color_temp)||void 0===f?void 0:f.unit)&&void 0!==k?k:"mired",y,g);return o.dy` <ha-labeled-slider style="${(0,s.V)({"--ha-slider-background":`linear-gradient( to var(--float-end), ${_})`})}" labeled icon="hass:thermometer" .caption="${this.label||""}" .min="${y}" .max="${g}" .value="${this.value}" .disabled="${this.disabled}" .helper="${this.helper}" .required="${this.required}" @value-changed="${this._valueChanged}"></ha-labeled-slider> `}},{kind:"field",key:"_generateTemperatureGradient",value:()=>(0,l.Z)(((e,t,i)=>{let r;switch(e){case"kelvin":r=B(t,i);break;case"mired":r=B(y(t),y(i))}return r}))},{kind:"method",key:"_valueChanged",value:function(e){(0,n.B)(this,"value-changed",{value:Number(e.detail.value)})}}]}}),o.oi)},8956:(e,t,i)=>{var r=i(309),o=i(95260),a=(i(34131),i(96985)),s=i(5095);(0,r.Z)([(0,o.Mo)("ha-slider")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[...a.$.styles,s.iv`:host{--md-sys-color-primary:var(--primary-color);--md-sys-color-outline:var(--outline-color);--md-sys-color-on-surface:var(--primary-text-color);--md-slider-handle-width:14px;--md-slider-handle-height:14px;min-width:100px;min-inline-size:100px;width:200px}`]}]}}),a.$)},21157:(e,t,i)=>{i.d(t,{PX:()=>s,V_:()=>l,nZ:()=>o,rk:()=>d});var r=i(58135);const o="unavailable",a="unknown",s="off",l=[o,a],n=[o,a,s],d=(0,r.z)(l);(0,r.z)(n)},27087:(e,t,i)=>{i.d(t,{F_:()=>r});new Set(["temperature","current_temperature","target_temperature","target_temp_temp","target_temp_high","target_temp_low","target_temp_step","min_temp","max_temp"]);const r={climate:{humidity:"%",current_humidity:"%",target_humidity_low:"%",target_humidity_high:"%",target_humidity_step:"%",min_humidity:"%",max_humidity:"%"},cover:{current_position:"%",current_tilt_position:"%"},fan:{percentage:"%"},humidifier:{humidity:"%",current_humidity:"%",min_humidity:"%",max_humidity:"%"},light:{color_temp:"mired",max_mireds:"mired",min_mireds:"mired",color_temp_kelvin:"K",min_color_temp_kelvin:"K",max_color_temp_kelvin:"K",brightness:"%"},sun:{elevation:"°"},vacuum:{battery_level:"%"},valve:{current_position:"%"},sensor:{battery_level:"%"},media_player:{volume_level:"%"}}},97315:(e,t,i)=>{i.d(t,{W:()=>o,Z:()=>a});var r=i(36655);const o=e=>{const t=e.attributes.entity_id||[],i=[...new Set(t.map((e=>(0,r.M)(e))))];return 1===i.length?i[0]:void 0},a=(e,t,i,r,o)=>e.connection.subscribeMessage(o,{type:"group/start_preview",flow_id:t,flow_type:i,user_input:r})}};
+//# sourceMappingURL=5891.uzrqofeKuzc.js.map
\ No newline at end of file
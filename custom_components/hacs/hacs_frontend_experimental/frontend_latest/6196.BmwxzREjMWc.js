@@ -0,0 +1,2 @@
+export const id=6196;export const ids=[6196];export const modules={58135:(e,t,i)=>{i.d(t,{z:()=>o});const o=e=>(t,i)=>e.includes(t,i)},56196:(e,t,i)=>{i.r(t),i.d(t,{HaSelectorState:()=>p});var o=i(309),a=i(5095),s=i(95260),n=i(49389),r=i(18394),d=i(3850),l=i(21157);const u={alarm_control_panel:["armed_away","armed_custom_bypass","armed_home","armed_night","armed_vacation","arming","disarmed","disarming","pending","triggered"],automation:["on","off"],binary_sensor:["on","off"],button:[],calendar:["on","off"],camera:["idle","recording","streaming"],cover:["closed","closing","open","opening"],device_tracker:["home","not_home"],fan:["on","off"],humidifier:["on","off"],input_boolean:["on","off"],input_button:[],lawn_mower:["error","paused","mowing","docked"],light:["on","off"],lock:["jammed","locked","locking","unlocked","unlocking"],media_player:["off","on","idle","playing","paused","standby","buffering"],person:["home","not_home"],plant:["ok","problem"],remote:["on","off"],scene:[],schedule:["on","off"],script:["on","off"],siren:["on","off"],sun:["above_horizon","below_horizon"],switch:["on","off"],timer:["active","idle","paused"],update:["on","off"],vacuum:["cleaning","docked","error","idle","paused","returning"],valve:["closed","closing","open","opening"],weather:["clear-night","cloudy","exceptional","fog","hail","lightning-rainy","lightning","partlycloudy","pouring","rainy","snowy-rainy","snowy","sunny","windy-variant","windy"]},c={alarm_control_panel:{code_format:["number","text"]},binary_sensor:{device_class:["battery","battery_charging","co","cold","connectivity","door","garage_door","gas","heat","light","lock","moisture","motion","moving","occupancy","opening","plug","power","presence","problem","running","safety","smoke","sound","tamper","update","vibration","window"]},button:{device_class:["restart","update"]},camera:{frontend_stream_type:["hls","web_rtc"]},climate:{hvac_action:["off","idle","preheating","heating","cooling","drying","fan"]},cover:{device_class:["awning","blind","curtain","damper","door","garage","gate","shade","shutter","window"]},device_tracker:{source_type:["bluetooth","bluetooth_le","gps","router"]},fan:{direction:["forward","reverse"]},humidifier:{device_class:["humidifier","dehumidifier"],action:["off","idle","humidifying","drying"]},media_player:{device_class:["tv","speaker","receiver"],media_content_type:["album","app","artist","channel","channels","composer","contibuting_artist","episode","game","genre","image","movie","music","playlist","podcast","season","track","tvshow","url","video"],repeat:["off","one","all"]},number:{device_class:["temperature"]},sensor:{device_class:["apparent_power","aqi","battery","carbon_dioxide","carbon_monoxide","current","date","duration","energy","frequency","gas","humidity","illuminance","monetary","nitrogen_dioxide","nitrogen_monoxide","nitrous_oxide","ozone","ph","pm1","pm10","pm25","power_factor","power","pressure","reactive_power","signal_strength","sulphur_dioxide","temperature","timestamp","volatile_organic_compounds","volatile_organic_compounds_parts","voltage"],state_class:["measurement","total","total_increasing"]},switch:{device_class:["outlet","switch"]},update:{device_class:["firmware"]},water_heater:{away_mode:["on","off"]}},h=(e,t=void 0)=>{const i=(0,d.N)(e),o=[];switch(!t&&i in u?o.push(...u[i]):t&&i in c&&t in c[i]&&o.push(...c[i][t]),i){case"climate":t?"fan_mode"===t?o.push(...e.attributes.fan_modes):"preset_mode"===t?o.push(...e.attributes.preset_modes):"swing_mode"===t&&o.push(...e.attributes.swing_modes):o.push(...e.attributes.hvac_modes);break;case"device_tracker":case"person":t||o.push("home","not_home");break;case"event":"event_type"===t&&o.push(...e.attributes.event_types);break;case"fan":"preset_mode"===t&&o.push(...e.attributes.preset_modes);break;case"humidifier":"mode"===t&&o.push(...e.attributes.available_modes);break;case"input_select":case"select":t||o.push(...e.attributes.options);break;case"light":"effect"===t&&e.attributes.effect_list?o.push(...e.attributes.effect_list):"color_mode"===t&&e.attributes.supported_color_modes&&o.push(...e.attributes.supported_color_modes);break;case"media_player":"sound_mode"===t?o.push(...e.attributes.sound_mode_list):"source"===t&&o.push(...e.attributes.source_list);break;case"remote":"current_activity"===t&&o.push(...e.attributes.activity_list);break;case"sensor":t||"enum"!==e.attributes.device_class||o.push(...e.attributes.options);break;case"vacuum":"fan_speed"===t&&o.push(...e.attributes.fan_speed_list);break;case"water_heater":t&&"operation_mode"!==t||o.push(...e.attributes.operation_list)}return t||o.push(...l.V_),[...new Set(o)]};i(16591);(0,o.Z)([(0,s.Mo)("ha-entity-state-picker")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"entityId",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"attribute",value:void 0},{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"extraOptions",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"autofocus",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean,attribute:"allow-custom-value"})],key:"allowCustomValue",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,s.SB)()],key:"_opened",value:()=>!1},{kind:"field",decorators:[(0,s.IO)("ha-combo-box",!0)],key:"_comboBox",value:void 0},{kind:"method",key:"shouldUpdate",value:function(e){return!(!e.has("_opened")&&this._opened)}},{kind:"method",key:"updated",value:function(e){if(e.has("_opened")&&this._opened||e.has("entityId")||e.has("attribute")||e.has("extraOptions")){var t;const e=this.entityId?this.hass.states[this.entityId]:void 0;this._comboBox.items=[...null!==(t=this.extraOptions)&&void 0!==t?t:[],...this.entityId&&e?h(e,this.attribute).map((t=>({value:t,label:this.attribute?this.hass.formatEntityAttributeValue(e,this.attribute,t):this.hass.formatEntityState(e,t)}))):[]]}}},{kind:"method",key:"render",value:function(){var e;return this.hass?a.dy` <ha-combo-box .hass="${this.hass}" .value="${this._value}" .autofocus="${this.autofocus}" .label="${null!==(e=this.label)&&void 0!==e?e:this.hass.localize("ui.components.entity.entity-state-picker.state")}" .disabled="${this.disabled||!this.entityId}" .required="${this.required}" .helper="${this.helper}" .allowCustomValue="${this.allowCustomValue}" item-value-path="value" item-label-path="label" @opened-changed="${this._openedChanged}" @value-changed="${this._valueChanged}"> </ha-combo-box> `:a.Ld}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();const t=e.detail.value;t!==this._value&&this._setValue(t)}},{kind:"method",key:"_setValue",value:function(e){this.value=e,setTimeout((()=>{(0,r.B)(this,"value-changed",{value:e}),(0,r.B)(this,"change")}),0)}}]}}),a.oi);let p=(0,o.Z)([(0,s.Mo)("ha-selector-state")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"field",decorators:[(0,s.Cb)()],key:"context",value:void 0},{kind:"method",key:"render",value:function(){var e,t,i,o,s;return a.dy` <ha-entity-state-picker .hass="${this.hass}" .entityId="${(null===(e=this.selector.state)||void 0===e?void 0:e.entity_id)||(null===(t=this.context)||void 0===t?void 0:t.filter_entity)}" .attribute="${(null===(i=this.selector.state)||void 0===i?void 0:i.attribute)||(null===(o=this.context)||void 0===o?void 0:o.filter_attribute)}" .extraOptions="${null===(s=this.selector.state)||void 0===s?void 0:s.extra_options}" .value="${this.value}" .label="${this.label}" .helper="${this.helper}" .disabled="${this.disabled}" .required="${this.required}" allow-custom-value></ha-entity-state-picker> `}}]}}),(0,n.f)(a.oi))},21157:(e,t,i)=>{i.d(t,{PX:()=>n,V_:()=>r,nZ:()=>a,rk:()=>l});var o=i(58135);const a="unavailable",s="unknown",n="off",r=[a,s],d=[a,s,n],l=(0,o.z)(r);(0,o.z)(d)},49389:(e,t,i)=>{i.d(t,{f:()=>r});var o=i(309),a=i(34541),s=i(47838),n=i(95260);const r=e=>(0,o.Z)(null,(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",key:"hassSubscribeRequiredHostProps",value:void 0},{kind:"field",key:"__unsubs",value:void 0},{kind:"method",key:"connectedCallback",value:function(){(0,a.Z)((0,s.Z)(i.prototype),"connectedCallback",this).call(this),this.__checkSubscribed()}},{kind:"method",key:"disconnectedCallback",value:function(){if((0,a.Z)((0,s.Z)(i.prototype),"disconnectedCallback",this).call(this),this.__unsubs){for(;this.__unsubs.length;){const e=this.__unsubs.pop();e instanceof Promise?e.then((e=>e())):e()}this.__unsubs=void 0}}},{kind:"method",key:"updated",value:function(e){if((0,a.Z)((0,s.Z)(i.prototype),"updated",this).call(this,e),e.has("hass"))this.__checkSubscribed();else if(this.hassSubscribeRequiredHostProps)for(const t of e.keys())if(this.hassSubscribeRequiredHostProps.includes(t))return void this.__checkSubscribed()}},{kind:"method",key:"hassSubscribe",value:function(){return[]}},{kind:"method",key:"__checkSubscribed",value:function(){var e;void 0!==this.__unsubs||!this.isConnected||void 0===this.hass||null!==(e=this.hassSubscribeRequiredHostProps)&&void 0!==e&&e.some((e=>void 0===this[e]))||(this.__unsubs=this.hassSubscribe())}}]}}),e)}};
+//# sourceMappingURL=6196.BmwxzREjMWc.js.map
\ No newline at end of file
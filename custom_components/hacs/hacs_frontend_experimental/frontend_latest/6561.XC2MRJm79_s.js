@@ -0,0 +1,4 @@
+/*! For license information please see 6561.XC2MRJm79_s.js.LICENSE.txt */
+export const id=6561;export const ids=[6561];export const modules={89833:(t,e,s)=>{s.d(e,{O:()=>u});var i=s(43204),n=s(42977),r=s(5095),o=s(95260),c=s(53180),a=s(10694),l=s(25815);const h={fromAttribute:t=>null!==t&&(""===t||t),toAttribute:t=>"boolean"==typeof t?t?"":null:t};class u extends n.P{constructor(){super(...arguments),this.rows=2,this.cols=20,this.charCounter=!1}render(){const t=this.charCounter&&-1!==this.maxLength,e=t&&"internal"===this.charCounter,s=t&&!e,i=!!this.helper||!!this.validationMessage||s,n={"mdc-text-field--disabled":this.disabled,"mdc-text-field--no-label":!this.label,"mdc-text-field--filled":!this.outlined,"mdc-text-field--outlined":this.outlined,"mdc-text-field--end-aligned":this.endAligned,"mdc-text-field--with-internal-counter":e};return r.dy` <label class="mdc-text-field mdc-text-field--textarea ${(0,c.$)(n)}"> ${this.renderRipple()} ${this.outlined?this.renderOutline():this.renderLabel()} ${this.renderInput()} ${this.renderCharCounter(e)} ${this.renderLineRipple()} </label> ${this.renderHelperText(i,s)} `}renderInput(){const t=this.label?"label":void 0,e=-1===this.minLength?void 0:this.minLength,s=-1===this.maxLength?void 0:this.maxLength,i=this.autocapitalize?this.autocapitalize:void 0;return r.dy` <textarea aria-labelledby="${(0,a.o)(t)}" class="mdc-text-field__input" .value="${(0,l.a)(this.value)}" rows="${this.rows}" cols="${this.cols}" ?disabled="${this.disabled}" placeholder="${this.placeholder}" ?required="${this.required}" ?readonly="${this.readOnly}" minlength="${(0,a.o)(e)}" maxlength="${(0,a.o)(s)}" name="${(0,a.o)(""===this.name?void 0:this.name)}" inputmode="${(0,a.o)(this.inputMode)}" autocapitalize="${(0,a.o)(i)}" @input="${this.handleInputChange}" @blur="${this.onInputBlur}">
+      </textarea>`}}(0,i.__decorate)([(0,o.IO)("textarea")],u.prototype,"formElement",void 0),(0,i.__decorate)([(0,o.Cb)({type:Number})],u.prototype,"rows",void 0),(0,i.__decorate)([(0,o.Cb)({type:Number})],u.prototype,"cols",void 0),(0,i.__decorate)([(0,o.Cb)({converter:h})],u.prototype,"charCounter",void 0)},96791:(t,e,s)=>{s.d(e,{W:()=>i});const i=s(5095).iv`.mdc-text-field{height:100%}.mdc-text-field__input{resize:none}`},3239:(t,e,s)=>{function i(t){if(!t||"object"!=typeof t)return t;if("[object Date]"==Object.prototype.toString.call(t))return new Date(t.getTime());if(Array.isArray(t))return t.map(i);var e={};return Object.keys(t).forEach((function(s){e[s]=i(t[s])})),e}s.d(e,{Z:()=>i})},52407:(t,e,s)=>{s.d(e,{y:()=>i});class i extends Event{constructor(t,e,s){super("context-request",{bubbles:!0,composed:!0}),this.context=t,this.callback=e,this.subscribe=null!=s&&s}}},58467:(t,e,s)=>{s.d(e,{H:()=>o});var i=s(52407);class n{constructor(t){this.subscriptions=new Map,this.updateObservers=()=>{for(const[t,{disposer:e}]of this.subscriptions)t(this.o,e)},void 0!==t&&(this.value=t)}get value(){return this.o}set value(t){this.setValue(t)}setValue(t,e=!1){const s=e||!Object.is(t,this.o);this.o=t,s&&this.updateObservers()}addCallback(t,e,s){if(!s)return void t(this.value);this.subscriptions.has(t)||this.subscriptions.set(t,{disposer:()=>{this.subscriptions.delete(t)},consumerHost:e});const{disposer:i}=this.subscriptions.get(t);t(this.value,i)}clearCallbacks(){this.subscriptions.clear()}}class r extends Event{constructor(t){super("context-provider",{bubbles:!0,composed:!0}),this.context=t}}class o extends n{constructor(t,e,s){super(void 0!==e.context?e.initialValue:s),this.onContextRequest=t=>{const e=t.composedPath()[0];t.context===this.context&&e!==this.host&&(t.stopPropagation(),this.addCallback(t.callback,e,t.subscribe))},this.onProviderRequest=t=>{const e=t.composedPath()[0];if(t.context!==this.context||e===this.host)return;const s=new Set;for(const[t,{consumerHost:e}]of this.subscriptions)s.has(t)||(s.add(t),e.dispatchEvent(new i.y(this.context,t,!0)));t.stopPropagation()},this.host=t,void 0!==e.context?this.context=e.context:this.context=e,this.attachListeners(),this.host.addController(this)}attachListeners(){this.host.addEventListener("context-request",this.onContextRequest),this.host.addEventListener("context-provider",this.onProviderRequest)}hostConnected(){this.host.dispatchEvent(new r(this.context))}}},45245:(t,e,s)=>{function i(t){return t}s.d(e,{k:()=>i})},22264:(t,e,s)=>{s.d(e,{F:()=>o});var i=s(39030),n=s(52407);class r{constructor(t,e,s,i){var n;if(this.subscribe=!1,this.provided=!1,this.value=void 0,this.t=(t,e)=>{this.unsubscribe&&(this.unsubscribe!==e&&(this.provided=!1,this.unsubscribe()),this.subscribe||this.unsubscribe()),this.value=t,this.host.requestUpdate(),this.provided&&!this.subscribe||(this.provided=!0,this.callback&&this.callback(t,e)),this.unsubscribe=e},this.host=t,void 0!==e.context){const t=e;this.context=t.context,this.callback=t.callback,this.subscribe=null!==(n=t.subscribe)&&void 0!==n&&n}else this.context=e,this.callback=s,this.subscribe=null!=i&&i;this.host.addController(this)}hostConnected(){this.dispatchRequest()}hostDisconnected(){this.unsubscribe&&(this.unsubscribe(),this.unsubscribe=void 0)}dispatchRequest(){this.host.dispatchEvent(new n.y(this.context,this.t,this.subscribe))}}function o({context:t,subscribe:e}){return(0,i.eZ)({finisher:(s,i)=>{s.addInitializer((s=>{new r(s,{context:t,callback:t=>{s[i]=t},subscribe:e})}))}})}},99266:(t,e,s)=>{s.d(e,{r:()=>c});var i=s(32982),n=s(16616),r=s(41005);const o=(t,e,s)=>{const i=new Map;for(let n=e;n<=s;n++)i.set(t[n],n);return i},c=(0,n.XM)(class extends n.Xe{constructor(t){if(super(t),t.type!==n.pX.CHILD)throw Error("repeat() can only be used in text expressions")}ct(t,e,s){let i;void 0===s?s=e:void 0!==e&&(i=e);const n=[],r=[];let o=0;for(const e of t)n[o]=i?i(e,o):o,r[o]=s(e,o),o++;return{values:r,keys:n}}render(t,e,s){return this.ct(t,e,s).values}update(t,[e,s,n]){var c;const a=(0,r.i9)(t),{values:l,keys:h}=this.ct(e,s,n);if(!Array.isArray(a))return this.ut=h,l;const u=null!==(c=this.ut)&&void 0!==c?c:this.ut=[],d=[];let f,p,b=0,v=a.length-1,y=0,m=l.length-1;for(;b<=v&&y<=m;)if(null===a[b])b++;else if(null===a[v])v--;else if(u[b]===h[y])d[y]=(0,r.fk)(a[b],l[y]),b++,y++;else if(u[v]===h[m])d[m]=(0,r.fk)(a[v],l[m]),v--,m--;else if(u[b]===h[m])d[m]=(0,r.fk)(a[b],l[m]),(0,r._Y)(t,d[m+1],a[b]),b++,m--;else if(u[v]===h[y])d[y]=(0,r.fk)(a[v],l[y]),(0,r._Y)(t,a[b],a[v]),v--,y++;else if(void 0===f&&(f=o(h,y,m),p=o(u,b,v)),f.has(u[b]))if(f.has(u[v])){const e=p.get(h[y]),s=void 0!==e?a[e]:null;if(null===s){const e=(0,r._Y)(t,a[b]);(0,r.fk)(e,l[y]),d[y]=e}else d[y]=(0,r.fk)(s,l[y]),(0,r._Y)(t,a[b],s),a[e]=null;y++}else(0,r.ws)(a[v]),v--;else(0,r.ws)(a[b]),b++;for(;y<=m;){const e=(0,r._Y)(t,d[m+1]);(0,r.fk)(e,l[y]),d[y++]=e}for(;b<=v;){const t=a[b++];null!==t&&(0,r.ws)(t)}return this.ut=h,(0,r.hl)(t,d),i.Jb}})},60307:(t,e,s)=>{s.d(e,{C:()=>d});var i=s(32982),n=s(41005),r=s(36585);class o{constructor(t){this.G=t}disconnect(){this.G=void 0}reconnect(t){this.G=t}deref(){return this.G}}class c{constructor(){this.Y=void 0,this.Z=void 0}get(){return this.Y}pause(){var t;null!==(t=this.Y)&&void 0!==t||(this.Y=new Promise((t=>this.Z=t)))}resume(){var t;null===(t=this.Z)||void 0===t||t.call(this),this.Y=this.Z=void 0}}var a=s(16616);const l=t=>!(0,n.pt)(t)&&"function"==typeof t.then,h=1073741823;class u extends r.sR{constructor(){super(...arguments),this._$C_t=h,this._$Cwt=[],this._$Cq=new o(this),this._$CK=new c}render(...t){var e;return null!==(e=t.find((t=>!l(t))))&&void 0!==e?e:i.Jb}update(t,e){const s=this._$Cwt;let n=s.length;this._$Cwt=e;const r=this._$Cq,o=this._$CK;this.isConnected||this.disconnected();for(let t=0;t<e.length&&!(t>this._$C_t);t++){const i=e[t];if(!l(i))return this._$C_t=t,i;t<n&&i===s[t]||(this._$C_t=h,n=0,Promise.resolve(i).then((async t=>{for(;o.get();)await o.get();const e=r.deref();if(void 0!==e){const s=e._$Cwt.indexOf(i);s>-1&&s<e._$C_t&&(e._$C_t=s,e.setValue(t))}})))}return i.Jb}disconnected(){this._$Cq.disconnect(),this._$CK.pause()}reconnected(){this._$Cq.reconnect(this),this._$CK.resume()}}const d=(0,a.XM)(u)},38768:(t,e,s)=>{s.d(e,{AG:()=>x,DD:()=>i,G0:()=>k,IX:()=>b,O7:()=>v,Rx:()=>$,Ry:()=>g,Z_:()=>C,f0:()=>f,hu:()=>h,i0:()=>y,is:()=>u,jt:()=>_});class i extends TypeError{constructor(t,e){let s;const{message:i,explanation:n,...r}=t,{path:o}=t,c=0===o.length?i:`At path: ${o.join(".")} -- ${i}`;super(null!=n?n:c),null!=n&&(this.cause=c),Object.assign(this,r),this.name=this.constructor.name,this.failures=()=>{var i;return null!==(i=s)&&void 0!==i?i:s=[t,...e()]}}}function n(t){return"object"==typeof t&&null!=t}function r(t){return"symbol"==typeof t?t.toString():"string"==typeof t?JSON.stringify(t):`${t}`}function o(t,e,s,i){if(!0===t)return;!1===t?t={}:"string"==typeof t&&(t={message:t});const{path:n,branch:o}=e,{type:c}=s,{refinement:a,message:l=`Expected a value of type \`${c}\`${a?` with refinement \`${a}\``:""}, but received: \`${r(i)}\``}=t;return{value:i,type:c,refinement:a,key:n[n.length-1],path:n,branch:o,...t,message:l}}function*c(t,e,s,i){var r;n(r=t)&&"function"==typeof r[Symbol.iterator]||(t=[t]);for(const n of t){const t=o(n,e,s,i);t&&(yield t)}}function*a(t,e,s={}){const{path:i=[],branch:r=[t],coerce:o=!1,mask:c=!1}=s,l={path:i,branch:r};if(o&&(t=e.coercer(t,l),c&&"type"!==e.type&&n(e.schema)&&n(t)&&!Array.isArray(t)))for(const s in t)void 0===e.schema[s]&&delete t[s];let h="valid";for(const i of e.validator(t,l))i.explanation=s.message,h="not_valid",yield[i,void 0];for(let[u,d,f]of e.entries(t,l)){const e=a(d,f,{path:void 0===u?i:[...i,u],branch:void 0===u?r:[...r,d],coerce:o,mask:c,message:s.message});for(const s of e)s[0]?(h=null!=s[0].refinement?"not_refined":"not_valid",yield[s[0],void 0]):o&&(d=s[1],void 0===u?t=d:t instanceof Map?t.set(u,d):t instanceof Set?t.add(d):n(t)&&(void 0!==d||u in t)&&(t[u]=d))}if("not_valid"!==h)for(const i of e.refiner(t,l))i.explanation=s.message,h="not_refined",yield[i,void 0];"valid"===h&&(yield[void 0,t])}class l{constructor(t){const{type:e,schema:s,validator:i,refiner:n,coercer:r=(t=>t),entries:o=function*(){}}=t;this.type=e,this.schema=s,this.entries=o,this.coercer=r,this.validator=i?(t,e)=>c(i(t,e),e,this,t):()=>[],this.refiner=n?(t,e)=>c(n(t,e),e,this,t):()=>[]}assert(t,e){return h(t,this,e)}create(t,e){return function(t,e,s){const i=d(t,e,{coerce:!0,message:s});if(i[0])throw i[0];return i[1]}(t,this,e)}is(t){return u(t,this)}mask(t,e){return function(t,e,s){const i=d(t,e,{coerce:!0,mask:!0,message:s});if(i[0])throw i[0];return i[1]}(t,this,e)}validate(t,e={}){return d(t,this,e)}}function h(t,e,s){const i=d(t,e,{message:s});if(i[0])throw i[0]}function u(t,e){return!d(t,e)[0]}function d(t,e,s={}){const n=a(t,e,s),r=function(t){const{done:e,value:s}=t.next();return e?void 0:s}(n);if(r[0]){return[new i(r[0],(function*(){for(const t of n)t[0]&&(yield t[0])})),void 0]}return[void 0,r[1]]}function f(...t){const e="type"===t[0].type,s=t.map((t=>t.schema)),i=Object.assign({},...s);return e?w(i):g(i)}function p(t,e){return new l({type:t,schema:null,validator:e})}function b(t){return new l({type:"array",schema:t,*entries(e){if(t&&Array.isArray(e))for(const[s,i]of e.entries())yield[s,i,t]},coercer:t=>Array.isArray(t)?t.slice():t,validator:t=>Array.isArray(t)||`Expected an array value, but received: ${r(t)}`})}function v(){return p("boolean",(t=>"boolean"==typeof t))}function y(t){const e=r(t),s=typeof t;return new l({type:"literal",schema:"string"===s||"number"===s||"boolean"===s?t:null,validator:s=>s===t||`Expected the literal \`${e}\`, but received: ${r(s)}`})}function m(){return p("never",(()=>!1))}function x(t){return new l({...t,validator:(e,s)=>null===e||t.validator(e,s),refiner:(e,s)=>null===e||t.refiner(e,s)})}function $(){return p("number",(t=>"number"==typeof t&&!isNaN(t)||`Expected a number, but received: ${r(t)}`))}function g(t){const e=t?Object.keys(t):[],s=m();return new l({type:"object",schema:t||null,*entries(i){if(t&&n(i)){const n=new Set(Object.keys(i));for(const s of e)n.delete(s),yield[s,i[s],t[s]];for(const t of n)yield[t,i[t],s]}},validator:t=>n(t)||`Expected an object, but received: ${r(t)}`,coercer:t=>n(t)?{...t}:t})}function _(t){return new l({...t,validator:(e,s)=>void 0===e||t.validator(e,s),refiner:(e,s)=>void 0===e||t.refiner(e,s)})}function C(){return p("string",(t=>"string"==typeof t||`Expected a string, but received: ${r(t)}`))}function w(t){const e=Object.keys(t);return new l({type:"type",schema:t,*entries(s){if(n(s))for(const i of e)yield[i,s[i],t[i]]},validator:t=>n(t)||`Expected an object, but received: ${r(t)}`,coercer:t=>n(t)?{...t}:t})}function k(t){const e=t.map((t=>t.type)).join(" | ");return new l({type:"union",schema:null,coercer(e){for(const s of t){const[t,i]=s.validate(e,{coerce:!0});if(!t)return i}return e},validator(s,i){const n=[];for(const e of t){const[...t]=a(s,e,i),[r]=t;if(!r[0])return[];for(const[e]of t)e&&n.push(e)}return[`Expected the value to satisfy a union of \`${e}\`, but received: ${r(s)}`,...n]}})}}};
+//# sourceMappingURL=6561.XC2MRJm79_s.js.map
\ No newline at end of file
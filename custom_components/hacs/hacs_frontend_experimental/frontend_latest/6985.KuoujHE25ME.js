@@ -0,0 +1,3 @@
+/*! For license information please see 6985.KuoujHE25ME.js.LICENSE.txt */
+export const id=6985;export const ids=[6985];export const modules={92952:(t,e,a)=>{var r=a(43204),i=a(95260),n=a(5095);class s extends n.oi{connectedCallback(){super.connectedCallback(),this.setAttribute("aria-hidden","true")}render(){return n.dy`<span class="shadow"></span>`}}const l=n.iv`:host{--_level:var(--md-elevation-level, 0);--_shadow-color:var(--md-elevation-shadow-color, var(--md-sys-color-shadow, #000));display:flex;pointer-events:none}.shadow,.shadow::after,.shadow::before,:host{border-radius:inherit;inset:0;position:absolute;transition-duration:inherit;transition-property:inherit;transition-timing-function:inherit}.shadow::after,.shadow::before{content:"";transition-property:box-shadow,opacity}.shadow::before{box-shadow:0px calc(1px*(clamp(0,var(--_level),1) + clamp(0,var(--_level) - 3,1) + 2*clamp(0,var(--_level) - 4,1))) calc(1px*(2*clamp(0,var(--_level),1) + clamp(0,var(--_level) - 2,1) + clamp(0,var(--_level) - 4,1))) 0px var(--_shadow-color);opacity:.3}.shadow::after{box-shadow:0px calc(1px*(clamp(0,var(--_level),1) + clamp(0,var(--_level) - 1,1) + 2*clamp(0,var(--_level) - 2,3))) calc(1px*(3*clamp(0,var(--_level),2) + 2*clamp(0,var(--_level) - 2,3))) calc(1px*(clamp(0,var(--_level),4) + 2*clamp(0,var(--_level) - 4,1))) var(--_shadow-color);opacity:.15}`;let o=class extends s{};o.styles=[l],o=(0,r.__decorate)([(0,i.Mo)("md-elevation")],o)},96985:(t,e,a)=>{a.d(e,{$:()=>x});var r=a(43204),i=a(95260),n=a(5095);const s=n.iv`@media(forced-colors:active){:host{--md-slider-active-track-color:CanvasText;--md-slider-disabled-active-track-color:GrayText;--md-slider-disabled-active-track-opacity:1;--md-slider-disabled-handle-color:GrayText;--md-slider-disabled-inactive-track-color:GrayText;--md-slider-disabled-inactive-track-opacity:1;--md-slider-focus-handle-color:CanvasText;--md-slider-handle-color:CanvasText;--md-slider-handle-shadow-color:Canvas;--md-slider-hover-handle-color:CanvasText;--md-slider-hover-state-layer-color:Canvas;--md-slider-hover-state-layer-opacity:1;--md-slider-inactive-track-color:Canvas;--md-slider-label-container-color:Canvas;--md-slider-label-text-color:CanvasText;--md-slider-pressed-handle-color:CanvasText;--md-slider-pressed-state-layer-color:Canvas;--md-slider-pressed-state-layer-opacity:1;--md-slider-with-overlap-handle-outline-color:CanvasText}.label,.label::before{border:var(--_with-overlap-handle-outline-color) solid var(--_with-overlap-handle-outline-width)}:host(:not([disabled])) .track::before{border:1px solid var(--_active-track-color)}.tickmarks::before{background-image:url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' fill='CanvasText'%3E%3Ccircle cx='2' cy='2'  r='1'/%3E%3C/svg%3E")}.tickmarks::after{background-image:url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' fill='Canvas'%3E%3Ccircle cx='2' cy='2' r='1'/%3E%3C/svg%3E")}:host([disabled]) .tickmarks::before{background-image:url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' fill='Canvas'%3E%3Ccircle cx='2' cy='2'  r='1'/%3E%3C/svg%3E")}}`;a(92952),a(86477),a(35981);var l=a(53180),o=a(86634);function d(t,e,a){return t?e():null==a?void 0:a()}var c=a(6157);function h(t,e){!e.bubbles||t.shadowRoot&&!e.composed||e.stopPropagation();const a=Reflect.construct(e.constructor,[e.type,e]),r=t.dispatchEvent(a);return r||e.preventDefault(),r}function v(t){return t.currentTarget===t.target&&(t.composedPath()[0]===t.target&&(!t.target.disabled&&!function(t){const e=p;e&&(t.preventDefault(),t.stopImmediatePropagation());return async function(){p=!0,await null,p=!1}(),e}(t)))}let p=!1;const u=Symbol("internals"),m=Symbol("privateInternals");const b=Symbol("getFormValue"),_=Symbol("getFormState");const k=function(t){class e extends t{get form(){return this[u].form}get labels(){return this[u].labels}get name(){var t;return null!==(t=this.getAttribute("name"))&&void 0!==t?t:""}set name(t){this.setAttribute("name",t)}get disabled(){return this.hasAttribute("disabled")}set disabled(t){this.toggleAttribute("disabled",t)}attributeChangedCallback(t,e,a){if("name"!==t&&"disabled"!==t)super.attributeChangedCallback(t,e,a);else{const a="disabled"===t?null!==e:e;this.requestUpdate(t,a)}}requestUpdate(t,e,a){super.requestUpdate(t,e,a),this[u].setFormValue(this[b](),this[_]())}[b](){throw new Error("Implement [getFormValue]")}[_](){return this[b]()}formDisabledCallback(t){this.disabled=t}}return e.formAssociated=!0,(0,r.__decorate)([(0,i.Cb)({noAccessor:!0})],e.prototype,"name",null),(0,r.__decorate)([(0,i.Cb)({type:Boolean,noAccessor:!0})],e.prototype,"disabled",null),e}((g=n.oi,class extends g{get[u](){return this[m]||(this[m]=this.attachInternals()),this[m]}}));var g;class f extends k{get nameStart(){var t;return null!==(t=this.getAttribute("name-start"))&&void 0!==t?t:this.name}set nameStart(t){this.setAttribute("name-start",t)}get nameEnd(){var t;return null!==(t=this.getAttribute("name-end"))&&void 0!==t?t:this.nameStart}set nameEnd(t){this.setAttribute("name-end",t)}get renderAriaLabelStart(){const{ariaLabel:t}=this;return this.ariaLabelStart||t&&`${t} start`||this.valueLabelStart||String(this.valueStart)}get renderAriaValueTextStart(){return this.ariaValueTextStart||this.valueLabelStart||String(this.valueStart)}get renderAriaLabelEnd(){const{ariaLabel:t}=this;return this.range?this.ariaLabelEnd||t&&`${t} end`||this.valueLabelEnd||String(this.valueEnd):t||this.valueLabel||String(this.value)}get renderAriaValueTextEnd(){if(this.range)return this.ariaValueTextEnd||this.valueLabelEnd||String(this.valueEnd);const{ariaValueText:t}=this;return t||this.valueLabel||String(this.value)}constructor(){super(),this.min=0,this.max=100,this.valueLabel="",this.valueLabelStart="",this.valueLabelEnd="",this.ariaLabelStart="",this.ariaValueTextStart="",this.ariaLabelEnd="",this.ariaValueTextEnd="",this.step=1,this.ticks=!1,this.labeled=!1,this.range=!1,this.handleStartHover=!1,this.handleEndHover=!1,this.startOnTop=!1,this.handlesOverlapping=!1,this.ripplePointerId=1,this.isRedispatchingEvent=!1,n.sk||this.addEventListener("click",(t=>{v(t)&&this.inputEnd&&(this.focus(),function(t){const e=new MouseEvent("click",{bubbles:!0});t.dispatchEvent(e)}(this.inputEnd))}))}focus(){var t;null===(t=this.inputEnd)||void 0===t||t.focus()}willUpdate(t){var e,a;this.renderValueStart=t.has("valueStart")?this.valueStart:null===(e=this.inputStart)||void 0===e?void 0:e.valueAsNumber;const r=t.has("valueEnd")&&this.range||t.has("value");this.renderValueEnd=r?this.range?this.valueEnd:this.value:null===(a=this.inputEnd)||void 0===a?void 0:a.valueAsNumber,void 0!==t.get("handleStartHover")?this.toggleRippleHover(this.rippleStart,this.handleStartHover):void 0!==t.get("handleEndHover")&&this.toggleRippleHover(this.rippleEnd,this.handleEndHover)}updated(t){if(this.range&&(this.renderValueStart=this.inputStart.valueAsNumber),this.renderValueEnd=this.inputEnd.valueAsNumber,this.range){const t=(this.max-this.min)/3;if(void 0===this.valueStart){this.inputStart.valueAsNumber=this.min+t;const e=this.inputStart.valueAsNumber;this.valueStart=this.renderValueStart=e}if(void 0===this.valueEnd){this.inputEnd.valueAsNumber=this.min+2*t;const e=this.inputEnd.valueAsNumber;this.valueEnd=this.renderValueEnd=e}}else{var e;null!==(e=this.value)&&void 0!==e||(this.value=this.renderValueEnd)}if(t.has("range")||t.has("renderValueStart")||t.has("renderValueEnd")||this.isUpdatePending){var a,r;const t=null===(a=this.handleStart)||void 0===a?void 0:a.querySelector(".handleNub"),e=null===(r=this.handleEnd)||void 0===r?void 0:r.querySelector(".handleNub");this.handlesOverlapping=function(t,e){if(!t||!e)return!1;const a=t.getBoundingClientRect(),r=e.getBoundingClientRect();return!(a.top>r.bottom||a.right<r.left||a.bottom<r.top||a.left>r.right)}(t,e)}this.performUpdate()}render(){var t,e,a,r;const i=0===this.step?1:this.step,s=Math.max(this.max-this.min,i),c=this.range?((null!==(t=this.renderValueStart)&&void 0!==t?t:this.min)-this.min)/s:0,h=((null!==(e=this.renderValueEnd)&&void 0!==e?e:this.min)-this.min)/s,v={"--_start-fraction":String(c),"--_end-fraction":String(h),"--_tick-count":String(s/i)},p={ranged:this.range},u=this.valueLabelStart||String(this.renderValueStart),m=(this.range?this.valueLabelEnd:this.valueLabel)||String(this.renderValueEnd),b={start:!0,value:this.renderValueStart,ariaLabel:this.renderAriaLabelStart,ariaValueText:this.renderAriaValueTextStart,ariaMin:this.min,ariaMax:null!==(a=this.valueEnd)&&void 0!==a?a:this.max},_={start:!1,value:this.renderValueEnd,ariaLabel:this.renderAriaLabelEnd,ariaValueText:this.renderAriaValueTextEnd,ariaMin:this.range&&null!==(r=this.valueStart)&&void 0!==r?r:this.min,ariaMax:this.max},k={start:!0,hover:this.handleStartHover,label:u},g={start:!1,hover:this.handleEndHover,label:m},f={hover:this.handleStartHover||this.handleEndHover};return n.dy` <div class="container ${(0,l.$)(p)}" style="${(0,o.V)(v)}"> ${d(this.range,(()=>this.renderInput(b)))} ${this.renderInput(_)} ${this.renderTrack()} <div class="handleContainerPadded"> <div class="handleContainerBlock"> <div class="handleContainer ${(0,l.$)(f)}"> ${d(this.range,(()=>this.renderHandle(k)))} ${this.renderHandle(g)} </div> </div> </div> </div>`}renderTrack(){return n.dy` <div class="track"></div> ${this.ticks?n.dy`<div class="tickmarks"></div>`:n.Ld} `}renderLabel(t){return n.dy`<div class="label" aria-hidden="true"> <span class="labelContent" part="label">${t}</span> </div>`}renderHandle({start:t,hover:e,label:a}){const r=!this.disabled&&t===this.startOnTop,i=!this.disabled&&this.handlesOverlapping,s=t?"start":"end";return n.dy`<div class="handle ${(0,l.$)({[s]:!0,hover:e,onTop:r,isOverlapping:i})}"> <div class="handleNub"><md-elevation></md-elevation></div> ${d(this.labeled,(()=>this.renderLabel(a)))} <md-focus-ring part="focus-ring" for="${s}"></md-focus-ring> <md-ripple for="${s}" class="${s}" ?disabled="${this.disabled}"></md-ripple> </div>`}renderInput({start:t,value:e,ariaLabel:a,ariaValueText:r,ariaMin:i,ariaMax:s}){const o=t?"start":"end";return n.dy`<input type="range" class="${(0,l.$)({start:t,end:!t})}" @focus="${this.handleFocus}" @pointerdown="${this.handleDown}" @pointerup="${this.handleUp}" @pointerenter="${this.handleEnter}" @pointermove="${this.handleMove}" @pointerleave="${this.handleLeave}" @keydown="${this.handleKeydown}" @keyup="${this.handleKeyup}" @input="${this.handleInput}" @change="${this.handleChange}" id="${o}" .disabled="${this.disabled}" .min="${String(this.min)}" aria-valuemin="${i}" .max="${String(this.max)}" aria-valuemax="${s}" .step="${String(this.step)}" .value="${String(e)}" .tabIndex="${t?1:0}" aria-label="${a||n.Ld}" aria-valuetext="${r}">`}async toggleRippleHover(t,e){const a=await t;a&&(e?a.handlePointerenter(new PointerEvent("pointerenter",{isPrimary:!0,pointerId:this.ripplePointerId})):a.handlePointerleave(new PointerEvent("pointerleave",{isPrimary:!0,pointerId:this.ripplePointerId})))}handleFocus(t){this.updateOnTop(t.target)}startAction(t){const e=t.target,a=e===this.inputStart?this.inputEnd:this.inputStart;this.action={canFlip:"pointerdown"===t.type,flipped:!1,target:e,fixed:a,values:new Map([[e,e.valueAsNumber],[a,null==a?void 0:a.valueAsNumber]])}}finishAction(t){this.action=void 0}handleKeydown(t){this.startAction(t)}handleKeyup(t){this.finishAction(t)}handleDown(t){this.startAction(t),this.ripplePointerId=t.pointerId;const e=t.target===this.inputStart;this.handleStartHover=!this.disabled&&e&&Boolean(this.handleStart),this.handleEndHover=!this.disabled&&!e&&Boolean(this.handleEnd)}async handleUp(t){if(!this.action)return;const{target:e,values:a,flipped:r}=this.action;await new Promise(requestAnimationFrame),void 0!==e&&(e.focus(),r&&e.valueAsNumber!==a.get(e)&&e.dispatchEvent(new Event("change",{bubbles:!0}))),this.finishAction(t)}handleMove(t){this.handleStartHover=!this.disabled&&y(t,this.handleStart),this.handleEndHover=!this.disabled&&y(t,this.handleEnd)}handleEnter(t){this.handleMove(t)}handleLeave(){this.handleStartHover=!1,this.handleEndHover=!1}updateOnTop(t){this.startOnTop=t.classList.contains("start")}needsClamping(){if(!this.action)return!1;const{target:t,fixed:e}=this.action;return t===this.inputStart?t.valueAsNumber>e.valueAsNumber:t.valueAsNumber<e.valueAsNumber}isActionFlipped(){const{action:t}=this;if(!t)return!1;const{target:e,fixed:a,values:r}=t;if(t.canFlip){r.get(e)===r.get(a)&&this.needsClamping()&&(t.canFlip=!1,t.flipped=!0,t.target=a,t.fixed=e)}return t.flipped}flipAction(){if(!this.action)return!1;const{target:t,fixed:e,values:a}=this.action,r=t.valueAsNumber!==e.valueAsNumber;return t.valueAsNumber=e.valueAsNumber,e.valueAsNumber=a.get(e),r}clampAction(){if(!this.needsClamping()||!this.action)return!1;const{target:t,fixed:e}=this.action;return t.valueAsNumber=e.valueAsNumber,!0}handleInput(t){if(this.isRedispatchingEvent)return;let e=!1,a=!1;this.range&&(this.isActionFlipped()&&(e=!0,a=this.flipAction()),this.clampAction()&&(e=!0,a=!1));const r=t.target;this.updateOnTop(r),this.range?(this.valueStart=this.inputStart.valueAsNumber,this.valueEnd=this.inputEnd.valueAsNumber):this.value=this.inputEnd.valueAsNumber,e&&t.stopPropagation(),a&&(this.isRedispatchingEvent=!0,h(r,t),this.isRedispatchingEvent=!1)}handleChange(t){var e;const a=t.target,{target:r,values:i}=null!==(e=this.action)&&void 0!==e?e:{};r&&r.valueAsNumber===i.get(a)||h(this,t),this.finishAction(t)}[b](){if(this.range){const t=new FormData;return t.append(this.nameStart,String(this.valueStart)),t.append(this.nameEnd,String(this.valueEnd)),t}return String(this.value)}formResetCallback(){if(this.range){const t=this.getAttribute("value-start");this.valueStart=null!==t?Number(t):void 0;const e=this.getAttribute("value-end");return void(this.valueEnd=null!==e?Number(e):void 0)}const t=this.getAttribute("value");this.value=null!==t?Number(t):void 0}formStateRestoreCallback(t){if(Array.isArray(t)){const[[,e],[,a]]=t;return this.valueStart=Number(e),this.valueEnd=Number(a),void(this.range=!0)}this.value=Number(t),this.range=!1}}function y({x:t,y:e},a){if(!a)return!1;const{top:r,left:i,bottom:n,right:s}=a.getBoundingClientRect();return t>=i&&t<=s&&e>=r&&e<=n}(0,c.d)(f),f.shadowRootOptions={...n.oi.shadowRootOptions,delegatesFocus:!0},(0,r.__decorate)([(0,i.Cb)({type:Number})],f.prototype,"min",void 0),(0,r.__decorate)([(0,i.Cb)({type:Number})],f.prototype,"max",void 0),(0,r.__decorate)([(0,i.Cb)({type:Number})],f.prototype,"value",void 0),(0,r.__decorate)([(0,i.Cb)({type:Number,attribute:"value-start"})],f.prototype,"valueStart",void 0),(0,r.__decorate)([(0,i.Cb)({type:Number,attribute:"value-end"})],f.prototype,"valueEnd",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"value-label"})],f.prototype,"valueLabel",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"value-label-start"})],f.prototype,"valueLabelStart",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"value-label-end"})],f.prototype,"valueLabelEnd",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"aria-label-start"})],f.prototype,"ariaLabelStart",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"aria-valuetext-start"})],f.prototype,"ariaValueTextStart",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"aria-label-end"})],f.prototype,"ariaLabelEnd",void 0),(0,r.__decorate)([(0,i.Cb)({attribute:"aria-valuetext-end"})],f.prototype,"ariaValueTextEnd",void 0),(0,r.__decorate)([(0,i.Cb)({type:Number})],f.prototype,"step",void 0),(0,r.__decorate)([(0,i.Cb)({type:Boolean})],f.prototype,"ticks",void 0),(0,r.__decorate)([(0,i.Cb)({type:Boolean})],f.prototype,"labeled",void 0),(0,r.__decorate)([(0,i.Cb)({type:Boolean})],f.prototype,"range",void 0),(0,r.__decorate)([(0,i.IO)("input.start")],f.prototype,"inputStart",void 0),(0,r.__decorate)([(0,i.IO)(".handle.start")],f.prototype,"handleStart",void 0),(0,r.__decorate)([(0,i.GC)("md-ripple.start")],f.prototype,"rippleStart",void 0),(0,r.__decorate)([(0,i.IO)("input.end")],f.prototype,"inputEnd",void 0),(0,r.__decorate)([(0,i.IO)(".handle.end")],f.prototype,"handleEnd",void 0),(0,r.__decorate)([(0,i.GC)("md-ripple.end")],f.prototype,"rippleEnd",void 0),(0,r.__decorate)([(0,i.SB)()],f.prototype,"handleStartHover",void 0),(0,r.__decorate)([(0,i.SB)()],f.prototype,"handleEndHover",void 0),(0,r.__decorate)([(0,i.SB)()],f.prototype,"startOnTop",void 0),(0,r.__decorate)([(0,i.SB)()],f.prototype,"handlesOverlapping",void 0),(0,r.__decorate)([(0,i.SB)()],f.prototype,"renderValueStart",void 0),(0,r.__decorate)([(0,i.SB)()],f.prototype,"renderValueEnd",void 0);const w=n.iv`:host{--_active-track-color:var(--md-slider-active-track-color, var(--md-sys-color-primary, #6750a4));--_active-track-height:var(--md-slider-active-track-height, 4px);--_active-track-shape:var(--md-slider-active-track-shape, 9999px);--_disabled-active-track-color:var(--md-slider-disabled-active-track-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-active-track-opacity:var(--md-slider-disabled-active-track-opacity, 0.38);--_disabled-handle-color:var(--md-slider-disabled-handle-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-handle-elevation:var(--md-slider-disabled-handle-elevation, 0);--_disabled-inactive-track-color:var(--md-slider-disabled-inactive-track-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-inactive-track-opacity:var(--md-slider-disabled-inactive-track-opacity, 0.12);--_focus-handle-color:var(--md-slider-focus-handle-color, var(--md-sys-color-primary, #6750a4));--_handle-color:var(--md-slider-handle-color, var(--md-sys-color-primary, #6750a4));--_handle-elevation:var(--md-slider-handle-elevation, 1);--_handle-height:var(--md-slider-handle-height, 20px);--_handle-shadow-color:var(--md-slider-handle-shadow-color, var(--md-sys-color-shadow, #000));--_handle-shape:var(--md-slider-handle-shape, 9999px);--_handle-width:var(--md-slider-handle-width, 20px);--_hover-handle-color:var(--md-slider-hover-handle-color, var(--md-sys-color-primary, #6750a4));--_hover-state-layer-color:var(--md-slider-hover-state-layer-color, var(--md-sys-color-primary, #6750a4));--_hover-state-layer-opacity:var(--md-slider-hover-state-layer-opacity, 0.08);--_inactive-track-color:var(--md-slider-inactive-track-color, var(--md-sys-color-surface-container-highest, #e6e0e9));--_inactive-track-height:var(--md-slider-inactive-track-height, 4px);--_inactive-track-shape:var(--md-slider-inactive-track-shape, 9999px);--_label-container-color:var(--md-slider-label-container-color, var(--md-sys-color-primary, #6750a4));--_label-container-height:var(--md-slider-label-container-height, 28px);--_pressed-handle-color:var(--md-slider-pressed-handle-color, var(--md-sys-color-primary, #6750a4));--_pressed-state-layer-color:var(--md-slider-pressed-state-layer-color, var(--md-sys-color-primary, #6750a4));--_pressed-state-layer-opacity:var(--md-slider-pressed-state-layer-opacity, 0.12);--_state-layer-size:var(--md-slider-state-layer-size, 40px);--_with-overlap-handle-outline-color:var(--md-slider-with-overlap-handle-outline-color, var(--md-sys-color-on-primary, #fff));--_with-overlap-handle-outline-width:var(--md-slider-with-overlap-handle-outline-width, 1px);--_with-tick-marks-active-container-color:var(--md-slider-with-tick-marks-active-container-color, var(--md-sys-color-on-primary, #fff));--_with-tick-marks-container-size:var(--md-slider-with-tick-marks-container-size, 2px);--_with-tick-marks-disabled-container-color:var(--md-slider-with-tick-marks-disabled-container-color, var(--md-sys-color-on-surface, #1d1b20));--_with-tick-marks-inactive-container-color:var(--md-slider-with-tick-marks-inactive-container-color, var(--md-sys-color-on-surface-variant, #49454f));--_label-text-color:var(--md-slider-label-text-color, var(--md-sys-color-on-primary, #fff));--_label-text-font:var(--md-slider-label-text-font, var(--md-sys-typescale-label-medium-font, var(--md-ref-typeface-plain, Roboto)));--_label-text-line-height:var(--md-slider-label-text-line-height, var(--md-sys-typescale-label-medium-line-height, 1rem));--_label-text-size:var(--md-slider-label-text-size, var(--md-sys-typescale-label-medium-size, 0.75rem));--_label-text-weight:var(--md-slider-label-text-weight, var(--md-sys-typescale-label-medium-weight, var(--md-ref-typeface-weight-medium, 500)));--_start-fraction:0;--_end-fraction:0;--_tick-count:0;display:inline-flex;vertical-align:middle;min-inline-size:200px;--md-elevation-level:var(--_handle-elevation);--md-elevation-shadow-color:var(--_handle-shadow-color)}md-focus-ring{height:48px;inset:unset;width:48px}md-elevation{transition-duration:250ms}@media(prefers-reduced-motion){.label{transition-duration:0}}:host([disabled]){opacity:var(--_disabled-active-track-opacity);--md-elevation-level:var(--_disabled-handle-elevation)}.container{flex:1;display:flex;align-items:center;position:relative;block-size:var(--_state-layer-size);pointer-events:none;touch-action:none}.tickmarks,.track{position:absolute;inset:0;display:flex;align-items:center}.tickmarks::after,.tickmarks::before,.track::after,.track::before{position:absolute;content:"";inset-inline-start:calc(var(--_state-layer-size)/ 2 - var(--_with-tick-marks-container-size));inset-inline-end:calc(var(--_state-layer-size)/ 2 - var(--_with-tick-marks-container-size));background-size:calc((100% - var(--_with-tick-marks-container-size)*2)/ var(--_tick-count)) 100%}.tickmarks::before,.track::before{block-size:var(--_inactive-track-height);border-radius:var(--_inactive-track-shape)}.track::before{background-color:var(--_inactive-track-color)}.tickmarks::before{background-image:radial-gradient(circle at var(--_with-tick-marks-container-size) center,var(--_with-tick-marks-inactive-container-color) 0,var(--_with-tick-marks-inactive-container-color) calc(var(--_with-tick-marks-container-size)/ 2),transparent calc(var(--_with-tick-marks-container-size)/ 2))}:host([disabled]) .track::before{opacity:calc(1/var(--_disabled-active-track-opacity)*var(--_disabled-inactive-track-opacity));background-color:var(--_disabled-inactive-track-color)}.tickmarks::after,.track::after{block-size:var(--_active-track-height);border-radius:var(--_active-track-shape);clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))) 0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)))}.track::after{background-color:var(--_active-track-color)}.tickmarks::after{background-image:radial-gradient(circle at var(--_with-tick-marks-container-size) center,var(--_with-tick-marks-active-container-color) 0,var(--_with-tick-marks-active-container-color) calc(var(--_with-tick-marks-container-size)/ 2),transparent calc(var(--_with-tick-marks-container-size)/ 2))}:host-context([dir=rtl]) .track::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host([dir=rtl]) .track::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}.track:dir(rtl)::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host-context([dir=rtl]) .tickmarks::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host([dir=rtl]) .tickmarks::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}.tickmarks:dir(rtl)::after{clip-path:inset(0 calc(var(--_with-tick-marks-container-size) * min(var(--_start-fraction) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * var(--_start-fraction)) 0 calc(var(--_with-tick-marks-container-size) * min((1 - var(--_end-fraction)) * 1000000000,1) + (100% - var(--_with-tick-marks-container-size) * 2) * (1 - var(--_end-fraction))))}:host([disabled]) .track::after{background-color:var(--_disabled-active-track-color)}:host([disabled]) .tickmarks::before{background-image:radial-gradient(circle at var(--_with-tick-marks-container-size) center,var(--_with-tick-marks-disabled-container-color) 0,var(--_with-tick-marks-disabled-container-color) calc(var(--_with-tick-marks-container-size)/ 2),transparent calc(var(--_with-tick-marks-container-size)/ 2))}.handleContainerPadded{position:relative;block-size:100%;inline-size:100%;padding-inline:calc(var(--_state-layer-size)/2)}.handleContainerBlock{position:relative;block-size:100%;inline-size:100%}.handleContainer{position:absolute;inset-block-start:0;inset-block-end:0;inset-inline-start:calc(100%*var(--_start-fraction));inline-size:calc(100%*(var(--_end-fraction) - var(--_start-fraction)))}.handle{position:absolute;block-size:var(--_state-layer-size);inline-size:var(--_state-layer-size);border-radius:var(--_handle-shape);display:flex;place-content:center;place-items:center}.handleNub{position:absolute;height:var(--_handle-height);width:var(--_handle-width);border-radius:var(--_handle-shape);background:var(--_handle-color)}:host([disabled]) .handleNub{background:var(--_disabled-handle-color)}input.end:focus~.handleContainerPadded .handle.end>.handleNub,input.start:focus~.handleContainerPadded .handle.start>.handleNub{background:var(--_focus-handle-color)}.container>.handleContainerPadded .handle.hover>.handleNub{background:var(--_hover-handle-color)}:host(:not([disabled])) input.end:active~.handleContainerPadded .handle.end>.handleNub,:host(:not([disabled])) input.start:active~.handleContainerPadded .handle.start>.handleNub{background:var(--_pressed-handle-color)}.onTop.isOverlapping .label,.onTop.isOverlapping .label::before{outline:var(--_with-overlap-handle-outline-color) solid var(--_with-overlap-handle-outline-width)}.onTop.isOverlapping .handleNub{border:var(--_with-overlap-handle-outline-color) solid var(--_with-overlap-handle-outline-width)}.handle.start{inset-inline-start:calc(0px - var(--_state-layer-size)/ 2)}.handle.end{inset-inline-end:calc(0px - var(--_state-layer-size)/ 2)}.label{position:absolute;box-sizing:border-box;display:flex;padding:4px;place-content:center;place-items:center;border-radius:9999px;color:var(--_label-text-color);font-family:var(--_label-text-font);font-size:var(--_label-text-size);line-height:var(--_label-text-line-height);font-weight:var(--_label-text-weight);inset-block-end:100%;min-inline-size:var(--_label-container-height);min-block-size:var(--_label-container-height);background:var(--_label-container-color);transition:transform .1s cubic-bezier(.2, 0, 0, 1);transform-origin:center bottom;transform:scale(0)}.handleContainer.hover .label,:host(:focus-within) .label,:where(:has(input:active)) .label{transform:scale(1)}.label::after,.label::before{position:absolute;display:block;content:"";background:inherit}.label::before{inline-size:calc(var(--_label-container-height)/2);block-size:calc(var(--_label-container-height)/2);bottom:calc(var(--_label-container-height)/-10);transform:rotate(45deg)}.label::after{inset:0px;border-radius:inherit}.labelContent{z-index:1}input[type=range]{opacity:0;-webkit-tap-highlight-color:transparent;position:absolute;box-sizing:border-box;height:100%;width:100%;margin:0;background:rgba(0,0,0,0);cursor:pointer;pointer-events:auto;appearance:none}input[type=range]:focus{outline:0}::-webkit-slider-runnable-track{-webkit-appearance:none}::-moz-range-track{appearance:none}::-webkit-slider-thumb{-webkit-appearance:none;appearance:none;block-size:var(--_handle-height);inline-size:var(--_handle-width);opacity:0;z-index:2}input.end::-webkit-slider-thumb{--_track-and-knob-padding:calc( (var(--_state-layer-size) - var(--_handle-width)) / 2 );--_x-translate:calc( var(--_track-and-knob-padding) - 2 * var(--_end-fraction) * var(--_track-and-knob-padding) );transform:translateX(var(--_x-translate))}:host-context([dir=rtl]) input.end::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}:host([dir=rtl]) input.end::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}input.end:dir(rtl)::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}input.start::-webkit-slider-thumb{--_track-and-knob-padding:calc( (var(--_state-layer-size) - var(--_handle-width)) / 2 );--_x-translate:calc( var(--_track-and-knob-padding) - 2 * var(--_start-fraction) * var(--_track-and-knob-padding) );transform:translateX(var(--_x-translate))}:host-context([dir=rtl]) input.start::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}:host([dir=rtl]) input.start::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}input.start:dir(rtl)::-webkit-slider-thumb{transform:translateX(calc(-1 * var(--_x-translate)))}::-moz-range-thumb{appearance:none;block-size:var(--_state-layer-size);inline-size:var(--_state-layer-size);transform:scaleX(0);opacity:0;z-index:2}.ranged input.start{clip-path:inset(0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))) 0 0)}:host-context([dir=rtl]) .ranged input.start{clip-path:inset(0 0 0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))))}:host([dir=rtl]) .ranged input.start{clip-path:inset(0 0 0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))))}.ranged input.start:dir(rtl){clip-path:inset(0 0 0 calc(100% - (var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2))))}.ranged input.end{clip-path:inset(0 0 0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)))}:host-context([dir=rtl]) .ranged input.end{clip-path:inset(0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)) 0 0)}:host([dir=rtl]) .ranged input.end{clip-path:inset(0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)) 0 0)}.ranged input.end:dir(rtl){clip-path:inset(0 calc(var(--_state-layer-size)/ 2 + (100% - var(--_state-layer-size)) * (var(--_start-fraction) + (var(--_end-fraction) - var(--_start-fraction))/ 2)) 0 0)}.onTop{z-index:1}.handle{--md-ripple-hover-color:var(--_hover-state-layer-color);--md-ripple-hover-opacity:var(--_hover-state-layer-opacity);--md-ripple-pressed-color:var(--_pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_pressed-state-layer-opacity)}md-ripple{border-radius:50%;height:var(--_state-layer-size);width:var(--_state-layer-size)}`;let x=class extends f{};x.styles=[w,s],x=(0,r.__decorate)([(0,i.Mo)("md-slider")],x)}};
+//# sourceMappingURL=6985.KuoujHE25ME.js.map
\ No newline at end of file
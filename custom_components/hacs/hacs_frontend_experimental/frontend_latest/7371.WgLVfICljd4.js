@@ -0,0 +1,8 @@
+export const id=7371;export const ids=[7371,3216];export const modules={52996:(e,t,i)=>{i.d(t,{p:()=>a});const a=(e,t)=>e&&e.config.components.includes(t)},18007:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.d(t,{Bt:()=>d});var o=i(22075),l=i(50345),n=i(23216),r=e([n]);n=(r.then?(await r)():r)[0];const s=["sunday","monday","tuesday","wednesday","thursday","friday","saturday"],d=e=>e.first_weekday===l.FS.language?"weekInfo"in Intl.Locale.prototype?new Intl.Locale(e.language).weekInfo.firstDay%7:(0,o.L)(e.language)%7:s.includes(e.first_weekday)?s.indexOf(e.first_weekday):1;a()}catch(e){a(e)}}))},76950:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.d(t,{G:()=>d});var o=i(14516),l=i(23216),n=i(94844),r=e([l,n]);[l,n]=r.then?(await r)():r;const s=(0,o.Z)((e=>new Intl.RelativeTimeFormat(e.language,{numeric:"auto"}))),d=(e,t,i,a=!0)=>{const o=(0,n.W)(e,i,t);return a?s(t).format(o.value,o.unit):Intl.NumberFormat(t.language,{style:"unit",unit:o.unit,unitDisplay:"long"}).format(Math.abs(o.value))};a()}catch(e){a(e)}}))},3747:(e,t,i)=>{i.d(t,{t:()=>l});class a{constructor(e=window.localStorage){this.storage=void 0,this._storage={},this._listeners={},this.storage=e,e===window.localStorage&&window.addEventListener("storage",(e=>{e.key&&this.hasKey(e.key)&&(this._storage[e.key]=e.newValue?JSON.parse(e.newValue):e.newValue,this._listeners[e.key]&&this._listeners[e.key].forEach((t=>t(e.oldValue?JSON.parse(e.oldValue):e.oldValue,this._storage[e.key]))))}))}addFromStorage(e){if(!this._storage[e]){const t=this.storage.getItem(e);t&&(this._storage[e]=JSON.parse(t))}}subscribeChanges(e,t){return this._listeners[e]?this._listeners[e].push(t):this._listeners[e]=[t],()=>{this.unsubscribeChanges(e,t)}}unsubscribeChanges(e,t){if(!(e in this._listeners))return;const i=this._listeners[e].indexOf(t);-1!==i&&this._listeners[e].splice(i,1)}hasKey(e){return e in this._storage}getValue(e){return this._storage[e]}setValue(e,t){const i=this._storage[e];this._storage[e]=t;try{void 0===t?this.storage.removeItem(e):this.storage.setItem(e,JSON.stringify(t))}catch(e){}finally{this._listeners[e]&&this._listeners[e].forEach((e=>e(i,t)))}}}const o={},l=e=>t=>{const i=e.storage||"localStorage";let l;i&&i in o?l=o[i]:(l=new a(window[i]),o[i]=l);const n=String(t.key),r=e.key||String(t.key),s=t.initializer?t.initializer():void 0;l.addFromStorage(r);const d=!1!==e.subscribe?e=>l.subscribeChanges(r,((i,a)=>{e.requestUpdate(t.key,i)})):void 0,c=()=>l.hasKey(r)?l.getValue(r):s;return{kind:"method",placement:"prototype",key:t.key,descriptor:{set(i){((i,a)=>{let o;e.state&&(o=c()),l.setValue(r,a),e.state&&i.requestUpdate(t.key,o)})(this,i)},get:()=>c(),enumerable:!0,configurable:!0},finisher(i){if(e.state&&e.subscribe){const e=i.prototype.connectedCallback,t=i.prototype.disconnectedCallback;i.prototype.connectedCallback=function(){e.call(this),this[`__unbsubLocalStorage${n}`]=null==d?void 0:d(this)},i.prototype.disconnectedCallback=function(){var e;t.call(this),null===(e=this[`__unbsubLocalStorage${n}`])||void 0===e||e.call(this),this[`__unbsubLocalStorage${n}`]=void 0}}e.state&&i.createProperty(t.key,{noAccessor:!0,...e.stateOptions})}}}},94844:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.d(t,{W:()=>u});var o=i(62308),l=i(59401),n=i(27296),r=i(18007),s=e([r]);r=(s.then?(await s)():s)[0];const d=1e3,c=60,h=60*c;function u(e,t=Date.now(),i,a={}){const s={...v,...a||{}},u=(+e-+t)/d;if(Math.abs(u)<s.second)return{value:Math.round(u),unit:"second"};const b=u/c;if(Math.abs(b)<s.minute)return{value:Math.round(b),unit:"minute"};const p=u/h;if(Math.abs(p)<s.hour)return{value:Math.round(p),unit:"hour"};const m=new Date(e),f=new Date(t);m.setHours(0,0,0,0),f.setHours(0,0,0,0);const k=(0,o.Z)(m,f);if(0===k)return{value:Math.round(p),unit:"hour"};if(Math.abs(k)<s.day)return{value:k,unit:"day"};const y=(0,r.Bt)(i),_=(0,l.Z)(m,{weekStartsOn:y}),g=(0,l.Z)(f,{weekStartsOn:y}),w=(0,n.Z)(_,g);if(0===w)return{value:k,unit:"day"};if(Math.abs(w)<s.week)return{value:w,unit:"week"};const x=m.getFullYear()-f.getFullYear(),C=12*x+m.getMonth()-f.getMonth();return 0===C?{value:w,unit:"week"}:Math.abs(C)<s.month||0===x?{value:C,unit:"month"}:{value:Math.round(x),unit:"year"}}const v={second:45,minute:45,hour:22,day:5,week:4,month:11};a()}catch(b){a(b)}}))},23860:(e,t,i)=>{i.r(t);var a=i(309),o=i(5095),l=i(95260),n=i(53180),r=i(18394);i(54371),i(37662);const s={info:"M11,9H13V7H11M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20,12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M11,17H13V11H11V17Z",warning:"M12,2L1,21H23M12,6L19.53,19H4.47M11,10V14H13V10M11,16V18H13V16",error:"M11,15H13V17H11V15M11,7H13V13H11V7M12,2C6.47,2 2,6.5 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4A8,8 0 0,1 20,12A8,8 0 0,1 12,20Z",success:"M20,12A8,8 0 0,1 12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4C12.76,4 13.5,4.11 14.2,4.31L15.77,2.74C14.61,2.26 13.34,2 12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12M7.91,10.08L6.5,11.5L11,16L21,6L19.59,4.58L11,13.17L7.91,10.08Z"};(0,a.Z)([(0,l.Mo)("ha-alert")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)()],key:"title",value:()=>""},{kind:"field",decorators:[(0,l.Cb)({attribute:"alert-type"})],key:"alertType",value:()=>"info"},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"dismissable",value:()=>!1},{kind:"method",key:"render",value:function(){return o.dy` <div class="issue-type ${(0,n.$)({[this.alertType]:!0})}" role="alert"> <div class="icon ${this.title?"":"no-title"}"> <slot name="icon"> <ha-svg-icon .path="${s[this.alertType]}"></ha-svg-icon> </slot> </div> <div class="content"> <div class="main-content"> ${this.title?o.dy`<div class="title">${this.title}</div>`:""} <slot></slot> </div> <div class="action"> <slot name="action"> ${this.dismissable?o.dy`<ha-icon-button @click="${this._dismiss_clicked}" label="Dismiss alert" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}"></ha-icon-button>`:""} </slot> </div> </div> </div> `}},{kind:"method",key:"_dismiss_clicked",value:function(){(0,r.B)(this,"alert-dismissed-clicked")}},{kind:"field",static:!0,key:"styles",value:()=>o.iv`.issue-type{position:relative;padding:8px;display:flex}.issue-type::after{position:absolute;top:0;right:0;bottom:0;left:0;opacity:.12;pointer-events:none;content:"";border-radius:4px}.icon{z-index:1}.icon.no-title{align-self:center}.content{display:flex;justify-content:space-between;align-items:center;width:100%;text-align:var(--float-start)}.action{z-index:1;width:min-content;--mdc-theme-primary:var(--primary-text-color)}.main-content{overflow-wrap:anywhere;word-break:break-word;margin-left:8px;margin-right:0;margin-inline-start:8px;margin-inline-end:0;direction:var(--direction)}.title{margin-top:2px;font-weight:700}.action ha-icon-button,.action mwc-button{--mdc-theme-primary:var(--primary-text-color);--mdc-icon-button-size:36px}.issue-type.info>.icon{color:var(--info-color)}.issue-type.info::after{background-color:var(--info-color)}.issue-type.warning>.icon{color:var(--warning-color)}.issue-type.warning::after{background-color:var(--warning-color)}.issue-type.error>.icon{color:var(--error-color)}.issue-type.error::after{background-color:var(--error-color)}.issue-type.success>.icon{color:var(--success-color)}.issue-type.success::after{background-color:var(--success-color)}`}]}}),o.oi)},74376:(e,t,i)=>{var a=i(309),o=i(58417),l=i(39274),n=i(5095),r=i(95260);(0,a.Z)([(0,r.Mo)("ha-checkbox")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[l.W,n.iv`:host{--mdc-theme-secondary:var(--primary-color)}`]}]}}),o.A)},33358:(e,t,i)=>{i.r(t),i.d(t,{HaIconButtonArrowPrev:()=>r});var a=i(309),o=i(5095),l=i(95260),n=i(67684);i(54371);let r=(0,a.Z)([(0,l.Mo)("ha-icon-button-arrow-prev")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_icon",value:()=>"rtl"===n.E.document.dir?"M4,11V13H16L10.5,18.5L11.92,19.92L19.84,12L11.92,4.08L10.5,5.5L16,11H4Z":"M20,11V13H8L13.5,18.5L12.08,19.92L4.16,12L12.08,4.08L13.5,5.5L8,11H20Z"},{kind:"method",key:"render",value:function(){var e;return o.dy` <ha-icon-button .disabled="${this.disabled}" .label="${this.label||(null===(e=this.hass)||void 0===e?void 0:e.localize("ui.common.back"))||"Back"}" .path="${this._icon}"></ha-icon-button> `}}]}}),o.oi)},54371:(e,t,i)=>{i.r(t),i.d(t,{HaIconButton:()=>r});var a=i(309),o=(i(20210),i(5095)),l=i(95260),n=i(10694);i(37662);let r=(0,a.Z)([(0,l.Mo)("ha-icon-button")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"path",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"label",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:String,attribute:"aria-haspopup"})],key:"ariaHasPopup",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"hideTitle",value:()=>!1},{kind:"field",decorators:[(0,l.IO)("mwc-icon-button",!0)],key:"_button",value:void 0},{kind:"method",key:"focus",value:function(){var e;null===(e=this._button)||void 0===e||e.focus()}},{kind:"field",static:!0,key:"shadowRootOptions",value:()=>({mode:"open",delegatesFocus:!0})},{kind:"method",key:"render",value:function(){return o.dy` <mwc-icon-button aria-label="${(0,n.o)(this.label)}" title="${(0,n.o)(this.hideTitle?void 0:this.label)}" aria-haspopup="${(0,n.o)(this.ariaHasPopup)}" .disabled="${this.disabled}"> ${this.path?o.dy`<ha-svg-icon .path="${this.path}"></ha-svg-icon>`:o.dy`<slot></slot>`} </mwc-icon-button> `}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`:host{display:inline-block;outline:0}:host([disabled]){pointer-events:none}mwc-icon-button{--mdc-theme-on-primary:currentColor;--mdc-theme-text-disabled-on-light:var(--disabled-text-color)}`}}]}}),o.oi)},73957:(e,t,i)=>{var a=i(309),o=i(34541),l=i(47838),n=i(5095),r=i(95260),s=i(18394);class d{constructor(){this.notifications=void 0,this.notifications={}}processMessage(e){if("removed"===e.type)for(const t of Object.keys(e.notifications))delete this.notifications[t];else this.notifications={...this.notifications,...e.notifications};return Object.values(this.notifications)}}i(54371);(0,a.Z)([(0,r.Mo)("ha-menu-button")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"hassio",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({type:Boolean})],key:"narrow",value:()=>!1},{kind:"field",decorators:[(0,r.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,r.SB)()],key:"_hasNotifications",value:()=>!1},{kind:"field",decorators:[(0,r.SB)()],key:"_show",value:()=>!1},{kind:"field",key:"_alwaysVisible",value:()=>!1},{kind:"field",key:"_attachNotifOnConnect",value:()=>!1},{kind:"field",key:"_unsubNotifications",value:void 0},{kind:"method",key:"connectedCallback",value:function(){(0,o.Z)((0,l.Z)(i.prototype),"connectedCallback",this).call(this),this._attachNotifOnConnect&&(this._attachNotifOnConnect=!1,this._subscribeNotifications())}},{kind:"method",key:"disconnectedCallback",value:function(){(0,o.Z)((0,l.Z)(i.prototype),"disconnectedCallback",this).call(this),this._unsubNotifications&&(this._attachNotifOnConnect=!0,this._unsubNotifications(),this._unsubNotifications=void 0)}},{kind:"method",key:"render",value:function(){if(!this._show)return n.Ld;const e=this._hasNotifications&&(this.narrow||"always_hidden"===this.hass.dockedSidebar);return n.dy` <ha-icon-button .label="${this.hass.localize("ui.sidebar.sidebar_toggle")}" .path="${"M3,6H21V8H3V6M3,11H21V13H3V11M3,16H21V18H3V16Z"}" @click="${this._toggleMenu}"></ha-icon-button> ${e?n.dy`<div class="dot"></div>`:""} `}},{kind:"method",key:"firstUpdated",value:function(e){(0,o.Z)((0,l.Z)(i.prototype),"firstUpdated",this).call(this,e),this.hassio&&(this._alwaysVisible=(Number(window.parent.frontendVersion)||0)<20190710)}},{kind:"method",key:"willUpdate",value:function(e){if((0,o.Z)((0,l.Z)(i.prototype),"willUpdate",this).call(this,e),!e.has("narrow")&&!e.has("hass"))return;const t=e.has("hass")?e.get("hass"):this.hass,a=(e.has("narrow")?e.get("narrow"):this.narrow)||"always_hidden"===(null==t?void 0:t.dockedSidebar),n=this.narrow||"always_hidden"===this.hass.dockedSidebar;this.hasUpdated&&a===n||(this._show=n||this._alwaysVisible,n?this._subscribeNotifications():this._unsubNotifications&&(this._unsubNotifications(),this._unsubNotifications=void 0))}},{kind:"method",key:"_subscribeNotifications",value:function(){if(this._unsubNotifications)throw new Error("Already subscribed");this._unsubNotifications=((e,t)=>{const i=new d,a=e.subscribeMessage((e=>t(i.processMessage(e))),{type:"persistent_notification/subscribe"});return()=>{a.then((e=>null==e?void 0:e()))}})(this.hass.connection,(e=>{this._hasNotifications=e.length>0}))}},{kind:"method",key:"_toggleMenu",value:function(){(0,s.B)(this,"hass-toggle-menu")}},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`:host{position:relative}.dot{pointer-events:none;position:absolute;background-color:var(--accent-color);width:12px;height:12px;top:9px;right:7px;border-radius:50%;border:2px solid var(--app-header-background-color)}`}}]}}),n.oi)},37662:(e,t,i)=>{i.r(t),i.d(t,{HaSvgIcon:()=>n});var a=i(309),o=i(5095),l=i(95260);let n=(0,a.Z)([(0,l.Mo)("ha-svg-icon")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)()],key:"path",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"secondaryPath",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"viewBox",value:void 0},{kind:"method",key:"render",value:function(){return o.YP` <svg viewBox="${this.viewBox||"0 0 24 24"}" preserveAspectRatio="xMidYMid meet" focusable="false" role="img" aria-hidden="true"> <g> ${this.path?o.YP`<path class="primary-path" d="${this.path}"></path>`:o.Ld} ${this.secondaryPath?o.YP`<path class="secondary-path" d="${this.secondaryPath}"></path>`:o.Ld} </g> </svg>`}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`:host{display:var(--ha-icon-display,inline-flex);align-items:center;justify-content:center;position:relative;vertical-align:middle;fill:var(--icon-primary-color,currentcolor);width:var(--mdc-icon-size,24px);height:var(--mdc-icon-size,24px)}svg{width:100%;height:100%;pointer-events:none;display:block}path.primary-path{opacity:var(--icon-primary-opactity, 1)}path.secondary-path{fill:var(--icon-secondary-color,currentcolor);opacity:var(--icon-secondary-opactity, .5)}`}}]}}),o.oi)},51520:(e,t,i)=>{var a=i(309),o=i(34541),l=i(47838),n=i(42977),r=i(31338),s=i(5095),d=i(95260),c=i(67684);(0,a.Z)([(0,d.Mo)("ha-textfield")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"invalid",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"iconTrailing",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,d.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,d.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,o.Z)((0,l.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e,t=!1){const i=t?"trailing":"leading";return s.dy` <span class="mdc-text-field__icon mdc-text-field__icon--${i}" tabindex="${t?1:-1}"> <slot name="${i}Icon"></slot> </span> `}},{kind:"field",static:!0,key:"styles",value:()=>[r.W,s.iv`.mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}`,"rtl"===c.E.document.dir?s.iv`.mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}`:s.iv``]}]}}),n.P)},43910:(e,t,i)=>{var a=i(309),o=i(5095),l=i(95260),n=(i(54371),i(37662),i(51520),i(18394));(0,a.Z)([(0,l.Mo)("search-input")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"filter",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"suffix",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"autofocus",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"label",value:void 0},{kind:"method",key:"focus",value:function(){var e;null===(e=this._input)||void 0===e||e.focus()}},{kind:"field",decorators:[(0,l.IO)("ha-textfield",!0)],key:"_input",value:void 0},{kind:"method",key:"render",value:function(){return o.dy` <ha-textfield .autofocus="${this.autofocus}" .label="${this.label||this.hass.localize("ui.common.search")}" .value="${this.filter||""}" icon .iconTrailing="${this.filter||this.suffix}" @input="${this._filterInputChanged}"> <slot name="prefix" slot="leadingIcon"> <ha-svg-icon tabindex="-1" class="prefix" .path="${"M9.5,3A6.5,6.5 0 0,1 16,9.5C16,11.11 15.41,12.59 14.44,13.73L14.71,14H15.5L20.5,19L19,20.5L14,15.5V14.71L13.73,14.44C12.59,15.41 11.11,16 9.5,16A6.5,6.5 0 0,1 3,9.5A6.5,6.5 0 0,1 9.5,3M9.5,5C7,5 5,7 5,9.5C5,12 7,14 9.5,14C12,14 14,12 14,9.5C14,7 12,5 9.5,5Z"}"></ha-svg-icon> </slot> <div class="trailing" slot="trailingIcon"> ${this.filter&&o.dy` <ha-icon-button @click="${this._clearSearch}" .label="${this.hass.localize("ui.common.clear")}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}" class="clear-button"></ha-icon-button> `} <slot name="suffix"></slot> </div> </ha-textfield> `}},{kind:"method",key:"_filterChanged",value:async function(e){(0,n.B)(this,"value-changed",{value:String(e)})}},{kind:"method",key:"_filterInputChanged",value:async function(e){this._filterChanged(e.target.value)}},{kind:"method",key:"_clearSearch",value:async function(){this._filterChanged("")}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`:host{display:inline-flex}ha-icon-button,ha-svg-icon{color:var(--primary-text-color)}ha-svg-icon{outline:0}.clear-button{--mdc-icon-size:20px}ha-textfield{display:inherit}.trailing{display:flex;align-items:center}`}}]}}),o.oi)},96710:(e,t,i)=>{var a=i(309),o=(i(14271),i(33829),i(5095)),l=i(95260),n=i(18394),r=i(51750),s=i(34541),d=i(47838),c=i(3239),h=i(53180),u=i(10694),v=i(86634),b=i(14516),p=i(47715),m=i(72218),f=i(2537),k=i(29950),y=i(62782),_=(i(74376),i(37662),i(43910),i(93217));let g;const w=()=>(g||(g=(0,_.Ud)(new Worker(new URL(i.p+i.u(8456),i.b),{type:"module"}))),g);(0,a.Z)([(0,l.Mo)("ha-data-table")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Object})],key:"columns",value:()=>({})},{kind:"field",decorators:[(0,l.Cb)({type:Array})],key:"data",value:()=>[]},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"selectable",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"clickable",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"hasFab",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"appendRow",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,attribute:"auto-height"})],key:"autoHeight",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"id",value:()=>"id"},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"noDataText",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"searchLabel",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,attribute:"no-label-float"})],key:"noLabelFloat",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"filter",value:()=>""},{kind:"field",decorators:[(0,l.SB)()],key:"_filterable",value:()=>!1},{kind:"field",decorators:[(0,l.SB)()],key:"_filter",value:()=>""},{kind:"field",decorators:[(0,l.SB)()],key:"_sortColumn",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_sortDirection",value:()=>null},{kind:"field",decorators:[(0,l.SB)()],key:"_filteredData",value:()=>[]},{kind:"field",decorators:[(0,l.SB)()],key:"_headerHeight",value:()=>0},{kind:"field",decorators:[(0,l.IO)("slot[name='header']")],key:"_header",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_items",value:()=>[]},{kind:"field",key:"_checkableRowsCount",value:void 0},{kind:"field",key:"_checkedRows",value:()=>[]},{kind:"field",key:"_sortColumns",value:()=>({})},{kind:"field",key:"curRequest",value:()=>0},{kind:"field",decorators:[(0,p.i)(".scroller")],key:"_savedScrollPos",value:void 0},{kind:"field",key:"_debounceSearch",value(){return(0,m.D)((e=>{this._filter=e}),100,!1)}},{kind:"method",key:"clearSelection",value:function(){this._checkedRows=[],this._checkedRowsChanged()}},{kind:"method",key:"connectedCallback",value:function(){(0,s.Z)((0,d.Z)(i.prototype),"connectedCallback",this).call(this),this._items.length&&(this._items=[...this._items])}},{kind:"method",key:"firstUpdated",value:function(){this.updateComplete.then((()=>this._calcTableHeight()))}},{kind:"method",key:"willUpdate",value:function(e){if((0,s.Z)((0,d.Z)(i.prototype),"willUpdate",this).call(this,e),this.hasUpdated||(0,y.o)(),e.has("columns")){this._filterable=Object.values(this.columns).some((e=>e.filterable));for(const e in this.columns)if(this.columns[e].direction){this._sortDirection=this.columns[e].direction,this._sortColumn=e;break}const e=(0,c.Z)(this.columns);Object.values(e).forEach((e=>{delete e.title,delete e.template})),this._sortColumns=e}e.has("filter")&&this._debounceSearch(this.filter),e.has("data")&&(this._checkableRowsCount=this.data.filter((e=>!1!==e.selectable)).length),(e.has("data")||e.has("columns")||e.has("_filter")||e.has("_sortColumn")||e.has("_sortDirection"))&&this._sortFilterData()}},{kind:"method",key:"render",value:function(){return o.dy` <div class="mdc-data-table"> <slot name="header" @slotchange="${this._calcTableHeight}"> ${this._filterable?o.dy` <div class="table-header"> <search-input .hass="${this.hass}" @value-changed="${this._handleSearchChange}" .label="${this.searchLabel}" .noLabelFloat="${this.noLabelFloat}"></search-input> </div> `:""} </slot> <div class="mdc-data-table__table ${(0,h.$)({"auto-height":this.autoHeight})}" role="table" aria-rowcount="${this._filteredData.length+1}" style="${(0,v.V)({height:this.autoHeight?53*(this._filteredData.length||1)+53+"px":`calc(100% - ${this._headerHeight}px)`})}"> <div class="mdc-data-table__header-row" role="row" aria-rowindex="1"> ${this.selectable?o.dy` <div class="mdc-data-table__header-cell mdc-data-table__header-cell--checkbox" role="columnheader"> <ha-checkbox class="mdc-data-table__row-checkbox" @change="${this._handleHeaderRowCheckboxClick}" .indeterminate="${this._checkedRows.length&&this._checkedRows.length!==this._checkableRowsCount}" .checked="${this._checkedRows.length&&this._checkedRows.length===this._checkableRowsCount}"> </ha-checkbox> </div> `:""} ${Object.entries(this.columns).map((([e,t])=>{if(t.hidden)return"";const i=e===this._sortColumn,a={"mdc-data-table__header-cell--numeric":"numeric"===t.type,"mdc-data-table__header-cell--icon":"icon"===t.type,"mdc-data-table__header-cell--icon-button":"icon-button"===t.type,"mdc-data-table__header-cell--overflow-menu":"overflow-menu"===t.type,sortable:Boolean(t.sortable),"not-sorted":Boolean(t.sortable&&!i),grows:Boolean(t.grows)};return o.dy` <div aria-label="${(0,u.o)(t.label)}" class="mdc-data-table__header-cell ${(0,h.$)(a)}" style="${t.width?(0,v.V)({[t.grows?"minWidth":"width"]:t.width,maxWidth:t.maxWidth||""}):""}" role="columnheader" aria-sort="${(0,u.o)(i?"desc"===this._sortDirection?"descending":"ascending":void 0)}" @click="${this._handleHeaderClick}" .columnId="${e}"> ${t.sortable?o.dy` <ha-svg-icon .path="${i&&"desc"===this._sortDirection?"M11,4H13V16L18.5,10.5L19.92,11.92L12,19.84L4.08,11.92L5.5,10.5L11,16V4Z":"M13,20H11V8L5.5,13.5L4.08,12.08L12,4.16L19.92,12.08L18.5,13.5L13,8V20Z"}"></ha-svg-icon> `:""} <span>${t.title}</span> </div> `}))} </div> ${this._filteredData.length?o.dy` <lit-virtualizer scroller class="mdc-data-table__content scroller ha-scrollbar" @scroll="${this._saveScrollPos}" .items="${this._items}" .keyFunction="${this._keyFunction}" .renderItem="${this._renderRow}"></lit-virtualizer> `:o.dy` <div class="mdc-data-table__content"> <div class="mdc-data-table__row" role="row"> <div class="mdc-data-table__cell grows center" role="cell"> ${this.noDataText||this.hass.localize("ui.components.data-table.no-data")} </div> </div> </div> `} </div> </div> `}},{kind:"field",key:"_keyFunction",value(){return e=>e[this.id]||e}},{kind:"field",key:"_renderRow",value(){return(e,t)=>e?e.append?o.dy`<div class="mdc-data-table__row">${e.content}</div>`:e.empty?o.dy`<div class="mdc-data-table__row"></div>`:o.dy` <div aria-rowindex="${t+2}" role="row" .rowId="${e[this.id]}" @click="${this._handleRowClick}" class="mdc-data-table__row ${(0,h.$)({"mdc-data-table__row--selected":this._checkedRows.includes(String(e[this.id])),clickable:this.clickable})}" aria-selected="${(0,u.o)(!!this._checkedRows.includes(String(e[this.id]))||void 0)}" .selectable="${!1!==e.selectable}"> ${this.selectable?o.dy` <div class="mdc-data-table__cell mdc-data-table__cell--checkbox" role="cell"> <ha-checkbox class="mdc-data-table__row-checkbox" @change="${this._handleRowCheckboxClick}" .rowId="${e[this.id]}" .disabled="${!1===e.selectable}" .checked="${this._checkedRows.includes(String(e[this.id]))}"> </ha-checkbox> </div> `:""} ${Object.entries(this.columns).map((([t,i])=>i.hidden?"":o.dy` <div role="${i.main?"rowheader":"cell"}" class="mdc-data-table__cell ${(0,h.$)({"mdc-data-table__cell--flex":"flex"===i.type,"mdc-data-table__cell--numeric":"numeric"===i.type,"mdc-data-table__cell--icon":"icon"===i.type,"mdc-data-table__cell--icon-button":"icon-button"===i.type,"mdc-data-table__cell--overflow-menu":"overflow-menu"===i.type,grows:Boolean(i.grows),forceLTR:Boolean(i.forceLTR)})}" style="${i.width?(0,v.V)({[i.grows?"minWidth":"width"]:i.width,maxWidth:i.maxWidth?i.maxWidth:""}):""}"> ${i.template?i.template(e):e[t]} </div> `))} </div> `:o.Ld}},{kind:"method",key:"_sortFilterData",value:async function(){const e=(new Date).getTime();this.curRequest++;const t=this.curRequest;let i=this.data;this._filter&&(i=await this._memFilterData(this.data,this._sortColumns,this._filter));const a=this._sortColumn?((e,t,i,a,o)=>w().sortData(e,t,i,a,o))(i,this._sortColumns[this._sortColumn],this._sortDirection,this._sortColumn,this.hass.locale.language):i,[o]=await Promise.all([a,f.y]),l=(new Date).getTime()-e;if(l<100&&await new Promise((e=>{setTimeout(e,100-l)})),this.curRequest===t){if(this.appendRow||this.hasFab){const e=[...o];this.appendRow&&e.push({append:!0,content:this.appendRow}),this.hasFab&&e.push({empty:!0}),this._items=e}else this._items=o;this._filteredData=o}}},{kind:"field",key:"_memFilterData",value:()=>(0,b.Z)(((e,t,i)=>((e,t,i)=>w().filterData(e,t,i))(e,t,i)))},{kind:"method",key:"_handleHeaderClick",value:function(e){const t=e.currentTarget.columnId;this.columns[t].sortable&&(this._sortDirection&&this._sortColumn===t?"asc"===this._sortDirection?this._sortDirection="desc":this._sortDirection=null:this._sortDirection="asc",this._sortColumn=null===this._sortDirection?void 0:t,(0,n.B)(this,"sorting-changed",{column:t,direction:this._sortDirection}))}},{kind:"method",key:"_handleHeaderRowCheckboxClick",value:function(e){e.target.checked?(this._checkedRows=this._filteredData.filter((e=>!1!==e.selectable)).map((e=>e[this.id])),this._checkedRowsChanged()):(this._checkedRows=[],this._checkedRowsChanged())}},{kind:"field",key:"_handleRowCheckboxClick",value(){return e=>{const t=e.currentTarget,i=t.rowId;if(t.checked){if(this._checkedRows.includes(i))return;this._checkedRows=[...this._checkedRows,i]}else this._checkedRows=this._checkedRows.filter((e=>e!==i));this._checkedRowsChanged()}}},{kind:"field",key:"_handleRowClick",value(){return e=>{const t=e.target;if(["HA-CHECKBOX","MWC-BUTTON"].includes(t.tagName))return;const i=e.currentTarget.rowId;(0,n.B)(this,"row-click",{id:i},{bubbles:!1})}}},{kind:"method",key:"_checkedRowsChanged",value:function(){this._items.length&&(this._items=[...this._items]),(0,n.B)(this,"selection-changed",{value:this._checkedRows})}},{kind:"method",key:"_handleSearchChange",value:function(e){this.filter||this._debounceSearch(e.detail.value)}},{kind:"method",key:"_calcTableHeight",value:async function(){this.autoHeight||(await this.updateComplete,this._headerHeight=this._header.clientHeight)}},{kind:"method",decorators:[(0,l.hO)({passive:!0})],key:"_saveScrollPos",value:function(e){this._savedScrollPos=e.target.scrollTop}},{kind:"get",static:!0,key:"styles",value:function(){return[k.$c,o.iv`:host{height:100%}.mdc-data-table__content{font-family:Roboto,sans-serif;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-size:.875rem;line-height:1.25rem;font-weight:400;letter-spacing:.0178571429em;text-decoration:inherit;text-transform:inherit}.mdc-data-table{background-color:var(--data-table-background-color);border-radius:4px;border-width:1px;border-style:solid;border-color:var(--divider-color);display:inline-flex;flex-direction:column;box-sizing:border-box;overflow:hidden}.mdc-data-table__row--selected{background-color:rgba(var(--rgb-primary-color),.04)}.mdc-data-table__row{display:flex;width:100%;height:52px}.mdc-data-table__row~.mdc-data-table__row{border-top:1px solid var(--divider-color)}.mdc-data-table__row.clickable:not(
+.mdc-data-table__row--selected
+):hover{background-color:rgba(var(--rgb-primary-text-color),.04)}.mdc-data-table__header-cell{color:var(--primary-text-color)}.mdc-data-table__cell{color:var(--primary-text-color)}.mdc-data-table__header-row{height:56px;display:flex;width:100%;border-bottom:1px solid var(--divider-color);overflow-x:auto}.mdc-data-table__header-row::-webkit-scrollbar{display:none}.mdc-data-table__cell,.mdc-data-table__header-cell{padding-right:16px;padding-left:16px;align-self:center;overflow:hidden;text-overflow:ellipsis;flex-shrink:0;box-sizing:border-box}.mdc-data-table__cell.mdc-data-table__cell--flex{display:flex;overflow:initial}.mdc-data-table__cell.mdc-data-table__cell--icon{overflow:initial}.mdc-data-table__cell--checkbox,.mdc-data-table__header-cell--checkbox{padding-left:16px;padding-right:0;width:60px}:host([dir=rtl]) .mdc-data-table__cell--checkbox,:host([dir=rtl]) .mdc-data-table__header-cell--checkbox{padding-left:0;padding-right:16px}.mdc-data-table__table{height:100%;width:100%;border:0;white-space:nowrap}.mdc-data-table__cell{font-family:Roboto,sans-serif;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-size:.875rem;line-height:1.25rem;font-weight:400;letter-spacing:.0178571429em;text-decoration:inherit;text-transform:inherit}.mdc-data-table__cell a{color:inherit;text-decoration:none}.mdc-data-table__cell--numeric{text-align:right}:host([dir=rtl]) .mdc-data-table__cell--numeric{text-align:left}.mdc-data-table__cell--icon{color:var(--secondary-text-color);text-align:center}.mdc-data-table__cell--icon,.mdc-data-table__header-cell--icon{width:54px}.mdc-data-table__cell--icon img{width:24px;height:24px}.mdc-data-table__header-cell.mdc-data-table__header-cell--icon{text-align:center}.mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:hover,.mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:not(
+.not-sorted
+){text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:hover,:host([dir=rtl]) .mdc-data-table__header-cell.sortable.mdc-data-table__header-cell--icon:not(
+.not-sorted
+){text-align:right}.mdc-data-table__cell--icon:first-child ha-icon,.mdc-data-table__cell--icon:first-child ha-state-icon,.mdc-data-table__cell--icon:first-child ha-svg-icon,.mdc-data-table__cell--icon:first-child img{margin-left:8px}:host([dir=rtl]) .mdc-data-table__cell--icon:first-child ha-icon,:host([dir=rtl]) .mdc-data-table__cell--icon:first-child ha-state-icon,:host([dir=rtl]) .mdc-data-table__cell--icon:first-child ha-svg-icon :host([dir=rtl]) .mdc-data-table__cell--icon:first-child img{margin-left:auto;margin-right:8px}.mdc-data-table__cell--icon:first-child state-badge{margin-right:-8px}:host([dir=rtl]) .mdc-data-table__cell--icon:first-child state-badge{margin-right:auto;margin-left:-8px}.mdc-data-table__cell--icon-button,.mdc-data-table__cell--overflow-menu,.mdc-data-table__header-cell--icon-button,.mdc-data-table__header-cell--overflow-menu{padding:8px}.mdc-data-table__cell--icon-button,.mdc-data-table__header-cell--icon-button{width:56px}.mdc-data-table__cell--icon-button,.mdc-data-table__cell--overflow-menu{color:var(--secondary-text-color);text-overflow:clip}.mdc-data-table__cell--icon-button:first-child,.mdc-data-table__cell--icon-button:last-child,.mdc-data-table__header-cell--icon-button:first-child,.mdc-data-table__header-cell--icon-button:last-child{width:64px}.mdc-data-table__cell--icon-button:first-child,.mdc-data-table__cell--overflow-menu:first-child,.mdc-data-table__header-cell--icon-button:first-child,.mdc-data-table__header-cell--overflow-menu:first-child{padding-left:16px}:host([dir=rtl]) .mdc-data-table__cell--overflow-menu:first-child,:host([dir=rtl]) .mdc-data-table__header-cell--overflow-menu:first-child{padding-left:8px;padding-right:16px}.mdc-data-table__cell--icon-button:last-child,.mdc-data-table__cell--overflow-menu:last-child,.mdc-data-table__header-cell--icon-button:last-child,.mdc-data-table__header-cell--overflow-menu:last-child{padding-right:16px}:host([dir=rtl]) .mdc-data-table__cell--icon-button:last-child,:host([dir=rtl]) .mdc-data-table__cell--overflow-menu:last-child,:host([dir=rtl]) .mdc-data-table__header-cell--icon-button:last-child,:host([dir=rtl]) .mdc-data-table__header-cell--overflow-menu:last-child{padding-right:8px;padding-left:16px}.mdc-data-table__cell--overflow-menu,.mdc-data-table__header-cell--overflow-menu{overflow:initial}.mdc-data-table__cell--icon-button a{color:var(--secondary-text-color)}.mdc-data-table__header-cell{font-family:Roboto,sans-serif;-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-size:.875rem;line-height:1.375rem;font-weight:500;letter-spacing:.0071428571em;text-decoration:inherit;text-transform:inherit;text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell{text-align:right}.mdc-data-table__header-cell--numeric{text-align:right}.mdc-data-table__header-cell--numeric.sortable:hover,.mdc-data-table__header-cell--numeric.sortable:not(.not-sorted){text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell--numeric{text-align:left}:host([dir=rtl]) .mdc-data-table__header-cell--numeric.sortable:hover,:host([dir=rtl]) .mdc-data-table__header-cell--numeric.sortable:not(.not-sorted){text-align:right}:host{display:block}.mdc-data-table{display:block;border-width:var(--data-table-border-width,1px);height:100%}.mdc-data-table__header-cell{overflow:hidden;position:relative}.mdc-data-table__header-cell span{position:relative;left:0px}:host([dir=rtl]) .mdc-data-table__header-cell span{left:auto;right:0px}.mdc-data-table__header-cell.sortable{cursor:pointer}.mdc-data-table__header-cell>*{transition:left .2s ease}:host([dir=rtl]) .mdc-data-table__header-cell>*{transition:right .2s ease}.mdc-data-table__header-cell ha-svg-icon{top:-3px;position:absolute}.mdc-data-table__header-cell.not-sorted ha-svg-icon{left:-20px}:host([dir=rtl]) .mdc-data-table__header-cell.not-sorted ha-svg-icon{right:-20px}.mdc-data-table__header-cell.sortable.not-sorted:hover span,.mdc-data-table__header-cell.sortable:not(.not-sorted) span{left:24px}:host([dir=rtl]) .mdc-data-table__header-cell.sortable.not-sorted:hover span,:host([dir=rtl]) .mdc-data-table__header-cell.sortable:not(.not-sorted) span{left:auto;right:24px}.mdc-data-table__header-cell.sortable:hover.not-sorted ha-svg-icon,.mdc-data-table__header-cell.sortable:not(.not-sorted) ha-svg-icon{left:12px}:host([dir=rtl]) .mdc-data-table__header-cell.sortable:hover.not-sorted ha-svg-icon,:host([dir=rtl]) .mdc-data-table__header-cell.sortable:not(.not-sorted) ha-svg-icon{left:auto;right:12px}.table-header{border-bottom:1px solid var(--divider-color)}search-input{display:block;flex:1}slot[name=header]{display:block}.center{text-align:center}.secondary{color:var(--secondary-text-color)}.scroller{height:calc(100% - 57px);overflow:overlay!important}.mdc-data-table__table.auto-height .scroller{overflow-y:hidden!important}.grows{flex-grow:1;flex-shrink:1}.forceLTR{direction:ltr}.clickable{cursor:pointer}lit-virtualizer{contain:size layout!important;overscroll-behavior:contain}`]}}]}}),o.oi);i(27763);var x=i(52996),C=(i(33358),i(73957),i(98734));(0,a.Z)([(0,l.Mo)("ha-tab")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"active",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)()],key:"name",value:void 0},{kind:"field",decorators:[(0,l.GC)("mwc-ripple")],key:"_ripple",value:void 0},{kind:"field",decorators:[(0,l.SB)()],key:"_shouldRenderRipple",value:()=>!1},{kind:"method",key:"render",value:function(){return o.dy` <div tabindex="0" role="tab" aria-selected="${this.active}" aria-label="${(0,u.o)(this.name)}" @focus="${this.handleRippleFocus}" @blur="${this.handleRippleBlur}" @mousedown="${this.handleRippleActivate}" @mouseup="${this.handleRippleDeactivate}" @mouseenter="${this.handleRippleMouseEnter}" @mouseleave="${this.handleRippleMouseLeave}" @touchstart="${this.handleRippleActivate}" @touchend="${this.handleRippleDeactivate}" @touchcancel="${this.handleRippleDeactivate}" @keydown="${this._handleKeyDown}"> ${this.narrow?o.dy`<slot name="icon"></slot>`:""} <span class="name">${this.name}</span> ${this._shouldRenderRipple?o.dy`<mwc-ripple></mwc-ripple>`:""} </div> `}},{kind:"field",key:"_rippleHandlers",value(){return new C.A((()=>(this._shouldRenderRipple=!0,this._ripple)))}},{kind:"method",key:"_handleKeyDown",value:function(e){"Enter"===e.key&&e.target.click()}},{kind:"method",decorators:[(0,l.hO)({passive:!0})],key:"handleRippleActivate",value:function(e){this._rippleHandlers.startPress(e)}},{kind:"method",key:"handleRippleDeactivate",value:function(){this._rippleHandlers.endPress()}},{kind:"method",key:"handleRippleMouseEnter",value:function(){this._rippleHandlers.startHover()}},{kind:"method",key:"handleRippleMouseLeave",value:function(){this._rippleHandlers.endHover()}},{kind:"method",key:"handleRippleFocus",value:function(){this._rippleHandlers.startFocus()}},{kind:"method",key:"handleRippleBlur",value:function(){this._rippleHandlers.endFocus()}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`div{padding:0 32px;display:flex;flex-direction:column;text-align:center;box-sizing:border-box;align-items:center;justify-content:center;width:100%;height:var(--header-height);cursor:pointer;position:relative;outline:0}.name{white-space:nowrap;overflow:hidden;text-overflow:ellipsis;max-width:100%}:host([active]){color:var(--primary-color)}:host(:not([narrow])[active]) div{border-bottom:2px solid var(--primary-color)}:host([narrow]){min-width:0;display:flex;justify-content:center;overflow:hidden}:host([narrow]) div{padding:0 4px}`}}]}}),o.oi),(0,a.Z)([(0,l.Mo)("hass-tabs-subpage")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"supervisor",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"localizeFunc",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:String,attribute:"back-path"})],key:"backPath",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"backCallback",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,attribute:"main-page"})],key:"mainPage",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"tabs",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0,attribute:"is-wide"})],key:"isWide",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"rtl",value:()=>!1},{kind:"field",decorators:[(0,l.SB)()],key:"_activeTab",value:void 0},{kind:"field",decorators:[(0,p.i)(".content")],key:"_savedScrollPos",value:void 0},{kind:"field",key:"_getTabs",value(){return(0,b.Z)(((e,t,i,a,l,n,r)=>{const s=e.filter((e=>(!e.component||e.core||(0,x.p)(this.hass,e.component))&&(!e.advancedOnly||i)));if(s.length<2){if(1===s.length){const e=s[0];return[e.translationKey?r(e.translationKey):e.name]}return[""]}return s.map((e=>o.dy` <a href="${e.path}"> <ha-tab .hass="${this.hass}" .active="${e.path===(null==t?void 0:t.path)}" .narrow="${this.narrow}" .name="${e.translationKey?r(e.translationKey):e.name}"> ${e.iconPath?o.dy`<ha-svg-icon slot="icon" .path="${e.iconPath}"></ha-svg-icon>`:""} </ha-tab> </a> `))}))}},{kind:"method",key:"willUpdate",value:function(e){if(e.has("route")&&(this._activeTab=this.tabs.find((e=>`${this.route.prefix}${this.route.path}`.includes(e.path)))),e.has("hass")){const t=e.get("hass");t&&t.language===this.hass.language||(this.rtl=(0,r.HE)(this.hass))}(0,s.Z)((0,d.Z)(i.prototype),"willUpdate",this).call(this,e)}},{kind:"method",key:"render",value:function(){var e,t;const i=this._getTabs(this.tabs,this._activeTab,null===(e=this.hass.userData)||void 0===e?void 0:e.showAdvanced,this.hass.config.components,this.hass.language,this.narrow,this.localizeFunc||this.hass.localize),a=i.length>1;return o.dy` <div class="toolbar"> ${this.mainPage||!this.backPath&&null!==(t=history.state)&&void 0!==t&&t.root?o.dy` <ha-menu-button .hassio="${this.supervisor}" .hass="${this.hass}" .narrow="${this.narrow}"></ha-menu-button> `:this.backPath?o.dy` <a href="${this.backPath}"> <ha-icon-button-arrow-prev .hass="${this.hass}"></ha-icon-button-arrow-prev> </a> `:o.dy` <ha-icon-button-arrow-prev .hass="${this.hass}" @click="${this._backTapped}"></ha-icon-button-arrow-prev> `} ${this.narrow||!a?o.dy`<div class="main-title"> <slot name="header">${a?"":i[0]}</slot> </div>`:""} ${a?o.dy` <div id="tabbar" class="${(0,h.$)({"bottom-bar":this.narrow})}"> ${i} </div> `:""} <div id="toolbar-icon"> <slot name="toolbar-icon"></slot> </div> </div> <div class="content ha-scrollbar ${(0,h.$)({tabs:a})}" @scroll="${this._saveScrollPos}"> <slot></slot> </div> <div id="fab" class="${(0,h.$)({tabs:a})}"> <slot name="fab"></slot> </div> `}},{kind:"method",decorators:[(0,l.hO)({passive:!0})],key:"_saveScrollPos",value:function(e){this._savedScrollPos=e.target.scrollTop}},{kind:"method",key:"_backTapped",value:function(){this.backCallback?this.backCallback():history.back()}},{kind:"get",static:!0,key:"styles",value:function(){return[k.$c,o.iv`:host{display:block;height:100%;background-color:var(--primary-background-color)}:host([narrow]){width:100%;position:fixed}ha-menu-button{margin-right:24px}.toolbar{display:flex;align-items:center;font-size:20px;height:var(--header-height);background-color:var(--sidebar-background-color);font-weight:400;border-bottom:1px solid var(--divider-color);padding:8px 12px;box-sizing:border-box}@media (max-width:599px){.toolbar{padding:4px}}.toolbar a{color:var(--sidebar-text-color);text-decoration:none}.bottom-bar a{width:25%}#tabbar{display:flex;font-size:14px;overflow:hidden}#tabbar>a{overflow:hidden;max-width:45%}#tabbar.bottom-bar{position:absolute;bottom:0;left:0;padding:0 16px;box-sizing:border-box;background-color:var(--sidebar-background-color);border-top:1px solid var(--divider-color);justify-content:space-around;z-index:2;font-size:12px;width:100%;padding-bottom:env(safe-area-inset-bottom)}#tabbar:not(.bottom-bar){flex:1;justify-content:center}:host(:not([narrow])) #toolbar-icon{min-width:40px}::slotted([slot=toolbar-icon]),ha-icon-button-arrow-prev,ha-menu-button{display:flex;flex-shrink:0;pointer-events:auto;color:var(--sidebar-icon-color)}.main-title{flex:1;max-height:var(--header-height);line-height:20px;color:var(--sidebar-text-color);margin:var(--main-title-margin,0 0 0 24px)}.content{position:relative;width:calc(100% - env(safe-area-inset-left) - env(safe-area-inset-right));margin-left:env(safe-area-inset-left);margin-right:env(safe-area-inset-right);height:calc(100% - 1px - var(--header-height));height:calc(100% - 1px - var(--header-height) - env(safe-area-inset-bottom));overflow:auto;-webkit-overflow-scrolling:touch}:host([narrow]) .content.tabs{height:calc(100% - 2 * var(--header-height));height:calc(100% - 2 * var(--header-height) - env(safe-area-inset-bottom))}#fab{position:fixed;right:calc(16px + env(safe-area-inset-right));bottom:calc(16px + env(safe-area-inset-bottom));z-index:1}:host([narrow]) #fab.tabs{bottom:calc(84px + env(safe-area-inset-bottom))}#fab[is-wide]{bottom:24px;right:24px}:host([rtl]) #fab{right:auto;left:calc(16px + env(safe-area-inset-left))}:host([rtl][is-wide]) #fab{bottom:24px;left:24px;right:auto}`]}}]}}),o.oi),(0,a.Z)([(0,l.Mo)("hass-tabs-subpage-data-table")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"localizeFunc",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"isWide",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"supervisor",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,attribute:"main-page"})],key:"mainPage",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Object})],key:"columns",value:()=>({})},{kind:"field",decorators:[(0,l.Cb)({type:Array})],key:"data",value:()=>[]},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"selectable",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"clickable",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"hasFab",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"appendRow",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"id",value:()=>"id"},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"filter",value:()=>""},{kind:"field",decorators:[(0,l.Cb)()],key:"searchLabel",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Array})],key:"activeFilters",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"hiddenLabel",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Number})],key:"numHidden",value:()=>0},{kind:"field",decorators:[(0,l.Cb)({type:String,attribute:"back-path"})],key:"backPath",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"backCallback",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:String})],key:"noDataText",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"empty",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"tabs",value:()=>[]},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"hideFilterMenu",value:()=>!1},{kind:"field",decorators:[(0,l.IO)("ha-data-table",!0)],key:"_dataTable",value:void 0},{kind:"method",key:"clearSelection",value:function(){this._dataTable.clearSelection()}},{kind:"method",key:"render",value:function(){const e=this.numHidden?this.hiddenLabel||this.hass.localize("ui.components.data-table.hidden",{number:this.numHidden})||this.numHidden:void 0,t=this.activeFilters?o.dy`${this.hass.localize("ui.components.data-table.filtering_by")} ${this.activeFilters.join(", ")} ${e?`(${e})`:""}`:e,i=o.dy`<search-input .hass="${this.hass}" .filter="${this.filter}" .suffix="${!this.narrow}" @value-changed="${this._handleSearchChange}" .label="${this.searchLabel}"> ${this.narrow?"":o.dy`<div class="filters" slot="suffix" @click="${this._preventDefault}"> ${t?o.dy`<div class="active-filters"> ${t} <mwc-button @click="${this._clearFilter}"> ${this.hass.localize("ui.components.data-table.clear")} </mwc-button> </div>`:""} <slot name="filter-menu"></slot> </div>`} </search-input>`;return o.dy` <hass-tabs-subpage .hass="${this.hass}" .localizeFunc="${this.localizeFunc}" .narrow="${this.narrow}" .isWide="${this.isWide}" .backPath="${this.backPath}" .backCallback="${this.backCallback}" .route="${this.route}" .tabs="${this.tabs}" .mainPage="${this.mainPage}" .supervisor="${this.supervisor}"> ${this.empty?o.dy`<div class="center"> <slot name="empty">${this.noDataText}</slot> </div>`:o.dy`${this.hideFilterMenu?"":o.dy` <div slot="toolbar-icon"> ${this.narrow?o.dy` <div class="filter-menu"> ${this.numHidden||this.activeFilters?o.dy`<span class="badge">${this.numHidden||"!"}</span>`:""} <slot name="filter-menu"></slot> </div> `:""}<slot name="toolbar-icon"></slot> </div> `} ${this.narrow?o.dy` <div slot="header"> <slot name="header"> <div class="search-toolbar">${i}</div> </slot> </div> `:""} <ha-data-table .hass="${this.hass}" .columns="${this.columns}" .data="${this.data}" .noDataText="${this.noDataText}" .filter="${this.filter}" .selectable="${this.selectable}" .hasFab="${this.hasFab}" .id="${this.id}" .dir="${(0,r.Zu)(this.hass)}" .clickable="${this.clickable}" .appendRow="${this.appendRow}"> ${this.narrow?o.dy` <div slot="header"></div> `:o.dy` <div slot="header"> <slot name="header"> <div class="table-header">${i}</div> </slot> </div> `} </ha-data-table>`} <div slot="fab"><slot name="fab"></slot></div> </hass-tabs-subpage> `}},{kind:"method",key:"_preventDefault",value:function(e){e.preventDefault()}},{kind:"method",key:"_handleSearchChange",value:function(e){this.filter!==e.detail.value&&(this.filter=e.detail.value,(0,n.B)(this,"search-changed",{value:this.filter}))}},{kind:"method",key:"_clearFilter",value:function(){(0,n.B)(this,"clear-filter")}},{kind:"get",static:!0,key:"styles",value:function(){return o.iv`ha-data-table{width:100%;height:100%;--data-table-border-width:0}:host(:not([narrow])) ha-data-table{height:calc(100vh - 1px - var(--header-height));display:block}:host([narrow]) hass-tabs-subpage{--main-title-margin:0}.table-header{display:flex;align-items:center;--mdc-shape-small:0;height:56px}.search-toolbar{display:flex;align-items:center;color:var(--secondary-text-color)}search-input{--mdc-text-field-fill-color:var(--sidebar-background-color);--mdc-text-field-idle-line-color:var(--divider-color);--text-field-overflow:visible;z-index:5}.table-header search-input{display:block;position:absolute;top:0;right:0;left:0}.search-toolbar search-input{display:block;width:100%;color:var(--secondary-text-color);--mdc-ripple-color:transparant}.filters{--mdc-text-field-fill-color:var(--input-fill-color);--mdc-text-field-idle-line-color:var(--input-idle-line-color);--mdc-shape-small:4px;--text-field-overflow:initial;display:flex;justify-content:flex-end;color:var(--primary-text-color)}.active-filters{color:var(--primary-text-color);position:relative;display:flex;align-items:center;padding:2px 2px 2px 8px;margin-left:4px;margin-inline-start:4px;margin-inline-end:initial;font-size:14px;width:max-content;cursor:initial;direction:var(--direction)}.active-filters ha-svg-icon{color:var(--primary-color)}.active-filters mwc-button{margin-left:8px;margin-inline-start:8px;margin-inline-end:initial;direction:var(--direction)}.active-filters::before{background-color:var(--primary-color);opacity:.12;border-radius:4px;position:absolute;top:0;right:0;bottom:0;left:0;content:""}.badge{min-width:20px;box-sizing:border-box;border-radius:50%;font-weight:400;background-color:var(--primary-color);line-height:20px;text-align:center;padding:0px 4px;color:var(--text-primary-color);position:absolute;right:0;top:4px;font-size:.65em}.filter-menu{position:relative}.center{display:flex;align-items:center;justify-content:center;text-align:center;box-sizing:border-box;height:100%;width:100%;padding:16px}`}}]}}),o.oi)},23216:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.r(t);var o=i(43170),l=i(27499),n=i(16723),r=i(82874),s=i(32812),d=i(99331),c=i(27815),h=i(64532),u=i(11674),v=i(53285);const e=async()=>{const e=(0,u.sS)(),t=[];(0,n.Y)()&&await Promise.all([i.e(9460),i.e(254)]).then(i.bind(i,20254)),(0,s.Y)()&&await Promise.all([i.e(7021),i.e(9460),i.e(8196)]).then(i.bind(i,48196)),(0,o.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(6554)]).then(i.bind(i,76554)).then((()=>(0,v.H)()))),(0,l.Yq)(e)&&t.push(Promise.all([i.e(7021),i.e(2684)]).then(i.bind(i,72684))),(0,r.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(9029)]).then(i.bind(i,69029))),(0,d.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(7048)]).then(i.bind(i,87048))),(0,c.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(655)]).then(i.bind(i,20655)).then((()=>i.e(4827).then(i.t.bind(i,64827,23))))),(0,h.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(759)]).then(i.bind(i,20759))),0!==t.length&&await Promise.all(t).then((()=>(0,v.n)(e)))};await e(),a()}catch(e){a(e)}}),1)},23636:(e,t,i)=>{i.d(t,{j:()=>a});const a=async()=>{try{new ResizeObserver((()=>{}))}catch(e){window.ResizeObserver=(await i.e(5442).then(i.bind(i,5442))).default}}},62782:(e,t,i)=>{i.d(t,{o:()=>o});var a=i(23636);const o=async()=>{await(0,a.j)(),await i.e(8984).then(i.bind(i,68984))}},72824:(e,t,i)=>{i.d(t,{X1:()=>a,u4:()=>o,zC:()=>l});const a=e=>`https://brands.home-assistant.io/${e.brand?"brands/":""}${e.useFallback?"_/":""}${e.domain}/${e.darkOptimized?"dark_":""}${e.type}.png`,o=e=>e.split("/")[4],l=e=>e.startsWith("https://brands.home-assistant.io/")},54779:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.r(t),i.d(t,{HacsDashboard:()=>P});var o=i(309),l=i(34541),n=i(47838),r=(i(14271),i(63436),i(44577),i(5095)),s=i(95260),d=i(14516),c=i(76950),h=i(3747),u=i(67684),v=i(38480),b=(i(96710),i(85878),i(99040),i(39663),i(21162),i(62082),i(37662),i(11285)),p=i(29950),m=i(72824),f=i(33367),k=i(90012),y=i(98355),_=i(78822),g=i(46797),w=i(61422),x=i(92178),C=i(25287),$=e([c]);c=($.then?(await $)():$)[0];const H="M11,15H13V17H11V15M11,7H13V13H11V7M12,2C6.47,2 2,6.5 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2M12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4A8,8 0 0,1 20,12A8,8 0 0,1 12,20Z",V="M5,20H19V18H5M19,9H15V3H9V9H5L12,16L19,9Z",A="M13,9H18.5L13,3.5V9M6,2H14L20,8V20A2,2 0 0,1 18,22H6C4.89,22 4,21.1 4,20V4C4,2.89 4.89,2 6,2M15,18V16H6V18H15M18,14V12H6V14H18Z",L="M6,13H18V11H6M3,6V8H21V6M10,18H14V16H10V18Z",M="M2.6,10.59L8.38,4.8L10.07,6.5C9.83,7.35 10.22,8.28 11,8.73V14.27C10.4,14.61 10,15.26 10,16A2,2 0 0,0 12,18A2,2 0 0,0 14,16C14,15.26 13.6,14.61 13,14.27V9.41L15.07,11.5C15,11.65 15,11.82 15,12A2,2 0 0,0 17,14A2,2 0 0,0 19,12A2,2 0 0,0 17,10C16.82,10 16.65,10 16.5,10.07L13.93,7.5C14.19,6.57 13.71,5.55 12.78,5.16C12.35,5 11.9,4.96 11.5,5.07L9.8,3.38L10.59,2.6C11.37,1.81 12.63,1.81 13.41,2.6L21.4,10.59C22.19,11.37 22.19,12.63 21.4,13.41L13.41,21.4C12.63,22.19 11.37,22.19 10.59,21.4L2.6,13.41C1.81,12.63 1.81,11.37 2.6,10.59Z",S="M12,2A10,10 0 0,0 2,12C2,16.42 4.87,20.17 8.84,21.5C9.34,21.58 9.5,21.27 9.5,21C9.5,20.77 9.5,20.14 9.5,19.31C6.73,19.91 6.14,17.97 6.14,17.97C5.68,16.81 5.03,16.5 5.03,16.5C4.12,15.88 5.1,15.9 5.1,15.9C6.1,15.97 6.63,16.93 6.63,16.93C7.5,18.45 8.97,18 9.54,17.76C9.63,17.11 9.89,16.67 10.17,16.42C7.95,16.17 5.62,15.31 5.62,11.5C5.62,10.39 6,9.5 6.65,8.79C6.55,8.54 6.2,7.5 6.75,6.15C6.75,6.15 7.59,5.88 9.5,7.17C10.29,6.95 11.15,6.84 12,6.84C12.85,6.84 13.71,6.95 14.5,7.17C16.41,5.88 17.25,6.15 17.25,6.15C17.8,7.5 17.45,8.54 17.35,8.79C18,9.5 18.38,10.39 18.38,11.5C18.38,15.32 16.04,16.16 13.81,16.41C14.17,16.72 14.5,17.33 14.5,18.26C14.5,19.6 14.5,20.68 14.5,21C14.5,21.27 14.66,21.59 15.17,21.5C19.14,20.16 22,16.42 22,12A10,10 0 0,0 12,2Z",R="M13,9H11V7H13M13,17H11V11H13M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z",F="M20,4C21.11,4 22,4.89 22,6V18C22,19.11 21.11,20 20,20H4C2.89,20 2,19.11 2,18V6C2,4.89 2.89,4 4,4H20M8.5,15V9H7.25V12.5L4.75,9H3.5V15H4.75V11.5L7.3,15H8.5M13.5,10.26V9H9.5V15H13.5V13.75H11V12.64H13.5V11.38H11V10.26H13.5M20.5,14V9H19.25V13.5H18.13V10H16.88V13.5H15.75V9H14.5V14A1,1 0 0,0 15.5,15H19.5A1,1 0 0,0 20.5,14Z",z="M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z",B={name:!0,downloads:!0,stars:!0,last_updated:!0,installed_version:!1,available_version:!1,status:!1,category:!0},Z={title:"",hidden:!0,filterable:!0},D=["downloaded","new"],T=(0,d.Z)(((e,t,i)=>[{name:"filters",type:"constant",value:""},{name:"base",selector:{select:{options:D.map((t=>({value:t,label:e(`common.${t}`)}))),mode:"dropdown",sort:!0}}},{name:"category",selector:{select:{options:t.map((t=>({label:e(`common.${t}`),value:`category_${t}`}))),mode:"dropdown",sort:!0}}},...i?[]:[{name:"behaviour",type:"constant",value:""},{name:"columns",selector:{select:{options:Object.keys(B).map((t=>({label:e(`column.${t}`),value:t}))),multiple:!0,mode:"dropdown",sort:!0}}}]]));let P=(0,o.Z)([(0,s.Mo)("hacs-dashboard")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"hacs",value:void 0},{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,s.Cb)({attribute:!1})],key:"route",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean,reflect:!0})],key:"narrow",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"isWide",value:void 0},{kind:"field",decorators:[(0,h.t)({key:"hacs-table-filter",state:!0,subscribe:!1})],key:"activeFilters",value:()=>[]},{kind:"field",decorators:[(0,h.t)({key:"hacs-table-sort",state:!0,subscribe:!1})],key:"activeSort",value:void 0},{kind:"field",decorators:[(0,h.t)({key:"hacs-active-search",state:!0,subscribe:!1})],key:"_activeSearch",value:void 0},{kind:"field",decorators:[(0,h.t)({key:"hacs-table-scroll",state:!0,subscribe:!1})],key:"_tableScroll",value:void 0},{kind:"field",decorators:[(0,h.t)({key:"hacs-hide-browse-fab",state:!0,subscribe:!1})],key:"_hide_browse_fab",value:void 0},{kind:"field",decorators:[(0,h.t)({key:"hacs-table-active-columns",state:!0,subscribe:!1})],key:"_tableColumns",value:()=>B},{kind:"method",key:"connectedCallback",value:function(){var e;(0,l.Z)((0,n.Z)(i.prototype),"connectedCallback",this).call(this);const t=this.activeFilters&&0===this.activeFilters.length?["downloaded"]:this.activeFilters,a=null!==(e=this._activeSearch)&&void 0!==e&&e.length?null==t?void 0:t.filter((e=>"downloaded"!==e)):t;this.activeFilters=null!=a&&a.length?a:void 0,this.updateComplete.then((()=>{this.restoreScroller().catch((()=>{}))}))}},{kind:"method",key:"updated",value:function(e){var t;if((0,l.Z)((0,n.Z)(i.prototype),"updated",this).call(this,e),e.has("_activeSearch")&&null!==(t=this._activeSearch)&&void 0!==t&&t.length){var a;const e=(null===(a=this.activeFilters)||void 0===a?void 0:a.filter((e=>"downloaded"!==e)))||[];this.activeFilters=e.length?e:void 0}}},{kind:"field",key:"render",value(){return()=>{var e,t,i;const a=!(this._hide_browse_fab||null!==(e=this._activeSearch)&&void 0!==e&&e.length||void 0===this.activeFilters||1!==this.activeFilters.length||"downloaded"!==this.activeFilters[0]),o=this._filterRepositories(this.hacs.repositories,this.activeFilters),l=0!==o.filter((e=>e.new)).length;return r.dy`<hass-tabs-subpage-data-table .tabs="${[{name:_.Z}]}" .columns="${this._columns(this.narrow,this._tableColumns,this.hacs.localize)}" .data="${o}" .hass="${this.hass}" ?iswide="${this.isWide}" .localizeFunc="${this.hass.localize}" .mainPage="${!0}" .narrow="${this.narrow}" .route="${this.route}" clickable .filter="${this._activeSearch||""}" .activeFilters="${null===(t=this.activeFilters)||void 0===t?void 0:t.map((e=>this.hacs.localize(`common.${e.startsWith("category_")?e.replace("category_",""):e}`)||e))}" .noDataText="${null!==(i=this.activeFilters)&&void 0!==i&&i.includes("downloaded")?"No downloaded repositories":"No repositories matching search and filters"}" @row-click="${this._handleRowClicked}" @clear-filter="${this._handleClearFilter}" @value-changed="${this._handleSearchFilterChanged}" @sorting-changed="${this._handleSortingChanged}" .hasFab="${a}"> <ha-icon-overflow-menu narrow slot="toolbar-icon" .hass="${this.hass}" .items="${[{path:A,label:this.hacs.localize("menu.documentation"),action:()=>{var e;return u.E.open((0,C.R)({experimental:null===(e=this.hacs.info)||void 0===e?void 0:e.experimental}),"_blank","noreferrer=true")}},{path:S,label:"GitHub",action:()=>u.E.open("https://github.com/hacs","_blank","noreferrer=true")},{path:H,label:this.hacs.localize("menu.open_issue"),action:()=>{var e;return u.E.open((0,C.R)({experimental:null===(e=this.hacs.info)||void 0===e?void 0:e.experimental,path:"/docs/issues"}),"_blank","noreferrer=true")}},{path:M,disabled:Boolean(this.hacs.info.disabled_reason),label:this.hacs.localize("menu.custom_repositories"),action:()=>{(0,f.U8)(this,{hacs:this.hacs})}},l?{path:F,label:this.hacs.localize("menu.dismiss"),action:()=>{(0,g.VP)(this.hass,this.hacs)}}:void 0,{path:R,label:this.hacs.localize("menu.about"),action:()=>{(0,f.lU)(this,{hacs:this.hacs,title:_.Z,description:r.dy`<ha-markdown .content="${(0,y.e)(this.hacs)}"></ha-markdown>`})}}].filter((e=>void 0!==e))}"> </ha-icon-overflow-menu> <ha-button-menu slot="filter-menu" @click="${this._handleIconOverflowMenuOpened}"> <ha-icon-button slot="trigger" .label="${this.hass.localize("ui.panel.config.entities.picker.filter.filter")}" .path="${L}"> </ha-icon-button> </ha-button-menu> ${a?r.dy` <ha-fab slot="fab" @click="${this._show_browse_dialog}" .label="${this.hacs.localize("dialog_browse.btn")}" extended> <ha-svg-icon slot="icon" .path="${z}"></ha-svg-icon> </ha-fab> `:r.Ld} </hass-tabs-subpage-data-table>`}}},{kind:"field",key:"_show_browse_dialog",value(){return async()=>{(0,b.g7)(this,{title:this.hacs.localize("dialog_browse.title"),text:this.hacs.localize("dialog_browse.content"),confirmText:this.hacs.localize("common.close"),confirm:()=>{this._hide_browse_fab=!0},dismissText:this.hacs.localize("menu.documentation"),cancel:()=>{var e;u.E.open((0,C.R)({experimental:null===(e=this.hacs.info)||void 0===e?void 0:e.experimental,path:"/docs/basic/dashboard"}),"_blank","noreferrer=true"),this._show_browse_dialog()}})}}},{kind:"field",key:"_filterRepositories",value(){return(0,d.Z)(((e,t)=>e.filter((e=>{var i,a;return!(null!==(i=this.activeFilters)&&void 0!==i&&i.includes("downloaded")&&!e.installed)&&(!(null!==(a=this.activeFilters)&&void 0!==a&&a.includes("new")&&!e.new)&&!(null!=t&&t.filter((e=>e.startsWith("category_"))).length&&!t.includes(`category_${e.category}`)))})).sort(((e,t)=>t.name.localeCompare(e.name))).sort(((e,t)=>e.stars<t.stars?1:-1)).sort(((e,t)=>e.installed&&!t.installed?1:-1)).sort(((e,t)=>!e.new&&t.new?1:-1))))}},{kind:"field",key:"_columns",value(){return(0,d.Z)(((e,t,i)=>{var a,o,l,n,s,d,h,u;return{icon:{title:"",label:this.hass.localize("ui.panel.config.lovelace.dashboards.picker.headers.icon"),hidden:this.narrow,type:"icon",template:e=>{var t;return"integration"===e.category?r.dy` <img style="height:32px;width:32px" slot="item-icon" src="${(0,m.X1)({domain:e.domain||"invalid",type:"icon",useFallback:!0,darkOptimized:null===(t=this.hass.themes)||void 0===t?void 0:t.darkMode})}" referrerpolicy="no-referrer"> `:r.dy` <ha-svg-icon style="height:32px;width:32px;fill:var(--secondary-text-color)" slot="item-icon" .path="${(0,x.C)(e.category)}"></ha-svg-icon> `}},name:{...Z,title:i("column.name"),main:!0,sortable:!0,direction:"name"===(null===(a=this.activeSort)||void 0===a?void 0:a.column)?this.activeSort.direction:null,hidden:!t.name,grows:!0,template:t=>{var a;return r.dy` ${t.new?r.dy`<ha-svg-icon label="New" style="color:var(--primary-color);margin-right:4px" .path="${F}"></ha-svg-icon>`:""} ${null!==(a=this.activeFilters)&&void 0!==a&&a.includes("downloaded")||!t.installed?"":r.dy`<ha-svg-icon label="Downloaded" style="color:var(--primary-color);margin-right:4px" .path="${V}"></ha-svg-icon>`} ${t.name} <div class="secondary"> ${e?i(`common.${t.category}`):t.description} </div> `}},downloads:{...Z,title:i("column.downloads"),hidden:e||!t.downloads,sortable:!0,direction:"downloads"===(null===(o=this.activeSort)||void 0===o?void 0:o.column)?this.activeSort.direction:null,width:"10%",template:e=>r.dy`${e.downloads||"-"}`},stars:{...Z,title:i("column.stars"),hidden:e||!t.stars,sortable:!0,direction:"stars"===(null===(l=this.activeSort)||void 0===l?void 0:l.column)?this.activeSort.direction:null,width:"10%"},last_updated:{...Z,title:i("column.last_updated"),hidden:e||!t.last_updated,sortable:!0,direction:"last_updated"===(null===(n=this.activeSort)||void 0===n?void 0:n.column)?this.activeSort.direction:null,width:"15%",template:e=>{if(!e.last_updated)return"-";try{return(0,c.G)(new Date(e.last_updated),this.hass.locale)}catch(e){return"-"}}},installed_version:{...Z,title:i("column.installed_version"),hidden:e||!t.installed_version,sortable:!0,direction:"installed_version"===(null===(s=this.activeSort)||void 0===s?void 0:s.column)?this.activeSort.direction:null,width:"10%",template:e=>e.installed?e.installed_version:"-"},available_version:{...Z,title:i("column.available_version"),hidden:e||!t.available_version,sortable:!0,direction:"available_version"===(null===(d=this.activeSort)||void 0===d?void 0:d.column)?this.activeSort.direction:null,width:"10%",template:e=>e.installed?e.available_version:"-"},status:{...Z,title:i("column.status"),hidden:e||!t.status,sortable:!0,direction:"status"===(null===(h=this.activeSort)||void 0===h?void 0:h.column)?this.activeSort.direction:null,width:"10%",template:e=>["pending-restart","pending-upgrade"].includes(e.status)?i(`repository_status.${e.status}`):"-"},category:{...Z,title:i("column.category"),hidden:e||!t.category,sortable:!0,direction:"category"===(null===(u=this.activeSort)||void 0===u?void 0:u.column)?this.activeSort.direction:null,width:"10%",template:e=>i(`common.${e.category}`)},authors:Z,description:Z,domain:Z,full_name:Z,id:Z,topics:Z,actions:{title:"",width:this.narrow?void 0:"10%",type:"overflow-menu",template:e=>e.installed?r.dy` <ha-icon-overflow-menu .hass="${this.hass}" .items="${(0,k.G)(this,e)}" narrow> </ha-icon-overflow-menu> `:""}}}))}},{kind:"get",key:"_scrollerTarget",value:function(){var e;return null===(e=this.shadowRoot)||void 0===e||null===(e=e.querySelector("hass-tabs-subpage-data-table"))||void 0===e||null===(e=e.shadowRoot)||void 0===e||null===(e=e.querySelector("hass-tabs-subpage"))||void 0===e||null===(e=e.shadowRoot)||void 0===e||null===(e=e.querySelector(".content"))||void 0===e||null===(e=e.querySelectorAll("SLOT")[0])||void 0===e||null===(e=e.assignedNodes())||void 0===e||null===(e=e.find((e=>"HA-DATA-TABLE"===e.nodeName)))||void 0===e||null===(e=e.shadowRoot)||void 0===e?void 0:e.querySelector(".scroller")}},{kind:"method",key:"restoreScroller",value:async function(){var e;0!==(null!==(e=this._tableScroll)&&void 0!==e?e:0)&&await new Promise(((e,t)=>{const i=setTimeout(t,1e3),a=setInterval((()=>{this._scrollerTarget&&(this._scrollerTarget.scrollTop=this._tableScroll,clearTimeout(i),clearInterval(a),e())}),50)}))}},{kind:"method",key:"_handleRowClicked",value:function(e){var t;this._tableScroll=(null===(t=this._scrollerTarget)||void 0===t?void 0:t.scrollTop)||0,(0,v.c)(`/hacs/repository/${e.detail.id}`)}},{kind:"method",key:"_handleIconOverflowMenuOpened",value:function(e){var t,i;e.stopPropagation(),(0,f.lU)(this,{hacs:this.hacs,title:this.hacs.localize("dialog_overview.title"),description:r.dy`<p>${this.hacs.localize("dialog_overview.description")}</p>`,data:{base:(null===(t=this.activeFilters)||void 0===t?void 0:t.find((e=>D.includes(e))))||"",category:(null===(i=this.activeFilters)||void 0===i?void 0:i.find((e=>e.startsWith("category_"))))||"",columns:Object.entries(B).filter((([e,t])=>{var i;return null!==(i=this._tableColumns[e])&&void 0!==i?i:t})).map((([e,t])=>e))},schema:T(this.hacs.localize,this.hacs.info.categories,this.narrow),computeLabelCallback:(e,t)=>this.hacs.localize(`dialog_overview.${e.name}`)||this.hacs.localize(`dialog_overview.sections.${e.name}`)||e.name,saveAction:async e=>{const t=Object.entries(e).filter((([e,t])=>["base","category"].includes(e)&&![void 0,null,""].includes(t))).map((([e,t])=>t));this.activeFilters=t.length?t:void 0,this._tableColumns=Object.keys(B).reduce(((t,i)=>{var a;return{...t,[i]:null!==(a=e.columns.includes(i))&&void 0!==a?a:B[i]}}),{})}})}},{kind:"method",key:"_handleSearchFilterChanged",value:function(e){this._activeSearch=e.detail.value}},{kind:"method",key:"_handleSortingChanged",value:function(e){this.activeSort=e.detail}},{kind:"method",key:"_handleClearFilter",value:function(){this.activeFilters=void 0}},{kind:"get",static:!0,key:"styles",value:function(){return[p.Qx,w.w]}}]}}),r.oi);a()}catch(e){a(e)}}))},98355:(e,t,i)=>{i.d(t,{e:()=>o});var a=i(25287);const o=e=>{var t,i,o;return`\n**${e.localize("dialog_about.integration_version")}:** | ${e.info.version}\n:--|--\n**${e.localize("dialog_about.frontend_version")}:** | 20240119163101\n**${e.localize("common.repositories")}:** | ${e.repositories.length}\n**${e.localize("dialog_about.downloaded_repositories")}:** | ${e.repositories.filter((e=>e.installed)).length}\n\n**${e.localize("dialog_about.useful_links")}:**\n\n- [General documentation](${(0,a.R)({experimental:null===(t=e.info)||void 0===t?void 0:t.experimental})})\n- [Configuration](${(0,a.R)({experimental:null===(i=e.info)||void 0===i?void 0:i.experimental,path:"/docs/configuration/start"})})\n- [FAQ](${(0,a.R)({experimental:null===(o=e.info)||void 0===o?void 0:o.experimental,path:"/docs/faq/what"})})\n- [GitHub](https://github.com/hacs)\n- [Discord](https://discord.gg/apgchf8)\n- [Become a GitHub sponsor? ❤️](https://github.com/sponsors/ludeeus)\n- [BuyMe~~Coffee~~Beer? 🍺🙈](https://buymeacoffee.com/ludeeus)\n\n***\n\n_Everything you find in HACS is **not** tested by Home Assistant, that includes HACS itself.\nThe HACS and Home Assistant teams do not support **anything** you find here._`}},78822:(e,t,i)=>{i.d(t,{Z:()=>a});const a="Home Assistant Community Store"},92178:(e,t,i)=>{i.d(t,{C:()=>l});var a=i(14516);const o={appdaemon:"M12,2A2,2 0 0,1 14,4C14,4.74 13.6,5.39 13,5.73V7H14A7,7 0 0,1 21,14H22A1,1 0 0,1 23,15V18A1,1 0 0,1 22,19H21V20A2,2 0 0,1 19,22H5A2,2 0 0,1 3,20V19H2A1,1 0 0,1 1,18V15A1,1 0 0,1 2,14H3A7,7 0 0,1 10,7H11V5.73C10.4,5.39 10,4.74 10,4A2,2 0 0,1 12,2M7.5,13A2.5,2.5 0 0,0 5,15.5A2.5,2.5 0 0,0 7.5,18A2.5,2.5 0 0,0 10,15.5A2.5,2.5 0 0,0 7.5,13M16.5,13A2.5,2.5 0 0,0 14,15.5A2.5,2.5 0 0,0 16.5,18A2.5,2.5 0 0,0 19,15.5A2.5,2.5 0 0,0 16.5,13Z",integration:"M2,10.96C1.5,10.68 1.35,10.07 1.63,9.59L3.13,7C3.24,6.8 3.41,6.66 3.6,6.58L11.43,2.18C11.59,2.06 11.79,2 12,2C12.21,2 12.41,2.06 12.57,2.18L20.47,6.62C20.66,6.72 20.82,6.88 20.91,7.08L22.36,9.6C22.64,10.08 22.47,10.69 22,10.96L21,11.54V16.5C21,16.88 20.79,17.21 20.47,17.38L12.57,21.82C12.41,21.94 12.21,22 12,22C11.79,22 11.59,21.94 11.43,21.82L3.53,17.38C3.21,17.21 3,16.88 3,16.5V10.96C2.7,11.13 2.32,11.14 2,10.96M12,4.15V4.15L12,10.85V10.85L17.96,7.5L12,4.15M5,15.91L11,19.29V12.58L5,9.21V15.91M19,15.91V12.69L14,15.59C13.67,15.77 13.3,15.76 13,15.6V19.29L19,15.91M13.85,13.36L20.13,9.73L19.55,8.72L13.27,12.35L13.85,13.36Z",netdaemon:"M2,15A1,1 0 0,1 3,16A1,1 0 0,1 2,17A1,1 0 0,1 1,16A1,1 0 0,1 2,15M21,17H19V9H17V7H23V9H21V17M16,7V9H14V11H16V13H14V15H16V17H12V7H16M11,7V17H9L6,11V17H4V7H6L9,13V7H11Z",plugin:"M13,3V9H21V3M13,21H21V11H13M3,21H11V15H3M3,13H11V3H3V13Z",python_script:"M19.14,7.5A2.86,2.86 0 0,1 22,10.36V14.14A2.86,2.86 0 0,1 19.14,17H12C12,17.39 12.32,17.96 12.71,17.96H17V19.64A2.86,2.86 0 0,1 14.14,22.5H9.86A2.86,2.86 0 0,1 7,19.64V15.89C7,14.31 8.28,13.04 9.86,13.04H15.11C16.69,13.04 17.96,11.76 17.96,10.18V7.5H19.14M14.86,19.29C14.46,19.29 14.14,19.59 14.14,20.18C14.14,20.77 14.46,20.89 14.86,20.89A0.71,0.71 0 0,0 15.57,20.18C15.57,19.59 15.25,19.29 14.86,19.29M4.86,17.5C3.28,17.5 2,16.22 2,14.64V10.86C2,9.28 3.28,8 4.86,8H12C12,7.61 11.68,7.04 11.29,7.04H7V5.36C7,3.78 8.28,2.5 9.86,2.5H14.14C15.72,2.5 17,3.78 17,5.36V9.11C17,10.69 15.72,11.96 14.14,11.96H8.89C7.31,11.96 6.04,13.24 6.04,14.82V17.5H4.86M9.14,5.71C9.54,5.71 9.86,5.41 9.86,4.82C9.86,4.23 9.54,4.11 9.14,4.11C8.75,4.11 8.43,4.23 8.43,4.82C8.43,5.41 8.75,5.71 9.14,5.71Z",template:"M8,3A2,2 0 0,0 6,5V9A2,2 0 0,1 4,11H3V13H4A2,2 0 0,1 6,15V19A2,2 0 0,0 8,21H10V19H8V14A2,2 0 0,0 6,12A2,2 0 0,0 8,10V5H10V3M16,3A2,2 0 0,1 18,5V9A2,2 0 0,0 20,11H21V13H20A2,2 0 0,0 18,15V19A2,2 0 0,1 16,21H14V19H16V14A2,2 0 0,1 18,12A2,2 0 0,1 16,10V5H14V3H16Z",theme:"M17.5,12A1.5,1.5 0 0,1 16,10.5A1.5,1.5 0 0,1 17.5,9A1.5,1.5 0 0,1 19,10.5A1.5,1.5 0 0,1 17.5,12M14.5,8A1.5,1.5 0 0,1 13,6.5A1.5,1.5 0 0,1 14.5,5A1.5,1.5 0 0,1 16,6.5A1.5,1.5 0 0,1 14.5,8M9.5,8A1.5,1.5 0 0,1 8,6.5A1.5,1.5 0 0,1 9.5,5A1.5,1.5 0 0,1 11,6.5A1.5,1.5 0 0,1 9.5,8M6.5,12A1.5,1.5 0 0,1 5,10.5A1.5,1.5 0 0,1 6.5,9A1.5,1.5 0 0,1 8,10.5A1.5,1.5 0 0,1 6.5,12M12,3A9,9 0 0,0 3,12A9,9 0 0,0 12,21A1.5,1.5 0 0,0 13.5,19.5C13.5,19.11 13.35,18.76 13.11,18.5C12.88,18.23 12.73,17.88 12.73,17.5A1.5,1.5 0 0,1 14.23,16H16A5,5 0 0,0 21,11C21,6.58 16.97,3 12,3Z"},l=(0,a.Z)((e=>o[e]))},25287:(e,t,i)=>{i.d(t,{R:()=>a});const a=e=>`https://${null!=e&&e.experimental?"experimental.hacs.xyz":"www.hacs.xyz"}${(null==e?void 0:e.path)||""}`}};
+//# sourceMappingURL=7371.WgLVfICljd4.js.map
\ No newline at end of file
@@ -0,0 +1 @@
+export const id=7386;export const ids=[7386];export const modules={87386:(o,t,s)=>{s.r(t)}};
\ No newline at end of file
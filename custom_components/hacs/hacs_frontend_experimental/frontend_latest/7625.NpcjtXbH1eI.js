@@ -0,0 +1,2 @@
+export const id=7625;export const ids=[7625];export const modules={7625:(t,o,r)=>{r.r(o),r.d(o,{HaIconButtonGroup:()=>s});var e=r(309),i=r(5095),n=r(95260);let s=(0,e.Z)([(0,n.Mo)("ha-icon-button-group")],(function(t,o){return{F:class extends o{constructor(...o){super(...o),t(this)}},d:[{kind:"method",key:"render",value:function(){return i.dy`<slot></slot>`}},{kind:"get",static:!0,key:"styles",value:function(){return i.iv`:host{position:relative;display:flex;flex-direction:row;align-items:center;height:48px;border-radius:28px;background-color:rgba(139,145,151,.1);box-sizing:border-box;width:auto;padding:0}::slotted(.separator){background-color:rgba(var(--rgb-primary-text-color),.15);width:1px;margin:0 1px;height:40px}`}}]}}),i.oi)}};
+//# sourceMappingURL=7625.NpcjtXbH1eI.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 7765.aMWklrSuv5w.js.LICENSE.txt */
+export const id=7765;export const ids=[7765];export const modules={52996:(t,e,i)=>{i.d(e,{p:()=>s});const s=(t,e)=>t&&t.config.components.includes(e)},92295:(t,e,i)=>{var s=i(309),n=i(14271),o=i(5095),a=i(95260),r=i(3712);(0,s.Z)([(0,a.Mo)("ha-button")],(function(t,e){return{F:class extends e{constructor(...e){super(...e),t(this)}},d:[{kind:"field",static:!0,key:"styles",value:()=>[r.W,o.iv`::slotted([slot=icon]){margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction);display:block}.mdc-button{height:var(--button-height,36px)}.trailing-icon{display:flex}.slot-container{overflow:var(--button-slot-container-overflow,visible)}`]}]}}),n.z)},96400:(t,e,i)=>{var s=i(309),n=i(34541),o=i(47838),a=i(5095),r=i(43204),l=i(95260),d=i(58417),h=i(39274);let c=class extends d.A{};c.styles=[h.W],c=(0,r.__decorate)([(0,l.Mo)("mwc-checkbox")],c);var p=i(53180),u=i(61092);class m extends u.K{constructor(){super(...arguments),this.left=!1,this.graphic="control"}render(){const t={"mdc-deprecated-list-item__graphic":this.left,"mdc-deprecated-list-item__meta":!this.left},e=this.renderText(),i=this.graphic&&"control"!==this.graphic&&!this.left?this.renderGraphic():a.dy``,s=this.hasMeta&&this.left?this.renderMeta():a.dy``,n=this.renderRipple();return a.dy` ${n} ${i} ${this.left?"":e} <span class="${(0,p.$)(t)}"> <mwc-checkbox reducedTouchTarget tabindex="${this.tabindex}" .checked="${this.selected}" ?disabled="${this.disabled}" @change="${this.onChange}"> </mwc-checkbox> </span> ${this.left?e:""} ${s}`}async onChange(t){const e=t.target;this.selected===e.checked||(this._skipPropRequest=!0,this.selected=e.checked,await this.updateComplete,this._skipPropRequest=!1)}}(0,r.__decorate)([(0,l.IO)("slot")],m.prototype,"slotElement",void 0),(0,r.__decorate)([(0,l.IO)("mwc-checkbox")],m.prototype,"checkboxElement",void 0),(0,r.__decorate)([(0,l.Cb)({type:Boolean})],m.prototype,"left",void 0),(0,r.__decorate)([(0,l.Cb)({type:String,reflect:!0})],m.prototype,"graphic",void 0);const g=a.iv`:host(:not([twoline])){height:56px}:host(:not([left])) .mdc-deprecated-list-item__meta{height:40px;width:40px}`;var v=i(96762),f=i(18394);(0,s.Z)([(0,l.Mo)("ha-check-list-item")],(function(t,e){class i extends e{constructor(...e){super(...e),t(this)}}return{F:i,d:[{kind:"method",key:"onChange",value:async function(t){(0,n.Z)((0,o.Z)(i.prototype),"onChange",this).call(this,t),(0,f.B)(this,t.type)}},{kind:"field",static:!0,key:"styles",value:()=>[v.W,g,a.iv`:host{--mdc-theme-secondary:var(--primary-color)}:host([graphic=avatar]) .mdc-deprecated-list-item__graphic,:host([graphic=control]) .mdc-deprecated-list-item__graphic,:host([graphic=large]) .mdc-deprecated-list-item__graphic,:host([graphic=medium]) .mdc-deprecated-list-item__graphic{margin-inline-end:var(--mdc-list-item-graphic-margin,16px);margin-inline-start:0px;direction:var(--direction)}.mdc-deprecated-list-item__meta{flex-shrink:0;direction:var(--direction);margin-inline-start:auto;margin-inline-end:0}.mdc-deprecated-list-item__graphic{margin-top:var(--check-list-item-graphic-margin-top)}`]}]}}),m)},29708:(t,e,i)=>{var s=i(309),n=i(5095),o=i(95260);i(37662);(0,s.Z)([(0,o.Mo)("ha-tip")],(function(t,e){return{F:class extends e{constructor(...e){super(...e),t(this)}},d:[{kind:"field",decorators:[(0,o.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"method",key:"render",value:function(){return this.hass?n.dy` <ha-svg-icon .path="${"M12,2A7,7 0 0,1 19,9C19,11.38 17.81,13.47 16,14.74V17A1,1 0 0,1 15,18H9A1,1 0 0,1 8,17V14.74C6.19,13.47 5,11.38 5,9A7,7 0 0,1 12,2M9,21V20H15V21A1,1 0 0,1 14,22H10A1,1 0 0,1 9,21M12,4A5,5 0 0,0 7,9C7,11.05 8.23,12.81 10,13.58V16H14V13.58C15.77,12.81 17,11.05 17,9A5,5 0 0,0 12,4Z"}"></ha-svg-icon> <span class="prefix">${this.hass.localize("ui.panel.config.tips.tip")}</span> <span class="text"><slot></slot></span> `:n.Ld}},{kind:"field",static:!0,key:"styles",value:()=>n.iv`:host{display:block;text-align:center}.text{direction:var(--direction);margin-left:2px;margin-inline-start:2px;margin-inline-end:initial;color:var(--secondary-text-color)}.prefix{font-weight:500}`}]}}),n.oi)},77765:(t,e,i)=>{i.a(t,(async(t,s)=>{try{i.r(e);var n=i(309),o=i(62434),a=(i(63436),i(44577),i(5095)),r=i(95260),l=i(99266),d=i(18394),h=i(51750),c=i(78889),p=i(23469),u=i(11285),m=i(29950),g=(i(92295),i(96400),i(7006),i(9828),i(78680),i(37662),i(29708),i(15758)),v=(i(86986),i(52996)),f=t([g]);g=(f.then?(await f)():f)[0];const _="M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z",y="M19,4H15.5L14.5,3H9.5L8.5,4H5V6H19M6,19A2,2 0 0,0 8,21H16A2,2 0 0,0 18,19V7H6V19Z";(0,n.Z)([(0,r.Mo)("dialog-media-manage")],(function(t,e){return{F:class extends e{constructor(...e){super(...e),t(this)}},d:[{kind:"field",decorators:[(0,r.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,r.SB)()],key:"_currentItem",value:void 0},{kind:"field",decorators:[(0,r.SB)()],key:"_params",value:void 0},{kind:"field",decorators:[(0,r.SB)()],key:"_uploading",value:()=>!1},{kind:"field",decorators:[(0,r.SB)()],key:"_deleting",value:()=>!1},{kind:"field",decorators:[(0,r.SB)()],key:"_selected",value:()=>new Set},{kind:"field",key:"_filesChanged",value:()=>!1},{kind:"method",key:"showDialog",value:function(t){this._params=t,this._refreshMedia()}},{kind:"method",key:"closeDialog",value:function(){this._filesChanged&&this._params.onClose&&this._params.onClose(),this._params=void 0,this._currentItem=void 0,this._uploading=!1,this._deleting=!1,this._filesChanged=!1,(0,d.B)(this,"dialog-closed",{dialog:this.localName})}},{kind:"method",key:"render",value:function(){var t,e;if(!this._params)return a.Ld;const i=(null===(t=this._currentItem)||void 0===t||null===(t=t.children)||void 0===t?void 0:t.filter((t=>!t.can_expand)))||[];let s=0;return a.dy` <ha-dialog open scrimClickAction escapeKeyAction hideActions flexContent .heading="${this._params.currentItem.title}" @closed="${this.closeDialog}"> <ha-dialog-header slot="heading"> ${0===this._selected.size?a.dy` <span slot="title"> ${this.hass.localize("ui.components.media-browser.file_management.title")} </span> <ha-media-upload-button .disabled="${this._deleting}" .hass="${this.hass}" .currentItem="${this._params.currentItem}" @uploading="${this._startUploading}" @media-refresh="${this._doneUploading}" slot="actionItems"></ha-media-upload-button> ${this._uploading?"":a.dy` <ha-icon-button .label="${this.hass.localize("ui.dialogs.generic.close")}" .path="${_}" dialogAction="close" slot="navigationIcon" dir="${(0,h.Zu)(this.hass)}"></ha-icon-button> `} `:a.dy` <ha-button class="danger" slot="title" .disabled="${this._deleting}" .label="${this.hass.localize("ui.components.media-browser.file_management."+(this._deleting?"deleting":"delete"),{count:this._selected.size})}" @click="${this._handleDelete}"> <ha-svg-icon .path="${y}" slot="icon"></ha-svg-icon> </ha-button> ${this._deleting?"":a.dy` <ha-button slot="actionItems" .label="${"Deselect all"}" @click="${this._handleDeselectAll}"> <ha-svg-icon .path="${_}" slot="icon"></ha-svg-icon> </ha-button> `} `} </ha-dialog-header> ${this._currentItem?i.length?a.dy` <mwc-list multi @selected="${this._handleSelected}"> ${(0,l.r)(i,(t=>t.media_content_id),(t=>{const e=a.dy` <ha-svg-icon slot="graphic" .path="${c.Fn["directory"===t.media_class&&t.children_media_class||t.media_class].icon}"></ha-svg-icon> `;return a.dy` <ha-check-list-item ${(0,o.jt)({id:t.media_content_id,skipInitial:!0})} graphic="icon" .disabled="${this._uploading||this._deleting}" .selected="${this._selected.has(s++)}" .item="${t}"> ${e} ${t.title} </ha-check-list-item> `}))} </mwc-list> `:a.dy`<div class="no-items"> <p> ${this.hass.localize("ui.components.media-browser.file_management.no_items")} </p> ${null!==(e=this._currentItem)&&void 0!==e&&null!==(e=e.children)&&void 0!==e&&e.length?a.dy`<span class="folders">${this.hass.localize("ui.components.media-browser.file_management.folders_not_supported")}</span>`:""} </div>`:a.dy` <div class="refresh"> <ha-circular-progress indeterminate></ha-circular-progress> </div> `} ${(0,v.p)(this.hass,"hassio")?a.dy`<ha-tip .hass="${this.hass}"> ${this.hass.localize("ui.components.media-browser.file_management.tip_media_storage",{storage:a.dy`<a href="/config/storage" @click="${this.closeDialog}"> ${this.hass.localize("ui.components.media-browser.file_management.tip_storage_panel").toLowerCase()} </a>`})} </ha-tip>`:a.Ld} </ha-dialog> `}},{kind:"method",key:"_handleSelected",value:function(t){this._selected=t.detail.index}},{kind:"method",key:"_startUploading",value:function(){this._uploading=!0,this._filesChanged=!0}},{kind:"method",key:"_doneUploading",value:function(){this._uploading=!1,this._refreshMedia()}},{kind:"method",key:"_handleDeselectAll",value:function(){this._selected.size&&(this._selected=new Set)}},{kind:"method",key:"_handleDelete",value:async function(){if(!await(0,u.g7)(this,{text:this.hass.localize("ui.components.media-browser.file_management.confirm_delete",{count:this._selected.size}),warning:!0}))return;this._filesChanged=!0,this._deleting=!0;const t=[];let e=0;this._currentItem.children.forEach((i=>{i.can_expand||this._selected.has(e++)&&t.push(i)}));try{await Promise.all(t.map((async t=>{await(0,p.Qr)(this.hass,t.media_content_id),this._currentItem={...this._currentItem,children:this._currentItem.children.filter((e=>e!==t))}})))}finally{this._deleting=!1,this._selected=new Set}}},{kind:"method",key:"_refreshMedia",value:async function(){this._selected=new Set,this._currentItem=void 0,this._currentItem=await(0,p.b)(this.hass,this._params.currentItem.media_content_id)}},{kind:"get",static:!0,key:"styles",value:function(){return[m.yu,a.iv`ha-dialog{--dialog-z-index:9;--dialog-content-padding:0}@media (min-width:800px){ha-dialog{--mdc-dialog-max-width:800px;--dialog-surface-position:fixed;--dialog-surface-top:40px;--mdc-dialog-max-height:calc(100vh - 72px)}}ha-dialog-header ha-button,ha-dialog-header ha-media-upload-button{--mdc-theme-primary:var(--primary-text-color);margin:6px;display:block}mwc-list{direction:ltr}.danger{--mdc-theme-primary:var(--error-color)}ha-svg-icon[slot=icon]{vertical-align:middle}ha-tip{margin:16px}ha-svg-icon[slot=icon]{margin-inline-start:0px!important;margin-inline-end:8px!important;direction:var(--direction)}.refresh{display:flex;height:200px;justify-content:center;align-items:center}.no-items{text-align:center;padding:16px}.folders{color:var(--secondary-text-color);font-style:italic}`]}}]}}),a.oi);s()}catch(t){s(t)}}))},86986:(t,e,i)=>{var s=i(309),n=(i(14271),i(5095)),o=i(95260),a=i(18394),r=i(23469),l=i(11285);i(7006),i(37662);(0,s.Z)([(0,o.Mo)("ha-media-upload-button")],(function(t,e){return{F:class extends e{constructor(...e){super(...e),t(this)}},d:[{kind:"field",decorators:[(0,o.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,o.Cb)()],key:"currentItem",value:void 0},{kind:"field",decorators:[(0,o.SB)()],key:"_uploading",value:()=>0},{kind:"method",key:"render",value:function(){return this.currentItem&&(0,r.aV)(this.currentItem.media_content_id||"")?n.dy` <mwc-button .label="${this._uploading>0?this.hass.localize("ui.components.media-browser.file_management.uploading",{count:this._uploading}):this.hass.localize("ui.components.media-browser.file_management.add_media")}" .disabled="${this._uploading>0}" @click="${this._startUpload}"> ${this._uploading>0?n.dy` <ha-circular-progress size="small" indeterminate area-label="Uploading" slot="icon"></ha-circular-progress> `:n.dy` <ha-svg-icon .path="${"M9,16V10H5L12,3L19,10H15V16H9M5,20V18H19V20H5Z"}" slot="icon"></ha-svg-icon> `} </mwc-button> `:n.Ld}},{kind:"method",key:"_startUpload",value:async function(){if(this._uploading>0)return;const t=document.createElement("input");t.type="file",t.accept="audio/*,video/*,image/*",t.multiple=!0,t.addEventListener("change",(async()=>{(0,a.B)(this,"uploading");const e=t.files;document.body.removeChild(t);const i=this.currentItem.media_content_id;for(let t=0;t<e.length;t++){this._uploading=e.length-t;try{await(0,r.oE)(this.hass,i,e[t])}catch(t){(0,l.Ys)(this,{text:this.hass.localize("ui.components.media-browser.file_management.upload_failed",{reason:t.message||t})});break}}this._uploading=0,(0,a.B)(this,"media-refresh")}),{once:!0}),t.style.display="none",document.body.append(t),t.click()}},{kind:"field",static:!0,key:"styles",value:()=>n.iv`mwc-button{--mdc-button-disabled-ink-color:--mdc-theme-primary}ha-circular-progress[slot=icon],ha-svg-icon[slot=icon]{vertical-align:middle}ha-svg-icon[slot=icon]{margin-inline-start:0px;margin-inline-end:8px;direction:var(--direction)}`}]}}),n.oi)},62434:(t,e,i)=>{i.d(e,{jt:()=>_});var s=i(32982),n=i(57835),o=i(76187);const a=new WeakMap;let r=0;const l=new Map,d=new WeakSet,h=()=>new Promise((t=>requestAnimationFrame(t))),c=(t,e)=>{const i=t-e;return 0===i?void 0:i},p=(t,e)=>{const i=t/e;return 1===i?void 0:i},u={left:(t,e)=>{const i=c(t,e);return{value:i,transform:null==i||isNaN(i)?void 0:`translateX(${i}px)`}},top:(t,e)=>{const i=c(t,e);return{value:i,transform:null==i||isNaN(i)?void 0:`translateY(${i}px)`}},width:(t,e)=>{let i;0===e&&(e=1,i={width:"1px"});const s=p(t,e);return{value:s,overrideFrom:i,transform:null==s||isNaN(s)?void 0:`scaleX(${s})`}},height:(t,e)=>{let i;0===e&&(e=1,i={height:"1px"});const s=p(t,e);return{value:s,overrideFrom:i,transform:null==s||isNaN(s)?void 0:`scaleY(${s})`}}},m={duration:333,easing:"ease-in-out"},g=["left","top","width","height","opacity","color","background"],v=new WeakMap;class f extends o.sR{constructor(t){if(super(t),this.t=null,this.i=null,this.o=!0,this.shouldLog=!1,t.type===n.pX.CHILD)throw Error("The `animate` directive must be used in attribute position.");this.createFinished()}createFinished(){var t;null!==(t=this.resolveFinished)&&void 0!==t&&t.call(this),this.finished=new Promise((t=>{this.h=t}))}async resolveFinished(){var t;null!==(t=this.h)&&void 0!==t&&t.call(this),this.h=void 0}render(t){return s.Ld}getController(){return a.get(this.l)}isDisabled(){var t;return this.options.disabled||(null===(t=this.getController())||void 0===t?void 0:t.disabled)}update(t,[e]){var i;const s=void 0===this.l;return s&&(this.l=null===(i=t.options)||void 0===i?void 0:i.host,this.l.addController(this),this.element=t.element,v.set(this.element,this)),this.optionsOrCallback=e,(s||"function"!=typeof e)&&this.u(e),this.render(e)}u(t){var e,i,s;t=null!==(e=t)&&void 0!==e?e:{};const n=this.getController();void 0!==n&&((t={...n.defaultOptions,...t}).keyframeOptions={...n.defaultOptions.keyframeOptions,...t.keyframeOptions}),null!==(s=(i=t).properties)&&void 0!==s||(i.properties=g),this.options=t}p(){const t={},e=this.element.getBoundingClientRect(),i=getComputedStyle(this.element);return this.options.properties.forEach((s=>{var n;const o=null!==(n=e[s])&&void 0!==n?n:u[s]?void 0:i[s],a=Number(o);t[s]=isNaN(a)?o+"":a})),t}m(){let t,e=!0;return this.options.guard&&(t=this.options.guard(),e=((t,e)=>{if(Array.isArray(t)){if(Array.isArray(e)&&e.length===t.length&&t.every(((t,i)=>t===e[i])))return!1}else if(e===t)return!1;return!0})(t,this.v)),this.o=this.l.hasUpdated&&!this.isDisabled()&&!this.isAnimating()&&e&&this.element.isConnected,this.o&&(this.v=Array.isArray(t)?Array.from(t):t),this.o}hostUpdate(){var t;"function"==typeof this.optionsOrCallback&&this.u(this.optionsOrCallback()),this.m()&&(this.g=this.p(),this.t=null!==(t=this.t)&&void 0!==t?t:this.element.parentNode,this.i=this.element.nextSibling)}async hostUpdated(){if(!this.o||!this.element.isConnected||this.options.skipInitial&&!this.isHostRendered)return;let t;this.prepare(),await h;const e=this._(),i=this.A(this.options.keyframeOptions,e),s=this.p();if(void 0!==this.g){const{from:i,to:n}=this.O(this.g,s,e);this.log("measured",[this.g,s,i,n]),t=this.calculateKeyframes(i,n)}else{const i=l.get(this.options.inId);if(i){l.delete(this.options.inId);const{from:n,to:o}=this.O(i,s,e);t=this.calculateKeyframes(n,o),t=this.options.in?[{...this.options.in[0],...t[0]},...this.options.in.slice(1),t[1]]:t,r++,t.forEach((t=>t.zIndex=r))}else this.options.in&&(t=[...this.options.in,{}])}this.animate(t,i)}resetStyles(){var t;void 0!==this.j&&(this.element.setAttribute("style",null!==(t=this.j)&&void 0!==t?t:""),this.j=void 0)}commitStyles(){var t,e;this.j=this.element.getAttribute("style"),null!==(t=this.webAnimation)&&void 0!==t&&t.commitStyles(),null===(e=this.webAnimation)||void 0===e||e.cancel()}reconnected(){}async disconnected(){var t;if(!this.o)return;if(void 0!==this.options.id&&l.set(this.options.id,this.g),void 0===this.options.out)return;if(this.prepare(),await h(),null!==(t=this.t)&&void 0!==t&&t.isConnected){const t=this.i&&this.i.parentNode===this.t?this.i:null;if(this.t.insertBefore(this.element,t),this.options.stabilizeOut){const t=this.p();this.log("stabilizing out");const e=this.g.left-t.left,i=this.g.top-t.top;!("static"===getComputedStyle(this.element).position)||0===e&&0===i||(this.element.style.position="relative"),0!==e&&(this.element.style.left=e+"px"),0!==i&&(this.element.style.top=i+"px")}}const e=this.A(this.options.keyframeOptions);await this.animate(this.options.out,e),this.element.remove()}prepare(){this.createFinished()}start(){var t,e;null===(t=(e=this.options).onStart)||void 0===t||t.call(e,this)}didFinish(t){var e,i;t&&null!==(e=(i=this.options).onComplete)&&void 0!==e&&e.call(i,this),this.g=void 0,this.animatingProperties=void 0,this.frames=void 0,this.resolveFinished()}_(){const t=[];for(let i=this.element.parentNode;i;i=null===(e=i)||void 0===e?void 0:e.parentNode){var e;const s=v.get(i);s&&!s.isDisabled()&&s&&t.push(s)}return t}get isHostRendered(){const t=d.has(this.l);return t||this.l.updateComplete.then((()=>{d.add(this.l)})),t}A(t,e=this._()){const i={...m};return e.forEach((t=>Object.assign(i,t.options.keyframeOptions))),Object.assign(i,t),i}O(t,e,i){t={...t},e={...e};const s=i.map((t=>t.animatingProperties)).filter((t=>void 0!==t));let n=1,o=1;return void 0!==s&&(s.forEach((t=>{t.width&&(n/=t.width),t.height&&(o/=t.height)})),void 0!==t.left&&void 0!==e.left&&(t.left=n*t.left,e.left=n*e.left),void 0!==t.top&&void 0!==e.top&&(t.top=o*t.top,e.top=o*e.top)),{from:t,to:e}}calculateKeyframes(t,e,i=!1){const s={},n={};let o=!1;const a={};for(const i in e){const l=t[i],d=e[i];if(i in u){var r;const t=u[i];if(void 0===l||void 0===d)continue;const e=t(l,d);void 0!==e.transform&&(a[i]=e.value,o=!0,s.transform=`${null!==(r=s.transform)&&void 0!==r?r:""} ${e.transform}`,void 0!==e.overrideFrom&&Object.assign(s,e.overrideFrom))}else l!==d&&void 0!==l&&void 0!==d&&(o=!0,s[i]=l,n[i]=d)}return s.transformOrigin=n.transformOrigin=i?"center center":"top left",this.animatingProperties=a,o?[s,n]:void 0}async animate(t,e=this.options.keyframeOptions){this.start(),this.frames=t;let i=!1;if(!this.isAnimating()&&!this.isDisabled()&&(this.options.onFrames&&(this.frames=t=this.options.onFrames(this),this.log("modified frames",t)),void 0!==t)){this.log("animate",[t,e]),i=!0,this.webAnimation=this.element.animate(t,e);const s=this.getController();null==s||s.add(this);try{await this.webAnimation.finished}catch(t){}null==s||s.remove(this)}return this.didFinish(i),i}isAnimating(){var t,e;return"running"===(null===(t=this.webAnimation)||void 0===t?void 0:t.playState)||(null===(e=this.webAnimation)||void 0===e?void 0:e.pending)}log(t,e){this.shouldLog&&!this.isDisabled()&&console.log(t,this.options.id,e)}}const _=(0,n.XM)(f),y=["top","right","bottom","left"];class k extends o.sR{constructor(t){if(super(t),t.type!==n.pX.ELEMENT)throw Error("The `position` directive must be used in attribute position.")}render(t,e){return s.Ld}update(t,[e,i]){var s;return void 0===this.l&&(this.l=null===(s=t.options)||void 0===s?void 0:s.host,this.l.addController(this)),this.N=t.element,this.P=e,this.S=null!=i?i:["left","top","width","height"],this.render(e,i)}hostUpdated(){this.C()}C(){var t,e;const i="function"==typeof this.P?this.P():null===(t=this.P)||void 0===t?void 0:t.value,s=i.offsetParent;if(void 0===i||!s)return;const n=i.getBoundingClientRect(),o=s.getBoundingClientRect();null===(e=this.S)||void 0===e||e.forEach((t=>{const e=y.includes(t)?n[t]-o[t]:n[t];this.N.style[t]=e+"px"}))}}(0,n.XM)(k)},99266:(t,e,i)=>{i.d(e,{r:()=>r});var s=i(32982),n=i(16616),o=i(41005);const a=(t,e,i)=>{const s=new Map;for(let n=e;n<=i;n++)s.set(t[n],n);return s},r=(0,n.XM)(class extends n.Xe{constructor(t){if(super(t),t.type!==n.pX.CHILD)throw Error("repeat() can only be used in text expressions")}ct(t,e,i){let s;void 0===i?i=e:void 0!==e&&(s=e);const n=[],o=[];let a=0;for(const e of t)n[a]=s?s(e,a):a,o[a]=i(e,a),a++;return{values:o,keys:n}}render(t,e,i){return this.ct(t,e,i).values}update(t,[e,i,n]){var r;const l=(0,o.i9)(t),{values:d,keys:h}=this.ct(e,i,n);if(!Array.isArray(l))return this.ut=h,d;const c=null!==(r=this.ut)&&void 0!==r?r:this.ut=[],p=[];let u,m,g=0,v=l.length-1,f=0,_=d.length-1;for(;g<=v&&f<=_;)if(null===l[g])g++;else if(null===l[v])v--;else if(c[g]===h[f])p[f]=(0,o.fk)(l[g],d[f]),g++,f++;else if(c[v]===h[_])p[_]=(0,o.fk)(l[v],d[_]),v--,_--;else if(c[g]===h[_])p[_]=(0,o.fk)(l[g],d[_]),(0,o._Y)(t,p[_+1],l[g]),g++,_--;else if(c[v]===h[f])p[f]=(0,o.fk)(l[v],d[f]),(0,o._Y)(t,l[g],l[v]),v--,f++;else if(void 0===u&&(u=a(h,f,_),m=a(c,g,v)),u.has(c[g]))if(u.has(c[v])){const e=m.get(h[f]),i=void 0!==e?l[e]:null;if(null===i){const e=(0,o._Y)(t,l[g]);(0,o.fk)(e,d[f]),p[f]=e}else p[f]=(0,o.fk)(i,d[f]),(0,o._Y)(t,l[g],i),l[e]=null;f++}else(0,o.ws)(l[v]),v--;else(0,o.ws)(l[g]),g++;for(;f<=_;){const e=(0,o._Y)(t,p[_+1]);(0,o.fk)(e,d[f]),p[f++]=e}for(;g<=v;){const t=l[g++];null!==t&&(0,o.ws)(t)}return this.ut=h,(0,o.hl)(t,p),s.Jb}})}};
+//# sourceMappingURL=7765.aMWklrSuv5w.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=8245;export const ids=[8245];export const modules={68245:(t,o,e)=>{e.r(o),e.d(o,{HaIconNext:()=>L});var n=e(309),r=e(95260),c=e(67684),s=e(37662);let L=(0,n.Z)([(0,r.Mo)("ha-icon-next")],(function(t,o){return{F:class extends o{constructor(...o){super(...o),t(this)}},d:[{kind:"field",decorators:[(0,r.Cb)()],key:"path",value:()=>"rtl"===c.E.document.dir?"M15.41,16.58L10.83,12L15.41,7.41L14,6L8,12L14,18L15.41,16.58Z":"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z"}]}}),s.HaSvgIcon)}};
+//# sourceMappingURL=8245.PFMlvyoCqgw.js.map
\ No newline at end of file
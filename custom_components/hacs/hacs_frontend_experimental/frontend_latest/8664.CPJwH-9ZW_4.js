@@ -0,0 +1,2 @@
+export const id=8664;export const ids=[8664];export const modules={58135:(e,r,n)=>{n.d(r,{z:()=>t});const t=e=>(r,n)=>e.includes(r,n)},58664:(e,r,n)=>{n.d(r,{v:()=>a});var t=n(21157),c=n(36655);function a(e,r){const n=(0,c.M)(e.entity_id),a=void 0!==r?r:null==e?void 0:e.state;if(["button","event","input_button","scene"].includes(n))return a!==t.nZ;if((0,t.rk)(a))return!1;if(a===t.PX&&"alert"!==n)return!1;switch(n){case"alarm_control_panel":return"disarmed"!==a;case"alert":return"idle"!==a;case"cover":case"valve":return"closed"!==a;case"device_tracker":case"person":return"not_home"!==a;case"lawn_mower":return["mowing","error"].includes(a);case"lock":return"locked"!==a;case"media_player":return"standby"!==a;case"vacuum":return!["idle","docked","paused"].includes(a);case"plant":return"problem"===a;case"group":return["on","home","open","locked","problem"].includes(a);case"timer":return"active"===a;case"camera":return"streaming"===a}return!0}},21157:(e,r,n)=>{n.d(r,{PX:()=>o,V_:()=>s,nZ:()=>c,rk:()=>d});var t=n(58135);const c="unavailable",a="unknown",o="off",s=[c,a],u=[c,a,o],d=(0,t.z)(s);(0,t.z)(u)}};
+//# sourceMappingURL=8664.CPJwH-9ZW_4.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=8697;export const ids=[8697];export const modules={48697:(o,t,e)=>{e.r(t),e.d(t,{default:()=>s});var n=e(56087);n.ZP.mount(n.V8,new n.lK);const s=n.ZP}};
+//# sourceMappingURL=8697.1XtQ3tOdB_4.js.map
\ No newline at end of file
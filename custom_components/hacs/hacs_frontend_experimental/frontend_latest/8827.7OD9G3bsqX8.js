@@ -0,0 +1,2 @@
+export const id=8827;export const ids=[8827];export const modules={28827:(o,t,e)=>{e.r(t),e.d(t,{HaIconPrev:()=>L});var r=e(309),n=e(95260),c=e(67684),s=e(37662);let L=(0,r.Z)([(0,n.Mo)("ha-icon-prev")],(function(o,t){return{F:class extends t{constructor(...t){super(...t),o(this)}},d:[{kind:"field",decorators:[(0,n.Cb)()],key:"path",value:()=>"rtl"===c.E.document.dir?"M8.59,16.58L13.17,12L8.59,7.41L10,6L16,12L10,18L8.59,16.58Z":"M15.41,16.58L10.83,12L15.41,7.41L14,6L8,12L14,18L15.41,16.58Z"}]}}),s.HaSvgIcon)}};
+//# sourceMappingURL=8827.7OD9G3bsqX8.js.map
\ No newline at end of file
@@ -0,0 +1,3 @@
+/*! For license information please see 9255.eVSn4MkuJ3Y.js.LICENSE.txt */
+export const id=9255;export const ids=[9255];export const modules={89255:(e,t,i)=>{i.r(t),i.d(t,{HaIconSelector:()=>a});var s=i(309),o=i(5095),n=i(95260),l=i(60307),d=i(18394),r=i(36655),c=i(81454),h=i(30045);let a=(0,s.Z)([(0,n.Mo)("ha-selector-icon")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,n.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,n.Cb)({type:Boolean})],key:"required",value:()=>!0},{kind:"field",decorators:[(0,n.Cb)()],key:"context",value:void 0},{kind:"method",key:"render",value:function(){var e,t,i,s,n,d;const a=null===(e=this.context)||void 0===e?void 0:e.icon_entity,v=a?this.hass.states[a]:void 0,u=(null===(t=this.selector.icon)||void 0===t?void 0:t.placeholder)||(null==v?void 0:v.attributes.icon)||v&&(0,l.C)((0,h.gD)(this.hass,v)),$=!u&&v?(0,c.K)((0,r.M)(a),v):void 0;return o.dy` <ha-icon-picker .hass="${this.hass}" .label="${this.label}" .value="${this.value}" .required="${this.required}" .disabled="${this.disabled}" .helper="${this.helper}" .fallbackPath="${null!==(i=null===(s=this.selector.icon)||void 0===s?void 0:s.fallbackPath)&&void 0!==i?i:$}" .placeholder="${null!==(n=null===(d=this.selector.icon)||void 0===d?void 0:d.placeholder)&&void 0!==n?n:u}" @value-changed="${this._valueChanged}"></ha-icon-picker> `}},{kind:"method",key:"_valueChanged",value:function(e){(0,d.B)(this,"value-changed",{value:e.detail.value})}}]}}),o.oi)},60307:(e,t,i)=>{i.d(t,{C:()=>v});var s=i(32982),o=i(41005),n=i(36585);class l{constructor(e){this.G=e}disconnect(){this.G=void 0}reconnect(e){this.G=e}deref(){return this.G}}class d{constructor(){this.Y=void 0,this.Z=void 0}get(){return this.Y}pause(){var e;null!==(e=this.Y)&&void 0!==e||(this.Y=new Promise((e=>this.Z=e)))}resume(){var e;null===(e=this.Z)||void 0===e||e.call(this),this.Y=this.Z=void 0}}var r=i(16616);const c=e=>!(0,o.pt)(e)&&"function"==typeof e.then,h=1073741823;class a extends n.sR{constructor(){super(...arguments),this._$C_t=h,this._$Cwt=[],this._$Cq=new l(this),this._$CK=new d}render(...e){var t;return null!==(t=e.find((e=>!c(e))))&&void 0!==t?t:s.Jb}update(e,t){const i=this._$Cwt;let o=i.length;this._$Cwt=t;const n=this._$Cq,l=this._$CK;this.isConnected||this.disconnected();for(let e=0;e<t.length&&!(e>this._$C_t);e++){const s=t[e];if(!c(s))return this._$C_t=e,s;e<o&&s===i[e]||(this._$C_t=h,o=0,Promise.resolve(s).then((async e=>{for(;l.get();)await l.get();const t=n.deref();if(void 0!==t){const i=t._$Cwt.indexOf(s);i>-1&&i<t._$C_t&&(t._$C_t=i,t.setValue(e))}})))}return s.Jb}disconnected(){this._$Cq.disconnect(),this._$CK.pause()}reconnected(){this._$Cq.reconnect(this),this._$CK.resume()}}const v=(0,r.XM)(a)},36585:(e,t,i)=>{i.d(t,{sR:()=>a});var s=i(41005),o=i(16616);const n=(e,t)=>{var i,s;const o=e._$AN;if(void 0===o)return!1;for(const e of o)null===(s=(i=e)._$AO)||void 0===s||s.call(i,t,!1),n(e,t);return!0},l=e=>{let t,i;do{if(void 0===(t=e._$AM))break;i=t._$AN,i.delete(e),e=t}while(0===(null==i?void 0:i.size))},d=e=>{for(let t;t=e._$AM;e=t){let i=t._$AN;if(void 0===i)t._$AN=i=new Set;else if(i.has(e))break;i.add(e),h(t)}};function r(e){void 0!==this._$AN?(l(this),this._$AM=e,d(this)):this._$AM=e}function c(e,t=!1,i=0){const s=this._$AH,o=this._$AN;if(void 0!==o&&0!==o.size)if(t)if(Array.isArray(s))for(let e=i;e<s.length;e++)n(s[e],!1),l(s[e]);else null!=s&&(n(s,!1),l(s));else n(this,e)}const h=e=>{var t,i,s,n;e.type==o.pX.CHILD&&(null!==(t=(s=e)._$AP)&&void 0!==t||(s._$AP=c),null!==(i=(n=e)._$AQ)&&void 0!==i||(n._$AQ=r))};class a extends o.Xe{constructor(){super(...arguments),this._$AN=void 0}_$AT(e,t,i){super._$AT(e,t,i),d(this),this.isConnected=e._$AU}_$AO(e,t=!0){var i,s;e!==this.isConnected&&(this.isConnected=e,e?null===(i=this.reconnected)||void 0===i||i.call(this):null===(s=this.disconnected)||void 0===s||s.call(this)),t&&(n(this,e),l(this))}setValue(e){if((0,s.OR)(this._$Ct))this._$Ct._$AI(e,this);else{const t=[...this._$Ct._$AH];t[this._$Ci]=e,this._$Ct._$AI(t,this,0)}}disconnected(){}reconnected(){}}},41005:(e,t,i)=>{i.d(t,{E_:()=>f,OR:()=>r,_Y:()=>h,dZ:()=>d,fk:()=>a,hN:()=>l,hl:()=>u,i9:()=>$,pt:()=>n,ws:()=>_});var s=i(32982);const{I:o}=s._$LH,n=e=>null===e||"object"!=typeof e&&"function"!=typeof e,l=(e,t)=>void 0===t?void 0!==(null==e?void 0:e._$litType$):(null==e?void 0:e._$litType$)===t,d=e=>{var t;return null!=(null===(t=null==e?void 0:e._$litType$)||void 0===t?void 0:t.h)},r=e=>void 0===e.strings,c=()=>document.createComment(""),h=(e,t,i)=>{var s;const n=e._$AA.parentNode,l=void 0===t?e._$AB:t._$AA;if(void 0===i){const t=n.insertBefore(c(),l),s=n.insertBefore(c(),l);i=new o(t,s,e,e.options)}else{const t=i._$AB.nextSibling,o=i._$AM,d=o!==e;if(d){let t;null===(s=i._$AQ)||void 0===s||s.call(i,e),i._$AM=e,void 0!==i._$AP&&(t=e._$AU)!==o._$AU&&i._$AP(t)}if(t!==l||d){let e=i._$AA;for(;e!==t;){const t=e.nextSibling;n.insertBefore(e,l),e=t}}}return i},a=(e,t,i=e)=>(e._$AI(t,i),e),v={},u=(e,t=v)=>e._$AH=t,$=e=>e._$AH,_=e=>{var t;null===(t=e._$AP)||void 0===t||t.call(e,!1,!0);let i=e._$AA;const s=e._$AB.nextSibling;for(;i!==s;){const e=i.nextSibling;i.remove(),i=e}},f=e=>{e._$AR()}}};
+//# sourceMappingURL=9255.eVSn4MkuJ3Y.js.map
\ No newline at end of file
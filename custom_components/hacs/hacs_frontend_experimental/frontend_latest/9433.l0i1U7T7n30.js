@@ -0,0 +1,3 @@
+/*! For license information please see 9433.l0i1U7T7n30.js.LICENSE.txt */
+export const id=9433;export const ids=[9433];export const modules={8485:(e,r,t)=>{t.d(r,{a:()=>m});var i=t(43204),o=t(72774),a={ROOT:"mdc-form-field"},d={LABEL_SELECTOR:".mdc-form-field > label"};const n=function(e){function r(t){var o=e.call(this,(0,i.__assign)((0,i.__assign)({},r.defaultAdapter),t))||this;return o.click=function(){o.handleClick()},o}return(0,i.__extends)(r,e),Object.defineProperty(r,"cssClasses",{get:function(){return a},enumerable:!1,configurable:!0}),Object.defineProperty(r,"strings",{get:function(){return d},enumerable:!1,configurable:!0}),Object.defineProperty(r,"defaultAdapter",{get:function(){return{activateInputRipple:function(){},deactivateInputRipple:function(){},deregisterInteractionHandler:function(){},registerInteractionHandler:function(){}}},enumerable:!1,configurable:!0}),r.prototype.init=function(){this.adapter.registerInteractionHandler("click",this.click)},r.prototype.destroy=function(){this.adapter.deregisterInteractionHandler("click",this.click)},r.prototype.handleClick=function(){var e=this;this.adapter.activateInputRipple(),requestAnimationFrame((function(){e.adapter.deactivateInputRipple()}))},r}(o.K);var c=t(78220),l=t(18601),s=t(14114),p=t(5095),h=t(95260),u=t(53180);class m extends c.H{constructor(){super(...arguments),this.alignEnd=!1,this.spaceBetween=!1,this.nowrap=!1,this.label="",this.mdcFoundationClass=n}createAdapter(){return{registerInteractionHandler:(e,r)=>{this.labelEl.addEventListener(e,r)},deregisterInteractionHandler:(e,r)=>{this.labelEl.removeEventListener(e,r)},activateInputRipple:async()=>{const e=this.input;if(e instanceof l.Wg){const r=await e.ripple;r&&r.startPress()}},deactivateInputRipple:async()=>{const e=this.input;if(e instanceof l.Wg){const r=await e.ripple;r&&r.endPress()}}}}get input(){var e,r;return null!==(r=null===(e=this.slottedInputs)||void 0===e?void 0:e[0])&&void 0!==r?r:null}render(){const e={"mdc-form-field--align-end":this.alignEnd,"mdc-form-field--space-between":this.spaceBetween,"mdc-form-field--nowrap":this.nowrap};return p.dy` <div class="mdc-form-field ${(0,u.$)(e)}"> <slot></slot> <label class="mdc-label" @click="${this._labelClick}">${this.label}</label> </div>`}click(){this._labelClick()}_labelClick(){const e=this.input;e&&(e.focus(),e.click())}}(0,i.__decorate)([(0,h.Cb)({type:Boolean})],m.prototype,"alignEnd",void 0),(0,i.__decorate)([(0,h.Cb)({type:Boolean})],m.prototype,"spaceBetween",void 0),(0,i.__decorate)([(0,h.Cb)({type:Boolean})],m.prototype,"nowrap",void 0),(0,i.__decorate)([(0,h.Cb)({type:String}),(0,s.P)((async function(e){var r;null===(r=this.input)||void 0===r||r.setAttribute("aria-label",e)}))],m.prototype,"label",void 0),(0,i.__decorate)([(0,h.IO)(".mdc-form-field")],m.prototype,"mdcRoot",void 0),(0,i.__decorate)([(0,h.vZ)("",!0,"*")],m.prototype,"slottedInputs",void 0),(0,i.__decorate)([(0,h.IO)("label")],m.prototype,"labelEl",void 0)},92038:(e,r,t)=>{t.d(r,{W:()=>i});const i=t(5095).iv`.mdc-form-field{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87));display:inline-flex;align-items:center;vertical-align:middle}.mdc-form-field>label{margin-left:0;margin-right:auto;padding-left:4px;padding-right:0;order:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{margin-left:auto;margin-right:0}.mdc-form-field>label[dir=rtl],[dir=rtl] .mdc-form-field>label{padding-left:0;padding-right:4px}.mdc-form-field--nowrap>label{text-overflow:ellipsis;overflow:hidden;white-space:nowrap}.mdc-form-field--align-end>label{margin-left:auto;margin-right:0;padding-left:0;padding-right:4px;order:-1}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{margin-left:0;margin-right:auto}.mdc-form-field--align-end>label[dir=rtl],[dir=rtl] .mdc-form-field--align-end>label{padding-left:4px;padding-right:0}.mdc-form-field--space-between{justify-content:space-between}.mdc-form-field--space-between>label{margin:0}.mdc-form-field--space-between>label[dir=rtl],[dir=rtl] .mdc-form-field--space-between>label{margin:0}:host{display:inline-flex}.mdc-form-field{width:100%}::slotted(*){-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;font-family:Roboto,sans-serif;font-family:var(--mdc-typography-body2-font-family, var(--mdc-typography-font-family, Roboto, sans-serif));font-size:.875rem;font-size:var(--mdc-typography-body2-font-size, .875rem);line-height:1.25rem;line-height:var(--mdc-typography-body2-line-height, 1.25rem);font-weight:400;font-weight:var(--mdc-typography-body2-font-weight,400);letter-spacing:.0178571429em;letter-spacing:var(--mdc-typography-body2-letter-spacing, .0178571429em);text-decoration:inherit;text-decoration:var(--mdc-typography-body2-text-decoration,inherit);text-transform:inherit;text-transform:var(--mdc-typography-body2-text-transform,inherit);color:rgba(0,0,0,.87);color:var(--mdc-theme-text-primary-on-background,rgba(0,0,0,.87))}::slotted(mwc-switch){margin-right:10px}::slotted(mwc-switch[dir=rtl]),[dir=rtl] ::slotted(mwc-switch){margin-left:10px}`},57463:(e,r,t)=>{t.d(r,{J:()=>f});var i=t(43204),o=(t(27763),t(38103)),a=t(18601),d=t(14114);const n=Symbol("selection controller");class c{constructor(){this.selected=null,this.ordered=null,this.set=new Set}}class l{constructor(e){this.sets={},this.focusedSet=null,this.mouseIsDown=!1,this.updating=!1,e.addEventListener("keydown",(e=>{this.keyDownHandler(e)})),e.addEventListener("mousedown",(()=>{this.mousedownHandler()})),e.addEventListener("mouseup",(()=>{this.mouseupHandler()}))}static getController(e){const r=!("global"in e)||"global"in e&&e.global?document:e.getRootNode();let t=r[n];return void 0===t&&(t=new l(r),r[n]=t),t}keyDownHandler(e){const r=e.target;"checked"in r&&this.has(r)&&("ArrowRight"==e.key||"ArrowDown"==e.key?this.selectNext(r):"ArrowLeft"!=e.key&&"ArrowUp"!=e.key||this.selectPrevious(r))}mousedownHandler(){this.mouseIsDown=!0}mouseupHandler(){this.mouseIsDown=!1}has(e){return this.getSet(e.name).set.has(e)}selectPrevious(e){const r=this.getOrdered(e),t=r.indexOf(e),i=r[t-1]||r[r.length-1];return this.select(i),i}selectNext(e){const r=this.getOrdered(e),t=r.indexOf(e),i=r[t+1]||r[0];return this.select(i),i}select(e){e.click()}focus(e){if(this.mouseIsDown)return;const r=this.getSet(e.name),t=this.focusedSet;this.focusedSet=r,t!=r&&r.selected&&r.selected!=e&&r.selected.focus()}isAnySelected(e){const r=this.getSet(e.name);for(const e of r.set)if(e.checked)return!0;return!1}getOrdered(e){const r=this.getSet(e.name);return r.ordered||(r.ordered=Array.from(r.set),r.ordered.sort(((e,r)=>e.compareDocumentPosition(r)==Node.DOCUMENT_POSITION_PRECEDING?1:0))),r.ordered}getSet(e){return this.sets[e]||(this.sets[e]=new c),this.sets[e]}register(e){const r=e.name||e.getAttribute("name")||"",t=this.getSet(r);t.set.add(e),t.ordered=null}unregister(e){const r=this.getSet(e.name);r.set.delete(e),r.ordered=null,r.selected==e&&(r.selected=null)}update(e){if(this.updating)return;this.updating=!0;const r=this.getSet(e.name);if(e.checked){for(const t of r.set)t!=e&&(t.checked=!1);r.selected=e}if(this.isAnySelected(e))for(const e of r.set){if(void 0===e.formElementTabIndex)break;e.formElementTabIndex=e.checked?0:-1}this.updating=!1}}var s=t(98734),p=t(72774),h={NATIVE_CONTROL_SELECTOR:".mdc-radio__native-control"},u={DISABLED:"mdc-radio--disabled",ROOT:"mdc-radio"};const m=function(e){function r(t){return e.call(this,(0,i.__assign)((0,i.__assign)({},r.defaultAdapter),t))||this}return(0,i.__extends)(r,e),Object.defineProperty(r,"cssClasses",{get:function(){return u},enumerable:!1,configurable:!0}),Object.defineProperty(r,"strings",{get:function(){return h},enumerable:!1,configurable:!0}),Object.defineProperty(r,"defaultAdapter",{get:function(){return{addClass:function(){},removeClass:function(){},setNativeControlDisabled:function(){}}},enumerable:!1,configurable:!0}),r.prototype.setDisabled=function(e){var t=r.cssClasses.DISABLED;this.adapter.setNativeControlDisabled(e),e?this.adapter.addClass(t):this.adapter.removeClass(t)},r}(p.K);var b=t(5095),v=t(95260),g=t(53180),_=t(10694);class f extends a.Wg{constructor(){super(...arguments),this._checked=!1,this.useStateLayerCustomProperties=!1,this.global=!1,this.disabled=!1,this.value="on",this.name="",this.reducedTouchTarget=!1,this.mdcFoundationClass=m,this.formElementTabIndex=0,this.focused=!1,this.shouldRenderRipple=!1,this.rippleElement=null,this.rippleHandlers=new s.A((()=>(this.shouldRenderRipple=!0,this.ripple.then((e=>{this.rippleElement=e})),this.ripple)))}get checked(){return this._checked}set checked(e){var r,t;const i=this._checked;e!==i&&(this._checked=e,this.formElement&&(this.formElement.checked=e),null===(r=this._selectionController)||void 0===r||r.update(this),!1===e&&(null===(t=this.formElement)||void 0===t||t.blur()),this.requestUpdate("checked",i),this.dispatchEvent(new Event("checked",{bubbles:!0,composed:!0})))}_handleUpdatedValue(e){this.formElement.value=e}renderRipple(){return this.shouldRenderRipple?b.dy`<mwc-ripple unbounded accent .internalUseStateLayerCustomProperties="${this.useStateLayerCustomProperties}" .disabled="${this.disabled}"></mwc-ripple>`:""}get isRippleActive(){var e;return(null===(e=this.rippleElement)||void 0===e?void 0:e.isActive)||!1}connectedCallback(){super.connectedCallback(),this._selectionController=l.getController(this),this._selectionController.register(this),this._selectionController.update(this)}disconnectedCallback(){this._selectionController.unregister(this),this._selectionController=void 0}focus(){this.formElement.focus()}createAdapter(){return Object.assign(Object.assign({},(0,a.qN)(this.mdcRoot)),{setNativeControlDisabled:e=>{this.formElement.disabled=e}})}handleFocus(){this.focused=!0,this.handleRippleFocus()}handleClick(){this.formElement.focus()}handleBlur(){this.focused=!1,this.formElement.blur(),this.rippleHandlers.endFocus()}setFormData(e){this.name&&this.checked&&e.append(this.name,this.value)}render(){const e={"mdc-radio--touch":!this.reducedTouchTarget,"mdc-ripple-upgraded--background-focused":this.focused,"mdc-radio--disabled":this.disabled};return b.dy` <div class="mdc-radio ${(0,g.$)(e)}"> <input tabindex="${this.formElementTabIndex}" class="mdc-radio__native-control" type="radio" name="${this.name}" aria-label="${(0,_.o)(this.ariaLabel)}" aria-labelledby="${(0,_.o)(this.ariaLabelledBy)}" .checked="${this.checked}" .value="${this.value}" ?disabled="${this.disabled}" @change="${this.changeHandler}" @focus="${this.handleFocus}" @click="${this.handleClick}" @blur="${this.handleBlur}" @mousedown="${this.handleRippleMouseDown}" @mouseenter="${this.handleRippleMouseEnter}" @mouseleave="${this.handleRippleMouseLeave}" @touchstart="${this.handleRippleTouchStart}" @touchend="${this.handleRippleDeactivate}" @touchcancel="${this.handleRippleDeactivate}"> <div class="mdc-radio__background"> <div class="mdc-radio__outer-circle"></div> <div class="mdc-radio__inner-circle"></div> </div> ${this.renderRipple()} </div>`}handleRippleMouseDown(e){const r=()=>{window.removeEventListener("mouseup",r),this.handleRippleDeactivate()};window.addEventListener("mouseup",r),this.rippleHandlers.startPress(e)}handleRippleTouchStart(e){this.rippleHandlers.startPress(e)}handleRippleDeactivate(){this.rippleHandlers.endPress()}handleRippleMouseEnter(){this.rippleHandlers.startHover()}handleRippleMouseLeave(){this.rippleHandlers.endHover()}handleRippleFocus(){this.rippleHandlers.startFocus()}changeHandler(){this.checked=this.formElement.checked}}(0,i.__decorate)([(0,v.IO)(".mdc-radio")],f.prototype,"mdcRoot",void 0),(0,i.__decorate)([(0,v.IO)("input")],f.prototype,"formElement",void 0),(0,i.__decorate)([(0,v.SB)()],f.prototype,"useStateLayerCustomProperties",void 0),(0,i.__decorate)([(0,v.Cb)({type:Boolean})],f.prototype,"global",void 0),(0,i.__decorate)([(0,v.Cb)({type:Boolean,reflect:!0})],f.prototype,"checked",null),(0,i.__decorate)([(0,v.Cb)({type:Boolean}),(0,d.P)((function(e){this.mdcFoundation.setDisabled(e)}))],f.prototype,"disabled",void 0),(0,i.__decorate)([(0,v.Cb)({type:String}),(0,d.P)((function(e){this._handleUpdatedValue(e)}))],f.prototype,"value",void 0),(0,i.__decorate)([(0,v.Cb)({type:String})],f.prototype,"name",void 0),(0,i.__decorate)([(0,v.Cb)({type:Boolean})],f.prototype,"reducedTouchTarget",void 0),(0,i.__decorate)([(0,v.Cb)({type:Number})],f.prototype,"formElementTabIndex",void 0),(0,i.__decorate)([(0,v.SB)()],f.prototype,"focused",void 0),(0,i.__decorate)([(0,v.SB)()],f.prototype,"shouldRenderRipple",void 0),(0,i.__decorate)([(0,v.GC)("mwc-ripple")],f.prototype,"ripple",void 0),(0,i.__decorate)([o.L,(0,v.Cb)({attribute:"aria-label"})],f.prototype,"ariaLabel",void 0),(0,i.__decorate)([o.L,(0,v.Cb)({attribute:"aria-labelledby"})],f.prototype,"ariaLabelledBy",void 0),(0,i.__decorate)([(0,v.hO)({passive:!0})],f.prototype,"handleRippleTouchStart",null)},44973:(e,r,t)=>{t.d(r,{W:()=>i});const i=t(5095).iv`.mdc-touch-target-wrapper{display:inline}.mdc-radio{padding:calc((40px - 20px)/ 2)}.mdc-radio .mdc-radio__native-control:enabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:rgba(0,0,0,.54)}.mdc-radio .mdc-radio__native-control:enabled:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:#018786;border-color:var(--mdc-theme-secondary,#018786)}.mdc-radio .mdc-radio__native-control:enabled+.mdc-radio__background .mdc-radio__inner-circle{border-color:#018786;border-color:var(--mdc-theme-secondary,#018786)}.mdc-radio .mdc-radio__native-control:disabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:rgba(0,0,0,.38)}.mdc-radio .mdc-radio__native-control:disabled:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:rgba(0,0,0,.38)}.mdc-radio .mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background .mdc-radio__inner-circle{border-color:rgba(0,0,0,.38)}.mdc-radio .mdc-radio__background::before{background-color:#018786;background-color:var(--mdc-theme-secondary,#018786)}.mdc-radio .mdc-radio__background::before{top:calc(-1 * (40px - 20px)/ 2);left:calc(-1 * (40px - 20px)/ 2);width:40px;height:40px}.mdc-radio .mdc-radio__native-control{top:calc((40px - 40px)/ 2);right:calc((40px - 40px)/ 2);left:calc((40px - 40px)/ 2);width:40px;height:40px}@media screen and (forced-colors:active),(-ms-high-contrast:active){.mdc-radio.mdc-radio--disabled .mdc-radio__native-control:disabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio.mdc-radio--disabled [aria-disabled=true] .mdc-radio__native-control:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:GrayText}.mdc-radio.mdc-radio--disabled .mdc-radio__native-control:disabled:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio.mdc-radio--disabled [aria-disabled=true] .mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:GrayText}.mdc-radio.mdc-radio--disabled .mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio.mdc-radio--disabled [aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background .mdc-radio__inner-circle{border-color:GrayText}}.mdc-radio{display:inline-block;position:relative;flex:0 0 auto;box-sizing:content-box;width:20px;height:20px;cursor:pointer;will-change:opacity,transform,border-color,color}.mdc-radio__background{display:inline-block;position:relative;box-sizing:border-box;width:20px;height:20px}.mdc-radio__background::before{position:absolute;transform:scale(0,0);border-radius:50%;opacity:0;pointer-events:none;content:"";transition:opacity 120ms 0s cubic-bezier(.4, 0, .6, 1),transform 120ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-radio__outer-circle{position:absolute;top:0;left:0;box-sizing:border-box;width:100%;height:100%;border-width:2px;border-style:solid;border-radius:50%;transition:border-color 120ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-radio__inner-circle{position:absolute;top:0;left:0;box-sizing:border-box;width:100%;height:100%;transform:scale(0,0);border-width:10px;border-style:solid;border-radius:50%;transition:transform 120ms 0s cubic-bezier(.4, 0, .6, 1),border-color 120ms 0s cubic-bezier(.4, 0, .6, 1)}.mdc-radio__native-control{position:absolute;margin:0;padding:0;opacity:0;cursor:inherit;z-index:1}.mdc-radio--touch{margin-top:4px;margin-bottom:4px;margin-right:4px;margin-left:4px}.mdc-radio--touch .mdc-radio__native-control{top:calc((40px - 48px)/ 2);right:calc((40px - 48px)/ 2);left:calc((40px - 48px)/ 2);width:48px;height:48px}.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring{pointer-events:none;border:2px solid transparent;border-radius:6px;box-sizing:content-box;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:100%;width:100%}@media screen and (forced-colors:active){.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring{border-color:CanvasText}}.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring::after,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring::after{content:"";border:2px solid transparent;border-radius:8px;display:block;position:absolute;top:50%;left:50%;transform:translate(-50%,-50%);height:calc(100% + 4px);width:calc(100% + 4px)}@media screen and (forced-colors:active){.mdc-radio.mdc-ripple-upgraded--background-focused .mdc-radio__focus-ring::after,.mdc-radio:not(.mdc-ripple-upgraded):focus .mdc-radio__focus-ring::after{border-color:CanvasText}}.mdc-radio__native-control:checked+.mdc-radio__background,.mdc-radio__native-control:disabled+.mdc-radio__background{transition:opacity 120ms 0s cubic-bezier(0, 0, .2, 1),transform 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__outer-circle{transition:border-color 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle{transition:transform 120ms 0s cubic-bezier(0, 0, .2, 1),border-color 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio--disabled{cursor:default;pointer-events:none}.mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__inner-circle{transform:scale(.5);transition:transform 120ms 0s cubic-bezier(0, 0, .2, 1),border-color 120ms 0s cubic-bezier(0, 0, .2, 1)}.mdc-radio__native-control:disabled+.mdc-radio__background,[aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background{cursor:default}.mdc-radio__native-control:focus+.mdc-radio__background::before{transform:scale(1);opacity:.12;transition:opacity 120ms 0s cubic-bezier(0, 0, .2, 1),transform 120ms 0s cubic-bezier(0, 0, .2, 1)}:host{display:inline-block;outline:0}.mdc-radio{vertical-align:bottom}.mdc-radio .mdc-radio__native-control:enabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:var(--mdc-radio-unchecked-color,rgba(0,0,0,.54))}.mdc-radio .mdc-radio__native-control:disabled:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:not(:checked)+.mdc-radio__background .mdc-radio__outer-circle{border-color:var(--mdc-radio-disabled-color,rgba(0,0,0,.38))}.mdc-radio .mdc-radio__native-control:disabled:checked+.mdc-radio__background .mdc-radio__outer-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control:checked+.mdc-radio__background .mdc-radio__outer-circle{border-color:var(--mdc-radio-disabled-color,rgba(0,0,0,.38))}.mdc-radio .mdc-radio__native-control:disabled+.mdc-radio__background .mdc-radio__inner-circle,.mdc-radio [aria-disabled=true] .mdc-radio__native-control+.mdc-radio__background .mdc-radio__inner-circle{border-color:var(--mdc-radio-disabled-color,rgba(0,0,0,.38))}`},18846:(e,r,t)=>{t.d(r,{l:()=>l});var i=t(43204),o=t(95260),a=t(5095),d=t(8674);class n extends a.oi{get chips(){return this.childElements.filter((e=>e instanceof d.A))}constructor(){super(),this.internals=this.attachInternals(),a.sk||(this.addEventListener("focusin",this.updateTabIndices.bind(this)),this.addEventListener("update-focus",this.updateTabIndices.bind(this)),this.addEventListener("keydown",this.handleKeyDown.bind(this)),this.internals.role="toolbar")}render(){return a.dy`<slot @slotchange="${this.updateTabIndices}"></slot>`}handleKeyDown(e){const r="ArrowLeft"===e.key,t="ArrowRight"===e.key,i="Home"===e.key,o="End"===e.key;if(!(r||t||i||o))return;const{chips:a}=this;if(a.length<2)return;if(e.preventDefault(),i||o){return a[i?0:a.length-1].focus({trailing:o}),void this.updateTabIndices()}const d="rtl"===getComputedStyle(this).direction?r:t,n=a.find((e=>e.matches(":focus-within")));if(!n){return(d?a[0]:a[a.length-1]).focus({trailing:!d}),void this.updateTabIndices()}const c=a.indexOf(n);let l=d?c+1:c-1;for(;l!==c;){l>=a.length?l=0:l<0&&(l=a.length-1);const e=a[l];if(!e.disabled||e.alwaysFocusable){e.focus({trailing:!d}),this.updateTabIndices();break}d?l++:l--}}updateTabIndices(){const{chips:e}=this;let r;for(const t of e){const e=t.alwaysFocusable||!t.disabled;t.matches(":focus-within")&&e?r=t:(e&&!r&&(r=t),t.tabIndex=-1)}r&&(r.tabIndex=0)}}(0,i.__decorate)([(0,o.NH)()],n.prototype,"childElements",void 0);const c=a.iv`:host{display:flex;flex-wrap:wrap;gap:8px}`;let l=class extends n{};l.styles=[c],l=(0,i.__decorate)([(0,o.Mo)("md-chip-set")],l)},16587:(e,r,t)=>{t.d(r,{W:()=>v});var i=t(43204),o=t(95260),a=t(5095),d=t(8674);const n="aria-label-remove";class c extends d.A{get ariaLabelRemove(){if(this.hasAttribute(n))return this.getAttribute(n);const{ariaLabel:e}=this;return`Remove ${e||this.label}`}set ariaLabelRemove(e){e!==this.ariaLabelRemove&&(null===e?this.removeAttribute(n):this.setAttribute(n,e),this.requestUpdate())}constructor(){super(),this.handleTrailingActionFocus=this.handleTrailingActionFocus.bind(this),a.sk||this.addEventListener("keydown",this.handleKeyDown.bind(this))}focus(e){(this.alwaysFocusable||!this.disabled)&&null!=e&&e.trailing&&this.trailingAction?this.trailingAction.focus(e):super.focus(e)}renderContainerContent(){return a.dy` ${super.renderContainerContent()} ${this.renderTrailingAction(this.handleTrailingActionFocus)} `}handleKeyDown(e){var r,t;const i="ArrowLeft"===e.key,o="ArrowRight"===e.key;if(!i&&!o)return;if(!this.primaryAction||!this.trailingAction)return;const a="rtl"===getComputedStyle(this).direction?i:o,d=null===(r=this.primaryAction)||void 0===r?void 0:r.matches(":focus-within"),n=null===(t=this.trailingAction)||void 0===t?void 0:t.matches(":focus-within");if(a&&n||!a&&d)return;e.preventDefault(),e.stopPropagation();(a?this.trailingAction:this.primaryAction).focus()}handleTrailingActionFocus(){const{primaryAction:e,trailingAction:r}=this;e&&r&&(e.tabIndex=-1,r.addEventListener("focusout",(()=>{e.tabIndex=0}),{once:!0}))}}t(86477),t(35981);function l({ariaLabel:e,disabled:r,focusListener:t,tabbable:i=!1}){return a.dy` <button class="trailing action" aria-label="${e}" tabindex="${i?a.Ld:-1}" @click="${s}" @focus="${t}"> <md-focus-ring part="trailing-focus-ring"></md-focus-ring> <md-ripple ?disabled="${r}"></md-ripple> <span class="trailing icon" aria-hidden="true"> <slot name="remove-trailing-icon"> <svg viewBox="0 96 960 960"> <path d="m249 849-42-42 231-231-231-231 42-42 231 231 231-231 42 42-231 231 231 231-42 42-231-231-231 231Z"/> </svg> </slot> </span> <span class="touch"></span> </button> `}function s(e){if(this.disabled)return;e.stopPropagation();!this.dispatchEvent(new Event("remove",{cancelable:!0}))||this.remove()}class p extends c{constructor(){super(...arguments),this.avatar=!1,this.href="",this.target="",this.removeOnly=!1,this.selected=!1}get primaryId(){return this.href?"link":this.removeOnly?"":"button"}get rippleDisabled(){return!this.href&&this.disabled}get primaryAction(){return this.removeOnly?null:this.renderRoot.querySelector(".primary.action")}getContainerClasses(){return{...super.getContainerClasses(),avatar:this.avatar,disabled:!this.href&&this.disabled,link:!!this.href,selected:this.selected,"has-trailing":!0}}renderPrimaryAction(e){const{ariaLabel:r}=this;return this.href?a.dy` <a class="primary action" id="link" aria-label="${r||a.Ld}" href="${this.href}" target="${this.target||a.Ld}">${e}</a> `:this.removeOnly?a.dy` <span class="primary action" aria-label="${r||a.Ld}"> ${e} </span> `:a.dy` <button class="primary action" id="button" aria-label="${r||a.Ld}" ?disabled="${this.disabled&&!this.alwaysFocusable}" type="button">${e}</button> `}renderTrailingAction(e){return l({focusListener:e,ariaLabel:this.ariaLabelRemove,disabled:!this.href&&this.disabled,tabbable:this.removeOnly})}}(0,i.__decorate)([(0,o.Cb)({type:Boolean})],p.prototype,"avatar",void 0),(0,i.__decorate)([(0,o.Cb)()],p.prototype,"href",void 0),(0,i.__decorate)([(0,o.Cb)()],p.prototype,"target",void 0),(0,i.__decorate)([(0,o.Cb)({type:Boolean,attribute:"remove-only"})],p.prototype,"removeOnly",void 0),(0,i.__decorate)([(0,o.Cb)({type:Boolean,reflect:!0})],p.prototype,"selected",void 0),(0,i.__decorate)([(0,o.IO)(".trailing.action")],p.prototype,"trailingAction",void 0);const h=a.iv`:host{--_container-height:var(--md-input-chip-container-height, 32px);--_container-shape:var(--md-input-chip-container-shape, 8px);--_disabled-label-text-color:var(--md-input-chip-disabled-label-text-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-label-text-opacity:var(--md-input-chip-disabled-label-text-opacity, 0.38);--_disabled-selected-container-color:var(--md-input-chip-disabled-selected-container-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-selected-container-opacity:var(--md-input-chip-disabled-selected-container-opacity, 0.12);--_label-text-font:var(--md-input-chip-label-text-font, var(--md-sys-typescale-label-large-font, var(--md-ref-typeface-plain, Roboto)));--_label-text-line-height:var(--md-input-chip-label-text-line-height, var(--md-sys-typescale-label-large-line-height, 1.25rem));--_label-text-size:var(--md-input-chip-label-text-size, var(--md-sys-typescale-label-large-size, 0.875rem));--_label-text-weight:var(--md-input-chip-label-text-weight, var(--md-sys-typescale-label-large-weight, var(--md-ref-typeface-weight-medium, 500)));--_selected-container-color:var(--md-input-chip-selected-container-color, var(--md-sys-color-secondary-container, #e8def8));--_selected-focus-label-text-color:var(--md-input-chip-selected-focus-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-label-text-color:var(--md-input-chip-selected-hover-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-state-layer-color:var(--md-input-chip-selected-hover-state-layer-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-state-layer-opacity:var(--md-input-chip-selected-hover-state-layer-opacity, 0.08);--_selected-label-text-color:var(--md-input-chip-selected-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-outline-width:var(--md-input-chip-selected-outline-width, 0px);--_selected-pressed-label-text-color:var(--md-input-chip-selected-pressed-label-text-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-pressed-state-layer-color:var(--md-input-chip-selected-pressed-state-layer-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-pressed-state-layer-opacity:var(--md-input-chip-selected-pressed-state-layer-opacity, 0.12);--_disabled-outline-color:var(--md-input-chip-disabled-outline-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-outline-opacity:var(--md-input-chip-disabled-outline-opacity, 0.12);--_focus-label-text-color:var(--md-input-chip-focus-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_focus-outline-color:var(--md-input-chip-focus-outline-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-label-text-color:var(--md-input-chip-hover-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-state-layer-color:var(--md-input-chip-hover-state-layer-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-state-layer-opacity:var(--md-input-chip-hover-state-layer-opacity, 0.08);--_label-text-color:var(--md-input-chip-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_outline-color:var(--md-input-chip-outline-color, var(--md-sys-color-outline, #79747e));--_outline-width:var(--md-input-chip-outline-width, 1px);--_pressed-label-text-color:var(--md-input-chip-pressed-label-text-color, var(--md-sys-color-on-surface-variant, #49454f));--_pressed-state-layer-color:var(--md-input-chip-pressed-state-layer-color, var(--md-sys-color-on-surface-variant, #49454f));--_pressed-state-layer-opacity:var(--md-input-chip-pressed-state-layer-opacity, 0.12);--_avatar-shape:var(--md-input-chip-avatar-shape, 9999px);--_avatar-size:var(--md-input-chip-avatar-size, 24px);--_disabled-avatar-opacity:var(--md-input-chip-disabled-avatar-opacity, 0.38);--_disabled-leading-icon-color:var(--md-input-chip-disabled-leading-icon-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-leading-icon-opacity:var(--md-input-chip-disabled-leading-icon-opacity, 0.38);--_icon-size:var(--md-input-chip-icon-size, 18px);--_selected-focus-leading-icon-color:var(--md-input-chip-selected-focus-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_selected-hover-leading-icon-color:var(--md-input-chip-selected-hover-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_selected-leading-icon-color:var(--md-input-chip-selected-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_selected-pressed-leading-icon-color:var(--md-input-chip-selected-pressed-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_focus-leading-icon-color:var(--md-input-chip-focus-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_hover-leading-icon-color:var(--md-input-chip-hover-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_leading-icon-color:var(--md-input-chip-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_pressed-leading-icon-color:var(--md-input-chip-pressed-leading-icon-color, var(--md-sys-color-primary, #6750a4));--_disabled-trailing-icon-color:var(--md-input-chip-disabled-trailing-icon-color, var(--md-sys-color-on-surface, #1d1b20));--_disabled-trailing-icon-opacity:var(--md-input-chip-disabled-trailing-icon-opacity, 0.38);--_selected-focus-trailing-icon-color:var(--md-input-chip-selected-focus-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-hover-trailing-icon-color:var(--md-input-chip-selected-hover-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-pressed-trailing-icon-color:var(--md-input-chip-selected-pressed-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_selected-trailing-icon-color:var(--md-input-chip-selected-trailing-icon-color, var(--md-sys-color-on-secondary-container, #1d192b));--_focus-trailing-icon-color:var(--md-input-chip-focus-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_hover-trailing-icon-color:var(--md-input-chip-hover-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_pressed-trailing-icon-color:var(--md-input-chip-pressed-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_trailing-icon-color:var(--md-input-chip-trailing-icon-color, var(--md-sys-color-on-surface-variant, #49454f));--_leading-space:var(--md-input-chip-leading-space, 16px);--_trailing-space:var(--md-input-chip-trailing-space, 16px);--_icon-label-space:var(--md-input-chip-icon-label-space, 8px);--_with-leading-icon-leading-space:var(--md-input-chip-with-leading-icon-leading-space, 8px);--_with-trailing-icon-trailing-space:var(--md-input-chip-with-trailing-icon-trailing-space, 8px);--_container-shape-start-start:var( --md-input-chip-container-shape-start-start, var(--_container-shape) );--_container-shape-start-end:var( --md-input-chip-container-shape-start-end, var(--_container-shape) );--_container-shape-end-end:var( --md-input-chip-container-shape-end-end, var(--_container-shape) );--_container-shape-end-start:var( --md-input-chip-container-shape-end-start, var(--_container-shape) )}:host([avatar]){--_container-shape-start-start:var( --md-input-chip-container-shape-start-start, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) );--_container-shape-start-end:var( --md-input-chip-container-shape-start-end, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) );--_container-shape-end-end:var( --md-input-chip-container-shape-end-end, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) );--_container-shape-end-start:var( --md-input-chip-container-shape-end-start, var(--md-input-chip-container-shape, calc(var(--_container-height) / 2)) )}.avatar .primary.action{padding-inline-start:4px}.avatar .leading.icon ::slotted(:first-child){border-radius:var(--_avatar-shape);height:var(--_avatar-size);width:var(--_avatar-size)}.disabled.avatar .leading.icon{opacity:var(--_disabled-avatar-opacity)}@media(forced-colors:active){.link .outline{border-color:ActiveText}.disabled.avatar .leading.icon{opacity:1}}`,u=a.iv`.selected{--md-ripple-hover-color:var(--_selected-hover-state-layer-color);--md-ripple-hover-opacity:var(--_selected-hover-state-layer-opacity);--md-ripple-pressed-color:var(--_selected-pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_selected-pressed-state-layer-opacity)}:where(.selected)::before{background:var(--_selected-container-color)}:where(.selected) .outline{border-width:var(--_selected-outline-width)}:where(.selected.disabled)::before{background:var(--_disabled-selected-container-color);opacity:var(--_disabled-selected-container-opacity)}:where(.selected) .label{color:var(--_selected-label-text-color)}:where(.selected:hover) .label{color:var(--_selected-hover-label-text-color)}:where(.selected:focus) .label{color:var(--_selected-focus-label-text-color)}:where(.selected:active) .label{color:var(--_selected-pressed-label-text-color)}:where(.selected) .leading.icon{color:var(--_selected-leading-icon-color)}:where(.selected:hover) .leading.icon{color:var(--_selected-hover-leading-icon-color)}:where(.selected:focus) .leading.icon{color:var(--_selected-focus-leading-icon-color)}:where(.selected:active) .leading.icon{color:var(--_selected-pressed-leading-icon-color)}@media(forced-colors:active){:where(.selected:not(.elevated))::before{border:1px solid CanvasText}:where(.selected) .outline{border-width:1px}}`;var m=t(90704);const b=a.iv`.trailing.action{align-items:center;justify-content:center;padding-inline-start:var(--_icon-label-space);padding-inline-end:var(--_with-trailing-icon-trailing-space)}.trailing.action :is(md-ripple,md-focus-ring){border-radius:50%;height:calc(1.3333333333*var(--_icon-size));width:calc(1.3333333333*var(--_icon-size))}.trailing.action md-focus-ring{inset:unset}.has-trailing .primary.action{padding-inline-end:0}.trailing.icon{color:var(--_trailing-icon-color);height:var(--_icon-size);width:var(--_icon-size)}:where(:hover) .trailing.icon{color:var(--_hover-trailing-icon-color)}:where(:focus) .trailing.icon{color:var(--_focus-trailing-icon-color)}:where(:active) .trailing.icon{color:var(--_pressed-trailing-icon-color)}:where(.disabled) .trailing.icon{color:var(--_disabled-trailing-icon-color);opacity:var(--_disabled-trailing-icon-opacity)}:where(.selected) .trailing.icon{color:var(--_selected-trailing-icon-color)}:where(.selected:hover) .trailing.icon{color:var(--_selected-hover-trailing-icon-color)}:where(.selected:focus) .trailing.icon{color:var(--_selected-focus-trailing-icon-color)}:where(.selected:active) .trailing.icon{color:var(--_selected-pressed-trailing-icon-color)}@media(forced-colors:active){.trailing.icon{color:ButtonText}:where(.disabled) .trailing.icon{color:GrayText;opacity:1}}`;let v=class extends p{};v.styles=[m.W,b,u,h],v=(0,i.__decorate)([(0,o.Mo)("md-input-chip")],v)},8674:(e,r,t)=>{t.d(r,{A:()=>c});var i=t(43204),o=(t(86477),t(35981),t(5095)),a=t(95260),d=t(53180),n=t(6157);class c extends o.oi{constructor(){super(...arguments),this.disabled=!1,this.alwaysFocusable=!1,this.label="",this.hasIcon=!1}get rippleDisabled(){return this.disabled}focus(e){this.disabled&&!this.alwaysFocusable||super.focus(e)}render(){return o.dy` <div class="container ${(0,d.$)(this.getContainerClasses())}"> ${this.renderContainerContent()} </div> `}updated(e){e.has("disabled")&&void 0!==e.get("disabled")&&this.dispatchEvent(new Event("update-focus",{bubbles:!0}))}getContainerClasses(){return{disabled:this.disabled,"has-icon":this.hasIcon}}renderContainerContent(){return o.dy` ${this.renderOutline()} <md-focus-ring part="focus-ring" for="${this.primaryId}"></md-focus-ring> <md-ripple for="${this.primaryId}" ?disabled="${this.rippleDisabled}"></md-ripple> ${this.renderPrimaryAction(this.renderPrimaryContent())} `}renderOutline(){return o.dy`<span class="outline"></span>`}renderLeadingIcon(){return o.dy`<slot name="icon" @slotchange="${this.handleIconChange}"></slot>`}renderPrimaryContent(){return o.dy` <span class="leading icon" aria-hidden="true"> ${this.renderLeadingIcon()} </span> <span class="label">${this.label}</span> <span class="touch"></span> `}handleIconChange(e){const r=e.target;this.hasIcon=r.assignedElements({flatten:!0}).length>0}}(0,n.d)(c),c.shadowRootOptions={...o.oi.shadowRootOptions,delegatesFocus:!0},(0,i.__decorate)([(0,a.Cb)({type:Boolean,reflect:!0})],c.prototype,"disabled",void 0),(0,i.__decorate)([(0,a.Cb)({type:Boolean,attribute:"always-focusable"})],c.prototype,"alwaysFocusable",void 0),(0,i.__decorate)([(0,a.Cb)()],c.prototype,"label",void 0),(0,i.__decorate)([(0,a.Cb)({type:Boolean,reflect:!0,attribute:"has-icon"})],c.prototype,"hasIcon",void 0)},90704:(e,r,t)=>{t.d(r,{W:()=>i});const i=t(5095).iv`:host{border-start-start-radius:var(--_container-shape-start-start);border-start-end-radius:var(--_container-shape-start-end);border-end-start-radius:var(--_container-shape-end-start);border-end-end-radius:var(--_container-shape-end-end);display:inline-flex;height:var(--_container-height);cursor:pointer;-webkit-tap-highlight-color:transparent;--md-ripple-hover-color:var(--_hover-state-layer-color);--md-ripple-hover-opacity:var(--_hover-state-layer-opacity);--md-ripple-pressed-color:var(--_pressed-state-layer-color);--md-ripple-pressed-opacity:var(--_pressed-state-layer-opacity)}:host([disabled]){pointer-events:none}:host([touch-target=wrapper]){margin:max(0px,(48px - var(--_container-height))/2) 0}md-focus-ring{--md-focus-ring-shape-start-start:var(--_container-shape-start-start);--md-focus-ring-shape-start-end:var(--_container-shape-start-end);--md-focus-ring-shape-end-end:var(--_container-shape-end-end);--md-focus-ring-shape-end-start:var(--_container-shape-end-start)}.container{border-radius:inherit;box-sizing:border-box;display:flex;height:100%;position:relative;width:100%}.container::before{border-radius:inherit;content:"";inset:0;pointer-events:none;position:absolute}.container:not(.disabled){cursor:pointer}.container.disabled{pointer-events:none}.cell{display:flex}.action{align-items:baseline;appearance:none;background:0 0;border:none;border-radius:inherit;display:flex;outline:0;padding:0;position:relative;text-decoration:none}.primary.action{padding-inline-start:var(--_leading-space);padding-inline-end:var(--_trailing-space)}.has-icon .primary.action{padding-inline-start:var(--_with-leading-icon-leading-space)}.touch{height:48px;inset:50% 0 0;position:absolute;transform:translateY(-50%);width:100%}:host([touch-target=none]) .touch{display:none}.outline{border:var(--_outline-width) solid var(--_outline-color);border-radius:inherit;inset:0;pointer-events:none;position:absolute}:where(:focus) .outline{border-color:var(--_focus-outline-color)}:where(.disabled) .outline{border-color:var(--_disabled-outline-color);opacity:var(--_disabled-outline-opacity)}md-ripple{border-radius:inherit}.icon,.label,.touch{z-index:1}.label{align-items:center;color:var(--_label-text-color);display:flex;font-family:var(--_label-text-font);font-size:var(--_label-text-size);line-height:var(--_label-text-line-height);font-weight:var(--_label-text-weight);height:100%;text-overflow:ellipsis;user-select:none;white-space:nowrap}:where(:hover) .label{color:var(--_hover-label-text-color)}:where(:focus) .label{color:var(--_focus-label-text-color)}:where(:active) .label{color:var(--_pressed-label-text-color)}:where(.disabled) .label{color:var(--_disabled-label-text-color);opacity:var(--_disabled-label-text-opacity)}.icon{align-self:center;display:flex;fill:currentColor;position:relative}.icon ::slotted(:first-child){font-size:var(--_icon-size);height:var(--_icon-size);width:var(--_icon-size)}.leading.icon{color:var(--_leading-icon-color)}.leading.icon ::slotted(*),.leading.icon svg{margin-inline-end:var(--_icon-label-space)}:where(:hover) .leading.icon{color:var(--_hover-leading-icon-color)}:where(:focus) .leading.icon{color:var(--_focus-leading-icon-color)}:where(:active) .leading.icon{color:var(--_pressed-leading-icon-color)}:where(.disabled) .leading.icon{color:var(--_disabled-leading-icon-color);opacity:var(--_disabled-leading-icon-opacity)}@media(forced-colors:active){:where(.disabled) :is(.label,.outline,.leading.icon){color:GrayText;opacity:1}}a,button:not(:disabled){cursor:inherit}`},99266:(e,r,t)=>{t.d(r,{r:()=>n});var i=t(32982),o=t(16616),a=t(41005);const d=(e,r,t)=>{const i=new Map;for(let o=r;o<=t;o++)i.set(e[o],o);return i},n=(0,o.XM)(class extends o.Xe{constructor(e){if(super(e),e.type!==o.pX.CHILD)throw Error("repeat() can only be used in text expressions")}ct(e,r,t){let i;void 0===t?t=r:void 0!==r&&(i=r);const o=[],a=[];let d=0;for(const r of e)o[d]=i?i(r,d):d,a[d]=t(r,d),d++;return{values:a,keys:o}}render(e,r,t){return this.ct(e,r,t).values}update(e,[r,t,o]){var n;const c=(0,a.i9)(e),{values:l,keys:s}=this.ct(r,t,o);if(!Array.isArray(c))return this.ut=s,l;const p=null!==(n=this.ut)&&void 0!==n?n:this.ut=[],h=[];let u,m,b=0,v=c.length-1,g=0,_=l.length-1;for(;b<=v&&g<=_;)if(null===c[b])b++;else if(null===c[v])v--;else if(p[b]===s[g])h[g]=(0,a.fk)(c[b],l[g]),b++,g++;else if(p[v]===s[_])h[_]=(0,a.fk)(c[v],l[_]),v--,_--;else if(p[b]===s[_])h[_]=(0,a.fk)(c[b],l[_]),(0,a._Y)(e,h[_+1],c[b]),b++,_--;else if(p[v]===s[g])h[g]=(0,a.fk)(c[v],l[g]),(0,a._Y)(e,c[b],c[v]),v--,g++;else if(void 0===u&&(u=d(s,g,_),m=d(p,b,v)),u.has(p[b]))if(u.has(p[v])){const r=m.get(s[g]),t=void 0!==r?c[r]:null;if(null===t){const r=(0,a._Y)(e,c[b]);(0,a.fk)(r,l[g]),h[g]=r}else h[g]=(0,a.fk)(t,l[g]),(0,a._Y)(e,c[b],t),c[r]=null;g++}else(0,a.ws)(c[v]),v--;else(0,a.ws)(c[b]),b++;for(;g<=_;){const r=(0,a._Y)(e,h[_+1]);(0,a.fk)(r,l[g]),h[g++]=r}for(;b<=v;){const e=c[b++];null!==e&&(0,a.ws)(e)}return this.ut=s,(0,a.hl)(e,h),i.Jb}})}};
+//# sourceMappingURL=9433.l0i1U7T7n30.js.map
\ No newline at end of file
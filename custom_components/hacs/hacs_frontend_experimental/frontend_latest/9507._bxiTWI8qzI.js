@@ -0,0 +1,2 @@
+export const id=9507;export const ids=[9507];export const modules={86089:(e,t,i)=>{i.d(t,{U:()=>l});const l=e=>e.stopPropagation()},71133:(e,t,i)=>{var l=i(309),a=i(34541),n=i(47838),o=i(49412),d=i(3762),r=i(5095),c=i(95260),s=i(72218),u=i(2537);i(54371);(0,l.Z)([(0,c.Mo)("ha-select")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,c.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,c.Cb)({type:Boolean,reflect:!0})],key:"clearable",value:()=>!1},{kind:"method",key:"render",value:function(){return r.dy` ${(0,a.Z)((0,n.Z)(i.prototype),"render",this).call(this)} ${this.clearable&&!this.required&&!this.disabled&&this.value?r.dy`<ha-icon-button label="clear" @click="${this._clearValue}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}"></ha-icon-button>`:r.Ld} `}},{kind:"method",key:"renderLeadingIcon",value:function(){return this.icon?r.dy`<span class="mdc-select__icon"><slot name="icon"></slot></span>`:r.Ld}},{kind:"method",key:"connectedCallback",value:function(){(0,a.Z)((0,n.Z)(i.prototype),"connectedCallback",this).call(this),window.addEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"disconnectedCallback",value:function(){(0,a.Z)((0,n.Z)(i.prototype),"disconnectedCallback",this).call(this),window.removeEventListener("translations-updated",this._translationsUpdated)}},{kind:"method",key:"_clearValue",value:function(){!this.disabled&&this.value&&(this.valueSetDirectly=!0,this.select(-1),this.mdcFoundation.handleChange())}},{kind:"field",key:"_translationsUpdated",value(){return(0,s.D)((async()=>{await(0,u.y)(),this.layoutOptions()}),500)}},{kind:"field",static:!0,key:"styles",value:()=>[d.W,r.iv`:host([clearable]){position:relative}.mdc-select:not(.mdc-select--disabled) .mdc-select__icon{color:var(--secondary-text-color)}.mdc-select__anchor{width:var(--ha-select-min-width,200px)}.mdc-select--filled .mdc-select__anchor{height:var(--ha-select-height,56px)}.mdc-select--filled .mdc-floating-label{inset-inline-start:12px;inset-inline-end:initial;direction:var(--direction)}.mdc-select--filled.mdc-select--with-leading-icon .mdc-floating-label{inset-inline-start:48px;inset-inline-end:initial;direction:var(--direction)}.mdc-select .mdc-select__anchor{padding-inline-start:12px;padding-inline-end:0px;direction:var(--direction)}.mdc-select__anchor .mdc-floating-label--float-above{transform-origin:var(--float-start)}.mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,0px)}:host([clearable]) .mdc-select__selected-text-container{padding-inline-end:var(--select-selected-text-padding-end,12px)}ha-icon-button{position:absolute;top:10px;right:28px;--mdc-icon-button-size:36px;--mdc-icon-size:20px;color:var(--secondary-text-color);inset-inline-start:initial;inset-inline-end:28px;direction:var(--direction)}`]}]}}),o.K)},79507:(e,t,i)=>{i.r(t),i.d(t,{HaSelectorUiColor:()=>u});var l=i(309),a=i(5095),n=i(95260),o=i(18394),d=(i(44577),i(86634));const r=new Set(["primary","accent","disabled","red","pink","purple","deep-purple","indigo","blue","light-blue","cyan","teal","green","light-green","lime","yellow","amber","orange","deep-orange","brown","light-grey","grey","dark-grey","blue-grey","black","white"]);function c(e){return r.has(e)?`var(--${e}-color)`:e}var s=i(86089);i(71133);(0,l.Z)([(0,n.Mo)("hui-color-picker")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,n.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,n.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"method",key:"_valueSelected",value:function(e){const t=e.target.value;t&&(0,o.B)(this,"value-changed",{value:"default"!==t?t:void 0})}},{kind:"method",key:"render",value:function(){return a.dy` <ha-select .icon="${Boolean(this.value)}" .label="${this.label}" .value="${this.value||"default"}" .helper="${this.helper}" .disabled="${this.disabled}" @closed="${s.U}" @selected="${this._valueSelected}" fixedMenuPosition naturalMenuWidth> ${this.value?a.dy` <span slot="icon"> ${this.renderColorCircle(this.value||"grey")} </span> `:a.Ld} <mwc-list-item value="default"> ${this.hass.localize("ui.panel.lovelace.editor.color-picker.default_color")} </mwc-list-item> ${Array.from(r).map((e=>a.dy` <mwc-list-item .value="${e}" graphic="icon"> ${this.hass.localize(`ui.panel.lovelace.editor.color-picker.colors.${e}`)||e} <span slot="graphic">${this.renderColorCircle(e)}</span> </mwc-list-item> `))} </ha-select> `}},{kind:"method",key:"renderColorCircle",value:function(e){return a.dy` <span class="circle-color" style="${(0,d.V)({"--circle-color":c(e)})}"></span> `}},{kind:"get",static:!0,key:"styles",value:function(){return a.iv`.circle-color{display:block;background-color:var(--circle-color);border-radius:10px;width:20px;height:20px}ha-select{width:100%}`}}]}}),a.oi);let u=(0,l.Z)([(0,n.Mo)("ha-selector-ui_color")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,n.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,n.Cb)()],key:"helper",value:void 0},{kind:"method",key:"render",value:function(){return a.dy` <hui-color-picker .label="${this.label}" .hass="${this.hass}" .value="${this.value}" .helper="${this.helper}" @value-changed="${this._valueChanged}"></hui-color-picker> `}},{kind:"method",key:"_valueChanged",value:function(e){(0,o.B)(this,"value-changed",{value:e.detail.value})}}]}}),a.oi)}};
+//# sourceMappingURL=9507._bxiTWI8qzI.js.map
\ No newline at end of file
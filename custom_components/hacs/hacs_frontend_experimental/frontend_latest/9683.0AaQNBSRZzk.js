@@ -0,0 +1,2 @@
+export const id=9683;export const ids=[9683,3216];export const modules={18007:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.d(t,{Bt:()=>s});var n=i(22075),l=i(50345),d=i(23216),o=e([d]);d=(o.then?(await o)():o)[0];const r=["sunday","monday","tuesday","wednesday","thursday","friday","saturday"],s=e=>e.first_weekday===l.FS.language?"weekInfo"in Intl.Locale.prototype?new Intl.Locale(e.language).weekInfo.firstDay%7:(0,n.L)(e.language)%7:r.includes(e.first_weekday)?r.indexOf(e.first_weekday):1;a()}catch(e){a(e)}}))},83111:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.d(t,{WB:()=>m,p6:()=>s});var n=i(14516),l=i(50345),d=i(23216),o=i(45502),r=e([d]);d=(r.then?(await r)():r)[0];(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",month:"long",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)})));const s=(e,t,i)=>c(t,i.time_zone).format(e),c=(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"long",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),m=((0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",month:"short",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),(e,t,i)=>{var a,n,d,o;const r=f(t,i.time_zone);if(t.date_format===l.t6.language||t.date_format===l.t6.system)return r.format(e);const s=r.formatToParts(e),c=null===(a=s.find((e=>"literal"===e.type)))||void 0===a?void 0:a.value,m=null===(n=s.find((e=>"day"===e.type)))||void 0===n?void 0:n.value,u=null===(d=s.find((e=>"month"===e.type)))||void 0===d?void 0:d.value,h=null===(o=s.find((e=>"year"===e.type)))||void 0===o?void 0:o.value,p=s.at(s.length-1);let g="literal"===(null==p?void 0:p.type)?null==p?void 0:p.value:"";"bg"===t.language&&t.date_format===l.t6.YMD&&(g="");return{[l.t6.DMY]:`${m}${c}${u}${c}${h}${g}`,[l.t6.MDY]:`${u}${c}${m}${c}${h}${g}`,[l.t6.YMD]:`${h}${c}${u}${c}${m}${g}`}[t.date_format]}),f=(0,n.Z)(((e,t)=>{const i=e.date_format===l.t6.system?void 0:e.language;return e.date_format===l.t6.language||(e.date_format,l.t6.system),new Intl.DateTimeFormat(i,{year:"numeric",month:"numeric",day:"numeric",timeZone:(0,o.f)(e.time_zone,t)})}));(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{day:"numeric",month:"short",timeZone:(0,o.f)(e.time_zone,t)}))),(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"long",year:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{month:"long",timeZone:(0,o.f)(e.time_zone,t)}))),(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{year:"numeric",timeZone:(0,o.f)(e.time_zone,t)}))),(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"long",timeZone:(0,o.f)(e.time_zone,t)}))),(0,n.Z)(((e,t)=>new Intl.DateTimeFormat(e.language,{weekday:"short",timeZone:(0,o.f)(e.time_zone,t)})));a()}catch(e){a(e)}}))},45502:(e,t,i)=>{i.d(t,{f:()=>c});var a,n,l,d,o,r=i(50345);const s=null!==(a=null===(n=(l=Intl).DateTimeFormat)||void 0===n||null===(d=(o=n.call(l)).resolvedOptions)||void 0===d?void 0:d.call(o).timeZone)&&void 0!==a?a:"UTC",c=(e,t)=>e===r.c_.local&&"UTC"!==s?s:t},99683:(e,t,i)=>{i.a(e,(async(e,t)=>{try{var a=i(309),n=i(5095),l=i(95260),d=i(18007),o=i(83111),r=i(18394),s=i(50345),c=(i(37662),i(51520),e([d,o]));[d,o]=c.then?(await c)():c;const m="M19,19H5V8H19M16,1V3H8V1H6V3H5C3.89,3 3,3.89 3,5V19A2,2 0 0,0 5,21H19A2,2 0 0,0 21,19V5C21,3.89 20.1,3 19,3H18V1M17,12H12V17H17V12Z",f=()=>Promise.all([i.e(8597),i.e(1353),i.e(1009)]).then(i.bind(i,81009)),u=(e,t)=>{(0,r.B)(e,"show-dialog",{dialogTag:"ha-dialog-date-picker",dialogImport:f,dialogParams:t})};(0,a.Z)([(0,l.Mo)("ha-date-input")],(function(e,t){return{F:class extends t{constructor(...t){super(...t),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"locale",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"min",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"max",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"canClear",value:()=>!1},{kind:"method",key:"render",value:function(){return n.dy`<ha-textfield .label="${this.label}" .helper="${this.helper}" .disabled="${this.disabled}" iconTrailing helperPersistent readonly="readonly" @click="${this._openDialog}" @keydown="${this._keyDown}" .value="${this.value?(0,o.WB)(new Date(`${this.value.split("T")[0]}T00:00:00`),{...this.locale,time_zone:s.c_.local},{}):""}" .required="${this.required}"> <ha-svg-icon slot="trailingIcon" .path="${m}"></ha-svg-icon> </ha-textfield>`}},{kind:"method",key:"_openDialog",value:function(){this.disabled||u(this,{min:this.min||"1970-01-01",max:this.max,value:this.value,canClear:this.canClear,onChange:e=>this._valueChanged(e),locale:this.locale.language,firstWeekday:(0,d.Bt)(this.locale)})}},{kind:"method",key:"_keyDown",value:function(e){this.canClear&&["Backspace","Delete"].includes(e.key)&&this._valueChanged(void 0)}},{kind:"method",key:"_valueChanged",value:function(e){this.value!==e&&(this.value=e,(0,r.B)(this,"change"),(0,r.B)(this,"value-changed",{value:e}))}},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`ha-svg-icon{color:var(--secondary-text-color)}ha-textfield{display:block}`}}]}}),n.oi);t()}catch(e){t(e)}}))},51520:(e,t,i)=>{var a=i(309),n=i(34541),l=i(47838),d=i(42977),o=i(31338),r=i(5095),s=i(95260),c=i(67684);(0,a.Z)([(0,s.Mo)("ha-textfield")],(function(e,t){class i extends t{constructor(...t){super(...t),e(this)}}return{F:i,d:[{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"invalid",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({attribute:"error-message"})],key:"errorMessage",value:void 0},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"icon",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)({type:Boolean})],key:"iconTrailing",value:()=>!1},{kind:"field",decorators:[(0,s.Cb)()],key:"autocomplete",value:void 0},{kind:"field",decorators:[(0,s.Cb)()],key:"autocorrect",value:void 0},{kind:"field",decorators:[(0,s.Cb)({attribute:"input-spellcheck"})],key:"inputSpellcheck",value:void 0},{kind:"field",decorators:[(0,s.IO)("input")],key:"formElement",value:void 0},{kind:"method",key:"updated",value:function(e){(0,n.Z)((0,l.Z)(i.prototype),"updated",this).call(this,e),(e.has("invalid")&&(this.invalid||void 0!==e.get("invalid"))||e.has("errorMessage"))&&(this.setCustomValidity(this.invalid?this.errorMessage||"Invalid":""),this.reportValidity()),e.has("autocomplete")&&(this.autocomplete?this.formElement.setAttribute("autocomplete",this.autocomplete):this.formElement.removeAttribute("autocomplete")),e.has("autocorrect")&&(this.autocorrect?this.formElement.setAttribute("autocorrect",this.autocorrect):this.formElement.removeAttribute("autocorrect")),e.has("inputSpellcheck")&&(this.inputSpellcheck?this.formElement.setAttribute("spellcheck",this.inputSpellcheck):this.formElement.removeAttribute("spellcheck"))}},{kind:"method",key:"renderIcon",value:function(e,t=!1){const i=t?"trailing":"leading";return r.dy` <span class="mdc-text-field__icon mdc-text-field__icon--${i}" tabindex="${t?1:-1}"> <slot name="${i}Icon"></slot> </span> `}},{kind:"field",static:!0,key:"styles",value:()=>[o.W,r.iv`.mdc-text-field__input{width:var(--ha-textfield-input-width,100%)}.mdc-text-field:not(.mdc-text-field--with-leading-icon){padding:var(--text-field-padding,0px 16px)}.mdc-text-field__affix--suffix{padding-left:var(--text-field-suffix-padding-left,12px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,12px);padding-inline-end:var(--text-field-suffix-padding-right,0px);direction:var(--direction)}.mdc-text-field--with-leading-icon{padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,16px);direction:var(--direction)}.mdc-text-field--with-leading-icon.mdc-text-field--with-trailing-icon{padding-left:var(--text-field-suffix-padding-left,0px);padding-right:var(--text-field-suffix-padding-right,0px);padding-inline-start:var(--text-field-suffix-padding-left,0px);padding-inline-end:var(--text-field-suffix-padding-right,0px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--suffix{color:var(--secondary-text-color)}.mdc-text-field__icon{color:var(--secondary-text-color)}.mdc-text-field__icon--leading{margin-inline-start:16px;margin-inline-end:8px;direction:var(--direction)}.mdc-text-field__icon--trailing{padding:var(--textfield-icon-trailing-padding,12px)}.mdc-floating-label:not(.mdc-floating-label--float-above){text-overflow:ellipsis;width:inherit;padding-right:30px;padding-inline-end:30px;padding-inline-start:initial;box-sizing:border-box;direction:var(--direction)}input{text-align:var(--text-field-text-align,start)}::-ms-reveal{display:none}:host([no-spinner]) input::-webkit-inner-spin-button,:host([no-spinner]) input::-webkit-outer-spin-button{-webkit-appearance:none;margin:0}:host([no-spinner]) input[type=number]{-moz-appearance:textfield}.mdc-text-field__ripple{overflow:hidden}.mdc-text-field{overflow:var(--text-field-overflow)}.mdc-floating-label{inset-inline-start:16px!important;inset-inline-end:initial!important;transform-origin:var(--float-start);direction:var(--direction);text-align:var(--float-start)}.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label{max-width:calc(100% - 48px - var(--text-field-suffix-padding-left,0px));inset-inline-start:calc(48px + var(--text-field-suffix-padding-left,0px))!important;inset-inline-end:initial!important;direction:var(--direction)}.mdc-text-field__input[type=number]{direction:var(--direction)}.mdc-text-field__affix--prefix{padding-right:var(--text-field-prefix-padding-right,2px)}.mdc-text-field:not(.mdc-text-field--disabled) .mdc-text-field__affix--prefix{color:var(--mdc-text-field-label-ink-color)}`,"rtl"===c.E.document.dir?r.iv`.mdc-floating-label,.mdc-text-field--with-leading-icon,.mdc-text-field--with-leading-icon.mdc-text-field--filled .mdc-floating-label,.mdc-text-field__affix--suffix,.mdc-text-field__icon--leading,.mdc-text-field__input[type=number]{direction:rtl}`:r.iv``]}]}}),d.P)},23216:(e,t,i)=>{i.a(e,(async(e,a)=>{try{i.r(t);var n=i(43170),l=i(27499),d=i(16723),o=i(82874),r=i(32812),s=i(99331),c=i(27815),m=i(64532),f=i(11674),u=i(53285);const e=async()=>{const e=(0,f.sS)(),t=[];(0,d.Y)()&&await Promise.all([i.e(9460),i.e(254)]).then(i.bind(i,20254)),(0,r.Y)()&&await Promise.all([i.e(7021),i.e(9460),i.e(8196)]).then(i.bind(i,48196)),(0,n.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(6554)]).then(i.bind(i,76554)).then((()=>(0,u.H)()))),(0,l.Yq)(e)&&t.push(Promise.all([i.e(7021),i.e(2684)]).then(i.bind(i,72684))),(0,o.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(9029)]).then(i.bind(i,69029))),(0,s.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(7048)]).then(i.bind(i,87048))),(0,c.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(655)]).then(i.bind(i,20655)).then((()=>i.e(4827).then(i.t.bind(i,64827,23))))),(0,m.Y)(e)&&t.push(Promise.all([i.e(7021),i.e(759)]).then(i.bind(i,20759))),0!==t.length&&await Promise.all(t).then((()=>(0,u.n)(e)))};await e(),a()}catch(e){a(e)}}),1)},22075:(e,t,i)=>{i.d(t,{L:()=>l});const a={en:"US",hi:"IN",deva:"IN",te:"IN",mr:"IN",ta:"IN",gu:"IN",kn:"IN",or:"IN",ml:"IN",pa:"IN",bho:"IN",awa:"IN",as:"IN",mwr:"IN",mai:"IN",mag:"IN",bgc:"IN",hne:"IN",dcc:"IN",bn:"BD",beng:"BD",rkt:"BD",dz:"BT",tibt:"BT",tn:"BW",am:"ET",ethi:"ET",om:"ET",quc:"GT",id:"ID",jv:"ID",su:"ID",mad:"ID",ms_arab:"ID",he:"IL",hebr:"IL",jam:"JM",ja:"JP",jpan:"JP",km:"KH",khmr:"KH",ko:"KR",kore:"KR",lo:"LA",laoo:"LA",mh:"MH",my:"MM",mymr:"MM",mt:"MT",ne:"NP",fil:"PH",ceb:"PH",ilo:"PH",ur:"PK",pa_arab:"PK",lah:"PK",ps:"PK",sd:"PK",skr:"PK",gn:"PY",th:"TH",thai:"TH",tts:"TH",zh_hant:"TW",hant:"TW",sm:"WS",zu:"ZA",sn:"ZW",arq:"DZ",ar:"EG",arab:"EG",arz:"EG",fa:"IR",az_arab:"IR",dv:"MV",thaa:"MV"};const n={AG:0,ATG:0,28:0,AS:0,ASM:0,16:0,BD:0,BGD:0,50:0,BR:0,BRA:0,76:0,BS:0,BHS:0,44:0,BT:0,BTN:0,64:0,BW:0,BWA:0,72:0,BZ:0,BLZ:0,84:0,CA:0,CAN:0,124:0,CO:0,COL:0,170:0,DM:0,DMA:0,212:0,DO:0,DOM:0,214:0,ET:0,ETH:0,231:0,GT:0,GTM:0,320:0,GU:0,GUM:0,316:0,HK:0,HKG:0,344:0,HN:0,HND:0,340:0,ID:0,IDN:0,360:0,IL:0,ISR:0,376:0,IN:0,IND:0,356:0,JM:0,JAM:0,388:0,JP:0,JPN:0,392:0,KE:0,KEN:0,404:0,KH:0,KHM:0,116:0,KR:0,KOR:0,410:0,LA:0,LA0:0,418:0,MH:0,MHL:0,584:0,MM:0,MMR:0,104:0,MO:0,MAC:0,446:0,MT:0,MLT:0,470:0,MX:0,MEX:0,484:0,MZ:0,MOZ:0,508:0,NI:0,NIC:0,558:0,NP:0,NPL:0,524:0,PA:0,PAN:0,591:0,PE:0,PER:0,604:0,PH:0,PHL:0,608:0,PK:0,PAK:0,586:0,PR:0,PRI:0,630:0,PT:0,PRT:0,620:0,PY:0,PRY:0,600:0,SA:0,SAU:0,682:0,SG:0,SGP:0,702:0,SV:0,SLV:0,222:0,TH:0,THA:0,764:0,TT:0,TTO:0,780:0,TW:0,TWN:0,158:0,UM:0,UMI:0,581:0,US:0,USA:0,840:0,VE:0,VEN:0,862:0,VI:0,VIR:0,850:0,WS:0,WSM:0,882:0,YE:0,YEM:0,887:0,ZA:0,ZAF:0,710:0,ZW:0,ZWE:0,716:0,AE:6,ARE:6,784:6,AF:6,AFG:6,4:6,BH:6,BHR:6,48:6,DJ:6,DJI:6,262:6,DZ:6,DZA:6,12:6,EG:6,EGY:6,818:6,IQ:6,IRQ:6,368:6,IR:6,IRN:6,364:6,JO:6,JOR:6,400:6,KW:6,KWT:6,414:6,LY:6,LBY:6,434:6,OM:6,OMN:6,512:6,QA:6,QAT:6,634:6,SD:6,SDN:6,729:6,SY:6,SYR:6,760:6,MV:5,MDV:5,462:5};function l(e){return function(e,t,i){if(e){var a,n=e.toLowerCase().split(/[-_]/),l=n[0],d=l;if(n[1]&&4===n[1].length?(d+="_"+n[1],a=n[2]):a=n[1],a||(a=t[d]||t[l]),a)return function(e,t){var i=t["string"==typeof e?e.toUpperCase():e];return"number"==typeof i?i:1}(a.match(/^\d+$/)?Number(a):a,i)}return 1}(e,a,n)}}};
+//# sourceMappingURL=9683.0AaQNBSRZzk.js.map
\ No newline at end of file
@@ -0,0 +1,2 @@
+export const id=9880;export const ids=[9880,8664];export const modules={58135:(e,i,t)=>{t.d(i,{z:()=>a});const a=e=>(i,t)=>e.includes(i,t)},86089:(e,i,t)=>{t.d(i,{U:()=>a});const a=e=>e.stopPropagation()},58664:(e,i,t)=>{t.d(i,{v:()=>d});var a=t(21157),s=t(36655);function d(e,i){const t=(0,s.M)(e.entity_id),d=void 0!==i?i:null==e?void 0:e.state;if(["button","event","input_button","scene"].includes(t))return d!==a.nZ;if((0,a.rk)(d))return!1;if(d===a.PX&&"alert"!==t)return!1;switch(t){case"alarm_control_panel":return"disarmed"!==d;case"alert":return"idle"!==d;case"cover":case"valve":return"closed"!==d;case"device_tracker":case"person":return"not_home"!==d;case"lawn_mower":return["mowing","error"].includes(d);case"lock":return"locked"!==d;case"media_player":return"standby"!==d;case"vacuum":return!["idle","docked","paused"].includes(d);case"plant":return"problem"===d;case"group":return["on","home","open","locked","problem"].includes(d);case"timer":return"active"===d;case"camera":return"streaming"===d}return!0}},11705:(e,i,t)=>{t.d(i,{T:()=>s});const a=/^(\w+)\.(\w+)$/,s=e=>a.test(e)},27056:(e,i,t)=>{var a=t(309),s=t(5095),d=t(95260),n=t(14516),l=t(18394),o=t(36655),r=t(28858),c=t(1913),u=t(16061);t(16591),t(90532);const h=e=>s.dy`<ha-list-item .twoline="${!!e.area}"> <span>${e.name}</span> <span slot="secondary">${e.area}</span> </ha-list-item>`;(0,a.Z)([(0,d.Mo)("ha-device-picker")],(function(e,i){return{F:class extends i{constructor(...i){super(...i),e(this)}},d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"exclude-devices"})],key:"excludeDevices",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"deviceFilter",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,d.SB)()],key:"_opened",value:void 0},{kind:"field",decorators:[(0,d.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"field",key:"_init",value:()=>!1},{kind:"field",key:"_getDevices",value(){return(0,n.Z)(((e,i,t,a,s,d,n,l,c)=>{if(!e.length)return[{id:"no_devices",area:"",name:this.hass.localize("ui.components.device-picker.no_devices"),strings:[]}];let h={};(a||s||d||l)&&(h=(0,u.R6)(t));let v=e.filter((e=>e.id===this.value||!e.disabled_by));a&&(v=v.filter((e=>{const i=h[e.id];return!(!i||!i.length)&&h[e.id].some((e=>a.includes((0,o.M)(e.entity_id))))}))),s&&(v=v.filter((e=>{const i=h[e.id];return!i||!i.length||t.every((e=>!s.includes((0,o.M)(e.entity_id))))}))),c&&(v=v.filter((e=>!c.includes(e.id)))),d&&(v=v.filter((e=>{const i=h[e.id];return!(!i||!i.length)&&h[e.id].some((e=>{const i=this.hass.states[e.entity_id];return!!i&&(i.attributes.device_class&&d.includes(i.attributes.device_class))}))}))),l&&(v=v.filter((e=>{const i=h[e.id];return!(!i||!i.length)&&i.some((e=>{const i=this.hass.states[e.entity_id];return!!i&&l(i)}))}))),n&&(v=v.filter((e=>e.id===this.value||n(e))));const p=v.map((e=>{const t=(0,u.jL)(e,this.hass,h[e.id]);return{id:e.id,name:t,area:e.area_id&&i[e.area_id]?i[e.area_id].name:this.hass.localize("ui.components.device-picker.no_area"),strings:[t||""]}}));return p.length?1===p.length?p:p.sort(((e,i)=>(0,r.$)(e.name||"",i.name||"",this.hass.locale.language))):[{id:"no_devices",area:"",name:this.hass.localize("ui.components.device-picker.no_match"),strings:[]}]}))}},{kind:"method",key:"open",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.open())}},{kind:"method",key:"focus",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.focus())}},{kind:"method",key:"updated",value:function(e){if(!this._init&&this.hass||this._init&&e.has("_opened")&&this._opened){this._init=!0;const e=this._getDevices(Object.values(this.hass.devices),this.hass.areas,Object.values(this.hass.entities),this.includeDomains,this.excludeDomains,this.includeDeviceClasses,this.deviceFilter,this.entityFilter,this.excludeDevices);this.comboBox.items=e,this.comboBox.filteredItems=e}}},{kind:"method",key:"render",value:function(){return s.dy` <ha-combo-box .hass="${this.hass}" .label="${void 0===this.label&&this.hass?this.hass.localize("ui.components.device-picker.device"):this.label}" .value="${this._value}" .helper="${this.helper}" .renderer="${h}" .disabled="${this.disabled}" .required="${this.required}" item-id-path="id" item-value-path="id" item-label-path="name" @opened-changed="${this._openedChanged}" @value-changed="${this._deviceChanged}" @filter-changed="${this._filterChanged}"></ha-combo-box> `}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_filterChanged",value:function(e){const i=e.target,t=e.detail.value.toLowerCase();i.filteredItems=t.length?(0,c.q)(t,i.items||[]):i.items}},{kind:"method",key:"_deviceChanged",value:function(e){e.stopPropagation();let i=e.detail.value;"no_devices"===i&&(i=""),i!==this._value&&this._setValue(i)}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_setValue",value:function(e){this.value=e,setTimeout((()=>{(0,l.B)(this,"value-changed",{value:e}),(0,l.B)(this,"change")}),0)}}]}}),s.oi)},91998:(e,i,t)=>{var a=t(309),s=(t(90532),t(5095)),d=t(95260),n=t(14516),l=t(18394),o=t(36655),r=t(2733),c=t(1913),u=(t(16591),t(54371),t(37662),t(75868),t(28858));(0,a.Z)([(0,d.Mo)("ha-entity-picker")],(function(e,i){return{F:class extends i{constructor(...i){super(...i),e(this)}},d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"autofocus",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean,attribute:"allow-custom-entity"})],key:"allowCustomEntity",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-unit-of-measurement"})],key:"includeUnitOfMeasurement",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-entities"})],key:"includeEntities",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"exclude-entities"})],key:"excludeEntities",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"hideClearIcon",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({attribute:"item-label-path"})],key:"itemLabelPath",value:()=>"friendly_name"},{kind:"field",decorators:[(0,d.SB)()],key:"_opened",value:()=>!1},{kind:"field",decorators:[(0,d.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"method",key:"open",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.open())}},{kind:"method",key:"focus",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.focus())}},{kind:"field",key:"_initedStates",value:()=>!1},{kind:"field",key:"_states",value:()=>[]},{kind:"field",key:"_rowRenderer",value(){return e=>s.dy`<ha-list-item graphic="avatar" .twoline="${!!e.entity_id}"> ${e.state?s.dy`<state-badge slot="graphic" .stateObj="${e}" .hass="${this.hass}"></state-badge>`:""} <span>${e.friendly_name}</span> <span slot="secondary">${e.entity_id}</span> </ha-list-item>`}},{kind:"field",key:"_getStates",value(){return(0,n.Z)(((e,i,t,a,s,d,n,l,c)=>{let h=[];if(!i)return[];let v=Object.keys(i.states);return v.length?l?(v=v.filter((e=>this.includeEntities.includes(e))),v.map((e=>{const t=(0,r.C)(i.states[e])||e;return{...i.states[e],friendly_name:t,strings:[e,t]}})).sort(((e,i)=>(0,u.f)(e.friendly_name,i.friendly_name,this.hass.locale.language)))):(c&&(v=v.filter((e=>!c.includes(e)))),t&&(v=v.filter((e=>t.includes((0,o.M)(e))))),a&&(v=v.filter((e=>!a.includes((0,o.M)(e))))),h=v.map((e=>{const t=(0,r.C)(i.states[e])||e;return{...i.states[e],friendly_name:t,strings:[e,t]}})).sort(((e,i)=>(0,u.f)(e.friendly_name,i.friendly_name,this.hass.locale.language))),d&&(h=h.filter((e=>e.entity_id===this.value||e.attributes.device_class&&d.includes(e.attributes.device_class)))),n&&(h=h.filter((e=>e.entity_id===this.value||e.attributes.unit_of_measurement&&n.includes(e.attributes.unit_of_measurement)))),s&&(h=h.filter((e=>e.entity_id===this.value||s(e)))),h.length?h:[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_match"),attributes:{friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_match"),icon:"mdi:magnify"},strings:[]}]):[{entity_id:"",state:"",last_changed:"",last_updated:"",context:{id:"",user_id:null,parent_id:null},friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_entities"),attributes:{friendly_name:this.hass.localize("ui.components.entity.entity-picker.no_entities"),icon:"mdi:magnify"},strings:[]}]}))}},{kind:"method",key:"shouldUpdate",value:function(e){return!!(e.has("value")||e.has("label")||e.has("disabled"))||!(!e.has("_opened")&&this._opened)}},{kind:"method",key:"willUpdate",value:function(e){(!this._initedStates||e.has("_opened")&&this._opened)&&(this._states=this._getStates(this._opened,this.hass,this.includeDomains,this.excludeDomains,this.entityFilter,this.includeDeviceClasses,this.includeUnitOfMeasurement,this.includeEntities,this.excludeEntities),this._initedStates&&(this.comboBox.filteredItems=this._states),this._initedStates=!0)}},{kind:"method",key:"render",value:function(){return s.dy` <ha-combo-box item-value-path="entity_id" .itemLabelPath="${this.itemLabelPath}" .hass="${this.hass}" .value="${this._value}" .label="${void 0===this.label?this.hass.localize("ui.components.entity.entity-picker.entity"):this.label}" .helper="${this.helper}" .allowCustomValue="${this.allowCustomEntity}" .filteredItems="${this._states}" .renderer="${this._rowRenderer}" .required="${this.required}" .disabled="${this.disabled}" @opened-changed="${this._openedChanged}" @value-changed="${this._valueChanged}" @filter-changed="${this._filterChanged}"> </ha-combo-box> `}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_valueChanged",value:function(e){e.stopPropagation();const i=e.detail.value;i!==this._value&&this._setValue(i)}},{kind:"method",key:"_filterChanged",value:function(e){const i=e.target,t=e.detail.value.toLowerCase();i.filteredItems=t.length?(0,c.q)(t,this._states):this._states}},{kind:"method",key:"_setValue",value:function(e){this.value=e,setTimeout((()=>{(0,l.B)(this,"value-changed",{value:e}),(0,l.B)(this,"change")}),0)}}]}}),s.oi)},25718:(e,i,t)=>{var a=t(309),s=t(5095),d=t(95260),n=t(53180),l=t(14516),o=t(18394),r=t(36655),c=t(1913),u=t(97477),h=t(16061),v=t(11285);t(16591),t(54371),t(90532),t(37662);const p=e=>s.dy`<ha-list-item class="${(0,n.$)({"add-new":"add_new"===e.area_id})}"> ${e.name} </ha-list-item>`;(0,a.Z)([(0,d.Mo)("ha-area-picker")],(function(e,i){return{F:class extends i{constructor(...i){super(...i),e(this)}},d:[{kind:"field",decorators:[(0,d.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"placeholder",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean,attribute:"no-add"})],key:"noAdd",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"exclude-domains"})],key:"excludeDomains",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Array,attribute:"exclude-areas"})],key:"excludeAreas",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"deviceFilter",value:void 0},{kind:"field",decorators:[(0,d.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,d.Cb)({type:Boolean})],key:"required",value:()=>!1},{kind:"field",decorators:[(0,d.SB)()],key:"_opened",value:void 0},{kind:"field",decorators:[(0,d.IO)("ha-combo-box",!0)],key:"comboBox",value:void 0},{kind:"field",key:"_suggestion",value:void 0},{kind:"field",key:"_init",value:()=>!1},{kind:"method",key:"open",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.open())}},{kind:"method",key:"focus",value:async function(){var e;await this.updateComplete,await(null===(e=this.comboBox)||void 0===e?void 0:e.focus())}},{kind:"field",key:"_getAreas",value(){return(0,l.Z)(((e,i,t,a,s,d,n,l,o,c)=>{if(!e.length)return[{area_id:"no_areas",name:this.hass.localize("ui.components.area-picker.no_areas"),picture:null,aliases:[]}];let u,v,p={};(a||s||d||n||l)&&(p=(0,h.R6)(t),u=i,v=t.filter((e=>e.area_id)),a&&(u=u.filter((e=>{const i=p[e.id];return!(!i||!i.length)&&p[e.id].some((e=>a.includes((0,r.M)(e.entity_id))))})),v=v.filter((e=>a.includes((0,r.M)(e.entity_id))))),s&&(u=u.filter((e=>{const i=p[e.id];return!i||!i.length||t.every((e=>!s.includes((0,r.M)(e.entity_id))))})),v=v.filter((e=>!s.includes((0,r.M)(e.entity_id))))),d&&(u=u.filter((e=>{const i=p[e.id];return!(!i||!i.length)&&p[e.id].some((e=>{const i=this.hass.states[e.entity_id];return!!i&&(i.attributes.device_class&&d.includes(i.attributes.device_class))}))})),v=v.filter((e=>{const i=this.hass.states[e.entity_id];return i.attributes.device_class&&d.includes(i.attributes.device_class)}))),n&&(u=u.filter((e=>n(e)))),l&&(u=u.filter((e=>{const i=p[e.id];return!(!i||!i.length)&&p[e.id].some((e=>{const i=this.hass.states[e.entity_id];return!!i&&l(i)}))})),v=v.filter((e=>{const i=this.hass.states[e.entity_id];return!!i&&l(i)}))));let _,m=e;var y;(u&&(_=u.filter((e=>e.area_id)).map((e=>e.area_id))),v)&&(_=(null!==(y=_)&&void 0!==y?y:[]).concat(v.filter((e=>e.area_id)).map((e=>e.area_id))));return _&&(m=e.filter((e=>_.includes(e.area_id)))),c&&(m=m.filter((e=>!c.includes(e.area_id)))),m.length||(m=[{area_id:"no_areas",name:this.hass.localize("ui.components.area-picker.no_match"),picture:null,aliases:[]}]),o?m:[...m,{area_id:"add_new",name:this.hass.localize("ui.components.area-picker.add_new"),picture:null,aliases:[]}]}))}},{kind:"method",key:"updated",value:function(e){if(!this._init&&this.hass||this._init&&e.has("_opened")&&this._opened){this._init=!0;const e=this._getAreas(Object.values(this.hass.areas),Object.values(this.hass.devices),Object.values(this.hass.entities),this.includeDomains,this.excludeDomains,this.includeDeviceClasses,this.deviceFilter,this.entityFilter,this.noAdd,this.excludeAreas).map((e=>({...e,strings:[e.area_id,...e.aliases,e.name]})));this.comboBox.items=e,this.comboBox.filteredItems=e}}},{kind:"method",key:"render",value:function(){var e;return s.dy` <ha-combo-box .hass="${this.hass}" .helper="${this.helper}" item-value-path="area_id" item-id-path="area_id" item-label-path="name" .value="${this._value}" .disabled="${this.disabled}" .required="${this.required}" .label="${void 0===this.label&&this.hass?this.hass.localize("ui.components.area-picker.area"):this.label}" .placeholder="${this.placeholder?null===(e=this.hass.areas[this.placeholder])||void 0===e?void 0:e.name:void 0}" .renderer="${p}" @filter-changed="${this._filterChanged}" @opened-changed="${this._openedChanged}" @value-changed="${this._areaChanged}"> </ha-combo-box> `}},{kind:"method",key:"_filterChanged",value:function(e){const i=e.target,t=e.detail.value;if(!t)return void(this.comboBox.filteredItems=this.comboBox.items);const a=(0,c.q)(t,i.items||[]);this.noAdd||0!==(null==a?void 0:a.length)?this.comboBox.filteredItems=a:(this._suggestion=t,this.comboBox.filteredItems=[{area_id:"add_new_suggestion",name:this.hass.localize("ui.components.area-picker.add_new_sugestion",{name:this._suggestion}),picture:null}])}},{kind:"get",key:"_value",value:function(){return this.value||""}},{kind:"method",key:"_openedChanged",value:function(e){this._opened=e.detail.value}},{kind:"method",key:"_areaChanged",value:function(e){e.stopPropagation();let i=e.detail.value;"no_areas"===i&&(i=""),["add_new_suggestion","add_new"].includes(i)?(e.target.value=this._value,(0,v.D9)(this,{title:this.hass.localize("ui.components.area-picker.add_dialog.title"),text:this.hass.localize("ui.components.area-picker.add_dialog.text"),confirmText:this.hass.localize("ui.components.area-picker.add_dialog.add"),inputLabel:this.hass.localize("ui.components.area-picker.add_dialog.name"),defaultValue:"add_new_suggestion"===i?this._suggestion:void 0,confirm:async e=>{if(e)try{const i=await(0,u.Lo)(this.hass,{name:e}),t=[...Object.values(this.hass.areas),i];this.comboBox.filteredItems=this._getAreas(t,Object.values(this.hass.devices),Object.values(this.hass.entities),this.includeDomains,this.excludeDomains,this.includeDeviceClasses,this.deviceFilter,this.entityFilter,this.noAdd,this.excludeAreas),await this.updateComplete,await this.comboBox.updateComplete,this._setValue(i.area_id)}catch(e){(0,v.Ys)(this,{title:this.hass.localize("ui.components.area-picker.add_dialog.failed_create_area"),text:e.message})}},cancel:()=>{this._setValue(void 0),this._suggestion=void 0,this.comboBox.setInputValue("")}})):i!==this._value&&this._setValue(i)}},{kind:"method",key:"_setValue",value:function(e){this.value=e,setTimeout((()=>{(0,o.B)(this,"value-changed",{value:e}),(0,o.B)(this,"change")}),0)}}]}}),s.oi)},7265:(e,i,t)=>{var a=t(309),s=t(5095),d=t(95260);(0,a.Z)([(0,d.Mo)("ha-input-helper-text")],(function(e,i){return{F:class extends i{constructor(...i){super(...i),e(this)}},d:[{kind:"method",key:"render",value:function(){return s.dy`<slot></slot>`}},{kind:"field",static:!0,key:"styles",value:()=>s.iv`:host{display:block;color:var(--mdc-text-field-label-ink-color,rgba(0,0,0,.6));font-size:.75rem;padding-left:16px;padding-right:16px}`}]}}),s.oi)},51948:(e,i,t)=>{t.r(i),t.d(i,{HaTargetSelector:()=>g});var a=t(309),s=t(34541),d=t(47838),n=t(5095),l=t(95260),o=t(14516),r=t(4771),c=t(16061),u=t(92794),h=t(29934),v=(t(33829),t(67182)),p=(t(14271),t(99608),t(53180)),_=t(18394),m=t(86089),y=t(36655),k=t(2733),f=t(11705);t(27056),t(91998),t(25718),t(54371),t(7265),t(37662);const b="M19,13H13V19H11V13H5V11H11V5H13V11H19V13Z";(0,a.Z)([(0,l.Mo)("ha-target-picker")],(function(e,i){return{F:class extends i{constructor(...i){super(...i),e(this)}},d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"value",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Array,attribute:"include-domains"})],key:"includeDomains",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Array,attribute:"include-device-classes"})],key:"includeDeviceClasses",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"deviceFilter",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"entityFilter",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean,reflect:!0})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"addOnTop",value:()=>!1},{kind:"field",decorators:[(0,l.SB)()],key:"_addMode",value:void 0},{kind:"field",decorators:[(0,l.IO)("#input")],key:"_inputElement",value:void 0},{kind:"field",decorators:[(0,l.IO)(".add-container",!0)],key:"_addContainer",value:void 0},{kind:"field",key:"_opened",value:()=>!1},{kind:"method",key:"render",value:function(){return this.addOnTop?n.dy` ${this._renderChips()} ${this._renderItems()} `:n.dy` ${this._renderItems()} ${this._renderChips()} `}},{kind:"method",key:"_renderItems",value:function(){var e,i,t;return n.dy` <div class="mdc-chip-set items"> ${null!==(e=this.value)&&void 0!==e&&e.area_id?(0,r.r)(this.value.area_id).map((e=>{const i=this.hass.areas[e];return this._renderChip("area_id",e,(null==i?void 0:i.name)||e,void 0,"M12.5 7C12.5 5.89 13.39 5 14.5 5H18C19.1 5 20 5.9 20 7V9.16C18.84 9.57 18 10.67 18 11.97V14H12.5V7M6 11.96V14H11.5V7C11.5 5.89 10.61 5 9.5 5H6C4.9 5 4 5.9 4 7V9.15C5.16 9.56 6 10.67 6 11.96M20.66 10.03C19.68 10.19 19 11.12 19 12.12V15H5V12C5 10.9 4.11 10 3 10S1 10.9 1 12V17C1 18.1 1.9 19 3 19V21H5V19H19V21H21V19C22.1 19 23 18.1 23 17V12C23 10.79 21.91 9.82 20.66 10.03Z")})):""} ${null!==(i=this.value)&&void 0!==i&&i.device_id?(0,r.r)(this.value.device_id).map((e=>{const i=this.hass.devices[e];return this._renderChip("device_id",e,i?(0,c.jL)(i,this.hass):e,void 0,"M3 6H21V4H3C1.9 4 1 4.9 1 6V18C1 19.1 1.9 20 3 20H7V18H3V6M13 12H9V13.78C8.39 14.33 8 15.11 8 16C8 16.89 8.39 17.67 9 18.22V20H13V18.22C13.61 17.67 14 16.88 14 16S13.61 14.33 13 13.78V12M11 17.5C10.17 17.5 9.5 16.83 9.5 16S10.17 14.5 11 14.5 12.5 15.17 12.5 16 11.83 17.5 11 17.5M22 8H16C15.5 8 15 8.5 15 9V19C15 19.5 15.5 20 16 20H22C22.5 20 23 19.5 23 19V9C23 8.5 22.5 8 22 8M21 18H17V10H21V18Z")})):""} ${null!==(t=this.value)&&void 0!==t&&t.entity_id?(0,r.r)(this.value.entity_id).map((e=>{const i=this.hass.states[e];return this._renderChip("entity_id",e,i?(0,k.C)(i):e,i)})):""} </div> `}},{kind:"method",key:"_renderChips",value:function(){return n.dy` <div class="mdc-chip-set add-container"> <div class="mdc-chip area_id add" .type="${"area_id"}" @click="${this._showPicker}"> <div class="mdc-chip__ripple"></div> <ha-svg-icon class="mdc-chip__icon mdc-chip__icon--leading" .path="${b}"></ha-svg-icon> <span role="gridcell"> <span role="button" tabindex="0" class="mdc-chip__primary-action"> <span class="mdc-chip__text">${this.hass.localize("ui.components.target-picker.add_area_id")}</span> </span> </span> </div> <div class="mdc-chip device_id add" .type="${"device_id"}" @click="${this._showPicker}"> <div class="mdc-chip__ripple"></div> <ha-svg-icon class="mdc-chip__icon mdc-chip__icon--leading" .path="${b}"></ha-svg-icon> <span role="gridcell"> <span role="button" tabindex="0" class="mdc-chip__primary-action"> <span class="mdc-chip__text">${this.hass.localize("ui.components.target-picker.add_device_id")}</span> </span> </span> </div> <div class="mdc-chip entity_id add" .type="${"entity_id"}" @click="${this._showPicker}"> <div class="mdc-chip__ripple"></div> <ha-svg-icon class="mdc-chip__icon mdc-chip__icon--leading" .path="${b}"></ha-svg-icon> <span role="gridcell"> <span role="button" tabindex="0" class="mdc-chip__primary-action"> <span class="mdc-chip__text">${this.hass.localize("ui.components.target-picker.add_entity_id")}</span> </span> </span> </div> ${this._renderPicker()} </div> ${this.helper?n.dy`<ha-input-helper-text>${this.helper}</ha-input-helper-text>`:""} `}},{kind:"method",key:"_showPicker",value:function(e){this._addMode=e.currentTarget.type}},{kind:"method",key:"_renderChip",value:function(e,i,t,a,s){return n.dy` <div class="mdc-chip ${(0,p.$)({[e]:!0})}"> ${s?n.dy`<ha-svg-icon class="mdc-chip__icon mdc-chip__icon--leading" .path="${s}"></ha-svg-icon>`:""} ${a?n.dy`<ha-state-icon class="mdc-chip__icon mdc-chip__icon--leading" .hass="${this.hass}" .stateObj="${a}"></ha-state-icon>`:""} <span role="gridcell"> <span role="button" tabindex="0" class="mdc-chip__primary-action"> <span class="mdc-chip__text">${t}</span> </span> </span> ${"entity_id"===e?"":n.dy`<span role="gridcell"> <ha-icon-button class="expand-btn mdc-chip__icon mdc-chip__icon--trailing" .label="${this.hass.localize("ui.components.target-picker.expand")}" .path="${"M18.17,12L15,8.83L16.41,7.41L21,12L16.41,16.58L15,15.17L18.17,12M5.83,12L9,15.17L7.59,16.59L3,12L7.59,7.42L9,8.83L5.83,12Z"}" hideTooltip .id="${i}" .type="${e}" @click="${this._handleExpand}"></ha-icon-button> <simple-tooltip class="expand" animation-delay="0">${this.hass.localize(`ui.components.target-picker.expand_${e}`)}</simple-tooltip> </span>`} <span role="gridcell"> <ha-icon-button class="mdc-chip__icon mdc-chip__icon--trailing" .label="${this.hass.localize("ui.components.target-picker.remove")}" .path="${"M19,6.41L17.59,5L12,10.59L6.41,5L5,6.41L10.59,12L5,17.59L6.41,19L12,13.41L17.59,19L19,17.59L13.41,12L19,6.41Z"}" hideTooltip .id="${i}" .type="${e}" @click="${this._handleRemove}"></ha-icon-button> <simple-tooltip animation-delay="0">${this.hass.localize(`ui.components.target-picker.remove_${e}`)}</simple-tooltip> </span> </div> `}},{kind:"method",key:"_renderPicker",value:function(){var e,i,t;return this._addMode?n.dy`<mwc-menu-surface open .anchor="${this._addContainer}" @closed="${this._onClosed}" @opened="${this._onOpened}" @opened-changed="${this._openedChanged}" @input="${m.U}">${"area_id"===this._addMode?n.dy` <ha-area-picker .hass="${this.hass}" id="input" .type="${"area_id"}" .label="${this.hass.localize("ui.components.target-picker.add_area_id")}" no-add .deviceFilter="${this.deviceFilter}" .entityFilter="${this.entityFilter}" .includeDeviceClasses="${this.includeDeviceClasses}" .includeDomains="${this.includeDomains}" .excludeAreas="${(0,r.r)(null===(e=this.value)||void 0===e?void 0:e.area_id)}" @value-changed="${this._targetPicked}" @click="${this._preventDefault}"></ha-area-picker> `:"device_id"===this._addMode?n.dy` <ha-device-picker .hass="${this.hass}" id="input" .type="${"device_id"}" .label="${this.hass.localize("ui.components.target-picker.add_device_id")}" .deviceFilter="${this.deviceFilter}" .entityFilter="${this.entityFilter}" .includeDeviceClasses="${this.includeDeviceClasses}" .includeDomains="${this.includeDomains}" .excludeDevices="${(0,r.r)(null===(i=this.value)||void 0===i?void 0:i.device_id)}" @value-changed="${this._targetPicked}" @click="${this._preventDefault}"></ha-device-picker> `:n.dy` <ha-entity-picker .hass="${this.hass}" id="input" .type="${"entity_id"}" .label="${this.hass.localize("ui.components.target-picker.add_entity_id")}" .entityFilter="${this.entityFilter}" .includeDeviceClasses="${this.includeDeviceClasses}" .includeDomains="${this.includeDomains}" .excludeEntities="${(0,r.r)(null===(t=this.value)||void 0===t?void 0:t.entity_id)}" @value-changed="${this._targetPicked}" @click="${this._preventDefault}" allow-custom-entity></ha-entity-picker> `}</mwc-menu-surface>`:n.Ld}},{kind:"method",key:"_targetPicked",value:function(e){if(e.stopPropagation(),!e.detail.value)return;const i=e.detail.value,t=e.currentTarget;("entity_id"!==t.type||(0,f.T)(i))&&(t.value="",this.value&&this.value[t.type]&&(0,r.r)(this.value[t.type]).includes(i)||(0,_.B)(this,"value-changed",{value:this.value?{...this.value,[t.type]:this.value[t.type]?[...(0,r.r)(this.value[t.type]),i]:i}:{[t.type]:i}}))}},{kind:"method",key:"_handleExpand",value:function(e){const i=e.currentTarget,t=[],a=[];if("area_id"===i.type)Object.values(this.hass.devices).forEach((e=>{var a;e.area_id!==i.id||null!==(a=this.value.device_id)&&void 0!==a&&a.includes(e.id)||!this._deviceMeetsFilter(e)||t.push(e.id)})),Object.values(this.hass.entities).forEach((e=>{var t;e.area_id!==i.id||null!==(t=this.value.entity_id)&&void 0!==t&&t.includes(e.entity_id)||!this._entityRegMeetsFilter(e)||a.push(e.entity_id)}));else{if("device_id"!==i.type)return;Object.values(this.hass.entities).forEach((e=>{var t;e.device_id!==i.id||null!==(t=this.value.entity_id)&&void 0!==t&&t.includes(e.entity_id)||!this._entityRegMeetsFilter(e)||a.push(e.entity_id)}))}let s=this.value;a.length&&(s=this._addItems(s,"entity_id",a)),t.length&&(s=this._addItems(s,"device_id",t)),s=this._removeItem(s,i.type,i.id),(0,_.B)(this,"value-changed",{value:s})}},{kind:"method",key:"_handleRemove",value:function(e){const i=e.currentTarget;(0,_.B)(this,"value-changed",{value:this._removeItem(this.value,i.type,i.id)})}},{kind:"method",key:"_addItems",value:function(e,i,t){return{...e,[i]:e[i]?(0,r.r)(e[i]).concat(t):t}}},{kind:"method",key:"_removeItem",value:function(e,i,t){const a=(0,r.r)(e[i]).filter((e=>String(e)!==t));if(a.length)return{...e,[i]:a};const s={...e};return delete s[i],Object.keys(s).length?s:void 0}},{kind:"method",key:"_onClosed",value:function(e){e.stopPropagation(),e.target.open=!0}},{kind:"method",key:"_onOpened",value:async function(){var e,i;this._addMode&&(await(null===(e=this._inputElement)||void 0===e?void 0:e.focus()),await(null===(i=this._inputElement)||void 0===i?void 0:i.open()),this._opened=!0)}},{kind:"method",key:"_openedChanged",value:function(e){this._opened&&!e.detail.value&&(this._opened=!1,this._addMode=void 0)}},{kind:"method",key:"_preventDefault",value:function(e){e.preventDefault()}},{kind:"method",key:"_deviceMeetsFilter",value:function(e){const i=Object.values(this.hass.entities).filter((i=>i.device_id===e.id));if(this.includeDomains){if(!i||!i.length)return!1;if(!i.some((e=>this.includeDomains.includes((0,y.M)(e.entity_id)))))return!1}if(this.includeDeviceClasses){if(!i||!i.length)return!1;if(!i.some((e=>{const i=this.hass.states[e.entity_id];return!!i&&(i.attributes.device_class&&this.includeDeviceClasses.includes(i.attributes.device_class))})))return!1}return!(this.deviceFilter&&!this.deviceFilter(e))&&!(this.entityFilter&&!i.some((e=>{const i=this.hass.states[e.entity_id];return!!i&&this.entityFilter(i)})))}},{kind:"method",key:"_entityRegMeetsFilter",value:function(e){if(e.entity_category)return!1;if(this.includeDomains&&!this.includeDomains.includes((0,y.M)(e.entity_id)))return!1;if(this.includeDeviceClasses){const i=this.hass.states[e.entity_id];if(!i)return!1;if(!i.attributes.device_class||!this.includeDeviceClasses.includes(i.attributes.device_class))return!1}if(this.entityFilter){const i=this.hass.states[e.entity_id];if(!i)return!1;if(!this.entityFilter(i))return!1}return!0}},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`${(0,n.$m)(v)} .mdc-chip{color:var(--primary-text-color)}.items{z-index:2}.mdc-chip-set{padding:4px 0}.mdc-chip.add{color:rgba(0,0,0,.87)}.add-container{position:relative;display:inline-flex}.mdc-chip:not(.add){cursor:default}.mdc-chip ha-icon-button{--mdc-icon-button-size:24px;display:flex;align-items:center;outline:0}.mdc-chip ha-icon-button ha-svg-icon{border-radius:50%;background:var(--secondary-text-color)}.mdc-chip__icon.mdc-chip__icon--trailing{width:16px;height:16px;--mdc-icon-size:14px;color:var(--secondary-text-color);margin-inline-start:4px!important;margin-inline-end:-4px!important;direction:var(--direction)}.mdc-chip__icon--leading{display:flex;align-items:center;justify-content:center;--mdc-icon-size:20px;border-radius:50%;padding:6px;margin-left:-14px!important;margin-inline-start:-14px!important;margin-inline-end:4px!important;direction:var(--direction)}.expand-btn{margin-right:0}.mdc-chip.area_id:not(.add){border:2px solid #fed6a4;background:var(--card-background-color)}.mdc-chip.area_id.add,.mdc-chip.area_id:not(.add) .mdc-chip__icon--leading{background:#fed6a4}.mdc-chip.device_id:not(.add){border:2px solid #a8e1fb;background:var(--card-background-color)}.mdc-chip.device_id.add,.mdc-chip.device_id:not(.add) .mdc-chip__icon--leading{background:#a8e1fb}.mdc-chip.entity_id:not(.add){border:2px solid #d2e7b9;background:var(--card-background-color)}.mdc-chip.entity_id.add,.mdc-chip.entity_id:not(.add) .mdc-chip__icon--leading{background:#d2e7b9}.mdc-chip:hover{z-index:5}simple-tooltip.expand{min-width:200px}:host([disabled]) .mdc-chip{opacity:var(--light-disabled-opacity);pointer-events:none}mwc-menu-surface{--mdc-menu-min-width:100%}ha-area-picker,ha-device-picker,ha-entity-picker{display:block;width:100%}`}}]}}),n.oi);let g=(0,a.Z)([(0,l.Mo)("ha-selector-target")],(function(e,i){class t extends i{constructor(...i){super(...i),e(this)}}return{F:t,d:[{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"hass",value:void 0},{kind:"field",decorators:[(0,l.Cb)({attribute:!1})],key:"selector",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"value",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"label",value:void 0},{kind:"field",decorators:[(0,l.Cb)()],key:"helper",value:void 0},{kind:"field",decorators:[(0,l.Cb)({type:Boolean})],key:"disabled",value:()=>!1},{kind:"field",decorators:[(0,l.SB)()],key:"_entitySources",value:void 0},{kind:"field",key:"_deviceIntegrationLookup",value:()=>(0,o.Z)(c.HP)},{kind:"method",key:"_hasIntegration",value:function(e){var i,t;return(null===(i=e.target)||void 0===i?void 0:i.entity)&&(0,r.r)(e.target.entity).some((e=>e.integration))||(null===(t=e.target)||void 0===t?void 0:t.device)&&(0,r.r)(e.target.device).some((e=>e.integration))}},{kind:"method",key:"updated",value:function(e){(0,s.Z)((0,d.Z)(t.prototype),"updated",this).call(this,e),e.has("selector")&&this._hasIntegration(this.selector)&&!this._entitySources&&(0,u.m)(this.hass).then((e=>{this._entitySources=e}))}},{kind:"method",key:"render",value:function(){return this._hasIntegration(this.selector)&&!this._entitySources?n.Ld:n.dy`<ha-target-picker .hass="${this.hass}" .value="${this.value}" .helper="${this.helper}" .deviceFilter="${this._filterDevices}" .entityFilter="${this._filterEntities}" .disabled="${this.disabled}"></ha-target-picker>`}},{kind:"field",key:"_filterEntities",value(){return e=>{var i;return null===(i=this.selector.target)||void 0===i||!i.entity||(0,r.r)(this.selector.target.entity).some((i=>(0,h.lV)(i,e,this._entitySources)))}}},{kind:"field",key:"_filterDevices",value(){return e=>{var i;if(null===(i=this.selector.target)||void 0===i||!i.device)return!0;const t=this._entitySources?this._deviceIntegrationLookup(this._entitySources,Object.values(this.hass.entities)):void 0;return(0,r.r)(this.selector.target.device).some((i=>(0,h.lE)(i,e,t)))}}},{kind:"get",static:!0,key:"styles",value:function(){return n.iv`ha-target-picker{display:block}`}}]}}),n.oi)},97477:(e,i,t)=>{t.d(i,{a:()=>c,Lo:()=>r,sG:()=>o});var a=t(28858),s=t(72881),d=t(72218);const n=e=>e.sendMessagePromise({type:"config/area_registry/list"}).then((e=>e.sort(((e,i)=>(0,a.$)(e.name,i.name))))),l=(e,i)=>e.subscribeEvents((0,d.D)((()=>n(e).then((e=>i.setState(e,!0)))),500,!0),"area_registry_updated"),o=(e,i)=>(0,s.B)("_areaRegistry",n,l,e,i),r=(e,i)=>e.callWS({type:"config/area_registry/create",...i}),c=(e,i)=>(t,s)=>{const d=i?i.indexOf(t):-1,n=i?i.indexOf(s):-1;if(-1===d&&-1===n){var l,o,r,c;const i=null!==(l=null==e||null===(o=e[t])||void 0===o?void 0:o.name)&&void 0!==l?l:t,d=null!==(r=null==e||null===(c=e[s])||void 0===c?void 0:c.name)&&void 0!==r?r:s;return(0,a.$)(i,d)}return-1===d?1:-1===n?-1:d-n}},21157:(e,i,t)=>{t.d(i,{PX:()=>n,V_:()=>l,nZ:()=>s,rk:()=>r});var a=t(58135);const s="unavailable",d="unknown",n="off",l=[s,d],o=[s,d,n],r=(0,a.z)(l);(0,a.z)(o)},92794:(e,i,t)=>{t.d(i,{m:()=>d});const a=async(e,i,t,s,d,...n)=>{const l=d,o=l[e],r=o=>s&&s(d,o.result)!==o.cacheKey?(l[e]=void 0,a(e,i,t,s,d,...n)):o.result;if(o)return o instanceof Promise?o.then(r):r(o);const c=t(d,...n);return l[e]=c,c.then((t=>{l[e]={result:t,cacheKey:null==s?void 0:s(d,t)},setTimeout((()=>{l[e]=void 0}),i)}),(()=>{l[e]=void 0})),c},s=e=>e.callWS({type:"entity/source"}),d=e=>a("_entitySources",3e4,s,(e=>Object.keys(e.states).length),e)}};
+//# sourceMappingURL=9880.N7f9dRfrn_c.js.map
\ No newline at end of file
@@ -0,0 +1 @@
+VERSION = "20240119163101"
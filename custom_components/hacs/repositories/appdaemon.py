@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 class HacsAppdaemonRepository(HacsRepository):
     """Appdaemon apps in HACS."""
 
+    tree_directories = ("apps",)
+
     def __init__(self, hacs: HacsBase, full_name: str):
         """Initialize."""
         super().__init__(hacs=hacs)
@@ -58,7 +60,7 @@ class HacsAppdaemonRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
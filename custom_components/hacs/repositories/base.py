@@ -3,21 +3,24 @@ from __future__ import annotations
 
 from asyncio import sleep
 from datetime import UTC, datetime
+from functools import partial
 import os
 import pathlib
 import shutil
+import sys
 import tempfile
-from typing import TYPE_CHECKING, Any
-import zipfile
+from typing import TYPE_CHECKING, Any, Callable
 
 from aiogithubapi import (
     AIOGitHubAPIException,
     AIOGitHubAPINotModifiedException,
+    GitHubReleaseAssetModel,
     GitHubReleaseModel,
 )
 from aiogithubapi.objects.repository import AIOGitHubAPIRepository
 import attr
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
+from homeassistant.helpers.json import json_bytes
 
 from ..const import DOMAIN
 from ..enums import ConfigurationType, HacsDispatchEvent, RepositoryFile
@@ -28,18 +31,28 @@ from ..exceptions import (
     HacsRepositoryExistException,
 )
 from ..types import DownloadableContent
-from ..utils.backup import Backup, BackupNetDaemon
-from ..utils.decode import decode_content
+from ..utils.archive import ZIP_SPOOL_SIZE, extract_zip
+from ..utils.backup import StagedInstall, link_or_copy
+from ..utils.blob_cache import (
+    asset_cache_key,
+    blob_cache_key,
+    commit_cache_key,
+    git_blob_sha_of_file,
+)
+from ..utils.compress_worker import compressed_variants
 from ..utils.decorator import concurrent
 from ..utils.filters import filter_content_return_one_of_type
+from ..utils.graphql import RepositoryMetadata, RepositoryMetadataFiles
 from ..utils.json import json_loads
 from ..utils.logger import LOGGER
 from ..utils.path import is_safe
 from ..utils.queue_manager import QueueManager
 from ..utils.store import async_remove_store
 from ..utils.template import render_template
+from ..utils.tree import EMPTY_TREE, RepositoryTree, TreeEntry
 from ..utils.url import github_archive, github_release_asset
 from ..utils.validate import Validate
+from ..utils.verify import SHA256_PREFIX
 from ..utils.version import (
     version_left_higher_or_equal_then_right,
     version_left_higher_then_right,
@@ -47,9 +60,16 @@ from ..utils.version import (
 from ..utils.workarounds import DOMAIN_OVERRIDES
 
 if TYPE_CHECKING:
+    from aiogithubapi.objects.repository.content import (
+        AIOGitHubAPIRepositoryTreeContent,
+    )
+
     from ..base import HacsBase
 
 
+# Attribute of RepositoryData that is not set yet
+_UNSET = object()
+
 TOPIC_FILTER = (
     "add-on",
     "addon",
@@ -117,6 +137,51 @@ REPOSITORY_KEYS_TO_EXPORT = (
     ("topics", []),
 )
 
+# Changes to these keys will update the indexes in HacsRepositories
+REPOSITORY_DATA_INDEXED_KEYS = frozenset(
+    (
+        "category",
+        "default_branch",
+        "installed_commit",
+        "installed_version",
+        "installed",
+        "last_commit",
+        "last_version",
+        "releases",
+        "selected_tag",
+    )
+)
+
+# Changes to these attributes of HacsRepository are forwarded to the data listener
+REPOSITORY_TRACKED_ATTRIBUTES = frozenset(
+    (
+        "integration_manifest",
+        "pending_restart",
+        "repository_manifest",
+        "state",
+    )
+)
+
+# Attributes of RepositoryData that are not part of to_json
+REPOSITORY_DATA_NOT_EXPORTED = frozenset(("full_name_lower", "last_fetched", "_listener"))
+
+# Keys of RepositoryData with values that many repositories share, they are interned
+REPOSITORY_DATA_INTERNED_KEYS = frozenset(
+    (
+        "authors",
+        "default_branch",
+        "published_tags",
+        "topics",
+    )
+)
+
+# Files up to this size are cached by the commit they were fetched at
+COMMIT_FILE_CACHE_SIZE = 64 * 1024
+
+# Size in KB of the repositories where only the root and the directories
+# of the category are fetched from the tree
+TREE_SCOPED_REPOSITORY_SIZE = 50_000
+
 HACS_MANIFEST_KEYS_TO_EXPORT = (
     # Keys can not be removed from this list until v3
     # If keys are added, the action need to be re-run with force
@@ -128,16 +193,38 @@ HACS_MANIFEST_KEYS_TO_EXPORT = (
 class FileInformation:
     """FileInformation."""
 
-    def __init__(self, url, path, name):
+    def __init__(self, url, path, name, cache_key=None):
         self.download_url = url
         self.path = path
         self.name = name
+        self.cache_key = cache_key
+
+    @property
+    def sha(self) -> str | None:
+        """Return the git blob SHA of the file, if it came from the tree."""
+        if self.cache_key is not None and self.cache_key.startswith("blob-"):
+            return self.cache_key[5:]
+        return None
+
 
+def _intern(value: Any) -> Any:
+    """Return the interned version of a string, or of the strings in a list."""
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    if isinstance(value, list) and value:
+        return [sys.intern(item) if type(item) is str else item for item in value]
+    return value
 
-@attr.s(auto_attribs=True)
+
+@attr.s(auto_attribs=True, slots=True)
 class RepositoryData:
     """RepositoryData class."""
 
+    # First, so it is set before the attributes that notify it
+    _listener: Callable[[str], None] | None = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+
     archived: bool = False
     authors: list[str] = []
     category: str = ""
@@ -155,6 +242,7 @@ class RepositoryData:
     has_issues: bool = True
     id: int = 0
     installed_commit: str = None
+    installed_files: dict[str, str] = {}
     installed_version: str = None
     installed: bool = False
     last_commit: str = None
@@ -170,6 +258,30 @@ class RepositoryData:
     show_beta: bool = False
     stargazers_count: int = 0
     topics: list[str] = []
+    # Set by the repository classes, not stored
+    full_name_lower: str = attr.ib(default="", repr=False, eq=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, and notify the listener if the value changed."""
+        if name in REPOSITORY_DATA_INTERNED_KEYS:
+            value = _intern(value)
+        listener = getattr(self, "_listener", None)
+        if listener is None:
+            object.__setattr__(self, name, value)
+            return
+        changed = getattr(self, name, _UNSET) != value
+        object.__setattr__(self, name, value)
+        if changed:
+            listener(name)
+
+    def set_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Set the callable to notify when a key changes."""
+        object.__setattr__(self, "_listener", listener)
+
+    def notify_listener(self, key: str) -> None:
+        """Notify the listener that a key has changed."""
+        if (listener := getattr(self, "_listener", None)) is not None:
+            listener(key)
 
     @property
     def name(self):
@@ -180,7 +292,9 @@ class RepositoryData:
 
     def to_json(self):
         """Export to json."""
-        return attr.asdict(self, filter=lambda attr, value: attr.name != "last_fetched")
+        return attr.asdict(
+            self, filter=lambda attr, value: attr.name not in REPOSITORY_DATA_NOT_EXPORTED
+        )
 
     @staticmethod
     def create_from_dict(source: dict, action: bool = False) -> RepositoryData:
@@ -192,7 +306,7 @@ class RepositoryData:
     def update_data(self, data: dict, action: bool = False) -> None:
         """Update data of the repository."""
         for key, value in data.items():
-            if key not in self.__dict__:
+            if key not in REPOSITORY_DATA_KEYS:
                 continue
 
             if key == "last_fetched" and isinstance(value, float):
@@ -211,7 +325,14 @@ class RepositoryData:
                 setattr(self, key, value)
 
 
-@attr.s(auto_attribs=True)
+REPOSITORY_DATA_KEYS = frozenset(
+    field.name
+    for field in attr.fields(RepositoryData)
+    if field.name not in ("full_name_lower", "_listener")
+)
+
+
+@attr.s(auto_attribs=True, slots=True)
 class HacsManifest:
     """HacsManifest class."""
 
@@ -241,20 +362,20 @@ class HacsManifest:
         manifest_data.manifest = {
             k: v
             for k, v in manifest.items()
-            if k in manifest_data.__dict__ and v != manifest_data.__getattribute__(k)
+            if k in HACS_MANIFEST_KEYS and v != getattr(manifest_data, k)
         }
 
         for key, value in manifest_data.manifest.items():
             if key == "country" and isinstance(value, str):
                 setattr(manifest_data, key, [value])
-            elif key in manifest_data.__dict__:
+            else:
                 setattr(manifest_data, key, value)
         return manifest_data
 
     def update_data(self, data: dict) -> None:
         """Update the manifest data."""
         for key, value in data.items():
-            if key not in self.__dict__:
+            if key not in HACS_MANIFEST_KEYS:
                 continue
 
             if key == "country":
@@ -266,36 +387,101 @@ class HacsManifest:
                 setattr(self, key, value)
 
 
+HACS_MANIFEST_KEYS = frozenset(field.name for field in attr.fields(HacsManifest))
+
+
+class ReleaseAsset:
+    """The metadata of a release asset."""
+
+    __slots__ = ("browser_download_url", "download_count", "id", "name")
+
+    def __init__(self, asset: GitHubReleaseAssetModel | ReleaseAsset) -> None:
+        """Initialize."""
+        self.browser_download_url: str | None = asset.browser_download_url
+        self.download_count: int = asset.download_count or 0
+        self.id: int | None = asset.id
+        self.name: str | None = asset.name
+
+
+class ReleaseInfo:
+    """The metadata of a release, without the response it was parsed from."""
+
+    __slots__ = ("assets", "body", "draft", "name", "prerelease", "tag_name")
+
+    def __init__(self, release: GitHubReleaseModel | ReleaseInfo) -> None:
+        """Initialize."""
+        self.assets = [ReleaseAsset(asset) for asset in release.assets or []]
+        self.body: str | None = release.body
+        self.draft: bool = bool(release.draft)
+        self.name: str | None = release.name
+        self.prerelease: bool = bool(release.prerelease)
+        self.tag_name: str | None = _intern(release.tag_name)
+
+
 class RepositoryReleases:
     """RepositoyReleases."""
 
-    last_release = None
-    last_release_object = None
-    published_tags = []
-    objects: list[GitHubReleaseModel] = []
-    releases = False
-    downloads = None
+    __slots__ = (
+        "_objects",
+        "downloads",
+        "last_release",
+        "last_release_object",
+        "published_tags",
+        "releases",
+    )
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.downloads = None
+        self.last_release = None
+        self.last_release_object = None
+        self.published_tags: list[str] = []
+        self.releases = False
+        self._objects: list[ReleaseInfo] = []
+
+    @property
+    def objects(self) -> list[ReleaseInfo]:
+        """Return the releases."""
+        return self._objects
+
+    @objects.setter
+    def objects(self, releases: list[GitHubReleaseModel | ReleaseInfo]) -> None:
+        """Set the releases, only the metadata HACS uses is kept."""
+        self._objects = [ReleaseInfo(release) for release in releases]
 
 
 class RepositoryPath:
     """RepositoryPath."""
 
-    local: str | None = None
-    remote: str | None = None
+    __slots__ = ("local", "remote", "staging")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.local: str | None = None
+        self.remote: str | None = None
+        # Set while a staged install downloads content
+        self.staging: str | None = None
 
 
 class RepositoryContent:
     """RepositoryContent."""
 
-    path: RepositoryPath | None = None
-    files = []
-    objects = []
-    single = False
+    __slots__ = ("files", "objects", "path", "single")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.files = []
+        self.objects = []
+        self.path: RepositoryPath | None = None
+        self.single = False
 
 
 class HacsRepository:
     """HacsRepository."""
 
+    # Top level directories content is used from, None uses the full tree
+    tree_directories: tuple[str, ...] | None = None
+
     def __init__(self, hacs: HacsBase) -> None:
         """Set up HacsRepository."""
         self.hacs = hacs
@@ -312,8 +498,11 @@ class HacsRepository:
         self.validate = Validate()
         self.releases = RepositoryReleases()
         self.pending_restart = False
-        self.tree = []
-        self.treefiles = []
+        self._tree: RepositoryTree | None = EMPTY_TREE
+        # The ref, without "tags/", and the commit it pointed at in the last update
+        self._resolved_commit: tuple[str, str] | None = None
+        # Swapped in content of an install that is not done yet
+        self._staged_install: StagedInstall | None = None
         self.ref = None
         self.logger = LOGGER
 
@@ -321,11 +510,55 @@ class HacsRepository:
         """Return a string representation of the repository."""
         return self.string
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, and notify the data listener if it is tracked."""
+        object.__setattr__(self, name, value)
+        if name in REPOSITORY_TRACKED_ATTRIBUTES and (data := self.__dict__.get("data")):
+            data.notify_listener(name)
+
+    @property
+    def tree(self) -> RepositoryTree:
+        """Return the tree of the ref, empty if it was released."""
+        if self._tree is None:
+            return EMPTY_TREE
+        if self._tree:
+            self.hacs.trees.touch(self)
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree: RepositoryTree | list[AIOGitHubAPIRepositoryTreeContent]) -> None:
+        """Set the tree of the ref."""
+        self._tree = tree if isinstance(tree, RepositoryTree) else RepositoryTree(tree)
+        if self._tree:
+            self.hacs.trees.touch(self)
+        else:
+            self.hacs.trees.discard(self)
+
+    @property
+    def treefiles(self) -> tuple[str, ...]:
+        """Return the paths in the tree."""
+        return self.tree.paths
+
+    def release_tree(self) -> None:
+        """Release the tree, it is fetched again when it is needed."""
+        self._tree = None
+
+    async def async_get_tree(self) -> RepositoryTree:
+        """Return the tree, fetched again if it was released."""
+        if self._tree is None:
+            self.tree = await self.async_get_tree_at_commit(self.ref)
+        return self.tree
+
     @property
     def string(self) -> str:
         """Return a string representation of the repository."""
         return f"<{self.data.category.title()} {self.data.full_name}>"
 
+    @property
+    def download_path(self) -> str | None:
+        """Return the path content is downloaded to."""
+        return self.content.path.staging or self.content.path.local
+
     @property
     def display_name(self) -> str:
         """Return display name."""
@@ -461,7 +694,7 @@ class HacsRepository:
     async def validate_repository(self) -> None:
         """Validate."""
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False) -> None:
         """Update the repository"""
 
@@ -474,13 +707,14 @@ class HacsRepository:
         await self.common_update_data(ignore_issues=ignore_issues)
 
         # Get the content of hacs.json
-        if RepositoryFile.HACS_JSON in [x.filename for x in self.tree]:
+        if self.tree.has_filename(RepositoryFile.HACS_JSON):
             if manifest := await self.async_get_hacs_json():
                 self.repository_manifest = HacsManifest.from_dict(manifest)
                 self.data.update_data(
                     self.repository_manifest.to_dict(),
                     action=self.hacs.system.action,
                 )
+                await self.async_use_full_tree()
 
     async def common_registration(self) -> None:
         """Common registration steps of the repository."""
@@ -503,7 +737,7 @@ class HacsRepository:
             self.data.last_updated = self.repository_object.attributes.get("pushed_at", 0)
             self.data.last_fetched = datetime.now(UTC)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def common_update(self, ignore_issues=False, force=False, skip_releases=False) -> bool:
         """Common information update steps of the repository."""
         self.logger.debug("%s Getting repository information", self.string)
@@ -533,17 +767,21 @@ class HacsRepository:
             self.data.last_updated = self.repository_object.attributes.get("pushed_at", 0)
 
             # Update last available commit
-            await self.repository_object.set_last_commit()
-            self.data.last_commit = self.repository_object.last_commit
+            if (commit := self.commit_for_ref(self.data.default_branch)) is not None:
+                self.data.last_commit = commit[:7]
+            else:
+                await self.repository_object.set_last_commit()
+                self.data.last_commit = self.repository_object.last_commit
 
         # Get the content of hacs.json
-        if RepositoryFile.HACS_JSON in [x.filename for x in self.tree]:
+        if self.tree.has_filename(RepositoryFile.HACS_JSON):
             if manifest := await self.async_get_hacs_json():
                 self.repository_manifest = HacsManifest.from_dict(manifest)
                 self.data.update_data(
                     self.repository_manifest.to_dict(),
                     action=self.hacs.system.action,
                 )
+                await self.async_use_full_tree()
 
         # Update "info.md"
         self.additional_info = await self.async_get_info_file_contents()
@@ -553,6 +791,95 @@ class HacsRepository:
 
         return True
 
+    @property
+    def metadata_manifest_path(self) -> str | None:
+        """Return the path of the manifest file included in batched metadata."""
+        return None
+
+    def releases_from_metadata(self, metadata: RepositoryMetadata) -> list[GitHubReleaseModel]:
+        """Return the releases of batched metadata the repository can offer."""
+        return [
+            release
+            for release in metadata.releases
+            if not release.draft and (self.data.show_beta or not release.prerelease)
+        ][: self.hacs.configuration.release_limit]
+
+    def update_from_metadata(self, metadata: RepositoryMetadata) -> bool:
+        """Update the repository from batched metadata, replaces common_update.
+
+        Returns False when the repository needs common_update instead, like
+        archived and removed repositories and refs the metadata has no files for.
+        The tree and the info file are not refreshed, see async_refresh_content.
+        """
+        if metadata.attributes.get("archived") or (
+            self.hacs.repositories.is_removed(self.data.full_name)
+            and self.hacs.repositories.removed_repository(self.data.full_name).removal_type
+            != "remove"
+        ):
+            return False
+
+        self.data.update_data(metadata.attributes, action=self.hacs.system.action)
+        self.data.last_updated = metadata.attributes.get("pushed_at", 0)
+        if metadata.last_commit is not None:
+            self.data.last_commit = metadata.last_commit
+
+        if releases := self.releases_from_metadata(metadata):
+            self.data.releases = True
+            self.releases.objects = releases
+            self.data.published_tags = [x.tag_name for x in releases]
+            self.data.last_version = next(iter(self.data.published_tags))
+        else:
+            # The releases were deleted or are all prereleases
+            self.data.releases = False
+            self.releases.objects = []
+            self.data.published_tags = []
+            self.data.last_version = None
+
+        if not self.force_branch:
+            self.ref = self.version_to_download()
+        if self.data.releases:
+            for release in self.releases.objects or []:
+                if release.tag_name == self.ref and (assets := release.assets):
+                    self.data.downloads = next(iter(assets)).download_count
+
+        if (files := metadata.files_for_ref(self.ref)) is None:
+            return False
+        self.update_from_metadata_files(files)
+
+        self._resolved_commit = None
+        if files.commit is not None and self.hacs.blob_cache is not None:
+            self._resolved_commit = (self.ref.replace("tags/", ""), files.commit)
+
+        self.data.last_fetched = datetime.now(UTC)
+        return True
+
+    async def async_refresh_content(self) -> None:
+        """Refresh the tree and the info file after a metadata update found new content."""
+        try:
+            self.tree = await self.async_get_tree_at_commit(self.ref)
+        except (AIOGitHubAPIException, HacsException) as exception:
+            self.logger.debug("%s %s", self.string, exception)
+            self.tree = EMPTY_TREE
+        if not self.tree:
+            await self.common_update(force=True)
+            return
+
+        # Update "info.md"
+        self.additional_info = await self.async_get_info_file_contents()
+
+    def update_from_metadata_files(self, files: RepositoryMetadataFiles) -> None:
+        """Update the repository from the files included in batched metadata."""
+        if files.hacs_json is not None:
+            try:
+                self.repository_manifest = HacsManifest.from_dict(json_loads(files.hacs_json))
+            except (HacsException, ValueError) as exception:
+                self.logger.debug("%s %s", self.string, exception)
+            else:
+                self.data.update_data(
+                    self.repository_manifest.to_dict(),
+                    action=self.hacs.system.action,
+                )
+
     async def download_zip_files(self, validate: Validate) -> None:
         """Download ZIP archive from repository release."""
 
@@ -580,36 +907,72 @@ class HacsRepository:
     ) -> None:
         """Download ZIP archive from repository release."""
         try:
-            filecontent = await self.hacs.async_download_file(content["url"])
-
-            if filecontent is None:
+            if not await self.async_download_and_extract_zip(content["url"]):
                 validate.errors.append(f"Failed to download {content['url']}")
                 return
 
-            temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-            temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
+            self.logger.info("%s Download of %s completed", self.string, content["name"])
+        except BaseException:  # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            validate.errors.append("Download was not completed")
 
-            result = await self.hacs.async_save_file(temp_file, filecontent)
-            with zipfile.ZipFile(temp_file, "r") as zip_file:
-                zip_file.extractall(self.content.path.local)
+    async def async_download_and_extract_zip(
+        self,
+        url: str,
+        *,
+        remote_path: str | None = None,
+        strip_root: bool = False,
+        keep_url: bool = False,
+        nolog: bool = False,
+    ) -> bool:
+        """Download a zip archive and extract it to the local path in the executor.
+
+        Archives are buffered in memory up to ZIP_SPOOL_SIZE before spilling
+        to an anonymous temporary file, and extraction progress is reported
+        between the 50 and 70 marks of the install.
+        """
+        archive = await self.hacs.hass.async_add_executor_job(
+            partial(tempfile.SpooledTemporaryFile, max_size=ZIP_SPOOL_SIZE)
+        )
+        reported = 50
+
+        def _progress(done: int, total: int) -> None:
+            nonlocal reported
+            if (progress := 50 + (20 * done) // total) != reported:
+                reported = progress
+                self.hacs.hass.loop.call_soon_threadsafe(
+                    self.hacs.async_dispatch,
+                    HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                    {"repository": self.data.full_name, "progress": progress},
+                )
 
-            def cleanup_temp_dir():
-                """Cleanup temp_dir."""
-                if os.path.exists(temp_dir):
-                    self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                    shutil.rmtree(temp_dir)
+        try:
+            if not await self.hacs.async_download_file_to_fileobj(
+                url, archive, keep_url=keep_url, nolog=nolog
+            ):
+                return False
 
-            if result:
-                self.logger.info("%s Download of %s completed", self.string, content["name"])
-                await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
-                return
+            await self.hacs.hass.async_add_executor_job(
+                partial(
+                    extract_zip,
+                    archive,
+                    self.download_path,
+                    remote_path=remote_path,
+                    strip_root=strip_root,
+                    progress=_progress,
+                )
+            )
+        finally:
+            await self.hacs.hass.async_add_executor_job(archive.close)
+        return True
 
-            validate.errors.append(f"[{content['name']}] was not downloaded")
-        except BaseException:  # lgtm [py/catch-base-exception] pylint: disable=broad-except
-            validate.errors.append("Download was not completed")
+    async def download_content(self, version: string | None = None) -> dict[str, str]:
+        """Download the content of a directory.
 
-    async def download_content(self, version: string | None = None) -> None:
-        """Download the content of a directory."""
+        Files whose blob SHA matches the installed version are not
+        downloaded again. Returns the digest of each downloaded file by its
+        path relative to the local path, the blob SHA for files from the tree
+        and the SHA-256 for release assets.
+        """
         contents: list[FileInformation] | None = None
         if self.hacs.configuration.experimental:
             if (
@@ -620,7 +983,7 @@ class HacsRepository:
                 self.logger.info("%s Trying experimental download", self.string)
                 try:
                     await self.download_repository_zip()
-                    return
+                    return {}
                 except HacsException as exception:
                     self.logger.exception(exception)
 
@@ -631,20 +994,70 @@ class HacsRepository:
             contents = await self.release_contents(version)
 
         if not contents:
+            await self.async_get_tree()
             contents = self.gather_files_to_download()
 
         if not contents:
             raise HacsException("No content to download")
 
+        if self.repository_manifest.content_in_root and self.repository_manifest.filename:
+            contents = [
+                content for content in contents if content.name == self.repository_manifest.filename
+            ]
+
+        installed_files = {self.local_file_name(content): content.sha for content in contents}
+        unchanged = await self.hacs.hass.async_add_executor_job(
+            self._apply_installed_files, installed_files
+        )
+        if unchanged:
+            self.logger.debug("%s %s files are unchanged", self.string, len(unchanged))
+
         download_queue = QueueManager(hass=self.hacs.hass)
 
         for content in contents:
-            if self.repository_manifest.content_in_root and self.repository_manifest.filename:
-                if content.name != self.repository_manifest.filename:
-                    continue
-            download_queue.add(self.dowload_repository_content(content))
+            if self.local_file_name(content) not in unchanged:
+                download_queue.add(
+                    partial(self.dowload_repository_content, content, installed_files)
+                )
 
         await download_queue.execute()
+        return {name: digest for name, digest in installed_files.items() if digest}
+
+    def _apply_installed_files(self, installed_files: dict[str, str]) -> set[str]:
+        """Compare the installed files with the files to install, must run in the executor.
+
+        Returns the files that are installed with the same content. In a
+        staged install those are linked into the staging directory, else the
+        installed files that are no longer part of the content are removed.
+        """
+        if not self.data.installed or not self.data.installed_files:
+            return set()
+
+        unchanged = set()
+        for name, sha in installed_files.items():
+            if sha is None or self.data.installed_files.get(name) != sha:
+                continue
+            local_file = os.path.join(self.content.path.local, name)
+            try:
+                if git_blob_sha_of_file(local_file) != sha:
+                    # Changed after it was installed
+                    continue
+                if self.content.path.staging is not None:
+                    target = os.path.join(self.content.path.staging, name)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    link_or_copy(local_file, target)
+            except OSError:
+                continue
+            unchanged.add(name)
+
+        if self.content.path.staging is None:
+            for name in self.data.installed_files.keys() - installed_files.keys():
+                local_file = os.path.join(self.content.path.local, name)
+                if os.path.isfile(local_file):
+                    self.logger.debug("%s Removing %s", self.string, local_file)
+                    os.remove(local_file)
+
+        return unchanged
 
     async def download_repository_zip(self):
         """Download the zip archive of the repository."""
@@ -653,65 +1066,28 @@ class HacsRepository:
         if not ref:
             raise HacsException("Missing required elements.")
 
-        filecontent = await self.hacs.async_download_file(
-            github_archive(repository=self.data.full_name, version=ref, variant="tags"),
-            keep_url=True,
-            nolog=True,
-        )
-
-        if filecontent is None:
-            filecontent = await self.hacs.async_download_file(
-                github_archive(repository=self.data.full_name, version=ref, variant="heads"),
+        for variant in ("tags", "heads"):
+            if await self.async_download_and_extract_zip(
+                github_archive(repository=self.data.full_name, version=ref, variant=variant),
+                remote_path=self.content.path.remote,
+                strip_root=True,
                 keep_url=True,
-            )
-        if filecontent is None:
+                nolog=variant == "tags",
+            ):
+                break
+        else:
             raise HacsException(f"[{self}] Failed to download zipball")
 
-        temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-        temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-        result = await self.hacs.async_save_file(temp_file, filecontent)
-        if not result:
-            raise HacsException("Could not save ZIP file")
-
-        with zipfile.ZipFile(temp_file, "r") as zip_file:
-            extractable = []
-            for path in zip_file.filelist:
-                filename = "/".join(path.filename.split("/")[1:])
-                if (
-                    filename.startswith(self.content.path.remote)
-                    and filename != self.content.path.remote
-                ):
-                    path.filename = filename.replace(self.content.path.remote, "")
-                    if path.filename == "/":
-                        # Blank files is not valid, and will start to throw in Python 3.12
-                        continue
-                    extractable.append(path)
-
-            if len(extractable) == 0:
-                raise HacsException("No content to extract")
-            zip_file.extractall(self.content.path.local, extractable)
-
-        def cleanup_temp_dir():
-            """Cleanup temp_dir."""
-            if os.path.exists(temp_dir):
-                self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                shutil.rmtree(temp_dir)
-
-        await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
         self.logger.info("%s Content was extracted to %s", self.string, self.content.path.local)
 
     async def async_get_hacs_json(self, ref: str = None) -> dict[str, Any] | None:
         """Get the content of the hacs.json file."""
+        ref = ref or self.version_to_download()
         try:
-            response = await self.hacs.async_github_api_method(
-                method=self.hacs.githubapi.repos.contents.get,
-                raise_exception=False,
-                repository=self.data.full_name,
-                path=RepositoryFile.HACS_JSON,
-                **{"params": {"ref": ref or self.version_to_download()}},
+            content = await self.hacs.repository_files.async_get(
+                self, RepositoryFile.HACS_JSON, ref
             )
-            if response:
-                return json_loads(decode_content(response.data.content))
+            return json_loads(content) if content is not None else None
         except BaseException:  # lgtm [py/catch-base-exception] pylint: disable=broad-except
             pass
 
@@ -733,7 +1109,7 @@ class HacsRepository:
                 name,
             )
 
-        info_files = [filename for filename in _info_file_variants() if filename in self.treefiles]
+        info_files = [filename for filename in _info_file_variants() if filename in self.tree]
 
         if not info_files:
             return ""
@@ -769,6 +1145,7 @@ class HacsRepository:
 
         self.data.installed_version = None
         self.data.installed_commit = None
+        self.data.installed_files = {}
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY,
             {
@@ -884,13 +1261,35 @@ class HacsRepository:
             {"repository": self.data.full_name, "progress": 30},
         )
         self.logger.info("%s Running installation steps", self.string)
-        await self.async_install_repository(version=version)
-        self.hacs.async_dispatch(
-            HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 90},
+        installed = (
+            self.data.installed,
+            self.data.installed_commit,
+            self.data.installed_files,
+            self.data.installed_version,
         )
-        self.logger.info("%s Installation steps completed", self.string)
-        await self._async_post_install()
+        try:
+            await self.async_install_repository(version=version)
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {"repository": self.data.full_name, "progress": 90},
+            )
+            self.logger.info("%s Installation steps completed", self.string)
+            await self._async_post_install()
+        except BaseException:
+            if (staged := self._staged_install) is not None:
+                # The post installation steps failed, put the previous content back
+                await self.hacs.hass.async_add_executor_job(staged.rollback)
+                (
+                    self.data.installed,
+                    self.data.installed_commit,
+                    self.data.installed_files,
+                    self.data.installed_version,
+                ) = installed
+            raise
+        finally:
+            if (staged := self._staged_install) is not None:
+                self._staged_install = None
+                await self.hacs.hass.async_add_executor_job(staged.cleanup)
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
             {"repository": self.data.full_name, "progress": False},
@@ -917,7 +1316,6 @@ class HacsRepository:
 
     async def async_install_repository(self, *, version: str | None = None, **_) -> None:
         """Common installation steps of the repository."""
-        persistent_directory = None
         await self.update_repository(force=version is None)
         if self.content.path.local is None:
             raise HacsException("repository.content.path.local is None")
@@ -937,24 +1335,13 @@ class HacsRepository:
             {"repository": self.data.full_name, "progress": 40},
         )
 
-        if self.data.installed and self.data.category == "netdaemon":
-            persistent_directory = BackupNetDaemon(hacs=self.hacs, repository=self)
-            await self.hacs.hass.async_add_executor_job(persistent_directory.create)
-
-        elif self.repository_manifest.persistent_directory:
-            if os.path.exists(
-                f"{self.content.path.local}/{self.repository_manifest.persistent_directory}"
-            ):
-                persistent_directory = Backup(
-                    hacs=self.hacs,
-                    local_path=f"{self.content.path.local}/{self.repository_manifest.persistent_directory}",
-                    backup_path=tempfile.gettempdir() + "/hacs_persistent_directory/",
-                )
-                await self.hacs.hass.async_add_executor_job(persistent_directory.create)
-
-        if self.data.installed and not self.content.single:
-            backup = Backup(hacs=self.hacs, local_path=self.content.path.local)
-            await self.hacs.hass.async_add_executor_job(backup.create)
+        staged = None
+        if not self.content.single:
+            staged = StagedInstall(hacs=self.hacs, local_path=self.content.path.local)
+            if staged.can_stage:
+                await self.hacs.hass.async_add_executor_job(staged.prepare)
+            else:
+                staged = None
 
         self.hacs.log.debug("%s Local path is set to %s", self.string, self.content.path.local)
         self.hacs.log.debug("%s Remote path is set to %s", self.string, self.content.path.remote)
@@ -965,39 +1352,57 @@ class HacsRepository:
             {"repository": self.data.full_name, "progress": 50},
         )
 
-        if self.repository_manifest.zip_release and self.repository_manifest.filename:
-            await self.download_zip_files(self.validate)
-        else:
-            await self.download_content(version_to_install)
-
-        self.hacs.async_dispatch(
-            HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 70},
-        )
+        try:
+            installed_files = {}
+            if staged is not None:
+                self.content.path.staging = staged.staging_path
+            try:
+                if self.repository_manifest.zip_release and self.repository_manifest.filename:
+                    await self.download_zip_files(self.validate)
+                else:
+                    installed_files = await self.download_content(version_to_install)
+            finally:
+                self.content.path.staging = None
 
-        if self.validate.errors:
-            for error in self.validate.errors:
-                self.logger.error("%s %s", self.string, error)
-            if self.data.installed and not self.content.single:
-                await self.hacs.hass.async_add_executor_job(backup.restore)
-                await self.hacs.hass.async_add_executor_job(backup.cleanup)
-            raise HacsException("Could not download, see log for details")
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {"repository": self.data.full_name, "progress": 70},
+            )
 
-        self.hacs.async_dispatch(
-            HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 80},
-        )
+            if self.validate.errors:
+                for error in self.validate.errors:
+                    self.logger.error("%s %s", self.string, error)
+                raise HacsException("Could not download, see log for details")
 
-        if self.data.installed and not self.content.single:
-            await self.hacs.hass.async_add_executor_job(backup.cleanup)
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {"repository": self.data.full_name, "progress": 80},
+            )
 
-        if persistent_directory is not None:
-            await self.hacs.hass.async_add_executor_job(persistent_directory.restore)
-            await self.hacs.hass.async_add_executor_job(persistent_directory.cleanup)
+            if staged is not None:
+                if self.data.installed and self.data.category == "netdaemon":
+                    await self.hacs.hass.async_add_executor_job(staged.preserve_matching, ".yaml")
+                if self.repository_manifest.persistent_directory:
+                    await self.hacs.hass.async_add_executor_job(
+                        staged.preserve, self.repository_manifest.persistent_directory
+                    )
+                if self.data.category == "plugin" and self.hacs.asset_compressor is not None:
+                    await self.hacs.hass.async_add_executor_job(
+                        staged.preserve_variants,
+                        tuple(suffix for suffix, _, _ in compressed_variants()),
+                    )
+                await self.hacs.hass.async_add_executor_job(staged.swap)
+                # The previous content is kept until the post installation steps are done
+                self._staged_install = staged
+                staged = None
+        finally:
+            if staged is not None:
+                await self.hacs.hass.async_add_executor_job(staged.cleanup)
 
         if self.validate.success:
             self.data.installed = True
             self.data.installed_commit = self.data.last_commit
+            self.data.installed_files = installed_files
 
             if version_to_install == self.data.default_branch:
                 self.data.installed_version = None
@@ -1020,16 +1425,152 @@ class HacsRepository:
     def update_filenames(self) -> None:
         """Get the filename to target."""
 
+    @property
+    def tree_scope(self) -> tuple[str, ...] | None:
+        """Return the directories to fetch from the tree, None for the full tree."""
+        if (
+            self.tree_directories is None
+            or self.repository_manifest.content_in_root
+            or self.repository_object is None
+            or (self.repository_object.attributes.get("size") or 0) < TREE_SCOPED_REPOSITORY_SIZE
+        ):
+            return None
+        return self.tree_directories
+
     async def get_tree(self, ref: str):
         """Return the repository tree."""
+        if (directories := self.tree_scope) is not None:
+            return await self.async_get_scoped_tree(ref, directories)
         if self.repository_object is None:
-            raise HacsException("No repository_object")
+            # Updated from batched metadata, without the legacy repository object
+            response = await self.hacs.async_github_api_method(
+                method=self.hacs.githubapi.repos.git.get_tree,
+                repository=self.data.full_name,
+                tree_sha=ref,
+                params={"recursive": "1"},
+            )
+            return RepositoryTree(
+                (
+                    TreeEntry(entry.path, entry.type == "tree", entry.sha, self.data.full_name, ref)
+                    for entry in response.data.tree or []
+                ),
+                self.data.full_name,
+                ref,
+            )
         try:
             tree = await self.repository_object.get_tree(ref)
             return tree
         except (ValueError, AIOGitHubAPIException) as exception:
             raise HacsException(exception) from exception
 
+    async def async_get_scoped_tree(self, ref: str, directories: tuple[str, ...]) -> RepositoryTree:
+        """Return the root of the tree with the content of the directories.
+
+        The root is listed without recursion, and each of the directories
+        that exists is fetched recursively by the SHA of its tree.
+        """
+        response = await self.hacs.async_github_api_method(
+            method=self.hacs.githubapi.repos.git.get_tree,
+            repository=self.data.full_name,
+            tree_sha=ref,
+        )
+        entries = []
+        for entry in response.data.tree or []:
+            entries.append(
+                TreeEntry(entry.path, entry.type == "tree", entry.sha, self.data.full_name, ref)
+            )
+            if entry.type != "tree" or entry.path not in directories:
+                continue
+
+            subtree = await self.hacs.async_github_api_method(
+                method=self.hacs.githubapi.repos.git.get_tree,
+                repository=self.data.full_name,
+                tree_sha=entry.sha,
+                params={"recursive": "1"},
+            )
+            if subtree.data.truncated:
+                self.logger.warning(
+                    "%s The tree of %s is truncated by GitHub", self.string, entry.path
+                )
+            entries.extend(
+                TreeEntry(
+                    f"{entry.path}/{subentry.path}",
+                    subentry.type == "tree",
+                    subentry.sha,
+                    self.data.full_name,
+                    ref,
+                )
+                for subentry in subtree.data.tree or []
+            )
+        return RepositoryTree(entries, self.data.full_name, ref, directories)
+
+    async def async_use_full_tree(self) -> None:
+        """Fetch the full tree if the scoped tree does not have the content."""
+        if self.tree.scope is not None and self.tree_scope is None:
+            self.tree = await self.async_get_tree_at_commit(self.ref)
+
+    async def async_resolve_commit(self, ref: str | None) -> str | None:
+        """Resolve the commit SHA a ref points at, when the commit cache can be used.
+
+        The trees and small files at a commit never change, so they are
+        fetched once per commit while the ref keeps pointing at it.
+        """
+        self._resolved_commit = None
+        if ref is None or self.hacs.blob_cache is None:
+            return None
+        ref = ref.replace("tags/", "")
+        response = await self.hacs.async_github_api_method(
+            method=self.hacs.githubapi.generic,
+            endpoint=f"/repos/{self.data.full_name}/commits/{ref}",
+            headers={"Accept": "application/vnd.github.sha"},
+            raise_exception=False,
+        )
+        if response is None or not isinstance(response.data, str):
+            return None
+        if len(commit := response.data.strip()) != 40:
+            return None
+        self._resolved_commit = (ref, commit)
+        return commit
+
+    def commit_for_ref(self, ref: str | None) -> str | None:
+        """Return the commit a ref pointed at in the last update, if it was resolved."""
+        if ref is None or self._resolved_commit is None:
+            return None
+        resolved_ref, commit = self._resolved_commit
+        return commit if ref.replace("tags/", "") == resolved_ref else None
+
+    async def async_get_tree_at_commit(self, ref: str) -> RepositoryTree:
+        """Return the tree of a ref, cached by the commit the ref points at."""
+        scope = self.tree_scope
+        key = commit_cache_key(
+            self.data.full_name,
+            self.commit_for_ref(ref),
+            f"tree:{','.join(scope) if scope is not None else ''}",
+        )
+        if key is not None and (cached := await self.hacs.blob_cache.async_get(key)):
+            self.logger.debug("%s Using the cached tree of %s", self.string, ref)
+            return RepositoryTree.from_list(json_loads(cached), self.data.full_name, ref, scope)
+
+        tree = await self.get_tree(ref)
+        if not isinstance(tree, RepositoryTree):
+            tree = RepositoryTree(tree)
+        if key is not None and tree:
+            await self.hacs.blob_cache.async_set(key, json_bytes(tree.as_list()))
+        return tree
+
+    async def async_get_cached_file(self, path: str, ref: str) -> str | None:
+        """Return the content of a file cached by the commit the ref points at."""
+        key = commit_cache_key(self.data.full_name, self.commit_for_ref(ref), path)
+        if key is not None and (cached := await self.hacs.blob_cache.async_get(key)) is not None:
+            return cached.decode("utf-8")
+        return None
+
+    async def async_set_cached_file(self, path: str, ref: str, content: str) -> None:
+        """Cache the content of a small file by the commit the ref points at."""
+        key = commit_cache_key(self.data.full_name, self.commit_for_ref(ref), path)
+        if key is not None and len(encoded := content.encode("utf-8")) <= COMMIT_FILE_CACHE_SIZE:
+            await self.hacs.blob_cache.async_set(key, encoded)
+
     async def get_releases(self, prerelease=False, returnlimit=5) -> list[GitHubReleaseModel]:
         """Return the repository releases."""
         response = await self.hacs.async_github_api_method(
@@ -1131,12 +1672,10 @@ class HacsRepository:
         )
 
         try:
-            self.tree = await self.get_tree(self.ref)
+            await self.async_resolve_commit(self.ref)
+            self.tree = await self.async_get_tree_at_commit(self.ref)
             if not self.tree:
                 raise HacsException("No files in tree")
-            self.treefiles = []
-            for treefile in self.tree:
-                self.treefiles.append(treefile.full_path)
         except (AIOGitHubAPIException, HacsException) as exception:
             if (
                 not retry
@@ -1171,7 +1710,12 @@ class HacsRepository:
                 if ref == release.tag_name:
                     for asset in release.assets or []:
                         files.append(
-                            FileInformation(asset.browser_download_url, asset.name, asset.name)
+                            FileInformation(
+                                asset.browser_download_url,
+                                asset.name,
+                                asset.name,
+                                asset_cache_key(asset.id),
+                            )
                         )
             if files:
                 return files
@@ -1181,40 +1725,56 @@ class HacsRepository:
                 if treefile.filename == self.data.file_name:
                     files.append(
                         FileInformation(
-                            treefile.download_url, treefile.full_path, treefile.filename
+                            treefile.download_url,
+                            treefile.full_path,
+                            treefile.filename,
+                            blob_cache_key(treefile.sha),
                         )
                     )
             return files
 
         if category == "plugin":
-            for treefile in tree:
-                if treefile.path in ["", "dist"]:
-                    if remotelocation == "dist" and not treefile.filename.startswith("dist"):
+            for treefile in tree.in_directory("", "dist"):
+                if remotelocation == "dist" and not treefile.filename.startswith("dist"):
+                    continue
+                if not remotelocation:
+                    if not treefile.filename.endswith(".js"):
                         continue
-                    if not remotelocation:
-                        if not treefile.filename.endswith(".js"):
-                            continue
-                        if treefile.path != "":
-                            continue
-                    if not treefile.is_directory:
-                        files.append(
-                            FileInformation(
-                                treefile.download_url, treefile.full_path, treefile.filename
-                            )
+                    if treefile.path != "":
+                        continue
+                if not treefile.is_directory:
+                    files.append(
+                        FileInformation(
+                            treefile.download_url,
+                            treefile.full_path,
+                            treefile.filename,
+                            blob_cache_key(treefile.sha),
                         )
+                    )
             if files:
                 return files
 
-        if self.repository_manifest.content_in_root:
-            if not self.repository_manifest.filename:
-                if category == "theme":
-                    tree = filter_content_return_one_of_type(self.tree, "", "yaml", "full_path")
+        if (
+            self.repository_manifest.content_in_root
+            and not self.repository_manifest.filename
+            and category == "theme"
+        ):
+            contents = filter_content_return_one_of_type(tree, "", "yaml", "full_path")
+        else:
+            contents = tree.with_prefix(self.content.path.remote)
 
-        for path in tree:
+        for path in contents:
             if path.is_directory:
                 continue
             if path.full_path.startswith(self.content.path.remote):
-                files.append(FileInformation(path.download_url, path.full_path, path.filename))
+                files.append(
+                    FileInformation(
+                        path.download_url,
+                        path.full_path,
+                        path.filename,
+                        blob_cache_key(path.sha),
+                    )
+                )
         return files
 
     async def release_contents(self, version: str | None = None) -> list[FileInformation] | None:
@@ -1232,43 +1792,46 @@ class HacsRepository:
                 url=asset.get("browser_download_url"),
                 path=asset.get("name"),
                 name=asset.get("name"),
+                cache_key=asset_cache_key(asset.get("id")),
             )
             for asset in release.data.get("assets", [])
         ]
 
-    @concurrent(concurrenttasks=10)
-    async def dowload_repository_content(self, content: FileInformation) -> None:
-        """Download content."""
-        try:
-            self.logger.debug("%s Downloading %s", self.string, content.name)
+    def local_file_name(self, content: FileInformation) -> str:
+        """Return the path of a file relative to the local path."""
+        if self.content.single or content.path is None:
+            return content.name
 
-            filecontent = await self.hacs.async_download_file(content.download_url)
+        _content_path = content.path
+        if not self.repository_manifest.content_in_root:
+            _content_path = _content_path.replace(f"{self.content.path.remote}", "")
 
-            if filecontent is None:
-                self.validate.errors.append(f"[{content.name}] was not downloaded.")
-                return
+        directory = _content_path.split("/")[:-1]
+        return "/".join([*directory, content.name]).replace("//", "/").lstrip("/")
 
-            # Save the content of the file.
-            if self.content.single or content.path is None:
-                local_directory = self.content.path.local
-
-            else:
-                _content_path = content.path
-                if not self.repository_manifest.content_in_root:
-                    _content_path = _content_path.replace(f"{self.content.path.remote}", "")
+    @concurrent(concurrenttasks=10)
+    async def dowload_repository_content(
+        self,
+        content: FileInformation,
+        installed_files: dict[str, str | None] | None = None,
+    ) -> None:
+        """Download content, and record the digest of files without a blob SHA."""
+        try:
+            self.logger.debug("%s Downloading %s", self.string, content.name)
 
-                local_directory = f"{self.content.path.local}/{_content_path}"
-                local_directory = local_directory.split("/")
-                del local_directory[-1]
-                local_directory = "/".join(local_directory)
+            local_file_path = os.path.join(self.download_path, self.local_file_name(content))
 
             # Check local directory
-            pathlib.Path(local_directory).mkdir(parents=True, exist_ok=True)
+            pathlib.Path(os.path.dirname(local_file_path)).mkdir(parents=True, exist_ok=True)
 
-            local_file_path = (f"{local_directory}/{content.name}").replace("//", "/")
-
-            result = await self.hacs.async_save_file(local_file_path, filecontent)
+            result = await self.hacs.async_download_file_to_path(
+                content.download_url,
+                local_file_path,
+                cache_key=content.cache_key,
+            )
             if result:
+                if installed_files is not None and content.sha is None:
+                    installed_files[self.local_file_name(content)] = f"{SHA256_PREFIX}{result}"
                 self.logger.info("%s Download of %s completed", self.string, content.name)
                 return
             self.validate.errors.append(f"[{content.name}] was not downloaded.")
@@ -1336,17 +1899,12 @@ class HacsRepository:
         if version is None:
             return None
 
-        result = await self.hacs.async_download_file(
-            f"https://raw.githubusercontent.com/{self.data.full_name}/{version}/{filename}",
-            nolog=True,
-        )
+        result = await self.hacs.repository_files.async_get(self, filename, version)
 
         return (
             render_template(
                 self.hacs,
-                result.decode(encoding="utf-8")
-                .replace("<svg", "<disabled")
-                .replace("</svg", "</disabled"),
+                result.replace("<svg", "<disabled").replace("</svg", "</disabled"),
                 self,
             )
             if result
@@ -1357,9 +1915,8 @@ class HacsRepository:
         """Get the hacs.json file of the repository."""
         self.logger.debug("%s Getting hacs.json for version=%s", self.string, version)
         try:
-            result = await self.hacs.async_download_file(
-                f"https://raw.githubusercontent.com/{self.data.full_name}/{version}/hacs.json",
-                nolog=True,
+            result = await self.hacs.repository_files.async_get(
+                self, RepositoryFile.HACS_JSON, version
             )
             if result is None:
                 return None
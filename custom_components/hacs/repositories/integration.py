@@ -9,9 +9,9 @@ from homeassistant.loader import async_get_custom_components
 from ..const import DOMAIN
 from ..enums import HacsCategory, HacsDispatchEvent, HacsGitHubRepo, RepositoryFile
 from ..exceptions import AddonRepositoryException, HacsException
-from ..utils.decode import decode_content
 from ..utils.decorator import concurrent
 from ..utils.filters import get_first_directory_in_directory
+from ..utils.graphql import RepositoryMetadataFiles
 from ..utils.json import json_loads
 from .base import HacsRepository
 
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
 class HacsIntegrationRepository(HacsRepository):
     """Integrations in HACS."""
 
+    tree_directories = ("custom_components",)
+
     def __init__(self, hacs: HacsBase, full_name: str):
         """Initialize."""
         super().__init__(hacs=hacs)
@@ -72,9 +74,9 @@ class HacsIntegrationRepository(HacsRepository):
             name = get_first_directory_in_directory(self.tree, "custom_components")
             if name is None:
                 if (
-                    "repository.json" in self.treefiles
-                    or "repository.yaml" in self.treefiles
-                    or "repository.yml" in self.treefiles
+                    "repository.json" in self.tree
+                    or "repository.yaml" in self.tree
+                    or "repository.yml" in self.tree
                 ):
                     raise AddonRepositoryException()
                 raise HacsException(
@@ -84,20 +86,7 @@ class HacsIntegrationRepository(HacsRepository):
 
         # Get the content of manifest.json
         if manifest := await self.async_get_integration_manifest():
-            try:
-                self.integration_manifest = manifest
-                self.data.authors = manifest.get("codeowners", [])
-                self.data.domain = manifest["domain"]
-                self.data.manifest_name = manifest.get("name")
-                self.data.config_flow = manifest.get("config_flow", False)
-
-            except KeyError as exception:
-                self.validate.errors.append(
-                    f"Missing expected key '{exception}' in { RepositoryFile.MAINIFEST_JSON}"
-                )
-                self.hacs.log.error(
-                    "Missing expected key '%s' in '%s'", exception, RepositoryFile.MAINIFEST_JSON
-                )
+            self.update_integration_manifest(manifest)
 
         # Set local path
         self.content.path.local = self.localpath
@@ -109,7 +98,7 @@ class HacsIntegrationRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -124,20 +113,7 @@ class HacsIntegrationRepository(HacsRepository):
 
         # Get the content of manifest.json
         if manifest := await self.async_get_integration_manifest():
-            try:
-                self.integration_manifest = manifest
-                self.data.authors = manifest.get("codeowners", [])
-                self.data.domain = manifest["domain"]
-                self.data.manifest_name = manifest.get("name")
-                self.data.config_flow = manifest.get("config_flow", False)
-
-            except KeyError as exception:
-                self.validate.errors.append(
-                    f"Missing expected key '{exception}' in { RepositoryFile.MAINIFEST_JSON}"
-                )
-                self.hacs.log.error(
-                    "Missing expected key '%s' in '%s'", exception, RepositoryFile.MAINIFEST_JSON
-                )
+            self.update_integration_manifest(manifest)
 
         # Set local path
         self.content.path.local = self.localpath
@@ -154,6 +130,44 @@ class HacsIntegrationRepository(HacsRepository):
                 },
             )
 
+    @property
+    def metadata_manifest_path(self) -> str | None:
+        """Return the path of the manifest file included in batched metadata."""
+        if self.repository_manifest.content_in_root:
+            return RepositoryFile.MAINIFEST_JSON
+        if self.data.domain:
+            return f"custom_components/{self.data.domain}/{RepositoryFile.MAINIFEST_JSON}"
+        return None
+
+    def update_from_metadata_files(self, files: RepositoryMetadataFiles) -> None:
+        """Update the repository from the files included in batched metadata."""
+        super().update_from_metadata_files(files)
+        if files.manifest_json is None:
+            return
+        try:
+            manifest = json_loads(files.manifest_json)
+        except ValueError as exception:
+            self.logger.debug("%s %s", self.string, exception)
+            return
+        self.update_integration_manifest(manifest)
+
+    def update_integration_manifest(self, manifest: dict[str, Any]) -> None:
+        """Update the repository from the content of manifest.json."""
+        try:
+            self.integration_manifest = manifest
+            self.data.authors = manifest.get("codeowners", [])
+            self.data.domain = manifest["domain"]
+            self.data.manifest_name = manifest.get("name")
+            self.data.config_flow = manifest.get("config_flow", False)
+
+        except KeyError as exception:
+            self.validate.errors.append(
+                f"Missing expected key '{exception}' in { RepositoryFile.MAINIFEST_JSON}"
+            )
+            self.hacs.log.error(
+                "Missing expected key '%s' in '%s'", exception, RepositoryFile.MAINIFEST_JSON
+            )
+
     async def reload_custom_components(self):
         """Reload custom_components (and config flows)in HA."""
         self.logger.info("Reloading custom_component cache")
@@ -169,14 +183,11 @@ class HacsIntegrationRepository(HacsRepository):
             else f"{self.content.path.remote}/{RepositoryFile.MAINIFEST_JSON}"
         )
 
-        if not manifest_path in (x.full_path for x in self.tree):
+        if manifest_path not in self.tree:
             raise HacsException(f"No {RepositoryFile.MAINIFEST_JSON} file found '{manifest_path}'")
 
-        response = await self.hacs.async_github_api_method(
-            method=self.hacs.githubapi.repos.contents.get,
-            repository=self.data.full_name,
-            path=manifest_path,
-            **{"params": {"ref": ref or self.version_to_download()}},
-        )
-        if response:
-            return json_loads(decode_content(response.data.content))
+        ref = ref or self.version_to_download()
+        if (
+            content := await self.hacs.repository_files.async_get(self, manifest_path, ref)
+        ) is not None:
+            return json_loads(content)
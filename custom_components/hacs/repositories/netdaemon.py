@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class HacsNetdaemonRepository(HacsRepository):
     """Netdaemon apps in HACS."""
 
+    tree_directories = ("apps",)
+
     def __init__(self, hacs: HacsBase, full_name: str):
         """Initialize."""
         super().__init__(hacs=hacs)
@@ -46,8 +48,8 @@ class HacsNetdaemonRepository(HacsRepository):
             self.content.path.remote = f"apps/{self.data.name}"
 
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith(f"{self.content.path.remote}") and treefile.endswith(".cs"):
+        for treefile in self.tree.paths_with_prefix(f"{self.content.path.remote}"):
+            if treefile.endswith(".cs"):
                 compliant = True
                 break
         if not compliant:
@@ -62,7 +64,7 @@ class HacsNetdaemonRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
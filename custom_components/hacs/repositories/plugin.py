@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class HacsPluginRepository(HacsRepository):
     """Plugins in HACS."""
 
+    tree_directories = ("dist",)
+
     def __init__(self, hacs: HacsBase, full_name: str):
         """Initialize."""
         super().__init__(hacs=hacs)
@@ -56,8 +58,10 @@ class HacsPluginRepository(HacsRepository):
     async def async_post_installation(self):
         """Run post installation steps."""
         self.hacs.async_setup_frontend_endpoint_plugin()
+        if self.hacs.asset_compressor is not None:
+            await self.hacs.asset_compressor.async_compress_directory(self.content.path.local)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -126,9 +130,7 @@ class HacsPluginRepository(HacsRepository):
 
         for location in ("",) if self.repository_manifest.content_in_root else ("dist", ""):
             for filename in valid_filenames:
-                if f"{location+'/' if location else ''}{filename}" in [
-                    x.full_path for x in self.tree
-                ]:
+                if f"{location+'/' if location else ''}{filename}" in self.tree:
                     self.data.file_name = filename.split("/")[-1]
                     self.content.path.remote = location
                     break
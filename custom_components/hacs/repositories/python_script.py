@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class HacsPythonScriptRepository(HacsRepository):
     """python_scripts in HACS."""
 
+    tree_directories = ("python_scripts",)
+
     category = "python_script"
 
     def __init__(self, hacs: HacsBase, full_name: str):
@@ -42,8 +44,8 @@ class HacsPythonScriptRepository(HacsRepository):
             self.content.path.remote = ""
 
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith(f"{self.content.path.remote}") and treefile.endswith(".py"):
+        for treefile in self.tree.paths_with_prefix(f"{self.content.path.remote}"):
+            if treefile.endswith(".py"):
                 compliant = True
                 break
         if not compliant:
@@ -66,7 +68,7 @@ class HacsPythonScriptRepository(HacsRepository):
         if self.hacs.system.action:
             await self.hacs.validation.async_run_repository_checks(self)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -77,8 +79,8 @@ class HacsPythonScriptRepository(HacsRepository):
             self.content.path.remote = ""
 
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith(f"{self.content.path.remote}") and treefile.endswith(".py"):
+        for treefile in self.tree.paths_with_prefix(f"{self.content.path.remote}"):
+            if treefile.endswith(".py"):
                 compliant = True
                 break
         if not compliant:
@@ -103,8 +105,6 @@ class HacsPythonScriptRepository(HacsRepository):
 
     def update_filenames(self) -> None:
         """Get the filename to target."""
-        for treefile in self.tree:
-            if treefile.full_path.startswith(
-                self.content.path.remote
-            ) and treefile.full_path.endswith(".py"):
+        for treefile in self.tree.with_prefix(self.content.path.remote):
+            if treefile.full_path.endswith(".py"):
                 self.data.file_name = treefile.filename
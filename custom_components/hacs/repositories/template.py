@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class HacsTemplateRepository(HacsRepository):
     """Custom templates in HACS."""
 
+    tree_directories = ()
+
     def __init__(self, hacs: HacsBase, full_name: str):
         """Initialize."""
         super().__init__(hacs=hacs)
@@ -46,7 +48,7 @@ class HacsTemplateRepository(HacsRepository):
             not self.data.file_name
             or "/" in self.data.file_name
             or not self.data.file_name.endswith(".jinja")
-            or self.data.file_name not in self.treefiles
+            or self.data.file_name not in self.tree
         ):
             raise HacsException(
                 f"{self.string} Repository structure for {self.ref.replace('tags/','')} is not compliant"
@@ -68,7 +70,7 @@ class HacsTemplateRepository(HacsRepository):
         if self.hacs.system.action:
             await self.hacs.validation.async_run_repository_checks(self)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
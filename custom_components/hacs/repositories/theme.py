@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class HacsThemeRepository(HacsRepository):
     """Themes in HACS."""
 
+    tree_directories = ("themes",)
+
     def __init__(self, hacs: HacsBase, full_name: str):
         """Initialize."""
         super().__init__(hacs=hacs)
@@ -46,8 +48,8 @@ class HacsThemeRepository(HacsRepository):
 
         # Custom step 1: Validate content.
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith("themes/") and treefile.endswith(".yaml"):
+        for treefile in self.tree.paths_with_prefix("themes/"):
+            if treefile.endswith(".yaml"):
                 compliant = True
                 break
         if not compliant:
@@ -74,7 +76,7 @@ class HacsThemeRepository(HacsRepository):
         if self.hacs.system.action:
             await self.hacs.validation.async_run_repository_checks(self)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent(concurrenttasks=10)
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -102,8 +104,6 @@ class HacsThemeRepository(HacsRepository):
 
     def update_filenames(self) -> None:
         """Get the filename to target."""
-        for treefile in self.tree:
-            if treefile.full_path.startswith(
-                self.content.path.remote
-            ) and treefile.full_path.endswith(".yaml"):
+        for treefile in self.tree.with_prefix(self.content.path.remote):
+            if treefile.full_path.endswith(".yaml"):
                 self.data.file_name = treefile.filename
@@ -0,0 +1,59 @@
+"""HACS services."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.persistent_notification import (
+    async_create as async_create_persistent_notification,
+)
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+
+from .const import DOMAIN
+from .utils.verify import async_verify_repositories
+
+if TYPE_CHECKING:
+    from .base import HacsBase
+
+SERVICE_VERIFY = "verify"
+
+SERVICE_VERIFY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("repository_ids"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register HACS services."""
+
+    async def async_verify(call: ServiceCall) -> None:
+        """Report installed repositories whose content changed after it was installed."""
+        hacs: HacsBase = hass.data[DOMAIN]
+        reports = await async_verify_repositories(hacs, call.data.get("repository_ids"))
+
+        drifted = [report for report in reports if report["status"] != "ok"]
+        for report in drifted:
+            hacs.log.warning(
+                "Content of %s is %s - added: %s, missing: %s, modified: %s",
+                report["repository"],
+                report["status"],
+                report.get("added", []),
+                report.get("missing", []),
+                report.get("modified", []),
+            )
+        if any(report["status"] == "drift" for report in drifted):
+            async_create_persistent_notification(
+                hass,
+                title="HACS",
+                message="The content of these repositories changed after it was installed:\n"
+                + "\n".join(
+                    f"- {report['repository']}" for report in drifted if report["status"] == "drift"
+                ),
+                notification_id="hacs_verify",
+            )
+        hacs.log.info("Verified %s repositories", len(reports))
+
+    hass.services.async_register(DOMAIN, SERVICE_VERIFY, async_verify, schema=SERVICE_VERIFY_SCHEMA)
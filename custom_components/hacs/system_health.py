@@ -25,7 +25,6 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         return {"Disabled": "HACS is not loaded, but HA still requests this information..."}
 
     hacs: HacsBase = hass.data[DOMAIN]
-    response = await hacs.githubapi.rate_limit()
 
     data = {
         "GitHub API": system_health.async_check_can_reach_url(hass, BASE_API_URL, GITHUB_STATUS),
@@ -35,10 +34,12 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "GitHub Web": system_health.async_check_can_reach_url(
             hass, "https://github.com/", GITHUB_STATUS
         ),
-        "GitHub API Calls Remaining": response.data.resources.core.remaining,
+        "GitHub API Calls Remaining": (
+            hacs.github_budget.remaining if hacs.github_budget.known else "unknown"
+        ),
         "Installed Version": hacs.version,
         "Stage": hacs.stage,
-        "Available Repositories": len(hacs.repositories.list_all),
+        "Available Repositories": hacs.repositories.count,
         "Downloaded Repositories": len(hacs.repositories.list_downloaded),
     }
 
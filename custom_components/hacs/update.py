@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
@@ -126,7 +127,10 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
             self._update_in_progress(progress=20)
 
         try:
-            await self.repository.async_install(version=version)
+            await self.hacs.queue.async_run(
+                partial(self.repository.async_install, version=version),
+                key=(self.repository.data.full_name_lower, "download"),
+            )
         except HacsException as exception:
             raise HomeAssistantError(
                 f"Downloading {self.repository.data.full_name} with version {version or self.repository.data.last_version or self.repository.data.last_commit} failed with ({exception})"
@@ -0,0 +1,90 @@
+"""Archive utils."""
+from __future__ import annotations
+
+import os
+from typing import IO, Callable
+import zipfile
+
+from ..exceptions import HacsException
+
+# Limits for the content of a single archive
+ZIP_MAX_MEMBERS = 10_000
+ZIP_MAX_SIZE = 512 * 1024 * 1024
+# Archives smaller than this are kept in memory while downloading
+ZIP_SPOOL_SIZE = 8 * 1024 * 1024
+
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+def _member_target(
+    name: str,
+    remote_path: str | None,
+    strip_root: bool,
+) -> str | None:
+    """Return the path of a member relative to the destination, None to skip it."""
+    if strip_root:
+        name = "/".join(name.split("/")[1:])
+    if remote_path:
+        remote_path = remote_path.strip("/")
+        if not name.startswith(f"{remote_path}/"):
+            return None
+        name = name[len(remote_path) :]
+    return name.lstrip("/") or None
+
+
+def extract_zip(
+    fileobj: IO[bytes],
+    destination: str,
+    *,
+    remote_path: str | None = None,
+    strip_root: bool = False,
+    max_members: int = ZIP_MAX_MEMBERS,
+    max_size: int = ZIP_MAX_SIZE,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """Extract a zip archive, must run in the executor.
+
+    With strip_root the top directory of archives created by GitHub is
+    removed, and with remote_path only members in that directory are
+    extracted relative to it. Returns the number of extracted members.
+    """
+    destination = os.path.realpath(destination)
+    with zipfile.ZipFile(fileobj) as archive:
+        members = [
+            (info, target)
+            for info in archive.infolist()
+            if (target := _member_target(info.filename, remote_path, strip_root)) is not None
+        ]
+        if not members:
+            raise HacsException("No content to extract")
+        if len(members) > max_members:
+            raise HacsException(f"The archive has more than {max_members} members")
+        if sum(info.file_size for info, _ in members) > max_size:
+            raise HacsException(f"The content of the archive is larger than {max_size} bytes")
+
+        extracted = 0
+        for index, (info, target) in enumerate(members, 1):
+            path = os.path.realpath(os.path.join(destination, target))
+            if os.path.commonpath((destination, path)) != destination:
+                raise HacsException(f"The archive member {info.filename} is outside the target")
+
+            if info.is_dir():
+                os.makedirs(path, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with archive.open(info) as source, open(path, "wb") as target_file:
+                    written = 0
+                    while chunk := source.read(_COPY_CHUNK_SIZE):
+                        written += len(chunk)
+                        extracted += len(chunk)
+                        if written > info.file_size or extracted > max_size:
+                            # The sizes in the archive headers did not match the content
+                            raise HacsException(
+                                f"The archive member {info.filename} is larger than declared"
+                            )
+                        target_file.write(chunk)
+
+            if progress is not None:
+                progress(index, len(members))
+
+    return len(members)
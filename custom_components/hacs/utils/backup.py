@@ -1,139 +1,182 @@
-"""Backup."""
+"""Staged installs."""
 from __future__ import annotations
 
+import errno
 import os
 import shutil
-import tempfile
-from time import sleep
 from typing import TYPE_CHECKING
 
+from .logger import LOGGER
 from .path import is_safe
 
 if TYPE_CHECKING:
     from ..base import HacsBase
-    from ..repositories.base import HacsRepository
-
-
-DEFAULT_BACKUP_PATH = f"{tempfile.gettempdir()}/hacs_backup/"
-
-
-class Backup:
-    """Backup."""
-
-    def __init__(
-        self,
-        hacs: HacsBase,
-        local_path: str | None = None,
-        backup_path: str = DEFAULT_BACKUP_PATH,
-        repository: HacsRepository | None = None,
-    ) -> None:
-        """initialize."""
-        self.hacs = hacs
-        self.repository = repository
-        self.local_path = local_path or repository.content.path.local
-        self.backup_path = backup_path
-        if repository:
-            self.backup_path = (
-                tempfile.gettempdir()
-                + f"/hacs_persistent_{repository.data.category}/"
-                + repository.data.name
-            )
-        self.backup_path_full = f"{self.backup_path}{self.local_path.split('/')[-1]}"
-
-    def _init_backup_dir(self) -> bool:
-        """Init backup dir."""
-        if not os.path.exists(self.local_path):
-            return False
-        if not is_safe(self.hacs, self.local_path):
-            return False
-        if os.path.exists(self.backup_path):
-            shutil.rmtree(self.backup_path)
-
-            # Wait for the folder to be removed
-            while os.path.exists(self.backup_path):
-                sleep(0.1)
-        os.makedirs(self.backup_path, exist_ok=True)
-        return True
-
-    def create(self) -> None:
-        """Create a backup in /tmp"""
-        if not self._init_backup_dir():
-            return
 
+# Directory in .storage installs are staged in
+STAGING_DIRECTORY = "hacs_staging"
+# Names of the staged content, the previously installed content and the
+# file with the local path, in the directory of a staged install
+STAGING_CONTENT = "content"
+STAGING_PREVIOUS = "previous"
+STAGING_TARGET = "local_path"
+
+
+def link_or_copy(source: str, target: str) -> None:
+    """Hard link a file, and copy it where the filesystem does not support links."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _remove(path: str) -> None:
+    """Remove a file or a directory tree."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _move(source: str, target: str) -> None:
+    """Rename a file or directory, moving it where it is on another filesystem."""
+    try:
+        os.rename(source, target)
+    except OSError as exception:
+        if exception.errno != errno.EXDEV:
+            raise
+        shutil.move(source, target)
+
+
+def staging_directory(config_path: str) -> str:
+    """Return the directory installs are staged in."""
+    return os.path.join(config_path, ".storage", STAGING_DIRECTORY)
+
+
+def recover_staged_installs(config_path: str) -> None:
+    """Remove the leftovers of interrupted installs, must run in the executor.
+
+    Content that was moved aside by an interrupted swap is moved back.
+    """
+    root = staging_directory(config_path)
+    if not os.path.isdir(root):
+        return
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        previous_path = os.path.join(path, STAGING_PREVIOUS)
         try:
-            if os.path.isfile(self.local_path):
-                shutil.copyfile(self.local_path, self.backup_path_full)
-                os.remove(self.local_path)
-            else:
-                shutil.copytree(self.local_path, self.backup_path_full)
-                shutil.rmtree(self.local_path)
-                while os.path.exists(self.local_path):
-                    sleep(0.1)
-            self.hacs.log.debug(
-                "Backup for %s, created in %s",
-                self.local_path,
-                self.backup_path_full,
-            )
-        except (
-            BaseException  # lgtm [py/catch-base-exception] pylint: disable=broad-except
-        ) as exception:
-            self.hacs.log.warning("Could not create backup: %s", exception)
-
-    def restore(self) -> None:
-        """Restore from backup."""
-        if not os.path.exists(self.backup_path_full):
+            with open(os.path.join(path, STAGING_TARGET), encoding="utf-8") as file:
+                local_path = file.read()
+            if os.path.lexists(previous_path) and not os.path.lexists(local_path):
+                _move(previous_path, local_path)
+                LOGGER.warning("Restored %s after an interrupted install", local_path)
+        except OSError as exception:
+            LOGGER.debug("Could not recover %s - %s", path, exception)
+        _remove(path)
+
+
+class StagedInstall:
+    """Install content into a staging directory and swap it in with renames.
+
+    The staging directory and the previously installed content are kept in
+    STAGING_DIRECTORY under .storage, outside of the directories Home
+    Assistant loads content from, so a leftover copy is never loaded. Until
+    the swap the installed content is untouched, so a failed download is
+    rolled back by removing the staging directory. The previous content is
+    kept after the swap until cleanup, so the install can still be rolled
+    back if a later step fails.
+    """
+
+    def __init__(self, hacs: HacsBase, local_path: str) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self.local_path = local_path.rstrip("/")
+        name = os.path.relpath(self.local_path, hacs.core.config_path).replace(os.sep, "_")
+        self.path = os.path.join(staging_directory(hacs.core.config_path), name)
+        self.staging_path = os.path.join(self.path, STAGING_CONTENT)
+        self.previous_path = os.path.join(self.path, STAGING_PREVIOUS)
+
+    @property
+    def can_stage(self) -> bool:
+        """Return True if the local path can be replaced."""
+        return is_safe(self.hacs, self.local_path)
+
+    def prepare(self) -> None:
+        """Create an empty staging directory."""
+        # Leftovers from an interrupted install
+        _remove(self.path)
+        os.makedirs(self.staging_path)
+        with open(os.path.join(self.path, STAGING_TARGET), "w", encoding="utf-8") as file:
+            file.write(self.local_path)
+
+    def preserve(self, relative_path: str) -> None:
+        """Carry a file or directory of the installed content over to the staged content.
+
+        The installed version replaces what was downloaded, and is hard
+        linked so nothing is copied.
+        """
+        source = os.path.join(self.local_path, relative_path)
+        if not os.path.lexists(source):
             return
-
-        if os.path.isfile(self.backup_path_full):
-            if os.path.exists(self.local_path):
-                os.remove(self.local_path)
-            shutil.copyfile(self.backup_path_full, self.local_path)
+        target = os.path.join(self.staging_path, relative_path)
+        _remove(target)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.isdir(source) and not os.path.islink(source):
+            shutil.copytree(source, target, symlinks=True, copy_function=link_or_copy)
         else:
-            if os.path.exists(self.local_path):
-                shutil.rmtree(self.local_path)
-                while os.path.exists(self.local_path):
-                    sleep(0.1)
-            shutil.copytree(self.backup_path_full, self.local_path)
-        self.hacs.log.debug("Restored %s, from backup %s", self.local_path, self.backup_path_full)
+            link_or_copy(source, target)
+        self.hacs.log.debug("Preserved %s", source)
 
-    def cleanup(self) -> None:
-        """Cleanup backup files."""
-        if not os.path.exists(self.backup_path):
+    def preserve_matching(self, suffix: str) -> None:
+        """Carry the top level files with the suffix over to the staged content."""
+        if not os.path.isdir(self.local_path):
             return
-
-        shutil.rmtree(self.backup_path)
-
-        # Wait for the folder to be removed
-        while os.path.exists(self.backup_path):
-            sleep(0.1)
-        self.hacs.log.debug("Backup dir %s cleared", self.backup_path)
-
-
-class BackupNetDaemon(Backup):
-    """BackupNetDaemon."""
-
-    def create(self) -> None:
-        """Create a backup in /tmp"""
-        if not self._init_backup_dir():
+        for filename in os.listdir(self.local_path):
+            if filename.endswith(suffix):
+                self.preserve(filename)
+
+    def preserve_variants(self, suffixes: tuple[str, ...]) -> None:
+        """Carry variants of the staged files, like card.js.gz, over to the staged content.
+
+        The variants of a file are linked when the download did not include
+        them, so variants that still match their file do not have to be
+        written again.
+        """
+        if not os.path.isdir(self.local_path):
             return
-
-        for filename in os.listdir(self.repository.content.path.local):
-            if not filename.endswith(".yaml"):
-                continue
-
-            source_file_name = f"{self.repository.content.path.local}/{filename}"
-            target_file_name = f"{self.backup_path}/{filename}"
-            shutil.copyfile(source_file_name, target_file_name)
-
-    def restore(self) -> None:
-        """Create a backup in /tmp"""
-        if not os.path.exists(self.backup_path):
+        for root, _, filenames in os.walk(self.staging_path):
+            directory = os.path.relpath(root, self.staging_path)
+            for filename in filenames:
+                for suffix in suffixes:
+                    if f"{filename}{suffix}" in filenames:
+                        continue
+                    source = os.path.normpath(
+                        os.path.join(self.local_path, directory, f"{filename}{suffix}")
+                    )
+                    if os.path.isfile(source) and not os.path.islink(source):
+                        link_or_copy(source, os.path.join(root, f"{filename}{suffix}"))
+
+    def swap(self) -> None:
+        """Replace the installed content with the staged content."""
+        if os.path.lexists(self.local_path):
+            _move(self.local_path, self.previous_path)
+        else:
+            os.makedirs(os.path.dirname(self.local_path), exist_ok=True)
+        try:
+            _move(self.staging_path, self.local_path)
+        except OSError:
+            if os.path.lexists(self.previous_path):
+                _move(self.previous_path, self.local_path)
+            raise
+        self.hacs.log.debug("Installed %s from %s", self.local_path, self.staging_path)
+
+    def rollback(self) -> None:
+        """Replace the swapped in content with the previously installed content."""
+        if not os.path.lexists(self.previous_path):
             return
+        _remove(self.local_path)
+        _move(self.previous_path, self.local_path)
+        self.hacs.log.debug("Restored %s", self.local_path)
 
-        for filename in os.listdir(self.backup_path):
-            if not filename.endswith(".yaml"):
-                continue
-
-            source_file_name = f"{self.backup_path}/{filename}"
-            target_file_name = f"{self.repository.content.path.local}/{filename}"
-            shutil.copyfile(source_file_name, target_file_name)
+    def cleanup(self) -> None:
+        """Remove the staged and the previously installed content."""
+        _remove(self.path)
@@ -0,0 +1,212 @@
+"""Content-addressed cache of downloaded repository files."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from functools import partial
+import hashlib
+import os
+import shutil
+from typing import Any, Callable
+
+from .logger import LOGGER
+
+# Total size of the cached files
+DEFAULT_BLOB_CACHE_SIZE = 200 * 1024 * 1024
+# Size of the chunks read when hashing files
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def git_blob_sha(content: bytes) -> str:
+    """Return the git blob SHA of the content."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def git_blob_sha_of_file(file_path: str) -> str:
+    """Return the git blob SHA of the content of a file."""
+    sha = hashlib.sha1(b"blob %d\0" % os.path.getsize(file_path))
+    with open(file_path, "rb") as file:
+        while chunk := file.read(_READ_CHUNK_SIZE):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def blob_cache_key(sha: str | None) -> str | None:
+    """Return the cache key of a git blob."""
+    return f"blob-{sha}" if sha else None
+
+
+def asset_cache_key(asset_id: int | str | None) -> str | None:
+    """Return the cache key of a release asset."""
+    return f"asset-{asset_id}" if asset_id else None
+
+
+def commit_cache_key(full_name: str, commit: str | None, name: str) -> str | None:
+    """Return the cache key of a tree or file at a commit of a repository."""
+    if not commit:
+        return None
+    digest = hashlib.sha256(f"{full_name.lower()}\0{commit}\0{name}".encode()).hexdigest()
+    return f"commit-{digest}"
+
+
+class BlobCache:
+    """Disk-backed cache of file contents with least recently used eviction.
+
+    Entries are keyed by git blob SHA, release asset id or by commit SHA,
+    all of which never change content, so entries are never revalidated.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_BLOB_CACHE_SIZE) -> None:
+        """Initialize."""
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._index: OrderedDict[str, int] | None = None
+        self._load_lock = asyncio.Lock()
+
+    def path(self, key: str) -> str:
+        """Return the path of a cached entry."""
+        return os.path.join(self.directory, key)
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        """Read the cached entries from disk, least recently used first."""
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+        return OrderedDict((key, size) for _, key, size in sorted(entries))
+
+    async def _async_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            async with self._load_lock:
+                if self._index is None:
+                    index = await asyncio.get_running_loop().run_in_executor(None, self._load_index)
+                    self.size = sum(index.values())
+                    self._index = index
+        return self._index
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            with open(self.path(key), "rb") as file:
+                content = file.read()
+            os.utime(self.path(key))
+        except OSError:
+            return None
+        return content
+
+    def _write(self, key: str, source: bytes | str, evict: list[str]) -> None:
+        """Write content, or copy the file at the source path, into the cache."""
+        os.makedirs(self.directory, exist_ok=True)
+        if isinstance(source, bytes):
+            with open(f"{self.path(key)}.tmp", "wb") as file:
+                file.write(source)
+        else:
+            shutil.copyfile(source, f"{self.path(key)}.tmp")
+        os.replace(f"{self.path(key)}.tmp", self.path(key))
+        for evicted in evict:
+            try:
+                os.remove(self.path(evicted))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self, index: OrderedDict[str, int]) -> list[str]:
+        """Drop the least recently used entries until the cache fits."""
+        evict = []
+        while self.size > self.max_size and index:
+            evicted, evicted_size = index.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+            evict.append(evicted)
+        return evict
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Return the cached content."""
+        index = await self._async_index()
+        if key not in index:
+            self.misses += 1
+            return None
+        content = await asyncio.get_running_loop().run_in_executor(None, self._read, key)
+        if content is None:
+            self.size -= index.pop(key, 0)
+            self.misses += 1
+            return None
+        index.move_to_end(key)
+        self.hits += 1
+        return content
+
+    async def async_get_path(self, key: str) -> str | None:
+        """Return the path of the cached content."""
+        index = await self._async_index()
+        if key not in index:
+            self.misses += 1
+            return None
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, os.utime, self.path(key))
+        except OSError:
+            self.size -= index.pop(key, 0)
+            self.misses += 1
+            return None
+        index.move_to_end(key)
+        self.hits += 1
+        return self.path(key)
+
+    async def async_set(self, key: str, content: bytes) -> None:
+        """Store content, evicting the least recently used entries if needed."""
+        await self._async_store(key, content, len(content), partial(git_blob_sha, content))
+
+    async def async_set_from_file(self, key: str, file_path: str) -> None:
+        """Store the content of a file, evicting the least recently used entries if needed."""
+        try:
+            size = await asyncio.get_running_loop().run_in_executor(
+                None, os.path.getsize, file_path
+            )
+        except OSError:
+            return
+        await self._async_store(key, file_path, size, partial(git_blob_sha_of_file, file_path))
+
+    async def _async_store(
+        self,
+        key: str,
+        source: bytes | str,
+        size: int,
+        blob_sha: Callable[[], str],
+    ) -> None:
+        if size > self.max_size:
+            return
+        loop = asyncio.get_running_loop()
+        if key.startswith("blob-") and await loop.run_in_executor(None, blob_sha) != key[5:]:
+            # Not the content the tree described, LFS pointers and similar
+            LOGGER.debug("Content does not match %s, not caching it", key)
+            return
+        index = await self._async_index()
+        if key in index:
+            index.move_to_end(key)
+            return
+        index[key] = size
+        self.size += size
+        evict = self._evict(index)
+        self.stores += 1
+        try:
+            await loop.run_in_executor(None, self._write, key, source, evict)
+        except OSError as exception:
+            LOGGER.debug("Could not write %s to the blob cache - %s", key, exception)
+            self.size -= index.pop(key, 0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache state as a dictionary."""
+        return {
+            "entries": len(self._index or {}),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,96 @@
+"""Precompressed variants of frontend assets."""
+from __future__ import annotations
+
+import asyncio
+from asyncio.subprocess import PIPE, Process
+import json
+import os
+import sys
+
+from .compress_worker import compress_files
+from .logger import LOGGER
+
+# Files served by the frontend that benefit from compression
+COMPRESSIBLE_EXTENSIONS = (".css", ".html", ".js", ".json", ".svg")
+# Compression is CPU bound, leave room for Home Assistant itself
+COMPRESS_MAX_WORKERS = 1
+# The worker runs as a script, without importing Home Assistant or HACS
+COMPRESS_WORKER = os.path.join(os.path.dirname(__file__), "compress_worker.py")
+
+
+def find_compressible_files(directory: str) -> list[str]:
+    """Return the files in a directory that should have compressed variants."""
+    return [
+        os.path.join(root, filename)
+        for root, _, filenames in os.walk(directory)
+        for filename in filenames
+        if filename.endswith(COMPRESSIBLE_EXTENSIONS)
+    ]
+
+
+class AssetCompressor:
+    """Create compressed variants of assets in worker processes.
+
+    Each worker is a fresh interpreter that runs compress_worker as a script,
+    so it does not load Home Assistant.
+    """
+
+    def __init__(self, max_workers: int = COMPRESS_MAX_WORKERS) -> None:
+        """Initialize."""
+        self.max_workers = max_workers
+        self.compressed = 0
+        self.skipped = 0
+        self._processes: set[Process] = set()
+
+    async def _async_run_worker(self, files: list[str]) -> dict:
+        """Compress files in a worker process."""
+        try:
+            # -P keeps the directory of the script, with the HACS utils, off sys.path
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-P", COMPRESS_WORKER, stdin=PIPE, stdout=PIPE, stderr=PIPE
+            )
+        except OSError as exception:
+            # Platforms that can not start processes, fall back to the default executor
+            LOGGER.debug("Could not start a compression worker - %s", exception)
+            return await asyncio.get_running_loop().run_in_executor(None, compress_files, files)
+
+        self._processes.add(process)
+        try:
+            stdout, stderr = await process.communicate(json.dumps(files).encode("utf-8"))
+        finally:
+            self._processes.discard(process)
+        if process.returncode != 0:
+            error = stderr.decode("utf-8", "replace").strip().splitlines()
+            return {"written": {}, "errors": dict.fromkeys(files, error[-1] if error else "")}
+        return json.loads(stdout)
+
+    async def async_compress_directory(self, directory: str) -> int:
+        """Compress the assets in a directory, returns the number of written variants."""
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(None, find_compressible_files, directory)
+        if not files:
+            return 0
+
+        workers = max(1, min(self.max_workers, len(files)))
+        results = await asyncio.gather(
+            *(self._async_run_worker(files[index::workers]) for index in range(workers))
+        )
+
+        written = 0
+        for result in results:
+            for file_path, error in result["errors"].items():
+                LOGGER.warning("Could not compress %s - %s", file_path, error)
+            for variants in result["written"].values():
+                if variants:
+                    written += len(variants)
+                else:
+                    self.skipped += 1
+        self.compressed += written
+        return written
+
+    def shutdown(self) -> None:
+        """Stop the running worker processes."""
+        for process in self._processes:
+            if process.returncode is None:
+                process.kill()
+        self._processes.clear()
@@ -0,0 +1,95 @@
+"""Write precompressed variants of frontend assets.
+
+This module runs as a script in a separate interpreter started by
+AssetCompressor, so it only imports the standard library and brotli,
+never Home Assistant or the rest of HACS.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Callable
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def _gzip_compress(content: bytes) -> bytes:
+    # A fixed mtime keeps the output identical for identical content
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _brotli_compress(content: bytes) -> bytes:
+    return brotli.compress(content, quality=BROTLI_QUALITY)
+
+
+def compressed_variants() -> list[tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    """Return the suffix, compress and decompress functions of each variant."""
+    variants = [(".gz", _gzip_compress, gzip.decompress)]
+    if brotli is not None:
+        variants.append((".br", _brotli_compress, brotli.decompress))
+    return variants
+
+
+def _variant_matches(
+    variant_path: str,
+    decompress: Callable[[bytes], bytes],
+    digest: bytes,
+) -> bool:
+    try:
+        with open(variant_path, "rb") as file:
+            return hashlib.sha256(decompress(file.read())).digest() == digest
+    except Exception:  # pylint: disable=broad-except
+        # Missing, truncated or written by something else
+        return False
+
+
+def compress_file(file_path: str) -> list[str]:
+    """Write the missing and outdated compressed variants of a file.
+
+    Variants that already hold the current content are left untouched.
+    Returns the paths of the written variants.
+    """
+    with open(file_path, "rb") as file:
+        content = file.read()
+    digest = hashlib.sha256(content).digest()
+
+    written = []
+    for suffix, compress, decompress in compressed_variants():
+        variant_path = f"{file_path}{suffix}"
+        if _variant_matches(variant_path, decompress, digest):
+            continue
+        temporary_path = f"{variant_path}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                file.write(compress(content))
+            os.replace(temporary_path, variant_path)
+        finally:
+            if os.path.lexists(temporary_path):
+                os.remove(temporary_path)
+        written.append(variant_path)
+    return written
+
+
+def compress_files(file_paths: list[str]) -> dict[str, Any]:
+    """Compress files, return the written variants and the errors by file."""
+    result: dict[str, Any] = {"written": {}, "errors": {}}
+    for file_path in file_paths:
+        try:
+            result["written"][file_path] = compress_file(file_path)
+        except Exception as exception:  # pylint: disable=broad-except
+            result["errors"][file_path] = str(exception)
+    return result
+
+
+if __name__ == "__main__":
+    # The paths are read as a JSON list from stdin, the result is written to stdout
+    json.dump(compress_files(json.load(sys.stdin)), sys.stdout)
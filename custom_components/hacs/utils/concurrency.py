@@ -0,0 +1,166 @@
+"""Adaptive concurrency limits."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+import time
+from typing import Any
+
+from aiogithubapi import GitHubConnectionException, GitHubRatelimitException
+
+# Added to the limit for each healthy call, so it grows by about one per limit calls
+ADDITIVE_INCREASE = 1.0
+# Multiplied with the limit when a call was throttled or timed out
+MULTIPLICATIVE_DECREASE = 0.5
+# A call slower than this factor of the average latency is not considered healthy
+LATENCY_TOLERANCE = 2.0
+# Weight of the latest call in the average latency
+LATENCY_SMOOTHING = 0.2
+
+_CALL_STATES: ContextVar[tuple[CallState, ...]] = ContextVar("hacs_call_states", default=())
+
+
+class CallState:
+    """State of a single call made within a limiter."""
+
+    __slots__ = ("throttled",)
+
+    def __init__(self) -> None:
+        self.throttled = False
+
+
+def report_throttled() -> None:
+    """Mark the calls of the current task as throttled."""
+    for state in _CALL_STATES.get():
+        state.throttled = True
+
+
+def is_throttle_exception(exception: BaseException) -> bool:
+    """Return True if the exception, or one it was raised from, is a throttle signal."""
+    seen = set()
+    while exception is not None and id(exception) not in seen:
+        seen.add(id(exception))
+        if isinstance(
+            exception, (asyncio.TimeoutError, GitHubConnectionException, GitHubRatelimitException)
+        ):
+            return True
+        if exception.args and isinstance(exception.args[0], BaseException):
+            exception = exception.args[0]
+        else:
+            exception = exception.__cause__ or exception.__context__
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit concurrent calls of an operation with additive increase, multiplicative decrease."""
+
+    def __init__(self, name: str, initial: int, minimum: int = 1, maximum: int = 50) -> None:
+        """Initialize."""
+        self.name = name
+        self.minimum = minimum
+        self.maximum = max(maximum, initial)
+        self.limit = float(initial)
+        self.active = 0
+        self.calls = 0
+        self.throttled = 0
+        self.latency: float | None = None
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self.active < int(self.limit) and not self._waiters:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over before the cancellation
+                self.active -= 1
+                self._wake_waiters()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float, throttled: bool) -> None:
+        """Release a slot and adjust the limit from the outcome of the call."""
+        self.active -= 1
+        self.calls += 1
+        if throttled:
+            self.throttled += 1
+            self.limit = max(self.minimum, self.limit * MULTIPLICATIVE_DECREASE)
+        elif self.latency is None or latency <= self.latency * LATENCY_TOLERANCE:
+            self.limit = min(self.maximum, self.limit + ADDITIVE_INCREASE / self.limit)
+
+        if not throttled:
+            self.latency = (
+                latency
+                if self.latency is None
+                else self.latency + LATENCY_SMOOTHING * (latency - self.latency)
+            )
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiting calls."""
+        while self._waiters and self.active < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    async def run(self, target, *args, **kwargs) -> Any:
+        """Run a coroutine function within the limit."""
+        await self.acquire()
+        state = CallState()
+        token = _CALL_STATES.set((*_CALL_STATES.get(), state))
+        start = time.monotonic()
+        try:
+            return await target(*args, **kwargs)
+        except BaseException as exception:
+            if is_throttle_exception(exception):
+                state.throttled = True
+            raise
+        finally:
+            _CALL_STATES.reset(token)
+            self.release(time.monotonic() - start, state.throttled)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limiter state as a dictionary."""
+        return {
+            "limit": int(self.limit),
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "active": self.active,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "throttled": self.throttled,
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+        }
+
+
+class ConcurrencyController:
+    """Hold the adaptive concurrency limiters per operation."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def limiter(self, name: str, initial: int, maximum: int) -> AdaptiveConcurrencyLimiter:
+        """Return the limiter for an operation, creating it if needed."""
+        if (limiter := self.limiters.get(name)) is None:
+            limiter = self.limiters[name] = AdaptiveConcurrencyLimiter(
+                name, initial=initial, maximum=maximum
+            )
+        return limiter
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the state of all limiters."""
+        return {name: limiter.as_dict() for name, limiter in sorted(self.limiters.items())}
@@ -3,6 +3,7 @@
 import voluptuous as vol
 
 from ..const import LOCALE
+from .store import STORE_CODECS
 
 # Configuration:
 TOKEN = "token"
@@ -18,6 +19,11 @@ COUNTRY = "country"
 DEBUG = "debug"
 RELEASE_LIMIT = "release_limit"
 EXPERIMENTAL = "experimental"
+STORAGE_CODEC = "storage_codec"
+STORAGE_JOURNAL = "storage_journal"
+
+# Encodings of the store files, "json" is the indented JSON Home Assistant writes
+STORAGE_CODECS = ["json", *STORE_CODECS]
 
 # Config group
 PATH_OR_URL = "frontend_repo_path_or_url"
@@ -48,6 +54,8 @@ def hacs_config_option_schema(options: dict = {}) -> dict:
             SIDEPANEL_TITLE: "HACS",
             FRONTEND_REPO: "",
             FRONTEND_REPO_URL: "",
+            STORAGE_CODEC: "json",
+            STORAGE_JOURNAL: False,
         }
     return {
         vol.Optional(SIDEPANEL_TITLE, default=options.get(SIDEPANEL_TITLE)): str,
@@ -58,6 +66,8 @@ def hacs_config_option_schema(options: dict = {}) -> dict:
         vol.Optional(NETDAEMON, default=options.get(NETDAEMON)): bool,
         vol.Optional(DEBUG, default=options.get(DEBUG)): bool,
         vol.Optional(EXPERIMENTAL, default=options.get(EXPERIMENTAL)): bool,
+        vol.Optional(STORAGE_CODEC, default=options.get(STORAGE_CODEC)): vol.In(STORAGE_CODECS),
+        vol.Optional(STORAGE_JOURNAL, default=options.get(STORAGE_JOURNAL)): bool,
         vol.Exclusive(FRONTEND_REPO, PATH_OR_URL): str,
         vol.Exclusive(FRONTEND_REPO_URL, PATH_OR_URL): str,
     }
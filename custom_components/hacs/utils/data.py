@@ -3,19 +3,31 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Callable
 
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import json as json_util
 
 from ..base import HacsBase
 from ..const import HACS_REPOSITORY_ID
 from ..enums import HacsDisabledReason, HacsDispatchEvent
+from ..repositories import REPOSITORY_CLASSES
 from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
+from .journal import (
+    RepositoryJournal,
+    category_snapshot_from_entries,
+    entries_from_category_snapshot,
+)
 from .logger import LOGGER
 from .path import is_safe
-from .store import async_load_from_store, async_save_to_store
+from .store import async_load_from_store, async_save_to_store, get_store_for_key
+
+# Seconds to wait for more changes before a requested write
+STORAGE_WRITE_DELAY = 10
+# Seconds a requested write can be postponed by later requests
+STORAGE_WRITE_MAX_DELAY = 60
 
 EXPORTED_BASE_DATA = (
     ("new", False),
@@ -42,6 +54,7 @@ EXPORTED_DOWNLOADED_REPOSITORY_DATA = EXPORTED_REPOSITORY_DATA + (
     ("default_branch", None),
     ("first_install", False),
     ("installed_commit", None),
+    ("installed_files", {}),
     ("installed", False),
     ("last_commit", None),
     ("last_version", None),
@@ -57,58 +70,322 @@ EXPORTED_DOWNLOADED_REPOSITORY_DATA = EXPORTED_REPOSITORY_DATA + (
 class HacsData:
     """HacsData class."""
 
-    def __init__(self, hacs: HacsBase):
-        """Initialize."""
+    def __init__(
+        self,
+        hacs: HacsBase,
+        write_delay: float = STORAGE_WRITE_DELAY,
+        write_max_delay: float = STORAGE_WRITE_MAX_DELAY,
+        journal: bool = False,
+        lazy_restore: bool = True,
+    ):
+        """Initialize.
+
+        With journal, repository changes are appended to a journal next to
+        the store files instead of rewriting them, see RepositoryJournal.
+        With lazy_restore, repositories that are not downloaded are restored
+        as their stored data and created when they are first used.
+        """
         self.logger = LOGGER
         self.hacs = hacs
         self.content = {}
+        self.write_delay = write_delay
+        self.write_max_delay = write_max_delay
+        self.write_requests = 0
+        self.writes = 0
+        self._write_requested_at: float | None = None
+        self._cancel_scheduled_write: CALLBACK_TYPE | None = None
+        self.journal = journal
+        self.lazy_restore = lazy_restore
+        self._journals: dict[str, RepositoryJournal] = {}
+        self._experimental_content: dict[str, dict[str, dict[str, Any]]] = {}
+        # What the content was built from when it was last written
+        self._written_hacs: dict[str, Any] | None = None
+        self._written_revision: int | None = None
+        self._written_state: tuple[str, frozenset[str], bool] | None = None
 
     async def async_force_write(self, _=None):
         """Force write."""
         await self.async_write(force=True)
+        for journal in self._journals.values():
+            await journal.async_wait_compaction()
+
+    @callback
+    def async_schedule_write(self) -> None:
+        """Request a write, coalesced with the requests that follow within the delay.
+
+        Every request postpones the write by the delay, but never further
+        than the max delay after the first pending request.
+        """
+        self.write_requests += 1
+        now = self.hacs.hass.loop.time()
+        if self._write_requested_at is None:
+            self._write_requested_at = now
+        if self._cancel_scheduled_write is not None:
+            self._cancel_scheduled_write()
+        self._cancel_scheduled_write = async_call_later(
+            self.hacs.hass,
+            max(0, min(self.write_delay, self._write_requested_at + self.write_max_delay - now)),
+            self._async_scheduled_write,
+        )
+
+    async def _async_scheduled_write(self, _=None) -> None:
+        """Run a requested write."""
+        self._cancel_scheduled_write = None
+        await self.async_write()
+
+    @callback
+    def _async_cancel_scheduled_write(self) -> None:
+        """Cancel the pending write, the caller writes the data now."""
+        if self._cancel_scheduled_write is not None:
+            self._cancel_scheduled_write()
+            self._cancel_scheduled_write = None
+        self._write_requested_at = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the write counters as a dictionary."""
+        data = {
+            "write_requests": self.write_requests,
+            "writes": self.writes,
+            "pending": self._write_requested_at is not None,
+        }
+        if self.journal:
+            data["journal"] = {
+                key: {
+                    "size": journal.size,
+                    "appends": journal.appends,
+                    "compactions": journal.compactions,
+                }
+                for key, journal in self._journals.items()
+            }
+        return data
 
     async def async_write(self, force: bool = False) -> None:
-        """Write content to the store files."""
+        """Write content to the store files.
+
+        Only the repositories that changed since the last write are
+        serialized again, and nothing is written when nothing changed.
+        This also runs a pending requested write.
+        """
+        self._async_cancel_scheduled_write()
         if not force and self.hacs.system.disabled:
             return
 
         self.logger.debug("<HacsData async_write> Saving data")
 
         # Hacs
-        await async_save_to_store(
-            self.hacs.hass,
-            "hacs",
-            {
-                "archived_repositories": self.hacs.common.archived_repositories,
-                "renamed_repositories": self.hacs.common.renamed_repositories,
-                "ignored_repositories": self.hacs.common.ignored_repositories,
-            },
-        )
+        hacs_data = {
+            "archived_repositories": set(self.hacs.common.archived_repositories),
+            "renamed_repositories": dict(self.hacs.common.renamed_repositories),
+            "ignored_repositories": set(self.hacs.common.ignored_repositories),
+        }
+        if self._written_hacs is None:
+            await async_save_to_store(self.hacs.hass, "hacs", hacs_data)
+        elif hacs_data != self._written_hacs:
+            await get_store_for_key(self.hacs.hass, "hacs").async_save(hacs_data)
+            self.writes += 1
+        self._written_hacs = hacs_data
+
+        revision = self.hacs.repositories.revision
+        if (changed := self._async_update_content()) is not None and not changed:
+            self.logger.debug("<HacsData async_write> Repositories did not change")
+            self._written_revision = revision
+            return
+
         if self.hacs.configuration.experimental:
-            await self._async_store_experimental_content_and_repos()
-        await self._async_store_content_and_repos()
+            await self._async_store_experimental_content_and_repos(changed)
+        await self._async_store_content_and_repos(changed)
+        self._written_revision = revision
+        self.writes += 1
 
-    async def _async_store_content_and_repos(self, _=None):  # bb: ignore
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
+    @callback
+    def _async_update_content(self) -> set[str] | None:
+        """Update the content of the changed repositories.
+
+        Returns the IDs of the changed repositories, or None when all
+        content was rebuilt.
+        """
+        repositories = self.hacs.repositories
+        state = (
+            repositories.epoch,
+            frozenset(self.hacs.common.categories),
+            bool(self.hacs.configuration.experimental),
+        )
+        if self._written_revision is None or state != self._written_state:
+            self.content = {}
+            self._experimental_content = {}
+            for repository_id, data in repositories.unhydrated.items():
+                self._async_store_unhydrated_data(repository_id, data)
+            changed, removed = repositories.list_hydrated, []
+            changed_ids = None
+        else:
+            changed, removed = repositories.changes_since(self._written_revision)
+            changed_ids = {str(repository.data.id) for repository in changed} | set(removed)
+            if not changed_ids:
+                return changed_ids
+            previous = {
+                repository_id: self._async_get_repository_data(repository_id)
+                for repository_id in changed_ids
+            }
+        self._written_state = state
+
+        for repository in changed:
+            repository_id = str(repository.data.id)
+            self._async_remove_repository_data(repository_id)
+            if (
+                repositories.is_registered(repository_id=repository_id)
+                and repository.data.category in self.hacs.common.categories
+            ):
                 self.async_store_repository_data(repository)
+                if self.hacs.configuration.experimental:
+                    self.async_store_experimental_repository_data(repository)
+        for repository_id in removed:
+            self._async_remove_repository_data(repository_id)
+        if changed_ids is None:
+            return None
+        # Created repositories and changes that were reverted store the same data
+        return {
+            repository_id
+            for repository_id in changed_ids
+            if self._async_get_repository_data(repository_id) != previous[repository_id]
+        }
+
+    @callback
+    def _async_get_repository_data(self, repository_id: str) -> tuple[dict | None, dict | None]:
+        """Return the stored and the experimental stored data of a repository."""
+        experimental = None
+        for entries in self._experimental_content.values():
+            if (experimental := entries.get(repository_id)) is not None:
+                break
+        return self.content.get(repository_id), experimental
+
+    @callback
+    def _async_store_unhydrated_data(self, repository_id: str, data: dict[str, Any]) -> None:
+        """Store the data of a repository that is not created yet, it is stored as is."""
+        if data["category"] not in self.hacs.common.categories:
+            return
+        self.content[repository_id] = data
+        if self.hacs.configuration.experimental:
+            self._experimental_content.setdefault(data["category"], {})[repository_id] = {
+                "id": repository_id,
+                **{
+                    key: value
+                    for key, default in EXPORTED_BASE_DATA
+                    if (value := data.get(key, default)) != default
+                },
+            }
 
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
+    @callback
+    def _async_remove_repository_data(self, repository_id: str) -> None:
+        """Remove the stored data of a repository."""
+        self.content.pop(repository_id, None)
+        for entries in self._experimental_content.values():
+            entries.pop(repository_id, None)
+
+    async def _async_store_content_and_repos(self, changed: set[str] | None = None):  # bb: ignore
+        """Store the main repos file."""
+        if self.journal:
+            await self._async_save_to_journal("repositories", lambda: self.content, changed)
+        elif not await self._async_remove_journal("repositories", lambda: self.content):
+            await self._async_save(
+                "repositories", self.content, compare=self._written_revision is None
+            )
         for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
             self.hacs.async_dispatch(event, {})
 
-    async def _async_store_experimental_content_and_repos(self, _=None):  # bb: ignore
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_experimental_repository_data(repository)
+    async def _async_store_experimental_content_and_repos(
+        self, changed: set[str] | None = None
+    ):  # bb: ignore
+        """Store the experimental repos file."""
+        if self.journal:
+            await self._async_save_to_journal("data", self._experimental_entries, changed)
+            return
+        if await self._async_remove_journal("data", self._experimental_entries):
+            return
+        await self._async_save(
+            "data",
+            {
+                "repositories": {
+                    category: list(entries.values())
+                    for category, entries in self._experimental_content.items()
+                }
+            },
+            compare=self._written_revision is None,
+        )
 
-        await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
+    async def _async_save(self, key: str, data: dict[str, Any], compare: bool) -> None:
+        """Save data, comparing it with the file on disk only for the first write."""
+        if compare:
+            await async_save_to_store(self.hacs.hass, key, data)
+        else:
+            await get_store_for_key(self.hacs.hass, key).async_save(data)
+
+    def _get_journal(self, key: str) -> RepositoryJournal:
+        """Return the journal of a store key."""
+        if key in self._journals:
+            return self._journals[key]
+        if key == "data":
+            # The experimental store file groups the repositories by category
+            journal = RepositoryJournal(
+                self.hacs.hass,
+                key,
+                from_snapshot=entries_from_category_snapshot,
+                to_snapshot=category_snapshot_from_entries,
+            )
+        else:
+            journal = RepositoryJournal(self.hacs.hass, key)
+        self._journals[key] = journal
+        return journal
+
+    @callback
+    def _experimental_entries(self) -> dict[str, dict[str, Any]]:
+        """Return the experimental content by repository ID."""
+        return {
+            repository_id: {"category": category, **entry}
+            for category, entries in self._experimental_content.items()
+            for repository_id, entry in entries.items()
+        }
+
+    def _find_journals(self) -> bool:
+        """Return True if journals were written while the journal was enabled.
+
+        Only the journals that exist are kept, the first write saves their
+        entries to the snapshot and removes them. Must run in the executor.
+        """
+        for key in ("data", "repositories"):
+            if not self._get_journal(key).exists():
+                del self._journals[key]
+        return bool(self._journals)
+
+    async def _async_remove_journal(
+        self,
+        key: str,
+        get_entries: Callable[[], dict[str, dict[str, Any]]],
+    ) -> bool:
+        """Save the entries of a journal that is no longer enabled to the snapshot.
+
+        Returns False if there is no such journal.
+        """
+        if (journal := self._journals.pop(key, None)) is None:
+            return False
+        await journal.async_save(dict(get_entries()))
+        return True
+
+    async def _async_save_to_journal(
+        self,
+        key: str,
+        get_entries: Callable[[], dict[str, dict[str, Any]]],
+        changed: set[str] | None,
+    ) -> None:
+        """Append the changed entries to the journal, or compact it when all content changed."""
+        journal = self._get_journal(key)
+        if changed is None:
+            await journal.async_save(dict(get_entries()), compare=self._written_revision is None)
+            return
+        entries = get_entries()
+        await journal.async_append(
+            {repository_id: entries.get(repository_id) for repository_id in changed}
+        )
+        journal.async_compact_if_needed(lambda: dict(get_entries()))
 
     @callback
     def async_store_repository_data(self, repository: HacsRepository) -> dict:
@@ -134,7 +411,6 @@ class HacsData:
     def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
         """Store the experimental repository data for non downloaded repositories."""
         data = {}
-        self.content.setdefault(repository.data.category, [])
 
         if repository.data.installed:
             data["repository_manifest"] = repository.repository_manifest.manifest
@@ -151,7 +427,9 @@ class HacsData:
                 if (value := getattr(repository.data, key, default)) != default:
                     data[key] = value
 
-        self.content[repository.data.category].append({"id": str(repository.data.id), **data})
+        self._experimental_content.setdefault(repository.data.category, {})[
+            str(repository.data.id)
+        ] = {"id": str(repository.data.id), **data}
 
     async def restore(self):
         """Restore saved data."""
@@ -165,21 +443,22 @@ class HacsData:
             pass
 
         try:
-            data = (
-                await async_load_from_store(
-                    self.hacs.hass,
-                    "data" if self.hacs.configuration.experimental else "repositories",
-                )
-                or {}
-            )
-            if data and self.hacs.configuration.experimental:
-                for category, entries in data.get("repositories", {}).items():
-                    for repository in entries:
-                        repositories[repository["id"]] = {"category": category, **repository}
+            if self.journal or await self.hacs.hass.async_add_executor_job(self._find_journals):
+                repositories = await self._async_load_from_journal()
             else:
-                repositories = (
-                    data or await async_load_from_store(self.hacs.hass, "repositories") or {}
+                data = (
+                    await async_load_from_store(
+                        self.hacs.hass,
+                        "data" if self.hacs.configuration.experimental else "repositories",
+                    )
+                    or {}
                 )
+                if data and self.hacs.configuration.experimental:
+                    repositories = entries_from_category_snapshot(data)
+                else:
+                    repositories = (
+                        data or await async_load_from_store(self.hacs.hass, "repositories") or {}
+                    )
         except HomeAssistantError as exception:
             self.hacs.log.error(
                 "Could not read %s, restore the file from a backup - %s",
@@ -229,6 +508,10 @@ class HacsData:
                 self.hacs.common.ignored_repositories.add(entry)
 
         try:
+            if self.lazy_restore:
+                self.hacs.repositories.hydrator = self._async_hydrate_repository
+                repositories = self._async_add_unhydrated_repositories(repositories)
+
             await self.register_unknown_repositories(repositories)
 
             for entry, repo_data in repositories.items():
@@ -250,6 +533,93 @@ class HacsData:
             return False
         return True
 
+    async def _async_load_from_journal(self) -> dict[str, dict[str, Any]]:
+        """Load the repositories from the journal and its snapshot."""
+        if self.hacs.configuration.experimental and (
+            repositories := await self._get_journal("data").async_load()
+        ):
+            return repositories
+        return await self._get_journal("repositories").async_load()
+
+    @callback
+    def _async_add_unhydrated_repositories(
+        self, repositories: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Add the repositories that are not downloaded as stored data.
+
+        Returns the repositories that need to be restored now.
+        """
+        restore_now = {}
+        for entry, repository_data in repositories.items():
+            if (
+                entry in ("0", HACS_REPOSITORY_ID)
+                or repository_data.get("installed")
+                or repository_data.get("category") not in REPOSITORY_CLASSES
+                or repository_data["full_name"] in self.hacs.common.renamed_repositories
+                or self.hacs.repositories.is_registered(repository_id=entry)
+            ):
+                restore_now[entry] = repository_data
+                continue
+            self.hacs.repositories.add_unhydrated(
+                entry, self._async_unhydrated_data(repository_data)
+            )
+        return restore_now
+
+    @callback
+    def _async_unhydrated_data(self, repository_data: dict[str, Any]) -> dict[str, Any]:
+        """Return stored data as async_store_repository_data stores it after restoring it."""
+        restored = {
+            **repository_data,
+            "hide": False,
+            "stargazers_count": repository_data.get("stargazers_count")
+            or repository_data.get("stars", 0),
+            "topics": [
+                topic for topic in repository_data.get("topics", []) if topic not in TOPIC_FILTER
+            ],
+        }
+        data = {
+            "repository_manifest": HacsManifest.from_dict(
+                repository_data.get("manifest") or repository_data.get("repository_manifest") or {}
+            ).manifest
+        }
+        for key, default in EXPORTED_REPOSITORY_DATA:
+            if (value := restored.get(key, default)) != default:
+                data[key] = value
+        if version_installed := repository_data.get("version_installed"):
+            data["version_installed"] = version_installed
+        if last_fetched := repository_data.get("last_fetched"):
+            data["last_fetched"] = float(last_fetched)
+        return data
+
+    @callback
+    def _async_hydrate_repository(
+        self, repository_id: str, repository_data: dict[str, Any]
+    ) -> HacsRepository:
+        """Create, register and restore the repository of stored data."""
+        repository = REPOSITORY_CLASSES[repository_data["category"]](
+            self.hacs, repository_data["full_name"]
+        )
+        repository.data.id = repository_id
+        self.hacs.repositories.register(repository)
+        self.async_restore_repository(repository_id, repository_data)
+        return repository
+
+    @callback
+    def async_unregistered_repository(
+        self, repository_id: str, repository_data: dict[str, Any]
+    ) -> HacsRepository:
+        """Return a repository restored from stored data, without registering it.
+
+        Used to read the stored data of a repository that is not created yet
+        the way the created repository would present it.
+        """
+        repository = REPOSITORY_CLASSES[repository_data["category"]](
+            self.hacs, repository_data["full_name"]
+        )
+        repository.data.id = repository_id
+        self._async_restore_repository_data(repository, repository_id, repository_data)
+        return repository
+
     async def register_unknown_repositories(self, repositories, category: str | None = None):
         """Registry any unknown repositories."""
         register_tasks = [
@@ -278,8 +648,14 @@ class HacsData:
         if not repository:
             return
 
-        # Restore repository attributes
         self.hacs.repositories.set_repository_id(repository, entry)
+        self._async_restore_repository_data(repository, entry, repository_data)
+
+    @callback
+    def _async_restore_repository_data(
+        self, repository: HacsRepository, entry: str, repository_data: dict[str, Any]
+    ) -> None:
+        """Restore the attributes of a repository from stored data."""
         repository.data.authors = repository_data.get("authors", [])
         repository.data.description = repository_data.get("description", "")
         repository.data.downloads = repository_data.get("downloads", 0)
@@ -305,6 +681,7 @@ class HacsData:
         repository.data.last_commit = repository_data.get("last_commit")
         repository.data.installed_version = repository_data.get("version_installed")
         repository.data.installed_commit = repository_data.get("installed_commit")
+        repository.data.installed_files = repository_data.get("installed_files", {})
         repository.data.manifest_name = repository_data.get("manifest_name")
 
         if last_fetched := repository_data.get("last_fetched"):
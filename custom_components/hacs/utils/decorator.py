@@ -1,40 +1,37 @@
 """HACS Decorators."""
 from __future__ import annotations
 
-import asyncio
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Coroutine
 
-from ..const import DEFAULT_CONCURRENT_BACKOFF_TIME, DEFAULT_CONCURRENT_TASKS
+from ..const import DEFAULT_CONCURRENT_MAX_TASKS, DEFAULT_CONCURRENT_TASKS
+from .concurrency import ConcurrencyController
 
 if TYPE_CHECKING:
     from ..base import HacsBase
 
+# Used when the decorated function is not called on an object with access to HACS
+_DEFAULT_CONTROLLER = ConcurrencyController()
+
 
 def concurrent(
     concurrenttasks: int = DEFAULT_CONCURRENT_TASKS,
-    backoff_time: int = DEFAULT_CONCURRENT_BACKOFF_TIME,
+    maxtasks: int = DEFAULT_CONCURRENT_MAX_TASKS,
 ) -> Coroutine[Any, Any, None]:
-    """Return a modified function."""
+    """Return a modified function.
 
-    max_concurrent = asyncio.Semaphore(concurrenttasks)
+    Calls share an adaptive limit per function name, starting at concurrenttasks.
+    """
 
     def inner_function(function) -> Coroutine[Any, Any, None]:
         @wraps(function)
         async def wrapper(*args, **kwargs) -> None:
-            hacs: HacsBase = getattr(args[0], "hacs", None)
-
-            async with max_concurrent:
-                result = await function(*args, **kwargs)
-                if (
-                    hacs is None
-                    or hacs.queue is None
-                    or hacs.queue.has_pending_tasks
-                    or "update" not in function.__name__
-                ):
-                    await asyncio.sleep(backoff_time)
-
-                return result
+            hacs: HacsBase = getattr(args[0], "hacs", args[0])
+            controller: ConcurrencyController = (
+                getattr(hacs, "concurrency", None) or _DEFAULT_CONTROLLER
+            )
+            limiter = controller.limiter(function.__name__, concurrenttasks, maxtasks)
+            return await limiter.run(function, *args, **kwargs)
 
         return wrapper
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from .tree import RepositoryTree
+
 
 def filter_content_return_one_of_type(
     content: list[str | Any],
@@ -11,6 +13,8 @@ def filter_content_return_one_of_type(
     attr: str = "name",
 ) -> list[str]:
     """Only match 1 of the filter."""
+    if isinstance(content, RepositoryTree) and attr == "full_path":
+        content = content.with_prefix(namestartswith)
     contents = []
     filetypefound = False
     for filename in content:
@@ -37,6 +41,8 @@ def filter_content_return_one_of_type(
 
 def get_first_directory_in_directory(content: list[str | Any], dirname: str) -> str | None:
     """Return the first directory in dirname or None."""
+    if isinstance(content, RepositoryTree):
+        content = content.with_prefix(dirname)
     directory = None
     for path in content:
         if path.full_path.startswith(dirname) and path.full_path != dirname:
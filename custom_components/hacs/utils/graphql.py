@@ -0,0 +1,217 @@
+"""Batched repository metadata from the GitHub GraphQL API."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from typing import TYPE_CHECKING, Any
+
+from aiogithubapi import GitHubException, GitHubGraphQLException
+from aiogithubapi.models.release import GitHubReleaseModel
+
+from .logger import LOGGER
+
+if TYPE_CHECKING:
+    from aiogithubapi import GitHubAPI
+
+# Number of repositories requested in a single query
+GRAPHQL_BATCH_SIZE = 25
+
+REPOSITORY_METADATA_QUERY = """
+  databaseId
+  nameWithOwner
+  description
+  isArchived
+  hasIssuesEnabled
+  stargazerCount
+  pushedAt
+  issues(states: OPEN) { totalCount }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  defaultBranchRef { name target { ... on Commit { oid %(files)s } } }
+  latestRelease { tagName tagCommit { oid %(files)s } }
+  releases(first: $releases, orderBy: {field: CREATED_AT, direction: DESC}) {
+    nodes {
+      tagName
+      name
+      isDraft
+      isPrerelease
+      publishedAt
+      releaseAssets(first: 5) { nodes { databaseId name downloadCount downloadUrl } }
+    }
+  }
+"""
+
+
+@dataclass
+class RepositoryMetadataFiles:
+    """Contents of the files HACS reads from a commit."""
+
+    commit: str | None = None
+    hacs_json: str | None = None
+    manifest_json: str | None = None
+
+
+@dataclass
+class RepositoryMetadata:
+    """Metadata of a repository returned by a batched query."""
+
+    attributes: dict[str, Any]
+    last_commit: str | None = None
+    latest_release: str | None = None
+    releases: list[GitHubReleaseModel] = field(default_factory=list)
+    default_branch_files: RepositoryMetadataFiles = field(default_factory=RepositoryMetadataFiles)
+    latest_release_files: RepositoryMetadataFiles = field(default_factory=RepositoryMetadataFiles)
+
+    @property
+    def full_name(self) -> str:
+        """Return the full name of the repository."""
+        return self.attributes["full_name"]
+
+    def files_for_ref(self, ref: str | None) -> RepositoryMetadataFiles | None:
+        """Return the files for a ref, None if they were not part of the query."""
+        if ref is None:
+            return None
+        ref = ref.replace("tags/", "")
+        if ref == self.attributes.get("default_branch"):
+            return self.default_branch_files
+        if ref == self.latest_release:
+            return self.latest_release_files
+        return None
+
+
+def _file_selection(alias: str, path: str) -> str:
+    """Return the selection of the text of a file."""
+    return f"{alias}: file(path: {json.dumps(path)}) {{ object {{ ... on Blob {{ text }} }} }}"
+
+
+def build_repository_metadata_query(repositories: list[tuple[str, str | None]]) -> str:
+    """Build a query for a batch of (full_name, manifest_path) entries."""
+    selections = []
+    for index, (full_name, manifest_path) in enumerate(repositories):
+        owner, name = full_name.split("/", 1)
+        files = [_file_selection("hacsJson", "hacs.json")]
+        if manifest_path is not None:
+            files.append(_file_selection("manifestJson", manifest_path))
+        selections.append(
+            f"  repository{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)})"
+            " {" + REPOSITORY_METADATA_QUERY % {"files": " ".join(files)} + "  }"
+        )
+    return "query ($releases: Int!) {\n" + "\n".join(selections) + "\n}\n"
+
+
+def _blob_text(commit: dict[str, Any] | None, key: str) -> str | None:
+    """Return the text of a file selected on a commit."""
+    if not commit or not (entry := commit.get(key)):
+        return None
+    return (entry.get("object") or {}).get("text")
+
+
+def _files(commit: dict[str, Any] | None) -> RepositoryMetadataFiles:
+    """Return the files selected on a commit."""
+    return RepositoryMetadataFiles(
+        commit=(commit or {}).get("oid"),
+        hacs_json=_blob_text(commit, "hacsJson"),
+        manifest_json=_blob_text(commit, "manifestJson"),
+    )
+
+
+def parse_repository_metadata(node: dict[str, Any]) -> RepositoryMetadata:
+    """Parse the result for a single repository."""
+    default_branch = node.get("defaultBranchRef") or {}
+    head = default_branch.get("target") or {}
+    latest_release = node.get("latestRelease") or {}
+
+    return RepositoryMetadata(
+        attributes={
+            "id": node["databaseId"],
+            "full_name": node["nameWithOwner"],
+            "description": node.get("description") or "",
+            "archived": node.get("isArchived", False),
+            "has_issues": node.get("hasIssuesEnabled", True),
+            "stargazers_count": node.get("stargazerCount", 0),
+            "pushed_at": node.get("pushedAt"),
+            "open_issues": (node.get("issues") or {}).get("totalCount", 0),
+            "topics": [
+                entry["topic"]["name"]
+                for entry in (node.get("repositoryTopics") or {}).get("nodes", [])
+            ],
+            "default_branch": default_branch.get("name"),
+        },
+        last_commit=head["oid"][:7] if head.get("oid") else None,
+        latest_release=latest_release.get("tagName"),
+        releases=[
+            GitHubReleaseModel(
+                {
+                    "tag_name": release["tagName"],
+                    "name": release.get("name"),
+                    "draft": release.get("isDraft", False),
+                    "prerelease": release.get("isPrerelease", False),
+                    "published_at": release.get("publishedAt"),
+                    "assets": [
+                        {
+                            "id": asset.get("databaseId"),
+                            "name": asset.get("name"),
+                            "download_count": asset.get("downloadCount", 0),
+                            "browser_download_url": asset.get("downloadUrl"),
+                        }
+                        for asset in (release.get("releaseAssets") or {}).get("nodes", [])
+                    ],
+                }
+            )
+            for release in (node.get("releases") or {}).get("nodes", [])
+        ],
+        default_branch_files=_files(head),
+        latest_release_files=_files(latest_release.get("tagCommit")),
+    )
+
+
+async def _async_fetch_batch(
+    githubapi: GitHubAPI,
+    repositories: list[tuple[str, str | None]],
+    releases: int,
+    result: dict[str, RepositoryMetadata | None],
+) -> None:
+    """Fetch a batch, splitting it when part of it can not be resolved."""
+    try:
+        response = await githubapi.graphql(
+            query=build_repository_metadata_query(repositories),
+            variables={"releases": releases},
+        )
+    except GitHubGraphQLException as exception:
+        # One or more repositories in the batch could not be resolved
+        if len(repositories) == 1:
+            LOGGER.debug("<GraphQL> %s %s", repositories[0][0], exception)
+            result[repositories[0][0].lower()] = None
+            return
+        middle = len(repositories) // 2
+        await _async_fetch_batch(githubapi, repositories[:middle], releases, result)
+        await _async_fetch_batch(githubapi, repositories[middle:], releases, result)
+        return
+
+    data = response.data.get("data") or {}
+    for index, (full_name, _) in enumerate(repositories):
+        node = data.get(f"repository{index}")
+        result[full_name.lower()] = parse_repository_metadata(node) if node else None
+
+
+async def async_fetch_repository_metadata(
+    githubapi: GitHubAPI,
+    repositories: list[tuple[str, str | None]],
+    *,
+    releases: int = 10,
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+) -> dict[str, RepositoryMetadata | None]:
+    """Fetch metadata for (full_name, manifest_path) entries in batched queries.
+
+    The result is keyed by the lowercase full name, repositories that could not
+    be fetched are set to None so the caller can fall back to the REST API.
+    """
+    result: dict[str, RepositoryMetadata | None] = {}
+    for start in range(0, len(repositories), batch_size):
+        batch = repositories[start : start + batch_size]
+        try:
+            await _async_fetch_batch(githubapi, batch, releases, result)
+        except GitHubException as exception:
+            LOGGER.warning("<GraphQL> Could not fetch repository metadata - %s", exception)
+            for full_name, _ in batch:
+                result.setdefault(full_name.lower(), None)
+    return result
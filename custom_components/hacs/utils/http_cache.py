@@ -0,0 +1,342 @@
+"""Persistent cache for conditional HTTP requests."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any, Mapping
+
+from aiohttp import StreamReader
+from aiohttp.base_protocol import BaseProtocol
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from .logger import LOGGER
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession
+
+# Environment variable used to set (or override) the cache directory
+HTTP_CACHE_DIR_ENV = "HACS_HTTP_CACHE_DIR"
+# Total size of the cached bodies
+DEFAULT_HTTP_CACHE_SIZE = 50 * 1024 * 1024
+# Responses larger than this are not cached
+DEFAULT_HTTP_CACHE_ENTRY_SIZE = 5 * 1024 * 1024
+
+# Request headers that change the content of the response
+_KEY_HEADERS = ("Accept", "Authorization")
+# Size of the chunks the content stream of a cached body is read in
+_STREAM_LIMIT = 2**16
+# Response headers kept with the cached body
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+def http_cache_directory(default: str | None = None) -> str | None:
+    """Return the cache directory, the environment variable takes precedence."""
+    return os.getenv(HTTP_CACHE_DIR_ENV) or default
+
+
+@dataclass
+class HttpCacheEntry:
+    """A cached response."""
+
+    url: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def etag(self) -> str | None:
+        """Return the ETag of the response."""
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Return the Last-Modified header of the response."""
+        return self.headers.get("Last-Modified")
+
+
+class HttpCache:
+    """Disk-backed cache of HTTP responses with least recently used eviction."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = DEFAULT_HTTP_CACHE_SIZE,
+        max_entry_size: int = DEFAULT_HTTP_CACHE_ENTRY_SIZE,
+    ) -> None:
+        """Initialize."""
+        self.directory = directory
+        self.max_size = max_size
+        self.max_entry_size = max_entry_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._index: OrderedDict[str, int] | None = None
+        self._load_lock = asyncio.Lock()
+
+    @staticmethod
+    def key(method: str, url: str, params: Any, headers: dict[str, str] | None) -> str:
+        """Return the cache key for a request."""
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        raw = json.dumps(
+            [
+                method.upper(),
+                str(url),
+                sorted((str(k), str(v)) for k, v in dict(params or {}).items()),
+                [headers.get(name.lower()) for name in _KEY_HEADERS],
+            ]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        """Read the cached entries from disk, least recently used first."""
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".body"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        return OrderedDict((key, size) for _, key, size in sorted(entries))
+
+    async def _async_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            async with self._load_lock:
+                if self._index is None:
+                    index = await asyncio.get_running_loop().run_in_executor(None, self._load_index)
+                    self.size = sum(index.values())
+                    self._index = index
+        return self._index
+
+    def _read(self, key: str) -> HttpCacheEntry | None:
+        try:
+            with open(self._path(key, "json"), encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(self._path(key, "body"), "rb") as file:
+                body = file.read()
+            os.utime(self._path(key, "body"))
+        except (OSError, ValueError):
+            return None
+        return HttpCacheEntry(url=meta["url"], headers=meta["headers"], body=body)
+
+    def _write(self, key: str, entry: HttpCacheEntry, evict: list[str]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        for path, content in (
+            (self._path(key, "body"), entry.body),
+            (
+                self._path(key, "json"),
+                json.dumps({"url": entry.url, "headers": entry.headers}).encode("utf-8"),
+            ),
+        ):
+            with open(f"{path}.tmp", "wb") as file:
+                file.write(content)
+            os.replace(f"{path}.tmp", path)
+        for evicted in evict:
+            self._remove(evicted)
+
+    def _remove(self, key: str) -> None:
+        for suffix in ("body", "json"):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    async def async_get(self, key: str) -> HttpCacheEntry | None:
+        """Return a cached entry."""
+        index = await self._async_index()
+        if key not in index:
+            return None
+        entry = await asyncio.get_running_loop().run_in_executor(None, self._read, key)
+        if entry is None:
+            self.size -= index.pop(key, 0)
+            return None
+        index.move_to_end(key)
+        return entry
+
+    async def async_set(self, key: str, entry: HttpCacheEntry) -> None:
+        """Store an entry, evicting the least recently used entries if needed."""
+        size = len(entry.body)
+        if size > self.max_entry_size or size > self.max_size:
+            return
+        index = await self._async_index()
+        self.size += size - index.pop(key, 0)
+        index[key] = size
+        evict = []
+        while self.size > self.max_size:
+            evicted, evicted_size = index.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+            evict.append(evicted)
+        self.stores += 1
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, key, entry, evict)
+        except OSError as exception:
+            LOGGER.debug("Could not write HTTP cache entry for %s - %s", entry.url, exception)
+            self.size -= index.pop(key, 0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache state as a dictionary."""
+        return {
+            "entries": len(self._index or {}),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+
+class CachedResponse:
+    """Response with a body the cache already has, that can be read again.
+
+    Served after the server returned 304, and for responses the cache read
+    to store them. The content stream is filled from the body, so streaming
+    readers get the same bytes as read().
+    """
+
+    def __init__(
+        self,
+        response: ClientResponse,
+        body: bytes,
+        headers: Mapping[str, str],
+        status: int = 200,
+    ) -> None:
+        """Initialize."""
+        self._response = response
+        self._body = body
+        self._content: StreamReader | None = None
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.status = status
+
+    @classmethod
+    def from_entry(cls, response: ClientResponse, entry: HttpCacheEntry) -> CachedResponse:
+        """Return the cached response of a 304 response."""
+        headers = CIMultiDict(entry.headers)
+        for name, value in response.headers.items():
+            if name.lower() not in ("content-length", "content-type"):
+                headers[name] = value
+        return cls(response, entry.body, headers)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    async def __aenter__(self) -> CachedResponse:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.release()
+
+    @property
+    def content(self) -> StreamReader:
+        """Return a stream of the body."""
+        if self._content is None:
+            loop = asyncio.get_running_loop()
+            self._content = StreamReader(BaseProtocol(loop), _STREAM_LIMIT, loop=loop)
+            self._content.feed_data(self._body, len(self._body))
+            self._content.feed_eof()
+        return self._content
+
+    def release(self) -> None:
+        """Release the connection of the response, the body stays readable."""
+        self._response.release()
+
+    @property
+    def ok(self) -> bool:
+        """Return True, cached responses are always successful."""
+        return True
+
+    def raise_for_status(self) -> None:
+        """Cached responses are always successful."""
+
+    async def read(self, **_) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def text(self, encoding: str | None = None, **_) -> str:
+        """Return the body as text."""
+        return self._body.decode(encoding or "utf-8")
+
+    async def json(self, **_) -> Any:
+        """Return the body as JSON."""
+        return json.loads(self._body)
+
+
+class HttpCacheSession:
+    """Client session wrapper that revalidates cached GET responses.
+
+    Requests that already carry their own validators are passed through,
+    those are handled by the caller.
+    """
+
+    def __init__(self, session: ClientSession, cache: HttpCache) -> None:
+        """Initialize."""
+        self._session = session
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    @property
+    def uncached(self) -> ClientSession:
+        """Return the wrapped session, for requests that must not be read by the cache."""
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs) -> ClientResponse:
+        """Make a request, conditionally if the response is cached."""
+        headers = dict(kwargs.get("headers") or {})
+        if method.upper() != "GET" or any(
+            name.lower() in ("if-none-match", "if-modified-since") for name in headers
+        ):
+            return await self._session.request(method, url, **kwargs)
+
+        key = self.cache.key(method, url, kwargs.get("params"), headers)
+        if (entry := await self.cache.async_get(key)) is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            kwargs["headers"] = headers
+
+        response = await self._session.request(method, url, **kwargs)
+
+        if response.status == 304 and entry is not None:
+            self.cache.hits += 1
+            return CachedResponse.from_entry(response, entry)
+        self.cache.misses += 1
+
+        if response.status == 200 and (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            if int(response.headers.get("Content-Length") or 0) > self.cache.max_entry_size:
+                return response
+            if isinstance(body := await response.read(), bytes):
+                response = CachedResponse(response, body, response.headers, response.status)
+                await self.cache.async_set(
+                    key,
+                    HttpCacheEntry(
+                        url=str(url),
+                        headers={
+                            name: response.headers[name]
+                            for name in _STORED_HEADERS
+                            if name in response.headers
+                        },
+                        body=body,
+                    ),
+                )
+        return response
+
+    async def get(self, url: str, **kwargs) -> ClientResponse:
+        """Make a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> ClientResponse:
+        """Make a POST request."""
+        return await self.request("POST", url, **kwargs)
@@ -0,0 +1,184 @@
+"""Journal backed storage of repository data."""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .json import json_dumps, json_loads
+from .logger import LOGGER
+from .store import get_store_for_key
+
+# Size of the journal in bytes before it is merged into the snapshot
+JOURNAL_COMPACT_SIZE = 512 * 1024
+JOURNAL_SUFFIX = ".journal"
+
+Entries = dict[str, dict[str, Any]]
+
+
+def _same(entries: Entries) -> Entries:
+    return entries
+
+
+def entries_from_category_snapshot(snapshot: dict[str, Any]) -> Entries:
+    """Return the entries of a snapshot that groups them by category."""
+    return {
+        entry["id"]: {"category": category, **entry}
+        for category, category_entries in snapshot.get("repositories", {}).items()
+        for entry in category_entries
+    }
+
+
+def category_snapshot_from_entries(entries: Entries) -> dict[str, Any]:
+    """Return a snapshot that groups the entries by category."""
+    snapshot: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries.values():
+        snapshot.setdefault(entry["category"], []).append(
+            {key: value for key, value in entry.items() if key != "category"}
+        )
+    return {"repositories": snapshot}
+
+
+class RepositoryJournal:
+    """A store file used as snapshot, with an append-only journal of entry changes.
+
+    Each line of the journal is a JSON object with the ID of an entry and
+    its data, or no data when the entry was removed. Loading replays the
+    journal on top of the snapshot, and compacting writes the entries to
+    the snapshot and removes the journal. As the snapshot is a regular
+    store file, existing files are loaded as a snapshot with no journal.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        compact_size: int = JOURNAL_COMPACT_SIZE,
+        from_snapshot: Callable[[dict[str, Any]], Entries] = _same,
+        to_snapshot: Callable[[Entries], dict[str, Any]] = _same,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.key = key
+        self.compact_size = compact_size
+        self.store = get_store_for_key(hass, key)
+        self.path = f"{self.store.path}{JOURNAL_SUFFIX}"
+        self.size = 0
+        self.appends = 0
+        self.compactions = 0
+        self._from_snapshot = from_snapshot
+        self._to_snapshot = to_snapshot
+        self._lock = asyncio.Lock()
+        self._compact_task: asyncio.Task | None = None
+
+    def _load(self) -> Entries:
+        """Load the snapshot and replay the journal, must run in the executor.
+
+        Raises HomeAssistantError when the snapshot can not be read.
+        """
+        entries = self._from_snapshot(self.store.load_or_raise() or {})
+        self.size = 0
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path, "rb") as journal:
+            for line in journal:
+                try:
+                    change = json_loads(line)
+                except ValueError:
+                    # An append that was interrupted, nothing after it was written
+                    LOGGER.warning("Ignoring the incomplete end of %s", self.path)
+                    break
+                self.size += len(line)
+                if change.get("data") is None:
+                    entries.pop(change["id"], None)
+                else:
+                    entries[change["id"]] = change["data"]
+        return entries
+
+    def _append(self, changes: dict[str, dict[str, Any] | None]) -> None:
+        """Append changes to the journal, must run in the executor."""
+        content = "".join(
+            f"{json_dumps({'id': entry_id, 'data': data})}\n" for entry_id, data in changes.items()
+        ).encode()
+        with open(self.path, "ab") as journal:
+            if journal.tell() != self.size:
+                # Drop the incomplete end of an interrupted append
+                journal.truncate(self.size)
+            journal.write(content)
+            journal.flush()
+            os.fsync(journal.fileno())
+        self.size += len(content)
+
+    def exists(self) -> bool:
+        """Return True if there is a journal, must run in the executor."""
+        return os.path.isfile(self.path)
+
+    def _remove_journal(self) -> None:
+        """Remove the journal, must run in the executor."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.size = 0
+
+    async def async_load(self) -> Entries:
+        """Return the entries of the snapshot with the journal replayed."""
+        async with self._lock:
+            return await self.hass.async_add_executor_job(self._load)
+
+    async def async_append(self, changes: dict[str, dict[str, Any] | None]) -> None:
+        """Append the changed entries, None removes an entry."""
+        if not changes:
+            return
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._append, changes)
+            self.appends += 1
+
+    async def async_save(self, entries: Entries, compare: bool = False) -> None:
+        """Write all entries to the snapshot and remove the journal.
+
+        With compare, nothing is written if the stored entries are the same.
+        """
+        async with self._lock:
+            if (
+                compare
+                and await self.hass.async_add_executor_job(self._load) == entries
+                and not self.store.needs_rewrite()
+            ):
+                LOGGER.debug(
+                    "<RepositoryJournal> Did not store %s. Content did not change", self.key
+                )
+                return
+            await self._async_compact(entries)
+
+    async def _async_compact(self, entries: Entries) -> None:
+        """Write the snapshot and remove the journal, the lock must be held."""
+        await self.store.async_save(self._to_snapshot(entries))
+        await self.hass.async_add_executor_job(self._remove_journal)
+        self.compactions += 1
+
+    @callback
+    def async_compact_if_needed(self, get_entries: Callable[[], Entries]) -> None:
+        """Compact in the background once the journal passed the compact size.
+
+        The entries are read when the compaction starts, so changes that are
+        appended while it waits for the lock are part of the snapshot.
+        """
+        if self.size < self.compact_size or (
+            self._compact_task is not None and not self._compact_task.done()
+        ):
+            return
+
+        async def _async_compact() -> None:
+            async with self._lock:
+                await self._async_compact(get_entries())
+
+        self._compact_task = self.hass.async_create_background_task(
+            _async_compact(), f"hacs_compact_{self.key}"
+        )
+
+    async def async_wait_compaction(self) -> None:
+        """Wait for a running compaction."""
+        if self._compact_task is not None:
+            await asyncio.shield(self._compact_task)
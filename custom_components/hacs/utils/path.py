@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from functools import lru_cache
+import hashlib
+import os
 from pathlib import Path
+import tempfile
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -41,3 +44,13 @@ def is_safe(hacs: HacsBase, path: str | Path) -> bool:
         configuration.python_script_path,
         configuration.theme_path,
     )
+
+
+def cache_directory(config_path: str, name: str) -> str:
+    """Return a directory for a cache of HACS.
+
+    The caches can be regenerated, so they are kept in the temporary
+    directory instead of .storage, which is included in every backup.
+    """
+    digest = hashlib.sha1(config_path.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f"hacs-{digest[:10]}", name)
@@ -2,29 +2,69 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import heapq
+import itertools
 import time
-from typing import Coroutine
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from ..exceptions import HacsExecutionStillInProgress
+from ..enums import HacsQueuePriority
+from ..exceptions import HacsException, HacsExecutionStillInProgress
 from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+DEFAULT_QUEUE_WORKERS = 15
+
+
+class QueueTask:
+    """A task waiting in the queue."""
+
+    __slots__ = ("factory", "key", "priority", "sequence", "cancelled")
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable],
+        key: Hashable,
+        priority: HacsQueuePriority,
+        sequence: int,
+    ) -> None:
+        self.factory = factory
+        self.key = key
+        self.priority = priority
+        self.sequence = sequence
+        self.cancelled = False
+
+    def __lt__(self, other: QueueTask) -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
 
 class QueueManager:
-    """The QueueManager class."""
+    """The QueueManager class.
+
+    Tasks are stored as factories and only turned into coroutines when a worker
+    picks them up. Tasks with the same key are coalesced while they are pending,
+    keeping the highest priority that was requested.
+
+    Tasks a user waits for are run with async_run, they are started right
+    away, ahead of the queued tasks.
+    """
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, workers: int = DEFAULT_QUEUE_WORKERS) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.workers = workers
         self.running = False
+        self._heap: list[QueueTask] = []
+        self._pending: dict[Hashable, QueueTask] = {}
+        self._waiting: dict[Hashable, asyncio.Future] = {}
+        self._sequence = itertools.count()
 
     @property
     def pending_tasks(self) -> int:
         """Return a count of pending tasks in the queue."""
-        return len(self.queue)
+        return len(self._pending)
 
     @property
     def has_pending_tasks(self) -> bool:
@@ -33,49 +73,140 @@ class QueueManager:
 
     def clear(self) -> None:
         """Clear the queue."""
-        self.queue = []
-
-    def add(self, task: Coroutine) -> None:
-        """Add a task to the queue."""
-        self.queue.append(task)
-
-    async def execute(self, number_of_tasks: int | None = None) -> None:
-        """Execute the tasks in the queue."""
+        self._heap = []
+        self._pending = {}
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(HacsException("The queue was cleared"))
+        self._waiting = {}
+
+    def add(
+        self,
+        task: Callable[[], Awaitable],
+        *,
+        key: Hashable | None = None,
+        priority: HacsQueuePriority = HacsQueuePriority.BACKGROUND,
+    ) -> bool:
+        """Add a task factory to the queue, return False if it was coalesced.
+
+        If a task with the same key is already pending, the new task is dropped
+        and the pending task is moved up if the new priority is higher.
+        """
+        sequence = next(self._sequence)
+        if key is None:
+            key = ("task", sequence)
+        elif (pending := self._pending.get(key)) is not None:
+            if priority < pending.priority:
+                pending.cancelled = True
+                entry = QueueTask(pending.factory, key, priority, sequence)
+                self._pending[key] = entry
+                heapq.heappush(self._heap, entry)
+            return False
+
+        entry = QueueTask(task, key, priority, sequence)
+        self._pending[key] = entry
+        heapq.heappush(self._heap, entry)
+        return True
+
+    async def async_run(
+        self,
+        task: Callable[[], Awaitable],
+        *,
+        key: Hashable,
+        priority: HacsQueuePriority = HacsQueuePriority.USER,
+    ) -> Any:
+        """Run a task ahead of the queued tasks, and return its result.
+
+        The task replaces a pending task with the same key. Calls for a key
+        that is already pending or running with async_run share its result.
+        """
+        if (future := self._waiting.get(key)) is not None:
+            return await asyncio.shield(future)
+
+        future = self._waiting[key] = self.hass.loop.create_future()
+        if (pending := self._pending.pop(key, None)) is not None:
+            pending.cancelled = True
+
+        async def _run() -> None:
+            try:
+                result = await task()
+            except Exception as exception:  # pylint: disable=broad-except
+                if not future.done():
+                    future.set_exception(exception)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                if self._waiting.get(key) is future:
+                    del self._waiting[key]
+
+        self.add(_run, key=key, priority=priority)
+        # Start it now, instead of waiting for a worker to be free
+        self.hass.async_create_task(self._async_execute_priority(priority))
+        return await asyncio.shield(future)
+
+    async def _async_execute_priority(self, priority: HacsQueuePriority) -> None:
+        """Execute the pending tasks with at least the priority."""
+        while (entry := self._pop(priority)) is not None:
+            try:
+                await entry.factory()
+            except Exception as exception:  # pylint: disable=broad-except
+                _LOGGER.error("<QueueManager> %s", exception)
+
+    def _pop(self, priority: HacsQueuePriority | None = None) -> QueueTask | None:
+        """Return the next pending task, if it has at least the priority."""
+        while self._heap:
+            entry = self._heap[0]
+            if not entry.cancelled and priority is not None and entry.priority > priority:
+                return None
+            heapq.heappop(self._heap)
+            if not entry.cancelled:
+                del self._pending[entry.key]
+                return entry
+        return None
+
+    async def execute(self, number_of_tasks: int | None = None) -> int:
+        """Execute the tasks in the queue, return the number of tasks executed.
+
+        Workers keep picking up tasks, including tasks added while executing,
+        until the queue is empty or number_of_tasks tasks have been started.
+        Without number_of_tasks, or with 0, all tasks are executed.
+        """
+        number_of_tasks = number_of_tasks or None
         if self.running:
             _LOGGER.debug("<QueueManager> Execution is already running")
             raise HacsExecutionStillInProgress
-        if len(self.queue) == 0:
+        if not self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> The queue is empty")
-            return
+            return 0
 
         self.running = True
-
-        _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
-
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
-
-        for task in local_queue:
-            self.queue.remove(task)
-
-        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
+        started = 0
+
+        async def _worker() -> None:
+            nonlocal started
+            while number_of_tasks is None or started < number_of_tasks:
+                if (entry := self._pop()) is None:
+                    return
+                started += 1
+                try:
+                    await entry.factory()
+                except Exception as exception:  # pylint: disable=broad-except
+                    _LOGGER.error("<QueueManager> %s", exception)
+
+        workers = min(self.workers, number_of_tasks or self.pending_tasks, self.pending_tasks)
+        _LOGGER.debug("<QueueManager> Starting queue execution with %s workers", workers)
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
-        for entry in result:
-            if isinstance(entry, Exception):
-                _LOGGER.error("<QueueManager> %s", entry)
-        end = time.time() - start
+        try:
+            await asyncio.gather(*(_worker() for _ in range(workers)))
+        finally:
+            self.running = False
 
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
-            len(local_queue),
-            end,
+            started,
+            time.time() - start,
         )
         if self.has_pending_tasks:
-            _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
+            _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", self.pending_tasks)
+        return started
@@ -0,0 +1,188 @@
+"""GitHub API rate limit budget."""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .concurrency import report_throttled
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession
+
+# Calls kept in reserve for user initiated actions, capped to a fifth of the limit
+RATE_LIMIT_RESERVE = 1000
+# Used before any queued task has been measured
+DEFAULT_CALLS_PER_TASK = 10
+# Pause used for secondary limits that do not include a Retry-After header
+DEFAULT_RETRY_AFTER = 60
+# Weight of the latest measurement in the calls per task average
+CALLS_PER_TASK_SMOOTHING = 0.3
+# Length of a GitHub rate limit window, used when the window has passed
+RATE_LIMIT_WINDOW = 3600
+# Seconds of the paced budget released ahead, matches the rate limit check interval
+RATE_LIMIT_PACE = 300
+
+
+class GitHubRateLimitBudget:
+    """Track the GitHub API budget from the headers of the API responses.
+
+    The calls above the reserve are released evenly over the time left
+    until the reset, so queued tasks do not spend a window at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset: int | None = None
+        self.retry_after_until: float | None = None
+        self.calls = 0
+        self.calls_per_task: float = DEFAULT_CALLS_PER_TASK
+        self._window: tuple[int, float, int] | None = None
+
+    @property
+    def known(self) -> bool:
+        """Return True if the budget has been populated from a response."""
+        return self.remaining is not None
+
+    @property
+    def reserve(self) -> int:
+        """Return the number of calls kept in reserve."""
+        return min(RATE_LIMIT_RESERVE, (self.limit or 0) // 5)
+
+    def update_from_response(self, headers: Mapping[str, str], status: int | None) -> None:
+        """Update the budget from the headers of a response."""
+        if headers.get("X-RateLimit-Resource", "core") != "core":
+            # GraphQL and search requests are counted against their own limits
+            return
+        self.calls += 1
+        if (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+            try:
+                self.remaining = int(remaining)
+                self.limit = int(headers.get("X-RateLimit-Limit", self.limit or 0))
+                self.reset = int(headers.get("X-RateLimit-Reset", self.reset or 0))
+            except ValueError:
+                pass
+            else:
+                if self._window is None or self._window[0] != self.reset:
+                    # A new window, pace what can be spent of it from now on
+                    self._window = (self.reset, time.time(), self.remaining - self.reserve)
+
+        if status in (403, 429) and (retry_after := headers.get("Retry-After")) is not None:
+            try:
+                self.pause(int(retry_after))
+            except ValueError:
+                self.pause()
+
+    def pause(self, seconds: int | None = None) -> None:
+        """Pause usage of the budget, used for secondary rate limits."""
+        self.retry_after_until = time.time() + (
+            seconds if seconds is not None else DEFAULT_RETRY_AFTER
+        )
+
+    def _pacing(self, now: float) -> tuple[int, float, float, int]:
+        """Return the spendable calls, the reset, the window start and the spendable at start."""
+        if self.reset is None or self.reset <= now or self._window is None:
+            # The window has passed since the last response, the budget has been restored
+            spendable = max((self.limit or self.remaining) - self.reserve, 0)
+            return spendable, now + RATE_LIMIT_WINDOW, now, spendable
+        _, start, start_spendable = self._window
+        return max(self.remaining - self.reserve, 0), self.reset, start, max(start_spendable, 0)
+
+    def available_calls(self) -> int:
+        """Return the number of calls that can be used now without touching the reserve."""
+        now = time.time()
+        if self.retry_after_until is not None:
+            if now < self.retry_after_until:
+                return 0
+            self.retry_after_until = None
+        if not self.known:
+            return 0
+        spendable, reset, start, start_spendable = self._pacing(now)
+        held = start_spendable * max(reset - now - RATE_LIMIT_PACE, 0) / max(reset - start, 1)
+        return max(math.floor(spendable - held), 0)
+
+    def available_tasks(self) -> int:
+        """Return the number of queued tasks that can be executed."""
+        return math.floor(self.available_calls() / max(self.calls_per_task, 1))
+
+    def paused_until(self) -> float | None:
+        """Return the timestamp when calls can be made again, or None if not paused."""
+        if self.available_calls() > 0:
+            return None
+        if self.retry_after_until is not None:
+            return self.retry_after_until
+        if not self.known:
+            return self.reset
+        spendable, reset, start, start_spendable = self._pacing(time.time())
+        if spendable <= 0 or start_spendable <= 0:
+            return self.reset
+        # The paced budget releases the next call before the reset
+        return reset - RATE_LIMIT_PACE - (spendable - 1) * (reset - start) / start_spendable
+
+    def record_tasks(self, tasks: int, calls: int) -> None:
+        """Update the average number of calls used by a queued task."""
+        if tasks <= 0:
+            return
+        self.calls_per_task += CALLS_PER_TASK_SMOOTHING * (calls / tasks - self.calls_per_task)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the budget as a dictionary."""
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset": self.reset,
+            "reserve": self.reserve,
+            "available_calls": self.available_calls(),
+            "retry_after_until": self.retry_after_until,
+            "calls": self.calls,
+            "calls_per_task": round(self.calls_per_task, 2),
+        }
+
+
+class GitHubRateLimitSession:
+    """Client session wrapper that feeds a budget from GitHub responses.
+
+    Both the legacy GitHub client and GitHubAPI are given this wrapper,
+    so every response they receive updates the same budget.
+    """
+
+    def __init__(self, session: ClientSession, budget: GitHubRateLimitBudget) -> None:
+        """Initialize."""
+        self._session = session
+        self.budget = budget
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def request(self, method: str, url: str, **kwargs) -> ClientResponse:
+        """Make a request and update the budget from the response."""
+        try:
+            response = await self._session.request(method, url, **kwargs)
+        except asyncio.TimeoutError:
+            report_throttled()
+            raise
+        self.budget.update_from_response(response.headers, response.status)
+        if (
+            response.status == 429
+            or response.status >= 500
+            or (
+                response.status == 403
+                and (
+                    "Retry-After" in response.headers
+                    or response.headers.get("X-RateLimit-Remaining") == "0"
+                )
+            )
+        ):
+            report_throttled()
+        return response
+
+    async def get(self, url: str, **kwargs) -> ClientResponse:
+        """Make a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> ClientResponse:
+        """Make a POST request."""
+        return await self.request("POST", url, **kwargs)
@@ -0,0 +1,150 @@
+"""Shared fetching and caching of small repository files."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import time
+from typing import TYPE_CHECKING, Any
+
+from .decode import decode_content
+
+if TYPE_CHECKING:
+    from ..repositories.base import HacsRepository
+
+# Number of files kept in memory
+FILE_CACHE_SIZE = 500
+# Seconds the content of a file at a branch is reused
+BRANCH_FILE_TTL = 60
+
+
+class RepositoryFiles:
+    """Fetch small files like hacs.json, manifest.json and the readme of repositories.
+
+    Files are cached per repository, ref and path, a file that could not be
+    fetched is tried again the next time it is needed. Content at a commit or a
+    published tag does not change and is kept until it is evicted, content
+    at a branch is reused for BRANCH_FILE_TTL seconds. Concurrent requests
+    for the same file share a single download.
+
+    Files are downloaded from the raw CDN, which does not count against the
+    rate limit, at the commit the ref was resolved to when it is known. The
+    tree of the repository answers for files that do not exist, and the
+    contents API is only used when the CDN fails for a file the tree has.
+    Files at a resolved commit are also kept in the blob cache of HACS, so
+    they survive a restart.
+    """
+
+    def __init__(self, max_size: int = FILE_CACHE_SIZE) -> None:
+        """Initialize."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.raw_downloads = 0
+        self.api_downloads = 0
+        self._cache: OrderedDict[tuple[str, str, str], tuple[str, float | None]] = OrderedDict()
+        self._in_flight: dict[tuple[str, str, str], asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._cache)
+
+    async def async_get(self, repository: HacsRepository, path: str, ref: str) -> str | None:
+        """Return the content of a file of the repository at a ref, None if it does not exist."""
+        ref = ref.replace("tags/", "")
+        commit = repository.commit_for_ref(ref)
+        immutable = commit is not None or ref in (repository.data.published_tags or ())
+        key = (repository.data.full_name.lower(), commit or ref, path)
+
+        if (cached := self._cache.get(key)) is not None:
+            content, expires = cached
+            if expires is None or expires > time.monotonic():
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return content
+            del self._cache[key]
+
+        if (task := self._in_flight.get(key)) is None:
+            self.misses += 1
+            task = self._in_flight[key] = asyncio.create_task(
+                self._async_fetch(repository, path, ref, commit)
+            )
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        content = await asyncio.shield(task)
+
+        if content is not None:
+            self._cache[key] = (
+                content,
+                None if immutable else time.monotonic() + BRANCH_FILE_TTL,
+            )
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return content
+
+    async def _async_fetch(
+        self,
+        repository: HacsRepository,
+        path: str,
+        ref: str,
+        commit: str | None,
+    ) -> str | None:
+        if (content := await repository.async_get_cached_file(path, ref)) is not None:
+            return content
+
+        tree = repository.tree
+        known = tree.ref is not None and tree.ref.replace("tags/", "") == ref and tree.covers(path)
+        if known and path not in tree:
+            return None
+
+        content = await self._async_download_raw(repository, path, ref, commit)
+        if content is None and known:
+            content = await self._async_download_api(repository, path, ref)
+        if content is not None:
+            await repository.async_set_cached_file(path, ref, content)
+        return content
+
+    async def _async_download_raw(
+        self,
+        repository: HacsRepository,
+        path: str,
+        ref: str,
+        commit: str | None,
+    ) -> str | None:
+        # Files at a resolved commit are kept in the blob cache, not the HTTP cache
+        result = await repository.hacs.async_download_file(
+            f"https://raw.githubusercontent.com/{repository.data.full_name}/{commit or ref}/{path}",
+            nolog=True,
+            http_cache=commit is None,
+        )
+        if result is None:
+            return None
+        self.raw_downloads += 1
+        return result.decode(encoding="utf-8")
+
+    async def _async_download_api(
+        self,
+        repository: HacsRepository,
+        path: str,
+        ref: str,
+    ) -> str | None:
+        response = await repository.hacs.async_github_api_method(
+            method=repository.hacs.githubapi.repos.contents.get,
+            raise_exception=False,
+            repository=repository.data.full_name,
+            path=path,
+            **{"params": {"ref": ref}},
+        )
+        if not response:
+            return None
+        self.api_downloads += 1
+        return decode_content(response.data.content)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache state as a dictionary."""
+        return {
+            "entries": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "raw_downloads": self.raw_downloads,
+            "api_downloads": self.api_downloads,
+        }
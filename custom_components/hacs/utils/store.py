@@ -1,22 +1,104 @@
 """Storage handers."""
-from homeassistant.helpers.json import JSONEncoder
+from __future__ import annotations
+
+import os
+from typing import Any
+import zlib
+
+from atomicwrites import AtomicWriter
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.helpers.storage import Store
-from homeassistant.util import json as json_util
 
-from ..const import VERSION_STORAGE
+from ..const import DOMAIN, VERSION_STORAGE, VERSION_STORAGE_COMPRESSED
 from ..exceptions import HacsException
+from .json import json_loads
 from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+# Compressed store files start with this, JSON files can not
+COMPRESSED_HEADER = b"HACSZ\x01"
+# Versions of the store files that can be loaded
+STORAGE_VERSIONS = (VERSION_STORAGE, VERSION_STORAGE_COMPRESSED)
+
+
+class StoreCodec:
+    """Encoding of the HACS store files.
+
+    Files are written as JSON without indentation, and optionally
+    compressed. The encoding is detected when a file is loaded, so every
+    codec loads the files written with any other codec or by Home Assistant.
+    Compressed files are written with VERSION_STORAGE_COMPRESSED, and are
+    written again as JSON when another codec is selected.
+    """
+
+    def __init__(self, name: str, compress: bool = False, level: int = 1) -> None:
+        """Initialize."""
+        self.name = name
+        self.compress = compress
+        self.level = level
+        self.version = VERSION_STORAGE_COMPRESSED if compress else VERSION_STORAGE
+
+    def encode(self, data: Any) -> bytes:
+        """Return the content of a store file."""
+        content = json_bytes(data)
+        if self.compress:
+            return COMPRESSED_HEADER + zlib.compress(content, self.level)
+        return content
+
+
+# Codecs that can be selected with the storage_codec configuration option,
+# the default "json" is the indented JSON Home Assistant writes.
+STORE_CODECS = {
+    codec.name: codec for codec in (StoreCodec("compact"), StoreCodec("compressed", compress=True))
+}
+
+
+def decode_store_file(content: bytes) -> Any:
+    """Return the data of a store file written with any codec."""
+    if content.startswith(COMPRESSED_HEADER):
+        content = zlib.decompress(content[len(COMPRESSED_HEADER) :])
+    return json_loads(content)
+
+
+def write_store_file(path: str, content: bytes) -> None:
+    """Write a store file atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with AtomicWriter(path, mode="wb", overwrite=True).open() as file:
+        os.fchmod(file.fileno(), 0o644)
+        file.write(content)
+
+
+def load_store_file(path: str) -> Any:
+    """Load a store file, returns an empty dict if there is no file."""
+    try:
+        with open(path, "rb") as file:
+            return decode_store_file(file.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, zlib.error) as exception:
+        raise HomeAssistantError(exception) from exception
+
 
 class HACSStore(Store):
     """A subclass of Store that allows multiple loads in the executor."""
 
+    def __init__(self, *args, codec: StoreCodec | None = None, **kwargs) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.codec = codec
+        self.stored_version: str | None = None
+
+    @property
+    def write_version(self) -> str:
+        """Return the version the file is written with."""
+        return self.version if self.codec is None else self.codec.version
+
     def load(self):
         """Load the data from disk if version matches."""
         try:
-            data = json_util.load_json(self.path)
+            return self.load_or_raise()
         except (
             BaseException  # lgtm [py/catch-base-exception] pylint: disable=broad-except
         ) as exception:
@@ -26,19 +108,61 @@ class HACSStore(Store):
                 exception,
             )
             raise HacsException(exception) from exception
-        if data == {} or data["version"] != self.version:
+
+    def load_or_raise(self):
+        """Load the data from disk if version matches, raises HomeAssistantError."""
+        data = load_store_file(self.path)
+        if data == {} or data["version"] not in STORAGE_VERSIONS:
             return None
+        self.stored_version = data["version"]
         return data["data"]
 
+    async def async_save(self, data: Any) -> None:
+        """Save the data, with the codec if one is configured."""
+        if self.codec is None:
+            await super().async_save(data)
+            return
+        _LOGGER.debug("Writing data for %s to %s with %s", self.key, self.path, self.codec.name)
+        await self.hass.async_add_executor_job(
+            write_store_file,
+            self.path,
+            self.codec.encode(
+                {
+                    "version": self.codec.version,
+                    "minor_version": self.minor_version,
+                    "key": self.key,
+                    "data": data,
+                }
+            ),
+        )
+
+    def needs_rewrite(self) -> bool:
+        """Return True if the loaded file was written with another version."""
+        return self.stored_version not in (None, self.write_version)
+
 
 def get_store_key(key):
     """Return the key to use with homeassistant.helpers.storage.Storage."""
     return key if "/" in key else f"hacs.{key}"
 
 
+def get_store_codec(hass, key) -> StoreCodec | None:
+    """Return the configured codec for a store key, None for Home Assistant JSON."""
+    if "/" in key or (hacs := hass.data.get(DOMAIN)) is None:
+        return None
+    return STORE_CODECS.get(hacs.configuration.storage_codec)
+
+
 def _get_store_for_key(hass, key, encoder):
     """Create a Store object for the key."""
-    return HACSStore(hass, VERSION_STORAGE, get_store_key(key), encoder=encoder, atomic_writes=True)
+    return HACSStore(
+        hass,
+        VERSION_STORAGE,
+        get_store_key(key),
+        encoder=encoder,
+        atomic_writes=True,
+        codec=get_store_codec(hass, key),
+    )
 
 
 def get_store_for_key(hass, key):
@@ -48,7 +172,7 @@ def get_store_for_key(hass, key):
 
 async def async_load_from_store(hass, key):
     """Load the retained data from store and return de-serialized data."""
-    return await get_store_for_key(hass, key).async_load() or {}
+    return await hass.async_add_executor_job(get_store_for_key(hass, key).load_or_raise) or {}
 
 
 async def async_save_to_store(hass, key, data):
@@ -61,9 +185,10 @@ async def async_save_to_store(hass, key, data):
 
     If the data has not changed this will generate one executor job
     """
-    current = await async_load_from_store(hass, key)
-    if current is None or current != data:
-        await get_store_for_key(hass, key).async_save(data)
+    store = get_store_for_key(hass, key)
+    current = await hass.async_add_executor_job(store.load_or_raise)
+    if current is None or current != data or store.needs_rewrite():
+        await store.async_save(data)
         return
     _LOGGER.debug(
         "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
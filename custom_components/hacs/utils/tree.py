@@ -0,0 +1,245 @@
+"""Compact index of the files in a repository tree."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from ..repositories.base import HacsRepository
+
+# Number of repositories that keep their tree after they were last used
+TREE_CACHE_SIZE = 100
+
+
+def _prefix_end(prefix: str) -> str:
+    """Return the first string after all strings that start with prefix."""
+    return f"{prefix[:-1]}{chr(ord(prefix[-1]) + 1)}"
+
+
+class TreeEntry:
+    """A file or directory in a repository tree."""
+
+    __slots__ = ("full_path", "is_directory", "ref", "repository", "sha")
+
+    def __init__(
+        self,
+        full_path: str,
+        is_directory: bool,
+        sha: str | None,
+        repository: str | None,
+        ref: str | None,
+    ) -> None:
+        """Initialize."""
+        self.full_path = full_path
+        self.is_directory = is_directory
+        self.sha = sha
+        self.repository = repository
+        self.ref = ref
+
+    @property
+    def filename(self) -> str:
+        """Return the name of the file or directory."""
+        return self.full_path.rpartition("/")[2]
+
+    @property
+    def path(self) -> str:
+        """Return the directory of the file or directory."""
+        return self.full_path.rpartition("/")[0]
+
+    @property
+    def download_url(self) -> str:
+        """Return the URL of the raw content."""
+        return f"https://raw.githubusercontent.com/{self.repository}/{self.ref}/{self.full_path}"
+
+
+class RepositoryTree:
+    """The paths of a repository tree at a ref.
+
+    Paths are kept in the order of the tree, with a sorted index into them
+    for path and prefix lookups in O(log n). Entries are created when they
+    are iterated, the tree only keeps the path, type and SHA of each.
+
+    The scope of a scoped tree is the top level directories it has the
+    content of, besides the entries of the root. It is None for a full tree.
+    """
+
+    __slots__ = (
+        "_directories",
+        "_order",
+        "_paths",
+        "_shas",
+        "_sorted",
+        "ref",
+        "repository",
+        "scope",
+    )
+
+    def __init__(
+        self,
+        contents: Iterable[Any] = (),
+        repository: str | None = None,
+        ref: str | None = None,
+        scope: tuple[str, ...] | None = None,
+    ) -> None:
+        """Initialize from tree content objects of the GitHub API or entries."""
+        paths = []
+        directories = bytearray()
+        shas = []
+        for content in contents:
+            if isinstance(content, TreeEntry):
+                paths.append(content.full_path)
+                directories.append(content.is_directory)
+                shas.append(content.sha)
+            else:
+                paths.append(content.attributes.get("path"))
+                directories.append(content.attributes.get("type") == "tree")
+                shas.append(content.attributes.get("sha"))
+            repository = repository or content.repository
+            ref = ref or content.ref
+
+        self.repository = repository
+        self.ref = ref
+        self.scope = scope
+        self._paths = tuple(paths)
+        self._directories = bytes(directories)
+        self._shas = tuple(shas)
+        self._order = tuple(sorted(range(len(paths)), key=paths.__getitem__))
+        self._sorted = tuple(paths[index] for index in self._order)
+
+    def __len__(self) -> int:
+        """Return the number of files and directories."""
+        return len(self._paths)
+
+    def __iter__(self) -> Iterator[TreeEntry]:
+        """Iterate over the entries in the order of the tree."""
+        return (self._entry(index) for index in range(len(self._paths)))
+
+    def __contains__(self, path: str) -> bool:
+        """Return True if the path is in the tree."""
+        position = bisect_left(self._sorted, path)
+        return position < len(self._sorted) and self._sorted[position] == path
+
+    @classmethod
+    def from_list(
+        cls,
+        entries: list[list[Any]],
+        repository: str | None,
+        ref: str | None,
+        scope: tuple[str, ...] | None = None,
+    ) -> RepositoryTree:
+        """Return a tree from the result of as_list."""
+        return cls(
+            (
+                TreeEntry(path, bool(directory), sha, repository, ref)
+                for path, directory, sha in entries
+            ),
+            repository,
+            ref,
+            scope,
+        )
+
+    def as_list(self) -> list[list[Any]]:
+        """Return the path, directory flag and SHA of each entry."""
+        return [
+            [path, directory, sha]
+            for path, directory, sha in zip(self._paths, self._directories, self._shas)
+        ]
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """Return the paths in the order of the tree."""
+        return self._paths
+
+    def _entry(self, index: int) -> TreeEntry:
+        return TreeEntry(
+            self._paths[index],
+            bool(self._directories[index]),
+            self._shas[index],
+            self.repository,
+            self.ref,
+        )
+
+    def _indexes_with_prefix(self, prefix: str) -> list[int]:
+        """Return the indexes of the paths that start with prefix, in tree order."""
+        if not prefix:
+            return list(range(len(self._paths)))
+        start = bisect_left(self._sorted, prefix)
+        end = bisect_left(self._sorted, _prefix_end(prefix), start)
+        return sorted(self._order[start:end])
+
+    def get(self, path: str) -> TreeEntry | None:
+        """Return the entry of a path."""
+        position = bisect_left(self._sorted, path)
+        if position < len(self._sorted) and self._sorted[position] == path:
+            return self._entry(self._order[position])
+        return None
+
+    def with_prefix(self, prefix: str) -> list[TreeEntry]:
+        """Return the entries with a path that starts with prefix."""
+        return [self._entry(index) for index in self._indexes_with_prefix(prefix)]
+
+    def paths_with_prefix(self, prefix: str) -> list[str]:
+        """Return the paths that start with prefix."""
+        return [self._paths[index] for index in self._indexes_with_prefix(prefix)]
+
+    def in_directory(self, *directories: str) -> list[TreeEntry]:
+        """Return the entries directly in the directories, "" is the root."""
+        indexes = set()
+        for directory in directories:
+            if not directory:
+                indexes.update(index for index, path in enumerate(self._paths) if "/" not in path)
+                continue
+            prefix = f"{directory}/"
+            indexes.update(
+                index
+                for index in self._indexes_with_prefix(prefix)
+                if "/" not in self._paths[index][len(prefix) :]
+            )
+        return [self._entry(index) for index in sorted(indexes)]
+
+    def covers(self, path: str) -> bool:
+        """Return True if the path would be in the tree if it existed."""
+        if not self._paths:
+            return False
+        return self.scope is None or "/" not in path or path.split("/", 1)[0] in self.scope
+
+    def has_filename(self, filename: str) -> bool:
+        """Return True if a file or directory with the name is in any directory."""
+        suffix = f"/{filename}"
+        return filename in self or any(path.endswith(suffix) for path in self._paths)
+
+
+EMPTY_TREE = RepositoryTree()
+
+
+class RepositoryTreeCache:
+    """Releases the trees of the repositories that were not used recently.
+
+    A repository keeps its tree while it is one of the max_size
+    repositories that most recently used theirs, a released tree is
+    fetched again when it is needed.
+    """
+
+    def __init__(self, max_size: int = TREE_CACHE_SIZE) -> None:
+        """Initialize."""
+        self.max_size = max_size
+        self.releases = 0
+        self._repositories: OrderedDict[HacsRepository, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of repositories that keep their tree."""
+        return len(self._repositories)
+
+    def touch(self, repository: HacsRepository) -> None:
+        """Mark the tree of a repository as used, and release the oldest trees."""
+        self._repositories[repository] = None
+        self._repositories.move_to_end(repository)
+        while len(self._repositories) > self.max_size:
+            oldest, _ = self._repositories.popitem(last=False)
+            oldest.release_tree()
+            self.releases += 1
+
+    def discard(self, repository: HacsRepository) -> None:
+        """Forget a repository that no longer has a tree."""
+        self._repositories.pop(repository, None)
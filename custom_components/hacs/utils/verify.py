@@ -0,0 +1,147 @@
+"""Verify installed content against the recorded file digests."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import mmap
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..base import HacsBase
+    from ..repositories.base import HacsRepository
+
+# Files larger than this are hashed from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+# Time to wait for all repositories before reporting the rest as timed out
+VERIFY_TIMEOUT = 60
+# Digests that are not git blob SHAs carry the algorithm as a prefix
+SHA256_PREFIX = "sha256:"
+# Files created next to installed content that are not part of it
+IGNORED_DIRECTORIES = frozenset(("__pycache__",))
+IGNORED_SUFFIXES = (".br", ".gz", ".pyc")
+
+
+def file_digest(file_path: str, expected: str) -> str:
+    """Return the digest of a file in the format of the expected digest."""
+    size = os.path.getsize(file_path)
+    if expected.startswith(SHA256_PREFIX):
+        prefix, digest = SHA256_PREFIX, hashlib.sha256()
+    else:
+        prefix, digest = "", hashlib.sha1(b"blob %d\0" % size)
+
+    with open(file_path, "rb") as file:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                digest.update(content)
+        else:
+            digest.update(file.read())
+    return f"{prefix}{digest.hexdigest()}"
+
+
+def verify_installed_files(
+    local_path: str,
+    installed_files: dict[str, str],
+    ignore: tuple[str, ...] = (),
+) -> dict[str, list[str]]:
+    """Compare the files in a directory with the recorded digests, must run in the executor.
+
+    Files in the ignored directories, relative to the local path, are not
+    reported as added.
+    """
+    modified = []
+    missing = []
+    for name, expected in installed_files.items():
+        try:
+            if file_digest(os.path.join(local_path, name), expected) != expected:
+                modified.append(name)
+        except FileNotFoundError:
+            missing.append(name)
+
+    added = []
+    if os.path.isdir(local_path):
+        for root, directories, filenames in os.walk(local_path):
+            directories[:] = [
+                directory for directory in directories if directory not in IGNORED_DIRECTORIES
+            ]
+            relative_root = os.path.relpath(root, local_path)
+            for filename in filenames:
+                name = os.path.normpath(os.path.join(relative_root, filename))
+                if (
+                    name not in installed_files
+                    and not filename.endswith(IGNORED_SUFFIXES)
+                    and not name.startswith(ignore)
+                ):
+                    added.append(name)
+
+    return {"added": sorted(added), "missing": sorted(missing), "modified": sorted(modified)}
+
+
+async def async_verify_repository(hacs: HacsBase, repository: HacsRepository) -> dict[str, Any]:
+    """Return the drift report of an installed repository."""
+    report = {
+        "repository": repository.data.full_name,
+        "repository_id": str(repository.data.id),
+        "status": "unverified",
+    }
+    if not repository.data.installed_files or repository.content.path.local is None:
+        # Installed before digests were recorded, or from a zip archive
+        return report
+
+    ignore = ()
+    if repository.content.single:
+        # Single file content shares the directory with other repositories
+        ignore = ("",)
+    elif persistent_directory := repository.repository_manifest.persistent_directory:
+        ignore = (f"{persistent_directory.strip('/')}/",)
+    files = await hacs.hass.async_add_executor_job(
+        verify_installed_files,
+        repository.content.path.local,
+        repository.data.installed_files,
+        ignore,
+    )
+    report.update(files)
+    report["status"] = "drift" if any(files.values()) else "ok"
+    return report
+
+
+async def async_verify_repositories(
+    hacs: HacsBase,
+    repository_ids: list[str] | None = None,
+    timeout: float = VERIFY_TIMEOUT,
+) -> list[dict[str, Any]]:
+    """Verify the installed repositories, or the installed repositories with the IDs.
+
+    Repositories that are not verified within the timeout are reported
+    with the "timeout" status.
+    """
+    repositories = [
+        repository
+        for repository in hacs.repositories.list_downloaded
+        if repository_ids is None or str(repository.data.id) in repository_ids
+    ]
+    tasks = {
+        hacs.hass.async_create_task(async_verify_repository(hacs, repository)): repository
+        for repository in repositories
+    }
+    if not tasks:
+        return []
+
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+
+    reports = []
+    for task, repository in tasks.items():
+        if task in done and task.exception() is None:
+            reports.append(task.result())
+            continue
+        report = {
+            "repository": repository.data.full_name,
+            "repository_id": str(repository.data.id),
+            "status": "timeout" if task in pending else "error",
+        }
+        if task in done:
+            hacs.log.debug("Could not verify %s - %s", repository.string, task.exception())
+        reports.append(report)
+    return reports
@@ -21,7 +21,7 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        if RepositoryFile.HACS_JSON not in [x.filename for x in self.repository.tree]:
+        if not self.repository.tree.has_filename(RepositoryFile.HACS_JSON):
             raise ValidationException(f"The repository has no '{RepositoryFile.HACS_JSON}' file")
 
         content = await self.repository.async_get_hacs_json(self.repository.ref)
@@ -27,7 +27,7 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        if RepositoryFile.MAINIFEST_JSON not in [x.filename for x in self.repository.tree]:
+        if not self.repository.tree.has_filename(RepositoryFile.MAINIFEST_JSON):
             raise ValidationException(
                 f"The repository has no '{RepositoryFile.MAINIFEST_JSON}' file"
             )
@@ -12,10 +12,13 @@ from ..const import DOMAIN
 from .critical import hacs_critical_acknowledge, hacs_critical_list
 from .repositories import (
     hacs_repositories_add,
+    hacs_repositories_changes,
     hacs_repositories_clear_new,
     hacs_repositories_list,
     hacs_repositories_remove,
     hacs_repositories_removed,
+    hacs_repositories_subscribe,
+    hacs_repositories_verify,
 )
 from .repository import (
     hacs_repository_beta,
@@ -57,6 +60,9 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, hacs_repositories_clear_new)
     websocket_api.async_register_command(hass, hacs_repositories_removed)
     websocket_api.async_register_command(hass, hacs_repositories_remove)
+    websocket_api.async_register_command(hass, hacs_repositories_changes)
+    websocket_api.async_register_command(hass, hacs_repositories_subscribe)
+    websocket_api.async_register_command(hass, hacs_repositories_verify)
 
 
 @websocket_api.websocket_command(
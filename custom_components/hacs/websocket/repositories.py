@@ -1,10 +1,16 @@
 """Register info websocket commands."""
 from __future__ import annotations
 
+from functools import partial
 import sys
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.messages import (
+    construct_event_message,
+    construct_result_message,
+)
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
@@ -12,11 +18,12 @@ from custom_components.hacs.utils import regex
 
 from ..const import DOMAIN
 from ..enums import HacsDispatchEvent
+from ..utils.json import json_dumps
+from ..utils.verify import async_verify_repositories
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
-
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository
 
 
 @websocket_api.websocket_command(
@@ -35,46 +42,207 @@ async def hacs_repositories_list(
     """List repositories."""
     hacs: HacsBase = hass.data.get(DOMAIN)
     connection.send_message(
-        websocket_api.result_message(
+        construct_result_message(
             msg["id"],
-            [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-                and (not hacs.configuration.experimental or repo.data.last_fetched)
-            ],
+            "["
+            + ",".join(
+                _serialize_categories(hacs, set(msg.get("categories", hacs.common.categories)))
+            )
+            + "]",
+        )
+    )
+
+
+def _serialize_categories(hacs: HacsBase, categories: set[str]) -> list[str]:
+    """Serialize the listed repositories in the categories.
+
+    Repositories that are not created yet are serialized from their stored
+    data, they are created when they are opened.
+    """
+    serializer = partial(_serialize_repository, hacs)
+    unhydrated_serializer = partial(_serialize_unhydrated, hacs)
+    context = (hacs.configuration.country, hacs.configuration.experimental)
+    serialized = []
+    for category in categories:
+        serialized.extend(
+            hacs.repositories.get_serialized(repo, serializer)
+            for repo in hacs.repositories.list_by_category(category, hydrate=False)
+            if _include_repository(hacs, repo)
         )
+        for repository_id in hacs.repositories.list_unhydrated_by_category(category):
+            if (
+                payload := hacs.repositories.get_serialized_unhydrated(
+                    repository_id, unhydrated_serializer, context
+                )
+            ) is not None:
+                serialized.append(payload)
+    return serialized
+
+
+def _serialize_repository(hacs: HacsBase, repo: HacsRepository) -> str:
+    """Serialize a repository for the repository list."""
+    return json_dumps(
+        {
+            "authors": repo.data.authors,
+            "available_version": repo.display_available_version,
+            "installed_version": repo.display_installed_version,
+            "config_flow": repo.data.config_flow,
+            "can_download": repo.can_download,
+            "category": repo.data.category,
+            "country": repo.repository_manifest.country,
+            "custom": not hacs.repositories.is_default(str(repo.data.id)),
+            "description": repo.data.description,
+            "domain": repo.data.domain,
+            "downloads": repo.data.downloads,
+            "file_name": repo.data.file_name,
+            "full_name": repo.data.full_name,
+            "hide": repo.data.hide,
+            "homeassistant": repo.repository_manifest.homeassistant,
+            "id": repo.data.id,
+            "installed": repo.data.installed,
+            "last_updated": repo.data.last_updated,
+            "local_path": repo.content.path.local,
+            "name": repo.display_name,
+            "new": repo.data.new,
+            "pending_upgrade": repo.pending_update,
+            "stars": repo.data.stargazers_count,
+            "state": repo.state,
+            "status": repo.display_status,
+            "topics": repo.data.topics,
+        }
+    )
+
+
+def _serialize_unhydrated(hacs: HacsBase, repository_id: str, data: dict[str, Any]) -> str | None:
+    """Serialize a repository that is not created yet, None if it is not listed."""
+    repo = hacs.data.async_unregistered_repository(repository_id, data)
+    return _serialize_repository(hacs, repo) if _include_repository(hacs, repo) else None
+
+
+def _include_repository(hacs: HacsBase, repo: HacsRepository) -> bool:
+    """Return True if the repository should be listed."""
+    return not repo.ignored_by_country_configuration and (
+        not hacs.configuration.experimental or repo.data.last_fetched
+    )
+
+
+def _serialize_changes(
+    hacs: HacsBase,
+    categories: set[str],
+    epoch: str | None,
+    revision: int | None,
+) -> str:
+    """Serialize the repositories changed since a revision.
+
+    All repositories are included when the revision is unknown to this catalog,
+    which is the case for a first load or after Home Assistant restarted.
+    """
+    serializer = partial(_serialize_repository, hacs)
+    full = (
+        epoch != hacs.repositories.epoch
+        or revision is None
+        or revision > hacs.repositories.revision
+    )
+
+    if full:
+        repositories = _serialize_categories(hacs, categories)
+        removed = []
+    else:
+        changed, removed = hacs.repositories.changes_since(revision)
+        repositories = []
+        for repo in changed:
+            if repo.data.category in categories and _include_repository(hacs, repo):
+                repositories.append(hacs.repositories.get_serialized(repo, serializer))
+            else:
+                # The repository is no longer visible to the client
+                removed.append(str(repo.data.id))
+
+    return (
+        f'{{"epoch":{json_dumps(hacs.repositories.epoch)},"full":{json_dumps(full)},'
+        f'"removed":{json_dumps(removed)},"repositories":[{",".join(repositories)}],'
+        f'"revision":{hacs.repositories.revision}}}'
     )
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/changes",
+        vol.Optional("categories"): [str],
+        vol.Optional("epoch"): str,
+        vol.Optional("revision"): int,
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_changes(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """List repositories changed since a catalog revision."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    connection.send_message(
+        construct_result_message(
+            msg["id"],
+            _serialize_changes(
+                hacs,
+                set(msg.get("categories", hacs.common.categories)),
+                msg.get("epoch"),
+                msg.get("revision"),
+            ),
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/subscribe",
+        vol.Optional("categories"): [str],
+        vol.Optional("epoch"): str,
+        vol.Optional("revision"): int,
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to repository changes since a catalog revision."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    categories = set(msg.get("categories", hacs.common.categories))
+    epoch: str | None = msg.get("epoch")
+    revision: int | None = msg.get("revision")
+    scheduled = False
+
+    @callback
+    def send_changes() -> None:
+        """Send the changes since the last revision sent to the client."""
+        nonlocal epoch, revision, scheduled
+        scheduled = False
+        if msg["id"] not in connection.subscriptions:
+            return
+        if epoch == hacs.repositories.epoch and revision == hacs.repositories.revision:
+            return
+        payload = _serialize_changes(hacs, categories, epoch, revision)
+        epoch = hacs.repositories.epoch
+        revision = hacs.repositories.revision
+        connection.send_message(construct_event_message(msg["id"], payload))
+
+    @callback
+    def schedule_changes() -> None:
+        """Coalesce catalog changes into a single event."""
+        nonlocal scheduled
+        if not scheduled:
+            scheduled = True
+            hass.loop.call_soon(send_changes)
+
+    connection.subscriptions[msg["id"]] = hacs.repositories.add_revision_listener(schedule_changes)
+    connection.send_message(websocket_api.result_message(msg["id"]))
+    send_changes()
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repositories/clear_new",
@@ -97,15 +265,17 @@ async def hacs_repositories_clear_new(
         repository.data.new = False
 
     else:
-        for repo in hacs.repositories.list_all:
-            if repo.data.new and repo.data.category in msg.get("categories", []):
+        for category in set(msg.get("categories", [])):
+            for repo in hacs.repositories.list_by_category(category):
+                if not repo.data.new:
+                    continue
                 hacs.log.debug(
                     "Clearing new flag from '%s'",
                     repo.data.full_name,
                 )
                 repo.data.new = False
     hacs.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
-    await hacs.data.async_write()
+    hacs.data.async_schedule_write()
     connection.send_message(websocket_api.result_message(msg["id"]))
 
 
@@ -213,3 +383,22 @@ async def hacs_repositories_remove(
     await hacs.data.async_write()
 
     connection.send_message(websocket_api.result_message(msg["id"], {}))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/verify",
+        vol.Optional("repository_ids"): [cv.string],
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_verify(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Compare installed content with what was installed."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    reports = await async_verify_repositories(hacs, msg.get("repository_ids"))
+    connection.send_message(websocket_api.result_message(msg["id"], reports))
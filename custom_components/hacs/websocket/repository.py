@@ -1,6 +1,7 @@
 """Register info websocket commands."""
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import websocket_api
@@ -44,14 +45,17 @@ async def hacs_repository_info(
 
     if not repository.updated_info:
         try:
-            await repository.update_repository(ignore_issues=True, force=True)
+            await hacs.queue.async_run(
+                partial(repository.update_repository, ignore_issues=True, force=True),
+                key=(repository.data.full_name_lower, "common_update"),
+            )
         except Exception as exception:  # pylint: disable=broad-except
             repository.logger.error("%s %s", repository.string, exception)
         repository.updated_info = True
 
     if repository.data.new:
         repository.data.new = False
-        await hacs.data.async_write()
+        hacs.data.async_schedule_write()
 
     connection.send_message(
         websocket_api.result_message(
@@ -124,7 +128,7 @@ async def hacs_repository_ignore(
 
     hacs.common.ignored_repositories.add(repository.data.full_name)
 
-    await hacs.data.async_write()
+    hacs.data.async_schedule_write()
     connection.send_message(websocket_api.result_message(msg["id"]))
 
 
@@ -148,7 +152,7 @@ async def hacs_repository_state(
 
     repository.state = msg["state"]
 
-    await hacs.data.async_write()
+    hacs.data.async_schedule_write()
     connection.send_message(websocket_api.result_message(msg["id"], {}))
 
 
@@ -228,11 +232,14 @@ async def hacs_repository_download(
     repository = hacs.repositories.get_by_id(msg["repository"])
 
     was_installed = repository.data.installed
-    if version := msg.get("version"):
-        repository.data.selected_tag = version
-        await repository.update_repository(force=True)
 
-    await repository.async_install()
+    async def _async_download() -> None:
+        if version := msg.get("version"):
+            repository.data.selected_tag = version
+            await repository.update_repository(force=True)
+        await repository.async_install()
+
+    await hacs.queue.async_run(_async_download, key=(repository.data.full_name_lower, "download"))
     repository.state = None
     if not was_installed:
         hacs.async_dispatch(HacsDispatchEvent.RELOAD, {"force": True})
@@ -288,7 +295,7 @@ async def hacs_repository_refresh(
     repository = hacs.repositories.get_by_id(msg["repository"])
 
     await repository.update_repository(ignore_issues=True, force=True)
-    await hacs.data.async_write()
+    hacs.data.async_schedule_write()
     # Update state of update entity
     hacs.coordinators[repository.data.category].async_update_listeners()
 
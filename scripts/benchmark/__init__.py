@@ -0,0 +1 @@
+"""HACS Benchmark script."""
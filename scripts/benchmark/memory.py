@@ -0,0 +1,62 @@
+"""Benchmark the memory used per repository for a restored catalog."""
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import tracemalloc
+
+from aiogithubapi import GitHubReleaseModel
+
+from .restore import restore
+
+
+def releases(count: int) -> list[GitHubReleaseModel]:
+    """Return release objects like the ones kept for downloaded repositories."""
+    return [
+        GitHubReleaseModel(
+            {
+                "tag_name": f"1.{index}.0",
+                "name": f"Release 1.{index}.0",
+                "body": "Fixes and improvements\n" * 10,
+                "draft": False,
+                "prerelease": False,
+                "assets": [
+                    {
+                        "id": index,
+                        "name": "repository.zip",
+                        "download_count": 100,
+                        "browser_download_url": f"https://github.com/benchmark/{index}.zip",
+                    }
+                ],
+            }
+        )
+        for index in range(count)
+    ]
+
+
+async def measure(count: int) -> tuple[int, int]:
+    """Return the memory of count created repositories and of their releases."""
+    _, repositories_memory, hacs = await restore(count, lazy_restore=False)
+
+    repositories = hacs.repositories.list_all
+    gc.collect()
+    tracemalloc.start()
+    for repository in repositories:
+        repository.releases.objects = releases(5)
+    gc.collect()
+    releases_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return repositories_memory, releases_memory
+
+
+def run(count: int = 10_000) -> None:
+    """Run the benchmark."""
+    repositories_memory, releases_memory = asyncio.run(measure(count))
+    print(f"{count} repositories, memory per repository")
+    print(f"{'restored repository':<24}{repositories_memory / count:>10.0f} bytes")
+    print(f"{'5 releases':<24}{releases_memory / count:>10.0f} bytes")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,94 @@
+"""Benchmark lookups in HacsRepositories."""
+from __future__ import annotations
+
+import sys
+import timeit
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.enums import HacsCategory
+from custom_components.hacs.repositories import REPOSITORY_CLASSES
+
+CATEGORIES = (
+    HacsCategory.INTEGRATION,
+    HacsCategory.PLUGIN,
+    HacsCategory.THEME,
+    HacsCategory.PYTHON_SCRIPT,
+    HacsCategory.TEMPLATE,
+)
+
+
+def populate(hacs: HacsBase, count: int) -> None:
+    """Register count repositories, every 100th is downloaded."""
+    for index in range(count):
+        category = CATEGORIES[index % len(CATEGORIES)]
+        repository = REPOSITORY_CLASSES[category](hacs, f"benchmark/repository-{index}")
+        repository.data.id = str(index + 1)
+        repository.data.last_version = "2.0.0"
+        repository.data.releases = True
+        if index % 100 == 0:
+            repository.data.installed = True
+            repository.data.installed_version = "1.0.0" if index % 200 == 0 else "2.0.0"
+        hacs.repositories.register(repository, default=index % 2 == 0)
+
+
+def scan_list_downloaded(hacs: HacsBase) -> list:
+    """Previous implementation of list_downloaded."""
+    return [repo for repo in hacs.repositories.list_all if repo.data.installed]
+
+
+def scan_category_downloaded(hacs: HacsBase, category: HacsCategory) -> bool:
+    """Previous implementation of category_downloaded."""
+    for repository in scan_list_downloaded(hacs):
+        if repository.data.category == category:
+            return True
+    return False
+
+
+def scan_pending_update(hacs: HacsBase) -> list:
+    """Previous implementation used by the sensor."""
+    return [repo for repo in hacs.repositories.list_all if repo.pending_update]
+
+
+def scan_category(hacs: HacsBase, category: HacsCategory) -> list:
+    """Previous implementation used by hacs/repositories/list."""
+    return [repo for repo in hacs.repositories.list_all if repo.data.category == category]
+
+
+def run(count: int = 10_000, number: int = 100) -> None:
+    """Run the benchmark."""
+    hacs = HacsBase()
+    populate(hacs, count)
+    category = HacsCategory.THEME
+
+    results = {
+        "list_downloaded": (
+            lambda: scan_list_downloaded(hacs),
+            lambda: hacs.repositories.list_downloaded,
+        ),
+        "category_downloaded": (
+            lambda: scan_category_downloaded(hacs, category),
+            lambda: hacs.repositories.category_downloaded(category),
+        ),
+        "pending_update": (
+            lambda: scan_pending_update(hacs),
+            lambda: hacs.repositories.list_pending_update,
+        ),
+        "by_category": (
+            lambda: scan_category(hacs, category),
+            lambda: hacs.repositories.list_by_category(category),
+        ),
+    }
+
+    print(f"{count} repositories, {number} runs each, time per run")
+    print(f"{'lookup':<22}{'scan':>12}{'index':>12}{'speedup':>10}")
+    for name, (scan, index) in results.items():
+        scan_time = timeit.timeit(scan, number=number) / number
+        index_time = timeit.timeit(index, number=number) / number
+        print(
+            f"{name:<22}{scan_time * 1000:>10.3f}ms{index_time * 1000:>10.3f}ms"
+            f"{scan_time / index_time:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
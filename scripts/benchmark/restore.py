@@ -0,0 +1,58 @@
+"""Benchmark restoring the stored repositories, created at restore or when first used."""
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.utils.data import HacsData
+from custom_components.hacs.utils.json import json_loads
+
+from .store import generate
+
+
+async def restore(count: int, lazy_restore: bool) -> tuple[float, int, HacsBase]:
+    """Restore count repositories, return the time, the allocated memory and HACS."""
+    # Parsed in the measurement like the store file is
+    stored = json_bytes(generate(count))
+    hacs = HacsBase()
+    hacs.core.config_path = "/config"
+    hacs.configuration.experimental = False
+    data = HacsData(hacs, lazy_restore=lazy_restore)
+
+    async def _load_from_store(_, key):
+        return json_loads(stored) if key == "repositories" else {}
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with patch("custom_components.hacs.utils.data.async_load_from_store", _load_from_store):
+        assert await data.restore()
+    duration = time.perf_counter() - start
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert hacs.repositories.count == count
+    return duration, memory, hacs
+
+
+def run(counts: tuple[int, ...] = (1_000, 5_000, 20_000)) -> None:
+    """Run the benchmark."""
+    print(f"{'repositories':<14}{'restore':<10}{'time':>10}{'memory':>12}")
+    for count in counts:
+        for lazy_restore in (False, True):
+            duration, memory, _ = asyncio.run(restore(count, lazy_restore))
+            print(
+                f"{count:<14}{'lazy' if lazy_restore else 'eager':<10}"
+                f"{duration * 1000:>8.0f}ms{memory / 1024 / 1024:>10.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    run(tuple(int(count) for count in sys.argv[1:]) or (1_000, 5_000, 20_000))
@@ -0,0 +1,86 @@
+"""Benchmark loading and saving the repositories store file with each codec."""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import timeit
+from types import SimpleNamespace
+
+from custom_components.hacs.const import VERSION_STORAGE
+from custom_components.hacs.utils.store import STORE_CODECS, HACSStore
+
+CATEGORIES = ("integration", "plugin", "theme", "python_script", "template")
+TOPICS = ("home-assistant", "hacs", "lovelace", "custom-card", "integration", "sensor")
+
+
+def generate(count: int) -> dict[str, dict]:
+    """Return stored repository data for count repositories, every 100th is downloaded."""
+    content = {}
+    for index in range(count):
+        entry = {
+            "repository_manifest": {"name": f"Repository {index}", "render_readme": True},
+            "authors": [f"@author-{index % 500}"],
+            "category": CATEGORIES[index % len(CATEGORIES)],
+            "description": f"Description of benchmark repository {index} for Home Assistant",
+            "downloads": index * 7 % 5000,
+            "etag_repository": f'W/"{index:064x}"',
+            "full_name": f"benchmark/repository-{index}",
+            "last_updated": "2023-06-01T12:00:00Z",
+            "stargazers_count": index % 1000,
+            "topics": list(TOPICS[: index % len(TOPICS) + 1]),
+            "last_fetched": 1685620800.0 + index,
+        }
+        if index % 100 == 0:
+            entry.update(
+                {
+                    "installed": True,
+                    "installed_commit": f"{index:07x}",
+                    "last_commit": f"{index + 1:07x}",
+                    "last_version": "2.0.0",
+                    "releases": True,
+                    "version_installed": "1.0.0",
+                    "installed_files": {
+                        f"custom_components/repository_{index}/{name}": f"{index:040x}"
+                        for name in ("__init__.py", "manifest.json", "sensor.py")
+                    },
+                }
+            )
+        content[str(index + 1)] = entry
+    return content
+
+
+def run(counts: tuple[int, ...] = (1_000, 5_000, 20_000), number: int = 5) -> None:
+    """Run the benchmark."""
+    codecs = {"json": None, **STORE_CODECS}
+    with tempfile.TemporaryDirectory() as directory:
+        hass = SimpleNamespace(
+            config=SimpleNamespace(path=lambda *parts: os.path.join(directory, *parts))
+        )
+        print(f"{number} runs each, time per run")
+        print(f"{'repositories':<14}{'codec':<12}{'save':>10}{'load':>10}{'size':>12}")
+        for count in counts:
+            envelope = {
+                "version": VERSION_STORAGE,
+                "minor_version": 1,
+                "key": "hacs.repositories",
+                "data": generate(count),
+            }
+            for name, codec in codecs.items():
+                store = HACSStore(
+                    hass, VERSION_STORAGE, f"hacs.benchmark_{name}", atomic_writes=True, codec=codec
+                )
+                save_time = (
+                    timeit.timeit(lambda: store._write_data(store.path, envelope), number=number)
+                    / number
+                )
+                load_time = timeit.timeit(store.load, number=number) / number
+                assert store.load() == envelope["data"]
+                print(
+                    f"{count:<14}{name:<12}{save_time * 1000:>8.1f}ms{load_time * 1000:>8.1f}ms"
+                    f"{os.path.getsize(store.path) / 1024:>10.0f}kB"
+                )
+
+
+if __name__ == "__main__":
+    run(tuple(int(count) for count in sys.argv[1:]) or (1_000, 5_000, 20_000))
@@ -0,0 +1,120 @@
+"""Benchmark fetching the full tree against the scoped tree of a large repository."""
+from __future__ import annotations
+
+import sys
+import timeit
+
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.hacs.utils.json import json_loads
+from custom_components.hacs.utils.tree import RepositoryTree, TreeEntry
+
+# Entries in the tree API responses, like GitHub returns them
+_ENTRY = {"mode": "100644", "size": 1234}
+
+
+def _entry(path: str, index: int, directory: bool = False) -> dict:
+    sha = f"{index:040x}"
+    return {
+        **_ENTRY,
+        "path": path,
+        "type": "tree" if directory else "blob",
+        "sha": sha,
+        "url": f"https://api.github.com/repos/benchmark/monorepo/git/blobs/{sha}",
+    }
+
+
+def generate(files: int) -> tuple[list[dict], list[dict], list[dict]]:
+    """Return the full tree, the root and the custom_components tree of a monorepo."""
+    root = [
+        _entry("README.md", 0),
+        _entry("custom_components", 1, True),
+        _entry("hacs.json", 2),
+        _entry("packages", 3, True),
+    ]
+    integration = [_entry("benchmark", 4, True)] + [
+        _entry(f"benchmark/{name}", 5 + index)
+        for index, name in enumerate(("__init__.py", "const.py", "manifest.json", "sensor.py"))
+    ]
+    packages = []
+    for index in range(files):
+        if index % 50 == 0:
+            directory = f"packages/package-{index // 50}"
+            packages.append(_entry(directory, 10 + index, True))
+        packages.append(_entry(f"{directory}/file-{index}.ts", 10 + files + index))
+
+    full = (
+        root[:2]
+        + [{**entry, "path": f"custom_components/{entry['path']}"} for entry in integration]
+        + root[2:]
+        + packages
+    )
+    return full, root, integration
+
+
+def _full_tree(response: bytes) -> RepositoryTree:
+    tree = json_loads(response)["tree"]
+    return RepositoryTree(
+        TreeEntry(
+            entry["path"], entry["type"] == "tree", entry["sha"], "benchmark/monorepo", "main"
+        )
+        for entry in tree
+    )
+
+
+def _scoped_tree(root: bytes, integration: bytes) -> RepositoryTree:
+    entries = []
+    for entry in json_loads(root)["tree"]:
+        entries.append(
+            TreeEntry(
+                entry["path"], entry["type"] == "tree", entry["sha"], "benchmark/monorepo", "main"
+            )
+        )
+        if entry["path"] == "custom_components":
+            entries.extend(
+                TreeEntry(
+                    f"custom_components/{subentry['path']}",
+                    subentry["type"] == "tree",
+                    subentry["sha"],
+                    "benchmark/monorepo",
+                    "main",
+                )
+                for subentry in json_loads(integration)["tree"]
+            )
+    return RepositoryTree(entries, scope=("custom_components",))
+
+
+def run(counts: tuple[int, ...] = (10_000, 50_000, 100_000), number: int = 5) -> None:
+    """Run the benchmark, requests are counted by the size of their responses."""
+    print(f"{number} runs each, time to parse and index the responses")
+    print(f"{'files':<10}{'tree':<8}{'requests':>10}{'size':>12}{'time':>10}")
+    for count in counts:
+        full, root, integration = generate(count)
+        full_response = json_bytes({"tree": full, "truncated": False})
+        root_response = json_bytes({"tree": root, "truncated": False})
+        integration_response = json_bytes({"tree": integration, "truncated": False})
+
+        full_tree = _full_tree(full_response)
+        scoped_tree = _scoped_tree(root_response, integration_response)
+        assert scoped_tree.paths_with_prefix("custom_components/") == (
+            full_tree.paths_with_prefix("custom_components/")
+        )
+
+        full_time = timeit.timeit(lambda: _full_tree(full_response), number=number) / number
+        scoped_time = (
+            timeit.timeit(lambda: _scoped_tree(root_response, integration_response), number=number)
+            / number
+        )
+        print(
+            f"{count:<10}{'full':<8}{1:>10}{len(full_response) / 1024:>10.0f}kB"
+            f"{full_time * 1000:>8.2f}ms"
+        )
+        print(
+            f"{count:<10}{'scoped':<8}{2:>10}"
+            f"{(len(root_response) + len(integration_response)) / 1024:>10.0f}kB"
+            f"{scoped_time * 1000:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    run(tuple(int(count) for count in sys.argv[1:]) or (10_000, 50_000, 100_000))
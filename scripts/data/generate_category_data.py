@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
+from functools import partial
 import json
 import logging
 import os
@@ -25,6 +26,7 @@ import voluptuous as vol
 from custom_components.hacs.base import HacsBase, HacsRepositories
 from custom_components.hacs.const import HACS_ACTION_GITHUB_API_HEADERS
 from custom_components.hacs.data_client import HacsDataClient
+from custom_components.hacs.enums import HacsQueuePriority
 from custom_components.hacs.exceptions import HacsExecutionStillInProgress
 from custom_components.hacs.repositories.base import (
     HACS_MANIFEST_KEYS_TO_EXPORT,
@@ -33,7 +35,13 @@ from custom_components.hacs.repositories.base import (
 )
 from custom_components.hacs.utils.data import HacsData
 from custom_components.hacs.utils.decorator import concurrent
+from custom_components.hacs.utils.http_cache import (
+    HttpCache,
+    HttpCacheSession,
+    http_cache_directory,
+)
 from custom_components.hacs.utils.queue_manager import QueueManager
+from custom_components.hacs.utils.rate_limit import GitHubRateLimitSession
 from custom_components.hacs.utils.validate import VALIDATE_GENERATED_V2_REPO_DATA
 
 from .common import expand_and_humanize_error, print_error_and_exit
@@ -137,6 +145,9 @@ class AdjustedHacs(HacsBase):
         self.queue = QueueManager(self.hass)
         self.repositories = HacsRepositories()
         self.system.generator = True
+        if (cache_directory := http_cache_directory()) is not None:
+            self.http_cache = HttpCache(cache_directory)
+            session = HttpCacheSession(session, self.http_cache)
         self.session = session
         self.core.config_path = None
         self.configuration.token = token
@@ -144,14 +155,15 @@ class AdjustedHacs(HacsBase):
         self.data = AdjustedHacsData(hacs=self)
         self.data_client = HacsDataClient(session=session, client_name="HACS/Generator")
 
+        github_session = GitHubRateLimitSession(session, self.github_budget)
         self.github = GitHub(
             token,
-            session,
+            github_session,
             headers=HACS_ACTION_GITHUB_API_HEADERS,
         )
         self.githubapi = GitHubAPI(
             token=token,
-            session=session,
+            session=github_session,
             **{"client_name": "HACS/Generator"},
         )
 
@@ -172,7 +184,7 @@ class AdjustedHacs(HacsBase):
             repository_full_name=repository_full_name, category=category, default=True
         )
 
-    @concurrent(concurrenttasks=10, backoff_time=0.1)
+    @concurrent(concurrenttasks=10)
     async def concurrent_update_repository(self, repository: HacsRepository) -> None:
         """Update a repository."""
         if repository_has_missing_keys(repository, "update"):
@@ -269,6 +281,41 @@ class AdjustedHacs(HacsBase):
 
         return self.data.content
 
+    async def async_prefetch_repositories_metadata(
+        self,
+        repositories: list[HacsRepository],
+    ) -> set[HacsRepository]:
+        """Refresh repositories from batched metadata, return those that did not change."""
+        if not self.configuration.token or not repositories:
+            # The GraphQL API is not available without authentication
+            return set()
+
+        before = {
+            repository: (
+                repository.data.last_updated,
+                repository.data.last_version,
+                repository.data.last_commit,
+            )
+            for repository in repositories
+        }
+        # Repositories that changed get a full update, their content is not refreshed here
+        missing = await self.async_update_repositories_metadata(repositories, refresh=False)
+        unchanged = set()
+        for repository, state in before.items():
+            if repository in missing:
+                continue
+            if state == (
+                repository.data.last_updated,
+                repository.data.last_version,
+                repository.data.last_commit,
+            ) and not repository_has_missing_keys(repository, "update"):
+                unchanged.add(repository)
+            else:
+                # Force a full update for repositories that changed
+                repository.data.etag_repository = None
+        self.log.info("%s of %s repositories are unchanged", len(unchanged), len(repositories))
+        return unchanged
+
     async def get_category_repositories(
         self,
         category: str,
@@ -288,20 +335,37 @@ class AdjustedHacs(HacsBase):
             # hacs/integration i not in the default file, but it's still needed
             repositories.append("hacs/integration")
 
+        unchanged = await self.async_prefetch_repositories_metadata(
+            [
+                repository
+                for repo in repositories
+                if repo not in removed
+                and (repository := self.repositories.get_by_full_name(repo)) is not None
+            ]
+        )
+
         for repo in repositories:
             if repo in removed:
                 self.log.warning("Skipping %s as it's removed from HACS", repo)
                 continue
             repository = self.repositories.get_by_full_name(repo)
             if repository is not None:
-                self.queue.add(self.concurrent_update_repository(repository=repository))
+                if repository in unchanged:
+                    continue
+                self.queue.add(
+                    partial(self.concurrent_update_repository, repository=repository),
+                    key=(repository.data.full_name_lower, "update_repository"),
+                )
                 continue
 
             self.queue.add(
-                self.concurrent_register_repository(
+                partial(
+                    self.concurrent_register_repository,
                     repository_full_name=repo,
                     category=category,
-                )
+                ),
+                key=(repo.lower(), "register"),
+                priority=HacsQueuePriority.REGISTRATION,
             )
 
     async def summarize_data(
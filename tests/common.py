@@ -670,11 +670,24 @@ class WSClient:
         return await self.client.receive_json()
 
 
+class MockedStreamReader:
+    def __init__(self, read) -> None:
+        self._read = read
+
+    async def iter_chunked(self, size: int):
+        content = await self._read()
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        for start in range(0, len(content), size):
+            yield content[start : start + size]
+
+
 class MockedResponse:
     def __init__(self, **kwargs) -> None:
         self.kwargs = kwargs
         self.exception = kwargs.get("exception", None)
         self.keep = kwargs.get("keep", False)
+        self.released = False
 
     @property
     def status(self):
@@ -688,6 +701,10 @@ class MockedResponse:
     def headers(self):
         return self.kwargs.get("headers", {})
 
+    @property
+    def content(self):
+        return MockedStreamReader(self.read)
+
     async def read(self, **kwargs):
         if (content := self.kwargs.get("content")) is not None:
             return content
@@ -707,6 +724,15 @@ class MockedResponse:
         if self.status >= 300:
             raise ClientError(self.status)
 
+    def release(self) -> None:
+        self.released = True
+
+    async def __aenter__(self) -> MockedResponse:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.release()
+
 
 class ResponseMocker:
     calls: list[dict[str, Any]] = []
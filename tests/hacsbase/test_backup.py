@@ -1,72 +1,135 @@
-"""HACS Backup Test Suite."""
+"""HACS staged install Test Suite."""
 # pylint: disable=missing-docstring
 import os
 
-from custom_components.hacs.utils.backup import Backup, BackupNetDaemon
+from custom_components.hacs.utils.backup import StagedInstall, recover_staged_installs
 
 
-def test_file(hacs, tmpdir):
-    with open(f"{tmpdir.dirname}/dummy_file", "w") as dummy:
-        dummy.write("")
+def test_staged_install(hacs, tmpdir):
+    local = tmpdir.mkdir("dummy_directory")
+    local.join("old.py").write("old")
 
-    backup = Backup(hacs=hacs, local_path=f"{tmpdir.dirname}/dummy_file")
-    backup.create()
+    staged = StagedInstall(hacs=hacs, local_path=str(local))
+    assert staged.can_stage
+    staged.prepare()
+    with open(f"{staged.staging_path}/new.py", "w") as new:
+        new.write("new")
 
-    assert not os.path.exists(backup.local_path)
-    assert os.path.exists(backup.backup_path_full)
+    # The installed content is untouched until the swap
+    assert local.join("old.py").exists()
 
-    backup.restore()
-    assert os.path.exists(backup.local_path)
+    staged.swap()
+    assert local.listdir() == [local.join("new.py")]
+    assert os.path.exists(staged.previous_path)
 
-    backup.cleanup()
-    assert not os.path.exists(backup.backup_path_full)
+    staged.cleanup()
+    assert not os.path.exists(staged.previous_path)
+    assert not os.path.exists(staged.staging_path)
 
 
-def test_directory(hacs, tmpdir):
-    os.makedirs(f"{tmpdir.dirname}/dummy_directory", exist_ok=True)
+def test_staged_install_rollback(hacs, tmpdir):
+    parent = tmpdir.mkdir("custom")
+    local = parent.mkdir("dummy_directory")
+    local.join("old.py").write("old")
 
-    backup = Backup(hacs=hacs, local_path=f"{tmpdir.dirname}/dummy_directory")
-    backup.create()
+    staged = StagedInstall(hacs=hacs, local_path=str(local))
+    staged.prepare()
+    with open(f"{staged.staging_path}/new.py", "w") as new:
+        new.write("new")
+    staged.swap()
 
-    assert not os.path.exists(backup.local_path)
-    assert os.path.exists(backup.backup_path_full)
+    # Nothing is staged next to the installed content
+    assert parent.listdir() == [local]
 
-    backup.restore()
-    assert os.path.exists(backup.local_path)
+    staged.rollback()
+    staged.cleanup()
+    assert local.listdir() == [local.join("old.py")]
+    assert not os.path.exists(staged.path)
 
-    backup.cleanup()
-    assert not os.path.exists(backup.backup_path_full)
 
+def test_recover_staged_installs(hacs, tmpdir):
+    local = tmpdir.mkdir("dummy_directory")
+    local.join("old.py").write("old")
 
-def test_muilti(hacs, tmpdir):
-    backup = Backup(hacs=hacs, local_path=f"{tmpdir.dirname}/dummy_directory")
-    backup.create()
-    backup.create()
+    staged = StagedInstall(hacs=hacs, local_path=str(local))
+    staged.prepare()
+    # Interrupted between the renames of the swap
+    os.rename(str(local), staged.previous_path)
 
+    recover_staged_installs(hacs.core.config_path)
+    assert local.listdir() == [local.join("old.py")]
+    assert not os.path.exists(staged.path)
 
-def test_netdaemon_backup(hacs, repository_netdaemon):
-    repository = repository_netdaemon
-    repository.content.path.local = repository.localpath
-    os.makedirs(repository.content.path.local, exist_ok=True)
-    backup = BackupNetDaemon(hacs=hacs, repository=repository)
-    backup.cleanup()
-    with open(f"{repository.content.path.local}/dummy_file.yaml", "w") as dummy:
-        dummy.write("test: test")
-    with open(f"{repository.content.path.local}/dummy_file.yaml") as dummy:
-        content = dummy.read()
-        assert content == "test: test"
-    assert not os.path.exists(backup.backup_path)
-    os.makedirs(backup.backup_path, exist_ok=True)
-    backup.create()
-    assert os.path.exists(backup.backup_path)
-    with open(f"{repository.content.path.local}/dummy_file.yaml", "w") as dummy:
-        dummy.write("tests: tests")
-    with open(f"{repository.content.path.local}/dummy_file.yaml") as dummy:
-        content = dummy.read()
-        assert content == "tests: tests"
-    backup.restore()
-    backup.cleanup()
-    assert not os.path.exists(backup.backup_path)
-    with open(f"{repository.content.path.local}/dummy_file.yaml") as dummy:
-        content = dummy.read()
-        assert content == "test: test"
+
+def test_staged_install_new(hacs, tmpdir):
+    parent = tmpdir.mkdir("custom")
+    staged = StagedInstall(hacs=hacs, local_path=f"{parent}/dummy_directory")
+    staged.prepare()
+    staged.swap()
+    staged.cleanup()
+    assert parent.listdir() == [parent.join("dummy_directory")]
+
+
+def test_staged_install_discarded(hacs, tmpdir):
+    parent = tmpdir.mkdir("custom")
+    local = parent.mkdir("dummy_directory")
+    local.join("old.py").write("old")
+
+    staged = StagedInstall(hacs=hacs, local_path=str(local))
+    staged.prepare()
+    staged.prepare()
+    staged.cleanup()
+    assert local.listdir() == [local.join("old.py")]
+    assert parent.listdir() == [local]
+
+
+def test_staged_install_preserve(hacs, tmpdir):
+    local = tmpdir.mkdir("dummy_directory")
+    local.mkdir("persistent").join("data.json").write("user")
+    local.join("config.yaml").write("test: test")
+
+    staged = StagedInstall(hacs=hacs, local_path=str(local))
+    staged.prepare()
+    os.makedirs(f"{staged.staging_path}/persistent")
+    with open(f"{staged.staging_path}/persistent/data.json", "w") as data:
+        data.write("default")
+    with open(f"{staged.staging_path}/config.yaml", "w") as config:
+        config.write("tests: tests")
+
+    staged.preserve("persistent")
+    staged.preserve("missing")
+    staged.preserve_matching(".yaml")
+    inode = os.stat(local.join("persistent", "data.json")).st_ino
+    staged.swap()
+    staged.cleanup()
+
+    assert local.join("persistent", "data.json").read() == "user"
+    assert local.join("config.yaml").read() == "test: test"
+    # The preserved files are linked, not copied
+    assert os.stat(local.join("persistent", "data.json")).st_ino == inode
+
+
+def test_staged_install_unsafe(hacs):
+    staged = StagedInstall(hacs=hacs, local_path=f"{hacs.core.config_path}/custom_components/")
+    assert not staged.can_stage
+
+
+def test_staged_install_preserve_variants(hacs, tmpdir):
+    local = tmpdir.mkdir("dummy_directory")
+    local.join("card.js").write("card")
+    local.join("card.js.gz").write("compressed card")
+    local.join("removed.js.gz").write("compressed removed")
+
+    staged = StagedInstall(hacs=hacs, local_path=str(local))
+    staged.prepare()
+    with open(f"{staged.staging_path}/card.js", "w") as card:
+        card.write("card")
+    inode = os.stat(local.join("card.js.gz")).st_ino
+
+    staged.preserve_variants((".gz", ".br"))
+    staged.swap()
+    staged.cleanup()
+
+    # Only the variants of the staged files are carried over, and they are linked
+    assert sorted(local.listdir()) == [local.join("card.js"), local.join("card.js.gz")]
+    assert os.stat(local.join("card.js.gz")).st_ino == inode
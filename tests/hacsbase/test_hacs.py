@@ -1,8 +1,17 @@
 # pylint: disable=missing-module-docstring, missing-function-docstring
+import hashlib
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
 import pytest
 
 from custom_components.hacs.base import HacsRepositories
 from custom_components.hacs.enums import HacsCategory
+from custom_components.hacs.repositories.base import HacsRepository
+from custom_components.hacs.utils.blob_cache import blob_cache_key, git_blob_sha
+from custom_components.hacs.utils.http_cache import HttpCache, HttpCacheSession
+
+from tests.common import MockedResponse
 
 
 async def test_hacs(hacs, repository, tmpdir):
@@ -57,3 +66,239 @@ async def test_add_remove_repository(hacs, repository, tmpdir):
 
     # Verify second removal does not raise
     hacs.repositories.unregister(repository)
+
+
+async def test_repository_indexes(hacs, repository, tmpdir):
+    hacs.hass.config.config_dir = tmpdir
+
+    hacs.repositories = HacsRepositories()
+
+    repository.data.id = "1337"
+    repository.data.category = "integration"
+    repository.data.installed = False
+    repository.data.installed_version = "1"
+    repository.data.last_version = "2"
+
+    hacs.repositories.register(repository)
+    assert hacs.repositories.list_by_category(HacsCategory.INTEGRATION) == [repository]
+    assert hacs.repositories.list_downloaded == []
+    assert hacs.repositories.list_pending_update == []
+    assert not hacs.repositories.category_downloaded(category=HacsCategory.INTEGRATION)
+
+    repository.data.installed = True
+    assert hacs.repositories.list_downloaded == [repository]
+    assert hacs.repositories.list_pending_update == [repository]
+    assert hacs.repositories.category_downloaded(category=HacsCategory.INTEGRATION)
+
+    repository.data.installed_version = "2"
+    assert hacs.repositories.list_pending_update == []
+
+    repository.data.category = "plugin"
+    assert hacs.repositories.list_by_category(HacsCategory.INTEGRATION) == []
+    assert hacs.repositories.list_by_category(HacsCategory.PLUGIN) == [repository]
+    assert not hacs.repositories.category_downloaded(category=HacsCategory.INTEGRATION)
+    assert hacs.repositories.category_downloaded(category=HacsCategory.PLUGIN)
+
+    hacs.repositories.unregister(repository)
+    assert hacs.repositories.list_by_category(HacsCategory.PLUGIN) == []
+    assert hacs.repositories.list_downloaded == []
+
+    # Changes after unregister should not touch the indexes
+    repository.data.installed = False
+    repository.data.installed = True
+    assert hacs.repositories.list_downloaded == []
+
+
+async def test_repository_indexes_order(hacs, tmpdir):
+    hacs.hass.config.config_dir = tmpdir
+
+    hacs.repositories = HacsRepositories()
+    repositories = []
+    for index in range(1, 21):
+        repository = HacsRepository(hacs)
+        repository.data.id = str(index)
+        repository.data.full_name = f"test/test{index}"
+        repository.data.category = "integration"
+        repository.data.installed = True
+        hacs.repositories.register(repository)
+        repositories.append(repository)
+
+    # Repositories are listed in the order they were registered
+    assert hacs.repositories.list_by_category(HacsCategory.INTEGRATION) == repositories
+    assert hacs.repositories.list_downloaded == repositories
+
+    repositories[5].data.installed = False
+    repositories[5].data.installed = True
+    assert hacs.repositories.list_by_category(HacsCategory.INTEGRATION) == repositories
+
+
+async def test_repository_serialized_cache(hacs, repository, tmpdir):
+    hacs.hass.config.config_dir = tmpdir
+
+    hacs.repositories = HacsRepositories()
+    calls = []
+
+    def serializer(repo):
+        calls.append(repo)
+        return f'{{"id":"{repo.data.id}","state":"{repo.state}"}}'
+
+    repository.data.id = "1337"
+    hacs.repositories.register(repository)
+
+    assert (
+        hacs.repositories.get_serialized(repository, serializer) == '{"id":"1337","state":"None"}'
+    )
+    assert (
+        hacs.repositories.get_serialized(repository, serializer) == '{"id":"1337","state":"None"}'
+    )
+    assert len(calls) == 1
+
+    # Setting an unchanged value should keep the cached payload
+    repository.data.new = repository.data.new
+    hacs.repositories.get_serialized(repository, serializer)
+    assert len(calls) == 1
+
+    repository.data.stargazers_count = 42
+    hacs.repositories.get_serialized(repository, serializer)
+    assert len(calls) == 2
+
+    repository.state = "downloading"
+    assert (
+        hacs.repositories.get_serialized(repository, serializer)
+        == '{"id":"1337","state":"downloading"}'
+    )
+    assert len(calls) == 3
+
+    hacs.repositories.mark_default(repository)
+    hacs.repositories.get_serialized(repository, serializer)
+    assert len(calls) == 4
+
+
+async def test_repository_revisions(hacs, repository, tmpdir):
+    hacs.hass.config.config_dir = tmpdir
+
+    hacs.repositories = HacsRepositories()
+    notified = []
+    remove_listener = hacs.repositories.add_revision_listener(lambda: notified.append(True))
+    assert hacs.repositories.revision == 0
+
+    repository.data.id = "1337"
+    hacs.repositories.register(repository)
+    assert hacs.repositories.revision == 1
+    assert hacs.repositories.changes_since(0) == ([repository], [])
+    assert hacs.repositories.changes_since(1) == ([], [])
+
+    repository.data.new = repository.data.new
+    assert hacs.repositories.revision == 1
+
+    repository.data.stargazers_count = 42
+    assert hacs.repositories.revision == 2
+    assert hacs.repositories.changes_since(1) == ([repository], [])
+
+    hacs.repositories.unregister(repository)
+    assert hacs.repositories.revision == 3
+    assert hacs.repositories.changes_since(0) == ([], ["1337"])
+    assert hacs.repositories.changes_since(3) == ([], [])
+    assert len(notified) == 3
+
+    remove_listener()
+    hacs.repositories.register(repository)
+    assert hacs.repositories.changes_since(3) == ([repository], [])
+    assert len(notified) == 3
+
+
+async def test_repository_unhydrated(hacs, repository, tmpdir):
+    hacs.hass.config.config_dir = tmpdir
+
+    hacs.repositories = HacsRepositories()
+    hydrated = []
+
+    def _hydrator(repository_id, data):
+        hydrated.append(repository_id)
+        repository.data.id = repository_id
+        repository.data.full_name = data["full_name"]
+        hacs.repositories.register(repository)
+        return repository
+
+    hacs.repositories.hydrator = _hydrator
+    hacs.repositories.add_unhydrated("1337", {"category": "integration", "full_name": "test/test"})
+    hacs.repositories.add_unhydrated("1338", {"category": "plugin", "full_name": "test/other"})
+    assert hacs.repositories.count == 2
+    assert hacs.repositories.is_registered(repository_id="1337")
+    assert hacs.repositories.is_registered(repository_full_name="test/test")
+    assert hacs.repositories.list_by_category(HacsCategory.INTEGRATION, hydrate=False) == []
+    assert hacs.repositories.get_unhydrated("Test/Test") == (
+        "1337",
+        {"category": "integration", "full_name": "test/test"},
+    )
+
+    hacs.repositories.mark_default_unhydrated("1337")
+    assert hacs.repositories.is_default("1337")
+    assert not hydrated
+
+    assert hacs.repositories.get_by_full_name("test/test") is repository
+    assert hydrated == ["1337"]
+    assert hacs.repositories.get_unhydrated("test/test") is None
+    assert hacs.repositories.count == 2
+
+    revision = hacs.repositories.revision
+    hacs.repositories.remove_unhydrated("1338")
+    assert hacs.repositories.changes_since(revision) == ([], ["1338"])
+    assert hacs.repositories.list_all == [repository]
+    assert hydrated == ["1337"]
+
+
+async def test_download_file_to_path(hacs, response_mocker, tmpdir):
+    url = "https://raw.githubusercontent.com/test/test/main/card.js"
+    content = b"console.log('card');" * 10000
+    directory = tmpdir.mkdir("download")
+    target = directory.join("card.js")
+    key = blob_cache_key(git_blob_sha(content))
+
+    response_mocker.add(url, MockedResponse(content=content))
+    digest = await hacs.async_download_file_to_path(url, str(target), cache_key=key)
+    assert digest == hashlib.sha256(content).hexdigest()
+    assert target.read_binary() == content
+
+    # A failed download does not touch the existing file
+    response_mocker.add(url, response := MockedResponse(status=404))
+    assert await hacs.async_download_file_to_path(url, str(target), nolog=True) is None
+    assert response.released
+    assert target.read_binary() == content
+    assert sorted(path.basename for path in directory.listdir()) == ["card.js"]
+
+    # The content is cached, the network is not used
+    copy = directory.join("copy.js")
+    assert await hacs.async_download_file_to_path(url, str(copy), cache_key=key) == digest
+    assert copy.read_binary() == content
+
+
+async def test_download_file_to_path_streams_past_http_cache(hacs, tmpdir):
+    content = bytes(range(256)) * 400
+    requests = []
+
+    async def _handler(request: web.Request) -> web.Response:
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"1"':
+            return web.Response(status=304, headers={"ETag": '"1"'})
+        return web.Response(body=content, headers={"ETag": '"1"'})
+
+    app = web.Application()
+    app.router.add_get("/file.zip", _handler)
+    server = TestServer(app)
+    await server.start_server()
+    session = ClientSession()
+    hacs.session = HttpCacheSession(session, HttpCache(str(tmpdir.mkdir("http_cache"))))
+    try:
+        url = str(server.make_url("/file.zip"))
+        # Fill the HTTP cache, so a request through it would be answered with 304
+        assert await (await hacs.session.get(url)).read() == content
+
+        target = tmpdir.join("file.zip")
+        digest = await hacs.async_download_file_to_path(url, str(target))
+        assert digest == hashlib.sha256(content).hexdigest()
+        assert target.read_binary() == content
+        assert requests == [None, None]
+    finally:
+        await session.close()
+        await server.close()
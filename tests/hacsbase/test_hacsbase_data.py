@@ -1,9 +1,14 @@
 """Data Test Suite."""
-from unittest.mock import patch
+import os
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.helpers.json import json_loads
 
 from custom_components.hacs.base import HacsRepositories
-from custom_components.hacs.enums import HacsGitHubRepo
+from custom_components.hacs.enums import HacsDisabledReason, HacsGitHubRepo
 from custom_components.hacs.utils.data import HacsData
+from custom_components.hacs.utils.store import async_load_from_store
+from custom_components.hacs.websocket.repositories import _serialize_categories
 
 
 async def test_hacs_data_async_write1(hacs, repository):
@@ -67,3 +72,190 @@ async def test_hacs_data_restore_write_not_new(hacs, caplog):
         await data.async_write()
     assert mock_async_save_to_store.called
     assert "Loading base repository information" not in caplog.text
+
+
+async def test_hacs_data_async_write_only_changes(hacs, repository):
+    data = HacsData(hacs)
+    repository.data.category = "integration"
+    repository.data.installed = True
+    hacs.repositories.register(repository)
+    await data.async_write()
+    assert str(repository.data.id) in data.content
+
+    with patch(
+        "custom_components.hacs.utils.data.HacsData.async_store_repository_data"
+    ) as mock_store_repository_data, patch(
+        "custom_components.hacs.utils.data.get_store_for_key",
+        return_value=AsyncMock(),
+    ) as mock_get_store_for_key:
+        await data.async_write()
+        assert not mock_store_repository_data.called
+        assert not mock_get_store_for_key.called
+
+        repository.data.installed_version = "2"
+        await data.async_write()
+        mock_store_repository_data.assert_called_once_with(repository)
+        assert mock_get_store_for_key.call_args.args == (hacs.hass, "repositories")
+
+
+async def test_hacs_data_async_schedule_write(hacs):
+    data = HacsData(hacs, write_delay=10, write_max_delay=25)
+    with patch("custom_components.hacs.utils.data.HacsData.async_write") as mock_async_write, patch(
+        "custom_components.hacs.utils.data.async_call_later"
+    ) as mock_async_call_later:
+        data.async_schedule_write()
+        data.async_schedule_write()
+        assert data.as_dict() == {"write_requests": 2, "writes": 0, "pending": True}
+        # The pending timer is replaced, not added to
+        assert mock_async_call_later.call_count == 2
+        assert mock_async_call_later.return_value.call_count == 1
+        assert mock_async_call_later.call_args.args[1] <= 10
+
+        # Later requests can not postpone the write past the max delay
+        data._write_requested_at -= 20
+        data.async_schedule_write()
+        assert mock_async_call_later.call_args.args[1] <= 5
+
+        await mock_async_call_later.call_args.args[2]()
+        mock_async_write.assert_called_once_with()
+
+
+async def test_hacs_data_async_write_flushes_scheduled_write(hacs):
+    data = HacsData(hacs)
+    data.async_schedule_write()
+    assert data.as_dict()["pending"]
+    await data.async_write(force=True)
+    assert not data.as_dict()["pending"]
+    assert data._cancel_scheduled_write is None
+
+
+async def test_hacs_data_journal(hacs, repository):
+    data = HacsData(hacs, journal=True)
+    repository.data.category = "integration"
+    repository.data.installed = True
+    hacs.repositories.register(repository)
+    await data.async_write()
+    journal = data._get_journal("repositories")
+    assert journal.compactions == 1
+
+    repository.data.installed_version = "2"
+    await data.async_write()
+    assert journal.compactions == 1
+    assert journal.appends == 1
+    assert data.as_dict()["journal"]["repositories"]["appends"] == 1
+
+    restored = HacsData(hacs, journal=True)
+    assert (await restored._async_load_from_journal())[str(repository.data.id)][
+        "version_installed"
+    ] == "2"
+
+
+async def test_hacs_data_journal_disabled(hacs, repository):
+    data = HacsData(hacs, journal=True)
+    repository.data.category = "integration"
+    repository.data.installed = True
+    hacs.repositories.register(repository)
+    await data.async_write()
+    repository.data.installed_version = "2"
+    await data.async_write()
+    journal = data._get_journal("repositories")
+    assert os.path.exists(journal.path)
+
+    # The journal is replayed and removed when it is no longer enabled
+    repository.data.installed_version = "1"
+    restored = HacsData(hacs)
+    await restored.restore()
+    assert repository.data.installed_version == "2"
+    await restored.async_write(force=True)
+    assert not os.path.exists(journal.path)
+    assert (await async_load_from_store(hacs.hass, "repositories"))[str(repository.data.id)][
+        "version_installed"
+    ] == "2"
+
+
+async def test_hacs_data_journal_corrupt_snapshot(hacs, repository):
+    data = HacsData(hacs, journal=True)
+    repository.data.category = "integration"
+    repository.data.installed = True
+    hacs.repositories.register(repository)
+    await data.async_write()
+    journal = data._get_journal("data" if hacs.configuration.experimental else "repositories")
+    with open(journal.store.path, "w", encoding="utf-8") as file:
+        file.write("{not json")
+
+    # A snapshot that can not be read disables HACS instead of failing the restore
+    assert await HacsData(hacs, journal=True).restore() is False
+    assert hacs.system.disabled_reason == HacsDisabledReason.RESTORE
+    os.remove(journal.store.path)
+
+
+async def test_hacs_data_lazy_restore(hacs):
+    data = HacsData(hacs)
+    stored = {
+        "202226247": {
+            "category": "integration",
+            "full_name": "shbatm/hacs-isy994",
+            "installed": False,
+            "description": "ISY994",
+            "stars": 5,
+            "topics": ["hacs", "isy994"],
+            "manifest": {"name": "ISY994", "render_readme": True},
+            "last_fetched": 1685620800,
+        },
+    }
+
+    async def _mocked_loads(hass, key):
+        return stored if key == "repositories" else {}
+
+    with patch(
+        "custom_components.hacs.utils.data.async_load_from_store",
+        side_effect=_mocked_loads,
+    ):
+        await data.restore()
+
+    assert hacs.repositories.is_registered(repository_id="202226247")
+    unhydrated = hacs.repositories.unhydrated["202226247"]
+
+    repository = hacs.repositories.get_by_full_name("shbatm/hacs-isy994")
+    assert repository.data.stargazers_count == 5
+    assert repository.repository_manifest.render_readme
+    assert "202226247" not in hacs.repositories.unhydrated
+
+    # The stored data of the created repository is the same
+    data.async_store_repository_data(repository)
+    assert data.content["202226247"] == unhydrated
+
+
+async def test_hacs_data_lazy_restore_listed(hacs):
+    hacs.data = data = HacsData(hacs)
+    stored = {
+        "202226247": {
+            "category": "integration",
+            "full_name": "shbatm/hacs-isy994",
+            "installed": False,
+            "description": "ISY994",
+            "stars": 5,
+            "manifest": {"name": "ISY994"},
+            "last_fetched": 1685620800,
+        },
+    }
+
+    async def _mocked_loads(hass, key):
+        return stored if key == "repositories" else {}
+
+    with patch(
+        "custom_components.hacs.utils.data.async_load_from_store",
+        side_effect=_mocked_loads,
+    ):
+        await data.restore()
+
+    # Listing serializes the stored data without creating the repository
+    listed = _serialize_categories(hacs, {"integration"})
+    assert "202226247" in hacs.repositories.unhydrated
+    assert {entry["id"]: entry for entry in map(json_loads, listed)}["202226247"]["stars"] == 5
+    assert sorted(_serialize_categories(hacs, {"integration"})) == sorted(listed)
+
+    # The created repository is listed the same way
+    hacs.repositories.get_by_full_name("shbatm/hacs-isy994")
+    assert "202226247" not in hacs.repositories.unhydrated
+    assert sorted(_serialize_categories(hacs, {"integration"})) == sorted(listed)
@@ -1,4 +1,10 @@
-from custom_components.hacs.repositories.base import RepositoryData
+from aiogithubapi import GitHubReleaseModel
+
+from custom_components.hacs.repositories.base import (
+    ReleaseInfo,
+    RepositoryData,
+    RepositoryReleases,
+)
 
 
 def test_guarded():
@@ -12,3 +18,33 @@ def test_guarded():
     test["name"] = "new"
 
     assert data.name != "new"
+
+
+def test_compact():
+    data = RepositoryData.create_from_dict({"full_name": "test", "authors": ["@ludeeus"]})
+    other = RepositoryData.create_from_dict({"full_name": "other", "authors": ["@ludeeus"]})
+    assert not hasattr(data, "__dict__")
+    assert data.authors[0] is other.authors[0]
+    assert "full_name_lower" not in data.to_json()
+    assert "_listener" not in data.to_json()
+
+    data.update_data({"_listener": "new", "full_name_lower": "new"})
+    assert data.full_name_lower == ""
+
+
+def test_release_info():
+    releases = RepositoryReleases()
+    releases.objects = [
+        GitHubReleaseModel(
+            {
+                "tag_name": "1.0.0",
+                "prerelease": True,
+                "assets": [{"id": 1, "name": "test.zip", "download_count": 5}],
+            }
+        )
+    ]
+    assert isinstance(releases.objects[0], ReleaseInfo)
+    assert releases.objects[0].tag_name == "1.0.0"
+    assert releases.objects[0].prerelease
+    assert releases.objects[0].assets[0].name == "test.zip"
+    assert releases.objects[0].assets[0].download_count == 5
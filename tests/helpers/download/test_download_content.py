@@ -0,0 +1,57 @@
+"""Helpers: Download: download_content."""
+# pylint: disable=missing-docstring
+from aiogithubapi.objects.repository.content import AIOGitHubAPIRepositoryTreeContent
+
+from custom_components.hacs.utils.blob_cache import git_blob_sha
+
+from tests.common import MockedResponse, ResponseMocker
+
+
+async def test_download_content_incremental(repository, response_mocker: ResponseMocker, tmpdir):
+    local = tmpdir.mkdir("custom").mkdir("test")
+    local.join("unchanged.py").write_binary(b"unchanged")
+    local.join("modified.py").write_binary(b"old")
+    local.join("removed.py").write_binary(b"removed")
+
+    repository.content.path.remote = "custom_components/test"
+    repository.content.path.local = str(local)
+    repository.data.installed = True
+    repository.data.installed_files = {
+        "unchanged.py": git_blob_sha(b"unchanged"),
+        "modified.py": git_blob_sha(b"old"),
+        "removed.py": git_blob_sha(b"removed"),
+    }
+    repository.tree = [
+        AIOGitHubAPIRepositoryTreeContent(
+            {
+                "path": f"custom_components/test/{name}",
+                "type": "blob",
+                "sha": git_blob_sha(content),
+            },
+            "test/test",
+            "main",
+        )
+        for name, content in (
+            ("unchanged.py", b"unchanged"),
+            ("modified.py", b"new"),
+            ("added/file.py", b"added"),
+        )
+    ]
+
+    for name, content in (("modified.py", b"new"), ("added/file.py", b"added")):
+        response_mocker.add(
+            f"https://raw.githubusercontent.com/test/test/main/custom_components/test/{name}",
+            MockedResponse(content=content),
+        )
+
+    installed_files = await repository.download_content()
+    assert installed_files == {
+        "unchanged.py": git_blob_sha(b"unchanged"),
+        "modified.py": git_blob_sha(b"new"),
+        "added/file.py": git_blob_sha(b"added"),
+    }
+    assert not repository.validate.errors
+    assert local.join("modified.py").read_binary() == b"new"
+    assert local.join("added", "file.py").read_binary() == b"added"
+    assert local.join("unchanged.py").read_binary() == b"unchanged"
+    assert not local.join("removed.py").exists()
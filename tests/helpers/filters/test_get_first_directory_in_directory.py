@@ -3,6 +3,7 @@
 from aiogithubapi.objects.repository.content import AIOGitHubAPIRepositoryTreeContent
 
 from custom_components.hacs.utils import filters
+from custom_components.hacs.utils.tree import RepositoryTree
 
 
 def test_valid():
@@ -25,3 +26,24 @@ def test_not_valid():
         )
     ]
     assert filters.get_first_directory_in_directory(tree, "test") is None
+
+
+def test_repository_tree():
+    tree = RepositoryTree(
+        [
+            AIOGitHubAPIRepositoryTreeContent(
+                {"path": "test.md", "type": "blob"}, "test/test", "main"
+            ),
+            AIOGitHubAPIRepositoryTreeContent(
+                {"path": "test", "type": "tree"}, "test/test", "main"
+            ),
+            AIOGitHubAPIRepositoryTreeContent(
+                {"path": "test/path", "type": "tree"}, "test/test", "main"
+            ),
+            AIOGitHubAPIRepositoryTreeContent(
+                {"path": "test/a.py", "type": "blob"}, "test/test", "main"
+            ),
+        ]
+    )
+    assert filters.get_first_directory_in_directory(tree, "test") == "path"
+    assert filters.get_first_directory_in_directory(tree, "other") is None
@@ -0,0 +1,94 @@
+from base64 import b64encode
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogithubapi import GitHubGitTreeModel
+from aiogithubapi.objects.repository.content import AIOGitHubAPIRepositoryTreeContent
+
+from custom_components.hacs.repositories.base import TREE_SCOPED_REPOSITORY_SIZE
+from custom_components.hacs.repositories.integration import HacsIntegrationRepository
+from custom_components.hacs.utils.blob_cache import BlobCache
+
+
+def _response(*paths: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        data=GitHubGitTreeModel(
+            {
+                "tree": [
+                    {"path": path, "type": "blob" if "." in path else "tree", "sha": f"sha-{path}"}
+                    for path in paths
+                ],
+            }
+        )
+    )
+
+
+async def test_get_scoped_tree(repository_integration: HacsIntegrationRepository):
+    repository_integration.repository_object = MagicMock(
+        attributes={"size": TREE_SCOPED_REPOSITORY_SIZE},
+        get_tree=AsyncMock(),
+    )
+    git = repository_integration.hacs.githubapi.repos.git
+    git.get_tree = AsyncMock(
+        side_effect=[
+            _response("custom_components", "docs", "hacs.json"),
+            _response("test", "test/__init__.py", "test/manifest.json"),
+        ]
+    )
+
+    tree = await repository_integration.get_tree("main")
+    assert list(tree.paths) == [
+        "custom_components",
+        "custom_components/test",
+        "custom_components/test/__init__.py",
+        "custom_components/test/manifest.json",
+        "docs",
+        "hacs.json",
+    ]
+    assert tree.scope == ("custom_components",)
+    assert tree.get("custom_components/test/manifest.json").sha == "sha-test/manifest.json"
+    assert git.get_tree.call_args.kwargs["tree_sha"] == "sha-custom_components"
+    assert not repository_integration.repository_object.get_tree.called
+
+    # Content in the root needs the full tree
+    repository_integration.tree = tree
+    repository_integration.repository_manifest.content_in_root = True
+    await repository_integration.async_use_full_tree()
+    repository_integration.repository_object.get_tree.assert_called_once()
+
+
+async def test_get_tree_at_commit(repository_integration: HacsIntegrationRepository, tmpdir):
+    hacs = repository_integration.hacs
+    hacs.blob_cache = BlobCache(str(tmpdir))
+    hacs.githubapi.generic = AsyncMock(return_value=SimpleNamespace(data=f"{'a' * 40}\n"))
+    hacs.githubapi.repos.contents.get = AsyncMock(
+        return_value=SimpleNamespace(
+            data=SimpleNamespace(content=b64encode(b'{"name": "test"}').decode())
+        )
+    )
+    repository_integration.repository_object = MagicMock(
+        attributes={},
+        get_tree=AsyncMock(
+            return_value=[
+                AIOGitHubAPIRepositoryTreeContent(
+                    {"path": "hacs.json", "type": "blob", "sha": "1"}, "test/test", "main"
+                )
+            ]
+        ),
+    )
+
+    for _ in range(2):
+        assert await repository_integration.async_resolve_commit("main") == "a" * 40
+        repository_integration.tree = await repository_integration.async_get_tree_at_commit("main")
+        assert repository_integration.tree.get("hacs.json").sha == "1"
+        assert await repository_integration.async_get_hacs_json("main") == {"name": "test"}
+
+    # The second update used the content cached for the commit
+    repository_integration.repository_object.get_tree.assert_called_once()
+    hacs.githubapi.repos.contents.get.assert_called_once()
+
+    # Without a resolved commit nothing is cached
+    hacs.githubapi.generic.return_value = SimpleNamespace(data="Not Found")
+    assert await repository_integration.async_resolve_commit("main") is None
+    await repository_integration.async_get_tree_at_commit("main")
+    assert repository_integration.repository_object.get_tree.call_count == 2
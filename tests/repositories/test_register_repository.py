@@ -101,3 +101,111 @@ async def test_register_repository_failures(
     assert len(messages) == 1
     assert messages[0]["action"] == "add_repository"
     assert messages[0]["message"] == result
+
+
+async def test_register_repository_listed(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    hacs = get_hacs(hass)
+    repository_full_name = "hacs-test-org/integration-basic-custom"
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/add",
+        {"repository": repository_full_name, "category": HacsCategory.INTEGRATION},
+    )
+    assert response["success"] == True
+    repo = hacs.repositories.get_by_full_name(repository_full_name)
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/list", {"categories": [HacsCategory.INTEGRATION]}
+    )
+    assert response["success"] == True
+    listed = next(
+        entry for entry in response["result"] if entry["full_name"] == repository_full_name
+    )
+    assert listed["id"] == repo.data.id
+    assert listed["custom"] == True
+    assert listed["new"] == False
+
+    repo.data.new = True
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/list", {"categories": [HacsCategory.INTEGRATION]}
+    )
+    listed = next(
+        entry for entry in response["result"] if entry["full_name"] == repository_full_name
+    )
+    assert listed["new"] == True
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/clear_new", {"repository": repo.data.id}
+    )
+    assert response["success"] == True
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/list", {"categories": [HacsCategory.INTEGRATION]}
+    )
+    listed = next(
+        entry for entry in response["result"] if entry["full_name"] == repository_full_name
+    )
+    assert listed["new"] == False
+
+
+async def test_register_repository_changes(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    hacs = get_hacs(hass)
+    repository_full_name = "hacs-test-org/integration-basic-custom"
+
+    response = await ws_client.send_and_receive_json("hacs/repositories/changes", {})
+    assert response["success"] == True
+    assert response["result"]["full"] == True
+    assert response["result"]["removed"] == []
+    epoch = response["result"]["epoch"]
+    revision = response["result"]["revision"]
+
+    await ws_client.send_and_receive_json(
+        "hacs/repositories/add",
+        {"repository": repository_full_name, "category": HacsCategory.INTEGRATION},
+    )
+    repo = hacs.repositories.get_by_full_name(repository_full_name)
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/changes", {"epoch": epoch, "revision": revision}
+    )
+    assert response["result"]["full"] == False
+    assert repository_full_name in [
+        entry["full_name"] for entry in response["result"]["repositories"]
+    ]
+    revision = response["result"]["revision"]
+
+    # Unknown epochs fall back to a full listing
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/changes", {"epoch": "unknown", "revision": revision}
+    )
+    assert response["result"]["full"] == True
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/subscribe", {"epoch": epoch, "revision": revision}
+    )
+    assert response["success"] == True
+
+    repo.data.new = True
+    response = await ws_client.receive_json()
+    assert response["type"] == "event"
+    assert response["event"]["full"] == False
+    assert response["event"]["revision"] > revision
+    assert [entry["full_name"] for entry in response["event"]["repositories"]] == [
+        repository_full_name
+    ]
+    assert response["event"]["repositories"][0]["new"] == True
+
+    await ws_client.send_json("hacs/repositories/remove", {"repository": repo.data.id})
+    removed = []
+    while str(repo.data.id) not in removed:
+        response = await ws_client.receive_json()
+        if response["type"] == "event":
+            removed.extend(response["event"]["removed"])
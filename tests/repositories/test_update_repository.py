@@ -81,6 +81,8 @@ async def test_update_repository_websocket(
     )
     assert response["success"] == True
     assert repo.data.installed_version == category_test_data["version_update"]
+    # The install state is stored before the result is sent
+    assert not hacs.data.as_dict()["pending"]
 
     await snapshots.assert_hacs_data(
         hacs, f"{category_test_data['repository']}/test_update_repository_websocket.json"
@@ -147,7 +149,7 @@ async def test_update_repository_entity_old_core_version(
 
     response_mocker.add(
         "https://raw.githubusercontent.com/hacs-test-org/integration-basic/3.0.0/hacs.json",
-        MockedResponse(content=json.dumps({"homeassistant": "9999.99.99"})),
+        MockedResponse(content=json.dumps({"homeassistant": "9999.99.99"}).encode()),
     )
 
     # Get a new HACS instance after reload
@@ -187,7 +189,7 @@ async def test_update_repository_entity_old_hacs_version(
 
     response_mocker.add(
         "https://raw.githubusercontent.com/hacs-test-org/integration-basic/3.0.0/hacs.json",
-        MockedResponse(content=json.dumps({"hacs": "9999.99.99"})),
+        MockedResponse(content=json.dumps({"hacs": "9999.99.99"}).encode()),
     )
 
     # Get a new HACS instance after reload
@@ -0,0 +1,56 @@
+from typing import Generator
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.utils.blob_cache import git_blob_sha
+
+from tests.common import WSClient, get_hacs
+
+
+async def test_verify_repository(
+    hass: HomeAssistant,
+    setup_integration: Generator,
+    ws_client: WSClient,
+):
+    hacs = get_hacs(hass)
+    repo = hacs.repositories.get_by_full_name("hacs-test-org/plugin-basic")
+
+    # workaround for local path bug in tests
+    repo.content.path.local = repo.localpath
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repository/download", {"repository": repo.data.id}
+    )
+    assert response["success"] == True
+    assert list(repo.data.installed_files) == ["plugin-basic.js"]
+
+    # The tree fixtures use a placeholder blob SHA
+    with open(f"{repo.content.path.local}/plugin-basic.js", "rb") as file:
+        repo.data.installed_files = {"plugin-basic.js": git_blob_sha(file.read())}
+
+    response = await ws_client.send_and_receive_json(
+        "hacs/repositories/verify", {"repository_ids": [repo.data.id]}
+    )
+    assert response["result"] == [
+        {
+            "repository": "hacs-test-org/plugin-basic",
+            "repository_id": repo.data.id,
+            "status": "ok",
+            "added": [],
+            "missing": [],
+            "modified": [],
+        }
+    ]
+
+    with open(f"{repo.content.path.local}/plugin-basic.js", "a", encoding="utf-8") as file:
+        file.write("// changed")
+
+    response = await ws_client.send_and_receive_json("hacs/repositories/verify", {})
+    reports = {report["repository"]: report for report in response["result"]}
+    assert reports["hacs-test-org/plugin-basic"]["status"] == "drift"
+    assert reports["hacs-test-org/plugin-basic"]["modified"] == ["plugin-basic.js"]
+
+    with patch("custom_components.hacs.services.async_create_persistent_notification") as notify:
+        await hass.services.async_call("hacs", "verify", {}, blocking=True)
+    assert "hacs-test-org/plugin-basic" in notify.call_args.kwargs["message"]
@@ -333,6 +333,8 @@ async def test_options_flow(hass: HomeAssistant, setup_integration: Generator) -
         "release_limit": 5,
         "sidepanel_icon": "hacs:hacs",
         "sidepanel_title": "new_title",
+        "storage_codec": "json",
+        "storage_journal": False,
     }
     assert config_entry.data == {"token": TOKEN}
     assert config_entry.options == {
@@ -344,6 +346,8 @@ async def test_options_flow(hass: HomeAssistant, setup_integration: Generator) -
         "release_limit": 5,
         "sidepanel_icon": "hacs:hacs",
         "sidepanel_title": "new_title",
+        "storage_codec": "json",
+        "storage_journal": False,
     }
 
     # Check config entry is reloaded with new options
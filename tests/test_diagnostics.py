@@ -20,10 +20,23 @@ async def test_diagnostics(hacs: HacsBase, snapshots: SnapshotFixture):
     )
 
     assert TOKEN not in str(diagnostics)
+    # Limits depend on the measured latency, so only the keys are checked
+    for limiter in diagnostics["concurrency"].values():
+        assert set(limiter) == {
+            "active",
+            "calls",
+            "latency",
+            "limit",
+            "maximum",
+            "minimum",
+            "throttled",
+            "waiting",
+        }
     snapshots.assert_match(
         safe_json_dumps(
             recursive_remove_key(
-                diagnostics, ("entry_id", "last_updated", "local", "minor_version")
+                diagnostics,
+                ("concurrency", "entry_id", "last_updated", "local", "minor_version"),
             )
         ),
         "diagnostics/base.json",
@@ -45,7 +58,8 @@ async def test_diagnostics_with_exception(
     snapshots.assert_match(
         safe_json_dumps(
             recursive_remove_key(
-                diagnostics, ("entry_id", "last_updated", "local", "minor_version")
+                diagnostics,
+                ("concurrency", "entry_id", "last_updated", "local", "minor_version"),
             )
         ),
         "diagnostics/exception.json",
@@ -0,0 +1,66 @@
+"""Archive tests."""
+import io
+import zipfile
+
+import pytest
+
+from custom_components.hacs.exceptions import HacsException
+from custom_components.hacs.utils.archive import extract_zip
+
+
+def create_zip(files: dict[str, bytes]) -> io.BytesIO:
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(fileobj, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    fileobj.seek(0)
+    return fileobj
+
+
+def test_extract_zip(tmpdir) -> None:
+    progress = []
+    archive = create_zip({"file.py": b"content", "sub/other.py": b"other"})
+
+    assert extract_zip(archive, str(tmpdir), progress=lambda *args: progress.append(args)) == 2
+    assert tmpdir.join("file.py").read_binary() == b"content"
+    assert tmpdir.join("sub", "other.py").read_binary() == b"other"
+    assert progress == [(1, 2), (2, 2)]
+
+
+def test_extract_zip_remote_path(tmpdir) -> None:
+    archive = create_zip(
+        {
+            "repo-1.0.0/README.md": b"readme",
+            "repo-1.0.0/custom_components/test/__init__.py": b"init",
+            "repo-1.0.0/custom_components/testing/__init__.py": b"other",
+        }
+    )
+
+    assert (
+        extract_zip(
+            archive,
+            str(tmpdir),
+            remote_path="custom_components/test",
+            strip_root=True,
+        )
+        == 1
+    )
+    assert tmpdir.listdir() == [tmpdir.join("__init__.py")]
+    assert tmpdir.join("__init__.py").read_binary() == b"init"
+
+    with pytest.raises(HacsException, match="No content to extract"):
+        extract_zip(archive, str(tmpdir), remote_path="missing", strip_root=True)
+
+
+def test_extract_zip_limits(tmpdir) -> None:
+    archive = create_zip({"1.py": b"12345", "2.py": b"12345"})
+
+    with pytest.raises(HacsException, match="more than 1 members"):
+        extract_zip(archive, str(tmpdir), max_members=1)
+    with pytest.raises(HacsException, match="larger than 9 bytes"):
+        extract_zip(archive, str(tmpdir), max_size=9)
+    assert tmpdir.listdir() == []
+
+    with pytest.raises(HacsException, match="outside the target"):
+        extract_zip(create_zip({"../outside.py": b""}), str(tmpdir.mkdir("target")))
+    assert not tmpdir.join("outside.py").exists()
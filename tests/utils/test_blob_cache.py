@@ -0,0 +1,65 @@
+"""Blob cache tests."""
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.utils.blob_cache import (
+    BlobCache,
+    asset_cache_key,
+    blob_cache_key,
+    git_blob_sha,
+)
+
+from tests.common import MockedResponse, ResponseMocker
+
+
+def test_cache_keys() -> None:
+    assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+    assert blob_cache_key("abc") == "blob-abc"
+    assert blob_cache_key(None) is None
+    assert asset_cache_key(123) == "asset-123"
+    assert asset_cache_key(None) is None
+
+
+async def test_blob_cache(tmpdir) -> None:
+    cache = BlobCache(str(tmpdir), max_size=10)
+    await cache.async_set("asset-1", b"12345")
+    await cache.async_set("asset-2", b"12345")
+    assert await cache.async_get("asset-1") == b"12345"
+
+    # "2" is the least recently used entry
+    await cache.async_set("asset-3", b"12345")
+    assert await cache.async_get("asset-2") is None
+
+    # Content that does not match the blob SHA is not cached
+    await cache.async_set("blob-abc", b"12345")
+    assert await cache.async_get("blob-abc") is None
+
+    assert cache.as_dict() == {
+        "entries": 2,
+        "size": 10,
+        "max_size": 10,
+        "hits": 1,
+        "misses": 2,
+        "stores": 3,
+        "evictions": 1,
+    }
+
+    # Entries are restored from disk
+    assert await BlobCache(str(tmpdir)).async_get("asset-3") == b"12345"
+
+
+async def test_download_file_uses_blob_cache(
+    hass: HomeAssistant,
+    hacs: HacsBase,
+    response_mocker: ResponseMocker,
+) -> None:
+    url = "https://raw.githubusercontent.com/test/test/main/file.js"
+    key = blob_cache_key(git_blob_sha(b"content"))
+    response_mocker.add(url, MockedResponse(content=b"content", headers={"ETag": '"etag"'}))
+
+    assert await hacs.async_download_file(url, cache_key=key) == b"content"
+    # The mocked response is consumed, the second download is served from the cache
+    assert await hacs.async_download_file(url, cache_key=key) == b"content"
+    assert hacs.blob_cache.hits == 1
+    # Content kept in the blob cache is not stored a second time in the HTTP cache
+    assert hacs.http_cache.stores == 0
@@ -0,0 +1,69 @@
+"""Compress tests."""
+import gzip
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.hacs.utils.compress import (
+    AssetCompressor,
+    find_compressible_files,
+)
+from custom_components.hacs.utils.compress_worker import compress_file
+
+
+def test_compress_file(tmpdir) -> None:
+    source = tmpdir.join("card.js")
+    source.write_binary(b"console.log('card');" * 100)
+
+    written = compress_file(str(source))
+    assert str(tmpdir.join("card.js.gz")) in written
+    assert gzip.decompress(tmpdir.join("card.js.gz").read_binary()) == source.read_binary()
+
+    # Variants of unchanged content are not written again
+    assert compress_file(str(source)) == []
+
+    source.write_binary(b"console.log('changed');")
+    assert str(tmpdir.join("card.js.gz")) in compress_file(str(source))
+    assert gzip.decompress(tmpdir.join("card.js.gz").read_binary()) == b"console.log('changed');"
+
+
+def test_compress_file_failed_write(tmpdir) -> None:
+    source = tmpdir.join("card.js")
+    source.write_binary(b"console.log('card');")
+
+    def _fail(content: bytes) -> bytes:
+        raise OSError("No space left on device")
+
+    with patch(
+        "custom_components.hacs.utils.compress_worker.compressed_variants",
+        return_value=[(".gz", _fail, gzip.decompress)],
+    ), pytest.raises(OSError):
+        compress_file(str(source))
+    # The temporary file of the variant is removed
+    assert tmpdir.listdir() == [source]
+
+
+def test_find_compressible_files(tmpdir) -> None:
+    tmpdir.join("card.js").write("")
+    tmpdir.join("card.js.gz").write("")
+    tmpdir.mkdir("dist").join("style.css").write("")
+    tmpdir.join("image.png").write("")
+
+    assert sorted(find_compressible_files(str(tmpdir))) == [
+        str(tmpdir.join("card.js")),
+        str(tmpdir.join("dist", "style.css")),
+    ]
+
+
+async def test_asset_compressor(tmpdir) -> None:
+    tmpdir.join("card.js").write("console.log('card');")
+    tmpdir.join("other.js").write("console.log('other');")
+    compressor = AssetCompressor()
+
+    try:
+        assert await compressor.async_compress_directory(str(tmpdir)) >= 2
+        assert tmpdir.join("card.js.gz").exists()
+        assert await compressor.async_compress_directory(str(tmpdir)) == 0
+        assert compressor.skipped == 2
+    finally:
+        compressor.shutdown()
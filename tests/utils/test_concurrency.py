@@ -0,0 +1,92 @@
+"""Adaptive concurrency tests."""
+import asyncio
+
+from aiogithubapi import GitHubRatelimitException
+import pytest
+
+from custom_components.hacs.exceptions import HacsException
+from custom_components.hacs.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyController,
+    report_throttled,
+)
+from custom_components.hacs.utils.decorator import concurrent
+
+
+async def test_limiter_additive_increase_multiplicative_decrease() -> None:
+    limiter = AdaptiveConcurrencyLimiter("test", initial=4, maximum=5)
+
+    for _ in range(4):
+        await limiter.acquire()
+        limiter.release(0.1, False)
+    assert limiter.limit == pytest.approx(4.92, abs=0.01)
+    assert limiter.calls == 4
+
+    await limiter.acquire()
+    limiter.release(0.1, True)
+    assert int(limiter.limit) == 2
+    assert limiter.throttled == 1
+
+    # Slow calls do not raise the limit
+    limit = limiter.limit
+    await limiter.acquire()
+    limiter.release(10, False)
+    assert limiter.limit == limit
+
+
+async def test_limiter_waits_for_free_slot() -> None:
+    limiter = AdaptiveConcurrencyLimiter("test", initial=1)
+    started = []
+    release = asyncio.Event()
+
+    async def task(name: str) -> None:
+        started.append(name)
+        await release.wait()
+
+    first = asyncio.create_task(limiter.run(task, "first"))
+    second = asyncio.create_task(limiter.run(task, "second"))
+    await asyncio.sleep(0)
+    assert started == ["first"]
+    assert limiter.active == 1
+    assert limiter.waiting == 1
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert started == ["first", "second"]
+    assert limiter.active == 0
+    assert limiter.waiting == 0
+
+
+async def test_limiter_throttle_signals() -> None:
+    limiter = AdaptiveConcurrencyLimiter("test", initial=8)
+
+    async def throttled_response() -> None:
+        report_throttled()
+
+    async def wrapped_ratelimit() -> None:
+        raise HacsException(GitHubRatelimitException("rate limit"))
+
+    await limiter.run(throttled_response)
+    assert limiter.limit == 4
+
+    with pytest.raises(HacsException):
+        await limiter.run(wrapped_ratelimit)
+    assert limiter.limit == 2
+    assert limiter.throttled == 2
+
+
+async def test_concurrent_decorator_uses_hacs_controller() -> None:
+    class Hacs:
+        concurrency = ConcurrencyController()
+
+    class Repository:
+        hacs = Hacs()
+
+        @concurrent(concurrenttasks=3, maxtasks=6)
+        async def update(self) -> str:
+            return "updated"
+
+    assert await Repository().update() == "updated"
+    limiter = Hacs.concurrency.limiters["update"]
+    assert limiter.maximum == 6
+    assert limiter.calls == 1
@@ -0,0 +1,302 @@
+"""Batched GraphQL metadata tests."""
+from typing import Any
+
+from aiogithubapi import GitHubGraphQLException
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.integration import HacsIntegrationRepository
+from custom_components.hacs.utils.graphql import (
+    async_fetch_repository_metadata,
+    build_repository_metadata_query,
+    parse_repository_metadata,
+)
+
+from tests.common import MockedResponse, ResponseMocker, dummy_repository_base
+
+
+def repository_node(full_name: str, **kwargs: Any) -> dict[str, Any]:
+    return {
+        "databaseId": 1337,
+        "nameWithOwner": full_name,
+        "description": "Repository description",
+        "isArchived": False,
+        "hasIssuesEnabled": True,
+        "stargazerCount": 42,
+        "pushedAt": "2023-01-01T00:00:00Z",
+        "issues": {"totalCount": 3},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "lights"}}]},
+        "defaultBranchRef": {
+            "name": "main",
+            "target": {
+                "oid": "1234567890abcdef",
+                "hacsJson": {"object": {"text": '{"name": "Test", "render_readme": true}'}},
+            },
+        },
+        "latestRelease": {
+            "tagName": "1.0.0",
+            "tagCommit": {
+                "oid": "abcdef1234567890",
+                "hacsJson": {"object": {"text": '{"name": "Released", "render_readme": true}'}},
+                "manifestJson": {
+                    "object": {
+                        "text": '{"domain": "example", "name": "Example", "codeowners": ["@me"]}'
+                    }
+                },
+            },
+        },
+        "releases": {
+            "nodes": [
+                {
+                    "tagName": "2.0.0b0",
+                    "name": "2.0.0b0",
+                    "isDraft": False,
+                    "isPrerelease": True,
+                    "publishedAt": "2023-01-01T00:00:00Z",
+                    "releaseAssets": {"nodes": []},
+                },
+                {
+                    "tagName": "1.0.0",
+                    "name": "1.0.0",
+                    "isDraft": False,
+                    "isPrerelease": False,
+                    "publishedAt": "2022-12-01T00:00:00Z",
+                    "releaseAssets": {
+                        "nodes": [
+                            {
+                                "databaseId": 1,
+                                "name": "example.zip",
+                                "downloadCount": 99,
+                                "downloadUrl": "https://example.com/example.zip",
+                            }
+                        ]
+                    },
+                },
+            ]
+        },
+        **kwargs,
+    }
+
+
+def test_build_repository_metadata_query() -> None:
+    query = build_repository_metadata_query(
+        [("owner/name", None), ('owner/"quoted"', "custom_components/example/manifest.json")]
+    )
+    assert 'repository0: repository(owner: "owner", name: "name")' in query
+    assert 'repository1: repository(owner: "owner", name: "\\"quoted\\"")' in query
+    assert query.count("manifestJson") == 2
+    assert query.count("hacsJson") == 4
+    assert query.count("oid") == 4
+
+
+def test_parse_repository_metadata() -> None:
+    metadata = parse_repository_metadata(repository_node("Owner/Name"))
+    assert metadata.full_name == "Owner/Name"
+    assert metadata.attributes["topics"] == ["lights"]
+    assert metadata.attributes["open_issues"] == 3
+    assert metadata.attributes["default_branch"] == "main"
+    assert metadata.last_commit == "1234567"
+    assert [release.tag_name for release in metadata.releases] == ["2.0.0b0", "1.0.0"]
+    assert metadata.releases[1].assets[0].download_count == 99
+    assert metadata.files_for_ref("tags/1.0.0").manifest_json is not None
+    assert metadata.files_for_ref("main").commit == "1234567890abcdef"
+    assert metadata.files_for_ref("tags/1.0.0").commit == "abcdef1234567890"
+    assert metadata.files_for_ref("other") is None
+
+
+async def test_fetch_repository_metadata_splits_failing_batches() -> None:
+    calls = []
+
+    class GitHubAPI:
+        async def graphql(self, query: str, variables: dict[str, Any]):
+            calls.append(query.count("repository("))
+            if '"broken"' in query:
+                raise GitHubGraphQLException("Could not resolve to a Repository")
+
+            class Response:
+                data = {
+                    "data": {
+                        f"repository{index}": repository_node(f"owner/repo{index}")
+                        for index in range(query.count("repository("))
+                    }
+                }
+
+            return Response()
+
+    result = await async_fetch_repository_metadata(
+        GitHubAPI(),
+        [("owner/repo0", None), ("owner/broken", None), ("owner/repo2", None), ("owner/x", None)],
+        batch_size=4,
+    )
+    assert calls == [4, 2, 1, 1, 2]
+    assert result["owner/broken"] is None
+    assert result["owner/repo0"] is not None
+    assert len(result) == 4
+
+
+async def test_update_repositories_metadata(
+    hass: HomeAssistant,
+    hacs: HacsBase,
+    response_mocker: ResponseMocker,
+) -> None:
+    repository = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/test"))
+    repository.data.domain = "example"
+    repository.data.selected_tag = None
+    renamed = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/renamed"))
+    renamed.data.full_name = "test/renamed"
+
+    response_mocker.add(
+        "https://api.github.com/graphql",
+        MockedResponse(
+            content={
+                "data": {
+                    "repository0": repository_node("test/test"),
+                    "repository1": repository_node("test/new-name"),
+                }
+            },
+            headers={"Content-Type": "application/json", "X-RateLimit-Resource": "graphql"},
+        ),
+    )
+
+    response_mocker.add(
+        "https://api.github.com/repos/test/test/git/trees/1.0.0",
+        MockedResponse(
+            content={
+                "sha": "abcdef1234567890",
+                "truncated": False,
+                "tree": [
+                    {"path": "hacs.json", "type": "blob", "sha": "1"},
+                    {"path": "readme.md", "type": "blob", "sha": "2"},
+                ],
+            },
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+    response_mocker.add(
+        "https://raw.githubusercontent.com/test/test/abcdef1234567890/readme.md",
+        MockedResponse(content=b"# Released"),
+    )
+
+    hacs.queue.clear()
+    missing = await hacs.async_update_repositories_metadata([repository, renamed])
+    assert missing == [renamed]
+
+    assert repository.data.stargazers_count == 42
+    assert repository.data.last_version == "1.0.0"
+    assert repository.data.published_tags == ["1.0.0"]
+    assert repository.data.downloads == 99
+    assert repository.data.last_commit == "1234567"
+    assert repository.ref == "1.0.0"
+    assert repository.data.manifest_name == "Example"
+    assert repository.data.authors == ["@me"]
+    assert repository.repository_manifest.name == "Released"
+    assert repository.data.last_fetched is not None
+    # The tree of the ref is refreshed through the queue, and the readme is found in it
+    assert hacs.queue.pending_tasks == 1
+    await hacs.queue.execute()
+    assert repository.additional_info == "# Released"
+    assert repository.tree.ref == "1.0.0"
+    assert "readme.md" in repository.tree
+
+
+async def test_update_repositories_metadata_archived(
+    hass: HomeAssistant,
+    hacs: HacsBase,
+    response_mocker: ResponseMocker,
+) -> None:
+    repository = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/test"))
+
+    response_mocker.add(
+        "https://api.github.com/graphql",
+        MockedResponse(
+            content={"data": {"repository0": repository_node("test/test", isArchived=True)}},
+            headers={"Content-Type": "application/json", "X-RateLimit-Resource": "graphql"},
+        ),
+    )
+
+    # Archived repositories are left to the full update, which handles them
+    assert await hacs.async_update_repositories_metadata([repository]) == [repository]
+    assert repository.data.stargazers_count != 42
+
+
+async def test_update_repositories_metadata_unchanged(
+    hass: HomeAssistant,
+    hacs: HacsBase,
+    response_mocker: ResponseMocker,
+) -> None:
+    repository = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/test"))
+    repository.data.selected_tag = None
+    repository.data.last_commit = "1234567"
+    repository.data.last_version = "1.0.0"
+    hacs.repositories.add_unhydrated(
+        "1338",
+        {
+            "category": "integration",
+            "full_name": "test/stored",
+            "last_commit": "1234567",
+            "last_version": "1.0.0",
+        },
+    )
+
+    response_mocker.add(
+        "https://api.github.com/graphql",
+        MockedResponse(
+            content={
+                "data": {
+                    "repository0": repository_node("test/test"),
+                    "repository1": repository_node("test/stored"),
+                }
+            },
+            headers={"Content-Type": "application/json", "X-RateLimit-Resource": "graphql"},
+        ),
+    )
+
+    hacs.queue.clear()
+    assert not await hacs.async_update_repositories_metadata([repository], ["1338"])
+    assert repository.data.stargazers_count == 42
+    # Nothing is refreshed or created for repositories without a new commit or release
+    assert hacs.queue.pending_tasks == 0
+    assert "1338" in hacs.repositories.unhydrated
+
+
+async def test_update_repositories_metadata_releases_removed(
+    hass: HomeAssistant,
+    hacs: HacsBase,
+    response_mocker: ResponseMocker,
+) -> None:
+    repository = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/test"))
+    repository.data.selected_tag = None
+    repository.data.releases = True
+    repository.data.published_tags = ["1.0.0"]
+    repository.data.last_version = "1.0.0"
+
+    response_mocker.add(
+        "https://api.github.com/graphql",
+        MockedResponse(
+            content={
+                "data": {
+                    "repository0": repository_node(
+                        "test/test", latestRelease=None, releases={"nodes": []}
+                    )
+                }
+            },
+            headers={"Content-Type": "application/json", "X-RateLimit-Resource": "graphql"},
+        ),
+    )
+
+    hacs.queue.clear()
+    assert not await hacs.async_update_repositories_metadata([repository], refresh=False)
+    assert not repository.data.releases
+    assert repository.data.published_tags == []
+    assert repository.data.last_version is None
+    assert repository.ref == "main"
+    assert hacs.queue.pending_tasks == 0
+
+
+@pytest.mark.parametrize("content_in_root,path", ((True, "manifest.json"), (False, None)))
+def test_metadata_manifest_path(hacs: HacsBase, content_in_root: bool, path: str | None) -> None:
+    repository = dummy_repository_base(hacs, HacsIntegrationRepository(hacs, "test/test"))
+    repository.data.domain = None
+    repository.repository_manifest.content_in_root = content_in_root
+    assert repository.metadata_manifest_path == path
@@ -0,0 +1,120 @@
+"""HTTP cache tests."""
+from typing import Any
+
+from multidict import CIMultiDict
+
+from custom_components.hacs.utils.http_cache import (
+    HttpCache,
+    HttpCacheEntry,
+    HttpCacheSession,
+)
+
+
+class Response:
+    def __init__(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None):
+        self.status = status
+        self.headers = CIMultiDict(headers or {})
+        self._body = body
+        self.released = False
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self) -> None:
+        self.released = True
+
+
+class Session:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self.responses: list[Response] = []
+
+    async def request(self, method: str, url: str, **kwargs) -> Response:
+        self.requests.append({"method": method, "url": url, **kwargs})
+        return self.responses.pop(0)
+
+
+async def test_http_cache_session_revalidates(tmpdir) -> None:
+    cache = HttpCache(str(tmpdir))
+    session = Session()
+    cached_session = HttpCacheSession(session, cache)
+
+    session.responses.append(
+        Response(200, b'{"key": "value"}', {"ETag": '"abc"', "Content-Type": "application/json"})
+    )
+    response = await cached_session.get("https://api.github.com/repos/test/test")
+    assert await response.read() == b'{"key": "value"}'
+    assert "headers" not in session.requests[0]
+
+    session.responses.append(Response(304, headers={"X-RateLimit-Remaining": "10"}))
+    response = await cached_session.get("https://api.github.com/repos/test/test")
+    assert session.requests[1]["headers"]["If-None-Match"] == '"abc"'
+    assert response.status == 200
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["X-RateLimit-Remaining"] == "10"
+    assert await response.json() == {"key": "value"}
+    assert cache.hits == 1
+
+    # The cache is persisted
+    session.responses.append(Response(304))
+    response = await HttpCacheSession(session, HttpCache(str(tmpdir))).get(
+        "https://api.github.com/repos/test/test"
+    )
+    assert await response.text() == '{"key": "value"}'
+
+
+async def test_http_cache_session_content(tmpdir) -> None:
+    cache = HttpCache(str(tmpdir))
+    session = Session()
+    cached_session = HttpCacheSession(session, cache)
+    body = bytes(range(256)) * 1000
+
+    # The cache read the body to store it, and after a 304 the body is the cached one
+    for response in (Response(200, body, {"ETag": '"abc"'}), Response(304)):
+        session.responses.append(response)
+        async with await cached_session.get("https://example.com/file.zip") as cached:
+            streamed = b"".join([chunk async for chunk in cached.content.iter_chunked(4096)])
+        assert streamed == body
+        assert await cached.read() == body
+        assert response.released
+
+
+async def test_http_cache_session_passthrough(tmpdir) -> None:
+    cache = HttpCache(str(tmpdir))
+    session = Session()
+    cached_session = HttpCacheSession(session, cache)
+
+    session.responses.append(Response(304))
+    response = await cached_session.get(
+        "https://api.github.com/repos/test/test", headers={"If-None-Match": '"abc"'}
+    )
+    assert response.status == 304
+
+    session.responses.append(Response(200, b"body"))
+    await cached_session.get("https://api.github.com/repos/test/test")
+    assert cache.as_dict()["entries"] == 0
+
+
+async def test_http_cache_eviction(tmpdir) -> None:
+    cache = HttpCache(str(tmpdir), max_size=10)
+    for index in range(3):
+        await cache.async_set(str(index), HttpCacheEntry("url", {"ETag": "1"}, b"12345"))
+    assert await cache.async_get("0") is None
+    assert await cache.async_get("1") is not None
+    await cache.async_set("3", HttpCacheEntry("url", {"ETag": "1"}, b"12345"))
+
+    # "1" was used more recently than "2"
+    assert await cache.async_get("2") is None
+    assert await cache.async_get("1") is not None
+    assert cache.as_dict() == {
+        "entries": 2,
+        "size": 10,
+        "max_size": 10,
+        "hits": 0,
+        "misses": 0,
+        "stores": 4,
+        "evictions": 2,
+    }
+    assert sorted(tmpdir.listdir()) == sorted(
+        [tmpdir.join(f"{key}.{suffix}") for key in ("1", "3") for suffix in ("body", "json")]
+    )
@@ -0,0 +1,105 @@
+"""Repository journal tests."""
+import os
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.utils.journal import (
+    RepositoryJournal,
+    category_snapshot_from_entries,
+    entries_from_category_snapshot,
+)
+from custom_components.hacs.utils.store import (
+    async_load_from_store,
+    async_save_to_store,
+)
+
+
+async def test_journal_migrates_store_file(hass: HomeAssistant) -> None:
+    """Test that an existing store file is loaded as the snapshot."""
+    await async_save_to_store(hass, "journal_test", {"1": {"full_name": "test/one"}})
+
+    journal = RepositoryJournal(hass, "journal_test")
+    assert await journal.async_load() == {"1": {"full_name": "test/one"}}
+    assert not os.path.exists(journal.path)
+
+
+async def test_journal_append_and_replay(hass: HomeAssistant) -> None:
+    """Test that appended changes are replayed on top of the snapshot."""
+    journal = RepositoryJournal(hass, "journal_test")
+    await journal.async_save({"1": {"full_name": "test/one"}, "2": {"full_name": "test/two"}})
+    await journal.async_append({"1": {"full_name": "test/renamed"}, "2": None})
+    await journal.async_append({"3": {"full_name": "test/three"}})
+
+    # The snapshot is not rewritten
+    assert await async_load_from_store(hass, "journal_test") == {
+        "1": {"full_name": "test/one"},
+        "2": {"full_name": "test/two"},
+    }
+    assert journal.appends == 2
+
+    loaded = RepositoryJournal(hass, "journal_test")
+    assert await loaded.async_load() == {
+        "1": {"full_name": "test/renamed"},
+        "3": {"full_name": "test/three"},
+    }
+    assert loaded.size == journal.size
+
+
+async def test_journal_incomplete_append(hass: HomeAssistant) -> None:
+    """Test that an interrupted append is dropped."""
+    journal = RepositoryJournal(hass, "journal_test")
+    await journal.async_save({})
+    await journal.async_append({"1": {"full_name": "test/one"}})
+    with open(journal.path, "a", encoding="utf-8") as file:
+        file.write('{"id": "2", "da')
+
+    journal = RepositoryJournal(hass, "journal_test")
+    assert await journal.async_load() == {"1": {"full_name": "test/one"}}
+
+    await journal.async_append({"3": {"full_name": "test/three"}})
+    assert await journal.async_load() == {
+        "1": {"full_name": "test/one"},
+        "3": {"full_name": "test/three"},
+    }
+
+
+async def test_journal_compaction(hass: HomeAssistant) -> None:
+    """Test that the journal is merged into the snapshot once it is large."""
+    journal = RepositoryJournal(hass, "journal_test", compact_size=100)
+    entries = {"1": {"full_name": "test/one"}}
+    await journal.async_save(entries)
+
+    await journal.async_append({"1": {"full_name": "test/one", "description": "x" * 10}})
+    journal.async_compact_if_needed(lambda: dict(entries))
+    await journal.async_wait_compaction()
+    assert journal.compactions == 1
+
+    entries["1"] = {"full_name": "test/one", "description": "x" * 100}
+    await journal.async_append({"1": entries["1"]})
+    journal.async_compact_if_needed(lambda: dict(entries))
+    await journal.async_wait_compaction()
+    assert journal.compactions == 2
+    assert journal.size == 0
+    assert not os.path.exists(journal.path)
+    assert await async_load_from_store(hass, "journal_test") == entries
+
+
+async def test_journal_save_compare(hass: HomeAssistant) -> None:
+    """Test that saving the stored entries does not write."""
+    journal = RepositoryJournal(hass, "journal_test")
+    await journal.async_save({"1": {"full_name": "test/one"}})
+    await journal.async_append({"2": {"full_name": "test/two"}})
+
+    await journal.async_save(
+        {"1": {"full_name": "test/one"}, "2": {"full_name": "test/two"}}, compare=True
+    )
+    assert journal.compactions == 1
+    assert os.path.exists(journal.path)
+
+
+def test_category_snapshot() -> None:
+    """Test the conversion of snapshots that group entries by category."""
+    snapshot = {"repositories": {"integration": [{"id": "1", "full_name": "test/one"}]}}
+    entries = entries_from_category_snapshot(snapshot)
+    assert entries == {"1": {"id": "1", "category": "integration", "full_name": "test/one"}}
+    assert category_snapshot_from_entries(entries) == snapshot
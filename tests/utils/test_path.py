@@ -7,3 +7,11 @@ def test_is_safe(hacs: HacsBase) -> None:
     assert not path.is_safe(hacs, f"{hacs.core.config_path}/{hacs.configuration.theme_path}/")
     assert not path.is_safe(hacs, f"{hacs.core.config_path}/custom_components/")
     assert not path.is_safe(hacs, f"{hacs.core.config_path}/custom_components")
+
+
+def test_cache_directory(hacs: HacsBase) -> None:
+    directory = path.cache_directory(hacs.core.config_path, "blob_cache")
+    assert not directory.startswith(hacs.core.config_path)
+    assert directory.endswith("blob_cache")
+    assert directory != path.cache_directory("/other", "blob_cache")
+    assert hacs.blob_cache.directory == directory
@@ -1,10 +1,15 @@
 """Queue tests."""
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
 from custom_components.hacs.base import HacsBase
-from custom_components.hacs.exceptions import HacsExecutionStillInProgress
+from custom_components.hacs.enums import HacsQueuePriority
+from custom_components.hacs.exceptions import (
+    HacsException,
+    HacsExecutionStillInProgress,
+)
 from custom_components.hacs.utils.queue_manager import QueueManager
 
 dummy_task = AsyncMock()
@@ -17,14 +22,13 @@ async def test_queue_manager(hacs: HacsBase, caplog: pytest.LogCaptureFixture) -
     assert not queue_manager.running
     assert not queue_manager.has_pending_tasks
     assert queue_manager.pending_tasks == 0
-    assert queue_manager.queue == []
 
-    queue_manager.add(dummy_task())
+    queue_manager.add(dummy_task)
     assert queue_manager.has_pending_tasks
     assert queue_manager.pending_tasks == 1
 
     for _ in range(1, 5):
-        queue_manager.add(dummy_task())
+        queue_manager.add(dummy_task)
     assert queue_manager.has_pending_tasks
     assert queue_manager.pending_tasks == 5
 
@@ -39,10 +43,96 @@ async def test_queue_manager(hacs: HacsBase, caplog: pytest.LogCaptureFixture) -
 
     queue_manager.running = False
 
-    await queue_manager.execute()
+    # 0 executes all tasks, like no number of tasks
+    assert await queue_manager.execute(0) == 4
     await queue_manager.execute()
     assert not queue_manager.running
     assert not queue_manager.has_pending_tasks
     assert queue_manager.pending_tasks == 0
-    assert queue_manager.queue == []
     assert "The queue is empty" in caplog.text
+
+
+async def test_queue_manager_priority_and_deduplication(hacs: HacsBase) -> None:
+    """Test that tasks are coalesced by key and executed by priority."""
+    executed = []
+
+    def task(name: str):
+        async def _task() -> None:
+            executed.append(name)
+
+        return _task
+
+    queue_manager = QueueManager(hass=hacs.hass, workers=1)
+    assert queue_manager.add(task("background"), key=("a", "update"))
+    assert not queue_manager.add(task("duplicate"), key=("a", "update"))
+    assert queue_manager.add(task("registration"), priority=HacsQueuePriority.REGISTRATION)
+    assert queue_manager.add(task("other"), key=("b", "update"))
+    assert queue_manager.pending_tasks == 3
+
+    # Raising the priority of a pending task keeps the original factory
+    assert not queue_manager.add(task("user"), key=("b", "update"), priority=HacsQueuePriority.USER)
+    assert queue_manager.pending_tasks == 3
+
+    await queue_manager.execute()
+    assert executed == ["other", "registration", "background"]
+    assert not queue_manager.has_pending_tasks
+
+
+async def test_queue_manager_continuous_feed(hacs: HacsBase) -> None:
+    """Test that workers pick up new tasks without waiting for the slowest task."""
+    slow_done = asyncio.Event()
+    executed = []
+
+    async def slow_task() -> None:
+        await slow_done.wait()
+        executed.append("slow")
+
+    async def fast_task() -> None:
+        executed.append("fast")
+        if len(executed) == 3:
+            slow_done.set()
+
+    queue_manager = QueueManager(hass=hacs.hass, workers=2)
+    queue_manager.add(slow_task)
+    for _ in range(3):
+        queue_manager.add(fast_task)
+
+    await queue_manager.execute()
+    assert executed == ["fast", "fast", "fast", "slow"]
+
+
+async def test_queue_manager_async_run(hacs: HacsBase) -> None:
+    """Test that user tasks run ahead of the queue and share their result."""
+    executed = []
+    release = asyncio.Event()
+
+    async def background() -> None:
+        executed.append("background")
+
+    async def user() -> str:
+        await release.wait()
+        executed.append("user")
+        return "result"
+
+    async def failing() -> None:
+        raise HacsException("failed")
+
+    queue_manager = QueueManager(hass=hacs.hass)
+    queue_manager.add(background, key=("a", "update"))
+    queue_manager.add(background, key=("b", "update"))
+
+    # The pending task with the same key is replaced, the other one keeps waiting
+    first = asyncio.create_task(queue_manager.async_run(user, key=("a", "update")))
+    second = asyncio.create_task(queue_manager.async_run(user, key=("a", "update")))
+    await asyncio.sleep(0)
+    release.set()
+    assert await first == "result"
+    assert await second == "result"
+    assert executed == ["user"]
+    assert queue_manager.pending_tasks == 1
+
+    with pytest.raises(HacsException, match="failed"):
+        await queue_manager.async_run(failing, key=("c", "download"))
+
+    await queue_manager.execute()
+    assert executed == ["user", "background"]
@@ -0,0 +1,94 @@
+"""Rate limit budget tests."""
+import time
+from unittest.mock import patch
+
+from custom_components.hacs.utils.rate_limit import GitHubRateLimitBudget
+
+
+def test_rate_limit_budget() -> None:
+    budget = GitHubRateLimitBudget()
+    assert not budget.known
+    assert budget.available_tasks() == 0
+
+    reset = int(time.time()) + 3600
+    with patch("time.time", return_value=reset - 3600):
+        budget.update_from_response(
+            {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4000",
+                "X-RateLimit-Reset": str(reset),
+            },
+            200,
+        )
+        assert budget.known
+        assert budget.reserve == 1000
+        # Only the calls of the next 5 minutes are released
+        assert budget.available_calls() == 250
+        assert budget.available_tasks() == 25
+        assert budget.paused_until() is None
+
+        # Measured calls per task are taken into account
+        budget.record_tasks(10, 200)
+        assert budget.calls_per_task == 13
+        assert budget.available_tasks() == 19
+
+        # Spending the released calls pauses until more are released
+        budget.update_from_response({"X-RateLimit-Remaining": "3000"}, 200)
+        assert budget.available_calls() == 0
+        assert budget.paused_until() == reset - 300 - 1999 * 1.2
+
+    with patch("time.time", return_value=reset - 1800):
+        assert budget.available_calls() == 750
+
+    with patch("time.time", return_value=reset - 60):
+        assert budget.available_calls() == 2000
+        budget.update_from_response({"X-RateLimit-Remaining": "900"}, 200)
+        assert budget.available_tasks() == 0
+        assert budget.paused_until() == reset
+
+
+def test_rate_limit_budget_reset_passed() -> None:
+    budget = GitHubRateLimitBudget()
+    budget.update_from_response(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) - 1),
+        },
+        200,
+    )
+    # A new window is paced from now
+    assert budget.available_calls() == 333
+
+
+def test_rate_limit_budget_retry_after() -> None:
+    budget = GitHubRateLimitBudget()
+    budget.update_from_response(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4000",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "Retry-After": "30",
+        },
+        403,
+    )
+    assert budget.available_calls() == 0
+    assert budget.paused_until() >= time.time() + 29
+
+    budget.retry_after_until = time.time() - 1
+    assert budget.available_calls() > 0
+    assert budget.retry_after_until is None
+
+
+def test_rate_limit_budget_ignores_other_resources() -> None:
+    budget = GitHubRateLimitBudget()
+    budget.update_from_response(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Resource": "graphql",
+        },
+        200,
+    )
+    assert not budget.known
+    assert budget.calls == 0
@@ -0,0 +1,72 @@
+"""Repository file tests."""
+import asyncio
+from base64 import b64encode
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from aiogithubapi.objects.repository.content import AIOGitHubAPIRepositoryTreeContent
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.base import HacsRepository
+from custom_components.hacs.utils.repository_files import RepositoryFiles
+
+
+async def test_repository_files(hacs: HacsBase) -> None:
+    hacs.repository_files = RepositoryFiles()
+    repository = HacsRepository(hacs)
+    repository.data.full_name = "test/test"
+    repository.data.published_tags = ["1.0.0"]
+    repository.tree = [
+        AIOGitHubAPIRepositoryTreeContent(
+            {"path": "hacs.json", "type": "blob", "sha": "1"}, "test/test", "1.0.0"
+        )
+    ]
+
+    async def _download(url, **kwargs):
+        await asyncio.sleep(0)
+        return b'{"name": "test"}'
+
+    hacs.async_download_file = AsyncMock(side_effect=_download)
+    hacs.githubapi.repos.contents.get = AsyncMock(
+        return_value=SimpleNamespace(
+            data=SimpleNamespace(content=b64encode(b'{"name": "api"}').decode())
+        )
+    )
+
+    # Concurrent requests share a download, and the content at a tag is kept
+    results = await asyncio.gather(
+        *(hacs.repository_files.async_get(repository, "hacs.json", "1.0.0") for _ in range(3))
+    )
+    assert results == ['{"name": "test"}'] * 3
+    assert await hacs.repository_files.async_get(repository, "hacs.json", "tags/1.0.0")
+    hacs.async_download_file.assert_called_once_with(
+        "https://raw.githubusercontent.com/test/test/1.0.0/hacs.json",
+        nolog=True,
+        http_cache=True,
+    )
+
+    # Files that are not in the tree are not requested
+    assert await hacs.repository_files.async_get(repository, "info.md", "1.0.0") is None
+    assert hacs.async_download_file.call_count == 1
+
+    # The contents API is used when the CDN fails for a file in the tree
+    hacs.repository_files = RepositoryFiles()
+    hacs.async_download_file = AsyncMock(return_value=None)
+    assert await hacs.repository_files.async_get(repository, "hacs.json", "1.0.0") == (
+        '{"name": "api"}'
+    )
+    hacs.githubapi.repos.contents.get.assert_called_once()
+
+    # Files at other refs are only requested from the CDN, failures are not cached
+    assert await hacs.repository_files.async_get(repository, "README.md", "2.0.0") is None
+    assert await hacs.repository_files.async_get(repository, "README.md", "2.0.0") is None
+    assert hacs.async_download_file.call_count == 3
+    assert hacs.githubapi.repos.contents.get.call_count == 1
+    assert hacs.repository_files.as_dict() == {
+        "entries": 1,
+        "max_size": 500,
+        "hits": 0,
+        "misses": 3,
+        "raw_downloads": 0,
+        "api_downloads": 1,
+    }
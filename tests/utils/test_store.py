@@ -1,16 +1,21 @@
 """Queue tests."""
+import os
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 import pytest
 
-from custom_components.hacs.const import VERSION_STORAGE
+from custom_components.hacs.const import VERSION_STORAGE, VERSION_STORAGE_COMPRESSED
 from custom_components.hacs.exceptions import HacsException
 from custom_components.hacs.utils.store import (
+    COMPRESSED_HEADER,
+    STORE_CODECS,
     async_load_from_store,
     async_remove_store,
     async_save_to_store,
     get_store_for_key,
+    load_store_file,
 )
 
 
@@ -20,18 +25,18 @@ async def test_store_load(hass: HomeAssistant) -> None:
     store = get_store_for_key(hass, "test")
 
     with patch(
-        "custom_components.hacs.utils.store.json_util.load_json",
+        "custom_components.hacs.utils.store.load_store_file",
         return_value={"version": VERSION_STORAGE, "data": {"test": "test"}},
     ):
         assert store.load() == {"test": "test"}
         assert await async_load_from_store(hass, "test") == {"test": "test"}
 
-    with patch("custom_components.hacs.utils.store.json_util.load_json", return_value={}):
+    with patch("custom_components.hacs.utils.store.load_store_file", return_value={}):
         assert store.load() is None
 
     with pytest.raises(HacsException):
         with patch(
-            "custom_components.hacs.utils.store.json_util.load_json", side_effect=OSError("No file")
+            "custom_components.hacs.utils.store.load_store_file", side_effect=OSError("No file")
         ):
             assert store.load() == {"test": "test"}
 
@@ -55,7 +60,7 @@ async def test_store_store(hass: HomeAssistant, caplog: pytest.LogCaptureFixture
     with patch(
         "custom_components.hacs.utils.store.HACSStore.async_save", return_value=AsyncMock()
     ) as async_save_mock, patch(
-        "custom_components.hacs.utils.store.json_util.load_json",
+        "custom_components.hacs.utils.store.load_store_file",
         return_value={"version": VERSION_STORAGE, "data": {}},
     ):
         await async_save_to_store(hass, "test", {})
@@ -67,3 +72,44 @@ async def test_store_store(hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 
         await async_save_to_store(hass, "test", {"test": "test"})
         assert async_save_mock.call_count == 1
+
+
+@pytest.mark.parametrize("codec", ["json", "compact", "compressed"])
+async def test_store_codec(hass: HomeAssistant, hacs, codec: str) -> None:
+    """Test that each codec loads the files written by the others."""
+    data = {"1": {"full_name": "test/test", "topics": ["test"] * 100}}
+    await async_save_to_store(hass, "codec", data)
+
+    hacs.configuration.storage_codec = codec
+    store = get_store_for_key(hass, "codec")
+    assert store.codec is STORE_CODECS.get(codec)
+    assert await async_load_from_store(hass, "codec") == data
+
+    await store.async_save({**data, "2": {"full_name": "test/other"}})
+    with open(store.path, "rb") as file:
+        assert file.read().startswith(COMPRESSED_HEADER) is (codec == "compressed")
+    assert load_store_file(store.path)["version"] == (
+        VERSION_STORAGE_COMPRESSED if codec == "compressed" else VERSION_STORAGE
+    )
+
+    hacs.configuration.storage_codec = "json"
+    assert await async_load_from_store(hass, "codec") == {**data, "2": {"full_name": "test/other"}}
+
+    # Saving the same data with the json codec writes compressed files again as JSON
+    await async_save_to_store(hass, "codec", {**data, "2": {"full_name": "test/other"}})
+    assert load_store_file(store.path)["version"] == VERSION_STORAGE
+    with open(store.path, "rb") as file:
+        assert not file.read().startswith(COMPRESSED_HEADER)
+
+
+async def test_store_codec_corrupt(hass: HomeAssistant) -> None:
+    """Test that a corrupt compressed file can not be loaded."""
+    store = get_store_for_key(hass, "corrupt")
+    os.makedirs(os.path.dirname(store.path), exist_ok=True)
+    with open(store.path, "wb") as file:
+        file.write(COMPRESSED_HEADER + b"not compressed")
+
+    with pytest.raises(HomeAssistantError):
+        await async_load_from_store(hass, "corrupt")
+    with pytest.raises(HacsException):
+        store.load()
@@ -0,0 +1,76 @@
+"""Repository tree tests."""
+from unittest.mock import AsyncMock
+
+from aiogithubapi.objects.repository.content import AIOGitHubAPIRepositoryTreeContent
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories.base import HacsRepository
+from custom_components.hacs.utils.tree import RepositoryTree, RepositoryTreeCache
+
+
+def _tree(*paths: str) -> list[AIOGitHubAPIRepositoryTreeContent]:
+    return [
+        AIOGitHubAPIRepositoryTreeContent(
+            {"path": path, "type": "blob" if "." in path else "tree", "sha": f"sha-{path}"},
+            "test/test",
+            "main",
+        )
+        for path in paths
+    ]
+
+
+def test_repository_tree() -> None:
+    tree = RepositoryTree(
+        _tree("dist", "dist/card.js", "card.js", "dist-card", "dist/sub", "dist/sub/a.js")
+    )
+    assert len(tree) == 6
+    assert "dist/card.js" in tree
+    assert "dist/other.js" not in tree
+    assert [entry.full_path for entry in tree] == list(tree.paths)
+
+    # Entries with the prefix are returned in the order of the tree
+    assert tree.paths_with_prefix("dist") == [
+        "dist",
+        "dist/card.js",
+        "dist-card",
+        "dist/sub",
+        "dist/sub/a.js",
+    ]
+    assert tree.paths_with_prefix("dist/") == ["dist/card.js", "dist/sub", "dist/sub/a.js"]
+    assert len(tree.with_prefix("")) == 6
+
+    assert [entry.full_path for entry in tree.in_directory("", "dist")] == [
+        "dist",
+        "dist/card.js",
+        "card.js",
+        "dist-card",
+        "dist/sub",
+    ]
+    assert tree.has_filename("a.js")
+    assert not tree.has_filename("b.js")
+
+    entry = tree.get("dist/sub/a.js")
+    assert entry.filename == "a.js"
+    assert entry.path == "dist/sub"
+    assert entry.sha == "sha-dist/sub/a.js"
+    assert not entry.is_directory
+    assert entry.download_url == "https://raw.githubusercontent.com/test/test/main/dist/sub/a.js"
+    assert tree.get("dist/sub").is_directory
+    assert tree.get("missing") is None
+
+
+async def test_repository_tree_cache(hacs: HacsBase) -> None:
+    hacs.trees = RepositoryTreeCache(max_size=1)
+    first = HacsRepository(hacs)
+    second = HacsRepository(hacs)
+
+    first.tree = _tree("info.md")
+    second.tree = _tree("README.md")
+    assert hacs.trees.releases == 1
+    assert not first.tree
+    assert "README.md" in second.tree
+
+    # A released tree is fetched again when content is downloaded
+    first.get_tree = AsyncMock(return_value=_tree("info.md"))
+    assert "info.md" in await first.async_get_tree()
+    assert not second.tree
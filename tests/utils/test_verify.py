@@ -0,0 +1,39 @@
+"""Verify tests."""
+import hashlib
+
+import pytest
+
+from custom_components.hacs.utils import verify
+from custom_components.hacs.utils.blob_cache import git_blob_sha
+from custom_components.hacs.utils.verify import file_digest, verify_installed_files
+
+
+@pytest.mark.parametrize("mmap_threshold", (0, verify.MMAP_THRESHOLD))
+def test_file_digest(tmpdir, monkeypatch: pytest.MonkeyPatch, mmap_threshold: int) -> None:
+    monkeypatch.setattr(verify, "MMAP_THRESHOLD", mmap_threshold)
+    tmpdir.join("file.js").write_binary(b"content")
+
+    assert file_digest(str(tmpdir.join("file.js")), "abc") == git_blob_sha(b"content")
+    assert (
+        file_digest(str(tmpdir.join("file.js")), "sha256:abc")
+        == f"sha256:{hashlib.sha256(b'content').hexdigest()}"
+    )
+
+
+def test_verify_installed_files(tmpdir) -> None:
+    local = tmpdir.mkdir("local")
+    local.join("unchanged.py").write_binary(b"unchanged")
+    local.join("modified.py").write_binary(b"modified")
+    local.mkdir("__pycache__").join("unchanged.pyc").write_binary(b"")
+    local.mkdir("sub").join("added.py").write_binary(b"added")
+    local.mkdir("data").join("user.json").write_binary(b"{}")
+
+    assert verify_installed_files(
+        str(local),
+        {
+            "unchanged.py": git_blob_sha(b"unchanged"),
+            "modified.py": git_blob_sha(b"original"),
+            "missing.py": git_blob_sha(b"missing"),
+        },
+        ("data/",),
+    ) == {"added": ["sub/added.py"], "missing": ["missing.py"], "modified": ["modified.py"]}